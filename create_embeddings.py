@@ -1,77 +1,131 @@
 import argparse
-from sklearn.feature_extraction.text import CountVectorizer
 from gensim.models import word2vec
+from gensim.models.keyedvectors import KeyedVectors
 import numpy as np
 import glob
+import multiprocessing
+import os
 import pickle
+from tweet_store import load_tweets
+from feature_store import write_sparse_features, write_dense_features, dense_filenames
+from feature_cache import FeatureCache, files_hash, DEFAULT_CACHE_SIZE
 
 # NOTE: Files will be saved in the path <one directory before the input file>/<model_name>/<filename_without_extension>.p
 parser = argparse.ArgumentParser()
 parser.add_argument("-i", "--input_glob", required=True) # e.g. */cleaned_tweets.p
 parser.add_argument("-m", "--model_filename", required=True) # e.g. bigram_model
 parser.add_argument("-t", "--model", required=True) # e.g. "bigram" or "word2vec_average"
-parser.add_argument("-o", "--output_filename", default="embedding") #e.g. 
-parser.add_argument("-e", "--sentence_embedding", required=True)
+parser.add_argument("-o", "--output_filename", default="embedding") # e.g. word2vec_average
+parser.add_argument("-e", "--sentence_embedding", required=True) # "average", "sum" or "minmax"
+parser.add_argument("-c", "--cache_dir", default=".feature_cache") # features of earlier runs, reused when nothing they depend on changed
+parser.add_argument("-cs", "--cache_size", default=DEFAULT_CACHE_SIZE, type=int) # MB, 0 to not cache
+parser.add_argument("-n", "--workers", default=1, type=int) # processes to featurize input files with, e.g. the number of cores
 args = parser.parse_args()
 
-# Creates features for each input sentence (each sentence is a list of words) based on averaging the words in the vector  
-def word_embedding_features(model_filename, input_list, aggregation=None):
-	model = word2vec.Word2Vec.load(model_filename)
-	# print model.wv.similarity('sunny', 'end')
-	# print model.wv.most_similar(positive=['landslide', 'emergency'], negative=['aid'])
-	embedding_list = []
-	for sentence in input_list:
-		if sentence == []:
-			continue
-		embeddings = [model[word] for word in sentence]
-		if aggregation == "average":
-			sentence_embedding = np.mean(embeddings, axis=0)
-		elif aggregation== "minmax":
-			sentence_embedding = np.append(np.min(embeddings, axis=0), np.max(embeddings, axis=0), axis=0)
-		elif aggregation == None:
-			embedding_list.append(sentence_embedding)
-		else: raise ValueError("aggregation value is not recognized.")
-	return embedding_list
+# Flattens the sentences in to one array of the vocabulary index of every word, in order, and the offset
+# at which each sentence starts
+def token_indices(vocab, input_list):
+	lengths = np.array([len(sentence) for sentence in input_list], dtype=np.int64)
+	indices = np.fromiter((vocab[word].index for sentence in input_list for word in sentence), dtype=np.int32, count=np.sum(lengths))
+	offsets = np.zeros(len(lengths), dtype=np.int64)
+	np.cumsum(lengths[:-1], out=offsets[1:])
+	return indices, offsets, lengths
 
-#creates features for each input sentence (each sentence is a string) based on bigrams
-def bigram_features(input_list):
+# Creates features for each input sentence (each sentence is a list of words) by aggregating the vectors
+# of its words: their average, their sum or their elementwise min and max side by side. Without an
+# aggregation each sentence gets the matrix of its word vectors. Every word vector is gathered from the
+# weights in one indexing, and each aggregation is one segment reduction over all sentences at once.
+# Empty sentences are skipped
+def word_embedding_features(word_vectors, input_list, aggregation=None):
+	input_list = [sentence for sentence in input_list if len(sentence) > 0]
+	if len(input_list) == 0: return []
+	indices, offsets, lengths = token_indices(word_vectors.vocab, input_list)
+	vectors = word_vectors.syn0[indices]
+	if aggregation == "average":
+		return np.add.reduceat(vectors, offsets, axis=0)/lengths[:, np.newaxis].astype(vectors.dtype)
+	elif aggregation == "sum":
+		return np.add.reduceat(vectors, offsets, axis=0)
+	elif aggregation == "minmax":
+		return np.hstack([np.minimum.reduceat(vectors, offsets, axis=0), np.maximum.reduceat(vectors, offsets, axis=0)])
+	elif aggregation == None:
+		return np.split(vectors, offsets[1:])
+	else: raise ValueError("aggregation value is not recognized.")
+
+#creates features for each input sentence (each sentence is a string) based on bigrams, as a sparse CSR
+# matrix. The model is only applied, never refitted, so every file gets the same columns
+def bigram_features(bigram_model, input_list):
 	input_text = [' '.join(sentence) for sentence in input_list]
-	with open(args.model_filename, 'rb') as input_file:
-		bigram_vectorizer = pickle.load(input_file)
-		feature_vectors = bigram_vectorizer.fit_transform(input_text).toarray()
-		return feature_vectors
+	return bigram_model.transform(input_text)
+
+# Loads the word vectors of a word2vec model, memory-mapped from a copy saved next to it with the
+# weights in their own .npy, which is written from the model the first time and whenever the model is
+# newer. Only the vectors are kept, not the training state
+def load_word_vectors(model_filename):
+	vectors_filename = model_filename + ".vectors"
+	if not os.path.exists(vectors_filename) or os.path.getmtime(vectors_filename) < os.path.getmtime(model_filename):
+		word2vec.Word2Vec.load(model_filename).wv.save(vectors_filename, separately=["syn0"])
+		print "Saved the word vectors of %s to %s" % (model_filename, vectors_filename)
+	return KeyedVectors.load(vectors_filename, mmap='r')
+
+def load_model(model_filename, model):
+	if model == "word2vec": return load_word_vectors(model_filename)
+	with open(model_filename, 'rb') as input_file: return pickle.load(input_file)
+
+# Featurizes one input file, or copies its features from the cache, and returns whether it was cached.
+# In a pool every worker uses the model the parent loaded before forking
+def featurize_file(filename):
+	output_filename = "%s/%s" % ('/'.join(filename.split('/')[:-1]), args.output_filename)
+	# Bigram features stay sparse, in a .npz, and word2vec features go in a dense store, in a .npy and
+	# the files next to it. feature_store.load_features reads both
+	if args.model == "bigram" and not output_filename.endswith(".npz"): output_filename += ".npz"
+	if args.model == "word2vec" and not output_filename.endswith(".npy"): output_filename += ".npy"
+	print "Saving output to", output_filename
+	output_filenames = [output_filename] if args.model == "bigram" else list(dense_filenames(output_filename))
+	cache_key = cache.key(files_hash([filename]), model_hash, args.model, args.sentence_embedding)
+	if cache.fetch(cache_key, output_filenames):
+		print "Reused cached features of", filename
+		return True
+
+	# Input all text from the input file in to the corresponding model featurizer, and write its features
+	# with the tweet ids they belong to in to the corresponding output file
+	tweets = load_tweets(filename)
+	nonempty = np.flatnonzero(tweets.nonempty())
+	keys = [tweets.tweet_id(i) for i in nonempty]
+	tweet_text = [tweets.tokens(i) for i in nonempty]
+	if args.model == "word2vec":
+		embeddings = word_embedding_features(model, tweet_text, args.sentence_embedding)
+	else:
+		embeddings = bigram_features(model, tweet_text)
+	num_embeddings = embeddings.shape[0] if args.model == "bigram" else len(embeddings)
+	assert(num_embeddings == len(tweet_text)), "Returned list of embeddings is %d while the number of inputs was %d" % (num_embeddings, len(tweet_text))
+	if args.model == "bigram":
+		write_sparse_features(output_filename, keys, embeddings)
+	else:
+		write_dense_features(output_filename, keys, embeddings, {"model": args.model_filename, "aggregation": args.sentence_embedding})
+	cache.store(cache_key, output_filenames)
+	return False
 
 # Ensure that some model file exists
 assert(len(glob.glob(args.model_filename)) > 0), "Model file does not seem to exist."
+assert(args.model in ["word2vec", "bigram"]), "Model %s not recognized." % args.model
 input_filenames = glob.glob(args.input_glob)
 
-# Iterate through each input file matching the input glob
-for filename in input_filenames:
-	output_filename = "%s/%s" % ('/'.join(filename.split('/')[:-1]), args.output_filename)
-	print "Saving output to", output_filename
+# The model is loaded once, before the pool is forked, so every worker shares the parent's mapping of
+# the word vectors instead of loading its own
+model = load_model(args.model_filename, args.model)
+
+# Features are cached on the hashes of the input file, the model and how the features are made. gensim
+# keeps the large arrays of a model in .npy files next to it, which are part of the model too
+cache = FeatureCache(args.cache_dir, args.cache_size << 20)
+model_hash = files_hash([args.model_filename] + sorted(glob.glob(args.model_filename + ".*.npy")))
+
+# Each input file is featurized by one worker, in the order they were found
+pool = multiprocessing.Pool(args.workers) if args.workers > 1 else None
+cached = pool.map(featurize_file, input_filenames, chunksize=1) if pool is not None else [featurize_file(filename) for filename in input_filenames]
+if pool is not None:
+	pool.close()
+	pool.join()
 
-	# Input all text from the input file in to the corresponding model featurizer, and dump a new
-	# dictionary mapping tweet ids to the features in to the corresponding output file
-	with open(filename, 'rb') as input_file:
-		tweets = pickle.load(input_file)
-		embeddings = []
-		keys, values = tweets.keys(), tweets.values()
-		tweet_text = [tweet.text for tweet in values]
-		tweet_text = filter(lambda a: a != [], tweet_text)
-		if args.model == "word2vec":
-			embeddings = word_embedding_features(args.model_filename, tweet_text, args.sentence_embedding)
-		elif args.model == "bigram":
-			embeddings = bigram_features(tweet_text)
-		else:
-			print "Model %s not recognized." % args.model
-			break
-		assert(len(embeddings) == len(tweet_text)), "Returned list of embeddings is %d while the number of inputs was %d" % (len(embeddings), len(tweet_text))
-		
-		# Replace each tweet id entry with its corresponding feature value
-		i = 0
-		for key in keys: 
-			if tweets[key].text != []:
-				tweets[key] = embeddings[i]
-				i += 1
-		with open(output_filename, "wb") as output_file:
-			pickle.dump(tweets, output_file)
\ No newline at end of file
+if cache.max_bytes > 0:
+	evicted = cache.evict()
+	print "Feature cache: %d hits, %d misses, %d entries evicted, %.1fMB of %dMB used" % (sum(cached), len(cached) - sum(cached), evicted, cache.size()/float(1 << 20), args.cache_size)
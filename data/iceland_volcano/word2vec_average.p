@@ -1,5598 +0,0 @@
-(dp0
-V503977933665763329
-p1
-cnumpy.core.multiarray
-_reconstruct
-p2
-(cnumpy
-ndarray
-p3
-(I0
-tp4
-S'b'
-p5
-tp6
-Rp7
-(I1
-(I200
-tp8
-cnumpy
-dtype
-p9
-(S'f4'
-p10
-I0
-I1
-tp11
-Rp12
-(I3
-S'<'
-p13
-NNNI-1
-I-1
-I0
-tp14
-bI00
-S'\x0f\x8cS?\rR\xa9>\x97b\x0e\xbf/k\x9c\xbdMK1>\xd8+\x97=1##\xbeT\xd9\xc4\xbe\xf01\xdf=H\x87\x12?A\x83\x05\xbeeN\x81\xbe\xb0\x15\xa7\xbc\xf1~\xcc\xbd\xd0\xdfs=\xbf\xe2\x10?\xb3Tq\xbe\xef^\xab\xbem<\x9c\xbe)p\x8e\xbewd\x0e\xbe\xc3\x19\x80<)\x98\xb7>\xd9S\xa5>\xef\x89\x8e=\xdf\x8f\x9a\xbd\xa7o\x82>\x9b\xe8\xcb\xbd\xdbt\xd7\xbeA\x9d\xb1\xbe\'\xa2\x16\xbe\x8c_\xdb\xbd\xc5p\xa4\xbc!\x9a\x10\xbf\xec\x13@>\x84y\xf7>\xb5\xbf\x00?{Vi>0\x81\xe3>\xdb\xda\x14=\x87W\xa8\xbe\xc7\xdd\x8e\xbe\xf3X0=\x07D\x05\xbe\x88\xc5\xc5\xbez\x16\x93\xbdL\x81\x1e?\xc3R\x1d>w-\x00>\x00?Z?\xd9\xa8\xb1\xbd\x8c\xe4\xfe>\xfb{\xb4\xbe\xe8\x06\xc6;\x08\xfc.\xbf\x0f\xce\x87=\xff\xce\x0f>;\xc3\x00>7Yo\xbf\x18\x95<\xbf\xdc\xa9\xb2>/\rj?\x8f\xff\x04?\x8a\xeb\x8c\xbe\x98\x9f\xa5\xbd\xc3\xa3\xea=\x80\xe0\xc1\xbe\xd1\xa1B?O\x19\x8a>\x81a\xcc\xbe\xec\x80\'\xbf\xff\xad(\xbf\x91\xbe\xeb\xbeC\xd4p\xbe\xbcE?\xbe\xb5S:\xbc\xa3\xf0\xc8\xbd\xdf\xdaI>\x14\xb9\xc6>\x834\\>\xab\xbc\xe4=\xf47\x05\xbdG<(?\xc9\x03\xea\xbeO?q>$w\xf2<\xc9\x10\xb9>\xca\x08\xa6\xbexV&?\xd5\xbb\xef\xbd[:\xbb\xbe[\x0f\x88>|\xc3\xb3\xbeTdX\xbeM6\xdc>h\'\xa3\xbdk}\xe8>M\xd5\xa7>\xbb\x15\x14>\xd7|\x82\xbe\xf1"t\xbe\xfbj\x81>\xd4\xfbZ>\x8b\xa6J>\xcc\xfe%?\xef\xde\xc5\xbe\xe1U\x92=\x90\x83\x1c?a\x9aX<\\\x13-\xbe\xb8\nV\xbf\x15@\xe6\xbd\x13\xa4\x0b?\xc9\x80\x91>\x87R\xa4>[A\xb8\xbd\x89\xeb\xf8\xbe\xd7\xa4A>\xd5?\xbd<s\xd8w\xbdI#\x1b?\x07\xfc\xcd>\x980\xe5\xbdE\xedz=\xf3\x18\xa5\xbd\x87 \xa5>\xa3\x8a\xfc\xbd1v\x83>\xb7Z\x0b>\x91\xef\x01>\x8d\x0f\x12>\xcb\xac9>\x94\x9a\x8c\xbc\xe0<\xfa\xbc\x1f\x96Z\xbe(;\xe4\xbd$:\xa3\xbc\xc0\xdf\xb8;\x9f\xed\x1d\xbf\xd7\xe6\x08\xbeU\xc9\x9d\xbe\xe8\xcdE>\xc40\xcb>S\xf1\x0f\xbf\xb1\xac*?Ln\x91>\xc3\x94\xd5=3\xf9o?\x08\xf4\x03\xbe\xefW\x99\xbc\xb1\xc1\x03=\xc5\x83J\xbe\x9f\xbe\xc0>\xac\xe6e>;\xbb\x12\xbe\x0c\x94\xf0>\xa8\xcb\xae\xbe\x08\xee^=\x19s,>\x8d\x88\x11\xbf@%\xe8\xbe\xac\xb3\xc8\xbe\xa7\xa3-\xbf\x89\xa8\xb2\xbeT\xdd\x05>s6P=]\x9a\x1b\xbf@\x95\x03?\xf8\xde{>hd\xf4\xbd\xb5g\x1f\xbdc\x93\xb1\xbee\x84\xe7\xbe\xec\xb8-?\x1e2#>\xb3\x8d\xd0>\xb8\xa1\xc7\xbe\x7f\x91V\xbfx\xadM>\xe7iz>\x1bQ\xb9>\xa0D\xe5\xbc\xa4\xe0\xd3\xbe\xe4\x82\xc6\xbe\x01\x9f\x1d?\')\xb7\xbc]\xb3c>\xb8\xa3\xda=H\x91\xb4> \xee\x9b\xbd\x87\xaa\x7f>\x9bn\x87\xbb\xff`\x9a>E#\x84>\xe3\'S?g\xf7\x19?\xcd\xc6q\xbe\xb0P>=^\xd2\x82>M\x9e)\xbc'
-p15
-tp16
-bsV504269865897963520
-p17
-g2
-(g3
-(I0
-tp18
-g5
-tp19
-Rp20
-(I1
-(I200
-tp21
-g12
-I00
-S'N\xb5p>\xa2\xd1\xc2<\x02\x8d\xb7\xbe\xf2a\xaa=\xce/\x00>\x86p\x18\xbd\x00\x0e\x93\xbdvJ3\xbe\xba\x87\x8c=0!\x01>\x96m\x87\xbd\x989\xd3\xbc\xcd\x964=*\xad\xda\xbcb\xcc\xf7=i\x91\x96>\xce\xb9\x87\xbd\x17\xc7\x85\xbdr\xdf!\xbe\xfc\t\xab\xbd\xa2\x98\xb3\xbd\xf7\xa3\xc3\xbd1 G>\x8c}\x94<\x11\xc8\xaa<K\x05\x93\xbd\xa7\xea\x19>_\x17:\xbd\x14\xb6\x18\xbe\x00z\xaa\xbd\xd6\xb2\xfe\xbd\x97\x8e\x17\xbd\xd3\xe1\x0f;V\x1d\xb6\xbe\xae\xd0\xb8<j\xa7\\>\xe3\x9b+>\xe2\x02%>\xfaSj>%\x8d\x9e\xbd\x0b\xe0^\xbe\xd8J`\xbd\xbaI\\\xbd\x8e\x7f\x8c\xbc"5\x88\xbec^\xdd\xbd\xce]\xa2>wQ\xbc=\x89\x90\x03>w\x85\xaa>h-\x1b<Np\x99>\x9a\xec\xc7\xbd\xca\x1ft=\r\xa5u\xbe\x94\x19\x13>}\xcab;\x10\xbb\xf6\xbd\x14T\x8b\xbemb\xbc\xbe\xc6\xd4\xcf=\xc6\n\x97>u\xedL>\x15\x8f@\xbe~\xb2\xf2=\xaa\xc3\x84=\xe5)x\xbez\xc7t>\xa4\xd0\xab=\xda\xf7\x18\xbe\x14.\xc4\xbe\xb5\xcd\xc2\xbe\xa5\xa4g\xbej\xd7O\xbd\x83?\xbf\xbd\xb0&S=u\xb1\xcd=\x0c\xb1\x85=V@\x8b>\xdd\xb6G>\xfc\x9a\xc4<\xcb\x00\x01>\xa2`\x87>\xca\xe7[\xbe\xafK\x85=\xb0@&=N\xb1L>\xb1\x07\x89\xbe\xa2;\xd3>Vh\xdf\xbd\x87\x8a\x9b\xbe\xc8/8>\xd4\xa26\xbe\xbc\x07\xaf\xbdZ\x82Q>\x96\x90L\xbd\x13\xc5\x81>\x18\x14\xf1=\x7f\xeb\x1e>\xe2#\x00\xbeprB\xbc5t4>\xfb\xa6\x02>U\xc1\x86>{\xf6\xbb>\x8e\x9aF\xbee\xd8\xab\xbc\xc0\x00p>\xbb\x11&=@Z\x8b\xbd?\x87\x81\xbe\x8a\xa1\x80\xbdJ\xfbg>8{\x11>\x12\xc2\xa7=B}\t\xbd~\x17\x9f\xbe\xf8}\x9e=]s\x8d\xbdB\xde\xaa\xbd\r_\xd2>\xa0mN>GbD\xbcu1\n\xbc\xcd\xa9b<\xf4tL>\x14-\x8c\xbd\xd3\x81\xf1<\xf2\x83\xa4=\xfe\x85->\x90w\xf3=\xa7n\x16>b\xce>=\xd8\xd1{=V0\xad\xbd\x06\x05,>\x1a\xe9\x01<\xd8\x9d\x98=\xef\x90\x9f\xbe*\x12Y\xbd\xb8\'\x80\xbe \xe2\x91>\xb3\x8a\xe4=\xa5\x1a\xad\xbe9\xf7\x1e>\xe3\x94M\xbd\xc0x\xf2<\xfa\xbf\xde>\xca\xfb\xe4\xbd\x9c\xa0\x81\xbbj\x83\xab<\xbesI\xbd!\xc9\x17>\xea\x8c\x05>\xe3\x80\x0f\xbdu\xa0\xc5>\xc3\x04^\xbe\xa0\xaaU\xbb\xca\xfe\x0b>\x99l\x8f\xbe\xb4\x13\xaa\xbd5pa\xbeZ\x05\xd2\xbe\xfc\xe6\x0b\xbe\x15q\x19<\xef\'\x91<|\x95\xae\xbe\x9d\xb5\xa3>\xd0e\xb0<M~\xa8\xbd\x18\x1a\x16<5\xcbj\xbe>\xd8U\xbe\xfa\x1b\x8a>HK\xe0<\xe6\x1d\xe4=\xe6\xdb\x1b\xbes=\xaa\xbejut>>\xa5\xfe=\xfe\x95\x92>\xc4\xc7\xb4<6N\'\xbe\x8e\xa1 \xbd\xe5\xe2\x92>\xb3\x00\xef<2L\x91>\x00\x0c\xe0=\xb3\xf0h>\xaa\xbd\xab\xbd\xd6\x88L>\xab\xdfR=\xfe\xf0,>\xb6\xfbQ=\xe6\xa0\xc7>\x1e\x0ev>@\xcew<\xa2\xd8\xb3<\xea\xd1\x93=\x04\xff\x1b\xbe'
-p22
-tp23
-bsV503967006576480256
-p24
-g2
-(g3
-(I0
-tp25
-g5
-tp26
-Rp27
-(I1
-(I200
-tp28
-g12
-I00
-S'L\x8b\xef>\x82s\xfa=\xa9]\x1c\xbf&\x98P=\x01\x07\'>\xf2\xaeV\xbd]\xc0\xac\xbd\xbe\x8aa\xbe|\x16\x8a=\xb7K7>\x83\xb7&\xbeX\x0c\x18\xbe\xed\xff\xe2=\xe5\xfe)\xbeo\xe1U>" \xe0>.\x14\x8c\xbd\x14R\x1e\xbe\x8d_\x84\xbe\x0cV\xc9\xbd\x8bG)\xbe\xc5[\xbb\xbd\xdc\x0f\xa2>\x91\x04\xb1=\xbc3\xcd=\x17\xd5\x1d\xbe0[c>o\x98\xad=\x9a\xcb\x8d\xbeo\x88Q\xbe\xa5\xb70\xbe\n\x84\x91<\xd0\xcf\t\xbd\xcaR\x0e\xbf\xfe\xd11=Y\xb3t>\x00^z>\xe1h\x81>\xb3#\xc8>T\xe9(\xbe\x003\xab\xbe`\x9d|\xbdi\n\x1c\xbeb\x86\xdc\xbc9\xb6\xdd\xbeK\xa1x\xbeE\x92\xf7>j\xbf >\x06\xaf@>\x9f\xc2\x06?\xd7\x90\xdb\xbb\xb9\x88\xf3>\xe4\x0e[\xbe1\x7f\xdb=\x18\xe2\x8e\xbe\x996\x13>|h\xae=%ct\xbd\t,\xd7\xbe\x9b\xd0\xf6\xbe\xe5\x03+>\x87\\\x16?\xf5\xa2\xd5>\xd7\xe3Z\xbe\x00\x9b\x13>\xda\xa4a=\xfe\x0e\x96\xbe\xe1\xbc\xd6>d\x92\\>\xbc\xf9e\xbeP\x82\x18\xbf\xb1\x0e\x1c\xbf40\xd4\xbe\xb4\xe6a\xbd]\x17O\xbeB\x925\xba\xd9%\x03;2|\xfd=2\xbf\xe7>5\x0c\x86>\xee\xac\x13={U\n>r\x1b\xce>\xda\x97\x90\xbe\xd3y\xde<\xbe\xf1\x16>3\xa8\x94>\xbf\x1f\xa1\xbe \x8a\x0b?\xe8\xc7\xa6\xbe[\xf5\xeb\xbe\x8a\xff\x83>\xe11\x99\xbe,\xe9\x8c\xbe\xe9t#>d\xaa\x02=\xc6>\xcd>O!/>\xb2\xcb\xf7=\x00\xdbo\xbe\xdc\x9e\x9b\xbc\xd2\xa2h>T\x97\x83>\xd9#\xbd>\x17~\xf6>m8\xa0\xbe\x8b\xe7M\xbd\x97\xb3\xff>\r\xc1\x8f<\x8d\xaeK\xbd\x1f\xd3\t\xbfU\xd7\xf5\xbd\xbb3\xed>\xa3;\x81>\xd8\x99\xbd=\x87!\x17\xbe\x10o\xfb\xbe${\xe5=\xa0w\x14\xbeD\xcd\xd4\xbd\xd4\x15\x10?\x95[\xac>Lz\xe5\xbd\xd5\xa8\x12>\x8c\xa0A=\xa0\x12z>\x1a\xc9V\xbe\x9fz\xab=\xdc$\xc4=\xa8\xa2\x99>\x07\x9ao>\xd4]}>|3\x82=\x15\xf1\xdf=s?\x08\xbeB\xd40>L\x14\xe3<8}\r=s\x16\n\xbf\x87G\xe5\xbdu\x8f\xe0\xbe\x10\xe9\xba> \xe8n>\xeb\xa7\r\xbf\xaeJ\x84>p\xc7\x8f\xbaK_\n=\xe5\xf3E?\x80#\xef\xbdz\xb8\x9a\xbdr\x93\xed=B\xe3}\xbdyA\x89>1\xb5?>\x9c>S\xbd^S\x14?QL\xaf\xbe\xac\x89G<\xdc\x17H>\x95\x85\xf5\xbe\xca\xd7S\xbe\xf4\x95\xc6\xbe\xf5\x87\x1e\xbf^\x80\x89\xbeb\xe6\xe8=[\xcd\xbd\xbc\xc2\xf7\x12\xbfS\xc9\xcb>\x886>>\xd0x\x86\xbd\xfaD\xbf\xbc\xca\x14\xc4\xbeL\xd8\xcf\xbe\xf9\xaf\xcc>\x8d\x0f\xa4<\x08M:>b\x07l\xbe\xd8\x91-\xbf\xb7W\xaa>\xedm;>\x9f0\xc6>\x86\x16K\xbd\x8b\xad\x8e\xbe\xf3\x9c\r\xbe`\x8d\xf9>\xdcR\xd1<\x1c\x82\xe5>\x9e\'\xbf=\x88\x88\xc4>$!\x9c\xbd\x9d4\x9a>\x83\xcd\x02=G\xdd\x90>\xacu\xcf=\xfc4"?#\x92\xb3>\x8b~\xa2\xbd\x95=\t=`\x8c\xe7=\xf4A\x83\xbe'
-p29
-tp30
-bsV503973855569125377
-p31
-g2
-(g3
-(I0
-tp32
-g5
-tp33
-Rp34
-(I1
-(I200
-tp35
-g12
-I00
-S'\xe4\xd9\x1e?O\x13\r>T\xf8\x00\xbf\xdf\xdf\x1f=\xc6\'n>\x8b0P\xbc\x9a\xe7\xd8\xbdBN\xc4\xbe9}I\xba~\xcb\xdd>\xe9?\xa7\xbdDtN\xbd@\xc9\n>\x14N\xe7:8\xf2\x86<\x8b\x88\xdd>\x80n+\xbe\x90\xb1\x1b\xbe\x95\xcbg\xbe\xa1]$\xbey\xcfV\xbeS\x8b\x11\xbcZ{o>\x0b\x16\xd8\xbd\xbd4\x85=y\x99c\xbdr^\x83>!\xec\xdb\xbd\xf5^\xc8\xbeOt\xdc\xbbn\xd4\x04\xbd\t4\xd9\xbd2H\x80=\xc0\xb7\xf8\xbe\xb6\x04\xf1=\x96\xee\xb9>\xcc\x94\xb9>r\x03i>[\xda\xf4>\x1e\x830\xbdRxZ\xbe\xb5\x1e\x19\xbe\xc2\xc7\x94>\xd1\xbcw\xbe&\xb6\x86\xbezx\xba\xbdy\xd2\x12?\xe5,\x0f>\xe1\xd3\xdd=\x17%-?\x14\x11\xdd\xbc\xc0\x91\x15?\xef\x89\x87\xbe\x97\xd1\x9b=\xd4\x91:\xbfq\x12=>\xdb\xa3\xef<\xf1\xa4\xa0\xbc66O\xbf\xe0&\x15\xbf*\xef\xa3>\xa0\t\xf0>~\xce\x9e>\x92\x89\x9d\xbe\x9e^#\xbd\x0ck\x15>\xe7\xbe\xb7\xbeq]\x0c?\x89\xc6\x9e=\xc5`J\xbe\xb2m5\xbf\xae\xb7\x11\xbf\xe1\x8e6\xbe\x7fI\x10\xbe\xd0;\xb2\xbd\x12\x19->j\xe2\xb6=\xa4\x0f=>\xcd\xeb\x8e>,6W>\xdb\xe0\xa8<\x19=\xb0\xbdI\xef\x05?\xc7\xc1\xba\xbe,W4>\xb1\xec\xaa=\xa4\xa6\xd3>\xaa\x1b\xb1\xbe\xb3\x00\x19?\xe7W>\xbd\x91y\x93\xbe\xe1aJ>+\xb6\xab\xbe\x0c\xf9\x1e\xbeV\'\xc8>\xf9\xc9a\xbc\x8e\xbd\x99>\xde\x12\xac>\xf2\xfb4>I\x11;\xbe\xdcU\xb1=\x1e\xd9\x94>W+<>\xca\x8a]>\x963\x15?i\xbd\x99\xbe&\xed\x84<j!\xa3>Mc\x81\xbc!\xe8\x85\xbd@\xc4\xf2\xbe+\xef\x0b>\xaf\x87\xe5>\xd6\xed\x92>\xcc\xc8\xf8=*\xce\x93\xbd0\xa4\xd7\xbeq\xd3\x99>~\xdc\x99=y\x92\'=\xb9\xfd.?\xf6\x1fg>D@\x9f\xbd\xca\xdd\xd0<Ae?<\x86v\x9a>\x92Q\x0e\xbeb\xe7\xb2=\x95\xc8\x06>\xf9\xf5\n>\x81\xf5\x13>A\xd1\x11>\x12\xfb\xbd<\xb9\\\xa5=~\x0b2=\x95\x92\xc7\xbc\x97\xed\xe5<\xc7=\x8a<t\x87\x95\xbeF\x941\xbd\xbfb\x8a\xbeG\xe5\xaf>KM\x8f>U\xe2\x00\xbf@A\xe0>p\x95\xd1=\xc4\xe5<>\x9f \x12?l\xf7<\xbe\x0e\xf9\xb0\xbcn\x8c\x14=\xaawS\xbe\xe2o\xa2>\xbew\x86>`\xb4\xaa\xbd\x8a\xe7\xd7>4\x94P\xbe\xa5\x9f\xfc=\xe4\x15\xba=\xf8C\x00\xbf\x8c}\x06\xbe\xcc\xd5\xe7\xber\xba\x1f\xbf\x86\xa0%\xbe\xc2\xb0\xef=\xe0\x11N\xbd\xdc\x03\xff\xbe\xa72\xe8>\xa1G\x95=)u0\xbe\x19\xca\x12;@0\x85\xbe\xd0!N\xbeqC\x1e?\xa5\xac^=\x80\x019>\xf1\xeb\xcf\xbe\xd2{\x1f\xbfLx\x05>9\xe8\x1f>\x1f"\x93>\x1e\xbdP=Yq\xaa\xbe\xd9\x89V\xbev\x0e\xe6>\xc5M\xbb\xbc\x160i>j\xd2\xf6=\xcb*\xcb>\xcc\x84J\xbe\xbe\x1d\x8f>\x8aAn=|\x1f\x82>\x04Ri><%7?v\x93\xf4>Una<N\r\xd0=F\x03(>z\xbc\t>'
-p36
-tp37
-bsV503975519705366529
-p38
-g2
-(g3
-(I0
-tp39
-g5
-tp40
-Rp41
-(I1
-(I200
-tp42
-g12
-I00
-S'\xa3\xfb\xa0>\xbf)(<\xbfV\xb9\xbe\x17\x8a\xa8<,\xe1;>\x81#\x08\xbd\x80uy\xbd\xfb\x0e\\\xbe\xdbav\xbc\xb55a>\xa7\x04\x9d<Y\x0e\xdb<\xeb\x88\xd8=T#\xae<\xe1\xfe$\xbd\xff\x03\x8d>\xd8\xd5\xb3\xbdl\x0e\xae\xbd\xf4K\x08\xbeI\xb1\xfd\xbc\x15\x04@\xbe\xa7\xfb\xb0\xbc\xf0o\x0b>LA\n\xbe\xfb\x01\xee\xbc\x99\x85\x82\xbd\xa1T7>\xb3\xbd&\xbe@5]\xbe\x80\xedD=\x95\xeb \xbb\xbf\x90\xf7\xbd\xed\xf5\xce=\x98\x1e\x90\xbe\xcf\xf62=\xb7\xdc\x90>}n<>\x0c\x1f\x08>f/\x9b>\x95"\xef<\x01!\xfd\xbd\xe8\x89~\xbd\x8dLE>\x94\x11K\xbe@\x05#\xbe\xb7\xf3\xe8\xbc\x9d\x86\xbe>\xbd\x04S=\x81\x86\x86=\x1b"\xc0>\x7f\xe5\xd0<\xa5\xd3\xbf>\xe9A\x1b\xbe\xe0M\xb9;G\xdf\xd7\xbe\x0c{5>(\x1e=\xbbpH\xaf\xbd\xc9c\xea\xbe\xab\xc2\xc2\xbe\xa5lI>\x81\xe8S>\xb5\xb4\x87=\xeb\x84Y\xbe\xdf\x8c\x8b\xbc\x946\'>?*b\xbe\xa7R\x84>\xdbQ\x11\xbee\xd2\xe4\xbd\x88\xee\xea\xbe\xfb\x8a\xa3\xbe\xe9\x0b\x80\xbdU\xca\xd8\xbdU\x1b\xb7\xbd\xe6.)>\xd5\x850>\xf0\xd2\xce=?\x12\x1f>\xf0o\x1c>\x95\x01\xd3\xbc\xa5\x1d\xdb;s\xdb\x8f>\x0e\xed\x80\xbe\xc1e\x08>\r\xbb@=m\xa4\x83>\x8dQ\x97\xbe\x85\xb4\xe3>=\t4=\x04QD\xbeM\x9d\'>X\xf1`\xbe+\xddh<\x7f\xaf\xa6>5\x98\xd2\xbc\x7fS*>\xe5\xacL>\xf0R\x16>\x84\t\xbd\xbd\xe4\xeeH=1\xffu>\x88}\xdc=E\x91\x0c>\x88N\xc7>\xc5`_\xbe\xb9~\x8c<\xc08\xeb=\xf1\xa6\xb5<\x91\xa7\x14\xbd\xb7\xbfI\xbe\xb0k\x0b>i\xfdJ>\r\xd0:>y\x9d\x88=\xa5\xf0U\xbbu\xb1\x8e\xbe\xb4C]>P\xcd\x0b=\x1d\xaaB=\x9d)\xed>Y\xab\xf7=\'\xa1\xcd\xbcW/\x91\xbc\xfd\xccS\xbc\xc7\x8b|>\x9c&\xba\xbdlW\xc3<\xb5\x9aA=4\xc8\x90=\xb1s\xaf=TT\xae=\xd8&]=\xf3\xd1\xa3;\x03^\x01<_\xa2\xaa=O\xfc\x82\xbc\xb1\xc3\x0c=-L\xa3\xbd\x9f3\x1b=@\xeb"\xbe\xe7\x84\x93>\x9c\x12@=\xb7\x11\xa0\xbe\xad\x0cw>\x19#\x94\xbc\x19\xef\x11>\xa0\xd0\xa4>\xdb\x81\x10\xbe\xff_w\xbbh\xc2l\xbc\xb9=\r\xbeW\x94B>\xcc98>\x82\xc9\x91\xbcx\xad\xa1>\xe7\xcf\xdd\xbd\xd9K\xa7=Os\x98=\xe5\xe9\x8b\xbe\xf1\xfa\x86<\x15\xe1[\xbe\xa9\xf7\xb3\xbe\xe0.\r\xbe\x00\xed\t9\xa5\xba\x7f\xbd\xb7\x03\xb6\xbe\xad\x0e\x9f>e\x13\xb1\xbc\xa3S\xba\xbd\xe86\x19<\x9c%)\xbepc\xae\xbd{\x1a\xe5>5\xd2u=\xbb\xeeL=Ss\x87\xbe\xc7\xa5\xac\xbe\xd5\xbe}=\x8f\xc2\x05>9\xd7z>(L\xff<\x1b\x8f\'\xbe\x13\xf9\xaf\xbd\xd2\xb6\x87>O*>\xbc\xc3\x02J>\x8d\xd9L=\xf1o\x80>\x89\xff!\xbe\xed\x11 >%\x9b\x80=\xb6.&>U\xf1\x13>ga\xcb>Y\xac\xa2>\x9dj[=\xd4\xd1p= \x02j=\xef6\xbd='
-p43
-tp44
-bsV503974691439407105
-p45
-g2
-(g3
-(I0
-tp46
-g5
-tp47
-Rp48
-(I1
-(I200
-tp49
-g12
-I00
-S'\xf6\x1f$?\xd3f\'>\xa4\xf10\xbf\x81i\x82;\xd0\xdbI>l\xebd\xbd\x8f\xf3\xc8\xbd\x8d\x98\xa0\xbe\x12\x9d\x13>\x81Z\xa4>\xe3~>\xbeE!:\xbe\xe7i-\xbc\xf5\x16\xb6\xbd\xc5\xc6\xe7=\x85\t\xf9>\xed\xff\xd4\xbd\x94)\r\xbeH\xf3\x9a\xbe`5N\xbe\xeaL7\xbe<\x06\x81\xbd\x9b\xd2\xba>\xe2\xee">\xad0\xd8=\x1d2&\xbed\xb4\xae>y\t\x0f\xbca\xa1\xad\xbeK\xf0\xa0\xbe\xed\x909\xbe#"\x99\xbd\x98\xbe1\xbd/Y%\xbfY\xcfr=\x1b6\xe1>\xe8\xe6\x9f>\xd7L\xae>\xe0=\xee>j\x9f\n\xbe\xb4<\xf4\xbe\x8e\x82\x97\xbd\x1b\x11\x9c\xbd\xd5\xba\xb9\xbdY\xca\xdb\xbe\x9d(y\xbe\x9b\x86\x08?\xe6E >\x1d\xe9m>\x9c\x00>?\xf3\x1d/\xbdhq\x06?c0\x9c\xbe4\x1d\xe8=\xe3\x97\xd4\xbe\x9beD>3\xc7#>\x18I\xf6\xbd\rc\x1c\xbf\x92>(\xbf\xe6*\x95>\xe8~@?GU\xd8>\n\xcf\x84\xbe]8\x14>\n-O=V\xbe\xea\xbe\x1ax\x05?1\x93N>3\x89\x87\xbe\x8a:<\xbf8[ \xbf\xf7\xf9\xcc\xbe\x03\xda$\xbe\xd0\xb7\x99\xbe\x18p`\xbd\x8d\xfe\xc0<\xcfj\xf6=\x8dD\xfb>z\x84\xa8>\xc8M\x15\xbc\x1d\xa3\'>\xe9\xe9\r?\x0b?\xbe\xbeh\xe1\xfd=\xd9L\xfe=2\xa2\x9f>-\xd7\xe3\xbe\xc4}/?\xae\x06\x80\xbe\x96\x87\xfd\xbe\xac\x8b\xa0>\xef*\xd1\xbe\xb3\x1fF\xbe-\xa6\xa9>\xed\x8c\xde=\x05\xb4\xe8>\x1b\x8d^>\xe4\xb5&>:\xd8\x87\xbex\xa8\xf8\xbd\xab\xfa\xb1>\xdd\xa7|>\x11S\xc5>\xd0\xd6\x0f?\xa1S\xd6\xbe3C\xf1\xbc[\x0f ?\xdc\xba\x92=\\\xb0:\xbd\xa5\xdc)\xbf\xa8\xeb\x83\xbeq\x04\x06?M\x96v>c\xfbx>\x03\xe9\xc0\xbd\xc3`\x16\xbf,\xf1.>\xb4k\xce\xbd\x8f\xae\xfc\xbd\xf3\xf1!?\x8e\x15\xc0>\xc75\xf3\xbd\xb4\\\x0c>\xbd\xc0u\xbdCI\xad>\xacP]\xbe\xa8\xe7\x87=\x1bK@>-?\x8d>J\xa9\x90>\x18v\x8c>&+\x9e=\xfe\xc9\xb6=\xc3\xecS\xbe\xa8=&>\x04K\x13\xba\xa7\x1c\xc0;\xcc7\x18\xbf\n\x86h\xbbL\xf5\xf8\xbe\x82\xfb\x8a>T\tf>S\x060\xbf\xa3\xd9\xcf>\xcf\xf6W=\x167\xef=\x88Qc?\xbd\x05\t\xbe\xeb\xfc\xa2\xbd\xde\x17!=\xf7V\xd0\xbd{A\xce>Y\xbdk>\xcb\x9d\xb0\xbd\xf1I4?\x90\x1a\xcb\xbe\x16\xa5\xd8<\xc8VJ>j)\xd7\xbe\xd3\x06\xaa\xbe,F\xef\xbe\xbf\xba:\xbfM\xea\xb9\xbe\xb0\xb5\x15>\xd7[\xcb<4q/\xbf>\x17\xf5>\x87ia>\x9d\xff\xb2\xbc\xafh\x08=(\x94\xba\xbe~#\xe4\xbe\x0f\xd4\x06?\x95\xf4\x91=\xc7\xc1\xb4>\xdf\\\xb1\xbe\\\xdcV\xbf\xed\xeb\xa9>\x7f+A>\xf1e\xdd>\x88A\xa59\xf3O\xce\xbe\xb8\xbe\x8b\xbesy\x03?[\xfd/=\xdd\xd9\xce>\x83r+>\x14\xf4\xca>\x98\x97\xe1\xbcc&\xc7>\rT\x0f=\xa9?\xad>t\xca\xd9=\xf4\x1aO?XE\xe5>\x1cR\x9e\xbd0:N\xbcm\x8b/>@\xe8p\xbe'
-p50
-tp51
-bsV503962719067066368
-p52
-g2
-(g3
-(I0
-tp53
-g5
-tp54
-Rp55
-(I1
-(I200
-tp56
-g12
-I00
-S',j\xc0>\xfd\xbc\x89\xbd\xdc\xaa\xd5\xbe\xdd\xe2\x14=\x1f\x05\x93>}\xfb\x94\xbd\x84TJ\xbd[8O\xbe\xf9R@=H\'\\>\xb3Ad<\xad\xa5\x0e=\x07z\n>\xc1\x9f\x9f\xbc\x83\x9cF\xbdP\x0f\xc8>\x19\xd5a\xbd)\x91)\xbc\xa1&c\xbe\xe7z\xaa\xbd\xd9w+\xbe\x8c\x9b\x00=\xd4i\xdb=Z\x94\n\xbe\xa5>\xb0<\x1d\x11\x1c\xbe\xe7\xcas>#-\x0f\xbe\xa3O\x9b\xbec\xbf\x0f\xbd7\xd3\xf3\xbd\xd5\xf63\xbc\xd7\x82\xaf=\x805\xe2\xbe3\xe4\xcb<\xf7\xedn>C\x8f^>R"">\x19\x13\xb1>!\xee\x94\xbd|\xc8i\xbe\xf0\xf0\x9d\xbd\xe7\xb6\x0c>\xb9\xe6N\xbe\xc5\x1et\xbe \x16\x0b\xbe\xabS\xd8>\x94\x01\xc9=\xad\x87\x07>\xcdu\xcf>\xd3\x19)=$\xf9\x06?t>\x7f\xbe\xfbT\xd3=\xfd\xb0\xd1\xbe\xd9:I>V\xf4\xa7\xbb!\xc7C\xbe/\xd8\xe1\xbe\xecE\xe6\xbe\x88\xa7G>\xd7W\x99>wlb>\xbc\x19\xd3\xbd_\x9b\xa2=g\x9a\xdf=\xfb~\x94\xbeh\x04\x98>X\xd1\xd5\xbc\x15\xb0:\xbe\x04\xa3\x01\xbf\xf1\xe7\xa2\xbedw\x85\xbd\xb5B\x0b\xbe\xa3c\xc3\xbd\xb0\xd74>\x84"\x1f>\x9ca\xef=\x81rA>y\x95\x82>x\xe3\x98\xbd\'\xe2\xac<X\xbb\xac>\x8f\xdag\xbe\xf36\xbe<\xc5\x9a\xd2<\x994\x9c>\x9bB\xa7\xbe\xe9t\x0c?\x0c\x0c\xc7\xbc\x7f\xed\x8d\xbe\xf6@\x11>\xab\xdb\x8a\xbe\x18%\xe8\xbd\x08A\xcd>\xeei\x10=\xa5Ay>\xbb9J>\xe4\x0eR>_w\xd7\xbd\xed\x14\xb3=\x913\x8e><TP>{\x0cd>oa\xcb>\xf8\xf9k\xbe\xe53\xe6<\xad\xfbN>KN\xa3=\xee$\x07=\x92\xc4\x93\xbe\xb077=\x15\xf0F>\xf5\xf1\xff=\xa7k\xac\xbb\xfb\xd2\xb4=lM\xcf\xbe\xec\\o>\xebb"=\x9b\xbb\xcf\xbb\x10Y\xf5>\x19B]>_\xb4\xfe\xbbO Q=\xd0\xf2)=1[\x9f>\x8a\xdf\'\xbeY\x97\x9a\xbc\xed\xb7\x9e=a43>y\xff\xd4=~\xca\x95=\x16\x0e\x02>\xcdy\x06=\x89~\xc8=\x1f\x01\x19>\x9d\x06\x18=\xd5\tW=a}\x1d\xbe\x1fI\x02\xbd\x9f\xf9\x96\xbe=\x8c\xc1>\xa5\xaf\xaf=0\xfb\xc2\xbek\x84W>\x95\xc5O\xba \xbf\x15>\x08\x1a\xe6>\xd9\x9b\x12\xbe\xf9\x81\x11=Oo+\xbd\xaf\x8c\x06\xbe\xa7\n5>\xd7n)>\r\x120=x\\\xe2>\x1c\x8d]\xbe\x8c\xdf\x06>wo\xeb=\x87f\xac\xbe\xeb>\xac\xba\x9bT~\xbe\xb8D\xfc\xbe%~\'\xbe/\x16\xf8<\x94\xcf%\xbd\xc9\xa8\x04\xbf@\xf4\xaa>t\xcf\xba\xbd\xbb]\x01\xbe\x8f\x9e\x15=)3l\xbe\x08\xe7\xd3\xbd\xac\x00\x05?\x9d\xc2\xdc=$L\xd1=I\x86u\xbe!\xf4\xe9\xbe\x89\x12)>\x7f\x84\x02>\x07"\xa3>\xb5\xab\xf7=\xc8z\\\xbeB\xf8\x83<\xf7?\xc2>\x81T\xc5<\x10\xd1\x97>qz\t>\xad\x83r>\x99H\x94\xbd\xf5\xb7\x8f>\x07\'\xa0=9\x85\xed=Y\x16l=\xeb\xf1\x08?\x8d\xbfe>\x81\xb3\xd9=\x10\xe6D=x\x7f\xd7=\xf8\xf1\x9a;'
-p57
-tp58
-bsV504264023647739904
-p59
-g2
-(g3
-(I0
-tp60
-g5
-tp61
-Rp62
-(I1
-(I200
-tp63
-g12
-I00
-S"\xec\xa1\xfd>J[\xae=\x03\xbf\x1c\xbf\xb7\xfc\x1b>\xe7\xa5\x93>\xb4\rg\xbe\x97B\xf8<\xa3\xf6M\xbe\xc0\xfa\r\xbd\xeav8=\xe4T\x9c\xbc\xfd\xa1\x82<A\x9f\xfa=\xc9$\xae\xbb\tIk\xbb6\xd4\xbc>\xd2\xf0\xa1=z\xb6\xd7\xbd\xa9\xe62\xbe\xfd@\x8c=\xbfS8\xbed\x84\x8a=\xacl\x06>\xff\x1b\x97\xbe3\xb4\x08\xbd\xd9\xb3\xe2\xbdTZ=>\x95\x0b\x9d\xbd\x96\xc3p\xbe\x9aYE=\xe9\x9b\xb9\xbd\xea\xd2\x81\xbcQa\xb9=\x7f\xc9\xad\xbe\x07W\n\xbc4\x05{>t\xfeu=\t\xe3\x92>\xcd\x8d\xd2>\xf1\xab\xe9\xbd\x86\xa5@\xbe|\xf0\xcb<\xe9\x8e7>\xa4m\xa7\xbeP\x89\xab\xbe3\x88D\xbe\xa4\xf1\xc6>\x0c\x15\xcf\xbbJ\x00\xec=\x8c\xfc\xf0>\x05\xb2\xa3=\x9c\x87\x0f?\\Kx\xbe\x99`\xd9==\x8b\xc0\xbe\x8f3U>O\x8b\xb5=\xcd\x93V\xbe\x9f\xc9\xc7\xbe\x9f\xb4\xd9\xbe\xd3O >\xac`R>\xad\xb1\x06>U\x16\x14\xbe\x06\xca`>\xa1@\x1f>\xb6\x11O\xbe\xe3\xcdn>\x94\xb7R\xbe\xd6\xd4:\xbe\x13\x0f<\xbf\xdc\xa6\xbf\xbei\xac.\xbe\x11\x8d\x82\xbd\xc7F>\xbe\x8d\xbaW>\x83mC>\xbe\x91!>D\x8ft>\n\x17\x96>\xb9\x1d\x9b\xbd\xa7`\xe2<F\xe5]>\xcf\xd0W\xbe`\xe0\xa1<\xe5\x07\x18>\x0fV\xa4>\xc4m\xb5\xbe\xaf\x13\x05?\x0c|\x9d\xbd\xd6\xda\x8e\xbe<%\x8d>\xa0Z\xde\xbe/\xad\xcf\xbd\x9f>\x86>_h\x89>\xefv)>L);>Cf\xc2=\x8c\x18 \xbe\xdc\xd1W>D\x9e\xb7>\x1f\xa5\x1e>$0q>W\x1e\xdb>\x05-\x9b\xbe.\x0b,\xbdC\x15\x8b>\xff8n=\xec\xf6\xe7=\x98p\x8b\xbe\xad\x1c\x17>\r\xf0\xbd>w\xaeU>\xe1\xc2\x15=D\xb2\x8d\xbdA\x0b\x02\xbfI\xd9\xb0>m\xb3\r\xbd\x8a\x9d\xc5<\xdf\x94\x06?\x84:\x0c>\x132\x05\xbe\x06\xc2&>\x10$\xd9=\xdf\x8eo>\xcf\xb6\xa3\xbe\xba\xd7j=\xa9\xe3\xc6:\x86x\xdf=\xb1O\x13>\x16V\x97>\x00\x93\xfb=\xe9\x97h=\xc2N\xa0=\xbf\x94 =\xb1l\xf3\xbc\x87!\xad\xbb\x9c/z\xbd\x87\x9d\xa4\xbc\x19\x81\x8c\xbe\xfd\xe5\xbe>Ct\xc9<\x84J\x0e\xbf\xed\xf1r>\xbf\x0e\xd7\xbd\xe1c!>\xdcR\t?\x89\xc5\xe0\xbd'\x94\x87<4Iq>\x818\x1c=\xf7E\x8b>3.T>\x86\xae\xd4=\xc7W\r?G#\xdc\xbd\x7f\xa3\x0b>\xdfS\\>\xa9w\x93\xbe\xda\x06n=@\xa2\xae\xbe_>\xd2\xbe^\xad\x9b\xbe\xd0\xf7u=sTO\xbe#\xc3\x03\xbf\xbf\xe0\xa3><\x1f\x10>\x89\x06\x07\xbdj9\xeb=\xdf1\x86\xbe\xc3\x16\xd7\xbd{\xd1\x04?\x84*\xaf=M\xd0\x0c>\x04\x06\x8b\xbe\n\x05\x17\xbfD\xea!>\xf9k7>g(\xa7>S\xf7A\xbd\xb9q\x1d\xbe\xafo\xaa\xbcj\xbd\xb3>\xcdy\x90\xbd\t#\xab>\xac>o<\x1bV\x94>\x10.\x8e\xbd\xdd\x1f\xb2>6\xf5\x9b=J\xeal>\x0fnf>YL\xea>l\xdd\x8e>I\xc0k<\xf6e\xd2=\xa4\xd5\x9b=\x9f\x16\xb1\xbc"
-p64
-tp65
-bsV503974101128851456
-p66
-g2
-(g3
-(I0
-tp67
-g5
-tp68
-Rp69
-(I1
-(I200
-tp70
-g12
-I00
-S'\xcf5\x8b>\x043A\xbcty\xae\xbe@\x0e\x99<\xaf\xf46>\xec\xb1\x16\xbd=\x7f\x1a\xbd\t\x82B\xbeh\xce\xc6\xbc\x0cQ@>4\x9e\x83<;\x89\x9b<\x19\xd3\xe7=\xf6G\x98<L\x94\x83\xbdEmv>\x0e\x1b\x93\xbd\x0f\xe3\x88\xbdA\x0e\x04\xbee\xe5u\xbca\xf19\xbe\xd0\xa2\x99\xbc\xdd\xb8\xe1=\\d\x10\xbe\x07\xe6\xe9\xbc\xc2T\x98\xbd\x16A3>\x95a\x18\xbe\xd5\xcaS\xbe\x82F9=\xfe\xbf\xa4\xbc~\xce\xd2\xbd\x9d\xe7\xc5=\xd9\x8a\x8b\xbe5\xd3\x00<\xe88\x84>\xe5\xed\x15>\x0b\xe7\xff=c\xdd\x8d>\')\xe2<JZ\xd9\xbd\x9cI\x00\xbd\x04\xf94>IuK\xbe\x0c\x84\x1b\xbe\x1d\xf54\xbd\x821\xaa>\x00\x177=Eq\x83=\xe2\x89\xad>\xf7\xef\x00=\xa4E\xb6>\x9e\xf0\x11\xbe|.\xad<RQ\xbb\xbe\xc9\xca3>\x81O\x87\xbb\xc1\x0c\xda\xbd\xd2[\xc8\xbe\xa9\xa3\xb4\xber/<>]\xbe\x1f>\\\xec2=\xbd2?\xbe\xdcT=;\xba\xe5(>\xc1\x0eU\xbe\xd8!M>\x10\xe6 \xbe\xfbm\xd4\xbd\xbd>\xd7\xbe\x90\x06\x91\xbeUu\xd9\xbc\xae\xd8\xca\xbds}\xc0\xbdP|\x1d><\x00=>P,\xb3="9\x17>\xb2e >\xfd3+\xbd\xc4>\xa8<\x97\x9c\x8a>.we\xbep\xac\xdf=4\xe69=\x89|d>\xae\x95\x98\xbe\xfey\xd5>\x19$ =\x14\x9e5\xbe\xa8\xb8\x11>\x07tN\xbe\x15\x1do<\xb5\'\x99>\xd9\\\x98\xbbE=\x17>\xea48>1\xed\x10>\xf9\xf5\x91\xbd\x12\x89`=\xab3u>L\xce\xd0=\xfa\x7f\x08>+\xe4\xab>4\xb6V\xbee8t<_p\xc0=wc\x16=5^e\xbc\x06\xe4\x1d\xbe9#\x04>\xbe\xb7%>\x15>">\x9eoD=\xd6\xf1 <\x9b-\x8b\xbe\xfc6f>\xe0{n<\xff\xde3=\\i\xd9>}\r\xca=\x19\xe3\xf5\xbc\xab\xbb\xae\xbc\x16\xe4\xa9\xbc\x85\xc8p>\x1eN\xc4\xbd\x04E\x18\xbb\xd2\x13D=\xde9\x88=T+\x9b=p\xc1\xa7=\x94R\x85=9\x85K<\xa26\x9c<B\xd8\xd2=\x8b\x18\xf3\xbc\xd4q\xeb<4\xc55\xbd\xb4^\x7f=\xc7\xdf\x1d\xbe2.\x91>\xf1 .<\xa5\xfb\x95\xbe<\xd6Q>v\xbe\xb3\xbc{\xfe\x14>\xa4\x1d\x96>K\xe1\xfd\xbd\x0f\xc3\xe1\xbb%n\xde\xbc;\xd4\x04\xbe0\xe3B>\x04\x868>\x19\xc9&\xbb:\xab\xa0>c \xd2\xbd\xbe\\\xaa=!\x9e\x9b=\x1e\x10v\xbeE\xd0\x16=\x9c\xdaG\xben\xdb\xa9\xbeH\xd7\x1c\xbe\x80;\x18\xbb^o\x92\xbd[\xf8\xb7\xbe\xbe\\\x89>\x0e\xd9%\xbd\xc2\xc9\x82\xbde\xd7\x97<\x04\x1b!\xbe\xc5Qe\xbd\x9b\x08\xd2>I\xf7q=\xf0\x06\r=\xe7\xfa\x80\xbe\xb4\x86\x9e\xbel\xcc;=\x00\t\xe2=T\xd9~>\x88!\x0b=\'\xe8\x1c\xbe\xd4\xae\x84\xbd\xbcbv>\x18\xbc1\xbc\xf7\xb2>>\xc7\xf9m=\x10\xbbq>\xdf%\x0b\xbe\xf4\x8c\x1b>\x14\xc5t=L\xe0\x1d>+;\xf9=\xbc\x10\xba>\xd5\xf5\x8e>~r\x91=\x0e\xe6]=2\xd2_=\xf5a\xa3='
-p71
-tp72
-bsV503971545631318016
-p73
-g2
-(g3
-(I0
-tp74
-g5
-tp75
-Rp76
-(I1
-(I200
-tp77
-g12
-I00
-S'\xda\xdc&?\x00(k>\x08>\xdb\xbe1\xa3\t\xbe7\xbd\x00>:8\n>\xe3@\xc7\xbd\xe7\xa7\x81\xbew\xbb\xca=\x05^\xf9>\xc5\x7f\x9b\xbd@\x9a5\xbe{\xf0\x89=y\x1d\x92\xbdQ\xfa\n<\x85\xb8\xda>\xb1jY\xbeKf]\xbe\xcd\xfa\x83\xbed\xac`\xbe\x1b\x98\x1a\xbed\xa1y=:`\x9b>\x87d\x93>{\xa2\xb0=\'h\xe2\xbd\xb5\x02\x1b>\xb5\xbc\xe3\xbd\xa8\x81\x90\xbev<\xa0\xbe\xa0b!\xbd\xf9\r\xc1\xbd\xb5N\'\xbb\x85<\xe9\xbeXP\xbf=\x88\xf6\xaa>\x8bZ\xc3>\xf0\xdf<>&\xd8\x9b>\x8b\x19\x03=\xa9\x06]\xbe$\x97;\xbe\x05\x10\xb8;\xb0&\x17\xbe\r\x1aN\xbe#\xfc,\xbdX\xbe\x08?\xa0\xb2`=\xf8H\xa7=\xe7O,?\xe0\x89\xdb\xbd\xb3\xf4\xe7>\xcb\x9d\x87\xbey\xc7\xa3=-\x97\xfd\xbe\t\xaf\xe4=\\\xd7\x00>\xf9c9=\xcc\x933\xbf\xb2B\r\xbf\x93o\xa6>Z\xe6\'?[N\x9b>\xc1J,\xbe\x96\x16\xa3\xbd\xd7\xf2\xe8=\x0c?\xc3\xbe\xe4y\x1c?\xfb\xf2\x04>\x90\xe6\x8f\xbeI\x94\xde\xbe\xe7\n\xed\xbe\xadv\x90\xbe\x0f]"\xbeY\xa7<\xbe \'\x8a\xbd,\xe7\xb1\xbd\'\xa3$>\xc7\xfd\x83>(a\x07>]\xb6i=\xf5\x0fq\xbd\xaf;\x10?m\x1e\xaa\xbe/\tc>@\x02V=|8\xa3>\xdc\x86\x91\xbeg\xa0\x00?L\x85\x9f\xbd)O\xbb\xbe\xb37\xf3=\xe6\xeb\x98\xbe\x0fQ\xde\xbdp\x11\xc0>\x90\xcb,\xbd\xc5M\x97>\xfd\xd7\x89>h\x15\x04>a\xe5[\xbeA\x16N\xbe\xb4\xa9N>\xf4\xf6a>e~\x0e>-|\xde>g_h\xbe\x13\xdf\xe4=\x1cR\xe8>\xe7\x06\xb4\xbb\xa4C\xfd\xbd%\r \xbf\xb0>\x9c\xbdPt\xc1>\x7f\xcc\x0f>_Or>\x81z\xfe\xbd\x13D\xab\xbe4\x0f+>\x14\xcf\x14\xbb;\xb1\xf0\xbca&\xf8>eS\x94>U\xd5\xca\xbd+\x86X=\x07\xf3\x92\xbd0\x8b\x94>\x8dEY\xbc\xfc,!>\x05p\x94=\xbc C\xbc\x93d\x1e>k\x80\xe3=\xf0\x83{\xbd\x7f\xe1>\xbc\xa8\xbd\xee\xbd\xe8\x84\t=\xfbsK\xbcP\xe2\xfd\xbb\xc4\'\xe4\xbe\xd3h\x17\xbd\xa1\xdbz\xbe\r\x94\xdc=\x9d\xe6\x84>\xc1\xbe\xdb\xbe\xbdY\x01?O\x99T>\xdbH\xcc=\xffz%?%\xbe \xbe\x8b\x86\x0c\xbd/\xc5\x90\xbdY\x13C\xbe#"\xa4>#V?>\xf3&\xac\xbd\x1c\xec\xb7>\xf9\'\x85\xbe\x00!\x92\xb9\xf4~\xca=\x8fw\xeb\xbe\xb8p\xac\xbe\xed\x8ba\xbe\xb8\x1c\xf8\xbe\xaf1\x92\xbe\r5\x01>\x03e\xe4\xbcDk\xf9\xbe8\xa0\xc6>\xfeQ\x1b>i$\xbc\xbd\xd5\xeb\xcb;\x83fG\xbe\x7f\xd4\x9f\xbe\x13\x81\x1e?\xc8\xce\xe8=c\x1e|>s\x88\xaf\xbe\xf3\x90\x1c\xbf\x81\xf2\xfc=\xd7\xf6M>g\x05\xb8>\xd3\xec\x10\xbd\xff\x9f\x96\xbe\xdf3\xa3\xbe\xbbJ\xd0>\xa7\x13\xe1\xbc\xa3\x8eF>\xe3R\xad=\x86N\x83>\xa0:\x90\xbb\x97f\x1a>U\xe8\xb4;\x05\xc7\x8d>t\x1d\x0e>7e;?w\x7f\xf0>\xfc\nB\xbe\xcb6\x0b\xbb\xb3\xf6<>\x0b\x89\xd0='
-p78
-tp79
-bsV504258426558771201
-p80
-g2
-(g3
-(I0
-tp81
-g5
-tp82
-Rp83
-(I1
-(I200
-tp84
-g12
-I00
-S'US\xff>\xa9\xb4\x95=,\xff\xf6\xbe\xaf\xcb\x90\xbd\x10Jn>wB/=_7\x1a\xbd\xbd\x08\x96\xbe\'^P=\x7fA\x8c>\x8f\xac\x94\xbdT\xf5\x88\xbd\x91u/>\xa5\xabk\xbc\xa0\x1a1\xbd\x9fv\xd0>S\xef\xc8\xbd\x88\xc2u\xbdG\xaf\x85\xbe\x8b4\x07\xbeMG3\xbe/d\xe8\xbb\xd6\x89\x9a>\xfc\xb2\xb2<E\xe3\x93=\xbdG\x1d\xbew\x8eK>\x89\xdd\xd5\xbdJ\xf4\x80\xbe\xd6\xd4\r\xbe[\xd6\x1e\xbd9\x15\x9e\xbd\x0f0\xd6<\x9fI\x00\xbf\x91\xa1\x1d=\xadE\x88>\xb0\xb3\x97>\xad\x90t>\xf8\xd7\x9c>\xf8\x86\xf5\xbc\x8c\x9b_\xbe\x0f\xb9\x9f\xbd\xfd\x8f\x97=<\xc7F\xbes\xe2@\xbe\xa4\xc1\xff\xbd\xcc\x02\xe8>\xf3\x18>=e^\xde=\xf5\x13\x10?\xb3\x80\x07<\x91\x93\xff>1\xf8|\xbe\xce\x9d\x00>1c\xcd\xbeG\x937>\xc0\n\xdf=\xa8\x00\xdd\xbd\xff\x06\xf8\xbe\xaa\x90\x08\xbf)g\x93>\'\xf5\xd4>\xc1\x90&>\xafmY\xbedy\xd4<\xd44\xcd==\xa7\xae\xbe+X\xcb>\x04\x15\xcc<T\x05g\xbe-j\xf7\xbe\x14~\xcb\xbeS/\'\xbe\xde\xbf\t\xbe\xc7v>\xbe\xfc\xfa\x04<\x1d(m=\x08\xde\xc7=\xcdKx>\x18RP>/\x7f\x8d\xbc\xf6U\x8a=D\xb8\xdd>-\xc9d\xbe/T\x05>\xa9>\x04>\xf7\'\x8b>?\xe3\xba\xbe\x06Q\x13?g\xde\xea\xbd\xacr\xd4\xbe@]\x03>\xff\xf8\xa0\xbe\xec\xa6\xc8\xbdl\xf9\xb4>\xbd\xcd\x8b=x\xb5\x8c>A\xdbm>\xa1\xc7\x1d>m\x19G\xbe7\xd6f\xbd\x0b\xb2b>#sC>|\x8b\x8e>\xe34\xc2>\xb0{z\xbe\x0f\\h=\x1c\x97\xa6>\x97\x97\x10=D<\\:\x19m\xcf\xbe\x7f\xea\x9f<D\x0e\x94>\xd1U\xef=S\xd67=z{\x82\xbd\xb0\x02\xc3\xbe\xe4\x9ax>\xb9\xebL\xbc\xaf:\xc4\xbc!I\x0c?,tC>k5\xee\xbc3e\xd2=s-,\xbd\xb9\x1f\x97>P\x97\xe5\xbdyG\\=\xab\xcb\x92=\xa7\xcb\xe4=,\xef8>C\xb4\x18>\n\x80!=\xd2;\x95=\xaf\xde\x91\xbb!ZL>\xe8[\xd4\xbc\xd3>\x13=\x83\x15\x97\xbeL/\xb3;\xa5A\x94\xbe\'B\x90>\xb5\xde\r>\\\xa3\xeb\xbe)!\xb4>)\x1dr\xbcMm\x13>@\xc4\x0c?\x914\n\xbe\xc0\x99\xc3\xbc\xcc\xcd\xcc\xbc\xe4\xaf\x1c\xbe\x15\x0e\x9c>\xcf9C>\xa2u\x93<\xd4\x90\xdb>\x9f\xdft\xbe\xa5\x95|=cB\xe5=\xd8\xb0\xb9\xbes\xe4\x16\xbe\x9f\tk\xbe\xff\xb4\x05\xbf\x05"l\xbe\xa2\x8c\x15>\xef\xado\xbd?\xb6\x07\xbf$\xb6\xb3>YO\x8d=8S\x92\xbd\xe1~\xaa=!mu\xbe?\xa0O\xbe\x88z\x00?\xd6\xab\xa2=\xad:\x05>i\x0e\x97\xbe\x84\xdf\x0c\xbfw:/>\xa8\xbbI>\xb4%\xbf>0\x9c \xbc\xe1%\x86\xbe\xdeS\x08\xbeHO\xbc>/\t\x00<\xb5\x1e\xac>\xeb\xe9\r>7\xd4\x92>\xe7\xa45\xbdT\xf0\x81>\x82h!=][k>\x9ddK=\x7fj"?\x12\xd1\xa8>\xcdrb\xbd#7B\xbc@v\xb7=\xe1*\x96='
-p85
-tp86
-bsV503972349268725760
-p87
-g2
-(g3
-(I0
-tp88
-g5
-tp89
-Rp90
-(I1
-(I200
-tp91
-g12
-I00
-S'\xb6T\x01?\xfd\xe0c=M\xd4\xd7\xbeuh\xee\xbd\x1ata>\xf5\x17r<\xa3\xb0\xf4;\x92=\x1f\xbec\xe1\xa7=\x1eZ\xad>Ov\xc2\xbd\xbd\xa7S\xbd\x1f\xb6\xa7=/t\n\xbe0\xfab\xbd\xfbb\xad>\xa5\x86X\xbdx\x1b-\xbd~\x06\x80\xbe\xb3\xc9\xdf\xbd\xe7\x00\x80\xbe\x94C\xc4=\x17>/>\xb6h<=^\x7f\x98=\xe6\xf0F\xbecNk>\xf9\x96\x9f\xbdr?\x9d\xbeD\x166\xbe\x82\xbas=b;\xe6<\xe29\x90\xbc:\xe3\xda\xbe\xb4\xb9\xa7</\x12=>\x80\xa6x>\x0f\xadE>,5\xa9>\xed\xa1\x00\xbe\x82\x8bd\xbeN8\xe9\xbc`_!>\x8a\xcbA\xbe\xd5R\x05\xbe/\xea\x13\xbe\xcd=\xc6>\xd1\xdd\x11=r\xfe\xdf=\xf2N\x03?\x9b\x13\xf4\xbc2\xdf\x06?p!\xa5\xbe\x98\xec#>\xde\x02\xc3\xbe\xf1M\'> \x9a\x1b>\xcaX\xdd\xbd\xc3\xba\x00\xbf8\x90\xd1\xbe\xc25\x8a>Z\xea\xe1>\x8cz?>\xaa~\x9f\xbd\x95\xc2O=\xb8\x8d`=\x0e\x7f\x94\xbe6\xa7\xe3>\\\xbd\x81<\xaa\xa86\xbe\xf6)\xce\xbe(\x9c\xa0\xbe3y\xa8\xbd~\xfd\xdd\xbd\xf5\xfa$\xbeX\x94s<\x03\xd8J=\xb0\xbd\xa6=\xce\xb7F>\xee\xd7D>0\x82r\xbd\x88\xe7\xd9\xbc;\x01\xaf>\xf8\rc\xbe[=\xf6<\x8b\xb2[=\x85\xcf\x80>\xa9*\x84\xbe3\xa1\xf3>\x9b\xda\x8b\xbdK\xd8\x96\xbe#i\xde=\x12)\x8a\xbeO\x8c\x1f\xbe\xe6r\xaf>\xfb\xf2\xc6=3\x10g>\xc8+P>\x1b\x92\x1c>\xe8%O\xbe\xa5\x1b\x84\xbc%\xb0I>\x9b\xa2N>.\xba\x07>K:\x82>\xa8=]\xbe\xf9%(=4\xbd\xa3>;\xb1\xca\xbb\xf0\xe3\xde<\x9e\t\xdf\xbe\x00\xef\xd3\xbc\x8a\x9ak>\xb0\x9a\xa0=.?\t=R\x8bc\xbc|\x88\xbe\xbe\x9beZ>N\xe02=~\xe1)\xbce\xf8\xdf>\xd2\x12">\xce\xd0\x8a\xbd\x0ej\'>\xf6j\x96=w\x16\xa0>oy\x11\xbe\xdc\tH=\xfaeM=cK7=&\x9c\x1f>^\xa1\xb9;\xd6u8=o\xee\x9a<\xd0Yy=z\x92\xcc=\x86\xe1&=\x96\xfaZ=\xeb\xd1Q\xbe\x12\x15\xe0;\xf4Y\x82\xbe\xf8"T>\r\xdd\x08>\x02=\xc5\xbe\x1a\xfe\xa8>J\x10\xf5=\xcd\x19\x1a>Z\xf3\xf6>Jg\xc9\xbd\x1e\x1f\x10\xbd\x0eb\x9b\xbd\x99\xf5\x16\xbe3oB>\xde\x93\xe1=\xca\xb7\xb8<\x0e\xec\xc2>\xc0\x16Y\xbe\x97\x17\x89=\x08W\xa9=\xd2\x01\xba\xbe\xceQ\x0b\xbe\xb9\xd85\xbe\x85\xde\xd8\xbeU\xd6z\xbe\x9d.\'>\xf3\x14\xa9\xbdR\xfc\xf8\xbe\x96\x89~>\x06\xcc\x8d=.1t\xbd\xdc\xc3\xb1=\x11\xa6\x05\xbe\xe9\x9f4\xbe\xe3\x02\x0c?(\xf1\xcb=f\xcd\x01>\xda^\x84\xbe$9\x10\xbf2t\xb1=MW\r>\x95_\x8c>\x1d\x9e\r=\xcdR\x98\xbeKo#\xbe\xcba\xa5>\x8a1\x03\xbd\x85|]>\xddr\xce=\xb1TF>\x8f\\\x11=\xcb34>\xb3V\x11<F;+>\x1e\x9bq<-\x93\t?\x94\x9a\x8e>\xb7\xf2<\xbd-@j\xbdgS\x99=\x8e\x9e\xa1='
-p92
-tp93
-bsV503957092504317952
-p94
-g2
-(g3
-(I0
-tp95
-g5
-tp96
-Rp97
-(I1
-(I200
-tp98
-g12
-I00
-S'\x15\xf5\xe1>3^\xc5=A\xcd\xa7\xbe\xf9\xa9\xe4\xbdZ\n\x17>\xea\xb7\x87\xbc\xf1e/\xbc\x9d\xd0{\xbe\x95l\xe4\xbc\x03#s>0h:\xbd\x10}\xcc\xbd\xa0q\x02>q"H\xbd\xa0\x80O\xbd\xbe\x01\x98>\xdd\xda\x97\xbd\xe8\x96\xe8\xbd\xea\xf5\x1a\xbeIr\x87\xbd5\xc9?\xbe\xce\x0es=\x02J\x1e>\xe9\r-;\x8d{^=\xf8\xce\xb9\xbd\x15m#>\x0b\x13\xdb\xbd\xa8u\x8a\xbe\x8e\x1a\xb5\xbdr\xd3\x92\xbc\x91\xf7\xef\xbc"\xa3\x9f<31\x98\xbe\xc1B\xbf=5}2>\xf1JY>\xbd\xf1\x13>\x07\x1e\x88>\xd1\xac\xdb;\x1cC\x03\xbe\xce\xb6\xb2\xbd \xd4\xb6=\x9e\x88Z\xbe\x89\xc3\x03\xbeI+V\xbdK\xde\x90>9&\x1d=n>s=z\r\xd5>\xc1y\x00\xbdK/\xaf>\xca{V\xbeM3#=\xcb%\xaf\xbe\xb7\xa7\xac=O\x04\xef=\n\x16\xcb<\rC\x01\xbf\xa5\xf2\xbd\xbe{\xe3\x80>!}\xbc>\xa1\xe60>>\x80\x11\xbe\x8a\xc2\xa7\xbd\xc5\x0b\xe1=\x9aj\xff\xbd\x82C\xae>\xda\xb3\xda<\xd5\xf54\xbe_\x0e\xc7\xbe\x1f\xab\x98\xbe\xae+\x1e\xbe\xdb9\xc7\xbdv\x1e\xf1\xbdE\x8d;<\xc8\xfcH<\x8f\x87\x0c>\x83\xf8(>\x1d\x12\x1f>\x05\xaeA\xbb\xf8A\xb6\xbc1\x9a\x9a>\xa0\x01K\xbe\x91O\xdb=\xcdt\xa0=\x02\x93E>\xbf\xf9#\xbe=\xa2\xbf>x\x10\x99\xbd\x057G\xbe\xa3Y\xf8=\xae\xbef\xbeb\xc7\xf9\xbd\x8f\xf1g>\x9d;q=; h>\xc6PY>@\xeb\x1f=\xd5\xcb\xea\xbd\x0eG\xc4\xbc\x9b\xbb:>.\x0f$>\xcf\x00\xfa=\x08\xcc\xa9>\xd7\xc1-\xbe6\x05\xda<\x03\xb6\x84>\xfe\xb0\xc3<\xb6\xd7\xda\xbc\x16o\xa5\xbe\xad9x=6\xbc7>R\xfb\x00>\xb9\xba/=\xa2\x8d\x04\xbdIB|\xbe\xd3\xba4>\x03\xd4\xe5<\x10\xb9\x8c=\xf9H\xb9>\xa9\xab*>\xf6\xac\xe3\xbc8d\xde=\xa1U\x96\xbc\x90\xd0_>g\xca\x02\xbe\xcb-\xc1=\xf1]\t=\xb5%\xde=\x06-m=\'\xf2\x7f=C\xb4P=d|\x00=\rhW\xbc\x9b\xfe\xfc\xb8\xb32\x10\xbd8\xb7\x08\xbd\xf3\xbe*\xbe}\xafh\xbc\xf8\x1cN\xbe\xba\x8e >\xd2\x13\x1b>6\xee\xa1\xbe\xcd\x1c\xb5>\xcf}\xdd=\xef\xa4\x17>\x80\\\xd2>\xa9\xb2\xc3\xbdZzk\xbdR\xf4!\xbd\t(\x0b\xbe\x06k\x84>\x91\xa2\x19>\x05\xea\xd8\xbcb\x9e\x8b>\xbb\x84\xed\xbd\x1d\xdf\xc7=\x97\x83&=M\x88\x8b\xbe\x99S\xed\xbdU\x05?\xbe\xeb\x90\xb8\xbe\x82\xdc8\xbe/B\xa5=\x81\rX\xbdi\xf4\xb7\xbe\x0fNT>=\xe0\x06>\x08yO\xbd\x06\xfcP<\x15kK\xbe\x90\xb87\xbe\x82\x0b\xc4>\xf0\x8a\xb2=C\xb9\xc3=\x89\xb4\x91\xbeG%\xef\xbe\xda\x8f\x14=\x19\xd1\x0e>g\xcf0>8)\xeb\xbc\xfd+u\xbech"\xbe=\x98\x9c>\xb1\xf7c\xbc\xdd ,>?\xd7~=\x06Gl>\xe5"\xaa\xbd"\x0f#>}U\x1f\xbc;\xfa\x00>\x13\x8c\x14>y\x0f\xdc>7e\x90>\xd8pW\xbd}\xf2\x17;\x8d\xbf\xbe=c\x1e\xa6='
-p99
-tp100
-bsV504182269415010304
-p101
-g2
-(g3
-(I0
-tp102
-g5
-tp103
-Rp104
-(I1
-(I200
-tp105
-g12
-I00
-S'\xf1+\x1b?@\x96z=\xb5g?\xbf\xec\xa2(\xb9,+\xa7>\xfbp\x05\xbefQ\xa3=y\x85\xae\xbeZ\x08\xda=\xb0z\xee=\x86^\xa8\xbd`;\xdf=\x1fEW>\\\x82\xa3<\x8c\xa9\x91\xbdz$\xe5>N\xdb\x9c\xbcjo\xd2<\x15\r\x9d\xbe\xf6\xf2\x97\xbd+\xdcI\xbe\xe1\xc9R<U%\xbc>\xecqG\xbe\x01\x8bI=0\x98^\xbe\xb3\x89\x91>\xe7\x02(\xbe\xc4\x02E\xbe\xf5"\x05\xbd\xf9n\xb8=<\x19\xc1\xbd\xb4\x8b\x8b<q\xb6\x12\xbf\x14\xe7\x96\xbd\x15l\xa0>\'\x85a>\xef\xfd\xce>\xec\x1c\xd1>\xe9\xd6\n\xbe\xb0i\x93\xbe\x86x\xa3\xbc\x9a\x11\n>\xef\xf3\xa1\xbe\x1a\xdb\xa3\xbe\xe5\xc7f\xbe\xc2u\x00?Yl\xbf\xbdlp\xc5=k\x9d,?\xf5L\xe3=\xefo)?\x99\xe9\xb2\xbe\xa6~o>y\xc8\x9d\xbe<\xc8\x9b>\xab\x0e?>bD\x8a\xbej\x98\xae\xbe\x12\xa4+\xbf*L\xab>y\xcd\xb8>\xc4:\x85=y\xe4m\xbe\x92\xfa[>\x9c\x08\x11>\xcb\xa7\xd9\xbe1p\xbc>%e\xd6\xbd\x0b\x99C\xbe%\xea9\xbf\x9f\xe3\xe4\xbeXK\x0c\xbejy\\\xbe\x8e.\x8e\xbe0P\xc4=\xafD\xdf=\x00\x9dW<\xab\xb6\x88>\xb5T\x9f>\xab\xcc\xe9\xbd\xa4h\x1e>Kp\xc2>\x1c.\x12\xbe\x07Z\xa9=\x97@i>1\xc3\xd4>\xf1\xf2\x03\xbf\'\xc48?\xfa=\x11\xbew\x00\x0e\xbfV\xf8_>\xabp\xf8\xbe5\x06\x8b\xbd\xfb\xe2\xd5>\x84\xfe\x8a>\x84\x0c\x82>v;\x80>b\x0f]>\x1c!s\xbe\xc9$\x88<\xd1\xaa\xa1>\x06`@>\t\xee\xc7>\x1e\xce\xc1>\x19\x08\xa7\xbe\x91&?=?m\xcf>\x96\xd5\x03=\x97\x19\xc2=\\n\xc5\xbe\x9b\xd9\xee<\xa1\xec\xd8>=\xa6\x05>\x0e\x91)<^\\\x1e\xbeCm\t\xbf\x85\xb8\xc6>\xbb\rR\xbd\x9f\xea\x81\xbd\xb9\xea/?\xe9\x850>\x86t\xa5\xbd1\xf0X>\x80\x00x=\x1b\x9b\xc0>\xbf\xefJ\xbe0T\x12=\x11\x9e\xb7=\x12\x1d\x9c=2\xb5\xb5>\xd7\xa7\x8f>\xbf\xf5\xa7="N\x7f=d\xa0\xdb=\x06\xe5\xaa>\xa4o8<\x8a\xc0\x96=k\xbfy\xbe\xb9\xcd|=\xe0\xad\xc1\xbejt\xe2>:yx=@\x001\xbf\x05i\x9d>\x06PN\xbe\x8c"w>E=\x13?g\xe5\xdc\xbd\xa5q\xeb\xbc\xea?\xeb=5\xddz\xbcjN\xab>RCK>\x9c\x99\r>\xbbw\x1d?LM\x8f\xbe\xd7\xb8\xa1=\xe9\xaa;>"\xaa\x9e\xbe\'\x11l\xbd\x02\x16\xa4\xbe\x8cr\r\xbf\x1f8\xaa\xbe\x9f\x15,>\xb0\x1e\x10\xbe 5=\xbf\x86\xd9\xce>\xfc\x88\xcf=z\xb6/\xbd\xac2\x86>\x96\x14\x8e\xbe\x99\xa3z\xbe\x0c(!?\xe1\x9e\x8c=\x15\x85\x02>\x900\x8e\xbe\xa5\x953\xbfa\xde\x9a>|\xf6G>\xa6\xc1\xf1>\\!z\xbd0\x8f\x86\xbe\xca~\xc1\xbdzq\x9d>\xab\xf5\xa7<d\xe2\x06?*\xd3\x15>\x82a\xb0>\x84\x9cT\xbd\x9e\x8b\xc1>w\xab\xf2=\x81\xbd\xc5>&\x97J=\x1bG6?\xdf\x0b\xbd>@\xbf\xc0\xbd\xbe\x89\x0f\xbdk<\x1b\xbd&\xf0\xa6='
-p106
-tp107
-bsV504160664446074880
-p108
-g2
-(g3
-(I0
-tp109
-g5
-tp110
-Rp111
-(I1
-(I200
-tp112
-g12
-I00
-S'\xb9=\xb0>cP\x1b\xbe\xfb\x99\x11\xbf\n\xfd\x93=\xbcQ\x9d>\x83\xb5\x13\xbed\x85\x1c=\xba7K\xbe\xf9A\xc4<u\xfd\xf7=#4L\xbc\xbf/\xd8=\xa8\xd7G>\xec\\G\xbb=\x00\xe0\xbd\xe7\x96\xa1>}\x1f\x85<i\t4<\xbb$4\xbe5\xbb.=m0\x89\xbey<\x99\xbc\x9f\xb6\x9e=\xbcA\xb9\xbe^i\xf8\xbdt\x05\x15\xbe\xa4G\x96>\x0bY{\xbe\xef\x8a\x8f\xbe\xde\xf0\xf6=\x94\x14\xb8\xbc\xc3]\x05\xbe\xe4\xc2\xed=r\xed\xd2\xbe\xf4\xd3\xd6\xbd\xab\x7f\xb4>\xf1\xbc\x03>e~6>\xb4J\xcf>\xfe\xecy<\x85\x97=\xbeo\xcf\x1a=\\\x90n>o=\x9d\xbe\xaeH\x9a\xbe\x1dG2\xbe\xc2\x9e\xf1>\xe1C?<\xa4\xad\xc8=\x19[\xe7>\x98r+>T<\x14?\xbd9\x87\xbe\xee\x17\x88=\xa7\x06\xb9\xbe\xf5\xf2\xc0>\xb7\xaf\xcb<\xe8\x84\x8a\xbe\xcd\xc0\x9d\xbe\x0eU\xf8\xbe\x82\x97{>f\r\xbf=C\xd1\xc1\xbb\x9c\xf3w\xbe8U_>l\xb7\x92>!\xf7\x82\xbe,\xe3!>\x85\xd2\xc3\xbe\xba\x82\x0e\xbe\xa9K\x1b\xbf\xd4\x9e\xb5\xbe$TL=\x9c\x87,\xbe:\xf4O\xbe\x02\xc6t>3>\xb6>2(\xf1=\x1a\xed%>4\x8a\x99>\xb6A\xdc\xbdS\xa2\xd2=8\xb2\x9a>\x89\xd2 \xbe{\x0c\x14=\xdf\xec\xcd=th\x8b>\t\xa6\xe9\xbe\x96\x8f\x1e?\x11h[=\x1cJ\xa4\xbe\xd4\r\x86>\xe3\xe0\xa6\xbeb\x84\x15=\x8a\x0f\xdc>\xad*\xb6=y\xda\xfe=m\x08$>"\xbf\x80>\\\x1el\xbd\x991\xe5=\xdcm\xa9>T\xe9\x1f>a\x0c\x8f>\xe8\xab\xb9>\xc40\xb6\xbe\xf4\x17\xc8<\x99\x96\xf8=(`\x8e=\xf0\x10)=\xcb\xe6\x03\xbe\xacu\x02>\x99\x08?>Fs_>\x14\xd6\x03=2!0=n\x91\xf2\xbet\x05\xbf>\x02#\xb9\xbc\xf5\x17\xfb\xbc \xa2\x15?\x8f1\xa8=\x81`"\xbd\x87\xee\x05=k\x1bd=\xb3|\xc0>\xd0B\x83\xbe\xf4\xab\xe8\xbd\n44=\x170\xa5=n\x85\x16>\x90\x8eI>@WN>$\xa9\xe3;\xe5\xd4\xab=/7\x8f>\xeca\xa8\xbcl\xc6\x84=\x0f\x17\x06=1\x82\xbb=\x85\x1e\x8d\xbe\x87\xf3\xf3>\xcc\x88\x94\xbd\x96\xc7\x04\xbffx\x0c>\x80\x8ac\xbe\xceZ\x8c>\xdd\'\xbf>\x16\xcaJ\xbeN\xba.<!M\n<IN\'\xbd\x17\xd0_>\xa2\x04l>DB\xd3=7~\x0c?\xa0\xf3\x0f\xbe2%)>$\x93\r>\xdd\x18\x84\xbe\xfe\xa3\x06>T\xe9t\xbe\x04f\xdf\xbeT\x0f\x89\xbe\xfc\xdb\x1b;f\xd84\xbeP\'(\xbf\x98L\xb1>\xdb\xdd\xcc\xbd\xad\xc3\xcd\xbc\r\xd7A>,\xd3s\xbe"\xc5i\xbc@\x9e\x17?\x85\x02%>\xeed\xcf\xb9+\x9ay\xbe\xd2\xa3\xce\xbeQN\x14>\xb9E >\t\x04\xcc>\x9a\xb7/=\x87\xc48\xbe@y<\xbdP\xf7\x85>I0u\xbd\x15\xd2\xd1>\x1ft\xc9=\x9e\xf6\x96>\xda\xaa\x0e\xbe\xce\xd8\x8b>\xc5,\xef=xX\x93>\x0b[\xa7<\xfd\xf6\xd2>\x0c\xe2\x96>\xc2\xb9\x05><\xfe\x8c=\xfev\x0e<y\x02\x87='
-p113
-tp114
-bsV504176827238465536
-p115
-g2
-(g3
-(I0
-tp116
-g5
-tp117
-Rp118
-(I1
-(I200
-tp119
-g12
-I00
-S'\xe3\xe3S?v:G>\xe65\x07\xbf7\x0f\x1b\xbe\x9d\xbc\x92>\xea\x02\xdc\xbb\x87uK\xbdR\xaa\xbf\xbe\xb3\xd5\xdf<+\x03\xcf>Sm\xa4\xbd\x0f\xb2\x1b\xbes\x142>~\x8f_\xbd\x9a>J\xbc\x1a\xd6 ?\x18i\x18\xbeF\xda\x11\xbeS\xc8\xa6\xbe\xd8\xeaX\xbe\x00\xd0b\xbeC\xdb\xc8=\xdb+\xae>\xb2{\xd0=N\xa4\x10>7\x08.\xbe\xa1\x04B>"\x939\xbeG\xcf\xc2\xbeX\x03x\xbe\x85\x97\x9b\xbd\x05*n\xbd+f%=\xa7\x97\n\xbf\x1e\x89U>\x1dSr>P\xd2\xdb>\x16\xb6\x83>\xcfm\xc7>\xeb\xc1N\xbd\x96\xc8|\xbe\xb3\xc5n\xbe\x8b\xb84=0\x8f\x8b\xbe\xee\xdfo\xbe>\x18\xca\xbd\xae\xfd\x03?\xeeMr=\xa8\xa2\x03>\xe0\xaf8?-\r\xf7\xbd\xa5\xd8\x1f??\x89\xa9\xbe\xc3\xc4\x1e>E\x0b\n\xbf\x8e\xa8\xbe=\xb1X>>\r!w<\xf5\x7fS\xbf\x8e-(\xbf\n\xb2\xb2>\xd0j6?\x0b\xc2\xc8>,\xf21\xbez\x89\xe8\xbd\xc2\xc8\xbe=\xe67\x96\xbeG\x90-?\r@Y>\xe64\xc0\xber)%\xbf\x93\xbf\xf7\xbe.\xd4\xbc\xbe;\x19/\xbe\x02\x16\x1e\xbe6Li\xbc\xabP\xe1\xbd\x1e\x82^>\xa0\r\x9c>\xf2\xd4\x8f>\xd3\x8e\xd1;\x14\x9d\xae\xbd\xd5\xa4\x01?\x06\xba\xa8\xbe\x07\xc9=>H\x16\xe5=\xbdx\xdf>\x0e\x8c}\xbet\x1f/?\x82\xf0V\xbe\xf8Y\xda\xbe\xcb\xe2\x1b>\x90\x7f\xda\xbe*\xa9|\xbe\x85\xe9\xd3>>\xbf\xf4=@\x9f\xea>\x06\xba\xb1>\xfe_o=z9\x9a\xbe\t\xf4\xb4\xbd.\xf3\x98>49\x99>`\xbce>>4\x19?5*K\xbe\xef\xb0\x97=Jk\x07?\x8e!\xb5<\xb0\xc5\x8e\xbc\x16\xd6%\xbf\x10\nK=A\x87\xc4>\xaf\x8b\x07>N9\\=0K\x80\xbd}&\xdb\xbe>\x9eW>\xc1\xb9\xc3=+\xae\xcb<\x1e\xad\x1d?\x84Q\xbb>D\n$\xbdU\xf5R>s\x02o<S\x8f\xb7>\xd2\xf3+\xbe\x95<b>}h\xbd=(\xe9J>j\x0f\xe7=\x18|\xd6=\xd6\x90s=%?\xd5<\xb9\x8e\x98<`p\xcf\xbb\x12l(<M\xa9\xad\xbc\xc5\xd6\xe2\xbe\xdc\xaf\x12\xbe\xf6\x9c\xc6\xbe\xa6\xacp>\x80\x9a\xbc>\x82\xcd\x06\xbf\xc0H\x1c?\x0f\x16,>\x83E\xe0=\r+B?z\x1d"\xbe9\xbc*\xbd\x80\xf3\xac\xbc\x92\x93;\xbe\x93\x18\xb1>S\xb8\x0f>\xf6\xcan\xbc\xfb\xb2\xde>M\xeb\x94\xbeB\x0f\xca=2\xd7\xbd=\xc1\xd1\x03\xbf6\x03\x90\xbe\r\xb0\x9a\xbe\x96\x14\x1f\xbf*\xec\x7f\xbe.u4>3$\x14\xba\xfe\xb7\r\xbf\x82\xbc\xd9>\x15\x0e\\>\x9a\x1cH\xbe"\xc2\xe4;\xd2U\xac\xbe\x0e\xdd\xc6\xbe\xbf_\'?\x1a9\x13>p\x0en>.\xa9\xd2\xbe\x9e\x14N\xbfBJR>:b\x92>\x13<\xba>\xad}/\xbd\tK\xbc\xbeY\xf3*\xbe\xf5\xe3\x13?\xaaEf\xbb\xce\x19\xad>\x82o\xe2=\xe6\xa2\x9f>\xd3\xe7\xb7\xbd\xae\x88\x9e>F\xf2\x84\xbc\x1e\xa6A>\xa2\'=>\x93\x91V?@H\xdb>\xe5\x990\xbe\xc5\xce\x9e\xbc\x07\xaf9>\x16\x01\xe0='
-p120
-tp121
-bsV503964649130569728
-p122
-g2
-(g3
-(I0
-tp123
-g5
-tp124
-Rp125
-(I1
-(I200
-tp126
-g12
-I00
-S'\x8e_\xa3>\x02U\xd6<\xe2\xac~\xbe\x1b\xea\x9b\xbd\xcb_\x17>n\xac\x14=\x92\xc7\x10\xbd\xac9-\xbe\x9a6\xd6<\xb0\x02\x85>\x9bE\x06\xbd\x13yf\xbdgW\x9b=1-\x10\xbdy\x88\x9c\xbdB\xed\x80>\xfc\x0b\xb8\xbd\x18F\xa7\xbd\x80\xac(\xbe\xbf\xbb\xa9\xbd\x077\r\xbeP:$= \'\xae=\x18D\xfd<\x1eK\x12<@i\xae\xbd[\x9a\x0f>\xfd\x17\xd0\xbd\xb3^k\xbe\x02\x1b\xe6\xbd@\xbfD\xbd\x9e\x9e(\xbc*m\x95\xbb\xfb\xfb\x90\xbe\xc6\x92\x1e<.\xd5Z>\x00\xc7Z>\xd6j\xd9=$\xc0I>\x96 \x93<\xc5\xe6\xde\xbd"[p\xbd\x9a\x11\xb3=\xae\xc1\x0c\xbe\x05\x8c\xf1\xbd+\xe4\'\xbd\xa8\xee\x93>_\xfd\xc4<fBr=\xbe\x9e\xc0>\x9e\x84&<y<\x9f>\xc0cF\xbe\xdedy=\xb6\xae\xa3\xbeUY\x05>\xe0\xbb\x90=~\xe2Y\xbdS\xc8\xb4\xbeoh\xa8\xbe\xe2\x0fM>65\x91>u5\xf0=\n(\xac\xbd\xf6*"<\xe5\xa2\xd8=J\xccC\xbe\xb7\xb3\x91>^!\xc1\xbcF\x8a4\xbe\xea\x83t\xbe\xaaOa\xbe\x8d\x7fl\xbd\x18\x05\xd1\xbd\xa7\xe2\xcb\xbd(\xe4\x00=\xb1\xa5\xc2=\x8a\x97\xb9=\xabV\xd2=:\xb9\n>\xd3\xc0s;\x06\xf4\xa7\xbcp\xf7\x94>^\x800\xbe:\x8a\x90=\xae\x81\x8f<3\xcc\xfe=5X]\xbe"A\xad>\xf1\xaa\x80<\xab\x92C\xbeb\xe1\x9e=\x9b? \xbe`=b\xbd\x0f\x1a\x91>m\xd7_\xbc\x1b\xa1\x17>:\xf4 >fv\x08>\xa2\x86|\xbd\xaemO\xbd\xf1(\x14>3\x19\xe8= Y\xd9=\xcd\xc3g>\x90D3\xbe\xbe\x00\x92=\xda62>\xbb\xa6\xe4<\x86\xc7\x00\xbd\xd3U\x83\xbe\xb3\x87z<\x8bP\xfa=\xa2\x03\x98=F\xf1\x87=\xbb?\xbb<*`\x85\xbe\x87\xbe5>\x9d\xf9O<\x16\x8e\xa0\xba\x1e\xf0\x9a>\xf5T\xe5=\xb6\xc2\x8b\xbc\xc3\x81\xe5\xbaz\x8b\x7f\xbc\xed\xf8`>L\xab\x95\xbdU/\xf8<]\xaf\xdf<\xadl\x90\xbcf\x04K=8\xaa^=k\xeaQ==z\x9f\xba\xf2\xa6\x18<\xaa\xc0\xa8=n\xa7\xbb\xbc\x02\x80\xbb<\xc7*\x06\xben\x14\xd8;R\xf5\x00\xbe\x8b\xd6%>\x8a2\xaf=\xed\x9ep\xbe\x19<\x83>\xa0\x98\xd2=\x9e:\x04>\x11\x86\xaf>\xf0\xf7\xd7\xbd\xf2\x8b\xe6<R)\xa6\xbd%\x84\x02\xbej\x997>\xd9s\n>\xe3\x14\x88\xba\x16dn>\xfa@\x05\xbeB.\xa3=C\x94\x9f=z\xe0s\xbe\xd4\x13\xba\xbdb\xe9\xcd\xbd\xee,\x9a\xbe\xceW6\xbe\x9d\xf6w=sF[\xbd\x04\x1c\xba\xbe`\xf5A>m\xe9\xa5\xbc&\xb4\xf8\xbc\xc2\xe6J=\xf5f\xf0\xbd"\xcf\xa2\xbd\x86\xd7\xbe>\xc7k\xba=\xc2\x7f\xcf=EcH\xbe\xb4\x1c\xa0\xbe\xac\xbb\x1b=w\xce\xcb=S\xe1l>\xda\xf1"=\xd0@G\xbe\xfaK\x06\xbe]y}>3\xab\'\xbd\xfcf\x08>z$\xc7=D\xb9\x02>\x8aAO<J}\xec=\xf2\xdf\x94<\xd2\x9f\xfd=\xd5\xb4\x1d=\xdat\xb4>\xb8\xcek>"\xf7|<2\\\x85<\x9es\xca=BC\x8d='
-p127
-tp128
-bsV503970226875031552
-p129
-g2
-(g3
-(I0
-tp130
-g5
-tp131
-Rp132
-(I1
-(I200
-tp133
-g12
-I00
-S'\xcd\xfd\xf8>\xc9\x8fH=%W\xcc\xbe\x92\xde&\xbe\x94\xc19>\xad\xaf\x04\xbd\xdf\xf4\x94=B><\xbex\x19f\xbc}BW>\xbc\x94\xbc\xbc\xbf\xd2\x18\xbd\x8e\x83\\>j\x11\x80\xbd\xb8T\xb8\xbd\x1cJ\x91>\xbe\x11U\xbdT\xd8\x9b\xbdt\xac \xbe\xb9g\x90\xbcQ\xd3\x80\xbe/\xa6)>\xec\xbc\x00>\xe3|`\xbd\x13\x9c\x80=R\xbe)\xbe7\x919>\x0ew\xe9\xbdrg\x88\xbe\xec\x1b\xc5\xbdL\xb9\x94=z\x1a\xb9<\x87H6<\xc6t\x94\xbe\xf3\xb8\x0c=\xb0#\xde=Bv\'>\x8a\xf2.>\xb9\xf5\x9d>Q\xf8\x97\xbd\xa3b\t\xbe*\x92\x89<Q\xe3\x10>2\xc0\x97\xbeU\xa8\xc7\xbdQU\xaf\xbd\x8f\xc4\xa1>Hl\xf5\xbc\x84\x82A=\xd3\x8a\xe5>E\x01!=\xa3W\xe9>\xac\xd9\x90\xbe\x80.\xf1=\xc5\x9b\x9c\xbe\x89\xce%>FQ#>W\xea0\xbd\xb8\xa6\xe4\xbe\x93\x92\xb8\xbe5\xe7\x9e>\xf6\xbf\xa6>\x9a\x86\x01>\xc3\xfb\xc7\xbd}N\xf2\xbc\x80\xf0\xe8=\xf3\x1e.\xbe\xdf\t\xb6>$\xe3\xaa\xbd\xe3s\xf6\xbd\x1a\xc0\xce\xbe\x80\xeeu\xbeS\xce\x1a\xbd9\x96\xb4\xbd\xd3x+\xbe[L.=\x8d\xc0\xe8<xH\xc7=\x0c^\xc8=>\xea@>\xd4h\xa6\xbd\xe4\xaa1\xbd\x86p\xa1>\x94T\'\xbe\xb3\x19\x85=Z[\x16>\xfe\xff|>b\xd94\xbe.\xf6\xc5>\xc82\x86\xbd\xaa\xb1l\xbe\x8e\xed\xfc=\xfdT\x9a\xbe\x8b\xf5\xbd\xbd:\x02q>\xf4Q\x1e>9$$>\x0e\x10v>\xd0\xb2]=E\x02\xe4\xbd\x866\xd5<\x0e%P>X\xeaV>"z\x01>\xfaQ\x85>\x126\x13\xbe\x9edw=\xf4\xe0\x8b>j\x8c\n\xbc \x89\xaa\xbb\x98\xef\x9e\xbe\xcb\x97\x93=\xf8\x10$>\x90\xa3g=\x08\xeb\x82\xbcB\x11\xa7\xbd*\xda\x8e\xbe\xeb{`>"\x1b\x0f=\xd6v\xec=81\xcc>\x83\x9b\xe9=?\xcd\x94\xbd\xc2\xb5->\xaf/\x16=\xc4\xea\x8e>\xda8\x0e\xbe@R\xe3<M\xd4\xd4<\xa2\xd4\xfd<\x88o\n>\x16\x14\x97=>lK=\xbb\xae\xf2<\xd9`\x8c=B\xf6s=\xf1\x17L<C$d\xbd\xad\x14j\xbd\x9d\xd1\xdb<\x18\x18`\xbe\xe1\x0c\x14>\x16\xd8\xe0=\xf0"\xbd\xbezZ\x9d>\x0e\xf5\xeb=E/U>\xed\x00\xa0>\x8b\xb3\xf3\xbd\xfcV\xb8\xbd\xfa\xf6\x81\xbd\xbdw\xd3\xbd\xcaW\x8d>!\xda\x13>\xf7<\x08<\xde\xbc\xb3>\x85\xf9\xc4\xbdF\x11\xec=\x1d7{=\x00\xde~\xbe}\xb5\x81\xbd\xf0\xe0\x1a\xbe\x15Q\x9c\xbe\xcd\x82`\xbe\xca\xb8\xe7=2\x12\xf7\xbd\xf2\xfe\xd1\xbe2\xd9+>\x89/\xa7=\x08\x8b\xed\xbc\n\x8a\x8e=zi\xf2\xbdg\xb1\xcc\xbd\x93\xf2\xfd>\xed\xa2\xee=\xaa\xd3x=\xb5T\x98\xbe\xa8\xd4\x07\xbf\xdeYe<\x9b\xbc\xf6=%\xf2O>V7#\xbd\xff\xa2\x80\xbe\x8ey=\xbe#\x19]>B3\xc9\xbc\xce\xb7,>\x05\x1ex=]uZ>r\x10\x81\xbcV\x0f1>\x17L1<nh,>\xc66\xc0=\xfd\xc9\xfb>V\x99|>\x8e\x88&\xbd\t)\xc8\xbcU\xc9d=\xbcj\x17>'
-p134
-tp135
-bsV503975041021661184
-p136
-g2
-(g3
-(I0
-tp137
-g5
-tp138
-Rp139
-(I1
-(I200
-tp140
-g12
-I00
-S"d{}?E\xc9\x9b>[\xeeD\xbf\x13h.\xbd\xf5{W>\x91\x94{=\x03\xa9\x0b\xbei\x16\xa5\xbe\x85\x93\x84>\xdc\x18.?Ya\x89\xbe\x07\xc7\xa4\xbe\x06\x02\x91\xbd\xd2?\x91\xbe\xafti>\x81\xffI?\xc0(Z\xbe6\xc7|\xbe\xd0\xcf\x03\xbf\xea&\xd2\xbe\xb2\nJ\xbe\xaev(\xbd\xc3;\x15?]\xdc\r?\xc3\\b>\xc6+\x83\xbe\xaf\xbb\xaf>Y=\x0c\xbda/\xe9\xbe3\xcb*\xbf\\\x9ct\xbe\xb0 M\xbcnn\xac\xbd\\w|\xbf\xab\xe5#>\x1f\xfa\xfc>\x93e\x1d?fv\xab>w\xb7\x06?1\x1dh\xbe\xd0v\x14\xbf\xfcH\x94\xbe\xb8\xe6Y\xbeYmx;\xac&\x11\xbfpa\x91\xbe\x0f\xfb<?\xd5T\x81>\xfe\xd8\x84>\x87\xba\x83?\xa7\x95t\xbe!\xebE?,&\xfb\xbe\xd1iL>O\xb2\x15\xbfN\xef\xba=\x19kP>\x08\xf3]\xbdE\x08r\xbf\x90\x04k\xbf\x1f\x81\x8c>cC\xa1?\x93\xb1K?2\x1ff\xbe\xd6\xab\n>\xb4G\x8d;]\xc3\x16\xbf4$q?\x9e\xbd\x0e?w\x8d\x12\xbf\x177?\xbf\xfb2c\xbf X4\xbfj\x14\x95\xbey\xa6\x85\xbe\x83\x8a\xcb\xbd\x97\xf29\xbe\xdf\xbf/>rl4?\xb4\xd3\xd4>G\x1e\xba=~\x04\xa6=Q{I?\xd3#\x14\xbfG\xc4\x0e>y\xde\r\xbde\\\x03?f'\x01\xbf\xaf\xa6w?\xa0h\xd2\xbe\xdae.\xbf\xf0\xd8\x8e>i\xe4\xc8\xbe\xda\x0b\xe3\xbe\x04\xd1\x0f?\x962\x06\xbd\x07`@?\xc9\xab\x99>\xfe3\x82>H\x11\x03\xbf\xf8v\xb2\xbeKp\x9f>)\xdb\xce>\x8a|\xb8>C\xf1??_\xbc\xed\xbe|k\x03=\xf1\xcci?j5\xe9\xbb\x04\x7f\xea\xbd\xcd\x8e\x9a\xbfu\xb1\xc4\xbe\xc732?\x1e*q>/\x1d\xa2>\r3\xb1\xbd\xef\xb9C\xbf\x068\xb2=\xf9\x93\x13\xbd\x9eW\xa5\xbe\xb0*J?\x85\xa1\x1e?H\xbd\x03\xbeYFg>\xe5x\x8a=\xf7\x95\t?\xf855\xbe\xcd\xf5\xae>KC?>\xe3\xb6\x9b>\xae\xb9\x9e>\x89\xe6\x0c>\xfe\x13\x98<\x02\xf5\xfe\xbc\xaa\\a\xbeN&\n>S0\xb2=\x0e\x8dG>>\x17\x88\xbf\xf9UR\xbe\x15\x97\x1c\xbf\x89\xa3\xc3>\xabl\xfa>&|O\xbf\x1fW??\xc4\x1a\x88>\xd6\x819\xbdS\x15\xb4?C\xd0\xa0\xbdT\xb3\xe2\xbc\xad\x19\x1e\xba+\xa8:\xbe\x1c\xf1\x98>\xd47\xe1=\x94\xcf7\xbd\x84AN?\xa2\x850\xbf\x1d\xa6\r\xbd_\x1e\x88>msU\xbff\xa6$\xbf\xbe/\xf8\xbe\xddZ\x84\xbf\xdf\xd7\x0b\xbf\xacTv>\xd4\xee&>Q\xd1c\xbf\x0c\x99.?_J\xa2>\x807\x87\xbe\xbe\xb6+\xbd\xc6>\t\xbf\x81NG\xbfS2^? \x16H>T:\x08?\xa3\xae\xa1\xbe\xf2s\x92\xbf\xb5y\xf6>n@\xa8>Qg ?i\x1b0\xbb\x80!\x0f\xbf9\xf5\x8c\xbe\x11\\g?(\x04J=\xbf\x9c\x0f?}\xcdD>\xb9\x11\xcb>\xf9.*=g4\xb9>\xa7`\xc7<\x10\xbd\xcb>C\xd3\xd8=I\x9f\x93?\xe3?2?~z\xba\xbe_\x04\xcc\xbdIq\x8e>\xe6\xd0\x83\xbe"
-p141
-tp142
-bsV504261016306589697
-p143
-g2
-(g3
-(I0
-tp144
-g5
-tp145
-Rp146
-(I1
-(I200
-tp147
-g12
-I00
-S'-\xb1S>\'\xe3\xb8\xbc\x999\x96\xbe\xa3-V=\xf51E>e\\\xae\xbd<@v\xbc_\x1aG\xbeKZR\xbdH\xf0\x93=kH&=\x89"V=\x9f\x8b\x03>C\x10\x87=*\xca\xa8\xbd-\x88d><\xe4\xea\xbc`\x82\xd8\xbci\xac\xd6\xbd\x88Y\xc5<\xe2~\r\xbec\x8d\xf0\xbcS\xab\xca=d\x0b\\\xbec\xa8\x12\xbd}\xa2x\xbd]c\x03>\xa1\x18\x16\xbe\xdf\xe9\x18\xbex&\xf7=\x95\xf0\xda\xbc\xf1C\xac\xbdi\x08\xd2=\x08\x1aP\xbe\xfc3\x1d<\xfb\x86D>\xdeQ\xa9=W\x06\x05>\xbd\x97b>Z\xfd\x8f<\x01\xd5\\\xbd\x0br\xb5\xbc\x85\x95(>\x94\xfeR\xbe\x85S\x05\xbe\x9ch\x13\xbd\x94\x12|>\xe5C=<=\xaaC=+\x9fy>\x8d\xe7O=\xce\xcc\x98><w\xbc\xbd0X\xea<\xcb\xdf\x91\xbe\x11\xe8\x0f>\x8d\x8c<\xbc\xbd\xb1\xea\xbdk\xec\x8e\xbe\xd9\xe3\x99\xbe{O\xf7=#\xcb5=\x98\xa9\xb9\xbb\x8f\x18"\xbe\xa5\xd2\x15<\xf7\xfb\x19>V\xeb\x11\xbe\xd1\xee\xc2=\x18\xa0%\xbe\x05y\xa8\xbd\x00L\xc9\xbe,\xf9V\xbe\xa9\xb2O\xbc]S\x9f\xbdg\t\x85\xbd\x97\n6>]\xc07>\xb8A\x80=?\xdc\xde=\xea\xd2\x1c>D\xbf`\xbd\x8e\xaf\x07=\xc7T4>\x03\xce/\xbelW\xb7=b}\x83=\x97cO>\xa6[\x86\xbe;\xe4\xbc>\xcd\xee\xd1<\x92k\r\xbe?L\x01>\xb4\x1aC\xbe\xecy\xab<\xa5\xd2k>\x0c\xdb3=\x99\x1f\x03>F\xfb\'>\x9f\x9e\xd5=\xe9|H\xbd\xe0o\xc4=Y-f>KH\x91=\x1b\xcc\x05>\xb5\xbf\x94>\xaa\xd5 \xbeE\xadc\xbb\xf492=\x8b\xa2F=\xad\xe5\x06=#\x8b5\xbd\xe0\x9d=>\xc0\xec\xfb=h\xc8\xfa=\x99\xa2\x92\xbcW\xcf\xba<\xbf\x1fd\xbe\xcb\x80g>Z\xcb$<\xd5R{=\xab\x01\xbb>5O\x80=>Y\x84\xbc\xef\xa6\x93\xbcy-\x93\xbc\x83\xe05>M*\xdc\xbd\xc0\\\xd3:\x1b\xa6\x15=\xf6\xe9\x9f=\x80\x1e:=\x89\x90\xbf=\xac\x0b\xa2=\r\x14\xed<g\x9d\x81=7"\xb7=\xbb\xb15\xbd\x9e\x9b\xa7<\'\x17\x87<\xc9tW=\xd3\xba\x04\xbe\x04\x95\x90>4\xb5\x82\xbc\x8c\x84p\xbe9\xad\x1a>W\x0f\x9c\xbdP\xbe\xec=}bS>\xb7B\xab\xbd\xcbK\x11<\xd0\xb9\xac<\x03s\xa8\xbd\xbd\xaa*>q\x03\x1b>\xf9\xae\xfe<S\xba\x81>\x89Bf\xbd#\xd3\xb5=\xf5O\x94=5\x90%\xbea\xfc\xb8=\x17\xb54\xbeK\xfc\x86\xbe$\xed\xde\xbd\xad\xcb\x9d\xbc\xdd\x97\x87\xbdE\x0f\x94\xbe\xb7+S>9\xaf3\xbdd\xc7}\xbdN\xb8\x90<FY \xbe \xbat\xbc\xeb\xf6\x9c>y\x16\xe3<\x14\xe3\x06<8\xa7W\xbeW\xa6z\xbei\xe2/=\xcc\xda\xcf=\xd9:Y>\rT\xb3<\xe0b\xd0\xbd\'U\xa8<\x83 H>\xe9\x00v<\xdc\x837>\xe1\xe9f=I\xeeR>\xba\xaf\x11\xbe!r*>m\xbb^=\xd5\r\xd8=\xcd\x82\x08>\xccr\x8e>\xd4\x05P>R\x04\xa6=\xb5\xf9q=\xaf\xdb\xe6<\xa8\x84\x97='
-p148
-tp149
-bsV503968837369217024
-p150
-g2
-(g3
-(I0
-tp151
-g5
-tp152
-Rp153
-(I1
-(I200
-tp154
-g12
-I00
-S'\r\x1c\x1d?\x15&\x8c>\x1b\xab/\xbf\x8f\xd5\x89<\x91\xc2T>[\xcc\x1b\xbeg\xb0\x81\xbd>\xbc\x94\xbe\xde\x7f\xb1;\xbd\xda5>O\x18\x83\xbd{_\xdd\xbd\xa3\x1c{<\xa6\x8a\xda\xbdx\x03\x07=\xee-\xcb>\xf5\xe7\xd2;\x93~=\xbeH\x1a\x84\xbe\xde5\x96:\xa2\xd7l\xbe\xb7>\x07=c^\x97>Nr/\xbd\xcboB=\t\xf3\x02\xbe"\x8bk>\x88C!<#\xbc\x96\xbe\xb5\xa6\xca\xbd\x9e\xf92<3};\xbc\x91c\r\xbd4\xf5\xbe\xbe\x8f3\xda<\xb8\xb7\x8c>\xd9\xe1\'>>\xf3\xaf>f\xe2\xde>=\x13\x0c\xbe7\xb7\x83\xbeZ\x92q\xbc.bO=\x1b\x89f\xbe`\xf9\xa4\xbeEL*\xbe\x8fG\xf2>\xcb\x89\xba;\xe9\x94\x03>\xc8\xc0\x1c?\xfd\xa6\x8d\xbco=\xe9>\xc7\xd9\x8d\xbe^n\x9e=U\xc4\xbf\xbe/8\x04>\x8b\xe4O>\xb6\x800\xbd)\x8b\x05\xbf.\xbd\xfc\xbe\xcbX\x80>\xc9<\x08?R\xf9U>\x19\xac=\xbe\x18\xb3\xb0=\x05\xdd\xa4=\xa2\x91\x91\xbe\xc9\xfc\xe5>\x9d\xd4K\xbd\\\x919\xbe\xdb?<\xbf\xe3\xae\x07\xbf\xf6O\xab\xbeb%A\xbd\xe7\n\x82\xbe\x853\xeb<+\xabw=\x02\xcb\x03>\xaf\xa7\xaf>\x14KT>\xe9=?\xbc\x06\xb2r=\'a\x9c>"\xbd\x99\xbez\x81\xc5=\xdb\xcc@>z\xcc\x8e>&\x89\xb6\xbe\xa5\xb5\x03?\xc8\x9c8\xbe2\xaa\xb8\xbeo\xee\x9b>}\xdb\xe0\xbe\x11\xa7\x00\xbe\x12??>\x02+U>\x97h\xa0>\x0b\xcdm>;E\x9a=\xb1,K\xbe$\x7f;=x\xd2\xa7>\x08<\x13>\xf4\x88i>\x1aD\xc6>\xce\x02\xba\xbe\x03\x03*\xbd\xda\x83\xf8>"\x15\x0e=\xc6{P=\xd7\x18\xfd\xbe\x8b/\x82<\x80\xf1\xfb>\xbe\x0c_>^#\x08>\x0b\x7f6\xbe*\xa6\x05\xbf\x7f?\x8f>\x8e\xff\x95\xbd\xe6\x8a\x86=;8\x0f?\xd7\x0e|>\x11\x12S\xbek\xb4B>td?=\xe5\x1ci>\xd23\x85\xbe\xa4\xa5\x0f>=\x08\xf2<C[\x99={qO>\x15O\x9d>n\xacl<H\xb2U=>\x01\x92\xbd\xc7Q\x91<\xd1\xba\x87\xbd7\x90\xdf\xbc\xc6l\xb4\xbe\xe0\x93\'=\xe2\xde\x98\xben\xf1h>\xcfe\xf8=\xfcf\x11\xbf\x1an\xc9>\xc2\xf4\x0b=\x0b\x02\x0c>\xfbu>?\xc6\xbe\xcf\xbd\xee\xf1\x8b\xbd\xcc\x1a\\>\xc2\xc4+\xbd\xfb\xf9\xbd>\x893m>\x80\xfa\xe1\xbc\xe9\xc5\x05?Q}0\xbe\x05R\x0c=t\xbdQ>\x11u\xb2\xbef\xec\x1b\xbe\xf6\x95\xbb\xbe=S\xdd\xbe\x85t\xb1\xbe\x7f\xc4\x07>\xbe\x02\x01\xbe\\i\x06\xbf8z\xb2>\x8b\x93\x99>\x1dYN=Uc\x83=\xec\xd1\x7f\xbe\xeb\x1f\x94\xbe\xda\xfb\xfa>\xc0nR;\xac\x13~>\xbc\xdb\xa3\xbe1\x00@\xbf\xc2\xd6\x18>\x86\xbdZ>\xc2\x00\xad>\xf2<\xc9\xbd\xf84\x90\xbe\xd4{o\xbe&9\xde>k\xcc\x93\xbd\xa5\xcd\xa0>\x05j\x0e=\x94\xbc\xbe>\xd7\xa0\xfa\xbcB\x08\x8f>\x13\xe7\x89<\x80\xd7\x8d>\xfb\xc3\x8c>\x9c\x08\x0f?&\xf9\xd9>\x89\xe1\xb8\xbdX3\x94=\x1b^\xda=\x03\x95\xc0\xbd'
-p155
-tp156
-bsV504261993235480577
-p157
-g2
-(g3
-(I0
-tp158
-g5
-tp159
-Rp160
-(I1
-(I200
-tp161
-g12
-I00
-S'\xd8\xd9\x07?8^*>H9\xfd\xbe\x15lD\xba\xbf\nH>W\xc8\x98\xbd"_\x14\xbd\xb6\xf0\xa1\xbes,U<\x87\xb0\x83>\x95kb\xbd\xcb\xbc^\xbd\x95\xb3\xc3=|\xb7\x18;D\x8b=\xbd\x98\xf9\xba>\x19\x04\xa6\xbdNY \xbe5\xeeI\xbe\x89T\xaa\xbd\x15\xf02\xbe\xdd.\x90<a7v>\xe0\x9d[\xbd\x7f\x8b*=\xe8\x15\xba\xbd\xd3\x87E>\xb5F\x02\xbe#\xea\x86\xbe9\xdb\x84\xbd\xf3\x08\xc2\xbc\xad\xdc\xac\xbd\xb8;\x85=\xb9\x19\xc6\xbec\x18e=\xa1\x90\x9f>\xd8I`>\x7fTo>\xa5\xe6\xb8>\x1a\x1e\x88\xbc\xf0\x13I\xbe\xb8T\xc7\xbd\xb9\xb3\x14>\xc8\x81x\xbe\xc1A\x83\xbe\xe3b\x8d\xbd?\x8c\xd5>\xa9t\xb0<\x87\xe3\xa6=w\xe1\x11?\xa5m\xe2\xbbd\xdc\xe0>\x05vq\xbe\xd5\xca\'=\x8b\x0c\xd7\xbe\n\xba\n>T\r\xe1=/.\x18\xbd\xedk\x13\xbf\xdf\xf5\x06\xbf_@z>\x19b\xce>\x95[F>|\xa7n\xbe\xd5\'\x84\xba\xb2B\x01>-\xa9v\xbe\xed\x16\xc2>\xd5+\xea\xbc\xe1\xf8P\xbe\xbfO\x1c\xbf(,\xdf\xbeS\xd4I\xbe\x81\x92\x1f\xbe\xa0d\x1c\xbe\x83)\xac=?\xf9(=\xaf\xfd\x02>\x7f\x87\x85>\xc7\x9eU>P\xe0\xe3\xbc%\xa7\xab<\xc3\x82\xc0>\x88\xce\x8f\xbe\xf4\'\x18>\xf3X\xc4=\xcb\xd2\xa1>\x12z\xa4\xbe\xd3\x01\x07?L\x04\xa7\xbdp\n\x90\xbeg\x15\\>\x9d\xbf\xac\xbe\x84e\x80\xbdn\x97\x9e>y\xfe\xc6=\xe37\x80>\xb0\x9c\x84>\xb0\x0e\xd8=\xda\x9a\x1d\xbe\x19\xab\xb2\xbco\xa0\x8c>\x03n\x1f>\xc3m)>\xd0\x9d\xe2>m(\x8e\xbewW\xa3<\xc2`\xa9>g\x07\xca<\x81\x1dY\xbcKj\xd3\xbe\xd8\xf2\xa4=\xad\x8e\xbe>s\xeaO>\x10v\x01>\x8b\x06\xb7\xbd\xbfN\xc7\xbe\x1a\x85\x8d>g\x15\xa5<\x1d2I<\r\xd9\x01?\xdc\xa8X>\x15:\xaa\xbd+}\xa5=pso\xbcm\x13\x88>\xd1\x91\x1f\xbe1\x9c\xf2=\x1fv\xad=\xedl\xb9=\xf0\x12\x1e> \x04!>\xf8\xf8\x18=+K_<\xcdt\x02\xbdcy\xad<i{\x10\xbdm%\x9f\xba\x08\x06}\xbe\x95\xc79\xbc \x08\x7f\xbe\xd9\xe3\x85>\xb3\xc4\x12>y\xb5\xf7\xbegI\xca>\x8d6\x85<\x94\xd5\x17>\xf3Q\x0b?\xe3\xb2\xbc\xbd\xa8\xf4\x7f\xbd1z\xab=\x19\xe9\xbb\xbd \xfe\x98>\x8cKO>\x07\x93X\xbc`\xce\xd9>[\xc0>\xbe|;\x93=Dk\xfa=\x81\x15\xac\xbe!\xf3\r\xbe\x8c\xe4\xab\xbe[I\xf3\xbe1\x95w\xbe0V\xa2=\x00\xb48\xbd\xd0\xb5\xfd\xbe\x03\xd5\xb3>\x84\x7f->\x80\x16\x93\xbd\x08=\x91<|\xdd\x86\xbe\xd4\xe8q\xbe\xc6V\x04?\'\xc8\x84=\xdbQ0>\xf0X\xa9\xbe\x13\xaa\x16\xbf=\x9f\xf8=\x9b\x81)>\x0cJ\x9a>\xc1\x85N\xbdS\xf1\x87\xbe\xff\x85(\xbe\xe8\xaa\xb4>7\xb70<\x0b\x05\x86>\xb6[\x8b=\x1a\x8e\xa6>3\x0e\xe9\xbd9\x00\x83>9\xd7]=9\x9d\x88>I\x87W>\xd5?\x0c?|\xa2\xcc>=\xee\xbe\xbd\x94#\x10=\x03F\xbd=!Q\x96='
-p162
-tp163
-bsV504273998989889537
-p164
-g2
-(g3
-(I0
-tp165
-g5
-tp166
-Rp167
-(I1
-(I200
-tp168
-g12
-I00
-S'\xd8\xd9\x07?8^*>H9\xfd\xbe\x15lD\xba\xbf\nH>W\xc8\x98\xbd"_\x14\xbd\xb6\xf0\xa1\xbes,U<\x87\xb0\x83>\x95kb\xbd\xcb\xbc^\xbd\x95\xb3\xc3=|\xb7\x18;D\x8b=\xbd\x98\xf9\xba>\x19\x04\xa6\xbdNY \xbe5\xeeI\xbe\x89T\xaa\xbd\x15\xf02\xbe\xdd.\x90<a7v>\xe0\x9d[\xbd\x7f\x8b*=\xe8\x15\xba\xbd\xd3\x87E>\xb5F\x02\xbe#\xea\x86\xbe9\xdb\x84\xbd\xf3\x08\xc2\xbc\xad\xdc\xac\xbd\xb8;\x85=\xb9\x19\xc6\xbec\x18e=\xa1\x90\x9f>\xd8I`>\x7fTo>\xa5\xe6\xb8>\x1a\x1e\x88\xbc\xf0\x13I\xbe\xb8T\xc7\xbd\xb9\xb3\x14>\xc8\x81x\xbe\xc1A\x83\xbe\xe3b\x8d\xbd?\x8c\xd5>\xa9t\xb0<\x87\xe3\xa6=w\xe1\x11?\xa5m\xe2\xbbd\xdc\xe0>\x05vq\xbe\xd5\xca\'=\x8b\x0c\xd7\xbe\n\xba\n>T\r\xe1=/.\x18\xbd\xedk\x13\xbf\xdf\xf5\x06\xbf_@z>\x19b\xce>\x95[F>|\xa7n\xbe\xd5\'\x84\xba\xb2B\x01>-\xa9v\xbe\xed\x16\xc2>\xd5+\xea\xbc\xe1\xf8P\xbe\xbfO\x1c\xbf(,\xdf\xbeS\xd4I\xbe\x81\x92\x1f\xbe\xa0d\x1c\xbe\x83)\xac=?\xf9(=\xaf\xfd\x02>\x7f\x87\x85>\xc7\x9eU>P\xe0\xe3\xbc%\xa7\xab<\xc3\x82\xc0>\x88\xce\x8f\xbe\xf4\'\x18>\xf3X\xc4=\xcb\xd2\xa1>\x12z\xa4\xbe\xd3\x01\x07?L\x04\xa7\xbdp\n\x90\xbeg\x15\\>\x9d\xbf\xac\xbe\x84e\x80\xbdn\x97\x9e>y\xfe\xc6=\xe37\x80>\xb0\x9c\x84>\xb0\x0e\xd8=\xda\x9a\x1d\xbe\x19\xab\xb2\xbco\xa0\x8c>\x03n\x1f>\xc3m)>\xd0\x9d\xe2>m(\x8e\xbewW\xa3<\xc2`\xa9>g\x07\xca<\x81\x1dY\xbcKj\xd3\xbe\xd8\xf2\xa4=\xad\x8e\xbe>s\xeaO>\x10v\x01>\x8b\x06\xb7\xbd\xbfN\xc7\xbe\x1a\x85\x8d>g\x15\xa5<\x1d2I<\r\xd9\x01?\xdc\xa8X>\x15:\xaa\xbd+}\xa5=pso\xbcm\x13\x88>\xd1\x91\x1f\xbe1\x9c\xf2=\x1fv\xad=\xedl\xb9=\xf0\x12\x1e> \x04!>\xf8\xf8\x18=+K_<\xcdt\x02\xbdcy\xad<i{\x10\xbdm%\x9f\xba\x08\x06}\xbe\x95\xc79\xbc \x08\x7f\xbe\xd9\xe3\x85>\xb3\xc4\x12>y\xb5\xf7\xbegI\xca>\x8d6\x85<\x94\xd5\x17>\xf3Q\x0b?\xe3\xb2\xbc\xbd\xa8\xf4\x7f\xbd1z\xab=\x19\xe9\xbb\xbd \xfe\x98>\x8cKO>\x07\x93X\xbc`\xce\xd9>[\xc0>\xbe|;\x93=Dk\xfa=\x81\x15\xac\xbe!\xf3\r\xbe\x8c\xe4\xab\xbe[I\xf3\xbe1\x95w\xbe0V\xa2=\x00\xb48\xbd\xd0\xb5\xfd\xbe\x03\xd5\xb3>\x84\x7f->\x80\x16\x93\xbd\x08=\x91<|\xdd\x86\xbe\xd4\xe8q\xbe\xc6V\x04?\'\xc8\x84=\xdbQ0>\xf0X\xa9\xbe\x13\xaa\x16\xbf=\x9f\xf8=\x9b\x81)>\x0cJ\x9a>\xc1\x85N\xbdS\xf1\x87\xbe\xff\x85(\xbe\xe8\xaa\xb4>7\xb70<\x0b\x05\x86>\xb6[\x8b=\x1a\x8e\xa6>3\x0e\xe9\xbd9\x00\x83>9\xd7]=9\x9d\x88>I\x87W>\xd5?\x0c?|\xa2\xcc>=\xee\xbe\xbd\x94#\x10=\x03F\xbd=!Q\x96='
-p169
-tp170
-bsV504238803251630080
-p171
-g2
-(g3
-(I0
-tp172
-g5
-tp173
-Rp174
-(I1
-(I200
-tp175
-g12
-I00
-S'sO\xb8>\xf7\xed8=\xb7\xc5\n\xbf\xfct >\x0c{[>\x05\n:\xbd\x9b\xa0\xf5\xbd\xdd\xeds\xbe`\xbe\x02=d-k>\x90\x81\xe3\xbd\xd9\x85\x84\xbd4\xf8p;\xa3@\xbc\xbbE#\xc5=I\xaf\xc4>\xef\x89_\xbd\x0f\xa1>\xbd\xb3\x1d\x82\xbe\xd1\xbc\xff\xbdP\x05\xe6\xbd_\xbd(\xbe\xe3\x9a\x98>\x9b\xd82\xbd\x0ey\x8f=_\xa9\xf3\xbd)J\x90>\xa3\xe3\xac<C~n\xbe\x13\xf3\xc7\xbd\xdf\x9d?\xbeI\xe5\xdb\xbd\xe3\xcf`=\xfc\xe2\x07\xbfm\xe1\xfc<\xc3C\xae>\xec\x08U>\x95\xfe\x83>`C\xc5>\xcb\xb3\x1a\xbe\x9c\x84\xb5\xbe\x94Q+\xbd\xa5\xcc\x93=\xd5\xe0\x89\xbd\x85\xe3\xac\xbe4\x13R\xbe\x99\xd1\xeb>/km>hO]>c\xf4\xfa>\x07\xcd.\xbc\x95\xf1\xf9>g\xe0\x1a\xbe\xd3P\xb0=\x08\xa4\xdd\xbe\xa5\xd7%>\xa71\x03\xbd8\xaf;\xbes\x06\xeb\xbe\x00\xb9\xf7\xbe)\xa1\x12>\xb7\x80\xca>\x9dB\xa0>w\xa4\x8a\xbe\x1f<*>\xc1\x8c\xf8<\xebV\xe3\xbe\xab\xe9\x8d>\xfd\xcd\xd1=\xb7U \xbe\xdd\x87&\xbf\xe6\xc1\x02\xbf\xb0\xb6V\xbe\x92\x8b\x9c\xbd\x99\xfb\x15\xbee\xfc\xb9=]\x92">\x0b}\xb4=\x8c\xe4\xcf>^\xb9\x8a>\xdcR\x8c\xbc\xc1\x12\x03>\x10q\xcf>\x0fH\x9c\xbe\xb4\xc5\xa0=3\xebt=VV\xa1>p\x8a\xf3\xbe\x89\x95\x10?\xec\xb8H\xbe\x89\xb4\xbc\xbe<\xfdD>\xb1\x0c\x86\xbe\xb3;\x0b\xbe\x02\x86\x89>\x03KE=\xfe\xe5\x9d>\xd4\xb4\x16>\x8b\xd8S>Xf]\xbe\x88y\xc8=2\xa3\x99>]\x80->%\xf0\xb3>\x88#\xf3>\xf3\xc6\xb2\xbe\x03\x9f\xd2\xbd\xf8=\xb0>\xa3"s=\xe0\xe2\x9c=\xb9\xe0\xc5\xbeA\xbe\xb0\xbd\x19&\xe5>\xda\xaf\x82>+\\\xd8=$\xcc\x98\xbc;\x06\xf2\xbe\'\x9e1>$\x91\x88\xbd\x89\x9d\x00\xbe\x10w"?4\x10H>\xa7\xe3\x82\xbd{\xdfp="\x14\x95\xbcT-a>\x0b/4\xbe\x00<\xda\xbaG\x81N>\xbf\xcb\x97>\xa4\xa3=>m\x1c(>@\x84\xad=\xdc1\xf4=\xdfa|\xbdQ,*>\xb1R\xe1<=@\xbd=\xfbu\xc5\xbem\xd6\xf3<\xdch\xc0\xbe%\xb2\xc0>\xbd\x7f\x03>\x89\x1a\x01\xbf\xfc\x87T>\xa1\x89\xc3\xbd&\xe8\x15=\x17\\%?\xd3\x0c\xfb\xbd\xe5A\xbf\xbb7&\xab=aX\xd0\xbd\x9f\x94x>\xb8\x9e_>\x94XV\xbd\xf2\x00\x11?\xee\xac\x9d\xbei\x9e\xaf\xbaH\xed,>\x07X\xbf\xbe\xa3\xb9\xc1\xbd\xe5r\xf4\xbe4i \xbf\x13\xbdb\xbeM-\xe2=\rt\xad<\xdb0\xf5\xbe?U\xed>\x97\x07\xf2<\xfd\x1c\xa2\xbdI\x87_\xbby\xb3\x8c\xbe\x89fb\xbe\xe1\xec\xc7>\x0bE0\xbc{hV>\x0f\xfbr\xbe\xef\x1f\x07\xbf\xb3\x0e\x9b>\x0ba\xed=\t\x0c\xb1>si\xb5=`\x9dt\xbe\x87\xb2\xd6\xbc\\\xe6\xe0>\x837\x18=$q\xa9>-\xc7\x03>\xabV\xbf>P\xbe\xf5\xbdk\xa6\xb3>q\xee`=X\xe0i>\x15\xa5\xa6=\xed\x9a\x10?Rv\x9b>I\x9b\x91=9\xb7\x82=m\xd9\x0e>\xa98A\xbe'
-p176
-tp177
-bsV503960564759269376
-p178
-g2
-(g3
-(I0
-tp179
-g5
-tp180
-Rp181
-(I1
-(I200
-tp182
-g12
-I00
-S'"_\x1d?\xcb\xd4\xb1=\x01\x1c\t\xbf\xad\xdeS\xbe\xb0\xc6\x88>so\x0e>\xc9\x8e\x01=W\xe5\x83\xbe\x97\x9b3\xbc=\xd7\xc3>\xf7s\xd2\xbcJ\x1f\x0f\xbe\x9dR\x9d>\xc5=,<8\xc0~\xbea\x06\xb7>\x01/\xca\xbd\x00n\x97\xbd\xc0-\x9b\xbem\xcf\xca\xbd@#|\xbe\xb2\xbc\x12>F\xb2\x98>;\xf2\x9b=\x97?\xda=\xd1\x9du\xbe\xfc\xf0?>\xeb+\xbe\xbd(\'\x8f\xbeyA|\xbe\xe1\xdc\xb4;\x84q\xdc\xbd\x05\xa5\xd4=\xf1\x1b\n\xbf\xcd\x97z\xbd\xf77\x88>\x1d\xba\x88>C\xb6\x86>\x91\xe9\x91>\xa8_\xd8<+S"\xbe\x0cz\xc2<\x9d\x12\x18>sW\xbd\xbep\xa7Q\xbd(\x9c\x03\xbe\x86\xbf\x08?\x91\xe3\xb2\xbc\xab\xc0\x86=\xa5p+?C\xfd\x8e\xba\xdd\x9e\x1f?\xfak\xa7\xbe\xdd~:>\x18)\xd8\xbe\x19\xbdS>!\xd53>\xad1\x1d\xbeI\xf0\x06\xbfu\xa1\x0c\xbf\x03\x10\xce>\xc3\x80\xbc> J\x18=\x98^\x17\xbe"\xf9\x02\xbdT\xd6\x1d>u\xee\xe6\xbeoK\xd3>A\xba7\xbeS}r\xbe]\xc9\xec\xbe)B\x89\xbe8\x03\xf7<\x91\xa2%\xbeL\x02\x99\xbeI\x8d\x81\xbdOU\x05=\xcc\xa4\xdc=\x8c\r\x1c>\x8bs\x1f>\xac\xf6\xe5\xbd\xdf\x8d\xa9<\x07h\x16?$wJ\xbe\xcdk!>c\xb9O>\xed\xaf\x86>\xb0$\xed\xbe\x9d\xf5\x15?GQ\xb4\xbd\xb7\xb4\xf3\xbe\x91\\\xc7<\xa4a\xd2\xbe\xa9\'\xc6\xbc{\\\xd6>\x10\xa8f>[~)>\xc8\x1a\x8b>\xa1\xee\x01>\x81\xefR\xbe\xdb\xf8\xab\xbd}\x82\x94>\x9d\xc6n>\xb5\xb5M>\x0cSm>\xe3\xed\x80\xbe\xdf\xc1\x12>\xadP\xa6>\xe3i/=\xd9\'\xec=\x1c(\xe9\xbe\xe5\x89\xca=\xb4\xfe\x8a>\xdc>T<dD\xde<\x05\x8d\xcf\xbd\x85\xa7\xd3\xbeX<\xc7> t.\xbc\x95\xaeG=\x7f\xa4\x0c?$\x17\xe9=g\x81\xd1\xbd\x8f3+>\xbc*\x0c\xbe\x9d\xe6\xb4>\x8b\x8c\x06\xbe\xd3yK\xba}\xa1\x08=t\xe9U\xbd\xd9}`>\xf8\xda)>e\x83\x97\xbc\xa3\xe4\xaa=?,g=e\xb3\x82>\xfcN\xb2\xbdM\xf8F\xbdf\xfa\x0b\xbe\x94w\x1d>\xaf\x1a\x89\xbe\xb0\xb75>\xadbR<\xe7\xbb\x05\xbf_\r\xd3>.z*=\x8d\x11f>?$\x07??\xf9!\xbe\x11]\x87\xbd\xd8\xda\xd4\xbd\x93\x03k\xbe(~\xe8>s\x9e~>\xcd\xdc9=tc\xf7>h\x81Q\xbe\xad+\xb5=\t)\xbf=+\xde\xb6\xbe-\xd6\t\xbe\xe7\xab*\xbe\xd4C\xfb\xbe\xa8\xfa\xc3\xbe\tR\x85>\xc3\x1eE\xbe\xd1\xc5$\xbfy\xd3\x9f>\x9bX9=\x11\xfb\x14<\x1f\x02\xf8=\x17x\x19\xbe\x10c\x90\xbd\x8d\x017?!\x8f\xe9=\xc1\xd9\xe1=\xac\xae\xd9\xbew\x0c)\xbf\x13\xbe\x9f<\x13\xb8W>\xe1\xed\xff>\xfd\xdf2\xbd\xdf\xd2\x80\xbe\x81aZ\xbe\xcb!\xa4>\xfd%\xf6\xbc\xa5\x1f\x92>\xf3\x86\xe0=\xf5R\x99>\x83*\xd4= \x1f|>\xaf\'\xa0<\xe8\x15\x95>$\xb9\xb7<\xc8\x9cK?[7\xa6>]\xca\x9e\xbd\x85PP\xbc\xaa\xae\x10>\xa5\xe9\x8e>'
-p183
-tp184
-bsV503971228932390913
-p185
-g2
-(g3
-(I0
-tp186
-g5
-tp187
-Rp188
-(I1
-(I200
-tp189
-g12
-I00
-S';R\xe8>9\x9b\xc1\xbc\x0cX\x16\xbf\xb3\x8d\xfc;(=\xa1>6\x80-<\xa8\xdf;\xbd/\xa0a\xbeG\xc3,=j\xe8\xa1>=?\xde\xbd~V\x17\xbd\x87\xcc\x06>mc\x8e\xbd\xfaX\x94\xbd\xbfP\xbd>\xf4R\x12\xbdT\xa2\xe7\xbcN;\x9c\xbec\xcf\x85\xbd}~\x89\xbe\xd8{\xe89\xd4\xd3J>^}\xeb\xbd\xec\xfd_=`\x93g\xbeO\xf6\x9a>\x1c\x8e\x06\xbd4\xc3\xb2\xbe\x11K\xff\xbdS\x06\x1e\xbd\x98pP<\x8d\x8c!<j\xa0\x0b\xbf\x94\x06 \xbd\x83*\x9d>\xe8\x9cK>\x8f\xd1\x9c>\xa5\xea\xdb>>34\xbe\xaf\x97\xaa\xbe_\x17\xbe=\x07\x05u>\x80\xf7Z\xbeM\x14e\xbeQ\xc7e\xbe\xc04\x07?\xff)\xcc=\x0b\xc9C>\t\xfa\x1b?X\x82\x9b=\xf9\x11&?f!\x93\xbe\x0c.B>8\x93\x01\xbf\x89\x03\x98>\xec\xec\xac=\xbb\x87\x86\xbe\xf9,\xf9\xbe\xd3R\x01\xbfwZ\x96>H\xa2\xb3>\x04\x17)>;\xbdN\xbe\x86\x0bP>h\xe7\x90=\'.\xe4\xbe\xf9\x90\xbd>E;\xe4\xbd\xaa\xba\x1d\xbe{[\x11\xbf\x93\xa6\xd1\xbe9\xe5\xf7\xba\x0b[R\xbd\n\x99m\xbe\xdeK\xb4=\xcc\xf3\x89>\xc8\xb3\xce=\xfdM\x91>\x9cQ\x84>+\x96\xa6\xbd\t&\x89=\xa3\xec\xdc>\x9d\xd1\x8e\xbe\xe5\x9d7=T\xf1\xfc=\xcd`\x90>/\x12\xf8\xbe\xcf\xfe\x17?l\x0e\x9b\xbd\x01>\xd0\xbe]\x8e5>\xf2\x04\xb0\xbek\x05\xbf\xbd\xff\x13\xc4>\x8a\x01\xf6=\xd3\xefD>\xd9\x8ai><g\x82>\xb4J)\xbe\x99\x9b\xef=\xd7\xce\x98>\xe5\x82Q>1\xad\xa1>y\x19\xa8>\xdb\xe6\xb9\xbe\x82L\xfa;\xcc\xfb\xa2>]0c=\xad`\xda=M\xc5\xc1\xbe\x8e\xcf\xc5\xbcm\xc4\xb9>W\x82\x1a>\xd8\xffT=\x80\xc7l\xbc\xd1\xd5\r\xbf\xde[\xae>\xad6K\xbd\xe3/\xb5\xbc3\x0f#?M&\xce=t\x1c\xfb\xbd\x15\xb4\xd2=\x9c\x90\x1e=\xfc\xf2\xb5>V\x07s\xbe\x06\xc1\xcc\xbd\xcf\xcf\xda=\nC\x82=-Qc>\xe8\x95.>\x0c7\xe9=\xe3\x0e\x05>\xed>\x8d=,Yw>\xd8\xf7\x17=M\x0c\x8d=\r\\A\xbe\xf8q\xae=\x97\xc3\xb0\xbe\xe6\xa6\xae>?\xa7\xbf<SL\x10\xbf"~\x85>\xa2\xf3\xde\xbc\xd8\x03X>Ou\x10?\xdc\xefQ\xbe\x8eL\x1f\xba\x1f\x9d\xab\xbc\xeb\xd5#\xbe45\x9e>\x08\x88\x8a>e\'\xff<\xb3\x15\x18?\xa2F\x87\xbe-\xd3\x98=\xf8\x0f.>z\x1c\xc8\xbe3*\x1a\xbd\x8dk\xba\xbeC\x83\x16\xbf\xd8\xac\x99\xbe:\xe4)>7\xe2\x0f\xbe\xbc3%\xbfq\xee\xc5>b\xd4\xf0\xbc\x91?\xde\xbc\xb3\x91\xf5=\xb0\xe0\x1b\xbe\x9e)\xa2\xbdz6\x19?\xa9y2=\x1b0\x0f>\x81D\x9f\xbeH~\x16\xbf`(#>=\xb0\x00>\x9d\xa7\xcd>\xc6\x89\xb7=-/\x9f\xbeO\xfe\xfc\xbd\xd4\xa3\xc3>\x18\xa67\xbd@\x19\xb5>\x13\x00)>\xe8\xfa\x99>\xc7\xe2\x93<x\x0c\xa6>\x03\xd4\x8b="\xba\x86>\x1b~o\xbc\x1eG\'?\xd9\xda\x97>\xe7\x07\xe4=\xb9\xf8\xae\xbb \x1c\xe7=\xbd\x96\xdd;'
-p190
-tp191
-bsV503960017347686400
-p192
-g2
-(g3
-(I0
-tp193
-g5
-tp194
-Rp195
-(I1
-(I200
-tp196
-g12
-I00
-S'\xef\x0f ?\xa4c#>\x0fm\x07\xbf\xdfe3\xbd\xd1\x1f)>\x10\xa7?\xbb\xc8\x84\xaa\xbc\xc3/|\xbe\x03H\xcf=\\K\xb7>\x1dk\x1f\xbe\xf6@\xd5\xbd\xad\x85D<\x9d\xce\x1c\xbe\xc4\xc6\xaa=y<\xe7>\x03\xf5\xc7\xbd\x90\xf8\xf5\xbd&O\xa3\xbe\xc9\x11f\xbe4=#\xbeZ\xda\x06=M\x8d\xa0>g3]>\x90\xc8\x14>z\xc7A\xbe3\xbb\x83>DR?<\xc67\x91\xbex\x8e\xab\xbeKX\xac\xbd\x8f+\xe9<\x9a\xd6\xe8\xbc:*\x14\xbf#\x95\x87=\x9f\x8au>\x04\xf5\xa9>7\x11\x92>\x1f\xdb\xb9>\x93/g\xbe\x86\xb5\xbe\xbeo\x1b\x06\xbed\xe7\xbf;qE\xd6\xbdW\xc3\x98\xbeQ\xeaF\xbeJ\r\xd6>z\xc8\xef=\xcf\xea&>F= ?\x0c\xcd\xc1\xbd~\x07\x0e?\xf9\xc8\xa0\xbe\xefxG>\x1d\x89\xca\xbe\xfb\xd9\xa8=,\x87\x19>tF\xed\xbd\xf8\xd5\x17\xbfQ$\r\xbf#\\m>x\xcc.?\xe9H\xda>6\xe9\xff\xbdr\x80\xaa=Q!\xa79\xa0\xa7\xca\xbe#\x0c\x14?\xbf\xbd\x98>B6\x8f\xbem\xc3\x0e\xbfQ\xc0\xfd\xbe\x00\xea\xa5\xbe\xad\xb0\x0b\xbe\xd7\xc8\x16\xbeZ\x86\xc6\xbcyTn\xbd\xe9\x02\x9b=\xb1u\xcb>#e\x87>`\xb3\x1d\xbb\xc7\xa0O=!*\xe4>\x06\x85\x9d\xbe \x90\x12=Lp\r<\xfcJ\xb2>\x9a\xab\xab\xbe"\x1a\x13?1\x8b{\xbe\xe3u\xd3\xbe(8\x05>\x8e\xd7\x94\xbe\xfd\xf4\x9a\xbe\'9\xad>Q\xdd\xe0=\x17\x06\xd6>,\xbdg>-l)>\xf8_\xa5\xbeI\xc8\x89\xbd\x9aXp>1\xbc}>fJt>A)\xdc>\xd1\x17\x89\xbe\x94\x06\xad\xbc\xed\xb7\x04?\xbaJM\xb8T\xca\x99<\x82\x11(\xbf\xf7\xe1\x1d\xbeO\x82\xd5>\x89F\x03>D \xc9=L%\x84\xbdc\x95\xf4\xbel5\x13>\xa2\xf7\x02\xbcI\x8f\xc2\xbd\to\x0b?\xdf\xec\xa2>\x81sl\xbd\xb9\xdaB>\xc4X\x85=\xd4\x90\xa4>{(\x03\xbe\x86\x1c)>F\r\x02>\x17\x88W>\xdcYV>\x14\xa6\x9f=\xfd\xe8\x8a<\x1f\xffE=c\x8b\xfe\xbc\x14%\xb4=\xc9\xf4\\=dI\xc5=\xedL\xfb\xbelR\xb2\xbds\xdb\xc1\xbe\xdb\xdb\x91>jQ\x90>#\x92\x06\xbf\x87r\xd4>\x98,\x1c>\xf9[_=\xd0IG?3\x83d\xbd\x1f\xda\xe0\xbc?\xcd\xc4\xbb\x80N\x06\xbe1ra>\xfa\xd6\xc3=\xe8\x86\xb8\xbc/\x89\x02?V\xd9\xc2\xbeC\xcd\x18<>\xf1\x1d>O\x8e\xf2\xbe\x03,\x8f\xbe\x0b\x94\xb0\xbe,\x0e"\xbf4\xaa\xa2\xbe\x9doN>\xa1\xa6s<\x14v\n\xbf\xbf\xb8\xc5>t\xad->)\x17\xf6\xbd\xefz\x12=\xb5+\x90\xbeD\x97\xcc\xbe\xdea\x0b?q\xdam=(\xe8\x88>\xb4\xb0\x8c\xbe\x14\x04>\xbfdw\x96>\xff\x0f\x1d>I\x88\xb1>-\xde\x0b=\x17\xcb\xaa\xbe\x9a\xb6\x07\xbe<\xf3\x02?\x83\xe7\xe0</\xcf\x9f>\xfdp\xf9=\xb2\x8a\x8c>\xd6\xd9y<\x96\xd0\x84>\xc3\xebq<@LL>(-\xa8=\x89\xdd:?\x06\xbe\xbb>W\xef\x13\xbea\xe7\x8a\xbd}\xe4\x0c>\xfc6\x01\xbe'
-p197
-tp198
-bsV503966055841402880
-p199
-g2
-(g3
-(I0
-tp200
-g5
-tp201
-Rp202
-(I1
-(I200
-tp203
-g12
-I00
-S'c\xc7\x90>\xf9\x1b\x14\xbeS&\x83\xbe\xb3Ac\xbc\x01\xc4\x83>o\xfd\x8c;\x98fs\xbd\xdd\xb1e\xbeH\x97\xee\xbc\xd7_j>\xb9\xe3\x8a=M\xb7\xa8\xba\xbd\x08A>\xb4\xf9\\=\xdd\xde,\xbe{\xe0\xa5>X\xf2\x8e\xbd\xef\xbd\xe6\xbc[>H\xbe$Lv\xbd\x19\x96\r\xbe$;u<T&\xf5<\x1a\x8f\x14\xbe-\x01\xd3\xbcpO\xe0\xbd\xb7\x89&>\x18\xe1A\xbe5%\x93\xbe\xc5\xc7\xb7\xbc\x17\x8bF\xbe\x7f<\'\xbd\xa0\xea\xdb=\xa3\xe5\xb5\xbe\x17\x0b\xe2\xbc \xd2\x82>i(d>\xa1\xda\xa1=\xc3\xf9e>\xa5\x8b\x85=\xf4_\xdb\xbdIy\x80\xbd\xfbO\x08>\xc3\x99q\xbe\xd3\xe8\x1a\xbe\x8e\xf7\x15\xbd\x95\xcf\xc1>|\x08\x82=\xad?\xb0=\x83\xbd\xb4>F]\x85=\xa0\xa6\xdb>\xe0\xd0U\xbe\x84\xac\x81=\xec\x06\xc7\xbe\x8dnY>\x9f3\xee\xbcK++\xbe\xaa/\xa6\xbea{\xc8\xbe=*B>U\x8c\x0b>\x8bK\xc6=\x18\xb0\xc3\xbd\xa8\xb6\xbb<\xb0\xeeB>%\x1ed\xbe\xb9h6>\xd5\xd6\x19\xbeg\xbdl\xbe\xdd\x9e\x9c\xbe\xb8;?\xbe\x84\xa8_=\xeb;\x13\xbe\xe4\x01\x9d\xbd\xbb\xb5+>\x1f\xf5z>\xfd\xfd\x0c>X\x08m=}\xd0o>y\xee_\xbdd\xd1\xa5;1\x03\xb3>\x0c\xda8\xbe,\x10_=\xbfv*\xbc\x88\xef,>d\xef\xba\xbe0\x00\xf2>\xdf\xb2\x83=\x042Y\xbe\xc3\x16\x81=\xfc\t)\xbe\xb9\xaf\x80\xbbk\xdd\xd2>\xbfd\xe9\xbcl\x19\x1f>\x97W6>\x15\xabS>1\xdd\xa5;\x10\x9a\xfd<\x7f\x0cu>\xe1&\x1f>!7->\x84e\x96>\xf9MJ\xbe,.\xc8=\xb8\x98p=k\x7f\xc9=\x84\xa6+=\x8d\xc9\x0f\xbe\xe9h\xe0=5\xd1\x03=\xbd\xbcS=#\xba\xc3\xbcps >\x11\xb8\xab\xbe\xaf4\x8a>\xff\xa2\x0c=\x85\t\x02<\xcf\xf0\xc7>\x8d\xe3\xf3=\xb4\xe4L=\x05z\xa3\xbde\x0b$\xbd\x8cT\x9e>\xe3)\t\xbe\x8a\xbc\x83\xbd\xbbl\x00=\xef\xe8#=\xf0\x81E\xbc\x83z\x90=\xc3W)>\xeeu\x92:\x90\x01\xec=\xd9\xc2L>\x98p+\xbd\x87EU=->\x87\xbcy\xc9\x10=4\xc0*\xbe\xd9\x83\xa3>\x14\xe7\x1b<P8~\xbe\x0ciB>]\xbf\xc7\xbb\xb3\xfb">!\xe2\xa4>\xe44+\xbe\xe1\xe5\xc6=\xaf\x95\t\xbe\xb1I\x1c\xbe]\x94J>\x14\xff4>\x99\xfa\x87=\x05\xa4\xa1>\x1b\xae\n\xbe)a!>\xa7\xad\xc6=\xb0tu\xbe\\\xadV=\x81\x92\x04\xbe\t+\xd4\xbe\xd9\xba3\xbe,91<\xf5\x81A\xbdA\xc3\xf5\xbe\xeb\xae\x82>\xd4"^\xbekY\xba\xbdS\xb7\x1f=\xc1\xf8<\xbe\xb4\xbe?=\xbd3\xf4>\xd8\x86\n>1F-=$xT\xbe\xb5\xb6}\xbe\x17\'\x7f=\x0c9\xf3=\xe1\xd7\xab>{\xaf\x0e>u\xa7"\xbe\x89\x8d\xa2<8\x10\xa7>\xff\xb6\x93\xbc\xd7\x07j>j\xcc\x13>w\xd7\x08>\x17\x13Q\xbb\x9c/d>1\xe9\x8c=tG\xba=\x19\x83\x0b;\xa7z\xcb>\x84\x13@>\x13s0>\x157\xb0=ks >7\xc9\xc4='
-p204
-tp205
-bsV504246296929386496
-p206
-g2
-(g3
-(I0
-tp207
-g5
-tp208
-Rp209
-(I1
-(I200
-tp210
-g12
-I00
-S'9\xd0\xcf>Bf\xf5=\xb4\n\xdc\xbe#\xf2\x08\xbe\xdd\xf8\x1c>\xbd\xc0\x05=\x96\xb5\xae\xbdn\xd2>\xbeep\xfa\xbc\xee\xb0j>\x9e\xe0\x1d\xbc\xf3\x8d\x1f\xbeLRG>\xecO\xd7\xbc\x1b\xd4&\xbd\xa9n\x95>\xf5f\xf9\xbd\x05\xaaQ\xbe\x00\x12\x14\xbeWqV<o`\x81\xbe\xf7\xfd\x0e=\xca\xa2\x16>\x9e\xb3B=\xdcfD<m\x18\xd5\xbd\xcdu\t>\xe4\x99\xb0\xbd\xd0H\x92\xbe\xec\x85\xde\xbd\xa2+\x12\xbd\x0c\xea\x9b\xbd)9\xf3<8\xc1\x8a\xbe\xe9@t=\xfa\xc8\x90>\xb4\x8eE>\x94\xe5\t>8=\x84>\x0c3\xfa=|+\xcf\xbd?\xf7\xb4\xbc\xf7o\xdd<\x9c\x86T\xbe\x14\xb0\xdc\xbd\xce\xc8c\xbd0\x96\xd1>\x12DW\xbcz\xdb\x99=\xf9\x06\xf1>\xe6\r\x00=2\xb3\xa2>\xed\x13<\xbeg\xd0\xe7\xbb\xde\xdc\xb1\xbe\x0f\x8a+>\x1e\xa6\xef=\x81DH=\xdc\xaa\xe9\xbe\xd5\x8e\xae\xbeH\xa0\x8c>\xc7\xae\xcb>\xf2/y=|\x0e<\xbe\x94Bv\xbdrY$>,\tH\xbeY\x1a\xa9>$\x92=\xbe\xeb\xe4\xdc\xbd\xb2m\xcb\xbe<\xb8\xa9\xbe\r\n\x1f\xbe2kq\xbd\xd9\r\x7f\xbe\xc0\xab!\xbc\xbb\xf2\xbc=<@ >\x9bE\x0b>h\x91\xd5=\xc9\xdb\xde\xbb\xd4\x85\xe3\xbc\x0c\xb1\xc3>\xa8W\x82\xbe\xb4\xe50>\x0bpR>\xe5^\x15>\xa8\xdfY\xbe\x19\xd4\xca>p(\x98\xbc\x88+\x81\xbehnc>\x1c\x17\x98\xbe\xc2\xeb\x9c:\x01\xf3O>\xbe;\xf2<Bt\r>iK`>\xdb\x04\'<<\xc4\x82\xbd\x05S\x99\xbd\x02sc>OV(>\xe2.\x17>w\xaf\xb3>\xd4\xecz\xbe;\x96\xc4=A}\x92>e\xd4\x1f=\x13<\xcb\xbd\x15\xf9\xa4\xbeN\x07\xa5=p\xd9\x8c>\xab\x80\x19>@\xbb\xf5=\xe2\xb3\xe4\xbd\xbd\x83\x92\xbekjP>\xc3\xef\x99\xbd\x12\xb7\xdb=\xc2\x07\xcc>t\x80\n>\x8b)\xfc\xbdg\x18\xd0<:\xde\xc9\xbd\xa5(c>M\x85\x1c\xbe2\x17D<\xee\xd5x\xbb\x8cr\xc8\xbcd\x0c\xfb=\x0e,F>-Z\x91<\xb6U\xc5;u\x8e\xed\xbd&O\xc2=5x\x9e\xbdk\x9b\x00\xbe\x08\x9e\x04\xbe\xe8\x10\x98=\x1e\xa8*\xbe\xd2e\xb9=E<-=\x00\xe7\xa9\xbe\xc9\x1c\xa0>o$\xc8=\\\xe1->ND\xd3>+\xb2.\xbe\xfc\xf7\xa4\xbd\xee\xfc\n<t\x13\x05\xbe\xd0 \xba>enr>\xe7\xf6\x91\xbd4\xe7\xa6>[d\xaf\xbd\xbc\xb6\x99=\xb3\x1c\xc9=\x17C\x84\xbep\xdd\xd8\xbd\xd1\xe9\r\xbe\xb5Rt\xbe\xd4>\x80\xbej\xc2\\=pJ\x19\xbe1\xff\xd3\xbe.\xef_>\xa2I\xde=CS2=\x04\xdfW\xbb\xf7\xa7\x06\xbe\xbc\xed\r\xbe\xebb\xe2>\xcc@\x94=\xe40\xbd=\r\xed\xad\xbe\xb2"\xf1\xbe\xf5\x02!\xbc\xceoD>\xaeJ\xa1>)?\xe6\xbdD\xccZ\xbe\xe0y\x9d\xbe\xbcg|>Es\x8f\xbd\xa4\xcf1>\xe4\xd7\x86\xb9U\x07\x7f>\xe6\x8d\x00\xbdl\xdc\x16>\x0f\x83\xa9\xbc<\xeak>\x87.0>\xd7s\xe9>\x15\xfd\xa9>\xf4\xe7\xa8\xbb5\x14\x93=N8\xc3=\x91&\xae='
-p211
-tp212
-bsV504256531198930944
-p213
-g2
-(g3
-(I0
-tp214
-g5
-tp215
-Rp216
-(I1
-(I200
-tp217
-g12
-I00
-S'Ru\x05?\xee(\xc8\xbd\x86\xb6?\xbf\x88\xdb\xe2;\xfb\xb6\xd2>\xa7\x91\x1a\xbe\xb5\xd9\x16>i\x82\xa0\xbe(\x06<=\xf2up=E\x90$\xbd\x92.\x00>w\xd7\xa7>\xb68\x98=\x83Ne\xbeV&\xd0>\x0e\xbf\x8c<\xb6\xdb\xc3=9\xc1\x94\xbe\x99\x8f\x84;K\xb3\x81\xbe(d\xba<\x01\x18\x8f>\x1d\x89\xbe\xbeC\x80\xc4;\x80\xce\x90\xbe\x99M\x9b>UOu\xbe\x83\n^\xbey\x8d|=\xebL\x1d=I\xe1\xf8\xbd\xd8e\xcf=\xdd\xe3\x16\xbf\x02\xe50\xbe\xc1\x99\xa9>k;\x00>zD\xc1>\xda\x9f\xda>V&\xaf\xbd\xa0\xc8\\\xbe\x87\x96\xc7=K\x15W>W\xfd\xd6\xbe\x99t\xab\xbe\xd7\xfdu\xbe\xe6\xc8\xfb>m\xef\xe9\xbd\x81\xac\xb7=C\xb6"?j\xc99>\xcb\xe2:?\x83g\xb0\xbe\x06t\x89>7\x9b\x8a\xbe\x0f,\xcf>\xc7\x1e\x0c>\xeb]\xc8\xbe\x12\xf5c\xbe\xf2\xd8+\xbf\xe1\x85\xb1>\xd6\x18\xea=\xbc\xc0\x8a\xbd5\xccg\xbe\x8dF\x81>B\x87}>w\x8d\xc3\xbe0\x925>\xf7H\x93\xbe\x85\x1fX\xbe\xe7q7\xbfY#\xae\xbe\x81u7=\xde9y\xbeg\x0f\xa2\xbe\x82\xe10>\xbe\xf5v>5Y\xcc<\xfb\x91x>\xf8@\xbc>\x9d\xd7W\xbe\xb7\x8aL>\x91\xb0\xbf>\xd8\x86\xc6\xbdbV\x88=\x9d\xfbx>H\xe9\xcc>\xff\x87\x1c\xbf\xab\x90H?\x0fT\xb3\xbdTG\x05\xbf\xb2t?>\xc5\x13\x00\xbfY\xb9\t<\xd0\xf6\xf2>\xfe\xe8\xa4>)\x0c5>\x1aT|>8o{>\xd8u\x1f\xbe\xab\xed\x8b=\x96O\xd4>!JM>\xdd \xcb>\x08\x90\xb1>\x9bu\xac\xbe\x9f3h==\x82\x87>-p\xa1=\x92\xdd*>\xeb\x98I\xbe\xae\xb0\x0e>v*\x96>w\xe3\xe3=\xf6\x98}\xbd\x07\xdd\xa4\xbd\xder\x14\xbf\xc0m\x08?7\x82R\xbd\xd7\xb35\xbd\x05S1?V\xf7\xd5=g\xa9\xb5\xbd\xfb\xe2%>\xee\x12i<\xcdp\xdb>\xb6\xf4\x84\xbe\x9b\xa9\x94\xbd\xe2V\xb0=\x1b\xec\x92=\xc3\xf9\xaa>B\xe7\x90>\xde\x83I>e?\x88=\xe2\x0c7>\xd6K\xe0>\x8aq\x0b\xbd\x16\x0e.=\r\x07\xae\xbc\x8a\xf0\x1f>\x0e-\xc7\xbe"\x97\x0c?+\xb2\xcf\xbd{\xa92\xbf9\xe9e>F\t\x99\xbe\t\x87\xa3>\xd1*\xec>F\x1d\xfd\xbdq\xee\x9c\xbc\xf2U>=;\x01t\xbd\x1e\x82\xb8>A%\x88>@*g>Q\xc1.?\x0f\xe5|\xbe\x8a\x8c)>\xf8\xe8<>U\x8b\x85\xbe\x95C\xb7=_\xa6\x9e\xbe\xf8{\x17\xbfX\xed\xb9\xbe\x08`\xeb= \xa7R\xbeq\na\xbf\xa7F\xb9>\x8f\xb9\xf3\xbc\xd5\xf2\x8a\xbc\x84\xd1\x8e>el\xa4\xbe\x83\xe4\xc0\xbdp\xd4.?\xc0\x1d\xd5=\x16\xfd\x17<\xc7h\x9d\xbeY\x11%\xbfi-e>\x92_<>iT\x0c?N`\x07\xbd\xebOk\xbe\xb2\x93\x1f\xbc\xe9(\x83>^n\xe4<\xff\x9e\x11?\x01\x037>\xab-\xae>\xcd\xe3\xa1\xbdC\xed\xdb>\x88l\x1d>\xb9\r\xd0>)9\xa7\xbcs22?\xabO\x9d>\xb2\x16Q<]\x90\xc9\xbc\xa2\xf5J\xbd0\xc5+>'
-p218
-tp219
-bsV503963528517402625
-p220
-g2
-(g3
-(I0
-tp221
-g5
-tp222
-Rp223
-(I1
-(I200
-tp224
-g12
-I00
-S'\x85\xed\xf3>\x95\x95L=jz\x07\xbf\tKR\xbc\x05\xeba>6[\x14\xbcd\xbf\x82\xbb`\x9cr\xbe7\xd6r=d\xe0x>\xc7\xf3\x97\xbd\xd8\xa1)\xbc\xabf\xb2=\x0f\xa3Y\xbd\xab\x05;=\xf0F\xcc>\xefAs\xbd@\\\xe2\xbcc}\x9f\xbedt\x1d\xbe0\x83<\xbei\xa9`\xbc\xbd!\xa2>`\r\x8f=\x0cX\x07>/\xa7_\xbe\xed\xd4q>\xb7\xa7Y\xbd\xaf\x08c\xbe\x08_P\xbeN\x84\'\xbd\x1d]L\xbd\xfd\xbdS<\x87\x9c\x03\xbf\x91\xafn<{u?>\x7f\x91j>\xc6)\x8e>q\xba\x9a>o\x85I\xbe\x03`\xa0\xbe\xc3\x92a\xbd\x88\xeav=s|\x0e\xbeh\xc3f\xbe\xd3yF\xbeD\xcb\xd8>\r\x00r=\xa4`#>\x00s\n?\x1b\xd9C\xbd/\x1e\x0f?q\x10y\xbe\xdf\x1e`>\xa3S\xac\xbe\xb3\xc6\x16>!\x0e\x85=\x03\x0bY\xbe\xb43\xcf\xbeu\x00\x00\xbf\xa8np>\xa3\x0b\xf0>\xc8.Z>\x03\x83T\xbe\x11\x07\xf7=\xc8\x02\xb1\xbc\xef}\xd1\xbeHF\xd7>\xf0\x94\xde==\x98B\xbeK\x82\x06\xbf\xaf\x16\xd3\xbem\x001\xbeG|\xbe\xbd\x15\xd9!\xbe\xeb&\xed\xbb\x12\x0f\x91=\xac\xcb\xb5<\xbf\n\xa6>\x8bF\x80>\xfc\xaf\x8f\xbd\xe9\xe1\xf7=)\x0f\xc4>\xc3\xb3b\xbe\x8b\x04\x8b=\xc2\x1d\xa5=\xc0\x83\xb7>x.\xc8\xbe\xbc\xac\x17?g\x921\xbeu\x96\xe5\xbe\xc4l\xf4=\x95\x04\x97\xbe\xde\xe1\x1d\xbe\xef\xb0\xab>\x98G\xeb=\xe5\x07\x95>\xcc\xdeD>\x99K5>p\ru\xbe4\xf7\xb6<\x89\x13\x85>E\xe4>>\x9f\x82\x95>\x8c\xe1\xba>Thw\xbe\xeb\x02{\xbcW\xa5\xbc>]T\xa3<\xafN\x8c=\xcc\x1d\xe1\xbeK\xde\x96\xbd\xf3(\xaf>Y4\x83=/\xf5\xaf\xbc)\xb1A\xbd\xd7\xe0\xe4\xbe-\xe3*>\x106~\xbc\xe8xS\xbd\xed\xac\x1a?W\xbfP>G\xb3\x0e\xbd\xe6L\x17>\xc1\x8a\x8d=L\x95\x9f>a\xca\xe9\xbd4\xf0\x1e=3\x8e\x18>=\xd78>\x1bla>\x94\xf4\xb6=\x08\xfcZ=%cJ={\xfb\x1c=\x8b\xa4w>o\x0f==<p\xee=w\x0c\xa4\xbe(\xe3\xab<C7\xab\xbe\xbd\xcd\xa2>|\xb6\xf5=\xa1\xc9\xf9\xbe]\xe1\x91>F8\xa3\xbc\x94n\xac=\xfc\x04\x16?\x11\x9b\xe1\xbd\xf3\xf5\x9d\xbc\xe1\xdc\x91<\xa0]\xe5\xbd\x9f\xf5Z>\x8d\x13\xcb=G\xc1\x89<\xe0m\xfc><\x82\x9c\xbe\xe5>\xc5\xbb\xbb\xbb\x16>\x10\xc4\xbc\xbe\xd7\xd0\xc5\xbd\xab=\x93\xbeK\xfd\xfe\xbe\xc1\x1d\x7f\xbe\xc9\x94/>\xfb\xc2s\xbbH\xa7\xfa\xbe\xa9\xd7\xcd>W\x80J=\xb3\xf2\xbf\xbd\xa17\xcd=\xd9P6\xbeRN\x82\xbex\xc0\xf1>Km\x13={\xc0\xfe=\xa8\xe7m\xbew\xc7\x0e\xbf:\x80\x9c>\x14\xfd\x1e>\x1b\xfb\xc0>+\xbb\xd8<Q)\x85\xbe\xc0\x95\x14\xbd\xac\xde\xc0>"\xe9\x85\xbb_,\xb1>\x85\xb0\xcb=\x96\x07\x83>E\x90\xbe\xbc 5\x9a>\xbd\xc5\xd2<)\xb6Z>$\xd8\xc5:W\r\x1d?\xd9\xa9\x8f>\x1a\xc4\x8c\xbc\xd2\xf0\x14\xbd\x15\xe2\x9a=\xe9 \x82\xbd'
-p225
-tp226
-bsV503978270182764544
-p227
-g2
-(g3
-(I0
-tp228
-g5
-tp229
-Rp230
-(I1
-(I200
-tp231
-g12
-I00
-S'\xb6\x9b\xd8>\xcb\xbd\x12>\x11\xba\x01\xbfZ\xa2\x00>>\xec\x03>^\x82#\xbd1x\xa3\xbdX\xd7\x8c\xbe:\xe9\x85=Z\x8eu>.c\x0f\xbe\x11\x96\x00\xbe\xadv\xa2</\xd1\x90\xbd\x85\xebY>\xd6 \xe4>\xba\xfe\xda\xbdi\xf46\xbef\xfaw\xbe\xe6?1\xbe\xa4\xca\xa1\xbd\x00\x9d\xef\xbd\r\xdb\xa0>\x14\xe1\x1e>\xb6\xd8\xbf=\x1a\xb6\xb5\xbd`.G>c\xf6\x89<k\xe2b\xbe\x8bN\x7f\xbe\x7f\xeb\x84\xbe\xfeKw\xbcsV\x97;\x07\x92\x11\xbf\xf6v\x89=\x0b\xfc\x9c>\x99\xee\x91>P\xc5\x87>\x9a\x87\x9e>?\x9e\x18\xbe\x9e\xf6\xb2\xbeU\xc0\x0c\xbe0\r\xef\xbd6\xab\x85\xbc\xe8_\xd7\xbe\n\x8b\x1b\xbe\xf5\xe7\xca>\x0740>\x8e\x13C>jS\x06?\xc2\xfe\x98\xbd6d\xdc>\xef\xe7%\xbe>{\xc4=GY\xbb\xbe"\x0c\xbc=Wb\xb7<=\xf8\x07\xbe2\xd8\xfc\xbe\x95\xd9\r\xbfCr\xe1=\xe6\xf9\t?\xf0W\xd8>&\x11m\xbe&\xd8\x17>\xa0\x8b\x83=\xe4\xf8\xb2\xbe;\xbb\xd6>\xce8\x96>\'\xaa\x95\xbe%T\x12\xbfN\xa9\x16\xbf5\x8a\xdd\xbe&Y\xae\xbd"\x05\xed\xbd\x15\xd4\xa7<\x03\x1c\x18=\xf5L\xda=6<\xf2>\xe6\xfa\x98>!L\x84=\xf2\xbb >\x90&\xdb>\xfbW\xb5\xbe\xc3\x0b\xa0=\xba\x8d\x94;\xea\x94\x9a>\xfe1\xbf\xbe.h\x11?\xf0|\x80\xbe\x8e_\xd5\xbe&\x9af>\x96\xdel\xbeu9\x80\xbeT\xcb\x85>\x0c7\x00\xbdjY\xdc>\x86^5>T\x11>>\x98\xbf\x83\xbez\xca-\xbd\x8a#x>b?L>\x85\xb7\xb4>\xf7}\x13?r\x8a\x91\xbeN\'\x85\xbdK\x1d\xde>MC)=\x02\x92\x95\xbd)\x9d\x01\xbf>\xfc\x05\xbe\x1a\x1b\xc7>\xdb\xd1`>T\xd7\x18>\xf5xw\xbd*\x1e\xe8\xbeBt\xb2=\x85\xd3\xd2\xbd\xde4 \xbe\xec#\x11?\xd3\xc1\xa9>\xc2\xd1)\xbc\x81v\xcc<\nVs;\xcd,\x8b>\x02\xfe\xd9\xbd\x7fc\x1c>z\x97\x01>TO\x9a>~g\x1b>bj3>[\xcc\x15=\xf0\x08\xd6=\xb3|$\xbe\x92Q\x11>:2]\xbcS\x05\xfc=*\x00\r\xbf\x15v\x00\xbeV=\xbd\xbe\xder\xc9>\x8b\x8b\x81>\x08\xa4\x01\xbf\x82\x05\xa6>\xc5\xeb\x0c=\xc6S\xca\xbcj\xb8G?\x13\xd0\xac\xbdR \xcb\xbb\x88\xcek=\xd6\xc6\x9c\xbdrfg>$\x8f+>\xb0\xb0\x9c\xbd\xd2\xfb\x10?\xf1\xbc\xb9\xbe\xfe\xcd\xcd\xbc\xf3\xffP>\xf5\x99\xf0\xbe\x82\xe2c\xbe\xc2\xaa\xc1\xbe\xb9\x81+\xbf\xea\xe4\x8c\xbe\x11<\x8b=\xb9\xab9=hy\xf3\xbe\xbd\x9b\xea>\xfb\xd8\x04>^\xff\x0e\xbe\x15^J\xbd;\xc6\xc9\xbe\x16\r\xcf\xbe5z\xc7>\x8by\xa5<jst>\x86\xaaw\xbe\xa4\x15\x19\xbf\xe5\xbd\xbd>M\xc91>\xceb\xc8>\x8fo\xb6<\xce\xa6\x86\xbe\xf0\x1bb\xbd!*\x02?\x00\xd2x=\x01\x12\xbb>\x9f\x1e\x0f>\x06\xe6\xb0>\xf2\xde\xc0\xbd\xab~\x94>\xf7E<=CIi>\xa3\xd3\x12>&\xac\x1e?\xc1\x1e\xbf>z\x7f\x8f\xbd\xf6\xfdM<\x8c\x83">\x9e\x85\x8d\xbe'
-p232
-tp233
-bsV503976994447818753
-p234
-g2
-(g3
-(I0
-tp235
-g5
-tp236
-Rp237
-(I1
-(I200
-tp238
-g12
-I00
-S'\xaax\xc5>\x10g\x9e=\x08\xa1\x8a\xbe\xc6\x17o\xbc\xa0\x8eA>\xa5\xf1\x9e<Y\xaa1\xbd\x05\xf0g\xbe\xb8\xcb\x95\xbdXEr>(\xb4\x98<\xb8\t\xb4\xbd\xcc\x00->\xd62\xb2=\x83\xdc\xb9\xbd\xc6\xfa\x91>n\xcc\xa3\xbd^\x88\x94\xbd"M\x10\xbe\xdd\xc4\x89\xbd#\x89\x04\xbez@\x8c<\xb5\xb7(>\x10\x8a\x80\xbd\xc2\x1c\x81=\xcd\x8b\x87\xbd\xd0T\xab=\x91\xd6\xaa\xbd\xda\xccg\xbe\xd3tU<\xd4\xd7\x80\xbd\x03\x9c\xd4\xbd\xce\xed\xeb=\x1f\xe7\x85\xbe\xcd\xc2\x93=U\x0c3>\x8e\xec;>\x8dp\xf6=b\xfbW>b\xcdO=\x1e\x84\r\xbdZ\xebZ\xbd2\xf6.>m#c\xbe\xe0\xe1\x92\xbd\xd0\xa3\xe8\xbc\x98r\xa5>\xb2\rJ=N2*=j\x99\xc9>\x9a\xd3A\xbd9\xd3\xb4>\x8e]\x05\xbe\x0e\xe2\x9c=V3\xce\xbe\xd7\x03\x9a=\r\x0b";\xc0k\x0b\xbc\xa8|\xe2\xbe\xce\x00\xa2\xbe\x91\xff;>\x1a\xa82>p\xb3\xb0=0n&\xbesI\xa1\xbdm\xf5\xca=c\xe5E\xbeJ\\\x84>s\xd0\xd5\xbbN\xa0\x1e\xbe\x00f\xca\xbe0od\xbeu\xbaQ\xbd\x858\xac\xbduH\xad\xbd\x86\x19\x9d=B\xaa\xe8<3\x8d\x04>Mf\xf9=\xe82\xe2=\xd9.\x1b\xbd\xeck\x93\xbd\xa6\x10\xa1>\x02\x81B\xbe\xe4C\x0f>]6\xe8=\xfa\x96\x82>\x90m[\xbeJM\xbd>riQ\xbd\xec\xc4\x1d\xbe\x8a\xe2[=\x07-\x81\xbe\x1e\xee\x7f\xbdsiY>\x86[\x9a=\xca\xa2\x1c>#\xba\\>~\xe1\x00=\xf0\x89\xe5\xbd\x01\xb4(=XEY>@\xa8\x02>\x07\xc7\xca=\xe7\xbf\xa8>\x90S\xe5\xbdB\xf4&=\xe2M!>H\xf6\x16<\xad\xba\x00=U\x05U\xbe\xbb\x90D>\xa0\x8f^>\x92\xbc\xa9=\n\xa1.\xbc*\x03\xe2\xbc`5c\xbes\x8el>\x93>\x8d=N&\x89=\x15\x93\xc8>\xf6\n\xb3=\xaa\xba#\xbdB\xb4\xb6<P\xeb\x7f\xbd\x05\xf0/>sN\xd9\xbd\xa4\xda#=}i}=\xf2\xaf\x93=E\xe4\x13=Zn\x8c=\x84b\xc7<\x9f\x04C=\x02\x92\x88=4\x11J\xbc\xc8\xc2\xe8\xbc\x1a\xa98\xbd\tZ\x93\xbd\xac%\xaf<\xd6\x8c\x11\xbe\xc6m\x13>\xeb\xf2\xe6=[Cm\xbe\x06\x12\x91>\x9e}"=*\xf0\xbb=oe\x84>}\x8d\xcb\xbd\x0cK\xa5\xbcX\xbb\xe8<b\xd5\x07\xbe\xed\xc4p>&5\x18>\xb0\xb5\x7f\xbc\x9d.R>\xe7\x85\x93\xbd\xcez\xb7=8f\x03=N.\x82\xbe\xb8|"\xbd\xab\xdda\xbe\xb5\xe7\xa5\xbe\xda\xa3\xbc\xbd2d\xc2=\xd3\xa4"\xbd\xb5.\x90\xbe\x12.f>\xd1)\xa2<\xa8\x82\xda\xbd\xea\xf2\xc2\xbc\xd4\xe8,\xbe\xdd\xfc^\xbd\xd2&\xbb>\xfb;\xb7<m\xa9\\=\xc9\xe5\x8d\xbe\x81\xe1\xbd\xbeTy\x94<\xc3\xe0\x0b>\x96\xb2j>S\xb1\x18\xbc}\x05\x1b\xbe\xb8%\xa9\xbd\xd85q>\re\x1d:\x1bX\xd3=\x8fOH=R\xb8J>\x8a\x90\xd9\xbd\xa2\xf7G>]\xa9[\xbc\xd5\xef\xeb=\xadd\x08>k\xcf\xdd>\x85[i>\xf5\xc6\x18\xbbG\xba\xa7=Kt\xd3=\xa2\xa9?>'
-p239
-tp240
-bsV503962195882156032
-p241
-g2
-(g3
-(I0
-tp242
-g5
-tp243
-Rp244
-(I1
-(I200
-tp245
-g12
-I00
-S'\xc1\xc6N?\x07i\xc7>>\xdaD\xbf\x9e{\\\xbcY\xbf\x12>O\xd9\x8e=\xb6\xd9\xd8\xbdNf\xda\xbe\xc0\xb8n=\x04\x9b\x0e?\x91\xa7\x9b\xbe\xf7\xb1\xc7\xbe\xc1\xfa\x90\xbc\x80\xceb\xbe\x9f\x85t>\x8d\x82*?Np|\xbe\xd5x\xee\xbe\xf8i\xd5\xbe\x84\x10\xa2\xbe\x81\xf0.\xbeV\xbcO\xbd\xba\xf7\xe4>\x04\xcd\xf4>Y\xfcy>\xb2;2\xbe\n\x11\xb4>\xd6l\x03>\xfd\xa4\xef\xbeC\xea\x1c\xbf\xf6\x90\xc2\xbe\xb5\x8e\xa4=\xfco\x0f\xbe\x88\x03e\xbf\xd7\xba\x1e>\xc4>\xe8>f\xae\x06?\x87\xe2\xdb>TL\xf1>\x95as\xbe&m\x10\xbf\r\xc8P\xbe\xa7\xaf\x02\xbe\xec)\xd2\xbb\xf8\xa6\x1c\xbfm\x08W\xbe\x8d\xd9\x0b?r\xfe\x88>\x8c\xa7\x90>~m~?\xa4\xe5\xce\xbd\x80@\x1e?\x84\xba\xb9\xbe\xc4A0>\xf4\x0f+\xbf\x03\xca7=\xcc}\x03>\x04g\xe7\xbc\x9f\xeb_\xbf\xd7}[\xbf\xe3\xfe\x9b>\xb1\x1c\x91?\xb8(D?\xc3\xe3\xae\xbe\x9fI?>+R\x7f<cG\xf7\xbe\x00\xf3]?\xf1\xd0\x19?\x06D\x02\xbf\xab\x9e:\xbfM<c\xbf\r;+\xbfLq\x06\xbem\x8a~\xbe\xcf^\xd0\xbd\x80J\xbe\xbcG\x10\x12>x83?\xe0s\xcf>\xff]\x1d>\x9d\xd6\x0e>3~<?\xe7\x1d\x08\xbf\x13@\xe0=f\x87\xcf<\xf4k\xbc>\xadF\xe2\xbe\x14\xd7@?\t\x90\xd2\xbed\x92\x14\xbf\xd9L\x9d>\x07\xb5\x94\xbeb\xec\x04\xbf]!\xaa>M\xed\xcf\xbcW\xcc\x1a?\x8b\x13\x9d>^km>/\x87\xc0\xbe<\x9f<\xbe&\xac\x8b>\x14\xd8\x80>\x9d\xbc\xf1>U9N?\xe3\xe1\x04\xbfM`D\xbd\x08\xb8U?\xbd%\xd7<\xd7g\xec\xbdQ\x84\x81\xbfQ\x9d\x8b\xbe}\xa55?=\n\xad>\x01n\x8c>\xad\xc9\x13\xbe~%7\xbf\x88\xa65>\x02(*\xbe\xfa\x85D\xbe\x08\xd1K?v\x19\xe3>\xa4>\xdf\xbd\xbdE\x96=\xfcZ_;\xb7\x15\xba>\x86Rc\xbe\xf7d\x97>"\xc2`>\xbdJ\xa2>\xddS[>\xec\xf8z>\xadd\x14=>\xb4\xf2=\x93\xb6\x9f\xbeCI\x86=\xa0f\xb6\xbc\xb71\x03>\x8c\xcc\\\xbf\xd7j[\xbe\xcfv\xf4\xbe\xf3\t\xdc>\\)\xfb>A\xc8=\xbf7\x07??7h\xbe>4\xfc\xd8<B?\xac?*\x91\xaa\xbd\xb2rf;f\xb2\xd4=Z_R\xbe\xf9[\xe0>\xa4\xe5\x8d>\\\x04-\xbeg\x9dF?r\x84\x15\xbf\x1f\xfe\xb3<\x8b\x91\xb3>\xbda@\xbf&\xb1\x00\xbf\xe8\x89\x19\xbf\x9f\xd6w\xbf\xe8\xcc\x10\xbf\xb84t>)7\xc3<\xbd|H\xbf`n\x15?\x1c\xb2\xab>\x91\xdc\xd9\xbdy\xd19\xbd-\xbb\xfd\xbe\xd9\xa0&\xbf\x01\xf7\x1a?\xe6\xee[=\x9c\xe0\xf3>RX\xc3\xbeF\\\x85\xbf\xf5\xb2\xf9>\xd3\xddW>\xa1+\xfb>\xceh\xf7\xbb\xcbM\x0c\xbfM7\xa0\xbe\x99\x8dX?\xf9\x1b@\xbd\x84\x1d\xbf>Y\xb9I>\x9f\x9f\xe5>`mV\xbd\xe4\xd4\xbe>\xe8\x0e\x8a\xbb\t\xcc\xb1>}\xe7Y>\xe7\xcfu?.D\x1e?\xbc:N\xbe\x7f\xad\xba\xbc\x06\xb3\x93>\xb3>\xc0\xbe'
-p246
-tp247
-bsV503971484860428288
-p248
-g2
-(g3
-(I0
-tp249
-g5
-tp250
-Rp251
-(I1
-(I200
-tp252
-g12
-I00
-S'|\xb76>\x13F\xc5\xbd\xc6\xf6\x96\xbe\x9c\xc6\xe6=\xd8O\x87>\xefM~\xbd\xfeM\xc6\xbd\xb4\xa7\x82\xbeS\xa5\xe4\xbd\xc0Z\xfe=\x17\xf1\xed=HDo=\xde\xf35>\xacD\'>\xe8N\x01\xbe\x18\x16\x99>\xba\xb3\x7f\xbdU\xb9\xb2\xbc\x7fU\xe5\xbd\x12\xb6\x98<\xf9M\x1d\xbe-C\xc6\xbdF\x90\xa4=\xac\xee\xa0\xbe\xa3\xce\xb4\xbd\\\xe3\xe0\xbc\xa5_\x1f>Iwp\xbe\xae\x1b`\xbe\xbe\xacj>G\xda\x15\xbe5\xc7O\xbe\xc3\x99h>\x1f\xa3g\xbe|\xb7"=Xg\x9d>.\xd8\x00>P\xf4\x92=J\x13\x86>\x18\xd3\x17>8o\xb0\xbc\x03\xb2\xb1\xbd\x8e#\x85>\x86m\x84\xbe\x05\xdd\x0e\xbeJ\x1b9\xbct\x8b\xba>\xa5\xc4\xc1=\xbat\x93=\x0f\x17x>\x08\xccs=*Z\xb9>@\x84A\xbd\xf1,\xff\xbc\r\xb5\xe6\xbeR\xc28>\x81,\x05\xbe#\x98\x0e\xbe*X\xcf\xbe\xf8\x8a\xb5\xbeO7\xfd=\xd8\xd6\xf2\xbcF\x86\xe2\xbc<X\x84\xbe\xb5\xb1Y\xbd<pj>\x0e\x8fK\xbe\xa8\xf2e=\xd5B\x8d\xbe\xc0\xbe\xd8\xbda\xc1\x00\xbf^\xaa\x7f\xbe\x9fMG=LD\xe8\xbd\xb8\xf6\x01\xbd_\xa0\x96>\xf26\x9e>\xceP\x08>&\xef\xd6=\x9f\x868>J"c\xbd\xd4r\xa8<}\xa7\x8b>u@y\xbe\xb7\xe4#>=\xae6=(K\x86>\x8f\xbe\xbd\xbe\xfah\xfb>&\xb0\xed=/\xb2\xfb\xbd\xa7%\x0c>@\x94O\xbeH\x1b\xbc=\x1fg\xb3>.\x07\x1c\xbd\x8c\x95\x17>l Q>\x86\xfd\x1a>,\x14k\xbc\xe4\x98\x1c>\x15i\xa0>;\xdd\xa0=\x8f\x01#>8\x8b\xdd>\x1drD\xbe\xc3~\xae;#\xb5\x8e\xbd\xb2\x18\xd8=\x00\x98\x07=\x0bJ\x19=Q\xab\x9f>\xd3\t\xd4=\x05>5>\xaf{\xe8\xbc\x1c>\xec=\xfa\xacn\xbe\xc3\xc6\x8c>\x0c\x12@=\xc6\xed\xc6=\x95m\xfd>`)\x91=6\xb9\x11=\x865\x03\xbeCy\xc7\xbd\xd8\x11Z>\xcc,\xe4\xbd\xbe\x0b\x95\xbd\xfa\x91\x97=p\x86\'>\x1a\xed\xc9\xbc\xee,\xb4=\xfc\x9a\x05>S\xba\xe7<\x0e\x19\xa2=\x0b\x8e\xcc=\xc6\x1b\x86\xbd\xb2\xf2b<\xf8\x1c\xca=e\x14\xad=\x01\\\t\xbe\xb7\x80\xc5>q\x99L\xbd6\x9b^\xbe\xfd\x0c\x10>\x06\x9c\n\xbe,\\\x04>&^K>\xa8m!\xbe?\xbc9=\xe4\x0cB\xbc\x18\x12\x1c\xbe\xf0lN>\xd8\xcb`>\x18\xb2\x06<\xdc\x1d\x89>d\xf2\xf9\xbc\x89\xdd\x06>\xd1\x07{=h\x1dL\xbeX\xde;>\x03\xea`\xbe:\x96\xa8\xbe\xd7\xbc\x85\xbd"\xb3\x99\xbd=\xc2\x19\xbd\x13q\x9b\xbe\xa2`\x9c>\x10\x9c>\xbeW\x03\xed\xbd\xdb\xa4\x00\xbdh"E\xbe\xc1\xf4\x98=\x0fo\xc0>r\x93W=\xe6\xca@\xbd\xcdd\x90\xbe\x84\\7\xbe\xd3\x91\x0c=\x9f\xfc\x0e>\x97\xb0\x92>\xf5\x90\xa9=B\x19\x97\xbd\x9f^\x9e=\x1b\xe3\x87>qg\xe1<\r\xf32>\xdb\\U=bG\x83>\x817\x81\xbet\x83g>\xc7Dd=\x80\xa1\xa7=c\xdb:>\xc0\xf7\xa8>\xed~t>\x16ZK>\x89\xe6\x1e>"\x05\xbd=>\x96\xff='
-p253
-tp254
-bsV503958781831942144
-p255
-g2
-(g3
-(I0
-tp256
-g5
-tp257
-Rp258
-(I1
-(I200
-tp259
-g12
-I00
-S'c\xc7\x90>\xf9\x1b\x14\xbeS&\x83\xbe\xb3Ac\xbc\x01\xc4\x83>o\xfd\x8c;\x98fs\xbd\xdd\xb1e\xbeH\x97\xee\xbc\xd7_j>\xb9\xe3\x8a=M\xb7\xa8\xba\xbd\x08A>\xb4\xf9\\=\xdd\xde,\xbe{\xe0\xa5>X\xf2\x8e\xbd\xef\xbd\xe6\xbc[>H\xbe$Lv\xbd\x19\x96\r\xbe$;u<T&\xf5<\x1a\x8f\x14\xbe-\x01\xd3\xbcpO\xe0\xbd\xb7\x89&>\x18\xe1A\xbe5%\x93\xbe\xc5\xc7\xb7\xbc\x17\x8bF\xbe\x7f<\'\xbd\xa0\xea\xdb=\xa3\xe5\xb5\xbe\x17\x0b\xe2\xbc \xd2\x82>i(d>\xa1\xda\xa1=\xc3\xf9e>\xa5\x8b\x85=\xf4_\xdb\xbdIy\x80\xbd\xfbO\x08>\xc3\x99q\xbe\xd3\xe8\x1a\xbe\x8e\xf7\x15\xbd\x95\xcf\xc1>|\x08\x82=\xad?\xb0=\x83\xbd\xb4>F]\x85=\xa0\xa6\xdb>\xe0\xd0U\xbe\x84\xac\x81=\xec\x06\xc7\xbe\x8dnY>\x9f3\xee\xbcK++\xbe\xaa/\xa6\xbea{\xc8\xbe=*B>U\x8c\x0b>\x8bK\xc6=\x18\xb0\xc3\xbd\xa8\xb6\xbb<\xb0\xeeB>%\x1ed\xbe\xb9h6>\xd5\xd6\x19\xbeg\xbdl\xbe\xdd\x9e\x9c\xbe\xb8;?\xbe\x84\xa8_=\xeb;\x13\xbe\xe4\x01\x9d\xbd\xbb\xb5+>\x1f\xf5z>\xfd\xfd\x0c>X\x08m=}\xd0o>y\xee_\xbdd\xd1\xa5;1\x03\xb3>\x0c\xda8\xbe,\x10_=\xbfv*\xbc\x88\xef,>d\xef\xba\xbe0\x00\xf2>\xdf\xb2\x83=\x042Y\xbe\xc3\x16\x81=\xfc\t)\xbe\xb9\xaf\x80\xbbk\xdd\xd2>\xbfd\xe9\xbcl\x19\x1f>\x97W6>\x15\xabS>1\xdd\xa5;\x10\x9a\xfd<\x7f\x0cu>\xe1&\x1f>!7->\x84e\x96>\xf9MJ\xbe,.\xc8=\xb8\x98p=k\x7f\xc9=\x84\xa6+=\x8d\xc9\x0f\xbe\xe9h\xe0=5\xd1\x03=\xbd\xbcS=#\xba\xc3\xbcps >\x11\xb8\xab\xbe\xaf4\x8a>\xff\xa2\x0c=\x85\t\x02<\xcf\xf0\xc7>\x8d\xe3\xf3=\xb4\xe4L=\x05z\xa3\xbde\x0b$\xbd\x8cT\x9e>\xe3)\t\xbe\x8a\xbc\x83\xbd\xbbl\x00=\xef\xe8#=\xf0\x81E\xbc\x83z\x90=\xc3W)>\xeeu\x92:\x90\x01\xec=\xd9\xc2L>\x98p+\xbd\x87EU=->\x87\xbcy\xc9\x10=4\xc0*\xbe\xd9\x83\xa3>\x14\xe7\x1b<P8~\xbe\x0ciB>]\xbf\xc7\xbb\xb3\xfb">!\xe2\xa4>\xe44+\xbe\xe1\xe5\xc6=\xaf\x95\t\xbe\xb1I\x1c\xbe]\x94J>\x14\xff4>\x99\xfa\x87=\x05\xa4\xa1>\x1b\xae\n\xbe)a!>\xa7\xad\xc6=\xb0tu\xbe\\\xadV=\x81\x92\x04\xbe\t+\xd4\xbe\xd9\xba3\xbe,91<\xf5\x81A\xbdA\xc3\xf5\xbe\xeb\xae\x82>\xd4"^\xbekY\xba\xbdS\xb7\x1f=\xc1\xf8<\xbe\xb4\xbe?=\xbd3\xf4>\xd8\x86\n>1F-=$xT\xbe\xb5\xb6}\xbe\x17\'\x7f=\x0c9\xf3=\xe1\xd7\xab>{\xaf\x0e>u\xa7"\xbe\x89\x8d\xa2<8\x10\xa7>\xff\xb6\x93\xbc\xd7\x07j>j\xcc\x13>w\xd7\x08>\x17\x13Q\xbb\x9c/d>1\xe9\x8c=tG\xba=\x19\x83\x0b;\xa7z\xcb>\x84\x13@>\x13s0>\x157\xb0=ks >7\xc9\xc4='
-p260
-tp261
-bsV503971518611988480
-p262
-g2
-(g3
-(I0
-tp263
-g5
-tp264
-Rp265
-(I1
-(I200
-tp266
-g12
-I00
-S' \xe8I?\xe1l\x90>\xea$C\xbf\xf6Q\x95=\xf6Qd>\xd1o4\xbd\xbbx\x95\xbdE\xcc\xaf\xbe\xc1n\xf5=2e\xc5>\x99\x14I\xbe{J\x11\xbe\xdbv%\xbb6L\xe5\xbd/.<>\xeaq\x14?\xf3\xd4\xe2\xbd\xdbPp\xbe\xa3\xf6\xb3\xbe\xd6?^\xbe8\xc70\xbeN\xb4\xf5\xbc\xd1\r\xef>\xf5|,>\xd7\t\x02>\xd6\x9f#\xbe\xd8\x9e\x95>\xf6O7<\xb32\xa0\xbey}\x9d\xbe\x83l\xda\xbd\xfd\xe9\x0f\xbd\xb6A\xda\xbc\xb0\x9c/\xbf\xbf*\xb5=\xae\x1c\xd3>RW\xc9>\xe3\xfc\xd9>\xa0$\xfc>7=n\xbe\x8bK\xed\xbe\x12\xdb\x06\xbe>\x1f/<R\xe2\xfc\xbd\xd2\xef\xf5\xbeN\x82f\xbe.\'\x15?\xf6\xd8\x04>\r\x8dM>\xe2@[?\xeb\x10\x9b\xbdI4(?\xbb\xbc\xb2\xbe2\x0e?>m\xdd\x0f\xbf\ro\x1a>\xeb9\x1c>v\x8d\xeb\xbd\xf8\x01<\xbf\xb7n9\xbfy\xb2\x86>zHN?\xb1g\xed>\xc5\xd6\x8d\xbe%\x1f8>>\xe6\x03=\xb1\x8e\xf8\xbe`\xa22?\x91\x1c\x99>\xe0\xb2\xb5\xbe\x08%N\xbf\x7fK9\xbf\xa3\xc0\x01\xbf\xb9\xd2\x13\xbe\x0b\rg\xbe\x0ef\\<\xb2\x85\xc1\xbc!!\xd6=\xc5\x07\x0c?\xb7\x9e\xac><g\x01=UX\xd6=\xd8\xca\n?Nm\xd9\xbew\x1c\x03>V\xed\xd7=\x00\xa4\xed>\x9f[\xf0\xbe\xd9i=?\x94\xe7\x89\xbe\x13\xe5\x06\xbfY\xac\x9c>`\xfb\xe0\xbe\x00\x1c\x98\xbe\xfb\x91\xbe>\x82\x17\xf6=\xef\x13\xf3>\xd1\x83\x8b>\xf3\xcbB>\xb3L\xc5\xbe<\x8a\x8e\xbdWA\xa2>\x16|]>\xe13\xbe>\xaf\x80+?W\xa9\xd4\xbe`\x8aA\xbd0L+?\x97\\\xcc\xbc\xab\x02\xcd\xbck\xc9I\xbf\xa9\x83\x14\xbe\xb7\xf1,?"\xf8\x8b>\xae,W>w\xa4;\xbe\x0f\xf3!\xbf\xf2\xbdd>\x97\x07\x85\xbd\r\x9e\x1a\xbe>\xee>?3\xeb\xbb>\xe2\xae\x18\xbe\xf3\xfa!>MV\x83=9T\xaf>\xfdk^\xbew\xa5e>\nJ\x1e>2\xe1N>\xfb\xa9\x97>n\x16\x83>\xd7&\xa3<\xed\x03\x8d=\x9b\xa6\x03\xbe\x91\xf7\xbc=!\xa5\xf2<\xfd\xf2\xe0=\xebk(\xbf\x9eY\xde\xbdg#\xd9\xbe\xc3L\xc0>n\x1b\xaa>\xfe\xef7\xbf\x19\xaa\t?\xb7J\xb4=\x02*6=\x00;~?!w\xa4\xbd\x8e+\x88\xbc\xf2\xc9:>sJ\xa9\xbd\x980\xad>3;L>&\x8f\x1d\xbd\xd5f1?Q\xf4\xe2\xbe\x9a\xfa\x18<\xf6\xe3\x84>\x17\xc0\x18\xbf\xa8\xca\xb1\xbe&\xe9\x06\xbf\xaf\xffI\xbf%\xad\xce\xbe\x8e#T>E]A\xbc\t\xe2/\xbf_\x84\x0e?%\x8a\x92>\xeb\xbe\xfe\xbdX!\x08=\xd1e\xc8\xbe\x99\xbf\x03\xbf\xdf\xcd\'?\xcd\x86\x1a=\x80>\xc0>\x17j\xa9\xbe\xf5\xe2k\xbf\x1b\xe1\xd0>\x93\xccl>\xee\xdc\xe4>\xa8\xd5\x01\xbd\xd9\x00\xc5\xbeR.k\xbeI5\x1a?Y\x0b\xc4\xba{V\xd2>\x19J\n>\xf0[\xd2>\xb6/G\xbdc]\xc3>\'\xc8e=\x9e\xe1\xba>}\xb1?>\xbax_?\x8d^\x0b?0\x84S\xbeXE\x89\xbcg\xd3\'>\x19\xb27\xbe'
-p267
-tp268
-bsV503958780090920960
-p269
-g2
-(g3
-(I0
-tp270
-g5
-tp271
-Rp272
-(I1
-(I200
-tp273
-g12
-I00
-S'd\xa5\xf8>\xc8\xf5\xb3<\xf4p\x04\xbf\xc7Cc\xbd|r\x9b>qr\x03\xbe\xe7\x82\x05=\xb7\'k\xbe\xf3g\xa6\xbc\xa1\x97\xca=W}`=\\^\xe5=\xa0\xf4a>t\xdb\x02=\xc9\xc3\x94\xbdf\xba\xc9>9\x9a\xee\xbc\x89\x1fh\xbc\x870E\xbe\xe4"$=\xf8\xfe\x8f\xbe\xfc\xbc\x8c=g7g>\x11\x88\x82\xbe\x17\xd2\x16\xbb\xe4\xb6 \xbe/\x145>\xbc1m\xbeJ\xeeW\xbe\x00\x00\xe8=\x1f\x1d\x17>}\xe6\x9b\xbd\x17\xc3\x90="\xf4\x84\xbe\xd0\x959=\x96p0>\x19\xcf*>\x96\xd4s>\x164\xb2>\xdc\xb9\x82\xbd\xbc\xbf\xdf\xbd\xa3>\xde\xb9\xcd\xb0\\>\xaf\x17\xaa\xbe\xc6\x8c\xf0\xbd\x0fx\xa5\xbd6P\xc7>\x17m\xbd\xbd\xa4lb=\xca\x02\xe2>9\xc7\x9c=\xd1\x15\x05?\xb9T\x7f\xbe\x16o\xf7=2\x98\xb4\xbe\xa9\x08j>q\x11\xef=\xfa\x8f\xf9\xbd?\xcb\xd6\xbe\x19\x98\xda\xbe\x8d\x99\x91>\t\xffe>9\xa2\x0b\xbd\xcd\xd5;\xbeC\xff\xba;+\x85\x14>l\xd4W\xbe\xca\x1e\xa6>\x8d\x9ad\xbe\x94\xb0\xe3\xbdK\xc3\x10\xbf\xdbm\x92\xbeTH\x97\xbd\x86\xce\xb7\xbd\xea\xef\x10\xbe\xd4\xb94>\xb7\x07\x1a>\x96\xb3\x81=\x14\x03\xdb=\x80\x10e>\xef\xf5\xd4\xbd\xd7)\x9a\xbc\x1c4P>\x97\xd5H\xbe`,\xee=\xf3\x98T>_=\xbc>\xf6\xf8\x95\xbe\n\xc3\x0c?\xff;,\xbc\xa3\xcc\x96\xbe6\xd4M>6>\xca\xbezw\x19<a\\\xa6>\xce_1>\xb0JC>\x87e\x8a>Fn\xc3=\xe8\xf3\x19\xbe\x83J\xc9=\xc8\xbf\x8c>A\x8c!>\xa0lH>\x8d\xec\xc2>y^+\xbe\x1c\xa5H=\x84\xadO>\xc7W=\xbc)\x9d\xff<\xea\'B\xbes\'Z>\xff\xadg>\x10\xd9\xa6=\x8d\x1d\x9d\xbdi\x17\xb4\xbda\xe8\xae\xbe7\xd0\x88>\xe4\x19\x8a=/\xe5\x03>\xa9\xeb\x12?\x13\xd7\xbb=\xb4\x90\x84\xbd\x98\x94\x16>\x94y\xba=\xc4l\x99>l\x0b$\xbe\xffr5=Q\xf2\x1a<Y\x11\xde<g\xc1\x1f>+\x04\x0b>\x04\x99\x9d=\xdf[\x0c\xbc\xf1\xb0\r>\x03L\x0c>\xdf\xcb\xaf<\xd1v)<f\x14\xcf\xbc\xd9\x8bS=S\xd3P\xbe\x0e \x95>x\x02:=\xa7\xac\xc7\xbe%"\x95>\xd4\x8c\x8d\xbd\xd1\xe5?>\x91\x08\x96>\xff%\x17\xbe\xba\x01\xf3\xbc\xe31{=\x86]\x80\xbd\x11Oq>\xc6\x83\n>\x12A\xaa=\xf8\x0c\xba>\xe6Z\xb7\xbdI3\xd8=\xf0<\xca=\x8c0\x80\xbe_\xab\x9d=WB)\xbe\xfc\xab\x90\xbe\xe9\x9e\'\xbe[e\x8a=m-\xf3\xbd\x97:\xd2\xbe\x04\xf2\x8e>\xd6\xdc\xcb<\xb6v\xc7\xbd\x90h\xe5=\xb5!\x11\xbe\xbc\xcf\xaf\xbdN,\x07?\xd6\xb1\x98=J\xe7|<\x14\xcd\x8d\xbe\x91\x1c\xf8\xbe\xf4\x8f\xbf=\x8cCR>\xc9X\x94>L\xba~\xbd\x00i:\xbeG\x19\x83\xbd}\xe8v>\'m\x0e\xbd\'\x98\x97>zX<=\x10ms>\x9a(\xfd\xbd\xd0Fa>,9L=\\%4>N\x1b\x19>`-\xed>r\xe2\x99>3\xbbM\xbc\xac\x8c0<\xf4/\x0c\xbd 4<>'
-p274
-tp275
-bsV503971384385892352
-p276
-g2
-(g3
-(I0
-tp277
-g5
-tp278
-Rp279
-(I1
-(I200
-tp280
-g12
-I00
-S'C\x06\xf8>\xbf^*>Qw\xc6\xbeH>\xc5\xbd\xf7p\x15>&\x13/=\x8e{C\xbd\x8d\xd1h\xbe\xff\xce\x18\xbcNx\x80>\xd2\n0\xbd\xd6\xdc\xf2\xbd3\x9e.>.\xa7\x08\xbd#\x98\xeb<[\x9d\xa6>x\x00\xd4\xbd\xef\xab\x15\xbeI=C\xbe\xc1\xef\x9e\xbd)\xd1\x14\xbe\xe3-\xeb<:\xc0\x84>k\x1b\xd1=]\x7f\xcd=\x87m\xc9\xbd\xc8 \x9e=\xf1\xeb\x15\xbcSl_\xbe!,\t\xbe\xe5\xb9Z<\x10\xe18\xbd\x02\x91:\xbb3\x83\x9b\xbe-\x07\xb3=\x07s\x17>\xb0\xfau>\xb6T/>f\x19X>\'\xe5\xee\xbc\xcf\x8a\xdd\xbd\x06\x95\x88\xbd\r\xb7+<\x92\xcc"\xbe\xbes\x01\xbe\x04_\x89\xbdE\x01\xc3>\x9b\x12\x12;\xaa\x80F={\n\xf6>MAX\xbd\xf5\xf3\xb8>X\x86F\xbe\x81=\xdb=\xffx\xac\xbeB\xb5\x9a=\xe2\x98\xd0=nlT=`P\xe1\xbeg~\xb0\xbe\x13\xa9q>IJ\xd7>\x92X3>\x03A\x1b\xbe\xa9FD\xbdX\xe2^=w\xdei\xbe\x0bV\xd9>q@\xbc=r\xa5"\xbe\xc6\n\xc4\xbe\'{\xac\xbeq\x01f\xbeA\xdb:\xbd`3\x18\xbew\x01\r\xbd\x91\xe4\x9b\xbd;"\xf2=z\xd0/>k3\xde=\xb6\xeb\x93<?\x8b8\xbd\x9e\x00\xb0>!\x87A\xbeB\x16\x07>\xa8\x86D>\xab\xc1z>\xab\x1c/\xbe~Y\xb7>\x1a\x87\x15\xbe/{\x97\xbe\x91d\xe4=;\xfa\x90\xbe\xc1\xb7\n\xbe\x97Q\x1b>C\x11{=!\xc0P> !^>\xedHC<n\xd8)\xbe\xdb\xdd3\xbdh\x03\x15>\xe9\xb4+>\xad\x1b\x1e>\xca\xbf\xa3>\x9b\xce\x0f\xbe}\xe0\x85=\x1a\x88\xb0>\xd8=(\xbd\x98\x8a\x15\xbd1i\xcc\xbe\xc7\xb8\x84=\xd0=\xa1>\xcf\xff\xad=\x91k\xea<\xd6\xbb\x16\xbe\xc0\xad\x87\xbe\xa2\xdf\x14>b\x03\x98\xbc\x93\x93;=\xd8\xd2\xd6>St\x1e>\xe8\x10\xa5\xbd\x82\x17\xf3=\xab8\x10<w\x897>\xd12\xbf\xbde-\xe6=A\xb6\xdc<\xb7\xf8\xcd<6\x95\x0e>ti\x0c>\xd8\xb4:\xbd\xeb\xdeP=A\xdd\x80\xbc\xe3\x05\x19=\n)\x8e;S\xb3#\xbd\x89 \x8f\xbe8\xf5\xfd\xbc\x15}@\xbe\xab3\xc8=X\xd9G>\xb6\xa8\xa1\xbe\x9f_\xaa>\xc2\xda\xdf=\x1el\x91=#\xe1\xd8>N\xe7\xda\xbd\xb8\xb1N\xbd\xfb\x8a\x88=\x98\xe1\xcc\xbdx\xbd\x80>\xfaj\xf8=\xaa:h\xbdF\xaax>o\x04\x07\xbe\x95\xbe\x94<\x91*\x83=\x10\xbd\xa6\xbe\xbf\xe0$\xbe\xd3\x8c5\xbeX\xd2\x9a\xbe\x1a\x92,\xbe\xae\xb5\x1e>\xed\xd3\x8c\xbd\xad\t\xa4\xbek+\x81>Z\xd1\x11>\xf7X\x93\xbdy\xfb\xce;\xe6m$\xbe`"V\xbe\xba\xbd\xc8>.l\x84<\xd6\'\xe0=\xafj\x84\xbe7\xfe\xfe\xbe\x7f\x1e\xd4=\x05e,>Z"\x86>0\xbd\xb1\xbd?gK\xbe.\xa5Q\xbe\x13)\x87>\xa0h"\xbdZ*K>\x8f0\xf5<%\xd9g>\xf8^\x99\xbcR\xee >\x9aV\xed\xbcH\xbbB>\xf9\r\xff=\x96\x1c\xfc>Z9\x97>i\xc0\xe0\xbdE\x1b7=a\xba\xbc=\x0f\t\xbe='
-p281
-tp282
-bsV504173441483042817
-p283
-g2
-(g3
-(I0
-tp284
-g5
-tp285
-Rp286
-(I1
-(I200
-tp287
-g12
-I00
-S'\xb5&-?G\x8b\xef=\x80\xd2\xd3\xbe\xe1<\xcf\xbd\xe8\xfd]>\xcdf\x8f<8\x8ev\xbe\x98\x00\r\xbfh\xae\xd9\xbd\xda\x8e\xf3>O\x02:=P\xa5\x10\xbe.e\xd2=\xd4\xb7\x1b=\xe0\xe4.\xbe\x89\x15\x12?\x03h\x84\xbeU\xcf\x9a\xbe\xa2p\xa1\xbe\xc9\xb8y\xbe\x1a\\\xeb\xbda\xab\x89\xbd\xc6&7>\x01\xe9\x8d=\xe7z\x8e\xbd0\x1a\x0c\xbdL\x81k>\x8e\x97\x87\xbeBr\xd1\xbe\x92%+\xbew\t\xde\xbe\xb0S\x92\xbe\x15\x11F>a8\xec\xbeI\xaf\xde=\x82\x02\x1c?\x84\x9f\xfa>*fQ=:/\xbc>\xe0<\x9e>w{"\xbeq\xf2\xcd\xbeU2\n>\xb1!\x8c\xbe\xe2\x98\xb7\xbe\xe2zM=qH\x1f?\xc8m\t>64\xd0=0\xcb.?\xa6\x01\xb2:\xb2g\xd9>\xcb\x8a\x7f\xbec\xbb\x12\xbe\x00\xb2,\xbf\x18\xbc\xaa=M\xe0[=\x11\xe8l=\x9bF[\xbf\x18]<\xbf)?\x91>\xb9\xee%?Jm\xbd>\x98\x19\xa7\xbe\xeb\xc9\x80\xbeb\xad\xac><\n\xa6\xbe~ \t?\xf6a\xeb\xbc\xd1k\xcb\xbe\xccN7\xbfx\xec\x07\xbf\xa8\x01\x9c\xbe\x1a\xc3\xac\xbe_\x1b\x93\xbdH\x9e\x15>\xe4iE>\x8b\xe2\x87>\xa2\xce\x85>*\x92\x83>\xec\xf7h=\x00\x9eT\xba\x1d\x89#?\xf8\xeb\xca\xbe\xe5Z\x85>r\xc3\x02\xbeU\xf9\x80>\xa2\xea\xf8\xbe \x0fB?S=C;\x0f\xa2\x86\xbe\x91O)>\xcbo\x8a\xbe8\x1c\xa3\xbc\xbcU\r?\xeb\xba\x04\xbedh\xfb>\x90\xec\xbd>~4F>\x10\x86\x15\xbe.2I\xbe\xe2\xbd\xd0>\x875>>\xd0\xb0!>L\xfa*?W\xf8\xb9\xbeS\n\x00>\xa9\xaa\x87>\xcb\xb6\x1c>n\xfdM\xbdO\xf3\xfc\xbe\xe2\xceT>\xf1\xe3\x81>\xac7\x8d>\xf2D+>,\xcb\xe6=\xe4\xd0\xf4\xbe \xe5\xb7>\xa8~\xc6=-\x1d\x90=@S ?\xe7\x87\xca>\x9a\x02\xe1=\x95\xc4\x06\xbe\x98\xbae\xbeY\xd6\xc3>\x9c\x1d\xe7\xbd|b\x13>\x98\xb6\x06>u5\x85>\x00\xc9\x8c\xbd\x0e\x8f2>\x84\xa9\x1d>\x8c_\xe4\xbd3\xd2)\xbe\xfae\x9d\xbd\x88"4\xbe\x08\x80\xf4;\x90\xda\x82\xbe@\xce\x90\xbdI\x9b\x8c\xbe\x90\x11\xd4>\xc9\x92\x8e>\xc5\x1b\xec\xbe1[\x0c?\xaf\xb2\x01>\xd5E,>Q U?|\xbb<\xbe+\x87\x7f=q\xc1\xe6\xbd\xda\xce\x8d\xbe\x98\xe0\xd1>\r\xfey>p\xdb\xd4\xbdo\x0b\xb3>\xf2V`\xbe\xb7\x82\xdc=\x91\xeb;>\x1c\xbc\xe1\xbe\xca\x011\xbe\xd7W\x8d\xbe\xd6p\x1f\xbf\xc0:\x91\xbe\xe1\x84\x84<\xcb\x9d\x89=\x88\xc5\x14\xbfL\x15\x07?\x94\x9f\x05\xbd\xf7\xd9\xf8\xbd\x80\x17\xb4\xbc\xaa\x10\xce\xbe0\xb9\x81\xbe>L&?LQZ>\x93\x02E>VX\xda\xbegw\x12\xbf\x124\x1c>\xd4\xc1\x86>\xcb]\x01?\xe2\xf9\xb7<\xdd\x8e\x90\xbe\xc2\xf9<\xbe\xd8C6?\xa2\xce\xcb\xbc\xfb\x8dm>\x879\x14=\xc1\x88\xa5>FSA\xbei\x87\x85>hr\x9e;\xa3\x82?>^.\x9e>s\xc5&?\xb5\x00\x1c?/Y\xf9<\x1f\x8f<>he\xb6>\x153F='
-p288
-tp289
-bsV504248104158511104
-p290
-g2
-(g3
-(I0
-tp291
-g5
-tp292
-Rp293
-(I1
-(I200
-tp294
-g12
-I00
-S'\x91\xab\x9d>\xd4\xf1\x96\xbcm\xcc\xb2\xbe\xfdDv\xbc\xc5\xd6m>\x14\xfa\x96\xbd\xcbL\x9d<\x88FC\xbe\xdas\x9f\xbd\x1d\xd6\xe2=\xdd\xa5^=\r\x05\xde<Mn@>\x85\'_=\x1f\xf6\x04\xbeAo\x8d>\xb5\x19\x03\xbd\x03?\xf8\xbc\x0b*\x06\xbe\x17~"=\x17\x98^\xbeq\x17\x07=\xa9\xcd\xef=\x98bi\xbe)\x12\xa5\xbc\xbf;\xdc\xbdk\x0e\x18>\x95\x875\xbe\xb1xM\xbe\x9b\x99\xca=\x0b\tq;L\xf5\xa0\xbd\xb7\x08\xed=\x876j\xbe3\xa3\x94;\xe0\xf0@>\tq\xe9=(\x98\x18>K~\x89>\xec\xd9\xb5<\xb4zM\xbdo0-<\xb9\xe7Y>\x8by\x8f\xbeX\xaf\xd0\xbd\xf3r1\xbd`\x19\x94>\xb5%E\xbc\x88\xcb;=1 \xa6>{hs=\xa4j\xc8>\x9d\xdf"\xbe\x1d\xcb_=\xe3\t\xa5\xbe\x0f\\+>S\xe5\x00=o-\xde\xbd\xff>\xb1\xbe\xf59\xaa\xbe\xe7\xdbC>xi\xa2=xv\xe8\xbc\xf3$%\xbe\xf0\xa2\x18\xbc\xd822>\xf5!\x1e\xbe\x8e\x08&>\xf3?e\xbe\xf8\xd0\xf2\xbd(\x80\xda\xbe\x01\xe0O\xbe\x1c(\xc1<\xff%\xc1\xbd\x17\xd1\xdd\xbd\xec\xbf4> \xfc@>\xb8\xf9\x9a=\t\xf9\xba=\x0f\xa97>\xf1^\xb1\xbd\xa8\xcfP\xbcy\xfba>\x11\x8f=\xbe\x049\xc3=\xb0q\xdc=;>{>Y\xc2\x92\xbe\xf9?\xdd>\x1e\xb8\x9c<\xb5b)\xbe\x1d\xc1\xff=\xb9\x10\x83\xbe\x95\xb4\xb4<*\x81\x8b>\xf8C\xda=\xa3\x00\n>\xc3_Z>\x93@\xc4=1\x1d\x8a\xbd\xd0\x81\xb9=5\xa6}>_i\xec=hT\n>\xab\xa4\x9a>\xa3Q(\xbe\x99\xbd\xf3<\x8b:\xa4=<\xf3\x02=\x9d\xc8B=\xbf\xe7\xaf\xbd\x94y_>\xfc\xb2\x01>\xfdh\xc1=\x8c\xcb3\xbdKCE\xba\x95\x98\x88\xbe7{\x8a>\r~1=|E\xcb=\xfb>\xdd>u\xbc?=_\xa8.\xbd\x956\xe1<%\'O\xbc[\x7fu>r\x9f\x13\xbe\xa1\xb6\x17\xbc\xdb1\xb3<\xbb\x859=K\xf7R==\x04\xb6=\x08\x85\xcf=XQ\x14<;\x1a\xcc=\xf1\xc0\xc5=U1&\xbdk5\xcb9\xfc\x87d=\x10\xec\xab=\t6\x11\xbe4\xd4\x87>\x18\x9bS\xbc!\x1e\x8d\xbeC\xacc>\r\xb9:\xbdul">\xe17d>\tN\xe0\xbd\xd5a\x0b\xbcU\xdbV\xb9O\xb2\xc1\xbd\xc4B`>\xc3,->E(o=\xcb\xc5\x97>\x10>k\xbd\x8d\x17\x00>\xe6\x13\x99=\x98\x1dD\xbe\x8b2\xb5=\xed\xbc&\xbe\xf3\xa3\x8d\xbe\xa8e%\xbe\x15\xd7\xaa<\x07O\xc7\xbd!\x82\xb5\xbeO\xc5J>m\xdd7\xbd\xd3\xfa\x81\xbd\x8bF\x1f=\x97\x89\x18\xbe\xbc/\xd8;oB\xd3>\xb9\xee\x80=\xad\xc6\x8c\xbbq\x1f\x82\xbe\xa4\x83\xa9\xbeh\xd8\xcd;\xdaD\x0e>m\x9a\x80>{Hy\xbb\xc7\x94\t\xbe<\x13\xc0\xbc\x05C_>\xb8\xc4;\xbcO\x89;>\xf8TL=\x0chM>\x90\xee\xfd\xbd\x85\xd18>+\x87,=\xff\x08\x02>\x01r\x05>%\x0c\xb8>\xfc\xc9q>\x8f\xe3R=\x93\x152=}\xa6\xbf<4q\x1e>'
-p295
-tp296
-bsV503972695625961473
-p297
-g2
-(g3
-(I0
-tp298
-g5
-tp299
-Rp300
-(I1
-(I200
-tp301
-g12
-I00
-S'gT\x00?]\xf9\x0b>\x8a\x8f\xdf\xbe\x10\x96\xad\xbc\xf1&a>\xe7:H\xbd\x0c#\x07\xbc\x928\x8c\xbe\x1e(8=\xc4\xc0+>P\x8e\xbd\xbc\x99=O\xbc\xa4\xb7\x04>\xd5\x82D=\xaf\xc4\xd8\xbc\x80\x19\xb5>\x91Bc\xbdF\xca.\xbdp\xebX\xbe\xd5\xf0\xd9\xbd\xc9?\xda\xbd/\xee\xb4<\t\x9b\x94>\x0c\x81\xd1\xbc\xd2\x18\xc7=\xff~\x00\xbeW\xbb\xea=\xb3\xb1\xa9\xbd\xe7;-\xbe\xd6\xf0S\xbd\x8a\x9d\n= \xe9\x96\xbd\xe5\x8d\xc5<\x0b\xe9\xaa\xbe}6v=\x15Z/>\x99\xb1?>\x07+w>\xe5\xd2\x82>}$\x9f\xbd\x10o\x1b\xbe\x89Q\x8d\xbd\\y\xb9=\xc9:K\xbeX&1\xbe\x9a\x98\xbb\xbd\x95u\xbc>J\xa2.\xbd\x04\xa8x=\xf4\xf9\x00?\xbc_6\xbc\xa3\xca\xd3>\xd32T\xbeF,\x1e>\xbf\xa5\x9a\xbe\xe8\x1d\xdc=\x9b\xd7\xdc=K\xee\x82\xbd\x9a\x17\xc2\xbe]W\xde\xbeG\xc3j>\xcc\xbe\xae><\xbd\x03>i\xe7)\xbe\xea\xa86<rm\xe7<\xf4\x1e\x86\xbe\x94\xcd\xb8>\n\xc9\x93=\xd3\xad-\xbe\x18\xd4\xfe\xbe|\x94\x9c\xbe\xb0=1\xbe\xb4\xeb\xef\xbd\x1bj\x14\xbe2\xeb\xbc<\xd9\xbfh\xbdT\x11\x82=\xd3\xdaA>\x00\xc1\'>m\xadW\xbdR=\xc1<e[\x94>3y\x19\xbe\xa4\xf4\x00>\x9b\x0f6>\xe3\xc4\xa7>\x8f\x02\x80\xbe\xf8\xba\xec>\xb5\xff\x03\xbe\x92\xae\xa4\xbe\r\xe5\xf8=F\xd5\xb6\xbe\x8f\xe9\xa3\xbd\x1b\xddg>\xf7\xef\x1c>\xf7\x0cX>ATh>\x87\x1cy=79/\xbe\xb0?U\xbc\xd5\xedX>\x80\xf3\x13>\xc9\xc3A>\xff8\xa8>\x92<\x18\xbe\xeaV1=vN\xa7>\xf8\x1c\xd5\xba\xc6\xd4#=\x86P\xb0\xbe\x08u\x86=)\x13\xac>\x01\xc0\x7f=\xc07{\xb7u\x17\xfb\xbd\x1e\xcb\xa3\xbe\xd3sb>\x07}\x0b=\x93|H<\xbc\xd2\xe8>\xd3\t.>"\x9d\x88\xbd.Q\x13>xi\x94<\x9e\x0fR>{\x81\xdd\xbd(\xa1\xbb=\x0f\x04\xad=\xd9\xc4\x94=\x16\xc0I>&\x8f\x16>\x99\x1b.</O\r=Q\xc1X=\x1a\xd9\x98=\x19\xd6\xbb<\x95\xb5w\xbc\xbb\xf7m\xbe/\xb0\x87\xbc\xb6\xeau\xbe\x82\x127>KH\x15>b\x81\xcd\xbe\x8dg\x9a>\x0bB\xf0\xbc\x1a8\xd3=+\x10\xcb>\xd7\'\x93\xbd\xef\xdc\x1b\xbdf\xe9\xdf=\xcd\xe8^\xbd Tg>\xa3\x9b\xd3=\x96\xf0\xcd<\xedi\x9f>]\t&\xbe\x98\xf1\x11=\x96\x10\xb2=\x93\x0c\x84\xbe\xce\x11\xec\xbdn\xf0z\xbeg\x8d\xba\xbe\xfe\x0f\x0e\xbey\'\n>\xa42\xc0\xbc\xc1u\xc6\xbe \xe0\x96>\x01)\xfd=\xfe\xa0\xc6\xbd\xb0\x11\x91=\xba\tA\xbe\x8c\x19T\xbe\xb9\x12\xd0>4\x14L<\xd5\xc2\xef=\xa40l\xbe\xed\x03\x06\xbf\xdc\x1f0>N\x99+>]z\x8d>\xde\x06\x86\xbd<\x9cH\xbeo\x81\xce\xbd\x07yx>z\x1b\xd0<?\xde\x88>\xf0\x87\x8e=\xc2\xf9`>Q\xa0g\xbd\xff\x8e\x88>\xb2\x8d\xba<\xe2\xd0]>\xebM\xca=\x03y\x07?3i\x85>\xedw\xe5\xbd\x11^^<\xdfU.=\x1c\xd7\xdc='
-p302
-tp303
-bsV503963824329080833
-p304
-g2
-(g3
-(I0
-tp305
-g5
-tp306
-Rp307
-(I1
-(I200
-tp308
-g12
-I00
-S'6\xba\r?R\xd5\xda=\x9b\x96&\xbfx\xc7(\xbeKSZ>>\xe1\xaf\xbc7\xb7\x1c\xbc?@~\xbe\'\xd2\xfa\xbc\xd7\xde\x80>A\xaa\xa7\xbd\x9e\x81\xc7\xbd\xd1\xf4\x85>j\x05<\xbe9\x8ex\xbd\xb6\xba\xa5>%se\xbdV:F\xbe\xb1\xfaf\xbeB\x96\xb2=N\xde\xb3\xbe/f\xb4=\xe1\x92L>?\xa1\xb3\xbd\x00\xac\x8a<\xcb\xdbA\xbe^\x08p>\xdey\xda\xbc\x9f`\xba\xbe[_\xb9\xbd\x98\xda\xeb=\x9b\x91\xf5<\xf3\x80Z\xbd\x86j\xc3\xbe0\xa2\x94\xbc\xe9\xa4n>_\xbaN>\x85\xa8\x83>:\xb3\xca>V\xae\x8e\xbd\xb0n?\xbe\xe6\x81\x97=g-\xa4=\x8b\xb9\x8f\xbe`\xbbr\xbeb{\x07\xbe\xf2Q\x04?\n\xf2\x0c\xbd\xf9M\x8a=\xaa-\x17?5\x06\xb5=Z\x90\x04?z\xad\xaa\xbe?\xd7\xc0=I\x13\xbe\xbe\x9b\x8c\x87>(\x85V>\xa9V9\xbc\xe2U\xed\xbe`$\xe9\xbe\xff\x1e\xbf>\x80\xa1\xe0>B\xda\xe8=\xb0\x13:\xbeks\x1c=\xab\x9a\\>"\no\xbeu\x06\xe5>Ae@\xbe\x02\x8e\xea\xbd\x8a5\x06\xbf\xc9t\xeb\xbe\x05\xa3!\xbe\xfb\xc7\x10\xbd*\xcd\x98\xbe>\xc5\x06=\xe6\xeb\xff=\xb7: >\x8a~[>M1;>\xa21\xf3\xbc\x86%\x01=\xb29\xc2>\xc2\xc3m\xbe\xdbU\xaf=\xfa\xfb\x83>\x8brZ>%B\x9d\xbe\xe0"\xe3>zx\xd0\xbd\xce\x93\xbe\xbe\xa9\\\x86>k\x01\xb7\xbe\xb3G\xe7\xbdh\xe3N>zW\xb5=b_L> :\x86>\xf2O\xe9=\x17\x96\xee\xbd\xbb\x1f\xcf;\xae\xd3o>\xd1\xb6S>\'\xe3v>\t>\x94>\x08W\xa8\xbe\xce\x06\x80=Fe\xcc>2\xd0\x1e\xbc\xf6.\x85\xbc\x00\xd8\xcc\xbe1\x1d\x9d=\xef\xf3\xa2>@\xabR>\xf7\xd4\x8d=:\xe96\xbe\xbdC\xdc\xbe+P\xa4>\x9f\xc7\x03\xbeb\x0f\x06>&\xe7\x08?\xed\xd3\x1b>\xdebH\xbe\n\xd8\x17>h\x1a2=\xe7g\xa4>\xa0\xdds\xbe\x8b\xd3\xb1<\x1d\xfc6\xbd\x12\x04_\xbdj\x1eQ>\xb9;\x87>u\xa7\xdb<!*\xb6=\xc1?\xe8\xbc\xb8\xe20>\xd5\x19F\xbdh-2\xbd\x8d!J\xbe\xc6\x96\x98=8\xe8\x84\xbe yx>\x99\x96\xa4=%P\x01\xbf\x06]\xb2>&\x9b\xb3=\xce\xf9\x83>$\x91\x0f?\'IB\xbe\xdf\xb3\xd9\xbd6\xbc\xa1<\xd2\xce\x00\xbee\x0c\xc6>\xe6`\x96>\xca>!\xbdn\xf4\xf0>\xab/\x01\xbeO\x1f\x90=|\'\x02>\xbb?\xc2\xbe\ra\xa6\xbd\x17\ne\xbeI\xbe\xc8\xbe\xb9\x1e\xbd\xbejR\r>\xe7\x80\x80\xbeP\xee\x1d\xbfP\xe0\x86>=\xc1\x19>\xf7\xad\x99=}\xa1\xa9=\x89\x85A\xbe\xf1\x012\xbes\xab\x1a?\xb0MG=\xab\xe2\x99=\xf2\xf7\xb7\xbe\xe3w+\xbf\xb4f\x08=J"9>\x97<\xb0>\xe2\t\xaf\xbdn\x1d\x99\xbex\x8e\xaa\xbex\x98\xa1>\xa6z\xdb\xbd3>\xb0>\x07\x82\x80=\x9e\r\xbe>\xb7\x01\xee9\xa7J#>N\xbc\x98<\xed\x81\xa0>#\x0c\x18>\xe1e\x0f?\x83\xd1\xd3>\xa3\xbf\x13\xbd\r\xa9\x02=Ye\x92=\x82Il='
-p309
-tp310
-bsV504210416344780801
-p311
-g2
-(g3
-(I0
-tp312
-g5
-tp313
-Rp314
-(I1
-(I200
-tp315
-g12
-I00
-S"3o\x1b?a\x80\xae\xbdb\xbd#\xbf\xd9\x8cg\xbd\xd9\x98\xc7>BS\xc4\xbd\x11*\xb0=\xa5\xda\x8c\xbe\xf5\xb1\x90=\x9b\xd2F>\xad\xaeI\xbdok\x90=\x95\x04\x8a>\xd1\xdc(\xbd\x93\x97\xca\xbdJ&\xfe>*:%<\rk\xd3<\xf7k\xa6\xbe\xb7\xc8q\xbd\x96/\x86\xbe\xad\xbd\xc4=\xd6\xb1^>\xe5\rA\xbe\x03\x9f@=\xff\x84\x8c\xbe\xe6\xf8\x88>\x80+[\xbe/T\xa4\xbe\xb3\xd1\xc5\xbdN\x92Z\xbc%\x19\x86\xbbC=\xdd<\xe3%\x13\xbfg\xeb@\xbd\x0b%M>wNu>\x89v\x9a>2\xf0\xbd>G\xa2%\xbe\x1a\xd9\x8f\xbev\x9f\xbf:\x86\xea\x02>\x17B\xaf\xbe\xb0\xd9\x8f\xbe\n$^\xbe\xaf\x1a\x00? A6\xbd[\xf1\t>\xe8\xc5\x1f?#\xe0\xb2=\xc9AA?\xf7\xdc\xcd\xbe^\x93\x8e>2B\xb5\xbef\xb6\xa6>[`\r>\xcb\x94\x99\xbe\xca*\xb8\xbe\xb0\\\x1b\xbf\xd5\xc3\xa7>\xf9\x90\xaa>!1\x0b>\xa7,\x1e\xbe\x9dOV>qp\x14>\xba\xc9\xac\xbeKU\xcc>\x9a\x06\xc0\xbd\x08\x1c\x87\xbe\xf0#\x16\xbfAs\xb3\xbe\x07\xc5\x9c\xbdV\x03#\xbe\x9fmj\xbe*G\xc8=&\xf6.>U;\xd5=\xc31Y>\xd1H\xc4>\x93\xf7\r\xbeJ\xc8\xd1=6\xd4\xc1>o\x7f\t\xbe\t\x0b\xb3<\xdas\x1e>\n\xba\xc5>;\xc9\xdd\xbe)\xfe6?`\x99\xd4\xbd\xfb\x15\x00\xbf\x13\x93<>\xeaK\xda\xbe\x0bp\x0f\xbe!\xa4\xee>`\xb8R>Vi\x80>^>n>\x9a-g>\xed\xf8G\xbe\xdeln=\xc5\x98\xa2>\xde\x81\x84>oZ\xb6>\xc0\x90\xc2>\xee2\x85\xbe\xfe\xfc\x8e=\n\x1f\xb5>\x15\x9b<=H\x9c\xd7=\x9d\xdf\xb5\xbe\xb5(\xda<.\xfbm>/\xab-=\x9e\xed\xc2\xbd\xebC\x12<!\x9d\n\xbfU\x1b\xb1>\x89\x1c(<b\xff#\xbd\xa7e%?0D1>\xbbJ[\xbc\x80\xa2A>\xcc\xd9\x08>S9\xe8>\xd7P\x81\xbe7H0\xbc\xe8\x1a\x86=\x0f\\\xc2=\xc8>S>\x0b\xa1 >-44>v\x9aI=\x17&>>\xe5\xd9\xae>=V\x1f=E\x13\xc2=\x90{\x1b\xbe@\n\xe6\xbb\x0b\xb7\xc1\xbe\xab\x8a\xe0>\xe3_\xa5=M\xf1\x15\xbfq\xc3\x94>P \xdc\xbd\xf7|f>y\xb0\t?\xdeh8\xbe\x89\x98W<\x1e\nz\xbc\x7f\x1eq\xbdj\x8b\x83>\x0b\xd8\x13>\x82\xb3\x12>\xdem\x19?#\xd4\x87\xbe\x9bh\xfb=\xe0\x0c%>/#\xba\xbee\x81\xd8:\x02Zj\xbe\xf9\x8c\x10\xbf\x190\x9f\xbe\x96\xa7&>i\x19\x07\xbe3p=\xbf\xce\x9e\xbf>\xaa\x8e\x07\xbd;\xf1\xc5\xbd.\xfaj>\xb0\xdc\x84\xbe\x7fr\x1d\xbek\xe8.?\xf7\t)>\xb2\xb1\x85=s\xa5\x86\xbe\xdb\x17#\xbf\x8d\x08\x92>\xda\xdcR>fs\xea>V8#=\xe5\x1f\x95\xbe7\x1c\xd1\xbc\xab\x91\xb6>\xab\x9e\x0b\xbd\xb0p\xfb>\xb5~1>\xef\x13|>\xf7\xa3\x95<\x15{\xc5>\xb2N\x93=\xe8M\x85>(\xd7x\xbdx\x82'?\xf8\x95\x82>0}`<\xb0\xe1\x14\xbd\x9e+b=\x17&\xa3="
-p316
-tp317
-bsV504272620611973121
-p318
-g2
-(g3
-(I0
-tp319
-g5
-tp320
-Rp321
-(I1
-(I200
-tp322
-g12
-I00
-S"\x04\x82?>\xb9&\x0f\xbc\xdd\x97\x86\xbe\x17\xb1\xc1<\xe9\x94,>\x07\x03\x13\xbd\xd4\xa9\xdb\xbc\x01\x8bA\xbe\xc9\x07j\xbdK\x9c\t>\xd9\xfe\xea<\x9d\x81\x9e;\x9d\x17\xe9==\x0em=\x18\xdb\xc3\xbdO\xeeU>\xe3$\x87\xbdP\x86?\xbd\xab\xf3\xe3\xbd\xdf\x1c\xc6\xbb\xad+\x0b\xbe\x97*\x17\xbd\x91\x16\xc9=\x18\xd3\t\xbe\xa7\x04\x92\xbc\xa9\x12t\xbd\x07L\x08>\x9b3\x0f\xbe\xc9\x89'\xbe\xc9.\x85=\xccy`\xbd\x9fO\xcd\xbd\xf3\x92\xd9=\x1f\x18k\xbe`g\x17<#\x8cY>m,\xe2=]\xa8\xd8=\xd3PI>7Ek=\x80M-\xbd\xe55\x1e\xbdM\x1f\x1f>\xfb\x03:\xbe\x83\xe1\xec\xbd\x13\x92\xa0\xbce\xe8r>\xcbw\x10=\xe0\xa8A=ie\x84>\x0e\x94\x97<\x15\xcb\x8d>\xa7\x8d\xa9\xbd+`\x8c<\x10;\x9b\xbe\xa1N\xf6=0\xa9\xe8\xbc\x83\xc8\xbb\xbd\xedN\xa0\xbe\xdc\xa8\x99\xbe\xa7T\r>\xafY\xa1=\x9c\xa9%<\x99\xdf)\xbeG\xe2\x98\xbc\r\xc5\x1c>\xb3\x1d&\xbe\xebQ\xdd=yw\x04\xbe\xd8\xdd\xd8\xbdI\xed\xb1\xbe\xef0X\xbe\x99\t\xe6\xbb\r,\xbf\xbd\xc7g\x8b\xbdc\x8a\x16>eF.>\x97\xcf\x88=\xede\xfa=\xdb2\t>\x1d\xb7%\xbd\x9b]\xb9<\xa0\x07h>\xc8^=\xbem3\xde=*D\x1f=8R<>D\xf0\x86\xbe!@\xb8>d\xbc\x06=-@\x05\xbeu\x7f\xba=\x85\x82\x1b\xbe\x1dA(<\xd5i}>K\xb4\xc3:\xd3\x9d\x04>@Z&>\xbda\xdd=\xb9\xa1?\xbdX8b=d\x1cY>\x93\xa4\x94=\xc0[\xec=0g\x96>\xa4v$\xbe\xb5\x9c]<-\xab)=\xed\xf4`=\xb8\xa0\x0c<5N\x91\xbd\xcd6%>\x88#\xdd=\x80\xe0\xfd=\x8f\t <x\xe8\x0c= QW\xbe\x05\xf5U>=\x19';\xb1:==\x95l\xb7>\x1e\x94\x81=\xa7'\x02\xbcC\xf36\xbd\x00\xd0[\xbd\xac\xd35>\xd3\x85\x91\xbd\xd5B$\xba\xdb\x11U=\x9f\x84\xa1='k\xe6<\xadLX=\x11\x84\x85=\xf9\xf6\xa6<\xad'\xe8<]\x88\xb2=\xbd\x02^\xbdm\x8a\xad<e\xee\xd8\xba\xec~\x8b=\xa18\xe6\xbd\x05\x94\x85>m:\x1c\xbck[V\xbe\x0c\xf9<>\x81\xc3\xb3\xbc\x97_\xe8=\xc5]c>\xbe\xec\xa4\xbd(\xe8\t<\xb4~\xd5\xbcw\xe3\xff\xbdhO3>\x94\xd8(>P\xady;\x83\x19q>\xed\xf7\x9d\xbd\xa9l\xa6=\xe38q=a\xe3;\xbe\xf16s=\xebU%\xbe\xa9\xa4\x8a\xbe\x18\xd5\x00\xbe;\x9a\xa5\xbc\x1d6\\\xbd\r\xf0\x92\xbe+\xacR>|\xb3W\xbd\x1dw|\xbd[\x8c\x85;\xdc\x02\x1f\xbe%\xc5\xed\xbc\x0c\x93\x9b>\xe1\xb8\x0e=_\x8b$<\x00\xaeh\xbe\x08\x19l\xbe{m\xc2<\x83\xf1\xb1=\xcb#c>\xf5{\xf9<\xf3S\xe4\xbdxT\xe2\xbb\x11\tQ>\xa98W<_\xef\x12>;\x07p=5\xf9H>\xe3\x16\x16\xbe>x\x10>\x04\x9b,=\x1d\xd3\xda=_\r\x01>\xde\xd0\x96>}#e>\xec\xbd\x9b=\xdb\x05i=\xf5\xdf0=H\x90\xac="
-p323
-tp324
-bsV503974858691452928
-p325
-g2
-(g3
-(I0
-tp326
-g5
-tp327
-Rp328
-(I1
-(I200
-tp329
-g12
-I00
-S'q\x9dR>\xb2\xe3\xa1=\x91\x123\xbeQ\x85\xbc<\xd5\x88\xb39_9\x06=CN\x0b\xbd\xee\xd2\xa7\xbd\xfcj\x9e\xbb\x8c\xd1k>h\x88u\xbdm\xbb\xe3\xbd\x17/\xf5\xbc\xe0\x05\xac\xbdo8\x81=\x90\x01\x15>D\n\x9d\xbd\xe4\x1c\x10\xbe\x11e\xc7\xbd\x17\x82\xa8\xbd\x87`\x88\xbdz\xe5\xa7;\x8a\xb9\x88=s.(>\xcfB/=\x00\x03\xfe\xbc\xe0d\xf0=\xe1\xd9\x0c=m\xb7$\xbe\xccPI\xbe\x9d\n\x02\xbe.L\x1d<\x860\x90<\x9e\xbc\x83\xbe\xa5Ir<\xba\x1d >/\xd4\x1a>\x05-\x97=A\xab\x18>\x1f+8\xbd"\xed"\xbeL\xce\x7f\xbd\x00\xa3\x9e88\xc6\xf0\xbc\xf4;\x10\xbe\xb9\xa5P\xbdg\xed,>\xf5\xa3\x07>\xaf\xd0\xa0=\xf8\xeas>\xad\xee\xad\xbdM\xf5O>\x0bA\xda\xbd$\x0c\xd1;h\ty\xbe\x0f\x84^<_%\t;\xddJ\x19\xbd)\xa0\xaf\xbex\x05Z\xbeI\x96z=\xed\xe8\x95>T>l>1\xfe\x87\xbdX\x1d\xfb<T\xc1_=L\xda1\xbe\x19_l>L\\\xd9=\x9d\x00\x08\xbe\xc0\x87W\xbe\xc4s\x85\xbe\xad\xe6\x13\xbe\x0b\x03*\xbdw\xe5\x18\xbdi\x06,\xbb\xc9\xba\x13=\xed\t\xa5=\xa5sQ>,-\xeb=\x898"=\\\x8do<K\x12\x85>O\xf1Z\xbe\x8b\x8c\x84<\rV\xa8\xbd\x9d^\xd0=Uk(\xbe\xb88I>\x17\xa9s\xbd\x00e\xe3\xbd\x15\x9et=\x8c\x0c\x1d\xbd\xd5\x1c\r\xbet3\x1c>Q)$\xbd\xec\xcd&>:\n\x97=\xa4\xf8\xb9=\xbd\xfb\xe1\xbd\x1as\xaa\xbcH \xe0=[r\xc8=\x13\xad\x8b=\xb9We>I\xc6\x1e\xbe\x9f\x1c\xfb\xbc\x93 4>\x81\x80\x1b<Y\xf9"\xbd3\xba\x98\xbe\xc5\x7f\xa6\xbd\x96\x9e\x19>\\\xf2\xe0=\xcb\x00\x07>$\xba\x80<\xf8\xb4H\xbecG(=9P\x1d\xbd\x00\x8dL\xbd\xd0\xdfZ>f?\x06><\xd11\xbc\xd2\x1a\xaa\xba\xdc\x84\x89\xbc\xe6\xd8\x15>\xad"\'\xbd\xf3*\x98=\x18\xe33=\xf1 \xc4=?vw<u\xb4W<j\xb9\x13\xbc?\x15\xe4<\xf9\xd7\xb8\xbd8\xd1$\xbb\x8c\\\xb3\xbcp\x05_=}\x8bS\xbe\x1b\xaa\x9a\xbc!\x0f\xee\xbd\'x\x01>\x93N\xda=\xc1\xbdG\xbeCUG>\xafu\x11>]\x11\xa0;CF\xc9>\xf3\x93\r\xbd`\xe5\x0e\xbb\xef\x0cA\xbd\xa9\x81\xc5\xbd-T\xe8=0V\xd0=\x1f\x89\x88\xbd\x9bt{>e, \xbe\xd7 -;\x895\xa9=\x01\xd8\x80\xbe_\xfb\x03\xbe\xc2\x15!\xbe\xe5\x0e\x97\xbe\x1f\xeaJ\xbe\x1d)*=G\x1d\xfc\xbb\x88\x05N\xbe\x93\'7>\xd3\x86N=\xe7\xb5 \xbd)\x0fR\xbdUq\x07\xbeE\xb3\x0c\xbeB\x98\x80>#\xfe?=\x0b\xc5\x12>\x02\x8f\x1f\xbe\xf0-\x8b\xbe)\xda\x9a=KAN=\xc5\xe2\x18>\xe9\xf3O=w\xec\x08\xbe%\x96\x9e\xbdO\x0c\x8c>\xf9\xa5N\xbc\xac\xbbB=Ra\'=\x8dA\x17>\xf3\x7f\x97;\xb4\x18o=\xb5\x8c\x91;\xb1t\x8d=\x83 \xd0=o\x02\x8c>|/K>/\xb5\x8b\xbc1\xa7r<\x13\t\x05>Y\x11\xf1\xbd'
-p330
-tp331
-bsV503977892116963328
-p332
-g2
-(g3
-(I0
-tp333
-g5
-tp334
-Rp335
-(I1
-(I200
-tp336
-g12
-I00
-S'\xc5\x92\x14?F\x8c\x1c\xbcp\x92\x0f\xbf\xba\xf97\xbeqa\xa2>v\x03\xed\xbc\xb0\xdd`=\xa8\x1b\x8c\xbe,G\xcd<\x0e\xb9\x98>^\x94\xd3\xbd\xc8Z@\xbd\xf4*q>\xa4\x99\x1a\xbe\x18\x8eU\xbe\xd48\xc2>\x14\x9c)\xbb\xcc\xa2?\xbd\x87\xb7\xa1\xbe\xb0\x01~91&\xad\xbe4\x8c\x1a>\x96I!>S\'\xce\xbd,\x8bK=z_\x8c\xbe\x1b\xc2\x8e>S\xa7\x03\xbeC\x98\xd0\xbe\x1a\xbb\'\xbef<\xa6=\xa2\xcc\xcd=\xe3/)\xbd\xc5I\xfd\xbe\xf3=z\xbcAf!>\xde\x18\\> \x94\x94>\x87\\\xaf>\x17\x00\x1d\xbe8=y\xbe\x03\xc8\x8b=d.2>\x1f\xca\xa6\xbe\xe9E2\xbe\x8bP\x1e\xbe\x0eO\xe2>\xdf\xc4+\xbdW\x1f\xc2=\xb1\xfe\x17?QB\x87=l\xa1%?\xe4\xf3\xc9\xbefOc>\xaa\xc2\xbc\xbezk\x85>\xf4\x80t>\xd7T"\xbeZ\x8b\xe7\xbe\xf7\xd1\x0c\xbf\x9a\xa4\xbc>\xdd0\xbe>6\x86\x0e>v@\xf0\xbd\xe8\xe6\x9c=V\xe50>\xaf.\x8b\xbec\r\xdc>\x89x\x06\xbe\x99\xb6C\xbe\xa8P\xef\xbe4&\xad\xbe\x10f\xbf\xbcLC\xc8\xbd\x0e\xae\x80\xber\xd7\x17=\x14\xb2!>\xd4\x9b\x00>\xfb)K>\xe2\xff\x8c>\x04\xe3\xda\xbd\x025c=\xdc\x9b\xcc>\xed\xc6R\xbe\x1b\xdb\n=\xdd\x90\xfc=\x963z>O\xe8\xb6\xbe\x90\'\x0b?\x8b\x96\x8b\xbdn\x14\xbc\xbe\x84\xc8%>\xc38\xaa\xbe\xa64 \xbe\xfew\xb7>\xba\xa9\x1d>\xc0\xf5\x88>\x15\xc4\x90>\x96\xa2G>\xb6#&\xbe\xca>Z<0\xeb\x81>\xf1Iv>8du>D$[>\xfd\x84\x86\xbe\xe42\x90=\xd5\x89\xbc>\x88Tl=\xac\xaf\xcd=EY\xc0\xbe87\x02=\x82\xa0\'>\x85\x92H=\x03\xdc\xb5\xbc149<Q\x9e\xea\xbe\xd5\x1a\xba>\x7f\xd0\x16\xbd\x9fs\xac=3\x9e\x01?M\xdc\x1e>~\xa9\xd3\xbd#=+>\xbf\xeb\x86=\xaa\xf8\xe0>%\xf5k\xbe\xd3@\xa2\xbc\x89\x84\xa4<B\xbc\xa7\xbb^\xed\x07>W\xb6\xe4=\x01\x81\xca=X\x18\xde=\xa6w\x00>\xc1b^>\xc2\xe8\xba\xbcQ\xebm=\x99\x0e\x06\xbe\x1e\xb5w=\xc9v\x9c\xbe\x1b\xab\x8c>\xc4\\\x8a=\x8a8\x00\xbf+\x96\xc8>i;\xa9=?\xc9\x88>\x84\xc2\n?E\xf5\x1c\xber\x9d\x8f\xbdW)\x07\xbeE\xf0\x19\xbe\xfb\xcb\xa6>\xd1\xc8S>\xa5\x83\x18=\n\xb9\xfe>\xb4\xb9L\xbe\x1c\xf6\xa9=\xe7f\xd2=\x85\xfb\xaf\xbe\xdbP\x99\xbd\xd2\x85P\xbeGB\x01\xbf\xed\xdf\xc2\xbe#\xa3,>\x93\x17+\xbe\x07j*\xbf{\xc4\x88>>\\\'=\x94H\x0e<\x10\xb5\x1e>h\xd05\xbe\x85{\x06\xbe\xd0\x1d(?\xaf)\xec=\xa8\xbc\xba=i\xdd\xaf\xbeIP-\xbf\xc9?\x86=\x92a">}\xa5\xba>H\xcf;=@\xc7\xbb\xbe=+(\xbe\x0f\xf8\xb5>\xa2J\r\xbd\xcf\xea\xb6>\x10J8>2N\x8c>\xe6\xc8\x9a=\xb9\x0f}>V\x9c\xea;E~P>f\x8b?<9\xf9 ?\x169\x9a>\xc3Ba\xbc\x10\x9c\xb7\xbd1\x01\xcb=t@\xc2='
-p337
-tp338
-bsV504225889786531840
-p339
-g2
-(g3
-(I0
-tp340
-g5
-tp341
-Rp342
-(I1
-(I200
-tp343
-g12
-I00
-S'Ru\x05?\xee(\xc8\xbd\x86\xb6?\xbf\x88\xdb\xe2;\xfb\xb6\xd2>\xa7\x91\x1a\xbe\xb5\xd9\x16>i\x82\xa0\xbe(\x06<=\xf2up=E\x90$\xbd\x92.\x00>w\xd7\xa7>\xb68\x98=\x83Ne\xbeV&\xd0>\x0e\xbf\x8c<\xb6\xdb\xc3=9\xc1\x94\xbe\x99\x8f\x84;K\xb3\x81\xbe(d\xba<\x01\x18\x8f>\x1d\x89\xbe\xbeC\x80\xc4;\x80\xce\x90\xbe\x99M\x9b>UOu\xbe\x83\n^\xbey\x8d|=\xebL\x1d=I\xe1\xf8\xbd\xd8e\xcf=\xdd\xe3\x16\xbf\x02\xe50\xbe\xc1\x99\xa9>k;\x00>zD\xc1>\xda\x9f\xda>V&\xaf\xbd\xa0\xc8\\\xbe\x87\x96\xc7=K\x15W>W\xfd\xd6\xbe\x99t\xab\xbe\xd7\xfdu\xbe\xe6\xc8\xfb>m\xef\xe9\xbd\x81\xac\xb7=C\xb6"?j\xc99>\xcb\xe2:?\x83g\xb0\xbe\x06t\x89>7\x9b\x8a\xbe\x0f,\xcf>\xc7\x1e\x0c>\xeb]\xc8\xbe\x12\xf5c\xbe\xf2\xd8+\xbf\xe1\x85\xb1>\xd6\x18\xea=\xbc\xc0\x8a\xbd5\xccg\xbe\x8dF\x81>B\x87}>w\x8d\xc3\xbe0\x925>\xf7H\x93\xbe\x85\x1fX\xbe\xe7q7\xbfY#\xae\xbe\x81u7=\xde9y\xbeg\x0f\xa2\xbe\x82\xe10>\xbe\xf5v>5Y\xcc<\xfb\x91x>\xf8@\xbc>\x9d\xd7W\xbe\xb7\x8aL>\x91\xb0\xbf>\xd8\x86\xc6\xbdbV\x88=\x9d\xfbx>H\xe9\xcc>\xff\x87\x1c\xbf\xab\x90H?\x0fT\xb3\xbdTG\x05\xbf\xb2t?>\xc5\x13\x00\xbfY\xb9\t<\xd0\xf6\xf2>\xfe\xe8\xa4>)\x0c5>\x1aT|>8o{>\xd8u\x1f\xbe\xab\xed\x8b=\x96O\xd4>!JM>\xdd \xcb>\x08\x90\xb1>\x9bu\xac\xbe\x9f3h==\x82\x87>-p\xa1=\x92\xdd*>\xeb\x98I\xbe\xae\xb0\x0e>v*\x96>w\xe3\xe3=\xf6\x98}\xbd\x07\xdd\xa4\xbd\xder\x14\xbf\xc0m\x08?7\x82R\xbd\xd7\xb35\xbd\x05S1?V\xf7\xd5=g\xa9\xb5\xbd\xfb\xe2%>\xee\x12i<\xcdp\xdb>\xb6\xf4\x84\xbe\x9b\xa9\x94\xbd\xe2V\xb0=\x1b\xec\x92=\xc3\xf9\xaa>B\xe7\x90>\xde\x83I>e?\x88=\xe2\x0c7>\xd6K\xe0>\x8aq\x0b\xbd\x16\x0e.=\r\x07\xae\xbc\x8a\xf0\x1f>\x0e-\xc7\xbe"\x97\x0c?+\xb2\xcf\xbd{\xa92\xbf9\xe9e>F\t\x99\xbe\t\x87\xa3>\xd1*\xec>F\x1d\xfd\xbdq\xee\x9c\xbc\xf2U>=;\x01t\xbd\x1e\x82\xb8>A%\x88>@*g>Q\xc1.?\x0f\xe5|\xbe\x8a\x8c)>\xf8\xe8<>U\x8b\x85\xbe\x95C\xb7=_\xa6\x9e\xbe\xf8{\x17\xbfX\xed\xb9\xbe\x08`\xeb= \xa7R\xbeq\na\xbf\xa7F\xb9>\x8f\xb9\xf3\xbc\xd5\xf2\x8a\xbc\x84\xd1\x8e>el\xa4\xbe\x83\xe4\xc0\xbdp\xd4.?\xc0\x1d\xd5=\x16\xfd\x17<\xc7h\x9d\xbeY\x11%\xbfi-e>\x92_<>iT\x0c?N`\x07\xbd\xebOk\xbe\xb2\x93\x1f\xbc\xe9(\x83>^n\xe4<\xff\x9e\x11?\x01\x037>\xab-\xae>\xcd\xe3\xa1\xbdC\xed\xdb>\x88l\x1d>\xb9\r\xd0>)9\xa7\xbcs22?\xabO\x9d>\xb2\x16Q<]\x90\xc9\xbc\xa2\xf5J\xbd0\xc5+>'
-p344
-tp345
-bsV504186032217419777
-p346
-g2
-(g3
-(I0
-tp347
-g5
-tp348
-Rp349
-(I1
-(I200
-tp350
-g12
-I00
-S'\xb4f\xe4>\xb0\xe6\xf0=\x1b\x0b\xbd\xbe\xb7\xd5\xae\xbc\xae\xbd#>\xa80\x13\xbc\xf5OL\xbd\xbd\xc6\x8b\xbe"l\xe3\xbc\xe3\x19\x8f>o\x19\x86\xbd\xb0\x17\xb3\xbd\x146\xd5=g\xc3\x8a\xbcg\x1e\x97\xbcv\xf3\xb0>\xd3\xa2\xe6\xbd\x06\x0c\x0b\xbeY\xfc8\xbeUU\xc7\xbd\x1a\xc1*\xbeK\x8d4;d\xb7>>uM?\xbc\xaf\x11E=-\xaf\x8a\xbdK\x980>\x89\xe3\xc5\xbd\x98\xfd\x82\xbe+\'\xa6\xbdfu\x94\xbd\x91\x17I\xbd\x14\xf9X=\xbd\xdb\xbb\xbe\xc7u\xa5=\x86\xdb\x85>z^\x82>c\x7fE>\xe7k\x95>\x94\x1c.\xbc\xf9y#\xbe\x90\xbe\xe6\xbd\xfa\xec\xff=\xef7D\xbe\xb5=;\xbe\xd0\xdb`\xbd\x07\x9f\xac>\xe2\xcc\x92=\xf9\x05\xb2=-\xa8\xf1>\x06\xb9<\xbd\x0b\xaf\xcb>\x03\xfe4\xbe{Y|=\xa4\xb6\xe4\xbe\xb51\xcd=?\xc6\x8f=\x9eL\xda\xbc\x8b\xed\x0e\xbfo\xf7\xdd\xbe\xbf(S>\xf0\x06\xb9>DSN>-\x08=\xbe\xf0\xe4\xd0\xbc\x8d^\x05>/Of\xbe\x03\x8e\xbd>\xa3\x94:=\x84\xddQ\xbe\rA\xef\xbe\xeb\x89\xc1\xbe\x9d\x918\xbe\xe7\x81\xd3\xbd\xc4\x81\xcb\xbdBM\x9f==\x9f\x98=\xe3w\x05>\'\xaef>X\r8><T\xad<\x85\xe9\xe4\xbcS\xa8\xb9>\xc4B\x90\xbe\x9a;\x00>\xf4\xe5\x1c=\x03\xd4\x82>%V\x89\xbe$\xe2\xe5>\x1c\xc1\x8f\xbd/kk\xbe3\xaa\x06>\xb2\xcbj\xbe\xc6/\x06\xbe>A\x93>\xe8G\x0b=\xc8\x90\x86>\xb6\x06s>\x8aj\xd5=\x90O\'\xbe\xd4\xe6\xc8;\x1fHa>\xf2\xb3\x16>\xc2#%>\xe5\x11\xd8>\x82"]\xbeA\xe2@<\xb5P\x87>w\x83\xa6<]\xa6\x9a\xbc\x80\xe1\xb1\xbe\x1d\xf8\xb3=\x84\x03\x8d>o\x914>s\x16\xb1=\xe3\x93\x14\xbd\xc3\x95\x9c\xbe\\RX>\xdd\xb06<\xa0\xf7\xa2<\xc9=\xeb>B\x88/>\xb1\xa1\x1b\xbd0\xb8\xf8<\\\x82\xa9\xbcN2r>Y\xd7\xe9\xbdT\xd8\xdb=\xf2\xcex=J,\xca=\x86w\x87=`<\xbf=\x02\xfd\x1d=\xc8\xc5E=\xf2\xc4\x9b\xbaj\x99\x9e<\xfb\xda\x15\xbd\xd6K\xb6<\xdb\x86b\xbe\xea\xdc\xca\xbc)lO\xbeZ\xd9}>\x07\x8d1>\xe6\xdf\xb3\xbet\xae\xbe>\x8e\n\xbd=\xd2\x83\xd8=UV\xf7>\xe6\xb8\xd1\xbd\x15Z\x1b\xbc\xd4<\xff\xbb\x17\xb4\x11\xbe \x0b\x86>\xe6\xef7>V\xb0\x04\xbdd$\xa6>\xa0\x8d3\xbe\x1cv\xa6=\xbb\x98\xaf=\x03C\xaf\xbe\xb4\xb3\xeb\xbd\xb6d\x8b\xbe\x17\x9d\xe6\xbe\xc2\nW\xbe(\xaf\x9f=F\x86X\xbd\xfe\x91\xc5\xbe\x84\x02\x94>EM\xbf=\x7f\xed\xcd\xbd3\xfd,\xbb\x0f\xa8f\xbeM\xa7E\xbe2\xcc\xdf>\x9c\xae7=\x00A\x11>\xa6\xc1\x9c\xbeOu\xf2\xbeQK\xc7=m\xc7\x0e>\x01(\x82>\xf9k#<\'\xb1o\xbe\xdf\xc4\xff\xbdk\xb1\xbd>\xa3y\xda\xbb\xb3\xf4=>\xa5\xf7\xa2=Wg\x84>\x15\x11\xe2\xbd\xe6\xef>>\xedD\xa5<,\xf7!>\xa3\x945>\x10\x15\x03?\xea\x92\xb2>\x9a\x9c\n\xbd\xa4\xec\xae<\xaf\xfb\xf0=\xb8\xdb_='
-p351
-tp352
-bsV503958497244229632
-p353
-g2
-(g3
-(I0
-tp354
-g5
-tp355
-Rp356
-(I1
-(I200
-tp357
-g12
-I00
-S'.q\xae>W\xaf\x06\xbe!\xcd\xce\xbe\xdd\x00\x00<C\xc6\x98>\x1ev\x9f\xbd\x82\xc7\x19=l\x19D\xbeQ \x0f\xbd\xf4|\r>\xean\xa6<\xde\x9b\x06=_^o>\xc5\xc4\xdf<\xb8\xe4\x11\xbe\xbf4\xa6>\xbd\xdc\x9e\xbb_&\x8c\xbb\x82\t/\xbe\x0c\xf3^<~\xd5]\xbe\x97\xf7\xf6<S\xc6W=\xd1h\x8c\xbe/\xf9S\xbd[\xed\x0e\xbe\xb7\x17Q>\x9djY\xbe\xbcw\x8a\xbew\xdb\x80=X\x05\xcc\xbd\x11 \x87\xbdg\x93\xeb=\x00\xc3\xb5\xbe\xfe\xedg\xbd\x1a\xd0w>{\xeb\x17>\x0b\xe9\n>2\xc8\x9a>\xf3\xf0\xb4<\xdf\x91\xf2\xbd\xf5<y<\x92vQ>\xf7w\x9e\xbe\xa2uM\xbefW\xee\xbd\x8ev\xbe>t{\xa0<\x99o\xb5=\x82\xe8\xc8>\xa5\xc1\xee=\xfc\xea\x06?\x99\xc5u\xbe\x05\xbb\xce={\xef\xb5\xbew&\x89>v[\x1f<\x17\x00R\xbe\xdbL\x9c\xbe\x196\xcc\xbed\xf2[>3I\xa4=&\x07\x06=\x8aj!\xbe\x8b\xf9\xf7="\x93e>\t\x80D\xbe7j%>\x05\x08\x82\xbe\xe1\x83G\xbe\x9a\x89\xe4\xbeu\xd5i\xbe\xae&{=\xbep\x0b\xbe{\x9e\x11\xbe#\xf4I>\xba\xf0\x8a>D\xb2\xfd=k\x85\xc2=\x998\x8e>\xbb\x03\xc6\xbd\x19U\xb4<\x18E\x9a>s\xf8\t\xbe\x81\xa3\x04=\xcbK\xb0=\x0eJu>3\x7f\xbb\xbe\x8a\xf8\x06?\x9bD\xf4<\x9d\x1c\x7f\xbe\x7fa\x18>{A\x8a\xbeZ\xa1\xae\xbcI\x96\xbd>\x8dl\xca=a\x97\xf7=\x8c\xa86>\xd9\x1c5>\x0b\xa1R\xbd\xbb\x16\xce=\xdc\x17\x89>\x7f\x1a(>\x0e\x97b>\xf3z\xa4>\x12\xdcp\xbe\xeeq[=+e\xcc=A\xf1w=\x1f\x0f\x89=\xe0\xaf\xe5\xbd\t\xf7$>\x17\x1a\xd4=\x85\x99\xd8=*\x12a\xbd\x83\xeb\x91=$\xa4\xc1\xbe\xe4\x05\xa5>ai\xdc<\xc8\xf4\x06<X\xd0\xf9>\xeafU=4\x1a\x96\xbat\x85\xb8<\x13k\xbc<,\x1c\xa1>\xc5\x8aa\xbeo\xc5\xa1\xbd+\x19\x16=\x8f\xba\x87=\xa1\xe0W=\xce\xf2\xe7=\xd8\x9eH>E\xc8\x1d<\x1a\xce\r>\t\x9aQ>\xa6a\xd2\xbc\x07\x8c\x13=D\xd6}=\xec\x7f7=\xd5dX\xbe\'\xa1\xc0>\x17\xb2j\xbc\\\xa0\xbb\xbe6\xa8->\x94\x7f\xdb\xbd?@M>\x00q\x97>\x9a`\'\xbeA0:=f, \xbd\x8c\x99\x94\xbd\xc5EX>\xf5\xe17>\xdb\xa0\xdb=^\x18\xd4>\xd7\x1d\xed\xbd%\xcb4>\xb3a\xd8=[\xb5q\xbe\xe1>\xd6=7\xd91\xbe\xc9\xf5\xc6\xbe\x16\xd6`\xbe)\xb3\x18=\x12\xcb\x08\xbehp\x08\xbf\xc4\xb5y>9\xef\x07\xbe\x92\xf5\x90\xbd\xe1\x1a\xff=f\xa6Q\xbe\xaf\xb7\x14=\x1b\x83\x02?\x12\xb5\x1a>\x14I\x98\xbb"\'d\xbe\x8c\x19\xaf\xbe\xa5p\xc2=\r2\x14>\xa0\xbf\xab>()p=\xfcP$\xbe\xc0#\x0e\xb9\xfe\xfc\x87>\x81\xca?\xbd\xe9\xbd\x92>i9\xcc=!\x01B>\xe0&\x9a\xbdl\xfa\x86>Z\x99\x84=\xef\x130>\x08Q\x90;pB\xc9>\x1f\xc8M>=\xda\xeb=\xa6\x84u=\nZ\x91=0\x8c\xfa='
-p358
-tp359
-bsV504228271882387456
-p360
-g2
-(g3
-(I0
-tp361
-g5
-tp362
-Rp363
-(I1
-(I200
-tp364
-g12
-I00
-S'Ru\x05?\xee(\xc8\xbd\x86\xb6?\xbf\x88\xdb\xe2;\xfb\xb6\xd2>\xa7\x91\x1a\xbe\xb5\xd9\x16>i\x82\xa0\xbe(\x06<=\xf2up=E\x90$\xbd\x92.\x00>w\xd7\xa7>\xb68\x98=\x83Ne\xbeV&\xd0>\x0e\xbf\x8c<\xb6\xdb\xc3=9\xc1\x94\xbe\x99\x8f\x84;K\xb3\x81\xbe(d\xba<\x01\x18\x8f>\x1d\x89\xbe\xbeC\x80\xc4;\x80\xce\x90\xbe\x99M\x9b>UOu\xbe\x83\n^\xbey\x8d|=\xebL\x1d=I\xe1\xf8\xbd\xd8e\xcf=\xdd\xe3\x16\xbf\x02\xe50\xbe\xc1\x99\xa9>k;\x00>zD\xc1>\xda\x9f\xda>V&\xaf\xbd\xa0\xc8\\\xbe\x87\x96\xc7=K\x15W>W\xfd\xd6\xbe\x99t\xab\xbe\xd7\xfdu\xbe\xe6\xc8\xfb>m\xef\xe9\xbd\x81\xac\xb7=C\xb6"?j\xc99>\xcb\xe2:?\x83g\xb0\xbe\x06t\x89>7\x9b\x8a\xbe\x0f,\xcf>\xc7\x1e\x0c>\xeb]\xc8\xbe\x12\xf5c\xbe\xf2\xd8+\xbf\xe1\x85\xb1>\xd6\x18\xea=\xbc\xc0\x8a\xbd5\xccg\xbe\x8dF\x81>B\x87}>w\x8d\xc3\xbe0\x925>\xf7H\x93\xbe\x85\x1fX\xbe\xe7q7\xbfY#\xae\xbe\x81u7=\xde9y\xbeg\x0f\xa2\xbe\x82\xe10>\xbe\xf5v>5Y\xcc<\xfb\x91x>\xf8@\xbc>\x9d\xd7W\xbe\xb7\x8aL>\x91\xb0\xbf>\xd8\x86\xc6\xbdbV\x88=\x9d\xfbx>H\xe9\xcc>\xff\x87\x1c\xbf\xab\x90H?\x0fT\xb3\xbdTG\x05\xbf\xb2t?>\xc5\x13\x00\xbfY\xb9\t<\xd0\xf6\xf2>\xfe\xe8\xa4>)\x0c5>\x1aT|>8o{>\xd8u\x1f\xbe\xab\xed\x8b=\x96O\xd4>!JM>\xdd \xcb>\x08\x90\xb1>\x9bu\xac\xbe\x9f3h==\x82\x87>-p\xa1=\x92\xdd*>\xeb\x98I\xbe\xae\xb0\x0e>v*\x96>w\xe3\xe3=\xf6\x98}\xbd\x07\xdd\xa4\xbd\xder\x14\xbf\xc0m\x08?7\x82R\xbd\xd7\xb35\xbd\x05S1?V\xf7\xd5=g\xa9\xb5\xbd\xfb\xe2%>\xee\x12i<\xcdp\xdb>\xb6\xf4\x84\xbe\x9b\xa9\x94\xbd\xe2V\xb0=\x1b\xec\x92=\xc3\xf9\xaa>B\xe7\x90>\xde\x83I>e?\x88=\xe2\x0c7>\xd6K\xe0>\x8aq\x0b\xbd\x16\x0e.=\r\x07\xae\xbc\x8a\xf0\x1f>\x0e-\xc7\xbe"\x97\x0c?+\xb2\xcf\xbd{\xa92\xbf9\xe9e>F\t\x99\xbe\t\x87\xa3>\xd1*\xec>F\x1d\xfd\xbdq\xee\x9c\xbc\xf2U>=;\x01t\xbd\x1e\x82\xb8>A%\x88>@*g>Q\xc1.?\x0f\xe5|\xbe\x8a\x8c)>\xf8\xe8<>U\x8b\x85\xbe\x95C\xb7=_\xa6\x9e\xbe\xf8{\x17\xbfX\xed\xb9\xbe\x08`\xeb= \xa7R\xbeq\na\xbf\xa7F\xb9>\x8f\xb9\xf3\xbc\xd5\xf2\x8a\xbc\x84\xd1\x8e>el\xa4\xbe\x83\xe4\xc0\xbdp\xd4.?\xc0\x1d\xd5=\x16\xfd\x17<\xc7h\x9d\xbeY\x11%\xbfi-e>\x92_<>iT\x0c?N`\x07\xbd\xebOk\xbe\xb2\x93\x1f\xbc\xe9(\x83>^n\xe4<\xff\x9e\x11?\x01\x037>\xab-\xae>\xcd\xe3\xa1\xbdC\xed\xdb>\x88l\x1d>\xb9\r\xd0>)9\xa7\xbcs22?\xabO\x9d>\xb2\x16Q<]\x90\xc9\xbc\xa2\xf5J\xbd0\xc5+>'
-p365
-tp366
-bsV504178112486051840
-p367
-g2
-(g3
-(I0
-tp368
-g5
-tp369
-Rp370
-(I1
-(I200
-tp371
-g12
-I00
-S"\xd7+#?\x89\xa2\xa6\xbd\r\xcff\xbf\xb8\xcd\xcb\xbb{i\xf6>7:\xc4\xbd\xb8\xf4n>\xa0\x87y\xbe\xfd\xa1\x04>\x17ED=\xe9%\xb9\xbd\xb3\r\xdd=\x1dh\xc8>3\x80\xbd=\xd8C\x8b\xbe\xd5\xc5\xc5>\x0b\xdev=,\x9e!>\x00\x1d\xa8\xbe;o\xef\xbcMaV\xbeSD\xbb=3\xfd\xaf>yR\xba\xbe\x98\xf3A=[\x12\xb9\xbeap\xa4>(\xc9?\xbeH}\x1d\xbeE\xce\xf1\xbbm\xba{==\x8e;\xbe\x11\xb4\xd4=w\xfe5\xbf\xb0\xb7\x95\xbe\r6\xb1>\xa1[\xac=A\x1b\xe8>{t\xec>\x0ck\x90\xbd\xa5\xf3w\xbeIZ?>\x9bmx>`\x9b\xf6\xbe\xff\n\xc1\xbe5t\xb8\xbe\xa58\x18?a\xde5\xbep\xaf\xbd=\x8fAJ?\xed\xf8x>\x8byd?s\xa3\xdf\xbe\xdf\xc9\xc8>0\xa4^\xbe\x08\x92\x00?m*.>\x9bG\xfd\xbe\t\x91\xb4\xbd\xc945\xbf\x0c\xb9\xe5>\xad\xdb\xc0=\xf5\xd3\t\xbe\xe1`\\\xbe\xa4?\xcd>\x98\xf1b>\x01$\x07\xbf\xa1\xeb1>\x08\x95\xb3\xbed\xffq\xbe?uE\xbf\x82\x08\x96\xbe\x8d\x00\n>\xc5\x0c\x9d\xbe\xad\x0f\xf6\xbeA\\\xb2=\x01\xa4+>+\xf1\xaa;C\no>\xc7]\xb6>\xb3\xd8\x93\xbe\xb9\x1db>\xa7A\xf3>\xcc\x12\x9d=8H:=T\xb9\xc4>\x13\xb4\xe4>\xa4N2\xbf\x9c8U?u\x88\xe9\xbd\xd522\xbf\xe36\x0e>\x04n,\xbf\x1b\x99O<t\x05\xff>\xa0\xa0\xff>\x0bZ@<\xc3\xed?>\x7f\xe2x>\x10\xd0O\xbe\xbf\nC=;\x87\xdb>=\xb7g>\x19_\xf8>\x03\x9ez>\x038\xc7\xbe\xc9t\xeb=;\xc3\xb7>\xf9t\x80=\xc9K\x84>\x18\x0e\x92\xbe\x98\xb0f==0\xdd>\x0e:\xa6=\xcc\xe5~\xbd\x87qP\xbe-\xd3.\xbf\x1f\xef$?\x98&\xb3\xbd\x85\xed\x10\xbe\x9f\xf8:?\xb8\xba\xfd<\xe3Y2\xbe\x13\xc5\x99>Uq6\xbb\xec\xcc\xc8>\x99\x18\x9c\xbe\xe2\x1d#\xbet\x8d\xdd=\xeb\x8d\xdd\xbb\x99\xff\x00?\x0c\xe5\xc6>1\xfcL>1\xde\x95=\x9d\xbfb>e\xad\x0c?\xcb\x05&\xbc\xedF\x99\xbc\xab\x9c|<T\x95P>\tq\xe6\xbeO\xae\x04?\x95%!\xbe\xe8w]\xbft.%>\xccS\xd7\xbeP\xf8\xc3>\xfd\xc6\xea>\x07\xf4\x11\xbe7\xe1\x10\xbd\x8b\xf5\x02>@7\xde;\xd1\xf5\xdd>\xcb\xcd\x92>\x99W\xa5>\xa8/Q?\x0c\xe1\x95\xbe\xa9\xf4<>\x0c\xd8b>\xf5\x15v\xbe'\x13\x7f=tA\xa5\xbe\xe4\xae\x17\xbf\xed\xfe\xe4\xbe\xb1\xd4|>\x8bh\xa8\xbe\xb2\xe5\x87\xbf\x91\x9d\xbc>|y\x8a<\xad\xcbn==0\xef>\x1d\x8b\x94\xbe\xa0{i\xbdKMK?U\xf1\x15>\xf4o\xb8<r\x98\x90\xbeO\x0f@\xbf\x1bc\x94>\xb9\xa5=>\x95E&? \x83\xb8\xbdirB\xbeI\x02\x9e\xbd\xad\x8f\x12>@\x9a\xf3\xbb\xd5\xc8%?ZK)>m?\xa7>\xa4i\xb0<yX\x0c?\xb9\x00,>\x16\xf2\x15?\xcc\x958\xbe\x05\x88X?3\xf2w>t\x93u\xbd\xd8\xf7\xba\xbc\xab\x97\xad\xbd\xcb\xd0\x92>"
-p372
-tp373
-bsV503978443415879682
-p374
-g2
-(g3
-(I0
-tp375
-g5
-tp376
-Rp377
-(I1
-(I200
-tp378
-g12
-I00
-S'13\xce>Y[2=\xca\x8e\xdf\xbe<\xa9<\xbd\xa2\x07\x86>\x80#\x92\xbd\xee&\x93<:=L\xbe !P\xbd\xc3\xcf\x0e>"\x02\xa1<\xfej1\xbcA\\0>G\x91\x84\xbbg\xe8\xb5\xbdp\x00\xaf>\xda\x03\x14\xbd\xf7\x89\xa3\xbd\xe6\xccF\xbe\xe5\x0cJ<_[u\xbe\xccY\x84=3B\x1d>\xfbS\xfc\xbd\x01"\xeb<\xc2U\x16\xbe\xce\xf0">\xe0\x8b\x0f\xbe/\xb3d\xbe\x1a\x97\x04\xbd>\xf0Y\xbb\x862\xf1\xbb\x1b\xd0c=\x17\xbf\x97\xbe\xd6`\xba<61.>b\xae\x14>\xa2\x16d>\xac\xc2\x8c>W\xd7\x85\xbdO\x8f\r\xbe\x98\x0e\n=\xfe\xe0<>U\x95\x8a\xbe\xa5\x17\xfb\xbd\xdf\x18\xbb\xbd\xa0Q\x9a>\xba\xd3\x16\xbdj7\xba=%\xbb\xd8>%\x84Y=\xdb1\xe9>\xf7\x91P\xbe,\x95\x02>vW\xad\xbeP+%>\x00\x05\xc2=>\x85\x0e\xbeB\xfb\xcd\xbeZt\xbf\xbe\xb4rn>!\x9dp>\xa3\xe3\x0b=\x95\x00\x14\xbej\xe1I=\xfcH\xe8=I\xcdQ\xbeF\xb0\x95>{\xd1$\xbe^i!\xbeN\xf8\xec\xbeOO\x86\xbe\xablm\xbd\x1b^.\xbd\xeb!\x19\xbe\xb43\xee=\xfas2>\xee\xfd\x9f=\xda\x11\x13>\x96/]>\x9f~\x90\xbd~Wt\xbc\xa4\x88w>\xa6tX\xbe\x0c\x83\x8c=\xd1\xd2\x0b>\x056\x86>\x8bh\x94\xbet\xb0\xf4>\'\xf4\x19\xbd\x1fl|\xbewU\x18>\xe2\x04\x9e\xbe\xe6\xc4\x84\xbd`T\x8d>p6">\xeb\xd82>{5s>V\xc3\xb6=\xbcS\x04\xbe\x02\x8f\xab=bO\x80>\xa5\xd4\x16>N\xe47>\x15\x10\xa9>\xe6=@\xbe\xf0\x88\x17=\x16\xa7Y>7\x18\x08=\xdc\x8d`=\xea\xafX\xbe\xfb\x9d\x14>\xcb3M>{/\x86=u_&\xbd\xd0#"\xbd1\xd0\xb9\xbe9M\x82>\xcay.<\xcf2\xc0=\xc7\x1e\xfc>\x9b/\x7f= \xab\x82\xbdr\xa7\xd7=J\x7f+=\xab\xc2\x83>\x1bf,\xbe\xea\x00\x02=vs\xa9<\xd7E\xfd<\xc7W\xbb=YL\xdf=u\x06\xb5=\xaaN\xea<d\xf6\xb1=\xd1\xce\xd9=\xdf\xdd\x87\xbc\xcb\xe4\x85<Q\x9c \xbd\x87\xdb(=\xf7\xbfH\xbe9\x01\x81>$P\x08=J\xd6\xb1\xbe\x07?\x99>y\xe3\xf4<d#\x1c>\x02X\xb6>\xda9\xf6\xbd\xf1\x14\x1a\xbcl\x9e\xdd<Us\xbd\xbd\x81>\x80>\x1e\x93\x19>\x0f\x93W=uP\xbc>\xab\x04\x02\xbe\xdc\xab\xc7=\x98\xa2\x04>\xef1\x81\xbe\xd26\x17=\xbb\xda(\xbe\x89G\x9b\xbeV\xf1r\xbe\xa0\x9c\x9d=\xfaO\x06\xbedx\xc8\xbeJ\xc9k>\xf4\x92\xb5<\x8c\x8cv\xbd\x1c\xe7\x9e=?\x8c\x0b\xbe\xa1\xa0\x97\xbd\x97R\xe7>\xf6\x83r=\xdf\xb9y=\xa4|\x88\xbe\xd9\xd5\xe2\xbe\x14\x16\x91=r[&>\xafn\x96>\xbb\x9f\xeb\xbc\xac\\=\xbeU\'@\xbd\x96;\x93>\t\x88>\xbd*Lb>\x1a]h=\xd2\xcfL>\x91\xfdg\xbd\x0b\x0bO>\x0fZ\xb4<\xd1\xdf\x07>L\xb2\xf7=\x86\xb7\xe1>\xdeQ\x81>\xca\xa1Y<\x8a\x91\x0b9A\x9c\x1f=\xab{\xb7='
-p379
-tp380
-bsV503961275836403712
-p381
-g2
-(g3
-(I0
-tp382
-g5
-tp383
-Rp384
-(I1
-(I200
-tp385
-g12
-I00
-S'\x8c("?\xfd\x92\xa4>p\xff%\xbf\xb3*\xd7=\xdc\x8b\x0e>s\x9c\xc0\xbd\xba\x18\xd5\xbd\xfb\x05\x8e\xbejC~=@d\x97>\x08\x0c\xd8\xbd\xafg\x1e\xbe\xbb\x9b\x9e\xbd\x101\xe0\xbd|\xef$>\x8a\x91\xef>[V[\xbd\x05\x18v\xbe\xadU\x91\xbeF\x9f\n\xbe\'\x9c\x0b\xbe\xe0\x82\xfd\xbbU\xf1\xb8>%\xa3\x18>uz\xaf=\xcbk\xd4\xbd;?a>\x1e\xe1[=\xff\x86\x87\xbe\x9a\x9d\x83\xbe\xaaN\x0e\xbe\x8a\xf7\xbe\xbc\x03\x15\x90\xbc\x8d\x00\x02\xbf\xe8\xe3\x7f=b\xed\xaf>\x8b\xb3\x85>\xe8\x9a\xaa>u\xa7\xdc>\xca\xfc+\xbe\xc3\x07\xb0\xbe\x13x\xfa\xbd\x9d\xdc\xea\xbc\n\x14\xe9\xbd\x8a\xb6\xd2\xbe\x1c\xe6(\xbeD\xfa\x02?X\xe4\xef=\xc9\x9b->V\x01-?\xd9\x89\xca\xbd\x90\xb9\xf6>\x1b3\x83\xbe\xe3m\x94=8\xe2\xea\xbe\x0cI\x9e=\x80\xef\t>\x941\x96\xbd\x84\xe7 \xbf\nS\x11\xbf@B7>7&-?\xd3Z\xcd>\xb9\xd8K\xbe\xfe-\x0e>\xb0\x9b\x1b=P\x92\xcf\xbe\xdf4\x0c?8\xe3$>5U\x8e\xbeX/?\xbf\xfb\x8a!\xbf\x1eI\xed\xbe\x8e\x94\xac\xbd\xaepL\xbep\x17\x11<\x8dx\xa1;\x96 \x05>P6\xea>\x85^z>\x1e,J=`M\x9f=\x18j\xd8>p\xa5\xc9\xbe\xfa\xf4\xdd=\xa6Te=\x06\x85\xab>:\x08\xcc\xbe%\xe9\x12?R\x92k\xbeJN\xd1\xbe/5\x8e>`\xd1\xc5\xbeFtH\xbe"$\x85>v\x06\xd8=\xec4\xcc>\x16VW> \x96\x16>\x063\x90\xberp\x83\xbc\xe9i\xa5>2{0>|6\x81>\xbd\x94\x05?U\xe7\xbf\xbe\xf5\x9c\x82\xbd\x8dD\x0c?\x99g\xa5<z\xd5x\xbc\xf9\xf9\'\xbf\xc5y\xd0\xbdj^\x0e?\x9d/~>~\x96m>\xea\xdc\x1d\xbe\xf9\xd2\x0e\xbf\xe9)F> \xf2\x90\xbd\xaaM\x9f\xbd\xf13\x18?\xcbc\xb2>`/\x1b\xbe\xf0s\x04>\x9bi\x08=&Z|>\xc1a=\xbe\xbdHY>\xcah\xaf=\x83F&>\xeeML>\x00\x07\x88>\xe97\x9a\xbc\xfb\x1a8=\x8b\xea&\xbecj\xf2:g\xe7E\xbdvbn=\xf3\xb1\r\xbfm\x85Y\xbd\xf8\xb3\xad\xbe\x96\xdc\x8c>\xa6\x9av>;i\x1a\xbf\xd5\xb3\xe3>\xfb\xde\xb7=\xe2\xda\xeb<b\ri?\x00\xf0\x9e\xbd\xb0\xbf\x9c\xbc*\xbfM>\xd8\xad:\xbd\xe4\xc1\xa3>\x93|O> \x1d\x84\xbd\xb2\x9a\x18?R\xfc\x94\xbe\x16\xf9W\xbcY\'\x84>*W\xf2\xbe\xf0P\x8f\xbe\xb6\xde\xdb\xbe\xe2\x8d\x14\xbf\xfa\xaa\xbe\xbe\xb3\xaf\x05>\x8c\xb1\x02\xbd\xa2\xc2\x02\xbf(\x1f\xef>]o\x97>\x8a\xea+\xbdf\\\xd2\xb9L\x87\xa1\xbe\xb5\xea\xcd\xbe\xf0\xed\x07?N\xdd\xdf<\xfd\xd3\xb4>\x12{\x98\xbe\xa5\xdaE\xbf\xf74\x8d>J\xd6b>\xa9\xf2\xc7>\x85\xc2D\xbd\xa2e\x95\xbe\x92\x89J\xbe\x8e\xe0\x0b?F\xe8\x15\xbd\x0e\xb8\x9a>}nq=\xe7\xb6\xbd>p\xf7\xc8\xbcpT\x97>\xda\x1b\x0f=\xd6W\x96>^\xb5\x8b>j\xbb(?\xe5k\xf7>\xbe\x06\x0b\xbe\xecg\x93=\xa3|=>jpV\xbe'
-p386
-tp387
-bsV504265522624475136
-p388
-g2
-(g3
-(I0
-tp389
-g5
-tp390
-Rp391
-(I1
-(I200
-tp392
-g12
-I00
-S'\xf1E:?r-h>p\xe4"\xbf\xda\xfb\x9c\xbd\xd0d;>\xd5\xa4\x94<RV!\xbdl\xd9\x84\xbe\x02\r\xc5=\x85\x03\xfd>W\xbf\x0f\xbeF+I\xbe\xae\r3\xbc5\xe0]\xbe\x80\xc7S\xbb\xbd\xd9\xdd>\xb3W\x90\xbd/\xb6<\xbe\xd8\x1a\xbb\xbe\x9b\'%\xbe\xf4\t\x82\xbe\xfb;\xa4=r\xe0\x9d>\xcdFf>7j\xd5=6\xe5Z\xbe3\xf9\x9a>\x1bz\xf0<\xb9`\xcf\xbe\xf3\xfd\xc3\xbe\x1bT\x90\xbda\x16\xfb<P\x98V\xbd\xbd\x14\x1f\xbf\xd9}\xd9\xbc\xbe\x1d\xb5>\xbe\x00\xa1>7\xa2\x98>\xee\xa8\xed>\xd6n5\xbeQ\xb6\xbc\xbe\x1b\xd6\x80\xbdS\xe7\x80=\xb5\xa2L\xbe%\xdd\x9f\xbe\x95\x05Q\xbe\x05\x8d\x16?\x10\r\xd8=9#2>`\xb0H?Jh\xe8\xbd\x8f\xcd$?\xa7o\xd7\xbe\xa5\x12\x1a>)\x9a\x05\xbf7Q!>\xeb\x10]>\xff\xdf\x00\xbe\xeb\x145\xbf\xa6\xa2\x1e\xbf\xdd\xa7\x9d>\x88::?q4\xbe>\xe3\xa0\xfe\xbdX\x9b\xd9=&\xa3\xc9=\xd7\r\xfa\xbeJU ?wd\x9b=\xc8\x80\xa1\xbe\xf6 $\xbf\xa7\xbd\x14\xbf\xa1\x92\x8a\xbe\xb7o\n\xbeJ3\x8c\xbe&#9\xbdK\x9fC=\x9d-\x10>\x80e\xcf>\x1c\x93\x86>5\xb3J\xbcv\xc3D=P\xd9\x15?\xb5H\xc9\xbe\xe3^\x90=FE\xc6<qb\x93>\xe2x\xf7\xbe\xceb"?\x97Q3\xbe\x18.\xec\xbe\xf8\x93J>\x13E\xbf\xbeORY\xbe\x13\xa4\xc5>\xd1Z\xe0=9\xed\xc4>f\x9e\x83>\xaapd>uS\x90\xbe\xf9\xb7\xa8\xbdP7\xa1>?u\x80>\xf8`L>\xa2\xc3\xb1>/\xd8\xce\xbe\t`\x89<B\x9b\x11?\x08\xb1\xdb<rS\x0c=\xad\x85;\xbf\x87f\x1a\xbe^\xb8\xe0>\x16\x06\x15>r\xbaW>>\xe4\x9b\xbd\x02#\x1a\xbf\x066\x93>%xP\xbd\r\xc2\x82\xbd\xe3\xec\x19?\x0e\xe7\x9d>\xfb\xb3)\xbe\xb7\x85/>\x0f\x96Z<\xf3m\xcc>`#D\xbe\xa6\x86\x02>\xealx=r)M=\x1e5_>\t\xf9 >\xafV\x1f\xbcg\xf75=\x05\x16\xa7\xbd!)\xc5=\xa2\xb2K\xbd\x7f{\x93=\x00\t\xf8\xbe\xcb\xd5N=~\xd7\xba\xbe\x83\xe5|>\xd9\xae7>*\x11#\xbf\x1e9\xf8>\x85\xa9G>\xb3\xe7\x12>\xd6\xa8l?a\xa6\xe0\xbdz\x97\x1b\xbdqQ\x1e\xbdx\x89-\xbev\xd6\xb3>s\x8bd>5\xcc\t\xbd\xa7\xfb"?+\xe3\xa5\xbe~\xb2\xa1;\x90"J>\x14\xfd\x06\xbfS\x16\xa3\xbe^M\xa7\xbe\xdam\'\xbf\xa6+\xfe\xbe\x85\xe6\\>]\xef\xc0\xbd\xbb\x892\xbfq\xce\xcd>\xb9lP>\x8f\xf0\x02\xbc5^\x85=\x13Z\x7f\xbe\x05V\x9f\xbe\xa7\x0f=?\xd7\xf5\xd1=\xcd\xc8\xa3>\x89\x17\xbe\xbe\x01\xee[\xbf\xed*\x14>\xe6\x1fX>\xf5\xf6\xed>Vz\xff<Q\xfe\xce\xbezs\x9a\xbe&m\x0f?VHs\xbd\x0eP\x9d>\xf6\xc7\xf9=\xcb5\xa8>w\x0c\x00>e\xdd\x7f>t\x81\x8a<\x05\x9b\xa0>\xe7w\x02>\x92\xfdK?2\x9c\xfc>\xf1`\xe5\xbd!e\x7f\xbbC+j> \xb4\x95\xbd'
-p393
-tp394
-bsV503959201912471552
-p395
-g2
-(g3
-(I0
-tp396
-g5
-tp397
-Rp398
-(I1
-(I200
-tp399
-g12
-I00
-S'\xebN\xac>\xaes\x83=k7\xa4\xbef\x05\x81\xbc\x1en\xf8=\xfd\x8b \xbd\xdf\xc4\xc3\xbc\xea\x93R\xbe\xa6\xbb>\xbd\x10\xff!>.\xcc\xdb\xbc\xb5\xe9\xe0\xbd\x90A\xf2=3Q\xf9\xbc\xa8\x0c\xdd<*\x1b\xa7>\xcf\xba\x91\xbd\xba\x8a\xfa\xbd!\x81!\xbe\xc6\x82,\xbd\x11B\x01\xbe\x10o\xa9\xbc`\xb0T>{|\x15=+\xd8W=\xf2a\x95\xbd\xba\xce\xc1=U}\xb6\xbd\xbe\x962\xbeb\xa3\x15\xbe:\xd6\xfa\xbd"\xbd\x11\xbd\x19\xd8)=^\x05\xaa\xbe%\x05\xcb=5\xdbE>\xad?V>\xdd`!>/D%>\x0eA#\xbcW\xac\x14\xbe?\xbc\xb1\xbd\xabU\x90\xbdv\x96\x00\xbe3\xa0S\xbej\xb3C\xbd\x82\xf0r>\xb9Z*=\xe2\xeak=\x17\xcb\xb5>\xe3ri\xbdK\xba\x96>\xe2P\x0c\xbe\x18\xa4A=\x1e\xe9l\xbe,0\x80=\x1d\xb5\x85=\x1d\x9c\x0c\xbdE\x07\xb2\xbe\xae\xbe\xbd\xbej\x95\xfb=\xf7\x95\xa7>)\xb4?>\xdbG\x0f\xbe\xfdM\x06<\xcaV\xf9=\x15i\x12\xbe\xb0\xae\x88>\xcd?\x89=+\xfeh\xbe\xa8\xd0\xad\xbe!\xe2\x9d\xbeX\xf7\x89\xbe\xd6\x7f\xbf\xbdm\xf8\xeb\xbd\x0bo\xc7<\xa5\xe1\xd3<\xaa\x16\xf1=\xa8<j>\xealO>\x93\x81\xe7<\xa5\xd5\x18=\x1b\xca\x88>\x13Fe\xbe[\x04\xe2=\n\xa93=\xadWC>\xfd\xff_\xbe\x93\xe9\xcd>c,\x0b\xbeu\x0bx\xbe[\xf9\x03>\xd7\xba+\xbe;\x9d\x02\xbe^\xc6_>\x86\x85\x9a<\xc0y\x94>\x06;(>~\xd7V=\x9e=\x12\xbe\xa5\xe3\\\xbd\xcej;>\xd6\xc4\x1f>u\x15?>\xf3\x06\xc8>\x00\xf64\xbeZ\xc4(<\xce\xc3\x86>k3\xfb<\x9f\xe1\x9a\xbc\xc8\xa8\x9a\xbe\x1d2\xdd<\xd6V9>\x02*\xdf=\x10\x07O=\x8e\xfe\x1b\xbc\xe4\x86\x8d\xbe\x05\xa5\xcc=\x8b~5\xbda\x1f\xb3\xbc\xa4\xab\xb2>\xe6hK>\x86\xea\xeb\xbbE\x8b4=-\x83\xd4\xbb\x9d\x16r>~\xd3\xfa\xbd\xa0.\x04>\xaf?2<B\xb5\xf8=+C?=\x03\x84\xef=\xcaIu=3\x89\xf3<\xd2#K\xbd7\xa9\xcc=zo[\xbdv\x0c:=\xa4x\x8d\xbe\xe3\xd8\x08\xbd\xea\xe6M\xbe\xe0\xe0g>C\xbd\xf7=\x8a\xab\x9e\xbe\xfd\xce\xa4>\x15\xf2@=\xc1\xbc\x03=\x16\x01\x01?j\xdb\x83\xbd\x82\xf8\xfb\xba\x82\xca#<\xd0\x19\x99\xbd\xaf\xc6A>;I\xcd=z0t;\'h\x9b>\xc6\xaa;\xbe\x86\xefM=\xbd\x18\xb6="&\x89\xbe\xbd\xbe\xe9\xbd\xe2f3\xbe\xae\x8b\xbb\xbeV\xf6x\xbe\xda&\x1f={\x9b\x88\xbcNz\xac\xbe\x9eA\x89>Z\x7f\xc4=\x83\xd5\xdd\xbdX\x80\x1a\xbd\x96\xf5\x86\xbe\x12\xf8x\xbe\x91\x8d\xa4>\x17\\\x80=V\xc7\x00>\x13\xf8J\xbe"Z\xcd\xbe"\xf0\x06>jS4>!\xab\x86>t\xd3\x14\xbd\x95l&\xbe\x0e\xf9\xfa\xbc\x8b\xb9\xb5>:\xae\x9a\xba\xc3\x0e\x8f>\xd8\xfdg=\xe2\x02Z>\xa2\x84\x83\xbd\x05S\x19>\xb8j\xb2;\xe8\x16\xfa=\xe5\xa8\x0f>JY\xcb>\x1bJ\x8f>\x8b\xb8\x8d\xbd\x08\xa4\x08\xbcS\xb4\xb5=#\np\xbd'
-p400
-tp401
-bsV503966600341360640
-p402
-g2
-(g3
-(I0
-tp403
-g5
-tp404
-Rp405
-(I1
-(I200
-tp406
-g12
-I00
-S'\xa6t\x95=.US\xbbjt\xc6\xbd\xe1\xb5\x18<V\x1b\x86=\xb0\xfeY\xbc?\xfb\x83\xbc\t\xf0\x9b\xbdU\xd5\xfa\xbcx\xafw=#\xa5Y<\x02\xfb\xe1\xbbn\n9=\xf6\xab\xba<\xef\xf9"\xbd\xfd7\xac=j\x1f\xe1\xbc\x10\x14\xd2\xbc\xb2\x11,\xbde}\x11\xbax/t\xbdz\x94\x86\xbc2g\xf2<\xee\nY\xbdL\x00*\xbc\x9aZ\x91\xbcn\x0b_=Z%w\xbd.\x13\x9b\xbd\xdb\xbb\xdb<\xad\xa0\x06\xbd\x8c\x8f"\xbd\xf6\x9fD=\x186\xb3\xbdF{\xf0;&o\xba=\xbd\x08:=\xab9\x0c=\x876\xa0=M\xb6\t=\xfa[n\xbc\xf69\x97\xbcC\t\x89=TP\x9d\xbd\xc0\x08-\xbd\xc2A\x8c\xbb \x9d\xc0=\x82\xf2\xb0<5\xca\xa6<i:\xcc=\xe74\x8b;\x92\xd5\xdc=\xd6\x1d\x00\xbd*K\x05\xbb8\xd2\x07\xbe\xb3\xa92=e\rv\xbc\xed\x93\xfb\xbc\x01\x0b\x11\xbe\xc3<\xf0\xbd\xf3\xb5Z=\x84\x0f\x05=\xc5Z\xc7;\xf2\xe7\x8f\xbd\xe3\xa4Y\xbc#y\x86=H\xb0f\xbdH\xd60=F\xdbu\xbd\xdeZ8\xbd\xee\xed\x0e\xbe\xdaR\xb1\xbdj\xfe\xad\xbaZ\xac\n\xbd\xfe\xca\xc1\xbc\xe5\xe5v=F\xf7\x9c=\x9b!\x11=\xfa}F=\xad]b=\x97\xac@\xbc\xfa^\xca:\n\x84\xc4=p\xc2\xa7\xbd2\x078=\x18T\x1f<\xa4\x08\x89=\x92p\xd2\xbd\xe3\xc3\x12>I\xd9\x94<18/\xbd~.\'=Fqj\xbd\xd8\x8b\x81;X\xa2\xcb=\xbe\xde\x86\xbb\xe3\xb8V=\xe6B\x88=\xa6\x1f\x1f=T\xc8\x80\xbc\xa7\x1c\xc2<\x0f\xcb\xb1=U\xb4\xf0<6u"=\x9d\xa2\xfd=N\xd5\x89\xbd\xbd\x8c\x7f;\xbe\xf8><\x1bb\xcb<\x16\xff{9\xbb+\xe3\xbc@\x17\x92=s\xe6\x1a=\x02\xcd]=\xcb\'\xdc;jZ\xad<\x06\xd3\xa7\xbd\x85\xfa\xa7=\xd2\x1e\xaa;z}\xbf<\x98t\x13>)\xd3\xb7<\xfb\xd1\x1f:\xe2k\xc5\xbc\xfd\xac\xd1\xbc\xe3\x9c\x8f=\xd2\x8d\t\xbdR *9$\x95\xab<\xcac\x0e={\x03{\xbb\xbd\x0cb<\xd6\xd4\xf3<\r\xa0\xe2;\x9a%\x1b<q\x0e\xc7<\xeaq\xd8\xbcs\x1c\xd6;\xf6\xa6h;\xf3\xd4\xd4<\xd0\x95*\xbdm5\xd0=\xa4+C\xbb\x9e\xfe\x9a\xbd01\xa0=P\x08\x1c\xba\x8b\x061=^\xfa\xba=\xba\xad\x0f\xbdyR6;5\xecy\xbc\xfb0X\xbd\xc3w\x96=\xb2\x87\x8c=\xc5Nz\xbb\xa5<\xbb=\xf5\x17\xd3\xbc9\xa3\x16=\xa2\xc3\xa5<h\x03\x9b\xbd\xb0Q\xc6<\xfc\xb2\x83\xbdN\x8c\xd9\xbd\xcdyQ\xbdV\xa10\xbc\x19\xe4\xac\xbc\x88\x89\xde\xbd\x92u\xa4=\x12`\xa7\xbc\x1ec\xbc\xbc\x96\xfb\xa6\xbb\xd0\xbd\x7f\xbd\xaaF\xd6\xbb\x9d\xac\xf4=\xbe\x8f\x8d<*Z\x9d;\x9d\'\xc7\xbd\x8e\xff\xb2\xbd\x93\xf2K;\xe0c\x15=\x16\x8d\xaf=\x0e-a<\r\x87>\xbd.\x90\xb8\xbb5;\xb7=\xfbRV:\xe4\x86;=\x9a\xe9\xa3<\x10_\xa4=\x85bx\xbd\xce\xfa[=_33</\x01\x0c=3]j=\xb0{\xdd=1\x8c\xbc=wr\x1b=\x16=\xe3<\x05\x9a\xd4<\xf3\x13\t='
-p407
-tp408
-bsV504246009006804992
-p409
-g2
-(g3
-(I0
-tp410
-g5
-tp411
-Rp412
-(I1
-(I200
-tp413
-g12
-I00
-S'.I\xfa>|P\xeb\xbc#\x9b\x03\xbf8\x0e\xd6\xbd\xd5\xb1\x8c>N\xdb\xb3\xbd\xff\xb9\x8e=\'\x14F\xbe.\xd2<\xbc\xe3\xee<>\x93;\x07\xbd`\xe8n<\\|\x80>\xac\x9a\x11\xbd, \xd1\xbd\xc4\x97\xad>\xf9\x81\xf3\xbcuds\xbd\xeff0\xbe\xb7?\xd0<\xd5\x18\xa8\xbe5\xdf\xf9=\xa7\xd3\xfc=\xf5\x85Q\xbeG\xfb\xc7\xba\xc3+?\xbek;u>o\xc7W\xbe\xdf\x07\x99\xbe\x9cG\xbc\xba\n\x10\x9a=\x84\x94\x19\xbd\x02\x8c\x99=\x0fW\xb6\xbe\xf9\xff\xb8;\xb4\x8aS>\xbd\xa8+>\xf0mV>\x80N\xc3>\xf2C\xf9\xbc\xdc(\x1e\xbec\xe6H=x\xa5]>\xb7E\xb1\xbeo\x8c\'\xbep$\xf7\xbd\xca\x84\xc0>d>M\xbd\xa1B\x8d=V\n\x00?\xbf\xd6\xae=\xf0\x16\x11?\xab\x8a\x99\xbe\xcb\x99\xfd=p\xfe\xba\xbe\xe2\xd5\x8e>\xd4\xa8\r>Z\xdf\x05\xbe\xdeX\xe6\xbeFq\xdb\xbeuz\xa6>\xc9\xb9}>\x00r\r=\xcc\xee2\xbe\xeb\xc9n=d\xb5E>\xfc\x95.\xbe\xc1\xcf\xa6>\xa2\xfbf\xbeW\x96\x1a\xbe$A\x04\xbf\'@\x93\xbe\xa9\xe7\xee\xbc\x9b\x89\xef\xbd4"P\xbe\x90\xe0\xfc=?\x1f3>\xdcn\xf1=\xcf\xf6\x14>kP~>i\x05\xe1\xbd\xebvQ\xbc\xae\xde\x97>\xdc\x1a;\xbe0u\x92=Y\x9e/>\x98\x12\x97>`o\x8c\xbeE\xf3\x08?\xc2\xf84\xbc\x04j\x8c\xbeB\x02O>x\xde\xb9\xbe\xf0\x99Z\xbd\xa2\x17\xb4>\xc8\xbb2>~\x1c\x1a>t_y>\xcd+\xd5=\x9c\x8a\x07\xbe\xf9\x17q=|\x9f\x90>\x9ecP>\xe0\xc4F>\x9c\xef\xc2>)\xe7e\xbeT\x1c_=\x9bAj>dC\xcc;\xecu\x97;\xafz\x82\xbe\xe3`\x0e>W=B>9I\xfb=\xb4I:\xbc\x00Ch\xbdE\xe1\xc4\xbeN\x9c\x9b>\x84\x03\x1c=;\x85\xa6=\xea>\x04?7\xb5\xbc=\xe4X\x99\xbd\xf9\xae\x14>\xc6\xa9\x8b=\xd41\xb4>\xe1xa\xbet\xdb\x0b\xbc\'\xf7v<\xe9\xe6&=\xcf\xdf\x19>+\x80\xfe=\x96\xc3\x0b>\xa2?\xff;\x01\xa8\xb7=J\xb9\x16>\x173;<]\x80\x8b\xbc\x82B\x1b<ew =\x80\xe4u\xbe\x11G\x92>+\xda\x0f=\xc7x\xe7\xbe\xc2f\x9e>9\x8f\xd0\xbb\xb7/\x82>.\x83\xaf>)\xba0\xbe\x9c8\x86\xbd\x19*\xe3\xbc;\x9f\xcc\xbd\xc3\xef\x8e>e87>\xc1\xc9\x95=\x99\xde\xe8>\x03\x98\x08\xbe\xd0\xd1,>\xf1G\xc5=\x1cr\x90\xbe\xe9\x9a\x03=\x8dq@\xbe\xdfz\xc0\xbe\xf5\x8a{\xbe\x19\xb3\xa1=\x88\x920\xbe\xb2J\x0b\xbf\xf8\xc1\x81>\xe1\xa5a=\xc9\'>\xbd\x8e\x7f\n>\xd1\xf2<\xbe\xbb\xd9\xc3\xbd3(\x16?\xfcV\x17>\n&\xb9<!\x88\xa1\xbe\xae\xba\t\xbf\xcfr\x88=\xc6\x1c->O\x92\x97>\xf5/2\xbd\xc5\xce\x80\xbe\xa3\xdd\x19\xbe%H|>\x95_f\xbd\xaeb\x92>9\'p=\xd7\x06}>\x9b}\xbe\xbd\xc4Mk>\x10GQ=\xa9\xaee>\x1b\xcb\x9f=\x1c\x16\x00?\x07^\x96>\xc5wX;O(\xa4\xbc^\xd0V;\xd5i/>'
-p414
-tp415
-bsV503973837701414912
-p416
-g2
-(g3
-(I0
-tp417
-g5
-tp418
-Rp419
-(I1
-(I200
-tp420
-g12
-I00
-S'\xa0=\x17?\xfc?B>HA\x13\xbf\xcb\xbf\xc9\xbc\x8f\t\x16>&2w<\x8fP\x01\xbd\xe7ip\xbeJ\x9b\xb6=z\x01\xca>\xa7CD\xbe\xc3\x85L\xbe6\xee<\xbd\xb2\\+\xbe\xae\xaa\xca=\x924\xde>Z=\xe5\xbdy-6\xbe/T\xaa\xbe$O_\xbeP\x18\x1f\xbe6\xc5\t\xbc\x1f]\xa6>\xe3\x90\x8e>\x1f\x95+>NxD\xbe\x81\xec\x9c>\xb8\x1b\x87=\xdf"\xa4\xbe`\xdd\xdd\xbe\xe6C2\xbe\xcf\xf4\xed<@\x05\xa4\xbd\xe9\xc4%\xbf\x9f\x9fB=\xe1i\x9f>\x9f\x1f\xa5>\xec8\xa1>\x03 \xc1>\\\x80o\xbe@o\xe7\xbep\xf5\x8b\xbd@L\xde\xbcC\x17^\xbd\x11\x01\xbb\xbe\x998W\xbe\x9c:\xd8>*#3>\xb8nX>\xa7L3?\xf8W\xa7\xbd_\x83\t?`P\xa6\xbe\xb8\xcd(>\x88\xdf\xd9\xbe\x8b\xef\xbb=\xdf\xdf\xf5=\x86\xf1\x01\xbe\x94H\x13\xbf%\xb2\x18\xbf\xf5\xcc}>6\xa2@?\xf3{\xf0>Z\xf4;\xbe.x6>\xcf\t\x8e\xbc\x1ae\xe6\xbe\x1a\x87\x10?NI\x99>?a\x9d\xbe\r6\x0e\xbf\x9d\xbe\x0c\xbf\xca\xf3\xa9\xbe\xebD\xfb\xbd`Cb\xbe\x06\xd8\xa1\xbdU?\xb1;\x02\xb4\x84=+\xed\xea>G\xe2\x9a>\xdd\xabJ<\xbc}\xc7=*\xc5\x04?\xc6\x12\xab\xbe\x11\x82\'=\xa8\xf7R<\xb3|\x93>\x80\xc1\xce\xbe\x0c\x17\x14?\xb5O\x8b\xbe}\xa4\xe6\xbe\xe3>7>y\xcf\x89\xbe\xc7\x00\x97\xbe\x1d~\x9d>\xd3q\xb6=\x80\x80\xcb>\x87XD>C\xd1L>\xa9\xc6\x92\xbe\xbcB\xc0\xbd\x15Vz>\x1c\x99b>8;\xa0>8\x8c\xe2>\xa6\x80\xc1\xbeNU\x12\xbd\xf3\x1a\x16?}\xf3\xda<\xa3p\x82<\x81\x833\xbfl\x8c\x86\xbe\xa3x\xf0>\x8a\r)>\xfa$2>cG\x84\xbd\x88\xd0\x0e\xbf\xc8\xbe\x17>\xc78\x88\xbd\x7f\xc4\x1c\xbe\x1f9\x15?W\xc5\x8f>yk\xbe\xbd-4\x16>\xe4\xf2\xc6<G.\xa2>\x99#+\xbe\xee\xe2\x04>H\xbf1>/\xa4F>(yR>\xfdY\x06>\xe6\xe9\x1b=\xb9\xc9}=\xb5S\x06\xbe\x0fX\xfe=\x01\x0b\x8d<\\\xdf\xd8=Fx\x10\xbf\x10h*\xbd\xc7\x04\xc6\xbe3g\x89>\xc6\xf9\x80>T\xed\x15\xbf\xe7\xec\xe4>m\x90>>-\xa7\x83=\xbc\xdcd?\xc7c\x9a\xbd\x01\xc9=\xbc\xd9u0<\xa1\xf5\x04\xbe\xb4\xb5\x8e>y\xd6(>\xe0\x94v\xbd\xb0\x8f\x1d?3\x17\xd7\xbe\x88\x1e\xd0\xb8\xce\x12W>`q\xf0\xbeq\xe6\xa6\xbe\xb2a\xcd\xbe\xb8m+\xbfa\x1b\xd7\xbeo\x1bX>\xa3\xe04<\xf1\xd3\x1a\xbf\xda\xf2\xd6>\xa6+8>\x0bA[\xbd\xf1\xb91=\x9e\xed\x8d\xbe\xa4\xe5\xc5\xbe\xcfh\x03?\xc0\xd3\x83=\xf5\xa8\xb2>Lr\x87\xbe\xe0\xc4A\xbf\x9a^\xa0> \xb6\x12>\xe3\xa1\xc1>\xe1\xe2@=\x93\xe9\xc3\xbe\xcauB\xbe\xffj\x0c?\xc04\xfb\xbc\np\x9a>\xe7\xac\x1b>\xad!\x97>\xefw =\xedy\x95>T\xbc\x90<\x8f\xb6\x82>\xed}S=\x88\xc95?\xfc\x8e\xc8>A\x95\xe4\xbdfzk\xbd\x99\x863> eb\xbe'
-p421
-tp422
-bsV503957197551075328
-p423
-g2
-(g3
-(I0
-tp424
-g5
-tp425
-Rp426
-(I1
-(I200
-tp427
-g12
-I00
-S'c\xc7\x90>\xf9\x1b\x14\xbeS&\x83\xbe\xb3Ac\xbc\x01\xc4\x83>o\xfd\x8c;\x98fs\xbd\xdd\xb1e\xbeH\x97\xee\xbc\xd7_j>\xb9\xe3\x8a=M\xb7\xa8\xba\xbd\x08A>\xb4\xf9\\=\xdd\xde,\xbe{\xe0\xa5>X\xf2\x8e\xbd\xef\xbd\xe6\xbc[>H\xbe$Lv\xbd\x19\x96\r\xbe$;u<T&\xf5<\x1a\x8f\x14\xbe-\x01\xd3\xbcpO\xe0\xbd\xb7\x89&>\x18\xe1A\xbe5%\x93\xbe\xc5\xc7\xb7\xbc\x17\x8bF\xbe\x7f<\'\xbd\xa0\xea\xdb=\xa3\xe5\xb5\xbe\x17\x0b\xe2\xbc \xd2\x82>i(d>\xa1\xda\xa1=\xc3\xf9e>\xa5\x8b\x85=\xf4_\xdb\xbdIy\x80\xbd\xfbO\x08>\xc3\x99q\xbe\xd3\xe8\x1a\xbe\x8e\xf7\x15\xbd\x95\xcf\xc1>|\x08\x82=\xad?\xb0=\x83\xbd\xb4>F]\x85=\xa0\xa6\xdb>\xe0\xd0U\xbe\x84\xac\x81=\xec\x06\xc7\xbe\x8dnY>\x9f3\xee\xbcK++\xbe\xaa/\xa6\xbea{\xc8\xbe=*B>U\x8c\x0b>\x8bK\xc6=\x18\xb0\xc3\xbd\xa8\xb6\xbb<\xb0\xeeB>%\x1ed\xbe\xb9h6>\xd5\xd6\x19\xbeg\xbdl\xbe\xdd\x9e\x9c\xbe\xb8;?\xbe\x84\xa8_=\xeb;\x13\xbe\xe4\x01\x9d\xbd\xbb\xb5+>\x1f\xf5z>\xfd\xfd\x0c>X\x08m=}\xd0o>y\xee_\xbdd\xd1\xa5;1\x03\xb3>\x0c\xda8\xbe,\x10_=\xbfv*\xbc\x88\xef,>d\xef\xba\xbe0\x00\xf2>\xdf\xb2\x83=\x042Y\xbe\xc3\x16\x81=\xfc\t)\xbe\xb9\xaf\x80\xbbk\xdd\xd2>\xbfd\xe9\xbcl\x19\x1f>\x97W6>\x15\xabS>1\xdd\xa5;\x10\x9a\xfd<\x7f\x0cu>\xe1&\x1f>!7->\x84e\x96>\xf9MJ\xbe,.\xc8=\xb8\x98p=k\x7f\xc9=\x84\xa6+=\x8d\xc9\x0f\xbe\xe9h\xe0=5\xd1\x03=\xbd\xbcS=#\xba\xc3\xbcps >\x11\xb8\xab\xbe\xaf4\x8a>\xff\xa2\x0c=\x85\t\x02<\xcf\xf0\xc7>\x8d\xe3\xf3=\xb4\xe4L=\x05z\xa3\xbde\x0b$\xbd\x8cT\x9e>\xe3)\t\xbe\x8a\xbc\x83\xbd\xbbl\x00=\xef\xe8#=\xf0\x81E\xbc\x83z\x90=\xc3W)>\xeeu\x92:\x90\x01\xec=\xd9\xc2L>\x98p+\xbd\x87EU=->\x87\xbcy\xc9\x10=4\xc0*\xbe\xd9\x83\xa3>\x14\xe7\x1b<P8~\xbe\x0ciB>]\xbf\xc7\xbb\xb3\xfb">!\xe2\xa4>\xe44+\xbe\xe1\xe5\xc6=\xaf\x95\t\xbe\xb1I\x1c\xbe]\x94J>\x14\xff4>\x99\xfa\x87=\x05\xa4\xa1>\x1b\xae\n\xbe)a!>\xa7\xad\xc6=\xb0tu\xbe\\\xadV=\x81\x92\x04\xbe\t+\xd4\xbe\xd9\xba3\xbe,91<\xf5\x81A\xbdA\xc3\xf5\xbe\xeb\xae\x82>\xd4"^\xbekY\xba\xbdS\xb7\x1f=\xc1\xf8<\xbe\xb4\xbe?=\xbd3\xf4>\xd8\x86\n>1F-=$xT\xbe\xb5\xb6}\xbe\x17\'\x7f=\x0c9\xf3=\xe1\xd7\xab>{\xaf\x0e>u\xa7"\xbe\x89\x8d\xa2<8\x10\xa7>\xff\xb6\x93\xbc\xd7\x07j>j\xcc\x13>w\xd7\x08>\x17\x13Q\xbb\x9c/d>1\xe9\x8c=tG\xba=\x19\x83\x0b;\xa7z\xcb>\x84\x13@>\x13s0>\x157\xb0=ks >7\xc9\xc4='
-p428
-tp429
-bsV503959933692690432
-p430
-g2
-(g3
-(I0
-tp431
-g5
-tp432
-Rp433
-(I1
-(I200
-tp434
-g12
-I00
-S'\x81\x0c\xf8>`\xffV;\x01J\x01\xbf\x88\xb4\xd2\xbdtU\x8a>eA\xd8\xbc\x15\xc9\xef\xba\x8d4z\xbe&\xef\x82<N\xfd\x91>\xeb\xc1\\\xbd\xc5\x9f\x19<\x85{B>\xb1\xe5\xb8\xbd\x9f\xb8\x16\xbe#\x19\xa1>\x96K(\xbd\xf8\xddF\xbd|pr\xbe\xd5\xbc\xdf;\x15E\x9b\xbe\xf4\'\xc2=W\x11\x15>\xe9\xe8$\xbeO\xc8\x1a<\x98\x12D\xbe\x0bc\x85>4\xfa\x10\xbe}\xec\xb0\xbe\xf7\xba\r\xbd\xeb\xaf\xde=\x80Z\xca;c>$<al\xc6\xbe+\xbb\x85\xbb\x94\xe6^>w=C>\xef"k>u\xd6\xbf>\xf9\xce\xaa\xbd\xdc\xce<\xbe\xc1R>=+\xc0q>w+\x95\xbe\xbf\xe6\x1c\xbe\xc9)\xde\xbd\xb0\xfa\xe8>\xcc\x97K\xbc\xb0`\x99=W~\x06?\xe5=\x8e=\xff\x86\x0e?f\x08\xa0\xbe\xfb\xc4\t>\xdd\xae\xdb\xbe!Q\x88>\x05\xad\x19>X0\xf9\xbd#\xa5\xf4\xbe\x01n\xf2\xbe\xa77\xad>3\x06\x95>\xf4\n\xa1=\xd9\x83,\xbe\xf0=\xff<\xd3\xb2,>\xd7)\x88\xbe\x03\x1a\xbf>\xe9z>\xbe\xfd\x19\xe6\xbd\x88\xf1\xf9\xbe\xc4\xd9\xae\xbe+\x8ep:\xfd\xc5\xba\xbd\xbd^H\xbe\x0f!\xdc=\xf3\xed3>\x87\t\xf3=\xa33,>u\xddH>os\xaf\xbd\x13\\B<\x8f\xdb\xb6>#\xccd\xbe\x19\xc2\xae=]\xb2\xff=\xeb\x94\x85>\x8c\\\xac\xbe\t\xdd\xfb>\x93\xf8:<\xe2\x18\x95\xbe\x0cK5>M\xd8\xa0\xbe\xe7\x01f\xbd\x04\x01\xb2>\xd1\x17\xa2=\x8d\x82B>$P\x88>S\x86<>\xb3F\xff\xbdY$V=\xaa.\x82>\x05V9>Y\xb2B>\x9c\x99\x8a>\x89+\x84\xbelc^=]B\x82>\xf0\x0b\xea<\xa3\xaf\x01=\xab5\x99\xbe\x90!\xb7=\xfd\xd5R>U\xb2\x00>\x8d3\xce<\xb5\x00\xee\xbcKU\xc9\xbeq\xd5\xa7>\xf5\'\x11;\xa5a\xca=\xed\x8c\x02?\xcb\x81\xff=}4\xe6\xbd\x14\xe7\xd0=\xc5\x144=\x81*\xb7>\xdb}+\xbe\x18\xeb\xea\xbcP\xe5\xef<\xf8\xf1~\xbc\xb6?\x14>k{\xef=m\x1e\x8c=\xd9\xed\x8a=\x84X\xc1=u\x88!>\xd4_\xa8\xbb\x7f~\x02=\xbfm\xac\xbdyQ\x9f=]\xe5n\xbe\n\xef\x88>\xfd\xe53=(\x92\xdf\xbe\nC\xa2>\x808)=\xf3\x18\x82>\x0c\xb6\xd2>\xf8n1\xbe\xcd\xc1\x7f\xbd\x85H\xa6\xbd{\x00\x1f\xbeg\xed\x91>s\x0cg>\xd8\x90<<mf\xdb>\xa9\xe6\x10\xbe\x17\xef\xb7=\xd9\xed\xac=\xbf\xba\xa1\xbe\x01\\\xaf\xbc\xd8\x95c\xbe\x0b\x01\xda\xbe\xc7t\x86\xbe\xc3\x1b\xcf=\xab\xbf\x17\xbe\xf9\xc8\x0c\xbf\\\xa6\x92>\x19\xef\x8b<q\xb6\x99\xbcmN\xe5=\xe8\x1f\x0c\xbem7\xad\xbd\x1e\xb2\x1a?_\x92\xaf=\xdd`\x7f=Q\x9e\xa9\xbes\x1d\x0c\xbfH\xfa\xd3<c\xb0\n>\xe91\x99>%\x84\x1c=\xf9^\x97\xbe\xd9\xb8:\xbe\x87\x8e\x91>\x1f\x97\x17\xbd\xd3\x18\x90>K\xe1\xfb=-w\x8f>3\x82\xf6\xbcq|S>t\x1a+=\xbd?_>\x01\t\x8f=%\xa9\x0c?`Z\xa8>8\x9e\xe5<\x16F\x97\xbc\xf1\xf5\x88=Od\x12>'
-p435
-tp436
-bsV504231423264317440
-p437
-g2
-(g3
-(I0
-tp438
-g5
-tp439
-Rp440
-(I1
-(I200
-tp441
-g12
-I00
-S'd\xd6\xcd>\xad\x1f\xd8\xbc\x91\xcb\xdc\xbe\xb2\x9d1\xbd\xa4-\xab>\x96*\xbd\xbd\xd5\x02\x9b=\x93\x9aP\xbe\xf6\xfc\xbc\xbd\xecu\xbd=\x1cD\xb5=\x95\x89d=\x1c)\x9b>\x0e\x9e\xc0=\xd2::\xbetH\xac>\x8e\xc3\x947\xd7\x12\xcd;\xcex\x12\xbe\xdc\xc0\x9d=GO\x8a\xbe@\xee\xdb=+\xef\xd0=J\xfb\xb0\xbe\x80\xfcm\xbc\x14\xf7\x1e\xbe\xe8;->\x9c\xc1\x8b\xbe\xfeXz\xbe\xb0\xde4>\xfcjC=!\xb5\xd9\xbd\xf7\xcc*>$\x12v\xbe$\x95\t\xbc1\xee\x1b>\xf4\x1d\xb1=;\x8c1>\x8b\xff\xa9>\x97\x0b\xf0<nO\xa8\xbc\xf4\x92*=\x92\xdc\xa3>\xa8\x94\xdc\xbeT\x0b\xa0\xbdLWz\xbd\xbc!\xb6>\xe4\xbfo\xbd\x8b>3=\xe3e\xce>`=\xea=\xf4 \n?\xe0cj\xbe5<\xf6=\xc5\x11\xcc\xbe\xbc\xb3k>\xfd\xfb\x0b=\xa8\xc3\x0e\xbe}\x15\xd0\xbe"6\xba\xbe\xd5\x9d\x8b>*&\xd5<x\xc8\xa5\xbd\xfbi0\xbe\x85\xcd\xa2<73A>A>#\xbe\x81\x1d5>d\x81\xad\xbeE\x1a\x08\xbe4\xe4\x07\xbf\x04":\xbeC\xe4\xd6=p\xdc\xe0\xbdd\xf5\x0b\xbe\xd4\x07m>\x89ae>\xaa\xe9\xd4=+U\xfa<\xb5\xd3j>\x000\x12\xbe\xafO\x86\xbd\x05\t}>\xb9$\xf4\xbd\n\xf7\xcd=RtU>;\xd9\xb8>\\{\x97\xbe\x87\x99\xff>\x12\xf8\'=\x8f\xa1R\xbe\xbdI\x16>3\xc2\xc7\xbe4\xa4$=\nT\x9c>\x13T[>,B@=W\x9f\x84>\xf5\x0e{=K\xfd\x9b\xbd\x90U2>\x1a&\x99>\x17\xba(>\xd9\x0c\x1f>\x8a\xb8\xb3>\xfe\xcc\x0f\xbe\xb9N\x90=\xf4\xf8\xa0=\xec\xa2\xe7<\xb1\x82\x94=\x04\xa5n\xbd\x14\x01\xab>1\xaf$>\xc2\xfb\x8e=\x80\x8a\x01\xbeE\x8ed\xbd\xacZ\x97\xbe\xdb\xc0\xc0>Z\xc8\xde=>\xf1\n>\x17\xfa\x0b?\x08\xaf\x14\xbd2\xb7[\xbd\x01\x14\xb9=\xaf\x90\x04=\\x~>\x9b\xadI\xbe\x9f\xee.\xbd\x88\x8a\x16=Y_7<\x98\xe4\x88=\x9c(\x8a=\x9f0\x10>\x18\x92A\xbc\xbc\xfbR>Lf\xd2=\xe8}\x84\xbc\x08xc\xbd\xf9=@>\x18\x1e\xa4=\x1bi\x1f\xbe\\U\x9e>\xf4y\x87\xbckA\xa7\xbe\xa7\xf1e>\x03(\xbf\xbd\x04va>\xdbP\xfe=\x89O*\xbeI\xd9\x85\xbc\x1c\x1a\x1d=\x84\x11\x90\xbd7\x8f\x86>\xf4\x12N>\x07+\xf4=_\xc8\xb5>\xc2k\x83\xbc\x0co5>\x9d\xc1\xa5=\xd3lZ\xbeLa#>i\x14:\xbe\x17\x94q\xbe\xf7\xea\x1e\xbe\xeb\x159=\xf7y5\xbe$\xaf\xd9\xbe\xdf`3>Nz*\xbd\\Q\xa1\xbd\xe8\x12\x03>\x1b7\t\xbe\xedt\xa4=Z\xfe\x05?\xb5\x16\xfc=\x82\x80x\xbd\x99\xfc\x9f\xbej\xa6\xc2\xbe;\x84\x92;\xe1*.>\xfc\x82\x8d>\xf9\xc8\x16\xbd\x8e@\x1a\xbe\xf26\x17\xbd\x00/%>g\x8d/\xbd\x1c\n/>\xff\x1c\t=5fO>\\W\x1a\xbe7g\x8b>\x83D.=\xeb\x1f&>U\xad\xe7=\xc4\x10\xc9>\xdb\xa1T>\x9c\x90\\=\xa7n\x94=\x07M5\xbap\xb3\x9d>'
-p442
-tp443
-bsV503967528658280448
-p444
-g2
-(g3
-(I0
-tp445
-g5
-tp446
-Rp447
-(I1
-(I200
-tp448
-g12
-I00
-S"<\x0b\x0e?!\xe1\xcc<\x07|\x10\xbf^\x93\r\xbe\x07T\x8a>\xaaA\xb0\xbc[Z\x11=\xe4\x93\x84\xbenT\xc7<\xa8\xf7\x9c>\x02\x9b\xec\xbdj\xa8S\xbd\xf1\x8aJ>\x1f\xca\r\xbe\x10\x91\x1b\xbexs\xbb>]\xa7V\xbd\xdb\xd8\x8b\xbd>O\x93\xbeZ%\xbb\xbc\xa6\xe5\xa3\xbeN=\xe6=\x18e.>\xf8n\xa1\xbd\xe1\x8eM=\xf2jv\xbe\x11X\x94>\xc8\xee\xc4\xbd\x9f^\xc1\xbeuY\x17\xbe72j=\x1a\x9d\xa3=\xfa&\x19\xbd\r!\xfb\xbe\xc0\xb7\x1e\xbd\xee\xe0h>_Kl>\xe3\xa8\x97>5\x1d\xc3>\x8b^\x1b\xbeC\xd0|\xbe\xe5\xaf~=\x91\x9a.>\x94\xa4\x91\xbe\xefaS\xbe\x98\x8c\x1f\xbe\x9d\xc8\xdf>W.6\xbc\x1d\xf4\xd6=\xb1\xc4\x1b?\x12\xda^=h\x90\x1c?;M\xb6\xbe\xe6\x12Q>\x85\t\xd1\xbe\xf0D\x88>\xcd\xafX>y\xb8'\xbeX\xbd\xf7\xbe;\xaa\x0b\xbf\xfaT\xb7>\xd7a\xca>\x12\xb9\x17>\x9bI\xff\xbd\xe2\xc2\xbe=\xefJ2>\x85O\x9e\xbeIr\xdf>\x86z\xbc\xbd\x8e\x8eC\xbe\x9e\xd1\xff\xbe\x1a3\xc3\xbe.-y\xbd\t\x89\xbf\xbdR\xfao\xbe\xd5-[=\x96r(>GW\xdf=\x85\xb9z>\x90\xb5\x86>\x108\xa7\xbd\x99\x95(=\xf8\xcd\xce>\x80\x90~\xbe\xef\xd0(=&\xf2\xdf=\x10C}>;\xdd\xc4\xbe\xab\xb8\t?\x86\xd5\x8d\xbd.i\xb9\xbe\xe0\xa3&>\xb5o\xa6\xbe\xd0\x18!\xbe\x951\xb7>5\x99\x11>\xd9S\x89>[o\x8d>\xa2\xd3R>\xc3\x9d!\xbe\xf5\xa62<G\x97\x8c>1\x8cb>\x05Zv>\xd7\xf4\x8d>\x0eD\x96\xbe~rE=\x9f\xb1\xb9>\x17\xc7\x1a=\xf3<z=I\xaa\xc3\xbe\x99\xcd\xc4<9\xb0n>\xc1\xfd\xe3=_\x97\x1e=\x12\xc7\x14\xbd\xf5\xf9\xf3\xbee\xa2\xb7>\x7f\x95S\xbdNpj=\xbdt\x08?X\xf4'>\xdb}\x02\xbec\xdc\x00>\xb8BC=6k\xca>u\x01N\xbe{A};1\x8e\x03=\xf2\xb1\xd0\xbb\xad=&>\xe2\x03\x11>\xb5\xaf\xae=\xcf\xb4\xc4='\xce\x9f=JjP>\x02\x10\xc6\xbcVH/=\x8ep2\xbe\t\x8c\x94=#\xc5\x94\xbe\x034\x99>e\xad\xa9=\xb3\x98\xfd\xbe\x81r\xc3>\x0b\xdc\xda=\x85u\x83>/\xb3\x0f?\xd5n\x13\xbe9\xa4N\xbd\xfe[\xd5\xbd\x0b\xee)\xbe\xeb\xa1\xab>\xb36~>!L\x01=\x82\x83\x01?0\xa1d\xbeJ\xea\xc4=5\x8e\x03>\x81\x0f\xbf\xbeR\xff\xb9\xbd\x13\x97\x80\xbe\xcf\x8e\x07\xbf\xa9(\xbf\xbe\xdd\x86\x19>--4\xbe_m)\xbf\xf9Y\x8a>\xae\xc1c=\x90\xa5\xef;\xf0\xcb\xfb=}\xc0H\xbe\x0e\xd9\x18\xbe\x98\x0b#?'\xbf\x97=\xed\x99\x02>r\xd6\xb6\xbe/\xbf)\xbf\r\xaa\x8d=\xde\xda\x0f>\xe3\x9c\xbf>\x935\x1e=\x92`\xb1\xbe\x16/E\xbeK?\xb9>\x9f\x1f$\xbd\x97\xa3\xa2>\xed#5>\xcb\xd1\x95>Go\x1c=\x95Nc>j\x83\x01=~\xd2o>\xdaa`=\x03\xd8$?r\xc2\xb2>\x0e\x02\x84\xbb\xf6\xc8\x88\xbd{\xa6\xc0=\x97\x1c}="
-p449
-tp450
-bsV503960265302343680
-p451
-g2
-(g3
-(I0
-tp452
-g5
-tp453
-Rp454
-(I1
-(I200
-tp455
-g12
-I00
-S'L\x8b\xef>\x82s\xfa=\xa9]\x1c\xbf&\x98P=\x01\x07\'>\xf2\xaeV\xbd]\xc0\xac\xbd\xbe\x8aa\xbe|\x16\x8a=\xb7K7>\x83\xb7&\xbeX\x0c\x18\xbe\xed\xff\xe2=\xe5\xfe)\xbeo\xe1U>" \xe0>.\x14\x8c\xbd\x14R\x1e\xbe\x8d_\x84\xbe\x0cV\xc9\xbd\x8bG)\xbe\xc5[\xbb\xbd\xdc\x0f\xa2>\x91\x04\xb1=\xbc3\xcd=\x17\xd5\x1d\xbe0[c>o\x98\xad=\x9a\xcb\x8d\xbeo\x88Q\xbe\xa5\xb70\xbe\n\x84\x91<\xd0\xcf\t\xbd\xcaR\x0e\xbf\xfe\xd11=Y\xb3t>\x00^z>\xe1h\x81>\xb3#\xc8>T\xe9(\xbe\x003\xab\xbe`\x9d|\xbdi\n\x1c\xbeb\x86\xdc\xbc9\xb6\xdd\xbeK\xa1x\xbeE\x92\xf7>j\xbf >\x06\xaf@>\x9f\xc2\x06?\xd7\x90\xdb\xbb\xb9\x88\xf3>\xe4\x0e[\xbe1\x7f\xdb=\x18\xe2\x8e\xbe\x996\x13>|h\xae=%ct\xbd\t,\xd7\xbe\x9b\xd0\xf6\xbe\xe5\x03+>\x87\\\x16?\xf5\xa2\xd5>\xd7\xe3Z\xbe\x00\x9b\x13>\xda\xa4a=\xfe\x0e\x96\xbe\xe1\xbc\xd6>d\x92\\>\xbc\xf9e\xbeP\x82\x18\xbf\xb1\x0e\x1c\xbf40\xd4\xbe\xb4\xe6a\xbd]\x17O\xbeB\x925\xba\xd9%\x03;2|\xfd=2\xbf\xe7>5\x0c\x86>\xee\xac\x13={U\n>r\x1b\xce>\xda\x97\x90\xbe\xd3y\xde<\xbe\xf1\x16>3\xa8\x94>\xbf\x1f\xa1\xbe \x8a\x0b?\xe8\xc7\xa6\xbe[\xf5\xeb\xbe\x8a\xff\x83>\xe11\x99\xbe,\xe9\x8c\xbe\xe9t#>d\xaa\x02=\xc6>\xcd>O!/>\xb2\xcb\xf7=\x00\xdbo\xbe\xdc\x9e\x9b\xbc\xd2\xa2h>T\x97\x83>\xd9#\xbd>\x17~\xf6>m8\xa0\xbe\x8b\xe7M\xbd\x97\xb3\xff>\r\xc1\x8f<\x8d\xaeK\xbd\x1f\xd3\t\xbfU\xd7\xf5\xbd\xbb3\xed>\xa3;\x81>\xd8\x99\xbd=\x87!\x17\xbe\x10o\xfb\xbe${\xe5=\xa0w\x14\xbeD\xcd\xd4\xbd\xd4\x15\x10?\x95[\xac>Lz\xe5\xbd\xd5\xa8\x12>\x8c\xa0A=\xa0\x12z>\x1a\xc9V\xbe\x9fz\xab=\xdc$\xc4=\xa8\xa2\x99>\x07\x9ao>\xd4]}>|3\x82=\x15\xf1\xdf=s?\x08\xbeB\xd40>L\x14\xe3<8}\r=s\x16\n\xbf\x87G\xe5\xbdu\x8f\xe0\xbe\x10\xe9\xba> \xe8n>\xeb\xa7\r\xbf\xaeJ\x84>p\xc7\x8f\xbaK_\n=\xe5\xf3E?\x80#\xef\xbdz\xb8\x9a\xbdr\x93\xed=B\xe3}\xbdyA\x89>1\xb5?>\x9c>S\xbd^S\x14?QL\xaf\xbe\xac\x89G<\xdc\x17H>\x95\x85\xf5\xbe\xca\xd7S\xbe\xf4\x95\xc6\xbe\xf5\x87\x1e\xbf^\x80\x89\xbeb\xe6\xe8=[\xcd\xbd\xbc\xc2\xf7\x12\xbfS\xc9\xcb>\x886>>\xd0x\x86\xbd\xfaD\xbf\xbc\xca\x14\xc4\xbeL\xd8\xcf\xbe\xf9\xaf\xcc>\x8d\x0f\xa4<\x08M:>b\x07l\xbe\xd8\x91-\xbf\xb7W\xaa>\xedm;>\x9f0\xc6>\x86\x16K\xbd\x8b\xad\x8e\xbe\xf3\x9c\r\xbe`\x8d\xf9>\xdcR\xd1<\x1c\x82\xe5>\x9e\'\xbf=\x88\x88\xc4>$!\x9c\xbd\x9d4\x9a>\x83\xcd\x02=G\xdd\x90>\xacu\xcf=\xfc4"?#\x92\xb3>\x8b~\xa2\xbd\x95=\t=`\x8c\xe7=\xf4A\x83\xbe'
-p456
-tp457
-bsV503956618854531072
-p458
-g2
-(g3
-(I0
-tp459
-g5
-tp460
-Rp461
-(I1
-(I200
-tp462
-g12
-I00
-S' \xfa\x13>\x13B\xed\xbd\xae9!\xbe\xbe\x86A;\xea\xce@>E\x08j\xbb\xa6n\xfa\xbc\xdc\xb6-\xbe\xff\x1e[\xbd\x9fN\x05>\x99\xfdu=\x8a\xb1\x06\xbc\xf6\x9b\x1d>\xff\xe0\x8d=\xb4\xc9"\xbe\xfa\xccX>\xcc\x06K\xbd\x95\xb4\xaa\xbb\xe9\xc5\x08\xbe\xd1\xe7\xf9\xbc\xa7r\xa5\xbd\x80b\xcc\xbb\xc8\xa5\x16;4\x97\xfb\xbd\xaa\xd6g\xbc\x99\xa9\x9b\xbd\xb4G\xe9=*\x91\r\xbeyeI\xbe\xb4Oe;\x97\xbc@\xbe\xc4\x17\x00\xbd5M\xc5=\xba\x7f\x81\xbex[3\xbd\x9a\xaa9>\xb2}\x02>\x9a$O=\x00P\x06>\x9a\xfc\x92=\xc0\xda5\xbd\x18{\x11\xbd[\x92\xc3=3$;\xbeJ\x18\xd5\xbd:\xd3\xc2\xbc\xb8\x1cj>j\xf6?=\xb2Vy=\xdeq`>\xceJF=]\x12\x91>-\xc5\xed\xbd\x06bI=\xf2\xec\x81\xbe\xad!\x12>\xf9\x8f4\xbd1\xef\x0e\xbe6\x90B\xbe\x9d\x95\x8d\xbeWL\xf7=\xd2\x01\x05=\xd6\xa87=\x10\xb2\x85\xbd<\xed\x8c<\xf8\x04\x1a>\xb8\x05\x1b\xbe\xe4SB=\x99-\xf8\xbdY\xa7,\xbe\x82\x87V\xbe\xeeE\xd9\xbd\x05x\x9b=\xec\xff\xde\xbd\x1a\xceN\xbd<\x13\x08>W@O>\x16F\xb9=R\x90$=\x01%4>G\xce[\xbdG>z<\x85\x0e\x83>\xe3\xba\xee\xbdm$\x1b=\xb7\x0c\x84\xbc#\xcc\xcf=8\x9c\x92\xbeO\x8a\xa8>\x858P=\x96\xac\x07\xbeh3\x8d<\xd6\x97\xc9\xbd\xb1\x02\xaa:\xa3N\x91>\xac\x8b\x03\xbc)p\xca=gb\xfd=\x94A\x12>WV\x02=\xf6J\x1f=\xbbsA>\x8b\xc3\xcb=\xe8\x95\x00>\xd8\xb5I>\xe5*\x08\xbez7\x86=n\xb0\x82;\x14\x97\xcc=`(O=0\xc7\x10\xbd\x11#\xd7=e\x04\xbf\xbb\xb7 \xd9<\x83\xab\x1d\xbd\xd2\xc3\x08>\xcb\x07m\xbeA\xbe_>Q\xd6\x9e;\r\x0f\x1c<03\x89>\x12\xcc\x80=\xab\t.=\xcf)\xb0\xbd\xbe1\x83\xbd\x0eHM>\x17\xdd\xb5\xbdq\x0e\x8c\xbd\xbf\xe4\x16=\x82\xa21=R#\x13\xbd\x93.2=K\x94\t>\xdc\xec@<\xeaC\xc5=\x95\xa6\x1f>\xec\xe1r\xbd\xa5\x1e\xe1<(\t\t=|\xd0]=\x99\xc4\xe2\xbd\xe8b~>\x18\xdb\xe7\xbci^\x18\xbe89\xf1=\x90@\'\xbc\xcb\xfd\xee=\xd3VK>Y^\xce\xbd\x7f\xb3\x97=D@\xe5\xbd_\xfd\xec\xbd\x184&>\xeeT\x1a>\x93\x81d=\x9e\xa4b>\xbfx\xb6\xbd&\xe2\xfd=\x12T\x92=Rw\x0e\xbe\x1f\xcf\x8f=\xfdE\xc1\xbdF\x16\x94\xbe\xfau\n\xbe\xe4\x1et\xbc>\xd7\x14\xbdfF\xaf\xbe*^\x1d>\xb5\x17<\xbe~fR\xbd7\x02\xc2<th\x14\xbedn\x86=\x07i\x99>o\xf4\xae=\x0fd9<\xc8i"\xbe\x10\xca\x0e\xbe{\xc8\xde<\xccO}=\x8e\x92\x82>\x82\x90\xdd=IP\xc2\xbd\xd6qX=\x19\xb4c>\x0f\xfa\xa1;[S\x12>=\x8c\xea=\x85\x0b\xbf=\xea\x1c\x83\xbc\x8at2>\xb5\x96<=\xa8BN=\x01\xdf3<\x94\xf9\x87>\xdb\x9d\xde=7w!>\xea~\x9a=\xdf|\xf3=\xd2\xe0\x8a='
-p463
-tp464
-bsV504229729415995392
-p465
-g2
-(g3
-(I0
-tp466
-g5
-tp467
-Rp468
-(I1
-(I200
-tp469
-g12
-I00
-S'Ru\x05?\xee(\xc8\xbd\x86\xb6?\xbf\x88\xdb\xe2;\xfb\xb6\xd2>\xa7\x91\x1a\xbe\xb5\xd9\x16>i\x82\xa0\xbe(\x06<=\xf2up=E\x90$\xbd\x92.\x00>w\xd7\xa7>\xb68\x98=\x83Ne\xbeV&\xd0>\x0e\xbf\x8c<\xb6\xdb\xc3=9\xc1\x94\xbe\x99\x8f\x84;K\xb3\x81\xbe(d\xba<\x01\x18\x8f>\x1d\x89\xbe\xbeC\x80\xc4;\x80\xce\x90\xbe\x99M\x9b>UOu\xbe\x83\n^\xbey\x8d|=\xebL\x1d=I\xe1\xf8\xbd\xd8e\xcf=\xdd\xe3\x16\xbf\x02\xe50\xbe\xc1\x99\xa9>k;\x00>zD\xc1>\xda\x9f\xda>V&\xaf\xbd\xa0\xc8\\\xbe\x87\x96\xc7=K\x15W>W\xfd\xd6\xbe\x99t\xab\xbe\xd7\xfdu\xbe\xe6\xc8\xfb>m\xef\xe9\xbd\x81\xac\xb7=C\xb6"?j\xc99>\xcb\xe2:?\x83g\xb0\xbe\x06t\x89>7\x9b\x8a\xbe\x0f,\xcf>\xc7\x1e\x0c>\xeb]\xc8\xbe\x12\xf5c\xbe\xf2\xd8+\xbf\xe1\x85\xb1>\xd6\x18\xea=\xbc\xc0\x8a\xbd5\xccg\xbe\x8dF\x81>B\x87}>w\x8d\xc3\xbe0\x925>\xf7H\x93\xbe\x85\x1fX\xbe\xe7q7\xbfY#\xae\xbe\x81u7=\xde9y\xbeg\x0f\xa2\xbe\x82\xe10>\xbe\xf5v>5Y\xcc<\xfb\x91x>\xf8@\xbc>\x9d\xd7W\xbe\xb7\x8aL>\x91\xb0\xbf>\xd8\x86\xc6\xbdbV\x88=\x9d\xfbx>H\xe9\xcc>\xff\x87\x1c\xbf\xab\x90H?\x0fT\xb3\xbdTG\x05\xbf\xb2t?>\xc5\x13\x00\xbfY\xb9\t<\xd0\xf6\xf2>\xfe\xe8\xa4>)\x0c5>\x1aT|>8o{>\xd8u\x1f\xbe\xab\xed\x8b=\x96O\xd4>!JM>\xdd \xcb>\x08\x90\xb1>\x9bu\xac\xbe\x9f3h==\x82\x87>-p\xa1=\x92\xdd*>\xeb\x98I\xbe\xae\xb0\x0e>v*\x96>w\xe3\xe3=\xf6\x98}\xbd\x07\xdd\xa4\xbd\xder\x14\xbf\xc0m\x08?7\x82R\xbd\xd7\xb35\xbd\x05S1?V\xf7\xd5=g\xa9\xb5\xbd\xfb\xe2%>\xee\x12i<\xcdp\xdb>\xb6\xf4\x84\xbe\x9b\xa9\x94\xbd\xe2V\xb0=\x1b\xec\x92=\xc3\xf9\xaa>B\xe7\x90>\xde\x83I>e?\x88=\xe2\x0c7>\xd6K\xe0>\x8aq\x0b\xbd\x16\x0e.=\r\x07\xae\xbc\x8a\xf0\x1f>\x0e-\xc7\xbe"\x97\x0c?+\xb2\xcf\xbd{\xa92\xbf9\xe9e>F\t\x99\xbe\t\x87\xa3>\xd1*\xec>F\x1d\xfd\xbdq\xee\x9c\xbc\xf2U>=;\x01t\xbd\x1e\x82\xb8>A%\x88>@*g>Q\xc1.?\x0f\xe5|\xbe\x8a\x8c)>\xf8\xe8<>U\x8b\x85\xbe\x95C\xb7=_\xa6\x9e\xbe\xf8{\x17\xbfX\xed\xb9\xbe\x08`\xeb= \xa7R\xbeq\na\xbf\xa7F\xb9>\x8f\xb9\xf3\xbc\xd5\xf2\x8a\xbc\x84\xd1\x8e>el\xa4\xbe\x83\xe4\xc0\xbdp\xd4.?\xc0\x1d\xd5=\x16\xfd\x17<\xc7h\x9d\xbeY\x11%\xbfi-e>\x92_<>iT\x0c?N`\x07\xbd\xebOk\xbe\xb2\x93\x1f\xbc\xe9(\x83>^n\xe4<\xff\x9e\x11?\x01\x037>\xab-\xae>\xcd\xe3\xa1\xbdC\xed\xdb>\x88l\x1d>\xb9\r\xd0>)9\xa7\xbcs22?\xabO\x9d>\xb2\x16Q<]\x90\xc9\xbc\xa2\xf5J\xbd0\xc5+>'
-p470
-tp471
-bsV504165604031754240
-p472
-g2
-(g3
-(I0
-tp473
-g5
-tp474
-Rp475
-(I1
-(I200
-tp476
-g12
-I00
-S"\xd9\xcf\xde=\xfb\xcb\xdf:\x11\xb9\x0f\xbe\xd7\xd4\xcb;<\x05\xaf=v\x94\x84\xbc\x1d\xfb\xc0\xbc\xe0\x99\xcd\xbd/e\x0c\xbdY+\xb8=g\x8e,<\xf3\xdc\xf6\xbb\x8f\xcdq=\xb4\xaa\xb4<G\xec4\xbd\x0b\xb9\xe3=\x8d\n&\xbdW6'\xbd@8`\xbd\xff\x9as\xbbW\x17\xad\xbdc\xd0d\xbc\x89\xf6)=[m\x89\xbd\xd5\xb5\x13\xbc\x08\xa2\xc6\xbc\xa0\xa5\xa3=ga\x9b\xbd\xbc7\xd7\xbd\xc3\x8b\x01=\x0b\xd2\xf9\xbccLS\xbd\x88Kk=\xd9\x17\xf7\xbd[\x83C<\xf0\xf9\xfa=\x92\xd6\x85=\xf7iQ=,\xc6\xf3=1#\x14=\r\xc3\xff\xbcq\xd4\xb2\xbc\x04\xf1\xbe=\xf4\xfa\xcd\xbd\x98\xdcp\xbd\x19|\x10\xbc\xfc\x83\n>\xbf\xfd\xf0<\x10\xe2\xeb<\xbb\xc0\x17>\x05\xba\xfa;1o\x1a>\xf1\xafK\xbd#\xb7\xe9\xbauW<\xbeE\x99\x84=\x9f\xc5i\xbc^L\x12\xbdI\x8fO\xbeg\x13#\xbe\xa9Z\xa7=\x88)t=\x9e\xb8\x88<\xf3H\xc8\xbd\x14u\x80\xbca-\xa6=EC\xa8\xbd\xaf\x93\x9c=\x1d\xef\x98\xbd$\xde^\xbd\xa4\x90G\xbe\xc3u\x00\xbe\x8c\\\xb3\xbb\x1f\xbd3\xbd\xc9\xcb\x0f\xbd\xfc\xaf\x9b=\xb0\x1f\xc4=TsB=\xf3\x89\x88=qi\x8d=~?\x80\xbcP\xe3\xac\xba\x0b\x0b\x06>\xbd\x16\xe3\xbd,\xc4u=\x9f\x04\x9f<\xa3\xfd\xc7=7\xd6\x07\xbe\x0f\x9dA>17\xbe<\xfa*\x80\xbd\x91\xa5r=\xdf\xd2\xac\xbdIo\xfb:\xc9\x1f\t>\xf3\n\xc8\xbb?\x0b\x89=E\xff\xba=ejX=\xbf^\xd2\xbc\xa5\xdb\x04=D\x0e\xec=$\x944=\x88\xaf`=S\x94->\xc4\x85\xbd\xbd\xdcd\xa5;W#\xe4<\x9f\xbf\xdb<\x1d\x84\x00\xbc-7Z\xbd\x7f,\xae=Uq\x85=o2\xa2=\x99\x10\x86<\x1dlt<\xd3\xbc\xeb\xbd\xec\x06\xdc=\x11\xe05<9\xfd\x06=\xdf`J>\x0e\x91\x16=\xc1A\xf2\xbb\xf8\x89\xbe\xbc(\x87\xd9\xbc\xfb.\xc5=/\x922\xbd\xadk\x15:+o\xe8< D'=-r\x12<%V\xbe<I\xe7\x0f=G\xce\x1d<\xde\x10\x13<\xe5<\xf7<\xac\xf5\xdc\xbc\x8dN\xb3;\xb1,w\xbb1\x9b\xfa<!\x87r\xbd'\xf5\x06>\x97\xf9\xa2;\x1fL\xec\xbd\xfb\x90\xe0=\\}_;0\x10\x87=\xc1\xce\xfe=\xbb\xd3`\xbd\xc9gk\xbbn\x8d\x97\xbc\x89\x89\x93\xbd8 \xd1=C.\xc1=\xe4\x900\xbc5\x83\x04>\xc5$\x1e\xbdQ~?=\xcb\x12\xe8<\x8f\x17\xdd\xbdc\x8a\xce<\xa8\x0b\xc1\xbd\xf0P\x16\xbe\xa3\x84\x87\xbd\t\xd0\x15\xbc\xe9\x9e\xff\xbcV\x14\x19\xbe@[\xea=\x99M\x9a\xbc\x1d\xe1\xfd\xbc[\x13r\xbb{\x97\xa1\xbd\xce\xc2\x8d\xbcu\x80/>#r\xc2<\xab,)<e\x11\x08\xbe\xccb\x06\xbe;\xa6\xae;\x83:==\xd5\x1c\xe1=t\xe3\x84<\x06\xc3\x91\xbd\x7fN\xbc\xbc\xf1o\xec=\xc9\xaf\x04\xbb8\x02~=\xd4\xbe\xd8<Td\xe6=\x14\x8a\xab\xbd\xe2G\x93=\x1b\xe0\x83<cTb=f\xa5\x9b='B >\tE\x05>\x0cg8=\xddk\x11=;\xde\xff<\xb8\xeaF="
-p477
-tp478
-bsV503962279738494976
-p479
-g2
-(g3
-(I0
-tp480
-g5
-tp481
-Rp482
-(I1
-(I200
-tp483
-g12
-I00
-S'\x0bF\xc0>~\x0f\xa6=\xae\x9c\xd8\xbe\xe2\xe5\xab=\xb6m\xe0=\xf4\xe3\\<\x14\x9e\x82\xbd\x94\x07\\\xbe\x17*T=\xbe1\x87>\x8b\x02\x17\xbe\x0f\xbb\x0f\xbe\xac\x8c\x96<\xba\xf0\xc8\xbd\xf4\x98;>\x1b\x07\xc2>\xee\\\xc1\xbd\xfe3\r\xbet\xadz\xbe\xd2>D\xbe\x8cp\xb8\xbd<\x8e\xa6\xbd\xeb;\x85>[~6>\x05\xf7\x0b>\xbb\xe3\x05\xbe\x0c\x08W>\x94\xd1n=\n\xd9q\xbe\xe2 \x96\xbeL\xb8\x85\xbe\x96\\)<U\xee\x97\xbb\xe1\x90\x0f\xbf\x17\x1cf=\x14_]>\x0f+\x85>\xcbcf>T\x02\x8f>\xe0\x90@\xbe\xa7\x92\xb8\xbe\x17\x9b\xca\xbd[\xc3\xa2\xbd\xef\xf3M<\xcf\x9e\xb4\xbe\x96\n0\xbe1\x9b\xb5>\xff_R>\xde\xcfL>\\$\xf6>\x99\x9b\x9d\xbdO0\xdf>l\xa8!\xbe\x92\xd7\x03>k\x8a\xae\xbeJa\x9d=\x8a\xbd\x948\xed\xf3\x10\xbe\x80O\xdf\xbe\x96F\xf3\xbe\xc2|\xec=\xceS\x03?p\xca\xda>\'\xefX\xbe\xcep\x13>\xca\xc9\x87\xbb\x0b\xdc\xac\xbe\xd2\x8d\xca>\xb2H\xa4>#m\x84\xbe\x164\xee\xbe\xeca\x01\xbf\x85\xfc\xa5\xbe\xb4U\x81\xbd\xcc\xba\xcc\xbd\x15N\xbd\xbc,\x90\x19=\xf0\xfa\xa6=,\x1f\xe1>\xecz\x8a>\xbat\x03=q\xd0\x12>\x1f;\xd9>\x14_\x96\xbe\xa6\n\x11=\xd3\xd5\x0c\xbd\xddi\x8c>b@\xa6\xbej\xd6\xff>\xf4\x1f\x81\xbe\xda\xfd\xbf\xbe\xe4+\x16>\xa1<(\xbe\x98k\x8a\xbe\xccNp>\x05\x94\xb2\xbc\xdc\xc7\xbe>\xc4\x9d\x10>kF8>4\xa6o\xbe1\xb4w\xbc5\xc8U>\xfb\xe9I>d\x86\xa5>Go\xf3>\x9f\x14\x80\xbe{?\x9a\xbdEF\xc8>%\xa7\x15=\xe2@\xdc\xbc`\xb2\xf7\xbe\x89\xdf,\xbe\x1bc\xae> \x0c,>\xf9[\xbc=\x86n\xb8\xbct\xa1\xd4\xbe\xf3\x0c\x88=a \x9a\xbdO\x11\x1a\xbe\x01Y\x01?=\x1e\x94>\x9eh\xcd\xbb\xb8-\x19=\xe1\x90\x85<?\xe2\x82>\x947\xde\xbd* \xad=\xcc3\'>\x8eJ\x9f>\xd7w\x06>\xda\xd6\xdc=`\xeb|=&\xd3\xdb=\xaa[\xf1\xbd\xab"\x1b>W\x89z<\x80\xf2\x00>\x80\xdd\xf4\xbe\x9c\xbb\xdf\xbd\xb9\x99\xb6\xbeW\xa2\xae>\xcc#o>\x19\xb2\xe8\xbe:\xfe\x8f>>\x9ch=\xcf\x04p\xbcUV4?L\xe3\xb2\xbd\xcc\t6\xbc\xf6\xd6\xd2;\x10\xa8\xdd\xbd\x89\x91F>\xe1W\x0c>t\xb4\x8b\xbd\xfb\xcd\x06?)\xe4\xba\xbe09[\xbc4,;>I\xb7\xe2\xbe\xca\xd9M\xbe\x0e\xde\xbe\xbe\xa1\x1c$\xbf\xf2\xe0x\xbeg1\xdd=\xd6*v="i\xe2\xbe\x84\x16\xd3>\xf6\xe1\xb0=\x1b\xf8\xf3\xbd\x11`\x18\xbd\x8c\xf1\x9f\xbe^\x11\xae\xbe\xee\xfb\xae>ba\xda<\xce\x89L>&\x95M\xben$\x06\xbf\xaf|\xb0>X\x1c\x00>\xda\xc5\xa6>~\xf0\x81=\xb3\xf1\x86\xbe;\x03\x03\xbd\xac\xf4\xf3>B\xc2\x19=AE\x9b>\xd2d\t>i\xd4\x92>\xcb\xbeu\xbd\x12q\x92>\x14\x13\xed<\xda\x1d7>9\x87%=b\xae\x14?y\xaa\x8f>D\x03\xc2\xbcU\x82\x8d\xbc6\xe3*>\xc3\xb6\x85\xbe'
-p484
-tp485
-bsV503970485634220032
-p486
-g2
-(g3
-(I0
-tp487
-g5
-tp488
-Rp489
-(I1
-(I200
-tp490
-g12
-I00
-S'\x9b\xde6?3A\x92>D\xba\xef\xbe6\x01\x0c\xbe\xefH\xf7=\xdfO\x91=\xfd\xbfk\xbdDG\xac\xbe\xdcE\x8e=d\x8e\xf9>\xa8M.\xbe\xc8j\x82\xbe\xfeh}<\x08\xe5\x02\xbe\x9a\xf88<\x1c3\xfd>6\xf4C\xbe\x00\xb2\x8c\xbe\x83M\x9f\xbe\r\xacy\xbe$\xc6\x0b\xbe>\x18\'=\x94;\xb2>\xd8X\xa8>\xde\xcb\x15>1\xe5\xf1\xbd>\x90F>\xbb\xce\xb1\xbd"\xbf\xac\xbe\xc0K\xd1\xbe\xb2W\xb6\xbd{@\x99\xbc\x00\xd4\x8f\xbd\xd7d\r\xbf\x08\xda\x15>\x81\x9a\xac>\xe87\xde>\x135x>p\xa6\x98>7\xfa*\xbd\xa9\xda\x8d\xbeHLI\xbe\xe4f:\xbd\xfbt\xdc\xbd\xf3\xd3\xa0\xbe\x7fr.\xbd]\x00\xd6>d\xb7\x9d=\xa6B\xbf=A\xca??\xc6\x0f\x06\xbe[6\xd9>{B\xa9\xbe\x07\x91\xac=\xa8\xfa\xe8\xbes.\xf2<\x08\xa39>Q\xdb\xba=\xbe\x0b4\xbf.\x13\'\xbf\x92;\x9f>\xd5\xccK?^\x07\xe8>\x18BS\xbe ?_\xbc\x1b\xdf\x89=\x8e\x9c\x93\xbe\xdd3+?\x1aT\xa0>\xe3\x80\xc7\xbe\xc7\x11\xe5\xbex\x05\x08\xbf\x92v\xd6\xbeD\xc0T\xbe{\x837\xbe\x11\xdd\xce\xbd\x151\xfe\xbdf\x0e\x0b>\xf83\xbe>U\x13p>\xba\xaf\xad=\x80\xa4v\xbc-\xfe\x06?\x8b\x11\xb4\xbeO36>+\xba\x82<\xbf\xd4\x8f>\x0eu\x88\xbe\x1fA\t?7\xadX\xbem\x85\xbc\xbe4\x9e0>\xefc\x85\xbe<Ox\xbe\xc2E\xb0>\x13^[\xbct\xf6\xd8>\x0b\x03\x88>\x1cU\xed=\xf8G\x81\xbe$\x94\x88\xbe\xc1\xd02>Q\xd6D>\x10\xe4I>b\x9d\xf6>\x19\x1e\x99\xbe{\xc7\x9e=v(\x16?\xfc\xc3\x07\xbc\x8b\x8c\xc8\xbd\x01U?\xbfZg\x08\xbe|h\xd7>\xb1^">\x97Hn>\xda$\xb6\xbd\x82m\xd9\xbe9\x96\x17>:\xe0[;\xfev\xda\xbdM\xc4\xf8>\xc7\xc2\xa6>\xc6\x97\x93\xbd6\xf3\xd5=\xf7H\x01\xbc\t\x07\xad>H\x8e\xca\xbd\xe2,\x8c>\x0c\xfb\xd9=@fw=\xe6\x90\t>\x89\x93\xd3=\x80\x01\xea\xbb\x1e1w\xbc\xd6\xa3\x1e\xbeA3\xa1\xbc\x08}\xf5\xbbk\xc9\x8f=o\xbb\x16\xbf\xa9\xb6\xe6\xbd\x87\xbb\x8b\xbe\xa8L\x1b> e\xb3>\xa0*\xfa\xbe\x17\xd2(?\xe1\xe9\x8c>@\x94s=\xe82]?<k\x89\xbd\xd7X\xdc\xbc/K\xcf:\x82t\x11\xbeq[\x9a>B\xa7\x03>\x06\xf5\x9e\xbd\xc2\xc5\xcc>j\xa3\xaf\xbe\xc6F\'<rf\x11>mA\xf8\xbet,\xd9\xbe\x81\xc8\x9b\xbe\xf1(\x15\xbf\x1f\x85\xc3\xbem\xe2(>#QS=\xf6\xf1\x0c\xbf\xdb\xf7\xc9>h~\x8a>\xb1\x1a\xff\xbd:HB\xba\xcf\xc3\x9f\xbee\xba\xef\xbe\x1f\xc8\x0f?\xafP\x07>\xd7\x10\xae>\xfb`\x96\xbe\x06X@\xbf\xb8\xb6N>\xcf\xa3I>\x82N\xab>\x13\x8ej\xbd\xf3\xad\xd0\xbe\t\x01\x96\xbe&\xcf\x08?\x82R\xff\xbct[\x88>\xd3$\xf6=\x18\x10\x87>(!"\xbc\x1bJ:>\xe8\xaeg\xbc\xea\x80\x8d>&j\x1f>k\x1b0?\xd3\x99\x03?,\xf9\x8f\xbe\xe9_\x89\xbd\xb24:>\x0e\xfd\xda\xbb'
-p491
-tp492
-bsV504190639312240640
-p493
-g2
-(g3
-(I0
-tp494
-g5
-tp495
-Rp496
-(I1
-(I200
-tp497
-g12
-I00
-S'\x86S\x07>B!\x0b\xbd\xbaC\x91\xbe\xe7-\xc2=)\xc8\x1b>zG\xaf\xbd?\xc3H\xbd{\xc0\xf8\xbdO|\\\xbd\xd3k\x9a=\xac\xe6\x81<\xf6\xfd\xba\xbc\x1b\x0b\\=\xf2q\xaa<X\xfe\x91\xbdy\xe7\x1d>\xfe-\xc3\xbbI\x02W\xbd\x99V\xc3\xbd\xdff =\x8e\xc0\x19\xbe\xfa\xa3-\xbd\x1eZn<\x97\xaa.\xbe\x116?\xbd\xee*\\\xbdA\xdd/>\xc7\xa1\xaf\xbd\x1e\x1eG\xbe{1P=d%\xf5\xbd~\x0fa\xbd\xb0\xae\xdd=\xd6,R\xbe\xd1\x90\xdc\xbc\xfb\x92j>\xf2\x1d\xd4<\xb5<\xc9=&\xf3n>\xd2B\x01=\xcb\x0b\xeb\xbdv\x03\x13=:\xab\x0c>\x90\x8b\x1a\xbe\x9a\x90\x1d\xbe\x89f\xab\xbd/\x14t>|T\x93=\xe7\xe2\xc1=\xdcei>\xbc|^=\'&\x83>e\xba\x93\xbd^\xcc\xac\xbc\xda\xfe\x82\xbe\xc6 \x19>b+\xcb\xbc\xd9\x7f\x06\xbe~\t\x80\xbeU\xfc\x7f\xbe\x06\x8f\xbc=/\xbbo=\xff\x1f\xbf<\xcfE$\xbe\xdcB\xa3=\x9cj\x03>B\xd3\x13\xbeT\x7f"=l\xdbg\xbe\xd1\x99s\xbdn\xd0\xc5\xbe\xa4\\d\xbe\xa1\xa9\xa8<@\x805\xbdne\xd9\xbdt\x9b\x0b>I\xe3w>\x123\xb1=qp\x18>\xef\xc4\r>\xcf;c\xbd\x82\x9eu=\xcc&O>\xc1\xf3C\xbe\x90\x1fI=\xc2[\xc3<i\x83\xe2=\xd9\xc5\x90\xbe\xd7\x1d\xa7>\xd4\xb0\x0b=\x87\xe4\xdb\xbd"I(>\xc6\xe5)\xbemb\x0f=J\x01C>\xe9\xb56=g\xc0\xca=0\xd9\xd8=T\x10\xdb=\xae1\xf1:\xa6\x0b\xc9=\xe2@\x80>\x96\xec\x80=\x99:\x05>\'\x00s>\xbe\xe4q\xbeY\xbe\xcd\xbc\xc0\x95v=A\x94\xc8=\x84q%=\xc7\x9e{\xbd\xf7\x05\xba=\xdf\x16\x13>\xc3\x05\x17>\xe5$l=f\xe1Y=\x1a\xbe\x8f\xbeA%X>\xd6.\xee\xbc\x90Z\x10=^\xd2\x9d>\xac\xbe\x86=\xbd\x96\x85\xbd\xf1\xddR\xbd~\x87P\xbd\xb0C(>\x10\xb8\x1f\xbeYx\x9c\xbd\x9a\x99c=\xc1\xb0\xad=\x87\x8f\xcc<r\xbe\xf3=?\x9d\xd3=\x8a\xec\xda<\x07]\xf6\xbb\xd9C\x9c=\xa26\x89\xbd&^\xc3\xbb\xeb\xc4.<;\xc7\xb9=R\xe9\x18\xbe\xc0\x16k>\x14\xd6\xb1\xbd23\x88\xbe\xd1\xfe\xc6=\xfc\xd1\x84\xbd\x9d\xda\x00>\xeaP\x85>d\x80\xd4\xbd.\xe9M\xbc\xd5\xaf\x84<1\xc2\x88\xbd\xa6\xfd=>9\x1a;>\x9d\xd0\x15\xbb\xf7\xbe\xa6>\xec\xd5\x97\xbd\xba\xe9\xb4=\x06\xa3\xbb=\x0b\xf8\x05\xbe,v\x9c=\\]W\xbeq\xbb\x83\xbe\xc7_%\xbe_\xd8\x0e\xbd6\xd0\x96\xbd\xbf\x0c\xa2\xbe\xdf\tP>\xa9x\x0f\xbdk\x805<\xafXO;\xf7x\t\xbez\xd6?<n7\x8a>^\xf8&=\x91tD=\xcfoQ\xbe\xe7\xb7h\xbe\xe0A\xc5<d4\x9c=\xe6\xf0h>\x04\xf2E=\x0b\x93\xde\xbd\tb\x92\xbc\xbf\x8e[>\xec\xea\xb0\xbc\x9c\xf6\x16>\x8e.0=\xa2\xd6T>\xb2\x03\xcd\xbd\xe6\xce5>\x05\x84==n\xc1\xe5=\x02x\xd9=\x81\xb5t>F\xc73>\x98d\x12>\x97f\x96=\xd4q\x9f=\x1cZ\x16\xbd'
-p498
-tp499
-bsV503970383599783936
-p500
-g2
-(g3
-(I0
-tp501
-g5
-tp502
-Rp503
-(I1
-(I200
-tp504
-g12
-I00
-S'\xa6\x9e\xc8>\xce\xf3\xca\xbdB\x90\x0f\xbf\x84\xed\x0c\xbd\xe0\xc8x>\xe8\x1c<\xbcRta\xbc\x9e\xe6!\xbe\xcd\xfd\x9c=\x15\xcb\xb6>\x84\xdb\xb3\xbd\x86}>\xbc%\xa2\xed=\x92\x0e@\xbe\xaf\x19\xba\xbd\xc3\xeay>1\xd0&\xbd\x9c{=\xbd\x12\xf4\x82\xbe\xc2;\xb6;\x02\x17\xb1\xbe\xea\x82\xea<\xa6\xc9\xd2=\xf4p\x01\xbe\xe5(9\xbd-\xae`\xbe\xeb\x9e\xb9>X\x8a\xa2\xbd(\xba\xd6\xbe2\x18\xc4\xbdr\xbba=\x061\x08=S1\n\xbd7+\x00\xbfk\x15\xf2\xbd%%\xb2>\x86>8>MJY>J\x9b\xec>E\x15\n\xbe\xff\xfc\x9c\xbe\xa1\x15\x02>J\xbcS>#iQ\xbe\r\xaa\x82\xbe\xbd\xebO\xbe\x9a~\r?\x8d,\x9d=\xc7:\x0b>NH\x11?\x16z\xc7=-\xfb\x1c?\x98\xbe\xb7\xbe\xf8\xb4\xd0=\x86\xc0\xee\xbe\xfa\xd1\xbf>\xed\n\xc9=\x0eIg\xbeB%\xdc\xbeZ\xec\xfd\xbe\xa3x\xa2>NL\xa6>;\x06\xdf=\xc5\x8d7\xbe\xa2\xe3@>\x06>Y>\\\x0f\xbf\xbe\x9dn\xb3>\xb8\xfb\x82\xbe5\x82\x06\xbe\xe6\x94\xef\xbe}`\xdc\xbe*\xb2k=\xfex\xb9\xbdD\xf9\x83\xbe\xea\xe5\xee=\xa6\xb0\xa5>\xe8\xee\xce=\xa3\x03~>\xaa\x96k>\xd2<\xa5\xbd\xf5@\xc5=z\xb9\xe8>\xb8\x08\x97\xbeP\x9f\xbc<\xad\xe9g=\xe0\xa3<>\xe8\x14\xf5\xbe?\xc1\r?"\xf5\t=\xa9\xf5\xb8\xbe*\xe0w>\xdd)\x84\xbe\xe3z\x15\xbd\xb3O\xd2>\x02R\x1b\xbc\xba\xf0B>\x0e\x9eT>i\x7f\xa7>\x16\xff\x92\xbdj\xca*=\x10Q\x89>\xf1\x01G>%\xf9|>\xb5\xb4j>\xb3T\xd7\xbe\xa2\x9a\xd7<\x12\x08\x86>]\x96K= M\x8d;\xfd3\xaf\xbeK\x86\x84\xbd\xcd\x8e]>\xd9[->8\x85\x08>\xdb\x7f\xc8<\xc3<\n\xbf\xa6\xb0\xa8>w\xa3\x90\xbd\xcb,\xbb\xbb\xa5\x82\x0e?{\x8c\x12>\xf9y$\xbe\xb2\xc3\xe9<>IC=\xadN\xe8>\xa2lc\xbe&\xa2\x06\xbe\x9eQ\xbe<H\x0e%\xbd\x15\x94M>\x959&>Y\x01\xcb=\xa4\x7f\x8b=\xe5h\xf9<\xa1\x90\x9a>\x90\x97/\xbb\x00\xa4\xbe={\xc0$\xbe;W\x17>\xc4\xb4\x92\xbe\x03\x91\xb4>\xcc\x02\x94\xbdn\xbf\x0b\xbf\xe0Q`>\xe6\x1e\x83<@D\x9a>Pa\n?\xc0L[\xbe6\xb8\xa8\xbc\xfd\xd7\x18\xbe;>E\xbe\xaaw}>\xa15\x92>\xbc\x0f\x8c<ev\x19?\x98\x90e\xbeMX\xd1=v\xcf\x01>\xae\xa4\xc3\xbe\x8b\xad\xeb\xbcs"\x81\xbe\xdc\x1d\x0f\xbf\xbc\xa2\xc0\xbe\xac\xb1\x89=~\t.\xbe\x0e\x0e=\xbf\xc6V\xb1>\xfeA\xb2\xbd\x02\xed\xd9<.\xb4\xfc=\xab\xbf\x19\xbe\xce\xf7,\xbd\xbd\x0e.?5\xb2\xe9=\xab\xf9\xd3=0\xd8\x94\xbe\x83C\t\xbf\xf0\x96)=\xf0[\xf1=\xed-\xcc>K\x04\x02>\x82E\xa6\xbe\xa6\xe1h\xbe\xdfu\xb3>V?\xb5\xbdS\x1f\xc0>\x02\xf8/>\x10 \x99>7s\x0f=&iA>8\xa1\xd6=\x16C\x96>\xe4?\x0f\xbd\x1b\x8b\x12?F\xdf\xbd>\xeb\xf6\xfe=\xa3\xafy\xbc.\xc2\xc2=\xf8g\xc7\xbb'
-p505
-tp506
-bsV503956115315363840
-p507
-g2
-(g3
-(I0
-tp508
-g5
-tp509
-Rp510
-(I1
-(I200
-tp511
-g12
-I00
-S'\x02F\xa5=\xdaV(\xbc\x10\xd0\x07\xbe\xfb4\x8c<\xaaM\xb3=\xe6\x0c\xbc\xbc\x8a\x12_\xbcap\xbf\xbd\xe7Y0\xbdm\x8b\x87=\xef\xe2\x9f<\x10\x00\x17\xba\x17\xf7\x82=k\xf1\x05=l\xef]\xbd,\x02\xcf=\x12\xc4\xfe\xbc\x86\xdc\xed\xbc{SM\xbdps\x11<,\xfa\xa5\xbd\x18\xbd\x86\xbcW\xe3\xf2<\xdci\xac\xbd\xbf*e\xbc\xd0\x19\xd5\xbc!\x18\x9a=f\xe7\x9e\xbd0\xbb\xbe\xbdBA5=\xe7^%\xbdi\x9aF\xbd\xe3t\x83=\xbe\xd9\xe1\xbd,\xd7\x8d:\xca\x02\xe6=\xaaa3=\xb7\xedL=\xaf9\xd8=\xfa\x88\x11={\x1d\x9e\xbc\x123!\xbc\xbaY\xba=\xac\xd7\xd5\xbd\xd2\x11n\xbd\x00\x85\x1b\xbcL \xeb=W\x0e\xc7<\xd0M\xe9<=\xcd\xfe=/\xddH<`q\x12>\x8e8\x18\xbd\xca\xf4\xb4;H\x80\'\xbe\x10\r\x88=\xe8\xb9\xc1\xbc1\xc7`\xbd\xb0\xed+\xbeD\xeb\x17\xbe\x04\x85\x8b=Z\xe1\xaf<\xd86"\xbb\x14?\xb7\xbdT\xd0y\xbb\xd6\x94\xb0=\x04\xe1\x97\xbd\xac\'.=\xd2 \xb0\xbd\xd8\xfcJ\xbd\xe4\xde=\xbeI4\xde\xbd\xf861<\x136\x1d\xbd\xcf\x07\t\xbdZ\xf3\xad=A\x9e\xe1=\xce\xfd-=\xdcE{=\x16\xee\x98=\xf0\xe4\xc2\xbcp)\xff;\x1bh\xe9=4\x9a\xcf\xbd\xc1\x1dV=\x9e\xaf\x91<\x9ep\xb6=\x1b\x1e\r\xbe\xff\xf79>\xfaI\xce<Nnf\xbd\x92\x06R=\xc8p\x9d\xbd\xa6;\xf6;~\xa5\x01>\x9c\x1dI;\x16\x8bm=\x8e\x1c\xaa=s\x98b=^\x11\x7f\xbcz\\8=\x98p\xf7=\xbaD\x17=\x03Rk=@\xcb!>\x02\x06\xb1\xbd\xea\xb1C9\x81 \xf2;\x1a\xb6\x06="*\x93;\x96.\x9c\xbc\xb2\xc5\xc3=d\x18<=\xe48\x91=\x88\x1bT;\xe6\x1f\xcf<c\x82\xe3\xbd>\xbd\xeb=\x89I\x04;\xbf\xf5\x10=\xdc\xf4@>t\xf7\xb8<%\xe9\x81\xbbbw\x00\xbd\x02\xc5\xdb\xbc2:\xb9=+\xc26\xbd\xb3\xaf\xe3\xbb\xee}\xd7<Q\x98-=\xc0/\xc4\xb9\xa31\xc9<$[\'=I(S<Bb\x91<\xd6\x90$=>n\x0b\xbdg\xe1\xe3;\xb2M\xab<\xd0U+=J ]\xbd\xcb\r\x11>\x80\x0bx\xbc\xf8W\xce\xbdi\x16\xb7=\x19\'\xe5\xbbk\xd6\x84=\xccz\xd8=\xdc\xb1I\xbd\x114\x1a;Mi\x90\xbcy\xd6\x87\xbd\x89\xff\xc2=+W\xc3=\x10\xaa\x9a\xb9\xe0\xb6\x01>\xdc\xd5\xf7\xbc;\xaeO=o>\x06=sp\xb7\xbd\x7f\x84E=5\xbc\xb1\xbd\xf7\x9e\x0b\xbe\x9e\xee\x89\xbd\xb7\x96\x94\xbc\xf2\x03\x15\xbd\xf3Q\x13\xbe\xb1\xd6\xcd=\xbe\xd3\x0b\xbd\x06\x94\xcd\xbcW2\x04\xbb\xba#\xa0\xbd\xa8\xc0\t;\x84\xef\x1c>44\x95<Vv\x1b\xbbT\xd8\x02\xbe\xad0\xde\xbd8B\x1a;\xc9\x9b#=\xc4\xbc\xe9=9u\x9e<Xxe\xbd`8s:\x10\n\xd7=\x9c\xe0\xec9_9s=\xee\xf5\xe8<vo\xd6=wo\xac\xbd,\xc3\x94=\xa1\xab\x9d<d\xba@=\x88\x13\x96=\xf2\xd3\x0b>\xee+\xe4=}pm=\x81\xca\x1d=hp\xdc<\xdc\xfe-='
-p512
-tp513
-bsV504226747521712128
-p514
-g2
-(g3
-(I0
-tp515
-g5
-tp516
-Rp517
-(I1
-(I200
-tp518
-g12
-I00
-S'8:\t?dV\xb9<\xd6]\xea\xbe\x8d\xf4\x1c\xbd\xc5\x9cc>wT\x8c\xbc\xbb\xf9\xe8<\x83\xefE\xbe\x1e;\xd2<0w\x8f>\xd8\xf7\x97\xbd\x16\xb3G\xbd\xbe\xcc0>H8\x96\xbd\xd3|\xc8\xbbt\x9e\xc6>^Qq\xbdjd\xcd\xbd\xe3=\\\xbeF\xc1\x9b\xbd\xc3\xf4Y\xbe\x86\x82\x9d=2=3>\xd8\x19#\xbd\xbb\x8f\xe0<\xc8\x15\x1a\xbe\xcdSL>\xde\xa3\xf4\xbd\xa7\x03\x95\xbe]z\x0b\xbex\x00S\xbdSu\xab\xbc\xb7y\x1c=\xf9\xf3\xe5\xbeB#\xea<\xb6\xcdj>\x11>\x87>\x1d\x8e;>98\xb1>\x00\x19\x84\xbd\xb6\xdaV\xbe\x05\x9aj\xbd\xdeO\xf3=\x80du\xbextm\xbe=q\x0f\xbe\xc38\xdc>\xbf\xa7U=\xa2e\xbf=\x8bK\t?W\xcd$<\x05\xd7\x12?=\xc7\x9b\xbe\x0c)\xfa=-x\xd3\xbe\xb2\x8fN>Y\xc8\xbf=\xc5|\xdb\xbdA\x9d\x00\xbf\xea\x00\xed\xbe@\xfbx>\xcd\x89\xc0>q\x92`>`\x8d\x1d\xbe\x18\xca\xb2=\xe0\xf3\x1d>\xc8#\x83\xbe\x17\xa8\xd2>o\xfd\x03\xbd\xb9\x01v\xbeb\xc8\xf5\xbe0\x85\xc1\xbe\xb3\xc8\x10\xbe_r\x02\xbe\xdd\xfe\x1c\xbeo\xbd\xa1=\xf1d\xad={\x90\x12>\x81\x19V>\x9f\xac\x84>\xa7\xa5\xf4\xbc-\xb2\x9e\xbcS\xc5\xcc>\xb3\xb4a\xbe\x8a>l=^C\x93=\xe6\x11\x9a>\xe3\x15\x96\xbe\xf9r\x08?-\x93\x96\xbd\xcd\xfe\xa5\xbeh\xd0$>\xb3\xee\x98\xbe\xdb\x89\x1c\xbe\x02\x87\xb2>\xd1?\xaf=\x03Gj>\xa3\x0c[>\xdf\xaf\x12>\xff\xaa8\xbe{\xe5U<"\xef]>*\xe4g>lQZ>,%\xc9>\xd4\x07x\xbe.E;=\xbcA\x9f>`7\'\xbcz\x0e\xc1\xbbS\x1f\xd2\xbe\x9b\xb2\xd9<\x91\xe7\x84>\xed\xda\t>"jR=\xcf\xfc\xed\xbc\x9dW\xcb\xbe\xa5\x90l>/\xc7r<\xaf0\x14\xbdW\xee\x01?\xfa\xa62>J\x8fA\xbd\x11\xc7\xe9=G\xb4x=8j\xab>\xbd\x1f;\xbe\xaf4]=<G\x15=\x16p\xa5=\xfb\x94\xf9=\xbd\xee\xe8=\xcbS\xad=\xd52\xb9<2@?=\x8d\xd7\xed=\xc8O8<q\xd08=\xd1\x7fN\xbe\xf6]$\xbd\x03\x11\x87\xbe\xa8U\x93>"A\x1e>\xe8`\xec\xbe\x04K\xa9>\rA\x16=\xbd\xeb\x16>\x06C\x04?\x05\xe6\x12\xbes\x9f\x0e9\x14\x1e]\xbc-\x9e\xb0\xbd\x03\x14l>\xdd\x1d\x1d>\xe0s4=\xac?\xe6>\xc1\x96S\xbe\xfb\xf8\xe2=G\xe4\xe6=\x1c2\xc8\xbe\xcd\xbf\xde\xbd\x05!i\xbeh!\xf6\xbe\x02\x0c\x90\xbe\xb3\xf7\xf4=\x93W\xd4\xbd\xb3\n\x07\xbfQ\xf7\x9f>\xb8\x1fL=\x80v\xd2\xbd\xce\xc9\xaa=\x85\xfek\xbe\xe2\xd6 \xbe\xbc\xda\x15?|\xd7\x1c>\xbd\x1a\x00>p\x12\x88\xbe\xb4\x02\x0b\xbf*\xcb\x1a>(x9>[F\xa5>=\x8f\x0b<\xef*{\xbe\xd4i\x06\xbe=\xa6\xba>\x9e\x9e[\xbd"\xe1\x96>\xf1B\xb9=\xe5\xc1r>~\xc6\xae\xbc^\x9fl>\x08\x04\'=\x80\xc4\\>\xec7t=;\xbb\x0f?\xf2\xfe\x9f>\xea\x95c\xbd\xf3\xcf\xdd\xb9\x06\xe2\xd3=\xca\x92p='
-p519
-tp520
-bsV503961278054805504
-p521
-g2
-(g3
-(I0
-tp522
-g5
-tp523
-Rp524
-(I1
-(I200
-tp525
-g12
-I00
-S'\xe3\x8a\x9c>\x02\x00\xdd\xbd\t9\xa6\xbe~vP;\xeb\xaa\x95>#p\x97\xbbH\xc6\x98\xbd\x90i\x9b\xbeeD\xc7\xbd\xf39\x93>\xafT\x81=\x99]c\xbdyqZ>\xd1\x8c\xb6=\x16\x8f`\xbe\n\xf3\xbf>\x1e\xcf\xdf\xbd\xb6\x1e\x8e\xbd\xaf\xbbb\xbe\x9e\x08l\xbd\xe0V7\xbeu\xc4\xd1\xbcV\xabF=#\xce%\xbe\x0e`\x8f\xbc?~\xd6\xbd\x11&_>c\x95i\xbe\xa7\xfa\xb7\xbe\xc5\xce\xcd\xbb\xb7\x81\x8c\xbe\xfdz\xbc\xbdI\xf6+>\xef\x04\xdd\xbe\x1fv\x91\xbc\xe9y\xb2>\xfb\xccu>FR\xd5=\xa7\xea\x8e>0\xac\x05>\x1d@\xbd\xbd\xa2\xbc\xae\xbd\xa2\xa4I>\xd5\x1e\x9b\xbe`\xc1A\xbe\xd6D\x18\xbdz\x94\xd6>\x1e\xa4\xd9=I\x15\xdd=@6\xdb>;\x14\x1c={\x11\xf6>B9?\xbe\xb2 ,=\xf9\xa4\x02\xbf \xb7\\>en\x81\xbd\x1f\x042\xbe\x96~\xf6\xbe\xb5z\xfe\xbeW\xb6k>20\x1c>b\x19\xeb=\x10\x996\xber\xf27\xbc\xc5z\x83>\'}\x8b\xbe\xd2[,>\x90\xb3A\xbe\t8\x89\xbe`m\xe7\xbe\xc1\xa1\x90\xbe\xc2 g=Y\xc03\xbe\x03l\xc9\xbd\xdfQY>)\x18\xa4>\x10A8>\xc0S\x08>\xb7g\x8c>q\x8fm\xbd8\x7f\xb0\xbb\xd5\xbe\xee>Y\x80\x8b\xbeU\xbf\xeb=\xa0O\x85\xbc\xa7\xcaT>\xf5\x88\xed\xbe\x8b\x17\x14?/\xcc\x8f=\xba\x1a\\\xbe\xf1>\xa0=\x93\xd0D\xbe[\x0e\x83\xbc\xde(\xf0>\xa2\xff\xf0\xbc_FR>\xc6\xdft>F\x16`>\xedO\x8f;\xc7\'y=\x99R\xad>\xba\xe4/>Y\xcfH>\x85_\xd5>\x8a\xd5\x87\xbe\xeej\xa9=+\xd8\x83=\xc5\xee\x16>\xb3,.=\xa3\x08\x16\xbe\xcd\x16;>n\x0c\xa4= b\xfe=\x7fr\xaa;\xff\xe44>\x80\xc2\xc9\xbe\x0fd\xb4>\xb2\xb3[<\xfd\xe4"=\x8aM\x04?\x05\x9d\x01>in\x1e=\xab\x06\xff\xbd\x89(\xe2\xbd\x8b\x97\xaa>\x02\xc4\x14\xbe\x97\x04\x84\xbd\x8e"\xa2=\xa8G\xd4=\x00^;\xbd\xee:\x87=\xc0\xbd<>\xad\xe5\xc3<\x8e\xe3\xc2=b[4>\x13\x11\xcf\xbda\x83\t=\xba\x03\xb8\xbb\xfb\x8f\xb8=\x17\x0fJ\xbew7\xcb>`\x0f\xad;6\x95\x98\xbe\x08\x85\x92>\xed_\xea<\x99vH>5\x1f\xd4>!\xf12\xbeS\xd1\x9c=ZJ \xbe\x80\xfd_\xbe[\x1e\x9c>&[\x8d>O\xe4\x00=\xb7\x95\xc7>Z\xb1\x1a\xbe\x05\xdf>>\xf5\x03\xe6=M\xea\x96\xbe(\xcb\x90=\xd5\xdd`\xbe\x91q\x00\xbf\xef\xeaz\xbe>b\x9a\xbc\xbe*\x83\xbd\x0f\xd0\x0b\xbfn`\x9f>\x18\xa2U\xbe\xa2\xac\xbd\xbd\xc9m7<\xb9F\x81\xbe\x16N\x17=`\x17\x08?^Z\x06>\xa6\xe1j=)1\xac\xbe\xda\x04\xa3\xbe\xe9x\x00=\x8ey\xf9=Jg\xd2>\xf6%\x13>\x9e\xccL\xbe\xdf\xd0Y<\x82u\xd3>\xbf\xbe\x9e\xbb\xb7\x86Z>+\x0f$>\xc0ol>O\x1e\xcb\xbd;.\x8b>\xc9>]=Ok\xe8=\x80a\xd9=)e\xf9>\xe0\xfa\x8f>\xe0\xba^>Z\xaf\x04>e\x92M>\xaf\xf8\xe4='
-p526
-tp527
-bsV503962617736867840
-p528
-g2
-(g3
-(I0
-tp529
-g5
-tp530
-Rp531
-(I1
-(I200
-tp532
-g12
-I00
-S"\x19\xdc-?\x92\x1f\x14>\x17\x02\x12\xbf\xb0\xcf\xfe\xbd\x89\xdc7>\x99\x17\xf0<w\x1c4\xbdo\x11\x8c\xbe\xc6\xf3w=\xdd\xe4\xd9>p\x94\xbd\xbdO\xc9\x02\xbe\x9c\x8d\x06>\xda\xbf\xe1\xbd9\xd6\xb7=\xe92\xf7>\xa5<\x0e\xbe\xf9\x84n\xbe,\xc6\x8e\xbe\xb6\x80 \xbe\x07X\x8e\xbe1\x12\xa9=\x90C\x9e>!\x0fv>9+\xdb=\xb49E\xbe0\x9bm>l4\xc3\xbdi\xa5\xb5\xbe\xe7\xa9\xae\xbe\x17*\x95\xbc\x1a\x86J\xbc\x03\x98\xbd<\xb9\xb6\t\xbf\x15I\x11>\xe1.\x8b>_\n\xbc>\xefa\x88>\x96U\xbf>)X\xfe\xbdt6\xad\xbe\x1d\xe3\xea\xbd\xf4\xea\xd6<\xcc\tY\xbe\xd7\xe3\\\xbe\xc9\xf2\xf2\xbd\x04\xef\xf9>\xb0W\x8b=:\xb9\r>\n\x04+?w\x9f\xc6\xbd\xeb\xd0\x17?(\xc0\xa7\xbe\x8d\x1f\xf2=\xc7L\x00\xbf4\xe4\x0f>\xady$>\xaa6V\xbd\xaf\x8fA\xbf$\x13\x12\xbf\xf6\xde\x9e>?v5?0\xbc\xb0>\xcd?Y\xbe\xf4\xc4\xcd\xbc%>\xab=\xe6\xe9\xae\xbe4C$?y4\x00>\x00\xc7\x80\xbei\xe3\x0f\xbf\xc0\xd2\x04\xbf\xb4\x80\xaf\xbe\x86\x0f\xdb\xbd\x13\x18?\xbe\x84\xc4\xc3\xbcq\xaf\x12\xbc\x0c\x17\x18>\xfbF\xaf>\x81L\x86>)\xc3\x93\xba\xa3\xa5\xfe<\x01\x12\x03?\x91\xc9\xd6\xbej\x8b\x0f>o\x1d\xa7=\xa7\x86\xb7>aS\x9b\xbe\xf1\x07\x1e?\x99q\x17\xbe\x13\xd6\xc7\xbe\x83\x95k>F\xe3\xa2\xbe|\xe5S\xbe\xd7\x01\xcd>\xec\xf7:=\x87\xf9\xc7>\xf9L\x93>L\x05\xe3=\x89\r\x99\xbe\xe78\xbf\xbd,\xf3\x8a>|\xf7\x8f>vPR>\x03M\x11?\xa7y\x85\xbe\x9fO\xcb<I\x0e\xf9>/\xb5a\xbc\x97q\xc4\xbd(6-\xbf\x01~\x8b\xbd>\x92\xb7>5R\x0b>a#\x06>\xf7$\x86\xbd3\x7f\xdc\xbeDt\xfa=\xd0)j\xbc\xf4j*<\xd9\x0e\x19?w\x1b\x9f>;>\x10\xbd\x1c\x86(>\x98\x9d5=\xfc\xab\xd7>q\xee\t\xbe\xa7A.>\xf9\x19\x84=\x97\xaa\x1f>\x10\xd4F>:6\xbd=db\xc1\xbb-\xfd*=g\xd6\xc4\xbd\xef\xe2\xc5=|\xaf\t=\xf6\xc2U=\xd1\xc7\xd0\xbe\xaf\x91\x88\xbd?8\xab\xbeOUg>\xc1\xfbn>\xb7\x84\x08\xbf\x0c\xa8\x05?\x89\x8eM>\x14\xdf\xd3=\xe9\x19@?\x19\xc3\x13\xbei\n\xb5\xbd\xd0Mf\xbd\xa7\x10>\xbe\xdd\xea\x9d>\xdf\xc7\x06>\x14f\xb1\xbd\xe0D\t?\xd4\x95\xa1\xbeQ\x0e\x05=\xbc\xc6\x04>\x1f9\x01\xbfW\xd1x\xbe\xd9c\x87\xbe'H\x17\xbfD\xd5\xaa\xbeS\xed!>\xff7\x1a\xbd\xb4!\x06\xbf=\xf3\xe4>\xf7\xbf<>\xd7\xbf\xff\xbd\n\xe3\xb0\xbc>5\x82\xbe\x8d\x1a\xc5\xbe\x92\x88/?\xca;\xf9=\xff\xaeg>=|\xc7\xbe\xb3\x86F\xbf\xe7tX>?\x8fh>\xb64\xbd>\xa4H\xfa\xbcZ\xaa\xbb\xbe\xcf\xdfs\xbe&<\xfa>\xf4\xb3\x9f\xba\xddw\x9a>\x05\x94\x89=\x97\xfb\xa6>=\xc0r\xbc\xef\ra>/)\x8e9\xef\x00^>\x9f\x91->1\xb5>?T\xac\xe7>\x84\x9a\n\xbe|@\x83\xbd\xd4`\x11>\x84\xa4\x0c\xbd"
-p533
-tp534
-bsV504226061136449536
-p535
-g2
-(g3
-(I0
-tp536
-g5
-tp537
-Rp538
-(I1
-(I200
-tp539
-g12
-I00
-S'}D\x99>\xf5\x95\xf8\xbd\x10o\xde\xbeN\x916=\x94\x7f\x8f>O\xf2\x11\xbe(\x012=\x92+a\xbeb\xe9t\xbc;cg=\xd7\x8e\x01=\xf6\xef\xc2=\xa9\xfaX>[\x18x=V\x196\xbe;\xbe\x92>\xad\x86\xe0<\xe7\xc4e<}\xcc%\xbe\xd4\x7f\x19=\xc1\xd4,\xbe\xacP1<\x9c\x86_=\xf4\n\xaf\xbe\xcb\xc4\x98\xbd\xdc\xb0\xef\xbd\xe2\xfcX>,5j\xbe\xd2\x19o\xbey\xc9\xeb=\xb25\xab\xbd\x89\x06\xb0\xbd\x90\x86\xf1=|\x8e\xac\xbe\xa8\x04\xdf\xbd\xb9\x8b\x88>\xb8\xf7\xc2=\xe6{\x19>\x15\xab\x99>\x99\x00>=\xb6*\xd6\xbdBD\xe9;\x94\xcb/>3\xef\xa4\xbe{U{\xbeT\xf0\xe0\xbd7M\xb8>k\x91\xee\xbcd.o=&l\xbe>\xbe\xe3\x16>\x84\xa5\xf1>)\x14z\xbe\xd2\xb7\x95=\xb15\x83\xbeK\xc6\x94>5\xcf\xd5<\xfa\x18_\xbe\xfc\xeeH\xbe\x02\xbb\xde\xbe\x92\xedY>\xde\x03\xdf<Z\xd1(\xbcG\xd1\x19\xbes\xdb\x15>Ray>\x0bC5\xbe\xae\xff\x7f=\xe5m\x9f\xbex`"\xbeg\x1c\xfb\xbe\xbe\x08u\xbe\xba\xee\x8e=\xf4\x93:\xbe\xac\xbf\x1c\xbe\xa7CX>@\xc1\x8c>LL\xc6=.=\xaa=)\x9c\x8e>p@\xf1\xbd\n\x08\x88=\xfb\xfc\x82>l\xd1\xa5\xbd\x97b\xd2<\xc6e\xb5=E\x11g>\x9b\x02\xd1\xbe\x10%\x01?\xb0\xee\x06=e\x00\x83\xbeVg*>rI\x8e\xbe?z&=\xa9\xc3\xb9>n\xfd\xfc={\x03\xbf=\xb0\x18\x17>M|=>\x04\xca\x89\xbb\xcd\x8d\xb7=\x130\x95>%\x8b\x02>\x9a\xbeb>\xe4\xd4\x8b>\xa0\xe9\x82\xbe\xb4j^=0\xc5\xac=\x9dz\xba=\x80\xe2\xab=F\x95\x86\xbd\r%\x14>\xfc\xe8\x04>0I\xfc=\x82\x0b\xf1\xbc1\xffQ=\x1e>\xc7\xbe}\x89\xbb>N\xb3\x8e\xbbt\x93~\xbc\xa2j\xe5>42\x7f=\x0c\xa91\xbcQ$\x97<\xccB\xbd<\xb2\xd2\x98>\xeb\x04^\xbegc\xa8\xbd\xbee/=\xdc\x13?=\x02C\xb2=\x00\xc1,>\xf9\x04L>3ZE\xbc\x7f\x08\x0b>\xab|o>\x87W$\xbd\x04\x9d\x15=\x05\x97\x8b=\x13\xf6\xa9=\xf7\xbcQ\xbe\xb5\xf8\xc9>J|\x85\xbd\xd2I\xc7\xbe%a\x02>`\xa0>\xbe \xacn>@\xd4\x8b>\xfd.\x0c\xbe`\xaa\xd4<\x92h{<d\xdb-\xbc\xc9\ti>}\xe3J>\',\x07>\xba\xae\xdd>Z\xfd\xd3\xbd\xd4\xdd%>!\xf2\x07>7\xc1$\xbe\x87V\x02>\x1c\x99K\xbe\xb0\x97\xb8\xbe\x96\x86b\xbe@\x8d\xee9A\x0e\x02\xbe\xf8!\x13\xbf\xbc\xd9{>\x18\xe7\xdc\xbd\xaaq\x90\xbc\xa4~\'>\x9cLf\xbe\xb5q\x8a<K\x83\xf6>\xa3/\x12>\xf2z\x1d\xba+\xb0G\xbe\x1e\x0f\xa3\xbe\x96Z\xd6= #\xda=cC\xb1>\xe2/\x07=o\xb8\x12\xbe5[\xff;\xdc\x94X> \xe4\xb7\xbc\x11C\xa5>\x1e\x86\xd6=~\x8eW>\xf7\xb5\xa6\xbd\xcd\xfe\x90>/"\xcf=\xab\xaaf>B\xe4\x07=V=\xa7>\x80\xf2O>\xb4\x01\xed=\x965\xb6=\xec0\x1b=\xf4x\xe3='
-p540
-tp541
-bsV503957999816155137
-p542
-g2
-(g3
-(I0
-tp543
-g5
-tp544
-Rp545
-(I1
-(I200
-tp546
-g12
-I00
-S"Mg\x8c>BT\xe5;\xc76\x9c\xbe\xf4\x0f_\xbcN3#>\xea-\x17\xbdNx\x0b\xbd\xfeV\xfa\xbdJ\x9f\x8f<u\t\x0b>\xa4:\x1a<\xc7\xf5U;\xa6\xe8\xb9=\xe7G\xc1;i20\xbd\xfc\xe7^>\x14\x1f-\xbd\x93\x87X\xbdK\xa0\xee\xbd<(\x00\xbbX\xb4+\xbe7\xb7\xd5<t\x19\xbb=\x8d\xe7\x9f\xbd\x12\xaa\x8a\xbcT\xd8\xb9\xbdS\x94\x11>\xb5\xe3\xf7\xbdz\xecA\xbe3\xa4\xca\xbb\xaez\r;\xa1\xcd]\xbd\x07\xadc=d|_\xbe$v\x91<\x01WH>\x07\xe1\xe6=|\x94\xf2=\x10]n>\xc9\xf1\x1d<@\x12\xed\xbd\xad\x98\xbe\xbb\xc2\xfa\xe5=\xa7\x01(\xbe\x81\r\xcd\xbd!l\x86\xbd4I\x90>\x00\xab\xc7\xb8T\x9c\x84=\x14Q\x9d>P\xba\x15=\\\xad\x9c>S\x05\x18\xbe4%\xf0<\x8e\xdf\x89\xbe\xe1\xc5$>D4;=\x9e\x95\xa5\xbdSZ\x9e\xbeW\x15\x90\xbe.y*>\xe0>B>\x9a\x10\xd8<\xe4\x1d\xf5\xbd]7\xc9<\x9c\xdd\xce=5\\&\xbeL\xbfL>h\xc4\x17\xbe\xe3\xbe\xa6\xbd0\r\xaf\xbe\xf7\x97Y\xbeN\xe2L\xbd\xd4\xdb\x8f\xbdnK\xea\xbd\xf3\xe7\xa9=\xea\xbb\x00>\x0eH\x9b=0'\xe9=\x99\x98\x01>\xc5\xcdX\xbdPa\x0c<lD[>7\xf86\xbez\x0f\x9e=\xfc\x1d\x97=\xbf\xc1/>\x05\xc0W\xbe\xbc\x1a\xb0>~\t\xee<\xdc\xa7'\xbek\x81\x1a>+\x9e]\xbe\xa2A\x80<4\xa2s>b\x0eO=\x95\xbd\xde=\xc0\xca\x14>\x02\xdc\xb3=\x95\xa9\x82\xbd\x11M3<=uK>G\xa7\xd8=\xd1W\xda=\xf7\xb0\x85>ev.\xbe\x84\xbb\x08=R\x96\x0b>\x8c\x91\x1f=2{\x96\xbct\x972\xbe9\x8cx=\xc3F%>> \xbb=KYd=\xf8\xcd\x82\xbc\xec&z\xbekt5>\xaez{<\x8a\xc4\x13=\xa6j\xa2>\xb4\xb3\xcb=n\xbdd\xbd\x84\x80\xc0<\xb4\x1d\x08\xbc}8P>\xb4\xdf\xdc\xbd=\xd2\t\xbc\x8f]\x99<\xa9o\xbc<\xa7\xec\xb3=\xa1\x15\xcb=}?\\=\xbfg-\xbcw\xcbA\xb9\xbb\x8e\xaf=R\xc9o\xbc\x0c\xd5|\xbc\xab\x96N\xbd9\x8f5=\xb4\xa3\r\xbe?\x1e$>\x8c8\x00\xbc{\x03\x89\xbe\xb8V9>\x9c\xbb\r\xbcd\x08\x06>#\xe1\x83>\xe0\xcd\xe9\xbdg+\x91\xbcO\xde\x99\xbb\xb4x\xa7\xbd\xd6\x8e3>\x1f\xb4\x0b>\x1eN\xa1<\x1b\x8e\x90>\\\x03\xbc\xbd\xea\x07\x97=\xec]\xa3=\xb03;\xbe6\xca\x88\xbb\x84\x07\x0b\xbe\x04\xf4u\xbev\xdb\x0e\xbe<\xe2`<f\xa4\x93\xbd_>\xa4\xbe\xd5BS>,\\d<H\xbc\xe2\xbc\xd3i\x1c=\xa2\x98\xd4\xbd\xf0\xcfr\xbd9\x0f\xb6>\x00e\x90=\x9d\x01\x83=\xc9\x9bP\xbeB\xb2\x9c\xbe\x889\x1f=\xdc\xe6\xfb=\xdc\x8b^>\xcb\xd8\xed\xbb\xd2\x88\x0f\xbe\x9c\x14\xcb\xbd\x18_=>\xed=\xdc\xbc\xb3\x10#>4\x011=\xe8\xd2#>\x1cRX\xbd\xd4E\x17>U\x1c)=\xc6\x0f\x05>\xa1\x7f\xa7=\x9c\xbd\xa2>\x00GT>\xeb\xa3\xed</\xe2\xa2<P\x9e\x11=0\x92k="
-p547
-tp548
-bsV504212714055417857
-p549
-g2
-(g3
-(I0
-tp550
-g5
-tp551
-Rp552
-(I1
-(I200
-tp553
-g12
-I00
-S')9\x97>lzK\xbd\xda`\xd1\xbep\xae\xa3<\xca1\xaa>&@\xbd\xbd\x93\x01\xec\xbb\xa0\xbe\x83\xbe\x08\xd3\x02\xbe\xa1\xb8\x02>\xc9\x1d\xf8=\xf9\x9b\xa2=\xfff\x8e>\x9f\t!>\xfd4F\xbe\x8b{\xac>V\x89o\xbd\xf91\xe3\xbc\xbdw\xf2\xbdAv\x96=R,\x82\xbe\'\xe2\x07<\x87\xd5\xc3=\xc3\x00\xc2\xbeM\xae\x7f\xbd\xa6\xd3\xc3\xbdq\xb5B>\xc44\xad\xbe\xe2\xe6\x80\xbeU\x16\x89>\xe1\xc9\x8f\xbcJ\nY\xbe\xf86\x80>\x9ce\x80\xbe\x97\xb7f<\xf1.\x8f>V\xce\xdb=\xfd\x9e\x08>G\xc8\xa6>\x80\xd3!>\x84\xb4\x9a<y?\x08\xbdI\x86\xb2>\xc0\xaa\xd6\xbe\xc9b\xcf\xbdh\xd0\x1c;\xdd\x1e\xc0>\xb6\x8b\x02\xbc\xacl0=t\xe3\xb4>\x16\xef\xa1=|\xa6\xf8>\xb9\xcf\r\xbe-i\xf1<\x80\xd2\xf9\xbe\x91Yq>\xc5\x9b\x85\xbd9&\x14\xbe\xec\xa1\xfb\xbe$K\xd1\xbe2\xca\x80>7\xd5\x0f\xbdW\xf8\xfb\xbd\xcfR\x7f\xbe\xdf\xb1L\xbd\x07\xa4\x89>\x90+<\xbem\n\xd7=g)\xbe\xbeD\xe0\xfd\xbd\xba\xa5\x15\xbf\x01\xd9o\xbe\xa1\xa7\xa8=\x0c\xea\x11\xbe\x8a\xee\xc2\xbd}\xe9\x9a>\x01\xc1\xa0>\xb9\xee\x03>\xcf\x8a\x9d=\xa9\xb7W>\xcc\xde\xfe\xbd#\x0e\x14\xbdW\xdb\x8b>\x93\x95M\xbem\xdf8>\x18\xe6\x0e>\xcd\t\xb9>\xf3G\xb7\xbe\xe2\xcf\x0b?\xfcN\x04>]\xaa \xbedf\x1d>\xb5\x0f\xab\xbe\xa6U\xc9=\x8d9\xc9>\xccb\xaa=9R\x98=\x9b\xd2\x85>\xa6\x9f\xdb=\x9ff[\xbd\xech/>\xa0_\xb9>\xf0\xda\xf8=#\x05\x18>1\x8a\xf7>l:,\xbe\xa4N\\=\x02\xa5\x02\xbd\xb7@\xa1=3\xe6\xe7<\xa3\xc6\xf9<A\xb3\xce>\x9e\x83\x06>\xc6\x97,>sg\x91\xbd\x83\xcfu<\xbdD\x88\xbe\xef\xa2\xc7>a\xcd\xc3=\xdaR\x13>.\xc8\x14?7^\'\xbb]W7\xb9\xc5\xc4!\xbd\xc4\xb1E\xbd\x0c\x97|>\xe9\xfb\r\xbey\xf1\x1a\xbd\x06}]=\x02N\xa7=\xc3}N<\xe0P;=e\x99\x0f>\xb2\xad-\xbc\x01\x04\x12>|f\xdf=\x91\xc2\x80\xbd\x84n\xf7\xbc\xcd\xd4U>G\xf9\xe2=\xd0\xc8\x03\xbe\xdd\x0c\xd0>-w`\xbd\xa3\xb0\x8c\xbe\xef\x85r>\xe0\xb1\xe9\xbdd\xa9a>\xbd\x04\x04>\xcf\xa5;\xbe0\xb7Q:\xb1\xbc\xf39\x19@\x19\xbe\xf3T\x8b>o\x81\x86>Ix\x91=\x01\'\xaa>\x13\x8f`\xbc\x16\x160>\xdc5\x95=\x16>p\xbe\x13Bg>\x9d\xa0X\xbe</\x90\xbe\x10\x9b\xe9\xbd\xc6"g\xbd\x00\x8e\x19\xbeO3\xcc\xbe\x97h\x89>\x1ca\xc9\xbd\x83W\xdc\xbd\xb9\x10\x8c=\xf6\xd7A\xbe\xa4<\x8c=\x1f\xe3\x00?&\x18\xcc=70\xb4\xbd\x10\x82\xbe\xbe;B\x96\xbe\x0e\xc8\xb5\xbb(`%>\x99\xd0\x9d>\x1b\x06\x85:,x\xef\xbd\x9c\xcf\xe3;\xbc,K>);%\xbc\xd4\xf6%>\x0e\xc0\x00=\xe9\xf7\x8b>%v\x92\xbe\x01\xb6~>t\x9dy=\x143\x13>\x19\x89W>\x7f\xd6\xbb>\x809\x92>\xf1\x05\x11>Q\xc8\x04>}\xd2E<\xf42\x98>'
-p554
-tp555
-bsV503962964760621058
-p556
-g2
-(g3
-(I0
-tp557
-g5
-tp558
-Rp559
-(I1
-(I200
-tp560
-g12
-I00
-S'%\x94;?\x99D\xa7>Q,\xf6\xbe\x88\x9b\xc4\xbd\x1a\t\xf2=\x02\xc5\x02>~Y\x01\xbe\xedF\xa0\xbe%QJ=\xc8\xa8\x19?\x90\xd3\x0b\xbeB\xd7\x91\xbe\x07\x0b\x96\xbb7o\xdb\xbd\xa2\xc5\xb5=W\x0b\x05?\xcd\x8bl\xbe?^\xae\xbe\x99\x96\x9d\xbe\x11_\x93\xbe\xd6x2\xbeY\xab\x05=\xc8)\xb9>\x18\n\xd7>\xe2\xfd!>\xe9\xc6\xe9\xbd\x06\x15U>har\xbd\xf1D\xbd\xbec\xf8\xe2\xbe\x9c% \xbe\xd4L\x97\xbdD(\xcc<\x88\xec\x12\xbf\xc1\xe4J>\xec(\xc3>l\xf2\xed>\xdbte>W\x8a\xb7>\xfc\xf1\x8d\xbc2\x87\xa1\xbeo\x99\x80\xbe(\xe7\xe7<\xbb\x17\xef\xbd\xe4\x1e\x8c\xbe\xbe\xa0-\xbd\x9c\xc4\x03?\x98\xc5.>\xd1\xd3\x15>\xe6dG?\x93\xeeG\xbe\xa7J\x02?b\xb5\x93\xbe\x1a\xaen=9p&\xbf\tQv<\x1cx\xcb=#n\xa7=\x89\x17o\xbf\x8f\x85%\xbf%G\x97>\xcc(]?\x18\xa1\x00?5u~\xbe$\\\xb9\xbd\x98\x1dU=\xe4\xce\xca\xbefk<?\x81=\x9f>8\xc9\xc4\xbe#\xe8\x0e\xbf\x06H\x1a\xbf\x10\x87\xdd\xbeU\xe2.\xbeu\xb0\x1a\xbe\xc7|\x8f\xbd\x13\xb3\xbe\xbd\x98\x85:>\xb8 \xdb>\xde\xb2T>\x94\x1e\xc0=]of\xbd\x8f\xfc#?@\xfd\xf5\xbe]Ye>*\x97\xaa\xbc\x1e7\xbb>\xf8i\x9d\xbe/\x99\x17?\xa0E\'\xbeR8\xb7\xbeK\x8f,>h\x94\x8d\xbeb\xd2\x83\xbe\x00\x9a\xcc>\xf6\x8c\x8b\xbdI\xd8\xd3>\xd8e\x98>\xf5\x08\xf6=\x94\x1d\xa2\xbe\x06\xe0J\xbe\x95L|>K\xe3p>\xbd\x83\x1a>\xae\x0c"?\xd6\x8e\x99\xbe\x18O!=\xa4\x1e\x0f?\x15\xb9\x05\xbcws\x04\xbe\x97\x04R\xbf@\xa9\xcf\xbdB\x1c\xf9>\xd6\xe3Y><\xf0\x87>\\\x93\xb4\xbdvg\xd6\xbe\xd7\x9e\xfc==,\xee<\xd42\x9b\xbd\\\xf6\x17?\x04\x87\xb1>\xfe&\x88\xbd\xb98\x8c=\x17\xbd_\xbd\x14e\xa7>\xa1\xf0m\xbd\x05`\x8b>]W\x0b>\x08\x13\x0c>\x82I\xe2=\xb2\xfb4=\xaf\xccB\xbd\xa22J\xbc8\x97E\xbe\xb8\xc9\xa3\xbd\xa0\x8b9\xbc\x0b\xfaQ=\xfd\xa2\x13\xbf\xf2\xe0\xee\xbd%\x01\x90\xbe\x10\x19,>\xcch\xbd>\x80\x9f\xf8\xbeU\x8d-?\x80\xa9\xa9>\xc8\r\xa8<\xa0^d?\xf0R\xe7\xbd\xdb\xe2\x1e\xbd\xc8\xab\x05\xbd\xaa\x0em\xbe\xe4n\xa7>*\'3>(\xc4\x19\xbeh\xf7\xed>\x14\xb2\xb8\xbe\xaf\xba\x95\xbb1\xfa\x18>\x17\xd8\x19\xbf\xda\x8e\xd4\xbe\xc6|\xb6\xbeM\xe7$\xbf\xde\xaa\xb5\xbe\x07\x19%>9[0=\x98\x88\xf8\xbe~\x87\xfa>\xbf\x87\x81>\xdd\xe2\x1d\xbe\xe9;\xaa\xbdE\x19\x96\xbe\x86Y\xea\xbe\x96\xcf(?\x1f\x81\xe0=\x18\xfd\xb2>/\xdc\xcc\xbe\xe3\x93E\xbf\x0f\xcaL>\x1b\x91`>\xf7(\xb9>\x05\xc0\x82\xbc\x88\x11\xc4\xbex\x92\x9c\xbeH\xf4\x18?(\xa7\xa3\xbcrw\'>\xbe\xc3\x88=\xdd\xb0\xa3>9r\x85\xbd\xd8\xc2V>\xe9\xce\xf3\xbc\x8f\xf5}>\xd8\x88l>\x7fAK?\xbf\x83\r?8La\xbe\x1b\xe2\xe0\xbb}>\x82>\xf1wM:'
-p561
-tp562
-bsV503956068285042688
-p563
-g2
-(g3
-(I0
-tp564
-g5
-tp565
-Rp566
-(I1
-(I200
-tp567
-g12
-I00
-S'}\x92\xc7>\xd8\xa5\xb0\xbd\xa5\xa3\x07\xbf\x03H\x9d\xbd]|z>Y\xe1\xa2\xbc\x95w\x12\xbdo\x94\x05\xbe\x899\xb3=\xc3\xb1\xa5>\xd8M?\xbdw\xceG=\x91\xc9\xbf=\x1bs4\xbe\r\xde\xbf\xbd\x1b\xf4\x86>\xe7\x93 \xbd\xfd\xaa\xf5\xbc b\x82\xbe\x90\xa3\x01=E\xd4\xb9\xbe\\\xe9C=\xf5F\xca=H\xaf\xd9\xbd\x11\x8a\xbf\xbdL\xd3S\xbe\xca\x94\xa2>\xc5\x19\x13\xbe;\xd5\xb7\xbe\xb9\xb2\x90\xbdy\x07\x0c>KQ\x7f<\xd4l\xee\xbc\xbd\x1d\xca\xbe\x0c\x06\xc5\xbd\xcd\x81\xa7>\x04\x04H>uTF>m^\xcf>\xf03\xbc\xbd\xdf\xf0\x82\xbe\xac^\xba=erP>\xdb\xdd\\\xbe8\xc3%\xbeq\xfc-\xbe\xff\x05\x07?I\xe5\x1e\xbb/!\xdf=\xe0q\x01?\x047\xc1=\xbf\x08\x10?I\xbe\xac\xbe&\x19\x9e=\xf8V\xde\xbe\x0f\x04\xbc>\xe4g\x11>%\x9eU\xbe\xd9\xb9\xd7\xbe\x8f:\xdc\xbe\xb1\x06\x9c>\x96X\xaa>\'[e<p\xde\x1a\xbe\xd3\xc2\x1c>\xeb<T>P;\xb4\xbee8\xc0>\x0b\xf6\xb3\xbe=\xad\xb7\xbdY\xa2\xdb\xbeH*\xbb\xbe\xdd\x03\x0f=\x8d\xbb\x91\xbd/\xcal\xbe(P\xed=-H\xac>\xc8\x1a\xba=\xa3+$>\xdd\x8bB>\x12\xa5\x85\xbdk\xb2H=s\'\xb6>\x02\xcb\x8e\xbe\xdc\xf0,=7\xe9\x83=W\x1c >Q\x0c\xd9\xbe\xc2\t\x0b?\xc3\xdd\xd0=\t\xf6\xaa\xbe\xc0\x85|>9\xf3\x85\xbe\xacT\xfc<s\xe6\xdd>\xb0\xe9.;\x8fO3>\xa1\xf6O>[e\x93>\xa0\x8b\xab\xbd\xc4\x93h<\x08\xbf}>\x95\x151>\xd0\xce8>EwS>$p\xc3\xbe\x86t\x86=Prb>\x01g\x00=q75\xbcq\xe4\x9f\xbe?\xf6\x91\xbc\x8f51>\xad\xb7\x04>;\xfa\xf8=\xffD\xcf<\xd4\xa0\xf9\xbe\x9c6\x96>0\x7fN\xbd\xae\xae\x17="\x8c\x05?\x13M\xf7=7\r\x03\xbe\x9c\xa4/=w\x84\xad=y\x86\xe1><\xe7@\xbeT\x8a\xe0\xbdej\x10\xbd\x03\xf2\xdd\xbd\xfd/->K\xd1\x17>Tp\xa2=\x9b\xa2\x04<5:\x02=O\xdf\x90>\x84\xea\x04\xbc\x85\xdb\xbd=$\xc4\xdc\xbd\xdd\xeb\x16>axe\xbeI\xa3\x96>\xb4H\xac\xbd\x9b\x8b\xf3\xbe\xd8\xbfl>\xb70\xa2<\x84,\x93>\xdbc\xf8>\xc9\xa8g\xbe?F\xab;=+\x06\xbe\xc9k)\xbeG_^>\xef\x04j>\xa8\xec\x10=\xb4\x11\xfb>\xe9\xfa5\xbe\xa9\x92\xb3=\xe7\x1f\xeb=\xdeH\xaa\xbe\xfb\xd8\xfa\xbb\nT\x04\xbe+\x8a\xcc\xbe\xff\xe9\xb0\xbe\xc1Ip=\xd7\x02B\xbe^\x04"\xbf\xa0\xfa\xa2>\xe7\x9c\x95\xbd\x11\xc8\xe9<\xe3Y!>\xf54\x89\xbdt\x9b\xff\xbc\t\xd4+?K=\x01>T:\xcb=fP\x8c\xbe`^\xed\xbeG\x9e\xf0<\x1d\x08 >\xa7\x19\xcb>/\xf1\xac=\xc4\r\x8d\xbe\xfb\xc8c\xbe\x06\xa9\xa3>\xda[\x04\xbe\xb9l\xb2>\xc0\xfa\xfb=O\xeep>\r5}=E\xf0\xea=\xc3\xb3\xb0=q\xe7p>?\xd0\x12\xbc\xb52\xf4>\x13\xab\xbe>1\x93\xd5=O\'\x9b\xbc\xb84_=eF\xa9<'
-p568
-tp569
-bsV503963474960330752
-p570
-g2
-(g3
-(I0
-tp571
-g5
-tp572
-Rp573
-(I1
-(I200
-tp574
-g12
-I00
-S'\x81\x0c\xf8>`\xffV;\x01J\x01\xbf\x88\xb4\xd2\xbdtU\x8a>eA\xd8\xbc\x15\xc9\xef\xba\x8d4z\xbe&\xef\x82<N\xfd\x91>\xeb\xc1\\\xbd\xc5\x9f\x19<\x85{B>\xb1\xe5\xb8\xbd\x9f\xb8\x16\xbe#\x19\xa1>\x96K(\xbd\xf8\xddF\xbd|pr\xbe\xd5\xbc\xdf;\x15E\x9b\xbe\xf4\'\xc2=W\x11\x15>\xe9\xe8$\xbeO\xc8\x1a<\x98\x12D\xbe\x0bc\x85>4\xfa\x10\xbe}\xec\xb0\xbe\xf7\xba\r\xbd\xeb\xaf\xde=\x80Z\xca;c>$<al\xc6\xbe+\xbb\x85\xbb\x94\xe6^>w=C>\xef"k>u\xd6\xbf>\xf9\xce\xaa\xbd\xdc\xce<\xbe\xc1R>=+\xc0q>w+\x95\xbe\xbf\xe6\x1c\xbe\xc9)\xde\xbd\xb0\xfa\xe8>\xcc\x97K\xbc\xb0`\x99=W~\x06?\xe5=\x8e=\xff\x86\x0e?f\x08\xa0\xbe\xfb\xc4\t>\xdd\xae\xdb\xbe!Q\x88>\x05\xad\x19>X0\xf9\xbd#\xa5\xf4\xbe\x01n\xf2\xbe\xa77\xad>3\x06\x95>\xf4\n\xa1=\xd9\x83,\xbe\xf0=\xff<\xd3\xb2,>\xd7)\x88\xbe\x03\x1a\xbf>\xe9z>\xbe\xfd\x19\xe6\xbd\x88\xf1\xf9\xbe\xc4\xd9\xae\xbe+\x8ep:\xfd\xc5\xba\xbd\xbd^H\xbe\x0f!\xdc=\xf3\xed3>\x87\t\xf3=\xa33,>u\xddH>os\xaf\xbd\x13\\B<\x8f\xdb\xb6>#\xccd\xbe\x19\xc2\xae=]\xb2\xff=\xeb\x94\x85>\x8c\\\xac\xbe\t\xdd\xfb>\x93\xf8:<\xe2\x18\x95\xbe\x0cK5>M\xd8\xa0\xbe\xe7\x01f\xbd\x04\x01\xb2>\xd1\x17\xa2=\x8d\x82B>$P\x88>S\x86<>\xb3F\xff\xbdY$V=\xaa.\x82>\x05V9>Y\xb2B>\x9c\x99\x8a>\x89+\x84\xbelc^=]B\x82>\xf0\x0b\xea<\xa3\xaf\x01=\xab5\x99\xbe\x90!\xb7=\xfd\xd5R>U\xb2\x00>\x8d3\xce<\xb5\x00\xee\xbcKU\xc9\xbeq\xd5\xa7>\xf5\'\x11;\xa5a\xca=\xed\x8c\x02?\xcb\x81\xff=}4\xe6\xbd\x14\xe7\xd0=\xc5\x144=\x81*\xb7>\xdb}+\xbe\x18\xeb\xea\xbcP\xe5\xef<\xf8\xf1~\xbc\xb6?\x14>k{\xef=m\x1e\x8c=\xd9\xed\x8a=\x84X\xc1=u\x88!>\xd4_\xa8\xbb\x7f~\x02=\xbfm\xac\xbdyQ\x9f=]\xe5n\xbe\n\xef\x88>\xfd\xe53=(\x92\xdf\xbe\nC\xa2>\x808)=\xf3\x18\x82>\x0c\xb6\xd2>\xf8n1\xbe\xcd\xc1\x7f\xbd\x85H\xa6\xbd{\x00\x1f\xbeg\xed\x91>s\x0cg>\xd8\x90<<mf\xdb>\xa9\xe6\x10\xbe\x17\xef\xb7=\xd9\xed\xac=\xbf\xba\xa1\xbe\x01\\\xaf\xbc\xd8\x95c\xbe\x0b\x01\xda\xbe\xc7t\x86\xbe\xc3\x1b\xcf=\xab\xbf\x17\xbe\xf9\xc8\x0c\xbf\\\xa6\x92>\x19\xef\x8b<q\xb6\x99\xbcmN\xe5=\xe8\x1f\x0c\xbem7\xad\xbd\x1e\xb2\x1a?_\x92\xaf=\xdd`\x7f=Q\x9e\xa9\xbes\x1d\x0c\xbfH\xfa\xd3<c\xb0\n>\xe91\x99>%\x84\x1c=\xf9^\x97\xbe\xd9\xb8:\xbe\x87\x8e\x91>\x1f\x97\x17\xbd\xd3\x18\x90>K\xe1\xfb=-w\x8f>3\x82\xf6\xbcq|S>t\x1a+=\xbd?_>\x01\t\x8f=%\xa9\x0c?`Z\xa8>8\x9e\xe5<\x16F\x97\xbc\xf1\xf5\x88=Od\x12>'
-p575
-tp576
-bsV503960265751531520
-p577
-g2
-(g3
-(I0
-tp578
-g5
-tp579
-Rp580
-(I1
-(I200
-tp581
-g12
-I00
-S'\x9d\xc8\xe4>fZ\x80=?\x9f\xf8\xbea\xdb8=\tW:>3\xeb\x99\xbd\xf398\xbdD\x15Q\xbe\x81X\n>/\x80&>\xbd\x99\xdd\xbdA?%\xbd~\xe3\x18=\x032x\xbd\xd5\x9ao=4\xbf\xb5>\xb7\x06\x17\xbd\x11\x80\xfe\xbcWeV\xbes\x93\xc0\xbdMY\xdc\xbd\xd9\xcd\xe7\xbc=\x12\x84>\xddk\xe0\xbae\xc3\r=\x91p\x05\xbe\x10r`>\x8f\x1e`\xbdcrd\xbe\xe3N\xe6\xbd\x19\x02\x8a\xbd(\x04\xe2\xbc\xd7m\xcc\xbcUj\xd6\xbeP\x812<Y\xb5\x7f>\xd5b@>\xf4\x94r>\x93x\xa6>\xd9\xbf\x06\xbe\xd4\x19\x93\xbe\xb9\x9f\xce\xbc\xd7.3\xbdI\x13\xa8\xbd\xa1\xd0\xa6\xbe\x1f\xbb2\xbe\x05v\xcd>\xeeF\x8d=\xc1c\x03>(L\xf3>\xf9+";\x10\xc0\xd2>)df\xbe\xaf\x02\x04>\xeb\x04\x83\xbe\x19\xe0<>\xd1\xa3\xc9=\x10\xc5\xe7\xbd\r\x8c\xad\xbe\x10#\xf4\xbe\x93\x0f:>\x9b\x85\xd0>;\xdd\x81>A\x9a \xbex\x98\xfe=[\xad\x8a=\x1eK\x90\xbeLw\xa5>\xe7\x1b\xee=\x9d\x165\xbe\xb0b\x03\xbf\xf8\xec\xd4\xbe)\xf9\x80\xbe\xb7\x1d\xef\xbdi\xfc1\xbe\xf7\xdeB=\xc1!e<q`\x8d=/;\xa7>\xe5\x01v>\xf0\xe40\xbd\xf1\x9d\x03>E\x06\xae>_\xacj\xbed\xbc\x97=\x85\xf7\xd2=\tV\x90>\xb5\xf7\xa0\xbeH\xa5\xf7>\x1f\xa7\x0b\xbeP\xed\xaf\xbe\xe5\xd0g>\xed}\x9f\xbe\xaf\xb4\xe7\xbdY\xf6w>\x05\x89\x82=M\x85\xa5>G#*>\xf3\xa2\x19>\x08\x9d6\xbe\xb3\xe4u\xbdy\xbap>\x97\xf8+>\xeb\xd6\x8e>\xecW\xb8>l\xf3r\xbeo7 \xbc\t\xfb\xca>\xd09-=/\x85\x15\xbd;\xbd\xc1\xbe\x861\x08\xbeb\xc1\xa5>?^\x12>pe\xf7=\xdb\xdct\xbdD1\xc8\xbe\xb8\xbc\x19>\xac7v\xbd\xcdQ\xa3\xbd\x81F\xdd>?\xe7\x8e>l \xd8\xbd\xb1/\x9d=YO\xfd;\x16\xb2\x80>N\x0f\x03\xbe\xc0*\xed<!\xd7\xdf=i)#>|\xc2?>X\xa3V>\xafxg=h\x04\x82=\x7fK\x82\xbd\xdf\x91\x0f>\x050\xaf<\x82-\r=\xbc\xe2\xc6\xbe\xdbB\xed\xbc\xeep\xaa\xbeoss>\x16\xd1\x1a>\x88\x08\xe9\xbe\xad\x98f>\xfd\x84\xc6\xbc\xd5\xb4\x9b=\x15\xb2\x05?3w\xaf\xbd\xbc<6\xbd\x80}\x05=\xa7j\xe7\xbce\xe0i>I(\x1b>y*\x1b\xbc$\xb7\xf4>\xb3\n\x84\xbe\xef\no<\xb2\xa2\x0c>\xce\xc7\x93\xbe\x98\xfd;\xbe3\xa1\x99\xbe\xe5\xc5\x01\xbf\x9f\x99S\xbe4!y=c\x92\xe2<\xad\xc6\xff\xbe(\xc2\xa6>\x84#\xc1=yl_\xbd4f:=\xff\x8d\x8a\xbe\x01>\x8a\xbe\xe3\x15\xc7>_\xa2~=\x15\x81J>Kp[\xbe\x9d\x84\r\xbf\xfdLs>kc\x0e>\'\xbc\xa0>\x99S\xa2<\xc5\x9f\x7f\xbe\xafD\x07\xbe\\B\x9b>\x07*\x84=\xbe\xbe\xa5>\x92\x11!>IU\x87>\x18:\xd1\xbc\x1c\xfa\x91>W]Z=t\xfck>\xf1bV=\xaf\x8b\x12?K~\x95>\x05\xe3\x91\xbd\xee\x19\x9e\xbcqD\xbc=\x94A\x00\xbe'
-p582
-tp583
-bsV503971628473409536
-p584
-g2
-(g3
-(I0
-tp585
-g5
-tp586
-Rp587
-(I1
-(I200
-tp588
-g12
-I00
-S'F\xdc\xc1>\xac\xb9U\xbc\xba0\xd9\xbe`NW\xbd\x9b\x98\x7f>\x02\x98m\xbbP\xbb\xc3:\x88\x01a\xbe%p\x07\xbd\x04\xc5\x16>\xa6?\xdf<\x12g\x82<\xf4\x04a>bN\xad=\xd9#9\xbe\xea(\x96>\t\x0e:\xbd\xcc\xed\x98;\x1f\xee=\xbe\xbe\xa2%\xbc\xe8\rL\xbe\xf1T\x14=\xb0\xf8R>\xd0;:\xbe\xcb\x8e\xf9;/E\r\xbe\xa6\x8b&>\xed\xc4&\xbe\x14\xd38\xbe\xe0r\x12=\xee\xb1\xf1<v\x8b\t\xbe\xff\xe8\x04>\xe7\x9a\xa9\xben\x81\xcb\xbc\xfb\x90o>\xf5I)>\x06\x91Q>t\x06\x84>\x89\xc1T=\xd04\xab\xbdD\x11?<\x84|;>\x12@\x95\xbe\xba\xc4\xa3\xbd\xe7\x9e\x95\xbd\xbc\x85\xbc>$\x99\xe9\xbc+\xcb5=\x0en\xce>\x92\xb0k=\r\xb7\xdf>D\x7f>\xbe\xd6\xf7\xc3=X\x96\x9e\xbe\xb3iO>\xe7\xda\x8e=\xa9\xf8\x17\xbe\xbcr\xa8\xbe\x9d\x85\xcf\xbe\x0c\x19\x81>\xab\xf6\xed=\xb3\xaf\x82\xbd\x91\xb2/\xbet\x06\x9e\xbbP\xd1&>\x88\x9a\x88\xbe\x9e^D>\x92\xfec\xbe\xef\xa2\x06\xbe\xb2\xd8\xe3\xbe\x1e|M\xbe\xe7^\xfa<\xa56\n\xbe\x7fG5\xbe\xb4Z\xdf=\xc2\xb3\x15>t\x89\x87=\x06b\xe2=\xceL\x1f>7\x9b\xd7\xbdTD\x14=,\xc9\x95>G* \xbe23\x00>\x0f\x97!>%\n\x80>\x0c\x9a\xbc\xbe\xec\x84\xf8>\x94&\x17\xbc\xfc\xd6\x90\xbeX"\xa3=\x8c:\xa1\xbeLyE=In\xad>\x1f\xfe&>Fr\x06>\xad\xdcN>t1\xe9= e\xf8\xbd\x99K\xb7<\x0e\x14\x89>\x998\xff=5\xbd=>\xae5\x8a>\xec\xbd@\xbe\xe7\x0b\x84=\x95\xae\xfb=\xfa\xd2@=F@\xb0=\xfe.$\xbe\x11<8>vW:>\xd7,\x96=G\xf8\x98\xbcG\xfe\x06\xbd\xf7Q\x99\xbe\xb2K\xa1>\x00\x15\xcc<W\xa7\x86=\xe9"\xe7>9\xe7\x92=\xaaD[\xbd\xd9~\x8b=6\xc7\x91\xbdt\xa4\x83>\xbe\xbc\x07\xbe\x18+\xdb\xbcZL\xb9<\x02\xad\xe9<r\x97\x10>p\xcb\x1e>4\xddx=?\xd9&=<\xb2\xae=\xa7\xdeA>\xac>F\xbd\t\xe0\x06\xbc{\xb6D\xbb\xb9E\xf3=\x0c\x7f8\xbe\x94b\x81>L~\x05\xbd\xddQ\xb3\xbe\xb4\xc9y>\xe4\x1d\xd7\xbd\x01\xc54>\xdcS\x97>\x1by\xf4\xbd\x12\x1f\xc4\xbc\xac5o\xbbA\x1b\x04\xbe\xa2\x1f\x95>_\xd5?>\x8dk\xa8=\xfcE\xac>\xc2\xad\xdd\xbd\xdaL\xdb=9F\xa8=\xc0\xadO\xbe\xef\xb3\x1e=\xffW1\xbe\x88#\xb0\xbe \xcb=\xbei\xef\xc4="+\xed\xbd\xf5\xbe\xe6\xbe\xdd\xf4\x80>O\x0b\x89\xbc\x077\xe1\xbc\x98\x1b\xc1=\x80\xa4\x1f\xber\xb1\x8a\xbc[\xc5\xf0>\x03\xba\x84=K\xf6\xc8<\xc9>\x91\xbeS\r\xd0\xbec\x93*=\xe9\x9e >8\x82\xab>l\x80\xa4\xbc\xf8i\x0f\xbe\x86=R\xbd\x88/c>\xe4\x83\x96:\xb2\x18\x85>\xb2\xef\x9d=\xf9\xe5m>\x93V\x88\xbd\x1c\xc5T>D|r=\xc0\x10:>Z\x91\x97=\xeb1\xfc>\xfeW|>\x0f\xe6\xa6<\xa0\xc0\xa0<D\xd2Y<\x14\xc6O>'
-p589
-tp590
-bsV503957531644149760
-p591
-g2
-(g3
-(I0
-tp592
-g5
-tp593
-Rp594
-(I1
-(I200
-tp595
-g12
-I00
-S'\xc7\xbb\xb3>}dQ\xbdz\x83\x00\xbf\xbbf\xb9<#\x89c>e?\x1c\xbd\x7f\xd6\xfd\xbd\xf7\x90d\xbe,EL\xbd\x85r\xb5>c\x82\x06\xbc\xbd\xd9W\xbd5\x9a\xb2=\xb4\xd2\x97\xbd\x89{\xb2\xbd\xb8\x8d\xb3>\x1d\xbd\xfc\xbdr%!\xbe\xdd\x8eR\xbe\x13\xe6\xcc\xba\xe2\x9d\xaa\xbe\xb5Y[\xbdc\x9aY=\x88\x9e\xfd\xbdI\x01\xf3\xbd\xd4q\xdc\xbd\xd5>\xaa>\xa5\xddO\xbeM;\xcd\xbe\xfb\xa4\xe3\xbc\xaf\x92\x1e\xbe\xfbP\xe9\xbd3\xf1\x0e>|w\xdd\xbe\xc3\xb9V\xbc\xf8\x1e\xf7>\xdc\x19\x83>\x13\xda\x0b>\xe9\xfe\xdd>\xbc\xb8\xb5=\xe5#n\xbe\xd5H@\xbd\xcc\x91u>\xe5\x04z\xbe}%\x81\xbed=\xd5\xbdY\xa3\x05?\x13\x8e\x13>\xf5\x03\x1f>\x985\xf7>\x83\xefU=9F\x02?\xfd\xc4K\xbeu\xa3\x7f\xbd,\xd0\x1b\xbf\xaf\xe4\x95>M4#\xbb\xa6m\'\xbe\xa8\xfa(\xbfK\xb2\x01\xbf\xb4\x8e\x7f>:\xd5\xa9>\xd8\xe2\xf8=\x17&\x91\xbe\x94{I=\xd1\xe8\x9e>\xf7\xd2\xa6\xbe\x058\xa2>\xb07\xae\xbe\xdd"\'\xbe\x12)\x1f\xbf(V\xf1\xbeC\x9bL\xbd\xb5P\xfa\xbdAm%\xbe\x03qe>  \xdf>)\xc3:>\x8d;\x83>\x99\x87~>5{\x9e\xbcq\x9a\xc3<\xec\x8b\xe9><e\xd8\xbe!\x13\xfb=[\xf82\xbd\xc9\x91C>\xa33\xf9\xbe\x9bV&?\xb8\xcf\xe5=s\xbfX\xbe\xc8f\x8b>U\xf0U\xbe\xb8\xbbj<c\xc5\xfa>:j\x9d\xbd5\xeb\x87>\x07\xb6p>\'\xa2\x87>#\x05\x89\xbd3\xeeF=\x83\x94\xc5>\x8b\x145>\xf9\x9b<>q\xde\x03?\xcc\xf2\xe3\xbe\x85rv<\x87\x17\x12>\x91\x92\xea=\xd72L\xbd7\x8e\x8c\xbe\xacc\xf8=\xf0OI>\x08\xac\x9e>\x83\xb47>\\B\xde=\x15M\xf2\xbe\x99\x05\xa9>\xf3\xdd\x19\xbdG6f=\xb0?\x1c?\x9c\xc35>\x15\x00\x18\xbd\x8bT\xfd\xbdp\x17j\xbd\x98\t\xcf>\x01\xfbG\xbeO\x17\xac\xbd\xb1\x9e\x1d=\xc9\xff\xf8=\x1d\xceJ<\xeb\x1c\x0b>\xa4#%>\x15\xbaf\xbb\xfcg\xc2\xbd\xd1)\x13>IZ\xf2\xbd\x85OJ=QR\x80\xbd\xcbR\xe7=\x00\xa1x\xbe}G\xdd>\xf3l\n\xbc\x95S\xe8\xbeY\x00\xa6>\x99\xd8H=\xe5+|>\xf9#\x19?}{m\xbe\xbf\x8d\xbf<\xa7\xec\xf0\xbd\xf8\xact\xbe\xb0\xdf\xa1>Y\x8e\xa7>\xe8\xaa6\xbd9C\x05?\xcd\xbdB\xbe\xa8\xb8\x1c>w\xdc\x1a>\xec\xbc\xc9\xbe\x19C\xff<$\xf3\x8e\xbe?}\x04\xbf/U\xad\xbe\x99C0\xbd-$\x18\xbeI\x99\x17\xbf\xf5\xc8\xd2>)\xa9\xa5\xbd]\xbf\xa2\xbc\xa5\x94<<\xb8\x85]\xbe\x01\xb1j\xbd\x18\\!?\x90B\t>I\x19\x00>5\xaf\xce\xbe\x93\xc9\xde\xbe\xf4\xe3@=\xb8\xd26>\x14m\xdb>\xb1\xc4\xc8=\xa6\x14\x80\xbeMN\x0f\xbe\xe0\xc6\xfb>3\n\xcd\xbdG\xdd\x80>Y\xd5\xb6=\x81\xb9\xb1>\xef\xf3\x1d\xbe7&0>\xff(\x95=\xd3\xa14>Sq=>\x80\xa9\xf9>\x0fs\xea>\x0cfN>\x81\xee\xc0=H\x00(>#\x1bY\xbd'
-p596
-tp597
-bsV504161981927264256
-p598
-g2
-(g3
-(I0
-tp599
-g5
-tp600
-Rp601
-(I1
-(I200
-tp602
-g12
-I00
-S'lu\x07?7\xcf|=\xac\xcd\xf0\xbe\xe8*\xb0<\xe0\x06I>\xf3\xae_\xbc\xc4\x97\x90\xbda;\x80\xbe\x81x\xc4=\x95\x15\xb6>\xeb\x8d0\xbd\xb6\x0f\xc8\xbd/o\x98<\xdb\xd3\xa3\xbdL\xd049\x14\xc2\xd2>\xc2D\xb8\xbd\xc0\xa1\xe2\xbd)\x7f\x8b\xber&\t\xbe\xe7\xcb\t\xbeC\xcb\xbe\xbc\xe3\x11t>\xe5N\xb8=\x7f\xfa\x93\xbc&`\xde\xbd\x11Ao> \xbb\xc5\xbdo\xc4\xaa\xbew\xb3I\xbe*\xca\x12\xbe\x96\x85u\xbdT+\x1c<&"\xfc\xbei\xff\xa8<\x8a+\xc8>\x12\xc5\x9b>y;<>il\xb1>\xd1A*\xbdC*\x8c\xbe\xb4\x1b\x10\xbe\xd1<\x97\xbb@\xc3\x1b\xbe\xb2\xcd\xa1\xbe\x97\'\x0e\xbeO\x05\x03?\xd6G\x01>\x1f\x00\xfc=\x809\x0f?f\xc2m\xbd/?\xfe>O\xb5\x9b\xbe\x9a\xfc`=i\xbf\xeb\xbe\xd0D >\xc9\xe2\x81=\xcf\xda\xee\xbdG\x13\x0e\xbf4\x81\x10\xbf\xd0\xbdD>\xff\x90\x04?qo\x9a>]2\r\xbe\xe3\x14\x8d=\x08/5>o;\xc2\xbe\xffv\xd9>f\xd3\x0e=\xfdU\x9a\xbe)J\x06\xbf\xe0$\xeb\xbe0\x86s\xbeA\xeb8\xbe\x93\x8f4\xbe\xe8)\xb3=6\xee\xa8=\x87\x93\x08>W-\x96>\xfcH\x8a>\x1dw\x9c;&,\x81=y\xc0\x01?\r\xa8\xb7\xbe\xf9\xbd\xe5=j\xf4\x97\xba\xa96\x87>\x0c\x95\xd9\xbe\xc7V\x16?\xfa\xc0^\xbd\xe7\xc7\xb8\xbe\xa3\xf5X>\xbc^\x8e\xbe\xe6\xc7\xdf\xbd\xb6\xd0\xcf>9\x1b\xbf\xbc\x06\xe1\xc0>\x03\xc3V>S\x80]>\x03\xf4)\xbe\xb3\xe6\xb1\xbd\xc9{\x8b>\x04\xefL>W\x18Q>F\xad\xd0>gj\xab\xbe4q\xf3<\xed\xf6\xc2>i\x11\x84=)\xeb\x1e\xbd\x06\xf4\xfb\xbed\xed\xb9\xbd\x17\x17\x95>\xc6\x10\x14>\x81\xac8>\xb7\x83\x86=-p\xe6\xbe\xb1\xf2C>\xc4F$\xbds\xa5\xaf\xbdT\x87\x00?\xa1\x84\x9b>ge\x8a\xbd\x87c\xba<\x94<<\xbd\xb7\xd5\xb9>A\xd1\x16\xbe\x97-\xa8=\xc7\xa9h=\xff\x11\xd0=p\r\xdc=`\x0e/>\x90A\x07=\xfaI\xb3<\xf6sj\xbdQ;\x00>\xa6\x88$\xbdv\xe1\x96=\x81#\xd5\xbe\xf6\x8b\xc6;q\xbb\x96\xbe\xf6_\x94>\xf6\xdf\xfc=\x13O\xf3\xbe\xcf\x94\xab>\x9d\xfd\xbc=\xc9\xc1\xcb=\x91\xb26?\'\x02\xe4\xbdL\xdeV=\x8a\x02X\xbd\xbcn\x07\xbe\x7f\x98n>`C<>\'\xa7\xbd\xbc\x1a\x00\xf8>?\x11\x83\xbe\xff?T=\xb1\xd7\x02>\x11Q\xd1\xbeA\xc2c\xbe\x9f\x96|\xbe\xb2\xea\x12\xbfZ\x9f\xb2\xbe\x9f\xe6q=\x7f\x16\xb2\xbb\x9c\xe1\x17\xbf\xe0\x9a\xc5>\xfc\x02\x8a;\x0eV\xaf\xbd\x1d\xab\x17\xbb\x9b\xbf\x93\xbe\xe6i`\xbe\xed\x8e\x17?\xd2\xf1\x0e>\rr\x86>>\x10\x95\xbe-&\x18\xbfp^\x1b>\xcaXI>\xd6N\xd4>i\xf1\xbf=\xe1I\x8b\xbe\xcd\x1a"\xbe\xd9\t\xf9>\xe3fS9\xdbr\xa4>@}\x18>\xf43\x8f>\xb5\x98\xb3<:ld>\xff\xabS= \xdb\\>\x01\x8b\xf9=\x00\x86$?W\xaf\xd2>\xd41\x1c\xbdJ\x88+=\xf9\x19E>x\xfb\xaa\xbd'
-p603
-tp604
-bsV504164874113384448
-p605
-g2
-(g3
-(I0
-tp606
-g5
-tp607
-Rp608
-(I1
-(I200
-tp609
-g12
-I00
-S'\xf7\xba\x11?V\x02Q=\xcb\xae\x13\xbf\xc9y\xbf\xbdh\xa9\xa1>\xc5|t\xbd\x84\xda\x06=6P|\xbeb~\x1e<\x16\x1dq>\x87\x8bm<\xd9\xcb\x07=\xec\xf2e>\xe8Q\xbf\xbc\xab\xbc\x80\xbdA\xee\xe5>J\xd6\x8d\xbd\xf1\xd7z\xbd$\x1a\x8b\xbe\x00q\xd7\xbc\xc9\xfc\x9b\xbe\xb7\xc8\xa9=u5\x89>\x85\x85\xc6\xbdu\x1aE=\xda$W\xbe\xce\x92Z>#\x81K\xbe\xe65\x8e\xbe\xb1\xb2T\xbd\xf5\x14\xc7=\xd7\xcdF\xbd\x97\xa6C={\xe0\xce\xbe\n\xd0\x16=E\xb8O>\xbb\x8co>G\x87\x89>\xf2\xc3\xbc>2\x7f\xd7\xbd\x94\x15;\xbe1W\x04\xbc\xf8\xa2G>\xd6f\xa8\xbe\x17\xab\x16\xbe|\x06\xf9\xbd\xdf4\xf3>\xac\xd4W\xbds\r\xc2=\x1av\x13?\xac\xea\x14=D5!?bJ\x9e\xbe\\\xa45>\xddy\xe0\xbe@!l>\xa8\xab\xff=\xe2K\x1a\xbeD\x9b\x08\xbf\xd2r\x03\xbf\x9c\xd3\xab>\xa6\xfd\xc2>A\xd7\x95=\xcf\x1fE\xbe\xdc\x8e\x0b=\x8e\xf5\x04>\x19u\xa8\xbe\xa5b\xe5>\x83\x9a\x1e\xbe\xb4\x9c9\xbe\xe5:\x16\xbfe,\xbd\xbe\xb1\xa7\xc3\xbd\x01%\xc9\xbd\xb8 =\xbeF\xdd\xf2=\xa1o\x08>C\xe7\xa0=\xf5\x9b1>\x11/\x87>1\xba\xbb\xbd\xc2hx\xbc\xd5\xbf\xbd>iC\x84\xbe\x9f\xd9\xf7=\x9aZG>\xacM\xca>O`\xba\xbe\xba\xe5!?\xe7\x04T\xbd#\x0e\xc8\xbeG\xadA>\x99\x0e\xd1\xbe\xe3\xbaz\xbd\xc8\x07\xc4>(t\x1e>1\x16s>C\x1e\x9d>\xf2\x00\x0f>:\xc2G\xbem\x9an=\xe1\xf4\x92>\xf8\xbfe>2~i>\x0b\xaf\xd2>u7_\xbe\xe2\x93\x8f=\xbe\xd4\x9f>O\xe8\xeb\xbb\x0c\t\xaa<\xf7\x1c\xb4\xbe;\xb7\x08>d\xe5\x8c>\x8c\xaf\x82=\xca%:\xbd\x8al\xb1\xbd\x10o\xd9\xbe\xcbC\x8b>\x15\t\x18=\x91\\\xb7=\xee\xfd)?[\xae\xfe=\xee)\x95\xbd\x9a\xf9&>aS\xad=\xbb\xa9\xbb>j\xf9\x15\xbeK\xa7S=\xf2[>=J\x95\xcb<\xbf\x1e>>\xd2\x8f\xd6=\xb3\x15`=\xca}$<\xcb\xf6\xec=j\xe09>\xb1\xb8\xcd<m\x06\x0e=\xc2\xf1\x0b\xbe\x9b\x98\\=\x95a\x86\xbe\x0c\xe1\x99>\xa3U\xb1=\xcb\xf9\xef\xbe\xc0\x9c\xbc>Bo\xe3<\r\x1d@>\x87a\xe5>\xe5\xe8)\xbe\x04\xea\xf6\xbcx#\xb0\xbb|\x8f\xef\xbd\x8e\x83\x8d>\x9a0\x1d>j\x80B=wF\xed>([3\xbe\xc2\xcb\xab==\xde\xf7=ZM\xba\xbe\xe2%E\xbcA8=\xbe\xdb\xca\xc6\xbe\x16D\x89\xbe\x19\x1d\xfe=\xb1\xe6\x02\xbe\xb7|\x02\xbfT\xe1\xad>\x12B\xc7<?@\xe2\xbd\x92#\xe6=\xf4H\x1c\xbe##\n\xbe\x99g$?\xe2\x01\xc9=\x1c\xf5\x98=\xe6\xdc\xab\xbe\r\x91\x19\xbf\x92\x8d\x01>\x86\xb6`>\xfe\xff\xc5>\r\xc3\n\xbd\xf3\xc2\x83\xbea!\xf0\xbd;\x93\xa7>\xc6\x802\xbd\xa7\xe6\xa0>\x12\x00\xa0=\xafI\x89>\x19\xaar\xbd\xd6\xa8}>\x8a1\x06=n\x18^>>}\xe8=\xe7\xb7\x1d?3\x05\xb6>\x93\x05\x08\xbd\xbc\xba\x0b\xbci\xf2\x04=\x91\xbe >'
-p610
-tp611
-bsV504262585794191360
-p612
-g2
-(g3
-(I0
-tp613
-g5
-tp614
-Rp615
-(I1
-(I200
-tp616
-g12
-I00
-S'\xd8\xd9\x07?8^*>H9\xfd\xbe\x15lD\xba\xbf\nH>W\xc8\x98\xbd"_\x14\xbd\xb6\xf0\xa1\xbes,U<\x87\xb0\x83>\x95kb\xbd\xcb\xbc^\xbd\x95\xb3\xc3=|\xb7\x18;D\x8b=\xbd\x98\xf9\xba>\x19\x04\xa6\xbdNY \xbe5\xeeI\xbe\x89T\xaa\xbd\x15\xf02\xbe\xdd.\x90<a7v>\xe0\x9d[\xbd\x7f\x8b*=\xe8\x15\xba\xbd\xd3\x87E>\xb5F\x02\xbe#\xea\x86\xbe9\xdb\x84\xbd\xf3\x08\xc2\xbc\xad\xdc\xac\xbd\xb8;\x85=\xb9\x19\xc6\xbec\x18e=\xa1\x90\x9f>\xd8I`>\x7fTo>\xa5\xe6\xb8>\x1a\x1e\x88\xbc\xf0\x13I\xbe\xb8T\xc7\xbd\xb9\xb3\x14>\xc8\x81x\xbe\xc1A\x83\xbe\xe3b\x8d\xbd?\x8c\xd5>\xa9t\xb0<\x87\xe3\xa6=w\xe1\x11?\xa5m\xe2\xbbd\xdc\xe0>\x05vq\xbe\xd5\xca\'=\x8b\x0c\xd7\xbe\n\xba\n>T\r\xe1=/.\x18\xbd\xedk\x13\xbf\xdf\xf5\x06\xbf_@z>\x19b\xce>\x95[F>|\xa7n\xbe\xd5\'\x84\xba\xb2B\x01>-\xa9v\xbe\xed\x16\xc2>\xd5+\xea\xbc\xe1\xf8P\xbe\xbfO\x1c\xbf(,\xdf\xbeS\xd4I\xbe\x81\x92\x1f\xbe\xa0d\x1c\xbe\x83)\xac=?\xf9(=\xaf\xfd\x02>\x7f\x87\x85>\xc7\x9eU>P\xe0\xe3\xbc%\xa7\xab<\xc3\x82\xc0>\x88\xce\x8f\xbe\xf4\'\x18>\xf3X\xc4=\xcb\xd2\xa1>\x12z\xa4\xbe\xd3\x01\x07?L\x04\xa7\xbdp\n\x90\xbeg\x15\\>\x9d\xbf\xac\xbe\x84e\x80\xbdn\x97\x9e>y\xfe\xc6=\xe37\x80>\xb0\x9c\x84>\xb0\x0e\xd8=\xda\x9a\x1d\xbe\x19\xab\xb2\xbco\xa0\x8c>\x03n\x1f>\xc3m)>\xd0\x9d\xe2>m(\x8e\xbewW\xa3<\xc2`\xa9>g\x07\xca<\x81\x1dY\xbcKj\xd3\xbe\xd8\xf2\xa4=\xad\x8e\xbe>s\xeaO>\x10v\x01>\x8b\x06\xb7\xbd\xbfN\xc7\xbe\x1a\x85\x8d>g\x15\xa5<\x1d2I<\r\xd9\x01?\xdc\xa8X>\x15:\xaa\xbd+}\xa5=pso\xbcm\x13\x88>\xd1\x91\x1f\xbe1\x9c\xf2=\x1fv\xad=\xedl\xb9=\xf0\x12\x1e> \x04!>\xf8\xf8\x18=+K_<\xcdt\x02\xbdcy\xad<i{\x10\xbdm%\x9f\xba\x08\x06}\xbe\x95\xc79\xbc \x08\x7f\xbe\xd9\xe3\x85>\xb3\xc4\x12>y\xb5\xf7\xbegI\xca>\x8d6\x85<\x94\xd5\x17>\xf3Q\x0b?\xe3\xb2\xbc\xbd\xa8\xf4\x7f\xbd1z\xab=\x19\xe9\xbb\xbd \xfe\x98>\x8cKO>\x07\x93X\xbc`\xce\xd9>[\xc0>\xbe|;\x93=Dk\xfa=\x81\x15\xac\xbe!\xf3\r\xbe\x8c\xe4\xab\xbe[I\xf3\xbe1\x95w\xbe0V\xa2=\x00\xb48\xbd\xd0\xb5\xfd\xbe\x03\xd5\xb3>\x84\x7f->\x80\x16\x93\xbd\x08=\x91<|\xdd\x86\xbe\xd4\xe8q\xbe\xc6V\x04?\'\xc8\x84=\xdbQ0>\xf0X\xa9\xbe\x13\xaa\x16\xbf=\x9f\xf8=\x9b\x81)>\x0cJ\x9a>\xc1\x85N\xbdS\xf1\x87\xbe\xff\x85(\xbe\xe8\xaa\xb4>7\xb70<\x0b\x05\x86>\xb6[\x8b=\x1a\x8e\xa6>3\x0e\xe9\xbd9\x00\x83>9\xd7]=9\x9d\x88>I\x87W>\xd5?\x0c?|\xa2\xcc>=\xee\xbe\xbd\x94#\x10=\x03F\xbd=!Q\x96='
-p617
-tp618
-bsV503970299243954176
-p619
-g2
-(g3
-(I0
-tp620
-g5
-tp621
-Rp622
-(I1
-(I200
-tp623
-g12
-I00
-S'\xecbS?!\x93U>\x9e\n1\xbf\xf9\x1dQ\xbd\xccvn>c\x84\x02\xbbM/F\xbd\xb2\xdf\x9b\xbe\xdai\xf7=\xd6\x1e\xec>3\x7fT\xbe\x10\xe59\xbel\x1d\xb5=\x01LV\xbe\xb3\xd9Z>x\xea,?\xd2v\x06\xbe\x96wU\xbe\xcd\x99\xd1\xbe\xad\x9b\x81\xbe\xfa\tk\xbe\xd1?\x08=\xc6\x01\xf0>\x1c\xd7\x99>:\xc2O>\xdaEu\xbe:\x99}>\xfa;A\xbc\xda_\xbe\xbe\xf6\xc9\xf2\xbe\x13R\xe7\xbd\xf3<\x89=?\xd5_\xbd\xbf\xfeF\xbfW|I>\xb7e\x8a>\xcc\xb9\xf4>\x976\xc5>\x8dD\xd9>\xd7\x0b\x93\xbei\xf2\xec\xbe\xc7\xa0-\xbe \xdb\xd1\xbd\xb9\xc8\xe1\xbd\xe3\x03\xcf\xbeZ>k\xbeh7\x0e?\xd5\xad\x04>g\x86M>Y\x99Q?\x8b9\x18\xbeo\xa1<?A\x18\xca\xbeowx>_p\x02\xbf\x9d\x95\xd8=\xa9\x8bQ>\x1d\xd5\xb8\xbd\xe6EH\xbfWr8\xbf\x01\xe5\x8c>\x90am?{\x8a\x15?\xbd\xcdC\xbeo`\xdb=W\xc1\xb49\x1f\xbf\xdd\xbei\xaeK?`(\xdc>\x81\xcd\xd3\xbe\x04?*\xbfx\x0b/\xbf\x7f\x9f\x13\xbf1d\x0c\xbe\x91[K\xbe4\x97\x86\xbd\x0f\xb3\xf8\xbd \x1f\x1b>\xfd\xe9\x07?\xec\xfd\xba>\x17%>=\xef\x0e*=\xef\xe7\x0f?\xd0\xbb\xe0\xbe\xfa*\xcd=6\xd5\x84=\nO\xee>b\x8a\xb5\xbe\xc3\xdbE?\xcd\xdf\xb8\xbe\x16_\x12\xbf<\xcej>\x11\x95\xc1\xbe\x8d\x8d\xd5\xbe\xb9\x16\xda>%\xd4\xa3=\xd0_\x16?\xac@\x9b>7\xc0$>Z+\xe8\xbeZ\x00\xe9\xbd\xe8\xd1\x85>\xb0o\xbb>\n\xdd\xb9>s\x800?\xf7\x9e\xa0\xbe\xe3\xf4<\xbc\x15w5?\x999\x0f\xbd`\x91f\xbdQ\xd0f\xbfM;;\xbeTe\n?h\x194>\xb6\xa6\xe8=4\xa2\xdf\xbd1\xf8\x1a\xbfa\xe2\xc8=Lg\x02\xbd\xb9\xaf\x19\xbe3\\5?\x07X\xe4>`\xbf]\xbd\xaej\x86>\nB\x12>-\xf9\xe7>\x9c\xadE\xbem\x11\x93>\xe6c\xdb=~\x83\x8c>\xdc\xa1\x85>\xb2\xa4\x00> \xa7\xe4<4\xa2\xa5=\x9c\x92\x98\xbd*\xc6\x13>PK\xa1=a\x1e\x1b>v\xd5<\xbf@\xeaM\xbe&\xab\xfe\xbe\xe4\xe6\xbe>w\xe2\xd5>\x1800\xbf?\xdc\x1d?\xc6\xc6L>\x0c2\x1b<\xe4\xff\x89?\x8ct\xcb\xbdX\x182\xbdg\xaf\x19=q7\x10\xbe\x1e\xc5\x89>\xd4\xe1\xbd=Po\xc9\xbce\x90*?\xb8\x9a\x02\xbf6p\x14<\xa9\xe2U>\xa0\xca/\xbf\x06\xee\xc7\xbe\xdc\x80\xcf\xbe\x1fMT\xbf\xfc\xcf\xd0\xbe\xcc\x89x>3\xa6\xa9<\xd2\x94-\xbf\xfc\xd6\x11?K\xa9\x8d>|?n\xbe\xd8\x037\xbcp!\xd5\xbe\x0b\x8e\x1c\xbf\xb4\xd62?\xa7\x95\xe6=;\x85\xae>\x99\xd5\xa9\xbe\x83\xd6z\xbf\xac\x0f\xcf>\xe61\x92>J+\xed>l\xa4\xff\xbc\x13\x81\xe4\xbe\x04R\x1c\xbe\x84j3?\xa7\x1c\xa3<\xdf^\x00?J\x13\x15>9\xf0\xbe>-\xf4A<\xf6$\xad>\xcc\xc6<\xba|5\x88>V\xad\x01>\xc95n?\x04/\x00?\x94\x8b}\xbe\xb3\xcf\xe8\xbd_\x9f)>Fn6\xbe'
-p624
-tp625
-bsV503978932539236352
-p626
-g2
-(g3
-(I0
-tp627
-g5
-tp628
-Rp629
-(I1
-(I200
-tp630
-g12
-I00
-S'\x98gf>\xc4\xb7\xa5\xbc\x85\xfd\x83\xbe\'b>\xbd9t\xff=8\xa9c\xbdY\xd8,<\xad\xe9\x17\xbe\x9d\x1a\t\xbd\x81p\xd5=\x0f\x84\xd0:\x81"\xbd;\x94\x86\xea=\xb54\xf6\xbb\xbc~\x9d\xbd\xcf\'\x1e>\xa3U\xd9\xbc\x17\xb3\x16\xbd\x9a\x94\x9d\xbd\xd7\x95\x91<\xe3,-\xbe\xdc\xce\x1e=\xb0\x1c\x18=\xc8\xb2\r\xbe\x97\xe7\x91\xbc\xb9\xcb\x83\xbd\xb2A\x18>+\xaa\xe1\xbd!\x809\xbe\x85b#=\x9b{x<\xdf|&\xbd\x80\x7f2=\xe4\x91+\xbe\x98"S;s\x87\x16>\xd9\xfb\xa3=\x83y\xb9=\xafEY>5\x1eI<7\x07\x95\xbd\xc1\xd4U;\xc9S\xf7=7\x92@\xbe\xe8\x0c\xc1\xbd\xdd\xbdA\xbd\x18>L>\x0f\xc7\r<\x11\xff\x11=s\x95l>\xe4\xce/=\xab\xb3|>\xb2\x14\t\xbe\xb7\x9b\xa2<l\xa5Y\xbe.\xd2\x06>\xcfXW=\xd0wj\xbd\xd2\x1b\x8b\xbe5\x9cm\xbeh\\1>\xa7\x91\xf4=\x93\xc2\xe2<\x9f\xa8\xdb\xbd[hc\xbc%"\x06>k\xfd\xbd\xbd+\xb6\x10>\x94\x81\x05\xbed\xebU\xbd\xba\x1f\x99\xbe\xcd\x953\xbe\xcbqF\xb8m\xc6\x86\xbd\x8fY\xbb\xbd\\u\xbe=\xfb\xd9\xfb=X\\\x9b=\x9b0\x99=\xdd\x93\x02>k!9\xbd\x04Tk<Q\xfe)>Kz\xfd\xbd\xa4uV=\x84\x01\x88=\x83)\x04>\xd9\x17%\xbe\xa6\x1f\x87>\xdb\x824<\xbb3\xde\xbd\xaf\xab\xea=\x06\xd4$\xbe}\x8eL\xbc\xadC7>p\x81c=\xe9#\xd9=\x8b*\x08>\xe1\xdf\x83=%7\xcf\xbc\xa3\x02M=\x13@2>o\xf2\xb3=\xd4\x1a\xbc=\x0f\x9aN>\xf9\x85\x0e\xbe\xcaV)<\xfc\xc9\xb0=\xe4\xf5\x03=\xab\xd6&:xE\xc3\xbd\x0f\x7f\xbd=\xa7\xee\x97={6\xcb=CD"<obt:\t~:\xbe;\xa7+>)Z\xd0;\t\xac\xa5=$h\x89>\xedv\x89=#K\xd8\xbc5\xc1\x19=\xd7\xf3\x8f\xbb\xa9\xed3>\x17-\xe4\xbd\x8bC\x95\xbc9\xe4\x9e<\x0b8r=\xcb6n=\xd5\xd8\x90=\xeb\xcc\x8a=)\xe4\xc9<H\xf5\xd2<e(i=p^\x9b\xbc\x08"\xc7\xbc\xff&\x88<h\x15]=x\x99\x04\xbe\xbc70>\xe4\xa3\xee;\xabr`\xbeMJ\x19>\xad.\x04<+\xb7\x1c>/\xc4=>\x83\n\xb7\xbd\xb3\xf6%\xbdO\xa7\x18\xbd\xcc\x12\xaf\xbdQ\x164>\x1d\x9c\x03>\xa1\xc1\x07\xbb\xdb\xf4d>\xa3\t!\xbd\x9f\xc7\xc1=wy\x08=\xdbr\x07\xbe\xcf\xc1\x16=v<\x06\xbe3\x19Y\xbec\xde\xf5\xbd\xbbV*<\xceB\x9d\xbd\t\xd2\x8a\xbe\xcc\t\x02>9\x1e\xd4;,5\x85\xbb\x93\x03\t=DL\xdd\xbd\x9c\xe4\x13\xbd\xfd\x92\x8f>\xf1\x1fx=\xf9\x10\x13<H\x96I\xbeY\xbe\x87\xbeHz@:\x80\xe1s=\xd9\x01\x04>\xfc\xd8\xc3;\xf7\xfa\x0e\xbe\xe2\xb2\xa9\xbd\n\x05\x19>\x1de`\xbc\xe4t\x01>Gd*=_\x931>\xe3!\xab\xbd}t\xd8=$s\xe5<\xcbc\xc6=\x97\x17\xbe=7\xdc}>\x18\x154>\x88\x97m=\xbfJ\xd7<\x18\xfc\xfb<\xbc)\x80='
-p631
-tp632
-bsV503959892152311808
-p633
-g2
-(g3
-(I0
-tp634
-g5
-tp635
-Rp636
-(I1
-(I200
-tp637
-g12
-I00
-S'\xc7\xbb\xb3>}dQ\xbdz\x83\x00\xbf\xbbf\xb9<#\x89c>e?\x1c\xbd\x7f\xd6\xfd\xbd\xf7\x90d\xbe,EL\xbd\x85r\xb5>c\x82\x06\xbc\xbd\xd9W\xbd5\x9a\xb2=\xb4\xd2\x97\xbd\x89{\xb2\xbd\xb8\x8d\xb3>\x1d\xbd\xfc\xbdr%!\xbe\xdd\x8eR\xbe\x13\xe6\xcc\xba\xe2\x9d\xaa\xbe\xb5Y[\xbdc\x9aY=\x88\x9e\xfd\xbdI\x01\xf3\xbd\xd4q\xdc\xbd\xd5>\xaa>\xa5\xddO\xbeM;\xcd\xbe\xfb\xa4\xe3\xbc\xaf\x92\x1e\xbe\xfbP\xe9\xbd3\xf1\x0e>|w\xdd\xbe\xc3\xb9V\xbc\xf8\x1e\xf7>\xdc\x19\x83>\x13\xda\x0b>\xe9\xfe\xdd>\xbc\xb8\xb5=\xe5#n\xbe\xd5H@\xbd\xcc\x91u>\xe5\x04z\xbe}%\x81\xbed=\xd5\xbdY\xa3\x05?\x13\x8e\x13>\xf5\x03\x1f>\x985\xf7>\x83\xefU=9F\x02?\xfd\xc4K\xbeu\xa3\x7f\xbd,\xd0\x1b\xbf\xaf\xe4\x95>M4#\xbb\xa6m\'\xbe\xa8\xfa(\xbfK\xb2\x01\xbf\xb4\x8e\x7f>:\xd5\xa9>\xd8\xe2\xf8=\x17&\x91\xbe\x94{I=\xd1\xe8\x9e>\xf7\xd2\xa6\xbe\x058\xa2>\xb07\xae\xbe\xdd"\'\xbe\x12)\x1f\xbf(V\xf1\xbeC\x9bL\xbd\xb5P\xfa\xbdAm%\xbe\x03qe>  \xdf>)\xc3:>\x8d;\x83>\x99\x87~>5{\x9e\xbcq\x9a\xc3<\xec\x8b\xe9><e\xd8\xbe!\x13\xfb=[\xf82\xbd\xc9\x91C>\xa33\xf9\xbe\x9bV&?\xb8\xcf\xe5=s\xbfX\xbe\xc8f\x8b>U\xf0U\xbe\xb8\xbbj<c\xc5\xfa>:j\x9d\xbd5\xeb\x87>\x07\xb6p>\'\xa2\x87>#\x05\x89\xbd3\xeeF=\x83\x94\xc5>\x8b\x145>\xf9\x9b<>q\xde\x03?\xcc\xf2\xe3\xbe\x85rv<\x87\x17\x12>\x91\x92\xea=\xd72L\xbd7\x8e\x8c\xbe\xacc\xf8=\xf0OI>\x08\xac\x9e>\x83\xb47>\\B\xde=\x15M\xf2\xbe\x99\x05\xa9>\xf3\xdd\x19\xbdG6f=\xb0?\x1c?\x9c\xc35>\x15\x00\x18\xbd\x8bT\xfd\xbdp\x17j\xbd\x98\t\xcf>\x01\xfbG\xbeO\x17\xac\xbd\xb1\x9e\x1d=\xc9\xff\xf8=\x1d\xceJ<\xeb\x1c\x0b>\xa4#%>\x15\xbaf\xbb\xfcg\xc2\xbd\xd1)\x13>IZ\xf2\xbd\x85OJ=QR\x80\xbd\xcbR\xe7=\x00\xa1x\xbe}G\xdd>\xf3l\n\xbc\x95S\xe8\xbeY\x00\xa6>\x99\xd8H=\xe5+|>\xf9#\x19?}{m\xbe\xbf\x8d\xbf<\xa7\xec\xf0\xbd\xf8\xact\xbe\xb0\xdf\xa1>Y\x8e\xa7>\xe8\xaa6\xbd9C\x05?\xcd\xbdB\xbe\xa8\xb8\x1c>w\xdc\x1a>\xec\xbc\xc9\xbe\x19C\xff<$\xf3\x8e\xbe?}\x04\xbf/U\xad\xbe\x99C0\xbd-$\x18\xbeI\x99\x17\xbf\xf5\xc8\xd2>)\xa9\xa5\xbd]\xbf\xa2\xbc\xa5\x94<<\xb8\x85]\xbe\x01\xb1j\xbd\x18\\!?\x90B\t>I\x19\x00>5\xaf\xce\xbe\x93\xc9\xde\xbe\xf4\xe3@=\xb8\xd26>\x14m\xdb>\xb1\xc4\xc8=\xa6\x14\x80\xbeMN\x0f\xbe\xe0\xc6\xfb>3\n\xcd\xbdG\xdd\x80>Y\xd5\xb6=\x81\xb9\xb1>\xef\xf3\x1d\xbe7&0>\xff(\x95=\xd3\xa14>Sq=>\x80\xa9\xf9>\x0fs\xea>\x0cfN>\x81\xee\xc0=H\x00(>#\x1bY\xbd'
-p638
-tp639
-bsV503967558710865920
-p640
-g2
-(g3
-(I0
-tp641
-g5
-tp642
-Rp643
-(I1
-(I200
-tp644
-g12
-I00
-S'\xc1U/?x\xe1L>\x85\xc8\xc3\xbe\x91\xfeM\xbe%\xde7>\xdb]\x10>\xcf2t\xbd\xa8`\x8d\xbem\xa8\xa1;;\x8f\x0b?\xbb|\x8c\xbc\xf0pF\xbe.\x02(>\x04\xfa\x95\xbd<\x16\xad\xbdI)\xd4>8e!\xbe\xd9\xbd^\xbe\x01\xbd\x8a\xbe\xd1\xaa\x12\xbe8Er\xbe\x0b\xf6\xe9=\x1e\xd4\x8b>\xec^[>\xa9uq=\x1f\x13\x06\xbe\xf0\x1e\xf1=!.\x0c\xbe\xdc%\xbc\xbe\x11\x95\x8b\xbek~\t9\x89\xfb\x9e\xbdK\xd30=\xb3\xb6\xd5\xbe\x81\x10\xc7=\x19\r\x9c>Q\xbf\xbb>!:\x10>\xfd\xf7\x9b>\x8fk\x82=S1\x07\xbe\xd6q\x1f\xbe\xd5"\xd5=cs\x8d\xbe\x8d\xb2\xa4\xbd\x8c\x8e$\xbcG\x83\r?\x1b7\x07=\x1d\xa8P=XO.?\xc5\xde\x00\xbeng\x08?\xa5\xbf\xae\xbeW\xf9-=\x11\x8b\x17\xbf\xc5;\xd1=\xe3#\x18>\x8c\x9au=\xc9KH\xbf}\n\x05\xbfR6\xa5>\xd3\xd3\x12?8IX>t_\x18\xbe\x7f\x92#\xbe\x85\xb9/>\x02\x85\xa3\xbe\xdb<\x1c?aX\x0e\xbd\xd1I\xa1\xbex\xe9\xcc\xbe\xbcJ\xc7\xbe\x05|<\xbe\x84\x92\x13\xbe \x0f>\xbe\xc4[B\xbd\xe9E\x1f\xbd\xb9WN>\x19]$>\x95@\xf2=M~\x03=\x15\x97\xf0\xbd\xa3\x00\x16?\xaf\x9e\xb1\xbe?\xcfp>-\x06\x91=\xd4U\x8c>\x0b\x81\x99\xbe\xe7\xa5\x07?\xe50\n\xbd\x17\xb1\xb3\xbe{\xd0\xf4=\nk\xa4\xbeMh\x87\xbdg\x14\xca>\xb4\x07\x87\xbch\x94\x86>\xa7\x96\xa5>\xa9A\xc2=\x19LW\xbea\xe3!\xbeUVL>\x87Qi>\xfb\xea_=\xc1\x9f\xbd>\xc8\x10g\xbeD\xa4\x0c><\x9a\xc0>\xb3Z\xed\xbc\x05u{\xbdW\xcc\x18\xbf\x069\xa9=\x05F\x90>\x17F\x8f=/\x84\x16>\xf5P\x81\xbd\x08\xfe\xaa\xbe\x1f\x1dj>#k\x8a=S\x9d\x08=S\xc9\x00?\xb4\xc9Y>\xa4\xe1\xaa\xbd\xc3\xd7\xb9=\xce\x91\x81\xbdh_\xbb>K\xec\xc5\xbdSx->\xa5pK\xbc\xe7B\xc8\xbd\xcaW\xa1=?R~=\x041c\xbd\x1a\xeb\x98\xbcQ\r\xc9\xbc\x90\xa8\xc0<\xa1r\x81\xbdCx\xa1\xbb)^\xa1\xbe\xf3c\x88;\xdfc<\xbe\x1f-\xbc=\xa4\\7>\xe0h\xd4\xbe+k\n?M\xbb^>\xf9\x1a\xfa=\x90\xdf\x19?\x94\r5\xbe4\xe9\xa5\xbc\x01\xdc\xe2\xbd\xcf\xack\xbe>\x84\xa4><\xcf9>\x14\xe3R\xbd\x19R\xaa>\xd7\xee.\xbe\xe1\x16,=]\xa98=\x13\xc7\xf3\xbe\xf6\xb9\x8e\xbe\xf9\xaa\x00\xbe\x99t\xe5\xbeC\x84\xa7\xbe\x81\x8a)>\xb9$\xa9\xbd\x8c\x9f\xfb\xbe\xb0\xdb\xb0>\x87\xad\xf0=\x90\x86\xfe\xbd\x08.\x9e\xbc9\xdf\'\xbeH6>\xbe\x91\xff;?\x06\xde%>\x8b):>\xf7\x81\xc8\xbe\n+\x1f\xbf\xaf\x9d\xbe\xbc\x0b\xe7\x89>L\xe5\xc1>;#\x0f\xbdN\x87\x9c\xbe\xbe]\xa5\xbe]\x14\xdb>\r&\x93\xbd\xb0\xb7H>\x1f\xbbK=\xac\xfdu>\x8bz2=\x90%\x00>\xa6\'\x98\xbc\xdc\xf3\x80>\xa9\xda\x19>|\x062?g\xc4\xf1>\xd5\x9f0\xbe\xbc\r\xc3<\x1c\x07`>\x11\xa1\x83>'
-p645
-tp646
-bsV503972642744188929
-p647
-g2
-(g3
-(I0
-tp648
-g5
-tp649
-Rp650
-(I1
-(I200
-tp651
-g12
-I00
-S'\x95\xea\x0f?\xdf\xa1\x99<\'\t\x10\xbf\xf5\x05\xf3\xbc\xe7o\xaf>\x9c\xa5\xed\xbd_\xbc\t\xbc=\x7f\x8f\xbe \x99\x18\xbc(sb>]Y3\xbc\x91\\T=S\xc3P>9\xce\x97\xbc\xd5\xd7\xd4\xbd<u\xe8>y\x19\xf1\xbc\x9cU\x08\xbd\x14\xc6x\xbe\xf1u\x84\xbc\xf8\x92\x9b\xbe\xf1\x18\x93=\xf1BR>\t\xe9|\xbe{\x9b\xc2<\xd9\x82?\xbe7\x1e\x83>\xdb}X\xbe%\xf0\xad\xbe\xd4Es=L\xe8p=\x99\xda@\xbdKi\xea=\x9dn\xd7\xbe\x0b\xb4\x9b=\xe3\x1fe>\x89\xb3Z>\xa5w\x82>\x8f%\xdf>e\x9a\xa7\xbd\xddSA\xbe\x0c\xd5/\xbd9\x85\x83>\xdc\xe6\xae\xbe\x03zD\xbek\xc2\xfa\xbda\xee\xe9>\x1f\xa6\x97<lB\xd2=\x7f\x04\x03??\x9c\x01=\xbe\x18 ?\xa5\x1a\x99\xbe\xb0\x9d\x04>\xfbE\xef\xbe{#]>\xec\xca\xd5=\x9b\xaf\x0b\xbe]\x93\x17\xbf[I\x06\xbf59\x91>\xa7g\x9c>\xf9\x04\x03>\x13\x9eC\xbeM\x15\xeb\xbb\xa9\xe5\x1c>\xbf@v\xbe\xc7\xf5\xc4>\xe3$\xf5\xbd\x97|$\xbeU\xcb+\xbfx0\xbf\xbe\xf5\'\xc5\xbd\xeb\x91\x07\xbe\xa9T\x12\xbe\x98AK>#\xf1\x0f>\x9b\x8c\x06>\xb3\xcba>\xc9\xff\x84>-\xd4\xef\xbd\xd3\xa2:\xbc4\xc6\x9b>\xb6a\x8e\xbe\x9cX\xc9=[a\x05>\xcc\xf0\xd3>\xff\x8d\xaa\xbe\xafu!?\x91,b\xbd~P\x93\xbe\x91XQ>\xa8{\xcb\xbe\x95\xc9\xcd\xbd\xcb\xa8\xcd>a\xe4\x1d>\r\xd1\x94>\xa5x\x99>\xb3G\t>\x90\xe5W\xbe\x11@\xdf=\xc3\x1b\xaf>\xdc\xcb`>\xc9\\P>t|\xf1>\xe7\xabe\xbe\xd5X\x18<\xbe\xd1\x82>^\xd0\n=+,w=\t\xe8\x9e\xbe\xef\xf8F>\xd1\xbb\x8c>8\xd3&>\xb9\xff>\xbd \xae\x10\xbc0\x05\xd3\xbe\x1f\x05\xa5>8\xce\xaf=\x90\xaa\xc7=\xb33\x1a?T8C>-Mx\xbd\x87\t\x1e>\xa56\x90=\x0b\xe9\xb8>\x85\xbc`\xbe\xed\xfbZ=K\x9er=2\xea&>\xff\x16\x0e>\xe32\xac=#\xd6\xdf=\xa5_.=!\x7f\x0f>\x8dl\xbe=\x0fn\xdb<\xfd$\xec<@\xf4\xbf\xbd\xb5\xa6M\xbbg\x86\x9e\xbe\x18\xf6\xc3>a$\xd9=\x1f\xdd\xea\xbe\xa8s\xb5>UW\xae\xbcE\x9eD>\x94s\xe8>%\xa8\x0f\xbe+\xc3~\xbdI\xb9\x9b<\xa1\xd0\r\xbe\xda\xaf\x87>\xdd\xd77>K\xf7_=$\xdd\xec>\x8fO1\xbe\xe3L\x04>k\xd2\xc7=uv\xbc\xbeU-\xc1<\x11O\x9d\xbe\xc0\xed\x00\xbf\xb7\xed?\xbe\x93\xa6\xab=\xbd\x93\xb5\xbd#\x9b\n\xbf\xb0`\xb2>\xfb\xb6Q=x\x83\x04\xbe1\xfa^=\x83O\x81\xbe\x84\xa8,\xbe\x07\x86\x1f?K\xa9\xbc=\xf1\x95i=\xe3^\xba\xbe\x9e\x7f"\xbf\xc8\x8c\xe6=Y\xc8@>\xc5\xc1\x9f>[4R<0\xa4\x90\xbe\xc8zQ\xbdk\xfd\xc1>I=\xcb<\xa7\n\xa7>A\xf7\xb9=\x14\x90\xa6>\xd0\xfd%\xbe\xee0\x97>{\xc5E=<^+>\xa3\x8d->\xf6\xd8\x1b?Y\xc7\xae>\x15\xd0\x85:\xc0?=:\xbdU\x11=\x15Q\x18>'
-p652
-tp653
-bsV503957909374783489
-p654
-g2
-(g3
-(I0
-tp655
-g5
-tp656
-Rp657
-(I1
-(I200
-tp658
-g12
-I00
-S'c\xc7\x90>\xf9\x1b\x14\xbeS&\x83\xbe\xb3Ac\xbc\x01\xc4\x83>o\xfd\x8c;\x98fs\xbd\xdd\xb1e\xbeH\x97\xee\xbc\xd7_j>\xb9\xe3\x8a=M\xb7\xa8\xba\xbd\x08A>\xb4\xf9\\=\xdd\xde,\xbe{\xe0\xa5>X\xf2\x8e\xbd\xef\xbd\xe6\xbc[>H\xbe$Lv\xbd\x19\x96\r\xbe$;u<T&\xf5<\x1a\x8f\x14\xbe-\x01\xd3\xbcpO\xe0\xbd\xb7\x89&>\x18\xe1A\xbe5%\x93\xbe\xc5\xc7\xb7\xbc\x17\x8bF\xbe\x7f<\'\xbd\xa0\xea\xdb=\xa3\xe5\xb5\xbe\x17\x0b\xe2\xbc \xd2\x82>i(d>\xa1\xda\xa1=\xc3\xf9e>\xa5\x8b\x85=\xf4_\xdb\xbdIy\x80\xbd\xfbO\x08>\xc3\x99q\xbe\xd3\xe8\x1a\xbe\x8e\xf7\x15\xbd\x95\xcf\xc1>|\x08\x82=\xad?\xb0=\x83\xbd\xb4>F]\x85=\xa0\xa6\xdb>\xe0\xd0U\xbe\x84\xac\x81=\xec\x06\xc7\xbe\x8dnY>\x9f3\xee\xbcK++\xbe\xaa/\xa6\xbea{\xc8\xbe=*B>U\x8c\x0b>\x8bK\xc6=\x18\xb0\xc3\xbd\xa8\xb6\xbb<\xb0\xeeB>%\x1ed\xbe\xb9h6>\xd5\xd6\x19\xbeg\xbdl\xbe\xdd\x9e\x9c\xbe\xb8;?\xbe\x84\xa8_=\xeb;\x13\xbe\xe4\x01\x9d\xbd\xbb\xb5+>\x1f\xf5z>\xfd\xfd\x0c>X\x08m=}\xd0o>y\xee_\xbdd\xd1\xa5;1\x03\xb3>\x0c\xda8\xbe,\x10_=\xbfv*\xbc\x88\xef,>d\xef\xba\xbe0\x00\xf2>\xdf\xb2\x83=\x042Y\xbe\xc3\x16\x81=\xfc\t)\xbe\xb9\xaf\x80\xbbk\xdd\xd2>\xbfd\xe9\xbcl\x19\x1f>\x97W6>\x15\xabS>1\xdd\xa5;\x10\x9a\xfd<\x7f\x0cu>\xe1&\x1f>!7->\x84e\x96>\xf9MJ\xbe,.\xc8=\xb8\x98p=k\x7f\xc9=\x84\xa6+=\x8d\xc9\x0f\xbe\xe9h\xe0=5\xd1\x03=\xbd\xbcS=#\xba\xc3\xbcps >\x11\xb8\xab\xbe\xaf4\x8a>\xff\xa2\x0c=\x85\t\x02<\xcf\xf0\xc7>\x8d\xe3\xf3=\xb4\xe4L=\x05z\xa3\xbde\x0b$\xbd\x8cT\x9e>\xe3)\t\xbe\x8a\xbc\x83\xbd\xbbl\x00=\xef\xe8#=\xf0\x81E\xbc\x83z\x90=\xc3W)>\xeeu\x92:\x90\x01\xec=\xd9\xc2L>\x98p+\xbd\x87EU=->\x87\xbcy\xc9\x10=4\xc0*\xbe\xd9\x83\xa3>\x14\xe7\x1b<P8~\xbe\x0ciB>]\xbf\xc7\xbb\xb3\xfb">!\xe2\xa4>\xe44+\xbe\xe1\xe5\xc6=\xaf\x95\t\xbe\xb1I\x1c\xbe]\x94J>\x14\xff4>\x99\xfa\x87=\x05\xa4\xa1>\x1b\xae\n\xbe)a!>\xa7\xad\xc6=\xb0tu\xbe\\\xadV=\x81\x92\x04\xbe\t+\xd4\xbe\xd9\xba3\xbe,91<\xf5\x81A\xbdA\xc3\xf5\xbe\xeb\xae\x82>\xd4"^\xbekY\xba\xbdS\xb7\x1f=\xc1\xf8<\xbe\xb4\xbe?=\xbd3\xf4>\xd8\x86\n>1F-=$xT\xbe\xb5\xb6}\xbe\x17\'\x7f=\x0c9\xf3=\xe1\xd7\xab>{\xaf\x0e>u\xa7"\xbe\x89\x8d\xa2<8\x10\xa7>\xff\xb6\x93\xbc\xd7\x07j>j\xcc\x13>w\xd7\x08>\x17\x13Q\xbb\x9c/d>1\xe9\x8c=tG\xba=\x19\x83\x0b;\xa7z\xcb>\x84\x13@>\x13s0>\x157\xb0=ks >7\xc9\xc4='
-p659
-tp660
-bsV503973827861577728
-p661
-g2
-(g3
-(I0
-tp662
-g5
-tp663
-Rp664
-(I1
-(I200
-tp665
-g12
-I00
-S'p*\xd2>\xee\xeaw\xbb\xe3\xe3\xda\xbe~Y\xab\xbd\xf7\xc3z>u8\xa8\xbdx\xf0\x8c=\xf1\xd2D\xbe1]6\xbde)\r>}\xbc\xbf<U\xbe\xf9<\'\x0cj>h<\xba\xba\n\xab\x03\xbe\x0f9\x98>\xedz4\xbd\x07\x0e\x1d\xbd\x98\x14$\xbe\xc2\xb4\xc9<@\x1b\x85\xbey\xb8\xbd=\x9b-\x08>;`O\xbef\xa9\xa2<w\xa1%\xbeg\xdbC>\x81H2\xbe%\nr\xbe\xa7X\x1f=i<g=\xbb1\x17\xbdr\xea\x88=\xbd\x9e\x91\xbe\x85\x9d\xb1\xbbEY&>f\xd1\x0b>u\xe19>3\xd8\xa6>}d)\xbdA\x8f\xc7\xbdoW\x0b=\xbf\x9aa>\x91"\xa3\xbe\xef\xab\x00\xbe\xe2\x15\xa4\xbd\xc06\xaa>\x815-\xbd\xae\xb7]=\xfaZ\xd5>?\xe6\xae=\xc0\x0b\xf8>\x11\x90y\xbe\x10B\xdd=\xee\'\xa9\xbe\nwT>\xb7G\xb8=N\x19\xe9\xbd\tG\xc7\xbe\xb7\xe5\xc5\xbe\xf8\xe1\x92>`%A>U\xa2\xbf<HQ\x1b\xbe\xd3q\'<#\xe7*>\xe8\x06C\xbe0\x96\x85>\x97\xaaP\xbe\x15\xa5\xfb\xbd\x00\xc3\xf2\xbe[jw\xbe\xb1\xc6\xcf<\x87\x87\xe8\xbdj9\x1a\xbe\x88q\x18>\x10\xeb\x17>1y\x87=\xde\xf3\xca=I^[>\xa9z\xe2\xbd\x9b\xcd\xd7\xbc\x0b\xfa\x8e>\xb7\xa8(\xbe\xb3#\x9c=\xcbP\x1a>0\xdf\x93>:A\x90\xbe\t\xdd\xef>\xcd\xb4X\xbc\xab[m\xbe\xdd\xd7\n>\'2\x9f\xbe\x01\x7f\x97\xbc\x90\r\x92>\xaeX\x19>\x9a\xe4\x0e>7@\x80>%\x18\xd8=\t\xc7\xa8\xbd0\x1c\xaf=\xc5\xab\x7f>OM,>&\xbf)>\xee\x95\x97>\xeb\xb67\xbei\xb4X=\x8b\xf20>\x95\x0f;<uu\x12=\xc2\xff2\xbeh\xed*>\x93&\x1f>\xab\xe9\xb6=Y\x1ee\xbd\x1c\x1e\x80\xbd\xc1;\xa1\xbe\xf2\xf2\x93>Q(.=\xb1\xfd\xe2=\x98p\xf8>v\xfe\x82=\x13S\x8e\xbd6\xc0\xd8=\xc0\x1c\xed<\xcb\x89\x90>b\x92\x16\xbe\x12Jz\xbc[\x12 =\xc17\x07=@@\xfc=\x01\xdd\xb5=\x92\xaf\xd0=\xd3%\xcf;\xf3\x0f\xe2=W\xa8\xf4=\x0e\xc3\xf0\xbb+\x9a\x98\xbc\x83\xcd\x01=mr\x9f=\xd0,J\xbe\xa8\x96\x87>\xda\xf3\xf4<\x90\xc3\xba\xbeC\xa9\x84>\x05\x80c;>\xf3a>Iz\x87>y\xfd\xfa\xbd\xae\x8e)\xbdx{\xf4\xbc"\xae\xc5\xbdoX\x82>\x9e\x9d1>\x18\x83|=~\n\xbd>I\x94\xaf\xbd\x8e\x18\t>{\xb9\xb0=\xc3nh\xbe#]R=\xeb\x01/\xbe\x98\x04\x99\xbeC\x16T\xbee3s=\x9ee\n\xbe~\x8b\xdd\xbe\xc0\xe7O>*\xe4$\xbc\x19\xf9Y\xbdM\x07\xb8=a\xbd\x05\xbeCm\xe4\xbc\xa7\xf9\xfb>;\x84\xc1=\xd8r <B,\x8f\xbe\x00B\xe4\xbe\x19\xd4\xb3<\x12\x8d\t>@\xb8\x83>+a\xc9\xbcOVF\xbe-\xbd\xb9\xbd\xff\x0e^>\xa1\x85\xe1\xbc\xf2Q[>\xa34\x81=!\x01b>\x00\xc9\xc2\xbdv\xa4Q>\xe9\x03;=\x7f\xb79>2\r\xcc=\xd2\x9e\xe6>\x1f\xca\x85>il\xb6<>\x9a0<\x88\x7fJ</\xef.>'
-p666
-tp667
-bsV503978761398665216
-p668
-g2
-(g3
-(I0
-tp669
-g5
-tp670
-Rp671
-(I1
-(I200
-tp672
-g12
-I00
-S'\x9b\xc7\x0f?"@%=\xc2(\x11\xbfB\xa4\xf7\xbdr\x04\x97>\x10\x0f^\xbd\xf2\xb3\x15=$\xd36\xbeb\x07\x04=@N\x8f>rLA\xbd~\xd7\x86\xbd\xab\x8a\x00>\x8f\xf6\x04\xbenX\x15\xbe\xce\x8b\xb9>E\xa0\xe7\xbc1\xc8!\xbd\xe4\xa3\x90\xbej\xb1\xfc\xbc\x17\xb6\xae\xbeT\x0f\xe3=\x95\xf03>\xe5;f\xbdqO\x16=\xd1\xddp\xbe\xc5 \x95>\x14\xb7\xe8\xbd7d\xaf\xbe\xae\xcf(\xbe\x8f\x15,=^\x08\x9c<B\xe2\xa4\xbb+l\xe8\xbe\xd1\xd8\x82\xbd\xc9\x8f\x8c>\x9c<I>\xf6V\x82>\xc6B\xd5>\x85\x05\xea\xbdn\xb9\x85\xbe\xe1U\xa9=\x14!a>\xf4\xc7\x98\xbe\xf1S"\xbeN\rR\xbe\xa9\xe7\xe4>\xec\xdf\xc7\xbc\'\x12\t>\n\x91\x1e?\x82S9=\xbf\xe6\x1b?@q\xbe\xber\xbc->\x1a\x0b\xca\xbee\xba\x84>DBU>\xb9\x03M\xbeR\xf7\xfb\xbeA\xf9\xef\xbe\x17\x1c\xae>\xae\x96\xd9>\xaa"\x90=\xaa\xa5\xe8\xbd\x9f\xdc\x04>\x19\xb5\x01>\x07\x86\xac\xbeR\x00\xd7>\xae\xb4k\xbe\x99\rU\xbe\xca\x96\n\xbf|<\xaf\xbeZ\xac4\xbc\x7f\x00\xd8\xbdV\xfb\x8d\xbe\xa9hU=e\xb1R>|\xdd\xb4=l\x8bM>\xa2\xcd\x82>\x14\x8d\xdc\xbd\xb1\xe7\xb5\xb8\x87\x0c\xc1> \xf2u\xbe_\xa6\x9c<7\xc7\x07>{\x9cr>d\r\xd0\xbea\x19\x1d?\xdf\x048\xbd\x1c)\xbc\xbe\xe2\xc34>\xc1\x1d\xc8\xbeo\x81\xae\xbd\xe1!\xc8>o\xcb]>\x1f\'Z>wP{>\x8f\xbd.>t\x04!\xbe\x1e\x90n<\xd6V\x99>t\x98U>\x94\xc6D>\xe0bv>|\xd8\xae\xbe\x17\x89\x95=D\x1e\xb6>\x97\x1c"=`[\xbf=\x87\x85\xd0\xbe\x80*\x08<vR\x88>\xbb\xb9\x93=\xb5\xc5$=VE\x14\xbd9\xa6\r\xbfYp\xb2>;\xa2n;:\x84\'=\xa6n\x0f?\xb2(\xf0=\xb75\x1a\xbe\xae]C>DeN=\x89~\xc0>\x1fz\x81\xbe\x00\xf8\xde\xbc\xa1dN<T?\xf9\xbcqZ=>\xef\x14\x08>\x17\x7f\xed=J\\\xa4\xba\xb1\xe7\x9b=\xe7|3>^\xd5\xa8\xbc\xa5\x9e\x93<\x7f\xfa\x02\xbe\xde\x84\x01>\x9cU\x97\xbe\xca\xb7x>9\xdd\xbf;\xc8E\x07\xbf\x16\xbd\xb6>63\x85=\x9b\xbd\x82>!\x99\r?\x1a\xb0\x15\xbe\xef\xbc\xe0\xbc\xef\x05?\xbd\xce\xf4\x07\xbek\xbf\x9d>\x84eD>:\x86\xb6=\x81Y\x07?\x9c\xb9X\xbe\xae\xc2\x01>\x9eV\x15><\xb1\xa4\xbe$\xbe\x8e\xbdr\x978\xbeQ\x15\xd9\xbe\x01a\xcc\xbe\xb1\xec!>B\x8a9\xbe\x87\xa8$\xbf\xf0\xb0\x82>\xd0\xb5j=d\x10\x17<\xff\xd60>\xf9\'\x05\xbe\x82\x1e\xca\xbd\xba\xae\'?jS\xf7=\xd5b\x17>V\xf8\x9b\xbe4\xde"\xbf\xfaiE=\xbf\xccF>\ta\xce>\'\xf4\xe1\xba \xe5\x97\xbe\xa1\xcdA\xbe\xb9\x8f\xc1>B\xb8\xcb\xbd\xd24\x9c>|M\xc9=\x05\xa6`>\xf0\xb4\x90=,\xf0b>\xbc\x10\x05=,qu>\x11\xfe\xce<W\x95\x1b?\xff\xcc\xab>\xb7f\xe8;\x8c\x12\x1a\xbd\x0bp\x9a=V\xdf\x9f='
-p673
-tp674
-bsV504173749969911808
-p675
-g2
-(g3
-(I0
-tp676
-g5
-tp677
-Rp678
-(I1
-(I200
-tp679
-g12
-I00
-S'6\xba\r?R\xd5\xda=\x9b\x96&\xbfx\xc7(\xbeKSZ>>\xe1\xaf\xbc7\xb7\x1c\xbc?@~\xbe\'\xd2\xfa\xbc\xd7\xde\x80>A\xaa\xa7\xbd\x9e\x81\xc7\xbd\xd1\xf4\x85>j\x05<\xbe9\x8ex\xbd\xb6\xba\xa5>%se\xbdV:F\xbe\xb1\xfaf\xbeB\x96\xb2=N\xde\xb3\xbe/f\xb4=\xe1\x92L>?\xa1\xb3\xbd\x00\xac\x8a<\xcb\xdbA\xbe^\x08p>\xdey\xda\xbc\x9f`\xba\xbe[_\xb9\xbd\x98\xda\xeb=\x9b\x91\xf5<\xf3\x80Z\xbd\x86j\xc3\xbe0\xa2\x94\xbc\xe9\xa4n>_\xbaN>\x85\xa8\x83>:\xb3\xca>V\xae\x8e\xbd\xb0n?\xbe\xe6\x81\x97=g-\xa4=\x8b\xb9\x8f\xbe`\xbbr\xbeb{\x07\xbe\xf2Q\x04?\n\xf2\x0c\xbd\xf9M\x8a=\xaa-\x17?5\x06\xb5=Z\x90\x04?z\xad\xaa\xbe?\xd7\xc0=I\x13\xbe\xbe\x9b\x8c\x87>(\x85V>\xa9V9\xbc\xe2U\xed\xbe`$\xe9\xbe\xff\x1e\xbf>\x80\xa1\xe0>B\xda\xe8=\xb0\x13:\xbeks\x1c=\xab\x9a\\>"\no\xbeu\x06\xe5>Ae@\xbe\x02\x8e\xea\xbd\x8a5\x06\xbf\xc9t\xeb\xbe\x05\xa3!\xbe\xfb\xc7\x10\xbd*\xcd\x98\xbe>\xc5\x06=\xe6\xeb\xff=\xb7: >\x8a~[>M1;>\xa21\xf3\xbc\x86%\x01=\xb29\xc2>\xc2\xc3m\xbe\xdbU\xaf=\xfa\xfb\x83>\x8brZ>%B\x9d\xbe\xe0"\xe3>zx\xd0\xbd\xce\x93\xbe\xbe\xa9\\\x86>k\x01\xb7\xbe\xb3G\xe7\xbdh\xe3N>zW\xb5=b_L> :\x86>\xf2O\xe9=\x17\x96\xee\xbd\xbb\x1f\xcf;\xae\xd3o>\xd1\xb6S>\'\xe3v>\t>\x94>\x08W\xa8\xbe\xce\x06\x80=Fe\xcc>2\xd0\x1e\xbc\xf6.\x85\xbc\x00\xd8\xcc\xbe1\x1d\x9d=\xef\xf3\xa2>@\xabR>\xf7\xd4\x8d=:\xe96\xbe\xbdC\xdc\xbe+P\xa4>\x9f\xc7\x03\xbeb\x0f\x06>&\xe7\x08?\xed\xd3\x1b>\xdebH\xbe\n\xd8\x17>h\x1a2=\xe7g\xa4>\xa0\xdds\xbe\x8b\xd3\xb1<\x1d\xfc6\xbd\x12\x04_\xbdj\x1eQ>\xb9;\x87>u\xa7\xdb<!*\xb6=\xc1?\xe8\xbc\xb8\xe20>\xd5\x19F\xbdh-2\xbd\x8d!J\xbe\xc6\x96\x98=8\xe8\x84\xbe yx>\x99\x96\xa4=%P\x01\xbf\x06]\xb2>&\x9b\xb3=\xce\xf9\x83>$\x91\x0f?\'IB\xbe\xdf\xb3\xd9\xbd6\xbc\xa1<\xd2\xce\x00\xbee\x0c\xc6>\xe6`\x96>\xca>!\xbdn\xf4\xf0>\xab/\x01\xbeO\x1f\x90=|\'\x02>\xbb?\xc2\xbe\ra\xa6\xbd\x17\ne\xbeI\xbe\xc8\xbe\xb9\x1e\xbd\xbejR\r>\xe7\x80\x80\xbeP\xee\x1d\xbfP\xe0\x86>=\xc1\x19>\xf7\xad\x99=}\xa1\xa9=\x89\x85A\xbe\xf1\x012\xbes\xab\x1a?\xb0MG=\xab\xe2\x99=\xf2\xf7\xb7\xbe\xe3w+\xbf\xb4f\x08=J"9>\x97<\xb0>\xe2\t\xaf\xbdn\x1d\x99\xbex\x8e\xaa\xbex\x98\xa1>\xa6z\xdb\xbd3>\xb0>\x07\x82\x80=\x9e\r\xbe>\xb7\x01\xee9\xa7J#>N\xbc\x98<\xed\x81\xa0>#\x0c\x18>\xe1e\x0f?\x83\xd1\xd3>\xa3\xbf\x13\xbd\r\xa9\x02=Ye\x92=\x82Il='
-p680
-tp681
-bsV503963031790161920
-p682
-g2
-(g3
-(I0
-tp683
-g5
-tp684
-Rp685
-(I1
-(I200
-tp686
-g12
-I00
-S'\x06\x06\xce>@k\xb6\xbd\xc4\x1d\x0e\xbf\x12\xac_=\xd0\xa9\x9b>AP\x1a\xbee\x99\xf3\xbc\x19\xcf\xa3\xbe%\x86\xf9\xbctx3>z\xfd\x8b=\x82\xef\n>\xf3uB>\xebt0=L\xb1\x1c\xbeF\xb2\xb2>\x80S=\xbd\xa5\x97\x96\xbc\x99\xc2>\xbeW\x9c;=\xb2\xb6\x98\xbe\x94\xa8\x93\xbc*\xc7\xf2=\x02o\xc8\xbe\xdd\xab\xf8\xbd\x89\xc2\xee\xbd\x08\xc5\x98>\xffY\x92\xbe\x02%\xa6\xbe\x01oG>\x11U\xc8<[\xa0\x16\xbe\xa9\xe4\t>@w\xb4\xbeF\xb9H\xbd\x9b\xf2\xcf>\x9fI\x18>\x837;>\xfc\xaf\xf7>\\$\xc5<\x9c\xe4\x12\xbe<\xf4\xa5\xbc\xd6/\x92>\xde\xf6\xba\xbe\x84\xbe\x82\xbe\x8f\t\xc2\xbd\x84\x83\x06?\xad\xbe~<f\x11\xa7=\xb3B\xf5>o!\x06>\xa7\xbf\t?\x18\xbb\x85\xbe\xd1\x88\x8c<VP\xfa\xberO\xb1>\xe5\xcc\x05=\xc5\x84l\xbe\xf3\xe6\xf9\xbe\xe9\xca\x0c\xbf\xf8\x1a\x89>>V\x05>\xf7T\x9c\xbcy\xba\x86\xbe\x96\xdf:=?Q\x9b>\x99\'\x8d\xbe\x92\xc7[>*\x89\xc3\xbeS\x05\xe3\xbd\xdd\xde3\xbfl\x94\xcd\xbef\x00\xe5<!6.\xbe\xcbC!\xbe\xbc\xcc\x9a>\xc0H\xb7>g\xf4\x05>X\xfc4>\xac&\x8b>=\xd0\xe3\xbd\xbeV\xad=n\xd4\xa9>\x8d\x89\x94\xbe\xc8\xb1\x05>\xa3\xf6\xc6=\x8c\x0c\xa1>~;\xfd\xbe\xddi)?\x02\xfb\xc0=\x1a2\x8c\xbeQ\xfa\x8f>\n}\xba\xbe\x1e3\xdc=\xfdZ\xeb>\n2*=\x15}[>\xfb3\x89>\x94\x85\x81>\xfb\x96\x16\xbd\x15-\x02>\x14(\xd3>\'\xd4\x13>\xa1\x8fS>\x15U\xde>\xb7\xf6\xb0\xbe\x10X\xb4<\xc9G\xc2=\x0cP\xa3=\xac}";\x1c)\x01\xbeb\xa9r>\xf9\x92@>\xa3\xd7g>\xc8\xcd9=\xf37(=\xb1i\xe9\xbegg\xd6>\xb6l\'=!\x90\xc3=\x9b}$?\xb0\xe8$>\xf1\x9eE\xbd\xa1L\xad\xbc\xbc\te\xbc X\xca>\xaa\xe2G\xbe\xd9\xa11\xbdT\xec.=\xbeg\x96=\x9e.\x08>\xab\xdcI>i\xc5\x0f>\xa6\xe0V;bR\xb0=\xc9\xa3S>sP\x87\xbdD%\xc3<\x8d\x8c\x8f<\xb9g\r>\xad\xa2\x84\xbe\xd6\xdb\xf9>\xf5\xe8\x8c\xbd\xb0\x96\xff\xbeY!V>\xf7\xa4\x13\xbeX.\x95>\'f\xc8>L\x04R\xbe\x1f\x8d\xa9\xbb\x17\xc9\xc0\xbc)\x8d\x14\xbeu1\x8c>h\x1e\x97>\xcb\xe7Y=\x84X\x02?\xda\x91\xb7\xbd\xd1\x14!>\xc8>\xf1=\xc4\xd8\x8d\xbe\xe3G\r>J\x14\x8d\xbe\xda\x00\xf4\xbe\x10sb\xbe\xdfs6\xbd9<\xfe\xbd\xaa@\x1e\xbf\xaf.\xbc>\xd5C\xe3\xbd\x0f Y\xbd\x02\xdd\xaa=\xd7z~\xbe\xbbL\xe9\xbb\xd3H%?\xad\xc8\xe9=\xc9\xefi<wW\xbb\xbey\xc5\xe9\xbeC\xb6V=\xe0\xf42>W\xba\xc5>\xd3\xed\x80=v\xa2e\xbe\xb7`\xb2\xbdu\xb0\xa1>\xcf1\xaa\xbcY{\xb6>\xea\xd5\xf3=\xc7\xa6\xbe>\x9b3J\xbe\x96\xf4\x82>k\xad\x06>c\x86\x82>\x0ch:>\xc2\xf2\xf5>\xc57\xcf><U,>\xfau\xdd=@\xadU=&\x82\xf9='
-p687
-tp688
-bsV503959180533694464
-p689
-g2
-(g3
-(I0
-tp690
-g5
-tp691
-Rp692
-(I1
-(I200
-tp693
-g12
-I00
-S'#S\xb0>\xb1\x978\xbec\xa7\t\xbf;\xec\xe7=o\xa7\xe4>8Q\xb2\xbd\x17\x83-\xbe\xd7\xc1\xf0\xbe\xa9}@\xbe\xd5k\xb9>\xd7\xe57>\xe7.\x85=\xbf?\x8d>e\x80J>W\xc5\x86\xbe}\xfd\x06?\xd9o1\xbe\xff\x8e\x0f\xbe\xab\xafb\xbeM\x8dE<K7\xb5\xbeC\\\x15\xbe\xac\x8b\xc9=\xc1\x1c\xea\xbe|iF\xbe\xdcG\x83\xbd$\xa5\xae>\xa3\xc5\xed\xbe|\x89\xed\xbec\xb9\x97>\xddf\x80\xbe\xdb\xae\xb6\xbex\xa8\xc2>O\x98\xf4\xbe\x15<T=e\xd7$?\xa4\x07\xa0>\x01\xc2\xd6=g\xca\xfb>1\xd8\xa1>\xd8\xe6u\xbd\xed{+\xbeX6\xfc>#\x80\xea\xbe\x7fo\x8d\xbe\x99\xd2\x05=\x85=*?\x8b\xae#>8c\xfb=\xb1\x1a\x02?\xefH\xb4=m\x11)?\xcd\xbf\x19\xbeP\x14\xe7\xbd\xf0\xcb_\xbfp\xd5\xaf>\xa3UT\xbe\x84\x7fs\xbe\xe5\xdbV\xbf%{5\xbfQ\xba\x90>\xe2\xed\x85=\x10\xbf\x05\xbdw\x7f\xf3\xbe\x08\xef\xe6\xbd@q\xfe>l\xc7\xb5\xbeG{S>2\xf8\x08\xbf\x10\x98\x81\xbe\xb7cZ\xbf\x889\xff\xbev\xd1\x88=\x08\xd6\x7f\xbe\xefQ\x9c\xbd\x90\xda\x01?T\x01\x1f?\xc3\xf3x>(\x86O>\xfa\x99\xaa>\xe4\x8a\x92\xbd\xd2z$=\xba\xce\r?\xab\x9a\x02\xbf\xe3\xb4\x91>k\xfe\xa4\xbc\xa5\xb8\xc9>\x0fh.\xbf\xe7\x99o?\xf2\x18\x8c>4\xe2R\xbe\x1c\x0e\x86>\xe1=\x95\xbe\xb1\xd5!>\xaf\xd5=?\x8c\xdb*\xbe\xf8\x9b\x99>H"\xc4>\x03\x96\xb3>\xb4t\x7f\xbc\x0b\xec+>\x0f\xac\r?\xcd\xb8\x10>\x19\xd9u>c\xeeK?\xdb\x17\xdc\xbe\x83&Y=\xbf\xef\xf0\xbd\xe7\\>>\xd8\xe1\xed\xbbc\xda\xa7\xbc\xd7\x82\x05?\xac`\xd0=O\x0c\xbb>\xb9d!=].\x89>\xc37\xf6\xbe\xa9i\x04?\x99\x08\x99=\xcc\x96+>\xc0fc?\x17T\x1f>\x1f\x16\xbe=\x1b\'\x90\xbe\x84r2\xbe5\x10\xfc>=\xf1:\xbet&\xb3\xbd\xad\xc1\xb6=\xd7\xd7p>\xf00\xa6\xbd\x9d:\xd7=\xcc\xf5w>\x91\x08\xa1:s\xecN=\xb0bB>\xc7$$\xbe\x95t\xbd=aG#>\xf2t&>\xd0\xf6Y\xbe+w9?\xf1\xfa\xa6\xbde\xa4\xd3\xbe\xa0o\xc5>8\xbc\xea\xbd_\x82\x96>PF\xf8>\xe3\xff\x96\xbe\xd7w\xc2=\xad\xc5\x0e\xbeX\xeb\xb5\xbe{\x91\xb9>7\xfd\xd1>\xc1\xa0\xc5\xbc+\x97\x00?%X\xc4\xbd\xbd\x1b\x80>\x83J\x04>ol\xde\xbe}=\x92>KD\xa3\xbes\xa1!\xbf\x88\xaci\xbe\xb5\x11\x1e\xbe\xe7\xec\xc5\xbd\xc5E#\xbf\x1a\xc3\x16?\xa0\xdb\xaa\xbeX?;\xbe\xc4\x16\x1f\xbd%"\xba\xbe\xe5\xec\xbf=O\rH?\xabT\x1d>\xab\xd8G\xbdg\x83\x0b\xbf5\xbc\xb3\xbe[t|<\xfd\xf0\x84>3\xd9\x0f?m"1>\xa9\xf7H\xbe`\xf4j=\x13_\x10?\xe1jW\xbc%W\xa0>K\xef\xd0=\xb0P\xee>(\x8b\xde\xbeC\xb4\x96>\xad\xb0\xe3=\x8c\xf1!>C\x9c\xa8>n*\x14?\xcb \x0e?\xc9}\xb7>\xf1Cy>\xbd\xe33>Q[N>'
-p694
-tp695
-bsV503969179025039360
-p696
-g2
-(g3
-(I0
-tp697
-g5
-tp698
-Rp699
-(I1
-(I200
-tp700
-g12
-I00
-S'\xbc%\xc1>\x15\xd4\x85=\x04\xf5\xb4\xbe\x84\xd3+\xbdW\xfc&>\n/\x98\xbco\xa0\xd3\xbc\xaaJJ\xbe\x1b\xa5\xa8<E77>\xbf\x88X\xbd\x82v%\xbd\xa6\x8c\xd6=\xf9B0\xbd\x83\xbd\x89\xbc\x9en\x92>\x90\x02\x1f\xbd>\xce\x95\xbd\x0b\xff-\xbe\xa2\xda.\xbd\x8f?)\xbe\x94\xc4\xc2<d\xd1:>\xa4\x17\xb6\xbc\xba\xb0\x0b=\x8d\x8f\xe0\xbd\x83*\x0b>Z\xb4\x9f\xbd\xd4#S\xbe\xa9>\x92\xbd[\x02\xf1;\x9c\x894\xbb b\xfe;\xbf\xe9\x98\xbe\x0f\tK=FS\x1e>#42>nS<>ncu>\xd9\xa0t\xbd\xff\xe7!\xbe\xc7\xd9\xf5\xbc\xdc)\x84=,\x87\x1f\xbe\xcb@\x10\xbe\xec0\x9e\xbd\xc4}\x9b>\xd8\xb0)<\xf2\x15\x96=O\xbc\xc3>ux\x1f\xba\xc7\x1f\xb5>\xa8\x14@\xbeO\x98\xad=\x12\xf7\x91\xbe;~\x01>!\x88\xd1=1\x12N\xbd\xf1\xe7\xb9\xbe\x8d\x01\xb3\xbe\x061>>\xe3s\x94>\xf9i\xf6=i\xc7\x08\xbe\xeb?t<\xbc\xad\xa1=N\xb2,\xbe~\x9b\x99>\xb4\xe2\xaf\xbb\x8bn\x11\xbe\xb0c\xb8\xbe/\xb0\x93\xbe\xdch\x16\xbe\xe9)l\xbd\x97\xa3\xfb\xbd\xff8\xe2<H\'S=L\xe6\xc1=\xb6\xfd8>l}\x18>Cz\x84\xbc\x94\xe3\xee<\x19[x>\\+@\xbee3\xa2=\xd9\xdf\xb4=\xd6\x83J>\xbc\xf6[\xbe\x9e\x99\xc1>\xf3\xb5\x93\xbde;u\xbe\xe9\xf4\n>\x00\xb7i\xbe\xdca\xaf\xbd\x10$]>\x1e\xd8n=\xac\xb1T>\xa4\xfb:>\xc7\xe2\xb1=\xc6r\x10\xbe$tK\xbc8\xf6\'>\xdb\xc1\x0e>\x02\x1e&>\xfd\x04\x90>\x8b\x83+\xbe\xc46\x89<\xe0\x9dx>\x12pG<Qv,\xbb;\xe4\x91\xbe\xf2\xf0\xfb<\xb2\x93O>\xf3\xab\xc5={h\xff<\xed\x05C\xbd\x1c\xc7\x8c\xbeC\xb5/>\xd5\xe1\x9c\xbb> \xbc<\xf1\xfb\xba>\xfd\xba\x14>#&F\xbdj\x8f\xb0=\x02\x08\xc7<\xd6\xf5`>\x906\xf2\xbd\xa7\xfa{=\xc6\x90\xa4<)F\x7f=[\xf1\xc3=\xfa\x11\xc6=l\x8c\x1c=U\xeb4=\xa5z\xb6;.\x1a\xae=\x17=@\xbc<\x04\xd7<\xf7A>\xbe\x1c\xac\x85\xbc\xb4\x97H\xbev\x999>\xe2\xc8\xd6=,i\xa2\xbe\tM\x88>\x1a\xf0a<\x16\x8a\xca=\x82\x8f\xc2>LM\xc5\xbduK\x12\xbd\x8biT;\x8c\x19\xa7\xbd\xd9%K>\xe7R\xfd=\xe8\xc4\x9a;\xdf-\x9a>9\x0e\x14\xbef\x91#=\xe2a\xa6=\xb6)\x81\xbexg\xb5\xbd\xfd\xa44\xbe\xf5G\xb2\xbe\x1c.*\xbe\x85\xef\xa7=`\'S\xbd\x95\x9f\xb4\xbe\x15\xb0p>\xa3\xbc\xba=\xbf2T\xbd\xe5P*=l\xe5+\xbe\xd3S$\xbe\xea%\xba>_\x8fK=\x9b\xc0\xb6=b\x03[\xbe"o\xd7\xbe\xf1\x81\xd1=\xce<\x12>\x1c\xbee>d\xc5\x9c\xbc@IM\xbeG\xc3\xd5\xbd\xc7\xbd\x86>\xe8\xb1\x0e\xbbE\x12d>\x1c\xf1\xa6=\xec\xb2L>\x00U\x03\xbd\xd8\xe0->)_`<\x17\x98\x10>\xf8\xcd\xa4=\xe4y\xcf>\x05\xb1y>g%L\xbdBl\xa3\xbc\x95\xaak=\xbc8\xe3<'
-p701
-tp702
-bsV504180022350204928
-p703
-g2
-(g3
-(I0
-tp704
-g5
-tp705
-Rp706
-(I1
-(I200
-tp707
-g12
-I00
-S'\x03\x11=?\x81 \xf6=xy\x18\xbf,d\xd8\xbd\x11r\x99>m\x8e\xb1\xbdd9n\xbcY\x99\xce\xbe\x97?\x02=7\xb4\x92>\xf6-\xbd\xbd\xaf\x7f\xae\xbdjO\x06>\xc3\x9au\xbd\xb1\x8c\x84<H5$?\xbc\xf5\xcf\xbd1I\xf0\xbddC\xb5\xbe\x10\xa7-\xbe\'Jx\xbe\x14\x8e\x18=\x07\xe3\xb9>\xc0\x8bP=4\xe1\xcb=\xb7\x19>\xbe\xa0^p>\x86\xaeQ\xbeg)\xab\xbe\x9daw\xbe/@\x9a\xbdi\x10\xca\xbco\xf2&\xbd\x9b\x9b\x13\xbf\x8181>\xd5\xf7\x86>@\xa3\xd8>\xbf\xef\xa6>Z!\xb1>\x8a\xf1\xfb\xbdC}\x99\xbe\x80\xcaE\xbe{\xcd\x9c\xbc\xb39W\xbe\x00a\xa2\xbe\xb6\xaf\x06\xbe\xcdb\xdf>\'\x9e\x08<`\xbf\t>l\xe05?\xe3\xf5H\xbd/\xfd\x15?\xc6\x1e\xad\xbe\xc6c=>\xb1\xea\xdd\xbe\xa81\x0b>\r\xefX>\x8a\x14\xb9\xbd\x89\xa9\x1a\xbf\x9341\xbf\x08Y\x94>\xe4\x0e2?\xc6\xad\xa7>\xbf\nY\xbe\xe4\x1aN=\xf0\xd7\xcf=\xef\xcd\x89\xbe\x13\x9d ?\xad}B>Gq\xcc\xbe9Z\x1a\xbfv\x8e\x00\xbfV\xc9\xd6\xbe\xeb\xf7-\xbeP*2\xbe\xb7\xc7H<lg\xd6<\xeb\xd7\x08>\\\xed\xae>#\xce\xbd>\xb1h\xeb<\xf6XU=_\x87\xc5>/\xa2\x9e\xbe\xe6\xdc\t>\xe1\x9d\xd3=\x19"\xbe>\x0e\xe9\xa3\xbe\xc7q@?\xfc\xc4[\xbeP\xd6\xfa\xbe\x1dHf>l\x8b\xc0\xbe\xe3\xbf\x7f\xbeT\x16\xdd>\xcd\xd0\xf2=\xc6\x85\x02?\x19\xea\x9b>B-\x06>\xa4\x9e\x92\xbe\xe1\x97\xd9\xbd\xb5\x8b\x90>4\xd5k>\xbc\xc3\xa9>\x97\xbe\x17?,\xf3\x8e\xbew\xb2D=|\x93\x04?fm\xf3<[\xa27;\xff\xe5\x14\xbf\xac)\x06;\xd9\xac\xb0>72\xd4=\xe9\x8c\xeb<c\x0c"\xbc\xd4\x94\x07\xbf\x90\xe3K>\x83\x0c\xac<\xefH\x02\xbdd\x08\'?G9\xb0>\xe1<2\xbc\x97\x0f1>\xa7^\xb9=O\x81\xd6>\x9d\xebf\xbeaei>#\x8f\x88=L\x051>\xba\x18\x05>\xb4$A>\xcd\x91\xff=\x83\x13O<4\x93i<\x15\xc3\x19>\x83NP;\x8c\xf1\xc9=\xcc\xfc\xf1\xbe\xa0\xb5\xf4\xbd\t<\xbe\xbet\x14\xb7>\x7fa\x92>o\xe2\x0f\xbf\xf2X\x17?\xca\x0c\xab=\xa6\x06\xd7=*\x0bZ?\xb5A\x03\xbe\xf7\xca\x15=\x00:\x0b=\x9a\x86\xed\xbd\xb1\x9a\x92>\x06\xbc\xc6=l\xbbW=\x80\xcd\xf8>5b\xae\xbe\x10F\xde=ys\'>A\x13\xe9\xbeI\xe0g\xbe7\x1f\x89\xbe/*\x1d\xbf7\xdd\xae\xbeO0\x1b>l\x9bV<\x04$\x1d\xbf\x8f\x02\xdf>9U4>\\\xea0\xbe\xa6#\xbb=GQ\xbb\xbe\xda$\xd6\xbe\xb1\xc5\x15?j\xd1\r>\xc1T|>\xd7\x18\x95\xbe|\x9e@\xbf\xa9{\xa4>cx\x9a>3\xa4\xd3>\xc1\xd72\xbd\x9c/\xbd\xbe\xaf\xef\xba\xbd\x9b\x89\x1d?\x0b 6\xbd\xcf\xa3\xf6>\xb9e\x18>\xbf]\x8b>a\xf6y\xbdVb\x9b>8x\x95<\x1c\x92E>\xc9\xee\x07>\xd9I8?\xda\xb0\xdd>\x19d\x12\xbe\xd9\xe8\x84\xbd0G\xc9=\xd1,9\xbd'
-p708
-tp709
-bsV503960326095007745
-p710
-g2
-(g3
-(I0
-tp711
-g5
-tp712
-Rp713
-(I1
-(I200
-tp714
-g12
-I00
-S'\xa5F\x94>\x80*\x9b\xbcO\xc5\t\xbf\xb3L.>\xb5_Z>\x82D\xbd\xbd\x9b-\xcf\xbd\xcb\xe7J\xbe\xe8\xaf\xab=z\xa8\xc2=\xb0`\xa5\xbd0(\xef\xbc\x0b\xea\xa7=\xb2}T\xbc\x05\xcd\r>\x17/\xbe>\xf0\xd4D\xbdt1\x88\xbd\t\xb6Y\xbe\xea0\x86\xbd\x7f\x02\x11\xbe5\xad\x02\xbe\xcbZ[>\x9f8\x8f\xbd\xdc\xe5O<\xe5\xa9\xf8\xbd\xd6\xf1i>\xcb\xcb>\xbd\xb0\x07f\xbem\xa0\xa9\xbd\x11XU\xbe\xfb\x8b\x01\xbd*( =.X\xf5\xbe\xe8\xf9\x0f\xbaF\x89\x9c>Z\xf0\x18>^\xe9s>Y3\xb1>\x1d\xd8\xe3\xbd\xbc\xbb\xaa\xbe\xaf\x14\x83<\xd4\x07-\xbd\x9e(D\xbdQ(\xbe\xbe\xf53N\xbe\x91\xfc\xe4>\x94\xfe\xf3=H\x17V>P^\xe6>\xb5\xe0\x92=\xdb\xa8\xe2>\xff~\x01\xbe\x18\t\xaa==Q\x99\xbe\x16\x84\x82>\xb2\x1f\x9e:8\xa5i\xbe~\xa7\x9a\xbe|\x94\xf8\xbe%\xed\x07>\x98N\xa5>x\xa6b>\xb4f\x88\xbe\xa4\xa7q>\x89\x0e\xa6=1\xb7\xa9\xbe\xeb\x89q>\xfe\x83\x8a\xbcJ\xd3\x1c\xbe\xcc\xc6\x15\xbf\xe6=\x00\xbf\xde\xc3o\xbe\xfe\xd6!\xbd4=6\xbe\x8e\x85\xb3=\x16;T>\xa2\x04\xc5=4\xf7\xbf>\x04N\x8e>op\xa4\xbc\x8a\xe1R>e\xea\xb4>T\xab\x93\xbe\xe2\xdbp=\\\xb9\xc7=DT\x80>5\x10\xd3\xbe\x0c\x0b\x14?\t\x0b\x06\xbe\xa1\xa8\xd3\xbea1\x97>\x16\xa1\x9c\xbe\x05^\x92\xbdy\xa1\x81>\xc0\x99\xd8;\xe3\x97\x96>\xca\xbd\x10>\xdeIN>\x14\x8c\x00\xbeA\x89-=6\xbb\x99>\x11?3>\x1e\xbd\xca>\xec\x81\xee>u\xe9\xa0\xbeN\x06\x0f\xbd\xe9\xc5\xa0>\x08\x06\xc8=\x1e=\x12\xbd\xbd2\x94\xbe\x82\x83\xb3\xbd\xfe\xef\xb0>\xc8\x08G>T\xda\xdb=\x8bG\x1f\xbd\xec\xea\xf8\xbe\xfe\xbe">q\xdc\xef\xbdV\x01\xcc\xbd\x94>\x0e?6`\x80>qk\x93\xbd\x08\xcc\x19\xbc\xf8E\xfb:\x1e4\x8c>\xac\xde/\xbef\x89L\xbd\x0e\xd8\xf7=D*g>\x8fDF>^\x8d\x88>\xe9\x9a\xd8=X\xd5\xce=mC\xce\xbdBj\x84>\xfa\x89\xad;\xb1\xc6i=\xdfQ\xb3\xbe\xe0Q\xcd\xbc;\xa1\xc0\xbe\xf9\xb1\xc1>\x97\xa31=\x9e\xb0\x06\xbf\x1bb\x06>$>\x15\xbe\x04\xf0\x9f=N5\x10?\x9fm9\xbe4\x00\xdf\xbc\xa1\xc7\x89=BK\xe6\xbc?\x19t>9\xceR>t@\xc2\xbcFO\x1d?\xf1\x7f\x93\xbe\xf2\xc6\x92<\xbciX>\x8ef\xa5\xbe\x939S\xbd\r\xb9\xb1\xbe\x15\xd0\x0c\xbfO\x06N\xbef\x87\x87;v\xc6\x93\xbcx\xf4\x05\xbfr\xe8\xe0>\xd5*8<\x01\x08\x89\xbd8\xe6\xd6<\xd1\xaa\x97\xbe\x1a\xae_\xbe\xb3=\xbf>6D\x16=\x1ed\x17>J\x10`\xbe\x00\xea\xf1\xbe^S\xa1>\xac\xfb+>\xcb\xa3\xdb>\x8b\xc7\r=\x12\xf8V\xbea\xb3*\xbd_\xbe\xbb>\xea"\x0b=\x14\xde\xd5>Z|\x0f>\xe9C\xa7>fg\xb5\xbd\x88\x1b\xb0>\xedu\xb1=\x90\x1b\x83>\xb9\xf4:=[\x91\n?m\x1d\x89>\xcd&\xbb=\xea?\x15=\xb4\xdb\xd3=l+p\xbe'
-p715
-tp716
-bsV503958440763744256
-p717
-g2
-(g3
-(I0
-tp718
-g5
-tp719
-Rp720
-(I1
-(I200
-tp721
-g12
-I00
-S'=V\x16?*\xe8\x8b>\xf3\xc4\x15\xbf\xfd+\x0b=\xc7a\xf6=\x84\x17f\xbcF\xa7\x02\xbe\x00\xb4\xac\xbeY\xef\x8f=\xf9Q\xab>\x01\xef7\xbe\xfbK\x8c\xbe\xff\xae\xe4\xbc\x95\xed\xc1\xbd<\xd7%>\xa1\xa4\xfb>\xfd8-\xbe\x97b\x91\xbeu\xa5\x85\xbeg\x13G\xbe\x1a\x03\xc4\xbdgr\xee\xbd\xc5>\xbd>\xe1\xa6\x84>\xfe\x14\xc2=\xc0\xcf\x87\xbd#s}>\x89dw<\xb5a\xa5\xbe\x1f6\xa0\xbe\x94\xae\x8e\xbe\xd2?\x95\xbd\x80\x91^\xbd\x8br\x15\xbf\xf3\xd4\xdb=\xa2\xe8\xe2>\x92U\xba>\xd0\xdc\x8a>\xf9\x81\xbc>\x1b\xc1\x0f\xbd\x12\x01\xb3\xbeW\xf45\xbe\xc9\xed!\xbe5\xf3j\xbc\xe7\x13\xfb\xbe2"\x1a\xbeD\x91\xee>\x92/7>m\x9f6>\xd5\x051?vE\xb6\xbd\xd5\x8b\xbf>W\xf0i\xbe\x1c\xea\x17=\xd1u\xde\xbep\xdd\x91=@O\xae=\x1dr\x03=s|\x1d\xbf\x9a\xdb#\xbfC\xb0V>u\x1bE?>#\xf9>\xf6G\x90\xbe\xcei\x97=\xc7O\xcc=\x0b\xd5\xa9\xbe\xfa\x93\x07?\xae%\xa8>\xde\xd5\xb5\xbe\x9eU!\xbfs:-\xbf\xda\xcd\x08\xbf\xf6}$\xbef_`\xbe\x86e\x05\xbd\x04\xa7\n\xbdz\xda\x12>\x94}\x03?U\t\x8f>\xca}\xd1=\x84\x01\xef=\xba\xc1\x0b?\xd1\xa4\xcd\xbe\xf4m(>\xbd\x04\xa1=\x81y\x89>\xbf\xd4\xb8\xbe\xda\xee\x17?\xd4t\x82\xbe\xda\'\xd6\xbe&7\x97>{n\x94\xbeb\xfa\x82\xbe\xb7\xd8~>\x0b\xb2\x1f\xbdSL\xf8>\xf6\x8e\\>\xd5\xf1\x00>\x0c\xbei\xbe|\xa5D\xbe\xf7\r\x85>\x95\xb01>\xb4\x7f\xaf>p\x9f\x1f?\xde/\xce\xbe7Y\x8b\xbc\x1c;\x19?}\x15Z=\x99\xb4\x03\xbeY\xea*\xbf\xc9T>\xbeo\xae\x07?v&\x97>\xfcR\x8d>\xe4i\xdb\xbd<\xa5\x00\xbf\xa5\xc7\x00>)\x9c\x0b\xbe\x9a]\x0c\xbe\x9cZ\x11?\xfaV\xc9>\xc4\x82\xee\xbdDe\x99<J\x8f\xb3\xbd\x03\xd4|>\x0cj$\xbe\x16\x97A>\xec\xbd\x15>\xea0{>\x14\x80%>\xe1\x14\x8e>l\x9a\x0c=\xda\xb9^=\xc9~\x8e\xbe\xd3\xdf*=\x91\xd3m\xbdE\xf6\xb4<"\xd5+\xbfVb\xbb\xbd\xd0h\xbd\xbet\xa4\x8e>\x87\xee\x9e>\xe9\xeb\x0c\xbf\x9a\xd5\xfb>\xce\xf4#>KF\xbe<i]r?\x87\xc9\x92\xbd-\x94\xb9\xbcbg\xcd=\xb3\x19\xe1\xbd}\x11\xb9>W\x14r>\xffK\x01\xbe\xf5\x99\r?\xbb\xf3\xbe\xbe\x81\xf2\xac<\xf0yV>\xf6\xd8\xf2\xbe|r\xc0\xbe\x8eF\xdc\xbe\xeen,\xbf\xf1\xfd\xbf\xbe/\r\xaf=$qb=\x9cv\x16\xbf\xf9\xb2\xe3>\xcd\x18\x83>\x03\x10\x88\xbd\x16\x00d\xbd\xdf=\xdd\xbe\x12W\xfa\xbe\x1bN\xd6>\xa7\x1f`=6\xa1\xb8>\xff\xf7\x9b\xbe\xe2\xb9=\xbf\xe3z\xa0>\x16\x0eO>\x8c\xce\xcd><\xc44\xbdM\xf4\xb1\xbeY(\x8a\xbe\xcd6\x14?\xd53<<\xe96\xaa>\xfb7\t>TE\xc1>\x9d\x80\xca\xbd\x1c\xaa\x95>Z\xbb\r<\x84\xdb\x9b>\xc5\x00_>\xa7\x945?\x9a^\x03?\n\x93!\xbe\xcf\xfb@=\x05\xa2Q>\xab\xa4\x83\xbe'
-p722
-tp723
-bsV503977056028594176
-p724
-g2
-(g3
-(I0
-tp725
-g5
-tp726
-Rp727
-(I1
-(I200
-tp728
-g12
-I00
-S'\x8e@\x16?$Cc>\xae\xd9\x12\xbf\x8f\xf4)<\xb1\xf2\x0b>*\x80+\xbdv+\xbe\xbdT\xc8\x92\xbe1\x94?=\xd7P\xc4>\xf1x\xb1\xbd\xde\xa6\x10\xbe\xf7\x1e\x90\xbc5\xd2\xc1\xbd4\xe6\x8e=4"\xd9>8\xd1\x1a\xbe\x10\xf6\x8f\xbe\xeb\x98g\xbe\xff^\xf9\xbd\x17k@\xbe,\x8d\x04<\xa2)r>y\xfd\x10>\x01\x13\x02=|\xb2\x99\xbd\xaa\x94\x90>\xb0\x16\xae\xbd\x17\xe7\xad\xbeL\xb7a\xbe\xce\xdc\xdc\xbdZ\x19\x81\xbd\x00\tq\xbaDy\xee\xbe\x82\xc2\xaf=\x00\xc4\xcc>\x9e-\xa1>\x9e\x90p>\xfe\xed\xd0>urc\xbd\x91\xb4\x9f\xbe2a\x14\xbe\x9e\x92\x1f=\xc8\x85\x10\xbe\xcb\x9d\xc1\xbeW\xb2\xbd\xbd!\xd0\xec>\xda\x0e\x0f>\xc9\x1a\t>+E!?\xe2\xe18\xbd\xabY\xde>\xaf\xe9\x87\xbe\\\xa4C<\xcfT\x06\xbf\xe5\xfc\xdf=\xa3\xf8\x92=\xf6`c\xbcg\xf46\xbf\x193\x18\xbf1\x9b\x80>\xc2\xf7(?Gj\xc2>O\x02n\xbe\xbb0\'=2\xa3\x14>\xc4,\xa7\xbeo\xef\t?\xc2x\xee=q\xd2{\xbeQq"\xbf"z\x17\xbf\xc5"\xb3\xbez~\x0c\xbe\xfb\xbc"\xbe>\x9b\xa4=\xfa\xc5\x84=\xf5|\x16>\x02\x17\xc4>P\x18\x84>\x90/e=U\x90\x1d=\xc1\xab\xee>\xf6y\xd4\xbe<\x17\x0e>\xc7\xa3\xd6<\xbe\\\xa3>\xe7x\xad\xbe\xec\x1d\n?_\x1c\xca\xbdq\x11\x94\xbe\xcc\xfc\x94>\x01\xfa\x8e\xbe\x00\t:\xbe\x0f\x11\xaa>\x0c\x05\xba\xbcp\xaa\xbb>\xaa\xeev>Z\xe30>V B\xbeg;\x9f\xbdy\xce\x97>\xf1\xd8!>J\x8fQ>q\x1d\x12?*N\xb9\xbe\x82pe\xbc?\xe4\xea>\xd5\xda\xf3<\x1e|\xd8\xbdn\xfa\x13\xbf\x1a\xdd\x86\xbd\x81\xff\xdb>\xa2\xc7\x90>\x9cw\x84>J\x90\x93\xbd\xf5g\xe8\xbe4Q=>6\xdaN\xbdB\xfe\x95\xbc\xad\xa2\x10?Q\x1c\x99>\xf1V\xf1\xbd\xe4\x8a\xfd<\x14/\xf2\xbb\\>\x99>\x17\x08\x0f\xbe6\x1e;>\x9fq\xe0=\x99 \x0e>\xe2T\t>\xf9q5>\x94a\x9f;\xb4M\x1d<j;4\xbe\x1bK\xbf\xbc//o\xbc\xb1\xef$=\\\xf1\xdb\xbel\xb76\xbdd\xaa\x8d\xbeZ\xa7\x90>\xf4\x1dl>\x00\x82\xfd\xbe\xca\xa8\xf9>\x97\x9aR>\xaf\xb4\xdd=\xc6\x8bF?T=\xdc\xbd\'Q\xd0\xbc\x85\xfbB=Z@\x11\xbe\x14\x9b\xa2>\xdb\x9fs>\xdc\xe4\xf2\xbd;\xf0\x03?\\\xa9\x8c\xbe5\xe11=\xde\xb7A>2\x10\xee\xbe\xdf\\t\xbe\xffj\xc1\xbew\x16\x11\xbf\x05u\xb5\xbe\x17zS=\xf1\x80\xa6\xbc\x81`\x06\xbfir\xd9>\xfc\x833>\xd9Ub\xbd\x0c\xc0\x11\xbd\xda=\x9a\xbeW\'\xae\xbe\xba\x96\x12?4e\xb5=RN\x9a>\xab\x86\xac\xbe\xac\xbc/\xbf"\x9eC>\x0f\xa7\x13>\x7f\x04\xa5>\x8c\xa3\x01<\xfa\xaf\xab\xbei\xa8\x81\xbe\xf5\x89\x01?\x1e5\x03\xbd\x84]R>\xb4W\xc6=~\\\xbc>a\xff\xf3\xbd\x80cL>\x19\xa5*=\x0e\x10z>\xe0\\\x8f>\x16\xaf\x1f?\x89\xad\x02?2.\xb9\xbd$\xa3g=\xfc`5>\xbf\x86\xf5\xbd'
-p729
-tp730
-bsV503976365109288961
-p731
-g2
-(g3
-(I0
-tp732
-g5
-tp733
-Rp734
-(I1
-(I200
-tp735
-g12
-I00
-S'\x8f\xc9\xff<\x89\xe8\x85:\xe8,\x02\xbd8\xec@\xba\xee\xce\xa5<\t\xd3\x12\xbb\x04\xfe[\xbb\xa9\xaf\xac\xbc\x83u\xc0\xbbyo\x9c<]I\xa1;P\xa4\xaf:c_\x82<\xa0\x16\xd8;\x04\xff;\xbck\xe2\xd6<u\xd1\n\xbc\x15\xec\xcb\xbb\x10\x060\xbcGo\x04\xbb\x11\xf8\x8d\xbc\x9cC\x19;lxP<\xad\x9du\xbc@$\xc389j\x08\xbc}yx<\xea\xa9\x98\xbc\xe5\x94\x9e\xbc@\xdc\xc0;\xc5\x87\n\xbbd\xf0F\xbc 1c<\x0fh\xc7\xbcm\xc1u;\xffW\xa7<m\x8a`<\x93g+<\xd0\xf0\xc3<\x9d\xb0S;Qo\xcd\xbb\xbfO\x8b\xbb\x900\xab<\xdfj\xcd\xbc\xd4\x19\x1e\xbc!\xfap\xbb\xedT\xfd<\x10\xffZ:GH\xb4;\xc7\xb5\x13=%\x88W;\x9f\xf2\x12=\x0b\'a\xbc`\xb9v;\xb1\xbb\x14\xbd3\x9eo<\x8b~N9\xb4\xaf\x12\xbc\xd5T2\xbd\xcc\x14\x15\xbdh;\x9f<eHS<K\xd50;<D\x9b\xbcY\x81\x88\xbb\xd3R^<[\xe6\x9d\xbc\xa2\xa4\x98<\x17\xba\x8f\xbc\x91\xb60\xbc=$-\xbd\x00W\xc7\xbc\xc7\xd2\xc6:\x10>.\xbc\xd5\xb7 \xbc-t\x87<M\xfcy<\xfa\x93\x05<\xd9\x96J<l\xc1Z<\xbb\x7f\xd5\xbb\x8c\x87\x1d\xbbOq\xe2<\x9c\x00\xad\xbc\xf4\xefV<}\xf5\xf1;q\xc6\xc9<Ts\xd8\xbc\xe0d\'=\xe8e2;\x8f\x83e\xbc#\x90Q<\xd5\xe8\xcc\xbc\xd0\x19\x92;\xd8=\xee<k \xcb;\xe1\x022<C\xaa\xab<\xcb\x83\x11<\xe5\xa2\x1d\xbc\xe9\xcc\x00<\xb9G\xd4<$GD<\xfc\x111<\xf0?\x12=pjp\xbc\x99\x85a;8$.<\x91\x13f;\xddh\xdb:\xe4\x8fU\xbc\x93\x01\x9b<\xfe\xcc\x9a<\xcdRS< \xd7`:\x7f\xdc\xcc\xba\xe4,\xc1\xbcx\xbb\xd5<\xe0\x93~;\xe9\xfe\x18<\x92Z*=H\x15\xf5;\x98\x03[\xbb\x8dT\xd6\xb9NP)\xbbk\xac\xae<\x95P\x1e\xbc\xdbp\xb4:$o\xc2;\x13\x0c\xd8;h\xfb\x9a;\xa4W\xc8;\xe7\xe0\xbb;/\xe7\x919 \xda\xd0;GT\xab;T\xc3p\xbb\x9bv\xad\xba;\xf2i9\xd8\xf2\xad;\x9bn\\\xbc\xd7\x83\xb1<\x1c+l;uB\xd0\xbc\xe0l\xcc<\x15\xf3-9u\x8ai<\xbd\xa8\xc2<\x85\x87P\xbcC\x93\xb3\xba9\xce\x01\xbb0ZM\xbc0o\xbc<qe\x88<\xfbg\x9e9\xfb\xcf\xdf<\xc8^\xd9\xbbSG\x19<A)\x03<\xe4\xde\xbc\xbc\xa9p\xb2;\nW\x99\xbc\r*\xe6\xbcU=Y\xbcl\x92F;\x81\xf3\xf7\xbb\xdc\xe5\x00\xbdd\xa4\xcd<\xf9\nq\xba\xf3\x16\xfd\xbb`\xe4\xb7:H\xfa>\xbc\xe3\x0f\x07\xbb\x1b\xbc"=-\xaf\xad;\x9b\xea\xbc:\x80>\xe3\xbc\x14\xf0\x01\xbd\xeb\xf6X;\x1d\xc65<U\xec\xbe<\x8dt$\xbaSc\x82\xbc\xedc\xb1\xbb\xe1>\xb0<$\x99\x07\xbb@NT<H\'y;\xdd\x1d\xa4<%\xacm\xbcz\xe1\x8f<@\xdcl;\xb0\xf8g<L\x89d<XG\x17=h\xb1\xce<yw\xca;\xfdE\xad;\xbd\x80\xad;}G\x83<'
-p736
-tp737
-bsV503967750206029824
-p738
-g2
-(g3
-(I0
-tp739
-g5
-tp740
-Rp741
-(I1
-(I200
-tp742
-g12
-I00
-S'\ts\x88>P\xc38\xbc^\x97\xb1\xbe\x19h:=5=e>\x8a\xfeZ\xbd\x91\xa4\x82\xbd\xc1\xcfm\xbe[\xb2u\xbdV\xea2>rm~=\xf1\x8e\x04=:O\x0c>\tw\xae=#\x05\xcc\xbd\xe9\xcb\x8e>\xe6\xcb\x92\xbdI=i\xbdcQ\x02\xbe\xf2]e:\xb5\x0e>\xbe0\xf9\x1f\xbd\xd1I\xea=\xc5\x07[\xbe\x8bS:\xbd\xcf\xf1`\xbd\xb9\xab,>IqM\xbe\xf3\xb4]\xbe\xf9v\x00>\xa5\x013\xbd[\x11\x1a\xbe\xc2\xb1\x17>k/~\xbe\x1a\xde\x07=\'\xff\x92>K2\x0e>8\xdd\xf2=\x13\x95\x92>\xbay\xaa=\x11\x84\x88\xbdz\x85d\xbd9ti>\xf0V{\xbe\xcaP\r\xbeI9\xc0\xbcE\xd8\xb6>\xef?D=S\xbb~=\xfaz\xab>\xc7\x80*=^\xf9\xb9>\x05\xa2\xea\xbd\xdbRi\xbaV\xf5\xd7\xbe\xcb56>\x99\xb8#\xbd\x19\xbf\xdd\xbd\xf64\xdc\xbe6\xcc\xbd\xbe\xad\xfc8>\x91k\xd0=\x0e)\x0f;\x8e\x9ag\xbeP\xd7\xe8\xbc\x8e4;>\xa0jS\xbe\x07p(>qY_\xbe\xe8\x12\xd4\xbd\xc3\r\xf7\xbej\xf7\x8d\xbe\x92a\xd6\xba:\xfc\xdb\xbdc\xf5\xab\xbd\t\x99V>\xc7Fh>\xeef\xe0=\xbe3\x01>\xafD#>"SM\xbd\nn\xeb;\x90u\x8a>Vat\xbe\x0e\xd2\x19>\xfb\x9a\x8b=\xb2D\x84>.\\\xa6\xbe\xa8\xc6\xeb>\xb5\x1c\x92=nc%\xbe+\xbf\x1f>\xebfp\xbe\xce\xc8k=\xcd\x91\xa6>\xb2r\xa7\xba\x1d9\x0f>5\xb1T>\xbf\x02\x06>B\\h\xbd!\x96\xbc=)\x9c\x90>\x02a\xb6=\xba\xe7\n>\xb1\x94\xc8>\xda\xafU\xbe\x93\x94\x90<\xfb3B=\xd9\xa2r=\x92P\x1a9\x8a>\xc4\xbd\xeb\x03`>R~+>\xb1B->\x19\xb3\xba<\xcb\xae\xf5</\x00\x88\xbeY\xb1\x85>>G.=\x1bs\xa1=gu\xf2>\xd9I\xa0=\xe9t\x96\xbc\xe0\xf9C\xbd=\x85B\xbd\xa7(e>\x85Z\xdc\xbdz,9\xbcp\xc8x=Vy\xa7=\xcb\xc59=\xa5\x96\xb2=\xad\x03\xa9=A\xc8\xd8;\x17\x08A=\x10n\xae=\x11\x1a6\xbd`\x8f2<\x9a\x87D<\x1e\xca\x99=@\x86\x13\xbe\x08\x83\x9f>\xa9\x10+\xbc_\xd5\x8c\xbe\x93\x91W>E\x13|\xbd\xe9\x07\x18>f\xce\x82>\x08 \x13\xbe7\x02};\xb7U\xa38\xb5\x1f\x0c\xbe\xee\x92Z>.\x00P>\x06\xa4\xd0:J\xf8\x99>\x98\xc4\x87\xbd.\xe5\xd7=\xd8h\x96=F\nf\xbe\xfe\xf3\xb9=\xe3\xd8Z\xbe\xb3\x96\xa2\xbe\xbbH\xf6\xbd\x0e\xd4\xd2\xbc\x1al\x89\xbd2x\xaf\xbec\xb5\x92>N\x10\x8f\xbd&\x11\xab\xbdT\xde\x03<@\x9b*\xbe\xe1\xfc\x83\xbc\x17\x7f\xd6>6\x9ef=zi:</R\x91\xbe\x08P\x91\xbe\'t\x01=\xb6\x19\x06>!I\x86>R\xfd\t=\x06\xba\x0c\xbe\xd3I\x04\xbd\x19\x10{>%\xc9\x0b9\x97\xb64>\xce\xb5H={\xcd\x80>=\xcaG\xbe"]A>\xcb\xedk=\x1f\xa6\x0f>W\xe7->[\xa5\xb8>\xb7"\x93>\xde;\xd8=~\xc2\xcb=\xfa\xfbn=@\x02\x0b>'
-p743
-tp744
-bsV503964197286592512
-p745
-g2
-(g3
-(I0
-tp746
-g5
-tp747
-Rp748
-(I1
-(I200
-tp749
-g12
-I00
-S'\xc1\xc6N?\x07i\xc7>>\xdaD\xbf\x9e{\\\xbcY\xbf\x12>O\xd9\x8e=\xb6\xd9\xd8\xbdNf\xda\xbe\xc0\xb8n=\x04\x9b\x0e?\x91\xa7\x9b\xbe\xf7\xb1\xc7\xbe\xc1\xfa\x90\xbc\x80\xceb\xbe\x9f\x85t>\x8d\x82*?Np|\xbe\xd5x\xee\xbe\xf8i\xd5\xbe\x84\x10\xa2\xbe\x81\xf0.\xbeV\xbcO\xbd\xba\xf7\xe4>\x04\xcd\xf4>Y\xfcy>\xb2;2\xbe\n\x11\xb4>\xd6l\x03>\xfd\xa4\xef\xbeC\xea\x1c\xbf\xf6\x90\xc2\xbe\xb5\x8e\xa4=\xfco\x0f\xbe\x88\x03e\xbf\xd7\xba\x1e>\xc4>\xe8>f\xae\x06?\x87\xe2\xdb>TL\xf1>\x95as\xbe&m\x10\xbf\r\xc8P\xbe\xa7\xaf\x02\xbe\xec)\xd2\xbb\xf8\xa6\x1c\xbfm\x08W\xbe\x8d\xd9\x0b?r\xfe\x88>\x8c\xa7\x90>~m~?\xa4\xe5\xce\xbd\x80@\x1e?\x84\xba\xb9\xbe\xc4A0>\xf4\x0f+\xbf\x03\xca7=\xcc}\x03>\x04g\xe7\xbc\x9f\xeb_\xbf\xd7}[\xbf\xe3\xfe\x9b>\xb1\x1c\x91?\xb8(D?\xc3\xe3\xae\xbe\x9fI?>+R\x7f<cG\xf7\xbe\x00\xf3]?\xf1\xd0\x19?\x06D\x02\xbf\xab\x9e:\xbfM<c\xbf\r;+\xbfLq\x06\xbem\x8a~\xbe\xcf^\xd0\xbd\x80J\xbe\xbcG\x10\x12>x83?\xe0s\xcf>\xff]\x1d>\x9d\xd6\x0e>3~<?\xe7\x1d\x08\xbf\x13@\xe0=f\x87\xcf<\xf4k\xbc>\xadF\xe2\xbe\x14\xd7@?\t\x90\xd2\xbed\x92\x14\xbf\xd9L\x9d>\x07\xb5\x94\xbeb\xec\x04\xbf]!\xaa>M\xed\xcf\xbcW\xcc\x1a?\x8b\x13\x9d>^km>/\x87\xc0\xbe<\x9f<\xbe&\xac\x8b>\x14\xd8\x80>\x9d\xbc\xf1>U9N?\xe3\xe1\x04\xbfM`D\xbd\x08\xb8U?\xbd%\xd7<\xd7g\xec\xbdQ\x84\x81\xbfQ\x9d\x8b\xbe}\xa55?=\n\xad>\x01n\x8c>\xad\xc9\x13\xbe~%7\xbf\x88\xa65>\x02(*\xbe\xfa\x85D\xbe\x08\xd1K?v\x19\xe3>\xa4>\xdf\xbd\xbdE\x96=\xfcZ_;\xb7\x15\xba>\x86Rc\xbe\xf7d\x97>"\xc2`>\xbdJ\xa2>\xddS[>\xec\xf8z>\xadd\x14=>\xb4\xf2=\x93\xb6\x9f\xbeCI\x86=\xa0f\xb6\xbc\xb71\x03>\x8c\xcc\\\xbf\xd7j[\xbe\xcfv\xf4\xbe\xf3\t\xdc>\\)\xfb>A\xc8=\xbf7\x07??7h\xbe>4\xfc\xd8<B?\xac?*\x91\xaa\xbd\xb2rf;f\xb2\xd4=Z_R\xbe\xf9[\xe0>\xa4\xe5\x8d>\\\x04-\xbeg\x9dF?r\x84\x15\xbf\x1f\xfe\xb3<\x8b\x91\xb3>\xbda@\xbf&\xb1\x00\xbf\xe8\x89\x19\xbf\x9f\xd6w\xbf\xe8\xcc\x10\xbf\xb84t>)7\xc3<\xbd|H\xbf`n\x15?\x1c\xb2\xab>\x91\xdc\xd9\xbdy\xd19\xbd-\xbb\xfd\xbe\xd9\xa0&\xbf\x01\xf7\x1a?\xe6\xee[=\x9c\xe0\xf3>RX\xc3\xbeF\\\x85\xbf\xf5\xb2\xf9>\xd3\xddW>\xa1+\xfb>\xceh\xf7\xbb\xcbM\x0c\xbfM7\xa0\xbe\x99\x8dX?\xf9\x1b@\xbd\x84\x1d\xbf>Y\xb9I>\x9f\x9f\xe5>`mV\xbd\xe4\xd4\xbe>\xe8\x0e\x8a\xbb\t\xcc\xb1>}\xe7Y>\xe7\xcfu?.D\x1e?\xbc:N\xbe\x7f\xad\xba\xbc\x06\xb3\x93>\xb3>\xc0\xbe'
-p750
-tp751
-bsV503968731429888000
-p752
-g2
-(g3
-(I0
-tp753
-g5
-tp754
-Rp755
-(I1
-(I200
-tp756
-g12
-I00
-S'<\xef\x19?\xb8+\xba=\xf5\xad\x16\xbf\x81\xdb\x9a\xbd(\x19\x8c>P$[\xbd\x7f5\x00=l\xd2{\xbe\xc8q\x9e=\x08\xceP>\xb3:\x94\xbd\xb5\x11\xe3:j\x0c+>T\xca\x92\xbdZ{-<\xd6U\xe7>\x03\x8e\x17\xbd\xbe\xf8\x97\xbd-4\x9c\xbe[\xb6\x97\xbd\xb5^w\xbe\x15\x08x=\tp\xa6>\x81\xa1";\xef\xc3\xbb=0\xb1e\xbe\xafW3>Z\xff\xc9\xbd0,m\xbe\xbb\xfa\'\xbe\x15\xd2\xc7=\x15\xd2\n=%\xc2\x00\xbd\xe2\xbc\xe5\xbeie\xff<\xdfH >uN\x80>Ky\xa9>\xca4\xa6>,o\\\xbe\x0cb\x88\xbeJ06<\xbc\x14\xa0=pVd\xbe\x1deJ\xbe\xcf\x9c!\xbe\xc0\x94\xdc>\x88v\x92\xbd\xf4"\xee=\x8b\x0b\x19?-\xbe\x8f<?1\x15?\x04O\xa0\xbe\xa7\xf5a>\xf5A\xa1\xbe=\xc6F>\xd5;K>\x83M\x18\xbe\xe1\x19\xde\xbe\x08\xfe\x02\xbf\xbf\xaa\x94>\x1b\x84\xed>\x8f\xc1\x1b>\x82\xab\'\xbe\xa2\x85\xfe=\xf6\x19\x1d=\xbf\xe8\x9d\xbe\xcc\x99\xfe>\xc7v\xe4;\xb3\x13T\xbe5\x13\x07\xbf\x8a\x12\xcc\xbe \xeaY\xbevd\x89\xbdp\x9eI\xbe3s\x90<PL(=F\xc1;=\xcbuz>=I\x87>\xc3\x94\x81\xbd\xbb\xa9B=\xf2\xda\x9e>0\xd7t\xbe\xa2\x9f}=\xf5\x8a<>~B\xb4>\x95A\xab\xbe:\xb8\x15?\xe8\x840\xbe"c\xe1\xbe\xa8HK>_\xca\xc8\xbe(\x99\r\xbe\xb9\xdf\x9c>\xc2\xc1B>\xdd"\x96>wa\x86>\x08f\x04>\xf0q\x81\xbe\xf8o(\xbc\xab\x8c_>\xbf|`>\xa0\xbe\x8b>\x9f\xad\xb1>\xf3rY\xbeY}K=\xab\x04\xdc>\xa4\xec\xf1\xbc\xc8\xa4B=\xfc\xf3\xea\xbe\xe8s\xca:o\xc9\xb0>HR\x16=\xe7\xc9D\xbc\x9c\xfa\x01\xbeH\xdc\xeb\xbe\xc2&Y>\xd9\x0b)\xbcc~S\xbb\x1f\n\x16?\xd7\xee1>rZ\xab\xbdy\xe9e>\x9a\t\x0e>\xd4\xca\xb7>`\xfe-\xbe\xcf*\xd8=\x1dS\x0f=\x1a\xe8\xf9<\xad\xe7|>)#\x1c>v\xcb\x1a=7\x92Q=\xec\xa9\x90=E\x08F>".\x89=\xeb\x12\xae=h\xde\x9a\xbe\'\xf4\xac\xbc\xff\x80\x9f\xbe\x18\r\x7f>\x0f\xeb\x10>fm\x05\xbfW\x06\xc1>t\x0bR;\xdc\xd3\xf2=\x81\x7f\x0f?\xe7\x86\xf4\xbd<\x97\x1d\xbdh\x14\x87=h\x0f$\xbd\xa0vy>\xa5\x02\xb3=\x89\xdfu=7X\xf1>ej\x82\xbeXW6<BY\x1d>^\xd9\xbf\xbe\'1\xeb\xbd\x0fr\\\xbe\x1c\xd1\xe6\xbe\xdd\xf4\x8f\xbe\r-<>\xe0D\xb2\xbd\xe0]\x06\xbf\xc2\x18\xb3>K\xe1\x05>>V\xda\xbdk\xb9\xf9=\x8c\xb69\xbe\x0b\x08\x87\xbem\x88\x11?M\x06i=\x13\xef\r>\xea\x89z\xbe\n^*\xbfJ,l>H+Z>\xe3d\xc3>.\xe6\x8e\xbdp\x84\x91\xbe:#\xe7\xbd\xb7\x12\xb0>x\x8b\x9b\xbc\xe2\xa2\xce>\x03D\xd0=>kr>\x11l\x10=\xe7\xdb\x81>k\xf2\x0c=!\x13v>\xff/U=\xce\x9f\x1d? P\xa9>%\x00\x0f\xbeX(\xb8\xbdD\xc1\x88<\x01"\x07='
-p757
-tp758
-bsV503966096899457024
-p759
-g2
-(g3
-(I0
-tp760
-g5
-tp761
-Rp762
-(I1
-(I200
-tp763
-g12
-I00
-S'/\x9e\x14?\xa7\xc2F>\xaf\xbf\xde\xbe\x1f\x85\r\xbe \xac%>&\x14\xaa<\x85\xa0\xf9\xbc\xcb:\x93\xbe\xbc\xaa\xcb<tC\xc3>\xc7\xf7\x0b\xbe1\xb8\'\xbe\xf0Ga=\xe7\x96\x13\xber3\x8c\xbdf\x9e\xa0>,.\xab\xbd\xb7q$\xbe \xfdn\xbe\x16\x86\xd8\xbd\x9e b\xbe\x96v\x91=\xd4\xe1X>\x07\xe8\xc3=O\x94\xa4=s\xd3\xfe\xbd\xca\x96p>A\x99>\xbd\xa7"\xb5\xbe\xc8\x9e[\xbe\x1c\x11\xbf<\xac\xfcj<\x97\xd5[\xbdi\x9d\xcf\xbe] \x96=\xb3\xf8\x81>\xea6\x8a>\xb0\x14_>\x80\xf3\xb0>X\xe8Z\xbd\xcb\xeaq\xbe\xb5\xa7]\xbd:\x02\x0b>\x08\x1eC\xbeZ2G\xbep\xcd\xb6\xbd\x0eV\xc6>GvH=\xbd\xe8\xa9=xr\x1c?z\xe33\xbd\x00\xdf\xd7>*a\xa4\xbeG\x1f\x91=U\xfa\xdd\xbe\nC\xd9=\xf0\x81K>\x91\xd5)=\xfdq\x1b\xbfn\xa8\xfa\xbe\x17_\xa3>7H\n?\xaa\xd0\x84>-\x986\xbe[\xed\n\xbd\x94\xa7\xac=&\xb2g\xbe\x01\x0b\xfd>\xa2\x13\x84=\xdd\xf1[\xbe\xd1L\xea\xbe\xf6\xa8\xd6\xbe\x11B=\xbe\xb0\xaf\xf1\xbd\xa0\x04I\xbe{QJ\xbd\xc0\x92\x8d\xbb\x15\x16\x0e>4\x06\x82>\x02\xe6\x1a>Hb\x19<\x13Br\xbc\xe2\x9d\xd6>\x99\xcc\x80\xbe\xde\xd2\xe5=\x92\xd3\x90=s\xf2E>\xd1\xbb\x80\xbe\x98\x02\xdb>9\xc8\xc1\xbd\xb0i\x8b\xbe\'Q/>!7\x8b\xbe64+\xbe\xa8\xdf\x84>\xab\xddX=\xf2D\x8a>C\xae\x80>\x9a\xdc\xc3=\xb6\\4\xbe+l\xae\xbd\x92\n5>\xbd\xd4$>9\x84\x17>\xe4\x1f\x96>D&\x96\xbe\x8fA\x08=@\xac\xd6>\xda\x92\xe7;\xb2\xcbw\xbc\xbdU\x06\xbf\xa2\xa5>\xbdH\x17\xa1> {%>\x14\xce\x10>\xc6D\x99\xbdJ\xb3\xc0\xbe\x94\xe3l>S\xc1*<\xe9j\xeb<\xb9\xc0\xdb>UfF>lB\xe6\xbd\x8d\xeb\x0f>\xdd"e\xbcTZ\x8f>\x8d\xce!\xbe\xed\xff\xdf=\x11\xd6v=L\xd2\xef<\x9a\xc1\xef=\xd37\xc8=`\xec\xc1<\xf6v!=\x92KW\xbd\xfd\x8d\x80\xbc\r\xb9$\xbd\xe8\xd9\xdf;\xfa\xe8\x9d\xbenG`;\x92sn\xbe-\x9f\x07>x\xc7E>\xda;\xe5\xbe+\x8a\xeb>\xeb\x8c4>\xa8\xba0>V\x88\x1a?^\xdf\xc8\xbd\xb7\x14\xb0\xbd{\xc2\x13\xbd\x17\xc0\x16\xbe~T\x9d>\x94_A>B\xc7\x82\xbd\xb7\x98\xbf>3\x08H\xbe\x8f\xc8O=8\xbf\x8b=\xd0\r\xb4\xbe`\xdd\x81\xbe\x84D\x89\xbe\xfa\xdf\xed\xbe\xbd\x8d\x9b\xbeB{\x1e>\xf6\xa2\x83\xbd|\x92\xfd\xbe\xd5\xb5\x8d>x*Z>TNr\xbc\xa8\xd6r=*}I\xbe\x90\xd4\x82\xbeI\x86\x01?\x90#\xa2=\xf9\xbaS>\xa7\xaf\xa1\xbe\x90\xe5#\xbf\xb4\x88J=AX\x15>\xa0\xbec>\n\xa9Z\xbcCt\xb3\xbe?\xa6\x97\xbeV\xb0\xbf>b8#\xbd\x9a\x08Q>l\x8e\xc1=X\x04\x8c>\xa4\xc8:\xbc\xe9[<>qY\xa9\xbc,gh>\xb6f\xee=\x9b\'\x0f?\x00\x11\xc6>\xe1\xb6\x03\xbe\x83 \x10\xbd\no\x0c>\x81\xc5\x84='
-p764
-tp765
-bsV504233778550947840
-p766
-g2
-(g3
-(I0
-tp767
-g5
-tp768
-Rp769
-(I1
-(I200
-tp770
-g12
-I00
-S'Ru\x05?\xee(\xc8\xbd\x86\xb6?\xbf\x88\xdb\xe2;\xfb\xb6\xd2>\xa7\x91\x1a\xbe\xb5\xd9\x16>i\x82\xa0\xbe(\x06<=\xf2up=E\x90$\xbd\x92.\x00>w\xd7\xa7>\xb68\x98=\x83Ne\xbeV&\xd0>\x0e\xbf\x8c<\xb6\xdb\xc3=9\xc1\x94\xbe\x99\x8f\x84;K\xb3\x81\xbe(d\xba<\x01\x18\x8f>\x1d\x89\xbe\xbeC\x80\xc4;\x80\xce\x90\xbe\x99M\x9b>UOu\xbe\x83\n^\xbey\x8d|=\xebL\x1d=I\xe1\xf8\xbd\xd8e\xcf=\xdd\xe3\x16\xbf\x02\xe50\xbe\xc1\x99\xa9>k;\x00>zD\xc1>\xda\x9f\xda>V&\xaf\xbd\xa0\xc8\\\xbe\x87\x96\xc7=K\x15W>W\xfd\xd6\xbe\x99t\xab\xbe\xd7\xfdu\xbe\xe6\xc8\xfb>m\xef\xe9\xbd\x81\xac\xb7=C\xb6"?j\xc99>\xcb\xe2:?\x83g\xb0\xbe\x06t\x89>7\x9b\x8a\xbe\x0f,\xcf>\xc7\x1e\x0c>\xeb]\xc8\xbe\x12\xf5c\xbe\xf2\xd8+\xbf\xe1\x85\xb1>\xd6\x18\xea=\xbc\xc0\x8a\xbd5\xccg\xbe\x8dF\x81>B\x87}>w\x8d\xc3\xbe0\x925>\xf7H\x93\xbe\x85\x1fX\xbe\xe7q7\xbfY#\xae\xbe\x81u7=\xde9y\xbeg\x0f\xa2\xbe\x82\xe10>\xbe\xf5v>5Y\xcc<\xfb\x91x>\xf8@\xbc>\x9d\xd7W\xbe\xb7\x8aL>\x91\xb0\xbf>\xd8\x86\xc6\xbdbV\x88=\x9d\xfbx>H\xe9\xcc>\xff\x87\x1c\xbf\xab\x90H?\x0fT\xb3\xbdTG\x05\xbf\xb2t?>\xc5\x13\x00\xbfY\xb9\t<\xd0\xf6\xf2>\xfe\xe8\xa4>)\x0c5>\x1aT|>8o{>\xd8u\x1f\xbe\xab\xed\x8b=\x96O\xd4>!JM>\xdd \xcb>\x08\x90\xb1>\x9bu\xac\xbe\x9f3h==\x82\x87>-p\xa1=\x92\xdd*>\xeb\x98I\xbe\xae\xb0\x0e>v*\x96>w\xe3\xe3=\xf6\x98}\xbd\x07\xdd\xa4\xbd\xder\x14\xbf\xc0m\x08?7\x82R\xbd\xd7\xb35\xbd\x05S1?V\xf7\xd5=g\xa9\xb5\xbd\xfb\xe2%>\xee\x12i<\xcdp\xdb>\xb6\xf4\x84\xbe\x9b\xa9\x94\xbd\xe2V\xb0=\x1b\xec\x92=\xc3\xf9\xaa>B\xe7\x90>\xde\x83I>e?\x88=\xe2\x0c7>\xd6K\xe0>\x8aq\x0b\xbd\x16\x0e.=\r\x07\xae\xbc\x8a\xf0\x1f>\x0e-\xc7\xbe"\x97\x0c?+\xb2\xcf\xbd{\xa92\xbf9\xe9e>F\t\x99\xbe\t\x87\xa3>\xd1*\xec>F\x1d\xfd\xbdq\xee\x9c\xbc\xf2U>=;\x01t\xbd\x1e\x82\xb8>A%\x88>@*g>Q\xc1.?\x0f\xe5|\xbe\x8a\x8c)>\xf8\xe8<>U\x8b\x85\xbe\x95C\xb7=_\xa6\x9e\xbe\xf8{\x17\xbfX\xed\xb9\xbe\x08`\xeb= \xa7R\xbeq\na\xbf\xa7F\xb9>\x8f\xb9\xf3\xbc\xd5\xf2\x8a\xbc\x84\xd1\x8e>el\xa4\xbe\x83\xe4\xc0\xbdp\xd4.?\xc0\x1d\xd5=\x16\xfd\x17<\xc7h\x9d\xbeY\x11%\xbfi-e>\x92_<>iT\x0c?N`\x07\xbd\xebOk\xbe\xb2\x93\x1f\xbc\xe9(\x83>^n\xe4<\xff\x9e\x11?\x01\x037>\xab-\xae>\xcd\xe3\xa1\xbdC\xed\xdb>\x88l\x1d>\xb9\r\xd0>)9\xa7\xbcs22?\xabO\x9d>\xb2\x16Q<]\x90\xc9\xbc\xa2\xf5J\xbd0\xc5+>'
-p771
-tp772
-bsV503976352786034688
-p773
-g2
-(g3
-(I0
-tp774
-g5
-tp775
-Rp776
-(I1
-(I200
-tp777
-g12
-I00
-S'b\t#>\xfb\xafi\xbc[\xecM\xbe\xe3\xd1U\xbd\xf0o\xfb=\xd2\\G=\x9a\x1b(<8\x0b\xe7\xbd\xd3\xe8\xd3\xbc\xeeS\xc6=\xc3\xe3\x96;\xdfh\x13\xbd\x82\xf5\t>\xa3\xc5U=\xaa\xd0\r\xbe{\xbd\xff=\xdf4\x10\xbd\x1a\xd1O<\x1bn\xea\xbd\xc3k\xd6\xbc\x1c4\xab\xbd\xfe:\x8b<\x06\x87\xd0=\xf2s\x10\xbd\xab\x9a\x0c=\x8a\xcf\xb0\xbd\xfe`\xb8=\x85\xe1d\xbd\xe3\xed\xbd\xbd\x12.*\xbd\x95\xfa\xfc\xbcm\x05\x93\xbd\x85`\x97=\xfb\xa8\\\xbe\xb6Q8\xbd\xc0\x87\xeb=\x8cM\xa4=\xf5+\xd1=\xbb\x90\xb6=\xd4\x1f4==h\x1e\xbd\xed)\xbb<o{\xa2=\x1c\x9b\x19\xbe\xed\x17\x96\xbc\xd32P\xbdd\xd34>\xb2\x07Q;\x95v\xe8<\xb8\x83W>hK\xd1<\x906b>\xae!\xae\xbd\x92\x8b\x95=b\x04\x10\xbe\x9b\xcc\xb9=vF\xcc<8\x04\xcc\xbd\xb2\x85\x0f\xbe\x00-Z\xbeQ\xdd\x14>S8F=~\xcd\x07\xbd\xc2\x0b\xad\xbd\xa6\xacp;\x82\x8a\x98=v\xe69\xbeoi\x85=\x95\xa2\xda\xbd&\xfe\x9c\xbd4\xe6?\xbe\xe0\xe6\x9f\xbd\xa55\x8d=<\x9e\x9a\xbd\xb6\xb7\xea\xbd\x01c\x82<\n\x9f\x97=\xa6\xdf\xb2<\xd8\xb4f=\x82\xec\x97=\xc5\xb7\x80\xbd\x86\xc5\x1a=\x16\x01\\>\x8bvi\xbd\xfa\x03y=\r:\xa9=sM\xc5=b&f\xbe\xc2Nq>\xa0{\xa7\xbcN\x8d.\xbe+$#\xbcn\xf7\x10\xbe~\xc4\x87<\x12\xb2.>Hz\xc4=9]@=\x1e\\\xbb=\'\xd8\x81=\xba\x12^\xbd"\xcaR\xbb\xca\x00\x0c>r\xbc\x8b=%\xef\xde=\xc2\xbd\xb2=4\x0e\xcb\xbd\xa7D;=\xc8\xe3v=%\xb6K=\x86\xe7\x8c=m\xee\xa4\xbd\xed\xa2\x94=z\x8b\x91=\xbb\r\x9b;\x99\xa4\x99\xbc5\xe8\xab\xbbej\x1a\xbe\xee\xac3>s\x13v\xbcUw\xaa<r\xc2d>\x86\xd0\x08<j\xa7\x9d\xbcn\t\xdb<\xca\x86\xaf\xbd\xc0\xe0\xf7=\xdcr=\xbd^\xe5D\xbda\x05\x1e=\x12\xec\x82<\xe7\xae\x95=\xaa)\x89=\xfde\xa9<\xe1\x0eD=3<$=\x1a\x18\x0c>B\xe98\xbd\x05"R\xbc\x8f\x8c\xae;Br\xc3=\xcf\xff\xc5\xbd\xaeG\xf2=Jh)\xbd\x8a\xd90\xbe[\xfd\xec=\xc7\xbe\x08\xbdr\xeb\xbf=\x80\xd9\x1f>\xe53R\xbdl\xb3\x95\xbc\ng9\xbd/G\xc3\xbd\xde\x01=>\xa6\xee\xe7=\xfd\xd5\x02=y"=>0s\x92\xbdvrI=\x87^ =p\x1d\xc2\xbd*\xdb!<2\xcb\xa0\xbd\x00\xb4<\xbeE\xf0\x03\xbe\x05\xbf\x9d=\xde\x1b\x8c\xbdV\xcf\x80\xbe\xaaS\xe1=W&\x0e\xbd,_\x80<\x83<m=VE\x8c\xbd\xfe^\xa2<\xa3\xc7g>\xc4F\x05=f\x97\x08<Q\xd2&\xbe)(I\xbe\xfa\xd7$<&\xb1_=\x9d\xf2Q>\\\xc6\xbb;\nl\x9a\xbd-\x1f\xba\xbc3|\xd3=\xd7 %<\x1d2\xe7=z\x19p=\xe2\xb2\xf7=\x8b\xcd\xf2\xba\x15\xec\xee=v}\x90<\x12-\xc4=\x0b\xd5\xff\xba\xb2\xe0\x8f>AW\xc6=\x98\x1d\xec<\x19&\x05<\xb7!\x04=\xbb\xa0\xe7='
-p778
-tp779
-bsV504176455576997889
-p780
-g2
-(g3
-(I0
-tp781
-g5
-tp782
-Rp783
-(I1
-(I200
-tp784
-g12
-I00
-S'\xdd\xf3\x11?Ny]\xbc)\xd6\xf7\xbe\xa5FA;\x1d\xdf\x8e>/\x0f\xe4<\x17\x0e\x06\xbe\xa0\xd8w\xbe~\x97\xa6=\x90\xb4\xcf>\xe2\xb6\x97<\xd8\xaa\xba<s)\x05>\xaa8\x85\xbcb\xae\r=\xc9\xc6\xe1>vc\xdf\xbd\'?\xbb\xbd\x87>k\xbe\xcb\xba\xc0\xbd\xaf\xf9\x8b\xbe\x17\x1b\xcb<v1]>\xa7+\xdd\xbd\xc3\xbf\xc4\xbc\xf3\xc3\xf7\xbd#(e>\xc5\x8aA\xbe\x8d\xfe\xbd\xbe.K\xf1\xbcg\x97j=\xe23\x02\xbe\x18\xe3\x89=i<\xd2\xbe\'[\x02>N\xb1\xb0>\x06\xd2\xb3>>(\x1c>\x95\xf1\xeb>0\n\xc8\xbc\xc3\xf0r\xbeyX\xcf\xbd\xc5\x93z>CbU\xbe=$%\xbe\x06c\xc8\xbd\x19*(?8-\xba=\x07\xec\xe5=7\x16\x18?_\x0e\xf4<\x0bt\x1a?\x97\x8e\x9b\xbe\x9e\xb2\xc1<\xa30#\xbfCr\x90>\'\xa74=\n\x03\x9c\xbd\x19\xaa2\xbf\xc97\x00\xbf\xf5\xc3\x96>`\xb8\xe3>rn8> \xfb\x84\xbe\xf2\xbe\xde\xbcdd\x07>\xa07\xb6\xbe\xc2n\x08?[\x0b\x1d\xbe\xc21\x17\xbe\xa3\xbe\x13\xbfe\xae\xed\xbeP\xe2\xfb\xbd\xe8\xb3\xfb\xbd\xf5\xf8\x01\xbeW\xca">\xeb\xa3\x15>j\xd34>6G1>6 <>\xb9\x08g\xbc\xfeMe\xbdbY\xe4>\t\xa7\xb7\xbeu\xf6*>z\x97\xb9=\x15K\xbd>0\x8c\xac\xbe\r\xef\x1c?\xf9@\x8b=\xb5\xb7\xa5\xbeA\x9f\x86>\xad^\xb1\xbe\xa5\xb5T;\x9f8\xf0>h\xc6{\xbdf;l>\xfcz\x8a>\xae\x04I>1\xb1\x10\xbe\x96\x0e\x14=\xe1\xf9\x85>=\xd0U>\x8d\xcc:>\x0e\x9d\xfe>\x7f\x95\x96\xbe\xba\xa2w=\xc7`|>\xc6Ij\xbcj\xb7\x87\xbd\xd9\xa6\xe6\xbe\xcd\x0c\x8b=\xb7"\xb2>y\xbe8>\x10\xd2\xf5=\x93C9\xbchU\xcc\xbe\xa7\xb5Q>\x00n\xc5=\xdb\x98\xc0<6s\x1f?n\xeeh>\x0f\xf5\x98\xbdY1j=\x01\xc29=\xd5\xb6\xcb>\x08\xad&\xbe\x9b\\\xe0;\xc7\xf4*=\xb2\x99\x1a=\x00-;>\x05\xd8\x13>\x02\x01M=\xe2\x9b\x17\xbc\x17\x83\n=\xde]\xe7=\x93\xe9\xa3=\x81\xd3\n=cFp\xbe\x92"\xf49\xeeVx\xbe\xa8\xe2\x86>9\x88\xe8=\x9f\x87\xf6\xbe\xed\xa6\xa9>\xf29\x11\xbc\xb0\x9b6>\xef\\\x02?\xe5B\x8b\xbe.\x19+:[\xcc\x93\xbb\xc8\x014\xbe\x97^W>\x01\xefD>\xf7\x17\xad\xbc!\xff\xdc>*\xc5*\xbep?\xca=\xa1d\xa1=\x15-\xeb\xbe\xa5\xb9\xae\xbd\x0e@\x89\xben\x85\xfb\xbe!&\x16\xbe_\xea\xa5=\x0f\x84`\xbd\xae\xd7\xfe\xbe\x98\xa6\xf6>\xedl\xeb\xbc>\xb6-\xbe\xa6\xf9B<\xaaV\x12\xbe.\xda\xee\xbd\xc1\x939?\xdb\xe3\r>\xc3\xfa\x0e>\x91*\x98\xbe\xb8\xd6\x04\xbf\xf1\xb4\xc8=\xf5(\x83>Fl\xa2>c\xa3X=\xa3\x8d\x89\xbe\x1d\xc5Q\xbe\t\xe9\xca>\xd7\xb0}\xbd\x01\xbf\xa3>\xb1\xa0\x8f=E\xf7\x98>\xf9\x8d\xbb\xbd\xd8\xdbk>a\x97\xa1=\x82\xb6t>%?\xc8=\xaf\xf7"?F\xf1\xcb>\xbe\xb8\xbf<\xd7\x91W=!l\xe1=\x86\xea\x0f>'
-p785
-tp786
-bsV504232479109443584
-p787
-g2
-(g3
-(I0
-tp788
-g5
-tp789
-Rp790
-(I1
-(I200
-tp791
-g12
-I00
-S'Ru\x05?\xee(\xc8\xbd\x86\xb6?\xbf\x88\xdb\xe2;\xfb\xb6\xd2>\xa7\x91\x1a\xbe\xb5\xd9\x16>i\x82\xa0\xbe(\x06<=\xf2up=E\x90$\xbd\x92.\x00>w\xd7\xa7>\xb68\x98=\x83Ne\xbeV&\xd0>\x0e\xbf\x8c<\xb6\xdb\xc3=9\xc1\x94\xbe\x99\x8f\x84;K\xb3\x81\xbe(d\xba<\x01\x18\x8f>\x1d\x89\xbe\xbeC\x80\xc4;\x80\xce\x90\xbe\x99M\x9b>UOu\xbe\x83\n^\xbey\x8d|=\xebL\x1d=I\xe1\xf8\xbd\xd8e\xcf=\xdd\xe3\x16\xbf\x02\xe50\xbe\xc1\x99\xa9>k;\x00>zD\xc1>\xda\x9f\xda>V&\xaf\xbd\xa0\xc8\\\xbe\x87\x96\xc7=K\x15W>W\xfd\xd6\xbe\x99t\xab\xbe\xd7\xfdu\xbe\xe6\xc8\xfb>m\xef\xe9\xbd\x81\xac\xb7=C\xb6"?j\xc99>\xcb\xe2:?\x83g\xb0\xbe\x06t\x89>7\x9b\x8a\xbe\x0f,\xcf>\xc7\x1e\x0c>\xeb]\xc8\xbe\x12\xf5c\xbe\xf2\xd8+\xbf\xe1\x85\xb1>\xd6\x18\xea=\xbc\xc0\x8a\xbd5\xccg\xbe\x8dF\x81>B\x87}>w\x8d\xc3\xbe0\x925>\xf7H\x93\xbe\x85\x1fX\xbe\xe7q7\xbfY#\xae\xbe\x81u7=\xde9y\xbeg\x0f\xa2\xbe\x82\xe10>\xbe\xf5v>5Y\xcc<\xfb\x91x>\xf8@\xbc>\x9d\xd7W\xbe\xb7\x8aL>\x91\xb0\xbf>\xd8\x86\xc6\xbdbV\x88=\x9d\xfbx>H\xe9\xcc>\xff\x87\x1c\xbf\xab\x90H?\x0fT\xb3\xbdTG\x05\xbf\xb2t?>\xc5\x13\x00\xbfY\xb9\t<\xd0\xf6\xf2>\xfe\xe8\xa4>)\x0c5>\x1aT|>8o{>\xd8u\x1f\xbe\xab\xed\x8b=\x96O\xd4>!JM>\xdd \xcb>\x08\x90\xb1>\x9bu\xac\xbe\x9f3h==\x82\x87>-p\xa1=\x92\xdd*>\xeb\x98I\xbe\xae\xb0\x0e>v*\x96>w\xe3\xe3=\xf6\x98}\xbd\x07\xdd\xa4\xbd\xder\x14\xbf\xc0m\x08?7\x82R\xbd\xd7\xb35\xbd\x05S1?V\xf7\xd5=g\xa9\xb5\xbd\xfb\xe2%>\xee\x12i<\xcdp\xdb>\xb6\xf4\x84\xbe\x9b\xa9\x94\xbd\xe2V\xb0=\x1b\xec\x92=\xc3\xf9\xaa>B\xe7\x90>\xde\x83I>e?\x88=\xe2\x0c7>\xd6K\xe0>\x8aq\x0b\xbd\x16\x0e.=\r\x07\xae\xbc\x8a\xf0\x1f>\x0e-\xc7\xbe"\x97\x0c?+\xb2\xcf\xbd{\xa92\xbf9\xe9e>F\t\x99\xbe\t\x87\xa3>\xd1*\xec>F\x1d\xfd\xbdq\xee\x9c\xbc\xf2U>=;\x01t\xbd\x1e\x82\xb8>A%\x88>@*g>Q\xc1.?\x0f\xe5|\xbe\x8a\x8c)>\xf8\xe8<>U\x8b\x85\xbe\x95C\xb7=_\xa6\x9e\xbe\xf8{\x17\xbfX\xed\xb9\xbe\x08`\xeb= \xa7R\xbeq\na\xbf\xa7F\xb9>\x8f\xb9\xf3\xbc\xd5\xf2\x8a\xbc\x84\xd1\x8e>el\xa4\xbe\x83\xe4\xc0\xbdp\xd4.?\xc0\x1d\xd5=\x16\xfd\x17<\xc7h\x9d\xbeY\x11%\xbfi-e>\x92_<>iT\x0c?N`\x07\xbd\xebOk\xbe\xb2\x93\x1f\xbc\xe9(\x83>^n\xe4<\xff\x9e\x11?\x01\x037>\xab-\xae>\xcd\xe3\xa1\xbdC\xed\xdb>\x88l\x1d>\xb9\r\xd0>)9\xa7\xbcs22?\xabO\x9d>\xb2\x16Q<]\x90\xc9\xbc\xa2\xf5J\xbd0\xc5+>'
-p792
-tp793
-bsV503976729090609152
-p794
-g2
-(g3
-(I0
-tp795
-g5
-tp796
-Rp797
-(I1
-(I200
-tp798
-g12
-I00
-S'\x05\x93\xf4>K\x9bz=R\xdf\x05\xbf\x1b\x02\xa7\xbc\x7f\x15\x83>\x10\x1fi\xbd\x0f\xc3\xd9\xbc^\x1b\x81\xbe\xb1 E=h\xf3Y>\x90\xf0\xb5;\xd1\xc7\x84=g\xf0\x08>/\xb0\xa6;Rz\xde:\x92^\xcd>)U\x98\xbd\xe0=|\xbdf\xb2v\xbe_\x97s\xbd\x7f\x1f[\xbe\xe6\xccR\xbb\x9d\xfb\x94>\x01,e\xbd\x81\xc6\x93<;\x14\x16\xbe\xe8?8>&\xde9\xbe^\xa2M\xbe5,\xfc\xbc\x8eg\xaa=A0\xd1\xbd\t\xc8J=\xa5\xf0\xbe\xbe`\xb3?=\xbf\x16\x80>\xb9\xb0k>\xfe\x95|>\xfd\x1e\x9f>\xa2Y\x96\xbd5d:\xbeOT\x8d\xbd\xf0\x06\xf7=\x15\x1cm\xbe\x92\x971\xbeG\xd3\xbf\xbd\x0bK\xe3>\xe1d\x15\xbdo\xad\xaf=Rv\xff>\x9dOr\xbb\x89A\x01?~,o\xbeAZ\xff=\x85\x8d\xc6\xbe\x1f\x1cL>\n\x0f\xaf=Y\xa5\x10\xbeg\x0c\xf0\xbe\xa7\xd2\xf9\xbe\xa1\xff\x81>\xba\xab\xb7>\x8f\xf7\x8b=P\xefP\xbeq\xa7\xfb<p\x90\xe6=o\xba\xa6\xbe1\x80\xc8>\r \xb2\xbd~B\x1e\xbeh_\x0b\xbffx\xc4\xbe\x7f\xfa1\xbe7u\xd6\xbd\xa0$\x11\xbe\x1ax\xd8=\xae\xcc\xd4=\xf2\xd9\x85=e\x08R>\xd3\xc3[>@\xf9C\xbd\x90\x1b,=\xca\x89\x9d>%\xb5\x86\xbe\xe9\xdb\x14>a\xab\x0e>0M\xb6>\xd2\x0e\xb5\xbeN3\x14?\xc9\xdf\x1a\xbdUr\xbd\xbepZB>\x86\xe1\xae\xbey\xc1\xfb\xbc\x99&\xbe>\x80)\x8c=\xf8\xd5\x7f>e|w>\x0b\xdc\x17>S)N\xbe\x9e\x81Z<\xd2$\x86>\x07"\'>\xb1\xb3X>b9\xd7>\x00\x04Y\xbekj-=X\x1f\x8b>2\xe7\xdd:\x05 \x0e\xbcB\\\xa9\xbeW\x86\xaf=\xf6\x84\x93>\xa2)\xd2=\xd0\r\xa4<s)\x8e\xbd\xd9\xa3\xbd\xbe\x08\xa5Q>\xb9\xa6\x1f<\xe7v\xea<\n\x16\x16?r\x8e+>\xbbt\x1f\xbd\xba\x91\xdb=\xc6s\x83=\xa1w\xa0>\xf5v\xb7\xbd\xb3X\xba=\x7fZ3=\x13\x15O=%_F>ro\xf6=F\xe8K<\x17\xf0\x13<\'\x1eC=\xc8\xad8>.\x04\xbe<\x0fM\x93=\x9d\x0c\\\xbe\x85?\x02=\xc8\x1cr\xbe\x91,\x9b>V\t\xa1=\xef4\xd8\xbe\x82\x9a\xa1>I\xb3\xf5\xbcY"\xfd=sT\xe8>\xdd)\t\xbe\x1b\\.\xbc\x13\x19\xeb<\xcf\xb7\xd5\xbd\xa0\xbcV>\xfbF\xff=I\x18\xb0<}\x8c\xcc>g\x1b>\xbe\tE\xcd<\xaf#\xe2=\xf0>\xab\xbe\xa1u\xfa\xbc\xd9\x80>\xbe)\xfd\xc4\xbe\xc5~S\xbe\xb7\xb5\xa2=\xbe\x85\x8c\xbd\x85S\xdf\xbe[]\xc3>\x19\xb9)=\xb0A\xf2\xbd\xbaK\xa6=@D2\xbe@4M\xbe\x8f5\x0b?@\xdec=\xe9*\xbd= \x0c\x8f\xbe\xe3\x89\x01\xbfS,5>\x87\xafL>\xdd\x07\xb9>/\x0f\xc8\xbc=\x8dS\xber\xe9\xae\xbd\xd7\x83\x9d>Mo\x1c\xbc\xf5,\xa9>\x95^\x8b=\xd4\x01\x89>nJ\xad\xbd\tmV>\xb9\x1eS=\x99)W>\x9b\xde\x04>\xc4\x18\t?\xd1\\\xb8>s,+\xbd\xf5\x88\x1c;\x88\xec\xa8<\x18\xf0\xa5='
-p799
-tp800
-bsV503963832512151553
-p801
-g2
-(g3
-(I0
-tp802
-g5
-tp803
-Rp804
-(I1
-(I200
-tp805
-g12
-I00
-S'{\xfb\xba>%\r"\xbe\xa7:\x00\xbf\x15\xd5l=~\xd5\xac>q\x90\xe7\xbd\xab\x10\xa6=\xbaOS\xbel\xfc\x06=\x07\xb2\xdc=\xe0w\xb6\xbcW\xe6\xea=\x90\xe6p>\x87\x97\r=I\xc0\x1e\xbe\x1d\x02\xa9>\x02\'\xdf;j\x15\xa8=\x04gc\xbe#\x93\xff\xbc\xcc\xaa>\xbe\xf6@\xc1<+\x04\xdb=5\x98\xa3\xbe\x85\xb0\x1c\xbc\xf9k^\xbe\x92\xcd\x8a>\x02\xb7E\xbe\x93\x9au\xbe{\xe8v=\x06\xeb\xa4\xbd\x90]\x87\xbd\xec\xe0\xec=C\xdd\xf9\xbe\xdc\xc5\x03\xbeq\xf1\x83>\xb6\x9d\xd9=^]Y>fE\xc4>D1\x87\xbd\xc1\xdb;\xbe\xef_\x01=\x12\xad_>6`\x9e\xbe\x077\x99\xbe\xa0\xdaP\xbep=\xd4>\xad\xa3\x00<\x07\x81\xd1=Z\x85\xea>\xf7\t\t>[\x97 ?\xad\x89\x8e\xbe,\xf5J>\x90@\x9c\xbe\xec\x8f\xa6>\xb04\x1e<gN\xa8\xbe\xe4Gm\xbe\xf0O\xfa\xbe\xb4\xc8f>/E\xa6=\xaa\x80[=Y$ \xbe\x11\xa2[>\x1e\x188>\xbdt\x90\xbeZ\x9d\x04>\x99\xe4?\xbe\x0f~A\xbe\xdb\xa2\x0b\xbf\x944\x88\xbe\xbd+\xb8=\xdd\x1cL\xbe\xbc-.\xbe\xca\xc3Z>\xd5\xadx>r\xbb\x81=.\xb79>7\\\xa0>\xb4@+\xbe,\x0b\xd8=\xbb\xda\xa3>\x8fl\xbc\xbd\xc4SD9/\x0c\xba=3\xf8\xaa>\xf7\xf4\xe8\xbe\x80\x93\x1f?\xdc:\xb8\xbc;\xe9\xb0\xbe\\\xfb\xf4=\xee\xfb\xa8\xbeY3"\xbd.\xe9\xde>\xcbB->`\xee\x03>\xc0\x862>C\x9ap>\x8e\xb8\xaf\xbd\xf1B\xf4=w\xa6\xa7>*\x17<>\xb6o\x8f>\xbc\xc3\x9f>\x9f\xad\x89\xbe]\x9f\x12=\x95\x98\x10>\xc4\x91\x94=m\xef\xeb=d8\x1f\xbe\x0b\x9c\xd1=\xcdYG>W~\xf4=\xb9d\x91\xbd\xd4=,=L/\xf6\xbe\xc0\xb1\xcc>\x87]\xa6;\x1a\xf3n\xbdU\xc0\x08?\x9f@\xda=Qc\x0f\xbd\xda\xc2\x9b=\xe0\xfdZ=\xe0\xac\xae>\x00\xfeb\xbe\x91\\\xd9\xbd\xe1\xcb\xd1=U\xef\x00>\xb3{;>\xf1\\\x12>}0b>\xc6\x82\xaa<\x1d\\C>\x1b\x0b\x9b>/\xb1\x80<r\xc9\x83=\xdac\xac<\xd0\x0eu=\x00\xa7\xa1\xbeg\xa9\xfb>\xf5\x16+\xbdO\x99\xfe\xbe\x83\xc0\xf2=\x14\x10L\xbe\x8f\xcdt>\xf6\xc4\xae>\xde\x81\x03\xbe\x81\xf9\x07=\xde\xba\x07\xbc=\xda\x88\xbd\x19 W>#\tI> \xc96>\xc7\xb6\t?\x04D[\xbe\x8fA>>\xbe\xf1\x12>\xbc\x8e~\xbe\xe0U\xd5=L\xee\x8c\xbe\xc4\xf1\x03\xbfv\xcdj\xbe[0K=\xf1\xc4\xeb\xbdPF0\xbfkq\x97>\xfd\xf8\xff\xbd\xc5!\x96\xbd%\x95>>mC\x83\xbe\xd4\xa8\xbc\xbcw\xb2\x0e?\x01\xf1\x04>?\xdb\xea\xbb@\t[\xbe\xc3\xd2\xd9\xbe\x8a2F>\xef\x90\xd0=\xc7\xec\xcb>\xe5\xd2\x96=\xa1\xaf<\xbe\x93\xd5\\=,8\x84>\x13oj<\xd7\x92\xcd>]\xc5\x14>&\xc3f>a`\xac\xbd\x87\xab\xbc>:\xf0\x07>?\x14\x88>z`d\xbd\xdf$\x05?l\x04K>\xd9I\xe3=\xdf\xf1\r=\xa1\x07\xb6<\xfe\x15\xd4='
-p806
-tp807
-bsV503979135803621376
-p808
-g2
-(g3
-(I0
-tp809
-g5
-tp810
-Rp811
-(I1
-(I200
-tp812
-g12
-I00
-S'\x0f\x1e\x8a>\xd3\x1e\x01>\xd4\x1c\x89\xbe\xa8\xbeD\xbc\xb2d\xd5=\x82\xb0<=RP_\xbd\x9bJQ\xbe\xae\xd0\xf5\xbcl\x18\x94>\xfc\xc2\x9b\xbd3D2\xbe\xb4\xda\xa4<k6\x9d\xbc,\xb7\x81\xbcp|\x8e>\x89\xa2\x1d\xbe\xf2\x8bS\xbe1\xed%\xbeD\x0c\xfc\xbd\x19V\xc3\xbd\xf4\xab\x0b\xbd\x93\x07\x05>\xd19\x1e>R\xf4\x9c=\x8c\xfda\xbd\xff\xb4->\xe2\xc7w\xbd\xf5$z\xbeh\x97;\xbeehR\xbeIv\t\xbd4\x88\xbb<\xce\xb6\xbe\xbe\xb5\xce\x8f=*\x87\x84>\xfdYY>\x91\x86\x07>\xf8_?>\xe4\xa0\xc0<\xbf\x96\x17\xbe\x19?\xd4\xbdw\xdc]=v\xa2\x99\xbd\x07\x18\\\xbe\xadh\xaa\xbcrgY>`q\x03>\x9f\x93\xd8=>$\xcb>\x90\xfe:\xbd\xe6\xeb\x84>^\xc8\xf0\xbd\xe0\xf0\x06=;\x83\xc4\xbe\x16&\xc7<\x82`\xd7\xbcd|\x8a\xbc\x1b\n\xea\xbeM,\xca\xbe\x9d\xe1\x1f>\x10\xa4\xc0>\x93\xdb\x82>\xe3\xca=\xbe\xe4\x19\xb7;\xe7\xd8\xb7=~\xb6F\xbep\x18\x94>\x84\xb8\x19>\xf2\xd5m\xbeu\xc2\x9c\xbe\xd5\xe9\xaa\xbe\xda\xdb2\xbe\'"\xce\xbd\xb4D\x9b\xbd\x8a\x140=\x0f%\xb3=\xd6Y\xa1=\xaat\x84>W\xf73>\x0e\xb11=$\xfdy<\xc5\xcc\xb9>P\xae\x8c\xbe\xfa}\xe1=]\x1f\xda\xbc\xa2n+>\xd5\x06j\xbe\xae\x1f\xb8>d\x95\x80\xbd\xf4\x18(\xbe\xd1\xe8\xd3=\xc3\xb3\xb6\xbdx2 \xbe\xa5\xa4l>\x08\xf0\x88\xbd\xd5\xcdg>n1+>\xbe\xdf\xe3=M\x82\xde\xbd\xc5\xc2\x8e\xbd{\xc8/>\xa4\x91\xa7=\xd4\xd3\x19>c\xaf\xd0>\x94\x88_\xbe\xb2\x99\xe7;\xa4\xe2g>\xd08t=\xf2\x1d\x80\xbdD`\xa3\xbeW{\xeb;\x94pb>\xc5?\x1f>\x05\xe3\xe4=\xef`\xa7<\xfc\x89\x88\xbe\x08\xd5\x0e>\xac\x17\x16\xbd}\x04"\xbd\x05\x1e\xbc>I\xdd\x08>\xfc\x0c\x9a\xbc\xc1+\x8e\xbd\xa9u\x8a\xbd\x1a\x82*>\xa5\xe1l\xbd!\xa8\xc3=\xb5\x87\xfe=M\\\x03>\x84\x9e\xb2;\xd8]\xad<L\x14&=\x8c\x1b\xba<bn\xe2\xbd&w\xab;\x19B9\xbd\x1c24=\xe7Ve\xbe\xe8E\x06\xbd\x94C\x0f\xbe\xb2\xafj>\x95\x98\x11>\xd2Wj\xbe\x1a\x00\xba>\xec\xacL>%\xceE=w\xd0\xf7>\xb0\x954\xbd(A\x95<c\xa4\x11\xbd\xc2\xdb1\xbeEBY>\xc3\x80*>U\xfe\xac\xbd\x06\xb9\x97>\xde\x9dY\xbek\xe6w=\xcb\x8b\xf8=\x9c\xcb\x9c\xbeFp\x05\xbe\x82\xcew\xbe\xdcL\xc8\xbe\x8b\xebu\xbe4d\xcb<\xa75+<\x94\xba\xa7\xbe@Ux>\xc5\x93B=<\xca\x98\xbd\r\xcbD\xbd\x00^X\xbe\x07\x98F\xbeo\xd7\x96>\xb9)[=\xbdA >R\xbbr\xbe\x1d(\xb9\xbe\xb0\x0c\xe7=RM\x85=\xce\x8bh>\xdc\xdd\x07=\x14nj\xbe+\x89\xce\xbd\xa5w\xb8>|\xc3%\xbc1\xb2\x93=\xac\xd1\xb7=\xfb\x0cE>\xe75\xfb\xbd61\x12>\x02\x1f\xae\xbbc\xf0\xe1=\xb9a\x13>Ve\xc4>2\xae\x95>\x1a%^\xbc\xfbv\xbf<\x05\x88\t>f\xc53\xbd'
-p813
-tp814
-bsV503958074663518208
-p815
-g2
-(g3
-(I0
-tp816
-g5
-tp817
-Rp818
-(I1
-(I200
-tp819
-g12
-I00
-S'\xad\xf7\x1d?OM\x1e\xbet\xb1"\xbf\x9f\xb47\xbe\xc0\x86\xcd>YU\xe7\xbdL*\x83=,\xde\xad\xbe\xa0\x90\xab<\x93m\x8c>\x98\xf1;\xbdOb8>\x85p\xad>\x1bk\xeb\xbdp\x9aS\xbe\xc4\x94\xe6>\xd9\x8c0\xbc\xc3\xb5\x04=g?\x98\xbe\x07@\x9b=\xbdB\xf6\xbeuf\x08>,%2>A\xdb\xc1\xbe\x05\xccA\xbd/3\x92\xbe\xf5\xc3\xa4>\xf2\xeb\xa1\xbew\xaf\xdc\xbe\x9e\xf4\xa9=\x15\xe7\x91>\xe3RO=\x8b\xba\xa7\xbbx\x1d\xec\xbe8\xfbU\xbc\xdb\x9cq>\xf3\x17\x95>!M\x8a>\xe8_\xeb>,\xd2.\xbe\x0b\x94R\xbe~/\x86=\x95V\x9b>yq\xd6\xbe%\x02)\xbe\\\xce\xec\xbd\xd7\xef\x05?\x8c\x9a\xde\xbd\xe3\x0fX=B\x99\x1a?9\x1d\x13>\xdd\xf1=?+\xd2\xea\xbe\xe3zF>KR\xea\xbe\xf7\x93\xd1>c\xe3\x80>U\xfa`\xbeu\xbf\xfc\xbe[\x19\x1b\xbf\xeb\xb0\xce>\xff\xa5\x8a>l\x02\x83\xbc\x97\x92F\xbe\xfd)~=\x9a\xbc\x8a>o\x1fW\xbe=\xc3\xf2>\x0f(\x96\xbe,o\x14\xbexG\n\xbf\xdb\xca\xb9\xbe\xcbc\xb4<\xf7$\r\xbe\x8f.;\xbey^S>\x89\x9d\x8d>\x95W\xe0=\xdf\xdb\x1e>/\x8a\xa3>\xef\x95\x05\xbe#\xd9\x92=g~\x92>A\xda\x82\xbe\x1e\xc2\x85=S\x1d\'>\xff\xe3\xb1> \x1b\xcd\xbe\x90>1?{\xd23=%`\xc6\xbe\x03\xe8\x89>\x97\xb3\xbf\xbe\x03\xc2\x0b\xbd\x934\x06?\x00\xc3\xd1=\xff]\x9a>\xd8t\xb4>\x05B\x92>\xff\xad\x16\xbee\x9bo=\xbbo\x96>\xa7\xa1s>s\xcc\x83>@c\xaf>4\x1e\x86\xbe\x83i\xbf=\xe1\xd1c>\xc7\x8d\x07\xbcCb\xea<\xbb\x17z\xbe\xad\x85W>O\xd0\x92=,\x0b\xcc=\x00\\\xa9\xbd\xeel\x90<\xd76\xf0\xbe\xcd\r\xd3>\x8f\xcb\x92=]\xb6\xf3=\x85Y&?\xb7\'+>\xb2t#\xbdX\xda\t>\xf0a0>\xf0S\x19?\x87\xdds\xbeA5\x94\xbb\xbf\x882\xbd\xf4\x1eC\xbd\xe0fI>\xb7C\xf5=+9\x11>y\xbdS=\xc8\x01T>\xd1<\xab>^\x97\x11=\r\xbb\xff=\x1b\xf9\xe0\xbc-$n=\x01\xce\x93\xbe [\xf2>\xd9+.< R\t\xbf\x9f\xd7\xbe>\x85\xea%\xbd-\x9e\xb8>\xa0\x8c\xdf>S4[\xbe\xfe\x81\x0c\xbd^\xbd\x18\xbe\x18B=\xbeR\x0c\x82>\xe0\xe9N>\'\xba\xf4=\xa8s\x01?\xa8(\x1e\xbeK\xc7 >\x9e\x04\x8b=\xef\x11\xc4\xbe\xcf#\x81=;I(\xbe\x90\x0e\x0e\xbf\t\xd0\x81\xbeM\xfe\xd7=o\xbb2\xbeu:?\xbfMf\xa8>\xccX|\xbd\x15\x0c\xc5\xbd5\xb60>i\x83b\xbeL;\xb7\xbd\xf9lO?\xdb.\x13>M\x0b\xf6\xbc\x81\xdf\xb8\xbe\xa3\x8b$\xbf\xd86\x80=L\x92h>\xc4\xa1\xc1>\'\x089=\xb5\xb0\xc8\xbe}\x14\x11\xbe$K\xa5>0n5\xbd\xb7z\x03?|\x08@>\r\xdf\x9f>\xc3\xd8Y\xbd5)`>\xc7\x1e\xe8=@\xa5l>\x85\x97Y<F\xd5\x1a?\xa7\x86\xd7>9\xb9\x10=%S\xf8\xbd\xef?\xd9\xbc\x9b\xba^>'
-p820
-tp821
-bsV503957172665872384
-p822
-g2
-(g3
-(I0
-tp823
-g5
-tp824
-Rp825
-(I1
-(I200
-tp826
-g12
-I00
-S'C\x0f\x07?\x8c\xd2\x16>\xbc\xac\xd0\xbeiN\x0b\xbdf]@>\xa0\xf4\xe79\'\xb4\x99\xbd\xf1\xa5\x94\xbe\x7fM8\xbc\xd8\xa1\xa4>zjw\xbd(<\x1f\xbe\xbd\x08\xa6=\xc3\xf6K\xbd\x84\x93\x82<\x1d\xaf\xcf>\xcd\x99\xd0\xbd\x0ck(\xbe\xae\x9ck\xbey\xca\t\xbe\xd0d\x1b\xbe\xc8>E\xbc{\rj>\xbcg\xa3=\xc4\x1d\xaa=\xa4w\xb3\xbdK\xfa#>\xf8.P\xbd\x0e1\x9b\xbe\xa8\x142\xbe\x1f\xa5\r\xbe;\x03\x86\xbdJU\x03=\x9e\xaa\xd3\xbe\x88\x88\xb3=k\xaf\x89>I\xa4\x92>\xee\x915>i\xf3\x99>\xbdz\xaf\xbc\x07NQ\xbe\xbc0\xef\xbd\x14\xb2e=\xd2\xd8!\xbeh\x97m\xbe\xac/\xa8\xbd\x84\x0f\xd1>\xcej\xcb=\x96\xe7\x00>1\n\x0b?DT\xad\xbd\xb3{\xda>\xd1\xbe]\xbeF\x8e\x91=PV\xe1\xbe\x88\x9c\x9f=\x00&\xa9=\xe8z\xc7\xbch\xeb\x16\xbf1\x0b\xf1\xbev#^>\x86c\xf3>\x142\x8e>\x1f\xcd5\xbeJ\x15\xb8\xbcV0\xc5=]\x15\x8a\xbe\x94c\xe7>\xaa\xac\xf7=\xfa\x86\x8e\xbe\x1f\xa4\x01\xbfH\x84\xdb\xbe#\x92\x84\xbe@w\xc1\xbd\xb2*\x02\xbe\xd0\xccG;\xe3N\xd0<U\xa0 >\xa1\x83\x8e>\xd8\xf6W>@\xc7\xbc<\xc6b\xac\xbb\x83\x8f\xd0>\xe4\xb5\x8e\xbex\xfa\xe9="\x96y=\xb1\xd8\x80>\xcd\x10\x90\xbe\xfc\x1a\x00?#H\x1e\xbe\x0cm\x98\xbe\xa9M\x17>\x97\xbe\x8e\xbe\xa5F(\xbe\x0e\xea\x88>\xc2\x0e\x1b=\xd9\xa3\xa1>\xf8gh>\xe8\xd6\xd0=2a:\xbe\xa6\x92\x18\xbd\x0e\xecu>\xfe\xfc1>\xb2\n=>>H\xdb>H\xa6p\xbe\xaa\xcb\xad<\x90\xe8\xba>T\x0c\x02=\x80\xd8\xe29w\xd7\xe2\xbeG\x14\xf7<\xf8\xb7\x9a>\xefl\x0f>\xfb\x95\xa9=\xb8\xf5\x0e\xbd\x82\x0e\xc1\xbe\xe2\x94F>\x84\xec\xd6<\xd1\x9d\x91\xbb:\x91\xfd>P\x97f>\xde\xf8\x05\xbd&\xe0\x83=\xe8v\x08\xbd\x8c\x98\x83>\xa5\xff\x12\xbe\x15\xb3\xfa=\xa0k\x93=vH\x17>:\x04\x9c=\x1e\xdf\xf6=\x10\x087=\xd61$=b\xc4p\xbd\xa1\xb8\x0c<\x92\xf3)\xbd\x1aK"<\xec\x8f\xa7\xbe*\xf8L\xbd\xf6\xa4\x89\xbeX\x87`>38^>\xb3\xe3\xcc\xbe\xc8\x06\xc8>\x8d<\xd8=\x8aM\x99=\xa2\xf0\x1d?\xac\xd6\x01\xbe\x1e\xfa7\xbc(\x92 <\x12D\x18\xbe\xddT\x87>\xa1m\x1f>\xbb\xcfg\xbd \x99\xbe>f\x88R\xbe\xff%M=`d\xd9=\xc1\x06\xc9\xbe\xa0\x03+\xbeE\xc4\x86\xbep\x95\xfe\xbeB\x13i\xbeU\xab\x06>=[\xa5\xbcz\xd2\xd8\xbe\x9f\xde\xaf>\xcc\x0b\xeb=Z\xd3\xd2\xbd/\xea\x93\xbch\xc6\x87\xbe\x05\x86o\xbeH!\xe5>P\xc6P=("7>w\x82\x97\xbe\xda\xdf\r\xbf\xcd\xe7\x1a>U\x00R>o\xd3\xa1>\x80\xa6|\xb9\x8f\xe0\x85\xbe\xa0%\x14\xbe\x0c\x9f\xe2>n,\x0f\xbd\xa2\xefj>\x13\xe2\xa9=\xa0\xca\x88>\xde\nu\xbdM\xe6c>\xb4\x92\xb4\xbb5&.>\xab\xe2\x0f>\xaf\xa3\r? \xa5\xad>\n\xcaQ\xbd\xe9YL=py:>R\xeb\x01\xbc'
-p827
-tp828
-bsV503959548462632961
-p829
-g2
-(g3
-(I0
-tp830
-g5
-tp831
-Rp832
-(I1
-(I200
-tp833
-g12
-I00
-S'\xafhA?3\xbdy>\x98l\x18\xbf\xb4\xf1\xf0\xbdng=>\x9b@\xa2=\xc0C\xc8\xbd(\r\x9d\xbe\x9a\xdd\x84=\xd3\xe8\x16?=pQ\xbe\x08\x84\x92\xbeRJ\xdd\xb8\xce\x08G\xbe%\x92\x16=\x7fy\xf7>\xf6\x98-\xbe\x98\x04|\xbe\xdc\xa9\xb6\xbeHEq\xbe(\xea\x80\xbe \xd9\xc8<\xaf\x15\xa1>:\xa6\x9c>\xd8\x80\x1a>Mw1\xbe\xc6Y\xa5>\xb6\x0c\xcd<J\x9e\xee\xbe\xact\xe2\xbe\xd1"\x05\xbeM\xd3?\xbc{\x92w\xbd\x7f,,\xbf|\x06\xc3=\x80\x06\xd6>\xe3\xb9\xe1>4\x9e\x94>\xe4>\xe5>A\xff\xdf\xbd\xba\xa3\xd2\xbe\xcc\xbe\xdf\xbdjY\x9d=\x0f\xd3\x0e\xbe\xf8\x05\x98\xbe2\x024\xbe\xc12\x10?:n4>\xaa\xe8E>\xa1\x11[?\xf4\x13\x07\xbe\xeb\xb3\x1c?\xac\xbe\xc8\xbe,\x0e\xe7=\xe1\xef!\xbf\x01\xe0\xfe=!\x08C>A\x01\xa1\xbci\x87\\\xbf\x04?&\xbf\x8d\xc5\xbb>\x0cd]?\xfd\xdc\xef>H\x07Y\xbe6\xa03=\x04|\x91=\x01\xd2\xf4\xbe\xaa\xfe8?\xf1\x9c\\>\x98h\xb1\xbe\x91\xb1\x1e\xbf|o!\xbf\xca\xda\xaf\xbe\x06\xba\x13\xbec\xfb\x82\xbe\xcc\xcc\xd2\xbd\xc6\x88\x1c<\xb4\xd7;>M\x1a\xdf>3?\x83>o%5=S\xcb\xed\xbc6\xeb(?\x0cn\xda\xbe\xa5\x13\xf6=\x00\'\x03=\xe1x\x8e>\xd6\x99\xce\xbe\xda\x01"?\x97$J\xbe\x08m\xde\xbe!\xafL>\xd7\xd8\xa9\xbe\x0fc\x96\xbe\xb2\xa8\xc8>\x80oB=\x00\xaf\xd6>\x11\x98\x8f>W\xfd.>\x84$\x95\xbeS\x7f\x0b\xbe?7\x8b>\x8b\xe7\x87>\xaf\x9d|>\xc5m\x01?\xcd\xef\xdb\xbe\xe4\x03\xdf<\x1c!!?\x05\xf1l<\x08|\xbb\xbc_\xe6P\xbf\xbf\xcb@\xbe\x90U\x04?\xd6\x1a`>\xf3y\x84>\x94\x82\x91\xbd\xad\xda\x15\xbf\x86Tb>qy\xe7\xbc\x8fI\xaf\xbd\xe0\xcb$?J]\x9b>\x0f\x13\x08\xbe7\xcc\x17>~"\x02\xbd\xe0H\xc2>\x17\xafK\xbe\xa1\xa8\x16>L\x10\x00>So\xe5=\xc9V3>\x95;\x05>\x83\xb2x<\xd7\xc4m=\xc6 \x12\xbe\xf1\xde!=\x00\x01\x96\xbc\x8cl-=b(\x12\xbf\xd2m\xe8\xbb\xb2\xfc\xbb\xber\x9eI>\x19A\x98>H\x1e\x1e\xbf\xae\x0e\x1a?\x88\x80\x94>\x8a\xc3\x0e>\x80\xc1y?\xfc\xa2\x1e\xbe\x08\xfb,\xbd\xa9\xbaS\xbdn&i\xbe\xf6\xc0\xc7>\xb8R}>\xc0\xa8\xe3\xbdm\x8c\x15?\x8f\xf3\xc5\xbe\xad\xbe\x0e=\x07\xdf\x1b>\xef\xd2\x14\xbf\x1f\xd6\xc9\xbe\xfc\xa1\xce\xbe\x1f+7\xbf/O\xec\xbe\xa5Hw>\x1f\xb6T\xbd\xcc\n*\xbf$\x1e\xeb>\x8emi>\xb8[d\xbd!\xc1\xb3<\xbf\xfb\x8e\xbe(b\xca\xbe\x08\x100?n=\xbd=\xbd\xe5\xc3>\xf89\xd2\xbe\x1c\xd8]\xbf\xc9g8>\x92\x0eQ>;{\xd4>\x08.\xe2<\xba\xe1\xe7\xbe\x86\x96\xb8\xbe\xe4\xb6\x1f?\xb3u\xa4\xbd\x17\x1d\x8b>\xcc\xc0\x0b>\xe5\x99\xb6>\xc6>3=+\xd9\x81>\xa6\x85\xb3\xbc\x1fK\x95>.\xaa\x04>c\xdcT?\x7fp\x05?,\xd2\xfd\xbdT\xcd\x98\xbcD\x00\x80>\\\xaf\x9c\xbd'
-p834
-tp835
-bsV503965650193502208
-p836
-g2
-(g3
-(I0
-tp837
-g5
-tp838
-Rp839
-(I1
-(I200
-tp840
-g12
-I00
-S'\xc1\xc6N?\x07i\xc7>>\xdaD\xbf\x9e{\\\xbcY\xbf\x12>O\xd9\x8e=\xb6\xd9\xd8\xbdNf\xda\xbe\xc0\xb8n=\x04\x9b\x0e?\x91\xa7\x9b\xbe\xf7\xb1\xc7\xbe\xc1\xfa\x90\xbc\x80\xceb\xbe\x9f\x85t>\x8d\x82*?Np|\xbe\xd5x\xee\xbe\xf8i\xd5\xbe\x84\x10\xa2\xbe\x81\xf0.\xbeV\xbcO\xbd\xba\xf7\xe4>\x04\xcd\xf4>Y\xfcy>\xb2;2\xbe\n\x11\xb4>\xd6l\x03>\xfd\xa4\xef\xbeC\xea\x1c\xbf\xf6\x90\xc2\xbe\xb5\x8e\xa4=\xfco\x0f\xbe\x88\x03e\xbf\xd7\xba\x1e>\xc4>\xe8>f\xae\x06?\x87\xe2\xdb>TL\xf1>\x95as\xbe&m\x10\xbf\r\xc8P\xbe\xa7\xaf\x02\xbe\xec)\xd2\xbb\xf8\xa6\x1c\xbfm\x08W\xbe\x8d\xd9\x0b?r\xfe\x88>\x8c\xa7\x90>~m~?\xa4\xe5\xce\xbd\x80@\x1e?\x84\xba\xb9\xbe\xc4A0>\xf4\x0f+\xbf\x03\xca7=\xcc}\x03>\x04g\xe7\xbc\x9f\xeb_\xbf\xd7}[\xbf\xe3\xfe\x9b>\xb1\x1c\x91?\xb8(D?\xc3\xe3\xae\xbe\x9fI?>+R\x7f<cG\xf7\xbe\x00\xf3]?\xf1\xd0\x19?\x06D\x02\xbf\xab\x9e:\xbfM<c\xbf\r;+\xbfLq\x06\xbem\x8a~\xbe\xcf^\xd0\xbd\x80J\xbe\xbcG\x10\x12>x83?\xe0s\xcf>\xff]\x1d>\x9d\xd6\x0e>3~<?\xe7\x1d\x08\xbf\x13@\xe0=f\x87\xcf<\xf4k\xbc>\xadF\xe2\xbe\x14\xd7@?\t\x90\xd2\xbed\x92\x14\xbf\xd9L\x9d>\x07\xb5\x94\xbeb\xec\x04\xbf]!\xaa>M\xed\xcf\xbcW\xcc\x1a?\x8b\x13\x9d>^km>/\x87\xc0\xbe<\x9f<\xbe&\xac\x8b>\x14\xd8\x80>\x9d\xbc\xf1>U9N?\xe3\xe1\x04\xbfM`D\xbd\x08\xb8U?\xbd%\xd7<\xd7g\xec\xbdQ\x84\x81\xbfQ\x9d\x8b\xbe}\xa55?=\n\xad>\x01n\x8c>\xad\xc9\x13\xbe~%7\xbf\x88\xa65>\x02(*\xbe\xfa\x85D\xbe\x08\xd1K?v\x19\xe3>\xa4>\xdf\xbd\xbdE\x96=\xfcZ_;\xb7\x15\xba>\x86Rc\xbe\xf7d\x97>"\xc2`>\xbdJ\xa2>\xddS[>\xec\xf8z>\xadd\x14=>\xb4\xf2=\x93\xb6\x9f\xbeCI\x86=\xa0f\xb6\xbc\xb71\x03>\x8c\xcc\\\xbf\xd7j[\xbe\xcfv\xf4\xbe\xf3\t\xdc>\\)\xfb>A\xc8=\xbf7\x07??7h\xbe>4\xfc\xd8<B?\xac?*\x91\xaa\xbd\xb2rf;f\xb2\xd4=Z_R\xbe\xf9[\xe0>\xa4\xe5\x8d>\\\x04-\xbeg\x9dF?r\x84\x15\xbf\x1f\xfe\xb3<\x8b\x91\xb3>\xbda@\xbf&\xb1\x00\xbf\xe8\x89\x19\xbf\x9f\xd6w\xbf\xe8\xcc\x10\xbf\xb84t>)7\xc3<\xbd|H\xbf`n\x15?\x1c\xb2\xab>\x91\xdc\xd9\xbdy\xd19\xbd-\xbb\xfd\xbe\xd9\xa0&\xbf\x01\xf7\x1a?\xe6\xee[=\x9c\xe0\xf3>RX\xc3\xbeF\\\x85\xbf\xf5\xb2\xf9>\xd3\xddW>\xa1+\xfb>\xceh\xf7\xbb\xcbM\x0c\xbfM7\xa0\xbe\x99\x8dX?\xf9\x1b@\xbd\x84\x1d\xbf>Y\xb9I>\x9f\x9f\xe5>`mV\xbd\xe4\xd4\xbe>\xe8\x0e\x8a\xbb\t\xcc\xb1>}\xe7Y>\xe7\xcfu?.D\x1e?\xbc:N\xbe\x7f\xad\xba\xbc\x06\xb3\x93>\xb3>\xc0\xbe'
-p841
-tp842
-bsV504251349392171008
-p843
-g2
-(g3
-(I0
-tp844
-g5
-tp845
-Rp846
-(I1
-(I200
-tp847
-g12
-I00
-S'Ru\x05?\xee(\xc8\xbd\x86\xb6?\xbf\x88\xdb\xe2;\xfb\xb6\xd2>\xa7\x91\x1a\xbe\xb5\xd9\x16>i\x82\xa0\xbe(\x06<=\xf2up=E\x90$\xbd\x92.\x00>w\xd7\xa7>\xb68\x98=\x83Ne\xbeV&\xd0>\x0e\xbf\x8c<\xb6\xdb\xc3=9\xc1\x94\xbe\x99\x8f\x84;K\xb3\x81\xbe(d\xba<\x01\x18\x8f>\x1d\x89\xbe\xbeC\x80\xc4;\x80\xce\x90\xbe\x99M\x9b>UOu\xbe\x83\n^\xbey\x8d|=\xebL\x1d=I\xe1\xf8\xbd\xd8e\xcf=\xdd\xe3\x16\xbf\x02\xe50\xbe\xc1\x99\xa9>k;\x00>zD\xc1>\xda\x9f\xda>V&\xaf\xbd\xa0\xc8\\\xbe\x87\x96\xc7=K\x15W>W\xfd\xd6\xbe\x99t\xab\xbe\xd7\xfdu\xbe\xe6\xc8\xfb>m\xef\xe9\xbd\x81\xac\xb7=C\xb6"?j\xc99>\xcb\xe2:?\x83g\xb0\xbe\x06t\x89>7\x9b\x8a\xbe\x0f,\xcf>\xc7\x1e\x0c>\xeb]\xc8\xbe\x12\xf5c\xbe\xf2\xd8+\xbf\xe1\x85\xb1>\xd6\x18\xea=\xbc\xc0\x8a\xbd5\xccg\xbe\x8dF\x81>B\x87}>w\x8d\xc3\xbe0\x925>\xf7H\x93\xbe\x85\x1fX\xbe\xe7q7\xbfY#\xae\xbe\x81u7=\xde9y\xbeg\x0f\xa2\xbe\x82\xe10>\xbe\xf5v>5Y\xcc<\xfb\x91x>\xf8@\xbc>\x9d\xd7W\xbe\xb7\x8aL>\x91\xb0\xbf>\xd8\x86\xc6\xbdbV\x88=\x9d\xfbx>H\xe9\xcc>\xff\x87\x1c\xbf\xab\x90H?\x0fT\xb3\xbdTG\x05\xbf\xb2t?>\xc5\x13\x00\xbfY\xb9\t<\xd0\xf6\xf2>\xfe\xe8\xa4>)\x0c5>\x1aT|>8o{>\xd8u\x1f\xbe\xab\xed\x8b=\x96O\xd4>!JM>\xdd \xcb>\x08\x90\xb1>\x9bu\xac\xbe\x9f3h==\x82\x87>-p\xa1=\x92\xdd*>\xeb\x98I\xbe\xae\xb0\x0e>v*\x96>w\xe3\xe3=\xf6\x98}\xbd\x07\xdd\xa4\xbd\xder\x14\xbf\xc0m\x08?7\x82R\xbd\xd7\xb35\xbd\x05S1?V\xf7\xd5=g\xa9\xb5\xbd\xfb\xe2%>\xee\x12i<\xcdp\xdb>\xb6\xf4\x84\xbe\x9b\xa9\x94\xbd\xe2V\xb0=\x1b\xec\x92=\xc3\xf9\xaa>B\xe7\x90>\xde\x83I>e?\x88=\xe2\x0c7>\xd6K\xe0>\x8aq\x0b\xbd\x16\x0e.=\r\x07\xae\xbc\x8a\xf0\x1f>\x0e-\xc7\xbe"\x97\x0c?+\xb2\xcf\xbd{\xa92\xbf9\xe9e>F\t\x99\xbe\t\x87\xa3>\xd1*\xec>F\x1d\xfd\xbdq\xee\x9c\xbc\xf2U>=;\x01t\xbd\x1e\x82\xb8>A%\x88>@*g>Q\xc1.?\x0f\xe5|\xbe\x8a\x8c)>\xf8\xe8<>U\x8b\x85\xbe\x95C\xb7=_\xa6\x9e\xbe\xf8{\x17\xbfX\xed\xb9\xbe\x08`\xeb= \xa7R\xbeq\na\xbf\xa7F\xb9>\x8f\xb9\xf3\xbc\xd5\xf2\x8a\xbc\x84\xd1\x8e>el\xa4\xbe\x83\xe4\xc0\xbdp\xd4.?\xc0\x1d\xd5=\x16\xfd\x17<\xc7h\x9d\xbeY\x11%\xbfi-e>\x92_<>iT\x0c?N`\x07\xbd\xebOk\xbe\xb2\x93\x1f\xbc\xe9(\x83>^n\xe4<\xff\x9e\x11?\x01\x037>\xab-\xae>\xcd\xe3\xa1\xbdC\xed\xdb>\x88l\x1d>\xb9\r\xd0>)9\xa7\xbcs22?\xabO\x9d>\xb2\x16Q<]\x90\xc9\xbc\xa2\xf5J\xbd0\xc5+>'
-p848
-tp849
-bsV503960752336932864
-p850
-g2
-(g3
-(I0
-tp851
-g5
-tp852
-Rp853
-(I1
-(I200
-tp854
-g12
-I00
-S'\xa9\x87\xb5>\x11{\xd4\xbcT\xde\xda\xbem\xfa:\xbcl\xcap>\x10f\xb2;|h,\xbd\x84_\x1c\xbe\x87\xf2e=\x95\xa7\x86>\xa0\x0b\xb0\xbd\xa4\xda\xbc\xbcJ\xcf\x81=\x94\x95+\xbd\x1fD\xd5\xbcE\xbc\x9e>\xcb\xf1\xf4\xbc\xeb\x1e;=\xfb\x04m\xbe\xdc\xcf\xd4\xbd\xef65\xbe\xfa\x8b\x92\xbc\xb2\xad\x1d>I\x88y\xbdv\x88\x82=\'\x83\x1f\xbe\xa6\xe7\x81>\xd8\x9eI\xbd%\xc9\x87\xbe\xc0#\xc1\xbd)Q\x1b\xbd\xbb}E\xbd#\xe7\x8e<\x18\xb8\xd6\xbex\xf0\x93;\xec\x15g>\xa9T7>\xa8QD>\xfb-\xa2><5\xfc\xbd\xfca\x89\xbe\xa5\x12M;\x9a\xa7\x1a>\xcb\x05"\xbeA\x0c\r\xbe\xc9\xed9\xbe\xd5^\xcf>=\xe4\x07>G\x832>\xc5\x9b\xdb>\xcc\x1c\xee;\xa9\xbf\xfd>\xaf\xd8a\xbe>\x08\t>\xb1\xd8\xc2\xbePWL>ux9=(6;\xbe\xb5\xed\xd7\xbe\xb0}\xbe\xbe\x03\x15v>\t9\xa0>\xcc\xbb>>4\xfc\x03\xbe\xe5e\xf7=ez\xa2<\x97\xc7\xcc\xbe\xbb\xac\x90>\xa8\xae\x94\xbc\xff\x91\xac\xbd$\xfb\xef\xbeEu\x97\xbehn\x1f\xbcW\x0f\x80\xbdO\xd1!\xbe\xb3\x8d\x9f<\xd3`\x15>\xdc(\xc3=t\x9bH>o\x9f]>\xd3\xe3\x8c\xbdQ\x8c\xaa<\\\xbc\xb0>\xc3R6\xbe\xb7\x1e)=\xe8\xa8\xad=\xc9\xebs>\xf5j\xad\xbe\xecy\xe5>\x7f&\xbd\xbdO5\xa2\xbeE\x04\xd9=B\xf0\x8b\xbe\xfb6\xac\xbd%\xf3\x96>\x01\xc0\xc9=8}&>\xf5)\t>,W3>\x8f\xd2\x1a\xbe\xfcx\xd5=\xbb\xe5z>\x17\xdfH>7iz>\xc7\xe3\x89>M\xd8w\xbeDE\x86\xbc\x97\xce\x88>\x1cS^=\xdf\xde\xa7=\x9f\\\x99\xbe\xb9\x93\x8f\xbdL\xf9\x86>\x8f\xf4\xf5=\xd5n\xbb<\x0b\xd2\x8a<\xb8\xa4\xb7\xbe\x90xC>ktp<\xad\xda4\xbd\xc1L\xff>y\x88\xac=\xf4\xc6\xa2\xbc\xd4J\xff=S,\x90<$\xaet>\x95\x8b\x12\xbe\xdb\xdf\x9a\xbd\x98r\x14>-\x96\x14>\xc9W&>Q_,=\x95}\x97=\xb4T\xca=\xb3ea=M\xa9%>\xc7\x05S=\x00\xac\xaf<\x15\xbd3\xbe\xf5\x9c\x88=\xc3\xe0\x9f\xbe\x08-p>\x03O\xb3=\x19J\xcd\xbe\r0!>\xa0T\xcb\xbc\xa1\x92\r>\x85\xae\xd1>\x90\xf2(\xbe\xdd\xfb\xd9\xbc\x1c\x15U\xbd\x08\xcc\xfa\xbd}OY>\xed\xbc1>H\xd2\xac\xbcA\xfd\xdd>@\xa6B\xbe\xa3\xbf\xe8<\xeed\xa1=\xfc|\x92\xbeI\xbd:\xbd\xf8w\x8e\xbeU\xab\xd8\xbe\xe0\x0b&\xbe\x0b\x1f >\xbf]\x87\xbd\xa3\x87\xdc\xbe\xc4\x86\x9a>BD\x08\xbd["\xc5\xbc\x11`\xb6=A@\xd0\xbd\x13w\xa3\xbd\xdd\xce\xd2>\xa1\xfam=\xc8\xbd\xef=\x82\xb0\x82\xbe,\xe8\xe8\xbe"\xc0\x1d>e\x0f\xb5=\xd3M\x87>\x1d\x8b\xc9=g\x14\x80\xbe\xc7w\xae\xbd\xc1N\x89>\xc41\x93\xbc\x83X_>\x08]\x02>A\x0c\x83>[\x05\x12\xbc\x00-\x89>\xa8$\xd4;\x17e#>\xd3\x9d\xdc\xbc\xa1\xd2\xf0>\xff\xfc1>o\xfa\xe6=\x1d\xf5s<\xd5e\xca=\x00\xad^\xb9'
-p855
-tp856
-bsV504162923196203008
-p857
-g2
-(g3
-(I0
-tp858
-g5
-tp859
-Rp860
-(I1
-(I200
-tp861
-g12
-I00
-S'\xb9=\xb0>cP\x1b\xbe\xfb\x99\x11\xbf\n\xfd\x93=\xbcQ\x9d>\x83\xb5\x13\xbed\x85\x1c=\xba7K\xbe\xf9A\xc4<u\xfd\xf7=#4L\xbc\xbf/\xd8=\xa8\xd7G>\xec\\G\xbb=\x00\xe0\xbd\xe7\x96\xa1>}\x1f\x85<i\t4<\xbb$4\xbe5\xbb.=m0\x89\xbey<\x99\xbc\x9f\xb6\x9e=\xbcA\xb9\xbe^i\xf8\xbdt\x05\x15\xbe\xa4G\x96>\x0bY{\xbe\xef\x8a\x8f\xbe\xde\xf0\xf6=\x94\x14\xb8\xbc\xc3]\x05\xbe\xe4\xc2\xed=r\xed\xd2\xbe\xf4\xd3\xd6\xbd\xab\x7f\xb4>\xf1\xbc\x03>e~6>\xb4J\xcf>\xfe\xecy<\x85\x97=\xbeo\xcf\x1a=\\\x90n>o=\x9d\xbe\xaeH\x9a\xbe\x1dG2\xbe\xc2\x9e\xf1>\xe1C?<\xa4\xad\xc8=\x19[\xe7>\x98r+>T<\x14?\xbd9\x87\xbe\xee\x17\x88=\xa7\x06\xb9\xbe\xf5\xf2\xc0>\xb7\xaf\xcb<\xe8\x84\x8a\xbe\xcd\xc0\x9d\xbe\x0eU\xf8\xbe\x82\x97{>f\r\xbf=C\xd1\xc1\xbb\x9c\xf3w\xbe8U_>l\xb7\x92>!\xf7\x82\xbe,\xe3!>\x85\xd2\xc3\xbe\xba\x82\x0e\xbe\xa9K\x1b\xbf\xd4\x9e\xb5\xbe$TL=\x9c\x87,\xbe:\xf4O\xbe\x02\xc6t>3>\xb6>2(\xf1=\x1a\xed%>4\x8a\x99>\xb6A\xdc\xbdS\xa2\xd2=8\xb2\x9a>\x89\xd2 \xbe{\x0c\x14=\xdf\xec\xcd=th\x8b>\t\xa6\xe9\xbe\x96\x8f\x1e?\x11h[=\x1cJ\xa4\xbe\xd4\r\x86>\xe3\xe0\xa6\xbeb\x84\x15=\x8a\x0f\xdc>\xad*\xb6=y\xda\xfe=m\x08$>"\xbf\x80>\\\x1el\xbd\x991\xe5=\xdcm\xa9>T\xe9\x1f>a\x0c\x8f>\xe8\xab\xb9>\xc40\xb6\xbe\xf4\x17\xc8<\x99\x96\xf8=(`\x8e=\xf0\x10)=\xcb\xe6\x03\xbe\xacu\x02>\x99\x08?>Fs_>\x14\xd6\x03=2!0=n\x91\xf2\xbet\x05\xbf>\x02#\xb9\xbc\xf5\x17\xfb\xbc \xa2\x15?\x8f1\xa8=\x81`"\xbd\x87\xee\x05=k\x1bd=\xb3|\xc0>\xd0B\x83\xbe\xf4\xab\xe8\xbd\n44=\x170\xa5=n\x85\x16>\x90\x8eI>@WN>$\xa9\xe3;\xe5\xd4\xab=/7\x8f>\xeca\xa8\xbcl\xc6\x84=\x0f\x17\x06=1\x82\xbb=\x85\x1e\x8d\xbe\x87\xf3\xf3>\xcc\x88\x94\xbd\x96\xc7\x04\xbffx\x0c>\x80\x8ac\xbe\xceZ\x8c>\xdd\'\xbf>\x16\xcaJ\xbeN\xba.<!M\n<IN\'\xbd\x17\xd0_>\xa2\x04l>DB\xd3=7~\x0c?\xa0\xf3\x0f\xbe2%)>$\x93\r>\xdd\x18\x84\xbe\xfe\xa3\x06>T\xe9t\xbe\x04f\xdf\xbeT\x0f\x89\xbe\xfc\xdb\x1b;f\xd84\xbeP\'(\xbf\x98L\xb1>\xdb\xdd\xcc\xbd\xad\xc3\xcd\xbc\r\xd7A>,\xd3s\xbe"\xc5i\xbc@\x9e\x17?\x85\x02%>\xeed\xcf\xb9+\x9ay\xbe\xd2\xa3\xce\xbeQN\x14>\xb9E >\t\x04\xcc>\x9a\xb7/=\x87\xc48\xbe@y<\xbdP\xf7\x85>I0u\xbd\x15\xd2\xd1>\x1ft\xc9=\x9e\xf6\x96>\xda\xaa\x0e\xbe\xce\xd8\x8b>\xc5,\xef=xX\x93>\x0b[\xa7<\xfd\xf6\xd2>\x0c\xe2\x96>\xc2\xb9\x05><\xfe\x8c=\xfev\x0e<y\x02\x87='
-p862
-tp863
-bsV503956019194908674
-p864
-g2
-(g3
-(I0
-tp865
-g5
-tp866
-Rp867
-(I1
-(I200
-tp868
-g12
-I00
-S" \xfe\xb0>\x02\x92T\xbcY\xfe\xd4\xbe\xabt\x84< /r>\xbdZY\xbd\xa20.\xbdb\x92z\xbej\x7fI\xbd\xcd8c>$\x91\xe3<{\xd8\xa0<5f&>\xf7#\x04=\\\xba\xb0\xbd\xda\xe4\xa5><?\xb6\xbdWn\x9d\xbdDv'\xbe\xd7+\x8e\xbc\x9e\x01e\xbe\xa4\x1d\x95\xbc\x9dw\x11>\x9ca;\xbe3\xe0\xb4\xbc\xc8\xe3\xc6\xbd\x84\\W>\xf7\rH\xbe\xce\xa1\x86\xbe\x081\x81=\xe8Y&\xbd\xc3Z\x01\xbe\xf45\t>Z\x92\xad\xbe\xbek\xe9<i\xe5\x99>\xb98=>p^\x1e>\x8a\x8e\xab>\xf0\x1c\x1d=\xfb\xc7\xf6\xbd\x96\xeaR\xbdn\x01^>0\x7f\x87\xbe(^6\xbe\xe4\x10I\xbd\t\x8b\xcb>\xa2\xcbj=l\x11\xa6=\x985\xd2>\x04\xa3\xe1<\xac=\xe8>;\xb80\xbe\xf83\t=\xd2I\xe9\xbe%-P>\xae\xdb\xdb\xbb\x89A\x02\xbe\xac\xf8\x00\xbf\xf2\x00\xe2\xbe\x90\x1dk>\xe4\nE>\xe7vw=+\xcbe\xbe\x99\xb5z\xbc`\xfeQ>|\xff|\xbe\\\x03z>\xae\xea3\xbe,\x9e\x13\xben.\x08\xbf\xceZ\xae\xbeE\xd82\xbd\xe79\xfc\xbd\x92\xe9\xdb\xbd\x98*G>|\xac`>\x108\xee=\xf6 ;>6rT>w\xafm\xbda\xed[<=\x0e\xaa>\xa71\x8c\xbe\xd5+\x0c>\xab\x9e\x7f=\xac\xa5\x95>\xe4{\xb6\xbeL\xdc\x06?\xbf\xfa\r=\x91\n`\xbe\xac\xe4&>K\xd4\x83\xbe\xd5#\xc7\xb9\xe5j\xbe>\x80\xa8\x18<\xc0\x9eH>Nnn>\x85\xc6#>.\x8f\xc7\xbdp\x8d\xa4=\xc9\x82\x9c>Z4\x10>\xf9\x85.>\xdba\xe1>\x90\x1cq\xbe\x84\x19\x98<\xe0\xbe\xf0=K\nX=\xa7\xb3\xda\xbb\xfbr7\xbe>\xf89>\xef\x0b@>\xf9f?>\x81\n\x06=\x06Y\xa1<\x80\xe9\xa6\xbe\xd8\xf7\x8d>\xbe>\xe9<\xd1\x81\x86=-\xc7\x08?\x1c\x88\xfe=\x81\xd7\xad\xbc\xf2\x99_\xbc\xe9\xb9\xeb\xbcHX\x93>\x05.\xf5\xbdt\x1d\xfd;\x045{=\xb2\xea\xe2=e\xcc\x97=_\xc4\xae=\x8cz\xb7=3\x16\xab<\xb6\xa4\x18=P\xf0\xef=V\xcf!\xbd\xce\x9b\xe0<B'D\xbde\xc9\x86=\x1cwK\xbe\x8a\xe5\xb7>36\xe3<\xda\xcf\xb3\xbe\xed\xba\x89>z\x10\xa2\xbcrp2>e\xd1\xb7>\x00y\x1c\xbedk\xe6\xbb\x89\x84\x1e\xbd\xc4\x81*\xbe$\x01x>\xfd|b>)\xf1G;'\xf5\xc3>\x8a\xb2\x00\xbeO\xd4\xe1=\xdeK\xb8=\n\xb2\x9b\xbe|\x7ff=^_v\xbe\x17\xb8\xd3\xbeL\x9c:\xbe\xe3\xd6+\xbb\xc7\x8c\xb0\xbdt\xdf\xdd\xbei\xe2\xa7>\x9a*G\xbd\xe6p\xc3\xbd\x81E\x82<\x0c\xedU\xbe\x064\x91\xbd\x99\x0b\x00?8\x13\x99=\xa5j\x12=\x94#\xa7\xbe\x0c\xd4\xc8\xbe\x19vp=U\xa9\x15>\x1c:\x9d>s\xeb!=L\x08>\xbe}Na\xbd\xd8/\x9f>4\x97\xb2\xbbR\x04i>\xac\xf5\x92=\n.\x96>Y\x0b9\xbe\x14\x07O>B\x17\x82=\x1d\x08+>\xd4\x84)>n\xe2\xea>\\\xeb\xa9>\x14\xcc\xb7=\x9c/\x88= M\x93=\xc6\x02\xde="
-p869
-tp870
-bsV503978970980048898
-p871
-g2
-(g3
-(I0
-tp872
-g5
-tp873
-Rp874
-(I1
-(I200
-tp875
-g12
-I00
-S'\xc1\xc6N?\x07i\xc7>>\xdaD\xbf\x9e{\\\xbcY\xbf\x12>O\xd9\x8e=\xb6\xd9\xd8\xbdNf\xda\xbe\xc0\xb8n=\x04\x9b\x0e?\x91\xa7\x9b\xbe\xf7\xb1\xc7\xbe\xc1\xfa\x90\xbc\x80\xceb\xbe\x9f\x85t>\x8d\x82*?Np|\xbe\xd5x\xee\xbe\xf8i\xd5\xbe\x84\x10\xa2\xbe\x81\xf0.\xbeV\xbcO\xbd\xba\xf7\xe4>\x04\xcd\xf4>Y\xfcy>\xb2;2\xbe\n\x11\xb4>\xd6l\x03>\xfd\xa4\xef\xbeC\xea\x1c\xbf\xf6\x90\xc2\xbe\xb5\x8e\xa4=\xfco\x0f\xbe\x88\x03e\xbf\xd7\xba\x1e>\xc4>\xe8>f\xae\x06?\x87\xe2\xdb>TL\xf1>\x95as\xbe&m\x10\xbf\r\xc8P\xbe\xa7\xaf\x02\xbe\xec)\xd2\xbb\xf8\xa6\x1c\xbfm\x08W\xbe\x8d\xd9\x0b?r\xfe\x88>\x8c\xa7\x90>~m~?\xa4\xe5\xce\xbd\x80@\x1e?\x84\xba\xb9\xbe\xc4A0>\xf4\x0f+\xbf\x03\xca7=\xcc}\x03>\x04g\xe7\xbc\x9f\xeb_\xbf\xd7}[\xbf\xe3\xfe\x9b>\xb1\x1c\x91?\xb8(D?\xc3\xe3\xae\xbe\x9fI?>+R\x7f<cG\xf7\xbe\x00\xf3]?\xf1\xd0\x19?\x06D\x02\xbf\xab\x9e:\xbfM<c\xbf\r;+\xbfLq\x06\xbem\x8a~\xbe\xcf^\xd0\xbd\x80J\xbe\xbcG\x10\x12>x83?\xe0s\xcf>\xff]\x1d>\x9d\xd6\x0e>3~<?\xe7\x1d\x08\xbf\x13@\xe0=f\x87\xcf<\xf4k\xbc>\xadF\xe2\xbe\x14\xd7@?\t\x90\xd2\xbed\x92\x14\xbf\xd9L\x9d>\x07\xb5\x94\xbeb\xec\x04\xbf]!\xaa>M\xed\xcf\xbcW\xcc\x1a?\x8b\x13\x9d>^km>/\x87\xc0\xbe<\x9f<\xbe&\xac\x8b>\x14\xd8\x80>\x9d\xbc\xf1>U9N?\xe3\xe1\x04\xbfM`D\xbd\x08\xb8U?\xbd%\xd7<\xd7g\xec\xbdQ\x84\x81\xbfQ\x9d\x8b\xbe}\xa55?=\n\xad>\x01n\x8c>\xad\xc9\x13\xbe~%7\xbf\x88\xa65>\x02(*\xbe\xfa\x85D\xbe\x08\xd1K?v\x19\xe3>\xa4>\xdf\xbd\xbdE\x96=\xfcZ_;\xb7\x15\xba>\x86Rc\xbe\xf7d\x97>"\xc2`>\xbdJ\xa2>\xddS[>\xec\xf8z>\xadd\x14=>\xb4\xf2=\x93\xb6\x9f\xbeCI\x86=\xa0f\xb6\xbc\xb71\x03>\x8c\xcc\\\xbf\xd7j[\xbe\xcfv\xf4\xbe\xf3\t\xdc>\\)\xfb>A\xc8=\xbf7\x07??7h\xbe>4\xfc\xd8<B?\xac?*\x91\xaa\xbd\xb2rf;f\xb2\xd4=Z_R\xbe\xf9[\xe0>\xa4\xe5\x8d>\\\x04-\xbeg\x9dF?r\x84\x15\xbf\x1f\xfe\xb3<\x8b\x91\xb3>\xbda@\xbf&\xb1\x00\xbf\xe8\x89\x19\xbf\x9f\xd6w\xbf\xe8\xcc\x10\xbf\xb84t>)7\xc3<\xbd|H\xbf`n\x15?\x1c\xb2\xab>\x91\xdc\xd9\xbdy\xd19\xbd-\xbb\xfd\xbe\xd9\xa0&\xbf\x01\xf7\x1a?\xe6\xee[=\x9c\xe0\xf3>RX\xc3\xbeF\\\x85\xbf\xf5\xb2\xf9>\xd3\xddW>\xa1+\xfb>\xceh\xf7\xbb\xcbM\x0c\xbfM7\xa0\xbe\x99\x8dX?\xf9\x1b@\xbd\x84\x1d\xbf>Y\xb9I>\x9f\x9f\xe5>`mV\xbd\xe4\xd4\xbe>\xe8\x0e\x8a\xbb\t\xcc\xb1>}\xe7Y>\xe7\xcfu?.D\x1e?\xbc:N\xbe\x7f\xad\xba\xbc\x06\xb3\x93>\xb3>\xc0\xbe'
-p876
-tp877
-bsV503957322213773312
-p878
-g2
-(g3
-(I0
-tp879
-g5
-tp880
-Rp881
-(I1
-(I200
-tp882
-g12
-I00
-S'q\xc8\x02?G\xe8D>\xb2\xfc\x01\xbf\x057\x90\xbc\xf74\'>d\xf7\xb4=\xa9~\xd4\xbd\x12k\x81\xbe\x1e\xdb\xd3=\x9e\x94\xf4>}\x8dQ\xbe`|k\xbe\xb7\xc2\x89\xbd\xf2\xbb\xf5\xbdk\xf0\x84=\x87\xbb\xcf>"\x9b\x08\xbe\x96\xbd-\xbe"\x0f\xa0\xbeu\x83~\xbe\xa7\x00\x15\xbe\xf9^Z\xbd\xec\xc1\x8c>/\xe9\x84>\x05\xe7\x13>`\x05\x0c\xbe\xd5e\x93>hD@=\x02\x10\xb2\xbe0\x10\xbc\xbe\xd1\x82-\xbe\xabz\xd0\xbc\xce\xab\x8a\xbd\xf6\x8e\x1b\xbf\x05\xfc\x84=]\xef\xbc>)o\xa8>7\xac\x87>t\x8c\xb8>\xfc\x8f\x02\xbe-\x98\xc4\xbe&\x10\xbf\xbdwTr=\x90\x15&\xbd)\t\x9b\xbe\xcc\xbe/\xbeI$\xf2>\xf5\xbcT>\x8fc^>4\x151?H\xb7\x8d\xbd\x9e\xda\xf8>\xda\xbc\x89\xbe\xd5z\xeb=\xc93\x05\xbf\xfbL\xdb=eg\xad=4f\xa7\xbd\x99o"\xbfs\x89\r\xbf\xa0\xcd\x89>\xe6\xbf/?\xdeF\xdd>\x9b\x05f\xbeZ\xc8\x06>F\xe0\x9a\xbcK\xcc\xf0\xbe<\xa7\x07?\xd2\xd3y>\t\x00\x89\xbe\x84P\x03\xbf\x9aA\x08\xbf4\xa7\x7f\xbe\xfb\x06\xec\xbd\xdc\xedR\xbe\x97\x15\xbc\xbd\xb4ZI=\x9c\xe6\xe4=["\xca>\xc41l>WxY=u\x81?=e\xe8\x0b?B\x14\xa9\xbe3\xfc\xc8=\xe8l\xc3<\x0cGp>\x8cP\xc5\xbe\xa0\xf1\x07?\xd2aB\xbe\xe6\x07\xd0\xbe\xfd\xd5+>\x02+~\xbe\xfeNa\xbegP\xa2>P.4;]"\x9c>\x1fA:>\xe5(T>K\xf1l\xbeLu\x97\xbd\x07-a>\x85\xc9A> \xaa\x8e>;\xbc\xd8>cR\xc4\xbe\xadl\x81\xbc\xd28\x00?rU)=\xd5{d\xbc\x93\x8b&\xbf\xfc\xbcZ\xbe\t\xd1\xf1>y&V>\x98\x0fU>\xb5u=\xbd\xf5:\xfd\xbe\x7f\xee+>\xb3\xebC\xbd\xb5Q\x1b\xbe\xde\x7f\x12?\xab"V>\xf8G\x8c\xbdl5\xac=\xc0\x95\xed\xbc\x04\xa2\x85>lz\x0c\xbe\xe2\xcd\x95=W\x1aO>fr">\x1e,C>d\xba\xaf=\x1e\x90\xe6<\x8a!\xae=\xa1u\x0f\xbeZ\xc0\xa7=fI\x9d<\x1c0\x86=\xcb\xe3\xff\xbeO\xb2\xae\xbcK0\xb0\xbe\xe0\xf9i>K\xbax>\xb3\xc7\x05\xbf}\xf4\xd4>W\xbc*>\xb8\x13\xa9=\xc3\xe6M?X\x94\x00\xbe`j\xa6\xbc\xd9\xe9\t\xbc;\x104\xbe\x87\x1f\x93>\xd6\x01V>\x0e\xa3\xf7\xbdMs\x08?/_\xb7\xbe\xec\xd6\xa2\xbaDr*>$\xbd\xef\xbe\x85\xce\x9d\xbe\x1a\xaa\xce\xbe\x19T\x1f\xbf\x1f\xc3\xa7\xbe\xfbLS>\xed\xb3\xbf9\xa6 \r\xbf,\xdc\xd7>\x11\xdd\x0c>\x8e\x86\x10\xbdL?\x07=Q\xe4^\xbe\xc9{\xa3\xbe\xe5\xf9\xf4>\xb0\xb6]=\xe0\r\x9e>\xa3Z\x94\xbe0P)\xbfw\xc3z>\xebm\xf3=\xfc\x13\xaf>\xb53\x82=4\xb4\xc7\xbew\xaa{\xbe\xb4>\xf7>\x84\xab\x0e\xbd\xcb\x93f>Um\x16>\xac\xba\x9d>\xff\xbd!;\xe8\xeb\x90>\x84\xcfV\xbcV\x96\x8a>\xd7\x17"=\xde %?=\xc7\xbd>\x7f\x87-\xbd-\x8c\xb7:R\xb2I>w\xfc\xf8\xbd'
-p883
-tp884
-bsV503961001784799232
-p885
-g2
-(g3
-(I0
-tp886
-g5
-tp887
-Rp888
-(I1
-(I200
-tp889
-g12
-I00
-S'\x0b\x81\xeb>V\x13\xe8=\x0ej\x0f\xbf\x08|\xd2=\x8e\xba\xa5>\x02\x18\xe7\xbd\xa6\x88\xb8\xbd\xd8\xf8\x91\xbe\xf8rm\xbd&\xc70>\x90\x82\x9f=\xb0?\xc8<\xaap\xf4=\xf5v\xd8=\x88\xcf\xa0\xbd\xebv\xd5>\xb5C0\xbdM\x9f\x16\xbeY\xb9J\xbetY\x87<\xbd?a\xbe\xf1\xaf\xaa<\x90}S>\x86_\x7f\xbe\x7f=\x0b\xbc\xf1\xf4\xc9\xbdx\x10+>"\xa7"\xbeN]o\xbe\x17q\x9d=O\x1f\x08\xbd\xe8\x98\xe7\xbd\xbfg">a\r\x9e\xbe\xfbN\xbb=FA\x9c>lo\x16>^\x1a\x93>\xd3\xd2\xc9>m\x17\xb4\xbchu\x1b\xbe{\xaf\xae\xbc|\x81\x94>J\xe8\x99\xbe\xd25a\xbec\xacf\xbdZO\xeb>\xf3\x91\xe0\xbb\xfaC\xd2=\xbc|\x01?\xf6\x87\x99=Z\x0b\xfc>\xb2.&\xbeS\xbaw=u\x8a\x08\xbf\xe5\xe4;>\xba\xc1\xa7<e-\x18\xbe\xf7\xa9\x0c\xbfc.\xf2\xbec9W>X\xa7j>[!Y=\xb5\xf8|\xbe\xe3\xf5\x14=\xc2t\xf9=\xd8"\x8c\xbe\xfdk\xa3>\x95\x87h\xbe\x0e\xb8\x15\xbes;5\xbfE`\xbb\xbe\xce\xb0\xe9\xbd\x9b\t\x8c\xbd\xe4\xe0\x17\xbe\xa5\x95~>\x85Xe>\xb0o\xf9=\xfajB>#\xa6J>\x16\x0bl\xbdg\xb5\x80\xbc\x05<\x82>"/\xa6\xbe\x95n(>\x9ex >p{\xc5>.\xec\xc5\xbe\xd6\xc0\x13?\xa5cn<c\xa8m\xbeX\xa8v>\xcb\xf3\xd3\xbe\x85$\xe0<\xe75\xb3>\xd7\xb7\x15>\xaa\xf13>\x97V\x93>#\x10\xf1=\x0b\xaa\r\xbe\x84o">\x8e\x16\xc5>`\x18\xdd=\xb4\xad:>2\xc1\x05?^|\x8d\xbe\x84\x06\x06<\xc6\xe1B>]\xecy=\xfcs\x9d=\x9f\x99\x83\xbe\x93;\x81>c(\xc9>M\xdaM>\x89\x9d\x12=rQ~\xbd\xcd(\xe1\xber\xf3\xb3>\x95\x97\x01=n_\x01>B\xf9\x19?\x8d\x84\xe5=\x9a\xcb\xfc\xbd$\xdd:=;\xa6\xd5<\xddf~>\nBa\xbe.\xd2p=(_C=>\x01^=L\x9d\x0e>\xea\xedb>\xced\xa8=\x024\xe0<\x1e\x95\x82=&\xfc\x93<\x94\xaf\x15\xbc\xbb\xfc4\xbb\xdf\xf8G\xbd#\xda\xe5<\x93\x84Y\xbe\xdde\xaa>\x87m\xc4<5f\xe3\xbe-;\xaf>\xee\x8f8\xbd\x14\xc5\x18>\xaac\xe3>\xc4\x03%\xbe\x04\x9f\x1b<!\xa9E>\xc6\r\xd5\xbd\xbd\x10\x97>\xe3\xe6g>\xee\x84\xdd<]\xff\xdd>\xd6 \xed\xbd>\xbf\xf2=b&I>\xdbe\x9b\xbes,\xb0=n,\xb3\xbe>\xc2\xc5\xbes\'=\xbe\xc6\xb5 =n\xc2\xfa\xbd\xbe\x03\xd8\xbe]}\xd3>\xca\x9fT=\xe3\x11\xd3\xbd\xee\xac\x81<\xca\xfe3\xbe\xfc\x1e\xb3\xbdc\xd0\r?!B\x82<e,\xef=xP\xaa\xbe\xbfC\x03\xbf\xf2\xaf\xc3=\xcb\xb6H>\x02r\xab>:\x90\x07\xbd\xabq0\xbe\x87\xcd\x0b\xbd\xcdQ\xbd>\x1b\x01\xea\xbc\'\xe4\x81>\xf1\xa3\xb3<\xfei\x9a>\x06\xb76\xbe\xb3\x83\x99>\xa4%\xaa=\x82KG>9\xc6\x8d>\xce4\t?g\xe7\xb7>b\xe1W=\x00\xb2\xd9=p\xebo=VB\xf9='
-p890
-tp891
-bsV503970622100107265
-p892
-g2
-(g3
-(I0
-tp893
-g5
-tp894
-Rp895
-(I1
-(I200
-tp896
-g12
-I00
-S'b"\xbc>0)\n>\xa6\x82\xac\xbe\x19\xa4\xe8\xbd\x90\xec\xcf=;\x9as<yx\x9d\xbb\xf1\xc5\x10\xbe<X\xd7\xbb\xb3<+>O+\x0e\xbd\xab\xeb\xc1\xbd\'\x8a\x00>]\x05\x98\xbd3\x00\xe3;V\x1aj>\x10\x0er\xbd%\x15\x03\xbe\x02\x7f\x18\xbe\xebz]\xbc\x97\xaa\x19\xbe\x0bsU=\x00\xed=>\xf6\xa2\xc6=S\xd6F=\x05\x03\xcb\xbdo\\\x9d=\x8e\xb2p\xbcB\x91#\xbe\xfe\xa9\x0e\xbe\xe3m\x0c=\x8c\x1e\x12\xbc\x89\xac\xf4\xbc\xb6ve\xbe\xa6m\xc0<\xd7q\xfe=\x91\x8e\x1b>\x16q\x13>Q\xdc)>\xfd?\xb7\xbc\x9d\x8f\xbf\xbd\xaf\xef\xd4\xbc\x96\xf1\n\xbd\x9dY\x10\xbevl\xca\xbd\xd9\xb3\x8a\xbdb?\x8f>V\xa4\x12\xbd\xdb\xb4\x12=\xdb\xd3\xba>\x1c\xbc\xd2\xbcJ\x0f\x8c>\xa004\xbei\xb5\x82=\x9c?H\xbe,\xec\xa8=\xdbq\x07>\xde\x86\xac<\xccE\x9c\xbe\xf3"\x86\xbe\xb3\x90G>\xa9\n\xb2>\x1fR\xb8=O\x88\xa6\xbd\xafMj\xbc\xdd\x82\x96=\'\x83%\xbe\x90\xd2\x9e>\xcb6\xb3\xbc]\xe2\xfc\xbdf\xf5\x8b\xbe:\x13\x81\xbe\xa5V3\xbe\xc7[\xee\xbc\x8eg"\xbe\x1f\xacw\xbdD>\xf4\xbc\xa0\x98\xb3=\'\x91\x02>\xa2\xd0\xb5=P4-<\t\xad\x9a\xbb\xdb\x8d~>\x10\xd5\r\xbe\xe9\xee\xae=f\xe2\x17>|\xda\t>\xf1\xd9\x14\xbe\x14q\x8c>\xfc\x0f\xcb\xbd\x14\x80\x86\xbe\xa7U\xe4=\xc6\xa0e\xbe\x80\x9d\xa6\xbd\x89\xc3\xf5=;\xf1\x8d=\xed\x9d\x14>z\x8e\x18>\xda/k<\x85G\xe9\xbd\xda}}\xbd\'Y\xec=\x91h\x06>\xb6-\xec=3\'E>\x195\x16\xbe\x86Ts=\xfdW\x91>\xa4\xf1\x86\xbc\x0c\xe4\xa8\xbc\xf5 \xa2\xbe\xbc\xb5h<e\\\\>\x9e\xab|=\xcdQC=b\x9e\x01\xbe\xb1\xc9k\xbeE$\xf6=\tCi\xbdjd)=k\x1b\x99>\xda\x81\xf6=<;\xb4\xbdsH\xf1=\x1e\xb2\xf1;\x80\xab >\x97\xfc\xbb\xbdY-\xb3=\xbc\x02\xc2\xbc\x86]\n\xbdV\xeb\xeb=\x1c&\x06>\xd2\x89\x04\xbd\x95\xf6\xa6<\xadk$\xbd\xff\xd9\x9a=\xd7\xab\r\xbd\xba\xe8\x15\xbd\n\x19Q\xbe\xe5\xb9u<o\xe0\x15\xbe\x8f$\x8c=^)\xb4=*\x15\x8f\xbe\x1b\xa1\x84>=\x08\xb0=\xe9\xf5\xab=TX\xbe>\xa3\xbb\xb2\xbdOr4\xbdO\x80\xde<N>\x85\xbd\xa3\x99_>\xfc\x14\xec=\xff\x99\xbd\xbc\x8c\xf1m>\x80\x13\xca\xbd6\xda:<=\x98\x87=\x9a\xe7l\xbe\xf2\t\xf9\xbdT\x81\x9d\xbd\xa7\x0bI\xbei\x13`\xbe\xf5G\xdf= \xea\xd7\xbd\xd9.\x96\xbe\x10\x9d)>\x9c\xe3\x0c>n\x04\xa8;\xc4\xa2\x12=v\xa2\xdc\xbd\xcd\xbe$\xbe\x9dh\xa8>p\x9d\x11=\x10\xb3\xb9=BNO\xbe\xfa\xd5\xcb\xbeI-`=0\xfe\x14>qum>\xc0\xd8\xbb\xbd\r@\x17\xbe\x97^@\xbe]*V>1\xfex\xbd=a9>\xa2\xfaN<!63>b\xbd\x18=*\\\xb2=S\xe3\x9c\xbc\x07\xbf+>D\xa3\xcc=\x95\x19\xb6>\xbd\x07v>\x13\x1d\xc9\xbd\xe9\xa7\x81<[y\x82=^\x1e\x16='
-p897
-tp898
-bsV503964921676054528
-p899
-g2
-(g3
-(I0
-tp900
-g5
-tp901
-Rp902
-(I1
-(I200
-tp903
-g12
-I00
-S'\x87a\x8a>7\xc9\xa5\xbb"P\xa3\xbe\xa7,\x1e<\xb7*%>\xa4T\xe2\xbc\x91\x1aL\xbd\xdf\xfe5\xbe@c\xe3\xbb$%A>I\xc1u<{$\xeb<\xe0;\xc1=\xf6\\\x0c<|\xc1"\xbd\x87\xc7o>\x87\x14\x92\xbd\x90w\x8d\xbdc\xe4\xf3\xbd\xbb\x16\xa5\xbc\x1c\xbe1\xbe\x89\xb2[\xbcH\x84\xed=\xd0\x04\xf4\xbd\xcal\x06\xbd\x9b\x86\x80\xbd\xb40">(z\x12\xbelhA\xbe\xe5\xe4\'=\xd7\x87\x15<\xf7#\xcc\xbd\xbe(\xa9=P\xd1x\xbe\xb0\x06\xd3<l\xbcy>\x02\xeb >\xbb\xa3\xe9=\xcds\x86>\x81\x1e\xb9<\x04\x80\xdd\xbd\x1f\x1d+\xbd\xcf\x8c(>[\x8d/\xbe\x89I\t\xbe\xdb\xaa\x02\xbdH\x00\xa7>\x82\xf3\x15=_\xf7j=k\xd6\xa5>X\xaa\xf4</\xd0\xa7>\xb8%\x10\xbe\x0b#\x1d<\x94\x97\xb5\xbe\xe9M)>\xfc\xcb\x96;\xb8\xb1\xad\xbd\x81\xb3\xc3\xbeFA\xa7\xbe\x10\x833>\x80\xb64>\x14 2=\x05\xf36\xbe$\x95\xad\xbb\x92\xee\x14>\x19\xf7E\xbe\xc9Vf>\xddK\r\xbeW\x04\xbf\xbd\xb1\xc6\xc5\xbe\xf9?\x8a\xbe\x91S>\xbd\xc5\x04\xbb\xbd\xa5\x83\xa5\xbdc\xeb\x11>G\x80">v\x10\xa8=G\x0e\x03>s\xc5\x07>\xa8\xa4\xe0\xbch\x04\\<=\xe5u>\xff\xaa[\xbeq\xf2\xdc=\x81\xbe/=g!Z>\x89\xd1\x83\xbe\xb9\x83\xc6>k\x914=\x7f\xd5,\xben\xa8\x14>e`@\xbe\xbc\xde\xb1<\x8f:\x93>\xf3,\xbd\xbci\xd8\x11>3\xf2.>=F\x0b>\x0e\xa6\xa0\xbd\x8c{\x1a=\xe9*S>1\x1f\xbf=W\xaa\xf2=\x13j\xa4>\x97eG\xbe\x0f\x92\xa8<\x83\x19\xc5=c\xea\x94<E\x19\xe7\xbc\xa16,\xbe\x19\x1f\xe9=\xf5Q#>y\xb4\x1a>\xcd!f=1i\xa0:9\xbdz\xbe\xf8]A>\xcf\x92\xd0<S\x11$=|\xe1\xca>\xbd\x87\xd1=\xa0\xcb\xce\xbc\xf7\x13Z\xbc\x0f\xd3\xc4\xbb\xfdcd>\xd0H\xab\xbd\x7f\xdd><\xa5g\x03=W\x15I=\xf34\xa4=T\xdc\xa1=YuL=_\xe5\xc4:c\xa9\xe7;\x95\xff\xb3=\xc1\xd9g\xbc+\xd2\x0c=\x00u|\xbd\x1d\x0e!=y\xab\n\xbe\xab\xb8\x80>\xb4\xe5\xeb<\xa9\xa1\x8b\xbe(\xa1M>s\xda\xab\xbc\x86?\x05>\x81\xdb\x8d>?!\xff\xbd\xfbcH\xbbp\xd4\x94\xbc?g\xf2\xbd\x0c\xa8">\x0b\x01\x1c>%\x0b\r\xbc\xdaG\x8d>\xd8\xa9\xc1\xbd\xb9\x1b\x90=\xff$\x88=\xef\x8an\xbe+%\x9b<\xd1\x80/\xbe\t\xca\x99\xbe0t\x01\xbe\x9f\xd3\x15;H]w\xbd\x11?\xa3\xbee\xf6\x86>$<\xe2\xbc\xf5%\x90\xbd)\xfe\x93<-\xae\t\xbe\x05\xbc\x8a\xbdO \xca>\xc7\x8ao=\x180\x1f=hDc\xbe\xc1m\x94\xbe}\xb5W=\x97\xa9\xec=\xb5\xff]><\xec\xd7<N\x8f\x12\xbe\xb3\x85\x9d\xbd\x94of>Ml\x86\xbct\xee7>)\xdd==\xd5\xf4X>\x04\x02\xfc\xbd7\xb9\x02>\x13\xd5k=\x87\x07\x13>\x90S\xe2=\xf5\n\xad>y\xe8\x8b>\x84wL=\xf3\xc7:=#E/=\x04J\xa0='
-p904
-tp905
-bsV504268525125795841
-p906
-g2
-(g3
-(I0
-tp907
-g5
-tp908
-Rp909
-(I1
-(I200
-tp910
-g12
-I00
-S'N\xb5p>\xa2\xd1\xc2<\x02\x8d\xb7\xbe\xf2a\xaa=\xce/\x00>\x86p\x18\xbd\x00\x0e\x93\xbdvJ3\xbe\xba\x87\x8c=0!\x01>\x96m\x87\xbd\x989\xd3\xbc\xcd\x964=*\xad\xda\xbcb\xcc\xf7=i\x91\x96>\xce\xb9\x87\xbd\x17\xc7\x85\xbdr\xdf!\xbe\xfc\t\xab\xbd\xa2\x98\xb3\xbd\xf7\xa3\xc3\xbd1 G>\x8c}\x94<\x11\xc8\xaa<K\x05\x93\xbd\xa7\xea\x19>_\x17:\xbd\x14\xb6\x18\xbe\x00z\xaa\xbd\xd6\xb2\xfe\xbd\x97\x8e\x17\xbd\xd3\xe1\x0f;V\x1d\xb6\xbe\xae\xd0\xb8<j\xa7\\>\xe3\x9b+>\xe2\x02%>\xfaSj>%\x8d\x9e\xbd\x0b\xe0^\xbe\xd8J`\xbd\xbaI\\\xbd\x8e\x7f\x8c\xbc"5\x88\xbec^\xdd\xbd\xce]\xa2>wQ\xbc=\x89\x90\x03>w\x85\xaa>h-\x1b<Np\x99>\x9a\xec\xc7\xbd\xca\x1ft=\r\xa5u\xbe\x94\x19\x13>}\xcab;\x10\xbb\xf6\xbd\x14T\x8b\xbemb\xbc\xbe\xc6\xd4\xcf=\xc6\n\x97>u\xedL>\x15\x8f@\xbe~\xb2\xf2=\xaa\xc3\x84=\xe5)x\xbez\xc7t>\xa4\xd0\xab=\xda\xf7\x18\xbe\x14.\xc4\xbe\xb5\xcd\xc2\xbe\xa5\xa4g\xbej\xd7O\xbd\x83?\xbf\xbd\xb0&S=u\xb1\xcd=\x0c\xb1\x85=V@\x8b>\xdd\xb6G>\xfc\x9a\xc4<\xcb\x00\x01>\xa2`\x87>\xca\xe7[\xbe\xafK\x85=\xb0@&=N\xb1L>\xb1\x07\x89\xbe\xa2;\xd3>Vh\xdf\xbd\x87\x8a\x9b\xbe\xc8/8>\xd4\xa26\xbe\xbc\x07\xaf\xbdZ\x82Q>\x96\x90L\xbd\x13\xc5\x81>\x18\x14\xf1=\x7f\xeb\x1e>\xe2#\x00\xbeprB\xbc5t4>\xfb\xa6\x02>U\xc1\x86>{\xf6\xbb>\x8e\x9aF\xbee\xd8\xab\xbc\xc0\x00p>\xbb\x11&=@Z\x8b\xbd?\x87\x81\xbe\x8a\xa1\x80\xbdJ\xfbg>8{\x11>\x12\xc2\xa7=B}\t\xbd~\x17\x9f\xbe\xf8}\x9e=]s\x8d\xbdB\xde\xaa\xbd\r_\xd2>\xa0mN>GbD\xbcu1\n\xbc\xcd\xa9b<\xf4tL>\x14-\x8c\xbd\xd3\x81\xf1<\xf2\x83\xa4=\xfe\x85->\x90w\xf3=\xa7n\x16>b\xce>=\xd8\xd1{=V0\xad\xbd\x06\x05,>\x1a\xe9\x01<\xd8\x9d\x98=\xef\x90\x9f\xbe*\x12Y\xbd\xb8\'\x80\xbe \xe2\x91>\xb3\x8a\xe4=\xa5\x1a\xad\xbe9\xf7\x1e>\xe3\x94M\xbd\xc0x\xf2<\xfa\xbf\xde>\xca\xfb\xe4\xbd\x9c\xa0\x81\xbbj\x83\xab<\xbesI\xbd!\xc9\x17>\xea\x8c\x05>\xe3\x80\x0f\xbdu\xa0\xc5>\xc3\x04^\xbe\xa0\xaaU\xbb\xca\xfe\x0b>\x99l\x8f\xbe\xb4\x13\xaa\xbd5pa\xbeZ\x05\xd2\xbe\xfc\xe6\x0b\xbe\x15q\x19<\xef\'\x91<|\x95\xae\xbe\x9d\xb5\xa3>\xd0e\xb0<M~\xa8\xbd\x18\x1a\x16<5\xcbj\xbe>\xd8U\xbe\xfa\x1b\x8a>HK\xe0<\xe6\x1d\xe4=\xe6\xdb\x1b\xbes=\xaa\xbejut>>\xa5\xfe=\xfe\x95\x92>\xc4\xc7\xb4<6N\'\xbe\x8e\xa1 \xbd\xe5\xe2\x92>\xb3\x00\xef<2L\x91>\x00\x0c\xe0=\xb3\xf0h>\xaa\xbd\xab\xbd\xd6\x88L>\xab\xdfR=\xfe\xf0,>\xb6\xfbQ=\xe6\xa0\xc7>\x1e\x0ev>@\xcew<\xa2\xd8\xb3<\xea\xd1\x93=\x04\xff\x1b\xbe'
-p911
-tp912
-bsV503963799050006528
-p913
-g2
-(g3
-(I0
-tp914
-g5
-tp915
-Rp916
-(I1
-(I200
-tp917
-g12
-I00
-S'L\x8c\xaa>\x97e\xcb<f\xe6\x88\xbeS\x18\x97\xbd\x02\xc7\x1e>\xb1o\x07=\xa6p\x1b\xbdO\x035\xbe\xf1:\xef<y9\x88>U\xc3\xf8\xbc\xb5\x85B\xbd^\xd0\xa3=\xa1\n\r\xbd\xcbs\x96\xbd\xfe\x08\x86>\xbfc\xbd\xbd\x1c1\xaa\xbd\xb9.,\xbe\x8d\x1a\xaa\xbd\xf5\x05\x17\xbeT\xb4\x1d=s\xa4\xc1=\xd4X\x9f<\xe3o\xb5;x\xd1\xb3\xbdux\x16>\xd2\x9c\xe2\xbdt\xb0o\xbe\xc0\x0b\xd5\xbd\xe2\xcb\x17\xbd2\xdb\x9b\xbc\xab*\xfd6\xa6A\x95\xbe\xf2\x08O<\x15-f>\xe5Qb>C\xdc\xe5=\xbb\x1eZ>\xc7\xe8\x83<\x00\xe1\xec\xbd\xb5;x\xbd\x89\n\xc9=Ba\x14\xbe\x08\xc9\xfd\xbd\x8cn*\xbd\xcb\xdc\x9d>8 \xbf<\x15gw=wJ\xc8>\xe6\x81[<\xdex\xa7>\xcb\xa5M\xbe]\xd0u=\xfa6\xac\xbe\xcej\x10>\xab\xfe\x90=\xa5\x94j\xbd:\x87\xbd\xbe\xa2\x14\xb0\xbe\xf2\xb6U>/\xad\x94>\xeei\xec=\x8b\xb0\xc4\xbd\xdb\xaf\x16<\xa5\x94\xe4=CuM\xbev\x93\x98>\xe5t\x07\xbd\xd3`3\xbe\x85l\x85\xbe\x059p\xbe.wz\xbd\x06\xed\xd9\xbd&)\xd2\xbd\xba\xda(=@\xe7\xcd=\xf5g\xbc=ib\xdb=m\xb7\x0e>\x98\xc2\xda:\xf4\x89\x96\xbc\xde\xd7\x97>\xd0r:\xbe\x10\xe7\x9e=\x0cH\xb7<\xb3_\x0f>}\x83h\xbe\x07K\xb7>D\xb9\x9d<\xc3QM\xbe_\xdd\xb4=\x8f\xd8+\xbe\x0b\xd9I\xbd\xafw\x98>\xd8\xbd\x86\xbc\xbeY\x1d>p\x11)>\x10\xe0\x0f>\x8b\xf3\x89\xbd\xc8\xecC\xbdB\xdb\x1c>\xbef\xee=\xc5=\xe5=n\x02y>w\x00<\xbe\xcbx\x92=*h5>\x95l\xc9<\xf2A\x0f\xbd08\x87\xbeL\x13\xb3<\xc5\xa4\x07>@\xb1\xaa=\x02\xb7\x8d=\xe0\xfe\x97<\x1b/\x8a\xbe\xddy<>P\xff\x86<\x89\xcb\xa9:\x8b\x1f\xa6>K\x05\xf1=\xef\xaa\x99\xbce\x91!9\x15#8\xbc~Cm>57\x9b\xbd\xaf\xf9\x01=w\x9a\xe1<z\xf2\x84\xbc\x9d_t=\x11\x10u=Q\x81S=\x9a\xb52\xbb\xee\x12&<.u\xb4=V\xc1\x9e\xbc\xf7\x18\xda<bt\t\xbes{\x00<\xdd\xe5\x07\xbe\xa1W3>\x92\x89\xb1=L\x89\x80\xbe\xb4j\x86>M\x0e\xc1=\xde\xd1\n>#\xac\xb3>7\x9e\xe6\xbd\x05\xea\xd9<)\x97\x9f\xbd.\xc2\x05\xbe<M:>L\x95\x0e>\x0c(\x19\xba\xa5D{>H>\x08\xbe\xec$\xa6=\xc2\x89\xa2=H$\x7f\xbe5\xa3\xb3\xbd\xfd\xad\xdf\xbd\xa6\x93\xa0\xbe\xab\xcd6\xbe\xcb!u=\xc0\xabd\xbdR_\xc0\xbe\x1bDS>\x1c\x8e\xa8\xbc\x8b3\x18\xbdi\x10S=\xc3\x8a\xf9\xbd\xb54\xae\xbd\xbe\x03\xca>\xb0w\xbd=\x97\xd2\xcd=\x82*P\xbe\xf5\xb8\xa6\xbe\xdaz1=\xb7\xd1\xda=\x03)t>1\xa1\x1f=8\xecK\xbe+T\n\xbe\n\xc4\x81>\xb8F(\xbdE\xa8\x16>\xa6\xbe\xc5=[\xab\x0e>\xd5\xf4@;\xa2\x1e\xf5=\xa3\xed\xc7<\x9b\xf8\x08>\xabX0=\xf7\x89\xbc>\xd4`{>\xfa\x06v<\xddY\x8c<\xde\xdd\xc1=\xa7w\x9a='
-p918
-tp919
-bsV503959327028174848
-p920
-g2
-(g3
-(I0
-tp921
-g5
-tp922
-Rp923
-(I1
-(I200
-tp924
-g12
-I00
-S"\xbar\xa0>\xa2\x92q<\xfe\x88\xb0\xbeKv\xa5<\xb5\xb7M>\xdd4\x81\xbd\x13\xec\x15\xbd\xcd\xf9a\xbe\xe2\x0f\x98\xbdPI+>\xc0\x1a.=\x82\xbf\x9d<\xdeD\x1e>\xa8\xa5\x81=\xd5U\xb9\xbd\xc32\x8c>5&\x88\xbd\xf7]\xa1\xbdrO\xee\xbd\xb2\x8dr<\xd7\x93G\xbe\xbd\x98\r\xbbML\xef=CVO\xbe=n\x03\xbd\x9aR\x82\xbd\xb3\x03#>\xfe\x807\xbe!Md\xbeP%\xde=9\xf6\xea\xbcg\xbf\xed\xbd\\\xfb\x0c>I\xbew\xbe\xf3\xac\xf6<m\xc2\x82>V\x11\x0f>x:\x05>5\x82\x96>)T\x80=o\x1ck\xbdkx@\xbd7\x00Y>\x8bn\x85\xbe.F\x05\xbe\x07\xe3\xbe\xbc\x0e\xce\xa8>\xcb\x0c\x01=\t\xfd?=\xcdP\xae>\xc6Y\xd5<+\xdb\xbc>\xf9\n\x0c\xbe\xe2(\x89;z\xd9\xcb\xbe\x1e\x0b'>\xb7!?\xbb\xfa\x86\x9e\xbd\x1a\x13\xe5\xbe)\x7f\xb8\xbe\xae\xd1;>\xcdb\xf4=\x18o\xb3< \x95I\xbe\x9e}7\xbd\x8b\x1cC>H\xee,\xbe\x12h=>\x17\x9f>\xbe\xa5\xec\xeb\xbd\x02+\xf4\xbe\xb8\xfe\x8c\xbe\x89\xe9\x13\xbdwb\xd7\xbd\xd7\xda\xa2\xbd\x99#C>O\x96=>\x88\x87\xed=\xd5\xa8\x0c>1.%>^\xb1d\xbd\xd9]\x90\xbcK\xe1\x84>\xdf^t\xbe\x02\x05\n>\x0fz\x91=\x9fo\x84>\x12u\x92\xbe\x9f\t\xdd>2\t\x1f=\xc5\xdb\x13\xbe\x13\xd9\x14>\x0ecx\xbe\x11C\xb2<`5\x97>\xdb\n\x1d=Y\xbf\x19>\x13-_>\xcf@\xce=K\xe2\x9a\xbd\xa1\xc2\xa5=\x1e\xac\x8a>\xca\x1d\xe2=\xb3H\xed=\x8d\xcc\xc6>\xdbd>\xbe\x11\x88~<n\xd0\x9c=\xd2+\x17=%\x91\x81\xbb\x8c\x9f\x00\xbe1\xa4^>\xb3\xcf5>\x8e\xc7+>\x97\xf3\xd3<\xdb\xb4\x00\xb9)\xa1\x85\xbeO\x0c\x86>\xce+:=\xe1G\xb3=w\xa1\xe3>u\x8a\xc6=\xc7\xd6\x11\xbd\xdd\xbd\x80\xbc\x06\xfa\x17\xbd\xb9\xc5c>#\xd4\xf2\xbd\x1e\xcf\xb7<e\t\x10=\x98\xde\xa0=\x88\x9f&=(\xe6\xb6=\x99j\x92=\xb7\xd5\x01<R\xe75=-\xeaJ=\x03|N\xbdS9\x88\xbbR\xe9l;\xcbes=+\xbd\x10\xbewu\x92>1\x15\xb1<\x9fL\x8f\xbe\xa85{>;\xdb\xf0\xbc\xb2T\x17>\xd1?\x89>\x8dy\xfa\xbd\x05\x0b\x83\xbcI\xcd\xc3;N\x88\xff\xbd\x0f\x97n>\xa3\xa2Q>{\xbeW<f\x03\x98>\x07\xd1\x85\xbd6\xda\xdf=\xdd\xe7\x98=\xae:t\xbe>w\x80=J\x80a\xben\xdb\xa5\xbe=\xac\r\xbeK\nZ\xbc\x17%\x9e\xbd^\xf8\xaf\xbeO/\x81>\x89\x86H\xbc\xe7L\xa0\xbdP\x9b/\xbb\x19\xbf<\xbe\x91\xd2\x15\xbdr5\xd7>\xf0\x94o=-v\xc3<\xda\xb2\x97\xbezP\xab\xbe\x02\x88c<K\xc9\x03>u\nz>\xb2\xe0\xbe;\x10\x8d\x13\xbe\xa1\xc7\\\xbd\xf7\xd5~>\x83]\xa4\xba9\xb8$>G\xda==o}\x80>\xea|0\xbe>\x191>\xf2\xb8F=\x03\xa5\x0b>`.I>\xde\n\xbd>\xab\xec\x97>\xaav\x83=_\x90\xa9=0\xa3`=\x96\x9b\n>"
-p925
-tp926
-bsV503963038836224000
-p927
-g2
-(g3
-(I0
-tp928
-g5
-tp929
-Rp930
-(I1
-(I200
-tp931
-g12
-I00
-S'\xa7\xb8V>\x81!\x84\xbc\xb5/z\xbe\x1dy\x06<\xe1}\x1b>A\xceV\xbd\x15\xd7\xd5\xbc+\x88\x17\xbe/4\x13\xbd-\xa8\xd6=\xa2>\x9a<A\x17{<\x94\x86\xba=@=\xb9<\x97\no\xbd\r\x7fP>\xa0O\x03\xbdU\xac\x13\xbd\x9f\xc0\xc8\xbdm"\xe2;\x8f\xf6\x16\xbe\xbd_\xf4\xbb\xfa\x0c\x9a=&\xc0\r\xbeP<\xec\xbc\xe5MU\xbd\x84\x07\xf7=\xe7\xed\x03\xbel\xff \xbe?\xd2P=\xe5\x86\xa0\xbc\x85\x19\x81\xbdgs\xa2=\t\xb79\xbe\x8b\xad\xc9<\xdbj/>\xbf1\xe0=\xf40\xc8=;\xe6G>\xd3\xee\xba<:\xec\x91\xbd\x94\xe5\xe8\xbc\xdcs\x00>up$\xbe;1\xca\xbd\xd4(\xf9\xbc\xdd\xcc^>\xcd\x13\xa5<\xdc~C=e\x15k>\x8da\xa5<\xb3\xca\x84>\x88\xc4\xd4\xbd\xac8?<\xfd\xf6\x80\xbeu\xbb\xf5=`\r4<\xeb\x13\x97\xbd\xdf\xde\x90\xbe\x03\xf6\x7f\xbe\'T\xf6=\xfc\xbc\xd7=\xf66\xa3<\xe6\x00\x03\xbe\x90i\xa0:S\x0e\xf6=\xedu\xe4\xbdk\xc9\x10>\x95t\x04\xbe;K\xbf\xbdd\xea\x9f\xbe\x19\xfe=\xbeP\x90\x18\xbd\x17\xa3\x86\xbd,P\x84\xbd\xfb\x85\xee=W\xf9\x14>$j\x98=\xf3`\xc7=\x0b\x9e\x05>\x9f\x9d\x06\xbd\xdb_\xba;\xb7\xff\x1d>A\xef\x1f\xbe\xc6\xe0\x90=\xbb\xba#=;O">\xf3rM\xbe\x89\x1b\xa2>\xeb+\xa6<\\\x98\xf5\xbdS\xd0\xe1=e\x90"\xbe\xdb\xa9e;\x89\xbda>S\x9f\xfa<m|\x01>\x83\xae\x08>G\x8b\xa6=\x81\x8dj\xbd\xbb\xeeE=\x83o;>\xf1Q\x9c=\x85\x01\xd0=\xcfo\x82>D\x01\x11\xbe\xff\x05\xf6;\xe5+\x82=\x0e\xdb\x0c=[{ <HH\xba\xbd\xc0\'\xf8=\xcf0\xce=\xb9R\xd4=}\xea\x16<\x08w\xca<T\xebL\xbe)C(>\x0b\xd8\xd8<\x0ct6=q_\x9a> H\x92=\xf5\xdeA\xbc\xd0n\x08;\xd5,\xf3\xba\x19y4>k\x12\xda\xbdU\xd5$<\xc3\xf1\x7f<7\x95|=\x05\xaf\xc1<\x9d\xa2\x86=+\x19\x99=y\xb0\xa1;\x99\x81\x05=\xa0bz=]{\xca\xbc\x9c\xc1\xad<\xcd\xf1\xb3\xbc)&\xe4<c\x1b\xe4\xbd\xb3\x03U>\xb86\x1b<\xc1\x07Q\xbe!\xa5\'>\xf5\x89\xe2\xbc\xfb8\xcf=\x94\xfe_>\x9cL\xba\xbd+\xf3\x1c;x\xc1\xbf\xba(\xdb\xa7\xbd\xbb\x13\r>\xf8\x8a\xf1=He\x99<\x10\x16X>~\x1f\x86\xbd5\\\xa2=\xb3>d=\x10\x82$\xbe\xc54$=\x7fy\x05\xbe3\x9dk\xbe\xaf\x06\xd3\xbd\x00p\xb9\xb6\x85\xbdS\xbd^\xe3\x81\xbe\xd4\x01<>\xb3\xe2y\xbc\xcbhU\xbd\xbd\x8c\x8e<\xa2\xf7\x02\xbeH\r\x1a\xbd\x0b\x05\x90>(\x88D=8\xe7\xb9<e^6\xbeMJg\xbe\xacp\x12=M\xc6\xd3=\xab\x826>k\xe8y<\xfd\x83\xe2\xbd!\x14\x96\xbc\xab\x9eH>K"\x81\xbc1J\x1a> . =W8!>\x1bp\xd0\xbd\xfcp\xf2=\x9f\xa3\x0e=\xa2\x1a\xa3=m1\xcd=\xc4\rx>\x943C>?\xfcM=\x04\xd4\n=\x0b\x84\xf4<\xa3\x8ee='
-p932
-tp933
-bsV504228332041293824
-p934
-g2
-(g3
-(I0
-tp935
-g5
-tp936
-Rp937
-(I1
-(I200
-tp938
-g12
-I00
-S'\xe0I\x8c>D\xeev\xbda\xde\xdc\xbe^?\xa2<\x1b\xba~>+\x00\xb8\xbd<\xa3\x10\xbdy\xcf\x83\xbea\xff\x9d\xbd\xe2b@>r\xf3U=\xa0Z\x84=\xd6\xf21>\xb4)>=\xfc\xb4\x11\xbe\x08\x84\x8a>\x86G\x94\xbdn\xe2A\xbd}\xfe\x07\xbe\x8e"P=\xf1+\x8e\xbe\x12\xa3\xbb\xbc\x9df\x92=Y`\x9a\xbeD`\x9b\xbd\xab\xdb\xb1\xbd\x1b\x97\x85>\xf1bt\xbe\xfd\xe0\x90\xbe\xf1\xe0)>\xd2\xc0\x0b\xbc\xab\xa7\x0c\xbe\r\x81\x13>\xda\xde\x98\xbe\xc1s\xb4\xbch\x0f\xae>a\\\x0b>\x9a\x05\x0f>\xe5h\xbb>x\xd7\x8c=\xe9|\xc6\xbd\xb3\xc8O\xbc\x1f\xe6\x8f>\x0b\xd4\x9e\xbe\x9e\x0f+\xbek\xf9R\xbd\xef\xb9\xc5>\xc8S?=O?\x8a=\xb7;\xc2>p\x7f\xb3=\xf8\x11\xdb>\x83\xaf\'\xbe(\xa6\xd4\xb8\xad\x12\xed\xbe\x93\x15\x83>Z\x8d\x8c\xbc!8&\xbe\xdf\xd2\xee\xbeh\x18\xd8\xbe\x15ms>\xd6W\xbf=ND\x0c\xbd\x96&\x81\xbeQ\x86\x15<X~\x82>\x9dqe\xbe\x98\x8d+>\xc6s\xa5\xbe\rh\xae\xbdr\xd2\x0c\xbf\xc1\xe8\xa4\xbe17P=j\x86\xf8\xbd\x8f\x85\xef\xbd\'\xc5\x82>\xb6\xa1\xab>\xbe \xea=\x8c<\x12>\xa4\xa8P>\x19\x0e\x93\xbd0*\x0b=\x9dV\x97>\xa2=\x84\xbe\xb51\x08>l\xdb\x89=\x9b\xde\x82>\xccu\xc6\xbe#\xbb\x05?`\xb5\xd9=\xd2\xd1;\xbe34O>\xb6B\x7f\xbe\xf8\n\x84=\xc8\x97\xc4>\xcc\xee\x05<R\x99\x1a>^\x92m>\x87\x0b=>o\x1b\x07\xbd\xb7\x0c\x03>\xfa\xbb\xad>\x0b1\xd7=\xa4\xc8(>\xd8\x11\xd3>\x9e\'\x8e\xbeR\xb3C<e3\x03=\x15\x14\x98=\xc4\x19\x82\xbbm\xd6}\xbdO\x97z>-\x18\x10>\xe6\xeba>h\xcd\xfc<\xe3\x1c*=\x8e\xd6\xac\xbe\xaal\xac>\xdcn\xaf<\xae\xfa\xd5=\xea\x83\x0c?1\xfa\x92=\x13_\xf4\xbcy\xb2w\xbd\x9bD\x06\xbd\x98I\x98>\x03L\x17\xbe\xbe\x01^\xbd\xe8\xf9L=<\xa4\x98=}bX=lO\xd2=\x08\x16\xf6=\x05\xd8A<\x0b\xf4i=\xcb\xf2\x1b>v\x89\x83\xbdd\xc7\x86<\x84\x1a\x8f=\xca\x84\x02>\x00\xef.\xbe\xa5[\xd2>\x82}u\xbd\xe7s\xb0\xbe\xf9\x15^>\xe4\x85g\xbdc6x>\x98\x8b\x8e>vO0\xbe\x1c\xb8\xa6\xbb\x06\xe3@\xbd\x15\x151\xbe\x19\x90\x86>\x95\xf9\x8e>\xa8\x15<<u\x9b\xc7>\x18F\x94\xbd\xa8{\x19>\x9c\x06\xb0=,\xba~\xbe\n\xea\x0b>2\x05w\xbeP\xc7\xbc\xbe\xf2\x03;\xbe0\x0fK\xbd\xf81\x03\xbe+\'\xee\xbe\xfc\xa8\x91>k\x05\xc4\xbd\x15\xf9/\xbd\xe3!;=[\x1fE\xbe\xd7\xe2\xe5;\x9f\xfa\xfe>\x1a\xce\x9c=\xf3\xf0\x0e\xbc}\xbd\xb2\xbe\xcb\xf7\xa5\xbe_\x9c_;\x07\xf5\xf4=\xbfX\x98>\xbb\xb0s=-\x858\xbe&\x9c\x86\xbd\xe0\xd5\x87>\xb4\x91\xcd\xbc\x92{Y>bP\x9b=\xa79\xa1>\xe9Ze\xbe\x17\x8fA>E\xff\xaa=L\x1a0>\xd0\n7>E\x07\xc5>\xdeU\xb1>\xe0\xf80>=n\xc1=_\xde3=\x08\xa3\x05>'
-p939
-tp940
-bsV503960895567847424
-p941
-g2
-(g3
-(I0
-tp942
-g5
-tp943
-Rp944
-(I1
-(I200
-tp945
-g12
-I00
-S'\xc1\xc6N?\x07i\xc7>>\xdaD\xbf\x9e{\\\xbcY\xbf\x12>O\xd9\x8e=\xb6\xd9\xd8\xbdNf\xda\xbe\xc0\xb8n=\x04\x9b\x0e?\x91\xa7\x9b\xbe\xf7\xb1\xc7\xbe\xc1\xfa\x90\xbc\x80\xceb\xbe\x9f\x85t>\x8d\x82*?Np|\xbe\xd5x\xee\xbe\xf8i\xd5\xbe\x84\x10\xa2\xbe\x81\xf0.\xbeV\xbcO\xbd\xba\xf7\xe4>\x04\xcd\xf4>Y\xfcy>\xb2;2\xbe\n\x11\xb4>\xd6l\x03>\xfd\xa4\xef\xbeC\xea\x1c\xbf\xf6\x90\xc2\xbe\xb5\x8e\xa4=\xfco\x0f\xbe\x88\x03e\xbf\xd7\xba\x1e>\xc4>\xe8>f\xae\x06?\x87\xe2\xdb>TL\xf1>\x95as\xbe&m\x10\xbf\r\xc8P\xbe\xa7\xaf\x02\xbe\xec)\xd2\xbb\xf8\xa6\x1c\xbfm\x08W\xbe\x8d\xd9\x0b?r\xfe\x88>\x8c\xa7\x90>~m~?\xa4\xe5\xce\xbd\x80@\x1e?\x84\xba\xb9\xbe\xc4A0>\xf4\x0f+\xbf\x03\xca7=\xcc}\x03>\x04g\xe7\xbc\x9f\xeb_\xbf\xd7}[\xbf\xe3\xfe\x9b>\xb1\x1c\x91?\xb8(D?\xc3\xe3\xae\xbe\x9fI?>+R\x7f<cG\xf7\xbe\x00\xf3]?\xf1\xd0\x19?\x06D\x02\xbf\xab\x9e:\xbfM<c\xbf\r;+\xbfLq\x06\xbem\x8a~\xbe\xcf^\xd0\xbd\x80J\xbe\xbcG\x10\x12>x83?\xe0s\xcf>\xff]\x1d>\x9d\xd6\x0e>3~<?\xe7\x1d\x08\xbf\x13@\xe0=f\x87\xcf<\xf4k\xbc>\xadF\xe2\xbe\x14\xd7@?\t\x90\xd2\xbed\x92\x14\xbf\xd9L\x9d>\x07\xb5\x94\xbeb\xec\x04\xbf]!\xaa>M\xed\xcf\xbcW\xcc\x1a?\x8b\x13\x9d>^km>/\x87\xc0\xbe<\x9f<\xbe&\xac\x8b>\x14\xd8\x80>\x9d\xbc\xf1>U9N?\xe3\xe1\x04\xbfM`D\xbd\x08\xb8U?\xbd%\xd7<\xd7g\xec\xbdQ\x84\x81\xbfQ\x9d\x8b\xbe}\xa55?=\n\xad>\x01n\x8c>\xad\xc9\x13\xbe~%7\xbf\x88\xa65>\x02(*\xbe\xfa\x85D\xbe\x08\xd1K?v\x19\xe3>\xa4>\xdf\xbd\xbdE\x96=\xfcZ_;\xb7\x15\xba>\x86Rc\xbe\xf7d\x97>"\xc2`>\xbdJ\xa2>\xddS[>\xec\xf8z>\xadd\x14=>\xb4\xf2=\x93\xb6\x9f\xbeCI\x86=\xa0f\xb6\xbc\xb71\x03>\x8c\xcc\\\xbf\xd7j[\xbe\xcfv\xf4\xbe\xf3\t\xdc>\\)\xfb>A\xc8=\xbf7\x07??7h\xbe>4\xfc\xd8<B?\xac?*\x91\xaa\xbd\xb2rf;f\xb2\xd4=Z_R\xbe\xf9[\xe0>\xa4\xe5\x8d>\\\x04-\xbeg\x9dF?r\x84\x15\xbf\x1f\xfe\xb3<\x8b\x91\xb3>\xbda@\xbf&\xb1\x00\xbf\xe8\x89\x19\xbf\x9f\xd6w\xbf\xe8\xcc\x10\xbf\xb84t>)7\xc3<\xbd|H\xbf`n\x15?\x1c\xb2\xab>\x91\xdc\xd9\xbdy\xd19\xbd-\xbb\xfd\xbe\xd9\xa0&\xbf\x01\xf7\x1a?\xe6\xee[=\x9c\xe0\xf3>RX\xc3\xbeF\\\x85\xbf\xf5\xb2\xf9>\xd3\xddW>\xa1+\xfb>\xceh\xf7\xbb\xcbM\x0c\xbfM7\xa0\xbe\x99\x8dX?\xf9\x1b@\xbd\x84\x1d\xbf>Y\xb9I>\x9f\x9f\xe5>`mV\xbd\xe4\xd4\xbe>\xe8\x0e\x8a\xbb\t\xcc\xb1>}\xe7Y>\xe7\xcfu?.D\x1e?\xbc:N\xbe\x7f\xad\xba\xbc\x06\xb3\x93>\xb3>\xc0\xbe'
-p946
-tp947
-bsV503957415352860672
-p948
-g2
-(g3
-(I0
-tp949
-g5
-tp950
-Rp951
-(I1
-(I200
-tp952
-g12
-I00
-S',\x9d\xfc>\xd0\xc6\n>\\k\x1a\xbf\x19\xb8\xe2=\xd7\xfea>\x83\xb0o\xbd\xfd\x1a\x04\xbeIL\xa0\xbe/\x9cA=5\xaf\x9b>\xa9\xcf\x95\xbd\x1fP\xd9\xbd\x0c\x80+=U\xb1\x8b\xbctS\xcb=qa\xf3>g1\xf5\xbd7\xb8G\xbe?t\x82\xbe\xc8\xbe\xe1\xbd\xb7L?\xbe\xa3\xa4\xd5\xbd\xd1\x07\x9d>\x07\xbe\x01=\xe1\x1f\x9c<\x0b\xfc\xb0\xbdk\xf8\x7f>\xff\xb3\xc7\xbd\x15\xc8\x9f\xbe\xc5^\xfd\xbd\x1d\xa8>\xbe$\xd9\xe9\xbdc\xd5k=N\x82\n\xbf\xbc!\x81=kt\xd8>\r=\x99>3\xe6\x87>\x81v\xd0>\xbd\xcb\xcf\xbc\x01\x08\x94\xbe\x94\xe9\xfe\xbdP\x02\xf9<\xc3X\x03\xbe\xeb\x90\xca\xbe!\xab\r\xbe\xbfY\x0b?\tl\x0b>H\x852>!\xe0\x1c?\xc3\xe9\x0f\xbd4\xba\xfe>\xb3\xdeH\xbe\x8d\x89\x15=A\xa9\x04\xbf\xe1\xc99>\x9f\xcf\xc0<\xab\xfa\xe1\xbd3\xc7\x1e\xbf\xd7\xd3\x1c\xbf\xb5\xb7R>\xa7\xea\x02?!h\x94>\x7f\x8a\x9d\xbe\x89&\xb5=)K">\xe8\xce\xc3\xbe\r\xc9\xdf>L\xd8&=\xd6J\x8a\xbe5\xfc1\xbf\x99\x0c\x1f\xbf)N\xb0\xbe\x95\xbf\xf9\xbd\'e1\xbe\x13~\xd8=\x93\xa0#>\xf8\xaa\x1b>\xb0\xda\xd5>\x89\x88\x8f>\x8f\xf0 =\xc4\x98\xd4=\x18 \xf7>3$\xd6\xbe\xe8t*>\x84\x9e\x8e=\xdd\x93\xa8>d#\xe6\xbe\x05\x19.?\xbf\xcd\xe5\xbd\xbd\xf0\xcb\xbeZU\x97>\'\xc1\xa6\xbe\xf0}\xe8\xbd\xb1\xa8\xc1>\xc0r\x1a\xbd\xaf\x98\xc8>\xdb\xa4s>\xf7:T>\xd4\x7fE\xbe7\x16\xb0\xbc\xd8-\xac>\x18\xac4>\xfeL\xa3>q\xb2\x1e?\'A\xbf\xbew\xdau\xbc\xac\x1e\xc6>\xf4K\x91=\x06\xe2\xa2\xbd]k\xf2\xbe\xd0\xb7\x83\xbc\xfcm\xd9>J\x16\x8a>W\xffD>mX5\xbd\x8cc\x03\xbf\x83\x0cZ>t\xd1\x9f\xbd\x88\xc4m\xbd1\xd2*?\xb5/\x9b>\xfd\xc8\xa8\xbd(o\x89\xbc\xef\xf1\x17\xbd\xb5U\xa6>\x90.%\xbe}3\xcb=\xb3{\xd7=\x10\xb8N>\xbdC\x1d>+7l>\xd5Va=\xa4\x90t=~\x90\x0c\xbe\xcc\x92\x06>1\xc5@\xbd\xd7"\x95=T\xab\xdc\xbe\xa02U\xbc\x88\xda\xab\xbe\xfb\xc3\xc6>\x83\xe3%>\r\xbf\x0b\xbf\x95y\xc8>\x00T\xe7;\x8f\xd2\xb1=\xd8\xe5D?\xbb\xff\x1f\xbe_.\x04\xbcl\xe8\x89=\xfc<\n\xbe7\xb6\xa1>\x13~\x82>\x1f\x92\x8a\xbd\xd3D\x15?\xf8\xd9\x95\xbe\x01\xd44=l\x85S>U|\xed\xbe\x01f\x17\xbeYA\xc4\xbe\xd3\x92"\xbf\x9bc\x9a\xbe\xcd\xd7\x03=0\xaeo\xbc\x84\xcb\x0f\xbf\x0fD\x02?\xebO\xca=\xb0\xdc\xd9\xbd\xa3Q\x88\xbc\xd4\r\xb4\xbe\x97\xb2\x9d\xbe\x1cU\x08?\x07\xecb=K\x80n>\x90;\xab\xbe\xc9\xec\x1e\xbf\x14a\x81>\x1b\x8ad>Ad\xe5>_\x89\xc0;\xf7\xd5\x8e\xbe\x1a\xb8\x11\xbe\x81\x03\x06?\xd0{h;U!\xbb>O\xed\xf7=\xd1\x16\xcb>\xedO\x17\xbe\xa2|\x99>\xcb\x16x=\x83\x83\x8d>\xa8<`>\x81\xd2(?\x05\xf6\xf4>%z\xce\xbb\xfbL\xb5=|\xfb >`\xfd\r\xbe'
-p953
-tp954
-bsV504219315197837312
-p955
-g2
-(g3
-(I0
-tp956
-g5
-tp957
-Rp958
-(I1
-(I200
-tp959
-g12
-I00
-S'\xe0I\x8c>D\xeev\xbda\xde\xdc\xbe^?\xa2<\x1b\xba~>+\x00\xb8\xbd<\xa3\x10\xbdy\xcf\x83\xbea\xff\x9d\xbd\xe2b@>r\xf3U=\xa0Z\x84=\xd6\xf21>\xb4)>=\xfc\xb4\x11\xbe\x08\x84\x8a>\x86G\x94\xbdn\xe2A\xbd}\xfe\x07\xbe\x8e"P=\xf1+\x8e\xbe\x12\xa3\xbb\xbc\x9df\x92=Y`\x9a\xbeD`\x9b\xbd\xab\xdb\xb1\xbd\x1b\x97\x85>\xf1bt\xbe\xfd\xe0\x90\xbe\xf1\xe0)>\xd2\xc0\x0b\xbc\xab\xa7\x0c\xbe\r\x81\x13>\xda\xde\x98\xbe\xc1s\xb4\xbch\x0f\xae>a\\\x0b>\x9a\x05\x0f>\xe5h\xbb>x\xd7\x8c=\xe9|\xc6\xbd\xb3\xc8O\xbc\x1f\xe6\x8f>\x0b\xd4\x9e\xbe\x9e\x0f+\xbek\xf9R\xbd\xef\xb9\xc5>\xc8S?=O?\x8a=\xb7;\xc2>p\x7f\xb3=\xf8\x11\xdb>\x83\xaf\'\xbe(\xa6\xd4\xb8\xad\x12\xed\xbe\x93\x15\x83>Z\x8d\x8c\xbc!8&\xbe\xdf\xd2\xee\xbeh\x18\xd8\xbe\x15ms>\xd6W\xbf=ND\x0c\xbd\x96&\x81\xbeQ\x86\x15<X~\x82>\x9dqe\xbe\x98\x8d+>\xc6s\xa5\xbe\rh\xae\xbdr\xd2\x0c\xbf\xc1\xe8\xa4\xbe17P=j\x86\xf8\xbd\x8f\x85\xef\xbd\'\xc5\x82>\xb6\xa1\xab>\xbe \xea=\x8c<\x12>\xa4\xa8P>\x19\x0e\x93\xbd0*\x0b=\x9dV\x97>\xa2=\x84\xbe\xb51\x08>l\xdb\x89=\x9b\xde\x82>\xccu\xc6\xbe#\xbb\x05?`\xb5\xd9=\xd2\xd1;\xbe34O>\xb6B\x7f\xbe\xf8\n\x84=\xc8\x97\xc4>\xcc\xee\x05<R\x99\x1a>^\x92m>\x87\x0b=>o\x1b\x07\xbd\xb7\x0c\x03>\xfa\xbb\xad>\x0b1\xd7=\xa4\xc8(>\xd8\x11\xd3>\x9e\'\x8e\xbeR\xb3C<e3\x03=\x15\x14\x98=\xc4\x19\x82\xbbm\xd6}\xbdO\x97z>-\x18\x10>\xe6\xeba>h\xcd\xfc<\xe3\x1c*=\x8e\xd6\xac\xbe\xaal\xac>\xdcn\xaf<\xae\xfa\xd5=\xea\x83\x0c?1\xfa\x92=\x13_\xf4\xbcy\xb2w\xbd\x9bD\x06\xbd\x98I\x98>\x03L\x17\xbe\xbe\x01^\xbd\xe8\xf9L=<\xa4\x98=}bX=lO\xd2=\x08\x16\xf6=\x05\xd8A<\x0b\xf4i=\xcb\xf2\x1b>v\x89\x83\xbdd\xc7\x86<\x84\x1a\x8f=\xca\x84\x02>\x00\xef.\xbe\xa5[\xd2>\x82}u\xbd\xe7s\xb0\xbe\xf9\x15^>\xe4\x85g\xbdc6x>\x98\x8b\x8e>vO0\xbe\x1c\xb8\xa6\xbb\x06\xe3@\xbd\x15\x151\xbe\x19\x90\x86>\x95\xf9\x8e>\xa8\x15<<u\x9b\xc7>\x18F\x94\xbd\xa8{\x19>\x9c\x06\xb0=,\xba~\xbe\n\xea\x0b>2\x05w\xbeP\xc7\xbc\xbe\xf2\x03;\xbe0\x0fK\xbd\xf81\x03\xbe+\'\xee\xbe\xfc\xa8\x91>k\x05\xc4\xbd\x15\xf9/\xbd\xe3!;=[\x1fE\xbe\xd7\xe2\xe5;\x9f\xfa\xfe>\x1a\xce\x9c=\xf3\xf0\x0e\xbc}\xbd\xb2\xbe\xcb\xf7\xa5\xbe_\x9c_;\x07\xf5\xf4=\xbfX\x98>\xbb\xb0s=-\x858\xbe&\x9c\x86\xbd\xe0\xd5\x87>\xb4\x91\xcd\xbc\x92{Y>bP\x9b=\xa79\xa1>\xe9Ze\xbe\x17\x8fA>E\xff\xaa=L\x1a0>\xd0\n7>E\x07\xc5>\xdeU\xb1>\xe0\xf80>=n\xc1=_\xde3=\x08\xa3\x05>'
-p960
-tp961
-bsV504264585218519041
-p962
-g2
-(g3
-(I0
-tp963
-g5
-tp964
-Rp965
-(I1
-(I200
-tp966
-g12
-I00
-S'8\r\xed><z\x1e\xbeD\xa59\xbf\xc0ug=H\x1e\xc7>\xf2\xc2\x15\xbe<H\xa6=\x13\xcf\x87\xbe\x94\xf6\xa5=\xe8\x80\x04>\xd8M5\xbc]\x1fB>NF\x85>p`\xbe<\xc80\xee\xbdRi\xd1>\xbf\xaeK\xbc\xcc\xc8\x93=\xbdV\x8c\xbe\xfd\xa3\xa7;\xfc\x99\x96\xbe\x9a\xde\xc3\xbb\xec\xd6`>8b\xb5\xbeBD{\xbd\x01;\x84\xbeQ\xcc\xab>\xda\x04\x88\xbeO\xf9\x84\xbe}q\xae=\xdd0b=^s\xf8\xbdx\xa7\xb5=t}\r\xbf\x8e\x1c\x19\xbeu\xf9\xba>\xe4\xbc\x1e>\xe4n\x9f>\\\xd1\xf1>]\x14\xdc\xbd\xbf\xd7\x84\xbexD\x8a=\xe9\xf2r>`\xc2\xb4\xbe\xd5 \xb0\xbeg\xffk\xbe\xd1\xaa\x12?$\xe0f\xbd\x88\xd9\xf2=\x8db\x1a?w\x962>\xf8\x91=?\xd4n\xa8\xbe\xe9\xceZ>\xff\x9d\xc3\xbe<\xbf\xe9>J\x83\x84=F}\xcf\xbe*\x1f\x9f\xbex\x03#\xbfj\xb7\xa2>\xe9\xac(>\xd8~\t\xbd\x9e+\x86\xbe\xe5\x1e\x8d>^m~>\x8c\x10\xd3\xbe\xa4.\x7f>\x0f\xb1\xa7\xbeW\xb6\'\xbe-S6\xbf\x08x\xd1\xbeCv\x12=\x95\x1eD\xbe\xf5\x08\x81\xbe\x15\x0er>\xd9\xb4\xac>\xf3\xaaR=X\xb0s>\x94\xfb\xb9>\xcd\xd80\xbe1\x99>>m$\xbc>\xa6\xf1;\xbeb\x1bu=cw/>@\xcb\xd1>\xc90\x16\xbfp\xb7K?\xe93\xc5;u\x1e\xff\xbe\xbf:\x81>\xeb\xa5\xe3\xbe\xf1\x81\x1a=\x0e\xd0\x08?~b%>\x08J;>L\x1cp>\xd7z\xa5>\x9f\xcf\x00\xbe\xec,\xda=\x11\xb8\xcc>\xf8WO>\xbc\xa6\xc0>\xac:\xd1>\xb8`\xbb\xbe\x0f\xb0@=B\x1c]>\xc2\xe9o=\x1c\x93\x86=\x83)P\xbeB2\xd3=\x80\xb8\x87>\x1d{%>m\\\x84\xbc\xb0\xff\xa0\xbc\x03S\x17\xbf\xb1\x9e\xe5>\xd4L.\xbd\xd4C\x12\xbdU\xe3=?:\x9a\x0b>\xd6}\x83\xbd\xba\x12\xb0=\xb6\xeb\xb2=\xf1B\xf0>F\x95f\xbe&P\xd8\xbd\xfb_\x9e=\xd8=\x8d=:\xe9\x96>\x88^x>\xcf.=>T\xc8\x02=\xe9\xac\x13>\xfd\xfe\xdf> \xbd\x19<\xcbk\xcf=\xbf{B\xbd\x04\x94\x02>\xe0\x90\xbd\xbe\x10\x8d\x13?=\xe9\xab\xbd\xbe\xaa)\xbff\x8f1>b\xcc\x87\xbeQ0\x9f>\x10\x13\xe8>\x0fCM\xbe\xe4g\x8e<\x9e\'\x11;-m\x94\xbd3\xc1\x87>U@\x82>\xf7\x85\'>\x1e\x7f.?\x80ft\xbe\xed\xcf\x16>x@>>\xdc\x81\xa2\xbe\xd5\x88\xf6=\xf6.\x8d\xbe\xfe\x00\x11\xbf!8\x9f\xbe\xde\xef>=%\xe85\xbe`\xedO\xbf\xa2\\\xde>\xa7\xf2\xed\xbd\xd7~s\xbd1\xec}>\xf3\xd8\x85\xbeq\x95\x8e\xbd\x8f^8?K\xbe\xfe=\xf5}W;/q\x96\xbebH\r\xbfub\x7f>\x93\xdaA>\xbc\x00\t?"\x97\x1f=\xd8\xddk\xbe\x89K\xca\xbc\xcd\xf3\x8f>\xeb\xaf\x88\xbc?\xdd\x0c?\xe7\xa4->U\xd8\xa9>\xa9n\xd7\xbd\xc8k\xbb>\xd1\xe4,> \xc1\xbe>\xadu\xb1\xbcU/#?\xc2\xed\xb1>z\xbd\xd8=\x84\xd6_<\xaa\x1b\x03\xbd\x1er\xaf='
-p967
-tp968
-bsV503964701097615361
-p969
-g2
-(g3
-(I0
-tp970
-g5
-tp971
-Rp972
-(I1
-(I200
-tp973
-g12
-I00
-S'\xc8s\x13?\x0b\x02\xf4=\x85\xf6C\xbf9\\\xc9\xbb\x146\x93><\xab\x04\xbe\xe6\xc3\xbc\xbc\x94H\xaa\xbe\x9d\xea\x86\xbdB\x0f;>\x80\xa0i;\xd2\x83\xce\xbb0\x06\x7f>\xcft\x1c\xbc\xc5\xba\xf0\xbd+\xa8\xca>\x8el\x19\xbd\'\xb9:\xbe\x97Ct\xbe\xa8b\xdb=@\xe0\xb1\xbe:\xa3\x16=\x9b.\x86>\x9a\xda\x96\xbe\x07(\x84\xbclx*\xbe\x1c\xban>>\xf2\xf6\xbd\xb2q\x9b\xbe\x92\xd5\x84=(\'\xe1=c\xa6\xaf\xbd\xfe:\xcd=nx\xc5\xbet\x9c0\xbd \xab\xa9>.n\x1f>\xf6\xba\xae>\xc5\xd3\xf8>\x14\xf1e\xbdZ\xf4\x1b\xbe%<\xa5=\xe6\xc2E>++\xc1\xbe\xf2\xce\x9e\xbe\xd9\xb7\xd1\xbd4{\x13?\xe6a\x9a\xbdQ\xfd\x84=ci#?\xf4\xea\xcd=/\xf8\x10?\xfd\x85\x92\xbe\xae$\x93=^h\xdb\xbe\x144\x98>\x1eh\x13>\xb9\xef\xda\xbd7\xd7\xfb\xbew\x14\x0c\xbf\xb4\x87\xaa>\xf6\xf6\x8e>\x0cz\x9e<\x8c\xba\x93\xbe\x98\x86\xbc=\x19\xf9l>\xd4\x1c\x8a\xbe\x899\xb9>_\xff\xad\xbe7C\xf2\xbd\x19\xf0D\xbfN\x9f\xfc\xbe\xe2\x96\x03\xbe\xd5\xb5\xb0\xbd\x15\x96\x94\xbee\'5>\xa7"Z>\xcd\x02\x01>\xebeq>\xd0]l>\xc1\xae\xaf\xbd\xa5\xb4<=\xbbZ\xa7>\xaa[\x9c\xbe\x8ef\x12>\x18\x0e\x90>U\x07\xb7>\xb5e\xf4\xbe\t\x0e\x1b?\x8b\xeb\xcd\xbd\x93\x0b\xb6\xbe}\x93\xa1>E\xd5\xf8\xbeD6\x04=\xb2:\x98>\x11\xccW>\xaa\xe3W>*\xe0\x9e>y\x8f\xfd=S~\x07\xbe\xecU\xc4=$\x9e\xd3>\xb18+>\x00\xd9w>\xd1\xb9\xdb>_\x83\xbf\xbe\x89.\xd5<\xce\xb9\xa5>[8y;\x8a\xc7_=\x9b)\xa9\xbe\xee\xab|>+<\xe0>\r)\x85>s\xce\x8e=\xf7\xb6F\xbeD\xab\x08\xbfY\xf5\xe4>\xf8\x83\x8e\xbd\x97\xd9\r>=\x84-?\x14\x91\x07>x\xd2W\xbe\xa2\x01\xfb=<z|=\xb8&\xb3>\x90\xbb\x92\xbe\x8c\xebw=R\x9d\xb0:\x9b\x89\r\xbd\x13\xca\x82>?V\xa6>{\xeav=\x80\x1e_=\x91Y\x01=\xef\xf5!>\xa2\x01/\xbdF\xda\xb4\xbcml\x08\xbe\xae \x01>\x02\xd0\x8d\xbe\xdb{\xbc>\xe4\xcd\x82;li\x18\xbf\x0b>\xbb>.:\x8c\xbd\xd1\xd6\x81>~\x90\x0e?\x8e\x01:\xbe\x8c\xb7\xcf\xbd\x0c\x01L>\x1f7\x91\xbd4\xf6\xd5>+\x12\x9b>>\x04k<\xde6\x0b?.\x9b\xf2\xbd\x9eo\xda=DhM>y0\xb4\xbe\x0f\x07)=\xfe6\xbc\xbe\xe1\x90\xe1\xbe\xc0\xbe\xab\xbe\x88\xcd\xd1=\x0b@j\xbeL\xf9*\xbf\xdb\x7f\xc8>W\xb6\x19>v\x16\xa2<\xe4\xe3\x88=\xe0`|\xbe\x01\xca \xbe\x0c9-?\xecf\xb7<\xfd8\x94=\xaeV\xcf\xbe<\xd64\xbf\x0c\x81\x87=\x84\xccO>\xe7^\xe7>\x05\xf7\xfd\xbd\xf6\x92\x8e\xbe\x938[\xbe\xa0"\xa9>:\xae\x8e\xbdXy\xcd>\x84~\x1e=f7\xe1>U]\x02\xbe\x19\xde\x87>\x96~\xc2=ps\xc1>\xcc\x9e\x8b>\xf2\x88\x14?\x073\xfd>\x0b\xee~\xbc$\xb0\xbc=,F\xe7;Ws\x05>'
-p974
-tp975
-bsV504225620768079872
-p976
-g2
-(g3
-(I0
-tp977
-g5
-tp978
-Rp979
-(I1
-(I200
-tp980
-g12
-I00
-S'W\xa54?Y\xf2\x1b>f\x03\xee\xbe?bl\xbe\x8a\xb8B>\xcf\xf0x=N8\x82\xbc\x90|\x88\xbe\x15\x82\x1a=5\xa8\xd2>G\x93\x9b\xbd\x16\xb9\xfd\xbdKfH>\xed\x99\xd9\xbd\xe8\x1b\xa4\xbd\xea\xc1\xcd>"\xc7\xf0\xbd\xd9\xa7\x14\xbe\xde4\x7f\xbe\x8fM\xde\xbd^\xc9\x88\xbe\xf8\x94*>\xf5\x84y>\x1e\xb7\xdc=51\xa4=\x90\xb07\xbe\xf01.>\xfb\x01\xe9\xbd\x13\xba\xae\xbe7Kq\xbe\xfe\xd3\xa8=\x00\x88C\xbc;\xfe\xe5\xbb\x10S\xce\xbe*\'\xc3=\xc9\n[>\xd2\xa1\xa3>\xee\x89Y>\x17\xab\xad>\xce\xb9\r\xbd\xe9\xd6A\xbe%\x8c\x9f\xbd\xe8\xed\xbd=]\xc9\x90\xbe\x80B\xe5\xbd"E\x98\xbdW\xaa\xfa>\xadO\xca\xbc\x80CW=p\x87%?\x18yL\xbdn^\x08?\xfeA\xb2\xbe\xc88\xf5=\xf6\r\xe2\xbeU\xca%>\xe2\x0fz>\xd1\xd8\xf2<2\xb2)\xbf\xe7L\xfd\xbe(?\xc2>\x17\x9f\x10?gu\\>\'O\xf8\xbd\xf0$\xd6\xbd\xe2\xe8\x04>\x08=\x8b\xbe\r\xd3\x16?\x85B\xbb\xba\x9e9\\\xbe7l\xe4\xbe\x868\xbb\xbeu\xae?\xbe\xb27\xf6\xbd5\x8cZ\xbeV\x85h\xbd1\xe6\x81\xbd=\x7f9>}\xf5+>C>\x18>\x0f\x05\x86\xbc:\xc5\x93\xbd\xe5W\xed>\x19\x8f\x84\xbe\x11\xe1 >\x8c6\r>\xa1P\x8f>\x92\xe9b\xbe\xf1M\xf6>v\xe8\xae\xbd\x1b\xd7\xb0\xbe\xcf\x08\t>\x86\xde\xb8\xbe}?\xef\xbd\'\xec\xab>Aj\xca=cP\x8c>>%\x9b>\xeex\x85=_\xb6V\xbe\xff3\xe4\xbd\x1e9\\>\x93F\x81>\xb2\x91\xfd=\x7fm\xab>\xce*I\xbe\x9e\xee\xea=\x86\x19\xda>>\x1e\xa9\xbc\xc9\xbe\xfc\xbc\xf6S\x0e\xbf\xf5\xd1\xb1<t~\x91>h=\xac=\x1b\x85\xd1=\x06\xc8\xef\xbd\x87\\\xb0\xbeNFo>\xcf\xe8\x02=\x8f=\xaa=\xe5*\xea>B\xc2t>p\xc7\xda\xbd`\xb7A>\x83K\xe5:a!\xb3>\x11\xa0\x08\xbe(\x01\xe6=bm\xd7:\xfe\xa7\xdd\xbc\r*$>\xf7T\xf4=f%\x17\xbc\x89q\x01=\xb2\xf4\x07:oP9=\xcd{$\xbb\xeeSJ\xbd\xf7\x9c\x8b\xbe\x85\x7fa\xbc`\x0b\x87\xbeKX\xb8=\xa7\xa7T>\xa2\xd9\xed\xbe6\xa6\xf8>*\xc19>\xe12G>\x05=\r?\xfd\xfc,\xbe*\xbe\xbd\xbd\xd8\x81\xae\xbd\x91o/\xbeu\x10\xb3>\xa6\n->\xa1\xb2\x00\xbdqd\xb9>\x9a\xf83\xbe+_\x83=\xc3[P=S\xd5\xc9\xbe\x88\x96v\xbez\xeb4\xbe\xf5@\xdf\xbe\xf5t\x92\xbe0\x9f:>\xca.\xe1\xbd\xca+\x02\xbf\x15\x98\x98>\xdd<6>^0z\xbdY\x15[=C\x89$\xbe\x10\x14z\xbe\x05\xdf)?\xcf\xa2\x03>\x1e\xd5&>_\xbf\xc0\xbe\xe9\xe00\xbf\xbb\xbc\x17=_RX>\xf5\x08\x9c>\x92N\x81\xbd\xc6b\xa7\xbeH>\xa1\xbe\xe0D\xb7>6=4\xbd\x0fr{>:a\x8d=A\xf9\x82>\x8d\x065=\x12\xc7*>\x1a\x98P\xbc\xe89v>r\xcf\xf1=\xd5i3?\xcd\xcb\xcb>\xa0\xc2!\xbe\xb166\xbd\xf7F\x10>K\xc2:>'
-p981
-tp982
-bsV503958704086323201
-p983
-g2
-(g3
-(I0
-tp984
-g5
-tp985
-Rp986
-(I1
-(I200
-tp987
-g12
-I00
-S'\x92{\xa4>\xd2\x9d;\xbbC\xcd\xca\xben\x07\xb7<\x1e\xa0?>5}\x8d\xbd\x05R\x0b<\x10\x04d\xbe\xc2\xc1\\\xbdNa\x0f>\xf5v\x05\xbd\x16\x07t\xba>\x1f\xf8=;\x11\x1c;p\xefh\xbd\x90\xdf\x8f>\xe1\x89\x05\xbd\x98\x073\xbd\xe0\xa90\xbe\x06,\t\xbd`\x16?\xbe\xb9\xe7\x1f\xbc\x82S\x19>\x7f\x89\x14\xbe]>>=\xfcG\x06\xbe\xea\x9f]>\xfaN\xc4\xbd>\xa9Z\xbe \xdd\xf7\xbb\x1e\x96\xa1\xbd\xca\xdeT\xbd\x87\xee\xb5=\x92\x8d\xb6\xbeE\x9b`\xbb\xbb\xb7N>\x08K\x06>{\xbaL>\xbbJ\x95>\x9c\xea\x9c\xbd]\xf6?\xbe\xb2$o\xbc\x13- >+1P\xbe\xd3\xbdM\xbe;A\xe4\xbd9\x81\x8f>\xeeb\x88=\xfb3\xd6=\xf0+\xc0>S\xe8\xb4<\xbe\x93\xd4>P\xc0#\xbek\xae\xcb=\x9f*\xa2\xbe\x07\x82\x13>\xcd]\xa8<\xbe\x13$\xbe\xaaz\xb6\xbeu\xb8\xc9\xbe\x8c\xf0.>\x19\xb4L>\x1ed\xe5=3\\B\xbeZ\xb9\x84=\x8d\xfd\xd0=j\x90_\xbe\xf3\x1cX>\xb6$ \xbd{S\x0e\xbe3\x94\xf5\xbe\x8c\xed\x9a\xbecjg\xbd\xdfl\xc4\xbd\xb8W\xd3\xbd\xd0\xef\xf5=s\xa55>\x80hY=\x85\x07p>eCb>\xc7\x02\x97\xbdE8\x9a=F\x1b\x86>]HI\xbe\x83\xf9\\=\x87,\x1c=\xb1a\x88>$\x9a\xa7\xbep\xf3\xeb>rR\xa3\xbd\x96\xb2`\xbe \xf1\xf1=n^Z\xbe\xee*\xb2\xbd\x11\xd2\x8a>F\xd0\xdd=\xc3\xc4Q>\xb4\x199>\xd6\xe9\t>F|\x00\xbe\xfa\xa0\xb3=_\xc1\x89>\xf6\xba\xf3==wS>.v\xb2>\x0e\x87\\\xbe\x9a<#\xbd\x08g.>\x8e\x9fD=\xb3\xb4\x99=:GC\xbe|\x8b\xbe=@6[>:\x9a\x0e>\xc3\xd0\x9d\xbcJ\xd5\x88\xba\x893\xac\xbe"\x89~>u\xdf\xd6;\xe62\xbf<>\xa8\xed>\xbbT\xea=*\xf3\xf6\xbc\x1dn\x19=\xc3f\x1d;nAy>\x1aT \xbejI\x18;\xa6u\xcb=\xc0:.>\xb3\xa3\xbd=\x95_\xbc=B\x8e\xf6=J\xd7:=\x80\xd2C=\x1e\xc1\x02>\xf0\xeb\xdb\xbcbNN=iy\x99\xbd\x19\xca1=\xbeLl\xbe\n\x01\xb0>\x80\xd4,=\x96\x1c\xba\xbe>Th>)\xc56\xbd&\xf1\x05>\xa9\xaf\xc4>\x18V\xab\xbd\xf0\xae\x82\xbc\x1a\x19e<\xbe\xe7\xe4\xbd*\x17j>%e2>{\xd6$=br\xc9>\xc9\xaa3\xbeS\n\xb9=S\xc0\xf3=\x81\xb6\x81\xbeB\xf1\xd1<*\xf0\x97\xbeKm\xda\xbev8J\xbe~\x8ak=\xf6XL\xbdE\x89\xd6\xbe&\xcd\x87>wKF<\xf2/c\xbd\x8a&*=\xcb\xceS\xbe\xaa6\xe7\xbdN\xe0\xbc>\xb0?\xfc<\x03iM=\x06\xf9v\xbeyk\xcb\xbe\xf6\xb7\x11>\x80\x8d\xca=\xd2A\x81>\xd0c\xf4<\xad\xd4D\xbe\x0e\xd4\xc1;\rR\x9c>\xfe!\xfb;\xaepd>\xbaw\xa7=\x82\xb4\x7f>\xce\xa7\x05\xbe\x98\xdex>\x95\xebV=\xa9\xb3\x12>}r\xc0=\xba\xe7\xd7>\xba&t>\x15#q=\r\x97\x12<\x1b\xa5n=h\x88\xe09'
-p988
-tp989
-bsV504214728390881280
-p990
-g2
-(g3
-(I0
-tp991
-g5
-tp992
-Rp993
-(I1
-(I200
-tp994
-g12
-I00
-S'\xe0I\x8c>D\xeev\xbda\xde\xdc\xbe^?\xa2<\x1b\xba~>+\x00\xb8\xbd<\xa3\x10\xbdy\xcf\x83\xbea\xff\x9d\xbd\xe2b@>r\xf3U=\xa0Z\x84=\xd6\xf21>\xb4)>=\xfc\xb4\x11\xbe\x08\x84\x8a>\x86G\x94\xbdn\xe2A\xbd}\xfe\x07\xbe\x8e"P=\xf1+\x8e\xbe\x12\xa3\xbb\xbc\x9df\x92=Y`\x9a\xbeD`\x9b\xbd\xab\xdb\xb1\xbd\x1b\x97\x85>\xf1bt\xbe\xfd\xe0\x90\xbe\xf1\xe0)>\xd2\xc0\x0b\xbc\xab\xa7\x0c\xbe\r\x81\x13>\xda\xde\x98\xbe\xc1s\xb4\xbch\x0f\xae>a\\\x0b>\x9a\x05\x0f>\xe5h\xbb>x\xd7\x8c=\xe9|\xc6\xbd\xb3\xc8O\xbc\x1f\xe6\x8f>\x0b\xd4\x9e\xbe\x9e\x0f+\xbek\xf9R\xbd\xef\xb9\xc5>\xc8S?=O?\x8a=\xb7;\xc2>p\x7f\xb3=\xf8\x11\xdb>\x83\xaf\'\xbe(\xa6\xd4\xb8\xad\x12\xed\xbe\x93\x15\x83>Z\x8d\x8c\xbc!8&\xbe\xdf\xd2\xee\xbeh\x18\xd8\xbe\x15ms>\xd6W\xbf=ND\x0c\xbd\x96&\x81\xbeQ\x86\x15<X~\x82>\x9dqe\xbe\x98\x8d+>\xc6s\xa5\xbe\rh\xae\xbdr\xd2\x0c\xbf\xc1\xe8\xa4\xbe17P=j\x86\xf8\xbd\x8f\x85\xef\xbd\'\xc5\x82>\xb6\xa1\xab>\xbe \xea=\x8c<\x12>\xa4\xa8P>\x19\x0e\x93\xbd0*\x0b=\x9dV\x97>\xa2=\x84\xbe\xb51\x08>l\xdb\x89=\x9b\xde\x82>\xccu\xc6\xbe#\xbb\x05?`\xb5\xd9=\xd2\xd1;\xbe34O>\xb6B\x7f\xbe\xf8\n\x84=\xc8\x97\xc4>\xcc\xee\x05<R\x99\x1a>^\x92m>\x87\x0b=>o\x1b\x07\xbd\xb7\x0c\x03>\xfa\xbb\xad>\x0b1\xd7=\xa4\xc8(>\xd8\x11\xd3>\x9e\'\x8e\xbeR\xb3C<e3\x03=\x15\x14\x98=\xc4\x19\x82\xbbm\xd6}\xbdO\x97z>-\x18\x10>\xe6\xeba>h\xcd\xfc<\xe3\x1c*=\x8e\xd6\xac\xbe\xaal\xac>\xdcn\xaf<\xae\xfa\xd5=\xea\x83\x0c?1\xfa\x92=\x13_\xf4\xbcy\xb2w\xbd\x9bD\x06\xbd\x98I\x98>\x03L\x17\xbe\xbe\x01^\xbd\xe8\xf9L=<\xa4\x98=}bX=lO\xd2=\x08\x16\xf6=\x05\xd8A<\x0b\xf4i=\xcb\xf2\x1b>v\x89\x83\xbdd\xc7\x86<\x84\x1a\x8f=\xca\x84\x02>\x00\xef.\xbe\xa5[\xd2>\x82}u\xbd\xe7s\xb0\xbe\xf9\x15^>\xe4\x85g\xbdc6x>\x98\x8b\x8e>vO0\xbe\x1c\xb8\xa6\xbb\x06\xe3@\xbd\x15\x151\xbe\x19\x90\x86>\x95\xf9\x8e>\xa8\x15<<u\x9b\xc7>\x18F\x94\xbd\xa8{\x19>\x9c\x06\xb0=,\xba~\xbe\n\xea\x0b>2\x05w\xbeP\xc7\xbc\xbe\xf2\x03;\xbe0\x0fK\xbd\xf81\x03\xbe+\'\xee\xbe\xfc\xa8\x91>k\x05\xc4\xbd\x15\xf9/\xbd\xe3!;=[\x1fE\xbe\xd7\xe2\xe5;\x9f\xfa\xfe>\x1a\xce\x9c=\xf3\xf0\x0e\xbc}\xbd\xb2\xbe\xcb\xf7\xa5\xbe_\x9c_;\x07\xf5\xf4=\xbfX\x98>\xbb\xb0s=-\x858\xbe&\x9c\x86\xbd\xe0\xd5\x87>\xb4\x91\xcd\xbc\x92{Y>bP\x9b=\xa79\xa1>\xe9Ze\xbe\x17\x8fA>E\xff\xaa=L\x1a0>\xd0\n7>E\x07\xc5>\xdeU\xb1>\xe0\xf80>=n\xc1=_\xde3=\x08\xa3\x05>'
-p995
-tp996
-bsV504271216639610880
-p997
-g2
-(g3
-(I0
-tp998
-g5
-tp999
-Rp1000
-(I1
-(I200
-tp1001
-g12
-I00
-S'\xbaZL?v\xdd\x9f>&dX\xbf\xf8\x0e\x82\xbd\xbc\xd7.>Dah\xbd\x15G\xbd\xbd\x8eC\xc3\xbe/\xc6<=\x13\x8e\xc9>\xb6\xd2\x84\xbe:\x80\x97\xbe~p\x14=\x18\x8f\x84\xbeNO\x03>\xdd\xe8\x01?\xef\xe5\xdb\xbd\xff\r\x9b\xbe\xea\xc6\xaf\xbe\x07Q\xe3\xbd\xdc\xf8\x86\xbe\x87\x12O\xbd\xede\xd4>\xee..>\xe4\x13\xe7=\xa6\xe1%\xbe\xa8t\xbd>\xcb\xb7\xf2=\x96c\xe4\xbe\x18.\xb7\xbe\x1d\x9d\xf6\xbd\xe5\xe2!<)"\r\xbe!\x91/\xbff(Z=\x00[\xea>+m\xc3>Y\xf1\xcd>\xb3\xfc\n?d\xab5\xbeD\x14\xf5\xbeD\x84g\xbd\xcd-\xba\xbd\x12\xf0\x02\xbe\xfd\x1d\x06\xbf\xd6\xc3\x82\xbe\x86\xf7\x1a?\xf6\xd1">\x086Q>.=c?\x95\x809\xbd\x88\x8b\x12?C@\xcd\xbeR\x04\xb2=\x9a\x0c\x01\xbf\x1a\x85.>\x13\xf3\x80>KW\xb9<HB9\xbf\x18\xc54\xbf8D\xb4>\x87\xbfk?\xa2:\x01?X\xaf\x91\xbe\xe6\x0e\x14>\x13\xa0\x03>8\xfb\xd1\xbeH;,?r9[>#\xc2\xa2\xbex\xb9N\xbf/\x14M\xbf5\x99\x07\xbf\x88h\xf1\xbd+\xa0\xbe\xbe\xda\xb8\x9f\xbd\x80_\t<R}7>\x0e\xd9\x0f?\xde\xcf\xa3>\x9dU\x8a=\xd1c\xec=QO\x1b?\xb8d\xd3\xbe\x18k\xd0=\\\xbf?>(\xe5\x8b>\xa7\xef\xe9\xbe\xaf\xac%?&\r\xb1\xbe.H\t\xbf?\xc1\xbf>\x07\x0c\xd4\xbeZ\xca\xab\xbe\xdd>f>\xd2\x0c\xdf=m\x99\x00?a\x1a\x8a>\x0f\x07\x1b>\x9b\x8a\x94\xbe\xb8^\xec\xbd\xf8\xd6\x9a>\t\xe3\x80>\x92\xc0\xce>\x9f\xc4\x0c?\xad\xc7\r\xbf5\xc5-\xbd\xfc\xa7I?\x16^%<\xe6\x08\x06\xbd+\xdcS\xbf\x84K]\xbe_\xbf)?\xb2\x17\xbf>Pg\x92>:\xbeR\xbe\xbb\xae.\xbf6\x19\x83>\xb5\xe9E\xbeo\xf4\xa2\xbd\x91g5?f\x9f\xc1>\x03Cn\xbe\xfc,I>\xfdA$\xbc\x1f\xe2\xab>\xe3\x15\xa5\xbe\x8b\xaf1>\xd3\x9f\xc9= 74>\xfc \x88>\xc0)\xc2>\xad`\x1d=\x8a\xee\xfe=9\xbds\xbe\x92\xdf\xd2=\xdeA\x8e\xbdY:X<\x0e\xb28\xbf\xa1`g\xbc\xb2\xc5\xf0\xbeK9\x99>V\xda\xa1>\xc6VF\xbf\xd47\x10?\x00m2>\xc3[\x1c>\xd0\xc2\x91?\xd3"\x00\xbe1\x94\xaf\xbd2\x11\x02>\xcd\x8b\xdf\xbd\x1a\xca\xfc>\x98\x98\xaa>+\xda\xf7\xbd(Y9??\x01\xc9\xbeO\x11\xfc<\xa7Xi>B\xe0\x0f\xbf(\x05\xd2\xbe\xe9L\x07\xbf\x01\xdcG\xbf;\x89\x0c\xbf\xb5\xfag>\xd1\x1e\xde\xbd\xc0^N\xbf\xdc\x99\xee>\xfdm\xc1>6X\\=B\x90\x0b=Z\x17\xda\xbe\x15\xfb\x03\xbfP\x82\x1c?#"\xe2<\xb5\x84\xd1>\n\xb5\xcb\xbe"S\x82\xbf\xa4u\x8e>Otf>\xe4\x9f\xe2>\xd1\xf8\x82\xbd\xa1\xdd\xed\xbe\x92\x9d\xd9\xbe\x19+&?\xbf\xee\x96\xbd\xe7\xcd\xea>\x8a\x02\x0e>Mb\x03?N\x12\xe5\xba}\x15\xa4>\x06\x1d4<\x04*\xd5>-]_>\xc7eU?\x06\xea\x1c?\n\xee*\xbejr\xac<\x0f\x80S>\xc01\x88\xbe'
-p1002
-tp1003
-bsV503972831613685761
-p1004
-g2
-(g3
-(I0
-tp1005
-g5
-tp1006
-Rp1007
-(I1
-(I200
-tp1008
-g12
-I00
-S'\xe1^\x18?;t0>\xce\xd7\x13\xbf\x9b]\xce<s"S>\xae\x01Y=\xe0\xb2\xdd\xbdgW\x82\xbe\xb6x\xd5=v[\xe8>e">\xbeH\xbb(\xbe3z~\xbd,[\x8c\xbdF\xd5\x02<\x06S\xe5>\xf6\x97\x13\xbejB\xd7\xbd\xa6\xf5\xaf\xbe\xdb\xdfk\xbe\xdb\xf3\xfb\xbd\x1b\x06\xaf\xbd\x11\x0c\xa0>J\xcb(>\x9a\x11\xb7=\x8e\xa6\x11\xbe\xd7\x13\xad>\t\x18\x1f\xbd\x96\xc5\xae\xbe\xd2\xd4\x87\xbe\xb2)7\xbe\x9e\xce\xdb\xbd~]`\xbc\n\xa7"\xbfP\x16\x8a\xbb\xd5\xbb\xf1>/\x1a\xae>W\xb7\x88>\xd8\xa8\xdc>v\x05\x87\xbd\x00\xe8\xbd\xbe,\xf9\x0f\xbe4\x8c\xa4=[\x96\xdb\xbd\x9f\x15\xb8\xbem\xa8e\xbe\x18\x90\x0c?\xe8Lb>\xe5\x02Y>B\x8c0?F\xef\xb9\xbd\x96\x9d\x11?~\xfa\x94\xbe+\xae\xde=-\xef\x08\xbfB\xfb\x17>}\x1fq=\xe6\x10\xdf\xbd\x8f\xd8.\xbfm\x90#\xbf\x92\x7f\x8f>a\x06*?\xfb\xb2\xd0>\x87xD\xbeS;\xdc=\x96[\x97=\xc8\x00\x11\xbf\xb22\xf2>\xbc\x87&>jo\x84\xbePd&\xbfV\x1b\x16\xbfP\x05v\xbe\x7f\x04?\xbe\x0e\x94I\xbe \xe0\x879\xf41\xac=fu\xfc=\x92b\xe1>\xa2L\x90>s\xb5\x03<\x9a\xff\x91<\xa2b\x1a?\xbeM\xb8\xbe\xe2\x8f\x02>jN <\x0f\xae\xac>\xd2\xda\x04\xbf\x14y!?\x9af\x17\xbe5/\xd2\xbewn\x17>\xa2"\x9b\xbe\xd3\x9d6\xbe\x8d\x01\xd2>n&===\x19\xb6>\xe6CG>\x95Jp>hao\xbe\xe34\xa1\xbd\x82\xfe\x9e>\xe3cM>\xb6\xac\x98>.\xf4\xe7>\xe3\xba\xd4\xbe\x06]\xae\xbb\xbc\xa6\x03?F>\xa5=\xb9\xf4 =\xc7\xac\x1f\xbfN\x1bW\xbe\xa6\x9c\x0c?p\x9ez>\xa2-\x83>~A,\xbd&p\x05\xbf\xdd*y>"\x89|\xbd*\x0b#\xbe\xf6\x06#?}\xa3~>6^\x0e\xbe\x10"\x99=s\xbc\xa2\xbdkV\x92>\xc2U\x08\xbe\xe5qN=\xdb\xd1e>8\x8d1>@\xcb]>\x0e\xe0\x17>2\xec\x18=\xe2\xa1O=\xd8\xae\xcd\xbdXh\xae=\xf2\xd7V<\xae\xc4N=\n\x85\xfd\xbeu\xc8\x8d=\x9a_\xc1\xbel\xee\x91>\x8a\xb6Q>b\xd6\x0f\xbf\x83n\xd1>\xe4\xa4\xcc=e-\xcc=\xf5)Y?\xc0\x97\xe3\xbdG:\x08<\x03\x05\xe5\xbb\xf4\xf6?\xbeo=\xba>*q\x95>\xa9_6\xbd\xcb\xc3\x12?s\xb6\xc2\xbe\xf6[[\xbb\xb5d8>\x15\xa0\xf6\xbe\xf6\xd8\x93\xbeM\x94\xee\xbe\x86d,\xbf\xcf\xbc\xc4\xbe\xdaW">\xda\xd1\x9a\xb9\xd6\xc6"\xbf\x96\xce\xe6>\xbb\xbf\xc8=\xfe\x1e\xd6\xbc\xbdP]=\x14d\x81\xbe\xb4o\x94\xbe}\x80\x10?m\xc3\x9b=\xe2I\xb9>\xe9\xc6\xa3\xbeO\xd22\xbf^Iz>\x86l\xdc=\x8dw\xd5>\xa2<\x94=\x15\x1e\xb7\xbe\x92Oa\xbe\x16\xe8\n?\xd3\x1f\xd0\xbc\x16\xee\x83>\x91G*>~|\xb7>\xeb\x10\xad\xbckN\xa0>\xdfz\x03=\x009\x99>\xfb\x08\xef=\xfa\nA?;l\xe1>pFY\xbd\xd9|)=\xbe\x99b>\xbd\xfa\xd1\xbd'
-p1009
-tp1010
-bsV504267587392667649
-p1011
-g2
-(g3
-(I0
-tp1012
-g5
-tp1013
-Rp1014
-(I1
-(I200
-tp1015
-g12
-I00
-S'Ru\x05?\xee(\xc8\xbd\x86\xb6?\xbf\x88\xdb\xe2;\xfb\xb6\xd2>\xa7\x91\x1a\xbe\xb5\xd9\x16>i\x82\xa0\xbe(\x06<=\xf2up=E\x90$\xbd\x92.\x00>w\xd7\xa7>\xb68\x98=\x83Ne\xbeV&\xd0>\x0e\xbf\x8c<\xb6\xdb\xc3=9\xc1\x94\xbe\x99\x8f\x84;K\xb3\x81\xbe(d\xba<\x01\x18\x8f>\x1d\x89\xbe\xbeC\x80\xc4;\x80\xce\x90\xbe\x99M\x9b>UOu\xbe\x83\n^\xbey\x8d|=\xebL\x1d=I\xe1\xf8\xbd\xd8e\xcf=\xdd\xe3\x16\xbf\x02\xe50\xbe\xc1\x99\xa9>k;\x00>zD\xc1>\xda\x9f\xda>V&\xaf\xbd\xa0\xc8\\\xbe\x87\x96\xc7=K\x15W>W\xfd\xd6\xbe\x99t\xab\xbe\xd7\xfdu\xbe\xe6\xc8\xfb>m\xef\xe9\xbd\x81\xac\xb7=C\xb6"?j\xc99>\xcb\xe2:?\x83g\xb0\xbe\x06t\x89>7\x9b\x8a\xbe\x0f,\xcf>\xc7\x1e\x0c>\xeb]\xc8\xbe\x12\xf5c\xbe\xf2\xd8+\xbf\xe1\x85\xb1>\xd6\x18\xea=\xbc\xc0\x8a\xbd5\xccg\xbe\x8dF\x81>B\x87}>w\x8d\xc3\xbe0\x925>\xf7H\x93\xbe\x85\x1fX\xbe\xe7q7\xbfY#\xae\xbe\x81u7=\xde9y\xbeg\x0f\xa2\xbe\x82\xe10>\xbe\xf5v>5Y\xcc<\xfb\x91x>\xf8@\xbc>\x9d\xd7W\xbe\xb7\x8aL>\x91\xb0\xbf>\xd8\x86\xc6\xbdbV\x88=\x9d\xfbx>H\xe9\xcc>\xff\x87\x1c\xbf\xab\x90H?\x0fT\xb3\xbdTG\x05\xbf\xb2t?>\xc5\x13\x00\xbfY\xb9\t<\xd0\xf6\xf2>\xfe\xe8\xa4>)\x0c5>\x1aT|>8o{>\xd8u\x1f\xbe\xab\xed\x8b=\x96O\xd4>!JM>\xdd \xcb>\x08\x90\xb1>\x9bu\xac\xbe\x9f3h==\x82\x87>-p\xa1=\x92\xdd*>\xeb\x98I\xbe\xae\xb0\x0e>v*\x96>w\xe3\xe3=\xf6\x98}\xbd\x07\xdd\xa4\xbd\xder\x14\xbf\xc0m\x08?7\x82R\xbd\xd7\xb35\xbd\x05S1?V\xf7\xd5=g\xa9\xb5\xbd\xfb\xe2%>\xee\x12i<\xcdp\xdb>\xb6\xf4\x84\xbe\x9b\xa9\x94\xbd\xe2V\xb0=\x1b\xec\x92=\xc3\xf9\xaa>B\xe7\x90>\xde\x83I>e?\x88=\xe2\x0c7>\xd6K\xe0>\x8aq\x0b\xbd\x16\x0e.=\r\x07\xae\xbc\x8a\xf0\x1f>\x0e-\xc7\xbe"\x97\x0c?+\xb2\xcf\xbd{\xa92\xbf9\xe9e>F\t\x99\xbe\t\x87\xa3>\xd1*\xec>F\x1d\xfd\xbdq\xee\x9c\xbc\xf2U>=;\x01t\xbd\x1e\x82\xb8>A%\x88>@*g>Q\xc1.?\x0f\xe5|\xbe\x8a\x8c)>\xf8\xe8<>U\x8b\x85\xbe\x95C\xb7=_\xa6\x9e\xbe\xf8{\x17\xbfX\xed\xb9\xbe\x08`\xeb= \xa7R\xbeq\na\xbf\xa7F\xb9>\x8f\xb9\xf3\xbc\xd5\xf2\x8a\xbc\x84\xd1\x8e>el\xa4\xbe\x83\xe4\xc0\xbdp\xd4.?\xc0\x1d\xd5=\x16\xfd\x17<\xc7h\x9d\xbeY\x11%\xbfi-e>\x92_<>iT\x0c?N`\x07\xbd\xebOk\xbe\xb2\x93\x1f\xbc\xe9(\x83>^n\xe4<\xff\x9e\x11?\x01\x037>\xab-\xae>\xcd\xe3\xa1\xbdC\xed\xdb>\x88l\x1d>\xb9\r\xd0>)9\xa7\xbcs22?\xabO\x9d>\xb2\x16Q<]\x90\xc9\xbc\xa2\xf5J\xbd0\xc5+>'
-p1016
-tp1017
-bsV503972686620393472
-p1018
-g2
-(g3
-(I0
-tp1019
-g5
-tp1020
-Rp1021
-(I1
-(I200
-tp1022
-g12
-I00
-S'j\x05\xef>L\xe0\xd2=F\x88\xf5\xbe9\xa8\xc0<\x95x1>\xa2\xcd\x0b\xbb\xc6Eq\xbd\x19\x9ao\xbe\xf1\xdd\x8f=N\x89\x92>Da\xa4\xbd\x0e5\x89\xbdj\xd2\x95=\xd0\xd5K\xbd\xfc3\xb7=~_\xce>ZO\xdc\xbdY,\x0f\xbeO\xfam\xbeIN\x08\xbe\xaf\x07\x16\xbe`l\xab\xbbR\xc7\x82>\x91\xfe\x9e=\xdc\xa3\x86=@r\xf1\xbd\x9bV8>\xdf\x95W\xbd\xf2Fr\xbe\t\xae>\xbe\xd0\xd1\xbb\xbd\x7fD\xf4\xbc\x9bE\t<"\xd5\xed\xbe\x8f\xd8\x8a=\xe4:\x87>\xb7\xca\x89>\xbc\x02\x7f>\x19\x95\xa1>\xa1\xdd\xdf\xbd\x0e\x89\x87\xbe1z\xbb\xbdU\xe6\x83<Ap\xe6\xbd\x01q\x93\xbe\x04T\xe7\xbd\x969\xdf>\xfc\x1e\xa1=\xd7\xdf\x05>GJ\n?\x0f)\x9b\xbc\xbf\x9b\xee>Z(V\xbe\xf6\xf6\xf7=_\x9d\xd2\xbeA\x1a\x1f>\xd9\x88\x8a=\x0c\xf2\xe7\xbd\x14\xc7\xfe\xbe|$\x00\xbf\xfa\xfdU>q\xd1\xef>\xb2\xa6\x8f>\xeb~:\xbe\xc1I\xa7=\x8f\x93\xa0=a\xe4\xab\xbe\x9f\xa9\xe2>\xe6U\x06>\n#e\xbe\xb2C\x00\xbf\xdf\xe4\xe4\xbe\x0e\x1a\x89\xbe\x14\xf9\xbe\xbdh\x80\x0f\xbe\xa7\x80\x18=\x82,@=\x10\x84\xda=\xfd\xb2\x9c>\x1b\xb3j>\xd1-s<\xb6\xb9z=\xf0=\xc8>\x97\x1c\x97\xbe\xce\x1f\xdd=8A\x86=<\xcb\x9d>vX\xa2\xbe\xea\xae\x04?7)\x03\xbe\x80\xd6\xb9\xbe\x9eu;>J\x86\x8f\xbe.\x88\x18\xbe\xf9w\xa0>+\xf8\x05<2\xcf\x97>TWW>\n\x9f+>\xa99W\xbe\xd0\xa9\xcd\xbc>Jx>\xa5+G>`\xe4\x82>\x00>\xf4>\xe6\xcco\xbe\xb1\xb0\xe7;K\xc9\xb5>L\xa3~<\xc9X\x81\xbdP\xc8\xe4\xbe\xd9\xdf+\xbd\x15\r\xac>\x9b\xd8(>\xbe<\xde=\tE\x9a\xbd\xef\xef\xcc\xbe\xe0\xf0\'>\x92J\x14\xbdZ\x80d\xbd\xc4\x13\x04?\x19ey>\x0b\xbd.\xbd|.T=\x0c.\xc9<vb\x90>\xdf\x88\xca\xbd\xb5\xfe\xd4=JC\xb6=i\x98\x0b>Q\xfa0>\x89h\x13>Ev\xd0<\xf0$\x87=EHv\xbd\x1a\xd0\x00>z\xb6G<\xf6\x15r=\xeb\xe1\xb8\xbe\xba\xca\x8f\xbd\xf5\xcc\x97\xbeeE\x9b>:\x0fI>\x06\x90\xe9\xbe\xd4\x16\xa9>\xac9\x82=\xeb\xca\xa6=\xda\xf5\x17?G\xb9\x03\xbek\xd8n\xbc\xa0\xa4}<\xaeV\xec\xbd\xb7\xbam>\x8c\xda,>/\xcf0\xbd\xea8\xef>\x08\xaa\x88\xbe\xb9\xb1\xcc<\xaba(>da\xd4\xbe\x06\x17"\xbe\xe1\xb1\x94\xbe\x84\xec\x07\xbf\xcepi\xbe\xe7/\xbc=\xdc\xd8\x01\xbdD\x91\xf2\xbe\xdc\xf2\xcc>\x00d\xa7=\x1b\x8f\xcf\xbd\xf4\xd0\xeb;\x9c\x80\x83\xbe1\x1f\x8f\xbe\xee\x9a\xf7>\x0eke=O~0>\xef\xfd\x8a\xbe\xe0\x89\x0e\xbf\xc0\x05h>\x9eM(>\xf6\xe9\xad>\x00\xe0A<\x07[\x84\xbe\x15D\xf7\xbd\x9c\xb0\xc7>\xe9\x8dK<O\xc2\x91>\xd6\x86\xf8=\xd7E\x93>\xd4Vp\xbd\x9f\xe4y>\x92b%=alb>\t\xf3\xed=f\xc8\x18?\xc4g\xb2>\n44\xbdA8#<\x8e\xf2\xe5=F\'\x84\xbd'
-p1023
-tp1024
-bsV504270071121068032
-p1025
-g2
-(g3
-(I0
-tp1026
-g5
-tp1027
-Rp1028
-(I1
-(I200
-tp1029
-g12
-I00
-S'\xb4\x01\xbf>\x9f\xb0\xa3;\xb3\xc6\xd3\xbeaR \xbc%5n>\xdd\xbdD\xbd\xc0\x83\xf6\xbbY5g\xbe\x94|\x04\xbd\x8c\xcdV>\xff\x8fD\xbb\xb6\x19\x92<\x9a;(>\xad\xec\xe6\xbb\xbc#\xae\xbd\x01\xa1\x97>^\xec\x90\xbd\x8c:8\xbd3\xc93\xbe\xeds\xa3\xbc\x0f\x95k\xbeh \xc6<\xca\xda\x0c>OWF\xbe\x85"\t<\xf3\xc2\xeb\xbd`\xc1^>#\x90\x0f\xbe\x0f\xa6\x8a\xbe\xbd\xfc7=\xb9\xaf)<\x05\xcav\xbd\x8c\xf7\x88=\x1b\x1c\xa7\xbe\r\x89\xd1;\x03\x19r>\xd8\xe64>\x0b\xa31>\x03b\xb6>\xc9\xf1\xf6\xbc?b\x06\xbe5\x9a\x9c\xbb\x03\xc5x>KD\x80\xbe\xfcp+\xbeT}\xab\xbdtw\xc8>Ay1=\x80\x0e\x97=#2\xde>y\x16\x88=\x19j\xf0>c\x81b\xbex\x83\x8e=o~\xdc\xbe\x0f\xffS>\xf45\r=\x04\xcd\xe9\xbd\xb8\x1d\xe9\xbesA\xd3\xbe5\x0f\x86>\xe4>_>?\xac\xb2=\xc1\xecL\xbe\xe0\xaf\x99<)\xd2\x1e>\x85\xad~\xbeYQ\x90>\xa7\xf6\x1a\xbex&\x01\xbe\x14$\x00\xbf,\xe4\xa7\xbeCU\x07\xba\xbf\x03\xdf\xbdA\xc4\xf2\xbd\xf7O(>[\xdf<>\x93{\xb4=\xb8X\x1d>\xac\x80I>k\xd4z\xbdr\xe8\x97\xbc\xe3\xd4\xa6>\t\xd0Z\xbe\x8bO\xb9=,\xff\xcb=J\x19\x8f>\xab\xe4\xa7\xbe\x9d\xc7\xf3>g\x96$<\r\xe4p\xbe\x08\xaa\x18>\x03\xf8\x8b\xbe=L\x02\xbd\x8c\xe0\x9d>\x94\x86b=\x9f~%>\x9f\x1bs>e\x16\x1f>k\x95\xa4\xbd\x1fL\xcb=\xe0a\x7f>\xe7\xdf\x11>u\xba;>\x19\xf9\xad>3\xb1o\xbe\xf0+\xec<%\x01 >Mp\x97<\r*L</\x8fV\xbe\x92\x9e\x14>O\xff\\>\x9fL\x1e>I\x13\xa5;\x140\xf2\xbc0Y\xaf\xbe\xde\xcc\x8f>\x99\x04&=\xc7\x1a\x8d=z\\\x05?\x9c\xc7\xb7=\xd9\xd4\x82\xbd\xcbE5=\x7f\x18R<7\xda\x87>\xd3\xc7\x0e\xbe\xa2\x97\xa1\xbc\x9a\x8f\x8d={\xa5r=\xd8\xe4\xde=p\xef\xcc=\xe0\xbb\xaf=!\x08\x06=\xabT\xa5=\x00\x95\xd1=\x0f\xf0\x86\xbb\xdb\x8ec<\x99\xb8l\xbd\xcc\xb3\x82=\xf8\rG\xbe\x15\x90\x9e>\x0bKY=\xf9j\xbe\xbe\r\xd8|>\xa9a\xd6;\x83\xa5E>\xd9L\xab><(\x18\xbe\xab\xa6x\xbc\xbd\xde\x8e\xbc\xa09\t\xbe\xb4\xcas>5I[>\xab\xe0`<%\xed\xbd>W\x92\xf2\xbdA\x7f\xf0=\xf9\xc7\xb3=\xd0X\x95\xbe\r\x9d\xc2<#5}\xbe\xfbm\xbf\xbedU9\xbe[\xa9I=\x87\xba\xcc\xbd\x81Y\xde\xbe\x19\x01\x8c>i\xf9\x11\xbd\x14\x1c\x94\xbd\xe7\xa7o=\x91\x9f\x1e\xbe\x96\x93&\xbd\xf0\x85\xf8>\xf9o\x92=\xe7\x97@=\xc5\xc7\x91\xbe\x15c\xd2\xbe\xbcQ8=\xf9\xd8\xf9=\x1b\x12\x87>\xfaP\t=\x8c\xa8V\xbe\x97\xe7\xc3\xbd\x0c\x04\x8d>s\x04\xf9\xbc\x83\x13Z>\x15\xcd\xb0=\x93\xc9\x87>_j\x02\xbeM\x95R>\x14!d=[\x8cB>E\xef\xe3=\xd0\x11\xed>(B\x99>k>\x83=5\x92P=8\\r=n\xcc\x01>'
-p1030
-tp1031
-bsV503965702152527872
-p1032
-g2
-(g3
-(I0
-tp1033
-g5
-tp1034
-Rp1035
-(I1
-(I200
-tp1036
-g12
-I00
-S'Q\\[?\xac\xe5t>\xf5*\x06\xbfT\xbdS\xbe\xea\x98l>\x87[\xf5=s\xe7\xb2\xbdA\xf8\xb9\xbe\xf6\xb5\xc5=\x98\xd9&?\xb8;\n\xbe%:c\xbe\xfb\x00\x99=\x97%"\xbea\xec@\xbd\x88?\n?N\xd5A\xbe%)M\xbe\r=\xbf\xbe\x836\x80\xbeBM\x88\xbe\x07e\x99=\xd8A\xb1>wO\x86>"\xb5\xf3=\xbb\x16,\xbe\xf6\xd1\x80>\xbd\xff\xfb\xbd\xcd\x07\xf6\xbe\xa6\xec\xb2\xbeM\x8e\r<\x98\xdfM\xbd\x18\xcaP\xbdV\xad\x17\xbf\xac\xfb\xf5=\xe4\x81\xc2>%\xd0\xfd>-sX>\x07d\xdc>\xa7\x9e\xf8\xbc)\n\x8d\xbeL\x94A\xbe\xd9\xb9\x03>\xe7\xc2^\xbe@mX\xbes.\xb6\xbd=\xfe"?1\x03\xbd=\r3\xf5=\x08\x95^?6\xd4\x13\xbey\x1d#?\x88\xb8\xe5\xbe\xac\xcf\xee=\xd5\xa2.\xbf\x17\x88\x04>d\x91T>@\x98]=\x11]i\xbf\xd5\x0c0\xbf}>\xd0>\x00\xd5R?\x0b<\xc7>\x82\xadL\xbeo`\xb0\xbdl\xd3\xef=\xee\x83\xd4\xbeZ\x19K?\x83\xf3(>\t\xd4\xc2\xbe\tY\x0c\xbf\x9b\xb0\x11\xbf\xc7\x04\x95\xbeYkL\xbe\xbb\x96W\xbe\xea\xe2|\xbd\x97\xb6P\xbd(\x94J>\x0e\x83\x9f>\xd9(_>\xe3\xd2==\xb7\x91\xc3\xbd\xb9\xfc&?s\xf1\xca\xbe>\xecH>\xc7@u=K\'\xb0>8\xeb\xb5\xbeS\x08+?\xac\xc6\xf3\xbd(\x08\xdd\xbeK\xf61>H\xe4\xbc\xbeK\x17Q\xbe\xca\x8d\xed>\xcd\x1b\x86\xbcN\xf2\xd0>;/\xb4>U\x1e0>h:\x8f\xbe\xe4\x1cL\xbe\xe2\xd1k>-\xa9\x85>\xa0\xf3\x1c>\xd1K\xe9>\xfb\x81\xa4\xbe\xa7\xb9\xf8=!\xa7\x11?\x0c\xe4\xe5\xbc(m\x8d\xbd\xc8\x05I\xbf\x90\x14S\xbdfr\xd3>{\xce\x08>\x7fPE>\x18b\x81\xbd@\xb8\xf8\xbe\x08(\x80>\xfe\t\xaf=Z\xf5\x18\xbd\xaf\x9f#?\xa1f\x9b>\x84\x9c\xcc\xbd\x12\x80\x14>\x1c\x83\x9d\xbb\xdd\xdb\xdf>A\x9d\x07\xbe\t\xafL>\xe7\xdc\x9a=m\xdf\xb9:\xeb\xfa\x1c>\xbb\xc5\x89=\xa8\xff\x8b\xbc\xb45^\xbck\xd5M\xbd\xb5\x00\x91;\xb8\xf0\x9f;~\xea<=\xe7\x1e\x05\xbf\x13a;\xbd\xca\x10\x9c\xbe\xff7(>\xa4\xbf\xa6>\x04S\n\xbf*\xd8&?:\x9b\x8e>+{\x1c>t\xa5U?\x8dP0\xbe\xb8_\xf8\xbc\x8ez\xd1\xbd\x9b]\x81\xbe\xc0\xb9\xab>\x9d\x8e<>\x8f\x9e\x8f\xbd\x8c\xdf\xe0>\x8f\xeb\x9b\xbe{\xb7\x17=#\xe7\xb1=\x8dS\x18\xbf\\\x1f\xcc\xbe\x1c\xe1\x86\xbe\x89\xaa$\xbf^\r\xb7\xbe\xb6\x02k>\xb2\x05\x89\xbc\xaf\x1f&\xbfB\x11\xdc>\t><>\xa3\xd7\x0f\xbe\xea\xc7 =\xe20\x81\xbeL\x81\xaf\xbeBIK?\xde\x03#>\x0b\x05\x98>s\x02\xce\xbe\xc3\x8dS\xbf(v\xce=\xddd\x87>\x9d\x0f\xd0>\xa6\xc1\x12<\xe2\x0e\xee\xbeZ\xd3\xc6\xbe\x1f[\x10?\x10\x82\x90\xbd\xed\xbb\x8c>\xb7\xc9\x05>\xef\xd7\x95>Q\x96\xc5<8\x0eO>?\r\x92\xbc\xd8v\x99>\n\xcf\xe7=\xb9HW?\xbb\x8a\x0f?D\xdbJ\xben\xb8\x9d\xbc\xbbNl>\x93\x8d.>'
-p1037
-tp1038
-bsV503958452515778560
-p1039
-g2
-(g3
-(I0
-tp1040
-g5
-tp1041
-Rp1042
-(I1
-(I200
-tp1043
-g12
-I00
-S'd\xa5\xf8>\xc8\xf5\xb3<\xf4p\x04\xbf\xc7Cc\xbd|r\x9b>qr\x03\xbe\xe7\x82\x05=\xb7\'k\xbe\xf3g\xa6\xbc\xa1\x97\xca=W}`=\\^\xe5=\xa0\xf4a>t\xdb\x02=\xc9\xc3\x94\xbdf\xba\xc9>9\x9a\xee\xbc\x89\x1fh\xbc\x870E\xbe\xe4"$=\xf8\xfe\x8f\xbe\xfc\xbc\x8c=g7g>\x11\x88\x82\xbe\x17\xd2\x16\xbb\xe4\xb6 \xbe/\x145>\xbc1m\xbeJ\xeeW\xbe\x00\x00\xe8=\x1f\x1d\x17>}\xe6\x9b\xbd\x17\xc3\x90="\xf4\x84\xbe\xd0\x959=\x96p0>\x19\xcf*>\x96\xd4s>\x164\xb2>\xdc\xb9\x82\xbd\xbc\xbf\xdf\xbd\xa3>\xde\xb9\xcd\xb0\\>\xaf\x17\xaa\xbe\xc6\x8c\xf0\xbd\x0fx\xa5\xbd6P\xc7>\x17m\xbd\xbd\xa4lb=\xca\x02\xe2>9\xc7\x9c=\xd1\x15\x05?\xb9T\x7f\xbe\x16o\xf7=2\x98\xb4\xbe\xa9\x08j>q\x11\xef=\xfa\x8f\xf9\xbd?\xcb\xd6\xbe\x19\x98\xda\xbe\x8d\x99\x91>\t\xffe>9\xa2\x0b\xbd\xcd\xd5;\xbeC\xff\xba;+\x85\x14>l\xd4W\xbe\xca\x1e\xa6>\x8d\x9ad\xbe\x94\xb0\xe3\xbdK\xc3\x10\xbf\xdbm\x92\xbeTH\x97\xbd\x86\xce\xb7\xbd\xea\xef\x10\xbe\xd4\xb94>\xb7\x07\x1a>\x96\xb3\x81=\x14\x03\xdb=\x80\x10e>\xef\xf5\xd4\xbd\xd7)\x9a\xbc\x1c4P>\x97\xd5H\xbe`,\xee=\xf3\x98T>_=\xbc>\xf6\xf8\x95\xbe\n\xc3\x0c?\xff;,\xbc\xa3\xcc\x96\xbe6\xd4M>6>\xca\xbezw\x19<a\\\xa6>\xce_1>\xb0JC>\x87e\x8a>Fn\xc3=\xe8\xf3\x19\xbe\x83J\xc9=\xc8\xbf\x8c>A\x8c!>\xa0lH>\x8d\xec\xc2>y^+\xbe\x1c\xa5H=\x84\xadO>\xc7W=\xbc)\x9d\xff<\xea\'B\xbes\'Z>\xff\xadg>\x10\xd9\xa6=\x8d\x1d\x9d\xbdi\x17\xb4\xbda\xe8\xae\xbe7\xd0\x88>\xe4\x19\x8a=/\xe5\x03>\xa9\xeb\x12?\x13\xd7\xbb=\xb4\x90\x84\xbd\x98\x94\x16>\x94y\xba=\xc4l\x99>l\x0b$\xbe\xffr5=Q\xf2\x1a<Y\x11\xde<g\xc1\x1f>+\x04\x0b>\x04\x99\x9d=\xdf[\x0c\xbc\xf1\xb0\r>\x03L\x0c>\xdf\xcb\xaf<\xd1v)<f\x14\xcf\xbc\xd9\x8bS=S\xd3P\xbe\x0e \x95>x\x02:=\xa7\xac\xc7\xbe%"\x95>\xd4\x8c\x8d\xbd\xd1\xe5?>\x91\x08\x96>\xff%\x17\xbe\xba\x01\xf3\xbc\xe31{=\x86]\x80\xbd\x11Oq>\xc6\x83\n>\x12A\xaa=\xf8\x0c\xba>\xe6Z\xb7\xbdI3\xd8=\xf0<\xca=\x8c0\x80\xbe_\xab\x9d=WB)\xbe\xfc\xab\x90\xbe\xe9\x9e\'\xbe[e\x8a=m-\xf3\xbd\x97:\xd2\xbe\x04\xf2\x8e>\xd6\xdc\xcb<\xb6v\xc7\xbd\x90h\xe5=\xb5!\x11\xbe\xbc\xcf\xaf\xbdN,\x07?\xd6\xb1\x98=J\xe7|<\x14\xcd\x8d\xbe\x91\x1c\xf8\xbe\xf4\x8f\xbf=\x8cCR>\xc9X\x94>L\xba~\xbd\x00i:\xbeG\x19\x83\xbd}\xe8v>\'m\x0e\xbd\'\x98\x97>zX<=\x10ms>\x9a(\xfd\xbd\xd0Fa>,9L=\\%4>N\x1b\x19>`-\xed>r\xe2\x99>3\xbbM\xbc\xac\x8c0<\xf4/\x0c\xbd 4<>'
-p1044
-tp1045
-bsV503970702983462913
-p1046
-g2
-(g3
-(I0
-tp1047
-g5
-tp1048
-Rp1049
-(I1
-(I200
-tp1050
-g12
-I00
-S'<!\xa8>{\xe6\xe6\xbc>\x89\xc3\xbe\xdb\x83Y\xbd\xfd\xa0J>"\xbf\x08\xbd@zJ<\xccG.\xbe\xac\xed`<h\x1c(>D/|\xbc\xc2%t=)\x02&>3,\xb6\xbc\x84\xe3\x9c\xbd\xdcQy>QQ=\xbd\xe2\xef_\xbc\x8d\xc3,\xbek\x01\xb3;\xbbI\\\xbe>\x9fS=KS\x0b>\x95\xa9\xfa\xbd9\x0c\xbe9\x9a{\x13\xbe\xac\xaf=>\xc0\x15\n\xbe\xa9\xbfQ\xbe\x9c\x1c\xba\xbbw\xf3\x9f=\xc4\x9b\xf8\xbc\x89\x1d\n=L\xea\x96\xbe\x7f\xad\xa3\xbc\x05\xda(>v\x88\r>\xe1?3>\xdf:\x84>\x8e\x8ff\xbd\xb0\xb6\x05\xbe\xf5j\xb5<U\x91\x10>\x9e\xb9\\\xbe\x9b\xd7\xe7\xbde\x9b\xb4\xbd\x8d\xa4\xa8>+\xfd\xe6\xbc\x86eU=\xc6\xc9\xba>.y\x1c=\xbfP\xd4>\xae\x14M\xbeW\xca\xee=\xbbh\x91\xbe9Z^>\x18\x8c\xa0=\xfe\xa9\x11\xbe\xeb\x11\xa0\xbe\xa0K\xb5\xbeB\xebi>pO?>Ji5<\'\xdd\x0c\xbe\xe47D=5\x91\xfd=\xa6eb\xbe\x9e\x14\x80>4\xc3\x13\xbe\x92-\xaa\xbd\xfct\xbd\xbe\x80^y\xbe\x84\x8al\xbc\t4\x90\xbd\x14h\x03\xbe\xbeZ\xbf=\x8a}\x15>R!|=\xd6\xa8\t>\xd3\xe0(>dz\x9c\xbd\xf1c\x17=\x1e\x1ez>t\xa0(\xbe\xa7V\x92=\xf1a\xd4=\xd2\xdbj>y\xe6\x88\xbe\x96=\xd0>\x1dj\x1d<\x01M\x83\xbeD\xa3\xf3=P\x85{\xbeH\x9f\x81\xbc\xbbk\x96><\xa5\x8b=\xc4v\x12>i\x83<>\xda\xad\x10>\xbc\xb4\xce\xbd\xb4\x18 =y*T>\x94\xf5\x08>"\xc8*>\xf20x>\xbcb.\xbe\xcb\xff?=\xa0\x10">\xd5x\x83<\x15\xa7\x8b;F\xad9\xbed\x84\x94=U&\x12>\xf7\xff\x9a=UQE9\xeb\xf5\xc7\xbc\x83N\x96\xbeW\x14c>\x07p\xe3\xbbd\x14o=\xe97\xd0>XM\xcf=5`h\xbd\xf4\x08|=\x9e\x80*=\xfb\xef\x8b>\xe4\xda\xc3\xbdT\r\xa5\xbc7\xce\xb0<\xc5\xa3\t<\xd0\x9d\x00>\xf5_\xd0=\xd7[6=p\xc3\r=\xc3h\x91=\xea\x167>\xf0XT;7=\'=\x8d\x92\x83\xbd\xa8\x02\x85=\x1c\xb43\xbeDTp>\xe9\x95$<\xbb\x9c\xa5\xbeY\x10Q>"\x8d\\\xbcuw0>="\x8e>~k\x05\xbe\x0cd\xca\xbc\xc0\xa7V\xbd\x94Y\xd0\xbd\xb2\xfbH>b"\x1b>?0\x10=\x1d\xdc\xa7>g\xff\xf7\xbd\xe4\xee\x82=\xa4J\x9a=\x84\xa1c\xbe\xf4\x82\x8b<o\x07\r\xbec0\x9b\xbe\xd384\xbe\x18:S=\xf0\x88\xc7\xbd\xb5.\xc9\xbep=o>L\xb2F\xbc0b\x18\xbd\xc4\xd0\xc4=e3\xe4\xbdt\x8d\x85\xbd/\xf7\xdc>\x8b\xc8\x80=/\x1f\xd0<\xdb~u\xbe\xd3\x9d\xba\xbe\xa0\xc5\x96=\\\xb6\xe1=H\xaf\x88>\x9d\xb0\x84<L\x937\xbe\xe4\xd2\xad\xbd\xf9\x91E>df\xb0\xbc\x82\x98u>\x10q\xb9=\xee\xe4L>\xff\xb8\x1d\xbd!\x1e\x1d>\x85\xc5^=\x86\xd3$>M\x16T=QC\xd2>y|w>b\xe8\x1c=z\x7f\n\xbc\x00\x9a\x7f<B6\xb5='
-p1051
-tp1052
-bsV503965264762138624
-p1053
-g2
-(g3
-(I0
-tp1054
-g5
-tp1055
-Rp1056
-(I1
-(I200
-tp1057
-g12
-I00
-S'Z\x0bz>\x8d\xa7\x91\xbc\x99\x95\x85\xbeO\x82\xe5\xbc\xd2\x1d4>\x9e\x88\r\xbd\x9b\x13\xba<=Q\x12\xbe-A{\xbd\xfa\x80\xf8=\xcc\xde\x00=\xbd\x06\xd7\xbbQ\xac\x1e>\xb2\x87\xa3<\xf0\xcb\xc4\xbd\x19ua>\xcd\x15\x11\xbd\xb8\x07\x18\xbd\xb1\x19\xe7\xbdfMa<\\\xb20\xbe\xbc\x16\x17=\x86(\x9a=J(\t\xbe\xc6\x0b\x1c;]\xf1\xbe\xbd\x87\xb4\xfc=\xaa\x7f\x00\xbe->8\xbe\x19\xc4\xe1<#\xe5\xd9\xbc\xc1\x9b$\xbd0G\xa9=\xd4lR\xbe\xda\x0b\xa5;\x8fM\x08>\x84\x87\xd0=w\x9b\xd6=,=P>\x0c\xf2t;IN_\xbd\xc1\x93\x16<|k\'>\x81f[\xbe_m\xa4\xbd\xbf/+\xbd\xd7Lj>,p><M\xa7F=\r\x93\x89>\xf4\xd7*=a8\xa8>Y\xd9\x0c\xbe\xd1\x8ei=\x04*\x8a\xbe\x83\xde\xfc=4\xf9\x85<\xbe\xb1\xb0\xbdC\xd6\x97\xben?\x86\xbe\x81o$>-\x87\xc0=y\xd9\xa8<\x1a\x06\xf8\xbd\x80S\xbf:5#\x01>\xd6\xad\n\xbe\x89-\x1d>\xfc\x16\x18\xbe\xa6\x8d\xdb\xbd\x84\xad\xa0\xbe\x9d\xb4*\xbeA\n\xe9<Qo\x88\xbdY\n\xac\xbd\xa6\x8a\xf9=9\xc2\x13>j\x19\x85=\xa2\xff\x95=\x19\xdd\x1d>\xa37y\xbd\x9ag\x9c\xbcq\r]>P\xcb\x15\xbe:\x93}=\xf2\xb0\x94=Q\x12@>\x9a\x82b\xbe\xed\xcf\xab>\x970\x92;\xbd\xa9\r\xbesM\xaf=\xb9g<\xbe}\xe1[\xbc\xb4\xf7Y>\xda\xdc\x92=\xd7\xae\xdc=\xf6A/>|\x07\xa7=\xffPT\xbd\xbc\xb4\x91=4\xd1;>\x97D\xe2=oI\xe1=Q(m>C\x9a\x03\xbe\xcfd\xe8<c\xcd\xa5=\x1c\xcd\xcf<\x99\x9a\xf8<\x8ck\xc2\xbd\x8c\x81\x18>1,\xb0=\x13\x08}=f\xe1\'\xbdO\xbd\x14<\xe0\xebY\xbe&~K>\n\xd0\xfa<\xbd\xf7\x90=~\xf3\xb1>\xd9a\xfb<\x18l\xb6\xbc\x04\xf0\xc0<\xec\xb6\xb0\xbbF>H>\xbd}\xd8\xbdt\xa3\x81\xbc\x8bj\x05=\x1a\xdf)=\x9au\xf7<\xcf\xa2,=\xb5\xd4\xa2=\xd3\x89w<\xa2\xe4\x9d=\x1c\xbf\x9b=\x9a\xb8\xd1\xbcm*E;\x14\x8e\x00=\xb4\xe4^=d\xc6\xf5\xbd\xba\rQ>\xd1\xaf@<\xb0\xa6\\\xbe\xf1\xe78>\x8cG\x07<9\xb9\xf7=\xca\xf3C>\xa6\xd4\xbd\xbd\x81\t\xda\xbb"\x16\x00\xbds~\xaf\xbd!w.>\x99\xee\x02>\xe1\xfb\xdc<#X{>\x9aWp\xbd7\x0c\xc5=y\xa6o=\xf3S2\xbe0\xd9W=@C\xf9\xbd\x83\x9di\xbet,\x13\xbe\x99v\x03=\xa8e\x9f\xbd\x90 \x90\xbe\xba\xc9\x1b>\x1d\x01J\xbdO\x05`\xbd#Z\xda<=\x8b\xdd\xbd\x9f\xa0\x11<t*\xab>\x8d\xdd\x81=\x0c\xf0\xb9::\x94S\xbeOI\x88\xbe\x8c\xa4\n<\xe3\x80\xcc=\xa3eM>\x04\xb8k<v\x12\xff\xbdt\x85\xcf\xbc\x804;>\x8au\x8f\xbc`\xd4\xff=\xb3\x91>=\x11\xef\x1d>\xaa\x15\xa2\xbd#\xed\x11>\xf4\x0f\xa7<\x1f)\xbf=\x87W\xa4=\xa9\x0f\x98>\xd7\xa43>\x1fxC=\x8c\n\xf0<,\xf06=l\x81\xe3='
-p1058
-tp1059
-bsV503967468537516032
-p1060
-g2
-(g3
-(I0
-tp1061
-g5
-tp1062
-Rp1063
-(I1
-(I200
-tp1064
-g12
-I00
-S'\xd0j>?p\xaay>\xb9\xa2\x13\xbf\xd1\xf2\xc5\xbb\xd9\x19$>GqT=\xc1\xd3\xa3\xbd\\\x86\xa8\xbe\x99_\x1a=\xe3\x14\xf0>\xe7\x9c\x13\xbe\xcf\xc8a\xbeS\xa3q=\x8d\x0c\xfa\xbd\x04\xe3\xcf=Vn\x05?\x12J"\xbe\xaeZ\x85\xbe$\xba\xa7\xbe\xe1\x9ew\xbe\x91\xa3\x14\xbe\x0f\\T<\x06\x1a\xbe>v\xf1\x82>d:\x16>\x03\x18\x10\xbe\xbd\x02|>@\xdc\xcb<s\xa3\xbc\xbe\'\x88\xb5\xbe\x00\xbdc\xbe\x05\x7f&\xbd\xccf>=_\x96&\xbf\x99\x99\xd2=[\x07\xb6>d\xdf\xcf>\x9e\xeb\x90>`\xb6\xdd>\xe0^\xea\xbd\xe0\xea\xbb\xbe\xb6CP\xbe\x1c\x8d\x04<\xb3\xe9 \xbe\x86"\xc5\xbeN\xe0%\xbe\r\xd9\x0e?w\xdfJ>\xb6\x990>*z=?G\xd9\x16\xbe\xec\xd2\x1e?\xe1\x8e\xa2\xbe\x1f\xe6\x07>^P\x13\xbf\x99\xed\x80=\xad\xec\xc7=\xe1o\x06\xbdw\x04R\xbf\xdcN(\xbfY\xd8\x84>1\xd5B?\x18Q\x05?gWR\xbe\xbc\x83?\xbc\r\x19\xc9=\x13*\xdf\xbe\xad\xaf&?\xb3\xb8\xa1>\x9f\xd7\xc3\xbe\x11\xbd/\xbf\x9e\xd7$\xbf?\xfb\xd5\xbe\xb7\x1d)\xbe\xb5\x0c&\xbe\x8c\xf2\xb88\xb5%\x8b\xbd\xbc\xb72><\xd2\xf8>\x0eu\x90>=v)=\xbf&\xb5<\xe2!$?\xf1\t\xdb\xbe\x1c\x85\x04>\x94\x8c~<\xe9\x85\xd4>`\xcc\xd5\xbe?0&?J/\x80\xbe\x8c\\\xdb\xbeqT%>\xb7\xb2\xa9\xbe\xc9\xf9\xa1\xbe\xc3\x8a\xbc>\xdav==\x14\xaa\xf2>\xb1\x96\x96>\xa0\xa1\x1f>\xec\x9e\xad\xbe\xf2\xc5\xac\xbd\x97\x95\x94>\xa7\xb7\x8d>\t\xf7\x83>4\xaf\x18?\xc7P\xa6\xbe\xcc\xdb\x83\xbc\xbf+\x11?\x87\x91\x87<\x17P\xc2\xbcl\xe5A\xbfy\xb1\xb9\xbdY%\x06?F%^>\xecC;>\xe3\xba\xbe\xbd&\x95\xff\xbe\x04|L>\x8c\x10\xee\xbcZa\xa5\xbd<\xd0"?o\xf6\xc6>\x1du\xbb\xbd\xdf\xd2\xf7=S57\xbd\xb8\x83\xab>\x12\xb3\x13\xbe\xd7\x1bL>\xc0\x87\x06>\xe1\'\x85>\xa2*3>\x99x\x19>0\xdcI\xbb\x1c\xc5\x97=Tk\xec\xbd\xb4p\xa8;:\x0f#\xbc\xdd\xf1S=\x87\x9d\x10\xbf\x03\xf9\xcf\xbd\\=\xc6\xbe2\xef\xa1>\'[\xad>\xab\xe8\x17\xbf\x9c\'\x07?l\x7fJ>4q#=]\x02p?\x9f\x98\xb6\xbd\xf4\x06\xf7\xbc=\xe90< yD\xbe\xea\x95\xb2>\xd7\x14S>;#\x9a\xbd\x1c\xef\x12?a\xcb\xc6\xbe\xf8\xd1\xac<a\xad9>\xac7\x1a\xbf@-\xb0\xbe\xec*\xe7\xbe\xcd\xb8F\xbf#\x06\xc4\xbe\xef\xea=>\x86\xe3J<\xe4\xd2\x1a\xbfy\xdb\xf6>\xaa\x0eT>\xa9e\x14\xbe}\x87t\xbdM\xe8\xc3\xbeoi\xd8\xbe\xb9\x08%?\xe1;\xa0=\t\x10\x9d>\xd7_\xc8\xbeprY\xbf\x9cM\x88>\x9a\xa0X>3\xf8\xd4>\x99\xbea<i\xff\xb4\xbe\xd7\xedU\xbe\xa4U%?\xb96\xe5<\xd73\x97>\xc4:\xd3=9\x1d\xc0>\\u\r\xbd\x9a\x90\x9d>\x86\xd5#<#\xc2\x86>pF\\>\\Ud?\xd0%\xfa>\x81^4\xbe\x0b~\x89<\xbe\x92\x83>\xbd/\xd2\xbd'
-p1065
-tp1066
-bsV503972586074955776
-p1067
-g2
-(g3
-(I0
-tp1068
-g5
-tp1069
-Rp1070
-(I1
-(I200
-tp1071
-g12
-I00
-S"\xc0!<?\xccu3>\xa5\x7f \xbfyv\x11\xbe\x01\xb6\x8c>\xa1k\x08=\xaax\x1b\xbdS~\x8b\xbec\x1d\x11>\x8d\xf4\xd8>\x1f\xce\xaa\xbd\x101\xa4\xbd,\x97\xcb=\xdf\x8a\xe5\xbd\xc7\xc65=\xb7\xd9\r?\xbc \x10\xbe\xf7\x01\x1e\xbe\x08\xf5\xb9\xbel1A\xbe)\x85|\xbe\xac\x10\xb5= \xdb\xbd>\xc0\xae[>\xa2\n\x01>\xa8 i\xbe\x1bws>\xbc{\xfe\xbd%\xd1\xae\xbe\xef\xe5\xa4\xbe\xc8\xff4=\x08\x01\xfa\xba\xe40\x9a\xbd\x82V\x11\xbf\xc9\xc2\xd4=\x11c\x8a>\xdfc\xc6>G\x7f\xa0>\xe0\x99\xc1>Ww%\xbe\xc3\x01\xac\xbeE\x86\xd7\xbd\xb5\xbf/=\xa3?H\xbe\xef\x0co\xbe/l\x12\xbe}\xa6\x12?\x9d\xaf=\xbb\xa8\xcd\x1a>[uE?\xb5\xe4)\xbd\x1eD&?D\t\xcc\xbeo\x9bW>\xa7D\x02\xbfC\x8dE>+\xa2?>4\r\xba\xbd\xf7!(\xbf\x81\x08$\xbf\xdf\xa7\xc4>\xc1\xd8@?\xa3)\x99>\x19\x7f8\xbe\xa3\x90\x87=\xed\xeb\xd6<`?\xe2\xbe\xcc-4?\x83\x82\x02>\x85\xee\x96\xbe\x82\xc3\r\xbf\xd7\xe2\xfd\xbe\x95\xb9\x99\xbe\xc1\xcb\x02\xbe\xb5\xdbo\xbe\xfcG-\xbd4\xa3m\xbc;\xfb\xc4=7\xc6\x90>\x80V\x88>>\x19\x11\xbc\xd7\xd0\x90;O]\x01?|\xab\xa5\xbe\xd9\xbe\x10>\xc1\xd7 >G\xdb\xc5>\xfc\xe8\xaf\xbe\xaf@-?\x85'\r\xbe\x050\x07\xbf\xf4\xafX>\xa7\xf9\xd4\xbe\xf0\x101\xbe\x10L\xe0>\xda\xcb\x91=\xe77\xb0>iK\x97>\xcd\x19=>\xa4\n\x8f\xbe \xc3\xee\xbd \xf6q>\x08\x15\x85>\x9e\x98\x8c>\xe5'\xf3>1\xca\x8e\xbe7\x8e\xd3=K\xeb\r?\t\x12U\xbc\xd8k~\xbd\xf7Y/\xbfT\x90\xda\xbdp\xed\xd3>5\xd1\x8e=\x9bJ\xb7=\xd7\xbc\xe3\xbd\x1a\xe5\x02\xbfW\xa5;>e\x93k<\xc7\x7f\xfd\xbc\x11\xdd)?\x813\x8b>#\xab\x9d\xbd\x81!D>\x8bO\xc2=\xe1k\xcc>\xe5\t\xee\xbdI\xe5\x19>+>\xa7=\xc5\x86\xb1<\xa0\xe7\x80>h.\xf1=\x1fX\x05\xbc\xfd\xaaD;\x00]y\xbc\x81\xc00>D\xa2\x85=s4\x86=\xc7[\xee\xbe\xf8Qo\xbd\xdd_\xab\xbe\xec\x97c>\x13\xfb\x7f>\x01-\x0e\xbfV>\x04?om2>\xda\x00\r>\xf98>?\xd0\xaf-\xbe\xee\x92\x84\xbc\xd1\xe0z\xbc\xaf\xba\x14\xbe\xe5\xec\x8f>\x03\xe5\xfb=\xbd\x1c\xad\xbc\xcd\xa0\x05?o\x8a\xa7\xbe[\xcd\xa3<-\x01,>\xb85\xfa\xbe\x7f\xa2\x84\xbe},[\xbeY\xe5\x07\xbf\xa1&\xa8\xbe\xd5\xa0P>\x8f\x19E\xbdDb\x1b\xbfmD\xe6>S\xeb\x08>\xf1\xf9\xf7\xbd<\x17\xec=M\xfb:\xbe\xb7\xed\xae\xbee\x063?%\r\x03>O\xbe\x80>\x8a\xc8\xa3\xbex\xf1E\xbfxT\x84>\xa9\xb6~>\x9dh\xdd>\xb3[\xbb\xbco\xef\xc2\xbeK\xca\x81\xbem\x85\xea>\xbb\x85q\xbd\xc7\xda\xb4>\x10\xb2\x04>\xc3~\x80>}\x1dR=\xaeN\x87>\xd5H!<\xf0\xb6\x8a>\xbf\xb8{=\x13\xc5E?\xe7k\xdc>-\x88\x15\xbe\x90\xf0`\xbd'n\xde=\xa3\xf5+="
-p1072
-tp1073
-bsV504207274139987969
-p1074
-g2
-(g3
-(I0
-tp1075
-g5
-tp1076
-Rp1077
-(I1
-(I200
-tp1078
-g12
-I00
-S"\xec\xa1\xfd>J[\xae=\x03\xbf\x1c\xbf\xb7\xfc\x1b>\xe7\xa5\x93>\xb4\rg\xbe\x97B\xf8<\xa3\xf6M\xbe\xc0\xfa\r\xbd\xeav8=\xe4T\x9c\xbc\xfd\xa1\x82<A\x9f\xfa=\xc9$\xae\xbb\tIk\xbb6\xd4\xbc>\xd2\xf0\xa1=z\xb6\xd7\xbd\xa9\xe62\xbe\xfd@\x8c=\xbfS8\xbed\x84\x8a=\xacl\x06>\xff\x1b\x97\xbe3\xb4\x08\xbd\xd9\xb3\xe2\xbdTZ=>\x95\x0b\x9d\xbd\x96\xc3p\xbe\x9aYE=\xe9\x9b\xb9\xbd\xea\xd2\x81\xbcQa\xb9=\x7f\xc9\xad\xbe\x07W\n\xbc4\x05{>t\xfeu=\t\xe3\x92>\xcd\x8d\xd2>\xf1\xab\xe9\xbd\x86\xa5@\xbe|\xf0\xcb<\xe9\x8e7>\xa4m\xa7\xbeP\x89\xab\xbe3\x88D\xbe\xa4\xf1\xc6>\x0c\x15\xcf\xbbJ\x00\xec=\x8c\xfc\xf0>\x05\xb2\xa3=\x9c\x87\x0f?\\Kx\xbe\x99`\xd9==\x8b\xc0\xbe\x8f3U>O\x8b\xb5=\xcd\x93V\xbe\x9f\xc9\xc7\xbe\x9f\xb4\xd9\xbe\xd3O >\xac`R>\xad\xb1\x06>U\x16\x14\xbe\x06\xca`>\xa1@\x1f>\xb6\x11O\xbe\xe3\xcdn>\x94\xb7R\xbe\xd6\xd4:\xbe\x13\x0f<\xbf\xdc\xa6\xbf\xbei\xac.\xbe\x11\x8d\x82\xbd\xc7F>\xbe\x8d\xbaW>\x83mC>\xbe\x91!>D\x8ft>\n\x17\x96>\xb9\x1d\x9b\xbd\xa7`\xe2<F\xe5]>\xcf\xd0W\xbe`\xe0\xa1<\xe5\x07\x18>\x0fV\xa4>\xc4m\xb5\xbe\xaf\x13\x05?\x0c|\x9d\xbd\xd6\xda\x8e\xbe<%\x8d>\xa0Z\xde\xbe/\xad\xcf\xbd\x9f>\x86>_h\x89>\xefv)>L);>Cf\xc2=\x8c\x18 \xbe\xdc\xd1W>D\x9e\xb7>\x1f\xa5\x1e>$0q>W\x1e\xdb>\x05-\x9b\xbe.\x0b,\xbdC\x15\x8b>\xff8n=\xec\xf6\xe7=\x98p\x8b\xbe\xad\x1c\x17>\r\xf0\xbd>w\xaeU>\xe1\xc2\x15=D\xb2\x8d\xbdA\x0b\x02\xbfI\xd9\xb0>m\xb3\r\xbd\x8a\x9d\xc5<\xdf\x94\x06?\x84:\x0c>\x132\x05\xbe\x06\xc2&>\x10$\xd9=\xdf\x8eo>\xcf\xb6\xa3\xbe\xba\xd7j=\xa9\xe3\xc6:\x86x\xdf=\xb1O\x13>\x16V\x97>\x00\x93\xfb=\xe9\x97h=\xc2N\xa0=\xbf\x94 =\xb1l\xf3\xbc\x87!\xad\xbb\x9c/z\xbd\x87\x9d\xa4\xbc\x19\x81\x8c\xbe\xfd\xe5\xbe>Ct\xc9<\x84J\x0e\xbf\xed\xf1r>\xbf\x0e\xd7\xbd\xe1c!>\xdcR\t?\x89\xc5\xe0\xbd'\x94\x87<4Iq>\x818\x1c=\xf7E\x8b>3.T>\x86\xae\xd4=\xc7W\r?G#\xdc\xbd\x7f\xa3\x0b>\xdfS\\>\xa9w\x93\xbe\xda\x06n=@\xa2\xae\xbe_>\xd2\xbe^\xad\x9b\xbe\xd0\xf7u=sTO\xbe#\xc3\x03\xbf\xbf\xe0\xa3><\x1f\x10>\x89\x06\x07\xbdj9\xeb=\xdf1\x86\xbe\xc3\x16\xd7\xbd{\xd1\x04?\x84*\xaf=M\xd0\x0c>\x04\x06\x8b\xbe\n\x05\x17\xbfD\xea!>\xf9k7>g(\xa7>S\xf7A\xbd\xb9q\x1d\xbe\xafo\xaa\xbcj\xbd\xb3>\xcdy\x90\xbd\t#\xab>\xac>o<\x1bV\x94>\x10.\x8e\xbd\xdd\x1f\xb2>6\xf5\x9b=J\xeal>\x0fnf>YL\xea>l\xdd\x8e>I\xc0k<\xf6e\xd2=\xa4\xd5\x9b=\x9f\x16\xb1\xbc"
-p1079
-tp1080
-bsV503957287174959104
-p1081
-g2
-(g3
-(I0
-tp1082
-g5
-tp1083
-Rp1084
-(I1
-(I200
-tp1085
-g12
-I00
-S'\xc1\xc6N?\x07i\xc7>>\xdaD\xbf\x9e{\\\xbcY\xbf\x12>O\xd9\x8e=\xb6\xd9\xd8\xbdNf\xda\xbe\xc0\xb8n=\x04\x9b\x0e?\x91\xa7\x9b\xbe\xf7\xb1\xc7\xbe\xc1\xfa\x90\xbc\x80\xceb\xbe\x9f\x85t>\x8d\x82*?Np|\xbe\xd5x\xee\xbe\xf8i\xd5\xbe\x84\x10\xa2\xbe\x81\xf0.\xbeV\xbcO\xbd\xba\xf7\xe4>\x04\xcd\xf4>Y\xfcy>\xb2;2\xbe\n\x11\xb4>\xd6l\x03>\xfd\xa4\xef\xbeC\xea\x1c\xbf\xf6\x90\xc2\xbe\xb5\x8e\xa4=\xfco\x0f\xbe\x88\x03e\xbf\xd7\xba\x1e>\xc4>\xe8>f\xae\x06?\x87\xe2\xdb>TL\xf1>\x95as\xbe&m\x10\xbf\r\xc8P\xbe\xa7\xaf\x02\xbe\xec)\xd2\xbb\xf8\xa6\x1c\xbfm\x08W\xbe\x8d\xd9\x0b?r\xfe\x88>\x8c\xa7\x90>~m~?\xa4\xe5\xce\xbd\x80@\x1e?\x84\xba\xb9\xbe\xc4A0>\xf4\x0f+\xbf\x03\xca7=\xcc}\x03>\x04g\xe7\xbc\x9f\xeb_\xbf\xd7}[\xbf\xe3\xfe\x9b>\xb1\x1c\x91?\xb8(D?\xc3\xe3\xae\xbe\x9fI?>+R\x7f<cG\xf7\xbe\x00\xf3]?\xf1\xd0\x19?\x06D\x02\xbf\xab\x9e:\xbfM<c\xbf\r;+\xbfLq\x06\xbem\x8a~\xbe\xcf^\xd0\xbd\x80J\xbe\xbcG\x10\x12>x83?\xe0s\xcf>\xff]\x1d>\x9d\xd6\x0e>3~<?\xe7\x1d\x08\xbf\x13@\xe0=f\x87\xcf<\xf4k\xbc>\xadF\xe2\xbe\x14\xd7@?\t\x90\xd2\xbed\x92\x14\xbf\xd9L\x9d>\x07\xb5\x94\xbeb\xec\x04\xbf]!\xaa>M\xed\xcf\xbcW\xcc\x1a?\x8b\x13\x9d>^km>/\x87\xc0\xbe<\x9f<\xbe&\xac\x8b>\x14\xd8\x80>\x9d\xbc\xf1>U9N?\xe3\xe1\x04\xbfM`D\xbd\x08\xb8U?\xbd%\xd7<\xd7g\xec\xbdQ\x84\x81\xbfQ\x9d\x8b\xbe}\xa55?=\n\xad>\x01n\x8c>\xad\xc9\x13\xbe~%7\xbf\x88\xa65>\x02(*\xbe\xfa\x85D\xbe\x08\xd1K?v\x19\xe3>\xa4>\xdf\xbd\xbdE\x96=\xfcZ_;\xb7\x15\xba>\x86Rc\xbe\xf7d\x97>"\xc2`>\xbdJ\xa2>\xddS[>\xec\xf8z>\xadd\x14=>\xb4\xf2=\x93\xb6\x9f\xbeCI\x86=\xa0f\xb6\xbc\xb71\x03>\x8c\xcc\\\xbf\xd7j[\xbe\xcfv\xf4\xbe\xf3\t\xdc>\\)\xfb>A\xc8=\xbf7\x07??7h\xbe>4\xfc\xd8<B?\xac?*\x91\xaa\xbd\xb2rf;f\xb2\xd4=Z_R\xbe\xf9[\xe0>\xa4\xe5\x8d>\\\x04-\xbeg\x9dF?r\x84\x15\xbf\x1f\xfe\xb3<\x8b\x91\xb3>\xbda@\xbf&\xb1\x00\xbf\xe8\x89\x19\xbf\x9f\xd6w\xbf\xe8\xcc\x10\xbf\xb84t>)7\xc3<\xbd|H\xbf`n\x15?\x1c\xb2\xab>\x91\xdc\xd9\xbdy\xd19\xbd-\xbb\xfd\xbe\xd9\xa0&\xbf\x01\xf7\x1a?\xe6\xee[=\x9c\xe0\xf3>RX\xc3\xbeF\\\x85\xbf\xf5\xb2\xf9>\xd3\xddW>\xa1+\xfb>\xceh\xf7\xbb\xcbM\x0c\xbfM7\xa0\xbe\x99\x8dX?\xf9\x1b@\xbd\x84\x1d\xbf>Y\xb9I>\x9f\x9f\xe5>`mV\xbd\xe4\xd4\xbe>\xe8\x0e\x8a\xbb\t\xcc\xb1>}\xe7Y>\xe7\xcfu?.D\x1e?\xbc:N\xbe\x7f\xad\xba\xbc\x06\xb3\x93>\xb3>\xc0\xbe'
-p1086
-tp1087
-bsV504179018913308672
-p1088
-g2
-(g3
-(I0
-tp1089
-g5
-tp1090
-Rp1091
-(I1
-(I200
-tp1092
-g12
-I00
-S"\xff\xf8\xbc>\x08\xdf\xda;\x95\xd4\xcf\xbe\xebf+\xbb0\xe49>\xab e\xbd\x87\xfa\x90\xbc4\x9fZ\xbe\x13?l\xbc[@8>\t#\x9e\xbc@\xc8,:\x11\x1a\n>k\xed\x16\xbc{X\xa0\xbd\xa4i\x90>\x10)q\xbd\xc8#i\xbd\xd7p%\xbe\xeb\x08\x91\xbc\x0f\x84F\xbe\xd9\xd9\x9a<s6\x13>\xb1\x1a\x0f\xbe\xfb*@\xbc\xd7\xf0\xe3\xbd\xc5hD>}\x0e\xdf\xbd\x93\xbcc\xbe\xab\x02\xc07\x01\xdb\xa2\xbcP\x16H\xbd\x19\x8e\x84=\x1c\xe1\xa3\xbe\xde\xfe\x14\xbc\x07\xbd\x83>V\x9c)>\xc3\xd2>>\xb82\xa0>\xf0\xa2(\xbd\xa40\x19\xbec\x01F\xbc\xb3+\n>\xa0\x97]\xbes\x03B\xbe\xd8\xb7\xac\xbd#a\xb5>\x95\xa9\xd6<\x8d\x8e\x87=G}\xd1>\x01\xf5%=\x1fr\xd0>0'A\xbe\n\xb2\x98=\x8b+\xb0\xbe\x99\x9fF>t\xa4\x9a=\x90\xbf\x00\xbe\xe8Y\xc3\xbe\x8d\xdb\xcc\xbe\xf3\xa0O>\xdd%_>\r\xaf\xb0=)\xf4\x15\xbe\xdd|\n=\xd93/>\xd9\xfci\xbekv\x81>\x00\xb3\xe5\xbd\xe6\x86\x0b\xbe\x94\xb7\xee\xbe7\xb9\x9a\xbe\xd3}\x94\xbdC\x1d\xda\xbd\x07\xe0\x08\xbe\x7f\x12\x08>A\x1a\x19>\xa5\xe2\xbc=\x1d\xec=>q\xc3A>\xfd\xedL\xbd\xb1\x8a\x19=\xcdy\x92>=Kf\xbe\\#\xa8=\xbb\x9c\x89=\x90\xbal>1\x97\xa6\xbe\x9b\xc6\xe5>W*\xb7\xbcTok\xbekx\x14>\xbbw\x82\xbe\xb8p\x16\xbdl\x8d\x96>\xa2\x84\x9b=8\x88S>\xb83P>q\xff\x15>\xd5j\xd3\xbd\xf0\xa2\x1b=9\xb9\x88>\x1f\xd4\x0e>\xf5n+>\x17^\xa7>S1l\xbe\x8fK\\<\xa8\xd9?>M\xa3\x00=c\x8a\xbe<\x9b\xdba\xbe\x89t\xc6=\xa7\xd8U>A\x8b\x1b>\xb4\x90]=\x87\xb1\xb3\xbcs\x1f\xad\xbe=\xfb\x89>%p%\xbc\x97>\x1f=\xabh\xdc>{\x04\x1b>c\x88\x8d\xbd\xbbT\xd9<}e\x06\xbc\x1c\x1b\x87>k\x86\x0f\xbel\x19\x8a<\x9e$\x01=\x8f\x04o=\xa8\x1f\xe6=\xbd\xde\x17>\xe8\xb0\x9a=\x88\xd3\x1c=\xf7\x95\t=\x1b\xcf\xfd=n\xae\x10\xbd\x84u`<\xa1\xe0\xd3\xbdSw]=\x93VT\xbe\x0c\xd2\x91>x\x88<=\xf0F\xbb\xbe\x0bns>\x13\x04D\xbc#\xf0%>\x80Z\xc2>\x15w\xdc\xbdW\x8c/\xbc \x1dZ\xbc\xbf\xb8\xe7\xbd\x87\x10r>\x94\xb8H>\xbd@\xd3<)<\xbc>Pr\x11\xbe\xcb=\xc5=\xb9\x19\xd4=\xd7\xb7\x83\xbeoap\xbc(iu\xbel|\xcf\xbe{\xfaX\xbe\x8dp%=\xb9\xf0\xbd\xbd\x01\x0b\xe6\xbe\x8aL\x84>8\x06\xf4;\xcc\xf40\xbd\x07v\x0f=8\x16L\xbe\x956\xce\xbd\x9f\xfe\xea>\x8dfA=\xd9)\xb1=(\xf9\x89\xbeM[\xdc\xbe\x06\x96\x8e=m\x17\xfe=\xd5\xa6\x92>\xe7a\xb0<#f9\xbe\x1c\x92\xbb\xbd\xff]\x90>\x00\xf0\xfe\xb8\xe1\x88t><\xfd\xbe=#\xc3\x80>\x80\xc6\x9b\xbd\x94B<>\xdd\xbdy=s\x11;>\x839\xfb=\xb58\xec>\x0f\xd2\x98>Tj\n=\xdb\x17\xce<o\xde\x8c=\x83\xe04="
-p1093
-tp1094
-bsV503956870131113984
-p1095
-g2
-(g3
-(I0
-tp1096
-g5
-tp1097
-Rp1098
-(I1
-(I200
-tp1099
-g12
-I00
-S'\x01\x88\xf9>\xc9[\x7f=\x00\x8f\xce\xbe\x9b|\xc4\xbd/pP>\\\xf6D\xbd\xc6s8=\xc2\xa4G\xbe\xcc\x1d-\xbd\x11\x824>\x85\x8c\x17\xbc\xa2*\x92\xbd\x95\x89T>\xac\xd31\xbd\x17\xd5\x05\xbdZJ\xc5>\x00\xfck\xbd\xa6<\xab\xbdQ"H\xbe\xe7\xfc\xae\xbc\xfa\x14`\xbe\xd9\x8f\xc8=\xf2\xa4V>\xfb\xf7&\xbd\xab\x98\xa7=\x9fc\x1f\xbe\xf0\xfa\x05>g\x1c\xf9\xbd>Hp\xbe:\xe7\x00\xbe\x82\x15\x91\xbc\x8esj<z\x1f\xc4<\xfb\x86\xab\xbe\\\xe9\xae=u\x85\xf2=\xc0\xeb]>\xfe\x90J>\xbbs\x86>\x05\x99\xb7\xbd\x97\xa7\x18\xbeI\xffc\xbc\xec\x1f\x89=\x92\xe3u\xbeP\xef\x1b\xbe\xecz\xa8\xbd\xce\xd2\x9e>\xa1\x0fL\xbc\xf4\xeaz=\xa6\xf9\xeb>K\x9fd<\xdf\n\xeb>\xa1_~\xbeLf\x01>\xd6F\x99\xbe9O\xfa=0\x1d\xff=\x04\xefC\xbdY\x03\xd4\xbe\xbc7\xcd\xbe6\x94p>G"\xb3>V\xcc+>;\xb1\x05\xbe\x1a\xcad< \xad\xd2=\x04\'3\xbe\x19\x94\xbf>\xaa\t\\\xbc\xb7\x16X\xbeu\xe6\xd3\xbe\xa4\x9c\x8e\xbe.\x84\x1b\xbeU\xda\xba\xbd\x9c\x8c\x1c\xbe\xf2Vl=`q\xe2<\xd2D\xcb=\xc4\xe3 >\x84\xf6o>t>;\xbd\x0fR4\xbd\xf0\xce\x9d>:\x1eL\xbe\x07\x1f\xae=DJ\x0b>\xac\\\x92>\xdb\xa4c\xbe+\xc0\xed>0\xd8\x06\xbe\xfa\x1b\x8d\xbe\x84@\t>N]\x95\xbe\xf1\xf3\xfa\xbd2\xc2s>\xd7\xf0\x11>\xc9\xf3|>B\xf8\x80>\x85\xeaf=\xd6i\x1d\xbe\xa7\x98\t<\x8c\x98K>\xb0!]>\xf6\x8fG>\xfe\x04\xb5>|\xf3 \xbeV\xf6P=\xdf\xc5\x9f>\xe5#N\xbc$\x93\x0c<\x91a\xab\xbe\xd5\xb8\x9d=\x11eS>k\xc9C=\xa3\x1f\x05\xbd!\'\x92\xbdFl\xa7\xbe\x92\x1f7>%\xb3\xf7<\xec\xb8l=\x8f\x17\xe9>A\xb9\x0e>\\\xdes\xbd\t\xe1\x0f>\xac\xa8P=5O\x95>\xda1!\xbe\xd0\xc0\xa5=oR\xcf<\x96\xc9f=L3\xc8=V!\xce=P\x9e\xa4=\'\x19\x85<\xaf\x07\x81=\t\x0e\xb4=\x04\x03H\xba\x84&\xbd;\x89\x024\xbe\xe6\rm\xbc\xb5\xa4g\xbe\xcbMF>\xf6u\x18>r-\xbf\xbe[\xb2\xb7>\x11\x1b\xa5=\x8c\xf0\xe9=\x14!\xda>oU\xcf\xbd\x97F\xf1\xbc\xd4\x18\x99;\t\x9d{\xbd\x81\xc6s>\x0cg\xde=\xdf\x8e@=\xfaW\xb7>y\xb9 \xbe\x027\xcc=N!\xce=r\xd4\x91\xbe5\xcd\xbd\xbd\x1eX1\xbel\x9f\xae\xbe|\x9a~\xbe\xba\x06\xe2="W\x8f\xbd\x0b\x12\xcc\xber\x8fm>\xc4\xa0\x99=\xef\xf7\xe6\xbd\xc29\x03=\n\xe4<\xbe\x00j\x1c\xbe\x9f*\xeb>\xbc\'\xd9=\xf5\xcc\xd3=K\xf2u\xbe\x07\x8d\x04\xbf^\x1b\xbc=\x9f$G>\x11\xa5\x88>\x049`\xbd\xef\x17d\xbe.u\xb5\xbdA\xb2\xa3>\x00a\xea\xbc\x1cE\x81>\xd4\xa8\x8f=\x17,F>\xc7I\x03\xbd\xe7SQ>\xa3\r\x9a;\xf9$\x1b>\x95\xd8\xd1=\xc7\x05\x02?\x81K\x8b>K*\xb5\xbd\x99L\x04\xbd\xf8\xfe\x83=\xf2\xf5\xa2='
-p1100
-tp1101
-bsV503971148049440768
-p1102
-g2
-(g3
-(I0
-tp1103
-g5
-tp1104
-Rp1105
-(I1
-(I200
-tp1106
-g12
-I00
-S'Go`?c#\xfe>\xe5v/\xbfI\xe2J\xbe\xa0B\xf8=\xdd\xde{<\xd9\xf2\x14\xbe\xb98\xf2\xbe\x97?\xbf\xbd\x98\xc1\xe4>G\x87\x1f\xbea&\xcb\xbeG\x06\x05>J\xa2*\xbe\xd3Q\xe1=\xb9\xaf\n?c\xb0d\xbe\xb8v\xf1\xbe\xe2\xbe\x83\xbe\xf3\x16\xed\xbd\xb5\x98\x8a\xbe\x86\xc9\x97<]S\xdb>\xa5\xa9\x80>n\x02\x1b>\x18\xd7F\xbd\x9d\xa6;>\xffp\xdc<\x05k\xdc\xbe\x8a\xbb\x95\xbe\xd35\x8f\xbds\xce\xb4\xbd5tV\xbd\x95?\xed\xbet*\x7f>\r\xc8\xc3>\x80\x8b\xe2>\xa0\x1d\x96>P\xec\xeb>\xb8\xfc\x80=?|i\xbe\x1bB]\xbe\xa0\xb1|\xbd[9Y\xbe\x19\x1f\xb9\xbe\xf7x\x1f\xbdu\xc1\r?\xa0\xf5\xb2=\xb1\x84\xcd=\x0f\xcbY?nY\t\xbeX\x81\xc9>]1\x95\xbe\xa9\xfa\x10\xbd\x1e\x8a\x19\xbf%\x80\x89\xbb\xddCu>\xf6\x7f\xa8>\x80\x13x\xbft\x88\x1f\xbf\x8f\x08\xd0>\x13^u?\xe1D\xed>\xa8b\xae\xbe\xa1\x82W\xbe>\x8a\x12>1\x8aG\xbe\xf3\x91H?$\xa6t>\xbfG\xb4\xbec}=\xbf\xa3\xde>\xbf\xfe\xa8 \xbf\x8b\xa5\xc4\xbd\x89\xb3\x91\xbe\xb4\xac\xf5\xbd\x15\xba,\xbe\x89\xb7\x91>\x03\xf9\xdd>l\xd6 >\x05R(>\xf5\x98\xa4\xbd\xab9\x12?\xbd\xa1\xde\xbe\xa1\xc6\x8e>\xad\x9f\x86>\x8fs\x98>\x18\x19I\xbeW\x82\x07?)\xa1\xa2\xbe\x0cl\xc9\xbe\xe1I\xa6>\xf3\xb5\xd7\xbe\xd2\x9c\x97\xbe\xb5\x11\x11>\x04\xda\x15=D\xbf\xe5>\xe3\x1b\xbf>s6\x94\xbd\x0f\xf5\x83\xbe\xa1I(\xbe\x1e\xfb\x80>\xa4\xddc>E9_>C\x13.?\x19-\xc6\xbeB\xd3\x11=O\xbe5?\xcd\x18\x04\xbdB\x12\x17\xbec@U\xbf\xcf\xedh=I/$?\x0c0\xc4>\xe6\xa1\x83>{\xee\x9e\xbe\x13\xc8\xe5\xbe\xd0\x13O>\xa1\xf1\x9b\xbd\xe7v\xdb=\x1a\x16$?c}\xbd>\x85\x9bN\xbe\xd0\x86A>\xd5q\x9b\xbd!\x07`>_tp\xbe/.\xb2>\x9d\xa2\x07=NG\x04>\x11\xe1\x19>\'*\x9a>\xe3JC\xbd\xa0\xf74=\xf0W\x91\xbe[\x0b7\xbeO \xdc\xbd\xb1\xc8\x11\xbe\x9dL!\xbf\xb7\x06\xde\xbd\xa5\x94\x9d\xbe!\x18\xf1=-=\xdf>\x11\x8c\x16\xbf\x14fD?\x1a_\xa3>\xa9\x1c\xe3=5\xed\x7f?\xefk\x17\xbe\x84%\x15\xbe\xa3\xab3>\x95\xbfE\xbe\xa9\x92\n?_\xa5\x99>I\xb9Z\xbe\x88\xf1\xd6>h\x83g\xbe\x0c\xfaW=\x11C\x04>\r1\x15\xbf\x87\xdf\xdb\xbe\x91\xe9\xdb\xbe\xb2\x85\x10\xbf\xf4\x17\xc1\xbe|\x95@>we\xc7\xbd\xdel\n\xbf\xdb\x87\xd6>\x97"\x07?\x91\xa0\xdd\xbc\xa0\xf0\xca\xbd\x11S\xd0\xbe3\x05\r\xbf\xac=\x0e?\x05@\x9d<\xbak\xa2>\xf8D\xff\xbe`\xf5t\xbf\x94\xac\xeb=\xcf\xaf\x96>\x05\xe4\x99>w\x06l\xbe\xbdK\xd2\xbe\x1d1\x05\xbf{\xd3 ?\xf1\xfb\xd8\xbdVt\x8e>E~\xd8\xbc\x8b\x99\xfd>\r\x1f2\xbe\xcb+R>\x17\xdc\x91\xbd$\x0e\xb4>\xd5B\xde>+\x83D?\xf4P-?+\x9f\x92\xbeo\xb3\xc3=\xa4n^>\xffhc<'
-p1107
-tp1108
-bsV503957971614072832
-p1109
-g2
-(g3
-(I0
-tp1110
-g5
-tp1111
-Rp1112
-(I1
-(I200
-tp1113
-g12
-I00
-S'\xa1y\x18?5\rp<a\xc9\r\xbfP\xa61\xbd{\x1e\x9a>,DC\xbd\x7f\xf2\xc7<\x04\xe6\x81\xbe\xb1\xf4\xbd=\xa4\xda\x9c>\xcc\xd4\x11\xbex\xcf!\xbd\xe42\x19>y\xbc\xc3\xbd|\x1b>\xbd2\x08\xe8>\xf8\xcaZ\xbd\xab\xf3+\xbd[U\x94\xbe\xd7\x93\x11\xbe\x98\xb2i\xbe\xa6Ax=\xf2\xf9A>\x12\xb2\x9c\xbd_Bp=\xd7\xedS\xbeb\x9f\x94>\xd9\xa8\x03\xbe\x88\x91\xb2\xbe\x9c\xe9\x15\xbeB\xa5m\xbd\x8f\xf1\xce;\xd7\x12\xd4\xb9\xd0\xe1\x11\xbf\xcf\xb5.\xbcT\x0e\x91>;\xe2\x92>x\xac\x84>\xa7X\xdf>\x82\xa2\xf5\xbd\xd8\xa2\x90\xbe\xbc\xce+\xbd|\x80%>\x86Ot\xbe\x03;\xa4\xbe\x13\x83P\xbe\xad\x13\xf3>\xe7QF=\xd3I\x10>\xa8\x85(?M\xdar=l\xaf(?\x82\xa1\xbf\xbe\x83(I>O\xc1\xe1\xbe(?\x87>a\xc1\x13>N\x012\xbe\xb5\xf5\xfe\xbe\xe9I\x12\xbf\xb2O\xa3>\x08\xeb\xea>\xe3c\x8a>\xc9\xa8!\xbe\x18\xa1+>\x8f\xb5\xed=@\xe4\x9b\xbe\xb2\xf0\xe4>"6\x12=(\x8e\x93\xbe\xc6}\x10\xbf\x88\xa0\xd8\xbe\xb1\xee\x0c\xbe%\t9\xbeO^B\xbe\xd0~\x90=\xb4\xb0\xdf=\xe9\x04\x01>N\x1f\x88>\xe9\xc8\x9e>\x84\x98b\xbd\x9a\xaa\x9d<\x08\x99\xd5>\xf1]@\xbe\x1e\xa1\xa6<H)\xb2=\xc4\xc6\xa3>\xed\x08\xbc\xbe\xb4\x8a#?\x03\x1c\xe9\xbd:\xe4\xcf\xbe|</>\xc8.\xb7\xbe\xbe\xc2H\xbe\xefA\xdb>\x87u\x0b>\x18\\\x84>\xc1\x84g>1\xb8O>\x1c\xd1K\xbe\x006\';B\x9a\x88>\xedfs>\x12e\x91>\xa1\xcd\xd0>\xc94\x9e\xbe\x18#==5\xfe\xc2>(P\x9c<>\xf9\x05=\x17N\xf4\xbe\x945\xa9\xbcU\x0e\xad>$\xe5)>A3*=+4\x17\xbd\xeeB\t\xbf\x95\xeb\xa3>l\xcf\xe6<\x9a\xfd\xb7\xbd\xe0\xf3\x13?v\x86H>5\x88x\xbd\xe6\xdc(>\xc5>\xc2=\x9aG\xba>\x0b\x87q\xbe\xcf+#=\xbf\x9e\xc5=7p\xe6=DPL>\xa8:\x08>\xf0%,>\xaf\x87\xca<\xff\xf9\xb1=\xf8\x97.>\x9b\xb2B=\x82Wz=$Zz\xbea\xc5l\xbd\xc8\x1b\xb5\xbe\xa5f\xc4>338>\xd2\xcc\x0f\xbf:\xd6\xb1>\xed\xcf5<&eU>z\xd6\x1b?i\x84\x15\xbe\xd1<\r\xbb\xc7\x12\xe6\xbb\x04\x9f\xd6\xbd\x89g\x83>Z\xd94>$\xfe\xb3=s/\x0b?\\h\x99\xbe\xd4\xdc\x19>\x98\xae$>\x85h\xd7\xbe\xe9\x1c\x03\xbe\xee\x84\xa1\xbes\x9b\x1c\xbf\x05\x7f\x92\xbe\xeb\xf8!>\xff:\xc2\xbd\x9f\xb25\xbf\x85o\xb6>\xe0\xca\x8a=g\xed\xbc\xbde\x86*>o\xa5\x90\xbe\xcdCf\xbe\x051 ?de\x1c>\x9f\x1f\x19>\x17\xc6\x86\xbe\x10\xd9\'\xbf\x18ad>\x81\x9c!>\xbb\xf3\xbe>%a\x00=8\xde\xac\xbe\x0f;\x0c\xbe\xc3F\xd3>\x87\xfb\x14\xbdY\x17\xc0>\xc6\xa2\x1c>\xe1h\x81>\xa2\xed\xd2\xbc"\xe8\xaa>oc|=T\xc1\x8f>W\xeaq\xbc\xcf\x8a$?\xa3\xaf\xa3>VL\x12\xbd\x8db\x9b\xbc\xcb\x9a\xbc=\xe1\x18p='
-p1114
-tp1115
-bsV503972971011375104
-p1116
-g2
-(g3
-(I0
-tp1117
-g5
-tp1118
-Rp1119
-(I1
-(I200
-tp1120
-g12
-I00
-S'O\xd4\x19?\xf9#\xb9\xbcB\xaf\x1e\xbfUBT\xbe\xf6\x15\x81>\xf9\xa6\x1f\xbe\x8d~\x9d=\xf9\x9b\xbb\xbe\xebe{\xbd\'\\W>\xac\x83_\xbd\x81y\xa5\xbc]a\x8c>5M\xad\xbdX#:\xbe\xa7\xc9\xa8>\xb3\xbe(\xbd\x10U\xb0\xbd\xc8\xa0*\xbe\x9cv\x16=\xb4[\xd1\xbe\xf1!,>[9\x80=\x7f\xe4\x91\xbe`\x88B;|\x9a%\xbe<^\xbe>K\xffV\xbe\x9fw\xe3\xbe\xa1\x98\xca<\xfc\xa4\xbb=3g\xd3\xbcP\n\xaf<`{\xc0\xbe\xe31K<i.\x8b>\x15M:>\xcb\x8an>nK\x00?YS\x8c\xbc-VQ\xbe\xa9A\xe6<\x14\xebc>%\xa4\xe1\xbex\xdcl\xbee.\r\xbe\xcd\x10\xc9>\x00\x94^\xbcG\xc4\x93=W=\x0c?\x10\xf8\xe3=\xe3\x02\x08?\xc8i\xba\xbekF\x96=\xa9\x93\xc1\xbe\x8c\xc6\x90>m\xf7q>\xb8&\x9b\xbd\x91\x8e\x19\xbf\xc95\x05\xbf\x04\xc1\xf1>\xf3s\xc1>\xcd\xf1\xfe=\xa5\x1eL\xbeW@Y\xbd\xe5\xa9\x8d>$\x95\x15\xbe\xf7)\xc7>-\x19]\xbe=\x06\xd1\xbd\xc6\xb4)\xbf\xec\xf1\xc8\xber_\x1a\xbds\xa1\x1a\xbem\x9c|\xbe4\xd4\xf2=\'\xa1?>\xf4\xf62>\x8bd->\xc1\xe8\x9b>\x8dS\xd1\xbd_/K=5\xdd\xb3>\x15\x86Z\xbeD\xbc\x8d=p\x83D>S\xe6y>I\x86\x87\xbeZ\x97\x08?\x88{C\xbd\xdb\x10\x81\xbe\xd0\xc9\x89>\x87\xd8\xc4\xbe\x04\xc0\xda\xbdwR\xaa>8\x18P>\xf7(\x8c>\x07\xe3\x97>\xa1c\xc4=\xa3\xd1A\xbd\xf0F\xa1=\x0f\x8a\xbc>i\x17_>mTa>\xd1\xca\xc5>\xd7w\x9c\xbe\xf8\x8c\xe2<9]\x9b>\x17,\x8c=\xa5\xca7<\x15\xd5\x91\xbexq\n>I[\x18>/\x88P>\xa3\xdc\x89<\xc7e\x1c\xbd\x15E\xd0\xbe\xc0\xbd\xb8>\xd0\x9e\x84\xbb{\x14g>+M\x08?P\xf9G>\xa0\xe8\x99\xbd\xe3cG>\xf8#f<\xdb\x1f\xd0>\x01\x9f\x98\xbe\x8d\x15\x01\xbd![\x1c=\x98\x03(>\xc5\x9d<>\xf3\x11D>\x0c\xf5\'>\xbc*\xb1=w0\x1d=\xd7\xf2\xb7=\x1b\xcd\x8e\xbc\x90\xdf\xe5\xbd\xa5\x81\x1a<p4\xd1=\xa3\x83\xb2\xbe\xa3\xde\x9f>\xd7\x19\x96=\xaf6\r\xbf\xf0\xff\xbf>P\xd4\xaa=\xb0\xdb\xcf>TD\xec>u\x13?\xbe\x1d+"\xbe\x94\x9c\xcc\xbd\xa1v9\xbe\x88\x16\xe7>\xcf6\x8b>\x80\xd0\xd0\xbc\xad;\x01?{\x1d\xac\xbd\xb3\x85t>\xafBR=\xef\xe4\x86\xbe\xd1\xa3\xc1<\xa4\xfa\x96\xbe\x8f*\xf3\xbeo\xf4\x96\xbe+\xc2\x9c=\xad\xc1:\xbe\xcf\x1a%\xbf\xcf&`>\x88\xe6\xec=@\x00Q=\xb0#\xe2=^\xa9\x82\xbe\x10\xa5\x1f\xbe}w\x1a?\xba\x91\x15>\x9f\x1c\x14==x\xe4\xbeWH8\xbf\x80\xb8\x80:\xa3\xdd\xd8=\xfdd]>#\x07\xda\xbc,\xb0\xc5\xbe\xcd\xbb\x8c\xbe\xc99\xa7>A5\t\xbd;\x99\x9a>\x1fo\xc4=\xb3R\xcf>\x94\xc9\x12\xbe\x88\x94l>\xaf\xef\x1a=\xd8:q>P\x1eJ>\xba4\x17?\x93\x8e\xbe>\xc7\xb3\xad=\xdbU\xa3;\xd0\xe6r=\xb7\xea\xd6='
-p1121
-tp1122
-bsV504265805681270784
-p1123
-g2
-(g3
-(I0
-tp1124
-g5
-tp1125
-Rp1126
-(I1
-(I200
-tp1127
-g12
-I00
-S'\xe0I\x8c>D\xeev\xbda\xde\xdc\xbe^?\xa2<\x1b\xba~>+\x00\xb8\xbd<\xa3\x10\xbdy\xcf\x83\xbea\xff\x9d\xbd\xe2b@>r\xf3U=\xa0Z\x84=\xd6\xf21>\xb4)>=\xfc\xb4\x11\xbe\x08\x84\x8a>\x86G\x94\xbdn\xe2A\xbd}\xfe\x07\xbe\x8e"P=\xf1+\x8e\xbe\x12\xa3\xbb\xbc\x9df\x92=Y`\x9a\xbeD`\x9b\xbd\xab\xdb\xb1\xbd\x1b\x97\x85>\xf1bt\xbe\xfd\xe0\x90\xbe\xf1\xe0)>\xd2\xc0\x0b\xbc\xab\xa7\x0c\xbe\r\x81\x13>\xda\xde\x98\xbe\xc1s\xb4\xbch\x0f\xae>a\\\x0b>\x9a\x05\x0f>\xe5h\xbb>x\xd7\x8c=\xe9|\xc6\xbd\xb3\xc8O\xbc\x1f\xe6\x8f>\x0b\xd4\x9e\xbe\x9e\x0f+\xbek\xf9R\xbd\xef\xb9\xc5>\xc8S?=O?\x8a=\xb7;\xc2>p\x7f\xb3=\xf8\x11\xdb>\x83\xaf\'\xbe(\xa6\xd4\xb8\xad\x12\xed\xbe\x93\x15\x83>Z\x8d\x8c\xbc!8&\xbe\xdf\xd2\xee\xbeh\x18\xd8\xbe\x15ms>\xd6W\xbf=ND\x0c\xbd\x96&\x81\xbeQ\x86\x15<X~\x82>\x9dqe\xbe\x98\x8d+>\xc6s\xa5\xbe\rh\xae\xbdr\xd2\x0c\xbf\xc1\xe8\xa4\xbe17P=j\x86\xf8\xbd\x8f\x85\xef\xbd\'\xc5\x82>\xb6\xa1\xab>\xbe \xea=\x8c<\x12>\xa4\xa8P>\x19\x0e\x93\xbd0*\x0b=\x9dV\x97>\xa2=\x84\xbe\xb51\x08>l\xdb\x89=\x9b\xde\x82>\xccu\xc6\xbe#\xbb\x05?`\xb5\xd9=\xd2\xd1;\xbe34O>\xb6B\x7f\xbe\xf8\n\x84=\xc8\x97\xc4>\xcc\xee\x05<R\x99\x1a>^\x92m>\x87\x0b=>o\x1b\x07\xbd\xb7\x0c\x03>\xfa\xbb\xad>\x0b1\xd7=\xa4\xc8(>\xd8\x11\xd3>\x9e\'\x8e\xbeR\xb3C<e3\x03=\x15\x14\x98=\xc4\x19\x82\xbbm\xd6}\xbdO\x97z>-\x18\x10>\xe6\xeba>h\xcd\xfc<\xe3\x1c*=\x8e\xd6\xac\xbe\xaal\xac>\xdcn\xaf<\xae\xfa\xd5=\xea\x83\x0c?1\xfa\x92=\x13_\xf4\xbcy\xb2w\xbd\x9bD\x06\xbd\x98I\x98>\x03L\x17\xbe\xbe\x01^\xbd\xe8\xf9L=<\xa4\x98=}bX=lO\xd2=\x08\x16\xf6=\x05\xd8A<\x0b\xf4i=\xcb\xf2\x1b>v\x89\x83\xbdd\xc7\x86<\x84\x1a\x8f=\xca\x84\x02>\x00\xef.\xbe\xa5[\xd2>\x82}u\xbd\xe7s\xb0\xbe\xf9\x15^>\xe4\x85g\xbdc6x>\x98\x8b\x8e>vO0\xbe\x1c\xb8\xa6\xbb\x06\xe3@\xbd\x15\x151\xbe\x19\x90\x86>\x95\xf9\x8e>\xa8\x15<<u\x9b\xc7>\x18F\x94\xbd\xa8{\x19>\x9c\x06\xb0=,\xba~\xbe\n\xea\x0b>2\x05w\xbeP\xc7\xbc\xbe\xf2\x03;\xbe0\x0fK\xbd\xf81\x03\xbe+\'\xee\xbe\xfc\xa8\x91>k\x05\xc4\xbd\x15\xf9/\xbd\xe3!;=[\x1fE\xbe\xd7\xe2\xe5;\x9f\xfa\xfe>\x1a\xce\x9c=\xf3\xf0\x0e\xbc}\xbd\xb2\xbe\xcb\xf7\xa5\xbe_\x9c_;\x07\xf5\xf4=\xbfX\x98>\xbb\xb0s=-\x858\xbe&\x9c\x86\xbd\xe0\xd5\x87>\xb4\x91\xcd\xbc\x92{Y>bP\x9b=\xa79\xa1>\xe9Ze\xbe\x17\x8fA>E\xff\xaa=L\x1a0>\xd0\n7>E\x07\xc5>\xdeU\xb1>\xe0\xf80>=n\xc1=_\xde3=\x08\xa3\x05>'
-p1128
-tp1129
-bsV504246497182220288
-p1130
-g2
-(g3
-(I0
-tp1131
-g5
-tp1132
-Rp1133
-(I1
-(I200
-tp1134
-g12
-I00
-S'.I\xfa>|P\xeb\xbc#\x9b\x03\xbf8\x0e\xd6\xbd\xd5\xb1\x8c>N\xdb\xb3\xbd\xff\xb9\x8e=\'\x14F\xbe.\xd2<\xbc\xe3\xee<>\x93;\x07\xbd`\xe8n<\\|\x80>\xac\x9a\x11\xbd, \xd1\xbd\xc4\x97\xad>\xf9\x81\xf3\xbcuds\xbd\xeff0\xbe\xb7?\xd0<\xd5\x18\xa8\xbe5\xdf\xf9=\xa7\xd3\xfc=\xf5\x85Q\xbeG\xfb\xc7\xba\xc3+?\xbek;u>o\xc7W\xbe\xdf\x07\x99\xbe\x9cG\xbc\xba\n\x10\x9a=\x84\x94\x19\xbd\x02\x8c\x99=\x0fW\xb6\xbe\xf9\xff\xb8;\xb4\x8aS>\xbd\xa8+>\xf0mV>\x80N\xc3>\xf2C\xf9\xbc\xdc(\x1e\xbec\xe6H=x\xa5]>\xb7E\xb1\xbeo\x8c\'\xbep$\xf7\xbd\xca\x84\xc0>d>M\xbd\xa1B\x8d=V\n\x00?\xbf\xd6\xae=\xf0\x16\x11?\xab\x8a\x99\xbe\xcb\x99\xfd=p\xfe\xba\xbe\xe2\xd5\x8e>\xd4\xa8\r>Z\xdf\x05\xbe\xdeX\xe6\xbeFq\xdb\xbeuz\xa6>\xc9\xb9}>\x00r\r=\xcc\xee2\xbe\xeb\xc9n=d\xb5E>\xfc\x95.\xbe\xc1\xcf\xa6>\xa2\xfbf\xbeW\x96\x1a\xbe$A\x04\xbf\'@\x93\xbe\xa9\xe7\xee\xbc\x9b\x89\xef\xbd4"P\xbe\x90\xe0\xfc=?\x1f3>\xdcn\xf1=\xcf\xf6\x14>kP~>i\x05\xe1\xbd\xebvQ\xbc\xae\xde\x97>\xdc\x1a;\xbe0u\x92=Y\x9e/>\x98\x12\x97>`o\x8c\xbeE\xf3\x08?\xc2\xf84\xbc\x04j\x8c\xbeB\x02O>x\xde\xb9\xbe\xf0\x99Z\xbd\xa2\x17\xb4>\xc8\xbb2>~\x1c\x1a>t_y>\xcd+\xd5=\x9c\x8a\x07\xbe\xf9\x17q=|\x9f\x90>\x9ecP>\xe0\xc4F>\x9c\xef\xc2>)\xe7e\xbeT\x1c_=\x9bAj>dC\xcc;\xecu\x97;\xafz\x82\xbe\xe3`\x0e>W=B>9I\xfb=\xb4I:\xbc\x00Ch\xbdE\xe1\xc4\xbeN\x9c\x9b>\x84\x03\x1c=;\x85\xa6=\xea>\x04?7\xb5\xbc=\xe4X\x99\xbd\xf9\xae\x14>\xc6\xa9\x8b=\xd41\xb4>\xe1xa\xbet\xdb\x0b\xbc\'\xf7v<\xe9\xe6&=\xcf\xdf\x19>+\x80\xfe=\x96\xc3\x0b>\xa2?\xff;\x01\xa8\xb7=J\xb9\x16>\x173;<]\x80\x8b\xbc\x82B\x1b<ew =\x80\xe4u\xbe\x11G\x92>+\xda\x0f=\xc7x\xe7\xbe\xc2f\x9e>9\x8f\xd0\xbb\xb7/\x82>.\x83\xaf>)\xba0\xbe\x9c8\x86\xbd\x19*\xe3\xbc;\x9f\xcc\xbd\xc3\xef\x8e>e87>\xc1\xc9\x95=\x99\xde\xe8>\x03\x98\x08\xbe\xd0\xd1,>\xf1G\xc5=\x1cr\x90\xbe\xe9\x9a\x03=\x8dq@\xbe\xdfz\xc0\xbe\xf5\x8a{\xbe\x19\xb3\xa1=\x88\x920\xbe\xb2J\x0b\xbf\xf8\xc1\x81>\xe1\xa5a=\xc9\'>\xbd\x8e\x7f\n>\xd1\xf2<\xbe\xbb\xd9\xc3\xbd3(\x16?\xfcV\x17>\n&\xb9<!\x88\xa1\xbe\xae\xba\t\xbf\xcfr\x88=\xc6\x1c->O\x92\x97>\xf5/2\xbd\xc5\xce\x80\xbe\xa3\xdd\x19\xbe%H|>\x95_f\xbd\xaeb\x92>9\'p=\xd7\x06}>\x9b}\xbe\xbd\xc4Mk>\x10GQ=\xa9\xaee>\x1b\xcb\x9f=\x1c\x16\x00?\x07^\x96>\xc5wX;O(\xa4\xbc^\xd0V;\xd5i/>'
-p1135
-tp1136
-bsV504232551334961152
-p1137
-g2
-(g3
-(I0
-tp1138
-g5
-tp1139
-Rp1140
-(I1
-(I200
-tp1141
-g12
-I00
-S'\xe0I\x8c>D\xeev\xbda\xde\xdc\xbe^?\xa2<\x1b\xba~>+\x00\xb8\xbd<\xa3\x10\xbdy\xcf\x83\xbea\xff\x9d\xbd\xe2b@>r\xf3U=\xa0Z\x84=\xd6\xf21>\xb4)>=\xfc\xb4\x11\xbe\x08\x84\x8a>\x86G\x94\xbdn\xe2A\xbd}\xfe\x07\xbe\x8e"P=\xf1+\x8e\xbe\x12\xa3\xbb\xbc\x9df\x92=Y`\x9a\xbeD`\x9b\xbd\xab\xdb\xb1\xbd\x1b\x97\x85>\xf1bt\xbe\xfd\xe0\x90\xbe\xf1\xe0)>\xd2\xc0\x0b\xbc\xab\xa7\x0c\xbe\r\x81\x13>\xda\xde\x98\xbe\xc1s\xb4\xbch\x0f\xae>a\\\x0b>\x9a\x05\x0f>\xe5h\xbb>x\xd7\x8c=\xe9|\xc6\xbd\xb3\xc8O\xbc\x1f\xe6\x8f>\x0b\xd4\x9e\xbe\x9e\x0f+\xbek\xf9R\xbd\xef\xb9\xc5>\xc8S?=O?\x8a=\xb7;\xc2>p\x7f\xb3=\xf8\x11\xdb>\x83\xaf\'\xbe(\xa6\xd4\xb8\xad\x12\xed\xbe\x93\x15\x83>Z\x8d\x8c\xbc!8&\xbe\xdf\xd2\xee\xbeh\x18\xd8\xbe\x15ms>\xd6W\xbf=ND\x0c\xbd\x96&\x81\xbeQ\x86\x15<X~\x82>\x9dqe\xbe\x98\x8d+>\xc6s\xa5\xbe\rh\xae\xbdr\xd2\x0c\xbf\xc1\xe8\xa4\xbe17P=j\x86\xf8\xbd\x8f\x85\xef\xbd\'\xc5\x82>\xb6\xa1\xab>\xbe \xea=\x8c<\x12>\xa4\xa8P>\x19\x0e\x93\xbd0*\x0b=\x9dV\x97>\xa2=\x84\xbe\xb51\x08>l\xdb\x89=\x9b\xde\x82>\xccu\xc6\xbe#\xbb\x05?`\xb5\xd9=\xd2\xd1;\xbe34O>\xb6B\x7f\xbe\xf8\n\x84=\xc8\x97\xc4>\xcc\xee\x05<R\x99\x1a>^\x92m>\x87\x0b=>o\x1b\x07\xbd\xb7\x0c\x03>\xfa\xbb\xad>\x0b1\xd7=\xa4\xc8(>\xd8\x11\xd3>\x9e\'\x8e\xbeR\xb3C<e3\x03=\x15\x14\x98=\xc4\x19\x82\xbbm\xd6}\xbdO\x97z>-\x18\x10>\xe6\xeba>h\xcd\xfc<\xe3\x1c*=\x8e\xd6\xac\xbe\xaal\xac>\xdcn\xaf<\xae\xfa\xd5=\xea\x83\x0c?1\xfa\x92=\x13_\xf4\xbcy\xb2w\xbd\x9bD\x06\xbd\x98I\x98>\x03L\x17\xbe\xbe\x01^\xbd\xe8\xf9L=<\xa4\x98=}bX=lO\xd2=\x08\x16\xf6=\x05\xd8A<\x0b\xf4i=\xcb\xf2\x1b>v\x89\x83\xbdd\xc7\x86<\x84\x1a\x8f=\xca\x84\x02>\x00\xef.\xbe\xa5[\xd2>\x82}u\xbd\xe7s\xb0\xbe\xf9\x15^>\xe4\x85g\xbdc6x>\x98\x8b\x8e>vO0\xbe\x1c\xb8\xa6\xbb\x06\xe3@\xbd\x15\x151\xbe\x19\x90\x86>\x95\xf9\x8e>\xa8\x15<<u\x9b\xc7>\x18F\x94\xbd\xa8{\x19>\x9c\x06\xb0=,\xba~\xbe\n\xea\x0b>2\x05w\xbeP\xc7\xbc\xbe\xf2\x03;\xbe0\x0fK\xbd\xf81\x03\xbe+\'\xee\xbe\xfc\xa8\x91>k\x05\xc4\xbd\x15\xf9/\xbd\xe3!;=[\x1fE\xbe\xd7\xe2\xe5;\x9f\xfa\xfe>\x1a\xce\x9c=\xf3\xf0\x0e\xbc}\xbd\xb2\xbe\xcb\xf7\xa5\xbe_\x9c_;\x07\xf5\xf4=\xbfX\x98>\xbb\xb0s=-\x858\xbe&\x9c\x86\xbd\xe0\xd5\x87>\xb4\x91\xcd\xbc\x92{Y>bP\x9b=\xa79\xa1>\xe9Ze\xbe\x17\x8fA>E\xff\xaa=L\x1a0>\xd0\n7>E\x07\xc5>\xdeU\xb1>\xe0\xf80>=n\xc1=_\xde3=\x08\xa3\x05>'
-p1142
-tp1143
-bsV503975903169626112
-p1144
-g2
-(g3
-(I0
-tp1145
-g5
-tp1146
-Rp1147
-(I1
-(I200
-tp1148
-g12
-I00
-S'G\xa6\'?!\xf0\x88>\xee\x17\xf2\xbe\xec\x93W\xbd\xd4\xf8\xe4=\x15o\xe7=\xf6!\x05\xbeU\x19\xa6\xbe\xde\x99\xb1;\xea@\x19?\x97\r\xbf\xbd^I\x8e\xbe\'\x8f\x97\xbc\xd0\xe6\xc4\xbd\xc9O$\xbc\xe5\x80\xf2>\xd1\x89\x80\xbe\xbc\x1b\xb4\xbe\'\xfb\x96\xbe\xb0\xf6_\xbe\xbb\xcc(\xbe\xe2rl\xbc\x8e\xa2|>\xb6\r\xaf>W\xdf\'=\xa9zp\xbdL\xd4\x81>(\x05\x02\xbe\xbd\x1e\xd3\xbe\xd7p\xb3\xbea\x05\x84\xbe\xa3\xa3\xfc\xbd\xc9\x99T=\xa7\xab\x0b\xbf\xfb\x95\x84=\xcc\x08\x03?\xec<\xdc>>i\x1f>\xf6\xf6\xb6>3j\xe1=[\x93s\xbe\x05z\x86\xbe\x16\xd0\xd1<S\x96&\xbe\x06\xb0\xae\xbe\xbe\xc2*\xbd3\x9d\t?\x03\xc1P>q\xc2\t>\xc2\xf66?Z\xe6\'\xbe\x0c\xce\xed>\xb07\x8b\xbe\xef\x82\xf5\xbb\x1f\xf6%\xbf\xb7/z=\xea\x1d,=\xc8\x8b =\x8dee\xbf\xc2\xce-\xbf\x0f\xc7\x8b>\x88\xbc=?\xf6\x14\xde>/\xbbl\xbe\x03\xd6\xa4\xbd\x82\'b>=\xb0\xcd\xbe\x7fX\x19?\xfa\xad\x16>\xa55\xcc\xbeui\x10\xbf/c\x1f\xbf>\x1e\xb1\xbe\xc9\x98P\xbeS\xa8\x08\xbe\xa8\xbf\xd4<%x\x83=\xc0\xfe]>\xa6}\xd4>\xa8\xa2}>\x19\xc1\xd6=r\xd9\x04\xbdd<.?\xcd\xe6\xff\xbe\x8c1_>6\xf0\x98\xbd\xee\x1b\x98>/h\xdd\xbe3n\x19?\xc5\x97m\xbd\xef\xe2\x9d\xbe<`?>\x85\xc0e\xbe\xb0#A\xbey\x02\xe6>{\xed\x04\xbe\xcd\xdd\xd4>\xca\xb3\x8f>-:F>\x98\xe9U\xbe\xf9\x96S\xbe\x93\x84\x9d>\xeaRF>\xa4\x1c\x0c>#\x8a\x16?\x8a\xda\xbc\xbe\xea\xe0y=>~\xe9>F\x9a\x83=s\xaa\x08\xbe\xd3\xc2,\xbf\x9d\xc7U\xbd\xac\r\xce>#\x86\x83>)\xfd\xa5>bK\x16\xbcl\xa8\xe0\xbe>\xf4X>\xb5\x0f\x0f\xbds\x06p\xbd\x986\x17?u\xfc\xa4>\xac\x80\x9b\xbdp\x84\x8c\xbd\xbd\x9a\r\xbe\xb4U\xb0>\x80\xc7J\xbd\x88:_>\xe3\x17\xfe=\x97#\xd3=2\x1b\xd5<\xf3:\xcc=A\xcf\xb9\xbcvZ\x12\xbdX\xebW\xbe\xf1\xf1S\xbd\x1e\xad\xc2\xbd-\x16/=\xee<\xf4\xbe\xe7\x8a\x8f\xbc11v\xbe\xbe\x07\x88>U\xf9\x87>\xea\xf9\xe1\xbe[b\x1b?\xcat\xaa>\x7f\xac\x94=\xb6ye?qC\xfc\xbd\xf3\xd0c<\x9f\xcf\xcc\xbd8i\x84\xbe\xcc\xa1\xc0>x\xa5\x90>\xb8\xb2\x13\xbe\x95\xad\xef>bN\x9f\xbeha\xa5<\xc7\x8e/>&\\\x14\xbf\xaar\xab\xbe\xc0T\xa3\xbe\xf2\xb5#\xbfR\xde\xe4\xbe\x8c\xcb\x86=y\xa5\x15<R\x07\x11\xbf\x05\xe9\xdf>NN\xe8=y\xc8\xa4\xbd\x0cg\xac\xbd\x8cW\xab\xbe\xaa:\xab\xbew8,?\xda.\x18>\xe8H\xa6>\xc66\xdf\xbeO\x87+\xbfD\x86\xf8=\xae\xa34>\x13\x92\xe6>\x95\x1e\x15=\x0b\x8d\xb5\xbeV\x01\x9d\xbe\xe2\x00!?"@I\xbd\x89\xae\xfe=e*\xdb=\xfd\xdd\xb1>)k\x9c\xbd\xb2M\x1f>t\xf16\xbc~"\x80>\xcd-\x9a>w\xbb:?/\xc9\x1a?kU\x00\xbe|\x84\xb6=\xcdR\xa1>\xe2\x14\n\xbd'
-p1149
-tp1150
-bsV503975987114426368
-p1151
-g2
-(g3
-(I0
-tp1152
-g5
-tp1153
-Rp1154
-(I1
-(I200
-tp1155
-g12
-I00
-S'\xac\x9b\xef>jO!>\x1al\x0f\xbf\x05\x06\r>t"\x11><H(\xbd\xa3\xa0\xb3\xbd\xb4\xca\x99\xbe\xa7\xb4\x93=\xb0>\x89>\xb3-\x1f\xbeQq\x0f\xbe\xbc\x81\xcf<*\x1c\xa2\xbd\xc98s>\xc0\xec\xfc>\xc9\xef\xf4\xbdp\x9cK\xbe\x14\x10\x8a\xbe\x9b\x86D\xbe\'\x89\xb5\xbdHF\x02\xbe\x1d\x87\xb1>\\\xc46>\x14\xbc\xd8=l\xec\xcd\xbd\xc0\x7fZ>i\xa5\xac<\x19\xfbz\xbem\xee\x8f\xbe\x91\xc2\x94\xbe\x19\x99e\xbc\xc7\xf7\xd3;\xf1\xca!\xbf\xc4\x85\x95=\xfc\xb2\xab>]\xd6\xa1>\xcc\xa8\x95>\x08]\xae>\xd3=+\xbe\xdc\xf3\xc5\xbeK\x9b\x1a\xbea\x10\x07\xbe\xee\xb4\x93\xbc$1\xed\xbe\x08\xfa,\xbe\xd5O\xe1>\xc3HD>\x9b\x02Y>\x16\x89\x14?46\xae\xbd\\\xf9\xf5>O)7\xbei\xf3\xdf=\x97\xbd\xcf\xbe\xd7V\xd1=\x83\xdd\xbf<\xe0\x1f\x1a\xbeLa\x0c\xbf\x9b\x93\x1c\xbf`\xee\xf6=*\xe5\x18?\x05\x8e\xf0>\x92n\x81\xbe\x0b3*>\xf6\xaf\x90=c\xda\xc7\xbe\xb7l\xee>x+\xa7>\x96\xe8\xa5\xbe\x12`!\xbfC_&\xbfR\x17\xf5\xbe)\x9c\xb8\xbd\xd15\x02\xbe7\xa0\xaf<1h(=U\xe6\xf2=u\xf5\x05?\xce\xf8\xa9>\xbc\\\x91=l\x9a0>\'T\xf4>\xfc_\xc9\xbe\x8fz\xad=\\\xf5\x81;\xd1\x8f\xab>\xb6\x9d\xd3\xbe\xc0\xf4 ?Z\x13\x8f\xbe):\xed\xbe\xe0\x8d|>\x9d\xe1\x82\xbe\x07|\x8f\xbe\xa6\x84\x94>\xb8\xcb\x0c\xbd)^\xf3>\x80\xbbH>\x1c\xd8R>G\x1d\x93\xbe\xbb\x1d<\xbd\xd8&\x89>)\xe2f>p\x02\xc8>*o#?|Q\x9f\xbe\xc0\x01\x92\xbdg\xe7\xf5>\x9c\x039=L2\xa8\xbd\x94\xdb\x0f\xbf\x89\xb3\x14\xbe\xb6H\xdb>\x94Wv>\x9c\x88\'>\xdcj\x89\xbd\xbbx\x00\xbf\x14>\xc2=\xdb\xfc\xec\xbdy|2\xbe\x8f\xf5 ?\xdd\x08\xbc>!@\x1f\xbcz\xbc\xe1<)\xf5\xc7;\x87\xe8\x9a>.\xa8\xeb\xbd\xc1D->D\xf9\x0e>a\xb5\xaa>\x87\x0c+>\x9bLC>\xf7K\x19=\xe2\x86\xf0=\x92B6\xbe\xe3\xab#>.\xfdk\xbcFE\x0c>l\xec\x1b\xbfwE\x0f\xbe|\x92\xd1\xbeW\x95\xde>\x913\x90>\x17\xfa\x0e\xbf\xa4m\xb7>\xa5\x97.=\xc7\xde\xf1\xbc\x15\x03]?\xc8E\xc1\xbd\x17M\xcf\xbbU\xb5s=\xcc\x1b\xaf\xbd\xc8\x0f\x80>\x86Q=>\xcc\t\xaf\xbd\xe6\xf4 ?\x8aK\xce\xbe\xe0\xae\xf8\xbc\xd5\xd7h>\xed]\x06\xbfG\xda{\xbe\xd0\xf6\xd4\xbe\x83\xf0=\xbf4\x8d\x9c\xbeq~\x9c=\x86AB=|j\x06\xbf\x80\t\x02?\'W\x10>\t\x9a\x1f\xbet\x83g\xbd:V\xde\xbe\xb4t\xe4\xbe\xe9d\xde>\x0b\xab\xc0<\x90\xac\x86>\x84q\x8a\xbe\xe2~)\xbf\xe7\x8b\xd2>\x9e\x01D>\xd6 \xe0>\x9aH\xd3<\xf7\xad\x94\xbe\xe5\tt\xbdh\xfe\x0f?\x1c\xcf\x88=Qv\xcd>\x11I\x1f>\x19.\xc3>\xfe\xe2\xcb\xbd7\x8f\xa3>*\x1eI=y\xcb\x7f>z\xe0!>E\x1f0?\xac\xa2\xd2>+\xd4\x9a\xbd\xef1c<s\xf95>\xd4}\x9d\xbe'
-p1156
-tp1157
-bsV503963689301864448
-p1158
-g2
-(g3
-(I0
-tp1159
-g5
-tp1160
-Rp1161
-(I1
-(I200
-tp1162
-g12
-I00
-S'\xf9\xa0i?@|\x97>yn(\xbf\x87\xf8m\xbe?\xcfN>Yk\xea=\x7f\xf2\xa7\xbd\x13\xbb\xb1\xbe\xdeA\x05=\x12\x91\x14?\x8fn\xfe\xbd\xff\x16\x91\xbe\xdc\x18^>?\xf2,\xbe\xba\xb6v=fR\x13?\xb1\'L\xbe\xe33\xb1\xbe\t\xaf\xac\xbe$\x057\xbe\xb6\xbf\x9f\xbe\x98\x13\x02>F\xfb\xca>\xa2?\xae> \xa1\x11>\\2U\xbeU1P>\x90\xa7\x03\xbdq\x0f\xec\xbeJ\xd1\xdd\xbegK\xe6\xbcr\x0bb\xbc\xadI\xee\xbc\xa1/\x1c\xbfDy4>\x96[\xab>o\xaa\xf9>\x0f\xc7\x8e>\x88\x0f\xde>\x86!X\xbd\x91\xfe\xa0\xbeX\x10\x12\xbe\x1d\x0cB;\x81>\x82\xbe\x06\xf7u\xbeA\xe0\xeb\xbd\xb60-?\'\xf6S=S\xcc\xed=\xaf\x8el?\rf\xd6\xbd\xd7Z*?\xa8\xf6\xd8\xbe!\xf7\xda=z\xab&\xbf\x17\x95\x18>l\x9b\x80>s\x11\xcc=\xd2\xb4l\xbf\xb8_*\xbf\xbd+\xdd>jOl?\x84\xfe\xd4>\x08\x9fq\xbem+\xb1\xbd=M\xe9=Fr\xc1\xbe\xaa\x8eY?\x08\xbd\x16>\xae\x9e\xb6\xbe\x15y\x1e\xbfFE\x1f\xbf\xf1\xba\xdf\xbe\xf9\xaa\xf3\xbdOA\x93\xbe6\\\xff\xbdm\xda\xf5\xbd5\xe2\x7f>\xf8\xf1\xaf>\xc0TU>2\x98j=&\xd6\x82\xbd\xde\xcd/?\xc0\xf4\xdb\xbe\xe1\xaeS>\xa8\xc2D>8\x98\xb0>]\xe3\x93\xbe\x0fv+?\x8f\x10X\xbe6\xba\x02\xbf\xf8\xe6u>\xc6A\xe2\xbe\x11\x0c\x83\xbe\xdd\xe7\xc0>V\xa4-=\x04U\xce>\xd2\xb9\xbe>%;\x90=\xd29\x9e\xbeH\xfeC\xbe6\x7f\x7f>?\'\xaf>\xd6Hc>h\xe9\x16?\xf6\xb0\xae\xbeUo\xf2=\x9ai+?\r\rK\xbd(\x7f\xf7\xbd\xbd\xc0c\xbf\x90F\n\xbdD\x03\x04?\xcd\x9fB>\xcb\x9dD>m\xf5B\xbe\x04\x15\x06\xbf\x1a\x1bh>dV\x9f\xbc\xc8H\xfb<w\xe9+?\x1fD\xb9>\xb8\x00\x0c\xbe\xe3\xadT>\x04\x8a\x9a\xbb\xeb\xf1\xd8>J\nH\xbe\x00\xf3i>d\xba"<xK\xf8<\xce\xfbR>\xfd\xc6P>Q\x8dN\xbdk~\x14=\x8a\x82\x0f\xbe\xc4\xe12=\x7f\xec\xf2\xbc\x9a\xb9:\xbd\x7f\x9b\r\xbf\xe4\xab\xbd\xbd\xfc_\xb5\xbe\xd6c\x0c>\xc4r\xb1>\x1f\xe9$\xbf\x91 2?o\xd3\x98>*\x8c%>\xc7zn?\xe4\x9dX\xbe\xef!\xc5\xbd\xcf@\x02\xbcy\xcca\xbe\xd8l\xe5>\xea\xeao>\x8d\xc8\xe5\xbd]9\n?\xb3\x92\x9f\xbeQlt=\n\x07\x0f>:\xe0!\xbfs0\xcf\xbe\x069\x90\xbe\xb7\xae%\xbf\xa8\xca\xd9\xbe?\xa3\x83>\xc1\xad\xef\xbd\xd6\x9d*\xbf\x1c\xb1\xf7>Q5\x9c>\xbaA\xcc\xbd \x1f\xf3\xbb\xcc\x80\x97\xbe\x04r\xda\xbe\xe7\xf3Q?\xdf\xef\t>e\xed\x97>h@\xf6\xbe?\xffu\xbf\xc3\r\x1e>MA\xab>#\xdb\xec>(\xcf\xf1\xbd/\xa5\xda\xbe="\xe6\xbe\xba$\x16?8\x8c\xbb\xbd\x94\xc6\xaf>\x94Z\x86=\xa8R\xc4>\xaf\x072=\x00qn>_\xb1\x19\xbd\x07\x10\xaa>\x0f?K>\xd9\xf7j?\xb8|\x13?\xd6\xa8t\xbeoj\x8e7XKf>\x91\xea\x9f='
-p1163
-tp1164
-bsV503963557500043264
-p1165
-g2
-(g3
-(I0
-tp1166
-g5
-tp1167
-Rp1168
-(I1
-(I200
-tp1169
-g12
-I00
-S'\xf8\xe8\x08?\xfe\xdc\xc4=\xc7\xa3\x03\xbf\xf0\xe1\xd6\xbd0\x12">\x82\xa0\xe2\xbb\xea\xe7K\xbd\xa3\xf9o\xbe\x96\xa7\xc8=$\\\xbe>\xdeu0\xbeo#%\xbe\xf0\xba\xfa\xbc\xb3:*\xbedi\xaf\xbc(\x00\xad>\x8c\xab\x9b\xbd\\\x9dA\xbd\xf8"\x93\xbe\xf0\xd3\x17\xbe\x96\xf4~\xbe\xea#\xd4\xbbt\x94]>\xe4X\x0c>z\x15\xfb<\x7f\x8c\x19\xbee\x1c\xa7>\x0b\xbe\n\xbd\xb9\x0f\xb5\xbe\xc6v\x9f\xbe\xbf\xdf\x80\xbd\xbc\xc0p\xbcR\x94\xaf\xbdB\x83\x08\xbf/\x87\xcf\xbc/\x17\xc7>\xe7\xc8\x99>\x96 m>\xaf\x06\xca>;\xb8\x98\xbd\x1c\xb1\xbc\xbex\xc7&\xbdP^\\<\x8a\xf0\xf9\xbd\x0e\xbfz\xbe\x07&\\\xbeG\xef\xeb>\n\n\xc4=\xd8L\x1d>\xdf\x06(?\x83\xa6\x15\xbdn>\xeb>&(\xb0\xbe\xd6\xeft=-z\xbc\xbe\xc3XZ>)Xm>\x08\x86\xee\xbd\xc8\xd2\x08\xbf\xe9\x14\x04\xbf\x06\x16\x9c>U\xef"?\xb6Y\x81>\xc8O"\xbe\xac\xa5\x0b>\x0b\t\xb5=|\x05\xc0\xbem=\xe9>\x08\xe2\xfe\xbc*`y\xbe\xa0<\x02\xbf\xa3\x10\xef\xbe\xa33H\xbei\x85\x0c\xbe\x1c\xdf\x8e\xbe\xf4\xc2\xed\xbd\xc9\x7f\xe0=\xbc\xf6\x14>^\xed\x9d>M8q>\xb7n\x82<\xde\xb7\x80=0\xee\xe9>\xc9\n\x83\xbe\xf4&<=\\\t\x1f=\xde\x81\xe0=r\xa7\xc8\xbe\xfd\xa4\x0f?\xf7\xc5\xfd\xbd\x0cC\xdf\xbev\xdbL>\x0e\xe3\x9c\xbe\x81v\xf4\xbd\xd4F\xb6>o\xb8\xbc=\xf4\xfe\xa8>p\xe6*>\xfc\xb3.>\x8a\x00&\xbe\x18\xe5\xfe\xbd11\x81>\x89\xa6\\>\xfa\xf2y>q\x03\x8a>x\xae\xdc\xbeD\xf7\x1f=\xf6\x88\xf2>r\x9bs=\xbeK\xff;\xcf,\x13\xbfe\x9ek\xbe\xc5\xb4\xa9>d\x9c2>xYl>\xae\xd5m\xbc\xbc\x1a\x0f\xbf\x16\xbcY>\xe4Hv\xbd\xf9\x9c\xd5\xbdE\x1d\x00?\x03\xde\x80>\x05B\xd7\xbd\x1e^)>\x18}\xa7\xbc\xeeM\xb2>\x9f\xd2g\xbe\x9c\xf8\x94<{#y=\x12\xc9q=\xad"&>o\x11?>*\x04\xa7=\x14\x91\xa6<8\xfc\xd6\xbd\x12\xea/>\xf7\x87N\xbd\x01\x98\xcc<\x9b\xc8\xe4\xbe\xae\x14\xb3=\xda\x93\xb1\xbe\xda\x0f.>\x852\xe0=I\x02\x18\xbf\x03\xeb\xba>\xf3&\xac={&S>X\xddG?F1(\xbe\xc9\xa5\x04\xbd\xc9Q\x99\xbd\xc8\xea\xfa\xbd\x8b@\x9f>\xde\x15k>\xad5\xa6\xbc\xb5b\x07?}c\x97\xbe\xf4\x9d\x7f=\x1c;\xe0=_\x18\xb0\xbeR}\x95\xbep\x1d}\xbeSP\t\xbf\x11\xf0\xcd\xbe\'c\'>\x9aB\x99\xbd\xfd\xf5$\xbf\x05\x89\xaa>n\xc4#>\xfa\xca\x83=\xe8\xe1\x0f>f\xe5[\xbe4~\x87\xbe/\xea\x06?\xe8\xeb\xfd=\xc2\xc2\x99>x(\x98\xbe\xcb\x9c$\xbfgX\x14>b\xf27>\x86\xe6\xc8>[\x8f\xc4<\xd0\x9a\xb4\xbe|\xa8\x98\xbe\xe5{\xec>\xd5\xc6\xc2\xbd\x1d\xa2\xb5>\xcb\xa7\x12>bJ\x8f>SA\xbd=]\xc6U>}oy<M\xab\x92>\x94\x9e)<\x8f\xe7\x16?\x19\xde\xc7>\xcb\x17\xe8\xbc\xa3}\xc4\xbc\xe5\x03\x0f>/\x87\xeb\xbd'
-p1170
-tp1171
-bsV504216925543882753
-p1172
-g2
-(g3
-(I0
-tp1173
-g5
-tp1174
-Rp1175
-(I1
-(I200
-tp1176
-g12
-I00
-S"\xd7+#?\x89\xa2\xa6\xbd\r\xcff\xbf\xb8\xcd\xcb\xbb{i\xf6>7:\xc4\xbd\xb8\xf4n>\xa0\x87y\xbe\xfd\xa1\x04>\x17ED=\xe9%\xb9\xbd\xb3\r\xdd=\x1dh\xc8>3\x80\xbd=\xd8C\x8b\xbe\xd5\xc5\xc5>\x0b\xdev=,\x9e!>\x00\x1d\xa8\xbe;o\xef\xbcMaV\xbeSD\xbb=3\xfd\xaf>yR\xba\xbe\x98\xf3A=[\x12\xb9\xbeap\xa4>(\xc9?\xbeH}\x1d\xbeE\xce\xf1\xbbm\xba{==\x8e;\xbe\x11\xb4\xd4=w\xfe5\xbf\xb0\xb7\x95\xbe\r6\xb1>\xa1[\xac=A\x1b\xe8>{t\xec>\x0ck\x90\xbd\xa5\xf3w\xbeIZ?>\x9bmx>`\x9b\xf6\xbe\xff\n\xc1\xbe5t\xb8\xbe\xa58\x18?a\xde5\xbep\xaf\xbd=\x8fAJ?\xed\xf8x>\x8byd?s\xa3\xdf\xbe\xdf\xc9\xc8>0\xa4^\xbe\x08\x92\x00?m*.>\x9bG\xfd\xbe\t\x91\xb4\xbd\xc945\xbf\x0c\xb9\xe5>\xad\xdb\xc0=\xf5\xd3\t\xbe\xe1`\\\xbe\xa4?\xcd>\x98\xf1b>\x01$\x07\xbf\xa1\xeb1>\x08\x95\xb3\xbed\xffq\xbe?uE\xbf\x82\x08\x96\xbe\x8d\x00\n>\xc5\x0c\x9d\xbe\xad\x0f\xf6\xbeA\\\xb2=\x01\xa4+>+\xf1\xaa;C\no>\xc7]\xb6>\xb3\xd8\x93\xbe\xb9\x1db>\xa7A\xf3>\xcc\x12\x9d=8H:=T\xb9\xc4>\x13\xb4\xe4>\xa4N2\xbf\x9c8U?u\x88\xe9\xbd\xd522\xbf\xe36\x0e>\x04n,\xbf\x1b\x99O<t\x05\xff>\xa0\xa0\xff>\x0bZ@<\xc3\xed?>\x7f\xe2x>\x10\xd0O\xbe\xbf\nC=;\x87\xdb>=\xb7g>\x19_\xf8>\x03\x9ez>\x038\xc7\xbe\xc9t\xeb=;\xc3\xb7>\xf9t\x80=\xc9K\x84>\x18\x0e\x92\xbe\x98\xb0f==0\xdd>\x0e:\xa6=\xcc\xe5~\xbd\x87qP\xbe-\xd3.\xbf\x1f\xef$?\x98&\xb3\xbd\x85\xed\x10\xbe\x9f\xf8:?\xb8\xba\xfd<\xe3Y2\xbe\x13\xc5\x99>Uq6\xbb\xec\xcc\xc8>\x99\x18\x9c\xbe\xe2\x1d#\xbet\x8d\xdd=\xeb\x8d\xdd\xbb\x99\xff\x00?\x0c\xe5\xc6>1\xfcL>1\xde\x95=\x9d\xbfb>e\xad\x0c?\xcb\x05&\xbc\xedF\x99\xbc\xab\x9c|<T\x95P>\tq\xe6\xbeO\xae\x04?\x95%!\xbe\xe8w]\xbft.%>\xccS\xd7\xbeP\xf8\xc3>\xfd\xc6\xea>\x07\xf4\x11\xbe7\xe1\x10\xbd\x8b\xf5\x02>@7\xde;\xd1\xf5\xdd>\xcb\xcd\x92>\x99W\xa5>\xa8/Q?\x0c\xe1\x95\xbe\xa9\xf4<>\x0c\xd8b>\xf5\x15v\xbe'\x13\x7f=tA\xa5\xbe\xe4\xae\x17\xbf\xed\xfe\xe4\xbe\xb1\xd4|>\x8bh\xa8\xbe\xb2\xe5\x87\xbf\x91\x9d\xbc>|y\x8a<\xad\xcbn==0\xef>\x1d\x8b\x94\xbe\xa0{i\xbdKMK?U\xf1\x15>\xf4o\xb8<r\x98\x90\xbeO\x0f@\xbf\x1bc\x94>\xb9\xa5=>\x95E&? \x83\xb8\xbdirB\xbeI\x02\x9e\xbd\xad\x8f\x12>@\x9a\xf3\xbb\xd5\xc8%?ZK)>m?\xa7>\xa4i\xb0<yX\x0c?\xb9\x00,>\x16\xf2\x15?\xcc\x958\xbe\x05\x88X?3\xf2w>t\x93u\xbd\xd8\xf7\xba\xbc\xab\x97\xad\xbd\xcb\xd0\x92>"
-p1177
-tp1178
-bsV503979404289007616
-p1179
-g2
-(g3
-(I0
-tp1180
-g5
-tp1181
-Rp1182
-(I1
-(I200
-tp1183
-g12
-I00
-S'\xa0!Q>&\xde\x85<\x9e%\x8f\xbeR \x1e=G@*>aJ\x11\xbdB\xfe0\xbd\xd2\x87=\xbe\xb8\x17\xaa\xbdg\xa4\x11>S9\x1d=n\xea\xaa\xbcm\x0f\xe8=\x89\x97\x8e= 3\xaa\xbd\xb3\xd9\\>\xbb\xd5\x81\xbd\xc9/\xa6\xbd\xad\x07\xce\xbdc:\xf6;"\xc6\x19\xbe\xe9\xd4\x07\xbd_\xe8\xb8=S\xea\x08\xbe\xda,\xae\xbcH\xb59\xbd*\xf9\x08>F\x9e\x0b\xbe\x90\xf02\xbeW<\x85=\xdf\x9e\xb5\xbd\x07\x0e\xe6\xbdPZ\x0e>f\xb9`\xbe"\xcd\x99<\x15ql>+\xb9\xc5=\xb9\x8c\xe5=s\xa5Z>\xed\xf0\x95=\x8e\x1c[\xbdu\x8c"\xbd\xdbQ%>Y\xecQ\xbe\xe3\x06\xef\xbd\xc6c\xa9\xbc\x01{\x81>\xd9\x0fY=c\xe0{=*\xc2\x88>G9";\xc9z\x93>\xa8\x83\x8c\xbd\xd4*\x86;0\xfc\xac\xbe-\x1e\xee=P\x8f(\xbd\xcd\xf6\xbd\xbd\xa2\xec\xbc\xbe\x98\x1e\x97\xbe\x98\xa8\x05>\x08\x12\xa7=\xce\xebP<r\x1c;\xbe\xae6\xb4\xbc\xcb\xee\x1c>\x87N(\xbe\xbe_\xe6=\x86l%\xbeWW\xd6\xbd\xbf\xb0\xca\xbe\x89\xefl\xbe\x86K\x9a\xbc\x17\x8c\x90\xbd\x82\x07\x99\xbd\xea\xe6\x18>\xd9\xc8=>\x10\x0f\xc6=\x1f\xbe\x0b>\x132\x0e>_2\x17\xbd\x19\xf1\xf1;r\x81u>\xea\x19\\\xbe\x11\x9b\xfa=\xaa\x18B=\x0fQL>]\xad\x8c\xbe7T\xbb>\x80\xbc\xf9<?D\x00\xbe\xd3\xe4\xe0=\xeb\x958\xbe\xba\xdf\x8e<i\x8dy>\x9a\xc5\xad<\xe0=\xfd==\xd3*>\xa5\xf9\xa8=\xc2\xf7y\xbd\xb8\xf7\xa0=\x8fP}>\xcfl\xa6=n\x1c\xe1=\'\xdb\xac>A\x95/\xbe\xe9i\xe8\xba\xc2\x01G=G\xafo=\xdf\x0cY<wb\xa8\xbd\xa8\x96;>\x0f@\x10>\x1e\xed\x14>\x8d\x83\xb8<\x17\x97\xaa<\x9b0c\xbe+M\\>q\xfe\xb9;\t\xe0\x86=5$\xc2>\xb5\xa7w=[\xd2\x9d\xbcx\xe2=\xbd>\x9a\x81\xbd?\xfc(>\x9b0\xc1\xbd%X\x03;\xbf\x10T=\xe04\xb8=\xf5\xcc;<\xf6$\x83=E\xce\x82=\xdae\xb6<\xa0Df<B\x16l=q\xcc\x8b\xbd\x851%\xba\x12\x97\xc1;my\x8f=%\xba\xed\xbd\xcc\xe3\x82>+\xfa[\xbcB\'^\xbe;\xecE>\'\xe1o\xbc\x9b>\xd1=\xbe\nw>U4\xc6\xbd\xd3\xcf\xa3\xbb\x9f\xee\x88\xbb\xc7\xba\xfa\xbd\xbe\x91S>y0:>\x05\xe80\xbc(z\x86>\r\xf5\x85\xbd\x83\xe2\xab=&\xe0\x8b=9\x0eB\xbefq\x85=\x02\xf8C\xbex\xbd\x8b\xbe\xf6\x86\x0b\xbe\x02\xb4\xa1\xbcOk\x8a\xbdC\xa5\x8b\xbe\xd8\xff_>\xd5\x1a\xe3\xbc\xb5{T\xbd\xd9\x9f\x9b\xbcH\xd3"\xbe*\x93\xcc\xbc\x82\xf1\xa1>5w\xf6<\'\x9e\x94<\xc2\xd1\x87\xbew\x95z\xbekg\xa5<\x1a\x80\xc3=\x05\x99l>+_\xa8<\'\x85\xdb\xbd\x9b\xc8w\xbc\xdbAc>\x13GA;A\x94\xeb=A\x92\x0f=j\xbb\\>\x00\x8e#\xbe\xc1\x18 >\xaa\'\xf6<f\x1e\xcb=P\xd7+>\x11\xf9\x9a>\xd17q>\x1b\x98\xb2=\xa2U\xa8=\xef\x9e\x8a=\r\x97\xa7='
-p1184
-tp1185
-bsV503966747456974848
-p1186
-g2
-(g3
-(I0
-tp1187
-g5
-tp1188
-Rp1189
-(I1
-(I200
-tp1190
-g12
-I00
-S'`L\x01?RN\x98\xbb>\xf2\x0f\xbf4?K\xbd\xd45\x14>\xfc\x98\x16\xbd\xec\x93+\xbdz\xccF\xbe\xeb\xbb\xb6=\x97\xc7\xa7>\x88\xe5\x0c\xbe\x04\xfb\x94\xbd Ej=%\x8bV\xbe\xc5\x9af=V\x90\xb6>\x17\xc9\xa5\xbd`B\xce\xbd\x07\xc1\x82\xbeKm\x85\xbd\xac\x93\x99\xbe\xae\xf2\'=\xa4\xc4\t>\xce\xb0q=\x14:\x08\xbd\xbfT(\xbe\xb54\xad><rh\xbdT\xe8\xc5\xbe\\_\x83\xbe\x10\xf3\x95\xbd\xef\xd2\x83=1\x08\x88\xbd\t\xe4\x06\xbf\xb4#\x16\xbd\xf0\xf3\xa8>\x19\x93\x96>_Wa>"\x0c\xdc>\xc7\xa8\x06\xbe\xa1\xf3\xbc\xbe\x82]\x94\xbcK\xfa<\xbc\xa2f\x0b\xbe7\x9e\xa2\xbe\x8bid\xbe\x05d\x01?\xf0N\xcf=I\xa4\x1a>P\x88\x12?\xe5\x8a\xd4<TO\x07?\xba\xcc\xa9\xbe[\x85\xa1=\xd4\xd4\xc6\xbe\xd7Y\x97>\r]=>\xd6\x8d,\xbe\x96\xc2\x04\xbfBA\x05\xbf0\x9a\x8f>\x1c\x1c\x12?I\xb1\x92>\x92\xa3 \xbe\x1c.+>\xbf\xad=>\xb4\xed\xab\xbeU\xa9\xf4>l\xc4\x91\xbd\xa4vJ\xbeL\xe4\x07\xbf\x7f\xed\x07\xbf\xbb\xb0c\xbe\xaf\xa2\x9c\xbd\xee3c\xbe\'\x91\x94<\x95\xdcP>\x95D.>\\\x18\xa7>\t\xb6\x95>\x05\xc2F<\xcdN\xca=\xe8\x8f\xde>\x97\x92\xa6\xbe\xbb\xa5\xcf:\xf2\xef\x12<\xdf\xbf)>k\xfc\xc1\xbeD}\x11?3q\x9b\xbd\xf4\xba\xcc\xbe\x87\x84\x88>\x8e\xba\x87\xbe?\x80$\xbe\x1f\xdf\xbe>\'\xe4\x1a<\xfco\xbd>l\xe9@>\x8c\xf2o>.\x01\x15\xbe\xc3\x035\xbd\xf4\x96\x90>\xbb\x16\x84>t\x0e\x90>m \xbd>\xb2\xc7\xca\xbe\xf4\xad\x8b<\xd2\x9d\xd0>ezi=\x8c\x92\x9f\xbdiJ\x01\xbf\xa4\xf06\xbe\xf9B}>\x08\x8eT>\x1fBM>9\xd1\x82;\x04\x96\x0b\xbf\xe0~I>\xc7\x1e\xf0\xbd\xf7\xf7\x17\xbd\xac\xae\x05?\xa5^\xa0>\x10\x12\xc5\xbd\x10\x8b\xb7=>\x9az=\x9aq\xdc><!]\xbeYf7\xbc~\x7f\x8d;\xfe:\xe2=\\\x92\x13>3\xe9`>\xb6\xc0\xb7=\xb4\\d=t`\xcf\xbd\x9fEX>43\xcd\xbc\x9fs\x84=\xe9j\xc0\xbeD\xa8\xc6<E\x8d\xb9\xbe\xb5}\x9b>\xcc\xd8\xf7=Z#\x15\xbf\x8c\x91\x9c>T\x11\xdd=\xa2\x0b`>\xe4\xbfA?\xb4\xa4L\xbe{O\x1b\xbd,\xcc\xe7\xbd\xb0\x14\xff\xbdz\xdd\x90>\x0c\x85~>\x87*\x10\xbdu\xb1\x18?\x84\xe4\x91\xbe\x97s\xa1=*R)>\xe5\xd5\xd6\xbe\xce!:\xbe\xbc\xe8t\xbet\xb7\x14\xbf\xa5}\xcc\xbe\xff\x82\x94=\x84"\xec\xbd\xf5l(\xbf\xd0T\xbb>\xf2\x85\x92=`0\xf9<\xe7\x00\xc1=\xf4D{\xbe\x00\xd1x\xbe\xae6\x19?9}\x19>r%d>\xdc\xb8\xa0\xbe3\n"\xbf\xb4\x988>s%,>\xba/\xd0>9\x99p=\xd1L\xac\xbe{Tz\xbe@{\xfa>\xc2\xbe\xac\xbdr\xb2\xc4>9c(>\x0f\xd5\xa4>\xb9\x18a=\x0bn4>\xa5LT=|\x10u>\x15\x00\x87=\x84o\x1c?%\xc5\xcf>H\x1f:=\xb5lo\xbc8\x1d\x10>\x89\xb6Y\xbe'
-p1191
-tp1192
-bsV504238698767351808
-p1193
-g2
-(g3
-(I0
-tp1194
-g5
-tp1195
-Rp1196
-(I1
-(I200
-tp1197
-g12
-I00
-S'Ru\x05?\xee(\xc8\xbd\x86\xb6?\xbf\x88\xdb\xe2;\xfb\xb6\xd2>\xa7\x91\x1a\xbe\xb5\xd9\x16>i\x82\xa0\xbe(\x06<=\xf2up=E\x90$\xbd\x92.\x00>w\xd7\xa7>\xb68\x98=\x83Ne\xbeV&\xd0>\x0e\xbf\x8c<\xb6\xdb\xc3=9\xc1\x94\xbe\x99\x8f\x84;K\xb3\x81\xbe(d\xba<\x01\x18\x8f>\x1d\x89\xbe\xbeC\x80\xc4;\x80\xce\x90\xbe\x99M\x9b>UOu\xbe\x83\n^\xbey\x8d|=\xebL\x1d=I\xe1\xf8\xbd\xd8e\xcf=\xdd\xe3\x16\xbf\x02\xe50\xbe\xc1\x99\xa9>k;\x00>zD\xc1>\xda\x9f\xda>V&\xaf\xbd\xa0\xc8\\\xbe\x87\x96\xc7=K\x15W>W\xfd\xd6\xbe\x99t\xab\xbe\xd7\xfdu\xbe\xe6\xc8\xfb>m\xef\xe9\xbd\x81\xac\xb7=C\xb6"?j\xc99>\xcb\xe2:?\x83g\xb0\xbe\x06t\x89>7\x9b\x8a\xbe\x0f,\xcf>\xc7\x1e\x0c>\xeb]\xc8\xbe\x12\xf5c\xbe\xf2\xd8+\xbf\xe1\x85\xb1>\xd6\x18\xea=\xbc\xc0\x8a\xbd5\xccg\xbe\x8dF\x81>B\x87}>w\x8d\xc3\xbe0\x925>\xf7H\x93\xbe\x85\x1fX\xbe\xe7q7\xbfY#\xae\xbe\x81u7=\xde9y\xbeg\x0f\xa2\xbe\x82\xe10>\xbe\xf5v>5Y\xcc<\xfb\x91x>\xf8@\xbc>\x9d\xd7W\xbe\xb7\x8aL>\x91\xb0\xbf>\xd8\x86\xc6\xbdbV\x88=\x9d\xfbx>H\xe9\xcc>\xff\x87\x1c\xbf\xab\x90H?\x0fT\xb3\xbdTG\x05\xbf\xb2t?>\xc5\x13\x00\xbfY\xb9\t<\xd0\xf6\xf2>\xfe\xe8\xa4>)\x0c5>\x1aT|>8o{>\xd8u\x1f\xbe\xab\xed\x8b=\x96O\xd4>!JM>\xdd \xcb>\x08\x90\xb1>\x9bu\xac\xbe\x9f3h==\x82\x87>-p\xa1=\x92\xdd*>\xeb\x98I\xbe\xae\xb0\x0e>v*\x96>w\xe3\xe3=\xf6\x98}\xbd\x07\xdd\xa4\xbd\xder\x14\xbf\xc0m\x08?7\x82R\xbd\xd7\xb35\xbd\x05S1?V\xf7\xd5=g\xa9\xb5\xbd\xfb\xe2%>\xee\x12i<\xcdp\xdb>\xb6\xf4\x84\xbe\x9b\xa9\x94\xbd\xe2V\xb0=\x1b\xec\x92=\xc3\xf9\xaa>B\xe7\x90>\xde\x83I>e?\x88=\xe2\x0c7>\xd6K\xe0>\x8aq\x0b\xbd\x16\x0e.=\r\x07\xae\xbc\x8a\xf0\x1f>\x0e-\xc7\xbe"\x97\x0c?+\xb2\xcf\xbd{\xa92\xbf9\xe9e>F\t\x99\xbe\t\x87\xa3>\xd1*\xec>F\x1d\xfd\xbdq\xee\x9c\xbc\xf2U>=;\x01t\xbd\x1e\x82\xb8>A%\x88>@*g>Q\xc1.?\x0f\xe5|\xbe\x8a\x8c)>\xf8\xe8<>U\x8b\x85\xbe\x95C\xb7=_\xa6\x9e\xbe\xf8{\x17\xbfX\xed\xb9\xbe\x08`\xeb= \xa7R\xbeq\na\xbf\xa7F\xb9>\x8f\xb9\xf3\xbc\xd5\xf2\x8a\xbc\x84\xd1\x8e>el\xa4\xbe\x83\xe4\xc0\xbdp\xd4.?\xc0\x1d\xd5=\x16\xfd\x17<\xc7h\x9d\xbeY\x11%\xbfi-e>\x92_<>iT\x0c?N`\x07\xbd\xebOk\xbe\xb2\x93\x1f\xbc\xe9(\x83>^n\xe4<\xff\x9e\x11?\x01\x037>\xab-\xae>\xcd\xe3\xa1\xbdC\xed\xdb>\x88l\x1d>\xb9\r\xd0>)9\xa7\xbcs22?\xabO\x9d>\xb2\x16Q<]\x90\xc9\xbc\xa2\xf5J\xbd0\xc5+>'
-p1198
-tp1199
-bsV503966188989603840
-p1200
-g2
-(g3
-(I0
-tp1201
-g5
-tp1202
-Rp1203
-(I1
-(I200
-tp1204
-g12
-I00
-S'^\xd3\x05?I\xbb\xac=j\xc4\xa9\xbe~\xc0\x1b\xbdM\xb4v>;\r\xac=h\x13\x81\xbd\x1b\x02\x90\xbeq\xfeK\xbdeP\xbe>\xda\xf2\xa9<\xb3\xe0\xd5\xbd\x0fj\x84>\xad\xf7\xd1=\xf6\xb2\xc7\xbd\x86\xce\xb1>\xad\xf8\xfa\xbd\x96;\xac\xbdV\xa2A\xbe\xd7\xd7\x03\xbeZ\x1d\x16\xbe\xb6\x08@=\xa2\xe6V>{U\xe8\xbcJ,\xee=x1\xcc\xbd\x1d\xea\xae=e\xda\x81\xbd2\xb1\x9a\xbeS\xb7\x89\xbc\x00\xea\x08\xbd%\xf1\xf6\xbd\x0e\xe3\xfc=\xef6\xb5\xbe\x18\xa1\xc5=\xbf~5>\x15\xa1\x84>\xde\xc1\x08>\x07\x18\x84>=\x0b\x9e<E\xe7D\xbd\xfb\xed4\xbd-\x93t>tk\x88\xbe\xe1\xaa\x80\xbd\x01\xa1F\xbd\x96\x9f\xf6>X\x81z=^\xe9.=\xfd\xc5\r?~\x00R\xbd\xd0\xcb\xfe>\xa6\xc2E\xbe\xb3\xec\x1e>\xed\xab\x0f\xbf]\x0e\xe7=\xf5\xde\'\xbcJ\x1a\x04\xbc\xef\x02\x10\xbf\xbe\x9c\xc7\xbe}\xc4\x8a> \xa1{>\x12*\x15>s\xb7Q\xbe\xaeG\xb9\xbdI\xad\xa5=\xba\xd5\x9a\xbe\xa2\x8f\xd2>h\xe5\\=u!)\xbe\x13_\xed\xbe\xe1.\x8f\xbe\xb7\xb4\xcc\xbc\xd6\xf3\xb6\xbd\x98O\xd4\xbd\x12\xb9\x9e=\x06\x16\xe1\xbc\xe7X">\x8e\x00\xec=]\xef\xde=@\xe5V\xbdV\xe5\xe9\xbd\xf6\xbd\xe9>\xd3\xe7S\xbe\xe7E0>9_<>\xc2\x13\xb5>\xd51r\xbe5\r\xe4>\x8d\xc9\x8b\xbdf%f\xbe\x03\xa6$=\x11\xbf\xaa\xbe@\x01\xc8\xbd5\xa3\x84>\x93\xde\x89=\x15\x05\x1e>\x90\xca\x91>\xf0\xd4\\=@+\x12\xbe\x0bPf=\xd2\xe5m>\x02:=>\xc0\x96\xf9=\xba\xc7\xc4>\xd6;\xdd\xbdB?\xae=\xa6\xe8c>\x1e3\xfc\xbc\x16\x8cu<9\xda\x9f\xbe\x15+o>\xc0\xfc\x95>nI\x8a=\xac\xc8\x13\xbd\x10\xa2\x81\xbd\xb2"\x8c\xbe\x88\xcf\x93>;\xb8\xd8=\x0bK\xa6=]X\x03?\xc0+\xc8=\xa8`N\xbd\xb7\xfe\x1d=\x96tA\xbd%\x90c>+\xde\xce\xbd\x92W\xbb<\xb7\xa7\xc6=\xca\xb2\\=\xcfP\xc9=t\xaa\x9b=\x95\xf7\x81\xbcm\xff\xaa= \xdc\xeb=\x80\xd9r\xbb10\xa8<\xed\xeb\x89\xbd\xbe\xac\xda\xbd\x03(\x12\xbb\xe4H<\xbe\xca\x10\x11>\x01\x84A>\xf8\x17\x98\xbe\xbb-\xa9>\xba\xe0\xa4=\x0f\x8a\x02>\xbc\x99\x8a>S8\x1d\xbeH\x8d\x03\xbd\xb0\x8c\xe8<\x9eV?\xbe\xad%\x8a>\xc6\xb3%>l\xfeJ\xbd(\xd1r>\x99\xb7\xbd\xbd3\x01\xd0=z\xa0\xb4<7\xa2\xb7\xbe\x02[\x9c\xbd!\x0e\x8c\xbe\xa2\xa8\xd4\xbeD\xe7\x82\xbd\x17\xcd2>24T\xbdI)\xb3\xbe\x8d\xa0\x9c>K\xa8l\xbc\x92v(\xbe\x1d\xc5\x91\xbcX\x08+\xbe\x8d[I\xbd\xa2{\x01?\xe8\x92\xc0<\x90\x8e\\=\xed\x98\xb0\xbeB\xa1\xf4\xbejb\x13=)h#>\xef\x18\x92>\xe0y\xa6;\xe6\x95W\xbe\xbc\x19\x19\xbe\xa2\xbcv>\x1fd\x00\xbcjg\xee=l3\x9c=\x10\rw>\x1d\xf8\xc3\xbdr\x0b\x80>\xdb\xfb\x9c\xbc\xe6\xd3+>\xd6\xc3\xc5=fe\x19?fI\x86>s\xb7H\xbb]L\xe4=\x17\x01\x16>}\xbc\x93>'
-p1205
-tp1206
-bsV503970523685347328
-p1207
-g2
-(g3
-(I0
-tp1208
-g5
-tp1209
-Rp1210
-(I1
-(I200
-tp1211
-g12
-I00
-S"+_\xb2>w\xbb\xd1\xbd\xb7\x9f\xd4\xbe\xac\xd1\xb6\xbda\x96h>[\x0b\xaa\xbd\x8d\xf2\xf7<ur\xee\xbdY\x84`\xbd;f9>\xdd?\xb9\xbb\xdb\xeb|\xbcOt,>\xab\x84\xf0\xbd\t\x04\t\xbe\xa2\x96\x8f>\xf9\xf8\xae\xbc\x17\xca\x1c\xbd\tP1\xbe\x89\x93\x93=t\xdd\xb7\xbe\x07\x8e\xbb=\xd2\x82\x88\xbc\x0b\xffI\xbe#m\x98\xbdm\xc6+\xbe\xe9\x80\x8e>\x11\xda0\xbex\x1b\xb1\xbe\x1b\xb5\xc2\xbc\x04)\xdf\xbc\xc5=\x0c=\xad\xe4;=\xe3\x18\x98\xbe\x1f\xa2a\xbd\r\xbad>R\xfb\x19>Nt\x03>D\xdf\xbb>\xafm\x0c\xbd\xe8\xf18\xbe\xe3C\xac=\x8c.`>b\x1d\x91\xbe\xf50\t\xbe/\x96\x12\xbe\xe5\x98\xb5>e\xeb\xed<c\xd0\xe3=q\xf5\xc4>\xbb\xfa\xf7=\x0b\x01\xfd>\xb7a\x88\xbe\xc3\xa15=\x9dZ\xbb\xbe\xb4\x95\x8f>\xb5=\xe7=\xa7J$\xbe\xa1\xcd\xd2\xbe_\xb7\xb0\xbe\x90\xa8\x87>Xae>\xf95.=\x92V\x07\xbeh\xe3\xcf=\x93\x17f>\x8fv8\xbe\xd5\x82\x84>!2\xb9\xbe;\xb1\xf0\xbdyX\xe3\xbe\x8d\x81\x87\xbe\xad0\x9e=elv\xbds*1\xbe\x10*\x1d>\xcb^\xb1>\x9c|\xfc=\x0cQ\xce=\xfb\x02\x83>~L\xa7\xbd\x18\x9d\xe9\xbc}\xdc\x93>#_b\xbe\x97\xdc>\xbc\x97\xe3Y=\t\xdd\x0c>E*\xa2\xbe\xd4\xe8\xfb>\x80\x84==!\xfeH\xbem\x86N>\x90\x1bv\xbe\xd7\xd9\x99\xbc[[\xa9>l\x99\xde=\xafQ->t\x12T>\xd5\xfd/>\xb1O\xcf\xbc\x8c\x7f\xbe=\x15\xe2\x8b>\xf7\x02L>\xa8z*>j\xcc\x80>[.\x9a\xbe\x0b\x0c3=]\xc7\x1b>\x11Au=\x94~\xb8<\x08\x8c0\xbeo'\xca=\x19\x07\x8f=8S\xfc=\xdf\xc78<\xebSm=\xc3\xa9\xd2\xbekd\x97>G\xe3\xee;\x1d\x94\xe0=1\xd4\xef>\xa7\x7f\x85=\xd7\xfd\x88\xbdm\xd60=Wk:=\x10\x05\xb9>\xa9rt\xbec\x00\xfb\xbd/\xac;\xbc\xe7\xfc\xb2<\xeb\xb3\x8e<e2\xd7=wI>>\xb9r\xcb\xbb\x97Pr=\xd7\x9d\x14>3\x9at\xbdA\xd9\xf29\xc3}\x80=3M\xda=\x15\x88Y\xbe\x97-\x8f>\xc5\x9b\xb2\xbc\xaf\xb0\xc4\xbe\xed\x0ff>E>K=U\x82\x8a>X\x0f\xbf>l\xa8I\xbeU\xfd\xf9\xbb/\x89\xf0\xbd\xf5u\xea\xbd'\xcf\x83>\x7fX`>\x940[=\xa8O\xdf>\xc8\xd6\xcc\xbd\x05\xb6;>\xd7}\xeb=c\xd6t\xbe\x157\x83=\rp\x04\xbeGh\x9f\xbe\xba\x05\x9d\xbeX\xc2\x13=Y\x1c=\xbe\xad\x97\x01\xbf\xa9\x079>\xd8v\x93\xbd#H\xe3<=]\xe3=\xb4`\xd4\xbd\xb0\xd3`=m\r\x05?\r\xc9&>\xc1\x0cL=\xfb\xe5\x93\xbe\x03l\xcb\xbeMLF\xbcV\xde\x1b>\x81l\x9d>}:<=\xc4\xd0j\xbe\xcbq\xf4\xbdi\xf7\xa5>\x9c\xee\x06\xbeYjZ>\xe4\x16\xb5=\xa0HK>\xdfX\x9a\xbc\x11'\x19>\xdf\xa3\x11=\xfb\r\xeb=\x1d\xc8J=7\x02\xbb>>\xe9\x83>\xff\xa4\x15>\xe3\xab:<g\\\x96=>4\x96<"
-p1212
-tp1213
-bsV503956894495436801
-p1214
-g2
-(g3
-(I0
-tp1215
-g5
-tp1216
-Rp1217
-(I1
-(I200
-tp1218
-g12
-I00
-S'\xe4Td>\xd6\x1eB\xbd\xbf<\xb2\xbe\xf4\x88\xa2<\x84\x88Q>@P\x8b\xbd<>\x0c\xbdO\x97Y\xbe\xc7p\x81\xbd\xc7y!>o\xcd0=\xbc,;=\x87\x95\x0f>\xc7\xcc.=`u\xea\xbdp\xc3i>\xe0\xa5\x80\xbd\xe7T\'\xbd\xe9\xd2\xe4\xbdP"\x06=\xf4D`\xbe\xea\n\xc2\xbct\xcb{=\xa7\xfbq\xbe\xb6\xe7n\xbd\xf3?\x8e\xbd\x0ceW> \xc1F\xbe\xff\x05n\xbe\xa16\x04>\xc9\x1b\xb5\xbc\x17s\xed\xbd\x96X\xf5=\x11\xe8\x7f\xbe:\x9c^\xbc\xcd\x05\x8f>\x01\xad\xee=\x99\x85\xe6=\x1c\x8b\x96> \xe2z=\xb1-\xa3\xbd\x7f\xfa\x8b\xbc\x83\x97f>\xb0\xea}\xbe\xcf\xab\x0e\xbe*G)\xbd{1\xa3>\xcb]6=\xd0Br=\xb6\xb0\x9f>\xa9_\x89=&\x03\xb3>\x1b\x9a\x03\xbe\x97\xe6\xff9\x8fk\xc4\xbeG\x93Q>\x87\xdc\xac\xbc\xea\xda\x06\xbe<\x7f\xc5\xbeI\xad\xb2\xbe\xe3nD>\x141\xa8=,|\x9d\xbc\x8c\xbfT\xbe\xa0\xdb\xc4;\x14&R>f\xa3@\xbe=\xd7\r>\x11"\x81\xbeR\xed\x9d\xbd\x89]\xe6\xbeK\xec\x87\xbeI\x17\x1a=]J\xcd\xbd\xca\xb3\xbf\xbd\xc70S>\xc0\xcd\x8a>\xb1[\xc4=\x14\xa1\xf7=\xee\x83+>\xb0<c\xbd\xd1\xb4\xe4<|\xb3\x7f>\x80([\xbe\x8aC\xe4=\xd7lS=&\x06X>7\xd0\xa2\xbe\x17h\xdc>\x90 \xac=\xcck\x1c\xbe\xf1c$>\x80\xdbN\xbes\xf4B=\x10\xbe\xa1>/\xa2\x89:de\x02>\xac\x82B>a\x97\x1b>\xb1n\xe5\xbc\x9f\x8c\xd0=s3\x8e>\x93y\xb3=\xe3+\x0e>\xd9\x18\xb0>\x11Pg\xbe\xf9A,<\xb46\xee<\x8fE\x84=C\xc6a\xbb\x1f\xe0_\xbd\xb6UI>\xc4z\xf0=\x12Z8>\xa0\xc5\xd5<\xbfr\x1d=\xfet\x8d\xbe\x1cc\x8b>\x08@\x8d<5\xdf\xa6=\x7f\xd7\xe6>Xk\x81=\x8c\xa2\xa9\xbcV\x9a`\xbd.\x92\x08\xbdT<u>\x0f\xd8\xf0\xbd\xd0Q1\xbd\x01\xd9==\xe4\x14\x8c=\x1cc\x1f=|\xe9\xa5=\xd4\x92\xca=`\xaa:<\xa2\x164=}R\xfa=\x17B\\\xbd_ug<3\xffF=A\x19\xcc=\n\xdc\x11\xbe\xefk\xab>\xd1\xad*\xbd\xab\xbb\x8e\xbeS\xa28>#\xf35\xbd\xfa\x8dD>\x8a2p>\x0e\xcb\x11\xbeA\x97b\xba\xe1X$\xbd\xd7G\x13\xbez?\\>\xcf\xfeh>9\xd5\xb4;^\xe5\xa2>\xf9(\x82\xbd\xc72\xf7=aG\x92=\xb11T\xbeg\xba\xdb=\x91XL\xbel\x0c\x9d\xbe\x1f\x04\x17\xbe\x8b\xaf$\xbd\x80\x95\xc9\xbdy3\xc1\xbe\xa4\x9at>\xa9=\xa8\xbdd=%\xbd\xccs\t=\xbb\xa3$\xbe\xf7.b;Lv\xce>J\xe4\x7f=\x17\xabn\xbb2\xd9\x91\xbe\xf2\x9c\x86\xbe\xbb\xb6\x11<`\xe4\xcb=&\x8f}>\x00\x90U=y)\x16\xbe\x93\x06F\xbd\\\xfde>\x9fE\x93\xbc\x7f`0>A\xd7\x84=\xb4\xe3\x82>\xe1\x8f<\xbe\x0c\x04#>\xbcd\x85=\xb9\xbc\x0c>[\xb6\x14>\x05Z\xa4>\xda\xd0\x8f>\xa8\\\x12>|\x02\xa5=dM0=\xef\x0f\xd2='
-p1219
-tp1220
-bsV503973727986786304
-p1221
-g2
-(g3
-(I0
-tp1222
-g5
-tp1223
-Rp1224
-(I1
-(I200
-tp1225
-g12
-I00
-S'\x98gf>\xc4\xb7\xa5\xbc\x85\xfd\x83\xbe\'b>\xbd9t\xff=8\xa9c\xbdY\xd8,<\xad\xe9\x17\xbe\x9d\x1a\t\xbd\x81p\xd5=\x0f\x84\xd0:\x81"\xbd;\x94\x86\xea=\xb54\xf6\xbb\xbc~\x9d\xbd\xcf\'\x1e>\xa3U\xd9\xbc\x17\xb3\x16\xbd\x9a\x94\x9d\xbd\xd7\x95\x91<\xe3,-\xbe\xdc\xce\x1e=\xb0\x1c\x18=\xc8\xb2\r\xbe\x97\xe7\x91\xbc\xb9\xcb\x83\xbd\xb2A\x18>+\xaa\xe1\xbd!\x809\xbe\x85b#=\x9b{x<\xdf|&\xbd\x80\x7f2=\xe4\x91+\xbe\x98"S;s\x87\x16>\xd9\xfb\xa3=\x83y\xb9=\xafEY>5\x1eI<7\x07\x95\xbd\xc1\xd4U;\xc9S\xf7=7\x92@\xbe\xe8\x0c\xc1\xbd\xdd\xbdA\xbd\x18>L>\x0f\xc7\r<\x11\xff\x11=s\x95l>\xe4\xce/=\xab\xb3|>\xb2\x14\t\xbe\xb7\x9b\xa2<l\xa5Y\xbe.\xd2\x06>\xcfXW=\xd0wj\xbd\xd2\x1b\x8b\xbe5\x9cm\xbeh\\1>\xa7\x91\xf4=\x93\xc2\xe2<\x9f\xa8\xdb\xbd[hc\xbc%"\x06>k\xfd\xbd\xbd+\xb6\x10>\x94\x81\x05\xbed\xebU\xbd\xba\x1f\x99\xbe\xcd\x953\xbe\xcbqF\xb8m\xc6\x86\xbd\x8fY\xbb\xbd\\u\xbe=\xfb\xd9\xfb=X\\\x9b=\x9b0\x99=\xdd\x93\x02>k!9\xbd\x04Tk<Q\xfe)>Kz\xfd\xbd\xa4uV=\x84\x01\x88=\x83)\x04>\xd9\x17%\xbe\xa6\x1f\x87>\xdb\x824<\xbb3\xde\xbd\xaf\xab\xea=\x06\xd4$\xbe}\x8eL\xbc\xadC7>p\x81c=\xe9#\xd9=\x8b*\x08>\xe1\xdf\x83=%7\xcf\xbc\xa3\x02M=\x13@2>o\xf2\xb3=\xd4\x1a\xbc=\x0f\x9aN>\xf9\x85\x0e\xbe\xcaV)<\xfc\xc9\xb0=\xe4\xf5\x03=\xab\xd6&:xE\xc3\xbd\x0f\x7f\xbd=\xa7\xee\x97={6\xcb=CD"<obt:\t~:\xbe;\xa7+>)Z\xd0;\t\xac\xa5=$h\x89>\xedv\x89=#K\xd8\xbc5\xc1\x19=\xd7\xf3\x8f\xbb\xa9\xed3>\x17-\xe4\xbd\x8bC\x95\xbc9\xe4\x9e<\x0b8r=\xcb6n=\xd5\xd8\x90=\xeb\xcc\x8a=)\xe4\xc9<H\xf5\xd2<e(i=p^\x9b\xbc\x08"\xc7\xbc\xff&\x88<h\x15]=x\x99\x04\xbe\xbc70>\xe4\xa3\xee;\xabr`\xbeMJ\x19>\xad.\x04<+\xb7\x1c>/\xc4=>\x83\n\xb7\xbd\xb3\xf6%\xbdO\xa7\x18\xbd\xcc\x12\xaf\xbdQ\x164>\x1d\x9c\x03>\xa1\xc1\x07\xbb\xdb\xf4d>\xa3\t!\xbd\x9f\xc7\xc1=wy\x08=\xdbr\x07\xbe\xcf\xc1\x16=v<\x06\xbe3\x19Y\xbec\xde\xf5\xbd\xbbV*<\xceB\x9d\xbd\t\xd2\x8a\xbe\xcc\t\x02>9\x1e\xd4;,5\x85\xbb\x93\x03\t=DL\xdd\xbd\x9c\xe4\x13\xbd\xfd\x92\x8f>\xf1\x1fx=\xf9\x10\x13<H\x96I\xbeY\xbe\x87\xbeHz@:\x80\xe1s=\xd9\x01\x04>\xfc\xd8\xc3;\xf7\xfa\x0e\xbe\xe2\xb2\xa9\xbd\n\x05\x19>\x1de`\xbc\xe4t\x01>Gd*=_\x931>\xe3!\xab\xbd}t\xd8=$s\xe5<\xcbc\xc6=\x97\x17\xbe=7\xdc}>\x18\x154>\x88\x97m=\xbfJ\xd7<\x18\xfc\xfb<\xbc)\x80='
-p1226
-tp1227
-bsV503959672635011073
-p1228
-g2
-(g3
-(I0
-tp1229
-g5
-tp1230
-Rp1231
-(I1
-(I200
-tp1232
-g12
-I00
-S'\x01\xa5\x8a>\xc2\x97<<\xa2k\x92\xbeJ\x0c\x87;\xe3\x06\x1f>\x10\x89v\xba\xbc\xe1\xde\xbcx\x9c3\xbe\x84I.\xbd\x02\x9f\\>A\x93\x19<\xcc\xf8\x06\xbd\x14\x00\xf0=b\xb0\xa4<\xd96\x89\xbd\xde1u>\xa5\x1d\x9e\xbdu%\xb1\xbd\xc2\xa0\x07\xbe\x14\xa3\x16\xbd\xc1\x83\x1c\xbe\xf7?\xd0\xbb\xe09\xd5=\xe5\xadg\xbd\xcb\x18e9+u\x9c\xbd\x96\x7f\x15>\xf4 \xfc\xbd\x86,S\xbe\xf6%\x83\xbc%\x8e\xa5\xbd\xe3\x97\xad\xbd\x06\xf1\xd3=\x9cb\x90\xbe\xaa\xad\t<d^j>H\xbc\x1a>\x95Y\xd3=\xf9\xc9h>{\xcd$=%\xe0\xa8\xbd\x1c\xa7W\xbd\xf8\xfd\x11>\xcc\x89C\xbe$\x19\x03\xbeo1$\xbd\x12b\x97>g\xb5\x82=N\x01\x82=\xd8Z\xa5>\xa7|9\xbc\xf8:\xaf>\xa0R\x06\xbe\x08\xc9\x07=\x84s\xb4\xbeei\x00>V]\x85\xbc\xc4\x9c\xba\xbd\xdc[\xcd\xbe\xda\xb3\xa9\xbeR:\x1d>\x8es(>\x90\xf7\xa6=\xe2\xa7\x1a\xbe{\xfaf\xbc\x1c=\x1a>:\xd1O\xbeN\xe8F>\xf6z\xbf\xbd]2\x0f\xbe\xa7r\xba\xbe5?\x83\xbe\xfd\x1c\x10\xbdGL\xc5\xbdl\xc8\x9d\xbd\xc4\xf5\xf6=\x04$\x14>\x0f`\xc7=\x8c\xd4\x1d>\xc84\x1c>Ha\x0e\xbd\x99\xd3!;\x13C\x9a>\x0e\xd5e\xbe\x9fJ\xd0=\\\xc2\xa2<\xad\xa9V>\x8c\xe5\x8d\xbe0/\xc4>\xd4\x1ai<!~!\xbe\xdc\xba\xbf=\x14Y-\xbe\xde\xe5\xf4\xbcx\xdd\x8d>N\xf4\xe18\xb6L\x18>\xc6|1>\xf22\xf5=\x9c\xa9\xa9\xbd^\x0c\x02=Daa>b\x9b\xee=\x12\xd4\xd9=&\x1f\xa4>QI2\xbe|\xba\x98<K\x99\xcf=sp#=\x10H\xe8\xbb\x1b\xd94\xbe\x1c\x1f\xf0=.\x0c\x12>\x854\xfb=(!/=\x1a\xfd\xbb<tev\xbe0\xaaQ>\xa5\xd64<\x00=\xd1<\xe9s\xc4>~\xe6\xc4=T\xdfl\xbc\x8c\x7f\xda\xbc+\xad:\xbdWw\\>_\xee\x9a\xbd\xeb\x82\xa1<\xb9NY=\xf3|\x9b=\x8b\xf1%=\xcez#=\xac\xcfF=\xaf\xe7\x85<\x9c\x816<8\x1d\x9a=X\xd08\xbd\x1f\n\xc2<\x17\xb0\\\xbd\xc9\x10L=j\xba\x12\xbe\x94\xa5\x80>\xc9\xff\x03=\xa4n}\xbe6[b>kh\xee<J\xcc\xd7=\xd0\x8d\x9a>\\*\xc8\xbdC[\x06\xbb\x87\x1cQ\xbd%o\x0c\xbe*NE>}\xd7+>\xf4\xb0\xed\xbb\x1ck\x93>\xf4\x1f\xde\xbd\xacP\x94=zD\x90=\x90S\x82\xbeD?\x8c;\xee\xaf5\xbeh\xc5\xa8\xbe\xe4\x85.\xbe\x1b\x06^<\xaeui\xbd/@\xa8\xbe$An>\x08\x18\x0b\xbd\xd00\x92\xbd\xf4o\n\xbc\x05\x82(\xbe\xe1\x90`\xbd\xe2\xce\xc6>w\xf2\x83=\xaa\xdb7=\xd6\x19\x83\xbed\xff\x9a\xbe\xe6\x92\x18=\x0et\xcd=\xc3\xa0\x80>p\xe7\x15=\x0c#\x15\xbe[\xc8Z\xbd\xab#\x7f>\xcbA\xb3:\xbc\x8b\x06>P]{=xuT>W\xb0\xce\xbd\x0c8\x15>@\xba\xfd<\xdc\xcc\xfa=)\xbf\xfb=\x9ei\xb9>{u\x82>\xb8\xc2G=\xb1\x8cY=q\xbd\xb8=\x01\x19\x98='
-p1233
-tp1234
-bsV503970626470936577
-p1235
-g2
-(g3
-(I0
-tp1236
-g5
-tp1237
-Rp1238
-(I1
-(I200
-tp1239
-g12
-I00
-S'\xec\xbe\xb9>\xceH\xce;B;\xd0\xbe,\x01b<\xdc\xd2D>\x93\xb6\xf3\xbcr\xff\x83\xbd\x9a\xa5Y\xbeq\x98\x85<\xa0r{>\xff\xb7`<\x07\x99)=\xe2@\xd3=\xfemA:O\xe1\xae\xbc\xb4`\x97>q\xed\xb6\xbd<\x96\xbb\xbd \x88\x18\xbe?\xa8+\xbd\x19\xceS\xbe\xfc\x19V\xbc\\\xc3$>\xeb\xda\x04\xbe\x03T\x11\xbdg(\xa2\xbdi2B>\xa5\x18)\xbeX\xa0d\xbe\xd5\x0f\x03=o7\x01=H\xef\xfe\xbdq\xd0\xb4=\xef-\x9c\xbe\xfb\xa7+=\xc56\x98>\x80QW>d)\x17>\x8a\xc6\xaa>(u\xdc;\x9e2\x1c\xbe\xe4\x94{\xbdS\x1eG>\xad\x02I\xbe\xfbE4\xbej\x85*\xbd\xe4N\xd8>,\x129=\xd7&\x8e=\xbe\xbc\xd4>\xfb\xd3\x08=\xe7\xaa\xd3>H+>\xbe\x86<\x97<6\xb0\xe0\xbe\x023R>\xc3\\c<\xea\xaf\xc8\xbd<\xed\xf3\xbeD\x9c\xd0\xbe\xf9Y_>\xf3\xc6~>\xb7\xc0\x9b=\xc8K_\xbeV\xd7/\xbbp\xfc\'>:V\x80\xbe\x0f\xd6\xa0>\xca\xe8\x11\xbew~\xe7\xbdt\x18\xf5\xbe\xd1\xbd\xb1\xbe\xc9N\xa6\xbd#8\xe9\xbdC~\xcf\xbd\x84\x81*>p\xe1*>]\xf5\xc6=\xf1?\'>\xcan">\x95~\xdb\xbc\x07?\x88<\x1bY\x96>K\xe2\x87\xbe\xcel\x07>\xd2*g=\x0c\x96\x8f>V\xc9\x9f\xbe\x96\x92\xf5>\xec\'5=\xc0\xbah\xbe\xde\x86=>1\xe1w\xbe\xdb\x99\xa0<\x0b\xfb\xb5>\x0fu\t\xbdC\xe85>\x80\x1fT>\xa3\x9e/>g\xd9\xe7\xbdH\xde\x13=\x91Yx>@x\xef=\x7fk\x17>^s\xcc>\xafys\xbe>B\xc2<y\x9f\x12>?c\xa0;[\x91-\xbd}\xa9{\xbe\x06>\xea=\xbeTb>\xe8\x89>>\xb6\x17\xa4=+\x1e\x8b\xbc\xf6@\x9c\xbe\xd0.]>\xa2=\x13=c\xfc\x19=\xcd\xa1\xfb>\xdf\xc0\x0f>`\x0e\t\xbd\xb4\xea\xad\xba\xcb_4<>\xe0\x8f>\xbco\xc8\xbdpr\xde<k9\x1b=w\xaff=\r\x86\xfe=\x1dA\xd4=T\xadE=\xff\x18i\xbbD\x18M;m\xd4\xdb=L\xdde;X\xe4S=\xd3b\xdf\xbd\xbe\x96\x03=t\xa62\xbe2>\x9a>\x9d\xa2j=Ua\xb5\xbe\xe2\xae~>\x95\xb9\xe0\xbc\xa6e\x19>r\x00\xb7>\xbb+\x1f\xbe\x00Pv\xbb\x88\xdd\x0f\xbc\xb2\xaa\x0b\xbe!\xbc:>\xe0\xff->QrC\xbc\x9f\xd6\xb0>\xe2Z\x02\xbe\x81\xa3\x97=e|\xaf=\x81\x8b\x9b\xbe\x07\xb9\xda:Sk^\xbew\xa7\xc2\xbe\x03\xb7\x17\xbe(\xa2\x88<r\x9d\x89\xbdc\xfc\xc8\xbe\x10\x7f\xb0>\xfc\x0b\xbc\xbcC\x12\xca\xbd\xcb9\xc6<\xb1V%\xbeIS\xdc\xbd\xdar\x00?T\xc1\x8d=\xba t=\xa5D\x85\xbe\x84\xd5\xc0\xbe\x8c\x8f\xb0=2\x9b\x19>\x01\xb4\x85>\xbb}\xf2<0\xde7\xbe\x9bp\xdf\xbd\x98.\x8e>\xd9\x7f\xb4\xbc]\xc4o>\xcc\x8cP=\xeb\xb4\x84>\xdf9\x11\xbe\x9c\x1d\x1e>\xc0=\x9f=\x98\x90C>>X\x03>E\xc8\xde>\x93h\xaf>.V\x1e=\n\xe0F=\x03,J=\x1c\xe0\xb7='
-p1240
-tp1241
-bsV503967992376733696
-p1242
-g2
-(g3
-(I0
-tp1243
-g5
-tp1244
-Rp1245
-(I1
-(I200
-tp1246
-g12
-I00
-S'<!\xa8>{\xe6\xe6\xbc>\x89\xc3\xbe\xdb\x83Y\xbd\xfd\xa0J>"\xbf\x08\xbd@zJ<\xccG.\xbe\xac\xed`<h\x1c(>D/|\xbc\xc2%t=)\x02&>3,\xb6\xbc\x84\xe3\x9c\xbd\xdcQy>QQ=\xbd\xe2\xef_\xbc\x8d\xc3,\xbek\x01\xb3;\xbbI\\\xbe>\x9fS=KS\x0b>\x95\xa9\xfa\xbd9\x0c\xbe9\x9a{\x13\xbe\xac\xaf=>\xc0\x15\n\xbe\xa9\xbfQ\xbe\x9c\x1c\xba\xbbw\xf3\x9f=\xc4\x9b\xf8\xbc\x89\x1d\n=L\xea\x96\xbe\x7f\xad\xa3\xbc\x05\xda(>v\x88\r>\xe1?3>\xdf:\x84>\x8e\x8ff\xbd\xb0\xb6\x05\xbe\xf5j\xb5<U\x91\x10>\x9e\xb9\\\xbe\x9b\xd7\xe7\xbde\x9b\xb4\xbd\x8d\xa4\xa8>+\xfd\xe6\xbc\x86eU=\xc6\xc9\xba>.y\x1c=\xbfP\xd4>\xae\x14M\xbeW\xca\xee=\xbbh\x91\xbe9Z^>\x18\x8c\xa0=\xfe\xa9\x11\xbe\xeb\x11\xa0\xbe\xa0K\xb5\xbeB\xebi>pO?>Ji5<\'\xdd\x0c\xbe\xe47D=5\x91\xfd=\xa6eb\xbe\x9e\x14\x80>4\xc3\x13\xbe\x92-\xaa\xbd\xfct\xbd\xbe\x80^y\xbe\x84\x8al\xbc\t4\x90\xbd\x14h\x03\xbe\xbeZ\xbf=\x8a}\x15>R!|=\xd6\xa8\t>\xd3\xe0(>dz\x9c\xbd\xf1c\x17=\x1e\x1ez>t\xa0(\xbe\xa7V\x92=\xf1a\xd4=\xd2\xdbj>y\xe6\x88\xbe\x96=\xd0>\x1dj\x1d<\x01M\x83\xbeD\xa3\xf3=P\x85{\xbeH\x9f\x81\xbc\xbbk\x96><\xa5\x8b=\xc4v\x12>i\x83<>\xda\xad\x10>\xbc\xb4\xce\xbd\xb4\x18 =y*T>\x94\xf5\x08>"\xc8*>\xf20x>\xbcb.\xbe\xcb\xff?=\xa0\x10">\xd5x\x83<\x15\xa7\x8b;F\xad9\xbed\x84\x94=U&\x12>\xf7\xff\x9a=UQE9\xeb\xf5\xc7\xbc\x83N\x96\xbeW\x14c>\x07p\xe3\xbbd\x14o=\xe97\xd0>XM\xcf=5`h\xbd\xf4\x08|=\x9e\x80*=\xfb\xef\x8b>\xe4\xda\xc3\xbdT\r\xa5\xbc7\xce\xb0<\xc5\xa3\t<\xd0\x9d\x00>\xf5_\xd0=\xd7[6=p\xc3\r=\xc3h\x91=\xea\x167>\xf0XT;7=\'=\x8d\x92\x83\xbd\xa8\x02\x85=\x1c\xb43\xbeDTp>\xe9\x95$<\xbb\x9c\xa5\xbeY\x10Q>"\x8d\\\xbcuw0>="\x8e>~k\x05\xbe\x0cd\xca\xbc\xc0\xa7V\xbd\x94Y\xd0\xbd\xb2\xfbH>b"\x1b>?0\x10=\x1d\xdc\xa7>g\xff\xf7\xbd\xe4\xee\x82=\xa4J\x9a=\x84\xa1c\xbe\xf4\x82\x8b<o\x07\r\xbec0\x9b\xbe\xd384\xbe\x18:S=\xf0\x88\xc7\xbd\xb5.\xc9\xbep=o>L\xb2F\xbc0b\x18\xbd\xc4\xd0\xc4=e3\xe4\xbdt\x8d\x85\xbd/\xf7\xdc>\x8b\xc8\x80=/\x1f\xd0<\xdb~u\xbe\xd3\x9d\xba\xbe\xa0\xc5\x96=\\\xb6\xe1=H\xaf\x88>\x9d\xb0\x84<L\x937\xbe\xe4\xd2\xad\xbd\xf9\x91E>df\xb0\xbc\x82\x98u>\x10q\xb9=\xee\xe4L>\xff\xb8\x1d\xbd!\x1e\x1d>\x85\xc5^=\x86\xd3$>M\x16T=QC\xd2>y|w>b\xe8\x1c=z\x7f\n\xbc\x00\x9a\x7f<B6\xb5='
-p1247
-tp1248
-bsV503978071150829568
-p1249
-g2
-(g3
-(I0
-tp1250
-g5
-tp1251
-Rp1252
-(I1
-(I200
-tp1253
-g12
-I00
-S'k\xda\x1f>\xd6\xac?\xbd>\x8d|\xbeu\x8d\x0c=\xf2=\xfa=\xa7\x05\xb1\xbb\x9b\x9aV<\xf1\xae\x13\xbeU\xdaL\xbd\xc2\xbe\x0c>4\x9a\x94:|\x1c\xca<\x1e/\x0e>N\xcb!=\xa0\x9dR\xbd{\x85)>\xc2\x04y\xbd\x94\xa8\xe2\xbc*\xc3\xca\xbdT\xfe\x85\xbc6\xea\x06\xbe\xcb\xdf\x1e\xbc\x02O\x95=q \xd5\xbd\\D\xb5<$\x98\xaf\xbd)\xff\x1a>\xb1,\xc4\xbd\xe5\xc9\x19\xbe!P*<X\xe5\x97\xbd\x95/\x8c\xbd0\xb7\xd7=\x16X\x8c\xbe./\x1a\xbd\xb5\xf7\x1d>\xcc1\xa0=\xb7\xf3\xd9=\x15\x80C>\x93\xe9\x8f\xbc\x93\xfd\xc1\xbd!\xdd\xca\xba{D\x04>\xdf9(\xbe\xec\xc2\x00\xbe\x19\x82y\xbd\xd9\xd1d>\xb0`\x93=\xcc\xcc\x81=,\x0b|>~6):!<\x9e>\x99\xb9\xa1\xbd\xee\x82\x9b=\x84\x0c\x88\xbe\x0cN\x0f>\x969\x85\xbd\xa8\x83"\xbe\xd0\x96\x88\xbe\xb1\x1e\x8e\xbe4\x18\xf5=Ps_=\xfa\x8d-=\xcd\xf9\'\xbe\xcf\xc3P=cj\xca=\xc9\xb6@\xbe\xba\x9f\xcd=~\xf6\x88\xbd\xaaI\xac\xbd\x94-\x9d\xbe\x99;M\xbeR\xc5\x19=\xbe\xe5\x80\xbd\xf0\xa7`\xbd`/\xf0=La$>\xff!A=vs\x1f>U\xe0\x1c>A\xe8\x8b\xbd\x8c\xeey=\xe2\xecx>\xac\xc4\x1f\xbe\x97\x89\x85=)\x89\x9b<\x12\xcaX>\x14\xbd\x83\xbeJn\xa7>\xae\x0c\xe7\xbbNt$\xbe\xb4\x12d=\xd4\xd0\x01\xbe\xe7{\xa9\xbc\x05\xbaw>\x00\x8d]<\r`\xc5=\xa4\x98\x00>\xa9\x01\x03>\x82\x04s\xbd;D\xb3=\xdc\xdeR>.K\xbf=\xe2\xc9\x10>\x93o\x89>=\xc8\x07\xbe\xe9"\x11\xbcE\x82,=\xc0~\x12=Y\xc0%\xbb\xaa\'\x9d\xbd+\xc0\xbc=\x92\x83\xc4=\x7f0\xd1=[GF\xbcHE\xc4<L\xd4W\xbe\xec\x1b9>t?\x1c\xbc&\xf6\x82<\xeb\x9f\xb3>\xbbfj=\xee7\x9c;*o0\xbd\x08\xdb\x9e\xbcr\xe5>>\x01SO\xbd\xa0\xfa,\xbd|\xa6\xb2=y\xe0\xde=\x1c%B=e\xb5\xf5<\xc9\\q=\x95\xc2C=x6\x1d=\x13\x8e\x12>\x16f\xce\xbcq\xe5B=PJ6\xbc\x04\x87c=\xac\x02\x11\xbe\x14V\x8c>)\xc4\xbe:\x17`g\xbed\xf3\xf4=$\xe7\xd1\xbc<\x02\xcf=\xeb\x06?>\x8a\xcf\xb5\xbd\xa0B\xf1\xbb\xa1\xd1_\xbdDz\xe0\xbd\xf2\xda#>\xc3\x9e >\xfb\x05\x1f;\x01u\x96>9\x84\xe6\xbdB:\x8d=\xdfV\x88=Y\x0fC\xbel\x0cf=~\xd4A\xbe\xee\xcb\x9d\xbe\xa0i\xeb\xbd\xfe\x18\x8b;\xf7\x91%\xbdPs\x94\xbe\x85\xaaK>\x8c\x16\x94\xbd\xd9\x14u\xbd \xdb\x00<\xb8\x94\x0f\xbe\xb5\xea\x88\xbc=\x11\x92>\xec\x9d\n=\xef\xa8\x9c\xbc!\'^\xbe\xcc\x0eQ\xbe+\xdc\xa7=n\xdd\x1c={\xdbX>\xc7\x9eu=IK\xf3\xbd7\x94\x95<3\x82">\r\xe1\x91<\x98\xa3\x04>m\xb5\xa7=\xae\xeb@>U!\xf6\xbd[Z#>{\xb8r=I@\xec=\x1a\xfcW=\xf18\xa0>\x14\xf50>\x18:\xd9=\xd6\x8e\x1c=\xcf\x06A=\x8f\xd05='
-p1254
-tp1255
-bsV503971242928787457
-p1256
-g2
-(g3
-(I0
-tp1257
-g5
-tp1258
-Rp1259
-(I1
-(I200
-tp1260
-g12
-I00
-S'\xb5&-?G\x8b\xef=\x80\xd2\xd3\xbe\xe1<\xcf\xbd\xe8\xfd]>\xcdf\x8f<8\x8ev\xbe\x98\x00\r\xbfh\xae\xd9\xbd\xda\x8e\xf3>O\x02:=P\xa5\x10\xbe.e\xd2=\xd4\xb7\x1b=\xe0\xe4.\xbe\x89\x15\x12?\x03h\x84\xbeU\xcf\x9a\xbe\xa2p\xa1\xbe\xc9\xb8y\xbe\x1a\\\xeb\xbda\xab\x89\xbd\xc6&7>\x01\xe9\x8d=\xe7z\x8e\xbd0\x1a\x0c\xbdL\x81k>\x8e\x97\x87\xbeBr\xd1\xbe\x92%+\xbew\t\xde\xbe\xb0S\x92\xbe\x15\x11F>a8\xec\xbeI\xaf\xde=\x82\x02\x1c?\x84\x9f\xfa>*fQ=:/\xbc>\xe0<\x9e>w{"\xbeq\xf2\xcd\xbeU2\n>\xb1!\x8c\xbe\xe2\x98\xb7\xbe\xe2zM=qH\x1f?\xc8m\t>64\xd0=0\xcb.?\xa6\x01\xb2:\xb2g\xd9>\xcb\x8a\x7f\xbec\xbb\x12\xbe\x00\xb2,\xbf\x18\xbc\xaa=M\xe0[=\x11\xe8l=\x9bF[\xbf\x18]<\xbf)?\x91>\xb9\xee%?Jm\xbd>\x98\x19\xa7\xbe\xeb\xc9\x80\xbeb\xad\xac><\n\xa6\xbe~ \t?\xf6a\xeb\xbc\xd1k\xcb\xbe\xccN7\xbfx\xec\x07\xbf\xa8\x01\x9c\xbe\x1a\xc3\xac\xbe_\x1b\x93\xbdH\x9e\x15>\xe4iE>\x8b\xe2\x87>\xa2\xce\x85>*\x92\x83>\xec\xf7h=\x00\x9eT\xba\x1d\x89#?\xf8\xeb\xca\xbe\xe5Z\x85>r\xc3\x02\xbeU\xf9\x80>\xa2\xea\xf8\xbe \x0fB?S=C;\x0f\xa2\x86\xbe\x91O)>\xcbo\x8a\xbe8\x1c\xa3\xbc\xbcU\r?\xeb\xba\x04\xbedh\xfb>\x90\xec\xbd>~4F>\x10\x86\x15\xbe.2I\xbe\xe2\xbd\xd0>\x875>>\xd0\xb0!>L\xfa*?W\xf8\xb9\xbeS\n\x00>\xa9\xaa\x87>\xcb\xb6\x1c>n\xfdM\xbdO\xf3\xfc\xbe\xe2\xceT>\xf1\xe3\x81>\xac7\x8d>\xf2D+>,\xcb\xe6=\xe4\xd0\xf4\xbe \xe5\xb7>\xa8~\xc6=-\x1d\x90=@S ?\xe7\x87\xca>\x9a\x02\xe1=\x95\xc4\x06\xbe\x98\xbae\xbeY\xd6\xc3>\x9c\x1d\xe7\xbd|b\x13>\x98\xb6\x06>u5\x85>\x00\xc9\x8c\xbd\x0e\x8f2>\x84\xa9\x1d>\x8c_\xe4\xbd3\xd2)\xbe\xfae\x9d\xbd\x88"4\xbe\x08\x80\xf4;\x90\xda\x82\xbe@\xce\x90\xbdI\x9b\x8c\xbe\x90\x11\xd4>\xc9\x92\x8e>\xc5\x1b\xec\xbe1[\x0c?\xaf\xb2\x01>\xd5E,>Q U?|\xbb<\xbe+\x87\x7f=q\xc1\xe6\xbd\xda\xce\x8d\xbe\x98\xe0\xd1>\r\xfey>p\xdb\xd4\xbdo\x0b\xb3>\xf2V`\xbe\xb7\x82\xdc=\x91\xeb;>\x1c\xbc\xe1\xbe\xca\x011\xbe\xd7W\x8d\xbe\xd6p\x1f\xbf\xc0:\x91\xbe\xe1\x84\x84<\xcb\x9d\x89=\x88\xc5\x14\xbfL\x15\x07?\x94\x9f\x05\xbd\xf7\xd9\xf8\xbd\x80\x17\xb4\xbc\xaa\x10\xce\xbe0\xb9\x81\xbe>L&?LQZ>\x93\x02E>VX\xda\xbegw\x12\xbf\x124\x1c>\xd4\xc1\x86>\xcb]\x01?\xe2\xf9\xb7<\xdd\x8e\x90\xbe\xc2\xf9<\xbe\xd8C6?\xa2\xce\xcb\xbc\xfb\x8dm>\x879\x14=\xc1\x88\xa5>FSA\xbei\x87\x85>hr\x9e;\xa3\x82?>^.\x9e>s\xc5&?\xb5\x00\x1c?/Y\xf9<\x1f\x8f<>he\xb6>\x153F='
-p1261
-tp1262
-bsV503972620597854208
-p1263
-g2
-(g3
-(I0
-tp1264
-g5
-tp1265
-Rp1266
-(I1
-(I200
-tp1267
-g12
-I00
-S'\xc7\x0fD?$)n>\xc2Y\r\xbf\\\x81\xf6\xbd\xd1\xb5R>\xe6\xb8\x87=\xfc\xf4\xcf\xbdmT\xa0\xbem\xe1\x8c=P\x95\xe8>\x11\xe1\x12\xbd5E\xfc\xbdDZ\xef=8x\xae\xbc\xf1J\x14\xbd\x0b\xcd\x03?\x19DF\xbex\xc5P\xbe !\x8b\xbe\xfd\x06(\xbe\x8f4h\xbe\xb1\x97\x8f=\x7fM\xb7>p\xb3\xff=\xbb\xbe =;\xaf\xfc\xbd\x93\xba6>\xc5\x13H\xbe\x01s\xa0\xbe\x88\xd2?\xbe\xc1\x9e\xb5<F\x8c\x13\xbex\x9e4=\x0c\xb1\xe8\xbeK`\xd5=\x99\xfb\xce>\x1f\xea\xcc>8\xd4x>x\x0c\xcf>1\xe3\x89=,rM\xbe\x83E8\xbeO8\xa7=\x19\x7f\x81\xbe\xf4\xe3`\xbe5\xf7(\xbd\xd7\x86\x1e?ek\xe5;?\xee\x8c=M???Ox\x95\xbd\xfe\xad\t?e@\x9d\xbea\xdb\x82=e\x0c\x10\xbf\x08\xf36>\x15\x8e(>\xa9\xa8\x0e=L?E\xbfK\x17"\xbf\xf5\x13\xbc>\xc1\xe7 ? \x03^>\xcbq^\xbe\xf8\xa8\xcf\xbdUU=>\xf1\x13\xc1\xbe\xc2\x9f!?\x80\xc1q\xbb\xf9I\x96\xbe|\x9c\x18\xbf\x0c7\x00\xbf8Y\x98\xbeA\xe2F\xbes\xae`\xbe\xa0\xa1|<\x90\xd5\xd5\xbc\xb0F@>\xd3\x0b\x86>\x81\xc3(>\xe3\xc7\xc0<\xd8\x02\x8d\xbd\xf7\x04\n?\xdc\x1b\xc1\xbe\xf5\xeb\x87>\xfff\xee=q~\xcb>@M\xb5\xbe{n!?{cP\xbd\xa7}\xc8\xbe\x05\xfcA>q/\xd6\xbeM\xf2A\xbd5=\xe6>\xd5\xde\xd3<\x85[\xa9>\xe0\xa2\xa9>\'\xbd\x04>\xa8rq\xbe\xa9T2\xbe\xb6\xa1\x92>u\x86g>\x9a\x8e(>\xe3r\x07?;\x80\x8b\xbex\x97\xf2=x\xc8\xe7>\xb7\x11\xe0\xbbkz\xca\xbd\xde\xeb\x1a\xbf\xad\xee\x15=\xaf\xa4\xdf>\xc1{=>\xc8\xb2g>\xa77\x15\xbe\x80V\xcf\xbe\xbc\x8c\x88>\x84\xe1\n=\xf8\x13\xcb<\xe9t\x17?(\xe9\x9e>@\xa4\x07\xbe\xc5\xf8\x96=\xdei\x8d\xbd\xb4H\xb3>\x81\xf0\xb9\xbd,y.>\\\xaf\x0e=[Y\xb4\xbc\xb1j2>\xf8\nE>\xc3/\xc4\xbc\xe1T\x05\xbd\xe0:\x9a\xbdgW)=KB\x02\xbde\xf8\xbd\xbc\x99^\xcb\xbe\xe0\xf0\x8c\xbb(\xca\x87\xbe\x7f\xaa1>\x1d\x16l>\x85W\x02\xbf\xcb\\\x11?\x19\xf2\xf5=\xeb\xd0\x1d>]H-?\xe0\\@\xbe\x84\xce\x18\xbd\x00\x1b\x7f\xbbA\xc97\xbe{\xcf\xc6>\xed\rr>k\xf3\xd1\xbci\xa5\xd3>\xa4\xddr\xbe\xd7wS=\xb3\xc0\xf0=\xd0y\xf0\xbe\xb8\xc0\x90\xbe\x1a\x97\x88\xbe\x94\xcf\x06\xbf\x1a\x00\x99\xbe!f\xe5=\'\x8au\xbda\x13\x14\xbfG\xbd\xdf>\xc8\x053>?r\xd1\xbd\xc06\xee<\xff\x10}\xbe\xeb\x05\x9d\xbe%%;?\xfd)\xfc=\xb7&t>H\xd4\xcc\xbe\xa4\x9f4\xbf\xa5I\xe1=\xa9\xc1\x8b>\xab\xec\xd3>z\xd7\x9d\xbdf\xc0\x99\xbe\x02\xd7\xa6\xbe\x94!\xe7>\xc6\xf8\x10\xbd\xd9\xf7\x8d>\xb2f\x9b=\xac\xfc\x9d>U\xc5\x81\xbd\x9f\xc4I>\xb7}\x01=\x98P\xa2>\xa0\x12_>5tL?\x02\xce\r?\xe3/I\xbe7`\xa1<\xa4\x1c\x13>\xdb\xba6>'
-p1268
-tp1269
-bsV503964740952276992
-p1270
-g2
-(g3
-(I0
-tp1271
-g5
-tp1272
-Rp1273
-(I1
-(I200
-tp1274
-g12
-I00
-S'\xa5L\xe9<\xe6\xfe-<\xf9c\x04\xbd`>\xe79\xf5\xbaG<\xcd\xec\x04\xbc\xec\xfa\xca\xbb\xffX\xa6\xbc\xab\xfd\xb1;\xe2xm<\x9ei\xfc\xba\x9a\xd6\x81:2\xd3\xa6\xba\xfa\x9b\n\xbb\x8dV\x84\xbb\xc1\xc3\xa0<\xb4\xdb\xed\xbb#\xbf\xd5\xbb\xc0\x1d\x1f\xbcK\x1dH\xbb\xec\xe5|\xbc\xe8D\r\xbb\x9b\x9d7<\x8c\x8e \xbc\x83\xe5\xf4\xbb \xcd\x13\xbb\xf9\x90\xa5<:\xfdX\xbcr"\xaa\xbcc%\xbb;r\x13\xe6;\x14\xb3\x08\xbc\x05\xcb#\xbb\xbd8\x97\xbcU\xe4\xf3:@\xf9\xd4<\xa4\xa6v<\xbf\x973<\x96\x18\xea<\xd8|^;a\x1f7\xbc&\xd5\xb6\xbbsEo<\xedC:\xbc4u\x91\xbcz\x7fh\xbb\x9b\xb4\xdf<\xe5\x07d:\x02\xdaX;Z\x1a\x0c=<L\xcf;\xe6\x9b\x9f<d\xf7u\xbc\x16\'V\xbb\x9b\xa5\xf5\xbc\x18\x14W<\xe1\xbd\xe5;L \x18:\xc9\xa3\x0b\xbdJ\x1f\x04\xbd\x98z\x90<v&\xd2<6_\x8c;\xfe4\xa3\xbc? \x9e\xba\xc6\xac\x17<H\xe5J\xbc\xeb\xee\xbd<\x9fy\x13\xbc\xcc/\x1f\xbc\xa3l\x1e\xbd\xf0]\xdd\xbc\xd3:+\xbc\xf1\xb1$\xbcx\x8f.\xbc\xdcG\xef;\xfb\x03@<\x18\xb7\xc8;\x8f16<\xa1$\xdf;\x84\xa1\x01\xba\xf2\xdb\x80;\x97\t\x83<\x90\x92\x8e\xbcK\x8a\x11<\xdb$\x90;\x9c+D<\xf6Lz\xbc\x80i\x0c=\x0f\xab$;\xbd\xdd}\xbc\xa9\xcc\xa7<G\xae\xad\xbcQ\xa3\xa0;7\xfa\xa4<\xa8\xdb\xef\xbaQju<:\xc7x<\x1e\x7f\'<vBm\xbb\xe0\xde<\xbaV#\x90<\x8ce\x11;\xe3\xd8\x00<\xe5\xd5\xd1<\x8fu\xc2\xbc\xe0f\x0e;\x16I}<\xb2#\x1d;\xa0\x96\xe4\xbb\x9a\xee\x98\xbc\xee\x81B;\'f\x8e<03\xa0<\x13\xe42<n+\xb2\xbb6\x84\xce\xbco8\x96<p\x15\xa4;>gR;\x8a\xec\x00=\xf6\x08O<\xc8\xeb\xf2\xbb\xe7\xe4\x07;\x02\x844\xbb\x8e]s<(\xae$\xbc\xe3\xe9\xc4;0\xc2-;J\xdb\x8d;E8\x18<\r\x1dF<\xf4\x88\xbf;n\xf3\x97\xbb\xc4\xf6\xf0\xbb49"\xba\x8a[l\xbb\xe4\\U\xbb\x05\xafC\xbc\xf4\xbf\x95:Fq7\xbc\xbe\xd2i<\xa5\x8e\xe8;>\xad\xf2\xbc\xe7\x94\xac<\xe3\xdcx:\xc1\xb1\x8a<,\x18\x01=\xa5\xbc#\xbc\xab\xc4\xcc\xba\n\x00\x91;34\x0c\xbcOzn<\xd7-u<%\xba\x85\xbb\xa5\x01\xa1<\xb4X\xd6\xbbj\xc2\x19<#\xed\xc8;\xd0\x00\x85\xbc\xa5b\xf9\xbb`Nn\xbc\x08z\xc0\xbc\xee\xac!\xbc*\x9d\x87\xbaT\x84\xe5\xb7N\x00\xf4\xbc\x08\\\xb9<\xe8\x00\xd6;\x03\x98\xe7:\x01\xf2\x0f<j\xc8u\xbc\xfdy<\xbch\xaf\xec<![\xb7;\xc4\x0c&<\x90`\x92\xbc\xfa2\x01\xbd\x91\x9d\xb0;t#D<R\xe3\\<\xbb\xb7\xe0\xba\xcc\xba\x86\xbc\xe4\xfb\x83\xbcB\x19\xaf<!\xb7Q\xbb\x83\x9c\x7f<w\xd9\xa7;\x8c\x11\x98<\xa6\xb6d\xbck\x9e-<\x1e\xcc\xb6;\x8e\xc2w<w\x84t<\x7f\x84\xdd<\x17\x9a\xe9<E\x88\x8b:<;\xbb;\x1e\xd8I:<|\x8d;'
-p1275
-tp1276
-bsV504172753923366912
-p1277
-g2
-(g3
-(I0
-tp1278
-g5
-tp1279
-Rp1280
-(I1
-(I200
-tp1281
-g12
-I00
-S'DY&?F\x9d\x1d>\xe6j6\xbf\xff\xb5\x05\xbe\xbc\x0c\x9d>_\x9fe\xbd\'l\xb9\xbc\xc31\xa3\xbe\x97y\xb0\xbd\x98\x8ef>\x1c\xc7\x85\xbd/c\xee\xbd\x13\xce\x97>\\\x01\xfb\xbd@3\xab\xbd\xf9Y\xe0>r\xd9:\xbd\xcbwr\xbe\xcc\xa2\x85\xbe\xc4\xaf\xac=-\xc6\xb7\xbe\xf2\x1f\xd2=9\xaci>y\x04\x1a\xbe\xee\x0eK=\xda\xbcK\xbe6aZ>L\x85%\xbd\x19V\xc7\xbeQ\xbd\x99\xbd\xc7\xfdH=\x9bGg=\\ou\xbc\xa3\xa7\xd0\xbe\xff\x98K=\xd0mo>\x1fe`>SS\xaf>Y\x08\xdb>f.\xc9\xbdt\xbcV\xbe\xefE\x96=r\xab)>\x9er\xb0\xbe\xf4v{\xbe\xb5(\x0c\xbeQO\x03?\xe1B?\xbdR:\xd1={\xf6(?Ko\xe0= \xb2\x16?\xa7\xa9\xa4\xbe\xee\x95\x0c>$\x8e\xf0\xbe\xa2Os>+\xf9a>5M\x16\xbd}\x97\x12\xbf\xa0R\x04\xbfW\x0e\xc3>B\xf7\xeb>1L\r>\xe9AQ\xbe\xa4q =:\xf9>>@\x8e_\xbeY\xd1\xff>\xcc0*\xbe\xc3\xa15\xbed&&\xbf\x8e\xe3\xf3\xbe\xab\x19O\xbe<@\r\xbc\xdf=\x94\xbe\xbfg\xb7=bw">\xe9d9>\xdcg{>\xceko>"W\x12\xbdna\x94\xbbF\xe0\xb8>\xa2w\x92\xbe\x92\x7f\xc6=\xdc\xcd\x95>|C\x94>lG\xa8\xbe\xb6\xb3\x06?\xd2\x19\x07\xbe\xe4\x83\xbc\xbe\x06V\x90>\xb2\xde\xdf\xbe\xeb|)\xbe\x0eJe>\xdc\x98:>\xcc\xaan>\xe6O\xab>\xe4}\xa7=\xaa\xc7\x1f\xbe\x81\xf4\x97=29\x94>\x7f\xb7[>\xdf)\x8f>x\x1d\xd4>\x06c\xa9\xbe\xa6\xc4e=\t\x83\xdd>\xcc\xb4i<\x90fe=\x8d^\xd8\xbe\xcb\xb0.>P\xc3\xd0>\xe1+T>\xed\xaa\xa2<\x897:\xbe$\xd2\x00\xbf\x13U\xc7>\xea\xb5\xd3\xbdf\xf30>\xa7\x87\x1e?d6\x12>\xce@S\xbe\xf2\xaf6>\xb7(m=\xc7\x12\xa3>s\x1d\xa2\xbel2u=\xaf"%\xbd\x15u~\xbc\xc1\xd8?>+\xe3\x9c>x9\x9d=R\x11\xf0=\xc9\x14\x9b<=w\xcb=\xbd\x17"\xbd^\'b\xbdr-(\xbe\x8d\x8b\x92<[\x0f\x95\xbe\x83\xa3\x8f>\x0e\xef\xec=Fn\x0e\xbf\xb7\x06\xe8>:a\xbc=\xe6j{>\xce\x8f ?\xa2\x9dD\xbe\xdbh\x9b\xbdl\xe4\xe1=\\K\x00\xbex\xec\xe5>\x16m\x9f>\xc8\xe2\xc5:\xcc\xcc\x01?V\xa3\x15\xbe\xbc\x8f\xdd=\xa8\xe3;>\xec\xcc\xd7\xbe2\x80=\xbd\x06I\xa0\xbe{\x15\xeb\xbe\xb7i\xc0\xbeZ/%>kh\x89\xbe\x9e\xcb \xbf\xf0\xae\x9c>\x1f\x1eC>\xf6a\xa3<\x0c\x07\x90=\xf5\x96f\xbe\xc3\xac>\xbe-\xf7"?>\x96\xb3<\x01\t\xde=\xaf9\xcd\xbel\x8cB\xbf~\xfb\x85=\xf7\x08a>v\x1e\xb9>\xb7 \xe8\xbd<$\x9e\xbe:\x9b\x85\xbe\x1e\x87\xd4>8\xc7\xcf\xbd\rL\xba>b"t=C\x00\xc1>\xe6c\xfe\xbcI@\x80>\x10\xc3u<\x88\x8e\x8f>L\xe1c>\xacH&?\x14\x92\xd6>9\x9e.\xbd~}\xe9<m\xd1\xbe=\x8b9\xa0='
-p1282
-tp1283
-bsV503977732191952897
-p1284
-g2
-(g3
-(I0
-tp1285
-g5
-tp1286
-Rp1287
-(I1
-(I200
-tp1288
-g12
-I00
-S'\x12\xa2\xbf>\xbb\xc7$=\xa5\x07\xd0\xbe\xcd\xd6.\xbd}\x7fy>Dv\x88\xbd?|\x85<\x99\x86>\xbe\xce\x7fC\xbd\x156\x05>W\xd0\x96<\xabO$\xbcr\x15$>)_i\xbb\x99\xa4\xa9\xbd>\xf2\xa2>y\x8f\n\xbd\x18\xb1\x98\xbd\x9d\xc88\xbe\xd5U?<\x91\xadd\xbe`\xbet=\xe7\n\x12>\xd9O\xec\xbdVH\xd8<\'\xaa\x0b\xbe\xd3\xf6\x17>\xf1\xcf\x05\xbe\xa6VU\xbe\'\xfa\xf1\xbc\xb8\xc1\x81\xbb\x8f\xe7\xea\xbb\x07-U=\xc1T\x8d\xbep\xc7\xab<\x9f\x00#>\x8eM\n>\x0e\xefS>a-\x83>p\xfbv\xbd\xfc\xca\x03\xbe\x9bb\x00=\xb9\x100>\xfe\'\x81\xbeq\xc9\xea\xbd\xf8,\xae\xbd\xa8\xae\x8f>\xc1"\n\xbd\x98\x80\xad=7\xb2\xc9>\xf7\xa2J=r\x01\xd9>U\xd5A\xbe\x0b%\xf2=\xf0\xbb\xa1\xbe\xc2\xe2\x19>\xe2W\xb3=\x0f\xee\x04\xbe\x99\x03\xc0\xbe\x88m\xb2\xbe\xeb\xcf]>\xf1^_>\x01k\x01=\xdb/\n\xbe\x82\x12;=\xd0\xd0\xd9=\x01AC\xbe\xf5\x15\x8b>h\x16\x1a\xbe(P\x16\xbe`\xcb\xdc\xbeUoz\xbe/\xd9[\xbd;L#\xbdBh\x0e\xbe\x07\x17\xdf=\xc7\t\'>\xcd\x84\x95=\x9c\x13\t>\xb9PN>\x96\xc1\x86\xbd\x85\x1aa\xbc\xba\xc7f>\xcf\x15J\xbe0.\x83=\xed\xa3\x01>\x10\x8by>\xd9\x87\x8a\xbew\xf4\xe3>\xfbr\r\xbd\x80\x8dj\xbe\xed\x05\x0e>\xda\xfb\x92\xbey\xe8u\xbd\x8f\xbe\x83>\xe0\x83\x16>\x92\xbf&>\xe9`b>\x07\xa5\xaa=\x9d\xf4\xf5\xbd}\xec\x9f=\xe0wo>s3\x0c>\x8f/+>Q\xb8\x9d>9k3\xbeUP\x0c=\xde\xeaI>"\xdc\xff<\x1fSP=\xdb\x1bI\xbe\xee\xdd\n>m\x84>>\x9b\xde{=&[\x1a\xbd\xafp\x14\xbd\xbd\t\xad\xbe\xc3\xd2r>\xd2I <\x00\xd0\xb2=w\xe3\xea>\x9e2m=\xbe\x9cr\xbd#\x01\xc7=0\xcf\x1d=\x1ewu>\xa7\x91 \xbe\x8b \xef<\xab\xa4\x9f<\xad\x17\xf0<\xfbR\xad=o\xdb\xcf=\xde\x96\xa9=~*\xdb<\xca\x01\xa5=\xe7A\xcb=s\x8b\x83\xbc\xe0\xe2z<V\xd1\x13\xbdw\x81\x1e=\xf1\xd7:\xbe\xee\xf9p>=\x0c\xfc<\xfa\x9d\xa5\xbe\xe9\xae\x8e>\xd2%\xe2<0\x8e\x11>\xe3\xcc\xa9>\xbaW\xe5\xbd\xe24\x0c\xbc\xf7+\xcc<\x05\xec\xb0\xbd\xa7!o>\xcd\x83\x0f>\n3G=Fi\xaf>\xa0\xa0\xf1\xbd\x88?\xba=\xb3\xb8\xf6=\xd6\x88p\xbe\xf8\xa1\x0e=\x80\xbc\x1d\xbe\xf4\xe4\x90\xbe"kb\xbe\x8c3\x91=?\x1f\xfa\xbd_\xce\xba\xbe\xf9\x97[>\x99\xe8\xa5<\x9b\xdae\xbd\xbdo\x93=\xc8\x88\x02\xbeO\xb9\x8c\xbd\xd6F\xd7>\xa2Eb=\xc8\xd8g=\xcbl~\xbe^\xef\xd2\xbe\x02Q\x86=\x05\xb4\x1a>O\x15\x8c>\xb0s\xd7\xbc}_0\xbe\xe8{1\xbd\xf5[\x89>m\x821\xbdy\x8dR>/DY=};?>G\xceZ\xbd\xff\xdb@>\xa3\x7f\xa7<\x95"\xfd=#\xbb\xe7=z\x02\xd2>B;q>\x8e\x05Z<I\xe1\xee9:2\x15=\xbbJ\xaa='
-p1289
-tp1290
-bsV503956535673122816
-p1291
-g2
-(g3
-(I0
-tp1292
-g5
-tp1293
-Rp1294
-(I1
-(I200
-tp1295
-g12
-I00
-S"'27?\xc8+\xaf>\x95H\xf8\xbe\x89\xae+\xbe\xec\x1b\x90=\xf8h\xf2=,\xda\xbe\xbd\xf1\xf2k\xbe\xde\x1b\xa5=<\xf1\r?\x7f\xe6\x04\xbe\\\xf9\x99\xbe\xd5\xea\t\xbd\xfcN=\xbe\x0bH\xa0;\xd1\xed\xd3>\x03\x9e]\xbe\x7f\xf7\xa8\xbeS\xdb\x90\xbe\x8f\xb9C\xbe=L5\xbe\xb0\x1f[=;\xe6\x8c>\xfc\xdf\xd6>\x91\x9e\xa1=\xcdZ\xc6\xbd\xbf\x9dZ>+\x18c\xbd\xb7&\xbd\xbeTM\xcf\xbe\xbf\xa1\xa7\xbd\xa3br\xbd\x85}\x95\xbd[Z\xec\xbem\x804=\x15\xc7\xd0>\xb81\xcb>\xedj\x15>\xb7\x06\xaa>_`H=\x11\xb2d\xbe\xcf\xa0N\xbe\xa3Eo\xbd\x00J\xe9\xbdU\xe3\x91\xbe]\x9a\x93\xbd:J\x01?\xf5\r\xde=/\x92\xc5=\xa0\xc09?\xac\xdf\x14\xbe\xd5]\xc8>\x114\xb0\xbe\xc8P\xad<\xbc\xba\xf9\xbe\xdcx3=\xa3\xfc!>\x0f}\x0e>\x98aA\xbfT.\x12\xbf\xb1\xf8\x9a>\xc4?X?\x1c\xe8\xcf>\xcem\n\xbe\xd5\x18U\xbdR\x1d\x03>\xeb\xd5\xab\xbe\xd1-&?\x1d1+>=O\xad\xbeo\xba\xe1\xbe&\xc2\r\xbf\xd3q\xbb\xbeew;\xbe\x1b\xebV\xbepZ\xb0\xbd\xd9\xb8\xb3\xbd\xb3\xc6)>\xd1\x8a\xad>h\xb73>\xf8\xbe\xc6=1\x91\x8a\xbd\xe4\xa5\x14?\x1d\x10\xc6\xbe\x11*->ZP\x0b=\x98\xbev>\x86j\x93\xbe\xc5\xc7\xf0><\x89\xf5\xbd/`\xa6\xbe\x037E>tm\x84\xbe]\xebF\xbe\xdf\xf7\xa0>4~Z\xbd\x1d\x0f\xab>\x00ak>?\x82\xe2=\xfd\xf5O\xbe5\xf7\x95\xbe \xe5P>\xe8\xa4=>\x00\xb5\xa5=a\xd3\xca>\x17N\xac\xbe\xadY\xdd=\xc2\x01\x13?{K\xf3\xbb\xb3$\r\xbe\x94\xc2B\xbf)\x98\x13\xbe}$\xe8>\xa0$N>E\xc7\xa3>Q\x18\x08\xbe\x18}\xcf\xbe7\xf2+>\x91\xc58\xbd\x10\xe3\x8c\xbd9\t\xec>\x0b\n\x96>\xf5q4\xbeh\xc9\x89={\x13r\xbd/\x1a\x8d>\xcc\x80\x9d\xbd}\x90y>\x90D\x92=uq/\xbdu\x87\xf9=<\xda\xfe=\xd1\xf0\x9c\xbd[\x14\xaf\xbd\xf8u]\xbe\xbb\x1d\x95\xbd\xe3\xdc&\xbd\x85\xf4z\xbca&\t\xbf\x94\x05\xcd\xbc\xa8Ja\xbe\xe6(\xaa=\x81\xa0\x91>'5\xd7\xbe\x94\xf0\x16?\t\xec\xba>\x01\xca\x9c=\x05\x1dV?\xdc\x19\xa2\xbdq\xce\x04\xbd!\xf4\xc8\xbc\xad\x9b:\xbe\xab\xae\xb0>\xed\x80Z>\x03\x93\xec\xbd\x90\x9c\xc5>\x1b\xe3\x8e\xbe\xb3\x99\r\xbc\xf8%\x1f>\x12\xb4\x03\xbfM\xdc\xdc\xbeL\xbdk\xbe9V\xf0\xbeyX\xe2\xbe\x85\xaa\x0f>\xd4\x91\xbe\xbc<\x8f\r\xbfk\xdc\x9e>\xf1\\|>I\xb7\xc2\xbbe\x7f\xbd\xbc\xfd0s\xbe\xe3\xcc\xbe\xbe\xa1N!?\xc5\xe5\x14>\x14\x9a\xb2>\x18\x08\xaa\xbe\x7f\xf27\xbfO\xee\xac=\x85\x06.>\xa3\xc2\xbe>+i\x83\xbdw\xa5\xbc\xbe\x03\xc0\xde\xbe\xb8\xe8\x00?\x97O\xc1\xbd\x1bG\xe8=\x14\xde\x83=\xc9\xfc\x88>\x7f\xa43=L4\xb6=3?\xec\xbc\x11>\x9a>+\xbfc>O\x9d(?\xb9\xef\x0f?}\xaf{\xbe\x0c\xd12=\x88\xc7u>\x80\xfd\x0b<"
-p1296
-tp1297
-bsV503959687050444800
-p1298
-g2
-(g3
-(I0
-tp1299
-g5
-tp1300
-Rp1301
-(I1
-(I200
-tp1302
-g12
-I00
-S'L\x8b\xef>\x82s\xfa=\xa9]\x1c\xbf&\x98P=\x01\x07\'>\xf2\xaeV\xbd]\xc0\xac\xbd\xbe\x8aa\xbe|\x16\x8a=\xb7K7>\x83\xb7&\xbeX\x0c\x18\xbe\xed\xff\xe2=\xe5\xfe)\xbeo\xe1U>" \xe0>.\x14\x8c\xbd\x14R\x1e\xbe\x8d_\x84\xbe\x0cV\xc9\xbd\x8bG)\xbe\xc5[\xbb\xbd\xdc\x0f\xa2>\x91\x04\xb1=\xbc3\xcd=\x17\xd5\x1d\xbe0[c>o\x98\xad=\x9a\xcb\x8d\xbeo\x88Q\xbe\xa5\xb70\xbe\n\x84\x91<\xd0\xcf\t\xbd\xcaR\x0e\xbf\xfe\xd11=Y\xb3t>\x00^z>\xe1h\x81>\xb3#\xc8>T\xe9(\xbe\x003\xab\xbe`\x9d|\xbdi\n\x1c\xbeb\x86\xdc\xbc9\xb6\xdd\xbeK\xa1x\xbeE\x92\xf7>j\xbf >\x06\xaf@>\x9f\xc2\x06?\xd7\x90\xdb\xbb\xb9\x88\xf3>\xe4\x0e[\xbe1\x7f\xdb=\x18\xe2\x8e\xbe\x996\x13>|h\xae=%ct\xbd\t,\xd7\xbe\x9b\xd0\xf6\xbe\xe5\x03+>\x87\\\x16?\xf5\xa2\xd5>\xd7\xe3Z\xbe\x00\x9b\x13>\xda\xa4a=\xfe\x0e\x96\xbe\xe1\xbc\xd6>d\x92\\>\xbc\xf9e\xbeP\x82\x18\xbf\xb1\x0e\x1c\xbf40\xd4\xbe\xb4\xe6a\xbd]\x17O\xbeB\x925\xba\xd9%\x03;2|\xfd=2\xbf\xe7>5\x0c\x86>\xee\xac\x13={U\n>r\x1b\xce>\xda\x97\x90\xbe\xd3y\xde<\xbe\xf1\x16>3\xa8\x94>\xbf\x1f\xa1\xbe \x8a\x0b?\xe8\xc7\xa6\xbe[\xf5\xeb\xbe\x8a\xff\x83>\xe11\x99\xbe,\xe9\x8c\xbe\xe9t#>d\xaa\x02=\xc6>\xcd>O!/>\xb2\xcb\xf7=\x00\xdbo\xbe\xdc\x9e\x9b\xbc\xd2\xa2h>T\x97\x83>\xd9#\xbd>\x17~\xf6>m8\xa0\xbe\x8b\xe7M\xbd\x97\xb3\xff>\r\xc1\x8f<\x8d\xaeK\xbd\x1f\xd3\t\xbfU\xd7\xf5\xbd\xbb3\xed>\xa3;\x81>\xd8\x99\xbd=\x87!\x17\xbe\x10o\xfb\xbe${\xe5=\xa0w\x14\xbeD\xcd\xd4\xbd\xd4\x15\x10?\x95[\xac>Lz\xe5\xbd\xd5\xa8\x12>\x8c\xa0A=\xa0\x12z>\x1a\xc9V\xbe\x9fz\xab=\xdc$\xc4=\xa8\xa2\x99>\x07\x9ao>\xd4]}>|3\x82=\x15\xf1\xdf=s?\x08\xbeB\xd40>L\x14\xe3<8}\r=s\x16\n\xbf\x87G\xe5\xbdu\x8f\xe0\xbe\x10\xe9\xba> \xe8n>\xeb\xa7\r\xbf\xaeJ\x84>p\xc7\x8f\xbaK_\n=\xe5\xf3E?\x80#\xef\xbdz\xb8\x9a\xbdr\x93\xed=B\xe3}\xbdyA\x89>1\xb5?>\x9c>S\xbd^S\x14?QL\xaf\xbe\xac\x89G<\xdc\x17H>\x95\x85\xf5\xbe\xca\xd7S\xbe\xf4\x95\xc6\xbe\xf5\x87\x1e\xbf^\x80\x89\xbeb\xe6\xe8=[\xcd\xbd\xbc\xc2\xf7\x12\xbfS\xc9\xcb>\x886>>\xd0x\x86\xbd\xfaD\xbf\xbc\xca\x14\xc4\xbeL\xd8\xcf\xbe\xf9\xaf\xcc>\x8d\x0f\xa4<\x08M:>b\x07l\xbe\xd8\x91-\xbf\xb7W\xaa>\xedm;>\x9f0\xc6>\x86\x16K\xbd\x8b\xad\x8e\xbe\xf3\x9c\r\xbe`\x8d\xf9>\xdcR\xd1<\x1c\x82\xe5>\x9e\'\xbf=\x88\x88\xc4>$!\x9c\xbd\x9d4\x9a>\x83\xcd\x02=G\xdd\x90>\xacu\xcf=\xfc4"?#\x92\xb3>\x8b~\xa2\xbd\x95=\t=`\x8c\xe7=\xf4A\x83\xbe'
-p1303
-tp1304
-bsV503956902947323904
-p1305
-g2
-(g3
-(I0
-tp1306
-g5
-tp1307
-Rp1308
-(I1
-(I200
-tp1309
-g12
-I00
-S'\xc4\'F?*\xaa\x17\xbc\x88\x9c/\xbf\xb6i&\xbe\xf2r\xa8>\xce\xf7w\xbd\x1a\x96\x0e=\\K\xc0\xbe\x99Il=\\\n\xaf>\xd2$\xf3\xbd\x17F\xef;Bv\x95>d\xbf\xf7\xbd`\xd1\xb6\xbd\xe9\xe2\x01?W7\x83\xbd\r\x0e\x13\xbd)z\xac\xbe|\xfe\x93\xbd\xda\xc2\xba\xbe\x82&\xe6=I0\x92>c9&\xbe\xdb\x88g=\xedK\x80\xbe%~\x99>\xd5\xc11\xbe*(\xdd\xbe5>\xe2\xbd\r$\x15>\x07\xach<\xf9\xc9:\xbd!3\x13\xbf\xecc\xae<\xb4>{>E\xd1\xb7>\x15\x89\xa7>\xec\xac\xf4>\xfa\x002\xbej\xf0\x90\xbeE\xcdd<1Y\x13>\xf0\xba\xaa\xbe\xd2\x16\x8c\xbe\xec\xe0<\xbe\xcc\xc1\x1a?\xd99\x1e\xbd\x16\xa1\xb3=~\xa1F?\x84&g=E\xa7=?\x1c\xeb\xe3\xbe\x97;n>)\xab\xec\xbe\xbd\xdd\xb1>x\xac\x85>\x1d\x8e\x12\xbe\x10\xf4\x12\xbfD\xc8+\xbf\xb0X\xe7>\x85\x0b\x04?F\xceM><\xcca\xbe\x8c\xad\xc0=@y3>\xa4\x1b\xa1\xbe&\x86\x1d?\x92\xe3\x1e\xbd\x95\xfe}\xbe\xceS!\xbf\xbc\x0c\xfe\xbe\x07\x90)\xbe.\x82\x17\xbe\xac[\x80\xbetM==F>\xc0=\x14\xfc\x1f>\xb9o\x86>\x99a\xa6>\x9f\xa1\x98\xbd\x9b\xcd<=\xe2\x10\xe2>\x05\x80w\xbe\xc9\xdf\xaa=[\xe9V>H\x8f\xbf>\xd7X\xc0\xbep\x8c3?\xea\xf4\x1d\xbe+y\x01\xbf\x04\x1cp>\x8b7\xec\xbe \x14(\xbe\x96\xc6\xdf>\xfd\xf4\x1c>\xfe\xb9\xbc>\xfc\x82\xaa>\xe4hM>cMT\xbeW0\x9f\xbc\xf0B\x98>}r\x91>O\x8d\xaa>\xb7\xca\xd1>J\xd0\x9b\xbeh\xac\xb9=\x8e\xf0\xed>\xc7y\xec\xbc\x0b+<<|\x1e\x00\xbfN\x089=\x02\xdb\x9f>\xf0\x86\xfd=\xe5\xba(<\x81=\xaf\xbd`9\x12\xbf\xe8 \xb5>\xa2\x96\xa9<\xc4g-=\xee\x13/?\x04\x1a\x8b>\xb1\xb0\xc4\xbd`\xf9`>\x01\x0b\t>\x84\xfb\x02?\xbc\x95\x85\xbe\x9f\xb2H=\xfc\xed\xf3<\xf8\x1e\x12=b;\x7f>|fk>\xb7\xe4\xe0=\xbdp\xb4=2<\xed=7\xb4\x81>\xdf\xd9K=1\xa4O=d\xa6\xa2\xbe\xbb\xcf?\xbc\x98\x9c\xce\xbe\x83\x08\xb2>\x93\x11I>\xccX*\xbf\'O\xeb>\x99\xf9\r<\xdb\xf1\x9a>?\xd3%?G\xf3m\xbe\x8b\x94\x88\xbdG\x0b$\xbd\x11\x85\x03\xbe/$\xb4>\x1b#P>|\xc9p=\xb96\x0f?\xb6\x80\x83\xbe\x03\xc4\n>\xe6\x9e\xdc=\x92L\xeb\xbe (\x0c\xbe!\xeb\x96\xbe\xa0\x98&\xbfu5\x9f\xbe\x8bsL>\xec\xcd\xfd\xbd\x1b\xf4G\xbf\x0b\xb1\xcf>\x88\xf5\xcd=\xcaI\xc0\xbd\xb8f/>\xb7%\x99\xbe\xa9\x7f\x86\xbeuCB?\x0cx\x0b>\xd0)\xf6=\x86\xb8\xbc\xbe[\xc9L\xbf\x89K9>W\xa4p>l\xde\xd7>"\x17t\xbc\xe0\x84\xd5\xbe\x0c\xf8n\xbeN"\xd8>\xde1y\xbd\xc0F\x07?\x9fqJ>|\xbd\xb5> \x8f\x05\xbc\xf8a\x95>.\xb0\x89= %\xa6>W\x82\xd1<\xf4\x9fG?\x82\xd0\xe3>\xeez{\xbd`\x8et\xbd<pv=\xd5\x0c\xf6='
-p1310
-tp1311
-bsV503962964173795328
-p1312
-g2
-(g3
-(I0
-tp1313
-g5
-tp1314
-Rp1315
-(I1
-(I200
-tp1316
-g12
-I00
-S'\x9f\x8dA?\xcba?>\xae\xe5\r\xbfVo"\xbe\xb2Lq>\xf4sG\xbc2\x87\x9a\xbb$\xc4\x93\xbe\xd6\x89\xaf=\xbb\x02\xbb>u\x89\xd6\xbd\x17L\xea\xbd\n\xac\xe8=c\xbf\x06\xbeI\n\xa9\xbb[\xbc\xf5>?t\xab\xbd\x02\xc2\x1c\xbe[\x90\x8f\xbe\x1d\xe6\r\xbe\xfde\x81\xbe\xf1\x9b\x07>\xa2\xad\x95>\xc7c\xb0=9\x9a\xaf=\x0c\x9d?\xbel\xdcb>\x7f\xc3\xb6\xbd\x1b\xa5\xb7\xbe\x82\xb8j\xbe\x8f\x85x=\xa1\x85L<-W\x87\xbd\xfe\x91\xed\xbe\x81%\xf2=L\x99m>\xb45\xb1>\xb5\xb1\x8a>\x16\xc2\xd9>\xf4\xd6\xf6\xbd\xce\x06\x8d\xbe\xfcA\xbe\xbd\x95\xed\xdb=*\xc5v\xbe\x9ejc\xbe@\xdc\n\xbew\x85\x00?[\x93\xd0;\xd6`\xd3=\x9eA8?\xa6n\x08\xbbe\xe8\x12?\xdf\x9e\xcb\xbe\x14\xc1\x07>\xba\x06\xf6\xbe\xe5\xa0\x1e>aix>\xfe\x8d\x01<\x90}*\xbf\n$\x0f\xbf\x90t\xba>\xa7\x0b+?\xcf\x06\x97>\xfbo\'\xbeJ\x86::\xeb\x00}=0\xe4\x87\xbe\xc7\x80"?\xac\xcc\xac=\x17\x95\x89\xbe\xecA\r\xbfN\xbb\xe3\xbe\x07\xe5\x87\xbe\xfa\x16\x0e\xbe\x9e\xea`\xbe\xdeD\x1a\xbd~1`\xbd\x0b<\x0e>\x8b5p>7oc>\xf7\xf7\xb1\xbb$\xc4\x06\xbd\x96\xe6\xdb>\xa1o\x87\xbe\xa4f\xdd=\xc9\xe9\x1f>\x0b\xec\x9e>\xdb\xf3r\xbe1@\x14?WR\x14\xbe\xa0\x13\xc3\xbe\x86\xceb>\x8f\xba\xcf\xbe\xa9\xfd2\xbe\xf2\r\xad>`\x98\x08>\x19\x8e\xa2>\x85\x06\x97>\xd5\xf9\xd1=\xa1\x98k\xbeUO\xab\xbdv\xe4V>\xfc\xd2v>gbM>\x856\xd0>\xe4R\x8e\xbe\xc9\x12\x88=\xc4*\x02?\xeb,\xec\xbc\x82:0\xbd/\x91!\xbf\xc9j\x05\xbdeO\xc1>\x1b\xc8\r>A\xaf\xae=\xfej\xf1\xbd\x85c\xe8\xbe\xf1\xc0x>$\xeba=\xd9\x8c\xb8<\xaf\xb1\t?\xe5:\x83>\x87\xd0\xc8\xbdBUl>\x8a\x8d\x83=^C\xaf>\x9e\x14R\xbe\x1a\x9d\x1d>\xe4_8=PTX=EkH>~\x85\x19>F&9=\x7f\xd9\x03<\x00\xcf}\xbc\xbat\xdf<t\xf5\x0f<<\xc73\xbc\x94\x8e\xb6\xbe\x04\xa1\x9a\xbd\xa6G\xa0\xbeU\xa0)>?\x8d\x8b>\x15\xbd\x0c\xbf)\x04\x01?\xee?\r>*\xda@>\xbe\xae+?\xb6\xe8\x0b\xbeG\xbee\xbd\x87\xd6\xdd<B\xb4\xec\xbd\x1b\xf8\x9d>\xa0\xdb\x14>\x8a/\x1b\xbb\x04\xa8\xe5>e\xc4l\xbe\x8c\xd7\xca=\x9ak\x02>\x0e\x0b\xd8\xbeB\x00\x8c\xbeB*}\xbe\x0c\xab\x03\xbf4\xfb\x90\xbe[,S>\xb2b\x96\xbd\xb4\x82\x14\xbf+\xa9\xac>\xa9\x9dc>T\xc2\x81\xbdA\x18\xbd=_hb\xbe\xed\x85\x96\xbe[L ?%\xaf\x13>j\x95i>\xa5@\xa3\xbe\xf9\xb0F\xbfN@\n>\xeat|>7\xd9\x94>V\x7f\x83\xbd\x80\xdc\xc0\xbe\xe6J\x97\xbe\xda>\xdb>aJz\xbd\xc4T\x95>@\xbd\xce=)\x0c\x88>[ \xa1<\t\xf7\x81>\xb1\x1bF8\xa5\xca\x81>\x85\xda\xd2=\xday,?\x19\x9a\xcc>\x8cz/\xbe\x8a}\x1c\xbd\xfbW\xe4=\x19\xcb\xa6='
-p1317
-tp1318
-bsV504238060351913986
-p1319
-g2
-(g3
-(I0
-tp1320
-g5
-tp1321
-Rp1322
-(I1
-(I200
-tp1323
-g12
-I00
-S'Ru\x05?\xee(\xc8\xbd\x86\xb6?\xbf\x88\xdb\xe2;\xfb\xb6\xd2>\xa7\x91\x1a\xbe\xb5\xd9\x16>i\x82\xa0\xbe(\x06<=\xf2up=E\x90$\xbd\x92.\x00>w\xd7\xa7>\xb68\x98=\x83Ne\xbeV&\xd0>\x0e\xbf\x8c<\xb6\xdb\xc3=9\xc1\x94\xbe\x99\x8f\x84;K\xb3\x81\xbe(d\xba<\x01\x18\x8f>\x1d\x89\xbe\xbeC\x80\xc4;\x80\xce\x90\xbe\x99M\x9b>UOu\xbe\x83\n^\xbey\x8d|=\xebL\x1d=I\xe1\xf8\xbd\xd8e\xcf=\xdd\xe3\x16\xbf\x02\xe50\xbe\xc1\x99\xa9>k;\x00>zD\xc1>\xda\x9f\xda>V&\xaf\xbd\xa0\xc8\\\xbe\x87\x96\xc7=K\x15W>W\xfd\xd6\xbe\x99t\xab\xbe\xd7\xfdu\xbe\xe6\xc8\xfb>m\xef\xe9\xbd\x81\xac\xb7=C\xb6"?j\xc99>\xcb\xe2:?\x83g\xb0\xbe\x06t\x89>7\x9b\x8a\xbe\x0f,\xcf>\xc7\x1e\x0c>\xeb]\xc8\xbe\x12\xf5c\xbe\xf2\xd8+\xbf\xe1\x85\xb1>\xd6\x18\xea=\xbc\xc0\x8a\xbd5\xccg\xbe\x8dF\x81>B\x87}>w\x8d\xc3\xbe0\x925>\xf7H\x93\xbe\x85\x1fX\xbe\xe7q7\xbfY#\xae\xbe\x81u7=\xde9y\xbeg\x0f\xa2\xbe\x82\xe10>\xbe\xf5v>5Y\xcc<\xfb\x91x>\xf8@\xbc>\x9d\xd7W\xbe\xb7\x8aL>\x91\xb0\xbf>\xd8\x86\xc6\xbdbV\x88=\x9d\xfbx>H\xe9\xcc>\xff\x87\x1c\xbf\xab\x90H?\x0fT\xb3\xbdTG\x05\xbf\xb2t?>\xc5\x13\x00\xbfY\xb9\t<\xd0\xf6\xf2>\xfe\xe8\xa4>)\x0c5>\x1aT|>8o{>\xd8u\x1f\xbe\xab\xed\x8b=\x96O\xd4>!JM>\xdd \xcb>\x08\x90\xb1>\x9bu\xac\xbe\x9f3h==\x82\x87>-p\xa1=\x92\xdd*>\xeb\x98I\xbe\xae\xb0\x0e>v*\x96>w\xe3\xe3=\xf6\x98}\xbd\x07\xdd\xa4\xbd\xder\x14\xbf\xc0m\x08?7\x82R\xbd\xd7\xb35\xbd\x05S1?V\xf7\xd5=g\xa9\xb5\xbd\xfb\xe2%>\xee\x12i<\xcdp\xdb>\xb6\xf4\x84\xbe\x9b\xa9\x94\xbd\xe2V\xb0=\x1b\xec\x92=\xc3\xf9\xaa>B\xe7\x90>\xde\x83I>e?\x88=\xe2\x0c7>\xd6K\xe0>\x8aq\x0b\xbd\x16\x0e.=\r\x07\xae\xbc\x8a\xf0\x1f>\x0e-\xc7\xbe"\x97\x0c?+\xb2\xcf\xbd{\xa92\xbf9\xe9e>F\t\x99\xbe\t\x87\xa3>\xd1*\xec>F\x1d\xfd\xbdq\xee\x9c\xbc\xf2U>=;\x01t\xbd\x1e\x82\xb8>A%\x88>@*g>Q\xc1.?\x0f\xe5|\xbe\x8a\x8c)>\xf8\xe8<>U\x8b\x85\xbe\x95C\xb7=_\xa6\x9e\xbe\xf8{\x17\xbfX\xed\xb9\xbe\x08`\xeb= \xa7R\xbeq\na\xbf\xa7F\xb9>\x8f\xb9\xf3\xbc\xd5\xf2\x8a\xbc\x84\xd1\x8e>el\xa4\xbe\x83\xe4\xc0\xbdp\xd4.?\xc0\x1d\xd5=\x16\xfd\x17<\xc7h\x9d\xbeY\x11%\xbfi-e>\x92_<>iT\x0c?N`\x07\xbd\xebOk\xbe\xb2\x93\x1f\xbc\xe9(\x83>^n\xe4<\xff\x9e\x11?\x01\x037>\xab-\xae>\xcd\xe3\xa1\xbdC\xed\xdb>\x88l\x1d>\xb9\r\xd0>)9\xa7\xbcs22?\xabO\x9d>\xb2\x16Q<]\x90\xc9\xbc\xa2\xf5J\xbd0\xc5+>'
-p1324
-tp1325
-bsV504194322611576832
-p1326
-g2
-(g3
-(I0
-tp1327
-g5
-tp1328
-Rp1329
-(I1
-(I200
-tp1330
-g12
-I00
-S'\x06T\x04?\xbb\x9c\x8d=G\xe9!\xbf\xdaN\x06>\xf3\xd6\x9a>\xf3\xf0I\xbe5\x14\x1c<3&p\xbe\x80\xca\x05\xbd\xcfl\xd8=S\xe4\xe3\xbb&A\xcd<\xa2\x91\x14>\xa3\xa2\xbf;\x1e<\xb5\xbc\x83\xeb\xca>z \x19=y\x0c\xe1\xbd\x0e&D\xbeEcH=\xeb\xdaZ\xbe\x0bKS=\x9b\xfd >%h\x95\xbeY\xb6\x11\xbd\x87\xe0\xf7\xbd\xc0\xacZ>\xef6\xf3\xbd\x99\xf2\x87\xbeA]h=\xaa\xdb\x97\xbdg\xfaX\xbd\xf6\xcd\xe3=\xbdR\xc1\xbe\x9fb^\xba\xffP\x96>\xf0[\xd8=Z\x9e\x91>\xe6\x9b\xe2>\r\xb7\xb2\xbdG\x02I\xbe\xbb\x01\xf3;=\xb0W>G%\xaf\xbe\xd3\xaf\xa8\xbe\xf7\x032\xbe~\x10\xe6>\'\xb3\xef;o\xf6\xef=\xe7\xfb\x03?\x07\x17\x9e=cB\x18?\xa3\xe2\x81\xbe\x95\x1a\xc7=\xb2r\xe2\xbemjs>\xf8k\x97=\xbd:U\xbe\x9e\xe9\xee\xbe\xe1\xc7\xf6\xbeX\xccK>\xc9Rm>\xe5\xc0\xfe=^\x15?\xbeQk5>~\x01=>\xe0=}\xbe\x11\x1f\x8c>\xb7\xbcc\xbeOM=\xbe\x1b\x1cC\xbf\x1e\x85\xd3\xbe\xaf\x15\x1e\xbe\xad\x86\xb7\xbd\x90I?\xbeF\xfdi>RK\\>\xb0\xce#>A5\x80>\xd2\xa7\x97>\xf9)\xa4\xbdp,\xee<\xaa \x8e>p\xee\x82\xbe\xbfPt=\x15=\x14>\xde\x11\xb6>;\xb0\xcc\xbe\x123\x15?\xf89R\xbd\xb1\x01\x99\xbei\xdf\x8e>\x8a\x82\xe0\xbeGP\x98\xbdg\xe4\xa6>\x03\xc4b>\x85RC>\xb5\xe3`>\xe1\xdd\x03>@\xea"\xbe\xa3\x05B>\x1d|\xc4>\x82\xe9+>\x06cx>\xb9\xd0\xf4>\x92,\xa4\xbe\xce"\xdd\xbc\xb3\xf3\x86>#\x84k=k`\xb1=\xe6\xf4\x92\xbe\x1a\r+>\xd0\x08\xbf>W\xdeg>\xc7ZD=\xcb=\x80\xbd\x18\xad\x03\xbf\xea\xd3\xba>\xf9@\x9e\xbc}\n\x19=\x11\xff\x16?Qw\x1d>\xc3}\xf7\xbd\xd9V\x05>S\xf6\xa5=\x0c\xfe\x8e>B\x88\x96\xbe\x970H=\'s\x9c<\xd7\x93\xe5=\x13b\x1f>\x023\x8d>\x1f=\xf6=\xbd\'J=\xce\xa7\x92=\x06\xc8\x8e=YA\xf9\xbcQ\xe5J;\x9a\x16\x94\xbd\x0b\x95\x86;\xeb\xb1\x91\xbe\x08\xba\xcf>I\xc5\xe5<y=\x11\xbf\xd7\xb7\x8a>\xbb\x1d\xc9\xbd\xab\xb59>k\xa4\x0b?\xb3\x03\x0c\xbey:\xf3;n7@>\x93\x1eu\xbc\xb6\xb5\x96>y\x9eo>q\xbb\xb0=\x92\xa7\x11?AU\x03\xbeD\xb0\x0e>\x9e\x03S>fJ\xa7\xbe\n\xd4l=\x08\x83\xb5\xbe\x8bg\xeb\xbei\xd8\x99\xbe;BQ=+\xd6A\xbeW\xe8\r\xbf\x11\xa6\xbb>\xe2w\xd5=5\xce]\xbd_\x17\xcc=\xad\xb3\x8a\xbeBm\xe3\xbdF9\x15?\xdeG\xb9=i\xb1\x01>\xaeL\xa1\xbef\x0c\x1b\xbf\x07~\x1a>\x87\xecC>]^\xb8>\x07t\xff\xbc\xbb\xf0:\xbe\x97.6\xbd\x1b3\xbf>\x0f\xedn\xbdEF\xb0>\xc0\x18\t=X\xab\xa6>\xa2\xc5\xd7\xbd+$\xb0>?-\xb0=[\xca\x7f>({l>\x12\xde\x04?\xd88\xaa>z\x9b\xf9<\xf5Z\xd1=\x8fS\xa4=\xba\xec\x84<'
-p1331
-tp1332
-bsV503967640172625920
-p1333
-g2
-(g3
-(I0
-tp1334
-g5
-tp1335
-Rp1336
-(I1
-(I200
-tp1337
-g12
-I00
-S'!v\x99>\xd7\x96\x11>\xf7%\xa7\xbe\xef\x9c\x8d=\xe1\xb6\xaa=`\xeb\x7f\xbd\x19\x8ca\xbd\xb4\xcf9\xbe\xef\xbb\xac\xbc\x11R\r>\x01\xa2\x17\xbd\xc9\xa5\x93\xbd:z\n:I1\t\xbc\x14\xf9n=\x93\xdbu>\xc1\xdb\x81\xbd\x8e3!\xbe]\x1c\xeb\xbd\xc8\x9d \xbdFO\xa2\xbd\x0c//\xbdi\x0e?>\xe9Om<\xf9\xd4\xbb<\x8a\xf3\xe5\xbc1\xd1\xfe=\x0c\xa9\xac\xbc\x7f\xae\x0e\xbe\x16`\x84\xbdJu\xb7\xbd`\xbd_\xbd\xdf\x1a\x13=\xf4\xd0\x81\xbeW\xccc=\xa3nZ>\xa1\x7f\x14>\x84\x81+>\x8d\x8dd>W\xab1\xbd2\x97\x1a\xbe\xc0L\x90\xbd\xe0<\x90<\xb5;\xa9\xbd\xef\xa2k\xbe\x0f>6\xbd1og>q\xda\x92=E\xa6\x8e=\xea\x00\xaa>\xd4|\x04\xbd\xff\x84g>@Z\xc8\xbd\xa3\xce\xf6;\xb3.\x8d\xbeTE(=)a\xa3<\xd0p\x85\xbc\xa4W\xb5\xbe\xd0\xe2\xa4\xbe\x02=\xb3=\xf4\x03\x97>4d7>\x93X)\xbe-r\xc9<!\xc3\x9f=\xe9k\x19\xbe\xd9\x9aq>\xc8\x88\x96=.\x11\x1e\xbec\xbf\xce\xbeP\xd0\xaa\xbe!\x88v\xbe\xdc\x8d\x81\xbd\xc7V\xa2\xbd\xf9G\x9d=\xab\x0f\x18=OI\x86=\x99\x16\x80>4\x18\x16>/ \xb2<\xc3\xb1.=,.^>\x91\xa3r\xbeor\xbd=T\t\t=\xb0\x82J>\x01\xef_\xbe\x0f4\xa3>\xc4r\xc8\xbd\xe7z\x1e\xbe\xb5\xdd%>\xb1\x82(\xbe\xd0\xbc\xc7\xbd\x03\xd1\x10>\xb3\x97\xd3<d9a>j2\x0e>=\xe5\x8a=\xff\xa8\x0b\xbe\xa6/\xce\xbb\x1a ?>\xaf\xc3\x87=\x87\xb1\x07>7\xe4\xbb>T\x87K\xbe\xe0L:\xbd mm>q\xf2\xf6;\xdd(\xc3\xbcb\x8c\x8c\xbe\x93_\xd3<\xd5\xa4\x8f>\xd7\x809>A\xf9\xdd=]H}\xbd\xd1\x81\x86\xbe\x13\xd8\xf7=\x8c\xa4\x05\xbd\xe2p\x96\xbc\x1e\'\xab>\xc4\xb6$>\xf2\x1b\x92\xbd,xD<\x86\xeb?\xbc\xa0\r\x01>Vi\xd3\xbdGT\x07>:}k=\r-\xef=:\xb9\x83=\xd97\x07>\x7f\x05x<\x9f\xcb\x95<\xac\x15\xb6\xbd\xd6,\x0c\xbc\xda\xe2\x1d\xbdN\xf5\x10=\x9aqv\xbe-)\xe9\xbc\x8f#\x18\xbe\xc9\xbdK>\x01s\xf2=\x14\xcb\x8d\xbe\x8c\x91\x86>\xc6CB=\x0c\xaf\x85<\xc6\x92\xdc>0\xb0\xbf\xbcA}\xb8\xbbc#\xce=\xb4\x1dT\xbd\xab\x1f0>\xde\x84\x03>\xbc\xd1!\xbdn%\x93>\xb3\xb8\x1e\xbe\x13A\xbf<\xe7r\x01>\xcdWv\xbe\x99\xe9\xca\xbd\x19\xe5\x83\xbeB\x91\xad\xbejz<\xbeAN\xb0<CSN\xbbym\x88\xbei\xc6\x81>\xb4@\x04>S\x0c_\xbd\x87v;\xbdc\xde\\\xbe\xe6\xa0P\xbe\x81%\x86>\x83\xd3%;k\xcb\x1f>m_6\xbe\x14\xe2\xbd\xbe\xe3\x11\x03>1\xeb\xcf=oG?>\xf7s\xbf\xbc\xe72\x11\xbev\xd8\x91\xbdK\xa6\x97>i\x82\xf6;,\xca\x16>\x0cp"=\xc65e>\xd3w\xe4\xbdD\xab\x15>\x1d\x98\n=Y\xf2\x0b>WjG>\xc7A\xa8>~\x81\x93>\xc6[v\xbdD\xbd:=\xc1R\xa2=/\x94\xab\xbd'
-p1338
-tp1339
-bsV504270855053271040
-p1340
-g2
-(g3
-(I0
-tp1341
-g5
-tp1342
-Rp1343
-(I1
-(I200
-tp1344
-g12
-I00
-S'P5\xd4>2\xd8\x89=\xe7\xec\xd9\xbeyc\xa6<\x1c\n\x87>aYt\xbdE\xf6\x81\xbd\x17\xe3o\xbe\x88\xd1g\xbdj\xef,>\xa1&\x98;F\xd5\xc7\xbb\x12\xfd\x08>\xd8\x0f\x14=\xd9\ny\xbd\x9aM\xb7>\xf0\xf1b\xbd(l\x02\xbe~\xee0\xbe\\H\xdc\xbb\xa6\x80O\xbe}P\xcc<\xfa\x86#>tY2\xbe\x9eba<\xd7F\xc4\xbd\x1fq\x0c>\x0b\xc2\xeb\xbd\x9c\xb1e\xbe\xbe\x85\xc6<\xfe\x94\x9c\xbc\xca\xdd\x1d\xbd\x9a\xf0\xc0=!Y\x8b\xbe\xbe\x04\xcc=\xde\xe1c>R\x8f:>v\xd3q>iE\x9e>\x07\xa8 \xbdK\xc0\x13\xbe\xc2\xfb$\xbc\xd9\x9cx>\x1f\x7fl\xbe\xaa9\x1a\xbeO\xfaU\xbd\xdb\xa0\xae>\xc8\xad\x9c:\xdc\x07\xb8=:\xc8\xd9>\xf7Rr=&D\xd9>\xf4\x10\x1b\xbeQ\xac\x99=\xcd$\xe3\xbe\xb9\xe0\x1c>.gp=4m\xc3\xbdF\x15\xf7\xbe~\xc3\xc5\xbe\xff\xd4W>!lw>R+\xa3=\xfbG;\xbe\x90\x17-<3\xf9\xce=`\xf3:\xbe\x0f\x9d\xa6>\xce\x99\xe6\xbdz\'\x1a\xbeMw\x03\xbfBB\x99\xbe9\xc3\xed\xbd\x980)\xbd\xe2\xf4\xcf\xbd\x89>0>\xb1\xc6->\x94\xca\xe4=&\x02,>\x0e\xd10>A\x9d\xee\xbc\xd4\xac&\xbdc\xdfU>\x00T\x86\xbe|L\xd5=\x9c\x04\xf1=\xd6+\x91>\x94u\x8a\xbe\xf2\xb3\xe9>^\x9a\xf3\xbb\xc3&C\xbe\xc5\xa1+>\xa9|\x99\xbe\x8a\x08r\xbd\xa4\x1a\x93>#M\xdc=\xfe]0>\xe6\x01}>N\xc7\xb8=\x07\xff\x08\xbe@@\xca=\xba\xca\x83>]\x18\xdf=\xfc\xfd->@p\xd8>\xe2\x1fV\xbe\x1dA\xa6< \xf58>\xbf\xd3\xcb<A\xd9\x85=N\xbbu\xbe:~A>N\xce\x97>\xc8>!>\x97V*<+\xac,\xbd\x92\x8d\xb4\xbe\x03\x8d\x89>h\x1d\xe9<\x15\x11\xcb=\xae\x93\xf3>\xf6M\xc8=@\xe8\xab\xbd2\xacp=\x01\xb6)=\x04\xaca>1\xc1D\xbe\xa7\x12c=|\xb8\x8a<\x11\xbdI=\xaa\xd3\xbf=\xcf\xa1$>\x8aM\xbc=\x90z-=Yfx=\xdeR(<\xf9\x05C<\xfad.<\xfdjt\xbd(\xe1\xc1\xbcJ\x038\xbek\xda\x84>4i\x9e=\xbc\xc5\xb4\xbe\xf0o\xa8>a\x9d0<Na\x03>\x84y\xc4>W\xd4\t\xbe\xb6\x91}<\xd3\x94\xd3=\x14B\xe8\xbd\xad\xcaw>\xfc\xaa1>{S\x1a=\x02e\xa3>\xe3\xfb\x02\xbe\xdc\xb0\xd9=\xd4\xcf\r>=\xcc\x94\xbe>v\x15=W\xae\x89\xbe\xfas\xb8\xbe.\xee\x1f\xbe&\xd0\x82=!\xf5\xe3\xbd\xe5*\xb5\xbe\x03\'\x9e>q4i=\x18#\xd9\xbdX\x1c\xa5<6W \xbe\x07.\xce\xbd\xd3`\xe6>\t\xc8r<\xfb\x83\xc3=|"\x88\xbe8\x1a\xe0\xbee)\xaa=\x08\xf8">\x16\x8fw>\xc1w\xb2\xbc\xba\x94(\xbe|\x0e\x18\xbd\xef_\xad>\xc2\xa8\x0c\xbdj&f>\xb6\x8e = \xd8c>\x10\xe6\xf3\xbd\xaa\xc4Y>h\x03H=*\xb7\x04>\x0e\xb6=>\xee\xa8\xeb>\t\x16\x93>\x98t\xa8<:\x12\xef<B\x17e=\xef\xff\xc1='
-p1345
-tp1346
-bsV503972915713675264
-p1347
-g2
-(g3
-(I0
-tp1348
-g5
-tp1349
-Rp1350
-(I1
-(I200
-tp1351
-g12
-I00
-S"R\x83\x15?\xf8\xcce>\x18\xc7\x04\xbf5\xc0\x98\xbd0e\t>\xd6\xf3z\xbc1C\xfc\xbc\xec\xd0m\xbeQi\x0f=\xe3u\xa7>\xf3\r\xe0\xbd35\x1b\xbe\xdd\x17\xe6<x\x93\x0f\xbe\xe8qf=\x16`\xbe>\xf9\xc1\xb3\xbd1\x9dO\xbe\x88\x1dv\xbe\x0f\x82\xcd\xbd\x92)L\xbe\x94\x02\x0e=\x13\xc9\x90>\x0e\xe1'>\xb5F\x9f=]i\xfd\xbd\x00\xc6J>\x1b\xb0\xed;\xf5\x0f\x89\xbe\x98\xab\x84\xbe|\xa2\x8c\xbc\x7f\x99\x11\xbc\xfd9H\xbdv\xc0\xdd\xbe\x0c\xe0Q=\x0e\xc8\x8e>Z\x15\x91>3\x84}>C\xec\xab>\xa3\xe1\xd6\xbd\xad\xd1\x80\xbeg~\xae\xbd\xc2j\xf9;\x9d]\x16\xbe\xedA\x83\xbeO\xd3\xfe\xbd$\x95\xcd>\x08\x832=\x0e#\xd0=\t\xe5\x1b?\t\xb5\x92\xbd\x1e@\xda>\x8a!\x96\xbe \xe9\xaf=\x94 \xc4\xbe\xe1@\xc3=\xd9o4>\x83\xe2\x99\xbc,V\x0e\xbf\x0f\x15\xee\xbe\x18Xp>\xc5q\x1c?w\x87\x8b>PN\x12\xbe\xb8\xe4M=Im\x9d=\\\xc9\x93\xber\xc6\x03?'E\xd5=\x02T}\xbe\xca\x17\x01\xbf\xf1\xca\xee\xbe\xf3\xd9\xa5\xbe\xa2\xff\xd1\xbd&\xf4P\xbe,\x83\t\xbd\x9d\x10\x8a\xbc\xa8\xd3\xde=-\xde\x9c>h\xd0L>\xd4\xca\xe8<=\xb1E<l\xe4\xc2>O<\x98\xbe\xfe\xdc\xb2=xa\xbb=\x96\x97q>Z\x06\x93\xbe\xf3\xbe\xf4>8\xb7-\xbeP!\xaf\xbe\xcd\x83J>\xa2'\x97\xbe\xbb\xdbE\xbe\n\xca\x7f>d\x7f\xb7=\xfa+\x9d>\xbd\xabS>\x9cj\xc2=\xfbur\xbe\xd52\xb1\xbdt\xcd_>\x83f1><%,>\xed\x0b\xc5>\r@\x9b\xbe\xc0\xf7@<\x18\x8e\xed>\xe8\xc8\xe4\xbc\\\x1b\xc4\xbc\xd3c\x13\xbf\x12)\x81\xbd\x16\xa3\xc9>u\xfc4>\x88\xd3\x18>\x0c\xf2\xfe\xbd\xdd\x9b\xde\xbe\xb3\xc38>c};\xbd\xf4\xaf\x17\xbd^H\xf5>MAl>\x9d\\\xed\xbd\xd73\x1f>\xd8\xd3\x0f=~d\x85>C\xbd+\xbe,\xfb>>\xd9\xab\xe0<\xc1)Q=\xdeM.>\xb9o\x1f>*\xfb\xd0\xbb\x92\x9c.<\xe1\xbd\xc7\xbd\x1e\r+=\xac\x83\xfa\xbc\xb33\x0c=\x01A\xd0\xbe\xbc7\x9c\xbc\x93R\x84\xbe\x0c\xd4E>\xd5.P>\xcd\x8c\xf0\xbe\x1b\xae\xde>\x908&>\xa5\xfd\xb4=\xbe;5?\x05*\x87\xbd\xe9\xfd\x01\xbd$_\x80=}\xe9\xcd\xbd>\xb1\x89>k\x85\x1c>9\xa9%\xbde\x1f\xdb>\x87\x9dy\xbe\x91\xda\xd6<#\xb0\x19>Fc\xd0\xbe\xe0o~\xbeI\x13\x80\xbeb\xde\xea\xbeK\xbd\xb5\xbe!\x8d%>\xf8\xbe\xa6\xbdV\xce\xfa\xbeXH\x9f>s^m>\x88\x05\xe7\xbc\x80\xef\xe1<%}q\xbeHr\xa8\xbe;\xbe\x03?\xc2\xdbb=\xa5\xf0z>X\xff\x8c\xbe\x9dH+\xbf\xcd\xfb\x17>#/>><6\xa2>\x1b/y\xbd\x8f\xe7\x93\xbev\x8c|\xbe\xa3_\xdb>\xb4\xb4l\xbd\x11\xee\x80>vxo=\xe3)\x8f>\xa4J\x83<\xc9\x02+>Z\x19\x93;\xbe^~>\xa9\x86->9[\x0f?\xef\xd7\xd8>\xd0\xbe\x10\xbe\x03\xae\x99;\xdd\x81\xf0=\xfe\x0bg\xbd"
-p1352
-tp1353
-bsV504173231385739264
-p1354
-g2
-(g3
-(I0
-tp1355
-g5
-tp1356
-Rp1357
-(I1
-(I200
-tp1358
-g12
-I00
-S'\xb8\xb5\x06?r\x7fA\xbd\xfc\x8c\x1c\xbf\xe4\xa9_<\xee\xc6\xa1>\xb4d\xd1\xbd\\\xdd{\xbc>\x0c\xab\xbe\xe4QC\xbd(\xe4c>=\xb1\xdc;~\x82\x94=\x19\xc6\x90>\r\xae&=b\x12\x0e\xbe\xde\x88\xe4>\xb2\xab\xa6\xbd.\x8dA\xbdL\x82k\xbe\xb6\x86\x9e<J\x8f\xa3\xbe\xc5\t\xbe<,\xa3V>\xbc\x14\x9f\xbe\x9c\xd0C\xbd?\xe33\xbe\xaa\xdb\x89>\xdf\x90m\xbe\xdb\xac\xa5\xbe\x84A\xd8=0r\xc2\xbb\xfc\xcd\xa7\xbdr\xa8\x1c>H;\xe9\xbe\xfe\xd6\x7f\xbc\xaea\xc4>,}s>\xae\x8c\x8e>0f\xec>\x07\xd06\xbdM\xa15\xbez\xfdO\xbc\xfbi\x81><N\xc4\xbe\xc7\xc6\x83\xbeV\xac\xe2\xbd\xf5\xab\x07?\xec$\xdb;-\xcd\xa9=\xf0\x84\x13?\xc0\xc3\xb8=\x02\x05&?\x8eh\x8c\xbe\xb0\x9f\xf4=\x0e&\t\xbft\xd5\xa8>\xb82\xa9=j0q\xbex\xf6\x0c\xbf.P\x18\xbf\ro\x92>\xc1\x84`>N\xf5$=\xdchu\xbe\x838v=V\xa3\x94>\xc86\xa1\xbe\xdbM\xab>\xea\xecz\xbel\x1aK\xbeZ\xfb5\xbf,\x9c\xd1\xbe\x9aX\x8c\xbd>8(\xbenU/\xbe\x94\xdf\x8e>\xec\xb3\x91>\x1e\xa1\n>\x84\x8by>\xbc\x83\x9b>\x173\xd4\xbd\xa4\nw=t\x0f\xc5>\x12\x9d\xac\xbe\xd4\xce\x05>4+\x03>,$\xc7>\xc4\xef\x02\xbf\x8e\xf55?\xe1\xd0\xb8<\xf1\xcb\xab\xbe\xd5\xc1e>WQ\xcd\xbe\xc8\x1d\x92\xbc\xc2\xd0\xf9>\xb3\xd4\xff=\x04\x90\x94>V\xd6\xa9>\xbc\xdfe>\x9c\x8a!\xbep\x89\xbf=\x92\x94\xd5>\xecb]>\xef\x8f\x85>\x18\xe2\t?\xca\x90\x9c\xbeC\xe8\x08=\xee\x1cA>\xd9\x841=\xfd\x8d\x03=~\x18m\xbe\xea\x12\x84>\x83\xd4\x82>\xacmY>I\xf3\x9e<CM\xa1\xbc\x8a0\xf8\xbe2\x1f\xdf>"\xe7\x12<\xech\xa3=\xc3\x9c.?\xe2\x7fI>\xe4\x9a\x87\xbd\x02\xb1\x8e<\xbfk\x06<\xd8<\xd8>/[]\xbe\x19\x88\x07<\xcd\'\xb1<B\x8b\xad=\x1d_\x1b>3\xd0S>\xf6A\x06>\x03\x84b=\xc1\x82\xce=\x89\xa2l>\xff|&\xbd\xca\xeb\n=\xc0\xf0n\xbd\xb6\xd4\x99=\x12\xa3\x91\xbe\xad\x97\x01?\xcac\xa1< \xc0\x05\xbfc\x9b\xa7>\xcem\x8e\xbd\xe0H\x80>\nH\xf6>0\xa1,\xbe\xdd\xb2\x04<T\x17E\xbcrY*\xbe<\x04\xab>\x7f\xaa\x97>>\xf1\xae=\xd5\x18\x08?\xa8\x88:\xbez#0>6\x06\x13>\x0b\x1b\xc2\xbe\xf59l=\xb9\xdb\xa8\xbe^\xc5\x17\xbf\xbc\xea\x8b\xbeB\xa9\xe2<>\x8a \xbe\x9d\xf5,\xbf\x16\x84\xc4>\x08MW\xbd\x81G\xdd\xbd\xde^c=!J\x9f\xbez\xc4\xc6\xbd\x87{7?\xa9V\x98=l\x91_=<-\xd6\xbe\x84X\x18\xbfV,\xdd=&<S>\xea4\xea>\xd8\x8a\x01=\xe0Kv\xbe\x10\xaf\x94\xbd\xa5\xa6\xc3>\xfce:<\n\xc4\xc4>\xcc\xc0\x07>:\xff\xb7>\xb9\xc7\x1a\xbe\xf8\xca\x94>\xe4\x97\xe3=\xfc\xd8\x81>\x117C>F\xc0*?\xbe\xbe\xe2>\\\x91\x93=\x86\xd6\x0b=X\xc8i=\xf3\xff\x00>'
-p1359
-tp1360
-bsV503970103961354242
-p1361
-g2
-(g3
-(I0
-tp1362
-g5
-tp1363
-Rp1364
-(I1
-(I200
-tp1365
-g12
-I00
-S'\xe4\xe1\xc9>B\'\x9b<]\xa5\xd3\xbe\x05\x9cr<U"?>\x04\x19\xa9\xbc\xab\x06,\xbd\xe1(r\xbe\xa0\xec\xa9<3\xbe\x8a>[$1\xbd\xc3\x98\xc6\xbc\xe0\xd9\xd8=\x87\xb8\xb0\xbc|\x0c\xda\xbc\xffx\xac>p\xc0\xde\xbd\x95\x07\xbb\xbd\xbbMD\xbe4\xa4\xb3\xbd\xae\xd48\xbetR\x0e\xbc\x85\x0e(>\x12\xc7H\xbd\xa7\x06(;\xc15\xc8\xbd\x13\xcdZ>\xbc\xc1\x07\xbe!?\x86\xbe\xc6\x15\x95\xbd\x94A\x95\xbd$\x9c\x8e\xbd\xddM\x83=\x95\x15\xd4\xbe@]\xde<}\x02\x9a>b8z>p\x980>\xec\xd0\xa6>yKl\xbc\xe8\xc7B\xbe&X\xb2\xbd\xc7\xc3\xef=\xba.;\xbe\xa4\xc5o\xbe\xd6>\xb0\xbd\t4\xd0>\xe1\x1b\xa6=U]\xc2=\xbdb\xeb>J\x06\x14;\x1aq\xe3>\xee\xb4M\xbe\x94\xe7y=$6\xdb\xbe\x14\x01@>n`\x03=\xcd\xd0\xf7\xbd\x9f\xb4\x00\xbf\x18\xcb\xf2\xbe\x1a\xbe`>w\x92\xa7>qX:>\xf2\x06>\xbe5\x93\x06=\xe5f0>Go\x93\xbe{\xfe\xa9>\x8b[\x0b\xbd\xe6z=\xbe\xce<\xfb\xbe\x08\xef\xc9\xbe\xd1\x8d\x02\xbeL\xd9\x03\xbe\x12\xdc\xec\xbd\x1c\xf0\xf6=\xc4w\x11>\x1a\x8a\xfe=\xd9\xb9m>\xf1q`>\x10x\x14\xbc\x9f\xb5\xe1<O=\xc3>\x01\x1e\x91\xbe\x92\x88\xd8=~\xa6\xb2<ms\x88>.W\xac\xbe$a\x04?\x83\xef\xbb\xbcc\xab\x8b\xbe7\x95\x1c>8\xe2l\xbe=;\xa3\xbdE\xaa\xba>&Zq\xbc\x06\xc4\x82>T\xfbY>\xc7\xa9>>\x8a\x89\xfa\xbd\xce\x93&<\xddN\x82>\xbb\x83&>ZEL>8G\xd5>\xadp\x84\xbeb#\xd3<\xe7\xa4h>H\xc42=k\x11\'\xbd\x07\xf6\xa2\xbeX\x1e6=\xc0`g>\x0fX=>\x0b\xb7\xcd=;{z<LU\xb9\xbeg/i>\xa0}\x91\xbc\x1d/\x89\xbbN\xa9\xfb>F\xeaQ>\xae\xad \xbd`0\xb69\xbaOX\xbc\xea\x84\x99>`\xa1\xdb\xbd*\xe0\x13=t\xab\x88=\xf4u\xe6=\xf1\xe3\xd5=<O\xdf=\x8e\xceu=\xd8\xee\x14=\xec\x9b5\xbc\xc4\xf5\xec=\xc6\xde\xd5\xbc\x8e\xc8X=m\xcaS\xbe\xb9\xc1\x85<\xcd`w\xbe\xc3\xa7\xa3>%n\xe2=@\x05\xcd\xbe\xaa-\x9b>#\t\x10=\x87\xd7\x13>%\xb6\xfa>\xec\x0e\x06\xbe\x877\xf29v\x1eY\xbd\xa1U\x18\xbe\xea l>\xc8mP>L,\x96\xbc\xd6d\xd0>\xc4\xbcJ\xbe\xa6\xbb\xaf=_W\xd8=\xfe\xd5\xb1\xbeT\xcb\x95\xbd\xd3\xa9\x80\xbe\xefm\xf6\xbe\xcfPi\xbeR\xdd\xda<\xa2\xc1j\xbd\xb0\x86\xef\xbe\x060\xae>\xc0\x07\xe2\xb8`\x1a\xbd\xbd\xbaF\xa1<\xc4\xe0l\xbe:\x12"\xbe\xda\xa7\xfe>\x83\x1c\xac=p\xb1\xfa=>*\x95\xbe\x97\xf5\xe6\xbe\xf9H\xf7=\xe5{\t>\x86S\xa1>\x04\xbaV=\x93gd\xbe\x9d\xd8\xc9\xbd>\x99\xba>(\x1e#:\xd5;\x85>0R\xef=\xa2\xa7\x8f>\xc2\xc3\xd7\xbd\x08\xdaC>\xc73|=x\xb2=>E\xda\x01>U\xcd\x08?\x88g\xb1>\x81H\x0e=\xf1\xac\x13=\xfes\xd5=\xe6n6<'
-p1366
-tp1367
-bsV503969271366438912
-p1368
-g2
-(g3
-(I0
-tp1369
-g5
-tp1370
-Rp1371
-(I1
-(I200
-tp1372
-g12
-I00
-S'\xa3_\xf2> \x13\x04>\x11.\xc7\xbe!\xe4\x17\xbdT\x08L>\x08iX\xbb4\xd8\x9a\xbd\x89\xeb\x96\xbe\x1c\xe1\x07\xbd\xda\xce\x97><;\x83\xbd\x8d\x07\x1f\xbe\xd4\x97\xbb=J\x89\x0c\xbd\x94\xadO\xbc8\xd5\xc4>e\xb6\xcf\xbd\x9f\xe1\x15\xbe":a\xbe|\x93\xee\xbd\xfa\x0f(\xbeoh\n\xbd\xcd\xfd[>\xc5\x99\n=,\xc6\xa7=Y\x10\xa5\xbd\xba\x12*>T\xdfx\xbd\x94(\x99\xbe\xd4\xad\x02\xbe\xb0\xa8\x04\xbe\xe0\xc8\x8e\xbd\x0c+-=\t\xc1\xc9\xbe\x16\xb4\xb1=\x9f:\x87>>\xa8\x8a>\xbc\x9e9>\x90\x96\x90>\xbc\xa7\xda\xbb\x19,?\xbe\x00\xe6\xc1\xbd\xc0\xf2\xba=y\xa4"\xbe\x86\xdbY\xbe\xaf\xfd\x95\xbd\x0ed\xbc>\xb2u\xc4=\xfaf\xfb=W\xed\x02?\xf4F\x91\xbdHs\xce>\x90\xd6?\xbe\x06\x8e\x8f=\n(\xe0\xbe\xf0\x1f\x9f=as\x8c=\xf9\xd3\xa7\xbc\xb0U\x10\xbf\xd2\xfb\xe6\xbej\xc9c>\xf2\x8d\xd9>JRp>2ZI\xbeb\xcb\xdd\xbcR\xc5\xce=\xf2@}\xbe%\x8a\xd0>\x92\x14\xc7=1\xdb\x85\xbe\x84\xfa\xf9\xbe\xeb\x94\xcf\xbe&\x98d\xbe\x88l\xb0\xbd&\xe3\xf8\xbddw\xb1<\xbb\xc1\x80=\xd1u\x11>\xe4\x04\x88>\xecBQ>`/\xa3<\x86\x07\xc6\xbbo\x14\xc2>\xe8\x83\x88\xbeBt\xef=\xf9\xba\x8a=\x17\x86q>%\xe3\x8f\xbe\x0c\xa6\xf9>\x18\x9e\t\xbe\x90\xfb\x89\xbe\x8eZ\r>\xaa\xdc\x81\xbe\xe8\xb7!\xbe~\xd9\x84>2!"=p\x91\x9a>\xa2Qi>]+\xbd=\x99\x17)\xbe\x80\x9d\x90\xbc\xee\x16q>\'\xc3\x16>T8E>\xee^\xd7>\x82\x12m\xbe\x00Zf<\x12\xe8\xa4>\x1a\xa4&=\xe8\x9b\x8a<\xc4\x8f\xc0\xbecw\x86=\xd68\x92>\x05Q\x15>L\x0fl=\xb6\xba\xcc\xbcr\xd2\xb6\xbeR\x89S>\xbbl\xa6<\xae\xc1p<\xea}\xfb>\xc8*:>(2\x0c\xbd\xcd\x90>=#m\x1f\xbd\xdd2r>h\xc9\x1c\xbe\x1f?\xc5=\xbb\xc4\x9e=\xf3\xed\x18>\xed\xb5l=\x9a\x14\xe2=q\x1e\x8a=3\xfcT=\xd5\x86&\xbd\xc1\xc55<\x8e\xe7+\xbd\t\xfd4<\x18\xc7\x8f\xbeu\xfd\x02\xbd4\xb2w\xbe\xe2\nj>\x92FF>w\x7f\xba\xbe\xad\xed\xc4>\xbd\x02\xc4=\x02\n\xad=W|\x10?\xbf$\xf4\xbd\xd3\x8a\x1c\xbcL/\x18<\x80\xf2$\xbe5P\x89>\xd7\xe9\'>\xdf\xbbQ\xbds\x99\xad>g\x82G\xbe\x83\xeb\x89=s\xda\xc8=\r\xbc\xba\xbe+P\x07\xbe\x8b\x95\x89\xbe\n\xe7\xf1\xbe\x17\xbaW\xbe\xb9\x91\xf5=\xa2\xdd\xdd\xbc\xed\x80\xcf\xbe$\x01\xa4>\x8e\x92\xcd=bP\xc5\xbd\x14qP\xbc\xeb"\x82\xbe\xd7\xcaV\xbe-\xd3\xcc>hm\xf6<:,\x1c>\xe5m\x95\xbeg\xb6\x02\xbf\x1fl\x03>l(@>J\x07\x97>P\xd0\xaf:p\xe3\x81\xbe\xa87\xf8\xbd\xb8\xa1\xd9>D\x0e\x04\xbd\xc6\xa5Z>&q\xa7=\xc8n\x85>W$\xbd\xbd"\x1b_>\xcc\xfa7\xbc\x08\x04\x1c>\x05\xba\x0b>(\r\x05?\xe4\xd8\xa4>\x92\xcb\xcd\xbc\xb9\x102=\xc1s#>\xad\xec@<'
-p1373
-tp1374
-bsV503975419788279808
-p1375
-g2
-(g3
-(I0
-tp1376
-g5
-tp1377
-Rp1378
-(I1
-(I200
-tp1379
-g12
-I00
-S'\xaax\xc5>\x10g\x9e=\x08\xa1\x8a\xbe\xc6\x17o\xbc\xa0\x8eA>\xa5\xf1\x9e<Y\xaa1\xbd\x05\xf0g\xbe\xb8\xcb\x95\xbdXEr>(\xb4\x98<\xb8\t\xb4\xbd\xcc\x00->\xd62\xb2=\x83\xdc\xb9\xbd\xc6\xfa\x91>n\xcc\xa3\xbd^\x88\x94\xbd"M\x10\xbe\xdd\xc4\x89\xbd#\x89\x04\xbez@\x8c<\xb5\xb7(>\x10\x8a\x80\xbd\xc2\x1c\x81=\xcd\x8b\x87\xbd\xd0T\xab=\x91\xd6\xaa\xbd\xda\xccg\xbe\xd3tU<\xd4\xd7\x80\xbd\x03\x9c\xd4\xbd\xce\xed\xeb=\x1f\xe7\x85\xbe\xcd\xc2\x93=U\x0c3>\x8e\xec;>\x8dp\xf6=b\xfbW>b\xcdO=\x1e\x84\r\xbdZ\xebZ\xbd2\xf6.>m#c\xbe\xe0\xe1\x92\xbd\xd0\xa3\xe8\xbc\x98r\xa5>\xb2\rJ=N2*=j\x99\xc9>\x9a\xd3A\xbd9\xd3\xb4>\x8e]\x05\xbe\x0e\xe2\x9c=V3\xce\xbe\xd7\x03\x9a=\r\x0b";\xc0k\x0b\xbc\xa8|\xe2\xbe\xce\x00\xa2\xbe\x91\xff;>\x1a\xa82>p\xb3\xb0=0n&\xbesI\xa1\xbdm\xf5\xca=c\xe5E\xbeJ\\\x84>s\xd0\xd5\xbbN\xa0\x1e\xbe\x00f\xca\xbe0od\xbeu\xbaQ\xbd\x858\xac\xbduH\xad\xbd\x86\x19\x9d=B\xaa\xe8<3\x8d\x04>Mf\xf9=\xe82\xe2=\xd9.\x1b\xbd\xeck\x93\xbd\xa6\x10\xa1>\x02\x81B\xbe\xe4C\x0f>]6\xe8=\xfa\x96\x82>\x90m[\xbeJM\xbd>riQ\xbd\xec\xc4\x1d\xbe\x8a\xe2[=\x07-\x81\xbe\x1e\xee\x7f\xbdsiY>\x86[\x9a=\xca\xa2\x1c>#\xba\\>~\xe1\x00=\xf0\x89\xe5\xbd\x01\xb4(=XEY>@\xa8\x02>\x07\xc7\xca=\xe7\xbf\xa8>\x90S\xe5\xbdB\xf4&=\xe2M!>H\xf6\x16<\xad\xba\x00=U\x05U\xbe\xbb\x90D>\xa0\x8f^>\x92\xbc\xa9=\n\xa1.\xbc*\x03\xe2\xbc`5c\xbes\x8el>\x93>\x8d=N&\x89=\x15\x93\xc8>\xf6\n\xb3=\xaa\xba#\xbdB\xb4\xb6<P\xeb\x7f\xbd\x05\xf0/>sN\xd9\xbd\xa4\xda#=}i}=\xf2\xaf\x93=E\xe4\x13=Zn\x8c=\x84b\xc7<\x9f\x04C=\x02\x92\x88=4\x11J\xbc\xc8\xc2\xe8\xbc\x1a\xa98\xbd\tZ\x93\xbd\xac%\xaf<\xd6\x8c\x11\xbe\xc6m\x13>\xeb\xf2\xe6=[Cm\xbe\x06\x12\x91>\x9e}"=*\xf0\xbb=oe\x84>}\x8d\xcb\xbd\x0cK\xa5\xbcX\xbb\xe8<b\xd5\x07\xbe\xed\xc4p>&5\x18>\xb0\xb5\x7f\xbc\x9d.R>\xe7\x85\x93\xbd\xcez\xb7=8f\x03=N.\x82\xbe\xb8|"\xbd\xab\xdda\xbe\xb5\xe7\xa5\xbe\xda\xa3\xbc\xbd2d\xc2=\xd3\xa4"\xbd\xb5.\x90\xbe\x12.f>\xd1)\xa2<\xa8\x82\xda\xbd\xea\xf2\xc2\xbc\xd4\xe8,\xbe\xdd\xfc^\xbd\xd2&\xbb>\xfb;\xb7<m\xa9\\=\xc9\xe5\x8d\xbe\x81\xe1\xbd\xbeTy\x94<\xc3\xe0\x0b>\x96\xb2j>S\xb1\x18\xbc}\x05\x1b\xbe\xb8%\xa9\xbd\xd85q>\re\x1d:\x1bX\xd3=\x8fOH=R\xb8J>\x8a\x90\xd9\xbd\xa2\xf7G>]\xa9[\xbc\xd5\xef\xeb=\xadd\x08>k\xcf\xdd>\x85[i>\xf5\xc6\x18\xbbG\xba\xa7=Kt\xd3=\xa2\xa9?>'
-p1380
-tp1381
-bsV503967696447614976
-p1382
-g2
-(g3
-(I0
-tp1383
-g5
-tp1384
-Rp1385
-(I1
-(I200
-tp1386
-g12
-I00
-S'\x0f\xe5\xb6>\xe8\xd7J=\r_\x7f\xbe\xde\xb2\x89\xbc\xcb\xfa5>\xce+>=\x9fZI\xbd\xf9\xe5S\xbe\xd4\xd01\xbd\x18c\x83>Z\xfb\xac<\x16J\x82\xbd\xc2^9>\xf6;\x9a=5\xc2\x94\xbd\x96\xde\x80>\xc1-\xb5\xbdu1\x83\xbdc\x9b\x07\xbeS\xe8\xa1\xbdqD\xef\xbd\xaf\x9a\xbc<\xc3\x1c\x11>\xb8\xa95\xbd\xc3\xd6\x85=n\xa0\x89\xbdY\xc0\x9c=\x8a\xbe\x85\xbd.\xb4`\xbe\xe2 \xc2;\xca\x0b\x06\xbd\x18U\xc2\xbd4\xc8\xca=\xf8X\x82\xbe#\x87\x85=\xca\x18\x19>e\x849>?\xa4\xc4=!\xedI>H\xd5\xd0<\xb32\x1a\xbd\x87R\x16\xbd\xc4\xcd7>\xb2]K\xbe\xf6Sl\xbd\xcej\xff\xbc7\xee\xb0>\xb8\x87B=\xe0r\x11=_\xd6\xc5>\xb0\x87\xe3\xbcF\xd7\xb6>\xcd\xeb\x06\xbe\xb9\x8d\xbf=W\xd5\xd1\xbe\x03\xb1\xbf=\xca\x9f\x84\xbc\x08\xe8\x94\xbc6z\xd3\xbe\xeb\xe9\x94\xbe\xe4\'D>U\t*>\x08\xdd\xc0=_\\#\xbeVX\x7f\xbdB\xf0\x9e=\xec\xa4[\xbeKs\x8d>\xe6\xe0\x9d;\xa4\xda\xee\xbd\x1b\x90\xb4\xbe(\x17Z\xbe\xb0\xc4\x8f\xbc2\xb7\x8b\xbd(g\x94\xbd5\x80\x9e=\x94\xee\x8d<\xba\xf6\xed=\x14>\xb9=9\xa3\xb8=\xc0{\x18\xbdWo\x93\xbd\x12~\xa5>\xc2\xad(\xbe\xad\x13\x02>\x9cl\xf7=r\x0e\x81>*\xccA\xbe\x8a\xd3\xac>\xa7\xb2\x01\xbd~\x86"\xbe\xc0"6=\x81hp\xbe\xfb\xa0g\xbd\xcd\xd8Q>\xa6%\x18=4%\xed=W\x8dR>$\xd5N=\x9c\xf3\xc1\xbd\x1e[J=\xfar;>\xe0"\x03>\xbc\xac\xbf=\xc4\t\x98>\xc4\xb1\xc3\xbdl0_=\xc0\xb9\x10>\xd0\xb11\xbc+i\xc7;\x90iQ\xbe\xfd-5>\xffrN>\xec\xc1\x8b=c\xeb\x96\xbcS\xfe\x04\xbd\xddwQ\xbe\xc9bZ>\xa9\xde\x8d=\xde\xaf\x82=\x1d\x17\xc4>,\xcb\x93=\xd3s\x02\xbd6\xe5J<Q)\x1a\xbdr\x01+>\xe2\xd1\x9a\xbd9\xb6H<(\xa1\x8c=\xefcG=;Y{=x\x16m=t\x02\x12:\xb8B^=(=\x9a=`Y\xdf;\xe7\xd6\xa1;]\xeb)\xbd\xf7\xba\x80\xbd\xbb\x94\x02<\x9f\xe2\x06\xbe\xd7[\x07>\x11\x92\xef=\xd9Q_\xbeC\x02q>\t\xb2@=\ng\xca=\xfbxP>j\x0b\xed\xbd\x87N\x9d\xbc\xe5\xf5a<?U\r\xbe\x89QK>\xba\xbc\x05>s\x0c\x0f\xbd\x00\xe7>>=U\x86\xbd6\xb3\xa1=G\x7f\xb9<\t7\x83\xbe\xa3\x98\x0e\xbds\xb3L\xbeF\xd2\x9a\xbe\'\xd8f\xbd\xed\x83\xd0=\x9b\x87,\xbds6\x85\xbe\x86nj>\xa6\x9f\xa8\xbc\xfe\xb2\xe8\xbd:~`\xbc\x07\x9e\x03\xbe\xb7\xe3\xff\xbc\x17m\xbc>[\xfb\xb2<\x18\xba\r=6\xc3\x83\xbeH|\xaa\xbe\x0e\xa3\xcc<\x87\xd0\xeb=\x17\x1bZ>\x1e1\x19<e\xb1\x17\xbe\x0b\x1a\xc6\xbd\xcf\xf4=>\xcao\xbd\xbb\xde"\xbd=\xb0\xfb]=\xa4B>><c\xb4\xbd\xcdq7>\xe3=\xab\xbb\x1c\xa0\xf3=\xe6\x0b\xb2=\xfd\xef\xd6>p\x98O>\xe6\xfd\x92<\x9c\xcf\xad=\xb7\xab\xd0=\x8edG>'
-p1387
-tp1388
-bsV504277443461394432
-p1389
-g2
-(g3
-(I0
-tp1390
-g5
-tp1391
-Rp1392
-(I1
-(I200
-tp1393
-g12
-I00
-S'\xe0I\x8c>D\xeev\xbda\xde\xdc\xbe^?\xa2<\x1b\xba~>+\x00\xb8\xbd<\xa3\x10\xbdy\xcf\x83\xbea\xff\x9d\xbd\xe2b@>r\xf3U=\xa0Z\x84=\xd6\xf21>\xb4)>=\xfc\xb4\x11\xbe\x08\x84\x8a>\x86G\x94\xbdn\xe2A\xbd}\xfe\x07\xbe\x8e"P=\xf1+\x8e\xbe\x12\xa3\xbb\xbc\x9df\x92=Y`\x9a\xbeD`\x9b\xbd\xab\xdb\xb1\xbd\x1b\x97\x85>\xf1bt\xbe\xfd\xe0\x90\xbe\xf1\xe0)>\xd2\xc0\x0b\xbc\xab\xa7\x0c\xbe\r\x81\x13>\xda\xde\x98\xbe\xc1s\xb4\xbch\x0f\xae>a\\\x0b>\x9a\x05\x0f>\xe5h\xbb>x\xd7\x8c=\xe9|\xc6\xbd\xb3\xc8O\xbc\x1f\xe6\x8f>\x0b\xd4\x9e\xbe\x9e\x0f+\xbek\xf9R\xbd\xef\xb9\xc5>\xc8S?=O?\x8a=\xb7;\xc2>p\x7f\xb3=\xf8\x11\xdb>\x83\xaf\'\xbe(\xa6\xd4\xb8\xad\x12\xed\xbe\x93\x15\x83>Z\x8d\x8c\xbc!8&\xbe\xdf\xd2\xee\xbeh\x18\xd8\xbe\x15ms>\xd6W\xbf=ND\x0c\xbd\x96&\x81\xbeQ\x86\x15<X~\x82>\x9dqe\xbe\x98\x8d+>\xc6s\xa5\xbe\rh\xae\xbdr\xd2\x0c\xbf\xc1\xe8\xa4\xbe17P=j\x86\xf8\xbd\x8f\x85\xef\xbd\'\xc5\x82>\xb6\xa1\xab>\xbe \xea=\x8c<\x12>\xa4\xa8P>\x19\x0e\x93\xbd0*\x0b=\x9dV\x97>\xa2=\x84\xbe\xb51\x08>l\xdb\x89=\x9b\xde\x82>\xccu\xc6\xbe#\xbb\x05?`\xb5\xd9=\xd2\xd1;\xbe34O>\xb6B\x7f\xbe\xf8\n\x84=\xc8\x97\xc4>\xcc\xee\x05<R\x99\x1a>^\x92m>\x87\x0b=>o\x1b\x07\xbd\xb7\x0c\x03>\xfa\xbb\xad>\x0b1\xd7=\xa4\xc8(>\xd8\x11\xd3>\x9e\'\x8e\xbeR\xb3C<e3\x03=\x15\x14\x98=\xc4\x19\x82\xbbm\xd6}\xbdO\x97z>-\x18\x10>\xe6\xeba>h\xcd\xfc<\xe3\x1c*=\x8e\xd6\xac\xbe\xaal\xac>\xdcn\xaf<\xae\xfa\xd5=\xea\x83\x0c?1\xfa\x92=\x13_\xf4\xbcy\xb2w\xbd\x9bD\x06\xbd\x98I\x98>\x03L\x17\xbe\xbe\x01^\xbd\xe8\xf9L=<\xa4\x98=}bX=lO\xd2=\x08\x16\xf6=\x05\xd8A<\x0b\xf4i=\xcb\xf2\x1b>v\x89\x83\xbdd\xc7\x86<\x84\x1a\x8f=\xca\x84\x02>\x00\xef.\xbe\xa5[\xd2>\x82}u\xbd\xe7s\xb0\xbe\xf9\x15^>\xe4\x85g\xbdc6x>\x98\x8b\x8e>vO0\xbe\x1c\xb8\xa6\xbb\x06\xe3@\xbd\x15\x151\xbe\x19\x90\x86>\x95\xf9\x8e>\xa8\x15<<u\x9b\xc7>\x18F\x94\xbd\xa8{\x19>\x9c\x06\xb0=,\xba~\xbe\n\xea\x0b>2\x05w\xbeP\xc7\xbc\xbe\xf2\x03;\xbe0\x0fK\xbd\xf81\x03\xbe+\'\xee\xbe\xfc\xa8\x91>k\x05\xc4\xbd\x15\xf9/\xbd\xe3!;=[\x1fE\xbe\xd7\xe2\xe5;\x9f\xfa\xfe>\x1a\xce\x9c=\xf3\xf0\x0e\xbc}\xbd\xb2\xbe\xcb\xf7\xa5\xbe_\x9c_;\x07\xf5\xf4=\xbfX\x98>\xbb\xb0s=-\x858\xbe&\x9c\x86\xbd\xe0\xd5\x87>\xb4\x91\xcd\xbc\x92{Y>bP\x9b=\xa79\xa1>\xe9Ze\xbe\x17\x8fA>E\xff\xaa=L\x1a0>\xd0\n7>E\x07\xc5>\xdeU\xb1>\xe0\xf80>=n\xc1=_\xde3=\x08\xa3\x05>'
-p1394
-tp1395
-bsV503970594325815296
-p1396
-g2
-(g3
-(I0
-tp1397
-g5
-tp1398
-Rp1399
-(I1
-(I200
-tp1400
-g12
-I00
-S'\x02f]>1\xf1G=\xac\xbcK\xbe}\xc7"\xbce\xc2\xb3=\xdbn\xaa;cL\x94\xbb#*\xca\xbd\n\xc1x\xbc\x82\x15\xe5=\xc2dJ;\xfe\nK\xbdO\xcf\x9c=H\x8d\xf8;M\xd6\x06\xbd^d\x19>L>\xd7\xbc9\x15t\xbd\x97\xf9\xb9\xbd{\x9d\xbe\xbc\xe8S\xa7\xbd;\x01\xf1<\xc4\\\xba=U$\xf8;\x9cM\xb7<\xcez\x7f\xbd\x9f\xa0\x82=\x04\xd5\x06\xbdLt\xe5\xbdL\x88i\xbd\t\xbeF\xbdB\xf2\xdb\xbcY#%=\x0f;-\xbe\x924\xa1:\r0\xd6=j\xf4\x97=\xcb\xb0\xc2=7I\x00>\xe4\x12\'\xbcT\t\x95\xbd\x81pe\xbc\x908\x12=\xb5\xa7\xf1\xbd\'4\xa1\xbd!\x9fE\xbd\xa0lC>\xb3\xf6q<\xfeD&=\xd9$k>\xc1y\xc7\xbb\x9c\x92W>\xfb|\xbf\xbd\xcf\x8fI=\xf2\xb63\xbe\\\xb6\x83=\xd1\'\x02=\xf3\xe3I\xbd&\x97W\xbe\x19\x1bG\xbe\x96\x0c\xca=P\xda\x0f>\x9eWj= \xca\x85\xbd\xc2$\xd5;\x8c\xa6t=\x9bA\x05\xbe1\xec\x1a>4w\x11\xbdt\xe2\xc1\xbd\xfc5a\xbe:\x84\x11\xbeq\xd1K\xbd\xe8\x16\x1c\xbd\x05\xe0\xac\xbduvt<\x1eq\xfe<\x910\x7f=\x86\xf2\xc2=\xb3\x82\xa6=\x9cx\xbb\xbc\xfd4k<tn>>\xd6E\xdf\xbda\xddd=?\xb7O=\t\xa1\xf8=^>\x1d\xbe\x98\x17`>?J\x10\xbd\xe3\x93\x10\xbe\x1f\xdfh=S\xf1\x14\xbe2@\xfa\xbcs;\xfe=\x00\xc4b=26\xb7=\x91\xb4\xce=\xb0i0=\x99\xb8\x87\xbdvkU;\xbc\xd1\x03>\xab!\xa5=.\xd6\x9b=\x86\xcf">+\xe8\xd1\xbdO4g<H*\x02>\xcc\x18\xac<O\xd0\xab<uo!\xbe\xc3\x99\x1e=\xb0Q\x03>\x82[.=\xf9\x8e\xb0<\xce\xb8\xf9\xbc\x9d3\'\xbeq\x81\x01>}\x96\x17\xbc\x95>\x99<\x0c\xfeY>\x93l\x96=l\'1\xbd\x1fj\xda<\x15\xa1\xea\xbc\x9e\x97\xec=}L\x8f\xbd\xe6\xa2\x89<f;\xa9<\xdf5\xb3<\xc1\xaeH=oB\x90=%-b<\x83g\xb5<\xa7Is;\x84\\@= \xdf\x08\xbd\'A\x97\xbc\x9a\xfe\x86\xbd\xf6\xd6\xbb<\x99;\xda\xbd\x90%\xc1=\x19k\xe0<\x03\nA\xbe\x80\xa9\x0f>O\x14<<RB[=\r\xf6Y>\x90td\xbd\xf7\x0f@\xbc\xbfZ\x84;\xa0\x81e\xbd2J\x15>\xb5;\xc2=j\x05\x1a;9\x0bG>\xac;\x90\xbd\x9c\x17\n=\xa5\xcdf=JA\x0f\xbe+\xd1"\xbd\xab\x02\xdd\xbd\xb6\xb8F\xbe\x0ca\x03\xbe@TE=Y\x81G\xbd$\xa0W\xbe\xf8\xf2\x08>\xc2T\xd6<\x9c\xb5\x9d\xbc\x96Q\xdd;\xd2v\xb2\xbd\xc6#R\xbde@n>\xea>\xf1<\xab\xa8O=\xa4\xdd\x12\xbeQ\x97s\xbe\n\xea\'=\xfb\xe7\xa9=l\x0b&>Q\x88Y\xbcw!\xab\xbd\xdd\x86f\xbd\x00]\x19>\xea-\xc2\xbb\xaf\\\xbe=\xd7a\x0e=\xde\xe8\xf1=\x0f\xc2\x93\xbb4\xf7\xe6=\x82\x98\xb9;\x0e\xcc\xbe=\xa8Tr=\xc2\xf1\x85>01\x02>\xa1+L\xbcxJ\xc5<\xdc}\x92=\x05\xa1\xf9<'
-p1401
-tp1402
-bsV504228937531416576
-p1403
-g2
-(g3
-(I0
-tp1404
-g5
-tp1405
-Rp1406
-(I1
-(I200
-tp1407
-g12
-I00
-S'Ru\x05?\xee(\xc8\xbd\x86\xb6?\xbf\x88\xdb\xe2;\xfb\xb6\xd2>\xa7\x91\x1a\xbe\xb5\xd9\x16>i\x82\xa0\xbe(\x06<=\xf2up=E\x90$\xbd\x92.\x00>w\xd7\xa7>\xb68\x98=\x83Ne\xbeV&\xd0>\x0e\xbf\x8c<\xb6\xdb\xc3=9\xc1\x94\xbe\x99\x8f\x84;K\xb3\x81\xbe(d\xba<\x01\x18\x8f>\x1d\x89\xbe\xbeC\x80\xc4;\x80\xce\x90\xbe\x99M\x9b>UOu\xbe\x83\n^\xbey\x8d|=\xebL\x1d=I\xe1\xf8\xbd\xd8e\xcf=\xdd\xe3\x16\xbf\x02\xe50\xbe\xc1\x99\xa9>k;\x00>zD\xc1>\xda\x9f\xda>V&\xaf\xbd\xa0\xc8\\\xbe\x87\x96\xc7=K\x15W>W\xfd\xd6\xbe\x99t\xab\xbe\xd7\xfdu\xbe\xe6\xc8\xfb>m\xef\xe9\xbd\x81\xac\xb7=C\xb6"?j\xc99>\xcb\xe2:?\x83g\xb0\xbe\x06t\x89>7\x9b\x8a\xbe\x0f,\xcf>\xc7\x1e\x0c>\xeb]\xc8\xbe\x12\xf5c\xbe\xf2\xd8+\xbf\xe1\x85\xb1>\xd6\x18\xea=\xbc\xc0\x8a\xbd5\xccg\xbe\x8dF\x81>B\x87}>w\x8d\xc3\xbe0\x925>\xf7H\x93\xbe\x85\x1fX\xbe\xe7q7\xbfY#\xae\xbe\x81u7=\xde9y\xbeg\x0f\xa2\xbe\x82\xe10>\xbe\xf5v>5Y\xcc<\xfb\x91x>\xf8@\xbc>\x9d\xd7W\xbe\xb7\x8aL>\x91\xb0\xbf>\xd8\x86\xc6\xbdbV\x88=\x9d\xfbx>H\xe9\xcc>\xff\x87\x1c\xbf\xab\x90H?\x0fT\xb3\xbdTG\x05\xbf\xb2t?>\xc5\x13\x00\xbfY\xb9\t<\xd0\xf6\xf2>\xfe\xe8\xa4>)\x0c5>\x1aT|>8o{>\xd8u\x1f\xbe\xab\xed\x8b=\x96O\xd4>!JM>\xdd \xcb>\x08\x90\xb1>\x9bu\xac\xbe\x9f3h==\x82\x87>-p\xa1=\x92\xdd*>\xeb\x98I\xbe\xae\xb0\x0e>v*\x96>w\xe3\xe3=\xf6\x98}\xbd\x07\xdd\xa4\xbd\xder\x14\xbf\xc0m\x08?7\x82R\xbd\xd7\xb35\xbd\x05S1?V\xf7\xd5=g\xa9\xb5\xbd\xfb\xe2%>\xee\x12i<\xcdp\xdb>\xb6\xf4\x84\xbe\x9b\xa9\x94\xbd\xe2V\xb0=\x1b\xec\x92=\xc3\xf9\xaa>B\xe7\x90>\xde\x83I>e?\x88=\xe2\x0c7>\xd6K\xe0>\x8aq\x0b\xbd\x16\x0e.=\r\x07\xae\xbc\x8a\xf0\x1f>\x0e-\xc7\xbe"\x97\x0c?+\xb2\xcf\xbd{\xa92\xbf9\xe9e>F\t\x99\xbe\t\x87\xa3>\xd1*\xec>F\x1d\xfd\xbdq\xee\x9c\xbc\xf2U>=;\x01t\xbd\x1e\x82\xb8>A%\x88>@*g>Q\xc1.?\x0f\xe5|\xbe\x8a\x8c)>\xf8\xe8<>U\x8b\x85\xbe\x95C\xb7=_\xa6\x9e\xbe\xf8{\x17\xbfX\xed\xb9\xbe\x08`\xeb= \xa7R\xbeq\na\xbf\xa7F\xb9>\x8f\xb9\xf3\xbc\xd5\xf2\x8a\xbc\x84\xd1\x8e>el\xa4\xbe\x83\xe4\xc0\xbdp\xd4.?\xc0\x1d\xd5=\x16\xfd\x17<\xc7h\x9d\xbeY\x11%\xbfi-e>\x92_<>iT\x0c?N`\x07\xbd\xebOk\xbe\xb2\x93\x1f\xbc\xe9(\x83>^n\xe4<\xff\x9e\x11?\x01\x037>\xab-\xae>\xcd\xe3\xa1\xbdC\xed\xdb>\x88l\x1d>\xb9\r\xd0>)9\xa7\xbcs22?\xabO\x9d>\xb2\x16Q<]\x90\xc9\xbc\xa2\xf5J\xbd0\xc5+>'
-p1408
-tp1409
-bsV504226366733049856
-p1410
-g2
-(g3
-(I0
-tp1411
-g5
-tp1412
-Rp1413
-(I1
-(I200
-tp1414
-g12
-I00
-S'\x15\xcd\xd3>8&\x86\xbdi\x03\xfd\xbe\x96\x97\xd5<\xa3\x8f\xa7>\xe8\xa8\xf1\xbd\xa6-j=-\x11S\xbe\xd7\xdd\x19\xbd\x90Z\xa8=IT\x8f<\xa2,\x80=\xf2\xa6\x8d>\xea1\x89=\xff\x0b\xd4\xbdx\xc0\xb2>\xca\xbc"<\xe04\xd0\xb9\x13l"\xbe_yD=o!z\xbe\xe1\xfa6=J\x92\xfb=\x9e\x0b\xaf\xbe=*\xc7\xbc\xca\r\x18\xbe\xb1\x84F>(^^\xbe.\xc4{\xbe\xf1\t\x0b>5m$\xbc\xb0\xa8\xc8\xbd\x91?\n>=)\xa6\xbeo}\x8c\xbc\xf6\xfbV>\xce\x81\xd4=X\xc7H> \x8e\xb8>(\xfb]\xbc\x0b\xc5\xdd\xbds\'"=O\xf7\x82>;\xb0\xb7\xbe\x88\xdaF\xbe\x90z\x0f\xbe\xe2 \xc8>fV\xbf\xbc\xf5\xa7\xa6=ip\xdb>\xf97\xf8=\xe0M\x13?F\x89n\xbe\xefp\t>\xb6M\xbb\xbeb\xe4\x8e>\x07\xaa\x1c=\x89\xfb9\xbe\x10r\xb6\xbe\xeeE\xd3\xbehi|>3L\x93=Y\xbb\xee\xbb\xc2\xacO\xbe\xc7\x9f\xc5=g,M>O}>\xbe\x06\x07?>\xf5\xc1\x88\xbe\xdbz\x0c\xbe\xbf\xda\x14\xbf\xad\xa3\x8c\xbe\xd22\xb3<\xda\xbd\xe4\xbd^\x8c"\xbeg\xc4Y>\xfd\na>\xf0\xa2\xf1=\x8f%\x01>\xefr\x8c>U-\x02\xbe\xa6hd;O\xae\x8d>\x8d\xba\x0c\xbe\x19\x13\x94=k\x03E>\xdb\x86\xb1>\xafr\xae\xbe\xdd}\r?`\xc9\x93\xbb\xcd\x8c\x89\xbe\xc6\xd2H>Z\x8f\xc2\xbeqN\x84\xbc#0\xa5>\xce\x85C>F\x8b\xdf=\xd9\x1ad>\x1e\x1c\xdf=\x90\xd2\xd4\xbd\xd3\xd7 >\xcdS\x9c>]\xec1>PKs>\x9e\x1f\xc6>\x138Q\xbe{\x00\x02=G\xc0\x13>F9\x14=\xdb\xe7\x92=\x1e>\xf0\xbd>^f>^+e>\x92I\xfa=\xfeJ\xa1\xbdi\xfc\x18\xbd\x91\xfb\xba\xbe\xd7H\xb0>.\xaa)=\xcd\x9et=1\t\x0f?\xe7E"=M\x93l\xbd\x0f#\xc1=\x81\xbf@=\xd8\xaa\x92>HJl\xbe\xc9X_\xbd\x03Y\\=@g\xb9=\xb4\xcf\x07>C\x84\x1e>8T*>\xa2\x0b\xee<xd">\xb9\xfd">\xe1:\xa1;\x87I\x90\xbcJ<\xa7=\xcdT:=y\xe8n\xbe\x1d\xc3\xb9>\xeff\xe5\xba9.\xda\xbe\xa0\xc0?>\xa3\xe2\x1c\xbe\xb9IU>\xab\xf1\x82>\x9d\x02\'\xbe\x9a \xa7\xbc\xf2\xdac=\x06?F\xbd\xd8\xe7\x7f>3%B>\x16\xad\xe6=\xad\x8e\xe2>\xe3\x90\xbb\xbd\xa9O)>\x0fL\xd6=E\xeey\xbe\x02|\x05>?Ow\xbe\xb9\'\xbb\xbe\xce19\xbe\xe3\xc3i=#n!\xbe\xa7\xf1\x00\xbfJ\xd1\x86>\x91\x7f\x0f\xbd\x01S\xb0\xbdi\x08\x02>\xd1\xe7N\xbe\xab%\xde\xba\xf3\x91\x05?+~\xe5=\x88\xbd\xf1\xbc\x8al\x8c\xbeG;\xdd\xbey2\xd0=\xdf\xcd->!<\xa2>\xda\x0c\xbe\xbc\xffR)\xbe\xf9\xac\xe0\xbc5\xf3Z>\'r\xda\xbcp\xe7\x96>\x9f\x06u=}\x16}>\x12}\x13\xbe\xf5\xd4\xa2>(\xc4x=yX\\>#\x1d\x9d=\x8f\xda\xe9>\x97\x91^>J\x18c=:\x04a=u"\x9a<_\x95;>'
-p1415
-tp1416
-bsV503976661319438338
-p1417
-g2
-(g3
-(I0
-tp1418
-g5
-tp1419
-Rp1420
-(I1
-(I200
-tp1421
-g12
-I00
-S'(\x87\xb4>p\xcd4=c\xab\xc5\xbe\x17[%=\x19\xf2\xc2=\x05\xf6M=\xdd\xce\xcf\xbc\xc7\x9e>\xbe\xf1l\xb0<\xe3\xee\x91>\xe9t\xc1\xbd\xff\xf3\x8d\xbd\xd4S\xd8=y\xedJ\xbd\x8c\x1c\xd5=\x13A\x95>pT\xf5\xbdPy\xff\xbd\xe1\xe3A\xbe\x8b\xe2\x07\xbe\xf4\x85\x03\xbe\xe7\xc8\x9e\xbc\xfc\xd8Q>xg\xce={O\xd2=1\xf7\xfe\xbde\xdeL>UQ\xf8:\x97Ff\xbeA\xf4U\xbeC\x1e!\xbe\xd0{\xf2\xbc\xfdy(=\x08\xa5\xfa\xbe`\x8b\xf4;P~P>)\x7fX>I\x0c:>HR\x93>\xfb\xe2\x04\xbe\xe5\x1c\x8e\xbe\xb7\xc0c\xbd\x00\xde\x86<\t \xb1\xbd\x12p\x85\xbe\xe9\xe2\x08\xbeP\x1b\xc2>\xa3\x88">\x802\x0b>\xccF\xeb>\xa3\xab\\\xbd\xd5&\xe4>KI%\xbe\x1d\x91\x01>\xd9\xb5\xbc\xbe\xf3\xf6\x10>\x1c\r\xeb\xbc\x8b\xa2\x15\xbe\x95\xa4\xe2\xbe\x930\xdb\xbe\x01\xf3$>\x88\xea\xbe>\x81\xf1\x94>\x98P]\xbe\xb5\xb0\xc2=\xc2\xca)=\xb9\x8a\xa7\xbe\x819\xaf>q\xe1 >\x9f\x834\xbe\xf8\xdf\xd8\xbe\x81"\xda\xbe7q%\xbe\xeb\xcc|\xbdo\xe3\xcf\xbd\x89\xc7\xc2<\xa9\x1e~=\x9d\x89\xaa=\x170\xab>x\xc1`>#\xedt\xbc\xfd\xfe\xbf=%A\xde>\xe4\xe7\x87\xbe{\x07\x93=H]\x14<\xc2\x8c\x99>\xb9\xc6\xa1\xbe\xfb\xeb\xe5>\x17A\x1b\xbe\x1e\xec\xa6\xbeg^\xea=\xd8\xce4\xbe\'\x11\'\xbe\x0b\xb4\x89>\x97\x9c\xca\xbcG\xb1{>\x15\x8f\'>\xec\x1b->\x8d\x106\xbe\x91\xbd\x9b<\xb1S]>m\x0e?>\x88\x15\x80>\x8d\\\xd5>l\nX\xbe\x89C\xcf\xbchF\x91>}\xa5\x11<\xa2\x92\x81\xbd\xa3\x9a\xc7\xbeP\xce\xad\xbd\xd2O\x93>\xf1\x9a\x1e>*\x8d\xa7={\xd9=\xbd\xa5Q\xb1\xbe\xbd\x91\xfc=\xf3\xfbZ\xbd\xbfC\x9f\xbdO\x17\xf9>\t\xc7V>\x93\xe2\xd6\xbcUS\xda;\x9b\xf9\xf0\xba\x1f\x8d\x86>c\x82|\xbd\x8d\xf8\xc7<\xb7\n\x10>\x9b\xaaL>\xbfJ\x0e>\x05\xbc\xb4=\xc8\x97\xc4<\x97K\xae=#\x80\x86\xbd\xa6\x8f(>\x9d\x9bV<\xb9a\xaa=\x12\x84\xa1\xbee\xad\x0b\xbd\x13\xef\x8f\xbef\xd4\x98>C;%>Er\xd3\xbe\xd5\x1fs>$tT=\xfc\xeci=\x8f|\x00?\x0f\xf6\xf5\xbd_\x95\x06\xbd\xe1\xf1+\xbdsJ\x03\xbe)\xb5Z>e\xd71>\xa5\x06s\xbdDz\xf5>!6\x8e\xbe\x93oB<#\xf5\n>?\xf6\xc5\xbe\xf7\xf7\x07\xbe\xe2\x83\xa3\xbek\xf7\x0b\xbf$ES\xbeGn\xac=\x1d\x13\xc8;\x8c\xa2\xd7\xbe;\xf3\xb7>\xc8\xce\xe2<08\xc4\xbd\xe5\x01\xc8\xbckxl\xbe\x1d\xa2Y\xbe\xcdT\xd0>\xa8\x9dG=t\xef\xea=\xd5|\x82\xbe{\xda\xe2\xbeP\nr>\xf7\xb7\xac=\xe1\xc1\x99>\xcfcp=\xdd\x17r\xbe\x01\x94\xa0\xbdC\xbd\xad>\x9b:\xab<\x94]n>\re\xf4=\xf1\x88\x8d>}\xd2\x8f\xbd\x98\x96r>\xf7\x0fl=\xa5MV>\x97\t?=\xc3\xe3\x10?\x10\xb8\x90>\xf1\xa8\x95<\x8byG<\xbb\xbd\n>\xb7\x13\xc5\xbd'
-p1422
-tp1423
-bsV503963883267424256
-p1424
-g2
-(g3
-(I0
-tp1425
-g5
-tp1426
-Rp1427
-(I1
-(I200
-tp1428
-g12
-I00
-S'\xc1\xc6N?\x07i\xc7>>\xdaD\xbf\x9e{\\\xbcY\xbf\x12>O\xd9\x8e=\xb6\xd9\xd8\xbdNf\xda\xbe\xc0\xb8n=\x04\x9b\x0e?\x91\xa7\x9b\xbe\xf7\xb1\xc7\xbe\xc1\xfa\x90\xbc\x80\xceb\xbe\x9f\x85t>\x8d\x82*?Np|\xbe\xd5x\xee\xbe\xf8i\xd5\xbe\x84\x10\xa2\xbe\x81\xf0.\xbeV\xbcO\xbd\xba\xf7\xe4>\x04\xcd\xf4>Y\xfcy>\xb2;2\xbe\n\x11\xb4>\xd6l\x03>\xfd\xa4\xef\xbeC\xea\x1c\xbf\xf6\x90\xc2\xbe\xb5\x8e\xa4=\xfco\x0f\xbe\x88\x03e\xbf\xd7\xba\x1e>\xc4>\xe8>f\xae\x06?\x87\xe2\xdb>TL\xf1>\x95as\xbe&m\x10\xbf\r\xc8P\xbe\xa7\xaf\x02\xbe\xec)\xd2\xbb\xf8\xa6\x1c\xbfm\x08W\xbe\x8d\xd9\x0b?r\xfe\x88>\x8c\xa7\x90>~m~?\xa4\xe5\xce\xbd\x80@\x1e?\x84\xba\xb9\xbe\xc4A0>\xf4\x0f+\xbf\x03\xca7=\xcc}\x03>\x04g\xe7\xbc\x9f\xeb_\xbf\xd7}[\xbf\xe3\xfe\x9b>\xb1\x1c\x91?\xb8(D?\xc3\xe3\xae\xbe\x9fI?>+R\x7f<cG\xf7\xbe\x00\xf3]?\xf1\xd0\x19?\x06D\x02\xbf\xab\x9e:\xbfM<c\xbf\r;+\xbfLq\x06\xbem\x8a~\xbe\xcf^\xd0\xbd\x80J\xbe\xbcG\x10\x12>x83?\xe0s\xcf>\xff]\x1d>\x9d\xd6\x0e>3~<?\xe7\x1d\x08\xbf\x13@\xe0=f\x87\xcf<\xf4k\xbc>\xadF\xe2\xbe\x14\xd7@?\t\x90\xd2\xbed\x92\x14\xbf\xd9L\x9d>\x07\xb5\x94\xbeb\xec\x04\xbf]!\xaa>M\xed\xcf\xbcW\xcc\x1a?\x8b\x13\x9d>^km>/\x87\xc0\xbe<\x9f<\xbe&\xac\x8b>\x14\xd8\x80>\x9d\xbc\xf1>U9N?\xe3\xe1\x04\xbfM`D\xbd\x08\xb8U?\xbd%\xd7<\xd7g\xec\xbdQ\x84\x81\xbfQ\x9d\x8b\xbe}\xa55?=\n\xad>\x01n\x8c>\xad\xc9\x13\xbe~%7\xbf\x88\xa65>\x02(*\xbe\xfa\x85D\xbe\x08\xd1K?v\x19\xe3>\xa4>\xdf\xbd\xbdE\x96=\xfcZ_;\xb7\x15\xba>\x86Rc\xbe\xf7d\x97>"\xc2`>\xbdJ\xa2>\xddS[>\xec\xf8z>\xadd\x14=>\xb4\xf2=\x93\xb6\x9f\xbeCI\x86=\xa0f\xb6\xbc\xb71\x03>\x8c\xcc\\\xbf\xd7j[\xbe\xcfv\xf4\xbe\xf3\t\xdc>\\)\xfb>A\xc8=\xbf7\x07??7h\xbe>4\xfc\xd8<B?\xac?*\x91\xaa\xbd\xb2rf;f\xb2\xd4=Z_R\xbe\xf9[\xe0>\xa4\xe5\x8d>\\\x04-\xbeg\x9dF?r\x84\x15\xbf\x1f\xfe\xb3<\x8b\x91\xb3>\xbda@\xbf&\xb1\x00\xbf\xe8\x89\x19\xbf\x9f\xd6w\xbf\xe8\xcc\x10\xbf\xb84t>)7\xc3<\xbd|H\xbf`n\x15?\x1c\xb2\xab>\x91\xdc\xd9\xbdy\xd19\xbd-\xbb\xfd\xbe\xd9\xa0&\xbf\x01\xf7\x1a?\xe6\xee[=\x9c\xe0\xf3>RX\xc3\xbeF\\\x85\xbf\xf5\xb2\xf9>\xd3\xddW>\xa1+\xfb>\xceh\xf7\xbb\xcbM\x0c\xbfM7\xa0\xbe\x99\x8dX?\xf9\x1b@\xbd\x84\x1d\xbf>Y\xb9I>\x9f\x9f\xe5>`mV\xbd\xe4\xd4\xbe>\xe8\x0e\x8a\xbb\t\xcc\xb1>}\xe7Y>\xe7\xcfu?.D\x1e?\xbc:N\xbe\x7f\xad\xba\xbc\x06\xb3\x93>\xb3>\xc0\xbe'
-p1429
-tp1430
-bsV503973249420906496
-p1431
-g2
-(g3
-(I0
-tp1432
-g5
-tp1433
-Rp1434
-(I1
-(I200
-tp1435
-g12
-I00
-S'\x98gf>\xc4\xb7\xa5\xbc\x85\xfd\x83\xbe\'b>\xbd9t\xff=8\xa9c\xbdY\xd8,<\xad\xe9\x17\xbe\x9d\x1a\t\xbd\x81p\xd5=\x0f\x84\xd0:\x81"\xbd;\x94\x86\xea=\xb54\xf6\xbb\xbc~\x9d\xbd\xcf\'\x1e>\xa3U\xd9\xbc\x17\xb3\x16\xbd\x9a\x94\x9d\xbd\xd7\x95\x91<\xe3,-\xbe\xdc\xce\x1e=\xb0\x1c\x18=\xc8\xb2\r\xbe\x97\xe7\x91\xbc\xb9\xcb\x83\xbd\xb2A\x18>+\xaa\xe1\xbd!\x809\xbe\x85b#=\x9b{x<\xdf|&\xbd\x80\x7f2=\xe4\x91+\xbe\x98"S;s\x87\x16>\xd9\xfb\xa3=\x83y\xb9=\xafEY>5\x1eI<7\x07\x95\xbd\xc1\xd4U;\xc9S\xf7=7\x92@\xbe\xe8\x0c\xc1\xbd\xdd\xbdA\xbd\x18>L>\x0f\xc7\r<\x11\xff\x11=s\x95l>\xe4\xce/=\xab\xb3|>\xb2\x14\t\xbe\xb7\x9b\xa2<l\xa5Y\xbe.\xd2\x06>\xcfXW=\xd0wj\xbd\xd2\x1b\x8b\xbe5\x9cm\xbeh\\1>\xa7\x91\xf4=\x93\xc2\xe2<\x9f\xa8\xdb\xbd[hc\xbc%"\x06>k\xfd\xbd\xbd+\xb6\x10>\x94\x81\x05\xbed\xebU\xbd\xba\x1f\x99\xbe\xcd\x953\xbe\xcbqF\xb8m\xc6\x86\xbd\x8fY\xbb\xbd\\u\xbe=\xfb\xd9\xfb=X\\\x9b=\x9b0\x99=\xdd\x93\x02>k!9\xbd\x04Tk<Q\xfe)>Kz\xfd\xbd\xa4uV=\x84\x01\x88=\x83)\x04>\xd9\x17%\xbe\xa6\x1f\x87>\xdb\x824<\xbb3\xde\xbd\xaf\xab\xea=\x06\xd4$\xbe}\x8eL\xbc\xadC7>p\x81c=\xe9#\xd9=\x8b*\x08>\xe1\xdf\x83=%7\xcf\xbc\xa3\x02M=\x13@2>o\xf2\xb3=\xd4\x1a\xbc=\x0f\x9aN>\xf9\x85\x0e\xbe\xcaV)<\xfc\xc9\xb0=\xe4\xf5\x03=\xab\xd6&:xE\xc3\xbd\x0f\x7f\xbd=\xa7\xee\x97={6\xcb=CD"<obt:\t~:\xbe;\xa7+>)Z\xd0;\t\xac\xa5=$h\x89>\xedv\x89=#K\xd8\xbc5\xc1\x19=\xd7\xf3\x8f\xbb\xa9\xed3>\x17-\xe4\xbd\x8bC\x95\xbc9\xe4\x9e<\x0b8r=\xcb6n=\xd5\xd8\x90=\xeb\xcc\x8a=)\xe4\xc9<H\xf5\xd2<e(i=p^\x9b\xbc\x08"\xc7\xbc\xff&\x88<h\x15]=x\x99\x04\xbe\xbc70>\xe4\xa3\xee;\xabr`\xbeMJ\x19>\xad.\x04<+\xb7\x1c>/\xc4=>\x83\n\xb7\xbd\xb3\xf6%\xbdO\xa7\x18\xbd\xcc\x12\xaf\xbdQ\x164>\x1d\x9c\x03>\xa1\xc1\x07\xbb\xdb\xf4d>\xa3\t!\xbd\x9f\xc7\xc1=wy\x08=\xdbr\x07\xbe\xcf\xc1\x16=v<\x06\xbe3\x19Y\xbec\xde\xf5\xbd\xbbV*<\xceB\x9d\xbd\t\xd2\x8a\xbe\xcc\t\x02>9\x1e\xd4;,5\x85\xbb\x93\x03\t=DL\xdd\xbd\x9c\xe4\x13\xbd\xfd\x92\x8f>\xf1\x1fx=\xf9\x10\x13<H\x96I\xbeY\xbe\x87\xbeHz@:\x80\xe1s=\xd9\x01\x04>\xfc\xd8\xc3;\xf7\xfa\x0e\xbe\xe2\xb2\xa9\xbd\n\x05\x19>\x1de`\xbc\xe4t\x01>Gd*=_\x931>\xe3!\xab\xbd}t\xd8=$s\xe5<\xcbc\xc6=\x97\x17\xbe=7\xdc}>\x18\x154>\x88\x97m=\xbfJ\xd7<\x18\xfc\xfb<\xbc)\x80='
-p1436
-tp1437
-bsV503959808425197568
-p1438
-g2
-(g3
-(I0
-tp1439
-g5
-tp1440
-Rp1441
-(I1
-(I200
-tp1442
-g12
-I00
-S'f\xdf\xd0>\xe8.p<t\xea\xc3\xbeH\xb3\x00\xbea1C>A6\x8d\xbc\xd2\xb5\xa8=l\x18&\xbe-d\xaf\xbc\x89\xc6G>\xef\xdca\xbd\xdfb.\xbd\xed\xabT>\xb8\xfe\x96\xbd\x97F)\xbe\xb0\xb6b>\xf8kI\xbc\xb4\xbe2\xbdO\x90D\xbe\xa6\xe4\x88<\x88\x01w\xbe/\xdd\xf6=\xde\xc6\xe2=\xd6m\xb5\xbd\xd2\xf3>=daC\xbe\x82\x17,>\x17\xd5\x9d\xbd\x9e\x12\x7f\xbe\x99a\xb1\xbd\x98\x84\x8e=\xaf\xbbT=\xef\xa1\x85<8H\xa0\xbe\x18\x9c\x8e\xbd5\xd0\xde=\xce\xf3\xea=FuH>\xc4\x03\x84>3\xde\xc4\xbd:\xfd\xf1\xbdT\xcf\xc1=\xf4\x85\x1c>yl\x8d\xbeS\xb9\xc4\xbdX\xf9\xd0\xbd\x15C\x98>\xb64N\xbd\xc0\xa0>==F\xd9>\x8a` =\x8e5\xe8>\xf0\xa7\x88\xbe\x8d\xf2\x13>\xe8\xdfs\xbea?;>(t#>m\xeb\xd7\xbd\xfe\xca\xa1\xbeZ\x83\xb2\xbeX?\x89>7pA>|+3=\x9e\n\xa9\xbdH@U="o\x04>\x9fz8\xbe\x8a\x12\x84>\x015\x1e\xbe\xdc\xd6\xf8\xbd(9\xad\xbe\xa8iV\xbe\x80\x89/=\x99P\x93\xbdFf8\xbePD\xc0<a\xa9\xbd=l\x16\x88==\x87\xf0=\x91H1>\\\x07\xdc\xbd\xa6J\x07\xbb\x94f\x96>\xbch\x0c\xbe%\xee\xc2<H?\xeb=x\xe7:>p\xb8\x8b\xbe\xe5;\xba>*"\x8d\xbd\xa84p\xbe\x15\xbe\xb5=\xb6\xc8\x85\xbe.\xa9\x84\xbdp\x11b>R\x915>\x1f{\t>\xe8(T>\x94\xdc\xc7=\x8aE\xd2\xbd\xe1\xf0\x9d<\xa8\xf6G>\x9f\xe6/>[*\x05>q+\xfe=\xd1t1\xbea\xeab=(\xd6k>;\x83J;\t\xb3\xa0=\x06\xc3t\xbe\x11@\xa0=\xbfR\x13>\xb6\xa0\x06=\xe5;\x8f\xbc"\xe4q\xbdv\xb1\xa2\xbe@\xc9\x94>1\xba\xc9\xbbw+\x82=\xe3\xb6\xb9>\xe7\xe2_=x-\xce\xbd\xb1\xa8\x07>\xe8\\\x07==\xf1\x92>\x04\xfb\x1f\xbe\x8f\xe3\'\xbc\xf1\x90b<\xa0\xff=\xbdf\xbd\xf2=N\xcb\x9b=$\x08q=B\xe3f=\xe9\x16\xcf=\x88\xd0\t>\x0e\xe8\xc7\xbct\xe5\x08;\x19\x06\x0b\xbd\x9b\xbf\xb6=N\xb5D\xbe\x95\x8a(>\x9e\xf2\x8a<C\xd6\xb7\xbe\xfb\x01\x85>o\xc6@=\xa9-H>((\x9e>\xf9\xea\xc1\xbd2b\x99\xbd\xd3L\x80\xbd\xa0\x11\xad\xbd\xb9>\x86>\x08\xdb#>\xe2cJ=\xa8\x9b\xb3>\x08p\xea\xbdHk\x99=bd\x98=\xfe"j\xbe\x11\xf2\x0c\xbd\xf8\xef\x19\xbevw\xa5\xbeG\'\x8d\xbex\x1f\x07>\xc4S\x18\xbei?\xef\xbe\xc8\xc8\x15>\xbb\x8b9=S\xe7<<Gw\xc0=\x08\x07\xe6\xbdU\xfcH\xbd\x98-\xf2>\xa9*\x9b=\xe8\xe6\x17=x"\x87\xbe\r\xf3\xf2\xbe_\xfe\x05\xbc(\x85\xc6=\xed\xc8\x8c>\x12\x16\xa5\xbc\x05\xe2o\xbeJ\xb5\t\xbe\xfc\xedC>z\xef\xf2\xbcv\xc6P>\xe9\xd4\xc2=\x88\xceH>V\x04M=a\xd6&>\xfb\xda\x88<"\x01B>k~\xf2<\x93M\xdc>\xb3$d>\xa3\xe4\x19\xbd8\xafE\xbdb\x12Q=\'\r\n>'
-p1443
-tp1444
-bsV504211730927341569
-p1445
-g2
-(g3
-(I0
-tp1446
-g5
-tp1447
-Rp1448
-(I1
-(I200
-tp1449
-g12
-I00
-S'\x08z\x1b>\xb2\x1b8\xbc\xa6\x9aW\xbe$e\x8d<(o\xf1=xq\x11\xbd\xa1x\xa3\xbc\xb1\x1d\xfe\xbd\x17\x04\xe6\xbc\xad\xe3\xc6=\x06f\x8b<\xeaL\xd0<\xcb\xb3\x9e=\xf52\xc7<b\xc6I\xbd\xae\xb5\x13>\xb3q\x1b\xbd\x8f\n\x0f\xbd~\xc6\x96\xbd\xda\x01\xf3;\xc3\xb6\xf4\xbd\xc0\xc3d\xbc\xd4f\x82=k\xc3\xf4\xbd\xee\x9c\xc6\xbc\xb7\xb4.\xbd`\x8b\xd8=\xdes\xd1\xbd\xbdo\xfa\xbd\xab\x8dv=\x1d8\x14;\x12\x97\x84\xbd/\xf2\x89=B\x94\x1a\xbe\xee9\x93;\xe6\xd0\x1f>g\xf2\x9c=\xaf\x83\xa9=\xb61->L\x7f\x97<\nzU\xbd[W2\xbc\x19L\x01>\xce\xcc\t\xbe\x1d\x95\xad\xbd\x8a}\xaa\xbc\x7f\x94C>|1\x86<[~\x08=V\x8fH>\xba\xdf\xeb<\x04\x0eX>\x14\x94\xa0\xbd\x0f\xb4$<\xea@e\xbe\xbe\xea\xe0=o}\x9f\xbb\x10`\x8e\xbd\x07\xcbk\xbeijX\xbee\xfd\xde=-\xc3\x83=\xaeH\x16\xbaky\xfb\xbd\xe8\x10\xe9:\xc2\x8e\xd9=\xf4\x8a\xe3\xbd\xe6\xe5\xd3=\xb7~\xf0\xbd\x87\x80c\xbd\xc6v\x86\xbeq\x0e\'\xbe)\xff\xa2\xbb\xfd\xbbe\xbd\xa4\xe7U\xbd\x04~\xe2=\xa5\n\x05>\xe8\rO=T-\xa8=\x90i\xc2=\xe3m\xee\xbc\xacx\\<\x0f\x9a\x10>\\|\n\xbeE7\x8b=F\x80\x1c=\xeb\x80\x0c>\xc5\xf1;\xbe^\xde\x81>o&\x00=&\xb1\xc9\xbd\xad=\xbe=\xb6\xf2\x00\xbe+\x90\x9d<\xdf\x1c:>]\xe4\xbe;K\x99\xa9="\x92\xec=\xdc#\xa9=\xf2\x08\x1f\xbdj\xbeD=\x83\x13\x1b>\xc1aY=\xf6\xb3\xa5=8\rU>\xb1$\xff\xbd\xe3\xfd\xac;o\xc5\x17=N\xa3\xb0<1\xeb_\xbb\xec\xd8\x82\xbd\xb7\xf5\xe0=]P\xbb=*\xe6\xcc=\xe1l\x83<\xbdW\xd0;\x179\'\xbeB\x96\x18>\x8erQ<\xa2o!=\xf1\xfe\x87>\x9a$:=\t\x90\x83\xbcM\xda\x87\xbc\x92>\x08\xbc\xe1\xbb\x0f>\x87\xed\x81\xbd\x1c\xa2\x96\xb9R\x8e\xc6<\xeeL\x10=\x87\xeb%=\x15\xabL=~\xd39=%t\x11<\x8d\x81\xc4<\x8c\xd0\x81=\xe2\xa5\xb0\xbc\xe9g\x9f<\xc2{\x9f\xbat\xed.=\x0b\x9e\xab\xbd=3>>\xbe\x98\xe2\xbbC\x820\xbe1_\xf9=\xd2L\xe4\xbc\x01\xcf\xbd=\xfe@\x1f>\x1a`\x98\xbdS\xa5P\xbbV\x97\xeb\xbb>/\x9b\xbd4\xca\xea=$\x1f\xe9=\'Ft;\x83|<>]zE\xbdw\x83i=\\^3=\t\xff\t\xbe\x1b\x9b<=\xbc\x06\xf5\xbd\xbe\xddC\xbe\xd5\xaa\xaa\xbdkd\x0e\xbc$HI\xbd\xe9\xd5Y\xbeg\xa4 >\xd9\xa7\xde\xbc\x9c*"\xbd\xc3\x8dj<d\x18\xc8\xbdW\xce\xb7\xbc \xfaw>l\x17\xe6<R\xa8\xbb;3\x98!\xbe<A5\xbe\xe2\t\xaa<\x95\xa1\x88=\xc4Y\x16>\xb6]\x8e<t\r\xb5\xbd\xaeU\xf3\xbc \x06\x0b>\x97=\xb7\xbbl\xf9\xea=BI\t=\x8d\x10\x15>z-\xca\xbd\xde\xca\xbe=\x86]$=\x1cm\xb4=\xff\xb0\xab=\xf6\x1eO>\xaf\r.>\xb7\xb2X=\x0b&\x11=j\x1b\x99<\xa5X~='
-p1450
-tp1451
-bsV503958335939694592
-p1452
-g2
-(g3
-(I0
-tp1453
-g5
-tp1454
-Rp1455
-(I1
-(I200
-tp1456
-g12
-I00
-S'c\xc7\x90>\xf9\x1b\x14\xbeS&\x83\xbe\xb3Ac\xbc\x01\xc4\x83>o\xfd\x8c;\x98fs\xbd\xdd\xb1e\xbeH\x97\xee\xbc\xd7_j>\xb9\xe3\x8a=M\xb7\xa8\xba\xbd\x08A>\xb4\xf9\\=\xdd\xde,\xbe{\xe0\xa5>X\xf2\x8e\xbd\xef\xbd\xe6\xbc[>H\xbe$Lv\xbd\x19\x96\r\xbe$;u<T&\xf5<\x1a\x8f\x14\xbe-\x01\xd3\xbcpO\xe0\xbd\xb7\x89&>\x18\xe1A\xbe5%\x93\xbe\xc5\xc7\xb7\xbc\x17\x8bF\xbe\x7f<\'\xbd\xa0\xea\xdb=\xa3\xe5\xb5\xbe\x17\x0b\xe2\xbc \xd2\x82>i(d>\xa1\xda\xa1=\xc3\xf9e>\xa5\x8b\x85=\xf4_\xdb\xbdIy\x80\xbd\xfbO\x08>\xc3\x99q\xbe\xd3\xe8\x1a\xbe\x8e\xf7\x15\xbd\x95\xcf\xc1>|\x08\x82=\xad?\xb0=\x83\xbd\xb4>F]\x85=\xa0\xa6\xdb>\xe0\xd0U\xbe\x84\xac\x81=\xec\x06\xc7\xbe\x8dnY>\x9f3\xee\xbcK++\xbe\xaa/\xa6\xbea{\xc8\xbe=*B>U\x8c\x0b>\x8bK\xc6=\x18\xb0\xc3\xbd\xa8\xb6\xbb<\xb0\xeeB>%\x1ed\xbe\xb9h6>\xd5\xd6\x19\xbeg\xbdl\xbe\xdd\x9e\x9c\xbe\xb8;?\xbe\x84\xa8_=\xeb;\x13\xbe\xe4\x01\x9d\xbd\xbb\xb5+>\x1f\xf5z>\xfd\xfd\x0c>X\x08m=}\xd0o>y\xee_\xbdd\xd1\xa5;1\x03\xb3>\x0c\xda8\xbe,\x10_=\xbfv*\xbc\x88\xef,>d\xef\xba\xbe0\x00\xf2>\xdf\xb2\x83=\x042Y\xbe\xc3\x16\x81=\xfc\t)\xbe\xb9\xaf\x80\xbbk\xdd\xd2>\xbfd\xe9\xbcl\x19\x1f>\x97W6>\x15\xabS>1\xdd\xa5;\x10\x9a\xfd<\x7f\x0cu>\xe1&\x1f>!7->\x84e\x96>\xf9MJ\xbe,.\xc8=\xb8\x98p=k\x7f\xc9=\x84\xa6+=\x8d\xc9\x0f\xbe\xe9h\xe0=5\xd1\x03=\xbd\xbcS=#\xba\xc3\xbcps >\x11\xb8\xab\xbe\xaf4\x8a>\xff\xa2\x0c=\x85\t\x02<\xcf\xf0\xc7>\x8d\xe3\xf3=\xb4\xe4L=\x05z\xa3\xbde\x0b$\xbd\x8cT\x9e>\xe3)\t\xbe\x8a\xbc\x83\xbd\xbbl\x00=\xef\xe8#=\xf0\x81E\xbc\x83z\x90=\xc3W)>\xeeu\x92:\x90\x01\xec=\xd9\xc2L>\x98p+\xbd\x87EU=->\x87\xbcy\xc9\x10=4\xc0*\xbe\xd9\x83\xa3>\x14\xe7\x1b<P8~\xbe\x0ciB>]\xbf\xc7\xbb\xb3\xfb">!\xe2\xa4>\xe44+\xbe\xe1\xe5\xc6=\xaf\x95\t\xbe\xb1I\x1c\xbe]\x94J>\x14\xff4>\x99\xfa\x87=\x05\xa4\xa1>\x1b\xae\n\xbe)a!>\xa7\xad\xc6=\xb0tu\xbe\\\xadV=\x81\x92\x04\xbe\t+\xd4\xbe\xd9\xba3\xbe,91<\xf5\x81A\xbdA\xc3\xf5\xbe\xeb\xae\x82>\xd4"^\xbekY\xba\xbdS\xb7\x1f=\xc1\xf8<\xbe\xb4\xbe?=\xbd3\xf4>\xd8\x86\n>1F-=$xT\xbe\xb5\xb6}\xbe\x17\'\x7f=\x0c9\xf3=\xe1\xd7\xab>{\xaf\x0e>u\xa7"\xbe\x89\x8d\xa2<8\x10\xa7>\xff\xb6\x93\xbc\xd7\x07j>j\xcc\x13>w\xd7\x08>\x17\x13Q\xbb\x9c/d>1\xe9\x8c=tG\xba=\x19\x83\x0b;\xa7z\xcb>\x84\x13@>\x13s0>\x157\xb0=ks >7\xc9\xc4='
-p1457
-tp1458
-bsV503960500427042817
-p1459
-g2
-(g3
-(I0
-tp1460
-g5
-tp1461
-Rp1462
-(I1
-(I200
-tp1463
-g12
-I00
-S'\xc9\xcf\xc8>\xa5\xa5T\xbd\xc7o\x00\xbf\x93*\x07=\x04\xa0\x84>\x0f\x88\xeb\xbd\xbc\xa5y\xbb\xd5\xf4\x87\xbe\n\xf0\x9e\xbc\xf3\x0b+>\x950\x04=\xaf\x17\xb8=\xa0\x989>fb\xda<\xbdo\xfc\xbd\nq\xa9>\x8f\xf3D\xbdZV\x10\xbd\x15g;\xbe\xad\xe5\x99<\xef\xe1|\xbe\x8f6\xa8:\xc0V\x10>\xfc\xe7\x89\xbe\xfb\xd5\x93\xbdpK\n\xbe=\x18z>A\xe4`\xbe{\xd1\x86\xbe\xc8\xd9\xc4=\xf4\xc8\x85\xb8w\xed\xd2\xbd*\x98\xea=\xc7\xb5\xb6\xbe\x9bh?\xbd8\xf8\xab>:>\x19>\xfa\xd8E>\xc0\x12\xcd>\xf6v7\xbc:\xbe\x11\xbe\xb1\xc3M\xbct"U>YQ\xa0\xbe\x87Tn\xbe\xbe\xb0\xbc\xbd\x84\x9d\xe4>J\xf1\xcb:h]\x96=\x13@\xe7>"\xed\xb3=\xb7\x06\x01?U\xf2l\xbe\xb3\rh=\x8bX\xce\xbe| \x91>\x83DW=\'\xfeT\xbe\xab\x07\xda\xbe\xd0\xf7\xff\xbe`|k>@\xaa\x1f>\x0b\xa2\x96<\xf6\x97Q\xbe\x1aug=\xafA\x80>\x11w\x84\xbe\xc1\x93^><\xbe\x8a\xbe\xde[\t\xbe\x03\x9f\x19\xbf\x92&\xb5\xbe\x0eY\x9d\xbc\x8a\xaf\x16\xbel\xe8\x14\xbeebi>a\x90\x86>m\xa4\xd3=\xf2\x00>>\xf4\x0b\x80>\xc8N\xca\xbd\xe7\x86\x9a=\x12\xa3\xa0>\xda\xa2\x86\xbeG_\xd9=\x9a\xc9\xa2=\x9f5\x96>N\xfe\xdf\xbe\xae\x8c\x16?\x9ci\x02=\x04G\x8a\xbe\xfd\x9eZ>\xe4!\xa4\xbe]oK=\xf0\x91\xcd>[S\x91=\x9e-Y>\xee\xaaw>Y\x81Z>\x89R\xa4\xbd@\x99\xa3=#S\xb5>&K\x1d>"\xedB>2\xeb\xc8>^@\x92\xbe\xff;\xb1<i\xb9\x0b>\xe3\x01q=\xe2\x0f\x88<\xe9\x85-\xbe\xce\'9>7\xd0@>>~9>&U)=2\x89R<*\xc6\xd2\xbev\xf5\xb8>\xc7\xfaB<\xd6\xd1g=W\x85\x0e?\xf3U">\xfe\x9a@\xbdC\xf6R;V\xfd\xbb\xbb\x90\xf3\xb5>\x85\xdd#\xbe\xac5\xb1\xbb\x07`\x17=\xbe\xee\x8c=&\xe0\x07>\x1c\xd0+>\xee\xf9\xe3=#\x81E<\r\xc3\x86=\xa9\xadF>A\x1bk\xbd\x8f5\x0f=rL\xec\xbc{\xc2\xd1=V\r{\xbe\xee\x9d\xd6>\\_\xfb\xbc@z\xe6\xbe\xc8ie>\xbf\xd5\xce\xbd\xde\\j>\xe6\xfd\xc8>\xb7\xd7\x1b\xbe{s\xb3\xbb\xf9\xd0\xc9\xbc"\x19\xfa\xbd\xda\xcd\x82>\x8c\xbay>!\x8fs=y\xc0\xf0>\x85\xb2\xfd\xbd\x99\x08\xfd=\x0eg\xfc=\xa8\xf8\x8c\xbe)q\x9e=\x86\xdfy\xbeJ\xfc\xe9\xbeh\x14o\xbe\x90)1\xbc\xd5W\xe8\xbdr\xc5\x0f\xbfq\x0e\xa8> \x90}\xbdg\x87e\xbd\xf1W\x89=n5s\xbe\xe0\xca]\xbd\xcb\x0c\x15?\xe5\x9b\xba=\xda\x9f\x14=\xb2\xe5\xa6\xbe&v\xe8\xbe\x9fe\x98=0G$>\xbd\xb8\xc0>JK\x0e=(}L\xbe\\\xf5\x89\xbddn\x99>\xf1\x0c`\xbb\xd7\xa3\xa5>\xaa\xd6\xdb=\xb64\xa1>/\xe9\t\xbe\x956m>|r\xe3=9\x81l>\xfd\xe9\x1a>\x17\x19\xf6>\xd5e\xb8>%\x1b\xbe=\xa4\x10x=\xc8yU=\x8f\xd9\xb2='
-p1464
-tp1465
-bsV504232939719499777
-p1466
-g2
-(g3
-(I0
-tp1467
-g5
-tp1468
-Rp1469
-(I1
-(I200
-tp1470
-g12
-I00
-S'\xda\x8f\xc0>\x9f\x14\x98=\x15\xc5\xd5\xbe\x8f\x97\x80=\xeb0\x18>\x1b\x99Q\xbd<\xb2\x9b\xbdG\xeer\xbe\xfc\x97 =N\xbd/>\x19\x84`\xbd\x1e\x00\x84\xbdjd\xb3=\x16\x1b\xcd\xbck\xa4\x14>\xca&\xd4>\xbc\xba\xb2\xbd5\xbb\xf6\xbd\xcc\xd9F\xbe\xf5\xb3\xc8\xbd\xa1~\xd7\xbd\x1c\x16\x9c\xbdz\x14\x92>\xef,_=i\x96c=\x90\x9d\xa9\xbdl\xf9\x01>\xe7\xd0\xa5\xbd\x9e24\xbe1\x13\x17\xbe\xb2\xc8\x12\xbe\xe0\xcd2\xbd\x168\xa5<\xb2\x0f\xd8\xbeTJ\xf0=\xee\xaao>\rY\x81>\x1f\xadP>\xf1\xbct> \x06\xa9\xbd\x11\xeft\xbe")\xe2\xbd\xe1T\xce\xbd\x85\xb0i\xbdBd\x9b\xbe\\\x82\xb9\xbd\x8e\xe2\xb3>;\xba\xa6=\xf2\x97\xe7=2n\xdc>E0\x13\xbd+\n\xb9>\x8e\x03\x0f\xbe.\xfb\x89=\xb9\x07\x97\xbeO\xf9\xe1=\xd0$\x1c=\x92:\xa3\xbd/i\xc6\xbe\xcc\xe8\xeb\xbe\x87\xfe\xee=4\xbe\xd6>\xe3\xb8\x8d>e\xd2Y\xbe+\xf1\x9c=_\xdf\x99=Z\x85n\xbeo\x8f\xb4>\xe1<$>\xa0\xa9o\xbe\xd5\xb1\xe6\xbe\xe6@\xe1\xbe\xbf\xca\xba\xbe\xb9\xe5\xaf\xbd\xb5\xea\xd9\xbd\xa5\rB=9\xe5\xe0<\x85\xa7\xdf=&\x13\xa4>O\x1au>1>2=N\xf4\xd3=nc\x9e>&\x10\x90\xbe\x04}\xfa=\xc7\x04a=W\xa4\x8d>\xac\n\x8a\xbe?P\x02?UW0\xbe\xc9\xbf\xb0\xbe\x7f\x0eS>\xc2\x93e\xbe\x8b2\x0e\xbe\xe3M\x82>/\\\x0e\xbd\xc2\x12\xb7>Tc8>\x1a\xbb\xf5=\xafeG\xbe\x8a$R\xbdf\xbdQ>%\x9b6>z\x92\x92>\xbb\xa4\x02?y%P\xbe\xe09=\xbc\xf5v\xa9>~g\xab<\xb6\x08\xa2\xbd\xbbS\xc3\xbe\xee\xb6\x1d\xbd\x833\x90>\x10\x17\x1e>*\xe6\xa9=u\x179\xbd\x96|\xb3\xbe\xb45\x85=<YL\xbdt\r\xa2\xbd\xdc\xde\xf1>\xef\x16\x8f>{[H\xba4\x9e\x0b=,~\xfc<\x16\xfb\x86>l\x83\xd0\xbd\xf2<\n>\x00"~=!>L>\xb1\x85\xfa=\xfb\'(>\xf6\x8eE=\xb7\xc2P=@<\xbe\xbd\xa1\xd5\x17>\x14c\x8b:G\xea\xb7=\xd1\x0f\xd7\xbe\xd0\xbf\xd7\xbd\xe7\xaf\x93\xbe\xf68\x9d>e\x1d@>\xf9\xca\xce\xbe\xd2\x85\x9a>\xc23M\xbc\'E\xd89\xcc%\x16?\xd6\xaf\xd5\xbd.\xb9+\xbbu\xf2e=\xdf\xaaV\xbd \xea3>\xaa\x07\xda=vi\xca\xbc\xec\x06\xd5>jp\x86\xbe\xc2\x7f(<7\xb2\x14>\x1b\x00\xb4\xbeu\xa3\x18\xbe5\x95\x82\xbeT<\xfa\xbej\x90B\xbe \xf2\xfa<\xfb+&=\xa7\xd8\xc3\xbek\xf9\xcb>\xe1e\xbf=\xc2\x8b%\xbe,\xea\x15\xbd\xef\x99\xa0\xbeW\xf0\xa4\xbeQG\xb5>\xc4\xbb]=\x8f\x08\'>@3B\xbeL\xbd\xee\xbe\xaaN\x8c>\xfa\xa5O>\xde\x81\xa4>\x96\xc3\xa6\xbc?,N\xbeZ\x9b\xfd\xbc\xc68\xcc>\x07\xdb\x18=\x1b\xe7\xba>ty\xcc=Un\x87>v\xf4\xcf\xbdjji>\xb5\xdc&=\xac\xb24>G\x8f\xf7=\xa5\x03\xff>1E\xa6>\x1b\x0b\x91\xbd1\xe9\x9c\xba\x8a\x96\xb7=\xfe%\x12\xbe'
-p1471
-tp1472
-bsV503978561817305088
-p1473
-g2
-(g3
-(I0
-tp1474
-g5
-tp1475
-Rp1476
-(I1
-(I200
-tp1477
-g12
-I00
-S'\xbe\x81>>\x1d&\xbb\xbd\xaa_\x8c\xbe \x8c\x0e=\x1b\x0e$>\xf7\xfa\x82\xbcnv\x8d\xbc\xba%9\xbe\x9a\x91|\xbd\x0bs/>\xc4\xb8\xb7<\xbe~ =\'m\x19>@\x01(=\xb5\xc8\x88\xbd\x1d\xad`>{\x94\x98\xbd\x1c%\x1b\xbd\xf8\x9a\xea\xbdM\x04B\xbc\xf8\xf10\xbe\xfc)\xb1\xbc\x03\xcaa="4\x1a\xbe*\x1a\xdf\xbc\xee6\xa3\xbd\xab\xc8:>\x86R\x18\xbe]\x02R\xbe\xde\xac\x0f=\xdel\xc8\xbd\xfe\xcc\xbe\xbd\xaey\x03>I\x94\x98\xbe\xb0\xde\xb9\xbc\xa0\xa0`>\xe6\xef\n>\xf7\xd8\xbb=&\x03r>J\x8f\xc3<hw\xd5\xbd\xa3\xe4\xf5\xbcM\x10(>\xda\x16C\xbe,\t\x13\xbe\xeeLS\xbd\xf0#\x94>Y\xac\xb3=\xaf\xf5\x93=u\x97\x8b>\xf7\x9e\x9b<\xe6\x07\xb4>\xf0\x10\xcf\xbdY?\x1d=\xbc\xd7\xaf\xbeI":>R\xf8\x90\xbd{\x0c/\xbe\xcd\x83\xaf\xbe\xdc\x19\xa8\xbe\xe2\xf9\x0c>\xb2\xe2\x96=\x9d\xa0/=&\xaaG\xbe#\xaf\x0c=|\x99">|\x7fI\xbe\xf0\'\x08>U>\x0f\xbe\x8d4\xe0\xbd\xdfR\xb9\xbe\xcb\x11v\xbe\xda\x8b\x04=\x18\xb1\xa8\xbdM\xb9N\xbd\xfb\xa6*>J\x91p>Hz\xb2=\xe6\xbb\x18>\x93\xcb=>\x1b\x83j\xbdx\xb1f=\xd4<\x8a>#\xe2Q\xbeJu\x99=JL\x8c\xbb{\xa6W>\xbe\x17\x99\xbe @\xd1>\xb8\xfd\x1c=\xa2\xc3*\xbe`\x84\xbb=\xca\xdc\n\xbe3s\xd89L\x00\xa5>\x15\xb8\xdb\xbc2\xd7\x0e>\x10[\x1a>+M*>2\xfe;\xbd\x9f\xa3\xba=\xa3#y>\xfb\x1d\xdc=v\xcc\x1e>l\x8b\xaa>\xb4\x9d8\xbefY\xa6;\n\x99\x85<\xc0\xd4\\=\x9e\xbb\x88\xbc"\x14\xa2\xbd7\xa5\x04>\x93\xbb\x8d=>\x87\x0e>\xc6\x83\x88:\x9e\xed\xa3=c\xe9\x82\xbe\xae\xa1V>\xcd\xcbZ;\xa6\xd9\x0f=\x95[\xd2>U\x1c\xb6=\x0e)\x03=X(\x97\xbd\xc2\xc1\xd3\xbc\xdd\xc5~>6\xca\x9f\xbdp\xd5Z\xbd\xdc\xd7\x87=z\x18\x01>\xc3\x1cv<\xc5DE=\xd3\x0b\xc3=-\x0c\x16=\xb2\x8e\x11={z\x1f>5n\'\xbd\xca\xbc\x80=\x93\x8b\x8e:#\x92i=\xba^\x1f\xbe_\xde\xa9>\xdd\x0e\xe9:\x97\xa6\x81\xbe\x10A\x19>\xce\xad\x07\xbdt\xb4\t>\xddE|>K<\x07\xbe\xc6d\x88<\x80\xcb\xab\xbdN\x19\x0e\xbe\xbc\xd8.>i\x1c;>\x80\x92\x8b\xb9\x11l\xa2>\xfae\xe2\xbd\x93:\xd1=\x90\x98\x95=\x80\xbaf\xbe\xf2^\xa6=J\xee7\xbe\xb8\xe0\xb4\xbe\xf24\x03\xbe\xda\\\x96\xbc\xc3\xa1<\xbd\x986\xad\xbe,\x02\x81>\xd8\xf4\xf0\xbd\xa7\xba\x92\xbd\xd0r\xe3;\xf2\xfa,\xbe\x06\xcf\x11;\x9e\x95\xb6>\xa2\x12\x8c=\xe0O\x87\xbc\x03 \x80\xbe\xf6C\\\xbe\xad\xb0\x9e=vT\xa1=\x9b`\x83>\xb0l\xb2=\xf0[\x06\xbeV0\x9f<\xe3in>\x86;\x04\xbb3\xfa.>\xd9\xd1\xbb=V\xbe\\>eG\x11\xbed5">3\xcf\x8d=\xf3\x10\xd5=\x8b\xea\x9a=\xfeA\xab>\xa0\xc1c>\x0eJ\x1d>#\x1b|=)\xef\x85=\x9dF\x19='
-p1478
-tp1479
-bsV503965415605673986
-p1480
-g2
-(g3
-(I0
-tp1481
-g5
-tp1482
-Rp1483
-(I1
-(I200
-tp1484
-g12
-I00
-S'4\xf9\xff>\x14\x05\x83=A\xd5\x04\xbf\xdc?\xb5<\xeci\x84>l\xca\xab\xbdL\x8b\x89\xbd\x03]\xa8\xbe\xa1[\x85\xbd\xab|\x87>\x14\xf3\x88<\xf2\xdfD\xbbz\xee >\x8e\xc6Q=\xcc\x0c\xa5\xbd\xf6r\xd0>\xb3C\xdf\xbdR\xc3\xff\xbd\xe2XA\xbeec\xda\xbc\xa8\xca\x83\xbe\xa9\x98\xad\xbc\x0b\xc5e>\xd2xW\xbe&b\xd4\xbc\xd6\x85\xa9\xbdR\xe1n>T\xfdb\xbe\x8co\x9c\xbe\xe4w\xa8=\xc7\x97\xe1\xbc\xc0\xa7+\xbe\xbep\x15>\xa0\xd0\xc1\xbe0e\x87=s\xed\xc6>\x99\xd7\x80>\x94\xdeW>@\xb0\xd8>\xb6t\x82=\x06P\x0b\xbe\xa00\xbd\xbd9yu>\xe7p\x9e\xbe\x87\xf8l\xbe\x17\xe6*\xbd\xbb/\xf5>L=T=g\xfb\x9e=\\1\t?\xeb=\xf3;\x05\xc8\xfe>-K[\xbe\x99\xe0"<c\x9a\x0b\xbf\xc4(W>\xb7{\x1c=\x08\xad\x9f\xbd\xce\xed$\xbf\x91\xaf\x0b\xbf\xd7\x83\x8c>.\t\x94>\xfc\xcf\xb8=\xfac\x91\xbe$>{\xbd\xd0\x8cv>\xbf\xfa\x85\xbe}a\xad>\xe34-\xbe\xa64C\xbe\xf9\xae.\xbf\x9a\x87\xe2\xbeO\xd3\x11\xbe\xa2\x9d%\xbe\xfc\xa7\t\xbe3\xd3V>|\x98H>\x03z!>\\k}>\x12\x89h>6S6\xbd\xd2\x0f\xe4\xbb|@\xc1>j\xe3\xb2\xbe\xca>J>\xd04\xbf=\xc2\xe3\xb6>\x8b\x86\xcf\xbe\x87\xd4\x1e?\x9bN-<[$\x80\xbeP\xc6b>\xcd\xa3\xb0\xbe\xbbp\x8d\xbb>\xcc\xd4>\x8b \x1c=\xc8,\x8c>\xfb\xb3\x97>\xde\x0e\x17>S\x88\x13\xbe\x9e\x9aR=\xde\xf6\xb9>G\x86\x1c>\xfe\xfb@>D\x06\x0f?D`\x96\xbeKT\x8e<\xd2\xb0I>\x04\xc1\'=\xa5z\x99\xbc\x19\xb5\x8e\xbeU\x00\\>g\xc6\x9b>\xe1\xde\x81>/\r\xb4=\xb7+\xe2\xbc\xec\x9d\xca\xbe\x9d;\xa7>\xa0GK=ju\xa8=\x93\xe9\x1f?D\xf5E>\x86\xbb\x83\xbd1\xde\x8a;\xb1\xaf;\xbd.\xe8\xa5>\xd2X%\xbeK\xaf\x98=R2e=\x19\xea\xf6=\xda\xb8\xc8=\xcc\xc0 >\xaf\x8a\xb2=\x14\x13\x16<\x9c\xa3<<|\x07\x86=\x17\xf2n\xbd\xa3\x137<5f\x01\xbe\xc1\xce\x80=\xa7\xe3f\xbe\\\xa0\xc0>\xda\xf4\xa5=\x00Z\xe3\xbeU\xae\xc7>\xf1h\xa7\xbc\x0f\'B>\xe5\x10\xfb>\xe5\x1a"\xbeTK\xd5\xbc\xdc\xc3\xa9<\x8d}0\xbe\xbfc\xa5>\xc9\xfe\x87>@Q\xa6\xb927\xdc>M\x95\x13\xbec4\x02>\x82\xce\xda=V\xc0\xb9\xbe\xab\n";\xb9\xd7\xa7\xbew\x8a\x00\xbf\x9b\xd5^\xbe<\x16#<\xa1f\xa2\xbd\x18\x9f\x01\xbf\x15P\xcd>6o&=R2\xe2\xbd\xca\xf95;\xbb\xfc\x91\xbei\x18\x1c\xbe\xd8\x84\x16?n\x94\x96=\xac=\xc2=\xac\x91\xc9\xbeY\n\n\xbf\xe5\xf8\x8b=SNL>&s\xaf>\x85w\x87\xbbu\xe4k\xbe\x0b\x80\xf7\xbd\xbfp\xcc>sy\xc7\xbb|\xbb\x8d>\xbct\x8a=\xee\x12\xba>\xf9=h\xbe\x10\xdfv>>\x1c\x8e=>\tf><\xa5\x87>\x8d-\x12?[3\xea>R=\xed<]\xb5\xad=\xc6\xc4\xa7=%\xbb\r>'
-p1485
-tp1486
-bsV503962938789482496
-p1487
-g2
-(g3
-(I0
-tp1488
-g5
-tp1489
-Rp1490
-(I1
-(I200
-tp1491
-g12
-I00
-S'\x12\xcd\x13?\x1e\xbe\xc7=\xa5\t\xeb\xbeeW\xe4\xbd\xd0\xb0W>\xd7#)=\xdd\xe4W\xbc[hP\xbeEi8=\x96U\xdd>\nX1\xbe\x97\r\x0f\xbeS\\\xbd=;\xddQ\xbeQ\rN\xbd\xf4z\xb4>J\xdb\x9c\xbd\x0b\x0e\xdf\xbdRm\x96\xbe\x13U\x1e\xbet \x83\xbeZ&\xd2=[\x8d>>\x0e\xdc\xca=\xec\xff\x0c>\x9cIf\xbe\x07N\x92>\xa8\xb9;<{3\xcc\xbe2\xd0\x89\xbe\x93\xd4\xab\xbc\xd1\'\x99=\xa6J\xba:v\\\x0c\xbf\xa5\xaeg=\xafP?>\x90,\x8f>R<f>IN\xd1>\xf6\xb8+\xbe\x9bw\x96\xbe2\xe5&\xbd\xcd\x1f@>\x8e\x1f8\xbe\x1anT\xbe5\x805\xbe\x7f\x86\xd9>\xb4\x86\x06>b\xe4\t>\xafL\x16?\xd6F\x82\xbd}\xab\x1c?\x96\x85\xb2\xbe`\x10,>\x99\xfd\xef\xbe\x94\x9b\xf0=\xcc\x83\x17>\xe2W\x80\xbd\xd1\x8a\'\xbf\xf9\xa2\xf5\xbe\xc5\xf3\x96>\x1dd\x0e?\xff-\xbe>]\x1d\xeb\xbd\xb0\xe3\xff:\xa7l;=#\x87\x9b\xbe\xfc\x92\x03?\xe6p\x11>L.f\xbe\xdf\xdf\xf8\xbe\xf5R\xdb\xbekF\x04\xbe\x0e\xc5\xfe\xbd%&\x1e\xbec\xa0\x1f<\x18\x0b\x1a;\xf6\xb8\x00>r\xb8\xa4>\x811J>\x99\x91K\xbdi\xcd3\xbd_\x01\xf0>z\x0f\x91\xbe\xed\xd6\x8c<\x9b9\xa0;\xb8\x7f\x97>"\xb9\x92\xbe3\x17\xfd>\xcb\xd7\x13\xbeH\x19\x96\xbe\xde\xf8\xac=S&~\xbe\x82\x08\x95\xbet\xcb\xaa>\xe1\xc6\xaf=\xd8_\x9b><\x03\x81>y\x93\x18>j\xdd\x82\xbeJ=\xe79RkV>7\x1a\x85>q:\x1b>V%\xa2>\x06\x04\x89\xbejm\xd0:\x9f\x11\xce>\x9c\xab";W\xecb=\x1b\x15\x16\xbf\x04\xd5e\xbd\x9aO\xaa>\xd0h\x1d>\xc5\\\x82=)\xb8\xac\xbc\xabZ\xdf\xbe\x99\\o>\x0e\xc3\xcb<\xf5\xd4Q\xbcI\xb1\xf4>\xd7^n>5\x82\xe7\xbd\x04"I>\x01\xe8X=\xc3]\xa8>\xcd\x8a3\xbeO\xd6\x86=\xfe\xc0\xcf=P\x92\x1b>\xe9$\x17>E\xd1$\xbb\xdb\xc0n=\xd9\t\x91=\xf2zI=\x9e\x81\t=\x06oH=\x8d\x0bz=\xc9!\x97\xbe\xbbP\x18\xbds]\xa7\xbe\xe4\xd1\x80>\xf0JU>\xa7\xc1\xf0\xbe\x7fE\xd5>\x05\x92N>\xdd\x7f\x17>2\xd2%?\xb3\xad\xb9\xbds\x80\xa2\xbd\x9a\x98\xc3\xbd\xc88X\xbe" \x80>Vc\'>$#\x9e\xbc\t\x8f\xed>T\xf7\x9b\xbe\x9e;\x99=\xd3r\xad=\x11\xc8\xf6\xbe\xec\xa1T\xbeVl\xad\xbe5\x7f\x1a\xbf\xf2\xc7\x9d\xbe\xb0"F>\x0f,\x86\xbdE\xfd\x10\xbf\x963\x9f>X\xf1\t>\xdc\x94\xa7\xbd\x1a\x06\xe4<\xd0\xce[\xbe\xc9\xf0\x88\xbe\x07w\x1b?o\x89\xab=\xbc\x823>\xef%\xa6\xbe\xab\x0b4\xbfs\xa8\xca=zP\xd5=\x88\xa1\x8a>\xcc\xdc\x84=\xe4\xf0\xb9\xbe\xcc\xf11\xbe\xac@\xed>fn\x89;,\xb0t>9\xef\xd1=\xc3\x0c\x90>\xec/\x87:\x04\x07n>\x84\x80\xb0\xb93|>>\xa6\xf4S=\x9841?\xe0\xa0\xaa>\x84D\xaa\xbd\xe3\x19\x8f\xbd\xed\xc4\x14>z\xb5\x13='
-p1492
-tp1493
-bsV503965317471936513
-p1494
-g2
-(g3
-(I0
-tp1495
-g5
-tp1496
-Rp1497
-(I1
-(I200
-tp1498
-g12
-I00
-S'$\x88\x12?\x18r\xd6=\x03\xc9\xe2\xbe;#\x12\xbd5\x90s>}\x85\xbe;\xd0\xb4\x82\xbd\xa8\xb2\xac\xbe%\xa5P\xbd\x8d\xa0\xbd>\xab\x00M\xbd\xd3\x88\n\xbe\xedX2>\xdbZ\x01<;\xc3z\xbd+A\xf0>W\xaf\x19\xbe\x8f\xca$\xbe\xc8\x98\x80\xbe\x86\xd7\x11\xbe]\xf0D\xbe\xd0t3<L\x15[>\x00e\xa5\xbbs\x1b\x90=\x9dh\xe2\xbd]\xddO>,\x0e-\xbe\xb8\x05\xba\xbe\x14\xb1\xfc\xbd\xef\xa61\xbe3F\xcd\xbd\xcfS\xf8=}\xbc\xf6\xbel-\xe6=\xa9T\x9c>\xa9\x91\xa0>\x18\x90C>\x8b\xd1\xb8>[\t\x0e=K?7\xbe\t\x7f"\xbeI\xfe\x1f>\xdc\x92\x8b\xbe\xc3\xe1r\xbe\xab6\x88\xbd5\xfd\xf1>5f\xe9=3k\xef=\x17\xc9\x18?]-u\xbd\xa9*\x0c?Lb^\xbes\xf0\xa2=\x02q\x11\xbf\n\x89\x0e>\xc9N\x11=\xad\x97\x17\xbd8J;\xbf\x10\x9e\x14\xbf-\xb6\x94>m\xf8\xe0>\xfd\xfe\x95>\xf8\x05|\xbe\xd2\xb7\x9c\xbd\xe8J4>\xffn\x90\xbe\xfd\xff\xdc>\x1d|\x14=\'\xaa\x93\xbe\xac\xa5\x1c\xbfD\xfd\xed\xbeM\xa4B\xbeT\xb4\x1a\xbe\x19G\xe9\xbdXb\xc8=\xd8\x9a\xb5=l\x9eV>\x03C\x93>\x9fl\x84>\x0c\xde\x99\xbbQ4X\xbd\xbf=\x06?O7\xad\xbe\xe8\xcd8>5\xd1:=\x83!\xb7>T\xcc\xb1\xbeu"\x1a?\x85\x1f\xb6\xbd\xef\x8a\x92\xbe\xdb\xd9\x10>\xdd\xec\x98\xbe\xd7\xe6\x15\xbe\x9d\xd6\xc7>\x84\t\xe4<)!\xa3>I{\x9c>\xc9\t\xee=i6/\xbe\xed\xbc\x02<,E\xa6>\x8c!p>\xc3\xc7N>\xce\xb3\x0f?\x1c\x19y\xbeGw\x1d=\x1f\xd6\xa0>\xfd\x89\x7f=+\xdb\x9d\xbcc;\xdd\xbe\r\x96\xff=\x0bf\xa2>\x97yL>\xec\x89\xa2=\x0b\x11/\xbbX\xd0\xc6\xbeh\x98\x8e>M\xc40=,9\x08=\x05\xf0\x17?\x8c@u>\xf5&\xdc\xbcU\xda\x08=s\x1cS\xbd\xe9\x82\xa0>Mc\x0c\xbe\xb8\xf9\xb9=8\x89\xf7=\xe5\x0f>>\xec\x166=\xe8j\xb1=\x8b\x88\xbc==`&=\x90\x072;\xc6\n\x86<\xbd\x068\xbd\x90sz\xbb\xf0\xf6x\xbep\xd2\x17\xbd\xd9P\x97\xbe\xea\t\x9d>\xaf\x8bf>\xf0s\xe0\xbe\x9d\x18\xee>%\xc5\xe7=\xd2\xf9\x12>`\xac\x16?\x99\xa0!\xbe\xd5w\x00\xbd[SL\xbdsIL\xbe\xd0\xdc\xaf>\xec k>\x8cB$\xbd\x1b\x02\xda>\x80\xeaa\xbe\x03\x0b\xe1=\xd5\x96\xdd=\x03\xff\xe3\xbe\xa9\xc9\x00\xbe\x13\xe8\xb0\xbe\xecb\x13\xbf\xcd\ry\xbeu0\x97=\x13\x99\x18\xbd\xcc\x14\x02\xbf\xe3`\xcc>\xb9\xb4\x92=\xd0\xd2\x13\xbem\xcd\xbd\xbc\xcc+\x9a\xbe\xfc\xd3W\xbe\xe7\xe3\x13?\xbb\x8f\xec=\x80\x0b\x17>@d\xd6\xbe4\x03\x16\xbft\xf5\xf0=\xeb\xc3;>\xd8\x89\xb8>\xf7\xd1\x91<\xd9\xcb\x94\xbee\x90\xee\xbd)0\xf7>\xdb\xb5e\xba[Sk>\x90C\xd2=\x87:\xa7>B*#\xbe\xa7x\x92>\xac_0<\xa7}D>s\x90O>\xf5\x17+?\xd8\x0e\xd0>\xe0\x037\xbc\xb0cs=\xe3\xbaI>\x1f\x8a\xc6='
-p1499
-tp1500
-bsV504167252782874624
-p1501
-g2
-(g3
-(I0
-tp1502
-g5
-tp1503
-Rp1504
-(I1
-(I200
-tp1505
-g12
-I00
-S'\x9bO)?\xa5\xbft>K\xd0\x0f\xbfJ\xc6/<\xdfrE>\xaap\x95=\x07\xed!\xbe/X\xaa\xbe\x11\xbb\xa5=\xfaO\xf1>\xc9\xcc\xcc\xbd\x8b\xb9Z\xbe\x84vU=\xd9\xd8 \xbd\xaf\xf1\xbf=\xbd\xae\x0c?\\\xe2W\xbe\xc9w\x87\xbeWO\xa7\xbe+Ff\xbeF\xa0\x14\xbe\xa2\xd4e\xbd\x96p\xba>y\xd5\x82>Q+\xb4=\xae\xa1\xd1\xbdO5U>4\r\xdf\xbd{1\xb9\xbe\x1e\xb9\x99\xbe\x86\x7fX\xbe;D\xd4\xbd~\xd2\x06=\x9fw\x16\xbf\x07\x91\xef=\x05\xc6\xdc>\x11\t\xcb>&\ns>q`\xc3>\x87\x85\x1e<\x04\x8c\x99\xbe&\xe3P\xbe\xf7\xce\x05\xbd6c\xf4\xbd\x96\xf6\xb7\xbe\xcc*\xc3\xbd\xe2\xd1\x1c?)\xd9">\xca\x017>P\x9f>?5\xff\xde\xbd\x1a\xa9\t?.T|\xbe\x0c\xc3\x85=;?\x1a\xbf\x10\x1f\xff=\xd7\x9f2=\xa7\xd6R\xbc\xa2\xfdH\xbf\xf6i3\xbf\n\xc4\x8b>\xd0\x0c8?\xff,\xd8>\xe9\xe8\x93\xbe.\x8d:;\x80"\xf6=> \xe2\xbe9\xef\x19?\x9f\xf46>&\x8a\xb5\xbe\xcc*#\xbf\x9ct\'\xbfI\xf3\xce\xbe\x892\x16\xbe\xfe%9\xbeL\xd9\xba;/\x1cz<5\x05D>i\xaf\xdd>i\x90\x81>\x86\xd7\x97=)\xbd\xe9<\xca\x12&?\x95\x81\xec\xbe;\xc6t>L\x1cl=5q\xc5>\xcb\'\xdb\xbe;k+?\xbc\xde\x11\xbe\x9f\xb5\xe8\xbe\xb4\xf7|>d2\xb5\xbe[s"\xbe\x15P\xc8>@\xe8\xa1\xbd\x91\xb3\xd5>\xe9\r\x96>\xab~/>\xfc\xd2y\xbe\xb6n\x1b\xbe\xfe\xc4\x9c>@\x10o>\xb4\xf5\x8d>/\x01"?\x86m\xa6\xbe\xfeNf=\x80A\x06?\xbe\n\\=\xecA\x00\xbe\xd0_*\xbf \x84\x96\xbd\xb9\x18\x01?\xa6v\\>\xfe/\x80>[?\xbf\xbdl\x0b\xf4\xbe\xe5&4>\xf5\xea5\xbdl\xaa\xb8\xbd\xbe\xc9*?e.\xb3>.M\xd1\xbd\xea\x06\x87:R\xe0\x9a\xbd\x1c\x02\xaa>*\\\xa1\xbd\x80e3>\x0c\xdb\x17>\x9c\x0e\x0e>\xce)\x19>U/>>,\xda\xa4\xbc\xda\x86\xe7<\xa7[-\xbe\x1ecg=\xaa\xed\x8b\xbc\xe5\x9f\r=\xa2k\x14\xbfT\x80\xa2\xbdQx\xad\xbeO\xa6\x88>S\xc3\x89>\x8a\xc9\t\xbf\xec\x8c\x05?\xd0\x17$>\x97\xba$=\xbc\xc0W?\xf6\x8d6\xbe\xfek\xa6\xbc\xaai\xc4;\x0e\xa63\xbe\xc6W\xba>\xdf[z>\xf6\xce\xeb\xbd\xba\xc7\x0c?\xe5O\xb2\xbe)\xde\xa0\xbc\xd4\xd6E>\n\x82\x11\xbf\x86\x9b\xa6\xbeN\xbd\xbf\xbe\xc5\x1c)\xbfQ\xe6\xa5\xbe,\'\xb2=\x15\xc2\xf6<\xb5n\x14\xbf\xa6<\x08?\xdb\xe9\x15>\xdcq\x11\xbe\x8c\xc3d\xbd`\x94\xad\xbe\xa7<\xc1\xbek\xcb"?\xcb\xa5\xdd=\x05\x9d\x9c>\xa5\x97\xc8\xbe\xc967\xbf\xdes}>\x0c\xd0m>\xcaD\xfa>\xfc~#\xbb\xa9I\xb4\xbe\xf8 \x83\xbe\x15\x99\x11?o\xdcD;\x1c\x16\x96>\xac\xd1\xfc=B\x9f\xbb>\x9f:\xb2\xbd\x7f>\x95>v\xc2\x92<\\\x02\xa1>\xd90Z>\xc2\xc1Q?\xa9;\t?\xdf_\x07\xbeG\xdbk=\xaf\x17\x80>K?\x1c\xbd'
-p1506
-tp1507
-bsV503961873398890497
-p1508
-g2
-(g3
-(I0
-tp1509
-g5
-tp1510
-Rp1511
-(I1
-(I200
-tp1512
-g12
-I00
-S'\xe3\x8a\x9c>\x02\x00\xdd\xbd\t9\xa6\xbe~vP;\xeb\xaa\x95>#p\x97\xbbH\xc6\x98\xbd\x90i\x9b\xbeeD\xc7\xbd\xf39\x93>\xafT\x81=\x99]c\xbdyqZ>\xd1\x8c\xb6=\x16\x8f`\xbe\n\xf3\xbf>\x1e\xcf\xdf\xbd\xb6\x1e\x8e\xbd\xaf\xbbb\xbe\x9e\x08l\xbd\xe0V7\xbeu\xc4\xd1\xbcV\xabF=#\xce%\xbe\x0e`\x8f\xbc?~\xd6\xbd\x11&_>c\x95i\xbe\xa7\xfa\xb7\xbe\xc5\xce\xcd\xbb\xb7\x81\x8c\xbe\xfdz\xbc\xbdI\xf6+>\xef\x04\xdd\xbe\x1fv\x91\xbc\xe9y\xb2>\xfb\xccu>FR\xd5=\xa7\xea\x8e>0\xac\x05>\x1d@\xbd\xbd\xa2\xbc\xae\xbd\xa2\xa4I>\xd5\x1e\x9b\xbe`\xc1A\xbe\xd6D\x18\xbdz\x94\xd6>\x1e\xa4\xd9=I\x15\xdd=@6\xdb>;\x14\x1c={\x11\xf6>B9?\xbe\xb2 ,=\xf9\xa4\x02\xbf \xb7\\>en\x81\xbd\x1f\x042\xbe\x96~\xf6\xbe\xb5z\xfe\xbeW\xb6k>20\x1c>b\x19\xeb=\x10\x996\xber\xf27\xbc\xc5z\x83>\'}\x8b\xbe\xd2[,>\x90\xb3A\xbe\t8\x89\xbe`m\xe7\xbe\xc1\xa1\x90\xbe\xc2 g=Y\xc03\xbe\x03l\xc9\xbd\xdfQY>)\x18\xa4>\x10A8>\xc0S\x08>\xb7g\x8c>q\x8fm\xbd8\x7f\xb0\xbb\xd5\xbe\xee>Y\x80\x8b\xbeU\xbf\xeb=\xa0O\x85\xbc\xa7\xcaT>\xf5\x88\xed\xbe\x8b\x17\x14?/\xcc\x8f=\xba\x1a\\\xbe\xf1>\xa0=\x93\xd0D\xbe[\x0e\x83\xbc\xde(\xf0>\xa2\xff\xf0\xbc_FR>\xc6\xdft>F\x16`>\xedO\x8f;\xc7\'y=\x99R\xad>\xba\xe4/>Y\xcfH>\x85_\xd5>\x8a\xd5\x87\xbe\xeej\xa9=+\xd8\x83=\xc5\xee\x16>\xb3,.=\xa3\x08\x16\xbe\xcd\x16;>n\x0c\xa4= b\xfe=\x7fr\xaa;\xff\xe44>\x80\xc2\xc9\xbe\x0fd\xb4>\xb2\xb3[<\xfd\xe4"=\x8aM\x04?\x05\x9d\x01>in\x1e=\xab\x06\xff\xbd\x89(\xe2\xbd\x8b\x97\xaa>\x02\xc4\x14\xbe\x97\x04\x84\xbd\x8e"\xa2=\xa8G\xd4=\x00^;\xbd\xee:\x87=\xc0\xbd<>\xad\xe5\xc3<\x8e\xe3\xc2=b[4>\x13\x11\xcf\xbda\x83\t=\xba\x03\xb8\xbb\xfb\x8f\xb8=\x17\x0fJ\xbew7\xcb>`\x0f\xad;6\x95\x98\xbe\x08\x85\x92>\xed_\xea<\x99vH>5\x1f\xd4>!\xf12\xbeS\xd1\x9c=ZJ \xbe\x80\xfd_\xbe[\x1e\x9c>&[\x8d>O\xe4\x00=\xb7\x95\xc7>Z\xb1\x1a\xbe\x05\xdf>>\xf5\x03\xe6=M\xea\x96\xbe(\xcb\x90=\xd5\xdd`\xbe\x91q\x00\xbf\xef\xeaz\xbe>b\x9a\xbc\xbe*\x83\xbd\x0f\xd0\x0b\xbfn`\x9f>\x18\xa2U\xbe\xa2\xac\xbd\xbd\xc9m7<\xb9F\x81\xbe\x16N\x17=`\x17\x08?^Z\x06>\xa6\xe1j=)1\xac\xbe\xda\x04\xa3\xbe\xe9x\x00=\x8ey\xf9=Jg\xd2>\xf6%\x13>\x9e\xccL\xbe\xdf\xd0Y<\x82u\xd3>\xbf\xbe\x9e\xbb\xb7\x86Z>+\x0f$>\xc0ol>O\x1e\xcb\xbd;.\x8b>\xc9>]=Ok\xe8=\x80a\xd9=)e\xf9>\xe0\xfa\x8f>\xe0\xba^>Z\xaf\x04>e\x92M>\xaf\xf8\xe4='
-p1513
-tp1514
-bsV503962280304705537
-p1515
-g2
-(g3
-(I0
-tp1516
-g5
-tp1517
-Rp1518
-(I1
-(I200
-tp1519
-g12
-I00
-S'\x81\x0c\xf8>`\xffV;\x01J\x01\xbf\x88\xb4\xd2\xbdtU\x8a>eA\xd8\xbc\x15\xc9\xef\xba\x8d4z\xbe&\xef\x82<N\xfd\x91>\xeb\xc1\\\xbd\xc5\x9f\x19<\x85{B>\xb1\xe5\xb8\xbd\x9f\xb8\x16\xbe#\x19\xa1>\x96K(\xbd\xf8\xddF\xbd|pr\xbe\xd5\xbc\xdf;\x15E\x9b\xbe\xf4\'\xc2=W\x11\x15>\xe9\xe8$\xbeO\xc8\x1a<\x98\x12D\xbe\x0bc\x85>4\xfa\x10\xbe}\xec\xb0\xbe\xf7\xba\r\xbd\xeb\xaf\xde=\x80Z\xca;c>$<al\xc6\xbe+\xbb\x85\xbb\x94\xe6^>w=C>\xef"k>u\xd6\xbf>\xf9\xce\xaa\xbd\xdc\xce<\xbe\xc1R>=+\xc0q>w+\x95\xbe\xbf\xe6\x1c\xbe\xc9)\xde\xbd\xb0\xfa\xe8>\xcc\x97K\xbc\xb0`\x99=W~\x06?\xe5=\x8e=\xff\x86\x0e?f\x08\xa0\xbe\xfb\xc4\t>\xdd\xae\xdb\xbe!Q\x88>\x05\xad\x19>X0\xf9\xbd#\xa5\xf4\xbe\x01n\xf2\xbe\xa77\xad>3\x06\x95>\xf4\n\xa1=\xd9\x83,\xbe\xf0=\xff<\xd3\xb2,>\xd7)\x88\xbe\x03\x1a\xbf>\xe9z>\xbe\xfd\x19\xe6\xbd\x88\xf1\xf9\xbe\xc4\xd9\xae\xbe+\x8ep:\xfd\xc5\xba\xbd\xbd^H\xbe\x0f!\xdc=\xf3\xed3>\x87\t\xf3=\xa33,>u\xddH>os\xaf\xbd\x13\\B<\x8f\xdb\xb6>#\xccd\xbe\x19\xc2\xae=]\xb2\xff=\xeb\x94\x85>\x8c\\\xac\xbe\t\xdd\xfb>\x93\xf8:<\xe2\x18\x95\xbe\x0cK5>M\xd8\xa0\xbe\xe7\x01f\xbd\x04\x01\xb2>\xd1\x17\xa2=\x8d\x82B>$P\x88>S\x86<>\xb3F\xff\xbdY$V=\xaa.\x82>\x05V9>Y\xb2B>\x9c\x99\x8a>\x89+\x84\xbelc^=]B\x82>\xf0\x0b\xea<\xa3\xaf\x01=\xab5\x99\xbe\x90!\xb7=\xfd\xd5R>U\xb2\x00>\x8d3\xce<\xb5\x00\xee\xbcKU\xc9\xbeq\xd5\xa7>\xf5\'\x11;\xa5a\xca=\xed\x8c\x02?\xcb\x81\xff=}4\xe6\xbd\x14\xe7\xd0=\xc5\x144=\x81*\xb7>\xdb}+\xbe\x18\xeb\xea\xbcP\xe5\xef<\xf8\xf1~\xbc\xb6?\x14>k{\xef=m\x1e\x8c=\xd9\xed\x8a=\x84X\xc1=u\x88!>\xd4_\xa8\xbb\x7f~\x02=\xbfm\xac\xbdyQ\x9f=]\xe5n\xbe\n\xef\x88>\xfd\xe53=(\x92\xdf\xbe\nC\xa2>\x808)=\xf3\x18\x82>\x0c\xb6\xd2>\xf8n1\xbe\xcd\xc1\x7f\xbd\x85H\xa6\xbd{\x00\x1f\xbeg\xed\x91>s\x0cg>\xd8\x90<<mf\xdb>\xa9\xe6\x10\xbe\x17\xef\xb7=\xd9\xed\xac=\xbf\xba\xa1\xbe\x01\\\xaf\xbc\xd8\x95c\xbe\x0b\x01\xda\xbe\xc7t\x86\xbe\xc3\x1b\xcf=\xab\xbf\x17\xbe\xf9\xc8\x0c\xbf\\\xa6\x92>\x19\xef\x8b<q\xb6\x99\xbcmN\xe5=\xe8\x1f\x0c\xbem7\xad\xbd\x1e\xb2\x1a?_\x92\xaf=\xdd`\x7f=Q\x9e\xa9\xbes\x1d\x0c\xbfH\xfa\xd3<c\xb0\n>\xe91\x99>%\x84\x1c=\xf9^\x97\xbe\xd9\xb8:\xbe\x87\x8e\x91>\x1f\x97\x17\xbd\xd3\x18\x90>K\xe1\xfb=-w\x8f>3\x82\xf6\xbcq|S>t\x1a+=\xbd?_>\x01\t\x8f=%\xa9\x0c?`Z\xa8>8\x9e\xe5<\x16F\x97\xbc\xf1\xf5\x88=Od\x12>'
-p1520
-tp1521
-bsV503979016958013440
-p1522
-g2
-(g3
-(I0
-tp1523
-g5
-tp1524
-Rp1525
-(I1
-(I200
-tp1526
-g12
-I00
-S'\x9c\xf0#?\xe1\x85Z=\xd2\x96*\xbf]n\xd3\xbdt\'\xa5>\xe6\x11\xae\xbc\xe8iH\xbc\xf6\xaa\x8c\xbe\x96\x93\x94==\x1f\xae>\xd0/\x13\xbd6-\x1d=\x80\x16[>\xd8\x0e\x83\xbd\x18\x1ea\xbd\xdbU\xef>\xfe\xef\x88\xbd\x90\x08\xd3\xbd\xa4\xde\x9b\xbe\xb9\x15$\xbd_\x16\xb5\xbe\xc6N\xde=\xbb&\x8f>"A\x8c\xbdQ\xd0\x1f=\x8a\x80\x80\xbez~\x87>\xd174\xbeQ\xd7\xb4\xbe\\8\xd8\xbda\x02\x15>\x9d\xaa\x08\xbc\xb9M\x85<\xfd%\xf8\xbe\xe1[t=.n\x7f>\xb3\xf8\x8a>\xfc\x1a\xa9>\x83\xd5\xda>AL\x1d\xbe\x00B\x89\xbe\xdc8\xab;\xbe\xa6U>X\xa5\xa4\xbeY\xb7>\xbeS[\x0b\xbe\xcb\xb5\x14?m\xf2?\xbdW"\xe7=`n-?\xb1K`=\xbcs4?\x0c\xed\xb9\xbeR\xdeL>\xb8\xe8\x07\xbf\xbcS\x9b>\xe2i.>\x15\xca/\xbe\xc3\x14\x1a\xbf\xf88\x18\xbf\xe7)\xc3>\xc1\xe1\xee>L\r\xea=\xb4Pb\xbe6\xf6p=\xa2\x1e\x04>\xac\xce\xc3\xbes\x0e\r?\xc26\x07\xbe\xc8\xd0 \xbe\xcaM\x1f\xbf\x18\x1d\xe0\xbeS\x02\x04\xbeV\'\xc5\xbd<\x7fq\xbe5g\xd8=fs\x18>Y\x97\xdc=\xe0Ik>!\xac}>-\x8a\xc1\xbd3\xee =gS\xd6>\xd8\xea\xa5\xbe\x04\x1c\x11>u\x13?>\xb6\xb0\xd1>\x05\x84\xca\xbe\xa9\x1c+?\x8d\r\xae\xbcvD\xda\xbe\x04\xf5z>\x18\x97\xda\xbe\xce\x80\x95\xbd\xa3\x0c\xe7>kb\xd1=6\x17\x86>t\x00\xa7>\xf7oO>^\x06s\xber\xa2\x11=\xf4\xb3\xa2>M>s>\xa4/\x80>;\xbb\xea>;\xb4\x8c\xbe\xec\xd0g=\xfeE\xbc>,z\x9c\xbb\xce,\x86\xbc6\xa1\xea\xbeN\xe2\x9c=\x89\x9c\xa6>\xc0\xa8\xf2=\x95\xeb\x9a<T8\xb0\xbd<\xb2\xf3\xbe\x8e\xc8\x9f>n\xa6\xa6;Iw\xba=,o.?\x99\x12@>\'\xb9\xcb\xbd\xff@\x1a>ka\xca=8\xc2\xe0>\xca\x8e)\xbev<,=1R+=T\xdc\x10<\xd8ov>\xdf\xbf\x0e>\xae\xad\x0f=\xd2kb=\xc1\xfa\x9c=\xa0\xbd`>H\x7f\x18=\xc9\xd1m=G\x11<\xbePJ\xf0<n\x0b\x9c\xbe\xc4\x90\xa6>l\x83\xce=\x0e:\x0c\xbf\x0b\xd5\xd3>\x9e\x1c2=\xd2\tm>J\xbf\x0b?_\xa9K\xbe\xcf\x8f\x81\xbd3\t\xeb\xbc\x81\xed!\xbe\xfe,\x9d>\xdaPJ>G\x8c\xd6;\xef\xb9\x0c?\x0c\x17c\xben\x9a\x84=\x10J\x19>\xd9\\\xd8\xbeg\xedn\xbd\xb4\r|\xbe\x03\n\x02\xbf\xc7I\x95\xbe\x90\xc9\x10>\x03\x0f\x17\xbe\x02\xa2\x1d\xbf\x92\xb2\xdb>\xe4\xefa=\x88\x98\x9c\xbd6f\xed=\x18\xc1\x1f\xbe\xe2\xc9L\xbe\xba\xd8@?\x98\x85\xc4=\xad\xbf\xcf=\xe5\xde\xc3\xbe\xa0S6\xbf\xf0\\\x1d>\xa5M`>\xf4\xb2\xcc>\xd9e\xcf\xbb\xa0\xee\xae\xbe\xd0fH\xbe\xe8?\xb2>g\xcc\xdf\xbc\xb4\xb7\xb8>WG\xf9=\xff\xe6\xa6>\x9b\xb4\x0b\xbd\xf5\xd4\x8c>\x05-3=\x18b\x87>\x0b\xb7\xd4=\x8cj6?\xaa\xdb\xd2>\x08#\xcc\xbc\xf6m$\xbd\x91\xef>=\xcbE\x04>'
-p1527
-tp1528
-bsV503976139900346368
-p1529
-g2
-(g3
-(I0
-tp1530
-g5
-tp1531
-Rp1532
-(I1
-(I200
-tp1533
-g12
-I00
-S'\xc7\xb1\x0e?Z\xf7\x08<\x13\xb7\xf6\xbeEH\xab\xbdh\xf3\x82>\xa2*\xe2\xbcR\xbd\x02=\xa1\x88\x8e\xbe\x87\'\xc5<\xf7_z>\xd1Pw\xbd\x1b\x7f\x8e\xbd\x93]r>sf-\xbd\x99$\x8f\xbd\x82\xad\xef>_]\x8a\xbde\xeb\x98\xbd\xe8y\x92\xbe\x02L\xbd\xbd#\xedS\xbe\x18\x1d^="\xd6\x82>4K\xc9\xbcPt\xb1=\xeb\xbaN\xbe\xd9\x81\'>G\xf9\x17\xbe\x8f\n\x93\xbe\x8fD;\xbe\x8c\x97\x84\xbd\x04\xa4\xe7<\xf1Z\x81<\xba\xbf\x01\xbf\xaa\x8d\xd7<\xd0\xadD>\xa3D\x95>\x8f\xbc\x80>\x8cp\x92>@\xeb\xe2\xbd\x12 \\\xbe\xd7`\xe7\xbc\x0b#\x8b<\\xz\xbe\xb5\x07x\xbe\xf2\xdd\xdc\xbdR\\\xd3>\xb5\x8cI\xbc\xdb\x16\xc2=\xd4\xd9\x14?8K\x12<\xd0W\x10?\xce\xa8\x9d\xber\x14:>o\x98\xa3\xbe\xe8\xe4I>\xab\xe1\x11>!\xfd\x01\xbe\xeb\\\xd5\xbe\xa9\xfb\r\xbf\x91g\x8c>\xb1\xb7\xc8>-\x9b`>+\xf7\x19\xbe\xe4\'\xba=\xf2\xb0\x08>\x1fR\x81\xbe\\\xca\xd1>\xd1\xff\x00=^E\x98\xbe\xfa,\xe5\xbe\xe2j\xba\xbe\xf7\x1e7\xbe@\x08\x12\xbe\xa8\x00:\xbe\x03R\x15=\x1c\xd8j=\x12\x12\xdf=\x1eMf>\x19&\xa1>\xfe\xcfc\xbdcb\x11=\xff\xf6\xcd>\xde\xcbn\xbe\x7f\x82\x95=\x0f\xf0\xd4=m"\x9a>\xbc\xaf\xb6\xbe\xc8u\x17?E\x183\xbe\x80\xf4\xc9\xbe\xf7\xf7\x10>y\x92\x9f\xbe\xf8\xc8\x13\xbe4\xa5\xb5>\x08\x0b\xf5=\xa1\x84\xa6>{\xcb\x83>\x17\x1c\x19>\x98\x1d0\xbe\x06\xeaa\xbdB\x80r>&{\x82>\xf2\x8a\x8d>\x9d\xb8\xc1>\x0e\x9bW\xbe\x0f\x8c\x99=g\x80\xc0>\xe6jW<\xe4$\xdc<\xd9{\xd1\xbe\xfb\xc1\xbc<\xda-f>U\x85?=\xec\xc5\xe9\xbb>H\xc0\xbc\xd8B\xe1\xbe\xa0Oz>\x05\xbb\x9d\xbbj\xd1\x19\xbd\xe6\xdd\x05?\n\x8aX>kV\xcb\xbc\xe2Y\xf5=\xcf{x=\xe76\xcc>\xed@3\xbe\x00o\xae=\x9f\xb9?=\x9d-\x87=\'\x15\x11>$\xbd\x03>$-\xe3=\x9aME=M\xe8\x93=\x85\n`>&\xc4?;\x1e\xa5\x9b=y\xca\x96\xbeyu\xd0\xbc\x88L\x9f\xbe\x0cb\x96>\x05;%>\x00"\xf1\xbe\xc5=\xca>\x004\xce<"\x1d\x05>M8\x12?\xf5s\x00\xbeb\xfce\xbc"\xcf\x0f\xbd\xee\xd7\x90\xbd2\xa6\x8a>h8\xff=GN\x8e=\x12\x0e\xec>\xb3\xfd\x83\xbe\xe7\xf4\xad=\xb8@\x0c>(N\xbc\xbe\x15\x95\n\xbe`,a\xbe\xb8(\n\xbf(\xd8\x9a\xbe\x8d;\n>\x99\x95T\xbd\xd2\xc8\x19\xbf\r[\xa8>d\xb72=\xef\xed\x04\xbe\x0c\xf6\x84=\xeb\x8f\x90\xbeh\te\xbe#^\x11?\x93\x90\xfc=rh\x06>\xa8\x84\x84\xbe;y\x1a\xbf\n!;>\x06\xc5P>\x1d\x9c\xd2>\xc6\xa66\xbc53\x98\xbe\xa2\xa8\x90\xbdp\x94\xc8>-\x7f\x99;\xb7\xc4\xcc>\xeb\x8b$>8Do><N\xb2<\xc5\xf0\x89>&\xbb\'=9\x15d>\xf3\xf1\xf2<\xc2\t\x1d?L\xc3\xa2>\xe0\xc3\xad\xbd\xc0vs\xbdN\x16\xc1=\x8d\xd9G='
-p1534
-tp1535
-bsV503963253903343616
-p1536
-g2
-(g3
-(I0
-tp1537
-g5
-tp1538
-Rp1539
-(I1
-(I200
-tp1540
-g12
-I00
-S'y\x0f\xd2>\xc9$v<y\xd1\xda\xbe\x10_z\xbd\x14\x83Z>\x16G\xbe<\x0f\x9d\xc5\xbb\x89_$\xbe\x06!\xa0<YB\x90>\xa1\xb7\xf6\xbd\xee\xbc\xc9\xbd\xd0\xae\xcc=\x1fI\xc6\xbdS\xa5\x98\xbd\xd1D\x8c>\x10[\xc1\xbc\xb3\xa0\x92\xbaY\xd1{\xbe\x95\xae\xa7\xbd\x8e\x1eR\xbe\xe2\x1f\xe6<0C)>1\xd9\xbb\xbcn\xe4\xcd=&\xe5B\xbe\xbb\x82\x81>W\xaf\xd8;|\xa7\x98\xbe\x00I*\xbe\xf5\x16\x0c\xbd\xcb\xaf`<r\x17\x85\xbb*7\xe1\xbe\x82{W\xbct\xdd<>,D(>7\xddU>\xbap\xa8>{\xe9\x14\xbe\x9fz\x8a\xbe\xbd<v=\x06\xb3">\xc964\xbe\xd0\x81\x15\xbeSA@\xbe/\xdd\xc3>\xbde\xee=\xd6O\x1a>\x1fe\xf4>\xc2\x1b\xd6;\x87S\x03?\xec\xbe\x86\xbe\xc7\x1e\x1a>\x13\xba\xb3\xbetY,>\x9b\x02\xc6=\xda\xdb\x02\xbe\x05\xc0\xd6\xbe\x9c\xc0\xc0\xbe\x1a)\x84>\x91a\xae>*\x94[>{\xba\x03\xbe\x9fy\xc1=\x9a)\xf4<\x9f\xde\xb0\xbe\xeag\x9c>\xdc\xceq\xbc\xa2p\xf4\xbdr\x99\xdd\xbeV\x91\x9f\xbe\x8f\'\xbf;\x92\x01\x80\xbd\xccXE\xbeO-\x18\xbc^\x9b\xd1=)\xe9\xbd=\xd6\xe2f>q1L>j\xc9\x9b\xbdy\xd5\x04<\x0c\xd8\xca>\x0b\x8a7\xbe\xff\x07\xa7<\x87\x83\xbc=p\xac_>\x80\t\xae\xbeK\x8e\xd6>\x803\n\xbec\xdb\x9b\xbe[\xa0\xb8=U\x83\x84\xbe\xb5#\x08\xbe\xdc\x12q>\xbf%\x0f>\x05\xe04>Y\x11/>\xbd*\x12>\x0c\xca\x1e\xbe\xe4n\x89=o\xceS>e9V>\xa5\xfae>\x9d\x16I>O+\x86\xbep\xae\x91\xbb\x95\xcb\xa6>`\xc9\x12=D.\xea=\x17z\xbb\xbe\x19\xec\x99\xbd\xbdM\x91>\x9d\xa6\xca=F)\xe9<\x80\x8e\xc2\xbc\x12O\xc6\xbe\xae)g>\x93\xe7\x14\xbc\xb4s\xbb\xbcR\x11\xef>P\xb5\xaf=\x0e\x00\xc9\xbd\x0c\t\x1f>\xf9\xab\x9e;>3\x83>\x97.8\xbe\xda\xcd\x8d\xbde\x08\x02>w\x1e\xc9=OR!>\xba3z=\xd0\xef\x9e=\xfb4\xce=\x02\x12n=L7\x07>\x89\xa5\xed<\x9c3\x88<\x0c\x99B\xbe\x05\xac\xa3=\n\x10\x9a\xbe\x93_;>\x06\xf9\xa6=\xcb\x1d\xdd\xbeD@j>\x84V\x07=\x19F\x19>\xe2s\xea>\x8f\xff\x07\xbe\xb3\x97~\xbd\x87\xa3u\xbd:h\x02\xbe\xbf2\x85>b\xe6?>\xe2\xa7(\xbc\x05\xf0\xe6>\xb5qX\xbe\xf1\x88*=\x8bi\x95=\xd3*\x98\xbe\xdf\xc4\xd4\xbd\xf1\x81\x9a\xbe\xd6<\xe8\xbe\xa3 \x82\xbe|\xb5@>e\xc5\xa5\xbdfK\xf6\xbe\\\xb3\x82>\xban\xed<\xfe\xf1\xa3\xbb1\xd9\xa1=\xc9\xdc\xf1\xbd\xb1&\xbc\xbd\xb2\xa8\xe4>\x1a\xc1W=<\xfc\x08>%\x01\x84\xbe\x1d\xed\x05\xbf1k\xca=\xc7\xdd\xa9=\xd4\xb1\x86>\xc7\x1b\x8d=!\xbf\x8f\xbe\x81\xea\n\xbej\xd4\x9a>|\xe4\xb7\xbc\xe1\x0ee>L9\xef=\xee)\x7f>\x92\xff\x08=\xa5E\x85>T\xfd\xa2\xb9V2F>\xcan\x04\xbd\xca\x07\x08?\xe2\x91N>\xb9\x99\xf3<K\x80\xe0\xbc\x01L\xf4=\xcd\xe5\xb7<'
-p1541
-tp1542
-bsV503976864612773888
-p1543
-g2
-(g3
-(I0
-tp1544
-g5
-tp1545
-Rp1546
-(I1
-(I200
-tp1547
-g12
-I00
-S'M\xb0<> O\r=\xa9\xe8K\xbe\xfd\x94\x13<\x17T\xc2=\xafVP\xbc\x95\x92\xe1\xbc[$\x10\xbe\xc9Y\xf3\xbc\xa5\xbf\x16>\x83\xb3\x15\xbc\xbf\x04\x1e\xbd\xf7\xb4Q=}B4<\xa1\x06\xe6\xbc\xcf\xa4(>\xef\xc9o\xbd\x93\x13\x94\xbdP\x8d\xb8\xbdb_\x19\xbd\x94\xe3\xc0\xbd\xe8\xa7\x8b\xbcW\x06\xa1=\xc5C\xbf\xbc3b`<\x80w"\xbd\xf7\xa9\xdf=1@\x8e\xbd\xd3F\x14\xbe\xe3|\xe2\xbc\x11\xd9\x8a\xbdq\xceX\xbd=(m=\xcc\xd5O\xbeT\xb4\xec<\xf5\xce%>\x00\xc7\xd5=`\xc5\xaa=\xce\xc8(>\xf5\xd5@<\xa4\xd1\xa9\xbd$S5\xbd\xd8\xc7\xb4=\xa9\xdc\xe7\xbdk\xb2\xd8\xbd\xc0W\xcf\xbc$\xbc;>h~d=\xd8lY=cQn>\x0fPw\xbc\x17GV>\x07\xe2\xa8\xbdU\x06;<\x00\xee{\xbeE|\x84=u!\xee\xbbO\xe33\xbdi\x13\x96\xbe\xc4]r\xbe|\x84\xd0=\x1cy\x18>\xb7\xf1\xba=\xdf\x1f\xfc\xbd\xf8\xa1;\xbcws\xa2=\x1bE\x02\xbe\xa1\x95\x11>\xcb\x91\xb7\xbc\xe0\xec\xc3\xbdO\xcf\x89\xbe\x11\x9fK\xbe\xadz]\xbd\x84Q\x7f\xbd\xb7\xb5Z\xbd\xae\x8e\x88=\xff\xa5\xa8=W\x16\x8b=\xc1H\x03>\xdc}\xd5=\x84\t9\xbc\x7f*\xff;\x93\xaaR>\xef\xc2\'\xbe\x8b`\x97=\x80\x18\x0b<\x97\xd2\n>{U6\xbeu\x86\x83>\xfb\xfa\x92\xbc\xd8`\xd7\xbd)x\xa6=\x80b\xe4\xbd\\\xaf\x10\xbd\x00\x9a.>\x99\xcf\x89\xba\xb5\x83\xfb=\xfc\xee\xf8=-\x91\x8c=\xc7\x06\x82\xbdJ)\xa6<R\x80\x19>\x05!\x9c=x[\xab==\xadz>X\x8a\x08\xbe\xd4b\xa0\xbbE\xe9\xc6=-\n\x04=\xf4?`\xbc\xeb\x8f\x16\xbe\x81\xd1t=\x9f\xaa\xfb=\xc4\x83\xd7=\xc1.8=a}+<s\xb93\xbe\x9f<\x00>3L\x05<\x88\xf3`<\x166\x87>M\x14\xa3=\xbeJ\x16\xbc\xff\xb0Q\xbc\xb7\xc9\x06\xbd\xfd\x85\n>\xcbsh\xbdl\xb7\xf3<\xd0\xf0]=w\x1e\xa5=!}\xe2<Wi\xfb<\x0f\r\n=\xc5\xa6\x96<\x90\xb4k\xbcP*\xea<&\x97\x07\xbd\x88\x17w<5\x04\x9a\xbd\xa5\x06\x9b<\xbf\x9c\xdf\xbd\xbd\xc9(>@\xe89=L\xf2>\xbe\x9c\xf2.>\x13L\x06=1\x87\x8b=\xc8Kv>\t\x8dt\xbd\x15\xf84\xbc\x9bp\xa6\xbc8\x9c\xbf\xbd\x9d3\x0c>[B\xef=\'\xef\xe5\xbc-\x88R>}!\xb1\xbd\'\x8d8=T\x90I=L\xce-\xbe\xd1\x10\xae\xbc\x9e\xa6\x1d\xbe\x93$z\xbeeu\xe5\xbd\x17\xa5\x0f<\x03\x88\x9e\xbcc2^\xbe\xe8+/>\xa7\x94A<\x97vB\xbdM\x86\x8b\xbcg\t\x03\xbe1\xb7\x94\xbd\x04\xf2o>\x1a\xca\x07=\'\xb5^=\x9c58\xbe\x0fSi\xbe\x0b\x1d\x1b=/\xa2\x81=\t\xb9\x1a>\xbb\x9f\xbd<\xd0\xb3\xf8\xbd\xd3\xaf<\xbd\xf3\xcd@>Y\xdb\x02<$n\xba=Ko,=\x1d\x90!>\xedB\xb9\xbd`\xf8\xe8=\xb5\n\x9d<k:\xaa=\xaf\xfc\xcb=\x97~}>=\xca;>9m\xdb<\x13r\x04=\x1d\x1e\x83=\x08e\xc2<'
-p1548
-tp1549
-bsV503979495872028673
-p1550
-g2
-(g3
-(I0
-tp1551
-g5
-tp1552
-Rp1553
-(I1
-(I200
-tp1554
-g12
-I00
-S'\x8d\x95\x87>\x83\xf6\x11=X#x\xbel\x94[\xbc\xdf\xd4\xf7=<\t\x97<\xbe\xf9\t\xbd\xfaU)\xbe-u\x93\xbc\xd4&`>\x1e\xbeG\xba:\xde-\xbd\xe4\x99\xbf=\xcf*\x17<\xf4\x19>\xbdz\x88`>\xc5\x87\xc2\xbd\x9d\xaa\xb7\xbd\xf5\xce\xf9\xbd\xab!d\xbd\x802\xf6\xbd\xaa\x8c\xdd;\'\x16\xd5=\xb6<\x01\xba\x02\x08\x1e<[\xb1|\xbd\x0f\x91\xfe=\xe7\xf9\xd7\xbd<NA\xbe\xa9\xd8E\xbd\xc8\xcb\x8d\xbd\xc3%\x85\xbd\xeb\xfe\x89=\x86m\x84\xbej\x8a\xb0<D\xbeR>\x0fs$>\x0e\xdf\xb8=\x0e\xbfI>\xc2\x17\x01=\xce\xb7\xad\xbd\x04\xc2\x84\xbd\r\xa9\xd1=\xb2D\x1b\xbe\x90\x07\xef\xbd\xb3\xb9\xc6\xbc\xc8\xa9\x8b>\xf7Wh=\xee\xffQ=\x99\x04\xa0>\x04\xc1\x8d\xbc\x1f\xb9\x94>\x85G\xfe\xbd\xa4\x1f\x00=\'\x93\xa5\xbeE\xd8\xcd=\xba! \xba\x91\xc5Y\xbd\xa5\xca\xc3\xbe}B\x9e\xbe\xf6n\x1d>=\xc7M>L\xff\xd8=.\xf0\x05\xbe\xcd-\xeb\xbc\x94\xc9\x01>\n\x83B\xbez4[>\x04\xf0\x1c\xbdne\x06\xbe\xb3\x13\x9d\xbeS$w\xbe]\x0bi\xbd;\xd0\xb1\xbd\xa5\xfb\x8d\xbdZ\x9b\xa7=\xeaY\xb8=U(\xbe=.2\x0f>\x94h\x00>p\xbdk\xbc6\xf2\xdc\xbby\xb2\x97>>\\U\xbe~\x9d\xd7=\x82\x01d<\xae\xef>>\\\x02g\xbe\x03\xd2\xa7>\xa00#<B\x05\x1a\xbe;W\xa4=\xfe\x7f\x1a\xbe\x9f\x91\x10\xbd\x19Rx>oV\xb6\xbc\xf9\xd9\x17>\x01\xe4*>\x88P\xd5=GP\xa0\xbd\xb6\x8f\xfd\xbaXx7>b\xcb\xeb=\xc8\x83\xc2=Ck\x94>\xe3\xde\x13\xbesl\x02=\xc2\xea\xfb=\xae\x9a\x02=\x0c$&\xbd\xb1\xffG\xbe\xdb0\x98=\xf4\xf7\n>K\xcd\xdb=\xc9\xeb\x83=\xea\xae\xd0;\x8bNQ\xbe!Z&>l2\x0b<[\x1b\xaa<\xe3{\xa8>\xb8}\xe2=\x9b\x96\x9f\xbc\x1f-\xe2\xbc+\xefB\xbd\x0b\xadA>J\xd5 \xbd\xcf\x05\x02=\x06<O=\xbap`=\xf9=\x17=D\x83\x15=\x99l\xa5<\x8d\xf7\x8c<$\xf4\x14\xbcY\xafT=n\xfb\n\xbd\xd5\xe9_<\x9d\xac\xcc\xbd\x162\xcd<\x1c\x80\x02\xber\xe9D>\x8f\x08\x83=\x15jc\xbe/\x86b>\xdb\n\x88=\xfdH\xbd=\xbd\xfb\x91>L#\xb8\xbd\xcf\xe3\x9e\xbb2Jz\xbd\x85\xeb\x04\xbe\xde\x167>&\x15\x1c>3\x9f\xdc\xbc\x97\xc9y>\x7f\xdd\xd9\xbd\xaf\x83M=+\x14u=\xdads\xbeL\xb72\xbd\x9aY\x1d\xbe\xf3n\x98\xbe"\xb0\x18\xbe\x16\x83c<\xd0]\x1e\xbd\x0b3\x94\xbeq\xddV>\x97\x94\x82\xbcV;{\xbd\xc7W@\xbc\xb0&\x12\xbenH\x95\xbd\x14\x8b\xb0>\xe8b\x82=\xe5\x17\x81=<\xc1p\xbe5\n\x93\xbe\x1b+\x0e=\x82\x03\xb9=\xd7g_>\x17\xa3\xf8<\xe5\xd0\x17\xbe\xd4$\xaa\xbd4of>H\x99\x8a;R\xe7\xd9=\x12\xdb\x86=lT<>\xd1\xe1\x99\xbd\xf5\x1d\xf8=\x9f\xf1\xcf<\x96\xd1\xea=zZ\xe5=\xb57\xb5>\x97\xd7v>`M\xa6<\xf2u\x1f=/k\xba=\xb8\xbf\x88='
-p1555
-tp1556
-bsV504276564306313216
-p1557
-g2
-(g3
-(I0
-tp1558
-g5
-tp1559
-Rp1560
-(I1
-(I200
-tp1561
-g12
-I00
-S'-\xb1S>\'\xe3\xb8\xbc\x999\x96\xbe\xa3-V=\xf51E>e\\\xae\xbd<@v\xbc_\x1aG\xbeKZR\xbdH\xf0\x93=kH&=\x89"V=\x9f\x8b\x03>C\x10\x87=*\xca\xa8\xbd-\x88d><\xe4\xea\xbc`\x82\xd8\xbci\xac\xd6\xbd\x88Y\xc5<\xe2~\r\xbec\x8d\xf0\xbcS\xab\xca=d\x0b\\\xbec\xa8\x12\xbd}\xa2x\xbd]c\x03>\xa1\x18\x16\xbe\xdf\xe9\x18\xbex&\xf7=\x95\xf0\xda\xbc\xf1C\xac\xbdi\x08\xd2=\x08\x1aP\xbe\xfc3\x1d<\xfb\x86D>\xdeQ\xa9=W\x06\x05>\xbd\x97b>Z\xfd\x8f<\x01\xd5\\\xbd\x0br\xb5\xbc\x85\x95(>\x94\xfeR\xbe\x85S\x05\xbe\x9ch\x13\xbd\x94\x12|>\xe5C=<=\xaaC=+\x9fy>\x8d\xe7O=\xce\xcc\x98><w\xbc\xbd0X\xea<\xcb\xdf\x91\xbe\x11\xe8\x0f>\x8d\x8c<\xbc\xbd\xb1\xea\xbdk\xec\x8e\xbe\xd9\xe3\x99\xbe{O\xf7=#\xcb5=\x98\xa9\xb9\xbb\x8f\x18"\xbe\xa5\xd2\x15<\xf7\xfb\x19>V\xeb\x11\xbe\xd1\xee\xc2=\x18\xa0%\xbe\x05y\xa8\xbd\x00L\xc9\xbe,\xf9V\xbe\xa9\xb2O\xbc]S\x9f\xbdg\t\x85\xbd\x97\n6>]\xc07>\xb8A\x80=?\xdc\xde=\xea\xd2\x1c>D\xbf`\xbd\x8e\xaf\x07=\xc7T4>\x03\xce/\xbelW\xb7=b}\x83=\x97cO>\xa6[\x86\xbe;\xe4\xbc>\xcd\xee\xd1<\x92k\r\xbe?L\x01>\xb4\x1aC\xbe\xecy\xab<\xa5\xd2k>\x0c\xdb3=\x99\x1f\x03>F\xfb\'>\x9f\x9e\xd5=\xe9|H\xbd\xe0o\xc4=Y-f>KH\x91=\x1b\xcc\x05>\xb5\xbf\x94>\xaa\xd5 \xbeE\xadc\xbb\xf492=\x8b\xa2F=\xad\xe5\x06=#\x8b5\xbd\xe0\x9d=>\xc0\xec\xfb=h\xc8\xfa=\x99\xa2\x92\xbcW\xcf\xba<\xbf\x1fd\xbe\xcb\x80g>Z\xcb$<\xd5R{=\xab\x01\xbb>5O\x80=>Y\x84\xbc\xef\xa6\x93\xbcy-\x93\xbc\x83\xe05>M*\xdc\xbd\xc0\\\xd3:\x1b\xa6\x15=\xf6\xe9\x9f=\x80\x1e:=\x89\x90\xbf=\xac\x0b\xa2=\r\x14\xed<g\x9d\x81=7"\xb7=\xbb\xb15\xbd\x9e\x9b\xa7<\'\x17\x87<\xc9tW=\xd3\xba\x04\xbe\x04\x95\x90>4\xb5\x82\xbc\x8c\x84p\xbe9\xad\x1a>W\x0f\x9c\xbdP\xbe\xec=}bS>\xb7B\xab\xbd\xcbK\x11<\xd0\xb9\xac<\x03s\xa8\xbd\xbd\xaa*>q\x03\x1b>\xf9\xae\xfe<S\xba\x81>\x89Bf\xbd#\xd3\xb5=\xf5O\x94=5\x90%\xbea\xfc\xb8=\x17\xb54\xbeK\xfc\x86\xbe$\xed\xde\xbd\xad\xcb\x9d\xbc\xdd\x97\x87\xbdE\x0f\x94\xbe\xb7+S>9\xaf3\xbdd\xc7}\xbdN\xb8\x90<FY \xbe \xbat\xbc\xeb\xf6\x9c>y\x16\xe3<\x14\xe3\x06<8\xa7W\xbeW\xa6z\xbei\xe2/=\xcc\xda\xcf=\xd9:Y>\rT\xb3<\xe0b\xd0\xbd\'U\xa8<\x83 H>\xe9\x00v<\xdc\x837>\xe1\xe9f=I\xeeR>\xba\xaf\x11\xbe!r*>m\xbb^=\xd5\r\xd8=\xcd\x82\x08>\xccr\x8e>\xd4\x05P>R\x04\xa6=\xb5\xf9q=\xaf\xdb\xe6<\xa8\x84\x97='
-p1562
-tp1563
-bsV503962738105016321
-p1564
-g2
-(g3
-(I0
-tp1565
-g5
-tp1566
-Rp1567
-(I1
-(I200
-tp1568
-g12
-I00
-S'\x0ee\xeb>\x97Iy>\xbeN\xd9\xbe\x19\xab0:?c\xcf=\\K\xb3=\x02\xc5\xc7\xbdi2\x96\xbe\x8a\xcc"=P\x8b\xe7>\x1f\xd9L\xbe\xd7\xe8\x9d\xbe\xbcxS\xbd?!\xe2\xbd\xab\xc6\r>R\xb6\xeb>\x0fjs\xbe\x91$\xa9\xbe\x9bh\x91\xbe=\x08\x8e\xbe\x99y\x96\xbd"\xb1\x94\xbdWD\x8a>\x9e\x9d\xcf>\x9e\x86=>\x06)\xc2\xbdZ\xe7x>*|\xb1<lu\xae\xbe`\xc6\xe5\xbe/\xbe\xb6\xbe+\xbf|<\x1f\x98u\xbd\x19\xc4%\xbf\x01\x9f\x12>\x8e\xac\xaf>qj\xc4>\xc4\xafu>\x91H\x8a>\xcb|\xb8\xbd/^\xb4\xbe\xdbAF\xbe(\xc3\x96\xbd?\xb4\x0f=\xa5\xf3\xd3\xbe\xa5\xb8\xa5\xbd0m\xa5>\xfe\x98o>l-U>y\xeb$?U5\xe5\xbd\xe6\xe8\xc3>\x7f5B\xbe\x8e\x85\xbe=\x04R\x03\xbf\xec\x8b\x01\xbc\x00\x81i\xbb\xfa\xf5\\\xbc?D*\xbf\xeb\xf9\x1e\xbf\x9e=S>!\xe7C?.1\x12?L\xe7\x81\xbe\xae?\x91=\xe26\xfc<\x14\x1a\xb0\xbe\xde\xc3\x0e??\x83\xf3>\x00\x0f\xcb\xbe \xa9\xe2\xbe\x1aJ\x18\xbf\xd2\xce\xe1\xbe2\xcb\x00\xbe\xbc7\xe4\xbd,\xcaM\xbd\xd6BB;\x91\xe8\xd6=\xd7H\xff>,\x81\x95>+\xe2\xf1=\xba\xc5\x8e=\x86\xff\x10?\xb4\x80\xd4\xbe@w\xf9=\xf4F\x95\xbd\xf9\x19\x81>\xd19\x9a\xbeF\x0c\x07?\\\xd8l\xbe\x8c\xbc\xb0\xbe\xc6.(>\x9az\xea\xbd/\x01\xb7\xbe\'\xd1\x95>\xc0\x8d\xfe\xbd!=\xde>\xe6\x9fX>\xe9\x876>\x1e\x19o\xbe\x8b\x84(\xbe\x12ZI>\x19\xb2(>:p\x99>\xd1\xc7!?\'H\xa5\xbe,\xcb\xa3\xbc\x85d\x01?\xa15\x8b=\x07\xbd\xfd\xbd\x16j(\xbf\xbaHB\xbe\x90z\xd4>\xa0\x10e>&\x05[>\x91\xd5R\xbcOA\xe2\xbee?\xa4=2\xaf\xbd\xbd\x91*$\xbe\t\x94\t?\xdfI\x9d>\x19\xa4\xa7\xbc%8:\xbdD\xe5P\xbd\xf6\x8fx>\xc7m\x85\xbd\x97\xf8P>\x12 Y>i\x82\x89>\xdfz\x8b=\xb5\x12{=\x98$\x08=\xf2\x05\x89=\x19uw\xbe\xc2t\x91<\xfc[\x83\xbcun\xdf=rf\x17\xbf\xac\x15!\xbe\xd2Q\x99\xbe"\xd7\xa0>\xce2\xb0>\xc9\xdf\xd6\xbefP\x0e?\xc0Y\xab>{\xdb\x14\xbc$\xfdf?\xd1>]\xbd\x1f\x1b\xba<\x84L\x04\xbd`&b\xbe\x7f\xd6\x8a>\x9c B>\xab\xde$\xbe\xafm\x00?/3\xde\xbe\x18\x96\x86<\x01\xe6a>\xc6\xad\t\xbf\x85\xe9\xad\xbe\xf1\xdb\xcd\xber\xe6.\xbf\xf9\xa2\xbb\xbe\xe1Y\xbd=\xef\xaf\xa9=\xc9\xd5\xfa\xbe44\xdc>\xa1] >o{\n\xbe\xaf\xc6\xab\xbd\xecU\xb8\xbe\x05C\xe6\xbe\xd7\x04\xc6>\xa5sx=\x87\xc8\xaa>Is\x92\xbeiK!\xbfP+\xa2>\xee\xc1\xdf=\xe2\x94\xae>W\x11V=\x85\xf6\xc2\xbe\x84\xa2$\xbe7\xa5\x1d?\x14\xfd\xdd9\xf7|=>^S%>\xa3\xe2\x92>\xde@\xe4\xbd\xe0\x16v>\xea\xd1M\xbc\xf7\xd19>U\xe7\x1d>W\xb3&?\xf0\xc5\xd9>\xf7\xc5\xce\xbd\x96\xc9\x8a\xbc\x8f\xe2l>\xe2\xe8t\xbe'
-p1569
-tp1570
-bsV503957620756344832
-p1571
-g2
-(g3
-(I0
-tp1572
-g5
-tp1573
-Rp1574
-(I1
-(I200
-tp1575
-g12
-I00
-S'\xc1\xc6N?\x07i\xc7>>\xdaD\xbf\x9e{\\\xbcY\xbf\x12>O\xd9\x8e=\xb6\xd9\xd8\xbdNf\xda\xbe\xc0\xb8n=\x04\x9b\x0e?\x91\xa7\x9b\xbe\xf7\xb1\xc7\xbe\xc1\xfa\x90\xbc\x80\xceb\xbe\x9f\x85t>\x8d\x82*?Np|\xbe\xd5x\xee\xbe\xf8i\xd5\xbe\x84\x10\xa2\xbe\x81\xf0.\xbeV\xbcO\xbd\xba\xf7\xe4>\x04\xcd\xf4>Y\xfcy>\xb2;2\xbe\n\x11\xb4>\xd6l\x03>\xfd\xa4\xef\xbeC\xea\x1c\xbf\xf6\x90\xc2\xbe\xb5\x8e\xa4=\xfco\x0f\xbe\x88\x03e\xbf\xd7\xba\x1e>\xc4>\xe8>f\xae\x06?\x87\xe2\xdb>TL\xf1>\x95as\xbe&m\x10\xbf\r\xc8P\xbe\xa7\xaf\x02\xbe\xec)\xd2\xbb\xf8\xa6\x1c\xbfm\x08W\xbe\x8d\xd9\x0b?r\xfe\x88>\x8c\xa7\x90>~m~?\xa4\xe5\xce\xbd\x80@\x1e?\x84\xba\xb9\xbe\xc4A0>\xf4\x0f+\xbf\x03\xca7=\xcc}\x03>\x04g\xe7\xbc\x9f\xeb_\xbf\xd7}[\xbf\xe3\xfe\x9b>\xb1\x1c\x91?\xb8(D?\xc3\xe3\xae\xbe\x9fI?>+R\x7f<cG\xf7\xbe\x00\xf3]?\xf1\xd0\x19?\x06D\x02\xbf\xab\x9e:\xbfM<c\xbf\r;+\xbfLq\x06\xbem\x8a~\xbe\xcf^\xd0\xbd\x80J\xbe\xbcG\x10\x12>x83?\xe0s\xcf>\xff]\x1d>\x9d\xd6\x0e>3~<?\xe7\x1d\x08\xbf\x13@\xe0=f\x87\xcf<\xf4k\xbc>\xadF\xe2\xbe\x14\xd7@?\t\x90\xd2\xbed\x92\x14\xbf\xd9L\x9d>\x07\xb5\x94\xbeb\xec\x04\xbf]!\xaa>M\xed\xcf\xbcW\xcc\x1a?\x8b\x13\x9d>^km>/\x87\xc0\xbe<\x9f<\xbe&\xac\x8b>\x14\xd8\x80>\x9d\xbc\xf1>U9N?\xe3\xe1\x04\xbfM`D\xbd\x08\xb8U?\xbd%\xd7<\xd7g\xec\xbdQ\x84\x81\xbfQ\x9d\x8b\xbe}\xa55?=\n\xad>\x01n\x8c>\xad\xc9\x13\xbe~%7\xbf\x88\xa65>\x02(*\xbe\xfa\x85D\xbe\x08\xd1K?v\x19\xe3>\xa4>\xdf\xbd\xbdE\x96=\xfcZ_;\xb7\x15\xba>\x86Rc\xbe\xf7d\x97>"\xc2`>\xbdJ\xa2>\xddS[>\xec\xf8z>\xadd\x14=>\xb4\xf2=\x93\xb6\x9f\xbeCI\x86=\xa0f\xb6\xbc\xb71\x03>\x8c\xcc\\\xbf\xd7j[\xbe\xcfv\xf4\xbe\xf3\t\xdc>\\)\xfb>A\xc8=\xbf7\x07??7h\xbe>4\xfc\xd8<B?\xac?*\x91\xaa\xbd\xb2rf;f\xb2\xd4=Z_R\xbe\xf9[\xe0>\xa4\xe5\x8d>\\\x04-\xbeg\x9dF?r\x84\x15\xbf\x1f\xfe\xb3<\x8b\x91\xb3>\xbda@\xbf&\xb1\x00\xbf\xe8\x89\x19\xbf\x9f\xd6w\xbf\xe8\xcc\x10\xbf\xb84t>)7\xc3<\xbd|H\xbf`n\x15?\x1c\xb2\xab>\x91\xdc\xd9\xbdy\xd19\xbd-\xbb\xfd\xbe\xd9\xa0&\xbf\x01\xf7\x1a?\xe6\xee[=\x9c\xe0\xf3>RX\xc3\xbeF\\\x85\xbf\xf5\xb2\xf9>\xd3\xddW>\xa1+\xfb>\xceh\xf7\xbb\xcbM\x0c\xbfM7\xa0\xbe\x99\x8dX?\xf9\x1b@\xbd\x84\x1d\xbf>Y\xb9I>\x9f\x9f\xe5>`mV\xbd\xe4\xd4\xbe>\xe8\x0e\x8a\xbb\t\xcc\xb1>}\xe7Y>\xe7\xcfu?.D\x1e?\xbc:N\xbe\x7f\xad\xba\xbc\x06\xb3\x93>\xb3>\xc0\xbe'
-p1576
-tp1577
-bsV503958853399355392
-p1578
-g2
-(g3
-(I0
-tp1579
-g5
-tp1580
-Rp1581
-(I1
-(I200
-tp1582
-g12
-I00
-S'\x1f\xee\x1f?\x07\xe4\xf6\xbb\x05M\x0c\xbfQH\x13\xbe\'X\xa9>\x00h\x0b\xbe)\xbe\xdf\xba_%\xc4\xbe\x8d\xd0\x96\xbc\xef-L>\xd4\xf7\xa8\xbc\x9a\x0b\x15<C\xd3_>\x88s\x82\xbc\xd4x\xcc\xbd\x1c<\x08?\x85\x00\x86\xbd\xcc\xf4\xfa\xbc_\xa2\x8b\xbe\x8f\x18]\xbda\x01\xa0\xbe\xdfml=\xc9\xcac>\xefn.\xbe\x9b.\x1d\xbc\n\xf7\x1c\xbe\xfb\xff\x81>\x9c0\x95\xbeUl\xb5\xbe\xcdk\xdf\xbc1\'U<\xdfu\x9b\xbd\x06\x9b\x95<\xa1\xe3\xd6\xbei\xe6\xdd=$\x02\x87>\x84B\xaa>\xf3\xf7j>\xf1\x10\xb6>\xc9\x84\x0f<\x8a\xbf(\xbe\xb8\x9b\x08\xbe\xf7@\x9f=\xc9\x0b\xa5\xbe\x8f~^\xbe\xb7T\xdf\xbda\x9b\xd9>\xc9e&\xbd\x81\x9e\xab=\xd8M\x0e?\xc9~\xac<\x10[\n?\x10\xdb\x9f\xbef\xfb\xf1=\x9a\x08\xc6\xbe\xa0\xc9e>?\xbaQ>lw\xc7\xbdjY\x0b\xbf\t\xe3\x14\xbf\x1d%\xac>\xa4\xd8\xe8>\xa4\xf8\x02>\xf9eB\xbe|\x11\xe1\xbc\x11T`>\xea\x9a=\xbe\xd9\r\xe9>\xa3\xd8\xbc\xbd\xc9\xe4\x8c\xbe\xa0\xda\x16\xbf\x90\x95\xc6\xbe\xb7\x07j\xbe)S,\xbe\x16\xec,\xbe\xb7\xcb\xba=\xff\t\x0e>\x193/>\xac|O>4\xae\xa8>\xe6R\xae\xbc\\\x8f\xd6<\xbfC\x9f>\xe3\xacr\xbe~C\x04>\xf4\xf7!>m(\x96>\xf1\x8c\x94\xbeO\n.?\xa4\x87\x89\xbd\xa9\xd8\xc7\xbe\xa6\xece>\x8d\xbc\xc5\xbe\x87d\xea\xbd!\x04\xde>)4\xfa=\x8a#\xce>tP\x96>\x16\x97\xf1=6\xea\x1d\xbeL\xa6\xc5\xbc\xa3\n\xa1>\xd4u`>\x18\xde\x89>t*\xfb>\x93\xc9x\xbe\xeck\xa1=\xb9\xb4\xa5>c\xcdz=\x86\xc4M\xba\xf2n\xa8\xbe\xbe\xfb\n>C\x1a >\x7f7\xe4=\x10\x96\x91\xbc9&!=\x1a}\xe0\xbe\xcc\x9b\x82>\xb0\x96%=\x8c\xa4\xb6=Y\xe2\x17?\xdf\xbd\x8d>\xba\\j<Vv\x13>flD=L\xe6\xd2>\xd7\xea`\xbeVr\xc3=A\x97,<T^\x12>,\x93\xb3=JZ8>\x8c\xc8\x1d>4+n<Qp\x92=\x9b\xcc+>z\x8d\xdf\xbc\xb9\x8e7<L\xbaV\xbeS\xed\x15\xbc\x17F\xa2\xbe\x1e\x9b\xb0>\xb7\'\x17>\xa7&\xf2\xbe\x16\x16\xe7>\x17r\x84<\x1c\x1ch>\xd6\x19\x17?zK?\xbe\x86\xcdR;\x8a\x8am\xbdK\xd3\x0b\xbe\x9c\xf8\x9d>\xf5\xf7\x1a>\x8a\x99_=Lo\xd0>\x87%2\xbemo4>y\x98\x98=d\xd3\xa7\xbe@-]\xbd\\<"\xbe\xcaZ\xf1\xbe\xc5\x00\x81\xbe\x86x\x96=\xff\x15\x83\xbd\x9a\x05\x12\xbf\xf9\x17\xaa>\xb1\x0e\x84=\x8d\xee\xcd\xbdp\x9f\xf6=\x91&\x9e\xbeGPm\xbe\xbb\xff\x10?\t\x80%>lZ\xd1=,i\xb2\xbeD\xa5\x1c\xbf:1">r.\x87>\xc9Y\xbe>\x1c\xd0\xbb\xbcl\x9f\x9a\xbeW\xa7\xd2\xbd\xaf\xd3\xeb>\x97jP\xbd\xfd\x1c\xdf>\xb9\xc8\x01>\xf7\x84\x90>\xb3{\xd2\xbd\x10\x8b\x80>\xff\xe2\xb6<\xbeL\x1f>\xc5\\\x18>;\xce\x15?T\x95\xc2>I\xbe\x08;\xa3\x89\xd69\xdfEt=\x8dU\x8c='
-p1583
-tp1584
-bsV503970573035134976
-p1585
-g2
-(g3
-(I0
-tp1586
-g5
-tp1587
-Rp1588
-(I1
-(I200
-tp1589
-g12
-I00
-S'\x8b\x18\xa1>\xba\xbe\xc1=\x8c\xbc\xae\xbe\xf1\xe7\x9d<\xd8\x92\x04>\xde\xf9\xa2;\x1dWz\xbd\\\xd87\xbe\xb7\xcb\xb4<\xad\xffo>t\x00\xe5\xbc\x1d\x9e\x81\xbd\xb8\x04+=\x82\xc1T\xbc0}V<_\xe9\x8f>\xee\xd8\xe1\xbd\x08\x06\x14\xbeT\x84"\xbe\x977\xac\xbd\x14\xa8\xe7\xbd/\xa5E\xbc\x1b\xd2\x1e>\xeb4i=\xc3\x18\xec<\xb2T\x85\xbdIc\x1a>\xec-\x9b\xbdFaG\xbe%\x00\xd4\xbd\xe1\x17\xb1\xbd\xd9\xb8n\xbd\x82C+=\xe5#\xa3\xbe\xf5\xcf\x13=\xf1Sx>\xfa\xe1D>?-$>PXi>\x17Kr\xbcQL!\xbeQ\x94\xab\xbd9Iy=\x1bJ\xda\xbd\xf2\xc8R\xbe\x1f\xa3D\xbd]\x83\x9d>\xca\xc8\x90=dR\xb2=\x9d\xe7\xc2>\xfe\x99t\xbc\xb3\xfb\xa1>\xdaG\x07\xbe\x89}L=\x957\xb4\xbe\xfa\x94\xbf=\xb3\xc8\xb7;s\x1f\x82\xbdm\x91\xd9\xbe\xfbE\xc1\xbeSX&>v#\xa6>\xcdR9>&\x18\x17\xbe\xc0(\xb7<c\xc3\xce=K\xf9|\xbe\x88\x8f\x98>W\xf5>=\xbd\xbd+\xbeh]\xc3\xbeP"\xa8\xbe\x99c$\xbe\x9dV\xac\xbd\xa1\xe8\xb2\xbd\xa6\xcf\xa2=\xec{\xa3=\x03\xab\x96=\xdb\x8c^>Y\xc1$>\xf9i\x12<\x9e\xbe\x96<_4\x9f>8l\x83\xbem_\xd6=\xa2X\xb7<\x17\x9an>A\xa9\x81\xbe\xce\t\xc0>\x152\x18\xbd:\xd9M\xbe\xa0r\x05>\n\xec5\xbeR\xe1\xaf\xbd\x9bj\x83>\xf8\x84\xa9\xbc\xb4"O>X\x84/>BJ\x05>\x8e\x01\xf4\xbd7\xfd\x9d\xbcG\x96O>\xccy\xe5=\x11T\x14>\xf8\xb4\xc0>2;B\xbe9\x8fH<\x13\x8e`>\xf3\'\r=\x81\x84a\xbd\xef\xc5\x94\xbesA\xa0<\xb9\xe3v>\xb8*\x14>G\xf8\xdb=}\x19\xfd\xbclZ\x8d\xbek\xf1\x19>+\xba\xe7\xbcQ-\x08\xbc8m\xc7>\xfd*\x1c>[\xeeE\xbd\x844\xba\xbc21\xc6\xbc2\x0fC>n\xffZ\xbd\x1cm\x9c=\x08\xc4\x9d=\xd1\xc0\xa8=E_\xad=\xef\xa7\xa9=\x04o/<Ic\xba<Z\x93q\xbdz\nF=\x18@`\xbc\xaaa\x0c=\xb2HW\xbeIgJ\xbc\xf8z(\xbe;\x11m>cb\xe5=\xcf\xe6\x90\xbe\xfb\x9f\x8d>\xab\xaa\xcb=*0\x8b=\xa6O\xd7>"\x04\xad\xbd\xc2\xe5\xb1;\x80*\xa68\x05F\x03\xbe\x1f]I>\x9e\xe0%>\xca1S\xbd\xe9\xb0\xa1>+j6\xbe\xd8\x94\x13=<I\xfe=\xdc\x14\x9b\xbe"\x84\xb3\xbd~\xb5b\xbe^\xed\xb8\xbe\xe5#D\xbe0<\xd2<`Q\xe4\xbcL\x07\xab\xbeA\xcd\x8f>\x9b2\xfe<\x04O\x85\xbd\xee\x12\xbe\xbc\xc357\xbe\xed\x0c+\xbe\xf2b\xbb>\xef\xc2(=6\x89\x07>\x83\xaeo\xbe\x99\x10\xc1\xbe\xe8\xab\xe9=CU\xc8=\xb6+\x82>\xca\x18\x92<\x9eN8\xbe\xdb\x8e\xba\xbd-\xdf\x98>\xa0\xcd\x01;pv\x0b>\xdc\xd7\x9d=CO_>\xcdr\xb2\xbd\x93\x00\x1a>\xca\x80\x06=\xfd\xec\x12>\xeaw\x18>\x8a3\xd8>\x94\x0c\x95>/\x07F\xbc\xad\xfa =#*\xc3=k^v\xbc'
-p1590
-tp1591
-bsV503969703120109568
-p1592
-g2
-(g3
-(I0
-tp1593
-g5
-tp1594
-Rp1595
-(I1
-(I200
-tp1596
-g12
-I00
-S'\xf2\x91\x8e<4\xe1\x07;\xa2"\xaf\xbc^\xdc*;\xfa\x03d<r\x90\x05\xbbf\x91\xa5\xbb\xc0\xf5\x91\xbc\x93\x12\x06\xbc\xc8O\x85<\xde\x88\xd7:F\xa3\xba\xbb2\xf7\n<DU\xa0;\xfd@\xee\xbb\xf0{\xa6<\xd6\x92\x04\xbcX\xed\x12\xbc\xfa\x88"\xbc\xe0\x08>\xbb\x97~G\xbc\x8d5w\xbb\x12\x88\x9d;\x02(\x17\xbc\x12n^\xb9\xc3\x9c\x9d\xba\xff#X<\xc7=B\xbc\xee\xb9\x98\xbc\x9fR\xd3:%\xe49\xbc\x86O,\xbc\x1ev<<1@\xc2\xbcPg;;\x0ej\xab<\x0c8a<\r\x93\xe7;D\xd4\x95<\xd04\x07<\x16Pp\xbb\x9a\x0e\xc3\xbb\xcb\x9aT<\xc7\x97\x93\xbc\x97\xf5N\xbc\xb8F\xea\xba\x1b\x8b\xb1<\x81\xd5\xdc;\xad\xe1o;F\xf1\xc4<X\x8c\xec\xb8\xcfz\xcc<\xc3\x04\xdd\xbb\x036\xc2\xb9\x1ah\n\xbdXW\x0e<\xfaF\xb4\xbb\xd4\xf3\xcf\xbb\xbc\x15\x14\xbd&\xc9\xe2\xbc\xa6=W<\xee\x8c5<7\xdd\xf9;\xeaJ\x80\xbc\xb3o;\xbb\x89\xefr<z^r\xbc\xb7\xbcR<\xd0\xa0+\xbco\xd8?\xbc\xc8\x7f\x01\xbd\xdaH\xaa\xbc\x06\xc8R\xbb\xdc\xdd\xfb\xbb\x83\xce\x8e\xbbX&V<\xf0\xa8\x90<5\x94%<N\xf1J<\xa3\x17]<04\x81\xba\xc8z\xa4\xba\x03\x1c\xcd<\x1aT\xa1\xbc\\~$<|!{9\xba\xbe\x83<\xb0\xcb\xbb\xbc\xb8.\xfe<\xe7u|;@\xf5\x1c\xbc4I\xf2;\xf7\x13J\xbc\xd9j\xca\xba\xdeF\xc3<\x80\xe8c\xbb\x14y\\<\x1c%m<F?\x0e<\xb9\x85\xad\xbbH=\x98;\xde\xdf\xa3<\xe5\xe0\xec;\x95"\x1c<3k\xff<^\xee\x81\xbc\xa0\xd8\x9f:W\x13\xb4; "\xa8;\xa0\x14\x0c\xbb\x98\x96\x15\xbc3\xf2c<,["<r8d<~\xe0\x82;\x94\xc8\xbd;X\x83\x91\xbc\xb2\x84\x89<\xe6\xaa`\xb9\x12B\x96;%>\x07=\xbeo\xdd;\x1e\x01):w\x82\xbc\xbb{+\xca\xbb\xf9\xb1v<\x1cy\xd6\xbb\x96 \xbd:rm\xe1;\xadh\x17<-\x9e-\xbbN1X;~y\xc8;\xe2\t\x8f:\xf4\x0f\x9e\xb9\x8b_[;^Y\xe6\xbb8\xc0]:\xabkL\xbb\xcc\tm;\x03\xc9*\xbc.\r\xce<,%=;\x80\\\x8f\xbc\xda\xee\xb0<K\x9e\xa8;2\xaa\x11<\xba\x14\xbe<\xa0\x10\x14\xbc\x96\x14\x1a;\xc81\x9b\xbbvkA\xbc1\xda\x92<\xec\xb9\x92<\xe4&!\xbb]\xd3\xaa< \xd3\xe1\xbb\xbeI\xf5;1\x81\xb8;\xdb\xeb\xa9\xbcS\xb0v;~F\x8c\xbc\x18,\xda\xbcy\x96`\xbc\xae./\xbb\x81`z\xbb4\xd5\xce\xbc\xb1\x8f\xa4<\xe8\x0c}\xbb\xac$\xc3\xbb\xbe+\xcd\xba\x1f\x08~\xbc\xb87\x8c\xbb\xc2\x82\xd9<,\xef\xb4;\x19 @;3=\xc0\xbc\xeb\xe3\xae\xbc\x99^\xe1:`y\xe5;\xfb=\xa2<\x94\xb5\xa6;\x14~"\xbcr\r\x1c\xbb\xc9\xfb\xc5<-g\x95\xba\x84\x9d\xee;\xbb\x95\x83;\xb2\xf4\x9c<bI\x88\xbcC\x82B<\x92\xd5\xef:\xaa\x8d\xe4;\xcb\xa8\x82<o\x02\xe2<\xab5\xbd<\xdb"\x1b<R\x11\x01<\xfb\x89\xd6;\x1a\x1c\xd2;'
-p1597
-tp1598
-bsV503964447249932288
-p1599
-g2
-(g3
-(I0
-tp1600
-g5
-tp1601
-Rp1602
-(I1
-(I200
-tp1603
-g12
-I00
-S'\xe0/\xd9>\x97\xd5\xd9\xba\x12\xbb\xed\xbeX\xfc-<\r\xe9\x88>\xf7z\xe7\xbdW\x11\x84\xbb\xdc\nK\xbe\xbc\x83}=~\x98\x00>\x18so\xbc\xe9\xfa\xa8=\xcc[\x19>\xa02\x19\xbd\xc3\x03(=\x0e$\xcd>\xe2\xfc\x91\xbc&\xe4\xa2:C\xd5H\xbe\x1dM\x1b\xbd\xc8TF\xbeX\x851=t\xea;>\x9e\xfa\r\xbe\x8f-,=`w\x1e\xbe\x95\xb6@>\xa9C\x1a\xbe\x00Yr\xbeq\xce\x92;b!\xe5<\xd8,\x96:]\x017=\x7f\xcc\xba\xbe\xc6O\x9e=f\xa4\xeb=3\x156>\xadjW>d\xd6\xa1>:y!\xbe#Ka\xbe\x88\xc9M\xbd\xb1\xf7\xac=\xd5\x1bK\xbe\x93)G\xbe\xf8\xd9\x03\xbe \xb1\xb6>iO\xe7<\x9c^\xf4=UO\xc1>U\xfb\xa0</;\xfd>h\xf3l\xbe\xd6\xcd\x12>D,\x9d\xbe\xf7t4>\xd4k\x89=\xdf\xd7\x1f\xbe6\x16\xd3\xbe\x95\xdd\xd8\xbe\xdfjG>\x00\xb7\x97>\x07S4>\x9c\xad\x07\xbe\x13\x8f\x86=U\x9aj= La\xbe\xe2\x92\xb1>\xeaS\n=\x1d\xca\xf0\xbdHp\x06\xbf\x89-\xa4\xbe\x00\xa2,\xbeu\xdb\x83\xbd\x82\xca\xc1\xbd\x93y\xf8=\xde\x7fm=i\x1c\xb5=\x02\xecT>\xe4?\x81>\x08\x9c\xab\xbd\xbdzP=\x14\xe6[>\xa2oK\xbey\x158=\x1f\xf4\xe4=\xffz\xb5>/\x0b\\\xbetR\x00?w\xf9\xd5\xbd,\x1e\x9c\xbe\xad5L>1j\xa6\xbe\x93\x8b\x04\xbex\x87\x93>k\xb3\xb9=\x04\xc0\x8c>T_N>\x17\x1c\x01>\xfb\xb8F\xbe1\x04\xb9=\x17\xad\x7f>L\xf1S>qot>\x04\xc4\xd4>S]\x05\xbe\xc0\xdf\xed\xbb\xf1O\x87>\x1fX\xd8<\x1a;\x88\xbb\x0b[\x88\xbe\xac\xedV=r\x9fN>\x93\x16\xc7=\xf1\x17~\xbd5AF\xbc\n\x11\xa3\xbeG\x04\x1a>\x90\x82Z=x\xa2\xce<\xd1\xaa\xf9>\x9bfS>~P\xfc;>\xb7\x15>\xd1\xe4\xeb=\x9e\xfd\x94>\x9b\x85\r\xbe&Hm=\x9b\x1c\x85=[\x82N>\xbc\xe3\x11>bs\x7f=K\xa1\x82=k\xd3\x87=||\xaf=>\xf0\x06>\xa82\x8e=X\x87D=\xc5\x9eA\xbe\xdea\xae\xbd\xc1\xbf\x9e\xbeP\t\xa6>&\x81\x15>k6\xc2\xbe\x82ZX>\xe8[\xf5\xbc\xa9\xcd\xce=\xfaE\xbf>\xd1\xda\xfe\xbd`\x07G\xbd\x886\xa4<\x1c\xf3u\xbd\xc4\x13\x11>N\xf7\xb9=\xe4\xae\x92<C\x88\xd4>\xa4$6\xbeBND=\xa2,\xc3=\x97+\xa1\xbe\x08jM\xbb\xf1\x9c]\xbe$\xfd\xd5\xbe~\xf8\xb9\xbd\xf9\x92\x81=t\xa3\xf0\xbcq\xd0\xca\xbefi\xa0>\xe8\x95\xe4< \xaf\x10\xbevy0=\x8f\x0e`\xbe,\x00L\xbe\xbc`\xdf>\xad\x9c\x97=\x00\xa8\\=\xcb/~\xbe$#\x02\xbf\\5\\>\xe8\xac#>+\x93\x7f>\xcf\xd4\xf3<\x13be\xbe\xda\xef\x1b:8\xe1\x8e>\xbf\x8dC=\xd3\xb1\x9f>\xba\x85\xe2=m\xda\x83>9\xf9\xe0\xbd\xca\xdf\x84>\x0fh-=\xbe\x84\xe2=\xac\xc6\xa9=Mn\xf8>o\xe9Z>\xe8\xc8\x0c;\x81\x07\xb6\xbch\x11\xad<\x1e\x06\xc99'
-p1604
-tp1605
-bsV504257832556834816
-p1606
-g2
-(g3
-(I0
-tp1607
-g5
-tp1608
-Rp1609
-(I1
-(I200
-tp1610
-g12
-I00
-S'z\xc5L>\xb6\xf7\xd8\xbc+\x05\xb4\xbex\xf7\xc5=\xf0\xf3J>y\xc6\xe3\xbdH\xb4R\xbdQ\x8f)\xbey\x04\x96\xbdU\xf7\xa2=p\x8a\x19=n,\x0b\xbb\x17B\xb4=o\xbaT=y\x1e\xca\xbd\x85\xaeW>\xfe\xa0\x17\xbcM\xc2a\xbd\xb9\x80\xe1\xbd\xf7\xebh=\xbe\xefA\xbe\x87\xd0!\xbdk&Q=\xba@w\xbeB\xb0\x80\xbd\xc9\x12\x81\xbd\xab\xd0@>]\x89\t\xbe  _\xbe9\xdf\xd9=\xbb\xa7\xc8\xbd\xaf\xbf\xb3\xbd)\x15\r>\x13\xc9d\xbe8\x15\x91\xbc\x83\x00\x8c>J\xccB=\x0e@\x06>\xee\xd1\x92>Z\xc6`=\x01\xf3\xd6\xbd\xb0\x8d\xe1<\xed[;>\x85\xd9Y\xbeYg)\xbe\xfd\xe9\xa0\xbdqO\x95>]\xc2W=\t\xac\xb7=-\xbe\x90>\xdf\xd8\x83==\x91\xa0>\x95m\xc2\xbd\x12^\xc2\xbc\xa0\x89\xa0\xbe@t9>j\xbb]\xbc\xe9\x14\r\xbe\xd6^\xa0\xbe\xff\x8e\x9e\xbeG\x8f\xfc=Xyg=r\xee<\xbc\x7f\xa8G\xbe\xf3\x02r=-+->\xd1\xd8\x1f\xbe\x1b,\x7f=\xc9\xf7\x90\xbe^w\x9f\xbd\xe6&\xf5\xbe\r\xf1\x81\xbe\x95\xbf-<\xe1\x03\x8f\xbdF*\xfd\xbdx\n9>\x1be\x8b>\x05\x94\xd2=8W">\x00\x1b$>\xc7M\x93\xbd\x10\xa1R=\xfe\x17\\>G\xcdf\xbe\xc6\x1d\xaa=\xb0\xc0_=\xf9\x80(>\xfe\xac\xa8\xbez@\xd1>\xa3\xef@=\xa9\xb9\x02\xbe\xf6kF>\xa3ti\xbe\xc7,q=0\x8ax>\x94\xe7\x91=\xf8\x0c\xfc==W\x19>\x87\x13\xe5=\x80\xfd{\xbc)g\xe2=\xdb*\x9a>\x9a<\x94=\xb2o\x15>&\x12\x9d>\xb5\xf8\x84\xbe\x9e\xa4\x95\xbc\xee\x91\x7f=@b\xc9=;\xacG=\x90\x03~\xbd\x05R >\xd3\x8f5>\xf5\x082>*\xe4T=\x93\xdc.=\xc6\x89\xa3\xbeE\x8f\x89>\xde\xb7\x1c\xbc\xa1\xa7\x81=e9\xc4>\x17\xef\xa0=\x82C\x9d\xbdU\x92<\xbd*\x89h\xbd\xe68M>\xae\xdd>\xbe5|\x82\xbd\xc2\xcd9=S\x89\xb0=\'\xf6\n=\xd2Z\x1a>\x00\xef\xf5=#K\x97<\xdeme<VH\xa8=\x80\xa0\xa2\xbdi*G\xbc\x99Z\xf8<E1\xdd=\xe1:&\xbe\x80\xde\x8c>wP\xbd\xbdou\x9e\xbe\x91\t\x17>\xd8\xb8\xc4\xbdI\x08\x1e>\x97\xbc\x92>\xa2_\xf8\xbdK\x8fT\xbc\x870&=\xd5\xf1\x9b\xbdWqk>3\xa6\\>\xb8]\xaa<Z\xca\xb7>\xcb\x1a\x8f\xbd\x16\xa3\xec=\xb7[\xd1=\xb9\xb7\x1c\xbe\xb0l\xcc=\x1ehv\xbe\x93\xd1\x96\xbe\xb562\xbe=\xee%\xbd\x08\x92\xb7\xbd\xce\xea\xbd\xbe\x8a-u>\xfdH\xe2\xbc\x8ekK\xbbn\x1b"<\xf3@,\xbe\x8f\x97\x11<(<\xaf>\xb0\x92>=2\xa35=A+\x80\xbeI+\x92\xbe\xde\x89\x97<H\xe9\xe6=\x02Z\x88>\x1d\x0b\xf5<v\x05\xf4\xbdF\x1f\xb6\xbcs\x94}>6)\xaa\xbc\x05\xc2>>\xf6\x1c.=\x7f1y>\x00\xdb\x0f\xbe.\xcfS>\x05\x10n=a\xc2\x0b>\xa0p\x1d>c\xff\x96>\xba\xd0m>\xac4\x0f>28\xb4=\xdf\xf8\x83=%\x16e<'
-p1611
-tp1612
-bsV503967665804050432
-p1613
-g2
-(g3
-(I0
-tp1614
-g5
-tp1615
-Rp1616
-(I1
-(I200
-tp1617
-g12
-I00
-S'\xdd\xa8\x92>\xd6e\x08\xbd\xee\xa4\x9d\xbex\xd3"\xbc1\x87z>\xfdm\xb2\xbd\xf3\xba\x99\xbc\xc8k\x89\xbe\xaf\xa7\xbc\xbd\x91\x0b\xf6=_\x86h=%\xdd\xb6<\x1c\x021>)F\xbf=0` \xbe+\x0f\x9f>\x02}{\xbd\x0b\x87[\xbcqZ\x11\xbeu\xe6\xa4;\xdfx>\xbe\xa9\n.\xbc\xd7\'\xd7=\xbcHs\xbeH\xc7,\xbd\xd1\xfd\x9a\xbdI\xdb >\xe8\xbdp\xbe$\xe6b\xbe\xbaB\xf1=\x9bs\x8d\xbd\x89\x04\xf3\xbd\x98E\x03>W9\x81\xbe\xa5\xf1\x07=S\xebx>\xf8\x1b >\xbc;\xff=3\xc9{>\xe6\xca\xca=(\xef\x92\xbcE\x8b\x9d\xbd8\xb38>3"\x8a\xbe\x9e-\t\xbe\x15T\x9d\xbc\xf8\xf9\x8c>\'!;\xbb\xb5\xaf#=8s\xa4>\xbd\x9c\x08=\x7f\xe7\xb1>\xdc\xf4\xf5\xbdT\n\xe4<\xc6\xd9\xb0\xbe\x14\x8b >\xe4\x01\x90<w\x12\xe4\xbd\x8b}\xbd\xbeB]\xc6\xbe\xb2T9>\xc8\xa0\xc0=\x89D\x7f\xbc.\x852\xbe\xf6\xae:\xbd?\xb7X>\xa7E\x06\xbez\xa3\x11>&\x8d?\xbe\x8br3\xbe\xc1s\xde\xbe\xbdX^\xbe\xb8\xc3\xde\xbc\xbf%\x0c\xbe\xf5\x02\xa1\xbdT\xf39>\xdb\xf5Y>w\x0e\xe8=\xd5\xcc\xed=%\tE>\xd5aP\xbd\xa7\xcfh;\xe7\xdei>F\x04C\xbe\xf4^\x07>\xf6\xa7\x83=\xe2\x95]>\xdc\x8f\x95\xbesI\xf3>\x11\xdeE=X\xf7+\xbe\xb5N\xde=\x8b\x82l\xbe\x1a\x1c\xa2<\xea\x07\xa8>\xbcEV=!\x02H>\xa4\xcb]>\x02\x1f\xd8=P\xad\'\xbdx\xf7_=f\xed\x90>x\xa5\xc9=i\\\x13>\xf3\xbd\xbc>\xfc\x151\xbe\xc8\xc8\'=`\xc2@=}r\xaa=t>\x03=\x1d\xc1c\xbd\xc0\xabx>\xf8\xc7\xac=s\xc9\xf2=\x8d\xb5\x99\xbcH\x93\x8d=\x98~\x8b\xbeJp\x90>*\xad1=q@\xad=\x91W\xd7>\xd5\xa5\xe4=\xe0W\x84;\xea>\xd7\xbc\xda\xa7X\xbd\xe8\x9br>\xf8\x02\x06\xbe\xf8N]<zI\xf7<\x12\xf3\xbc=\xf3\xc2\xe9\xbb\x7f\x0b\xd3=\x99\x15\x07>Q\x95p;Ur\xa7=\xe5\x02\xcd=\xf4|\xa0\xbd\xe74\x19\xba\x9a[\xae<\xde\x95\x82=W\xc6\x18\xbe\xd6\x19\xa3>\xfe\xe9\x84\xbbUi\x83\xbe\xc8\x12\x85><\xe73\xbdX\x7f*>{\x87\x8f>De\xef\xbd!Y\x13=|\x7f\x0c\xbd+\x9c\n\xbe\x1e\xe0h>\xff\xc1E>\xdc\xf9s=\xc3h\x82>E\x92\x8e\xbd|\xfd\x1a>\x88Oz=R\xcfD\xbe\xfck\xa5=\xffx\x1d\xbe\xe2\xec\xa1\xbe\xf1\xc0\x12\xbe|\x1f\x16\xbd\x0c\n\x83\xbd\t\xa8\xbf\xbe\xf0sf>w\xb2\\\xbdq\x12\x9a\xbd\xe9|\x17=s=\\\xbe\xb7\xa6\xd5\xbc^\x12\xc0>\xcf\xa1\x9b=\x81G=<\xa5b\x8d\xbe\xf8\xc4\x92\xbe\xb2-\x9d<\xdf\x8b\x19>\x0b\t\x8f>\xc0\x84\x93<\xc2\xba\n\xbe\x88Su<\xd5E\x92>\xfc\xdb\xd0\xbb\xed\xe4`>\xf0\x16\x9c=t\xe1V>_12\xbe<\x0e@>\x83\x8cI=X\xb5\xcb=\x90)%>b\xc9\xb4>\xce\xc1\x86>\xd4\x80\xc0=\x80[\x91=r\xc2H=\xc0z\t>'
-p1618
-tp1619
-bsV503957080038834176
-p1620
-g2
-(g3
-(I0
-tp1621
-g5
-tp1622
-Rp1623
-(I1
-(I200
-tp1624
-g12
-I00
-S'\x1do\x8a>I+\xd4=\x07\x8d\xae\xbea\xbf\x06=\x12\xab\x0c>\xe2\xa6\x17\xbeew\x90;\xa0VC\xbe\xd3\xba\x07\xbd\xbb\xbeC=\xf4\xa5v\xbc+R\xfa;\xa5T\x0e\xbb\x1crO\xbc\xc4Br\xbd\x83\xfc6>\x04\xd9\xb8<o\x9cW\xbdy\x80\xef\xbd\x0c\xed\xb8<\xec:\x10\xbe\x1b\xee\x89<$\xa8\xc2=\x8f\x1e#\xbes<\x10\xbc\xc5\xcc]\xbd)\xd5\x1b>\x1frr\xbd\x1f\xc6\x0f\xbe` t=\xe0\xd1\xb4<\xc9\xf0\x93\xbc\x13\x84\xe8;\x87\xb3%\xbe\xddb\xa3\xbc\xc3[\'>\xeb\xb83=4\xdaB>\xb5}\x83>\xc9\xdc\x89\xbd\xdb\xca\xc0\xbd/\x1eF\xba\xaeD\x12>\\R8\xbe\xcd\xe6!\xbe\x0f\xb5\x8d\xbd\x93\xef<>\x15\x1a\x8b\xbc]\xd5w=\xc7\t\x90>{z\xa7<\xc1\x86n>\x1aY\x02\xbe\x03b\x07=\xdfyd\xbe\x81\x01\xa4=\x84\xfa\xcb=\xe1\x8f\x94\xbd\x00\xbe\x87\xbe\xb3V\x87\xbe\x89j\xf7=\xf2\x87 >\xb8u\x18=\xc7\xba\xcf\xbd\x00\x10I=`;\xb2=X\xb3\xe9\xbd+\xfb\x16>\xbb\xa5\xe6\xbd\xff\xfe\x99\xbd\xd0\x11\xda\xbeW\x8au\xbeCl\xa9\xbd{\xe9\x1f\xbdMC\xc5\xbd\x14\x10\xcd==J\x0b>J\xa4&=\x13W\x13>\x83W\t>pG\xe9\xbc3\x15\x05=[\x83\xc2=3\xba \xbe[\x96 =\xff\x1c`=\xd9m\x0e>\xcd,h\xbe.\x06\x98>\xc5y\x1c\xbd\xe7\x16\xf7\xbd\x8f\xc5\x1a>\xc4\x82Y\xbe-f\xe3\xbcI&\x11>r\xf7\x13>?\x05\x14>Q\x94\x0e>\xbf)\x8b=\x91\xb2\x89\xbd\x14U\xc1=%.X>\xa9\xa8\xe7<\xff\xd3\xc0=\xd7\xd8?>\x8bMO\xbe<\xd2\'\xbd\t_\x19>\x03\x16,=\xa0I\x8d=\x9bn\x0e\xbeo\xd4\xd6=\xdf\x8eN>\x82\x10\x01>\r\xaf)=\x99\xd71\xbd3f\x90\xbe-\xd5h>\x84\xb7E\xbc#n\x98=\x05\xed\x9c>\xcf)\x98=[\xd6\xb6\xbd\x07\xca\x8a=%\x9d\x07=\x98h\xff=\xbb\x07\x1c\xbeX\x94\x84=E\x11\xac<\r\x06\x11=m\x06\x9c=\\\x12\x13>@\xe2e=\xda\xa0\x8f<9\x12\xf0<\x93\xab\x1b\xbc\x991x\xbd%\x92\xc4;\x9c\x998\xbdW\x1a\x8a=\xb7\xad\x00\xbe\xf1gH>t\x9fP<O\x92\x93\xbe\xa8$H>K\x83\xdc\xbc\xd3\r\xf4=\xce\xe6\xa6>\xdc\xd8\xf6\xbc/\x92\x1a\xbcy\xd6\xd1=\xe1\xef\x07\xbd\x0c\xaaG>g\n\x0b>\x00\x8e\x04=6@\x84>\xf0w?\xbd-\x86\x8c=\x19\x8d\xe3=\xea\xcc\x06\xbe\xfb,r<i\x1bS\xbe\x8d]]\xbem\x883\xbe\xd8:\xea<wj\xad\xbd:\xf8\x8c\xbe\xf7M\x16>\xcd\xc2\xf9=\x0b\x08\x0b=F\x9c\x8e=\x0cY\xff\xbdR\xec\x9e\xbd\x1d\xf2z>\xc5Sv\xbaT\x12\xc5=]K5\xbe\xb0\x03\xaf\xbeM\xb9\x1c=j\x12\xa3=\xcf\xe6\x18>\rB\xf9\xbc\x81\xe9\x14\xbe\x00\xd5t\xbd\x8d\xfca>\xc7\x16#\xbd5f\x12>\xb3\xbe\xd1<Y\xf1D>\xcb\x10\x89\xbdt\x0e\x19>\xfc\xa4!=8[\xf4=q\xe34>\xa9kj>\xd4"^>47\x9e<\x8b\xe96=\xd1:\xe3<X!\xbe\xbb'
-p1625
-tp1626
-bsV504275175219531776
-p1627
-g2
-(g3
-(I0
-tp1628
-g5
-tp1629
-Rp1630
-(I1
-(I200
-tp1631
-g12
-I00
-S'\xe0I\x8c>D\xeev\xbda\xde\xdc\xbe^?\xa2<\x1b\xba~>+\x00\xb8\xbd<\xa3\x10\xbdy\xcf\x83\xbea\xff\x9d\xbd\xe2b@>r\xf3U=\xa0Z\x84=\xd6\xf21>\xb4)>=\xfc\xb4\x11\xbe\x08\x84\x8a>\x86G\x94\xbdn\xe2A\xbd}\xfe\x07\xbe\x8e"P=\xf1+\x8e\xbe\x12\xa3\xbb\xbc\x9df\x92=Y`\x9a\xbeD`\x9b\xbd\xab\xdb\xb1\xbd\x1b\x97\x85>\xf1bt\xbe\xfd\xe0\x90\xbe\xf1\xe0)>\xd2\xc0\x0b\xbc\xab\xa7\x0c\xbe\r\x81\x13>\xda\xde\x98\xbe\xc1s\xb4\xbch\x0f\xae>a\\\x0b>\x9a\x05\x0f>\xe5h\xbb>x\xd7\x8c=\xe9|\xc6\xbd\xb3\xc8O\xbc\x1f\xe6\x8f>\x0b\xd4\x9e\xbe\x9e\x0f+\xbek\xf9R\xbd\xef\xb9\xc5>\xc8S?=O?\x8a=\xb7;\xc2>p\x7f\xb3=\xf8\x11\xdb>\x83\xaf\'\xbe(\xa6\xd4\xb8\xad\x12\xed\xbe\x93\x15\x83>Z\x8d\x8c\xbc!8&\xbe\xdf\xd2\xee\xbeh\x18\xd8\xbe\x15ms>\xd6W\xbf=ND\x0c\xbd\x96&\x81\xbeQ\x86\x15<X~\x82>\x9dqe\xbe\x98\x8d+>\xc6s\xa5\xbe\rh\xae\xbdr\xd2\x0c\xbf\xc1\xe8\xa4\xbe17P=j\x86\xf8\xbd\x8f\x85\xef\xbd\'\xc5\x82>\xb6\xa1\xab>\xbe \xea=\x8c<\x12>\xa4\xa8P>\x19\x0e\x93\xbd0*\x0b=\x9dV\x97>\xa2=\x84\xbe\xb51\x08>l\xdb\x89=\x9b\xde\x82>\xccu\xc6\xbe#\xbb\x05?`\xb5\xd9=\xd2\xd1;\xbe34O>\xb6B\x7f\xbe\xf8\n\x84=\xc8\x97\xc4>\xcc\xee\x05<R\x99\x1a>^\x92m>\x87\x0b=>o\x1b\x07\xbd\xb7\x0c\x03>\xfa\xbb\xad>\x0b1\xd7=\xa4\xc8(>\xd8\x11\xd3>\x9e\'\x8e\xbeR\xb3C<e3\x03=\x15\x14\x98=\xc4\x19\x82\xbbm\xd6}\xbdO\x97z>-\x18\x10>\xe6\xeba>h\xcd\xfc<\xe3\x1c*=\x8e\xd6\xac\xbe\xaal\xac>\xdcn\xaf<\xae\xfa\xd5=\xea\x83\x0c?1\xfa\x92=\x13_\xf4\xbcy\xb2w\xbd\x9bD\x06\xbd\x98I\x98>\x03L\x17\xbe\xbe\x01^\xbd\xe8\xf9L=<\xa4\x98=}bX=lO\xd2=\x08\x16\xf6=\x05\xd8A<\x0b\xf4i=\xcb\xf2\x1b>v\x89\x83\xbdd\xc7\x86<\x84\x1a\x8f=\xca\x84\x02>\x00\xef.\xbe\xa5[\xd2>\x82}u\xbd\xe7s\xb0\xbe\xf9\x15^>\xe4\x85g\xbdc6x>\x98\x8b\x8e>vO0\xbe\x1c\xb8\xa6\xbb\x06\xe3@\xbd\x15\x151\xbe\x19\x90\x86>\x95\xf9\x8e>\xa8\x15<<u\x9b\xc7>\x18F\x94\xbd\xa8{\x19>\x9c\x06\xb0=,\xba~\xbe\n\xea\x0b>2\x05w\xbeP\xc7\xbc\xbe\xf2\x03;\xbe0\x0fK\xbd\xf81\x03\xbe+\'\xee\xbe\xfc\xa8\x91>k\x05\xc4\xbd\x15\xf9/\xbd\xe3!;=[\x1fE\xbe\xd7\xe2\xe5;\x9f\xfa\xfe>\x1a\xce\x9c=\xf3\xf0\x0e\xbc}\xbd\xb2\xbe\xcb\xf7\xa5\xbe_\x9c_;\x07\xf5\xf4=\xbfX\x98>\xbb\xb0s=-\x858\xbe&\x9c\x86\xbd\xe0\xd5\x87>\xb4\x91\xcd\xbc\x92{Y>bP\x9b=\xa79\xa1>\xe9Ze\xbe\x17\x8fA>E\xff\xaa=L\x1a0>\xd0\n7>E\x07\xc5>\xdeU\xb1>\xe0\xf80>=n\xc1=_\xde3=\x08\xa3\x05>'
-p1632
-tp1633
-bsV503959716720934912
-p1634
-g2
-(g3
-(I0
-tp1635
-g5
-tp1636
-Rp1637
-(I1
-(I200
-tp1638
-g12
-I00
-S'\xffv\xae>\xa8\x1af\xbd\xe8=\xdd\xbe\x80++:\xad\xe7\x87>\xd8\x05\xf8\xbd344\xbd\x05\xfcJ\xbe8\x0e{\xbd\xdd\xed\x18>\xe4\xcd\xab=\xb0\xe9\xac=\xe8\x05,>\x14X\x98<\xf3\xa4\xb8\xbd)o\xb1>\x13\x8f4\xbdX_+\xbd\'\x8f\t\xbe\xe1x\x98=|\xd0\x98\xbe\x1fx\xc6<+\x15\x98=R\x1a\x94\xbe{r\xbc\xbd;\x7f\xcd\xbdY\x85`>\xa5H\x8d\xbe\xfdS\x90\xbe\x8f\x83!>u7\x94<\xe3\xd4\xd7\xbd\xcd\x1b\x15>\xc0\xa7w\xbe\xbb\xad\x0e=\xa1\xdc\x8a>\x14l!>\xdbN\n>\x95\xa2\xb4>}0<=\xef\xb9\xe5\xbd\x08\x15\xf3\xbc\xf0\xa6p>YR\xa0\xbe\xf9!\xf8\xbd\x97\t;\xbdK\x00\xc6>\xf18}<\x8c\x07\xac=\x89\xd7\xab>\x84 \x82=\xe4\xc5\xe4>\x07\x05:\xbe\xd83\xeb\xbb\x992\xe0\xbe`L\x7f>\x87\xa4\xc6<\x03\x14\r\xbedR\xff\xbeS\x9d\xc7\xbe,\nd>7\xa4\x13>\xd1\xdb\xea\xbcA\xc9H\xbe\xed\xaa\x16\xbcX\xd1p>\r\xb08\xbe#up>\xf9x\xa5\xbe\x19U\xb8\xbd\x91i\x0e\xbf\tj\x8f\xbe\xc4\x82\xe7\xbcqu\xaa\xbd\xeb\x03\xd2\xbd\xb5\xffu>Rn\x9c>q\x1e\x0c>$k\xe5=U\xc8b>\x97_\xb0\xbd}\xbdN\xbcs\x84\\>\xdd(\x8a\xbe\xfc\xda\xee=@?\x9b=9\xda\x8b>\xa4\xc2\x9c\xbe\x17\xfa\x07?\xd8\xd6\xb9=a\xdc-\xbe-,r>\xca\x82\x95\xbe\xa7\rt=@\x83\xc2>\xe1\x1bC={\x85?>\xc0Ji>\xf1!\x15>{\x8c\x9a\xbd\x9b\xbf\xf2=4\x8c\xaa>\xafB\x16>\x97\x0b\x18>\xa4\xaf\xe3>\xd7\x86c\xbeH\xd4\xc3<\xa9U\x98=\x91\xe7\x89=e\xabn\xbc9\x81\xb4\xbd\xc4kp>;E\xe8=,\x8b0>%~s:m\xb5O=u\x1d\x9d\xbe\x8b\xf9\x8c>k\x91\x8f=\xe3\'\x07>\x95[\x04?\xb1\x90\xdb=\xe8/\x95\xbb\x81\x0e\x13\xbc\xab\x16\xc6<\xbb\x1c\xa4>\x18\x97/\xbe`\x9d\xd6\xbc=\xdag\xbb\xa5\x1f\xc1=:\xdb\xa6<\x9b\n\xbc=\x8d\xb3\x02>\x98\xabV\xbc3,[=\xd8\'\xdb=UnI\xbd\xaf7\x99;k\x88z=\x818\x84=\x91\xac<\xbe$e\xb2>\xa5\xd4\xe5\xbb\xb9\xc4\xa4\xbe\xa7\x88r>\xc0\xcfQ\xbd\x9b\nQ>\tQ\x94>U\xf9H\xbeN\xad\x88\xbba\xc3\xe7\xbc\xa6\xef\x03\xbe\xfb\xd8f>m\xb4Y>\xa5W\r=\x1b7\xbb>\x8d\xect\xbdK\xab\n>\x17\x18\xb5=w\x19\x82\xbe\xb0\xc2\x0c>780\xbeU\xbc\xa0\xbe\xc4>\x15\xbe\xcde1\xbd9\xfc\xf8\xbd|\xcf\xce\xbe\x8f\x88\x93>\x8b\xeaq\xbd/a\x96\xbd\xc1!"=\x9di\'\xbe\xd5\x08+\xbc\x11\n\x01?\x8c\xad\xe0=\xa5\x9b\xec;1\xf0\xa7\xbe`&\xb8\xbe\xbc\xa9\x0b=A\xaeB>0%\x91>I\xcb\xeb<\x15(+\xbe\x0bQ+\xbd\x81!\x94>\x0cvW\xbdP\xa5d>\xa7\\b=\x0c\x88\x86>\xf3=<\xbe\xbdp/>\xd6\xb2\x80=\xd5\xf8\xc1=\xf8w>>[\x99\xb6>^\xa6\x9b>\x0eu\x0c>1\x08\x88=4E\x17=\x08\x8e\xcf='
-p1639
-tp1640
-bsV503962556365406208
-p1641
-g2
-(g3
-(I0
-tp1642
-g5
-tp1643
-Rp1644
-(I1
-(I200
-tp1645
-g12
-I00
-S'\x96[5>H\x0c\x1c\xbbozG\xbe9\xd3\xbc\xba\x94\xfc\x15>Y\xa0\x00\xbc\xce\xc1b\xbc\x0cw\x11\xbeMV\x0e\xbd3\xc0\xd2=\xc2\xfdh<\xc7\x1d\x80\xbc|\x8c\xe8=+\x96\\=\xa5\x19q\xbd2kG>S\xc1U\xbdJD\xa6\xbc \x8d\xd2\xbd3\xc4\x02\xbd\xc7+\xca\xbd^$\x0b\xbc\xa6:\xab=\x86;\x9a\xbd$@\xce<X\xfa\x83\xbd:U\xb2=\xabG\xd6\xbd\xf6\x07\x03\xbe\xaaa\x99<\xe2\x1fq\xbdV{y\xbd\x12\xfa\x9a=\x01@C\xbe\xf3\xfe\x8a<\xbe\x96\xf5=\xbc\xb5\xc0=C\xda\xc1=\x07\\\x08>\x04F\x80<\xee\xafP\xbdH}\xe9\xbc\xc60\xde=\xb1\xd2\x12\xbe\x92n\x98\xbd\xfb\x93\xdf\xbcB\xd66>|\xd1\xce<\xc2\xa3P=A#[>\x07G\x14<R\xd0y>\x0e\xd1\x8b\xbd=\xe0\x86=\x02\xa8j\xbe\x16v\xaf=d\xae\x92\xbcH\x83\x9a\xbd\x01K|\xbe\'jm\xbe\x9e\xa8\xfb=\xbb\xa2\xb0=\xbbe\x13=\x8b\xf1\xe1\xbd\xae\xef/\xbb\x13H\xa8=\xf9q\n\xbe\x9d\xa4\xf4=\x14G4\xbd\x02:\xc0\xbd\n\xcd\x83\xbe\xb58\x13\xbe\xae\ny\xbc\xd8(X\xbdvjD\xbd\x8dO\xa8=s\x15\xd1=itl=\xa5\t\xc1=$W\xf6=\xcd\x17\x0f\xbd]\x99:\xbbSQ9>\x94I\xea\xbd2\xc5\x9b=\x130[=\xe6X1>\nV6\xbeu0\x8d>\x8a\xda\xfc\xbb{\'\x02\xbe\x17\x8d<=\xc3X\x12\xbeG\xe5\xf9\xbc\x1aN8>\x1ex\x1e=\xbc\x06\xbe=\xbd\xab\x05>Nd~=\xfb\x9fc\xbd\xaeTE=\xee0">\xef:\xa7=\x90\xc7\xdd=f q>,\xd4\xa6\xbd\xc43\xab<\xe6 \x83=\x8f "=\x84\xbc\x9f<\x84s\x99\xbd=\xd5\xec=\x97\xbf\xcf=\x0bMi=\x93\xdd\xd8\xbc\xb1\x7f\x8c;?\xa7"\xbe\xfa\x98\x1a>\xf1\x1e\x93<0?\x06=%\x1d\x92>\x9a\xb1\x1a=\xb4E\n\xba$\xa9\xe0\xbb\x93J\xbd\xbc\xbcw\xfe=\x88@R\xbd\x9c?\x08:Q\xbcx=\x9b\x8f\x8d=\x11A\xe5<\x82\x99\xec<\xf3qx=\xc5\xf4\xea<,\xa6D=\xe1\xc3\x8b=c\x89\x8a\xbc,\x1c\x9e;\x08\xc8#\xbc\x05?\xa1<\xd6\xbb\xd9\xbd\xf5\x10;>\x13d\x15=T:\x1e\xbe\x95\r\x19>3y\xfb\xba\\\x92\x93=\xac\xb4$>S\x97\x93\xbd\x86\x1ek;o\x88\x99\xbc\xe2\x84\xbd\xbd\x88]\x12>\xa4$\xe0=*\xd4F<\xf4\x0c8>\xd1)\x9a\xbd\xb0Wk=\x8a\xd6L=\xaaV\x1f\xbe\\\xc6\x00=\xfef\x06\xbe\x1acQ\xbe\xb1\xce\x9d\xbd\x00:\xa8<!E\x1d\xbdbrX\xbe\x02\xbb\x1e>\xdbk\xf8\xbc\xa7t\x81\xbd\'h_<\x10\xf1\xe0\xbd\x8b\xb7\x00\xbd\x91\xeeh>~c\xe6<0\xbd\x90;\x11-1\xbe{"F\xbe(\xb9J=\xca\xed\x8b=\xbc\xd6.>w\x1c\x97<O\xb1\xc8\xbdj\x15\n<\xe7\x97\x1c>)z <6\x9b\xc0=\xb7\xeb]=\x99\xb7\t>\x92_\xc0\xbd \x95\x0f>\xb4\xe9I<\xa2\xa7\x83=\x8f\xed\x86=a\xe7\x82>{Y\x07>\xadDB=\x8a\xe3\xf7<\x1b\xd62=\xc2\xae\x9d='
-p1646
-tp1647
-bsV503964215930277888
-p1648
-g2
-(g3
-(I0
-tp1649
-g5
-tp1650
-Rp1651
-(I1
-(I200
-tp1652
-g12
-I00
-S'{\xfb\xba>%\r"\xbe\xa7:\x00\xbf\x15\xd5l=~\xd5\xac>q\x90\xe7\xbd\xab\x10\xa6=\xbaOS\xbel\xfc\x06=\x07\xb2\xdc=\xe0w\xb6\xbcW\xe6\xea=\x90\xe6p>\x87\x97\r=I\xc0\x1e\xbe\x1d\x02\xa9>\x02\'\xdf;j\x15\xa8=\x04gc\xbe#\x93\xff\xbc\xcc\xaa>\xbe\xf6@\xc1<+\x04\xdb=5\x98\xa3\xbe\x85\xb0\x1c\xbc\xf9k^\xbe\x92\xcd\x8a>\x02\xb7E\xbe\x93\x9au\xbe{\xe8v=\x06\xeb\xa4\xbd\x90]\x87\xbd\xec\xe0\xec=C\xdd\xf9\xbe\xdc\xc5\x03\xbeq\xf1\x83>\xb6\x9d\xd9=^]Y>fE\xc4>D1\x87\xbd\xc1\xdb;\xbe\xef_\x01=\x12\xad_>6`\x9e\xbe\x077\x99\xbe\xa0\xdaP\xbep=\xd4>\xad\xa3\x00<\x07\x81\xd1=Z\x85\xea>\xf7\t\t>[\x97 ?\xad\x89\x8e\xbe,\xf5J>\x90@\x9c\xbe\xec\x8f\xa6>\xb04\x1e<gN\xa8\xbe\xe4Gm\xbe\xf0O\xfa\xbe\xb4\xc8f>/E\xa6=\xaa\x80[=Y$ \xbe\x11\xa2[>\x1e\x188>\xbdt\x90\xbeZ\x9d\x04>\x99\xe4?\xbe\x0f~A\xbe\xdb\xa2\x0b\xbf\x944\x88\xbe\xbd+\xb8=\xdd\x1cL\xbe\xbc-.\xbe\xca\xc3Z>\xd5\xadx>r\xbb\x81=.\xb79>7\\\xa0>\xb4@+\xbe,\x0b\xd8=\xbb\xda\xa3>\x8fl\xbc\xbd\xc4SD9/\x0c\xba=3\xf8\xaa>\xf7\xf4\xe8\xbe\x80\x93\x1f?\xdc:\xb8\xbc;\xe9\xb0\xbe\\\xfb\xf4=\xee\xfb\xa8\xbeY3"\xbd.\xe9\xde>\xcbB->`\xee\x03>\xc0\x862>C\x9ap>\x8e\xb8\xaf\xbd\xf1B\xf4=w\xa6\xa7>*\x17<>\xb6o\x8f>\xbc\xc3\x9f>\x9f\xad\x89\xbe]\x9f\x12=\x95\x98\x10>\xc4\x91\x94=m\xef\xeb=d8\x1f\xbe\x0b\x9c\xd1=\xcdYG>W~\xf4=\xb9d\x91\xbd\xd4=,=L/\xf6\xbe\xc0\xb1\xcc>\x87]\xa6;\x1a\xf3n\xbdU\xc0\x08?\x9f@\xda=Qc\x0f\xbd\xda\xc2\x9b=\xe0\xfdZ=\xe0\xac\xae>\x00\xfeb\xbe\x91\\\xd9\xbd\xe1\xcb\xd1=U\xef\x00>\xb3{;>\xf1\\\x12>}0b>\xc6\x82\xaa<\x1d\\C>\x1b\x0b\x9b>/\xb1\x80<r\xc9\x83=\xdac\xac<\xd0\x0eu=\x00\xa7\xa1\xbeg\xa9\xfb>\xf5\x16+\xbdO\x99\xfe\xbe\x83\xc0\xf2=\x14\x10L\xbe\x8f\xcdt>\xf6\xc4\xae>\xde\x81\x03\xbe\x81\xf9\x07=\xde\xba\x07\xbc=\xda\x88\xbd\x19 W>#\tI> \xc96>\xc7\xb6\t?\x04D[\xbe\x8fA>>\xbe\xf1\x12>\xbc\x8e~\xbe\xe0U\xd5=L\xee\x8c\xbe\xc4\xf1\x03\xbfv\xcdj\xbe[0K=\xf1\xc4\xeb\xbdPF0\xbfkq\x97>\xfd\xf8\xff\xbd\xc5!\x96\xbd%\x95>>mC\x83\xbe\xd4\xa8\xbc\xbcw\xb2\x0e?\x01\xf1\x04>?\xdb\xea\xbb@\t[\xbe\xc3\xd2\xd9\xbe\x8a2F>\xef\x90\xd0=\xc7\xec\xcb>\xe5\xd2\x96=\xa1\xaf<\xbe\x93\xd5\\=,8\x84>\x13oj<\xd7\x92\xcd>]\xc5\x14>&\xc3f>a`\xac\xbd\x87\xab\xbc>:\xf0\x07>?\x14\x88>z`d\xbd\xdf$\x05?l\x04K>\xd9I\xe3=\xdf\xf1\r=\xa1\x07\xb6<\xfe\x15\xd4='
-p1653
-tp1654
-bsV503970264494141440
-p1655
-g2
-(g3
-(I0
-tp1656
-g5
-tp1657
-Rp1658
-(I1
-(I200
-tp1659
-g12
-I00
-S'{\xab|>\x0eIL=u\xc8\x8f\xbe\xbd\xd9\x1d=\x10\x17\xd3=\x08\xbb\xe7\xbc\xb1\x96\x12\xbd\xf4.\x1d\xbe\xb6\r\xd6;\x8b\x1c\x12>\xd0\x89Q\xbd\x18hY\xbd\xe8\x99@=\x11@\xcf\xbcD\x108=\xd0\xf1j>\xd8ed\xbdZ\x85\xa3\xbd\x11A\x03\xbeN(\x7f\xbd\\}\xb9\xbd\t\x97-\xbd5\xe3\x0e>\xf2>\x1c<=K\x03=0\x10n\xbd\x03\x1e\x00>*Y\x19\xbdN\xec!\xbe\x85\xc3\x9c\xbd\x07\x93\xcf\xbd\xe8\xda\x03\xbd{=\xf6<\xa5\xd6\x8f\xbe\x17\x93\xe9<\xcd[5>\xc0d\x0e>\x9c9\x05>\xa6\x92J>)\xe3<\xbd\xfc3\x1e\xbe\x9a\xdbP\xbd\xb0^:<\xfd;\x9b\xbdEgA\xbe.\xf3\x98\xbd\xbc\xc8r>1|\xa0=Z\'\xb5=\x7f\xfa\x94>\xeb\x1d\xc9\xbc\xcb\x1b\x88>\x04q\xd6\xbd\xbds7=\x9bJs\xbe\xce\xeb\xa8=X\x0fh<\xba\x8d\x85\xbdN5\x9b\xbe~K\x9a\xbe\x1b\xdb\xd0=;\x85y>\x8az->\x8dV\n\xbe\x8b\xda5=\xc1J\x95=\xb7\x191\xbe1\xe1P>A\xe9f=\xbd\x8c\x0c\xbe\x16\x82\xab\xbe\xba\x9a\x95\xbe\xc5\xc8 \xbe\xe9{e\xbd\xf4\x89\x95\xbd\xb7\xfd<=%\x0c\x80=)M\x96=\xa5S]>\x97\xcc >O\x9b\x80;\xb9\x17M=\x0f\xe0t>\xe3WE\xbe\x80\xa8n=\xe4 \xa8<y\xef0>\x83l^\xbe\xcb\xfa\xa4>\x99!\xb7\xbd\xf2\x92F\xbe\x1d\xfa\xf5=8N\x15\xbe\x0cw\xc1\xbd\xfaZ0>\x01\xea\x82;\xc5\xd6O>\x97\x1d\xf7=\x96v\xc1=\xda%\xe6\xbd\xd1\x89\xae;\x9d\x1c(>\xa3=\xe2=\x86\x12$>\xe0\xc4\x98>\x9cg%\xbe \xdd\xb7\xbcv\xb8E>\x94\xe6\xf9<\x05\x95\xa2\xbc\x04\x8di\xbeM\x95\xbf\xbb>WC>\xa9\xd5\xfe=\xc7T|=^2\x9a\xbc`mx\xbe\x80\xe3\xd4=\xc8N\xea\xbc6\xfb\x0f\xbd\xa8\x9b\xa5>_\x90\x16>p\xf1\xac\xbc\x8a\x00c<LZ\xd7\xbb\xe0\x05)>\xc1p\xa0\xbd\xae\xffN=\xd8\xb4\x83=\x1f\x1d\x08>\x1dc\x8a=\x8bB\xab=\xb0\xc4$=\xa3\x800=\xf5\xa6=\xbds\x19\x88=\x86\xd8\x86\xbc\x02\xe5\x1d=>\x9eR\xbe\xb1\xe2\xad\xbc1\x86=\xbe\xbdgV>\xfa\x01\xc5=uG\x89\xbe\xec\xad=>\xa8&z<\xf8\x97 =\xdcE\xbb>\xa7\x87\x87\xbd,\x83h\xbcFR\xba;wD\x8c\xbd\nl\x19>\xb6\x0b\xee=\x9c$\xe1\xbc\x99>\x97>u\xa0 \xbe\x111\xb2<\r\x9f\xb3=5\xd1r\xbe~\x94\x93\xbd\x83[N\xbe&~\xae\xbe"E\x16\xbe\xa7*\xf7<\x84\xaa\xe4\xbbd\xbf\x90\xbe\xdern>\xda\xdd==\x91P\x81\xbd\xc6\x1d`\xbc\xff\xa1@\xbeW] \xbe\x94\xe3\x83>;\x97\xe8<\x8f\x8c\xc2=\xb6\xef0\xbe%Q\xa3\xbel\xce\x04>\x92\xe9\xc0=\xeeVV>W\xf0t<\xbf_\x18\xbe\xa1\x1f8\xbd\xa7\x05\x84>\x13\xcb\x80<\x1805>\x01\xde\x8c=\x1e7G>\x10\xff\x94\xbd\xca\x8a >4\x14\xce<\xff\xf4\xf7=qD\xb7=\xde\xf3\xa9>\xfd\xb0X>#O\xab\xbb\xb0\x18\x99<\x16J\xa7=\xfaP\x8b\xbd'
-p1660
-tp1661
-bsV503979679565357056
-p1662
-g2
-(g3
-(I0
-tp1663
-g5
-tp1664
-Rp1665
-(I1
-(I200
-tp1666
-g12
-I00
-S'\x879t>d\xff\x02<\xa5b\x90\xbe\xd5T\xbe\xbc\xe2\xef\x15>\xe1 V\xbd\xd0\xa8}9\xce\x9b6\xbe:t~\xbd-\xfb\xee=\xb4(\x06<\x944\x9d\xbc\xda<\x01>UY\xc7<\x93\x96\xba\xbd\x07\xf4@>\x0e\xbf.\xbd\xbf p\xbd\xc9\x83\xc1\xbd\xcehB<l\x9f&\xbe\xbaZ\x90<\xaa\xeb\x88=yJ\x05\xbe\xd4\x07|\xbb)C\x84\xbd\x9b"\x17>\xd5\xe7\xef\xbd\xeb(>\xbeXz\x14=c\x18\x15\xbdz\xde\x7f\xbdW&\xa6=\x9d\xc0R\xbeIb\xcc;\xe2\x974>\xcb\xd0\xb1=y\xb7\xeb=F\xb5\\>\xa7\xcd\t=\x05\'\x89\xbd7?O\xbc\xdaQ\x06>\x168V\xbeH\xbb\xe4\xbd\x01\x9d-\xbd\x8c"[>\x9e\xab\xb5<\x068G=T\xb1\x86>|a\xad<o\xc1\x8b>\x90\xf0\xe8\xbd5n\xd9<~\xbe\x82\xbez\xbb\xf5=~\x89\xea<Ii\x90\xbd\x0b\xdf\xa3\xbe\xef\xaf\x8c\xbe\xfa0.>\x12\xc0\xf0=|$\x05="X\n\xbeZ\xea\xad\xbc\xd4\xbd\x10>\t\xc0\xfa\xbd5\xf9\x08>E\xfb\x02\xbe7F\xad\xbdYS\xb5\xbe\x84\xc3P\xbeC\xce~\xbc\xff\xc5\x93\xbd\xf7t\xc1\xbdS\xcd\xcf=\x08(\x0b>|\xe3\xb0=v\x91\xea=~|\x13>h\xbcC\xbd\x12\xcf[<R$V>\xdfI"\xbeu\xe6\xa3=\xebD\x89=\x1f\x98%>\r,Y\xbe\xacS\xa0>p\xe0\xaf\xba\x00\xb8\xfd\xbd*\x94\xda=%h9\xbeQ\x7f\x99\xbc\xbf?L>,\x0f\x86=dg\x00>\x1f\x14\x1f>\x1a\xf9\x7f=[\xe97\xbd\xc7ko=\x16\xe8\\>\xa6m\xbf=\x9b\x82\xdc=+\x8e\x85>\x86R\x1c\xbe^\x9c\xc9;p\xc0\xbe=\xaf\xfdL=\xd4\x1f\x89<sA\xd0\xbdUB\x04>\xe4\x91\xe0=\xc1\xa4\xeb=\xe0\x8b\x1f<\xa8\xd7Q:\xbe]U\xbe\xd8gN>\xeb\x85\x15\xb9\x8e\xfc\xa1=\x03\xfc\xa2>\xef-\x91=?e\xe1\xbc\xbbA\x90<\x06|\x14\xbd\x00\x900>|>\xe3\xbd\x9b\xe4=\xbb]\x84#=\x0e\x94\xaa=\xf0+4=\xd0{\x94=\x0cF\x8e=Dp\x07=\x03\x00\xb3<84\\=\xd84<\xbdEE\xd0\xbc:0\xaf;i\xe0\x82=\xefm\x0e\xbe\x84\xb7S>7\xa7\xe6;{Ep\xbe\x84,@>\x92c\'<\xf4\xb3\x0e>\x08\xcbi>\x7f\xb1\xae\xbd\xd3D\x13\xbd\xf3\x1e\xc7\xbc3\\\xd4\xbd\xa3R[>\xcc\xd2#>\x93b\x82\xbb\xd3Q\x81>\xdf\x83k\xbd\x1e9\xc1=\xe2GR=c\xef!\xbe,8 =]\x07,\xbe=\xee\x80\xbe\xf2-\x13\xbe\xe7\x19\t<\x08$\x9f\xbd\xca\xf7\x94\xbe9\xdc">\xcdO6<L\x10\x85\xbce\xd0o<\x846\x14\xbe!;:\xbd/\xbc\x97>]b6=rU\x96<\x93\x11w\xbe\x9d\xef\x93\xbe\xf1\xcc\x1e<\x9cz\x93=\x90\x888>\xb3U2;0\x98\x0e\xbe\xa7\x92o\xbd\x1b\xbd@>3Z\t\xba\x08\xb8\xff=6\x919=4dO>[\xc9\xe6\xbdZ\x19\x10>\xe2\x1d\xbb<o\xad\xd6=\xd4\xd1\x07>\x1a@\x96>EmO>\xeec{=H\x851=\x16\x9bP=B\x9d\x8f='
-p1667
-tp1668
-bsV503960300702662656
-p1669
-g2
-(g3
-(I0
-tp1670
-g5
-tp1671
-Rp1672
-(I1
-(I200
-tp1673
-g12
-I00
-S'\xcb\xbd\x14?SZz>\x8a\xa0\x0b\xbf\xe6\xa6e\xbd[y\xb6=\xa3X\x8b<\xb8\x8c\x86\xbdLj\x89\xbe\']\x0b\xbd\xe3\xeb\xa1>V3 \xbe\xbeQT\xbe\xb2\x95\x08>\xe5\xb8=\xbe\x1c\xd1">\x0ep\xc8>3\x95\x11\xbe\x05\x1c\xa9\xbe\x82\xc7K\xbe\x15Vc\xbdd<M\xbe\xddL3\xbc\xdf%\x89>)v\x14>l\x90\x82=\n\xc1\x87\xbd\xc0@<>?S\x8a=\x05\x03\xa4\xbe\xc8\xd8_\xbe\xb0\x7f\xd9\xbd\x83\x0c\xea<\x92\xcfb\xbd\x13\n\xeb\xbe`\xa0\xa0=\x85\xbd\x9c>E4\xb0>~\x1dm>g\x18\xbb>\xab?x\xbd=\xe4w\xbe40\xef\xbd\xfaGu\xbd\xd20\x03\xbeOm\xb6\xbe\xc1\xdc\xfe\xbd\x13\xc9\xe0>\xe2\xd9\xf3=O\\\xcf=\xdf\x19\x16?\xb8\x90\\\xbd\xe0R\xda>\xd64\x88\xbeD"\xfd<q\x9a\xe2\xbe\xdf\x13\xbb=[|\x07>\xa0\x86\xb8=\x16\x8c$\xbfN\x1d\xf1\xbe%Wn>\xdc{%?\xba\x96\xc2>\x15\xc7?\xbe\x16\xda\x0e<\xba\xc5.>\xe9tx\xbe\xa1\x85\r?\x90\x91/>\x11Iz\xbef\x94\x07\xbf}\xda\x1e\xbf\x9b\x92\xe3\xbe\x006H\xbd\xd2v/\xbe\xea\x92\x18;{\xd4>\xbc\x8b\x1a3>\xc8\xcb\xbd>\xeb\xe3^>\x87z\xda=|\x87&\xbc\x001\xe9>\xd7\x01\xb5\xbe\x1b\x9b\xc0=\x83\xf5\xe3=\x86bq>\xaaB\x83\xbe\xe5\xc8\xe1>\xab\xf1V\xbe\xfa\xc2\xa8\xbe\x95\xc0z>\xdc:v\xbe\xe5\x8c\x97\xbeJp/>c\xb0W\xbc\xbdl\xba>\xd0\xd3s>B\x0e\x8f=T\xa6]\xbeHGx\xbd\x8f"->=\nJ>k\x02\x80>\xe5Y\x03?h\xf7\xa6\xbeo\xf4\x04\xbcE\t\xfd>\xbd2.\xbd\xae\xed\xdf\xbdl3\x15\xbf\x15>\xad\xbc\xdf\xa1\xe5>\xef\xfa\x99>\xda\xff6>\xe5\xa2;\xben\xa5\xc8\xbe\xae\xf0#>\xd2(\x14\xbej\x95)\xbb\xb5\xcd\x04?\xc5\xac\x8a>&\xde\x03\xbea"\xae=\x0c(\x0b<\xcf?t>6\x8e<\xbeZ\xa6E>\xee\x07\r;)\xa9\xfe=v\xf9\x16>6$o>\x17\xab\xa3\xbc\xa9\xc2\xb5=\x9dE2\xbe\x9d\xef\x0e<I\x03[\xbd\x86\x88\x06<\xc3\xc4\xef\xbe\xf6\xf7\xad\xbd0\xff\x84\xbeU\x96\x8b>\xfa\x9a\x98>\xdd\x1c\xef\xbe\xb8\x88\xe7>\x1a\xf8W>\x95\xc3\x92=\xf1\xecI?%\xf0\xb3\xbdOg2\xbd\xbc(\xb7=\xafo\x02\xbea,\xb5>D\xa7\x84>C\xb8\xce\xbd\xad\xd3\xdd>\x7fRw\xbeu\xbc/=,N%>\x04B\x06\xbf\xa9_\x86\xbe,\xac\xa8\xbe\xbe\xc0\x08\xbf\x8f$\xbe\xbe\nE\x02>\xd5x\x01\xbe1G\xfc\xbe\x08\x16\xa4>\x06\x91\x80>\x14Y\r\xbdVd~\xbd5\x9d\xa7\xbe\x12\xad\xbc\xbe\xd1\x01\xf4>\xc7\x97\xf0<\x03\xecm>lq\xa5\xbe@\x030\xbf\xbe\xe6*>\x02\xda1>\xc8\xef\x97>^\x97\xb3\xbdo\xa9\x94\xbeN\x05\x9c\xbe\xe7!\x00?\xb8\x8a\xa3\xbd\xd2`\x89>\x91f_=\x16\xf8\xc3>\x1aY[\xbd\xc2\xe1\x11>OV\xa1;\rP\x80>\'\x0e\x8a>\xa8Q\x17?\xdd\xb0\xf8>\xd1\x8f\x15\xbe\x99\x96b=\x141*>\xcb\xc6\x11\xbe'
-p1674
-tp1675
-bsV503971576534933504
-p1676
-g2
-(g3
-(I0
-tp1677
-g5
-tp1678
-Rp1679
-(I1
-(I200
-tp1680
-g12
-I00
-S'\x16\xc6\xa0>\x05\xf71<sJ\xb7\xbe\xf7z\x80<\x93@6>M\x87\xda\xbc\x18\x9di\xbd,vP\xbeA\xfa\x16\xbc\xfb\x10g>/\x9e\x84<\xfdb\x96<\xb5Q\xd0=\xd4\xc8Z<-v*\xbd\x9b\x9b\x89>G\xf0\xad\xbd\xf3\x1f\xb6\xbd\x8e\\\x0c\xbe\xda\xbe\x0c\xbd\xb0L@\xbe\xd3\x1e\x91\xbcN!\x0c>\x8b\xd6\xee\xbd\x00y\xd3\xbch\'\x8f\xbd@x4>w\x9f\x1d\xbe[\xe8Z\xbe\xc9\x00\x05=\x0b+H\xbb3\x92\xee\xbd\x1d\x1c\xc3=#6\x91\xbe/\x02\r=\xd9y\x8d>\xcb\xcb9>\xa5\x0f\x07>u\xce\x97>1^\xc9< u\xfa\xbd\xf1\x95b\xbd\xed\x02<>[\xa2C\xbe\xb1\xb8\x1f\xbey\xc3\r\xbdGk\xbc>\xd3\xd1F=.\xdd\x84=\xa5\xe4\xbf>\x84\x88\xb5<\xf3\x90\xbe>%e \xbe\xed\x12E<k\xe1\xd0\xbe=\x9b1>\xed\xc8\x1d\xbb\x94\x8b\xb4\xbdX\xcf\xe4\xbe\xed\x90\xbf\xbe(\xc4E>i\xc6W>M"\x88=\x7f\xf4R\xbe%\xd1,\xbc4\xfe\x1f>m\xadd\xbe\x8e\xf6\x84>wk\n\xbe\tS\xe9\xbdT\x05\xe2\xbe\x8d\xc3\xa0\xbe \xf2z\xbd\xdb\xc3\xd6\xbdX\xad\xbc\xbd\xdf\xf9\x1d>\xac=)>\xa7\x7f\xc0=}t\x1d>\xc4\xb7\x18>t\r\xdf\xbcM\xeb#<\xb8\x1d\x92>i\xea\x7f\xbe\xc2\xc6\x04>\x81t7=p\xd2\x7f>\x1f\xee\x96\xbeh&\xe1>\xfbO&=\xe9\xdbC\xbe\xc3\xf3!>\x8f*[\xbeAZA<f\xfd\xa4>\x9b\x07\xd2\xbc\xc3\xec%>8\xf9F> 1\x17>\x93\x9b\xc2\xbdu\x14)=YEq>w3\xde=#S\x07>\xb0;\xbf>\xfd\xa9]\xbe\x1a\x04\x93<3\x89\xf0=\xdc\xb3\xa1<\xa3S\x04\xbd)0S\xbe\x88\x7f\xfe=i\xa0F>\x0c\xbd.>\xa53\x8a=\xa5S\xa5\xba\xf4n\x8e\xbe\xc4VX>Hj\xef<\xd56\'=\xfc\x88\xe7>\x855\xf5=cj\xf2\xbc\x89\xa1u\xbc\x85v0\xbc\xcf\xcd}>\x917\xb8\xbd\x10\xbf\xb8<\x05\x93>=\x0by\x80=G/\xb5=%/\xa9=\x05(T=\xe7\xeb\xe7:E\x95\xc2;\xd8\x04\xb7= \x99}\xbc\x97\xc9\x1b=\x1f<\xa7\xbd\xc9\xd7%=\x10c\x1e\xbe\\\xf7\x8e>\xd1\x95-=\xdc9\x9e\xbe\xd7\x9fu>\xdd\xc2<\xbc \xea\x0c>\x19\xf2\xa5>L\x86\t\xbe@\xff\xaf\xbb\xfa\xc5\x86\xbcH\x0e\x0c\xbe\x97\xb8=>\'\xe9/>i\xbd\x8d\xbc\xeb\xe3\xa0>\x85n\xe5\xbd\x81\xc3\x9d=\x9a\x9f\x9c=\xf3\x81\x8c\xbe\xe5<1<\xf7\x0cR\xbe{\r\xb2\xbe\x90\xe9\x13\xbe\xb5O\xf9;0I|\xbdW\x91\xb6\xbe\x05\xda\x9b>G\xbd\xca\xbc\xab\x04\xaf\xbd`\x0b=<g\xf2 \xbe\x08,\xae\xbd\x84x\xe4>e\xff\x81=\x03\xb2X=\x88\x00\x83\xbe\x9d\x18\xad\xbe9\x81\x80=\xa9-\x03>]\xab|>#9\xf0<\'-(\xbeH\x1d\xb5\xbd\xe3\x7f\x85>\xe8\x1d\x80\xbc\xa7\xb7F>\xf0\xb0N=M\xc0x>\r&\x13\xbeP\xbc\x18>\x0f\xe1x=\xda\xad(>\x17\xe6\t>\x9d\x8c\xc9>\x01\x7f\xa0>\xa7\x0cF=\xdb\x1f\\=\x01\xf4k=\xb9\xf5\xb5='
-p1681
-tp1682
-bsV503969860208951296
-p1683
-g2
-(g3
-(I0
-tp1684
-g5
-tp1685
-Rp1686
-(I1
-(I200
-tp1687
-g12
-I00
-S'\xaax\xc5>\x10g\x9e=\x08\xa1\x8a\xbe\xc6\x17o\xbc\xa0\x8eA>\xa5\xf1\x9e<Y\xaa1\xbd\x05\xf0g\xbe\xb8\xcb\x95\xbdXEr>(\xb4\x98<\xb8\t\xb4\xbd\xcc\x00->\xd62\xb2=\x83\xdc\xb9\xbd\xc6\xfa\x91>n\xcc\xa3\xbd^\x88\x94\xbd"M\x10\xbe\xdd\xc4\x89\xbd#\x89\x04\xbez@\x8c<\xb5\xb7(>\x10\x8a\x80\xbd\xc2\x1c\x81=\xcd\x8b\x87\xbd\xd0T\xab=\x91\xd6\xaa\xbd\xda\xccg\xbe\xd3tU<\xd4\xd7\x80\xbd\x03\x9c\xd4\xbd\xce\xed\xeb=\x1f\xe7\x85\xbe\xcd\xc2\x93=U\x0c3>\x8e\xec;>\x8dp\xf6=b\xfbW>b\xcdO=\x1e\x84\r\xbdZ\xebZ\xbd2\xf6.>m#c\xbe\xe0\xe1\x92\xbd\xd0\xa3\xe8\xbc\x98r\xa5>\xb2\rJ=N2*=j\x99\xc9>\x9a\xd3A\xbd9\xd3\xb4>\x8e]\x05\xbe\x0e\xe2\x9c=V3\xce\xbe\xd7\x03\x9a=\r\x0b";\xc0k\x0b\xbc\xa8|\xe2\xbe\xce\x00\xa2\xbe\x91\xff;>\x1a\xa82>p\xb3\xb0=0n&\xbesI\xa1\xbdm\xf5\xca=c\xe5E\xbeJ\\\x84>s\xd0\xd5\xbbN\xa0\x1e\xbe\x00f\xca\xbe0od\xbeu\xbaQ\xbd\x858\xac\xbduH\xad\xbd\x86\x19\x9d=B\xaa\xe8<3\x8d\x04>Mf\xf9=\xe82\xe2=\xd9.\x1b\xbd\xeck\x93\xbd\xa6\x10\xa1>\x02\x81B\xbe\xe4C\x0f>]6\xe8=\xfa\x96\x82>\x90m[\xbeJM\xbd>riQ\xbd\xec\xc4\x1d\xbe\x8a\xe2[=\x07-\x81\xbe\x1e\xee\x7f\xbdsiY>\x86[\x9a=\xca\xa2\x1c>#\xba\\>~\xe1\x00=\xf0\x89\xe5\xbd\x01\xb4(=XEY>@\xa8\x02>\x07\xc7\xca=\xe7\xbf\xa8>\x90S\xe5\xbdB\xf4&=\xe2M!>H\xf6\x16<\xad\xba\x00=U\x05U\xbe\xbb\x90D>\xa0\x8f^>\x92\xbc\xa9=\n\xa1.\xbc*\x03\xe2\xbc`5c\xbes\x8el>\x93>\x8d=N&\x89=\x15\x93\xc8>\xf6\n\xb3=\xaa\xba#\xbdB\xb4\xb6<P\xeb\x7f\xbd\x05\xf0/>sN\xd9\xbd\xa4\xda#=}i}=\xf2\xaf\x93=E\xe4\x13=Zn\x8c=\x84b\xc7<\x9f\x04C=\x02\x92\x88=4\x11J\xbc\xc8\xc2\xe8\xbc\x1a\xa98\xbd\tZ\x93\xbd\xac%\xaf<\xd6\x8c\x11\xbe\xc6m\x13>\xeb\xf2\xe6=[Cm\xbe\x06\x12\x91>\x9e}"=*\xf0\xbb=oe\x84>}\x8d\xcb\xbd\x0cK\xa5\xbcX\xbb\xe8<b\xd5\x07\xbe\xed\xc4p>&5\x18>\xb0\xb5\x7f\xbc\x9d.R>\xe7\x85\x93\xbd\xcez\xb7=8f\x03=N.\x82\xbe\xb8|"\xbd\xab\xdda\xbe\xb5\xe7\xa5\xbe\xda\xa3\xbc\xbd2d\xc2=\xd3\xa4"\xbd\xb5.\x90\xbe\x12.f>\xd1)\xa2<\xa8\x82\xda\xbd\xea\xf2\xc2\xbc\xd4\xe8,\xbe\xdd\xfc^\xbd\xd2&\xbb>\xfb;\xb7<m\xa9\\=\xc9\xe5\x8d\xbe\x81\xe1\xbd\xbeTy\x94<\xc3\xe0\x0b>\x96\xb2j>S\xb1\x18\xbc}\x05\x1b\xbe\xb8%\xa9\xbd\xd85q>\re\x1d:\x1bX\xd3=\x8fOH=R\xb8J>\x8a\x90\xd9\xbd\xa2\xf7G>]\xa9[\xbc\xd5\xef\xeb=\xadd\x08>k\xcf\xdd>\x85[i>\xf5\xc6\x18\xbbG\xba\xa7=Kt\xd3=\xa2\xa9?>'
-p1688
-tp1689
-bsV503963437610065920
-p1690
-g2
-(g3
-(I0
-tp1691
-g5
-tp1692
-Rp1693
-(I1
-(I200
-tp1694
-g12
-I00
-S'.q\xae>W\xaf\x06\xbe!\xcd\xce\xbe\xdd\x00\x00<C\xc6\x98>\x1ev\x9f\xbd\x82\xc7\x19=l\x19D\xbeQ \x0f\xbd\xf4|\r>\xean\xa6<\xde\x9b\x06=_^o>\xc5\xc4\xdf<\xb8\xe4\x11\xbe\xbf4\xa6>\xbd\xdc\x9e\xbb_&\x8c\xbb\x82\t/\xbe\x0c\xf3^<~\xd5]\xbe\x97\xf7\xf6<S\xc6W=\xd1h\x8c\xbe/\xf9S\xbd[\xed\x0e\xbe\xb7\x17Q>\x9djY\xbe\xbcw\x8a\xbew\xdb\x80=X\x05\xcc\xbd\x11 \x87\xbdg\x93\xeb=\x00\xc3\xb5\xbe\xfe\xedg\xbd\x1a\xd0w>{\xeb\x17>\x0b\xe9\n>2\xc8\x9a>\xf3\xf0\xb4<\xdf\x91\xf2\xbd\xf5<y<\x92vQ>\xf7w\x9e\xbe\xa2uM\xbefW\xee\xbd\x8ev\xbe>t{\xa0<\x99o\xb5=\x82\xe8\xc8>\xa5\xc1\xee=\xfc\xea\x06?\x99\xc5u\xbe\x05\xbb\xce={\xef\xb5\xbew&\x89>v[\x1f<\x17\x00R\xbe\xdbL\x9c\xbe\x196\xcc\xbed\xf2[>3I\xa4=&\x07\x06=\x8aj!\xbe\x8b\xf9\xf7="\x93e>\t\x80D\xbe7j%>\x05\x08\x82\xbe\xe1\x83G\xbe\x9a\x89\xe4\xbeu\xd5i\xbe\xae&{=\xbep\x0b\xbe{\x9e\x11\xbe#\xf4I>\xba\xf0\x8a>D\xb2\xfd=k\x85\xc2=\x998\x8e>\xbb\x03\xc6\xbd\x19U\xb4<\x18E\x9a>s\xf8\t\xbe\x81\xa3\x04=\xcbK\xb0=\x0eJu>3\x7f\xbb\xbe\x8a\xf8\x06?\x9bD\xf4<\x9d\x1c\x7f\xbe\x7fa\x18>{A\x8a\xbeZ\xa1\xae\xbcI\x96\xbd>\x8dl\xca=a\x97\xf7=\x8c\xa86>\xd9\x1c5>\x0b\xa1R\xbd\xbb\x16\xce=\xdc\x17\x89>\x7f\x1a(>\x0e\x97b>\xf3z\xa4>\x12\xdcp\xbe\xeeq[=+e\xcc=A\xf1w=\x1f\x0f\x89=\xe0\xaf\xe5\xbd\t\xf7$>\x17\x1a\xd4=\x85\x99\xd8=*\x12a\xbd\x83\xeb\x91=$\xa4\xc1\xbe\xe4\x05\xa5>ai\xdc<\xc8\xf4\x06<X\xd0\xf9>\xeafU=4\x1a\x96\xbat\x85\xb8<\x13k\xbc<,\x1c\xa1>\xc5\x8aa\xbeo\xc5\xa1\xbd+\x19\x16=\x8f\xba\x87=\xa1\xe0W=\xce\xf2\xe7=\xd8\x9eH>E\xc8\x1d<\x1a\xce\r>\t\x9aQ>\xa6a\xd2\xbc\x07\x8c\x13=D\xd6}=\xec\x7f7=\xd5dX\xbe\'\xa1\xc0>\x17\xb2j\xbc\\\xa0\xbb\xbe6\xa8->\x94\x7f\xdb\xbd?@M>\x00q\x97>\x9a`\'\xbeA0:=f, \xbd\x8c\x99\x94\xbd\xc5EX>\xf5\xe17>\xdb\xa0\xdb=^\x18\xd4>\xd7\x1d\xed\xbd%\xcb4>\xb3a\xd8=[\xb5q\xbe\xe1>\xd6=7\xd91\xbe\xc9\xf5\xc6\xbe\x16\xd6`\xbe)\xb3\x18=\x12\xcb\x08\xbehp\x08\xbf\xc4\xb5y>9\xef\x07\xbe\x92\xf5\x90\xbd\xe1\x1a\xff=f\xa6Q\xbe\xaf\xb7\x14=\x1b\x83\x02?\x12\xb5\x1a>\x14I\x98\xbb"\'d\xbe\x8c\x19\xaf\xbe\xa5p\xc2=\r2\x14>\xa0\xbf\xab>()p=\xfcP$\xbe\xc0#\x0e\xb9\xfe\xfc\x87>\x81\xca?\xbd\xe9\xbd\x92>i9\xcc=!\x01B>\xe0&\x9a\xbdl\xfa\x86>Z\x99\x84=\xef\x130>\x08Q\x90;pB\xc9>\x1f\xc8M>=\xda\xeb=\xa6\x84u=\nZ\x91=0\x8c\xfa='
-p1695
-tp1696
-bsV503964024149512192
-p1697
-g2
-(g3
-(I0
-tp1698
-g5
-tp1699
-Rp1700
-(I1
-(I200
-tp1701
-g12
-I00
-S'\xd2\x01\xf6>\xea~\x8e=\x0c\x01\xf9\xbeLD\xfd\xba\x0e\xdd\x88>g \x9e\xbd/\x9c\xa7\xbd\xa2\x1b\x83\xbef\x933\xbd\x8dy\x81>8\xff4=\xc6\x94<\xbc\xf0i\xf1=r\x8a=<\x96m\x96\xbd\xc7\xdd\xdf>\x82\x1c\xc8\xbd\x15\t\x1d\xbe\xeegG\xbe\x80\t/\xba\xaa\xe4\x85\xbe=\x12\xca<\xea\x03\x10>\xac<\x11\xbe\xa6\xc9C\xbd\xb5\xc1\xbc\xbd\x0c\xe0[>\\\xcd\x81\xbec\x0c\xa5\xbez\x84\x02=i\x05E\xbd\xb4 \xc4\xbd\x17`\xea=*\xa3\xa0\xbe\xf5\x1c\xa4={S\xab>\xd7\xb8u>]\xa9<>\x13\x9e\xbb>\xe2&3=F\xc7"\xbe0\x01\xb8\xbd\xb8tS>\x12\xb3\x91\xbe\xad\xb5D\xbe$\x8d"\xbdHw\xdd>1M2=\x92\xf6\xdb=\xffX\xf4>Jp\xeb<@\x1a\xee>\x99\xe5S\xbe\x9bL\x18<\xa2^\x07\xbf8rA>q\xb0&=\x1aS\xa7\xbd\rE#\xbf8\x97\x00\xbf\xd1\x88}>\x08W\xad>\x98n\xd8=\x0b\xa8^\xbe\x1a\x15\x99\xbc\x1a\xe5P>\x16\xa5f\xbe\xe82\xc0>\',=\xbe\x9b\xadA\xbe\xc6\x9d\x1a\xbf\xbfq\xc3\xbeR\xfd\x17\xbe\x1f\x97\xd2\xbd-\xf9\xe5\xbdL\xa8U>\xebLv>N\x81!>\x03zK>\xcc\xacw>6\xaa\x03\xbd\x18\xf9\x0c\xbd\x7f\x02\x9f>\xfe]\xb3\xbe\x06H >\xa4<\x8e=\xadl\xa5>v\xde\xa8\xbe/I\x12?\xf9D5=E\xb9R\xbe\xbfM\x83>%%\xa3\xbe\xc4Q\x85\xbc\xae3\xcc>\xa7\xad\x03=ic\x81>\x9f\xa6\x8a>\xa5\xbb\x13>\xdbk\xf9\xbda\xf6#=\xcf \xad>x\t\x18>\xb49%>\x94~\x08?\x81S\x86\xbe3\xc4)=G\x82Z>\xb2g\x8f=\xca\xe3\x00\xbd\xfe\xe7\x88\xbe\x16\xc0<>\xdb\xfe\x82>\r6J>R\xfc\xa3=hCE<(\x96\xbd\xbe\xa9\xf9\x8e>\x9e\x82[=\xd6\xff\xc8=4\x0b\x11?\xb2h#>\xcb\xa5J\xbd!F\x1b\xbcz#\xb1;0\x17\xa3>\x92\x14.\xbe\xccv\x8b=\xf0\xfd\x0b=\xc4j\xa4=\xae\xa4\xf9<{!\x05>\x9c%\xc8=\x92&\xb1\xbc<_\x93\xbb\xe2X\xc1<\x1f\x9d\x1a\xbdo0\xd8;\xb6q\xb4\xbd\x94\x82\\;\xda\xf2O\xbe\x11\xa9\xa4>\xc6\xfd\xb4=\xce\xe4\xbe\xbe\xeb\x92\xc7>\xe3\x97n=\xf0\x1c&>F\n\xf3>\xc4-7\xbe \x13a<T\xd3\xa0<\xce\xb1\x17\xbe\xb1\xf4\x91>\nzo>p\x1e\xe9:A\xc0\xcb>\xb5M\x0b\xbe\xbf\xc2\xe0=)d\x15>z\x1b\xb5\xbe\xfe\x0bM</\xa8~\xbe\xd4\xcb\xce\xbe\\\xb0`\xbe\xb0i\x03\xbc<p\xb2\xbd\x02&\xe7\xbet6\xb3>b\x9f\x92<\x9f\xb3\xc1\xbd\x87w\x06<JsW\xbe\x92\x1b\xed\xbd\x1d \x10?U\xa2\xe1=\n\xe7\xf9=Y\xbf\xb5\xbeq\xf5\xf8\xbe\x9c\xde\xa3=\xb2\xf0M>\x04\xa5\xa5>\x88X\xb5;\x1e\xd0i\xbe\x91=\xd1\xbd\xac\xd9\xcf>g\xc8c\xbd\xf5\x9cQ>\x146\x8a=.\xdb\x8f>\x9c\x0c-\xbe\xa1\xdeK>\x88cA=\x80\x1c\x0b>\n=\x80>\xe2O\xf8>\xe8\xb9\xca>\xefP\x1f=@\x0f\x8a=^t\xd7=h\x8d\xa3='
-p1702
-tp1703
-bsV504172972672700416
-p1704
-g2
-(g3
-(I0
-tp1705
-g5
-tp1706
-Rp1707
-(I1
-(I200
-tp1708
-g12
-I00
-S'a>+?L\xa9\r\xbdErt\xbf\xcan\xbe=\\\xe2\xf4>_U\x94\xbeq\xaa\x19>\x9d\xdd\x96\xbe\xe9\xbc\x1a<\xc9m\x91=;a\x0b\xbd\x8f\xb1F>\x8c4\xa4>"\x9a<=\xa9\x7f*\xbe\\1\xe7>\x94\xd9\x86=N\xed\x84\xbb\xb9\xb1r\xbe\xc9\x1d\x01>\xba<\xcb\xbe7\xc5\xc0=\xf1\xef^>\xaa\xa2\x1e\xbfN|\xb0\xbd+\xd4~\xbeUA\xbf>\xbf\x93\xa2\xbe\xda0\x93\xbe\'\xfd\x83>R\xa5\x17>\xe1\x02%\xbe\x94\x9b">$\x02\x05\xbfD\xd1&\xbe\xcc\xde\xd2>\xd2t\x87=\xdaW\xd7>\xa2\x10\'?\xe9\xa4\xa8\xbd\xca\xb3P\xbe\x8fi\x0c>e/\xd7>\x8f\xf7\x11\xbfZc\xde\xbe\xa1\xdb\x85\xbe7P\x1c?\xbf{\x19\xbe\xbb\xeb\xb8=\xe22A?A=q>I\xfce?\x9a\x95\xce\xbe^\x1de>\xab\x9f\xf7\xbe\xa2\xa1\x05?\xf3\xaa\x08>\xcf\xa2\xc2\xbe\xe4m\xd4\xbe\xaf\x0f.\xbf\xc2-\xcd>\xb5f\xbe=\x90b\xea\xbd\x02"\x9e\xbei<\xa5>r\x07\xb2>\xde\x1c\xa9\xbea\x8f\x88>\xab\xe0\x05\xbf6\x10/\xbe\x80\xa7\x7f\xbf\xf2n\xf2\xbe{\x8cp<\xd6\x9b]\xbe\x12\xef\xad\xbe\xdeG\xaf>\xe6\xd3\xc2>"\xbc\xe0=\xce\xe8\x80>\'\xe8\xc9>\xb7\xa7\\\xbe\x89\xe5\xb7=7!\xa1>\xbf\x91%\xbe\xe6\x89\xaf=f\xb7\x9a>\xe5\x92\t?\xc7\xb7\x1b\xbf6`[?\xf4\xea\xc2<E&\xed\xbe\xaa\x07\xbb>;\x88\'\xbf\x8c\xa8\xf0<s#\x05?a\xa1\xc7>[5\xb8=5\xa9\x93>\xe0(o>O\xc0?\xbe_\x1dm>\x1c\xde\x07?/\x08:>>\xf0\xb9>^b\t?\xb6|\xde\xbev\xcfP<\nK\x86>G\xbb\xab<G\x0e\x1a>\x81\tV\xbe"\xcb\x9b>\xc1\xd7\xf0>\xba\xe7\x98>v"\xab\xb9\xf1\xb66\xbe\xf5\xed2\xbf\x1b\x80\'?g\x03D\xbc\xfeG\xb3<G7Z?\x9a5H=.\x87X\xbe\xa1.Q>\x114&>N3\xdc>\x01*\xcd\xbe\xc2\xf80\xbd\xaf\x183=,w\xfd:\xb7 \xb1>\x8f\xbc\xbb>t\x00v>\xd7p\x1a\xbb\xbep`>\xfa\xef\x9a>bp\xd3:\x8fdg<\xa8\x9e\x00>]\xf6\x08>!S\xb8\xbe|\xcc$?O\xa8\xd6\xbdV\x9fO\xbf\x85}\x8f>\x9b\x18\xa6\xbe\xc2S\xcd>\xdb\xc1\xea>\x06-W\xbe{ \xf4\xbcw\x0fe>\xec\x92w:\xd9,\xcb>\xe9\xfe\xa8>\x8c\x8ex>\xe1\x9cI?\xa1\xcd1\xbe\xc0\xc7{>^Y{>p\x13\xb2\xbed\xfdX>0\x84\xdf\xbe\x9e\xe8\r\xbf\x99U\xca\xbe\xfe\x12\x98=\xfcO\xb7\xbe\xe6\x1bp\xbf\xc5h\xe1>\xf9v\xa2="\xd7\x9f\xbc\x86\x9e\xae>n\xc0\xa0\xbe\x03\x19\x9c\xbd\xb2\x9db?\xd2\x91\x12>\x87\xbd:<j5\xc3\xbe\x17\x8d=\xbfqRJ>\xe2\x9bY>F\xb7\x05??>\xc1\xbd\xd2`u\xbe\x018\xd1\xbd^\xc5\x8a>P\xc9\xc9\xbdl\xf3\x0b?\xaa\xcc\x7f=V\xdb\xd8>\xc9\xbc`\xbep\x88\xeb>[OA>j\xd6\x01?\x92\xf0\x11>\x89\xf6)?%\x17\xe7>\xc3+\x00=\xc2q\x84=\xc2q\xa7\xbd\xc9\x17\x85>'
-p1709
-tp1710
-bsV503966530947002368
-p1711
-g2
-(g3
-(I0
-tp1712
-g5
-tp1713
-Rp1714
-(I1
-(I200
-tp1715
-g12
-I00
-S'f\x91\x9e>\x8d-\xf6=\x0b\xd3Y\xbe[;\x05\xbdi\x1a\xf0=S\x15\x0e=S::\xbd7sT\xbei\xa5\xb0\xbd\x0e\xc6~>\x9b\xfbo\xbc\x95\x14\x18\xbe\xc9\x81\xcc=\x97_\xbc<aRy\xbd\xd9%^>\xf3h\xb7\xbd\x86\xa5\xf6\xbdoG\x02\xbe"A\x95\xbd\'e\xd9\xbd\xa9\xc4\xa5\xbb\xfd\x8a\x05>\xb2\xb6\x15=\x97J\xa5=\xe7+\x13\xbd\xd2\x8a\xa9=\xe2\xc9\xd1\xbc/\x02V\xbe\xe8/\x90\xbd\x0e(\xdb\xbdN\x06\xa4\xbd\x93X\xa0=\x169z\xbe\x1aYi=\xea\xe12>\x1d<*>\x9e\xe8\xbe=jk\'>\xe0\xcfk=\x96\x925\xbdy\x8b\x8c\xbd\x1a9\xee=\xbb,$\xbe\xf5\x99\xab\xbd\x1e\xe8}\xbc\xc7\x0bv>\xd5\xdf\x98=!\xf3B=1\xf3\xb0>\x8a5\xaf\xbd\x8eB\x85>\xaf\xb3\xd0\xbdA\xd5\x1e=\x8b\xdf\xb1\xbeN\xce]<\x19Z*<\n\xb2\x9d<\xbe\x7f\xdd\xbe\xb2M\x8a\xbe\x17x >\xfa\xffh>\xf2\xd8\x04>n\xb9\x0c\xbe\xa3\xfb\xaa\xbd\x9d\x90\xb1=\r\xdd,\xbe\x8aWx>\xbd\xb24=nC/\xbe\xa6a\xa4\xbe\xd70u\xbe@\xb9\xb8\xbd\x19\xc6\x88\xbd\xe2\x81\x97\xbdG\x12\x93<\xba\x9c\xb3<\xf6v\xf2=\xd1\x1b\x1a>J\xa2\xc0=\x80@\xab;\xa8\xf2|\xbd\'\x95\x9d>\xfb\x8f;\xbe\xf3q\xea=\x00\nV=\xb2\xa6*>Z:A\xbe\x7f\xaa\x91>\xf32\x8c\xbd\xde\x9c\x02\xbe9<\x06=\t\xb3&\xbe\xe8;\xd1\xbdX\x98\x1f>U\xef\x10=S\x04\x1a>\x1e\x0c2>\xfa\x9a\xa6<\xc2\xfd\xc3\xbdi\x03F<\xe8\xba0>\xd0\x00\xc9=\x95\x8d\x86=\\\x82\x8e>\x18J\x06\xbeB\x04\x9f<k@*>\xe2\x98\x9b<7\x94\xca<V\x06m\xbe\x9b\x9a\xff=\x87<D>\x81"\xc1=\xf2E\x04=\xd1\x8b\xc7\xbc\xea\xa7K\xbe\x8b\x944>f\x85\xd5<\x08\xa5/=\xd1\xa9\xa5>V\xa5\x9e=\xcaX\t\xbdM\xdaR<\xef\xbb\xa4\xbd\x90l\xf9=+\xdf\xa2\xbdZ\xf2\x89=\xb9\x94o=\xe7\x94\x9b=\x89\xd9X;\x9b\x0f\x15=\xb0$Q<\x90\x03&=\xcd\x11\x89\xbb\xf8**\xbdr\xf2k\xbdI\xaf\x03\xbd"\x1c\xef\xbd\xe2L\xd8<\x15P\xe5\xbd%\x8d\xf1=f\xd0\xe6=\xa9IF\xbe\x8d|\x91>R\x8f\xe5=\x15\xf1m=\xe95\xa3>\xbbO\x88\xbd\xa1R\x8c\xbc\xebV!\xbb\xbf\x7f\x15\xbe/\xd9`>\x1d\x19\x14>\xfe\xbf\\\xbd\x1d\xe34>]w\xaa\xbd+\x9em=\x1eJ\x07=/\x8a\x7f\xbe\xb3\xdf\x98\xbd\xc6\x1dD\xbe\x14(\x92\xbe:7\x17\xbe\xc3v\xb2=\xd1<+\xbd\x87\xa7j\xbe\xebY:>\xa0Y}=j\x8d\x88\xbd\xf3\xaf4\xbd\xeeR \xbe\x86\t\xba\xbd\x7f\x82\x91>\xa9\x97\x9b;\x17Q\x9c=\x05\xe8\x80\xbe\xf0\x00\xa5\xbeI?\xfe:\xaa\xd8\xd2=7\xfdC>x\x91\x01\xbccX\x16\xbeA\x8c\xc3\xbd\t\xe8\x83>\x86\xa4\x9e\xbcH\x0b`=\x10-\xe0<\xb27@>\xa8\xeb\xaf\xbd&w\x07>K\xec\xfe\xbcI\xe5\xcd=\xa5\xea\x13>M\x0e\xb6>\x90\xb8g>\xeb\xc5\n\xbc\xad\x15\x9c=/\xd0\x08>\xbaJ\xd6='
-p1716
-tp1717
-bsV503958255060918273
-p1718
-g2
-(g3
-(I0
-tp1719
-g5
-tp1720
-Rp1721
-(I1
-(I200
-tp1722
-g12
-I00
-S'\xf7\x0b:?\xdb\xf1\xad=\xc5\x844\xbf\x0bl\x92\xbd5\x01\x94>5K\xe1\xbc\xdb\x01D;\x88@\x9d\xbe\xef\xb4\xb9=\xb1$\xc6>\x13y1\xbem\xe4\xd6\xbd\x98\'\xe2=B\xc5=\xbe\x0er\xec;w#\x0e?\x05\xca\x96\xbd[\xdc\xff\xbd\xe2\xb4\xcc\xbe\xa0,)\xbe\xe9\xfe\x8f\xbeEv\xa9=\xb7\x1c\x9e>\x18W\xb2=\x91\xd7\x01>\x053\x92\xbe\x82\x9a\xb6>W\xda\x1f\xbd\x08\xb7\xd8\xbe\xe2\'\xb0\xbe=\x1f\xbd\xbdg\x86\x9e=\'\xcb\x89\xbde+7\xbfC#\x1c=-\xc0\x87>m\x99\xb9>g\x97\xbd>\x0b\x9a\xee>e!\x8a\xbe\xc7\xd9\xdf\xbeV!7\xbdPd\x81=\x17\x83?\xbe\x81\x9f\xc7\xbe6\n\x80\xbeY]\r?Q8\xcf=\xa9\xddM>\x86,I?/z<<Q\x19??\x10H\xd8\xbe\x02\xd5\x83>\x1ei\xf8\xbe\xca\x12e>\xcf\xbbH>}\x16M\xbe"\xcc\x19\xbf[\x915\xbf \x15\xae>\x92\xf66?FN\xd8>5\xfcH\xbe\x17q>>JQ\x8c=\xc9k\xdd\xbe\'\x1a%?\x07\x1f3>\x81;\xa8\xbe\xb0\xce\'\xbf"\x89\x12\xbfnk\x8d\xbe\xf6\xa4\x0e\xbeY\xdfx\xbe\x8d\x94N<\xf2\xfb\xb6=H\xfa\xd6=\xd3\xb0\xdb>\xfe\xd6\xc0>.\x0e;\xbd\x90h\xdc=\xe9\x05\x07?=\xb6\xa6\xbe\x8ej\xc8<\xd1\xd2\x96=\x8d\xd5\xc1>\xd0\x97\xe2\xbe~\xcd;?(\x02m\xbe\x86\x8d\x06\xbf~ka>\xa5\xbe\xc0\xbe\x1bc\x9c\xbe~\x90\xd9>R\xe6\x08>-5\xe5>\xe9K\x8f>\x11\xe2\x83>\nH\x97\xbec\xc0\x08\xbd2\xc2\x9e>\xd1\x90\x90>W\xf0\xbf>\x19\xf1\xf4>r\x10\xc2\xbe\xee}r;\x1e\xa2\x13?\x11%\t=fA:=\xa6\xc1+\xbf\xad(\x0c\xbeX\x8c\xd7>kW\x18>\x0b\x8e\x81=/e\x05\xbd\t\xed%\xbf\x8e\x1b\x90>\xc8\xa9?\xbdi\xdb\x8a\xbd\x05\xfa1?\x82c\xa5>b\x8f\xd4\xbd%\xe2@>\x08\xfa\xcc=:\x9b\xeb>\xdf\x99\x80\xbe0\xa4\xa9=\x9e\xfd\x06>\x90(>>\x07\x15c>\xd2\x8c7>\x8b\xed\xed=\xbe\xcf\xb5=\x1ew\x01<w\x16`>\x12\xbe\x13=\x85P\xfb=@I\xeb\xbew\xe5~\xbdvN\xe8\xbe\x9d\xcc\xcd>\x0e(}>\xfd\x19-\xbfk \xf8>\xfb7\x03>Hh0>\rcg?\xa3\xa5\x12\xbe\xe8l\xac\xbc\xce\xe1\xbb\xbcB\xde\x15\xbe\x18:\xa4>\xae\xbbF>\xb8.;<}\x8b1?\x90\xaa\xd5\xbe\xa1\xfc\x9d=\xdekn>R\x8a\x08\xbf\xcd\x89o\xbe*~\xc7\xbeaVA\xbf\xa2\xfe\xdf\xbe\xcdu`>\xbbK[\xbd\x1f/G\xbfS\xe6\xea> \x07\xeb=\xe2\x9a\x99\xbdV\xfc\xed=k\xe0\xa0\xbe\xe8h\xb6\xbeOV3?\x7fg\xf6=\xde\xd3\x84>\xf36\xa6\xbe\x9bZ^\xbf\x8eX\xa4>[\xcfO>q\x1b\xeb>\xd3\x92g=\xbf\xba\xe1\xbe\x82\xff"\xbe\xda\xe1\x18?l\'\x01\xbd\x87\x1c\xe4>\xbaLQ>j\xeb\xad>X\x90\x04=\x0e\xe8\xb7>\x98\x05\x19=J\xd7\x8c>\xdaA\xf7<\x8d\x9fW?\xc1\xa4\xd2>0\xa6\x91\xbd\xbd\xee\x94\xbd\x06E\x1b>R\x9f\x06\xbe'
-p1723
-tp1724
-bsV503958136881823744
-p1725
-g2
-(g3
-(I0
-tp1726
-g5
-tp1727
-Rp1728
-(I1
-(I200
-tp1729
-g12
-I00
-S'?\xfa\x0e?\'P$\xbd4B!\xbf\xaf&\x04\xbd\xd3Y\xae>\xda\x01V\xbd\x8a\xe43\xbc\xb6\x01w\xbe\xe2\x8b\xb0<\x99\xf2\xb8>.\xe7\x97\xbd\xafvJ=\xd1zW>\xba&\x0f\xbemR\x08\xbeV\x8b\xc5>6g\xd9\xbc\xe5\n,\xbd\x99\xce\x92\xbe\xf8\r9\xba\xa7U\xc0\xbe3\xd6\xd7=\x82\x15\x12>\x972{\xbeI\xf0[<S\x9b|\xbe\xe1A\xbb>\xbf\xa2\x05\xbe\xbf\x83\xe6\xbeVVC\xbb\x08\xec\xb6=C=\xef<\xf2\x8c\x91=N\xbe\x08\xbf\xdd\xd5)\xbc\xb9H\x88>!\'b>\x1a\xf7\x86>\xabF\t?`\xd1\x1d\xbe\xfc\xcb\x8d\xbe\xd7\x00Z=\x103\xba>\'\x16\xad\xbe\xdf)k\xbe\xc4\xaeH\xbeB\xbe\x14?\x87\x04\xaa=i\xd4\xfd=\xfb2\x19?\x05_\x9d=a\x00E?\xb0^\xc7\xbee\x93$>\xa8\xda\x13\xbf\xd0\xc5\xa5>g\xd6\xe4=\xc0\x83J\xbe\x99i$\xbfn$\x0e\xbf\xae\xe1\xb2> o\xaa>\x07\xfe5>A\xdcE\xbe\x92!\xab=\x8349>\x81\xa8\xb6\xbe:\xbd\xdf>Y N\xbe\xcf\x00\xe3\xbd\xd8\x9f,\xbf3b\xef\xbemX\t=\x9c\xb0\xe5\xbd6EA\xbe\xd7\xd5`>\x19\xb0|>\x13X\x0e>7\x04\x83>\xd4\xd3\x83>\xdc\x16\x08\xbe-6\xc8\xbb\x81\xa5\xe0>\x8b|\xa3\xbe\x94\xbf\x10=\x98\'\xaf=\xc7=\xca>\xa0G\xe2\xbe\xa03"?\x14\x80\x0f:\xb1\x93\xa1\xbe\x8a\xd8W>\xe9\x11\xb9\xbe\xcfM\n\xbe\x1d.\xea>\x7fx\xc8=\x86\x9a{>A\xf2\x9c>\n\x00\x82>\xb6<F\xbe,\xeb\x1e>\xa4\x80\xaa>\xf9\xf6\x81>\xfa\xfae>\xe6t\xc2>p\xc5\xac\xbe\x91r\x85;\xbe?\x8a>$\xbf\xc1<$\x14\x8b=@\xa2\xc5\xbe\xbd\xf2\xf6=\xfd\xf8\x9c>\xac\x06V>\xd6\x92\x81<\x9c\xe1\xaa99"\x03\xbf\xda\xb4\xc9>\x9b\xd7\xb7<\x89\x94\xaf=X\xc8(?\x9b[,>&\xc0\r\xbem}\x10>m\x1e\xbf=\x8dB\xe0>/Nv\xbe\xda\x06o\xbd\xf8\x84\x92=\xcd\x84\xc5=\x81\xb0A>\xc1\xff\xab=\xbc\\\xd5=\x87=\xb6=<\xdd#>\x16\xf5/>\xf3\xdb:=S\xfc\x9f=\xf7\xa8\xb5\xbd@Z\x80=o\xbb\xa9\xbe\x19\x0e\xe0>\xba\xa0S=\xdc\xe7\x0c\xbf\xc7\xeb\xa4>c\xe7\n=;/\x92>\xdd\xdd\x06?\xfc\xafG\xbe\xdbf\x91\xbdW\xbc\x89\xbdI0K\xbem\x84\x97>\xa1\x01\x8d>\xd1D\n=\xa5\xd7\x15?\x89}b\xbe\x91\xd5\x06>c\xb0\xef=P\x9e\xed\xbe\xb4\t|<\x07\x13\xbd\xbe\xff\xf6\x1b\xbf\xef\xed\x9a\xbe\x06\x16\xe7=\xcdN(\xbe\xcb\x162\xbfa,\xc0>\x9b\xfc\x97\xbc\x1f\x85\x8d\xbd\x1d\xc4\xba=\x17\xc4J\xbe\x1d2\xcf\xbdd\xa3F?)\xe5\xd6=\x0c8\x8c=\xc7\xa7\xc9\xbe\x12o.\xbf\xd68\x84=y\x02\x04>\x7f\xd2\xb4>z!\xd5=\xa1S\xb8\xbe\x14E\x0f\xbe\\\xfd\xcd>\xa4\x1a:\xbc\xd4\xfa\xae>\x08%\r>\rP\xc3>\x17\xc7\xb5\xbd\xee\x8e\x8e>\x07\xf8\xa5=\x90\xdar>Mj\xc5=\x9f\xa02?t\xef\xc4>\x17\xdc\x89=\x0e0\x11\xbc\x06X\x9c=\x113\xfc='
-p1730
-tp1731
-bsV503970116271226880
-p1732
-g2
-(g3
-(I0
-tp1733
-g5
-tp1734
-Rp1735
-(I1
-(I200
-tp1736
-g12
-I00
-S'0\xbe>>\xf1\xb9\xd0\xbdi\xe0\x9d\xbe\xc6\x02\xf2=;\x0f\x8e>\x9e\x07\x87\xbd\x03u\xcf\xbd\x80\xe3\x88\xbe\x8d\x19\xf0\xbd7|\x03>\x0c\xa7\xfa=\x91\xfa~=Q\x9d>>3\xd9/>\x1aW\x08\xbeu6\xa0>^\xfb\x84\xbd\xfb\xec\xb3\xbc\xdb\xd4\xee\xbd\xb6\xb4\xa5<\xb5\xf3$\xbe\xde\x17\xcf\xbd=\xcb\xaa=\x9b\x84\xa9\xbeX\\\xbf\xbd\xc3\xef\xe6\xbct\xaa&>b\x03}\xbe\xc4\x16j\xbe4\xf6w>$\x8e\x1c\xbeO\xceY\xbe\x92\xdcs>\xe0\xeap\xbe\x86\xd1(=\xce\xae\xa4>\xc8\xf7\x05>\xffD\x99=PP\x8c>k\xb0\x1f>~\t\xb4\xbc\xcf<\xba\xbd\x18\xd0\x8b>6\x16\x8b\xbe\xc7U\x15\xbeU_A\xbc/\xf4\xc2>\x1a\xbb\xc8=\x08\xdf\x99=64\x81>g\xe1\x80=U\xc2\xc1>\xf3\xafH\xbd:\xa0\x08\xbd\xa1#\xf1\xbe7\xb8A>\xfc\x99\x0b\xbeF\xea\x15\xbe\x0c~\xd8\xbe\x84\xa9\xbd\xbeL\xb8\x03>\x89s\x06\xbd!\x12\xf6\xbc\x9eo\x8a\xbe\xbe\x87f\xbd\xb5\xbdu>\xf2CT\xbe\xa98l=\x9a\x9e\x94\xbe\x18\x9e\xe1\xbd\xb0\xde\x06\xbf\xc7v\x85\xbe\x7f\xf9S=9\x07\xf4\xbd\x9a\xa9\x05\xbd\x8d\x1c\x9e>[9\xa6>\xdf\xbf\x0e>\xdc\xd6\xde=\xce\x8fA>i\x0bp\xbd]\x12\xb4<yc\x91>\x14\x0b\x82\xbe\xb7\x08+>^:@=qm\x8c>d\x95\xc6\xbe\xc9\xb7\x03?u!\xfa=\xe6n\x03\xbe`\xe6\x12>`UY\xbed\xdd\xc6=\xe9\xca\xbb>\x18}!\xbd\xbb\xac\x1e>{\x0b[>\x96\x03">\xac\x18l\xbc\x95b$>\xe4\x14\xa8>\xcc\xcf\xa7=C\\*>\xe6\x86\xe7>\x9a\xecL\xbe`x\xb3;\xd1\x9e\x98\xbdPZ\xe3=\xf8\xde\x10=\xf7\xb0*=&\xf8\xa7>\xad\xb5\xda= \xae=>K\x90\xfa\xbcd]\xf8=j6y\xbe\x10\xa3\x93>\x13MK=N\x0b\xd2=\x8a\x9c\x04?\xce\x98\x97=\x8a6\x1a=\x90\xfb\t\xbe\xb2w\xd0\xbd5Bd>\\\x89\xf0\xbd\x9eO\x9d\xbd3\xc1\x9d=\x0f%0>_\xef\xd6\xbc\x11[\xbd=\x90\x8b\x0c>\xb5l\xee<\x06\xef\xaa=^z\xd5=\xb6\xc3\x8c\xbd?\xa4j<\x0cB\xd8=\xfa\xbc\xb5=7W\x0f\xbe\xf2\x0c\xcf>\x86UX\xbd\x05\xd2h\xbe\x0e\n\x16>\xdc\x94\x12\xbeA\xc0\n>\'\x98S>\x8d\x04)\xbeK\x7fB=\xa4\x99J\xbc\xc1\xe3"\xbe:\xbeW>mHk>q\xf5\x15<\xd3#\x8f>\xc1/\xfd\xbc\x88\xa7\r>\x06\t\x83={tT\xbeO\x1aF>\xdb\xe1j\xbe\xef\x08\xb0\xbem\xd9\x89\xbd\x06\x8e\xa2\xbd"\x8e\x1f\xbd\xa6y\xa2\xbew{\xa3>0\x1dH\xbeWv\xf7\xbd\xab\x81\x04\xbd\x9d!N\xbeX{\xa2=\xf8W\xc9>q\xb1a=\xda(L\xbd\xcd/\x97\xbe\xa0\xae>\xbeX\x16\x12=\xc1\x9b\x15>,T\x99>\x9e\x04\xb1=t\xa4\x9c\xbd\xadX\xa8=\xe2\xe4\x8d>\xd5\xb5\xee<:<;>\xc2\xa7]=\x13\x13\x89>\x0b\xa1\x87\xbe \x8cr>\xe3\xa4q=\xe8\xf9\xad=agC>\x0fU\xb0>\x02\x10\x7f>\xe1\xb5U>Q}&>J\xeb\xc4=\xc3\x11\x06>'
-p1737
-tp1738
-bsV503969468477763584
-p1739
-g2
-(g3
-(I0
-tp1740
-g5
-tp1741
-Rp1742
-(I1
-(I200
-tp1743
-g12
-I00
-S'\xf1\x1eS<\xc7\x7f\xa1\xbc}\xae\x10\xbe\xce4\x8a=\x96\xd3\x1c>\x15X\xb2\xbcmsQ\xbd\xffXJ\xbe\x1a{6\xbe\x8f@\x00>\x03V;=\xb0\x1a2\xbd\xe3H\xf4=\xc5\xc2\xf4=\xf5\xba\n\xbe}:\x1c>\x7f\x02\xba\xbdb\xe0\xd1\xbdJ^F\xbd;\xe1\x04=\xb5\xa8\x13\xbe;\x1f\xd8\xbd\xa0\xfcE\xbb\xe9\',\xbe\xd1\x86#\xbd.q\x9c<\t{\xeb=OO1\xbeCj+\xbeG\xac\x05>\xd5\xa5:\xbe.\xe4\xed\xbd\xfb\x06H>7\xbe1\xbe\xad\xfe\x95<\xc1\xc6\x83>_\xe0o=[\xeab=\x05\xb7\x00>\x87\x91/>;\x07\'=u,\x1f\xbd\x1e\xc8\\>BGR\xbe\xb7;\xa5\xbdb?N=\xb9\x02\xe0=\xf1\xc3\xb5=02S=\r\x94\n>@P\x89\xbb\xda\x1bA>:\r\n=\xbaBN\xbd\xe0\x15\xb8\xbe\xfa\x04\x8a=\x11~\r\xbe\x87\xed\xb5\xbdU3\xb3\xbe\xd3\x99{\xbeN0\x95=\xd0%\xbf\xbd\xc9\x080\xbdw\xffX\xbe=\xdf\x80\xbd\xb0\x02Y>:\xcf\xa3\xbd\'\xe2<\xbdy\x9d6\xbe3\xbe\xd8\xbd&\x97\x99\xbe\xce\xe15\xbe_\xa3P=\xf2,{\xbdU\xe7\xa7\xba\x81\xb0Y>%\xe2\x94>\xfa\xf2\xba=K\x86\xf9=\xba\xf8\xf4=N\xc1\x9b\xbc\xbb\x942\xbcy3Z>n\xa9k\xbe\xa9\x0f\x01>\xc1u\t\xbd\x1d\xa7\xf3=\xbd\x0f\x8b\xbe1\xc2\xa0>\x06f\xd1=o\xb9\xb2;.\xe7a=\x1f:3\xbd\xb9\xca\xa5<\xe3\x14n>\x16js\xbd\xc0c\xbf=\xea\xfa&>\xea\x87\xb0=G\x95\xd4\xbb5+\xdf=9\x10s>\x07\xce\xeb<or\x89=\xd3\xa2\xbc>\x90\xf7\x0c\xbe\x8b\xac\xdb\xbc\x17i\xf8\xbd/\n\xc3=\x8e\xb9\x88::\x1d\xb4=\x06\x92\x96>\x852b<\x9e\xc6/>\xc9*v\xbb\x99B\xda=\x19\x97\x0b\xbe\xd2\xc7d>G\xe0Q;\xfd$\x9f=\xd2\xaa\xad>\x19M\xee\xbc]|@=F\x94+\xbe\xff\x19\x04\xbe\x81\xc8\xf5=\x1a\xdc.\xbd1\x80\x19\xbcIb\x89=\x12\xe8\xf3=\xf8\xa8\xff\xbd\xcf\xde\x00\xbdj1\xba=\xa6X\xfa<\xa3\xf0\r<S\x11\xc3<\xb9\x97\xf0\xbd6L\xf0<l\xaa\x08>ji\xac=\xe7\x1f\xca\xbc\xcaB\x9e>h\xbf\x7f\xbd\x1dzs\xbd\x10\xee?>\x9d\x8e\xd0<}T\xb1=\x1a\x92\xf6=\xd7\x90z\xbdo\xd0\x87<\x92\xa4\x96\xbda\xee.\xbe)\x16B>\xd3:P>\xd6\xd2\x17\xbdJ\xa0,>\xd2\xe0\xd6\xbcB\xbe\xe8=\xea\x955=\n\xd7!\xbe`R">W8,\xbe\xf5\xb3{\xbe}\x16\xd2\xbd\x98\xe0\xcb\xbd;\xa7q\xbd\x08\xaa0\xbe\xc8^\'>\x9b\xc4\xeb\xbd\xb3\x07\x91\xbd3\x04\xa4\xbd\x8e\x8b7\xbe\x9e\xb51=\x82\x89J>\x8b\xdc+<!\xe0 \xbd\x02\xef\x95\xbe\x16o\x9d\xbd\xed\xden\xbd\x0f\x02\x05=\x9d5L>wi}=\x9e\xf7\x91\xbd\xab\x8f\x8d=\xad\x16[>\x914\xab<`.\xce\xba\xee\xba,=\xe2!N>!\x9d\x83\xbe(\xac\xe7=\t\r\x05<\xf2]\xa5<\x00p\\>54&>\x0bma>h}1>:\x96\xc5=\xa5\xcc\x9b=r\x0e\xc1='
-p1744
-tp1745
-bsV503976239154356224
-p1746
-g2
-(g3
-(I0
-tp1747
-g5
-tp1748
-Rp1749
-(I1
-(I200
-tp1750
-g12
-I00
-S"}\xff\xba>\x0b\xa9\xc4=A\xecN\xbe\x11(\xf6\xbd\x9d\xd2\xe3=p9\xc6=\xd9A\xb5\xbd\x1b\x12\x1a\xbe\xa3d3=U!\xaa>\xb47\xb6\xbca\xe8\x08\xbe\x17<F=\x13\x97\xcd\xbc\xd5%\x14\xbd\xd0\x19\x84>\xa7\x9b\xfa\xbd6\xac\x03\xbe\x9e+#\xbe1\xcc\xf3\xbd\x93L\x17\xbe\x1e\xdf\r=\x196\x0b>\x17\xe2,>\x15\xe2\x06=c\xc1\x95\xbd\xf4\xf6\xbc=\x90t\xd7\xbd\xb0\xa8y\xbe cA\xbe\x18\x1c\t\xbd\r\x0f|\xbdQ\xbc\x86<\xb9\xf2\x82\xbem\x08\xda=P\xc8h>i\x8ez>\x15[\x84=\xa8\xe2/>\x88\xc1\xb2=\x99X\xdc\xbd\x98\x83\xe5\xbd\x07F\x80=\x0b&\xde\xbdo\xc2\xc4\xbc\xa4\xf1\x89\xbbI6\xa2>@\x13\t=\xf7\xb2\x83=\x97r\xcb>\xff<\x84\xbd\xe6L\x8b>\xd7\xc77\xbe\xcf?\x9b\xbb_\xbf\xb9\xbe\x95h\x81=\x95W\xa5=U)T=\xa0p\xf3\xbe<\xd6\x9a\xbeH<D>\x80`\xcb>\xf8\xc5\x07>\x0c\x06\xf3\xbd\xc1\x18\xce\xbd\xa9\xdf\x91=\xcf\xd6H\xbe\xaba\xb7>\xe3\xbb\xaa\xbcz\xb7&\xbe\xec6`\xbe)\xe0o\xbe\xbf\x02\xf7\xbd\xabA\xc9\xbd@8\x01\xbe\x9f[\x1f\xbd\xf0\xb6\x0b<hq\xea=\xe4\xce\xc0=\xf1]\x84=h\x8d\xaf<\xa1\x8b\x9b\xbd\xfd\xff\xb6>]\xaay\xbe\xf6\x9a!>\xb3\xf7\xcf<s3\x06>\x11\xb5 \xbe%\xb6\xab>\xa5z\xc4<\x14V4\xbe\x15i\xda=-\x10.\xbe|\x7f\x81\xbc\xc9\xa6\x85>}\xdbM\xbdBF&>\x18\xd69>\xf3\x9f==\xd3}\xd9\xbdS\xb8\x03\xbe\x8cF\xf2=?\xfd\x04>\xd9\xde,=\xf4\xa2\x85>\xbb\x82\x1c\xbeA.\xb9=\xa0\xece>\xdf\xc7\x8b<\xedG\xa8\xbdA\x85\xb9\xbe\x02\xcf\x01\xbc\x19\xc85>\xb5\x8f>=:\xa9\x01>#h&<-\xf7@\xbe\x113\xb7=\x98]\x1f=$\x94'<\xaf\xef\x8c>i\xc7\x0c>\xbb\x11\x19\xbd)#^<\xef\xd0\x95\xbd5Nf>I?b\xbd{\x1d\x81=x\x9f\xc6<\xa1\xf2\xc9\xbc\x18\x05N=\xa5\x7f\xad<\xd9G\xf6\xbb\xc3\xa9\x08\xbd8\xf8\x84\xbd\xa0nY<\t\xf1\xab\xbc\x16Y\x82\xbc\xa0\xf8A\xbe\xb7\xf2\xf8;\xd4\xbc\xd8\xbd\xb9\xb3j<mI\xc6=G\x13`\xbe\x13\x11\xa4>w+\x11>\xda\xf2\x94=<\x14\xba>\x10\xaf\xe8\xbd\xb0\x18\x91\xbca\xde\xaa\xbdeZ\x17\xbe\xdb\xb7@>\x08\xc3\xbf=\xb0\xb5f\xbdC\xaa?>\x03w\xfb\xbd\xb1r\xdc<+\xd4\xfa<\xc4\xc8\x80\xbeP\\B\xbe<\x98\x94\xbd(\x88w\xbeM\xe9*\xbe5\x8e\x88=\x90\xcd\x17\xbcL\xc0\x8c\xbe\x87\xe5[>@;i=\xe4\x1d\x83\xbdQ\xa5\x9d\xbc\xb1\xf3\x8f\xbd\xe9$\n\xbeS\x86\xca>\x95(\xde=\xb3\x93\x0f>\xd4\ti\xbe/\x8d\xb0\xbe\xe7\xd1\x13\xbc\xb1\xcb#>a(\\>\xfd}A\xbc\xf4yV\xbe\xe4\xc7^\xbe\x02O\x84>\xbd\x81\x00\xbd\xbfI\xc8=9\xa9\xbf<\xec\x00\xe5=\xfcN^<\xd9\xed\xb5=\xd0\x94\xc2\xbc\x89\xd5\x05>\x81\xb7\x93=\x11\xd3\xcd><J\x89>\xe9\xb4\x82\xbd\x15=\xa0\xbb\x8fP\xf5=\xa5\xf3\xf1="
-p1751
-tp1752
-bsV504276898562600960
-p1753
-g2
-(g3
-(I0
-tp1754
-g5
-tp1755
-Rp1756
-(I1
-(I200
-tp1757
-g12
-I00
-S'\x88ew>V>\x80\xbcW<\x87\xbe\xc0\xa6A<y\x1f\x10>Y0\x92\xba\xd9\x13V\xbd\x07\xd2-\xbe\x07\xd4`\xbc\x01_j>\x08D\x81<_?o<\xbd\x1d\xc6=K\x8d\xae<g\xbd8\xbd\\\xdaB>)4\xc2\xbd\xe3\xbe\x8f\xbds\xc6\xd5\xbd\xcd\x1f\x03\xbd2\x92\'\xbeC\xeb\xf2\xbb\xb3\x81\xaa=Ox\xd5\xbdUO\xe7\xbciv9\xbd\x05^\x18>=\x04\n\xbe\xcc\xd5L\xbe1\'T=\xa7N\xae\xbbI\xdb\xdc\xbdSw\xb6=\xd77m\xbe\xab)\xbc<\x88\x12m>\x9b\x96\x1e>\x0bK\x99=\xef\xbb\x83>\x89a0=\xef\xb2\x90\xbd\xe4\xc4n\xbd\xcd\x05A><20\xbe\xe8\xcf\xde\xbd7\xa8\x95\xbc\x7f\xaa\xa9>[Xu=\xe8I@=n!\x99>\xa1 e<\xf1F\xa1>\xcb\xd4\xf1\xbd\x0b\x93\x1b\xbbU"\xc8\xbe\xe5\xfc!>\x91*\xf8\xbc\xbd,o\xbd$`\xd6\xbe}s\x96\xbeC\xe48>\xb7$\x15>\xf9{t=t\xbe9\xbe\x11\x83J\xbd\xf7\x07!>\xb0\x97G\xbe\x83\xb2M>q\xd7\x0b\xbe?\x02\x96\xbdQ\xd4\xb9\xbeZ\x8f\x86\xbez\x9e\x9d\xb9\\\xc2\xa7\xbd\x89NU\xbd\xe1\xf9\x15>\rJ\x1b>\x04j\xdb=I\x95\xe0=,\x01\xdf=1$\x94\xbc4\xf1\xb8\xbca\xc6\x8e>%\xcec\xbe\x83\xa9\x00>\x0b8\xd2<\xa1\x03R>\toq\xbe\xbb\xa1\xb2>C\xed\x94=)\xb6\x0b\xbe\xbf\xef\xe0=\xdb\xc6\x1d\xbe\xcf\x8d\xc4<\xe7<\x8f>\xc3\x9fq\xbd\xd8\xab\xe2=[-8>G\xeb\x05>\xf9\xb0N\xbd)\xb9c=\x9f\x16G>\xe9 \xd0=\x03\xad\xa8=\x91\xce\x9d>@S/\xbe\x9c\x18\xc8<\x88hT=\xb1T\x99<uTO\xbd\xbe\x8f\x1d\xbeO\xe0\xf6=#<\x0e>\'\xa1!>\t-\x93=\xb8\x18/<\xe3*U\xbe\x10\x899>+\x0b\xc4<\x15\xb4k=\x98\x00\xc1>+V\xc3=\t\xfc\x07\xbd\xa4\x914\xbd\xc7m\xb0\xbc\x1f\x91O>\xe4{+\xbda\xd7?\xbc\xcf8@=E\xb4B={\\v=g\x8b,=H\xa3\xd5<\x13YL< \xfeL<\xaf\x82c=\xbc\xee\x17\xbc\x17\x84\x86<\x7fl\x11\xbd\xc7<m=\x0f0\xe7\xbd\xf3wg>\x8fi\x0f=\x07\xebw\xbe\xdd\xca>>\xd7\xf5p<\xa9\xb7\x0e>\x8f\xc0j>7\x14\x05\xbe\x9bt8\xbc\x88\x9cv\xbdG\xa9\x18\xbe\x17\xa2%>\x0f\xe4,>s*\x1d\xbd\x8b\xact>$\x17\x88\xbds\xe5\x93=\xb9\xd5\x18=?\xe3x\xbe\xd9\xe8\xc5<\'l5\xbe\xdc\xe0\x92\xbe{\xf3\xcb\xbd\x89\x00V\xbc\x89\xb3l\xbd\n\'\x90\xbe\xd7\xb4\x80>`\xe3C\xbdV1\x9a\xbd\x19\x85!\xbb\xc8\xd5\xe0\xbd\x08P\xc6\xbc\x98x\xc3>M\xb9y=\x99\xf6\xc5<\xed?~\xbe\xdd\xac\x80\xbe\xa3\xd8\xd9;\x01\xfd\xa6=\xab\x87F>\xc3(>=\xab"\x0c\xbe\x19\xf4\xbe\xbdg\xe4Q>\x9cCE\xbc\xb9\x9b\x03>T\xaeC=$\xddZ>=\xd9\x08\xbe\t\xcf\xe0=\xbc\xe6Y=\x93\xce\x04>y\xa8\x00>\xdf\xc1\xae>-`\x89>\r|\xa3=H[\x8b=\xc1\x1e\x83=G\xe3\xe4='
-p1758
-tp1759
-bsV503960002928082945
-p1760
-g2
-(g3
-(I0
-tp1761
-g5
-tp1762
-Rp1763
-(I1
-(I200
-tp1764
-g12
-I00
-S'\xcaH\x16?\x0e\x9e.>{k\xc0\xbe\xd7\xddL\xbe\x075!>\xe1\x1d\xf2=\xac\x98\x82\xbd\x11VB\xbe2#m=\xef\x97\xe6>?\xc0\xbd\xbd(\xfaW\xbe6\x92\xd7=k\xb1\xb3\xbdF+\xa2;?\x17\xcc>b\xdd(\xbe\x1f+`\xbeKIp\xbe\x8b4/\xbeB\xe9\x81\xbe\xa0\x82\xeb=\t\xf1i>\xee\xca\x92>\xc6\xa2\x00>\xbb~*\xbe\xaaG#>\xa6\xb7\xac\xbdm\xc6\xab\xbe\xa7T\xba\xbe#\x06\xc1\xbcAki;\x1dg\xca\xbb\xd7q\xda\xbe\x80\xd6)>\xee[s>\xc1P\xb4>\xa6B>>e\xc8\x8c>^4\x88\xbc\xc0\xa6v\xbex\x19\xab\xbd\xba>\x8f=GG\x1c\xbe\xd8\xb1\x9f\xbd\x16~a\xbd\xf5\x8a\xc9>\xce\xd1\xf6<\xef\x8c\xe2=\x8d\xda!?3\xb9\x9f\xbd\xc8\x98\xe8>:\xf7\x91\xbeOV\xb2=n\xf7\xf1\xbe\x12\\\xc9=)\xe81>\xf7\x93==\xb6\xe1,\xbf\xd0\x0c\xe3\xbe\x0b\x92\x9e>.\x8f%??\xf8\x86>\xa5}#\xbe\xdbM\x9c\xbdwh\xca<\\\t\x88\xbe\x03.\x17?\xd6\xab\xbd=\xd7\x85}\xbe\x85\xb8\xad\xbe\xc5<\xb3\xbe\xca\xa6h\xbe=\xbc\xd7\xbdm\xf8M\xbe\x13\x12\xc7\xbd\xf3\xf1*\xbdmb\t>:\x06X>\xf5\xc1\x0f>\x95\xe5?<\x97\xd5\xba\xbd\xde\x11\xf9>\xfb\x9f\xae\xbeu?\'>B\xba\xab={\xcen>\xa3o7\xbe\xcaf\xf7>-r\x96\xbdcx\x94\xbe\x12\xdc\x1a>\xdf\xf1\x8b\xbe\x9d\x0f\r\xbe\x11d\xad>\t*\xf3<\x94\xea\x84>\xceK\x8c>U"A=\xc1\xc3^\xbe=\x10)\xbeK|,>\xad{l>\xf2\xf0\xef=o\xfc\xd9>h\xafT\xbe\xad\xa5\xce=\x18\xec\xda>0\xb9x\xbc\xbd\xdf\xe3\xbd\x01\xc5\x1b\xbf\xe9\'\x8d\xbd+w\x9e>\xce\xb6\x80=\xd2\x05\x13>m\xe3\x8b\xbd\xa8T\xab\xbe\xfe\x18\xe5=r`4=\x9bk\x96<!\xe2\xdb>\xdf\x97T>m\xb3\x9a\xbdQ\xcd\xd5=7\x8a\xe6\xbc\xb9\x85\xa8>\xf3\xa4\xd3\xbd\x93\xb9\xea=\xbd\xc9S=RtJ;\xf7\x81\x02>\xb8\xc2\'=^+\xa6;n>\x8d\xbc\xf8\x00\xb6\xbd\xd5\xa8\xcb<\x910a<\x15{\xb1\xbcn6\xa2\xbe\x17\xd8N\xbd\x189W\xbe\x91<\xf1<J\xeaT>Z\xe8\xc4\xbeQ\xb1\x05?\x8a\xe4\x89>EJ\xe6=s+\x13?e]\x15\xbe\xedB\x89\xbdH\x07\xb4\xbd\x92zC\xbe\xf5^\x95>+\xbf\xf2=\xf8\xe2\x92\xbd\xe9\xb8\xba>\x8bZ\x81\xbeU\x18\x80=vq\xb5=~\x1c\xca\xbekx\x95\xbe\xf8\xe9\'\xbe/\x82\xd3\xbej\x89\x8b\xbew\xb3&>1\x1d\x15\xbd\x13\x89\xd9\xbe\x97\x9c\x9d>/"(>\xe2\xa1\xb9\xbd\xe6\x15O\xbc9v\x04\xbe\xb5\x9e\x8f\xbe\xc1\x00\x11?{\x1e\x03>\n\xd4b>\xbbv\xa9\xbePL\x1e\xbf\xd8\x16\x90=\x156Z>>\x9a\x95>Y2Y\xbd\xb2\x85\xaf\xbe\x12\x1b\x9d\xbe{\xff\xc2>9\xc9)\xbdmr\x1d>o\x8aU=2D0>h\xc0\x14=\x08\xb6.>\x81K\x16\xbd\x01\x90@>\xde\x7f\xa8=&l&?O\xc2\xba>\xbar\x14\xbe\x02\'\xa1\xbd\xcb<\x08>\xa3\xe6\xd6='
-p1765
-tp1766
-bsV503968097020411904
-p1767
-g2
-(g3
-(I0
-tp1768
-g5
-tp1769
-Rp1770
-(I1
-(I200
-tp1771
-g12
-I00
-S'pr3?\x11\xd9\x89>s\xa0\x14\xbf\xc6\x94\r\xbeArH>\xcf\xf6\xe4<)\xecC\xbd\xcfA\x96\xbe\xa4\xc8\xba=D\xac\xda>zy\xe0\xbd\xd46\t\xbe\x04K\x9e<D@\x11\xbe\n\xed\xa9<\xe7L\xeb>\x9c\x85\x08\xbe\xbc\x0fO\xbe\x1ev\xaf\xbel\xbf\x1e\xbe\x10\xb7Z\xbe\xfe\xfd>=\xce\xed\xba>p\xbd\x81>\xc7\xb8\xdf=\x14\x98$\xbe\xe4\xe4Y>F\x93\xb7\xbd\xbd\x86\x9b\xbe\xb2\x8d\xa1\xbe\xc9\xc9\x80=Vv\x19\xbd\x8c\xdf\x9b\xbd\xb7\xfa\xf4\xbeQk\x94=\xf7\x8a\x95>\x148\xb3>\xf2o\x95>t\n\xa2>"_\xd0\xbd\x8c\xf7\x8a\xbe\t|\x0c\xbedi\x8f<\xaa\xeb,\xbe\x9b\x8cp\xbege\xd0\xbd\xd9\xc6\xf7>F\xd3\x16;\xac\xd7\xe0=R\xb83?\xe7\x91\xf5\xbd\xed>\x03?\xb4\xda\xad\xbe\x1d8\x14>\xd6\xc0\xe0\xbe\xc0L\xc8=^\xc8S>\x17\xc0"\xbc\x9c\xe3*\xbf\x99\xab\x19\xbf\xef\xba\xaa>4\r<?9\xa0\x90>\t\xe8+\xbe\x9eA\xc3\xbb\x99{\x8b=t\xa9\xc7\xbe\xc7R%?\xf1\x95\x05>\xac\x1a\x94\xbe\x14\xc1\x06\xbf\xca\xf3\x06\xbfLB\xb3\xbe&4\xfb\xbd\x1b;L\xbe*\xff\x8d\xbd\x8e\xa24\xbd\x053\xd6=|\x14\xa9>)\x83Z>\xf5Y\r=\xac\x94\xbe8\xd7\xd5\xeb>\xac&\xa9\xbe\xcc\x8f$>\xd9\xbd\xd2=\x1b\xc2\xa8>p\xd4\xae\xbe4\xdb\r?\xfa\xe9\x0e\xbe\\\xbe\xe1\xbe\xa5\x9aC>E\xaa\xad\xbe\x1cO?\xbe\xfbt\xb2>\xee\xf2`=\x0e]\xb8>\x0f\xb0\x88>\x02\x9f\x07>\xfdM\x8f\xbe\x92"\x1e\xbe\xb5\x0ea>Qa@>\xba\xa9<>r\xdb\xca>m\xb9\x8f\xbeYX\x89=\x12\xa1\x0b?a\xf3\x15\xbc4N\xd3\xbc{\x08*\xbf\x92\xd4\xc3\xbd\xe9p\xdc>\xbe.\xd9=A\xfb&>\x82\xc4\n\xbe\x16\xae\xe3\xbe\xbe,+>y3\x04\xbd\x0b/\xa8\xbct\xb2\x14?-g\x81>\xb5\x7f\xfa\xbdU\x906>\xdf ?=e\xbb\xa7>\x12O\xab\xbd\xb6~c>\xc20\x82=\xba]\x05\xbc\x84\xd7E>\xc03\xfa=\x10.n\xbd\x87\xb1\xc1\xbbwR\x8b\xbd\xcfQ\x90=P\x14I<\xce\xc0\x95=Y\xb9\xfb\xbe\x84\x82\x1b\xbc)O\x87\xbe\x17*0>\xce@k>\xcc\xab\xfa\xbe\xa4+\x0c?\xd6RX>\x82\xa1\xaf=\xd6&H?\xd2-\xd6\xbd\xca\xf5\r\xbd\xb0\x87H;\xa7Z\x18\xbe1\x07\x97>\xe4\x18\x12>7\nq\xbd\x06G\xdb>\xac\x83\x95\xbe+O=\xbd\xb5\xab\x0b>Fl\xf4\xbe5\xe1\x93\xbe\x8cSc\xbe\x99\xe6\xef\xbeu\x15\xc8\xbeE\xee=>RU>\xbd\x02\x10\x04\xbf*\x12\xca>N\xd6d>\xde\xf2\x8b\xbd\xd9\xf3\x8b=\xef\xd2J\xbe,\xfc\xc5\xbe*\xd6\x1f?\x8c\xd6\x89=\xf9\x00\x8c>\x1b\xc2\xa3\xbe\xdb\xec:\xbf\xf6\xeb>>\x10\xdeU>\x0e\xd6\xc5>\xa9L]\xbd\xe4\x06\xb0\xbe\x04\xe8\x8a\xbek\x91\xf0>+\xaaw\xbds+\x92>\xf5\xcc\xa8=\xbc\xf4\x92>\xb1*\xfd<\x15\xb0+>\xcec\x80\xbc\xe4:\x8a>\x1f\xa5.>\xeb\xcb/?\xaa@\xfa>\x0fr^\xbe\x02\x9f\x15\xbd\xece\x0c>\xe9&\xa1<'
-p1772
-tp1773
-bsV503976969399435264
-p1774
-g2
-(g3
-(I0
-tp1775
-g5
-tp1776
-Rp1777
-(I1
-(I200
-tp1778
-g12
-I00
-S'eA\x12?\x14\xcd\x8f>Er\xfc\xbe\xf9a\x9b\xbd]%\xe1=Q\x01&=\xa6N\xb4\xbdd\xeb\x9c\xbe\x87\xf2\x17\xbd\xa0w\xc6>h\x9a\x07\xbe\xf37\x92\xbeX\xc2Z=\x83\xd7\xf0\xbd\x9e\x95\x80=(\x10\xda>\x9c\x8e6\xbeT\x9c\xa0\xbeF\xbct\xbeA\x1a\r\xbe\x9a\x8b1\xbeM?"\xbc7\xc5\x8a>~\xceu>\x18\xaa\xec=\xc2\x9c\x95\xbds\xcfQ>D\x05>\xbbD\xfa\xb3\xbe\'\x19\x98\xbe\xe9\x85G\xbe<s\x1a\xbd\x10\xf3\x9b\xbc.5\xf8\xbe\x02\xbb\xec=\xc5\xee\xad>\xf0\xfa\xac>\x1a\xebd>t\x82\xa4>x\n)<\xef|q\xbe\xa9m#\xbe\x89w\x1a\xbd\xa8"\xff\xbdx\xaf\xa4\xbe\x14?\x9d\xbd%\x19\xd0>=|\x07>\x97\xda\x06>4\x03#?\x94\xd5\xd1\xbd\xf6\xce\xc3>\x00\rk\xbeG)\x06=\xaa,\xf6\xbe\x8b\x0e$=+\xd7\xe0=\x0b\x13\xa5=N\xb10\xbfWZ\t\xbf\x9e\xfa\x8b>k\x150?\xf9\xf5\xc7>\xd8\x8eb\xbe\xe0\xf8\x10\xbd*o\x04>\xfd\xd5\x8a\xbe\xf29\x0b?\x15\x19U>\xa13\xa5\xbec\xc1\x07\xbf\x0f\x9e\x0f\xbf\xd9\xab\xcc\xbe\x08O\xd9\xbd)\x94>\xbe\x9b\xc3C\xbd8\x9c\xdb\xbbd\x05:>M}\xc4>\x02\xa8[>\xe6(\xc6=WE\x08\xbc\xc5I\x02?\xee\x08\xb9\xbeH\x04\x1f>\x99\x88\x93=\xc3\xdfk>\x0c`\x8d\xbe\\\xc4\xf5>\x9f\x8cH\xbe\xe5j\xa9\xbe\xf6\x1eI>\x17h\x7f\xbe\xd3$\x81\xbe\x03\xf7p>(\xfe[\xbcNA\xbc>\x89\xd5z>\x840\x9e=B\x92H\xbe\xec\xf6\xfa\xbd*\xb3l>\x1f\x1d6>\x06\xead>+\x84\x07?=\xbb\xa6\xbe\xc0-\xa2<\x90\xc0\xfd>O\x7f\x1c=\x1e\xa1\xae\xbdLt\x19\xbf\x08\x95-\xbdC{\xd8>\x1a1v>\x84BN>\xba\x16\xe5\xbd\x16\xe9\xd1\xbe\x9b\x102>b\x8e\xa5\xbdh!s\xbc<\xf4\x04?T\xe7\x8d>\xfa\xc1\xd6\xbd\xdfuK=VJ\x8f\xbd\x84\xedl>\tF\x15\xbe\xa2jD>\x1fx\xa3=v\\\x10>\x1fD\xb1=\xbam*>?\xba\xf8;\xaab<=\xaa~E\xbe&\xbf\xe7\xbc\xa2+\x9f\xbd\xc7\xbc\x96\xbc\x0ft\xed\xbe5\xd7^\xbd\xf3\x1a\x85\xbe\x17\x06W>p\xdf\x8d>\x19C\xe4\xbe\xf2\xe3\t?\xbdI\x85>TG\xa0=/WQ?*{\xcf\xbd[\xde\x1f\xbdA\xcd\xe0<*;9\xbeeY\xbc>\xb8#x>\xde\x12\xfe\xbd:\x1a\xdb>\xe5F\x88\xbe@ZC=\xb7\xf7\x1e>\xf4\xd4\xf0\xbe\xc5\xa9\x91\xbeU\xd5\xa8\xbe\xd3\x8c\x08\xbf\x15w\xc0\xbe\x1b\xcc\xec=\xf6mC\xbd\xad\xe7\xf8\xbe>M\xb2>\x03Fy>\xb5AD\xbdN\x89I\xbd1\xe8\xa1\xbe\xf0[\xbe\xbe\xed!\xec>W\xae]=i\xd3\x85>\xb1\xc6\xb6\xbe\x90U-\xbf\xa2\xaa\x1d>.?>>\xfc\x17\xa7>\x0ehu\xbd\x0e\xd0\xa4\xbe\x95\xdc\x90\xbe\xf0\x05\n?EY|\xbd6-Q>\xa5\xad\x88=&\x8c\xaa>\xe4B\xaf\xbd\xe1\xb6@>\x0b\xdf\n\xbd\x80eo>\xf0t\x80>\xbe\xa6 ?\x8ck\xef>4 \x03\xbe\xac\xebY=\x8f\x8bT>\xab\xd3\xaf\xbd'
-p1779
-tp1780
-bsV503965048109150208
-p1781
-g2
-(g3
-(I0
-tp1782
-g5
-tp1783
-Rp1784
-(I1
-(I200
-tp1785
-g12
-I00
-S'\xdd\xff\xbc>\xf1b,>\xcf,\x01\xbf\xde;\xbd=\x9fi<>\xa9\x16D\xbexJ~\xbd\xbbf[\xbe\x00\xd8M\xbd\xf3\xe4\n>\x1a?\x9f<\xe6}7\xbdU|q\xbd\xa8\xac\xf7\xbc\xa0r\xab\xbd:\xe5\x80>\x8fU\x19=\x99Y\xe8\xbd\xa96/\xbe\x82\xab\\=\x8e\xf9S\xbe\xe2\xe0\x90<\xa5&\xe0=\xf7\xe8:\xbe\xc8\xd2\x1a\xbd\xf5\x16\x87\xbdy@q>\t\xb4\x85\xbdB8\x89\xber\x8b==\x99&\x03\xbd\x15\x0f\x84\xbd3GN=\x1e\x8dm\xbe\xe0\xa0\xf8\xbc\xb6*\x97>n\x19==\xab\xef]>/\x0b\xc9>\x9d\x87\xf0\xbc]\x01\x07\xbeP#\x83;\x1e7C>Qt}\xbe\xff6w\xbe\x9d\x9b\xe1\xbdW\x9e\xb8>G~\n=\x0e^\xce=\xd7\x9f\xd4>\x16\x18\x87;\xf9G\xae>h\xb97\xbe\x82f\xd5\xbc\xd6C\xbe\xbe\x85\xfa\xff=\x86\xd5\xb8=\xc7q\xca\xbd\xd7\xc3\xe1\xbe\xf11\xbf\xbe\xc1\x8f6>\x00.\x83>\n\xf9\x9e=\xa7\xeb\x1f\xbe\xcf\xb4\x9e=#\x97\x03>f\xe0i\xbe\x08eN>\rc\x81\xbe\x9f\xb0\xcc\xbd\xb5 )\xbf\x82j\xc1\xbe\xf5\x99\xd8\xbd%\xbb\x8d\xbd\xa1\x910\xbezS\x12>6\x9aa>\xe0H\xea=\x93\xc5a>\xdaN)>\xbbC1\xbd0\xec\x8f<\xc1;_>Z)\x8a\xbeC\x9a\xa2=6Z\x83=\xc63<>\x05\x9f\xb8\xbe\xd1\x99\xd8>X1"\xbc+B\'\xbe\xcf%x>\xde\xd8\xa5\xbeu<\x94<W\xb5f>\xc2\xd7#>\xe6\x977>q\xd1*>\x17\xe6\xe4=?\xbcO\xbd\xf7\x1b\x0b>\xb0;\xba>\xe1ir=\x95\xf3\xd4=8\x16\x91>\xeer\xb4\xbe\xe5jd\xbd\xe6b_>I\xab\xc3="\xc6\x9d=q\x97v\xbe\x06g\xdc=\xd0#\xa1>\xd0X_>J\xec\r>\x95\x92\x06\xbd\xaa\x13\xe3\xbe\xef\x1a\xa2>8/\xa9\xbc\xda\xde\xcc=8\x00\xe4>RA\x0e>%\xc7$\xbe\x90\xfay=\'\x1cm\xba\xbfL3>3\xad^\xbe\xd8h6=\xf3\x11\x1f=Zd9=BV\xac=\xb8e[>\xad\xbcr=*9\n;z\xa9\xae\xbcda\x11\xbd=K\xea\xbd\xbb\xad\xeb\xbc.;\xb6\xbd\x199\x15>\xf2\xdf8\xbe5\xdcs>\x9b%\x0e\xbd\x12>\xd6\xbeg\t\x8b>Y\xc2\xda:\xc9\xfe9>\xd9\xba\x07?!0\xb1\xbd\x00&\xb1\xbcsE\x1b>\xd0\x88\x83\xbd\xda\xe3\x9a>\xa5\xd9\x80>\xd9\xfc\xb3\xbb\xcf\x19\xd9>o@C\xbde\xec\xc2=E\xbc1>Z\xaaR\xbe\xadaL<\xd6\xd8\x9d\xbe\xa23\x91\xbe\x03T\x93\xbe\xcakd<\xed7\x00\xbe\xd8\xf4\xce\xbe<\xae\x87>\x95\x96\x19>\x16]\xa9=B\xa6`=\xd1\xb3#\xbes*\x96\xbd\xa2\x00\xcd>1(\x04=\x91I;>b\x8f\x96\xbeZ\xdf\xf4\xbe\x8ft\xd3\xbb\x9eA\x05>\xc95\x88>\xa7\xa3X\xbcq%I\xbef\x8b\xfe\xbdm`\xad>\xb1\xcf\xb5\xbd\xe8\xe7#>F^\x89<\x89l\x9d>\xe5#\xba\xbd\xc6\xd2^>Ci =\xcaO<>+t\x95>\x9a\xc2\xa4>Y\xe7\xb0>~+\xa3=\xd0\xb5\x14>~\xfc\xcf=\xbaL\x1a\xbd'
-p1786
-tp1787
-bsV504257408173346817
-p1788
-g2
-(g3
-(I0
-tp1789
-g5
-tp1790
-Rp1791
-(I1
-(I200
-tp1792
-g12
-I00
-S'Y\xef"?\x93\x83\x84>0\xf1\xfe\xbe\xbc\xb6\xc8\xbd\x01\xb6->\x90&\xb7=\x8d\xc8\xe2\xbd~d\xa8\xbe\x11\x8a$=\xd7\xc2\x13?\x84\xd1G\xbeCB\xa1\xbe\xec&\xa5\xbd\xf7\xa0\xda\xbd\xc9\xfe\x87\xbd\x84\x0c\xde>\xbag=\xbe\x03\x07L\xbez,\xb0\xbe\xa9\xef\x8b\xbe\xa4\xfe!\xbe^\x8e\x85\xbdY\xd3\x96>\x8e\xb6\x9d>EM\r>\xec\x9f\xec\xbd\xa0s\xa8>\xffbB\xbd\xc1A\xd5\xbe\xefT\xcc\xbeS\xb7c\xbe\xd7\xb0\xf1\xbd\x17&\x85\xbc\xf5\xaa \xbf\xef\xccz=\xc6\xe9\x00?\xa4\xeb\xc4>\xe9\xaef>\x1c\x01\xc6>\xad/\xcc<Q\xd6\xb2\xbe\xeb\x10\'\xbeY\xe7\xa5=DZ\x07\xbe\x0fP\x95\xbe#\xe2\x05\xbe\xa1\xd8\xf4>\x99\x19g>f_J>q\rE?1h+\xbe\xbf>\xf7>p\xe1\xa1\xbe\x9642=\x8a\xb7\x15\xbf\xdf\xa3^=`J\xd6=%P\x04\xbb\xba\x02T\xbf7\x10)\xbfQN\xa8>Q.E?\xea\xfd\xe1>\xc7(j\xbe\x97\xa1\xeb:Y\x07\x98=\x94\xf0\xf4\xbe-\xc2\x07?\x17\xf0G>k\x06\xb3\xbe\xa1K\x17\xbf4\x94\x10\xbf\xb0{\x83\xbe\xfa\xcab\xbeT\x80m\xbe\xd9\x90\xd4\xbdM\x9c\x07=A6&>0A\xdd>\xfdD\x7f>\xd7;/=$\x0b\x99\xbc<\x9e+?=/\xc7\xbe9\xf43>\x9dg\xb7\xbcQDt>\x91!\xee\xbe)\x8e\x18?\xc6\x9b*\xbe\xa4V\xbc\xbe\x1c\xed\x0f>-\x11\x8c\xbe\xe3\xb1Q\xbe\x89M\xcc>\xae\x97\xa6<\xd7\x0f\xc1>\xda\xfam>~\xaa*>\x8a\xedl\xbe\x07\xd87\xbe\xa0\xd6\x96>\r\xdcQ>\x00:U>\'Q\xe8>\xd0\r\xdd\xbew\x7f\xcf<\xf7[\r?\x01\x19\xae=\x84M\x1a<\x1c\xcb4\xbfA\x1cG\xbe@c\xf3>,\x13o>iu\x96>\xdc\xa5)\xbc\xb46\x02\xbfO\xc8i>\xf4S\xfc\xbb\xc6\x12\x0b\xbe\x84y\x19? ^u>^}\xae\xbdI\x15\x9d=\xceQ\x17\xbe\x12{\x96>\x90s\xfa\xbd\xd4\xcc\x07>\x7f\xbde>\xccZ\x12>w\x06\xdf=g\xce\x82=\xaf\xbf\r=\xb3\xa7\x8c<\t\xe6-\xbeC\xac4\xbbM\x99\x86\xbd\xf7\x05\xbe<, \x08\xbf\x15\x8c\x83=\x96\x9b\xab\xbe\x7f\x87?>c\xc1v>Q\xa1\x07\xbf\xef{\x11?\x9e\xcb\x80>\x99G\xea=\x90Yf?gF\xe9\xbd\xc0&\xcf\xbc\x199\xb6\xbd\xc4\x83u\xbe\x8fj\xd1>\xa8u\x8c>$K\xf4\xbd\x91P\x05?A@\xb9\xbe\x93\xdd=<P\x95\xf1=\x7f\x18\xf5\xbe\x97@\xc7\xbe\xa9#\xd5\xbe0\xc4)\xbfI!\xdd\xbePEA>\xedA\xa7<\xc4\xd9\x1d\xbf\xf1\xa5\xd3>\x03\xa1=>\xb4\xc9\x9b\xbcKY\x93<\xc4\x8f\x93\xbe\xa4"\xb0\xbe\x9db\x10?\x1a\xc9\xd0=@f\xc8>M\xe4\xce\xbe\x83\xc2;\xbf\xf1\x82\x10>(\xd8\x05>\xd3\xd2\xcc>*Yy=\xfcr\xdc\xbe\xd30\xa1\xbe1e\x12?<\x01)\xbd\x05\n2>\xa9\x04\x13>y\xf5\xaf>p\x06\xbc\xbc\x04\xcf\x89>\xf1\xc1\x00\xbdB\xa0\x91>;\xa6\x0e>:\x977?\xc5;\x00?`3\xcc\xbd\xc5y\x9f<\xfcV\x8b>\xac\xf0\x01\xbd'
-p1793
-tp1794
-bsV504227219162402816
-p1795
-g2
-(g3
-(I0
-tp1796
-g5
-tp1797
-Rp1798
-(I1
-(I200
-tp1799
-g12
-I00
-S"\x9b\xfd\x89>\x9d\xa2\x92\xbc\x8a\xb4\x95\xbe\xd7\xd7\xdc\xbc;Rf>\xc0q}\xbd\xd0\x12==\xd4\xe2\x10\xbeO\x9f\x81\xbd\xb1%\x8a=\xb2\x1dt=\x12C\x11=\xbf\xfaN>\x0e4\x82=\x08\x17\xfa\xbd\xca\xbak>\x9eoh\xbb\x17\x14#9\xf5\xc7\xc8\xbd\n\xf8K=\x90r;\xbe\xcfA\x8a=U\xbe\x8d=\x9a\xcdk\xbeR\r;\xbcX\xa6\xd2\xbdu\xaf\xef=\x91\xbe=\xbe^\x84,\xbe\xd3\xbe\xf1=\x15E\xd4<\x80\xf1\x98\xbd\rN\xea=\xdd\x97*\xbe\xc6R\x84\xbb\xb1\xf3\xe1=!G\x7f=\xb3\xf0\xee=\x1e\x08f>a-\xbf</\x9ax\xbc\xe3\xd2\xc1<\xb8\xbc[>+\xfe\x93\xbe\x0f\x19f\xbd\xb2\x0e$\xbdZ\xe9x>M\x0f\x11\xbd\xaa\xa3\x00=x\xf4\x8b>\x1a4\x98=\x00<\xba>\x1b\x0b\x1c\xbew\x85\x9e=\xa8\xf1\x8c\xbe*\xe5\x1e>\x11[\xa6<\xc6\x03\xc1\xbd3V\x90\xbe\xae\x7f\x80\xbe_h;>\x129\xb2<a\x1dR\xbd\xc6\xe1\xf6\xbd\xf3\xbc7<\x01#\x06>\xe2.\xe2\xbd\x85<\xf6={\x15i\xbe\xc3\x95\xbc\xbd\xa3I\xb9\xbe4~\x04\xbe= \x88=\xfd\x13\x9a\xbdx\xe1\xbb\xbdM,!>\x10h\x1f>e1\x95=P\xde\xd7<\xf0Z >\xf9Q\xc0\xbd1,-\xbd\xbd\x1c0>\x81\x83\xb5\xbd\xa7~\x91=\x963\x0b>?\xb5x>\xfd\x99Q\xbe\x99\x17\xaf>\xaf)\xea<\x0e\x1f\x0e\xbe\xf9\x1a\xcf=W\x7f\x85\xbe\xb8\xf6\xd9<;^X>b\xfb\x0c>\xa6\xb2\x1a=@\x9e4>\x01\xbe7=\x01\xd0Q\xbd3\x06\xed=\x07\xcfR>\xc9\xd8\xe3=\xf2H\xd8=\xaf\xa3z>+1\xca\xbd\xbf\x17<=^\x01Y=\xe2\xbe\xb8<\xf9\xfb==J\x94&\xbdI\xe5f>\x0ec\xde=\xc86U=\xaf\xe7\xa5\xbdo\x18\x08\xbd\x1f\xb1N\xbe\x0e\xfb\x81>\x9e\x02\x92=\xa5\xf8\xba=\xe8\r\xbf>s#\xa1\xbc\x996\x0b\xbd\xe7\xd0a=]\xf1\x90<\x0f\x06/>(\xb4\x06\xbeQ\xca\xe0\xbc\t\x82\xd4<\xcb\xfbH<\x91\x14/=XJ<=\xe6f\xc2=j\x92\xd4\xbb\x9b2\t>\xb4\x87\x8f=\xa3Bh\xbc\xe6A\x12\xbdHw\xf9=\x11\x91^=\xd8\xbb\xd9\xbdg\x03[>\x95\x9f.\xbcXgb\xbe'\xc3\x1f>\x8f\x0bx\xbd\xa9\x03\x18>v\xbe\xbd=N\x9a\xe8\xbd\x95x#\xbc\xfbr\xb5<\x05\xa7W\xbd\xd9x8>Qb\x0e>\xa5\x7f\x9c=i\x13x>\x89\x0b_\xbc\xc1\xa7\xf3=\x8b\xefd=\x9bo\x17\xbe\xbf\x83\xda=\xb5\xa5\x00\xbe\x15\xa4*\xbe]\x80\xdb\xbd\x12\x1d\xdc<\x0er\xf1\xbd\x02\x1c\x94\xbe\xa0\xdf\xfe=\x89\xfe\xf7\xbc8\x98]\xbdp\xc7\xa7=O\xda\xc2\xbd\x99\xc9O=\x17\xd3\xb5>\xe1V\xa8=[\xda\x1e\xbd\x01\xa2\\\xbe;\x1c\x84\xbe;h|;\xe5J\xec=\x10\nC>\xa6<\xb3\xbc\xe5\x9b\xd4\xbd\x18\x8f\xc8\xbc6\x8a\xee=\x900\xe2\xbcE\x8e\xee=\xb6\x11\xc8<\xff6\x11>\x89|\xd8\xbd\x1d\x1d<>\xca\xb6\xed<\xe0\x14\xde=\xc5\x9f\xa6=PN\x89>e*\x16>\x055'=rmP=v\xf2d;\xa5\tP>"
-p1800
-tp1801
-bsV503974308935258113
-p1802
-g2
-(g3
-(I0
-tp1803
-g5
-tp1804
-Rp1805
-(I1
-(I200
-tp1806
-g12
-I00
-S'\x05P\xdc>\xb2\x9e\x91=\x9fT\xb3\xbe\x91j\x86\xbd\x11nM>;\x96\xb0<\x18<\x1e\xbd\xa51@\xbe\t{\xfc<\xd7\xe6\x80>\x9d\xbe\x03<\xed5\xc7\xbcNL\x17>\x12\xd3\x89<<.1\xbb\x17\x07\xad>\x96\xbc\x9a\xbd\xa5\xd0\xa4\xbdwX>\xbe\x80\x98\xa5\xbd\xf8\x926\xbe,\x19;=\x8e\x83i>\x88N\x1f=\xe6\x02\x8b=\x1e\x85\x06\xbe~\x9a\xca=\xfb\x88\xee\xbd\xd9\xf5S\xbe\x83\xc0\xae\xbd\x15~u=1\xdf{\xbd<FS=l\xb2\x96\xbeA\xc5\xda=Zh\x0c>`4a>\xbb?)>M\x9c\\>\x0cKM\xbd\xb8\xc1\x01\xbe\x82"a\xbdF\xe2\xd8=v\xfa;\xbep\x0e\x81\xbdc\xa5M\xbd%\x87\xb7>\xf2\xcc\x0c\xbco\xf5~=\xf58\xdc>\x80\x1c,\xbd>\xd6\xd4>\xb8\x06C\xbe2\x94\xec=B\x1f\xbd\xbe3\xd5\xe7=X\x7f\x82=\xa4\x8b,\xbd\xb3\x19\xe6\xbe\xbc\x8e\xb3\xbe^\xd8Y>4a\xa6>\xfe\xfa\xcf=\xe8t\x1b\xbe\xb8\xc6\x17\xbdH\x87\x1c=\xfa\xe9n\xbe<\x93\xc3>\xc3\x9b\\<\x88\x89\r\xbe\xe8\xfa\xbd\xbeTc\x84\xbe\x15Q\n\xbeA\xaa\x80\xbd\xb3\xc7\xdb\xbd\xaa\x19\x12=d\xb4\xde\xbaR\xe3\xa6=@\x1e\x08>\xbe\xd1\x06>\xb3\x80$\xbd\xeaV\x02\xbdU\x12\x94>\xf8La\xbe\xc3^\t>\xe8\xdb\x06>\xc2\xcd\x97>qfB\xbe`M\xd9>\x9b_[\xbd\xc9\xf0\x80\xbe\x89\xb5\xf0=\xb6\x9a\x8b\xbe$\x1bv\xbd\xd8\xe0\x89>\xa6\x9aX=R\xab>>>\xd4]>86u=\xce\x126\xbe\xaf\xb4*\xbc\xdf\xb17>\xf5\xac$>\x17S\xf5=\x88\xca\xb4>_H\xd8\xbd9\x1c_=z\x18x>tj\xc9\xbc|\x0c\xd8\xbc#\xef\xa5\xbe\xf2\xf8\xb3=\xcb:i>M<\x12=X\x05\x9c\xbb\x81\x1b[\xbd\x98\xf7z\xbe\x84b\x0c>\x8c\x80o=\xd8H5=\xa8j\xdd>\xa8z\x01>\xe5M\xd9\xbcB\xf8\xbd=\xd0\xc1\x15=H\x82z> \xa7\x94\xbdP)\xa8=\xed\xd6*=\xbd\x14\x1a=\x91R\xfc=\xcc\x93C=\xde$;\xbc=8\x8a<\xdcM.=)7\x9b=(I&=\xbe\xec\x7f<\x9c\xb7.\xbe`w\xbc\xbc\xb8\xd20\xbeYX\x0e>\xb7\x9c\xfa=\xab\x88\x92\xbeP\x82\x9d>\xff@d=\xaey\x9a=\xe6\xd0\xa5>:#\xfa\xbd\xcc\xc7\x05\xbd\x17\n.<\xfe1\xf2\xbd\xf8\xb50>\xcbq\x94=\xd4\xa9\x85\xbc`u\x87>BM\x0f\xbe8\x1c\x08=*\xcac=Jf\x98\xbe\x04\x98\x9f\xbd\x8c\xcd\x11\xbe\x070\x9c\xbe\x9b\x80\xe6\xbd\x8c~\xe6=\x18\xc1\xfe\xbc\xd9\x82\x98\xbe2\x11\x94>\n\xc0O=\xa8\xc6\x02\xbe\xb0RQ<\xf3\x93\xef\xbd6\xd4\x1c\xbe\xcd\xf1\xe2>\x8d\xcfW=\xfdG\xa1=Fx{\xbe\x91!\xdc\xbeE\xc4\xd4=\xed\xb87>&\xc6\x80>\xe9\x84\xeb\xbc*\xc8G\xbecD\xd7\xbd\xa5\xcbm>\xd4\xe4\xbd\xbb3\xb2@>}\xa8;=dL<>M!M\xbd\x19d/>\xec\x16\xce:\xea\xf1\x04><\x03\xa9=:\xd7\xed>\xba\x84\x7f>=\xc5\x82\xbd\x81\xbb\xad\xbbXyD=6J\n>'
-p1807
-tp1808
-bsV503974992430632961
-p1809
-g2
-(g3
-(I0
-tp1810
-g5
-tp1811
-Rp1812
-(I1
-(I200
-tp1813
-g12
-I00
-S'ml"?\xe0]\xaa=#\xa5\n\xbf\\\xdeX\xbe.\x1a\x83>\x05\x85==\x1f\x18#=9\xe0Z\xbe\xd4\xe7\xb7<a+\xd1>i\xbb\xac\xbd\xb4\'\xb3\xbd\xb1\x98m>\xf7\xca\'\xbe\x89\x8c2\xbe4A\xa6>i\n@\xbd\x19.\xf4\xbd\x00c\x8f\xbe\xa4\xcf_\xbc\xa5\xa9\xac\xbe\xeb\xeaN>\xe5\xc42>\xdd\xc7l<\x90zg=\xdcX\x83\xbeq\x11p>5\x82\x99\xbdU\xd6\xc3\xbe\xdd\x05\\\xbey[\x00>\x82|\x85=\xc7r\xa3\xbc(\xf7\xe6\xbe\xc1>\xee\xbc\xc4_F>\x18\xbaa>\x7f?\x85>=\xe2\xbc>\xabs\xf3\xbd\xac\xb4\\\xbeh\x89\x95=/fI>\x1f\x88\xad\xbe\xf1\x81\xde\xbdnr\x08\xbe9V\x03?\xf3\xa6$\xbd\xa5\xf7\x91=jr\'?\xb4\x9e\xb2<\x18\xea%?e\r\xcf\xbe\x85\xb24>\x85\xe9\xe6\xbe\xec\xa0\x7f>K\x06\x7f>\x80\xa2\xcf\xbd\xefQ\x12\xbf\xbf\xe4\xfe\xbe\x1c\x06\xcb>\x9c\xbc\xdd>\r\x1e\xf5=\xc3\x9d\xbf\xbd\x03\x9b\x1e<\x8cm$>)F\xa6\xbe\x82\x81\x02?\xbdE3\xbe\x01--\xbe\xdf\xee\xe3\xbe\xf0\x9a\xac\xbeE\xeb\x90\xbc\x10d\x9b\xbd\x8b\xc9\x85\xbeap\xa4\xbc\xe3V\x9b=\x81\x8c\x17>\xc5\xb3&>S.0>\x81\xe8\xb6\xbdu\xb8\xa8\xbc\x1b\x07\xf2>\x13gu\xbe\xe9\xde\xa1=2\x13\x10>\x9c;t>\x84\xfe\xaa\xbec\x7f\xfd>?\xd4\x14\xbd\x84\x10\xbf\xbeT\xdc\x10>\x81t\xba\xbe\x95\xa7\xda\xbd\xc77\xb5>\x8fW\x12>0,D>\xf7\xc7\x94>O\xed\x1f>\x1d\'9\xbe\x98l\xb1\xbc_\x15s>\xb3Kx>iH\x17>\xbd\xc0L>\x0c\x9a\x89\xbe\x0c\xc4\xd1=\xa9\x15\xc2>GR\x00;\x94_z=\xad\x0e\xf5\xbe\x9f\xca&=(Hz>\x9b/\x8f=\xffda=72\xae\xbd\xd5\xf8\xe0\xbe\x802\xb7>\xf9$\x9e\xbc\xf7\xab\xcb=Y\xff\xfc>m\xdd\x11>\x11{#\xbe V=>t\xf8\x0b=\xa0(\xce>\xd0\xdbA\xbe\x194\x89<\x91{\x86\xbc93\xeb\xbd\xbb"0><\x1f\xf7=\xbb}\x15<>z\x9d=\xebD\xa0=N\xb1#>\xad\x03\x0c\xbde\xb1\x03\xbbkf\x0e\xbe(#\xa9=\xfe\xb5\x84\xbe[d*>"\xa2\x84=_\x8a\x04\xbf\xff\xb2\xd5>\x99\xe2\x17>\xacx\x88>\xd4\xf6\x06?\xa8{<\xbe($\xb5\xbd\r\x16\xfe\xbd\x94\x94>\xbe\x91x\xb8>qzs>\xcca\xc8;\xa0\x03\xf8>#!2\xbe\xc0y\x93=Q\x8d\xb8=K\xef\xc9\xbe\x90B\x06\xbe\xac<1\xbeX`\xec\xbe\xa1\xdd\xca\xbe(\x11U>\x7fJ`\xbe\'? \xbf\t>\x8d>Mr\xb9=\xfc/\x81<p\xe8\xf1=C\r\xdf\xbd\x181\xe8\xbd\x11\xda>?\x9by\xe6=\xf7\x9e\xf5=K\xc2\xc8\xbeK\x142\xbf\x82\xca\x80\xbc#\x117>\x87g\xbd>\xdf\x1d\x9e\xbb;2\xac\xbe\x98\x8e\x93\xbe\x19\xc1\xa6>\xa3\xae\xa2\xbd\xa9\xcb\x88>\xdb\xc6\xea=\xf9C\x91>\xa8\xfc\xf9=\xf1V<>\x89\x1c\x07<\x7f[\x86>\xd7\x8eP=\xb32.?\xf5\x9d\xb4>\xdb\x16\x90\xbd`yV\xbd}\x18\x10>\xd3\x037>'
-p1814
-tp1815
-bsV503961793346428928
-p1816
-g2
-(g3
-(I0
-tp1817
-g5
-tp1818
-Rp1819
-(I1
-(I200
-tp1820
-g12
-I00
-S'\xb1D[?n\x86\xda>01,\xbfq\xb8\xb3\xbcS\x02\r>\xaa)\x94=\x9d\xd7\x05\xbej\xcf\xb4\xbe\x95\x9cQ<\x93p\t?\'HE\xbe\xf5l\xc4\xbe\xd6)\xd8\xbc\x94\xf9:\xbe\xa5,\xf1=\xa8?\x13?\x08\xe49\xbe\xf7\x06\xea\xbe*\xea\xb8\xbe\x7f-Z\xbe\xcc\x9e)\xbe\xc2\x0e<<\xf5U\xcf>\xb5\x8b\xd4>\\\xee\r>en\xd9\xbd4\x11z>d\xc1\x94=\xfd\x11\xd6\xbea\xe1\xf1\xbe\x1d\x03\x8b\xbe\xaa!\xc2;\t]\xd1\xbc\xb3n&\xbf\x15\xcd\xe6=\x87\x8c\xe0>\x1ce\xe8>7\xa2\xb5>>*\xd6>\xa4i\xbd\xbd\xd2\x12\xce\xbe\x1dsP\xbe\x8b\x83\x86\xbd\rX\x01\xbem\xb7\xec\xbe\x13\xe9\x17\xbeS1\r?M\xddN>\x91rF>\xa2\x86Z?\xf4\xef2\xbe\xae\xb8\x0e?^=\xa8\xbe\xe9F\xcc=\x00\x90\x1f\xbfC\xaen\xbb\xc9\xf2*>\xe6\xfb\x85=\xb2\xb2m\xbf\xd5\xff7\xbf\xae\x13\x8b>"\xfdr?\xfe\xe3\x14?\x00\x9b[\xbe\x0f\xc8\x1e<g\x06\xfc=\xe7\xd7\xd3\xbe\xb0=E?\x8e\x06\xb8>\xc9.\xf5\xbeE\x1f5\xbf\xed\x97B\xbfA-\x17\xbf\xfda\xea\xbd\x1c\xe4^\xbeUrc\xbd\xd7\xb5v\xbd\xaa~V>\x14\r\x15?@\xe3\x97>wo\x02>!\xa3^<\x8e\x8f)?\xe8\xa6\x08\xbf\xa6D\x1c>\xfe{\xf3<g5\xba>t\x85\xdb\xbe\x81H\x1e?\x84\x85\x8e\xbeq\xe7\xd2\xbeE\xc8\x81>U\x1d\xab\xbe4\xf8\xcb\xbe\xf3\xe6\x9b>\xf1\xed<=\xed\xb2\t?\xac/\x9c>\x1b\x08\x02>M6\xbb\xbe=\xff:\xbe\x1b\x00\x92>\xff\x92i>\x8b-\x84>\x85\x93\'?\x01<\xd6\xbe\xb7\x80\x99\xbc\x00`;?f\xf3\xd9<M\xd9\x0f\xbd|\x99e\xbf\x16\xfd\r\xbe\xd4<(?\xfb\xf2\x8d>@\x8d\xa0>\xb9\x97!\xbe8\xcc\x11\xbf\x8b=Y>\xdc\xf2\xf8\xbd\x03U\xa5\xbd\x8a\xab%?\xef%\xc8>Y\xadI\xbe\x92\xb2\xc5=\x8c\x89\x90\xbd,\xaf\x99>\x00\xe3P\xbe\xdc\x9f\x9f>\xb8%\xc7=qT3>\x0b<\xfe=\xe3yx>\xea!\x1b\xbd@\x11\x91=r\xff\x80\xbex\xa4\xce\xbd\xa9\x89\x83\xbdr\xcd;=\x1f\xe01\xbf\xc1\xb8\xf1\xbd0\xa3\xad\xbeX\xaay>\x81\n\xc5>\x94\xd9\x19\xbf\xd9j7?&/\xb4>\xaa\xe1\x89\xbb\x87K\x96?\x96\xd7s\xbd\x08mz\xbc\x08\xc6\xce=h\x15<\xbe\xce\xe7\xe8>\xdb\x82\x8c>\xe6-\x04\xbe\xae\x99\x18?Wh\xd9\xbeEQ\x9d\xbc\xf3\x93\x88>\xeb\x1b.\xbf\xc2V\xe9\xbe\x05\x99\xfd\xbe\xe8\x1dK\xbf\x8e\x83\x0f\xbf\x8biP>Q\xd3\xd4\xbc\xc8\xa5"\xbf\x18\x0f\xf6>\xa5j\xb3>\x9e\x01z\xbd\x0eP\xc3\xbd\xbax\xd6\xbe\x9e\xdf\x06\xbf\xe8F(?\xd4\xf7D=;\xcc\xe6>2g\xd3\xbe\xa6wy\xbf\xa54\x88>CYm>\xba[\xe5>\xff\xa5m\xbd\xacd\xcd\xbe\xbd\x0f\xa9\xbe\x1e\x99D?\x85\t+\xbd\x12\x1fk>\xab\x83\xc6=`\x15\xcf>\x01)5<XH\x84>h:\x1f\xbd\xa4e\x91>\xec\x03\xb3>v\xc9e?\xc4 \x1c?i\xec\x93\xbe@\xa3\xd1<\x19\x97\xa7>4XT\xbe'
-p1821
-tp1822
-bsV503967941701140480
-p1823
-g2
-(g3
-(I0
-tp1824
-g5
-tp1825
-Rp1826
-(I1
-(I200
-tp1827
-g12
-I00
-S'T\x19u>A\x893\xbd!,\xc7\xbe\x8d\x00\x8a;Ggt>\x1c\xe9\xdf\xbd\x04_\x0b<\x1dl>\xbeP\xd7q\xbd[\x15\xac=\x14\x065=Gh\xb6=\x10\x94->X\x0e\x8b<\x99\xb9!\xbe\xd6\xd4P>\xa0\x9f|;W\xdbd\xbb\x00\xe4\xfa\xbd\xe7\x99\xcc=\xa0\x11t\xbe\xaam#=@\x94a=y\xc0\x9e\xbe\x8d\xddU\xbd\xc3\xdb\xeb\xbd\x91\xbaN>\x1c\xee4\xbe\xec\xeab\xbeQn&>\xdc\xd5\x87=\n9E\xbd\x0ew\xb5=\xbc\x8aS\xbej\x9d\x0e\xbd\xec\x0f?>\xd6\xe8(=o&!>m6\x96>\xd1\xd3\x80\xba\x17\x1d\x90\xbdO$~=q\x99\x81>)\xdc\x92\xbe\xc3\x8b\xee\xbd\x970x\xbdHz\x96>\xcf(\xd5\xbc\x9b\xb12=t\xc4\x96>\x8aT\xd3=\xf6\x90\xc5>\xd9\x85)\xbe\xf6+G=j\xa1\x9d\xbe\xec{j>W\xcd,=[\x0c\x16\xbe\x17w\x97\xbeK\x0e\xa8\xbe\x14\x98[>\xb4\x7f\xa4<z\x89\x91\xbdH\xb0\x1f\xbe:9\'=\x18s9>\x99*\x1d\xbe=\x14\xe2=nw\x9c\xbe\x80\xdc\xd3\xbc\xfa\xb9\xe7\xbe\xb0\xb8[\xbe\xd5\x9f\xa8=\n\xe7\x7f\xbd \x0b\x02\xbe\xf3GL>\x80i\x84>6\xec\x97=\tB\xb2=\xe6\xe9#>\x91\xce\xda\xbd\xf1\x83\xd6<\x1b\xec1>\xe4\xee \xbe%\xad\x91=\x80\x1e\xdc=\xb0\xfd^>\xa1\xb0\x96\xbe\x13\xbe\xc4><;\x95=I\x1c\x1b\xbei\xcd\'>\x0c&\x83\xbe\'\x0cK=\xc7\xbe\x86>\x17c\xb5=\x19\xd8\xa8=1\x1bB>|\x12\x06>\x8e\xa2\x00\xbd\xdc\xad\x10>1F\x89>\xea\x1d\xb8=\x0c\xd3\x0c>]\x99w>3\x8eE\xbe\x87\n <\xdf{M=\x8f\xdby=\x8f\x7fS=X\x89\x9c\xbc\xb7\xe2Q>\t\x10\xe7=\x84.\x02>\\_\xe6\xbcn\xd6\x0b;/\xfd\x8d\xbe\x05\x18\x9d>4\xc40<\xe4\x8d\x02>\xdf\xd2\xd2>p\xe6\x00=\x0b\x1b\x94\xbd\xe6b\xd9<=rO<\x0f\xd4k>3\x7f\x16\xbe\x19\xc4v\xbd\x14\x0e\xc7<\xe9\xbc\x96<%\xaa\x8f=*\xf5\xd4=3\x1e\xbc=\x16Y\t=j\xf6\xe3=T\xdc\x06>\xeeL4\xbd\x97\xba\xf8:\xcd\xc6\xda=\x91\xc8\xe9=h"\r\xbe\xdf\x86\x98>\x01\xef\xb0\xbd\x9b\xe4\x93\xbe\xb9a\x1b>a1\x8b\xbdA\xdfd>$\xf17>\xfcC\x08\xbeOL\xf9\xbc\xda\x98\xbc\xbb\x1e$\xba\xbd\xc0\xe7_>\xa6\x90]>?\xbf7=A\xee\xa5>\xc3\x04\xe9\xbc\xbf\x1d\xdc=\x9e\xea\xa3=:\xb7\x1e\xbe\x17\xd0\x16>\xef\xa56\xbe\x11\xb2}\xbe\x830#\xbe\xf4y\xac\xbcG\xf2\x0e\xbe\xec\xbe\xc4\xbe\t\xaeA>\xc4-J\xbd&\xccZ:\x04\xa6\xa5=\xc0=\xe3\xbd^\x10\x0f=F\x92\xce>!\x8d<=\xb93\xe8\xbc\xda\x86\x86\xbe\x91\x12\x9c\xbe\x95L\x92\xbc\x90\x19\xb6=g\xe7f>\x91\xdd\xdb<\x87%\x1a\xbe\xe1\x98&\xbdg0 >\x9cy\x8e\xbc\xb0\x92F>\x82\x97\x89=a\xb7u>\x8a\n\x0e\xber\x9b.>\xd2\xed\x82=\xaao\x0c>\xb7\xca\x01>\xc9\xa2\x99>\xb0\xa7c>!\xbf\xec=\xe9~?=i/\x7f\xba([\x0b>'
-p1828
-tp1829
-bsV503978876939542528
-p1830
-g2
-(g3
-(I0
-tp1831
-g5
-tp1832
-Rp1833
-(I1
-(I200
-tp1834
-g12
-I00
-S'JSX>aIW=\xc0\xfeM\xbe\x8c\'!\xbcYM\xd7=\xb8\x8f\x84:\x0b\xa9\xed\xbc\xe6+(\xbe\xa9j~\xbd\xad\x1d4>\x02l\xe6\xbb\xf5H\x9d\xbdG\xec\x9e=\x86\x93\xa3<\xf0Q\x7f\xbd\x82\xc4:>\x15\xfd\x97\xbd\x85\xec\xbd\xbd8\xe2\xc5\xbd\xbf\xca\'\xbdN\x9f\xe2\xbd\xb8\x1co\xbceC\xaa=\x13f\x9a\xbcY\x07\xab<6_\x10\xbdC\xb7\xdf=[\xba\xad\xbd\xad\x90-\xbe\x07Q\xbe\xbc\x11\xce\xbb\xbd\x01O\x9a\xbd\xf0\x8b\xae=\xf7\nV\xbe\x16?\x03=\xe4]:>D\x88\xf5=f\xc9\xa0=Pq(>F6z=\'\x0eX\xbd!Gl\xbdad\xdf=\xecz\x17\xbe\xe4|\xbf\xbd8\x95H\xbc\xccBG>v\xbd}=L\xebN=\xc7n\x84>\xec\xd1\x12\xbd\x8f\x9bg>\x13\xd9\xa3\xbdy\xdf\xbf;_\x0b\x92\xbe(\xdb_=m\x8b*\xbc 5\xd0\xbc\xf3`\xb6\xbe\x12\x86\x82\xbeR\x01\x03>Q=\x1e>\xdf\xe0\xab=a\x81\x0e\xbey>9\xbd\x0b\xc1\xe4=\xb0}\x06\xbe`\xaa\x19>\x9a\x82"\xbd\xc7\x0b\x00\xbe.c\x95\xbe\x06\xf2V\xbe;nM\xbdZ\xb5\x98\xbdx\xd1y\xbdN\xf7\x86=\x98\xef\xc2=\x8e\xaf\xb7=m\x18\x07>\xbd.\xdb=[V\x06\xbc8\x9f\x95\xbcF\xd4|>TR7\xbe--\xc9=\x1b\xafR<\x02$\x14>P`G\xbe3\xe3\x8d>CG\x08\xbc\x1a\xfb\xd1\xbd\x08\x95\x81=\xaa\x85\xff\xbd,V7\xbd\xb1T<>\x1c\xf7\x9e;=s\x01>3C\x11>\xe8_b=\xd9|\x85\xbd\x87\x18\x91<O\xfd/>\x1cQ\xa7=\xc4t\x97=\xc4v\x88>u\x12\n\xbe\x9a\xcb\xd2;@\xad\xc3=Y\x88\x1f=\xb8\x11\x9f\xbb\xad~\x16\xbeNr\xd0=\x9a\xae\xff=\xe0\xae\xe7=\x0e\xbe6=8f0<\xc2\x8c0\xbe\x19\xf8\x1d>\x90r"<\xabS\x08=\xc7\x8f\x94>\xf3\x7f\x8f=\x14\x87G\xbc\xeas\xa3\xbc\x8f\x1bz\xbd[\xc6\x08>K\x82p\xbd\xc7\xdb\x0e=\xaa\xbfm=\xe0;\xa2=wCJ\xbb\x93-\xa0<[?\x1b=\x89\xf4\x91<\xcd_Q\xbc\x86]\xa3;A+`\xbd\xf8\xc2\x06\xbb%ug\xbd\xe8B\x12=2\x05\xce\xbd`K\'>)\xc1X=\xd3\x015\xbee:]>K\xb5m=\x07q\x98={\x8b\x80>\n\xd2\x83\xbd\x00\xf1~\xbc\xa9\x9c\x06\xbd\xb4\xaa\xeb\xbd\x97t9>d\xde\x0e>&\xf1\x14\xbdy\xe5J>\x92\x82\x9f\xbd+\xedi=\x1aK0=<\x1dC\xbe|6\xae\xbc|\xcc"\xbeXt~\xbe\xc3\xe8\n\xbe\x8c\xe2h<\xd5\x8c\x17\xbd\t\xd2e\xbe\xbd\x06.>yU\x97<\xfe\xec?\xbd\xd77\xa7\xbc&I\x0e\xbeji\x8b\xbd\xf7\x85\x84>\xdf\x1f\x14=\xb8WJ=\r\xc4b\xbe?\xfbx\xbe+\x17O<\xadE\x90=0R/>\x8b\x15I<V\xdf\xfb\xbd\x93\nr\xbd\x11\xbaW>\x9c\x9d"\xbb\x12\x92\x85=\xf1\xb6\x06=\x11`.>\xd1\x00\xe1\xbd9\xac\xe9=\xbeN~\xba\xd7/\xb2=\x9b\xe3\x04>\x19j\x8b>\xf5\rV>s,\xda<\'\xdfE=_S\xb0=#\xc8\x85='
-p1835
-tp1836
-bsV503969169327800320
-p1837
-g2
-(g3
-(I0
-tp1838
-g5
-tp1839
-Rp1840
-(I1
-(I200
-tp1841
-g12
-I00
-S'L\xc7\x9d>\xb2"\xe2=\xf4\xdd\xc6\xbe\xcb\x98\x1b=\xd2\xb9\xfb=N\x91\xc2\xbd\xd0\xa8 \xbd\x18|\x05\xbe\x7fb\xb6<\xc1 7>\xfaf\x1c\xbdL\xce\x1f\xbd\xa9k@\xbdbQ\xcc\xbd\x94\x11w<\xac\xb9X>\xb6\xb8\x81\xbc\x89\xf4\xe2\xbd\x1e\xfb\x11\xbe\xe2\x97n\xbcUj+\xbe\xc5\x185=TT\x96=\xe2s\x03\xbd\xe4E\x10;\x8c\xa4\x9e\xbd\xfarY>\xd2\xc7\xc8\xbbt6c\xbeb\xba\x98\xbd Ko\xbc\x7f\xd3\xc6<\x9a\x85\xb2\xbcaL\x85\xbeQ\x96\x01\xbc\x95fZ>7o\xee=\xcf15>\xaf7\x9c>{\x03\xd5\xbd\xa2\'K\xbe\xea\xf2\xae\xbbvz\xf3=oI\xf7\xbd\xcf\x19O\xbeiU\xd4\xbd\x16\x7f\x8e>\xb2\xfcn=\xf6H\xcb=\xf0\xb4\xb9>\xe9/7<)"\x9e>\x0f\x05@\xbeW\xcd\x96<\xf9{\xa5\xbe\x9e\x18\xe6=\\\xdc\xa5=aP\xc2\xbd*\xc3\xc2\xbe\xd2m\x97\xbe \t\x1d>\x149\xa7>\x14\x86!>,:\xa7\xbd\x9c"\xe4=\x87J\x86=@``\xbe\xf9\x9a\x92>wt\x82\xbd\x10V\xbe\xbd\xfa\xea\xde\xbe\x0b\x1f\xa5\xbe\xccs\x04\xbeg\xee\x0c\xbduR\xea\xbd"\x88\x95=\xde\xc1\x07>\x01r\xa0=\x1e\x19K>I\xf3\x11>\xc0\xd6\x08\xbb\xfc\xd8o<\x92\xceJ>\x85\xa6e\xbe1\x07\xb5;!\x1a><\x02\x91\x13>\xb9zk\xbe\xca\x1a\xa2>\x96\xe1\xaf\xbc\xa6u.\xbe\x10#<>N\xf8V\xbe\xa2\xe4\xb9\xbd\xaf=P>ed\x8f=\x1a\xac\'>\xf1]\xff=\xef\x0f\x07>o\xce\xa4\xbd\t\xe8\x8c=\n\x0eY>\x85!\xa4=\xa77\xee=._~>\x0c/\x8a\xbe\xa1\xbd\x13\xbdQ\xd8k>\xeah\x0f=\x81\xfev</\xe2\x95\xbe\xc1\xeb~\xbc\x1f\xaf|>\xc9\xa7/>\xf1\xc1\x07>[\xd5\x0e\xbd\xf4\xbb\xb6\xbe\xd0\xe6<>\x11\xe0\xd9\xbcBa\xd1<\x013\xae>\xf0\xfe\x0e>*\xaa\xe2\xbdo*\x83=A\xa9T=\x07{5>\xe8\x0f\x1c\xbe\xc7\xa1K=\xd6V\xa8<a\xe1\x04=\x80\x1d\xc6=\xd1"\n>O\xa8\xed<R\x14\xa5<&\x87&\xbd\x05$S;\xbf\xa2\xd3\xbcb;\xba<\xce\xc6&\xbek\xd3\x12=\x9fT$\xbe\x8e\x96K>0k7=gN\xae\xbe\x86\x90i>A\x16\xb3=\xb1\xf0\x05>%Z\xed>\xb7?\xaf\xbd\x9b\x9cH;~\x08\x82=Y\xb3\x94\xbd\xd2\xf9>>\x81_4>\x87"\xc3\xbcVV\xb7>\x14\xaf\xf7\xbd\x93\xbc\x83=9*\r>\x97\xe9\x7f\xbe\xe6\x07|\xbd\x80_i\xbel\xa0\x95\xbe\xc2\x08n\xbe\xe7L7=\x06\xd4\xcb\xbd\xb7f\xae\xbe1\xf4e>\xccK\xd7=\xa0\x82\xdc<\xcc\x1d>=\xee\x14\xf9\xbd.\xa1\xe8\xbd\xe6\xdc\xb6>g\xa1\xee<\xf6\x055>\xe2\xa9L\xbe\xfc\x91\xd4\xbe\xfaQ\x84=\xf9O\xb5=\xb9fD>oS\xf4<L\x90B\xbe\xd8B\x05\xbe\x94A\x98>~\xd9\x9b\xbdf\x16\x0e>u\xcd@=I\xb5\\>L\x19\xc0\xbc\x19\xa5\x05>\xc2\xa9/=\xa6\x17\x03>\xd0\x04!>W\x0b\xa3>\x84/\x85>f\x99\x15=<[I=W\x8d\xa1=\x8e\x00\xb7\xbd'
-p1842
-tp1843
-bsV504173101689892864
-p1844
-g2
-(g3
-(I0
-tp1845
-g5
-tp1846
-Rp1847
-(I1
-(I200
-tp1848
-g12
-I00
-S'\x86\xdf\x04?\xe7\x1e&>,\'\x06\xbf\x1b\x03\xbd\xbdy6\x14>A]\xaf\xbcO\xa8X\xbd\x96ls\xbeW\x12\x9a\xbd\xa2\xd5v>\xce\xf8\xb3\xbd\xa1\xb3G\xbe\xff\xbfA>\xbcx\x17\xbe$o$=\x1e+\xb9>V\x88\xb7\xbd\x80\x02q\xbeF<E\xbeQk\x0c\xbbt\xe9\x80\xbe\xf5ft<\xb2s^>\x90\xfc\xbf<\x95[w=\xb5\xa9\xe6\xbd\x0fJ8>\x9fJ\xa2<\x86/\xaa\xbe\xabC\n\xbe\xff\xcc\x98\xbd\xf4\x0eK\xbcv\xf4-<`>\xc6\xbe\x16\xd5\x93=1\xbfs>\x10\x97|>q\x02;>f}\xb6>`|\x0e\xbc\xd9\xfd)\xbe\xb7\xa4\x80\xbd\xbc\xb7\x92\xbc;\x05@\xbea\xeb\x8b\xbeh\x0f\x04\xbe)\xed\xda>\xd0\xd4\xac= Q\xb2=\x01H\x02?\xcba\x91\xbc\xee\xf9\xd2>\\$u\xbe\xe2\xba\xb5< M\xb6\xbe\x91\xb0\xd9=6\xf3\x00>4\x14\xa1=\x0c\xcf\t\xbf\x86\xbd\xca\xbe\x8a:z>ih\x03?\x7f\xe1\x8b>LA6\xbe\xb2B\xfe\xbc\xa1\r$>\x9b\x15$\xbe\xbf5\xd5>\x87\x80\x91<\x1bOM\xbe8#\x05\xbf\x05\x16\xf7\xbe_.\x98\xbe\xfe\x1a\x83\xbdA U\xbe6n\x99<\x91\xe9v<\xe62>>\xbc?\x91>\x0b\xba3>\xd7u\x0f=\xd9b\xa5\xbc\x16\xeb\xc1>\xfbA\x89\xbed\xc4\xb0=\x00<3>~\xbdb>\xf1\x10f\xbeQ\x93\xda>\xa63O\xbe\xe8\x8a\x98\xbe\x1f\x1aW>n5\x90\xbed*W\xbe\x98\xa9\x1c>\xb3\xf7\x81=d\xce\x91>L\x1fg>\xf2\xa0\x98<n\xba\x1b\xbe\xc0p\x95\xbc\x8fM`>Qga>\x91\x05L>\xf9\xb2\xd4>\x0e\x06\x97\xben\x7f\x1d<\x04\n\xcc>^\x8d\xb8\xbbWD\n\xbd?\x98\xef\xbe\x01-\x8f=\xd96\xbe>f\x05\x81>\xe9\x1a\xb0=\\\xc7\x11\xbe\xd2\xf8\xc2\xbe4~N>\xfa\x9d\xbb\xbdp\x0bo=)K\xf2>\x82\xf6k>\xaaV\x10\xbe\xf7@\x0b>\xe2\xc4\xb1\xbaL\nd>\x8aCs\xbe\xe5\xca\xe9=\xe2\x90\x93\xba\xbbq\x03>\xf2\x0f\x02>FKU>\x06@8=\x0bEa=\xa4\x12\xb4\xbd1\x89\n=~\x80J\xbd\xec\x9f\x82\xbd\xfb\x12\xa0\xbe\xd1\xa9\xd7\xbc\xcf\x9f\x8e\xbe\x10\xbev>\xea5;>\x168\xde\xbe\xce\x94\xbf>jM\x00>\xeax\x00>>\xb2%?f\x1b\xf3\xbd\x96C\xa6\xbd\xc9\x0e\xa7=\xad\x1b\x02\xbeW4\xae>W\xeco>\xc4Z^\xbd\'\xb6\xc9>\x1e\xd41\xbe\'B\xc1=$\xf0\xe4=\x9c\x95\xd6\xbe\n\x95\x1f\xbe\x00\xea\x93\xbet\xb9\xde\xbeN"\x9e\xbe\x81"\xe9=O\xba\n\xbe\xd8i\x01\xbf\xc6\x9f\x87>\x85\xb5Z>\xe1\xc8\x19\xbc\xdf\xbc1\xbd*$\x98\xbe\xa6\x12\x8d\xbee6\xec>\x95\x9fC=\xca7\x02>\x89\xfb\xa4\xbeNV!\xbfPf\xa9=\x1e\xb1=>\xbc\x14\x95>\xa5\x05\xcd\xbd\x0bl\x82\xbe\xa1Bv\xbe!\xa1\xde>Z\x9b\x82\xbd\xf5?\x94>q\xe5I<\xca\x82\xb6>\xc7\xab\xac\xbd\xac\x020>\xc6?/\xbcQ\xb6p>\xca\x90b>\x02_\x08?"\xa1\xca>\x8e\x91\xa4\xbd\x91w\x94=D%\xe8=\x0c\xb3\xfd\xbc'
-p1849
-tp1850
-bsV504173249056751616
-p1851
-g2
-(g3
-(I0
-tp1852
-g5
-tp1853
-Rp1854
-(I1
-(I200
-tp1855
-g12
-I00
-S'&\x14\'?/-Z>\xa2\xba \xbfgM\xf9<\xc0\x93\x1f>\xa2\x7fq=y\x82\xc7\xbdH\x18\x96\xbeo\xaa\x0b>\x95\xb5\x01?\x87%U\xbe\xa3\xecV\xbe\x12S\x8b\xbb\xaaL1\xbeS\xd1M>(\x8f\n?\x19\xe8I\xbeM\xa7\x95\xbe\xc3\xf1\xa8\xbe\xe8\xa3\x8a\xbeBr\x15\xbe68y\xbc\x9fe\xa5>\x8a\xb6\xa8>\xc4\xfa\x0f>\x182\x1d\xbe\x8e\x1d\x9f>e9e=sI\xc6\xbe\x94x\xe8\xbe\xa0\xd9\x82\xbe\x11\xf4c=\xf1\x87\x9f\xbdS?@\xbf\x1e\xae\xd7=h\xa4\xcf>\x16\xac\xe3>\xc3\x93\xa7>\xb3\xb5\xdc>\r\xefa\xbeT\x80\xfd\xbe\x8f\x81$\xbe\x05\t.\xbd\xd6u\xd9\xbc\xe8\xf7\xf4\xbe#ZE\xbe4\x8e\x0e?}|j>;+l>y\xe4I?\xf7\x9e\x8e\xbd$\xe0\x1c?\xc2\x1c\xa9\xbe~\xe0\x1f>\xec\xdd\x1d\xbf\xb8\xd9\x06>\x8d\xc3\x96=\xdbe\xee\xbd\x07\x86C\xbf\x9e\x845\xbfs\xd8\x80>\x99\xd5[?\x8a\x9d\x1a?[\x91\\\xbeb\x912>E\xe4p=\xc7\xd0\x03\xbf}\xa47?\xd8,\xcd>W\x89\xb4\xbe\xef! \xbf\x8a\x917\xbf\xbb\xb5\xe9\xbe\xcd\xc8\xf8\xbd\x88\xae:\xbe\xb8\x08&\xbc3Sf<\xf9`\x0b>\xdc\x87\x06?\x18 \xab>\xf35\xba=L]\xba=l\xeb%?\xf1\x9e\xef\xbeN\xfb\xa5=\x9c!\xb3\xbc,\xb7\xb8>k\x14\xd5\xbe\xa7\xe6)?\xe0\xffj\xbe\xca\xbc\xf8\xbe\x84C\x81>\xbc,\x8e\xbe\xc5\x8a\xbd\xbe-\xa4\xcb>(~\x83\xbdx\xf1\xf5>^\xc8\x85>\x88\xad\x8c>\x99\x9f\x9e\xbe\x06\xb5\xcf\xbd\xe5h\x82>\x8c\x12\x85>@\x10\xc0>\xb6:)?\x9c\xd1\xce\xbeh\xab\xca\xbc\xe0=\x1f?\xff\xb1\xc3<J\xc8\xed\xbd\xa8KL\xbf\xc3\xc6u\xbe\xaa\xbe\x06?\xe0\x13\x88>\xad\xf9\x82>T{\x8f\xbd\xf0 \x15\xbf\xb7\xf7\x1e>\x87\x84\xdf\xbd#.$\xbe\xf0\xaf*?0|\xc7>H\x12\x9c\xbd\xe7N\x1d=\xd4G\xae<\x15\x04\xbf>\xfc!\x06\xbe\xfch/>\x18\xca$>\x1e\xcel>]\xeab>\x98\xc1*>\xb3\xfe{;>]\xe7=\xef9H\xbeL\xdb\xd6=ss\xeb<O\x10\xfe=N\x04,\xbf\x15\x1b\x1c\xbe\xafq\xd5\xbe\x83\xe1\xc5>%\x9b\xbc>-\xa7 \xbf2 \x04?4~\x84>lmk=\xb3\xeb\x81?\xe8\x1e\xf7\xbd\x186\x83<\x08\xf1\xe3\xbbyn>\xbe\xa7y\x9e>H\x12u>\xed\x94\x05\xbegM/?@\xda\xf2\xbe\xec\xeeC<\x1bB\x82>\xfd\xc7&\xbf\\\x8d\xc2\xbeV\x92\xed\xbe\x99/T\xbfl+\xd5\xbeq\xb4#>SU\xaf\xbbh\xd9+\xbf\x15V\t?\xf8?\x19>Q!\x03\xbe\x88<\xf8\xbc\xdd\x87\xbd\xbet\xcc\xeb\xbeC*"?\xad:\x96=O\xe2\xc4>=b\xac\xbeg}V\xbf\xd6\xb1\xbf>\xc0\x89,>%R\xe0>\x8eZ\xa6=\xfd\xf4\xda\xbe\xdd\xfar\xbe\xder%?\xf2kH\xbbx=\xa4>\x90\xd9M>\x05\xfc\xc1>\xe9Y7\xbcJ\xe0\x9b>sV\'=\xb4\x7f\x8c>]e\x0e>QF^?\xe5\xce\xfc>\x1b\xae\xcb\xbd\x88\xc3\xac\xbcx\x1ey>\xda/\x8b\xbe'
-p1856
-tp1857
-bsV503972008216911872
-p1858
-g2
-(g3
-(I0
-tp1859
-g5
-tp1860
-Rp1861
-(I1
-(I200
-tp1862
-g12
-I00
-S'\xffv\xae>\xa8\x1af\xbd\xe8=\xdd\xbe\x80++:\xad\xe7\x87>\xd8\x05\xf8\xbd344\xbd\x05\xfcJ\xbe8\x0e{\xbd\xdd\xed\x18>\xe4\xcd\xab=\xb0\xe9\xac=\xe8\x05,>\x14X\x98<\xf3\xa4\xb8\xbd)o\xb1>\x13\x8f4\xbdX_+\xbd\'\x8f\t\xbe\xe1x\x98=|\xd0\x98\xbe\x1fx\xc6<+\x15\x98=R\x1a\x94\xbe{r\xbc\xbd;\x7f\xcd\xbdY\x85`>\xa5H\x8d\xbe\xfdS\x90\xbe\x8f\x83!>u7\x94<\xe3\xd4\xd7\xbd\xcd\x1b\x15>\xc0\xa7w\xbe\xbb\xad\x0e=\xa1\xdc\x8a>\x14l!>\xdbN\n>\x95\xa2\xb4>}0<=\xef\xb9\xe5\xbd\x08\x15\xf3\xbc\xf0\xa6p>YR\xa0\xbe\xf9!\xf8\xbd\x97\t;\xbdK\x00\xc6>\xf18}<\x8c\x07\xac=\x89\xd7\xab>\x84 \x82=\xe4\xc5\xe4>\x07\x05:\xbe\xd83\xeb\xbb\x992\xe0\xbe`L\x7f>\x87\xa4\xc6<\x03\x14\r\xbedR\xff\xbeS\x9d\xc7\xbe,\nd>7\xa4\x13>\xd1\xdb\xea\xbcA\xc9H\xbe\xed\xaa\x16\xbcX\xd1p>\r\xb08\xbe#up>\xf9x\xa5\xbe\x19U\xb8\xbd\x91i\x0e\xbf\tj\x8f\xbe\xc4\x82\xe7\xbcqu\xaa\xbd\xeb\x03\xd2\xbd\xb5\xffu>Rn\x9c>q\x1e\x0c>$k\xe5=U\xc8b>\x97_\xb0\xbd}\xbdN\xbcs\x84\\>\xdd(\x8a\xbe\xfc\xda\xee=@?\x9b=9\xda\x8b>\xa4\xc2\x9c\xbe\x17\xfa\x07?\xd8\xd6\xb9=a\xdc-\xbe-,r>\xca\x82\x95\xbe\xa7\rt=@\x83\xc2>\xe1\x1bC={\x85?>\xc0Ji>\xf1!\x15>{\x8c\x9a\xbd\x9b\xbf\xf2=4\x8c\xaa>\xafB\x16>\x97\x0b\x18>\xa4\xaf\xe3>\xd7\x86c\xbeH\xd4\xc3<\xa9U\x98=\x91\xe7\x89=e\xabn\xbc9\x81\xb4\xbd\xc4kp>;E\xe8=,\x8b0>%~s:m\xb5O=u\x1d\x9d\xbe\x8b\xf9\x8c>k\x91\x8f=\xe3\'\x07>\x95[\x04?\xb1\x90\xdb=\xe8/\x95\xbb\x81\x0e\x13\xbc\xab\x16\xc6<\xbb\x1c\xa4>\x18\x97/\xbe`\x9d\xd6\xbc=\xdag\xbb\xa5\x1f\xc1=:\xdb\xa6<\x9b\n\xbc=\x8d\xb3\x02>\x98\xabV\xbc3,[=\xd8\'\xdb=UnI\xbd\xaf7\x99;k\x88z=\x818\x84=\x91\xac<\xbe$e\xb2>\xa5\xd4\xe5\xbb\xb9\xc4\xa4\xbe\xa7\x88r>\xc0\xcfQ\xbd\x9b\nQ>\tQ\x94>U\xf9H\xbeN\xad\x88\xbba\xc3\xe7\xbc\xa6\xef\x03\xbe\xfb\xd8f>m\xb4Y>\xa5W\r=\x1b7\xbb>\x8d\xect\xbdK\xab\n>\x17\x18\xb5=w\x19\x82\xbe\xb0\xc2\x0c>780\xbeU\xbc\xa0\xbe\xc4>\x15\xbe\xcde1\xbd9\xfc\xf8\xbd|\xcf\xce\xbe\x8f\x88\x93>\x8b\xeaq\xbd/a\x96\xbd\xc1!"=\x9di\'\xbe\xd5\x08+\xbc\x11\n\x01?\x8c\xad\xe0=\xa5\x9b\xec;1\xf0\xa7\xbe`&\xb8\xbe\xbc\xa9\x0b=A\xaeB>0%\x91>I\xcb\xeb<\x15(+\xbe\x0bQ+\xbd\x81!\x94>\x0cvW\xbdP\xa5d>\xa7\\b=\x0c\x88\x86>\xf3=<\xbe\xbdp/>\xd6\xb2\x80=\xd5\xf8\xc1=\xf8w>>[\x99\xb6>^\xa6\x9b>\x0eu\x0c>1\x08\x88=4E\x17=\x08\x8e\xcf='
-p1863
-tp1864
-bsV503971544788664320
-p1865
-g2
-(g3
-(I0
-tp1866
-g5
-tp1867
-Rp1868
-(I1
-(I200
-tp1869
-g12
-I00
-S'\xfd$(?L\xe9\x83>^B\xe7\xbe\xc8\x9c\x17\xbeT\x16\xeb=\r\xff\xde=\xf2\xd3\xb1\xbdt\xd1\x87\xbe\xccU\xdc=\x14\x8e\x0b?\x8b\xa1\x1c\xbe\x83\xd9\x8a\xbe9\x1f\x03\xbd\xf4\xfe\t\xbev\x08\xa1<Y5\xea>=Zc\xbea\xff\x8f\xbeM\x16\x99\xbe\xda\xc4\x81\xbe\xfap7\xbeh:!=\xcb\x9e\x90>\xbaW\xd2>\x07?\xe8=\xe3\x94\x04\xbelS~>\xf86\xc8\xbd\xed\xd3\xc2\xbe\x85\xb4\xdd\xbe\xd0m\x06\xbeF9\n\xbd\xb7\x88\x81\xbd6\xe1\x0c\xbf\xd1\xfd\xd8=\x99\xe6\xc3>\x97\\\xd5>\xd4\x8e>>\xa2\xb2\xa5>m\x80\x1e;\xadr\x93\xbe\xab\x00I\xbe\xf4\x17\x1a\xbd\xca\xf3\xa3\xbdh%\x93\xbe\x1b\x1c\x99\xbd\xb8\xf7\xe2>\x90\'\x01>hv\x08>\xfck8?\xbd\x95\t\xbe\xa2\xaf\xd9>0\x1a\xa4\xbexy\x8b=m\x00\x00\xbf\x99\xa6q=#K\r>X\x1fq=q\xca>\xbf\xec\x9e\x1e\xbf\xbe\x1b\x9a>+\xbcS?v\x9c\xdf>\xa2`;\xbeS\xa2\xf8\xbc\x87\xee\xa3=3\xa0\xaa\xbe\x17F%?\xfa\xaf\x86>\x91$\xbc\xbe\x87v\xd7\xbe\xcb\xdb\x07\xbf\xf3\x9c\xb9\xbeliH\xbe\xf9K:\xbeS(\xa8\xbd\xd8\xe8Z\xbd.\'\x0c>\xb2)\xc2>*ue>M\xdd\xa3=\xad\xe3\x14\xbc\x18]\x13?\'\x03\xd0\xbe{X,>\x08\x17\x9c\xbbC\xae\x84>Q>\x91\xbeZt\r?e\x1f\x02\xbe,\xb9\xaf\xbe8W=>C\x8ck\xbe99b\xbe.~\xc5>\x9cV\x91\xbd\xf30\xcb>\x98\xfa{>#\x13\x16>^\x9aj\xbeT\xbb\x90\xbe\xc7\xe3Y>\x0c\x96H>\xe18\x1b>-\xe8\xfb>\xe78\xa0\xbeC\xdf\xaa=8\x18\n?\xd8B\xc2<\x90\xab\x16\xbe\xb7m<\xbft\x0f5\xbe\x13t\xc6>9\x8e">\xed\xe4\x8a>D\x0cB\xbd\xd8\xf7\xd8\xbe\xd5\xb5\x00>V6L\xbc\xadO\xc5\xbd3\xe0\xf9>\x17\xa8\xa5>q<\xc0\xbd\xb5\xc0<=\xbaWW\xbd\x9b\xce\xab>\x83m\x8c\xbd\xf3TZ>\x98\x02\xfe=Nw\x92=\xf94\xf5=\xb3\xb9\x93=\xaa\x8a\x7f\xbc\x04Y;\xbd\xc4\xdeK\xbee\x7f\x0f\xbc\xc9\x04\x98\xbbU|\x18=\x05\x9c\t\xbf\xbfl\x95\xbdZ\x15\x89\xbe\xe7$\x15>\xa9\x88\x92>\x13H\xdf\xbe\x9d\xee\x1b?$\x87\xb0>Z\xbb\x99=OKU?sY\xb8\xbd\x11\xe1\xd5\xbc\xd8m\xb3\xbd\xb1\xd3_\xbe\xef\x00\x9e>\xee>,>%\xa7\xe4\xbd,\xd1\xe0>\x82\xe2\xb6\xbe\xef\xa6\xd5<\xd2h\x1b>82\x00\xbf\x87\x19\xd0\xbe/\xd9\x83\xbe\x98\xcc\x12\xbf\x98\x01\xc5\xbe\x87\x8b\xfa=e\xa8U=\x98l\x0e\xbf\xa8\x1b\xbd>i8J>\xbc\xbe\x9e\xbd\xfa\xa7\xb8\xbc\xf8\xd5\x8b\xbe\xd9\xf6\xd2\xbe&e\x17?\xc6N\x1f>R\xd5\xad>\xb3\xd4\xa5\xbe\x07I5\xbf3\xa8+>\xad\x95+>\xf3\xcb\xba>\xd6\xd0\x10\xbc\xd7\x08\xd4\xbe\x13K\xad\xbeH\xd9\x08??\x92\n\xbd}\xa10>\x08#\xf9=#\xcc{>-\xf8\xd5\xbb\xac\xbf">c\xa9\x83\xbc\x1dQ~>\r)\x1b>\xc3\x134?\xfe\x0f\x02?D\xe1K\xbe\xc7T\xf2\xbc\xf9\xf8V>X\x9c\n\xbd'
-p1870
-tp1871
-bsV504200091721531392
-p1872
-g2
-(g3
-(I0
-tp1873
-g5
-tp1874
-Rp1875
-(I1
-(I200
-tp1876
-g12
-I00
-S'L\x97\x8b>d\x9f\x9e=* \x8f\xbe\x1fs\xea<\xfb\xf9M>\x98&b\xbd%}\x00\xbd\x01@9\xbe\xfd\xb6\xbf\xbd\xe8v~=\x98Z\xe1;0al\xbd\xad4\xe1=T\xecJ=\xb9Jt\xbdq\x1e\x89>\xfa\xfb\x9c\xbc\xd4\x1f\xf4\xbd\x93\x01\xfd\xbdew\x04<\x95\xd6\xeb\xbd\x9d\x1d\x9d<\x03(\xca= \x00\xe4\xbdX\xd3*=\xcb\x1e\x85\xbdAf\x80=\x1d\xaaS\xbdl\x06\x1c\xbes\x9b\xe1\xbb\xb1\x92\xce\xbd\xdc_p<\x9f\x05\x92=+K?\xbe\x0c%\xaf=\x84\x08\xf5=\x81p\xc7=\xd7\xbfB>\xfc\x15->\xb3\xc7\x07\xbd\x9c\xcd\xc0\xbds\x13\xa6;\xbf+">\x7fG0\xbe\xc7\xda\xd0\xbd_T,\xbd\xf2\x1f!>K\xa8\xa19\x92\xb3\xa0=\xbdv\x8f>\xf020=\x8f\x86\x87>\x9c\t\x8c\xbd\x13x\x96=E\x19\x92\xbe\x80\xf7G=\x9d\x96"=7\xaa\x90\xbd\x0c\xdc\xa3\xbe\n\x89\x82\xbeg\xa6\xe6=`m\x1a>\x87\xae\x90=\x04\x83\xe6\xbd\xfb\x7f\x9e<\x91\x98<=q\xeb\xa6\xbd\xbbG@>\xea\x1e\x1f\xbd\xe5\xc2\x14\xbeQ\x13\xb6\xbe\xed\x817\xbe\x8do\xd0\xbdUc\x13;/\xcb\x8c\xbd\x18\xd7\xeb=\xa70\x00>\x85\x83\xa7=\xfb\x86\t>\x839\x13>\xf9d\x9c\xbc\x97\xcf\xd8\xbc\xed2\xfc=\x87!7\xbe\xeb\x81f=\xe9\xb4\xb7=L\x8d9>\x04h.\xbe\xbb^\x97>\xe8\x85N\xbd\x04\x80\xd6\xbd\x1b\xaf\xd5=\xe0hQ\xbeK\n\xca\xbd\x7f\xfe\x13>G\x80\x05>E[\xfe=\x18\xd36>\x18T\x99<\x91\x80\xb7\xbd\xe0\x8a\xc5=\x1c:8>\x13\x9f\x8e=\x19\xbd\t>V#\x9f>\xcc\xb6\x02\xbe)\t@;a\xb8\x0e>w\xf3K=\xd3\xc8\xbc=-^\x10\xbe9\xb4!>\xb1\xa3[>}\x12\xaf=\xc1o\xef\xbc\x95\t\xa6\xbc\xae?\x81\xbe4WO>yC"\xbbq\x0c\x9f=\xa9D\x9f>\xd19*=#0g\xbd)\xc27=qZ\xfb;\xa00\xea=\xff\x85/\xbe4\xddW=\xab\xbdo<>7\x8c=o5\xb0<\x15\xa1\xfc=\xe1*\xbf=\x8c\xd0o=\x93,>=Q\\\x04\xbdq\xc0\x80\xbc\x07\x12"\xbcw\xc1a\xbc\xe9\xc1\x1e\xbd[M\x01\xbe\xdb.1>\xcd\x8c]=\xd5\xd1j\xbeMz\x85>\x0fB\xf7<h\x89t=\xadp\x92>(\x9a|\xbd\xbd\xcd\xda<%\xd7\xe2=+\t\x80\xbd,\xf6O>\xb5\x82\x05>\x82\x8f(=\x99\xfeb><\xe8\xbb\xbd\xa2!\xaa=3.\xfe=0\xe8?\xbe\xc8\xbf\x1d=\x8d\x02W\xbe\xd1A\x81\xbe\x92\x97\n\xbe \xceC=$\x93\xae\xbdP\xb9c\xbes\x9a3>\xe2\x86\x85=Ou\x94\xbd\xa1,\xa8\xbb\xd15\n\xbe\xd9\xe6\x8b\xbd;;{>P8l\xbc\xd3`\x9b=\xd7/=\xbe\xb9\xf8\x9e\xbe\xdb\xa0\x80=Y\xe4\xdc={"$>\x07\xa2\x14\xbd\xb1\x18\xcc\xbdo\x11\xf1<\x92\xb0\x88>\x15\x1fR\xbc\x06\xd7\x08>Ex\xdd<#6\x0c>\x91\xc4\xa0\xbd\x97y>>\xdcsE<\xc1FI=\x08/#>\xd0x\x9e>\xe6b\x1e>\xeb\xb1\x13<\xe0\xa9\x89<\xfd\xffx=\x04c\x08='
-p1877
-tp1878
-bsV504254821956743168
-p1879
-g2
-(g3
-(I0
-tp1880
-g5
-tp1881
-Rp1882
-(I1
-(I200
-tp1883
-g12
-I00
-S'>9\xe5>f\xa1\xde\xbd\xe4u4\xbf]3\xbf=\r\xeb\xce>\x88\xd2I\xbe\xcc\xda\x93=\xbaw\x8c\xbe\x95\x89\x87\xbc\x90\x06\xcf=\x16\x81\xd5<RP$>\x1eN\x8b>\xfa\xde\x90="\x93*\xbe\xf3\xe3\xc5>\xcbgK<\xb2\x84\x04<\x9e~K\xbeWj\xad=6\xde\xa3\xbeR\xc8\x83<\x86\x14\x13>\xf3\xc7\xfe\xbe\xcd\\\xdd\xbd\xe95;\xbe2^\x9e>\xed\xbc\x9b\xbe\xe9\xa6\x8a\xbe\x88\xbbb>\tq1=\r/+\xbeES+>^\xf2\xe0\xbe\xd5\x06\xf3\xbd \xae\xc2>\xd5c\xd3=\xea\xab\x8d>^\xc9\xfc>b\xda\xeb\xbaJ\xd8\x0f\xbeV\xd2\x8d=\xab\x84\xae>c\xe2\xdf\xbe\xef\xd0\xa9\xbeT\xd5/\xbeK\x8f\x05?k\xe5l\xbd\x02\xfc\xad=\x84)\x0e?\xbf\xdc?>\xe2?2?\xe2\t\x93\xbe+\x0f\t>#\xb0\xe5\xbe\xe0^\xd9>\xf5r\x17=\xfb\xa7\xa9\xbe\x8dT\xbe\xbeP\x97\x12\xbfF\xda\x99>\x03.\x13=\x1e\x84\xc2\xbd\xb0\x96\x90\xbe\xc0\xd6X>\xd0\x1f\xa5>k\x98\x94\xbeP\x1e1>\x98\x9e\xe7\xbe\xa4T\x1d\xbe\xf5\x0bE\xbf\xfa0\xc4\xbe\x05Uj=\xee\xca9\xbe\xb8\x0cm\xbe\xc0g\xa5>\xa4\r\xc4>2~\xde=\xf2\x98=>\x1e\xc4\xaa>\x8a\x87#\xbe\xf6J\xc6=\xe0\x04\x9b>T:B\xbe\xf9\xe1\xbb=\x86J>>VH\xce>\x1cS\n\xbf:\xf8<?\x08\xe2\x90=#\xde\xb8\xbe\x84\x7f\x90>\x06\xfe\xea\xbe\xb9\x88\x84=\x82\x7f\xfb>u\xe8B>\xbae\xf4=V;x>\xea\x8f|>\xc6;\xc5\xbdt\x85?>\xf2\xc8\xe3>2f\x17>\xf4\xda\x97>6\x86\xf0>\x10\xc3\xb9\xbe\x0e\xfc\xbb<\xee\xde\xf4=h\xb4y=\r\xd6\xae=\xe3\xa6\xcd\xbdNV\x8e>\xce\x92\x89>[\xa2u>\x1d\x1e_\xbc\x00I\xdc\xbc\xe6\xfb\n\xbf\xd6\x93\x02?\xfe\xdb\x01\xbcC\xfc\x02=:Q8?5qp=\xea\x92\xbf\xbd\xf6vv=\x99\x17\x90=Y\xac\xca>\x08\x93\x91\xbebr\x91\xbd\xbab==\xb5\x04I=\xe6(U>X/\x80>K\xedW>\xba[#<\x17\xdd)>\x91\x0e\x96>\x1a(\xe2\xbc\xb9\x030=\xd5\x98\xe5=V\xb8\x07>k\xe2\x90\xbe\xc6\\\x14?\x08\xe3\xdf\xbd\xda\xf4\x17\xbfM%P>\xf6G\x81\xbe\xe0f\xa3>\x1c\x1f\xbd>M`M\xbe\xcd\xcf\x0f<]\x0b\xaf=\x1cA\x8c\xbd\x17\xb8\x96>q\\\x94>\xbdE\x1f>\xfa!\x1e?\xea\x1f\x08\xbe\x83\x89V>\xc2"7>\x12f\x96\xbe\xde\xdbZ>\xac\x89\x9c\xbe\x9d\xd1\xf7\xbe|\xb2\x93\xbel\xf3\x18<\xd2Fu\xbe\xd0\x07>\xbfTx\xc7>\x8aZ\x9b\xbd&lL\xbd5"[>G\t\x8c\xbe\xa3S\xc8\xbb?\xa85?\xec>\x03>\xe2\x04\xe6\xbc\xb5K\xab\xbe \x96\x01\xbf+ \r>\x86\xfd=>\xe3\xf3\xed>\x8d\xa6t:\xf2\x1eB\xbe[u\xd7\xbc]\x1e\x88>e\xb6\\\xbd\xeeg\xe3>\x1c\x81\xba=\x96\x9a\xb7>v\x1bZ\xbe\xd6\xa8\xb3>\xc4\x10\x1d>I\x95\xb4>\xe8\x87\xe2=\xef\xca\x06?k\xc6\xba>\xd7B\x00>\xc1\xea\xb7=@\xcb\xdd\xbc\xb9\x13@>'
-p1884
-tp1885
-bsV504239973243969537
-p1886
-g2
-(g3
-(I0
-tp1887
-g5
-tp1888
-Rp1889
-(I1
-(I200
-tp1890
-g12
-I00
-S'Ru\x05?\xee(\xc8\xbd\x86\xb6?\xbf\x88\xdb\xe2;\xfb\xb6\xd2>\xa7\x91\x1a\xbe\xb5\xd9\x16>i\x82\xa0\xbe(\x06<=\xf2up=E\x90$\xbd\x92.\x00>w\xd7\xa7>\xb68\x98=\x83Ne\xbeV&\xd0>\x0e\xbf\x8c<\xb6\xdb\xc3=9\xc1\x94\xbe\x99\x8f\x84;K\xb3\x81\xbe(d\xba<\x01\x18\x8f>\x1d\x89\xbe\xbeC\x80\xc4;\x80\xce\x90\xbe\x99M\x9b>UOu\xbe\x83\n^\xbey\x8d|=\xebL\x1d=I\xe1\xf8\xbd\xd8e\xcf=\xdd\xe3\x16\xbf\x02\xe50\xbe\xc1\x99\xa9>k;\x00>zD\xc1>\xda\x9f\xda>V&\xaf\xbd\xa0\xc8\\\xbe\x87\x96\xc7=K\x15W>W\xfd\xd6\xbe\x99t\xab\xbe\xd7\xfdu\xbe\xe6\xc8\xfb>m\xef\xe9\xbd\x81\xac\xb7=C\xb6"?j\xc99>\xcb\xe2:?\x83g\xb0\xbe\x06t\x89>7\x9b\x8a\xbe\x0f,\xcf>\xc7\x1e\x0c>\xeb]\xc8\xbe\x12\xf5c\xbe\xf2\xd8+\xbf\xe1\x85\xb1>\xd6\x18\xea=\xbc\xc0\x8a\xbd5\xccg\xbe\x8dF\x81>B\x87}>w\x8d\xc3\xbe0\x925>\xf7H\x93\xbe\x85\x1fX\xbe\xe7q7\xbfY#\xae\xbe\x81u7=\xde9y\xbeg\x0f\xa2\xbe\x82\xe10>\xbe\xf5v>5Y\xcc<\xfb\x91x>\xf8@\xbc>\x9d\xd7W\xbe\xb7\x8aL>\x91\xb0\xbf>\xd8\x86\xc6\xbdbV\x88=\x9d\xfbx>H\xe9\xcc>\xff\x87\x1c\xbf\xab\x90H?\x0fT\xb3\xbdTG\x05\xbf\xb2t?>\xc5\x13\x00\xbfY\xb9\t<\xd0\xf6\xf2>\xfe\xe8\xa4>)\x0c5>\x1aT|>8o{>\xd8u\x1f\xbe\xab\xed\x8b=\x96O\xd4>!JM>\xdd \xcb>\x08\x90\xb1>\x9bu\xac\xbe\x9f3h==\x82\x87>-p\xa1=\x92\xdd*>\xeb\x98I\xbe\xae\xb0\x0e>v*\x96>w\xe3\xe3=\xf6\x98}\xbd\x07\xdd\xa4\xbd\xder\x14\xbf\xc0m\x08?7\x82R\xbd\xd7\xb35\xbd\x05S1?V\xf7\xd5=g\xa9\xb5\xbd\xfb\xe2%>\xee\x12i<\xcdp\xdb>\xb6\xf4\x84\xbe\x9b\xa9\x94\xbd\xe2V\xb0=\x1b\xec\x92=\xc3\xf9\xaa>B\xe7\x90>\xde\x83I>e?\x88=\xe2\x0c7>\xd6K\xe0>\x8aq\x0b\xbd\x16\x0e.=\r\x07\xae\xbc\x8a\xf0\x1f>\x0e-\xc7\xbe"\x97\x0c?+\xb2\xcf\xbd{\xa92\xbf9\xe9e>F\t\x99\xbe\t\x87\xa3>\xd1*\xec>F\x1d\xfd\xbdq\xee\x9c\xbc\xf2U>=;\x01t\xbd\x1e\x82\xb8>A%\x88>@*g>Q\xc1.?\x0f\xe5|\xbe\x8a\x8c)>\xf8\xe8<>U\x8b\x85\xbe\x95C\xb7=_\xa6\x9e\xbe\xf8{\x17\xbfX\xed\xb9\xbe\x08`\xeb= \xa7R\xbeq\na\xbf\xa7F\xb9>\x8f\xb9\xf3\xbc\xd5\xf2\x8a\xbc\x84\xd1\x8e>el\xa4\xbe\x83\xe4\xc0\xbdp\xd4.?\xc0\x1d\xd5=\x16\xfd\x17<\xc7h\x9d\xbeY\x11%\xbfi-e>\x92_<>iT\x0c?N`\x07\xbd\xebOk\xbe\xb2\x93\x1f\xbc\xe9(\x83>^n\xe4<\xff\x9e\x11?\x01\x037>\xab-\xae>\xcd\xe3\xa1\xbdC\xed\xdb>\x88l\x1d>\xb9\r\xd0>)9\xa7\xbcs22?\xabO\x9d>\xb2\x16Q<]\x90\xc9\xbc\xa2\xf5J\xbd0\xc5+>'
-p1891
-tp1892
-bsV503968963240656899
-p1893
-g2
-(g3
-(I0
-tp1894
-g5
-tp1895
-Rp1896
-(I1
-(I200
-tp1897
-g12
-I00
-S'z\xa1\x16?M?\x15>\x89\xf8\x14\xbf_u\xe0\xbd\xa0\xf8]>\xbb\x07\xa0\xbc\xcf7]\xbd s\x87\xbe;E\xd6\xbc\xb3"c>2 \x94\xbc(K\xc5\xbd\xa4\xc5}>\x02\x0e]\xbdX\xb2\x85<\xa9\xdf\xc0>8\xbd\x9b\xbd\x0b\xa4,\xbe\xa8\xccO\xbe\x1e\xc4d<\x90\xd7\x85\xbe\x84\xcd{=\xdd\xa5\x82>\x9cDH\xbdo\xd5d=O\xf4\x04\xbe\xa7\x1c\x1d>\x14\n\x0e\xbd\x18\xbf\x9e\xbe5\xa5U\xbd\x17\xa2\x92=\xdc\xebj\xbd\x15\xeb\xc9\xbb:U\xa2\xbe;)\x88=\xc8\xe9T>YZi>9\x02_>)_\xb7>\x1f\x8c\x00\xbd\xc2\x90\x10\xbe\x82\x98\xeb\xbb\x97\x08_=\xbcm\x83\xbe\xde\x18>\xbek}\xfa\xbd\xb8\x7f\x05?$\x8a\xa0\xbc\xf6\x07\x87=\xde\xed\x11?TY\x0c=\x00@\xef>>\x13\x89\xbe\x94\'\xb7=\xda\n\xc8\xbe\xef\xc9E>\x1a\x87\x19>8\x9c\x19=m\x1f\xff\xbe\xa5\xf9\xce\xbe@(\xa9>\xf6F\xea>\xc4\x1c\x0c>84K\xbe\x87>\xed\xbc\xef\xba\x01>\x0b\xe0x\xbed\xc9\xef>\xb0\xfa\xaa\xbd\xad6\xef\xbd\x8eY\x0f\xbfu\xb6\xdb\xbe\x15\xe1a\xbe\x8bN\x11\xbd\t\xc0r\xbe"\xe6\xb5<\x0c=,<zB\'>\xf3\xc97>n\x1a >^\xccW\xbcPT\xd6\xbc?f\xbc>f\xf7_\xbex|\t>x\xf1\x9c>\x93\xe2\x90>yDk\xbe\xa6\xb9\xe3>\x86\xfe\x06\xbe,\xc0\xb4\xbeH\xb8s>V\xcb\xd1\xbe@\xf6\xce\xbdh\x96,>\xeb\xa5\xf9=\xe8\x17N>\xa2\x1c\x84>\xc8\xfc\xb3<\xbe\x14\x03\xbe\xa9\xb7\xa9<sqt>{JN>\xa7q\\>\xee\xbc\xc0>Kwu\xbe\xfc\xb2\x85=U_\xca>C\x7f\xdf\xbc@\xd1\xed\xbc\x88`\xd2\xbe|\x0b\xeb=u\xdd\xc7>\xfd\xd6\x1e>D!\x10=%OO\xbe\xdd\x05\xbc\xbeI\xc1s>\xda\x82P\xbd\xf8\x88\x01>DV\n?1\x1c2>\x89\x18 \xbe\x1a;*>Z2\xe3<w\x16w>\xc0hT\xbef\x17d=\xefF\xf4\xba{`\x88</b[>($\x89>\x0f\xa9\xb7\xbb\xcb=\x81=7b\x7f\xbc\xcf_\xa4=\xee\xcb\x8e;\n\xf4\xdd\xbd\xb0\x1cn\xbei,\xc8<\xd7\xf7\x7f\xbe\xb1*\x1c>\x1e\x9a\x13>N\xf9\xe5\xbe\x9fr\xab>&\xd8y=\xae\t8>\xb79\xf9>\xf5+@\xbe\xd0\xf5\xb6\xbd\xb8\xaf\xf5=^Y\xc9\xbd\x84.\xb8>\xa8_^>:aW\xbd\x9al\xbf>2d\xc3\xbd\x82\x9d\x9f=\x8b\xd0\xcc=go\xb6\xbe~\xfe\xc6\xbd~\xbdt\xbe|`\xaa\xbe\x80\xefa\xbe\x1f\x12 >a4$\xbe\x07\xdf\xee\xbe3`\x96>C\x07\'>\xdcZ\x1d\xbc\x18\x16\x14=\xab\xdd7\xbet~;\xbe\xa6\xf7\x05?\xc0\xf3\x08=\xc7A\xc5=\t\xea\xa8\xbe\xc8\x92!\xbf\x14!\xaa=\xf1*[>\x11\x08\x9f>\xf3\xed\xfa\xbd\xcbzv\xbeh\xe1\x97\xbe\xf5v\x95>Hq\xb1\xbd\xbf\xdb\x92>\xbc\xa8\x92<\x7fa\xa9>=\xc9,\xbd\\_W>\x98\xd9\xb8\xbb\x08\x04\x8a>w\x109>w\xed\x10?\x18\xa1\xb6>+\x11o\xbd\xe8n\xbd=H\xea\xa9=\xc3\x8a\xc7='
-p1898
-tp1899
-bsV503956231107538944
-p1900
-g2
-(g3
-(I0
-tp1901
-g5
-tp1902
-Rp1903
-(I1
-(I200
-tp1904
-g12
-I00
-S'\x14\xa4\x81>\x10\x83/\xbd\xc0\xd0\x87\xbe\xe1\xbc\xe8\xbc\xda#M>\\\x06"\xbd\xba\xb6\x9c<\x88$)\xbe\x1a\x1fH\xbd\xa8\xf2\xf6=\xdd\xd6\x1c=\x8c\xa3\x05:8I,>\x12\xe6\x1b=\xc4\xf0\x10\xbe\xb4|o>\xde\xee7\xbd,\xfcK\xbc\xdeW\x10\xbe\xf2^\xe2\xbb\xe2\xd6\x10\xbe\x06\x95A=5\x8e\x88=\xe2@\x14\xbe!&<<<\xa7\xea\xbd\x1e\x91\x0b>Is\x07\xbe\x92\xc0D\xbe\xb6\x18><\x98\xf2\xa1\xbd\xafY\xd3\xbc\xf0\x0e\x9c={<\x82\xbe%&\x02\xbd\xc0o#>E\x9c\xdf=\xc2\x1d\xf1=\x00WW>L0O<\xcf\xe2w\xbd\x0f\x9b\xa3\xb8\xfa\x08\x12>\x8d\x0el\xbe\x08\xe9\xeb\xbd\xab\x94R\xbda#\x80>\x04\xe1\xa5\xbbX8K=\xb2{\x99>\xe8\x84Z=\x8f&\xb5>+\xfc!\xbe\xe2:\xab==G\x87\xbe\x89\x94\x1d>\xd4;\xb0<"H\x03\xbe\x19\x9e\x82\xbe<\xb8\x9e\xbe\x8a\xf2:>\xaeM\xc9=k\x89\xfe<9\x14\xa9\xbd\x80\xbe\x8c<&<\x11>f\x7f*\xbe\t\xb4\x05>\xd4\xe3\n\xbe\xad\xb3\x17\xbe}\xb0\xa2\xbe~\xf3\x1b\xbe\x05u)=\xb1f\xd8\xbd\x1eO\xc5\xbdE\x81\x00>)\x9b >\x04\x08\x91=\x08\x04\x9c=\x1b74>\xbeN\xa1\xbd\xabW\xd3\xbb\x87M\x80>\x00[\x00\xbe\xe4zW=\xcf\x1di=k\xd07>f\x0c\x8a\xbe\x1ep\xbc>\xf7\xd8|<\t\x90+\xbe\xef\xd4P=\xbf*H\xbe\xe2\x17D\xbcT\x9b\x85>or\xa8=\xc5\x14\xde=\xfa\xcc/>\xbe~\xeb=q\xdf\xb2\xbc\x8b?`=\xcb\xaa[>\xba\xcd\xf8=ha\x08>h"d>i\xf4\x12\xbe\xe2\x11j=0\xdd\xb0=\x08\xea{=\xc8\xe2^=k\xd1\xcc\xbdOv\xfd=\x0b\xf5\xaa=\xcbJ9=QD\x17\xbdu"\x03=)\x1d\x87\xbeb\xac\x80>oF\x9a<\x90\x8cN=Tt\xaa>8\x9e\x88=\xa8\x8b\xe2\xbc\xb5\xf8\xed;\xa1Y\xcb\xbc\x8c1V>AD\xdf\xbd,\xe0\x12\xbd\x1au\x0f=K\x9c\xf4<\xadn\x1e=8\x95\x97=\x90\xef\xdf=\xa7\xa4\x10<\xc6\xe7\xce=x\'\xf9=""(\xbdo\x8d\x85\xbb\xc4~\xc9<Lh\x86=\xc1\xd8\x0f\xbeWLo>\x15W\xd0\xbb\x13ct\xbe\xbe=6>X\x1bL;\xb1\xaf\x1c>\x01yg>"q\xc1\xbd\'l\xda<\xb6\x84j\xbd\xd3\x99\xcc\xbd\xfa\xfbL>\xa9\x86%>\xe5\xf8\x8a=A\x17\x8b>\x0b\xdd\xb7\xbdQ\xee\xf8=\x87k\xa9= 0*\xbe\x85OJ=\xeb\xcb\x04\xbe\x8a\x8e\x8d\xbe\xb2\xa1-\xbe\x02s}<\t\xd0\xa9\xbdO\xc5\xbc\xbe\x89\xb1$>\xafS\xa7\xbd\x04F-\xbd\xf6p`=+f\x05\xbe\x86a\xa1<\xa8<\xb8>x\x84\x98=U\xbe\xd0<tYO\xbe\xd1C\x8c\xbe1\x97\x99<\x134\xb5=}I\x80>\x99\xc8\x1a=\xe2I\xfe\xbd\x85\x0b\xe6\xbb{\x97Z>\xb3\x92\x1d\xbc~r%>\xf6\x92\xac=\xfb\xf0\x0c>h\xc5-\xbd}L;>^\x9b:=\xc8\xd4\xdc=\xe9\xb8h=\x16\x81\xb1>C\xee)>b\xbb\xa5=\xc0/.=\xd3\x96\x8c=hV\xe3='
-p1905
-tp1906
-bsV503964539034292224
-p1907
-g2
-(g3
-(I0
-tp1908
-g5
-tp1909
-Rp1910
-(I1
-(I200
-tp1911
-g12
-I00
-S'\xfa\xc0\x08?\xb7J\x11=\xea\xf8\xf5\xbeF\x16\xa0\xbd2@\x8a>\xf0{\xb9<.\xd5C\xbd \xc4\x91\xbev\xd4\xba="s\xaf>\xd5\xb8\x01\xbd\xde\xa7+\xbdY\xd5\x00>b\xa5&\xbd\xca\x90C\xbd\x1d_\xf4>\xac`\x06\xbe\xb5\t\xd6\xbd8\x90\xa1\xbe*\xb8\x18\xbe\xf6,/\xbe\x96\x8e\xe5<\xdb\xe3q>\xfd]i=\x9a\xf6^=.\x92.\xbe\xb8^a>\xc2`4\xbe\xdf\xd4\xad\xbe\x8c\xf6F\xbe\x12$\x9c\xbd\xde\xa4J\xbco99\xbd\xf9\x82\x04\xbfZ\xdb\x1d=r\xc6\x95>G|\xaa>\x1dQe>V\xf1\x9f>\xb8\xe7\x85\xbd]\x14~\xbe\xe0\xd4\xdb\xbd\xfb\x0f]=\xd4\xd7<\xbe\xe8\xc9\x80\xbeb\xf1\xc2\xbd\x10{\x00?a\xe0\xc4<\x96[\xfa=;\n\x1e?.S\x0b=\x03\xce\n?F\xd6\xa9\xbe\xd5K\x18>\xcd\xaa\xea\xbe\xce\xdb]>V\xcf\xaa=\x00\xa4\xfb\xbdp\xfd\xf0\xbe\xba\xf4\x18\xbfq\xcb\x9d>\x8d:\x04?h\x7fp>_\x8d)\xbe*\xe2\xa7=%\x82\xe2=\x0c?\xb0\xbe}\xbb\xf6>\x89A\x1e=s\xc6\x95\xbe\xc2q\xd9\xbe\xcd\xd8\xcf\xbe\xfeN(\xbe\x95d#\xben\x1a)\xbe\xd8E\x8a=\xea0\xf2=-Z\xc3=/\xb0H>\x05\xb5\x8e>fb/\xbc\xe3V\xe1<V>\xe5>\xf6T\x84\xbe\x8b\x87\xdf=\xd6\xd3\x96=f>\x98>&v\xc3\xbe8\xd3\x1b?>\x96h\xbd\xb2\x12\xda\xbe}\xfe2>0\xf1\x8f\xbeV\xa8\xcb\xbdc\xa9\xe1>\x9d\xe2}\xbc\x89H\x90>E\xce}>\xf5Xj>\xaff\n\xbex\xd2\xc5\xbd"\x0c_>}-C>\xaeo\x8a>x\xdd\xcf>\xd6b\x8d\xbe\xfa\xe5\xec=2w\xb6>+|P=\xba\x14\x0f\xbd`!\xeb\xbe\xa2\x86)\xbdD,\x8f>\x82\x8dn=\xae\xdak=\xc0\x16F<\x8b0\xeb\xbe \xf7k>\x9a\xc4\x869\xe8\xa3T\xbd/\x03\x11?E\x1fW>\rk\xf9\xbc{\x16+=u\xe5P=Q"\xc1>\xa7\xb8\x00\xbe8\xbb\x80=\xa3\xcb\x92=\xf4\x81\x05<4C\x14>\xd7\x94\x0b>\x03\x17\xa2=\xd0v\'\xbc\xe9\\\x12=\xd8\xebb>Vs\x04=\xee\xc6\xb8=AR\xa6\xbe\xfc\xe8\x17\xbd(x\x85\xbe6\xa8\x9c>i\xb4\x15>\xfe\x11\xe0\xbe\xd2\x9c\xc8>\x05\xff\xb6=;R\x1e>\xc8\x16\x1b?\x8b\r.\xbej.\x81=2\xe5\\\xbd\x8au\x16\xbe\x98\xd6t>\x18\x85\x1e>\x18F\xe5<Zl\xe3>H\x86\x8c\xbe\x05\x84\xa5=\xd2\xe4#>G\x07\xc9\xbe\xc5`\x10\xbe+\x82J\xbe\xe9\xb1\x01\xbf\x86;\x96\xbe\x08\xde\xc1=r\xd9\xc2\xbc\xeb|\x1d\xbf\xf6\xce\xc1>q#\x04\xbdv\x08\xf6\xbd0\xd5\xd2=\x83\x03U\xbe\x85\x02M\xbe\x8e;\x1a?\x12\xf8\x14>\xac\xd4:>\x96\x16q\xbe\xd2\xfa\x08\xbf\xa3\xb9X>\xeb\xa8;>\xc6I\xd1>\x8aF@=\xda1\xa3\xbe\xf5N\x0e\xbe`i\xde>u@W\xbdl\xf4\xb1>\xf0U0>\x04\xe7C>\x10sc<\x8eB|>\x88Ez=\xf6\xe5f>\x83\xc1\xba<4\x05\x1c?u@\xb5>\xb2\x87\xd4\xbc\x00\x92\xb8\xb8\x9a4\xf1=\x80\xd6L='
-p1912
-tp1913
-bsV503967224731017216
-p1914
-g2
-(g3
-(I0
-tp1915
-g5
-tp1916
-Rp1917
-(I1
-(I200
-tp1918
-g12
-I00
-S'}g\xe0>\x8f\xa2\xb1\xbd\xc9\xde\x19\xbfP\\\xb7\xbc\xc4\x8d\x8e>\xefKL\xbdL\x01\x98\xbc\x89]F\xbeI\xfdB=c\xb1\xa5>\x8f\x8ce\xbd\xaaR\x83< \x10\x11>A\xa7\x0e\xbe\x94\x97\xea\xbd\x93\x1e\x94>\x1ea\x0b\xbd\xc1\x9f0\xbd\xa9\x0c\x80\xbe\xac\xe2\x07=\x1a\xf0\xbc\xbe\xad\xbc\xe9<\x7f\xb7\x06>\x949Y\xbe\x11\x12\x8a\xbd\x91\xeeW\xbe\x84\x03\xb7>\x0e(\x05\xbe\xfd\x07\xd5\xbeO\'\x83\xbcVe\x9d=#\xb9\xc7\xbbz\xb7\x9c;\xd7\xf1\xf3\xbeLS\xcb\xbd\xd7}\xc0>!\x9d=>\x907o>d1\xfd>\x07\xd0\xc7\xbdd4\x8d\xbe\xd3k\xe7=o\x18z>!!\x85\xbe\xb32\x81\xbe\n\xf7=\xbeH\x8a\x12?J6I=*G\xf9=\x9a7\x15?\xbf\xfa\xda=\xe76!?\xd6?\xb7\xbe\xc3\x1d\xac=p\x11\xfc\xbe\x9a\x18\xc6>\xf3\xf5\xdb=\x80j^\xbe\xd4\x91\xed\xbe\xbf\xef\x05\xbf\x91\\\xa6>\xd3\xc5\x95>\t]g=\xea:S\xbe\x9c\x19 >W\xb6z>\xa4I\xb4\xbe\xcf\xc5\xaf>\x80\xd9\xa1\xbey\x1d\x0c\xbe\x1a\xf8\x0b\xbf\xc48\xde\xbe\x94\x8f+=\xb7b\xe1\xbdgB\x85\xbe,\xde&>\x19\x0b\xaf>$\x0f\xeb=\xc1\xcdu>ddt>\x89#\xc1\xbdc\x91\xa7=\x01W\xd9>\xf3\xfc\x9f\xbe\xdd1e=\x03w\xb5=\x83\x04i>\x99]\xfe\xbe\x12/\x1b?\xb6\xd3D=\x93\x06\xb5\xbe$$\x89>\x94\xdf\xa0\xbe\xe9\x82\xc7\xb8\x83\xdd\xdf>\xe3\xe8\xe0<zEQ>\x80\xf3s>\x83\x03\x9d>\xa0\xee\xa7\xbdz\xe6i=\x18\xc6\x9e> \x1e@>\x8d?}>).\x94>\xecw\xd8\xbeZ\x81\xe8<\x97\\y>\x9dsI=\xe6M\x86<H\x96\x9f\xbe\xf7\xe0\x83<<\xfav>\x89vC>\xfd\x8b\xf4=\x14jW<d\xa1\x0c\xbf\xf4\x7f\xbe>\xaa\x0c0\xbd\xea\x89\xea<=\x1a\x19?\xe0\xef\x17>\xdc\xed)\xbe\xe6\xc9\x08=2\x94"=\x93]\xec>\x1dq\x80\xbeQ\xce\xe3\xbd\xb7\x8a\xcc;\xe6a\x10\xbd\x84SG>\xd1TH>\xa0\xf6\xec=f\x1cS=\x8c\xdbP=&\x16\x91>\rG\x91\xbcf\xfb\x9d=Wy\xfa\xbd\xcc]!>\xceV\x90\xbe$y\xc1>\xa7\x01\xa4\xbd\xffN\x0f\xbf\xa7\xb5\x81>=\xeb\xfe\xbc\x18\x88\xa0>\xe7\x12\x08?#Ta\xbei\xe7\xac\xbc\x0c\xf7\xd0\xbdo\xe89\xbe\x9e$\x8f>l\xc6\x9a>fA8=\xcc\xed\x18?#\x9aK\xbe\xb7\x85\x03>\xac\xf1\x05>\x89\x82\xbe\xbe@4\xba;\x98\xc8\x8a\xbe\xc6\x9f\x0e\xbf\xab9\xb9\xbe\x14\xacV=\x8c\xd84\xbe\xcc1?\xbf+S\xb9>\xe4\xa6\x8d\xbd\xad\xd4T<\xcf\xd6\xfc=\x8937\xbe\x07U!\xbdI\x965?:\x19\xe8=\x0c~\xbe=\xca\x02\xa3\xbe2\xed\x0f\xbf\x8b\x84\x01=E\xf7\x1d>\xf9\xfe\xd2>\x10\x18\xc3=V\x1e\x9f\xbe\xca\xd9[\xbe\xb4?\xba>g\xa9\xad\xbdY\x15\xcb>Yz\x1f>\xbd\x89\xa3>\xcf\x00a\xbc\x04\xdfV>\xacI\xe5=\xfc\xff\x98>-t\xca<\r\xce\x15?\xbf\xd3\xcf>4\xa7\xec=w\xbe\x84;\x8e~\x91=\xb4\x115='
-p1919
-tp1920
-bsV503966939681525760
-p1921
-g2
-(g3
-(I0
-tp1922
-g5
-tp1923
-Rp1924
-(I1
-(I200
-tp1925
-g12
-I00
-S"\x8b\xfca?\xff\x81\x81>\xbe|8\xbf>\xbc\xac\xbd\xdc\xae\x81><'@<7\xd7\x1b\xbd~\x82\xa6\xbe\x14a\xd7=\xd3\xb7\x00?\xd4\x134\xbe6QC\xbeg\xb7\xce=%\xb0=\xbe\xff\x8b5>\x84\r/?\x1b\x91\x15\xbe\xc0\xc0i\xbe\xb2\xc5\xdb\xbe\xfb\x90\x82\xbe!r\x7f\xbe0\x9c\\=\xd1\xcc\x00?\x86+\xaa>\xa5\xa2c>\x1b\xec\x81\xbe?\xf4y>\xe8\x1a\t\xbd\x92\xd8\xc5\xbeK1\xf8\xbe\xae\x95\x92\xbd\xecC\x1c=\xf6#-\xbd\x8b\xf7E\xbf\xa9\x81W>G\xa6\x8b>1\x9d\xf4>\x0e\xbf\xcc>P\xda\xd8>\x063\x8c\xbe<\xc7\xe2\xbe\x07\xf94\xbe\xb9f}\xbdp\xe4(\xbe\xaa\x02\xb7\xbe`y[\xbe\x034\x15?\x95;\xcc=\x8f\xaaC>y\xf6]?\xa1\x028\xbe[\xd9D?4\xa2\xd3\xbe#\xd0\x83>*i\x0e\xbf\x84i\xb9=\xfeIS>l^\x99\xbd^\xd7X\xbf.\x19?\xbf\xe0r\xa1>\xd59t?Sk\x0b?\xd5GR\xbeJnz=\xe5wj\xbb@0\xed\xbeIYT?\xf4\x8f\xc9>\x11\xfc\xd4\xbe\xf5Q2\xbf\xcf\x16.\xbf\x97\xfb\x0c\xbf\xe7\xf6\x10\xbe\xaa\xd0c\xbe\xb6\t\x9e\xbd|\xf2\x11\xbe\x8c2\x18>\x96N\x03?5\x8e\xb2>?\xf9\xe1<R\xec\\<\x9d\xc9\x1a?N\xa2\xec\xbe\x04c\x12>e=\xc7=2*\x01?\xc7.\xc0\xbe\xa5LL?\xd4\xef\xb0\xbe\x96B\x16\xbf.\xd6a>\xab\xa2\xd5\xbeD\xe2\xcb\xbe\xbf\xaa\xe4>\xac\xb3\xde=8\xbb\x11?\x8a\x9b\xad>L\xe4\x0f>Q\x93\xef\xbeA-\xeb\xbd\x9f\x85\x91>\xff\xd1\xbd>\xf6y\xaa>\xfbV1?\\g\x9f\xbez\x8a\xe5;LC:?\x16/\x0c\xbd\xfcz/\xbd\x05\x14o\xbfpq\x19\xbe\x07\xfd\x10?\xa3`\x17>\xb5\x06\xd7=\xbc\x1c\x01\xbe\x99\xb4\x1a\xbf\xbc\xcc\xf5=o\x96{\xbc\xda\x9a\xe7\xbd\xda\xf2??\xfe\xb7\xd9>\xa9\x94\x91\xbd\xd5%\x91>.K\x07>w\xf6\xec>r-7\xbe\x0b\xc4\x9d>\xfe\xc3\xe5=\xfe\xa5n>\x0f\x06\x8c>\xb7\x9b\xd0=\xac\x02&\xbc\x14\xc9\x86=\xc9\xeaS\xbdw\x81\x05>z\xc9\x94=\x9bv\t>>\xa27\xbf\xeb\xfc%\xbe\x14\xf2\xf5\xbea~\xab>jF\xcc>\x1fA1\xbf\xa0\x12,?\x84\x14n>\xc6\x01\xb7<\xadl\x89?\xc0\xe8\xc3\xbd\xcf\x06b\xbd\xaa\n\x15=\x8cM-\xbeZ\xe6\x96>kV\xb9=\xd6*\x15\xbd\xa4Y(?\x9ao\xfc\xbe|\xb5\n\xbb\x91\xf6C>\x15F1\xbf\xf0b\xc6\xbe\x96B\xc9\xbeE\xdfL\xbf >\xdd\xbe\x9e\xc0\x86>\x9fo\xb4;$\xa9-\xbf\xd65\x15?h\x9e\x95>t\xebn\xbe\xa9\xe8\xf7\xbb\x0b\xef\xc3\xbe{\\\x1a\xbf\xa1EA?UX\xdc=*\xb0\xae>\x9aR\xc2\xbe1\xa4\x82\xbf\x0f\x92\xbe>\xfc\xe8\x98>\xf6\x03\xf8>B\xf7B\xbdw\n\xe9\xbe\x1e\x1d7\xbe7\xe01?\xd1[\x14<O`\xf4>\xd0\xb1\xfb=\x05y\xc1>\xbf\x0fF<O\x03\xaf>t\x1b\x82\xbcd\xd6\x8d>\xf6\xcb!>j\xf3x?\xf8\xf3\x07?\x19\xa3\x88\xbe\xba\xd1\xe4\xbd\xea\xbd)>g\xa1\xd2\xbd"
-p1926
-tp1927
-bsV503976479429238784
-p1928
-g2
-(g3
-(I0
-tp1929
-g5
-tp1930
-Rp1931
-(I1
-(I200
-tp1932
-g12
-I00
-S'\xa4}&?$\xe4\x1a>B84\xbf\xdf<\x12\xbe\x9aY\x83>d:\xc8\xbc>\xc5\'\xbd\xb8\xab\x97\xbe?\xac\r=\x04\xf0\x99>t\x0e\xb5\xbdl\xde\xab\xbc\xcc\xca`>\x0c\xc00\xbe%\xf43<v\x8d\xce>\xdd\x85\xaf\xbd\x97\x1b\x1b\xbeA\x9d\x91\xbe\xaa5"<\xbc\x81\xae\xbe\x8f\xf0\x8f=4\x85\x9a>\x8b\xd6\x97\xbd-%,=\xf8\xe3>\xbe\xc6i\x80>p\x11v\xbd\x1eo\xb9\xbe\x8e\xb5\x9f\xbdQqQ>\xe4\x026\xb9u\x10\xab\xbdF\xf7\xd5\xbe]W\t=\xd2T|>\xcb\x87\x8e><\t\x9b>I\xaf\xe5>\x97+\xfd\xbd7qf\xbe\xef/\x15<\xe4\x96\x00>\xa3\xf1\x85\xbeK;q\xbe\x9f\xa1\x16\xbe\xc9$\x1b?\x84\xd75\xbd\x87*\x99=\xb3--?\xa0\xc7y=\xd3\x82\x18?F\xc3\xbf\xbe\x9e\x1e\x05>\xa7\xc2\xee\xbe\xaeK\x8f>+\xbb\\>\x9f8\xac\xbcCk\x11\xbf\xb8\xc4\x07\xbf\xdct\xd9>\x01\xa1\x0f?\xf0l\x1d>\x14\xeee\xbe4\x07\xe6<G\xdd\x17>i;\xaa\xbec\x13\x16?cu\xe3\xbd\xb4\xf8\xf6\xbd\xf2^\x1d\xbfS\x9c\x0b\xbfw\xffd\xbe\xec\x07W\xbd0$\x87\xbe\xecz\x16=\xb3a\x9e=\xdc?\r>\xf5\x94u>X\xec?>\x89\x94z\xbc\xd5\x94\x83\xb9{\x16\xcd>Z\x04\x82\xbeP"\xfa=\xb6\x8e\x8f>\xc7\x92\xa3>\xfa(\xa7\xbe\xbf\xb5\x07?<w\xbf\xbd\x10&\xed\xbe\xd2K\x8d>&S\xd9\xber\xdb\xfc\xbd\xd3_\x8b>\x14\xe3\x8e=r\xa8x>\x87\xf1\x99>\xac\x80\x0e>\x9c$6\xbe\x1d\xa8\x8e<\xab~j>\xb8\x9dW>\xcd\x9d\x8b>g\xb3\xb7>\x1e\x15\xa6\xbe\x0c\x05\x97=\'D\xe6>\xc0aE\xbdra.\xbd\xa5\xf1\xff\xbe4\xdc^=\xcc6\xd7>\x16\x1bP>-\x1b\x89=x\xad]\xbew+\xf1\xbe/s\x91>-\xba\x8d\xbd\xb2%\xe0=\x9aL\'?\x1c\xdbG>y\x7f=\xbe\xeaVS>c\xd5\xe1=\xd8\xd4\xa9>j\xbcE\xbeW\x90\x8d=\xfa_\x07\xbc\xf1\x94T\xbd\xd2\xcd\x8a>tk\x82>zk\x8d\xbc\xd8s\x96=c^6<\xb5\xdb,>\x1cf\xcf<\xbe\xdb\x83\xbb\xee\xaa\xa2\xbe-\x84\x17=\x8ea\x90\xbe\xc3v\x86>\x8d\xb7\x1d>\x1bV\x0f\xbf\xab\x10\xc8>\\S\xab=\x94\xbav>\x15\xd5\x1b?p\x81]\xbe\x18X\xb8\xbd5\x95w=\xe1\xca\x03\xbe\xea\x86\xb2>@\x18\x83>\x86S5\xbdEY\xf0>\xe0\xb7.\xbe%F\x12=^\x9d\xf7=D\xae\xe6\xbe\xd4\xd9\xf3\xbd\xb8\xa8\x81\xbe\xfdJ\xd4\xbe\xd5\x0b\x9d\xbeD\x9c,>K\x02Q\xbe*U\x18\xbfI~\xbc>\xeaP+>_\xc2\x88\xbb/\r\x00>\x80\x80(\xbe\x1e\xb9x\xbe\x9a\xab)?\x93\xc58=\xb0\xf9\xf3=\xb52\xb7\xbe\xdd\x977\xbf\x8c\x0f\xe5=\x1d\xd8T>\x8fn\xb5><C\xa5\xbd\x00\xf8\xa7\xbe\xce\xd0\xac\xbeD[\xb1>\xfcV\xe2\xbd\xc7\x08\xc9>\xd1\x98\x94=\xfcL\xc7>M\xd9\xb9\xbcQt?>$z\xd1<$\x97\xae>\x19\xf6\x1a>PD%?\x90\x9e\xf1>\xa1\x12\x94\xbd\x97*\xe3<\xcc\x91V=\xbc\x01\xbe='
-p1933
-tp1934
-bsV503960256356315137
-p1935
-g2
-(g3
-(I0
-tp1936
-g5
-tp1937
-Rp1938
-(I1
-(I200
-tp1939
-g12
-I00
-S'\x85\x82\xbe>\x82\xc4\xfd=n0\xdd\xbe\xe5\xa2\xbb=\xcb\x1d\xf5=\nZ\xc8\xbcV\xd1\x85\xbd|/w\xbe\xa2\xc8\x15=K\x1cf>\xbf%\xe8\xbdL\xcd\xf5\xbd\xac\x96\x0c=\xd4\x0cY\xbd.\xe0\x1c>Q~\xc4>\x8f\xdf\xcb\xbd\xdaP$\xbe\xe0\x12V\xbe\xe2\xc5\x12\xbe\xcb\xbc\xaa\xbd?\xde\xb6\xbd=k\x84>\x9b\x81\x02>\xbe\x8e\xa8=D"\xa4\xbdb$/>\xbb\x05\xf59{\xb1S\xbe\xeaUW\xber\xfbg\xbe\x97\xb5\x9b\xbc\x01\x0f\x9f<P \xfa\xbe+\x81o=\xea\xab\x89>\xa6\xdd{>\xf5\xdcd>\x19J\x89>q\xd4\xda\xbd6\x0e\x91\xbe\xbc\xd0\xec\xbd\x02\xd4\x96\xbd\xebp+\xbd\x06W\xb0\xbe\xbb\xef\xf9\xbd\x1e\xc4\xaf>\xe41\x16>T?#>\xd0<\xec>\xcc\xd3\x89\xbd\xd9\t\xc4>\xdcv\x11\xbe\xdaJ\xa8=\xfb\x8f\xae\xbe\xcc\xe2\xa3=\x8a\x97x<`\x82\xdf\xbd\x00\x04\xe8\xbew\xec\xf5\xbe\x01z\xe4=\xbe\xdf\xe7>9\x1d\xb3>OnN\xbeV\x18\xe0=RP\x8e=3_\x99\xbej\xc4\xb7>w~g>|3\x83\xbe@O\xfd\xbe"\xc6\xfd\xbe\x11e\xb1\xbe%-\x9e\xbd\xa1\x18\xd4\xbd?\xe7\xcc<AM:=\xc9\\\xce=\xceF\xca>"\x8e\x82>\x17\xc6E=\x8b4\xec=%0\xc6>\t\x1a\x9f\xbe\xc5\xb8\x9f=\xc9:\xba;\xaat\x86>E\xd2\xa7\xbe\xae\xfd\xfc>\xc9\x91M\xbe\xa5\xdf\xb0\xbe\xb9\xba:>\xa4\xa2O\xbe\x94\xbeW\xbe&wt>\xda\xb2\xa5\xbc~t\xb7>eR)>\x08A\x1d>\x07\x9e\\\xbe\xb3\xe3\x03\xbd\x1f\x1eb>\xa1M3>W\x88\x94>\x12\x05\x00?I\xdcz\xbe\xa9yD\xbdL\x10\xb9>>\xf1#=\x9a\xfel\xbd\x04\xf5\xda\xbe\xd4\xdf\xac\xbd\x04\x9f\xa7>\x10\xf9@>\xba]\xfb=\xe78:\xbd0-\xc6\xbe\xfc]\xc7=\xf5\x05\xa7\xbdQ\xa7\xee\xbdr\xb1\xfd>.\x1a\x8a>\xb1\xa0A\xbc\xe9\xe5\x80<\xda=\n\xbc\x04\xf7r>\x01&\xc1\xbd\x97\xec\x00>l*\xe0=y\xb7}>\xf6]\xec=\x97\x84\r>_\xa9\x12=\x11\x86\xb1=\xc0\x1e\x02\xbe9\x7f\xe6=\xaa{\xb3\xbc\xa1\xfd\xc0=\xeb\x82\xe1\xbeVp\xbe\xbd\xa7\x07\x9d\xbeZ\\\xab>\xbc\xb8V>\xa0%\xda\xbe[o\x99>7/E=\xe4\xc2\xec\xbb\x14\xa2(?q\xe9\x9d\xbd\xdbT\xe1\xbb\xe6\x99\x11=_!\xac\xbd\x82\x0b\\>\x91\xba!>~\x1b\x85\xbd\x9bK\xf6>\xdb\xa6\x9a\xbe\xf7\xa0\x01\xbc\xb2>.>\x19V\xd0\xbe\xb9[8\xbeIj\xa6\xbe7\x1c\x12\xbf{^}\xbeK-o=\xa5\x8f\xc6<\x19\xb8\xd4\xbe\xf2\xb2\xc5>\xee\x02\xd8=\x9b\xd9\xf1\xbd\xbe\x915\xbdpL\xaa\xbe\xdb5\xa8\xbe\x8b\xfd\xb5>\x81\x89\xc9<z\xf1I>\xd1\x9an\xbeW\x01\x04\xbf\xd4\xe7\x94>\xeeR\x16>\xcf\xb5\xae>\x0bG\xa1<Dkl\xbe6\x8c`\xbd/\x95\xe0>Z\xcc7=\xfae\x95>\xe24\xef=\xf9O\x98>\xdcX\xb4\xbd\xbf\x7f~>\x11\xa4\x02=\x04\xbaD>gf\t>G?\n?\xfb\xe2\xa7>\xd7\xebO\xbd\xc4\xa2\x83<e\x1a\x13>\xac\xa3P\xbe'
-p1940
-tp1941
-bsV503965700419907585
-p1942
-g2
-(g3
-(I0
-tp1943
-g5
-tp1944
-Rp1945
-(I1
-(I200
-tp1946
-g12
-I00
-S'\x14\xe7\xb7>\x0c\x97\x0f>#R|\xbe\x17\xbc\x18\xbd\r\xc9\n>\xc9\x97&=Q\xfeW\xbd\xa5Lv\xbe\xcb?\xcd\xbd\x91\xe6\x93>\xcb\xd3\x8f\xbc\xb8\x1c2\xbe\x13\xd0\xeb=\xf5\x04\xd7<\x02:\x90\xbd\x90\x9a\x80>\xb3`\xd4\xbd\xa9\xc1\x0f\xbei\xc8\x16\xbe\xf5m\xae\xbd\x05n\xfa\xbd%\xce\xc2\xbb\x8e\xcb\x1a>\xe3\xac4=\x81\x86\xc1=&\x93*\xbd\xb4\xed\xc3=\x8d\x15\xe4\xbc\x93\xf7w\xbel\xd1\xa9\xbd\xbf\x03\x00\xbe\xc0\xa4\xbd\xbd\x8c\xae\xb9=\xaa!\x91\xbe\x84L\x87=\xb0\xf7N>\xdb(E>\x98\xb6\xdc=\x0fIA>\xad\xd6\x87=w\xf6R\xbd\t|\xa2\xbd>\x84\t>/\x91=\xbe\xaf\x99\xc7\xbd8\x16\x97\xbc\xa9q\x8e>Y.\xb2=d\x85c=\x7f,\xcd>0\x19\xcd\xbdt[\x9a>\x93*\xf1\xbd\x03J9=\xab/\xce\xbe\xb5Mp<\xdf\xb7=<q\x18\xbc<\xf3f\x00\xbf\xe8\x0f\xa0\xbe\xc3\xbe9>\x0bk\x87>\xdd\x10\x1b>\x03\xa1"\xbe\xcf\x86\xc5\xbd\xc3\xfb\xcb=,\xdaH\xbe7\n\x90>DYX=\xa3qK\xbeG\x7f\xbe\xbe\xf98\x8e\xbe\xb8K\xd7\xbd,\xd2\x9d\xbd\x14\xe9\xaf\xbd+\xdb\xa0<\x87;\xc7<\xfe\xac\x0c>\x87\x8a3>\xc8A\xde=\x15m\xcb;\x9d\x92\x92\xbd\xd9\xff\xb6>P+Y\xbe\xd9\xdc\x07>\x1c\xe0w=\xb1\\E>\xab\xce_\xbe#\x87\xa8>\x99|\xa4\xbd\xe6\x83\x17\xbe\xeb\xef\x19=H\xf5@\xbeS\xb2\xf4\xbd\x9c\xaf7>G\xad(=\x1f&2>\xfb\xfbM>\x9f\x9a\xbc<\xc8\xa5\xe3\xbd\x15ie<\xd8\xb0L><\x95\xe9=\x17X\x9c=;\xf7\xa4>/\xae\x1b\xbeMS\xb5<)UF>\xd0>\xb4<sE\xee<\x1e\xe3\x89\xbe@2\x13>\xc8\xe8c>|;\xdf=\xfe\xd7\x1a=\x89W\xea\xbc\xb8\x0bl\xbeO\x01Q>\xaf\xbf\xf4<4\xe8J=|\xdb\xbf>4\xef\xb7=\xab\xfe \xbd\xed+z<\xf4L\xc0\xbd\'\x10\x10>\xbb\xaa\xbc\xbd\x86@\xa0=be\x8b=\xb0\xf6\xb4=\x10\x14c;\x0b\x14-=(ii<\xec\x8fB=y\x99\xb3\xbbd\x8aH\xbd4\xc9\x88\xbd\xae`\x1a\xbd5\x88\x0b\xbeX\x8d\xfb<\xc3;\x05\xbe\xc8\xf9\n>\x14\x8b\x06>M\xc8e\xbei\xab\xa8>&\xfa\x05>\xeeO\x88=}\x9f\xbd>\x90\xc7\x9c\xbdA\xb8\xa1\xbc\r-2\xbb+\x89-\xbe\xd6\x88\x82>\xffq+>\x88\x99\x80\xbd\x04\x96Q>\xabf\xc6\xbd\x1bq\x89=n\xd0\x1c=\x95<\x94\xbe\xd4\x80\xb2\xbdG\xcfc\xbe\x88n\xa9\xbe\xc8\xae/\xbew\x86\xd0=D\xb9E\xbd\xd3\xb0\x87\xbe`\xfbW>\xe7\xec\x93=\x0f\xb6\x9d\xbd{\x04S\xbd\xcb\xca9\xbe\x88\x92\xd8\xbd\xce/\xa8>;\r\x95;\xa0M\xb6=\xe3c\x95\xbe?\x83\xbf\xbe\x05\x8d\x16;|I\xf4=\x843c>\x15\xfe\x12\xbc\xb0+.\xbe\xdf\x0b\xe3\xbd\xf2\xe1\x98>\xd3Y\xb8\xbc,q\x80= g\x02=(\xc8^>,*\xca\xbd\xf1\x11\x1d>\xf0\x8a\x15\xbdo#\xef=@\xfb*>L9\xd3>\x07\x1c\x86>\xe3m#\xbc\t8\xb5=\xa7\xb0\x1f>\x8d\xca\xf6='
-p1947
-tp1948
-bsV503962052713787392
-p1949
-g2
-(g3
-(I0
-tp1950
-g5
-tp1951
-Rp1952
-(I1
-(I200
-tp1953
-g12
-I00
-S'\x10E\x03?d\xbe\xef<\xb5\x96\xec\xbe\x1a\xac*\xbe\xa2\r\x81>\xdc\xebi\xbd\xea\x06\x08\xbdh\xa8\x7f\xbe#p\xb5\xbc\xc6\x9eh>\x82\xc0\xa4<.\x81d\xbd\x8d\x91U>\xf9\t =\x0b\xc79\xbe\x10\xaf\xae>\xc6\xd2\x9e\xbd4\x03\xbd\xbd\x86\x1b \xbe\x86p\x0f<\x07\x11\xaf\xbe\xa7E\xf5=\xfer\xca=\xd3\x82\x0e\xbe\x89\x96\xc8\xbc\xcb\x04\x12\xbe\xf1kj>\xeb>{\xbe\xa3\xbd\xb7\xbe\xb3@\x0b\xbc\x9cw#=\xb3Z\xc4\xbd\xf6\xa2\xa8=\x8b\xd8\x8f\xbe!\xc0\x8c=/\xbc\xa2>;!C>x\x06->\xab\xaf\xb7>\x9e7\x05>\xeaf\xf8\xbd4~\'\xbcq\xe5L>\x9e\x1e\xb6\xbe\xc1\x01h\xbd\x11\x0f\x84\xbd\xe7\x8d\xcd>\xb7wm\xbd`\x03\x93=)\xa6\x02?\xcb\xfd\x84=\xdb\xbf\xda>\xbe\xef\x88\xbe\xfb\xe3H<\xab\xcc\xcb\xbe\xf6\x04t>\xb7\xb3?>~\xde\x02\xbdP\xc8\x0c\xbf9\xe8\xda\xbe\xb1\x9a\xb5>\x85\xbc\xa9>\x9f\xee\xa7\xbc#y>\xbeN\x1f\xc5\xbdF\x01Q>8k7\xbeP\xfb\xa6>\xea\xff\x9f\xbe"\x93\xd2\xbd\xaf&\x03\xbf\xba\x04\x87\xbe\xbd\x17\x02\xbdE\\\x12\xbe\xca\x85\x80\xbe=t\x8d=\xfeR2>\x97m(>\x07\x03\xb0=\x07\xfe1>\xdf\xe7\xcb\xbd\x9b\x04\x17\xbdo\xcd\xb2>\x8ey\x88\xbe\xe6\xb20>\n\xfd7>\x8d\x18P>\xf2\xd7\x80\xbe"\x87\x07?U\xfe\x8a=\x19\x88S\xbe\x9aCy>i\xc1\xc5\xbe\x03\xf2}=\xcfN\xba>\x025\x17>\x8a38>\xc9,\x8e>\x92\xd4\x13=\xf6,\x83\xbd\xad\x1a\x10\xbd\x16\xed\xa5>v(6>\x10\xe6\x01>\xc5\xe2\xc0>\xc6\xdd|\xbe\x9b\x05\xcd=\x15\x13k>\xfc=\xa8=\xfa;\x0e\xbd\xa8D\x86\xbe\xd4m\x14>\x82\xb2E>\xca\xf8\xdf=S;\xa1=\x01qN\xbcg\xa7\xa9\xbeTW\x9a>+&7=\xa5\xde2>\x08\x0b\xdf>h\x04\x18>G\x1b\xb7\xbd\x88?\x9e=\x83\x94\xba\xbd\xb4\xb2\xb1>\x89xc\xbeH\xff\x14\xbd\x9b\xcc\'<=\x9c\x8f<\x821\xf5=\x8e\xeb$>\xf2\xe4\xdb=\xfa\x9c\x89\xbc\xf85\x81\xbb\xef\xa4\xa4=\x019j\xbd\xc3\xe9\x06\xbe\xc8\xde\x08=\xe9\x83\xfd=\x85\xc9W\xbeiD\x01>\xa2NC\xbcn\xae\xcc\xbe)\xa8\xbc>N9+=\x1e(\x93>\xa3i\xb5>~xA\xbe\x8b\x01\xd1\xbd\xed\xedn\xbdb\x96\x1a\xbe\xc3\xd3\xce>\x92Ih>u)\xbd;p\xde\xc1>\x83u\x85\xbd\xfa\xa50>\x88\xa4\x82=\xe6@B\xbed\x08\xfa\xbc\xe5w\'\xbeZ\x82\x9a\xbe\xee\xc3l\xbew\x02#=\xc0\x8f\x03\xbe\xdb\xaf\xff\xbeuXb>rI\x97=\x0b\x8a\xc6<Gf\x87=&\xbf\x0b\xbe\x07\xc7\xb4\xbd8d\x0f?\xbe\x0c\x16>\x07]\xa2=\xbeK\xcd\xbe\x89\x97\r\xbf\xe6e_\xbd\x84\xd6K>\xdc\r\x97>\xe1N\x95\xbdYy\x90\xbe\x07\x9c\x8b\xbe\xf0\xb1\x84>\xd2\x8f\x12\xbd\xa5\xf3J>\xb3P =\x8fdw>\xe7\xec\x8c\xbd{\'Z>V\xc8\x8d;1\xc6I>\xd1\x852>\xb7g\x06?\xcd\xc7\xa8>\x9e\xf9(=\x93\xc1\x91<\xb2\x12u=DYJ>'
-p1954
-tp1955
-bsV503970186941456384
-p1956
-g2
-(g3
-(I0
-tp1957
-g5
-tp1958
-Rp1959
-(I1
-(I200
-tp1960
-g12
-I00
-S'\xae\xff4?S\xfa\x97>\x85\xfa\x0e\xbf\xfa\xf1W\xbe^F;>\xbe\xce\xc2\xbc\xb7\xeb?\xbd9\xed\xbd\xbe\xafB\xb4\xbdKK\x84>\x8d\xae\x91\xbdg\xc6\x81\xbe\xbe\x88o>\x8f\x10\xb4\xbd\x98\xde5\xbd\x12\xe0\xd6>;[\xec\xbd\xeaR\x8c\xbe\xb6IN\xbe\xd2\x83\x16\xbc\x7f\xb4v\xbe\xe7\xc0\x92=T\xd3\x93>\xfe\xeb\x00=\x99\xa8\xb6=\xfdb\xaf\xbdh\xb0\x00>b$N\xbd\xb9\x13\xb8\xbe\xeb\xec\x08\xbe\x0e5.<V>6\xbd\x04@9\xbdgV\xa4\xbe\x00\xb2\x0e>\xfb\x17{>\xea\xa9\x8e>\xe3\x10x>D\\\xb1>\x1b\x07\x86=o\r\xe4\xbd\xecC\x8d\xbd\xc8C\x05\xbb1\xba\x8f\xbe\x0bwg\xbe\x92\xfbX\xbd\xde\x00\xe1>\xac\xd2(\xbdn6\x1f=\xfeF(?\xb8\x03s\xbcy@\xba>?\xce\x8c\xbe\xda=\xed<(\x1f\xc5\xbe7G\xb4=_tv>ReN>\xd26\x1f\xbfw\x81\xf9\xbe\x15.\xc4>\x86\xc8\x18?i5b>[\xe2Y\xbe\xbe\xba\x0e\xbe=I%>\x86E\xd2\xbd\xffa\x06?\xa1d\x8b<\xd5\xf4}\xbe2#\x0e\xbf\x1aS\xf0\xbe2\x08\xb5\xbe\x90\x9c\xaa\xbd\xe5\xaf\x8d\xbe\xa9\xa2\x86\xbd0\xc7\xad\xbd\xed\x08i>\xa5\x10c>,I\x13>\xd4\xab<=\x7f\xa7\x98\xbd\xb3O\xcb>p?n\xbe\x7f\xc9J>\xd9\x03\x99>NFe>N\xd5#\xbeB\xf1\xd4>\x97\xf0Z\xbep\xd0\xa7\xbe\xa8wy>M\x03\xd3\xbe\xcbE&\xbe\x92\xf9\xf0=\rn\t>v^\x8f> x\x9f>}\xe4\x9a\xbd=\x9d\x00\xbepu\xdf\xbd\x14\xe3[>\x03\xa1I>\x06uI>|\xcd\xd9>\xb6\xad\x87\xbe\x97\t\xc5=\x98\xbd\x03?,\xd1\x81\xb9\xe8(#\xbd\xe9\xe0\x04\xbf_9\xe3=\xe3\xa4\xdd>h\x17O>\x06\xc2\xe5=\xd5\\u\xbe\xbb\x93\xbb\xbePz\x88>O\xe8P\xbdH\x04\x13>\xa1\x9c\xf2>0la>\xb9W:\xbeLpJ>\xc2\x98-\xbd\x7f@W>\xc1M}\xbeO\x159>f\xc4\xbe\xbc\x98\x1c\xcf;R\x13\x0f>\x08z\x99>\\\xe6\xa1<\xe9W:=\x10\x88\xc8\xbd\x9a\x0c|\xbdx\r\x93\xbd\xfau*\xbe\xe9\x86\xae\xbe\x89U\n\xbdv\x82\x81\xbe\xc1\xb2\x93=\x13\x02|>\x06\x80\xf6\xbe\x8a\t\x0b?#k)>\x14\xfeD>T?"?\xf2\x0c\x1d\xbe\xbe\x81\xf1\xbd\xb3\xc9\x00>\x08\x19\xdc\xbd%\x81\xed>\xb4\xc3\x81>qV\x87\xbd\x9cZ\xa4>\xa6.\xd7\xbd\x1b\x99\xc0=5D\xb2=6\xaa\xba\xbe\xfd\xb9q\xbe\xeb\x1b\x8a\xbe\xab\x0c\xbe\xbe\xfa\x12\x9b\xbe()\x19>Y^\x18\xbe\xfcK\x03\xbfh\xe7\x80>\x8d\xed\xb3>\xdc\x8d\x08;p\x7fe<%!\x93\xbe\x86\xab\xa1\xbe\x15#\xf4>\x95pV=\xa9\x026>?\xd6\xc5\xbe\x92\x13<\xbf\x82\x98\xb5<m\xf7w>p\xaa\x89>\x95\xa8[\xbe\xb8\xf7\x9d\xbe\x94\x1a\xc3\xbeB\xd7\xcc>.0\xbb\xbdP\x86\x94>VR\x1d<\x0c\xf1\xaf>\x02\xf3\xa8\xbd\xde\xbeD>\xd4\xff\x1e\xbd\xd6\xb0\x99>5x\x8f>a\xa3\x1a?\x82\xac\xeb>\xce\xe0K\xbe\x81\x1ct=!\xa4\xf7=\xbd\x1b\n>'
-p1961
-tp1962
-bsV503961021904859136
-p1963
-g2
-(g3
-(I0
-tp1964
-g5
-tp1965
-Rp1966
-(I1
-(I200
-tp1967
-g12
-I00
-S'@Jr?\xb4k\xf8>P0*\xbf>\xcb\xf5\xbd\xe3\x04\xf0=\xbb\x17`>\xef\x8e/\xbe+\xff\xa8\xbe\xf6w\x86>\xcf\xd6c?\x01\x85\x8b\xbe\xb4\x03\xe9\xbeNxp\xbe\x1f\xbbo\xbe\xe9\x80\xaa=\xd5\x90/?t\xcc\xc0\xbew\xa2\xec\xbe\x97l\xfe\xbe\'^\xf1\xbex|\x01\xbe\x8e\x1c\x9d\xbcB`\xe7>\xa6{Q?5\xe8>>5W+\xbe\xe9\xa5\xc4>\x04H\xb7\xbdy~\x05\xbf\x97\xb0B\xbfw\x91\x9d\xbe\xac\xee|\xbd\xed\x10\x1f\xbe\xb5\x96d\xbfl\x89\xa0=\xe6\xfe(?v\x1b"?\xdb\xf5\x87>\xe5\xfa\xe3>\xdc\xed\r\xbd\xe1\xf7\xfa\xbe\x92\xef\xb2\xbe\xce\xe4\x07\xbe:T\t=\xf9A\x0c\xbf\xa4H\r\xbe\xd4\xf5-?\x14\xdf\x8b>=e\x80>\x18\\\x8e?\x16\xe5n\xbe\xefu\x14?\x18H\xee\xbe\x948\xed=\xb2\xfd?\xbf\xba\xc5\xde<\xfe\x01\xfa=I0\x81=\xb2\xa8\x88\xbf\x03P|\xbf2\xd2\xbc>\x8b>\xad?\\\xbdG?\x16~|\xbe\xe3\xed\xa0=*\xcaq=\xdfi"\xbf\xce\x81z?\x85^\r?\x9eG\x1b\xbfF\xaf\x16\xbf\xd2^_\xbf\xbbd\x18\xbf\xa5\xfb\xa4\xbeX\\x\xbe\n\xfc\x05\xbeh\x82\xd4\xbdd{\n>\xeeG)?\x8d\x94\xb5>\xa0\xeb&>\xd9\x80\xc6<\x1a\xdel?\xb6;#\xbf\xe8=j>\x9e\x91\xe8\xbdN>\xce>s\xd7\x02\xbfp\xb6N?F\xa1T\xbe\x8f\x9d\t\xbf V\x89>\xae\x00\x8b\xbe\x16i\xbb\xbe\xe7\x16\x13?:\x96E\xbe\x08\xdc\x19?\\\xd3\x94>\xf4\x17\xa1>\x86Z\xbb\xbeH4\x05\xbfV)\x93>\xfanj>\xf9\xd6j>\xf4\xfe2?\xf2\xb9\x04\xbf\x04\xba\xf3==~c?\xe8\xd4R=4\x9ap\xbe@q\x99\xbf>\x8e\xd7\xbe\xea\xc94?\xf0\xdf\x82>\x00\xce\x04?\x16\x1e\xa9\xbd\xfa ,\xbf]\x9f#>C\x9f\x8b\xbd\x9eT\x9e\xbe]D9?O|\xf8>\n\x9a:\xbei\x9d\xab\xbc\xbc\x9c\xb4\xbd\xc2R\xdb>\x1a\xdd\x9e\xbc\xf4n\xb9>\x05n\x8f>`\xcd\x9e=\x1d\x0eC>#N\xb1=Cn\xa0\xbd\xc3\xd1\xfa\xbd\x14|\xc5\xbe\xb7\xa3\x10\xbd^\xf1a<4i\x08>\xe3\xaay\xbf\x80\x8e\x07\xbe\xaf\xae\xc4\xbeL\xc2r>\xbc`\xf1>\x85\x9a\x1e\xbf\xa4\xbed?Zs\x12?\xd8\x87D;~\xe7\xae?\xd7\xa8n\xbdR\x0b\x0f=\x10\xf9\xa9\xbd+!\x99\xbe]\n\xcd>J6~>\xa7`>\xbe\xb6\xef/?\xfa\xa8#\xbf\x0cx\x80\xbd\xcc\xf2\xa5>r\xbfO\xbf(\x908\xbf\xbd\xd8\xde\xbez\xbec\xbfo\x07&\xbf\xea\xae5>\x1aQ#>\xf3\xa3Y\xbf\x02\x88\x13?\xed\xbb\x87>\xf4\xfb\xe3\xbd\x0f\x88\x15\xbdh\xcd\xcd\xbek\x10*\xbf\xa8QY?\xdc\xa0d>4\xa2!?\xfb\xd5\xc3\xbe\xfc\xcd\x82\xbf\xe6+\xb3>1\xd8?>\xf9\xc6\x1a?\x1e\r\x08=\x97\xa0\x1e\xbf\xaee\x01\xbf\xd1\x81W?-\xc2O\xbd\xb8\x1a+>\x1e]g>FL\xa5>\xc1@"=\x9d\x95f>DO7\xbc]~\xd4>\xa6\x03M>LF\x85?\xbb.J?\xeex\xb8\xbe4\xe6\xa0\xbc\xc4\xba\xc3>+\xbd1\xbe'
-p1968
-tp1969
-bsV503975212409712640
-p1970
-g2
-(g3
-(I0
-tp1971
-g5
-tp1972
-Rp1973
-(I1
-(I200
-tp1974
-g12
-I00
-S'1\x9e\xf8>\xdbn\x16>\x1cq\xc4\xbey`)\xbda\x18\x17>Lo\x01=\xef\xbe\xc6\xbd\x11\x04\x11\xbe\xdfq\x7f=\x90\xb5\x81>Z\x82.\xbd\xaa\x0f\'\xbe\x8f\x88~=\xd9\xa0Q\xbc6\x98\xeb;\xa3b\x9f>y:\x98\xbdaE\x16\xbeyM-\xbe_\xef\xbf\xbd\xd1\x9b\x11\xbe\x17\xbc\x0f=\xd1\x18`>\xf0\xc4\r>\x8c\xa5\x12=V\xb2\xc9\xbd.\xd3\x02>\x1c\xd0\t\xbd\xc1Em\xbe\x8bJ8\xbe3\xff\xc4\xbd"\x82\xa5\xbdW\xf4f=j\t\xa2\xbe\x8c~\x8a=|R\x95>\xc1lR>\xf6\x86*>\xb4X\x85>\x1fE,=\x86gR\xbeW\x97\x8d\xbd\xd7\xe8\xd2;Y\x1b\x12\xbe\xcd\xcb\x12\xbe9\xfa\xeb\xbddo\xd0>V<A=:\xb2\xda=\xba\xe2\xf0>\rj{\xbd#:\xb9>\xe3bN\xbe\x04Z)=d\x83\xab\xbe\x81\xcc\xcf=@\xfd\xf1=e\xa7\x0e;\x83\x8f\xf7\xbe\xccu\xb2\xbe\x8aX=>F\xb8\xe5>\x0b\xc2$>\xfa\x0c\xe2\xbd\xb2\x9b\x0c\xbd\x02\xe4\x9b=\xe8\x95\x8a\xbe\xaf\xb8\xb7>\'V\xb4\xbc_\xa5/\xbet\x06\xdc\xbe\xd8\xa9\xa4\xbe <\\\xbe\x04\x9f\xca\xbd3%S\xbe\xdf\xfd\x08\xbd\xa4\xf3\xd9\xbcAF\x07>\xedm\\>@\x11\xeb=\xcf\xe3\xa0\xbc\xd6n\x11\xbc\x8a\xdb\xcc>\x07:\x8b\xbe\xcc\xfb\x0f>\xc6B\xf9=j\xc6T>\xc0\xe3}\xbe\x84\x94\xd9>\xc3\xabI\xbd+|\x82\xbe\x1c\xc32>\x81b\xa3\xbe\xec\x18I\xbd-\xc3v>\x9f\xa5\xbd=\x01_a>d\xa78>\x06\xf8\xac<QF3\xbe\xf9w\xe1\xbd\xc0\r[>\x84\x81(>\x0c\x83\x01>\xb3e\xab>\xf0\xd6g\xbe\xa1\'H=\x17\xf9\xb5>.\xc5\x19=-U\xa8\xbco&\xdf\xbe\x91\x142\xbd\xc8_\xb3>_\x00\xce=\x01#(>t\xf7\x9a\xbd9\xfc\x98\xbe\x8b6\x1e>\xb0~\xdd\xbc\xf9\x05B;\x8a,\xac>\x9d;d>\x04\x95\x07\xbe\xf9]\x94=!\xc5\xe4\xbdT#N>Q\x00\x16\xbe\x80\x81\x1e=\x1c\x0f\x08=\n\xc7b=\xa9\xed\x11>\x18\xc33>L\xfeV:9\xe0\x06<C\xf5\xe1\xbd-x\xbe<wi\x1a\xbd\xb9f\xac\xbd\x9fH\x82\xbe\xe3+\xe0<\xfdqW\xbe9v\'=\xa7d\xb1=A\xfd\xb9\xbe\xefh\x99>\x04Zy=\xc7}\x84=\xa6T\xfc>\xefT\xc1\xbd&\x08C\xbd6\x02\x10=\x03}\xb7\xbd\xe0\x89\x9a>\xfc\xb4\x19>\x1d*\xe4\xbcg\xe8\xb3>D70\xbe}\xa5\x19=JO\xbd=a\xd9\x88\xbe\xba\xb3]\xbe|\xb6S\xbe)\x01\xb6\xbe_kx\xbe\x9cZ\xce=\xc9\x1f5\xbdtE\xc6\xbe)\x0e\x85>\xbfj\x13>\x81\xe0l\xbc\xa5m\xac\xbc\xf7{ \xbe3\x7fN\xbe\x0f`\xe0>,O\x8b=l\xfdQ>\xf47\x8e\xbe+H\t\xbf\xb7\xb1\x9e=\xe1=L>\xdc)\x9b>\xc4\xd6w\xbd\x01\x1cA\xbe\xf6\x93s\xbe\xb1\xdb\x9a>>\xa7\x11;\xed\x96$>\x1f\xbc\x97<JLG>@\xbeN=\xf7\x9cY>\x0f/\xa3\xbc\xd6\x89C>t\xfb\x06>\xe81\x10?\xe4G\x8f>&\n\xdb\xbd;-\xa9<\xc3\x16\x1a>\rK\xa5;'
-p1975
-tp1976
-bsV503963788249677825
-p1977
-g2
-(g3
-(I0
-tp1978
-g5
-tp1979
-Rp1980
-(I1
-(I200
-tp1981
-g12
-I00
-S"\xeb\xb4$?\x99\xacC>J\xec\x02\xbf\xfc\x10\x90=\x8e\xba\xff=\x12\x9df\xba\xbe\xddF\xbd\xc7}\x85\xbe\xae?\xda=\t\xc1\xe3>TB\x90\xbe\x86\x84\x00\xbe\xfe\x1c\xaf\xbc\x17\xccl\xbe\xac\x7fV>\xab\x9a\xe8>\xa2\x82\x05\xbe,EV\xbe%z\x8f\xbe\xa5\x87\x82\xbe\xb9\x11\x18\xbeLFT\xbc\x89!\x82>Oz(>\xc6\x85\x01>\xacR\xd2\xbd\\-\xa3>g\x13\xb6=\x08\xf0\xbc\xbe\x88\xe3\x99\xbe\xfeK\x14\xbe\x8b\x94\xe7=\xa7\xbah\xbd%\x991\xbf\x89Q\xb9=\xd5\xed\xa1>\x0c\x02\xdd>\xec\x89\x94>\x95\xfc\xf3>\x1c\x8c\x81\xbe\x7f\xe1\xdf\xbe\xc4YC\xbe\x9a\xb6\xbf=\xe2\xd29\xbd+\xf3\xd7\xbe\xf4\x07|\xbe6L\xdc>\x1d%\x83>\xb7\xa8?>\x10\xca$?\x9aW\xdb\xbd\x8d\xd3\x1d?\xb1\x14\xaf\xbek\t\x12>\x1c9\x12\xbf\xda\xb1\x8e=\xdc\x12\xe0=\x96\xcdF\xbd\x05\rH\xbfZ(\x12\xbf!\x96)>\xa0\xa4=?\x18\x11\x1b?\x815 \xbe\x10\x8e\t>\xb2\x95/=\xfe\xe2\xbe\xbe\x9aY(?\xb5\x1d\xd8>T\xa7\x95\xbe\x03\xb1\x19\xbfd\xe91\xbf\xb0\xbc\xcc\xbe\x87\xa0\x05\xbe\xd9\\~\xbdV-\x8a=\x9c\t\xdf\xbcA\x08\xe1=\xfc\xb8\xf7>'u\x96>\x8b9\xaa=rp\xc6\xbc\xb4P\x05?cO\xd4\xbe\x82\x8d\xe9\xbc\xfc\x9b\xd7\xbd\xfd\xb5\xbb>\xe7\xa6\xa3\xbe\xaci\x13?\x0c$s\xbe\x14\xb1\xa6\xbe\x0c\xe9=>\x07q<\xbeb\xc2\xee\xbe\xdf\xeb\xb3>\x15\xd3\xe2; \xc5\xfa>\x0b\xc9u>\xfb\xc1^>\x10\xc3\xb7\xbeX\xdf\xdb9L\xea\x1c>\xa2\xdam>\xf3R\x8c>J\xfb\x0c?\xbc^\xb8\xbe\x02l\xae\xbd\xb1\x80\t?!\xdb?\xbd,\xe3K\xbdz\xcb@\xbf\xaa\xc9+\xbeg\x99\x08?c\x97\x9e>S\xf0A>,\x81e\xbdg\xba\xfb\xbeJ\xe0\x0f>\xc1d)\xbdT\xd5)\xbe\xf0\xb5\x10?\x88\xa2\xaf>\x1e\x8b\x98\xbd\x95\x08\x00>#\xc0\xdc=4\xf7\xa7>C$@\xbe\xde\x07D>\x0c\x93\x08>k\xb6\x93>\xd0pD>4\xf8\x9a=\x8af\xd9<\xa9\xe0\xe3=\x07\xd0,\xbd\xcc\xae\xcd\xbc\x85W\x9f=\x0b\xb52>\xbby\x15\xbfxNH\xbe$,\xc3\xbe\xa9\x82\xd4>\xc9\xf0\xd3>\x17W\x11\xbfW\x08\xef>J1a>9=\x18=\xcb\xb4i?\x141\xb0\xbc\x85\x8d\xaa\xb8 \x9e\x1f=\x15\xf7\x19\xbey\xb4e>\x9b\xb8'>aR<\xbd\xb4\x12\x0b?\x00\x7f\xe5\xbe\x08\x82\x95=\xfea->#\xa9$\xbf\x90\x95\xaf\xbe\x93I\x02\xbf^\xa3R\xbfL^\xb0\xbe{\xf7E>\xd3\x94\xdb;\xeab\x13\xbf\xa8\xb7\xd1>\xb72M>*\xb23\xbe\xbd\x10\xdb\xbc&\xa0\xb9\xbe5\xf2\xe9\xbe\x1at\x0e?i\xf3h=.\x00\xaf>\xd5\xf0\x87\xbe\xec\x00F\xbfs%\xa3>6c\xc8=q\xd3\x84>\xee\xa7\xb2=a\xdd\xcf\xbe\x08\x07&\xbe\x00\xaf%?\xceG{<:\xde\x94>D\xc0\x1c><f\xb7>\xe3n\\\xbdE\xe6}>\xa7{|=\x0cJQ>\xd7k#>THD?;*\xea>\x0b\x1c\x1f\xbeG\xfep\xbd\xd9\xb99>\x9e\xece\xbe"
-p1982
-tp1983
-bsV503965065972707328
-p1984
-g2
-(g3
-(I0
-tp1985
-g5
-tp1986
-Rp1987
-(I1
-(I200
-tp1988
-g12
-I00
-S'1\xb2\x12?\xd5\x9f\xa0;\x0fE\xfb\xbe\x8bd\xb9\xbd\x1c\xef\x84>\x87\xcb\xc1\xbc2@"=6~\x8e\xbe\xfb\xcc\xf1<L\x83\x80>w\x91\x80\xbd8\x91\x90\xbd\xba\xe4|>|\xbdG\xbd\x07\x81\x8f\xbd\xb3f\xf5>\x14\xc1\x8a\xbd:~\x95\xbd\xb1\xed\x97\xbe\n\xe4\xc6\xbd\xa3\x8dW\xbe\xef\xa9\x81=,\xb5\x86>\x8b\x9f\x85\xbc9w\xc0=\xc4.[\xbe(\xa5&>\x83!\x17\xbe\xb7\xa5\x94\xbe\x07\x8dK\xbey\x15\x80\xbd,\xd2\x1d=u\xde)<_\xfe\x05\xbf\x8d\xeb\xb6<\x9f*<>r\xa4\x99>cV\x84>b\xef\x92>\xb2\xea\xfd\xbd\xdemb\xbe\x94?\xca\xbcH\xdf\x0e<\xc7\x99}\xbe\xef\xd2{\xbe\x95\xf4\xe5\xbd\xf89\xd8>F_\x8c\xbc-\xa0\xc3=\xda\xa1\x18?;\x12\x14<*6\x15?\xf2\xdc\xa3\xbe<~H>\xfe#\xa2\xbe\x00*P>\xff\\\x19>\xc1\x86\t\xbe%\xfc\xd3\xbe\xea\xab\x10\xbfk\xf0\x8f>C!\xce>\xc5ki>\xe4M\x14\xbe\xca=\xcd=\xcc^\x07>A}\x85\xbe,&\xd9>\xe0\x84 =\nD\x9d\xbe\x1bg\xe3\xbe\xd4\xb6\xbb\xbeev9\xbe\xa9\x93\x13\xbe\xd3n?\xbe)T\xf8<\xaf\x9aQ=\xec5\xdd=V\xa1g>+\x87\xa5>/\xd1n\xbd\x18M\x15=\xf0\xb9\xd2>[\xbem\xbeJ\xa2\x8b=P\xeb\xd8=\xa1\xbd\x9d>\xdac\xb9\xbeU\x06\x1a?{\xd5=\xbe\x07\x88\xd2\xbe\x99\xfb\x0c>\xf0c\xa2\xbe\x990\x1c\xbe\x92\x17\xb9>;2\x00>lW\xa9>_\xd3\x85>1j\x1f>\x8c\xcc5\xbe\xe9\\s\xbd\xd70q>W|\x88>\xc9\x81\x91>E\\\xc0>\x07\x83U\xbe\xf6\xe0\xa4=lx\xc7>\x9dH\x11<\xe9/\xe9<\x1bg\xd9\xbe\xdf\x0b}<\x10\nf>\x00\xf5\x17=\xe6\x15J\xbc\r\x18\xd8\xbc\xe9\xac\xe6\xbe\x0bx|>Pc\xd9\xbb\x01$2\xbd\x1e\xaf\x07?\x87\xed]>\x12\x9c\xcd\xbc\x9f\x9c\x03>\xa4\xe4\x8f=\xa78\xd3>\xcd94\xbe=\xbd\xb3=%\x876=\x96\xf5u=\xbb\xc7\x18>f\xd6\x03>b\xff\xe4=\x0f.M=rN\xa3=i\xe0n>\x84:\xf4;\x18\xd2\xa7=\xfe\xdf\x9c\xbe:+\xed\xbc\xcc\x1c\xa4\xbe\x08>\x98>\xad\x12,>\xfb\xe5\xf6\xbe\xf6\xc9\xcd>\x04\n\xe7<\x02\x1e\x06>8P\x15?\xd6\xdf\x02\xbel\xbaZ\xbc\xe1<$\xbdB\xf1\x8b\xbd_+\x8b>z\xb5\xf7=\x16h\x9b=\xb4\xf0\xf1>\xc6\xf8\x88\xbe.\x9b\xac=\\\x05\x11>q\x08\xc2\xbe\x1e\x12\x12\xbeh\x18^\xbe\x9b8\r\xbf[\xf8\x9f\xber\x82\x13>\x82{^\xbd\x80H\x1e\xbfHo\xaa>Y=-=\x9c\x8b\t\xbe\x98\x96\x8f=\xf3\xfd\x91\xbe\xdfgj\xbe\x8a\xe2\x15?\xdd\xbd\x03>\tI\x08>\x9d\x08\x84\xbeTU\x1e\xbf\x8fEC>\x0cbU>f\x04\xd9>\x08\x1d8\xbc\x88\xb9\x9b\xbe\xe8o\x8f\xbdhB\xcb>\xdc\xaa\x8f;=\xfc\xd3>^\xdf+>\xe0zm>\x9c\xdd\x11=>\xee\x8b>(\xe3.=R\xb2j>)\x8b\x96<\xdd\x83!?mU\xa3>\xc2\x95\xbc\xbd\tl\x89\xbd6"\xc2=\x04<M='
-p1989
-tp1990
-bsV504221766047121408
-p1991
-g2
-(g3
-(I0
-tp1992
-g5
-tp1993
-Rp1994
-(I1
-(I200
-tp1995
-g12
-I00
-S'\xe0I\x8c>D\xeev\xbda\xde\xdc\xbe^?\xa2<\x1b\xba~>+\x00\xb8\xbd<\xa3\x10\xbdy\xcf\x83\xbea\xff\x9d\xbd\xe2b@>r\xf3U=\xa0Z\x84=\xd6\xf21>\xb4)>=\xfc\xb4\x11\xbe\x08\x84\x8a>\x86G\x94\xbdn\xe2A\xbd}\xfe\x07\xbe\x8e"P=\xf1+\x8e\xbe\x12\xa3\xbb\xbc\x9df\x92=Y`\x9a\xbeD`\x9b\xbd\xab\xdb\xb1\xbd\x1b\x97\x85>\xf1bt\xbe\xfd\xe0\x90\xbe\xf1\xe0)>\xd2\xc0\x0b\xbc\xab\xa7\x0c\xbe\r\x81\x13>\xda\xde\x98\xbe\xc1s\xb4\xbch\x0f\xae>a\\\x0b>\x9a\x05\x0f>\xe5h\xbb>x\xd7\x8c=\xe9|\xc6\xbd\xb3\xc8O\xbc\x1f\xe6\x8f>\x0b\xd4\x9e\xbe\x9e\x0f+\xbek\xf9R\xbd\xef\xb9\xc5>\xc8S?=O?\x8a=\xb7;\xc2>p\x7f\xb3=\xf8\x11\xdb>\x83\xaf\'\xbe(\xa6\xd4\xb8\xad\x12\xed\xbe\x93\x15\x83>Z\x8d\x8c\xbc!8&\xbe\xdf\xd2\xee\xbeh\x18\xd8\xbe\x15ms>\xd6W\xbf=ND\x0c\xbd\x96&\x81\xbeQ\x86\x15<X~\x82>\x9dqe\xbe\x98\x8d+>\xc6s\xa5\xbe\rh\xae\xbdr\xd2\x0c\xbf\xc1\xe8\xa4\xbe17P=j\x86\xf8\xbd\x8f\x85\xef\xbd\'\xc5\x82>\xb6\xa1\xab>\xbe \xea=\x8c<\x12>\xa4\xa8P>\x19\x0e\x93\xbd0*\x0b=\x9dV\x97>\xa2=\x84\xbe\xb51\x08>l\xdb\x89=\x9b\xde\x82>\xccu\xc6\xbe#\xbb\x05?`\xb5\xd9=\xd2\xd1;\xbe34O>\xb6B\x7f\xbe\xf8\n\x84=\xc8\x97\xc4>\xcc\xee\x05<R\x99\x1a>^\x92m>\x87\x0b=>o\x1b\x07\xbd\xb7\x0c\x03>\xfa\xbb\xad>\x0b1\xd7=\xa4\xc8(>\xd8\x11\xd3>\x9e\'\x8e\xbeR\xb3C<e3\x03=\x15\x14\x98=\xc4\x19\x82\xbbm\xd6}\xbdO\x97z>-\x18\x10>\xe6\xeba>h\xcd\xfc<\xe3\x1c*=\x8e\xd6\xac\xbe\xaal\xac>\xdcn\xaf<\xae\xfa\xd5=\xea\x83\x0c?1\xfa\x92=\x13_\xf4\xbcy\xb2w\xbd\x9bD\x06\xbd\x98I\x98>\x03L\x17\xbe\xbe\x01^\xbd\xe8\xf9L=<\xa4\x98=}bX=lO\xd2=\x08\x16\xf6=\x05\xd8A<\x0b\xf4i=\xcb\xf2\x1b>v\x89\x83\xbdd\xc7\x86<\x84\x1a\x8f=\xca\x84\x02>\x00\xef.\xbe\xa5[\xd2>\x82}u\xbd\xe7s\xb0\xbe\xf9\x15^>\xe4\x85g\xbdc6x>\x98\x8b\x8e>vO0\xbe\x1c\xb8\xa6\xbb\x06\xe3@\xbd\x15\x151\xbe\x19\x90\x86>\x95\xf9\x8e>\xa8\x15<<u\x9b\xc7>\x18F\x94\xbd\xa8{\x19>\x9c\x06\xb0=,\xba~\xbe\n\xea\x0b>2\x05w\xbeP\xc7\xbc\xbe\xf2\x03;\xbe0\x0fK\xbd\xf81\x03\xbe+\'\xee\xbe\xfc\xa8\x91>k\x05\xc4\xbd\x15\xf9/\xbd\xe3!;=[\x1fE\xbe\xd7\xe2\xe5;\x9f\xfa\xfe>\x1a\xce\x9c=\xf3\xf0\x0e\xbc}\xbd\xb2\xbe\xcb\xf7\xa5\xbe_\x9c_;\x07\xf5\xf4=\xbfX\x98>\xbb\xb0s=-\x858\xbe&\x9c\x86\xbd\xe0\xd5\x87>\xb4\x91\xcd\xbc\x92{Y>bP\x9b=\xa79\xa1>\xe9Ze\xbe\x17\x8fA>E\xff\xaa=L\x1a0>\xd0\n7>E\x07\xc5>\xdeU\xb1>\xe0\xf80>=n\xc1=_\xde3=\x08\xa3\x05>'
-p1996
-tp1997
-bsV503963400888942592
-p1998
-g2
-(g3
-(I0
-tp1999
-g5
-tp2000
-Rp2001
-(I1
-(I200
-tp2002
-g12
-I00
-S'L\x8b\xef>\x82s\xfa=\xa9]\x1c\xbf&\x98P=\x01\x07\'>\xf2\xaeV\xbd]\xc0\xac\xbd\xbe\x8aa\xbe|\x16\x8a=\xb7K7>\x83\xb7&\xbeX\x0c\x18\xbe\xed\xff\xe2=\xe5\xfe)\xbeo\xe1U>" \xe0>.\x14\x8c\xbd\x14R\x1e\xbe\x8d_\x84\xbe\x0cV\xc9\xbd\x8bG)\xbe\xc5[\xbb\xbd\xdc\x0f\xa2>\x91\x04\xb1=\xbc3\xcd=\x17\xd5\x1d\xbe0[c>o\x98\xad=\x9a\xcb\x8d\xbeo\x88Q\xbe\xa5\xb70\xbe\n\x84\x91<\xd0\xcf\t\xbd\xcaR\x0e\xbf\xfe\xd11=Y\xb3t>\x00^z>\xe1h\x81>\xb3#\xc8>T\xe9(\xbe\x003\xab\xbe`\x9d|\xbdi\n\x1c\xbeb\x86\xdc\xbc9\xb6\xdd\xbeK\xa1x\xbeE\x92\xf7>j\xbf >\x06\xaf@>\x9f\xc2\x06?\xd7\x90\xdb\xbb\xb9\x88\xf3>\xe4\x0e[\xbe1\x7f\xdb=\x18\xe2\x8e\xbe\x996\x13>|h\xae=%ct\xbd\t,\xd7\xbe\x9b\xd0\xf6\xbe\xe5\x03+>\x87\\\x16?\xf5\xa2\xd5>\xd7\xe3Z\xbe\x00\x9b\x13>\xda\xa4a=\xfe\x0e\x96\xbe\xe1\xbc\xd6>d\x92\\>\xbc\xf9e\xbeP\x82\x18\xbf\xb1\x0e\x1c\xbf40\xd4\xbe\xb4\xe6a\xbd]\x17O\xbeB\x925\xba\xd9%\x03;2|\xfd=2\xbf\xe7>5\x0c\x86>\xee\xac\x13={U\n>r\x1b\xce>\xda\x97\x90\xbe\xd3y\xde<\xbe\xf1\x16>3\xa8\x94>\xbf\x1f\xa1\xbe \x8a\x0b?\xe8\xc7\xa6\xbe[\xf5\xeb\xbe\x8a\xff\x83>\xe11\x99\xbe,\xe9\x8c\xbe\xe9t#>d\xaa\x02=\xc6>\xcd>O!/>\xb2\xcb\xf7=\x00\xdbo\xbe\xdc\x9e\x9b\xbc\xd2\xa2h>T\x97\x83>\xd9#\xbd>\x17~\xf6>m8\xa0\xbe\x8b\xe7M\xbd\x97\xb3\xff>\r\xc1\x8f<\x8d\xaeK\xbd\x1f\xd3\t\xbfU\xd7\xf5\xbd\xbb3\xed>\xa3;\x81>\xd8\x99\xbd=\x87!\x17\xbe\x10o\xfb\xbe${\xe5=\xa0w\x14\xbeD\xcd\xd4\xbd\xd4\x15\x10?\x95[\xac>Lz\xe5\xbd\xd5\xa8\x12>\x8c\xa0A=\xa0\x12z>\x1a\xc9V\xbe\x9fz\xab=\xdc$\xc4=\xa8\xa2\x99>\x07\x9ao>\xd4]}>|3\x82=\x15\xf1\xdf=s?\x08\xbeB\xd40>L\x14\xe3<8}\r=s\x16\n\xbf\x87G\xe5\xbdu\x8f\xe0\xbe\x10\xe9\xba> \xe8n>\xeb\xa7\r\xbf\xaeJ\x84>p\xc7\x8f\xbaK_\n=\xe5\xf3E?\x80#\xef\xbdz\xb8\x9a\xbdr\x93\xed=B\xe3}\xbdyA\x89>1\xb5?>\x9c>S\xbd^S\x14?QL\xaf\xbe\xac\x89G<\xdc\x17H>\x95\x85\xf5\xbe\xca\xd7S\xbe\xf4\x95\xc6\xbe\xf5\x87\x1e\xbf^\x80\x89\xbeb\xe6\xe8=[\xcd\xbd\xbc\xc2\xf7\x12\xbfS\xc9\xcb>\x886>>\xd0x\x86\xbd\xfaD\xbf\xbc\xca\x14\xc4\xbeL\xd8\xcf\xbe\xf9\xaf\xcc>\x8d\x0f\xa4<\x08M:>b\x07l\xbe\xd8\x91-\xbf\xb7W\xaa>\xedm;>\x9f0\xc6>\x86\x16K\xbd\x8b\xad\x8e\xbe\xf3\x9c\r\xbe`\x8d\xf9>\xdcR\xd1<\x1c\x82\xe5>\x9e\'\xbf=\x88\x88\xc4>$!\x9c\xbd\x9d4\x9a>\x83\xcd\x02=G\xdd\x90>\xacu\xcf=\xfc4"?#\x92\xb3>\x8b~\xa2\xbd\x95=\t=`\x8c\xe7=\xf4A\x83\xbe'
-p2003
-tp2004
-bsV503969540263256064
-p2005
-g2
-(g3
-(I0
-tp2006
-g5
-tp2007
-Rp2008
-(I1
-(I200
-tp2009
-g12
-I00
-S'\x1d\xe2\xdd>C\x9f<\xbc1\xc9\xcf\xbe\xd6\xe0\xa8\xbddD\xa9>iN\x9a\xbd\xe2z\x08>\x8c\xcd\xf2\xbd\xd9J|\xbd\x13(U=\xcd\xaa\xbb=\xd1\xe6U=}\x15\xa4>\x87\xe9\x97=M\xe6.\xbe9\xd3\x9d>\xe8\xd0,=\xcec\x15=w\xa5\x02\xbe\x15\x9d\xaf=\xd1N\x81\xbe\x11=A>\x8f\xbc\xbd=\xd75\xa2\xbea\xe79<\xfbs@\xbe\x11\xe7\x01>\x14\x89{\xbeT\x84P\xbeSj\x11>\xe7\xb7\xcf=js\x92\xbd}u\x0e>\xc1\xaaB\xbe<\x1f\xbf\xbc\x80q==\xdf\x9aE=\xd3\x9c(>Q\xa0\x9a>?\x1e\x03\xbca\x14\xc5\xbb\xb0a\xb2=<\x06\x9e>\x90v\xe0\xbe}\xa4\xe3\xbcz\xd5\xa6\xbdK\x85\xa9>\x8d5\xd9\xbdq\x0f\xda<\x93>\xc9>\xff\x90\n>\xad\xed\r?\xb8\x01\x8a\xbe\x90\x00+>k\xfd\xa2\xbe\xbc\xc9`>?\xec\x8b=\xe4\xd6\xf9\xbd\x14\xab\xa2\xbe\xc5\x9c\x8e\xbe\xd7\x92\x8d>\xb0gU<\x9dO\xc4\xbd\x03\x8e\xd2\xbdg\x8bh=\x18=\x04>_\xa5\r\xbeAN@>\xdb\xc2\xad\xbe\xd3\x1f\xf9\xbd=\xe1\xe7\xbe\xe1o\xbd\xbd\x08\xad\x13>5\xd6\xc2\xbdvU%\xbe\xa1S;>\x1fa\x13>\x01\xe1\xaa=\x10g4\xbd\xd8\x80Q>\x11o*\xbe\xd9\xc2\xdc\xbd\xcb\xfbS>-G\x83\xbc\xa5[n=B\x1e\x87>\x18\xed\xbb>u,[\xbet\xd9\xd8>(\x16\xa1<;\xef[\xbe(\xf6\xf0=/\xf4\xdb\xbe\x16f\x0e=\x14qo>\xc0\xcf\x96>\xc0.,\xbd\x80\xa3k>\xfc\xe9\x07<u/\xa8\xbd\x9fJ2>QFp>\xe3s;>xN\x05>\xd7\x82{>1\xba\xa3\xbdg]\xd0=c\n\xe5=\xc4;5\xbcL{\xc0=c\x94\xa0\xbd\xbd\xdb\x98>\x8bn)>\x1f\xa3\t\xbco\x9c.\xbet\xca\xf2\xbd\xc5\xfc\x84\xbeC\xaf\xb4>ne\t>\xd7v\x00>\\\xc7\xf6>o\xc7\xbf\xbd\xa86\xab\xbd\x8f\x90/>9\x88\xa0=\\}R>\xdbRS\xbe\x11\\q\xbd#\xa5\x90<\xf8\xecv\xbdGg\xc6=\xf8\x84Q=\xc5\xba\x03>\x99&\x12\xbd\xd6U\x81>{B\xb2=\x7f\xdc\xc0<\xefh\xbe\xbd\x19\x81h>\xe1"z=\xdan\x0c\xbe\x15\xceS>\xeb\xd2\xd8\xbb\xd3\xfa\x9e\xbe-\xd88>\xb0\xe5\xcc\xbdq,V>W\x95\xe1<_9&\xbe8s\xd4\xbc1\x1e\x99=\x15PG:O\rk>=\xa6\x15>\x81\xad%>\xf3*\xa8>\x1c\xa3H<\x95u/>\xbf\x07\x95=\xfc\xd20\xbe\xd3\x17\r>\x1f\xa2\xff\xbd\xb8(\xfe\xbd/\xf9\x11\xbeeN\xca=\xe5\xfcP\xbe\xaf^\xc6\xbe-E\xc3=\xf0\x117\xbc\x87\xdb\x81\xbd,\xd5;>\xe4"w\xbd\xb0\x85\xf6=\xb5R\x03?I\xdb\x19>\xc1)\x8f\xbd\xcbL}\xbe\x9b\xfa\xbf\xbe\xdd\x0e{;\x0ck/>W\x1cl>\xe8\x8d\x9a\xbd\x81\x87\xf7\xbd\xf5\xfb\x83\xbd\xd7\x06\x8a=\xc3-\x90\xbd\xf7\x19\x08>E\x906; \x04\xf4=+y\x89\xbdy8\x8c>\xf7\x88\xcc<\xf5\xee,>\x9c@\x16=oQ\xb8>\xd9E\xf5=\xc0\xcbM\xbc\r\x13U=\x81\xc0\xff\xbcP\x8e\xb8>'
-p2010
-tp2011
-bsV503977818897002496
-p2012
-g2
-(g3
-(I0
-tp2013
-g5
-tp2014
-Rp2015
-(I1
-(I200
-tp2016
-g12
-I00
-S'\x83\x93\t?*\xf1\xfa=}7:\xbf6\x12?>\xa35\xc0>\x1dJ\x1a\xbe\x8e\'\x19\xbe\xf6U\xac\xbe\xa0\x9cN\xbcBbz>\x93+\x0f>\xb0\xcb\xee=\x93F\xa7=\xde\x13\x1b>8\xd9j\xbd\xcb\x80\xf8>\xcd>i\xbd\xf3\x0e\n\xbe\x0e\x0fg\xbe\xe2*\x9c<\xfd\xfd\x88\xbe\x9am\x1e:\x03L\x8f>\r{\xb8\xbe\xd3iy\xbdzM\xb9\xbdh\xa9x>s^j\xbe\x96\x9a\x82\xbe ~(>\x02\xe23=C\x90z\xbeE\xa7e>\xb5\xf0\xb4\xbe\x9a%\xc4=\xb0X\xdc><\xb2+>\xe5\xf6\xa4>\xd2\xfe\x0b?ml6\xbc\x89\xb2=\xbe\x88d_\xbd\x80\x0f\xbc>\xb34\xb1\xbe\xd2&\x9b\xbeX~e\xbd\xcd!-?\xe0\xa1?< \xaf\xdc=za\x1d?\xe2w\xb4=\xaa\x9f\x1a?\xd0\xacP\xbe\x1e\x91\xc8<\x9a!/\xbfB\x99\x8e>\x8eI\xc4\xbc\n\xd8E\xbe>\xe1)\xbf\x1cX\x16\xbf\x1d\xf3~>\x941\x82>3\xd9\x1b=\x8a\xb3\xb5\xbe(\x047=\x9a^\x1f>=\x96\xd5\xbez\x7f\xc3>\n\x91\xb9\xbeJU\xd7\xbd\x12\x88n\xbf\x95\x91\xfc\xbes\xe2\xe0\xbd\xf0\xe9\xef\xbd\xb6]8\xbe`?\xb3>\xc8\x92\x8e>\n\xca\x0c>\xc6\xeaU>\x98\xecT>\x17\xbf\x90\xbd\x00)\xbb:k\xc9\xa2>v-\xcf\xbe\xcd\xca|>\x02]C>\xf2\x1d\x07?\xc6\x14\x07\xbf\xcb$;?\xe6<\x92=\xb8u\x9e\xbe<9\xac>\xc2\xc7\x08\xbf\xf6b\x1f>[\x00\xf6>\xc8D\xf1=V\xb0H>\xe5\xfb\xa6>\xe5\x17G>5\xd2(\xbe\xee\x19Y>\x94\xb8\x03?:\xb6\xdb=\x13\xbeK>\xb2\xc7%?\xda?\xbd\xbe&\n\xd9\xbbz-B>\x05\xf6h=JuB=.\x9e\xa1\xbe^\xca\x98>F\xb8\x03?\xee5\x96>\xd6\xaf\xca=S\xd6\xb8\xbd\x83C\x08\xbf\x1dw\xd0>\x19\xb9\x86=\xec0\x16>w\xb6I?k\xc3!>\xd68\'\xbeZk\xfa<\xed\xf6?=\xb6\xfb\xa1>S\x1ba\xbe\x9e,b=\xe2\x05\xb2=\xf5\xffE=]\tk>\xfe\x94\x90>\x9d\xa6X=\xc5|#\xbc\x1b\xc2\x93=\xe05d=vx\x8e<\x93C{<\x7f\xc5\xbd\xbd\xde\x9d\xa4=*0\x81\xbe\x83w\xde>\xdaI\xb9\xba\x9eR\x11\xbfi\xf5\xac>\xba\x19\x06\xbe\xdb\xdeB>\x1bH\x02? \x10s\xbe\xff\xa0\x06\xbc\x16Y\x85>\xf0u\xf6\xbds\xd7\x9c>\xe2\x9a\x89>\x02I\x11\xbc~\x18\r?{\xe7\xef\xbd\r\xfb\xfd="\xb2g>x\x1f\xb8\xbe\x9a\r\x02>\x10*\xe3\xbe\xf0\x92\xe2\xbe\xf6\xa2+\xbe\xf9@\xc0<\x9a\x10\xe1\xbd\x88\x9e\x01\xbf\x16*\x18?\x1aC\x8d<*K\xfe\xbd\xa2\xbe\xc2<\xad\xfe8\xbe#B\xbc\xbd&)<?\xfaG\x04=\x1d|\x08>\xca(\xcc\xbe\xc6M\x16\xbf\xaaY\x03>\xb0\xdbu>\x9dr\xd7>#\xc7B\xbc\xca\x12N\xbe\xdf\x97\x9b\xbd`$\xce>.\x15\x17\xbd\xb2\x9c\xa3>Mw\x80;\x13\xbf\xd6>\xba{\x8b\xbe\x9bU\xb7>~a\x15>\xeb\xfc\x99>\x95\xae\xb1>\xca\xe7$?\xd8c\xf9>\xb2z\xc2=\xda\x10C>\x87B.=\xc8\x036>'
-p2017
-tp2018
-bsV503975729726758913
-p2019
-g2
-(g3
-(I0
-tp2020
-g5
-tp2021
-Rp2022
-(I1
-(I200
-tp2023
-g12
-I00
-S'\xa8\xfd\xb3>c)\x02\xbco\xf7\xc2\xbe\xe4\xfc\xc4\xbdck3>\xabo\x9f\xbd\x9d\xff\xa7<9\x92\x81\xbe}r\x8b\xbd\xc0\x1b+>I\x14\x97\xbc]\x90\xf0\xbc\x91K7>\xb9\x8e\x84\xbcuf\xfe\xbd}6o>\x15nn\xbd\\o\xa0\xbdE\xdd\xea\xbdK\x84\x1b<\x94`~\xbe\xebW\x83=\x9de\\=|X1\xbekn\xa8\xba\xd9u\xb7\xbd\xd3\x18k>..\x1d\xbe\xa8\x80\x93\xbe\xd9\xea\xf5<k\xe20\xba8\xe2S\xbds\xafu=\x00V\x88\xbe\x1d\x87\x91<\xb8Y^>{J\x08>U=\x11>7\xa1\x9e>mR\x06=\xe74\xdc\xbd\xc1r\x17\xbcP\x8b->D\xf2\x90\xbe(\x96\x1a\xbeh\x83\x82\xbd\x84\xbf\x88>\xfco\xa8<4\xa4[=}\xbe\xb6>Y\xd7I=H9\xb3>p\x12I\xbe\xc9\xd5\x01=]\x91\xa0\xbe\x87"->\x1f\xac\xbc=\x15\x16m\xbd\xb8\xf8\xde\xbe\x10 \xb9\xbeK\xc0\x8e>`*\\>}\x1a\x9d=G\x1d*\xbe\xf0\xfeR\xbd;|J>%U\xf8\xbd`\x98h>\x11\x9c\x12\xbe\xf9K\xc3\xbd\xd3\x9f\xe3\xbe%\xb8\x8b\xbe1F\xbb\xbcsC\xd9\xbd\xa7\xbc\x0c\xbeP\xdc\xe3=B.!>\xc3\xcf\xf7=\x8b\x96\x08>E\xdaI>\x89\xe8h\xbdDb\xaa<\xbb5\x8b>\x1c\\=\xbe\x97\xa8\xa5=\x8c\xae\xc8=\xfdD7>\xf0Pa\xbe0\x92\xc4>sF\xd4\xbb\x01\x8a\x1c\xbe\xda\xf6!>A\xbeh\xbeT\xf0d\xbd\x13\x88\x80>\xb9U\xb0=\x93\xb8;>\xe3=U>\x80`\x9f=\xed)\x14\xbd\xa5]n=\x7f\xd1\x84>c\x06\t>\xed\xfb\x0f>\xe9G\xa1>K\xeeQ\xbe\xe7\x03\x88<\xb0\x0e\x1e>\xf3(q=@M\xd1\xba\xcf0(\xbe\xb9s\t>+T\xd8=\x1b\xcf\x1c>\xe4\xe5~<\xebJ\xf4:\x19.\x87\xbe8<~>\x80\xa2\xa7\xba\xdf\xcf\t>\xcd\xae\xc6>\xf0\xdd\xf0=\x9dC\xfa\xbc\x11\x91\x7f=hd\xe7\xbc\x17o\x83>\xb3L)\xbe\x18\xbb[\xbc\xecb2=\xdb\xc9\xfa=\xd53\xa1=\x05\xf5\xcb=\xbfu\xd4=\xcdXZ=\xce\x10\x9f<\x08=h=\x8bR\x13\xbd\xbd#Z\xbdP\x1e\x17<\x1ce\x94=kvP\xbe\xac({>\xbc\xda\'=1A\xa8\xbeS\xc4\x86>\x01\x17l=\xc0+p>\x0fU\x9d>\xd1O\xf7\xbd\x86\xf0\x9f\xbd\x1c\x8d\x91\xbd\x1e\x93\x17\xbeK\x9e\x96>\x94SL>\xd3\xc3\xe1\xbce\xc8\xa5>?M\x86\xbd8r\x1a>\xc5\x93,=\xfbSO\xbe\xb7}\x02=i%T\xbe\xd3\x98\xaa\xbea\xc3B\xbe\x11\x0b\xc9<\\ \xd9\xbd@\xee\xce\xbe\x99C7>gD\x12=\xab\x05\x1c:\x15\xa1\x1e={\x06>\xbeG\x84\xae\xbd<\xd9\xca>8\xa7\xaf=A\x05\xa8<\xb9\xb4\xa2\xbe\xfb\xdd\xda\xbe`B\x19\xbb\xe5X\x9a=\x13\':>\xeb\xb4\xb09\xd8\xe3l\xbeUd\x10\xbe\x1d\xf5x>]\xd3"\xbcC\x8e2>O^\x86=\xf7\xe2\x8b>\x99\xcd\n\xbe{\x00#>T\x9c\xc3<\xa4\xf2\x11>\x8f\xf3!>%\x95\xc8>\x1e\xf4\x88>\xeb\xfa\xa0=\x95\xf3\xfe<\xa4s{=\xc7\xce\xac='
-p2024
-tp2025
-bsV503965377752465409
-p2026
-g2
-(g3
-(I0
-tp2027
-g5
-tp2028
-Rp2029
-(I1
-(I200
-tp2030
-g12
-I00
-S'\xde\x04\xf7>\xaf\xe0\x9d\xbb6\xc9\t\xbf\r\xe3\xae\xb9\xa5\xe2u>\xa0\xc4\xf5\xbb\x16\r|\xbc\xd0\xff)\xbel\xc5\xd9=S\xc4\x81>O\xc3\x1c\xbe\x9d-\x83\xbd\x14W\xd8=%\x02\xf4\xbd\xadY*=\xdf\xff\xca>\xf0m\xa7\xbc\xc6.\x1e<HA\x9d\xbe@"\x0e\xbec[;\xbe=\xd9Z;*\xa3~>\x91\x18\xfe<\x0b\x1c\x01>\xe5{{\xbe\x1f\x81\x8e>\x98\xed\xce<8\xfe\x98\xbe\xf8\x87o\xbe:\x1d\xd1\xbdo$7=\x98\xc7&\xbcP\xdc\x14\xbf\x07\xf8\x03\xbbHX;>}\xaeT>\x97F\x88>\x1e\xe2\xc2>}9\x81\xbeY\r\xc6\xbe{\x14\xc5<\x0c~3=\xfb\x82\xf6\xbd_\x07\x87\xbeW_\x8a\xbec^\xec>\x13>\x17>B\xc3W>\x03b\x08?\xc9\xd2(<\xcd\x81\x1f?\xad\xdc\x94\xbe\x08\xe9^>\xfdY\xa6\xbe\xbc\xa4J>Y\xfa\xc8=D4S\xbeX[\xd4\xbe-\xfc\xf5\xbe\xb4\xb6e>gO\xed>q\xfa\xaf>\xccP\t\xbez\x109>\xcc\x17\x19\xbc\xd5X\xd5\xbe\xf8\x85\xc2>X\xc6\xfa=\xbd\xcd,\xbe\xbc\x83\t\xbf\xd8\x1a\xd8\xbe2\x10\x08\xbe\x9b\xfa\x99\xbd\x88\x18E\xbe\xd1t~\xba\r\x82\x82=>x\x9e=ef\xb1>\xc4\x05\x94>\xadH\xae\xbd\xb6\x19\xc4=\x91\xdb\xe0>\x07Qj\xbeM\x1dt\xbc\xa6\xc5\xb6=G\x95\xa2>\xf9\xdb\xc7\xbe\xd6\xf5\r?\xc8\xfas\xbe\xca\xfa\xdd\xbe`h\x11>\xf6\x8a\x9f\xbe\xbb\x8fV\xbe]\xec\x8f>\x96\xec\x16>#\t\x9c>L\xae6>\xf9\x9dE>sxz\xbe\xea<F=\x1d\x98z>p\xaa\x91>\xdb\xe1\xa8>\xd1\x04\xa1>\x8b`\x87\xbe\xe6\x19\x00\xbd[\xdb\xdd>E(9=>\r\xb3=\xb4)\xf4\xbe\xe1\x15%\xbe\x13\xe0\xb8>\x1bY\xc7=\x03\xa9\xab<\xcd^\x0f\xbdH\xd6\xf5\xbe\x96\xd4;>\xc4\x01\x19\xbd\x7f&\xd1\xbd\x03\xc2\r?\xad\n^>\x1dj\x9c\xbda\x7f?>4\x08X=x\xf7\xa4>\xfe\x93>\xbep64\xbd\x8c{%>\xcf\x81n>\xde\xe4q>\xd8\xbc\xdb=\x06\xa4\xb5=*,\xf7=\xc9\xc4\x03=3ka>\xf8\xc8\xa4=\xa1\xe1\x82=4\xc1\xb4\xbe\x82\x7f=\xbc>%\xdf\xbe,}\x96>~\xbd\x16>E\xbc\x0b\xbf\xc7\xbdW>\x8c\xa9\xa1\xbc\xc3\x90\xca=\xf5\xdf\x1b?3P\t\xbe>yx\xbdcE\x0e\xbd\xfbS\xc0\xbd\xca\xa7t>HT\x1b>\xe3UN<(E\x1a?\x93L\xac\xbe#uT<\x13\xcd\x15>\xf6r\xc9\xbeO\xf5\x1d\xbe\x08s\xba\xbe~\xce\x1d\xbf\xd8\xc8\x84\xbe\xcd*H>2e\xba\xbc\xcc\xe9\x14\xbf\xaaY\xb9>\xc3\xb2\x17=T\xf5\x88\xbd\xbf\xd0\x91=\xd8\x1bb\xbe\x83z`\xbe\x13\xa2\xfe>wk\x88=9N1>Bwz\xbe\xf0\xcd&\xbf\xd4s\x8b>\xe6\xe5\x02>y}\xbb>\x8cX\x99=\x13\x85\xa1\xbe=\xfa\x9b\xbdH\xc6\xc9>\x1f\xe5 =\xe0\xfc\xb9>\xdc\xc1$>\xef;\x92>k\xd8:=`r\xb6>(R\xfc<\x8d\xc7`>3A}\xbd\xfao-?\x80\xc1X>\x94e\xa7\xbb\xad)k\xbd\xf1\x82\xfd=\xf4\x1f\xf4\xbd'
-p2031
-tp2032
-bsV503970254196711425
-p2033
-g2
-(g3
-(I0
-tp2034
-g5
-tp2035
-Rp2036
-(I1
-(I200
-tp2037
-g12
-I00
-S'p\xd5\xfc>HiP>\x10\x15\xf9\xbe\x1f\x02m=\xdbi\x04>\x15s\xa1\xbdB\xc2\x9e\xbd\x15*\x95\xbe\x07\x92o\xbd\xad\x04w>\x8e\x8bW\xbd\x13\xeb \xbeYB\x19=\xd55\x17\xbdSZ\xc1=p\x02\xd7>=\xcf\xd3\xbdrO~\xbe%*D\xbeo\xbb\x86\xbd\x062\x1a\xbe\x00SS\xbd\x8a\xe5\x9a>\xeeNz=~\xf3_=\xcb\xc8C\xbd\xee\xf6&>\xa5R}\xbd\xfd\x1fr\xbe;h\'\xbe\xca\xbc"\xbe&\xc2\x9a\xbd\x97!U=\xef"\xd6\xbeP\x0b\x0c>q\x9a\xa5>\x06\x19\x8f>\xa7K}>\xeb\x84\x9b>\xee\xdb\x0f\xbd\xcf\x89k\xbe\xeby\x08\xbe\xf61\x00\xbd\x87\xd2\x08\xbe\xf3\xe8\xac\xbeowa\xbd\xfb\x90\xae>Uh\xd2=z\xde\xc1=\x16\x1f\x07?\xe2c\xab\xbd\x15\x98\xb6>\x9f\xcd0\xbe\xe0r\xde;N\xf1\xd0\xbe\xd0;H=\xdf\x85\x81=)C\xe5\xba<\x83\x11\xbf\xe0\x0b\x02\xbf\x99\xc0\x12>\xaaC\x01?)\x8e\x97>+vx\xbe\xa3%Z<iY\r>}QU\xbe\x98G\xd2>\xba\xb9\x06>\x96G\x96\xbey\xcc\x12\xbf~\xbf\x01\xbf\xe6\xdd\xd8\xbeE\xa7\xe8\xbd2\xbc\x0b\xbe\x16\xe4\x94=\xaf\xfe\x0c=\x95\xce\x13>&\x0e\xc1>x\xc7y>b\xb2{=\xbfU8=\xfd2\xb2>o\xa6\xbe\xbe\x19P">\xd8>\'=\n\x86\x93>\xc2\xfa\x9f\xbeN\xfd\x04?\xf2Q5\xbeFS\x8a\xbe(Ot>\x0e\xbcx\xbe\x9f37\xbe\xf0N\x81>\xdfy\xbb<\x9b\xe7\xc6>-ad>\xf7\xd6\x9f=Y\x10d\xbe\x89\xa8O\xbd\x90\xef\x88>\xab\x17\x13>^/a>\xaf\x8c\x17?\xae\xfd\x98\xbe\xc8\xdf4\xbdx\xd5\xc5>\xc6\x8dk<2^:\xbd6\xf0\xf0\xbe\xb2\xa4\xef<\x03U\xc6>uL|> W >/\x99\x8a\xbd\x90\xfd\xcf\xbe\xbe\xff\x14>\xaa\x87C\xbd\xdd\x99\x04\xbdK\xdb\x01?M\x83\x8d>\xc5\x13\x95\xbd\x9f\x11"=rSA\xbc\xbe\\\x81>\xcb_6\xbe8\x92k>\x19fA=\xa8\xd85>z\xf6\x8f=p\xafF>\xa7\x97-=[\x90\xbb<\xf9\xdd\x0b\xbe\x80m-<\x97k\x94\xbdz\xe5\x85=2\xc3\xd5\xbeKvn\xbd\x8a\x1bv\xbe\x90\xb7\x97>\xcd\xebQ>?\xac\xdf\xbef\x18\xf1>\xeb\x1c\xc0=\x16fz<\x8e.<?SNh\xbd\x92\x90\x9f\xbb\xe2\xdd\xf9=)\xed\xb2\xbd\xae\x85\x88>u\x1e0>\xa3\xb0G\xbd\xdf\x9c\xdd>U\xc6\x80\xbe\x9b\xe2R=\xc7\x01+>\x0b\xf4\xc9\xbeN\xff>\xbe\xf9\x83\xb3\xbe\xe8\xf3\x06\xbf\x9e\xfc\xa4\xbe\x95o9=[\'\'\xbb\xa2W\xd7\xbe^a\xcd>\x0e\xd0U>\x90\xf8\xf8\xbds\xa0\xaa\xbd\x88\x98\xb9\xbe\x96\xdf\xb8\xber{\xdb>\xea\xc9\x1d=\xbf\x94x>\x89\xb1\x8c\xbeF\xf7\x16\xbfQ\xb7E>\xf2\x12W>KA\x9c>\xa2z^\xbdW\xc6h\xbe\x8ed\xd5\xbd\x08C\x03?\xe5\xe21\xbc\x0b\xd0\x94>\x99\xacS=\xc1\xd4\xa8> \xce\x16\xbe\x12\xecR>\xe2v\xcf<\xfaaD>\x831\x94>[\x90\x06?\xf8\xb8\xe9>\xa6X\xf7\xbd\xe0\xf8#=}\xa6\x05>`\xa0\xfc\xbd'
-p2038
-tp2039
-bsV503975387152781312
-p2040
-g2
-(g3
-(I0
-tp2041
-g5
-tp2042
-Rp2043
-(I1
-(I200
-tp2044
-g12
-I00
-S'-GV>\x00:8\xb7j\xe3s\xbe\x00\x0f4<\xa5 \xf2=\xe5W\xa3\xbc.~\x1c\xbd\x83z\x06\xbe\x80\x05\xdf\xb9\xee\xea\x11>\xa4\xae7<\x05\xa2\xbe<:m\x8a=\'\x80\xad;\xfb\x84\xac\xbc\x82\xf37>\t\xc2V\xbd>\x10a\xbdw]\xb5\xbd\x83\x15\x97\xbc\xd2\x98\x01\xbens%\xbcB`\xba=\x81\xbd\xb3\xbd\xb2\xf7\xc5\xbc\xc8\xca6\xbd\n#\xe9=\x94s\xd7\xbd\xd7G\r\xbe0}\xe7<\x98W\x18<\x90`\x98\xbdK\xa6u=\xf7P8\xbe\xcf/\xc5<\x14\x897>6@\xfb=\xfbt\xac=&uH>\x9e\xf4E<\xb0\xd0\xa9\xbd\xfd\xe4\x1d\xbd\xf4~\xf4=%\x96\xfd\xbd\xa1\xcf\xd4\xbd@\x84\xc1\xbc\x01\xbb{>W\x0f\xe6<\x12\x08$=\xd3ow>\x81\xde\x9c<\x93\xa7z>\xc7Y\xd6\xbd\xdc\x0f\xe3;3\xda\x87\xbe\xf01\xf7=B\xdeK;`fr\xbdQC\x92\xbe\x8a\xbfy\xbe\xbd\x9a\x00>\xf4\x12\x0c>\xa2\x06!=\xca\xcf\x07\xbe\x02m\xd2\xbb9\x9e\xd7=\x19\'\x12\xbe\x8a\x814>?l\xbf\xbd\x9c\x19\x92\xbdt\x9f\x93\xbe\xd6*R\xbe\xaa\x803\xbd\x9c-\x8a\xbd\xa2\x08i\xbd\xf3\x98\xdb=<\xe1\xe1=\xbc\xe3w=|V\xc5=\xc4^\xcc=\xc0-\x85\xbc5G\t<\xb6\x944>\x06+#\xbe/\x1a\xa6=\xcd5\xfd<\xb1\xbe(>\x06\x15C\xbe2 \x94>-$\xf8<\xae\xf8\x02\xbej\x17\xdf=\xd8\x9a\x0f\xbe\xf5\x9dD<\x9drY>\x8e\xe0\x97\xbcd\x13\xe1=|:\x02>\xe3\xb0\xcb=\x0eL\x80\xbd\xc0{\xe0<\xfe\x0c\x19>\xd1~\x8b=!\xd6\xb3=t\x9ay>\xf8\xba\x10\xbek\xdeZ<!O\x99=\xf8\xbf\x12<\xc3o\xbc\xbcTl\x06\xbe\x7f\xb1\xa8=\xbe\xb9\xfd=.\x96\xe4=nu,=&\x8cK\xbb\x8b\xf58\xbe?\xe0\x08>u\xb6\xb3<\xc0\x8f\xe3<;N\x97>\x0c\xe9\xa6=:-\x8f\xbc\x82\xf2\xea\xbb(\xa9\x0c:\xc4\x8e+>>\x0fy\xbd\xab\xcfp<\x93k\xbb<\x13P\x1a=\x9d\xc9{=\xa0.y=\x98\xdc\x0c=\x06E{:\xe4`\xbc;X\x0b\x80=\xaa\xd1\xa9\xbb\x1eE\xf7<\x92\xf7d\xbd\x00O\xb6<c\xb5\xd2\xbd\x00S?>\xa0.\xed<\xa0\xc1Q\xbe\xf9\x15\x19>\x88j\x85\xbcr\x99\xb7=$\xbbW>\xed\x1a\xba\xbdP[*\xb9\xaeo\xfe\xbb\xb2N\xae\xbd$z\xe8=\xc5\xfa\xd9=D\xf7\xc5\xbb\x0b\xcdN>|I\x93\xbd\x91\xf3L=,\x06M=\xca\xe67\xbe2\xd8.<\xfe8\x03\xbe\xcb\x03h\xbe\x8b\x84\xb7\xbdv\x88K;\x82\xce"\xbd\xcb\x95n\xbe\xba\xaaN>\xaa#\x98\xbcrDv\xbd\xcbBA<\x96\x87\xd1\xbd4\xe1d\xbd\xf2s\x97>X\xbb3=\xba\xca\x00=\x06%$\xbef\x14_\xbe@\xf7:=\xe3k\xb8=\xfb\x19#>\x0f\xf7\x94<\xa4\xf7\xd5\xbd\xe0\xb1i\xbd\xc39->~\xf2J\xbc^\x8d\r>\xba4\x06=\x88\xd5 >!\x17\xbd\xbd\xe2\x9a\xc0=\xf5\x877=\x0cX\xd9=\xcf\xc4\xad=6\xdd\x81>\xf6!R><\xc3\xf4<hd\t=\xd7\xed\x03=?z_='
-p2045
-tp2046
-bsV503976852827148288
-p2047
-g2
-(g3
-(I0
-tp2048
-g5
-tp2049
-Rp2050
-(I1
-(I200
-tp2051
-g12
-I00
-S'\x9e\x1e\xfe>\x82\xfa\xe4=y\xe6\xf7\xbe\xec\xbb[<w\xb63>\x0b\xd3\x0b<X\x80\x93\xbd\x90\x93q\xbe\x99K\x9c=dm\xac>\x12\xf2\xc3\xbd\xfe\xaa\xab\xbd\xaeQt=g\xcf\x85\xbdkW\xa9=\xd5l\xd2>\x97\xfa\xe3\xbd\xbd\r\x1c\xbe<8r\xbe\x87*\r\xbe)\x86+\xbe\x06\x82)\xbb\x90\xaev>29\xad=N\x14:=\xfe\xc4\xe2\xbd\x8c\xebK>\xc9Js\xbdx\xa1\x8c\xbev\x92C\xbe\x85\xfc\xbc\xbd\xd6\x8c\x0b\xbd\xe0E\x9c\xbaw\xdd\xf2\xbe3M\x89=v\xa8\x9b>\xcfw\x96>\x89\xfdm>|\xb6\xb0>\x9c.\xad\xbds}\x85\xbenl\xc6\xbd\x82\xf6&=\xae\x07\xfa\xbd\xf0)\x92\xbeN\xaf\xf0\xbdW\'\xf3>\x83\xac\xbf=E\x95\t>\x13\xa6\x13?\xba!\xba\xbc\x9e\x1e\xf8>7(p\xbewo\xc9=\x1b\r\xec\xbe\x9c\xa0/>\xe8/\xa4=\x94\x8a\xcb\xbd\xa9\xab\x0c\xbf\xb5A\x03\xbfe\xe5f>g3\xfe>$;\x93>^\xc8F\xbe\x92\xc3\xab=[\x9c\xc0=\x0ch\xb1\xbe\x8e%\xef>\x8f\x06\xc5=\xc2Cm\xbemD\x03\xbf\xc4\xb6\xf2\xbe9\x7f\x86\xbe\x8c4\xd4\xbd+\xcd\x19\xbev\x1e\x11=A\xf9\x8c=L7\x04>*\xbe\x99>\xa2\xaae>D\xb7\xe7<]\x11\'=(\xa2\xd9>\x98\x0f\xa1\xbe\\N\xee=rVf=V\x14\x93>\x9c5\xa7\xbe"\t\t?\x8dR\xcd\xbd\x1f\xff\xb8\xbem\x9cM>\x83\x10\x94\xbe\x19p\r\xbe\x92\x99\xad>`\x87\x14\xbc\xf0\xc1\x97>\xaf\x16Z>l88>]~R\xbe=\xf7\x06\xbd\x84\x9d{>SyI>\x94/y>5)\xf4>\x05\x06\x8a\xbe\xe23v<\x1cj\xb9>vcO<j\xcf\x9f\xbd\xd9t\xf4\xbe\xb8\x97C\xbd\xa4\x89\xb0>o\x92A>\xb13\x0f>"\x01\x82\xbd\xdd\xba\xd6\xbew\xeb6>\x8d\xcd\xde\xbc\x1b.z\xbd_\x14\x08?\xc5!x>\xa1\x13>\xbdT\xfdB=\x14y\xa7<\xab\xc5\x97>y\xe4\xe4\xbd\x059\xcb=Z_\xa8=\xe2\xf7\xea=\xd4D$>t\xe9\x16>\x143\xd9<\xdfr`=at\x91\xbdu/\xe3=\xed\x17\x89;\xb5\x87e=\x93\x05\xbb\xbe\xe4s|\xbd\x9f!\x95\xbe\x9a\xaa\x94>\x1c\xabP>\xfbE\xef\xbe\x9c|\xb1>$\xfd\xa1=\xcf\x8f\xcc={\xcd\x1e?\xe7\x01\x18\xbe\xa1\xca"\xbc9yX;E&\xf4\xbd|\xec{>}\x0f=>t\xb6Z\xbd\xc0\x1f\xf2>\xc5\xf6\x83\xbeT\t\x0b=\xbf3(>\xa5#\xdd\xbe\xbav6\xbeko\x91\xbe\xb8#\t\xbf\xaciz\xbe\x1b\x91\xc9=\xa8+5\xbd\x82\xba\xfd\xbe\xe4\xdf\xcf>\xf0\x87\xaa=\xbc)\xb3\xbd\xdd\x9b\xad<\xf5\x00}\xbeX\x11\x88\xbe\x0bP\x04?\xfeU\xa8=\x16gF>\xdbw\x94\xbeto\x12\xbf\xa6\xcfP>\x95\x841>\xb2\x05\xb4>6%\x8e<\xa8\xdf\x90\xbeA\xb3-\xbe\xfe\x0f\xce>m\xf1I\xbc\xb1\xc9\x8a>\xf2\xe9\xf8=gN\x96>Rs7\xbd\x00Jq>\xec\xa9\x08=\xe9\x01t>\xf7\x14\xf3=\x17k\x18?\x92\xa9\xc1>\xce\x02\x0e\xbd\xf4l\xd4<)\xe7\x07> \x1b[\xbd'
-p2052
-tp2053
-bsV503974918350856192
-p2054
-g2
-(g3
-(I0
-tp2055
-g5
-tp2056
-Rp2057
-(I1
-(I200
-tp2058
-g12
-I00
-S'Z\xde\x94>\xa9?\x87<Y\xdb\x93\xbe\xaaa \xbdO\xac5>\x17\x98\x0f\xbd^W\xa5<\x80)\x16\xbe4\xb70\xbd\xb7q\x01>LT\x9b<9\xa0;\xbc\xbf\xfa\x1a>H2+<\xdfY\x9e\xbd\xfaGs>\xcc\xc3@\xbd\xf7\xdc5\xbdu\x01\x00\xbeQ\x0c\xab\xbbO:\'\xbeW\xebN=\xd1s\xcd=\x83v\xdb\xbd\xa4\xcd\xe4<\xe9%\xd0\xbd*\xdb\x01>y(\xe2\xbd\x0f\x026\xbeZ\xae\xb7;&\x82\x9a\xbch\xde\x1a\xbd\xd1/\x84=\xcc\x8e_\xbe\xf3d\x91<\xf4U\x03>\xe7\xfa\xea=w`\xfb=\xc0\x98a>\xda\xf5>\xbcZk\x92\xbd\xa9;R\xbb\xff\x18\x1a>\x84FW\xbeF\x88\xc5\xbd\x87\xfaY\xbdm\x85}>$m\x9a;\xc6\xb8X=\x90\xeb\x9b>\x00\xb8\x1e=\xcct\xaf>a\t\x1b\xbe\xe4\xd7\x97=q7\x8c\xbe\x13p\xf8=\xce+\x15=\x98\xbd\x92\xbdZ\'\xa3\xbe\xd1\xda\x8f\xbe4.?>\xe4X >\n\x8d^=W\x96\xe8\xbd\xa4]\x9e\xbb\xca\x1e\xdc=\xbb\x1c!\xbe&\x90J>\x16o\xcf\xbd\x87\xbf\xe1\xbdO\x9e\xb0\xbe\xaa\xeaA\xbed\x90\xf4\xbbh\xba\x95\xbd\xfc\x9b\xc0\xbd?\x01\xd3=\x8a\xfc\xd0==P\x85=\xc9m\xbc=\xe34\x1c>\x96Ew\xbd\x9d\x99\xf5\xbc\xcd\xefl>\xa91\x0f\xbe\x9a\xe2\x8a=1\x01\xba=4TZ>\xf9\x81R\xbe7J\xae>\x0ea\x83\xbc\xb9&\'\xbeG^\xac=l%]\xbeaN\x17\xbd\xc6-P>3\xe8\xb0=?"\xea=2\xf98>\xc6\x8a\x94=\xea\xad\x90\xbd9F\x81=\xe9B>>q!\x00>Y$\xf6=\xe0q\x7f>\xc9\xb5\x00\xbe\xdd\xdc\x05=e\xdf\x05>+=\x9f<\xc1M\xbf<\xba%\x14\xbe\'5\xf9=\xcf_\t>p\xa7\x88=\x1c\xb2\x03\xbd\xd9\xc0\xf1\xbc\x1cZf\xbe\xa6\xdfH>0\x91\xfa<a\xc5\x90=\x9a\x0c\xb7>\xfd\x91_=\xa7\xde&\xbdT\x8cX=t[98\xf4,;><\xb2\xc9\xbd\xd3\t\xe1\xba+\xb96=\xc0 H=\xb6t{=\xf1\xa7]=\nr\x8c=J$^<!\xdd\x8c=\xc3Cp=\x17BK\xbc\x16\xba\x84\xbc1T\xf5\xbb\x0f>\x1a=\x183\x11\xbe\x19\x89A>\x96%A=\x19\xb9x\xbe\x0c\xcfL>/\xfe\xd2<\xfe\x82\x00>*\xbe_>\xaa\x1f\xbf\xbd\xf1\xb9\x8e\xbc\x96\x8e\x87\xbc\xb3k\xae\xbd&\x0f@>\xd1\x14\x06>q\x9d\xc9<(\xae\x83>\xe7\xc8\x9b\xbdl\x1e\xb8=@\xfa\x8e=\x19WC\xbe\x83\xdb\xae<\xbf\xdc\x10\xbe\xf7Tn\xbe66\x13\xbe\xe4\r<=_\xd9\xa2\xbdf\xd1\x94\xbe\xdf4(>\x84nq\xbc\xec\x8fe\xbd\\\xa2\x17=c0\xdd\xbd\xa1\xca\xdd\xbch\x1a\xaf>\xf6\x00x=\x16-\xcb<#UX\xbe&\x9a\xa0\xbe\xa7\xac\xe4<*\xfe\xd2=\xccvI>T\x17\x97\xbbQ\xfc\n\xbeJ\xe7V\xbddOD>\x84\xf6\x86\xbc\x04\x9b\x01>"\x9b9=T\xed$>\xc0\xa4\x9e\xbd[\xa0$>\x97r\x8f<\xdc\x8d\xe4=\xbe\xea\xb3=Zp\xaf>Q+<>\xf1w\xb3<a\xa0\xe2<\x9a7==\xc9\x87\xe1='
-p2059
-tp2060
-bsV503977236655910913
-p2061
-g2
-(g3
-(I0
-tp2062
-g5
-tp2063
-Rp2064
-(I1
-(I200
-tp2065
-g12
-I00
-S'\xe7\x01A?\x8cDi>\x87\x915\xbf[\xf24\xbe\xde\xe9B>\xdf\xa4\x04<\x88\xe88\xbd\x16\xc7\xb0\xbe[\xa3\x8a\xbd\x1a\x85\xd2>gN\x13\xbeN\x81\x8b\xbe\'\xd7s>\xa4\xa2S\xbe\xcb\xeaU<JF\xf0>\xf3\xaf\x0e\xbe\xef\xbb\xac\xbeZ\xd8\x8f\xbe\\H\x04\xbd\xb7\x0f\xb0\xbe&\xfc\x8c=\xd5%\x95>t\x91\xe3="[\xb4=\xf1\x931\xbe\xc6\'\x88>\x80\xc6\xc8\xb9p\x8f\xf0\xbe\xf6\xeb\x8c\xbe\x8c\x0e\xa0\xbd\rX\x90;\xbe\r\xc5\xbc*j\x0e\xbf\x7f\xb7\x96=\xbf@\xb0>Rs\xb4>"\xf8\x93>\xc8]\xeb>\x01\xee7\xbd\xaa\x86\x93\xbe\xba\xc4b\xbd8t\xd0;F$\x91\xbe\xd6h\xae\xbeX\x10\x17\xbe\\2\x15?L\xe9\xa2=\xed:\x03>\x84*F?\xfe\xa6\xfe\xbc\xae`\x18?\x97\xf0\xbb\xbe)\xd6\x82=\xb3F\t\xbfU_;>\x8a\x0e`>\xcc\xc9\x89=t\xfcG\xbfn\xf1\x1d\xbfG\xdf\xcf>\xf7\xe2:?\xd8\xb8\xb5>\xd1\x8cx\xbeC"\x1c\xbd=\x8fl>,D\x92\xbe\xa2\xe9!?w\x16\xbb<\x83\x1b\x95\xbe\xf9\x8f,\xbf\\\xbe$\xbf\xcc\xdd\xbd\xbe\xc7\x90\xaf\xbd\\\xcc\x9b\xbe\xc9R\x15\xbdH\x15\x1f=:\xfa|>\xe8\xf0\xc6>\xd8\x07\x86>\xa2\x8b\x07=\xa6H\xda;\x07\xd9\x17?&)\xc7\xbe\xa8\x05\x13>\xd4\xb7K>\xce\xa5\x8c><u\xb2\xber\xd0\x16?\x85Pc\xbe\xf5\xc2\xdc\xbe\x04d\x91>-n\xc4\xbe"\xd9\x86\xbe\xe6/\x88>\x1a\xf2\x9b=b,\xc5>\x9cb\xa7>Y\'\xa9=\xf0\xe4\\\xbe5\x84\x96\xbd\xce \x97>\xaet\x92>\xf5\xfa\x90>\xd8\x12\x08?\x94V\xcf\xbe\xec\xfb\x1e=\xe7\x8f\x14?\xaa~\x1f<b\x1a`\xbd0t+\xbf\tj\x9f<\xac\x0c\xeb>\x99\xe4\x95>\xe9\xd2\'>GT7\xbe\x92\x11\x07\xbf=-\x98>\x9b\xf6\x01\xbe\x0c\xcc\xa3=\x86\xbc%?*\x9f\x99>aU7\xbe7\xce >\xe18\xe8\xbc\xa7/\xbd>\x8c\xbd\x8b\xbegz\x14><\x7f\'<\x9cU\xcf=x\xcc*>\xf4\xd0\x8a>r\xfe\x0b=\x86\xaa\xcb=\xeer\x18\xbe`\xbf\x92=\x0bC\xc3\xbd\xa8Sg\xbd\x1aQ\xd6\xbeH\xd7\xe5\xbbn\x82\xb9\xbe\xca\x1f\x88>A{\x7f>\xba\xd1!\xbf\xda\x83\x13?"Wa>\xb4\xd6V>C4e?)\xdc7\xbez)\xec\xbd\xf4\xea\x03<5\x9aM\xbe\xac\xb4\x00?8\x0c\xad>\xf0S\xd3\xbd\xfaF\x16?\xa5\x9a\x82\xbe\x14\x0f\xb1=\x16\xb1!>X\x0b\x0f\xbf\xed\xeb\x81\xbe\x0f>\xb9\xbeu\xf4"\xbf2\xd8\xf7\xbe?\xac3>"ME\xbe\xdc\xd84\xbf\xd6\x9c\xc8>\xfb\xc1\x8e>T\xedg<T\xb9O\xbc\x02c\xb3\xbe\x87p\xb7\xbe|\xca0?\x1bw\xb1=\x8a\xdb]>`5\xf4\xbe\n\xf7d\xbf\x1f\x1d\xd5=\x02?{>a\x91\xd4>\x18\x96\xd8\xbdTD\xc8\xbe"\xfe\xc6\xbe\xab\xc8\x11?\x91\xf4\xc9\xbd\xdb\xf5\xb5>lu\x91=j\xfa\xef>\xbbI\xfe\xbc1\xbch>T\x16\xb7\xbc;N\xa9>\xe2@\x84>\xd1vF?\xce\xa4\x0c?\x12\xe5\xf0\xbd{\x0e$=\x99{V>\x19\x19\x08\xbd'
-p2066
-tp2067
-bsV503971165736402944
-p2068
-g2
-(g3
-(I0
-tp2069
-g5
-tp2070
-Rp2071
-(I1
-(I200
-tp2072
-g12
-I00
-S'Ps\'>!\xfe\xc6\xbd*\x0ce\xbe\xf5\xc9\xd9<\xbc\x82\x15>\xfd\xa9b\xbc\x05\xa6\x81\xbd>\x10\xf2\xbd\xf3/9<oa\x18>t\xd5$=XZ\x17=\x85\x16\x7f=\xf5\x81\xfb:\xeb\xddK\xbd\xad\n?>\r\xc3*\xbd\xfb\xa3\xbf\xbcv\x83\xc9\xbdp$=\xbc\\\xc2\x11\xbe\xb0\x88\xe5\xbc\t\n\x0c=~<\xfb\xbd\xc9\x05\xb6\xbd\xad|O\xbd\xa4_\x0f>\r\xa0\t\xbeD\xf54\xbeqy\x03=\x15r\x16\xbd\xd9\xf1\xaf\xbd[)\x91=\xf9\x92D\xbee\xfb\xcf:\xd1\x13c>I\x08\x15>\xbf\xab/= \xa0N>I\xe1M=9n\xd1\xbd\x1dK\xf6\xbc\xcaD\x04>\xa6<\xda\xbd\xc5q\xe1\xbd]\xab\x14\xbd\xbf.\x99>jbS=\xa8\x9ae=\x02\xf5d>\xdd\x05\x86=Gt\x83>s\x08\xe1\xbdC\xac\xef\xbc\x90\xbb\x8d\xbe\xcaw6>\x976_\xbcp\xd6\xd4\xbd\x1d\\\x81\xbeb\xc2{\xbe\x05\xa4\xec=\xa0w\xe0=\xb0\x96\xa6<\x1d\xc8\x0f\xbe\r\xf0\x04=\x81^\x16>4(\x1f\xbe\xe0C\x19>\xc1\xc2L\xbe\xf9\xa8\xa6\xbd\xd1\xa8\x87\xbe\xeeQE\xbe\xeb\xc7J<\x11\xe6\x97\xbdI\xb6\x85\xbdQk\t>L\xc5Q>?\x97\xb2=\xd9\x96m=&Y\xee=\xbb\xccn\xbc\xa0\xc1\x0b=\x9e\x1a@>\xb9\xf9%\xbeN\x18Q=g\xc7\xfb\xbbWi\xda=\xabwi\xbe\x02\xf3\xa8>(\xa0\xac=\xad\x84\x0b\xbeA\x01\x02>8\xcd\xf1\xbd9\x9ao=\xbbo\x8b>\xec#\x8d\xbd\x85\xbb\xdd=\xc3C\xcd=K\xba">\x96\x9a\xca\xbb\xd4\x04\xbc<Rr">W\xa5\x97=\xe8\xde\xe0=\x81)Z>|\x15H\xbe\x90\x9a\x0e=;\xbe\xe6<\xd852=V\xc0\x84\xbc\x9d\xfd\xc4\xbd9\xd1\x85=\xbc\x91k=\x84\x83\xe6=\\\n^=J\xbc\xb7=\xab\x89d\xbe\xebH\x17>\xb7\x93 <\xac_\x94<)\x84\x96>\x0f;\xb9=\x02!\x8a;q\x05R\xbd\xe80\x01\xbcJoa>\xc6\xfb\xcc\xbd\xa4Ns\xbd\xd8#%:\n\x1c\x07=\x9e@\xb6<\xef\x01\xb2=u\x95\xaf=\xac~5\xbc\x0b\x7f\x97;.v\xf1=Y\xf8\x8f\xbc\x12VC=J\xd8\xdb\xbc\x16\xa5&=r\xbb\xe8\xbd\x13ZV>\r\x12\xa7\xbc\x13\xef[\xbe\x07\xff\xcd=M){\xbd\xbf\xf3\xfb=\xc6\x86j>\x89v\x12\xbe\x14\xfd\r=\xf4\xefQ\xbd1\x99\xb2\xbd_\xd9\xb7=\x90\xd1\xf1=P\xcf6;2\xda`>P\x9e\x88\xbd\xe2\x11\xa5=_\x8ei=\x89{&\xbe7\xa93=P\xc9\xa6\xbd\x1c\xb6o\xbe\xf4\xbd\xd2\xbd0\xc4\xa5\xbc\xea\xe64\xbd/\x8b\x90\xbe[\x99h>T\x1f\xeb\xbd\xed\xff*\xbd\xc8\x01\xfc<\xb0"\xbd\xbd\xfe\xe08<\xac\xde\xa6>6\xf5\xac=/\xc3\xbe<\xf91\n\xbe\xfb\x08#\xbe\xe6\xeb,=49\xf1=KjT>I\xf2\x8f=OW\xb6\xbd\xb8y\x11\xbd\xbe\xd4U>\xcc\xca\x15\xbd\x9e\xdc>>\x17\x8f_=0\x94\x10>\xd0n\x85\xbd\xf3\x1e\xb3=\xe5\xd6m=\x10X\xbb=j_\xd7<\x086m>\xe8\x17<>\xd2\xe3\xde=m\xddW=l\xb2K=\xbdE\x84<'
-p2073
-tp2074
-bsV503971079518289920
-p2075
-g2
-(g3
-(I0
-tp2076
-g5
-tp2077
-Rp2078
-(I1
-(I200
-tp2079
-g12
-I00
-S'#H\x0c?\xecu*>\\\xf2\x1d\xbf\x9c\x08\xae\xbd\x05L<>\xa7\x1a\t\xb9\x00\xd3\xb0\xbc;\x85\xa0\xbeLk\xee\xbb^\xae\x85>m)\x0c\xbe\xf1\x18G\xbe0\xa70>g\xa0\xcd\xbd\x8d\xc7W\xbcC\'\xce>\xf0\x91\xc7\xbd_\x13<\xbe\xe7V\x8a\xbe\nc\xa7\xbd\x1b\xcc^\xbeI\x87\x8a\xbbEH\x97>\x1d\xee\xa8=C\x17\xdf=8\x0e#\xbeK\x16w>\x03\xff\x8f;\x97\xec\x9e\xbei\x08p\xbe\xfc\xbc\xe1\xbda\xf1\xce\xbc\xac\xe8?\xbc=\xab\x0c\xbf\xc0>f\xbb \xbf\x99>-1\x8d>\x07\x9e\x96>yn\xaf>\xb0\x9fs\xbd|\x1b\x8a\xbeH\x87\xeb\xbc\x81&\xce\xbc\xe4\x83@\xbe\xfb\xa8\x9f\xber\xa0%\xbe\x04*\xe2>\x84\x10\x8b="\xc4\t>\x90\xd3$?%4\x14<\xc4\xbd\xf3>\x15\xef\x87\xbe|\xd2\xd5=o\xfb\xb0\xbeI\xfa!>\xd1F(>3\xd7\x81\xbdX\x8c\xfd\xbe\xb3\xf7\x0f\xbf_c\x9e>)\xe0\x0b?/\x17\x85>\xdb\x8fg\xbeG\xd1\xa4=\x11A\x04>\x97\x9c\xa2\xbe\xb1\x99\xdf>\xd9\x87|=V\x13\x89\xbe\xdf\xdb\x11\xbf\xd0\xcf\x01\xbf\x15\x01\x8d\xbe\xac\xdb\xde\xbd}\x9f\x87\xbeY\x91K\xbd\xfd\xce?=$\x98\x01>H\xeb\xb7>f\xc2\x80>\xa7\x99\xb7:m\x1e\xd9=\xdb5\xf3>\xfb\xd2\x83\xbe\xe0\xd0\xb2=l\xb70>\'\x18f>U\x82\xc2\xbe\xd9\xa4\x0b?\xbf\xb6s\xbep\x9f\xe7\xbeO\xb6L><\x1d\xaa\xbe5eH\xbe\xac\x10{>@w\x05>s\xe9\xa2>\x00\xbdc>]u\xee=\xe9\xed=\xbe\x9e\x95\xa0\xbd_J\x87>DAV>\xd8l\xa5>\x8bN\xd1>A\x1a\xb0\xbe\x1f\xce\xb4<i\xff\xf0>\x08\xc6A=a\xa3+<\xfa\xbc\x01\xbf\xf4b\xe9\xbc\x07\xc6\xca>\xa4\xf0L>\xa1\xb4\xe9=\x95F\x14\xbe\xb9}\xf7\xbe\x852\x89>\xfc}\xee\xbd\xdd\xcc\xdd\xbc\x91m\x10?\xa7Mj>e\xd8\xe3\xbd2N\x06>\'?Q\xbd\xd5\xfd\x92>\xd8FW\xbe7\x85\xac=\xd3c\x8a=Q\x1a\x08>\\\xc3N>\xe9\x12\x83>\xa7>A=P\xa2\xd6=\xeb\xf4\xe2\xbd\xd8d3>\xd6\n\x8f\xbd\xf4GR\xbc\x88u\xc7\xbe\x991Z<m\\\xae\xbe\xa6\x96\x95>+\x11!>\xfd\xd4\x0f\xbf}\xe0\xd2>\xb7\xe2\x8f=\xef\xe0\x1e>O\x1a@?\xc7<\xf2\xbd\xf5=\x9e\xbd\xa8\x1f7=\xa5\xd1\x07\xbe\xd0N\xd1>\xa2\xea\x87>c}\x0c\xbd\xe4\x18\x0b?\xa4\xe7\x90\xbeY\xff\x80=s\xbc1> G\xd5\xbe\x9c;O\xbe\x18\\\xaa\xbe\x02\xc3\x13\xbf\xb7?\xc3\xbe\xbcd3>\x1c\xda\xe7\xbd\xeb\xb1#\xbf\xf5S\xae>\xb5#K>\xa4>\x8b<Q\xf2C=R}\xa7\xbe\x17T\x99\xbe\x8bC\xfd>L\xfd*=\xac\x06F>\x1f\x9e\xb1\xbe\xbc\xbb5\xbf4RD>)\x19=>8\xdb\xd5>\x1a\x9b\x8f\xbd\xacv\x9e\xbe\xbcce\xbek\x7f\xe6>uX\xfb\xbc\x1f\xad\xbc>\xe9\xdd\xf0=[\xa1\xc2>\x0c[\xed\xbc\x82\xfd\x84>\x84\x1f\xb3<6\xeb\x9b>^\xaa\x02>\xf4b*?\x9cU\xca>S\xd3\xaf\xbd\x10e+<\xc0G\xff=\x01\x1d\x7f\xbd'
-p2080
-tp2081
-bsV504262468181303296
-p2082
-g2
-(g3
-(I0
-tp2083
-g5
-tp2084
-Rp2085
-(I1
-(I200
-tp2086
-g12
-I00
-S'.\xc0\xad>\x8a\xae\xe1;ZX\xb6\xbe-\xc1g\xbdA\xf4b>\x11\x17#\xbd\x0fVj=\xc5\x8d \xbe7T\xa3\xbdn\xdb\x14>C\xae\x9c<\x1e\x81\x1f\xbd\xb9\xf5U>\xc2,\xb6:>\xa7\xf3\xbd[\xb5\x8b>\x86\xf1\x16\xbdH\xedt\xbd\x18\x19!\xbeN\xbb\xbf<jGj\xbe\xd5\'\xa4=\xa8\xf2\xd1=\xae0\x05\xbe\x88E\x18=W\x9d\x17\xbe\xbe<\x1f>)\xc2\xf0\xbdu\x97g\xbe3\xb7|\xbc\xd0\xc9\x1a\xbd~p!\xbc0m\xb0=,\xa2\x8f\xbe&\xd85\xbc\xe9o\x01>6\xf9\xe1=\x10?(>\xa6\xdf\x84>\xbe\xac\x19\xbd\xabN\xb0\xbd0 2=\xcf/<>:m\x90\xbe_\xc6\xd1\xbd ,\xa9\xbd\x9a\x0c\x8d>\xa2*\x84;I\xee\x92=\x18i\xb9>\xef\x17@=\xeah\xe3>m\xadA\xbe\xf3q\xe8=\xdfv\xa2\xbe\xa1n\x19>\xb5~J=\x0f\xe0\xf1\xbdp\xc7\xbb\xbe"\xb8\xa5\xbe\xd9\x83]>\xc7|\x18>\x0b\xc64=\xa5<\xff\xbd9.\xcc<Z\x05\x0c>U\xce9\xbe\x97\x19W>\xbd\x1b)\xbe\x9d3\x15\xbe\xbd\xc6\xcc\xbeM U\xbe\x8eI\xfd<\xf5\xa3z\xbd\x7f\xa2\x05\xbe\x19g\xef=\xd1=\x1e>#\x97\x9b=)>\xe8=H\xd9Q>\xf9l\xb5\xbdFo\xfe\xbc\t\xfc\x92>\xaf02\xbe\xa7}f=\xb1\xf7\xef=\xf1\x17x>\xc5H\x8b\xbeV\x02\xd4>\x8aW\x14\xbd\xd6jL\xbex2\xc0=\x91\xdd\x82\xbe^ih\xbdq\x8bp>\xfae\x17>\xb9f\x02>5\x8d_>\xf0\xe5\xa6=?\x92\xb2\xbdhv\xc9=k\x10p>\x18\xe9\'>\x15C\x16>\xaa\x08\x8b>\r\x10 \xbe\xc6V\x05=\x8a,\x1d>\xc5k\xdc<\xcbin=\x83\xd4 \xbe\xf5\x14\'>\xb2)\x0c>z\x89k=\x8c{\x84\xbd\xb5\xcc\xdd\xbci\xff\x94\xbe\x1c\xf8\x84>N\x15\x9c<\xa9\xf0\xbe=\xfa\xe8\xde>Zk\xfd<X\x06~\xbd\xb1\x14\x8f=\xa9\x82%;\'\x87p>\x97<\x18\xbe\xcf\xfd\xa2\xbcG\xcd*=\x0b\xda5=8\xeef=\xf1\xa8t=\x7f1\xc3=\x03\x0f\x04=\rq\xcd=\xca5\xc3=\xcf/\x11\xbd\xe3\x9d\x85\xbc\xc1j\xf3<z\x9f\x91=)/,\xbe\x0f\xdbo>\r\x17\x9e<p\x00\x97\xbe1\x96t>\xca(0=\xaeK\x1d>\x0e\x19\x87>\x12\r\xd8\xbd\x1dF\xc1\xbc\xf2\xa4\n\xbd\x9b\x8c\xd1\xbd>U{>@\xd9*>A)<=BN\xb0>\xae\xcb\xb8\xbd\xf8\x94\xf8=pU\xc0=\xcd\xe5k\xbe\x86\xe14=\xb2\xe8\'\xbe\xe2\xca\x92\xbe\xbe\x87c\xbe\xf2\x0e\x93=?\xd8\x02\xbe{\x8a\xbf\xbe?\x88(>2\xce\xbc\xbc\xa1\x8f8\xbdx\xf66=\xaf\x16\x04\xbe\x01\xa6a;\xbaX\xd8>\xc31\x94=S\xb4\x81<[N\x8c\xbe\x1bn\xc7\xbe\xb1r<<\x8f \xf7=\x85\x94\x87>E\x19v\xbb\xc2\xce+\xbeK\xb88\xbd\xca\xefp>Nh\xf0\xbc>y\x15>\xc9/v=@f@>\xc5\xa3~\xbd\xd8+I>\xb3\x90Q<\xbbW\xfd=\xd6\x80\xc0=C\x95\xd2>\x0e\x05P>\x18\xc4\x1d=\x05!\xa9<\x01\xa5q=\x01y\x03>'
-p2087
-tp2088
-bsV504225445164752896
-p2089
-g2
-(g3
-(I0
-tp2090
-g5
-tp2091
-Rp2092
-(I1
-(I200
-tp2093
-g12
-I00
-S'\xbc\xa5\x0c?R\xe5\xbe\xbd\x87\xb8e\xbf\x04\xc7\x8e=9\xe0\x01?;\x842\xben4\x0b>g\xd7\xa8\xbeN\x0f\xf5;o\x12\x81=G\x95\xfb<*x;>*W\xc3>\xd7"\x1a>\xb4@\x90\xbe\xfc\x9c\xd8>\xac\x8c\x9f<z[\xb7=\xech\x8f\xbed0\x80=\x0c\x80\x9b\xbe\xcb\x1b\xef<\x06\xa7\x94>\xb9\x9f\t\xbfNl%\xbd\xce\x83\x93\xbe:\xbf\xb8>9J\x9f\xbe\x9c\x1fj\xbe\xc0X\\>\x04\x0b_=R\x8dz\xbe\'\xefP>\xf2\x1d\x1c\xbfW\xe4S\xbe\xb5\x90\xe1>U\x9d\xab=\xf4\xf6\xce>DG\x0b?\x9eP{<\xf4\xfc=\xbe \xfc\x07>\xfaz\xc6>\xc5\x03\x0c\xbfiH\xb7\xbek#~\xbe\xd5\\\x1f?t\xfb\xf6\xbd\x15\xbd\xba=C\xb38?i\x03t>!>[?eB\xb6\xbe\x146x>]\x03\xd9\xbe\xd8\xc2\x02?\xa9I\x90=\xb0N\xea\xbew\xeb\x9e\xbet\xb8;\xbf\xd9\'\xda><\xefW<\x08\xadA\xbe\xaf=\xa5\xbe\xb8\xb5\x8e>\\\xd0\xa0>+\xcf\xf1\xbeI\xcd\x14>\xff\xc7\x01\xbf\x00D0\xbeP\x9fm\xbf\x88\xde\xc1\xbey\xd0\x10>)\x11\x8b\xbeZ\xda\xc4\xbe*\x0b\x91>4\x82\xb8>\xa5\x7fX=\t\rk>\xd2`\xb8>i\x9e\x89\xbe\x86\xbf7>FD\xdc>\xf9\x9e\xe3\xbdk\x12\x08>7\xde\xa6>\xa8\x91\x01?\x90^:\xbfw\x86f?\xd7\x9a\x82<\x97\xed\r\xbf\xee\xdao>\xddi$\xbf\x7f\x98\xdb=\rf\x12?\x14\xe6\xb7>\x0c\x15\x87=D\xc2\x8a>\xf2\xc6\x8a>\x95\x85\x18\xbeV\xda*> \xd6\x08?\x04\xf9A>=\xa0\xdb>r\x02\xe9>\xbe\x9b\xd5\xbe\xef\x96\x83=\xd40K>#\x17\xbd=\x9a\x1cD>\xc4\xbe\x08\xbe\x84!\x8a>\x00\x1d\xc6>`\xc5M>>\x01f\xbd<>\xfc\xbd\xdc]\'\xbf\x7fD*?\xbb\xf0\xff\xbc\xe4*c;\xa81[?\xa8\xbf9=\xf0\xa7\x0c\xbey\x04">\xc7\xc8\xd7\xbcn\xee\xd5>^\xde\x94\xbe\xb2d\t\xbe\xc7\xb0\xdd=Yzk=\x88\xf0\xc2>\xe4o\xaf>\xfa\xc9W>\xe0\xbf;=D\xddZ>\xb2\xb5\xf0>D\xb8~\xbd2.\xb5\xbb|\x12\x01>;\xf0q>\xd0\xe3\xc3\xbe\x17\xf8%?D\xaeQ\xbe=\x0fG\xbf\x03qS>3\n\xc8\xbe\x07 \xd1>\xfb\x1e\xd4>C=L\xbeq \x96\xbcIg\xef=\x0c\x96\x98\xbd\xc9\x8c\xe4>\xcf\xce\xbf>\xce\xec\x80>9\x00I?\x1ffM\xbe9\xfc]>_ha>\xbc6\x8c\xbe\xbb^_>`c\xc0\xbeBQ\x16\xbf\x98[\xc0\xbe\x0cP\xaa=Iz\x9b\xbeG\xfcv\xbf2\xc8\xdf>\xeb\xe8\x7f\xbd\xb5x\xe4:\xb5O\xab>K\xf9\x9f\xbe\x8c\x0c\x8e\xba^\x81Q?lx\xee=\xfb\xc2\x0b\xbd\x02x\xcc\xbe\xc2R+\xbfD\xebE>\xfc\x98Q>\xc7\xaa\x1e?\xc6\x89\x1e\xbd"\xccC\xbeG\xb7\xfb\xbc\xee{c>\x8e,.;\xbb\x80\x14?\xb9m\r>\x84\xe0\xda>\xe80K\xbe\x02\xc3\xfe>\xd2\xfbC>K\x0f\xfc>$#(=\xd3OC?\x9f\xe6\xbb>p\x90\xb1=\xa9\xb9\x8c=\x92s\xa6\xbd\x03\r\x9d>'
-p2094
-tp2095
-bsV504263942579822594
-p2096
-g2
-(g3
-(I0
-tp2097
-g5
-tp2098
-Rp2099
-(I1
-(I200
-tp2100
-g12
-I00
-S'\xd8\xd9\x07?8^*>H9\xfd\xbe\x15lD\xba\xbf\nH>W\xc8\x98\xbd"_\x14\xbd\xb6\xf0\xa1\xbes,U<\x87\xb0\x83>\x95kb\xbd\xcb\xbc^\xbd\x95\xb3\xc3=|\xb7\x18;D\x8b=\xbd\x98\xf9\xba>\x19\x04\xa6\xbdNY \xbe5\xeeI\xbe\x89T\xaa\xbd\x15\xf02\xbe\xdd.\x90<a7v>\xe0\x9d[\xbd\x7f\x8b*=\xe8\x15\xba\xbd\xd3\x87E>\xb5F\x02\xbe#\xea\x86\xbe9\xdb\x84\xbd\xf3\x08\xc2\xbc\xad\xdc\xac\xbd\xb8;\x85=\xb9\x19\xc6\xbec\x18e=\xa1\x90\x9f>\xd8I`>\x7fTo>\xa5\xe6\xb8>\x1a\x1e\x88\xbc\xf0\x13I\xbe\xb8T\xc7\xbd\xb9\xb3\x14>\xc8\x81x\xbe\xc1A\x83\xbe\xe3b\x8d\xbd?\x8c\xd5>\xa9t\xb0<\x87\xe3\xa6=w\xe1\x11?\xa5m\xe2\xbbd\xdc\xe0>\x05vq\xbe\xd5\xca\'=\x8b\x0c\xd7\xbe\n\xba\n>T\r\xe1=/.\x18\xbd\xedk\x13\xbf\xdf\xf5\x06\xbf_@z>\x19b\xce>\x95[F>|\xa7n\xbe\xd5\'\x84\xba\xb2B\x01>-\xa9v\xbe\xed\x16\xc2>\xd5+\xea\xbc\xe1\xf8P\xbe\xbfO\x1c\xbf(,\xdf\xbeS\xd4I\xbe\x81\x92\x1f\xbe\xa0d\x1c\xbe\x83)\xac=?\xf9(=\xaf\xfd\x02>\x7f\x87\x85>\xc7\x9eU>P\xe0\xe3\xbc%\xa7\xab<\xc3\x82\xc0>\x88\xce\x8f\xbe\xf4\'\x18>\xf3X\xc4=\xcb\xd2\xa1>\x12z\xa4\xbe\xd3\x01\x07?L\x04\xa7\xbdp\n\x90\xbeg\x15\\>\x9d\xbf\xac\xbe\x84e\x80\xbdn\x97\x9e>y\xfe\xc6=\xe37\x80>\xb0\x9c\x84>\xb0\x0e\xd8=\xda\x9a\x1d\xbe\x19\xab\xb2\xbco\xa0\x8c>\x03n\x1f>\xc3m)>\xd0\x9d\xe2>m(\x8e\xbewW\xa3<\xc2`\xa9>g\x07\xca<\x81\x1dY\xbcKj\xd3\xbe\xd8\xf2\xa4=\xad\x8e\xbe>s\xeaO>\x10v\x01>\x8b\x06\xb7\xbd\xbfN\xc7\xbe\x1a\x85\x8d>g\x15\xa5<\x1d2I<\r\xd9\x01?\xdc\xa8X>\x15:\xaa\xbd+}\xa5=pso\xbcm\x13\x88>\xd1\x91\x1f\xbe1\x9c\xf2=\x1fv\xad=\xedl\xb9=\xf0\x12\x1e> \x04!>\xf8\xf8\x18=+K_<\xcdt\x02\xbdcy\xad<i{\x10\xbdm%\x9f\xba\x08\x06}\xbe\x95\xc79\xbc \x08\x7f\xbe\xd9\xe3\x85>\xb3\xc4\x12>y\xb5\xf7\xbegI\xca>\x8d6\x85<\x94\xd5\x17>\xf3Q\x0b?\xe3\xb2\xbc\xbd\xa8\xf4\x7f\xbd1z\xab=\x19\xe9\xbb\xbd \xfe\x98>\x8cKO>\x07\x93X\xbc`\xce\xd9>[\xc0>\xbe|;\x93=Dk\xfa=\x81\x15\xac\xbe!\xf3\r\xbe\x8c\xe4\xab\xbe[I\xf3\xbe1\x95w\xbe0V\xa2=\x00\xb48\xbd\xd0\xb5\xfd\xbe\x03\xd5\xb3>\x84\x7f->\x80\x16\x93\xbd\x08=\x91<|\xdd\x86\xbe\xd4\xe8q\xbe\xc6V\x04?\'\xc8\x84=\xdbQ0>\xf0X\xa9\xbe\x13\xaa\x16\xbf=\x9f\xf8=\x9b\x81)>\x0cJ\x9a>\xc1\x85N\xbdS\xf1\x87\xbe\xff\x85(\xbe\xe8\xaa\xb4>7\xb70<\x0b\x05\x86>\xb6[\x8b=\x1a\x8e\xa6>3\x0e\xe9\xbd9\x00\x83>9\xd7]=9\x9d\x88>I\x87W>\xd5?\x0c?|\xa2\xcc>=\xee\xbe\xbd\x94#\x10=\x03F\xbd=!Q\x96='
-p2101
-tp2102
-bsV504172673216569344
-p2103
-g2
-(g3
-(I0
-tp2104
-g5
-tp2105
-Rp2106
-(I1
-(I200
-tp2107
-g12
-I00
-S'\n\x1c\x05?(\xd2\xbc=t\xee\x00\xbf\x98\xf0\xd1\xbd\x15\x83\x81>QJ\xc0\xbc\x17\xcc-\xbd\xf5T}\xbe\xef\xcf\x99=if\xa0>\xcfB\x0c\xbeY\xe6\xb1\xbd^\xf9\x82<\xbf\xaf\xed\xbd\x0e\xda_\xbd\xfa\'\xbf>\x96t\x16\xbd\x17\xc2\xe1\xbci\xe1\x91\xbe\x93\xf9\xf4\xbd\xa03i\xbeJ\xc9\x99;\xbb\x0bj>\x9afw<O\xb2\x9f=fH)\xbe\x8a\x1a\x90>rJy\xbd\xda1\xa4\xbeu\rA\xbe[r\x9a<k?_\xbc\xd20X\xbd\xb3\xbd\xed\xbe\xed\x84\'=\xc9z\x92>\xde\x9b\x84>E\x16\x87>\x9e\xab\xb5>\x97\x04\x00\xbev9\xa7\xbe\x08\xb4y\xbc\xf5N\x07>!\x96\'\xbe\xa3,<\xbe\xf2*#\xbe\x89k\xc8>\xd9B\x82=*\xc0&>\xc5j\x14?\xcb\xe7\xc2\xbc\xd6\xb3\xfb>Zf\xa4\xbe^$\xf7=\xb0\xe5\xc7\xbe\xa7\x9e(>\xdb\xc66>?\x0f\xef\xbd\xa3\x8f\x04\xbf\xa2\xfb\xf7\xbe\xa0\xaa\x97>\xfcj\x01?\xfb\xebT>#%\x15\xbe\x18\xf7\xc2=o|\xee<*\xe7\xb3\xbe\x93\x83\xe0>\x17&\xf7<q\xec?\xbe\xd3\x9a\x01\xbf\x97\xb9\xbe\xbe\x05\r\x15\xbe\xb7"\xdc\xbd!\x16f\xbek\xb06\xbd\xd8\x87\xb9=\xcb\x00\xbc=\xca\xba\x83>\xb94k>\xfb\xef\x18\xbd\x8d\xd0\x00=w\x18\xb4>\xfb\xbb`\xbe\x80Nk=\xf9<\xb3=v\xe4R>0\xe1\xac\xbeRQ\x03?\x8a\x1a\xfe\xbd\x060\xba\xbe\x9fe0>\r\x91\xa3\xbe\xaf1\r\xbe\xa2.\xa5>\xa6<\t>\x11\x12\x8f>\xe2\xebD>\xab>!>urQ\xbe\xf7\xc5\xdd\xbcE\x9cl>>\x056>\xbd\xf0q>\xa8u\x93>\xf2\x07\xa1\xbe\x16<P<\xdd@\xd5>\x8d\xbe,=\tx\xa1=\x83\x07\xe8\xbe\x907\xdb\xbd*\x89\x9c>\xd7\x95\xfa=\x7f\xea\xb6=!\xdcO\xbcu\x8e\xe4\xbeC\x98`>\rE\x9e<\xaa\x80\x1c\xbd\xfd\xcb\x02?\xb3\xa7\x1d>G\xe7c\xbd\x8f$7>[H\xbb<\xb6\xdf\x99>\xbf8E\xbe\x89\x06\x17=e]\xc9=\xd8_\xae=S\x83)>.(\xbb=\xe0x\x98=K\xfb\x81=\xce\x7fU\xbb\x96\x1a\xfa=c!\x15<s\xa8@=.}\xa3\xbe\xba\x83"=\xc6\xc4\x9d\xbe\xffVK>\x00\xd9\x07>\xc8~\xf3\xbeQ\xb8\xb5>\x85\x0fu=\xb7\xaa\'>\x98%\x1b?6\x94\x0c\xbe\xf0]\xe1\xbc\xa0\x9c\xf0\xbc\xc6F\x01\xbe!\xac\x86>>\xdd$>*@G\xbc\x85*\xe4>\xffYv\xbe)_\x1a=\xf5\xa3\xae=\xa6\x83\xa2\xbe\x05\x178\xbe^\xb8\x86\xbe\xe7]\xf5\xbe\xed1\x8a\xbe\xd1\xcbH>\x96\x1a\x82\xbd_\xe1\x05\xbf\xd3\xf8\x9f>\xef\x90\xf2=\xed\xcc(\xbc\xa9O\xfb=\tw.\xbe3\xaab\xbe=\xdc\xf3>\x8b\x80d=\xbe\x1ba>R\x1a\x8e\xbe1\xfd\x1c\xbf\xf8\x8f\x19>\xe2\xb3\x1f>=\xf9\x96>\x87\xe6?=0_\xad\xbe\xeb\xeaC\xbeHO\xbd>\xe0\xafG\xbd\x8e;\x94>\xc5\x9b\x08>\xe9^\x80>R\xe9\xd4<Y\xc5{>\xdb\x04\x82;\x15\xc6I>=\xd74<\x9a\x95\t?6\x80\x9a>\x8b\xfb\xe6\xbc\xa0Fk\xbdn\xf4\xbc=\xb0=\xda\xbb'
-p2108
-tp2109
-bsV503979114358112256
-p2110
-g2
-(g3
-(I0
-tp2111
-g5
-tp2112
-Rp2113
-(I1
-(I200
-tp2114
-g12
-I00
-S'\xf6\x1f$?\xd3f\'>\xa4\xf10\xbf\x81i\x82;\xd0\xdbI>l\xebd\xbd\x8f\xf3\xc8\xbd\x8d\x98\xa0\xbe\x12\x9d\x13>\x81Z\xa4>\xe3~>\xbeE!:\xbe\xe7i-\xbc\xf5\x16\xb6\xbd\xc5\xc6\xe7=\x85\t\xf9>\xed\xff\xd4\xbd\x94)\r\xbeH\xf3\x9a\xbe`5N\xbe\xeaL7\xbe<\x06\x81\xbd\x9b\xd2\xba>\xe2\xee">\xad0\xd8=\x1d2&\xbed\xb4\xae>y\t\x0f\xbca\xa1\xad\xbeK\xf0\xa0\xbe\xed\x909\xbe#"\x99\xbd\x98\xbe1\xbd/Y%\xbfY\xcfr=\x1b6\xe1>\xe8\xe6\x9f>\xd7L\xae>\xe0=\xee>j\x9f\n\xbe\xb4<\xf4\xbe\x8e\x82\x97\xbd\x1b\x11\x9c\xbd\xd5\xba\xb9\xbdY\xca\xdb\xbe\x9d(y\xbe\x9b\x86\x08?\xe6E >\x1d\xe9m>\x9c\x00>?\xf3\x1d/\xbdhq\x06?c0\x9c\xbe4\x1d\xe8=\xe3\x97\xd4\xbe\x9beD>3\xc7#>\x18I\xf6\xbd\rc\x1c\xbf\x92>(\xbf\xe6*\x95>\xe8~@?GU\xd8>\n\xcf\x84\xbe]8\x14>\n-O=V\xbe\xea\xbe\x1ax\x05?1\x93N>3\x89\x87\xbe\x8a:<\xbf8[ \xbf\xf7\xf9\xcc\xbe\x03\xda$\xbe\xd0\xb7\x99\xbe\x18p`\xbd\x8d\xfe\xc0<\xcfj\xf6=\x8dD\xfb>z\x84\xa8>\xc8M\x15\xbc\x1d\xa3\'>\xe9\xe9\r?\x0b?\xbe\xbeh\xe1\xfd=\xd9L\xfe=2\xa2\x9f>-\xd7\xe3\xbe\xc4}/?\xae\x06\x80\xbe\x96\x87\xfd\xbe\xac\x8b\xa0>\xef*\xd1\xbe\xb3\x1fF\xbe-\xa6\xa9>\xed\x8c\xde=\x05\xb4\xe8>\x1b\x8d^>\xe4\xb5&>:\xd8\x87\xbex\xa8\xf8\xbd\xab\xfa\xb1>\xdd\xa7|>\x11S\xc5>\xd0\xd6\x0f?\xa1S\xd6\xbe3C\xf1\xbc[\x0f ?\xdc\xba\x92=\\\xb0:\xbd\xa5\xdc)\xbf\xa8\xeb\x83\xbeq\x04\x06?M\x96v>c\xfbx>\x03\xe9\xc0\xbd\xc3`\x16\xbf,\xf1.>\xb4k\xce\xbd\x8f\xae\xfc\xbd\xf3\xf1!?\x8e\x15\xc0>\xc75\xf3\xbd\xb4\\\x0c>\xbd\xc0u\xbdCI\xad>\xacP]\xbe\xa8\xe7\x87=\x1bK@>-?\x8d>J\xa9\x90>\x18v\x8c>&+\x9e=\xfe\xc9\xb6=\xc3\xecS\xbe\xa8=&>\x04K\x13\xba\xa7\x1c\xc0;\xcc7\x18\xbf\n\x86h\xbbL\xf5\xf8\xbe\x82\xfb\x8a>T\tf>S\x060\xbf\xa3\xd9\xcf>\xcf\xf6W=\x167\xef=\x88Qc?\xbd\x05\t\xbe\xeb\xfc\xa2\xbd\xde\x17!=\xf7V\xd0\xbd{A\xce>Y\xbdk>\xcb\x9d\xb0\xbd\xf1I4?\x90\x1a\xcb\xbe\x16\xa5\xd8<\xc8VJ>j)\xd7\xbe\xd3\x06\xaa\xbe,F\xef\xbe\xbf\xba:\xbfM\xea\xb9\xbe\xb0\xb5\x15>\xd7[\xcb<4q/\xbf>\x17\xf5>\x87ia>\x9d\xff\xb2\xbc\xafh\x08=(\x94\xba\xbe~#\xe4\xbe\x0f\xd4\x06?\x95\xf4\x91=\xc7\xc1\xb4>\xdf\\\xb1\xbe\\\xdcV\xbf\xed\xeb\xa9>\x7f+A>\xf1e\xdd>\x88A\xa59\xf3O\xce\xbe\xb8\xbe\x8b\xbesy\x03?[\xfd/=\xdd\xd9\xce>\x83r+>\x14\xf4\xca>\x98\x97\xe1\xbcc&\xc7>\rT\x0f=\xa9?\xad>t\xca\xd9=\xf4\x1aO?XE\xe5>\x1cR\x9e\xbd0:N\xbcm\x8b/>@\xe8p\xbe'
-p2115
-tp2116
-bsV503966862250483713
-p2117
-g2
-(g3
-(I0
-tp2118
-g5
-tp2119
-Rp2120
-(I1
-(I200
-tp2121
-g12
-I00
-S'Y\x83\x1b?\xe5\xd2\xdf=\xfc8\xb7\xbe\xb7\x18a\xbd\x11\x06\x88>9\x0f\xde=\xa7\x87\x8e\xbd\xe18\xa0\xbe\x9b$M\xbdP\xd3\xda>\xf1\xea\x85<\xc5\xac\x05\xbe\xa5\x90\x97>H\xd5\xed=?\xef\xda\xbde\x9f\xc5>Lc\x0f\xbe\x8c\x10\xbc\xbd\x97\xf9Y\xbe\x00\xbb \xbe\x9d~\x1c\xbe\x19\x1b\x84=o\x00{>\xb4\x83\xfb\xbb\x8f\xc8\x19>\xb7\xda\xeb\xbd\xdf.\x9e=\x1f\x1aL\xbd\xe06\xac\xbe[Q\x0f\xbd\xd2O\xcf\xbc\xf8\xed\x02\xbe#\xa0\x03><\xc2\xc8\xbe\xac\xfc\xec=I\xcf3>\x1f\x05\x98>\x88\xd8\x18>,4\x8d>\xae\xbc*<\xf9\xcbF\xbd\x0ek7\xbd\xc1\xf0\x85>\x9f\xa1\x95\xbe\xc1\x03b\xbd\n\x89d\xbd"\xf9\t?p\xae\x80=\xcc\xbe)=\xfb-"?\xde\xba\x8b\xbd\xee\xf9\r?(\xceb\xbeL\x03D>\xcd\xd9\x1f\xbf7{\xe5=\xf9\xa3\xc3\xba\x14\'%<\xb7\r \xbf\xca%\xd9\xbeL0\x9e>\x98\n\x93>4\xad1>tP_\xbe\xbf \xde\xbd\x01D\x8b=\x14\xf8\xac\xbe\xba\xa3\xf7>\t"\xcb=\x05?<\xbeN4\x00\xbf\x8a;\x99\xbe\x8b\xd6\x03\xbd\x93\xc8\xbf\xbd\x82U\xf1\xbd\xa1\x15\x7f=\tr\x94\xbd\x06\x054>\x93\x1b\xf5=\xc5\n\xd9=\x0f\xffo\xbdAf\x11\xbe\xf7\xa8\x03?\xf2\x89[\xbe`\'C>\xd8\xc3d>\x7f\x14\xcb>\x968u\xbe\xb4t\xf5>\x07\x86\xc5\xbd\x17+\x80\xbe\xbdA\xe7<`\x15\xc4\xbed\x1c\x00\xbe\x80o\x88>!\xc4\xb7=\xd5\x9d+>\xeb\xa6\xa4>\xab\xc2+=\xa2\x90,\xbe\xba\xe0X=\x9b~y>\xf7vW>\xb2\xda\x02>\xf3\xea\xd2>1\xc3\xcc\xbdt\x93\xd3=V\x16\x8a>[\xe3J\xbd\x18\xdc\xa4<\xaaL\xbd\xbe\x96^\x83>\x9am\xae>\x7f\xebd=\'\xdaK\xbd4\xb2\xb4\xbd\x98\xf4\x97\xbe\x02\xda\xa2>s\x8e\x04>\x1d\xc3\xbb=\xf7\xc6\x0e?\xa0\x1f\xdb=\xdaQ\x7f\xbd\x1a/x=V\xeaG\xbd\xc2\xcdr>\xf5\xfe\xe2\xbd\xf4\x02\x01=\xb3\x89\xe1=40P=\xb2<\xf4=\x88\xdf\xac=\x9d!\x05\xbd\xbfJ\xcc=\xdb\xdb\x0b>"\x13\xab\xbc-\x91\x0c=:\xd8\xb1\xbd\xf8\xd2\x08\xbe\x0f\xc4n\xbc,\x92Q\xbe0\x03\xfc=\x7f\xd6n>\x9a8\xa6\xbe\x92\x82\xc0>\x0e\x16\xd5=\xc4\x7f\n>0\x92\x94>\xa7\xf5)\xbe\x9cM,\xbdrF.=W\xadR\xbed\x94\x99>\x98\x1c*>=\xe4l\xbdm.x>\xfb]\xcf\xbdo\xfd\xde=\xf4\xdax<\xee\xd9\xcd\xbe\x97\xd1\xdd\xbd$!\x9c\xbe\xde\xe2\xea\xbe+8f\xbd6\x0cc>c=Z\xbd\x8c\\\xc1\xbe\x9d\xba\xaa>\xc2\x01\xc5\xb9\xa4\x8cA\xbe\x03\xda\x9f\xbc\xbc&6\xbe\xbadt\xbd\t\xe1\x0e?_\xd2\x8a<T|\x86=Rk\xc2\xbe\x18\x9f\x0c\xbf\xb8\x81#=6\xc36>\xe4n\x9e>\x87_\x86\xbb\'\x97t\xbe\x8f\x13;\xbe\xa2\xfa\x81>\xce\x90"\xbc\x17\x19\xf2=r\xd3\xab=9\x85\x83>\xfc\x97\xb8\xbd\xde\xf1\x8f>H\xf9\x03\xbd:"@>\xf2)\xbd=\x03\x83.?-\xbe\x8e>\xae\n\xc9\xbc?\xe4\xfa=\xc2C*>gW\xae>'
-p2122
-tp2123
-bsV503975559031169024
-p2124
-g2
-(g3
-(I0
-tp2125
-g5
-tp2126
-Rp2127
-(I1
-(I200
-tp2128
-g12
-I00
-S'\x12M\xf8>\xa7\xaa\xc3<\xca\xd6\x07\xbf\xb7J\xb4\xbd!\xf8\x82>\x1b\xe9\xca\xbd\x8a\x9a?=\x10rQ\xbe;Q =\x06B\x1b>\xe1\x80`\xbc\x11UT=\xeb\xba>>$\x84i\xbd\xca\\\xee\xbc\xaf\x9b\xb5>\xfb\xd4\x03\xbd\x9en$\xbd\x1a\xc7N\xbe\x16(K\xbb\xa0k\x8a\xbe\x00\xbf\xdd=\xae\x9f8>7$\xfb\xbd\xe3\xf1\x17=>\xe28\xbe%\x81d>\x81\x1c\x0c\xbe0\x1f|\xbe[\xa7,\xbd\xcf\xe0\xe4=\xd6;C<,\x14[\xbb\xba\'\xad\xbe\x0b,\xbe<q\'\x1d>$\x812>ep\x7f>\xfe\xdd\xaf>\x02;\x12\xbe\xbc\xf7Y\xbe?i\x95<$p\x10>\xd9p\x8a\xbe\xac4(\xbe<\x91\x0b\xbe\xcbf\xbf>E\x8dG\xbd\xce8\xb5=tr\xeb>\xe2\x1c\x8f=\xcf\xe3\x04?\xcf\xa0\x94\xbez\xa7\x1c>k\xdf\xa3\xbe\xa4\xbd\\>\xcd\x18\x16>\x9f\x1d\x0f\xbe\xa1\x00\xd7\xbe\x9e\x03\xd5\xbe\xf9N\x96>v4\xb3>\xa9\x86\xc5=,\xa8\xf2\xbdlZ\x8f=\xeax\xde=\xd8\x89\x83\xbe\x1a\x8c\xc6>\x82\xe1\xdd\xbd\\\x12\xcd\xbd\xbfb\x03\xbfE\xc9\xa4\xbe\xfb\xb4\xc2\xbd\x9a\x1f\x89\xbd\xbcV0\xbe,d\xc7=\xf1\x14\xd4=3\xfc\x85=\xb3!\x18>yqv>g\xbb\xa0\xbd\x1d\xc7\x9c<\t?\x86>\xb7\rF\xbez\x7f7=l\x876>>\xde\x9e>\xd7\xa2\x84\xbe\n\xae\xfc>W\x7fp\xbd\xfc\x9f\xa4\xbe\xc9\xa7N>1\x05\xb6\xbe\\\xaa\xc3\xbd\xb6x\x95>\xab\x7f)>\xbf\xe1U>\x99|u>\x9e\x81\xf7=\xba\xab\x16\xbe\xb4\\\x96=\x91\xf9r>\xde\xb1E>%\xefa>\xde\x96\xa6>\xe7\x16K\xbe\xf53\x14=\xbc7\x98>\xb1\xb3\xba7U\'\xa4<\x99S\x9a\xbeu\xf4\x84=E<e>5\x9c\x99=u\x91\xc1\xbc\xebS\xab\xbd\xa2\x90\xbc\xbeT\xdfd>\x94\r\xd4\xba@\x87\xc2=\xa4B\x03?R6\t>\x91^\x9f\xbd\xf2\x847>\xab\xa0\xd2=\xc6(\xa0>`\xe0)\xbe\x86\x81\xd6<OJ\xc2<\xfe\xc8K=%\rP>\xa87\x06>\x92\xc9n=\xdb\xc13=\x19\x8c\xa9=\xe1\x18\x15>\xeb,F=\x01\x8a\x00<\xec,\xf1\xbdQ\x9d\xe9<\xb7\xca\x85\xbeAc\x84>\xef;\xa0=Nu\xde\xbeL\xc3\x8d>\xd0\x98\xdf<\xce\xe1I>\xa1\x14\xc8>\x19S\r\xbe+;B\xbd\x84)\xda;[8\x9f\xbd\xea.}>\xfe\xae\x0c>\x02Z\t=&\x9b\xda>\xe1\xb1\x15\xbe\x96\x97\xbc=k\xe0\xd6=\x87\xf5\x91\xbe\x0b\xb3H\xbc\xeck9\xbe\x84\x0e\xac\xbe\xea\xfcg\xbee?\xd3=\xd1\xf2\t\xbe\xf5\xdd\xea\xbe\x8e\xc2\x82>\xae?i=\xf1.Y\xbdZ\xc9\xe4=>u\r\xbe|\xae\x0c\xbe\x0b_\x07?e\x92\x9c=\xab\xe2\xa1=r\x87\x89\xbe,\xef\x0f\xbf\xbcT\x00>_\x8e\x1c>\xe7\xc2\x8b>W\xc9\xc4\xbc\x84Jy\xbe\xa46\xfc\xbd\xab\x80\x85>{\x1e\xfd\xbc\xb7\xc5\x92>^\xae\xa1=\xb4\xcd~>\xabl\x02\xbd" W>*D,=\xdb\x8e6>\x0c\xa2\xc8=q\xe4\x04?F\x19\x89>J\x8c*\xbc\xca\xbd\xde\xbc\xac\xd3\r<:H~='
-p2129
-tp2130
-bsV503974616805543937
-p2131
-g2
-(g3
-(I0
-tp2132
-g5
-tp2133
-Rp2134
-(I1
-(I200
-tp2135
-g12
-I00
-S'\x97.$>\xd1$\xba;\x81 8\xbe(\x0f\xc2;Z|\xaf=\x82\xeb-\xbc\xf3\xcd\xf2\xbc*/\xc8\xbd\x03|\x1a;r\xba\xe7=\xa6\x11\x81;\xcd\x9dd<\x19EF=\xd2\x0c\xba:\xcbhH\xbc\\\xa4\x07>\xeaz(\xbd\xb6\xeb/\xbdo\xda\x8c\xbd\xba\xb8\x9a\xbc\x10[\xc1\xbd\xf0 \xc6\xbb5\xde\x8e=\xceD`\xbd-\x93k\xbc\xa6\xb0\x0b\xbd\xc5\x15\xb3=\xa2\x8c\x97\xbd(|\xd4\xbd\x98aM<P\x8e\n<\xdb\x0cd\xbdM\x9b.=\xd7\x0e\r\xbe\x1e^\x99<\x8f6\n>\x12\xf7\xbf=n\xe5\x85=3\xb6\x18>sS\xd4;\x0eL\x88\xbd6\xcd\xdc\xbcr\xb9\xb4=\xaf\x83\xb6\xbd\x1e\x9e\x9e\xbdn\x14\x97\xbcne=>\xe6=\xbb<\xc7\x92\x06=\xfa\x81?>\x86{J<\x9d\xf7<>\x80y\xa7\xbd\xde)\xec;\xb3\x88L\xbe\n\x92\xb4=BY\x86;\xf6\xcd,\xbd\xa2\xf5_\xbeN\xd5;\xbe\xfa2\xc7=\xb0G\xe6=\x9a\xe9\x14=\xe2\xfe\xcd\xbd\xddLX\xbb\x027\x98=\xfdi\xe6\xbd\x9d\xb8\x0c>\r\xd6\x80\xbd\xc30`\xbd\xfb\xb8Z\xbe{\x11 \xbe\xa3U\x10\xbd\xa3#R\xbd"\xa26\xbdL\x9b\x98=g\x1c\x9e=\xb7\xbf9=\xea\x19\x9c=\xe2\xbd\x93=\xfc>;\xbcU\x12\xaa; \xa1\x0b>v\xc4\xf7\xbdJ\x89x=\xce\xae\xba<*\x95\xfb=\x9a\x93\x11\xbe\xdb\xa7\\>\xf7(\x9a<\x1d\xc9\xc8\xbd\xa2K\xa5=nc\xda\xbd\xfdD\xcd;!J#>\xd2^m\xbc\x8d\x84\xa5=\x13v\xc1=\xe8C\x9c=\xe0\x1dI\xbd;Z\x8e<\xfb#\xe1=`\x98X=[\xf5\x88=,X9>\xa3\xa4\xde\xbdo\xce\x19<\xe0\xf2\x81=F\xdb\xb4;\xd26\x98\xbc\xb0}\xe0\xbd\xf8{^=1\x90\xcb=\xd4\x9d\xad=\xc5B\x13=\xa1H\x88\xbb\xed\x82\r\xbe\xe0\xd5\xca=2\x00q<\xc2\x01\x91<\x98ec>\x82F\x80=\x02\xf6{\xbcV4R\xbb\x1b\x96\x08\xba\x95\xf6\xfe=\xc7\xc1:\xbde\xe7Q<\xd2\xe2\x97<\xbb}\xe0<5\xe6N=\x18\xde4=\x13\x1b\xb7<\xa5P?9\xd5\x92\xa9:v{6=\x13\xe6M\xbb\x0e4\xb0<\xc9D?\xbdv\xc8\x85<*\x1d\xa0\xbdb\xb6\n>=1\xcf<i\xcc \xbe\x03\x0b\xec=\x0b\xfa\xfb\xbb\xff7\x88=N\x87\'>\x1e\x96\x8c\xbd\xfa\x8f\xf6\xbaK\xc6\xcd\xbbJO\x84\xbd7\xa0\xaf=\x82g\xa3=\x8ai\x01\xbc9%\x1d>\xd8\x04j\xbd6\xe0\x10=Z\x8a\x1e=\x0e\x1c\x0c\xbe\xbe\xea\x9c9;\x04\xcb\xbd\x9a\xa9/\xbe\xdd\xca\x8e\xbd\xf5\xed\xdd;\x13\x8d\xf0\xbc\xd3M3\xbe\xa7\xd9\x1b>\xd5h\x1d\xbc\xf8|/\xbd\x8c\xdb\x19<\x066\x98\xbd\x7f}>\xbd\xe6\xa6c>&\x84\xfb<\xd3\x85\xea<Cn\xf9\xbd%G.\xbe%#\x14=\x15=\x84=\xee\xc6\xf3=F?i<\xb2\xe3\xa9\xbd\x05\xa2E\xbd*O\x02>\x89G\x1b\xbc\xad`\xce=\xb6\x8e\xc1<0[\xf1=\x16\x86\x87\xbd\xbc\x14\x8e=VX\x03=\xd2!\xac=Fex=\xab\x0bG>\xde\xde\x1e>J[\x94<E\\\xb2<\xf6\x9b\xc9<\xeaJ#='
-p2136
-tp2137
-bsV504239496381341696
-p2138
-g2
-(g3
-(I0
-tp2139
-g5
-tp2140
-Rp2141
-(I1
-(I200
-tp2142
-g12
-I00
-S'\xee\xde8?\x17iL>\x90]\x0c\xbf\r\x1e\x1b\xbe\xfd\x04&>\x84\xa0\x87\xbd@\x00\xfa\xbc\xa0\x97\xcc\xbe9\x86\xd59\xb9\xa7\xc0>\xbc\xda\x10\xbe\x143O\xbe\xb8\xa7\x8b=\xe6\xb9\x04\xbe{Y\xba\xbc\xeb\xc7\xe6>*c\x05\xbeQ\x90R\xbe\x9e\x8aw\xbeh\x1c\x1a\xbe3\xff\x85\xbe\xe9\x88\x94=\xb4di>\x16\x08\xaa=\xba1\xa3=\x0c\x1d\xd2\xbd\xeaT\x9e>\xa9\xce\xf3\xbd\xf2\xe7\xdb\xbe\x14\x16\x86\xbeav\xb4\xbd\x84\xf9\xfe\xbc\xdd>\x1a\xbd\xee\x02\x02\xbf\xff\x0f\x02>\xccm\xbb>D\xca\xb9>\xe2m~>\x91Z\xe3>\xf5\xb5\x1a\xbc\xfb/\xa0\xbe$\xa4\x1d\xbe\xcc\x10\x1b=\xab3q\xbe\xc3\xec\xa6\xbe\xf4\x08\xea\xbd\xb8\xe0\xd4>\x01\xcd\xa2=\x14\x11\xef=2+5?\xb5\x95\x80\xbd\\n\xe6>\xc9\xdd\xb2\xbe\xc4\x9f\xf2<\xd9W\xec\xbeiH\xfa=e\xd4w>\\\xd9%=W\x9fC\xbf\xb2\xb7!\xbf#\xdd\xbe>\xd7\x07:?\xf7`\xc3>\xd2\xfd`\xbe7g^\xbd\xf6\x08">(zZ\xbe\xc6\xb1\x17?\x82\x08\x04>\xdeu\xa1\xbe\x8c\xbb#\xbf\xe6\xcf\x0b\xbf\xfd\xfc\xb2\xbe\\\x0cC\xbe\xb47e\xbe\xd54E\xbdU\x13\x969\x1a\xfe]>\x07\xc0\xb3><\x9c\x8d>\x9c\x90-=y\xa1b<\xc7`\xf5>\x84\x9d\xa8\xbe\xfc\xa6\x03>\x0cU\x88=\xb7\xedq>\x93\x8b\x86\xbe\xdf\xb4\x14?\xc7F1\xbe\x97\xfd\xab\xbe\xe4\xa2\x81>\xb2h\xb0\xbe\x9c?f\xbeD\xc8\xaf>\xd9\x83\xb7=\x02\x8a\xe1>\x1a\xf4\x93>U\xd6\xaa=\x1cb0\xbe\xbe\xd0\xff\xbdxw\x98>\xd9\x85f>\x00\xdei>l7\x05?\xcc1\xbd\xbes\x0b\xdd<e\xa7\x07?\x8c\xc9r==\t\x88\xbdPM \xbfL\xa3\x95\xbd\x19\x1a\xb1>\xf5\x1fx>\x04,L>!\xeeb\xbd\xf4\x82\xf6\xbe\x1e\x84l>K\t\r<\xde \r=j\x96\x05?c\'\xb6>?\x04\x96\xbdd\xab#>\xcdm\'\xbd\xf0\xf5\xb9>n\xber\xbe\xa3r*>A\xab\x94=`\xa4>>T\xa1\xfe=\x0e\xccF>\xe4\xae\xc8=z\x89\xdd<\xd0~\x05\xbe\xf0b\xdb\xbc"\xb0\x88\xbd\x0bPF\xbdUM\xda\xbe\xfb\xac4\xbd\xbc\xaf\xba\xbe\x1b)`> /\x8d>\xb6\x98\x18\xbf\xec\x85\x14?\x85oR>\x04Gf>2\xcaU?k\x14\x0c\xbe`U\xb9\xbdr\x02\'\xbd\xb8y1\xbe\xe4\xc2\xd1>\x1e<o>W\xdf\x9a\xbd`O\xfd>2M\x85\xbe(\xa9\x0f>\x8a|\xc9=\xf4\xac\xce\xbe}\xa1\x98\xbe\xde\xd3\xb2\xbe\x8dG\x1e\xbf\xdaU\xba\xbe~]\xf8=,j\x0f\xbd8!\x1f\xbfV\xc1\xb3>T\xd7\x91>w\x9d\xf8\xbc\xa21\x0e=\xb8\xb3\xb9\xbezE\xcb\xbe\x90W\x0e?\x9eH\x0f>d\xd7\x8e>\xc1\x8e\xcf\xbe\xe5@M\xbf3\x15\x07>:\x00S>\xf8\x01\x90>\xa5\xfe%\xbd\xf2\xd5\xd7\xbe\xcc\x1b\xa4\xbe\xc4\x10\x0f?t-"\xbd\xe5f\x9f>5\x11\xed=\x84:\xbc>O\x1d\xc1\xbd\xc9]x>\xbf\xb5\x07\xbbE\xac\x7f>\x1bDc>\x9b\xd12?\xe7\xc9\xfb>\xabX\xe6\xbd\xd5\x9ff\xbco\xb60>C50\xbd'
-p2143
-tp2144
-bsV503975995930836992
-p2145
-g2
-(g3
-(I0
-tp2146
-g5
-tp2147
-Rp2148
-(I1
-(I200
-tp2149
-g12
-I00
-S"\xd8\x1c\xe7>m\xcb\x89<F\xa7\x02\xbf\xbd\xf9\x0c\xbdHL\x80>\xce@\x88\xbd\xb5\xdc\x00=\xa4\xc0 \xbe\xd9\x15H=\x02\x9dI>\x01\xb1\xa2\xbc\xba\xeb\xd5<l\x1d+>G \x92\xbd\xa6\x92\x08\xbc>]\xb3>\x18BH\xbd\xbd\xaa\x8b\xbd\x0c\x11I\xbe\xd7\xd5\x9e\xbc \xd6\x81\xbeLH\xcc=\xf1\xa5#>(z\xd2\xbdi\x87\x1c=\xba\x0f;\xbeE\x02d>\xa2\x04\xc6\xbd\x984\x7f\xbeEL\x98\xbd]\xeaR=8e\xfa<tiV<\xc4]\xc2\xbe+vO<\xd4(7>\x97yB>Q:u>_\x99\xb8>\x17\t%\xbeL\xfby\xbe\xdc\x8b\n=\xcb]3>\x08\x06j\xbe~*H\xbe\xc8h\x0b\xbe>5\xcd>\xe1\xe6\x9e;\x1a\x01\xdd=K\x8f\xf2>\xeb\xaf\xa5=\x83\xfd\x0c?F\x8d\x92\xbe\xa6w\x14>\xc2\xea\xc6\xbe\xf8U^>`P\xb9=\xbd+'\xbeP\xf9\xdf\xbe\xa4\xbb\xd3\xbe\x1d\xce\x81>ik\xad>\xf0\xbf\x12>\x11<\xe6\xbd\x1fJ\xf3=\xa0\x99\xdc=\xcaE\x97\xbe\x8d7\xc9>\x8d\xcb\xc0\xbd\x93P\xf9\xbdZ\xe9\xfe\xbe\xb0\xf7\xac\xbel\xe9\x8e\xbd\xcb\xaf\x83\xbd\t\xf3#\xbek\x91\x04>\x1a\x1d\x05>$H|=t\x9f.>\xa6\x04t>\xf1\xa9\x90\xbdp\xdc$;\xab\x00\x9d>\xe0\xeaj\xbe\xc1\xea\xb6<\xb3\x92\x03>\r\x00\xa4>\t \x96\xbe\x07-\xff>\xa9\x05+\xbd:\xad\x9b\xbe\x7fbE>2\xb1\xa6\xbe\x0c\xe3\xdf\xbd\x084\x9e>?\xff\xf5=\x1fg=>B\xd1p>\x83\xac.>\xa5\x07\x18\xbe\xeab\xb3=n\x9ce>,(I>\xb8\x0bf>^8\xaf>\xea}k\xbe\x95\xbb\xea<^\xfd\x90>\xfdH(\xbc>\xf6\x8a<\x196\xa6\xbe2\x05E=\x06^\x7f>\xfc\x81\xd5=#\xcd7<\x81\xbe\x8d\xbd\xba\x9a\xca\xbe\xf8}t>F$\xe4\xba|\xe7P=\xec'\x05?0\xf6\xf8=`j\xc6\xbd\xf3@\xfe=\xca\x13\xbf=CR\xa0>\xaa\xcb'\xbe^r\x13<\n\xfc\xfc<L8\x0b=\xf0\xb5A>\x8bM\xf3=\x0ev\x86=\x91W5=Fn\x90=^\xf1\r>\xdc\nD=\xd6\xa2\x19=\xd7\x9b\x04\xbeT\x7fS<\xb5\xbc}\xbe\xe6\xc3\x92>\xda\xd0\xaa=\xb7L\xdf\xbe\x03\xa5\x87>\xc0\x1e$=\xaax1>w\xfa\xd3>\x98\xba\x10\xbe\xa8\xfb7\xbcf\x80\xc1;\xfa\x00\xb0\xbd4\x9fa>0\xc9'>\\\xaf\x10=T`\xee>H\x8f8\xbe\x13>\xc6=}\x00\x0b>\x9f\x1e\xad\xbe\xe3\x89\xf6\xbc\xc0|]\xbe_\xfb\xc5\xbed!{\xben\xd6\xc6=g\x05\x13\xbe\xb5\xfa\xf4\xbe\x04\xc8\x8f>\xa7\xea\x12<H7\x99\xbd\xc1\x1a\xa7=R\x11\x0f\xbey\x9c\xcd\xbd\xb2v\x10?\xf7<\x98=\xfbr\xda=.\x1a~\xbez\x12\x0b\xbf\xe8\x11\x01>\x02\xfb\x1a>\xdb\xaa\x95>\xa03\x8a<Ikm\xbe\xa3%\xda\xbd\x0c\xd1\x94>\x082\x18\xbd\x15\x96\x84>\xb0\r\xbb=\xae\x8bt>\xdd\x11\xb0\xbc\xe8\x06]>\xf3~\x83=\x9b\xbc=>\x06\xdd\x95=\x83/\x0b?p\xb2\x87>\x10uD;LS\xa1\xbc\xd5\xef\x11=\x12\x9a%="
-p2150
-tp2151
-bsV503960186126876672
-p2152
-g2
-(g3
-(I0
-tp2153
-g5
-tp2154
-Rp2155
-(I1
-(I200
-tp2156
-g12
-I00
-S'\xdc\xb0(?RS\x91>![&\xbfW\xcc\x13\xbe\x1d!D>\x1e\x17\xa8;\x14\x08"\xbd\x8br\xa5\xbe\x99\x0e\x82=\xf1{\xa0>m\xef\x04\xbe\x1e\xef\x1e\xbeC\xc1\xc7=-\xbd\x0e\xbe\x19\x02\xee=\x19\xdc\x01?\x9b\x01!\xbe\xbc\x92\x81\xbe\x90\xd6\xa5\xbeOw\t\xbe\xd3VU\xbe\xa4#\xcd:\'\x82\xd3>WU\x86>\xff\xc0\x0e>4Q*\xbea\xa1M>\x82\x15#\xbdg\xe9\x91\xbe\x0f\xc5\xa1\xbe\xca\xb1D<&/\xf6\xbb\xb0|\xfd\xbdXW\x04\xbfp\x1f\xea=Lg\x8a>\xa4\x05\xb6>g\xa4\xa7>\x01\xd1\x9e>\x83\xb2\xff\xbd\x8a|\x93\xbe\xec\xd0\xff\xbdo6\xbd\xbd\xf0\n\x03\xbe\xddM\x9c\xbe\x89S\xfe\xbd\xe4\x10\xe7>\xda)f\xbc|(\x00>Eq6?}\xb1^\xbd\xd3\x1b\xf1>\x94\xf0\xa0\xbeA\xc6\x1a>\xca\xd7\xc3\xbe\xb3y\xce=\x04$M>\x91\xec\x8a<x\xb4\x12\xbf!w\x19\xbf9"\xab>\x17\xc6J?\xfe\x7f\xa0>\xc7#g\xbetA6=\xc1aA=\xef\xdb\xab\xbe\x84\x8d&?\xaf\xd6[>W\xaf\x91\xbeiS\t\xbf\x9b\n\x13\xbf&)\xed\xbe\xeb\xb6\xb4\xbdM\xd4t\xbe\x99f\xbd\xbd\x00\xb9x\xbd\x8f\xb4\xac=\x87\x8b\xb8>ZCy>\xef\x16\x83=\x1d\x15c=\xaaB\xdd>J\x08\x9d\xbe\xb5\x86\x1a>\xec[S>SA\x9e>?V\x91\xbet\x0b\x13?\xaa1y\xbe\xfem\x03\xbf\x13\x90\x80>\xbc\x95\xb3\xbe\xa1Wy\xbe\xd5n\x82>\x97\xdd\\==4\xc6>\x8f\x92\x88>\x1f_\xb4=\x95v\x8b\xbe7B!\xbe96@>\xff\x10G>\\\xc2\x9c>D\xb2\xfe>\x97\xa6\x9a\xbem\x17y=\x91\xfe\x19? +\xa1\xbc\x17/\xae\xbd\xd9\x12*\xbf\x0c\xa8\xb4\xbdv\xb2\xf4>\xf2\x1b\x15>\xa6P\xe1=@\xe7L\xbe\xb6\x13\xef\xbe<\xb2\x08>\x1d\x97\xd1\xbd\x10f\xd5\xbc\x1e\x1b ?CZ\x8a>Pt\xce\xbd\xe6\xfc=>\x0c\x99\x88=6`\x94>\xdc\x8f\x00\xbes\xaaq>-\xbd\x80=\xed\xd2\x84=\x0f\xd8x>\x0c\xd8K>,\xd7\x1b\xbd\x84^\xea<\x97\xad\x06\xbe\xa1/\n>h\x80\x07<%q4=\xff\x99\r\xbf\xf0\x07\x93\xbdXL\x9c\xbe,-o>\xbf\x1a\x89>X\xd1\x05\xbf\x96\xf0\n?\xf92G>\x9fg\xa9=\x91\x9fS?\xac\x90\xd3\xbd\x12Y\x1f\xbd\xd9\xd3\xbd=\xe0\xbc\xf4\xbd\x7f\x8a\xa3>,\xfa\x15>\x19\xde\x93\xbd!n\xec>\xc3\x80\xa2\xbe\xb03\x8e\xbc_~3>Z)\xf2\xbe\xfc\xe9\x90\xbe\x86\x18u\xbe\x946\xef\xbe_H\xc1\xbev\xa6:>|E\x7f\xbd|\xd5\t\xbf\xa9\xbc\xc8>L,\x8b>\t+\x89\xbd47\x8a=$z\x87\xbeJ\x8b\xec\xbe\xc6\xcc\x04?p\xcd+=|d\x7f>l5\x98\xbe\xc6GC\xbfOq\x91>?_n>FZ\xca>\xf4\x7f\x02\xbe\x13s\xb3\xbe\xc0D\x91\xbe\xc4\x98\xf3>\x04\xa4\x91\xbd\x16(\xbf>o*\x9c=v\xab\xa0>\x9e\x82\xa7\xbcT\x97N>\x7fi\x97\xbc\x1f<\x94>\xef\xe0.>\xe3\xee(?\xa3\x96\xf4>\xb4\xa7Z\xbe\x95\xfd\x02\xbddL\xa4=DP\x94\xbd'
-p2157
-tp2158
-bsV503965050462150656
-p2159
-g2
-(g3
-(I0
-tp2160
-g5
-tp2161
-Rp2162
-(I1
-(I200
-tp2163
-g12
-I00
-S' \x9d\x13>(\x12+;\x01\x87\x1a\xbe\x88\x07\xd49\xfc\x99\xb5=\x1c\xae\x9b\xbc+P\x82\xbc\x01\x7f\xce\xbd\xca\xc1\xe4\xbc\xf8\xda\xb2=\x98\xd8\x10;\xd6\x0c\x10\xbc\x193\x81=\x0b\x90R<l\x96\xec\xbcK\x9b\x0e>m\x8a\n\xbd\x01+\x1f\xbd*\x05\x86\xbd\xd6\xc92\xbc\xa0\xa8\xb2\xbd\xf6\xaa\xdc\xbb\xd8{k=rwj\xbd\xec8s\xb9\x92*\x0e\xbd\xce~\x97=\xf1r\x97\xbd6C\xd7\xbd{\x1e\x15<\x9d\x85\x01\xbdQ\xc2\x1b\xbd\xe5\xf3Y=UT\x0b\xbe\xf4\xb5\xd2<\xfd\\\xe0=S\xa7\xaa=\xb0y\x82=\xfa\xa4\xef=\x99\x11H<\xe0\xd1B\xbd\x9fi\xfb\xbc\xc6D\x94=\xcfd\xc8\xbd\xa6<\x89\xbdb\xb0\x8f\xbc\x88\x0b\n>G\x8a\xd0<A*\x06= \xd6 >f\x0cI\xbbf^0>\x11\xd8}\xbd\xfc8\x7f<\xc6\xa43\xbe\x0c\xc0u=\xe0\xa6\x1b:{\x06\x1f\xbdr\x1eS\xbe\xfc8-\xbe\xe7\xdd\x99=\xbe\x95\xb3=\xf2r\x1f=(@\xaf\xbdbn1\xbc\x06\x84\x96=\x18\xe7\x9e\xbd\n\r\xd7=c\x1a/\xbduX\x95\xbd\xb0\xb5H\xbe\x1e\xf1\x06\xbe\\j\x1c\xbdtQ1\xbd\xb3^\x0e\xbd\x9fY\x8a=W\x1b\x9c=\xf0\xdeN=r9\xa3=P\xd4\xaf=~Lp\xbc\xa4\x06\x06\xba\xe6\xc4\xfe=\x94\x1d\xe7\xbd0\xd3S=F\xaa}<\xbcM\xe3=n\xa6\x01\xbe\xb3\xceP> \t\x16\xbb3\xdf\xa0\xbdhZm=\xf8w\xb9\xbd$7\xbd\xbc\xc6+\x0e>\xf3\xe76<"\x16\xc0=\x98l\xbe=\xeeQD=4\x83G\xbdo\x1f\xbb< \x8d\xe5= Il="p\x85=\x0fV=>\x10/\xab\xbdw\xf2@;\xa1\xeeX=F\xcf\xa1<\x90\xe1\xba9n\xb6\xa4\xbd\x15\xde\x97=\xf2\xce\x93=\xcd\xa4\x8c=Z\xb0\x14<W(I<.\xb2\xfa\xbd\xec\x83\xc6=\xfc\xfeM<\xab,\xb1<\xe3\xb4J>^\xff^=h\x0c\x84\xbb\x0c\xf2\x02\xbb\x13-\x0c\xbc\x08r\xe4=\xd5Sd\xbd+\xd1\x9b<\x93\x0c\xa9<S\xa8W=vb8<\xcf\xcc\xf4<\xe1\xdc!=d\x800<@\x9bY<\x8fu\x03=N\xed\x8b\xbcc\t\x85<\xa4\x0c\x08\xbd\x96\xf6\x08<\x16\x1e\x9d\xbdl\xc8\t>4\xa7\xe4<\xe9\xbf\x01\xbeo6\x01>\xad\xf7\x9f;\xf9rT=<0!>\xcapF\xbd\xa8\x8d\xf3\xb9q\xed\x1e\xbc\n\xfa\x82\xbd<\x94\xc4=\x9f\xae\x99=\xf4\xd3\x00;\xc6Y\x0b>\x8fXc\xbd+\xf3==\x13\x10\x10=dS\x00\xbe\xaf_\xe0;"?\xc3\xbd\xf8\xf8,\xbe\xee\x05\x97\xbd`.\xac;\xf1%\xd3\xbcT\x90!\xbe\x92M\xf9=\x12\x9e\xf7\xba\x84\x88=\xbd\xb6\x85O\xbb\n=\xc0\xbdu\xdc/\xbd\xe0C:>\x16\r\xea<\xfe\xa1\xb6<D\xb9\xff\xbdp\xa7"\xbe\x03.\xf8<"8{=xt\xec=0\x06\x15<#w\x9f\xbd\xc7\xb5?\xbc\xdd\x85\x0e>\xfa;\xe5\xb9R\x02\xb0=p\xa6\xf3<M\x12\xd9=\xf0\xa1\x8c\xbd\xea\xc5\xa1=\xfa#\x84<\xc67E=u*\x92=\xeb\xd36>Y\x8a\x04>D\xda\xaf<\xa0\xac\x8c<I&\x03=O\xdf\x00='
-p2164
-tp2165
-bsV503965544216014848
-p2166
-g2
-(g3
-(I0
-tp2167
-g5
-tp2168
-Rp2169
-(I1
-(I200
-tp2170
-g12
-I00
-S'#\x11\x13?\x8c\xc3\x9f=\xaf\x85\x1e\xbf\xbeC\x19=\xdd5\x98>mi\x19\xbd%\xca\xc6\xbdhG\x93\xbea~l=\x8ft\xad>\xeb\xedu;\xc4\x10w\xbd\xe9`\r>\x1d\x01_\xbc \xbe\x96;u5\x00?S\xd4\xcb\xbd\x84;(\xbe\xe5\xdf\x91\xbe\xed\xe7\xcd\xbd\x1b\x18Q\xbeI\x04"=\xe4\xef}>\x03Pl\xbcl\xa1!=\x86$)\xbe\xcd\xe6o>/a\xd4\xbd\x81?\xa9\xbeI\x166\xbe[`\x13\xbes\x9eD\xbde\xbe\x8f=\xfaI\x0c\xbf%UC=q\xe4\xb3>\xc1\x7f\x94>\x81\xae\x8f>\xdb\xac\xd6>CV\xb2\xbd\xf8W\x9e\xbe\xe4\xbc\x9d\xbd\x11\'\xad=\xd8\xfcn\xbe\xb5K\xaa\xbe\x0f\xf0\x08\xbe\x8eH\x1d?8\xa5\x97=]\x82$>aN(?\xf9\xad\xcb<\x08Q ?\x9c.\x96\xbeP\xc1\xe1=4 \x0f\xbf\x0b\xf1u>+\xe3e=\xad`5\xbeA\xa9\x1b\xbf\x81\xd6\x1a\xbf\xd0L\x89>\x88~\x00?\x8b\xbd\x8d>\x9b\xf8A\xbe\xe7\x98\xcd=X\x11\r>{\x1f\xdb\xbe\x83\xe0\xf7>q\xe9^\xbd\x10\xb6\x84\xbeC\x9f)\xbf\x91\xf7\xff\xbekz\\\xbe4\x11\xe8\xbd\xbf5O\xbe#\\\xf2=\xef#\x12>uc/>V+\x8d>1\xc3\x8f>\x10\n\x99\xbc\x81\xf57=\xf1\x0b\xfe>e\xf3\xb8\xbe,\x8c\xfc=\xfc\xb3\xcf=\xabE\xbc>\xdbd\xea\xbe\xab\x8e-?BM\x93\xbd3\xef\xdc\xbepQt>lW\xcd\xbe\x08\xd8\xbe\xbd\xb3\t\xe4>\x9d~U=(\xba\x9b>\xdb\x06\x8c>\xfc-]>U\x902\xbeks\x00=\xf8\xe8\xb7>\x91\xddn>\x84\x05\x93>\x1fS\n?q\xe9\xae\xbe`iF=\xd9\xe3\xc2>O\xc6\x8c=#\x91\xa6;\xbf\x8e\x02\xbf\xdb\xef\x8b<\xe0\xd6\xc9>\xa3\x82;>\xcdI\xf1=\xa5\xee\x14\xbdM\x84\x0e\xbf\xfb\xc8\x94>\xbc\xe2)\xbd\x05\x1f*;\x1e\xf3%?\xb5"\x8c>\x0b\xa0\xc8\xbde\xdbc=9N\xab<\xab\xbd\xbe>|\xdbG\xbe\xf4\x1de=f\xcb\x86=\x1f\x07\xb5=\x7fe>>yfn>\xbb\x0b\x8c=\x85]Z=M$\xe0\xbb<\xb0/>yM\x98\xbb\xe1f\x1f=\\\xcb\xa8\xbed\xd0\x94\xbc\xa5A\xb2\xbe\xdd\xed\xb8>\xa9\xc8\x02>|W\x13\xbf#\x06\xc2>\xcf\xf6\x1f=9\xce\x1d>\'\x105?\xe3^Z\xbe,\xee\x9b<\xe3\x11\x19=`\x83\x15\xbe\xb6\xa6\xaa>\x13p\x80>\xe1_\x80\xbc=\xaf\x1b?\x9c\xc5\x8d\xbe\x1d\x07\xc5=\xad\x05Z>\x11\xb5\xec\xbe_\xe5\xd7\xbdt\x1c\xac\xbe[`\x1c\xbf\xfc\xa6\xa1\xbe\xbf\x1f\xc0=\xc8h\xc3\xbd\x14\x07#\xbf\x03\x82\x01?\x1d8\xa4<\xfb=\xd2\xbd/\xe9\xcb<\xb1\xfe\x87\xbe+cN\xbe9q4?\x15\n\xc8=7\xaab>0\x85\xaf\xbe\xeb\x8e)\xbfH\x12Z>\'\xe1d>gV\xf4>\xbf},=\x8c\xcf\x8d\xbe\xfcM\xfe\xbd\x1f2\x01?\xa0\xff\xe9\xbc\xf7\xdf\xbb>\xd7y\x02>\xe8\x8e\xae>e\xd1\xc4\xbck\x0c\xac>\xcfj\xae=\x15E\x84>\x90\xd6\x1d>E\r>?oE\xcb>\x8f\xef\x0f=\xa0\x08\xad=\xbf]8>u\xdd\x9e\xbc'
-p2171
-tp2172
-bsV503967587823538176
-p2173
-g2
-(g3
-(I0
-tp2174
-g5
-tp2175
-Rp2176
-(I1
-(I200
-tp2177
-g12
-I00
-S'Ha\x11?\xad\xfa\x92=\x19~\x11\xbf\xb3V\xd4\xbc\xf8\xff\x9c>\xbb\xb6\xaa\xbdO \x9c<v\xbc\x8a\xbef&\xbc;\xab6<>S\xbf\x1b<\xbez\xc2<\x81mP>\x93g\x1b<\x02^\xc0\xbc\x1aB\xf8>\x93\xa0l\xbd\xd2\x8f\xbf\xbd}c\x85\xbe\x9f\x1fC\xbd\x02\xc1i\xbe\xb8;\x8b=\xed7\x88>\x91O\xab\xbd\x950\x7f=/\xd4?\xbeE\xb07>\x02\x83&\xbe\x8e\x0f\x81\xbe\xa2\xe1\x9b\xbdJ\xe8$\xbc.+\x8a\xbc\xf5\xd7w=\xee\xc8\xd8\xbeH\x89\x87=\xe2:F>\xb2\x12m>\x8f<\x98>-\x18\xad>\xf2\xc3\x11\xbec\xf1f\xbev\xab\x11\xbd0\xe3\x07>\x16\xee\x95\xbe\x19\x07Q\xbe\x9cc\xf8\xbd\'\x8c\xd8>\x17\xff\xc9\xbcd\xee\xf8={k\r?J\x8f\x01=\x9f\xed\x16?\xa0\xf1\x88\xbe \x1fA>\x8c\x04\xd5\xbeYx?>\xa2\xbb\xd7=\xc3?5\xbecA\x04\xbf\x88\x05\t\xbf\xe0\xc0\x87>\x07\xb0\xc2>\xe2\x08\x18>\x86\r0\xbe\xe73\x8d=\xb2\xff\xcd=C\xfc\x9b\xbeb\xce\xdf>\xf1\x00\xee\xbcJ\x9fX\xbeC|\x1c\xbf\x92j\xbd\xbeo\x08<\xbeq\xb7\xa2\xbdc\xdf\x1f\xbep\xb9\x00>\xb8\xc3\xd1=I\xc7\xb1=9\xf8j>\xad\xfd\x97>l\x7f\xa3\xbd\x02j\xf2<R\xee\xa9>\x90\x8c\x8c\xbe\x9d\x90\xcd=\xee\xae&>4(\xce>R\xac\xb0\xbes\x1c\x1e?)\xc9\xe1\xbd\xa11\xc0\xbe+iK>\xe5\x0b\xcf\xbe\xf7\xc8\xf1\xbdmL\xb4>\xefB.>]\xbf\x91>l&\x95>Z\x84\x08>\x08\'_\xbe\xa5\xac\x81=\x00\xc4\x9c>\x83\xe0_>\xe6\xa2\x86>\xa2\xb7\xf6>\x97\x8aF\xben\xa2\x15=\x10\xaf\xad>\xf6\xc3\xc3<6\r\x11=K\xde\xb4\xbe\x9a\xb4\xe8=\xd8\xc8\x99>\xb8V\x98=Z\x97+\xbd\x0b\xd5\x87\xbd\x93?\xd9\xbeM\xba\x85>B\xaa\xb3<\x0f\x10h=bM\x1e?\xc8?2>\x06(%\xbdD\x9b\x0f>\x176\x9a=\xd0@\xae>\xa5f(\xbe\x7f\xb6\xbf=\xc7\x06g=\x8f\x98\xd7=\x99\xfd,>\xb2\x08\x10>\\e\x82=\xa8\xe0T=\x12\x85\xa7=\x91-\x12>\xa6\r\xa6<\x98\xa5\x17=\xeb[=\xbe?\x06\xea\xbc\x8a\x82\x98\xbe6|\xa8>]\xcc\t>\x8b\x8c\xf1\xbe\xb5\x05\xbb>\xdcC\xa2<\xa2J\x05>H&\x00?\x8d\x7f\x08\xbep\x17\n\xbcW~G=\x81V\xaf\xbd\xdf3\x8a>k\x94\x15>\xa4AG=/\xd8\xf7>\xc10T\xbes\x02\x8e=C\xb5*>G1\xbb\xbe\x81q\xea\xbc\xf3\x07y\xbeo\x1a\xed\xbe\x00\xe3v\xbeO!\xec=\xca\xb2\xbe\xbd\xbc2\xfc\xbe\x8a\'\xb7>\xc9\xa6L=R\xee\n\xbe\xeb$\x87=\x0b\xcdb\xbeFX<\xbe\x9c\t\x13?qj\x93=\xf8D\xe6=\xd1#\xa6\xbe\x8e\xaf\x1f\xbf\x97\x97N>xA]>7;\xc1>}A\xbf\xbc\xfa\x18z\xbe\x9a\x9a8\xbdl`\xbc>"\xbd#;\xa4\x8e\xa5>\x99\x1d\xd7=e1\x89>\xba\xb9\x82\xbd\x07\xab\x96>`G*=\x98\xab3>\xc83\x15>\xe9\x0c!?\t\x85\xa1>\xc29&\xbd\xc8\xe7z\xbc"\xb2~=\x93\x11p='
-p2178
-tp2179
-bsV503973773172023296
-p2180
-g2
-(g3
-(I0
-tp2181
-g5
-tp2182
-Rp2183
-(I1
-(I200
-tp2184
-g12
-I00
-S'i\x18b?\x98\\\x98\xbb\xb1\xfeD\xbf\x96\xaa\x1f\xbeP\x16\xbe>\xc3\xb66\xbd5\x82\xa8<!O\xd2\xbe\x85{\xc5=;\xfe\xd0>\x80\xff\x13\xbe\x8c.\x89<@\xfc\x9e>\xd2\xa7\x12\xbe\x16\x03}\xbd\xe1s\x18?v\xa3\x9e\xbd\x82F\x13\xbd\x9a\xe8\xce\xbeJ\xee\xde\xbdU\x8c\xc4\xbe\xb8\xf1\xd4=\x99@\xba>\x01\xe7\x12\xbe\x92i\x92=O\xa3\x93\xbe\x92\x17\xa1>\x92\r5\xbe\xdd\xb4\xee\xbej\xea\x1c\xbe\xff\x8d*>^\xb1\x9f<\xa5\x9c\x82\xbd\x98\xe3,\xbf\x08]\xf3<s\x11\x8b>\xc2s\xdf>zN\xc1>k\x15\x06?Woj\xbe\xabl\xad\xbe\xc9\xc3\x98;\x87P\x0e>xO\xa9\xbe0<\xa3\xbe\xca\xa7Y\xbeiq7?\x17C\x18\xbd\xc7C\xd5=U\rf?\xc1rJ=-\xe5Z?\xba\x86\x00\xbf\xbdW\x91>\x8dr\x08\xbf>\xfd\xc8>\xebF\x91>;\xda/\xbe\x92l!\xbf\xdf\xe7D\xbfI\xd7\xf7>\x9e\x13\x1b?\x8e\xa2\x7f>\xc3\xb8\x80\xben\xc4\x0c>\xc9;*>\xe5\xf9\xc7\xbe\xf8\xeb:?g\xaa\xa4;\x8d\xae\x99\xbe\x93\t1\xbf\xd8>\x14\xbf\xcd\x97`\xbe\xf2\xe0$\xbe;W\x8a\xbe\xd7\x0f%=\'\xaf\xa7=V\xed)>\xfb>\xa1>7\x84\xb8>\xc0g\x8e\xbd\xa2\xf3]=\xe5a\x01?=b\x8f\xbe\x9ad\xc2=\xd0?g>QK\xe3>\x1b\xef\xe0\xbe\xe5iN?\xaf\'C\xbe\xef\x0f\x1c\xbf[\x82\x83>\x0ew\x04\xbff7E\xbe\x8a\xe6\x00?\xbf\xae\x13>u\xe7\xda>A\xd1\xbc>\x90\xdd\x7f>\x9a\x86\x88\xbe\xa0\xe0$\xbdZG\x9e>\xc6\xa3\xa5>\x06^\xc8>\t\xe3\xed>\x00w\xad\xbe\xee\xb7\xdb=\xa7\xf0\x0b?\x81\xcc]\xbdj\x18\xd2;\x8f\x08\x1b\xbf\xd0/\xa6<\xff\x90\xc6>W\xfe\x02>v\xb6\xa1<\x1aQ\xd6\xbd\xa2i)\xbff\x86\xc0>\xcbs\xda<w\xa4\xd799\x9bI?Q\x16\xa4>\xc5.\xdc\xbd\x00+v>\x05\xa42>\x83\r\x15?\x0f\xa0\x8b\xbe\xd0\x90\x97=\xaf\xf8\x0e=\x07$\xa3<\xa1\x1f\x96>\xe9S\x85>\xc5\x17\xd5=\xb3\xdd\xc4=\x06y\x08>\x91\xb0\x9e>N\xd6\x98=\xbd"\xc7=Kx\xdc\xbe\x83x1\xbd\xbe\x80\xe9\xbe\xc9\xca\xc9>P\xda}>\x02\xf0A\xbf\xa9L\x04?\x92\x83\x15\xbc9\t\x9a>\xd7\xc4B?\x05\xa9\x87\xbe\x88\xa4P\xbdkU\xda\xbc\x85\xe1\x03\xbe\x00\xf3\xb5>7\x10S>\xeak\x99=\xaa`!?kQ\xa6\xbeP#\xf4=c\x1a\t>\xb5\xd0\r\xbfFL@\xbe\xd2\xbe\xa9\xbe\xa61B\xbf\xb9\xa1\xae\xbeq\x8ax>\xa7v\xef\xbd\xc8\x0ea\xbf;O\xff>Z\x0e\xd6=\xa0\x8c\x0e\xbe\xfajF>\x9a\x86\xac\xbe\x80\t\xa3\xbe\x9a\xe6]?\x8a\xbc\x14>\xe8>\x1f>\x96z\xc3\xbew\xa4d\xbf\xf6\x86~>~&\x92>\xe7\xc5\x00?\xfa5\x17\xbc\xfa8\xec\xbeh\xab|\xbeN\x82\xfa>~V\x90\xbdB\xb3 ?\xf9"q>.\x10\xc4>\x9f\x0b\x87<\xd78\xaa>\x7f\xf5\xab=\x01\x13\xc1>%y\xbc\xbb\xd5\xb0e?\x9b\xcb\x01?y\xbf\xc9\xbd64\x9d\xbd\x8d\xb3\x8e=\xbd\xba\xf7='
-p2185
-tp2186
-bsV503972053931016192
-p2187
-g2
-(g3
-(I0
-tp2188
-g5
-tp2189
-Rp2190
-(I1
-(I200
-tp2191
-g12
-I00
-S'\xa83_>^\x13\xad\xbd\xac\xc7\xba\xbeH\x8a\xb8\xbc\x15\x8be>\xeb\x81\xa4=;\x85\xa9\xbc{\xdf\x08\xbe<7\x99<N\x7f@>w\xe1\xa6\xbd\x900\x91\xbd@\xab\xeb=3_\x12=V\x95*\xbe\xbe\xddE>\x93\xf29\xbb+\x80\r>J\xa2u\xbe\x95\xe3\xd4\xbd8\x7f\xe2\xbd\xb6/\x86\xbdwY5>Z#\x82\xbdy\x94\xc9= \x8d8\xbe\xf3\x03p>\xfe\x17\x1e<\x06R:\xberG\xe2\xbdj\xaa\xc3\xbd\xf3\xbc\xe2\xbd:\xf9\x93=\nL\xe2\xbe\x8aU\xc6\xbd\xfbUU>\xbe\xa7\xc6=r<3>\x188\\>*\xe5S\xbd-\xfa`\xbe.\xb9\xac=\xe6\xdf\r>\x1b\xea\x1d\xbe\xb2\x03\x80\xbdMyS\xbe=?\xb2>\xf4i\x0e>\xc1\xaa!>},\xb2>X\x85\xe9<\xabN\xdc>\xc8\x8c\x1d\xbe&\xed\x19>\xe6\x03j\xbe\xd9\x804>\xdc\xf5A<\xf3\xf7j\xbe\xfd[T\xbef5\xa2\xbe\x92\xf1^>\xb5\x13\x08>\xd9\xda\x8c=2-\x07\xbex\xaa\xf8=[_\xd0;f\xa4\xe1\xbe\xab\xe6\x86=\x8bn\xd1\xbd0\x8cv\xbd\xf0\xd5\xb9\xbe4\xa90\xbe\xcb\x05)>\xd1\xb5\xb5\xbd\x83\x9cW\xbe\xc8\x1f\x15\xbd)"\x1b>Dj\x11=\xc4n+>\xfb\xd8#>\xb3\x00\xfa\xbd\x92\x8f\xb6=3\x1a\xc4>\xc8\xbc\x8e\xbd\xb8\xf3\xea<\xfd?\xed=<\x06\x1b>::\xe3\xbe\xc9r\xc8>\x1b\xc0\x00\xbe\xcd>\xad\xbe\x02\x8e\xc2\xbc"Qh\xbe{\xab\x14\xbcnRw>g\x179>\xa6\x01\x9b=\x8c^\x98=\xf6\xfb\x1e>H\xfc\xdf\xbdV\xa5\x9e=\x13\x88f>\xf6\x8a">\xa1)\x85>\x90W\x8a==\xbdt\xbeR\xa3\xd09\xa0\xd5:>\xda\x03\xd7=*\xbdX>\x16\x05B\xbe]y\x8d\xbd\xed\xaca>\xd0T\x1f=\xe8\xbc\x8a\xbc\xfb\xd2\xf7<\xb4R\xa4\xbej/w>\x04}\x16\xbd\x12\x12\x9b\xbd\x92L\xd9>\nN\xe5\xbbp\xd5\x1e\xbd\xf5\x06\xeb=\xda\xda\xf1\xbd\x9a\x844>\x80\x8f\x01\xben\xa7C\xbe6-5>\xc52\x0b>\xa0\x02@>BS\x8e=\xe4^\x9f=n\x8f\n>\xe2\xe2\x98=*\xff\x88>`^>;f(\xed\xba<\xa1\xbf\xbd]#K>\x8e\x91\x96\xbe\xdak>>\xfe\xaf\x83\xbdq\xbc\xbd\xbe;\xbbi=\x0e\x83\x13\xbe\xce\x96\x06>y\x1e\xa5>\xa2\xb4\xf9\xbd\xef\xae%\xbd\xcfX\xa3\xbd\xf7\x84\x0f\xbe\xc2\xd3\x88>\xa0\xb9B>h\xfa\xd9<\xfa\xad\xd1>Z1C\xbe\xd8+\x9d<f\x83;= \x90%\xbe\xb5\xe8d\xbc\xae}\x88\xbe\xa6\xe3\xc9\xbe,\xa7@\xbe\xa2\xedO>\x12\xb7\x86\xbd\xb5\xd4\xe3\xbe\x00\xf2l>\xf1\xa7\xbe\xbd\x9d\x96T=b?\xf2=\xcd\x9d\x96\xbd\xa6\xa0\x13=\x87\x87\xa1>\xc5\x0e\xac<\x1d\x90\x92=#\xc9Z\xbe=[\xb1\xber@\xdc=\x8d_\x1e=\xd5\x00\xa1>\x9ah\xcf=\x1f\xd22\xbe6\xde\xa4\xbc\x9a\xdaD>\xa2\x8f\xb5<\xeb\xabl>_\xb8\x05>\x10Sn>-\xb08=\xe60\x94>\xcbv_<m)9>\x9b\xff\x0e\xbe`\xbc\xee>\x16\xad\x84=c%\x07>\x84\xcd\x8d;\x82\xbe\xbd=%\xa5\\='
-p2192
-tp2193
-bsV503958135510286336
-p2194
-g2
-(g3
-(I0
-tp2195
-g5
-tp2196
-Rp2197
-(I1
-(I200
-tp2198
-g12
-I00
-S'\x90x\xbb>de\n\xbd4@\x00\xbf\xdcg\x8c;\x95\x07x>cz:\xbe\x9d\x11g\xbd\x06\x0e\x92\xbe\xf9\xd0\x98<\xe3\x07\x13>\xa1\xcc(=\x81\xcd\x16>-\x8f\xbd=\xfc8r\xbc_;\xb7\xbd\xfa\xc5\x89>;\xa3\xca\xbc9\xf4\x8f\xbc%;\xe0\xbdcf\x92=\xd7z\x9d\xbe/N\xa1;I\xdb\xc4=\x89\xe5\xc3\xbe+!\x01\xbe` a\xbdi,\x97>\x04\xe5n\xbe\x01\xd1\x8f\xbe\xb3Kg>\xb0\xc2A>\xc1i\x0b\xbe\x85*\x14=%$c\xbe\x83\x92B<\x98\x06\xb5>\xd9_\x1c>\xbe(\x15>\xa3w\xe4>\xe1\x13\x1f<9\xbd\x1b\xbet\t\xe7\xbc\x19b\x82>\xd2\xbc\x88\xbeu\xdaG\xbe\xe3\x04\x99\xbd\xe4=\xde>\x11#\xa8;Q\x1c==\x04$\xca>\xdf\xbb\x04>\x0bB\xbe>cMz\xbe\xdb\xfc\x87\xbdX+\xce\xbeh\'\x8d>\xeb\xfa\xcc=m\xd9\xb4\xbd\xd8\xe1\xe5\xbe\xd4\n\xcf\xbeo.~>\xd3\x8bT>\r\x87\xe9\xbc(\xd8\x80\xbe\xd9f\x05<\xbf?]>\xf9\x9f-\xbe\x8b=\x86>\x0b\xfc\xb1\xbeK\xe3\x87\xba\x87\xe8\x16\xbfS\\\xb8\xbe\xeb6\xa7\xbc\'#\x07\xbeg\x18\x14\xbe3\x1as>\xc2\x92\x80>\\Y\xc2=Y\xa2\xc9=X\xfe.>\x93\xd1T\xbd\xe8\xde`={\xd70>\xfc?m\xbe\xa9!\xf0=x\xf4\xf1=\x9c\x86r>\xf6\xce\x94\xbe\xc9V\xfe>\x19\x81\xd9=\xdb^J\xbe\xe8\xa9\xac>I<\x9d\xbe/\xc3\xd9=\x13q\xb4>\x00n\x80<\x11GL>\xf4vT>iA*>x"\xc4\xbc\xc1s\xc8=Qj\x92>=\x07\x7f=\xb2[\x13>3\xb3\xb2>7\xfb\xa3\xbe\x85:i\xba\x1f\xbd\xed=\xadA\xdf<\xf1\xb0\x12\xbdy\xd8\x06\xbeG\xb80>\xdd\xb8A>X\xfb\x83>\x11n\xa6=e\xa3\xa0;C\x9a\xad\xbe\xd7\x0f\x8e>tvG=Md\xee=\x88\xb0\x00?\xb8{\x10>1\xf7\x88\xbd\r\xa1\xff<-\xe2\x15=Q\r\xa3>\xe3\xc3S\xbe\xedz\x87\xbc\xab$N<\xddm+=\xb5?\x14>h\xafK>\xf8\x89\xc3=\x877\x9a\xbc\xa0\x10\x06=\xa8s\xf4=D,=\xbbK\x0b\t<\xfd\x86\xbe\xbc\xb3\xaf\xca=\\\x17@\xbeW\xef\xae>\xb4\xdc\x0e\xbde\x9d\xd9\xbe\xa4\x8fI>h\xc4\xe6\xbd\x1a\x02\x8d>/\xa2\x9d>\xc5c<\xbe\x9a~\x19\xbd\x8c\x88F=I)\xd5\xbdyX[>\xbd\x88[>\x94+>\xbc\x88m\xbd>\x95\xb6\x0b\xbda3\x12>1\xba`=-8P\xbe1#\x93=\x0bZl\xbe\x10&\xa5\xbe\xac\x10\xef\xbd5\xa0\xd1\xbc\xf0\xc3\xc2\xbdO\xb3\xf1\xbe\xb8\xf4\x91>\xf5^\x1d\xbc\xdd\xd9\xba\xbb\xd5X\x9c=P\x830\xbeb\xaf\x8d\xbdY,\x01?I\x85\x9e=\xf3SA=y\x81\x8d\xbeOF\xc9\xbe\xe8^~<\xbf\xba\x1f>\xe5\xcb?>\xa3/\xb9<\xb7\x85h\xbe\xa0z/\xbe$\xa9l>\xcf\xb8K\xbdG\x07\x9b>!XG=\x19\xae\xb3>\'DZ\xbeih\x16>_)\xee=+\xa4`>\xe9\xa2;>\x9c1\xad>\x85\x19\xc5>Y\xb1\xdf=\xfe~\x93=\xc1\x8dm\xbc\xc5\xa3\xc0='
-p2199
-tp2200
-bsV504261136179400705
-p2201
-g2
-(g3
-(I0
-tp2202
-g5
-tp2203
-Rp2204
-(I1
-(I200
-tp2205
-g12
-I00
-S"\x8c\xf1\xbc>\xe7-.<<L\xc0\xbe?\xe6\x93\xbd\x81\xa0n>0w-\xbddg\x92=\x08\\ \xbe\x88\\\xad\xbd09\x1a>\x90)\x83<\xb3z?\xbdD\xcfe>\x1a{!\xbc\t.\x01\xbeA&\x93>\x06\x91\x08\xbd\xf1r\x80\xbd\x18\x16,\xbe3Z\xe1<\x93\xd0}\xbe\x87\x05\xca=h\x98\xd9=\x8c\xa9\x06\xbe\xb9\x86==\xf7\x9e(\xbe\xeaz&>\x01m\xee\xbd\x88sv\xbeiQ\xe7\xbcKM\x05\xbd\xe4a\x96;Q\t\xa8=G2\x96\xbe\xc7<`\xbc]\xf5\xeb=\xf57\xe8=\x0755>\xc9s\x8c>\xa4\xbf\\\xbd\xd5\x9e\xbf\xbd\xc5\xc4e='\xf4D>\xc4\xe3\x99\xbe\x10\xa7\xd0\xbd\xdd(\xbd\xbd\\\xc1\x90>\x11`J\xbax\x8a\x9a=\x8f\x12\xc5>\xc1LP=\xdbD\xf3>\x1f>W\xbe\x99\r\x04>\xd3\xd7\xa5\xbe\xc2\x1a\x1e>\xc7\xc3\x84=\x1br\xf8\xbd\xeb\xc1\xc3\xbeL\x88\xaa\xbe#\xeam>\xd7\x96(>\x83ZQ=\x7f\xee\xf6\xbd\x7f\xda\xef<\xb1f\x0c>3\x08=\xbe\x98\xcfk>'\xc4-\xbe\x0e\xa4\x1e\xbe\xa9\x87\xd3\xbe\x11\x17Y\xbe{\xcd\x12=h\xf8q\xbd\xa7\xd9\x10\xbe\x98/\xea=S'\x1d>\x92\x05\x9e=\x97\x1b\xeb=\x1b\xe0_>dR\xc6\xbd\xbfo#\xbd4\x0f\x99>\xd9\x034\xbe,RI=7\x8d\x04>o!\x82>\x0cx\x8d\xbe\xc8\xb5\xdb>\xfd\xdbG\xbd\x95\x1eX\xbe\x1b:\xc5=\xb5\xdd\x8b\xbe\xbf\xf6\x8e\xbd\xe8\x03r>\xcc\xe0/>\r\xc7\x07>4\xbel>\xfe\xe7\xa1=\x90}\xc4\xbd`1\xd6=7\x99u>M\xa27>\x8d\x00\x1c>\xb2\x07\x8b>\x13*#\xbe\x07\x05\x11=\x85L2>\x81\xba\xb9<\x99[\x88=\xa4\x192\xbe\xdbr*>m\x0f\x12>s\xeeI=\xa8a\x9d\xbd\xc00\x13\xbd\xee\xf1\x9d\xbe,\x0b\x8b>\xc3@\xbb<$\xdc\xcf=\xfcB\xe8>-h\xdb<l7\x91\xbd\xc0r\xb7=\xf9TI<\xe0\xb1~>O\xbb&\xbe\xf4\xc4\xa2\xbc\x885&=2\xf3%=\xbfQ{=e\x8et=\xb9Y\xd0=f2\x0b=\x99(\xe6=\x03$\xc5=\xe7\xdb\x08\xbd\x0c\xa3\xa3\xbc\xfc\xcc\x07=\x13\xee\x94=8\t7\xbe{\xb9o>\xb4z\xd2<\xc12\xa0\xbe\xe7\x81\x82>\x85\x1ee=\x9f\x1a'>\x8b\x03\x8e>%\xf1\xdd\xbdC\xd0\xec\xbc<\xee\x11\xbd7\xa5\xd0\xbd\x91\x88\x84>\xef\x96->\x0c\xc4Y=\xb0\xc2\xba>,\xad\xc2\xbd\xab\xeb\x04>O>\xcb=\xb4\xabw\xbe8\x0b)=Tu+\xbeKF\x97\xbe\xc0\xd7v\xbe\xdc\xc6\xb2=\x16\xa8\x0e\xbe\xf5\xd2\xc9\xbeYY#>\x81\x9b\x86\xbc\xbb\xb84\xbdOuQ=\xa0\x8e\x03\xbe\xfe\xe3\xa2;A\x9a\xe4>M\xc4\xa2=\xb0K\x94<\x0f\xea\x91\xbeo\xed\xd7\xbee\x8d\x08<\x19!\x02>_\xe6\x8b>\xdb\xa8\x15\xbc\x8ct:\xbe|/V\xbd\x1c\xa9{>\x9a\x8b\x13\xbd|t\x19>-&~=G0B>\xe3>S\xbd\x81\x9fR>+\xb2\x10<\xdaY\x03>\xe04\xbb=8a\xde>\xe0\xceR>\x9cf\xf8<h\xd4X<\\\xcdx=\x08\x00\r>"
-p2206
-tp2207
-bsV503964732118667264
-p2208
-g2
-(g3
-(I0
-tp2209
-g5
-tp2210
-Rp2211
-(I1
-(I200
-tp2212
-g12
-I00
-S'\xebb\x87>\xab\xf3\xe18\xe7\xd4\x94\xbe\x91y\xa5\xbd\xdc\x9d\x19>\xdd\x08\x16\xbd@\x7f4=\xb0\xa3\xe5\xbd\xb2\xa1\x07<#\xff\xe2=\xbc\xbdR\xbd\x1f\x11\xc0<\x17\x81\xff=D\xd6\x99\xbd\x03\xf1\xa9\xbd|\xa2)>\xdb\x7f\x11\xbc\xc3\xcc;\xbc\x00\t\x06\xbe=\x7f\xcb<L\xc72\xbey^\xbd=\xdc/\x8d=>\x91\xbb\xbd\x82:\xe1<sy\r\xbe=\x03\x15>\x1eAi\xbd\xf3\xb6*\xbe\x17+ \xbd\x05\xaf\xaf=\xa4m\x86=!\x84\xb8\xbc\x8f\xb7[\xbe7\xc6z\xbcU\xe8~=\xfc\xf5\xa9=r\xfa&>>\xc0B>\x951\xd0\xbd\xb4\r\xe1\xbd\xbb7l=\xe0\x00\xed=@@,\xbe8\x12\xac\xbd\xfc\x83\x9f\xbd\xd4nA>gZ5\xbd[\xc5$=l\xae\x8c>\x1f\xf5R=\x80\xf7\xa4>\x13\xaf8\xbe\x0b\xd3\xf8=Q\x008\xbek\x9f\x1a>\xae\\\xf9=\xbfG\xc7\xbd\x878U\xbe\xf6\xf9\x80\xbe\xe0\xedG>\xba\r%>\xd2N =Y?-\xbdG\xc4Z=bh\xa2=\xcax\x08\xbe#\x8fS>d@\x94\xbd\xa8\xa3b\xbd\x89\xd2\x7f\xbe*\x8a \xbeN\x19\x18\xbc\xa41\xf4\xbc\xfe$\xe5\xbd\xb4[>=\xab\xcb\xb0=<(\x1e=\xf3\xa5\xc1=\xfa5\x02>p\x83\x88\xbd\x98O\x0e<\xe3L\x15>\xaa\x1f\xbb\xbd\x99\tj;\xc1\xa7\x9f=@\xb7\r>=\xe3"\xbe\x0b\xc6}>\x8f\x02\x94\xbcX\xaf,\xbe\x16\x93\x99=\xa3\xf06\xbe\xee\xdf\xa0\xbd^\x82->\xb8\x17\xcd=\x0b\xce\xca=\x05Z\r>\x9f\xa9\xb9=\x18k\xa9\xbd\xc4l*=\xc7,\x06>\\\xa3\xdb=\xfe\xd4\xf8=\x15\xdf\xf7=\x90\xa7\xef\xbd2\xca\xce<\x82\x81%>r\x00,<\x0c?.=\xcc\xfc\x1c\xbe\xfc\xc9\x0f=\xff\x14\xcc=\x82\x9d7=c\xb4\x93\xbc\x1bv\x0f\xbd\xa5\x11d\xbe\x80\xb0>>\xe4\xcf\x9f\xbc\xd4\xdc{=g\x06\x81>\x8e\xf6o=}y\x95\xbd4\xf2\xc9=n\xbb\x82=O\xbfA>XK\xd4\xbdy\xde\xae\xbb\x87\x11\xfd\xba\xd4\xd2\x93\xbc\x99\xb4\xc1=[\xca\x8b=\x0473=NKV=\xdf\xd3\x9d=\x05u\xd0=\x1eq\xae;@.\x9a<\xf5\xb5\xe3\xbc\xe4>\xed<;\xe9\x0c\xbe\x88  >\xee\xb6\xda<\xce\xedw\xbe=\x002>\xc4\xe1D=&\xfb\x17>\xa5"d>\xcc\xef\x90\xbd?]\x0e\xbd\x9d\xa42\xbdhG\x8e\xbde+ ><c\xed=>h\x17=\x19\x9fz>\xd4\xa4\xc0\xbdiOX=\xcf\x97\x85=\x06\xd9%\xbe\xc4\xf9\xce:t\xdf\xd6\xbdh\x9f_\xbeT\x8a.\xbeoe\x89=nk\xed\xbdVx\x9e\xbe\xcc\x80\xee=\xcd\xb3\x16=T[\xb8;?\xff\xb7=\xd0\xa9\x8a\xbdE\x16w\xbd\xcc\xeb\xa1>\xf9I\xfd<<\xea\x17=\xef\xac/\xbe\x93\x99\xa7\xbe\x1c\xde\xe2<\xaeKh=i\x0c\x1d>\x97\xf4\x0e<\r\xa5$\xbeY\xd0\x98\xbd\xf9\xd5\x13>\xdc\xb4\xc5\xbc\xa2Q\'><]\xa1=7\xd2\r>\xde\xd2l<\xd8\xa4\xd8=\xac6\xb8<\xbf\x14\xcf=\t\x1b\xda<$\x9d\x99>6u\x15>\xa4\xb9\x9c;\x88\xb5L\xbd/\xc2\x07<%\xd0j='
-p2213
-tp2214
-bsV504172303366635521
-p2215
-g2
-(g3
-(I0
-tp2216
-g5
-tp2217
-Rp2218
-(I1
-(I200
-tp2219
-g12
-I00
-S'\xcb\xc6(?\x8bV\x88\xbdP\nu\xbf\xe1\x92\xcf= \x11\xf8>R0\x9a\xbe\xd5\xc7\x1b>,?\x94\xbe\xed\\\xa1;\r\x15g=\xcfM,\xbd?\'X>1\xb4\xa9>\xc3\x98\x04=\xc7\xf4\x17\xbeiJ\xe8>I\xd1\xbc=\x05\x08\xe1\xbb\xc3\xbfe\xbe_\x00\x18>\xab\xf7\xd8\xbe/\xd1\xad=\x9b\x82C>c()\xbfGZ\xde\xbd\xdf\xe6q\xbeC\xa7\xc0>\xfdN\xaa\xbe\xbb\xb4\x98\xbeQv\x92>\xab\xc5,>\x8b>\x1c\xbe`*%>\x8d\x8f\xff\xbeH\xfb\x1f\xbe)\xcb\xca>\xa9\x93\x86=\x1b\xca\xd1>\x0eX&?\xa9\x0f\xca\xbd\xd3|Z\xbe\xfb\xdb\x1c>\x9d\x96\xdc>\xa9\x9c\x12\xbf4\xa1\xda\xbe\x03\n\x88\xbey\xe8\x19?\xd1\x94\r\xbe\xa4\xf8\xc7=\x97_:?\x82I\x82>\x17\xccf?\x7fc\xd2\xbeo\x90^>\x90\xf5\xf6\xbea\xe5\x08?\x9bg\x06>\xd0\x8f\xc1\xbe\xd0\xe7\xcf\xbe%c\'\xbf\x90v\xc3>\xc0\xf3w=\xfc>\xf9\xbd\xef\xa4\xa6\xbe\xd3\x8d\xb1>\x83\xb9\xb4>\xfd\xdd\x93\xbeL\x06\x87>\xa9\xb3\x0c\xbf\xd9\xb4\x1e\xbe\x1dN|\xbf\xfb\xb7\xf3\xbe\xec\xf4\xc7<\xa0FA\xbe\xc5\xd6\xa5\xbe\x18_\xb8>\xa3o\xd2>@\xb2\xee=\xc8\xd6o>\xe7R\xd3>\xd7\xd8T\xbe\xedL\xc1=\r\x82\x8c>\xb9f"\xbe\xb8\x9a\x80=\xaf^\x9c>\xc2\x87\x07?\xc8\x84\x17\xbf\xadVX?\x87m\xa8<\x00\xc8\xe5\xbe G\xce>\xbd\x9a#\xbf\xd5\x06\xb4<\xf0F\x02?\xe7\x9b\xc4>\xbb\xfe\xb2=Y{\x8d>\xe5\xd6l>\xf5+I\xbep\xce\x83>\xdd\xef\x02?\x9d[5>\xb8\x02\xbc>\x8f\xe5\t?\xb7\x8d\xdc\xbe\x173\x95\xbb=0x>\x1bk\x8e;\x97\xb0\x14>\\\x0b9\xbe>\xe8\xa5>\xa1\xa1\xe4>\x86\xaf\x9c>\x9c<\xb7\xbc\xc5y(\xbep 0\xbfN\xaa"?\xa0\xa8J\xbb\xfc\xc0\xb5<\x1cN]?\x85\x87\x8b<{y?\xbe\x89XS>H\tM>\xb3\xbd\xe3>+\x9a\xdb\xbe\x1fC4\xbdO\xde\x0b=(O\xe7;\xafl\xa8>P\xf6\xb4>\xe3\xe6\x82>\xeb\xcev;kNm>\xe7$\x9c>Wv\xa3<\xa9\xfb\x1c=ix\x19>w\xf5\xe0=\x94\xa3\xb4\xbe\xa8c)?\xb5\xe4\xcc\xbd$\xb3L\xbf\x9b\x00\x84>\xe7\\\xb3\xbe\xd9\xa2\xc7>\x0c,\xdc>\xa3\x9fd\xbeo,\x10\xbd_`p>\xb8\xa4\xb9<\xc5M\xbc>B\x8e\x9b>S\xb8s>\x83@I?<1!\xbe\x91\xae~>/Ds>p\xa4\xb3\xbe\xfb\x82v> \xa8\xdc\xbe;|\x0c\xbf\xe8\x88\xc0\xbe\xef\xb2\xb0=\xe8\x17\xb8\xbe\xab\x9ak\xbfM\\\xdd>y\xb6\x88=\xc0\xda\xf8\xbc\xec6\xaf>\xb5\x16\xa2\xbe\x9f\xb6\x85\xbdX\xff`?\xf2\xad\x1d>\x7f|\x96\xbc3\xde\xba\xbe\x85\x8b7\xbfH\xedX>\xa0\xf5\\>\xc3\x80\xfe>\x0f\xf7\xb7\xbd\xcb\xf8}\xbe\xc0^\xbd\xbd,S\x83>HN\xe2\xbd\xda\x1a\r?\xfb\xa4m=Kl\xd8>X\xfdi\xbe\x84{\xe7>\xf57=>w\x01\xfb>\'\x84\x00>-\xfd\x1a?\x17\xb6\xde>\x14\xef\x1c=a\x1bj=\xbd|\xbf\xbd\xbd\xd9\x80>'
-p2220
-tp2221
-bsV503958522556469248
-p2222
-g2
-(g3
-(I0
-tp2223
-g5
-tp2224
-Rp2225
-(I1
-(I200
-tp2226
-g12
-I00
-S'\x1f\xee\x1f?\x07\xe4\xf6\xbb\x05M\x0c\xbfQH\x13\xbe\'X\xa9>\x00h\x0b\xbe)\xbe\xdf\xba_%\xc4\xbe\x8d\xd0\x96\xbc\xef-L>\xd4\xf7\xa8\xbc\x9a\x0b\x15<C\xd3_>\x88s\x82\xbc\xd4x\xcc\xbd\x1c<\x08?\x85\x00\x86\xbd\xcc\xf4\xfa\xbc_\xa2\x8b\xbe\x8f\x18]\xbda\x01\xa0\xbe\xdfml=\xc9\xcac>\xefn.\xbe\x9b.\x1d\xbc\n\xf7\x1c\xbe\xfb\xff\x81>\x9c0\x95\xbeUl\xb5\xbe\xcdk\xdf\xbc1\'U<\xdfu\x9b\xbd\x06\x9b\x95<\xa1\xe3\xd6\xbei\xe6\xdd=$\x02\x87>\x84B\xaa>\xf3\xf7j>\xf1\x10\xb6>\xc9\x84\x0f<\x8a\xbf(\xbe\xb8\x9b\x08\xbe\xf7@\x9f=\xc9\x0b\xa5\xbe\x8f~^\xbe\xb7T\xdf\xbda\x9b\xd9>\xc9e&\xbd\x81\x9e\xab=\xd8M\x0e?\xc9~\xac<\x10[\n?\x10\xdb\x9f\xbef\xfb\xf1=\x9a\x08\xc6\xbe\xa0\xc9e>?\xbaQ>lw\xc7\xbdjY\x0b\xbf\t\xe3\x14\xbf\x1d%\xac>\xa4\xd8\xe8>\xa4\xf8\x02>\xf9eB\xbe|\x11\xe1\xbc\x11T`>\xea\x9a=\xbe\xd9\r\xe9>\xa3\xd8\xbc\xbd\xc9\xe4\x8c\xbe\xa0\xda\x16\xbf\x90\x95\xc6\xbe\xb7\x07j\xbe)S,\xbe\x16\xec,\xbe\xb7\xcb\xba=\xff\t\x0e>\x193/>\xac|O>4\xae\xa8>\xe6R\xae\xbc\\\x8f\xd6<\xbfC\x9f>\xe3\xacr\xbe~C\x04>\xf4\xf7!>m(\x96>\xf1\x8c\x94\xbeO\n.?\xa4\x87\x89\xbd\xa9\xd8\xc7\xbe\xa6\xece>\x8d\xbc\xc5\xbe\x87d\xea\xbd!\x04\xde>)4\xfa=\x8a#\xce>tP\x96>\x16\x97\xf1=6\xea\x1d\xbeL\xa6\xc5\xbc\xa3\n\xa1>\xd4u`>\x18\xde\x89>t*\xfb>\x93\xc9x\xbe\xeck\xa1=\xb9\xb4\xa5>c\xcdz=\x86\xc4M\xba\xf2n\xa8\xbe\xbe\xfb\n>C\x1a >\x7f7\xe4=\x10\x96\x91\xbc9&!=\x1a}\xe0\xbe\xcc\x9b\x82>\xb0\x96%=\x8c\xa4\xb6=Y\xe2\x17?\xdf\xbd\x8d>\xba\\j<Vv\x13>flD=L\xe6\xd2>\xd7\xea`\xbeVr\xc3=A\x97,<T^\x12>,\x93\xb3=JZ8>\x8c\xc8\x1d>4+n<Qp\x92=\x9b\xcc+>z\x8d\xdf\xbc\xb9\x8e7<L\xbaV\xbeS\xed\x15\xbc\x17F\xa2\xbe\x1e\x9b\xb0>\xb7\'\x17>\xa7&\xf2\xbe\x16\x16\xe7>\x17r\x84<\x1c\x1ch>\xd6\x19\x17?zK?\xbe\x86\xcdR;\x8a\x8am\xbdK\xd3\x0b\xbe\x9c\xf8\x9d>\xf5\xf7\x1a>\x8a\x99_=Lo\xd0>\x87%2\xbemo4>y\x98\x98=d\xd3\xa7\xbe@-]\xbd\\<"\xbe\xcaZ\xf1\xbe\xc5\x00\x81\xbe\x86x\x96=\xff\x15\x83\xbd\x9a\x05\x12\xbf\xf9\x17\xaa>\xb1\x0e\x84=\x8d\xee\xcd\xbdp\x9f\xf6=\x91&\x9e\xbeGPm\xbe\xbb\xff\x10?\t\x80%>lZ\xd1=,i\xb2\xbeD\xa5\x1c\xbf:1">r.\x87>\xc9Y\xbe>\x1c\xd0\xbb\xbcl\x9f\x9a\xbeW\xa7\xd2\xbd\xaf\xd3\xeb>\x97jP\xbd\xfd\x1c\xdf>\xb9\xc8\x01>\xf7\x84\x90>\xb3{\xd2\xbd\x10\x8b\x80>\xff\xe2\xb6<\xbeL\x1f>\xc5\\\x18>;\xce\x15?T\x95\xc2>I\xbe\x08;\xa3\x89\xd69\xdfEt=\x8dU\x8c='
-p2227
-tp2228
-bsV503965312144797696
-p2229
-g2
-(g3
-(I0
-tp2230
-g5
-tp2231
-Rp2232
-(I1
-(I200
-tp2233
-g12
-I00
-S'\xc1\xc6N?\x07i\xc7>>\xdaD\xbf\x9e{\\\xbcY\xbf\x12>O\xd9\x8e=\xb6\xd9\xd8\xbdNf\xda\xbe\xc0\xb8n=\x04\x9b\x0e?\x91\xa7\x9b\xbe\xf7\xb1\xc7\xbe\xc1\xfa\x90\xbc\x80\xceb\xbe\x9f\x85t>\x8d\x82*?Np|\xbe\xd5x\xee\xbe\xf8i\xd5\xbe\x84\x10\xa2\xbe\x81\xf0.\xbeV\xbcO\xbd\xba\xf7\xe4>\x04\xcd\xf4>Y\xfcy>\xb2;2\xbe\n\x11\xb4>\xd6l\x03>\xfd\xa4\xef\xbeC\xea\x1c\xbf\xf6\x90\xc2\xbe\xb5\x8e\xa4=\xfco\x0f\xbe\x88\x03e\xbf\xd7\xba\x1e>\xc4>\xe8>f\xae\x06?\x87\xe2\xdb>TL\xf1>\x95as\xbe&m\x10\xbf\r\xc8P\xbe\xa7\xaf\x02\xbe\xec)\xd2\xbb\xf8\xa6\x1c\xbfm\x08W\xbe\x8d\xd9\x0b?r\xfe\x88>\x8c\xa7\x90>~m~?\xa4\xe5\xce\xbd\x80@\x1e?\x84\xba\xb9\xbe\xc4A0>\xf4\x0f+\xbf\x03\xca7=\xcc}\x03>\x04g\xe7\xbc\x9f\xeb_\xbf\xd7}[\xbf\xe3\xfe\x9b>\xb1\x1c\x91?\xb8(D?\xc3\xe3\xae\xbe\x9fI?>+R\x7f<cG\xf7\xbe\x00\xf3]?\xf1\xd0\x19?\x06D\x02\xbf\xab\x9e:\xbfM<c\xbf\r;+\xbfLq\x06\xbem\x8a~\xbe\xcf^\xd0\xbd\x80J\xbe\xbcG\x10\x12>x83?\xe0s\xcf>\xff]\x1d>\x9d\xd6\x0e>3~<?\xe7\x1d\x08\xbf\x13@\xe0=f\x87\xcf<\xf4k\xbc>\xadF\xe2\xbe\x14\xd7@?\t\x90\xd2\xbed\x92\x14\xbf\xd9L\x9d>\x07\xb5\x94\xbeb\xec\x04\xbf]!\xaa>M\xed\xcf\xbcW\xcc\x1a?\x8b\x13\x9d>^km>/\x87\xc0\xbe<\x9f<\xbe&\xac\x8b>\x14\xd8\x80>\x9d\xbc\xf1>U9N?\xe3\xe1\x04\xbfM`D\xbd\x08\xb8U?\xbd%\xd7<\xd7g\xec\xbdQ\x84\x81\xbfQ\x9d\x8b\xbe}\xa55?=\n\xad>\x01n\x8c>\xad\xc9\x13\xbe~%7\xbf\x88\xa65>\x02(*\xbe\xfa\x85D\xbe\x08\xd1K?v\x19\xe3>\xa4>\xdf\xbd\xbdE\x96=\xfcZ_;\xb7\x15\xba>\x86Rc\xbe\xf7d\x97>"\xc2`>\xbdJ\xa2>\xddS[>\xec\xf8z>\xadd\x14=>\xb4\xf2=\x93\xb6\x9f\xbeCI\x86=\xa0f\xb6\xbc\xb71\x03>\x8c\xcc\\\xbf\xd7j[\xbe\xcfv\xf4\xbe\xf3\t\xdc>\\)\xfb>A\xc8=\xbf7\x07??7h\xbe>4\xfc\xd8<B?\xac?*\x91\xaa\xbd\xb2rf;f\xb2\xd4=Z_R\xbe\xf9[\xe0>\xa4\xe5\x8d>\\\x04-\xbeg\x9dF?r\x84\x15\xbf\x1f\xfe\xb3<\x8b\x91\xb3>\xbda@\xbf&\xb1\x00\xbf\xe8\x89\x19\xbf\x9f\xd6w\xbf\xe8\xcc\x10\xbf\xb84t>)7\xc3<\xbd|H\xbf`n\x15?\x1c\xb2\xab>\x91\xdc\xd9\xbdy\xd19\xbd-\xbb\xfd\xbe\xd9\xa0&\xbf\x01\xf7\x1a?\xe6\xee[=\x9c\xe0\xf3>RX\xc3\xbeF\\\x85\xbf\xf5\xb2\xf9>\xd3\xddW>\xa1+\xfb>\xceh\xf7\xbb\xcbM\x0c\xbfM7\xa0\xbe\x99\x8dX?\xf9\x1b@\xbd\x84\x1d\xbf>Y\xb9I>\x9f\x9f\xe5>`mV\xbd\xe4\xd4\xbe>\xe8\x0e\x8a\xbb\t\xcc\xb1>}\xe7Y>\xe7\xcfu?.D\x1e?\xbc:N\xbe\x7f\xad\xba\xbc\x06\xb3\x93>\xb3>\xc0\xbe'
-p2234
-tp2235
-bsV503972009085132800
-p2236
-g2
-(g3
-(I0
-tp2237
-g5
-tp2238
-Rp2239
-(I1
-(I200
-tp2240
-g12
-I00
-S'\xcd\xfd\xf8>\xc9\x8fH=%W\xcc\xbe\x92\xde&\xbe\x94\xc19>\xad\xaf\x04\xbd\xdf\xf4\x94=B><\xbex\x19f\xbc}BW>\xbc\x94\xbc\xbc\xbf\xd2\x18\xbd\x8e\x83\\>j\x11\x80\xbd\xb8T\xb8\xbd\x1cJ\x91>\xbe\x11U\xbdT\xd8\x9b\xbdt\xac \xbe\xb9g\x90\xbcQ\xd3\x80\xbe/\xa6)>\xec\xbc\x00>\xe3|`\xbd\x13\x9c\x80=R\xbe)\xbe7\x919>\x0ew\xe9\xbdrg\x88\xbe\xec\x1b\xc5\xbdL\xb9\x94=z\x1a\xb9<\x87H6<\xc6t\x94\xbe\xf3\xb8\x0c=\xb0#\xde=Bv\'>\x8a\xf2.>\xb9\xf5\x9d>Q\xf8\x97\xbd\xa3b\t\xbe*\x92\x89<Q\xe3\x10>2\xc0\x97\xbeU\xa8\xc7\xbdQU\xaf\xbd\x8f\xc4\xa1>Hl\xf5\xbc\x84\x82A=\xd3\x8a\xe5>E\x01!=\xa3W\xe9>\xac\xd9\x90\xbe\x80.\xf1=\xc5\x9b\x9c\xbe\x89\xce%>FQ#>W\xea0\xbd\xb8\xa6\xe4\xbe\x93\x92\xb8\xbe5\xe7\x9e>\xf6\xbf\xa6>\x9a\x86\x01>\xc3\xfb\xc7\xbd}N\xf2\xbc\x80\xf0\xe8=\xf3\x1e.\xbe\xdf\t\xb6>$\xe3\xaa\xbd\xe3s\xf6\xbd\x1a\xc0\xce\xbe\x80\xeeu\xbeS\xce\x1a\xbd9\x96\xb4\xbd\xd3x+\xbe[L.=\x8d\xc0\xe8<xH\xc7=\x0c^\xc8=>\xea@>\xd4h\xa6\xbd\xe4\xaa1\xbd\x86p\xa1>\x94T\'\xbe\xb3\x19\x85=Z[\x16>\xfe\xff|>b\xd94\xbe.\xf6\xc5>\xc82\x86\xbd\xaa\xb1l\xbe\x8e\xed\xfc=\xfdT\x9a\xbe\x8b\xf5\xbd\xbd:\x02q>\xf4Q\x1e>9$$>\x0e\x10v>\xd0\xb2]=E\x02\xe4\xbd\x866\xd5<\x0e%P>X\xeaV>"z\x01>\xfaQ\x85>\x126\x13\xbe\x9edw=\xf4\xe0\x8b>j\x8c\n\xbc \x89\xaa\xbb\x98\xef\x9e\xbe\xcb\x97\x93=\xf8\x10$>\x90\xa3g=\x08\xeb\x82\xbcB\x11\xa7\xbd*\xda\x8e\xbe\xeb{`>"\x1b\x0f=\xd6v\xec=81\xcc>\x83\x9b\xe9=?\xcd\x94\xbd\xc2\xb5->\xaf/\x16=\xc4\xea\x8e>\xda8\x0e\xbe@R\xe3<M\xd4\xd4<\xa2\xd4\xfd<\x88o\n>\x16\x14\x97=>lK=\xbb\xae\xf2<\xd9`\x8c=B\xf6s=\xf1\x17L<C$d\xbd\xad\x14j\xbd\x9d\xd1\xdb<\x18\x18`\xbe\xe1\x0c\x14>\x16\xd8\xe0=\xf0"\xbd\xbezZ\x9d>\x0e\xf5\xeb=E/U>\xed\x00\xa0>\x8b\xb3\xf3\xbd\xfcV\xb8\xbd\xfa\xf6\x81\xbd\xbdw\xd3\xbd\xcaW\x8d>!\xda\x13>\xf7<\x08<\xde\xbc\xb3>\x85\xf9\xc4\xbdF\x11\xec=\x1d7{=\x00\xde~\xbe}\xb5\x81\xbd\xf0\xe0\x1a\xbe\x15Q\x9c\xbe\xcd\x82`\xbe\xca\xb8\xe7=2\x12\xf7\xbd\xf2\xfe\xd1\xbe2\xd9+>\x89/\xa7=\x08\x8b\xed\xbc\n\x8a\x8e=zi\xf2\xbdg\xb1\xcc\xbd\x93\xf2\xfd>\xed\xa2\xee=\xaa\xd3x=\xb5T\x98\xbe\xa8\xd4\x07\xbf\xdeYe<\x9b\xbc\xf6=%\xf2O>V7#\xbd\xff\xa2\x80\xbe\x8ey=\xbe#\x19]>B3\xc9\xbc\xce\xb7,>\x05\x1ex=]uZ>r\x10\x81\xbcV\x0f1>\x17L1<nh,>\xc66\xc0=\xfd\xc9\xfb>V\x99|>\x8e\x88&\xbd\t)\xc8\xbcU\xc9d=\xbcj\x17>'
-p2241
-tp2242
-bsV503971472369778688
-p2243
-g2
-(g3
-(I0
-tp2244
-g5
-tp2245
-Rp2246
-(I1
-(I200
-tp2247
-g12
-I00
-S'\n*\r?\xb0\x16A=\x93\xf2$\xbfJ\x8b\xc1=\xd9A\x82>>\x10\xbc=\xd6\x84\x05\xbe\xae\xdas\xbe2\xbd\x0b>\xee\xbc\xf2>\n\x1f\xab\xbefk\x10\xbe.\xdax\xbd\xf0\x0e\x1c\xbe\x8a\x17\xfb=\x1b\xe3\xdf>\xe8ki\xbd\xb4 \x17=\xf5)\xcb\xbe\xeb2\x97\xbe\xb6*\x0b\xbej\xf5H\xbe\x98Z\xb6>\xc0w\x8b=b\xff/>\x9b\xf6G\xbeh?\xe4>3+(>\x88\xa6\xbe\xbe\xd2)\x91\xbeVp?\xbe0PG\xbd\x03q7\xbd\xebUS\xbfH&D\xbc51\xdf>\x12\xf2\xb6>F \xaa>\x96\x8f\t?\x8b\xa3\x97\xbe\x00\xab\x19\xbf\xc6H%\xbdO\r->\x8aM\x04\xbd\x16Q\xb7\xbe>\x90\xcc\xbeV\xcb\x1d?\x93\xcd\xd1>f\xeb\xad>)\x8f0?\x1az\x91\xbd\xa5\x8a??k\xd2\xac\xbe\n\x1bH>C\x01\x16\xbf-aK>F\x12,=\xb0Fd\xbeR\x931\xbf.\x80\x11\xbf\x0f\xa8\x82>\x01\x14*?_\x8a\x0c?\xab\xabe\xbe\xfb\x91\x81>ju\x91\xbd\xde=?\xbf\xd8e\xf4> \'\x90>\x03p\x18\xbe\xdc\x94:\xbf\x9d5-\xbfwR(\xbe\x85C\xbd\xbdH\x82M\xbe\xfc]D\xbd;a\x01>Z\x06\xcf=\x19\xb7\x05?&\\\xad>\xb5\xf3\x95\xbc\xd1p\x86=*^%?\xa0\xea\xa5\xbe\x1b\x12\x19\xbc\x9e\x01f<\xce\xc6\xb3>\xdaJ\x1f\xbf\x9d\xa1(?T\x8c\xa1\xbe\x0cR\x03\xbf\xa0\xad\xff=\xceN\x8f\xbe\xb3\xd4\xa0\xbe\xbfb\xb5>Fz\xe4=\x05\xf8\xc2>\xa6~\r>\x83\xf5\x95>\nW\xb6\xbe\xd2\xd1\xee=\x05\x86\x7f>\xcc\x84\x8a>\xc5\x15\xed>f{\xcb>\r\n\xfd\xbe\xb7O\r\xbe\x0f\xd8\x13?d9%=HjF>\x91!/\xbf\xeaB\xb0\xbe\x1d7*?LH\x99>H4(>\xdc_\xba\xbc?\x81\x18\xbf\xf3`N>\x80\xe6\x9e\xbd\xa2M\x87\xbe\xc4\x16G?n!6>\x06\xbe\xb0\xbdNTQ>\x98gT\xbc}Q\x94>\x96%w\xbe\x80\x8a\xcf\xbd^\x89\xa8>D\xf9\xc0>\x17?\xaf>\x063\xb6=\x9f\xcb\xae=+\xe6h>z\xf9\xfe\xbc\x03\x9eH>\xd7\x05\x01>F\xc5\x0c>\x97)\x16\xbfY\x17\x90=S\n\r\xbf\xa3\x9d\xc2>\x03\x1b\x84>o\x903\xbf\x06\x96q>e\x9dc\xbdO\xa6\x80=\xba\x83h?l\xe4\x15\xbe\xd02\xd1\xbc\xf3\x8e\x11;\xf3\xd8B\xbe\xdb\x82\xa9>=\x1d\x8f>\xce\xbd\x8e\xbdGD9?\x13g\xf7\xbe\x1d\xc77\xbd\x02\xdf\x08>V\xa5\x10\xbfc\xe8\x8f\xbe.\x92-\xbf\xa3nc\xbf4\xc3\xa5\xbe\xeev\xb1>\x05$\xb8;\xc6\xac*\xbf\xe6\x86\x05?"\xbc8=\xac\xbc@\xbd\n\xed\x94=[\x04o\xbe\xebU\x91\xbe\xf8\xd8\x03?&E\x1a\xbc\x10\xf3\xb6>\'\xb1\x8c\xbeh\xe9B\xbf\x82m\xc9>\xa6MM=XO\xb5>.\xecD>\xe0P\xdb\xbe\xdcq#\xbe\xe2%\x14?\xa1H6;\xe9\xcd\xbe>\xe6LZ>\x80J\xe8>(\x1b\xd0<\xab[\xe2>\x95\xcc\x05=P5\x97>;X\xaf\xbd\x1d\xa9P?\x8d\xce\x9b>\xa0Z`=f\xf6\x84\xbc\xed\xb3s>pm{\xbe'
-p2248
-tp2249
-bsV503966136396812288
-p2250
-g2
-(g3
-(I0
-tp2251
-g5
-tp2252
-Rp2253
-(I1
-(I200
-tp2254
-g12
-I00
-S'\xcd\xfd\xf8>\xc9\x8fH=%W\xcc\xbe\x92\xde&\xbe\x94\xc19>\xad\xaf\x04\xbd\xdf\xf4\x94=B><\xbex\x19f\xbc}BW>\xbc\x94\xbc\xbc\xbf\xd2\x18\xbd\x8e\x83\\>j\x11\x80\xbd\xb8T\xb8\xbd\x1cJ\x91>\xbe\x11U\xbdT\xd8\x9b\xbdt\xac \xbe\xb9g\x90\xbcQ\xd3\x80\xbe/\xa6)>\xec\xbc\x00>\xe3|`\xbd\x13\x9c\x80=R\xbe)\xbe7\x919>\x0ew\xe9\xbdrg\x88\xbe\xec\x1b\xc5\xbdL\xb9\x94=z\x1a\xb9<\x87H6<\xc6t\x94\xbe\xf3\xb8\x0c=\xb0#\xde=Bv\'>\x8a\xf2.>\xb9\xf5\x9d>Q\xf8\x97\xbd\xa3b\t\xbe*\x92\x89<Q\xe3\x10>2\xc0\x97\xbeU\xa8\xc7\xbdQU\xaf\xbd\x8f\xc4\xa1>Hl\xf5\xbc\x84\x82A=\xd3\x8a\xe5>E\x01!=\xa3W\xe9>\xac\xd9\x90\xbe\x80.\xf1=\xc5\x9b\x9c\xbe\x89\xce%>FQ#>W\xea0\xbd\xb8\xa6\xe4\xbe\x93\x92\xb8\xbe5\xe7\x9e>\xf6\xbf\xa6>\x9a\x86\x01>\xc3\xfb\xc7\xbd}N\xf2\xbc\x80\xf0\xe8=\xf3\x1e.\xbe\xdf\t\xb6>$\xe3\xaa\xbd\xe3s\xf6\xbd\x1a\xc0\xce\xbe\x80\xeeu\xbeS\xce\x1a\xbd9\x96\xb4\xbd\xd3x+\xbe[L.=\x8d\xc0\xe8<xH\xc7=\x0c^\xc8=>\xea@>\xd4h\xa6\xbd\xe4\xaa1\xbd\x86p\xa1>\x94T\'\xbe\xb3\x19\x85=Z[\x16>\xfe\xff|>b\xd94\xbe.\xf6\xc5>\xc82\x86\xbd\xaa\xb1l\xbe\x8e\xed\xfc=\xfdT\x9a\xbe\x8b\xf5\xbd\xbd:\x02q>\xf4Q\x1e>9$$>\x0e\x10v>\xd0\xb2]=E\x02\xe4\xbd\x866\xd5<\x0e%P>X\xeaV>"z\x01>\xfaQ\x85>\x126\x13\xbe\x9edw=\xf4\xe0\x8b>j\x8c\n\xbc \x89\xaa\xbb\x98\xef\x9e\xbe\xcb\x97\x93=\xf8\x10$>\x90\xa3g=\x08\xeb\x82\xbcB\x11\xa7\xbd*\xda\x8e\xbe\xeb{`>"\x1b\x0f=\xd6v\xec=81\xcc>\x83\x9b\xe9=?\xcd\x94\xbd\xc2\xb5->\xaf/\x16=\xc4\xea\x8e>\xda8\x0e\xbe@R\xe3<M\xd4\xd4<\xa2\xd4\xfd<\x88o\n>\x16\x14\x97=>lK=\xbb\xae\xf2<\xd9`\x8c=B\xf6s=\xf1\x17L<C$d\xbd\xad\x14j\xbd\x9d\xd1\xdb<\x18\x18`\xbe\xe1\x0c\x14>\x16\xd8\xe0=\xf0"\xbd\xbezZ\x9d>\x0e\xf5\xeb=E/U>\xed\x00\xa0>\x8b\xb3\xf3\xbd\xfcV\xb8\xbd\xfa\xf6\x81\xbd\xbdw\xd3\xbd\xcaW\x8d>!\xda\x13>\xf7<\x08<\xde\xbc\xb3>\x85\xf9\xc4\xbdF\x11\xec=\x1d7{=\x00\xde~\xbe}\xb5\x81\xbd\xf0\xe0\x1a\xbe\x15Q\x9c\xbe\xcd\x82`\xbe\xca\xb8\xe7=2\x12\xf7\xbd\xf2\xfe\xd1\xbe2\xd9+>\x89/\xa7=\x08\x8b\xed\xbc\n\x8a\x8e=zi\xf2\xbdg\xb1\xcc\xbd\x93\xf2\xfd>\xed\xa2\xee=\xaa\xd3x=\xb5T\x98\xbe\xa8\xd4\x07\xbf\xdeYe<\x9b\xbc\xf6=%\xf2O>V7#\xbd\xff\xa2\x80\xbe\x8ey=\xbe#\x19]>B3\xc9\xbc\xce\xb7,>\x05\x1ex=]uZ>r\x10\x81\xbcV\x0f1>\x17L1<nh,>\xc66\xc0=\xfd\xc9\xfb>V\x99|>\x8e\x88&\xbd\t)\xc8\xbcU\xc9d=\xbcj\x17>'
-p2255
-tp2256
-bsV503968896890589184
-p2257
-g2
-(g3
-(I0
-tp2258
-g5
-tp2259
-Rp2260
-(I1
-(I200
-tp2261
-g12
-I00
-S'\x04&\xc7>\xf2f\xe6=I\xed\xbb\xbe\x12\x10\xa0\xbd"]\x00>\x8c\x89\xa0\xbc\x8b\xecL\xbdd\xb5v\xbe\xe56X\xbd\x97\xbb_>e\x88T\xbd0r\x07\xbe\xfc"\xd4=A\x97\x9c\xbd\x17\x9d\x0c\xbc\x8c\x0c\x95>\x81c\xb2\xbd\x17\xcf2\xbe=\xbd\x17\xbe\xb0a\xd1\xbc\xde6E\xbe\x0bs\x18\xbc\x14\xad\x1c>\xc5\xbf\n<\x0e\xcb\x89<\xb0Cl\xbd\xe4 \x1e>\xdeR\x88\xbd\xf9\x12\x86\xbeR\x05\xc5\xbd\x1a\x0bq\xbd\xa0-<\xbd\x8as\xa1:\xb33\x94\xbe\x84\xfe\x8f=lFz>\x87\x8fg>\xd8:\x0c>\xb6N\x82>o\x9d\x1c=<\xb3\n\xbe\xb2\xcc\xa4\xbdOH\x01=\xaa\x9a\x1a\xbe\x9cfE\xbe\xa0\x80K\xbd\xef^\x9b>\x8b\x0eH=\xc6&\x88=\xc7\x9d\xd5>D\xd4=\xbc\x1c-\x91>\xac\xe95\xbe\xd1\'q\xbc\xac\x9f\xa6\xbe\x14s\xbc=l}\xc8=j\xec%=\x99/\xe7\xbe\x12o\xb9\xbe\x07\x00Q>\x9f\x8b\xc7>\xd7|,>`e4\xben\x98\x01\xbd\xacO\x16>\x16\xaf\x03\xbe\xfa\x8d\xaa>\x99w\xa3\xbc\n}=\xbe\xcct\xc6\xbe^\xe8\xb8\xbe\xc2;[\xbe \xff\x9f\xbd!R\x14\xbea\xa5\x96<\xaet\x97=\xf7\xa9\x0f>\xeatJ>\xeb5\x1e>\x1eQ4=\x85\xb8\xc7:V+\x95>\x16og\xbe\x89\x19\xd1=&C\xa5=\xda\xc8\x0f>\x9e\xecL\xbeO\xa4\xbc>\x8c^\xb0\xbd\xd1!^\xbe?\xb19>\xef\xc5H\xbe~\xc0\xe1\xbdLBB>\x9f\xbc\x9d;\x11zp>O\xcf;>\x89\xeeR=u\x01\xba\xbdb\x917\xbdqf5> \xda\xf9=~\xae\x1c>\xb9\x9e\xb0>OT\x7f\xbe2_\xc4<\x08)\x8b>\xa1\x99\xa6<P\xd3\x1f\xbd\x1bW\xa5\xbe\'\x07k=W\xcai>\x00\xc9=>e\xe9\xbf=\xc9\x12G\xbd\xaa\x11\x95\xbe\xf5b*>\x1b@\x18\xbdD\x7f =~k\xc3>J\xe0$>?\x11c\xbd\xc0\xc4>=\x14|\xe8\xbcVfU>l\x9c\'\xbe`\xeb\xc5=\xe2\x86\xb0;\x7f\xe2\x8c=\xc4\xf5K=Y$\x17> \xaem=O\xac\x8c<?k\xa6\xbd\x92\xab\xf8<Ps\x8e\xbdQ\x0fw\xbc\xa5\xa3f\xbe"m\xe9\xbb[\xcb8\xbe\xc7nC>$\xd2\x02>I\x99\xa7\xbe\x9a\xf3\xac>[\xc1\xbd=/\xfd\xf3=\xb7\xb7\xff>\x9eQ\xe4\xbdJj\xd2\xbc\xbe\xb0\x94<V\xe0\xec\xbd\xe1\x18\x83>Z@8>\xf1\xa1J\xbd\xa0\xb0\x91><{\x03\xbe\xecq\xa0=\xc7\xad\xa0=\x9e^\x95\xbe\x91\xfc\xef\xbd[\xefA\xbe!i\xac\xbe`\xd2s\xbe\xda\x82v=)s\xa3\xbdeJ\xc2\xbe\xf5lj>\xfeV\x05>v\x8f\xa0\xbcw\xb1\xa2\xbb\xbbHb\xbef\xd5H\xbe\x84\x8c\xb7>\x9f&g=\x0f+\xf8=\xd7\xa8\x80\xbe\xa7\x87\xdb\xbe\xfc\x99t=\xa1(\'>\xdb\x1bg>\x15\xb0B\xbd\x87\xaaX\xbeI\xc0:\xbe\xf1\xa1\xb3>#\xaa\x81\xbdK\xd5\\>y\xe0\x17=2\xff\x82>\x91\x07\xb7\xbda\xef\xf3=\xb13\xda\xb7\x89z*>\xa2\x13\'>^,\xc1>G\\\xaa>\x08\x14\x12\xbd\xd0\xd3%=\xe0\xb6\xc8=\x8c\xc4\x8e\xbb'
-p2262
-tp2263
-bsV503964504406106112
-p2264
-g2
-(g3
-(I0
-tp2265
-g5
-tp2266
-Rp2267
-(I1
-(I200
-tp2268
-g12
-I00
-S'\x9f\xaf\x0f?\x01\xfa9>;\xaf\xf8\xbed\x17\x9b\xbc]\x13U>\xe2e%=p\xf5\xf4\xbd\xb5$\x88\xbeMJ&\xbd\xfb\xdb\xae>\x95\x9e\n\xbe\xb9\xf4\x90\xbe N?=]Tt\xbd\xce\x03\x04\xbd?\x0c\xb6>3Q\x1d\xbd\xf5\xf4\xdc\xbdP\xc7\x92\xbe\r\xcb\x11\xbe\xa5F\x19\xbe2t\x9f\xbd\xa7\xc5\xa8>\'!\xc0=)V\x01>\xbb\xb7\xe0\xbd\x9c\xf0Z>\x98\xf5\xe9=\xd5$\xa5\xbe\xcf\x87D\xbe\xe4\x89;\xbe\xd7\xd3\xe4\xbd\x97 \x81=\x11\x03\xfa\xbe\x8f=\x0b=\xab\x08\xb2>\xe1\n\x81>\xcfou>\x9cr\xb6>\xa1hX\xbcA\xb4\x8d\xbe-88\xbd\xaf\xd1\xaa=\xb8\xb2,\xbeH\xd2_\xbe@\xb3N\xbe\xcb=\xf2>l\x86<>\xfc\xdc1>\xb3\x94\x17?m&\x13\xbe\x1f7\xfb>\x1d.r\xbe1f\xaf=\xe7\xfc\xe2\xbe\xa8eU=Q\xf2\xe6=~\xb7\x8e\xbc\xc54\x18\xbf\xe5[\xd9\xbe\xd4\xcfk>\x9c7\xff>\xff\'\x89>\xc5\x037\xbe=\x1a\xfd\xbb\xe3\xab_=\xb8\xe3\xcd\xbe)\x8c\xc2>;!\xc9=\x89p\x88\xbe\x936\x1c\xbf\x7fn\xe5\xbee\x86e\xbe{5\xd0\xbd\xc8tx\xbe\xfd\x99\xad\xbdYnk<\xa9\x13+>/c\xba>|\xfb4>\xf3\x11\xc4\xbb\x0f>\x8b;\t\xdd\x00?\x8b\xf7\x83\xbe\x8dS\xc8=\x07\x12\x0f>\x1b\x8fU>\xf3\xeb\xd5\xbe\xdf\xc4\x02?\x83\xb9o\xbe)\x8c\xb3\xbe=\xc1\xbd=\xdc\x80\xaf\xbe\xdfCE\xbe[JS>\x87k=>2\xc2\xa2>L?:>\xff\xfd\\=Y\x15\x7f\xbe4[R\xbc\xb1\x06\x86>\x99\xff@>X}g>\x9c\x00\xa2>88\xb2\xbeCO\xee\xbcO\x85\xe9>\xb8hV=c\x984>\xb3)\x04\xbf\xe1\x0c\x11\xbd\xefV\xf2>8Q)>\xf3\x95\xe0=\xdd+\x8c\xbd\x95\x8c\xe5\xbe\xfd\xb7\x85>\xd7\x02\xea\xbc3\x19C\xbd@\x01\x07?u}>>\'\x03\xfe\xbd\xcd\x88\'>\x0e\x82\x10\xbe?\xdf7>f\xe9\x80\xbe\x80\x80\xac<|o\xd8=e\xe1T>\xd3\x9a\r>x\x96=>\xd7\xed3=\x97\x1f\xf4=T\xef\x90\xbd\xbaO\x96<\xe2q\x8c\xbd\xa7gA\xbd\x8b\x06\xbf\xbe\x87\xa7\xaf=\x13\x99\xa1\xbe\x90w\x13>Z(\x15>\x05\xd2\xf6\xbe\xe1X\xb4>\xab\x97\xbb<\xa9(\x8b=D\xc3:?\x1b\x9d\xc6\xbd!\x0f\r\xbd\xabM\x8d=\x8f\x8a#\xbe\x08M\xc2>\xf14b>5K\x1a\xbdM\x9d\xd8>wlt\xbe\xe1\xef\x0e=\x1e}\x95=\xc5\x8c\xbd\xbe\x9d2m\xbe\x075\xce\xbeu\x0b\x13\xbf\xf0\n\xa0\xbe\x0c\x1a\x83>Y\x14U\xbd5\xb3\xfa\xbeu\xb6\xa9>Y\xacC>9\x81\xee:\xe0\xb8\x19<\x8b-\x87\xbeu\x81d\xbe07\xd4>\xcd~\xe8\xbc\x8f\xc1\x80>\\\xb9\xa6\xbe1\xfe-\xbf\xf9\xf5\xfe=\xbd\xb1G>W\xf2\xb6>\x13\xec\xb2\xbbc\x12}\xbe\x93\xe1R\xbe\x07\xc4\xf6>_S\r\xbd\x97U{>\x98\xb7>=D\x14\xa1>l"\xff<g\xcb\x9b> \xfdr\xbd\xa4\x9b]>P\x9f\xda=\x07\x8a$??\x07\x9e>\xa3\xc1\x85\xbd;(\x8d=Q\x83j>\xd1\x1f\x1f\xbd'
-p2269
-tp2270
-bsV503966342190350336
-p2271
-g2
-(g3
-(I0
-tp2272
-g5
-tp2273
-Rp2274
-(I1
-(I200
-tp2275
-g12
-I00
-S'F*\xe3>|\n\x05\xbe1\xc1\x0c\xbf\x06\x19\xcc=\x1f\x8c\xde>~\x9d\x1a\xbe\xd3\xef\x1a\xbd\xd9\x97\xac\xbeI\xb5\xdd\xbd\x08`\x1e>\xcf\x12\x88=:t\xa4=d\xd9\x8f>I\x02\xff=\xb4S*\xbea]\xfc>\x9d\x9e\xcc\xbc\t\\\x93\xbd\xafmG\xbe\x83Y-=\xc5_\x8e\xbea\xb9\xdc\xbc\xecM\xdb=\xe1\x1c\xec\xbe\x04\xf1\x0c\xbe\xed\x84\xd5\xbdG\xedn>\xf7G\xae\xbe\x01\xd3\xa9\xbe]\xf1X>\xe8\r\x13\xbe\x0f\x93?\xbem{n>\xea\xa8\xcf\xbeLl\x15=l\xf7\xd4>\x1c\x10f>p\xf9>>\x84\xc7\xd5>\xad\xdb\r>\xdc\xf0\xc1\xbd\xcdij\xbd\x81V\xb6>\x17\xfb\xd0\xbe\x1a?\x90\xbe\xec(\xae\xbd\xce\xff\x00?\xf1\xa3\xbc<\x89\xb1\xc5=&\x98\xfd>\xc9\n\x19>,^#?\'\xb7d\xbe\r\x82"=\x11\x95\x14\xbf\x1f]\xa5>1\x95\xe2\xbc\x94\xc4t\xbe\xad\xcd\x04\xbf\x86q\r\xbfc\x16d>oW\x87=?\xf9\x80\xbc\xf0\xd6\x9d\xbe\x91]\xb1=a\x8a\xad>VrI\xbeZ7_>T\xae\xc8\xbeu\x86\x85\xbe\x8f\xd75\xbf9"\xb7\xbe\x7f\xa5\xda\xbc\xf646\xbe\x9d\xb4\x08\xbea\xe7\xba>L\xd3\xd3>\xb7\x1dV>\xc1\xa3!>\x1c\xc5\xa7>\x9a$\x97\xbd\xbc\xd4\xb3<V\x1d\xa2>\xf7C\x87\xbe\xb0\x13\n>\xdc\xc0\xe6=$\x07\xb2>\x94>\xee\xbe\x1d\x06A?\xd7\xe1\xe3=lL\x8a\xbe\xe5X\x83>\x110\xc5\xbe\xf0\x98\xc9<zI\x07?\x1a\xa6\x95=\xf0OH>\xdd\xd0\x8c>\xcc\xfb[>\xb6,\xb3\xbd\xc6\x8e!>\x89\xda\xcb>\xc7[\x16>B\xc5\x8c>\x1d\xe7\x19?]\xff\xac\xbe\xd1$e=\xda\xbcG=`\xcc\xbc=D\\\x97=\xff\x89\xc7\xbd\xf3W\xc0>\xc9\x9b=>\x06/{>\xdd\xad\x00\xbdD\x97\xf1=I\x86\xfb\xbe\n2\xe3>\xa6,a=c!p=I\x1d0?\xd3\xab\xdb=\xbc\xa7\x97<\x8c\xfe\x0b\xbd\xd7\xd0\xa3;\xf9\xb5\xc5>\xe7L\x9a\xbeJ\x9f\x0b\xbd\xedq\x0c<\xe7u\x07>l\x82\xbb<$=X>\xdc"\x83>,\x90\xc0;Wq\n>\x9f+->s\xaby\xbd\t-g=1\xb3\xe2=\x91>a<FSs\xbe\xebm\x0f?aq\xa6\xbc\xd0\xb0\xf0\xbeL\xc4\x9a>*\xbcG\xbe\x94\x13r>\x1d\xa2\xda>\x03\x01k\xbe\x0cc\xc3=:\xbeo=\xc9\xb4\xea\xbd\xcft\x8b>\x96\x00\x83><W\x00>\x0f\x7f\xf3>\x8a!\xda\xbd\xbdqy>+ \x18>\x84\xb6\xa7\xbe\xb3\xe3O>\xea\x88\x85\xbe\xe7\x1a\x01\xbf\xcd4a\xbe\x14b\xa8\xbc\xcc\'%\xbea\xde\x1b\xbf@2\xd8>\x0f:\x08\xbei\xfd\x1c\xbe\x9a\x07\xe5=\x94R\xa6\xbe\xc0]\x82<"\x95\'?\x11\xe3%>\x97\x18\x07\xbc\xafs\xab\xbe\x1a\xcf\xd4\xbe7\xe5\x08>M\xef\x82>\x9a<\xe1>Y\xfa&=)\xe2\x18\xbe\x8c\xbdO=\x1f\xe7\xd6>\x1d4z\xbd]\xf9\xd1>\xec\x95\x90=\x80\x0c\x9a>Q\x83x\xbe\xb4s\xac>\xd6\xba\xce=9\xf2J>\xec\xac)>\xed[\xfa>\x90\xae\xb8>`e#>\xcb6\x07>9\xb9\x95=\xac\x00+>'
-p2276
-tp2277
-bsV503959152205365248
-p2278
-g2
-(g3
-(I0
-tp2279
-g5
-tp2280
-Rp2281
-(I1
-(I200
-tp2282
-g12
-I00
-S'0\xd3\x10?\x13\xd8\xfe=\xa6&\xda\xbe4\xd1\xd6\xbc\xb6\rE>\xd9-a=\xcd\nS\xbd=[\x93\xbe\x1a\t\xe1<\xab-\xc6>\x92-\x06\xbe\xd3\xbc2\xbej5!>\x82\xadX\xbd\xc2\xf6\x8b=\x08}\xe6>\xa5"\x1b\xbe,\x1e\x11\xbe\xbf\x87\x85\xbeR8X\xbe\x1eR\x07\xbe{\xa9)<\xc6\xb4\x83>h\xcd%>\xe9\xdc%>\xeb\'\x10\xbe\x94\xfd2>\xec!f<\x90\x07\xaa\xbe\xcfW}\xbe\xc5\x01,\xbe\xd4B\xe2;\xe9A\xc8;u\x91\x0f\xbf\x18\xcf\xda=\x85\xeb\\>\xb7E\xb5>\x04>a>v|\x9c>\x14\xf9\xf5\xbdq\xcd\x80\xbe\x97\x10\xc5\xbd[\x051=\xbcp\xfc\xbd(\x15\x82\xbeia\x04\xbe\xaf\xb1\xde>\xafy\x0e>S4\t>\xb5\xe9"?m/\x9c\xbdH\x81\x08?\xe4Pw\xbe$h6>\x03\xc9\x00\xbfL\x93\xd4=\x00\xd6\x82=\xf3\x1b^\xbd\x95\xff\x19\xbf\xc65\x05\xbf\xce\xd4\x80>j\x0f\x0b?\x9b(\xcc>\x854>\xbe\x98-)=x\x025=\xc3r\xac\xbeCx\n?\xc7\xb9\xa0>W\xb7\x95\xbe\r,\xfc\xbe;\xb1\xeb\xbe-\x13\x91\xbej\x06\xbe\xbd#]\xe8\xbd\x9f\xa4m\xbc\xc7{X\xbd\xeaX\x1e>\'\xf6\xa9>Z>u>%\x00\x92<\xf749\xbc\xf1|\x01?\x8c\xc0\x91\xbe\xb3\xae\xa6=\x90c\x9d=v\xef\xa1>\x83\x9c\x82\xbevc\x07?<\xf1^\xbej\xe8\xb8\xbe)\xe0\xd4=c\xd1\x8f\xbe\x94\xdf\x99\xbe\x02\xf5\x8f>\xa9\xcc\xf6<N\xab\xb5>\xb5\xe6\x80>\xdb\x0e\xf7=\xe9_q\xbe|\xc2 \xbdQm]>VE\x82>}\xf2\x88>\xbd\x8a\x01?\xa2\x04G\xbe\x87\x93\xeb< \xc2\xdc>\xb0Qv\xbb\xcb\xbd$\xbd\x17\xa9\x08\xbf\xdb\x86\xa4\xbce\x8d\xb6>~l\r>w6s=\xccj\x87\xbd\xc2\xbf\xd4\xbeg\xf4=>\x84H.</\x9f\x81\xbdn\x81\x0b?gZ\x85>6\xd6\xe2\xbcy\xe5\xaf=\xbc\x9f\x06<\x15\xb3\x94>\xbbs\x02\xbe\xcf\xb4\xe4=\xccU\xf1=*}L>4-\xfe=\xd6f\xe2=^\xe7\xd4<\x89/\xed=V=\xa6\xbcW\xc4l=2\xa8\x05=y\xc4\xd4<5\xf5\xd4\xbe\xe2}\x00\xbe\x05m\xa7\xbe1\x10\x81>\xfc\xba\xa1>f7\xe3\xbe*\x1a\xd4>\xb5]3>7\xa3\x9c=\xd09 ?\x17M\x06\xbe\xa2\xee\xbc\xbc)6;\xbcm\xb5+\xbe4O\x88>\x05\xa4)>\xf2Q\x89\xbdx\xc8\xdb>S\xa4\x9b\xbe#\xdb\x82=\xb9\xdc\xf7=\xa2\xb9\xfd\xbe\\-r\xbe\xb8j\xae\xbe\r\xdb#\xbf\x0c)P\xbe\xc6\xc48>\x18\x02\x939jx\xf7\xbe1\xa5\xc5>\xe2\x95\xc2=t\n1\xbem!\x86\xbc\r8\xa1\xbeS\xb7\x95\xbew\xea\xf8>\xc041=\x8f\xedM>\x13\x88\xa3\xbe\x00^&\xbf\x03\x98k>\xff\xe4,>\n\xf8\xb2>\xb9)\xd0<\x80I\x9f\xbe\xbe\xe0\x19\xbe\xb7<\xe9><}B<\x87$\x83>\xfa{\x1d>\x969\x8f>\x92nO\xbd\x12\xa8\x8c>\xf8\x85\x9e\xbb\xe8j>>n\xec\x99=\x89K5?\\t\xa5>\\\x91\x91\xbd\xba\x9du<:\x9b;>\xb1B\x83\xbc'
-p2283
-tp2284
-bsV504212490285514752
-p2285
-g2
-(g3
-(I0
-tp2286
-g5
-tp2287
-Rp2288
-(I1
-(I200
-tp2289
-g12
-I00
-S"3o\x1b?a\x80\xae\xbdb\xbd#\xbf\xd9\x8cg\xbd\xd9\x98\xc7>BS\xc4\xbd\x11*\xb0=\xa5\xda\x8c\xbe\xf5\xb1\x90=\x9b\xd2F>\xad\xaeI\xbdok\x90=\x95\x04\x8a>\xd1\xdc(\xbd\x93\x97\xca\xbdJ&\xfe>*:%<\rk\xd3<\xf7k\xa6\xbe\xb7\xc8q\xbd\x96/\x86\xbe\xad\xbd\xc4=\xd6\xb1^>\xe5\rA\xbe\x03\x9f@=\xff\x84\x8c\xbe\xe6\xf8\x88>\x80+[\xbe/T\xa4\xbe\xb3\xd1\xc5\xbdN\x92Z\xbc%\x19\x86\xbbC=\xdd<\xe3%\x13\xbfg\xeb@\xbd\x0b%M>wNu>\x89v\x9a>2\xf0\xbd>G\xa2%\xbe\x1a\xd9\x8f\xbev\x9f\xbf:\x86\xea\x02>\x17B\xaf\xbe\xb0\xd9\x8f\xbe\n$^\xbe\xaf\x1a\x00? A6\xbd[\xf1\t>\xe8\xc5\x1f?#\xe0\xb2=\xc9AA?\xf7\xdc\xcd\xbe^\x93\x8e>2B\xb5\xbef\xb6\xa6>[`\r>\xcb\x94\x99\xbe\xca*\xb8\xbe\xb0\\\x1b\xbf\xd5\xc3\xa7>\xf9\x90\xaa>!1\x0b>\xa7,\x1e\xbe\x9dOV>qp\x14>\xba\xc9\xac\xbeKU\xcc>\x9a\x06\xc0\xbd\x08\x1c\x87\xbe\xf0#\x16\xbfAs\xb3\xbe\x07\xc5\x9c\xbdV\x03#\xbe\x9fmj\xbe*G\xc8=&\xf6.>U;\xd5=\xc31Y>\xd1H\xc4>\x93\xf7\r\xbeJ\xc8\xd1=6\xd4\xc1>o\x7f\t\xbe\t\x0b\xb3<\xdas\x1e>\n\xba\xc5>;\xc9\xdd\xbe)\xfe6?`\x99\xd4\xbd\xfb\x15\x00\xbf\x13\x93<>\xeaK\xda\xbe\x0bp\x0f\xbe!\xa4\xee>`\xb8R>Vi\x80>^>n>\x9a-g>\xed\xf8G\xbe\xdeln=\xc5\x98\xa2>\xde\x81\x84>oZ\xb6>\xc0\x90\xc2>\xee2\x85\xbe\xfe\xfc\x8e=\n\x1f\xb5>\x15\x9b<=H\x9c\xd7=\x9d\xdf\xb5\xbe\xb5(\xda<.\xfbm>/\xab-=\x9e\xed\xc2\xbd\xebC\x12<!\x9d\n\xbfU\x1b\xb1>\x89\x1c(<b\xff#\xbd\xa7e%?0D1>\xbbJ[\xbc\x80\xa2A>\xcc\xd9\x08>S9\xe8>\xd7P\x81\xbe7H0\xbc\xe8\x1a\x86=\x0f\\\xc2=\xc8>S>\x0b\xa1 >-44>v\x9aI=\x17&>>\xe5\xd9\xae>=V\x1f=E\x13\xc2=\x90{\x1b\xbe@\n\xe6\xbb\x0b\xb7\xc1\xbe\xab\x8a\xe0>\xe3_\xa5=M\xf1\x15\xbfq\xc3\x94>P \xdc\xbd\xf7|f>y\xb0\t?\xdeh8\xbe\x89\x98W<\x1e\nz\xbc\x7f\x1eq\xbdj\x8b\x83>\x0b\xd8\x13>\x82\xb3\x12>\xdem\x19?#\xd4\x87\xbe\x9bh\xfb=\xe0\x0c%>/#\xba\xbee\x81\xd8:\x02Zj\xbe\xf9\x8c\x10\xbf\x190\x9f\xbe\x96\xa7&>i\x19\x07\xbe3p=\xbf\xce\x9e\xbf>\xaa\x8e\x07\xbd;\xf1\xc5\xbd.\xfaj>\xb0\xdc\x84\xbe\x7fr\x1d\xbek\xe8.?\xf7\t)>\xb2\xb1\x85=s\xa5\x86\xbe\xdb\x17#\xbf\x8d\x08\x92>\xda\xdcR>fs\xea>V8#=\xe5\x1f\x95\xbe7\x1c\xd1\xbc\xab\x91\xb6>\xab\x9e\x0b\xbd\xb0p\xfb>\xb5~1>\xef\x13|>\xf7\xa3\x95<\x15{\xc5>\xb2N\x93=\xe8M\x85>(\xd7x\xbdx\x82'?\xf8\x95\x82>0}`<\xb0\xe1\x14\xbd\x9e+b=\x17&\xa3="
-p2290
-tp2291
-bsV503976918228533248
-p2292
-g2
-(g3
-(I0
-tp2293
-g5
-tp2294
-Rp2295
-(I1
-(I200
-tp2296
-g12
-I00
-S'`\x0c\xd4>\xb3{\xb3\xba\x98\xf4\xc2\xbe\xa0Z\xcc\xbd" ?>\x86n\r\xbd\xae\x7fT=b\xa5\x0b\xbej\xdc\x02<\x03\xacR>\xa3b~\xbd\x96\xbf\xec\xbc\xf0\x94\x16>f\xc7\xd5\xbd\xa7\x8e\x9c\xbd\x1eu\x8b>U\x90=\xbd\xdc4\x10\xbd\xda\x9b9\xbe\xcd\xeet\xbc\x06\x16\x82\xbe\xce>\xd3=>\x85\xb2=\xd2k\xab\xbd\x02\xc6\x97<<\x18!\xbeM\xceZ>F\x05\xc6\xbdj\x1b\x8e\xbeLu\xb6\xbd\xce\x8d\x04=.\xa3D=\xc9\xc4\x81\xbcpG\xa7\xbeB0\xe6\xbc\xcfH%>\x108<>_\x91+>\x12Y\xa0>d\xb4\xbe\xbdh}-\xbe\xa8s\x12=\xd8-\x13>p\xffa\xbe\xee\xc4\n\xbeE\xe1\x04\xbe\xd5\x00\xa2>\xfd\xea\x93;\x0e\xc4\x97=\x93\xc5\xdb>\xed\x93_=J\xda\xeb>D0\x8c\xbe\x1e\x01\xed=@\x93\x9e\xbe\r\x02Q>:\xd4\x0e>\xfb+\xd9\xbd\xf2:\xc4\xbe\x81\xce\xb5\xbeh\xe2\x87>(\x8f\x99>\xdd\n\xe1=\xc1\xa8\xa8\xbd\x12\x1d\xa0=\x90\xa1\x04>\xc8oJ\xbe\x8a\x03\xa6>{]\xf3\xbd\xd4\xd5\x17\xbe\x1d\xff\xbc\xbe\xc9\x86\x87\xbe\x0f]\xc3\xbc`=\x96\xbd\x848\x1b\xbe\n\xee{=K\xdb\x07>\x89\x99\xab=\x9b\xa1\x07>\xa6\xf0W>\x1d#l\xbd\xa2\xd5\x10\xbdJC\x93>\x1a(/\xbejA\x89;\xd7%\x9f=\xcb!A>}\x1by\xbe\xe3d\xd0>\x03\xf3\x14\xbd\x00\xdfx\xbe\xe8\xca\x00>\x80F|\xbe\xb2\xc6\xca\xbd\xac\x08\x8b>\x8d\x07\xfa=:\xa8.>\x9d9G>\xfb\xa3\x03>R6\xbd\xbd\x8a\xaf\xf2<\x93\xf2D>\xd6(7>\x1f\xfb">ZGb>\xee:Z\xben\xb9I=\xb3\rz>\xf3\xd3U;\x93\xdd\x83<@\x7f\x8d\xbe"\xfb\xbe<\xde\x07$>\xc3\x93\xaf=F\xbb\xa7<\x8b\xc1\x0b\xbd\x9bC\xb3\xbe\x13Nr>\x9f2\x11<\x1b\xb2\x1c=>\x96\xcc>E\xfe\xcd=\xb3\xe7\xb5\xbd\xe6\x1e\xe4=z\x14\x81=\xceR\x92>\xee//\xbe\xe5\xdcL\xbc\x11\xe3@<3\xf83\xbb\xcal\xc9=\xde\xfe\xc2=\x1e\x9e\xc0=f^{<\xbfK\x92=\xb3\xbd\xe7=f\xbc&\xbb-\xd8\xcf;>A\xc1\xbd\xce\xe9/=KQM\xbe\xb3\xc8M>\x8ea\x96=\xad\x9c\xba\xbe\xbd\x84\x85>6V\xad=\xd3\x84M>\x8e3\xbe>\x826\x00\xbem(\xa0\xbc\x1e:\x89\xbdl\xcd\xca\xbd\xceZd>\\\x03*>\x8e\xacQ=\xa4\xe5\xba>X\x1d\x14\xbe8\x96\xfe=J\x19\xc7=\x0e\x8c\x8b\xbe\xde\xa8i\xbd%\x8d\x1a\xbeK\x9b\xac\xbe \xe7\x83\xbe\x83\xb6\xd0=\x9f\x1d\n\xbe:\xcd\xec\xbek\xc4.>h\xb2\xb1<\x9c4\x1b\xbc\xbe\x11\xd3=\xaa\x00\xf5\xbd\xd3\xdc\x80\xbd6j\xf0>]\xe0\xe3=dO\xc2=:\x87v\xbe\n\xc6\xe6\xbe\xec\xcc\n=\xf0\xfa\xf8=\x92z\x7f>\x8aA/<]\x18o\xbeRW\x16\xbe\x08\x11\x8c>\x0b\xd1\x9d\xbdv\x8eP>\xf5\xc9\xcf=6\xcb9>H\xc8}<\x1e\x98\x18>\xf8\x8f\x0c=\x90\x12&>\xf2\xe3\x0f=\r\xbe\xdf>j\x05y>\xa3z4<\x13\x03\xec\xbc\xbb*l=\\?\x84='
-p2297
-tp2298
-bsV503974408781041664
-p2299
-g2
-(g3
-(I0
-tp2300
-g5
-tp2301
-Rp2302
-(I1
-(I200
-tp2303
-g12
-I00
-S'\x98gf>\xc4\xb7\xa5\xbc\x85\xfd\x83\xbe\'b>\xbd9t\xff=8\xa9c\xbdY\xd8,<\xad\xe9\x17\xbe\x9d\x1a\t\xbd\x81p\xd5=\x0f\x84\xd0:\x81"\xbd;\x94\x86\xea=\xb54\xf6\xbb\xbc~\x9d\xbd\xcf\'\x1e>\xa3U\xd9\xbc\x17\xb3\x16\xbd\x9a\x94\x9d\xbd\xd7\x95\x91<\xe3,-\xbe\xdc\xce\x1e=\xb0\x1c\x18=\xc8\xb2\r\xbe\x97\xe7\x91\xbc\xb9\xcb\x83\xbd\xb2A\x18>+\xaa\xe1\xbd!\x809\xbe\x85b#=\x9b{x<\xdf|&\xbd\x80\x7f2=\xe4\x91+\xbe\x98"S;s\x87\x16>\xd9\xfb\xa3=\x83y\xb9=\xafEY>5\x1eI<7\x07\x95\xbd\xc1\xd4U;\xc9S\xf7=7\x92@\xbe\xe8\x0c\xc1\xbd\xdd\xbdA\xbd\x18>L>\x0f\xc7\r<\x11\xff\x11=s\x95l>\xe4\xce/=\xab\xb3|>\xb2\x14\t\xbe\xb7\x9b\xa2<l\xa5Y\xbe.\xd2\x06>\xcfXW=\xd0wj\xbd\xd2\x1b\x8b\xbe5\x9cm\xbeh\\1>\xa7\x91\xf4=\x93\xc2\xe2<\x9f\xa8\xdb\xbd[hc\xbc%"\x06>k\xfd\xbd\xbd+\xb6\x10>\x94\x81\x05\xbed\xebU\xbd\xba\x1f\x99\xbe\xcd\x953\xbe\xcbqF\xb8m\xc6\x86\xbd\x8fY\xbb\xbd\\u\xbe=\xfb\xd9\xfb=X\\\x9b=\x9b0\x99=\xdd\x93\x02>k!9\xbd\x04Tk<Q\xfe)>Kz\xfd\xbd\xa4uV=\x84\x01\x88=\x83)\x04>\xd9\x17%\xbe\xa6\x1f\x87>\xdb\x824<\xbb3\xde\xbd\xaf\xab\xea=\x06\xd4$\xbe}\x8eL\xbc\xadC7>p\x81c=\xe9#\xd9=\x8b*\x08>\xe1\xdf\x83=%7\xcf\xbc\xa3\x02M=\x13@2>o\xf2\xb3=\xd4\x1a\xbc=\x0f\x9aN>\xf9\x85\x0e\xbe\xcaV)<\xfc\xc9\xb0=\xe4\xf5\x03=\xab\xd6&:xE\xc3\xbd\x0f\x7f\xbd=\xa7\xee\x97={6\xcb=CD"<obt:\t~:\xbe;\xa7+>)Z\xd0;\t\xac\xa5=$h\x89>\xedv\x89=#K\xd8\xbc5\xc1\x19=\xd7\xf3\x8f\xbb\xa9\xed3>\x17-\xe4\xbd\x8bC\x95\xbc9\xe4\x9e<\x0b8r=\xcb6n=\xd5\xd8\x90=\xeb\xcc\x8a=)\xe4\xc9<H\xf5\xd2<e(i=p^\x9b\xbc\x08"\xc7\xbc\xff&\x88<h\x15]=x\x99\x04\xbe\xbc70>\xe4\xa3\xee;\xabr`\xbeMJ\x19>\xad.\x04<+\xb7\x1c>/\xc4=>\x83\n\xb7\xbd\xb3\xf6%\xbdO\xa7\x18\xbd\xcc\x12\xaf\xbdQ\x164>\x1d\x9c\x03>\xa1\xc1\x07\xbb\xdb\xf4d>\xa3\t!\xbd\x9f\xc7\xc1=wy\x08=\xdbr\x07\xbe\xcf\xc1\x16=v<\x06\xbe3\x19Y\xbec\xde\xf5\xbd\xbbV*<\xceB\x9d\xbd\t\xd2\x8a\xbe\xcc\t\x02>9\x1e\xd4;,5\x85\xbb\x93\x03\t=DL\xdd\xbd\x9c\xe4\x13\xbd\xfd\x92\x8f>\xf1\x1fx=\xf9\x10\x13<H\x96I\xbeY\xbe\x87\xbeHz@:\x80\xe1s=\xd9\x01\x04>\xfc\xd8\xc3;\xf7\xfa\x0e\xbe\xe2\xb2\xa9\xbd\n\x05\x19>\x1de`\xbc\xe4t\x01>Gd*=_\x931>\xe3!\xab\xbd}t\xd8=$s\xe5<\xcbc\xc6=\x97\x17\xbe=7\xdc}>\x18\x154>\x88\x97m=\xbfJ\xd7<\x18\xfc\xfb<\xbc)\x80='
-p2304
-tp2305
-bs.
\ No newline at end of file
@@ -1,1429 +0,0 @@
-(dp0
-V445269155327913984
-p1
-cnumpy.core.multiarray
-_reconstruct
-p2
-(cnumpy
-ndarray
-p3
-(I0
-tp4
-S'b'
-p5
-tp6
-Rp7
-(I1
-(I200
-tp8
-cnumpy
-dtype
-p9
-(S'f4'
-p10
-I0
-I1
-tp11
-Rp12
-(I3
-S'<'
-p13
-NNNI-1
-I-1
-I0
-tp14
-bI00
-S'\xcf#\x16?\xf3{B>s\xb8\x00\xbf\xa6M&\xbd\x85\xc5\x05>\xda\xaa\x88=\xf3_\xa2\xbd1\x80\x86\xbeA\xc8\xeb=\x1d\x15\xcf>jl)\xbe\xac\xe6Z\xbe\x93\xf59\xbb\x11\xc2\xc6\xbd\xcf\x87\xef=\xe8\xb7\xe7>u\xeb,\xbeU\x15?\xbe\xe3\n\x96\xbe9\xa8\x85\xbe3\r\xf7\xbd}y\xa2\xbc\xf70\xa7>\x82d\xa4>o\x15 >1\x0b\x18\xbe\x05h\x81>\xb66\x9d\xbb\xc1w\x9f\xbe9\x85\xcf\xbe`\x91X\xbe\xea{\x1c\xbd[+H\xbda\x1a\x1d\xbf\xc9\xa7\xbb==k\xa9>\xa9p\xb9>\xaeh\x84>Uu\xa6>Dh\xd4\xbd\x93>\xc7\xbeiN\x19\xbeh%\xa5\xbd\xb2>\x14\xbd1P\xae\xbe=\xbb*\xbe \x0b\xe9>R\xad!>$\xbc>>\xc4\xac/?1\x93\xd7\xbd,\xe4\xf1>\xca\xd7\x86\xbed\xdc\x0e>g\xa0\xdd\xbe\x10\xe4\xc0=\x14\xd4\xb5=t\xf2\x86\xbdJ;\x1a\xbfK\x7f\x19\xbf\x16\xc2\x84>e\xf5@?\xf3\xe4\xe4>\xf4\x01`\xbe\x0f\xdc\xa6=\xdd\xab\xed9\xd0\xa1\xd4\xbeu\x06\x12?\xa7\xe0\xa6>\xf8d\xa3\xbe\x954\x03\xbfi\x04\x0b\xbf\xd9\xc1\xbe\xbed%\x1a\xbe<\x07N\xbe\xf1Z\xc5\xbd\xc9DB\xbdqu\xcb=\x0f\xc1\xdc>Ih\x84>\xe7#\x05=\xac(\xb1=\x14\xaf\x10?\xdce\xad\xbeSW\x04>\x84~\xfd<\xf7K\x9c>\xc9w\xab\xbe\xc7\x9e\x14?\xc3\x0eY\xbe\x08\xff\xe1\xbe\xdb\xb05>\xf7@\x8c\xbe\xc3ky\xbe\xb3\x08\xab>z7\x9f:\x98Y\xcd>\xc91S>;\xe6\x1a>\x99\x90\x80\xbe\x17\xdd+\xbe\xc5\x82q>\xe4\x00[>\xfeE\x9c>#\xb4\x04?5\xeb\xa0\xbe\x02\x8b\x8d<qY\r?y\x93+=(\x12\xb4\xbd\x88~,\xbf\xac\xe1y\xbe}p\xe3>\xd4Q"><\xfeK>\xff\xeb\x85\xbd5\x98\xee\xbe\xd4N\xd0=\xa5\x92}\xbd\xa71\t\xbe\xf1\x8a\n?+D\xaf> i\x8f\xbd\x99s\x91=\xc5\xedO\xbd\xafP\x97>Wh\xd5\xbd\'\xe1\xe9=\xd0\x8b6>\xf1iU>\xbbs:>Po\x18>\xbd?\xdf<\xfd\xd0,=G(3\xbe\xed+\xeb=\xad\r\x0b<\x8b\xcaE=\xb8\r\x13\xbf\xacf\x93\xbdu<\xbc\xbe \xf3\\>z"\x91>\x9d\x06\x07\xbf=\x7f\xe6>0K8>%\x9fS=/\xe5P?Q;\xde\xbd\xbf\xc0\xbc\xbc\xa49\xa5\xbc%\xb9\x17\xbe\x02d\x9e>\xe9\x03,>\'\x01\xba\xbd\x9e\xe4\t?\x13\xec\xcb\xbe\xf9Y\xf7;\x95y2>\x80\xb9\xea\xbe\xbd\xaf\xb8\xbeDx\xb6\xbeS\xc1"\xbfUC\xa9\xbe\x89U\x1a>dnu=C\x08\x0e\xbf\x13Y\xda>\x7f\xbf*>\x90C\xb3\xbd\x8b\xea\xc4;4U\x95\xbe\x984\xd4\xbe\xad\xbe\xf3>t/\xb8=\xf6\xe9\xa0>\xf5\xe1\x96\xbe\xed\x9a/\xbf\xc5\x1d\x9f>||.>AL\xc4>Q\xf5\x81<\xb4\xe6\xb6\xbe\x98(e\xbeqO\x02?\x16h\x1f<S\xcc\x8e>\x9d\x89\x17>Aw\x8f>\x8aU\x1f\xbc\xaf\x05\x96>\xf9\xe5\xa6:\xa1\xee\x84>\xa3\x1d\x8d=\t\xa1B?S\xa9\xcc>\x9dm\xee\xbd\xf3g\x00\xbd\xa4 F>*\xb7)\xbe'
-p15
-tp16
-bsV445233019721637888
-p17
-g2
-(g3
-(I0
-tp18
-g5
-tp19
-Rp20
-(I1
-(I200
-tp21
-g12
-I00
-S'\xb5n\x18?\xfba\xae>\\\x1cA\xbfa\xad%=\xa1\x0e\x1c>\x1cI\xee\xbd_\xa9\xcc\xbd\xe9\xa9\xac\xbe\xb6\xbc\xd6\xbd\xf1\x13\xe2=\xb3\xa2\xda\xbdyf|\xbe_=\x1f>0\x93\xe8\xbdD\xd7E>]&\xf6>\xa9\x9f\x9c\xbdC\x04\xca\xbe\x11\xfa]\xbe\x9d\x8eC=\xe7ZO\xbeX\x8c\x84\xbdD\xdd\xbe>\x01\xf3:=iC\xa7=\x97\xca\xa8\xbd\x07o\x1d>]\xcd\xf4=\xfa|\x8c\xbe1\xab%\xbe8<1\xbe\x80\xafv<f(\x1e\xbdm\xc0\xda\xbe!\xda\xcb=\xb4\r\x97>\xfd\xcfm>\xe8\x04\xba>6\x85\xc7>\x10\x1a\xe4\xbd7B\x8a\xbe\xc36\x17\xbdw\x80\x1a\xbe!\x83\x0f\xbe\x9a\xe6\xf0\xbe\xff\xb1\x1a\xbe\xaf\x1b\xe4>_\x19\x86=\xca*\x13>\xb7T"?\xb7\xe3\xad<\xa3\xde\xc1>|\';\xbei\x91\x14=\x16*\xba\xbe\xffs\xa9=\xcc;\x14>\xcd\xb1\x82=\x86J\x05\xbf/4\x02\xbf\x81`H>6\xbb$?s\x04\xaf>\x902\x90\xbeCO\xcc=\x9fD\x01>\x9f\xa7;\xbe\xf68\xf8>F\x91\x04>P:\x87\xbe|-<\xbf0\x8d,\xbf\x98O\x15\xbf\x8a\x81\xb0<\xb7\xd7\x89\xbeq*\xda<\xe9\xfb\xd6<\xe5\xcb0>\x03\xf3\xee>\t\xce\x84>\xad|\xbe=Zw\xd2=\xd2\r\xb0>\x11\xc3\xb8\xbe\xe6S\xed=1\xea\x92>\x1d\xcd\x8d>v\xe9\x9b\xbe#\xe6\xfc>!\xbb\xb1\xbe*y\xcf\xbe\xd4H\xc2>]\x8b\xc6\xbea\xde\x8c\xbez4\xca<\x12K\x03>\x81Z\xc3>\xc3\x0b\x81>\xe0\x82c;a6_\xbe\x17*\xb4\xba\xd4\x9b\x90>\\\x9d0>L\x84\xba>\x83`\x1f?\x91\x7f\xc3\xbe\xd6*j\xbd\xf9e\x16?\xa7:0\xbb\xda\xcf&\xbd\xee\x1f\x0c\xbf\x81\xa8W=\xef>\x1c?\xf5\xf9\xaf>\xdc\x85\x10>(\x1e\x94\xbe\xb1\x18\x07\xbf\xd6{\\>}Na\xbeQ\xeb\x11=\xe7\xad\x1d?mE\x91>\xaa8^\xbe\xec\x98\x03>\xe91\x93<\x01M(>\xac\x1b\xa2\xbe<\x99m>#W\x18;p\xce3>\x9f\x85<>\t\xd3\xe1>\x8c7\xd6<\x14m\xef=\x9cBk\xbe\x9f\xd0\xdb<\x02P\xb4\xbdv\xd1O\xbd\xa0\x97\x02\xbf\xb3\xe0\xcb\xbd\x8c\xde\xa9\xbe!\xc6\x9e>j\x00}>\x14f\x13\xbf\x9a\x94\xeb>\xbd8\xbb=\xe0c\x1f=\x00\xc9b?\xe4F\xbe\xbd\xa7/~\xbd\xe7H\xaa><\x0b\x92\xbcO\xf8\xe2>u\xb3\x98>5\x03\xb3\xbdx\x1c\x0e?\xccMu\xbe\x9d?\xff<T\x0b\x92>/\xeb\xef\xbe\x8d\x02H\xbe\x01\xb1\xe4\xbe\x14\x8a\x07\xbf/\xce\xcb\xbe\xc35\xe8=\xeb\xf7\x17\xbe\xca^\t\xbf\x91P\xc2>7\x8a\xc0>\xa0\xc2C<\x04\x9a\x99\xbd\x13\xcd\xd6\xbe$\x81\xdb\xbe\xef\x95\xca>\x80\x18z\xbd\x11\xae}>\x825\xa4\xbe\x89\nK\xbf\xfaI\x88>\xd1\xee{>g|\xc1>)\x05Q\xbe|\x87\x80\xbe\xf1\xdaz\xbe\x96L\n?\x9e\x18\x8b\xbd\xa1\x7f\xc6>\xa0\xd4\x84<\xf4V\xea>\xc1S\xf2\xbd\x7f\x19\x8d>\x19c\r<\xbe\xe1\xa1>\xff`\xbf>\xbf\xed\x16?\xd6F\xff>Y,\x1a\xbe\xa7!\xea=M>\x07>\xe4\x0f\x80\xbe'
-p22
-tp23
-bsV474094092717015040
-p24
-g2
-(g3
-(I0
-tp25
-g5
-tp26
-Rp27
-(I1
-(I200
-tp28
-g9
-(S'f4'
-p29
-I0
-I1
-tp30
-Rp31
-(I3
-S'<'
-p32
-NNNI-1
-I-1
-I0
-tp33
-bI00
-S'\xc9\x04\x01>,\x8b\x9f<\x1f(\x02\xbe{\x87X;Za\xa5=-\x04\xdc\xbb\xec\x0e\xb3\xbc\x8bC\xdc\xbd\xa0V\x0c\xbdgR\xc8=D`\x07<7\x9a\xbf\xbcFSa=\xb9\xf5\xf2<[\xeb-\xbd\xdc2\xfb=\x99\xfc;\xbdo\xbb?\xbdq1q\xbdT+\xa7\xbc\xeeB\x8f\xbdk\xc7\x1b\xbc\xe2\x11Z=\xe9\xca\x10\xbd\xc10\x94;\xedH\xb5\xbcm\xfd\x89=z\xad\x90\xbdz\xf5\xcd\xbd\x9e\xf5\x06</16\xbd\xd61V\xbd\xb9\xafj=\n\x80\xfe\xbdy\xad\xb3<9q\xe8=\x07\xdf\x97=\xd2{[=\x16\xbb\xd0=\x1d\xc7\x17=\xd3F\xe5\xbc\x9a\xc9\x0f\xbdJ\xb1\x98=\xfa\xae\xc5\xbd\x16\x9ao\xbd\xac\xa1\x93\xbb\xdd\xb7\xfe=<\x0b\x03=\xbe.\xd5<\x85\x9d\x1f>\xd6\x99\x1a\xbc$\x03\x16>>\x80@\xbd#5\xc6;\xa0\xce7\xbe^\x1e?=c1c\xbc(\xfd\xed\xbc\x86\xddP\xbec\xde&\xbe@\xe6\x95=\x8f\xab\x9e=\x192\x0b=i\xb5\xb6\xbd\xd9e\xbf\xbcB\xba\x93=\x08B\xa9\xbd\xa4\xe7\xb7=\xb0\x9c&\xbd\xbeb\x93\xbd\xe6b;\xbe\xe3\xea\xf9\xbd\xb7\x88\xaa\xbc\xa3\x87=\xbd\xfe\xd3\xf9\xbc\xbe\xb5\x7f=F\x17\x8e=\xc3\xb3N=.\n\x92=\xf7%\x89=6(\x1d\xbct\x18\x98\xbb\xcc\xda\r>\xfa\xcc\xde\xbd\x0e&\x86=\r\x00\x86<\xc0\x0c\xc7=\x1c\xe4\x00\xbef\xd0>>\x0c)\xf3;\x93S\x89\xbdu\xdd<=Eg\xa5\xbdi\x13\\\xbcWW\x01>\xdc\xbc\xc6:WG\x9b=\xe0a\xbf=$\xdf*=\xa6\x8a\x18\xbd\xa6 \x8c<\xc2\x85\xdf=\x1ea4=\n\x1e\\=\xb2\xbc2>3\xfe\xa7\xbd\x914\x1d<\xacn.=:\xee\xc3<\x12\xdf\xdf\xba\xfaW\x95\xbd!\xe8\xa3=\xb7{\x8f=\xca\xca\x86=\xcc\n\x8f<\x18\xddk<0\x81\xde\xbdw\xf2\xd0=0\x87I<\xb1H\xdb<!\x18>>O\x01!=\x067\x84\xbbb\xe7\xc1\xbc\x82{\x0b\xbdY\xa2\xb3=\xe4[\x0c\xbd\xd8\xc1\xa2<<\xb2\x0c=\xc3\xa2(=\xfb\x01\x879\n\xdf\xa3<\x01\xb7\xe8<\xfcW\x1d<x\x92\x87;OV\x87<"\x8c\xe2\xbc\x8f\x85\xef;\xe0\x12\xb0\xbcc\'\x9b<\x82\x14i\xbdY~\xef=\xe2\xb2\xce<k,\xd2\xbdt.\x00>\xec\xcf\xa4<\x1aZ>=\xbe\x85\x0c>\x15\x93=\xbd\xad\t2\xba\x8d\x94s\xbc\xcf4\x90\xbdY\xff\xd3=}\x95\xa3=\xdc\x15L\xbc\xa1\xa3\xea=\\y=\xbdK\xc51=\xe0S\xff<\xa8\xf7\xe2\xbd\xa0\ny;\xfc\x02\xbc\xbd\xdcF\x16\xbe\xa6q\x8f\xbd\xf6\x93\xad:\x98|\x8d\xbc@x\x0b\xbe\xe3\x8d\xe7=\xc8m\xfe\xbbX\xfa"\xbd\xb4c\x0e\xbcc\xdf\xa8\xbd\x98\xa2\xea\xbc\x8e\xaa\'>\xa5\x9c\xb2<\t_\xa1<uT\x07\xbeM\xba\n\xbe\xdac\x82<\x18\x85J=\xf5\xf9\xe0=\x16\xab;<F+\x95\xbdu\x00\xa9\xbcCZ\xfb=\x99\'\xb8;\xcf\x83W=\xb5\xc6\xc2<\xda\xd7\xcf=\xb9^\x96\xbd\xb6!\x97=\x19M\x12<\xcc\xf8E=\xcb\xbe\xa2=\xc8".>l\x13\x02>\xc0\xb0\xd3<\x0c\x0e\xf5<>m,=\xd3\xf4A='
-p34
-tp35
-bsV445261181347835904
-p36
-g2
-(g3
-(I0
-tp37
-g5
-tp38
-Rp39
-(I1
-(I200
-tp40
-g12
-I00
-S'\xec\x9b\x00>%\x83\\\xbd\xd0\xa5i\xbe7\x9e\xde<\x87\xed\x1a>`\xb0\xa3\xbd\x9b\x0f\xb2\xbc)\xda\x13\xbe\xa9Z\x99\xbd\xbes\x8d=<\xc6\x19=\x7f&V=\x15A\xef=\xfd\x95\x14=\x89u\xc4\xbd&\x9d\x1d>^\xa9\xbf\xbcc\xfcN\xbcw5v\xbd\x88\x95\x85=d\xd5+\xbe%E\xb9\xbc4\x9e\x88<dcn\xbe\xdc+\x86\xbd4\xee+\xbd#E\x13>\x18k!\xbe\xe3o*\xbe\x8c\xe8\x18>\x8b\x96\x16\xbc\x9e\x88\x92\xbd4;\xd8=\x19\x07\x0f\xbe7o\x1e\xbc@\x01>>\x0c&`=\xbc0\x93=\xb5\xbaP>S\xcdI=|K\x05\xbd\xe4\x1b\xc5;u\xdc:>4\x94H\xbe\xf4&\xa6\xbd=\xb8\xba\xbc^\xd0E>\x10\x05\xcf<\x9c\xd8\x13=;\xd0.>\xf0\xb3h=\\\xe0r>\xeat\x99\xbd\xbcM\x84\xbc\xa6\x9a\x84\xbe\xc5\x83\x17>\xcbM]\xbcD%\xc0\xbd\xd9J\x83\xbe\xc4\xe3c\xbel\xf4\xe3=\xec\xf7\x01\xbc5{M\xbd\xcd\x8b\x17\xbe\xdb\x1e\xb19\xbcz&>\x08\xcf\xa9\xbd\\\xbc4=\x95\xbdf\xbe\r)\x1a\xbd x\xa5\xbe"\\\'\xbe\xe9\x0e9=\x00\xc8j\xbd\x927D\xbd\x99\xc27>0\xe8i>\x93:\x95=\n\xc5\x96=\x99\xf3\xfb=\x12\x99Y\xbdF\xfc;<\xde9\x08>\xa7\xc7\x1b\xbe\xfb\x04\x8e=\xf9\x80\x11=qm\x0b>\xf6\xeb`\xbe\xa5[\x96>\xb4\x1f\x93= n\x84\xbdt\xe8\xfe=\x03\xe3\x08\xbec\x1fL=\x81\x82W>\xadP\x95<\xd8h\xb7=\x93M\x0b>\x1b\xf1\xbd=I\x1c\x14\xbc\x95\x83\xce=\xcffM>G\xd5c=n\x9a\xb2=\t\xacy>p\xca\x1a\xbe\x8b\x03-\xbbDM\xbe\xbc\x1e\x0cR=U\x1e\xed;\x83\xb1\xbc<\xf1cC>\xbc\xd7M=,\xab\x06>\xf2\xa1u\xbboR1=y\xe04\xbe\xe8\x8eP>X\x03\xc3<\xb7\x80\xa1=\x87\xe9\x9b>\x18\x86\xd2<u+\xa5\xbb6NC\xbd\xc2\xec\x92\xbc\xda\xea\'>e/\xce\xbd{\x0e*\xbd\xe0\xfb\x87<\xd0\xffs=\x90K\xb5\xbb\x93=^=\xc5C\xbd=Nc\x1b<\x062E=\xe8$\x97=%\x12R\xbd#g\x10<\x1c\x00\xb9=\xaf\xac\x94={\xa8\xad\xbd t\x80>\r\x1aU\xbd\x94\x170\xbe\x02M\xe6=F\xb6a\xbd\xb4|\x0c>\x04h\x02>W\x06\xc2\xbdr]\x12\xbb9\xfc\xb3\xbc\x88\x00\xb7\xbdd`\x17>1~\'>e@\xc4<c\x1eS>j\xda\x91\xbc)\xa3\xcb=\xc4\x00"=\xc0<\xf6\xbd)\xac\xf3=\x90\xac\x0b\xbee\xd0I\xbeoU\xb6\xbd(/O\xbd\xe9f\x98\xbd\x9b\x9d}\xbe?\x0b\x14>\xc7g~\xbdR\xc9\xd2\xbc\xe8n\x88<\x1c\xd7\xf2\xbdv\xa8\x0b=eO\x84>k\x0c0=\xbe1\xe7\xbc\xd2\xe4P\xbe\x00\x15!\xbe\x88~U\xbc\x86\xc1\x8f=L\xfe#>K\x14\x05=\x04\xd8\xbf\xbd \xcf\xc5\xba\\\x19\x15>X\x94W\xbc\xcb\x8b\xf5=\xecf$=\x10\x1b5>\x8e \x16\xbe\x8e\xee\xdd=F\xa0D=\xe94\x8b=\xa9\xd1\xf2=\xe3=.>!\xc8;>p\xd6\xed=\xe1\xb5b=rw\x94<Q\xe0\x9c='
-p41
-tp42
-bsV445260051310075904
-p43
-g2
-(g3
-(I0
-tp44
-g5
-tp45
-Rp46
-(I1
-(I200
-tp47
-g12
-I00
-S'1|\xd0>\xeb)9=\xf0\xdd\xd4\xbe\xfd\xab\x95<\x01\x92\x00>AA\xa6<\xad\xd1";\x83\xb9J\xbe\xd16)=\xaf\x95\x95>\'\xea\xfe\xbd\xb5\xd6\x88\xb8,\xf0\xda=\xdde\xc2\xbd\x92\xceg=oQ\x90>g\x10\xc3\xbdk5\xd5\xbdIhE\xbe\x05X\xbe\xbd\x90\x8b)\xbe\x17\xf7\t=s\xdb">\xe8\xb1\xdc;+\xc8z=\xd8\x13\x00\xbe\xe4\xacr>Yrm\xbc\x85\xe4\x80\xbe7\xdf\x15\xbe\xa4\xbe\x0c\xbd\xaa\xd1\x1c=\x03\xee7\xbc\xc7 \xee\xbe\x1bs\x9c\xbc\xf5JX>\xe9\xa4k>\xa4Xf>\xdf5\xa7>;\xc0/\xbe[\xf4\x8a\xbe\x91\xc4\t\xbd\xc7\xa1\xe8=$\x1a\x0c\xbeK\x83}\xbeY\xca\x13\xbeJ<\xbd>\xfc,\xe1=E\xab\xe1=y8\xf5>p\xb6L\xbcwP\xfb>\x0eYm\xbeUh\x1e>\xa3q\xd3\xbe\xf2\xbd:>wn\'=,j\x1b\xbe2y\xec\xbe)T\xe0\xbe\x8e\xa0D>X\xe0\xb5>|7\x80>\xd6\xde(\xbe\x8cD\x07>\xa0\x1b\xa5=U\xa0\xa5\xbe<\x08\xcb>\x9c6\xda=\x9f\xb5\x11\xbe\x99\xfc\xd7\xbeX\xdf\xd5\xbe~\x93\xf5\xbd\x12\x08|\xbd\xbe\x81\xbc\xbd3}\xa2=\xb5\xe6\xcf=\xcb\xef\x8e=IA\x90>\xc4\xe3b>\xe0\x97s\xbc\xb8\xc4[=*\xeb\xc7>\xe1\xbb\x84\xbe\xd5\xad\x00=\xc9\xfa\x9b;qP\x94>v\x89\x9d\xbe\x83\x1d\xdc>T\x8d\xab\xbd\xe4\x0e\x98\xbe\x1d\x02\x05>n\xfeA\xbe\xca9<\xbe\xa0\xc3\x9c>\x86\r\x1f<N\xbfp>\x07BC>\x84\x12Y>\r3:\xbeCXX=\xfa\xe99>+\xc3#>\x9b\x11n>1(\xb4>\t\xc6m\xbe\x0b\xa8y\xbc#p\x93>\xfeOl\xbc#\x81@\xbd\xb5\x1f\xc0\xbe$,U\xbd5\xa7\x8e>:r(>\xb9:\xa6=\xee<D\xbd9\x0e\xb6\xbe\x91\xecC>>\x1cP\xbd\xec\\\x1b\xbdev\xf4>\xb7\x9b->\xf6\xa5U\xbdN\x07\xda<\x12\xbb\x81=[\x12\x95>\x88\t\xb2\xbd\xac\xc6\xe9<j*\xbc=\xfaG\xca=e\x85\x19>\xe2\x03\xca=\x8bC;<\xc1\x9d\xc9=\x8c\\Q<?\x93\x10>b\x89\xd1<\xcf\x07\xe3=\x90\x01\x85\xbe\x1av\x04\xbdW\xc7w\xbe\xf1\xad\xa2>\xecf0>\x14\xfb\xd4\xbe=\x86\x85>\xb8\x0f\xaf=\xf2\xd8\xef=\x8b\xf8\xf5>\xa1\x00\xd7\xbd\xfec\xac\xbb\xf4"/\xbd|(\xf4\xbd\xbd\x00]>\x89\xdbC>]\xa0\xd7\xbc>b\xe5>\x10\x88~\xbe\x12\x0f@=d\n\x06>\x00|\xc5\xbe\xac\xa4\xf2\xbd\xca`\x9a\xbe\x18\x1f\x07\xbf[\x9er\xbe\xa68\xdd=\xcc\xd2u\xbdR\x0f\xe7\xbe\xbf\xd0\x9b>"\x85\xbf<\xfd\xea\x9f\xbd5q5=\xba\x94>\xbe\xd4=/\xbe\x00\xf4\xed>\x08\xe0:=\x18B\x05>\xdbz\x84\xbeBh\xf2\xbeU\xc2F> \xbb\x80=\x0cy\x86>/\x9e\xa6=\xe7\xe8\x87\xbe\xd0\xb3\xf3\xbd\xfde\xa2>\xca-\x18\xbcpD_>\t\x07\x19>N\x07\x86>\xb3\xb3\x00\xbdt\xfdF>Y\xf7\x9f=FCI>y\x12x=\x8e}\x0e?,\xa8\x9e>\xb8\xd6\xcc;\xaf\xf1\x94\xbc\x9aY\xd8=\x8bpe\xbd'
-p48
-tp49
-bsV445258858743619584
-p50
-g2
-(g3
-(I0
-tp51
-g5
-tp52
-Rp53
-(I1
-(I200
-tp54
-g12
-I00
-S"D\xef\x91>\x1bi\x15=.6\x95\xbe\xb6\xc2\x80\xbc\xab\x81.>\xb4\xde$\xbdZl\xc2\xbcX\x02@\xbe\xe6/\x16\xbdC\x0b\xfe=\x16\x1d~\xbcj\x81\x0c\xbd\xf6\xc7\xe5=r\xfa\x14=\x0e&\x8c\xbd\x96W}>\xc2\x00d\xbd~\xc9\xab\xbd\x0ez\xfa\xbd\x91s\xbe\xbc\xab\x04\x1d\xbeJ=\x80<.@\xc8=\xd6\x9a\xac\xbd\xcc/\x8f<\xea\x99\x9d\xbd%\xc1\xfd=C\x05\xdb\xbd+\t7\xbeZ\x16K\xbc&2u\xbd\x1e\x05\x0c\xbd\xddf\x81=u\x86m\xbe*?>=\xc1lA>\x85\xc8\x01>%x#>\x8b\x10R>\x0b\xc1\x90;{[\xe0\xbd\x8b\xad\xb9\xbc\xea\x0c\x0b>\x10[8\xbe(\xc9\xd2\xbd\xf6cP\xbd\xe5\xff\\>\xad\x8f\xe5;>\x84\x9e=\x94\x9a\xa0>#\x0e\xd9<\x06\x9f\x94>pO\xe6\xbd\xfa1q=S\xdd\x96\xbe\xb5\xbf\xd7=\xa6rk=\x82\xc9\x90\xbd!\xb1\xaf\xbe\xaa\xa1\x99\xbesH\x1c>t\x80@>6\x05`=\xca?\x08\xbeN7\xe9\xbar\xbb\xcd=\t\xd8\r\xbe&rK>b\x9c\x97\xbd:\x05\xeb\xbd\x83\x81\xb5\xbe\xed{]\xbe\x96\x12\x92\xbdJ\x9cX\xbd\xc9\xc8\xc6\xbd2\x97\xbd=\xe74\x07>\x02\xd0\x9d=\xb5\x0b\x07>\x0bH\x17>~U\x08\xbd\x1b\xa39;Z\x84Y>\x06FM\xbe0\xff\xb2=\x15\x83\x8e=\x9a\xa83>}KW\xbe\xd7\x90\xb6>\xe8\x99\x0c\xbc\r\xc3\x11\xbe\xc3\x1b\xff=\xf6wM\xbe\xf5=;\xbd\x103^>\xbdC\xa9=Zr\x1b>\x00\xd4:>\x8d\xdfn=Kl\xb5\xbd\xe04\x03=z\xc8I>\xfdY\xb3=\x12\x99\x05>2x\x99>WF!\xbe\xc7\xff\x8f<D\xab\x16>\x06BQ=0i\xa4<a\xbf$\xbe\xb8\xc0\xe5=\xad\x138>.h\xbd=\xcc\xb4\xb0<K\xf6b\xbb%\x84u\xbe\x1e\xb3L>\xf6B\xba\xbb<\xce\x84=\x8a\x04\xa9>\x95\x07\xa2=]\xec>\xbd\x16*9<b\xc1\xe5\xbc\xb7\xfc8>\x02\xe1\x06\xbe\x0fE\xbb<\x82T\x18=\xcd3~=\x9e\xd7h=\x12\xf9\xcd=6\xf7\x9b=\x8b\x85\x06=\xa5z\x99<\xf8\x0c#=\x96\x14\xf2\xbc\x076'\xbc\x00X\x05\xbdb\x15\xa2<\xfe\xd3\x10\xbe\t\xfc:>F\x8e9=\x96<\x83\xbe\x93[r>\x169o<\xb2\xc8\xd4=\xdds\x91>\x80\xf6\xa0\xbdOR\x17\xbcnrG<\x1f@\xbf\xbd\xd3Q`>\xd5h\r>U\xc6p<\xca\x1c\x83>\xde-\xd6\xbdOQ\xa8=\xa0 \xb9=\xdd0;\xbeV\x15s\xbbM\xba:\xbeu\x12\x8e\xbe\x00\xaa\x1d\xbe\xae\xd4\x02=\xbc\xb5\x84\xbd$\xf8\x95\xbeP\x15:>#m\x15=\xb3\x07>\xbd\xd6k\x92<\xaeB\x06\xbeh\x05\xaa\xbd\x80\x19\x9c>\xb6W\xfb<G\xb4\x8e=\xc2wf\xbe~?\xa9\xbe\xd0\xd1d=\xe0\x9a\xdb=6pM>\xb9\x9b\x88\xbc\xf4I\x1d\xbe\xb8\xafm\xbd#\x14s>N_J9\xda^\x10>ryI=\x9cr)>\xc9,\x95\xbd\n\xd4->\x89R\x9a<vH\xce=j\x1f\xfe=/F\xb6>\xb5\rO>5g\xd6<\xa6\xba\xb7;M\xdcv=\x93yQ="
-p55
-tp56
-bsV445126719402680320
-p57
-g2
-(g3
-(I0
-tp58
-g5
-tp59
-Rp60
-(I1
-(I200
-tp61
-g12
-I00
-S'o\xdcl>k\xa8\x85;\x1b\xfe\x8b\xbenC\x04\xbd\x18\x0f >\x91\x0b\xaa<\xb8\xaf\x19\xbcj\x00$\xbe/\xbf\xfa\xbc\xfb\xbb\x10>Wl\xc5;\xd6n\xbe\xbcfM\x13>c\xe2G=6%\xeb\xbd\xfb\xcaG>\x02]j\xbd(\xfc\x9b\xbc\xf3/\t\xbeEF\xf9\xbc\xd5t\xfb\xbd\xef\xe3(<7\xa9\xff=[o\x8c\xbd%\xf5\xd3<I\xd7\xb4\xbd\t\xff\xff=\xf9\xa3\xbd\xbd\xc5\xbc\x14\xbe\x1b\xe7u\xbc\xc9\x02\x10\xbdHX\xae\xbd\x0e\x04\xb3=b\xfe\x84\xbe\xe3\xf1\x88\xbc\xd5\x1a/>\x9d\x93\xf5=9-\xff=\xb9@+>\xd0\x89%=\t\x05\x85\xbdc\x84\x0e\xbc\x02\x94\xf3=\xde\xbc<\xbe%\xe4\x8b\xbd\x9a\x87T\xbd\x15\x04\x81>R\xb6\x94<\xb3\xe4:=\xe9\x9f\x91>\xa2\xa2\xbc<w\r\x98>]\xa0\xe5\xbd\xe4\x11\x85=\x80\x10}\xbe\xa7\xae\xf7=\x9b=\x96<\x05\xe9\xcd\xbd\xaa\x91\x88\xbe\xb0\xbf\x93\xbeb\x943>\xc2\xd4\xe2=\x7f\x89\xba;\x85O\x04\xbe\xcbQt\xbbjy\xdb=_\xdaX\xbe\x95\xc7\n>\xb8\xae\xe8\xbd\xad\xc3\xc4\xbdh\x00\x9b\xbe\xb6\x90+\xbe7M\xbb<~\x12\xb6\xbdB\xed\xe8\xbd\x88\xdc\x85=1k\xdd=\t\x8fT=\xdek\xca=`\xe9\xe3=\xf7\xeai\xbd\xd1\xe6\xad<\xdf\xd7\x85>,}\x02\xbe\x19;\xba=\xed\x8e\xa7=\xbeG(>\x07\xb4\x86\xbezX\xa7>\x1ba\x05\xbcq\x82D\xbe\x1e\xeb(=\x19\x1e=\xbe\xaa\x85\x0c;+Vk>\x97\x05\x99=\xe6\xba\xc4=\xcf\xf4\x12>\x92,\xb6=/\x04\x99\xbdws\xa8<\x82\xdf>>(\x83\xc1=!y\x06>p\xccP>\x90l\x0e\xbe"\xaf\'=\xedE\xbb=\xfbxE=\xcaf$=\xaf\xd0\x01\xbe\xfe+\xd8=@\xe3\x00>\xa1\x00\x80=\xd2\x86\xae:\x97\x15&\xbcgxR\xbeU\x03S>J\xeb\x89\xbb{\n\x17=>\x06\xa7>iFK=O\xbb\xd5\xbc\xbd\xb2\x8f<\x8b\xc0\x8d\xbd\x90,)>O\xdf\x80\xbdu(\xc8\xbc\x1a\x19G=\xde\xeb/=\xc3\xb5\xa2=\x08|\x9b=\x89\xc1\x00=yr2=\x8b\x8a\x1a=\xe7x\xfb=\xbd\x85)\xbdk\xfe\xaa\xbb\x824\xcc\xbc)\xc9\xa7=c#\x03\xbe.=?>m\xcb\x9f\xbb\xe9\xcfl\xbe8\x193>\xc8\xd8\x9f\xbc\xb5\x80\xee=\x9d\xc8i>\x86\x89\xa6\xbd\xda\xf6\x83\xbcj\xcf\x0f\xbd\xdf\xea\xed\xbd\x0e\xfcZ>\x17I\x1a>\x9d_\x97<\r\xf2y>\x08\r\xba\xbdOw\x83=EZu=\x03\xfd)\xbe\xe6J,<\x8b\x86\x0b\xbe\xf8\xf2\x81\xbe+a\x15\xbe1\xcdn=\x0e\x08\x98\xbd\x92\xa6\x9b\xbe\xd2\xd76>9\x90\xd4\xbc\xcbW\x98\xbci\x06:=\xed!\xe2\xbd\xcb\xe3\x92\xbcu\xa4\x9f>>\xe6(=\xf9N\xda<e\x8da\xbe`a\x8a\xbe\x98;\xef<\x0e_\xa7=\xb2\xc8t>5\xad\x0e<Q\x83\xea\xbd\'\x8a+\xbd\xf3L/>\xc5\xc1\xb5;\x99\x12\x13>\xa10\x80=)n5>\x15\'e\xbd\xe1\x1d\x17>\xe9\xf4\xec<)\x88\xfa=NHx=\x9dc\xb4>\xb7-6>{\xf0\x1c=Cc\xe2<\xd5\xc0B=\xa3.\xea='
-p62
-tp63
-bsV474176288924925952
-p64
-g2
-(g3
-(I0
-tp65
-g5
-tp66
-Rp67
-(I1
-(I200
-tp68
-g12
-I00
-S'\xbc\xdf\x9f>\xf3Un<\x1ff\xab\xbeO)\xd2\xbcD\xda\xf0=\x83\'\x18\xbdA\x1f\x14=\x1dl>\xbe\x1d\xa6\xa5<I\x16\x1a>\x8b\x96q\xbd\xf9\xf0\xb0<\xff8\xfa=\x80\xeb\x99\xbc\x98\xfa\xa9\xbdL\xb61>\xb0I\xec\xbcQ\x82\x14\xbd\x8d\xb8\x0f\xbe\r8\xca\xbc#?%\xbe\xd3\xaa\xfe<;_\x03>\x88\xbe\xdc\xbd\x99\x90\xe8<\x87|\xe9\xbd\x8a\xc5">\xe9W\xa5\xbdL81\xbe\x98*\xb6\xbcGe\x8a=u\xe5\x85\xbc\xc0\x1a\x00=\x8b\xd4\x8f\xbe\r\xcbu\xbd\xfdM\x1b>I\xf5\xd5=fM)>(#{>\xe2\xcf\xa7\xbd\xd1\x99\x0e\xbe\xe3G\xf9<qN\xf8=\xeb\xee;\xbe}5\x17\xbe@P\x99\xbd,\xba\x8b>\xabFl\xbc\x98\xca!=\xbd\x95\xb9>\x04c\xec<\x164\xaa>06@\xbe\x10\xb2\xa6=3\xbbK\xbe_\xee&>q\xdd\xac=\x81\xcc\xca\xbd\xf3\x8d\x85\xbe5\xee\xa8\xbeU\x11B>C\xe7\x1e>\xb9\x05d=\x0e\xd9!\xbe\xb3\xe1\x9c="j\xa1=0\x19!\xbek\xb8L>\x1b\xae\xb3\xbd\x0e\x8c\xa1\xbd\xb3\xab\xaf\xbe\xf7\x08{\xbeH\x00a;\xf5\x10\xc0\xbdK!\xf8\xbd\x9b\xebC=\xaf.\x9b=\xd8\xca\x0b=\xa0\xdc\x17>u(\x18>\x92\xe9\x9e\xbd\x8d\x89k={+h>\x99;\x08\xbe\x8f83=\x0e7\x92=\xbd\xa4I>X\xac\x81\xbe\x1dN\xaa>\x8d\x0e\x87\xbd\xcd\x8dO\xbe=\t\xed=\x1b\xedP\xbek\x13\xdd\xbb\'\xbcU>\x81\x13\xce=[\x8b\xfc=&\xc7\x1e>ax\xe6=\x0c\xb8\xa0\xbd\xabO\xd9;\xf0\x82/>\x80w\xd9=\x0b\xb5\x04>\x9d<)>\xe5b5\xbe1\x1c\x94<W$7>7\r1\xbc\xab\x83\x8c<+zT\xbe\xbfQ%=\xfbm<>3\x00\xbe=\xc3o\x1f=c\xfbe\xbds1\x8b\xbe\xdd\x98a>\xe8\x87\x89;\xbbpA:cS\xa8>\x08\xe3\xb7=K\x07{\xbd-\xe2\x88=\xed\xe1\x10=Txs>\x8c\xe9\xdd\xbdsA%;{2u=/\x03}<)\x13\x15>dg\xb1=\xa0j&=!\xf6\x06=\\\xc3\x1c=k\xcd\xfd=\x8d}\xbb;)\xe6"=%\xd3\xca\xbdtvT=\xc5i1\xbe\xaf\xa3A>\xb0\xc1\xff<G\xf5\xae\xbe\xa5\xaa@>A\x80F\xbd<a\x17>\xc3k\x89>\xe1\xc1\x8d\xbd\xc5\xef\x8b\xbd\xb9\x06H<WW\x17\xbd\x9c\x83=>\xa5\xc1\xfc=\xe5\xa7\xc5<\x87\xd9\x9b>\xa9\xf2\xf7\xbdM\xae,=\x85V\x8c=\xebP:\xbeQ\x8f9\xbd\x95\xfbW\xbev3\xa4\xbe{@\'\xbe\xeb\x8f\x9a=\xff\x0bN\xbd]\xb8\xc9\xbe\xf77E>i?t=\x15ob\xbc\xc6\xfc\x80=W\xc0\n\xbe\x98\x18\xc7\xbd5\xb7\xb7>\xcb\xab==\xb4\xf7!=\x0f\xb2H\xbeL\r\xbb\xbesU\x9b=\xd9\xc6l=\xc7\xe5Z>e\x1bO\xbc\x00\xbdP\xbe\xccC\xc8\xbd\x1f\xc0\x10>\xe7\xa1\xe8;l~_>\xa9\x92\xaa=\xc5\xcbN>\xe6\xcc\x04\xbd\xf9\xcc >\xd8\xef\x85=\xd5rY>m\xf2\x10=\xac\xca\xac>D?n>1E\xfa\xbc\xf4\xae\xc8\xbc\xf5\x0b\x00<\xa3}\x95='
-p69
-tp70
-bsV473443685997084672
-p71
-g2
-(g3
-(I0
-tp72
-g5
-tp73
-Rp74
-(I1
-(I200
-tp75
-g31
-I00
-S'\xc9\x04\x01>,\x8b\x9f<\x1f(\x02\xbe{\x87X;Za\xa5=-\x04\xdc\xbb\xec\x0e\xb3\xbc\x8bC\xdc\xbd\xa0V\x0c\xbdgR\xc8=D`\x07<7\x9a\xbf\xbcFSa=\xb9\xf5\xf2<[\xeb-\xbd\xdc2\xfb=\x99\xfc;\xbdo\xbb?\xbdq1q\xbdT+\xa7\xbc\xeeB\x8f\xbdk\xc7\x1b\xbc\xe2\x11Z=\xe9\xca\x10\xbd\xc10\x94;\xedH\xb5\xbcm\xfd\x89=z\xad\x90\xbdz\xf5\xcd\xbd\x9e\xf5\x06</16\xbd\xd61V\xbd\xb9\xafj=\n\x80\xfe\xbdy\xad\xb3<9q\xe8=\x07\xdf\x97=\xd2{[=\x16\xbb\xd0=\x1d\xc7\x17=\xd3F\xe5\xbc\x9a\xc9\x0f\xbdJ\xb1\x98=\xfa\xae\xc5\xbd\x16\x9ao\xbd\xac\xa1\x93\xbb\xdd\xb7\xfe=<\x0b\x03=\xbe.\xd5<\x85\x9d\x1f>\xd6\x99\x1a\xbc$\x03\x16>>\x80@\xbd#5\xc6;\xa0\xce7\xbe^\x1e?=c1c\xbc(\xfd\xed\xbc\x86\xddP\xbec\xde&\xbe@\xe6\x95=\x8f\xab\x9e=\x192\x0b=i\xb5\xb6\xbd\xd9e\xbf\xbcB\xba\x93=\x08B\xa9\xbd\xa4\xe7\xb7=\xb0\x9c&\xbd\xbeb\x93\xbd\xe6b;\xbe\xe3\xea\xf9\xbd\xb7\x88\xaa\xbc\xa3\x87=\xbd\xfe\xd3\xf9\xbc\xbe\xb5\x7f=F\x17\x8e=\xc3\xb3N=.\n\x92=\xf7%\x89=6(\x1d\xbct\x18\x98\xbb\xcc\xda\r>\xfa\xcc\xde\xbd\x0e&\x86=\r\x00\x86<\xc0\x0c\xc7=\x1c\xe4\x00\xbef\xd0>>\x0c)\xf3;\x93S\x89\xbdu\xdd<=Eg\xa5\xbdi\x13\\\xbcWW\x01>\xdc\xbc\xc6:WG\x9b=\xe0a\xbf=$\xdf*=\xa6\x8a\x18\xbd\xa6 \x8c<\xc2\x85\xdf=\x1ea4=\n\x1e\\=\xb2\xbc2>3\xfe\xa7\xbd\x914\x1d<\xacn.=:\xee\xc3<\x12\xdf\xdf\xba\xfaW\x95\xbd!\xe8\xa3=\xb7{\x8f=\xca\xca\x86=\xcc\n\x8f<\x18\xddk<0\x81\xde\xbdw\xf2\xd0=0\x87I<\xb1H\xdb<!\x18>>O\x01!=\x067\x84\xbbb\xe7\xc1\xbc\x82{\x0b\xbdY\xa2\xb3=\xe4[\x0c\xbd\xd8\xc1\xa2<<\xb2\x0c=\xc3\xa2(=\xfb\x01\x879\n\xdf\xa3<\x01\xb7\xe8<\xfcW\x1d<x\x92\x87;OV\x87<"\x8c\xe2\xbc\x8f\x85\xef;\xe0\x12\xb0\xbcc\'\x9b<\x82\x14i\xbdY~\xef=\xe2\xb2\xce<k,\xd2\xbdt.\x00>\xec\xcf\xa4<\x1aZ>=\xbe\x85\x0c>\x15\x93=\xbd\xad\t2\xba\x8d\x94s\xbc\xcf4\x90\xbdY\xff\xd3=}\x95\xa3=\xdc\x15L\xbc\xa1\xa3\xea=\\y=\xbdK\xc51=\xe0S\xff<\xa8\xf7\xe2\xbd\xa0\ny;\xfc\x02\xbc\xbd\xdcF\x16\xbe\xa6q\x8f\xbd\xf6\x93\xad:\x98|\x8d\xbc@x\x0b\xbe\xe3\x8d\xe7=\xc8m\xfe\xbbX\xfa"\xbd\xb4c\x0e\xbcc\xdf\xa8\xbd\x98\xa2\xea\xbc\x8e\xaa\'>\xa5\x9c\xb2<\t_\xa1<uT\x07\xbeM\xba\n\xbe\xdac\x82<\x18\x85J=\xf5\xf9\xe0=\x16\xab;<F+\x95\xbdu\x00\xa9\xbcCZ\xfb=\x99\'\xb8;\xcf\x83W=\xb5\xc6\xc2<\xda\xd7\xcf=\xb9^\x96\xbd\xb6!\x97=\x19M\x12<\xcc\xf8E=\xcb\xbe\xa2=\xc8".>l\x13\x02>\xc0\xb0\xd3<\x0c\x0e\xf5<>m,=\xd3\xf4A='
-p76
-tp77
-bsV445232111516405760
-p78
-g2
-(g3
-(I0
-tp79
-g5
-tp80
-Rp81
-(I1
-(I200
-tp82
-g12
-I00
-S'\xa0\xd0&?l\x10R>d\x10\x14\xbf\xd5\xcc\x94\xbd/<W>4\xb0\xc4\xbc\xb2\x9f!\xbcQY{\xbe\xf5\xf2b=B\xc8\x8e>\xd7\x13\x04\xbe\x91M\x07\xbe\x08T\xe7=\r\xb5\x10\xbe4|\xc0=\xad\xfd\xf5>\x93\x1a\xb8\xbd\x11\x997\xbeS\x15\x98\xbe\x1b\x8f\x01\xbe\xeb\x8eM\xbe\xecpu=Y|\xa0>\xeb3\x13>\x96\xa8\n>\xdcb5\xbe\x83HL>\xbbD\xd6:\xdd\xfd\x97\xbe#\x84\x8b\xbe\n\xea(\xbdD&\x85=\x13\x85\x85\xbd\xc8j\x00\xbf\x01\xbf\xb4=\x1d\x18@>\x12\x12\x9d>gZ\x9e>\xcf\xa5\xb5>\xdf\x84E\xbe\x8d\xa6\x9c\xbe\x89\x9b\x92\xbdYx\x1e;t\x82\x1f\xbe\x97\xcb\x8f\xbe|\xd8:\xbe$\xb0\xdc>w\xe22=q\x13\x15>\xa5\x10#?=u\xf3\xbc-\xeb\x0c?t\xbb\x9e\xbe{5=>\xbd$\xc7\xbeXc\xd3=\xac\xd09>\xb1\x81\x1c\xbd\xfd\xce\x11\xbfI\xcb\x04\xbf\x07.\x8b>\x1d>(?\xdb\x1f\xb7>\xb8\x0b\x15\xbe\xa3.\xb0=\x95\xa4\xc6<<\xcc\x9e\xbe\xd2\xb1\x15?T\xf6C>\xddB\x89\xbe\xd9b\r\xbf\xb1:\x00\xbf\xe9\xe6\xad\xbe\xc3\x10\x88\xbd\xddKB\xbes\xbb\x9b\xbc\x16C*\xbdDA\xcb=a\xd9\xa7>A\x81\x84>\x91i\x81<Z\x0e\x87\xbbhA\xd4>\xfaI\x93\xbeM\x1a_=-5\x19>\x93~\xae>7\xc6\x89\xbe\xc8\xde\t?[\xb8x\xbe\x8d\xa6\xd7\xbe\xed*L> \xe6\xb5\xbe\x12A\x90\xbeK9y>[\x9c\x11>T\xb1\xb6>\xce\xae\x86>g\xed\xc6=\xbe0\x8a\xbemx\x08\xbd`\xc8H>k\x9e{>\x99\xa0\x8d>\x07\x88\xdd>.e\x82\xbe\xc4\x1c\xcc<Qb\x0b?yg\x8d\xbc\x9b\x8a\x08\xbc\xfd\x9a\x1b\xbf\x071\x92\xbd\xdf\xa7\xe3>\xa0\xf0\xfd=XFz=\xff\x8c\x1c\xbe0\xda\xee\xbe<\xcf$>OK>\xbdk\xad\xb3\xbc\xb5C\x11?\xf5\xa8}>\xad-\xef\xbd\x91\xbcW>\xb7\xf6\xb9=u\x04\x93>U_9\xbe\xcel!>E\xb1\x8e=D\xac\xeb=\xb3\xb9O>\xed\x8d*>II\x8d<nO\x81=\xa2\xc3\x89\xbc@\xcd\x88=\xa5\x855=[\xbe\t=\x1bX\xe3\xbe\x03\x98\xce\xbdK<\xae\xbei\x84j>~\x10\x8d>\x07\xda\x05\xbf\x04\xd0\xe3>E-#>\x13\xb6\xa4=\xc4\xed8?\x80V\xce\xbd\xf2\x04\x19\xbd\x9d\x81\x9f=K\x8e\xa0\xbdk4\x95>\x03\xcd\x0b>=Q\x82\xbc\x9f\x86\xf9>\x89\xe0\x9a\xbe\xc5\x08\x0f=\x8d-1>\xb5\x02\xed\xbe\x0fpt\xbe\xba\x8f\x98\xbe\xb7\x9c\x04\xbf\x84\x1b\xa7\xbe\xb12K>\xc1g\x89\xbd\x80\xac\x04\xbfA\xa5\xad>\x892S>E\xb0\xbe\xbd\xb3aI=\xf3`}\xbeD\x00\xb2\xbe\xb4K\x06?\x85\xe3q=\r\xdar>+)\x8e\xbe\xb3k>\xbf\x87Mz>\xe5\x8eI>\x1b\xe6\xae>\xdf\xecz\xbd\xc7\x18\xa4\xbe\xa0_@\xbe\x9dx\xf0>sD\x04\xbdO\xa1\xa2>\xecb\xbe=9t\x8e>\xa5\x1e\x86<%V\x85>+\x8c\xb4\xba\x83\xb4i>lW\x04>\x8c\x191?\x80\\\xbc>\xbdB*\xbe\x82: \xbd\x13\x8c\xe5=\xad\x9a\x89\xbd'
-p83
-tp84
-bsV473435889071161346
-p85
-g2
-(g3
-(I0
-tp86
-g5
-tp87
-Rp88
-(I1
-(I200
-tp89
-g12
-I00
-S'\xc3G.?J\x8b}>\xe1)\x18\xbfAO\xe7\xbd\x12\x10\x04>\xaf\xd9\xa1<\xf8\x07M\xbd\xb6\xea\x85\xbe\xfb\xec\x12\xbd\xfb?\xd5>b\x12\x80\xbe9\xfd\xaa\xbef\xa4\xd2=q\x0b\x98\xbe\xb5\xe0\xe4=\xc5i\xec>m\xc7\x0e\xbek\xf3\x9b\xbev\xfd\x97\xbec\x07\x1a\xbep0|\xbe\xb2!\xf3<\x8a\x84\x80>\xbe\x8ay>?\xba1>\xb9\xd7.\xbe\xff\x9d\x98>\xa64\x17>;\xa0\xea\xbe\x0fT\xc4\xbe\x87bV\xbe\x8f<\xc1=\xae\x08V\xbd\xb8\x1a$\xbf\xe7+\xcc=\xfd\x8a\x8a>\x99\x86\xc0>\xd3\xc9\x80>^\xc5\xe7>\x9ea\x0e\xbe\'Q\xb1\xbe\xde\xf9\xf4\xbd\xbe\xdfG\xbd\x15\xd8\xe8\xbd\xb0h\xcc\xbe\x05|e\xbe\xb2\xb8\xe0>~\x89i>\x13c5>]\xa4.?\x83\x13\xc4\xbd)\x9a\x0c?\xf3\xb1\xac\xbe\x0er\xbe=2\x9a\xed\xbe\xe7\xed(=&h3>\x80\xa4\xa6=\xe1BB\xbf\xb3\r\x07\xbf\xa6\xdb\x91>K\x8bW?\xc2\xde\x16?\n \x19\xbe\x9a\xeeo<\x10\xd8\xb6=\xd1d\x84\xbe\xeb\xed ?\xbd}\xad>V\x0c\xac\xbe2\'\x1a\xbf\xf2n&\xbf\xc1\xa8\xe5\xbe\xd8\xc6\xc5\xbd2XO\xbe\xbe\xbf\x86\xbd\xe0x\x9a\xbd\xb0\xb8S>\xb5\x18\xfc>\x8dZ\x87>\x87\x1a\x89=V\xd1\xeb\xbc\xa7\'\r?\xfb\x8e\xb9\xbe\xc9\xd8\x0f;Y[\x87=\xe6\xed\x81>p=|\xbe]Y\x02?\xed+\xb7\xbe>\x03\xbd\xbe\xa9!9>\xe9\x0b\x83\xbe\x17\x88\xf5\xbeG\x06H>&\xd6\xa4=\x0eg\xec>\x1eWy>\xd9\xe9x=S\xd1\x8f\xbe7B\x8b\xbdm\xb3d>\xdel\x9d>\xf5L\x86>Q2\x04?\xad\x7f\xc1\xbe\xc2\n+\xbd\xe3} ?\xc9\xcf\x94:9_\x84\xbc\xb8\x89F\xbf\xc3\xce\xe6\xbdo,\x04?0y\xa3>\x95\x9e\x1c>R0\x07\xbe\x07K\x06\xbf\x15^9>z\xcc\xd5\xbd\xc5\xe3D\xbd\xb2f\n?A\x83\xb6>\xb0\x10\x1f\xbe\x8f\x82\\>\x16e\x88<d\xab\x8b>\x1b\xf9\x8f\xbeV\x1dA>\xbf\x8f\xac=\x1f\xbb\x92>z)\x13>\x7fe\x1e>\xf1my=\xad2\xd2=\xdfI\x12\xbe\xef\xd9\x0e\xbd\xa2\xf1e\xbc\x0fD\x82\xbc)\xff\x0e\xbf\xdeG\x01\xbe\xfdE\xd4\xbeQ\x98\x97>\xd0\r\xbc>+\xef\x0f\xbf\x0e\x14\x07?25\xa4>;M\xc3={\x01}?\xce\xf7\x9b\xbdq\xcd\xc1\xbd\xbe\xe3\xef<\x16\xe2L\xbek\xd3\xc0>\x17T\x80>\xb9\xf5\xca\xbd\xe6\xe6\x0b?\xa7t\xc2\xbe\x02\xcf\xc4=.9\'>\xb6\xfc\x1e\xbfUr\xb0\xbeI\x95\xe7\xbeM88\xbf\x0e\xeb\xde\xbe\xe0ha>\x19e\xaa\xbd\xf8\x88%\xbf\x1b\x19\xaa>-\xa5\xa1>/\x1b/\xbd\xd1\x03\x90\xbduv\xd3\xbe_B\xf0\xbe\xb6k\x07?@\x9aj=\xd7H\x93>\x88&\xc1\xbe\xa1\xeed\xbf"EH>\xe9\xe3\x1c>~w\xa5>\xce\x03\x1d\xbd\xab\xa6\xcf\xbeA\xff\x92\xbem\xaf-?\x87\xf9:\xbd\x1a\xbe\x98>\xbd\xc9\x9f=zi\xd3>y\x976\xbd\x00\x12l>\xe2\xc0\x1b\xbdk\x1bp>\x05\x0eW>\xa7~B?\xbf\xe1\xe8>\x12\xb3\x1c\xbeg\xb3\xde;Fua>\xad\xd4G\xbe'
-p90
-tp91
-bsV474117578101493760
-p92
-g2
-(g3
-(I0
-tp93
-g5
-tp94
-Rp95
-(I1
-(I200
-tp96
-g12
-I00
-S'\xd6\xd0"?G\xb8\xf7=\xc2{\x19\xbf\xf3R\x8a\xbc\x14dl>\xcb\x15\xf0\xbd\xf4l\x98\xbd~\xd1\x7f\xbe\xabT\xae=h#\x99>\xca3\x1f\xbd\x9a;V\xbc\xee\xd21=\xa3J\x05\xbe\xf3O&\xbb\x03\x16\xe4>-\xa5s\xbd\x83\x8b\xc9\xbd\x1f\x8d\x8a\xbe\x9c\xd3>\xbd\xbd\xd8q\xbe\xda\xb3\x9b=1"o>\x8411\xbd\xf2\x12p\xbc\xb1\x9d\x07\xbe\x93\xaa\x87>B\xaa\x07\xbe\xd8\xe7\xbb\xbe$+\xdc\xbdy\xe4\x82=\x7f\xca\xf1\xbc\xeb\xfdG\xbd\r\xc5\xcf\xbe)\x05.=7\xc4\xa7>\xb6\xd9\x8b>\xcf\xbco>\x01a\xdd>\x05\xe0\x9b\xbdo\x1c\x82\xbe"Pu\xbd\x93m\x88=\x81H[\xbe1\x0e\x96\xbe\xed\xe9\x1c\xbe\x8e\xa3\x13?2\x88Q<,\x8f\xbf=\xad0!?\xb4\xdf\x99\xbb@\xd6\n?\xd0)\xb8\xbe?\xae\x9a=\xf0\xb9\xe9\xbe\xfc\x9ey>7\x11?>\x15\x16\x9d\xbdCo\x0b\xbf\xe4A\x11\xbf\x8e\xc2\xa2>#=\x11?\xd2bb>\xde-\x1b\xbe\xb7\x94\xd0=xy\x17>\x83\xb5\xb0\xbe\xa7{\t?\x90\x10\xac\xbd\xf2\x8aF\xbe\xfe\xf4#\xbf\xbf\xf4\x00\xbfu\xa2\x82\xbe%\x99\xf9\xbd\xe1\xc4S\xbeg}\xa0=\x83&\xc4=\x82\x06*>pQz>\n\xa9a>\xec\x9e=:>\x10@<\xb0F\xbf>\xa3N\x8c\xbe\x18F\xcf=~>\xf8=h\xc9\x93>/\xd1\xa4\xbe@\x1b\x14?\x13*\x1f\xbdV\x04\xd3\xbe\x92Q\x8c>\xf5M\xd8\xbe\xe1\xc4\xa4\xbd\xeb\xe2\xc7>\xc0)M=\x14\xea\xa2>\\\xedo>7\xeeR>R\x84\t\xbe-\xfa(\xbd\xba\x10\x91>8\x06<>epg>\xf3Y\xc0>\x13\xde\xb4\xbe\xb4\xb3\x91=\xf4\xb7\xde>e\xe3\x15=\x96\xaa;\xbd\xd4\xa8\xfc\xbe\xb7\xbc\xee\xbc|E\xb7>\xd4g\'>\xf5;.>w\x10p\xbd\xe5k\x07\xbfmL\x85>4\xcf\xa3:\x0e\xf0\x12=K\x84\r?\tL\xa0>W\x8a\x0f\xbe\x03Q\xfc=u\xd0\xba=\x90\xb8\xb5>\x85\xe6A\xbe\xc9\xa1\xa9=\x03\xd3t\xbb\x1e\x7f\x8d\xbc\xc9p(>\xe1c\x8b>\xc0\x9a\x81<\xdb\xb1\x8a\xbb\x8cU\x1f\xbc\xa4\xb6\xb9=EW\xa6\xbb\x18I\x8f<j\xb7\xbc\xbet\x90\x8c\xba\xce&\x95\xbe\xb5\xeey>]\n\x1b>:\xa9\x0c\xbf\x953\xc5>qN\x89=\x98|]>\xd8\xa71?,$L\xbe\xc4\xe0\xe6\xba&$T=\xef]\xa3\xbd\xf4\xeb\x8b>\x9d\xdfV>\x1d_\x92;V\xa3\xf4>\xa9\xf78\xbe3\xc9\x9b=\x9a{\x1f>w<\xbe\xbe\xa1m\x1f\xbed\x8fg\xbe\xfe\xba\xdc\xbe\x7f\xd2\xa2\xbe\xf6\xc1\xad=\xfb+\xb2\xbdz\xe5\x14\xbf\x94S\xd0>\xcd\xc5\xf2=`M*\xbd\xc8\x93\r>(JX\xbe\xc8H`\xbeg\\!?_\xba\t>\x9et|>\xb3\x19\x9b\xbe\xa5$&\xbfH\x14\x15>0\x82}>\xd3\x19\xc5>$(\xb0:\x8di\x97\xbef\xa8{\xbe\xde\x1a\xde>\xe7\xa3\xf1\xbd\xa3\x1a\xbb>\xf5\xef\xe7=\x90\xfc\x9b>\x8e$\x02<\r\x15P>\xc3\xfe?=i#\x83>0!#>\xb0\x97\x19?W\x9b\xe3>@,K\xbd3\xc5\x82=!D\xee=EX\xca\xbc'
-p97
-tp98
-bsV476548892423503874
-p99
-g2
-(g3
-(I0
-tp100
-g5
-tp101
-Rp102
-(I1
-(I200
-tp103
-g12
-I00
-S'\xe3\xa5\x13?\xc4\x90q>g%\x0f\xbf\xbb\xc4K\xbd9\xd2\x06>\x1d\xc9;<\xa4\xd9\x85\xbdj\xfex\xbe\xd7\x97k<\xe1\xff\x98>\x19\x02\xbd\xbd\x16E/\xbe\xb0v\xeb=\t\x8c\xd0\xbd\x12\x1c\xbe=^"\xc8>\xde\xb2\xeb\xbd\xe3\x00w\xbe\xf1Uf\xbe\x04_\x97\xbdvy@\xbe\x85\x18\xc4<A\xf7\xa0>\xc27\x12>\x94\xde\xa2=\x94\x11\xf5\xbd.u->\'\xa6p<\\/\x89\xbeO)`\xbe\x16\xe9h\xbd\xe9\xc6\x11\xbd$\xa3\xa3\xbc]\xef\xdc\xbe\x9efg=\xcf\xe1\x8a>C\xda\x88>\x88o\x80>"x\xb3>\xb30\x93\xbdP\x12u\xbe\xff\xa5\x89\xbd\x80\xfa-\xbd\xad\xa4\x18\xbeN\x1e\x93\xbe].\xeb\xbd"\x91\xf9>\xad(k=\xd52\xd3=p\xc9\x1f?4N\x1e\xbd/\x00\xe2>\x96\x18z\xbe\xc5 \x8f=\x9d\x1b\xd1\xbe\xf3\x87\x06>}\xf3\x07>\n\xbd\x89<\xdfJ\x0e\xbfm&\xf8\xbe\x14\xb2\x85>\xdd\xe0\x15?|\xde\x8e>k\xa3R\xbe\xa1\x93\x02=\xa5\xc2\xca=G{\x98\xbe\xdek\x01?\'\xc7\xa6=\x06-j\xbe!M\x0b\xbfTu\x04\xbf>\xab\xb0\xbe\xf6\xa4\x82\xbd\xce\x92c\xbe\xbc\xb1\xf7\xbckI\xae\xbc\x1cb\x15>\xc7+\xa5>\xc3\xee6>]&\'=\x07\xa4\xce<\\`\xe2>R\x07\x9a\xbe\x1e8\x0c>\x15\xbc(>U\xef\x8c>\xbdF\x93\xbem~\xf4>z\x12C\xbe\x14\xb0\xca\xbe\x05\x1fd>\xdc\xd5\xac\xbe\xdb0#\xbe\x13\x92N>=\xb1_=\xe0\xf6\x90>3bm>n*\xa9=S\x11T\xbe;_\x98\xbd\xf1Si>\x05\xe1J>*\xd1l>f\xd7\xe4><\xd4\x94\xbe[\xf2\xe7<E\xb4\xf2>\xc7\xf1\xbb\xbc\x00p\x8e\xbd\xea\xfb\r\xbfdy\xdf\xbc\x9a;\xe6>\xb1YS>\x80K$>\xf6`G\xbe5M\xd9\xbe\xb5\xe9@>B\xc0\xac\xbdW\xb4\xe3\xbbG\xf8\x07?\x85n\x82>\x9cP\x1d\xbedq\xeb=F\x92<\xbb\xf0pr>\xbe\x0f\x1e\xbe\x19\xd7\x18>\xdbs\x12=\xa37q=\xaf\xba:>C?s>qM\xe5\xbc\xbe\xedF=\xdb\xb8\x08\xbe\x90\x81\x96=NH\x19\xbdD[\xa2\xbc\xbf\x99\xda\xbe^\x87\x0e\xbd11\x8c\xbe\x9a\x19@>\xc1\xbbW>\r\xc4\xfe\xbe\xc1\xde\xd3>jt\xef=/\x11\xba=f6.?\xa5\t\t\xbe\x15yo\xbd\x1d\x93\xc0=\xe0)\xc3\xbd\x06\xe6\xad>\x12\xfad>\x1c\xa4\x8f\xbd\x86\x10\xee>\xb3\xa7j\xbe\xd2a\x8b<\xbdV.>\xeb\xbd\xdc\xbe\xeb\x7fr\xbe\x9d"\x98\xbe|\xb0\xf3\xbe\x87\x07\xa5\xbe\xcb\x15\t>T$\xbf\xbdL\x0c\xfe\xbe,l\xb8>\x12Sj>p\x9a\xfb\xbc\xce\xb8\xcf\xba_-\x82\xbe\xdf\x83\x9e\xbe\x1bh\x03?\x04T+=\x82\xba]>\xfbm\xa1\xbe\\\xbd)\xbfe\x17/>\x0e\xdaQ>\xe0\x1c\xb7>\x07q\xc5\xbdy\x8d\x86\xbe#(\x8e\xbe4\xfc\xd0>\x9cAZ\xbd\xce\t\x8e>ldi=\xb0\x8f\xa9>\x025\xda\xbc\x97RR>\xfbJ\x84<b\xc8\x97>A\x85C>\xcbj\x1f?\xfe\x19\xdc>\xca\xa0\x0c\xbeF\xfe[=<\xf8\x10>CM@\xbd'
-p104
-tp105
-bsV445264474900295680
-p106
-g2
-(g3
-(I0
-tp107
-g5
-tp108
-Rp109
-(I1
-(I200
-tp110
-g12
-I00
-S'F\xf5 ?\xbd\xfb{>G\xc68\xbfF\x1e\xd8\xbac\x88J>j\x18\x8d\xbcA\xcc\x92\xbd\x86x\x90\xbe\x01\x8b,=\xa2r\x83>v>)\xbe\xd9\xcfJ\xbez\xdbm=\xd4\xa6\x13\xbe\x06\x1a\xfb=pX\xf0>H\x89_\xbd\xca\xba\\\xbe\xae"\xac\xbe\xbd\x92\xdd\xbd\xfd\xa5O\xbe\xbdo\xf7\xbc\xf8\xf0\xd4>/\xc1\x19>\xaa\xaa\x06>\xeek9\xbe\xad\xccx>EG\xd5=o\x9e\x8e\xbe\xa9\x8f\x92\xbev\xcc\xe4\xbd\xce6\x8b\xb9x=T\xbdFe\x15\xbf\x1b\xea\x80<\xa8a\x9e>..\x8e>c\xe1\xc6>z\x95\xcc>\xdb\x99@\xbe^*\xbf\xbe\x98B\x07\xbdC\xc1\x8d\xbd\x18i\xe7\xbd\xfd\x98\xc9\xbe\x80\x04q\xbe1j\x02?\xcd\xa5\xb5=p\xaaE>\xe2\xc91?\x95\xf8/\xbd\x18\x03\x0c?\xff\xb7\x90\xbe\x85\x8c)>`\x15\xbf\xbe9\xec\x02>\x02r9>\x9b\x8d\xd0\xbd\x1b\xe8\x00\xbf\xbe\xf9\x10\xbf\x18\x8a\x7f>\r\x95,?v8\xa7>kqa\xbe\xca\xa6 >\xb4e\x05=\x05\t\xd1\xbe{Y\n?\xcd\x04,>\xe6\x1e\x97\xbef )\xbf\x92\xab\x1b\xbf\xbb\xf7\xd9\xbeP\x91c\xbd\xa0\xc0\x8d\xbe\xb5\xd9\x88\xbdc\x08\xe4<\xc7\xcc\xbc=\xdaq\xf2>2\xe7\x85>={\x03=v\x8d\x17>nw\xe0>u\xd5\xa0\xbep)\x97=(\xa3>>\x8e\x16\x96>+\x97\xde\xbe\xea\x01\x1b?\x19\xd9\x9c\xbeE@\x08\xbfE\x92y>\xcc\xcc\xc6\xbe\xa8V}\xbe\x9b+j>\xfc{,>N\xcb\xc8>\xb8\xbaP>\xa2S\x07>\xb6\xa2\x9b\xbe3\xaeK\xbd\x80t\x8b>\x92R>>\xaa\xea\xbb>\xc0,\xe6>~\xb8\xc7\xbe\x14\x9d \xbd\xcc\xbd\x15?\x9e^\x90<sy\x7f=\xbd.#\xbfj\xfd\xd4\xbd\xe3\xd2\x0f?\xde\xdbF>\xea]\xfb=ZLK\xbe\xc6\x83\x13\xbf*\x9cd>\xeaM\x10\xbeN\x0f\x87\xbd+\x82#?\n\xd2\x92>.X,\xbe:\xe7>>\xd6\xf1\x90<\xb15\x86>>nz\xbe>\xd4\x0b>\xf3c\x92=\xff^+>\x11l\x8d>V\x12\xa2>VF\xa4<~\x04\xde=WZ\x0c\xbe(\xf7(>\xa3\xb2\xeb\xbc\xa5\xb75=\x9ax\x08\xbf\xe6-\xd4\xbcV~\xc0\xbe0#\x9f>\x1b\x0c=>\x8d\x1a!\xbf\x12\xfd\xd5>\x02\xb50=X\x8e~=\x0e\x9em?\xc1\x18\xc0\xbd\xe2\xef\x13\xbd2\xed1>HT\xc8\xbd>\xc8\xc0>\xeeqY>\xac\x82\x97\xbc9\xd6\x1c?\xa8\x84\xb2\xbe\xb9\x1c\x84;\xb8&~>\x03\x03\xf5\xbe\x8e\x1cx\xbe%\xb6\xce\xbe\xf3\xb6\x1f\xbf\xdeL\xd4\xbecdh>\x9e\xe1\xb7\xbd#> \xbf&i\xd7>\xcf\x02\x8e>\xd7\xbb\xcb;\x1d\xb1`=\x8a(\xa4\xbe_\x0c\xcc\xbe\x8d\x88\xfe>B\xb4\x86\xbc0\x8b\x8a>\xd2\xd4\x91\xbep\xf7O\xbf\xf6h\xa3>2!l>n\x07\xe5>^\xc3\xaf\xbd\xee\x17\x9e\xbe\xba\xf7Y\xbev\xcd\n?"1_\xbd~]\xd5>n\xfa\x9e=:\x16\xbc>X\xea\xd3<\xe6^\xa0>bTD<\x01\xe2\xa1>\xf0\x8c\x12>\xf6\xb49?\xdb\xd2\xd5>4\xb4\x13\xbe\x8a\xb6\xae;(\x96\x0c>\x13bJ\xbe'
-p111
-tp112
-bsV459113539936862209
-p113
-g2
-(g3
-(I0
-tp114
-g5
-tp115
-Rp116
-(I1
-(I200
-tp117
-g12
-I00
-S'I<\x05?\xe8\x91\x00>\x9dQ\xfc\xbe\xd9t4\xbc\xe7%\x86>\xf9\xae\xc1\xbbw\x03\x91\xbd\x10#\xa7\xbe,J\xdb\xbdL.\x84>{h\x17\xbc\x118\x15\xbe\xfdhs>\xa1n\xca<\xe0g\x8f\xbd=\xf6\xd1>\xaeA\xa5\xbd\x87\x9c!\xbe\xca\xac\\\xbe\xb4\x7f\x18\xbd\x1f\td\xben\xae\xa3\xbb\xa7<\x82>\xa4\xe2\xe3\xbd\xf5\xaf+=<\x06\xcb\xbd\x8aP,>\xd3\xff\xae\xbd\xc4\xf4\xa9\xbe\x02\x9f\x1e<\x87{\xaf\xbd 9\xe9\xbdB+\x0b>\xd4T\xc5\xbe\xff/\x87=\xcf7\x95>FUt>\x1c*l>cH\xba>\xe4#>=\xff<\xf9\xbd\xdf@s\xbd\xb4\xfb@>\xec}\xa2\xbe\x06\xa3P\xbe\xe4\xc4\x9b\xbd\xc1m\xfc>9H\xa5=\xd5\xa4\xb3=\x0fT\r?\xf34)\xbc\x84\x9d\x03?yzO\xbe\x15\xc0\x92=s\xfc\x08\xbf\xaf#\x0c>]\xf8t=\xb1*\xf3\xbb\xf1\x92"\xbfmU\xea\xbe\xc6|\x8a>\xb6\x14\xa4>q\xff\x14>\x03py\xbe\\c\x83\xbd\xdbe7>\x8d\x88\x8c\xbe\xb6\xc2\xba>e\xc9\xb3\xbd\x91`{\xbe\xdcn \xbf\xbaL\xe1\xbe\x94\xa1\x19\xbe\xaaw\xc5\xbd\xdaL \xbe\xbf*\x04>@\xbc\xf0=\xaa-=>\x07;m>\xa3NY>\x91\xcd\xb6\xbb\x84r\xa8\xbcw+\xe1>h\xcb\x8f\xbeoW\x1e>M\x9cN><\x16\xab>\x13\xf9\xba\xbe\'i\x0c?_\x99\xc6\xbdY\xe7\x97\xbe\xe3\xd6(>\x91*\xbc\xbe\xeay\xcb\xbd\x84\x81\x86>\x80\xef\xd4=\xac$\x82>O\x93\x93>\x813l=\xe1\x80\x1d\xbeO\x10\xac=\xa1:\x98>\x94@5>\xe1FT>7\xb6\xf0>\xe4\xd7\x82\xbe\xac\x99\x15=?\xa1\x8c>\x15\x81\x07=\xd0\x9d\x00=\xd3y\xa8\xbe?\xb7\x81>\xe1)\xb8>a;<>!\x99\xa5\xbb\x17{\xca\xbd\xc4h\xc0\xbe\x84R\xb1>\xb4.h;\x90\xb8\xca=1\xfa\x1b?AU\x0f>\r\xad\xbe\xbd73K=X\x82\x8a\xbd\xb1Mk>4\xb2`\xbe\xc9\xd0Q=\xf3RT=\xcc\xa8\xf2=g:\xb0=\xce=)>`\x8da=\xdc\xca\xac=\x81\xec\x14=\xb0J\xc2<=E\x8c\xbdW\x8b\x88\xbdl\xb8$\xbe\xcc\x86\xa5<\xcf*j\xbeC\x82\x95>h\xa7\x11>&\xd8\xd1\xbe\x91\n\xbe>\x978\x8f<\xf0\\\x15>t\\\xff>\xecT\x18\xbe\x04\xcb\xbb\xbc>c\xb0=S\xdb%\xbe\xc1\xd9\xb8>\xe66\x87>\x1b\xc0\xb2\xbc\x1dB\xc6>\x9e\x0e\x04\xbe1\\\xf7=:%\xde=O\x10\xc8\xbed\xebN\xbd\xb5\xb2\xab\xbe/\x05\xed\xbe\xd0\x86w\xbeS\xea\xe3=<\xf1\xfc\xbd\x9fX\xf0\xbe_\xeb\x97>\xb5;\xb7=\xf9Y\x8f\xbd\x05\xcd\xb7\xbb\xf3\x16\x8a\xbe\x0e \x01\xbe\xb7\xce\x03?\xb6\xf4\xd5<\x07\xa0\xb3=\xfco\xc8\xbe\xb81\x13\xbf\xdf\xcd\x91=\xcfsa>|\x0c\xb2>\x9a\x83>\xbd\x07EY\xbe\xb4\xf7"\xbe6C\xcb>\tX\xdb\xbcA\x84b>\x9c\xbf\x10=\xb1\xdc\xaf>\xd0I\xf5\xbd\x85!\x8e>\x9d\x01\xa6\xbbI\\P>q\xacm>E\xe9\x14?\x89s\xbc>\x02\xd67\xbcw\x12\xff=\xce\xf9\x11>P_\xf7='
-p118
-tp119
-bsV445260103156264960
-p120
-g2
-(g3
-(I0
-tp121
-g5
-tp122
-Rp123
-(I1
-(I200
-tp124
-g12
-I00
-S'\xab\x13g?&?\x9a>{\xa6"\xbf\xf3\xbe;\xbd\xd6~\x9f>A\xe7\r\xbd\x92\xee\x89\xbd&\xf7\xc4\xbe\xea\xdc_\xbd\xa6\xfe\xce>\x96\x07\xf6\xbd8<\x85\xbe\x17\x8c3>\xee\x92\xd2\xbd\x16|}=\xdaI7?H\xb6\xdb\xbd\xad[\x9e\xbe\x80\x90\xbd\xbe\xc9\x03<\xbe\xd2\xeaR\xbe\xa3\xc1\xde=(8\xcf>\xf6s/>.eW>\x15pI\xbe\xa6\x15\x18>S\xb8c\xbc\xa9\xc3\xcb\xbeCh\xce\xbe\x85Mh\xbe\x8ck\xb7=B9T=*\x95*\xbf|\xd2\x96>\x13\xb6\x82>\xf0\xf4\xdd>\x8e\xab\xca>\xdeS\xd3>$6D\xbes\xd4\xbd\xbe6u2\xbe\x8e\x07P=\xcaU\x83\xbeI\xcc\xaa\xbeK\x13 \xbeh\xc7\xf6>\x12\xf4\xcc=\xe0\xe2+>\xa5\xabP?\x9dC\xe6\xbd\xdf\x854?\xb2\x04\xb2\xbe\x04X?>\xbd\xb5\x1d\xbf=\xee^\xbb\x9e\xf0Y>\xb4\xae\x94\xbc(\x8bj\xbf\'01\xbf\xba|\x80>\xbd?W?\x15P\x0e?\xa3\xef,\xbe\xa2>\\\xbcV\xc7\x8e<\x07\xda\x92\xbe@\x06C?\x0c\xb4\xa9>\xf3\x08\xef\xbeD\xa0>\xbf\x1e\xa7\x13\xbf]v\n\xbf\xa0v\xe8\xbd\x90Q6\xbeR\xe5\xc7<\xf0#\xee\xbd#\x9fs>\x8d\xa8\xe6>\xe7\x8f\xa8>sC\x1a=\x0b\xa5\xa7\xbd67\x03?\x12\x1a\xee\xbe\x8f[\x06>\x1a\x88\xca=\xf3`\xef>>7\x97\xbe\xf8\xe8<?\xc0\xba\xad\xbehB\xda\xbe\xe5\x1dO>\xc0\xee\xe3\xbe\xddV\xd8\xbem\xd4\xc0>\xde\xd4T>\x8d&\n?N\xad\xcd>\xb0\x88\xd0<\xd33\xd2\xbeff\x04\xbd\xe2\'\x9b>\x86>\xad>\xb7\x96\x90>\xf0\xbb=?\xb2y\x97\xbe{\xab\x91<\xcc\x86(?\xf5>d<-\xf6\x9f=\xe3)Z\xbf\xc2pK=\x8a"\x16?\x13M6>V\x91z=\x0b\x06\xbe\xbd\x1dY\x1b\xbf\x13\xcfo>{\xc2\xcf<xG\x80\xbbv\'(?&\xd9\xc9>\xa0i\xd5\xbd>\xbc\x8d>R!\x89=83\xc2>q@\xa4\xbe2\xe7\xa6>\xe2\\7=#\x07{>f\xa1\x0f>\'\x0cD>y\xd9\x9d=NU\xbe=\xa5\xf2\xa4\xbb\xd9g\xa4\xbd\xb2\x90\x8a<.\t =\xd2Y\x0c\xbf\x95m|\xbe\xf8\xe4\xe2\xbe\xcdz\x9b>\xd6\x8e\xcb>x\xef+\xbf\xb4\xf7??p{v>\xf8\x8b\x9b<5\xa7\x86?.\xce\xb4\xbdj\x91\xec\xbb\xa2I >e%\x19\xbe\x16w\xc4>"\xec\x1a>+\xee\xd4<\xeeE\x14?\x9b*\xd0\xbe@\xbe\xd3="H`>S\xf1"\xbf\t\xab\xa7\xbe\xbe\xc2\xef\xbe%\xffH\xbf\x02~\xd5\xbeF\xe6u>\xff\xd0#\xbd\xc6\x9c\x1a\xbf\xe6\x03\x03?\xd5q\xac>\xa2\x8c\x89\xbe\x06\xf7\xae\xbd\xda\x8b\xdc\xbe\xbe\xff\x01\xbf~m5?UH\xac=\x07\xf5\xb9>\x13e\xcd\xbe-~\x81\xbf\xdd@\x8b>\xae\xc1\xa5>\x13\xe0\xce>\\!\xbb\xbd\xfa\xcb\xc2\xbe*\x9b\xac\xbd{\x9aJ?\x10\xeeL<\xf6\xd8\xda>\x98\xaa\x95=-\x88\xb3>\xc2H\xcb\xbc\xcae\xc5>\xe2s\x7f\xbc\nn;>#\x95\x98>\x9bJv?~2\xf4>\xbe\xeb\x86\xbehZs\xbd\xcd\xcdp>0EB\xbd'
-p125
-tp126
-bsV476550081026351104
-p127
-g2
-(g3
-(I0
-tp128
-g5
-tp129
-Rp130
-(I1
-(I200
-tp131
-g12
-I00
-S"\x87\xe4\xc0=\xc0]Z<\xfa\x81\xc3\xbd&\x08j\xbbL\xa7i=^\xc94\xba99\x96\xbc\x87\x82\x91\xbd\x1e\x81\xb2\xbc\xf1\xe8\x99=\xd4r|;d\x9c\xa0\xbc\x97\x01*=\xcb\x8d~<\xa4\xc2\xe2\xbc\xcf\xb2\xb1=\xf3\xd8\x07\xbd+\xff\t\xbd\x0c\xd06\xbd\xf4\x1cl\xbc\x91@`\xbd\xab\n\xa6\xbb\xb8\xe6\x18=6\xc8\xa7\xbc\x17\xecI;r\xce\xa2\xbcirG=6\x00H\xbdn\t\x9c\xbdo90:\xe7k\xfe\xbc\xb4\x17\x12\xbd\xc6F!=\xa5j\xbb\xbd%\xa9\x87<\x06,\xa7=\xf0ua=\xd4\x8d\x0e=\xb9\x0e\x9e=P\xae\xd2<2\xa0\xc2\xbc\x16y\xc6\xbc\xf5fW=\n\x13\x8e\xbdyI\x18\xbd[n\xd1\xbb\xee\xd0\xca=\xd1\xd5\xba<__\xb1<\xaf0\xe9=\x7f\xb8\xb8\xbb\xf6\xbd\xe0=y\x1a\x19\xbd[@\x9e;lY\x06\xbe\xd9;\x18=\xd1Q\xb6\xbbE)\x8d\xbc\x94\xfb\x1d\xbe\xa5\x80\xed\xbd\xcc\xd8s=\x95\x8a\x82=g\xd2\xd6<\x842\x82\xbdj\x11\x9c\xbcD>O=\x81\xd5~\xbd\xd4e\x8a=\xb4\x84\x04\xbd2'G\xbdw\xa3\x07\xbe\xd6H\xb8\xbd\xf4\x0b\x87\xbc-\xf7\x02\xbd\xf5\x81\xe1\xbc\xea\xb7\x1e=t\\F=F &=v\xfdS=\x15\xa0C=\xa7\x92\x03\xbc\x0b~\xef\xbbB\xb3\xd9=N\x8a\xa4\xbdizB=oeg<g\xdb\x90=@\xfd\xb1\xbdt{\x08>\xac\xd4\xc7;\xb2&N\xbd\x89y\x0c=\xb7L\x7f\xbd\xcb\xda\xf1\xbb\x9c\x0f\xbe=}U\x1c\xbaU@Z=o\xc0\x87=E\xd1\xf1<\xa5\x82\xe1\xbc\x80\xd27<\x8b\xad\xa0=\x94x\x1f=\x01\x0b\x16=\xe94\xfd=\xb9\x9co\xbd:\x15\x00<O\xb6\x11=\xa8\x07\x8f<\xe9\xcc\xd5\xbbU\x15q\xbd\x96\xe7N=\xc5\xe8Y= AG=q9v<\x9aZ\xd4;\x11q\x9f\xbd\xa1\xa2\x8e=\xd1h\xf4;&\x16\x9d<x\x9a\x0b>\xff;\x05=\xfa\x8a\x97\xbb\xd5\x0c-\xbc\xcfF\xc0\xbcb\x9f\x85=L\xdb\xd3\xbc\x97\xca\x14<\xaa\x1a\xb4<\xa2\xfa\xfb<\xc7\x01\xad;\xcb4]<n\x1f\x95<\x96\xd1\xc5;@\x85.\xb9\xdf\xcfl<D\x82\x96\xbc\x9c\x1e\x95\xba\x8c\xe1\x98\xbcW\xa2u<\xc9w8\xbd\x00\x06\x9f=?N\x86<y-\xa5\xbd9\xcd\xb5=J\xc7\x80<\x916\x1c=I\xa8\xd1=\xbe\x13\x1b\xbdB\xfe\x9c\xbb\x95\x1c|\xbc\x00\x8eV\xbd\x00i\x9d=\xe4[~=$\xbd0\xbc\x15x\xb5=?]\x05\xbdW\x07\xeb<\x1b\xc8\xa1<O\xd0\xaa\xbd<\x82Z\xba9w\x86\xbdon\xda\xbd\xcf\xcaM\xbd\xa9\x0b\x02;*\x02\x88\xbc\xb9\xdc\xd1\xbd\xef\xdc\xa7=\xf1\x9b%\xbb\x8a\xe7\xc7\xbcr\xad\xac\xbb|\xfab\xbd\x14G\xb7\xbc\n\x1f\xfd=\x81{\xa0<L2\x8d<R\t\xca\xbddt\xd5\xbd\xd1\xb3\xf6;[\xab\x16=\xb5\xf3\xa7=/\xd0\xdd;\x82\xa5\\\xbdr\xe5\xbe\xbc_n\xb5=\xea\x869\xbauI\x1f=\x9a\xb0\x84<y\x88\x97=\x10ZG\xbd\xcaaY=,\x9d\x8f;\x9ci\x1d=9\x1c\\=\x8a\xcf\x00>[\xa0\xba=\x83t\x99<N\xf9\xb6<9\x91\x04=\xf2\x80\x0f="
-p132
-tp133
-bsV445233028135002112
-p134
-g2
-(g3
-(I0
-tp135
-g5
-tp136
-Rp137
-(I1
-(I200
-tp138
-g12
-I00
-S'\x97\x0bV?*\xf4\xa5>|P\x15\xbfY\x8c\x08\xbe\x1f\xfa\n>\xe6x@=\x03\xd0\xb3\xbd\xcd#\xb8\xbe\xb9\xef\x88=m\xb9\xf1>\x7f\xf5\x15\xbe\xb6\x13\x95\xbe\x08\xde^=\xe1\x00\x1c\xbe\xf1w\xea=\xb9\xcf\x11?\x00\x817\xbe\x85g\x8a\xbel\xfc\xa9\xbe0@`\xbeh\xef$\xbe\xb4\x9b\xa9:\xf5]\xee>\xfe\xcd\xb6>\xb8\xe4\x0b>\xc4\x1b\xec\xbd\xbf64>O\xa7\x0f\xbd\xa4\x01\xb5\xbe<\x8c\xdb\xbe\xfa\xb9\xfc\xbd\xee\x1d{\xbd\x07\x17u\xbd\x9c8\x16\xbfK$1>k:\xc8>\xdc\xcc\xf3>e\x92\x8c>\xfb\x97\xb1>\xcd\x00%\xbd\xdd\x94\xa3\xbep\x8dp\xbe\xea\xb7,\xbe>M\x08\xbe\t\xa8\xb3\xbeO\t\xef\xbd\xcaa\x0b?C\x06\xbc=\x16\x84\xe6=\xe2\xfcM?\xf8\x85G\xbe#t\xff>\x1e\xcc\xb9\xbe\x81\x88\xb0=HP\xf7\xbeKp2=\x1cd]>t3\xcc=\xd8VH\xbf\x7f\xc2+\xbf\xdd<\x98>\x05Jk?KH\xf4>v\xcfC\xbe\xba&Q\xbd\xde\xd7\xe3=\xbb?\xba\xbe]\x94;?\r\xa9\xa0>\xef{\xd9\xbe\x83\xed\x17\xbfA\x15"\xbf\xd1\xce\x12\xbf\\lC\xbe\xbc/\x82\xbe\xa4\xb7\xef\xbd\x916<\xbeO\xd2I>J\t\xdc>\xfdt\x80>\x99Z\xcf=\x83&\x14\xbcBF\x1d?a\xf5\xd3\xbe\xf9\xcdb>]\xff\xdf=\xc6\xc5\xaa>\xce_\xab\xbe5_!?\xb5G\x8b\xbe5\xf7\xfc\xbe_\xb8g>\x8d\x03\xbf\xbe\xd7\xa9\x8b\xbe\x81\xd7\xa8>\xbf\xeb\xd2<\xfb\x07\x06?\xfau\x9b>*8\x80=4\xe1\xa6\xbe\x0eA\x86\xbe=\xc8j>S5\x8c>\x92\r}>\xbb\xa5\x12?\xb8\x9b\xac\xbe\xc4\xf5\x84=\xfe\x823?\xb78\xa1\xbcf\x12\xd5\xbd\xb6\x9bY\xbfJ\x1c\x1f\xbea\xe2\x03?\x90M8>\xf7\xb0\x7f>U\n\x10\xbej\xe7\xf5\xbeG\x0c\xe7=\xb9\xbct\xbd\xc3%\xb9\xbd\xa71\x13?Z\xfc\xd9>`\x98\xf1\xbd\x8cR0>\xb7Q.\xbd\x03}\xb4>:\x87\x18\xbex\xac\x99>\rS<=\x93%\xd9=\xdeC8>\xb6\xdf`>\x07\xfe\x1c\xbd\x155D<\x9e\x9a?\xbeC\xf1\xbd<%\x12B\xbd\xf71\x9d<d\x85=\xbf\x91\xb4\xb7\xbdl\xa9\xb7\xbe\xc2\xe3 >\xaaw\xbd>t\x99\x15\xbf>g%?\x18\x00\x80>_\xaf\xcc<\xa7J\x81?\xaa\xc3\xb3\xbd\'\x06\x03\xbd\xef\xeb\x07=\xdd\xe1\n\xbe@\x86\xbc>\xb4(#>\xcd\xe3\xa6\xbd\xcd^\xf3>\x85]\xb5\xbe\x19\t\x8e\xbb\xc4\xdc\xff=\x03\xea\x0c\xbf\xdc{\xfa\xbe\xbc\xeb\x9a\xbe\x8d5"\xbfN\xb0\xe2\xbe\x9c\xb9C>\x94\xc5g<s\x8c\x1a\xbf\x83\xd9\xe4>z\xf7\xa7>\xfc\x14\t\xbe\x1bk(\xbd\xfd<\xc5\xbeS\xfd\x08\xbf\x11\x90!?C\'\xea=*M\xc3>\xa9\x92\xba\xbe95b\xbf^#g>\xe6\xad\x9b>D/\xdc>\x1f#\xbc\xbd\x1d\x0c\xc2\xbe\rA\xb0\xbe\x89\x96\x1e?6\t\xbb\xbc \x0e\xc4>0,\xb5=\x99\xc2\xad>\x01\xd6\xec<\x1a\x17e>Z\\\x03\xbd\xec\xf4\x9f>^\xd4e>s\x85Z?gU\x16?"\n\x9d\xbeo\x0c\x95\xbc\xc4\xaeb>\x9f\xeb\x8a\xbd'
-p139
-tp140
-bsV445233315352547329
-p141
-g2
-(g3
-(I0
-tp142
-g5
-tp143
-Rp144
-(I1
-(I200
-tp145
-g31
-I00
-S'e\xa1\xc2:\xac\x82\xbb8\xa3\x0e\x1d\xbb\xf13>\xba\x1c\xb8\xc89\xd7 \x88\xba\xcf\x85\xac\xba\xdbq\x1e;\x8a\xde\x8e:\x0c]\x93:~p#\xbb\xac\xa4\x15\xbb\xb6\x96\xe3:[^\xf5\xbaf\x80L\xba\x17^\xa0:g\xa7\xec7&\xf5\xbf:\xd3\x8d;\xba5W\xb9\xb9&\x10\x9b:x\xe6\x1c\xba\xc2\xb8\x03;\xabf\xb2\xba\xfc\xa5\x97:\x17\x84\x12\xbb\x1cV\xda:\x87\x86\xcd\xba\xc6\xb6\xa5:K$\x1b\xbb\xead\t;\xa7\x826\xba\xef\xdcc:9L\x1b;\xed\x89\x15\xb9\xfb\x83\x88\xba\x9b\xf7\x04;\xf9b\n\xb7$\x86\xfa\xba\xce\xc1\xdc\xba;\x0b\x08;\xa3\x8f\x18;\xd2t\xe7\xba\x0e\xed6\xba"\xe7\x82:\x06Q7\xba\x19\x18\x13:j\x80\x8f\xba\x9dW\x0e\xba\xae\xd1\xc5\xbax\x91\xfb\xbau\xbf\x03\xbb:\x81K\xb9l`\x028\xfd(\xde:A\x96\xaf\xba\xbe\x90i\xba9\x06\xb7\xba\xe08\x04\xba\x1b\xffn9\x08\xae\x01\xbb\xbd\xf8}\xba\xf8\x8c1\xba\x1ci\xf4:1\x91\xc3:Z\xf0\x17\xbbN4\x15:\xd9_f\xbaT\xe2\x8a:\'\xa1\x0e;\x98/\xff:u\xce[:\x0e6\x02;\xf1\xbf\x99:"V\x8d7\x98X\xce\xba\x9c76\xba\x1c\xc5\xde:\xd0\xdd\xba\xba&\xf2\xa2\xba\x0bX\xac:\x12\x1c\x1c; \xa3\x00\xbb*\xe6\xee\xba\x8a\x0e[9\x9e\x96\xb5:@\x8d\xbf:\x93\xcd\xd1\xb8XG#;|\xeb\xa4\xba@-\xc7:\x189\xff:\x8e\xe4\xae:\xd8\xea\x9e:\xfd\xd4\x04\xb8\xbb"49\xadZ\xf2:\xbf\xcc\x17\xbb\xf3f\x0e\xbb\xdb\x06-\xba\xedd\xf2:\x85a\xe3:9\xc0\x878$`\x9c:\xd3K\xd9\xba[e\x10;8u\x00;\xc1\x99\xc9\xba\xb1\xc7\x17\xba\x11\x93\x97\xba\x99\x9a\xc9\xba.+\xf1:\xe2w\x07\xbbT\xbb\xf4:\xd1~\xac:\x94\xea\x1a:\x8b3\xc0:CGa:\xca\x1f\xe4\xb8U=\x05\xbb*\xd5\xa4:\xa6P\x14\xbb<\xd1\x94\xba\x8c+\x16;\xe3\x1f\xf3:<0J:\x19^\xab\xban=\x13\xbb\xec\xe4<:e\xa4 ;W{\x059\x06\xf6\x9a\xba\x1fR\xda:\n\x86\x02;\xd6Z\xa0\xbaD\xd5\xdc:\x81Y\x8e:\x8d\xf9\x9d\xba\xefA\xd6:\xbaH\xbe\xba\xda\xbf\x8d\xb98y\x01\xbb\x1b\xf1\xcb\xb9\xf2\x01_\xba\x06\xdd\xb0\xba\'\xf17\xba\x1e\r\x14\xba&n#;"\x83\xa5\xba|\xd5\xc38\xf8\x10\x1e;\r\xe4\x96\xba\xccy\x1b\xb9\xb8\xfc\x15\xbb\x13\x19\x188s6\x1b;M\xc7\xb6\xba\xdcj\xdd\xba\tz\x02;\x1e\x8c[\xba\xc4Z\xe6\xb9\x9dU\x829O"\x0e\xbb\xe7.\r;\xf5c\xd8:l\xe8\xcb:\xeb\x08\x0e\xbb^I\x9d\xb9\x937\xb3\xba\x92y\xb5\xba\x08_i\xba^ \x0e\xbb\x9eR\xb1:Q\xc6\x03\xba\xbf2\x92:)\x8c\x11;\x16\xbc\x02;@\xc9\xbc\xba\xb2\xbe\x98\xb9$\xd5=\xba\x86\x82\x16\xbb\xe3\xe2\x0b8\xa4\xf8\xd6\xbaT\xc7^:\x08\x17\xe0:Ty\x00;&!\xa2:\t\x9ah:\x8f#\xee\xba\xa9\xb4\xf5:\xe9\xf5p\xbad\xc2\x0f\xbb\\q\x08\xbb\x81U\x08;\x87\x88z\xba\xa9\xe6W\xb7\xdb!\x1e;L\n\xe49g\xd5\xb6\xba\xdch*\xba'
-p146
-tp147
-bsV473379271755300864
-p148
-g2
-(g3
-(I0
-tp149
-g5
-tp150
-Rp151
-(I1
-(I200
-tp152
-g12
-I00
-S'.\x1f\x87?\xb9\xd0\xb4>\xfdy\xea\xbe\x1c\x1b\xbf\xbeYl(>\x9f\xf1\x80>or\x13\xbe\x1bl\x90\xbe:\x89?>\xf3\xfa2?-!\xc8\xbd/\n\x14\xbe\xbf\x19#>\xb3\xd7\xf2\xbdc\xe9<<\xbc\xa8\t?\xfb\xc7\x81\xbe7\xd9k\xbe\xb2\xec\x9e\xbecl\x96\xbe\xbbl\x80\xbe\xdc\xe9g>\x9fx\xfa>U\x16\xcc>\xebA\xf0=\x18bF\xbe\x9f\xa5\xa1=\xc1>\x11\xbe8.\xaa\xbeX\x99\xc3\xbe\xea\x89\x8f>\xe0\xa4\xef\xbdr\xd8\xc2\xbc\x0bl\xd3\xbe\xc2\xa2\x7f>\xc9\x82\x99>\x9e7\x12?C\x80=>\xb3\x11\xd5>r\xae\xee<.\x87P\xbe\x1d\x95j\xbe\x93\xc8\x04>\xac\xa2k\xbe\xdb\xc2\x19\xbb\xceX\x19;\xe19B?\x92\xe2\xa5\xbd\xa8\x13D\xbc\xa6\xd0o?c\xf6\x06\xbe\xaa\xeb\x1a?\xae\x1b\xef\xbe\xb7\x94\xc2=o\x0f*\xbf(\x8f\x15>\x00\xa1\xaf>\xc1\xd0\x85>\xca\xa2y\xbf\x8e\xc1\x10\xbf\x1e\x00\xfb>\x7f\x0eq?7\xdc\x99>\xb7a4\xbe\xb4?\x98\xbe\x8dK4<\xd1u\xbc\xbe\xf4\xd4z?\x1e\xf3\x04>\x02\r\x8a\xbe\xe2Y\xdb\xbe{\x1d\xe2\xbe\xbd\xcf\xb7\xbe\xe3PU\xbe\x1cgc\xbe\xab\xa4/\xbe\x90\xd6\xb3\xbeg\xb5T>\tS\x0c>\xb2W\xef\xbc6\xf3U=s\xc4v\xbe\xf89\x1f?(\xfa\xac\xbe]a\xad>\xb1\xa1K>\xb8H\xd8>\x1c*\t\xbe\xd9\xdb\x0f?\x17\x13\x1e\xbd\xcbw\xdc\xbe\x19\x13\xf4=\r\xf6\xfb\xbe\xbe\x9f\x0c\xbd&\xf9\xef>\x89\x9f\xc5;\xbf~\x8f>\x96|\xd5>\xd3\xc7/</<\xc0\xbeN\x13\xb8\xbe\x9e\x1e\xe7=\x1e\x1b\xa1>\x86(\xd3\xbb\xdf\x01\xdd>\x06\xa0\x1a\xbe%\x8f\x80>\x98t\x17?]\xb9:\xbe\xf1`B\xbe"\xdaw\xbf\x9b\xb7\x02\xbd\x96\xe6\t?\x19\xb4\xb4=c\x9b~>]\x1f\x99\xbeC\xf6\xa1\xben\xcb+>\xa4\x12C>\xd0\x04\x18=\x078\x00? \xff\xb7>\x18\xbe+\xbe2\xde\x8c>\x95a\x80<\xcb\x19\xbc>\xc7\xfd\x15\xbc>\x97\x85>\x8d\xe7\xd2\xbc \xdeU\xbe\xc72\x94>\x13\x7f\xe2=\x1a\t\'\xbe\x8b\x14\xf1\xbd\xa9(\x97\xbd\xe4\xb1\xb0\xbd\x01\xdf\xd4=\xd2\x00\xa0\xbd\x8fK\x08\xbf\xfdU\r\xbe\x94_Z\xbec\xed\x18\xbe\xb3P\xd6>\xa3a\x04\xbf\xa5\x135?\x0c\x90\x8d>Os\x16>\x96|\x1d?`\xa9\\\xbe?f\xe3\xbd\x93\x9d\xf6\xbc\x82\xa7T\xbe*~\xae>\xab\x91\xaf=\xd6{C\xbd \xdek>\xe6\xccm\xbe\xa9\x9eI\xbb\x16j\x95<>\xcf\x0c\xbfq:\x0b\xbf\x0b\xaf\x0c\xbeD\x98\xdd\xbeN\xc5(\xbe\x12\xd6\x99>\xbaL\xc0\xbc\n\xd8\xf6\xbe\x90\xff\xe5>\xee;\xb0>\xf3@8\xbe\x82\x16`=\x8dv\x8f\xbd\xa2\x00\xd1\xbe?og?\xd0BK>k\xae\x90>I\xfc\xca\xbe\xe49X\xbf\x82s$=\xf8\xa8\xb2>\xe2D\xa7>\xb7zD\xbefk\xc4\xbe\xcc\xba\x17\xbfc\xd4\xb8>\x0c\x9a\x83\xbdp\x92a>\xe3F\xb4\xbc\xf5V7>\xdea\xef=\xb9;\xfa=\x08\x8e\x84\xbcn\xad\xbf>`\xdf\xd2=\xe8Pr?\xf6\x07\x1b?\x82)\xe6\xbe\xf4\xaa\xba\xbd\xd6p\x12>,\x0e\xe3>'
-p153
-tp154
-bsV445232231364448256
-p155
-g2
-(g3
-(I0
-tp156
-g5
-tp157
-Rp158
-(I1
-(I200
-tp159
-g12
-I00
-S'y5\t?\xae\x08\x10>*K\x13\xbf\x87\t\xbf=\xee\xcdD>\xcd\xbe\xcc\xbd\x00\xb2\x92\xbd\x86\xfb{\xbe\xbc\xc2\x0b=\xc99U>x\xe6\xcf\xbdn\xca\x00\xbe\xa0G\x81=Q\xd4\xa5\xbd\x11\xfc#>8\x9b\xfb>P0\x8b\xbd\xc6\xbc.\xbe5M\x82\xbe!\x0b\xd2\xbd\xe8\x10)\xbe\xe4\x183\xbd\x8f\x03\xa7>M*]=\x8f\xb6\xb7=\xb8\xed\x05\xbeu\xd0Y>\xecm\xdb\xbc\xac+\x8a\xbeV\x14V\xbe\xc2z:\xbe\xd2e\xaa\xbb\xf2f\xc4<\xd1\x00\x08\xbf1\xf6\xfa=\xb4^\x8a>\x18\xd5\x8a>Y\xfb\x90>\x19r\xc1>yr&\xbe\x9a\xad\xae\xbe\xb6\x8a\xa6\xbd\r\xb1y\xbd\xb5\xa6\xbf\xbd\xc0\xcd\xca\xbe\x0cb5\xbe\xd7s\xda>\x18\xde\x08>\x1a\x8a->\xf3\x8f\x12?0\x0b\t\xbdX0\xff>\x9e#f\xbe\xde\xc3\xc3=\xdf\x80\xc0\xbe\x15\xb3\xe7=\xd8s\xa3=\xed\xf7\xb0\xbd=Z\x05\xbf:!\x0b\xbf^O\x19>b\x93\x11?\xd6g\xc8>\xeb\x1cs\xbe{\xe1\x04>^\xf1c=\x985\x90\xbe3q\xe7>\x0e\r:>\xffk\x8e\xbe\x03\x1b$\xbf\x03\x0f\x0f\xbf\xb4\x88\xd5\xbe\xfd\xf0\xc0\xbd\x17\x18+\xbe\xa1\xe6\x85=\x96\xf3\xc6<m\xf3\xfe=@\x91\xdc>\x98\xce\x9a>\x86\xb5\x86<\xfc\x88\xb7=7\xa5\xc8>(0\xb7\xbeQ\xce\xb4=EQ\xab=_,\xb4>\x8eV\xad\xbe\xbf\xf0\x1c?JE\x81\xbe\x8b\xf7\xc5\xbe\xa8\xdf\x8c>Xa\xa5\xbe\xff\x8ei\xbeo\x8f\x84>\xff\xf7\x96=^\xb1\xdc>\xf3fa>\xab/\xf3=W\x1c\x86\xbe"\xf9\x81\xbcfp\x8e>\xcf\xfef>\xf0\xee\xa7>\x0e\x9d\x15?>d\x9e\xbeq\xa5H\xbdZ\x88\xf6>i\xb0\xac<fJ\x03\xbdX\xf6\n\xbf\xab\x97\x91\xbdb\xe5\xe6>"IX>p\x03\xe2= \xe7\xa7\xbdV\xd0\x01\xbfzs\xfc=\x081W\xbd\xbfC\xaf\xbd\xe5\xb3\x14?\xf5\x06\xa7>s\xc0\xc5\xbd\xa8\x9c\xeb=:\xf7P=\xec\xe7\x99>\x08\xbc]\xbe\x1ez\x1d>h\x87\xd5=C\xe6\x83>~\xaa+>\x16\xdbZ>\x88D\x9f=\xe8\xe3j=B\x87\xc3\xbd\xfe\x92\xc5=Z\xebl<\xd2Z\x9d=i_\xfd\xbem\xd6\xde\xbd\x04\x89\xc2\xbe\xd7\x87\xac>B\xa0h>\x08{\r\xbf\xab\xbf\xc5>\x8f\xba\xf2<\xd8\xc6v<\x1f,G?/Q\xbb\xbd\xf8\xf5\x05\xbd{\xb3\x04>ej*\xbdB\xce~>\x00\xb5\x0f>\x90\x95\x94\xbc\xf1q\x14?\xd8\x0c\xae\xbeH\xb8-=V9U>_\xb4\xdf\xbe\xf4\xbfO\xbe\xbbZ\xcd\xbe\xef\xf3\x1d\xbf\x03\xcc\x99\xbe\xbb\xb8\xb4=\x85\x1c\xbf<2\xce\x04\xbf\xdbB\xe6>\x7f\x03;>(\xbb\x19\xbe\xa7\x80%\xbd~\xa2\xbd\xbe\x84.\xc6\xbe\xb8\x1c\xef>\x9b\x08\x88=\x9cB\x82>q\xa4y\xbe\xb4q0\xbf\xdf\xa1\x9e>{Md>M6\xbc>@\xcf\xfd\xbc\xb9\x9e\x90\xbe\xadX\x9d\xbd\xe1\x0b\x08?\xfe\xec\xc8<\xc8\xcf\xcb>\xf9\xb1\xc6=x\xbd\xad>\x02\xa7\xc6\xbd\x86E\xa5>>z/=I\xe0j>i\xbb/>\xca\xc7&?\x01\x0e\xc8>^\xb5\xdf\xbd\x0b\xdc\xe7:\'B\x02>\x9d\x95N\xbe'
-p160
-tp161
-bsV445912109340057601
-p162
-g2
-(g3
-(I0
-tp163
-g5
-tp164
-Rp165
-(I1
-(I200
-tp166
-g12
-I00
-S'\x9f\x0c\xcb>\x8bx\xb1=\x11i\xb2\xbe\x83UA=\x99j5>\xc2\x97\xb5\xbd\x0e\xdf\x7f\xbd\xd2\x02s\xbeVHv\xbc\x1b\x18\x1e>\xb7\x93\xbf\xb9\xd2 !\xbd\xdf\t<=\xa6c\x91=0\xc0}\xbds6\xa0>\x9aW~\xbd\xc5(\x87\xbd"\x9a\xfc\xbd%1L\xbd\xf5J\xe7\xbd\x19\xfa\x03\xbd\x95\xf5D>\x8f*\xfd\xbd\x8a9\xa1\xbc\x0eB\xff\xbc_\x93!>\x167\x1c\xbeM\'K\xbeWsU=\xa7q\x9a\xbdK\xb0\x16\xbe\xc5\xf1\xe5=7\x19\x80\xbe`\xe9\x8b=(\xfc\x9c>\xb0<4>\x18\x1d\x1d>v\x0f\x93>\x8e\x11\x8e=\x86\xba\xe6\xbd#`\xca\xbd\xd8i\xe6=\x9b\xf1A\xbe\x16\xe2P\xbey\xd9@\xbd\xab<\x9e>\x1a\x94]=wOa=\xe8\x8e\xc1>N2\xf9\xbc\xffu\x98>\x02\x9b\x13\xbe[\x8e\xf19-\xef\xaf\xbex\xd4\xd3=\n\xeb\x00=\xf5\xca\xc1\xbc\x8a\xd7\xe0\xbe\x9bU\xc9\xbe\xaa\xcb\x16>\xe6\xeau>?\x9d\xdc=\x88\x8e7\xbe-\x14:\xbdy\x8e\x12>W\xc4%\xbe#\xd2[>\xf77(\xbd\xa9./\xbe\xb6@\x03\xbfi\xb9\x97\xbe\x9ar&\xbe\xc7\x94#\xbe\x0b\x0f\xd5\xbdOc\x13>\x08\xc0{=&\xea\xd8= \x8bQ>`")>\x82}\x13\xbd \xbe\xfc:F\x9a\x86>\xdb\xbe|\xbe\xc2\xbd\x1e>\x8f\xe1\x8f=a\x16\x87>E\xff\x8c\xbe2\xa8\xe0>\n\x15^\xbc\'\xca\x18\xbe\xd3\n,>e3\x8d\xbe\xe0\xec\x16\xbc\xefR\x8b>\x1b\x04\x94=\xaf\xb5z>H\xd9F>\xd6\x8aq=r\xfc\xf3\xbd\xc0\x15\xae\xbc\xa7\xc4\x8a>J\xe6\xb4=E\x90\xfe=\x16\xb9\xd0>>.V\xbe\xb7\xd9\xe69\xf2iL>\x0e\x108=e\xdfq\xbb\xd0\x82j\xbe\xeb\xb0\xd4=6Z\x87>\x0fN8>cf\xd0=\xf5\x01M\xbbg\xe3\x8c\xbe%VV>&+*=6l\xb4<\x93S\xc1>\xd7aC>\xb1\xf2\x8e\xbd\xd2@\xe9;\x9d\x9b\x9c\xbdk+<>3,\n\xbeJ\xa6\x96=\xb5\x01\x8d=f\xfb\xfa=\xf26[=\x87=\x19>\xc7<\x97=\t\xd4d\xbcE\xf3\xa6\xbc\xc7s\xb6\xbcj\x82B\xbd\xbb}\xc0\xbc\x01G)\xbe\xa0\x9d\xd7<o\xd38\xbe\xebiR>V\xe4\xba=\xaeY\x9c\xbe\x89G\x92>\xae\x19\x8d\xbc\xa2\xaf\xaf=\xe9\x86\xbe>\xdf\x9ck\xbdN\x1f\x1e\xbc(\xba\x8c=m\\\x96\xbd\x02\xefr>\xb1V%>H\x00\n<\x01\xa4\x91>v\x98\xf2\xbd\x1b\xde\xca=Xy\x93=n\xc3O\xbe\x9bG\x9e\xbd\x1a\xa9\x89\xbe@\x10\xba\xbe!$\x13\xbe\xd5\x94\x12;\xc9\xd2]<w8\xb4\xbe8[\x85>\xd69\x9d=\xc5\x9d\xa4\xbd2N\x9b\xbc\xd7\xeb{\xbe\xc0\xc9\x1d\xbe\xa25\xb6>~tu==\n\x10>E\x07\x86\xbex4\xd2\xbe\'\xaf\x91=o\xfa\x15>\xf5\xedl>9\xce7\xbc\x89F \xbe\x03V\xae\xbd\x07\xdc\x93>\x19=!=\x8el2>\xb7Lp=\xfe,n>\xfdX\x1d\xbe\xdb\xa2\\>^\x92\x18=79\x18>\xd9$R>\x00#\xdd>\xc9\xc6\xa2>%\xd2\x17\xbd\xd7Fs=`\x8c\x99=\xb0 q='
-p167
-tp168
-bsV445257821915865088
-p169
-g2
-(g3
-(I0
-tp170
-g5
-tp171
-Rp172
-(I1
-(I200
-tp173
-g12
-I00
-S'\x94n\xd1>\x97\x98\x84=L\xbd\xa6\xbe\xd8;\xf3<\x92\r<>\r\x89\xc9\xbcd:F\xbd\x1e\x98\x11\xbe\xd9\x04\x96<\x9b\xa2\x91>\xb0\x88\x16\xbe\xb5\xa7\x00\xbe<\xffo<\xbf\x08\x07\xbe\'\x92\x01<J\x99\xab>\x9cL\'\xbdj\x14\x0b\xbd\xd4\xffk\xbe\xdd\x86=\xbe\x90\xca\x12\xbe\x1c\xcb\x0f;gL\x1f>6W\xf6<\x0bp\x12>\x00D\x1b\xbe\xb1\x95z>&\xc4\xf4<\xbf<\x9c\xbe\x85\xf7\x18\xbe.E\x17\xbef\xfeI<\xde\x17\xd2=\xc6N\xf7\xbe\xf0a\xd6=\xe2y\x12>\xd6RP>\xccZ\x11>wA\xbc>\xf0\x9c\x01\xbe\xe5`x\xbe\x8dW\xf9\xbd\x81\xdc\x1c>B0\xb9\xbd\xea[k\xbe\xb6\xe6M\xbe\xefZ\x96>\xeaOp>\xf0\r\x1b>p\xb6\xba>|"\xca\xbd\xc8;\xf6>\xba)T\xbe\xda\xf4\xde= \x02\xb6\xbe\\\xe9E\xbc\x83\x9b\x9b<\xc0\x91\x14\xbd\x1e&\x0f\xbf`4\xae\xbef\xc6\xed=\x97\xaf\xde>\x00_\xd9>\x93~\xcf\xbd\xfb\xa5\x96\xbcpP\xf8\xbc\xbe&O\xbe\xe1\xb5\xa3>V\x88{>\xb1\xbbL\xbex\n\xfc\xbe<P\xbb\xbe\n.\x0f\xbe\xd8\xef\x14\xbe\xbfH;\xbd\x8eG\xad=\x0fQK\xbd\xc1\xfb\xc2=a\xc1\xab>\xf6l0>\x14\xdaG\xbd\xb2a}\xbd0\xe6\xab>\x8a\xabw\xbeL\x1c\xb7\xbc\x97\xa1H\xbd\xb1\xe2\xa5> )T\xbe6X\xe5>\x0cA\\\xbe\x8c\x12)\xbe\xd8_\x12=9\x151\xbe\xa8x\xa0\xbe\xe5\x9a\x82>BC\xdb=f\xe5\xa7>r].>\xf7\xd5\x82=|\xb9\x85\xbe\xcf\xf2\x86=\xcf=O>\xeakd>\xbb)\xe6=:\xe9\xb7>\xb3)R\xbe\x94\x1f\xab\xbd?\xd4\x94>\x10#\xc6<\x9f\xf4\xc7=\xc8f\xf3\xbe\xb8\x93\xff\xbb\xb1\x15\xb4>\xe08B>@\\\x0f\xbboe!=\xa6d\xb2\xbeF\\\t>\xe0\x9b\x9c=\xe6\xae\x86\xbd\xdeF\xc6>\xe2\x8cw>\n\x02\x82\xbd\xa8\x91@>oU\x13=Y\x14>>Y\x07C\xbe\x8a\xc3\x88=\x86<2>\xe7}\xbd>>"\xc4=\x1d\x00\x98\xbdQi\xe4=t\x98\'=\xadP\x93=\xff\x87\x93\xbd*\xa7\xba=\xc5\x11I=05\x88\xbe$\xcd\xd7\xbdi\xfe\xaf\xbe\x9c\x82\x97>\xd4\x08a>\x98\xc8\xb3\xbe\xf4\xfa\x8f>Z\xdf\xc6=6\x16\xbb<\xf8t\x0c?0w\x14;\x05P\x8d\xbdrr^<Ns)\xbe\x94\x9a\t>\x1c\xa4\x8b=\x82\x9a\xb8;\xaeq\xb9>\x93\x04\x9d\xbe0W\xda=\xaaya=&W\xd0\xbe\x90\x05\x16\xbe\xbd\xf7\xd3\xbe\x83\x83\x0f\xbf\xd1T\x19\xbee\xd1\x08>C.\x83=\xdf\x8a\xd2\xbe\xa2\xc5\x88>\xeev\xf5=|l\x1f\xbe\x03\xdf\x85\xbd\xed\x86\x8d\xbe\x1e\xc0\x93\xbe\xca\xf2\xc1>\x9a\xdeh=w\xfd\x0f>6\ra\xbe\xb9\xf9\x0e\xbf\xe7\x7f\x1e>\xe1\xb5_=Z1)>\x06;\x8f=\xea\xac\x87\xbe\xff\x16\xb2<\x9c\xab\xf2>\xf9\x12\xb4=\x8e8D>\xa4\xaf\'=J\xe7\x7f>r\x1b\x10\xbe\x00\xb6\x8a>X\xbc\x10\xbb\xc6"\xaf=\xfcw\xa9=+\x97\x0e?\x92BZ>\xfde\x81\xbd)P\xa6\xbc\xd8\xc7\xdf=:\x9a\x17\xbd'
-p174
-tp175
-bsV473451385363501056
-p176
-g2
-(g3
-(I0
-tp177
-g5
-tp178
-Rp179
-(I1
-(I200
-tp180
-g12
-I00
-S"\x08\xe2\xe9>\x87\xd0\x16>\x00\xe6\xe1\xbe\x1d\\\x0c\xbe\xdc\x04*>\xf7O;<\xeb=\xcd\xbcIQv\xbe\xdbfB\xbd\xb5qt>\xaf\xd5g\xbd\x15\xa4\xf2\xbd\xe8\xdbC>'\xb1\xaa\xbd\xc1\x9d\x9c\xbd\x8d\x12\x8b>\x9f+\xa2\xbd\xbb\xad\x1d\xbe;\xfd5\xbeHVY<\xb9mk\xbe0&y=\xf3\xb1:>c\xb5\xde\xbc\xf3>D=[\xe4\xea\xbda\x12\x1d>\x14r@\xbds\xd3\x91\xbe\x91\x16\x8f\xbd\x0b\xc7S=M5\xa8\xbc\xec\xa7/\xbcu}\x93\xbek\x90\xee<\xf4\xcbB>\x95S9>\xcb!8>\x18\xc2\x92>]\x92\x1f<(\xf2\xc7\xbd\xf5\xc2\x0f\xbb\xa4\x0e\xc0= \xa0k\xbeN\xbe\x14\xbe\x87Hu\xbdXg\xc4>\xbc3\x80\xbc\xac\n(=\xd7\x10\xf7>\x89{\x98<\xd7[\xbd>\x17\xc7j\xbe`\xf4r=\xb0\x96\xad\xbe\xf0n\x13>\xc7a\x13>\x1bcQ=%\\\xe6\xbe\xa3$\xbe\xbe\x0f\xd6\x99>$\n\xb4>\xfb\xb9\xdf=E\xe3+\xbeW\xbcK\xbdb\x8c\x13>\xed\xdb2\xbeX9\xb4>\x87\xd2\xb9\xbdL\x1c\xfe\xbd@\xab\xd4\xbe\xe7H\xb1\xbeR\xb0\x00\xbe#\xc6k\xbdo\xcaP\xbei)\xc2;\xcf\xbe0=\x11\x1b\x0f>GK%>\xe3\x02\xe8=\xf1B&\xbc\xd3\xbe\x08\xbd\xf0<\xae>\x17\xc1?\xbe\xf69\x00>\x01 B>\x00\x8eB> `a\xbe\xdf?\xb0>\x95\xbf\xa3\xbdU\x8b\x84\xbe\x98\xc4#>t\x06\x92\xbe\tp\xa8\xbd'J&>\x0b\xbd\x8d=\x8d\x17!>\xc0\x02p>\xbbU*=\x996\xc6\xbd\xf3\xcb\x99\xbc\x8bM;>\x1c\xa6\x1d>\x0b\xa2\x17>\x87\xad\x85>\x85\xf0_\xbe\xefe\x83=RX\x9c>\xab=\xd39;\x15\x94\xbc\x10\xa9\xa8\xbe\xd1A\xca=\x7f%\x8d>\n\xfd\x18>d\x0f\x81=~\xce\x12\xbe\\8\x96\xbe\xcd\xdb\x7f>\x9b\x87D\xbdH\xe5\xd5=\x11\xf0\xd3>\xefW\xee=\xed\xa8\r\xbe\xa3\xe9\xd7=\xd1\xfd\x92\xbc\xd9&V>y\n\x14\xbes-Q=\x15\n\x9c;\xf8\x12\xe7\xbc,\x06\xf8=\xbe\xb0%>\xf8\xd8\xc7;\xdb/W=\xc6\x9b\x92\xbc\xe0DT=\xc1\x9eB\xbd\x01-\x81\xbd\xaft*\xbe\xcf6?=\x8d\x065\xbeD\xf6\x0b>\xbd\xc9\xd8=\xed\xb3\xb5\xbe\x03|\xac>\xa1&\xd1=i\xa38>\xb5\xe1\xd2>#\xe2\x07\xbew\xdc\xb4\xbd \x96\x94<\x0fZ\xf3\xbd\xa2\xa9\xa7>\x0b\xd4h>\xefjB\xbdO\x0f\x9b>\xf3\xb9\xb3\xbd\x87ia=\xbf\xff\x90=\x05T\x96\xbe\xac@\xd8\xbd\x95\x92H\xbe\xf7r\x98\xbe\x7f\x18|\xbe\x9c\x90\xdd=\xc5\x89\x17\xbe\x97u\xd9\xbe\xa7\x91O>\x07\x18\x16>w\xb6\xb9<\xdb\xd70={$\x1e\xbean\x15\xbe4\x05\xe2>u\xff\x1b=\xe7l\x9d=\xe7e\xa0\xbe\x08\xda\x02\xbfH1/\xbb\x97\xa5\x0e>\x05\xbb\x7f>M\xd3\xaa\xbd\xbb\x9at\xbe\xc5[\x87\xbe\xc8\xe6\x80>i\xedx\xbd\xfb\xc3K>\xb5h\x1f=w_\x8d>\x8fM8\xbdm\xfa\x13>\xa7\x9e\xf6\xbb\x89\xbap>\x83b\x1e>\xbd\x81\xec>l\xf7\xab>\xa5\xfd\x82\xbd\xc4Y$=b\x1a\xa4=J\xc1\x04>"
-p181
-tp182
-bsV445232110345781248
-p183
-g2
-(g3
-(I0
-tp184
-g5
-tp185
-Rp186
-(I1
-(I200
-tp187
-g12
-I00
-S'\xc5S\r?\x91\x158<]!\x01\xbf\x8e\xd3\x9a\xbd(\x8b`>\x10\xc5N\xbd\xdfl\xcb\xbc\xd4\xdfj\xbe\xa8x\x9e=*n\x8c>[\xdaZ\xbb\xf0\xa0\x95=Q5(>\xb3W\x9c\xbdY\xbd\xac\xbd\xcb\xcd\x9c>kL+\xbd\xc4\xa4\xc4;=\xb7A\xbe\t\xca8<\x19\xca\x96\xbe{/\x8c=\xd1\x0c0>\x80D\x8f\xbe1\xcf\xb7\xbd\x04\t\xd9\xbd\x13\xd0g>\xe00b\xbe\xf4\x1c\xb3\xbeC@\xd4=L\x07f>\xcb\xb7\xb8\xbdt\xda\xd1\xbchR\x97\xbe\x1e\xef\x8b\xbc/\x9e\x97>4\x95O>!\xf8\'>!C\xf2>W\x87\xd7;\x95\xc8\x1d\xbe\xb0\xcf\xdf\xba\xc9)h>\xe8W\x97\xbe\xde?\x16\xbe\xd8\xae\xd1\xbd\xf7\x1c ?\xcct5\xbdT\xe9\xd6<IE\r?\x97\x14\xce=\x00\xde\x05?\xech\xb4\xbe\xef\x8ex<\xf1\xfd\xe5\xbe\xd76\xb6>\xfa\x9f">\xf3]\x14\xbd\xe8n\xf0\xbe\xa3W\xf2\xbe\x94\xd1\xb6>\xaaI\x91>c\x08F\xbc\xc4PS\xbe\xf3\xec\n=\xa4\xafQ>\x11Nq\xbe\xf8P\xc5>T6\xb7\xbe\xdaP\x89\xbdJ7\x06\xbf\xd8/\xd0\xbe\x8e\x87\x91<IC\x06\xbe+\x93b\xbe\xde\xcf\t>3\xd10>"L\x16>)\xfap=:\xf7\x04>E\xc5Z\xbd\x89\xc3m\xbd\xaf\x9e\xa8>\xfb\'<\xbe\x83&\x0f>\t\xda3>+Q\x95>\xd3\x04\xac\xbe\xcb\xd1\x00?t\xee[=yp\xaf\xbeJ\xb2\x8c>\xcb3\xcb\xbe\xe5\xa2\x08>k\xae\xbb>g\x0b\x17=\x83L\xf0=\xa5\x0c\x85>\xd4\xf88>YhZ\xbd\xc9V\x9c\xbbyrb>%\x192>\xafo%>\x1c\xe4k>\xd1\xf0\x9c\xbe\x04:\xe5=\xf1[o>7\xdav\xbc\xbc)h\xbdS \x9e\xbee\xec\x9e=1F\x9c>y\xd2\x11>\xa3\xcf\x00>X\xaa\xe0\xbd\xcb]\xc5\xbe\xa5b\xa8>\x00\x9a\x95=5\xf1\x8c=^\x1f\x07?\x87\xed\x00>\xf4R%\xbe\x04E\xe1=X\xdf\xa5=\x8b\x8c\xc1>\x997K\xbe\xff`=\xbdA\xb6K\xbdv\xec\x1f\xbe5kO>\x93s\x7f>\xd1\x0e?=\xcd\x12+\xbd\xc3u\xbf=\xa4\xeb\x1f>L0\xf4<(\xb0\xb0\xbc\xf3\xc8\x10\xbe\xc2\xb6\x96=|\x17T\xbe\x05\xb6F>Sf\xd4<i\xd9\x01\xbfi\x9al>\xff\xb4\xf2\xbd\xeb\xe7\x9e>\xc77\xaa>\xbdy\x8c\xbe,{f\xbd\x05\x9f\'<\xe3\xc3\x88\xbd\xdb\x95\x84>M\x9ck>\xcc\x9fx=@\xdd\xc4>\xd1\xc1?\xbd\x1f\x9a\xc9=\xc44e=\xd4<\x92\xbe18d\xbdS\x1aK\xbe\xf1\x9e\xa8\xbe$\xf1A\xbeKe?=mm\x13\xbe9\xad\x19\xbf(\x89\x9b>\x1c\xa6_=\xcd\xa4\xd6\xbc\xefl0>\xbbt\xd2\xbd\x85\x0e4\xbda\xd9\'?\xa3^">+\x0f\x9a=]\x18\x8f\xbe\xff(\xf5\xbe\x05\xb5\xf7\xbb\xf8]U>/\x83\x94>\xfd\xa8N\xbd\x81\x93\x92\xbek}\x9e\xbe\xa5\x89b>\xed\xca\xf5\xbdWS\xb8>\x89\x06\xb2=\xd8I\x84>W\x90P\xbd\xbc\x8c >\x9c\xa7\xef=U\x87\xb5>\x7f\xca\x88=e\xe2\xfc>,\xcc\xd4>$,\x07\xbd\xd5i\x1e= \xb83;\xe7\xc4\x85>'
-p188
-tp189
-bsV459199896323510272
-p190
-g2
-(g3
-(I0
-tp191
-g5
-tp192
-Rp193
-(I1
-(I200
-tp194
-g12
-I00
-S'\x03h\x1a\xbc\xe8\xcc\x0b\xbd\xbfh\x97\xbd\xc5V4=\xe5\xd2\x9b=0A\xec\xbb&\x9cU\xbd\x0fW\xf8\xbdU\x11\xe6\xbdSI\xd6=B\x06\x08=\x86\xd0+\xbd\xab\x10g=\xc6\xd2}=\x034\xc0\xbdw;\xbc=j\x12\x82\xbd\x913\x8c\xbd\x8f\x10\x13\xbd\x8fq\x00<\x1f\xc9\xaa\xbd\x15\xe9\x98\xbds\xda\xe2\xbc\xa5\x9f\xb6\xbdFb*\xbdYU\x83<\xa5n\xbb=\xef\x15\xdc\xbd\x1f\xfb\x08\xbe#\x10\x82=\x9e\r#\xbez"\xb4\xbd\xe9:\x01>F\x11\xed\xbd!\xda\xa9;\xe5\x007>s\xb5C=E\xf9\xd58\xed\xdd\xab=\xf7\x04\x07>\x93\x82\x91<Ia3\xbd*Y\x02>\x8e3\xe5\xbd\xbb\xfbr\xbd\xe7\xe5\xb7<\x85?\xbb=y\xd1\xb2=xE!=\xe1\x0b\xab=\xe9\xc6\x8d9\x95\xfe\xd2=\x1d\x87\xba<~\x93\x80\xbd\xe9\xabq\xbe\xb0\x9c<=Y\xe1\xcf\xbd\x18\x10Y\xbd\xde\xbbm\xbev\x00\x1e\xbe\xd1\x90\x15=#\xe4\xf6\xbcH\x05\xcd\xba@N\x10\xbe"?+\xbdq\x1e\x15>|\x87\x80\xbdX\x90\xe0\xbc\x07\x0c\x04\xbe\x07\xcc\x90\xbd\xeb\xf9>\xbe\x9aT\xf6\xbd;\xef5=\n\xe9V\xbd\xc1q\x89\xbb\xc1\x85\x03>\xc1_T>W8\x95=\xcbn\xa9=\xa8^\xa9=\x91<\x94\xbb\x19\nK:%d->\xf6\x07\x1d\xbe\xe6\xb3\xa3=\x9b\xc0M\xbd;?3=2\x859\xbenmP>\x10\xd2\x9f=\xa0Mh<\xf7i7=\x1c)\x0c\xbc\x8b8\xb5<-a >`\xd8\x92\xbd=\x13\x94=\xe3\xb9\xad=\xb2\xf7\x8f=\xbe\xa5\xcb<\x9a\x0ei=\xf3C">\x8f(\xa7<\xf7_#=\xe5\x85c>\xd0\xa0\xf8\xbdJ\ro\xbc\x95\x85\xa5\xbdPC\xa7=\xc7k\xf4\xbboKU=\x112\x1c>\x10\x02\xde\xbb3\x9c\xea=\xe1\xdc\x7f<e%\xdb=\x18\xa0\xc5\xbd\x19\x15\x07>}<\x9e\xba\t\xb4@=\x85|R>\x9d\xc2\xbd:9\xd06=^!\x0e\xbeG\x84\xce\xbdw\x9e\xb2=\x87\xda\x17\xbd\xfe\xcb\x13\xbdc\xabR=\xf8\x86\xc8=\xc6\xb9\xcb\xbd{\xca\x81\xbc\x17\xa5\x9e=\xb5\xd3O<0\xa1\x96\xbcP\xfat<\x9b\xc9\xbd\xbd\x82\xc7,<\xb8\xce\xa7=)\x96|=2*\xca\xbc\x10\xfbH>\x16)!\xbdk\xe79\xbd\x88a\xcc=\x80\xe5\xdb<\x158s=j\x10\xe1=IMg\xbd}\x06\xa7<\x0e\n\x8e\xbd\x05\x17\xf4\xbdz\xf5\xf6=\xd1\xfa\r>\x1a\xaa#\xbdFu\xed="t\xa5\xbc\x05\xa7\x9c=\x10\xac\xd2<\xfbN\xba\xbdq\xc9\xb9=8"\xd3\xbd\x16+\x1f\xbe\xc3\x14\x9b\xbd\x05>\x98\xbd\x88}\xca\xbc\xdf\x85\xfd\xbd\x18\xd6\xe3=9\x93\xd1\xbd-d\x0b\xbd\x0e\xe1R\xbdY+\xdc\xbd\xf9\r7==\xd5\xfb=\x1a\xc2\xf6<%v{\xbc\xeb\xf74\xbe\xf8\xef\xdb\xbc\xa6I\x14\xbdp(\xcb<\xeaR\x07>\xc9`\x81=\xc7\xf4J\xbde\x11\x18=\x15N\x1f>Ip\xe3:\x1e\xdd\xd0\xba\x07L\xf4<h\xf4\xfb=\t)\x1b\xbe3Y\x88=\x80\xa1\x02\xb8\xf1\xdd\xdc;A7\xf7=\x95\x98\xb9=\xae\xdd\x08>E\xf3\x13>\xd7N\xb4=)\x8e\xa4=n{\xd1<'
-p195
-tp196
-bsV474156553126178816
-p197
-g2
-(g3
-(I0
-tp198
-g5
-tp199
-Rp200
-(I1
-(I200
-tp201
-g12
-I00
-S'H\x97\xc5><\xee\x18=\x9di\xb7\xbexi\x90\xbd\x87\x00y>\x9c\xcd\x1c<t/\xb8\xbc\xccbl\xbe\xef\x16U\xbd\xfa\x81\x81>B9>=L&\xd7\xbb]\x1c]>\xb4\xea\x85="\xc4\x04\xbeZD\xa3>!+\xdf\xbd\x1b\r\x80\xbdl\xb5%\xbe25\xe0\xbc9\xcff\xbe\xd9o6=\xa4\x84(>2]\xf6\xbd\xa4y\xd3<\xc9\x86\xeb\xbdU\xdb\x1b>\x11\xfe^\xbe\x99\x9c\x82\xbe8\x19`=}q\xe1<\xccw\x01\xbe\xe7\xc0\x08>\xe7l\x97\xbev\xe0G=Uid>s\x91?>"\xc3\x10>1\xdc\x8f>\x9d\xfa\x9b=\xfd\xa8$\xbd%\xe0V\xbd\x9eso>\x9cv\x9c\xbe .k\xbdGd,\xbc2\x05\xc2>\x00I\x15\xba;\x98==\x9c\x8b\xd8>\x9a{\x9f\xbb\x82\x8d\xe3>_\xb81\xbe_\xea\x90=~\xd0\xe7\xbeD\x93->\x16\xee\x83<\x15:\x8a\xbd\xc7\x03\t\xbf\xec\x0b\xcc\xbe\xa1\xdf\x8d>\xddh<>t\xad\xc3;\xf7\xfeA\xbe\x1b\xbe\xbb\xbdd\t+>\x19\xa4k\xbe@\xbf\x8b>\x99C$\xbez%\x0f\xbeE_\xe6\xbe\x14\x04\x84\xbey\xe0y\xbb\x1c\x00\xe8\xbd\xfc\xb6\xe4\xbd\xad\'\n>\xae\xdb\x07>\x9b\xee\xf8=\x16~\xe2=h+\x15>\x97l\x99\xbd\x1b\xb0\x8a\xbd\x93\x04\xaf>\xf4\xb6m\xbe|\xf27>\xc3\xe9\x00>M\xae\x9f>\xe1~\x8c\xbe\x12\x03\xf2>]`+=\x90\xa2V\xbe\xdfe\xc1=\xe3\xa7\x96\xbe\x10\xa7{<\xb9\xcf\xae>\x07\xe3G=\xfbD\x05>^=\x89>\x1a\xfe\xb7=4\x07\xd7\xbd\x96\x99A=\x90\xcd\x85>d\x90#>\xd5\xbe\xec=\x9f\xe0\xc8>\xdf\xa0\x10\xbe/\xd9\x9e=\xd2t\xf6=\xb5\x8d\xda<\xdc\x1a\xa7\xbcD\xf79\xbe\x073g>\xfa\x145>\xba\xfa\xd0=\x95\xaf\x06\xbb\xf2H\r\xbd\xc5\x16z\xbe;\xf9\x8c>-\xc2\x97=~l\xd7=\'q\xfd>\xbcV\xa1=*\xc1\x0c\xbd\x88\xe1\xd4<\x90\xa33\xbd\x80\x1f\x81>\x9b6\x8d\xbd\xb8\x85\xbb<t\xa9G=t\x00\x07=\xf1\xfd\x97=\xf5\xf4\xd0<\xb8\x94 =d\x9e\xf1;\xa0\xc3\x9c=\x04\xef\xa3=6\x88\xe0\xbcu\x9e\xe7\xbc`\t\x88\xbb".\x92=\xfej\x18\xbe|\x86p>|~?=\xf6\x9f\x8d\xbe\xdce\x9f>}\xd8\x02=Z\xf82>\xd5\xect>\x9eN\x1d\xbej\xd1\x0c\xbdu\xf3k\xbd\xb0{9\xbe\xec\xe6\x86>\xaa\xbdR>\xc5>e<Ff\x91>\xf2R\xa6\xbd`7\xc9=\xe4\x9b5=RQ\x93\xbeRv\xdc<\xa7\xb5/\xbe\xbc\x90\xa1\xbe\xeb\xdd\x07\xbe\x0e1\xff<\xd5|\xc3\xbd\\\xb9\xbd\xbe!\x89\x83>\x193i\xbc\x99\r\xd7\xbd\x07\xe4\xf7<ZP\x14\xbeYc0\xbd0\x91\xff>\xaa\xaa\xa0=<\xd8\x87;\xdd\x93\xb5\xbe\x8e\xdf\xc5\xbe\t\xcb\xd4\xbb\x0cE\x1b>tk\x91>`\xb3\xff\xbb\x00\x9a?\xbe\xc4\xc3\xd3\xbdwHg>\x9ekN\xbb\x81\xc4\x1a>\x00Yj=<{o>\xaa\xe5\x1e\xbe\xf5\xfd;>@\x19\xe2<\xcd\x1b\x1d>y\xf6\x1e>\xd9^\xf4>b^\x99>\xa5\xfc\xdf<\xfa8Q=8\xb0S=Jl\x85>'
-p202
-tp203
-bsV445258528987807744
-p204
-g2
-(g3
-(I0
-tp205
-g5
-tp206
-Rp207
-(I1
-(I200
-tp208
-g12
-I00
-S'\xdd\xd6\xfa>\xb0I\x0b>\xfb|\xe3\xbeg\xfb\x84\xbc\xc2\x7f]>W\x89\xb5\xbc\xc4h\xf3\xbc@\xbfP\xbe\xb3s,=\x93?N>\x18\x96C\xbd\xea3\xbd\xbb\xeeB\xbd=\xaa\x08&\xbd\xd7\xf3\x89=\xa5\xec\xc4>\xa1@i\xbd\x86\xc3\x0b\xbe^mf\xbe\xa5\x85\x9a\xbd\xc9\xd4"\xbe\x87\xa4D==\xad\x80>\xbe\xce0=7\x88\x8f=\x0f\xc2\xf9\xbd\xb5\xf2\xd9=\xe8|B\xbd&\x1d>\xbe\x9b\x96\x10\xbes\xff/=\xc0=#=\x1e\xd2\xa5\xbc"\xd7\xab\xbe\x91\xd8\xd7=\xb5K\x16>\x04sv>\xf1\x1d\x89>\xdcv}>\xff\xc5!\xbeN:b\xbe\x00J@\xbd\xeb&\xd6=)*\x1b\xbe-\xab\x12\xbe\x08#\xd2\xbd\x96g\xae>\xc1\xd7\xda\xbc\x91m\xc5=-\xc4\xef>6\x9b\x03\xbc\x1d\xa7\xe3>\x11\xd5[\xbe/$\x1c>1B\xbd\xbe>\xc1\xd7=\x05,\xf6=c\x8f\xb3\xbd1:\xee\xbe\xd1*\xc7\xbe\xdeDF>\xdfv\xdb>\xfaf,>\x83\xdf\xff\xbdu9\x8b=\xb9\x82\x8a;\xa3\x89\x80\xbe \xa0\xed>\x80\x92x=\xc1s+\xbe(N\xde\xbe\x0cq\xb4\xbe\xaf\x90w\xbe\xf9\xcb \xbc.\xd4\xd6\xbd\xb51O=\xabL\xe9<\x13\xab\x8f=\x97\xa7M>\x96\xdf9>\xa5+\xc8;\xb3s\xa3\xbc\xdd\xe4p>\xd5\xd3\x82\xbe>\xd4\x8c=1\xd7\xf2=\x13\x7f\x98>\xffJ`\xbe\x1e\xab\xdf>\x8c\xc6\xbc\xbdA~\x9b\xbeAQ(>\xb58\x94\xbe\xa9\x19&\xbedl\x81>\xaa\'\xd3=\xba\xb1i>\xa9\x9fh>\x16e\xad=\x1a\xd0b\xbe4\xbf\xd6<\xcfO\x18>\xbe2\x17>\xa0QG>\x10K\xbe>p7.\xbe\xad\x8e\x07=\xc05\xab>4F\xf5\xbc\x84q\x83<|\x19\xd4\xbe\xe2T\xe1<\x1aM\xae>\xf65\x8e=:\xca\xc5<\xdd\xf5\xbe\xbd\x8c~\xb3\xbei\xb1\x0c>\r\x8f^\xbc^h\x9e<T\xce\xed>\xc0\xd6\x14>:\xfa\x8c\xbd\xe6>\x1b>\xfc\x93\xf5=\xf0\x99t>\xa5\xbb\x05\xbe%\x03\t>\x92/\xbd;\x93\xd3\xbd<\xae\xcf)>K\xd2\x02>Z\xb50\xbcF\x96T=\xf1\x1f\x10=\x14\xcbT=\x1c{\x86= \xb7\x93=\xfc\x99\x86\xbe-`\xa9\xbd\xb9\xd6P\xbe~\xc0A>\xc3\xb6\'>\xf9\xef\xc2\xbe\x8dt\xb6>\xdce\x9f=#\xb2V=\xaa\x04\xfa>\x11\x88\xc1\xbd\xa5\x9as<Cm\xdb=`\xccp\xbdm\x9d<>\x82y\xa2=h\x95\x92<9Z\xa7>Y\x0eK\xbexT\x18<\x8b:\r>\xa5\x9f\xb5\xbeu\xd5\xd2\xbdm3K\xbe\x91\xb7\xb2\xbeV\x85M\xbe\x89\xe5\x0c>\xe84\xa2\xbd\x91J\xa6\xbedJ\xa0>c\xad\x03>\x80B\x00\xbe\xafcO=yo\x03\xbe\xec\xccc\xbe\x13\x8f\xe4>u-\x8e<\xbck)>\xfa\xf2U\xbezL\x03\xbf\x1e\xd9A>\xf7\xe6,>k\x99\x83>\xf0L>\xbd\xa6=M\xbe\xe9\xe6\xa5\xbd\x9a\x00\xad>\x06\x84\x0f\xbd\xb5j\x87>\x87\xdfZ=\xb1\x16?>]4*<\x11\r6>\x1e\xd9\xbf<\xd4\xaa\x08>\x84\x93\x06>\x0c\xed\x00?u\xf7\x91>p\x8d\xd5\xbdw\xf6(\xbda\x1c==\xbe\xf4Z;'
-p209
-tp210
-bsV474170820428713984
-p211
-g2
-(g3
-(I0
-tp212
-g5
-tp213
-Rp214
-(I1
-(I200
-tp215
-g12
-I00
-S'\x85\xd9\x86=\x9e\xef$<v2\x8b\xbd\x96\x0e!;L\x9d4=U\xa5>\xbb\xb2\xdc3\xbc|\xedi\xbd\xc0\x06\x98\xbc&\x94U=\x15C\x94;oh.\xbc\xac\xf7\xfa<\xb2\x0fw<e\x01\xb3\xbc\xb5\x9f\x83=\xa7\xa0\xc6\xbc%\x98\xc9\xbcp\x99\xfd\xbc\xccR\x1f\xbc*8\x16\xbd\xd7U\xca\xbbzH\xec<\x0f\xa6\xa8\xbc\xd8\x11>:T4U\xbc}\xbb\x14=\xb7y\x19\xbd\x03\xfb]\xbd9\x0f\x82;\\\x84\xb7\xbc`\x99\xe6\xbc\x84^\xf8<h\x8e\x86\xbdP\x127<\xe4\x01w=Fw"=P\x92\xe3<\n\x1f\\=@:\xa1<.>b\xbcP\xd8\x9e\xbcI\x99#=\r\xb0P\xbdL\x1d\xf4\xbc\xa4\xe9,\xbb\xa1,\x86=\x8a\xac\x8f<l"T<\x92\x83\xa5=F\xc3s\xbb+L\x9d=\xba`\xd5\xbc.\xf7i;\x95\x04\xbf\xbdT\xe0\xd0<\xbf,\xd2\xbb\x0b0\x8b\xbc\xe0\x8b\xda\xbd\xf7\xdb\xb0\xbdn3\x1a=\xaf\xcc!=\x01\xab\x8f<\x15\xee:\xbd\xe8\x86<\xbc\x8a\xc3\x1e=\xa4\x15/\xbd\xbb\xfaB=\x9a\xb4\xb0\xbc[\xa7\x1c\xbdu\xa9\xc3\xbd;\xd8\x80\xbd\xed\xe4.\xbc\xc3Y\xc6\xbce\x8f\x7f\xbc\xbd\xdb\x0b=>a\x19=\x1c\xea\xd8<\x11\x1f\x16=\x16{\x13=\x9d\x05\xa1\xbb\xe0m\xf5\xbaK\xaa\x94=\xd6\x18n\xbd\x06\x0f\x08=0\xf8\xfc;\xbb\x8aM=\x05p\x87\xbd#\xfb\xca={\x8f\\;\x00?\x12\xbd\xc9j\xc9<\x8b\x8d1\xbd\x96\xa5\xc2\xbb\xdd+\x88=&\x19\x06;\x84\xd3\x1f=\xc0\xd8K=\xda#\xb7<Hi\xa0\xbcjT\x08<X\xe7k=<\x02\xca<\xc0!\xe6<\xe4\xd2\xba=X-3\xbd6\xdb\xa0;k\x18\xb8<\xd2\x9e@<\xb7\xc2\xb5\xba\x8d\xf9\x1d\xbd)\x97,=\xf7\x8b\x11=\\\xe1\x08=\xee\xf1\xf7;\xbc\xdc\x10<\xf7\xd4f\xbd76`=\xf4W\xbe;\'\xf9n<a\x93\xc9=\x84\xe9\xa9<\xb7\x9b\x06\xbb.MG\xbcU7\x96\xbcg\xa7:=\x90\x88\xa0\xbcM\xf4\x1f<\x9ch\x97<\x81\xfd\xb8<\x1c\x9d\x80:{\x94)<\x90Ct<\x83\x83\xcd;\x8cwH;V?(<\x92K\x81\xbc\x1ex\x90;\x9f\xc4?\xbc\x9a>/<K\xb1\xf2\xbc\xf1P\x80=HpF<K0[\xbdB\x93\x87=\xa0\x93\x19<\xe7\x07\xcb<kN\x94=\x04\xc8\xc1\xbc^\xbe\x0f:\x94`\xf0\xbb\x17\xd1\x14\xbd8\xa3c=\xe0\xb4\'=nO\xc0\xbb\xa8\x99|=\xb6\x0c\xc7\xbc\xd7\x0b\xbf<(\'r<\r\x84o\xbdHu\x11;\xc3\xa2E\xbdt\xea\x9f\xbd\xb7\xd5\x17\xbd\x0cMb:\xef9\x13\xbc8\xf1\x92\xbd0\xc5l=:\x97\x88\xbb\xc2\xc9\xa4\xbc\xa7\xf0|\xbb\xf1y1\xbd\xdavv\xbcLo\xb2=*JU<\xde\xc9!<\xef\xd8\x90\xbd\xf7\x9d\x93\xbd\xec\xa8\xf1;\x9a\xf9\xdb<\x00\tn="\xbf\xf7;\xd1\x15\x1c\xbd:k#\xbc\x10\xaa\x82=J\x1c\x18;Nr\xe9<j\xdfB<6\n^=@6\x19\xbd\xd0\xa9"=\xbc\r\xc0;\xb7R\xcf<\xf4--=\xc7a\xb9=\x122\x86=\xa5\x17_<c\x90\x8a<V]\xaa<&$\xd2<'
-p216
-tp217
-bsV445260260102922240
-p218
-g2
-(g3
-(I0
-tp219
-g5
-tp220
-Rp221
-(I1
-(I200
-tp222
-g12
-I00
-S'\x1e\xb7\xad>\xd1\xc1/>U/\x9c\xbe"\xa3\xb7\xbd\xbbv\x94=\x041G<\x1e\xbf`\xbc\xd3\x9e1\xbe7g\xc2\xbd\xad\x94W>\xba/\x83\xbd\x03\x16c\xbe\x13\x05\xb2=\xe7K\xc9\xbd"\x1d\x1a\xbc\xdb\x88e>\xb1\xa7\xa7\xbd\xd8AM\xbe\xd9 \x0e\xbe\xbb\xc7\xba\xbc&\xc9\x1d\xbe\xf2\x05\x8a<\x87\xfa\t>\x16d\xdb=\xb9\x8e\xa6=\xbe\xe3z\xbd\x8c/\xef=Q\xb8\x05=\x0e\x82l\xbe\x91x5\xbe1\xef\xfc\xbd\xad\xa0d\xbb0\x08\x1c\xbb\x9c\x12\x87\xbe\x10z\xff<\x97\x123>7\xc0&>T \x00>\xf9\xb3F>0R\x8f<~W\xd1\xbd\xd2\x14$\xbd=\xba\x15\xbb\xf4\xfa\x07\xbeeZ)\xbe\xb5q^\xbd\x9d\x03_>\xfb\x13\x8a=\xd1\xbc\x91=?\x90\xbe>-5k\xbdV\x1aw>p\t\x19\xbe\x06\x19{<Qc\x84\xbe0\x84H<O,\xb7=7\xb7s=\xe7\xc0\xce\xbe\xad5\x8d\xbe\xe1f5>n\xe4\xbe>\xfb^G>\x879\xe8\xbd\xeaX\x05\xbd\x92\xa3\xde=\xb4n\x07\xbem\x99\x91>e?$=\t\xd9L\xbe\xf1\xa8\xa1\xbe\x15*\x9f\xbe\xa4\xc0@\xbe\x1aj/\xbdE[\x16\xbe$\xb6#\xbd\x8dC\xc0<\xd6\xe5\xf0=\x06\x8eR>\x15:\x08>\x0e\xf5\x1a=\x12\xd8\x03\xbd\rs\x9f>\xe3|F\xbeX\xeb\x8b=n\x01\x9e=9q\xd1=}\xab8\xbe\xe8\xdb\x85>\xbe\xc9\x10\xbe\xeb\xc5:\xbe\xba\xce\xce=Q\xa7!\xbe\xdd\x15%\xbek\x9f\xa9=h\x18j=\xf8\x9c@>\xeb\xa8!>\xba\xab\xf0;H\x07\xbb\xbd\xec\xe4\x07\xbdn[\x18>\xf1\xf8\xf9=\xff\r\xe7=\xd2\xa5\x81>\xd3\x90T\xbet`"<\xf7Q\x94>u/\xa2<\xd4\x850;\x94Y\xa6\xbe\x99\xca\xe1<\x1eef>\x89\xa2\x05>\x12)\x9f=\xe2\x14\xad\xbd\xb0\xfb\x83\xbe\\+\x13>\x9f\xb9\x86\xbdc\xb6\x16=+"\xa1>\x17\xe3\xd7=\xc0U\xb9\xbd\xd4?\x84=\xf8/n\xbd\xc2\xdd\x04>y\xe4\t\xbe\x99\t\xbf=\xa3\x93\xaa<\x83Pp=\xf3\xa5\xd3<\x80\x9a\xcf=\xe6\x86\xe5<D[\x0c=\xc9\xb4\xb8\xbd\xc1\x1a\xa6\xbc\x9f\x0f\xaf\xbd\x7f\xc86\xbdP\x86T\xbeI=\xc9<2\xa3\x15\xbeW\xbb\xe5=\xacy\xfe=I\xda\x86\xbe\xeb!\xa3>=\xc74>(<\x8a=Gu\xf4>VSk\xbd\xb2\x06\x1e\xbdC|!<\xe1%\xdf\xbd\x14\x94\x89>\xe9\xd11>i\xe9\x85\xbdf\xf7\x85>\xe37\xf0\xbd\x88\xc1Q=\xe8\x12\xad=o\\\x8b\xbe\x8ad\t\xbe\xf9?4\xbe\xf8\xf7\x8a\xbe\xc4&\x94\xbe\xb81\xc4=\x01a\xc0\xbd\x06\x92\x9c\xbe\xc2q\x0f>\x1aM\x1b>\x1a\xd0\x85<uf\x0f\xbd\x10c6\xbe\xc7\xf4(\xbe\xc6\x9d\x8f>NO\xba<:/\xff=\x8dvt\xbe\xc7*\xd5\xbe\xe5\xfd\x87<\xc9\x06\xee=\x1bTS>\xfar{\xbd\xc9\x82:\xbe\x88\xca6\xbe\x0b\x19\xa4>\xe8F\x8c\xbd\xa2~\xd2=^*\x1b<\x13\x9cY>k\xbb\xec\xbc\x15i\xce=\xc3\xa40\xbd\xdff\x15>:\x01(>\xd3\x9f\xb3>!\xa5\x89>\x04\xc2q\xbd,bH=\x8do\x0b>\x04[\xb4\xbc'
-p223
-tp224
-bsV445265005886590977
-p225
-g2
-(g3
-(I0
-tp226
-g5
-tp227
-Rp228
-(I1
-(I200
-tp229
-g12
-I00
-S'\xfc\x16U?\xeaZ\xa3>/\xb8\x11\xbf,\x90\x8c\xbe4\x17,>\x81\x84\xd5=\x1f\xb6\x1e\xbd\xach\x81\xbe\xc7\x08\x95=-\xfd\xed>$t\xda\xbd\xd1^z\xbe\xb4\n >~\n\x1f\xbeS\xdf\xa0\xbc\x13\xaa\xe8>\xd1\xe9\x0f\xbe|\xa1s\xbe\xbf\x08\x97\xbet\xf3\x16\xbeu\x98\x8a\xbe\xb45$>\xb9\xc4\xb5>O#\x9d>>D\x06>\x1fZD\xbe9b$>\x01k\x19\xbd\xc0\x12\xb2\xbe\x8dN\xc0\xbe\x8f9\x8e=\xf4\xc8\xe5\xbc\x14a\x87\xbd\xfa\r\xeb\xbeF\xe0\xb5=\xb1Q\x90>\xa1\xb9\xba>\xc1Gq>3\xfc\xb7>\xbe\x01\x92\xbb!(f\xbe \x8b\xdb\xbd\x17\xe4\x8d\xba\r\xa5\x7f\xbe7\x13\x0e\xbe7\xd5\xf0\xbd\xcd~\x13?\x8a\xeb+\xbd\xdf\xc2\x9c=\x84\xd8M?\r\xd9\xba\xbd\xa7B\x07?\xa4\xd1\xd0\xbe&Z\xeb=\x8fB\xe4\xbe\xbd\x9a\x04>\xec\xee\x9c>|V\xd9=-C7\xbfN/\x05\xbf\x14\x11\xd3>F\x0fM?}\xb1\x82>p\x89\xfb\xbd\xff\x85\x92\xbdA\x90\x98=}\x93\xb2\xbeY\xe75?\xfd\xbe\x07=\xa4\x9c\x8a\xbe\xc15\xfd\xbe:\xb1\xec\xbe\x1b\xf5\x9e\xbe\x19l\x06\xbe\xe4\xab\xa6\xbe1\xa98\xbe78\x1b\xbe\xd2\x1f8>\x87\x83b>1\xfb\x04>i\xd2\x86<\x19r\xb8\xbd8"\x0e?r)\x8f\xbe\x89\xd39>\xc9\xdbc>\xa9\xeb\x88>\xcaIq\xbe\xa1&\x07?D\xc7\'\xbe\x16\x1d\xea\xbe\xf4\xef7>\x01\xa5\xe8\xbe\xf9\xd5\x17\xbeh|\x95>\xbc\xa5\x0e>\'\x1a\x88>Q\xa7\x97>\'\xb8y<\x9f!\x83\xbe\xcf\x83^\xbe\x01\x00M>\xd6\xb3\x8a>\xfa)\n>\xd5\xe7\xaa>\xe7\x1f\x8f\xbe\xc34\x1d>\xa5\xa1\x1d?X\xe18\xbd\xd9\xdc\x84\xbd\x87BC\xbf\xe4\x8b\x85\xbd\xd6X\xec>\xa9\xca\xc2=\x13q5>\x84\xbfm\xbe\x94\x13\xd9\xbe\x8aGm>4D6\xbc\x1c\x95\xf1<OJ\x00?\x03,\x86>\xd8\x7f9\xbe\xf4\x18\x80>\xa9L\xcc\xbc\xc9\xb9\xa0><x%\xbed\xc01>!\xef\x01\xbc\xaf\xa1\xc1\xbd\x19Fx>$B3>\xe1?\x8b\xbd\xb38\xc5\xbc}\x8e\xd6\xbdFY\xf3<\x110\x0b\xbdg\x00\xcb\xbd\x04X\xde\xbe:p^;Ct\x90\xbe&\xd9\xc7\xbb\xefZ\x80>\xe9H\n\xbf\x0f=\x12?!\xd3m>\xb2\xff\'>\xc9z9?\x95t\x1a\xbe\xa7V\xd9\xbd\x11\x81u<`\xe1\n\xbe\x0fi\xd7>\x91w4>o\xbf;\xbd\xa7H\xd4>\xd7\x03\\\xbeI\x99\xdb<\xa9\x12\xdb=\x03\xf6\xe5\xbe=\xd0\xc6\xbe\t\n/\xbeq\x0e\xcc\xbe\x8a}\xc8\xbe\x95\x03\x85>\x1f\xff\x0e\xbeG\xfe\x13\xbf\x9cQ\x99>\x16\x1d\xa5>\x17\x84\xa59\x14\xe6\xa3=\xf0\xa2"\xbe\x14\xea\xaf\xbe\xc0\xd83?\xf6\x11\x03>+\x88\x85>$\xb9\xc4\xbeYhU\xbf\xbf\xc3\x88=\xe0\xf4\x90>\x8a\r\xc6>Y\xdd,\xbe\xead\xb6\xbeY\xf2\xf2\xbe@\xd3\xca>$\x00\xd3\xbd\xe0\xdcz>\x9f\xed\xaa<\xff\xa7\x84>\x1f\x1c\x06>\xfbG8>}\xdeZ\xbd\'\x90\xb0>L\x93\t>\x97\xd5B?\xfd\x9f\xf1>i_\x86\xbe!Nk\xbcC\x8b&>\x89g#>'
-p230
-tp231
-bsV445126509305405440
-p232
-g2
-(g3
-(I0
-tp233
-g5
-tp234
-Rp235
-(I1
-(I200
-tp236
-g12
-I00
-S'l\xdf[>\xfai\xa9;u\x80\x83\xbe\x94)\xf7<\xfe\xb1\x1e>\xf6\xff\x98\xbdNZ\xbf\xbc\xc1h\x1a\xbea:`\xbd\xaf\xd1v=\x96\xe7&=\x98\xaf(=\xe5\xda\xcf=\x18\x03\x84=\xf5_\x88\xbd&4K>\x9c\xd0\xb3\xbc\xd1\xef\xf8\xbcZ\xa8\x93\xbd\\I\x12=\x100\x10\xbe@l\xe3\xbbr\xf9\xc9=:YK\xbe\xc2\xe1,\xbd,\xfd \xbd\xcc\x84\xcc=\x00d\x0e\xbe\xb7\x19\xff\xbd\xf7\x08\x01>&RW<&\xcc\xb9\xbdQ\x9f\xc9=\xb4n\x08\xbe\xa0\xdc\xce<\xa6\xbc2>\x9a\x04\xad=6\xcb\xdf=\x9a\x93O>[\x01E=\x8e2\x01\xbd\xb9\xe7\xb7\xbc\xb3\xf0\x16>\xe1\x81=\xbemX\xb5\xbdz/w\xbc\xe3_X>\x04\n\xf4\xbb\x94\x9a\xc8<\x93\x9f\\>\x18y\x08=\x90mt>(E\xb1\xbd\xb0\x8b\x00:P\xb3u\xbe\x02\x17\xf5=\xad?\\<\x04\x99i\xbd{\xe2\x83\xbe\xb4\xbao\xbe\xe3`\xe4=g\x078={\xe5\x1d\xbdD(\x0c\xbeI"\xb8\xbcx\r\x08>\xdd\x89\xb8\xbd\xa8\xe5\xd1=~\xcf\'\xbe`P\x8d\xbd\xdc\xa8\xae\xbe\xde\xf8+\xben\x90\x0c\xbd\xf8+\x92\xbd\xe8\xae\x81\xbd[{\x15>\xd6\xfe\x0c>\xe0\x88\x8d=\x19\x85\xa6=~\xcd\xda=<\xa0-\xbd6\xbdP\xbb\x82\x8b\xe7=\x8au\x19\xbeL\xee\xbc=\xfa\xd2\x94=\xc4\xe08>\x16\x1fH\xbe<\xa2\x9c>\xfez\xf7<\x08\x92\xc9\xbd\x11\xc3\xf0=\x98\xd9A\xbe\x1e\x81%=\xa2\xafJ>t\x87k=\x90\xee\xd4=x\x15\x11>hBp="\xf4k\xbdh||=\xac~@>\x1a\x1b\\=\xdb\x91\xb5=\x8dO\x86>\xab\xea\x01\xbeo5\xba;0i =\x8c?\xb5<\xc1k\x91<*EI\xbd\x82E1>\xdd.\x01>\x0b\x0f\xe9=\xf6\xe8%;&"\xce\xbb\xebE8\xbe*\x1d>>4-\x17=\x04\x83\x8b=\xb2\x95\x98>\xa8ew=\x16\t\x02\xbd\x80\xe3\x8f:\xe8\x86l\xbc\x88\xe9\x17>~\xb6\xda\xbd\xeax\x94<\xf8A6;mZ7=x\xba\x0c=\xca\x86\xc1=\xd1\xd2\x82=$\xe4I\xbb\xb7\x119=\xb1{0=\xee\x13\x0b\xbdP\xe2\x07:\xeai\xaa<\x16\x98==\xe1`\xb2\xbd\x94FL>h>\xef\xbbr`C\xbe\x10\xee">l\x99\x94\xbd\xdfz\xcc=\x05\xc1)>-\xe9\xa0\xbdI\xf1l\xbbN\x97I=\xb8Uh\xbd\xf8\xcb\x1c>\x98\x18\x03>n\xb8!=\xde\x1dA>\xe8X\xfe\xbc\x00\x9e\xad=82Y=_\xd3\x03\xbe\xd0\xa1\x8a=S\xad\x12\xbeB\xe0I\xbe\x8eL\xa0\xbd\xf3\xf3S\xbc\x9e&b\xbd\xf5_i\xbe.\xbb+>`\xed\xc4\xb9\xdaCO\xbdN}}<"\xea\x04\xbe\xd2\x14\xc8\xbc0\xd3\x8a>\x84T\xef<\xa9>\xcf;\xd3d6\xbe\xc6<c\xbe\x99\xbd\x8f<\xa0\xfc\xdd=\x0c\x94&>#\xba\x8e\xbc\x82\x83\x98\xbd8S\x91\xbc\xcdy$>\x00\x9b\x85\xbb\x80\x94\x12>\xc8\xc0\xa0<\xc9\x03#>\xd5!\x05\xbe\x16o\xfa=\xa8\x1e*=\xbe\xf6\xbc=\x80\x9f\x0f>\x92\xcbj>\xc9\x19I>\xfc+\x02=<+M=\xc0zL:u(\xcd='
-p237
-tp238
-bsV474078354937622528
-p239
-g2
-(g3
-(I0
-tp240
-g5
-tp241
-Rp242
-(I1
-(I200
-tp243
-g12
-I00
-S"l\x0b\x8a=\xbb'\x1a<\xf9h\x92\xbd\xa6\xb9\x0f;\x9f\x9d7=\xfe3\x88\xbb\x1e@;\xbc\xd9;x\xbd\x92\xa2\xaa\xbcr\xf3S=\xa0y\xdc;\x84\xd6V\xbcc%\x00=\xd8\xf1\x90<\xb0\xd1\xd6\xbc\xd7\xf9\x87=S#\xc2\xbc\xd4\xda\xbb\xbc\x9f=\xfd\xbc\xc6\x97\x18\xbc;' \xbd>8\xa8\xbbX(\xde<N\x95\xba\xbc\x19W\xf5:\xb0@E\xbc\x08\xf7\x1b=\xa5T!\xbd[\xe7b\xbd<5\xe3;\x97n\xce\xbc\x1e\xac\xf9\xbc\x86q\x07=1]\x8a\xbd\xf9\xbc6<\x1d\x8b\x81=fe\x1b=\x98\x1b\xf1<\xaePf=5s\xb3<)\x07m\xbc\xb7l\x97\xbc\xa9\x18-=/\xbfa\xbd\xaaL\x04\xbd\xbe\xe6-\xbb\xb2\x7f\x8a=M\x03\x8b<gRo<\xd3\xac\xae=\xf2\xe73\xbb\x0f\xa3\xa5=\xf6w\xc7\xbc\xa0tS;\xca\xc4\xca\xbd{\x05\xd8<\xe7\xd0\x13\xbc\xbb1\x98\xbc\xbf/\xe2\xbd\xa0\xa4\xb5\xbd\x12\x9c#=\xea\xb3\x1e=^\x1f\x88<\xf4<O\xbd\x9f\xa0B\xbc\x1d\xff'=\xa5^8\xbd\x82&7=\x12M\xdd\xbc\xf8\x8e\x1a\xbd\x9fp\xd3\xbd\xd6\xf1\x86\xbd\x86u \xbc\xfc+\xc8\xbcW\xe3\x86\xbc\xebt\x0e=\xfd\xa6-=\x11\xe3\xe4<\x06\xaf\x18=(\x82\x1e=\xd7\xac\xcb\xbb^\xba#\xba\xc6\xce\x98=\x18\xccv\xbdV\xc8\x0e=\xe7\xc0\x1e<\xa4EV=`\r\x92\xbd\xa9\xe8\xd3=t\xb0\xa7;\xf3H\x19\xbdqR\xdb<\xc8D7\xbd\x82n\x8d\xbb\x06T\x91=\xd5\xc8\xfa:h\xc6,=b\xeaQ=\xa6v\xc6<{&\x9a\xbcf\xd0;<L\xee|=\xa6A\xc3<\xafT\xf2<\xe1\x12\xc6=\xffr;\xbd\x1c8\xc2;\xc9Z\xb2<\xe6\xd1i<\xfc\xf0\x919\x18\xc8\x11\xbd~\x07:=B\x17\x1b=>'\x15=\xaf\xa2\x03<\xf0\xfc\x0e<\xf0\x8d|\xbd.\xfcj=\xe9\\\xe0;2\xf5r<\x87\xbb\xd4=\xf6X\xb4<\x98|`\xbaN\xbe^\xbcyM\x9c\xbc\xba\xbaI=\xfdl\xa0\xbch\xb0\x15<\x0b\xa4\x9b<\xde\xe0\xbd<:\xd4\xa69=/:<\xe4\xdb\x99<4\x0c\xd1;\x18\x97);(t)<\x90\xfc\x7f\xbc\xbb5~;\xb0}\x0e\xbc\xee\x15B<V\x9e\x02\xbdh\x95\x85=\x9fp><\x07\x0ei\xbdV\xbd\x8b=q\x97\x10<y\r\xd9<\x1b\x17\x98=\xa1^\xda\xbc\xa0\x04.8\xb4\x93\x0b\xbc(K\x1d\xbdY/k=\\\xa25=\x8b\x9a\x9f\xbb\xd2\xf2\x82=\xd9\xe0\xc9\xbcy\xc3\xd1<\x1dS\x82<\x00\xf7u\xbd\xff\x93\xb7;\xa9\xe4R\xbd\x80\x0f\xa4\xbd\x0c\x98\x1a\xbd@\xb6&\xb96\x84<\xbc\x91\x98\x9b\xbd\xff\xcb\x7f=hZ\xaa\xbbO\xb5\xa9\xbcg+\x97\xbb\xb4\xeb<\xbd\xebzq\xbc\xb4\x1b\xb7=\xe4\xfdY<\xde\xe7+<5\x7f\x93\xbdM\x89\x93\xbd\xdd\xc9\x03<\x82f\xe1<\xbf\x19}=D<\xc3;w\x81!\xbd\x02\x9b2\xbc\xde\x9a\x8b={5!;\x1a\xe8\xf3<\xfcej<l\xb0j=6p*\xbd\xe9M&=\x02\xe3\xa8;\x8a\xb1\xcf<A\x157=\xc0y\xbd=y\xcb\x8c=\xee\xc6\x8e<Y\x98\x8d<\xfdp\xbb<\xd7E\xdc<"
-p244
-tp245
-bsV474174910462713856
-p246
-g2
-(g3
-(I0
-tp247
-g5
-tp248
-Rp249
-(I1
-(I200
-tp250
-g12
-I00
-S'\xc8\x94f>\xd3\r>=\xd41w\xbe\xd0\xbc\xde;>=\xf2=\x06d\x9c\xbc\x7f\xab&\xbd\xca\xaf\'\xbe\xb5\xf0\xfe\xbc?Q\x1b>\x17F\xe1\xbb\xdd\xb5\x8a\xbc\x1d\xf7\x97=i\xd7x<\xd8D\xef\xbcs\x9eL>Z\xdc\x8e\xbd3\x92\x9f\xbd\xc2\xbe\xc6\xbd\x17\x81\xf2\xbc\x89H\xf3\xbd\xcc\xaa>\xbc\xaeQ\xda="\xfe}\xbdc8\x96;\xfc{\x19\xbd\xa8#\xec=\xcd+\xbd\xbd\x16\xbc\x19\xbe\xcf}\x04<&\xeb\xe9\xbc)\x8b\x85\xbd\x97\n\x8b=?RS\xbe\x1eqH=\x85\xc47>\x8ag\x04>n4\xdb=v\xf5D>\xa3;\xc0<\xa5l\x9f\xbd7\xddV\xbd\xd0\xcf\xee=\x1b\xed\t\xbe\xd6I\xe3\xbd\xcb|w\xbc\x83\x8ac>^\xb2\x1d=r\x9d6=M|\x86>\xfdF\x88\xbbz\xb1y>\xba(\xbc\xbd\x8bR[<X\xfd\x93\xbeN0\xb6=\xf1\x17\x99;\xabj\x1c\xbd\xa6\xf6\xab\xbe\xf59\x88\xbe\xd8g\x07>\xed\x0b)>\x00M\x97=\x86\xcd\x12\xbe\x1a\x9f\xa9\xbc\x08x\xc8=\xf2n\x11\xbe\xad)=>4\x0bI\xbd!\xdc\xbe\xbd\x17I\xa1\xbejef\xbe\xaf\x17\x96\xbdt\xd0\x87\xbd\x16\xe3t\xbd\xc0\xe4\xc4=\xf4:\xbf=\xe5\xb0\x97=O\x12\x02>\x07s\xd8=\x0f\x11\xe9\xbb\x0bu\xfc\xbbZ\xf2P>\x14\xf27\xbe\x1fH\xc6=SB\x1d=\xce\xd32>\xd6J@\xbej\xe2\x97>\x0e\x1eu\xba\xbf\xe8\xfc\xbd\xefw\xc9=\xd6\xf4\x18\xbeDt\xda\xbc%{M>\xd9&\';sQ\n>3M\x19>\xc3[\x96=\xccj\xa5\xbd\xde\xe3\xc7<\x92q&>q\xc2\x96=V\xf5\xc9=\xd8\xbc\x92>\x1b\xff\x12\xbeN\xc2+<\xc9\x93\xd9=d\x17\xa2<#6\x9e\xbc>\xe2\x1e\xbe\xa8\x8b\xcd=\x1e\xe6 >QN\x01>\xda\xad2=E\xfeO\xbc\xb8LA\xbe\x8f\x03\x15>\xd1\xa8X<,n\x1e=\xf4]\x9f>\x8d\xf5\xb3=\x9d\xb3\xbf\xbc\xb3b\xdd\xbb~,\x92\xbc\xb3`\x19>\xe21\x87\xbd\xd1\\ =9\x8a4=\x143\x87=\xcc\xa8:=\x06\xb6V=\x84\x87\xef<Sm\x8b<\xc5\xdf\xec\xba\x1b\x8b\xc9<U\xd7\xa4\xbc\t\x9aj<\xed[\xa2\xbd\x0fu\x1b<Eh\xdf\xbd#\xd4?>,\xbes=\x80fU\xbe\x8f$O>}t\xdc<y\xd1\xa4=Z\x8d}>\x9b\xed\x9d\xbd4\xa9?\xbc&&?;\xcc\xd4\xc5\xbd\xbcA\x1e>\x08\x95\x00>\xd0j\xc8\xbc\xfe\x9aT>\xd4\x03\xb4\xbdH\xd0[=)8f=\x9a\x9bE\xbe\xbe\xf2\x1d\xbc\x03\xba*\xbei\x95z\xbe\xb1\'\xda\xbd\\\xdb,<`&\x16\xbd\xf7\xafj\xbewdL>\xd5\x80\xb0<~\r\x83\xbd\x07\xa1\xba\xbb\xd0(\x05\xbe\x85C\xb0\xbd\xe3\xf8\x8d>\xa4\x81\xf7<\xb5\x12b=:2M\xbed\xa8\x84\xbe\xbd\x82A=Sg\xa6=\xaa\x00)>\xd2\xec\xd0;\xf6o\x01\xbe\x0b\xe8f\xbd\x96\xa3P>\xa3S\'\xbb4\xf5\xe8=l\xd7\x10=\x82\x158>\xeej\xef\xbd\x12\xa1\xe8=\xc6W\xd0<\x85\x7f\xcf=7U\x04>\xae\xc2\x92>\x07Te>\xcb\xb3\x93<\xca|\x16=\x1e\xe7==;\xc5d='
-p251
-tp252
-bsV445262125070422016
-p253
-g2
-(g3
-(I0
-tp254
-g5
-tp255
-Rp256
-(I1
-(I200
-tp257
-g12
-I00
-S"\xbb\x94\x8e>\x8b3\xf7\xbb\xec\x82\xaf\xbe\x9c\x11\x02\xbc\x8fJq>\xd58\\\xbdE\x16\xe4\xbc\xe95w\xbe\xc4V\xe0\xbd\x18\x931>\xc7\x81g=d\x8a\xc7<y\xe3[>\xab\xa5\x99=\xd6\x16\x00\xbe\x14\xf2\x96>\x8d\xc0\xc1\xbd\x1c\xc8\x86\xbd\xc45\xfe\xbd\x87k\xce<Q\xf9]\xbe\xd5\xbfj\xbb\x99P\xfa=m\xf3c\xbe\x88km\xbb\x91E\xa8\xbd4R+>\xfde_\xbe\xbb0s\xbe\xe5\xd5\x0f>\x91\xb9\xb1\xbcX\xfd\x06\xbe\xd0K4>4\xd3\x86\xbe\x10\x8d0=\xfb\xd0k>\x89\x86\x13>\\\xcb\x03>7{\x8d>\xb4x\xa1=G\x1f\t\xbd\xeb\n1\xbd\xa1'}>\xee\xe7\x99\xbe\xc5\xc9\xcd\xbd\xd2Y\xaa;\x88:\x9e>\xc5e\x06=\xd3\x96K=\x07\xad\xa5>\xbf\x9cC<g\xc8\xcc>as\xeb\xbd5\xf0\xe6<\x17\xe8\xd9\xbe\x96G#>\x18\xf2\xe7\xbcc\xad\xae\xbd\xfd\xe4\xfa\xbe\x1b#\xc1\xbeg\xf7d>}_\xa8=\x87\x13\x0c\xbc\x89;Y\xbe\ta\xb5\xbdM\xb9S>\x99@2\xbe\xaf\xc2->Ca9\xbe\x1b\xcc\xef\xbd\x19u\xf7\xbe+=\x85\xbeM\xab\x93\xbb\xfd)\xcb\xbdH\x83\x87\xbdK\x0bS>\xcb\xfaT>\x08\xa0\xde=I\xe6\r>\x94'2>j\x05\xa3\xbd\x9b\x02\xdb\xbc<e\x8e>+`v\xbe='\x1d>\xa9j\xa6=5\x15\x96>\xae\x8e\x97\xbe\xa5\x07\xe6>\xa1\x95<=\x11\xb5\x11\xbe\xd7\xe9\xe4=\xb7\xb0q\xbem\x95!<\xc7S\xa3>\xc3\x10\xf1<\xc64\x1e>\x83\xd2|>i\xf6\xd5=\x19Y\xaa\xbd\xd0\xa4\xdc=\x83\x8c\x92>%O\x00>\xe6G\x07>\xb0\xe4\xda>rP\x13\xbeU\xc8\xbd<\xf3a5==r]=\xe8\x1a\xa5:|\xa3\x7f\xbd\xe1\xe2\x8e>\r\x9c\x01>\x83\x9a!>[\x17\xe8\xbcE]0<,\xc2i\xbeu\xc5\x8d>\x97\xe7c=\x81 \xf8=l+\xfa>\x8f\x15\x8a=c\x1d\x12\xbaa\x1f\xce\xbc`QG\xbd\xd7\xefp>\x00\x17\xac\xbd\x95\xf1`<O\xccd=cG\xe9=<M\x95<\xef[\xc2<\xe9j\xa5=/C\xf4<\xed\xa5\x90=\xa1r\x95=\xe0\x8eC\xbd\x08\xdc\xe7:\xf0\xc3P=\x8b\xeb\x8d=\xec\x81\x0f\xbe\xb1#\xa7>\xc1\xbb\xab<\xc5\xc6{\xbe1R\x88>\x9f\xc61\xbbs\xa1'>w\xe4\\>\x134\x07\xbe\xd0j\xd9\xbc\xb4mC\xbdC\xba4\xbe<py>%\xe8b>\xf0\x14\xb5;\x8fu\x92>\xc9\xa5\x8b\xbd\x99\xbe\xdf=\x1c\x9c^=\x0c\xe9\x85\xbeH\xed\xf0=\x1f\xc8U\xbe\xd6\x99\xa8\xbe\xd7\xd6\xef\xbd\x15\xbb\xc4\xbc\tP\xb3\xbd\xd5A\xaa\xbe/\xec\x84>\x15\xbfL\xbd8\x95\xda\xbd?\x99\xf5\xbb\xed\xf6B\xbe\x1b\xda\xe8\xbc'\xcb\xd4>\xd9\xc9B=\t\xb2\x11\xbdu=\xb0\xbe\xfcm\xa4\xbeq\x1e\x04;\x81\x8d\x00>-C\x82>$\xe2`<5#\x18\xbe\xaen\x83\xbcM\xcds>\x91\xc3\x94<\xdb\x8b\x17>\xc8\x8cM=\xce\xe1\x8b>1\xa3m\xbe\xb5\x9e5>\xeb\x94+=\xb5\xf4\xe1=\t{Q><\xab\xc6>_b\x93>\xbc\xf7\xb9=*P\x86=\r\x835=M-@>"
-p258
-tp259
-bsV445259595649646592
-p260
-g2
-(g3
-(I0
-tp261
-g5
-tp262
-Rp263
-(I1
-(I200
-tp264
-g12
-I00
-S'\xa3\xce\xfb=\x94\x15\xdd<\x85h\n\xbe\xdc\x95\xfe\xb9\xa0r\x8b=\xc3\x88\xc1\xbb\xf6\xb4\xb1\xbc$\xa7\xc1\xbdL#\xc4\xbc\xa1\xc1\xbf=\xdd\x97\xb2\xbb\\X\x9c\xbc\x90,B=\xcaB"<4\xac\xba\xbc\xf2\x99\xe2=[q*\xbd\r\xb8A\xbd=\x86i\xbdR\x01\x99\xbc\xc6\xc5\x91\xbd^\xee\xe3\xbb\xfc\x8bj=\xba\xb5\x01\xbd:\xf9\xb4;jQ\xc3\xbcg\xde\x89=I\xd5W\xbd\xedF\xbf\xbd\x00\xa4#9\xb6\x80\xbc\xbc\xf1O\x1b\xbd\xe2\x1e2=o"\xfa\xbd\n\x88\xcd<\x1c\xc1\xd2=\xd4<\x90=\xb7\xd3o=:^\xde=eD\x8d<\x85\xef*\xbdI4\xd9\xbc\xd0\xb4\x93=\x98=\xa6\xbd\x13\x13p\xbd\xb0L\xfb\xbb\x9c!\xfc=\xf4\xd3\xd4<\x0f \xdd<\x05P\x1b>L\x1a\xcf\xbbs\xfd\x0f>\x8b\xadR\xbd\x01\xd4\xf7;\xed\xcf,\xbeM\xafE=\xb5\x9d\xc1\xba\xaf\x13\xab\xbc"\xa2J\xbe\x17\xa4\x1b\xbeL\xdd\x9f=\xae\xca\xb6=ky#=Ds\xae\xbd\x05\xc4\x87\xbc?\x16h=w\xb8\xa4\xbd\xc1\xa0\xcc=\x82\x11\xec\xbc\x89>d\xbd\x95I6\xbe\xe6h\x02\xbe\xed1\x04\xbdZ\x94\x17\xbd\xdf\xf9\x13\xbd\xcb<N=\xfa\xf6j=\x82\x1f,=\rM\x9a=\xe7\xf6p=\x80n\xc8\xbb\\i\xbe\xbbt\x9e\x01>Z\x84\xd6\xbd\xcbUn=\x82]\xa6<&n\xc8=\x06\xdd\xe2\xbd?*,>3v0:\x1d\x8d\x88\xbd&~M=5;\xa5\xbd\x1d0\x92\xbc\x81|\xe8=\x85O\xd7:\xf7\xef\x96=^\x1f\xaf=\xeb\x17(=.\xb31\xbd\xb6@e<\x83s\xc3=\xc3V1=\x82\x06d=\xc5\xc6&>\xf5\x9b\xa6\xbd\xf8v\xbc;\x8e\x88d=(\xbfj<\xdcO*\xbc\x84\xbe\xb0\xbd/\xafr=\x94\xe6\xac=P\xbf\x90=\x93\x13\xc8<\xf3\xeb\x8e\xbb\r\xb8\xdc\xbd\xd6\xd3\xb3=\x92c\xea;\xac\xb8\xb3<Z\x9b7>\xe0\x908=4$m\xbc\xc0\x11\xd6\xbb\xcf\xb4\x94\xbc,\x8e\xaf==\xcb\x19\xbd\x86\xd1\x9c<Nl\xf0<\xd3J\x1c=D\x05\xa7<\x19\xde\xbd<\x8e\xa9\x97<\xbf\x0fK<\xa6\xc6M\xba\xc3D_<\xeb\xec\x7f\xbcm\xf7\xd0;#\x9f \xbdV`C<a\xfes\xbdD\xba\xd7=\xe8[\xf6<l{\xed\xbd\xb3\x99\xf5=&\xfb\xa7<[_G=\xb5\x1f\x0f>s?2\xbdJ\xdd\x11\xbcF8\x8a\xbb\xfc\x9a}\xbd\r\xbd\xc0=\x96\x1d\xa1=\x83t\x83\xbc9 \xf7=\xd3\xdbM\xbd\x1e\xb9\x08=\x14\x98\xee<\xb4\xed\xe4\xbd\x819\xad\xbb\xda\x05\xc6\xbd!\xe2\x12\xbe\r\x9d\x82\xbd6B\xc9;\xd3\x93\xbf\xbc\x9eh\t\xbe?\x07\xe5=~\x194<*W\r\xbd`\xe3\xb1\xbb\xa4D\x99\xbd\x19\x888\xbd<\xbc!>l\xb5\x80<\xaf\xc6\xe5<Wy\xf7\xbd\xc6\xe1\x15\xbe,o\xa9<\xbd\xd0.=\xd3j\xc7=\xba\x17\x98;\x92\xcd\x9a\xbd]\x1f\n\xbd\x1c\xfa\xed=\xbe\x8d\xa4\xba\x10\xfbq=\xcb\xb3\xa2<G\x0f\xd4=\xfaD\x8a\xbd\x13\x81\x8a=\'\xae=<\xc0\xa4i=\x1f\xe3\x95=\x16k)>\xaf\x06\x02>\x05\x8ad<&\xd6\xae<\xb2\xd5\xff<\x83\xdb\x1a='
-p265
-tp266
-bsV473440765255766016
-p267
-g2
-(g3
-(I0
-tp268
-g5
-tp269
-Rp270
-(I1
-(I200
-tp271
-g12
-I00
-S'\x8b\x05]=L\x85\xd1;\xf1\x0fm\xbd\x85\xf6a;+M\x1b=\x18n\x81\xbb\x8c2\x14\xbc\x95\xd9?\xbd\xb7ku\xbc\x9f[)=\xf3\x94\xa4;bG\x05\xbc\xbb:\xca<_\xe4N<\x83\x0b\xa4\xbc\xc5\t`=\x9b\xf7\xa5\xbc,\xbb\x94\xbckF\xcb\xbc\xd3\x04\xde\xbb\xac*\xff\xbc\xcb:\x8b\xbb\x15a\xb3<\xcc\xf4\xa7\xbc\xb0Fp\xba\x84*\x16\xbc\x90f\xfa<\x88l\x05\xbd\x11\x1f7\xbd\xffh\x00<,\xcc\x91\xbcok\xb3\xbc\xc0j\xd1<I\xdfZ\xbd\xeb\x9c\x07<\x1bPN=q\xf0\x01=\x94*\xbd<-\xeb<=-\xe9~<E\x1cI\xbcoix\xbc\xcd\xed\x0e=7\xe65\xbd\xfd\xca\xd9\xbc\xff\x0b\x1d\xbb\x9bFh=\x7f\xbdM<\xe4\xac><\xe3\x17\x8a=\xa3P)\xbb("\x85= \x0c\xab\xbc\xbb\xf7\xa6:\xe1\xde\xa0\xbd\x93S\xbd<\xd7n\xd3\xbb\xb9\xf4c\xbc\x07\x01\xb5\xbd+\x89\x90\xbd\xf1\x9b\x01=\xe3\x1b\xfe<\xfc\x90F<\xf3\xea"\xbd\xad\xb8\x15\xbc\x99v\x04= ,\x12\xbd\xeao\x15=\x17\xc7\xab\xbcI\\\xf3\xbc\xcf\x9c\xa4\xbd w`\xbd7\xef\xe9\xbb\xb0\xf4\xac\xbc\x90\xf9p\xbc\xc1R\xf5<\x05\x05\r=-\x1b\xaf<lj\xf5<W\xfe\xf3<\x99\x12\xce\xbb\xad\xc3\xc9\xba\x13\xd6u=\xbf\x19A\xbd\x9d\xb1\xdd<\xdc\x83\x07<\xec\xc32=\xbf\xe6h\xbd\xe4I\xac=E^\xa6;\xa5\xac\xea\xbc\xd16\xad<ww\x15\xbd\x0f3\x86\xbb\x0f\x0fi=-\x80R:\xe0\xf1\x06=\xc4?$=L\xec\x9d<\x08\x19\x80\xbcY\x8b\x0f<\x0c$E=\xbf\xf8\x9e<=\xd2\xc3<vb\x9c= \xbb\x11\xbdU\xdcM;\xa1.\x81<O#9<E\xa3\xb69\xf53\xe7\xbc}I\x16=;\x16\xf0<\x9d\xdc\xf2<\xc0h\xd5;\x1f\xc3\xe9;)\xbfE\xbd8\xaa==\x19F\xd0;\xef\xd0C<\x1d4\xa9=N8\x97<\xa9C\r\xbb-\x1e.\xbcwwV\xbc&"$=Pk\x85\xbc\xd7\xca\xb9;[\xe9|<\xe2\xf0\xa5<\x87F\xcd:\x1f\xb1!<\xadFl<Y\xb2\x9f;\xce\xd0\x10;C\xa5*<q(D\xbc\xb5)P;\xc5j\xe7\xbb?\xba\x0b<\xe8!\xd3\xbc\xb8j[=\xe8\xa9\x0e<\xb5+@\xbd\xdf\xc6T=U\xb5\xc0;C\xc9\xb3<\xa8\x08n=\xcd\xc5\xad\xbc+\xb2[:\x90\xf1\xdc\xbbU9\xf8\xbc\xbb\xf62=\xa8)\x17=l_m\xbb[\xbbU=\x97C\xa0\xbcy+\xa8<\x81\x97S<\x9bCI\xbd\xc3\xdf\xa5;I\xc6#\xbd\xaa`\x88\xbd#Y\xfe\xbc1\xdb}\xbas\xfd\x0b\xbc\x8doy\xbd\xf3CO=\xeb\xf7\xd8\xbb%\xa8\x88\xbc\xb8\x1bW\xbb\xd4o\x19\xbd\xa8l:\xbc\x86X\x97=G8"<h0\xd7;!sk\xbd\x9dDm\xbd\xd4F\xd1;\xdc6\xae<\xfbcG=\x15\xb8\xc7;\x08\xbd\xfa\xbc\xc7\xbe\t\xbc\xcd\xe9Y=\xc5!\x0c;\xed\x03\xce<\x9b\x0f)<\xe3\xe5;=I\xa4\x08\xbdg\xb2\x0b=kZ\xb4;g\x06\xab<\x8dC\n=\x8cZ\x98=T\xeee=\xc5\x04U<\xc7pw<\xd68\x9a<u\xf1\xaa<'
-p272
-tp273
-bsV445265855211782145
-p274
-g2
-(g3
-(I0
-tp275
-g5
-tp276
-Rp277
-(I1
-(I200
-tp278
-g12
-I00
-S'\xfc\x16U?\xeaZ\xa3>/\xb8\x11\xbf,\x90\x8c\xbe4\x17,>\x81\x84\xd5=\x1f\xb6\x1e\xbd\xach\x81\xbe\xc7\x08\x95=-\xfd\xed>$t\xda\xbd\xd1^z\xbe\xb4\n >~\n\x1f\xbeS\xdf\xa0\xbc\x13\xaa\xe8>\xd1\xe9\x0f\xbe|\xa1s\xbe\xbf\x08\x97\xbet\xf3\x16\xbeu\x98\x8a\xbe\xb45$>\xb9\xc4\xb5>O#\x9d>>D\x06>\x1fZD\xbe9b$>\x01k\x19\xbd\xc0\x12\xb2\xbe\x8dN\xc0\xbe\x8f9\x8e=\xf4\xc8\xe5\xbc\x14a\x87\xbd\xfa\r\xeb\xbeF\xe0\xb5=\xb1Q\x90>\xa1\xb9\xba>\xc1Gq>3\xfc\xb7>\xbe\x01\x92\xbb!(f\xbe \x8b\xdb\xbd\x17\xe4\x8d\xba\r\xa5\x7f\xbe7\x13\x0e\xbe7\xd5\xf0\xbd\xcd~\x13?\x8a\xeb+\xbd\xdf\xc2\x9c=\x84\xd8M?\r\xd9\xba\xbd\xa7B\x07?\xa4\xd1\xd0\xbe&Z\xeb=\x8fB\xe4\xbe\xbd\x9a\x04>\xec\xee\x9c>|V\xd9=-C7\xbfN/\x05\xbf\x14\x11\xd3>F\x0fM?}\xb1\x82>p\x89\xfb\xbd\xff\x85\x92\xbdA\x90\x98=}\x93\xb2\xbeY\xe75?\xfd\xbe\x07=\xa4\x9c\x8a\xbe\xc15\xfd\xbe:\xb1\xec\xbe\x1b\xf5\x9e\xbe\x19l\x06\xbe\xe4\xab\xa6\xbe1\xa98\xbe78\x1b\xbe\xd2\x1f8>\x87\x83b>1\xfb\x04>i\xd2\x86<\x19r\xb8\xbd8"\x0e?r)\x8f\xbe\x89\xd39>\xc9\xdbc>\xa9\xeb\x88>\xcaIq\xbe\xa1&\x07?D\xc7\'\xbe\x16\x1d\xea\xbe\xf4\xef7>\x01\xa5\xe8\xbe\xf9\xd5\x17\xbeh|\x95>\xbc\xa5\x0e>\'\x1a\x88>Q\xa7\x97>\'\xb8y<\x9f!\x83\xbe\xcf\x83^\xbe\x01\x00M>\xd6\xb3\x8a>\xfa)\n>\xd5\xe7\xaa>\xe7\x1f\x8f\xbe\xc34\x1d>\xa5\xa1\x1d?X\xe18\xbd\xd9\xdc\x84\xbd\x87BC\xbf\xe4\x8b\x85\xbd\xd6X\xec>\xa9\xca\xc2=\x13q5>\x84\xbfm\xbe\x94\x13\xd9\xbe\x8aGm>4D6\xbc\x1c\x95\xf1<OJ\x00?\x03,\x86>\xd8\x7f9\xbe\xf4\x18\x80>\xa9L\xcc\xbc\xc9\xb9\xa0><x%\xbed\xc01>!\xef\x01\xbc\xaf\xa1\xc1\xbd\x19Fx>$B3>\xe1?\x8b\xbd\xb38\xc5\xbc}\x8e\xd6\xbdFY\xf3<\x110\x0b\xbdg\x00\xcb\xbd\x04X\xde\xbe:p^;Ct\x90\xbe&\xd9\xc7\xbb\xefZ\x80>\xe9H\n\xbf\x0f=\x12?!\xd3m>\xb2\xff\'>\xc9z9?\x95t\x1a\xbe\xa7V\xd9\xbd\x11\x81u<`\xe1\n\xbe\x0fi\xd7>\x91w4>o\xbf;\xbd\xa7H\xd4>\xd7\x03\\\xbeI\x99\xdb<\xa9\x12\xdb=\x03\xf6\xe5\xbe=\xd0\xc6\xbe\t\n/\xbeq\x0e\xcc\xbe\x8a}\xc8\xbe\x95\x03\x85>\x1f\xff\x0e\xbeG\xfe\x13\xbf\x9cQ\x99>\x16\x1d\xa5>\x17\x84\xa59\x14\xe6\xa3=\xf0\xa2"\xbe\x14\xea\xaf\xbe\xc0\xd83?\xf6\x11\x03>+\x88\x85>$\xb9\xc4\xbeYhU\xbf\xbf\xc3\x88=\xe0\xf4\x90>\x8a\r\xc6>Y\xdd,\xbe\xead\xb6\xbeY\xf2\xf2\xbe@\xd3\xca>$\x00\xd3\xbd\xe0\xdcz>\x9f\xed\xaa<\xff\xa7\x84>\x1f\x1c\x06>\xfbG8>}\xdeZ\xbd\'\x90\xb0>L\x93\t>\x97\xd5B?\xfd\x9f\xf1>i_\x86\xbe!Nk\xbcC\x8b&>\x89g#>'
-p279
-tp280
-bsV445258417700372481
-p281
-g2
-(g3
-(I0
-tp282
-g5
-tp283
-Rp284
-(I1
-(I200
-tp285
-g12
-I00
-S'\xc1\x8c\xb8>\x17\xd3\xaa=<\xc4\x84\xbe\xab\x04\xa7<\xcb\x14\xde=\xee\x05\x96<9\x8b4\xbd\xae\xc5\xd1\xbd\x96\xb7\xd5<V|\xa2>\x94\x90#\xbe\xc7\x8d5\xbe\xd7s\x05\xbdj}&\xbe\xe9\x1fH=-s\x8d>\x1e\xbc|\xbd\x12O\x9b\xbd\x1ayZ\xbe\xd5rN\xbe+\xfd\xd4\xbd%\x15\xe0;tQ\x01>\xa2\xbc!>1\xcf\x1c>N\xa5\x04\xbe\xd6\x1ac>\xf3\x85\xa6=\xfa\x1b\x94\xbe\xe76\x80\xbe\xbc3C\xbe\x1e\xfa6=\xd8\xabd=;\'\xee\xbe^I\xb4=7\xe7\x07>=\xb5U>\xd6&\xe6=\xdcx\x9a>\x14\xbf\x06\xbe\x02$\x81\xbe\x1d:\xf3\xbd`A\x98=\x98\xd9\xf1\xbc\x88\xf4b\xbe@V;\xbe-\xf4}>\x95\x98\x80>\x00\x88\x1b>\xe4\x1b\xb0>(\xa4\x05\xbe\xfa\xf5\xd0>\x90\x88C\xbe\xde\xb4\xc2=N\xcb\xa5\xbefs\x1f\xbd\xd6\xff]<BV\xc3\xbc1\xd2\x05\xbf`\x9c\x9a\xbe\xa4}\xc7=\xdd\x8a\xf1>x\xb7\xea>\x0e\x86\x87\xbdu\x17>;\xca\xaa\x1e\xbd\xb5\xefX\xbeG`\xa8>\xdc\xb5\x9a>\xd3\xb8Z\xbe}\x8a\xc3\xbeb*\xb5\xbe\xcdh\'\xbe\xbd\x93\xf3\xbd4L)\xbd8u\x83<\xfc\x88\x87\xbd\x86\xa4\xc6=\x83%\xad>\xfb\xfc!>c\x9c\xff\xbbf\xce@\xbdz\xaf\xb7>&\xa8w\xbe\xa4\xcb\x17\xbd\x06\xeb\xc1\xbdUc{>iX7\xbe\xae\x10\xb7>JRV\xbe\x95K$\xbe\xc8=_<}\x96\xd7\xbd\x96f\xaa\xben\x85Z>\xa9\xc5D=\xac\xfd\x9b>\x8e\x07\x01>\xbe\x93\x99=\x88\x84n\xbe\xd7\xaa\xc5<\xd9\x1c!>\x8a\x93Z>\xfal\xc6=\x8eb\x9c>\x82[J\xbe\xee\xd9\x9e\xbd\t\xa1\x9c>\xb5\x9b\xcf<\xa8\x0bl=Bc\x00\xbf2\x7f\xcf\xbd\x05\xc9\x9b>H\xe0\'>.\x94\\=F\xa8==\x82\x83\xa3\xbe_\x15\x93=\xd0\x1b\x10=H|\xca\xbd\xc7\xcc\xa0>\xdd\xfcu>\xba\x11S\xbd7\x83\x19>\xc9i\xa6<\xba\xb3+>E3\x10\xbe\xa8\x89\x9d=\x989">Ff\xa5>\x10=\x8b=<\x12\xaa\xbd\xbe\xd3\x96=\r?<=\x08Q\x1c<g\xac\x93\xbd\xb2\xa5\x8b=R\xc0k=\xff\x93\xa2\xbe\xa5\xb4\xcf\xbd\x08G\x9e\xbes]j>\x0eCh>\xf2\xe8\x9f\xbe\x0c\xa4\x8a>a\xeb,>=\xb8y\xbb=\xa2\x12?\x8d\xa3\x9f;z\x16T\xbdU\x18\x11\xbd\x0b\xf6(\xbe\xe0\xeb\xec=\x81w\x8a=\xd71\x06\xbd\xd2~\xb0>Q\x82\x9d\xbe\xc4\x87\x8c=[\xd5r=\xaa\x0b\xcd\xbe\xb3\xe7L\xbe\x98\xc3\xb6\xbeP\x9c\x07\xbf\xe6\xcdA\xbe\xed\x9e\x05>_\xfc\x84=,Z\xb9\xbe;\x1aw>5\xf5\xea=\xcd6\x03\xbeAQ\x9f\xbd\x95\xb6~\xbez\x02\x91\xbe.\xa0\xaa>&gs=4\x152>\x12\xcaE\xbe*w\x01\xbfg\x8f\x12>c \x17=o\xb2\x1c>\xb9X\xb7=\xb6\x1b\x80\xbeF4Y\xbc f\xeb>\xa6!~=\x89/\r>c\xedM=\x00!Z>\x95(\x8d\xbd"\x7f[>\xf3A\x91\xbc\x8e\xcc\x8e=\x90\xf4s=\x05C\x03?C\x85I>{0{\xbd\xae2\xc0\xbc\x11\xce\x18>\x0e\x0e\xd8\xbd'
-p286
-tp287
-bsV446249785519915008
-p288
-g2
-(g3
-(I0
-tp289
-g5
-tp290
-Rp291
-(I1
-(I200
-tp292
-g12
-I00
-S',]\xe1>\xf9\x18\x88=\xc0 \xcb\xbe_\xfeP;l\x9a\x12>\xa7\xaf%;;\x80\xbc\xbcI\xc4-\xbe62\x19=\x05\xfbx>E\xd1\x1c\xbd\x14\xbfz\xbc\xeb4\xec=\x84z\xef\xbcZ\x806=\x12\x05\xad>\xf5\xb4\xb4\xbd\x99\xae\xd9\xbd\xc7\x86>\xbe\x1e\x8d\xae\xbd\xd0\xc7\x11\xbe\x89\xa65=\x1f\x90Y>\x80\xe5\xf1<\xa7G7=\x055\xf3\xbd\xb9\x8e\x10>\x02a\x95\xbd\xe9\x89N\xbe\x02*\xf8\xbd\x19\x88\x14\xbd\xcf\x8f\xd6\xbc\xfa\x82E=\xb1-\xbc\xbeR\xb9)=\x160K>\xf1]e>2PB>\xa9<\x90>1N\xae\xbd\xcf\xc0F\xbe\xa0o\xa3\xbd9\xd2L=Gn#\xbe\xa6wE\xbe\x0b\x9c\xb2\xbd\x91\x99\xc7>\x94\x81I=\xc4V\xa4=\xba?\xdf>V\xbb\xdd\xbc\x94\xdc\xe2>\xc5\xdcS\xbe\x1f\xa0\xd2=<\x1b\xb7\xbe\xb6:\x15>\x82\x8dg=\xf1\xdc\xb6\xbd\xdf\xad\xe7\xbe&\x9c\xd2\xbel\xae:>F\x8b\xb4>\xc6\x96S>t\xeb\xf3\xbd\xf6\r\xef<\xecG\xd0=q\xba\x8f\xbe\x8e\xa2\xbe>p\x8aX=\xab\xfe*\xbe>a\xde\xbe\xc1c\xb3\xbe\x89\xe3:\xbe%\xa2\xb1\xbd\x14~\xc8\xbd\x17\xec\x8f=zL\xf1<\x02f\xcc=\xbb\xb8d>\xc5kE>\x01\xbd\xc2\xbc\x87C\x9a;\x84\xaf\xaa>\x89\x0c\x83\xbe&\'\xac=W<K=\xae\xc9\x9c>~\x86\x8a\xbe\x1c\xaf\xde>j\xb3\xac\xbd\x9c\x9d\x90\xbe\x11\xfc\xfc=\x02\x98\x7f\xbe\xb6\x07\xe0\xbd\xba\xcd\x92><J\x17=\x14\x01m>\xf0\xa1L>[\xc0\t><\xa5>\xbe\x1bc\xeb\xbb\xcc\nU>\xb2\xc1E>\x06\x102>&\x1a\xc5>0-&\xbeT?\xc6<\xc8o\x8a>\x99\xbf\xa9\xbbJ\x9c#\xbd\x07\xfc\xba\xbe\x19\x19\x1e<J\xf8\x88>\xd4`\xe6=\xa1!\x99=\xea\xe3\x85\xbd\x00>\x9e\xbe\x12\xa9%>\x94\xfd.\xbb&W\x87\xbc\xacX\xdd>\xc7\x94T>6mL\xbd\x1b0s=\tC\xf9<\xaa\x83\x89>/#\x95\xbd\xde\x18\xb6=T\xef-=.\x88\xb0=\xbb\x07\x11>P:\xcd=\xec\x8a*\xbaN>\x1b=\x94\x13\xc5\xbb\x17)\xbb=,L\x83<\x1fg:=\x1e<y\xbe<:\x0b\xbd\x14\xb9h\xbe\xd2\xa1v>\xe0\x91\x1c>\x17\xc8\xbd\xbe\xfe\'\x91>\xb7/M=\xf5S\x9f=\xbaA\xe7>\x8a"\xd3\xbd\x9f\xaa\x97\xbc\n\xd7\x18\xbb\xa1N\xc6\xbd\xa9\x83M>\xab\x0f\x12>,\x8c\x8c;\xe4e\xc1>g}G\xbek\x90\xe6<@_\xf8=\x90\xcd\xb6\xbe\xbe\xbc\xdf\xbd!7j\xbe{\xb8\xdd\xbe&IJ\xbeQ\xd1\x9a= \xcb4\xbdi\xe9\xc8\xbely\xa1>\xbac`=\x9b\xe9\xdd\xbd\xdem\xc7\xba\xe0\xaaI\xbe\x87\xbcA\xbe\'[\xf8>+\x07\x8b=<l\xfd=\xe84\x81\xbe\x8eu\xf6\xbe\x0e\xe8\x1b>j4\x12>\x80 \x94>\xcf\xf6s;O\x97E\xbe\xc7c\xc4\xbd&b\xa1>\xc2\xa3\x14<\xe2\xd8h>\xe9\x83\xb4=\x97\xeak>0*\xfb\xbc\xe4$;>b\x99>=\xd7\xe7.>\xcf\x9c\xf9=\x02\xd4\x06?\x1c{\x98>\xa5\x05w\xbd\x89G\xb6;\x1b\xa7\xb7=\xf1\xb7%<'
-p293
-tp294
-bsV445259979285876737
-p295
-g2
-(g3
-(I0
-tp296
-g5
-tp297
-Rp298
-(I1
-(I200
-tp299
-g12
-I00
-S'\xb6\x1cM?\xbb\x16\x91>\xde\xef"\xbf\xab\xee \xbe\xa5\xf7\x18>\'`\xa2=\xdb\xaci\xbd\xffc\x82\xbek\xa7\x02>\x1a\xaf\x10?Pwp\xbe\xce\xe7]\xbez\xd7+\xbc\xb9\xd7\x95\xbep\xc9\xfc=3\xd0\xf5>\x11L,\xbe\xac\xdd\x87\xbe)S\xb6\xbe]\x8dT\xbe=\x05\x8d\xbeF\xcaW=\xaa\xb7\xbc>\xd4\xd3\xb1>\x1d\xde\xf7=\xaaM2\xbe&\xc2\x93>\x08m&=|\xa7\xcb\xbe\xa8G\xe4\xbe$\xc3\x16=\r\xffa=\xf0\x8e\x17\xbe\xaa\x15"\xbf\xd3\x84|=z\x87\xc4>Z\x17\xf3>U\x93\x9e>\xc0B\xe4>Ro8\xbe\xc8U\xc9\xbe\xd5?\xf5\xbdZ\x008<\xaav\xcb\xbd\xfc\xc0\xa3\xbe\xaf\xa4C\xbe6y\x0e?\xe5\x18\xb6=#o\x16>}eX?:\xe5\xff\xbd\xa8\xa9\x1a?\x92I\xe4\xbeD\xc1\x16>\x1e:\x0e\xbf\x86\x0f\x13>\x1e{\x86>\xb3\xef\xde:,\xbfK\xbf9\xae\x1c\xbf\x16\xff\xb5>^\x9fp?X\xeb\xdd>\xde\xcb\x12\xbe\x08\xa4\xb3=\x07S\x8d=\xb2K\xe3\xbe\xb0\xffR?6iu>\x00>\xb0\xbe\xe8\x1b\x08\xbf\x96\xdb)\xbf+/\xe0\xbe\x9bE\xf8\xbd\xf2\xa4w\xbe\x08\xc5\xd2\xbdUu>\xbd\xddk\x06>\xce\n\xd7>\x92\x02s>\x82\x14\xbd=J\x00\xfb\xbc\xa2\xaf\x0e?\xa3\xe2\xd3\xbe\x1bJ\xa4=\x8bR]=b\xd2\x90>\ns\xb4\xbe.\x99\x1a?\xdeJL\xbe\xd80\xf9\xbe\xb8\x9ca>\x0fA\xa2\xbe>\xfa\xa8\xbej!\xc6>}&\xd4<{\xf7\xd9>\x9e\x99\x87>J\xa4>>\xa8P\xad\xbee5@\xbeA\x915>\xc3\xb7s>\xeb\xccd>R\x15\xe5>C<\xd3\xbe\x96\xa2I=b]+?C\x89\x9c\xbd\xbe\xec\x99\xbd=\x9ba\xbfk\xc8V\xbe:9\x08?\xf3\x92Y>\x03}\x84>)\xb0)\xbe\xe2\xa5\x12\xbf\x9540>\xf5\'\x89\xbdS|\xd5\xbd\xf5\xbe\x1c?~\x14\xa4>\xc8\xf4.\xbe\x9b\'P>\x90\x9f\xc3=~P\xc5>n\x0b3\xbe\x1e\xb8r>{.\xc6<\xba\xbb\x06\xbc\x1a\x80\x82>\xc5J\x1b>\xb0\xba;\xbd\xc6\xf37<\xe4\x0c\n\xbe\xc6\xe3\x89=\xa3\xde\xe8<0\x0e\xd4=\xe5\xbd\'\xbf\xad\xcd\x7f\xbd\x04\xb5\xa5\xbe\xd5\xfaY>\\\xf2\xa7>~j\x1b\xbf\xbb^\x1c?\xfa\xdc\xa0>\xde\x1c\xeb=\xda\x14\x7f?\x06\x00\xe0\xbd\xab\x0f\x82\xbc5z\x83\xbb\xc0\x81A\xbe\x86\xff\x9e>.\x98:>\x0e\x90{\xbd1R\x07?\xf2\x0e\xcb\xbe&xV<\xfe\x18.>\x91\xcd"\xbf\xdb\xbc\xda\xbe\xab\xd2\x96\xbe\xf6\xec$\xbf.\'\xf9\xbe\x86\xb8\x83>)\xf6\xc5\xbdJ\xb0*\xbfEa\xd4>\xacm\x92>\x9du\x85\xbdt\xa8\x82=5v\x82\xbeF#\xf1\xbe\x1909?:B\xad=B\x0b\xbf>\xc9\x16\xa5\xbe\xaa$`\xbf&\xceT>\xc8\x9f_>\xab\xda\xcb>\xfe"\x0f\xbdZ\xde\xdc\xbeR\xb7\xd0\xbe\x8d$\x1a?+\x8a\xfa\xbd|J\xa9>c\x04\xe1=\xea\xa4\x9f>]\x93\xce=\xcan\x0c>\xb2\x11\x03<\xca\x80\xa6>\xde\t\x00>P\xf6L?\xe5\xea\x15?\xc6\xafq\xbe  \x8e\xbd\xbaA/>\x11B\xab\xbd'
-p300
-tp301
-bsV474173720563425280
-p302
-g2
-(g3
-(I0
-tp303
-g5
-tp304
-Rp305
-(I1
-(I200
-tp306
-g12
-I00
-S'\xc3x1?b=O>\xc1:\x08\xbf[ \xe2\xbd)\x8fJ>\xad\xca\xa8=\x85\xff\x88\xbdu\xebh\xbe\x8b\xe5\xfb=\xbf_\n?e`\x82\xbe@\xd0\x87\xbe\x0f\xe3q\xbd\x19\x89i\xbe\x1e\xd8V=\xf6"\xf1>\x198\xf3\xbd\x16\xea\xe1\xbd~\x8e\xc8\xbe9\xa2\xa6\xbeE\xee<\xbe\xdcC\x9d<9\xd4\xa8>\xb0\xbe\xad>eqn>\xdd\x88d\xbem\xe1\xaa>\x1f)\x9e=\x11\xf5\xcc\xbe!\x08\xf8\xbe\xac\x8a\x0e\xbe\xb3\xaa\x82<^\x00>\xbd}{7\xbf\x1e2\xda=-7\x98>iQ\xc9>\xab\xe5\x90>\xb9\x9f\xdb>q\xd5J\xbe#W\xe9\xbe\xad\xf3\x0b\xbe\xaa\x9bk=v]\x8d\xbd\x03Z\x91\xbe\xc8\xcc\x81\xbe\x1ca\xf5>\xafJk>`\x02i>r\x85=?\xe0\x083\xbe\x89\xff!?tf\xc0\xbe\x1d\xe4?>\xf1[\xff\xbeT=\'=U\xf2$>d\x9dm\xbdi\xddE\xbf\x1b\x07\x12\xbf\x9a\xff\x9c>\xb1\xe0]?\xda\xe6\x10?\xb3\x10\x02\xbe\x1ba\x8c=\x83\xc5\x9d\xbd\x03<\xfa\xbe\xee\x17&?0|\xbf>3u\xab\xbe\x168\x12\xbf\x8d\xe3\n\xbfrJ\x96\xbe\x1dA1\xbe\xfe\x9e[\xbe\xfc\xd5\x0c\xbeA\x08\xc8\xbd\xc3C\xf0=\xf4g\xe8>\xcb\xa3z>\xde1\x00<\xff\x9d\x18\xbd\xb4\xd0\x17?I\xf3\xa7\xbe\xee_\x1a=5\x89@\xbc\x92x\xa7>\x9e\xd5\xb3\xbe\xa3p\x18?\xd7\xb9\x98\xbe\xcd\xf3\xe2\xbe[)\x96=\xfa!\x96\xbe T\xc2\xbe\x91\x04\xbf>\x96\xee\x01>0\xf0\xd7>\x19\xd1]>p\xfa\x13>\x8f\x95\xb7\xbe~\xdc\xc6\xbd\x80\xe7d>!#\x9d>\x8c7o>c\x0f\xd0>w\'\xb6\xbe\xef\xd7\x93\xbc-J!?\xa7\x93\xa3<*H\x95=J\xd3X\xbf\x19\xd6\x8d\xbe\x02l\x05?\xe2\x8c)>\xeeI*>:\x81\x1e\xbd\xd1k\x0c\xbf\x90\xb8\x0b>\xe6\xcc\x87<\xf98%\xbe\x83\x8d\x13?\x07\x81\x9d>Z~\xc4\xbd\r\xc5\x8b>\x1e&\xad<\x0e\x1c\x9c>\x81\xe34\xbeD\x8a\x00>\r\x1eT>|\xb0\x81>\\\xa7[>)9\x0c\xbb\x13\x867=\xb6\x10u=\xcf\xb8O\xbd\xcb\x12\x04=O\xe1\xa3=\x12\x88\x94=\n\xe7\x1b\xbf\xfd\rx\xbd\xe7\xe2\xe7\xbe\xefMU>\xf1\x08\xa8>\x02\xb2\x16\xbf\xa3\xc1\x01?\x1eA{>\x89K\x93=O\xadn?\xfb\t\xb6\xbdyWM\xbd\xd2\x8bj\xbd\x89g\\\xbe<\x0f\x92>\xda]\x07> \xc0o\xbd\xb0o\r?\x9a&\xec\xbe/\xfc\xc1<\x848\xe1=K\xaf\x0f\xbfF\x1f\xd0\xbew\xad\xe1\xbe\'G8\xbf\x15\x90\xbf\xbe\xd6M\x97>\xb5\xff\xda<\xa7\xd7\x1e\xbf\xaau\xd6>\x96ip>\xeda\xc4\xbd3\x8b.=\x8d\xff\x87\xbe,\n\xe4\xbeSv\x15?\xec\xb2\xac=\\,\xbb>y\xae\xa3\xbe%\xe2W\xbf\xab\x81\x83>\xf4\x11\x07>Z\x9f\xaf>\x9f\x14\x8d=\\\'\xdf\xbe\xab&]\xbe\xf6\x8d\x1c?c\xc4\x8f\xbb\x9c\x08\x91>>\x06\xf8=\xb4T\x98>\x1f:A=\nd\x9e>\x175\x03\xbd\xb6\xf9i>\x9f\xda<<\xb4ST?\xb3\xb8\xc1>\xec\x9c\x1a\xbe4\xa8\xac\xbd\xfb\x8bJ>Cs\xc8\xbd'
-p307
-tp308
-bsV445127884424740865
-p309
-g2
-(g3
-(I0
-tp310
-g5
-tp311
-Rp312
-(I1
-(I200
-tp313
-g12
-I00
-S'\x9d\x15\xe7>\x95nX=Q[\xce\xbe\x12\xf2\xdf\xbd\xac&Z>\xb6"$\xbd\x1e\xb8\x19=\xa5#7\xbeo$]\xbbU\x94C>;\xc0\t\xbdo\xf7\x17\xbd\xefn\x19>\xa0l\x87\xbd\xbb1\xa0\xbd\xdew\xa3>u8\t\xbd]2[\xbd.\x03S\xbe\xa8^o\xbc\xef\xcds\xbe\xf8M\xcf=\xb8\x8d(> \xe21\xbd\x80"+=\x19[#\xbek\x90->\x94\xab\xe4\xbd\t$\x80\xbe\xf52\xd1\xbd\x94KI=?D\xb9<#\x08\xcc\xbb>\xfe\x9c\xbe\xac\x13\xd0<\x05\xeb\x01>\xe2\xad:>\x189J>\xd8*\x87>\xebw\xa1\xbd>K\x10\xbe\xe2\xd1$<@U\xdf=8.k\xbe\xb1*\xed\xbd\xc8u\xcd\xbdr\x98\xa1>:\x9a\x14\xbd\xf7\xb0\x85=\x9e$\xe1>\xf2=\xa5<\x18\x0f\xe2>\x07\x17\x86\xbeG_\x08>u\'\x92\xbe \xa3\x1d>V>\x1f>\xca\'\x99\xbd;d\xc1\xbeup\xbc\xbe>\x85\x81>~\x0b\xa3>\xc2L\xbe=X\x14\xd0\xbd\x1f\x92\x00=\x12\x8a\xcf=\xcf\xa7F\xbeY\xa1\xb2>.\x15\xaf\xbd\xcc\'(\xbe\xe2\xe7\xc2\xbe\x92\xcb\x83\xbe!\x1e\xa7\xbd\x91\xd7\x90\xbd\x0c\xe6&\xbe/\x83\n=\xb2t\x9e=^\xde\xad=\xe2\xc8\r>+\xcbF>U\xf9S\xbd\xc8\x86\xcf\xbcE1\x8c>9\xa9.\xbe\x88/e=\xb1^\x05>\xf2{a>\xef+k\xbe\xce9\xd8>\xbb\xfa\x87\xbd\xda]\x8c\xbe\xee\xd2\x04>\xbf\xa2\x93\xbe\xe1\xaf\xba\xbd\xc5\x08\x80>\xa7\xd1\r>\x91)N>\xb4\x1c_>\x11}\xb9=\x82\x90\x07\xbeh\x1c\xad;\xe5!A>\xe6\xfb1>F\x18%>^lu>\x06\xa94\xbe\x95&q=\x93\x04\x8f>\x8c\'\xe2;\x1b\xba\xdc<\xdf\x9c\x98\xbeC~N=\xeeb4>\xbdn\t=\x0f\xc5\x0e\xbc2L<\xbd3}\xaa\xbe\xfb\x16T>\xf5@n<\x97\xdf\x84=Zj\xd5>\x80h\xe6=NC\xa5\xbd\xd2\x88\r>nGR=]\xed\x8f>\xc2M\x19\xbe\xc2%\x1f=\xcd\x06.<\x0b\x9ai\xbbF\x8f\xd1=\xb2\xec\xc2=e\xe9j=\xd7e\xa3<\xba\x01\x95=R\r\xd2=b\x0e\xac\xbb\xd5\xf4\'<.\xf7\x03\xbe\xa5u\x0b=\x17~H\xbe\x05\xff%>\x96\x06\xac=\xc1\xe6\xb2\xbe\xd2\xcc\x9e>$\x96\x9c=\xf7\x9a\x1e>@\xcf\xc7>k"\xe8\xbd\xc5+\n\xbd\x94\x06\xe8\xbc\xfd\x01\xa1\xbd\xb5:h>\x05\x86\xf8=\x14\xd9\x19=\x9b\x92\xab>\xa4\xf5\x06\xbe-\x12\xa4=\x85\xe1\xb0=\r(\x81\xbejw\x88\xbd\xc4\xa5\x00\xbe\'0\x99\xbe2;|\xbeW\xb7\xec=\x00r\xca\xbd/\x16\xd1\xbeU!K>\xe3h~=\xb6\n\x1b\xbd\x80\x1c\xc1=\xeb\x00\x01\xbe e\xe0\xbd\x859\xe8>\xad6\xb9=+\xc9\xba=\xe9\xe9y\xbe:7\xf8\xbe\xef\xb1q=\x8d\xce#>\xf1@\x89>\x88\xe3\xca\xbc\xa8\xaah\xbehT\x07\xbeXt\x8b>\xf5\x95W\xbd\x86\xebg>\x8fR\x9f=\xd5y3>)\x16\x84<\x0f&0>\xa8\xa9\xe09\xf8\x17\x19>\x8e\x13\x8a=,\xb8\xe7>\x15I\x7f>\x12\x11H\xbd7\xfe\xe2\xbc\xc6%H=\xe27\xb1='
-p314
-tp315
-bsV445260367951040514
-p316
-g2
-(g3
-(I0
-tp317
-g5
-tp318
-Rp319
-(I1
-(I200
-tp320
-g12
-I00
-S' B\xd5>\xa0\x02\xba=\xaf\xcfw\xbe\x9f\xdb1\xbde+C>kB\x89=\x05\x8c@\xbd|\x97x\xbe\xdd \x85\xbdz\xee\x95>\xf9K\x10<\xccY\xe7\xbd\x01\xac^>8<\xbf=\xdd\x92\xce\xbd\xcfc\x8e>Y_\xd1\xbd7S\x92\xbdE\xbb\x18\xbe\xa0\xf2\xd2\xbd\xfb\xa1\xe4\xbd\x9d\x99\x1d=S\x0b)>\xa0Eo\xbc\x8b\x15\xde=\xa7H\x97\xbdT\x9bp=[\xfaB\xbd\xb0 \x80\xbe3\xa2\x86\xbc\xdd*B\xbd\xcf\xfc\xb4\xbd\xac\x8a\xd0=\x93\x04\x8e\xbe\xad4\xb5=\xad\x93\x03>\x8c$O>\xcd\xc3\xd7=-\x99A>\xd1\xa6\r=!\xd0s\xbc`\'&\xbd\x195B>m\xd1f\xbe\x9d\xff\x16\xbd\xf0\xa8\xee\xbc\xc1\x14\xb4>\xe9\xaaH=}\xde\xe9<a\xd0\xe0>WJa\xbd\xf7\'\xc1>\x01\xca\x12\xbe\xbf\xdd\xfc=i\x07\xe4\xbe7r\x81=\xc4N,\xbb\xad\xb5\x98<\xd7\xd0\xec\xbe\xfb\'\x9d\xbe]\xe0]>G\xd2B>_\x05\xf5=kl%\xbe[q\xbd\xbd\x80\x07v=\xa8;\\\xbe\x91G\xa1>\xbfl\x80=\xb9x\x12\xbe\x94\x03\xba\xbe\xb7\xc7W\xbe;\xee\xb1\xbc\xd5H\x8b\xbd\xf2\xfb\xa5\xbdk^@=\x8c\xb1\x14\xbd\xc3\x10\r>}\xea\xba=\xeb0\xa8=,H\x1d\xbd\x05r\xe0\xbd\x9c\xad\xbc>\xeb\x1d"\xbe\xf8N\x13>s\xcb\x1e>\xc0=\x89>\xe3\xe6.\xbe\x91\xd6\xae>G\xe4\x92\xbd\x1d\x18#\xbe\xa4\x8e~<\xc3,\x88\xbe\xf9\xde\xc4\xbd;6<>J\xd1\x95=";\x03>\xbf\xe9r>T\xecC<\x9c\xf3\xe3\xbd[Y&=\x01\x81=>%\xc4\x15>\x8cj\xb9=\x01\xb3\x9d>\x91\xf4\x94\xbdQh\x91=\x0cl;>\x00\x87\x95\xbc\xdfV\x90<\x94\xb0v\xbeu3U>%\'l>uJL=\x02\x9d!\xbd\x89\xf9X\xbd\xb0\xa0T\xbe\xa5\x19v>\xbd\xc8\xb3=i\x97\x9d=u\xa8\xca>\x19G\x8f=y\xd3$\xbd\xbf\xd0\r=\x14Cd\xbd\x87& >\x15\xaf\xb0\xbd\xcd\xaf\xf9<\x06\xde\xa9=\xc3\xdcN=\xc80\\=p\xa8O=\xb0\xd3=\xbcE\x96\x96=`\x8b\xc2=i\xcd\x0e\xbd\x00\xf5\xb69%\xc5\x94\xbd\xde\xd3\xa2\xbd\xb0$\xc2\xbb\x84\xd6\x0e\xbe\xd3\x9c\xbf=E\xb7&>cL^\xbe\x8e\xd0\x94>\xf7\x98\xb6=\xcd5\xca=\xb5dW>\xc5\x9f\xdf\xbd\x7f\xde\x0c\xbd\x97Z\xd3<r\\\x1d\xbe\xfd-s>\xcf\x01\x0b>q\xc80\xbd\xdbK(>\xe6\xd9\x85\xbd\xe0\xa2\xb6=\xbb\x00\n<\x13R\x8c\xbe\x8f\xd0\x91\xbdw\x8ad\xbe\x1b\x7f\xa4\xbe\xa4\x19J\xbd4\xb3\x13>\x97\x85#\xbd\x07^\x87\xbe\x80\xb7]>\xb8\x0cg<\xa1\xf1\x02\xbe\xd8\xe1\xa8\xbcdp\x15\xbe\x84_+\xbdUq\xbe>\xe5IO<\xed\x15;=9Q\x96\xbe\x1f\x0e\xc6\xbe\x1d\xa4#<\x95]\xf8=\x0b\x18`>\x95\xd9\x01\xbcy\xaf2\xbe@\x90\xf5\xbdLAH>\x8f!(\xbb\xb5N\x88=\xacf}=\xa3uC>-F\xb2\xbd[\x06R>~b\r\xbd\xfc`\xf4=\x8b\xcf\xc4=is\xf0>\xa0,Q>\xb9\xc3&\xbc\x10\x10\xbe=c\xbd\xfe=\xb4\xd1|>'
-p321
-tp322
-bsV445128068860895232
-p323
-g2
-(g3
-(I0
-tp324
-g5
-tp325
-Rp326
-(I1
-(I200
-tp327
-g12
-I00
-S"\x06\xaa\x91>Q\x93\x17>\x9e\x08\x98\xbe-\x0e\xff\xbbd\x16\x86=\xeaF\xc1\xba\x80\xf46\xbd\x06\x8a\x1f\xbe\xe6?d\xbc\xac\x8f->\t\x10i\xbd\x83\xb7\xdc\xbd\x0cK\t=D\xf93\xbd\x94a2=&\xfc^>3\x05\xb2\xbdI\xf30\xbe\x8a\xf1\xf2\xbd\x93\x0bE\xbdj\xd7\xb6\xbd\xcc\xec3\xbc\xb8\x92&>\t2\xac=-gM=\x85\xad<\xbd[D\xdf=\xa3\x12\xc5;\x82\xc3\x1e\xbeon\xe8\xbd-\xba\x8a\xbd\xd2\x8e\xb1\xbc\x83\xaf\x00\xbc\x94=~\xbe\xda\x8cE=\x89\x932>\xa2]\x1e><t\x11>\xc9\xbf>>[\xc1\xe8\xbcVv\x00\xbe\xbcke\xbd\x08\x95\xd9\xba\xaa\xf4\x85\xbd\xc5GB\xbe\xa8A\x1f\xbd\xaf\xa0`>\xe0%c=\x08\xb0v=\x9d\xfe\xab>\x1f\xd8\xa1\xbcq\xb3S>\t\xdd\xe8\xbd\xf6\xe3\xb4<l|\x80\xbeFT\x1f=\xa5\xc0\x18=\x94(\xb9<\t\xf3\xa5\xbe\x1bH\x91\xbe\x0f7\x03>\xef\xc1\xa7>\x0869>\xf6\x98\x0f\xbe@\x08g<A\x8et=Y\xd8\x13\xbe\xc4\xf3\x88>\x89\xa8\xba=\xd6 \x10\xbe\xfc\x8d\x9b\xbe\xc8+\x9a\xbe\xb8\x11T\xbez\xa4J\xbd@\xe4\xc9\xbd\x13z\x96<\xcar\n<s\xf8}=\xc4vR>\xa6c\xe7=\x83\xcc\x08=\x8d\xf8\x84<\xfb<q>;2G\xbe\xf2\x9d\xa6=\xba\x0f{=_\xc3\x1b>\xff\xa6#\xbe\x8e\xa5\x84>X\xa4\xce\xbd\x18M,\xbe\xf8\x16\x03>)\x89\x0f\xbe)x\xe8\xbd\xb1R\xe1=\xdd|\x84;/\x1c1>\xdd\xdc\x05>\xa8&V=1\xe9\xdd\xbdD\xb8.\xbd\xb6\xc3\x03>8\t\x99=\xc6\xb6\xff=i<\x98>\xad#6\xbe@\xc8\xa6\xbbd1|>H\xe3Q\xbb\xaeQ@\xbd@\xb0\x95\xbeI\xa6|;)&\x83>]\x03\x16>\xa6\xa2\xc2=\xc8\xe6\xae\xbd]\x8dj\xbe:\xa4\xd8=\xe4\x7fN\xbd\xcc\xdc\x10\xbcyg\x97>d\x92\x05>.\x9b\x97\xbd\xe3\x9e\xa4<\r\xbb7\xbc\xc0\x0f\xe3=3\x9e\xa4\xbd\xfb\xa9\xd8=\xf3HI=\xd3J\x84=\x8aW\x97=\xce\x01\xde=\x8dK\x91\xbb!\x96\xb2<\x1b\x00\xc6\xbd\x84\xad\x91;V\xe0\xd0\xbc\x04J\x16<\x9dBk\xbec\x1a\xf9\xbc\n\xbf\x01\xbe\x83\x95\x11>\x8a.\x05>\xfc\xf8t\xbe\x08\xf2\x87>/\x86\xda=\xae\x15\x16=VQ\xca>6,\x1e\xbdO\x89\x87\xbc\x8e\x14\x8c=\xe0\x90\x91\xbd\xf1\xf69>MB\x02>\x05og\xbd\xcc\xacw>\xdd\xcf\x10\xbe\r#\xb3<\xe9*\xe0=R\x07w\xbe\x86\xf9\xfa\xbd%\xbeN\xbe4(\x8d\xbe{\xa0;\xbe\x12\x9dN=\xb1'\xe7\xbc\xb1r\x85\xbe1QJ>\xcd\xeb\xfe=L\xb6\xe3\xbcX\xbd\xe1\xbcH`)\xbe\xee\x00C\xbe\xae\xb8|>\xbd\xcc+<T\x15\x07>\x16\x0b/\xbe\x85\xb9\xb4\xbe\xc0\xb8\xd0=\xe9\xe8\xab=\xaf01>\xce<#\xbd\x9f\x8a!\xbe\x16U\x07\xbe\x98\xde\x81>\x9c\x97\xbe\xbc\x0e#\xef=\xd8&\x0b=\xed\xb3@>j\xe4\x8b\xbd4Y\xda=Lm'<\x8f\xa7\x11>,\x02\x14>\xc1l\x9f>A\n\x85>\x8bX\x8b\xbd\xe6;\x0b=\xd4C\x98=\xd6\xd6I\xbd"
-p328
-tp329
-bsV445232027499896833
-p330
-g2
-(g3
-(I0
-tp331
-g5
-tp332
-Rp333
-(I1
-(I200
-tp334
-g12
-I00
-S'\xb9\xf3\xb1>\xb9\x92\xcd\xbc\xcc/\x91\xbe\xe9*\xd5\xbc\x9c\xd5\x8e=\xc6r\xba\xbc\xdc~\xc4\xbcs\x9c\xde\xbd\xab2\xb3<\x84\xe2\x92>\x8a\xeb\n\xbe\x14\x1e\t\xbe\xa9~\xd8\xbc^\xb01\xbex\xb3\x0c\xbd\xd4\xe8W>@\x9f\x81\xbd\xf93\x81\xbc\x10\x03-\xbe\x0cj\xcd\xbd\xaa\xbba\xbeP\x070=\x12\n\x18\xbbW\xb4\xf9<"\x91\xcb\xbc~\x1e\xbb\xbdfV\x96>N?)\xbc\xe7;\xb2\xbe\']U\xbeZ\xc3\x1b\xbe\x1c\xd6v=\xbc\x05\x8d:\x9b\x07\xd4\xbe\x81\xb2\t\xbd|\x00\x85>D\xa2n>\xd4}\xaf=,\x04\xb8>\xe4\xce+\xbd\x97ps\xbe\xb7\xd1\x82\xbd\xa7T0=\xef\xf9\xb2\xbd\x9c\rb\xbe\xe3\xd8H\xbe\xb6\xc4\x95>U0.>b\xac\xbe=\x80j\xc4>yQ\xd3\xbc\x07i\xb2> \xe3\x7f\xbe5\xba\x7f<\xed[\x95\xbe6!\x1b>\xd7\x1b\x05>\x11\xf6\xbc\xbd\xe2\xa0\xe0\xbe\xcdB\xa4\xbe\xcd\xb3">\xc2\x95\xd3>\x13\x82\x8f>\x82\xe1[\xbd\x86\x9b\xac=\xa6\xee\x0b>\\\xb1$\xbe\x024\x8e>y`\xc5\xbc\x8e\x17S\xbeN\xef\xbb\xbe\xe7\xb9\xad\xbe\x7fT\xbc\xbd^f\xf4\xbdH^\x05\xbeW\xac\xc8<<\xd9\x02>$\xa9*>\x82\x0e|>\xbd\x03J>"[E<\x90c\xb4\xbc\x1b\xee\xa3>\xb4kg\xbe\'S\x87\xbd\x0e\xd9\xde\xbd\xac\xab\x89=T\xe0|\xbe\xb9$\xc5>\x17\x9c\x86\xbdl\x8a4\xbe\x91\xaf\xce=\x8cd\x05\xbe\x9e\xb7<\xbe\x0cx\x94>\x95PD=\xdf\xfa\x98>\xb9\xfe\xe5=n\xac\xf7=\xb5\x9f\xb1\xbd\xf1\xf4\xba\xbc\xd4um>}\x1dP>\xb2\x0b\xdd=\xb0Cg>\xda\xae\xa5\xbe\x17\xd6J\xbcb\x12|>N\x87\x83=\xc5\x90\xdd\xbb\x0c\x96\xcc\xbe\x8e\x90\x08\xbe\xc7\xa4+>\xf0jM>\xe4k2>\xdf\xd4\xc4=\xb0c\xd9\xbe}33>\xa7\xab\x04\xbd\xcc\xe0\x8b\xbdB\x98\x8f>\x17\x86\x82>\x00^\xc9\xbd\xffl\xc0=r7\x92\xb9\xda\xe0\x8f>"\xdaq\xbe4\x0b_\xbc\xe9\x99\x85<w\xf6\x1e>\x89i4<*\x8e\xbe=\x14\xd5\x0f>\xd4\x8d\xa4\xbbax\xcf\xbc\xbc\x1b\n=c\xd7\x04\xbdH\xdf]<\xfc\'\x82\xbe\xd5\x9c\xf1<Z\x07\x87\xbe\x8c>Q>\xb6\x11\xc3=\xfc\xc1\xc8\xbe\x00,k>dP\x15>\xcfX/>\x0b/\x17?\xd7\xb3\xb2\xbd\x9dn\xb0\xbc\xe9Y\xea\xbdt\xab\x06\xbe\xbaa3>\xd3\x16G>\x0c\x15W<\xd7k\xc2>\xbbwj\xbet\xde%>?j\x9d=\x96\xb1\x9a\xbe*\x01<\xbe)Ni\xbeU\xdf\xf2\xbe\xf0\x96\x9c\xbeET8=\xd7\xe1Y\xbdT\x81\x04\xbf@W6>\x03#\x89=w\x19\x1a=\xa6\x99\x0b=\x89\xc7m\xbe\xb0\xe1&\xbeDP\xd0>\xe7\x91\x1c>\xe9zH>\xbbqo\xbe0\xdc\xe7\xbe\x0c\xd0\t=\xbb\xf5\x9a=\xd48u>\xafz\xaa=\xa2D\x81\xbe\x0c\xbb\x1a\xbeI\r\xe9>\xa5\x99^\xbd\xac\xccX>\xf4\xed\xdd=\xe2\xb1R>\x16\x9a\x15<\x87\x14\xf1=\xfe\xc5\xe1<\x859\x07>\xd7*o=\\\x87\xe2>\xe0\x80\x8b>\xf2\xa0\\=p\xe2\xba;\x17\x10\xfe=N\xe4\t\xbe'
-p335
-tp336
-bsV446076696736071680
-p337
-g2
-(g3
-(I0
-tp338
-g5
-tp339
-Rp340
-(I1
-(I200
-tp341
-g12
-I00
-S'H~;>\xef\xa5)\xbckMj\xbe\x9f\x95S\xbd\xf7\xba\n>\xac\xf1J=D\x1a\x14<\x10\x06\x02\xbeY\x83\xe7\xbc \xe5\xdc=\xe6\xf8Y;\x15\x95 \xbd\x15\xa9\x17>\xd0\xc3m=`j\x14\xbe\t\xb5\x11>,\x1a"\xbd\xb3\x9e4<\x16/\x02\xbe\x10\x85\xfa\xbc}?\xbb\xbdw\xcd\x8e<\xfc\xba\xf9=\xd9]\x1b\xbdul&=\xb4m\xc3\xbd\x0c\xfd\xca=\x12\xf7m\xbd\\\xfd\xcd\xbd\x9fw@\xbd\xa0\xe6\x11\xbd\xd6\x1c\xa5\xbd\xb4\xbd\xaa=n\xe3x\xbe\xac\xa7=\xbdz\xc5\x05>u\xe1\xbc=\'\xfc\xed=@\x11\xd5=\x7f\x9b8=\\\x1aD\xbdIz\xbb<\xdf\xda\xaf=\x84\xac\'\xbe\xffF\xd7\xbcr\x92k\xbd\xa9\xf4K>\xcfT\xab;\x1a\xae\n=\xcc\x19r>\xc8\xcc\xc8<\xfb\xd3~>\xcd\xfe\xc1\xbd\xedy\xa5=r\xae#\xbe\xa6m\xcc=L\xb9\xdd<Cq\xe2\xbd\x04E$\xbe\xa0&t\xbe\x9ca">\xb5\xccv=V!\x03\xbd\x95Z\xc5\xbd>\x94\x9e;\x7fp\xa3=\xf7\x07R\xbe\xfc\x80\x9f=\xa5w\xe2\xbd\x87\x8e\xb0\xbdg\xb0\\\xbe!!\xbe\xbd\x83\x81\x88=$y\xab\xbd.\xf9\x00\xbe\xe4\xd3\x95<\x1c1\x9f=pc\xc3<\xe1\x91\x91=\x19\x17\xa7=\x19|\x8b\xbd\x1b%\'=Y\x8dt>3\x90\x8b\xbd\x19n\x8c=D7\xbe=\x85t\xe7=\x94C\x81\xbeTO\x88>\x9a!\xdf\xbcU\x9eC\xbe\xc7\x06+\xbc"\xf2#\xbe\x92Jk</:B>\xd4\xc2\xde=\'\x01n=\xac\xb4\xd2=T\xd3\x8f=J:\x88\xbdB=S\xbb\xe5#\x1c>\xa1v\x9f=d\x13\xfa=\xf7\xb8\xd9=\xcb9\xe5\xbd\xec\x94D=4I\x94= UT=\x93\xde\x9b=\xfe\xd8\xc8\xbdz\x1d\xa3=\xfc\xa7\xb6=X\xfe\x1c<\x11^\x8f\xbc\x88Y\'\xbc@\xac-\xbed\xcaD>\x1e\xd2\x88\xbc\xde\xb9\xab<)B\x81>\x89r\x7f<6\xe8\xbf\xbc|\x1e\x07=\xdfY\xc1\xbds"\t>D\x17M\xbd\xa7\x9d?\xbd\xd4\x97,=e\xd9\xbb<\xc6L\xb1=\xfd*\x9c=K\xed\xa6<\xa0\x99]=`\xbe(=\x94\xff\x19>\x95\xf3D\xbdr\x9e`\xbc`\xd4\x80\xbbd\xec\xd5=\xf4\xef\xe0\xbd^\xfb\x08>\xb8\xa5+\xbd2\xc4H\xbe\xb4A\x06>t\x07\x1d\xbd\x9c\x11\xcc=\xe4\xfa:>l\x14b\xbdZ"\xa6\xbct\x963\xbd%\x13\xd7\xbd\x14\nQ>\x19\xfc\xff=G\n\x0c=p\xd2U>\x8d\xdb\xad\xbd\x08\x10X=\x1c\xab:=\xa0\x16\xe1\xbd\xec\x85\xbd;i\xbf\xc0\xbda\xc9X\xbe\xeaZ\x12\xbe\xf9$\xb2=D\xe1\x96\xbd\x1bx\x8e\xbeh\x97\x03>\r\xe8\x07\xbd\x82\x94Z< Fv=\xb4\xd5\xa5\xbd\xcccM<\xf4 \x81>\x18y\x02=7|p<\x9c\xc68\xbe\xd4|h\xbe\x99\xfb\x8c<\x14\xc0\x80=\xc2\xd3k>"\xd6\x8e;\x17\x04\xa9\xbd\x04\x05\xcd\xbc\x1e\x8c\xf7=\xec;Y<\x19\xd7\x04>\xf2\x1f\x7f=\xcdt\r>\x90\x8d\x88\xbbV\x17\x06>\xa7}\xad<\xa4\xd3\xde=\xb6\xe3_;!\x1e\xa4>^\xa4\xe5=\x95\x9b\xde<\xa5\x94\xec;\xc0\x1f\x0f=\xfc\x02\xf5='
-p342
-tp343
-bsV473454349105242112
-p344
-g2
-(g3
-(I0
-tp345
-g5
-tp346
-Rp347
-(I1
-(I200
-tp348
-g12
-I00
-S'\xee\t\r?\x18J\xa0={\xbe\xef\xbeh\x1c3\xbdz(\x17>\x99\xc6\xb5\xbbi\\j\xbc\xfd*{\xbe\x9d\x8cf<\xa5\x91\xcc>\xb2\xf5\x1b\xbe0!\xfc\xbd\x1e\x84\x91=\xf9i%\xbe\x7f\xben<\xa2\xf4\xb8>2\xf5\xcd\xbdv\x7f\x14\xbeP\xb7p\xbe\x80\xc5\x1b\xbe\xdf\\o\xbe\x03r_=\xd0\x10\x19>\xee#u=\x1d8\xb1=SI\r\xbek\xac\xa1>\xa0T\xb6\xbc\x05\xfe\xc8\xbe\xf8yc\xbe;\x08\xed\xbd\x8bi\x81<\xd5\xb2\xbf<\x11?\n\xbf\xe9\xa2\x14=+g\x94>B\x8b\x98>\x07\xecB>94\xdc>\x8bg\xeb\xbdg\x95\x9e\xbeW\xd6\xcb\xbd\x98y\x04>\x9bm:\xbe\x88b\x93\xbe\x11+6\xbe\x88\x1d\xd6>I\xe0?>@1\x14>b\xc8\x0e?\xddj\x8c\xbd\xbdZ\r?w\xd7\xa0\xbe\xeb1\xc7=B\x9e\xf8\xbe5\xbb\x05>m\xf0\xc5=3\xc6\xa5\xbd.\xe1.\xbf\xbc\xf7\x00\xbf\xe7~\x84>\x9b\x1b\x0c?\x87\xd0\xcb> \xc7\x1e\xbe\'T\r=i\x7f\xf3=!\xd6\x9e\xbe\xb5B\xf8>\xd6\xe0\x0e>G\xfbh\xbe\xb0\xda\x0e\xbfD\x19\x01\xbfGy:\xbe\xe2\r\x0c\xbe\x97\xe8\xfc\xbd\xdb+f=\x81\x8c\x8b=\xbb\xb6\x1c>a\xb5\xb2>\xb9\xe6\x84>!\xc6\xf8\xbb\xa5\x88 :\xc30\xf7>\x88\xa5\xa7\xbe]\x9e\xcf<i,\xff\xbcb\x7f\x93>.\xa7\xa2\xbea\xfc\x04?\xee\xc3\r\xbeO5\x8f\xbeWN\x17>\x05nf\xbe\x91v\x8d\xbe\xcaw\xb3>>\xfeC=\x86(\xb4>\xfb\x14h>\x9a\xcc/>u\x10R\xbe\x90\x8eh<\xa8&\x83>\xf5\x16o>\x80\x7fD>^\x1c\xda>z\xea\xa0\xbe\xceJ\n\xbd\x9d\xdb\xc2>]\x84\xb9<\xd5\xab\x0e\xbc\xc0\xb1\t\xbf\xf8qw\xbdX\xd7\xa1>h\xdd`>rK\xfc=\xcbl9;\xdf+\xde\xbe@\xf8T>\xdbV\xa3\xba7\x8d\xc8\xbci\xbb\x04?\x8e \x89>%\'\x81\xbd\x87\x05\xe7=\xa28\xa6<ES\xad>\x89\xe68\xbeW\xb5\x93=K\xc9\xe5=+\xe3e>\xc2\xe3\x03>)\x0ei=\x8a\xda\x8f=/6\x89=-\xe4\xcf\xbc\xaff\xea<*\xf3\x91<\x9e~T=\xbf\x8a\xa0\xbeb\x98\xf3\xbc\xf0`\xad\xbe%\x0f\xa7>\xc2\x17g>\x96`\xfd\xbe\xe6[\xc3>Eg6>\x9b\xb5\x1b>"j0?\x07\x9c\xd2\xbd\n\x89e\xbd\x0f2\xa7\xbd9HF\xbe\xddA\x8e>\x11\x83O>a\xee^\xbd\xe9\x0f\x01?\x8b\x8c\x91\xbe\xe0\x1c\xd5=\x1f5\xd0=#d\xf2\xbe\xcbB?\xbe\xd0\xdc\xc0\xbe\xf2\x9a"\xbf\xd5I\xa1\xbeuB\x0b>\xa3-0\xbd`\xd4\x0e\xbf\xe5\x10\xa7>~\xa9\xd9=\xba5\x9f\xbd\xa5\x1d\xbd\xba\xbf\x82\x90\xbeZ\xf6\x87\xbe\xf5\xee\x10?\x113\xd2=^5H>I!\xb0\xbe\xa2\xa2)\xbf\xcb\xbe\x16>zm\xc3=\xfc\x06\x8c>A*\xa1=\xb1%\xb5\xbeE76\xbe\xf7\xe3\xfd>\x12D\xe1\xbb\xd3\xech>\x1d\xb2\xec=\xd2\xe5\xac>z\x1e\x84\xbd\x1d\x98`>3\xd2\xcc<POC>\x03\x9c\x06>\x10:(?\xedL\xc3>\xb1>\x87\xbcV\x1f\xac\xbb\x95\x125>\xfd\xe1\x8c\xbd'
-p349
-tp350
-bsV473381420400795648
-p351
-g2
-(g3
-(I0
-tp352
-g5
-tp353
-Rp354
-(I1
-(I200
-tp355
-g12
-I00
-S"\xbc\x1ck=m\xb3\xcd;\x14U\x7f\xbd\x13s\x86;\x9c\xe5(=\xf5U\xbb\xbb-u&\xbc/ S\xbd!\xb2\x8a\xbc\x91\xb08=\xd5\xfb\xa1;a\xb8#\xbc\x1d\x91\xda<\xe5\x90n<\xb5\xa7\xb4\xbc\xa7\rp=\xf9\xa7\xb9\xbc,\x05\x9e\xbc\xf3\x1d\xe6\xbc\xc1'\xf6\xbb\xf9'\x08\xbdXH\xb7\xbb\x03\xe3\xc7<+\xdb\xb0\xbc\xcd\xcb\x1e\xbb\xe5\xc5*\xbc\xdc\xd3\n={!\x17\xbd8\xdbG\xbd\x03A\x12<\x90\x10\xb4\xbcyv\xd7\xbc\xa5P\xdd< qo\xbd-\xb8\x19<\xfd\xb0h=5X\x10=1\xa9\xce<\x91+N=\xda\x12\xaa<T\xf4D\xbc\xff\xad\x86\xbc$P\x18=\xa3\xe5@\xbd\x8b\xe0\xe9\xbc\xcb\x88Q\xbb<5\x80=UZf<\x95?O<[M\x98=S\xd8\x15\xbb\xe7\xef\x8d=\xe3\x94\xb2\xbc\xe9\x16\xbf:\x8b'\xb2\xbdm\x8b\xd0<\xd0\x89\xe4\xbb\xe8\xe9z\xbcD\x98\xc5\xbd\x82$\x9f\xbd\xbb\x19\x10=\xa7Z\x0c=\xb7\x84N<\x08\xfd2\xbd\x0f\xca!\xbc\xf7\x92\x1a=\x8f' \xbd\xe1\xc5 =\xa0{\xcc\xbc\xf9\xe2\x0b\xbd\x88\x9d\xb7\xbd\xa4\xc3p\xbd\x9fF\n\xbc\xa0\x80\xbd\xbc\x7f)\x87\xbc\x1dv\x03=\x8e\x94\x1f=\x15+\xc9<\x8b\xf2\t=#\xae\x05=\xc0\xad\xae\xbb\x84]\xf3\xba_`\x8a=\x00\xf8Q\xbds\xc4\x01=\xc4\x9e\t<]\x1f>==\xdf\x81\xbd\xbcL\xbd=K\xba\xca;\x9b\x13\x01\xbdL\xf4\xc0<%\xda!\xbd\xac0,\xbb\xc5\x0c\x81=K?\xc4\xb9\xc1\x8f\x13=\x8f\xc66=;\xbf\xb3<e\x1fl\xbcE\x13\x05<\xc8\x06a=\xd9\xe5\xa9<H[\xdc<\xddW\xac=\x95\x03*\xbd\x98\xe0\x93;^\xc2\x94<P[e<\xb8(\x1c\xba\xc4\xfd\xf9\xbc#\xe0!=H\x7f\x01=\xc3\xc3\x05= w\x1e<\x00\xe6\x18<]\xbdX\xbd?(P=tl\x9c;\x80\xad_<\x8c\x98\xb9=\xfc\x0e\xa6<]\x95@\xbb\xd0\x01I\xbc]R\x8b\xbcE\xeb/=?\x90\x8d\xbcT\x19\x95;L/\x82<!\xbb\xab<n\x04\x00:\xf0\x82N<a\x80\x85<\x0c\xbc\x98;q\x9f\xe2:\x03\xd92<]\xaek\xbc\xf0h7;\xb5\xc5\xd7\xbb\xf9\x8e0<p\xa5\xe3\xbck-n=\xd4&\x1c<+\x8dR\xbd9_k=\xa3\x85\xeb;\x19\\\xcc<\xdc\x1f\x86=\x0f\xa5\xc0\xbc/D\xbc:\xef+\xfd\xbb\xbcD\r\xbd\xf9,G=\xcbm+=\xe1\x15\x88\xbb\x0b\xe1l=m\x83\xb2\xbc#\x88\xb7<\xd1\xe8m<\xec\xadP\xbd\xa8\xd3\x98;5\x084\xbd\xc9G\x90\xbdN\x87\x0c\xbd\xbd;6\xbbIk\x11\xbc\x0fr\x8b\xbd;_f=\\\x7f\xf8\xbb\xebb\x8d\xbc\xeft\xdf\xba\xa3\xd5#\xbd\xb5\xe4<\xbc\xfa\xfe\xa1=-[S<%h\x13<\xcc\xea\x80\xbd\xf9\xa7\x81\xbd\xef\xb5\xda;A9\xbe<\xad ]=#\x1c\xd7;=C\x03\xbd\xb9\xa5\x0c\xbc\xcd\xc0m=\x03\xcf%;kR\xe3<\x15\x90T<y\x84M=4V\x15\xbd\x84\x99\x19=OA\xb7;\xdbm\xbe<\xe3\xc8\x1c=\xd57\xa6=\xed\x12}=\x90\xe7w<\xec>\x88<;\x97\xa2<\xedN\xb9<"
-p356
-tp357
-bsV474059577772617729
-p358
-g2
-(g3
-(I0
-tp359
-g5
-tp360
-Rp361
-(I1
-(I200
-tp362
-g12
-I00
-S"l\x0b\x8a=\xbb'\x1a<\xf9h\x92\xbd\xa6\xb9\x0f;\x9f\x9d7=\xfe3\x88\xbb\x1e@;\xbc\xd9;x\xbd\x92\xa2\xaa\xbcr\xf3S=\xa0y\xdc;\x84\xd6V\xbcc%\x00=\xd8\xf1\x90<\xb0\xd1\xd6\xbc\xd7\xf9\x87=S#\xc2\xbc\xd4\xda\xbb\xbc\x9f=\xfd\xbc\xc6\x97\x18\xbc;' \xbd>8\xa8\xbbX(\xde<N\x95\xba\xbc\x19W\xf5:\xb0@E\xbc\x08\xf7\x1b=\xa5T!\xbd[\xe7b\xbd<5\xe3;\x97n\xce\xbc\x1e\xac\xf9\xbc\x86q\x07=1]\x8a\xbd\xf9\xbc6<\x1d\x8b\x81=fe\x1b=\x98\x1b\xf1<\xaePf=5s\xb3<)\x07m\xbc\xb7l\x97\xbc\xa9\x18-=/\xbfa\xbd\xaaL\x04\xbd\xbe\xe6-\xbb\xb2\x7f\x8a=M\x03\x8b<gRo<\xd3\xac\xae=\xf2\xe73\xbb\x0f\xa3\xa5=\xf6w\xc7\xbc\xa0tS;\xca\xc4\xca\xbd{\x05\xd8<\xe7\xd0\x13\xbc\xbb1\x98\xbc\xbf/\xe2\xbd\xa0\xa4\xb5\xbd\x12\x9c#=\xea\xb3\x1e=^\x1f\x88<\xf4<O\xbd\x9f\xa0B\xbc\x1d\xff'=\xa5^8\xbd\x82&7=\x12M\xdd\xbc\xf8\x8e\x1a\xbd\x9fp\xd3\xbd\xd6\xf1\x86\xbd\x86u \xbc\xfc+\xc8\xbcW\xe3\x86\xbc\xebt\x0e=\xfd\xa6-=\x11\xe3\xe4<\x06\xaf\x18=(\x82\x1e=\xd7\xac\xcb\xbb^\xba#\xba\xc6\xce\x98=\x18\xccv\xbdV\xc8\x0e=\xe7\xc0\x1e<\xa4EV=`\r\x92\xbd\xa9\xe8\xd3=t\xb0\xa7;\xf3H\x19\xbdqR\xdb<\xc8D7\xbd\x82n\x8d\xbb\x06T\x91=\xd5\xc8\xfa:h\xc6,=b\xeaQ=\xa6v\xc6<{&\x9a\xbcf\xd0;<L\xee|=\xa6A\xc3<\xafT\xf2<\xe1\x12\xc6=\xffr;\xbd\x1c8\xc2;\xc9Z\xb2<\xe6\xd1i<\xfc\xf0\x919\x18\xc8\x11\xbd~\x07:=B\x17\x1b=>'\x15=\xaf\xa2\x03<\xf0\xfc\x0e<\xf0\x8d|\xbd.\xfcj=\xe9\\\xe0;2\xf5r<\x87\xbb\xd4=\xf6X\xb4<\x98|`\xbaN\xbe^\xbcyM\x9c\xbc\xba\xbaI=\xfdl\xa0\xbch\xb0\x15<\x0b\xa4\x9b<\xde\xe0\xbd<:\xd4\xa69=/:<\xe4\xdb\x99<4\x0c\xd1;\x18\x97);(t)<\x90\xfc\x7f\xbc\xbb5~;\xb0}\x0e\xbc\xee\x15B<V\x9e\x02\xbdh\x95\x85=\x9fp><\x07\x0ei\xbdV\xbd\x8b=q\x97\x10<y\r\xd9<\x1b\x17\x98=\xa1^\xda\xbc\xa0\x04.8\xb4\x93\x0b\xbc(K\x1d\xbdY/k=\\\xa25=\x8b\x9a\x9f\xbb\xd2\xf2\x82=\xd9\xe0\xc9\xbcy\xc3\xd1<\x1dS\x82<\x00\xf7u\xbd\xff\x93\xb7;\xa9\xe4R\xbd\x80\x0f\xa4\xbd\x0c\x98\x1a\xbd@\xb6&\xb96\x84<\xbc\x91\x98\x9b\xbd\xff\xcb\x7f=hZ\xaa\xbbO\xb5\xa9\xbcg+\x97\xbb\xb4\xeb<\xbd\xebzq\xbc\xb4\x1b\xb7=\xe4\xfdY<\xde\xe7+<5\x7f\x93\xbdM\x89\x93\xbd\xdd\xc9\x03<\x82f\xe1<\xbf\x19}=D<\xc3;w\x81!\xbd\x02\x9b2\xbc\xde\x9a\x8b={5!;\x1a\xe8\xf3<\xfcej<l\xb0j=6p*\xbd\xe9M&=\x02\xe3\xa8;\x8a\xb1\xcf<A\x157=\xc0y\xbd=y\xcb\x8c=\xee\xc6\x8e<Y\x98\x8d<\xfdp\xbb<\xd7E\xdc<"
-p363
-tp364
-bsV445232063080173568
-p365
-g2
-(g3
-(I0
-tp366
-g5
-tp367
-Rp368
-(I1
-(I200
-tp369
-g12
-I00
-S'\xcb$\xd2>i\xaf6\xbc\x97\x94\xe9\xbeD+\x99<\x19\x8b\x9a>@z\xec\xbd\xa6k\xaf\xbc\xaf\x85\x85\xbeQ\x186\xbd{R\xcf=\xb1\xb9\xe3<|\xc1w=\xe4\xe9@>\xa7X\x00=v\x8e\x9b\xbd\xab\r\xbd>\xfb\xd3\xcf\xbc4\x86V\xbd&\x925\xbe\x0c\xc1\xba<QBk\xbe?\xfb\xc0<\xb4\x97\x07>\xce*\x98\xbe\x96\xf6\x04\xbc\x14E\xe9\xbd\x15\x99D>\x17\x07<\xbe\xc6\xe0\x86\xbep\xe2\xec=\xe7R\x16\xbbQ\xbe[\xbd\xa4n\xb4=\x9f\xbf\x90\xbeg\'W=\x90kO>\x11:\x13>\xce\xfbY>\x06`\xb7>\xb69W\xbdI\xd0\x1f\xbeDd6\xbcusq>\xa0\xa6\x92\xbe\xcf:;\xbe\x94\x18\xc3\xbd_C\xbc>\xd15\xee;9A\xd6=Q\xcb\xcc>\xd0h\xb2=|\xe4\xf6>\xe6\x81C\xbeN\xa4\xc8=\x1c[\xd2\xbe\x10sX>\x1e\xa4:=\xe4<\x12\xbe\x01\xe2\xe4\xbe\'\x1a\xd7\xbe\x06]p>\x82\xd6=>%\x14\\=\xd7\x9dB\xbe\xd6#\xf9<d\xcc\x10>\xfa\xb78\xbeW\xb0\x8a>w[)\xbe\x02\xdd\x04\xbe\x08>\x13\xbf\xb5\x16\xa0\xbe\xea\x15y\xbd\x8c\xfec\xbd\xc6\xdf\xd3\xbd\xa4{V>\xa0\xdd^>FC\xdd=\xa7\x9f\x1f>f)z>`\x0e\xa0\xbd2\xdb\x00<\xae\x8e[>\xda\xfdZ\xbe\xff\x0f\xac=\x8cX\x11>\x10\x81\xa4>\xb5~\x95\xbe\xee\xc1\x03?\nKT\xbc\xf0\x9ag\xbe\xf1\x14P>wv\xa8\xbeI\xe7\x18\xbd_s\x9c>\xf1\xaa\xf8=\xb9SA>\xcc\x18{>\xb6\x14\xf8=\xc2f\xc4\xbd\xcc\xb6\x1d>/\xb5\x95>\x81\x8d\xfd=z\xbd^>\xd15\xcf>\x96XO\xbe\xc7\x82\x10<\x84A,>\xb19b=\xd4\xfew=&\x00\x16\xbe\xc9\x80O>\xb0\xfcj>\x82\n\x11>\x07\tl\xbd\xb6\xf2>\xbc\xa1\xd9\xb3\xbeB^\x98>\xab\x9a<=\\\x1d\xee=_,\x07?\xde#\xd8=)\x1dm\xbd\xd6(\x83=P`P=\x82\xfe\x82>\xd1\xeaV\xbe\xbbY=\xbb\xc17:=1X\xe8=n\xea\xca=y\x91">\x0f\x08\n>_\x8fH=\xb2+\xdb=^\xea\x9b=f\xf5\x97;\x16\xeeY9\xb4\xd7"\xbc\xa0\xcd\x81;@\xa8h\xbe\xc4\xde\xad>\xbc\x90j=B\xfa\xc3\xbeaN~>!W\x89\xbd\xf1&6>)\x1d\xab>\xac\xed"\xbe\xbe\xd4\x94:\xa9\xf7\x81=\x9cR\xd1\xbd\x89\xe0w>\x1b\xff<>QBh=V\x96\xbf>\xf4(\xd2\xbdQ\xec\x05>\x00&\xfa=/y\x84\xbe\n\xf4\xcc=iw\x87\xbef\x17\xc0\xbe\x83P\x08\xbe\xa5x\x1b=I\x1b\xd2\xbda\xb6\xd4\xbe\xcd\xa5\x92>\xb4\xcc\x1d\xbb63\xba\xbd\x8a\xc8n=y\xfd6\xbe\\2G\xbdp<\xe3>\xb2\xdaT=\xcc\xa6\xfe<\xfa$\x8c\xbe\x1a\x16\xdc\xbet\xfa\xd4=f\xe5&>\xa2\xc8{>k\t!<\x0b\x1fE\xbeo\xe4\x1c\xbc\x15\xf9\x9c>/\xa7\xf9\xbc\xe5`\x88>\x0c\x8b\xa1=\x11i\x83>\x16\x89\x19\xbeL\x04\x86>&\x8e|=\t:\x04>d\xfd\x18>\x97\xee\xe3>\xd9\x03|>UQ\xb2=kB?=>NF=\xf6\xdb\xb9='
-p370
-tp371
-bsV445233013765705728
-p372
-g2
-(g3
-(I0
-tp373
-g5
-tp374
-Rp375
-(I1
-(I200
-tp376
-g12
-I00
-S'\x94\xc1\x03?\x05[==\xbe|\xdf\xbet=\xcf\xbd\x89yE>\xe4\xae\x97=@!t\xbd\xdd\xd8V\xbe\xfc4\xdb=\xc1\xc2\xd7>J\x8c\x06\xbe\xce\xd90\xbe\x9d\xd7\x06=%$\x10\xbe\xbe\xd3\x1b\xbd#\xf8\xb7>\xb4\xb6\xca\xbd\x9fuT\xbd\xb8\xad\x95\xbe<\xc1b\xbewI4\xbe\xd1\xf8\x11=\x15\xcd1>@o\'>;\xe9\xea=\x80\xa5;\xbe\xf30\xa0>\x10\xcf\x02\xbcZ\x18\xc6\xbe\x1b\xbb\xa3\xbel\xc8\x1a\xbe"\xcd;\xbbH\x92,\xbd\x12\xb9\x12\xbf}a\xa3<\xcb\xf7\x9a>\x7fx\x9b>\xa8\x814>D\x0f\xc5>\x7fI\xa2\xbdY\xf3\xb8\xbeBx\xa2\xbdE\x95\x89=\x92L\xfa\xbd2}s\xbe\x82\xefS\xbe\x00b\xf9>/X;>z\xde;>_\xd3\x1b?\xe37\xce\xbc$S\x06?\x16\xe6\xad\xbel\xe4\xed=\x84\xe7\xe1\xbe\x93-/>\xa9\x9b\xd7= r\xd0\xbd\xfe\x8a\x10\xbfpg\xfb\xbe\xccM\xa3>\x11\xc5\x1c?\x8c\xf0\xc1>\xeb\xdf\xee\xbd&\xf4\xa3=9\xb5\xeb<\xb1#\xd1\xbe~\xfc\xeb>\x9f\xc1\x01>t3x\xbe\x95\xf4\xe5\xbe\xb5\x9a\xcf\xbe\xf5Q\xc5\xbd\xf7\xef$\xbe\xd7\xdfc\xbe\x15;\x86\xbd\xf2\xa2?=$~\x0f>\x04\x91\x8b>\xe5\x94c>\x1f\x06\x8a\xbc\xd7\xba\xc4<$]\n?\xd2\xc4f\xbe\x93\x85\x02=\x95\xaf\xc9<"\xe6N>\x8f\xd6\xae\xbe\xa5x\x04?qy\x06\xbe\xc4\r\xc2\xbeN\xe9\xcf=<\xd5\x86\xbe\xa9?K\xbe\xb6\xba\xb8>\xccP$=\xd87\x86>956>\xb2\xcfH>x\xb0\x10\xbe\xcb\xb1\x83\xbdo\x88\\>zR\x84>W\x14u>\xd0\xcc\x93>\xd2\x81\xae\xbekP:=\x87\x83\xdd>\xd8^\x93=\xda+a<W\xb9\x13\xbf\xc3W^\xbe\xce\xea\x9c>\x07t\t> \xa1\n>\xdc\xff\xce<\x17g\xf0\xbe(\xa7E>\x06\xf6\x0f\xbc\xc4i\xa9\xbd\xd4\xe8\xf3>\x8c~y>\x9cu}\xbd\x1e\xc1\x0e>\xc4\xd7$\xbdx7\x9d>m\x1e\'\xbe\x147\x10\xbd\x13\x9e\x14>N\xdd\x1c>\x92\xa0.>\xb2\x14\x82=\xc87\xbb=3\x9cP=\xa4o\x13\xbd\xae\x04\x08>}0\xb9<\x84\xe4\x88;\xe1\xb3\xbd\xbe1\x97\xa2<\x90L\xbf\xbe\x0e\x81I>\xcf\x8c2>\xa3s\x00\xbf\xc7\xd2\xa3>\xaeF\x07>\x9a\x1d<>\x15\x9b*?*V&\xbe7p\xb6\xbcC\xd0\x04\xbe\xfc\x8d?\xbem\xbd\x93>\x06[N>\x11*\x17\xbd\xb1\x87\x00?\xc8H\x9c\xbe>\xa3\xba=F\x96\xb4=\x11\xeb\xc4\xbe\xfc\x05\x84\xbe\x142\x9a\xbe;\x8d\x15\xbf\x15D\x97\xbe\xeez3>;\'\xa7\xbc\xb1\x05\x1d\xbf\x00\xfb\xa3>6\xf86=6j\x80\xbc?@\xa1=\xf6OI\xbe#\xa6T\xbe`Z\t?v\x02\x08>\xb2Yp>M+\x8b\xbe\xcb\xa4\x1c\xbfd\xaf >Ok\xe1=\xbc\xfc\x9f>\x85~\xe6=\xf6\xe3\xb4\xbe\xbe/j\xbe\x81\x1a\xe0>$\x8f\xab\xbc\xb1k\x83>jZ)>\xbb\x93x>+\xfc\x7f=5\xff\x8e>\xb6\x08\x1d<\xec\xda^>\r\x8fB\xbd\xb4\x93*?\xf7\xc2\x8d>\x10S\x9e<\xa0`\x81;H\x9bC>;\x91K\xbd'
-p377
-tp378
-bsV445233117972799489
-p379
-g2
-(g3
-(I0
-tp380
-g5
-tp381
-Rp382
-(I1
-(I200
-tp383
-g12
-I00
-S"\xe9\xc0&?\xe3\xd6\xcf=m\x17\xe7\xbe`v\xf5\xbd\x0b\xe7\x81>9\x8c9=\x81\xd0d\xbdaD\xb5\xbe\xbc\xfd'=\x16\xe3\xcd>3\xeeM\xbd\xac\x89\xb7\xbd=b\x1e>\x07\x1c\xff\xbc\x1cZ\xdb\xbcl\xef\x04?9q\x18\xbe\xe0\x0e\xd9\xbdJ\xc6\xa6\xbeY\x95`\xbe;\x07-\xbem\xe5\\=\xec\xcb\x95>\xd0\x07\xef=\xf6\x9f\xfd=_\x8f$\xbe\x91\xb3D>\xfc\xdd\x17\xbe\xb3\xe8\xac\xbe|s}\xbe\xaa_\xc0\xbdv7*\xbd0J\x16<X\x03\t\xbf?_\xd6=\x82\xf1\x85>\xfd_\xd0>7~e>_]\xa3>\x96\xbb_\xbd\xdfjw\xbe\x8c\xf3?\xbe\x9b\xff\x88=D.f\xbe\x9d\xc9M\xbe\x91\xca\x96\xbdG\xec\x00?\x87\xd64=\xd0\xe0\xed=\xc9\x93*?\x0c\xb2\x94\xbd\x0c\xf6\x12?\xb8\xa7\xa6\xbe\x1ff&>T\xdb\x01\xbf\x92{\x12>\xea\xd6\xf8=\xcd\xf3\x8b\xbd\x17\x88%\xbfK\x9a\x19\xbfq\x92\xaa>|\xa6\x17?\x7fq\xa1>Y\x80,\xbeq\xbf\x1a\xbd\xe7.\xab=\x83B\xbb\xbeqG\x12?\x81\x11\x17>\xdc\xaf\xad\xbe\xa97\x00\xbf\xb9\xd9\xda\xbez`q\xbeh93\xbe]Y\t\xbec\xf8\xa2\xba\x89;\xfe;<\xf4\x1f>\xb1\xfbr>`]\x86>\xe4\xe9\xd5;O\xdf\r\xbd\xeb\xdc\x03?\xb6\x94\x8e\xbe\x92\x01\x16>\x80\xb2l=\x8fJ\xb0>\x8f\x0b\xb1\xbe&A\x1e?Zf\xed\xbd\xb6D\xdc\xbe}u\xbe=HX\xa4\xbevK1\xbeG\x11\xe2>)\xff\x13=\xb8\xba\xaf>\x07\x11\x97>_p >*dS\xbe\x9c\xaa\x94\xbdm\x86t>\x9c\xd9\x80>\x04\x95p>G\xa0\xee>3\x11[\xbe\xf7b\xd1=\xd7\xfd\xcf>dt\xbe<-\xb6`\xbc\xe3\x1a\x0e\xbf\x0cCi\xbcl\xf9\x99>[k\x85=\xad\xf3P=\xe7\xcf\x8f\xbcW\x92\xdb\xbe\xcatP>\xfc,p=\xf0>\xbe\xbc\x08\xea\x17?|\xfd\x8d>Ym$<\x9a\xe2\xeb=\xbbC\x80<=g\xba>,\x8b\xb9\xbd\tk\x04>\xa9A\xb4=\xf5V\xb9=k\xb4\x00>\xff\xa7\xa3=\x93\xa5R=OU\x8a<\x93JS=}\xb1\x06>\xff(\x8b<\x00\x08i=\x01\x17\xc5\xbe\xba\x9bm\xbdD\xb2\x97\xbe.\x19\x84>s\x96\x86>=q\xec\xbe\xfc\xf5\xf5>\xb7~\x08>7\x08\xfe=O\xe1(?h\x08)\xbe\xb3\x05\xc7<\xb9\xbf\xa9\xbdN\xc94\xbe\xe0\xc9\x93>d\xf7\x12>a\xc7U\xbb\xea\r\xd1>q\xca\x8d\xbe\xc8`\x87=\xd4\xbb\xd1=A}\xe7\xbe\xda\xb1[\xbey&u\xbe\x8fb\x10\xbfP7\x82\xbe\x81J$>\xc9\xcc\xbf\xbb\x16a\n\xbf\x9dH\xd1>\x1f\xb5g=\xdf\xdf(\xbe\x07(\x86=\xbc\xed|\xbe\xb1X\x88\xbe>\xb5\x1f?1\xd1\xfb=\x01(J>%\xd9\xa3\xbeCA\x1f\xbf&\xf5S>A\x0bY>\xdf\xa7\xc7>\xf1Q\x19=\x93\x9c\xa0\xbe\xa1 \x14\xbe'u\xf7>5\x85\x8c\xbc\xc9\x08\xa4>2K\n>\xd1 m>\x8e\xaf!;\xbf\n\x8e>\xe4\x1d\x8d<i\x87L>\xc5\xfb\x9d=\x15\x949?\x07\x97\xc1>\xaf\xb8\x8a\xbd\xdfu\xaf\xbaG\x1a5>\xb1Y\xc7="
-p384
-tp385
-bsV445268221542010880
-p386
-g2
-(g3
-(I0
-tp387
-g5
-tp388
-Rp389
-(I1
-(I200
-tp390
-g12
-I00
-S'>}\x13>\x10\xe6M\xbd\x8e\xd6\x95\xbe@"p=3\xd4Q>\x94H\n\xbe\x90\x00\xbb\xbc\xd8\x13<\xbe\x1c\xbe\xd0\xbdR\x9a\x10<X\xf9\xd7=\x0eI\xf9=xH\x1b>\x90\xf9\xcf=\xd4f\xe9\xbd,\xf2D>\xb2\x83z\xbc\x11\xd6\x1f\xbcIkN\xbd ;\xd3=\xc0\x05<\xbe\xc2\xa8\xb5\xbc\x0b\xef@=\xc6z\xaf\xbe1\xb9\xa9\xbd\x9a\x8e\x1f\xbdT\xe3\x13>\xb9\\e\xbe\xcfZ\x15\xbeNo\x84>\x8cR\x96<\xc0%\xff\xbdGS\x1a>2u\xd9\xbd\x88\xaa\x89<\x87\xa1N>\x81E\xf7</\x92\xba=@\xbcw>\xb4\xd9\xac=\xe0\xa8\xb5\xbb\xa05[\xbb\x1c?r>>\xc6\x85\xbe:\xca\xba\xbd\x98\xff\x0b;bH_>\xa1\x1fW\xbc\\Y\xbf</\xda8>\xa7\xf6\xad=\x155\x88>77\x89\xbd\xdb[\xfd\xbc\xbc[\x93\xbe\xbd\xe68>bn\x05\xbd\\\xb0\xdc\xbd$8\x8f\xbe\x8a\x16\x87\xbe?r\r>B\xeex\xbd\x8a\x11\xe9\xbd\x8b\x95:\xbe\xb9f\x9b\xbc\xff\xfb=>\x9f\xdf\xa3\xbd\xa4\xcd\xe8<\xfc6\x98\xbe\xe3\xa3r\xbc|\xfe\xde\xbe\x87\x1d4\xbe\xdf\xb52=\xb6\xb4\x8d\xbd\xe8\x01Y\xbd\xd8\xc6{>\xa9\x97\x83>\xc0\xc5\x94=\xa4\xb0g=\x16\xd0\x0b>J*\xa7\xbd\xeb\x83/<\xb8o\xbb=\xf02$\xbe6\xed\xdd=\xe8\x9b\xb0=\x97\xd5^>\xb4#s\xbe\xb2n\xb6>\xbc\xa9\xcc=-\x8b\x93\xbd\x8b\xde\x1f>@\xc2Y\xbe\x9f\xcd\xd0=B(z>g\x80(=WF\x92=Q\xdd(>\xdb\x94\xab=\x88K\r\xbc~\xcc\x16>\xb2T\x86>i~H=\xfb-\xd6=BQ\xa6>\xff=\x0f\xbe\xce\x94\xb7\xbb\x08\xddW\xbd\x11Um=|\xfab<\xb1\x9d\xad=EV\x8e>DA\x9a=\xcai\x16>D\x95\x1f\xbd\x87\xd9\xa7<\x91\xa4;\xbev/x>\x8c\xf0P=A;\x08>8d\xc0>\xb8\x95\xdd<\xb0\xd7\xe8\xbb\x9d\xd4\t\xbd\x0f\xae\x97\xbc\x8a\x04%>\xac\x84\xd8\xbd\xab\xcf\xcb\xbc\x80\t\xbb<\xa5O\x9f=y"\x91<\xa8@\xa7=\x00\xb6\xc6=\xb4\xe5\x16\xbc\x04\x8a\xa7=\x1e=\xa2=\x14\xa3i\xbd\x98BN\xbcs\xcf\x16>\xfb\x0b\xae=\xa5\xaa\xac\xbd\xac\xe3\x9c>\xa8\xf2\xb4\xbd\x06^B\xbe\xcb\x0f\xe9=\xb6\xc0\xe9\xbd\xd2\x17*>\xb0u\xac=\x00\x90\xf0\xbd|\x18\xe7\xba\x0f<\x08=Ey\x9c\xbd\x94\xb0+>\x04q;>Oi==F\xbec>\xe9x\x8b<u\x08\xe9=20u=v\x7f\xcf\xbdg\x1dM>\x92\r\x1c\xbe\xbcJ3\xbe\xc0\xd6c\xbd\xf1f\xc3\xbd\xda\xeb\xaf\xbd\xa8ky\xbe\x92V:>\xa9\xda\x89\xbd\xda$O\xbd\xc7\xd6\xba<!u\x04\xbeR\x948=w\x89\x93>6%\x16=\xe5\x96\x83\xbdY\xach\xbeX\xed-\xbeP\x812\xbc<\xe0\xcb=\xdc?.>\xcc\xe9\x12<H\x1d\x8a\xbd*V\x00=\xf9\xd7\x07>\xfe\x15x;z\x88\x16>c\xa3\xac<=\x84Z>\xb6\xdar\xbelD\x0f>+\x91\x8e=\xc6\n\x9c=\xf0"@>\xfa\xf3:>\x9e\x8bP>\x90\x14\x08>\xa4\x9e\xb5=\xb8\xc6\xcd\xbc\xe3\x93\x0c>'
-p391
-tp392
-bsV445887808964927488
-p393
-g2
-(g3
-(I0
-tp394
-g5
-tp395
-Rp396
-(I1
-(I200
-tp397
-g12
-I00
-S'5C\xdb>\x1d}\xb7=\xc7.\xdb\xbe\x03\xa0\xdf\xbcp I>\x8fJ\xab;\xdb"\xa8\xbc\x16P]\xbe\xf1\x8e\xc3<\x83+9>\xa4v(\xbdwC \xbc\xcfo\x05>\x8b=O<\xcb\xf2r\xbc\xea\xed\xab>\xde#\x8d\xbd\x93\x15\x83\xbd\xfcaR\xbe-\xf0\x8f\xbd\x03\xf5\x17\xbeU\xd0\x90:\xf1\x92\x8a>\x84tT\xbcf7;=\xe4\xb0\xe4\xbd\xc9Y\x18>b\xa3\xb6\xbd\xcd\x17\'\xbe\x12\xfb\x81\xbd\xb3F\x94<\xbb[\x93\xbdO\x93,=\x9b\x94\xbb\xbe}+\xba<`;a>Z\x10l>\xdb7o>\xfb\xe1v>~\x02%\xbdo6%\xbep\xc0n\xbd\x0er\xa8=\xb6H8\xbe\xa1\xe0\x18\xbe\xde(\xce\xbd4\x05\xb0>\xe6\xc3\x94;\xbbl\x92=30\xdc>\xd4\x8d:\xbc\n(\xd4>\x14ZH\xbe\xf5\x8f\xf4=\xf1 \xa0\xbey\x92\x05>\xaf\x03\xb4=\xce\xbc\xc0\xbd\x1c\xfc\xc8\xbe\xb0\x81\xd1\xbe\xea`R>\n\x17\x9f>5\x90\xa5=\x11\x1f\x1c\xbeG\xfa\xcc<S>\xba=\x16x\x95\xbe!\xfb\xa9>\xad\xb2!;\xe3\x8f&\xbe[\r\xdc\xbe\xe1\x84\xa4\xbe0+&\xbel\xc0\xc2\xbd\xfe\xbf\x07\xbe\xa7\x98V=+f@=Z\xa0A=@\x06Q>\x89>0>\xf25\xfd\xbc\xed:\x05=\xc6\x89\x99>\x04\xc0S\xbe!\xbb\xd9=\x930\xf6=\x16=\x8d>\x9a\xa4\x9f\xbeR\xe1\xec>\x97\xc2\xa3\xbdZ\xff\x9e\xbe;\xd8\xe4=\\\xa1\x8c\xbe\xbc`\xaf\xbd\xc0\xf2\x92>\x00t\xda=\x80\xaaj>\x01\xb5G>&+\xd8=\x95\xbeP\xbe\x8b\x06\xac\xbc\x90\x8dB>\xe2\x8c\xfd=\xc7\x9cV>\xeeY\xac>\xe1\xfe8\xbe\x17@\xf5<\xceS\x85>l\xe5\x1b;,\x8c\xbb<\xe5\x12\x9d\xbeW\xccm=\xc6d\x90>\xe4\xc3\xb7=#\xfd\xe2<\x86l\xac\xbd3\x0b\x98\xbe\xd6bF><6\x8c\xbc\xa9e\xc2:\x94\x06\xeb>\xe9r\x08>\xbd\xfcO\xbdb\xd6\xb4=\xc1\xe8\x15\xbc\xa9\x11l>\xdes\xc1\xbd\x9f\xa9\x97=\xdb\x1f!=\r\xe7\x89=\xc2\x1a)>\x87\xb4\x08>\x1a\x08\x1f;b\x19Q=Im\x95<\x9e@\n>7\x88\xa3\xbb\xb3\x12J=g\x1fX\xbeu\x1f\xb2<\x1e\x9cF\xbe\x03js>jy\xcf=@\x84\xb2\xbe\xdb6\x98>\x06\x8d3\xbc\xcf\xd2\xa2=\x84^\xdd>\xd6\xf3\x8e\xbd\xf1D\x05\xbcK61= Y\xcd\xbdv\xady>\xf4-\x0c>\x12\x02\x11=\xd0\xc3\xa7>$\xaa@\xbe\xd3\xcd\x12=\xee\xfd\xd7=\x11\xa7\x97\xbe-.\xaa\xbdy\xe2J\xbe\x9d\xd2\xc1\xbe\x9c\xd0P\xbeq=\xf7=\x06[~\xbd\xf7,\xc5\xbe\x06\xf9\x8e>\xa5\x1d\x92=\x07\xa3\x91\xbd@\xa7v=\xfb\x1f6\xbe?43\xbe\x0c\xce\xd3>N\xa9\xec<3j\xe5=\xf3\x18n\xbeRk\xed\xbe\xba\x95\x1c>J\x89\x1d>\xe4\xf0\x99>\n\x93\x07\xbd\xf6w2\xbe\xd3o\xaf\xbd\x02\xd1\x92>\xf7\x1a\x0b;\xba\xd6\x80>R\xe6\xa3=s]h>Jt)\xbd\x91\x1f>>\x83+\x13=1\r,>B)\xdb=\xb1M\x02?\xbao\x94>Bh\xa4\xbd\x9a\xac?\xbc\xba\xcf\x16=$}k='
-p398
-tp399
-bsV445261535623925761
-p400
-g2
-(g3
-(I0
-tp401
-g5
-tp402
-Rp403
-(I1
-(I200
-tp404
-g12
-I00
-S"~\xa0\x86>\x07d\xc1=\x00Ya\xbe\x1aa\x11\xbc\xe3\xf2\xba=S\xe3\xa0< \xec\n\xbd\xcb\x9d\x1d\xbe\xee\xfd\xca\xbc\xcb\xbcA>M3\xe1\xbc\xf2\xda\x92\xbdv\x03\x8e=\x8a(\\<\xf6\xd0\x85\xbc[\xc6Q>\xab7\xab\xbd\xb0\x9f\xdc\xbd\xf2h\xe3\xbd\xb8\x03\x8f\xbd\x86\x95\xa0\xbd\x0e\xe1\x81;9w\x0c>\x86\xc3/=kTJ=\x95ME\xbd\xb8/\xa8=\x01dG\xbd\x1a\xac\r\xbe\xec\x98\x98\xbd&\x19\x86\xbd\xdd\xb5O\xbd\x00Dz=\xe5\xe1i\xbe\xc3wP=E\x86#>z\xbf\x14>\xca\x1e\xe2=N\xf7!>\xe6(a<\xb3b\xa0\xbd\\o\x94\xbdpk\x93=sY\xf7\xbd\xd8r\xd7\xbd\xeb\xea\x88\xbc+]Z>\xee\x1f9=\xba\x18?=\xa6\xf0\x94>v\x1aJ\xbd\xe3<y>\x83!\xbd\xbdf\xbd\x1a=\x12\xbe\x8c\xbe\x0b\x89(=\xa5gW<\xablK\xbc\xf1\x1f\xb6\xbe34\x88\xbe}~\xfd=\xf8n^>\xde\x1f\x03>\x13\x94\xee\xbd\xc3\xef\x1b\xbd\xefR\x92=\xd2m$\xbe\x8a\x9aW>\x06c\x1d=F\x19\x01\xbe\x13\xb8\x93\xbe=\x17g\xbe\x83\x16\xe2\xbdj=\x8f\xbd\xad.\x80\xbd]\x8d&=\xb6\xa0r<\xc6\x88\x9e=\xfd\xc4\x19>@\x05\xc4=\xc0$\xfe\xb9\x9c`\xba\xbc+\x11\x82>\xb2\xf8<\xbe\x02;\xcf=\xcdv\xdf<\x1a59>g\xaf4\xbe\x1a\xc3\x8a>\xa2\x89.\xbd.\x17\x0b\xbe\xa31b=z@\x13\xbe\x1a\x89\x8f\xbdK*2>\xaf\xa6\x8a<\x99\xd8\x10>\xfa\xff\x17>]yB=~=\xe1\xbd\xdb\xc2A\xbc\xb0*\x13>\xc2\xa2\xc6=\x86\x99\xa4=\x84\xfe\x8b>2\x86\xe7\xbd\xfe}]<\xc6\x9f!>-i&<a\x84\x8b\xbcj\xa7g\xbe\x93J\x7f=\xc0\x91>>\xbb&\xcc=8\xdaq=\x8a\xe9\x13\xbd\xd2\xac2\xbe\x00\xf4\xfe=\x06\xf0\xb4:\x0eC'<\xe7\xe0\x8f>\xdd\xa5\xd2=\x85}\xf1\xbc\xe6\x18X<[\xda\x16\xbd\x0bM\x01>\xcc\xbd\x17\xbd,C\x99=\xd5\x8c`=\xc3 \x86=\xca\x91?=\xe6\xf1\x10=\xb0@\x11\xbb\x85\xa9\xbd<\x94&\x9e\xbc3\xf6r\xba\xba\xe6\xc9\xbc\xc3\xc4\xbd;\xbd\xf9\n\xbe\xed\xe4~\xbb\xae\xa2\xea\xbd\xc3\xf0\n>\xb2P\xcd=^\xa2L\xbec\rr>\xb5\xb5\x97=\xed\x8f(=\x19\xce\x90>\x98\xff<\xbd\xaa!\x99\xbc\xa6\x92\x078\xb6W\xc4\xbd\xeak.>x\x12\xe9=/w\x06\xbd\xfd\xbcK>-\xc9\xe0\xbd\x0bG\xe4<\x16Wp=\xb2\x8f^\xbe\xb7&\x9f\xbd@j-\xbe\xf6\x8c\x86\xbe\xb8\xb3\x06\xbe\xe5\x175=\xbe\xd1\xc7\xbcXq_\xbe\x0cVC>p\xed{=6V\x8a\xbd\xd2\x91\xda\xbcX\x84\x0c\xbe\x90e\xfa\xbd\x15\xa7\x8c>i\x87\xc5<\x1aW\xaf=\x8e\xaaS\xbezC\x97\xbe\x93(X=\x9e\x92\x9e=+\xbf5>\xbb\x85\xfc\xbb\x8a\xc8\x02\xbeB/\x93\xbd\xd2\xcfU>\xc5Hy<&g\xac=\xbd\x19\x0b=\xd2?)>\xf6\x1c\x8d\xbd\xc6\xde\xf4=\\\xec\x80;\x9d\x96\xd9=\xbd\x8f\x02>\xd63\xa9>F\xdb]>g\x91\x1c\xbd\xda\x01\xc8<\xa9\xe4\xa2=\x9aJ\\="
-p405
-tp406
-bsV446177096948125696
-p407
-g2
-(g3
-(I0
-tp408
-g5
-tp409
-Rp410
-(I1
-(I200
-tp411
-g12
-I00
-S'\xaa\xfd\x11?\xcf\x0b\xe9<7\x96\x18\xbf\tyt\xbdP\xf2N>b\xf4\x03\xbe]@I\xbd\x89\xcfg\xbe\xecZ\xab<\xdd\xbef>[\xac\x8f\xbd\xc0\xe3\x8f\xbd%\xb1\x99=\xc1\xda\x10\xbe\xd3\xde\xf6\xbd\xaf\xba\xaf>\xe94\x1d\xbdc\xa3;\xbd\x96\rd\xbe\x03\xff\x02=/p\xa5\xbe\x885\x9e=\x03>\x0b>\xa9\xf06\xbe\x01\x19\xbe\xbd\xe7\xac\x01\xbe2}\xb5>s\xac\x00\xbeZ@\xd2\xbe\xebT\x8a\xbdy#\x17;t\xfd"\xbd\x04\x05\xc1\xbc-+\xc8\xbe7\x08k\xbd\xd6\xcd\xd6>&\xdeu>\xd7\xa2O>\x1f\x9f\xff>\x9f&\xd6<?\x9dt\xbed\xa9\x91<\x8e\x8d\xa5=W\x83\x80\xbe\x14\xfa\x9a\xbeD\x8cQ\xbe\x8f\x87\t?<\xea\t=\xfc`\x97=c\x10\x19?\x813\xa9=\xcc\xf5\xf6>\x8aY\xbd\xbe\xacp\xfc9a;\xc1\xbed\xa8\xa7>\xf4\xc0t>\xc3|\xb5\xbd\x91\xa4\xeb\xbe\xc2\x81\x04\xbf\x087\xaf>\xccW\xf4>I\xff\x01>\xec-"\xbe\x1c\xf2\xe4=\x1e\x1d\x84>\x9a_\x83\xbe\x01Y\xc0>\xb4\xba\x9b\xbe\x03A@\xbe\xf9\xe3"\xbf\x9d\x95\xe9\xbeld\r\xbeI!,\xbe\xa6\xd1\x96\xbe\xa4\xa6\xb9=\x94\xe0b>\xe9\xc2D>Fps>\x9f\x0fq>tC\xc3\xbc\rz\x07=\xc7\x03\xc4>\xd4\xecx\xbe\x9fy`=5\x08\x06>\x17u\x0e>\xc1\xe7\xc9\xbe\xe7k\x11?\xc2\x85$<+\xfa\xb8\xbe\x14c\x92>\x87\xa8\xce\xbe\x89\xf9w\xbcJ,\xc2>\x9b\xb6\x00>"\xa3\x95>\xbc\xdcR>\x98\xd96>\x8f\xbc\x0b\xbd\xf9]S\xbd\xc5"\xae>\xd7\xc12>\xd6?q>#>\x90>\n\xc4\xf0\xbe\xb8\x92\x8b=\xac<\xba>y\xab\xa4=`\x0b6\xbc9P\xce\xbe\xbcR\n\xbd\xd1L\x96>?\xbbu>t\xf0b>\xf4\x80\xd3\xbc$\x85\x14\xbf\xd4\x1d\xb4>V\xace\xbd7\xd5X=\xc1\xb2\xf7>\xa8<\x97>\n\xa7\\\xbe\xdf\xf1\xd9=\x80K\xac\xbc\x1d\x9c\xb9>\x1f\x00\x9e\xbe\xec\x8fD\xbdi\x86(\xbd(\xcc\xa0\xbc,W\x06>\xb6\x16\xc2>$\x11\x0b>\xceo\xa6\xbc\x17\x986\xbd\x82[\x0b>y\xdb\xc3\xbd|\xb8\x84\xbd\x0b\x1c\x82\xbe\xdf@\x10>ex\x93\xbeQ\x11r>\x12\x1e\x91<\x1a\xf0\x17\xbf\'?\xa7>\xdc\x8c\xc4<\xa7\x13\xa4>\x94\xfd1?-\xb5M\xbe\xf4\xde\xb9\xbc\xa9\r^\xbb\xcc\xce\xb5\xbd\xa35\xc3>p\x1e\xa6>\xdf\xd8k=\x1cg\x06?wm\x1b\xbe]\x7fJ>\x856\x15>w/\x89\xbe\\o\x0f\xbeY\xe3r\xbe:\xfe\xe0\xbeQ\xf7\xd2\xbe$\xd5N=\xbfz#\xbenw7\xbf9\xdd\x92>\x1a(\xdc=\xba\xae\xde=\xacS*>\xd7\x1du\xbe\xc6\xc3\xec\xbd\xb3 \x1c?I`:>\xe38o>\x08\x8d\xa9\xbe\xe2\xbe\x1f\xbfa\xab\x91<\x87\x84f>}\x17\xcb>\xa1\x16\x91\xbb\x9e\r\x91\xbeOw\xa0\xbe?\x85\xe2>\xf1\x06\x14\xbe1\xf2\xc3>@U\xf0=2\x1c\xa6>\xf1\xd7\xbb<D\x98I>\xef\r\x85=0\x07\x99>\xa4u\r>\x7f\xac\x14?\xac\xec\xe3>0|\x1c=\xe3\xd7\x98=}\xef\xdf=p\xdf-\xbd'
-p412
-tp413
-bsV445259011823136768
-p414
-g2
-(g3
-(I0
-tp415
-g5
-tp416
-Rp417
-(I1
-(I200
-tp418
-g12
-I00
-S'\xf6\xd48>\x1aQ\x16=\xd5Od\xbe\x91@p<\xd2/\xfa=\xb4\xd3\xd5\xbc0e\x7f\xbc\x94,\x0b\xbey\x1a\r\xbd\x94r\xe1=\x9e\xe9\x9e<\xd5\xd3$\xbc\xcf\xb1\x9f=j\x9aN=\x1cs\x93\xbd\xe0%%>\xf1\xbb}\xbdO\xba7\xbdi/\xb9\xbde\xac\x93\xbcjO\xb3\xbd\xca\xea;\xbbBM\xc6=hV\x95\xbd\xbeH\x00<,\x05j\xbdL\xbe\xcd=\xf0\x8c\xb8\xbd\x8f}\xe8\xbd\x05\xa1\xaa</\xb5W\xbdF\xb2\xa1\xbdV\xd5\xa3=\x12aB\xbe\xb1(,:\x9eM2>\x91j\x95=@@\xd4=\x99\xef.>\xe5\xb9<=\xc7g\x1f\xbd/\xe0\x07\xbdg\x88\xe7=\x8e\xab\x18\xbeP%\xd9\xbd6_\xbe\xbcK\xf0J>\x0f$\xd2;\xd2\x8f\t=B\xa3t>E\xd1\xfa:\xcb\xcek>.}\x8c\xbd\xfc,\xe5<L\ro\xbe\x92\xd9\xba=\x1f\xb4\x0b\xbc\x999\x9d\xbd.\xde\x81\xbe\x06\x80\x80\xbe\x87\xa5\x00>\xda\x03\xcc=\xe1\xce\x91<^\x9d\xe2\xbdo\x15_\xbc\xa2\x0c\xd7=)\xbc \xbeA\x8c\xd2=\nh\xac\xbd\xa0?\xb9\xbd\x8a\xee\x99\xbe\xe6\xc0*\xbe\x86\xd8\xd4\xbc^\x99\xb3\xbd\x1c\xe7\x9f\xbd\x91\xc4\xbd=\x15\x19\xc6=1\xe0X=\x8c\xc3\xe9=\x1aC\xb8=T\xa4&\xbd\x11\xb4\x8a;\x1e\xebN>\x0f\xd6\x0e\xbe_\xbd\xc9=\xc2\xae\'=\xb7\xe1&>\x8aBV\xbe-\x1b\x92>\xe5\xcd\xb3<\xf9\x00\xf5\xbd\xc4\xa9X=\xd9,"\xbe\xe4j2<\xe6yF>I\x94\x13=\xc5\x08\xb1=f\x81\x07>\x0bd\x93=\xf1C4\xbd\xf1z\xdd<)\xfb?>60\x85=\xb5\xf6\xae=N\xe2o>\\\xec\x03\xbe\x89_\xaa<L\xd3\x92=\x04\xec:=\xa2\xaaR<\x02\xa5\xcf\xbdD\x80\xcf=\xbf\xd1\n>"v\xc3=`\xfd\r=*|P\xbc\x00\xc1=\xbe\xa4\x1b:>T\x9a\xed\xba\xaa\x0e\x0b=\xf9\xa2\x88>vB\x97=\x9eW2\xbd\x7f\xac^\xbcL|Z\xbdY\x02\xf3=\x04\xdbD\xbdv4\xbe;\xbf\xb67=\xa4\x959=\xa7qV=\xec?\x8d=\xe5W\x18=\xbb\xc0\xaf;\x91DR<\xb4\x0bU=\x0e\xf0?\xbd\x8f\x19n\xbcQ\xcf\xaf\xbcOqu=\x02l\xcd\xbd\xd4}4>\xac\xfb\xac\xbb\xd9\xe9E\xbeG\xa0$>\xab\x93\xa5:\xaa\x10\xc6=R\xabM>0\xa2g\xbd\xfe\xef\t;ly\xec\xba\x0e\x90\xbf\xbd\xa2\x03*>\x89\xac\x13>%\xe2W<\x0e\xc7O>\x8b5\x96\xbd\xe0\xce}=\xfa\xda\x83=\xd7\x17\x0f\xbe\xa6\xbdt<\'\xda\x11\xbe\xee\xfbS\xbej\xaa\xf6\xbd\xc6E|\xbc1\x15a\xbd[\x07w\xbe\x90h->\'\xaf2:\x1c&\x04\xbd\x01\xf2c<40\xe2\xbd\xc9\xa5%\xbd9\xad\x82>b\x98\xb4<\xe0\xe8/=@\xadA\xbe\x19\xcfa\xbe\xdd\xcb\x9a<\x9e@\x89=\xfe\x1fB>1\x8a\xfa:\xc2-\xa3\xbd\xe0\x13\xf4\xbc\xaf\xa6&>*V\xf4;@\x9b\xd5=\xb7\\\n=\xc9N\x1a>\xb1\xc0\xc8\xbd\xbc\x96\x01>&\x03\x16=\xdb\'\xe3=\x81T\xec=\xfe\x01\x90>\xa2\xae?>\x01\x0c\x18=9\xd9G=.\xc8)=b\x80\x99='
-p419
-tp420
-bsV476511152080293888
-p421
-g2
-(g3
-(I0
-tp422
-g5
-tp423
-Rp424
-(I1
-(I200
-tp425
-g12
-I00
-S'\xc7S\xfb>\x80\\\x9d=G\x90\t\xbfA\xe3\xb9\xbdC\xbdq>\xe3\xcbz\xbd`\xdf\xd9\xbc\xcd\x13\x87\xbe\x92{\xcb\xbc\xe9\x974>\x83\xb0\xdd\xbc\xe2\x90)<Nig>D\x82\\\xbd\xe2\xef^\xbd\xce\xec\xa5>\xa7jp\xbdD\x80\xd2\xbd\xc1\xa08\xbe\xda:K=v\xca\x95\xbe`\xb5h=\r\xdf?>\xf7\xa4Q\xbe\x04\xa0\xc9:\x94\x8f\x06\xbe\xe1gN>R\x11\xf3\xbd\x87H\x94\xbe99v=F\x91\x04>+\xf4\'\xbd\x06u\x16<\x99\xf7\x93\xbe\x89|\xe8<d0Z>\x82>7>\x8ayd>t\xa3\xc2>)\xf3\x1f\xbd\xf4\xa1\x0c\xbe\x06\xd2|<Y\x1b3>\xb0J\x8f\xbe\x17\x9c.\xbe\xd1E\xb2\xbd\xfe\xde\xe6>\xd692\xbdK\xa9^==\xfa\xfd>\xb4.\xb5=&\xb4\xee>\x07\x92\x82\xbe\xcb:\x99=\xb9a\xc8\xbed\x14y>k\x89\x10>\xa6S\xe2\xbc\xcf\xe4\xe8\xbe\xdf7\xd5\xbeze\xa5>wi\x9c>y\x1f?=\xfd\xb0\\\xbe\xef\xd3\x869\xfc\xf1\'>?\xacC\xbe\x8b\x05\xbe>\x14\xeaA\xbe\xf0K\x9e\xbd\xa9\x1f\x0b\xbf\xb4\x07\xc2\xbe\xd1O\xda\xbd\x05\xd7a\xbd\x0f\xddF\xbe\x01.\xda=\x0c\xa4\x08>\x00\x15\x00>\xae=\x1d>\xed\x0b$>\x14L=\xbd\x1b\x97\xbb\xbbn\xb5\x8e>O\x18N\xbe\xe9\xf9\xee=\xdb;j>\x90\x98\x8c>3n\x86\xbe+\xd6\xe5>\xad\xe4%\xbd\x05)\x97\xbeP\xd6l>\\[\xb6\xbeo\xbf\x00\xbd\xe6jp>\x00\xab\xd5=\xb1w)>\xe1$\x88>\xaa\x80\xb8=F\xe2\xd9\xbdJN\x85=\x93\xddu>%]\x1f>g\xd9O>>\x8b\xad>,3y\xbe\x80\x975=\xd2/\x88>u\xca\\\xbck5\x7f\xbc6\xd2\x89\xbe\xdb\xd0&>\x1du\x96>$4<>VV\xb7<\x0eh\x16\xbe\xcaT\xb2\xbe \xd6\x96>L\xb3:\xbc"1\x0b>\xf6\t\x07?\x00\xaf\xfb=\xd6\xa2\x07\xbe\x82\x03\xee=p\xdeH=\xac=\x86>\xab\xb0>\xbe\xd1\xb4\x9f<U\xb3e:\xcd\xf1\x89\xbb#\xd91>OAY>e\xc7==\xcb\xd6;=o;!=\xe5 \xe2=My\n\xbc\xfd@1\xbd\xe5N\xdc\xbdD\x0e+=>[V\xbe\x16@~>q\xa2\xa4=\xfb\xbe\xd8\xbe!\x84\x97>^\x11\xce\xbb\x1e\x9dl>\xf5\xc2\xc0>e\xbb7\xbef\xa0\x97\xbdJ\xc3}=1\x7f\xcf\xbd\xb1\xc4\xa0>Vdm>)\x02\xe4\xba\x06\xd7\xba>\x13[\xa3\xbd\xbf\x83\xbf=`\xd1\xc2=\xc2r\x98\xbe\xbfg>\xbc\x97+q\xbe?\xa5\xa9\xbe7\xd6C\xbe|\xfa\xaf=F\xe9.\xbe\x9c\xd1\xf2\xbe\xca[\x87>\x90B\xde=\xfaT\xea\xbb\xde\xb1\xb2=w\xcc!\xbe\xf3"\xec\xbdki\x02?\xc0*(=c` =\xb7\x07\xa4\xbe\xaf\x8b\x07\xbf\t\xd9O=?\xeb,>\xbba\x87>6+\x93\xbd\xef\xb6w\xbe\xb5\xd0c\xbe\x1cH\x7f>\xb2w\x89\xbd 4\x92>\xf99O=\xc3\xe2\x9f>i\x82\xdb\xbd\xe9AA>\xe5\x1f6=@\x9c}>\x0cQ!>M\x9a\xf6>\xe6\xa4\xb5>\x82:\xbc\xbb\xac\x85$=\x7f\xa3\xaa<|V\x0f>'
-p426
-tp427
-bsV445262404361142272
-p428
-g2
-(g3
-(I0
-tp429
-g5
-tp430
-Rp431
-(I1
-(I200
-tp432
-g12
-I00
-S'G\xfd\xd2>(\x92u><\xf1\xe1\xbe`\xc9@;v:<=\xbeo+\xbdMP\xd7\xbd\xa8\xd9v\xbe\xb0\xcbp\xbd\xbd{\x8a>g\xf0\xf0\xbd\x89\x02f\xbe\xd3\xed9\xbd\x8d\x97\x16\xbe\x12\xaf\xd3=\x04h\x98>,\x96\xdf\xbd\xe7F\x97\xbe\xfd\xef(\xbez\xcex\xbd\xda\x94)\xbe\xac]f\xbd\x08\xd29>7\xc0\x17>j\xb5\x0c=o\xd5\xae\xbc\x17\xb2X>{\x9fY=\x97V\x8e\xbe\xb6Z^\xbe\xa6a4\xbe\x07\x7f\xb0\xbc\xef\xb5\xa5\xbcdz\xb5\xbe\x95\xb1\x9c=c\xfc\xa6>\xc6\n}>AM?>,\xb0\xa0>\xd2\x1e\xa3\xbc4\x8a\x81\xbe\xf5Y\xd4\xbd\xe6\xf1\xd2\xbc5\xdf~\xbd\xb8\xdd\xa4\xbe\x80x\xa6\xbd\xd8u\x9c>\x1cb\x19>&\x81\x02>\xebJ\xf4>By\x85\xbd\x8da\x7f>\xac\xee#\xbe\x08\x1ac\xbds\xf9\xc7\xbeW\x02\xee<Q\xa1\xb4=\x82\xe4p=\x18\x8d\x0f\xbf\xd20\xcc\xbe\n\xd9\x1f>\x87a\x11?\x95\x9a\xa8>\xd8\t]\xbe\x89\x15\xb9<\x9d\xf7\xeb=4BA\xbep\x8f\xd1>)m\xdb=\xa7>c\xbe\xa1J\x01\xbf|x\x04\xbf3\x08\xbe\xbef\xbcN\xbd\xfaj\x1b\xbe\xaf\xa3\xb9\xbb+\xb9\xa1=\x88\xa2\x14>\xe1\x8c\xb9>\xc9M5>\x04\xa8\xcf=\xd8\x13\x01=`\'\xb1>\xfe\xa6\xac\xbel+\xaf=@\x13\'<@\x0c\xf8=H"\x82\xbeHf\xc1>\xdc)%\xbe\xf8LU\xbe)\xe6y>M\x98*\xbe\x98\xaeQ\xbe\xf5\xd8\x14>\xcfb\x1e\xbc\x10\\\xa6>k\xd7(>\xd1\xb4\x98=\x185\x1c\xbedVZ\xbd\xf3n[>\x98\x06\xdd=\xb5\xda0>^\x1c\xe4>\\Z\xb9\xbe\xdeMh\xbdv\x0f\xca>sB\xee<\xbel{\xbd\x97\xae\xf5\xbe\xd0\x98V\xbd&\x8b\xbd>r\xd2\x97>\x18\x9b_>tX\xa1\xbd\x05n\xc7\xbe\xc9C\x05>\n\xb3\xc6\xbdf+\x0c\xbc\x97\xec\xd7>c\x8em>\x00\xc6\xc9\xbd\xcb_\xb1<h\x7f\x14\xbd\xa1n4>\xae\x8b;\xbe\xcce#>\x08\xbd==\xa9!\x1f>\xef\xbe%=\x84U@>\t\xe8\x0c=\xf3\x16\xf0<\xbc\xadi\xbe\xda\x8fq\xbd\x93\x8f\xd2\xbd\xf9\xa8N<\x1c\xe5\xc6\xbe\x0eN\r\xbduXY\xbe)\x99W>H3N>\x94?\xcb\xbe\xb7\xcc\xce>O\xff?>\xf4\x06f=\x91\xb1=?\xd5\xd5\x96\xbd\x98\xfa\xdb\xbc\x045\xad=\xd5\x9e\xe8\xbd(\xb0\x93>w\x0b]>2\x13\x06\xbe8*\xc7>\x8e\xdb\\\xbe\x16r\x1c=\xea\xab$>\xb6\xd4\xbb\xbeM\xbb\\\xbe`\x9d\xa6\xbeH\x82\xe2\xbe=\x86\xab\xbe\xd8/\x89=\xe6\xa2\\\xbd0\xf2\xc4\xbeV*\x9b>X]w>x)\x90<\xe0g\x80\xbd\xcc\xb3\x8e\xbeS\x07\xa0\xbeN*\xa8>3]P<\xf9\x88\x85>\x08\xeb\x8a\xbe\x0e\xd4\t\xbf`\x8d\x0c>\x14g\x10>\xfa\xc1u>K#\x11\xbdw\xbf~\xbe\xab\xfei\xbe\xfa)\xfa>\x11\x90\xaa\xbd\xf8A/>\x92\x88\xd7<\x89}\xa3>\xa12\xc5\xbd\xf6\x83\x04>\xbcP\xf6\xbb\xc435>\x8d0\x84>,\xf5\xce>4=\xd8>\x15.g\xbd\xdeC\x8d=\xb1\x951>\x96\x18\\\xbe'
-p433
-tp434
-bsV445259180543184896
-p435
-g2
-(g3
-(I0
-tp436
-g5
-tp437
-Rp438
-(I1
-(I200
-tp439
-g12
-I00
-S'Q\xb6\xe9>\x87\r\xf4=G1\xfb\xbe=\xa2\x00\xbe\xd7!\x05>3\xedG\xbd\xe4\x81\x04\xbd\x91_Y\xbe\x96@\x07\xbdb\x8d\x12>\xfdo\xfe\xbc\xfb\xe1\x9e\xbd\xb3\xaaO>\xab\xa3\xf2\xbd\xed\x96\xf5\xbb`\x11\x86>\x85)R\xbdM\x97\x14\xbe\x12|\x08\xbe\xf8\xc4\xb4=\xb9N\x86\xbe\xf3\xa6\x1c=y\xd6*>\xd7\x18\x06\xbe\xea\xf7!\xbdc3\x97\xbd\x10\x9a\x13>\x0bRk\xbd\xebE\x8f\xbe\xa9\t\x82<\xcda\xe5=\x0c\xf9\x0c\xbdR\xac\x81\xbd\x86NV\xbe\x86\x19\xb9;\x03\xdfb>\xc9l.>K\x06\x1a>\xed!\xab>\xed] =\x8b\xbc\xb8\xbd\xd5\x87\xd6;\xc7\xe1\x04<\x9e\x92\\\xbe\x92\x9f=\xbe\x93\x0b\xb0\xbd\xe5q\xe5>\xef\xd3E\xbd\x80\xc2\x93<\x07F\xe6>.\x05\xaa=a\n\xa2>\xd5&\x7f\xbeV\xbc\xae\xbc\x119\x89\xbe62^>ez7>\x81\x84\xb7=-\xac\xb1\xbeRN\xa8\xbe\x8d\xde\x92>\xd2\xf4\xb4>\x82\xfa3=\x1a\x92,\xbe\xcd\xa0\xdf\xb9YFG>q\xb8\xd3\xbd\x89\x9a\xab>?Nc\xbe\x05\xb5\xa2\xbd\xd9v\xd9\xbe\xd7\x01\xc6\xbeS0-\xbeNz$\xbd\x1d\x1a{\xbe0\xdf\xbe<~\xe5\xa1=\x92X!>\x8f\x01\xde=/\xe1\xd4=\x98\xf1\xbe<\x05m\xad\xbc\x0f\xca\x80>\'\xd7\x15\xbe\x0f\x98\xd6=q\x91\x82>\x0c\x86\x11>\xf3\x0bD\xbe\xa6\xb3\xa7>\xd1H\xa8\xbd\t\x97\x98\xbeV\xbf\x86>W\xb4\xa3\xbe\xbao\xa3\xbb\xc7\x96\xec=\xeb<d=\xf5\xdf\x0b>\xb8\xb7L>\xe1\x85\x03=\xd1\xe2\x05\xbd\nx\x0e\xbd\x17E&>\xd36\x16>\xd3F4>\xc5\xd6k>9\x10\x8d\xbe\xa0\xdd\xa2=\xcf\xbf\x9c>\xb5\xb7\xb7\xbc\xc8y\x8e\xbd"w\x98\xbe\xc60\xb3=\xb6\xdd\x96>h.@>R\x1e\xcd=\xea\x87C\xbe2\xa2\xa0\xbeJ\x18o>\xd2\xee\x9c\xbd+C\xdf=\xa7\x04\xce>\x97\xc1\x04>\x02\xb00\xbe7\xd1\xef=Z?\xef<\x13\xf1\\>\xc3R`\xbe\xc1\xa8\x0c=\x983\xb3\xbd:\xbf\xbd\xbd\xee\xa1\x1d>\xab\x8e\x9b>N\x9d\xa4<P`\x08<\x10\xefN\xbd\xaf\xf4\xc7=1\xdcI\xbd\xc8\x81\xcc\xbdf\x15F\xbe\xd9K5=v\xbf2\xbe\xc7o\x07>\x81=\x8f=\xe2\xfd\xcb\xbeg\xca~>\x85\xdd\xf89/B_>fM\xd2>1\xbfB\xbe\x93\x9c\x9f\xbd\xd1P\xca=\r\xa6(\xbd\x7f\xf2\xa0>\xa7\xf9r>7\xb9}\xbc\x1fl\x98>2)\xd0\xbc\xdb\xea\xa4=\xbb\xe3\xa4=\x11\xb0\x82\xbeY\xb9\xb0\xbd\xe5:\x19\xbeodZ\xbeA\xd7u\xbe>R\x89=\x80\x0fC\xbe\x9e\x08\xf0\xbe\x03\r9>kp3>\x9e7\x90=+\xb9\x9a=Oe#\xbe\xd71\x06\xbe\xb6=\xda>\xb3o\x89=\x18\x0e\x8a=\xc5\xd5\x81\xbe\xf2\xb2\xf2\xbe\x1e\xbb\xab\xbau\xd8E>\xd1\x13~>\xe15\x19\xbe0\xcdX\xbe\x0eZ\xaa\xbeZ\xcfj>Y\x85\x0b\xbe{\xb9\x99>g\xf0+<\xa4\xc6\x8f>\xbf)\x14\xbdw\x13\xc0=n\xb7\xfd<\r\xe1\x96>\x05\x0b$>y%\xba>b<\xbb>w\xb2x\xbd\x0e\x88\xaa=/\xe7\xca<fZ\xb5='
-p440
-tp441
-bsV445268270376288256
-p442
-g2
-(g3
-(I0
-tp443
-g5
-tp444
-Rp445
-(I1
-(I200
-tp446
-g12
-I00
-S'\xdd!\x03?{<X>\xb9\x8c\xd3\xbe7\x98\xc2\xbd\xdc1\xfa=\xbd\x89\xac=\x12E\xb8\xbd\xf9\x17d\xbe|\xf2\xdd\xbc;A\xb7>\x0e~\x98\xbd\xe5\xe2\x88\xbe\xf9\xf4\t>\x00\xb1X\xbd\x8bN\x1a<\x05\xc8\xac>n\xd7\x14\xbe9a\x7f\xbe\xbc\x1bI\xbe\xb1\xda\xd0\xbdDY2\xbeb\x9c\xd2<@\xfdV>*\x0bZ>%\x04\xc9=\xf5f\xb7\xbd\x87\xfc\x07>C\x06\x92<|\x0e\xa6\xbe\x0b\x93~\xbe3T\x1a\xbe|\xd2L\xbd]\x8a\x9b<\xa2\xa2\xc8\xbe\xa5\x81\xa8=\x1f\x11\x90>\x9f\x11\x89>|\x03#>\x1f\xe5\x82>UXz=1\xfa#\xbeB\x05\x9e\xbd\\\xcb\x80\xbb\xfc\xbd!\xbe\xcc\xb63\xbek\xc0\xb1\xbd\x0f\x0b\xda>{^\xac=\x9f\x9d\xd1=B\xed\x11?\x03\xc7\x9a\xbd\xe9v\xbe>\x01\nS\xbeP"H=\x00\x99\xde\xbe{\x93\x96=r\xeb\xc1=\xd2g\x93=Ew\x14\xbfs\xfc\xcd\xbe\xe6u\x82>J\xec\x07?\t\n\x82>\xc9\xeb/\xbe\\JO\xbdS\xc8\xdf=\xd4\xfc\x8d\xbe-s\xe5>\xad\xcd\x8c=$\x83`\xbe\xdb\x1c\xdd\xbe\xe1\x12\xd5\xbeO\xa3{\xbeL\xdd\x8e\xbd.r^\xbe\xe9q\x8b\xbd\xffy\x93\xbc2\xaa6>\xc6\x0f~>\x06\x8b\x06>f\x95\r=)\x9fX\xbd\xec\x0e\x02?`\x10\x98\xbe7\x9f >\x879\x12>N\xedE>q.q\xbe\xde\x8c\xd0>\xb8Z\x03\xbe\x1c\x94\x8d\xbe\x950 >\xe6"\x90\xbe\x03\xfa \xbe\xb9\xd7?>G\xee\x0c=\xeaWm>\x8f\x97h>\xf6o\x94<m\x8a\x17\xbeY\x82\xc7\xbdq\x95V>\xda\xc1F>&,">R-\xcc><>\x7f\xbeS\xe8\x84=3\x86\xd1>\xec>\xc9<W4\x8f\xbd\xb1\xec\xfc\xbe%{\xa0;\x1f\xcf\xbe>\xc4j\x17>\x1a\x14\x1d>Kz\xe6\xbd\x934\xaa\xbe\x00\xf7<>\xe9\x99\x87\xbdb\xbb\xe5</#\xdb>\x162C>o`\xfb\xbd<\xf2*=\xb5\xca\xe1\xbdyWU>\x94W\x12\xbe\x9eb\xa5=\xc2\'^=\x97\xc0`=?h\xd2=\xc9\x1b&>\x84_\xa9\xbc\xe7\xa8T=\xaa\x08\x08\xbew\x19;:S\xea\x8a\xbd\xee\xf1\xc2\xbd\x13\xf6\x9b\xbe\x81\xce\x10<\xa7\xf7X\xbe\xc7z\xa0=\x9a\x1d7>\xa1)\xbc\xbe\x8dH\xd0>N\x90R>\x92\xa0\xc4=\xc6\x04\x16?\xfa\x98\x00\xbe\x9f\xc5\x81\xbdB\x01\x99<$\x8d!\xbe\xdc\xfd\xbc>|#e>\x0b{\xe2\xbd\xfb\xa3\xb4>\xe0\xb03\xbe>[A=\xf5\xe9\xd9=\x84#\xc2\xbe\xaeZs\xbe]\xc9{\xbe\xed\xa6\xcb\xber\xcc\x98\xbe\xe5\xc2\n>\x8a\xa8\xb3\xbd\xe7z\xd9\xbe\xd1\xa9\x8b>\xc5$\'>\xa0\x1a+\xbc\x83\x8aE\xbd\x1a\x1dS\xbe02g\xbe#p\xe6>\xcf\xe9N=\x04\x17I>\x1d\x8a\xb4\xbe\x9c\xb0\x15\xbf\xe0\x98n=\xc9\xb04>\xeeQ\xa9>\xaa\xb8\x93\xbd\xb3\xc5\x84\xbe\x05\x07\x9c\xbe\x0f\x1c\xbd>\xbf\xeac\xbdS$\t>\xe1\xab\x17=q\xb1\x89>\xf3\xc6B\xbb\xf6\x01?>\xb7\xce]\xbd)ta>?\xce6>\xd9O\x15?\x97\x1a\xb5>\xce\xbc\xa0\xbd\xee\xdf\x9c=\xff.I>B"\xcc<'
-p447
-tp448
-bsV445257739292254208
-p449
-g2
-(g3
-(I0
-tp450
-g5
-tp451
-Rp452
-(I1
-(I200
-tp453
-g12
-I00
-S'\x99\xcd@?N~!>K\xcd\x16\xbf\x82\xcd#\xbe\xee\xcbH>\x00\xc3\x95=\xe4\x086\xbd!\x8a\x8b\xbe\x90\x94\xd8=\xb2;\x05?\xd3h\x1f\xbe\xcb\x049\xbeZu\xe8=p M\xbe\xfb\xf8\x89=\xb7Q\x08?\xfc\xceC\xbe\xcd\xdcM\xbeF@\xad\xbe\xe6kX\xbe\xa0\xdd\x8e\xbe\xa6\xdd\xd3=\x1eu\x90>R\x8dn>\xca_\x00>\x1a\xb8X\xbe1?\x9c>\xf4\x07\xad\xbd\xdf\xa4\xe5\xbe1\xe2\xca\xbe&T\x97\xbd\xec\xfe\x1d=\x04\x93\xb5\xbd_&&\xbf\x16`\xd4=it\xa4>\x848\xe3>\xe5\x98\x85>\xf08\xeb>\x02B\x0b\xbe\x1f\xb1\xc9\xbe\xe4\x88\xf6\xbd\xd4BH=W<0\xbe0\xed\x95\xbe\x92\xbf&\xbe\xac\x8e\x19?\x17t\xd5=\xc1|.>\xb1}P?&8"\xbdo\xfd+?\xe3\xe2\xd1\xbe\x1aQ\x17>\x85z\x1a\xbf\x92\x15Z>\xf4\x80:>\xe9\xf1*\xbd\xc0\x16I\xbf\x1c\x88+\xbf\x0bk\xd1>]xT?I\xa0\xe2>\xb9@W\xbe\x11q\x88=\xe2\x96\xbd=\xf5$\xd8\xbe\x82\xd6>?\xad\n\x1d>\xa0\xac\xa6\xbe[\x1a\x11\xbf\xee\x14\x16\xbf`3\x99\xbe|\xa4\x13\xbe\xee\xd2q\xbeO\xa9=\xbdb\x10\r=\xbe\xdd+>\x9c\xad\xaf>\xfa\x9c\x94>6\xa8\xec<\xcc\x98\x15\xbd\xb7\t#?$;\xc1\xbe<\xe0\xf2=y_g=\x1c\x91\xad>\xb4\x7f\xac\xbe\x04~*?/r\x1d\xbeM\xe9\xf7\xbe5\x13_>\x975\xaf\xbed\xefs\xbey\x9a\xe0>5J\x1c<Q\xaa\xc3>\x05#\xa2>nmY>D\xc7t\xbe\xfaC\xfa\xbd\xee\xc6p>=\xf7\xa2>\x87\xad\x94>O\xcd\x04?\xec\xe1\xb4\xbe\xc6C\xb3=C \x15?U\xe13;\xee\xd8\xf3\xbd\x14\x82A\xbfd\xb9\'\xbe\x07\xb5\xd4>\xb3\x8d+>\x9f\x89B>\xd5\xcc\xb4\xbdF\xac\t\xbfj\xd4L>\xdf(\x18\xbbVg@\xbd\xda\x17(?m\x99\xa6>\x8d\xaa\xc6\xbd\xf2\x8b\x06>W\x1eR=r\xe9\xe2>\x0c\x06\x1a\xbe\xf6\xdf\xc3=\x16\xfa\xb8=?\xc3\xa1=\x10\x8e?>Dc\x10>\x17\xa73=\xad\xd5\xac<l\x80\xad\xbdc\xfd\x00>\x90\xed\xd9<\x1d|*=gr\x01\xbf\xab\xe1\x9d\xbd\x9d\xac\xc0\xbe\x7f\xefu>\r/\xa2>J\x96\x1f\xbf\xa7\xc8\x0f?u\xc3\x81>\x013I>\xc5\x92Z?\x8a\xcb_\xbe\xb9m\xdc\xbc\xf0\xa2\xd4\xbd\xe1\xeeF\xbe\x00\xc1\xb3>\xfbxa>\xc3\x1c[\xbd\x1c#\x17?\xc2\xf7\xb8\xbe\x17\xf6\xa3=sN->\x85\x9c\x11\xbfS\x17\xae\xbeL6\x9e\xbe\xb7\x8e\'\xbf\x1a\xc1\xcb\xbe\x00\x129>\x16$\x8b\xbdB\x7f0\xbf$\r\xe5>\xf3#!>:_\xcd\xbd\xf4\x7f\xa0=\xefzo\xbe[\xb8\xaa\xbe)\xc1:?\x83T8>\x06\xd5\x99>\x85\xc0\xc0\xbe<,M\xbfB+`>a"p>e\\\xd4>y\x11T<\xa2\xf8\xe3\xbe\xdcm\xa9\xbe\xcc\x7f\x10?\xfc\xbd\xc7\xbd\x03\x1a\xab>\xc0" >@\x99\x98>\xa7T\xff<\xe9l\x80>\x11\x91\xce<\xf7\xeb\x94>A\xea\x84=~ZW?s\xbb\xf9>*@\xdc\xbd\xf6pg\xbd\x85gD>\x073\xaf\xbc'
-p454
-tp455
-bsV459201976400883712
-p456
-g2
-(g3
-(I0
-tp457
-g5
-tp458
-Rp459
-(I1
-(I200
-tp460
-g12
-I00
-S'\xa2\xb4\x1b?_\xa9\xe9=\xb2\xdeA\xbf\xa7M\t\xbe\xb11\x85>\xbe?\xde\xbd\xd5\x9d\r\xbd2\x9a\xaf\xbeR\xd2\xf2<\x8c\x87\x82>\x0c\xbf\xb2\xbdj\xac\x11\xbdG\r >\xb54X\xbe\t\x9c\x00=\xd6\xdc\xd9>\x84\xfbV\xbd\x94x)\xbe?\xbe\x8a\xbef\xb6Z=\xbe\xad\xc5\xbe.OS\xbc\xedo\x94>\x84\xf0\xf6\xbd\xe0\x90\x16\xbd\xe6\xa2\x10\xbe\x06\xc1\x9d>\xde\xc6\xbc\xbd\x86n\xc3\xbeN}4\xbd\xb9\xb0>><=\xdd\xbc\xf8p\xfb\xbd\xa2R\xde\xbe\xc0g\x03<\x90\xe4\xc0>\x87m\x98>\xd8\xa5\x91>\x17\x0e\xec>\x83\xb3\xac\xbdA\xff\x87\xbe\x94N\xc0\xbc\xc2e\t=\xcc\xb9r\xbe\xa8\xb6\xa5\xbe\x1b\xdd2\xbe\x1f\x05\x10?\x9dv\x87\xbc\xdf|\xc3=\x82w(?kF\x90=\xe5\xf4\x04?Z\xd1\xc5\xbez\x8a*=B\x81\xd6\xbe\xb4k\x8d>\x97\x07u>.3\r\xbd\x19\xc6\t\xbfy\xad\n\xbf)\xeb\xb5>\xe0\xc8\x19?\\Q\x01>0\xc7v\xbe\x87t\xc5=\n\xf7b>\xf6\xf4\x93\xbe\xd6z\r?\x90\x1f,\xbe$\xf1+\xbeLV\x1f\xbf\xc3\xa0\x17\xbf\xfc/\x99\xbeFy\x99\xbdQ^\x9b\xbe\'*P=\xe2\xcb+>\x87m\x05> `\x85>\x97\xc2|>fe4=\x9a\x95\xb4=N\xb6\xac>"F\x91\xbe}\xbc\xd7=\xd5\xf7\x82>=\xdej>\x16\xe8\xb7\xbe\xe3\x02\x1a?\xeeH\xe3\xbd\xd0\xa7\xfa\xbe\xc02\xc9>\x9b\x14\xc6\xbe\xc2\xc8\xf4\xbd\x19\x81\x98>\x08\xb42=L\x1c\xad>\x84/\x80>\x82\xfb&>C%\x17\xbe\x1ehV\xbc2\x1et>.\xe5#>\xfd\xaf\x9b>\xd86\xc7>\x1eF\xe3\xberZ\x04=\x95\r\xf3>~Z\xc7\xbc\xa8\r/\xbdf\xf4\xec\xbe:Q\x16=BG\xc0>\x8c\x86\x85>\xa3\x85\xd8=\xde\x91\x10\xbe2L\x05\xbf~Y\x83>{ \x01\xbeR\xb6Y=\xf9:+?`\x8cQ>\x19\xcf\x19\xbe\\Z0>or\xd8=\x87\x1f\xc7>\x95\x99\x97\xbe\r\xd8\xda=\x88\xe1H\xbd\x0c\xe9\xb8\xbc\xa4~\x80>^\xaf\xa0>\xa0#.=\xcb\xfa7=`\xd3`\xbd|\tn>e\x01\xd3\xbc\xb4\xc0\n=\x1d\xd6\xc1\xbe\xb4\xd7c=\xb2\xab\x9a\xbe\xbb\xcc\xb9>\xe9V\xbb=*x\x1a\xbf\xdb\x8c\xc5>\xf6\xf6\x06=\xbd\xd3\x80>\xde\xb3<?\x9fIL\xbe\xde\x81\x14\xbd&C\xb6=4o\xf2\xbd\xd8\x83\xa9>\xdd{\x81>\xc4m\x10\xbd\xb7\xf1\x02?\xc6\x045\xbe\xc2`\xa3=\xf5m\xfa=\x0e`\xdf\xbe\x07\xc3\xf7\xbd%^e\xbe\x87\xf2\xe3\xbe\xc0)\xc4\xbew\xaa\r>\xf2\\V\xbe\xb1\xe82\xbf\xa1\xee\xae>\x93$->=r\r=\xa0\x80\xef=\x02N\x8a\xbe\xb3\x04\x95\xbe\x05\xb4 ?+AQ=\xce\xa0\x1d>\x94F\xa4\xbe~\xc34\xbf\xec\x9c\x0b>i\xe3\x81>]\x86\xbc>S\x00\x8e\xbd\x8b\xcd\xb0\xbeF\xfb\xae\xbeu\x0b\xdd>\xa8\x91\x1b\xbe\x07\x04\x02?\xa44\x89=e1\xdd>\xfb\'\x8a\xbd\x9e\x9f\x0e>:ZH={\xa5\xb2>\xa3\xe0->\xca\x0e\r?\x84\x93\t?M\x19(\xbds\x92\xef<\xf9\xb7\x01=\xee\xce\xfe\xbc'
-p461
-tp462
-bsV476609289822302208
-p463
-g2
-(g3
-(I0
-tp464
-g5
-tp465
-Rp466
-(I1
-(I200
-tp467
-g12
-I00
-S'\x10\x9f{?\xc28\x8f>\xd0\xe94\xbf\xe1\xeci\xbeO\xe3\x95>\xda\xc2\xc1=\x06\xa2 =\xa3\xc8x\xbep\x05m>m\x8c\xe3>~\x83\xa4\xbd\xd3j\x82\xbc\x86\xffH>[d\xb5\xbd\xc7Q(=\xd6\xc4\x1a?R)\xd0\xbd\x96H\x8b\xbd5\x18\xd8\xbe\xa6 t\xbe\xc6\xbfy\xbe\xde`Z>\xc3v\x0e?\x94\xc7\x8a>\xa3\xdfA>a\x9b\x9b\xbe\xe3\x9f\xe0=\x0e\xd2\xe8\xbd0\x02Y\xbe\x1b\xed\xb1\xbe\xdb\x95\xa1>\x18\xbc\xe2\xbc\xe2\'\x9d\xbd\x7f\xdf\x06\xbf\x03\x03\xa9=\xed]\x01>E\xbd\xc5>\xe3=\xcb>Z\xc8\xbc>\x0f\xd1}\xbeO\xc6\x89\xbe\xf7\x12\xc7\xbdV\xdb>=\xa3\xee\x9b\xbe\x7f\xbc\xc0\xbd\x91\xe8#\xbe\xa3^4?Q(*\xbeen\xaf=\x03\x83d?;\x92\xc7\xbd\xaaiJ?\x986\xec\xbe\xfa\x85\xba>Y\xe3\xdf\xben\x8d\\>\xc7\xa0\xa6>\x8dj\x9a\xbd\xc6\xad*\xbf\x12\xf2\x1c\xbf\x1e\xff\xee>E\xb5C?\xc0CT>\x93\xbc\xe2\xbd\xb1\x84$=\x15\xe6L\xbd\xf6h\x0f\xbf\xda\x0e[?\x02B\xd3=\x97q\x81\xbec\xdb\x14\xbf\xbdN\xe2\xbe\xb0\xd4\x90\xbe\xdaj\xe2\xbdx\x07\x93\xbe\x8b\x1b"\xbe\xe9\x83z\xbe\xa7\x89\x94={\x7fD>\xe2\x9aC>\x98|u\xbdg\xc1\xa5\xbd\xe9-\x04?/Om\xbe\xb5}D>\x987\xa1>\x1f"\x0c?.\xf0\x9e\xbe\xda\xe4(?\xf1b`\xbe\xf8\xfe+\xbf\xa1p\x00>\x8b\xe5\x1d\xbf\xff\xac\xfa\xbd\xf6\x84\xd0>\x95C\x84>1{\x89>\xc2:\xad>#\xa5\xdb=(\xb8\xd3\xbe\x8a_\x03\xbe\xad\xcfG>9\xca\xac>\x1d\nY>\xf3s\xa9>]a\x03\xbe\xd8~*>\xe3j.?\x90~\x0c\xbe\xca\xe0\x8b\xbb\x99xO\xbf\x1d\xb4\x95\xbdy\x10\x08?\xbb\xb8\x95\xbd\n\xca\x0f=\x1am\xa2\xbe\xe2\xa5\xe6\xbeYRV>\x92Ct=`\xc3\xbf\xbc\xfa-2?ro}>\xeb\xcd\n\xbe\x89\xaf\xcd>~\xc43>G\xfb\xc9>\x8e\'1\xbd\x9fMO>\x12\xebL=\x9b\x9e\x11\xbex\xb9\xd9>{(\xd9=\xed\xcc\x15\xbe\xa2\x14\xe3;\tZ\xd6=\x88\x94;>Z\xe7\x0f>;j\xcd<Z\x00\xff\xbe\xa9\x8f\x10\xbd~\x82\xb9\xbe\xdar\x1e=\xb3\x00\xa2>\x8a\xb7\x1f\xbfG<\t?`s\xb4=\xe9\x04\xde=\x18\x87\x1d?}\xa62\xbe&\xd3\xb5\xbd\xbfum=Ec*\xbd\xb9\xcb\x96>\xe7\xb6G<z\xcc\r=\x18\xb2\xee>;\x9b\x8d\xbemk\xa9\xbd\x85:\xef=\xf1\xd7\x04\xbf\xff\xfc\xaf\xbe\xcd\xd5\x18\xbe\xb0\xc6\xd6\xbe" \x8f\xbe\xed\xc1\xba>.\x10\xdf\xbd\xff=\x10\xbf\x19\xb8\xe1>\xd5\x18\x83>\xdb\x85\x18\xbe)CU>"\xbd\x83\xbdI\xc9\xc2\xbe\xfb\t]?\xd3o\xd4=\x18w]>{\x82\xae\xbenJi\xbf\xdeF\x89>vS\x9e>*\xad\xf0>B^\x19\xbe\x1aW\xae\xbe\x7f\xfa\xad\xbe\xab\\\x92>\x80\xd41\xbd\x86\xf4\xc5>\xd4\xcf\x89=\xcb\x8f`>\xa2\x848>/7\x88>*\xb4e\xbcF,\xc7>\x8ey\xbf;\x06\xcfl?\xc1\xba\xda>c-\xb6\xbe\t4\xec\xbd\xdb\xe5X=\xde9\x8f>'
-p468
-tp469
-bsV474113722294616064
-p470
-g2
-(g3
-(I0
-tp471
-g5
-tp472
-Rp473
-(I1
-(I200
-tp474
-g31
-I00
-S'\xc9\x04\x01>,\x8b\x9f<\x1f(\x02\xbe{\x87X;Za\xa5=-\x04\xdc\xbb\xec\x0e\xb3\xbc\x8bC\xdc\xbd\xa0V\x0c\xbdgR\xc8=D`\x07<7\x9a\xbf\xbcFSa=\xb9\xf5\xf2<[\xeb-\xbd\xdc2\xfb=\x99\xfc;\xbdo\xbb?\xbdq1q\xbdT+\xa7\xbc\xeeB\x8f\xbdk\xc7\x1b\xbc\xe2\x11Z=\xe9\xca\x10\xbd\xc10\x94;\xedH\xb5\xbcm\xfd\x89=z\xad\x90\xbdz\xf5\xcd\xbd\x9e\xf5\x06</16\xbd\xd61V\xbd\xb9\xafj=\n\x80\xfe\xbdy\xad\xb3<9q\xe8=\x07\xdf\x97=\xd2{[=\x16\xbb\xd0=\x1d\xc7\x17=\xd3F\xe5\xbc\x9a\xc9\x0f\xbdJ\xb1\x98=\xfa\xae\xc5\xbd\x16\x9ao\xbd\xac\xa1\x93\xbb\xdd\xb7\xfe=<\x0b\x03=\xbe.\xd5<\x85\x9d\x1f>\xd6\x99\x1a\xbc$\x03\x16>>\x80@\xbd#5\xc6;\xa0\xce7\xbe^\x1e?=c1c\xbc(\xfd\xed\xbc\x86\xddP\xbec\xde&\xbe@\xe6\x95=\x8f\xab\x9e=\x192\x0b=i\xb5\xb6\xbd\xd9e\xbf\xbcB\xba\x93=\x08B\xa9\xbd\xa4\xe7\xb7=\xb0\x9c&\xbd\xbeb\x93\xbd\xe6b;\xbe\xe3\xea\xf9\xbd\xb7\x88\xaa\xbc\xa3\x87=\xbd\xfe\xd3\xf9\xbc\xbe\xb5\x7f=F\x17\x8e=\xc3\xb3N=.\n\x92=\xf7%\x89=6(\x1d\xbct\x18\x98\xbb\xcc\xda\r>\xfa\xcc\xde\xbd\x0e&\x86=\r\x00\x86<\xc0\x0c\xc7=\x1c\xe4\x00\xbef\xd0>>\x0c)\xf3;\x93S\x89\xbdu\xdd<=Eg\xa5\xbdi\x13\\\xbcWW\x01>\xdc\xbc\xc6:WG\x9b=\xe0a\xbf=$\xdf*=\xa6\x8a\x18\xbd\xa6 \x8c<\xc2\x85\xdf=\x1ea4=\n\x1e\\=\xb2\xbc2>3\xfe\xa7\xbd\x914\x1d<\xacn.=:\xee\xc3<\x12\xdf\xdf\xba\xfaW\x95\xbd!\xe8\xa3=\xb7{\x8f=\xca\xca\x86=\xcc\n\x8f<\x18\xddk<0\x81\xde\xbdw\xf2\xd0=0\x87I<\xb1H\xdb<!\x18>>O\x01!=\x067\x84\xbbb\xe7\xc1\xbc\x82{\x0b\xbdY\xa2\xb3=\xe4[\x0c\xbd\xd8\xc1\xa2<<\xb2\x0c=\xc3\xa2(=\xfb\x01\x879\n\xdf\xa3<\x01\xb7\xe8<\xfcW\x1d<x\x92\x87;OV\x87<"\x8c\xe2\xbc\x8f\x85\xef;\xe0\x12\xb0\xbcc\'\x9b<\x82\x14i\xbdY~\xef=\xe2\xb2\xce<k,\xd2\xbdt.\x00>\xec\xcf\xa4<\x1aZ>=\xbe\x85\x0c>\x15\x93=\xbd\xad\t2\xba\x8d\x94s\xbc\xcf4\x90\xbdY\xff\xd3=}\x95\xa3=\xdc\x15L\xbc\xa1\xa3\xea=\\y=\xbdK\xc51=\xe0S\xff<\xa8\xf7\xe2\xbd\xa0\ny;\xfc\x02\xbc\xbd\xdcF\x16\xbe\xa6q\x8f\xbd\xf6\x93\xad:\x98|\x8d\xbc@x\x0b\xbe\xe3\x8d\xe7=\xc8m\xfe\xbbX\xfa"\xbd\xb4c\x0e\xbcc\xdf\xa8\xbd\x98\xa2\xea\xbc\x8e\xaa\'>\xa5\x9c\xb2<\t_\xa1<uT\x07\xbeM\xba\n\xbe\xdac\x82<\x18\x85J=\xf5\xf9\xe0=\x16\xab;<F+\x95\xbdu\x00\xa9\xbcCZ\xfb=\x99\'\xb8;\xcf\x83W=\xb5\xc6\xc2<\xda\xd7\xcf=\xb9^\x96\xbd\xb6!\x97=\x19M\x12<\xcc\xf8E=\xcb\xbe\xa2=\xc8".>l\x13\x02>\xc0\xb0\xd3<\x0c\x0e\xf5<>m,=\xd3\xf4A='
-p475
-tp476
-bsV474175914482216960
-p477
-g2
-(g3
-(I0
-tp478
-g5
-tp479
-Rp480
-(I1
-(I200
-tp481
-g12
-I00
-S'G\xf1\x15?\x1e`\xdd=\xe3\x10\xfb\xbez\xa9\x87\xbd\x8a\x9ag>ET$\xbc\x16\x1d\x80\xbd\xab6I\xbe\xf5\xa3\xd9=\xc8\xee\xa2>\xf8\x1e\xac\xbd\x00\xceT\xbd\xb0\xa6\x94=\x95<\xcd\xbdb\\\xb6<54\xd8>\x1a\xe3\xb8\xbdU1\xcd\xbd\x8c\x8d\x85\xbe\x00\x9f\x04\xbeH0c\xbe\xa0\x85\x9b=\x1d%W>\xb5Qh=\x05Va=\x02\x05\'\xbef\xd8j>\xd2P\xc3\xbd\xb5\xfb\xa1\xbe\xb8z;\xbe\xbb \xff:Z%4<\xed\x15\xbe\xbck\xfe\xe0\xbe\x9f\xc4\xa7=\xff\x92\x88>\xc5\x0f\x93>\xfe\xbcm><\x9a\xc2>\x99\xdc\xc4\xbd\xd6\xac\x91\xbe\x04\xae\xb6\xbd\n\xf1\xe5=\xa5=5\xbe\x8e\xe4?\xbe\xfc\xbe$\xbe\xb2\xbc\xf1>>p\x1a=\x8eR\x0b>?\x1f\x15?\xf2wE\xbaVP\n?\x15\x88\x9e\xbe\xdbA\xfb=\xfa\xa9\xeb\xbe\xe6\xdb8>w\xca">Q\x13\xa1\xbd\xb8\xb9\x15\xbf\xfb\xf5\xf3\xbe\x0fb\x8f>~\xaa\x11?\xa0~{>\xad\x94\xf7\xbd\x05\x1c}=>Bd=\x9eI\xa8\xbeXu\x05?\x14]\x8b<\x9e\xc7D\xbez\xe5\x03\xbf\x06\xcf\xd1\xbe\x0b$O\xbe(B\xde\xbdBi8\xbesk(=\x08\x18n=C\x93\xee=>Zd>;\x81O>\xfe\x8b\x8f\xbc6\x9e+\xbd\xf6\x91\xc9>gi\x94\xbe?\x85\xa5=\x19\xad\xaa=\x16\x8e\x9a>\xa9\xa8\x8a\xbe\xce\xfe\n?:\xf3n\xbd{\xc2\xaf\xbe\x84\x0fG>\xbb\xad\xaf\xbef\xb6\r\xbe6\xf9\xbc>Z\xfa\xb1=\xdcM\x88>0\x07|>\xf6\xcd\r>\xc8\x12T\xbe\x0e\xad\xfc\xbc%|c>*\xb1^>\x89\xadF>\xe1\xf3\xc7>%>\x88\xbe\x06\xcan=2K\xce>v\x8e\x8f<*\x9c\xf4\xbc\x0c\x16\x05\xbf\xe3\x7fZ\xbd\xbe\x07\xbe>\x9aq\x00>}=\xec=\xd0[w\xbd\x98\x0c\xdb\xbe\xcf\xf0I>\xda\xc6\x97<A\x80\x9d\xbb\x9a9\xff>\xd5\xa1m>zA\xd8\xbdf\x8d\x0f> y_=[m\xa0>&c,\xbe\xa1\xaa\x84=\x8e\x91;=g\xbeI=\x06\xba=>\xba\x1b\n>d\x97(=\x9e\xc9\x93;~\x1f/<n\xfd\x9e=\xdc\xd1>=T0L<\xee\x9b\x96\xbe\xcaM5\xbdr\xd6\x93\xbe\xe01O>\r\xb3/>U"\xf3\xbe\xb0\xde\xbd>UA\xd0=\x8f\xe8\x1b>\x18\xea\x16?,_\x1c\xbe"\x0f&\xbc*\xcd\xb2;\xf0z\xf1\xbd\x03\xdb\x84>\xe6Y\x1a>h4\x97<>}\xdf>\x0bn|\xbe{\xaf\x9d=a\xc6\x0b>\xbcK\xc6\xbek2<\xbe\xca]}\xbe\x88\xa7\xe8\xbe?\xc8\x84\xbex\xca\x02>jz\x96\xbd\xe7=\x03\xbf\xb1\xd5\xaa>>U\xe9=\x8d{\xa4\xbd\x006\xaa=p\xb7\x1b\xbeRsm\xbe\x8e\xd5\x14?\x85\xa7\xe8=JPa> \xb6\x8f\xbe\x1e\x83\x1e\xbf\xc9\x9d\x1e>\x16\x1fB>\x06W\x9e>\xa6\xca\xbb\xba\xa1\xca\x97\xbe\xd6:P\xbe\xc0A\xcf>\xbe\xb7=\xbd\xa11\x8a>\xe3r\xb3=5Pa>xS\xbe<\xa6\xfem>@|\xfd<\xbe[P>\xeeC\xbb=DV"?x\x84\xaf>\x12u\x84\xbd\xaf/\xc2\xbc\xae\xb9\xd4=\x16\xb1\xb0<'
-p482
-tp483
-bsV445262369313542144
-p484
-g2
-(g3
-(I0
-tp485
-g5
-tp486
-Rp487
-(I1
-(I200
-tp488
-g12
-I00
-S'\x9b\xa6\xe1>M5\xd7<2\xc9\xec\xbe\xca4\x83<{\x9fA>\xea\x8f\xe9<\xa0\x90\xe7\xbcK\x14m\xbeFo\x87=\xa17\x99>\xe6\x96\xa5\xbdn\xf0\x10<SK\x16>\xce,\xb7\xbc\xf3:\x84=\x9d\xf7\xc3>\xf8\xa7\xf2\xbd\x9a\xed\x8c\xbd\xab\xfef\xbe\x05\xea\xfd\xbd\x19\n5\xbe\xa6o\xb0<^\xe3`>\xbdd9;[UQ=q\xf5\x12\xbeB\x80V>\xc03\xb8\xbd\xae3~\xbe\n\xa8\x08\xbe\xd9\x89D\xbd\t\t\x01\xbd\x98d\xf7<\x8a\x99\xf6\xbe}\x04\xa2<\xb8<~>69\x89>\x0b\x81q>4\xde\xaf>m\xfd\xf7\xbd\x0bby\xbe\xf6\x88~\xbd\xfa\x01\xc5=\x8b\xeb&\xbe\xf6\xcay\xbe\x9a\xee\xf7\xbdp\xe1\xef>7\x87\x9d=`7\xef=7"\t?,D\x9b;\x0e\xc2\x08?R\xa7e\xbe\xa39*>\x08Y\xe9\xbe\x12\x99l>\xf8^\x1e=\x85\x8a9\xbe@_\xfb\xbe\x15?\xfe\xbep\x96o>\xfa\xa3\xc0>\x18\xc2a>\xdb5O\xbe\x83\xe7\xf3=\xcd\xb0\xab=\x1b\xfe\xba\xbe\xb5`\xd5>\xce\xe5\x80=\x17zA\xbe%\xc1\xf8\xbe\xbe\x8e\xd6\xbe\xea\xe7\x1b\xbef\x12\xb9\xbd\xc2\xef\xe8\xbd\x8a\x86\xaa=\xa5\xd7\xdf=\x08\x95\xd4=\x80\xbd\x87>\x0b\xc0t>\xee8b\xbc\xe2\xbfl=\xaa=\xcf>\xe2E\x88\xbe\x1b\x9d\xc0=<\xb9\x9b=\x9e\xef\xaf>V\x90\xae\xbe\x89\xc6\t?l8\x95\xbd\x1e\x8e\xc5\xbee\xb1\x16>\xb2\xa8\x93\xbeR\xb4\xdf\xbdf\xc5\xc1>T\xe4\x0c<\xa8\xd2s>u\xe7`>\x0b$T>\x9drE\xbe\xf6+\x12=\xbb\xf9~>\xde\x95R>\x1e&\x88>\xd3\x9f\xe6>\x05\xa8X\xbe&\x9d\x01=\xdet\x8c>\x15\xa1c\xbbk\x9d\xa8\xbd5\x8a\xc4\xbe\x8d\xbfF\xb9\x86\xed\x93>h\xf0\x18>\x90\xd5~=\x9b\xbax\xbd\xd8\xb1\xca\xbe\xfe\xccT>\xc6G\x88\xbc\xed\xed\x1f\xbd\xf6\xaf\x10?\xf8\xf7G>\x0b\xf6\x9c\xbc29\x1f=\xd0zd=\xc6\xa5\xa1>I\x8b\x99\xbd\xca\x9a\x19=9\xb3\xbc=\x8e\x9e\xe4=\x9dx3>\xe2\xb6\xfc=\xf8\x86\x00=\x92S\x98=\xbd&Z<\xc3\x03C>\xb7\xae&=\xb9/\x9c=\xfa[\x8d\xbe\xe9EG\xbdG\xb2\x8e\xbe\x92\xe1\xaf>\xc0\xae5>-d\xe6\xbe\xe0\xa1\x88>\x8et\xff<\xea\xe6\x00>]E\xf6>\xbc\xc9+\xbeH\xf0\xbf\xba\xa3,\x00\xbd\xab\xca\xfa\xbd\xbd\xfcb>`GE>\xfb\xa4u\xbc\xa3\xde\xf0>\xcd<{\xbe\xbd\xefM=\xe31\x1c>S\x14\xd0\xbe\x83W\xd4\xbd\x99$\x8a\xbe\'\xd8\x05\xbf\x8c\xd7;\xbe\x12\x8e\xbd=S\xedV\xbd\xb2\x01\xfa\xbe\xaa\xa5\xc2>p#i;\xdei\xe0\xbd\xa1\x05\x81=f$W\xbe~6<\xbe\xfeW\x05?c\xaf\xa2="{\xda=\xa8S\x99\xbe\x01o\x00\xbf\x12qj>\xc0\x1f\r>3\x93\xb7>\xf2}8=m\xd8\x86\xbe\xe6F\xe6\xbdX\xe9\xa3>t\xd7\x98;/e\x8e>\x0b\xb9\x13>\x1a\xb4\x89>\x8b`d\xbdQf\x80>\xef\xfc\x95=F\x07n>\x15\x9co=\xc4\x8a\x1b?\xce\xb0\xa6>\xd66\xc9<&\xc6\xa1<\x0e\xc9\xac=f\xba\xea;'
-p489
-tp490
-bsV445259119734566912
-p491
-g2
-(g3
-(I0
-tp492
-g5
-tp493
-Rp494
-(I1
-(I200
-tp495
-g12
-I00
-S"\xe7\xfd\xfb>\xf5\x1c\xe9=\xf9\xda\xa2\xbe\x7fO\x88\xbd\x08\x17%>\\\xd9$=%k\x0e\xbdC\xd43\xbe\xa4\xe79=V\x98\xaa>\xf1\xaf\xc6\xbd\x9e\x8a\xcb\xbd\xf2\x92\xaf=\xdci\xa9\xbd\x94\x92\xc9<\x8c!\xba>\x87;\xca\xbdS\x03\xc2\xbd\xaey`\xbe\x84\x1c6\xbe\xf4\x13\x12\xbeW\xb8\x7f=S<X>h\x07\x06>29\xff=\xf0e\x16\xbe\xb1\xc7#>%\xbc/\xbd\xb0\xfa\x86\xbeAEM\xbe \x08i\xbd\xf4\xf7\x8a;\x9b\xe7G=Z\\\xd8\xbe4\x11\x02>t\x98\x0e>|5\x89>\xac*\x1c>\xea\xef\x94>\xfe\xa2\xbd\xbdi\xa3G\xbe.Z\x11\xbe\x95\xcf\xbe=@\xc2\x0f\xbee\x83\x14\xbe\x01\x98\xd5\xbd\xa0\x00\xaf>7\xf8\xe4=&\xbb\xcb=\xfe\x8e\xe5> \x89\xc7\xbd\x049\xf0>\xcbFk\xbe\xb2\x8d\xf2=\xfc\x97\xcd\xbe<f\x19=d;\x94=a\xef\xda\xbb)\xc4\x15\xbf\x87/\xc6\xbe\xecxD>\tE\xf5>\xccP\xab>\xa3$\xca\xbd\x05\xcfl\xbd\x84\x9f\xd2;p\x80m\xbe{\xbc\xda>-\xc2O>\xe2\x99V\xbeq=\xd0\xbee\x80\xab\xbeB8D\xbe>9\xf2\xbd\x13U\x8a\xbd^\xa2\x95<\x1c\xa9\xb3\xbd\xcb\x0e\xe4=5\xc9v>\xac+\x1d>.\xd7\x8b\xbc\t\xb5\x94\xbd~`\xc0>\x01%\x82\xbe\xed8\x9a=\x1c\x01\x18<\xe4F\xa1>l\xe71\xbe\x14\xff\xdd>'\xc3\x0f\xbe\xd7\xf5q\xbe\x8c\x94G=T^]\xbe\x84\x9ac\xbe7\x86\x93>\x14\x86U=\xe9D\x8d>\x92\x89_>\xd5\x1f\x84=\xb4n{\xbe\xf1\x97\xb8\xbcz\xf6+>\x89\x15k>h\x7f\xd3=\xf2\x06\xc2>\r\xda\t\xbe\xb6\x12*<%\xb4\xa1>\xc5zB\xbck\xf5>\xbc\x0b\xb7\xfc\xbe\xa4.}\xba\x88\xde\x94>\xc2\xd7\xe8=k2\x14=\xa3O\xdb\xbct}\x90\xbe\x04\xc6\xf4=Ln\x8e=\xe1\xfe\xdb\xbc\x0b\xd4\xca>\x17\xfel>]\xdd\x0e\xbd#\xeb\x19>\x8e\xc4\xfe<\xe0\x1bg>\x18\xd0\xaa\xbd\x8eM\x04>\xee\x0c\xc6=^8<>$\xf5\xd8=\x9f\xcb\x01\xbd\xbc\xd4z<'1\xc2<\xbe\xca\xf4<T1\xa3\xbc\x12\x85e=%n\xee<w\xc3\x91\xbe\xb6\xd4\xd3\xbd\xa4q\x86\xbe\xc5\xf2C>\xfc\xaay>\x87\xe3\xaa\xbe<\xfc\xb8>\xfc\xea\x19>:\x92A=d\x8d\xfc>nmp\xbd\xc4!D\xbd\xf5\xfc\x17\xbd\xe6I!\xbe\xb624>\xe9\xae\xa2=\x03>\x85\xbc\xe4/\xa1>\x99\xc4w\xbe\xbc~k=\x91b\x80=\xb4\x08\xce\xbel H\xbe\xd6@\x84\xbe\x85Z\xf0\xbe\xe9\xe0 \xbeb6\t>\x9c\x02h<\x94\xbc\xb9\xbe\xaaT\x91>%\x02\x04>\xe8\xc7\x1b\xbe\xf9p\xf4\xbc\xe8\x8bP\xbe\xa4.\x85\xbe\xbbA\xeb>\xc8:\xb1=$\x02\x1a>\x9e&\x88\xbe\x87b\x0b\xbf\x9e\xf5\x03>\x14+\xfb=\x9aAZ>7\x89{<\xe5\x99\x83\xbe\x94\x00\xb2\xbd:?\xc3>\xb1\xb6-=\xf8\x11.>I\xacr=fmV>k\x16f\xbd\xb5eR>.<U\xbb\x0b\x8a\xe8=A\x0f\xc5=\x0f~\x12?W\x9e\x89>\x10`\xe5\xbdQ\xb2\x06\xbd\xce\xa9\xe4=\xc0\x18|="
-p496
-tp497
-bsV476534288049905664
-p498
-g2
-(g3
-(I0
-tp499
-g5
-tp500
-Rp501
-(I1
-(I200
-tp502
-g12
-I00
-S'sgv>b\xe8.\xbc\x1e\x95\x91\xbea\xf3"\xbd\xdfy\'>\xf4|\xd0\xbc\xfc/V\xbb\xa9\x94\x15\xbe\xd4\xee\xbc\xbc/v\x19>\xe9\xc0U\xbc\xa5\xa0.<\x80\xca\x00>\xd3\xeb\xd9\xbc\xec\x9e\xd1\xbd<\x0b3>M\x19\xe8\xbc\xfa1\x00\xbd\xc1\xc1\xfe\xbd\x1ag\xc1<\x1at:\xbe\xcd\x1e&=\x01\x00\x84=)D\x04\xbe:\x00\xe9\xbb\xf9C\xce\xbd\x85\x96\x1c>\xb7\xe0\xc8\xbd\x8d`P\xbe98\xa2<\x05w\x0e=<\x969\xbcl\x93\x1c=\x97\xc2]\xbe\xf7d&\xbc\xd9i\x10>\xc2\xfa\xb8=%\xdf\x00>!\x9a]>\x90\x8d\xac\xbc/\x19\xaf\xbdms\xf1<\x9e#%>\xc4XB\xbe\xe7#\xad\xbd#dZ\xbd\x81\x99\x81>/\xd4u;\x01\xe42=\xcd\xb8\x8f>\xb5\xa34=\xec\x99\xa3>\xb5\xef\x1d\xbe\xf6\xe2}=\xaf\'\x89\xbe0B">\x0f\x0f]=\xdf\xef\xad\xbd\x9d\x03\x92\xbe#\xc5\x8a\xbe\xa6{<>\xb6\xf7\xeb=)\xda\x9a<\xfd\xd5\xe9\xbd4{T<m\xc4\xf8=\x8e\xc2\x19\xbe\xe1\xf5->\n\xca\x17\xbe-\xffo\xbd\xb0H\x9b\xbe\x0c\x05F\xbe_\xf9\xdc<]\x0fO\xbd7\xa2\xd1\xbdsI\xc1=\xecj\x16>\xe0\x84\x98=\xc3\x8b\xc5=S\x14\xf0=\xdc\x94l\xbd*\xd3\xb6;\xd1 V>\xc4\xd7\x12\xbe\xf1<n=Y\xc4\x86=\xa1\x9d\x1e>l\xad^\xbe\xf1I\x96>g\xb4\xd0</\x99\x16\xbe`1\xcd=,\x1a4\xbe\x06A\x85\xbc]\xd9U>\xa7\x1f1=z\xbe\xcb=\xf1\x1f$>\xcc\x06\xd9=\xa1~e\xbd\xc3Rn=ON1>T\x06\xcb=\xd1\xcf\xdd=J\x90;>\x8f\r\x1c\xbe\x97\xa0\xcb<\x00\x02\xcf=Y\x12\xf9<qw\xad<o\xe8\xf2\xbd\xa9]\xc7=&u\xd5=\xa5\xca\xb3=\xc9\xff\xb8;y\xdb\xbf\xba\xaa|d\xbe\x07)X>\xdd\xcb\x0b\xb9\xcdh\x93=\xe7\xed\x9f>\xfao[=\x91Tg\xbd\xaft\xec<\xe6U\xc0;ZGL>\x96/\xc8\xbd\xea\xca\xf6\xbcD\xe0\xb1<\x8du\xc6;\xb6?i=\x83\xb5y=\xcf{M=I\xee+=\xef\xe3r=\xc9\xac\xbd=O\xfc\xb4\xbc\xc4\x8aJ<l@O\xbb\x7f\x18\x80=\\\xf0\xfd\xbd@\x02A>@=.\xbb\x8c\xaap\xbe\xb2\xf80>\xd9\x87i<\x19\x98\x1d>4jW>\xb9\x96\xd4\xbd\x8c\x0b\x02\xbd\xf9\x02N\xbd\xd7F\xd0\xbd\xda.8>_\x87!>4\xc6\xc2;<7\x81>I*\x87\xbd\xb6\x11\x82=\x81\x84P=\xf4\x9f4\xbe0\xe8\xe6<\xc9\xe5\x0e\xbe\xa6vy\xbe\x81\xf7\x18\xbe\xa9\xee\x00=\xc7\x0c\xc5\xbd\x18w\x9f\xbev\xaf$>\xc9Cr\xbc\xed0\'\xbc&\x11U=\xda\x9a\xba\xbd\xd3\x10\x96\xbc\xdb\x97\xae>r|2=%\xb9\x83<\xa9;_\xbe\xd2\x9b\x92\xbe\x97\xfbF\xbb4M\x8f=\xa3\x0f>>\x1f\x1c\xf4<9\x9c\x1e\xbe\x89\xfb\xa2\xbd\xfbi\'>\xd0\x07\x88\xbc\x8e\xd4\x12>Q\xcb\x8d=qS5>\xfcX^\xbd\t\x8c\xfc=\x97\xe2\xd9<Lx\xe8=?\x08\x8d=\x1a\x9c\x99>P"F>4\xd6X=\xc4O,<\xc1\xe5$=\xef\xa1\xb9='
-p503
-tp504
-bsV445258811893645312
-p505
-g2
-(g3
-(I0
-tp506
-g5
-tp507
-Rp508
-(I1
-(I200
-tp509
-g12
-I00
-S'\x0f\xc9\xbd>\xdabJ:$\xa6\xc8\xbe\x8f\xc2\xda\xbc\xbb\xb6!>|\xa5\x86\xbbNK\x9d\xbc\xc4\x91T\xbe\x01\xdb\xf7<\xc6\xd5\x8f>\xe6\xb8\xd6\xbd\xee5\x08<\xa7\x02\x9c=\x19\xca\xd5\xbd\xf4R\xf1\xbcW\x01i>\x94\xc7\x80\xbdW\x057\xbd\x03\xf5<\xbeM\xfd\x8d\xbd\x89\xb4Y\xbe\xd1\xf7\xfa\xb7p\'\x13>A8\xfb\xbd\xaf\x7f\xcd;\x9c\xa2\xec\xbd?\x10z>\xf1\xb6e\xbd\xc0\xd5\x8a\xbe\xb0\x83\xf2\xbc\xe4\x13s=\x17\x83\xe8\xbc)\xe7\xa4\xbc\x10\xd0\xbb\xbe\x97l\xd8\xbc\xff\xd2\x85>\xc9\xc3T>#\x88/>W\xb6\xbb>\xd1\xc0\xc0\xbd/\xafV\xbe\x9b\xb1\';\x1fcN>[\xaf\x10\xbe\xa1$M\xbesF\xf0\xbd\x10M\xc9>\x07\xa3\x93=\xa4\x17\xa2=\xc6\xb5\xed>\xa3\x0eD=3\xc7\xdd>\xca\xdfz\xbe#R\x8b=\xf3p\xc9\xbe\xf1\xa6Y>\x89T\xa2=p\x82\xcc\xbdO\xfc\xcd\xbe\x87\x1b\xca\xbe\xd6\xces>\xb7E\x94>%\xac\x06>\xe4!L\xbeI\xfd\x96=\x11\xd2\xc1=\xa9\x06v\xbe\xe4\xd6\xa8>\xc1@Q\xbd\x86\xce\xea\xbd&r\xcb\xbeqH\xb9\xbec\x8c\xe4\xbc\xdfZ\xd6\xbd\xe7\x95\xfc\xbd\xdcc\xa2=\x81\xf8\x1c>\xe6\x18\x89=\xb9\xb8N>\xe4E\x13><\x18\xbb\xbci\x82\x05=\x86\xe6\x99>\r\x12B\xbe\xec\xc3\\=\xf3\xcf\x12=\xca\x03S>\x89\n\x9d\xbe/\xbc\xd6>_\x00\x04\xbd\x02\x94\x85\xbeUF\x18>YXJ\xbe\x99\x94j\xbd\xf8\xc9\x9a>0F\x15;^?,>\xda\xef6>\\\xb1L>\xf9D\xd2\xbds\xb5\xea<m\x1a0>f\xbe\xdf=\x07L7>\xdd0\x7f>w\x13\x92\xbe\x1a\xc3\x85;\x86\x84N>!\x9b\xbc\xbc\xb10\xf9:\xef\xde\x9b\xbe\x89\xbe\xdb;k\x16\x84>7\xf07>\xde\x06\x9e=,\x92$\xbd\'C\xbc\xbe|\xc2w>\xfcc\xc0<\xbd\xa7\x86\xbci\'\xe7>\x90\x1b\xf6=t\x11\x9d\xbd\x0c\xb7^=M\xceT=\xb5\xda\x90>\xe27\x13\xbe\xd41\xe8\xbb\x1f5u=\xff\x14\xda<\xa9p$>6\xa0\xeb=\x14\xc2\x9a=0\xe1\xe2<:\xce\x08=\xe9\x9f\n>\xda\x8e\xc9<\xdd&\x96=\xa5\xd5-\xbe_h\xbb<Z\xb4Q\xbe\x0b\xe7\x90>\x8dR\x9d=\xcf\x9f\xd3\xbe\x9c(c>\xa4\xdck\xbcQ`J>\xcd\x8b\xce>\x17D\x0e\xbe\xd9\xb9K\xbc_Q\xbf\xbc\xde\x97\x08\xbe\x19\xa4;>f\xc1=>F\xear<\x04\x7f\xb9>\xfa\xca-\xbeA;\xa5=\xee\xa2\xa7=|}\x9f\xbe%\xaa\x85\xbd"\xb5\x89\xbed!\xe3\xbe\xff\xbd7\xbe\xf71\xbf=\xa1\x1a\x91\xbd\x01\xed\xf9\xbe\x87\xdc\x8d>98\xac<\xf6\xac\x11\xbd\x7fa\xb7=Q\xb5\x1b\xbe\x11%\xed\xbd-u\xe5>\x1c=^=\xe7\xb4\xa6=}\x9aX\xbe-\x80\xd0\xbe(j\xb6=\xa7\x96\xae=\x89(_>\xbf"?=\x87\xc7\x83\xbe|\x91(\xbe\xc0\x03\x8c>\xe9\r_\xbdS\xb8\x87>\x96\xff\xc9=\x9aYu>\xf8\xf3\x8e\xbd\xe4\x90%>\x807\xb0=\x00]w>\xaf/+<\xbd\x10\xdf>\x8fn\xa3>\x9c\x9c\xb9<:\x03\xea\xbb/5J=q\xefx='
-p510
-tp511
-bsV445258384627863552
-p512
-g2
-(g3
-(I0
-tp513
-g5
-tp514
-Rp515
-(I1
-(I200
-tp516
-g12
-I00
-S'E+\x1b?~\xde\xa5=I\xb9!\xbf<PJ\xbd&\xf8\xa2>\xae%\x00\xbd\xcd\x08^\xbd\x9a2\x8f\xbe\x02\x92\xcd=\x1f\xd9\xab>#\x87\xf0\xbd\xd3\x1c\x9c\xbd\x8c\x9a\x83=\xc2&\xc9\xbddx\n=\xed\xa7\x06?\x01?\x90\xbd\x96`\x8c\xbc#\xd1\xbb\xbe\xdaHE\xbe\xebZt\xbe\xbb\xf1\xf5\xbc\x8cj\xb5>e<\x85=U!\x0f>\x93\xe2i\xbe\xe7\xc3\x9e>\xba\\\xb3\xbdk\x8b\xaa\xbew\xe6i\xbeB\xceP\xbd\xc5\xa3\x84\xbd\xab\xf3`<\x03\xee\x1f\xbf\x1cE\xa9=\xddT\x99>\xe4O\xa0>\xa0q\xa3>\x9d\xdb\xd6>uH6\xbe\xe1\xea\xcf\xbe-\\\xb0\xbd\xffV\xbd=iI6\xbe#\x80\x85\xbem3e\xbe]<\x03?q*\xf5=\xbf\xd2b>\xe7/(?<\xba\x80\xbd\x9co)?/\xa9\xa9\xbeY\xc3D>\x10\xe9\xec\xbe\xfa\x9b1>\xc4\x8f\xfa=c\xe59\xbeS*#\xbfI\x9f\x19\xbfP\x0c\xa0>%\xea!?\xe9\xe6\xa1>g\'K\xbe\xd5T\xd2=wa\xe7;B\x9e\xf3\xbe1\xd1\x06?\xbf\xc5\x08>\xech\x80\xbezx-\xbf\xa0\xda\xf9\xbe@\x94x\xbe\x1aY\x0c\xbeQ\x8ad\xbe6\xb43\xbc\x1f\xfa\x85=\xf4 \xc6=lo\xbf>\xae\xf4\x9f>\x89\xf2y\xbd\t\x84w=\x91/\xeb>K\xce\x94\xbe-\xe2\xad=\xfe\x91\xec=N\xb3\xc7>\xd2\x00\xd9\xbe1\xfc5?K\xb3^\xbe\x0bU\x01\xbf\xa2\x198>\x1a\x84\xcc\xbe\t&X\xbe\xc7\xab\xd5>\x818\x13>\xb0\x96\xc2>\xd2 t>-\xce7>U\x7f\x9e\xbe\xef\xd4\x11:\n\x8f\x9e>\xffD\x8d>\xed\xa6\xa9>R\xb7\xf7>?\xef\xa1\xbet\xa3K\xbb\x16T\xfc>.nO=M\x1c\x98=c\xec\x11\xbf4\xb7\xd2\xbdu~\xd7>\xbc\x9c\t>\xa9\x06 =\xbbH\xf7\xbc\x072\t\xbf\x8e\x9fH>\\+\xc4<\xbe\x1b\xa2\xbdM\x853?7\x85{>\xae\xab\xf3\xbc\x82\xd9j>-\xc09=\x83\x93\xb8>\x01\xb7?\xbe\x84\xf2\x88==\xd8(>*6|>\nVx>\xe0\x95\x90=\xf0}\xb4=\x00\x96\x99=\x04\xe4k<o\xb6K>\xcd\x00q=k\x91\xa2=Zr\xdc\xbeQ\xe8\x04\xbc\x86 \xe3\xbe\x9fS\xb2>\x8a\xedB>R\x08\x17\xbfm3\xc7>\xc6\x88\xad<\x8a4\xf0=L\xa2??<\xcf\x1f\xbe\x03\xa9\x14\xbd\x11\x822\xbc@\xf9\'\xbe\xd1\xd5\x8a>u\xed\x16>D\xcd\xb8:\x89\xaa\x16?5\xeb\xb9\xbe\xbf\x02\xd4<\x11\x1a\xfc=]p\xed\xbe:54\xbe\x8c\xde\xb7\xbe\xfa\xd4!\xbf\xab\xa0\x8f\xbe\xdftS>C\xbd\xa2\xbc\xb2\xc2\x1c\xbf\xb1\xc1\xed>\xde4\xe5=6\xd5\xf7\xbd_}\xbd=\x8b%\x88\xbe@\xf4\xad\xbe\xb6Y\x16?\x0fI\x89=\xe3f\\>;f\xa7\xbev2?\xbfz\x90\x98>\xe5^U>P\xf0\xd0>kbN=\x05W\xb8\xbe\x8aQ\xce\xbd\xcbn\xff>_\xb1\x0b<\xd3a\xd2>\x8d\x98\t>\x9a?\xab>@\x01C\xbd\xd4\xc3\xb6>=3K<\xed|c>\x91"\xf1<\x92u<?;\xbf\xb0>@\xad)\xbd1\xc8I\xbd\xcdS\xcc=\x07\x94B\xbd'
-p517
-tp518
-bsV473425528955752449
-p519
-g2
-(g3
-(I0
-tp520
-g5
-tp521
-Rp522
-(I1
-(I200
-tp523
-g31
-I00
-S'\xc9\x04\x01>,\x8b\x9f<\x1f(\x02\xbe{\x87X;Za\xa5=-\x04\xdc\xbb\xec\x0e\xb3\xbc\x8bC\xdc\xbd\xa0V\x0c\xbdgR\xc8=D`\x07<7\x9a\xbf\xbcFSa=\xb9\xf5\xf2<[\xeb-\xbd\xdc2\xfb=\x99\xfc;\xbdo\xbb?\xbdq1q\xbdT+\xa7\xbc\xeeB\x8f\xbdk\xc7\x1b\xbc\xe2\x11Z=\xe9\xca\x10\xbd\xc10\x94;\xedH\xb5\xbcm\xfd\x89=z\xad\x90\xbdz\xf5\xcd\xbd\x9e\xf5\x06</16\xbd\xd61V\xbd\xb9\xafj=\n\x80\xfe\xbdy\xad\xb3<9q\xe8=\x07\xdf\x97=\xd2{[=\x16\xbb\xd0=\x1d\xc7\x17=\xd3F\xe5\xbc\x9a\xc9\x0f\xbdJ\xb1\x98=\xfa\xae\xc5\xbd\x16\x9ao\xbd\xac\xa1\x93\xbb\xdd\xb7\xfe=<\x0b\x03=\xbe.\xd5<\x85\x9d\x1f>\xd6\x99\x1a\xbc$\x03\x16>>\x80@\xbd#5\xc6;\xa0\xce7\xbe^\x1e?=c1c\xbc(\xfd\xed\xbc\x86\xddP\xbec\xde&\xbe@\xe6\x95=\x8f\xab\x9e=\x192\x0b=i\xb5\xb6\xbd\xd9e\xbf\xbcB\xba\x93=\x08B\xa9\xbd\xa4\xe7\xb7=\xb0\x9c&\xbd\xbeb\x93\xbd\xe6b;\xbe\xe3\xea\xf9\xbd\xb7\x88\xaa\xbc\xa3\x87=\xbd\xfe\xd3\xf9\xbc\xbe\xb5\x7f=F\x17\x8e=\xc3\xb3N=.\n\x92=\xf7%\x89=6(\x1d\xbct\x18\x98\xbb\xcc\xda\r>\xfa\xcc\xde\xbd\x0e&\x86=\r\x00\x86<\xc0\x0c\xc7=\x1c\xe4\x00\xbef\xd0>>\x0c)\xf3;\x93S\x89\xbdu\xdd<=Eg\xa5\xbdi\x13\\\xbcWW\x01>\xdc\xbc\xc6:WG\x9b=\xe0a\xbf=$\xdf*=\xa6\x8a\x18\xbd\xa6 \x8c<\xc2\x85\xdf=\x1ea4=\n\x1e\\=\xb2\xbc2>3\xfe\xa7\xbd\x914\x1d<\xacn.=:\xee\xc3<\x12\xdf\xdf\xba\xfaW\x95\xbd!\xe8\xa3=\xb7{\x8f=\xca\xca\x86=\xcc\n\x8f<\x18\xddk<0\x81\xde\xbdw\xf2\xd0=0\x87I<\xb1H\xdb<!\x18>>O\x01!=\x067\x84\xbbb\xe7\xc1\xbc\x82{\x0b\xbdY\xa2\xb3=\xe4[\x0c\xbd\xd8\xc1\xa2<<\xb2\x0c=\xc3\xa2(=\xfb\x01\x879\n\xdf\xa3<\x01\xb7\xe8<\xfcW\x1d<x\x92\x87;OV\x87<"\x8c\xe2\xbc\x8f\x85\xef;\xe0\x12\xb0\xbcc\'\x9b<\x82\x14i\xbdY~\xef=\xe2\xb2\xce<k,\xd2\xbdt.\x00>\xec\xcf\xa4<\x1aZ>=\xbe\x85\x0c>\x15\x93=\xbd\xad\t2\xba\x8d\x94s\xbc\xcf4\x90\xbdY\xff\xd3=}\x95\xa3=\xdc\x15L\xbc\xa1\xa3\xea=\\y=\xbdK\xc51=\xe0S\xff<\xa8\xf7\xe2\xbd\xa0\ny;\xfc\x02\xbc\xbd\xdcF\x16\xbe\xa6q\x8f\xbd\xf6\x93\xad:\x98|\x8d\xbc@x\x0b\xbe\xe3\x8d\xe7=\xc8m\xfe\xbbX\xfa"\xbd\xb4c\x0e\xbcc\xdf\xa8\xbd\x98\xa2\xea\xbc\x8e\xaa\'>\xa5\x9c\xb2<\t_\xa1<uT\x07\xbeM\xba\n\xbe\xdac\x82<\x18\x85J=\xf5\xf9\xe0=\x16\xab;<F+\x95\xbdu\x00\xa9\xbcCZ\xfb=\x99\'\xb8;\xcf\x83W=\xb5\xc6\xc2<\xda\xd7\xcf=\xb9^\x96\xbd\xb6!\x97=\x19M\x12<\xcc\xf8E=\xcb\xbe\xa2=\xc8".>l\x13\x02>\xc0\xb0\xd3<\x0c\x0e\xf5<>m,=\xd3\xf4A='
-p524
-tp525
-bsV445260035162382336
-p526
-g2
-(g3
-(I0
-tp527
-g5
-tp528
-Rp529
-(I1
-(I200
-tp530
-g12
-I00
-S'\xa5s\xf5>wxW>=\xa0\xa8\xbehl\xd2<\x8e\x9c\x91=S\xf6\xda\xbc\xe5\xcb\x96\xbd\xdfW}\xbe!\xe1\x88<\xe0yu>\xdbv\xbd\xbd\xa9\xce`\xbe\xa7\x16\xe4\xbctS\xe9\xbc\x9d\x07\xa5=L1\xbb>\t\x85\xc9\xbd\x8c\xb63\xbe<R.\xbe\xcb\x05\x1f\xbe\xcdJ\xc7\xbc`Hi\xbdS\xd4\x99>\xe7\x0eG>]\xb6\xb1=\x8c\x8e\xa3\xbc\xb8B\xde=\x05n\xca\xbc\x89i@\xbe\x1bvu\xbe0\xc3S\xbe\x0c\x84\xa4\xbd@\t\xb2<1\x93\xbf\xbe%\xe7\x14>qI\x95>%\xba\x8d>\xff\xbc8>\xc7FI>s\xc7,\xbb\x1c?[\xbe\xc7\xa8/\xbe\xadR\x0b\xbe3RE\xbdkZ\x99\xbe\xf3f\x8f\xbd\xb0\xd5\x83>\t\xe4\xf5=\x81\xbe\xa1=\x9b\xc2\xe9>\xf6\xed\x1c\xbe\x84\xfct>9" \xbe\xe4\xcd\xde<V\xba\x8f\xbe\xd1\x85\x0e\xbd\xd4\x00\x9b=\x10pu=\xdc\xcb\xf3\xbe}\xfc\xde\xbew\xf3\xc1=\x16z\x06?\x94z\xb6>om\x19\xbe[\xe2\xee\xbc\x97H\x87=C\xdd8\xbe,w\xb9>\xff\xb3\x94>\xc4\x9e\x9c\xbe\xf5\xc3\xda\xbe{\xd5\xcc\xbe|\xd2\xd9\xbe\x9f]$\xbe@\x0e\xfd\xbd\xe9\xad\xb7\xbc\nb\n\xbe\x97\xf2\xf8=Q+\xb3>\xedXF>\xdb\xf2\x81=U0\r=UZ\xbb>?\xf7\x98\xbe\xd3x!>\xees\x8e<\x05\xfdh>c\xa0f\xbe0\xca\xd1>s\xc6G\xbeM\xc2f\xbe/\x08\x1f>\x85uO\xbe\x9d\xa7F\xbe\x95lF>\xe8m\xd0<\xd0\x18\xcd>\xc9.->Q\xdbX<\xfd\xc8Z\xbe\xabb)\xbe$\xf0@>\xed\xcf\x08>\x87C,>\x9f\xef\xec>/\xa9d\xbe\xf7\x00\xaf\xbc#\x9b\xda>\x15\xdd\xc0<y\x8fJ\xbd\xf1\xf2\xfe\xbe\xc5<\xcc\xbd\xfdu\xb1>\xff\xff%>\xb5\x99;>}\x10\r\xbd\x88\xfa\x96\xbe\x08\x19L=$L\x18\xbd\xef\xca\xc5\xbd\xef\x02\xa3>\xbb\x1c\xa1>\xcd+w\xbd$\nF=\xb0\x0c\xac\xbd9\xee5>S\xe9\xe6\xbdA\xa3Y>C\xda\xac=\x07\x86A>\xcfy\x81=nY\x1d>\xf0>\xa1<\xe9nf<*\xaa"\xbe\x9b\x84X\xbd\xad\x7fg\xbd\x19Q\x8b<Ty\xfd\xbeb\x08\x9a\xbd\xe3\xc8t\xbe\x0f\xa4\x08>\xcd,~>\xa4\xfb\xb1\xbeW\xee\xd3>\x98\x9f\x03>\xec\xf2X\xbd3u*?\xe7o\x97<\xfc\xfc\x04\xbc\xcb\xcf\x9c=\xb5\xb8f\xbd@\xd4h>\x1b\xd2\xb3=<Xa\xbd\x96?\x9f>\xd9\x87\x81\xbe<\x02\xc2<G\xeb\xb6=\x9e\xc5\x99\xbe\xb3]\xa3\xbe\xf3\xe6\x96\xbe\x85\xc1\xf1\xbe\x94\xa3\x86\xbe\xcdy\x8e=mO\xc8=\xdc\xff\xae\xbe1\x92\x99>\xed9b>\xb7\x12\xfc\xbd\'\x89\xcd\xbd\xfd^\xae\xbe\xbdH\xc5\xbe\x0e\xb8\x95>\xeb\xb5`=m4\x94>\x10$[\xbeyZ\n\xbf\xff\xa68>kc2>\xf8\xc7v>\x9b\xbf"\xbd\xad"X\xbey\xf2\xfe\xbd,\xee\xdb>\xc5\x05l=5\']>\x95k\x91=\xe0\x04l>7nl\xbd<GP>\xb9\xf1\x8c\xbc\xba\xe3\x1d>k)M>\xc3\xab\x06?\x88\xf0\xb7>|\x83K\xbe/P-\xbb\x8f\x10)>2\x0f\x08\xbe'
-p531
-tp532
-bsV474175488634531840
-p533
-g2
-(g3
-(I0
-tp534
-g5
-tp535
-Rp536
-(I1
-(I200
-tp537
-g12
-I00
-S"\xa20(?T\xfaJ>:\x0f \xbf{{M\xbcR\xd6+>J\xa1Z\xbc&\x07\x01\xbcmy\x83\xbe\x87C\x04>j^\x9d>\xd2\xbb\t\xbe\xe2\x01\xa7\xbd%|7=\xf8\xb0\x04\xbePB\\>\xdb\xff\x02?\xfb\x94\xcb\xbd\xeaC8\xbe|\xdf\xb0\xbeF\x9aS\xbe\x0cV\x0b\xbe\xfd6o;\xf6\xdb\xde>\xaci\x9e>r\xa5/>\xfa\x0fR\xbe\xa0WI>\xca#\x94<5\xb2h\xbe\xbb\xc8\xce\xbeU\xa8\x86\xbd\xcd\xfc#=z\x14\x8e\xbd\x92\x1c\x1c\xbfRu\xcb=\x8e\xa0E>\x04\xff\xa9>P\xb8\xb9>\xe14\x98>\x85\x90\x9e\xbe\xaa\x84\xdb\xbe\xf5x\xe9\xbdG$\x06\xbe\x13z\x9d\xbd^\x1e\xa9\xbe\x8d\xabL\xbe\xa0\xbf\xe4>\x9d\xc8r=`\x0e<>T\xe2)?\xc3\x0c\xf0\xbdX\x16\x15?K\xd9\x99\xbe\xd5\x84~>\xa6\x18\xb4\xbeB\xfc\xbb=\r[\x10>\xaa\xb4\x15\xbeY\xf9\n\xbf$\r\x1c\xbf\xf2\x0b^>~\x11>?\xc5\xa6\xd6>\xad\xd4.\xbe\x96o\x0f>\x18\xad\x1a\xbd\x9b\xf4\xe0\xbe\xeeb#?C\xbd\xb7>gV\x95\xbeV\x04\x12\xbf\xed\x83\x10\xbf \xd8\xed\xbeT9\x82\xbd\x1c\x072\xbe\xf2c\xa7\xbd\xc3\xab\xd0\xbdRDN=\xb53\xe8>\xa0\xd1\x9f>\x90\xea+<\xb6\xf1\n>\xee\xf7\xe9>\xa4%\xb0\xbe\xc7\x11\x9e=\xba\xe8\xb9=\xe8q\xd2>\x93\xe3\xb4\xbe\x0e\xfe\x1d?!\xdd\x9f\xbej6\x0b\xbf\xabHS>^|\xac\xbe\xe9\xfb\x9d\xbe\xa4Q\x9a>\xb2\xfa\xc9=f7\xe9>\xf5*m>\xcaI$>\x11\x16\xc2\xbe\x8bk\xb8\xbdp\xddc>\xfb\x96\x88>k7\xaf>d\xd3\x04?\xd3Fn\xbe\xc6\xc9\xbe\xbc\t\xa9\x1c?\x86\xd8~\xbcG\x1d\x05\xbd;\xfa3\xbfN\xe3U\xbe\xc3\xea\xec>\r\x1c\x91=\x86\x18\xa8=\x96i\x0c\xbeC\x91\xfa\xbe\xbe<c=J\xcf\x97\xbd\xb3*\xfa\xbd\x8c\xba\x1f?>\n\xb0>\xe3~&\xbd}\xfaM>\xd3}\xf4=\xe6\xc1\xb5>^J\xb8\xbdU\xdbg>&\xf8\xed=&\xb5L>\x9e\xfb\x8c>\xc1\xbe\x0b>\x9b\xec]\xbd\xaf\x82\xa8=$n\xaa\xbdV;>>\x06Q\x8a=\xd7\xf8\x0e>\xc7\xae\x1e\xbfx\xbb\x01\xbeh\x9d\xce\xbe\x9b\xee\x92>\xc4-\x97>B\xda\x14\xbf\xe3\x04\xde>\x96\x14\xfb=\x82=\x82\xbc\x93\xd8W?\xe9\xeb\x84\xbdx\xe9\x0f\xbd\xb0\x90T=\x17\x17\x9f\xbdekW>-[]=\xee\xa7G\xbd\x8e\x00\x17?\xda\x8f\xd6\xbe)\xd7\xb1\xbdf\xeeL>\xbe\x12\x03\xbfr\xd5\x94\xbe2\x0e\x9e\xbe\xed\xea#\xbf&7\xaf\xbeJnW>\x15\xa5\xc9<V?\x04\xbf\xad6\xf9>\x12\xa5R>\xb2\xfc\x1d\xbe\xcd'\xeb<\xc8\xd1\x95\xbe\xd0\xb7\xf6\xbe\xd86\t?\xd3\xc6\x14=L\xa4\x8d>j\xd7\x85\xbe\x8f\xf4I\xbf\x1b\xec\xd6>r\xe2Z>(\xa9\xd8>'9\xb1\xbc\xefW\xa7\xbe\xf8\xca\xe5\xbdH_\xff>\x06\x00\xe3<\xe0\xc7\xcf>c\x8d\x03>\xce\xeb\x97>\x92VZ=T\xb6\x94>8qL<\x92\x97k>\xd8\x1e\xb4=\xca\x02C?\xe8\xf3\xc2>+\x0cO\xbeNe\xcf\xbdPc\xf5=\xeb\xf3Z\xbe"
-p538
-tp539
-bsV445260234181718016
-p540
-g2
-(g3
-(I0
-tp541
-g5
-tp542
-Rp543
-(I1
-(I200
-tp544
-g12
-I00
-S"D\xef\x91>\x1bi\x15=.6\x95\xbe\xb6\xc2\x80\xbc\xab\x81.>\xb4\xde$\xbdZl\xc2\xbcX\x02@\xbe\xe6/\x16\xbdC\x0b\xfe=\x16\x1d~\xbcj\x81\x0c\xbd\xf6\xc7\xe5=r\xfa\x14=\x0e&\x8c\xbd\x96W}>\xc2\x00d\xbd~\xc9\xab\xbd\x0ez\xfa\xbd\x91s\xbe\xbc\xab\x04\x1d\xbeJ=\x80<.@\xc8=\xd6\x9a\xac\xbd\xcc/\x8f<\xea\x99\x9d\xbd%\xc1\xfd=C\x05\xdb\xbd+\t7\xbeZ\x16K\xbc&2u\xbd\x1e\x05\x0c\xbd\xddf\x81=u\x86m\xbe*?>=\xc1lA>\x85\xc8\x01>%x#>\x8b\x10R>\x0b\xc1\x90;{[\xe0\xbd\x8b\xad\xb9\xbc\xea\x0c\x0b>\x10[8\xbe(\xc9\xd2\xbd\xf6cP\xbd\xe5\xff\\>\xad\x8f\xe5;>\x84\x9e=\x94\x9a\xa0>#\x0e\xd9<\x06\x9f\x94>pO\xe6\xbd\xfa1q=S\xdd\x96\xbe\xb5\xbf\xd7=\xa6rk=\x82\xc9\x90\xbd!\xb1\xaf\xbe\xaa\xa1\x99\xbesH\x1c>t\x80@>6\x05`=\xca?\x08\xbeN7\xe9\xbar\xbb\xcd=\t\xd8\r\xbe&rK>b\x9c\x97\xbd:\x05\xeb\xbd\x83\x81\xb5\xbe\xed{]\xbe\x96\x12\x92\xbdJ\x9cX\xbd\xc9\xc8\xc6\xbd2\x97\xbd=\xe74\x07>\x02\xd0\x9d=\xb5\x0b\x07>\x0bH\x17>~U\x08\xbd\x1b\xa39;Z\x84Y>\x06FM\xbe0\xff\xb2=\x15\x83\x8e=\x9a\xa83>}KW\xbe\xd7\x90\xb6>\xe8\x99\x0c\xbc\r\xc3\x11\xbe\xc3\x1b\xff=\xf6wM\xbe\xf5=;\xbd\x103^>\xbdC\xa9=Zr\x1b>\x00\xd4:>\x8d\xdfn=Kl\xb5\xbd\xe04\x03=z\xc8I>\xfdY\xb3=\x12\x99\x05>2x\x99>WF!\xbe\xc7\xff\x8f<D\xab\x16>\x06BQ=0i\xa4<a\xbf$\xbe\xb8\xc0\xe5=\xad\x138>.h\xbd=\xcc\xb4\xb0<K\xf6b\xbb%\x84u\xbe\x1e\xb3L>\xf6B\xba\xbb<\xce\x84=\x8a\x04\xa9>\x95\x07\xa2=]\xec>\xbd\x16*9<b\xc1\xe5\xbc\xb7\xfc8>\x02\xe1\x06\xbe\x0fE\xbb<\x82T\x18=\xcd3~=\x9e\xd7h=\x12\xf9\xcd=6\xf7\x9b=\x8b\x85\x06=\xa5z\x99<\xf8\x0c#=\x96\x14\xf2\xbc\x076'\xbc\x00X\x05\xbdb\x15\xa2<\xfe\xd3\x10\xbe\t\xfc:>F\x8e9=\x96<\x83\xbe\x93[r>\x169o<\xb2\xc8\xd4=\xdds\x91>\x80\xf6\xa0\xbdOR\x17\xbcnrG<\x1f@\xbf\xbd\xd3Q`>\xd5h\r>U\xc6p<\xca\x1c\x83>\xde-\xd6\xbdOQ\xa8=\xa0 \xb9=\xdd0;\xbeV\x15s\xbbM\xba:\xbeu\x12\x8e\xbe\x00\xaa\x1d\xbe\xae\xd4\x02=\xbc\xb5\x84\xbd$\xf8\x95\xbeP\x15:>#m\x15=\xb3\x07>\xbd\xd6k\x92<\xaeB\x06\xbeh\x05\xaa\xbd\x80\x19\x9c>\xb6W\xfb<G\xb4\x8e=\xc2wf\xbe~?\xa9\xbe\xd0\xd1d=\xe0\x9a\xdb=6pM>\xb9\x9b\x88\xbc\xf4I\x1d\xbe\xb8\xafm\xbd#\x14s>N_J9\xda^\x10>ryI=\x9cr)>\xc9,\x95\xbd\n\xd4->\x89R\x9a<vH\xce=j\x1f\xfe=/F\xb6>\xb5\rO>5g\xd6<\xa6\xba\xb7;M\xdcv=\x93yQ="
-p545
-tp546
-bsV445258044860289024
-p547
-g2
-(g3
-(I0
-tp548
-g5
-tp549
-Rp550
-(I1
-(I200
-tp551
-g12
-I00
-S'Y\xf4\x18?}\xf5V>\xf5\x8e\x13\xbf5#\xbf=\xd2\xd5">\xd7\x86f\xbdw\x15S\xbd+\xc7\x89\xbe\xb3%L=\x93\x10\x8c>4f\x14\xbe\xe7,\xec\xbd\x91\r*\xbcER\xd7\xbd?\x85>>M\xc1\xf6>\r\xf9\x9b\xbd\xab\xa7A\xbe\xbcw\x99\xbe\xe5\x12D\xbe\xe9\x15\xd9\xbd\x13t\xd2\xbc\xcf\xb9\xba>c\x98.>\xb1\x89!>\xcf/\x1a\xbeILi>f\x8f\x88=\x8c\x9ey\xbeq\x06\x9d\xbePQ9\xbehi\x93<\xbf(@\xbb\x07\xe9\x15\xbf}}\xe4=\x95\xe7m>\x05I\x99>W\xd1\xab>\xdc\x10\xbc>\xd5\x16\x89\xbexw\xd0\xbeO\x1f\x0f\xbe\x19\x14\x0c\xbdM\xdb\x83\xbd\xddL\xcb\xbe\xad N\xbe$\x12\xce>st)>\xfb\x91?>\xa7\xee\x1a?\x14\xe1\xc9\xbd\xe0 \x08?\xa8\x99z\xbeq\xf0.>\x10\xb6\xd2\xbeZ\xe6\x08=\xa8\x0b\x97=\x8f\xa7\xf7\xbd!n\x13\xbf\xa6\xb7\x0f\xbf\x1d\x83\x0f>m\x13,?\xb3\xc0\xf5>[\xf8L\xbe\xfc\xcd\x08>\xb4h\x14\xbd\xc0L\xbb\xbe\xac]\n?\xd5\x11\xba>\xf4H\x97\xbe>\x1e\'\xbf\xf9N\x13\xbf\xf3\xa3\xe0\xbe\xd9\x91\xb4\xbdd\x99\xfa\xbd\x84{\xb1<\xcbSI\xbd{\xd6\x9e=\xb4\xd4\xf8>\xe7\xa0\x98>y;\x8f<\xb3-\xc7=\x10\x95\xcf>\xbf\xae\xb3\xbeP%C=\xb8[\xa0<5\x10\xcf>\xe5\x8b\xb2\xbe)P\x15?\xaf~\x9c\xbeU\x0b\xcf\xbe\xb0\xe5C>\xdf\x7f\x92\xbeH\xf0\xab\xbeE\xa9\x87>\x03\xfd\xde=\xfb5\xe4>\xd44W>\x03\xe8\x0f>p\xea\xaf\xbe\xc1\xaen;t\x9e\x84>\x8f\xbaS>Zc\x9b>\xd8\x10\x10?\xbdb\x96\xbe\x99\x8d\xbd\xbd\x9b"\x08?\x956\x8e\xba}q\xf2<w\t\'\xbf\x92\xcb\n\xbe1\x95\x05?\x88\xdbK>\x995\xc3=\xd5l\xb4\xbd}\xe1\x02\xbf\x89&\xec=\xf4\xd8H\xbd$\xb6\xed\xbd\xc8`\x17?\x84"\xae>\xb7\xfe\xa5\xbd\xf2r(>\xdf#\xa5=\xf3+\x88>\xa107\xbet\x14X>H\xd3\x19>,\xd8\x9b>H\xe6C>p\x1e!>\xef\x83\xed<u\xd9\xa1=}|\x9a\xbd\x1fN]=-\xe46=\x94\x9d\x05>)\x98\r\xbf\x19:\x12\xbe\xc1\xe7\xc6\xbe\xe9=\xb2>\x19p\x9b>c\x1f\x0f\xbfD\xfb\xd6>\xec\x03\xcb=\x95\xd4\xda\xbc\xc9\xa3[?\x10\xb8\xed\xbc\x9c&\xfa\xbb\xaf0\x16>d7\x97\xbd1\xfdd>\xf7\x8f\xe5=\xe2\xf5\r\xbd\x15\xae\x10?i\xca\xcb\xbe\xb3g\xec\xbb\xed\x00c>\xfd\xdc\xfe\xbe\xfd\x13\x82\xbe\x88d\xec\xbe\x99a.\xbf\x85\xf1\xa1\xbe{\x18->\x18\xc8A=\xd0J\xfb\xbe\xdb\xbf\xed>\x1f/`>a\x8f\x18\xbe\xc4\xa9\xff\xbc\xedH\xb0\xbe\x93C\xe4\xbeAc\xee>\xfb\xeb8<z\x1b\x98>\xb4ft\xbe\xa9/>\xbf4\x1f\xc6>\xf5\xe2&>\xef4\xa9>\x10\xf9\x14<\xe9\x84\x97\xbe\x8b\xa44\xbdd\xb1\x13?\x1b\xcf\x12=aO\xae>\xf3\x9e\xd0=\xde\xf7\xa8>Q\x84t\xbdP\xc7\xa7>-\xd3\x0e=\x7fdP>ey->\xadX5?\x8c\xf0\xc1>_J\x13\xbe\xbd\xb0\x9a\xbc\x98\xfe\x19>#\xbc{\xbe'
-p552
-tp553
-bsV474168552585322497
-p554
-g2
-(g3
-(I0
-tp555
-g5
-tp556
-Rp557
-(I1
-(I200
-tp558
-g12
-I00
-S'\x9cTV>DZ[=iz]\xbe\t\x15?=\xfe\x1f\x85=\xf9\x13\x83;\x86\xce9\xbd\r"\x00\xbe_\xf9\x1b= \n\x15>\xea\xa1[\xbd\xe0[a\xbd\xef\xdf\xae<\xac\x0b\x05\xbd\xbe\x89\xc5=)\xe0]>>\xbe\x8e\xbd\x8f\xd8\xa8\xbd\xec\x00\xf0\xbd\xe0\xd7\xc4\xbde+\xea\xbc\xba\x0e/\xbd\xa5\xa2\x10>D\x11\xba=\xa4\x1f1=\xce\xf26\xbd\xec\xff\xaf=\x00\x13\xce\xb8oD\xeb\xbd\xd9\xf7\x04\xbe9\x81\x02\xbeV\xd2K\xbc\x84\xe0\xd2;\x86,\x8b\xbe\x7f\xd7>=\xd9\x8b\x13>\xf0Y\x1d>\xca\xfd\xd3=-1\x14>\xca"n\xbd\xd6\xb8"\xbe\xc7\xac\xa9\xbd\x94\xedI\xbd\xafu\x1c\xbc\x06F<\xbe\x8c&\x82\xbdQ$Y>\xf4V\xb7=\xd5c\xaa=\xba\xe2\x80>\x85\x02\x1d\xbd\x0b\xd8b>\xa5~\xa6\xbdy\xf56=\x8fLP\xbe\x00aC=\x94#\xfa\xbaL\x88j\xbd\x8bo\x85\xbe\xba\x88\x87\xbe\xe9ry=\x0f\xd4\x88>fr]>T\xad\xcf\xbdg(D=a\xed\x0f=5\xa3:\xbe\xb4\xff_>\x9e\xf4\x11>\xceZ\x10\xbe\xd3S\x82\xbe\x0e\x0b\x89\xbe\xc7\xa4C\xbe.qD\xbd\xaa\x9d8\xbd\xe0ai<J\xee\xb7;\xa9\xb6\x82=;[P>V\x91\x07>Yj\xfb<\x0ev`=\xbc\xfco>\xce\x192\xbe\x176E=\xc7N\x16\xbc\r\xfc\x1a>\xbf\xed(\xbe\xb4\xdc\x8a>7\xac\xc7\xbd\xf2\x17J\xbeg\x0b\xb5=\x19\xde\xd8\xbdO\x13\xe9\xbd\x93\xf8\x17>\xe6\x9e)\xbd\x04\x9bK>\xec\x86\xc1=\x04\xe5\xc3=\xf9\xeb\xec\xbd\x0c \xbe\xbcT\x8f\xe0=\xf9\xb3\xe4=\xac\x9a\x1e>\xfc\x81\x8e>I\xf2\xf6\xbd\x15D[\xbc\'\xd2H>\x0f\xa5\xa0<`\x88F\xbd3\xe6\x80\xbet\xc4\x80\xbd\x99\x8f,>!\xf4\xc3=\xcc\xf6\x92=\xc0\xd9\\\xbc\xc9PN\xbe\n \x0c=\xc3\x8b\x13\xbd\xb5\x84\x89\xbdi+\x87>\x1f\x9a->\xb9\xf7\x80;\xec\xb36;\xb2%\xb7\xbb\x14\x94\x0c>\xc2U\xf8\xbc5\x1f\x83=<\xd0s=T\x19\x0b>\x83K\x84=\xba\x93\x8c=\xf7\xd8\xfa;d\x9b;=\xc4\xf9\x88\xbd{\xc4\x84=\xf0?%:\x9e,V=\xee\x9c\x84\xbe4k\x90\xbd\xfbl2\xbeq\xe53>\x83\xac\x04>r1k\xbe\xbaa\x1e>\x11\xc2\x17=\xd7\xf8\xa0\xbb\xa6\x01\xb7>\xf94f\xbd\xfe\xc3\xf2;\xe7\xc1\xbc\xbb\xcfkf\xbd%G\xcc=\x17L\xa2=\x81\xe6,\xbd\xcdV\x82>\xb2P+\xbe\xb9\xa1\x00\xbc\x1c\xe8\xad=\x0b\xb3q\xbe\xc0\x9a\xe7\xbd\x11\xca%\xbe$\xf0\xa2\xbe6\xe6\xef\xbdy\xf2\xe0<D\xa9\xcb<\x05Ra\xbeD\x19j>\xd7q\x05=g\x83\xa7\xbd\x9f\x8c\x01\xbd\x05\x910\xbe\xbc\xb22\xbe2\xefW>\x15\'\xd5<\x8c\xec\xe5=\xe4\xdd\xfd\xbd\x90\x82\x8b\xbegY&>\x8e\x02\xae=\x9c\xbc?>\x06\x82\xe7<\x04\xc0\xf6\xbd\xd4W\xf6\xbc\t\x93{>\xd6\xf3\xf6<\x91\x13(>\x92=\x8d=v\xc6\x1e>\xb9L\x19\xbd]:\x06>\x8c>\xbb<N\x82\xc6=\xb5wv=\x96\xa7\xa3>\xbc\xc53>[\x00\xc2\xbcz\xec?<&[\xbc=\xa4\xc3\xdf\xbd'
-p559
-tp560
-bsV445269662956146688
-p561
-g2
-(g3
-(I0
-tp562
-g5
-tp563
-Rp564
-(I1
-(I200
-tp565
-g12
-I00
-S'1\xc61?t\x84\x00>\nK\x05\xbf\x073Q\xbe9sg>C~<=$\xd1\xed=\x19\xe1\xf5\xbdMY\xcc=\x93\x00\xbc>o\xc0\x9e\xbdO\xf3\x9f\xbd\x04\xb1\x1e>\x91\x16!\xbe,bX\xbd\xe3\xe0\xc2>q\xe0p\xbd_\t\xf1\xbc\x1e\xbe\xa0\xbe\xb5B\x0c\xbed\xe3\x8b\xbe$7V>\xd1\xd5\x91>?\xbf0>\x9fZ0>!\xf1\x96\xbe<\xede>\xabW\x07\xbd]n\x8f\xbe\xfd\x9e\xac\xbe/\x8a\xd7=\xb4pu=\x0c\xa6q\xbd\x97\xbc\x00\xbf\x98\xad\x10\xbd\xfc\x17\xde=\xb4\xf7\x82>\xc0k\x81>\xf2\xa5\xb9>\x99\xcbl\xbe-l\x8b\xbej\x99\xe3<\x9b\x16\r>\x17N\x88\xbe\x9f\n\xc8\xbd\xb09W\xbe\xf1\xb9\xec>\xcf\xd3\x05\xbd\xfc<\xdc=\xa3\xb1-?\xc1\xfc"\xbdm\x05.?@\x84\xe2\xbeu\x03\x90>dr\xb3\xbe\xd1\xe35>W?i>\xd1\xfd\x14\xbeN\x86\x02\xbf\xd1\xde\xe5\xbe\x17\x10\xb7>\xdc\xce\x13?\xf7"T>\xae<"\xbdIo\xc3=\xd6c\x04\xbc/\xc9\xd7\xbe\x9f\x7f\x12?\x07\xe9\x94<\xe0\x8fd\xbey\xa5\xe2\xbebn\xa0\xbe\xd0hP\xbdW\x13\xfb\xbdzd\x80\xbe5\'\x8b\xbd\x11vf\xbd\xb6U\x11=17:>\xf1\xfcn>\xa1\x9d\xf7\xbd\x87/~\xbd_\xe6\xf1>\xf0,;\xbe!\xa0|<z\x0e\x1a>\xb1\xea\xb4>\xec\x9b\xa1\xbe\x1c\xae\x0c?s,!\xbe*\xbc\xe4\xbeH<\x83=W8\xcd\xbe\x11\xf27\xbe|\xab\xaa>\xcc\xba\x80>l\x14M>\xd4\xfe\x81>\x0f\xca\x03>\x86\x1c\x86\xbe\xc1^\'\xbd\xb6hH>V\xa5\x95>\xee\x97%>\xa1\xb6:>?\x11O\xbe\xacK\xd8=\x10o\xf8>\xbbY\x83\xbd\x14i\x86=8\xa0\x19\xbf\xbfE\xdc\xbdj\x1e\xa4>\xbf=S\xbdS8+\xbc+\xc2\x10\xbe\xa7\xc7\xeb\xbe\xe9\xb1j>\xd7\x06O=\xcd\xe7i\xbc\xf0\xc4\t?\xd7\x13\x0e>D\x85\x10\xbe\x97\xdc\x9c>\x19(\xd2=\xf7l\xb9>\x9a\xbc\x06\xbe\xc7\x8d9=\x93\xd8~=l)@\xbdfs\x87>q<\xd9<a\xa5\xa6:\xc1\x88j\xbc3\x1c\xee=\xb1\x98">\x89c\x8e=Q\xb7\xd3<\xa2\xf6\x84\xbe\x8f\xe1x=\x9a.\x9e\xbey4\xe4=|\xdd">\xaeQ\x04\xbf\x9a_\xc4>\xec\x88*>H\x94+>\x16\x93\x05?a\xa6\xcb\xbd\x81Eo\xbd\xb4/\x93\xbd\x83\xc0\xc4\xbdy\xd9\x83>x\xeb\xaa=+\x94\x98=\xc4\x10\xff>\xbf\xb2\x83\xbe\xa2\xb09=\xf0\x8d\xef=\'L\xc7\xbeA\xebc\xbe\xf4\xf3\x12\xbe\xca\x08\xcc\xbec\xe0\xbd\xbe\xa4\xdf\x90>\xc0\xe6\xf1\xbdR\'\x0f\xbf\xf6\xcem>\xf67\xd7=\xf4Ms\xbd\x93R)>\xbf\xe3\x7f\xbd\xce>+\xbe\xd1\xa81?_\xc0\x0e>\x0c\xdb0>\x100\x89\xbe\x92@9\xbf\x86\xb6\xeb=\xc9G6>q\x00\xbb>\xd7\x8c\xe9\xbc\xa1\xf5\xa2\xbe\xffHo\xbe\xaa{\x9e>\x0e\x84\x80\xbd\xea\xfbq>\x8b\x14\xb9=\xb3\x91\x1f>\xa1\x1b4>\x19\xffj>\xaa\xa5\xd1:E\x85\x87>#\xf6G\xbd\xbf\x10<?\x8fs\x94>\xc5\x15\x1b\xbe\xbf\xdc\xb8\xbd\x8eQ\xa9=\x98#\x17>'
-p566
-tp567
-bsV445232757225295872
-p568
-g2
-(g3
-(I0
-tp569
-g5
-tp570
-Rp571
-(I1
-(I200
-tp572
-g12
-I00
-S'\xcdKM?K\xdb\x9f>\xfd>\xff\xbe\xad(\x01\xbe. \n>D\xab\x1c>\xbfA\x81\xbd\x8ak\x8a\xbe!\xc6\xa6=\xf1\xd9"?\xacpO\xbe\x90+\x9d\xbe\x95\x86$;\x1e\x9bC\xbe99d=i\t\xfc>x\x18Q\xbehM\x9d\xbeN-\xae\xbe\xda\x84\x98\xbe\t19\xbe\xe6m\xb9=\x85\xdf\x9e>hL\xe1>\xa8\x063>\xbd\\\x1f\xbeo\\t>3\x9a\xe4<\xd1\x8f\xd0\xbe{h\x03\xbf\xee\x18-\xbe\xdb\xba\x0c=bZ8\xbd\x8c\xee(\xbf\xd8\n\xcd=\x1e\xa3\xb9>\xaf8\xf3>\xc0\xd7\x81>\xd5\x18\xc8>1\xaa\xde\xbd\x0e\xa2\xbc\xbe\xbc\xe5H\xbe\xe0\xd9_==\xb6\x04\xbe\xa3\xc5\x90\xbefr\x13\xbe\x1d\xd9\x04?\xeah0>\xfc\x16(>\xc3\xdfS?\x0fa8\xbe\x1f\xf0\x18?\xe6 \xc4\xbe\x9d4\x15>\xd7\t#\xbf\xc0\x9c-=\xec\xfd)>\xebai<\xd3\xd3j\xbf\xbd\xcc!\xbfzz\x9f>\xb8\x83e?\xe2\x15\t?IJ\x07\xbe\xec\xa9\xc5\xba\n%L=\x92\xe4\xe3\xbe,WG?\xfe\x14\xab>Tz\xd0\xbe\xa9\xe9\x04\xbf*g\x19\xbf\xc99\xbe\xbe2. \xbeEX5\xbez"\xc6\xbd\x92\xb6\xc1\xbd\xa5\x9a3>\x81\x10\xd8>\xc1\xc9v>;q\x9c=:\xe6\xaa\xbd\xd2\xa4-?`C\xe4\xbe\x02\xdf\xe9=D\x8a)\xbd\xcd\xc9\xa6>\x99\xdb\xad\xbe\xd5\x9e\x16?\x13\xcc?\xbe\x06\xad\xc7\xbecx\xf7=\x01\xaf\x8d\xbe\x90A\xb8\xbe\x00\x99\xcf>_}\xb2<\xfb%\xd3>\xa1\xbf\x95>\xd6K\x1d>\xe0=\xa9\xbe>\x19?\xbe\x1f\x0fT>G\xee\x86>\xc9\x14)>\xca\x1e\x01?)\xd6\xaa\xbe\x0e\xefp=\x1c\xe1\x1e?\xbc\t\x93\xbcT\xdc_\xbd\xb0\x88b\xbf\xb1x2\xbe\xbd\xe9\x01?\x85:7>\xd4\xff\x83>\x94\xd5\xb6\xbd\t\x17\x00\xbf\xd7\xb2D>\x15\x8b}\xbc \xa0\xdb\xbd\xa6\x89\x0f?\xf7\xbe\xa7>\xac\xe2\xff\xbdm\x11\x06>JW\x8e\xbc&\xc4\xb2>,&\xfc\xbd1\xaei>\x9c\xda\xd7=\'\xfc\xae=\x9e\x19\x1b>\x08@z=\x97\xfc\x1b\xbd\xec\xfe\xda<7\xe9\x06\xbe\x1e\xcfj\xbd\x04\x94\x9f::\xef\x7f=\xcf2\x15\xbf\xeb\x97\xcc\xbd\xd4\x9f\xa4\xbei\x95->\x88\x8f\xc1>s\xcf\x0b\xbf\x12$)?a\xd2\xc3>\x06\xbe{=\x14\x13t?\xc8\xb2\xa8\xbdvu\x1a\xbc\x8b;\x7f\xbd\xee.n\xbeP\xb6\xb6>\xffzM> y\xb1\xbd\x88\x02\x02?\x1a\xe2\xcd\xbe\xf4\x7f\xbe<\x84\xf0,>\xd3\xec%\xbf\xc9\\\xeb\xbe?\xd1\xb7\xbe\xe8r6\xbft\xbd\xe9\xbe\xa2.x>@>\xf8\xbc\xa6\xdd\x18\xbf\xf0\xd9\xcf>\x10-{>oF\xf1\xbd&^\xc2\xbc\x9f\xb7\x8b\xbefi\xd5\xbe*\x076?W|\xee=\xb2s\xc7>mp\xc2\xbe\'\x84X\xbf\xc01:>\xb5\xcc6>\xf9\xc5\xc5>\x8b\xbf.<\x12\x90\xd6\xbe\xbbP\xab\xbeK["?eOI\xbd\xc8s2>\x9f\t\xfb=\x0e\xd7\x8f>v\xa0\xa2=\x94\x0fT>||\x9d\xbce\x13\x81>\x8f\xc2%>x\x19a?\x86\xe3\x04?\xaf\xddh\xbe$\xe0%\xbd\xfbL\x92>\xdd\xba\x07\xbd'
-p573
-tp574
-bsV445233560220217344
-p575
-g2
-(g3
-(I0
-tp576
-g5
-tp577
-Rp578
-(I1
-(I200
-tp579
-g12
-I00
-S'\xa6\xeb\x07?\xbaqg>\x83\x0f\xe9\xbe\x85\xd0\xb3<\x00\xf3\x15>j>:\xbdH\x0f\x9d\xbdv\x0b\x84\xbeh\xf6A<\xf4\x87\x94>\xe4\x82\xbd\xbd\x1d\xaf\xef\xbd\xc6\xf9j\xbc\x80\xcbd\xbd\xd6\xb1\xb0=;\x11\xd8>\xda\x98\xca\xbd\xd0\xf2a\xbe\xa2S`\xbeNn\xe6\xbd\xca\xc5\x12\xbeC\x882<"\xa8\x85>\x1dT\xcc=;ua="\xe8\x87\xbd^\x93,>\xd2\x04\x06\xbd su\xbe\xf6\xec?\xbemT\xb1\xbdu\xe5~\xbc\xe7\xc1\x96\xbc\xfb\x15\xc5\xbe3\xd0\x02>\xdd\xaa\x8b>/\x8b\x97>\xcai\x84>\xe7\t\x9c>\x8b\xda\xc5\xbd%\xe5c\xbe\xd6:\t\xbe\xed\x19\xf1<J\x1b\xdf\xbd\xd6\xc6\x91\xbe7j\x86\xbd\xbb\xf4\xb0>\xb2T\xa1=(\x92\xd9=\xbfJ\x0b?b\xfc{\xbd\xa7\xdc\xc3>\x9e\xd3U\xbeX\xc9\x97= \xdc\xe7\xbe\xd5\xc6`=\x13\xb0\xd1=\xbc2\x92\xbc\xa9\xce\x10\xbf\xce\x8a\xf1\xbe\xfa\xd2+>\x9eq\x0b?d\xf2\x9a>\x86l/\xbe\x0b\xaeU=p!|=\xb2\x08w\xbe\xbe\xae\xf9>\x1c\xd83>\x06{\x88\xbe\xb2\xe0\x02\xbf\x8a\xee\xe6\xbe\xeb"\xbf\xbeZ\xe0\xaa\xbd\xee\xe7\xe4\xbdf;8=\xdd\x11Y<}-\xe5=\x91\n\xa1>\xe6\r^>T\x01\x8d=Z\xf3\x01\xb9\xd1\x93\x9d>a\t\xa7\xbe\xedE\xee=Ji<=q$\x8a>\x8e\x03\x81\xbe\xb3\xa7\xed>Gl\x06\xbero\x88\xbe\xa6_N>T\n\x84\xbe\xfc\x9dG\xbe6\xdb\x86>v.8=\xba\xa9\xa7>:7Z>z\x98\xe5=\xb5nq\xbev\x0f\x17\xbd\x9dsi>\x06\xdf\xfb=\x8a":>P\xe1\x01?\xca\x0b\x84\xbe\xee\xb3\xbf\xbc\x0e\x1e\xc7>\x0e\xcd}\xbc*1F\xbd@\x0c\xfe\xbe\xba\xdc\x9b;\xed\'\xc2>="T>\x9a\xb8\x0e>\xb5"\x99\xbd1\xb4\xc8\xbe\xf1\xce\x1e>\xfd\xc7\x02\xbc\xda\xd1\x04\xbd\x85\xc9\xf1>\xe0Lr>v\xe8\x8c\xbd\x0fq\x84=\xa1\x96>=\xee\xd9X>\xd2D\x10\xbe"&k>J\rg=\xf8R\xd8=\x84I\xb2=\x88\xae\x1a>"E6<`\xb6\x96<R\x90\xba\xbds&\xe4\xbc\xfb\x00\xba\xbc\xa6\xe9\x83=6\xc1\xc5\xbeb\x8f\xc8\xbd5\x96Q\xbe\x00Lu>\xfdo\x83>\x85\xf2\xc2\xbe\x86{\xe5>\xc6\x82\'>\xd3\xbb\xde<B,,?{\xbfv\xbd\xc6\xb1\xc2<#\x15\xe7=x\x10\xb9\xbd\x8d\xdfe>2l\x0c>8\x1a^\xbdo\xcc\xbb>\xbd\xc2l\xbe\xe6/H=\xb4\x03>>\x9d\x8c\xc8\xbe0\xc0T\xbe\x16\xac\x97\xbe;\xab\xed\xbe3N\x86\xbe=\xd0\xd9=N\xae\xb2\xbc\xdc\x9b\xc2\xbe\x0b\xfb\xb2>=\x02F>\x93{\xb4\xbd\xc7T\x97\xbc\x16\x02\x83\xbe\xb3\xe0\x9e\xbez\xc6\xd9>n\xaa2=Y\x0f\x85>;\x1c\x83\xbeU\xa0\x15\xbf\x15\xbeF>^\xd33>\xdf\x04\x89>\xb5\xb2\xb9\xbco(\x86\xbe\xb2A\x13\xbe\x1a9\xe6>L\xe7)\xbdW\xa4A>\xee\x0c\xa0=DX\x83>\xa64\x85\xbd\xf0\xdfG>_\x0e\x1e<\xed\xf3*>3\x89k>rI\xfd>\xa31\xcd>bw\xd8\xbd\xf2"\x07=\xea\x1f\x01>6\xeb\xad\xbd'
-p580
-tp581
-bsV474112987838820353
-p582
-g2
-(g3
-(I0
-tp583
-g5
-tp584
-Rp585
-(I1
-(I200
-tp586
-g12
-I00
-S'{V(?\xf1\xa7D>|\xea\x1d\xbf\xec\xa4\xd3=2\x055>\xee\xd2\xa6\xbc\x80\x84\xbe\xbd*p\x87\xbez\xe5\xeb=\x8b\x8e\xb8>\x16\xdc\x15\xbe\xe5\r\xf9\xbdL?2=y\xd3\xcd\xbd\x05\xa9?>gz\x00?\xcc\x02\xe8\xbd\xbb\xa9:\xbeI\x9a\x97\xbe\xcb\xb2^\xbe\x9e\r\xe2\xbd\x87W\r\xbb \xc2\xb8>Jn,>\x01~\x17>\xc6\xeb#\xbe\xe7\xc3z>\x97\xad\xc3=t\xec\x9a\xbe\xc4\x9d\x93\xbe\x94}\'\xbe\xba\xab\x9d<\xcf\xb3\x84\xba\xf0\xa7"\xbf\x00&\xca=\xf1+\x8d>\x00\xe2\xae>\x91\xbd\xa1>V-\xdf>\xd8\xcc\x8a\xbe\xccY\xd6\xben]\xdb\xbd_yk\xbc\x8a\xc7y\xbd"\x1d\xd9\xbe\xb7\x9e_\xbe ;\r?\xa5RE>\xfb\xae:>E\x872?\x06\xf4o\xbd\xafb\x1a?Y\x99\x92\xbe\xef\xa1B>>\x99\x03\xbfyG\xe2=Q\x13w=\x85T\xe3\xbd\x9f\xc2 \xbf\x9eH\x17\xbf\x0c\xc3;>\xff\xb0/?\xa4;\x07?u@I\xbe\xda0\x1c>6{\x90\xbb\xae^\xe5\xbe\x1e9\x1d?A\\\xbf>\x1b\x88\x87\xbe\x0e\xb21\xbf\xe6\xd8\x1d\xbf\x86\x89\xd0\xbe\x8f\xe0\xcd\xbd"\xe6\x1b\xbe\xd78T=\x12T\xa7\xbd\x8e4\xec=|Z\xf2>\xb7\xdd\x8c>5\xf7\x85<\x86E\x95=\xc3\xbe\x02?T\xe0\xbd\xbe\x9b\xcc\\=1\x92\x97=\\\x1e\xe2>be\xb8\xbe\xf1\xbe\x1b?(\xbc\x94\xbeV\xf1\xdc\xbe\xbb\x8a]>\x1e\x10\xb8\xbe\xd0\xf1\xa7\xbe\x1f~\x91>\n\xa8\x94=\'\x19\xdf>`\x9a~>\xdc\x1c>>)\x94\xa9\xbeg\x9e\x07\xbc\xe4\xc4\x8c>D@\x85>\xa52\xa3>\xdf\xdc\x15?$,\x9a\xbe\x9ev]\xbd\xb2_\x11?t\x86\xdf\xbc\xa22\xf1\xbc\xc4\xc12\xbf\xc7\x8c\x00\xbe+\xa2\x11?Bnf>\xfe\x11\x15>\x13L\x00\xbe\x9eP\x0b\xbf\x15\x18.>\xee\x94#\xbd\xc4\x0f\xf5\xbdO\xcb\x1f?\x8b\xe5\xc1>\xf2\xe3\xfb\xbd\xfce\x05>\xd7\xee\x85=,\x86\x96>\x86\xbb-\xbejr">\x06\x15\x1f>\xee\x94\x88>2\x0b\x81>\x1f\xc0Q>\xbf\x8a\x1a\xbcE\x03\xe2=Q\xe2\xa1\xbdj\x07r=&\xb4\xa4=\x9a\x1b\x9c=\xda9\x17\xbf\xe6\xcc!\xbe\xa7\xea\xd8\xbe\x85\xc6\xaa>2K\xb1>2\xf7\x17\xbfU\xf8\xc6>\x99\x94\xe9=-3\x9a<BWR?\xc4\x06\xae\xbd,\xbd\xc2\xbc\xe2\x8a\x07>\x07\xc8\xc2\xbd\xbc\xd6\x7f>5\xa8&>\xe4\x80\x8f\xbd\xd1\x98\x1b?D\xcc\xcd\xbe~@t<\x17j`>q\xe0\x0e\xbfJ\x9c\x9b\xbeX\xf9\x00\xbfD\x06B\xbf\x12\xcb\x88\xbe\xe9\x9f<>\xbet\xda<\x1cE\x13\xbf\x91\xf7\xfe>\xc7V/>\xca\x97\'\xbev"+\xbd\xbc\xec\xba\xbedd\xd1\xbef"\x13?L\xc4\x8e<\xa05\xa2>\x99\x90\x91\xbe\xb7\xc1P\xbfb#\xbc>o\x9a,>n\xa5\xc4>\x8cC =\xcbA\xa9\xbe\x12\x07\x15\xbeJ\'\t?a\xdcV=\x1fC\xac>"\xc0\x17>\xb2\xf3\xbb>\xd6\xbb+\xbd<\xa1\xb3>0g^=;\x04\x85>)_\x0e>\xda5T?\x80\xfc\xce>\xc2\x11\x03\xbe\xba\x19\xb3<K68>\x9f\'E\xbe'
-p587
-tp588
-bs.
\ No newline at end of file
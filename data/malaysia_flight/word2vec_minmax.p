@@ -1,1429 +0,0 @@
-(dp0
-V445269155327913984
-p1
-cnumpy.core.multiarray
-_reconstruct
-p2
-(cnumpy
-ndarray
-p3
-(I0
-tp4
-S'b'
-p5
-tp6
-Rp7
-(I1
-(I400
-tp8
-cnumpy
-dtype
-p9
-(S'f4'
-p10
-I0
-I1
-tp11
-Rp12
-(I3
-S'<'
-p13
-NNNI-1
-I-1
-I0
-tp14
-bI00
-S'\x0e\x8aO;\x9b\xef4\xbe\xc7L\xa5\xbfP\xcf:\xbfq:\xca\xbb -E\xbfj%\x87\xbe\xa8\xe4\x8e\xbf\x13\xa5\x1a\xbf\xce\xcd\xa9:VP\xe0\xbe\xf6\x98D\xbf=bf\xbfv\xb9>\xbe)\xe5\xb3\xbe\xb0:\xdf\xb9w\xe3R\xbf\x977S\xbf\xdc\xd3\x9f\xbfS\xd8\x88\xbf\xc7\x13\x02\xbf\x92\xc5\xb2\xbe6\xb9L\xba\x9f\xcc\xc4\xbe\x11\x08.\xbf\xfe\xb5;\xbfz\xe5p\xbb\xb0\xc9?\xbf\x9d\xd7B\xbf\xc2\x95{\xbf-\x91\xa1\xbfg\x89\xa3\xbfyq.\xbfC\x1a\xc2\xbf\xb57z\xbe\x8b\xdb\xed\xbb@\xdc\x83;\xc9f\xa79;\x0b\xa6\xba\x0c\xbc:\xbf\x8a\x8f\xa9\xbf\x19\x16\xbc\xbfwI\xc5\xbe\x07`f\xbe\xf4E\xbc\xbf7F\x1d\xbfV\xd6%:b\xcc\xd1\xbeg\x8d<\xbe\xb9sl\xbb\xfe\x1fL\xbf\xf2\x8e\x02\xbc\xa1_0\xbf\xed\x87\r\xbe\xfa\xe5\x9e\xbf\xc8n\x18\xbfu\xb2\xd8\xbe9"=\xbf_\xe7\xf0\xbf\xbf:\xba\xbfj_,\xbf\x05H\x0e\xbdT\\n;\xff\xfd\xeb\xbe+\xac\xcd\xbdB\x81\xfd\xbe%\x98\xa9\xbf\xdbf\xd5:s\xe5\xa6\xbe\xdb>\x8e\xbf\xed\x08\x04\xc0/\xa5f\xbf2\x1e\xb7\xbfu\x06j\xbf\x98xr\xbf<Au\xbf\x90\xd5_\xbf\x95k\xc2\xba\xa0Eb\xbd\\ N\xbb\x8eP\xc9\xbe\x909\xe5\xbe\xc0Cr:\xe6\xb1\x83\xbf\x92*\x11\xba6\xdc\x8f\xbeW\x07&\xbcy\x15\x80\xbf\xfc\xb2b\xba\x1cOq\xbf\xa8^\xcd\xbf\x04b\x189a\x84\xb0\xbf\x07<\x8e\xbf\xc1\xa2q\xbb\xd7)\xcf\xbe\xce\xd7s\xba\x8bg\xf9\xb9z\xf7\x8a\xbe\x16\x8f\x98\xbf\x80\xad*\xbf\x87\xdf\xcb\xbc\x02b)\xbd\x1cb\x84:\x1e\xc7\x05\xbc\xa3\x8d\x9e\xbf\xdc7\xcd\xbeG{\x1e;\xf1\xb9\x17\xbf\x9c(\xbf\xbe\x89\xd8\xfa\xbf\xbe\xa9q\xbf\xa6\xbb\x849%\t\xfd\xbd\r\xe9\xa2\xbej\xb3\x9d\xbe\x1f\xd6\x8d\xbf1\xbf\xbb\xbbX\x88\xa6\xbe\xedY\x12\xbfS=\xf3\xbbW\x87N;\xaeq\x1c\xbf\xde\x08\x00\xbf\xffa+\xbf\x03\xa8\xc6\xbbGb5\xbf\xddLZ\xbeh\xf8\x85\xbciz\xcc\xbe\xebz\x9d\xbe\xd1#\xe4:J\xac\xa8\xbd\xe9\x80V\xbf\xb5.\x10\xbfT\x9a\xfc\xbe\xad\xfa;\xbf\xe2\xc3\xda\xbe\\\x12\xe9\xbfK_>\xbf[\xc3M\xbf!\xb5\x13\xbf#\nb\xbdQ\xc0\x91\xbf>=\x0f\xbb*\x00\xfc\xbe\xdf&\x0e\xbfQ=\xfd\xba%\xc3\x0b\xbf\xca\xd6\xd1\xbe\xed \x89\xbeE\xb9\x9a\xbe\xe3_\xba\xbb\xce\xc2*\xbf\xd8\xa7\xd4\xbe\xbe{\n\xbb\t\x8a\x86\xbf\xe0\x02\x97:\xf7p$\xbaP\x9bf\xbf\x15\x8f\xd8\xbf1V\xa5\xbf\xc2\xf9\xe5\xbf\x9bm\x8d\xbf\xf09\x82\xbd\xfe,\x8d\xbe\xd8\xe0\x9c\xbf\xdf\xad\x18\xbb\xc5[e\xbd\xff/\xd2\xbe\xc5[\x92\xbe"\xec\xa5\xbf\x16\xfd\x8f\xbfS\xb3`\xbc\xa3|\x13\xbel\x95\xcd\xbd\x1f@O\xbf\x8a3\xcf\xbf\x9b>\x93:yn\xb29\x82-b:\x93\xaa\xb5\xbe\x19\xacS\xbf\x0caK\xbf\x14\xeb\x11\xbb\xa8\xe8\x9c\xbe\x1cxm\xba\x9c\xd5\x1e\xbd\xb0\x88\x00\xbd$m\x08\xbfb\xc9i;\x83\xb7\x0c\xbet}}\xbe\x0b?_\xbe\xfa\x18\x0f<\x1cn\xa7\xbd\xd9\xa8\xa9\xbf\xb2\x1e<\xbe@/\xcd\xbe\x98\x0c\x96\xbf!\xef\x0b@\xd6\xb4#?\nC\x04<\xb9\xfc\x02?\x0bS\xb3?$C\x0f?$\xae0?8\xf3\x0f:\x13"\x15?\xdf\x84\xb5?\xf6\xf0\x19>\xe0m^?\x973\xd3>\x93r\x1b?\xadT\xe6>\xeb\t\xd2?\xd6\xbe\xc5=\t\xedj>\xd3\xd8\x14\xbb\xec\xd8\x8a\xbaq\x97z?\xc0)\xfa>4\x8cl?o\x8a\xa9?\xf5\xfc\x02?9-\xc2=\xbd&<?\x91\x8c\\>\xad\xf3\x8d>\xde/\xcf>xc\x81>\xa4;*>\x12\xd8\xf3=Zjz\xba\x01\x86\xef>\x94\xf6\xe1?\xd7\xc1\xb7?\xc6\xb2X?\xe7&v?\x83\x06\xc6>c\xa9?\xbb?\xe0B:\x9b2\x86>M\x06*?\xf0\x85\x9c>\xaf\xe2\xfd=\xc0\xab\xb9?6rD?\x0f\x08\x12?Y\xef\xe8?\xf6\x13\x96=\x97\x1c\x8e?[JW>\xe7}k?\xcbt\x12;\'\xaf\x88>\x14\x80\x05?\xd2\xf9\x06?y>\x93\xbb\xb9\xc5\xd1;R\xe4&?\xaf\x02\t@\xde\x05\xb0?\xe1M\xa9>\xb6EM?\x89\xa1\x80>\x81\xd2*=\x1eU\xd8?\xed\x88\xc3?\x94s\x99=E\xdd{;\xc2\x9b=;Hqy>\x1f\xbfV=c\x82j>\x0b1\n>i\xa9\xb5>\xbd\xd4\xef>\xb3y\xc0?-0|?}\xe9\x14?\xacn^?\x9e|\xb1?\x1e\xae\x88\xba\xe3\xfbL?T&\xf2>\x97&\x98?\xec\xdd\x9c=\r\xb9\xe8?\x86\xec\xe1=\\\xba\x9d<\xfa\xf9\xb9?\xa9s\x17>\x16\xf0\xe7=\x7f\x84\xcb?\x98\x0f;?V\xab\x04@\x1a\x80\x96?\x93^v?\xed\xed\x07\xbbT \x82>g\x82\x89?\xe1\xa4\x18?r\xd9[?\x0b\xa5\xd2?\x97jq;\x96\xe6\x1a?`\xb2\xb1?V\xed\xc7>\xa3\xa2??\x01\x1f]=\xda\xd3%>|\xc4\xaf?D\xc0\x83?Y2\xd2?\xff\xd1\x03?\xc7\xde ;\xfcu!?\r\x1a\x17>\xc5C >\xd0\x03\xa7?@\x86\xf7?\x1a\x98\x84>\'\xb6\n?\xed\xcd%?\xe3\n3?\xf3\xe6\xdd=\xc2\x95\x7f?\xc8\xbfD?\x83\xeb1?e\xdc\x1b?Xm\xd2?\xe2\xaf\x87?(\x16\xa6<c\tn?\x04\xec)?\\m\xb7;\x82\xb4\xd7>\xc5\xb6>>\xac\xfc\xcf=\xb6\xc1n\xba\xa3\xc3t?i\xa2s?\xdaA\x1c\xba\xe2\xdf\xcc??fg?\x05V\x13>\xc4\xe4\x13@\xe7T\xfa>\x1ei\x82?\x00,\xa4??C.?\x0c\x956?\x018\xd0>\xf2C\xa5>\xca\xcb\xb0?\xc5~\x10\xbb8\xc2L?zWY?\xbf\xa43=NM\x9e=\x83\x83C;\x05\xdf\xb2:>4\x05\xbbf9\x03?\xdc\'~?\xcb\x8e\x02<\xd6\xdb\x14?\'\xe0@?\xae\xa3??C\x10\xa1>\xaa=\x95>L\xd9\xd7=\xad\xf4\xa3?lC\x1d?"\xaf\x94?\x00O\xcc:\x8e\xb2 \xbbi1\xf2?Mw$?\xdf\x81\x99?\x82\xc4+> W\x8d;i~X?i\xbf\x1a@\xd4Q\x1f?\x07b\x97?T#\xf8>\xbd\x15\x06? \x97\x08?\xfe-\xa3?N\x8f[?Q"\xa8>q\x8a(?[\x12\xf4?\xf4\xbdm?\x89\x18\xe2=-\x1e\xad>\xc1A\x0b?\x8b7\'?'
-p15
-tp16
-bsV445233019721637888
-p17
-g2
-(g3
-(I0
-tp18
-g5
-tp19
-Rp20
-(I1
-(I400
-tp21
-g12
-I00
-S'\x90\x7f\x90;\x1cV>\xbc\xa0B\xae\xbf\x9bN8\xbf\xa3 o;\xf4\xd6_\xbf\xa4To\xbe\xb1\xb7\x89\xbf\x96\xe1\x11\xbf\xa0\x8e9\xbeC\xde\x02\xbf\xc7\x8f\x83\xbeH\x0e[\xbf\xb0\xe8+\xbf\x9f7\x07\xbf\xbc\xe1\xc2;\xdd\xa2\x13\xbf\xb2qQ\xbf\xaa2,\xbf=9>\xbf\xe0d\xbc\xbe\x92\xc5\xb2\xbey\xba\x98\xbb.\xa5\xdd\xbe\x8b\xeb\xfe\xbe]OI\xbe\xd1\xd2\x97;\xed\xa6\xf9\xbe\xbe\xe5\xbf\xbe\xd6\xb0\x84\xbe(,+\xbfNn?\xbf\x8e{\xb5\xbe\xc6\xa1\x80\xbf\xdf\x86:\xbe3\x91\x1c<5\x07\x1d;S\x80g;\x0e\x10\xb3;\x18\x9e\xa8\xbe\x99b\xa4\xbf\xd3\x82\x8b\xbf\xcbl\x05\xbf\xebsj\xbe\xe4\x13\xc6\xbf#D\x9e\xbeY\nr;Py\x1e\xbe*xW\xbe\x03\x9a\xf8;\xd2~\x18\xbeR\xec\xfd:\xd3"\x0e\xbe\xa5\n\x92\xbd |\x8d\xbf5K\xed\xbeku\x16\xbe9"=\xbf\xb0\xe6\xc2\xbf\x11\xc4R\xbf\x80\x90u\xbf|\x08\xdd;\x06&\xb3;\'\x9f\xe0\xbe"\xee6\xbc\xb7\x87\xbd\xbc\xc5\x03s\xbe\x1e\x80\x82;]:5\xbe\xd9q?\xbf\xc2\xb5\xed\xbf\xb4\xc6\x95\xbf\x14\xee\xc9\xbf\xc9u\xee\xbdYz\xcf\xbe\xeb\xb6\xda\xbe\xa4p\x00\xbe\xfd\x11\x8c;&.\x06<I\x19\xb4;Y\xa6\xe8\xbc.67\xbe\x9c\xad\xa0\xbeQ\x96\x1c\xbf\xb9\xe0\x93:eFZ\xbe \x08\xab9\xb5\xbba\xbf[\xfe)<\xd3lz\xbf3-n\xbf\r\xe7\x18;\xdb\x1f\x99\xbf\x94\x9f\x97\xbf\xf2\x1b\x8b;\xc0\xda\x91\xbe\x08s\x17<|k\xb6;*\'\xf0\xbe\xb7%\x84\xbf\x8f>]\xbe\xd0\xa7\x88;\xb6\xc1\x8a\xbeEu\xb4;\x9ei\xfd;,J\x96\xbfW="\xbf\xd8\x1ey;1g#\xbf3\x93\x99:P\xeb\xcd\xbf\xf7/\x7f\xbeFFZ;\x8f6R;\'\xc5V\xbe\xd8\x1c}\xbf\xfb"\x8f\xbfV\xc4\x95;\xc7}\xac\xbf\x93\xdb\xde\xbe\xf7\x8f\x06<\x8c\xcfB;?\xda\xde\xbe7?O\xbe\xfc\x83\xb1\xbep\xe5z;\xde\x85\x95\xbf][\xa7:\x009,\xbf\x0c\xf9N\xbek\xeb\xc7\xbd\x96\\m;hfI;D\x9c\xa8\xbe\x89\xb1\x1a\xbe\xfc\xf6\x07\xbf\xf4\x00n\xbf\xd6\xc8+\xbeK$\xca\xbfh\xa8*\xbf[\xc3M\xbf\x11\x80\xd8;\xcd\x93\xfe:T6\xa9\xbf\x08\xc5\x06<*\x00\xfc\xbeAM\t\xbfn19<f\\\xb2\xbe%\xae\xd3:\xec\xf8\x8d:\xbe\nL\xbe\x1e\xe1\x10<\xb1v\x9a;b\xc7\xa5\xbe\xdc\xd6\xc5;2k\x1a\xbf\xb3\x16\xbb: \xe4.;\xb8\xb2\xca\xbeh\xe2p\xbf\x13\x83\x84\xbfI[\xaa\xbf\x98J\x9b\xbf\x80\xa9U\xbd\xd3\x15\xab\xbe\x90\x04v\xbf;\xda\x99\xbe\xc5[e\xbd\xc2\xc9\r\xbe\xd2/Q\xbe-P|\xbf\x88\xd3W\xbf*\xe2\x8f;NU\xa8\xbe\xbe_i:\x18\xf5G\xbf\xb0B\x9a\xbf\x06\x05\x8b;Hh":\x08\x19\xa2;C\xde)\xbf\x88\xd2\xa8\xbe\x9bi\x0c\xbf}\xc6\xe8;yO\xa8\xbe\xb6\xa0!;\xaf\xf6\xad\xbbB\x0e\x0c<)("\xbfE\x16\xb6;\xd9\x85\xe8:\xb0Hh\xbe\x08\x99\xa6;.\xef.<\\\x7f\xbe;\r\xb0\xa1\xbf\xa3%\xa1\xbc\xd6\x00\x91\xbe\x9a\xc9\xc7\xbf\x9c\xa3\xbb?\xe8\xecA?\x80\xd8=\xbb\x8c\x85b?4{\x88?qA\xa3\xb93>\x9f>\xab\xa2\x0f\xbcG\xeb\x8a>\xa9\x97\x8a>\x91\x03\xff=\'{\x9b>M^\x16?k\xfe\xfb>\xadT\xe6>\xa6t\x9e?\xaf\xfe\xfc\xba\t\xedj>l\xa41\xba\x12\x05\x16>@\xe5\xc8>\x9b\xf7\xfe=\xaeZ\x97?\xe5C >\xc7\x1c\x87>\xfd\x0c\xf4=\xd9\x8c5?\xd8\n(>\xe0\xd2\x1b?e\xa7\x00?vM\x80=\x00,\x89>\x9e;\'>O,\xe5\xbb\xf6\x98\xa8>\\\xac\x95?9I\x98?O\xe0g?/\x9c\x9b?\xe9\x9c\xfa=\x9ep\x18\xbb\xd7\x04\x8e\xbbN\tT?\xc4<\xce>\xdb9\xae\xbb\xbd\xf9\x06\xbb\x075C?\xdd\xaa-?\x0f\x08\x12?~\xe1\x93?+\n\xb7>\x85\xca\x1c?[JW>\xcaF\x86>y\xc2\x02\xbc5k\xea=\xa0\xbb\'?:\x9a\x14?\xef\xe7>\xbc\xb9\x86\xbd\xbb\x7f\xbd*>z\xba\x9a?2pe?:c\xc9=U\xa7\x1f?\x04\xfc\xe7>\xfd=\x04<\xa4\x8d\xbe?\xf5\xa7\xd4>\xc1\xea\xa5>\x1b\xe0,\xbc\x92W\x9e\xbbf\xe8\x87\xbb\x18FE?V\xb6\x93=\xb0c\xb1>\x98.\xb6>YG\x11?\x19\xde\xb8?\x9e\x97R?\xf5\xad=?\xacn^?\xca\xf8\xd3>m\xd6,\xbb\xcd\xf7\xe0>~v\x96>!\x1dN?\x8c\xb1\xc9\xbb\xa8v\xdf?\xecQ\x8c\xba\xd06:\xbb\xd0\xf5\x9a?r\x97\x83\xbbE\xdf\x92\xba\x9f!A?\x8a\xe9,?\xa7\xbb\xe3?@(\x83?6_o?\x10\xd2\xdf\xb9Y\xf76?]\xb0,?C\x8b\x89>\xb7\xb7R?x\x81\xc7?Q\x8a\x13\xbcRk\x89>\x1bE\x9d?\xecYq>\x1cF\x18?\xb8\xa2\x81\xbb\x88\x8c\x11?a\x15\xca?D\xd7o?\x9b\xdbJ?\x8fI\n>\x89g\xa4\xbb\xbf\xcab?U\xfb\xb0=\xa6\xcb#?\xd0\x03\xa7?\x0b\x9fm?\x97\x0e\xe9\xb9\x0e\xf2\xe0>F\x84\xe4>\xc5\x15\xcf>\xf3\xe6\xdd=_\xc6\x8c?)&\xbe>DP"?\xd6\x869?\xb2\xbe\xcf?\x08\x17H?\x9c\xdb\x8b>\xacs2?"")? \xad[\xbb7\x15\xe0>\xb8F\xc1=4EJ=\x11H\xc8=\x7f\xd0\x80?1\x95G?\xad\xbb\xd0\xbb\x9b\x9fc?p\x02\x99>\x08&\xf8=\x8c\x13\xda?Tc\xa5>{"\x85?\x8b|\xc5?b\x00\x1c?u\xa0V?:b\xe0>\xd9M\xaa>\xe8[\xaf?\xb4\xa1\xe5\xba\xe8\xd5\x17?\x06\x9e\x97?\x14J[\xbb\xd4g\xad<\x01\x05\xa7\xbb\x9e\x12\x13\xbc\xf0=\x9c\xbaiI\x95>\x06\xc6P?\x0b\xe2\xda\xbb\x92K\x17?o\x9c\xa2?\x13_\x1f?\xd1\xc0(>\xd0V\xc5\xbb3\xd5(>\xaee\xf8>r\xeb\x9a=\xee\x91\x8c?\xebD\xa0\xbb\xaa\xb2\xc5\xbb\xffZ\xd8?\xc9\x1b\x02?=\xebb?@s\xa2<\xb0\xed\x19>\xfc\x8b\xfd>m\xfc\xc3??\xa4\x92>\x95\x10\x94?}Tl>tD;?\x81\x01)\xbb5\x05@?\x14%\x8f?mX\xa6>\x80\x95\x8f?\xe7\x83\x83?iN\x86?Z\xd7\xfa;\xfa\xe3\xd0>\xb9}v>Y\x8e4>'
-p22
-tp23
-bsV474094092717015040
-p24
-g2
-(g3
-(I0
-tp25
-g5
-tp26
-Rp27
-(I1
-(I400
-tp28
-g9
-(S'f4'
-p29
-I0
-I1
-tp30
-Rp31
-(I3
-S'<'
-p32
-NNNI-1
-I-1
-I0
-tp33
-bI00
-S'G\x1b\x03>%\x1d\x07\xbc\xe4f\t\xbe\x88\xaa%<\xac2\xbf=0#/\xbc\xeb[\xc3\xbc\xcc\xfe\xb1\xbd%T\xae\xbc\xf7\xf3\xbf=\xac6V;=A\t\xbd\xc6\x9a*=\xea*$<\x1a\xcf\x0c\xbd\x1cx\r>Kw\x01\xbdU\x16-\xbd\xd5\xbbe\xbdTg\xc6\xbc9J\xb5\xbd\x8f\x0c\xec;r\xfaA=qk=\xbd\xe6\xe44\xbc\x08\xcc(\xbd9\x9a\x9d=\xf3f\x88\xbdEc\xe1\xbd\x8c\xe6\xfe:\xe7\x16?\xbd\xfa\x0f"\xbd\t]\x16=\xa7\x9d\x01\xbeh\x84\x9c<"\x9f\x04>\xde\xb9i=\xff\x9fB=H\xe9\xf5=%\xcc\x1f=\x9a\xe75\xbd\xe5I\xc2\xbc\xd5ou=\xd0U\x98\xbd\xfc\xe3\x8d\xbd<d\x8c\xbc\x83\xe7\x0f>\x83\x0c\x14=\x84\x01\xaf<H\xe6,>\xe2\xfb\n\xbc3\xb3\x17>yTv\xbdb\x83\xb8\xbb,\x0e*\xbeYI\x8a=T\x80\xbc\xbb\x0fh\x1b\xbd\xa6\xa8J\xbe:\x08#\xbeG\xd2\x94=\t~\xb0=\xa4\xd0\xee< \x1e\xb8\xbd\xe1f\x0b\xbc\x8a%\x9a=\xa42\xb5\xbdK&\xb5=F\x08\\\xbdN\xf7\x85\xbd\xbf<?\xbe\xf3\xba\xf9\xbd\xa7\x95\xb2\xbc\x8f\xeb5\xbd\tSW\xbd\x95Hx=u\xb6\x93=2\xfbz=r<\x95=\x8a\x8f\xa2=(Z\x8f\xbc\xb1\xd6,<\x8dy\x02>\x0e\x85\xb7\xbdn\xffs=b/\x19=\xbc-\x98=\x89W\xfa\xbd\xadR?>\xd2\x86\x87<3D\x8f\xbd\xa5 [=\xd8#\x99\xbd\xf43p\xbc\xc8\x10\xe6=\xa3\xd4^\xbb5\xc4\xc4=O\x8b\xcc=\xee\xdd\x93=\xcc5\x19\xbd\xd7\xd3\x03<\x89\x90\xd9=8GO=\x93\xc5\x83=\x9a\xe9B>\x00\x1b\xdd\xbd\xb1n\x19;\xad\xcf[=`\xf3\x10=]\x8f\x00;\xd0\xe4\x9e\xbd7\x87\x91=w2j=\x86\x9a\x96=V3\xb0<\x92\x94\xe0<\xb6+\t\xbe\xb7/\xcd=8\xa51<A\xfe\xbc<x\x94;>m!I=h\x96\x1c\xbc\x00C\xf2\xbc\x81"\x11\xbd\x8b\xb8\xb2=\xc5\xb8C\xbd\xc9\x96\xab;\xc2l\xae<\x1d\x7fd=\xbc\xe3k\xbb~0\x19=\xd9S\x05=6\xd6\xab;\x8dI\x83;HQ\x08=i\xbf\xee\xbc\x98Z\xe5\xba4\xf4\xf4\xbc\xb6_\x01=\xee6\x9b\xbdo>\xf4=)\xda\xbf<<Q\xec\xbdY\x99\xff=9z\x8c<\xe5S\x85=\xedo$>\xcd\x0b\x7f\xbdJ\xe3-<\x95\xdc\xe1\xbc\x145\x89\xbd\xd9\x96\xdf=\xa2R\xcd=\xfa\xad!\xbc\xa2-\x04>tnx\xbd\xe7\xb1U=P;\xf4<\xd4%\xe8\xbd\x0b7\x0e<-\xb3\xc3\xbd4\t\x1e\xbe\xff\xd4\xb9\xbd\xeeU7\xbcb\xa7\xb9\xbc\xb5O\x1c\xbe}\x04\xea=\xc3\xbbK\xbc\x96S-\xbd-M\xa7\xbbAl\xd6\xbd\xf4\xaf\x12\xbd\'\xc16>\x11\xd7c<\xe3\x17\x8d<\xe7L\x15\xbe\x0e\xc5\x10\xbemW\x81<\x8c\xaeG=\xc6\x1e\xf6=\xce\xb0\xdd<\xa5\x03\xaa\xbd\x859\n\xbdSf\r>e\xf189\xd6\xbfx=\x951\xb1<\xca-\xe3=t\xeb\x97\xbd\xc1\xc4\x96=\xb6M\xad;\xb4#E=\xac\xf6\xa2=\xa7\xb0(>\x8a\x91\x10>\x84\xfd\x14=\x81\xea\xbe<D|6=\xa5\xba\x97<G\x1b\x03>%\x1d\x07\xbc\xe4f\t\xbe\x88\xaa%<\xac2\xbf=0#/\xbc\xeb[\xc3\xbc\xcc\xfe\xb1\xbd%T\xae\xbc\xf7\xf3\xbf=\xac6V;=A\t\xbd\xc6\x9a*=\xea*$<\x1a\xcf\x0c\xbd\x1cx\r>Kw\x01\xbdU\x16-\xbd\xd5\xbbe\xbdTg\xc6\xbc9J\xb5\xbd\x8f\x0c\xec;r\xfaA=qk=\xbd\xe6\xe44\xbc\x08\xcc(\xbd9\x9a\x9d=\xf3f\x88\xbdEc\xe1\xbd\x8c\xe6\xfe:\xe7\x16?\xbd\xfa\x0f"\xbd\t]\x16=\xa7\x9d\x01\xbeh\x84\x9c<"\x9f\x04>\xde\xb9i=\xff\x9fB=H\xe9\xf5=%\xcc\x1f=\x9a\xe75\xbd\xe5I\xc2\xbc\xd5ou=\xd0U\x98\xbd\xfc\xe3\x8d\xbd<d\x8c\xbc\x83\xe7\x0f>\x83\x0c\x14=\x84\x01\xaf<H\xe6,>\xe2\xfb\n\xbc3\xb3\x17>yTv\xbdb\x83\xb8\xbb,\x0e*\xbeYI\x8a=T\x80\xbc\xbb\x0fh\x1b\xbd\xa6\xa8J\xbe:\x08#\xbeG\xd2\x94=\t~\xb0=\xa4\xd0\xee< \x1e\xb8\xbd\xe1f\x0b\xbc\x8a%\x9a=\xa42\xb5\xbdK&\xb5=F\x08\\\xbdN\xf7\x85\xbd\xbf<?\xbe\xf3\xba\xf9\xbd\xa7\x95\xb2\xbc\x8f\xeb5\xbd\tSW\xbd\x95Hx=u\xb6\x93=2\xfbz=r<\x95=\x8a\x8f\xa2=(Z\x8f\xbc\xb1\xd6,<\x8dy\x02>\x0e\x85\xb7\xbdn\xffs=b/\x19=\xbc-\x98=\x89W\xfa\xbd\xadR?>\xd2\x86\x87<3D\x8f\xbd\xa5 [=\xd8#\x99\xbd\xf43p\xbc\xc8\x10\xe6=\xa3\xd4^\xbb5\xc4\xc4=O\x8b\xcc=\xee\xdd\x93=\xcc5\x19\xbd\xd7\xd3\x03<\x89\x90\xd9=8GO=\x93\xc5\x83=\x9a\xe9B>\x00\x1b\xdd\xbd\xb1n\x19;\xad\xcf[=`\xf3\x10=]\x8f\x00;\xd0\xe4\x9e\xbd7\x87\x91=w2j=\x86\x9a\x96=V3\xb0<\x92\x94\xe0<\xb6+\t\xbe\xb7/\xcd=8\xa51<A\xfe\xbc<x\x94;>m!I=h\x96\x1c\xbc\x00C\xf2\xbc\x81"\x11\xbd\x8b\xb8\xb2=\xc5\xb8C\xbd\xc9\x96\xab;\xc2l\xae<\x1d\x7fd=\xbc\xe3k\xbb~0\x19=\xd9S\x05=6\xd6\xab;\x8dI\x83;HQ\x08=i\xbf\xee\xbc\x98Z\xe5\xba4\xf4\xf4\xbc\xb6_\x01=\xee6\x9b\xbdo>\xf4=)\xda\xbf<<Q\xec\xbdY\x99\xff=9z\x8c<\xe5S\x85=\xedo$>\xcd\x0b\x7f\xbdJ\xe3-<\x95\xdc\xe1\xbc\x145\x89\xbd\xd9\x96\xdf=\xa2R\xcd=\xfa\xad!\xbc\xa2-\x04>tnx\xbd\xe7\xb1U=P;\xf4<\xd4%\xe8\xbd\x0b7\x0e<-\xb3\xc3\xbd4\t\x1e\xbe\xff\xd4\xb9\xbd\xeeU7\xbcb\xa7\xb9\xbc\xb5O\x1c\xbe}\x04\xea=\xc3\xbbK\xbc\x96S-\xbd-M\xa7\xbbAl\xd6\xbd\xf4\xaf\x12\xbd\'\xc16>\x11\xd7c<\xe3\x17\x8d<\xe7L\x15\xbe\x0e\xc5\x10\xbemW\x81<\x8c\xaeG=\xc6\x1e\xf6=\xce\xb0\xdd<\xa5\x03\xaa\xbd\x859\n\xbdSf\r>e\xf189\xd6\xbfx=\x951\xb1<\xca-\xe3=t\xeb\x97\xbd\xc1\xc4\x96=\xb6M\xad;\xb4#E=\xac\xf6\xa2=\xa7\xb0(>\x8a\x91\x10>\x84\xfd\x14=\x81\xea\xbe<D|6=\xa5\xba\x97<'
-p34
-tp35
-bsV445261181347835904
-p36
-g2
-(g3
-(I0
-tp37
-g5
-tp38
-Rp39
-(I1
-(I400
-tp40
-g12
-I00
-S'u\x86\x8d<\xd8\xc5\xca\xbe\x98}a\xbf\xad\xb85\xbd\xb3=\t<\x13N\xb2\xbe\xaaK\x1e\xbe\xbe\x8e\xee\xbeY\xde\x88\xbem#Z<6Q\xb3\xbb_\xe2\x88\xbc\xda\x86\xc5;\x9bJ-\xbd_\xbe\xd4\xbe\xd9)\x93<\xa0\x0e\x92\xbci\xbc\xfe\xbc\xae\xa2Y\xbe(\t\x86\xbc\x0bK:\xbf\'\xb3\x88\xbd\x80\xe2\xa4;t\x1cv\xbf\xa8\xff\x1a\xbeI\xfa\xa5\xbe\x90\x89\xed;\x898.\xbf\xe1d/\xbf\xad\xcf\x16\xbcYI\xed\xbc\xc9(\x0f\xbeQ8\x86;\xf1\x00\x06\xbf\x8c\xad5\xbeO\x8e\xd7;\xcf\x8a\x85\xbd\xbb\xf6\xbe;\xba\x13u<\xe6:\x05\xbcO\x1aA\xbd\x0eS\xe0\xbcM\xd5-;\x08%-\xbf\x17\xbc\x85\xbe\xccV\x8a\xbd\xd7*\x9b<4\x10\x12\xbe\x9a\xc4\xcd\xbaE\xa5\x9d<\x00i\x96\xbb\x92C\x90<\xa3x\x02\xbf\x167j\xbd<\xacI\xbf\xdb%\x1e\xbc,9\xf9\xbb@\x00\xc8\xbe\xa5\x0eI\xbfT\xb7`\xbfz\xdc\x96\xbb5\xb0&\xbe\xfe\x0e\x86\xbe\xbb\xf1"\xbf\x9d*\x02\xbe\xcbM\x02\xbb\x9b\x9f\xae\xbeb\xc1+<Q|j\xbf\xd8\x95\xae\xbd\x87\xe0\x8f\xbf;\xac,\xbf?Z\xad\xbc\x96\x93\x8b\xbe\n\x7f\xd3\xbe\x10.\xf2\xbb\x178\xe5\xbbT%\xe1;3-\xe8;\xdb\xad\xf0;\xc7y\xbe\xbeD\x8as\xbd\xca\xdd\x8a<[=\xc0\xbe\r\x83\x1a<\xa8\x8c~;E\xa1\x1f<\x8b\x9fF\xbf3\xc7\xba<Z\x00@\xbcN}L\xbehw\xea9\x9f\xb5\x10\xbf=[X\xbc\x89\x16I<\xfak\xc6\xbb\x8b\r\x1d<\xef\x97U<6\xce\xef;\x9f\xeb\xdb\xbcSNJ;*\xd0$<lsz;\x97N\xba;)\\\xd3<\xaf4\x14\xbf\xd3\x9a\x90\xbcl\x9d\xa4\xbd\xa0\xbf>\xbbj\x95"\xbd\x1c\x0b\x0b\xbd\xf5\xe3\x8b:kM\xc8;j\xd1\xd2\xba\xddVo\xbe\xef\xad\xb4\xbb\xd2W&\xbf\x9c>,<\x96T:\xbb\xd6\xc1\xb3\xba6\x13\xbc<<\x8cK\xbd\xa2\x980\xbe6k\x12\xbeN\xa2\x8f\xbc\xa3m\xe4;\xd8}\x91\xbe\x0c\xca^\xbe\xebr\t\xbd\x90\xff\';J\xd3C\xbb2\x84[\xbbi\x1d|\xbbk\x08\x15\xba\x0b+\xfe\xbaO*\xe1:\xa9\xdc\x9c\xbc\xed\xc8\x1a\xbc\t\xc8n\xbc\x03<-\xbc\xfe\x9b\xb9\xbee\x9ep<\x9c\xe5V\xbe\x13\x92,\xbf\xb3yf<\x7f\'U\xbe#\xa0\xd8\xbb\xfe]l<\xe5\x80\xbc\xbe-\xedO\xbe_\x89\x80\xbe\xd1~\xf2\xbe\xc5\x80Y<\\\x0c\x06\xba\x01\x8d\xb0\xbb\x8e9r<3?>\xbe\xed\x06,;\x1c\x86\x9c8\xa6\x9b\x01\xbfG\x96\xad\xbcy1\x0e\xbf\x0c}\x1d\xbf\x03h\xcb\xbe\x18+\x8b\xbe\tl\xef\xben\xf1\x84\xbfsS\x81<\x90k_\xbeoCL\xbe+\xfc\x19\xbc\xdd\xb5\xc2\xbe\x8a"g\xbc\xae\xe0\xa9<?\xe0\xa5\xba\xea\xf3?\xbe\x9f\xb2+\xbf\xa3\x96\x12\xbf\xf7\x95\xae\xbeG\x9b\x14;[\x9aK<2\x1c\x039%Q\xf3\xbe\xeb:\x9b\xbe{\xbba<\x18\x0f\xfc\xbdu\x0f\xa7;1\x90\x98:&X\xed;\xe1\x86\xd1\xbe\x9d!\xfe;\xc1\xcc\x12\xbc\xd0\xbc!\xba\xde\rN<\xb7\xa2\x8b<\xb1Y\\<\xda\xd68\xbcg\xdf:;\xd0\xb4\x90\xbc\x1e\xdf\x83;\x9c\xe4\xfb>\xee\x89&<\xc1\xbap\xbc\x95`\x07=\x01-\x16?\xd3\x80\x18<I\x99\x05<[u\x13\xbc\xef\xbf\x12\xbb\xf8\x14\x89>\xeb\x91Q>\xa2\x05v>X\xee\x0f?2EF>\xbb\xael\xbbM\xd9\x07?(4|=\xff(\xf1\xb8^\xfe\x98\xbb\x13\x035>.#2;\x8a\xbd\xdf;,\x05:>\x14\xf0\x91<5\xfa\xeb;\xfe&\xc2\xbb\xee\x82\x0c?\xa8\xed\xc3\xbbh\xb0\xf3\xbbou\xf4>\x87\xef<>y{+\xbb8,\xc6>\xb2&j\xbc\xae\xd0\x90<\x8b\x0c\x1a?x\xc9\xe4<"Q\xa6>\'5<?G\x0b;>V\xa4\xb0=\x1bO\xc5>\xcbu\'?\xa9\x9c\xad\xba\xb4\xec \xbb\xdd\xbfo=J\x902?\xe9\x9b\xe4<~\xd2P>\xbcV@?\xb7\xc4c>g\xdbs?\x8e\xc7\x9d;J\xb1\xcf=wD\xc3\xbc\xf8\x93L?\x9c\x82\xd8=\xd8F\x1e\xbbv\xff\xd5\xbc\xb5\xf8\x8f\xbc\xc7\\J?\xdf\xd1%=O~w< \xc4\x98\xbb\xea\xf1\x18<2\xf1+?l^[\xbc\xca\xf1\x0f>\x1bTe<\xfe\x7f\xb2\xbb\x8c\xcf\xa4\xbc\x94\xcc"\xbc\x99\x12q>\nJr\xbb\xfd\x80O\xbb\x00\x04\x1b?\xd4\rM?_\x16Z>\xc2WI>\r\x81\xfa>\x06\x81\x94;Ww\x9e=x~\x16?\xf9\xe6G\xbc\xd5\xf3\xb6>\xf0\x02\x8f>\xba\x1c*?\x7fs^\xbc1\x06n?\xc2\x80\xed>\xbf\x9b\x07\xbc*t\xac>\xb5\xc9\x03\xbch\xa4t>\xb2\xbf!?\x9f;\xf7=w\xd6G>[\xe3\x1e?\xfbD\xb7>\x13\x96\xe9=Q9\x8b>\xbb1K?\xc1\xcb\x84>~\xdc\x80>\xfa\x8dV?gE\xbf\xbb9J\x96=>\x9d\xc9<\xa5\xc3\x0c>}\xaf\\=\xb7\xd2\x83>h\x85C?\x92\x8f\x1b>\x8b^\xd2>\x95D\x9c<E_o=9PU\xbc\xb8\xa6;?q\xbb%>\xe4a\xa5>j\xc9\x8d?\xe6Z\xf3<\xa5\xf2\xbc;u|T;\x93jY=\xa5\x85\n?\xd5\xc9T\xbbDq\x1c</\xfa\xe1<\x81\x84b>l!\xdb=\xf9<H=\xefC?>\xd3k\x1c>\xadj\xb6>\xb9a\x98>x\\\xb8=\xbd\x18\x83=\xca\x9a\xd5>,+\xb8>{\x97\x08\xbc6\x12D?</\x80<\x9c s\xbc#\xfd\xea>A\xdc\x0c<\xb8t<?K\xda\xc4>\xa2\x1c\xbc\xbb\xc5\xf9\x11<\x10g\x0f<-)\x0c\xbc\xb1N\xfd>\xd9AM?\xbe\x1e?>\'6P?\xe7\x9e\x9f\xbb\x89\xd4\x1a>\xc3d\xba=\x86\xf4\x87\xbc\xe9S%?\xc1\xfbR\xbc\xb3\xdc\x81\xbc\xb1\xe6\xeb\xbb|V\x80;\x063\x8f;\xf6\xdd\x97\xbc_\xf9\x04??\x96\x1f<\x16x"\xbb(\xaaH>u>I\xbc\x7f6\x0b>&\xe4\x8f?\x02\x83\xfd=\xcc\xa0\xb3;R5\x94\xbc\xc1\x03\x97\xbcS6\x04=\x1c\x00\xf6=@\xc0&?\xe4wD>\x08\x93\x00\xba\xd2\xd6W<\xfa0O>\xa8\x0e@=\\\xc2\xda>6{.>\xb5\xad\x1f?\xe3\xcdn:}\xda\xbf>\xa6\t\xca=\x0fw\xe7>\xd7\'\xd1>\x1e\x14"?7R0?D\x1e\xc4>1/\x15=+\x8dx=^\xcb\x0e?'
-p41
-tp42
-bsV445260051310075904
-p43
-g2
-(g3
-(I0
-tp44
-g5
-tp45
-Rp46
-(I1
-(I400
-tp47
-g12
-I00
-S'\xfcjC\xbaT\xd1\x1f\xbf\xe3\xaf\xa3\xbf\xefns\xbf\xb2\xdc\xcd\xba\xeb\xa9\xc3\xbe\xec}v\xbe\xc9\x01\xad\xbfft\xe0\xbe\xccrH\xbc\xc4O\x12\xbf\xe3\tp\xbe}A\xda\xbe\'\xa7\xb7\xbe\x14\x9eh\xbf\xba\xb8":y\xe7$\xbf\xba4\xa7\xbe\x12!\x84\xbfz\xbf\x8d\xbf\x8dH\x13\xbf\xd7\xf2\xee\xbcW\x88\x94\xbeihG\xbf=\xf5b\xbe\xf1\xd4\x80\xbfx\xf9\x98;]\xd5J\xbf\r\x82\x19\xbf\xac\x8a\xa4\xbe\x13kV\xbf\xb0$\xcc\xbe\xd8\xc1\x1e\xbf\xb3\x90\xa7\xbf:\x88\xad\xbe\x90Y]\xbe\x01;\x98\xbc0\xfcX;Bc\x10;\xe4\x95M\xbf\x9b\x9e\xae\xbf\xb1i\xcc\xbfPME9\xedy\x00\xbf\x8eM\x8c\xbfv?\xad\xbe\'\x05\x16\xbb\xc8\xf45\xbf\x0b\xb1A\xbe{:K\xba\x02jR\xbe\xef,\xb4\xba.\xa2\xa7\xbe\x8b$\xd1\xbb\xa2\xc8\xaa\xbf\xec\x00\xeb\xbe$R\x89\xbe \xa6\x84\xbf\x05\xb2\xf1\xbf\xa7~\xae\xbf\xae=\xef\xbe\x02\x8d\x15\xbe\xe3\xa7\xf1\xbcOhA\xbf"\xee6\xbc\te\x14\xbd\xa9\xb5 \xbf\xbb\xd99\xba\x17\x02\x01\xbf\xc3\xa22\xbf\xf0\xda\x9e\xbf\xe2v\x86\xbf\xb8\xa2\x86\xbfs\'D\xbe(Up\xbe\xf56\xb2\xbe\xcb\xb3\x1f\xbe\x1d\xb5%\xbbU\xb4\xe4:y\xb1F;Y`\x98\xbe7:\x1e\xbd\xa7xL\xbb2\x95)\xbfml(\xbb\xbbP\xe4\xbe\xea2\xa6\xbbS\x1a\x89\xbf\xbf\x91\x87;\xe4\x18+\xbf\x0c\x12A\xbf\x9an^\xba\xf5c\xa0\xbf\xdd\xf3\x98\xbf\xda\xa5\xde9\xcb\xb3[\xbd\xfe\x9bF;\xe2\x02\x879\xb6\xb1\xe9:\x7ff\x90\xbf\x9d\xde\xca\xbd\x1e\x9e\xa1\xbd\xfb/x\xbc\xa4\x8a\x1b:_\xf3\xd8\xbe\xb5\xcar\xbfA\x16\t\xbeQ\x8d.\xbcYU\x01\xbf\xf1\x05\x00\xbc\x90f\xd9\xbf\xe5\x93z\xbe\x18F\x94:\xca\x7f\x1a\xbd\x0f.\xb2\xbe>\xd7\x94\xbe\xa1\xb3\x88\xbf\x88\r\xd69f{\x11\xbf\xa9\xf5\xa4\xbe\xc8w\xd1:\xb4\xc8R\xbb\x1f\xcd\x8f\xbe\xa84\xfd\xbd\x16\x1a%\xbeeR/\xbaV\x84\x12\xbf\xb6\x950\xbe\x08\xc8\xbb\xba\x1ce\xf9\xbe\xcc\xf0\xa1\xbd\xdc\x0e\x9a:\x9fV\x02\xbb\xe7\xd9\x15\xbe[*\xf2\xbb\xde\xfb&\xbe\xd4KM\xbf\xfc\xeb%\xbc\x89\x00\xb1\xbfX\xb7\\\xbf\xc5b\xf9\xbe\x98\x9a%;y]`\xbe\xce}\xad\xbfO\x84\xe4\xb9\x0b`\x08\xbf\tT\xcf\xbe\x15r\x04;\xe5\xa0\xa1\xbe\xc0\xbeT\xbe)\x9c\xd4\xbe::\xf2\xbe\xa7O\x19:\xd6\xab\x15\xbd\x0fA\x07\xbe?\x11\x91\xbb\n&J\xbfU\x07\x80\xba\n\x98=:\xe7\x99`\xbf\xf4\r\xb6\xbfhh_\xbf\x99[\xcb\xbf*\xa4z\xbf\xe9\xa0\x12\xbew(\xd0\xbe\x99_\xc7\xbfq\xcc\x12\xbb\xe6^\xd5\xbeb\x9e\xcc\xbe\xa7\x80\xce\xbd\x95\xacY\xbf9-v\xbf6\xefN\xbb\xdc\x1fQ\xbdm\xdaG\xbe\x89*+\xbf\xd5}\x90\xbf\xaaT\xe2:!\xfa\xa2\xbd\xc0^\xa2\xbb\x98d\x82\xbeL-\x1a\xbf\xd2\xee\x9d\xbdKn\xa0:\xf67d\xbe\x8c\xa6\x17:F\xe8\n\xbe\x93\xfa8:i-\xcb\xbe\x13w&9s\x96\xe7\xba\xd3\x835\xbe\x9aT\xeb\xb9m\xb5\xff:\xee\x05?:G\x8ab\xbfi\x05\xfb\xbe\x9cM&\xbe\xb1jn\xbf~N\xd7?.(\x0c?}\\\x9f:\xa4\xc5$>\xa0\xcb\x8f?\xd3\xa2\x16>\x96\xb7T?\x8b\xef\xff\xba\x8b\x97\x1e<\xb5,B?p\xf3\x8b>\xdc\x0c\x00?\xf1\x03-?s\xa7\x7f>\xf5\x8d^>9l\xb5?\x1c\xf8\x10=\x16\x9eF>\x05\x8e\x04\xba\x95\xfc\x12<Yk\x8d>w\xec\xf9>\xedX\x15?E\xa3\x02?\x96\xa3\xf2>gn\x85:}\x97u?T\x99\xb3=\xe6\xa0h=\x8f\xd4\xb9>\r\xd0\\>\xeaSK?{\x91\xb5>\xa0_\xe5\xba\xf1\x1a\xc4>\xe7\x8b`?$\xfd\xd3?\'<Z?9\xba\x87?\xf6r\x98=\x81\x98\xe2;\xbfm\x88<\t\xfb\x16?C@\xd3>\xe0\x96=\xbb\xaf\xa2\xf0:\x93\xd7N?K\xa7"?W\x96\x95>0\\\xcf?\x00\xee\x9e>\xd6v\x96?\xb0F\x83=\xbfr\x18?\xc2\xfa\xed\xba\xf6\xc7/?\xd5\xae\x9d> \x14d:\xa0\xf9\x18\xbb\xefh\x0b\xbb\xfcE)?\x06\x97\xda?r \xa2?\xe7\xddH=\xe1_I?\x98\x93\xe2>\x9e\xd9\x08;>\xc7\xca?\x92\xab\x97?\xa1\x02\x11?\x86.Q;\t\xd7\x85\xb9\xff\xae\x1a?\x15Fv>Q\x0c\x96>\xcb\xf4\xc9>\xf4\x99/?\xdc\xdc\xb0>\xdb\x84\x81?\xf5\xae\x81?e\xc3\x17?F\x16\r?R\xc6W?\x90R\x85\xb9\xf6I\x00?\xb6\x162>T\xef\x8f?\xd2\xb5\x949\x90\xdf\xcc?\xbbzr<\x9f\x05&:\xb9\xe0:?\xcb{\xcf;\xa5\xe4q>\xb2\x01\xa6?\x9a\x18(?\xb9\x1c\xd4?\xce\xcd\xa2?L;R?\n\x8d\xc5\xb9\x14:\xcc>\xd6&h?\x9c\xeb\xec>\xd2\xffD?y\x95\xa0?\xbd\x92u\xbb\xb0=\xce>\xa8a\x94?$\x9f\xb6=\xe5\xba\xec>/V\x9e>w\xb4\x9d>X\xfb|?\xc2\xa5A?\x12`\xdf>\xe5\x1b\x8b>E@\xa59\xe4\xa8\x90?\xdd\x16\x90=\x8d\xb1\xbf>\xc3\xec\xb5?\xcd\xe5j?\xa2)E>r\xa6\x8e>.\xcf%?(\xc7-?\xe2\xd3\xcf\xbad\xe19?\xb4.\xbf>\\\xc0\xf2>\xdd\x05\x9e>\x92M8?\x97\x87\x12?\xce\x86\xf1>\xbc\xdb\x82?\x07~@?\x1f\xf1\x00;\xae\xdd\xa1>\'\xad\xbc>\xa2m\x9b=\xef.P=1r\x8a?Q\xed\x9c?*\xf0\xab:\x06c\xaa?7m\xbc>\x8c@\x90>\xdc\xa1\xe7?\x9b\xb8\xd2=\xe8Ve?\x8f\xee,?;|\x12>\xe4(\x0c?\xef}\x02?\xe3\x1bZ>K\x12\xa8?\x1cjQ\xbbW\x1e2?\xe2\xa5\t?\xfc=;\xba\xc1:|>\x98H\x94\xbb\x07\xcc\x97\xbb T\xb7\xbaS\xdc\xd6>\xe5\x9c\x04?ji\xbe\xba\x8a\x97\r?\' )?\x92J\xf3>D\x01\x1d?\xd8\x88&\xbb\xf9>\x80>\xc1B\x96?+\xd9\x94>\x88GI?M\x1d\xae:#\xbc[\xbaT\x95\xd8?\x1a\xbf\xb5>\xbe\x8e\x81?) \xcf>\x04\xf7\xac<R\xa3\xe1>99\xf9?\x1d\xf5\x84=\xdb\xfd=?\xa0(\t?\xcbJ\x02?\\^ ?A38?\x9d\xabB?\x01\xad\xc6>\xc8Y9?\xbe\x97\xc0?*\xf8\x80?\xd1\xcc_>\x82\x82\xb4>\x03\xfby>"\xdd\xf8>'
-p48
-tp49
-bsV445258858743619584
-p50
-g2
-(g3
-(I0
-tp51
-g5
-tp52
-Rp53
-(I1
-(I400
-tp54
-g12
-I00
-S'\xb6L\xc2;OT\x17\xbf\x1al\x8a\xbfP\xcf:\xbf+\x05\xcc:}cp\xbfk\x17z\xbd\xad\x02\xb5\xbft\xe92\xbf\xe9\xaf\x0e\xbey\x13(\xbe\x9b\xd5\xa1\xbe\x19\x94\x83\xbc\xd2\xfa\x86\xbd\xf6\x83V\xbf\xf6\x06L<\x0f\x83\x8a\xbe\xd8L\xd1\xbe\x97UC\xbf\x0e>\xab\xbe\xc7\x13\x02\xbf\x0c\x1c\x05\xbey\xba\x98\xbb\xbai\xaa\xbfL\x80(\xbei\xa0\x1e\xbf\x00\xb0\x96;eu\x93\xbf\x9d\xd7B\xbfI\xa51\xbf\xbf\r\x14\xbfU9\x89\xbe\xd5\x8a\x85\xbc\xae\x84{\xbfw\x92\xb9\xbeX\x04h<v\x08\xf0;\xf9\xe0\n\xbb>\x8d\x18<d\xa0\x8e\xbe!\xa6\x1f\xbf\x02\x8c6\xbfz\xd6\xde\xba\xae\xbc\x06\xbf\xb1\x0c4\xbf\xdbF\xdf\xbe\xd7\x8eU<\x14\xfe\xcb\xbe\xea8\x84\xbb\xf8\x99P<\xe2t\x84\xbe\x05#X<\xa1_0\xbfy\x18(\xbc\x87\xb5\x93\xbf\x1f\xa7]\xbe\x84\x8c7\xbd+\xf2!\xbf!e\xe5\xbf\xfd\x84\xa7\xbf\t1d\xbb\xd8L1\xbd\xe9\x0f\x9e\xbc\x07\xf5\xf6\xbe\xeb\xe4:\xbd\xbd\xcao\xbe\x87\xbd3\xbf\xf4\x87\x17<\xdb\xd2\x0e\xbf+\xa2`\xbe\xd7\x10\xc1\xbf\xa61(\xbf\'\xeee\xbe\xb0\xc3\x96\xbe\x98xr\xbfcsG\xbf$GF\xbe\x14\x7f\x0b<\xa0Eb\xbd\xa9\xbd$\xbc\x8eP\xc9\xbe\x909\xe5\xbe\xd7\xba\xdf;\xe6\xb1\x83\xbfO6\xa2;A\xc9\xdb\xbd\x16v\xa6:\x94\xdeb\xbfg\xd63<v\x02\xa4\xbeu\x84>\xbf\x93V\x91;\x16\xf7\xa8\xbf\x04\xc9\x10\xbf\xb9\xab5<\xab\xa1\x8b\xbc\xb9\xc9\x01<\x97]\xbd;z\xf7\x8a\xbe\x06\x8f(\xbf\xb48\xc2\xbeyt\xf0;\x83\xf3\xca\xbc\x7f\x01\xd8:\xf2\xdd\x8a<\xbc\xe6A\xbf\x19\xc6\xe1\xbd\xdb\xa7j;>]\xad\xbe\x9c(\xbf\xbe\x91@\xaa\xbfk\x05\xc0\xbe |\x97;hX\xb4\xbcz\x10\x05\xbf\xd0\xf1f\xbe\xbenb\xbfG\x8c3;G\xaa\x9a\xbe\xbd^o\xbc\x15\xceP<\x16\xa3\xa5;\x1c\x8ae\xbe\x18\xcd7\xbe\xf1\x8f\xdb\xbd:\x9f\x05<\xde\x85\x95\xbf\xed&O\xbeh\xf8\x85\xbciz\xcc\xbe\xed5P\xbdF\xcd\\;\xc3GZ\xbb\xccUA\xbd\xc8Dq\xbd\xfc\xf6\x07\xbf9?\x03\xbf\xe2\xc3\xda\xbe7\xa5\xac\xbe\x84K$\xbf\xc2\xb4\xdf\xbe!\xb5\x13\xbf\xc1\x8e\xa0\xbcgfy\xbf\x80a\x17<\xdb8\x15\xbfK\x0b6\xbeQc\x93<%\xc3\x0b\xbf\xca\xd6\xd1\xbe\x1dJ\x07\xbe\xbf\xc9\xd9\xbe\xcae\xd4;c\x01\x18\xbe\xd8\xa7\xd4\xbe\x14#0<\xff\x8b\xc9\xbe\x11Mq;\xf7p$\xba\xee\xb7\x9b\xbeZ\xf5`\xbf`\xccX\xbf\x89\x8eh\xbf\xdaDc\xbf_\xe0t\xbe\xfe,\x8d\xbe\x17\x97\xa2\xbf\x9c\x98P<\xfb\xb2G\xbe\xb6.\xfa\xbd\xf2\xe1\x13\xbeG\xdc\x14\xbf\x06\xf1\xbf\xbe\xca\x0b\x8d<u\xb9\xff\xbc\xbd\xe6\x8c\xbd\x1f@O\xbf\xc5\xd4\xbc\xbf\x86T\xa5\xb8\xce\x03\xbf;\x0c\xb8d<\x8c\xc9B\xbe3\x95+\xbf\x0caK\xbf"\x07i<\xa8\xe8\x9c\xbe]\x9d\xa5;\x02\x8b\xe6\xbc\x18\x0f$\xbcB\xcb\x01\xbf\xa7\xdb\x87:\xbfy\xb3\xbc\xb0Hh\xbe\x8b\xbb8;^\xc8m<+\x8dl<\xf6\xec#\xbf\xb2\x1e<\xbeO+\x9a\xbe\xae\xaa1\xbe\x18\x85\xb9?T\xb3\xe1>\x1d;\x0b\xbc\xd7\x1b\x1a=u\x01\x95?M\x00\x86>\x8d\xf6\x17?\x8d\xd3\x89\xb9S\xad\x9a>\xd1\x19W?\x91\x03\xff=:rN?\x9e\x1b\x1a?k\xfe\xfb>K\x83\x97:x\xb8}?\xb5\xedB<\x1dJb>\xcc\x81(\xbb\xebM\xb3:\x94\x03\x8c=\xc0)\xfa>\xd9\x800>\x16\x91Q?\xaf\xfc\x97>\x9c\xf7\xaa\xba\xc9lY?M\x87\xc2:P\xe1-\xbc$\xe9\x87?Q\x03>>\xa4;*>\xd3G0>2\xbdM\xbc\x07O\xed>\xaan>?g/Z?\xfb\xacz?\x87V\x81?\xb6\x9e4>\xe4f\xd1\xbb\xd4\xa6\xda<\nf\x8f?\x82\xad\x02\xbb\xf0\x85\x9c>_\x18\t=\xa6\x1d\x8e?-\x12/>\xf5\x9c\x95>\x11\x84\xb7?+\n\xb7>j\x9d\x80?\xa2>z=\xd8\xa8\x17?|Ie\xbc\x99\xe0\x04?\x14\x80\x05?\xfaV\xa8>\x971\x8e\xbc\xecl;\xbcR\xe4&?\r\x01\xad?\x04:\t? \xe9\xb7=4\'\xce>\xe5g-?\xfawv>\x8e\x10\xb3?@\xff0>\x94s\x99=\x82\xd6@\xbc\x17:,\xbc\x08\xcc\x8e=,\xad\xb4>\xc79+>;\xb8\x06?\t~M?\xbdC\xf5>\xad\x9e\xc5>\xa5_\x90?\xfd\xb9\xa0=\x0f\x93\xd9>\nE\x80?\xa8\xbcN\xbc\xc8\xed@?T&\xf2>gy{?\xec\xdd\x9c=?\x02\xc9?\x86\xec\xe1=\xfc\xf8\xf2\xbb\x1e%R?\xea\x89u:\x16\xf0\xe7=\xf0[~?:\xb3S?\x7f!I?=\xf3\x87?\xfd6\x0b?`\xc9\xa5\xbb:\xf78?Q\xd9W?\xa0\x96\xce>\x00M\xfe>\xdb\xebF?}a\xd4\xbb\x96\xe6\x1a?\x94dj?\xb3\xbb\xba=\x1cF\x18?.\xe67=\x00\xae\x87?\x99Gh?\x9b\xe4\x97>\xcf\xde\xce>\xcb\x90\x93>b\xa98\xbc\\\xd2\xb2?U\xfb\xb0=Ce\x18?\xeb\x12\xa2?\x10M*?\xdfK\x17>\x0e\xf2\xe0>u`\x02?\xe3\n3?.d\xd8\xbaL\r\xae>\x07\xbf\xf4=i}\xa1> 9\xe2>\x86\xbce?n\xa4r?G\xb1e>\xb6\x8e\x94?5C\x02?\x84\x89\r<\x0fk\x91>\xaew\xc7>\x8b\xcaV=\xf2\xe1\xd0\xbb/[\x88?!iU>u\x9a\x1a\xbco6O?in;?<B\xed>\x98#c?HQ\xd7\xbb\xceR\xdf>\x10\xd5>?\x1d\xd0?\xbb_`\x17?Y\x1d ?\xd3W\x1a?\xad:\x8f?\xc6\x1fy\xbb\xa2|L?U\xa9\xb6>\xa3\xc4v\xbc\xbc\x8a\'=\xd8 n\xbb\x0b\x043\xbcP\xa1:\xbc\xf5#h>\x16\x92J==h6\xbc\xa2s\xc3>\x15\xd0\x15?\xd2\xf7\xe1>\xe4\xa0\r?\xaa=\x95>3\xd5(>\xad\xf4\xa3?\xb2H\xea>\x02\xe7\xad>d\x1b2\xbc\x9c~\x04\xbc\xd4`\x91?Mw$?\xf5\x146?\xb0R\xa1>`\x1b%\xbb\x1c\xb1\x1a?\xf3?j?\x80\x7f\xd4=\x9d?p?F\xfe\xae>\x13\xeb\xf1>\xe20\x07?c\xa7k?=\xff(?g\xe7\xa6>\xe7\x8dH?T5\xcd?;^)?I\xae\x8e=~xH>\xe2\xaa\x1a>\x8b7\'?'
-p55
-tp56
-bsV445126719402680320
-p57
-g2
-(g3
-(I0
-tp58
-g5
-tp59
-Rp60
-(I1
-(I400
-tp61
-g12
-I00
-S'\xc2*\x8d<\xb1`\xe0\xbd\xceN\x91\xbf\x0e\xacF\xbf\xcbu\x85<\x17\xd4\xc7\xbd\xc3*\xb7\xbdw\xcag\xbf\x0c\xc95\xbf\xf3\xa5\x19<\x8eK\r\xbb\xbb\x18\xd5\xbd\xd1Q\xf5;<.\x00\xbcd\xf8\xa7\xbf\xf1\xe0\x93<\r\xb7\x1e\xbe\x9f\xa1\'\xbe\xce\xfb\x90\xbf\xa6\xbe\x02\xbfY\x0c\xb1\xbeV\x9a\x16\xbd\x17a\xeb;\x90\xedO\xbe\xed\xf6\x01\xbd\xcdL0\xbf\xd0\xa0\x17<\x0f\xc9\x86\xbe\xf8)\xec\xbe\x967\x97\xbe\xc4c\xc0\xbe\xa7\xb7\xdb\xbe\x95aW;\x93\x85\xa9\xbf\xcc\xb9\xc5\xbe5\xbfx<\x0e\x13\x8e;\x91P\xf2;\xad\xeb[<Y\xba\x9e\xbd\xef;]\xbeoi\xeb\xbe\x17\'\x06<\x0fr\x9d\xbe\xd2\xb2\x80\xbe\x066\xf4\xbe[0\xb7<\xa7X\x9b\xbe\xac\x01\xfa\xbd\xa1W\xc0<_\x1f\x15\xbd\xd3{\xc4<\x8c\x9e\x91\xbe\x03H\x85\xbcv\x89,\xbf\xcbs\x10\xbe\xdej\xce\xbc\xa6\xa8\x04\xbf.b\x90\xbfi\xea\xa0\xbf,\x85%<hh\xa1\xbciEG\xbe)\xa8\x8c\xbe\xb8%\x8f\xbd&\xe9\x14<\xac{n\xbf\xeb\xce\xf6;\xf0\x01(\xbf\x96\x06G\xbe\xff]\x89\xbf\xc8\xd0\xda\xbeN\x01\xe4\xbd\xad\xe6A\xbe!\xb6\xff\xbet\x16\x1b\xbf\xf5%\x85;\xa00\x9e;\xb3\xe4\x00<\x03\xeb\xc9;\xad,g\xbe\x1ei\r\xbc\xd8\xe8\xa1<\x89\xcc\xf6\xbe\xe1\xe4b<-\xdf\xa1;\x0e\x8d\x8b<\xe8\x8f\xbb\xbf\x1b\xfb\xe2<\x94{-\xbf\xde\x1d\xa5\xbfE\xfb\x8e\xbe\x08L\xdb\xbf\x8f^\xa0\xbd9\xf9\x9c<\x0e\xf0\xdd\xbc\x9dY\x86;h,\x82<\x88\x18\xd6;A|{\xbf\xacep\xba%\xaa\x81<\xe0\xd7\t<\x13\xee\xea;\x80~\xea\xbe\xb9\x1a\xf1\xbe>\xcea\xbc\xb1\x12?;\x19\xdaB\xbe\x80\xb2\xda\xbc\x03\xcf\xc0\xbe\xb0@\x1e<\xf9\xb5\x9f;\xb2\xa5\x9b\xbe\xa2\xdd\xe6\xbc_#\xd8\xbdQRC\xbf"\x0fz<^\x0c\xa1\xbe7\xb0\x85;R3\xb4<Q\xa5\x0e<\x14\xc20\xbd\xeb\xa7\x80\xbd\x7f*\xd0\xbe\xabn\x06<\x0b#\xe3\xbee\xc8\xa7\xbe3O,;\r\xb8Z\xbe(\xeb\xb7\xba\xec\xcfw;\x86\xe3\x0f;\xd6\xbb\xe2\xbc\xe1\xaa\xa6\xbb\xb9y\xc3;rX\x8b\xbf\xbb\x81A\xbd]\xa4+\xbe`8\xfe:\xb7\xbc\xac\xbe\xc8\xfa\x85<\x82\x8c_\xbf\xdb\xaaY\xbf\xa61:<\x10\x16\xbc\xbec\xd9#\xbd2\xa4\x80<Rv\x9c\xbe\xb6\xcf\x08\xbd@\xe3=\xbe6\t \xbf?iG<\xdaT\x16<\xc5\xde\xa7\xbd[\x11\x8c<\xf2\xf5\xa2\xbe\xab=e;\xea/\x8c;\xc2\xb5\xf3\xbe){K\xbfWU#\xbf\x93\xc9\x9a\xbfj\x1eM\xbf8[z\xbdk\xb3\x1f\xbe\xc6\xbd\xb2\xbf2\xc2z<\xdb\x82j\xbdb\xcf\n\xbe\xc6B\x06\xbd\x97X\xaf\xbe A\x17\xbe}\xec\xe8<H\xd5p:\xb4{\x9b\xbc\xff|<\xbf\'\x1f\x8c\xbfp\xbbX\xbb\x88v\xf8;\x8a\xf6\xa2<\xc5\x1a\n\xbc\r\x9e\xa0\xbe3E\xd5\xbd\xf8\xcc\x17<Uj\xa1\xbd\x01\x88\x03<e\xc5\xb0\xba\x18\xc5!<EOq\xbe\xcd\xa8\x84<\x97K\x14\xbcK\\\xf3;\xe8 Z<\x8f\n\xb4<\xce6Q<\xbb\x0b@\xbfLg\xf9\xbdm\x84\x07\xbe\xdbX\x0e<\x10[u?\x14\xb1\xc2=\xc4\xef\x9d\xbc)%+=\xf5\x0el?Z\xed\x12<\x07\xf9=?8\x80?\xbcpW\xfe9\xc9\x94\x16?\x1cZ.>\x01\x10N>\x18\xb5_?\x0b\xf8&?zl\xb4\xbb\xe2\xcf\x11?\xff\xd7\xb0\xbbz\xd3\x89>;W$\xbc\xb9 \xa9;dIU>\xd8\xeb\xe1=L\x81\xdc>=8\x93\xbb \x08\x00?\x8eX\x1b\xbc2\xc6<?e45\xbcn\xb9\xfb\xbb\xa5A\xe2=\xf6\xae{=2u\xda\xbb$\xd8;?h;y\xbc\x10d\x14>\xfd\xc7\xe6>\x0c\tB?^\xabH?\xe1\x863?\x96\xec\xbb=\x04}\x02;\xdaE\x17=\xb4\xb8[>R\xd9P\xbc2\xbe\x91>\xf1\xf8\xae<\x08\xbeA?\x17\xce\xb5=qa\xd5=\xdf0\x84?\xedH==\xb9\x8fv?\x18\xdbg>/\x10\x9b>\n\xd0\x9d\xbcF\xc1\x8f>\xe7s\x15>\x1d\xd5\xf5\xbb\xb3\x1a\xb8\xbc+\xfd\xd6\xbcx\xb1\xa9>!<\xdc>\xf8\xf1K>\xac?\x10\xbc \xc9\x0c?\xcbd\x81>\x11\xab[\xbc\x05\xa1\xe0>\xcc\xa1\xce\xbb\xbb\x06\xb1>r\xe2\xec\xbc\x0ej)>l\x92a?\xdc\xe9\x1e\xbc\xf2\xeb\x0e\xbc\xd5\xf9*>\xde\x9d\x97>`\x8a\x89>{\xb1g>\xb2\xba)?A\xa6\xf6;i1\x1a?W\x82\x97?+\x90\x1f\xbc^\xce~? \r\xc9>\x8e\x91V?\xdd\x92\x95\xbcUQ\x94?)\x86\x95=u\x9a<\xbc=_W>@\xffk\xbc\xef\xff\xb8>\xec\xe4\xda?Uh\x94?\xc3\xec\x1d?\xca:m?\x99v\x9d>\x12\x0e\xbc\xbb\xb8\'r>M\n\x88?.\xd6\xc2>NY\x9a>\x9b\xc5+?qI\x17\xbc\xd5s\xdc>\xa3*\x84>@\x87\xe9=\xde\xfb]?\x1f\xf6\xbf\xbb\xd7x\x8a>\x9fuy>x\xf2]>\x93\xa4P=\xa2s\x83=\x88\xf7d\xbc\x16\r\x8b?\x17\x7f\xde=\x88\xcf\x9a=\x87\nJ?\xd9\x1c-?\x89\xc9\x83>\xa2\x8b\xb2>\\Zi=\xe5\xdd\x11?\x96\xf6\x94\xbbd\x1d\xef=1X\xd4>v,.>Z\xf3\xd2>w*\x87?\xfc_\xe1>\x00\xf1\xda>\xc8;w?\xa6\xb4Q?|{%<\x84\xa0\xb1=\xd9\xbau=\x94\'$>\xc4\x01\xd3\xbbH\x1f\xe9>\xac\x92?>\x04\xdb2\xbc\x9c\xe4\xe0>/1\xe3=3\x0e\x86>!\xeb\x98?Z\xd9\t\xbcNS\xac>\xe2\x92i=\x8b\xa2\x00\xbc\xbeww?c\x8e\xc4>\xc9\xb2\xab>\x83\x94\x98?\xa5<\xa5\xbb\xc3\xed\xcc>h\x96\x00>!\xe4\x81>V\xa3\xcf=\xa4t3\xbc\n\x1b~\xbcuA\x1b\xbc^\xdb\xe5>%\xd3(=\xc5=\xb2\xbcI\x94\xec>l\xc3I>\xc9/`?\x18\x7f\xd1>(@\x0f\xbcuY8?\r\xf1`?\x07\xd6\xe5>\x95\xcb\xa9=z\x80\x8d\xbcJ\xaf\x9a\xbc\xca\xb1|?\xee\xc5\xa1>d]\xe3?1g+>\xab&\xb6\xba\x08\xb7\x0c?\xc5\xdc\xf9>\x9dv[>\x84sA?d\x92\xeb=A\x08\xcb>\x08\xf1/?\xfd\xca\x8a?\xe9\xceh?p\xf9q>\x92\xd5\x94>\xb3)\xd3?7\xaa\t?\xe3u\xf0=\x03\xc0\r>~\x0b(>yf<?'
-p62
-tp63
-bsV474176288924925952
-p64
-g2
-(g3
-(I0
-tp65
-g5
-tp66
-Rp67
-(I1
-(I400
-tp68
-g12
-I00
-S'\xfat\xa3<\x85d\x11\xbf\x82\x93\x9a\xbf\xe2\xa2:\xbf\x92\x8ax<=\xbf9\xbfk\x17z\xbd\xc4u\x90\xbf\xfeYS\xbf\xa1Y9<A\t\xa5\xbe(9\x87\xbdR\x7f\xe7\xbd\xbaQ\xe69Y\xae\xa7\xbf\xab\x1f\x98<T\xfc\xef\xbd7\xa1\x81\xbe\xe9Hp\xbf\xf4\x02\xe5\xbe\xd7ew\xbe9\xd5\xe3\xbd\x81\xdb5\xbe\xfe.\xa4\xbf[E\xc4\xbcG\'k\xbf\xa3\x89\x08<\xc5\xc5d\xbf\xf5\xeb\xb5\xbe\xa4\x8d \xbem}\x08\xbe\xdc+\xe0\xbe\xe44\x0c\xbe\xdc\x18\x97\xbfCg\\\xbf+\xbe\x87<\x10{\xc0;\xabV\x1b<\x8aW\x86<\xa1>U\xbf\x15\x90&\xbf\xbf\xeb\x1e\xbft+=<\x8b\xfc\xa2\xbe\xde\xf11\xbf\xa3T\xa8\xbexz\xca<\x0eW=\xbf)\x96\xe1\xbc\x0bV\xef<\xda\x85\xeb\xbd\xb9\x9a\xba<#\x96\x83\xbe\xf7\xc6R\xbb\x0f\x98,\xbf\xd6\xfc\x9a\xbd\xd3\x11\x1a\xbe\xf1!\r\xbf\x8c\'\x96\xbf\xb9x\xb0\xbf\xb2XQ<\x8d\xd4%\xbf\x94\xcc\xf3:\x98\x01\x0c\xbf"\xee6\xbc1\xdcI\xbc\xa7H\xe4\xbeF\xb6 <\xdd"r\xbfL\xb9\x95\xbe\xf1W\xa8\xbfA\x81K\xbf\xb2\xe8\xae\xbe\x90\x1eK\xbeg\xfc~\xbe\xc5ob\xbeK\\\xcf\xbd%F\x00<Q\x81\x1e<\xa8\x950<N\xd7\xb7\xbe\xfeUU\xba\xc3\x8c\xa6<\xf0\xf0\x03\xbfI\x10\x1f<Kuj\xbe\x8aM\x87<Q\xb6\xad\xbf\xee\xfa\xdd<\x82\x14\xf5\xbe\xdf\x1d$\xbf\xdd\x1c\xdb;\x99\x05\xb6\xbf\x11V\xc2\xbd\xed\xda\x95<l(\xd9\xbc\xc0u!<\xa9\xbdf<!\xde3<\\R0\xbf\xbcUX\xbd7\xc2\x85<+\xba\xe7;2`\x11<\xe2\x9a\xd6\xbe\xcb\x84X\xbf\x18\x13\xb1\xbc\xb9\x95\x08<=WW\xbf7+\x08\xbc\xe5\xe6\x86\xbf\xc2=6\xbe\xa0\x97a<\xa1b\x88:W\xb12\xbemt!\xbe\x83H\x84\xbf\xb8$\x7f<\xde\x05\xf6\xbe\x97jX\xbe\xe6\xe9\xe4<&2\x97;\xe4B1\xbe\x1b\xc3\x9d\xbc\'4e\xbd\t\x07B<\xe1\x8a2\xbf\x03\xf0\xc0\xbd)\xaf\x03;\xdf\xdd\xdb\xbe\xcf\n\\\xbc\xa3\x10t;-io;\xdc\xb4\x81\xbe\xc2\t\x90\xbb\x90\xd9%\xbc\x18\xac \xbfU&\xd0\xbb)\xcf\x1d\xbf#\xe2M\xbeV\xb7\xbd\xbe\x92\xe8{<\xba\x19\xec\xbe$\xbc\x98\xbf}\x81\x87<H\xef\x12\xbf\xbb(I\xbb/o\xa2<\xb1!`\xbe,\xe3\xe1\xbc\xd4\xa5\x06\xbe\x94c\xb2\xbe\x87`x<Z8><\x8dP\x9d\xbc4{\x93<\x9c\xe1\xaf\xbezK\xb2;\xa2\xb1\xa9;\x14\xfc\x93\xbe\x1c\x8b\x1e\xbf\xce\xad\x9c\xbf\xf2\x8b\xbe\xbf/\x89\x8d\xbf6 \x15\xbc{\x15\x8d\xbe\xb2R\xed\xbf\x08\xfe\x91<\xc4\xc5\xfc\xbd\x149\xf5\xbd,A\xae\xbc\x08v\xf0\xbe\x01\xc1\xcb\xbe\xaa\xf3\xe3<4\xdf\x85\xba\xfe\x8e\x94\xbeq\xbf\n\xbf\x9aM\x83\xbf\xe6)\x81\xb9a\xefi\xbe\xe6\xc2\x8d<\x03\xdd~\xbe\x91\x08\xf2\xbew\xb1\x8a\xbe\x0c\x98\xae\xbc\x80\xf2\x8b\xbcu\x9e\x18<^.\x13\xba7\xf2\x84<\x00b\x85\xbe=\xafC<\xf2\x1c\xde\xbaZ\xf0)<\xc6\xf8\x19\xbeb\xff\xd8<O\xf1\x1d<\xda\xc0\x9e\xbf\xadU*\xbf\xc20\xee\xbeQ\x8e\xc6;\xd5Q\xa7?)\xb6\x05?\x1b\x0b\xa2\xbc\x00j\xff;\x1ecz?\xaf\xb0T;\xd5\xf3w?\x83\x89e\xbc\xc4b)>\xd8h\x1b?g\xad\xad<\xcb\x13H?\x03\xca\x82?\x89n\xc1=\xfeh\x00\xbb\xd9\xc51?U\xc9r\xbbN\xa2\xc2=\xbf\n\x04\xbc*<1\xbb\x9e\x1a\xe1=\xa4|\x8b= \r\xc7>o\x81\x97<\x06\x13\x07?6Pb\xbb\xe1\x12\x81?f\xc54\xbc=r\x81\xbc\xfd\x84\xa7>\xd1\xe2\x94>\xc1\x84h>\xdb{\x03?\x14\xa2z\xbc\x84;\xd4=kD"?\xc2M<?\xe2\xd7e?\xab\xb7q?5\xcf\xb0=\xbe\x9b\x9e\xbbS\xa2\x16\xbbAHP?\xd1\x8ez\xbc?\x98\xe0\xbb\x82\xb5m=C\x86C?\x13E\xe2=\xce\x87u>s\xf5\x97?\xd0[\x8d=\xb12\xa0?\xcb\xd7\x0c\xbc\x95\x05\x15?\xb9\xcf\xc8\xbc?\xcb\xe8>\x9c!\x9f>\xd2\x059>/\x85\x04\xbd\x13Q\xd0\xbc\xb2\xa2\x1a?\xa2_R?\xbe\xa2\xce>\x99*;\xbc\'Rm?\x8f\x89Q?\xd2\xa3D\xbc\x0e\xd0A?\xe2\x85\xfd<W\xfb\x04?N\x0f\xf9\xbc\xebI\xa6\xbc,\xf0`?{\x0fB=\xf8\x12\xe8\xbbg|\x07>\x80UW?J\xf4\xa4>~\xcb\xf6>\x9c\xb6\x9c?=\x1e\xed<\x0c\xe2\x02?\xe9\',?O-M\xbce\x84\xfb>?\xa8\xd2=\x91\x96\x8a?\x05\xf9\x90\xbcq\xde\x95?\x8d\xfa\xde<lh\t\xbc\xc6\x18E?\xd3\xf1d\xbci\xdc\x80<\xea@\xab?\xa0\xb1\x95?\xb2\x7f@?\xf8\xfe\xa5?(\xe7\xf9>\x07\xa0\xd2\xbb\xf6c\x00?\x13|\xa6?\xbc<\xc7>\xc7\x9c\xb7>|\xa2\x05?\x99[h\xbc\xad\xe6n>\xa2\x9c>?Z\xe3"=\xe30I?\x8d+\xdb<\xa5\x81\xea>\n\xb4F?\xaa\x0b\n?l\xfc\x0e?\xdf8\x15=\xdb\xb3\x8a\xbc\xbc\x94\xbd?\xa9\x7fd=*T\xf4=\xe7\xfc\x90?!v&?\xff\xeau=\x8f\xa1\xbe>\xcb\x8b+?rS\x86?]\xa6\xcd\xbb\xa4=\xbc>\x88\xf3\xba>\xdbr\x10>d\xbb\xf2>\xf5;%?\xe4\x046?J\x00\xdf>:\x7f\xc0?\xc2\xe4\x05?\xc6\xaf\x19\xbbQ%\x1f?\xabS\x89>\xe1\x8e\x93<\xcb\xe0"\xbc\x13\x8b(?\x1b\xe0\xcc>K\xb6\x9a\xbc\xd7)1?\xc9]M=\x08&\xf8=\x87\xf7u?_\xff\x07>\r\xba\x7f>\xb1\n\x18?!k\xb383\xc6\r?Ii\x84>$x\xbd>j3\x92?\xd6a\xb8\xbb\x7f\x0c\x9b>\x92\x9d\xc1>\xfc\xe0\x85\xbctP\xde;\xb0\x82\x90\xbc\x14\x93\xab\xbc\xe3p\x15\xbc#\xe3u>\xb1O\x8a>\xc3}\xa0\xbc\xd0\x9f\xb8>\xf5l\x0c?\x84>\x0e?6\x85\xf8>\xc9\xadY\xbc\x8bU\xad>MQ\xae?{\x9dg>+\xb4\xaa>\xc3\xc6\xbb\xbc\xb4\xa1\xae\xbc\xe3T\x85?)uh>\xb4\xb7\x9a?\x0bq.>\xbb\x8e\x1b\xbc!\x8f ?W\xf4\xfb>\xd2\xe0R>\x04$\x83?\xa6\xb0\xd9>Vu\xfd>\xc6\xe0\xc3>hC;?\x0e\x8d\x8d?\x08Y\xf3>\xd0\xe0\xd3>"0\x92?.\xab ?\x0f\x10\xf0;J{\x8f=4\xb4\x91=K\xee[?'
-p69
-tp70
-bsV473443685997084672
-p71
-g2
-(g3
-(I0
-tp72
-g5
-tp73
-Rp74
-(I1
-(I400
-tp75
-g31
-I00
-S'G\x1b\x03>%\x1d\x07\xbc\xe4f\t\xbe\x88\xaa%<\xac2\xbf=0#/\xbc\xeb[\xc3\xbc\xcc\xfe\xb1\xbd%T\xae\xbc\xf7\xf3\xbf=\xac6V;=A\t\xbd\xc6\x9a*=\xea*$<\x1a\xcf\x0c\xbd\x1cx\r>Kw\x01\xbdU\x16-\xbd\xd5\xbbe\xbdTg\xc6\xbc9J\xb5\xbd\x8f\x0c\xec;r\xfaA=qk=\xbd\xe6\xe44\xbc\x08\xcc(\xbd9\x9a\x9d=\xf3f\x88\xbdEc\xe1\xbd\x8c\xe6\xfe:\xe7\x16?\xbd\xfa\x0f"\xbd\t]\x16=\xa7\x9d\x01\xbeh\x84\x9c<"\x9f\x04>\xde\xb9i=\xff\x9fB=H\xe9\xf5=%\xcc\x1f=\x9a\xe75\xbd\xe5I\xc2\xbc\xd5ou=\xd0U\x98\xbd\xfc\xe3\x8d\xbd<d\x8c\xbc\x83\xe7\x0f>\x83\x0c\x14=\x84\x01\xaf<H\xe6,>\xe2\xfb\n\xbc3\xb3\x17>yTv\xbdb\x83\xb8\xbb,\x0e*\xbeYI\x8a=T\x80\xbc\xbb\x0fh\x1b\xbd\xa6\xa8J\xbe:\x08#\xbeG\xd2\x94=\t~\xb0=\xa4\xd0\xee< \x1e\xb8\xbd\xe1f\x0b\xbc\x8a%\x9a=\xa42\xb5\xbdK&\xb5=F\x08\\\xbdN\xf7\x85\xbd\xbf<?\xbe\xf3\xba\xf9\xbd\xa7\x95\xb2\xbc\x8f\xeb5\xbd\tSW\xbd\x95Hx=u\xb6\x93=2\xfbz=r<\x95=\x8a\x8f\xa2=(Z\x8f\xbc\xb1\xd6,<\x8dy\x02>\x0e\x85\xb7\xbdn\xffs=b/\x19=\xbc-\x98=\x89W\xfa\xbd\xadR?>\xd2\x86\x87<3D\x8f\xbd\xa5 [=\xd8#\x99\xbd\xf43p\xbc\xc8\x10\xe6=\xa3\xd4^\xbb5\xc4\xc4=O\x8b\xcc=\xee\xdd\x93=\xcc5\x19\xbd\xd7\xd3\x03<\x89\x90\xd9=8GO=\x93\xc5\x83=\x9a\xe9B>\x00\x1b\xdd\xbd\xb1n\x19;\xad\xcf[=`\xf3\x10=]\x8f\x00;\xd0\xe4\x9e\xbd7\x87\x91=w2j=\x86\x9a\x96=V3\xb0<\x92\x94\xe0<\xb6+\t\xbe\xb7/\xcd=8\xa51<A\xfe\xbc<x\x94;>m!I=h\x96\x1c\xbc\x00C\xf2\xbc\x81"\x11\xbd\x8b\xb8\xb2=\xc5\xb8C\xbd\xc9\x96\xab;\xc2l\xae<\x1d\x7fd=\xbc\xe3k\xbb~0\x19=\xd9S\x05=6\xd6\xab;\x8dI\x83;HQ\x08=i\xbf\xee\xbc\x98Z\xe5\xba4\xf4\xf4\xbc\xb6_\x01=\xee6\x9b\xbdo>\xf4=)\xda\xbf<<Q\xec\xbdY\x99\xff=9z\x8c<\xe5S\x85=\xedo$>\xcd\x0b\x7f\xbdJ\xe3-<\x95\xdc\xe1\xbc\x145\x89\xbd\xd9\x96\xdf=\xa2R\xcd=\xfa\xad!\xbc\xa2-\x04>tnx\xbd\xe7\xb1U=P;\xf4<\xd4%\xe8\xbd\x0b7\x0e<-\xb3\xc3\xbd4\t\x1e\xbe\xff\xd4\xb9\xbd\xeeU7\xbcb\xa7\xb9\xbc\xb5O\x1c\xbe}\x04\xea=\xc3\xbbK\xbc\x96S-\xbd-M\xa7\xbbAl\xd6\xbd\xf4\xaf\x12\xbd\'\xc16>\x11\xd7c<\xe3\x17\x8d<\xe7L\x15\xbe\x0e\xc5\x10\xbemW\x81<\x8c\xaeG=\xc6\x1e\xf6=\xce\xb0\xdd<\xa5\x03\xaa\xbd\x859\n\xbdSf\r>e\xf189\xd6\xbfx=\x951\xb1<\xca-\xe3=t\xeb\x97\xbd\xc1\xc4\x96=\xb6M\xad;\xb4#E=\xac\xf6\xa2=\xa7\xb0(>\x8a\x91\x10>\x84\xfd\x14=\x81\xea\xbe<D|6=\xa5\xba\x97<G\x1b\x03>%\x1d\x07\xbc\xe4f\t\xbe\x88\xaa%<\xac2\xbf=0#/\xbc\xeb[\xc3\xbc\xcc\xfe\xb1\xbd%T\xae\xbc\xf7\xf3\xbf=\xac6V;=A\t\xbd\xc6\x9a*=\xea*$<\x1a\xcf\x0c\xbd\x1cx\r>Kw\x01\xbdU\x16-\xbd\xd5\xbbe\xbdTg\xc6\xbc9J\xb5\xbd\x8f\x0c\xec;r\xfaA=qk=\xbd\xe6\xe44\xbc\x08\xcc(\xbd9\x9a\x9d=\xf3f\x88\xbdEc\xe1\xbd\x8c\xe6\xfe:\xe7\x16?\xbd\xfa\x0f"\xbd\t]\x16=\xa7\x9d\x01\xbeh\x84\x9c<"\x9f\x04>\xde\xb9i=\xff\x9fB=H\xe9\xf5=%\xcc\x1f=\x9a\xe75\xbd\xe5I\xc2\xbc\xd5ou=\xd0U\x98\xbd\xfc\xe3\x8d\xbd<d\x8c\xbc\x83\xe7\x0f>\x83\x0c\x14=\x84\x01\xaf<H\xe6,>\xe2\xfb\n\xbc3\xb3\x17>yTv\xbdb\x83\xb8\xbb,\x0e*\xbeYI\x8a=T\x80\xbc\xbb\x0fh\x1b\xbd\xa6\xa8J\xbe:\x08#\xbeG\xd2\x94=\t~\xb0=\xa4\xd0\xee< \x1e\xb8\xbd\xe1f\x0b\xbc\x8a%\x9a=\xa42\xb5\xbdK&\xb5=F\x08\\\xbdN\xf7\x85\xbd\xbf<?\xbe\xf3\xba\xf9\xbd\xa7\x95\xb2\xbc\x8f\xeb5\xbd\tSW\xbd\x95Hx=u\xb6\x93=2\xfbz=r<\x95=\x8a\x8f\xa2=(Z\x8f\xbc\xb1\xd6,<\x8dy\x02>\x0e\x85\xb7\xbdn\xffs=b/\x19=\xbc-\x98=\x89W\xfa\xbd\xadR?>\xd2\x86\x87<3D\x8f\xbd\xa5 [=\xd8#\x99\xbd\xf43p\xbc\xc8\x10\xe6=\xa3\xd4^\xbb5\xc4\xc4=O\x8b\xcc=\xee\xdd\x93=\xcc5\x19\xbd\xd7\xd3\x03<\x89\x90\xd9=8GO=\x93\xc5\x83=\x9a\xe9B>\x00\x1b\xdd\xbd\xb1n\x19;\xad\xcf[=`\xf3\x10=]\x8f\x00;\xd0\xe4\x9e\xbd7\x87\x91=w2j=\x86\x9a\x96=V3\xb0<\x92\x94\xe0<\xb6+\t\xbe\xb7/\xcd=8\xa51<A\xfe\xbc<x\x94;>m!I=h\x96\x1c\xbc\x00C\xf2\xbc\x81"\x11\xbd\x8b\xb8\xb2=\xc5\xb8C\xbd\xc9\x96\xab;\xc2l\xae<\x1d\x7fd=\xbc\xe3k\xbb~0\x19=\xd9S\x05=6\xd6\xab;\x8dI\x83;HQ\x08=i\xbf\xee\xbc\x98Z\xe5\xba4\xf4\xf4\xbc\xb6_\x01=\xee6\x9b\xbdo>\xf4=)\xda\xbf<<Q\xec\xbdY\x99\xff=9z\x8c<\xe5S\x85=\xedo$>\xcd\x0b\x7f\xbdJ\xe3-<\x95\xdc\xe1\xbc\x145\x89\xbd\xd9\x96\xdf=\xa2R\xcd=\xfa\xad!\xbc\xa2-\x04>tnx\xbd\xe7\xb1U=P;\xf4<\xd4%\xe8\xbd\x0b7\x0e<-\xb3\xc3\xbd4\t\x1e\xbe\xff\xd4\xb9\xbd\xeeU7\xbcb\xa7\xb9\xbc\xb5O\x1c\xbe}\x04\xea=\xc3\xbbK\xbc\x96S-\xbd-M\xa7\xbbAl\xd6\xbd\xf4\xaf\x12\xbd\'\xc16>\x11\xd7c<\xe3\x17\x8d<\xe7L\x15\xbe\x0e\xc5\x10\xbemW\x81<\x8c\xaeG=\xc6\x1e\xf6=\xce\xb0\xdd<\xa5\x03\xaa\xbd\x859\n\xbdSf\r>e\xf189\xd6\xbfx=\x951\xb1<\xca-\xe3=t\xeb\x97\xbd\xc1\xc4\x96=\xb6M\xad;\xb4#E=\xac\xf6\xa2=\xa7\xb0(>\x8a\x91\x10>\x84\xfd\x14=\x81\xea\xbe<D|6=\xa5\xba\x97<'
-p76
-tp77
-bsV445232111516405760
-p78
-g2
-(g3
-(I0
-tp79
-g5
-tp80
-Rp81
-(I1
-(I400
-tp82
-g12
-I00
-S'}\xce:=T\x14.\xbe\xa0B\xae\xbf\x17 M\xbf\xd5\x94\x9a<\x8a\xa2\x18\xbfk\x17z\xbd\xc9\x01\xad\xbf\xc3\x84<\xbf\xf3\xcfu\xbd\xc4O\x12\xbf\xef}\xe0\xbe\x89\x98\x11\xbf\xb0\xe8+\xbf\xe9 .\xbf\xd0\x1a\xd1<\xbe\x99$\xbf\xb2qQ\xbf\xdc\xd3\x9f\xbfz\xbf\x8d\xbf\xe0d\xbc\xbe\x92\xc5\xb2\xbe\x1ba\xb4\xbe.\xa5\xdd\xbeE\xcb\x05\xbe\xf6\x04V\xbf~F/<\xb0\xc9?\xbf|\xe0\x16\xbf\x06\xc8M\xbf;\x08I\xbf\xd8#\x14\xbf\xd8\xc1\x1e\xbf\xb3\x90\xa7\xbf\xdf\x86:\xbe\xe9\xa2,\xbe\xce\xbf]<,] <C\x7f\xa5<\xd2r8\xbf\x9b\x9e\xae\xbf\xb1i\xcc\xbf\xcbl\x05\xbf\x1d+\xcc\xbe\x8eM\x8c\xbf#\xb40\xbfQ\xbc\xc8<b\xcc\xd1\xbe*xW\xbeh\xcaE=\x15\x1e\xa4\xbe\x03\xe0\xb4<\xd9\x9f\xda\xbe0[G\xbd\xa2\xc8\xaa\xbfM\xd2\xe0\xbeq\x18\x95\xbe9"=\xbf\x9cS\xfa\xbf\xbf:\xba\xbf\x0en\x1f\xbf\xc8\x84\xe4<:\x88r\xbb\'\x9f\xe0\xbe\x89\x9d\x8c\xbc\xbb\xb7\xb8\xbeKIg\xbf\xf7\xf2\xfa<]:5\xbe\xf88S\xbf\xcb\xde\xac\xbf\xb4\xc6\x95\xbf\xb8\xe3u\xbf\x141\x08\xbfYz\xcf\xbe\x1fK\xfd\xbe\xfb\xf1\xd8\xbeA~\x05<\xbdaZ\xbeY\x97\xc2:y\xc0S\xbe\x9c\xa0\x8e\xbe\xb5\xc0(<\xbc\x17i\xbf\n\x97M\xbc\xbbP\xe4\xbe\x9d[\xc3;\x12\x986\xbf\x13L\x11<jEM\xbf\xf9\xf4\x9b\xbf5\x01H;\x15\x0c\xc4\xbf\xdd\xf3\x98\xbf\xaa\x1e\\<\xc0\xda\x91\xbe\x95\xe6\x8d<;\xda\xdf<*\'\xf0\xbe\x16\x8f\x98\xbf\xa1\x86\x0f\xbfQ|\x99\xbc\xe6Cy\xbcRK\xb6;\xa7`>\xbd,J\x96\xbf\xdc7\xcd\xbe\xfbCl<1g#\xbf\x88y\xde\xbd\xd9\x19\xfa\xbf~\xc7&\xbf\xfb\xf1\xa2<\x03O\xd0\xbd\xd4\t\xd1\xbe\xd8\x1c}\xbf\xa1\xb3\x88\xbf\xc4\xe4\x85<\xc7}\xac\xbf\x93\xdb\xde\xbePv\x8a;Q`<<K\xac\x07\xbe7?O\xbe\xad\xd5\xbc\xbe\xfao\xec:\xde\x85\x95\xbf\xe2\x92\xd0\xbd\x009,\xbf\\\x98{\xbe\xb1V\xe4\xbd\x84\xb3\x85:/9|\xbbu}\xe5\xbe\x9f(\x89\xbe\xfc\xf6\x07\xbf\xf4\x00n\xbf\xd6\xc8+\xbe\xd5\xa9\xd2\xbfX\xb7\\\xbf\xa9VQ\xbf5TG\xbc\x88B\x1e;\xce}\xad\xbfA=\xf5<*\x00\xfc\xbe+\xc3 \xbf\xdd\xd1\xee<\x8d\x03\xd4\xbe\x91j\x94\xbb\xe2\xf8\x88\xbd\x90\xc6W\xbe\xe3_\xba\xbb\xce\xc2*\xbfb\xc7\xa5\xbe\tQ\xf7\xbbQ\x9fp\xbf\xf1\xe7\x17<[\xa3\xd5\xbb\xee\x9df\xbf\xf2\x9a\xbe\xbf\xec\xea\x98\xbf\x99[\xcb\xbf\x98J\x9b\xbf\x80\xa9U\xbd7\x04\xde\xbe.\xbe\x87\xbf;\xda\x99\xbe\xc5[e\xbdb\x9e\xcc\xbe#\x06\x8a\xbe\x9fnY\xbf9-v\xbf\x12T\x14=NU\xa8\xbe/\xbd\xe3\xbc\x18\xf5G\xbf\xfbL\xa8\xbfq\x0eg;\r\xc1\x89;]d@\xbcC\xde)\xbf\xcd\x06*\xbf\x9bi\x0c\xbf\x06\xeb\xc9<z\x16\xc1\xbeF\x8e!\xbcF0\xcd:\xb0\x88\x00\xbd$m\x08\xbfP\xa7%:BE4\xbcpM\xbc\xbe\xc1W\xde\xbb9\x8f7=P[\xf0<\r\xb0\xa1\xbf4\x10\xc5\xbd@/\xcd\xbe\xf5\xa8M\xbf~N\xd7?K\xd6I?>A\x83\xbcj\x16\xdd>\x0bS\xb3?\'\x88\xb7>\x18.\x8c?\xaa\'k\xbcPo\xc4>\xcf\xe6\x81?\xf6\xf0\x19>\xe0m^?0a\x1f?k\xfe\xfb>\xadT\xe6>+\x89\xba?!_\xaa\xbb\t\xedj>"\xe0\x94\xbc\x12\x05\x16>v0\x93>\xd6\xe5\r?\xb1D\\?l\xd8\x97?\xb4\xa9\xcf>\xa8\xfb\x1b\xbc\x8a\x1cn?\xa7c\xd3=\xad\xf3\x8d>e\xa7\x00?xc\x81>.\xcc\x13?\x9b\xa9\x84=\x92\x83\xc9\xbc\xf1\x1a\xc4>%\x85z?$\xfd\xd3?\'<Z?\x19\xa4\xb6?\xf68\xcb=5;\x03\xbc\xa3\x98\xa7:N\tT?.\x18\xd3>\xea\x81\x8d:\x15w\xb4=\x81\xc3\x92?n\xf76?\x0f\x08\x12?0\\\xcf?+\n\xb7>\x02\x82\x9f?[JW>\xe7}k?\xb53%\xbd5k\xea=\xa0\xbb\'?:\x9a\x14?\xc7kz\xbd\x1fR\xea\xbcN\xe7\t?\xcfG\xea?\x97\xa4\xbd?u\xec\xa6>\xf9/v?\x04\xfc\xe7>\xfd=\x04<>\xc7\xca?\xf4i\x87?\xc1\xea\xa5>r\xc0\xd1:{\x10\x9c\xbc\xc6\xb4\t?\x18FE?v\xdd\xa1>\xce\x01\xad>\xea\xbf\xc2>YG\x11?\x01\x1es?\xb2\x00\xa3?\xf5\xad=?\xacn^?}\xf09?\x06\xc1\x80\xbc\x96\x9c8?~v\x96>\x02\xbf\x86??\xa6E<\r\xb9\xe8?\xff\xcc\xd5<\x08\xb9\x12\xbc\x95\xd4\x94?G/z\xbc\x17hH;\xe8l\xac?\x83\ts?\xb9\x1c\xd4?\x1a\x80\x96?6_o?\xcf)l\xbc\xdd\xe4H?\xa3\x01"?"\xfc\x08?\xb7\xb7R?\xbb\xd9\x9e?z \xa8\xbb\xf3\xcb\xd8>\x816\xa7?\xecYq>\x1cF\x18?\x9d\xd2v\xbc\x88\x8c\x11?\x7f;\x86?\xc2\xa5A?\x884H?*\x14\r?\xca\xe4i\xbc\x97\xaeu?\xa7G\n?\xa6\xcb#?\xd0\x03\xa7?\xc5Y\xa0?\x1a\x98\x84>\xac\xbc=?\x96"6?o\xba1?\xf3\xe6\xdd=\xc2\x95\x7f?\xa5\xe5\xff>\x04\xbd\x89?\xd6\x869?\xb2\xbe\xcf?5O\x8c?\x9c\xdb\x8b>\xfb\xa5\xa2?"")?0\xf5\xca\xba\x82\xb4\xd7>\x0f\x01\xbc>\xd1\x18\xad<\x11H\xc8=1r\x8a?Q\xed\x9c?=\xd3\xc2\xbc\x06c\xaa?\x990[?a\xa4\x06>s\xcd\xf2?x\xc3\xdc=\x81\x9aQ?\xcf.T?\xa9f]>u\xa0V?:b\xe0>\xe9\xf4\xd8>\x9c\xe4\xb3?\x85t\x05\xbcro\x7f?\xc5>1?\x1d\xe1\xe4\xbc\xee\xa9\xec<\x83\x83C;:\xef\xc1\xbc)jF\xbcf9\x03?\xc8\xe9H?4 \x96\xbc\xd6\xdb\x14?o\x9c\xa2?\x13_\x1f?H\xb7\x12?6\xab\xb1<\xbat\x02?w\xff\x86?\xa7\x92\x1f?2\xf9R?4\xe9x\xbc\x96\xd5\x12\xbdi1\xf2??c$?#-\x80?\x05a_>\xe8o\x8d\xbc\xb3\xeb`?99\xf9?\xe6\x15\xae>\x07b\x97?\xa0(\t?tD;?\x91\x8c\x87>\xcex\x86?\xed?Z?mX\xa6>j\xc3\x85?\xbe\x97\xc0?iN\x86?\xb7d\xc4<\x8eK\x8d>`\x16\xa2>\x06\x16"?'
-p83
-tp84
-bsV473435889071161346
-p85
-g2
-(g3
-(I0
-tp86
-g5
-tp87
-Rp88
-(I1
-(I400
-tp89
-g12
-I00
-S'\xc2\xbd\xcf<\xcaEL;\xa0B\xae\xbf\x9bN8\xbf[\x87w<\xb5\x10\xd1\xbe*(\x9d\xbd\x85\x89a\xbf\x94R\x90\xbe\xe0\xdc\x8b<\x16\x99 \xbf`\xa6\xd2\xbe\x0c{t\xbe\xb0\xe8+\xbf\x19j@\xbe\x9e\xab\xfd<\x00G\x1d\xbf\xb2qQ\xbf4\xec]\xbf{\xcd]\xbf\xe0d\xbc\xbeS\xfb\x88\xbcYr\xc9\xbd\x1a~\xd6\xbdE\xcb\x05\xbekA\x1e\xbfi\x83\x8d<?:|\xbeAG\x1a\xbf;\x14@\xbf;\x08I\xbf\xc8{\x8f\xbe\xbb%\xe8\xbe$\x0e\xa7\xbf\xdf\x86:\xbeiA\xca<\x89$\x9d<v.,<\xbb\xb4\xc0<\x86\x8d\xca\xbeej~\xbf\xce\xfd\xad\xbf\xcbl\x05\xbf\xa3U?\xbeC;<\xbf#\xb40\xbfP\\\xc9<Py\x1e\xbe*xW\xbe\x07}\xf6<\xf7x~\xbe\xd2\xc2\xa2<y\xca\x9f\xbe0[G\xbdL~\x84\xbf5\xe4\xd7\xbeq\x18\x95\xbeQ\xe2&\xbe\x9cS\xfa\xbf\x04\xc2\x8e\xbf\x9c\x8ar\xbe\xbf\xdd\xbb<\x88\x11\x80<\x95ui\xbe"\xee6\xbc\xbb\xb7\xb8\xbeT\x9d\x1f\xbfad\xad<]:5\xbeRH\xf4\xbe\xcb\xde\xac\xbf\xb4\xc6\x95\xbf\xd5\x94]\xbf\x141\x08\xbfYz\xcf\xbe\xeb\xb6\xda\xbe\x08\xcc\x92\xbe\x98\xf2G<\xe7a\x9c<\xea\xeb\x97<\xf2X&\xbe\x8c\xcf\xa3\xbd\xdd\x98\x9c<\xf89\x1b\xbf\n\x97M\xbc\xcc\x99\xb1\xbe/\x1aB<\xd0%\xcd\xbe*\xa5\x10=jEM\xbf3-n\xbf\xc6\x07M<+\xca\x90\xbf\x94\x9f\x97\xbf\r\xf9\xac<\\c\x88\xbc\xdcK\xde<  \x96<*\'\xf0\xbe8a\x89\xbf\xa8\xf9:\xbe\x9c\x05\x96<\xa4\xd1A<\xd3?j<Fd\x07=,J\x96\xbf\xc0\xe0\x13\xbe\x15@\x84<1g#\xbfe\x01\xc5\xb9\x18\x16\xc7\xbf\x17(\xa5\xbe\x12\xb9B<E\xdb\x8d<\xda\xfa\x15\xbc\xd8\x1c}\xbfp\x99\x86\xbfuD\x85<\xc7}\xac\xbf$\xfa\x94\xbe\xd2\xa7\xff<\xa1\xf9\x9f<K\xac\x07\xbe\x89\xb2\xe7\xbd\xd3|d\xbe \x96J;i\\n\xbf}_\x9e;\x009,\xbf\x0c\xf9N\xbe\x1d?\x88\xbeYN-<!\xa6!<\x17\\\xd5\xbe\x177\xd0\xbd\x87\x05\xfe\xbe\xf4\x00n\xbf\xd6\xc8+\xbeC\x8dp\xbfh\xa8*\xbf\xa9VQ\xbf1V\xc8<N\xcf\x11<\xf7S\x9f\xbf\x04\x95\xb8<\xe3\x81 \xbe+\xc3 \xbf3\xf8\'=+\xe0\xa0\xbep\\\n<5\xa4\x97\xbe\xd4\x9a\xb0\xbe\xed\xdb\x80<\x06\xf6\xc0\xbeb\xc7\xa5\xbe\xbdN\xe4<Q\x9fp\xbfP\x1ch<|\x1a\x02<qt<\xbfC\xf7\xa9\xbf\xec\xea\x98\xbf\xf0h\xbf\xbf\x98J\x9b\xbf\x8d\xa59\xbd\xd3\x15\xab\xbe\x8c]\x9d\xbf;\xda\x99\xbe\xf7\x9f\xd0;\x07\xe32\xbe\x7fb\xd8\xbd\x9fnY\xbf,\x14T\xbf]\xf9\xd7<NU\xa8\xbe\xa9-\x0e<\x18\xf5G\xbf\x86\xea\xa5\xbf\xaefn<7w\x16<\xa1#\xaa<C\xde)\xbf\xcd\x06*\xbf\x9bi\x0c\xbff~\x04=yO\xa8\xbe\x13\xc3\x8d<L\xfc\xe1;&\xb3\xa2<\xd3\xf7\x95\xbe:\xc5\x93<\x92\x83\xa6;pM\xbc\xbe\x99\xdc\x97<\xd1^\xea<\xabZ\xd6<\r\xb0\xa1\xbf\xcd\x07O\xbe\xd6\x00\x91\xbe\xd4\xed\x01\xbf\xaf\xcd\xb0?\xf0\x83\x18?\xf9\xb0\xd4\xbc\xfe\x7f_>\x81\xe1X?3\x962>\xd7\x19\xfe>\xb7S\x8f\xbc7\xb7`\xbb\xa8#w?\xd7\x83\x19=\x9f\xf8\x88>M^\x16?d\x95\xd8=j.5>\xe9\xe5\x96?\x82\x07\xa8\xbb\xde1_> i\x89\xbc\x12\x05\x16>\xdb\x03\'>\xa0\xfc\xdf>\xff\x9bu>0\xb0-?2\n\xc0>5]V\xba\x8a\x1cn?.;\xad=\x80\rX\xbc\xc0\xcb\xb5>vM\x80=O\x9c\xc1>\x9b\xa9\x84=Ti\xe7\xbc\x94N\xbd>\x95\xe7\x10?$\x92\xa8?\x8a\xe4\n?\x19\xa4\xb6?@7\x9d=\xd7T[\xbc\xbb\xb5\x83\xbcu/\x1e?\x87\x8d\xc3>B2\xb1\xbc\xbd\xf9\x06\xbb\xc8\x16V?n\xf76?[\xb6\xa2>5\x83\xad?\xee\xc65\xbb\x9bIe?\xd5\xd9\x07>\xe9\x89 >\xb1Y\xdb\xbc5k\xea=\xa0\xbb\'?:\x9a\x14?\xa3\xcd"\xbd\x1b,\x01\xbd\x12\xf9\x8c>\x9cq\xc9?\x97\xa4\xbd?\x00\xea\xfd=ig\x12?\x04\xfc\xe7>\xfe\xee\xac\xb9\xad\xe2\xc4?\x85Al?\xc1\xea\xa5>\xd4>\x17\xbd\xe0\x0c\xb6\xbcIMW\xbc\x18FE?v\xdd\xa1>g|\x07>v\xf04>YG\x11?\x01\x1es?\x89\xd4b?\xf5\xad=?\'\xa7V>\xb8\xbc\xf6>pz_\xbc\xcd\xf7\xe0>\xa4\xc6}>\x1b?Q?v \x91\xbc\x80:\xc1?\x04\xef\xc1\xbb8\x96\x93\xbc\x95\xd4\x94?\x06\xa1\x8a\xbc\x1c\x1a\x0f\xbc\x8cK\x87?\x04+\r?\xc2R\x9f?@(\x83?\xc6\xd7\xee>U\x94I\xbc\x920\xc6>\xa3\x01"?=\x00\xdb>>\xd5\x0c?n\xcdI?\xb5I\xb7\xbc$\x1c\x02>\x1bE\x9d?\xb8p4>\xe2\xf5\n?c\xb4\xd0\xbc\x8b\xd2V>\x7f;\x86?|\t\x1c?\x87$\xae>*\x14\r?\xf7s\xc8\xbc\x19\x16)?\xa7G\n?\xa6\xcb#?\x0f\xe7\x80?\xc5Y\xa0?\xf2\xcc\x13>\xac\xbc=?F\x84\xe4>t,\xe7>\x83tG\xbc\xdd\xce\xf0>\xa5\xe5\xff>\x04\xbd\x89?\xd6\x869?\xb2\xbe\xcf?5O\x8c?\x9c\xdb\x8b>\xefnl?\xb6\x15\xe1=\xdc\x9aE\xbcn"k>\x18\xc5\x9d\xbc\xe1\x8e\x93<\x11H\xc8=\xd7V"?\x1ch0?\xccz\xdd\xbc\x0c\xa8\x9e?i\xb1H?\x08&\xf8=\xf4\x9c\xe0?x\xc3\xdc=\xbae\x05?\xcf.T?#\xd4/<u\xa0V?:b\xe0>\xe9\xf4\xd8>\xfe\xcav?\x92\xfb6\xbcro\x7f?k \xb1>\xb7\x80\x8a\xbcI\xe1C\xbc\xc3\x94e\xbc\xaa\xa9\xe4\xbc\xb8\xaa\xaa\xbc\xeb^\xac>+~ ?\x12U\xec\xbc\xe7\xb3\xbe>o\x9c\xa2?\x13_\x1f?\x07\xf5\xbd=\x0c\x84\xd5\xbc\xb1Th\xbc|E??H\x1d\xd3>NQ\r?\x10\x10\xbe\xbc7\xd0\xe9\xbc\xd6\xa5\xc4?>\xfc\x9d>\x80\x0c\x11?\x0f\x01\x85>\xfdgG\xbc\xb3\xeb`?\xf8\x1b\xe3?\xe6\x15\xae>\x95\x10\x94?\xa1f\xd9>tD;?r\x93R=\xcex\x86?h?M?mX\xa6>j\xc3\x85?\xe7\x80\xb7?iN\x86?\xa7\x8f\xbf\xba\x86EJ>\xfa[\xb5>\xb7,\xa3='
-p90
-tp91
-bsV474117578101493760
-p92
-g2
-(g3
-(I0
-tp93
-g5
-tp94
-Rp95
-(I1
-(I400
-tp96
-g12
-I00
-S'\xe3\xa0\xe9;\xe8\x11F\xbf\x877\xed\xbf\xcb\x7f\\\xbfz\x1b\xc1;]\xce\xc7\xbf{5B\xbe\xa8\xe4\x8e\xbf\xa6\xbc\x1b\xbf\xe3KJ\xbe\xe1\x8d>\xbf\xef}\xe0\xbe\xcaH\x1a\xbf\x90#\xd4\xbf\xff\xe6\x02\xbf\x12\xef\xf9;\xbe\x99$\xbf?\xea-\xbf\xdc\xd3\x9f\xbfz\xebG\xbf\xd0@\x1b\xbf[\x04\xe6\xbd\xa8)\x1e9@\xa1\x95\xbf\xcd~\x83\xbee\xe0W\xbf1\xf12<)\x01\x85\xbf\xb1\xb0&\xbfy\xd5m\xbfa,8\xbfz\xe2{\xbe\xb8}\xe3\xbeE\x99\xc5\xbf\xc2\x0b\x85\xbfGw\x14<\r\xc6A;M\xfd\r\xbe\xb5\x0e"<\x85\xe3\x1c\xbf\xc4\xfd\xbb\xbfq\x8f\x9d\xbf\x99++\xbfB\x1a*\xbf\x16\x1e\x8d\xbf\xa5\x1d\x13\xbf\x19\x93U<b\xcc\xd1\xbe\xd6\x9c\xd9\xbeul\x8c<\x15\x1e\xa4\xbeN\xdb<<\x18\x81\x18\xbf\x17|\x1c\xbel\x0b\xc7\xbfM\xd2\xe0\xbe)\x9b5\xbe\xb1\x1e\x13\xbf\x93\xa1\xff\xbf\xbf:\xba\xbfK|s\xbe\x1dPs;\x90^\xa8\xbc`\x0b\xbb\xbe\xc3u\x11\xbe\xa1\x97\x85\xbeKIg\xbf(\x84!<<\xe9\x9f\xbf\xf88S\xbfa\x98\xf8\xbfq\xf7S\xbf\xb8\xe3u\xbf\x92\x96\x0f\xbf\xcdv\xf8\xbe\x1b\x8e\x18\xbf\x9a\xe0\x07\xbf\x03\xb8\x89;]\xfc\x90\xbd`?\xf6;\xa8%\xa6\xbe\xf3v\xda\xbe\xb7\x1c\xaa\xbe\xbc\x17i\xbf\x93\x9e&\xbe4SD\xbf\x06\x1d\xa9\xbe\xe4\xa1\x81\xbf\xdd\xfcH<4S\x1f\xbfz\xcf\xa4\xbf\x9d\xdc\x7f\xbd\xf4)\xcb\xbf`B1\xbf8#\xa1\xbd\xbe \x1e\xbf\r\xf0\x05\xbb\x0c`\x92;\xfd=\x19\xbe\x16\x8f\x98\xbfA\x18Y\xbf\x923\'<\xc1/\x94\xbeQ\xd9\xbc\xba\x1fX\x91\xbeE^\xc0\xbf\xcb}X\xbe\xd0\xdf];2\x834\xbf\xde\x94\x12\xbe\xd9\x19\xfa\xbf\xb8;\x9a\xbf\x92\\\x01\xbf\xb4r\x1f\xbd\xaeN\x10\xbf\x08*\xe1\xbe\xca\xe2\xbe\xbf(\x85\xf4;\xae\xa9\xa2\xbf\xf8\xb6\x06\xbfM[k<\xd4\xf9\x81\xba"\xaeL\xbf\xb2E\xe4\xbe\xad\xd5\xbc\xbe\x9a*\x10<\x1d\x17m\xbf\x1c4h\xbe\x9f\xed\xfb\xbe(\x04\x0f\xbf\xcad1\xbe\x99I\x9f:)\x0c\xc6:u}\xe5\xbe\x9f(\x89\xbeA\x05\xd6\xbe\t\x1fJ\xbf\x8f\x16\x86\xbe\xd5\xa9\xd2\xbf\x8690\xbf\x94\xd4\xf9\xbe\x19\xb1\x1a<\xb5=\xeb\xbe\x81\xdf\xb8\xbfX5\x03<\x83\x9f+\xbehM\xd6\xbe\xb1\xd0\x7f;;\xe3J\xbf\x1c\x97t\xbde\x07\x9f\xbf\x9aC\xcd\xbe\xe3_\xba\xbb\xce\xc2*\xbf\xfe\xee\x90\xbe\xa4u\x83<\x0c\xcbI\xbf\xf1\x95\x03;<\x90\\\xbe\xee\x9df\xbf\xf2\x9a\xbe\xbfgM{\xbf?b\xa2\xbf)\xbc\xe3\xbfp#\xd3\xbe\x94=\xc5\xbe\x17/\x19\xc0\xd9^9\xbd\x08[\x94\xben\xd1\xe0\xbe#\x06\x8a\xbe\xb64N\xbf\xab\xc1H\xbf>\xef\x90<{r\x16\xbd\xa9\xa3\x85\xbc\x1b*O\xbf\xfbL\xa8\xbfrY\xc6\xbb\x89\x82\xd7\xbb\x8f>\x9d;\x03\x96U\xbe\x0fm\x05\xbf\xc4\xe6\t\xbf\xbefo\xbb\x19\xe7\x84\xbf\xe7R`\xbcM\xd65\xbe@I<\xbd\xe4\xb8$\xbf\x8d\xfe;\xbe\xf8\xa6\x85\xbbt}}\xbet\xc5-\xbf\x829\x0f<\x93\xb9R<mE\x98\xbfx4\x1f\xbf\xa5i\xcf\xbe\x03P>\xbf\xaf\x8f\xd8?K\xd6I?E\x88\n\xbcVA\x04>\x0bS\xb3?\xfcb\x15?\x8d\x8f*?\xdd\xf8\x99\xbbPo\xc4> \xe5\x92?D2\xc5>\xe0m^?G\xcc\x1c?\xf4\xbd(?\x085K\xba+\x89\xba?f\x92\xa5>\xdf\x89`>\xe3\xd3\x85\xbb\xf3\x88\xe2=v0\x93>\x06q\xc8>gUX?l\xd8\x97?\x16c\xa4>\x08~l\xbb\x03S\xd1?\xa7c\xd3=\xc2vE>m\xdcR?\xb1%$?\rO\xa9>\xe1PG=\xef\xadX\xbc#\xa9\xe6>d\x85\x81?\xd7\xc1\xb7?\xc6\xb2X?\xff\xdf\xd5?E\xe0:>\xcf-\xbf=\xeb\xd6\xd9;\x82:V?X\xa8\xdf>\xcen\x81>\x1e\xbd\xc8=nX\xa4?\x94\xc9\xf4>W\xcfA>\xb4\xcf\xe5?\x00X9>x~\x94?\x87y\x0c=\xe7}k?\x00\xb35\xbc\x00\xf21?:\x16v?`\xdf\xc1>\x9cAk\xbc\xed\xae\xff\xbb]\x9fE?\xcfG\xea?\xc3\xff\x97?\xec\xc2\x0b?\xfdYb?\xc0\x8ch?%\n\t>L\x19\xc3?:\xda|?Lt\xdb>\x808(\xbc\xf2\x00/\xbc\xde:\xb3>P1\x15>a\xe3w=\xd3\xd6\xf1>\x8aVm?\xa4QY?\xb8\xfbP?n\xd9J?l\xa1\xd3>\xd2:\xa7>\xc5\xcc\x90?\x01\xab\xc9\xbb`\x11W?o\xc0\x12?\xc3\xa4\x9d?0\xe5:\xbc\r\xb9\xe8?\'X\xb9>J\xa0N=\x96\xf1L?\xca\x150\xbb,5\xaa>\xb8\x84\xe2?:\xdf\x9d?\xe1\x92\xb8?T\x13\x99?\xf8\xb2x?|;\x92\xbaR\x8eX?\xec\xea\xdb?\xe4\x8b\x01?T\xe0\x19?\xd0Z\x93?`5A\xbc7\xd7,?\x816\xa7?\xb8\xe1\x8c>\x1c\xe9\x02?[\x14\xda\xb84L%?\xdb\xbf\\?\xf2\xa64?\xcc\x10s?\x08\xe1\t?\xb9\xd3q\xbcO\xb9\x8f?aj\x18?\xa7\xe2\x0e?=\x84\xae?\xfap\xd4?X\xad\xa9>$<\x0c?\xed\xcd%?\x9d\xfd\x92?^8D\xbb\xc2\x95\x7f?DU\x8e>\x9e\xcb\xf1>l\x1f2?\xed\xf8\x8e?N\x92\x18?h\xb3\xb8>\x94\xe0\x97?\xf6\xbd\x8b?\x06\xcb\xbc=b\xe5\xf5>\x1bw\x83==\x82\xc3>?\xbb\xd8:\x08Ny?\xa4!J?\x83\x804\xbc\x8e\xac\x90?\x990[?\xbc5U?QQ\xf9?\xa2e\xa6<\xbf\xc7L?\x1d\x9d\x8d?\\k\xb2=\x8f\xa0,?\x86),?\xcd\t\xd9>\x92J\xf3?\n.\x92=VZ\x18?\xa4>g?>2\x07>\nb\xba>\xa1\x19\x08>\xb2\x15\x19\xbc\x97fM>_\xcaZ?D\xb0\x04?\x1a\xf5\x94\xbc\xedX3?\xf4\x97\xa7?J^\xac?J\xc6\x82?\x1d\x1bU>\xcau\xb7>\xea\xa8\xd8?\xe3\xf6p?2\xf9R?\x90f4\xbc\x9c\x197\xbci1\xf2?-C[?#-\x80?\xe1\xf2\x16?\xd9\xd9\r\xbc\xdf0\n?\xb4_\xcd?\xdb=j=\x10\xcc\xa9?.\xad\x11?\xf8X\x08?\xdd\xb2d?c\x95\x84?\xed?Z?E\x004?\xa5\x83r?=\xf5\xc8?=kw?\xcf\xa4/>J\x1c\x1b?`\x16\xa2>\xf3\xd8\x8d?'
-p97
-tp98
-bsV476548892423503874
-p99
-g2
-(g3
-(I0
-tp100
-g5
-tp101
-Rp102
-(I1
-(I400
-tp103
-g12
-I00
-S'\xa3x\xba<4}/\xbc\xa0B\xae\xbfm\x8e<\xbfW\xd1m<\xf4\xd6_\xbf\xa4To\xbe\xb1\xb7\x89\xbf\x94R\x90\xbe\xa0\x8e9\xbeC\xde\x02\xbf\xdd\x8d\x8d\xbeH\x0e[\xbf\xb0\xe8+\xbf\x01J\xd7\xbe\x85i\x8a<\xdd\xa2\x13\xbf\xb2qQ\xbf\x98\xae\x87\xbf=9>\xbf\xe0d\xbc\xbe\x92\xc5\xb2\xbe\xf0b\xf7\xbc\x85\x99 \xbe\x8b\xeb\xfe\xbe\x98\x08\x1e\xbf\x0f\x00R<\xd9\x01\xb1\xbe%\x11.\xbf\xf7,!\xbf(,+\xbfNn?\xbf\x8e{\xb5\xbe\xc6\xa1\x80\xbf\xdf\x86:\xbe9Z\x80<\x0c\x19\'<-\xb0\xd5;$\x0f\x85<\x18\x9e\xa8\xbe\x99b\xa4\xbf\xd3\x82\x8b\xbf\xcbl\x05\xbf\xf5\xb8\x9c\xbe\xe4\x13\xc6\xbf#D\x9e\xbe\x8c6\xc5<Py\x1e\xbe\x8dd\x93\xbeV\x97\xf0<\x04f\x99\xbe\x9c\xdc\xac<\x07S\xbf\xbeK\\\xb9\xbc\xd7\xd7\x90\xbf5K\xed\xbe,d\x07\xbe9"=\xbf\x81D\x05\xc0\xfeU\x98\xbf\x80\x90u\xbf\xe3\xbaN<\xe8\x87D\xbc\'\x9f\xe0\xbe\x1b\xa6(\xbd\xe0J\x06\xbeD\xfa3\xbfT\x15\x7f<]:5\xbe\xd9q?\xbf\xc2\xb5\xed\xbf\xb4\xc6\x95\xbf\x14\xee\xc9\xbf\xbex\x19\xbeYz\xcf\xbe\x97\xb5\'\xbf\x8a\xd1\xe2\xbe\x14\x97\xbc;\xb2q\xbc;\xbf\x0b1<\xf9^\xbd\xbdU\x94\xbd\xbe\x9c\xad\xa0\xbe-\xde)\xbfa9\xfa;eFZ\xbe\xd8\x97\x89<\xb5\xbba\xbf\xbcS\xbc<\xd3lz\xbfO\x01\x81\xbf\x0388<Y\xc8\xa5\xbf\x94\x9f\x97\xbf\x1e\\\x82<\xc0\xda\x91\xbe\xc7\x1b6<XZk<*\'\xf0\xbe\xb7%\x84\xbf\x8f>]\xbe\x914\x81<\xb6\xc1\x8a\xbeu!\x9f;\xfe\x99\x9f<,J\x96\xbfW="\xbf-\xdd\x1b<1g#\xbf9\xab\xcf\xbdP\xeb\xcd\xbf\x8f\x13\xc7\xbe\x0b&\xe1;`h\x14<\xc8f\xc2;\xd8\x1c}\xbf\xfb"\x8f\xbf\xb9\xbd\x8a<\xc7}\xac\xbf\x93\xdb\xde\xbe\x1b\\\xcf<\xa5l\xcc;?\xda\xde\xbe7?O\xbe\xfc\x83\xb1\xbe\x86OY<i\\n\xbf\x1c\xed\x9f;\x009,\xbfb\xde\x9f\xbe(\xeb\xb7\xba\xab\xe3!;\xb9\x9b1\xbdD\x9c\xa8\xbe\x89\xb1\x1a\xbeQ\x8b\x1b\xbe\x8a\xe9z\xbf\xcc\xbe\x8e\xbeK$\xca\xbfh\xa8*\xbf[\xc3M\xbf<\\\xad\xbd\xcd\x87+;T6\xa9\xbf\x84\x96\x9b<*\x00\xfc\xbeAM\t\xbf}\x93\x8b<o\x8f\xed\xbe\x90\xd2\xe4\xbd\xb0\x1a\x94\xbe>\xa9\xcc\xbem\xdeR<\xae\xf7$\xbeb\xc7\xa5\xbe\xd5\xbd\x96<2k\x1a\xbf\xc6\xfd\x84;y\xdf\x1a;J\x1c\xfb\xbeY\xf1\x9b\xbf\x13\x83\x84\xbfI[\xaa\xbf\x98J\x9b\xbf\x80\xa9U\xbd\xd3\x15\xab\xbe\x88F\x80\xbf;\xda\x99\xbe\xc5[e\xbd\x149\xf5\xbd\xd2/Q\xbe-P|\xbf\x88\xd3W\xbf\xc82\x00=NU\xa8\xbe\x13\xa9\xa5;\x8b\xf6~\xbfa\xf9\xc6\xbfp\xbbX\xbbF\x8f\xa7;\x91*J<C\xde)\xbf\xc8G\xf8\xbe\x9bi\x0c\xbf)\'\x1b<yO\xa8\xbe\x03$\x08<\xc6\xf2\xc4\xbc6YZ<)("\xbf\xbe\xfc\x07<\x97K\x14\xbc\xd8\xc5G<\xc8\n\xbe\xbd[\xb8\xb9<\x15!\xac<\r\xb0\xa1\xbf\xe4\x85\xf9\xbc\xd6\x00\x91\xbe\x9a\xc9\xc7\xbf\xcfP\xd9?\xe8\xecA?\x83\x15\xb0\xbc\x8c\x85b?gp0?q\x98\xbe>3>\x9f>prC\xbcG\xeb\x8a>\x01p\x86?J\xc9\xfe<\'{\x9b>M^\x16?GK\x00>\xadT\xe6>\xa6t\x9e?\xbc\x94\x00;\t\xedj>\xed\x1f(\xbc\x12\x05\x16>@\xe5\xc8>\x1a\x93\x07?\xaeZ\x97?\x0cS.?\x97\xc2\x9e>\xfd\x0c\xf4=\xd9\x8c5?\xd8\n(>\xe0\xd2\x1b?\xc0\xcb\xb5>\xd1\xa50>\x00,\x89>\xd0\xeb\xb8=\xb0w\x87\xbc\x9f\x93\x8d>\\\xac\x95?9I\x98?O\xe0g?/\x9c\x9b?\x96\xec\xbb=b\x19\xda\xbb"\xda\xfb\xba\xbbb\xdd>\xc4<\xce>G&\xed=W\xae\xe3=\x83S\x8a?\xdd\xaa-?\x0f\x08\x12?\xd3\x05\xc5?*\xdb\x8e;\xd1)h?[JW>\'\xa2\xb8>_o\xcb\xbc5k\xea=\xa0\xbb\'?:\x9a\x14?\xad\x8c\xe1\xbc\xbb\xed\xcd\xbc\x07\xb9\xde>\xbf\x8d\xa7?2pe?\xdf\x1a`>U\xa7\x1f?\x04\xfc\xe7>\xfe\xee\xac\xb96&\xd3?\xf5\xa7\xd4>\xc1\xea\xa5>\xe4\x84\xeb\xbc\xbd\x02\x80\xbcl\x7f\x84=\x18FE?V\xb6\x93=\xb0c\xb1>*\x98\x11>#B;?\x19\xde\xb8?\xa9~I?\xf5\xad=?\xacn^?\x1e\x9e\x81?\xa1\xa4\x0e\xbc\xf6m\x1f?\xeb\xce\x8d>\xef\x97g?,\xa8V\xbc\xa8v\xdf?\xf6\xf2\x17=\xd1\xa2"\xbc\xd0\xf5\x9a?@\x01\x80\xbce\xe5\xf2<Ges?\xdf\xdf\xf9>\xa7\xbb\xe3?\x1d\xbc\x84?6_o?\x90\xf0\x9b\xbb\x920\xc6>]\xb0,?\xd8b\xf6>\xb7\xb7R?x\x81\xc7?\\\xbbC\xbc\x01\xa7\x05?\x1bE\x9d?\xecYq>5\xcf\x7f>.\xe5N\xbc\x8b\xd2V>a\x15\xca?D\xd7o?\x9b\xdbJ?\xba\xfc\x85=\xf3\xf9\x8b\xbcd\xb2e?\x14\x12\x99>\xa6\xcb#?\xd0\x03\xa7?\x8d\x13\x89?\x03c|=\xa3\x0f\xaf>F\x84\xe4>\xcc\xbf\x14?\xf3\xe6\xdd=_\xc6\x8c?)&\xbe>DP"?\xd6\x869?\xb2\xbe\xcf?\xe2O\xf9>\x9c\xdb\x8b>\xc0?\xcc>"")?C\xdeu:7\x15\xe0>\xfb\xf8\xab\xbbm\xbb\x8e=\x11H\xc8=\x7f\xd0\x80?1\x95G?\xbb\x95\xa4\xbc4\x9dk?3y\x1d?\x08&\xf8=\x8c\x13\xda?Tc\xa5>{"\x85?\x8b|\xc5?b\x00\x1c?u\xa0V?:b\xe0>\x1e5.>\xe8[\xaf?5\x97\xe8\xbbg]\x19?\x06\x9e\x97?\xb6!=\xbc\x80\xc8`=)Jb\xbc#\xd5\xaa\xbc\xbf\xa3P\xbc\xe1J\xe7>\x06\xc6P?\x01\xff\xc1\xbc\x92K\x17?o\x9c\xa2?\x13_\x1f?\xde\xd6\xb9=\x15s\x05>\x11\x1cS\xbbk4\x9c?\xb49\xc3>\xee\x91\x8c?{OW\xbcp\x04\xb6\xbc\xffZ\xd8?\xf7w&?*\xd7p?0\xdf\x18>\xb0\xed\x19>\x93G\xd8>m\xfc\xc3??\xa4\x92>\x95\x10\x94?}Tl>tD;?\x93\x8c\xc9>5\x05@?\x14%\x8f?mX\xa6>\x80\x95\x8f?\x88\t\xcd?iN\x86?\x9ci\x97=\xfa\xe3\xd0>\xf0\x9d\x96>\xd8\xf3G?'
-p104
-tp105
-bsV445264474900295680
-p106
-g2
-(g3
-(I0
-tp107
-g5
-tp108
-Rp109
-(I1
-(I400
-tp110
-g12
-I00
-S'\xc6\xf8\x9a:x"\x14\xbe\x877\xed\xbf\x0e\xacF\xbf\xc3\xc3*:]\xce\xc7\xbf\xee\x8f\xac\xbe\xa8\xe4\x8e\xbf\x0c\xc95\xbf\xe3KJ\xbeC\xde\x02\xbf\xf6\x98D\xbf\xcaH\x1a\xbf\xb0\xe8+\xbfd\xf8\xa7\xbfF\xffO\xbbw\xe3R\xbf\x977S\xbf\xdc\xd3\x9f\xbfSH\x87\xbf\xe0d\xbc\xbe\x92\xc5\xb2\xbe\xcdSp;@\xa1\x95\xbfIV\xd0\xbe\xcdL0\xbfj\x18\xa5\xbb\xb0\xc9?\xbf\xc2\xa4\x11\xbfI\x9fw\xbfx9\xc2\xbf\x0f%N\xbfyq.\xbfz\xe5\xc1\xbf\xc2\x0b\x85\xbf\xe0X\xf0:\x17\xa4b:\x140s;\x88\xed\x96\xbb\x85\xe3\x1c\xbf\x8a\x8f\xa9\xbf\xb1p\xd1\xbfI\xbf)\xbf\xf5\x07\xad\xbe\xfd\r\xb5\xbfv\xd7j\xbf\xde\x82\xf3:b\xcc\xd1\xbe*xW\xbe\xf2~\x0b:\x84\x96\x17\xbf=~\x92\xbb\x18\x81\x18\xbf\xca^\xab\xbe\xfa\xe5\x9e\xbf\x8e\xe6:\xbfu\xb2\xd8\xbe9"=\xbf\xae\x9a\xe5\xbf\xbf:\xba\xbf\xceu1\xbfhh\xa1\xbciEG\xbe\xff\xfd\xeb\xbeB\x0bf\xbeP\xeer\xbe\xac{n\xbf\x92\x9f\xcd\xbb<\xe9\x9f\xbf\xdb>\x8e\xbfa\x98\xf8\xbf\xb4\xc6\x95\xbf\xd6\xd4\xac\xbfL\xf6D\xbe!\xb6\xff\xbet\x16\x1b\xbf\xdd\x99\xb2\xbe\xd8\xfc\x8f\xba\x1c\x13\xfd:\xa1\xf0\x81\xbb\xad,g\xbe\x0b\x9c2\xbe\xb7\x1c\xaa\xbe\x92@d\xbf\x93\x9e&\xbe\x01\xe1\x98\xbe7\x1f\x0e\xbe\xe8\x8f\xbb\xbf;,\x81;jG\x89\xbf\xde\x1d\xa5\xbfE\xfb\x8e\xbe\x08L\xdb\xbf\x94\x9f\x97\xbf8#\xa1\xbd\xd7)\xcf\xbe\xcaU\x08:\xd1F\xcb\xba\x00\r\x01\xbf-\\\xa8\xbf\x80\xad*\xbf\x87\xdf\xcb\xbc\xc1/\x94\xbe\x88em\xb7\x80~\xea\xbeE^\xc0\xbf\xae5\x11\xbf`\xa6*\xb9\xaa\xa5&\xbf\xb8O*\xbd\x89\xd8\xfa\xbf@j\x8d\xbe\xd0R\x99;\xb2\xa5\x9b\xbe\r\xe9\xa2\xbe\xd8\x1c}\xbf\xca\xe2\xbe\xbf\x96M\xef\xba\xc7}\xac\xbf\x93\xdb\xde\xbe\xe7\x89\xd9\xbbx\xef\x1f;"\xaeL\xbf\xde\x08\x00\xbf\xc3\xaf\xfc\xbeW?\x03\xbd\x96]\xb7\xbfe\xc8\xa7\xbe\x009,\xbf:\xc8\xc9\xbe\x8a\n\x84\xbe_\x9d\x8e;\xd0\x84\xaf\xba\xd4\xaf\xce\xbe\xb5.\x10\xbf\x7f\xca\x02\xbf\x8e\xee\x9c\xbf\xe1OH\xbe_\xf2\xb7\xbfK_>\xbf[\xc3M\xbf|\x16\xde9\x82\x8c_\xbf\x81\xdf\xb8\xbf[m\xeb\xbb$R+\xbfr\xe38\xbfd\xde\xa6:+\xe0\xa0\xbe\xca\x92\xbf8"\xa1%\xbe\xcc\xd6%\xbf\xe3_\xba\xbb\xce\xc2*\xbf\xbd\x86\xcf\xbe\xa1\xe5\x90;\t\x8a\x86\xbfVu\xc5\xba\xef\x8eP;P\x9bf\xbfhN\xc6\xbfg\x9c\x92\xbf\xc2\xf9\xe5\xbf\x98J\x9b\xbf\xd2#\xf8\xbd\x94=\xc5\xbe\xc6\xbd\xb2\xbf;\xda\x99\xbe\xc5[e\xbdL\xc2\xb1\xbeJ\xd7\xcb\xbe\xb5\xd1\x9d\xbf\x16\xfd\x8f\xbfI\n\xe4\xbbNU\xa8\xbe\xe8{N:;vc\xbf\x89\x10\xb6\xbf\x98Y\x83:\x16\xa4\xcc\xbc\xf0\x04\xe1;\x12;.\xbf\x19\xacS\xbf\x9bi\x0c\xbf\xdb\x0b\xa0\xbb\xa6\xab\x14\xbf;.(;\xdb4\x1a\xbf\xb0\x88\x00\xbd$m\x08\xbf\xb8\xee\xac;\xa9\xbc9\xbb?\x9d\xf4\xbe\xbf\x96/\xbd\x9fo!;\x1cn\xa7\xbd\r\xb0\xa1\xbf\xdd\x8e\xd2\xbe@/\xcd\xbe\x98\x0c\x96\xbf\xbb\x9a\xcd?\xd6\xb4#?_T\x18;j\x16\xdd>\x0bS\xb3?uQ\xb3>\x07\xf9=?J\xee\xf8\xbaG\xeb\x8a>i\xa2\x83?\x1cZ.>\xe0m^?\x18\xb5_?\x0b\xf8&?\xadT\xe6>\xeb\t\xd2?f\x92\xa5>z\xd3\x89>\xfd\x02\xbf\xba\x12\x05\x16>\xd58o>\xea\x8d\xad>\xb1D\\?o\x8a\xa9? \x08\x00?\x19\xbe\x0b>\xa5H\x84?\xfa\x14\x98>\xad\xf3\x8d>h\xa0\x0f?\x06\x0b*?\x00,\x89>$\xd8;?\xb7[\xcd\xba\x01\x86\xef>\x00\x85\x89?\xd7\xc1\xb7?\xc6\xb2X?\xff\xdf\xd5?C\xbe*?_\x82\x84\xb7\xf2\x0b\xff=2\x17g?M\x06*?2\xbe\x91>\xfe\xb5(>\x0b;\x88?^zk?\x0f\x08\x12?ty\xc0?\xf5d\x88>\xb9\x8fv?\x16\x0c\x04?\xe7}k?d\x02\xca;\xb3\xd2\xf2>\xfe\x1bk?\x03B\x1e?\xb2\xa9\xc7;\xbc\xa9\x9f\xba\xd7\xa31?\xaf\x02\t@\xde\x05\xb0?\x0c#j>\xfdYb?\xcb\xb2\x08?\xf1hC>\xf3\x91\xc6?\xed\x88\xc3?Lt\xdb>\x84\xe1B:\x0ej)>l\x92a?\x18FE?c\x82j>06\x7f>\x1d\x1dh?\xe9\\\x85?+y\x85?-0|?\xf5\xad=?\xacn^?W\x82\x97?\xc4lb\xba^\xce~? \r\xc9>\x02\xbf\x86?\x99\x03\xb3\xbb\r\xb9\xe8?\xca]U>\x8f\x15\x989\x95\xd4\x94?\xa9s\x17>\xef\xff\xb8>\xec\xe4\xda?:\xdf\x9d?;b\xeb?\x1a\x80\x96?\x93^v?%p\xd2\xbaR\x8eX?\xec\xea\xdb?.\xd6\xc2>r\xd9[?\x0b\xa5\xd2?\x10\xa3y;\xd5s\xdc>\xa6\t\xa7?V\xed\xc7>JQa?\x03\xf87\xbb\xb3S\x17?\x15\xb7\xb5?\xf2\xa64?\xe4B,?\xff\xd1\x03?}\xb5I9\x16\r\x8b?>\x97&>\xa6\xcb#?\xd0\x03\xa7?\xf4\x1d\xb3?\x1a\x98\x84>\'\xb6\n?\xed\xcd%?o\xba1?\xf3\xe6\xdd=\xc2\x95\x7f?\xc8\xbfD?\xa1\xaf\x94?\xd6\x869?\xa5w\xe2?\xe2\xaf\x87?\x00\xf1\xda>\xc8;w?\xa6\xb4Q?5\x9ed<\x96s\x05?T\xa6z\xbb=\x82\xc3>_\xd2j>\xa3\xc3t?i\xa2s?\x13\xf6p:\xe2\xdf\xcc??fg?\x12\x9b@?\xc4\xe4\x13@\x87\xe4\x15=\x1ei\x82?\x0c_\x90?\xa9f]>Z\xdc\x90?\x86),?\xcd\t\xd9>\x92J\xf3?\n.\x92=/\xe0f?\xa4>g?!\xe4\x81>\xfe\xdf\xa8<\x83\x83C;^J\x17;\xc7w\xbe:\x03\xbf\x08?n9a?Bt\xd5:\xd6\xdb\x14?\xf4\x97\xa7?J^\xac?\xf3\x08\x06?6\xab\xb1<uY8?\xd1\n\x93?\x07\xd6\xe5><\xfdQ?\xecG\x7f;\xc0\x157;i1\xf2?\x91\xefo?d]\xe3?\xe5\xd9\x9f>\xf1S\xb9>i~X?i\xbf\x1a@;h\xae>\x07b\x97?T#\xf8>tD;?\x08\xf1/?\x10@\x92?\xe9\xceh?\xa9\xde\r?e\xe4\xaf?\xb3)\xd3?iN\x86?JB\xa1<\x14DU?^\xd6B?yf<?'
-p111
-tp112
-bsV459113539936862209
-p113
-g2
-(g3
-(I0
-tp114
-g5
-tp115
-Rp116
-(I1
-(I400
-tp117
-g12
-I00
-S'E\xad\xdd;O]\xc0\xbe\xa0B\xae\xbf\x17 M\xbf@\xdf\xe9;\xcb\x82\xd5\xbe\x90\xd5\x0f\xbfL0\x80\xbf\xc3\x84<\xbfg3H\xbeC\xde\x02\xbf\xd7"\x02\xbfR\x7f\xe7\xbd\xb0\xe8+\xbf\xe9 .\xbf\xbat\x06<\xdd\xa2\x13\xbf\xb2qQ\xbfn8\x7f\xbf\x07\x8c9\xbf-H\x1b\xbf\xf2w\x8c\xbe\x1ba\xb4\xbe\xed\xd65\xbfIV\xd0\xbe\xf6\x04V\xbf`\xeby;\xa7\xdaP\xbfE\x1b_\xbf\xf4\xc0\xe4\xbex9\xc2\xbf\x0f%N\xbflF\xad\xbeU\x98\x85\xbf\xdf\x86:\xbe\xe9\xa2,\xbe3\xbe\xfa\xbd\xf4*\xa1;\xfc\xad\x1a<\xd2r8\xbf\xa6\xc5p\xbf\xb1p\xd1\xbfI\xbf)\xbfI\x9c\x82\xbf\xde\xf11\xbfv\xd7j\xbf|\xe1Q<\xcc\xa1\x90\xbe\xd6\x9c\xd9\xbe94B<\x84\x96\x17\xbf\xe4\xbcG<\x11 \x06\xbf\xca^\xab\xbe\xac)\xc9\xbf\x8e\xe6:\xbfgo\xaa\xbe\xbc^\xbb\xbe\x93\xa1\xff\xbf\xcb\xde\x8e\xbf\xceu1\xbf\xa8\x16\x83\xbe\x08\x14\xab\xbe\xc9\xd8r\xbfN\x08\xe3\xbe\xa1\x97\x85\xbe\xf7\xabq\xbf\xdd/]\xbe\xf6B[\xbf\xd7D8\xbfE\x0f\xec\xbfz?\x9c\xbf\xd6\xd4\xac\xbfL`\xbd\xbeYz\xcf\xbe\xeb\xb6\xda\xbe\x9a\xe0\x07\xbf\xee\xf4\xf2;\xbdaZ\xbe\x14p\'<y\xc0S\xbe\xf3v\xda\xbe7!<<Q\xcf\x19\xbf\x1d\xa3\x05<i\x19\x80\xb9[\x9b\xc3;\x05\xf8\x89\xbfcK\x8a<jG\x89\xbf3-n\xbf\x9d\xdc\x7f\xbd\xf4)\xcb\xbf\x94\x9f\x97\xbf\xe2\xcf+<\xd1~\xb4\xbeL\x1cb;\xfa\x92\xd9;\x00\r\x01\xbf-\\\xa8\xbf\xbcUX\xbdg{X<\xf0M\xf5:\xb9$\xb5;\xa7`>\xbd\x9b\xc4\xa2\xbf\xae5\x11\xbf\x1b\xd5\xcc\xbe2\x834\xbf!qW\xbe\\\x8c\xc1\xbf\xf3z\x9c\xbe\x7f\xda\x01\xbe\x03O\xd0\xbd\x7f|\xd7\xbe\xd8\x1c}\xbf\x0ccg\xbf\xf7\x1c0<\xc7}\xac\xbfq\xb7l\xbe\x88\xcf\x87<\x92\x1e\x87\xbe\x16\x0f\x8a\xbe\x08\xed\x13\xbfL\x18\xf7\xbeW?\x03\xbd\x96]\xb7\xbf\xe2\x92\xd0\xbd\x009,\xbf\xfd\xba\xc1\xbe\x13\xe2\x85\xbe\xc0g\xbd\xbe\x9c2\xa0\xbd\xdc\xb4\x81\xbe\xb8\x07\xa9\xbb\x7f\xca\x02\xbf\x8e\xee\x9c\xbf\x8f\x16\x86\xbe\x00\'R\xbf\xed\xca5\xbf\xa3X\x0c\xbf\xb8/q<\xb7dL\xbe\xf7S\x9f\xbf\x87S\x10<$R+\xbfr\xe38\xbfj\xbf)<#\x01\x12\xbf\x8a\x8e\xab\xbc\x81\xedB\xbe\xa9\x871\xbf\r~!<\x87\x93\xa9\xbeb\xc7\xa5\xbe\xb0\xc2\xeb;\xc6\x9b\xed\xbee\xb2K;<\x90\\\xbe\xb3\x1c\x94\xbf\xdd\xcdw\xbfg\x9c\x92\xbf\xfcX\xab\xbf\x98J\x9b\xbfp\xe5\xdb\xbe7\x04\xde\xbe\xf4\x0f\x89\xbf;\xda\x99\xbe\xe90\xe7\xbe\x1b=\x19\xbfJ\xd7\xcb\xbe42x\xbf\xdf}\xec\xbez\x0c\x80<NU\xa8\xbe\x06^)\xbe\xed3}\xbf\x89\x10\xb6\xbf29\x03\xbf\x10\xad\x99;\xc9\xe6g<\x12;.\xbf\x7f\rO\xbf\xe6\xe1"\xbf\xb0\xe4\x13<\xff\x13\xd8\xbe\xe7R`\xbc\xdb4\x1a\xbf-@\x01<Z\xc2;\xbf\x8f\xae\xf3;\'n\x1e\xbe?\x9d\xf4\xbe\xfd\xd4\x81\xbbB\xb3\x0e< \xba\xf5\xba\r\xb0\xa1\xbf4\x10\xc5\xbd\xd6\x00\x91\xbe\x92\x0b\x84\xbf\xaf\x8f\xd8?\xb0\xdc"?\x05W=\xbc\x90X\xd6>\xd2[z?\xfcb\x15?\x18.\x8c?_B\xf0\xbb\x1e{H> \xe5\x92?\x08S\xf5>p\x8f\x9c>0a\x1f?\xf4\xbd(?j.5>\xc97\xb1?\xa9\xb3\xf9<\x02\x03\x8c=\x1a\x06\xb6\xb8\xbb\x9f\x1f>\x88\xc8\x8f>\xd6\xe5\r?\n#M?\x0e\xa2\xd5>\xb4\xa9\xcf>\x19\xbe\x0b>\xb6\xf6M?\xfa\x14\x98>\xb2\xad<\xbc\xf7l\xfb>\xd3H\xd9>.\xcc\x13?\xb3\xf4T?\xf4\xc0\xe8\xbb#\xa9\xe6>6\xe7w?\'\x9e\x9c?d\xa4.?+\xde\xa7?C\xbe*?\xd6{">\xaa\xbe\xf9>\xc1h\x8f?l~/\xbc\xcen\x81>\xa8\xd6\x86>\x8a\xca\xbf?^zk?\x1dd2>\xb4\xcf\xe5?\x05k\x96>\x02\x82\x9f?\x16\x0c\x04?\x82\xd5,?\xf6Bv\xbcF ,?\xa0\xbb\'?\x03B\x1e?\x0694\xbcQ\xbaK\xbc\x94\x9cr?\xc2\xb7\x97?\xd7\x9fH?\x0cSj>\xf9/v?\x04\xfc\xe7>\xf1hC>\x18\xfb\xc2?Y\xcdH?\xc1\xea\xa5>\x86M\x9e\xbckP\x0e\xbc\xc6\xb4\t?\x18FE?a\xe3w=\x1b\x8b\x96?\xd6\xf4Q?\xe9\\\x85?\xa1j{?\xb2\x00\xa3?\xf5\xad=?\xcd\x9b\xa2>\xc5\xcc\x90?b\xb9\xae\xbb`\x11W?o\xc0\x12?\xe6\xbe\x95?\x9eT~\xbc\x05\x16\xb0?_\xac\xf1>\x8d\xa2\x87\xba\x95\xd4\x94?\xe3\xf5\x08\xbc\x0c\xd6\x14?\xd7\xd1r?\x83\ts?;b\xeb?T\x13\x99?\xcb\xed>?\x99\n\xa9>\xdd\xe4H?L>9?"\xfc\x08?-\xc4\x16?\x83}\xc7?)\xbcC\xbc7\xd7,?\x1bE\x9d?\x18P$?JQa?\x87\xac\xb1>:n\xa3?\x15\xb7\xb5?\x17\xd5T?l\xfc\x0e?\x00=e>\xb2\xa5H\xbcO\xb9\x8f?aj\x18?\xa6\xcb#?(\xef\xb8?\xf4\x1d\xb3?\xca\x9e;>\xe5\x83(?\x96"6?\xa7\xd8\xe6>^\xf7\xcd\xbb\xdd\xce\xf0>\xb5#\x86>\xa1\xaf\x94?\xd6\x869?\xa5w\xe2?\x94\x1d_?h\xb3\xb8>\xfb\xa5\xa2?#k\xa7>\x95\xf1\xed>N\\\x1d>\xa8\xdf\xec>\xe8\x06\xe0>\x11H\xc8=4\xa1t?\xf6\x94c?\xecn(\xbc\xde\xf4b?`\x9a0?4#H?\xe4\xa3\x01@Lvw\xbb\xb1\xa3C?\x0c_\x90?*#\x0f>Z\xdc\x90?d\x15z?\xfb\xb6\xc2>\x9c\xe4\xb3?\xaf\x12\x87\xb9/\xe0f?\x92\x9d\xc1>fb\x1a\xbc\xfa\xe5s?\x82$2\xbcf\x80\x16\xbcc\xe5\x17>_\xcaZ?v\xf4\x90>\x8e\xa6\x87\xbc\xfc\xfb_?3\xec\xa2?\x13_\x1f?H\xb7\x12?\xa1\x7f\x19>\xbat\x02?\x97\xfe\xb3?\xa7\x92\x1f?+\xb4\xaa>\xd5Ca\xbc\xeb<\x1d\xbcu\xf5\xc5?\x91\xefo?\x87\x90|?Yk\xa6>\xf1S\xb9>\xd9P\x0c?\x08\xe9\n@;h\xae>\x95\x10\x94?D\xcc\xaa>\x95\xd5b?\xa89\xeb>c\x95\x84?h?M?\xa7\xdd\x11?e\xe4\xaf?=\xf5\xc8?iN\x86?I<q?\x14DU?^\xd6B?\xf3\xd8\x8d?'
-p118
-tp119
-bsV445260103156264960
-p120
-g2
-(g3
-(I0
-tp121
-g5
-tp122
-Rp123
-(I1
-(I400
-tp124
-g12
-I00
-S'\x94_\x87>vo\n=\xf2\xa8N\xbfm\x8e<\xbf\xff\xcd1>\xf5\r\x0e\xbfk\x17z\xbdp\r\xaa\xbf\x96\xe1\x11\xbf\xf3\xcfu\xbd\xb6\xf5\xc0\xbe\x90\xce\x87\xbe\x14s\x9b\xbe\x04\xe6\xa8\xbd\x9f7\x07\xbf\xd3\x98a>[\x97\xe3\xbe^\xe2\r\xbf\x98\xae\x87\xbf{\xcd]\xbfB:4\xbe\xb9\x8c\xb3\xbd\xf0b\xf7\xbc.\xa5\xdd\xbe\x84\xe1\x0c\xbe\x98\x08\x1e\xbf\xa9\xd9\x10>`/M\xbf%\x11.\xbf\xdaK\x08\xbf\xa2\xfcM\xbfiR\xf8\xbe\xf0e\x86\xbeq\x83\x95\xbf\xeb\xdd6=\xc2G\xe3=\x98\xe8)>\xb7\x02\xf7=_\xc3j>\x10\xe9G\xbe\x9f\x0f\x84\xbf\x85\x80\xd0\xbf\x9e\x95\xef\xbe\xebsj\xbe"\xe2h\xbf#\xb40\xbf3\xaaV>\x08\xd4\x12\xbe\x8dd\x93\xbe\'\xed\x90>1\x81\x1a\xbfL\x1d>>\x07S\xbf\xbeF\xb2<\xbc\xd7\xd7\x90\xbf\xe2\x9f\x07\xbfq\x18\x95\xber\xba\xf6\xbd\x81D\x05\xc0\xa5x\xc3\xbfK\xac.\xbf\x92\xd9.>f\x85\xb6=W\x98\x90\xbe"\xee6\xbc\xbb\xb7\xb8\xbe%\xd1\x1e\xbf\n\xba5>\x9a\xc4\x91\xbd*0]\xbf\xcb\xde\xac\xbf\xfb\x11F\xbf\x87\x1b\xb3\xbf\x141\x08\xbf[\x03\xb1\xbe\x97\xb5\'\xbfI\x9d\x18\xbf\xcd@\x86=\xfdX\xcb=\xdb\x86\xe0=\xf2X&\xbehnf\xbe\xde\xd1\x84=\xefMu\xbf\n\x97M\xbc\xd8\xf1\x8d\xbe\xa47\xe9=j\x8e\xc3\xbe\x84\x91\x9b>\x0b*N\xbfO\x01\x81\xbfl7\x08>Y\xc8\xa5\xbfHA\x82\xbf\x87\xcc\x13>\xf0\xca,\xbe(v\\>.\xfe\x17>\xf7\xe3{\xbe\xd6\xe3\x8f\xbf$\xfc\xaf\xbe\x12\xa2\xe9=\xa9d\xa6<\xcd_\xf1=\xe6\x06}>\x0b-i\xbfO\xdd%\xbe\xbb\x8e\xfb=\x98\xd2\xb3\xbe\x80P#\xbe*\xcc\xec\xbf\x95\x0bU\xbe|\xdf!>~\xa3\xb3=\'\xc5V\xbe\x18\xfd!\xbe_\xbfj\xbf\xc3b\x19>6.\x89\xbd$\xfa\x94\xbeN\xfcs>\xac[\x0c>\x89\x80\xa5\xbdi\xe3\xa6\xbd\xe4\xac\x87\xbe \x96J;\xde\x85\x95\xbf\xfa\xc8V=\xd1\x1eJ\xbe\x7f\xd6\x93\xbe\xb1V\xe4\xbd\xbc]\x03>\xe7\\\xa9=\x0f\xae\x06\xbf:\xb3\xe8\xbd\xfc\xf6\x07\xbf\x8a\xe9z\xbf\xcc\xbe\x8e\xbe\xf8^\xda\xbf\xb7\xe3p\xbf\xa9VQ\xbf<\\\xad\xbd\xfd\x11\xc7=b\ty\xbf<\x02K>\x99Wh\xbe\xb8\xeeO\xbf|\xfau>o\x8f\xed\xbe\\^;=\xcb\\\xee\xbd>\xa9\xcc\xbeH\x1c\xe3=\x17P;\xbf\xbc!(\xbe\xbd.1>Q\x9fp\xbf\xf7\xab\xb4=_\t\xa4=a# \xbf\xe0\x02\xbd\xbf\xec\xea\x98\xbf\xf0h\xbf\xbf\xc3\x01c\xbf\xe6\xa5\xb1<$\x01\x1c\xbe?\xb4\x80\xbf\xb9[\x03>k\x94l=a\x92\x15\xbf\x15\xa3\xeb\xbe\xfb\xbdh\xbfak\x8e\xbf\x17\xbdX>\x93\x93\xb6\xbb\xd4!\x80=\x8b\xf6~\xbfa\xf9\xc6\xbf\x004\xfa=YT\x8f=`\x8d\xc0=s\xc8\xcc\xbe\xcd\x06*\xbf\xf9Mx\xbe\x17\x95S>|\xbe\xa1\xbe\x9a\xee">"!\x8a<\xc0\x05\xe4=\xd07\xff\xbe\xf2:\xed=\xad9\x87=pM\xbc\xbe\xaa \xdf=N\x9eS>\xec2\xab=\xfb`\xb5\xbfP\xe3\xd6\xbd8\t\xc3\xbc|;K\xbfd\x0b\xe8?\x9a8\x11?\xd2\xbcU\xbed\x8b\x97>4{\x88?\x06\x9e_>\x8f?\xb5>\x8epF\xbe\x1d\xe7C=\x01p\x86?\xc9+\x1a>\x1c\xfdr>Qq\xe0>k\xfe\xfb>\x80\xab\x97>\x82\xbf\xf4?\x118\xd7\xbc\xde1_>Y\xed\xd3\xbdw\xc5\xa0\xbd\xdb\x03\'>\x1a\x93\x07?}\x95R?\x0cS.?\xb2\x8e\xa5>\xb6\x8a\xee\xbc\x8a\x1cn?\x1a\xa8\x7f=S/\xa8\xbde\xa7\x00?\x8f\xc4\xbd\xbc9-Z>\x9b\xa9\x84=\xa5q+\xbe\x05\xcd\x84?\xfb\xd9D?^#\xf4?\xab!A?\x19\xa4\xb6?\xf6r\x98=\x8a\x82\x0c\xbe\xf2\xf5\xb0\xbdN\tT?\xb0{\xbb>d\xd9\x07\xbe\tW\xca>\x83S\x8a?n\xf76?[\xb6\xa2>\xd3\x05\xc5?+\n\xb7>\xd1)h?\xa2>z=\xe9\x86<>\xdc\x91{\xbe5k\xea=\x8c\xb7\xd3>\xea9\xbe>\x1f\xc7\x8d\xbe\x8b\xc7a\xbe-\xaa\xda>\xf0\xe5\xd5?\x97\xa4\xbd?\xdf\x1a`>4\'\xce>\x8c\x1c\x82>``p>6&\xd3?{\xc9J?\xb1b\x9a\xbd\xf7\x96\xa4\xbet\xaf=\xbe\xa3\xd4\xa8\xbd,\xad\xb4>v\xdd\xa1>\xce\x01\xad>\x98.\xb6>#B;?\x01\x1es?\x9e\x97R?\xe3\x07\x0c?P\t\x9b>\x1e\x9e\x81?\xd3\xf9\xc6\xbd\xe0\xf5T?~v\x96>\x1b?Q?(\x92\xe0\xbd\x0e\x06\xee?y:"\xbc\x97\xf3\x89\xbd\xa0\x0e\x89?\x03\xe8(\xbe\x12,(\xbd\xecC\xad?\x8a\xe9,?\xad\xd2\n@\xdd\x1c\x88?\xdb\xf2\x14?\xa0\x8c\xb8\xbdY\xf76?\x12\xd7\x1b?\xd8b\xf6>\xce\'\x1c?\x08\xc1\xc7?Y\xd3\x18\xbe\x01\xa7\x05?\xf8\xf2\x88?\xe7\x9bU>\x1cF\x18?\xc6\xe6D\xbe\x88\x8c\x11?\x9e\xd5z?}U\x07?\n\xdd\xd7>*\x14\r?\x961W\xbed\xb2e?\xa7G\n?EW\x08?\x7f\x07n?;A\xce?\xc7:\xf5>\xac\xbc=?" \x89>\xa0\xa6\x89?\xec\xae\xeb\xbd\x9d_\xab?\xa5\xe5\xff>\x04\xbd\x89?1\xd2\xa0=\xb9\xe6\x86?5O\x8c?G\xb1e>\xefnl?\xd3\x8f\x90>H\xf1\xda\xbcO#\xe8>\xb8F\xc1=\xe1\x8e\x93<\xb5\xd9\xb9\xbdk\x06H?\x01\xf5\x85?\xa1\xffh\xbe\xb9Y\xb4?3y\x1d?\x08&\xf8=ut\xd0?x\xc3\xdc=*\xf7M?\x10\xd5>?\xea\x9bI>\xa4\x88$?\x8d\xb4R>\xe9\xf4\xd8>\xd6=g?\x10\xe5\xa0\xbdro\x7f?v\xfc\xd6>\x01\xca\xc9\xbd\xa7\xaa#\xbd\x07\x98.\xbe\xc7}w\xbe\x8c\x83\xb4\xbd\xe1J\xe7>g\x00y?,\xfd<\xbe\x97\xce5?\xf8\xe2(?S.b>\xd1\xc0(>-\xb7\x06\xbe3\xd5(>k4\x9c?H\x1d\xd3>o?\x12?\xaf\xeb\x00\xbe\x80\x88n\xbe\x9bj\xe4?=q\x91?*\xd7p?\x0c\x8e\xdb=#\xff\xbc\xbd\xb3\xeb`?P\xb5\xdb?\xe6\x15\xae>\x0c\xa0\xd3?z\x1cx>\xac\xff\x02?\x93\x8c\xc9>\xcex\x86?\x82\x9c}?\x9f\x15\x02>\xc8T^?\x88\t\xcd?s\xfa\x83?\xf1\xe3\x13\xbc\xcbx\x88>\xa5\xc7\x97>\x92\xa5\xb2>'
-p125
-tp126
-bsV476550081026351104
-p127
-g2
-(g3
-(I0
-tp128
-g5
-tp129
-Rp130
-(I1
-(I400
-tp131
-g12
-I00
-S'j\x0bz<%\x1d\x07\xbc\x80\x05\xb0\xbe&o\x1a\xbc\x8f\xb18<0#/\xbc\x84\xbb\xce\xbd\x9d\x1eO\xbe@\x08\x80\xbd\x99~\x94<t\x95\x1e;N/)\xbe;\x8a\xac;\x89T\xb6\xba@\x9a\xa6\xbd\xea0\xb4<\x07 \xb6\xbd\xec\x90\x16\xbe\xc04\t\xbe~\th\xbd\xc0\x0e\x82\xbe\x81]j\xbbQt\x07<\xfa\xdbq\xbd\xce.\n\xbd&\xeb\xd2\xbdl?\x08<\xb0\x86\x17\xbe\xe1*\xa1\xbeX\xa8\xa1\xbc\xb3\x0f/\xbee\x15\xd1\xbd\xf1\xab\xe7;\xe4\x8f\xa4\xbe\xa0\xbb\xad:\xed\x95\x9e<\n\x96\xa9;z\x0b\x0b;\x9d_z<\x0fD\x00<\xc3\xf7\xb3\xbdZ\x01\x8c\xbd9\xf7\xbc;\xcb\xffq\xbe\xd9\x1c\x10\xbe\x18\xb5;\xbdX\xd1\xee<\xf4\xcb\xae;\x03\x842;$C\xdb<\xf0r$\xbd\xc8\x9f\xcc<\xc5\xd4\x14\xbeZ\xf7\xa9\xbcL\x7f\xef\xbeR\x06X<V\'h\xbd\xf8q\xbe\xbd\x96Y\n\xbf\xd1\x9a\xd2\xbe}\x19\x7f<\xe6\xce\x8c<\xfe\xa0O;@U\x93\xbe\x0e y\xbd\x99A><~\x00\x8d\xbe\xf8\x1dW<\xb9d\x12\xbe\xac\x9a:\xbe\xea\x98\xf8\xbe\xb6?\xa3\xben\'\x8c\xbd\xcc\xc3\xf1\xbd1\xa11\xbe\xceP\x02<\xa3\x7f\x1f<\xc3\xf2F<\xd88\x04<g\xcd\xef;\x86\xc8\x80\xbd\xb1\xbfL\xbc\x96R\xe5<\xf5\xcc\x84\xbe\x9e\xde\x12<\xa2P\xec;\x8dp\xfa;\xff\xf8\xaf\xbeGY\xcb<\xe2\xdd\x02\xbb\x06[?\xbe\x87E\xd5;\x91W@\xbe\xf43p\xbc\xc04\x9c<|\xfd\x02\xbd\xcak=<\x98C`<D\xe8C<h\x88\xb8\xbd\x9c\xf5\xe7\xba\xf56\\<&\x07\x1b<\xac\xa3\x18<\xa4O\xfb<\x86\xda}\xbey\x88\xf4\xbbS\xba\xb3;\xe7\xf0E;\x82\x8c\xf8\xbcA\xaeU\xbemi\x1b<\x1b\x12Z;\x11\x03M<\x918p:\xd7\xe7\x87\xbb\xfck\xa9\xbeJMU<\xb5\xa2\xd0:\x9d\xa4\xc4:\xa5\xfe\x03=\x8ag\xa5;\x86S\xcd\xbc\x17:\xcd\xbd\x97\x14\x14\xbez\xb0_<[\xe5\xd7\xbd\xa3)\xd5\xbc \x97o;\x15:\xd1;\x0f\xd5\x9d\xbcr\n\xc8\xba\xc0\x9cC\xba\xd7\xa6}\xbc\xa8\x7f\x01\xbd<eg;\xdbW\x88\xbd!\'[\xbd\x7f\xbd\xa8\xbd\xf3\x0c\xc8;X;o\xbejT\xa4<i^\xfb:x\xbe\x91\xbeI\xc5\x8c<\x0e\xbcE\xb9NgI<&\xd7\xd9<cT.\xbeF\xf6\x01\xbcb\x84\xbc\xbd\x17\x9bG\xbe\xbd\xe8_<P\x9e\x9d<q\xb8Q\xbdG<\x99<N\xff\x16\xbe0\xd7\xa7;\x03\xbc\x00;\xee\x9d\xad\xbe\xe3\xd9(\xbb\x01\xe0\x86\xbe\xbd\xfc\xcf\xbe\x8c\x88\\\xbe\xceJ-\xbdm1\xc8\xbd~\xdf\xbe\xbe\x83\x14\xc3<\xe3\xdey\xbd\xcc\x82\x10\xbe!u\x81\xbdh\xd2\x90\xbe\x83a\xc4\xbd;\x84\x0b=\xfc\x8f\xad:\xef6\x1a;/\x03\xe4\xbe\x99K\xc6\xbe\x87X \xbd\x96\x12\xf5;\x95|\xc8<\xb1\xbc/:l\xe2f\xbeb)\xf2\xbd]\x98\xb5<\xca\\$\xbc\x84!\xde;k`?;\xbcK\x96<\x85il\xbe\xcf\xa1\xe8;\xc3"E\xbd\xd0\xcc\x03</99<\xecw\xcf<\xf5<\xd9<\x03$\xa9:\xca\x17\xa5;\x8c\x8d\xf5;\x19\xfe\xf1;\xb6\x8e\x99>\xdc6@=hS\x9e\xbc\xf7\x16b=\t0T>y\x8e;=K\xff\x95\xbb\xcf\xc1\x03\xbcf\x1c\x01;&-\x8f>\xd7s\xf3<\xc8\x8b\xcf\xbb#C\x12>\x7f\xc2\x96=\xca|(\xba\xf1L\xb1>\x03/]\xbbE\xc2\xc8\xbb$\xb9\x12\xbct\x11\x9b\xbbK\xd4\x85\xbc9\xb6{<jJ\xfe=\x0e?\xa9\xba3\xb7\xa79v\x95\x06\xbc\xdd~\x0f>\x9b\xa9\xb3\xbb\xb4\xcb\xa9\xbc\xb5\xc7\xa6<\xfe\x8f\xe7\xbb\x16L\xd9\xbb\xaa\xc6\x07>\xf7\x1d\xa0\xbc\x94\x08\x92=\x05\xc3\xb4>\xc6\\\x0c>a\x9e\xe5=U$\x94>U?\x17>\xe46\xa1\xbbC\xb0@\xbb\x13\xc0&>\xb2\xb5*\xbc\x82\x8e\xd6\xbb\xad\r\xcb9\x15k\xcd>\xd0\xd5\xd8=\xafci=\xb1\xe7\xe4>\x82*\xcb:\x17\xa3\xcd>\xf9\xe6+\xbc\xb8\x8a3<\xd8u\xe3\xbc\xbc\x82A>\xc1\xe8c<\xf5^\xc4\xbb\x92\xc6\n\xbd\xaa\xeb\xcf\xbc\xc0\xe1V>\xfc~a>UP\x8c=c\\\x92\xbc\x0e\xe8\x97\xba]\x81:>\xbd8\x9c\xbc<\x02`>\x05Y\xf1\xbbf\xcdA\xbcMk\xcd\xbco\xed\xa2\xbc@z\xb5\xba\n\xf5\x10\xbcsr0\xbc\x1e\xbd8>\xc4O=>X1,>!\x81=>?\xbd9>\xbau\x02\xbbk\xeeA<\x1aO\xd5>\x0cX\x83\xbcc\xd9@>M\xad\x19>\xa2\xa0V>\xb9i\x89\xbc\xdfn\xee>0\x9bp=8-G\xbcE\x9c\xfc=\x7f\xfa\xd1\xbb\xa8\x17Y<\x83\xde\x8c>\xf0\xdb\xeb;\x9a\\U>\xb1\xc9\x81>\xb8\x07B>\xe6S\x97\xbb\x9c_\xf4<\x14\xda\x93>\x93r*>\x19\x93\x1f>\x853\x0e?\x9e\x1dG\xbcI\xad\xe2<z\xdf\x04>\x92\xc3\x05>\xa8\x9a\x1c<\xeei9\xbc\x87rm>\xcdW.>5t>>\xbc\x18P=j\x9bT=\x14\xac\x97\xbc=\x87\x84>\x16\xc2h=\x0b~\x9d=\x85\xfd\x00?\xc4\x8e\xea=\xdc\x1e\x1d;p\x9f\xd2\xba\x92Y\xaf\xbbm\x1aY>\xf0\xae7\xbbu\xe3M=kb\xa5=~\x004>\x8f\\7=\x8c\xa7\x96=\x1b\xe5&=)3\x12=\xa0\xd3S<O\xe1\xb4=\xa7\xbbu\xbb>H\xcd\xb9wLV\xbb\x80\x87\x04>O\xa9f\xbcJ\xe6\x9a>#U\xa7=S9\x7f\xbc\xd0\xd0\xa2>}\xe4\x7f=B8@>\xad\x91\xce>\xe2\xdbQ\xbc]\x8f?<\xb9\xf0D\xbb\xc3\x86_\xbc\x93+\xa8>7j\x9f>\x91w\x1f;5\xd3\xac>\xe8\x1c\xfa\xbb;+\xd5=\x93$\x80=\xc3\xb2\xab\xbc\x0f \x8b=\xe0\x99T\xbcW\x1e\xb5\xbcvr?\xbcUD\x87;\xb4\xffn\xbbcR\xc3\xbc\x08r\xa8>\xd6^\xe4;\x88\xaa\xa4\xbb\x93\xf2=;\xab\x0bu\xbc\xec(\xc5\xbb\xe5r\xf1>Bi\x00=\n\x99#=4\xa6\xc9\xbc\x19\xd4\x9b\xbc\xb12O=\x82\x0e\xec=\x1c\x80\xbc>\xce\x1b\x8e=\xbf\xddj\xbc\xb8X\x1b\xbb7\xad\xb5>t\xf8\xc1<U\xb0\xdc=\xf5\xd6.=\xc6\xef\xa5>|\n2\xbc8c\\>*\xf1p<qf >\xb0\x88m>N]\xe9>\x97\xc4\xc7>\xdf*2>n\x9b\xd0=\x02\x9f\'>\xb2\x95\xa6='
-p132
-tp133
-bsV445233028135002112
-p134
-g2
-(g3
-(I0
-tp135
-g5
-tp136
-Rp137
-(I1
-(I400
-tp138
-g12
-I00
-S'\xe3 z<1\xf5\x01\xbe\xa0B\xae\xbf\x9bN8\xbf\x95\xa0\x95; -E\xbf\xea]\x9b\xbep\r\xaa\xbf\xed(\xf4\xbe\x08\\\x13;C\xde\x02\xbf\xbd\xaa\x08\xbf=bf\xbf\xb0\xe8+\xbf\x9d\x1c\xd5\xbe\xad\x15g;\xdd\xa2\x13\xbf\xb2qQ\xbf\xdc\xd3\x9f\xbf\x07\xe5W\xbf\xe0d\xbc\xbeeX(\xbee\xdaf;\xa3l\xe3\xbd\x11\x08.\xbf8e\x05\xbfq:\xdd:`/M\xbfR\xd9\x1b\xbf\x08\x8c\x1b\xbf\xac\xf2e\xbfg\x89\xa3\xbf\xd1\x1d\x9f\xbe+\x13\x91\xbf\xc7\xbb\x94\xbe4\xb8\x0c<]\xbc6<\xff\x19\xa7;\xaa\x07\xb9;\x85\xe3\x1c\xbfa_\x90\xbf\x85\x80\xd0\xbf\xcbl\x05\xbf\xa3U?\xbe\xf4E\xbc\xbf\x1d\xf3\xee\xbe\xaci\xd0;b\xcc\xd1\xbe*xW\xbe\xdcz9<\xfe\x1fL\xbf\x99D\xdb:;\xdc\x1c\xbf\xcd\x13\xd8\xbdK\x91\xb4\xbf\xe2\x9f\x07\xbf\xfb5\xa4\xbd\xd2\x93\xa4\xbe\x90\xec\xde\xbf\xa5x\xc3\xbfK\xac.\xbf:?R<\r]2<\x95ui\xbe\xe0b\x81\xbe\x1b\xd2\xd3\xbd\xf6sA\xbf\xf6\x96\xa7;\xfa\x12\x94\xbe*0]\xbf\xed\x08\x04\xc0\xb4\xc6\x95\xbf2\x1e\xb7\xbfu\x06j\xbfYz\xcf\xbeLH\x11\xbf\x90\xd5_\xbfU\xfa\x8f;\xdd\xe0.<\xd7\x89\xe6:\x96\xe3\x87\xbe\xf0Pw\xbe\xc9\x1e\xa9;\xefMu\xbf\xc1\xe2\xf99\xab\xb5v\xbeW\x07&\xbc\x13\x87a\xbfWa$<\x0b*N\xbf\xf9\xf4\x9b\xbfIq\xa0:a\x84\xb0\xbf\x94\x9f\x97\xbflO\xb3\xbbZ\x0b\xb2\xbeC\x99_<\x80\x7fs:*\'\xf0\xbe\x16\x8f\x98\xbf\x0c\xdf\x1c\xbf\xce?/\xbc\x02b)\xbd\xe5\x83\x7f;t\xc7}\xbd\xa3\x8d\x9e\xbf\xdfth\xbe\x0b\xde\x87<1g#\xbf\x8b\xe6\x97\xbe\xcbc\xed\xbf\x99\xb8&\xbfz\xa7\x8c\xbc\xb4r\x1f\xbd\r\xe9\xa2\xbe\xd8\x1c}\xbf\xea\xfd^\xbf>@\xa7;\xc7}\xac\xbf\xedY\x12\xbf\x96u\x8e:\x0cb&<\xaeq\x1c\xbf\xa5.\x07\xbe\xffa+\xbf*\xa9\x90\xbbi\\n\xbf\xb8\xad\r\xbe\x009,\xbf\x0e?q\xbe\xdc\xba\x04\xbe\xc4\xa7[;\xdc\x17G\xbe\xe9\x80V\xbfi\xec\xa9\xbeT\x9a\xfc\xbe\xf4\x00n\xbf\xd6\xc8+\xbe\\\x12\xe9\xbf\xb7\xe3p\xbf\xd3\xe72\xbf\x9aQh\xbd\xda\xdd;\xbe\xf7S\x9f\xbfR\xd7\\;\xfb\xd8\xe8\xbd\xb8\xeeO\xbfn\xbb\xaa<\x17?\xc2\xbe\x98k\xb8;\xae\xe0\x9b\xbe\xb9G\xa7\xbe\xe3_\xba\xbb\x17P;\xbfb\xc7\xa5\xbe\x94\x17\xa8:N\x87\xfe\xbe\t\xd3\xab;kE\x18\xbd@\xb8j\xbf\x15\x8f\xd8\xbf1V\xa5\xbf\xf3\xc0\xc2\xbf\x98J\x9b\xbf\x15\x07n;\xd3\x15\xab\xbe\x84\x94\x98\xbf;\xda\x99\xbe\xe5b)<a\x92\x15\xbf\x15\xa3\xeb\xbe"\xec\xa5\xbfak\x8e\xbf\xc2h(\xbcNU\xa8\xbe9"\xff;\x12XK\xbf\x8a3\xcf\xbf\x10>\x1e<\xdf}!\xbb@J4:C\xde)\xbf\xd84,\xbf\xcbk8\xbfThb<yO\xa8\xbepY\xe3\xb9\x9c\xd5\x1e\xbd\xb0\x88\x00\xbd\xd07\xff\xbe\x0bg\xfa;\x005h\xbd\x8c1\xba\xbeR\x1d\xe4\xbd\xce\xebh<\xa1\xd7\x0c\xbb\xfb`\xb5\xbfP\xe3\xd6\xbd@/\xcd\xbe\x0e\x96\x84\xbf!\xef\x0b@\xe2nH?K\xf6A\xbb\xb9\xfc\x02?\x0bS\xb3?9\x11>?;R\xfc>oM\xc0\xbb\x13"\x15?F|\xa8?\xc9+\x1a>\xe0m^?M^\x16?\x93r\x1b?\x80\xab\x97>\x82\xbf\xf4?\xd6\xbe\xc5=\xd2\xeaV>\xed"\x07\xbc\x12\x05\x16>q\x97z?\xde\xf93>4\x8cl?|\x1fW?\xc7\x1c\x87>9-\xc2=\xd9\x8c5?\x91\x8c\\>\xc2vE>\xde/\xcf>xc\x81>\x00,\x89>\xd3|\x97=\xf4\xaa\xc6\xbb\x05\xcd\x84?\x94\xf6\xe1?^#\xf4?\xc6\xb2X?\xd9\xc1\x97?\x83\x06\xc6>\x81_\n\xbc\x9abD\xbc\xb4\xb8[>\xa4i\xbf>\x89Z\xff\xbb\tW\xca>W\xa4\xa9?6rD?:h\x84>W-\xb0?\xd1*\xec\xba\x89\xddU?\xd5\xd9\x07>\xe7}k?\xce-\x90\xbb\x08 q>\xa0\xbb\'?:\x9a\x14?\xca\xf0S\xbc\r\ng\xbb\x06S\xe1>\xf0\xe5\xd5?\xa7\xd7\x8a?\xe1M\xa9>\xe2;\xfc>\x04\xfc\xe7>``p>\xe3c\xc9?\x16N<?\xc1\xea\xa5>,\xe7\x17\xbb#\t\x08\xbc\xc7\x00\x8b>\x18FE?\x8cm\x0c>g|\x07>\xd2_\xbe>=\x9b:?\xb3y\xc0?\xa9~I?\xf5\xad=?\x9ax\xb4>\x9d*G?\xca\x89\x9c\xbb\xe0\xf5T?\xa4\xc6}>\x02\xbf\x86?\xf3mC\xbb\x0e\x06\xee?\xa7n\x1f\xbc\\\xba\x9d<\xfa\xf9\xb9?x\xe8J\xbb\xc1\x8b\x0f=\xecC\xad?\x98\x0f;?\xad\xd2\n@\x1a\x80\x96?\xdb\xf2\x14?\x1b\t\xd7\xbb\x920\xc6>g\x82\x89?(\xce\xda>\xce\'\x1c?\x08\xc1\xc7?\x96a\x0c\xbc\xc08\xea>`\xb2\xb1?_\xb3\x8e>t\xc7\x86>\xbc\xca\xb0\xbc\x8b\xd2V>|\xc4\xaf?D\xc0\x83?Y2\xd2?o\x96\xca>\x18\xc9 \xbc\xfeh\x19?\x01\xa5\xa6=\xa6\xcb#?\x16\x8f\x99?@\x86\xf7?\xc7:\xf5>\'\xb6\n?\xed\xcd%?\xa0\xa6\x89?\x8c\x87\xb4\xba\x9d_\xab?\x0c\xef\xdd>X\xe3\x1d?\xd6\x869?Xm\xd2?\xe2\xbcS?\x9c\xdb\x8b>c\tn?\x9f\xad\xce>5\xdd-\xbcO#\xe8>4\xee]\xbc\xe1\x8e\x93<\x11H\xc8=k\x06H?\x01\xf5\x85?]\xdd\xe2\xbb\xb9Y\xb4?\x80{o?<\x90D>ut\xd0?\xe7T\xfa>\xeel|?\x00,\xa4??C.?u\xa0V?:b\xe0>\xf2C\xa5>\xe4\xdc\x81?.\x8a\xac\xbb9l8?}\xeb0?\xbf\xa43=\x04v\xa5\xbc\x83\x83C;\xc0x\x95\xbc\n\xd9\x95\xbb}^\x04?\xdc\'~?%\x0e4\xbb\x97\xce5?o\x9c\xa2?\xae\xa3??C\x10\xa1>6\xab\xb1<\x02\xea\xe1<a\x87\xa4?/G\x08?"\xaf\x94?$\xc1\xcc\xba\xb8\xd0\x8a\xbci1\xf2?=q\x91?#-\x80?Y\xb1v>\x85\xaa{\xba\xdf0\n?P\xb5\xdb?\xd4Q\x1f?\x0c\xa0\xd3?z\x1cx>tD;?a\xe8\xf3>\xfe-\xa3?\x82\x9c}?mX\xa6>j\xc3\x85?\x0e0\xaa?\xcc;\x9e?\xf0\x0b\x05\xbc-\x1e\xad>Y\xf1\xdd>\x91N\xdc>'
-p139
-tp140
-bsV445233315352547329
-p141
-g2
-(g3
-(I0
-tp142
-g5
-tp143
-Rp144
-(I1
-(I400
-tp145
-g31
-I00
-S'e\xa1\xc2:\xac\x82\xbb8\xa3\x0e\x1d\xbb\xf13>\xba\x1c\xb8\xc89\xd7 \x88\xba\xcf\x85\xac\xba\xdbq\x1e;\x8a\xde\x8e:\x0c]\x93:~p#\xbb\xac\xa4\x15\xbb\xb6\x96\xe3:[^\xf5\xbaf\x80L\xba\x17^\xa0:g\xa7\xec7&\xf5\xbf:\xd3\x8d;\xba5W\xb9\xb9&\x10\x9b:x\xe6\x1c\xba\xc2\xb8\x03;\xabf\xb2\xba\xfc\xa5\x97:\x17\x84\x12\xbb\x1cV\xda:\x87\x86\xcd\xba\xc6\xb6\xa5:K$\x1b\xbb\xead\t;\xa7\x826\xba\xef\xdcc:9L\x1b;\xed\x89\x15\xb9\xfb\x83\x88\xba\x9b\xf7\x04;\xf9b\n\xb7$\x86\xfa\xba\xce\xc1\xdc\xba;\x0b\x08;\xa3\x8f\x18;\xd2t\xe7\xba\x0e\xed6\xba"\xe7\x82:\x06Q7\xba\x19\x18\x13:j\x80\x8f\xba\x9dW\x0e\xba\xae\xd1\xc5\xbax\x91\xfb\xbau\xbf\x03\xbb:\x81K\xb9l`\x028\xfd(\xde:A\x96\xaf\xba\xbe\x90i\xba9\x06\xb7\xba\xe08\x04\xba\x1b\xffn9\x08\xae\x01\xbb\xbd\xf8}\xba\xf8\x8c1\xba\x1ci\xf4:1\x91\xc3:Z\xf0\x17\xbbN4\x15:\xd9_f\xbaT\xe2\x8a:\'\xa1\x0e;\x98/\xff:u\xce[:\x0e6\x02;\xf1\xbf\x99:"V\x8d7\x98X\xce\xba\x9c76\xba\x1c\xc5\xde:\xd0\xdd\xba\xba&\xf2\xa2\xba\x0bX\xac:\x12\x1c\x1c; \xa3\x00\xbb*\xe6\xee\xba\x8a\x0e[9\x9e\x96\xb5:@\x8d\xbf:\x93\xcd\xd1\xb8XG#;|\xeb\xa4\xba@-\xc7:\x189\xff:\x8e\xe4\xae:\xd8\xea\x9e:\xfd\xd4\x04\xb8\xbb"49\xadZ\xf2:\xbf\xcc\x17\xbb\xf3f\x0e\xbb\xdb\x06-\xba\xedd\xf2:\x85a\xe3:9\xc0\x878$`\x9c:\xd3K\xd9\xba[e\x10;8u\x00;\xc1\x99\xc9\xba\xb1\xc7\x17\xba\x11\x93\x97\xba\x99\x9a\xc9\xba.+\xf1:\xe2w\x07\xbbT\xbb\xf4:\xd1~\xac:\x94\xea\x1a:\x8b3\xc0:CGa:\xca\x1f\xe4\xb8U=\x05\xbb*\xd5\xa4:\xa6P\x14\xbb<\xd1\x94\xba\x8c+\x16;\xe3\x1f\xf3:<0J:\x19^\xab\xban=\x13\xbb\xec\xe4<:e\xa4 ;W{\x059\x06\xf6\x9a\xba\x1fR\xda:\n\x86\x02;\xd6Z\xa0\xbaD\xd5\xdc:\x81Y\x8e:\x8d\xf9\x9d\xba\xefA\xd6:\xbaH\xbe\xba\xda\xbf\x8d\xb98y\x01\xbb\x1b\xf1\xcb\xb9\xf2\x01_\xba\x06\xdd\xb0\xba\'\xf17\xba\x1e\r\x14\xba&n#;"\x83\xa5\xba|\xd5\xc38\xf8\x10\x1e;\r\xe4\x96\xba\xccy\x1b\xb9\xb8\xfc\x15\xbb\x13\x19\x188s6\x1b;M\xc7\xb6\xba\xdcj\xdd\xba\tz\x02;\x1e\x8c[\xba\xc4Z\xe6\xb9\x9dU\x829O"\x0e\xbb\xe7.\r;\xf5c\xd8:l\xe8\xcb:\xeb\x08\x0e\xbb^I\x9d\xb9\x937\xb3\xba\x92y\xb5\xba\x08_i\xba^ \x0e\xbb\x9eR\xb1:Q\xc6\x03\xba\xbf2\x92:)\x8c\x11;\x16\xbc\x02;@\xc9\xbc\xba\xb2\xbe\x98\xb9$\xd5=\xba\x86\x82\x16\xbb\xe3\xe2\x0b8\xa4\xf8\xd6\xbaT\xc7^:\x08\x17\xe0:Ty\x00;&!\xa2:\t\x9ah:\x8f#\xee\xba\xa9\xb4\xf5:\xe9\xf5p\xbad\xc2\x0f\xbb\\q\x08\xbb\x81U\x08;\x87\x88z\xba\xa9\xe6W\xb7\xdb!\x1e;L\n\xe49g\xd5\xb6\xba\xdch*\xbae\xa1\xc2:\xac\x82\xbb8\xa3\x0e\x1d\xbb\xf13>\xba\x1c\xb8\xc89\xd7 \x88\xba\xcf\x85\xac\xba\xdbq\x1e;\x8a\xde\x8e:\x0c]\x93:~p#\xbb\xac\xa4\x15\xbb\xb6\x96\xe3:[^\xf5\xbaf\x80L\xba\x17^\xa0:g\xa7\xec7&\xf5\xbf:\xd3\x8d;\xba5W\xb9\xb9&\x10\x9b:x\xe6\x1c\xba\xc2\xb8\x03;\xabf\xb2\xba\xfc\xa5\x97:\x17\x84\x12\xbb\x1cV\xda:\x87\x86\xcd\xba\xc6\xb6\xa5:K$\x1b\xbb\xead\t;\xa7\x826\xba\xef\xdcc:9L\x1b;\xed\x89\x15\xb9\xfb\x83\x88\xba\x9b\xf7\x04;\xf9b\n\xb7$\x86\xfa\xba\xce\xc1\xdc\xba;\x0b\x08;\xa3\x8f\x18;\xd2t\xe7\xba\x0e\xed6\xba"\xe7\x82:\x06Q7\xba\x19\x18\x13:j\x80\x8f\xba\x9dW\x0e\xba\xae\xd1\xc5\xbax\x91\xfb\xbau\xbf\x03\xbb:\x81K\xb9l`\x028\xfd(\xde:A\x96\xaf\xba\xbe\x90i\xba9\x06\xb7\xba\xe08\x04\xba\x1b\xffn9\x08\xae\x01\xbb\xbd\xf8}\xba\xf8\x8c1\xba\x1ci\xf4:1\x91\xc3:Z\xf0\x17\xbbN4\x15:\xd9_f\xbaT\xe2\x8a:\'\xa1\x0e;\x98/\xff:u\xce[:\x0e6\x02;\xf1\xbf\x99:"V\x8d7\x98X\xce\xba\x9c76\xba\x1c\xc5\xde:\xd0\xdd\xba\xba&\xf2\xa2\xba\x0bX\xac:\x12\x1c\x1c; \xa3\x00\xbb*\xe6\xee\xba\x8a\x0e[9\x9e\x96\xb5:@\x8d\xbf:\x93\xcd\xd1\xb8XG#;|\xeb\xa4\xba@-\xc7:\x189\xff:\x8e\xe4\xae:\xd8\xea\x9e:\xfd\xd4\x04\xb8\xbb"49\xadZ\xf2:\xbf\xcc\x17\xbb\xf3f\x0e\xbb\xdb\x06-\xba\xedd\xf2:\x85a\xe3:9\xc0\x878$`\x9c:\xd3K\xd9\xba[e\x10;8u\x00;\xc1\x99\xc9\xba\xb1\xc7\x17\xba\x11\x93\x97\xba\x99\x9a\xc9\xba.+\xf1:\xe2w\x07\xbbT\xbb\xf4:\xd1~\xac:\x94\xea\x1a:\x8b3\xc0:CGa:\xca\x1f\xe4\xb8U=\x05\xbb*\xd5\xa4:\xa6P\x14\xbb<\xd1\x94\xba\x8c+\x16;\xe3\x1f\xf3:<0J:\x19^\xab\xban=\x13\xbb\xec\xe4<:e\xa4 ;W{\x059\x06\xf6\x9a\xba\x1fR\xda:\n\x86\x02;\xd6Z\xa0\xbaD\xd5\xdc:\x81Y\x8e:\x8d\xf9\x9d\xba\xefA\xd6:\xbaH\xbe\xba\xda\xbf\x8d\xb98y\x01\xbb\x1b\xf1\xcb\xb9\xf2\x01_\xba\x06\xdd\xb0\xba\'\xf17\xba\x1e\r\x14\xba&n#;"\x83\xa5\xba|\xd5\xc38\xf8\x10\x1e;\r\xe4\x96\xba\xccy\x1b\xb9\xb8\xfc\x15\xbb\x13\x19\x188s6\x1b;M\xc7\xb6\xba\xdcj\xdd\xba\tz\x02;\x1e\x8c[\xba\xc4Z\xe6\xb9\x9dU\x829O"\x0e\xbb\xe7.\r;\xf5c\xd8:l\xe8\xcb:\xeb\x08\x0e\xbb^I\x9d\xb9\x937\xb3\xba\x92y\xb5\xba\x08_i\xba^ \x0e\xbb\x9eR\xb1:Q\xc6\x03\xba\xbf2\x92:)\x8c\x11;\x16\xbc\x02;@\xc9\xbc\xba\xb2\xbe\x98\xb9$\xd5=\xba\x86\x82\x16\xbb\xe3\xe2\x0b8\xa4\xf8\xd6\xbaT\xc7^:\x08\x17\xe0:Ty\x00;&!\xa2:\t\x9ah:\x8f#\xee\xba\xa9\xb4\xf5:\xe9\xf5p\xbad\xc2\x0f\xbb\\q\x08\xbb\x81U\x08;\x87\x88z\xba\xa9\xe6W\xb7\xdb!\x1e;L\n\xe49g\xd5\xb6\xba\xdch*\xba'
-p146
-tp147
-bsV473379271755300864
-p148
-g2
-(g3
-(I0
-tp149
-g5
-tp150
-Rp151
-(I1
-(I400
-tp152
-g12
-I00
-S'\xd8\xca\xd2:}\x81\xc4;\x16iM\xbf\xa2\xfcv\xbf;gh\xbbd\x06(\xbe\x12\xea\x81\xbe\xdc\x9f\x06\xbf\x88\xba\xfe:Ii\x17;\xb7\xd5\x89\xbe\xe5\xe1\x15\xbeh\xf06;/-i\xbe\xcb&G\xbe\x87g;\xba*K\xeb\xbe\xfe\xa7\xce\xbe\x1c\xe1t\xbf\x80_\x14\xbf]]a\xbd6d\x9d\xbdWad\xbb\t\x1e}\xbe\xb0\x87\xaf\xbd\xa0\x03$\xbf;\x1e\x14\xbb6\x1a\xa6\xbe\xec\x12\x06\xbf\xe9\xda\xd6\xbevB\xa4\xbd\x87\x1c\x87\xbe\xd1f\x97\xbe\xce\xaa`\xbf>\xb5\xd1:\xa6\xe5k\xbbo\x10\xb8;\xb9\x8d\xf1\xb9\x11\x91\xd2\xba\xfe\x81l\xbe\xf0QC\xbf0{\x8a\xbfQ\xc9Y:\x14\xa2\x1e\xbe\xa7\xcan\xbe\xca\x12\x19;@_\x1e;\x0f\x8b\\\xbe/\x7fo\xbe0oI;&\xaa\xfe\xbe\\ x:\xa0\xae+\xbf\r7\x8e:\x82\x12\xbf\xbf=GF\xbe"\xfb\x12;\xf6p\xfd;I\xbf\x08\xc0_\x94\x9b\xbfr\xc8\x88\xba\x9d\x0c+;w\x82\x8e:,_\x19\xbe\n\xdc\xd5\xbd\xcd\xc2\x19\xbe\x9b\xac;\xbf\x96l\x8d;\xa0\x01\x17\xbe\x82%\x18\xbf\x9b\x97?\xbf\x9bW\xec\xbe>\xdbR\xbf\x97w\x8d\xbex:\xe4\xbe\xc8h)\xbf\xb8\x8c;\xbf\xe4>\x15\xba\xe0\x04B\xbbi\xc1\xf4\xba\xc0\xbd\xee\xbd\x7f\xd9\xc6\xbe\x03\xd3\xfe:\x90\xa7q\xbf\xabt\x96:|4\xf6\xba\x04\x02@9\xda\xd2\x83\xbe\x87\x1a\xb2\xbb\xac5\x8c\xbe6\x05\\\xbf/$5\xbb0l\x9d\xbf\x01\xe2\x19\xbe\xf94\xe4\xba\xd3\xde\xf6\xbd\xb4<\xf4\xba:\\\xbe:\xeeO\'\xbb\x11\xc0\x97\xbfW:\x01\xbf\xf6]\x84\xbbs8f\xbc\xfdF\x90\xbb\'R\xb2\xbb\xf5\xa9\x97\xbe=\xb5w;\x02\xcf\xdb9?^\x02\xbf\x084\xa2\xbeB\x88\xf5\xbfx\xc7\x8e\xbe\xd4\nQ:\xd3^%\xbbt\xab\x9f:G\xd2\n\xbfI\xa6\x1a\xbf\x87I\x19;\x8a\x9d\x19;\xce-\x14\xbeS\xd2\xf1\xbb|^;9\x0e\x80\x1e\xbeS\xb9\xa7;\x93\x9b*\xbd\xc7\x022\xba\x07Ly\xbeg\xa8Y\xba1\xfa\xe4\xbd\x10\x0f\x13\xbf\xfe|\x9c\xb9I\x85\xfd\xba\xa5n\xb6\xbd\xe2R\xe5\xbeV[08\xf1l+\xbe {\x8f\xbe\x9a\x99\xfe\xbd\xbe\xa6\x9e\xbf\x1bl)\xbf#\x83\xca\xbd\x1e\x07@\xbe\xdfb\x07;\xd6\x95:\xbf1f\x8a\xba\xa6\x92&\xbd\xb8B\xf2\xbe\x99\xff\x7f\xbb\xef\xf8\xbb\xbe\x07\xc4\x14\xbe\xb4N\xc6\xbd\xa5\x8d\xc9\xbe\xd4\x1a\xb3\xba\xb5\xda\x0c\xbf\xe1\xc9&\xbe\xf3~\xc8\xbb\xac\xad\xd6\xbe\x12_\x8c:I\xb2[\xba\x01 F\xbf\x8ey\x98\xbf\xb5\xaa\x01\xbf\x8b\x17m\xbf\x8bu:\xbf>j\xd3;\xc4\xe0.\xbex\x03\x87\xbfe\x05\xd6\xbaa\x98\x99;"j`\xbe!@\x84\xbeu\xcaU\xbe\xf5\xb6W\xbfk\x80\xbb\xbaS\xe6^;V \xdf\xba} \x1d\xbf-\x85\xc6\xbf\x92/\x1b;\x8arB:\xc4n\x94\xb9\n\xc4\xa7\xbe\x0f\x9a#\xbf\xc5\x0fE\xbf\x9b50\xbb\x9e2\xde\xbe\x82\x9c\xcb\xba\x9b\xc4\xf6\xbd\xfc\'\xa7\xbb\x97\xb46\xbe\x876\xb1\xba\xc8\xc35\xb6RqD\xbbb\x8c\x1a\xbb\r\xd0K;8|\xd08&\xb8\x8e\xbf\xd9+\x1c\xbd\xeb6-\xbd\xaci4;\xf3\x91\xf0?bq]?AW\xb7:\xde \xf1\xbbf\xbd(?`\xe6\x1d?eE\xd6=\xaa\xbdW;\xad\x1f\\>\xff\xf1\x9a?\x81\x01\x94\xba}8\xef=_\xccV>\xc9\xf4\xbe=\xca\xbc\xa4=z\x08\xbb?i\x12-\xbb\x04\xbf\t:2\xc1A\xbbju\x86\xb9\xbd\x1e}<O\xf2\xd8>\x9cyD?\xf5\xeaN?\x1b<\xb3>b\xc1\xc0\xb9\xd1\xe0\x04?\x1a\x0e\xec:\xfd0]:\xe0\x10a>\xb8\x1f\xb6>\xa1m\x19>?!2<\x17\x8e\x9e:\xd8\xaeB?\xd4\x03\x0f?\xbb\x91\xbb?\xb1\x06\xd0>\xabl%?%\x1a\xaa=\xb5`\xf99\xf3\xc3\xa3\xbb\xb4\x9b\x03?U\x953;Oy6=\xc2\xff]>d\xfc\xbf?\xd9\x15.>9\x94Q<\x07\xcc\xe1?\xf0\xeb\x106\x063\x84?\xc5X\x9a9GT\xdc>DOA\xbb\x06nh=\x8a\xa7\xfc>Au\x18?D\xf8\xa4\xbb\xde3\xa69\xf9*V?T \xe2?\x870T?\x81\x008>5\x9e\x99=\xbdW\x12>\xbb\xa6\x01\xbb\xbf\xb7\xe8?M\xce\x1e? \xd9J:c!\x95;\xc6\x93\x9b;.\x95y:>\xaa\xd2\xb9`\x86\xda\xba47\x01=\xc6#\xbd\xbb^\x01!?\xcd\xbf\xc2>&\x949>\xd0\xa6%>{\xf0"=\xb2Uo?\xccY\x1e;i\xfb-?3\x982>\xa3me?\x85\xe5\xdd;_\xe3\x9a?\x13^\xc0<\xae\x1d\x06\xbb\xf2\x86*?\xe1\xeb\xd5\xba\x02\xe3&=\xc8@\x90?$c\x16>\x0b\r\x95?"\nz?\xfa\xbde>\xbf\xdb\xa4\xbb\x8a\xea4;:\xf6\x82>\x89\xa2\x87>\xc4\xa1}>\xf0\x8ee?Z\xba9;b55?.\xa7\x80?V\xc3-\xbb\xc4\x9c\x1c<\x1f\xf2\xea\xbbV\t\x0e>S\xca\x00?\r\x91\xa6>\xaa\x82\xbd>\x1e\xffX\xba\xb6cq;\x9c\x94:?\x89\xcfk>\x81\xafs=\xf5\x8b\x16?\xc6\xe1\x80?\x05\xe1\xc6=\x02Z\xef>)5W>\xad\n\n?\x14z~:\xe8\x8ea?\x97\xa3"=\xfb=f=\xc1\'\xbe>\xf0f\x16?q\xa8\x06>\x08\xce\x15\xbb\xd1\xfau>\xcd(9\xbb\xf6\xb4&9.\x17!=OY\'\xbb\xa5\xc2k\xbaU\xd0\x8a=\xfd\xa87>\xa1q\x7f?,\xb2\xb69\xb4\x04\x8e?w\x1c\\?\xcc\xfc\xc1=\xb7\xc2\x8f?#*\x13\xba\xce3r>9\xe5h>:\x05_:\xcf\x8b\xb8>\x99\xff\xa4=f\xfep=\xf8\x95\x1c?\xe8\x00\x19;0\x9b\x94>\xe6\xd3\x12>P\xe2\xf3\xba\xeb\xb4\xd7\xbbo0n\xba\x8c\x1d\x1b:\xcf\x8d~:&\x1a)?\xd6M\x96>\xce\x9c\x8b:5\x928?tG\x04?\xfc4_>\xb4\xae*>\xdc\xf3Z>#_\xc4\xb8\x11\xeb\xc4?\xf5J\xf4>\xc7<\xb0>\x8b7\x06;\x06\n\x17\xbak\xb4\x8b?\x05dm??\xf1G?w\xf1\x93\xbb\xdd\xcb\x02;\xcc\xa5\x1f\xbbQy\x8d?\xa1\x7fd=l\xad\xd0>\xe0\x1a\x82=\xcf5]>f%\xb5>\x98\x87\xf3>\xe6\xaa\x88>\xa2\xb3\xdd>\xf7I\n?D\xab\xb6??-\x84?\x9d\xdf\x15\xbc\xbd\xe5\xdc=\xd6\x8c7>\xa5\xf8n?'
-p153
-tp154
-bsV445232231364448256
-p155
-g2
-(g3
-(I0
-tp156
-g5
-tp157
-Rp158
-(I1
-(I400
-tp159
-g12
-I00
-S'\xd2\x1d\xd9\xbb\xf5\xa6\xd1\xbe\xf2\xc3\x92\xbf\x17 M\xbf\xaf\xc9\x12\xbb\xf4\xd6_\xbf\xa4To\xbep\r\xaa\xbf\xc3\x84<\xbf\xa0\x8e9\xbe\xb6\xf5\xc0\xbe\xe6\xe5\xb1\xbeH\x0e[\xbfMa^\xbc\xe9 .\xbf\xfcc\x98\xbb[\x97\xe3\xbe\x97s\x16\xbfu\xbb\x84\xbf{\xcd]\xbf\xd5\xff\x1d\xbf\x92\xc5\xb2\xbe\x1ba\xb4\xbe\x97\x11\x8a\xbf\x8b\xeb\xfe\xbe\xf6\x04V\xbfV\xdf&\xbb`/M\xbf|\xe0\x16\xbf\xd6\xb0\x84\xbe;\x08I\xbfNn?\xbf\x8e{\xb5\xbeq\x83\x95\xbf\xc0\xb3d\xbe\xe9\xa2,\xbe# P\xbbRAT\xba\xb2}\xb0:\xd2r8\xbf\x99b\xa4\xbf\x85\x80\xd0\xbf\x9e\x95\xef\xbe\x1d+\xcc\xbe\xe4\x13\xc6\xbf#\xb40\xbf\r5\x86\xbb\xcc\xa1\x90\xbe\x89\xbf1\xbe\x13\x01Z\xbb1\x81\x1a\xbf"\xd5\xfa\xba\xd9\x9f\xda\xbec\x1e\xb6\xbd]\xb6\x8d\xbf\xe2\x9f\x07\xbfq\x18\x95\xbe9"=\xbf\x9cS\xfa\xbf\xa5x\xc3\xbf\x80\x90u\xbf\x0eB\xc3\xbd\x81\x81\xd7\xbcx\xf77\xbf"\xee6\xbc\xbb\xb7\xb8\xbe5m\x05\xbf\x8a\x90\xbb\xbb\xa1\xec\x9a\xbf*0]\xbf\xc2\xb5\xed\xbf\xabH\x91\xbf\x14\xee\xc9\xbf\x141\x08\xbf\xeb\x87\x04\xbf\x03\x95\x83\xbeI\x9d\x18\xbfWo\xee:\xbdaZ\xbe\xff\xa6C:\xcc)\x9e\xbe\x9c\xa0\x8e\xbe\x9c\xad\xa0\xbe\xefMu\xbf\n\x97M\xbc\xd8\xf1\x8d\xbe~\xf3\x99\xbb\xb5\xbba\xbf\xa7\xb0\xb7\xbb\xd3lz\xbf\xa6\xcda\xbf\x93\x8f\x129\x15\x0c\xc4\xbfHA\x82\xbfv=/\xbb\xc0\xda\x91\xbe&I\x1a;\x16\x9e\x8b\xbb\x1c\xcc\x1b\xbe\xd6\xe3\x8f\xbf$\xfc\xaf\xbe\x84\xf1\x04;\xb6\xc1\x8a\xbe4e\xdb\xba\xa7`>\xbd#\xa1\x94\xbfW="\xbf\xe9\x85\x009\x0e\xe9\x1a\xbf\x80P#\xbe*\xcc\xec\xbf\xf7/\x7f\xbe\x180v9\x03O\xd0\xbd\xd4\t\xd1\xbe\xe5\xe0y\xbe\xfb"\x8f\xbf\x08\xe6\xb3\xbb\xd1h\x1d\xbf\x93\xdb\xde\xbe\xcd\xfb\xba\xbb\xbd@\x898\xaf~\x02\xbf7?O\xbe\xfc\x83\xb1\xbe\x10\xbdx\xbb\x9aa\x84\xbf\x9b\x82\xd3\xbe\xd1\x1eJ\xbe\\\x98{\xbe\xb1V\xe4\xbd\x9c9U;\xf5\x9f\x90\xb9\x0f\xae\x06\xbf\xf1\x89+\xbe\x87\x05\xfe\xbe\xb9g2\xbf \xd4%\xbe\xf8^\xda\xbf\xb7\xe3p\xbf\xa9VQ\xbf\x02o\xc5\xba1\xf5\xf5\xbeT6\xa9\xbf\xa1#\x88\xbb\xe8|\r\xbf\xb8\xeeO\xbf\x84\xaeE\xbb\xe4v\xdb\xbe\xf8\xb8\x84\xbb\xe2\xf8\x88\xbd[\x1fV\xbe\x84\xc5\xc1\xba\x17P;\xbf0\x9a\xb9\xbd\xf4oi:Q\x9fp\xbf\x1e\x1c\'\xbb5~/:\x12\x08\x13\xbf\xe0\x02\xbd\xbf\xec\xea\x98\xbf\xf0h\xbf\xbf\x1b\x9bZ\xbf\xa5\x1f\xa5\xbe7\x04\xde\xbe\x97\xa6\x8d\xbf\x01\xc6\xd9\xbd\xc5[e\xbda\x92\x15\xbf\x15\xa3\xeb\xbe-P|\xbfak\x8e\xbf\xf3\xd8\x0c\xbc\xae\x9fq\xbe/\xbd\xe3\xbc\x97h1\xbf\x82\xfd\x97\xbfp\xff\x15\xbb\xdf\x7fI9\x01\x1b\xfb\xbb\xc5%\xe7\xbe\xcd\x06*\xbf\xf8c\x98\xbe\xe2C\x89\xbbz\x16\xc1\xbe;7J9>\xbf>\xbc\xa5H4:)("\xbf\xf6\x10\x06\xb9\xe7\xcd\x11\xbdpM\xbc\xbed\xdc\x8c\xba\x99)\xca\xbb\xfb\'\xe5\xbb\xfb`\xb5\xbf\xd0\xa8\xe9\xbdNE;\xbe\x9a\xc9\xc7\xbfd\x0b\xe8?\xe8\xecA?\x1cH\x8a:\x8c\x85b?\xd2[z?\'Mc=\x18.\x8c?\xae\xcc\x11;G\xeb\x8a>\xa7W\xf9>\xc9+\x1a>p\x8f\x9c>0a\x1f?7a\x88>\xadT\xe6>\x82\xbf\xf4?\x06\xe4\x95<\t\xedj>\xfd\'\xfd:\xa4YS;@\xe5\xc8>\xd6\xe5\r?\xaeZ\x97?U\xe3\xb2>\xb4\xa9\xcf>\xfd\x0c\xf4=\x8a\x1cn?\xd8\n(>\xe0\xd2\x1b?\xa4\n\x9b>9e\x81\xba.\xcc\x13?D\xcd\xb7>\xe3\xb2\x04;\x05\xcd\x84?\\\xac\x95?^#\xf4?O\xe0g?\x19\xa4\xb6?VZh>\xd2\xd3.:\x02\x05n>\x91\xeb3?\xc4<\xce>:\x8c|\xbb\tW\xca>\xe1\xeap?n\xf76?\x0f\x08\x12?~\xe1\x93?\xbf\x0b\xc0>\x02\x82\x9f?[JW>\xc9\x1e\xa2>\xa8\x88\xfe;2\xb6<?\x8d)\xa3> j\xa0>\x91\xea\x04<\xf4u\xd4;I_\x10?\xf0\xe5\xd5?\x97\xa4\xbd?\x00\xea\xfd=\xf9/v?\x91\x18\xcc>``p>\x0br\xc4?{\xc9J??\xe4n>\xaeH\xa4\xba}\xd9\x06;\xc6\xb4\t?\x02\xd7\\>v\xdd\xa1>\xb0c\xb1>\\\x9ac?=\x9b:?\x19\xde\xb8?\xb2\x00\xa3?\xe3\x07\x0c?\xacn^?}\xf09?g\'j:\xe0\xf5T?\xe4\x0e\xb9>\xad\x8f\x84?k\xceY;\x0e\x06\xee?\x10\xe5\xb2=\xd0C\xd4:\xd0\xf5\x9a?}\x1d\xee:\xb1\xa4\x9c<\xecC\xad?\x83\ts?\xad\xd2\n@\xdd\x1c\x88?6_o?\xa2\x07\xba;\xdd\xe4H?\xc8\x03\x9d?"\xfc\x08?\xb7\xb7R?\x08\xc1\xc7?\xa6\xe6\x8e\xba\x8e\x05\xcd>\x1f\xc2\x93?\xecYq>\xe2\xf5\n?\xb6l\x15=\xa7\xa4\xca>a\x15\xca?D\xd7o?\x9b\xdbJ?*\x14\r?\xec\xf9\xaf\xba\x97\xaeu?\xa7G\n?a^\xbf>\xd0\x03\xa7?;A\xce?\xc7:\xf5>\xac\xbc=?\x96"6?\xa0\xa6\x89?\xf3\xe6\xdd=\x9d_\xab?\xa5\xe5\xff>\x04\xbd\x89?\x85m\x01?r\xa1\xb4?5O\x8c?\xf2\xcc\xab>\xfb\xa5\xa2?"")?\x97 j\xbaO#\xe8>\x0f\x01\xbc>\xcbF\x1d>S\x08#:\x7f\xd0\x80?\x01\xf5\x85?k\xbdh\xbb\xb9Y\xb4?\xb4\x1f\x85>\x8er\x16?\x8c\x13\xda?Tc\xa5>{"\x85?\x8b|\xc5?b\x00\x1c?\xffR@?;\x88>?\xe9\xf4\xd8>r\'\xb6??\x95\r;ro\x7f?\x06\x9e\x97?``\xd0;xo\x84>\xc3Z\xfe92\x07\xa9;\x9em\xf7:\xef}\xa6>g\x00y?\x14Eg;\x97\xce5?4\xbf\x80?\x1e}\xa1>H\xb7\x12?\x1c\xe6\xc6\xba\xbat\x02?\xcf\xe6}?\xa7\x92\x1f?\xee\x91\x8c?<\x99\x86;\x0e\x9dd;\x9bj\xe4?=q\x91?=\xebb?\x97\x1b\x10>\xb0\xed\x19>\xb3\xeb`?P\xb5\xdb?\xe6\x15\xae>\x0c\xa0\xd3?D\xcc\xaa>\xfcw2?\x91\x8c\x87>\xcex\x86?\x14%\x8f?A6\xd3>\x80\x95\x8f?T%\xb4?s\xfa\x83?\x1e4\x18>\xfa\xe3\xd0>r\xa5\xa2>\x06\x16"?'
-p160
-tp161
-bsV445912109340057601
-p162
-g2
-(g3
-(I0
-tp163
-g5
-tp164
-Rp165
-(I1
-(I400
-tp166
-g12
-I00
-S'{\xe0B<\x93\xce\xba\xbd\xc1M\x82\xbf}\x1c\x01\xbe\x7f\xcb\xdd; -E\xbfj%\x87\xbe1\x84D\xbf\xb46u\xbe\xa3\xa7B\xbc\x0b\x1c;\xbe:vD\xbe=bf\xbf0M\xab\xba\xadM\x03\xbf\x88\xbc\x0f<\xd4\xcb\xeb\xbd(\x16!\xbe\xe4\x853\xbf\x07\xe5W\xbf\x01\xb0\xed\xbeeX(\xbe0\x81N;\xf0>\x9c\xbf\x11\x08.\xbf\xc3\x18~\xbe_\x84\x07;\xe4DM\xbf\x8b\x82\xfd\xbe\x1c\xb1\x85\xbd\xac\xf2e\xbfg\x89\xa3\xbf\x084u\xba\x14\xfa-\xbf\xb57z\xbe%\x8e\x07<x\xee\xdd;9\xab\x0e;\x17ln;\xe9\x1cQ;a_\x90\xbfK\xd3\x9b\xbfwI\xc5\xbe\x04?.\xbf\xf4E\xbc\xbf\x1d\xf3\xee\xbe\xdb_\x0c<2\xb6\x8b\xbe\\\xd0\xd9\xbc|\x997<\xfe\x1fL\xbf2\x7f\x02<9\xdd\xd1\xbe\rP\x8d\xbdUro\xbfTR\xa1\xbe\xe1\xe6\xc0\xbd\x86x\x14\xbe\xae@\xc3\xbf\x98\xdac\xbfj_,\xbf\x0bx\x17\xbe)-\xa5\xbe\n3\xdc\xbeV\xf9J\xbeF!\xae;\xd9\x9d\x95\xbe\xde)C<\xaf\xbe}\xbf\x05\xd5B\xbf\xed\x08\x04\xc0\x9f4+\xbf2\x1e\xb7\xbfu\x06j\xbfI\xb6\xd1\xbeL\xbb\x82\xbd\x90\xd5_\xbfX\xfe\x82;|"\x01<9\xf6\x8e;\xe5\x88\xd0\xbe\xf6x\x02\xbe\xf9(\xda;#2E\xbf\xe5\x16\xcf;\xbf\xd2\x1a\xbd^l\xde;\x13\x87a\xbfp\xaa\x1d<\x9eL\x0b\xbf(S\x84\xbe\xa1\xd9\xe0:a\x84\xb0\xbf}\xf5\x13\xbe\xc8\xcf\xa4;\x90\xc0\xf6\xbcP\xc0\x0f<\rF\x96;\xf9\n\x08;\x8eN`\xbf\x0c\xdf\x1c\xbfi\x13\xcb;\x02b)\xbd\x86\xc7\xa6;>\xf4S<\xa3\x8d\x9e\xbf\x1f\xa4\x04\xbe|O\xe2;\x0c\xde\x00\xbe\x94p,\xbd\xcbc\xed\xbf\x99\xb8&\xbf\xe6\x12\x8a;\x95\xb3\x80;\x9b[\x0f\xbeC\x1d\x13\xbe\xea\xfd^\xbf\xe5\x88\xab;X\x88\xa6\xbe\xedY\x12\xbf\x16\xd3\xf2;\xed9\xfd:\xaeq\x1c\xbf"\xba1\xbd\xffa+\xbf\x9d\x0b];Gb5\xbf\xb6\xe4\xb1\xba\xd5\xe7;\xbe/%3\xbd\x1e\xe1:\xbd\x90ed;V\x80\xbe:\xe9\x80V\xbfi\xec\xa9\xbeT\x9a\xfc\xbe\xd6\xb3\xe5\xbe\xa3\xf4\x96\xbd\\\x12\xe9\xbf\x07\xf0\xda\xbd\xd3\xe72\xbf\x9aQh\xbd\xd6\xc4+\xbeQ\xc0\x91\xbf\x19\xe3Q<\x18\xa9\xba\xbe\xdf&\x0e\xbf{q\x0f<\xe3\xfd\x8f\xbeB\xf2\xb8\xbd\xd2G\xbe\xbdl \xa2\xbec\'\xa3;\r \x97\xbe\xb92\x8f\xbd2\xbbH;\x9d\xaf\xca\xbe\xa0Vl;y\x1fC;qt\xe9\xbe\x15\x8f\xd8\xbf1V\xa5\xbf\xf3\xc0\xc2\xbf\xa7\x93?\xbfU\x0e\x19\xbe\x98s\xa5\xbeea}\xbf\xe0F\xef;\x83[\xbb\xbc\x1a\x18v\xbe\xc5[\x92\xbe"\xec\xa5\xbf\x01\x18\\\xbf\x0e\x083<\xd7\x07\x90\xbb\xc3\x03\xee\xbd\xe1\xac\x13\xbf\x8a3\xcf\xbfH1\x8b\xbc6\xcb\x86;\xe6\xbf\xd1;\x93\xaa\xb5\xbep\xf8\xad\xbe\xe1\xaf\xb9\xbe\xb4\xfb!<C\xc0\x90\xbd6\xc3\xa0;L\xa0\x05\xbc\xd3\xab\x00<F\xff\xc6\xbe \xb6C;\x8e\x89;\xbd\x1e\xf0\xe8:\xd1\x15\x0f<\xff\xb0U<\x01\xa0c<\xd9\xa8\xa9\xbf\xe9\x87\x1a;\x1d;\x96\xbe\x0e\x96\x84\xbf!\xef\x0b@h\xc8\x0c?\x9a\xab\x0b\xbc\xb9\xfc\x02?\xcf\x93.?W\x07\x8c=\xca\xc3\xcb\xba\xd6#\xb5\xbb\x13"\x15?\xab\xa9\xa1>=@\x98>[P\xe9>\x1e\x96\xe0>\x93r\x1b?\xe6\xa8\xdd7/+\x8b?\xd6\xbe\xc5=\x9e\x8f\xbe<v2\x8c\xbbIt\x15>q\x97z?p\x86\xbd=4\x8cl?\xeb\x954=\xe0)\x8f=9-\xc2=\x7fR\x1d?\xb3\xf80\xbb\xa6\x83\xdb=\x97\x1fO?\xf0-\x91>\x8bSg\xbbn\x11\xdc>\x93<\xc6\xbb\x16A\x1e>\x94\xf6\xe1?\x84\xb8\xab?\x12\x1b\xdd>\xe7&v?\x83\x06\xc6>_\xc8\x1f>\x87i.>2\r-?\xa4i\xbf>\xcc\xd0!\xbb\xd6\xe7F>W\xa4\xa9?6rD?:h\x84>W-\xb0?\xf6u\x1a>\x9ds`?\xe3\\\xcb\xba\xb3o.=\x94\xa60\xbc\xf6P\x14?f\xbc\xcf>\x7fW\xfd>\xb4\x0fc\xbc\xa7\xeb\x17\xbcs\xd4$?a\\\xa8?\xa7\xd7\x8a?\xe1M\xa9>\xe5\xb7\xb8>\x96\x1d8?\x81\xd2*=\xca{\x13?\'%\x85>\xeb\x13\xa9\xbb\x0b\xf1,\xbc\x01\x98\xc7\xbb\x9b\xad\x92=9\x1d\xab\xbbm\xc1J\xbb\xb5\x15\x04?h\x9e\xff>"\xd9\xcf>\xb3y\xc0?\x92\xfb\x1b?\xbc\xeb\xa9<\x9ax\xb4>\x15q\xe4>\xf3\x8e\xa2\xbb\xb0\x07\xf5>\x04\xb0\x8f>x\xbbK?\xa1\xcf\xa3\xba\xd8\x86\xda?\x15\xcb\xb0>\\\xba\x9d<\xfa\xf9\xb9?\xbb\xdat\xbb\xfam\xcb>\x13\x19K?\x98\x0f;?V\xab\x04@\xe5\xe5"?\xdd\x15H>r\x03\xb7\xbb\xfd\xd6\x88>g\x82\x89?\x1cP\x90>\xb7^\xe0>\xf09\x81?\xd8+\x90\xbb"KQ>`\xb2\xb1?|.\xdf=\xb1\x15\x8e=,\xff\xf0\xbb!\n&?|\xc4\xaf?D\xc0\x83?Y2\xd2?\xd1\x0c\x06>1\xee\xc6\xbb\xc2\x85U?\x92\xcaZ>\x1c\xe4\xd4>*tg?@\x86\xf7?G\x8f\x9d<\xc7\xb5\x19>o+\xcc=\xe1{\x0c?\xefnZ\xbb\xd1\x84\xf6>\x0c\xef\xdd>X\xe3\x1d?\xb9\xf2\xa8>Xm\xd2?\xe2\xbcS?3\xb4q=e,\x00?0&(>\xfaW\x12;\x96\xde\xfc=\xcc\xe1\x89>Go\x82>\xa3N\x1a\xbb\xa8\xee\x06?\x17\xceW?y\'\xb6\xbbZ\xca\x1b?\x92\\\x17>\x85\xfd\x04?\xc3\xed\xc9?\xe7T\xfa>\xeel|?\x00,\xa4??C.?B\xa6\x1f?\x8a/\xd0>\xcfD\xc5>\xe4\xdc\x81?\x15\'\xe6<i\x9c\x10?}\xeb0?\xbf\xa43=\x0f\xf3\x06?y\xea\x92\xbbP\xce\xf2\xbb\xc6\xe0V\xbb 27>\xdc\'~?\xd0\x10\x00\xbc\xd4x\xfd>\'\xe0@?\xae\xa3??\x14\x99A>\x17\xc5\x9e\xbb`\x10\x00>\x13\xdc\x93?/G\x08?"\xaf\x94?^X\x08\xbc0\xf33\xbcB\xd8\xb0?FP\xa9>\xc6\x0e\x0e?\xd5]\xa2=c\xdc\xb3\xbb\xfe\xf3\x98=\xe8\xe7N?\xd4Q\x1f?>\x06\'?\xecU\x06>\x19a\xe4>\x82\x16\x9f=\xfe-\xa3?\xc7\xccO?\x1b\xd5\xc3>q\x8a(?\x0e0\xaa?\xf4\xbdm?`\x87\'>-\x1e\xad>\x97\x13\xa9>K;=?'
-p167
-tp168
-bsV445257821915865088
-p169
-g2
-(g3
-(I0
-tp170
-g5
-tp171
-Rp172
-(I1
-(I400
-tp173
-g12
-I00
-S'K\xe5\x8c;f\xbe\x12\xbbq7\xfa\xbep=\xcf:\xaaG\xca:F==\xbek\x17z\xbd\x1e\xa6\x1d\xbf\xc2\x81y\xbe\xbd\x1fq;\xb6\xf5\xc0\xbe\x95\x86\x8a\xbd\x0c{t\xbe\xa8\xe2\xdd\xbai<\xda\xbd\xb7V\xe8;\xc0U\xc9\xbdUL\xf2\xbd\x8co?\xbf{\xcd]\xbfB:4\xbeQ\xb5\xb6:!(\xbc9\x1a~\xd6\xbd\xd8\n\x9a\xbc\xf7s\x19\xbf\x8c\xf5\xb9:?:|\xbeS8\xd6\xbe\xc2\xdf`\xbc;\x08I\xbf\xc8{\x8f\xbeV)\x1a\xbdq\x83\x95\xbf\x9e\xec\xb4:Z\xf8\x05<EG\x1c;(eJ;z\xe6\x80;\x10\xe9G\xbe2\xbdN\xbf\xce\xfd\xad\xbfR\xe9\x8e;\xa3U?\xbeC;<\xbf#\xb40\xbf/\xb3\xd6;\xb8\xc0w;l,\x83\xb8R\xa6\xe7;\xfb\xc3i\xbe\xe23l;\xfadQ\xbeW\xa3x\xbc\xf2\xfbe\xbf5\xe4\xd7\xbeq\x18\x95\xbe\xd4xs\xbd\x9cS\xfa\xbf+{8\xbf\x9c\x8ar\xbe+\xfd\xd4:\x1f\xfd\x00;\x95ui\xbe.\x00\xcd\xbc\xbb\xb7\xb8\xbe\x7f[T\xbe\xdcr>:\x9a\xc4\x91\xbd\xaa\xdc\xa0\xbe\xcb\xde\xac\xbf\xfb\x11F\xbf\xb5\xd8\x98\xbe\x141\x08\xbf\x87\xac\xf8\xbd\x00Xp;\x08\xcc\x92\xbe\x1a-\xcf9xH\x87;\xd3\x8c\xf1:\xf2X&\xbe\x8c\xcf\xa3\xbd\xc9I\x8c;$\xc8\xf0\xbe\n\x97M\xbc\xd8\xf1\x8d\xbe\xaf\x8dc;7\xf1\xad\xbe\xa1A\x0e<jEM\xbfjGQ\xbe\x01\xbc\x84;\xe7\x89\x1b\xbfHA\x82\xbf\x9e\xb1\xc9;\xda\xcb\x8d\xbc\xd0\x83\xbb;V\x9e_;B\xdf\x86;8a\x89\xbf\xdc\xa3t9lS=;\xb7\xd8d;\x14\t\xaf:V\xd4.<\x0b-i\xbf\xc0\xe0\x13\xbe;\xca\xc5\xb9n\xec]\xbd\xcf\xa6`\xbc\x18\x16\xc7\xbfD\xc4\xa2\xbd\x98\xd7Z;\xc4E\xcf:\xda\xfa\x15\xbc\xc4\xbe\x0e;_\xbfj\xbf\xba*\x86;\n\xc5\xc6\xb8$\xfa\x94\xbe\xf8\x17\xd4;\xdc2l:\x89\x80\xa5\xbd{\'+\xbd\xe7\x1bq\xbd&D\x03;\x9b+^\xbf\xc5\xd3\x08\xbb\xd7\xaf\x0c;\xda\xab\x98;\xb1V\xe4\xbd\x1cVK:\xb8\x9e\xe0\xba\x17\\\xd5\xbe*\xef\x87\xbc\x87\x05\xfe\xbe\x94ui\xbe\x928#\xbc\x89\xa1!\xbfA[\x17\xbf\xa9VQ\xbfU\x7f\xe2;o\xaf\x00\xba\\\xa6S\xbf5\x88\xb5;\xe3\x81 \xbe+\xc3 \xbf\x90\xe3\x99;\x8c\xba\r\xbe\xf2\xaf\x10\xba\rV\xff\xbc\x91+\x16\xbe_\xcc\xb5;\x06\xf6\xc0\xbe\xbfP\x08\xbd\xac\x87N;Q\x9fp\xbf<\xb5:;\xeeC\xdd:\x12\x08\x13\xbf\x7f\xf6l\xbf\xec\xea\x98\xbf\xf0h\xbf\xbf\xcd?\x92\xbe\x8b\tu\xbc1R\x12\xbd?\xb4\x80\xbf^O[;^|R\xbc\x07\xe32\xbe}\xdc)\xbd\x9fnY\xbf,\x14T\xbf\x96~$<\x03\xe1\xa9\xba  \x859\xdc\x01\xc3\xbe\x82\xfd\x97\xbf\xcdB\xd4\xb9\xdam\x05;\xaf\xd8\xa0;\'S\x8b\xba\xcd\x06*\xbf\xd2\xee\x9d\xbd\xa6\xe3\xd3;6"\xb9\xbaM\xe3\x84;\xb0\x7f.;O/y;\xd3\xf7\x95\xbe)\x1a\xb2:\xf2\xbb\xd99pM\xbc\xbe\\j\x9e;\xf4O\x10<x\x06\xac;\xd2\tf\xbf\x82\x88O;7\x02];\xa46m\xbe\x95\xa7\x9c?x\x18\x9d=.\x8e\xd1\xbbz\x0e3=\x81\xe1X?\xc7\n\xe2;\x8f?\xb5>z\x08\xce\xba\xc8~W:\xa7W\xf9>\x9a\x92\x07<\xda\x06M\xbb\xd9\xb7\xcc=\xfa^v=\xf8\xb6X\xbb\xe9\xe5\x96?\xa2+s\xb9\xde1_>\xd0"\xe3\xba\xe4\x11\xf5:\xdb\x03\'>\xcf\xbf\xa5>\xd9\x800>\xa4\x93\xd6=\xb2\x8e\xa5>\x03R\x0c\xbb\x8a\x1cn?\xc8\x80\xd3\xba<\xaa\xb1\xbb\xc7\xaf0=\x9b\xee\x82\xbaJ\x12V\xba\x9b\xa9\x84=\x1bg\xb7\xbb\x94N\xbd>d\x19\xb8>\'0\x81?\x07\xcb\xc3>\x19\xa4\xb6?\xf6r\x98=H)g\xbb\xe3\xcbg\xbau/\x1e?\xb0{\xbb>\xe0^\xb47\x95\xec\xf8:\xc8\x16V?n\xf76?[\xb6\xa2>=\xa3j?\x9eo\xce\xb9\x9bIe?E\xb0\xb0\xbb\xb3o.=\xe6]\x0f\xbc5k\xea=\x06`\xe8\xba\xfc\xb2)>\xf3(#\xbc\xc0Y\xcf\xbb|j!>ye\xaa?\x97\xa4\xbd?\x00\xea\xfd=S\xe4A>\x0b\xf8\x10>\x83\xad\xac\xbb\xccTY?{\xc9J?P$,\xbb\xfa\xb0\x13\xbc\xb7{\xcd\xbb\xfc\xc2\xb8\xb9c\x11R\xbbv\xdd\xa1>g|\x07>\xd1\xe6\xdb=\x90I\xc7>\x01\x1es?\td2?\xce\xe2\x18\xbb\x19]\x9f<8>\x9b>\xcc\xbe\xb2\xbb8\xb9=>?\xa8\xd2=\x1b?Q?\x84P\xca\xbb\x80:\xc1?\x1e{\x14<\xb8\xe0]\xbbLQ\x89>g\\\x9e\xbbG\xd6\xb7\xb9\x8cK\x87?\x04+\r?6\xd7\x97?T\x15\x02?\xac\x0c\x98>[\x08\x00\xbb\xf5\xe9\xa6>\x98\x83\xce>=\x00\xdb>2\x8f@>n\xcdI?#\xf9\xc9\xbbEo\xc7<\xcb.\t?\xf2\xa2U=\xe2\xf5\n?(\xc1\x1c\xbb\x8b\xd2V>\x9e\xd5z?}U\x07?\xa2B;=*\x14\r?\xdc\x85\xe9\xbb\x88t!?\xa7G\n?\x88\xcf\x9a=\x1a3\x0e?\xc5Y\xa0?Py\xdf\xba\xac\xbc=?\xff\xecZ>sWW>\x93\x12/\xbb\x95\xb5\xbe=\xa5\xe5\xff>\x04\xbd\x89?E\xb4/=\xb8\xfd\x8d>5O\x8c?S\xcf\x0f<\xefnl?\x81}(=^\xe2\xa0:n"k>\x94%\x1e\xbb\x83%\'=\xe2\xb84\xbb\xd7V"?\x08g$?g?\xb7\xbb\xb9W\x17?\xc9]M=\x08&\xf8=F\x18\xab?x\xc3\xdc=\xbae\x05?\xbc\x02\x8b>Z\xa1R\xbb\xcdH\x9d>\x8d\xb4R>\xe9\xf4\xd8>\x0c\xe6\x1e?\xe6G\x8f\xbaro\x7f?\x15\x8dZ>\xf2\xc5\x80\xbb\\\xdbF;\x06\xcb+\xbb\n\xdc\x8f\xbb0D\xa3\xbbI\xa0\xa4>+~ ?\xa0\x88\x05\xbc\xd3\xac\x9e>z\x97\x1e?\xb1\x88L\xba\x80,\x7f=\x03\xc2\x89\xbb\xc7\xbfe9<@\xee>H\x1d\xd3>N\x99\x8d>\xcc\x1b\xea\xbb\xaf\xf6\xc5\xbb\xeey\xbb?9B\x02>@\x04\x9a>\x0c\x8e\xdb=P\x8e\x1e\xbb\xb3\xeb`?\x86\xac\xbc?\xe6\x15\xae>u\x14\x00?\x92\x8eQ=\x1e\xbf\x99>\xb04\x90\xbb\xcex\x86?,\x192?\xbb3\xf6=.\xa3\x8a>T%\xb4?\n(\xc7>ozO=\xe8\xdb\xb1=\xa6\xe0\xe9=\xb7,\xa3='
-p174
-tp175
-bsV473451385363501056
-p176
-g2
-(g3
-(I0
-tp177
-g5
-tp178
-Rp179
-(I1
-(I400
-tp180
-g12
-I00
-S'\xee%+<\xb2-\xbe\xbd\xa0B\xae\xbf\xefns\xbf\xe7\t\x1e<\xb5\x10\xd1\xbek\xb9$\xbe\x85\x89a\xbfft\xe0\xbe=\xe5+<C\xde\x02\xbf_\xe6O\xbe\x98e\xdf\xbc\xb0\xe8+\xbf\x14\x9eh\xbf\xe4\xb29<\xdd\xa2\x13\xbf\xb2qQ\xbf\x12!\x84\xbf\x1c(\xdf\xbe\xe0d\xbc\xbe\xa3\xae\x18\xbdW\x88\x94\xbe\x7f\x8eg\xbe\xe6\xcb\xc5\xbc\xf1\xd4\x80\xbf\x1bp\x08<\xde^\xf0\xbe\r\x82\x19\xbfw!\x9f\xbd\xea\xd6-\xbe\xb1OW\xbe\xd1\x1d\x9f\xbe\x8a\x00\x8d\xbf:\x88\xad\xbe\x90Y]\xbeS\x9do;\xdc0h;\xc9\x96/<\xe4\x95M\xbf\xf9\xd8l\xbf66\x84\xbf\xcbl\x05\xbf{\xd5\x8a\xbe9*/\xbf#D\x9e\xbe\xe0y{<\xc8\xf45\xbf*xW\xbe\x93\xc1l<&\x89\x86\xbe\xa4\xa2f<~\xb8\xb4\xbe\x03H\x85\xbcbvz\xbf=\xc10\xbe\x06\xc2\xb5\xbc\x86o|\xbe\xb0\xe6\xc2\xbf\xa7~\xae\xbf\xa7\x103;\x8a\xe3\xc9;\xac\x11u;U\xd8\xa0\xbe+\xce\xe6\xbdB\xd8%\xbdv\xde\x11\xbf\xd2G\x0b<\xde\xc0\x81\xbe\xb0\x1a\x8c\xbeC\xee\xa1\xbf\xb4\xc6\x95\xbf\xd5\x94]\xbfx#.\xbeYz\xcf\xbe\xeb\xb6\xda\xbe\x05\xdf\xb6\xbe\xeeR\x9d;\x81\xe9\xd5;\xdc\xc8\xcb;\x7f\x11k\xbe\x07q5\xbe\x9e\xe4=<\x99\x98\xfc\xbe\x1f\'\xc1; K\xef\xbd,\x02\xd8;\x8fe\x08\xbf\x99\xa4\x84<\xfd\xcc\x15\xbf3-n\xbf\xfe|!;\xf5c\xa0\xbf\x94\x9f\x97\xbf~\x8a\x0e<\xc1\xca\x80\xbb\xa3\xe2\xe5;uJ\xf7;*\'\xf0\xbe\xcafZ\xbfoI0\xbe\xb2T\xeb;"\x8e\xb9;@\xdd!;_\xf3\xd8\xbe,J\x96\xbfkK\xfc\xbcb\xb3\xb1;1g#\xbfI\xa6\x07\xbe\x1c\xe5\xb0\xbfo\x9a\x9b\xbd\xa6n\xd9;\x7f\x19\xc3\xbc\xbbO[\xbe\xd8\x1c}\xbf\x97\x98m\xbfe\xc3\xce;\xc7}\xac\xbf@_\x849\x81=\x82<\xf4\x11*;K\xac\x07\xbe"\xba1\xbdNM\x1e\xbej\x14\xb5;i\\n\xbf\xb6\x950\xbe\x009,\xbf\x1ce\xf9\xbe\xf2M\x9b\xbc\r\x1a\xad:V\x89\x04\xbdx\x19T\xbePr \xbd\x8d\xaa7\xbe\xf4\x00n\xbf\xd6\xc8+\xbe\x8cN0\xbfh\xa8*\xbf\xb4\xe0\x82\xbe\xb2\x89\x13<\xa7\xc2\n\xbe\xf7S\x9f\xbfc\xbbL<\x17\xed.;\x98\xc0\x14\xbe\xef\xebA<+\xe0\xa0\xbe\xc0\xbeT\xbe)\x9c\xd4\xbe::\xf2\xbe\xd1\xb1\xd3;\x92\x87k\xbcb\xc7\xa5\xbe\xe0\xf2&<\xd7\xc2\xea\xbe\xc1\x9c\x0c;\x98\xf0\x15\xb9ND\xea\xbe\xb1Gn\xbf\xa5\xdav\xbf\x02\xaeS\xbf\x98J\x9b\xbf4\xc1\x04\xbdw(\xd0\xbe\x99_\xc7\xbf;\xda\x99\xbe\x90\xaf\xa5\xbb\xdb&\x15\xbe\xb7\x06\xd2\xbdT\x16\xa3\xbe\xe6\x81\xdf\xbe\x99\x13\x89<NU\xa8\xbe\x19\xd8\x83\xbd\x18\xf5G\xbf\xb0B\x9a\xbfp\xbbX\xbb!\xfa\xa2\xbdg\x93f<C\xde)\xbf\xc2\x95\x06\xbf\x0c\xe9\x13\xbfz\xc1e<yO\xa8\xbe\xc0\xf5p;\x17\xc9\xa5\xbbS\x05$<\xaez\xac\xbe\x87\xee\xd1;\x17\xa5|\xbc\xe5\xa7\x80;\x1f\xbe\xd5;\xab\xe6\x89<4\xb5s<\r\xb0\xa1\xbfi\x05\xfb\xbe\xd6\x00\x91\xbe\xf8\xc1\x86\xbe\xaf\xcd\xb0?\xb7\xd0!?\x11\xafR\xbc)%+=\xa0\xcb\x8f?t0{>\x96\xb7T?\xea4j\xbb%H\x00>\xb5,B?\x1e\xef\xe4<\xdc\x0c\x00?\xf1\x03-?\xdbl\xdc=j.5>P\xadm?\xf8\xf4\xcd\xba\x8by\xda\xbb\xb6_\x90\xbb\x12\x05\x16>\x9a\x8a\x92<w\xec\xf9>\x93\xc3\xbd>\xab-\x97>\x96\xa3\xf2>k\xa6\xe2\xba}\x97u?.;\xad=\xfc\x85\x05\xbc\xc0\xcb\xb5>\r\xd0\\>\xeaSK?WG\xdf=\xd6\xf61\xbc\x14\xd5r>L\x90\xef>\x1e\xf8\x88?O:C?\xd9\xc1\x97?\xbd\xaeB>\x06\xc7\xfc\xba\xb2\xc5{;\t\xfb\x16?\x8f\x90\xaf\xbb=\xfa\x96\xbbt\x922>\x9a\xa6Y?\x8b!\x15>\xc2\xe99=V\xe5\x9c?\x00\xee\x9e>\xa1\xce\x93?\xd5\xd9\x07>\xbfr\x18?\x9cx\x94\xbc\xd3\x85\x86>\xa0\xbb\'?:\x9a\x14?\x98!\xa2\xbc\x04+S\xbc\xfcE)?\xc1\xc2\x92?\x86J\xf9>:c\xc9=\xe1_I?\x04\xfc\xe7>\xfe\xee\xac\xb9\xa4\x8d\xbe?DK)>\xa1\x02\x11?\xaa\xe5t\xbcG\xe2@\xbc\n\xd2\x00?\x18FE?\xae\x87@\xbb4p\x0b>)Z\x04?YG\x11?\te\xa8>\xf5\xae\x81?\xf5\xad=?J(`>\xdaAN?\xa23\x1d\xbc\xcd\xf7\xe0>\xa4\xc6}>"}%?D\xc0=\xbc\xdczZ?C\xa1\xe8=W\x1b\xae\xbb\x95\xd4\x94?yG\x8f\xbb\xda4\x14>\xbe5\x7f?\x9a\x18(?\x18\xcb\x80?\xce\xcd\xa2?}\xb80>\x81\x1c\xa1\xbb\x14:\xcc>\xfc\x02P?\x1f\x96\xac>>\xd5\x0c?\x82\x96+?l\x7f\x06\xbc\xb0=\xce>\x1bE\x9d?\xdf\x0f\xb7=\xe5\xba\xec>gp\x0e\xbc\x8d\xa9\x89>\x7f;\x86?|\t\x1c?\xc68\xca>\xb1\xb2\xda<\x83\xe3*\xbc\xe4\xa8\x90?7W7>\xa6\xcb#?\x0f\xe7\x80?t&Z?\xaa\xc3(=r\xa6\x8e>.\xcf%?(\xc7-?\xa7vr\xbb\xdd\xce\xf0>\x96\x8c\xcb="$!>\xd6\x869?\xb2\xbe\xcf?\xf3\xfc\x91>\xce\x86\xf1>\xbc\xdb\x82?\xdf\x85\x98>\xc3\\\xfe=\xc7\xc0^>A\xbe\x02>\x8d/\xfd=\x11H\xc8=\x93\xbf\xf2>\xcd\xd4\x14?\xc2!)\xbcl9T?\x95\xe0\xd9>\x00qg>\xbf\xf7\xb9?\x8e\x93\x81\xbb\xaaf\xae=\xcf.T?2\x7f\x8f\xbbu\xa0V?:b\xe0>NYC\xbbK\x12\xa8?\xc5c\xdd\xbb\x05\xaa\x15?\xc1~P>G|_\xbc\x80\xc8`=\x03?\x19\xbc\xf9\x14\x85\xbc\x00\xf7-\xbc\x8c\x08\xbb>\x8d\xcf\x91=\xdc\x0eH\xbc,\xb2\xd4>o\x9c\xa2?\x13_\x1f?D\x01\x1d?\xd4\xac\xa9\xbb-Rn>\xc1B\x96?\x7f\xd1\x80>\xc9\xa6m>\x12HY\xbcs\xfdg\xbc\xd6\xa5\xc4?\xfe\xb2\x96>~gM?) \xcf>\xa7z\xcc\xbb\xe7\x00\xbc>\x15\xa5Y?\xe9\x17==\x95\x10\x94?\xa8\xf1\xd8>tD;?\\^ ?\x11Z\x1f?h?M?mX\xa6>j\xc3\x85?s\x9c\x91?iN\x86?\x9ci\x97=\xb4\x163>\x87\xbf\x14>"\xdd\xf8>'
-p181
-tp182
-bsV445232110345781248
-p183
-g2
-(g3
-(I0
-tp184
-g5
-tp185
-Rp186
-(I1
-(I400
-tp187
-g12
-I00
-S'\xe9oS=\x13\xbc\xc1\xbb\xc5\x03\x85\xbf\x1e\x9e\n\xbfO\x10\xeb<\r,\x98\xbek\x17z\xbd\xa4\xa9\x17\xbf.\xe0\x8a\xbd\\\x1c\x06=\x17X\xfc\xbdI\xb99\xbd\xd8\xf4_<\xb1\xbe\x8a\xbe\xb8\xd4\xb2\xbe\xdc\x01?=\xc0U\xc9\xbdUL\xf2\xbd]B\x13\xbf\x82\xfek\xbe\\\x08\x98\xbes\xef\xda\xbdq\xdd\x88<\x1bS_\xbf\xff\x96\\\xbc\x1f\xd1\xcf\xbeF\x0c\xd8<\xcbo<\xbf\xc6B\xf1\xbe\x99iM\xbb\xaf\x15\xdd\xbd\xe34\xe5\xbd&$\xc8\xbd(j=\xbf\xb5?\x80\xbe\xac\xf8H=\x1c\xd4\x8c<;\xfa\x80<\x1a\xeeG=S&~\xbe\x1b\xef\xe2\xbe\xc0\xd7\x0f\xbeD\xa3{<\xfaR\xb5\xbe\xa1\x11q\xbe\x08\xe93\xbc0*v=\x12\x9b\xbf\xbe\xc0\x933<I\xefu=_\x1f\x15\xbdCjn=\xe1\n\x16\xbf\x8b$\xd1\xbb9\xc8k\xbf\xd6s\xe2<\x044\xfb\xba\xd4\xd4\xed\xbdDN\x97\xbf\x9fV\x90\xbf\x1e\x05\xbc<,\x1b\xfd<stj<\x96\xcdp\xbe"\xee6\xbc\xc3\xd2\xdf<\xdb\xf1\xa1\xbe\xf7\xf2\xfa<PyR\xbf"\x99(\xbeT\x99\x8a\xbf\xcd+I\xbfN\x01\xe4\xbd]\xda\xee\xbd\xcdv\xf8\xbe\x8fh\xcd\xbd\x95B\xd0<K\xdd\xe9<\xfa\x0e\xb2\xbc\x80\x1b\xda<\xbc\xcf\x06\xbe\tjD\xbe\x88FV=\x939\xac\xbe\xed\x86\xc1<4\xa0f<\xabt\xeb<\x15\xaf?\xbf`\x84\x89=y:"\xbc\xd4"\x0e\xbf\x15\xca\xc7<}\xc6\x99\xbf)\xf3\x8e\xbd\xa7\x930=\x91\x8a\t\xbbB\xcf\x0e=Fw\x12="p\xd0<\x1b\xeb\xe3\xbe\xf1\xd0\xb2;\xa7<9=b\x95\xdc<\x95\x81\x8f<\x94\x96\x8b\xbdhs\x06\xbf\xea(\x9d\xbb\xea5\xb6<\xac\xb1\xe6\xbe\xba\xce\x11\xbc\x84x\x12\xbf\x971\x15\xbd\xf0`\xbe<\xc6\xb9\xdf<\xad\xd8\x14<\x08*\xe1\xbeX\xc08\xbf1\x8a\xf5<\xb6|\x13\xbe\x07\x02\x00\xbd-\xe2\x8c=r\x95\xc0<\x14\x8d\xa5\xbe\x1b\xc3\x9d\xbc\'4e\xbd\xc7\x90\x0f=\xe7m\xb7\xbeW\x9c\xb7\xb8\x12\xc9\x15\xbe(\x04\x0f\xbf\xaf\x9b\xb1;\xfc-\x9f<\xdck\xf6;\xac\x15D\xbd\xbf\x01U:@\xd3Z<\x03~\x95\xbdjt\xa1\xbb\xc9|W\xbe{O\x0e\xbe\x06\xa9B\xbe.u\x1c=+\xc1\x9d;\t\xb3{\xbf\xc5i\x12=\xd6\x06\x19\xbe_\xae\xa6<Y\xe1\x7f=\xc5\x08\xdb\xbe\x1c\x97t\xbd\x81>N\xbc1\xfdU\xbe\t\xda\x10=d\xa7\x12=\x8dP\x9d\xbc\xe2\xabq=\x1ew!\xbe\xc4<F<\x81\xb1F<\xee2\x9e\xbe\xb5\xe0d\xbes\x9d,\xbf\xdc3>\xbfk\xe32\xbf\x9d\xaa\xf7\xbb\xe7\xb6g\xbe\xbc\xe5\xa8\xbf\xc2\x146=\xf3\xbf\x94:\x149\xf5\xbd\xc6\'~\xbcw\xb6\x85\xbeC\x16\x14\xbe\x96\x80\x8f=\xf4;\xba;f\xa6k\xbc\xdc\x01\xc3\xbeM\x8dR\xbf\x93\xa1v;~)\xc5<\xa8#P=G\xc1\x00\xbe\x0fm\x05\xbf\xc4\xe6\t\xbfH\xd5\xa4<\xdf?\xdf\xbe\xccm\xc7<\xc84\xdb;\'<\x1d=EOq\xbe1\xb3\xc2<\xde\xc6\xcf;i\x8d\xa5<\x8a\x02\xe5<!\xea\x81=\x01!R=>gR\xbfUe\x0e\xbe\xa5i\xcf\xbe\x8a\x03\t\xb9\'\x80\x9c?x\x18\x9d=\xd7\xfbS\xbd\x00j\xff;\x07 :?Z\xec6\xbbt\x0ej>\x1c\x0f\xbb\xbc\xafY{=|: ?\xc2k\x01;<|\x07?\xc2{\x9c>\xfa^v=\xd2\xe6\xf7\xbb\xad\xcb\x19?!_\xaa\xbb\xebz\xb0="\xe0\x94\xbc\xf6\xe2\xe2\xbb\xd52\xfa\xbc\xc8\x1d]<#6\xaa>\xe5Zt\xbc\xad\x81B=\xf2V\x8c\xbcT\x9f@?7\x8d\xb7\xbc[\xeb%\xbdw\xd6\x9a>\xb1%$?\xec\x1fw\xbc\x9b\xa9\x84=)\xe4;\xbd\x84;\xd4=\xce\xa8\xc9>M\x1e\x12?\xdc\x88\xe8>\xae\x94Z?\xf6r\x98=\x06\xd0\x8e\xbc\xcb\x03.\xbcVd\x12?\x08\xfa\xff\xbc\xd0\xa7\xc1\xbc&\xd1\x83=\x145\x94?\xd7\'\xa7=\xf3\t\xc6=\x9d\xbc\xa7?\xbfu\x07>r\xa4\x8d?\x93\xd1\xa7\xbc\xe8^\xc7>\xdc^k\xbd\xd7j\x19?\x12\xec\x08?\xb1\x86\x80\xbc\xc6\x99\x96\xbd;\xd8c\xbd:\x1eE?\xd6^\xb4>\xaad\xf6=\xcc\x9a\xf5\xbc\xe6e\x96>\xc9b\xf2>\x17\x06\x0f\xbd\x1a\x95a?\xcfw\xcd\xbc\xe5(\x0b>\x19\x15\x96\xbd\xeb\x8eB\xbd\xde:\xb3>\xf0cZ\xbc\xb9:\xc8\xbcg|\x07>20\xa3>)Y\xc9>8\xb7T>#\xab\xe3>_\xd3\x04\xbc\x19]\x9f<E\x97\x1c?\xd5"&\xbd\x8c2\xea>?\xa8\xd2=fH\x82?/\x1a9\xbd\xbd&s?\xfb\xc3\xfb=_ \xf6\xbc\xaf\xd5\x18?M\xed\t\xbd,5\xaa>\xd8\xa9~?\x84\xddm>\xb2E\xa3>\xda-q?Se\x9e>Ax\x99\xbc\xdd\xb1u=\xd9\x80)?Y\xc0\x15>\x99\x13u>|\xa2\x05?`%\x16\xbd8e\xd8>\xce#\x00?Z\xe3"=\x81>(<\xec\xf8\xfb\xbc\x8b\xd2V>\x10\xa4\xeb>?\xe5\x8d>\x1a\x17|>-\xe5\x89<\x893O\xbd\xdfnA?]QM=\x88\xcf\x9a=b\xfa~?V\x98\x83>\x7f\xeb\xce\xbb\x05\xd4\x9d>\x0c\xf7\xc9>-\x884?\\V\x8f\xbcCn\x86>\xa5\x9a\x87=\xdbr\x10>y\xf7\r?\xc6\xb9\x18?\xa0+e>8\n\xb7;A-@?{\xaa\xb9>\xeffA\xbc^\x01r>\x88\\=\xbc\xe1\x8e\x93<R\x94\xbc\xbc\xfbL\xa2>\xd3kJ>TY;\xbdP\xd7\x01?\xc9]M=\xd4\x06\xc1>\xc3\x9c\xdc>\xe04\xca\xbc\\^;=})\xdd=\xcb\x12\xae\xbc\xa1\xa2\x8e>\x8d\xb4R>\xad\xc9\xff=:dd?\r\xd6\x9b\xbc2\xee\r>\xb5\xa4\xf5=\x13\xb2#\xbd\t\xa0[:\x96C\x0f\xbd\x11\xedo\xbd-\n\x07\xbd+\xc6\x05>\xf6\xc7R\xbc\xd6\x9ce\xbd\xa2\xe9\xb1>)\x88J>\x97\r\xc8>\xa7u\x02?\x1d\x1bU>\xa4\xc9\x1f\xbc\x84\x9d\xb5?\x84\xdc\xb9>\x19/\xa2=\xea\x90f\xbd\xe5\xefc\xbd\x8c\xf6\xd5>\xb2\xd8d>\x0cj\x02?@s\xa2<\xe8k\xc6\xbc\xb1\x9cg\xbc7\x02\xc1>\xfa\xfe0<&$%?\x86\xd2n>\x1e\xbf\x99> \x8f\x89=1\xb9\xb0>\x04\x0b\x1f?E\x004?.\xa3\x8a>\x8d.^?\x86K ?C;\xf9;)\xbf\x8d=4\xb4\x91=\xaf&w?'
-p188
-tp189
-bsV459199896323510272
-p190
-g2
-(g3
-(I0
-tp191
-g5
-tp192
-Rp193
-(I1
-(I400
-tp194
-g12
-I00
-S'\xaek\\\xbaX\xb4\x9a\xbei\x81\x0b\xbf>\x8e\x16;d9\xa0<\xc4\xdb\x05:D\x8c\x14\xbf\x0b,I\xbe\x02H\xec\xbd\xf2\x03\xa3<\x12^\xff9\xec\xb7>\xbf\xda\x8c\x04<\xfb\xf4t;\xf32\r\xbe\xa7\x81\xee<\xc3\xf2\xab\xbdw\xa7\xe5\xbe\xdf\xce\xc6\xbcR\xcc+\xbc\xe2Nb\xbf\xca.\x82\xbd\\\x02\x11<M\x00R\xbe$E\x9e\xbe\x85\xe7)\xbd\x97Rd<t\x94\x87\xbe\x9b\t\x82\xbf\x0c\xfc\x9e\xbd\x0c\xad\x11\xbf\xb2\x82\x99\xbe\x9e\xda\xe6;\x029\x08\xbf\\\x10\xa8;!<\xc5<\xfb\r\xaa\xbe\x97\xb0\xb9\xbd(\x05\xcd<+\x05\x11<2W\\\xbc\xfd\x18c\xbc[\x9dr<\xd9\xc4<\xbf-\x88i\xbej\x1d\xb1\xbd\xd7{\xf8<\xb4\xc6\xd2;\xa2jP;\xea\x90\x0f=\xd3/\x18\xbc*\x88\n=Q_\xae\xbePC\xe5\xbe\xfa\x1b\x81\xbf\x11Kz<\xd2n\xc6\xbeu`\x89\xbe5\x04W\xbf\x174+\xbfUYz<V\xd0\x8a<3\x19\\\xbe\xba\xecx\xbf\x83\xf3\xef\xbe\xd2\\R<\xd7:%\xbf\x11\x9f\x07\xbe\x89\x06\x1d\xbf\xeb\xbb\x0f\xbf\x168d\xbfe\xaaA\xbf\xc5?=\xbc\x1c\xed\xc8\xbe\xa5;\xfc\xbe\xc8\xf88<\xd7\xbbT<`c}<J\x0cQ<7Gu<\xf3\x1fW\xbe\xb9l\x9a\xbb\xe9\xab\xe5<\xb4L\x0c\xbf\xc0qH<\xf6\xfa\x1d<\xa4\rt:\xe7\xf6Z\xbfFi\x14=\x99\x1c\x10;/C\x00\xbeGb(< \xb0\x00\xbd\x95\x0b\x10\xbc\xd9\xbd\xae<\x8c\xf0\xe7\xbe\x17\xab\x81<\xb2\xcb\x97<\xda8\x88<\x94j\x89\xbc\'\x0c\xb2\xbcA\xec\xa7<\x8f\xbe4<ji(<_U)=(\xe8\x1e\xbf?\x87Y\xbez\x06\xdb\xbdw\xe3\xfe;\x94|)\xbej\\\x06\xbd<\xd7}<\r\x07R<\xd9Ec<.]\xa8\xba\xed}\x89;\x82}!\xbfY\x82\x96<\x82\xb6>;[\\);j\xae\x1e="\xef~\xbe\xb1\x80\x7f\xbb\xcdw*\xbf\xc1Y%\xbf\xd5&\x80<\xaf\xab\xab\xbdT\r\xe4\xbe\x0fFw;<2\'<\xec9\xd5\xbe2e\x93\xbe\x02\xc5E\xbdH\x89\xa99b;\x12\xbf\xca\x7f\xc2;\x81Q\xcf\xbc\xc1my\xbe\x07]\'\xbc\xb85\xb6;\xea\x10$\xbf\x07\x84\xc2<\xae\x19\x1e\xbe\xe4%\xb7\xbe\xf4\x01\xcd<\x86&\x1f;/\xc3J< \xb0\x00=\xaa;\xf6\xbe\x18j2\xbe\xb0>\r\xbf\xdd\xe3\x13\xbf\xc2\x0b\xb8<a+\xa8<\xcf\xf3\x89\xbea\xc2\xde<\x92\xe5v\xbe\x8c\x99\x03<\xa67\xa1\xbb:\xc4i\xbf\x02/\x83:\xaf\x11\xe8\xbe\x1eh@\xbf\xf7\xb7\xbb\xbe\xb9\xd8\xd4\xbe\xf7j\xc9\xbe\xb5\x05>\xbf\xc0<\xcb<\xfc\x0f\x16\xbf\x92\x95"\xbf\xf5\x02\xa3\xbe\xd7\xb9]\xbfe\x94z\xbd*H#=\xbd7g\xbd}\xb1X\xbd`\x90\x9a\xbf\x8f&\x08\xbf\r\x88j\xbf\x1b{7<\xcfq\xde<\x0c4\xa5;\xad\xb8\x14\xbf\xf9+\xe9\xbelR\xd1<\x11\x16\x08\xbb\xf30y\xbd\xdf\xc9\x8a;z_\xc2<\x94\x8aP\xbf$2y<\x88I(\xbf\r\xf5\x14<7,\xa1<\x9c\xb7\x0f=[\xd8\xfa<\xc9n\x1c<IF\xd6;\x98\xfd\x1c<l@s;]\xf2K=C\xc8\xa29X\xcd\xe1\xbc\x0e\xf0\xe7>\xd4v\x14>E\x01\x86>U\x94\xac\xbb)=\x8d\xbc\x90Qf\xbb\x1dG\x1a?1\xaf\x10>\xc7>\x94\xbb\xbf\x18\xac>C\nM>\xfe\x8b\xab\xbbu\x87\x17?H+\xb6\xbb\x12\x9b\r\xbc?h\xa6=\x01\'2>[\xef\x95\xbc\xe05i;O\x86\x19>\x1cP\xeb\xbb/\xcb\x14\xba\x06\xf2\xd0\xbb\xb9#\xb8=P\xac0\xbc\xc3\xce\xb4\xbc\xb7\xd5\xa2;\xa3\xfd6\xbc\x95\x0f\xbd\xbbe}\x0c?7x\xca\xbc[\x98\x10>\xb7\xb3z?\xb9\xdf\xad<\xa2\x8a\xaa<e\xfa\xc2>\x00\x02K?47\\>Y\x9c\xc5>\xd9\xed\x98>X@\x84\xbc\x1f\x11J\xbc=\x1a\xd9\xbaRd7?ll\xe4>-rS>\x0c\xa3\x1e?\xe8\xe8\xc09\x92\x19A?\xba\x94Z\xbc\xcd\x8f5;"\xc8\x1b\xbd#\x03+?X\xcfG\xbb\x16\xcc\xb0\xbbU&0\xbdi\xb4\x08\xbd%\xe7\x10?\xe1\xf8\x9e=\x91\xf5?<3\xda\x9c\xbc\xb5l,\xba}4\x1d?\x17\xf8\x9a\xbc\xcf\xd8\x02=\x13\xd8/\xbc\x1f7Q\xbc\xdf\xfb\x1c\xbd\xbc\xcb\xdb\xbc\xd6\x01\xa3\xbar\xc9\x10\xbcq\xa4<\xbcr\x1cR?\xd3\x03Z?\x9a\xd3\xa3>\xd6\xe0\xc5>\xa0\xcb\x96>l\x0c\n\xbb\xa0nw;6\x10\x90?\xe9 \x97\xbc,>\xa4>\xc9\x89\xd1>\x98\xf6\x16=\xaeO\xd2\xbc\x84NP?\x99\x9e\x01?\xeb\nI\xbce\xfa\xd9=\xe1\xd7K>}\x9dI>\x8c_\x92>\xe5U\x8b9\xa8\xb43>[\xf1h>\xb4d\n?\xfd&\xc2>!A\xe0;[\x07\x14?\x9dN\xcf>8\x08\x93>\x85G\xcf?\xdci\xb1\xbc)\xe9\x16;\x98\xe0\x89<\xc5<H?\x1f\x8b\xa38\xa5[$><AR?%!\xfc=\x0fQ\xee>!\xdfA=\xfe\xb1\xe6>\xcbP\xcd\xbc\xed\xca\xd3>?\xe8B>5\xe5l>\xa3H\x97?F\x1b\x8c<%\xb7\x15=\xd6\x01?\xbbLD\x95\xbb\xec\xad\xf8>V\x81\x01\xbc\xa5~\x0e;\xbd\x18#>\x9b\xd22??\xb2\xee\xb9\x8e\xf2[<N\x89\x1e<\xb4\r\x07>de\xc4;C\x00\x83>\x11\xcd\xae\xbb\x9e\xfb\xfa9}\xe9\x99>r\xef<?\xb6 \x85\xbc\xb5\x83P?K\xf9\x08<\xa7$\xc9\xbc\xc3\xd2\x1f?\x89\xc8\x13>\x9c\xec<?\xafEO?\xfc%L\xbc\x03O\xad;&\x13\x9d\xbb\x08\'V\xbc\xd5\x03d?\x10\xfb\x91?\x7f\x80\xb6\xba\x0bp\x10?\xe061\xbc\x98\xa6\r>\xd2\x9f\x19<\x16\xd9\xd2\xbc8HC?N"\x95\xbc\xab\x93\x01\xbd\x8d\x1a\x85\xbc\xd3r\xc3\xba\xb7\xc9\xbe\xbb\x9ct\x02\xbdr\x81_?\x82\tE\xbb\xefw-\xbcx]\x11:T\x16\xba\xbc\x11|^\xbb\x16Vu?GN\xdd;\x82\xe0\x06<v^\xf9\xbc\x89\xab\xed\xbc\xd0\x9e\xe5;n\x83S>\xfe/T?\xf5R\xbc>LG\x96\xbcN\xec\xa9\xbb\x94)e?\x88\x0b\xdd=\xc1\xf4\xad<P\x00\xeb=\xc8\x17w?\xa4\n\x81\xbcj\xa7\x93>\xcc\xab%;\x07\x03\xdf>\x12M\x01?z\x114?\xc9B\x83?|\xc9\x9b?C\xe1\xba>\xd0V.? 0\x08='
-p195
-tp196
-bsV474156553126178816
-p197
-g2
-(g3
-(I0
-tp198
-g5
-tp199
-Rp200
-(I1
-(I400
-tp201
-g12
-I00
-S'\x9f\xfe\x18<\xee\x93\xaa\xbd\xf2\x0cs\xbfz\x80\xae\xbe\x1d\x14\xbd;\xf0\xd7>\xbe\x16\xf25\xbe\xcfY\xc6\xbe8\xf25\xbe\xe7)\xcf;\xab\xfa&\xbdP\xf2\x89\xbe\x95\xf7\xb8;\x90\xa8\xe0\xbco\xed\x8b\xbe\xcarV;bD{\xbexF\x9f\xbe\x067\xf1\xbe\x94S\xdb\xbd\xcf\x07\xe5\xbe\xde\xdd6\xbc\xaa\x9e_:\x12E\xf3\xbe\xaf\r\xde\xbc\x8e\x8c\xeb\xbeZ\x17\xf8;X\x908\xbf"\xf3-\xbf\xc2\x9bz\xbd\x19\x1c \xbe\x99\x17+\xbe\xa3\x99J;V\x9d(\xbfq\xd1=\xbd\xbc\xd1\xa9;\xb1\x03\xc7\xbc\xaa\x9aZ;\xd2`*<\xdd\xaa\x0e\xbe\x11\xfb<\xbe\xc0\xd7\x0f\xbeF\\(<\xdc\x8d\x10\xbf\x1bW?\xbe\xe0\x88p\xbd\x0b\xbd\x03<\x10\x1c!\xbeKq\xa3\xbd+\xdc<<G\x08\x0e\xbem\xc3i<\xd6\xcc\x07\xbf\x9dM\xb0\xba\x16\xbe\x83\xbf\xdfu\x08<\xac\xfc|\xbd\x8d\xad\x9e\xbe\x1eo\xb6\xbf*\x9f\x86\xbf\xed\xa0B<\xa0\\G\xbd\x8d\xc6k\xbd\xf1\xa8\xe5\xbe/HC\xbe5\xec\xfb;\x12B\x15\xbf\xec1B;\x9bw\xcb\xbe\xbc\t\x83\xbeh\xab\x8c\xbfmv\x00\xbfN\x01\xe4\xbd\xec\xd8a\xbej\x1e\xa3\xbeB\x11\xa1\xbd\xe7\x03!<g\x87\x19:\t\x97\x13;\xf9\x0b`;U\x7f\xb4\xbe\x15\x8d{\xbeU\x11\x05<\x8d\xb6\xfd\xbeH\xa2\xda;\xd8\xdf\xdf;N^\x1a<\xf4&\x0c\xbf\xa6\x001<y:"\xbc\x1b5\n\xbf\x92`+:\xc8\x0e{\xbf)\xf3\x8e\xbd\xa8\x0e\xe5;\xc6\xcb\x1b\xba\x05\xcc\xd9:7\x94\n<\x94\x0f\xae;Vp\xcf\xbe\xe9i`\xbcc\x14\x17<\x18\x94\x85;\xdd\x7fR;\xa5&g<:\x92\x95\xbeH\xeb\xfc\xbb\x85\x13\xa8\xbc\x9at_\xbe\xeau\xaa\xbd\xc5\xe2\xf3\xbe1\xf7\x16\xbd\x11\x85#;4.\x88;X\xe8Z\xbe_\xc50\xbe\xd1"\x0e\xbf\x9f5\xfa;\xe0g\x8a\xbdf\xacU\xbb\x15\xcd\x85<*g\xb8\xbc\x8b\x00$\xbd\x8d\xc7\xa0\xbc~\x80\x0e\xbeRB\x01<\xa4\x1c\xaf\xbe\xe2\xb73\xbdA\xc8\x8a\xbc}\x84n\xbd\xd0\xb5\xc5:~F\x11\xbb\xb7\x8fv\xbd\'\x9c\t\xbd\xc1\xfd\x06\xba\xdaC!;v\xb2\x06\xbe\xf3\x8cK\xbe\x99\xb4\x07\xbeh \xe9\xbdk\xd6\xae\xbez\x0f\xc3; Z\x90\xbd\xd1}\r\xbfD{\x10<\xc4\x9a\x00\xbe\x10\xae7<\xd6\x9b\xa0;\x03\xc6\xd4\xbe\xb4\x9dD\xbe<$q\xbeC\xe6\xef\xbeJ\xb5\x07<\x82\xee\x17<n*\xdb\xbd@\xc8+<\xde`\x83\xbe\x18\xcf.:\xb8\xa1\x10\xbcTo&\xbf\xa8K\xd7\xbd\xbc\x13\xfc\xbe\xe0H+\xbf>f\xbe\xbe\xa6?=\xbd\xb3\x94\xa6\xbe\xe3\xcaY\xbf\xda\xbd\x17<\xc8\xa1t\xbd\x7f\xa4\x99\xbe\xcbn\x0c\xbe\xeb=\xb2\xber\xdc2\xbex\x9e\x8a<`O\x1b\xbc\xbf\x07\xc3\xbd\xa9\x8cW\xbf\x12e{\xbfP\xff~\xbd\x80\xd4\xf39(4\xd7;\xb1\x1e-;ny\x00\xbf\xca\xc0\x9e\xbe\x01m%;\xa1Y\xd8\xbd\nm\xfe:\xd4\x8fs:\xde\\\x0e<y\x9e\xdc\xbe:\xb9C;\xc8\xd0\x9b\xbd\xea\x8a\xd0;\xa2\x05\x84;\t\xfe1<\x14x=<0\x12\x85\xbe\xcd1M\xbc\xf7\xf3\xb3\xbd\xe1\xe7(<\x0b\xbf\x87?\xc3\x1fe>\xdd!q\xbc=k\xcd<?\xcaD?\xf8\xb0}>\xb4\xbb\xd8=\xdc\x12\x86\xba\xc4\x90~\xba\xbf\x9f\x1e?\xe2\xc4;>W\xc5\xaa>\xce\x8e\x00?\x8d\x035>\xc78k\xbb[">?`h\xbc<x\x0f\xca<\xa5D\xfc\xba\xc6\x16.=\xf8\x16H\xbc\x12\x07Q>\x11\x13\x9b>\x1aa\xd4=\xcd\x1dH>99\x98\xbba\x12\xdb>w\xe1\x08\xbcm\xd0(\xbct\xa6\xa9>\xb3\x893>/\xa6z<,\xcej>Ms\x08\xbc\xc8\x81\x83>\xde\x91\xde>\xcf%\xd2>\xddu\xe6>\xa5\n6?\x9b*P>\xf1\xac\x95<\xf5\xb1\xa6=~[\x1b?\x01\x9d\x0e\xbcZ\x0eM={_\xb8=Mh\x84?\xb89\x02>O\xdc\x91=\x86\x9f\x85?]Dv=8O\x8d?2;\xa8\xbb\x14\t\x9e>\x8e\x0eB\xbc|\xb7\xcf>r\xc3\x88=\xe6\xd1p=\xe1\xa2E\xbc\xb7\xf6N\xbc\xb3\xec0?\x9e\x98\x0c?jT*>\x82-\x02\xbc\x0c\xb0\xcd=\x9fS\xb2>\x0bw\xab\xbb\xfe!??\t\x80K\xbc\xed\x84\xc4;VBe\xbcS\x1f1\xbc@7\x13>\xdc\xac\xd2\xba\x91\xae\xf3\xbb*z\x7f>\xd65)>\x85e\xb8>\x96\xfaz>\xe7\xdc\xdd>J\xd7\xd1\xbb\x19]\x9f<w\xe7E?\xae\xde\xe0\xbb\\\x87\xf7>ee\xb1>\x06Q\x88?\x97\xfa3\xbcea\x91?ql&>;\x0c1\xba\x92%\xa7>$H%\xbc\'\xa5\xbf=*\x82g?\rf9>l\xca\x95>\xbf\xf2@?\xd0\x9c\x84>\xa1f\x03<\x8d\x13R>\xe0\x1e\x1e?\xc1\x1e\xb0>\xf4\x12\x82>\x96\xb5i?\xa0\xc1\xf7\xbb\xfc\x90\xa3>\x90\x8d\x92>\xb0\xec\xa8=\xfaJ\xf2<Y\xf9h=0=\xdd>\xf1h\xcd>\x84\x9a\x9d>\xa2B;=-\xe5\x89<\x14\n\t\xbc\xedT-?\x95\n\x99>;\xf5\xa0>tU\x84?\xcf\xfe\x8e>\t\x8e\x82\xbb\xa7z{>j\xd0w>\x9c\x17\xf1>\xd3j\x19\xbbV\xeaz>\x01m\x06>7HD>r\x7f\xbe>b\xd35>k\xe7\n>\x9c\x98==\xa8\xd5\t?a\xab?>\xb0)\x12<\xc62\xa5=\t$\xd7=1C">\xf8\x05\xb5\xbb\xe4\n\x0e?\x892;>v\xb6\xf3\xbb\'\x7f8?\xc8\x9f\xb7>I-\xaf>\xd3w\x16?\x03\x8d\x9c\xbb\\^;=\x8f,\xe5<\xf0&\n\xbc\xaa\xe8\x0c?C=\xc8>\xe8`B>qXW?6\xa77\xbb\xf0\x9e\x80>\xaf\xb1\x06>\xb0f\xe8\xbb\xdc!\x1f>\x8a|\x14\xbcr\x95\x03\xbc\xdc\x03\x9c\xbb\x84u\xbf=\x87\x16\xc2\xbbZ\x83L\xbc\xb1\xa9\x1b?l2y=\xf7\xe9\xc7=\xe9\\ >\x99\xdc\xeb\xbaS\xe0h=\xbf\xca\xa7?>\x02\x90>\x19/\xa2=$\xbb\x1e\xbcj\xae\x11\xbc\xae[\xc6>?R\xa5>\xac\t+?_\x01a= \x16\x13\xbcH\rL=\x129\x00?\xfd\x007=3\x9e\xe9>cu\xd7=\xff\x00\x10?,\x11\x94=l\xc6\xfb>\x87\x83\x95>\xadM\x89>\xc6\xa8\x06?\xea\xf2\x84?\x19\x97@?\xae\xc2\xaf=\x9e\xad]>\xcdwZ>x?=?'
-p202
-tp203
-bsV445258528987807744
-p204
-g2
-(g3
-(I0
-tp205
-g5
-tp206
-Rp207
-(I1
-(I400
-tp208
-g12
-I00
-S'\xa1\xdd\xf0;0a\t\xbc\xc7L\xa5\xbf\xc3\'-\xbf\xf1\xe5\xbd;\x8a\xa2\x18\xbfk\x17z\xbd\xa8\xe4\x8e\xbf\x96\xe1\x11\xbf\xf3\xcfu\xbd\xd7\x80\x86\xbe2=\xf2\xbdE\x05\x96\xbd%\xc4\xa8\xbe\x9f7\x07\xbf\x15\xc4\xbb;\\\x0c\x90\xbe\x9b\xd7\x9f\xbe\xdc\xd3\x9f\xbf \x00\x10\xbfB:4\xbe\x10#\x11\xbby\xba\x98\xbb.\xa5\xdd\xbe\n(\x9f\xbd\x92>\xde\xbeX\n8;\xb0\xc9?\xbf\xce\xc8\x8f\xbe\x93\x8b\x85\xbe\xbf\r\x14\xbf@\x189\xbe\x1cw\x94\xbe+\x13\x91\xbf\x10\x11\x8f\xbaD=\xb5;K*\xf3:\xb2\xc1\x85;\xcd\x83\x10<\x85\xe3\x1c\xbfd\x10U\xbfcf\x9b\xbf\xfe\x9d\xe9;\xebsj\xbe\xa3\\\xfa\xbeZbc\xbe[\xed\xc1;b\xcc\xd1\xbeg\x8d<\xbe-W\x1e<\xd6Vd\xbecu\xfa;\x0f \xad\xbe\x04 \xfd\xbb |\x8d\xbf>\xb9\x90\xbe\x9e\'\x08\xbd\xd2\x93\xa4\xbeq8\xbd\xbf\xbf:\xba\xbf\xc6AK\xbe\x7f\x89*\xbaH3\xee\xbaW\x98\x90\xbe\x95wB\xbc\x81\xec\x85\xba\xc4\x83\x01\xbf\xca\x9f\x03;\x9a\xc4\x91\xbd/\xc6F\xbeM\x15\xaa\xbf(Q\x16\xbfS\xaf\xd6\xbe\xf2|\xcd\xbd\x87\xac\xf8\xbd\x1fK\xfd\xbe\xdd\x99\xb2\xbe\x1d\x97\x88;\xf0Bs;\xa4I\xc2;\n\xd4\xb6\xbc.67\xbeX/\xae;m\xcf\x06\xbf\x99\xce\x02;\xa4(q\xbexW\xd7;\xfb\n\xcc\xbe}a6<q\xc2\xef\xbe\xf9\xf4\x9b\xbfw\x19=;~\x1a\xa8\xbf\x04\xc9\x10\xbfYx\xa1;H\x9c:\xbd\x04p~:\xe3\x97\xbd;\xf7\xe3{\xbe\x16\x8f\x98\xbf\xc4\xf4\xda\xbc|\xca\xc7;\xfc\xd2\xa3\xb9\x0f<C;\x9bp\x02<\x9f\x8e%\xbf\xa2u.\xbbiK\x03:\xf1\xb9\x17\xbf\xf5\xc4:\xbak\xe8\x9d\xbf\x81\xf9\x84\xbe\xca\x19\xc5;\xb4r\x1f\xbd\r\xe9\xa2\xbe\xe1\xdeR\xbe\xbenb\xbf\x08\xbd\x0e<_>|\xbe\xea\xf3\x8d\xber\xe1E<X\x89\xa3:=\xa01\xbdhu\xb0\xbcG\xaf\x84\xbd\xa4\xbbW;\xde\x85\x95\xbf\xf7\x8168\x7f43\xbb\x05d`\xbe\xcaK6\xbd\xa5\xc1\xc7:J\xf7.:\xc1\xd8L\xbeV\t\x03\xbd\xfc\xf6\x07\xbfDl\xc3\xbef\xde\x92\xbd\xd4\xf9\x80\xbf\x8690\xbf\xf9\x89G\xbe/:\xec;\xb2\xd2\xd99\xb7Ct\xbf\xa7\xaf\x88;\x99Wh\xbe\xee\xe7\xcc\xbe\x8e\xd9q;f\\\xb2\xbe|2\xe3\xb9S\xc0T\xbd\x91+\x16\xbe\xe3_\xba\xbb\xce\xc2*\xbf\x02\x06\x96\xbd\x06\\\x01<\xa4\x9f\xdf\xbe\x86$\xc7:\xa0:\xd7:\xdb\x88\t\xbf\xf5\xb4^\xbf\x192P\xbf\xa4\x93K\xbf\xbe\x0b+\xbf\x06s\x16\xbb\x1d-&\xbd\xac\xbcQ\xbf\xbcGi;\xe3\x805\xbb\x149\xf5\xbdRLu\xbdw\xb6\x85\xbe\x06U\xd4\xbe\xbb\xc5,<\xf4\r\xb9\xbaB\x80\xf8\xbaC\x1f\xd3\xbe$jo\xbf\xa5\x80\xa4::?\'\xbaac\x83;\x03\x96U\xbeq\xa4\x9a\xbe\xd2\xee\x9d\xbdz\xbe%;#\xdb\x8b\xbe\xd5h\x8a;5\xb4\x9d\xb8\xb0\x88\x00\xbdEOq\xbel\xf03;\xd3\xe0\x9a\xbbt}}\xbe\x11\x9a\x99;\xc3\x05\x16<8\rC;mE\x98\xbf\xabI\xf7\xbd@/\xcd\xbe\xfd\x13\x01\xbe\xbb\x9a\xcd?0D\x0c?(e\x0f\xbc\x00j\xff;\x0bS\xb3?\x92\x9fq=;R\xfc>\r\xed\xd6\xbb\x90\xb9#=Z\x01\x11?\xf6\xf0\x19>\xe0m^?eU\x87>k\xfe\xfb>\xb74\xdc<+\x89\xba?\xec\xe7\xb4:\xd2\xeaV>y8\xc2\xbaW\x85Q\xb9\x94\x03\x8c=\x9b\xf7\xfe=gUX?\xda\xc0\xb8=\xe9$%>\x88\x0c\xf8\xba\xe6\xe4"?\x9f\xb3\xad\xbb\xc2vE>e\xa7\x00?xc\x81>\x83\x8a*>\x9b\xa9\x84=\xf3\x9c\x86\xbb\xf6\x98\xa8>3\x0c\xc3>\xd7\xc1\xb7?\xc6\xb2X?\xc7*e?\xf6r\x98=)\x9dU\xbb&B\xdb:N\tT?k\x13\xf9=L\xbc(\xbb\xaf\x1d\xa2<\xc7Ud?\xee\xe0\xf4=\x9e\xf0\x10>7\xac\x93?+\n\xb7>\x89\xddU?\xa2>z=\xe7}k?\xc0\x02-\xbc\x94z\x05>6=\xd1>U\xd4\x07=V\xbb \xbc\xc5(\x13\xbc|j!>-`\xa2?\xf0\x1a\x1f?\xa4\x8a!>,z\xe6>\x0b\xf8\x10>\xfd=\x04<D\xb7\xb0?\xcc\xfb\x82>\xb1n\x00\xba\xcdzN\xbc\xba\xa8\x9b\xbbM(";,\xad\xb4>\x1fx\x89<\xce\x01\xad>\x98.\xb6>\xbdC\xf5>\xf3\x8e\xb7>\x9e\x97R?\x90\xf8,>\x8b@\x9c>\x17\x98\xbf>\xe6\xdc\x89\xbb\x96\x9c8?~v\x96>\x02\xbf\x86?\x9f\xf5\xd7\xbb\r\xb9\xe8?\x9e\x0c\xbf:\xdd\xf3\xf1\xbah\x13=?n\xab\xfc\xbb\x90\xf1n\xba\xe8l\xac?\x8a\xe9,?\xda\xd1\xa4?\x1a\x80\x96?\x13\x86\n?\x90\xc4\xaa\xbaY\xf76?\x1dC\n?FAH>\xa1\xb9\x05?\xdb\xebF?\x9c\xc4z\xbb\xf3\xcb\xd8>@\x9a_?c|\'=\x1cF\x18?\x98\x81\x84\xb9\x88\x8c\x11?\x99Gh?\xd4>\x8f>\xdd\x10/>.T\xf6=\xb6\xddw\xbb\xbf\xcab?U\xfb\xb0=EW\x08?\x16\x8f\x99?|\xbbl?\x1a\x98\x84>\'\xb6\n?\xed\xcd%?o\xba1?~L-\xbb\xc2\x95\x7f?\xa5\x9a\x87=\xdbr\x10>e\xdc\x1b?\x86\xbce?\x08\x17H?G\xb1e>c\tn?\x1d/\xa5>\xcb\x1dx:\x82\xb4\xd7>\xb8F\xc1=\xe1\x8e\x93<a\xb4\xca\xba\xcd\x07%?\xce\x1f\x12?N\xb2\xf7\xbba?p?\x10R\x96>\x08&\xf8=\xa2d\x80?\xb0\x07&\xba\xdb_\xe7>\x10\xd5>?^\x9en=G\xbe\xf5>\x8d\xb4R>\xd9M\xaa>\x89\xa0T?P\xeb\xd7\xba\xe8\xd5\x17?U\xa9\xb6>\x08`\x0b\xbb\xb7\xf6\x83;\x83\x83C;i)\xd0\xbbd\xe7\x8c\xbaf9\x03?<\x83\xc1>\xdcM\xe7\xbb\xf6\xb2\xe4>\x15\xd0\x15?\x94\xe6\xb7=C\x10\xa1>6\xab\xb1<3\xd5(>w\xff\x86?]\x1d\xa2>\xe2\xd2\xbc>2f\x9d\xbb\xc4\x12\xc3\xbbi1\xf2??c$?#-\x80?\xb8\'P>G\x19{\xba\xdf0\n?\xf3?j?\xfd\x18\xac<\x07b\x97?\x15}\xaa>\x1e\xbf\x99>\xd9\xdf\xb9=\xbd\xfe??\xed?Z?\xbb3\xf6=\xe7\x8dH?\xe7\x83\x83?\x13&\x16?T\xf0\x8f:~xH>\xce\xa7\xbf=\xb3\x11\xc6>'
-p209
-tp210
-bsV474170820428713984
-p211
-g2
-(g3
-(I0
-tp212
-g5
-tp213
-Rp214
-(I1
-(I400
-tp215
-g12
-I00
-S'!\x0f\x07<%\x1d\x07\xbc\xe4f\t\xbet\xc4\xab:C8\x0c<0#/\xbc\xeb[\xc3\xbc\xcc\xfe\xb1\xbd%T\xae\xbc\xa9\xee\xf8;\x11\xc8{:=A\t\xbdlv\xb2;\xba\x87\xda9\x1a\xcf\x0c\xbd\xaf\xc3\x02<Kw\x01\xbdU\x16-\xbd\xd5\xbbe\xbdTg\xc6\xbc9J\xb5\xbd\xad\xee*\xbb!\xa3\xc3;qk=\xbd\xe6\xe44\xbc\x08\xcc(\xbdjP\xcc;\xf3f\x88\xbdEc\xe1\xbd\x9a\xbe\x109\xe7\x16?\xbd\xfa\x0f"\xbd\xe0\x1dm;\xa7\x9d\x01\xbel\x1b\xa0:a\xb9\x1a<\x86\xa8\xa2;\x1d55;1\x80\xfb;_\x12n;\x9a\xe75\xbd\xe5I\xc2\xbc\x0ce\xc6;\xd0U\x98\xbd\xfc\xe3\x8d\xbd<d\x8c\xbc\xd5\xae\x15<]\x1cY;\x94nj8\xe5~\x16<\xe2\xfb\n\xbc\x95\xb5\x02<yTv\xbdb\x83\xb8\xbb,\x0e*\xbe\x03\xe6\xb1;T\x80\xbc\xbb\x0fh\x1b\xbd\xa6\xa8J\xbe:\x08#\xbe@!\x88;-\x1eh;\xa3g7: \x1e\xb8\xbd\xe1f\x0b\xbc\xe1\xdd\xc5;\xa42\xb5\xbdn\xeb\xec;F\x08\\\xbdN\xf7\x85\xbd\xbf<?\xbe\xf3\xba\xf9\xbd\xa7\x95\xb2\xbc\x8f\xeb5\xbd\tSW\xbd$\xf4\xc5;jz\xaa;\xfc\x04T;\x06hY;\xf5I\xaf;(Z\x8f\xbc2Jk9S\x16\xde;\x0e\x85\xb7\xbd!\xfa2;H\xfc\x9b:\x81\xd2\x90;\x89W\xfa\xbd\x92\x12W<\xcbja83D\x8f\xbdX\x9d\x8c;\xd8#\x99\xbd\xf43p\xbc\xd1\x00\xcb;\xa3\xd4^\xbb\x98\xe9\x8f;(\x88\x03<\x7fc|;\xcc5\x19\xbdn\xc1\xa4\xba\x98\x90\x05<\x1e\'\xaa;\x93\xa07;\xdb6B<\x00\x1b\xdd\xbd\xdaU\x1c9\x15\xbd\x88;\n\xd7\xc781\x8b\xb6\xba\xd0\xe4\x9e\xbd\xd1\x0f\xb3;O\x1e\x1d;\xe1\x19A;o$\x9f\xba\xd3\x91\x0b;\xb6+\t\xbe\xb7\xf9\x0e<\xc2*\x1c\xb9\xa8\x15^;\xd9\xcaS<\xedm<;h\x96\x1c\xbc\x00C\xf2\xbc\x81"\x11\xbd\x1c7};\xc5\xb8C\xbd\x94\xedG:\x04\x95\x0b;\xaf\xbb\xac;\xbc\xe3k\xbb\xb3\x91\xc7:\x01\xbd\xa3:\xb0\xd61;i\x00\x91:\xb4\x0eO;i\xbf\xee\xbc\x98Z\xe5\xba4\xf4\xf4\xbc\x9a\xc3\x84;\xee6\x9b\xbd\x0eq\x03<\x88\x17g\xb9<Q\xec\xbd=\x80)<\x08\'\xbd8\xe5\xa4\x8d;\xc8\xf3%<\xcd\x0b\x7f\xbdD\xf5\xb2:\x95\xdc\xe1\xbc\x145\x89\xbdh\x87\x1f<\x0b\xf0\x81;\xfa\xad!\xbc"\xba\x1c<tnx\xbd\x99!U;\x89\'\x96\xba\xd4%\xe8\xbd\x1d\xcb\xd5:-\xb3\xc3\xbd4\t\x1e\xbe\xff\xd4\xb9\xbd\xeeU7\xbcb\xa7\xb9\xbc\xb5O\x1c\xbe\x04K\x97;\xc3\xbbK\xbc\x96S-\xbd-M\xa7\xbbAl\xd6\xbd\xf4\xaf\x12\xbd\xfb\xa4Z<R\x14G;J\x96\xd59\xe7L\x15\xbe\x0e\xc5\x10\xbeW\x92\x0e\xbb\xc3\xaf\x99;X\x91\xf0;\xbe\xddK;\xa5\x03\xaa\xbd\x859\n\xbdX\x12\xc1;t\xdfp\xbau\t\x8a;\xd2x\x82\xba\xa7/\x0e<t\xeb\x97\xbd\xe9t\xcc;\x17M\x10;\x1e\xcf^;\x97Y\x01<<IU<m\xb6\x00<\x9eq%:\x96Yo;8[\'\xba\x81\x94\x9e;G\x1b\x03>\x8a\xe6\xe3:\x98u>\xbc\x88\xaa%<\xac2\xbf=F\xc8\x04:\x05\xaa\r\xbb}\x15\xdc\xbbC\x00\x1d\xbb\xf7\xf3\xbf=\xac6V;=\x9e\x05:\xc6\x9a*=\xea*$<@\xbe\x96\xba\x1cx\r>\x041\x06\xbb\x85\xfb_\xbb\xd6\x15`\xbb\xb0oB:m\x84\xa4\xbb\x8f\x0c\xec;r\xfaA=\xa4\xa1\xda\xbbZ\xc0?\xbb\xe4\xa0\x9e\xbb9\x9a\x9d=\xc7\xa2\xad\xbb\xe8\x9c\x15\xbc\x8c\xe6\xfe:\xbf\x9f\xa69s\x1d\xa3\xbb\t]\x16=a0\x01\xbch\x84\x9c<"\x9f\x04>\xde\xb9i=\xff\x9fB=H\xe9\xf5=%\xcc\x1f=\xb4\xa7\x85\xb9+\xd4\x1c\xbb\xd5ou=\x8f\xb8\xa6\xbb:\xc6\xbe\xbas\xb0\xfb9\x83\xe7\x0f>\x83\x0c\x14=\x84\x01\xaf<H\xe6,>\xd4\xac\x11:3\xb3\x17>\x83\xa2\xdd\xbb\x94\xeeW9\xc2\xcc\x1c\xbcYI\x8a=\xa6f\x0e;\xd0\xddf\xbb\x90$U\xbc\x1f\xea9\xbcG\xd2\x94=\t~\xb0=\xa4\xd0\xee<$\xa0l\xbbF\x89\x83\xba\x8a%\x9a=\x19M`\xbbK&\xb5=X\nl\xbb\xb1\xd6\x9c\xbb\xa9\xf8<\xbcE]\xc0\xbbx|\x00\xbb3a%\xbb\x0e\xbd]\xbb\x95Hx=u\xb6\x93=2\xfbz=r<\x95=\x8a\x8f\xa2=\x9d\x96\xb2\xba\xb1\xd6,<\x8dy\x02>0\xbf\x0c\xbcn\xffs=b/\x19=\xbc-\x98=\x1e\x0f\xf0\xbb\xadR?>\xd2\x86\x87<*\x15e\xbb\xa5 [=@U\x01\xbc\xd4\xb2%;\xc8\x10\xe6=\xf8\xe2P;5\xc4\xc4=O\x8b\xcc=\xee\xdd\x93=\x0b\xfc+\xbb\xd7\xd3\x03<\x89\x90\xd9=8GO=\x93\xc5\x83=\x9a\xe9B>\xd6\xb8\xf7\xbb\xb1n\x19;\xad\xcf[=`\xf3\x10=]\x8f\x00;\xae-\xc4\xbb7\x87\x91=w2j=\x86\x9a\x96=V3\xb0<\x92\x94\xe0<vG\xc6\xbb\xb7/\xcd=8\xa51<A\xfe\xbc<x\x94;>m!I=B\\\xf2\xbaJ\\6\xbae\x83M\xbb\x8b\xb8\xb2=(9\xc8\xbb\xc9\x96\xab;\xc2l\xae<\x1d\x7fd=zT\x17;~0\x19=\xd9S\x05=6\xd6\xab;\x8dI\x83;HQ\x08=\xea\xecK\xbb\x05=h:\x15%[\xbb\xb6_\x01=\x19\xfd|\xbbo>\xf4=)\xda\xbf<\xe8B\xb6\xbbY\x99\xff=9z\x8c<\xe5S\x85=\xedo$>\xcc\xd1\xd5\xbaJ\xe3-<FR\x9e:\x02:p\xbb\xd9\x96\xdf=\xa2R\xcd=J\xbd\x01:\xa2-\x04>\x99_o\xbb\xe7\xb1U=P;\xf4<Q\xb8\x00\xbc\x0b7\x0e<\xb4\x12\xf3\xbbB\xa68\xbc>|\xc7\xbb\xc8\x8e\x078\xddn\xaf\xba}\xbf\x13\xbc}\x04\xea=\xbe\x8b\x8c:\xc0\xcc\xb6\xb9@\xd9q\xb7\x147\xb8\xbb\x86\x97`\xbb\'\xc16>\x11\xd7c<\xe3\x17\x8d<\x9f79\xbcnfI\xbcmW\x81<\x8c\xaeG=\xc6\x1e\xf6=\xce\xb0\xdd<\x11\xff\xb1\xbb::\x0f\xbbSf\r>e\xf189\xd6\xbfx=\x951\xb1<\xca-\xe3=\x03\x96g\xbb\xc1\xc4\x96=\xb6M\xad;\xb4#E=\xac\xf6\xa2=\xa7\xb0(>\x8a\x91\x10>\x84\xfd\x14=\x81\xea\xbe<D|6=\xa5\xba\x97<'
-p216
-tp217
-bsV445260260102922240
-p218
-g2
-(g3
-(I0
-tp219
-g5
-tp220
-Rp221
-(I1
-(I400
-tp222
-g12
-I00
-S'X\xbaH<T\x14.\xbe\xa0B\xae\xbf\x17 M\xbf\xa4\xcc7<\xb5\x10\xd1\xbe2\xcb\x82\xbe\xc1t\x80\xbf\xc3\x84<\xbf {&<C\xde\x02\xbfh\r\x89\xbf\xde\x02\xe8\xbe\xb0\xe8+\xbf\xe9 .\xbf\x06{`<\xdd\xa2\x13\xbf\xfcGi\xbf\x8b\x12_\xbf\xad\xe9\x0e\xbf\xe0d\xbc\xbeS\xfb\x88\xbc\x1ba\xb4\xbe\xe4\xe0:\xbe\x86\x82\x8b\xbd\xf6\x04V\xbf\xe8v\xd3;9\xcd>\xbf|\xe0\x16\xbfa\xd1H\xbf[jd\xbf\xff\xbf\x82\xbe\xd1\x1d\x9f\xbe\xd1`n\xbf\xdf\x86:\xbe\xe9\xa2,\xbe\xe7\x8f\xa5;R\xfd4\xbd\x80\x1f\x0e<\xd2r8\xbf\xf9\xd8l\xbf`s\x9c\xbf\xcbl\x05\xbf\x1d+\xcc\xbe\x12`0\xbf\x9bi\t\xbfPc\x83<\xcc\xa1\x90\xbe*xW\xbe\xf4A\x92<!\x94t\xbf@\xfd\x8c<\xd9\x9f\xda\xbe\x1bC~\xbe\x9e\x8a\x8c\xbfg8M\xbf+\x8e\x03\xbe\x11#\xa1\xben\xb3\xfb\xbf\xcb\xde\x8e\xbfI\x17\x03\xbenA\x02<|\xc9b\xbc\nUi\xbe\x96\xa5\xa8\xbd\xb8\xec\xcd\xbd\x99\\ \xbf\x91\x14 <\xb9\\\x82\xbe\xfd\xe6A\xbfC\xee\xa1\xbf\xb4\xc6\x95\xbf\xf6H\x9b\xbf;r\x18\xbeYz\xcf\xbe\xea\xd8\x1a\xbf\xfa\xf5\x19\xbe\xd5{\xb1;\xbdaZ\xbe\xd8\xf4\x08<y\xc0S\xbe\x9c\xa0\x8e\xbe\x7fbO<\xcaL1\xbf\x8e\x89\x03<|g\xec\xbdr\xa5\x9a\xbe\x0e-\x03\xbf\x7f\xcc\x93<\x86\xd7Y\xbf3-n\xbfED\xa6;\x15\x0c\xc4\xbf\x94\x9f\x97\xbf\xd4\xa33<_"\xf4\xbd\x85\xf1\x1e<\xf7l6<*\'\xf0\xbe\xdf\xf9g\xbf\x8a\xc3\x96\xbe\x93\xb7A<O\x055;"\xa1\xbc;\xa7`>\xbd2\x99\x98\xbf1\xac\xe6\xbd"\xe0\xb0\xbc1g#\xbf\xff\x92\xad\xbcC\x1c\r\xc0\xe2\x95\xe0\xbc\xe7\x1f\x08\xbd\x03O\xd0\xbd\xd4\t\xd1\xbe\xd8\x1c}\xbf\xebtx\xbf\xdaL<<\xc7}\xac\xbf\x03\xc4\x0b\xbe[\x88\x9b<\xca\xaf\xc3:K\xac\x07\xbe\x1c\xa9\x80\xbe++\x0e\xbfSD%<\x9aa\x84\xbf\xe2\x92\xd0\xbd\x009,\xbf\\\x98{\xbe}\xaee\xbep\x8dO\xbb\xbd[p:\x00=0\xbe\x86\x94%\xbf";\xb6\xbe\x8cN\x80\xbf!\x054\xbe\x83\xed\xcb\xbf\xed\xca5\xbf\xea\xbe\xe5\xbe\xdf&e<j\x9a\xf0\xbb\xf7S\x9f\xbf\xa1\x9b\x82<\x16\xf6&\xbd\xab\xacY\xbe-Gh<\x8d\x03\xd4\xbe\xa5\xd7\x97\xbc\xe2\xf8\x88\xbd\x94\x93\xc2\xbe\xbfm\x1b<\xa2j\'<8\x1c\xd1\xbeB\x8dI<\x07\xf2\x12\xbfa\x8dO;_\x8dN:B\x7ft\xbf\xeb\x07\xa1\xbf\xa5\xdav\xbf\xb4\xdc\xaa\xbf\xcf\x1c\xa9\xbf\xdbt\xc5\xbd7\x04\xde\xbe.\xbe\x87\xbf;\xda\x99\xbe#[\xdb\xbdb\xf2\x92\xbe\x16z\x19\xbf\x0car\xbf\x07\xb2p\xbfh\x17\x96<y\xd8\xd1\xbe/\xbd\xe3\xbc\xf9\xbd\xa2\xbf\xfbw\xd6\xbf\x10\xa1N\xbd\x86\x96{;\xf3>(<C\xde)\xbfK\xa3\x1d\xbf\xba\xe7\x1d\xbf\xe3?1<z\x16\xc1\xbe\x06\xd0d;\x88\xf4<\xbe-@\x01<\xa0.\xf5\xbe\x94q\xcf;\xbbE:\xbd\xb0\x17\x82\xbd}\xfd\x10<\xc8V\x93<\xaf\x9aM<\r\xb0\xa1\xbf4\x10\xc5\xbd\xd6\x00\x91\xbeo\xbe+\xbf;\x02\xb5?Z\x8a\x98?s4p\xbc\xdcC\xbe=\xd2[z?@\xc1\xd8>\x18.\x8c?\xa3F\xbf\xbbO\xab-<\xbdY\x8d?\r\xea8=p\x8f\x9c>0a\x1f?\xbd\xc2\x11>j.5>\x83\xeey?\xdc\xc8R\xbaO.\xe1\xba\xad\xa2\xa9\xbb\x12\x05\x16>\xa6\x0e%\xbc\xd6\xe5\r?\xb2\xd2\xde>\x8e\xf1\x8c?\xb4\xa9\xcf>\xeeN\x90;\xb6\xf6M?\'\x7f/?\x0e\xffB\xbc\xc0\xcb\xb5>vM\x80=.\xcc\x13?F*\x99=\x0e\x06a\xbc\xe1\x0e\xae>=w\x8d?`\x9e\x9c?d\xa4.?\xd9\xc1\x97?0\x0e\xc8>\xaa\x1a\x8f<\xb2\xe4\xce\xba\x91\xeb3?\xa2\xfe3>\xf7\xef0\xbb\xb9:\x85<x\xa2*?\xe0\xb2\'?UY\x16> \x10\xb2?\x05k\x96>\x02\x82\x9f?\xd5\xd9\x07>\xc9\x1e\xa2>\xe8\xe8\xae\xbcz\xe3}>\xa0\xbb\'?\xef\xbf9?`\xf8\xb3\xbc\xcf\xfa\x93\xbcN\xe7\t?y\x92\xf8?5\x8b\\?:c\xc9=\xf9/v?\x04\xfc\xe7>\xfe\xee\xac\xb9\xa4\x8d\xbe?\x8d*M?\xc1\xea\xa5>H&\xa0\xbc\x02Y \xbc\xc6\xb4\t?\x18FE?A\xe8\xc8\xbb\xbe[\x17>\xea\xbf\xc2>\xb1\x07$?\xd2(\x8a?\xb2\x00\xa3?\xf5\xad=?\xb1>P>}\xf09?\x1a\xdd,\xbc\xcd\xf7\xe0>\xa4\xc6}>\xad\x8f\x84? \x105\xbc<~\x86?a\xca\x83=\x17\x88\x90\xbb\x95\xd4\x94?\xe68:<tBb=L\x0eo?\x83\ts?\x87\xa7\xb6?@(\x83?\xdc\xe8\xea>,H\xd0<\xdd\xe4H?\xa3\x01"?"\xfc\x08?>\xd5\x0c?\x0cr\x95?\xcb\x8bM\xbc\x8e\x05\xcd>\x1bE\x9d?\xa9\x0b\x87>\xf8\x02\xfe>h\x12\xc7;n\xaf!>\x7f;\x86?\xb0\x99W?g\x8aL?\xbd\xa4\x8f>\xf9\x86_\xbc\x97\xaeu?\xe7\x80(=\xa6\xcb#?\x8b\xf8\x8b?t&Z?D\xbe >\xe5\x83(?\x96"6?\xc5\x15\xcf>\xb6k\xa0\xbb\xdd\xce\xf0>\x8c\x16\x8a>\x07\xba\xfd>\xd6\x869?\xb2\xbe\xcf?\x19\x0c>?\x9c\xdb\x8b>\xfb\xa5\xa2?a\x13\xe6=\x86\xb8.\xbb\x9d\\?<\x0f\x01\xbc>\x13\xef\xdc=\x11H\xc8=\xf4\x7f\x06?\x06>\x1b?\xb5\x029\xbc\xfd\xc7\xc1?\x172o?\xefea>\x9a\xb7\x18@qY\xad\xbb\xd5Z\xe9>\xcf.T?N\xe0\x1b\xbc)\xdc\x92?:b\xe0>\'n8>\x9c\xe4\xb3?~L\xa8\xbb\xd5\xa9<?\x16\x9a\xab>\xcd\xa1W\xbc>\x12\x9d=\xf3e\x01\xbcM\xecj\xbc1d\xe3\xbbH\xf7\x11?4\x12\xb0>\r3\x93\xbc\xde\xda\x00?o\x9c\xa2?\x13_\x1f?H\xb7\x12?\x1c\xe6\xc6\xba\xbat\x02?\xcf\xe6}?\xa7\x92\x1f?\xaf\x87%?\x0e&k\xbc\xdf\xf2\x85\xbc\xd6\xa5\xc4?\xcei!?6;<?\x97\x1b\x10>\xbf=\x0f\xbc\xd9P\x0c?\xe3\xbe\x0c@T=\xc5=\x95\x10\x94?D\xcc\xaa>\x830V?\x91\x8c\x87>\xce&/?h?M?mX\xa6>\xdfC\x8a?r\xc5\xb1?\x02\xeb\xc4?\x94\x0f\x10>\x1bZ\xcb>\xc7$/?\x06\x16"?'
-p223
-tp224
-bsV445265005886590977
-p225
-g2
-(g3
-(I0
-tp226
-g5
-tp227
-Rp228
-(I1
-(I400
-tp229
-g12
-I00
-S'\xc8g\xb8<:\xf0\xfd\xbc\xa0B\xae\xbff\x12\x9b\xbf\x1fI\x13<\x8a\xa2\x18\xbfy\x175\xbe\xa8\xe4\x8e\xbf\x94R\x90\xbe\x10\xff\x98<\x07}\x07\xbf\xaf\xe1\xc8\xbe\xed\xc4\x8a\xbe\xb0\xe8+\xbf\xaa{-\xbf\xb2\x13:<\xdd\xa2\x13\xbf\xb2qQ\xbf8X\xbf\xbf\xf5\x81\x95\xbf\xc7\x13\x02\xbfS\xfb\x88\xbc\xf0b\xf7\xbc\x05\x14\xe6\xbd\xa3]\xb4\xbc\xc8S\x85\xbf\xe7vT;\xb0\xc9?\xbf\x9d\xd7B\xbf\x0f\xac\x9e\xbf\xe2\xa1\xd3\xbe\x14|\x8c\xbe\xeb\x12\xd9\xbe,\xc0\xc9\xbf\xdf\x86:\xbe\xd6\t\xdb;\xd4\xb9\x9f\xbc\xd0\x83M;\xca\x05\x08<\x85\xe3\x1c\xbf\xf9\xd8l\xbf\xbf\xe1\xb8\xbf\xcbl\x05\xbf#2N\xbe9*/\xbf\x0c>\xec\xbe\xf0\xdc\x8f<b\xcc\xd1\xbe\x8dd\x93\xbe\xe9\xe5\xb3<1\xcf>\xbf\x1d\xceX<;\x9f\x92\xbfv\xd5?\xbc\x0ba\xd9\xbf\x07`\x93\xbe\xee\xb6\xe6\xbb\xd2\x93\xa4\xbe\xf9\x97/\xc0H\xb7\xc1\xbf\xc6AK\xbe\xdfZ\xac\xbcK\x04\xf8\xbc\xd3!p\xbeG\xdf\xa5\xbc \x89\xd2\xbe\x80i\xb6\xbfL\x94\x04\xbcs\xe5\xa6\xbe\xdb"\xf8\xbeC\xee\xa1\xbf\xb4\xc6\x95\xbf\xd5\x94]\xbf\x9a\xc8(\xbf\x98xr\xbf\x88[~\xbf<\x8bM\xbf\x1c\x04\xc3;\xa0Eb\xbd!R\xa1\xba\x8eP\xc9\xbe\x909\xe5\xbel\xbf\x13<\xe6\xb1\x83\xbf~\x89&<\xb2\xe3\x81\xbe\\\\\x19<KD"\xbf\xf2\xc8X<\xbe\x10\x1d\xbfcL\xc4\xbfkV\x1c\xbe^v\xdc\xbf\x94\x9f\x97\xbf\x15\xd5)<\xf2\xb7\xcc\xbci\x0f\x84;\xaaC`<*\'\xf0\xbe\x94\xdd\xbb\xbfo\x98\xe3\xbe\x9b\xf2\xb5\xbb\x05\xaa\x8f\xbd\xc5s\x8a\xbe\xaa\xef\x05\xbf,J\x96\xbfkK\xfc\xbc~ .\xbc1g#\xbf\x9c(\xbf\xbe\xd2L\x13\xc0I\xba\'\xbf\x88\xa3H\xbe\xb4r\x1f\xbd\r\xe9\xa2\xbe\xd8\x1c}\xbf=\x96\x96\xbf\xeb\xa4@;\xc7}\xac\xbf\xedI\r\xbf7\xf8\x08<\n@9\xbc\x1c\x8ae\xbe\x82\xc1%\xbd\xe5)i\xbesM\xec;i\\n\xbf\xe4\xb1\x91\xbc\x009,\xbf\x11s\xf7\xbe;z\x03\xbd\xda\xf4\':\x84`\x80\xbcU\xa8\x08\xbf\xf8F}\xbe\xa2\x9d\xa5\xbe\x8a\xe9z\xbf\xe2\xc3\xda\xbe\xd3\x97\xbe\xbf\x8690\xbfj\xc7\xc9\xbe!\xb5\x13\xbf\x1a\xb8\xf6\xbc\xf7S\x9f\xbf\x8ez\x98<\x91W\x9f\xbc\xee\xe7\xcc\xbe_\xd7\x84<\xce1\x1a\xbf\xca\xd6\xd1\xbet\xec\x0e\xbf\xff\xd1\xe1\xbe\xe3_\xba\xbb\xce\xc2*\xbf\xd8\xa7\xd4\xbe\x8b\xb0\xeb;\xea]-\xbfZg.9\xbeN\xc3\xbc\x12\x1bj\xbf \xe3\xd8\xbf\xa5\xdav\xbf\xb2&\x98\xbfc\x10\xc5\xbf\xa2\xa3\xf4\xbc\xd3\x15\xab\xbev\x19\xe2\xbf;\xda\x99\xbe|X\xf6\xbc\x149\xf5\xbd\xf2\xe1\x13\xbeT7\xf4\xbeR\xa2<\xbf\xec\xc9\x88<NU\xa8\xbe<\x1eI\xbc\x8b\xf6~\xbfl\x93\xe8\xbfHD*\xbd\xe6u\x0f<4\n\xf6;C\xde)\xbf\t\x0bG\xbf\x95\x81W\xbf\xc5\xac\x9e;^3,\xbf*\xb9\x94\xbd\xcc\xcf\x95\xbd\xa5\xfb\xd2\xbe\xd4#\x80\xbe? \xa8;\x113\xd5\xbct}}\xbe\xd4\x81&\xbe\xcb\xce\x97<Z\xdc\xa3<\r\xb0\xa1\xbf\xb2\x1e<\xbe@/\xcd\xbe\xf8\xc1\x86\xbe G\x14@%\xed\x87?\xeby\x1c\xbcM\xdc]<\x0bS\xb3?o\xe40?\xdd\x93\x0f?\x1f\xcf\x9d\xbbS\xad\x9a>\x19\xe1\xe0?\xf6\xf0\x19>\xe0m^?M^\x16?\xba\xad>>j.5>*\xf3\xc7?r\x0b\t<\xd2\xeaV>US\x0c\xbc\x12\x05\x16>S\x04\x99>\x89A-?\x06\x8f^?\xa8\xa2{?\xf5- ?\xf1F\x89\xbb\xd3R\x8b?.;\xad=\xc2vE>\xc0\xcb\xb5>xc\x81>\x00,\x89>\x9b\xa9\x84=\x04\xa5I\xbc9\x9d\x00?\xa1\xcaM?K\xdb\xd9?\xc6\xb2X?\xd9\xc1\x97?\xab\xa0\x8a>\xf8\x8f\x86<\xba\xee\r=\xd3i\xdd>\x0b\x046>\xf0\x85\x9c>;zD>\xb9\xf1\xfe?\xcc\xc28>\xe0P\xf7=~L\x15@\xca\xe7\x96<F\xaa\xa8?\xd5\xd9\x07>\xe7}k?\x97~\x98\xbc\'\xaf\x88>\xa0\xbb\'?Z\xbdR?\x00\x14\xf7\xbcg\x9b\x8c\xbcR\xe4&?\xc2\xee\x05@\xca[\xa0?\xaa\xd4+?\x14\xea"?\x04\xfc\xe7>\xfe\xee\xac\xb9\xe0\x03\x17@\xb7\xe51?\xc1\xea\xa5>\x114\x07\xbcz \xa0\xbb^DD>\x18FE?\x1fx\x89<g|\x07>*\x98\x11>G\xc2G?\xe6g\x19?\xa9~I?\xf5\xad=?\x8b@\x9c>\xe4\xe6\x96?\x114\x1f\xbc\xf9/O?T&\xf2>\x1d\x7f\x9d?\xec\xdd\x9c=\r\xb9\xe8?\x86\xec\xe1=\x8a\xe5&\xbc\x95\xd4\x94?\xf0i\x0e\xbc\x16\xf0\xe7=\x14+\xbd?\x87\xa8=?\xda\xd1\xa4?\x1a\x80\x96?\xf9>\x05?\x88w\x97<\x920\xc6>\x8dVD?\xd8b\xf6>>\xd5\x0c?5#\x0c?r\x8a\x9f9\xedlQ?He\xad?Z\xe3"=\x8a\xa5\xbe>\x8d`\xcb<\x8b\xd2V>\x7f;\x86?\xe2%M?\xa7\x93I?\x1f\xc9\x88=\x94v"\xbcd\xb2e?\x94(\xc4>\xa6\xcb#?\x16\x8f\x99?\xa2\xf7\x98?\x1a\x98\x84>\x82\x84C?\xed\xcd%?\xe3\n3?\xe75\x07=\xc2\x95\x7f?7m\x93>\xdbr\x10>\xd6\x869?\xb2\xbe\xcf?\xbd\xf1\xa6>\x9c\xdb\x8b>c\tn?\x1d/\xa5>\xd4X98\x82\xb4\xd7>-\x0c\x13= .2=\x11H\xc8=\xcd\x07%?k\xf2\x8d?\x1e\xee\x1f\xbcb@\xa3?}]s?a\xa4\x06>~\x19\xd1?\xd6fs\xbb\xdb_\xe7>\xcf.T?\x9c\xf1\xb0=u\xa0V?:b\xe0>\xf3\xd9\xe9=\x11\x9b\x96?\xeaY1\xbbg]\x19?9\x03\xad>ne\x13\xbc]\x8b\x86=\x83\x83C;\t\x13.\xbc\xa5\xed\x0c\xbb\xde\xc3r?<\x83\xc1>\xd3\x18^\xbc\xb6\x88@?o\x9c\xa2?a\x0e&?C\x10\xa1>\xaa=\x95>\x8a\x92\x9f<\xfc\xa7\x06@\x0c5W?u\xc3\x02?q\xd7\xec\xbb\xfb7\xaf\xbci1\xf2?(\xe6b?\x14N\x8d?\x97\x80\xb2>:\xf2\x0b\xbc\xdf0\n?/\xf4\x83?\xfa\xfe0<\x07b\x97?\xd1)\x82>tD;?x\x95\x9b?\xfe\x7f`?\xed?Z?\xfd\x95\xc1>j\xc3\x85?\xe0?\xf8?\x0b&\x87?^\x98O=\xbf\xfb\x8a>\xf0\x9d\x96>\xf6\xfcB?'
-p230
-tp231
-bsV445126509305405440
-p232
-g2
-(g3
-(I0
-tp233
-g5
-tp234
-Rp235
-(I1
-(I400
-tp236
-g12
-I00
-S'h\x91\x8d<w,\xd1\xbd\x15\xb4\x80\xbf}\x1c\x01\xbe{\xfd@<\r\xf6\x0f\xbf+\x08\x11\xbe\xed\xcf\xe6\xbe\xce\x00X\xbe\xa3\xa7B\xbc\xb8}\x80\xbb\xb9\xe9\x8c\xbdb\xc3\xae;PZ\x91:\xadM\x03\xbf\x91\xe7\x80<E\x1e\x1b\xbd\xe4\x9c\xba\xbd\x1c\x16\x93\xbe\xe4\x97\'\xbd\x01\xb0\xed\xberj\xdd\xbd\x82\\\xc3;\xf0>\x9c\xbf\x1d\xcbD\xbe\xc3\x18~\xbe\xad\xeb\t<\xe4DM\xbf3\xa4\xbe\xbe\xa5\xcf\x8c\xbc\xe5b\xc0\xbd\xed\xed\xc5\xbe\xb1^\x8f;\x9b\x8a\xa2\xbe\xe8\x83\x9e\xbd]1N<\xf8\x0f\x12<\xa8\x94\x17<|\x03r<[\x13\xfb\xbc\xb3\x87\x81\xbd)%{\xbd<R\x0f<\x04?.\xbf\x14|\xd4\xbd\xa06\xbe\xbc\re\x8d<2\xb6\x8b\xbe\\\xd0\xd9\xbc\xbdU\xaa<\x1e\xd3\xa4\xbc\xf2/\xa2<9\xdd\xd1\xbe\x03H\x85\xbcR\xaaW\xbf\x0e\x97\x0c<\x06\xc2\xb5\xbcnn\x1f\xbe\xf8\xcbM\xbf\tR]\xbf\xec,2<\x0bx\x17\xbe)-\xa5\xbe\n3\xdc\xbeV\xf9J\xbe@\xb9+<l\xb5\x01\xbeG5J<\xaf\xbe}\xbf\\X\xcd\xbd\xcb(\xae\xbfo\xf4\x00\xbf+\xf8S\xbdi\xbc\xaf\xbeI\xb6\xd1\xbe!\xf0\xa2;\xa2.\x01<\x9ey\x08<Me\x03<\x89\x85(<\xe5\x88\xd0\xbe\xf6x\x02\xbeJ\xd8K<\xc1]\xb3\xbe:\xd5\x0b<o[\xa1;\x1c\xefg<?\xae.\xbf\x827\xc2<\xda\xe5\xac\xbb\xf9"\xd3\xbd\x12\xcf\xe6;\xec\xc9\x83\xbfr\xf3\xd5\xbc+\xf6r<\xb1O\xc1\xbc\xc6\x94\x13<Y\xeby<\xe7c\xeb;<\x07\xa9\xbd\x86\x89\x8f\xbb\xae\x9dn<\xd3\x14\xa5;9&\x17<X\n\xdd<\x7f\xb2\x02\xbf>\xcea\xbc4\x9a\xa6;\x0c\xde\x00\xbe\x02{\x98\xbc\xdb$\xed\xbd\xe7/\xe8;\xda\xd2\x04<\x18q\x1f<\x92\x7f\xc1\xbdC\x1d\x13\xbeeS\x1e\xbf\xe0\xa1J<\xce-\\\xba\xeb\xe9\x91\xbb\xf2\xbc\xc2<\xaa\x8f\xe8;\x1d\xc3}\xbe"\xba1\xbd/\xaa\x84\xbd\x83\xc4F<\xb4\xee\xfb\xbe\xa9<\x10;\xd5\xe7;\xbe/%3\xbd(\xeb\xb7\xba\x8a\xe2\x94;\xaf\xf0\xa3:\x87\xdc\x13\xbd\x92\x06\xde\xbbg.\xba;~yH\xbdx\x18\x93\xbcp9I\xbdLH\xb7\xbc.,\xf6\xbd\xcf\xbe\x8f<\xd6\xc4+\xbeVA \xbf\x98\x10a<\x18\xa9\xba\xbeUN\x01<\x91\x86v<\x01\xa9\x8e\xbeB\xf2\xb8\xbd\x89\x08\xb0\xbcl \xa2\xbe\xd5\x82@<\xff{9<XI\xbc\xbc\x14\xf0\x83<\xdex\xa0\xbdp\x7f\x1f;\x9e3};=\x82F\xbe\x8c\xff\x92\xbc\x9b\x90\x03\xbf\'\x7f\xe9\xbe\xba\x8e\xa5\xbeU\x0e\x19\xbe\x98s\xa5\xbe1\xfd^\xbfMh\x8e<\xd7\xf1\x84\xbc\xd1y\x98\xbd\xc6B\x06\xbd\x15\xcbt\xbe\x8f\xf4Y\xbd\t\xde\xd9<H\xd5p:\xc3\x03\xee\xbd\xa4\xae\xb9\xbe\xc3\xf9C\xbfH1\x8b\xbc\x01,\xa9;%\xbb]<\x92\x8b\xc1\xbd\x82 2\xbe\xce\x85Q\xbe.\xf8\x0e<C\xc0\x90\xbd\xf7\x05\x06<L\xa0\x05\xbc\xd7ly<\xec\x16\xaf\xbe\xcfy\t<\x97K\x14\xbc\xda\x83\xf1;\x8f\xadW<\xb9R\xbb<U>\x85<\x7f\xf5\x0f\xbe\x0b\xabE;\x1d;\x96\xbe\x91\xff\xc0\xbb\xc1\xa4^?|x\x8b<U\xb3\xb9\xbc)%+=\xcf\x93.?\xa4\xfd\n<\x91\x9d6=\x19n@\xbc\x82\xb5!\xbby\xf3\xfa==@\x98>[P\xe9>\x1e\x96\xe0>1\xde\x80>(\x0f\x1a<P\xf8\x12?j\x7f\xa4=\x9e\x8f\xbe<gS\x94\xbbIt\x15>\xfbE<\xbc#9,<\x01\xbd\xa1>n\\X<\xe0d\x12\xbb"C\xc3\xbb\x0f\xdd\xed>\xab\x88%\xbc\x90\xaa*\xbc\x97\x1fO?\xf0-\x91>*\xaf\xe3\xbbn\x11\xdc>\x87e\x8b\xbc\x1e8E=\x07\xc0\x04?U\x8f\x87>\xda\x7f\xc5>\xfe\x95P?\x9bd\x9a>_\xc8\x1f>\x87i.>2\r-?\xb2\x97<\xbc@S\x04\xbc\xd6\xe7F>\x99\x90V?\xca\xe2g=8\xc0\x18=\xbf\xf4X?\xf6u\x1a>\x9ds`?f\x95"\xbcH\x1b\x9c=T\x96\x9e\xbc\xf6P\x14?Xq\xa2>\x1f$\xc5\xbb\xc8\x81\xc3\xbc\x12i\xa6\xbcs\xd4$?w\xa4\xfe=\xfb\xbfb=S\x90=\xbcn\xb8\x10=\x96\x1d8?\xde\x93B\xbc\xe3\xb5\x81>\xd8o\x98:\xe8,\x9f\xbb \x91\xe8\xbcn\xf1\x80\xbc\x9b\xad\x92=/\x00\xab\xbb\xdc\x89\xe8\xbb\xb5\x15\x04?h\x9e\xff>\xc7\xef\x94>\x8c\x1d\x0f>\xee0\xab>\x06\xc6?;\x92\xc6\x8e<\xf7\xc7u>\xcb7N\xbc\x8b\xf8\xe7>\x04\xb0\x8f>x\xbbK?\xb2\xack\xbc\x88\x1dx?\x15\xcb\xb0>\xb7\xd3\x1d\xbc\xcdS\xc8>\xa7\xb36\xbc\xfam\xcb>\x91\x05.?\x8d\xd7\x9e>\x96\x0b\x84>\xe5\xe5"?w\xf4\xb7=\x96H\xfd\xbb\xfd\xd6\x88>\xe9\xc8]?\x9fj\xb9=r\xc6D>W72?oG\x05\xbc"KQ>\xf3\xda\x85=\x01\x18\x88=\xb1\x15\x8e=\xa6\xcc\x89;!\n&?\x9a\x18\xa9>\xb0\r\xca>o\xd7\x9d<Rs\x1b=\xa6Pe\xbc\xc2\x85U?}\x9f">\x1c\xe4\xd4>*tg?\x15r\x91>Y\x9e\xba;\xc7\xb5\x19>o+\xcc=\xe1{\x0c?S\xc5\x87\xbb:\x7f\r>\xe85\xd3<\x1d\xb5\xe4=32\x8a><v\xc0>\xa2\x1e\x9b>\x9b\xd8D=e,\x00?0&(>\x80\x89\n8\x96\xde\xfc=\xcc\xe1\x89>Go\x82>\xa5\xb3\xe8\xbb:~\x03?n\rq=m\xc9c\xbcW\xe9\x00?\xdc\xda\xc9<\x85\xfd\x04?UR\xa5>K\x10\x18\xbc\x96\xa3\xb1<\xfc\xea~>Tl+\xbcG\xb8\xd3>\x8a/\xd0>\xcfD\xc5>\x02\x08-?\x15\'\xe6<j\xe7r>\x9c\x8a\x1b>y\xba\x87\xbc\x0f\xf3\x06?\x1e#+\xbc\xa01\x96\xbc\xccX#\xbc\x98\x84N;\xfe\xd7\x98;O#\xa9\xbc\xd4x\xfd>\x91X\x8f=\x8c\x1f\x16>\x14\x99A>\x0c\xb5\x0e\xbc`\x10\x00>\x13\xdc\x93?\xfa%\x1e>\xbc\xf3\xb8<h\x12u\xbc\xa5\xbd\x8c\xbcPI\xee=\x82\xa2\x8f>o\xb0\xf4>\xcf\xbb\xc4<\xb5h\xef\xbbox\xab=\xfb\xa8S>-\xd4\xc5<>\x06\'?\xac4\x03=\x19a\xe4>\xf8^\x1f\xbc\x0c\x19\xba>@=\x89>\x1b\xd5\xc3>V\xc5\r?j\xf1!?(D.?\x9ci\x97=\xb1\xad1>\xee\xaa\x9d=K;=?'
-p237
-tp238
-bsV474078354937622528
-p239
-g2
-(g3
-(I0
-tp240
-g5
-tp241
-Rp242
-(I1
-(I400
-tp243
-g12
-I00
-S'\xa4\xdd\xb8<%\x1d\x07\xbc\xe4f\t\xbeL\xf1\xc1:~\xfbT<0#/\xbc\xeb[\xc3\xbc\xcc\xfe\xb1\xbd%T\xae\xbcx\xa2Y<\xac6V;=A\t\xbd\x15L$<>4\xcd;\x1a\xcf\x0c\xbdm\xe2\xae<Kw\x01\xbdU\x16-\xbd\xd5\xbbe\xbdTg\xc6\xbc9J\xb5\xbd \x007;\xfd\xa8\x02<qk=\xbd\xe6\xe44\xbc\x08\xcc(\xbd!O\x0b<\xf3f\x88\xbdEc\xe1\xbd\x8c\xe6\xfe:\xe7\x16?\xbd\xfa\x0f"\xbdt\x9d\x0f<\xa7\x9d\x01\xbe\x93\x10\xd2;\x9b\x0c\x91<+H\xcd;\x1a\x1b\x18< \xa5\x93<D\x18\xdc;\x9a\xe75\xbd\xe5I\xc2\xbcf\x136<\xd0U\x98\xbd\xfc\xe3\x8d\xbd<d\x8c\xbc\x0fz\xc1<\x88[\x8f;3\x16\xe4:1b\xe1<\xe2\xfb\n\xbc{\t\xcb<yTv\xbdb\x83\xb8\xbb,\x0e*\xbez=\x12<T\x80\xbc\xbb\x0fh\x1b\xbd\xa6\xa8J\xbe:\x08#\xbe\x9a\x85&<M-,<\xb9\xc7\xa2; \x1e\xb8\xbd\xe1f\x0b\xbc\x0e.6<\xa42\xb5\xbd\xc3b8<F\x08\\\xbdN\xf7\x85\xbd\xbf<?\xbe\xf3\xba\xf9\xbd\xa7\x95\xb2\xbc\x8f\xeb5\xbd\tSW\xbd\x8b\x03(<\xb76\x1f< \xc8(<\xc8U\xf1;\xe6\x89Q<(Z\x8f\xbc\xa1\xac\xd1:0\x86\x9b<\x0e\x85\xb7\xbd\x1d?%<\xebW\x1f<\x7fd\x85<\x89W\xfa\xbd\xf8K\xe5<\x16M-;3D\x8f\xbd\xe0\xe0\x10<\xd8#\x99\xbd\xf43p\xbcV\x10\x9f<\xa3\xd4^\xbbX\x18z<\x815\x87<I\xc1%<\xcc5\x19\xbd\x0b\x9e\x9a;\'\xb7\x8c<\x80\xca\x15<?\'\xfb;x\xaa\x12=\x00\x1b\xdd\xbd\xca6\x07;\x9b\xfe\xfa;3\x19r;\xfb5[\xb9\xd0\xe4\x9e\xbd\x9b\xddr<\xf5\x03[<\xfe\x0f*<&O\xba\xbaai\x88\xb9\xb6+\t\xbeUCw<J9\x9a;~g\xa7;\xed\x81\x02=\x10(\x1b<h\x96\x1c\xbc\x00C\xf2\xbc\x81"\x11\xbd\x0c\xe0X<\xc5\xb8C\xbd\xf3|t;\x8c\xe3C;n\xbd\x07<\xbc\xe3k\xbb\xd6o\xa4;\xaa\x16\xb2;\x06\x90p;\xe6\xb9\xd3:V\x126;i\xbf\xee\xbc\x98Z\xe5\xba4\xf4\xf4\xbcz\nz;\xee6\x9b\xbd\\P\x8b<oU\x8e;<Q\xec\xbd\xd7B\xac<\xd588;\x89\xd8\xef;\x1c\xfa\xad<\xcd\x0b\x7f\xbd"Cz:\x95\xdc\xe1\xbc\x145\x89\xbd\x07:\x88<3\xb6S<\xfa\xad!\xbc\x91\x95\x99<tnx\xbd~T\xff;\x0c\x9b\x0c;\xd4%\xe8\xbdK|\xb8;-\xb3\xc3\xbd4\t\x1e\xbe\xff\xd4\xb9\xbd\xeeU7\xbcb\xa7\xb9\xbc\xb5O\x1c\xbe\xe9\xbb\xab<\xc3\xbbK\xbc\x96S-\xbd-M\xa7\xbbAl\xd6\xbd\xf4\xaf\x12\xbd\x19\x07\xe7<\x95D=;E\xa3V;\xe7L\x15\xbe\x0e\xc5\x10\xbe\xb0\\\x0b;\x17\xbf\t<!F\xad<p\x1f\x9e9\xa5\x03\xaa\xbd\x859\n\xbde\xc2\xae<e\xf189\xd6A\x04<T\xc3`;\xb1\x07\xa4<t\xeb\x97\xbd\xb0\x00"<\x00j\xf99\x9e\xe9\x98;\xa7\x87\x9d<z\x03\xe2<\xbf\x91\xb3<\xfa\xb9\xdd; \xa6\xcd;\t\xd0\xde;\x13\xf7\x08<G\x1b\x03>\xcc*\x11;\x9b\xaf\xc1\xbc\x88\xaa%<\xac2\xbf=l|\xed:!+\x9c\xbb\xbd\x8ez\xbc{\xaf\xe3\xbb\xf7\xf3\xbf=\xf6\xd0\xbb;N\xcd\xe6\xbb\xc6\x9a*=\xea*$<\xdd\xf8\xdf\xbb\x1cx\r>\xc2\xfe\x87\xbby\x85\xb2\xbb\xbf\xfe\xd4\xbb\x15\xd8C\xbaoWW\xbc\x8f\x0c\xec;r\xfaA=\xf3V\xb9\xbb\xf4X]\xba\x8c2\xbb\xbb9\x9a\x9d=\tL"\xbc\xfa\xbc~\xbc\xee#\\;f\xd3\xeb\xbb\x06\xdd\x0b\xbc\t]\x16=\x8f\t\x89\xbch\x84\x9c<"\x9f\x04>\xde\xb9i=\xff\x9fB=H\xe9\xf5=%\xcc\x1f=\xc0(\'\xbb\xda\xbfj\xbb\xd5ou=\xcdv\x85\xbc\x89\\\xf5\xbbt\xcb\xfe\xb9\x83\xe7\x0f>\x83\x0c\x14=\x84\x01\xaf<H\xe6,>\xe7\xcf_:3\xb3\x17>>\x85\xcf\xbb0b\xc9:\x8a\xec\xf9\xbcYI\x8a=7\x99\x8a\xbb"\xa0\xda\xbb@\xb9\x08\xbd\xd0;\xc0\xbcG\xd2\x94=\t~\xb0=\xa4\xd0\xee<(@\x89\xbc\xe8\xa6z\xbb\x8a%\x9a=H\xcbc\xbcK&\xb5=cK\x0b\xbc\x10\xe5\xf7\xbb>[\x0b\xbd\x14%\x8f\xbc\xaa\xe8\xba\xbb\xe7(m\xbb\x89U\xbc\xbb\x95Hx=u\xb6\x93=2\xfbz=r<\x95=\x8a\x8f\xa2=\x15\xd9j\xbb\xb1\xd6,<\x8dy\x02>m(\x92\xbcn\xffs=b/\x19=\xbc-\x98=\x04G\xa0\xbc\xadR?>\xd2\x86\x87<\x8f\xf4U\xbc\xa5 [=\xed\xa4b\xbc\xcd\x94\x91:\xc8\x10\xe6=\xe2m*:5\xc4\xc4=O\x8b\xcc=\xee\xdd\x93=\xfb\xc3\xd7\xbb\xd7\xd3\x03<\x89\x90\xd9=8GO=\x93\xc5\x83=\x9a\xe9B>g\x9bF\xbc\xb1n\x19;\xad\xcf[=`\xf3\x10=]\x8f\x00;2\xeb\x13\xbc7\x87\x91=w2j=\x86\x9a\x96=V3\xb0<\x92\x94\xe0<mg\xa8\xbc\xb7/\xcd=8\xa51<A\xfe\xbc<x\x94;>m!I=\x0f\xf1\xc69\xed\xf66\xbb\x92\xa9v\xbb\x8b\xb8\xb2=\xa2\x90\xcc\xbb\xc9\x96\xab;\xc2l\xae<\x1d\x7fd=9\x973;~0\x19=\xd9S\x05=6\xd6\xab;\x8dI\x83;HQ\x08=+\xbf\xb0\xba\xb9\xd9_\xba\x02\x08@\xbb\xb6_\x01=6\xd5F\xbco>\xf4=)\xda\xbf<\xb6v\x82\xbcY\x99\xff=9z\x8c<\xe5S\x85=\xedo$>\x1a\x180\xbcJ\xe3-<\xd8\xb0\xe5\xbao\xbc"\xbc\xd9\x96\xdf=\xa2R\xcd=\x80\x11\xf2:\xa2-\x04>4\x10\n\xbc\xe7\xb1U=P;\xf4<\xb97\xad\xbc\x0b7\x0e<\xe7d\x8e\xbc\xa2\x10\xb3\xbc;v\r\xbc\x17\x05\x81\xb9+\x19\xfd\xbb\xe4\xbd\x99\xbc}\x04\xea=\xa8\xcd*:\x88]\x11\xbc\x9e\x11\x9a\xbb\xda\xb4\x81\xbc\xa7\xa6\xde\xbb\'\xc16>\x11\xd7c<\xe3\x17\x8d<\x8a\xc7\xb6\xbc\x80b\xac\xbcmW\x81<\x8c\xaeG=\xc6\x1e\xf6=\xce\xb0\xdd<!V1\xbcl\xc3\xbf\xbbSf\r>+\x8bT:\xd6\xbfx=\x951\xb1<\xca-\xe3=\x14`g\xbc\xc1\xc4\x96=\xb6M\xad;\xb4#E=\xac\xf6\xa2=\xa7\xb0(>\x8a\x91\x10>\x84\xfd\x14=\x81\xea\xbe<D|6=\xa5\xba\x97<'
-p244
-tp245
-bsV474174910462713856
-p246
-g2
-(g3
-(I0
-tp247
-g5
-tp248
-Rp249
-(I1
-(I400
-tp250
-g12
-I00
-S'\xef[T=u\xfdM\xbc\xfc\x90\xc1\xbe\xa2\xa7\x16;\xed^G=\xc9\x94\xc7\xbck\x17z\xbd\x9e\x97\x9a\xbe.\xe0\x8a\xbd\xea\x05\xce<\x8eK\r\xbbI\xb99\xbd\xed<\x88<T\xf4V\xbbHY\x9d\xbd!;h=\xc0U\xc9\xbdUL\xf2\xbdeZK\xbe\x94S\xdb\xbdB:4\xbeN\x80\x8b\xbb\xb4+\xba<\x1a~\xd6\xbd\x88\xf2\x9e\xbc\xc6O\xcd\xbd\xc4\xc4\x03=h<7\xbe(,j\xbe\x06\x9f\x83<\xaf\x15\xdd\xbd\xe34\xe5\xbd\xef\xbfn<\xfd,\xb1\xbe\x8c\xb25<.pB=\x1a\xf5\xeb<\x97\xd7\x91<^r8=\x90hl<?\x8b\x16\xbe\xc0\xd7\x0f\xbe\xaf\x84\xe9<\xa3U?\xbe\x1bW?\xbe\xbd\xf9\x06\xbb%\xca\x82=\xf6L1;"\xa0\xcd;\xc2Tp=_\x1f\x15\xbd\x18\xc9n=\xd3"\x0e\xbe\x03\x9f\x82:\xab\x9b\xf9\xbe\xfeX\x1e=\x06`\xe8\xba\xd4xs\xbd\x91~\x1b\xbf\xd2)\xe8\xbe.\xc1\x0c=t\x0f\xc7<\x0b\xc81:\x95ui\xbe"\xee6\xbc\xb1c =\x7f[T\xbe\x16\xc6\n=\x9a\xc4\x91\xbd"\x99(\xbe]\xb8\x0b\xbf\xab\xea\xac\xbeN\x01\xe4\xbd\xf2|\xcd\xbd\x87\xac\xf8\xbdVb\x0e=\xf7\x1f\x11=\xd5\x10\xd0<\xbcW\x83<\x87\xe7\xe4<\n\xd4\xb6\xbcy\x18\x1e\xbaTj\x04=\xb4\xbdy\xbe,w\xa9<\x82bx<\xe4C\xfe<C\xba\x98\xbe}=\x9b=y:"\xbc\x9c\xc6G\xbe/\xa4\x04=\x8a\x86\x87\xbe)\xf3\x8e\xbd\xa9\x9fR=\x83C\xe8\xbb\x8d\xcf%=A\xf1$=\x1eD\xf9<,.\'\xbe\xba,Z:\'\x0f*=q\xf7p<\x1c\'\xb7<\x1b\xf1\x90=j\xff\x8c\xbe\xb3h\xc6;\x87Az<\x81\xc20<@\x0b\x18\xb9\x7f\x0e\x94\xbe \x94\xf8<\xadEU<\xda\x18\xec<V9\x82;:\xf9f<w\x1a\xad\xbe\xab8\x12=\xa4x\x98;6\x08@<.\x1f\x9b=\xcdP\xac<\x1c\xa4\xac\xbc\x1b\xc3\x9d\xbc\'4e\xbd\x9f\xab4=\xe5\x9a \xbexj\xf8;"\xe0\x98\xbb\xd9\n\x8c<\x11\x06\xfb;;\xf5s<\xe1\x89t<D\x07\x08;\xbf\xd24<\xea\xaa\xa3<\x03~\x95\xbdjt\xa1\xbb\x99\xb4\x07\xbe,b8<\x06\xa9B\xbe\xe2\x85G=\x91C\xec;\x12\x11\xaf\xbe\xafq0=\xe5\xdcI\xbax\xcd\xe6<\xeaDT=\x8c\xba\r\xbe:\x92\x0f<8v\xcb\xbb\x91+\x16\xbeT\xa9\xd2<\xdd\x90\x02=\x8dP\x9d\xbcM\x80;=\x1ew!\xbe\xc8\xcax<|%\'<\x14\xfc\x93\xbe\xa7\xaa#\xbd\xca(\x98\xbe\xb4\x08\xd5\xbe\xc5/Y\xbe\xcfT\xeb\xbb1R\x12\xbd\xe1\xcd\xb6\xbe\x06\xf35=\xbc\x02\x91\xbc\x149\xf5\xbd\xc6\'~\xbcw\xb6\x85\xbeC\x16\x14\xbe\x01(\xab=\xf1\xbaA<\x86\x97\xfb;\xdc\x01\xc3\xbe;K\xe1\xbe\x01\x9d\xdb\xba\x89{\xe3<R\xed*=\xed\xabN<\xa8\xc9g\xbe\xd2\xee\x9d\xbd\x10\xec==:\x7fG\xbc\xc8`\x1d=\xd7\xb3B<]\xdb =EOq\xbe\'1~<\x8e\xe9\xda;L~\xa0<oP\xd1<2\x9bP=\x80\x01W=\xf1\xe3\x13\xbc\x1a\x16\x11<a\x8c\x85;\x05\x87\x94<Gu\xdc>x\x18\x9d=z\xa9n\xbd\x00j\xff;F\xa8\x8d>yD\x80\xbcW\x0c\x83\xbc\xe3l\x07\xbdB\xb9\x91\xbb\xf5\x15r>|\x0c\x1d<.\xb7\x8b;\xd9\xb7\xcc=\xfa^v=\xca\xc2\x9e\xbc\xe33\xd3>\xd0\xdbD\xbb\'\xc7\xaf\xbb\xb7\xf3\xad\xbc\xefE\xec\xbaD|\'\xbd\xc8\x1d]<\xd9\x800>\xe1"G\xbd\xff\x96\\\xbc0\xb36\xbc*dE>\xa4\xc2!\xbd\x0f;\x18\xbd\xc7\xaf0=\xe5\xc3\n\xbb\x92\xd9\x9e\xbc\x9b\xa9\x84=e\xf6.\xbd\x84;\xd4=\xb0/\xa2>\x81\xa0l>\x92eB>\x8f\xdf\xb0>\xf6r\x98=3uj\xbcB\xc1\x0e\xbb\xb4\xb8[>Z2\xfb\xbc!\xbd\xa6\xbcD\xa1b;\xd1y\xc9>\xd7\'\xa7=\xc2\xe99=q2\xff>\x07\xf8\xd4;]\xb5\xc0>W\xeb\xf9\xbc\xb3o.=[\xbf\x8d\xbd5k\xea=\x10Q$<\x80\xfc\xb1\xbcN?\x84\xbd\xaf<w\xbd|j!>2I\x90>\xaad\xf6=\xe9\xdd\xf3\xbc\xd5\xa6\xdf\xbb\x0b\xf8\x10>\xe5y\xd2\xbc\x03G\x9e>\x96E/\xbd\x15\xa2\xcd\xbcb\x96\x8f\xbdF\xb1-\xbd\r\xf4\x04\xbc>\xeb\x9a\xbc\xfff\xc9\xbcg|\x07>\xd1\xe6\xdb=\x85W$>8\xb7T>\xfc\x1dR>I\xa5\x13\xbc\x19]\x9f<8>\x9b><\x8f\x06\xbd8\xb9=>?\xa8\xd2=\xd4\xe4\x8d>\r\xc98\xbd\xban\x06?2\xc6\x8b<\xf1\xe6\x9e\xbc\xcaD1>s\xe4\x0e\xbd\xa2\xfc\xe7;f\x8f\x9a>\xbb\xaa\t=l\xca\x95>\xc6\xec\x99>\x04w\'>\x94m2\xbc\x16\x82/=\xb7\x80\x80>k\x03\xd6=2\x8f@>|\xa2\x05?B\x89)\xbdEo\xc7<\x18uD>Z\xe3"=\x81>(<\xd8\x1f\xae\xbc\x8b\xd2V>\x9fuy>\xe0\x9dY>\xa2B;=-\xe5\x89<hwD\xbdF\x1b\x95>]QM=\x88\xcf\x9a=\x02B\x00?)(#>Y\xa7\xa5\xbb\xb5\x97\x06\xbc\xf9xW\xbbsWW>q\xac\xc1\xbc\x95\xb5\xbe=\xa5\x9a\x87=\xdbr\x10>E\xb4/=\xbc]\x03>\xe7\\\xa9=8\n\xb7;\xb1&b= \xf5\x1d=\xe4\x11L:\x05[\x12<\x91\xae!\xbc\xe1\x8e\x93<c\xe4\xad\xbc\xfbL\xa2>\xa7\xd8\x06>\xac^2\xbd\xeaS\xbf>\xc9]M=\x08&\xf8=!\x1d\xd8>:\xcd\xf8\xbc\\^;=\x8f,\xe5<\xa6\x8d\xcc\xbc\xa1\xa2\x8e>\x8d\xb4R>\x11c\x80:\xd9\xf7\xa6>\xcc\xdf\x94\xbc2\xee\r>kq\xc8=\x7f $\xbd\xf6\x02\xb2<>\xd2\xb7\xbc\xa1\xc1S\xbd!\xf2\xe2\xbc}\xbc\xd6<5\xbe.\xbc\xd5k{\xbdt\x12\x95>k\x94l=CwO\xbcJ\x18\xe8\xb9\x85\xfc\xdf\xbc\x92\xe1\x1d\xbcue\xe7>\xa0/m<\x19/\xa2=\xe3\xdd0\xbdfQK\xbd\xc5\xf0!>^b\xfb=@\x04\x9a>@s\xa2<Oe\xcd\xbc\x02\xe3\x1c\xbc7\x02\xc1>\xfa\xfe0<la?>\x92\x8eQ=\x1e\xbf\x99>\xcfG\xd3\xbc\x17\x84z>\xad9\x87=\xbb3\xf6=.\xa3\x8a>m\xaa\xec>\n(\xc7>q\x10K<)\xbf\x8d=4\xb4\x91=\xb7,\xa3='
-p251
-tp252
-bsV445262125070422016
-p253
-g2
-(g3
-(I0
-tp254
-g5
-tp255
-Rp256
-(I1
-(I400
-tp257
-g12
-I00
-S'Z\xe9\x94;\x9e\'\x8b\xbex\xc0\x8d\xbfP\x98\x88\xbd]\xcf\xc2;%\x8a\xa5\xbeh\xa1U\xbe\xbe\x8e\xee\xbeC\x8a\x9b\xbe\rT\xba:+@t\xbcP\xf2\x89\xbeL\xbfA\xbb\xb3\xf00\xbc_\xbe\xd4\xbe\x14\xcc\xcc;\xfe\xd6\\\xbexF\x9f\xbe\xe8\x11\xb0\xbe\x94S\xdb\xbdNE:\xbf\'\xb3\x88\xbd\xf6B\xb2:\x90\x95]\xbf\xe6\xfc\x0c\xbd\x80=\xa7\xbeP\xc4\x8e\xb5\xd5"3\xbf\x90\xe6F\xbf]:\xbb\xbb\tLY\xbe\xd6"\x9b\xbe\x9d\x0e\x1b\xbc\x1dC"\xbf\x86\x1f\x1d\xbd\x82\nL;\xdc\xe5\x87\xba!\xf2\r8\xa3\xc2\xcb;)\x8bW:?\x8b\x16\xbe\xc0\xd7\x0f\xbe\xe3\x13\xfe;9\x95e\xbf-\xbb\x87\xbe\xcf({\xbd7\x0b\xdb;4\x10\x12\xbe\xc9\x94\xd4\xbc,(\x1d<G\x08\x0e\xbe\xc0\xfb\xe7;\xf45\xef\xbe\xf3\xef\xe6\xbcV\xbc\x8c\xbf\xa8)\xaa;\xe1\xe6\xc0\xbd@\x00\xc8\xbeJ\xd9\xb4\xbfc\x8b\x87\xbf\xb7y\xcc;5\xb0&\xbe\xfe\x0e\x86\xbe=\x002\xbf\x7f\xa0\xaf\xbeJ^\x18;m\xba\x0e\xbfa\xa8\';\xe0s7\xbf\xbc\t\x83\xbe\xab\xea\xc9\xbf\x9a\xc0=\xbfN\x01\xe4\xbd\x07\xc2\x8c\xbe}\xbc\xc4\xbe\xae\r\x80\xbbJ\x10(\xbbT:\xf5:\xcd\xf0\x94:\xbe\xf04\xba\x12\xd5\xe5\xbe^\x91\xff\xbd8>\x07<\x8d\xb6\xfd\xbe\xc5\x1fB;yb\xb9:\x06\x07\xb0;\x8b\x9fF\xbf\x84#\xf9;y:"\xbc{\xdf\xcf\xbe\x18,\x1a;\xa8\xfeB\xbf}\xf5\x13\xbe\x17\xf6\x9d;\xa0{\xba\xbb\xd4v:\xb9\x95@\x9c;\x7f\xf4\xaf:&\x13s\xbe[X5\xbc\x1b\x99\xbb;\x97\x863;\xa1\xb3\x86;\x80\xfe\x05<\t\xf0\xfa\xbe\xda\x84\xa3:l\x9d\xa4\xbd\xf2\xf1\x07\xbc\xeau\xaa\xbd\xc5\xe2\xf3\xbe\\\x98\xf77N!0\xbaX\xd3N;\xddVo\xbe$\xab\xe0\xbd/N)\xbf\xff\xb0\xd4;\xeb;F;>\x0e\x84\xba\xfe\xeb8<\xd5\xfa\xc5\xb9\xd3\xc1\xf1\xbd\xbe\x93\xbf\xbd~\x80\x0e\xbeL\xdc\xa7;\xe7\xe4\xc9\xbed\xd8+\xbd\x8f\xf5\x9c\xba\xe4e\xdc:\x1e\xe1:\xbd\xe6\x995\xbb\xb7\x8fv\xbd\xfc\xd1\xac\xbb\x19&\x85\xba\xc7\x84\xe5\xbbZM\xe6\xbd\xa4\xb3\x10\xbe\x99\xb4\x07\xbe\x89\x8eF\xbc\xb6\xcd\n\xbf\xef\x0b\xb7;\x9c\xe5V\xbe\xaf\xb93\xbfs\x90\x83;\x7f\'U\xbe\xc5\xb8\xc8;\xea\xf8\x939F>\xd8\xbe\xd4i\x95\xbe\x81\xac\x17\xbe\xc7b\x0c\xbf>\xbe\xb1;W\xfd\x9d;n*\xdb\xbd\x8a\x8d\x95;C"\xa2\xbe-&\xa5\xba\xb3\xdd>\xb9\xa2\xb1I\xbf\xa7\xaa#\xbd\xeev:\xbfQMH\xbf?\xb1\xba\xbe\x13\x1a=\xbeG\x95\xfe\xbe\xd2ja\xbfib\x06<\x90k_\xbe\xb4*\xb7\xbe\xcbn\x0c\xbe^\xf4\x1e\xbfr\xdc2\xbe\xdb\xa06<X\x04l\xbc\xea\xf3?\xbe\x90\x97v\xbfT\x98\x85\xbf$>\x10\xbe\x1a?\xd19L\xb4\x99;\x1e`\xe6\xbc\xaf\x86\xef\xbe\xec\x92\x93\xbe,\x03\xfd:\x83q\x8b\xbbJ\xa7\xff::w\x10\xbc\xe4\xe6\x91;\x05\x80[\xbf\x16W\xc38\xc8\xd0\x9b\xbd\xbd\x89\xd0;W/\x98;bh\xfd;\xbc\t\x03<P_\xc0\xbc8\xed\xea\xbb\xd0\xb4\x90\xbc\x82\x94\xcb;\x172J?\xc3\x1fe>\xf4\xe4\x0f\xbc\xab\x9cL<\x9d8&?\xf8\xb0}>\xca\xc3\xcb\xbaO\x97\n\xbb1\x94\xec;\xe9\x89\x17?\xeb\x91Q>\xa2\x05v>Kw\x1e?\x8bn[>\x01\x7fi;(\xc4X?\xae%}\xba\xff(\xf1\xb8\x9ay\xa1:SU{>N\xcb\x9a\xbb\x82\xbc\xd8=\x05\x8f\x9a>\x1aa\xd4=\xe0)\x8f=\x13_@\xba\x94|\xd9>\\\xaa\x8d\xbb\x10\x19\xa0\xbb\xd7\x19\x11?\xcei\xbe=\xbe\xb9a\xbb~\xf0\xdc>\xbf\xba\xb2\xbb\xc8\x81\x83>\xda\xab\x15?\xfdN\x93>\xb3\x8d\xad>P\xcdh?+b\xb0>V\xa4\xb0=\xdeX|>\xcf\xda??P\xd7\xad8_\n\x90\xb8V+\x94=x$l?\xb89\x02>?\xdc\xaf=\x9djr?T\x9d4>cm\x8d?k\x16\xac\xbbJ\xb1\xcf=@\xad0\xbc\xfd&\x1a?\x8d\x89Q<\x9f\xa3C=-\x07\x15\xbc\xdd\xfe\x00\xbc)5P?J\x84\xf1>\x891=>|\x07\xfd\xbb\x88\xf3 \xbb\xbfF\x1e?\xf8J\xd1\xbb#\xc7\x17?hK);\xda\xf8\xfb8*U\x1e\xbcJ\x97\xcf\xbb\x8d\xe8f>\xca8\x14\xbb\xa2\xe3\xc0\xbb]\xc9(?\x9c\xac"?\xc7\xe3\xb1>\xadU\xad>\x0f\xb6\x16?\xab\x0f\x9b:Ww\x9e=w\xe7E?)\x13|\xbb\xbc\xc8\xe9>\xdc\xd3\xec>\n\x0er?/\x0b\xbd\xbb\xcf\x9c\x85?\x1a\x0e\xa3>\x8f\x06\x13\xba\xe5\xf1|>\xc0\x84}\xbbh\xa4t>"},?*5T>\xf2\x9b\x99>i/\x1f?\xea\x9a\x96>\x80\x99\x90<s\xac\xa9>\xa3\x9d`?\xbc \xba>\x1dp\xd8>.\xa6\xb5?\xc9^w\xbb\x0ep\x01>gO\x8e>H\xefZ>\x98\xdd\x8b=\xb7\xd2\x83>\x01pL?\xd9.\xd9>Z.\xf0>\xa2B;=\x11+\xd7=\x9a\xd7\x1f\xbb\x1b\xda`?\x07/\xa1>q\xf3\x11?\x9c\xae\xad?\xb1\x93X>G\x8f\x9d<\x98\xb3\x12=\x93jY=\x16\xf7\x04?\x94\x86\xea9\xfb"\xd1=\x01m\x06>\xfa\xeb\x02?l!\xdb=\xbc]\x03>P\xe4l>\xd0\x1e)>\xadj\xb6>\xb9a\x98>\x90\xd3t<\xbd\x18\x83=2\xd1\xbe>\xe6n\xb9>\x9flA\xbbS_X?\x892;>\xffK\xab\xbb\xf3\xfa7?FI\x85>\xd7\x93 ?\xd3w\x16?\x83\xff\x9f\xbb\\^;=\x8f,\xe5<\x06|{\xbbJvG?W2I?\xbe\x1e?>\x8e\xc9X?@\xfd^\xba \n\x97>k^=>\xc1\x11\x9a\xbb\x10\xa76?\x95  \xbb\xc0\x90\x8c\xbb\xb2\xbf\xbb8\xfan\xb9=h\xd3\xa8;\x90\x07\xb2\xbb\xab\xb8P?k\x94l=\xf6\xb6\xf3\xba\x1a\xda\xca=\xc5\xdfK\xbb\x7f6\x0b>\xaa\xab\x93?\xce}\x84=\x19/\xa2=\x0e\x98\xdb\xbb\xd4W\xc0\xbb!\xc5=>c[X>@\xc0&?\xdc[\x13>(\xca\xfa\xba\xfe\xf3\x98=\x129\x00?\x93\x13\xb6=\\\xc2\xda>\xd3%\x08>\xf1fj?*R\xb5\xbb\xd6r\x02?\xa6\t\xca=\xd3Q\xa2>\x80\xe4J?\xdc-\x83?`(h?\xae\x89\xc9>\x9e\xad]>\xcdwZ>^\xcb\x0e?'
-p258
-tp259
-bsV445259595649646592
-p260
-g2
-(g3
-(I0
-tp261
-g5
-tp262
-Rp263
-(I1
-(I400
-tp264
-g12
-I00
-S'I\xf9\xa2<\xeal\x0b\xbc\xfc\x90\xc1\xbe\xf6\x9a\xee\xb9KS\x91<\xc9\x94\xc7\xbck\x17z\xbd\x9e\x97\x9a\xbe.\xe0\x8a\xbd\x1f\x8e\x81<\x8eK\r\xbbI\xb99\xbd\x9eu\xad<^\xb4\xf1;HY\x9d\xbd\xb7\xff\xbd<\xc0U\xc9\xbdUL\xf2\xbdeZK\xbe\x94S\xdb\xbdB:4\xbe\xfe\xe6`\xba[\x81\x84:\x1a~\xd6\xbd\xff\x96\\\xbc\xc6O\xcd\xbd\xb4!-<h<7\xbe(,j\xbePy\xcd\xbb\xaf\x15\xdd\xbd\xe34\xe5\xbd\xf7\xe3\x89<\xfd,\xb1\xbe\x00dc;\xd9\xa1\xd5<r\x96\xad\xba\xb9\x02 <7A\xdf<\xe7vl<?\x8b\x16\xbe\xc0\xd7\x0f\xbeDA\x91<\xa3U?\xbe\x1bW?\xbe\xf8\x8f\xae\xbb\xe4d\xc5<R\xa0\xdb;\xa2|0;\xf6h\xdb<_\x1f\x15\xbd\x94i\x08=\xd3"\x0e\xbe\x85\x81\xdd\xbb\xab\x9b\xf9\xbeo\xba\x9e<?T\x0f\xbc\xd4xs\xbd\x91~\x1b\xbf\xd2)\xe8\xbe\xda(\x8c<\x99N\xa8;\xed\x7f\xf0\xb9\x95ui\xbe\xfa\x97<\xbcP\x9e\xae<\x7f[T\xbe\xbdr\r<\x9a\xc4\x91\xbd"\x99(\xbe]\xb8\x0b\xbf\xab\xea\xac\xbeN\x01\xe4\xbd\xf2|\xcd\xbd\x87\xac\xf8\xbda\xd8\x94<\x8eR\xa4<\xec\x950<1\xd8Q<-\x1c\x98<\n\xd4\xb6\xbc\xf2\xfb\xa3\xb9\xbf\xd7\xf7<\xb4\xbdy\xbe\xa0\xb4I<)\xd0I<\xae\xfb\x90<C\xba\x98\xbeu\x10\x12=y:"\xbc\x9c\xc6G\xbe\xaa\xfe\xb9;\x8a\x86\x87\xbe)\xf3\x8e\xbd\x07\n\xa7<\x1c\x9f\xba\xbb\xab<\x81<\xdc\xdf\x94<gV_<,.\'\xbe\xacep\xba\xd3b\xea</<v<\x9bup<<LP=j\xff\x8c\xbe\xa7\xc9\xa9\xbb]\xa2\x06;\x808N<\xa4\x0f\x9f\xbb\x7f\x0e\x94\xbe r\xd0<\x16v\xf9;\xc4\xees<\xdf\x89^\xbb\xe2\xbc\xb4;w\x1a\xad\xbe\x1d\xf3\xc3<\xa9\xde\xa2;v\x86\x0f<\x14\xc7/=\x87\x9f\x8f;\x1c\xa4\xac\xbc\x1b\xc3\x9d\xbc\'4e\xbda#\xbe<\xe5\x9a \xbe\x88\xa6\xf9\xbb\x1f\x89\xba;*\xbd\x89<\xc6)\x08\xbcZ\xf7\x07;$9\xad;\xcfoa;\xdarB\xbb\xf1\xc8\xe3;\x03~\x95\xbd\x9dJ\xfb\xbb\x99\xb4\x07\xbe;\xb5^<\x06\xa9B\xbe\x19s\xea<\xaf5\x9b\xbb\x12\x11\xaf\xbe\xb9\xc1\xcf<D[\xd7\xb9o[\xad<\xac\xcc\xfe<\x8c\xba\r\xbe\x9f\xa8\xd5\xbb7\xac\x17\xbc\x91+\x16\xbe\xd9\xe3\xfd<&.\x06=\x8dP\x9d\xbc\xed\xb6\xec<\x1ew!\xbe\xc1\xcd2<\xc5|b;\x14\xfc\x93\xbe\xa7\xaa#\xbd\xca(\x98\xbe\xb4\x08\xd5\xbe\xc5/Y\xbe_\x13\x01\xbc1R\x12\xbd\xe1\xcd\xb6\xbe\x81\xba\xdf<\x08 H\xbc\x149\xf5\xbd\xc6\'~\xbcw\xb6\x85\xbeC\x16\x14\xber9\x1e=\x8a\xdd\x11\xba\t\x80\x0b\xbb\xdc\x01\xc3\xbe;K\xe1\xbe\xe7\x80$\xbc\x06\xc5\xdb;\xc2\xd1\xfb<>k\x9f;\xa8\xc9g\xbe\xd2\xee\x9d\xbd\xf7\x1d\xe6<\n\xbc\xa3\xba\\\x903<-\x8e\xb4:_\xbd\xee<EOq\xbeJ\xf7\x95<:\x97\x06\xbcW\xeb><\xd0l\xb8<\x01h\x13=>\xe1\xf2<\xf1\xe3\x13\xbc\x16\xcd\xd2;\xe0wB<\x13#\x11<Gu\xdc>x\x18\x9d=P=\xfa\xbc\x00j\xff;F\xa8\x8d>E\x15\xbc;\xab(\xb6\xbb\xe5\xd2\x95\xbc\x88C\xff\xbb\xf5\x15r>\t\xe4\xfd;s\x9d\\\xbc\xd9\xb7\xcc=\xfa^v=\xdf\x90\x1d\xbc\xe33\xd3>\x18\xb6\x91\xbb\x98\xc4<\xbc\x05\xd0\x00\xbc:\xa2\x9b;\xb53\xcc\xbc\xc8\x1d]<\xd9\x800>=8\x93\xbb\xec\xa0z\xbb\x0e\xc3\x07\xbc*dE>\x1b\x91\xa2\xbc\xce\x18\x05\xbd\xc7\xaf0=\xf2Q\x8d\xbcA\x1b\xcd\xbb\x9b\xa9\x84=\x13o\xcc\xbc\x84;\xd4=\xb0/\xa2>\x81\xa0l>\x92eB>\x8f\xdf\xb0>\xf6r\x98=\xc1\x94\x05\xbas\x14\xb6;\xb4\xb8[>!\xf0\xd5\xbc\xb38\x1f\xbc\xe3\x9fe9\xd1y\xc9>\xd7\'\xa7=\xc2\xe99=q2\xff>\x97N\xab\xba]\xb5\xc0>Y\x97\x7f\xbc\xb3o.=7\xaa\x11\xbd5k\xea=\x06`\xe8\xbal\x16\xfe\xbbb\x9a\x1d\xbd\xbc`\x04\xbd|j!>2I\x90>\xaad\xf6=5f\xda\xbc\x81\xb0\xf2\xbb\x0b\xf8\x10>7\xe0{\xbc\x03G\x9e>uK\x89\xbc\xbaJ^\xbc{8:\xbd\x05\x08\xd5\xbcY\xd22:a\x85\r\xbc\x14\xf3W\xbcg|\x07>\xd1\xe6\xdb=\x85W$>8\xb7T>\xfc\x1dR>\x06\xae\xfe\xbb\x19]\x9f<8>\x9b>\xaf\x89\x95\xbc8\xb9=>?\xa8\xd2=\xd4\xe4\x8d>\x8c\x03\xfd\xbc\xban\x06?_U,<\xc4N\xa2\xbb\xcaD1>\xa7rA\xbc\x8a\xb1\xf8:f\x8f\x9a>\xbb\xaa\t=l\xca\x95>\xc6\xec\x99>\x04w\'>\x87\x18\x199\x16\x82/=\xb7\x80\x80>k\x03\xd6=2\x8f@>|\xa2\x05?\xee\xeb\xb1\xbcEo\xc7<\x18uD>Z\xe3"=\x81>(<\x10\x03^\xbb\x8b\xd2V>\x9fuy>\xe0\x9dY>\xa2B;=-\xe5\x89<\x94>\xde\xbcF\x1b\x95>]QM=\x88\xcf\x9a=\x02B\x00?)(#>\x12\x9a\xb4\xb9\x99\xf8\n\xbcj%@\xbcsWW>\xa5\xb1@\xbc\x95\xb5\xbe=\xa5\x9a\x87=\xdbr\x10>E\xb4/=\xbc]\x03>\xe7\\\xa9=`\x90\xef;\xb1&b= \xf5\x1d=\xeeG\xa5\xbb;:C\xbb\\\xab\xfb;\xe1\x8e\x93<\x84\xfd\x98\xbc\xfbL\xa2>\xa7\xd8\x06>\xe2\xf9\xb3\xbc\xeaS\xbf>\xc9]M=\x08&\xf8=!\x1d\xd8>F\xe03\xbc\\^;=\x8f,\xe5<\xbe\x0e\x92\xbc\xa1\xa2\x8e>\x8d\xb4R>\x971\n:\xd9\xf7\xa6>\xb0\x9aJ\xbc2\xee\r>kq\xc8=\xa2\xd0\xc9\xbc\xa3;\x8b<k\xe2\xa7\xbcE-\x0e\xbd\xa9T\x88\xbc}\xbc\xd6<\xbb\x0e9\xbc\x9a\x13\x05\xbdt\x12\x95>k\x94l=Q\x97Z\xbc4\x9d\xa4\xbb;\xc4\xe2\xbco\xb5A\xbbue\xe7>\xa0/m<\x19/\xa2=\x92\xa9\x0e\xbd\xaa\xac\x03\xbd\xc5\xf0!>^b\xfb=@\x04\x9a>@s\xa2<\xc9w\x9c\xbc\xdeb`\xbb7\x02\xc1>\xfa\xfe0<la?>\x92\x8eQ=\x1e\xbf\x99>8\x1e\xb4\xbc\x17\x84z>\xad9\x87=\xbb3\xf6=.\xa3\x8a>m\xaa\xec>\n(\xc7>\xd3)\xc5<)\xbf\x8d=4\xb4\x91=\xb7,\xa3='
-p265
-tp266
-bsV473440765255766016
-p267
-g2
-(g3
-(I0
-tp268
-g5
-tp269
-Rp270
-(I1
-(I400
-tp271
-g12
-I00
-S'3c,<%\x1d\x07\xbc\xe4f\t\xbe\xe8\tO;6c6<0#/\xbc\xeb[\xc3\xbc\xcc\xfe\xb1\xbd%T\xae\xbc6\xb9\x01<\x84\xa1\x0e;=A\t\xbd\xf1\xc3\xae;\xca\xec\x0f:\x1a\xcf\x0c\xbdr\x1dQ<Kw\x01\xbdU\x16-\xbd\xd5\xbbe\xbdTg\xc6\xbc9J\xb5\xbd\x8c\x1a\x16\xba\x0e\xd5c;qk=\xbd\xe6\xe44\xbc\x08\xcc(\xbd\xdb\x95\xa6;\xf3f\x88\xbdEc\xe1\xbd\x8c\xe6\xfe:\xe7\x16?\xbd\xfa\x0f"\xbd\x91\x0f\r<\xa7\x9d\x01\xbed\xd8\xa2\xb9%\x8cj<\xdc6\x8d\xb7F\x11\x85;eTS<O\x11\x80;\x9a\xe75\xbd\xe5I\xc2\xbc\xbe\xf3\x05<\xd0U\x98\xbd\xfc\xe3\x8d\xbd<d\x8c\xbc\xb4\x12\x9a<\xd8\x1a\xac\xb7hC\xde9\xd7\xa5y<\xe2\xfb\n\xbc\x8d;\x84<yTv\xbdb\x83\xb8\xbb,\x0e*\xbe\xba"%<T\x80\xbc\xbb\x0fh\x1b\xbd\xa6\xa8J\xbe:\x08#\xbe\xf1-\x16<\t\xcd3; t\xf4\xba \x1e\xb8\xbd\xe1f\x0b\xbc\x1b0\x19<\xa42\xb5\xbd\xcf\xa8\x13;F\x08\\\xbdN\xf7\x85\xbd\xbf<?\xbe\xf3\xba\xf9\xbd\xa7\x95\xb2\xbc\x8f\xeb5\xbd\tSW\xbd\xc1\xa7<<\xe93\x1d<\xfd\x18\x8d;$\xb5Y;$Hi;(Z\x8f\xbc\x92\xc7,\xba\x0c\xac\x83<\x0e\x85\xb7\xbd\xf5#\xb4;O\x9f\xe8;\xc7\xff<<\x89W\xfa\xbd(\xe5\xa4<\xbaP\xb0;3D\x8f\xbd\xb6\x84e;\xd8#\x99\xbd\xf43p\xbc\xbd\xe4J<\xa3\xd4^\xbb\xdf\xa0\xa5;s\t\x15<,\xab\x0c<\xcc5\x19\xbd\xc8\xbf\x01:\tq+<\xa36\x00<Q\xf2?;\xba\xfd\x88<\x00\x1b\xdd\xbd\xfb\xd1c\xbbN\xc6G:\xae\x1f~;\xe4`l\xba\xd0\xe4\x9e\xbdL\x80\xf3;\x8c\xb8\x87;gz\r<\xca\xac[:~{=\xb8\xb6+\t\xbeo\xc9\x15<\x97\xaf7;D=\xbf8h\x11\x9f<?\xb37;h\x96\x1c\xbc\x00C\xf2\xbc\x81"\x11\xbd\x19\x1fJ<\xc5\xb8C\xbd\xba=\xbe\xba\xd7e-;\xf7\x08\xc4;\xbc\xe3k\xbb\xe8\xc0\xfd\xb88\xb7\x01;\xc0\xb2\x81:\x8a\t\x0c\xbb\x87\t\xff;i\xbf\xee\xbc\x98Z\xe5\xba4\xf4\xf4\xbc\xf4\x01\xb7;\xee6\x9b\xbd\xbc\xe4M<RTY\xbb<Q\xec\xbd\xbe\x06%<\x14\xce\xdb\xba\xcaR5<o_\x1f<\xcd\x0b\x7f\xbd\x14]\x04\xba\x95\xdc\xe1\xbc\x145\x89\xbd\xc1\xee\xff;\x14\x9f|<\xfa\xad!\xbcC\xcc\\<tnx\xbdehy;\x0f\x17I:\xd4%\xe8\xbd\x198\x02<-\xb3\xc3\xbd4\t\x1e\xbe\xff\xd4\xb9\xbd\xeeU7\xbcb\xa7\xb9\xbc\xb5O\x1c\xbe!\xf7e<\xc3\xbbK\xbc\x96S-\xbd-M\xa7\xbbAl\xd6\xbd\xf4\xaf\x12\xbdj\xfa\xca<\x80\xb8=\xb7\x0f\x0fO\xb9\xe7L\x15\xbe\x0e\xc5\x10\xbeg\xf0\xd6\xbb\xc6\xef\x84;\x85\xfch<\x98\xe2`;\xa5\x03\xaa\xbd\x859\n\xbdw9\x06<nB\xe8\xba\xb4\xa2\xce;\x1e\x00\xac\xb8k\x8ce<t\xeb\x97\xbdI\xbe\xe5;\x08\x17\xee\xb87\xf1\x04<\x8au\xa9;u\x07\x8a<\xe8\xed~<\xef\r\xbb;\xdc(\x8d;\xb3\x96\x9d;?\x14\xca;G\x1b\x03>L\x1f\x84\xba\xf9\xe7y\xbc\x88\xaa%<\xac2\xbf=b\xf1\xb39x\xe8{\xbb6\r\xe6\xbbxT\xad9\xf7\xf3\xbf=\'m\xae;\x92\x94d\xba\xc6\x9a*=\xea*$<m\xc7\xb1\xbb\x1cx\r>\xb2^\xeb\xba\xe4\xe0&\xbb<^\xb0\xba\xeeF{\xbam(*\xbc\x8f\x0c\xec;r\xfaA=_\xdaL\xbc\x12\x80\x8a\xbbQ]\x00\xbb9\x9a\x9d=\xc8\r\x02\xbcv\xd1a\xbc_\xee\xbc;\xb6v\xef:Q\x91/\xbb\t]\x16=S\x1e2\xbch\x84\x9c<"\x9f\x04>\xde\xb9i=\xff\x9fB=H\xe9\xf5=%\xcc\x1f=L\xef\x05\xba\x84\xf5\xd7:\xd5ou=\x14xG\xbc\xd1\xcd\xe1\xbb\xd4\\!:\x83\xe7\x0f>\x83\x0c\x14=\x84\x01\xaf<H\xe6,>"\xa3\xee:3\xb3\x17> \xd6\x1e\xbcEr\x1e\xbb<br\xbcYI\x8a=\xe0\xf8\x02:\xa0Gz\xbbXa\x84\xbc\xe4\x01\x80\xbcG\xd2\x94=\t~\xb0=\xa4\xd0\xee<\x82\xedM\xbc\xb8"=\xbb\x8a%\x9a=\xa9\xff-\xbcK&\xb5=!cP\xbcR\x9c\\\xbb\x80I\x96\xbcd\x9bj\xbc"\x8d8;\xe5\x9c\x01\xbc\x8b(\x18\xbc\x95Hx=u\xb6\x93=2\xfbz=r<\x95=\x8a\x8f\xa2=\xb3x\xeb\xbb\xb1\xd6,<\x8dy\x02>,^\x1e\xbcn\xffs=b/\x19=\xbc-\x98="\x08\x84\xbc\xadR?>\xd2\x86\x87<i\xe6\x9b\xbb\xa5 [=&\x9a\n\xbcL\x7fY;\xc8\x10\xe6=^v1\xba5\xc4\xc4=O\x8b\xcc=\xee\xdd\x93=R\xe1V\xb8\xd7\xd3\x03<\x89\x90\xd9=8GO=\x93\xc5\x83=\x9a\xe9B>P\xc0\xe0\xbb\xb1n\x19;\xad\xcf[=`\xf3\x10=]\x8f\x00;\x9e\x10\xc3\xba7\x87\x91=w2j=\x86\x9a\x96=V3\xb0<\x92\x94\xe0<\xd2\xd4P\xbc\xb7/\xcd=8\xa51<A\xfe\xbc<x\x94;>m!I=\xb7\x0cd\xbbE\xe6\x90\xbb\xf7\xa5\xe7\xba\x8b\xb8\xb2=\x16\x90K\xbb\xc9\x96\xab;\xc2l\xae<\x1d\x7fd=\xee6(;~0\x19=\xd9S\x05=6\xd6\xab;\x8dI\x83;HQ\x08=\xe7G\x829\x109\x89\xb6\xceVX\xba\xb6_\x01=\xbc\xbc\x18\xbco>\xf4=)\xda\xbf<\x97\xdf`\xbcY\x99\xff=9z\x8c<\xe5S\x85=\xedo$>\xcfM\xbf\xbbJ\xe3-<&\x8d\x12\xbb\xc6\x1a\xc3\xbb\xd9\x96\xdf=\xa2R\xcd=9\x95\xd9\xb9\xa2-\x04>"*4\xbb\xe7\xb1U=P;\xf4<\x9d\xa1[\xbc[\x91\x14<\xa0\xca\x03\xbc\xd8\xfb\x84\xbc\x9c\x13\x18\xbc\x8a\xc3-\xbbIs\xaf\xbb\x14\x01\x85\xbc}\x04\xea=\x91\xe9\xaf\xbbr\xbe\x02\xbb\xe0\x04\xf4\xba\x89\xc0\x1f\xbc:\xc3F\xbb\'\xc16>\x11\xd7c<\xe3\x17\x8d<\x90\x86x\xbc\x90\xd6)\xbcmW\x81<\x8c\xaeG=\xc6\x1e\xf6=\xce\xb0\xdd<\x92\xc3\x0e\xbc\xd4P\xcd\xbbSf\r>S\x84E;\xd6\xbfx=\x951\xb1<\xca-\xe3=\x93\xf0\t\xbc\xc1\xc4\x96=\xb6M\xad;\xb4#E=\xac\xf6\xa2=\xa7\xb0(>\x8a\x91\x10>\x84\xfd\x14=\x81\xea\xbe<D|6=\xa5\xba\x97<'
-p272
-tp273
-bsV445265855211782145
-p274
-g2
-(g3
-(I0
-tp275
-g5
-tp276
-Rp277
-(I1
-(I400
-tp278
-g12
-I00
-S'\xc8g\xb8<:\xf0\xfd\xbc\xa0B\xae\xbff\x12\x9b\xbf\x1fI\x13<\x8a\xa2\x18\xbfy\x175\xbe\xa8\xe4\x8e\xbf\x94R\x90\xbe\x10\xff\x98<\x07}\x07\xbf\xaf\xe1\xc8\xbe\xed\xc4\x8a\xbe\xb0\xe8+\xbf\xaa{-\xbf\xb2\x13:<\xdd\xa2\x13\xbf\xb2qQ\xbf8X\xbf\xbf\xf5\x81\x95\xbf\xc7\x13\x02\xbfS\xfb\x88\xbc\xf0b\xf7\xbc\x05\x14\xe6\xbd\xa3]\xb4\xbc\xc8S\x85\xbf\xe7vT;\xb0\xc9?\xbf\x9d\xd7B\xbf\x0f\xac\x9e\xbf\xe2\xa1\xd3\xbe\x14|\x8c\xbe\xeb\x12\xd9\xbe,\xc0\xc9\xbf\xdf\x86:\xbe\xd6\t\xdb;\xd4\xb9\x9f\xbc\xd0\x83M;\xca\x05\x08<\x85\xe3\x1c\xbf\xf9\xd8l\xbf\xbf\xe1\xb8\xbf\xcbl\x05\xbf#2N\xbe9*/\xbf\x0c>\xec\xbe\xf0\xdc\x8f<b\xcc\xd1\xbe\x8dd\x93\xbe\xe9\xe5\xb3<1\xcf>\xbf\x1d\xceX<;\x9f\x92\xbfv\xd5?\xbc\x0ba\xd9\xbf\x07`\x93\xbe\xee\xb6\xe6\xbb\xd2\x93\xa4\xbe\xf9\x97/\xc0H\xb7\xc1\xbf\xc6AK\xbe\xdfZ\xac\xbcK\x04\xf8\xbc\xd3!p\xbeG\xdf\xa5\xbc \x89\xd2\xbe\x80i\xb6\xbfL\x94\x04\xbcs\xe5\xa6\xbe\xdb"\xf8\xbeC\xee\xa1\xbf\xb4\xc6\x95\xbf\xd5\x94]\xbf\x9a\xc8(\xbf\x98xr\xbf\x88[~\xbf<\x8bM\xbf\x1c\x04\xc3;\xa0Eb\xbd!R\xa1\xba\x8eP\xc9\xbe\x909\xe5\xbel\xbf\x13<\xe6\xb1\x83\xbf~\x89&<\xb2\xe3\x81\xbe\\\\\x19<KD"\xbf\xf2\xc8X<\xbe\x10\x1d\xbfcL\xc4\xbfkV\x1c\xbe^v\xdc\xbf\x94\x9f\x97\xbf\x15\xd5)<\xf2\xb7\xcc\xbci\x0f\x84;\xaaC`<*\'\xf0\xbe\x94\xdd\xbb\xbfo\x98\xe3\xbe\x9b\xf2\xb5\xbb\x05\xaa\x8f\xbd\xc5s\x8a\xbe\xaa\xef\x05\xbf,J\x96\xbfkK\xfc\xbc~ .\xbc1g#\xbf\x9c(\xbf\xbe\xd2L\x13\xc0I\xba\'\xbf\x88\xa3H\xbe\xb4r\x1f\xbd\r\xe9\xa2\xbe\xd8\x1c}\xbf=\x96\x96\xbf\xeb\xa4@;\xc7}\xac\xbf\xedI\r\xbf7\xf8\x08<\n@9\xbc\x1c\x8ae\xbe\x82\xc1%\xbd\xe5)i\xbesM\xec;i\\n\xbf\xe4\xb1\x91\xbc\x009,\xbf\x11s\xf7\xbe;z\x03\xbd\xda\xf4\':\x84`\x80\xbcU\xa8\x08\xbf\xf8F}\xbe\xa2\x9d\xa5\xbe\x8a\xe9z\xbf\xe2\xc3\xda\xbe\xd3\x97\xbe\xbf\x8690\xbfj\xc7\xc9\xbe!\xb5\x13\xbf\x1a\xb8\xf6\xbc\xf7S\x9f\xbf\x8ez\x98<\x91W\x9f\xbc\xee\xe7\xcc\xbe_\xd7\x84<\xce1\x1a\xbf\xca\xd6\xd1\xbet\xec\x0e\xbf\xff\xd1\xe1\xbe\xe3_\xba\xbb\xce\xc2*\xbf\xd8\xa7\xd4\xbe\x8b\xb0\xeb;\xea]-\xbfZg.9\xbeN\xc3\xbc\x12\x1bj\xbf \xe3\xd8\xbf\xa5\xdav\xbf\xb2&\x98\xbfc\x10\xc5\xbf\xa2\xa3\xf4\xbc\xd3\x15\xab\xbev\x19\xe2\xbf;\xda\x99\xbe|X\xf6\xbc\x149\xf5\xbd\xf2\xe1\x13\xbeT7\xf4\xbeR\xa2<\xbf\xec\xc9\x88<NU\xa8\xbe<\x1eI\xbc\x8b\xf6~\xbfl\x93\xe8\xbfHD*\xbd\xe6u\x0f<4\n\xf6;C\xde)\xbf\t\x0bG\xbf\x95\x81W\xbf\xc5\xac\x9e;^3,\xbf*\xb9\x94\xbd\xcc\xcf\x95\xbd\xa5\xfb\xd2\xbe\xd4#\x80\xbe? \xa8;\x113\xd5\xbct}}\xbe\xd4\x81&\xbe\xcb\xce\x97<Z\xdc\xa3<\r\xb0\xa1\xbf\xb2\x1e<\xbe@/\xcd\xbe\xf8\xc1\x86\xbe G\x14@%\xed\x87?\xeby\x1c\xbcM\xdc]<\x0bS\xb3?o\xe40?\xdd\x93\x0f?\x1f\xcf\x9d\xbbS\xad\x9a>\x19\xe1\xe0?\xf6\xf0\x19>\xe0m^?M^\x16?\xba\xad>>j.5>*\xf3\xc7?r\x0b\t<\xd2\xeaV>US\x0c\xbc\x12\x05\x16>S\x04\x99>\x89A-?\x06\x8f^?\xa8\xa2{?\xf5- ?\xf1F\x89\xbb\xd3R\x8b?.;\xad=\xc2vE>\xc0\xcb\xb5>xc\x81>\x00,\x89>\x9b\xa9\x84=\x04\xa5I\xbc9\x9d\x00?\xa1\xcaM?K\xdb\xd9?\xc6\xb2X?\xd9\xc1\x97?\xab\xa0\x8a>\xf8\x8f\x86<\xba\xee\r=\xd3i\xdd>\x0b\x046>\xf0\x85\x9c>;zD>\xb9\xf1\xfe?\xcc\xc28>\xe0P\xf7=~L\x15@\xca\xe7\x96<F\xaa\xa8?\xd5\xd9\x07>\xe7}k?\x97~\x98\xbc\'\xaf\x88>\xa0\xbb\'?Z\xbdR?\x00\x14\xf7\xbcg\x9b\x8c\xbcR\xe4&?\xc2\xee\x05@\xca[\xa0?\xaa\xd4+?\x14\xea"?\x04\xfc\xe7>\xfe\xee\xac\xb9\xe0\x03\x17@\xb7\xe51?\xc1\xea\xa5>\x114\x07\xbcz \xa0\xbb^DD>\x18FE?\x1fx\x89<g|\x07>*\x98\x11>G\xc2G?\xe6g\x19?\xa9~I?\xf5\xad=?\x8b@\x9c>\xe4\xe6\x96?\x114\x1f\xbc\xf9/O?T&\xf2>\x1d\x7f\x9d?\xec\xdd\x9c=\r\xb9\xe8?\x86\xec\xe1=\x8a\xe5&\xbc\x95\xd4\x94?\xf0i\x0e\xbc\x16\xf0\xe7=\x14+\xbd?\x87\xa8=?\xda\xd1\xa4?\x1a\x80\x96?\xf9>\x05?\x88w\x97<\x920\xc6>\x8dVD?\xd8b\xf6>>\xd5\x0c?5#\x0c?r\x8a\x9f9\xedlQ?He\xad?Z\xe3"=\x8a\xa5\xbe>\x8d`\xcb<\x8b\xd2V>\x7f;\x86?\xe2%M?\xa7\x93I?\x1f\xc9\x88=\x94v"\xbcd\xb2e?\x94(\xc4>\xa6\xcb#?\x16\x8f\x99?\xa2\xf7\x98?\x1a\x98\x84>\x82\x84C?\xed\xcd%?\xe3\n3?\xe75\x07=\xc2\x95\x7f?7m\x93>\xdbr\x10>\xd6\x869?\xb2\xbe\xcf?\xbd\xf1\xa6>\x9c\xdb\x8b>c\tn?\x1d/\xa5>\xd4X98\x82\xb4\xd7>-\x0c\x13= .2=\x11H\xc8=\xcd\x07%?k\xf2\x8d?\x1e\xee\x1f\xbcb@\xa3?}]s?a\xa4\x06>~\x19\xd1?\xd6fs\xbb\xdb_\xe7>\xcf.T?\x9c\xf1\xb0=u\xa0V?:b\xe0>\xf3\xd9\xe9=\x11\x9b\x96?\xeaY1\xbbg]\x19?9\x03\xad>ne\x13\xbc]\x8b\x86=\x83\x83C;\t\x13.\xbc\xa5\xed\x0c\xbb\xde\xc3r?<\x83\xc1>\xd3\x18^\xbc\xb6\x88@?o\x9c\xa2?a\x0e&?C\x10\xa1>\xaa=\x95>\x8a\x92\x9f<\xfc\xa7\x06@\x0c5W?u\xc3\x02?q\xd7\xec\xbb\xfb7\xaf\xbci1\xf2?(\xe6b?\x14N\x8d?\x97\x80\xb2>:\xf2\x0b\xbc\xdf0\n?/\xf4\x83?\xfa\xfe0<\x07b\x97?\xd1)\x82>tD;?x\x95\x9b?\xfe\x7f`?\xed?Z?\xfd\x95\xc1>j\xc3\x85?\xe0?\xf8?\x0b&\x87?^\x98O=\xbf\xfb\x8a>\xf0\x9d\x96>\xf6\xfcB?'
-p279
-tp280
-bsV445258417700372481
-p281
-g2
-(g3
-(I0
-tp282
-g5
-tp283
-Rp284
-(I1
-(I400
-tp285
-g12
-I00
-S'\xee\xfb#<\xf1\xbf\xb7\xbbq7\xfa\xbe\xc0T\x82;\xc5\xaf\xc3;F==\xbe.\xe3\xfa\xbb\x1e\xa6\x1d\xbf\xc2\x81y\xbeG8\x89;\xb6\xf5\xc0\xbe\xe4\xe6\xba\xbe\x0c{t\xbe\xd0Z\xd9\xbdi<\xda\xbd"\x0bF<\xb9\x04\x92\xbe\xe6S\x9b\xbe\x8co?\xbf{\xcd]\xbf\x1a\x90#\xbe\x8eO\xa19\x94c\xdb;\x88\xccW\xbc\xd6\x8b\xae\xbb\xf7s\x19\xbfG\x15\x82;?:|\xbe\xb9,\xe3\xbe\x0c,\xc8\xbe;\x08I\xbf\xc8{\x8f\xbe\x0f\r\xcf\xbdq\x83\x95\xbfj\x9a\xa6;Q\x13M<\xa0C\x0f;\xe7\xa0\x19;t0&<\x10\xe9G\xbe2\xbdN\xbf\xce\xfd\xad\xbf\xf7\x8cp;\x1b\xc1g\xbcC;<\xbf#\xb40\xbfY\x95S<\xfd$\x14;\xbf\xdd\xf1:c\x11<<\xfb\xc3i\xbe\xd9<o<\xfadQ\xbe e[\xbd\xf2\xfbe\xbf5\xe4\xd7\xbeq\x18\x95\xbe\x84q\xae\xbc\x9cS\xfa\xbf+{8\xbf\x9c\x8ar\xbe\x88\x17e;\xce%l\xba\xab\xde=\xbe\x14\xfc\xbe\xbb\xbb\xb7\xb8\xbeK\x8a\xea\xbe\x19\xe7\xb0;]{\x0b\xbc\xee\x05\xe1\xbe\xcb\xde\xac\xbf\xfb\x11F\xbf\x10o\xc8\xbe\x141\x08\xbfA\x98\xf3\xbd\xb9[|\xbd\x08\xcc\x92\xbe\x19%u;\xae>D;\xda\rb;\xf2X&\xbe\x8c\xcf\xa3\xbd5\xf78<\xc45\xf3\xbe\n\x97M\xbc\xd8\xf1\x8d\xbe\xe3u\xdc;@\x07\xc0\xbeG%_<jEM\xbf\x95A\xe4\xbe\xe41\\;\xe7\x89\x1b\xbfHA\x82\xbft\xc8\x05<cs\x9e\xbd\xea5\xbc;\x14L\xe1;\x97\x0b\xad;8a\x89\xbf\x14\x1c\xad\xbdc\x99*<\xd9\'\x11<d%\';B\xc7\xb4<\x0b-i\xbf\xc0\xe0\x13\xbe\xe0N\xad:n\xec]\xbd\x98\xf2\x99\xbb\x18\x16\xc7\xbfD\xc4\xa2\xbd\xe18\xf5:\xd6.\x10<\xda\xfa\x15\xbc\xecD\x9e\xbb_\xbfj\xbf\xa1\x95\x07<?C"\xbd$\xfa\x94\xbe\xfd\x03\x8d<|\xfeb:\x89\x80\xa5\xbd5\xcf\xfb\xbda\xdf]\xbe \x96J;\x9b+^\xbf8\x8a\x02;\xee\xfbY9\xfc\xf8\xb4;\xb1V\xe4\xbd!\xd4\xe28\xc8\x80\x01\xba\x17\\\xd5\xbe3/\x0b\xbe\x87\x05\xfe\xbe\xf1\xb8\xbb\xbe\xd5\xf1O\xbd\x89\xa1!\xbfA[\x17\xbf\xa9VQ\xbf\x80\x8e@<\x12\xf5\x1a;\\\xa6S\xbfM\xf2\x0b<\xe3\x81 \xbe+\xc3 \xbf_|:<\x0f\x89l\xbe%\xf3u90\x10\x1d\xbe\x9b\x10S\xbej\xc9\xea;\x06\xf6\xc0\xbe\x8f\x99O\xbe\x14\xfaJ<Q\x9fp\xbfY\x0eU; 7\xf2\xb6\x12\x08\x13\xbf\x7f\xf6l\xbf\xec\xea\x98\xbf\xf0h\xbf\xbf\xe9\xc3\x06\xbf\xc7\xea\xa3\xbbn\x1e_\xbb?\xb4\x80\xbf;Cz<\x0b\xec\xd9\xbb\x07\xe32\xbe\x8aY\x07\xbe\x9fnY\xbf,\x14T\xbfmY\x8e<\x93j\x1a;\x94\xc2\x0c\xbba\xb1,\xbf\x82\xfd\x97\xbf\x02q\xd9\xbb\x04c\xa0;\x8e\xd0)<6)\x9f:\xcd\x06*\xbf^\xe4\xa7\xbd\x02\x93\xf0;!\xce\x9b\xbb\xd8\r\xa9;\xf7@\x89\xb9\x83\x05f<\xd3\xf7\x95\xbe\xa6\xec\xde; \x97\xe5\xb9pM\xbc\xbe\x827\xf6;\xb8\xa19<j\xc1z<\xd2\tf\xbf\xf0\xe2\xc5;Vc\x97;\xf5\xcb\xab\xbe\x95\xa7\x9c?\xd71$>\xc1\xb0!\xbcz\x0e3=\x81\xe1X?I\x1d\xc6=\x8f?\xb5>\xfe.\xa3\xbb\xc7\xd0\x80\xba\xf4\xaf\x1c?\xfc|\x19<>y\xc1\xb9\xd0?\xfd;3\x88\xd2;s\xe9\t=\xe9\xe5\x96?\xc2b\xa9\xba\xde1_>\n\x04\x90\xbbT%N:\xdb\x03\'>\xcf\xbf\xa5>\x8c\x92@>\xb8\xf6\xb4>\xb2\x8e\xa5>\x80{K\xbb\x8a\x1cn?\xd3\xbc\x0e<\x82\x9a\x00\xbc\xeav\x1f<xg\xf9\xba\x01\x88\x19\xbb\xdb\xd0\xaf;\xf1[\x10\xbc\x94N\xbd>A\xb3\x16?\'0\x81?\x07\xcb\xc3>\x19\xa4\xb6?\xa93\xfe<\x16_\xaa:<uT:u/\x1e?\xb0{\xbb>\xf2\xbc\xcd\xbb\xdb\xab\x14:\xc8\x16V?n\xf76?[\xb6\xa2>=\xa3j?\x97\xe0n;\x9bIe?\xf6\x08\xa7\xbbW\xefD;\xe4y\x83\xbc\xab\xac\x1c<\x19\xa6\x85\xba\xfc\xb2)>pC}\xbcF-P\xbcw\xfa\xd7=ye\xaa?\x97\xa4\xbd?\x00\xea\xfd=S\xe4A>\x1b\x1a\xc0=\x10\xd3\xe2\xbb\xccTY?{\xc9J?{0q\xbbe\x00\xa8\xbc\x89\x93S\xbc\x9c\x13j\xba\x00c\x86\xbbv\xdd\xa1>~\xde\x00>\xe4\xfd~=\x90I\xc7>\x01\x1es?\td2?\xd9\x11\x17>+\xcd\x13>2\xab\x13?\x15\x07\xfa\xbb#9K>|\xaf\x03<\x1b?Q?\xd6t2\xbc\x80:\xc1?D\xe7\xcc;\xd6gh\xbbLQ\x89>\x84q\xfd\xbb\xd4>\xff9\x8cK\x87?\x04+\r?6\xd7\x97?T\x15\x02?f\xcb\xd1>\x83\x86";\xf5\xe9\xa6>\x98\x83\xce>=\x00\xdb>!\x18\xa7>\x1a4R?\xbfZ\r\xbc\xf8\xc1\x1d:\xcb.\t?\xdd\xa14>\xe2\xf5\n?\xf2\xa0\xdc\xbaP\xf5.<\x9e\xd5z?}U\x07?\xbc\x08\x99>*\x14\r?\xbac\x0f\xbc\x88t!?\xa7G\n?s(a;\xb6\x9a-?\xc5Y\xa0?\xd0\xf8\x96=\xac\xbc=?\xff\xecZ>M@\xab>X\xbe\xca\xb9N\x1a\x07>\xa5\xe5\xff>\x04\xbd\x89?\x8f7\x8f;2P\x90>5O\x8c?R\x183:\xefnl?\xa2\x11T=\xee\x9b\xb2:n"k>L\xd2\xed\xb9BO\x11;\x86r\xfe\xbb\xd7V"?\x08g$?:\x0e\x05\xbcO\x921?:\xeb\x9f>\x89\x86S=F\x18\xab?x\xc3\xdc=\xbae\x05?\xbc\x02\x8b>/#\xc4\xbbo\x14\xf4>=\x1e\xb0>\xe9\xf4\xd8>\x0c\xe6\x1e?\t\x94\xf7\xbaro\x7f?\x15\x8dZ>\x80)\x0f\xbc\\* <<\xe1\xdb\xbbd\xbb<\xbc7Y\xa6\xbaI\xa0\xa4>+~ ?+DJ\xbc\xa0\xe1\xd9>z\x97\x1e?\xd5\xd0\xc3\xbb\x80,\x7f=\x08\xf8\x08\xbc\x87\'\x0b\xbb\xfb%\x1b?H\x1d\xd3>s*\xa4>9(r\xbcq\xf5\x16\xbc\xeey\xbb?\x9d\xa9\x8b>\xab\x0f\xff>\xcd~\x15>r\xaf\xf0\xbb\xb3\xeb`?\x86\xac\xbc?\xe6\x15\xae>u\x14\x00?\xb9\xf06>Hg\xd6><}\x0c\xbc\xcex\x86?,\x192?\x881\x7f=\x07,\xa6>T%\xb4?\xba9\x1f?\xd3F\x12<\x13@\xcf=\x19\x84\xa6>\x04\xc4\xc3;'
-p286
-tp287
-bsV446249785519915008
-p288
-g2
-(g3
-(I0
-tp289
-g5
-tp290
-Rp291
-(I1
-(I400
-tp292
-g12
-I00
-S'vl\x8b;\x93b\xad\xbd\x15\xb4\x80\xbf\x02j\xea\xbeF\xca>;\r\xf6\x0f\xbf+\x08\x11\xbe\xd5SX\xbf\xce\x00X\xbe\xa3\xa7B\xbc\xe7@V\xbe\xa5\r\xcd\xbd\x85\xd6?\xbe\x85\xc7\xa9\xbe\xadM\x03\xbfT\xf1\xf4;\x14R\xd7\xbe2\xbd\xb3\xbeUR@\xbf\x8b\x1a?\xbf\x01\xb0\xed\xberj\xdd\xbd[\x81\x84:\xf0>\x9c\xbf\x1d\xcbD\xbe\xbd\xca\xd5\xbefP.;\xe4DM\xbfv%\xd3\xbe!t^\xbf\xa5\xd3\x13\xbf\xed\xed\xc5\xbec\xc4\xa8\xbe\x852\x87\xbf\xe8\x83\x9e\xbd\x7f(\xa7;r\x96\xad\xba\xb9\x7f":h4\xc7;\x8fk\xf4\xbe\x8eO\x86\xbf\x14\xba\x9c\xbf\xd7\xc5R\xbe\x04?.\xbf\x82\x8a(\xbf\xc3\x98\xda\xbe\x89pX;2\xb6\x8b\xberQ%\xbd\x8e\xbc\xcc;k\x15\x9b\xbe\xb0\x87\x8e;9\xdd\xd1\xbe\x03H\x85\xbc\x1e\xfaa\xbf\xcb0W\xbeJ\xa3H\xbdn:\x19\xbf\xcf\x9a\xd2\xbf}{\x88\xbf\xc1\xe3\xbe\xbe\x0bx\x17\xbe)-\xa5\xbe\n3\xdc\xbeV\xf9J\xbeS\x14\x1e\xbd\xa0-`\xbf\x9eU\x13;\xaf\xbe}\xbf\xf5g\xf8\xbe\xcb(\xae\xbfq|\x19\xbf\x0f\x85\n\xbfi\xbc\xaf\xbeI\xb6\xd1\xbe\xb1\x16@\xbe\xdf\xa9\xaa\xbe\xa9\xa3\xdf:U\x9b\x87;*0\x8b;\xe5\x88\xd0\xbe\x9f\xcc~\xbe<\x86\xc9;\xeb\xdaD\xbf\x8a\x11Z;\x8e^\x97\xbeCn\xaa;?\xae.\xbfo\x15\x04<\xb3\xcd\x19\xbf\xa5{k\xbf\xf42g\xb9\xec\xc9\x83\xbf\xcf{\'\xbf\xf9~\xb8;\xa3f\x80\xbe\x85ii;\x11E\xbd;S\x81\x9d:\x88P{\xbf-[N\xbem\x08\x19;\xba\xc5\x90;C\x8b\x06;\xb6/\xf4;\x7f\xb2\x02\xbf.\xbdk\xbd\xb9\xf7\xc6:4\xdfi\xbe\r\xc7\xe0\xbdj\xf4\xcc\xbf\xd3\x0c(\xbf8\xd8_;\x13\x9a\xe2\xbc\xa0\xb6\xc4\xbd\x19x\xb6\xbeE\xa3I\xbf\x00\xfd\x0b:m\xc5\xb8\xbd\xa8Z\x00\xbff\x1e\xae;\x87\x9f\x8f;\x1d\xc3}\xbe"\xba1\xbd/\xaa\x84\xbd%\xcf\x8a;\xb4\xee\xfb\xbe\x88\xa6\xf9\xbb\xd5\xe7;\xbe\x03Q\x8b\xbe\xbf\xb3\xb4\xbcZ\xf7\x07;\x9a\xfaY\xbc\x8c<a\xbe\xe1\xaa\xa6\xbb\xa7\x1bv\xbbZ\xc3\xe1\xbe*[\x1c\xbd\x08u\x99\xbf\x81$\x13\xbf\x8e\x84\xf6\xbe\xecK\xf2;\xd6\xc4+\xbe\xfd\xe4h\xbf\x92\xc1T;\x18\xa9\xba\xbe\x113\x9e\xbecI\x1b<\x97\x8a\xad\xbe\xb9\x0c\xbe\xbd\xe5_\xcc\xbel \xa2\xbe\x1fG\xca:Mf\xd8\xbd\xbf\x07\x84\xbe\x83@\x0f<\xd6j\x10\xbf\xf6\xf1\x87;\x10\nY;\xff\xa5d\xbf\xe8!\x9d\xbf\x9b\x90\x03\xbfK\xb2\x9e\xbf\x9d\x1d\x18\xbfU\x0e\x19\xbe\x98s\xa5\xbe1\xfd^\xbfA\x02c;\x83[\xbb\xbc\xc2\xc1\x84\xbeHo\x13\xbe\xcb\x00\x0e\xbf\xef<\x02\xbf\xd6\xa6n;ms\x12\xbc\xc3\x03\xee\xbd5Q:\xbf\xe74p\xbfH1\x8b\xbc\xae\xc6\x82;0"\xd1;\x92\x8b\xc1\xbd\xe30\xb5\xbe=?j\xbeK\x8c\x1d<\xeb\x8dW\xbe[\x03\xbc:L\xa0\x05\xbcr\xb8\xd0:\xec\x16\xaf\xbe\x9a#\xf8;\x97K\x14\xbc\xb7W\x87\xbe\xe7^n;\x87\xd81<\xa4\x8f\x1c;\x0f\x1c\x04\xbf\xc8\xf5\xa4\xbc\x1d;\x96\xbeX.)\xbf\xcb\x1f\xac?B[\x92>\xf7\xa1\xad\xbb)%+=\xb7][?\xf7\xa7\xa4>\xb3\x9a\xa6>)\x92\xb3\xbb^\x9d\xe1;ZO\x85?=@\x98>[P\xe9>\x1e\x96\xe0>1\xde\x80>V\x06\xaf>]\x8f\x85?j\x7f\xa4=B\xa3\xf7<J\xdd\xa2\xbbIt\x15>\x1a\x8e\xb1=~\x1b\x9b>?m#?H|H?\xb3C*>=i\xd2\xba\xecn\x08?\xa2\xfe\x15>\xdeGJ>\x97\x1fO?\xf0-\x91>ZA\x16>n\x11\xdc>\n\x18#\xbcI\xb5\xa5>8\xe4\x16?\x96\xc4\x9a?c\xf3K?\xfe\x95P?\x9bd\x9a>_\xc8\x1f>\x87i.>2\r-?\xe7\xce\\>j:\xac<\xd6\xe7F>\xd6\xd2\x91?\t\x1b\x13?cPf>\x8fX\x8b?\xf6u\x1a>\xf0\x99b?\x0c\x05\xd2=\x00\xc2\x07?b\xbf\xef\xbb\xf6P\x14?Xq\xa2>\xe3\xb2\xa9<g\x06\x0b\xbc\x1d\x8a\x0f\xbcs\xd4$?\x90\xdb\xc3?\xae\x92\xa1?-\x167>\xcf\xd2\xcf>\x96\x1d8?9\x05\x11\xbb\xfd\x12\xa6?\xd09P?\xb10\x98\xbb1\xb0\xe6\xbb\xe1\xd8\x16\xbb\x9b_\x11>\xb0\x99\x1a\xbb\xf4\x04\x03>\xb5\x15\x04?h\x9e\xff>1&\x05?o\x8c0??\\-?\xfaL\x89>\xe2\x8d\x1b?z\xe0b?\xc7W\xaf\xba\x08/\xe8>\x04\xb0\x8f>\xf3Vi?\x08\xa4\xf7\xbb\xa1B\xb4?\x15\xcb\xb0>\xc4N\xa2\xbb:\xf3\xd0>zgn\xbb\xfam\xcb>TV{?\x8d\xd7\x9e>\r-\x91?@oB?c\x8d:?\xf7\xeeX\xbb\xfd\xd6\x88>\xe9\xc8]?n\xce.?z\xcf\x04?m!G?Q\x01\x1f\xbb7\x91\xcb>q\xbcP?\x01\x18\x88=o\x82`>\x10\x03^\xbb!\n&?\xf5!\x04?\xb0\r\xca>4\x00\xe5>\xcb&\x9f>\xbb\x8a\xf6\xbb\xc2\x85U?\xbbc*>\x1c\xe4\xd4>\xf2\xa9}?0\x19\x83?\xa0O\x90>0;|>\x0e1<>\xe1{\x0c?\x1ag(=\xf3\x1c\x00?\x0c\x1d\x7f>al\xd1>({\x02?\x10J4?I\xfe\x1c?\x80\xa4\x84<e,\x00?\xc7\xe5\xd6>W\'E\xbb\x94\xcez>\xcc\xe1\x89>Go\x82>\xa1\x98\x96\xbb\xf1\xd3P?ZLL?k\xd7l\xbb\xa9A)?\xf90\xce>\x85\xfd\x04?\xee\x06\xc5?r\xebk:W\xb8\x0c?\xd4p\xb5>\xa6]\xf9<G\xb8\xd3>\x8a/\xd0>\xcfD\xc5>\xb8\xe4\x8e?\x15\'\xe6<\x1dw\x05?\x86\xd4\x0c?\x82F\xb0\xbb\x0f\xf3\x06?})\xc2\xbb\xc73*\xbc\x8a\xb0\xb1\xbb~\x0c\x92>\xc2\xf5\xe7>\x13\x7f\x07\xbc+\x80 ?\x9al\x94>\x8c\x1f\x16>\x14\x99A>2\xab\x89=`\x10\x00>\x13\xdc\x93?\x9c\xcc\xda>\xea\xd6\x04?K4\xa2\xbb\xb9^\xbe\xbb\xbfH\xa9?\xd5\xf2\xe4>m\x7fj?\x9a\xa3\x89>j;\xad\xba\xa9\xca%?4P\xaf?9\xe2p>g\x08X?\xc2\'\xad>\x19a\xe4>o\x92\x8b>\xb9\xaf7?$\xd6R?\x1b\xd5\xc3>V\xc5\r?\xc5\x18\x9a?(D.?\x9ci\x97=\xb1\xad1>\x18~\xcf>K;=?'
-p293
-tp294
-bsV445259979285876737
-p295
-g2
-(g3
-(I0
-tp296
-g5
-tp297
-Rp298
-(I1
-(I400
-tp299
-g12
-I00
-S'|\xd0\x93<\xe1\x04D\xbe\xa0B\xae\xbff\x12\x9b\xbf2\xd9\x0c<\x8a\xa2\x18\xbf!\xc1\xed\xbd\xa8\xe4\x8e\xbf\x94R\x90\xbe\'!\x18<\xb9\xc1s\xbf\xfc\x81%\xbf}A\xda\xbeH\x86p\xbf\xaa{-\xbf\xb3\xf5\x95<y\xe7$\xbf\xb2qQ\xbf:&\xa1\xbf_1p\xbf\xf63\xfa\xbe\xe4X\x1c\xbe\xa9.\x9b;8\x7fi\xbf<\xc5\x88\xbd\xc8S\x85\xbf\x0f\x13\xde;\xb0\xc9?\xbfIf\x15\xbf\x0f\xac\x9e\xbf\x13kV\xbf@\x189\xbe?v\xfe\xbe,\xc0\xc9\xbf\xf4\xa8\\\xbe\xe4r\xec;AD\xa4;\r`\x9d;\x9ap+<\x85\xe3\x1c\xbf\xfc\xad\x97\xbf+z\xc4\xbf\xcbl\x05\xbf$\xcf\x15\xbe@\xb2\x8a\xbf\x0c>\xec\xbe6\x95\xe9<b\xcc\xd1\xbe*xW\xbe)1\xbd<1\xcf>\xbf\x82\x94\xa9<;\x9f\x92\xbf9\x07I\xbd\xbb\xc6\xa1\xbf\xec\x00\xeb\xbe+\x8e\x03\xbe\xe8A\x06\xbf\xe4\xc3\x0c\xc0\xbf:\xba\xbf\xae=\xef\xbe(BH;\xc66\xf3:\t\x08\x8a\xbe\xaa\xb96\xbc)%\x94\xbe\x9c\x87\xa9\xbf\x86\xf3I<]:5\xbe\xd2#3\xbfC\xee\xa1\xbf\xb4\xc6\x95\xbf\xb8\xa2\x86\xbf\x9a\xc8(\xbf&\t(\xbf\x88[~\xbf\xdd\x99\xb2\xbe\xfan\xd7;\xe9D\x8c\xbb\xbf\x04\x18:\xb7\xc9\x8d\xbet\xfd\xb7\xbe\xads_<Bc@\xbf\xf3\xd8\x9e\xbc\x07b\x04\xbf\x9bt\xed\xbdz\xd3s\xbf\xaeS\x87<\xe4\x18+\xbf\xf9\xf4\x9b\xbfkV\x1c\xbe~\x1a\xa8\xbf\x94\x9f\x97\xbf\x9e\xde\x8e<\xc6\x84\xfe\xbd\xdc.\x99:?\xceR<*\'\xf0\xbe\x94\xdd\xbb\xbf\x8c\x83\xc9\xbe\x1e\x9e\xa1\xbd\xfb\xee\xad\xbe\xc5s\x8a\xbe\xaa\xef\x05\xbf,J\x96\xbfA\x16\t\xbek_;;1g#\xbf\x19j\x8a\xbd\xfb]\x08\xc0I\xba\'\xbf\x88\xa3H\xbe\xb4r\x1f\xbd\r\xe9\xa2\xbe\xd8\x1c}\xbf#\x96\xa7\xbfiD\x0c;\xc7}\xac\xbf\xedI\r\xbf+\xef\xaf<Td\xfe:U\x80\r\xbe\x1c\xa9\x80\xbe\x17\xa3\xc4\xbeM\xbe\x19<i\\n\xbfN\xfao:\x009,\xbf\x11s\xf7\xbe}\xaee\xbe\xb3\xefE;z6\xbb\xbbU\xa8\x08\xbf\x1f\x85\xc3\xbe\xde\xfb&\xbe\xf4\x00n\xbf\xd6\xc8+\xbe\x89\x00\xb1\xbf\xf3\x9c3\xbf\x1b\x93\xd2\xbe\x010\x14\xbe\xc9\xb2D;\xf7S\x9f\xbf0\x00\xa6;\x86C\xa5\xbb\tT\xcf\xbe\xbb\xa2\x91\xbb\xe6w\xaf\xbe\xb2\xcb\xcd:t\xec\x0e\xbf\xc0S:\xbf\xcf\x08t\xbc\xce\xc2*\xbfb\xc7\xa5\xbeh<N<?+Q\xbf)\xe4\x1b\xbc\xbeN\xc3\xbc\xe7\x99`\xbf S\xc4\xbf\xa5\xdav\xbf\xe1b\xd8\xbfc\x10\xc5\xbf\xe5t\xe7\xbc\xd3\x15\xab\xbe\xb83\xea\xbf;\xda\x99\xbe\x8al?\xbd\xb3K\xa0\xbe_\x8c\xa5\xbe\x95\xacY\xbf\\\xa6p\xbf\x1a\xaf\xe4<NU\xa8\xbe\x1c\xfd\xe1\xbb\x18\xf5G\xbf\xd6z\xde\xbft\x07\x99:\x19\xdc\x8d;Z\xf1:<C\xde)\xbf\xe5\xb1\'\xbf\x9bi\x0c\xbf\x8f\x83\x8a\xbb^3,\xbf*\xb9\x94\xbd\xcc\xcf\x95\xbd\xa5\xfb\xd2\xbei-\xcb\xbeQ+F;\xcdR\x15:t}}\xbe\xd4\x81&\xbe\xfe\x921<\xcc\xcc\x06<\r\xb0\xa1\xbf_\x8c(\xbf@/\xcd\xbe\xb1jn\xbf\x80\x10\xda?Z\xb5\x1e?\x1a5\x82\xbc(O\xe0=\x0bS\xb3?\x81>\xe6>\xdd\x93\x0f?P\x1e\x18\xbc\x08\x95t>\x19\xe1\xe0?\xf6\xf0\x19>\xe0m^?M^\x16?6\xd4X=\xf5\x8d^>+\x89\xba?\xb5\x9f\x87\xb8\xd2\xeaV>{\xf1\xf1\xbb\x12\x05\x16>Yk\x8d>\x89A-?gUX?\xe6#w?\xf5- ?\xd8\xc5*\xbb\xde\x97\xa4?}:\x1c>\xc2vE>\xc0\xcb\xb5>\xa2\x07\x9c>LR\xad>\x92\xce\'=#Dz\xbbIR\xaf>\xe3\xf5x?\xb2\xbe\xc6?\x1e|Z?\xd9\xc1\x97?*\x9e\xd6=J\xfd6:\xd3G\xfe\xba=\x05Y?4\x14\xd4>\x99ro>TJ+=AX\x94?K\xa7"?z\xfaA>w\x1f\xe1?\xeaq=>\xc2y\xa3?\xd5\xd9\x07>\xe7}k?\x1f\x8d\x7f\xbc\nC\x86>\xa0\xbb\'?:\x9a\x14?\x8d>\x8e\xbc`\xae_\xbc\xa0\xa0#?Y\xdf\xe7?R\xd2\x93?\xaa\xd4+?\x14\xea"?\x14\xa3\x11?\xfe\xee\xac\xb9\r\x0f\xdd?\x92\xab\x97?\xc1\xea\xa5>Z<\xb3\xbc8cE\xbc^DD>\x18FE?Q\x0c\x96>N0\x8f=\xec\xa7\x88?YG\x11?\xdb\x84\x81?\\\xf1f?\xf5\xad=?\x8b@\x9c>\xc8\xfdX?\xe7\x12\xaa\xbb\x96\x9c8?\xa4\xc6}>\x02\xbf\x86?\xf1w\\\xbc\r\xb9\xe8?\xc1s{<\x01Hb\xbc\x95\xd4\x94?\xe68:<\x19\xd5s<\xe8l\xac?\x87\xa8=?\x18b\xd1?\x1a\x80\x96?\xe01n?\x0bOS\xbb\x920\xc6>\x8dVD?\x87\'\xbc>\xe7w3?y\x95\xa0?\xa2\xdd\xc1;;\x9e7?\x1bE\x9d?\xa9\x0b\x87>\xec\x9f\xca>\xf3|\xa6:2w\x03>\x7f;\x86?\xbc\xfbF?\x15\xab\x0e?\xbd\xa4\x8f>\x10\x05\xa5\xbb\xafGX?\x02,\x1f>\xa6\xcb#?\x16\x8f\x99?N\xed\x81?\x1a\x98\x84>\x82\x84C?\xed\xcd%?\x1a\xbe5?/+\x04<\xc2\x95\x7f?\x8c\x16\x8a>\x07\xba\xfd>\xd6\x869?\xb2\xbe\xcf?\xd8\x835?\x9c\xdb\x8b>c\tn?\x9a\x19\xbd>\x96\xdf\x9e<}\xdb)?\x7fQ\xcb\xba\xd1\xd0\x97<\xc9\xf4\xd4={\x12\x9e?\xee\xaf\x90?\xbe\xec0\xbc\x9d\xbc\xb3?}]s?\x7f\x9f\xca>\xb6m\xe1?\x9b\xb8\xd2=\xe8Ve?\xcf.T?\x13\x96\xba=u\xa0V?\xe8-(?\xf3\xd9\xe9=\x11\x9b\x96?x\xfcd\xb7\xd9\x05"?\xe2\xa5\t?\x04J3\xbc\x8f\x95\t<\x83\x83C;Ln\x8e\xbb\xeb\x18\xbb;\x94\xceW?\xe5\x9c\x04?\x0e>:\xbc\xb0t\x0e?o\x9c\xa2?a\x0e&?r\xe0\xe8>3\x16\xb3=\xa9:O\xba\xfc\xa7\x06@\x0c5W?\xfc\x94??a\xab\xbd\xbb\x1d\x16\xf1\xbai1\xf2?n\x86-?\x14N\x8d?\x97\xd3\x02?\x8e\x9c\xb4\xbb\xdf0\n?\x1c\xd1\xf8?T=\xc5=\x07b\x97?\x00K\x11?tD;?x\x95\x9b?\xdaU=?\xed?Z?;\x9a\xc4>j\xc3\x85?^A\xe2?iN\x86?,j\xbb<U0C>\x98R\xfa>Jz\x1d?'
-p300
-tp301
-bsV474173720563425280
-p302
-g2
-(g3
-(I0
-tp303
-g5
-tp304
-Rp305
-(I1
-(I400
-tp306
-g12
-I00
-S'\xe2\xaf\xc2\xbb\xa4\xd0n\xbe\xc7L\xa5\xbf\xeboH\xbf\xb3\xc4F\xbb\x8a\xa2\x18\xbf\xeb[\xc3\xbc\xa8\xe4\x8e\xbf\xbaf\x8a\xbe\xf8\x19\x0e\xbe\xcc\x03\x8f\xbfQV\x01\xbf\\w+\xbf\x94O\xf8\xbe\xc8\xa6\x08\xbfki]\xbb\xbe\x99$\xbf?\xea-\xbf\xdc\xd3\x9f\xbf\xbcP\xb0\xbf~@P\xbe\xb1\xe6\x04\xbe\x96\xd5Z:f\xd9\x00\xbf,\xdb\xb7\xbd:3 \xbf\x99\xc7\x00\xba\xb0\xc9?\xbf3\xf8\xd6\xbe1O\xb9\xbf;\x08I\xbft\xd4\xde\xbe\xb8}\xe3\xbe\xe0 \xf1\xbfq>"\xbf^\xe0\xd6:0\xea\xa3:\x87n\x8f:_=\xf1\xba\x85\xe3\x1c\xbf\xff\xff\xf2\xbf\xce\xfd\xad\xbf\xdc\x07\xa7\xbe\xe2!f\xbeAi\x83\xbf\xebA}\xbf\xb9\xb3R\xbbb\xcc\xd1\xbeg\x8d<\xbe\xab\xcep\xbb\x80\x86:\xbfF)\x9c\xbb\x9f\x01 \xbf\x98\xa3k\xbdK\t\x8a\xbfM\xd2\xe0\xbeq\x18\x95\xbe\xcc\x17\xf1\xbe\x9cS\xfa\xbf\xbf:\xba\xbfK|s\xbe\xf0Gf\xba\xbe\x8c\xec:\x8eQ3\xbe\xbe^\xf0\xbc\x9d@/\xbfH\xf6\xa6\xbf\x8f\x0bO\xbb\xc5\xa2\x94\xbe\xf88S\xbf\xcb\xde\xac\xbf\xfb\x11F\xbf\xb8\xe3u\xbf\x141\x08\xbf$vD\xbf\xdey\xd9\xbf\xfb\xf1\xd8\xbe\x8d\rX\xbbE{\x02;S\xb4\x9a\xb9\xf2X&\xbe\x8c\xcf\xa3\xbd\xfdM\x1d\xbc\xbc\x17i\xbf\n\x97M\xbc\xd8\xf1\x8d\xbe\x94_\xe9\xbe\x00\x9a\xc4\xbf\xd9Z(:\xb7\x82\x99\xbf\xf9\xf4\x9b\xbf\xa0\x0e\x9d\xbd~\x1a\xa8\xbfHA\x82\xbfv\xee\x84\xba\xbd\xf7\xec\xbd\xfbY\x8b;,\x8d2\xbb\xc7\xaeF;\xd7\xb3\xaf\xbf\xa1\x86\x0f\xbf\xa7(\xa3\xbb\nm\xbe:\x19\xa8\x7f9\xda\xcbn\xbf\x8b\xe1\xb7\xbf\xc0\xe0\x13\xbe\x1f6\xdf:\xf1\xb9\x17\xbf\x88y\xde\xbd\xd9\x19\xfa\xbf\xbc=\x97\xbf\x8cm:9\xb4r\x1f\xbd\r\xe9\xa2\xbe\xe1\xdeR\xbel\xbb\xc2\xbf\x1a\xd8\xcd\xbb\x85\xc2\xf9\xbe\xff_\x9e\xbfc\x15L:\x01\x10I\xba\xff\xe1\x04\xbe\x9e=\xe9\xbd\x8b\xfd\x02\xbf%\xa6\x81:\x9b+^\xbf\xe5#5\xbf\xe6\xe1\x13\xbc\x05d`\xbe\xcf\x84\x02\xbe~\xcb\xec\xb9\xcf\x8a\x14\xbbu}\xe5\xbe\x9f(\x89\xbe\x87\x05\xfe\xbe2#4\xbfqh\x99\xbd\xd5\xa9\xd2\xbf\x8690\xbf\xf09t\xbf\xfd\\\x93\xbe\xd6\xd3u\xbe\r\xde\xb6\xbfh\x87:\xbb\xe5\xdc\x88\xbe+\xc3 \xbf\x06_\xa1;{\x92\x95\xbeD\x1f\xbb:\xd1\xff\xcf\xbe\x02A\xd5\xbe\xe3_\xba\xbb\xce\xc2*\xbfv\xab\x94\xbe:qL\xb8Q\x9fp\xbf\xe2\xdf\x04\xbb\xba0\xa4\xbe\xee\x9df\xbf_\x0c\xd4\xbf\xd0\xb7\x9c\xbfi\x87\t\xc0\x879\xba\xbf\xeeU7\xbcb\xa7\xb9\xbc\x15\xcc\xf9\xbf\x92\x98S\xbb\xc3\xbbK\xbcq\xd8\x97\xbe#\x06\x8a\xbe\x9fnY\xbf,\x14T\xbf\x8a\xfcR\xbbt\x16\xcd\xbc\x7f\x04y;\x0e\x0f6\xbf\xc5\xdc\xa8\xbf\x94\xef\x83:\x80}\xb29\xd2\xad\x938\x03\x96U\xbe!\xb3\x86\xbf\x1f\xca\xe8\xbe\xe1~\x9a;I\'\xff\xbe\x8faW\xbb/J\x8a:#\x9b\xde\xbd\x12L\xc4\xbe\xc5\xfa\xda\xba\xecA?\xbbpM\xbc\xbe]\xad\x9b\xbf\x1f\x9d\xd4\xba\xea\xe4\x14:mE\x98\xbf\x1cT$\xbf@/\xcd\xbe\x03P>\xbf\xbb\x9a\xcd?K\xd6I?NP\xc288\xcd\x96=\x0bS\xb3?\x08b\xd5>pc&?\x93\xb2T:Po\xc4>2\x89\xc8?=\xa23>\xe0m^?(\x0b[>?ha>\xa3\xb9I>+\x89\xba?>\x86\\>\xf2\xf3K?\x0f\xc4\xa4\xba`g\xc6\xbav0\x93>\xcf\xbf\xa5>gUX?l\xd8\x97?\xa7&1?\xaa\x9f\x9f7+R\xbe?\xf3\x04\'?\xc2vE>\x1a\xcc\xa0>xc\x81>0\x94\xd1=\xc7\xaex=nn\x89\xbb{\xa9\xca>\x1f7\xb4?\xd7\xc1\xb7?\xc6\xb2X?\x19\xa4\xb6?:\xc9\x8c=\xc7\xed\x81\xbb\xa9\x1e\x8e\xbbu/\x1e?3$j?\xcdh68n\xdao=\x81\xc3\x92?n\xf76?\xca+\\?\x95F\xd3?`\xf6\xc2=M\x94{?\x85_E;\xe7}k?\xe3l\xb6;YI\x8a=Y\xed\xd4>\xfc\xb2)>]2\xd6;\xb4;\xa7;x\x12\xfa>\xcfG\xea?\x97\xa4\xbd?u\xec\xa6>j^\x87?i\xbc\x1e>\xd7\xc36<L\x19\xc3?:\xda|?\x8dqQ>\xf0\xf1/;\xa0[-\xb6\x82{<?\xaf\xfd_<v\xdd\xa1>\xd9\xfbP>3\t9?\x90I\xc7>d\xb1w?\x1e\x9e`?l\xa1\xd3>\x8b@\x9c>7\xcd_?\xfcV\xea:\x96\x9c8?\x84\xbf\xb2=\x02\xbf\x86?\x9c\xb0\x03\xba\r\xb9\xe8?\xd2\x86\x87<\x9a=z\xbbh\x13=?\x1d\xb3\xc2;F1\xa7<\xe8l\xac?\x03a\x8b?\xe1\x92\xb8?\x1a\x80\x96?\x08\x88B?L~D\xba\xf5\xe9\xa6>\xc8\xd8P?=\x00\xdb>\xa1\xb9\x05?a\xedl?S1C\xbb\xf3\xcb\xd8>\x816\xa7?f2\x0c>1\x19\x92?\xd2\xece\xbbh\xad\x95>\x9e\xd5z?}U\x07?\x93R\x8b?*\x14\r?\x1f`M\xba\x88t!?\xa7G\n?\xc4\xf3\x15>\x16\x8f\x99?\xc5Y\xa0?\x1a\x98\x84>\xac\xbc=?\xed\xcd%?o\xba1?\xc6\x17l;\xc2\x95\x7f?\xb8\x8cS?\x04\xbd\x89?e\xdc\x1b?\x87EX?5O\x8c?T\xe6G>c\tn?L=7?\xe6\xf6\xc6\xba\x82\xb4\xd7>\x9b\xc5"\xbb\xc6^\x17?\xad.=:\xcd\x07%?\xa4!J?b\xb6\x81\xb9\x8e\xac\x90?\x990[?\xe5S\x85=\xc3R\n@x\xc3\xdc=#\xebX?\x03\x91\x0e?\xc5|\xd6=\xd7\xfd\x83?6\x13\xdf>\xe9\xf4\xd8><)\xb0?\x99\x04\x16\xbbro\x7f?\xc5>1?\x18\xb6^=\x0b7\x0e<4\x8f\x7f;\xb1\xfa\xf2\xb8P9\xa3\xbb\xdc*_?+~ ?\xb6r\x0b;\xb7a\x05?z\x97\x1e?\xba\xc6\xb0?3f\xfd>6\xab\xb1<\xa6\xcaG:w\xff\x86?b`\xe4>s\xd9\x85?\x97i\xd6:\xb6{\x96;i1\xf2??c$?#-\x80?u\xd4(?b4\xac:\xb3\xeb`?\xb4_\xcd?\xe6\x15\xae>\x07b\x97?\xe9\xffb>\xa8X\x96>\r\xb5\xac?\xcex\x86?\xed?Z?HL\x03?\x0f\x1a\x19?T%\xb4?\xcd#t?\x84\xfd\x14=\x8eK\x8d>\x00\xd9\xc0>\xb3\x11\xc6>'
-p307
-tp308
-bsV445127884424740865
-p309
-g2
-(g3
-(I0
-tp310
-g5
-tp311
-Rp312
-(I1
-(I400
-tp313
-g12
-I00
-S'^n\xe8;*A\xf0\xbe\xc7L\xa5\xbf\xefns\xbf\xfa\xa9\x9d;\x8a\xa2\x18\xbf\x06)\x1b\xbe\xa8\xe4\x8e\xbf\xc3\x84<\xbf\x06\xe4l;n\xbf\xb3\xbe\xe6\xe5\xb1\xbe\x86\xb2j\xbe\'\xa7\xb7\xbe\x14\x9eh\xbf\xd7D\xfe;\xe0\xcd\x97\xbe\xf6\xfa\xc7\xbe\xdc\xd3\x9f\xbf \x00\x10\xbf\xb8\x8a\x05\xbf\x9c\x14\xc6\xbd\x1ba\xb4\xbe\x94\x0ee\xbf\x02~\x8a\xbe\xf1\xd4\x80\xbfq\x0e\xbc;\xb0\xc9?\xbf\xba\x98;\xbf\xa1\xf5O\xbe\x84"\x0c\xbfGH\x94\xbe\x1cw\x94\xbe+\x13\x91\xbf:\x88\xad\xbe\x90Y]\xbe@e\xed:\x12\xe0\xae\xbcS_\x89;\xe4\x95M\xbfd\x10U\xbfcf\x9b\xbf\xdaD\x06\xbe\x1d+\xcc\xbe#\x16\x16\xbf\x9bi\t\xbf\x17\xaa\x14<\xc8\xf45\xbf\x0b\xb1A\xbe\xe8\xe3\x95;\xf1a\xab\xbe\xf2\xb1.<\xd9\x9f\xda\xbe\xad\x9f\x17\xbe\x05Bx\xbf>\xb9\x90\xbe\x89\x98V\xbd\xd2\x93\xa4\xbe\x94\xd6\xd8\xbf\xbf:\xba\xbf\xc6AK\xben\xf6\xf1\xbd_7\xa9\xbdX\x0b\x8d\xbe\xb7\x9b\xcf\xbdM\xd7\xd4;v\xde\x11\xbf>dg;\xf3\xb9\x18\xbff;\xe8\xbeT\xca\x9a\xbf\xc8\xcf\'\xbf\xf15*\xbf\x18\xbd\xb4\xbe\x1cw\x80\xbe\x1fK\xfd\xbe\xdd\x99\xb2\xbe\xeaqz;\xbdaZ\xbe\xd7i\xef:\x7f\x11k\xbe\x9c\xa0\x8e\xbe\x07\xfe\xd1\xba[\xde\x0e\xbf\xa7\x8d\x89; K\xef\xbd\xd2\xa0\x19\xbd\x8fe\x08\xbf\xa1?\x82<q\xc2\xef\xbe\xf9\xf4\x9b\xbf7\xe7c;\x15\x0c\xc4\xbf\x94/)\xbf\xae\x15\x12<\xe4\xa7C\xbd2\xc2\xbe;\xc6\x1d\xea;\x1c\xcc\x1b\xbe\x16\x8f\x98\xbf\xd4\x1e;\xbe/C\x04<\xc13\xa5:\t\xe6\xbc:_\xf3\xd8\xbe>\x98>\xbf,U\xdd\xbc\x05\xb92;\x0e\xe9\x1a\xbfb\xe0\xf6\xbdk\xe8\x9d\xbfo\x9a\x9b\xbd!\xc9\xd5\xbe\x03O\xd0\xbd\xd4\t\xd1\xbe\xe1\xdeR\xbe\x97\x98m\xbf(W\xbb9f{\x11\xbf\xf6Yq\xbc\xca\xce\x0f<\xc9\xdf\xe9:\x08\xa1\x13\xbe\x8ct.\xbe\xea\xb9\x9c\xbe\x9fG\xbd;\x9aa\x84\xbf\xb6\x950\xbe\xacW\xa0\xbe\x1ce\xf9\xbe2\xb6\x89\xbe\x17a\xd8\xb9Z\xf8\xad\xba()z\xbe\xf1\x89+\xbe\xf4t\x1e\xbe\xd4KM\xbf-\x1c\xf0\xbc\xd4\xf9\x80\xbf\xed\xca5\xbfk\x1f\xbf\xbe\xfc\xc6\xce;\xa7\xc2\n\xbe\x85\x93~\xbf\xc3\x1a\x84;\xaaJ|\xbe\xee\xe7\xcc\xbe{Y\xeb;\xec\x04\x07\xbf\xc0\xbeT\xbe)\x9c\xd4\xbe::\xf2\xbe\xe3_\xba\xbb\xce\xc2*\xbf\x98\xd6\xd7\xbd\xe9\xf3\x04<\xd7\xc2\xea\xbe@\x82\xd6\xb9x\xc2\xfe\xb8/i\x10\xbf\xf5\xb4^\xbf0u\x1d\xbf7=l\xbf*\xa4z\xbf\xb6\xef\x81\xbe7\x04\xde\xbe\x99_\xc7\xbf\x01\xc6\xd9\xbd\xca\xdf\x86\xbe\x149\xf5\xbd?M\x1b\xbe\xdb1\x1d\xbf\xe3\x1d\xec\xbe\x1ese<\x84\xf8\xf9\xbb\xe4&\xa2\xbd\x15r1\xbf\xe8\xc4\x88\xbf\xe6$\x06\xbc!\xfa\xa2\xbd\xe9\xe8\xae;\x03\x96U\xbeT\xf9\xf5\xbe\xf8c\x98\xbe\x96\xaaL;z\x16\xc1\xbe\x1d\xa2@;>\xb3\x1c;\xb0\x88\x00\xbdEOq\xbe\xd5\xd1\x08\xbb2\x7f\xcf\xbbt}}\xbe\xe1\x02\x07;E]m;\x10J\xdb;mE\x98\xbfi\x05\xfb\xbe@/\xcd\xbe\x18\x08\xd0\xbe\xbb\x9a\xcd?0D\x0c?\xb5\x89*\xbc\x80,\xf0=\x0bS\xb3?\xb4\x91\x0e>\x18.\x8c?\n1\xf0\xbav\x1b\xfc<\xb5,B?\xf6\xf0\x19>\xe0m^?\xf1\x03-?\xbd\xc2\x11>\xdd\xf7Q=+\x89\xba?\xc1\xbe\xfc<\xd2\xeaV>/\x8d\x11\xbb\xc6~\x7f;\xfc_3=\xd6\xe5\r?gUX?U\xe3\xb2>\x96\xa3\xf2>#\xbe\x9c\xba}\x97u?\xa3L\x8d\xbb\xc2vE>\x03\x0bg>xc\x81>\xeaSK?\x1bp6>\xec\xf5\xd9\xbb\xe8S\x9f>\xbb\xc3D?\xd7\xc1\xb7?\xc6\xb2X?}g\x84?)\xf3\xb2><\xab\xdc\xb9\xcez\xad=\x91\xeb3?a\r\xaf\xbbz?\x11\xba\n\xfa\xcf=\xc7Ud?\xf9\xcc\xba>\xc2\xb8\xb3=\x1a\xc2\x97?\x00\xee\x9e>\x02\x82\x9f?d\x1d\x96\xbb\xe7}k?\x12\x17+\xbce\xd8\xe3>\xc4\xdf\xdc><c^>\xa3\x1f\xd6\xbb\x9c1\xfa\xbb\xfcE)?-`\xa2?\xd7\x9fH?\xa4\x8a!>\xf9/v?\xa1W\x1e?C|(=D\xb7\xb0?v:M>\xa1\x02\x11?\xd1T\x12\xbc\xe3\x99E\xbb\xc6\xb4\t?\x15Fv>\x1fx\x89<\xac4C>\x1b\xae#?9A\xee>\x0e\xe2"?\xb2\x00\xa3?\x83\xa18>\x8b@\x9c>\xdaAN?1=\xe7\xbb\x96\x9c8?l\xd9\x11>\x02\xbf\x86?\'gd\xbb\r\xb9\xe8??h\x94>\nc\x82\xbbh\x13=?S\xc6Z\xbb\',\x0e>\xe8l\xac?\x83\ts?\xda\xd1\xa4?\xce\xcd\xa2?\t,\x9e>\xd4\xc0\xd4<\xdd\xe4H?\xfc\x02P?"\xfc\x08?\xa1\xb9\x05?\x8f\xfa_?^lJ\xbb\xf3\xcb\xd8>@\x9a_?\xbdJa>\xf8\x02\xfe>jr\x1e=\x9a\xfaV>\x0e\x0f#?c\x87\xf3>W\xe8\x05?)\xc1\x1a?\x8c\xfd\x05\xbc\xe4\xa8\x90?K\xbf\x98=\x8d\xb1\xbf>\x16\x8f\x99?|\xbbl?\x1a\x98\x84>\xe5\x83(?\x96"6?\xdd\xc7L?+\xb9z8\xc2\x95\x7f?`\x99.>\xda\x83\x9d>e\xdc\x1b?\xf6\xce6?\x19\x0c>?\xce\x86\xf1>\xfb\xa5\xa2?-\xff\xac>Q\xe8_<\x82\xb4\xd7>\x0f\x01\xbc>\xeb\x0f\x08=\xef.P=\xcd\x07%?\x96\x9a\n?\x05\x86L\xbba?p?\xf3>\xbc>\xca\x89\x07?\x80\xe5\xaf?\xf1,A\xbb\xdb_\xe7>\x03\x91\x0e?^\x9en=\xaf\xd8\x17?<1\xb7>\'n8>\x9c\xe4\xb3?\xc4\x9f\x10\xbb\xd5\xa9<?\x9b\xa2\xa7>\xcf2\x9f\xbb\x97@6>"\x19[;PQ\xd1\xbbb\xd3\xd5\xbaf9\x03?<\x83\xc1>\x1a\x05>\xbc%(\xe6>\x84\xfc\xf1>\x92J\xf3>D\x01\x1d?6\xab\xb1<\xbat\x02?\xc1B\x96?\xa7\x92\x1f?9\x1e\xe6>\\\xa3\xda\xb9\xec}2\xbbi1\xf2??c$?#-\x80?) \xcf>g\xb2t\xbb\xd9P\x0c??/\x8f?/\xc1\x99<\x07b\x97?\xa8\xf1\xd8>\x1d\xc2\xf8>\\^ ?\xdaU=?\xed?Z?\xb7\xe0c>\xe30#?\xdc*\x92?mWW?H\xc8\xce=\x13\x88\x9a>r\xa5\xa2>\x06\x16"?'
-p314
-tp315
-bsV445260367951040514
-p316
-g2
-(g3
-(I0
-tp317
-g5
-tp318
-Rp319
-(I1
-(I400
-tp320
-g12
-I00
-S'\x8fY\x96<k\xca\x9f\xbc\x1f\x02\xc3\xbej+\xce\xbe\xb9>P<\xc9\x94\xc7\xbcr;\x8c\xbd\xe5\xc7~\xbf\xa6\xbc\x1b\xbf@\xf1\x11<(\xa0m\xbd\x06w\x1a\xbe\xf2\x02\xd0;\xde\xe1_;~\xb8\xf3\xbe\x8b3\xad<\x97\xd6\xf5\xbeUL\xf2\xbdn8\x7f\xbf\x07\x8c9\xbfB:4\xbe\xa2J\x0b\xbc\x07\xc0\x0f<\x1a~\xd6\xbd\xb5V\x1c\xbdc\x0e\x9f\xbe\xbd\xdc\x0b<h<7\xbe\xb1\xb0&\xbf\xd2h\xa5;\xb5\x86\x98\xbe\xe34\xe5\xbdG^\x95\xbd{o\r\xbf<\xbd\x1c;B\x85\x89<\x15\x99\xc0;\x85|\xc1;\xc4\xdf\x95<H\x94\x8d\xbe?\x8b\x16\xbe\xc7\xea\\\xbf\xfc\x94O<)!\x8b\xbe\x1bW?\xbe[\xe3\x7f\xbe\x9bY\xbd<\xf3,\x12;\xd6\x9c\xd9\xbeS\x80\xba<iv$\xbe \x9b\xc6<\xd3"\x0e\xbe\xd8\xa1W\xbcl\x0b\xc7\xbf;4>\xbe)\x9b5\xbe\xaf\xc6\x82\xbd\x93\xa1\xff\xbf\xf7Z\x81\xbf\x0c\x9e <\xa4\xc2\r<E\x04\xa2:y\x1c\x8a\xbeQ`9\xbd\xa1\x97\x85\xbe\xd9\xeeP\xbf2\xefm<{\x19\x02\xbe"\x99(\xbe\x18`\x90\xbf\xab\xea\xac\xbeN\x01\xe4\xbd\xf2|\xcd\xbd\x87\xac\xf8\xbd\xae\x8eM\xbe\x9a\xe0\x07\xbf\x92\xb5=<]\xfc\x90\xbd\xc8b6<O_*\xbd\xf3v\xda\xbe\x10k\xaa<\x92\x8f\xb7\xbe\xa7\x917<r\x16\x0c<\xb4\xa1\x95<t9\xc0\xbe\x88R\xe3<\xafS\xe7\xbe\xd5+H\xbf\x9d\xdc\x7f\xbd\xf4)\xcb\xbf`B1\xbf\x1c\x9c\x90<g2\xe8\xbc\x108e<\xe8\xf6c<\xfd=\x19\xbe\x8e\x98$\xbf\x9f\xa4\x9b\xbb\xdb`\x90<;\xf2\x00<\xf1:\xdc;\xf3\x86\xde<j\xff\x8c\xbe\xdd\x18\n;~\xb3\xa1;2\x834\xbf\x03\xb6\x93\xbc\xc3\xa5Y\xbfdA:<\xbe\x8c\x0b<\xf9\x92A<\xb0\x9c\xb1\xbe \x8d\x85\xbe\x84\x02?\xbf\xc2\xb4\x7f<\x02\xcaX;\xcfQT;C\xe6\xf1<)\x7f\x07<\x1c\xa4\xac\xbc\x9f\x9f"\xbd\'4e\xbd`\xbf"<\xac\x0bM\xbf\x83$\x18\xbc\xd6\x89\xac:\x1b\xd1|\xbe\x99\x11o\xbc\xd7:\t<\xe0XX;\x00sU\xbc\x94\x845;A\x05\xd6\xbeUt\x05\xbf\x8f\x16\x86\xbe\xfe\x04\x9a\xbei\xb9\xd1\xbe\x06\xa9B\xbe1W\x9c<\xca\x04$;y\x125\xbf\xc3\xc2\x8d<\xbb\x16\xbb\xb9R\xca5\xbe7\xf6\xa6<\xa2\xb8\xba\xbe\x11\xbc]8+\xafj\xbd\x9aC\xcd\xbeu\x07\x85<\x16\xb7\xce\xbdl\x83\xea\xbc\x91\xc3\xa2<\x1ew!\xbeT\x1c\xce;<\x90\\\xbe\x1a\x11\xd3\xbet\x9fq\xbfgM{\xbf ;l\xbf\xc5/Y\xbe\xb19\xff\xbc\xe4\x80\x93\xbd%\xe2\x06\xbf\xcagk<\xdbqc\xbd\xeb\xd5\xa3\xbe\xc6\'~\xbcw\xb6\x85\xbeC\x16\x14\xbe\xb4\x10\xe4<_\x00\xd7:\x84\\N\xbb\x1b*O\xbf\x9a\x9e\x96\xbf\xec\x0e\x11\xbd\xa7\x8a\xcd;\x92\x93\x95<f\x9c\xaf88\xd5\xe2\xbe\x7f\xb4\xdd\xbd\xbd\x97\x86<\xd4;6\xbe\xe7R`\xbc\x0e\xab\xad8Zr\x82<EOq\xbe(-Y<5\x81V\xbc9\xa7;;\x1d\x916<H`\xc0<\xf5\x83\xa7<C\xd2&\xbf\xdc\xe5`;\xe0w\x19;K\xa2\xd9;\xaf\x8f\xd8?\xfa\xd7\xf4>?\xe1\x9f\xbck\xf0\x98<G\x96^?\xfcb\x15?\x0e\xa8\x8e>\xb2\xb1k\xbc\x98\x9c\x969 \xe5\x92?\x8c\x13\x1a=\xb4r1;G\xcc\x1c?\xf4\xbd(?\xd5\x01\xec\xbb\xe0%B?\xfe\xc8\x80\xbb\x1e\\\xf6\xbad\xf5\xef\xbb\x06\xbc\xb4\xba\x88\xc8\x8f>\xc0\xe7n>\x90\x18~>K6\xc1>\x16c\xa4>\x05n\xdc\xbb*dE>\x1f\x07Y\xbc \xbcm\xbc\xd8\xe9\xa3>c\xfa\x02\xbb`\xf4\xbe=\xf6\x89\x98=\xef6\x85\xbc#\xa9\xe6>\xb0/\xa2>\'\x9e\x9c?n\xcb\x0f?\x81\x7fE?A\xdb\xa0=\xcf-\xbf==\xd9.\xbb\x82:V?R\x02Q\xbc\xcen\x81>\xdc\x06\xe4:nX\xa4?\xd7\'\xa7=\xc2\xe99=\xb4\xcf\xe5?\xeb\x14#<\x18\xe7o?\x87y\x0c=\x82\xd5,?r~\xc2\xbc\xd7\xd5\x0f>5C\xb2<`\xdf\xc1>o \xe8\xbc\x9f\x8c\xcf\xbc\x02\x01\xa9>n\x0b;?>\xcdE?J\xd4c\xbcoo\xa3>\x0b\xf8\x10>frP\xbc\x18\xfb\xc2?Y\xcdH?\xe1+\xc9<q`\xff\xbc@\x1b\x86\xbc\x8c\xeb\x97>P1\x15>a\xe3w=g|\x07>\xc2\n\x00>\xa4QY?8\xb7T>k^\xed><m\x1f>\x19]\x9f<\xc5\xcc\x90?f\x9c*\xbc`\x11W?o\xc0\x12?\xe6\xbe\x95?\xa3\x14\x9e\xbc\x1e\xb3??\xda:}=G\x9a\x17\xbc\xcaD1>\x0e\xf9\x80\xbc.\xa5\xfa<\xcbEB?\x93\xc91?A\x03\xbb>T\x13\x99?\x04w\'>\x9f*\x94\xbb@\x87\x1d?\xe1\'\x9c>\xc1v\xa7>\x08\xfbF>|\xa2\x05?\x8e\\W\xbc7\xd7,?\xae\xc9\xf2>\xf2bv=\xe2\xf9\xb8>[\x90#\xbc4L%?\xdb\xbf\\?\xe0\x9dY>\x14WQ=%\x08\xfd<O\xeb\x8c\xbcO\xb9\x8f?aj\x18?}\xc1\xb3>E\x887?\x0e\xcd\xdd>\xca\x9e;>$<\x0c?\x1aY\x84>sWW>l\x0f\xc6\xbb\x95\xb5\xbe=\xb5#\x86>\xdbr\x10>E\xb4/=\xd2?;?\x06\x04\xe2=h\xb3\xb8>\x94\xe0\x97?\xceY\x88=m\x1a\xc18ZJ\x82\xba\xc6G\xa6\xba^\xc4\x9e=\x04iU\xbc\xfbL\xa2>\xd1\t\x04?\xf4\xde\x9b\xbc\x90\x90%?[\x1d\xbc>\xc4\xe1\x02>\xfe\x830?d\xe0\x13\xbc\xea"w>w>\x8e>h\x99\x01\xbc\x14\xab\x05?\x8d\xb4R>\xceD\\;\xd9\xf7\xa6>\x02\x9f\xb1\xbbVZ\x18?kq\xc8=Xao\xbc\xf3@\x86=\xb6]P\xbc\xe8\xcc\x94\xbcc\xe5\x17>_\xcaZ?\xc8X\xa7\xbbV\xf3\xa8\xbc\x17\xd4\xf6>\xd9\xc0\xd2>\x01\xb6\xde\xbb\x96\xdeZ>\x01a\xea<\xcau\xb7>y\xeaD?_\xc9o=\x19/\xa2=`U\x9f\xbc\xaad\x9f\xbc\x946\x8c?33\x83>\xa9\x82b?:n\xf5=\xe4\xde\x0c\xbc7\xfde\xbb\x02:\x15?\xfa\xfe0<la?>_\xe9\x8c>j\'\xa1>\x08\xaa\xab=c\x95\x84?U7\x87>\xbb3\xf6=\'V\xf0>=\xf5\xc8?xZ\xf5>\x0cM\xc9=J\x1c\x1b?\xcc\xae9>\xf3\xd8\x8d?'
-p321
-tp322
-bsV445128068860895232
-p323
-g2
-(g3
-(I0
-tp324
-g5
-tp325
-Rp326
-(I1
-(I400
-tp327
-g12
-I00
-S'\xa0\x13-<4\x06\xcc\xbd\xa0B\xae\xbf\x9bN8\xbf\xe7M\x83;\xf4\xd6_\xbf\xa4To\xbe\xb1\xb7\x89\xbf\x94R\x90\xbe\xa0\x8e9\xbeC\xde\x02\xbf\xf6\x98D\xbfH\x0e[\xbf\xb0\xe8+\xbf!\xc9s\xbe\xd3\xb1!<w\xe3R\xbf\x977S\xbf\xb5\x15i\xbfSH\x87\xbf\xe0d\xbc\xbe\x1f\xe3\x81\xbe\xec\xc2";\x11\xff(\xbe\x8b\xeb\xfe\xbe\xa1\x89\xe6\xbe\x01+\xa4:h<7\xbe\xc2\xa4\x11\xbfI\x9fw\xbf-\x91\xa1\xbfNn?\xbfyq.\xbfz\xe5\xc1\xbf\xdf\x86:\xbeG0\xf0;d\xe2t;\x8c=\x98;l\x90\x00<\x18\x9e\xa8\xbe\x8a\x8f\xa9\xbf\x19\x16\xbc\xbf\xcbl\x05\xbf\xa3U?\xbe\xe4\x13\xc6\xbf#D\x9e\xbe\xac\xaa\x1c<Py\x1e\xbe*xW\xbe6uU<\xc7\xbd\xaa\xbeZ0O<\x92\xb7\xa6\xbe\xdb\x88\x8a\xbc\xfa\xe5\x9e\xbf\xc8n\x18\xbfT(\xb6\xbeF\x14\xa7\xbe\x0b\xea\xd7\xbf}\xd5\xb6\xbf\x80\x90u\xbfCZ\xfa;\xa6\xcd\xdd\xbc\x95ui\xbe\xec{\x89\xbd\x7f\xf4\x02\xbe\x9c~I\xbf\x05\xea\x12<J\xa0F\xbe\xdb>\x8e\xbf\xc2\xb5\xed\xbf\xb4\xc6\x95\xbf\x14\xee\xc9\xbfoWI\xbeYz\xcf\xbe\xeb\xb6\xda\xbe\xd2\x07\x8d\xbe\xd2\xf5\xb9;\xa7:a;W@\xc7;[\xfe\x8a\xbd&\x86b\xbe\x9c\xad\xa0\xbe\x92@d\xbf\xa3u\xf6;\xacLk\xbe\xb2\x13\xa1;\xb5\xbba\xbf\x1b\x0bz<\xd3lz\xbf3-n\xbf\xa6[8:+\xca\x90\xbf\x94\x9f\x97\xbf\xaf\xd2 <\xd7)\xcf\xbe\x9d\xdb\xfb;1f\x05<*\'\xf0\xbe\xb7%\x84\xbf\x80\xad*\xbf\x87\xdf\xcb\xbc\xb6\xc1\x8a\xbe<7\xcd;O.x<,J\x96\xbfW="\xbf\xf2\xe6\xc7:1g#\xbf\xb8O*\xbd\x89\xd8\xfa\xbf@j\x8d\xbeJ\x05\xa7;^LJ;\xae&\x12\xbd\xd8\x1c}\xbf\xfb"\x8f\xbf\xfe\xfdF<\xc7}\xac\xbf\x12\xcf\xb7\xbe\xa7\x8be<\x9c\x06\x05;?\xda\xde\xbe\xde\x08\x00\xbf\xc3\xaf\xfc\xber\x1fl;i\\n\xbf\xcc\xac\x92\xbd\x009,\xbf\x0c\xf9N\xbe\x8a\n\x84\xbe/\xf2\x0c\xba-\t\x8a9\xd4\xaf\xce\xbe\xb5.\x10\xbfQ\x8b\x1b\xbe\xf4\x00n\xbf\xd6\xc8+\xbeK$\xca\xbfK_>\xbf\x01\xd4\x01\xbf\x0f&\t<d\xa0Q\xbdT6\xa9\xbf\xa3\xe8)<V\xd4Z\xbeAM\t\xbf\x15}Z<+\xe0\xa0\xbe\xf4$Y\xbc\x88\x8b\xe4\xbd\xbe\nL\xbe^2E<A\xe3\xc9\xbd\xbd\x86\xcf\xbe)\xd8\x81;\t\x8a\x86\xbf\x13&>;7\xc1\x1e\xbbP\x9bf\xbfhN\xc6\xbf\x13\x83\x84\xbf\xc2\xf9\xe5\xbf\x98J\x9b\xbf\xb6\n\x88\xbd\xd3\x15\xab\xbeOM\x90\xbf;\xda\x99\xbe}p\xc5\xbdL\xc2\xb1\xbe\xdc\x1d\x88\xbe\xb5\xd1\x9d\xbf\x16\xfd\x8f\xbf\xe2qC<NU\xa8\xbe\xe2\xf9$\xbc\x18\xf5G\xbf\xaeh\xa1\xbf&b\x92\xbd\xaf]\xa9:940<C\xde)\xbf\x19\xacS\xbf\x9bi\x0c\xbfT\x91+<yO\xa8\xbeP\x8a\x8b;N\xe8\xb6\xbc\x9d,%<)("\xbf\x1aL\x13<\xc7\t7\xbcc\xef0\xbe\x0e\xeb\x0b<\x91v_<??1<\r\xb0\xa1\xbf\xa0\xe3c\xbd\xd6\x00\x91\xbe\x9a\xc9\xc7\xbf\x9c\xa3\xbb?\xe8\xecA?\xc4\x15\xa2\xbb\x8c\x85b?\x04\xbf.?uQ\xb3>3>\x9f>\xa9\x81\x13\xbc\x04n\x17>i\xa2\x83?\xf1\xcf\x13=\'{\x9b>M^\x16?\x05\xddy=\x94\x86\xb0>\xeb\t\xd2?\xcb\x86\x96\xba\x11y\xcd\xbb\xae\rs\xbb\x12\x05\x16>@\xe5\xc8>\x0c\xd3\x95>\xaeZ\x97?o\x8a\xa9?:\xd2\x89>\xfd\x0c\xf4=\xd9\x8c5?\xd8\n(>\xe0\xd2\x1b?\xc0\xcb\xb5>vM\x80=\x00,\x89>"V\xa6=\xe13*\xbc\x01\x86\xef>\\\xac\x95?-\x04\xae?O\xe0g?/\x9c\x9b?\xf6r\x98=\xcc\x9a\xfd;\x00zJ=\x88\x84\xad>M\x06*?\x96a \xbbh\xbe\xa0<\x14\xaa\x84?a\xab7?\x16\xd0\xa5>ty\xc0?\xfe\xd2\x15=\xb5\xedf?\xc2\xdeG>\xc95\xb7>\xcaHn\xbc@\xf27>\xa0\xbb\'?:\x9a\x14?=\xac\x93\xbc\x84\xd0?\xbc\x15U\xa5>\xaf\x02\t@\xde\x05\xb0?:c\xc9=U\xa7\x1f?\x04\xfc\xe7>\xfe\xee\xac\xb9\xf3\x91\xc6?\xed\x88\xc3?\xc1\xea\xa5>\x7fs\x88\xbc\x92\x0b2\xbc~\xe1{=\x18FE?\xc0\xf0\x9d=\xb0c\xb1>[hT>YG\x11?\x19\xde\xb8?i\xb5g?\xf5\xad=?8\x1f8?\xdefV?SO\xc6\xbb\xe9\xf7\xfc>\xa4\xc6}>\xa6#;?\x91\xae\t\xbc\x85A\xce?\x84\x1a\xcb=\xda\'v\xbb\xd0\xf5\x9a?\xa9s\x17> #(=\xd7\xb0Y?\x8d\xe3\xee>\xa7\xbb\xe3?@(\x83?\x93^v?7\xe4l\xbb\x920\xc6>]\xb0,?^v\xa4>r\xd9[?\x0b\xa5\xd2?\x97\xa5\xb5\xbb\xe8\x9c\xa2>\xa6\t\xa7?V\xed\xc7>5\xcf\x7f>"\x88\xbc\xbb\x8b\xd2V>a\x15\xca?D\xd7o?\x9b\xdbJ?\xff\xd1\x03?\x82\xb4\xc6\xbb\xfeh\x19?\x89\xc3\xd3=\xa6\xcb#?4v\x96?\xb4\xcb\x80?\x80\xeb4>u\xe2\x98>F\x84\xe4>\xc5\x15\xcf>SP\x1b\xbb_\xc6\x8c?I\xdf\x10?\x83\xeb1?\xd6\x869?\xb2\xbe\xcf?\xad_\x1a?\x9c\xdb\x8b>%\xb8\xcb>\xd2\xe7\xed=\x9a\xcd\xdd\xba7\x15\xe0>>U\xfb<@\xcd\xba=\x11H\xc8=\x7f\xd0\x80?i\xa2s?x\xd2\x19\xbc\xe2\xdf\xcc??fg?\xfa\xaf.>\xc4\xe4\x13@Tc\xa5>{"\x85?\x8b|\xc5?b\x00\x1c?u\xa0V?:b\xe0>\x1e5.>\xe8[\xaf?\xd1\x03&\xbb8\xc2L?\x06\x9e\x97?)E\xe6\xbb$d\xb1=m\n\x11\xbcY\x96i\xbc\x16\xdd;\xbba_\xf4>n9a?r\xa8\x1b\xbc\x92K\x17?o\x9c\xa2?\x13_\x1f?\x83J\x83=\x88\xa7+\xbc@\x7f\xa4<\x0f-\x97?\x0b\xc8\x80>\xee\x91\x8c?\xb6\x1d6\xbc\xa3\\_\xbc\xffZ\xd8?\xe0z\xd7>\xd25I?\n\xbe\xc3=\xb0\xed\x19>\xf5\x86\x91>i\xbf\x1a@a\x0b\x8c>\x95\x10\x94?T#\xf8>tD;?"\n\x94=\x9b\x14E?\x14%\x8f?mX\xa6>\x80\x95\x8f?\x1a>\xb5?iN\x86?F\x8b\xf3=\xfa\xe3\xd0>\xc1A\x0b?r\x8f\xde>'
-p328
-tp329
-bsV445232027499896833
-p330
-g2
-(g3
-(I0
-tp331
-g5
-tp332
-Rp333
-(I1
-(I400
-tp334
-g12
-I00
-S'\xe7\xe4\xea;\x07l\xa3\xbf4\x10Q\xbf\xa9\x84@\xbf\x10\xa9W;X"\x19\xbfk\x17z\xbd\x1e\xa6\x1d\xbf\xc2\x81y\xbe]\x9d\xfb;|\xcf\x14\xbf\x9d\x9c9\xbe\x0c{t\xbec\x10p\xbf\xa9\xc5%\xbf\x02?C<Pu\xef\xbe\xf9kp\xbe\x8co?\xbf{\xcd]\xbf\x0cwn\xbf\xc6\xcf\xb8\xba$\x07\\\xbf\x98n?\xbflw\xa5\xbe"\x8cP\xbfW\xfeN<\xa5\x9e\xdc\xbec\xaf\x9a\xbf\xc4k\x93\xbf;\x08I\xbf\xc8{\x8f\xbed.\x80\xbd6h\xdd\xbf\xaf,\x88\xbf\xd3\xc3\x0b<\xf3\xff\xe6;\x84G\x94\xbd\xb1\xd9\x02<\x10\xe9G\xbe\xfa\r\x88\xbf\xce\xfd\xad\xbf.\xf5\xf8\xbe\xa3U?\xbe\xcb\xe0r\xbf\xb0I:\xbf\xbdz\x08<)\xe4\xa6\xbe*\xd0I;\x16\xfeq;\xfb\xc3i\xbe\x84]4<\x84\xbfR\xbf\x13\xb4\xad\xbe\xf2\xfbe\xbf5\xe4\xd7\xbeq\x18\x95\xbeP\xab!\xbf\x9cS\xfa\xbf\xd3\x1b\x8d\xbf\x9c\x8ar\xbeK\x1dQ<d\x94E;\x95ui\xbe"\xee6\xbc\xbb\xb7\xb8\xbeB<\x11\xbf\x91\x02\x04<\x99\xef\xa4\xbf\xaa\xdc\xa0\xbe\xcb\xde\xac\xbf\xfb\x11F\xbf<\x9e\x9a\xbe\x141\x08\xbf7 S\xbf\xce1\xe7\xbe\x08\xcc\x92\xbe \xc9\x80;\xa8%\xa5;\xbe\xac\xeb;\xf2X&\xbe\x8c\xcf\xa3\xbd\xca\x89\x05<o\xb1\x14\xbf\x1a\xab\x9b\xbe\xc3ax\xbf\x8d<z\xbfE\xb5d\xbf\x00\xd3!<jEM\xbfbz\xe1\xbe\xa6\x08\xb3:\xdc\xa8"\xbfHA\x82\xbf!\xfa:<\x15\xc9W\xbc\x81\xb0T<\x13\x1c\x81;\xc8\xe97<8a\x89\xbf2r\xfe\xbe\xa7\xbd\x94;\x14\xd7\xa5;\xda\xebZ;\xc1\xfe\x0c\xbe\xf1d\xb0\xbf\xc0\xe0\x13\xbeu\xeb\xd1;n\xec]\xbd\x9c%%\xbd\x18\x16\xc7\xbf\xe9\x1c\x8e\xbfX)\x81\xbf\x91\xa6\xbb:\xda\xfa\x15\xbc\xf3\x81_\xbaJm\xf9\xbf\x98U\x87\xba\xbah\xa6\xbf\x13\xc2\x10\xbf\xb7b\xed;\xfa\x97b<1\xa8\x80\xbe\x87\xba\xb2\xbe\xc5&\xe1\xbd \x96J;\x9b+^\xbf\xa1\x1d\xf7\xbe;u\x16\xbf\x98\x10\x11\xbe_\xf2\xb8\xbe\x16\xa0\x90;\x12\xec\x1d;\x17\\\xd5\xbeZ\xd6\xab\xbc\x87\x05\xfe\xbe\x81\xee\x94\xbf\xe3\xcb\xb7\xbc\xe1\x8dO\xbfA[\x17\xbf\xa9VQ\xbfw\xec!<S\x1fL\xbe\xb1d\xac\xbf\xd1i_;\xe3\x81 \xbe+\xc3 \xbf\x06\x10p<\xff/\x12\xbf\t\x84\x13;1\xc9\xa1\xbf\xf5\xe9\x05\xbf[\x9e\x07\xbb\x06\xf6\xc0\xbe\xb5\xdc2\xbe\xeeT\x88<Q\x9fp\xbf\xf3\xfel;\x05G\xc2:\x12\x08\x13\xbf\x02\xa0\x8b\xbf\xec\xea\x98\xbf\xf0h\xbf\xbf\x99\x0f\xfa\xbfO,l\xbf\xdeJ\xeb\xbe(\xaa:\xc0#m&\xbeO\x93K\xbe\x07\xe32\xbe0I\xf9\xbd\x9fnY\xbf,\x14T\xbf\x0fc{<\xee\xab&<l5(;\xe3Z3\xbf\x82\xfd\x97\xbfM[O\xbe\xdb\x14\xdd;)\x16\xbc;\xe6\x1b\x92\xbb\xcd\x06*\xbf\xf1q:\xbf\xe8/-<\xa7,g\xbf-"(<-\xb2\xee;_\xff\xb3\xbd\xd3\xf7\x95\xbe\x85\xfab\xbe\x13\xc1\xa4;pM\xbc\xbe\xe0\xc9\x08\xbf\x11\xc0\xd1;\xa0\xd6\xe1;\xd2\tf\xbf\x83}\xb3\xbe\x08\x82\xc7\xbd=,\x17\xbf\x95\xa7\x9c?\x15-W>\xbf\xb9\xae\xbbz\x0e3=\x81\xe1X?\xe6\xa5\xf4=\xe3\xac\x18?ZU\xdf:\x9b\x1by>q\xe9\x7f?\xac6V;=\x96\x93;\xd9\xb7\xcc=\xfa^v=\x9b|\x85=\xe9\xe5\x96?z\x8d\xbe\xbb\xde1_>\xaf5\x9e\xbbp\x1a4\xbb\xdb\x03\'>\x04\xdc\xda>\x02r\x81>\xc8\xaby>\xb2\x8e\xa5>\xf2\xf4\xd2\xbb\xf3S\xd1?\xe31\x95\xbbz\xf6\xfb\xbb\xc7\xaf0=\x00\xc3\x07;\xd8\xee)?\x9b\xa9\x84=\xb9\xdfC\xbc\x94N\xbd>\xf8\xec\xa4?\xbb\xf8\x8a?\x07\xcb\xc3>\x19\xa4\xb6?\xf6r\x98=\xbcY2\xbc\xf8\xe8\x01\xbcu/\x1e?(\xe0\xe1>\x8a\xca4\xbc\xbd\xf9\x06\xbb\xc8\x16V?n\xf76?[\xb6\xa2>\x1f4\x99?\xdf\xdd\x97>\x9bIe?\x8c}\xf6\xbb\xb3o.=\xc2\xa2\x85\xbb?\xb9\x82?\xc5\xc7\x87?\xfc\xb2)>.R\xab\xbb\x0b4\x1e\xbccx\x9a?ye\xaa?\x97\xa4\xbd?F\xca\xfb>\x05\xbcv?{\xd0\x96?\xd2\x9c(\xbc\xccTY?{\xc9J?\x9a\xff\xbe\xba\xe6{\xf4\xba\x96P\x97\xbb$\x83n>\xc3\x08\x89\xbbv\xdd\xa1>g|\x07>\t\xe7\xd0?R\xb2-?\x01\x1es?\x018\x9c?\xc8A\x1a>\x12Q\xd2<\xb9P\x19?x\x89\x13\xbb\x85`Z>?\xa8\xd2=\x1b?Q?\xb8\xbf*\xba\x80:\xc1?Q\xe4\xbd>\x0cTO\xbcLQ\x89>\x92\xa0\xca:^]\xfd;p\xa3\xa1?\x04+\r?\xbf\xf0\xbd?\xbfVj?\xa5\xd0\x06?0\xc2\x8c\xbb\xf5\xe9\xa6>\x19H\xc7?\x99\xe8P?2\x8f@>n\xcdI?x\xa6\x00\xbc\xccb\x9f>\xcb.\t?,\xc7a>\xe2\xf5\n?\xfa>\x00\xbc\x8b\xd2V>\x9e\xd5z?}U\x07?vP\x94?\x04iP?7H\x1e\xbc\x88t!?\xa7G\n?\x88\xcf\x9a=\x1a3\x0e?\x89\xd2\xad?o;.<\xac\xbc=?\xff\xecZ>\x99 \xba?\xe2\xb5\xa39\xa2EU>\xa5\xe5\xff>\x04\xbd\x89?8\xf0I=\xe4\x8cO?5O\x8c?8\n\xb7;\xefnl?]\x8cl?\xb2\x0b\x04\xbbn"k>\x84f<\xbcBpm=\x12Wv\xb9\xd7V"?\x08g$?\xe3\x8c9\xbc"s5?\x12\xbe\x15?q\xb7\x94?\x05\x0b\x08@x\xc3\xdc=\xbae\x05?\xbc\x02\x8b>\xbc\xb7\x0e\xbbO\x05\xce>3&\xa4?\xe9\xf4\xd8>\x1b\x15\xd6?\xa4\x1f\t\xbcro\x7f?\x15\x8dZ>Nm\xf3\xba\x0b7\x0e<|A\xdc;\xf32\xc7\xbb\xd7~0\xbcI\xa0\xa4>+~ ?\xc4A\x87\xbc\xaca\xb9>z\x97\x1e?d8\xb7?V\x98\x01?\x06j\xbf\xbb\x8c+\xa4\xbb\x15}\xe4?K~\x84?\x8f\xd1\xe8>c\x86\r\xbb\xb0U8\xbb\xeey\xbb?|S\xf3>e\xa6\x81?WS(?\xf3\x13\x13;\xb3\xeb`?\x86\xac\xbc?\xe6\x15\xae>IA4?\x0b\xe5;?\x1e\xbf\x99>\x05\xeb\x8f?\xcex\x86?,\x192?3\xf7\n?8\xf7\x95>T%\xb4?\x9d\x8b*?\x84\xfd\x14=C\xa1\xf1=\x86\xca=>\xb7,\xa3='
-p335
-tp336
-bsV446076696736071680
-p337
-g2
-(g3
-(I0
-tp338
-g5
-tp339
-Rp340
-(I1
-(I400
-tp341
-g12
-I00
-S'\xb9\xa5M<\xb1`\xe0\xbd\xceN\x91\xbf\x0e\xacF\xbfUnu<3\xe4\xd7\xbc\x8e>n\xbdw\xcag\xbf\x0c\xc95\xbf\xcd\xf2\xfb;I\xdc\x86;\xb9\xe9\x8c\xbd\nm\xd7;Y\xcc\x9f;d\xf8\xa7\xbfh\xeax<\r\xb7\x1e\xbe\xe4\x9c\xba\xbd\xce\xfb\x90\xbf\xa6\xbe\x02\xbf`\xb0\x15\xbe\x1f\x88\xa9\xbb\x87\x12\x03<7)\xa2\xbd\xe6\xcb\xc5\xbc\xcdL0\xbf\n\xe3\x0e<\xe8>z\xbe4\xef+\xbe\x967\x97\xbe\xc4c\xc0\xbe\xa7\xb7\xdb\xbe`l\xdb;\x93\x85\xa9\xbf\xcc\xb9\xc5\xbe`\x10\xa0<\xea\xc2\xce;9\xbe\xb0;\xc11:<Y\xba\x9e\xbd\xda\xb8N\xbeoi\xeb\xbe\x82>\x88;\n[\x16\xbe\xb8\xe9\xbe\xbd\x066\xf4\xbe^7\xab<\xa7X\x9b\xbe\xac\x01\xfa\xbd\xc7*\x8b<\x1e\xd3\xa4\xbc\xee\x06\xa5<^\xd5\xaa\xbd\x03H\x85\xbc\x95\x9d\x05\xbf\xcbs\x10\xbe\xdej\xce\xbc\xa6\xa8\x04\xbf.b\x90\xbfi\xea\xa0\xbf\xb9F <hh\xa1\xbciEG\xbe\xa8\xaao\xbe\x16\'\xfd\xbcy\xbfC<\xac{n\xbf\xd2Aw;\xf0\x01(\xbf\\X\xcd\xbd\xff]\x89\xbf\xc9BC\xbe+\xf8S\xbd"\xc12\xbe!\xb6\xff\xbet\x16\x1b\xbf\x95\x0f\x16<J\x1a\xaf;+\xd0\n<`\x96\xcf;\xad,g\xbe.r%\xbc\xf9\x10\x9d<\x89\xcc\xf6\xbew\xb0\x1f<\xde\xa6\x86;\x98}K<\xe8\x8f\xbb\xbfs\x94\xc5<\x94{-\xbf\xde\x1d\xa5\xbfE\xfb\x8e\xbe\x08L\xdb\xbf\xbb\x8e\xa3\xbc\xd2\x99\x82<\xe6\x8c\x88\xbbZ7@<\xa8Sp<\xf1\xa9\x16<A|{\xbf"\x9eU\xba\x02\xcb\x83<\x93F\x05<\xba\x95\xaa;\x80~\xea\xbe\xb9\x1a\xf1\xbe>\xcea\xbc\xef\x94\xaa;\x19\xdaB\xbe\x99L\x03\xbcgN\x82\xbe"\xf8\r<\xa9\x84\x86;\xb2\xa5\x9b\xbe\xa2\xdd\xe6\xbc_#\xd8\xbdQRC\xbf\x8c\xb7_<^\x0c\xa1\xbe_\xe0\xea:\xba\xb0\xac<\xa7\xe1\x17<G\x0f\xe3\xbc"\xba1\xbd\x7f*\xd0\xben\xaf;<\x0b#\xe3\xbee\xc8\xa7\xbeD\x9c\x8d\xbb\r\xb8Z\xbe(\xeb\xb7\xba\xf6\xc6\xeb;\xaa\xe1\xd4:\x14\x9c!\xbc\xe1\xaa\xa6\xbb\xe6!*<rX\x8b\xbfx\x18\x93\xbcC\x97\xdd\xbdb\xf0@\xbb\xd7\xd77\xbec\x81s<\x82\x8c_\xbf\xdb\xaaY\xbfa\x179<\x10\x16\xbc\xbec\xd9#\xbd\x14\xd1\x92<\x11\xf9\xac\xbdd\xf8H\xbb\x89\x08\xb0\xbc6\t \xbfM\x9e\x10<\xcc\t0<\xbb\xa5\x91\xbc4\xaf\x93<\xf2\xf5\xa2\xbe\x00t^;\x99#H;\x8e\x19:\xbe){K\xbfWU#\xbf\x93\xc9\x9a\xbfj\x1eM\xbf4\xc1\x04\xbd\xb7\xfa\x8a\xbd\xc6\xbd\xb2\xbf\xba\xa3\x8a<\x83[\xbb\xbc\xd1y\x98\xbd\xc6B\x06\xbd0\x8b;\xbe\xb5mK\xbd\x8e\xd6\xb1<WX\xc69\x149\xd2\xb9\xff|<\xbf\'\x1f\x8c\xbfp\xbbX\xbb{\xd5\x06<\x84\x9f\xb6<\xb5:\xe0:C+\xe5\xbd<\x8db\xbd\xb2\xb1M<\xb4P\x1c\xbc\xf2\xe66<\\5\xaf:\xeejE<\xfc\xcd\x19\xbe\xfa\xf2S<\x97K\x14\xbc\xe5g0<m\x9b-<,A\xb4<T\xcev<\xbb\x0b@\xbfLg\xf9\xbdm\x84\x07\xbe\xba"s;\x10[u?]\xc4\xa1<\xc5\xa3\x96\xbc)%+=\xf5\x0el?\x9d\x80\xb5\xbb\x07\xf9=?I\xaa5\xbc\xac\xa5\xb7:\xc9\x94\x16?\x1cZ.>\x01\x10N>\x18\xb5_?\x0b\xf8&?\xf7\xe6\x9f\xbb\xbe\x99\xcc>S\xf1\x92\xbbz\xd3\x89>\x15\xb2\xeb\xbb$=\xf3\xbadIU>\xd8\xeb\xe1=L\x81\xdc>[\xc6\x02\xbc \x08\x00?\x94"\xec\xbb2\xc6<?E\xe8(\xbc\xbc\xb1!\xbcq\xb3\t=]\xe3w\xbb\xd6\x82\x16\xbc$\xd8;?\xc7]\x89\xbc\x1a\xfc\x1e=\x86P\xe5>\x0c\tB?^\xabH?\xe1\x863?\x96\xec\xbb=\x94\x00\x83\xb9\x0c\xc8i\xbb5L2>I\x00\x06\xbc2\xbe\x91>\x929\x1b<\x08\xbeA?\xca\xe2g=\x8e\xfb\xdb<\xdf0\x84?\xb8\xd9\xd3:\xb9\x8fv?\x18\xdbg>/\x10\x9b>\x9aG\x9b\xbc\xdf\xc4\xcb=\xe7s\x15>_\xd2\x11\xbc\x18e\x84\xbc-\xb3\x9d\xbc\xa6\xad\x83>"<\xce=\x0bF\x16=\xc5\x1b>\xbc \xc9\x0c?\xcc\xbf\x04>\xb69F\xbc1\xcd\xc9>\x8eEd\xbc\xbb\x06\xb1>\x00&\xaf\xbc\x0ej)>l\x92a?\'\x8bN\xbc\x9a\xc2\x10\xbc%\x8b\xf1=\xde\x9d\x97>NGU>\xb6\x0f\xe7=\xb2\xba)?e\xa5\x89\xbbi1\x1a?W\x82\x97?\xf7\x9c\x15\xbc^\xce~? \r\xc9>\x8e\x91V?OY\x9a\xbcUQ\x94?\xd4\xd3\xf7<\xa0\xdb0\xbc\xbd\xcc\xa0=*U0\xbc\xef\xff\xb8>\xec\xe4\xda?Uh\x94?\xc3\xec\x1d?\xca:m?w\xf4\xb7=\xe3\x01)\xbb\xb8\'r>M\n\x88?.\xd6\xc2>NY\x9a>c\xbe\xab>\x94\xb9;\xbc\xd5s\xdc>1\xf0\xf5=\x01\x18\x88=\xde\xfb]?O\xc5\xf2\xbb\xd7x\x8a>U\xba\x17>^\x11\xf3=\xef\xbd\x05=Rs\x1b=\xabmh\xbc\x16\r\x8b?"V\xe5<]ek=>\x8e5?\xd9\x1c-?\x89\xc9\x83>\xa2\x8b\xb2>\xb2\'\x83:\xe5\xdd\x11?\xaa\xe7m9Y\xd9\x05=1X\xd4>\x1d\xb5\xe4=Z\xf3\xd2>w*\x87?\xfc_\xe1>\x00\xf1\xda>\xc8;w?\xa6\xb4Q?j\xedT<\x84\xa0\xb1=\xa8\xd4t\xba\x94\'$>\xf5\xc5\xfe\xbb3\xe1c>\xab\xb3\x07=\n\x0c>\xbc\x0c:\xc9>\x0eDg<\xfe\xf0\xd8=!\xeb\x98?\xf6*\xc1\xbbNS\xac>A\x18\xe1<p\x07\xf8\xbb\xbeww?J\x83:>\xc9\xb2\xab>\x83\x94\x98?\n\xb0\xb3\xbb\xc3\xed\xcc>\xfa\xe3A=!\xe4\x81>\x80\xc8`= \xe3\xff\xbb\xb4q\x8a\xbc\x87\xe2\x1f\xbc^\xdb\xe5>\x15AV\xba\x8d\xfc\xa4\xbc\x82#\xbb>l\xc3I>\xc9/`?\x18\x7f\xd1>?\x97:\xbcuY8?\r\xf1`?\x07\xd6\xe5>Q\x04n=\x96xV\xbcY\x9cz\xbc\xca\xb1|?\xee\xc5\xa1>d]\xe3?1g+>9\xa9\x97\xbb\x08\xb7\x0c?\xfb\xa8S>\x9dv[>\x84sA?\x9e\xbb\xbe=\x87!L>\x08\xf1/?\xfd\xca\x8a?\xe9\xceh?p\xf9q>\xe4\t->\xb3)\xd3?V\x81s>\x9ci\x97=D\x9e\x83=\xee\xaa\x9d=yf<?'
-p342
-tp343
-bsV473454349105242112
-p344
-g2
-(g3
-(I0
-tp345
-g5
-tp346
-Rp347
-(I1
-(I400
-tp348
-g12
-I00
-S"\x8a\x8f\x90:OT\x17\xbf\xf8#\x85\xbf\xe9\xc8P\xbf\x96A\xce\xba`\x92*\xbfm\x7f\xbc\xbd\x0b\xffG\xbf\x8eX\x80\xbe\x99\xa5D;\n\xa9\xe0\xbe\xa9p\x11\xbf\\#\xcf\xbe%\xc4\xa8\xbe\x01?\xfd\xbe\xd4\xc3\x95;\xc3b\xbc\xbeg\xdc\xbb\xbe\x8co?\xbf{\xcd]\xbf\xde\xbc\xb5\xbe@\xc9\xb6\xbc=\xbc\x16\xbf;_\x7f\xbfL\x80(\xbe\xf7s\x19\xbf\x10\xb6\xc3:\x8d\n\x12\xbf\xa1\x0cW\xbf\x83YG\xbf;\x08I\xbf\xc8{\x8f\xbe7N\x9f\xbeq\x83\x95\xbfw\x92\xb9\xbeL\xedk;\x9e7\x07:+\x1b\x99\xba\xa0\x82\x9c;\xad\x12\xe0\xbe\xd4db\xbf\xce\xfd\xad\xbf\xe4L\x0e\xbb\x8e\x81\x9d\xbeC;<\xbf#\xb40\xbf\x83*\x96;\x8fv\x8d\xbe\x9d1\x9e\xbd\xde\x0f\x85;\xa7\x15\xf9\xbe\x8c\xf0l;rL\xcb\xbeoO\x1e\xbd\xf2\xfbe\xbf5\xe4\xd7\xbeq\x18\x95\xbe+\xf2!\xbf\x9cS\xfa\xbf\xd0|\x80\xbf\x9c\x8ar\xbe\r\x95E;cFN\xb9|\xf2\xad\xbe\x15[\xbe\xbd\xbb\xb7\xb8\xbe\xd1\x8f\x0f\xbf\xd4\x88\xaa:\xdb\xd2\x0e\xbfl.\x12\xbf\xcb\xde\xac\xbf\xfb\x11F\xbf)\t\x11\xbf\x141\x08\xbf\x9f\x99S\xbeD\xe4\xee\xbe\x08\xcc\x92\xbe\x1aF\xec7\x01\x07\xc4\xbd\x00\xac\xc6\xb9\xf2X&\xbe\x8c\xcf\xa3\xbd\tm\xbb;^ \x13\xbf\n\x97M\xbc\xbe\xba\xad\xbeu\xa5\x10\xbe\x94\xdeb\xbf!r\x81;jEM\xbf\xd6\x97\x0b\xbfa\xcfm;\xac\xf1\x8e\xbfHA\x82\xbfj\xd2\x1f\xb9H\x9c:\xbdC\x10R;\x9f7M;\xe6\xac\x92\xbe8a\x89\xbf\xd7qz\xbe\x88\xc8\x95:P}\x97:\x1dC\x88:I\x9d\xe7;\x0b-i\xbf\xc0\xe0\x13\xbe\xad/\xc59\xe5p\xb8\xbe\xc6\x1f\xb8\xbd\x18\x16\xc7\xbfRp\x99\xbe\xf2\x89f:\xba+Z;\xda\xfa\x15\xbc\xda\x89a\xbd_\xbfj\xbf\xad;\xb3\xbaG\xaa\x9a\xbe$\xfa\x94\xbe\x01T\xa3;\x9b'\x83\xb9\x89\x80\xa5\xbd\x18\xcd7\xbeL\x1f\x92\xbeR\x9eZ\xb9\xf8$c\xbf\xf7\x1d_\xbe\x7f43\xbb\x08\x9c\x84\xbd\xfa\xd2k\xbe\xc9\x99\xa3:\xfbP\x86\xbb\x17\\\xd5\xbeZ\x9e\x91\xbe\x87\x05\xfe\xbe\xf4\xe7#\xbf\xe4\xcc\x8e\xbe\xbb\x9c\x87\xbfA[\x17\xbf\xa9VQ\xbf\x93\x8e\xaf;\xc1\x8e\xa0\xbcA\xca\x8c\xbfL%';p'\xec\xbe+\xc3 \xbf\xcc+\xbe;\xce\xdc\x8d\xbe\x81)|\xbe\xbci\x00\xbe\x0bk\x0b\xbf\xd7\xf8\xb7;\x06\xf6\xc0\xbe\x13l\x9e\xbe\x8a\x0fo;Q\x9fp\xbf\x90@\xae\xb9\\\x18\xd3\xbd\xb9\xf0)\xbf*w\x8f\xbf\xec\xea\x98\xbf\xf0h\xbf\xbf\x94\xfc]\xbf_\xe0t\xbe\xb5\xfa\xa9\xbe\x8a\x03\xaf\xbf\xfb%u\xbe\xfb\xb2G\xbe\x07\xe32\xbe\x1e\xff\xb4\xbd\x9fnY\xbf,\x14T\xbf\xc1\x0b\xa2;\xdcm\x08\xbdx+ \xbe*\xe1.\xbf%d\xa8\xbfp\xbbX\xbb\x11\xf7\x8f\xbe\x98\xb3\x07;\xc1i\xa7\xba99F\xbf\xc3\x15\x86\xbe@\xfe\xb9;#\xdb\x8b\xbe\xd6\xe5\x0f\xba\x9d\x10M\xba}L\x8d;<\x03\x98\xbe\xef\xfb\xd8\xba\x97K\x14\xbcpM\xbc\xbe\xab\xfce;\xee-\x93;\xf1\xba\xa5;\xd2\tf\xbf\x84.\x1d\xbe\xa5V\xfc\xbd\xbfk\x05\xbf\xa6\xbe\xa0?(\xce\xe3>\xb9\\\x8a\xbbz\x0e3=\x81\xe1X?\x0b\xd4\x88>\xb2$\x12?\xc6\xd6\x9b\xb9\x90\xb9#=J\xa1n?\xda-\xd0<l\xd1\xeb>\xc3S,?\x8f\xc9\x94=EI0=\xe9\xe5\x96?\xb5\xedB<\xde1_>\x82k\xd3:\xc4+\x94:\xdb\x03'>\x0e\x80\xe0>n?\x9c>\xbfaG?\xff\xf9\xd7>r.\x8f:\x8a\x1cn?\xc2\xf3}>\xcc\x14\x85\xbatK\x14?s\xe3\xe6=\xfe,k>\xd3G0>\xf5\x16l\xbb\x94N\xbd>\x0c\x87D?J!\x85?\xa3\xef\xc6>\x19\xa4\xb6?D\xcd\xcb=\xf7\x11\xc3\xba\x7f\xac\x93:u/\x1e?\xb0{\xbb>\x1cG:\xbb\xda\xdbI=\xa9\x92a?n\xf76?[\xb6\xa2>\xf3r\x94?e\xddI>\x9bIe?\xb0F\x83=\xb5 \xaa>\xeea\xed\xbb\x99\xe0\x04?\x04\xe1\xb8>)\x12\x87>\xba`\t\xbc\x81\xd7\xa3\xbb`\x04f?>\xa8\xb9?\x97\xa4\xbd?\x00\xea\xfd=G\x85\xe1>,\x08!?\xad$\xb0\xbb\x89>\x8e?{\xc9J?\xa0&\x05?&\x08\xb1\xbb\xf4\x9f\xc9\xbbVG:>\x0e\x11\xa3<v\xdd\xa1>'\xd3\xd8>:\xf6<?\xca]\xd6>\x01\x1es?7i\x94?\xfb\t\xbc>\x0f\x93\xd9>\x9d\x19&?\xee\x90+\xbb1\xbb\xa8>,$#>\x1b?Q?\xe1fa\xba\x80:\xc1?X\x8b\xd9=n\xdd\xab9L)\x18?~:$;\xb3\xbc^\xbb\x8cK\x87?\xfb\x01O?6\xd7\x97?\xf5/a?\xfd6\x0b?\xc1\xc6T:G\x98\x08?Q\xd9W?=\x00\xdb>S1\xc5>n\xcdI?Ck \xbb6\xd5\x90>\x8a\xffY?\x8b\xd8\x1b>\xe2\xf5\n?[#\xe3\xbbKR\x81>\x9e\xd5z?}U\x07?\xee\xaa\x14?*\x14\r?\xe0Q\xbd\xbaK\xaf\x7f?\xa7G\n?S\xfe\x1e?.\xa4\x8a?\xc5Y\xa0?F\x19:>\xac\xbc=?\xf57\x05?6\x1d\x13?\xe3\x91\x1e;$\x8d\xb2>\xa5\xe5\xff>\x04\xbd\x89?\xb8\x9c\x92>l\xbb\x12?5O\x8c?\x9bFr>\xefnl?5C\x02?\x01>\x04\xbb\x16\xf9\x9a>\t\xaf\xe3>m\xbb\x8e=D\x9d=7\x91\x0e`?\x08g$?\xd00g\xbb\xe1\xdd\x89?s\x92\x15?<B\xed>'\x99\xce?x\xc3\xdc=\xbae\x05?\xbc\x02\x8b>\xa1\xf8\xdc\xba\xb6pN?Y\x1d ?\xe9\xf4\xd8>\xad:\x8f?R\xba\xfc8ro\x7f?:\xdfx>d\x07\x11=\x80\xc8`=\x96\x0bD\xbb\xc3~\x91\xbbu\xd1\x1e\xbb\x9e\x12\xab>+~ ?\x07\xf6\x84\xbb\xad\xe2\xfd>z\x97\x1e?R\x9f\xe4>\xe9\xcb\xe8>\x01\xd8\x82\xbb\xdc\x80\x08>\xb7$\x87?H\x1d\xd3>\x92[\x17?\x16>\xc0\xbb\xff\xda\xcb\xbb\xeey\xbb?3O\xba>L\xfc'?\xb0R\xa1>\x92\\\x92\xbb\xb3\xeb`?!\x9f\xc1?\xe6\x15\xae>\xd6\xa42?\x8aY\xd8>\x13\xeb\xf1>\xd9\xdf\xb9=\xcex\x86?,\x192?u>\x85>\xbe\xfc\xd3>T%\xb4?\xfb\x1dO?\x9ci\x97=RD\x04>Eo\xdb>\xa0M\xf6>"
-p349
-tp350
-bsV473381420400795648
-p351
-g2
-(g3
-(I0
-tp352
-g5
-tp353
-Rp354
-(I1
-(I400
-tp355
-g12
-I00
-S'\xf0\xa7\xf8<%\x1d\x07\xbc\xe4f\t\xbe\xea)k8e\x19\xb9<0#/\xbc\xeb[\xc3\xbc\xcc\xfe\xb1\xbd%T\xae\xbc\x9f1\xa1<\xef\x82\xb2:=A\t\xbd\xf4\xc6\x1d<\x9a\tH;\x1a\xcf\x0c\xbd\xc2y\x06=Kw\x01\xbdU\x16-\xbd\xd5\xbbe\xbdTg\xc6\xbc9J\xb5\xbd\x8c\x1a\x16\xba\xd1\x8a;<qk=\xbd\xe6\xe44\xbc\x08\xcc(\xbd\xd0\x97y<\xf3f\x88\xbdEc\xe1\xbd\x8c\xe6\xfe:\xe7\x16?\xbd\xfa\x0f"\xbd\xa1#\xfc;\xa7\x9d\x01\xbe\xc3\xa0\x95;\x81\xb1\xe8<\x11\x84D<\xcb\x01\x1c<\xb4g\xe5<&^6<\x9a\xe75\xbd\xe5I\xc2\xbc*x\x87<\xd0U\x98\xbd\xfc\xe3\x8d\xbd<d\x8c\xbc)R\x13=\xe8\xa0\x92;\xc9M\x8d;N\x8c+=\xe2\xfb\n\xbc\xc4\xb3\x10=yTv\xbdb\x83\xb8\xbb,\x0e*\xbe\x1be\x8c<T\x80\xbc\xbb\x0fh\x1b\xbd\xa6\xa8J\xbe:\x08#\xbe\xcf\xcb\xa0<\xa6\x1f\x8e< \\\xb4: \x1e\xb8\xbd\xe1f\x0b\xbc\xb8 \x94<\xa42\xb5\xbdz\xc4\x98<F\x08\\\xbdN\xf7\x85\xbd\xbf<?\xbe\xf3\xba\xf9\xbd\xa7\x95\xb2\xbc\x8f\xeb5\xbd\tSW\xbd\ri\x80<\xa0\xd4\x9d<P\xb0Y<H@U<i\xad\x8f<(Z\x8f\xbc\xc2\xfaO\xbbL0\x05=\x0e\x85\xb7\xbd&\xc3e<\xb4\xbfD<+\x86\x9a<\x89W\xfa\xbd\xc0;8=\xbaP\xb0;3D\x8f\xbd\x91&I<\xd8#\x99\xbd\xf43p\xbcC\x8e\xca<\xa3\xd4^\xbb&O\xa0<\xe8\xe5\xbb<\x86\x95\x87<\xcc5\x19\xbdL\xeb\x7f:\x9c(\xd8<\x85\xed%<\x1eNi<\x07\xde*=\x00\x1b\xdd\xbd\xfb\xd1c\xbb\xb0\x1b"<\xebo\x11<\xc0;[\xba\xd0\xe4\x9e\xbd\xbf;\x9d<J\xc3?<B\xbcw<\xa6+\x80;\x8c+\x9b;\xb6+\t\xbe1\xbf\xbf< \xb8A;\xa4\xea\xf5;F\xf7?=\xcdn\x18<h\x96\x1c\xbc\x00C\xf2\xbc\x81"\x11\xbd\x8b(\xa9<\xc5\xb8C\xbd\xbbT\x0e\xbb\xa3\xda[;\xb2\xd87<\xbc\xe3k\xbb^u\xf7;}\xb4\xb6;~\xa1\xf2:\x8a\t\x0c\xbb\x87\t\xff;i\xbf\xee\xbc\xe4\\\x0f\xbb4\xf4\xf4\xbc4\xca\xea;\xee6\x9b\xbdpD\xdf<\xcf\xfe\xb6;<Q\xec\xbd>\xf7\xe5<WvX;\x92\\\x94<~\n\r=\xcd\x0b\x7f\xbd\x0b\xe2\xc2:\x95\xdc\xe1\xbc\x145\x89\xbdg\xf8\xbb<\x17\xe7\xd6<\xfa\xad!\xbc\x8b\xc5\xf9<tnx\xbdlU\x13<\x0e\xb2\x9a;\xd4%\xe8\xbd\x18\xe5\xa4;-\xb3\xc3\xbd4\t\x1e\xbe\xff\xd4\xb9\xbd\xeeU7\xbcb\xa7\xb9\xbc\xb5O\x1c\xbe\xed\x06\xed<\xc3\xbbK\xbc\x96S-\xbd-M\xa7\xbbAl\xd6\xbd\xf4\xaf\x12\xbd\x88\xb91=\xe2\xe4\x8a;&\x94\xaa:\xe7L\x15\xbe\x0e\xc5\x10\xbe<Pz\xbb\x9c1\x08<\xecg\xda<\xeb\xe4\x83;\xa5\x03\xaa\xbd\x859\n\xbd\xa2\x93\xce<\x06\xbf\xeb\xba\xa6+Z<w\xa3\xc9;i$\xd5<t\xeb\x97\xbd\xa3$\x9b<\x08\x17\xee\xb8\x1b:><x\xa4\x8f<\xf3\xee\x1e=\xc2\x1c\xf9<|E\x1f<\xfc\xfe\x97;\x10\xde\xd7;\x16\xe0\x0e<G\x1b\x03>L\x1f\x84\xba\xb1\xa1\x03\xbd\x88\xaa%<\xac2\xbf=\xce\xed(\xbb*\xcb\x99\xbbH\xe6\xa4\xbc?\xde|\xbb\xf7\xf3\xbf=\xac6V;\x0f\xd3\xb3\xbb\xc6\x9a*=\xea*$<\x93\x8c\x14\xbc\x1cx\r>\xda\x06\xe3\xbb\xff*\x85\xbb\t\x941\xbc\xeeF{\xba\xda\x8e\xa9\xbc\x8f\x0c\xec;r\xfaA=\t\xa8i\xbc\xee\xa0\xd7\xbbw\x87\x03\xbc9\x9a\x9d=\xdd6\x9e\xbc\\\x1b\xdf\xbc\x90\x90\xd2;\x0e\xb4\xf3\xbb\xd2%\x18\xbc\t]\x16=)\xec\xd6\xbch\x84\x9c<"\x9f\x04>\xde\xb9i=\xff\x9fB=H\xe9\xf5=%\xcc\x1f=@a\x99\xbb\xb0Z\x9a\xb9\xd5ou=EY\x98\xbcC\xba+\xbc@\x08\xdf\xba\x83\xe7\x0f>\x83\x0c\x14=\x84\x01\xaf<H\xe6,>K\xdbv;3\xb3\x17>\xd2\xd0t\xbc\xc6\xfcd;\xdb\x02/\xbdYI\x8a=\xe0\xf8\x02:\xec\x97\x00\xbc\x0f\x0e@\xbd\xba#\x11\xbdG\xd2\x94=\t~\xb0=\xa4\xd0\xee<\x94\x88\xb2\xbcd\xc7B\xbb\x8a%\x9a= \'\x9a\xbcK&\xb5=\xa1s\x88\xbc\x9aFk\xbcy\xdc8\xbd\xe5\xd5\xd5\xbc\x07\x8e\xe9\xba\x02<\x1c\xbc-\xc9k\xbc\x95Hx=u\xb6\x93=2\xfbz=r<\x95=\x8a\x8f\xa2=\xa4\xb7\xa5\xbb\xb1\xd6,<\x8dy\x02>\x13\xf3\xa2\xbcn\xffs=b/\x19=\xbc-\x98=\x9ee\x04\xbd\xadR?>\xd2\x86\x87<:\xc96\xbc\xa5 [=\xdc7\x97\xbcL\x7fY;\xc8\x10\xe6=[\xfa(\xb95\xc4\xc4=O\x8b\xcc=\xee\xdd\x93=\xb3\x0b\x97\xbb\xd7\xd3\x03<\x89\x90\xd9=8GO=\x93\xc5\x83=\x9a\xe9B>\xb3\x8f\xb4\xbcnSw;\xad\xcf[=`\xf3\x10=]\x8f\x00;FgZ\xbc7\x87\x91=w2j=\x86\x9a\x96=V3\xb0<\x92\x94\xe0<\xe5\x99\xe1\xbc\xb7/\xcd=8\xa51<A\xfe\xbc<x\x94;>m!I=\xc6\'\x82\xbb1+\x85\xbb+U\xf0\xbb\x8b\xb8\xb2=\xc7A2\xbc\xc9\x96\xab;\xc2l\xae<\x1d\x7fd=\x90\xc3 ;~0\x19=\xd9S\x05=6\xd6\xab;\x8dI\x83;HQ\x08=\xda\t\x0c\xbb\x109\x89\xb6\x0f\x9cn\xba\xb6_\x01=\x89G\x91\xbco>\xf4=)\xda\xbf<\xd9\x98\xe2\xbcY\x99\xff=9z\x8c<\xe5S\x85=\xedo$>\xef\x02z\xbcJ\xe3-<\x0b\x96Y\xbbN\x9b\x98\xbc\xd9\x96\xdf=\xa2R\xcd=\xa6\x81\x049\xa2-\x04>\xe65F\xbc\xe7\xb1U=P;\xf4<\x95\x1d\xc3\xbc[\x91\x14<7\xa8\xbe\xbc\x8ad\x04\xbd\x12\n\x8c\xbc\x84\xe5\x99\xba\x81W\xc9\xbb\xc0J\x13\xbd}\x04\xea=X3\xc3\xbb\x04\xdc\xb9\xbb\x1b-C;\x80[\x93\xbc\xa9=\xb8\xbb\'\xc16>\x11\xd7c<\xe3\x17\x8d<K\xbb\x04\xbd\xeaW\n\xbdmW\x81<\x8c\xaeG=\xc6\x1e\xf6=\xce\xb0\xdd<\xe3\x96\xa0\xbc;\xa9\xf8\xbbSf\r>S\x84E;\xd6\xbfx=\x951\xb1<\xca-\xe3=g\\\x87\xbc\xc1\xc4\x96=\xb6M\xad;\xb4#E=\xac\xf6\xa2=\xa7\xb0(>\x8a\x91\x10>\x84\xfd\x14=\x81\xea\xbe<D|6=\xa5\xba\x97<'
-p356
-tp357
-bsV474059577772617729
-p358
-g2
-(g3
-(I0
-tp359
-g5
-tp360
-Rp361
-(I1
-(I400
-tp362
-g12
-I00
-S'\xa4\xdd\xb8<%\x1d\x07\xbc\xe4f\t\xbeL\xf1\xc1:~\xfbT<0#/\xbc\xeb[\xc3\xbc\xcc\xfe\xb1\xbd%T\xae\xbcx\xa2Y<\xac6V;=A\t\xbd\x15L$<>4\xcd;\x1a\xcf\x0c\xbdm\xe2\xae<Kw\x01\xbdU\x16-\xbd\xd5\xbbe\xbdTg\xc6\xbc9J\xb5\xbd \x007;\xfd\xa8\x02<qk=\xbd\xe6\xe44\xbc\x08\xcc(\xbd!O\x0b<\xf3f\x88\xbdEc\xe1\xbd\x8c\xe6\xfe:\xe7\x16?\xbd\xfa\x0f"\xbdt\x9d\x0f<\xa7\x9d\x01\xbe\x93\x10\xd2;\x9b\x0c\x91<+H\xcd;\x1a\x1b\x18< \xa5\x93<D\x18\xdc;\x9a\xe75\xbd\xe5I\xc2\xbcf\x136<\xd0U\x98\xbd\xfc\xe3\x8d\xbd<d\x8c\xbc\x0fz\xc1<\x88[\x8f;3\x16\xe4:1b\xe1<\xe2\xfb\n\xbc{\t\xcb<yTv\xbdb\x83\xb8\xbb,\x0e*\xbez=\x12<T\x80\xbc\xbb\x0fh\x1b\xbd\xa6\xa8J\xbe:\x08#\xbe\x9a\x85&<M-,<\xb9\xc7\xa2; \x1e\xb8\xbd\xe1f\x0b\xbc\x0e.6<\xa42\xb5\xbd\xc3b8<F\x08\\\xbdN\xf7\x85\xbd\xbf<?\xbe\xf3\xba\xf9\xbd\xa7\x95\xb2\xbc\x8f\xeb5\xbd\tSW\xbd\x8b\x03(<\xb76\x1f< \xc8(<\xc8U\xf1;\xe6\x89Q<(Z\x8f\xbc\xa1\xac\xd1:0\x86\x9b<\x0e\x85\xb7\xbd\x1d?%<\xebW\x1f<\x7fd\x85<\x89W\xfa\xbd\xf8K\xe5<\x16M-;3D\x8f\xbd\xe0\xe0\x10<\xd8#\x99\xbd\xf43p\xbcV\x10\x9f<\xa3\xd4^\xbbX\x18z<\x815\x87<I\xc1%<\xcc5\x19\xbd\x0b\x9e\x9a;\'\xb7\x8c<\x80\xca\x15<?\'\xfb;x\xaa\x12=\x00\x1b\xdd\xbd\xca6\x07;\x9b\xfe\xfa;3\x19r;\xfb5[\xb9\xd0\xe4\x9e\xbd\x9b\xddr<\xf5\x03[<\xfe\x0f*<&O\xba\xbaai\x88\xb9\xb6+\t\xbeUCw<J9\x9a;~g\xa7;\xed\x81\x02=\x10(\x1b<h\x96\x1c\xbc\x00C\xf2\xbc\x81"\x11\xbd\x0c\xe0X<\xc5\xb8C\xbd\xf3|t;\x8c\xe3C;n\xbd\x07<\xbc\xe3k\xbb\xd6o\xa4;\xaa\x16\xb2;\x06\x90p;\xe6\xb9\xd3:V\x126;i\xbf\xee\xbc\x98Z\xe5\xba4\xf4\xf4\xbcz\nz;\xee6\x9b\xbd\\P\x8b<oU\x8e;<Q\xec\xbd\xd7B\xac<\xd588;\x89\xd8\xef;\x1c\xfa\xad<\xcd\x0b\x7f\xbd"Cz:\x95\xdc\xe1\xbc\x145\x89\xbd\x07:\x88<3\xb6S<\xfa\xad!\xbc\x91\x95\x99<tnx\xbd~T\xff;\x0c\x9b\x0c;\xd4%\xe8\xbdK|\xb8;-\xb3\xc3\xbd4\t\x1e\xbe\xff\xd4\xb9\xbd\xeeU7\xbcb\xa7\xb9\xbc\xb5O\x1c\xbe\xe9\xbb\xab<\xc3\xbbK\xbc\x96S-\xbd-M\xa7\xbbAl\xd6\xbd\xf4\xaf\x12\xbd\x19\x07\xe7<\x95D=;E\xa3V;\xe7L\x15\xbe\x0e\xc5\x10\xbe\xb0\\\x0b;\x17\xbf\t<!F\xad<p\x1f\x9e9\xa5\x03\xaa\xbd\x859\n\xbde\xc2\xae<e\xf189\xd6A\x04<T\xc3`;\xb1\x07\xa4<t\xeb\x97\xbd\xb0\x00"<\x00j\xf99\x9e\xe9\x98;\xa7\x87\x9d<z\x03\xe2<\xbf\x91\xb3<\xfa\xb9\xdd; \xa6\xcd;\t\xd0\xde;\x13\xf7\x08<G\x1b\x03>\xcc*\x11;\x9b\xaf\xc1\xbc\x88\xaa%<\xac2\xbf=l|\xed:!+\x9c\xbb\xbd\x8ez\xbc{\xaf\xe3\xbb\xf7\xf3\xbf=\xf6\xd0\xbb;N\xcd\xe6\xbb\xc6\x9a*=\xea*$<\xdd\xf8\xdf\xbb\x1cx\r>\xc2\xfe\x87\xbby\x85\xb2\xbb\xbf\xfe\xd4\xbb\x15\xd8C\xbaoWW\xbc\x8f\x0c\xec;r\xfaA=\xf3V\xb9\xbb\xf4X]\xba\x8c2\xbb\xbb9\x9a\x9d=\tL"\xbc\xfa\xbc~\xbc\xee#\\;f\xd3\xeb\xbb\x06\xdd\x0b\xbc\t]\x16=\x8f\t\x89\xbch\x84\x9c<"\x9f\x04>\xde\xb9i=\xff\x9fB=H\xe9\xf5=%\xcc\x1f=\xc0(\'\xbb\xda\xbfj\xbb\xd5ou=\xcdv\x85\xbc\x89\\\xf5\xbbt\xcb\xfe\xb9\x83\xe7\x0f>\x83\x0c\x14=\x84\x01\xaf<H\xe6,>\xe7\xcf_:3\xb3\x17>>\x85\xcf\xbb0b\xc9:\x8a\xec\xf9\xbcYI\x8a=7\x99\x8a\xbb"\xa0\xda\xbb@\xb9\x08\xbd\xd0;\xc0\xbcG\xd2\x94=\t~\xb0=\xa4\xd0\xee<(@\x89\xbc\xe8\xa6z\xbb\x8a%\x9a=H\xcbc\xbcK&\xb5=cK\x0b\xbc\x10\xe5\xf7\xbb>[\x0b\xbd\x14%\x8f\xbc\xaa\xe8\xba\xbb\xe7(m\xbb\x89U\xbc\xbb\x95Hx=u\xb6\x93=2\xfbz=r<\x95=\x8a\x8f\xa2=\x15\xd9j\xbb\xb1\xd6,<\x8dy\x02>m(\x92\xbcn\xffs=b/\x19=\xbc-\x98=\x04G\xa0\xbc\xadR?>\xd2\x86\x87<\x8f\xf4U\xbc\xa5 [=\xed\xa4b\xbc\xcd\x94\x91:\xc8\x10\xe6=\xe2m*:5\xc4\xc4=O\x8b\xcc=\xee\xdd\x93=\xfb\xc3\xd7\xbb\xd7\xd3\x03<\x89\x90\xd9=8GO=\x93\xc5\x83=\x9a\xe9B>g\x9bF\xbc\xb1n\x19;\xad\xcf[=`\xf3\x10=]\x8f\x00;2\xeb\x13\xbc7\x87\x91=w2j=\x86\x9a\x96=V3\xb0<\x92\x94\xe0<mg\xa8\xbc\xb7/\xcd=8\xa51<A\xfe\xbc<x\x94;>m!I=\x0f\xf1\xc69\xed\xf66\xbb\x92\xa9v\xbb\x8b\xb8\xb2=\xa2\x90\xcc\xbb\xc9\x96\xab;\xc2l\xae<\x1d\x7fd=9\x973;~0\x19=\xd9S\x05=6\xd6\xab;\x8dI\x83;HQ\x08=+\xbf\xb0\xba\xb9\xd9_\xba\x02\x08@\xbb\xb6_\x01=6\xd5F\xbco>\xf4=)\xda\xbf<\xb6v\x82\xbcY\x99\xff=9z\x8c<\xe5S\x85=\xedo$>\x1a\x180\xbcJ\xe3-<\xd8\xb0\xe5\xbao\xbc"\xbc\xd9\x96\xdf=\xa2R\xcd=\x80\x11\xf2:\xa2-\x04>4\x10\n\xbc\xe7\xb1U=P;\xf4<\xb97\xad\xbc\x0b7\x0e<\xe7d\x8e\xbc\xa2\x10\xb3\xbc;v\r\xbc\x17\x05\x81\xb9+\x19\xfd\xbb\xe4\xbd\x99\xbc}\x04\xea=\xa8\xcd*:\x88]\x11\xbc\x9e\x11\x9a\xbb\xda\xb4\x81\xbc\xa7\xa6\xde\xbb\'\xc16>\x11\xd7c<\xe3\x17\x8d<\x8a\xc7\xb6\xbc\x80b\xac\xbcmW\x81<\x8c\xaeG=\xc6\x1e\xf6=\xce\xb0\xdd<!V1\xbcl\xc3\xbf\xbbSf\r>+\x8bT:\xd6\xbfx=\x951\xb1<\xca-\xe3=\x14`g\xbc\xc1\xc4\x96=\xb6M\xad;\xb4#E=\xac\xf6\xa2=\xa7\xb0(>\x8a\x91\x10>\x84\xfd\x14=\x81\xea\xbe<D|6=\xa5\xba\x97<'
-p363
-tp364
-bsV445232063080173568
-p365
-g2
-(g3
-(I0
-tp366
-g5
-tp367
-Rp368
-(I1
-(I400
-tp369
-g12
-I00
-S'\x0b\xd2\x90<\xf0\xd3\x07\xbfJ\x14\xa1\xbf\x03\x96\x16\xbfj\x83\x99<\xce\x8c[\xbf\xb2\xe8h\xbe\xd7\x11\x8c\xbf\x96\xe1\x11\xbf\xf3\xcfu\xbd\x1b\xba\xad\xbd\x8a\xe3,\xbd(47\xbd\xe5\x1b\x80\xbb\xd8\x13\x12\xbf\xc0.\xa2<\xee\x82=\xbe\x9b\xd7\x9f\xbe\xaciL\xbfK\xf2\x8b\xbe!\x99U\xbf\n\xf6\xe1\xbdy\xba\x98\xbb\xe9\xae\xaf\xbf\xec\x89i\xbe\xc4\x8e6\xbf\xc8Jy<\x9b\x04\xb1\xbfRyX\xbfq\x00A\xbd\xbf\r\x14\xbf_\xd8\xaf\xbeV\x1f"\xbe\xad\xaa?\xbf\xe3\xcad\xbe\x10\x0b\xa4<\xb4\xf1\xfb\xbb\x1c\\\x86;C;\xc6<\xf6\x97\x03\xbf\x04\xc7\x11\xbf\x02\x8c6\xbf{u\x92<\x99\xecU\xbf\xf6\xb0\xe2\xbeZbc\xbe\xf0\x19\xd2<\x90\xa3\x94\xbe\xc0\x8d\xca;\xdd\x7f\xd4<\xd5\x1e\x89\xbda,\xef<*\r=\xbf\x82\r\xf7\xbb\xd7=\x97\xbf\x1f\xa7]\xbe\x91X(\xbd\xe0\xfb(\xbf\x8d*\xe0\xbfQ\x92\xbf\xbf\xb0\xff"<\x05H\x0e\xbd\tZ\x96\xbeiYK\xbf\xa3\xcb+\xbe\x81\xec\x85\xba\xab\x1d+\xbf\xa0:\x06<\xb3j\x99\xbfk[M\xbev\xac\xe4\xbf\x91+h\xbf\x82&\x83\xbeT\xad\xd5\xbe6\x05\x08\xbf\xd2|\x99\xbbf\x92J<\xa4\x02<<\xcc\x0c\x84;\xf3\n\x82<s\xd8\xf3\xbe.67\xbe\x07E\xb2<\t\x94\xd4\xbe*#J<9\xc4m\xbc$\xd4\x99<Z7\x8e\xbf\xa1\xc0\t=v\x02\xa4\xbeN\x15\x05\xbf\xac\xe7\x0f<\xab\xd4\xbb\xbf\x04\xc9\x10\xbf\xa0j\x93<\x06e\x01\xbe|S\x1e<\x9f)\xab<\xf7\xe3{\xbe\xd9\xe5\xe6\xbe[\xa2\xcd;\xff!\xa2<\x1e\x0e\x17<\xfb\xb9\x13<\xb8\x0f\xe9<\x9f\x8e%\xbf}(\xf6\xbcWp+\xbbxH\x8f\xbefO\xce\xbd\x0c7\x1e\xbfX\xb5j<\xdf\x11><\xfdA\x81\xbb\xb1"I\xbf\xa3^C\xbd\xbenb\xbf\xa2\xbb\xa4<\xfe\xef\xc1\xbd\x98\xb4\xc0\xbcG\xad\x19=\xbd\x18m;\t\xb5e\xbe\xf6\xaf/\xbd\x91\xa6\x80\xbd^\xe5\\<\xde\x85\x95\xbf-2\x03\xbev$\xd5\xba\x8b\xe6\xeb;\xcaK6\xbdi\x1f\x13;)\x0c\xc6:\xf62\xaa\xbc*\x07J\xbb\xfc\xf6\x07\xbf\xc6\x17\xb6\xbef\xde\x92\xbd=\x10\xaf\xbe\x84K$\xbf\x9f\x88\x17\xbf\xf3\x02\xb6<\x13\x10\x1d\xbem/\x80\xbf\xf0(\x90<\x17#\xe5\xbeK\x0b6\xbeB}\xaf<\xe1\xde#\xbf\xb28:\xbeK\x83\x80\xbe\xa8\x85\x1c\xbf1\xce\x86<\x03\x90\xbc<\xc3\x9d\xb4\xbc\xb0[\xc7<\xebx\xe6\xbe\xe9\x17\xda;\x95\x0fR:\x18\xcd\x1c\xbf\'\x1e\xad\xbe\x192P\xbf\x00\x15h\xbfhW\x9f\xbe\x0f\xbd\x9a\xbe2N\xe3\xbe\x82\xea\xb3\xbf\xdcz\x9e<\xc58\x0c\xbf\'\x1b\x01\xbe\xfb\xa84\xbc\xd5\xf9\xa4\xbe\'\x00g\xbe\xf3\x10\x04=\xa9\xd5X\xbc\x13\xdaI\xbe\xb9\xbdC\xbfq\xfb[\xbfTt\xb2\xbe\x0f\x1c\xaa;\x06\x8c\x7f<\xbc\xe0\xc7\xbd\xa4\xe6\x1d\xbfm\xcb\xe8\xbe\xf1\xadZ<\xe4\xeb\x8c\xbe\xdc\xa6\x18<c\x12l;\xd4\xe8\xb7<h\xd8\xec\xbe\x91pP<\xc0F\xdd\xbb/4\xc9\xbe\xde(W<\xd8\xf1\xbf<X\x9d$\xbb\xff%\xff\xbe\xd3e%\xbed\x1b\x13\xbe\x9d\x8f\x19\xbe`r\xcb?\xf7]^>C\x1d\xcb\xbcAg\xe6<}e\xbd?\xca\x08&<\xfe\x1d\x0c?\xc2=\x95\xbc\t~o=&\x07\xe9>\x9eL\xaa>\xd9\xd4`?$\x91G?k\xfe\xfb>\x085K\xba,\x93\xc6?\xd1=\xe8=\xb1L\x8c>_\xc6\x06\xbc+\xf4)=\x94\x03\x8c=\xa2\x08!>|9\xae>s\x92\x85<(0\x84>\xed\x9d\x07\xbcK\xdbH?\xa6{\x86\xbc\xd5\xec\xc9\xbc\xc8)l?\xf16\xe7>U\x1b\x94\xbadL\x9c>\xe6=\x89\xbc\xf6\x98\xa8>d&I?g/Z?\xab!A?q\xb2\xab?\x96\xab\x06>\x14*\x8b\xbb\xe0o\xb6>\rb\x82?\xf0F\xb4\xba\\\xbf?\xbc\x10\xda\x95\xbb\x18:\xa8?Y\xab\x04>\xafr\xbf>?-\x90?\x8e\xf1\xc3>\x7fL\xba?\xa2>z=\xf8x\xec>C\xc6\x03\xbd\x11\x12\x94?s\xf1\xd1=C\xbc\xb5\xbb\xd6\xaa\x0f\xbd\x85\xfe\xda\xbc\xf6\xf5\x84?\xb9\x86\x04?\x04:\t?0\x93\xb5\xbc4\'\xce>n"V?\xc9\xa8\xac=!\x08\x81?\x01\xb2\xf6=\x95\x8b\xfb<\x9e\xaf!\xbd\x0eA\xcd\xbc\xaa\x08\xf0>,\xad\xb4>Y]\x95=PA@?i6T?\xbdC\xf5>_:\xa8>\x87\x91\xb4?\xc53\xb0=\xd7y\xda=ino?\x92v|\xbc1\xaa\xf5>\xde\x11\xca>^\x92\xbb?\xd4\xa4\xd4\xbc\xa87\xf3?*\x936?\xad\x06\xe6\xbbC\x8a(?$\xba\x88\xbc\xc1s\x00?,k\xab?\x84\xb5;?\x99\xd33?\xf1\xda\x92?\xd4\xe0 ?\x05\xfcC>-\xeb8?\xd7\xca\x86?\x052\xb6>\xfc\x18:?I\x96T?\xa5<\x9a\xbcRk\x89>f\xdb\xde>p2P=\x1cF\x18?KU3>\t\xae.?\x99Gh?N\xfe\xd5>vz\x0b>\x06\xf9B>\xdb\xa8\xaf\xbc\xb1\x01\xa0?\x10\x13\x03?\x8d}"?\xe1\xd9\xcd?\xf2\xad+?\x96bm=\x0e\xf2\xe0>*vX?\x08\x9c6?B\xd9c\xbb\x01\xde\x1b>\xa1\xa2\xb9=\xbfN\xb7>\x10a\xd5>\x86\xbce?0(\x86?G\xb1e>\x9a\xb2\xa3?ht\x18?e\xdc\x8b>\xf4\xeb\x8d=\xe3\xd4\xd7>8\xf2\xf8>\xcfkP\xbc\xed\xf4w?\x01\xcb\xcf>\xd3\xdd\xab\xbc\xe7\xa9%?\xe2\xe9Z=0\xccs?\xd6\xd7D?\x90\xd3\\\xbc\xceR\xdf>\x10\xd5>?\xe6\xf3\x9f\xbbG\xbe\xf5>\xaa\xf9h?4\t\x0e?\x80:\x8f?\x19\xcf\xc5\xbb`\xe1o?\xcf\xe5\xb7>\x89\x07\x9e\xbc\x12\xdcX?\xcd\x87\xac\xbc\xac\x84\xc4\xbca7 \xbc\xf5#h>\xfb.\x93=:\xe8\xe7\xbc\xe1TN?\x15\xd0\x15?ILL:a3\x02?[P`\xbcl\x9fn>7c\xe0?F\xfc\x9f>\x1d\xf6r>\xde\x0f\xd3\xbca+\x9f\xbc\xcd\xa1\xa4?v\xc9\xd2>=t#?\n\xcd\xc0>\xf0\xdf\xa7\xbc\xf1KS?\xf3?j?0\x94\x08=\xa9\x18j?2\x06\xc4>\xd8\x95Z?\xdaGi\xbc\x9c\ty?\x9d\xe91??=8?\xe7\x8dH?\xfe7\x88?I\x0bW?%\xfc\x03?\x1f"T>\t\x87\x9b=)\x1aM?'
-p370
-tp371
-bsV445233013765705728
-p372
-g2
-(g3
-(I0
-tp373
-g5
-tp374
-Rp375
-(I1
-(I400
-tp376
-g12
-I00
-S'M\xdc\r;a~\x91\xbf\xfc\x90\x9b\xbf$MR\xbf\xbf!|;8_\x0f\xbf\xd7<\xa2\xbe\xcd\xcam\xbfC\x87C\xbfz:\xac:\xcc\x03\x8f\xbfL\x08\x0c\xbf\\w+\xbf\x94O\xf8\xbe\xe4~\x97\xbf*\xba\xde;\x14R\xd7\xbeh\x93\xf3\xbe}8\x83\xbf\xbcP\xb0\xbf)\xc5\x94\xbe\xb1\xe6\x04\xbe=\xbc\x16\xbf\xe8p\x07\xbf\x9a\xc49\xbdc<!\xbf\xfall;\xf7Q@\xbf^\x16\xa0\xbf1O\xb9\xbf\x8aE\xb1\xbft\xd4\xde\xbe\x97\xcd\x16\xbf\xe0 \xf1\xbfq>"\xbf\x12a\r<*\xe4\xb4:\xb8 \xd9\xbdu\x9a\xcb:\xdc\xe4\x10\xbf\xff\xff\xf2\xbf\xce\xfd\xad\xbf\xa2\x91\xc7\xbe\x1e\xb7\xe2\xbe\xbe\xe2i\xbf\xebA}\xbf\xa0\xe2L;\x8fv\x8d\xbe\x9d1\x9e\xbd\x0f\xff\xc5:\x80\x86:\xbf\xfc\xf9g;N\x04.\xbf\xf0@\r\xbeI\xb2\x9d\xbf5\xe4\xd7\xbe,\x13\x03\xbf3\xb3\xca\xbfQ\n\x04\xc0\xb1\xea\xa8\xbf\x9c\x8ar\xbe=x\x0e<2\x07X:\xf41}\xbe\xd8\x8a\x0b\xbe\x9d@/\xbf\x7f\xd4\xe0\xbfK\x80":>\xca\x9b\xbe\r;>\xbf\xcb\xde\xac\xbf\xd4\x9eP\xbfR\x91t\xbf\x141\x08\xbf\xf1\x9aa\xbf\xdey\xd9\xbfa2\xae\xbe\x92`%9\xdb\xf2\x0e\xbf\x9f\x92\x9a;\xf2X&\xbe\x97[\xc2\xbd\x15 \xbb;\xeb\xdaD\xbf\n\x97M\xbc\x8e^\x97\xbe\x94_\xe9\xbe\x00\x9a\xc4\xbf?\xaa\xeb;\xb7\x82\x99\xbfh\\\xf3\xbf\xcbnf\xbe\xd7\x9b\xb9\xbfHA\x82\xbf\xa1\x1c\xb1;\x91r\xc2\xbe\x8d\x18\xd8;io<;\xe6\xac\x92\xbe\xd7\xb3\xaf\xbf\xda\xdc\xad\xbe\x93\x90E;\x85>\x1d;\x94\xb9\x0e;\xda\xcbn\xbf\x8b\xe1\xb7\xbf\xc0\xe0\x13\xbe\xc8\xcc\xbe\xbe\xe5p\xb8\xbe3y\xe5\xbd\x94\x08\xd3\xbf59\xa2\xbfx\xf1H\xbf\xed\n\x1b\xbfY\xbb\xe4\xbe\xde\xb5\x01\xbfl\xbb\xc2\xbf\xec\xd8\x19\xbb\xbe%2\xbf\xff_\x9e\xbf\xaae\xf7;2F\x7f;\x10\x08\xe3\xbe\xd4\xa3\xe3\xbe1\xd6\x13\xbf \x96J;\xf8$c\xbf\xe5#5\xbf\xdfO\xee\xbd\xa2\xba\xd4\xbe%\xfaO\xbf\xa4\xd5\xd4:\x9a\xfaY\xbc\x17\\\xd5\xbe\x05\xb1\xdf\xbe\x87\x05\xfe\xbe\r\x0bN\xbf\xe4\xcc\x8e\xbejq\xab\xbf0n.\xbf\xf09t\xbf\xfd\\\x93\xbe\xc7\xfa\xd1\xbe\r\xde\xb6\xbf\x84\xc3\xda\xbeN\xf6\x9d\xbe+\xc3 \xbf,\x15\xe0;\xe0\x95]\xbf\x81)|\xbei\x1cI\xbf\x14\xb0\x0b\xbfkv5;\x06\xf6\xc0\xbe\x9d\xf0\xd9\xbe\xd0\x199;Q\x9fp\xbf\xb0\xadB\xbb\xba0\xa4\xbe\xff\xa5d\xbf_\x0c\xd4\xbf\xd0\xb7\x9c\xbfi\x87\t\xc0\x879\xba\xbf\x98P\xcb\xbe\xb5\xfa\xa9\xbe\x15\xcc\xf9\xbf\xfb%u\xbe\xdb$\x8f\xbf\xae\xfe\x9d\xbe\x8d+\xb6\xbe\x9fnY\xbf\x03\xa4Z\xbf\xa8\xba1;\xe5#\x98\xbd\xe3\x9ad\xbe5Q:\xbf\xc5\xdc\xa8\xbf\xf6q\xce:\x11\xf7\x8f\xbe4*\xb7:\xdb>\x14\xbe!\xb3\x86\xbf\x1f\xca\xe8\xbe6\xdc\x93;I\'\xff\xbe`W\x19;*Ce;9\xf8\xac\xbe\xbd\x0b\x19\xbf\x03:!\xb9\xe8\xf7\x96\xb9pM\xbc\xbe]\xad\x9b\xbf\xceA\xda:\x14\n\x08\xbfu\xd3\x8a\xbf\x1cT$\xbf\xa5V\xfc\xbdX.)\xbf\x1bP\xd9?\x97*0?n\x9a\xa6\xbbJIN>Z\xf5q?\xf7\xa7\xa4>\x9c\x027?\xb3k\x91\xbba,r?2\x89\xc8?\x9f@\x14?g\xc2\xd3>\xf4\xa5|?\xce\x0b%?V\x06\xaf>\xe9\xe5\x96?>\x86\\>\xf2\xf3K?S\xa8 \xbbgc\x97\xba\xdb\x03\'>\x0e\x80\xe0>2F\x0f?\x88>]?\xa7&1?\xa6a =+R\xbe?\xf3\x04\'?\x91\xb0\x03<tK\x14?(\xd3\xfc=\xfe,k>\xf45\xee>\xe9O\xb5\xbb\xf9C\x0c?\x1f7\xb4?\xac\xc2\xa5?\xda\xf6.?\x19\xa4\xb6?=\x1dw>\x81y\xdf\xbbV\xba.\xbbu/\x1e?3$j?\xb8,\xc4\xbbG\x0ca<X\\\xc7?n\xf76?\xca+\\?\x95F\xd3?\xb2!-?\xf0\xd1\x90?`\xeb\xa8>`T2?N\xbb\x94\xba\xf0<\x1a?\x1f\xdd\xf4>\xb9\xe4\xe7>\x13\x8f0\xbb\x95\xd3g\xbb`\x04f?\xc8\x9e\xcd?\x97\xa4\xbd?-\x167>;t\xc7?\xef\xd3\xd9>s,\xc6\xba\xba\xaa\xcf?\xd09P?\xa0&\x05?\x14\xa6\xab\xbbH\xbd\xb1>Q\x08Q?\xef\x8d\xb0=v\xdd\xa1>_\x08\xe3>\x00\xedu?\xab\xad-?d\xb1w?Y\xf5\x97?T;\xb2>\x17\x03n?\xe5\x0c\xb9?\xd6B\x14\xbb\xc2\xc3\x1c?\xc2-\xb7>\x86\x1a\x8c?\x8c\xdc\x87<\x80:\xc1?\xc6C+=\'\x06K\xbbL)\x18?\xbd\xb5\xc8\xba\xdd\x89K>\x18\x9f\xdf?\x03a\x8b?6\xd7\x97?\x89\x89\x7f?\x91(\xa4?\x01\xaci=G\x98\x08?\xc8\xd8P?N\xe6a?5\x97_?K\xa4\xa2?"\x05\xab\xbbL\x01\x1d?\x95k\x8b?;O\xf2>1\x19\x92?&\x10@>"\x83\xd8>\x9e\xd5z?%\xea$?\x93R\x8b?\t\x97\x94?&W\xe6\xbaK\xaf\x7f?\xa7G\n?S\xfe\x1e?\x9e\x86\xa8?\xc5Y\xa0?V\xbeb?\xac\xbc=?\xf57\x05??dT?\xa39\xae>Vv\x13?\xb8\x8cS?\x04\xbd\x89?\xa1\x16k?\xe5S\x87?5O\x8c?\x9bFr>\xa8\xdez?n\x1d\xa7?\xdc,\xbd:\xc4\xa7\x88>\t\xaf\xe3>\xc6^\x17?\xd2y?\xbb\xfb\xb8<?\x88\xa4X?\x961\x82\xbb\xcb!\x88?<{\xe2>ur\xd2>\xc3R\n@x\xc3\xdc=T7g?\xed\xba\xa0>\xaf6W=\xd7\xfd\x83?1\x88\xf1>\xe9\xf4\xd8>@N\x11@Y\xee=\xbbro\x7f?C\x08!?\x18\xb6^=\x1br(<\x06I\x13\xb9n\x87\xbd\xbb\x1e\x14\x8d\xbb\xdc*_?+~ ?\xdc\x01\xe0\xbb+\x80 ?\xa4P\x1f?\xba\xc6\xb0?3f\xfd>\xd1\x19\xbf<\xc6$V?P<\x92?k\x9e.?s\xd9\x85?:\x82i\xbb\x02k\x92\xbb\xeey\xbb?\xf8\xe7\x19?{\x00\xce?} [?\x7f\xee\x06>\xb3\xeb`?)w\xc0?\xe6\x15\xae>\xdfF\x12?#\xc1\x15?\x0fU\x14?\r\xb5\xac?\x84\xec\x8c?1\xa4R?K+%?n\xa9\x16?\x18~\xd3?\xb5\xd0X?D\xae"?\x11\x15\xe7>(\xea-?\xfe\xb3\x03?'
-p377
-tp378
-bsV445233117972799489
-p379
-g2
-(g3
-(I0
-tp380
-g5
-tp381
-Rp382
-(I1
-(I400
-tp383
-g12
-I00
-S'9L\x18<a~\x91\xbf\xc7L\xa5\xbf\xc3\'-\xbf\xef9\xe3:\x8a\xa2\x18\xbf\xd9a\x8c\xbd\xa8\xe4\x8e\xbfC\x87C\xbf\xd4<\x97;\xe2A\x92\xbe\xe4\xe6\xba\xbe_&\xc7\xbd\xd0Z\xd9\xbd\xe4~\x97\xbf\xcf;\n<\xebI\xed\xbe\xe6S\x9b\xbe\xdc\xd3\x9f\xbf\x84\x91}\xbfB:4\xbe\t\xcc6;2Z\r\xbf\xe8p\x07\xbf\xa1\xb0m\xbd1\x8d\n\xbf<5g\xba\xf7Q@\xbf^\x16\xa0\xbf\x0c,\xc8\xbe\x8aE\xb1\xbf\x04\xd8\xae\xbe\xcb\xa0\xc5\xbe+\x13\x91\xbf\xder \xbe\x10|\x13;w\x19\x8f;\xb8 \xd9\xbdL@};\x85\xe3\x1c\xbfd\x10U\xbfcf\x9b\xbf\xfeO\x07\xbe\x1e\xb7\xe2\xbe\xbfD\x07\xbfhG|\xbe\x91C?;b\xcc\xd1\xbeg\x8d<\xbe\x1a\xda\xcc;X\xf5\xd7\xbe\x86\xc9f:\x07#\xd8\xbeOF\x05\xbe\x91L\xa8\xbf>\xb9\x90\xbe\xbc\x15\xfa\xbefk\xfb\xbe\xa5\x1e\xff\xbf\xbf:\xba\xbf\xc6AK\xbe7\xd9\x01<\x02r\xf1:2\x8d\x88\xbe\xe9\xb1)\xbek\xfe\xec\xbe\xa1\xd4!\xbf\x8b\x87\x0e<\x83\xd3^\xbeN\xd7\xf1\xbeT\xca\x9a\xbfI\'?\xbfS\xaf\xd6\xbe\xear\xdd\xbe\x87\xac\xf8\xbd^\x18\x0f\xbf\x93\x80F\xbf\xbb:\xa3:\xdb\xf2\x0e\xbf\x1fqV:\x87\x18\x1f\xbe\xc9ER\xbe\xc5\xb5\xd9;m\xcf\x06\xbf#o\x93;\x89\x01\x07\xbe\x1a\xa1\x08:|O\xa3\xbf\xb4\xe1\xf6;q\xc2\xef\xbe\xf9\xf4\x9b\xbf\xcbnf\xbe~\x1a\xa8\xbf\x91\xc5\xd4\xbe&\x16\xd2:cs\x9e\xbd\xdc`V;+m\xa2;\x14\x05\x11;\x16\x8f\x98\xbf\x14\x1c\xad\xbd\x19\x83\x03\xbd?\xc1\xf8:\xf4G\'7\xd8*\xfb;%J\x10\xbf\x10\xa03\xbd\xc8\xcc\xbe\xbe\xf1\xb9\x17\xbfL\xef\r\xbd\xf03\xc5\xbfF@,\xbdx\xf1H\xbf\xed\n\x1b\xbfY\xbb\xe4\xbe\xcf\xd0\xd1\xbe\x1c\x0b\x8b\xbfYy\x14;_>|\xbeIl\xe4\xbdH4\xa7;9?o;\x1c\xa4\xac\xbc\xd4\xa3\xe3\xbea\xdf]\xbe\xb1s\t\xb9\xcf\xb1\x0b\xbfS\xb30\xbf\x9e\x96\xb8:\x05d`\xbe%\xfaO\xbf\x93<\x17;+V\xcc:\x1fjp\xbe3/\x0b\xbe\x1asH\xbe\r\x0bN\xbfN\xa6\n\xbe\xd4\xf9\x80\xbf\x8690\xbfhr\xce\xbeF\xfc\x8f;\xc7\xfa\xd1\xbec\xc5F\xbf\xa3\xed\x08<\x18\xeef\xbe\xee\xe7\xcc\xbe\xbe\x80\x10<!\xdf\x12\xbf<\x82a;i\x1cI\xbf\x14\xb0\x0b\xbf\xe3_\xba\xbb\xce\xc2*\xbf\x8f\x99O\xbe\x8b\x07\xda\xba%\\\xd7\xbev\xc3\x93;\x1e\xe8s\xbb\x8f\xd8/\xbf\x9cw\x8f\xbf\x8c\xaba\xbfK"\x96\xbf\xbe\x0b+\xbfK\x82\xa5\xbe1R\x12\xbd\x94\xb9\xd5\xbfFx\x95:\xdb$\x8f\xbfH\xa3\x89\xbe\x8aY\x07\xbe\xac\xdbD\xbf\xabN%\xbf\xff\x00\x9b;\xe3\xd8\x9e\xbc\xe3\x9ad\xbea\xb1,\xbfN\x8b\x9f\xbf\x06\xd3#;\x1dwA;\xe6W\xe2;\x03\x96U\xbe\x85j3\xbf\xbe\xb2\x08\xbf\x1e\xd6/<x\x9e\x87\xbe8\x8d\x999o\xb1\xe3\xba9\xf8\xac\xbe\xe0\xe0\xb7\xbe\x05\x0b\x16;\xd1\x12r:\xbf\xbe\xaa\xbe\x17\x9b(\xbe\xa6\xcd\x01<\xca\xe5\xb2\xbdmE\x98\xbf\xb2\xef\xb8\xbd@/\xcd\xbe\xf5\xcb\xab\xbe\xfd!\xce?\xa4\xc5h?\x9e\x14\\\xbb\xa7_\xec<\x0bS\xb3?\xd5\xb4 ?;R\xfc>|4\x85\xbb\xcdM\xc8<\x9e\x13\x82?\x9f@\x14?\xe0m^?\xf4\xa5|?\xce\x0b%?\x1e\x8d\x0b>+\x89\xba?!u\xb0\xbb\xd2\xeaV>\x91\xaf\x1e\xbbh\xe5\x9b\xba\xb7\x94\x82>P\x05\x91>gUX?\xacp+?\xe5\xaa\xb2>>\xd2\x96:\xff\x94\x1d?\xd3\xbc\x0e<\xc2vE>\x03\x0bg>xc\x81>\xf5 c>\xf45\xee>\xfd\xd8\xbf\xbb:8\x19?A\xb3\x16?\xd7\xc1\xb7?\xc6\xb2X?\xe8%H?\x059\xa3=\xc0;\xa7\xba\xf0\xe7-\xbbQ\xed\x1c?\xd6\x8eY="\xbf\x81\xba\xbax#>\xc6\x15\x90?Z\x91\xaf>\xc4B\x96>i\x98\xdd?\xf3\xbaE>\x197x?\x89\xc8-\xbb\xe7}k?\xc03\xde\xbb\xf5\xe4\xc1>6=\xd1>\x01\x93\x05?\x82\\>\xbc$\x81\x03\xbc\x19\xe5\x90>\xb0\x96\xc4?\xbe!T?\xa4\x8a!>,z\xe6>\xdf\xaa\xcf>`\xect\xbb\'\x01\xd1?/n_?:\x9c\x9a\xbb\xe8\x82"\xbbH\xbd\xb1>w\r<?\xaf\xfd_<#\xc8\xe5=_\x08\xe3>\x00\xedu?\xab\xad-?\x0cO\x0c?Y\xf5\x97?\xff\xe1\x84>\x8b@\x9c>\xd3@\x93?\x9e\x0fN\xbb\x96\x9c8?\xee\x06\x14>\x02\xbf\x86?f\xa5\xfa\xb9\r\xb9\xe8?E\xa1g\xbb4\x84\x82\xbbh\x13=?M|*\xbb\xb0\x80>>\x18\x9f\xdf?\x93H\xf4>\xda\xd1\xa4?\x1a\x80\x96?\xfb\xae\x00?\x01\xaci=F\xd1B>\xe1\xb19?N\xe6a?\xa1\xb9\x05?\x1a4R?\xc0%T\xbbL\x01\x1d?\xd0*b?;O\xf2>\x08#\xdd>&\x10@>"\x83\xd8>\x14\xebs?q\xaa\xf2>[s\xa4>\t\x97\x94?\xd5j|\xbb4xu?\xdbl\x0c?\xec\x9f\xac=\x16\x8f\x99?|\xbbl?V\xbeb?\'\xb6\n?\xed\xcd%??dT?\xee\xae\xfc\xba\xc2\x95\x7f?t\x97\xe1>}3\xb7>e\xdc\x1b?\xf6\xce6?\x94\xb5\x89?8\n\xb7;\xa8\xdez?\xef|:?Hr\xc2\xba\x82\xb4\xd7>4\xb3\xc6>\xe1\x8e\x93<\xd2\x8e\x83\xbb\xfb\xb8<?\x1dr\x81?\xcb\x93\x05\xbbs\x15\x8a?\x81q\x03?\x08&\xf8=\xf3\x8c\x92?)\xca_\xbb\xa2v2?\x03\x91\x0e?^\x9en=\x84\xec\x1a?=\x1e\xb0>\x0f\x13\xb5>\x89\xa0T?:q\x84\xbb\xc1-\\?\x9b\xa2\xa7>5\xd6\xe9\xbbh#q\xbb\x83\x83C;zN\xc7\xbbU\x07\xc2\xbb/dA?<\x83\xc1>74\'\xbb\xf0\xe2\x0e?\xfe_\x0b?\x94\xe6\xb7=C\x10\xa1>6\xab\xb1<\xc6$V?\xf2\x91\x90?k\x9e.?\xe2\xd2\xbc>\xc4D\xb1\xbbi5!\xbci1\xf2??c$?{\x00\xce?} [?\xb4f\x1d\xbb!\x8fT?P\xff\x84?3\\<<\x07b\x97?#\xc1\x15?Hg\xd6>rCE?\x84\xec\x8c?\xed?Z?Y\xaaW>\x8a\xe8\x16?_\xf5\xb5?\x02\xc76?D\xae"?\x11\x15\xe7>(\xea-?\tV\x08?'
-p384
-tp385
-bsV445268221542010880
-p386
-g2
-(g3
-(I0
-tp387
-g5
-tp388
-Rp389
-(I1
-(I400
-tp390
-g12
-I00
-S',i\x0c<\x84\xac\xfc\xbe\xf5\x98\xa3\xbf\x9f\x1e\x8d\xbd\xe1&-<?K:\xbf\xc1\xcc\x8d\xbe>\xde\xc5\xbe\xcf\'\x83\xbeE\xec\n\xbe\n\x99\x07;\xdb\xe1\x08\xbd\xae\xea\x03<"\xdcJ;\x96\xba\xdf\xbe\x9b+j<\xf4V\xdf\xbc<(N\xbdv\xbf>\xbe\x1eDI\xbc\x1dEk\xbf\xde\x97)\xbe\xbcZ\xb4;*?\xdc\xbf\xff\x04\x84\xbe)X\x88\xbe}7q;\'\x08\x83\xbf\x9a\xc6\x13\xbfEp\xf1\xbb\xce\x97Y\xbd9\xa6\xc5\xbe\x82\xc8U;L\xc9\xc0\xbe\xc1\x813\xbe%eD<^\x18\xa9\xbe\xf0\xb83;M0d<Z&\x93;\xb3Q\xd3\xbc\x95\xbf\x8e\xbc\xa3\x87\xf4;\x8fE\x8d\xbf\xc3\x8d@\xbe\x88K9\xbcyzg<\x89U\x83\xbe\x18>\x17;{\xb8\x8c<\x1a\xfc\xc7\xbb\x18k\x9c<\x0cW\r\xbf\xfa\xe2\xae\xbc\xc2\x19b\xbfz\x9e,<\xd3\x89l\xbc\xf8\xe9)\xbf\x14EK\xbfm\xe0\x82\xbf\x8c}\xc7;&b\x1c\xbf3\xcd)\xbf\xc6\xdbl\xbf\xbd\xa3M\xbe`\xc9\xbb;\xa3F\x92\xbe\xd7}\'\xbe\xffW\xbc\xbf=\xe3\x84\xbd\xc0\x1c\xe5\xbf:\xcbJ\xbf\xb9\xd7\xf1\xbc|\xa9\x9c\xbe\x8a}\xfa\xbe\\\xa0-<Y\x1e\x02<\\9\x07<\x91\x02\xbe;i\xc8\xf7;\x19\xf0\x18\xbf\x8a\xee\xcf\xbd\xd3\xf6\x81<\x7f\xdf\x93\xbeq@\xfb;p\x86\xfc;\xe4\xe5"<\x97\x87~\xbf\xe8\xf5\xa9<U\x92;\xba,@M\xbe2\x94\x9e;\t\xa8[\xbf\xd2\x1c\x1e\xbc318<H\x92\x9b\xbb:N.\xbe*\xa5/<BD\xf8;\x11o\xfc\xbc\x0b\x88X: \xe2c<0L\t<N$\xd7;8.\xc1<L\x1e\x03\xbfWW\x1c\xbd8[\x91\xbe\xcbbL\xbd\xe5\xc3\xc3\xbce\x97o\xbd\xb6\x1c=<C3\xf3;\xa1\xd2\xd7;2dx\xbe\xdd84\xbe\xde\\)\xbf\xf5\x8bB<Q\xfb\x88:c\xbdE:\xa6\xe2\xa6<|MF\xbe"\xd9\x8b\xbe\xe1\xa2\xcb\xbc;\xc9\x16\xbd\x92\xfa\xd3;\xc4\x8c\x95\xbed\xdbo\xbd\x16\xe0r\xbd%\xe8\xb2;@3l\xbb\xc6\xfe\xa8\xbc\xe6\x04p9\xf2\x06\x06;p\xdd\x80\xbb\xb4\t\xc3:\xcb\x97\xe3\xbc&\xba\xc6\xbc\xbe\n9\xbc\x98O\x9e;\x86\xfd\x9a\xbe}sx<nQ\xe1\xbe\xe5\xe1>\xbf\xc6\xcc\x02<\xf4t\r\xbfa\x86\xcf;\xccEH<\xe4\x1d\xe4\xbe\xca\x05\x95\xbeU\xaf\xed\xbc\x81\xe5\xef\xbeVG@<\xec\x1d\x83<\xa5\x15\x12\xbc\xddRI<\x98\xd0\xb2\xbd\x95\tO;\xbc\xb76;\xe5\xeb\xe4\xbe*@P;\xf3\xe9\x0b\xbf:\xa9\xd1\xbeD\xe7A\xbe\xaf[\x08\xbf\x16\xd2(\xbf\x89\xc5\x82\xbfxC}<\x89\xf7\xa2\xbe{\xa6/\xbe<\x15q\xbc\x18x\xbb\xbe\x8b \t\xbd\xe6\x19\x8b<\x1aH\x83\xb9\x89\x85\xb1\xbe\x1d}+\xbf\xf4\x88\x0b\xbf\x97\xd2\x02\xbfr\xa3\xc9:f\xe0\x85<\xaf\xa7\xee:\xd7m\x94\xbe\xd0\xd4:\xbe\x10\xaft\xbe\xc0\x8ak\xbd\x07\xa6\x00;\x1e\xed\xbe:\x80\xe1y<\x96\xa1Q\xbf\x08\xdc\x17<\\\x84\xca\xbb\xe5\xde\xb2;\xcdl\x1a<\xf0\x9f[<d\xf9B<\x07\x14z;Fb\xe3;\x9e\xf5\x8a\xbe0km;\x85/$?[J\xcc9\x15\xd6\x85\xbc\xf9dX>\xbe\xf64?\xcf\x9d\x8a;\x1e\x82N\xbb\xdb\xc4\xb5\xbbelV\xbb\x0b\xdc\x9a=\xec\xb3\xfe>\xc9e\x1c?`Y5?\x99\xce\x87>\xea\xc9:\xbb\xc5\x9c\x1e?\xcaKe>\x85\xa6M=\x1f&M=\x1e\xf0\xf1>\xb5\xb0\x16\xbc>\xd3\xf7;\xedu\x9f>o\xd1\xad\xbb9\x864\xbb\xcev\xcc\xbb\xdc\xc0\x03?|\x96\x9f\xbbZ\x8bc\xbc\xec\xd2\x89?!\xff\xb7>Ip\xae\xbbW\x1f\x1d?\xd4F@\xbc\xa3d\xff=f\xe2$? \xff\xfd=\xe67\xa9>QIx?;\xc5\xba>\xfd\xe9\x94>\xe1|B?\xc6\xb8\x81?J5\'\xbc-\xa3\xb1\xbb\nB\xf0=\xf6\xced?\xf7D\xfa<z\xa3\x16>\xe4\xa9C?\x15\x13\xef>\xbd,\x9c?\xd3t\xc5\xbb\xae9\xcc=(L\x8f\xbcCC\x91?\xd1\x03\xc1=\tpg\xbb\xf6\x85\x87\xbcB[\x8f\xbcJux?|,~=\xa0\xa1W<\xdcDX\xbc\x82\xaag\xbae&p?h\x18$\xbc\x1b\xd6\x8e>\x98\x1e\xf4\xbb\x1e\xc5B=\x01A\xac\xbc\x0f\x06i\xbc3\x93\xb9>\nU\x14\xbbK\\\r\xbc\xc1\xad\x87?\xc2ju?:\x02Q>$*\xbd=\x86f\xfa>\xac\xac\x0b\xbb.\x94\x01<gO\x01?\x1d{\x18\xbcom\xb7>\xb2\xc9\xf5>wA\x83?\x0eKe\xbc\xd0X\x91?\xd2\xec:?\xd0k\xf0\xbb\xd3N\xc1>\xbd=\xe4\xbb\xde\x0e\x0c?N\xaa-?\x9a\xb3\xd9=)K\x1a>\xe7\xed\x17?\xdd[\xa5>7(\x8f>i\xd7\xff>g\xae\x92?\x16\xf7x>1z\xa4>q\x0f\x9a?\xae\x94\xe9\xbb\r\\\xdf=m>0=\x822\xa7=\x97\xba\xb2;\xdd\xe5,?<f\x81?^\xbd\xa0>z\x85\xde>\x911\x03<\xb3\xe4\xaa<\x7f(v\xbcj\x06X?\x9e-\x89>\xeb\xd9\x07?2\x18\xca?\x88\x0f\x1f>\xee7\x08\xba 4\xf5=2\x1cY>\xf2R\x10?\xa2m\xc3\xbblY\xf7=\xb1\xdf\x93<\xeb)e>{\xe1\xc3>\x83\x08\xee=\xdf\x0c2>\xb7\x9e\x1f>dQ\xed>\x9e\x7f\xf2>[:\x9c>\xb9\xba"=\xfd0V?l\x9d\r?F\x9b(\xbc\x18d\x8a?\xa27\xaa<\x9e$A\xbc,"\xa2>\xbf\xa4K<\xf2\x97\x82?\x17\x01\x18>^Z\xe8\xbb\xc1\xaeS;7~\x03=\xe9e\xcd\xbb\xb8\x0c\xfd>qS\x7f?\xb0{\xa0>p\xac\x84?\xec\x06H<\xe8\x95@>\x04\xf1j>V\xe3 \xbc\x18(\xb3?\x8e\x15N\xbc\xecCU\xbc\xfe\x17\xcf\xbbU&e\xba\x0c\x9a\xa5\xbb\x01\xe6C\xbcg\xc9;?\xee0\xc6:9\x04y\xbbSL\x80>\x0c\x868\xbc\x86\xa5\x98>B\x8f\xb4?\xc7*\x07>\x8e\xb3-<\xeff\x9e\xbc\x8e\xbbZ\xbc:_B=\xef\x916>\xd9\xeb\x11?\xa7S\xda=YH\xd4\xbb\x9e\xb2\xfa:_\x84\x04>\x0b54<\xa7\xe1)?\'~\xa2=\xe1\xadd?d\x8f\x19\xbcBS\xa6>\xe7*/>ZF\x17?bM\x1e?\xde\x9b\xfd>Q\xe2H?\r2\x11?8\xaf9>\x160.=\xb8\x0cT?'
-p391
-tp392
-bsV445887808964927488
-p393
-g2
-(g3
-(I0
-tp394
-g5
-tp395
-Rp396
-(I1
-(I400
-tp397
-g12
-I00
-S'\xae\x8f};\xb1`\xe0\xbd\xc7L\xa5\xbf\x0e\xacF\xbf\x01\xd2\xf8;\x8a\xa2\x18\xbf+\x08\x11\xbe\xa8\xe4\x8e\xbf\x0c\xc95\xbf\xa3\xa7B\xbc\xbb|\xfc\xbe\xb1\x8f[\xbd}A\xda\xbeOL.\xbed\xf8\xa7\xbf\xe6-\xeb9y\xe7$\xbf\xba4\xa7\xbe\xdc\xd3\x9f\xbf_1p\xbf\x01\xb0\xed\xberj\xdd\xbd\x02\xc9\xdc7\xf0>\x9c\xbf\x1d\xcbD\xbe\xcdL0\xbf\x19\xf6\x87:\xe4DM\xbf3\xa4\xbe\xbe\x967\x97\xbe\x13kV\xbf\xa7\xb7\xdb\xbe?v\xfe\xbe\x93\x85\xa9\xbf\xcc\xb9\xc5\xbe\xb7\xf3>;;\x1c\x90:q\xed\xa9;\xc7\x88\x0c9\x85\xe3\x1c\xbf\xfc\xad\x97\xbf+z\xc4\xbf\xf1~I\xbb\x04?.\xbf@\xb2\x8a\xbf\x066\xf4\xbe\xd7\xc1\xa6;b\xcc\xd1\xbeg\x8d<\xbe\xd5\xec\x1e;\xd6Vd\xbe\xbc\xfb\xff;9\xdd\xd1\xbe\x11N\x05\xbb\x1d9\x8b\xbf\xec\x00\xeb\xbe\xdej\xce\xbc\xa6\xa8\x04\xbf\xc1\x84\xdf\xbf\xbf:\xba\xbf\xae=\xef\xbe\x0bx\x17\xbe)-\xa5\xbe\n3\xdc\xbeV\xf9J\xbeS\x98\xfa\xbb\xac{n\xbf_+\x00\xba\xaf\xbe}\xbf\xc3\xa22\xbf\xcb(\xae\xbf\xc3\xe0\x82\xbf\xb8\xa2\x86\xbfi\xbc\xaf\xbe!\xb6\xff\xbet\x16\x1b\xbf\xdd\x99\xb2\xbe\xd4x\xe38\xc7\xb5\xc1\xb9y\xda@9\xe5\x88\xd0\xbe\xf6x\x02\xbeq\x0e\xb5;2\x95)\xbf\x91\xfd\xb7;\xb1\xd5\xcc\xbe\xc3\xef$<\xe8\x8f\xbb\xbf\x1a\xc6#<\x94{-\xbf\xde\x1d\xa5\xbfE\xfb\x8e\xbe\x08L\xdb\xbf\xcf\x99\x93\xbf\xc5\x00\x19<\xf6\xb2\xe1\xbc\xc8\x9d\xc3:\xa5\xb3\xdc;=\x10\'\xbb\x16\x8f\x98\xbf\x9d\xde\xca\xbd\x1e\x9e\xa1\xbd1\x84\x85;\x8a\xe0\xd1\xba\x80~\xea\xbe\xa9kF\xbfA\x16\t\xbe\xbd&\x99\xbb\xf1\xb9\x17\xbf\x17\xb2\x1f\xbb\xba\xf8\xcc\xbf"\xe9Y\xbeK4\x11:\xb2\xa5\x9b\xbe\r\xe9\xa2\xbe\xe1\xdeR\xbe\xae\xc2`\xbf\x08\x10\x03<\xa3\xab\xbe\xbe\xa9\xf5\xa4\xbe~2\xd2\xb9g?\xce9\x1d\xc3}\xbe\xa84\xfd\xbd\x7f*\xd0\xbe\x7f3\x02;\xb4\xee\xfb\xbee\xc8\xa7\xbe\xd5\xe7;\xbe\x05d`\xbe\xda\xb9\x96\xbb\xccY\x85:v\xa9\x16;\xc1\xd8L\xbe\x93\xec\xaa:\xde\xfb&\xberX\x8b\xbf\x98\x7fE\xbc\x89\x00\xb1\xbf\xf3\x9c3\xbfy\n\xbc\xbe\xa9\xd9\xea:\x82\x8c_\xbf\xfd\xbcq\xbf;\x89\xa4\xba\x10\x16\xbc\xbe\tT\xcf\xbe\x0e\n\xc8;\x01\xa9\x8e\xbeB\xf2\xb8\xbd[\x88\x02\xbd6\t \xbf\xe3_\xba\xbb\xce\xc2*\xbf\x1e\x19\x84\xbd\xe2&\xd1;\xc6\x9aF\xbf\xb28,;d\xaa\xf0:\xe7\x99`\xbf\xf4\r\xb6\xbfhh_\xbfC\x15\xb4\xbfj\x1eM\xbfU\x0e\x19\xbe\x98s\xa5\xbe\xc6\xbd\xb2\xbfU\xc5d;\xfe\xb0\x16\xbd\xb3K\xa0\xbe\x17\xf6\x1f\xbd\x95\xacY\xbf\\\xa6p\xbfSz\x88;\x84\xb7\x95\xbd\xc3\x03\xee\xbd\xff|<\xbf\'\x1f\x8c\xbf&R\xd9\xbcN=\x15;\xd1\xbc7<\x03\x96U\xbe\xba\xa7\xc9\xbe\xce\x85Q\xbe\xbc\x80\xd28x\x9e\x87\xbeB\xc3\xd1:L\xa0\x05\xbc\xb0\x88\x00\xbdi-\xcb\xbe"\x1d%<;k"\xbct}}\xbeT\x90O;}\x1f\x10<\xd7\x81+\xbamE\x98\xbfLg\xf9\xbd@/\xcd\xbe\xb1jn\xbf\xbb\x9a\xcd?0D\x0c?E\x02&\xbb\xbd\xae\xb0=\x0bS\xb3?\xd3\xa2\x16>\x07\xf9=?L\xb56\xbb\x1d\x92\xf7;\xc9\x94\x16?=@\x98>\xe0m^?\x18\xb5_?\x0b\xf8&?\xf5\x8d^>+\x89\xba?j\x7f\xa4=z\xd3\x89>b\\\x83\xbbIt\x15>Yk\x8d>\xd8\xeb\xe1=gUX?E\xa3\x02? \x08\x00?\x9d\xbc\x8192\xc6<?T\x99\xb3=\xc2vE>\x97\x1fO?\xf0-\x91>\xf6\xf7H=$\xd8;?=\xef\xdc\xbbIR\xaf>\xe7\x8b`?\xb2\xbe\xc6?\xc6\xb2X?>\xe7f?\x9bd\x9a>_\xc8\x1f>\x87i.>2\r-?C@\xd3>2\xbe\x91>\xd6\xe7F>\xc7Ud?K\xa7"?z\xfaA>\x89l\xa0?\xf6u\x1a>\xb9\x8fv?\x18\xdbg>\xe7}k?A{\x1a\xbb\xf6P\x14?6=\xd1>\xd1\x9e\x1c=\xdf\x7f2\xba\xc1~\xc8\xbbs\xd4$?p7\xca?R\xd2\x93?\xa4\x8a!> \xc9\x0c?\x96\x1d8?7X\x1f\xbcD\xb7\xb0?\x92\xab\x97?\xbb\x06\xb1>#\xf0\xc7\xbb\x0ej)>l\x92a?\xaf\xfd_<Q\x0c\x96>\xb5\x15\x04?h\x9e\xff>\xc7\xef\x94>\xdb\x84\x81?\xff"5?:\xb9\x12?i1\x1a?W\x82\x97?)\xde\xfe\xba^\xce~? \r\xc9>\x02\xbf\x86?\xae\xc2\xd0\xbb\r\xb9\xe8?\x15\xcb\xb0>\xfa[t\xbbh\x13=?]u\r\xbc\xfam\xcb>\xec\xe4\xda?Uh\x94?\x18b\xd1?\x1a\x80\x96?[h-?HF\x03\xbb\xfd\xd6\x88>M\n\x88?.\xd6\xc2>\xe7w3?y\x95\xa0?\x9e\xfa7;\xd5s\xdc>\x87\xa6\x87?wl\x98=\xde\xfb]?\xe0.\xcf<!\n&?X\xfb|?\x7f\x02\x1f?\x0e\x90\xb6>,1\x0b>H\xa2\xb5\xbb\x16\r\x8b?}\x9f">\x1c\xe4\xd4>\x16\x8f\x99?|\xbbl?\x1a\x98\x84>\'\xb6\n?\xed\xcd%?o\xba1?\x16\x1a\x1c:\xc2\x95\x7f?1X\xd4>\\\xc0\xf2>e\xdc\x1b?w*\x87?*\x92\xef>\x00\xf1\xda>\xc8;w?\xa6\xb4Q?^\xa7!\xbb\x82\xb4\xd7>\xcc\xe1\x89>Go\x82>uDR;\x08n\x81?\xee\xaf\x90?fc):\xae\xd5\x93?7m\xbc>\x85\xfd\x04?\xb6m\xe1?\x9b\xb8\xd2=\xe8Ve?\x03\x91\x0e?^\x9en=\xbeww?\x8a/\xd0>\xcfD\xc5>\x83\x94\x98?\x15\'\xe6<\xc4n\t?\xe2\xa5\t?!\xe4\x81>\x0f\xf3\x06?\x83\x83C;\xcc4\x97\xba\x1c\x1e\xbc\xbbf9\x03?\xe5\x9c\x04?w\x05\xd2\xbb\xd4x\xfd>\\O\x07?\xc9/`?\x18\x7f\xd1>6\xab\xb1<uY8?\x13\xdc\x93?\x07\xd6\xe5>\xfc\x94??\x0c5\xbb:3\x80\x8f\xbbi1\xf2??c$?d]\xe3?1g+>E\x8f\xfb;\x08\xb7\x0c?\x1c\xd1\xf8?\x9dv[>\x07b\x97?\x07\x9f\xc6>\x19a\xe4>\x08\xf1/?\xfd\xca\x8a?\xe9\xceh?\x1b\xd5\xc3>\xc8Y9?\xb3)\xd3?\x8f\x9ab?BZ\x82=\xb1\xad1>\x83\x06y>K;=?'
-p398
-tp399
-bsV445261535623925761
-p400
-g2
-(g3
-(I0
-tp401
-g5
-tp402
-Rp403
-(I1
-(I400
-tp404
-g12
-I00
-S'+\xaaS<t\x94K\xbb\x10l\xfb\xbe\x02:~\xbd\xc3\x89\x0f<\xc9\x94\xc7\xbck\x17z\xbd\x9e\xaa\xfa\xbe!\xf0\x05\xbeq\xd2\xf1;\xbd\x9a\x89\xbd\x0b\xaa\xc0\xbd\x1d\xad\xf1;/\x94g;\xd0\x02\xc5\xbdT\x1a\x8e<?\xecX\xbe\x9e1\x80\xbe\xf0\xc0\xe0\xbe\xff\xd9\xa4\xbeB:4\xbe\xd8\xa5K\xbb\xc1\x87\xf7;\x1a~\xd6\xbd\xff\x96\\\xbc \xd1(\xbe\x1a\xde\xe5;h<7\xbe(,j\xbe\x0c*|\xbd?W\x89\xbex\x8c\x1a\xbe\xb7#9;B\x16\t\xbf\x85S\x16:<b_<Pc\x07<\xee\xbbh;Snl<\xc0\xa9.;\xe1\xfc\x9c\xbe V\xf5\xbed\x17*<\xa3U?\xbe\xe5\x0c\x8e\xbe~\x96<\xbd,K\x87<F\xc5\x9f9\xaan\x8d\xba\xd4\x8c\xa4<#\xce!\xbe\xf7}\x95<\xd3"\x0e\xbe\r\xf2\xf8:\xa2\x193\xbf`\xa5\x82\xbd\xe4p\x1c\xbc\xd4xs\xbd\xa4h\x86\xbf\x84g*\xbf\xd3\xac\xe6;e\xe7\xcb;\x1f{\x89\xbb\x95ui\xbe\xbc\xf5\x97\xbc\xc2%\xb9;/\x8e\xa3\xbeL\xa9\n<\x9a\xc4\x91\xbdQY{\xbe\xf4\x1aB\xbf\xd9\xa0\xda\xbeo1\x85\xbe\x85\r\xee\xbd\x87\xac\xf8\xbd\xfcv\xf0\xbc1\x92\x02\xbeB\x05\xc0;\x01\xcb\x07< \xbe\xf1;\n\xd4\xb6\xbc\x90_\x81\xbbC*L<\xe7\xe3\xbc\xbe\xf4\x80\xc6;s>\xa1:\xc1W3<\x1f\t\xbb\xbe\xbeN\x98<\x15\x16o\xbe\x15@\xca\xbe\xfe0\x97;q\x89\x03\xbf\x99\x0ft\xbe\x1f\rR<\x01y\x03\xbaF`\x10<\x88\xec\x11<>\xd4\x8e;\xbc)\xef\xbef7\xee:\xdc5(<W\xda\x93;j\x80\x0b<\xc8T\xaa<\xbd\xb2\xb9\xbe\x18(\x94\xbb\x83\xdc_;\xa9\xab\x97\xbd\x06\xd7\xdf\xba\xea\xf1:\xbf\xe9\x80T<\xb3[\x10<Q\x88\xca;\xc5\xf4N\xba\x11Z\x83\xbd\xd4;\xf6\xbe\xbe\xb5L<[\x07\x8b9\x01\xbf\x9f;\xa6>\xb8<B\x0e\xfc9\x1c\xa4\xac\xbc\x1b\xc3\x9d\xbc\'4e\xbd\xd1\xaa\x10<\x11Gz\xbeF\x0f\xe58#A\x98;\x1d\x84\xfc;\xc8\xd4\t\xbb\x8ef18\x813\x99:\xed X\xbd\xdf\xf9\x8c:\xca\xf5d\xbdj1y\xbe\x07\x9b\xe5\xbb\xf4\x8a\xd7\xbeL\'\x17\xbe\x98/k\xbeoHe<\xd3\xe4_\xbbi\xae\x07\xbf\xd5\x9fa<{\xa0\xad\xbb\xde\xf5Y\xbd\x1f\x11W<\x8c\xba\r\xbe{\xba\x08;\xceA\xc1\xbc\x91+\x16\xbe\x7f\xd90<\xfd\xfa\x15<0\r\xbd\xbc\x94=D<.\xcdz\xbe\xabi\xa5;\xbe\x13};\x8de\xc3\xbe\x07a\xdb\xbe:A\xfc\xbe\xb6\x0c+\xbf""\xb0\xbe\x93Ew\xbb1R\x12\xbd\xaa\x1a\xdc\xbe\xed2w<\\\xd3\x05\xbb\x149\xf5\xbd\xec\xa3)\xbd\x99G\xb0\xbe#\x11\x8e\xbe\xeb+\xb0<-\xe8\x1a\xbb\x98GN\xba\xd1\xd3\x01\xbf\x92s@\xbf\xa4\x19\r:&\x896;0\xe2\x83<JQ=\xbdh\xe7\x88\xbe\xd2\xee\x9d\xbd"\x98Y<\xda\xa7\xd39eE\xdd;w\xd6`:\xaf<v<EOq\xbe\xcf_\x1d<\x89G\xed9\xb7\x80\x04<;}\x1b<\xe6}\x8f<2!w<\x0b\x12\xad\xbe\x94no\xba\xd0p\xaa;\xb3\n\xbd;|\x86Z?\xb3\xea\x9a>\xef\xe8\x81\xbc\x00j\xff;\xb0S\xd0>\x1fZ1=\x11\x8d\x9f<.t\n\xbc$\xd8\x94\xbb~8\xdc>\xa04\xf5;\x85\xd1k\xb9\xd9\xb7\xcc=\xc9\xdd\x02>\x8aYy\xbb\xdc\xbf\x1d?\x86\xd3\xb5\xba1\xa3p\xbb\x1as\x04\xbc6\x99\xea\xba\xdf]\xef\xbb\x90\x1b\x98=\x10\x9c\x90>\x04\x86\x06>\xa4\x16\x90=\\\xe6\x8d\xbbo\xbfy>\x0e\xe1)\xbc_\xf6-\xbc\xc7\xaf0=@\'\x0f\xbb\xc0\x88\x94\xbb\x9b\xa9\x84=\xe6\x92/\xbcU\x1b>>"\xfc\xc4>\xcec\x11?,C\xb2>O_\xfb>\xf6r\x98=\xbe,\x01\xbbr\xca\xdc\xba+\x15t>\xe6\x11?\xbc\xad\x04\\\xbb\xc2\xaf%\xba\xb7O\x1c?\x9a\x0c\x05>\xc2\xe99=\xb5\xbfT?\xa8\x80^;\xad\xbb\xf7>\xbc\xe4\xb3\xbb\xb98\x14>\x04-\xb3\xbc5k\xea=m3\r=\xc4\tZ=R\n\xcb\xbcg\x8e\x82\xbc|j!>V\xa0\x19?\xad\x9e\xd6>\x85\x1d@\xbc\r\xeb\xbf=\x0b\xf8\x10>#\xd5\xff\xbb?\x8d&?6\xfe)>|\x1e\xa3\xbb\xbd*\xc5\xbc\xe7\xa3c\xbcA\x07\xa9\xbaan`\xbb\xec\x1d\xf5\xbbg|\x07>\xd1\xe6\xdb=\x13\xce\x99>NY\xb3>\xbeC\x8d>\x1c\x96o=hY\xbc<\xf81\xed>\xbd\xfe)\xbcg\xe0\x9e>?\xa8\xd2=g;\xf1>"\x0b_\xbc\xc8\xe5;?\x91F_;`4\xf6\xbbM\xaam>\nQ"\xbc\xaf\xe4\x1c;\x8c\xbc\xf6>\xd0u1>l\x13\x04?\xfa8\xf4>\x04w\'>hc \xbb\xd0Nr=%\x83\x90>3\x8f<>\xdeoq>\xc9\xeb\x1a?I\xd9\xfd\xbb\xe4\x0f\x9c=\xc9^\xda>Z\xe3"=6M\x96=\xb6\xd0\x04\xbb\x8b\xd2V>wo\xf9>\x1e\x8e\x97>\xa2\xf2\x15>eM\xab<;\xdf.\xbcZ\xac\xd3>\xdb^{=\x88\xcf\x9a=\xa7\x16\x10?S\x92\xcd>\x85\x89M<\x01\xf6\xd6=T\r\xe4\xbasWW>\x05\x00\x9e\xbb\xb6\xce\x83>03\x14>\xdbr\x10>XY\xc9=jq\xaa>\xcf\xbb\x0b>8\n\xb7;\xb8\xd0+> \xf5\x1d=\n\xc4 \xbb8Ak;\x88Rx;\xe1\x8e\x93<\xbf\xf2\x1f\xbcz\xcc\xa2>!\x9f\xa0>\x8b\x1cW\xbc\xcc \x14?\xc1\xab\x0e>\x08&\xf8=8:8?\x0f\x87\xf7\xbb\x83\x04\x1b>\xe8\xcc,>\x01\x90\x0b\xbc\xa0\x17\xc3>\x8d\xb4R>\xe3\xe8\x12;*U\xef>q\x9f\x88\xbb\xd0co>\x91\xc43>*\xf0A\xbc\xaa[2<%\xf09\xbc\xa8ai\xbc\'\xff\xbb\xbbw\x9eS>\xe9XX=\xe2\x9b~\xbcpN\xc2>\xdc\xd4\x99>\x16R\x8d\xbb\xcb\x0b\x82;\xfdyA\xbc\x04\xac[\xbb\xbe\xcb\x18?@5c=J\xb1J>\xf2\x82\x97\xbc\xcae\x84\xbcs\xd0\x08?\xf4\xe0S>q7\xf2>@s\xa2<<\x85\x10\xbc$\x04o\xba\xeb\x0e\x1a?\xb4\x9e6=\xf2\xa5\x80>\x92\x8eQ=fu\xad>V\xf3"\xbc\xf4P\xdf>\xb4\x83a>\x93;\xf6=\x01u\xda>4\xe7G?g\x0f\x01?^C\xcd;\x03,\t>_e\xd3=\xb7,\xa3='
-p405
-tp406
-bsV446177096948125696
-p407
-g2
-(g3
-(I0
-tp408
-g5
-tp409
-Rp410
-(I1
-(I400
-tp411
-g12
-I00
-S'\x93\xf1Q;\x07l\xa3\xbf\x877\xed\xbf\xcb\x7f\\\xbf\xd6Ab;]\xce\xc7\xbfI#\xb9\xbew\xcag\xbf\xc3\x84<\xbf\xe3KJ\xbe\xe1\x8d>\xbf\x04\xd2|\xbd=bf\xbf\x90#\xd4\xbfd\xf8\xa7\xbf8*\xf7\xba\xdd\xa2\x13\xbf\xb2qQ\xbf\xce\xfb\x90\xbf\x07\xe5W\xbf\x0cwn\xbfeX(\xbe$\x07\\\xbf@\xa1\x95\xbf\x11\x08.\xbfe\xe0W\xbf\x047\xd5\xbb9\xcd>\xbfc\xaf\x9a\xbf\xc4k\x93\xbf\xac\xf2e\xbfg\x89\xa3\xbf\xd1\x1d\x9f\xbe6h\xdd\xbf\xaf,\x88\xbf\xe9\xa2,\xbep\xa1\'8M\xfd\r\xbe\x90\x11h\xb9\xd2r8\xbf\xc4\xfd\xbb\xbfK\xd3\x9b\xbf\x99++\xbf\x1d+\xcc\xbe\xf4E\xbc\xbf\xb0I:\xbf\x9b\xc3\xab:)\xe4\xa6\xbe*xW\xbe:|f\xbb\xfe\x1fL\xbf\x8f\xa2\xd8\xbb\x84\xbfR\xbf\x13\xb4\xad\xbe\xac)\xc9\xbfTR\xa1\xbe\x89\x98V\xbdP\xab!\xbf\xd7\xd9\xde\xbf\x06\xd3\xa9\xbfj_,\xbf@\xb6\x99\xbdiEG\xbe\x1f\xa5%\xbf\xbd\'\xa1\xbee\xb8\xe8\xbb\xac{n\xbf\xfd*\x8c\xbb\x99\xef\xa4\xbf\x05\xd5B\xbf\xed\x08\x04\xc0z?\x9c\xbf2\x1e\xb7\xbfu\x06j\xbf7 S\xbft\x16\x1b\xbf\x90\xd5_\xbf0\xc6C9\xbdaZ\xbe.\xc5\xf4\xbb\x81=\xb7\xbe\xc1\r\xae\xbe\xb7\x1c\xaa\xbe#2E\xbf\x1a\xab\x9b\xbe\xc3ax\xbf\x8d<z\xbf\xe8\x8f\xbb\xbfjA\x1f;\x94{-\xbf\xde\x1d\xa5\xbfE\xfb\x8e\xbe\x08L\xdb\xbf\x94\x9f\x97\xbf8#\xa1\xbd\xbe \x1e\xbf\xdby\xe0:\xbf\xfb\x11:*\'\xf0\xbeA|{\xbfA\x18Y\xbf\x16N\x82\xbb\xc1/\x94\xbeD\xcf\xc07\x80~\xea\xbeE^\xc0\xbf\xcb}X\xbe\xf9\x92\xa5\xbd1g#\xbf!qW\xbe\xcbc\xed\xbf\xb8;\x9a\xbfX)\x81\xbf\xb2\xa5\x9b\xbe\xd4\t\xd1\xbe\xd8\x1c}\xbfJm\xf9\xbfj#\x11:\xc7}\xac\xbf\xedY\x12\xbf\xaa\xdb$\xbc\xca.\x8a:"\xaeL\xbf\xb2E\xe4\xbe\xffa+\xbfa\x0f\xa9\xbb\x9aa\x84\xbf\xa1\x1d\xf7\xbe\x009,\xbfh0\x05\xbf_\xf2\xb8\xbe\xfdMH\xba\x9c2\xa0\xbd\xe9\x80V\xbfi\xec\xa9\xbeT\x9a\xfc\xbe\x81\xee\x94\xbf\xd6\xc8+\xbe\\\x12\xe9\xbf\xed\xca5\xbf\xd3\xe72\xbf\x9aQh\xbd\x82\x8c_\xbf\x81\xdf\xb8\xbf\x8c\x98"\xbc\x10\x16\xbc\xbe\xdf&\x0e\xbf\xb9\xd7\n;;\xe3J\xbfc\xb58\xbd1\xc9\xa1\xbf6\t \xbf\xc4\x1b\x83:\r \x97\xbeb\xc7\xa5\xbeY@\x14\xbb\x0c\xcbI\xbfPT :\xaaa\x10\xbb\xb3\x1c\x94\xbf\x15\x8f\xd8\xbf1V\xa5\xbf\xf3\xc0\xc2\xbf\x99\x0f\xfa\xbfO,l\xbf\xdeJ\xeb\xbe(\xaa:\xc0;\xda\x99\xbeX\x95\xa2\xbe\x1b=\x19\xbf\xc5[\x92\xbe"\xec\xa5\xbf\x01\x18\\\xbf\xd3)F\xbcNU\xa8\xbe\xd0d\xef\xbd\x18\xf5G\xbf\x8a3\xcf\xbfM[O\xbe\xd3\xbeO;\xe6\x93\x169C\xde)\xbf\x7f\rO\xbf\xf1q:\xbf\xc0R\xf3\xba\x19\xe7\x84\xbf2\x0b\xd1:M\xd65\xbe_\xff\xb3\xbd?)+\xbf\x85\xfab\xbe\xdd\xb2&\xba\xb0\x17\x82\xbdt\xc5-\xbft\xc8\x04;\xb1\xec\xba\xbb\xd9\xa8\xa9\xbfx4\x1f\xbf\x91\x19\xb5\xbe\x0e\x96\x84\xbf!\xef\x0b@\xf0\x83\x18?\xd1\xa3#;\xb9\xfc\x02?\xd2[z?6\xcc\xb9>\x18.\x8c?6\x02B\xba\x13"\x15?q\xe9\x7f?.\xd1/>\xea\xd9-?\x18\xb5_?\x0b\xf8&?j.5>/+\x8b?f\x92\xa5>z\xd3\x89>/\x98\xf1\xba\x12\x05\x16>q\x97z?\xd6\xe5\r?4\x8cl?1\xc3\xac< \x08\x00?9-\xc2=\xf3S\xd1?.;\xad=\xa6\x83\xdb=h\xa0\x0f?\xd3H\xd9>\xd8\xee)?$\xd8;?\xede\x93;\xc5j\xc6>\x94\xf6\xe1?\x84\xb8\xab?^\xabH?\xff\xdf\xd5?\x83\x06\xc6>,\xeb\x0e<\xba\xe5\x1b=\xc1h\x8f?(\xe0\xe1>2\xbe\x91>+\xb4\xdd=\x8a\xca\xbf?6rD?:h\x84>].\xd9?\xdf\xdd\x97>\x02\x82\x9f?\x18\xdbg>\xc9\x1e\xa2>\xebc\xae;?\xb9\x82?\xc5\xc7\x87?:\x9a\x14?(\x01;;\x01\x18c;cx\x9a?\xdb\xb5\xb0?\xa7\xd7\x8a?\xec\xc2\x0b?\x05\xbcv?{\xd0\x96?\x81\xd2*=\xa4\x8d\xbe?\'%\x85>Lt\xdb>\x91\xe4\xd68\x0ej)>l\x92a?\x18FE?\xd9\x9aO:<\\\xd7>\t\xe7\xd0?R\xb2-?\xb3y\xc0?\xb2\x00\xa3?\xf5\xad=?i1\x1a?W\x82\x97?\xa6\xfb\x96;^\xce~? \r\xc9>\xad\x8f\x84?\xad\xeb\xf3:\xd8\x86\xda?Q\xe4\xbd>\\\xba\x9d<\xfa\xf9\xb9?IO\xa6\xba\xef\xff\xb8>\xb8\x84\xe2?:\xdf\x9d?V\xab\x04@@(\x83?\xf8\xb2x?\xd4\xc0\xd4<R\x8eX?\xec\xea\xdb?\x99\xe8P?\xeb\xa8\x11?\x94\xd7\x8a?3\x0f[;\xd5s\xdc>`\xb2\xb1?,\xc7a>\xde\xfb]?\xfb\xbfN>\xc8\x7f\xcb>|\xc4\xaf?D\xc0\x83?Y2\xd2?\x04iP?]\xa3\xc4;\x16\r\x8b?\xbd\x08\x15?\xa6\xcb#?\xc2\xf0\xab?@\x86\xf7?\x89\xc9\x83>\xe5\x83(?\x96"6?\x99 \xba?Gl>9\xd1\x84\xf6>\x0c\xef\xdd>X\xe3\x1d?\xd6\x869?Xm\xd2?^4}?\x00\xf1\xda>\xfb\xa5\xa2?\xf6\xbd\x8b?\x95\xf1\xed>b\xe5\xf5>\x0f\x01\xbc>=\x82\xc3>\x11H\xc8=\x02\xd1V?\xf6\x94c?\x87\xea*:6\x90`?\x12\xbe\x15?q\xb7\x94?\x05\x0b\x08@\xe7T\xfa>\xeel|?\x00,\xa4??C.?\xbeww?3&\xa4?\xcd\t\xd9>\x92J\xf3?\n.\x92=\xef\x87K?\xa4>g?!\xe4\x81>\xb5\xc1\xa7>\xa1\x19\x08>\xee\x9a\x9a;\xd1\xd2\x18=^\xdb\xe5>\xdc\'~?\xc4\xec\xe2;\xfc\xfb_?\xf4\x97\xa7?d8\xb7?J\xc6\x82?\xaf\x9cu;uY8?\x15}\xe4?K~\x84?"\xaf\x94?\x1a\xd3\xe0;p\xd0\xc87\xd6\xa5\xc4?-C[?d]\xe3?WS(?\xa0\x01\x1e<\x08\xb7\x0c?\xbd9\xa8?\xd4Q\x1f?\x10\xcc\xa9?\x0b\xe5;?\x95\xd5b?\x05\xeb\x8f?\xfe-\xa3?\xe9\xceh?\xa7\xdd\x11?j\xc3\x85?\xb3)\xd3?iN\x86?\x86\xe8\x87>\xea\xba\xcc>\x97\x13\xa9>yf<?'
-p412
-tp413
-bsV445259011823136768
-p414
-g2
-(g3
-(I0
-tp415
-g5
-tp416
-Rp417
-(I1
-(I400
-tp418
-g12
-I00
-S'\xb2mv<N\x17\x8a\xbd\xd3Hy\xbf\xd5(:\xbeY\x07T<\xdd\xa6\xd1\xbe\xaf\x8f0\xbe\x9cn\xb7\xbe\x1cu\xdb\xbd\x86\x90\x1b<\x8eK\r\xbbE\x9br\xbe\xf9N\xa1;\xf9#\xa2;\xa9T\xe9\xbe+\xb4k<\x80SH\xbe\xae=K\xbe\xc7v\x17\xbf\xf0\xbas\xbeF\xdc\xb3\xbe\x95\x94\x93\xbcd\xae\xc6;\xd4`\xa2\xbe\x14\xd1\x96\xbdk\xf2\xdf\xbe\x910\xe3;[~\xab\xbe\x1d`\xda\xbeA\xd6X;\x8f1\x90\xbe\xac\x80\xb4\xbe\rW\x19;\xc3\xcd=\xbf\x8b;4\xbe- ~<\x10\xe8P;\xf7\xe2\xfe;\xf0\x13r<\x15\xdd\x83;?\x8b\x16\xbex5^\xbe\xb7\xdc!<\x0fJ\xae\xbe\x97\xd5\xcb\xbe\xe6\x9f\xf4\xbdt\xb6\xa5<\xef\xf9\x97\xbe\xb3\xe9\x1b\xbe\xec\xe6\xa7<_\x1f\x15\xbdT\xe6\xa2<\x1fVD\xbe^\xd2\x92\xbd\x1f%\x1c\xbfa\xef\xc4;?\x01\xf2\xbdil\x8d\xbe\xc2\x1aT\xbf\x91u\x81\xbf\x9c~8<rq\x03<\xfbk\x83\xbc\xdb\xee\xd9\xbe\xee\xca\r\xbe\xe6o\x11<"3\x18\xbf\x1d\xfa&<\x02\xbc\xbb\xbe?H\x85\xbe\x00\xc9\x9d\xbf\xcc3\xd3\xbeW\x0e\xe4\xbd\x06|\r\xbf\x9d\xb3\xe3\xbe\x0bu\x1c\xbdq\x88\x1c\xbb\xec\xd9\xbf;O\x05\xc3;d\xc70<m%\xb6\xbe`\xf3\xe8\xba\xfd\x80R<h\x82\xac\xbe\x94^\x1a<mH\xb3;\x18\xcfQ<q\x0c@\xbf\xcfR\xa2<y:"\xbc\xb8\xe7\x1c\xbf\xf3\xd6\xc9;\x8cZ\x8f\xbf)\xf3\x8e\xbd\x8b\x18=<\x7fy\x9d\xbd}\x0f\x04<n\x84m<\xd9\xad\xe4;\x97\xff\xd1\xbe\xf4\xf13;}\xfc\x83<(|\xa9;\xd2\x96\xdd;V\xa9\xac<\r\xef\xc3\xbe\xac\xba\r\xbdz\xe8\xa5;\x9c\x99\xfc:1\x08\xdb\xbc\xfa\x9c\x03\xbf\xf9hV<6\x8a-<\xa0\xb5\x10<sX.\xba\x0f\xd2\x98\xbe(\xf7H\xbf\x85\t\x83<C%>\xbdLi\xab;3\xc0\xcd<\x8d\x05p;C\xdd\x9f\xbe/\xe66\xbe\x9dvc\xbeQ\xba\xee;\xf0\xd6w\xbe\x87pa\xbd\x10\xb7n;\x11\xd9-\xbcPb\xad\xbd\xbaL\xad;5\x11i:\xa1\x1dw\xbeS\x1b\x92\xbd#MR:\x13,\xc6\xbe\xe6\xa2\xb6\xbd3\x93\x8f\xbew\xf4U;\xc5e\x97\xbej\x7f\x8c<M\x1bs\xbe\xa0\xc07\xbfI\xf7{<\x87{\xa2\xbdc_\xe1;L\xd0n<\xddeU\xbe\xc6\xe7\x83\xbc\x90\x8c\x04\xbe?S\x8c\xbe\xce\x93E<\xdeC\x1a<A\xec\x8c\xbd45\x83<\r\xb3_\xbe\xc2\xbf\xcc;\x0b\x08`;\xd4\xd3\xe4\xbe\x99L\x0c\xbeH\xcb\xe3\xbe\xc7!\x03\xbf\x0f\x86\n\xbf\x91\xcev\xbe\x0fIT\xbe\xf75k\xbf\xf3\x03s<\xb4d\x01\xbe\xa5\x17x\xbeh\xc8\xd5\xbd\xf8\x9b\xd2\xbeC\x16\x14\xbe\\\xf3\xba<\x07\x8c\x9e\xbb\x04N\xcb\xb9\xc3\xeb\x17\xbf\x84\xcev\xbf]\xee\x06\xbeg\xdbY;{@i<\x00\xd9\x1d\xbePl\x93\xbeRl\x18\xbe(Kn<=<\x81\xbc\xcd\xfc\x06<\xd3\xea\x1b\xbe\r\xd7N<\xcd\xd1\xbb\xbev\xe51<\x17\x9a\xff\xbd4\x1e\xd7;\x86\xc3Y<|\x8e\xa1<^g\x90<\x17P\x88\xbe6^\x99;<f\x10\xbe\xf43\xa8;B\xcdN?3\x9f\x8e>/\r\x8f\xbcb\x8e\xec=%d%?\x1eS|=^N\xc7=\xaaE&\xbc\xcc\xf3\xc7\xba\xa7\xed\xa4>\xa9C\x82>\x0b8\x97=\x19@_>*V\x91>\nS\xcb\xbb\xbd&\xfc>\xc6~\x0f;6\x8c\xda\xbb\x1f\x87\xf8\xbb\xb4\xd1\x9e\xb9&\xc5\xe2<\x8a\xe2\x0e>\xd6\xed\xd1>\xbd\x1e\xbb\xbbK\xdb\xdd= w\x82\xbb\xc12\xc7>\xdcp(\xbc\xa4K"\xbc\nu\xef=\x14\x1d\x97\xbb\xea\x89\xd0\xbb\xa4Q\x99>\xf9\xa9>\xbc\xf4\xc7\xd7=7I\x1e?\xa8\x84\x80>\xb5\x93\x0e?\xe3\x15P?\xad\x9c\x82>_\x19\xd7\xba\xf8\x17\xe7<\x0b\x8c\x9a>.\x0f*\xbc\x0e\xc7\xbe\xbb\x85\xe1\xe9:\xd1\xd5`?GV+>\xe2o\xb9=\x87\x02\x88?j\xcb\xb1<A\xd8e?0\xb3\xb8\xbb\x188/>3a\xa2\xbc\x1dM\x8a>\x1c\x1d\x12>\xd1\xfb\xd7\xba\xd1\xaa\xc4\xbc\x07-\xb3\xbc\x1d3\xdd>X]\xa3>\xaad\xf6=<e\xa8:)\xce\r>\xe04\x96>\xa6<\x02\xbc\x9b\x9a\x9f>\nF\xc1\xbb\x13\xdc\xea\xbbse\xdc\xbc\x95\xb6`\xbc\x1bu\xe3:\xeeM\xbf\xbb\xca\xcd\xef\xbb\xee\xbc\x9f>A\xe2\x97>\xee\x1d{>EM\xf9>\x87\x1f\x8d>\xc3c\xad\xbb[\xa9j=\x01\xa6"?\x0e1\t\xbc\xb3\xbc\xf9>\xc9\xd0v>q>A?\x96\x1e\x87\xbc\xf7+\x8c?Q\xf0\xf0=\xc2\xc8\xab\xbb\xda\x02{>z\xddW\xbc\xba)x>\xd3\x80P?~\x00\xaf>\xc3\xda\xbb>\xb8e\r?~\xebp>\x90\x0cP\xbb\x08V\x0f>\x7fea?O\xb5\x85>f\x81\x88>\xb5eH?\xdc\xd2E\xbc;\x8e\x99>\xfb0\xa6>\xb6\xede>\xf4\x903>}%\xb1\xbb@\xdb\xc7>Fp\x13?I\x89\x9c>\x17\xaa\x87>\xd4\xf2\xff=\xc4cO\xbc\x91\xbeT?\x88\xb3\xae=/\x9e\xfa=\x0e\xd18?\xcf\xc1:?V`\xb0;6\x14:>\xb43\xce\xba\x11\xc4\xa0>\xa0\xdc\xbd\xbb\x95\xb5\xbe=\x05CB>\xd0.\x8e>\t\x03\xe0>\xa9\xe2\x1a?dii>\x03\xa0a=\x11\xd4|>\x7f!\x85>\x8e\xd4\xc4\xb9\xb6\x1f\x81<\xd1\xd0\x94<|\xe7`>\xd4k\x02\xbc*w\xe0>\xa7\xd8\x06>w\x99F\xbcS{\xe1>\xc9]M=\xaf\x15\xd7>\xdb\tH?\xce\xb0\xae\xbb\xa3\x16 >\xcf\xe1Z>q\x18\x0b\xbc\xa6\xcd\x01?\xce\xf3\xdf>\x14N\x8c>\xff\x86\x82?\xe0>\x87\xbb\x97\x9f5><g\xd7>Q1{\xbc\x02\xcc7>#\xbeI\xbc\xd9K\x95\xbc.\x91\xcf\xbb}\xbc\xd6<\x0c\x1b\n\xbbO\xda\x8a\xbc\xc0\x1f\x0f?4\x00\x88>\xe4\xb9\xb1>\xb6\xb3\'>\xcf<>\xbc\x08\xaf\xa2\xbbO\xa1|??\xfaE>;7U>\x8fk\x9a\xbc\x83\xda\x8e\xbc\xf3u\x9e>m\xe0\x95>i\x97f?@\x13\xe3=Y\x1c%=E\x03\xcb\xbb\xdd\x01\xf7>cGn=\xb8\xe8\xf2>*\xc1k=}~\xe7>P\xba3\xb9\x1720?\x92\x9f\xef>\xe7y\xf1>\xda5\x14?U\x9cx?\xcaS\x05?\xd6\x1d\xa1>A\x0c\xb3>\x07\x9bq>\xf1\x95\x8c>'
-p419
-tp420
-bsV476511152080293888
-p421
-g2
-(g3
-(I0
-tp422
-g5
-tp423
-Rp424
-(I1
-(I400
-tp425
-g12
-I00
-S'L\x06a<\x92^\xb8\xbe\xa0B\xae\xbf\xefns\xbfR\x8c5<\xb5\x10\xd1\xbea\xa4\x08\xbe\x85\x89a\xbfft\xe0\xbe}*\x16<C\xde\x02\xbf\xb9\xe9\x8c\xbd\xce\x1b\x98;\xb0\xe8+\xbf\x14\x9eh\xbf9\x99\x84<\xdd\xa2\x13\xbf\xb2qQ\xbf\x12!\x84\xbf\xf3\x7f\xf4\xbeN\'\x05\xbf\x13_\xa1\xbdW\x88\x94\xbe[HC\xbfR\x03\x91\xbd\xf1\xd4\x80\xbf\x1e\x0b\xb3;\x80\xb8 \xbf\r\x82\x19\xbfw!\x9f\xbd\xaf\x15\xdd\xbd\x02\xedH\xbe\xd1\x1d\x9f\xbe\x8a\x00\x8d\xbf:\x88\xad\xbe\x90Y]\xbe\x85\xf3]\xbd\xc2\xa1\xdc;\xf0\x89L<\xe4\x95M\xbf\xf9\xd8l\xbf66\x84\xbf\xcbl\x05\xbf\xcaA\xce\xbe9*/\xbf#D\x9e\xbe\xac\xe2q<\xc8\xf45\xbf*xW\xbeY_\x81<_\x1f\x15\xbdJ\xe0\x89<\xefo\xb2\xbe\x03H\x85\xbc2\x9cQ\xbf=\xc10\xbe\x06\xc2\xb5\xbc\x16]\xc7\xbe\xb0\xe6\xc2\xbf\xa7~\xae\xbfw%,<@\x12\xe3\xbd\xf02K\xbe]?\xc6\xbe\x11\xf0:\xbe\x9e\x1c\xa4;v\xde\x11\xbf\x98_\t<\xf1\xf5@\xbf"\x99(\xbeC\xee\xa1\xbf\xb4\xc6\x95\xbf\xd5\x94]\xbf\xb2\xe4\x17\xbeYz\xcf\xbe\xeb\xb6\xda\xbe\xf5\xae&\xbeV \xd2;\x18\xe1\x82\xbd\x15\xb6\xf4;\x7f\x11k\xbem\xdf\x93\xbe\x82&y<\x99\x98\xfc\xbez\xa6\xc1; K\xef\xbd\n\xe0\x16<\xf4\x93\x15\xbff\xdb\x8b<\xfd\xcc\x15\xbf3-n\xbf\xde\x02P;\xf5c\xa0\xbf\x94\x9f\x97\xbf\x84\x91\\<\xc1\xca\x80\xbb\xb5\x14\xbd;\xadsR<*\'\xf0\xbe\xcafZ\xbfz\xe7\xf6:\xa2i\x1b<-0j\xbd\xe4Jx;_\xf3\xd8\xbe,J\x96\xbfkK\xfc\xbc\x9f\xddg;1g#\xbf0h\x85\xbd\x1c\xe5\xb0\xbfo\x9a\x9b\xbd\x05\xe2\xd8;\x7f\x19\xc3\xbc0V\x8f\xbe\xd8\x1c}\xbf\x97\x98m\xbf\x19\x12h<\xc7}\xac\xbf\xb8\x1c\xa9;\xdb\x7f\x94<\xf2\xc4\x13;\xd9\x90\x1e\xbe\xa0\x9b\x81\xbd/\xaa\x84\xbd:d\xe8;i\\n\xbf\xb6\x950\xbe\x009,\xbf\x1ce\xf9\xbe\xfd\x94\xd0\xba\xae\x99\xa8;V\x89\x04\xbd\xa4\xc3\xdf\xbd\xe1\xaa\xa6\xbbu\xa4\x16\xbe\xf4\x00n\xbf\xd6\xc8+\xbe\x8cN0\xbfh\xa8*\xbf\x8c{c\xbe \xcc*<k\x01U\xbe\xf7S\x9f\xbf\xabNF<"\xc9:\xbe\x98\xc0\x14\xbe\xd4\x8eD<+\xe0\xa0\xbe\xc0\xbeT\xbe)\x9c\xd4\xbe::\xf2\xbe\x0c\x914<\r\xf5\x06\xbeb\xc7\xa5\xbeB\x14\x19<\xd7\xc2\xea\xbe\xf6\x97u;W\x17p;K1\xa5\xbe\xb1Gn\xbf\xa5\xdav\xbf\xef\xb5V\xbf\x98J\x9b\xbf\xa78d\xbew(\xd0\xbe\x99_\xc7\xbf;\xda\x99\xbe\xb9Y\t\xbe\x1c\x9b\x85\xbe\xc6B\x06\xbdw\xb6\x85\xbe\xe72K\xbe\x0b\xa3\x83<NU\xa8\xbe\x19\xd8\x83\xbd\x18\xf5G\xbf\xb0B\x9a\xbf\xa0\xd71\xbe!\xfa\xa2\xbdI\xe69<C\xde)\xbf\x07\xcc\xde\xbe\x9bi\x0c\xbf\xd3-l<yO\xa8\xbeo\x7f<;\xe7\xc5\xea\xbb\\\x8c3<d\x03\xe7\xbe\xb1\xd99<\x97K\x14\xbcc\xb8\x90;x)\x0e<\xd6\xf3\x8f<\xb9\xccy<\r\xb0\xa1\xbfi\x05\xfb\xbe/?\xa7\xbe\xf8\xc1\x86\xbe\xaf\xcd\xb0?\xf0\x83\x18?\xb3\xd5Y\xbc)%+=\xa0\xcb\x8f?\xb6\xd66=\x96\xb7T?\xc2\xe8\x0e\xbcVg\x17=\xb5,B? \xb9\x0e>\x13\x866?\xf1\x03-?\x07y\x87>j.5>P\xadm?\x9e, =M\x1b1>W}\x98\xbb\x12\x05\x16>\xa9>\x14\xbcw\xec\xf9>RM\xfc>n\xdd\xf0\xbb\x96\xa3\xf2>\xdc\xa6y\xbb}\x97u?.;\xad=c/O\xbc)L@?"u\x02?\xeaSK?\xa3-H>\xc2\x154\xbcYS\xc3>L\x90\xef>\x1e\xf8\x88?O:C?\xd9\xc1\x97?\x96\xec\xbb=\x8e_\x08\xbb8\xa5\x89>P\xca<?\ty.\xbc\x84\x11\xb3<\xa9`T>l\x1aP?\xd7\'\xa7=\xf7\xbe\x05>\x1a\xc2\x97?\x00\xee\x9e>\xa1\xce\x93?\xd5\xd9\x07>\xbfr\x18?\xcb.\xa1\xbc\xf7\xb2\x0e?\xa0\xbb\'?:\x9a\x14?~W\xa0\xbc\x14\x91\x90\xbc\xfcE)?\xc1\xc2\x92?\x86J\xf9>:c\xc9=\xe1_I?\x9c\x82\x02?YG\xaf<\xa4\x8d\xbe?\xc7Q\x13\xbc\xa1\x02\x11?yA\x92\xbc\xaa\xa4\x16\xbc\n\xd2\x00?\x18FE?\xdcP\xb2=cx\xa3>\xc2*&?YG\x11?\xac\xb7\x85>\xf5\xae\x81?\xf5\xad=?J(`>\xdaAN?j\x99\xfc\xbb\xcd\xf7\xe0>\t\x9d\x8d>\xf3rp?M\x9e|\xbcU*\x96?G\xd4\x9c>\x19\x99\xd7\xbb\x95\xd4\x94?\xda\x89\x18\xbc\xda4\x14>\xbe5\x7f?\x9a\x18(?\x18\xcb\x80?\xce\xcd\xa2?\xa9u\xb0>5\x0fa=\x14:\xcc>\xfc\x02P?\x1f\x96\xac>>\xd5\x0c?\x19N\x19?\xd8^\n\xbc\xb0=\xce>\x1bE\x9d?\x01\x18\x88=\xe5\xba\xec>\x02\xe6\x10>\xc0:\x01?\x7f;\x86?|\t\x1c?A\xde\x84>*y\x1c=\xe8(9\xbc\xe4\xa8\x90?e\xb6\xbf>\xa6\xcb#?6\x81\x82?t&Z?\xaa\xc3(=\xde\x02\xaf>.\xcf%?(\xc7-?0w\xc5\xbb\xdd\xce\xf0>\xf3\x1f\x96=\xdbr\x10>\xd6\x869?\xb2\xbe\xcf?\xf3\xfc\x91>\xce\x86\xf1>\xbc\xdb\x82?\x9b\xbc\xa3>d\x9bU>\xc7\xc0^> \x83\x80>\x04\r\x87>\x11H\xc8=z\xc5\xfc>\x9e\xb0\xfe>HP8\xbck@3?\xfa\xd8\x9e>!Q\x0b?\xbf\xf7\xb9?\x85\xb0\xd5\xbb\x9e;M>\xcf.T?\x1ax\x00\xbcu\xa0V?\xc4\x7f\x16?\xef\xcbZ>K\x12\xa8?j\xd6\x0c\xbb\x05\xaa\x15?\xc1~P>\xfe\x04K\xbc\x88\x9d\xc6>\xb0\xa47\xbcM\x08O\xbc\x1f\xacW>iI\x95>\x8d\xaa\xa4=~\xa0T\xbcF\xde\xc6>o\x9c\xa2?\x13_\x1f?D\x01\x1d? 4\x19>-Rn>\xc1B\x96?\x7f\xd1\x80>\x9a\x18\xcd=\xd8\xc2\x8d\xbc\xcc\x1cB\xbc\xd6\xa5\xc4?\xc7I\x9f>~gM?) \xcf>!\\\xe8\xbb\xe7\x00\xbc>\x15\xa5Y?-\xd4\xc5<\x95\x10\x94?\xa8\xf1\xd8>tD;?\\^ ?\x11Z\x1f?h?M?0d\xbf>j\xc3\x85?s\x9c\x91?iN\x86?\x92JR>\t\xdc\x14>\xee\xaa\x9d=9\x1d0?'
-p426
-tp427
-bsV445262404361142272
-p428
-g2
-(g3
-(I0
-tp429
-g5
-tp430
-Rp431
-(I1
-(I400
-tp432
-g12
-I00
-S'\x16\x15\t<\\X\x08\xbf\xa0B\xae\xbf\x9bN8\xbf\xee]\x8f;\xf4\xd6_\xbf\x83O\xeb\xbe\xb1\xb7\x89\xbf\x94R\x90\xbe\xa0\x8e9\xbeC\xde\x02\xbf\xa9p\x11\xbfH\x0e[\xbf\xf3\xeeG\xbfHY\x9d\xbd-\xc3?<\xdd\xa2\x13\xbf\xb2qQ\xbf\xaa2,\xbf:|K\xbf\xdf\xb7u\xbf\x1f\xe3\x81\xbe/m\xb0\xbc{\xce\xba\xbeG`\x04\xbf\xc9\x83\x9e\xbe\xa4\xb9!;h<7\xbe\xc4\xd1w\xbf\x83YG\xbf\xc1\xd2F\xbfNn?\xbf7N\x9f\xbeQ\xc1v\xbf\xb07t\xbe\xe9\xebj<\xd5\x84\xcc;e\x99\xa7\xbeJU"<\x18\x9e\xa8\xbe\x99b\xa4\xbf\xd3\x82\x8b\xbf\xcbl\x05\xbf\xa3U?\xbe\xe4\x13\xc6\xbf4.\xad\xbe\x18EH<Py\x1e\xbe*xW\xbe\x11IM<\xa7\x15\xf9\xbe\x88.Q<<\x9c7\xbf.\xce\xf8\xbe\xc2M[\xbf5K\xed\xbe\xfb5\xa4\xbdF\x14\xa7\xbe\xb0\xe6\xc2\xbfr\xbeM\xbf\x80\x90u\xbf\x8d5\x04\xbd\xd2\x9f\xdc\xbc\r\x7f\x87\xbe"\xee6\xbc*!\x1c\xbe\xcf\xaf\x15\xbf\xdb\xed\x17:2fH\xbf\xd9q?\xbf\xc2\xb5\xed\xbf\xb4\xc6\x95\xbf\x14\xee\xc9\xbf\xb7u\x8b\xbe\xc8> \xbfD\xe4\xee\xbe\xa4p\x00\xbe\x80\x0c_;\xef\xb3*\xbb\x9d\xa8\xab;\x8eS\x05\xbe\xe9\xd3@\xbe\x9c\xad\xa0\xbeQ\x96\x1c\xbf~\xf3%\xbe\xbe\xba\xad\xbe\x1e\xe5\x1d\xbf\xb5\xbba\xbf\xc4Q\x82<\xd3lz\xbf3-n\xbf\xf5\xc2\xb0:+\xca\x90\xbf\x94\x9f\x97\xbf,\xc5\xf9;\xa2\xea\xe8\xbee\xa6\x1a<\x0e\xae\x16<*\'\xf0\xbe\xb7%\x84\xbf@q\xd4\xbe\xd3j\xb0;\xb6\xc1\x8a\xbe\xc3\xc3\xc1;P\x87a<,J\x96\xbfW="\xbf\xa8\x82\x8c\xbb1g#\xbf\x1dv\x9b\xbeP\xeb\xcd\xbfRp\x99\xbe>Pc\xbe 0\x81;\xf9\x00M\xbc\xd8\x1c}\xbf\xfb"\x8f\xbf&\xd6V;\xc7}\xac\xbf\xd0\xb7\x8d\xbe\\\x0e\x97<\xceYU;?\xda\xde\xbe\xe0\xd1\x1a\xbf\x17(\xb7\xbe~{\xb6;i\\n\xbfv\xbf\xfe\xbe\x009,\xbf\x0c\xf9N\xbe\xfa\xd2k\xbe\x140M;\x1bC\xca:D\x9c\xa8\xbe\xd5\x9e@\xbf\x82\xd8O\xbe\xf4\x00n\xbf\xd6\xc8+\xbeK$\xca\xbfh\xa8*\xbf\x98\x15\x03\xbf`7\xd6;u\xd8\x0b\xbdT6\xa9\xbf8KV<V\xd4Z\xbeAM\t\xbf\xed\x1a\x8d<\'m\x1b\xbf\x7f\x08\x17:5\xaa*\xbfT\xcb\xc1\xbe}\xea%<#<\xf7;d]\xc5\xbe1 \x02<)t\x08\xbf\nyA;\xdc<\x17; \xdcH\xbf*w\x8f\xbf\x13\x83\x84\xbfx|\x99\xbf\x98J\x9b\xbfS7\xd1\xbe\xd3\x15\xab\xbeG\xe9\xa8\xbf;\xda\x99\xbe\xafm\x9e\xbe\xb3\xf0V\xbe\t1\x88\xbe-P|\xbf\x88\xd3W\xbf\xa2\xadS<NU\xa8\xbe\x0f\xc5{\xbc\x18\xf5G\xbf\xb0B\x9a\xbf>^\x0b\xbfS\xf3\xf9:]\x03\xa7\xbcC\xde)\xbf,I\x1d\xbf\xfb{F\xbf\xa5\xb9\xe5;:\x89"\xbf\xdc\x1e ;\x9c\xd5\x1e\xbd\x9c\xc74<)("\xbf\xc2\x18\x9f\xbe!A\x1a\xbeGP{\xbc\xd7\xfcf\xbe\x04bQ<\x91\x8bB<\r\xb0\xa1\xbf\xfe\xbb\xd0\xbd\xd6\x00\x91\xbe\x9a\xc9\xc7\xbf\x9c\xa3\xbb?\xe8\xecA?*\xb1J\xbc\x8c\x85b?\x04\xbf.?\x0b\xd4\x88>3>\x9f>\xfc\x9e\x7f=z\xbe\xf0>J\xa1n?J\xc9\xfe<\'{\x9b>M^\x16?\x05\xddy=\x94\x86\xb0>\xe1w\x98?Uk\xa8<\xdc\xd4\x8b<\x8b\x15\x1a\xbb\x12\x05\x16>@\xe5\xc8>\xc20L>\xaeZ\x97?\xbfaG?\xc7\x1c\x87>\xfd\x0c\xf4=\xd9\x8c5?\xc2\xf3}>\xe0\xd2\x1b?\xc0\xcb\xb5>\xedo9>\x00,\x89>\x9b\xa9\x84=\xf2x\x11\xbcD \xaa>\\\xac\x95?9I\x98?O\xe0g?/\x9c\x9b?\xd5\x0cM>`\xde\xe1\xba\xad\x85\xbb=\x1a.\x06?\xfe\xe5\xad>tX~\xbb\xf7\xf3\xe7=\x06\xe7V?\xdd\xaa-? \x9a\xe6>\xf3r\x94?\xc3J >\xd4x7?\xc2\xdeG>B\x04\x04>\xa0\xe1\x80\xbc\xd5,^?\xa0\xbb\'?:\x9a\x14?\x0c\x96\x87\xbc\xef\x9eA\xbc\xb5\rA?>\xa8\xb9?2pe?:c\xc9=U\xa7\x1f?\xa8\xc0\x0f?7\xe9#=\xa4\x8d\xbe??\x9a9?\xc1\xea\xa5>nHk\xbc\x90\x1b1\xbce\xcf\xf8<\x18FE?V\xb6\x93=\xb0c\xb1>\xa1\xb5\x88?YG\x11?\x19\xde\xb8?\xa9~I?\xf5\xad=?8\x1f8?8\x1a\x1a?\xdbk\xf3\xbb\xcd\xf7\xe0>\xa4\xc6}>\xce\xf7\x05?=P\x19\xbc\x85A\xce?M\xf4\xf5>\x9a\xd4,<\xd0\xf5\x9a?|\x90S>\x1b\xeb\x11=Y\xb1\xd0>\x8d\xe3\xee>\xa7\xbb\xe3?@(\x83?\xf0\xac.?\x1f\x97\xe9=\x920\xc6>]\xb0,?\x1f@\xba>\xb5Y3?x\x81\xc7?\x93:\x0f\xbcEo\xc7<\x1bE\x9d?6\xd9\x07?t\xc7\x86>_\x9d\xa2<\x8b\xd2V>a\x15\xca?D\xd7o?\x9b\xdbJ?\xc0\xd1\xc8>\x0fYI\xbc\xfeh\x19?]QM=\xa6\xcb#?4v\x96?\x0b\x9fm?F\x19:>\xa7\\\x0f>F\x84\xe4>\xf2\x8eY?\x8f\xa2l\xba_\xc6\x8c?D\xb3\xa8>Pn\x0f?\xd6\x869?\xb2\xbe\xcf?\x9fs\xc7>\x9c\xdb\x8b>%\xb8\xcb>\x93\x80\xb5>]X\x1e:7\x15\xe0>\xc9Q\x14=5\xcf~>\x11H\xc8=\x7f\xd0\x80?1\x95G?F}\x00\xbc\xe1\xdd\x89?s\x92\x15?\xb9[Y?\x8c\x13\xda?Tc\xa5>{"\x85?\x8b|\xc5?b\x00\x1c?u\xa0V?\x03yk?\x1e5.>\xe8[\xaf?\xc2\x96d\xbb\x05\xaa\x15?\x06\x9e\x97?#]\r\xbc7\xa8\xb8=Q\x10\x18\xbc\\?p\xbc\xc1\x95\xa6\xbb\x9e\x12\xab>\x06\xc6P?Y#\x10\xbc\x92K\x17?o\x9c\xa2?\x13_\x1f?\x91\xaa\xd1=\\\xcf\xfb\xbb\xf2\xc8\xfe<\xb5\x10\xa2?#\x07\x84>\xee\x91\x8c?\xa6\x87;\xbc\xf6le\xbc\xffZ\xd8?b_\xcd>\xcf\x9e\x10?y)\xbe>\xb0\xed\x19>\xf5\x86\x91>m\xfc\xc3?a\x0b\x8c>\x95\x10\x94?\x80T\x9c>tD;?]\x01\xab=\xbd\r\x04?\x14%\x8f?mX\xa6>\x80\x95\x8f?\xc8\x98\x85?iN\x86?\xcfn&?\xfa\xe3\xd0>Y\xf1\xdd>\xb7,\xa3='
-p433
-tp434
-bsV445259180543184896
-p435
-g2
-(g3
-(I0
-tp436
-g5
-tp437
-Rp438
-(I1
-(I400
-tp439
-g12
-I00
-S'\xfd8\x1d<\xf0\xe8\xcd\xbd\xa0B\xae\xbf\x9bN8\xbf\x04\x92\xa5:\xb5\x10\xd1\xbek\x17z\xbd\x85\x89a\xbf\x94R\x90\xbe\xa0\xe4\xb7;C\xde\x02\xbfI\xb99\xbd\xb9\xd8\xee8\xb0\xe8+\xbf\xb8\xd4\xb2\xbeK\xc1\xc2;\xdd\xa2\x13\xbf\xb2qQ\xbf\xaa2,\xbf\x82\xfek\xbe\xe0d\xbc\xbes\xef\xda\xbd\xbf\xf0\t;\x1bS_\xbf\x93$:\xbd\x1f\xd1\xcf\xbekA\xd7;\xcbo<\xbf\xc6B\xf1\xbej\xbd1:\xaf\x15\xdd\xbd\xe34\xe5\xbd\xd1\x1d\x9f\xbe(j=\xbf\xb5?\x80\xbe\xc7\xe9B<\xc7G\x93;\xd4\x1b\xf1:\xeb\x9b\t<S&~\xbe\xf9\xd8l\xbf66\x84\xbf\xcbl\x05\xbf\xfaR\xb5\xbe9*/\xbf#D\x9e\xbe\xb3\xfa*<\x12\x9b\xbf\xbe*xW\xbe\x90\x0f=<_\x1f\x15\xbd\xc7\x0c\xfc;\xe1\n\x16\xbf\xb9\x0f\xdf\xbb9\xc8k\xbf=\xc10\xbe\x06`\xe8\xba\xd4\xd4\xed\xbd\xb0\xe6\xc2\xbf\x9fV\x90\xbf*\x93\xd6;\x0eZ\xe8;\x9e\xb2\xfe\xbc\x96\xcdp\xbe\xa4\xa4\x0e\xbd3Y\x03;\xdb\xf1\xa1\xbe\x99`\xc8;PyR\xbf"\x99(\xbeC\xee\xa1\xbf\xb4\xc6\x95\xbf\xd5\x94]\xbf]\xda\xee\xbd\xcdv\xf8\xbe\xeb\xb6\xda\xbe\x06\xd7\x8a:F_\x94;\xfa\x0e\xb2\xbc&\xb2\x1e;\xbc\xcf\x06\xbe\tjD\xbe_\x11^;\x99\x98\xfc\xbe\xca\xcc\x809\x17\xf8p\xbab\x13T:\x15\xaf?\xbfs]\x04<\xfd\xcc\x15\xbf3-n\xbf\xdb\x9f`;}\xc6\x99\xbf\x94\x9f\x97\xbf\xb3@\xc3;\xb1\xc4c\xbc\xb9\x89\xdf;\x89\x82\xf8;*\'\xf0\xbe\xcafZ\xbf\xa5\x12\xfb\xbaw\xbdA;\x02qv:f\xe5\xa4;\x94\x96\x8b\xbd,J\x96\xbfkK\xfc\xbck\xbfQ;1g#\xbfN[\x01\xbd\x1c\xe5\xb0\xbf\x971\x15\xbd\xc7\x11M\xbc4\x8f\xd9;\x80\xf7\xce;\xd8\x1c}\xbfX\xc08\xbf\xc6\t\xca;\xc7}\xac\xbf\x07\x02\x00\xbd\x15T5<\xb2L&;\x14\x8d\xa5\xbe\x86\xc6\x9d\xbc\'4e\xbdzE\x99;i\\n\xbf\xf8\x9f\xaa\xba\x009,\xbf(\x04\x0f\xbfEGL\xba\x9a\xef\xd2:\x1c\xd9\x88\xba\xac\x15D\xbdn\x98k\xbb\xe86\xe49\xf4\x00n\xbf\xd6\xc8+\xbe\x8cN0\xbfh\xa8*\xbf\x06\xa9B\xbeI\xea\xcb;[]I;\xf7S\x9f\xbf\xad4\xf2;\xd6\x06\x19\xbe\x98\xc0\x14\xbe\xf7\x88\xdd;\xc5\x08\xdb\xbe\x1c\x97t\xbd\x0e\x8d\x1b\xbd1\xfdU\xbe\xf9\xf3\xcf;>\x97r;b\xc7\xa5\xbeXs\xab;\x04\xaan\xbe\xeb\xfc\xa6:\xba\xb5\xe0\xba\xee2\x9e\xbe\xb1Gn\xbf\xa5\xdav\xbf\xdc3>\xbf\x98J\x9b\xbf\x8b\xbf*\xbd\xd3\x15\xab\xbe\xbc\xe5\xa8\xbf;\xda\x99\xbeV;\x81\xbd\x149\xf5\xbd\xc6\'~\xbcw\xb6\x85\xbe\xe72K\xbe~\x03@<NU\xa8\xbef\xa6k\xbc\x18\xf5G\xbf\xb0B\x9a\xbfu.\xa2\xbc\xc3f\xce:Z\xa7Z;C\xde)\xbf\x0fm\x05\xbf\x9bi\x0c\xbf\xa8O\xe4;\xdf?\xdf\xbe#\xa2t:\xe4\xb1\x11;T\xe8&<EOq\xbe&P*;\x82\x8e\\\xbc\x03\xb1\xeb;\x0f\xb6\xe4:O\xaf\xf1;\xae.\xf4;\r\xb0\xa1\xbfUe\x0e\xbe\xa5i\xcf\xbe\xf8\xc1\x86\xbe\xaf\xcd\xb0?\xf0\x83\x18?jy\x86\xbb\x00j\xff;\x07 :?\xe1\x1e\x1b\xbb3>\x9f>O2\xc8\xbb\xafY{=|: ?\xbb\x8e\xe6<<|\x07?M^\x16?\xfa^v=j.5>P\xadm?\xcbx\x07;\xebz\xb0=\x87\x16`\xbb\x12\x05\x16>*a\x93\xbb\xc8\x1d]<#6\xaa>\xbap\xde\xbb\xc7\x1c\x87>\xda\xd0v\xb9T\x9f@?.;\xad=\xba\xe7\x05\xbc\xc0\xcb\xb5>\xb1%$?\x00,\x89>\x9b\xa9\x84=\x87\x03\xa5\xbb\x84;\xd4=L\x90\xef>\x1e\xf8\x88?\xdc\x88\xe8>\xd9\xc1\x97?\xf6r\x98=T\xbf\x14\xbb\xee\xfb\xb9:Vd\x12?\rT\x83\xbb\xcb"f\xbb&\xd1\x83=\x145\x94?\xd7\'\xa7=\xf3\t\xc6=\x9d\xbc\xa7?\xbfu\x07>r\xa4\x8d?\xd5\xd9\x07>\xe8^\xc7>\xa5\x0b\n\xbc\xd7j\x19?\xa0\xbb\'?:\x9a\x14?\x9b\xa5O\xbc\xbd\xb7\xea\xbb:\x1eE?\xc1\xc2\x92?\x86J\xf9>:c\xc9=\xe2;\xfc>\xc9b\xf2>\xfe\xee\xac\xb9\xa4\x8d\xbe?{P\x00\xbc\xc1\xea\xa5>\xf2\xf0+\xbcPm\xf5\xbb\xde:\xb3>\x18FE?\xef\x88\xcb\xbbg|\x07>20\xa3>YG\x11?8\xb7T>\xa9~I?\xf5\xad=?e\x99\x13=E\x97\x1c?9\xe0\x18\xbb\x8c2\xea>\xa4\xc6}>fH\x82?~<\xe6\xbb\xbd&s?\xfb\xc3\xfb=@\xf7\x978\x95\xd4\x94?a\xb5\xbc\xbb,5\xaa>\xd8\xa9~?\x8d\xe3\xee>\x18\xcb\x80?@(\x83?Se\x9e>\xf9\xe0\xa29\x920\xc6>\xd9\x80)?Y\xc0\x15>>\xd5\x0c?|\xa2\x05?\x10\x10%\xbc8e\xd8>\x1bE\x9d?Z\xe3"=:\xa6\xe5=\x05\x99\xf6\xbb\x8b\xd2V>\x7f;\x86?|\t\x1c?A\xde\x84>\xef\x8c\xae<\x9c=\xca\xbb\xdfnA?]QM=\xa6\xcb#?\x0f\xe7\x80?t&Z?4\xde\x19\xba\x05\xd4\x9d>F\x84\xe4>-\x884?!\xde\xe2\xb9\xdd\xce\xf0>\xa5\x9a\x87=\xdbr\x10>\xd6\x869?\xb2\xbe\xcf?\xa0+e>\x9c\xdb\x8b>A-@?{\xaa\xb9>\xd0\xde\x02=^\x01r>\xf9\xaf\x87\xba/\xb3\x0b=\x11H\xc8=\x93\xbf\xf2>\x9e\xb0\xfe>\xc4\xd3*\xbc\xc4\x92\x0b?p\x02\x99>\xd4\x06\xc1>\xbf\xf7\xb9?\x93\x98\x95\xbb\xaaf\xae=\xcf.T?-d\x07\xbbu\xa0V?:b\xe0>\xad\xc9\xff=\xfe\xcav?\xb1\xf33\xbb\x05\xaa\x15?\xc1~P>\xaa6\x9e\xbb\xdbk\\=\x92\xd1$\xbcZ\r)\xbc\x9cWu\xbbiI\x95>\xaf\x11\xdc:*c\x05\xbc\xa2\xe9\xb1>o\x9c\xa2?\x13_\x1f?\xa7u\x02?\x1d\x1bU>\xc8@V\xba\x84\x9d\xb5?\x84\xdc\xb9>\x19/\xa2=\xedA\xcb\xbbi,\x02\xbc\xd6\xa5\xc4?K\xba\x89>\x0cj\x02?"\xa2\t=\xba\x7f\xf2\xbb\x11\xdd\x19\xbc\x15\xa5Y?\xfa\xfe0<\x95\x10\x94?\x86\xd2n>tD;? \x8f\x89=1\xb9\xb0>h?M?E\x004?j\xc3\x85?\x9c\xe3m?iN\x86?\xa6\x18\x1c=\x9af\r>4\xb4\x91=\xaf&w?'
-p440
-tp441
-bsV445268270376288256
-p442
-g2
-(g3
-(I0
-tp443
-g5
-tp444
-Rp445
-(I1
-(I400
-tp446
-g12
-I00
-S'\x01\x8e\xb8;6\xa9\x85\xbe\xa0B\xae\xbfP\xcf:\xbf\xba\xbc\xb1:\xb5\x10\xd1\xbek\x17z\xbd\xe5\xc7~\xbf\xa6\xbc\x1b\xbf|%\xfe\xbcC\xde\x02\xbf\xbd\xaa\x08\xbf\xc4\x7f\xcd\xbe\xb0\xe8+\xbf~\xb8\xf3\xbeTF\x0c<\xdd\xa2\x13\xbf\xb2qQ\xbfn8\x7f\xbf\x07\x8c9\xbf\xc7\x13\x02\xbf\xa3|\x19\xbe*\xb1\x97;\xac\x9d\x06\xbf)\xdf\x15\xbei\xa0\x1e\xbfU\x7f\x90;=\x9f\xd2\xbe\x9d\xd7B\xbfI\xa51\xbf\xc1\xd2F\xbf\xdf\x14T\xbe\xd1\x1d\x9f\xbe\xae\x84{\xbf\xdf\x86:\xbeF\xaa\xd6;F\n.;\xb6\xdb\xc6:\xdb2\x9b;H\x94\x8d\xbe\xf9\xd8l\xbf66\x84\xbf\xcbl\x05\xbf)!\x8b\xbe\xa3^?\xbf4.\xad\xbe\x00&\x04<\x922\xaa\xbe\xd6\x9c\xd9\xbe[\xa8\xd4;)/\xb4\xbe\x99\\\xd4;\xa1_0\xbf\xcd\x13\xd8\xbdl\x0b\xc7\xbfr\xc3\x97\xbe)\x9b5\xbe\\\xdeN\xbe\x93\xa1\xff\xbf1\xcb\x8c\xbf\x9fu!\xbe%\x8c+7{|\x9c;y\x1c\x8a\xbe"\xee6\xbc\xa1\x97\x85\xbe\xd9\xeeP\xbfp\xf7\xdc;\xf0\x9f\xc8\xbe\r\x0f\n\xbfC\xee\xa1\xbf\xb4\xc6\x95\xbf\xd5\x94]\xbfm\xf4\xf6\xbd\x98xr\xbfcsG\xbf\x9a\xe0\x07\xbf2\xa3\x83:]\xfc\x90\xbd.hC;\x8eP\xc9\xbe\x909\xe5\xbe\xdeG\x9f;\xe6\xb1\x83\xbf\x0e\xa6\xa2:q~\xec\xbdW\x07&\xbc\x98\xa9\xde\xbe\x9f\xbe\x12<\xfd\xcc\x15\xbf3-n\xbf\x9d\xdc\x7f\xbd\xf4)\xcb\xbf\x94\x9f\x97\xbf\xfd\xe3\x9c;\xac\xa0\x80\xbdf\x1f\x91;\xabWI;*\'\xf0\xbe\xcafZ\xbf\xb48\xc2\xbesc^;\xa7\xf6\x1c:\xab\x0c\xe6:\x1b\xe2\x0c<,J\x96\xbf\xdfth\xbe\xe2&\x94;2\x834\xbf\x9c(\xbf\xbeH0\xbf\xbf\xac\xa6\xfd\xbe\xc2z\xa7;hX\xb4\xbc\xb0\x9c\xb1\xbe\xd8\x1c}\xbf\xff\xa6A\xbfB\x05\x8e;\xc7}\xac\xbfnY\x93\xbe\x0c"\x0b<N\xb5Y;\x1c\x8ae\xbe\xa5.\x07\xbe\x17(\xb7\xbe\xb4\x9c*;i\\n\xbf\xd7n\xb5:\x009,\xbfiz\xcc\xbe\xdc\xba\x04\xbe?\x05\x94;kt\x8a\xba,%\x89\xbeX\x8fj\xbeA\x05\xd6\xbe\xf4\x00n\xbf\xe2\xc3\xda\xbef \x97\xbfh\xa8*\xbf\xb3y\xd8\xbe!\xb5\x13\xbf\x96J<\xbc\xf7S\x9f\xbf\x01D\x17<\xb1\x02\xa4\xbe\xb8<\x89\xbe\x8e\x9c\x15<%\xc3\x0b\xbf\xca\xd6\xd1\xbe\xab\xe8)\xbe\x9aC\xcd\xbe\x83\x15v;c\x01\x18\xbe\xd8\xa7\xd4\xbeg"\xc0;\xf1R\x00\xbf\x0c\xc0*;<\x90\\\xbe\xc2\xf1$\xbf8\xc6\x83\xbfgM{\xbf ;l\xbf\x98J\x9b\xbf>\xef\xd1\xbd\xd3\x15\xab\xbe\xf8\xfc\x86\xbf;\xda\x99\xbeX\x84J\xbb\xeb\xd5\xa3\xbe:\xbco\xbe\t\x1f0\xbf\xc6}\x19\xbf\xe9\x1b\x03<NU\xa8\xbe\x071\x00;\x1f@O\xbf\xc5\xd4\xbc\xbf\xb3\xcd(;\xe2`\x91;v\xda\xb0;C\xde)\xbf3\x95+\xbf\x0caK\xbf\xf5\x7f\x08<yO\xa8\xbe\xe7R`\xbc\x9c\xd5\x1e\xbd\x18\x0f$\xbc\x9a\xa3\x85\xbe\xfe\xd7\x07;\xe0\x9c\xdc\xbaGP{\xbc\xa1\x19\x94;\xae\x9a\x06<\xed\xa4\xc5;\r\xb0\xa1\xbf\xb2\x1e<\xbe\xd6\x00\x91\xbeS\xcf\x15\xbf\xaf\x8f\xd8?\xf0\x83\x18?\x15\x19\xd4\xbb\x1b\xb3\x1e>G\x96^?\xfcb\x15?3>\x9f>!M]\xbbS\xad\x9a> \xe5\x92?\x9cs\x9a;\x9f\xf8\x88>G\xcc\x1c?\xf4\xbd(?j.5>P\xadm?\xf1\xbb\xaf=\x10\xacQ=\xdb\xc30\xbb\x12\x05\x16>\x88\xc8\x8f>\xc0)\xfa>]@\xef>\x16\x91Q?\x16c\xa4>\x88\xcd\'\xba\xd9\x8c5?\x91\x8c\\>\xbb\xa1#\xbb\xc0\xcb\xb5>Q\x03>>\x00,\x89>\xc5]\xd9=\x9f\xe3\x9b\xbb\x07O\xed>$\xf8+?\'\x9e\x9c?n\xcb\x0f?\xd9\xc1\x97?\xb6\x9e4>\xcf-\xbf=\x1c\xa8\x90\xbb\x82:V?\x01\n\x84>\xf0\x85\x9c>H\xb3\x9e\xbanX\xa4?D\x14\xef>\x97\x1a\x1e>\xb4\xcf\xe5?2\xcb:=j\x9d\x80?\xd5\xd9\x07>\x82\xd5,?\nY\x05\xbc\'\xaf\x88>\xa0\xbb\'?:\x9a\x14?-\xab$\xbc\xa2\xc6\x0e\xbcR\xe4&?\r\x01\xad??D^?\x88\xed=>\xe2;\xfc>\x04\xfc\xe7>5\x1bY=\x18\xfb\xc2?Y\xcdH?\xc1\xea\xa5>V.\xc6\xbb\x8e\xe4\x8b\xbb\x8c\xeb\x97>\x18FE?a\xe3w=\x1b?\x15>\x18\xdb\xba>\xa4QY?\xf3\x19+?\xa9~I?\xf5\xad=?\x1a\xa0e>\xc5\xcc\x90?\x0bC\xdf\xbb`\x11W?o\xc0\x12?\xe6\xbe\x95?\xec\xdd\x9c=\xda\xf6|?\x86\xec\xe1=$\xea:\xbb\x95\xd4\x94?rJ\x97\xbb\x16\xf0\xe7=\xf0[~?\x93\xc91?\x18\xcb\x80?T\x13\x99?FD\xea>\x84\x88\xbd\xbb@\x87\x1d?_\xf0#?\xa0\x96\xce>>\xd5\x0c?\xee\xcdL?\xea\xa3p\xbb7\xd7,?\x1bE\x9d?_\xb3\x8e>\xe2\xf9\xb8>t\x0b\xc8\xbb4L%?\x7f;\x86?|\t\x1c?\x15\xab\x0e?\xa3\xef\x02>\x90W\xb7\xbbO\xb9\x8f?aj\x18?\xa6\xcb#?\x0f\xe7\x80?t&Z?\xca\x9e;>$<\x0c?F\x84\xe4>\xe3\n3?\xde\x9aM\xbb\xaf\xed\xfb>\xb5#\x86>\xffs\x03?\xd6\x869?\xb2\xbe\xcf?\x99h\xad>h\xb3\xb8>\x94\xe0\x97?/?+>\x9bo>\xbasp%>\x8d\xfa\x95\xbbA\xeb\x00=\x11H\xc8=\x93\xbf\xf2>\xd5"\x0f?\xe3\xc7\x9f\xbbT\xfcK?in;?\x08&\xf8=\xbf\xf7\xb9?\xb4P^\xba\xe2\x9f\xed>\xcf.T?\x13\x96\xba=u\xa0V?:b\xe0>m"\'>\x8a\x0c\x82?v\x05\xd5\xbaVZ\x18?\xb9a\xf6>\xba\xed\xd2\xbb\xbe&5;\x15\xf5\x9f\xbbI\x85\xf9\xbbc\xe5\x17>_\xcaZ?f8\x92>@\xa7\x8b\xbb\x17\xd4\xf6>o\x9c\xa2?\x13_\x1f?\x96\xdeZ>\xaa=\x95>\xcau\xb7>\xad\xf4\xa3?\xb2H\xea>\x8c:\x1e?g\xfb\x1f\xbc}>\xf4\xbb\xd6\xa5\xc4?Mw$?\xa9\x82b?:n\xf5=\x8cl\xde\xbb\xe6`\xa7=\x04\x16\x98?\xb5[\xf5=\x95\x10\x94?_\xe9\x8c>tD;?\xe20\x07?c\x95\x84?h?M?g\xe7\xa6>j\xc3\x85?T5\xcd?iN\x86?j^Q<J\x1c\x1b?Y\xf1\xdd>\xf3\xd8\x8d?'
-p447
-tp448
-bsV445257739292254208
-p449
-g2
-(g3
-(I0
-tp450
-g5
-tp451
-Rp452
-(I1
-(I400
-tp453
-g12
-I00
-S'\xfa\x1f\t<\\X\x08\xbf\xb0\xd7\xae\xbf6g\xb3\xbff}\x99;\xf5\r\x0e\xbf\x83O\xeb\xbe\xc9\x01\xad\xbf\xc3\x84<\xbf\x93b\x05<\xc4O\x12\xbf\xf6\x98D\xbf\xe4_\x03\xbf\x80\xc2U\xbf\xe9 .\xbf\xde\xdd\x14<w\xe3R\xbf\x977S\xbf\xd2\x9f\x9b\xbfz\xbf\x8d\xbf\xdf\xb7u\xbf\x92\xc5\xb2\xbe\x1ba\xb4\xbe\x1bS_\xbfG`\x04\xbfG-\x8b\xbf\xe2\\\xd2\xb9`/M\xbf\xc4\xd1w\xbf\xc2\x95{\xbf-\x91\xa1\xbf\xd8#\x14\xbf\xefU4\xbfC\x1a\xc2\xbf\xec(\x1d\xbf\xe9\xa2,\xbeN\xc4U<e\x99\xa7\xbe\xb4\x15\xe2\xbb\x0c\xbc:\xbf\x9b\x9e\xae\xbf\x85\x80\xd0\xbf\x9e\x95\xef\xbe@\x89\xd3\xbe\xfd\r\xb5\xbf\x9bi\t\xbf,\xc6T\xbc\xe2\xce\xde\xbe\x89\xbf1\xbeC,\xfd91\x81\x1a\xbf\xa9%\xf5\xbb\xfc\xdb\x89\xbf.\xce\xf8\xbe\xa2\xc8\xaa\xbf\xc8n\x18\xbfT(\xb6\xbe9"=\xbf\xa5\x1e\xff\xbf\xa5x\xc3\xbfK\xac.\xbf\xe0\x98\x88<\x92\x81\xfd;\'\x9f\xe0\xbe\xe9\xb1)\xbeB\x81\xfd\xbe%\x98\xa9\xbf\xa1Z\xb6<PyR\xbf\xdb>\x8e\xbfe\x87\x8d\xbf\xe2v\x86\xbf\x87\x1b\xb3\xbf1\xe8\x95\xbe_\xa6:\xbf<Au\xbf\x93\x80F\xbf\xd8\x8bp\xbb\xbdaZ\xbe_b\xe2;y\xc0S\xbe\x9c\xa0\x8e\xbe|u\x90\xbc\xefMu\xbf~\xf3%\xbe\xbbP\xe4\xbe\x1e\xe5\x1d\xbf\x15\xaf?\xbf\xa9\x07F;O\x86g\xbf\xa8^\xcd\xbf\xbe\x1d\x12\xbc\x15\x0c\xc4\xbf\xdd\xf3\x98\xbf\xaa\t\x02;\xa2\xea\xe8\xbe\x9d\xd3B<m(\xdc;\x1c\xcc\x1b\xbe]\x99\x94\xbf\x80\xad*\xbf\x19\x83\x03\xbd\xc0\x93\xb3\xbb\xf0.\x11;XO\\\xbf\xbb\xc7\x89\xbf\xdc7\xcd\xbe\x07\xf9\x06<\x0e\xe9\x1a\xbf\x1dv\x9b\xbe\x89\xd8\xfa\xbfI\xa2\x9b\xbf!V\x99\xbe%\t\xfd\xbd\xd4\t\xd1\xbe\x08*\xe1\xbe\x12\xf6\x8e\xbf\x9a\x84r\xbb\x82\xa1$\xbf"\xc5\xf5\xbe\xf6\x83\xa6\xbb\xffy8;\x14\x8d\xa5\xbe\xe0\xd1\x1a\xbf\xc3\xaf\xfc\xbe\x1a\x1f]\xbb\x9aa\x84\xbfv\xbf\xfe\xbe`\xcc\x9f\xbe1\x19=\xbf\x8a\n\x84\xbe\xba\xa1\xe2\xbb\x93\xf8X;\x0f\xae\x06\xbf\xd5\x9e@\xbf\x1asH\xbe\xb9g2\xbf\xb9j\x0f\xbe\xf8^\xda\xbf\xb7\xe3p\xbf[\xc3M\xbfz\x0e0\xbe\xc6\xb8L;\xce}\xad\xbf\xeb\x8b\x84<*\x00\xfc\xbe\xb8\xeeO\xbf&G\x8d;\xa2\x8e0\xbf\xb9\r\xb2\xbd5\xaa*\xbfT\xcb\xc1\xben\xe3U\xbb\x17P;\xbf\xbd\x86\xcf\xbe,\x9f\x95\xbc\t\x8a\x86\xbf\xf8\xa9\x01<\xa7\x0e\x86\xbbP\x9bf\xbf\xb1\xbb\xcb\xbf\x92\x97\x7f\xbf\xc2\xf9\xe5\xbf\x02\x82\xa8\xbfS7\xd1\xbe7\x04\xde\xbeS\xa2\x12\xc0\x01\xc6\xd9\xbd\xafm\x9e\xbea\x92\x15\xbf\x15\xa3\xeb\xbe\xb5\xd1\x9d\xbf\x16\xfd\x8f\xbf%\xe7j\xbc\x97<\x83\xbe/\xbd\xe3\xbc\xa2\xc08\xbf\xaeh\xa1\xbf>^\x0b\xbf7B\xf59)\xd6\xed\xbbs\xc8\xcc\xbe\x19\xacS\xbf\xfb{F\xbf>\xbe<<\x9e\x81\x8c\xbf\xa0c\x8e\xba\xe8\xb6\x8c;%\x19\x16\xbf$m\x08\xbf\xc2\x18\x9f\xbe!A\x1a\xbe\x8c1\xba\xbe\x9f\x9d\x0c\xbf\xf9V\xa8;\xf4A\xe3\xbb\xfb`\xb5\xbf\xe2\x95d\xbe\xa5i\xcf\xbe\x98\x0c\x96\xbfd\x0b\xe8?\xa4\xc5h?\xb2\xf3\x81<j\x16\xdd>\xd8<}?\xd5\xb4 ?\x18.\x8c?\xfc\x9e\x7f=\x9e\xc4\x1f?\xdf\x84\xb5?\xc9+\x1a><|\x07?0a\x1f?\xbd\xc2\x11>\xadT\xe6>\x82\xbf\xf4?uB\x86\xbb\x057\xaa>\xa9\xf8\x1e\xbc\xd6\xba\x15:\xb7\x94\x82>\xd6\xe5\r?\xb1D\\?o\x8a\xa9?\xf5\xfc\x02?\xce\xab\x1a\xbb\x1b\xef\xa5?"\x0cp>\xad\xf3\x8d>w\xd6\x9a>\xb1%$?.\xcc\x13?\xc6\xa3\x11>\xae\x01\xf1\xbb\x05\xcd\x84?\x00\x85\x89?^#\xf4?\'<Z?9\xba\x87?\xd5\x0cM>\x12n\x0f\xbc\xad\x85\xbb=\x91\xeb3?M\x06*?\xc61\xa7;\tW\xca>\xc0\xab\xb9?a\xab7?\x0f\x08\x12?Y\xef\xe8?\x05k\x96>\xb5\x15\xb0?[JW>u\x8e\x16?\x06i\x8d\xbb\xd5,^?\xf3AY?\x01\x93\x05?\x90\x92[\xbc\x12\r\x11\xbb\xd9#~?\xaf\x02\t@\xde\x05\xb0?\xce<o?\xf9/v?\xa8\xc0\x0f?``p>\x1eU\xd8?\xed\x88\xc3??\xe4n>\xd49\x96<\xcah\xf0:\xc6\xb4\t?\x02\xd7\\>\xd1\xbe\x1e>\x8b\x8f\xa6>\xa1\xb5\x88?=\x9b:?+y\x85?\xb2\x00\xa3?e\xc3\x17?\xacn^?\x9e|\xb1?\xb6\n\n;\xe0\xf5T?\xdd8X>\x97&\x98?Q\xe1\xef<\x0e\x06\xee?M\xf4\xf5>\xd66\xa4\xbb\xa0\x0e\x89?|\x90S>,5\xaa>\x7f\x84\xcb?\x83\ts?\xad\xd2\n@>$\x89?\x93^v?\x1f\x97\xe9=\xdd\xe4H?\xe9 \\?\xe1\xa4\x18?r\xd9[?\x0b\xa5\xd2?\x16\x84\xe9;+\x81:?\xa6\t\xa7?6\xd9\x07?\xf8\x02\xfe>k\xfb\x89\xbcf\x0c\xcf>\x14\xebs?\xc2\xa5A?\x19\xc8\x1a?\xff\xd1\x03?\xe1y\xf7;\x97\xaeu?\xdbl\x0c?a^\xbf>\xd0\x03\xa7?;A\xce?\xc7:\xf5>\xe5\x83(?\x96"6?\xa0\xa6\x89?\xf3\xe6\xdd=\x9d_\xab?f_!?\x83\xeb1?y\xf7\r?\xb9\xe6\x86?\x19\x0c>?x \x19>\xfb\xa5\xa2?s(-?*\x8f\x08\xbcO#\xe8>\x0f\x01\xbc>5\xcf~>\x1c\xcb{;1r\x8a?Q\xed\x9c?z\xb8\x12<\xe2\xdf\xcc??fg?\xb9[Y?\xc4\xe4\x13@\xcd\xa4@;\x1ei\x82?J@\x1a?\xa9f]>m\x8aB?\x03yk?\x1a\x94A>\xf5\xdb\xcb?\x9b%\x13\xbc8\xc2L?zWY?w_\x9d\xbb\xe1_)>\x965\x81;\xf0\x05\xeb\xbbj\x1f\x17;/dA?g\x00y?/\xe6\xad;\x97\xce5?\' )?\xb8M\xa0?3#H?s.\xbd>\xbat\x02??J\xdd?e\xcb\x81?<\xfdQ?\xba\xcb`:;\x9e\xa5:\x9bj\xe4?=q\x91?\xdf\x81\x99?y)\xbe>0X\xd9\xbb\xd9P\x0c?i\xbf\x1a@v\x17\xa0>\x0c\xa0\xd3?\xa0(\t?v1\t?#s\xab?H\x93Y?\x82\x9c}?E\x004?\xc8T^?[\x12\xf4?s\xfa\x83?\xcfn&?\xab\xd2\xf4=\xc1A\x0b?\xaf&w?'
-p454
-tp455
-bsV459201976400883712
-p456
-g2
-(g3
-(I0
-tp457
-g5
-tp458
-Rp459
-(I1
-(I400
-tp460
-g12
-I00
-S'X\x9f\xc19\xdbn\xbc\xbf\x08\xd6\xc6\xbf\x9bN8\xbf $\xfa:f\xe8\x8d\xbfC\xef$\xbe\xa8\xe4\x8e\xbf\x94R\x90\xbe.\xf1\xb3:\xb9\xc1s\xbf<*\x00\xbe\x1a_\xeb\xbdH\x86p\xbf\xca\xfb\x81\xbf\xb1\xc4}\xb9\xdd\xa2\x13\xbf\xb2qQ\xbf\xdc\xd3\x9f\xbf\xb12B\xbf\rz\x89\xbf\xe4X\x1c\xbe8\xfc\xbc\xbc\x08\xdc\xb8\xbf\xafz.\xbf]\xafH\xbfN\xea\xcf;\x97\xcev\xbfA\xfd\x86\xbf\x0b\xf0\x87\xbe\x85"!\xbet\x13\xbd\xbeA\x86\xdc\xbe\xb2\xab\xab\xbf\x9b>A\xbfWw\xd8\xb9\xff\xedE;\xfb0Y\xbe\xd1\xa07;\x85\xe3\x1c\xbfd7\x82\xbfcf\x9b\xbf\xcbl\x05\xbfc\x1e\xca\xbe\xc2\xa7\x80\xbfzD\xd7\xbe\xde/\xd8\xbbb\xcc\xd1\xbe*xW\xbe\x00<\xcf\xb4\xd6Vd\xbe\xce\xd5\xad93u\x85\xbf\xec\xb8\x1e\xbea\xf5\x95\xbf>\xb9\x90\xbe\x06\xc2\xb5\xbc\x9c\xc5\xaa\xbf\xb0\xe6\xc2\xbf\xbf:\xba\xbf\xc6AK\xbe}\xa7\x00\xbem\xef\xa2\xbe\xd8\xc9\x13\xbf\xa0\x04Q\xbeu\xf3\x82;\xe9$\x9c\xbf\xfe\x15!;qk\xe2\xbfo\r\xc4\xbe\x14!\xe0\xbf4\xe8\xbd\xbf\xd5\x94]\xbf\xb0\x9e\x07\xbf\x18\x94V\xbf\x1fK\xfd\xbe\xdd\x99\xb2\xbe\xbb\xeb0\xbeD\xf5\xfe\xbe\x18\xb7\x0f<\xfdk\xb0\xbe\xd2K\xe4\xbd\x9b\x19\t\xbbm\xcf\x06\xbf\x9au+\xbe\x07b\x04\xbf\x9bt\xed\xbd\xf4\x1c\xcd\xbfZ\xfal9\xfd\xcc\x15\xbf\xf9\xf4\x9b\xbf\xaa\xd9\x849~\x1a\xa8\xbf\x94\x9f\x97\xbf>\x89\x94\xba\x11J\x18\xbf\xff\xaf\x82;,j\n;*\'\xf0\xbe\x16\x8f\x98\xbf\xdd\xabG\xbe|\xc6\x06\xb9\xfb\xee\xad\xbe\x8a\xfa\x7f:4O\x07\xbf,J\x96\xbf\xadh\xf8\xbe\xfc\xbe\xff\xbd1g#\xbf\x88A\r\xbe\x1c\xe5\xb0\xbf\xf1\x0b(\xbe\xc2\xc7\xa1\xbf@\x1b\xbf\xbe\r\xe9\xa2\xbe\xd8\x1c}\xbf#\x96\xa7\xbf\x00\xfc\xaa:\xc7}\xac\xbft\x99,\xbf\xde4\x06\xbb^X\xec:\xba\xde\xad\xbe\xbet\x82\xbe\x01\x82\xb3\xbd\x86\xc9\xf59i\\n\xbf\xb3s\x13\xbf\x009,\xbf:P\x00\xbf\xaf(\xb8\xbc~\xcau;H~~;\xc1\xd8L\xbe\xee\x1a\x1d\xbd\xaa\xae%\xbe\xf4\x00n\xbf\xd6\xc8+\xbe\xd4\xf9\x80\xbf\x8690\xbf\x03j!\xbfU^N;~\xa4s\xbf\xbeP\xc4\xbf\xe3\x0f\r\xbd\xf7\x89\x1f\xbf\xee\xe7\xcc\xbe\xd7\xeb\xb7;A\xa2]\xbf\xc6\xd5\xc5\xbe\x16,\x86\xbf\xc0S:\xbf\\\x15\xc7\xbe\xce\xc2*\xbf\xda\x88\xcf\xbe\xe7R\x85\xbd?+Q\xbf@\x8a\x88;0\xe5\x15\xbe\xf6/P\xbf\xb1Gn\xbfA\x17\x9d\xbf\xe1b\xd8\xbf\x98J\x9b\xbf\x9cx\x08\xbf@3\xe1\xbe\x999$\xc0;\xda\x99\xbe%\xad\xd0\xbf\x149\xf5\xbd\x93\x81\x88\xbd\xe2\'-\xbfO\xac5\xbf\x0b\xbf\xe2\xbaNU\xa8\xbe\x83n,\xbe\x18\xf5G\xbf\xb0B\x9a\xbfRi\xce\xbe]\xd4\x0e\xbf9\xf40\xbfC\xde)\xbf\x81\xbev\xbf\xb7\x01"\xbf\x13\xbd1\xbe\x0f\xbaS\xbf\x13\xff\xa1;:EG;\xb0\x88\x00\xbd\x9c\xe0N\xbfW \xcb\xbc\x97K\x14\xbct}}\xbe\x91\x81m\xbf\xd2\xe8\x8d\xba5\xcd\x98:\r\xb0\xa1\xbf_\x8c(\xbf@/\xcd\xbe\xf1\xb6\x89\xbe\xbb\x9a\xcd?\xf0\x83\x18?\xc8\x7f\x02:)%+=\x0bS\xb3?\xe2\'8=7\xc3\x00?\x9aR\xbd\xbb\x00\x96\xbc>\xbe\xbd\x8e?\xf0/\x0f?\xcc)k?M^\x16?\xfa^v=\xb2\x8b\x9d>+\x89\xba?cf\xcc>\x16-6?\x88\xe5\x93>\x12\x05\x16>\xfc_3=\x0e\xa1->gUX?\xbe1l=/h\x9e>\ty\x9a=\xd5\xdb\xaf?.;\xad=\xc2vE>#UP?k\xa9|?LR\xad>\x1b\xe7\xac>8\xa0\x96\xbb\xe8S\x9f>\xe3\xf5x?\xd7\xc1\xb7?\x1e|Z?W\x84\xca?\xd6|\xc9>\x0fX2\xbb\xe4\x0cy>=\x05Y?4\x14\xd4>x\x0c\xd4\xbb\xcb\xfc\xa1>\xcca\xc8?U\xb8r>\x7fc\xe2>\x04\xa0\xb8?^u\xf3>Z`\xd1?\xd5\xd9\x07>\xe7}k?s\x01e;d\xf5\x8a?\xa0\xbb\'?:\x9a\x14?\xa8\x9d\xb08\xb0\x07\x18\xbb.\xeef?-`\xa2?\x86J\xf9>\xa4\x8a!>\xb4=\x0f?e\x92\x96?\x87b\xb0>\xa4\x8d\xbe?v:M>!\xff!?\xb1\xf8\xa9;\xf7\xef\x12;}\x84\x94?\x18FE?\x1fx\x89<\xca2"?\x98\xd6\xca?YG\x11?w\xb27?\\\xf1f?\xf5\xad=?\xbc\xb5\xfa>\x8ai\xa3?\xfb\xd3\x08;\x96\x9c8?\xa4\xc6}>\x02\xbf\x86?<\x05\xb2\xba\r\xb9\xe8?\x96G;?\x0b\xc3\'=\x95\xd4\x94?\xd5\x90\xcf:\xbb\xdf\x88?\xd1\xe6\xe6?\x93H\xf4>\xc8\xb4\xa5?\x1a\x80\x96?\xda\x10\x9c?x\xbf`=\x91\xb8\x0b?\x1f\xef\x86?W(\x01?\x85\x07\x11?\x82l=?\xf3\x1a\xf2\xbb\xf3\xcb\xd8>\x1bE\x9d?\xa0oB>\xec\x9f\xca>Z\xddx>\x18[\xda>\x7f;\x86?\x8a<\x82?3\x17\xaa>\xb2o\x8b?D\x13\x8d\xbb\x04\xe9I?]QM=\xa6\xcb#?\xdf\x8f\xc4?|\xbbl?\x1a\x98\x84>\'\xb6\n?\xed\xcd%?\xccG\xbb?Q\xc7\xbb\xbb\xc2\x95\x7f?\xcf{\xde=\x9f\xa6\x1f?\x9f\xf8t?\xb2\xbe\xcf?\xd8\x835?\x9c\xdb\x8b>c\tn?}\x93\xd2?i\xd2\x06?\xdd"F?\xd4w\x8f>\xf2l\x9d>\xc9\xf4\xd4=\xe2\xaa\xa3?\x96\x9a\n??u\xee\xba\x9d\xbc\xb3?p\x02\x99>\x99\xcbi?\xb0\x91\xc6?\xc7\xd0\x13=\xd8\xce ?\xcf.T?^\x9en=u\xa0V?n\xcf\x8b?\xf3\xd9\xe9=}\x15\xc0?\x7f\x86T:\xd9\x05"?\x9b\xa2\xa7>1\xd5\x96;rY@?\xda6\xab>\xd2\xda\xc7\xbb\x16\xb5\xaa\xbbf9\x03?<\x83\xc1>%\xc9\xe2\xbb>v8?o\x9c\xa2?\x13_\x1f?Wu\xfb>6\xab\xb1<\xc1\xd0h?\xa1\x9f\x18@\x0e\xb9\x95?\xab\xdf\xf3>\x8a\x87\x8f;\xb2\x13\x06;i1\xf2?!\x9fa?\x88\xce\xc6?\xb9\xd9\x98?\xad\xd6\xb9\xb8\xdf0\n?\xb8\x9a\xb9?-\xd4\xc5<\x07b\x97?\xcd/6?\\\xd1\xaa?HKm?\xdaU=?\xed?Z?\x1bx=?j\xc3\x85?\x11\xc5\x85?\'\xde\x87?b\xc2\xa4>\x9af\r>\xda@\xda=\x17\xc5-?'
-p461
-tp462
-bsV476609289822302208
-p463
-g2
-(g3
-(I0
-tp464
-g5
-tp465
-Rp466
-(I1
-(I400
-tp467
-g12
-I00
-S'm#\xe2;T\x14.\xbe\xc7L\xa5\xbf\x89\x84U\xbfww\x1b;\x8a\xa2\x18\xbf\xb6\x8f\xd4\xbd\xa8\xe4\x8e\xbf\xc3\x84<\xbfZ\x0c\xfe9\xbcM\xa5\xbe\xf1\xf3\xc1\xbd\xd7\x834\xbd\xa2*|\xbe\xe9 .\xbf\xa1\xaf\xa8:W\xa4\xe8\xbe\xf1{\x8a\xbe8X\xbf\xbf\xf5\x81\x95\xbf\x84Xt\xbe\x958\x1f;\x1ba\xb4\xbe\xd9R\x03\xbe\xe6\xe44\xbc\xf6\x04V\xbf\xf8[\x937\xb0\xc9?\xbf|\xe0\x16\xbf\x1e;0\xbf\xde\xc6\x8c\xbe\xc0\xa2U\xbe\xed\x00\xc5\xbe\x85:\xb0\xbf\x7f3\x02\xbe\xe9\xa2,\xbe\xd0\x0e\xe4;\xa3\x17\xbf;\xd5\xc5F;\xd2r8\xbfiSi\xbf\xbf\xe1\xb8\xbfi\n%;\x1d+\xcc\xbe\xb5\xa5~\xbe\x9bi\t\xbfk\xb3\x12;b\xcc\xd1\xbeg\x8d<\xbe\xb9\xf3\xe5;A\x88\x01\xbf\xeb\xb1\x9c:\xfc\x05"\xbfb\x83\xb8\xbb\x0ba\xd9\xbf>\xb9\x90\xbe\x89\x98V\xbd\xd2\x93\xa4\xbe\xf9\x97/\xc0H\xb7\xc1\xbf\xc6AK\xbeREX;G\xc1n;\xdd\xf6\xd2\xbdL\xe2\x85\xbd \x89\xd2\xbe\x80i\xb6\xbf\xd33$<\xddG\xec\xbd\xf4(\xe8\xbeT\xca\x9a\xbf\\\x1d\x03\xbfS\xaf\xd6\xbe\xe9>\xc4\xbe\xc2\x17\xe1\xbe\xdd\x06~\xbf<\x8bM\xbfU\x8eH:\xbdaZ\xbefE\x81\xbby\xc0S\xbe\xa9>\x99\xbe\x1b#\x8f\xbbt\x0b2\xbfw\xd2[;\x0c_\x9c\xbc\xbcN\xdc;\xc8? \xbf\xa1\xd5\x97\xb9\xbe\x10\x1d\xbfcL\xc4\xbf\x96\x90\xa4\xbb^v\xdc\xbf\x94/)\xbfc\xf9\x96;\xa3\xd4^\xbb\xf9\xbc\x92\xbbB\xe0\x89;\x1c\xcc\x1b\xbe\xfd\x18\xb9\xbf\xcc\xef(\xbe\xf7u\xb0\xba\x03\n`\xbb\x06\xadQ\xba\xa7`>\xbd\xcc<\x1f\xbf\xb1n\x19;\x1e\xb3c:\x0e\xe9\x1a\xbf\xa2\x0e\xa8\xbd\xd2L\x13\xc0 \x10\xe7\xbe\x0b`\x82;\x03O\xd0\xbd\xd4\t\xd1\xbe4\xf6\xde\xbe\x07Aj\xbf\xad\x17\xb7;_>|\xbeE\xf3\xda\xbe4\x96\x97\xbb\x87M\x1d;\x11ND\xbd\x00C\xf2\xbcE\x16\x19\xbd\xe2\x11\x9b\xbb\x9aa\x84\xbf\xe2\x92\xd0\xbd\xce\x11\xb8:\\S\xe3\xbe\x1a\xcb\xd3\xbdp\xe6\xce:\x19\xa5\xbb\xbc\x08\x82\xbc\xbeeLd\xbd\xf4t\x1e\xbe\xb9g2\xbf\x1e\xb7\xb4\xbd\xd3\x97\xbe\xbf\xed\xca5\xbf\t:\xf7\xbeUV\xff\xbc\x89\xe1\x9f;\xbfK\x8a\xbf\xdd??\xba&\xdc~\xbd\xee\xe7\xcc\xbe(\xd8\xd3\xbb\xce1\x1a\xbfa\x0e\xc1\xbc\xe8J\xe2\xbd\x1d\xd8Q\xbe\xe3_\xba\xbb\xce\xc2*\xbf\xae|b\xbe{\xdb\xa1\xbb\xc6\x9b\xed\xbeY\xec\xcc\xba\xb5\xcf\xac\xba\x12\x1bj\xbf \xe3\xd8\xbf\xa0\xd8A\xbf\x85\xdd\x95\xbf\x1b\x9bZ\xbf\xeeU7\xbc7\x04\xde\xbe\x9a\xe3\x8d\xbf\x01\xc6\xd9\xbd\xc3\xbbK\xbc23[\xbd\xb9\x08\x8d\xbdAl\xd6\xbdC\xf9&\xbf\x97\xbd\x9f:\xb7\xbc\xf6\xba/\xbd\xe3\xbc\xbe\xe8S\xbfl\x93\xe8\xbf\xb6\xa9\xd2;\n\x15(\xbaS\xb9q\xbb\x03\x96U\xbe\xafj\x19\xbfb#\xeb\xbe\x168@\xbb\xa7\xb1\x15\xbf \xaf\x18\xbb\x01\x8c\x93\xbd\xb0\x88\x00\xbd\x18\x1c\xda\xbd\xfb\xd2\x05;\x15\xe8D;t}}\xbef\xa5\x1a\xb9E\xfa*;\x0b}\x8e\xbbr\x90\x98\xbf4\x10\xc5\xbd@/\xcd\xbe\xdeg\xb8; G\x14@%\xed\x87?\xe7]\x93:\x88\xaa%<\x0bS\xb3?o\xe40?\x18.\x8c?r\xac.\xbb[\xc7\xb7=*\xe3\xc9?\xf6\xf0\x19>\xe0m^?0a\x1f?\x03\x91\xb2>h$+=*\xf3\xc7?<\x85\xde\xba\xd2\xeaV>i\x80\xc0\xbb\xdc"k\xbbS\x04\x99>\xd6\xe5\r?\x06\x8f^?\xa8\xa2{?\xb4\xa9\xcf>!\x03N\xba\xb6\xf6M?lf\x9a\xb8\xc2vE>\x03\x0bg>xc\x81>.\xcc\x13?L\rq>A\x88A:9\x9d\x00?\xd8\x07\x07?K\xdb\xd9?\xc6\xb2X?}g\x84?%\xcc\x1f=\xd7\xdb\xd69\xb2\x0e\xbd\xbb\x91\xeb3?\x9f\x12\x88:\xf1\xd4\xc9<%\x0e\xa9=\xb9\xf1\xfe?\x98\xf7\x11>kZ\xfe<~L\x15@\x05k\x96>F\xaa\xa8?A>\xed:\xe7}k?\xf6\xed\xb7\xbb\xf1D\x00>AW\xd2>\xe6\xbfz>\xf2\xe5\x05\xbcb&D\xbaN\xe7\t?\xc2\xee\x05@\xca[\xa0?\x84\x07\xa8>\xf9/v?(z\xda=\xfa\xfd\xc69\xe0\x03\x17@\xb7\xe51??\xe4n>l\xcex\xba\x15\xa2m;\xc6\xb4\t?\x02\xd7\\>\x1fx\x89<\x95Hx=\xea\xbf\xc2>G\xc2G?\xc4\xcf\xe1>\xb2\x00\xa3?\x0b\xd3!>\x8b@\x9c>\xe4\xe6\x96?,Y\x81;\xf9/O?g\x80\xab>\x1e)\x9e?;\xf6\xd4;\r\xb9\xe8?\xd2\x86\x87<\x96\xd9\n\xbbh\x13=?\x06\xb3\x01\xbc\x06\x8f\x17>\x14+\xbd?\x83\ts?\xda\xd1\xa4?\x1a\x80\x96?\xf9>\x05?\x0b\xd7\xca\xbb\xdd\xe4H?\xc2iA?"\xfc\x08?\xa1\xb9\x05?\xaff\xb2>\xbf2\x0c<\xedlQ?He\xad?`\xf3\x10=\xf8\x02\xfe>\x83\xd4\xbe\xbbn\xaf!>\x87\x1d+?\x9f\xbb\xa7>\xe3H\xde>\x92\x94\xe0<\xc2q@;\x97\xaeu?\x94(\xc4>a^\xbf>\x16\x8f\x99?\xa2\xf7\x98?\x1a\x98\x84>\xe5\x83(?\x96"6?o\xba1?\x84\x1b?\xbb\xc2\x95\x7f?7m\x93>\x1d\x7fd=e\xdc\x1b?\xf6\xce6?\x19\x0c>?x \x19>\xfb\xa5\xa2?\x1d/\xa5>@T\xcd9\x82\xb4\xd7>\x0f\x01\xbc>\xb6_\x01={\xfb\xc0:\xcd\x07%?k\xf2\x8d?e\xb3[;b@\xa3?`\x9a0?{\x10\xa4=\x19\x83\xbd?\x99\x14n:\xdb_\xe7>\x03\x91\x0e?^\x9en=3\x80\xd8>\xa2R\xcd=\'n8>\x9c\xe4\xb3?\x1a}\xd8\xb9\xd5\xa9<?\x9b\xa2\xa7>\xcd\xee\x1f;\x0b7\x0e<\x83\x83C;W\x90\x0f;b\xca\xd4;\xde\xc3r?<\x83\xc1>\xed\xa6\x99;\xb6\x88@?p.\r?\x9e?\x8e>H\xb7\x12?\xa1\x7f\x19>\xbat\x02?\xba\xf0\xf5?\x92\x97,?\x86\xb3\x01?\x13\x82\xc8:\xaa\xd8\x8e\xbbi1\xf2?(\xe6b?{\x07\x91?[\xce\'>"?\x90:\xd9P\x0c?/\xf4\x83?\xae\xd4\xff=\x07b\x97?D\xcc\xaa>\xdb\x16M>\xa89\xeb>\xfe\x7f`?\xed?Z?\xfd\x95\xc1>\x8a\xe8\x16?\xe0?\xf8?\xcc\xbe]?\x84\xfd\x14=\xbf\xfb\x8a>\x86\xf09>\xf6\xfcB?'
-p468
-tp469
-bsV474113722294616064
-p470
-g2
-(g3
-(I0
-tp471
-g5
-tp472
-Rp473
-(I1
-(I400
-tp474
-g31
-I00
-S'G\x1b\x03>%\x1d\x07\xbc\xe4f\t\xbe\x88\xaa%<\xac2\xbf=0#/\xbc\xeb[\xc3\xbc\xcc\xfe\xb1\xbd%T\xae\xbc\xf7\xf3\xbf=\xac6V;=A\t\xbd\xc6\x9a*=\xea*$<\x1a\xcf\x0c\xbd\x1cx\r>Kw\x01\xbdU\x16-\xbd\xd5\xbbe\xbdTg\xc6\xbc9J\xb5\xbd\x8f\x0c\xec;r\xfaA=qk=\xbd\xe6\xe44\xbc\x08\xcc(\xbd9\x9a\x9d=\xf3f\x88\xbdEc\xe1\xbd\x8c\xe6\xfe:\xe7\x16?\xbd\xfa\x0f"\xbd\t]\x16=\xa7\x9d\x01\xbeh\x84\x9c<"\x9f\x04>\xde\xb9i=\xff\x9fB=H\xe9\xf5=%\xcc\x1f=\x9a\xe75\xbd\xe5I\xc2\xbc\xd5ou=\xd0U\x98\xbd\xfc\xe3\x8d\xbd<d\x8c\xbc\x83\xe7\x0f>\x83\x0c\x14=\x84\x01\xaf<H\xe6,>\xe2\xfb\n\xbc3\xb3\x17>yTv\xbdb\x83\xb8\xbb,\x0e*\xbeYI\x8a=T\x80\xbc\xbb\x0fh\x1b\xbd\xa6\xa8J\xbe:\x08#\xbeG\xd2\x94=\t~\xb0=\xa4\xd0\xee< \x1e\xb8\xbd\xe1f\x0b\xbc\x8a%\x9a=\xa42\xb5\xbdK&\xb5=F\x08\\\xbdN\xf7\x85\xbd\xbf<?\xbe\xf3\xba\xf9\xbd\xa7\x95\xb2\xbc\x8f\xeb5\xbd\tSW\xbd\x95Hx=u\xb6\x93=2\xfbz=r<\x95=\x8a\x8f\xa2=(Z\x8f\xbc\xb1\xd6,<\x8dy\x02>\x0e\x85\xb7\xbdn\xffs=b/\x19=\xbc-\x98=\x89W\xfa\xbd\xadR?>\xd2\x86\x87<3D\x8f\xbd\xa5 [=\xd8#\x99\xbd\xf43p\xbc\xc8\x10\xe6=\xa3\xd4^\xbb5\xc4\xc4=O\x8b\xcc=\xee\xdd\x93=\xcc5\x19\xbd\xd7\xd3\x03<\x89\x90\xd9=8GO=\x93\xc5\x83=\x9a\xe9B>\x00\x1b\xdd\xbd\xb1n\x19;\xad\xcf[=`\xf3\x10=]\x8f\x00;\xd0\xe4\x9e\xbd7\x87\x91=w2j=\x86\x9a\x96=V3\xb0<\x92\x94\xe0<\xb6+\t\xbe\xb7/\xcd=8\xa51<A\xfe\xbc<x\x94;>m!I=h\x96\x1c\xbc\x00C\xf2\xbc\x81"\x11\xbd\x8b\xb8\xb2=\xc5\xb8C\xbd\xc9\x96\xab;\xc2l\xae<\x1d\x7fd=\xbc\xe3k\xbb~0\x19=\xd9S\x05=6\xd6\xab;\x8dI\x83;HQ\x08=i\xbf\xee\xbc\x98Z\xe5\xba4\xf4\xf4\xbc\xb6_\x01=\xee6\x9b\xbdo>\xf4=)\xda\xbf<<Q\xec\xbdY\x99\xff=9z\x8c<\xe5S\x85=\xedo$>\xcd\x0b\x7f\xbdJ\xe3-<\x95\xdc\xe1\xbc\x145\x89\xbd\xd9\x96\xdf=\xa2R\xcd=\xfa\xad!\xbc\xa2-\x04>tnx\xbd\xe7\xb1U=P;\xf4<\xd4%\xe8\xbd\x0b7\x0e<-\xb3\xc3\xbd4\t\x1e\xbe\xff\xd4\xb9\xbd\xeeU7\xbcb\xa7\xb9\xbc\xb5O\x1c\xbe}\x04\xea=\xc3\xbbK\xbc\x96S-\xbd-M\xa7\xbbAl\xd6\xbd\xf4\xaf\x12\xbd\'\xc16>\x11\xd7c<\xe3\x17\x8d<\xe7L\x15\xbe\x0e\xc5\x10\xbemW\x81<\x8c\xaeG=\xc6\x1e\xf6=\xce\xb0\xdd<\xa5\x03\xaa\xbd\x859\n\xbdSf\r>e\xf189\xd6\xbfx=\x951\xb1<\xca-\xe3=t\xeb\x97\xbd\xc1\xc4\x96=\xb6M\xad;\xb4#E=\xac\xf6\xa2=\xa7\xb0(>\x8a\x91\x10>\x84\xfd\x14=\x81\xea\xbe<D|6=\xa5\xba\x97<G\x1b\x03>%\x1d\x07\xbc\xe4f\t\xbe\x88\xaa%<\xac2\xbf=0#/\xbc\xeb[\xc3\xbc\xcc\xfe\xb1\xbd%T\xae\xbc\xf7\xf3\xbf=\xac6V;=A\t\xbd\xc6\x9a*=\xea*$<\x1a\xcf\x0c\xbd\x1cx\r>Kw\x01\xbdU\x16-\xbd\xd5\xbbe\xbdTg\xc6\xbc9J\xb5\xbd\x8f\x0c\xec;r\xfaA=qk=\xbd\xe6\xe44\xbc\x08\xcc(\xbd9\x9a\x9d=\xf3f\x88\xbdEc\xe1\xbd\x8c\xe6\xfe:\xe7\x16?\xbd\xfa\x0f"\xbd\t]\x16=\xa7\x9d\x01\xbeh\x84\x9c<"\x9f\x04>\xde\xb9i=\xff\x9fB=H\xe9\xf5=%\xcc\x1f=\x9a\xe75\xbd\xe5I\xc2\xbc\xd5ou=\xd0U\x98\xbd\xfc\xe3\x8d\xbd<d\x8c\xbc\x83\xe7\x0f>\x83\x0c\x14=\x84\x01\xaf<H\xe6,>\xe2\xfb\n\xbc3\xb3\x17>yTv\xbdb\x83\xb8\xbb,\x0e*\xbeYI\x8a=T\x80\xbc\xbb\x0fh\x1b\xbd\xa6\xa8J\xbe:\x08#\xbeG\xd2\x94=\t~\xb0=\xa4\xd0\xee< \x1e\xb8\xbd\xe1f\x0b\xbc\x8a%\x9a=\xa42\xb5\xbdK&\xb5=F\x08\\\xbdN\xf7\x85\xbd\xbf<?\xbe\xf3\xba\xf9\xbd\xa7\x95\xb2\xbc\x8f\xeb5\xbd\tSW\xbd\x95Hx=u\xb6\x93=2\xfbz=r<\x95=\x8a\x8f\xa2=(Z\x8f\xbc\xb1\xd6,<\x8dy\x02>\x0e\x85\xb7\xbdn\xffs=b/\x19=\xbc-\x98=\x89W\xfa\xbd\xadR?>\xd2\x86\x87<3D\x8f\xbd\xa5 [=\xd8#\x99\xbd\xf43p\xbc\xc8\x10\xe6=\xa3\xd4^\xbb5\xc4\xc4=O\x8b\xcc=\xee\xdd\x93=\xcc5\x19\xbd\xd7\xd3\x03<\x89\x90\xd9=8GO=\x93\xc5\x83=\x9a\xe9B>\x00\x1b\xdd\xbd\xb1n\x19;\xad\xcf[=`\xf3\x10=]\x8f\x00;\xd0\xe4\x9e\xbd7\x87\x91=w2j=\x86\x9a\x96=V3\xb0<\x92\x94\xe0<\xb6+\t\xbe\xb7/\xcd=8\xa51<A\xfe\xbc<x\x94;>m!I=h\x96\x1c\xbc\x00C\xf2\xbc\x81"\x11\xbd\x8b\xb8\xb2=\xc5\xb8C\xbd\xc9\x96\xab;\xc2l\xae<\x1d\x7fd=\xbc\xe3k\xbb~0\x19=\xd9S\x05=6\xd6\xab;\x8dI\x83;HQ\x08=i\xbf\xee\xbc\x98Z\xe5\xba4\xf4\xf4\xbc\xb6_\x01=\xee6\x9b\xbdo>\xf4=)\xda\xbf<<Q\xec\xbdY\x99\xff=9z\x8c<\xe5S\x85=\xedo$>\xcd\x0b\x7f\xbdJ\xe3-<\x95\xdc\xe1\xbc\x145\x89\xbd\xd9\x96\xdf=\xa2R\xcd=\xfa\xad!\xbc\xa2-\x04>tnx\xbd\xe7\xb1U=P;\xf4<\xd4%\xe8\xbd\x0b7\x0e<-\xb3\xc3\xbd4\t\x1e\xbe\xff\xd4\xb9\xbd\xeeU7\xbcb\xa7\xb9\xbc\xb5O\x1c\xbe}\x04\xea=\xc3\xbbK\xbc\x96S-\xbd-M\xa7\xbbAl\xd6\xbd\xf4\xaf\x12\xbd\'\xc16>\x11\xd7c<\xe3\x17\x8d<\xe7L\x15\xbe\x0e\xc5\x10\xbemW\x81<\x8c\xaeG=\xc6\x1e\xf6=\xce\xb0\xdd<\xa5\x03\xaa\xbd\x859\n\xbdSf\r>e\xf189\xd6\xbfx=\x951\xb1<\xca-\xe3=t\xeb\x97\xbd\xc1\xc4\x96=\xb6M\xad;\xb4#E=\xac\xf6\xa2=\xa7\xb0(>\x8a\x91\x10>\x84\xfd\x14=\x81\xea\xbe<D|6=\xa5\xba\x97<'
-p475
-tp476
-bsV474175914482216960
-p477
-g2
-(g3
-(I0
-tp478
-g5
-tp479
-Rp480
-(I1
-(I400
-tp481
-g12
-I00
-S'"}m;\xf8\xc7\xe4\xbd\xb0\xd7\xae\xbf6g\xb3\xbf\xdaQf;\x8a\xa2\x18\xbf\xc7B\x8b\xbd\xc9\x01\xad\xbf\x96\xe1\x11\xbf\xf3\xcfu\xbd\xc4O\x12\xbf\x9b\xd5\xa1\xbe\xbe\x17\xc7\xbe\x80\xc2U\xbf\x9f7\x07\xbfzc2;G\xfd#\xbf\xd8L\xd1\xbe\xdc\xd3\x9f\xbfz\xbf\x8d\xbf\xc7\x13\x02\xbf$\x9e\xd5\xbcy\xba\x98\xbb\x0f\x0f\xf0\xbe\n(\x9f\xbdG-\x8b\xbf\xda%f:\xb0\xc9?\xbf\x9d\xd7B\xbf\x94^>\xbf;\x08I\xbf\xc8{\x8f\xbe\xefU4\xbf\x18\xf1\xb9\xbf\xec(\x1d\xbf(\xff\\;\xaa)G;\x88\x80\xc8:\x04\xe2\xd5;\xe3I7\xbf\x9b\x9e\xae\xbf\xb1i\xcc\xbf\xbd\x81~\xbe\xfa\xdd\xa7\xbe\x8eM\x8c\xbf#\xb40\xbf\xf0;\xd1;\xe2\xce\xde\xbeg\x8d<\xbe\x9d\xea\xea;\xe2t\x84\xbe\x98~\xbc;\xfc\xdb\x89\xbf\x1a\xb2\x9d\xbc\xa2\xc8\xaa\xbf5\xe4\xd7\xbeq\x18\x95\xbe\x1a\xbf\xe3\xbe\x9cS\xfa\xbf\xbf:\xba\xbf\xee}\xb2\xbeM\xd4\x99;J\x05\xf8\xbcW\x98\x90\xbe\xafZ\xad\xbd\xbb\xb7\xb8\xbe3P\x8d\xbfK\x88";\x88\x18\xd9\xbe8\x8c%\xbf\xcb\xde\xac\xbf\xe2v\x86\xbf\xc8\x80o\xbf\x141\x08\xbf\x98xr\xbf\x9c\x1dq\xbf\xdd\x99\xb2\xbe\xbd`e:\xa0Eb\xbd\xde\x84\x90:\x8eP\xc9\xbe\x909\xe5\xbe\xc5e-<\xe6\xb1\x83\xbf\n\x97M\xbc\xbbP\xe4\xbe\xb7p!;\x0b\xe3!\xbf\xd4j\xb5;jEM\xbf#\x1b\xa4\xbf\xc8\x01\xe5\xba\x08?\xb9\xbf\xdd\xf3\x98\xbf\xb3r\xce;|k\t\xbdI\x81u;_\x96\x1f;z\xf7\x8a\xbe\x16\x8f\x98\xbf\x18\x9e\xda\xbef\xf1.;\\\xca\xd3:\xc3t\x13;XO\\\xbf\xb5\xcar\xbf\xc0\xe0\x13\xbe&\xa9H\xbc\xf1\xb9\x17\xbf\x9c(\xbf\xbe\x90f\xd9\xbfI\xa2\x9b\xbf!V\x99\xbe8r\xb8\xbd\r\xe9\xa2\xbe\xd0\xf1f\xbe\x12\xf6\x8e\xbfy\x9f\x9e:\x82\xa1$\xbf\x959\xd8\xbep]\x16<\xbf\xe0\xe496G\x9a\xbe\xeb\xa7\x80\xbd\xd9\x8d\xee\xbd \x96J;\xde\x85\x95\xbf\x02WH\xbd\xff\x8f\xa5\xbd1\x19=\xbf\xb1V\xe4\xbd(\xa9u\xbb\xbe"\x849r\xaf\xe1\xbe\xc8Dq\xbd\xfc\xf6\x07\xbf-\xdb \xbf\xe2\xc3\xda\xbe\xb6\xc1\xac\xbfX\xb7\\\xbf\xa9VQ\xbf!\xb5\x13\xbf<5\xf8:\xce}\xad\xbf\x1a7);\x99Wh\xbe+\xc3 \xbf\x1a\xfd\x9a;\xa2\x8e0\xbf\xca\xd6\xd1\xbe\x0c\xaa\x1f\xbf\x99y\xa1\xbe\xcf\x08t\xbc\xce\xc2*\xbf\xd8\xa7\xd4\xbe\x9a7\x86;Q\x9fp\xbfI\x12\\\xba\xf7p$\xbaI\xd5:\xbf\xffy\xb2\xbf\xec\xea\x98\xbf\x99[\xcb\xbf\x02\x82\xa8\xbf8[z\xbd\xfe,\x8d\xbeS\xa2\x12\xc0R\x8fv;\x19\xfa\xf0\xbdb\x9e\xcc\xbe\xf2\xe1\x13\xbe\x9fnY\xbf9-v\xbf\x9a\xe2?<\xd4\xf1\xd79\xd9\xa6K\xbd\x1f@O\xbf\xc5\xd4\xbc\xbf\x8f\xeeF\xbd\xe8\xcb\x9e\xba\x01#\x86;\x03\x96U\xbe3\x95+\xbf\x0caK\xbf\x8bPT;\x9e\x81\x8c\xbf\x81\x87\xd8:\xfe\xeej:%\x19\x16\xbf\xc2\x06\xa9\xbe\xcc\xfbM;\xb5\xda\x8f\xbcpM\xbc\xbe\x9f\x9d\x0c\xbf}7\xc8;\xaa\xfa\xd7;mE\x98\xbf\xe2\x95d\xbe@/\xcd\xbe\xb8\xd7A\xbf~N\xd7?0D\x0c?j\xfe\xc4\xbbz\x0e3=\x0bS\xb3?M\x00\x86>(\xa2/?\xd3\x89T\xbb\x9e\xc4\x1f?\x84\xc9\x86?\xf6\xf0\x19>\xe0m^?\x973\xd3>k\xfe\xfb>v7V>+\x89\xba?uK\xb5<\x057\xaa>p\x82}:\xa43\xc5<\xdb\x03\'>V\x02\t?gUX?\x16\x91Q?\xb2\x8e\xa5>\xc7\x93$\xbb\x1b\xef\xa5?\xbb3n\xbb\xc2vE>e\xa7\x00?\xccJ\xd2>e\xf5\xe2>\xf3f\x04>T\xac\xaf\xbb\x07O\xed>\xe0\xceW?$\xfd\xd3?\'<Z?\x19\xa4\xb6?\xb6\x9e4>\xbc]\xb5<\xb4\xcf\x14=N\tT?\xb0{\xbb>\xf0\x85\x9c>\x8f\xb9\xab<SC\xa1?n\xf76?[\xb6\xa2>0\\\xcf?+\n\xb7>\xb5\x15\xb0?\xa2>z=\xe7}k?^o\x08\xbcp\xee\xe5>\xf3AY?\xfaV\xa8>r\xbd\x0c\xbctI\xe3\xbb\xd9#~?\x06\x97\xda?\x97\xa4\xbd?\xce<o?\xc9\xdbq?p\x8c\xb5>\xfd=\x04<>\xc7\xca?\xf4i\x87?\xe5\x95\xb4=\x8a\xd4\xd2\xbbm\xa3\xb6\xbb\xab\rx>,\xad\xb4>v\xdd\xa1>\xce\x01\xad>:\x00\xd5>\xbdC\xf5>\x01\x1es?+\x92g?e\xc3\x17?\x8b@\x9c>\nE\x80?`\xd4L\xbb\xc8\xed@?T&\xf2>\x02\xbf\x86?\xec\xdd\x9c=\r\xb9\xe8?m\x8b\xfc=AV\x85\xbb\x1e%R?&\xee%\xbb\x16\xf0\xe7=\xea\xdc\xc3?\x8a\xe9,?\xb9\x1c\xd4?\x1a\x80\x96?L;R?A!C=Y\xf76?\xe9 \\?=\x00\xdb>\xd2\xffD?\xbb\xd9\x9e?K/G\xbb+\x81:?\xa8a\x94?@\x87\xe9=\x1cF\x18?3\x81\x1f=\x88\x8c\x11?\x9e\xd5z?\xc2\xa5A?\xa5a\x18?*\x14\r?\xdaG=\xbb\xbf\xcab?\xa7G\n?EW\x08?\x16\x8f\x99?\xc5Y\xa0?\x1a\x98\x84>\xac\xbc=?\xed\xcd%?\xe7\x8eZ?\xfcl\n\xba\xc2\x95\x7f?\xa5\xe5\xff>\x04\xbd\x89?e\xdc\x1b?\x86\xbce?5O\x8c?G\xb1e>c\tn?s(-?\xef\x83\x8d=\x82\xb4\xd7>x\xf5\xd9=\x1fG\xa1=\x90\xa7\x90\xbb1r\x8a?Q\xed\x9c?-\xf6\x0b\xbb\x06c\xaa?in;?2#\xd9>\xdc\xa1\xe7?x\xc3\xdc=\x81\x9aQ?\x10\xd5>?^\x9en=\xe4(\x0c?c\x8e\xc4>\xe9\xf4\xd8>\xf5\xdb\xcb?\x03\x7f\x96\xbbro\x7f?\xd2\xe5\x03?\xe9\xa0\xe1\xbb\x11\x86F>\x83\x83C;S\xff\xea\xbb\x82\xb4L\xbaf9\x03?+~ ?\x8c\x8d\xfa\xbb\xb0t\x0e?\' )?\xb8M\xa0?3#H?s.\xbd>3\xd5(>?J\xdd?e\xcb\x81?\x88GI?z\xb8\x1b\xbc2D\x17\xbbi1\xf2?Mw$?#-\x80?\x96q\x98>\xc4\xfa\x06\xbb\xb3\xeb`?99\xf9?\xe6\x15\xae>\x07b\x97?\xa0(\t?\xcbJ\x02?#s\xab?\xcex\x86?\xed?Z?g\xe7\xa6>\xe7\x8dH?T5\xcd?*\xf8\x80?\x89\x88\x10>~xH>~\x0b(>\x8b7\'?'
-p482
-tp483
-bsV445262369313542144
-p484
-g2
-(g3
-(I0
-tp485
-g5
-tp486
-Rp487
-(I1
-(I400
-tp488
-g12
-I00
-S'*\x856;T\xd1\x1f\xbf\xff\x82q\xbfY\x81\x18\xbf\xc2A\xb6;\x84U\xcc\xbe\x9b\x10F\xbdKq`\xbf\xf3\xef\xc0\xbeRc>;\xbcM\xa5\xbe\xc6\xc0\xda\xbc\xaa\xf2\xa2\xbe\xa2*|\xbe1t\xbc\xbe\x05l\xa8;K\x03\xc3\xbe\xf1{\x8a\xbe\xf8\xe5l\xbf=9>\xbf\x8dH\x13\xbf\x92\xc5\xb2\xbe\xdb\xed\x0b\xbbihG\xbfu6C\xbd\xe4^\x13\xbf}]\x85;]\xd5J\xbf\xf5\xc7\xd6\xbe\xf4\xc0\xe4\xbe:\xb74\xbf\xd8#\x14\xbf\x8e{\xb5\xbeU\x98\x85\xbf\xa9\xa0|\xbe>Q\x9c;\xb8\x16\xcf\xb8\x90\xd3_;*P\xc0;\xa5\xf5\xf5\xbe\x06\x9a\x89\xbfn\xf9h\xbfg\xc1o\xbe\xedy\x00\xbf\x8b\xe4{\xbf\xa4_\xab\xbeK\x17\xa7;x&\xc4\xbd\xe6[\xc6\xbd.\xef\x19<\xa0\x9f0\xbeI\xdf&<\x1e\xfa\xf6\xbe\xd8&\x00\xbc\xfb\xf2\x93\xbf\x04^\x19\xbe$R\x89\xbe \xa6\x84\xbf\x12E\xd8\xbf\x8d\xd6\x93\xbf\x0en\x1f\xbf\x02\x8d\x15\xbe\xe3\xa7\xf1\xbcOhA\xbf\xb3\xb5\xe7\xbd\x12}\xd2\xbd\xf7\xabq\xbfN4\xa2\xba\x17\x02\x01\xbf\x7f;*\xbf\xf0\xda\x9e\xbf\xf0g^\xbff\xdf\t\xbfs\'D\xbe(s\xc0\xbe\x01\xfb\xc4\xbe\x00Y\xde\xbdP\xae&;\xd62(:\xd3\x17\xb0;Y`\x98\xbe\xb0\x08\x87\xbe*P\x01<\xd7\x8f\r\xbfO\x0c\x9e;\xe6P\x14\xbe\xf6&\xc4;S\x1a\x89\xbf\x88\x1d\t<\xf0\xfb8\xbf\xa6\xcda\xbfUF\x7f8\xc2W\x83\xbf\xa2\xab\x03\xbf!\x7f\x93;\xc0\xda\x91\xbe\x18\x83<;\xdd\x95\xac;\n\xf6\x93;\xf8\xd9x\xbf\x8f>]\xbe;+\xe3;\xb5\xb2K;9\xea\x07;\x7f \x1f<\x8fA\x10\xbf\xdc7\xcd\xbeQ\x8d.\xbc2\x96\xdf\xbe.\xfbb\xbd\x9e \xa7\xbf\xf3z\x9c\xbe\xa6Z\xc9:\xca\x7f\x1a\xbd\x0f.\xb2\xbe\xd8uG\xbeEYM\xbf\xb2\xb7\x03<n\xd0.\xbe\x93\xdb\xde\xbe;\xa8i<\xce\xfa\xe0:\tn\x9f\xbc7?O\xbe\xfc\x83\xb1\xbe\xddX\xb3;\xcc\xa7\xd5\xbe\xeeR!\xbe\x0c\x80\xc5\xbd\xfd\xba\xc1\xbet\xbd^\xbd\n\xd2&;\xd5\xa9\xc6;\xb2\x8c\x02\xbek\x1b\xa0\xbd\xec\xf7\x089\xd2i\xf0\xbe\xb3\xec\xaa\xbd\x95\x14\x86\xbf\xd0\x08\x17\xbf[\xc3M\xbf\xad\x8d\x9c;y]`\xbe\xff\xc5W\xbf"\xadd;\x0b`\x08\xbff\x1d\x9e\xbe\xce\xd4\xdc;\xc7\xe9\xad\xbe\xa2[V\xbc\x1ft\x90\xbee\xfe\xb2\xbe\xd7R\xb9;\xe0\xac\xca\xbc\xae|b\xbe\x1aY\x0b<2k\x1a\xbf\x02\x17\x05;\xcd\x07\xb1:\x04\x07\x10\xbf\xdd\xcdw\xbf\xf5\xc4!\xbfI[\xaa\xbfH^F\xbf\xe9\xa0\x12\xbe\xb1\xad\x85\xbe\xa2\x05\x8d\xbf\x1e\xd1\x02<\xe6^\xd5\xbe25x\xbe\r\x87\xcd\xbd\xb0\x1cN\xbf\x1b\xd1+\xbfyw\x04<\x93\xd7\xec\xbdm\xdaG\xbe\x8a\xf1+\xbf\xfe\x97\x96\xbf\xd2\xe4$\xbb\xcacl\xbaU\xe6\xf8;\x07\x12E\xbe_\xc1\xeb\xbe\xc1\xf7t\xbe\xab\x9b\xd4;\xff\x13\xd8\xbe~\x92\x83\xb9"r\xfb9\xecA\x16<$m\x08\xbf\xc6"\x01<g\x96\xb0\xbaX}\xe9\xbd\x10\x8bo;gi\t<\x96B\xc2:\xad\xd57\xbf\x16i\xa8\xbd\xd8\x8b\x86\xbd\xf5\xa8M\xbf\xca\x9e\xaf?v\xff\xd6>\x1c>\t\xbcj\x16\xdd>\x1c]X?\xceP\x88>\xd8Q\xe0>\xd2\xa6\xb6\xbbG\xeb\x8a>J&\x84?\xd7\x157>\xc5V\xf6>@\x87\'?\x14\xa0\xa6>\xadT\xe6>\xa6t\x9e?\xc0\xbe\x9d:\t\xedj>\\d \xbb\xd0\xb1\xbb:X\'\x97<\xdf\x11\xe3>\xb1D\\?\x0e\xa2\xd5>\x19\x01\r>\xf3\x01\xd9\xba\xf2\xb61?\xed\r\x02\xbc\xad\xf3\x8d>\x7f\x8b\xc3>B\x88\xc8=\xa7\x00\xc3>{\x91\xb5><=\x84\xbbe\x1a\x81>\x1a]/?\x0b\xae\x92?\x7f\x8f.?\xe7\x1a^?\xc7\xe2\xf2<\xfao\xb0=VoV;\xb09\n?\xc4<\xce>L9S=\xff\xf4\x97=\r\n\x84?\xff\xe3\xb9>\x0f\x08\x12?N\x83\xc4?\xba\xa4[>\xd6v\x96?[JW>\xb1\xf5&?\xffW\x01\xbc\xf6\xc7/?\xda3\xbd>\x92\xd7\xca<\xd5\xd3\x02\xbc\xaf\xca\x0e\xbc\rj\xd0>\xc2\xb7\x97?x\xba>?\x0cSj>\x1c\x93\x19?\x98\x93\xe2>\x8eA\xfd9r\xb4\xba?\x04\xde\xde>> \x87:\xff\x9bS\xbcv\xd3\xb7\xbb\xff\xae\x1a?\x8cLW<\xbb8\x02>\xcb\xf4\xc9>\xf4\x99/?:\x81\xd1>\xba\xb5F?vX^?\x1aJ\x90>\xacn^?R\xc6W?%\x00\xa7\xbb\xf6I\x00?\xb9 \x9f>T\xef\x8f?fh5\xbc\xa8v\xdf?\xa1l\xc0=J\xfd\xf8\xba8e\x1b?\xd0\xb3\x9d\xbb\xa5\xe4q>\xb2\x01\xa6?v\xf2\x8a>\xa0:\xa5?\xf0\xf6k?6_o?\x81\xaf\xf8:\xf8\x84\xc0>\xd6&h?\xdb(\xf3>\xb7\xb7R?F\xd5\x81?F\x89\xca\xbb_!\xf1>g=<?\xecYq>M\xe4,>/V\x9e>y\x08\x02?*\xec\x0c?\x9f\xbb\xa7>Q\xc19>\x0b\x7f\xb3>\xa5\xc1\xc2\xbbi\x91*?%\xdd\xae>4,|>\xc3\xec\xb5?+\x1fQ?\xdd*V>x\xfd\xaf>\x97\xfb\xa8>\x8d\xe6(?\xf3\xe6\xdd=/\xbf\xea>\xb4.\xbf>DP"?V\x11\xbc>\x95\x804?\xe2O\xf9>v\x12A>\x92hA?\x07~@?8\xafg=\xc8$\x98>\'\xad\xbc>\xa2m\x9b=Pj\x1a\xbc\x98\xebq?:\xcd1?\x95G\x0c\xbc\xde\xf4b?`\x9a0?\x8c@\x90>]Q\x9b?e\x90W\xbb\x05\x846?L\\\xa9>\xa9f]>\x98&\xd6>\xef}\x02?\xd8\xedG>\x9eB\xa3?x\xc44\xba\xe2e\xe3>\xa3{/?(\xd7\xcc\xbb\xc1:|>[\x1a*\xbc\xf5&"\xbc\xdc\xd9\xef<\xde\xff\xed>\xc8\xe9H?@\x018\xbc\xd6\xdb\x14?\xdf\x95\xb6>\xd42j>\xb8)\xa9>\xa1\x7f\x19>\xf9>\x80>5\xe8\x9b?\xa0\x9e\xde>I\x9d\xfb>\xdb\xb6\x02\xbc\x0e\xb5\xd0\xbb\x1fs\x9f?\xc9\x1b\x02?\xbe\x8e\x81?:\xc5\x9a>\x06\xe8\x94\xbbR\xa3\xe1>+=\x93??\xa4\x92>T\xc9d?N\xb7\x90>\\\x83\xc2>\xa89\xeb>5\x05@?\xe0\xf21?\x01\xad\xc6>\xc6\xca\xed>c\xf2\x94?0\xea;?\xd1\xcc_>\x83\xc7/>\xf7\xd8N>\xc7D\x04?'
-p489
-tp490
-bsV445259119734566912
-p491
-g2
-(g3
-(I0
-tp492
-g5
-tp493
-Rp494
-(I1
-(I400
-tp495
-g12
-I00
-S'\xf1\xff\x17<\xb1\xbc\xf3\xbc\xcd\xbe\'\xbfX7\xe3\xbez\xd6>;F==\xbe\x0e\xde\x13\xbe\x1e\xa6\x1d\xbf\xc2\x81y\xbe^$\x99;\xb6\xf5\xc0\xbe\xcepW\xbe\x0c{t\xbe\xa9}\xb1\xbdi<\xda\xbd\xf3\x82\xee;\xbf\xd3\xc6\xbe\xce\xc7\xb4\xbe\x8co?\xbf{\xcd]\xbf\x9bm\x8d\xbei\x12\xa2\xbcX\xdd`;\x98G\n\xbe-_\x84\xbd\xf7s\x19\xbf6\xef\x81;?:|\xbe\x80\xe4\xdb\xbe\xed\x84\xf6\xbe;\x08I\xbf\xc8{\x8f\xbe\xc6\xdfT\xbeq\x83\x95\xbf\xc7\x84Y;C\x81A<\x9b\x16!;x./;\xe5\xd6\xe0;\x06\xab\x88\xbe2\xbdN\xbf\xce\xfd\xad\xbf\xb8Y\xd3;\xdc\n\x85\xbeC;<\xbf#\xb40\xbfl\x88:<\xa6\x0f\x9e;\xa0\x85\xd1\xbdW\xe6\x19<\xd2\x07\x84\xbe\xbb\x1fL<~\xca\xe0\xbe\xeb3i\xbdA\x1e\x92\xbf5\xe4\xd7\xbeq\x18\x95\xbe\xaa\x8d\xd2\xbd\x9cS\xfa\xbf\x05\xb7\x89\xbf\x9c\x8ar\xbe\x15\xb3Q;J\xc8\x8e9\xeb\xcf\x9e\xbe\xd5D\xcd\xbd\xbb\xb7\xb8\xbe\'|>\xbf\xe7l\xba;\x86MG\xbe\x8d\x86\xd0\xbe\xcb\xde\xac\xbf\xfb\x11F\xbf0\xb1\xca\xbe\x141\x08\xbfs\x01{\xbe|_\x98\xbe\xc2\xe7\x05\xbf\xb8=\xe3;\x80\xfb\xe2;\xb5\xea\xaa;\xf2X&\xbe\xf7\xe7)\xbeF\xed\x0c<-\xc03\xbf\n\x97M\xbc\xd8\xf1\x8d\xbe\xeb\x18\xdf;\xff-\xb3\xbe\x9c\xc5^<jEM\xbf\x83\x95X\xbfS\x0b\xaf;\xec\x03@\xbfHA\x82\xbfu\x87\xf0; Q\xcc\xbdt\xf6\xd7;\xc0{\x84;\xf4_\xd5;8a\x89\xbf\x96\xab>\xbeV/)<\xb0\x08[;MG\x02;\x15\x14\x82<\x0b-i\xbf\xc0\xe0\x13\xbe\xd8\x7f\x88:\x15\xb1m\xbe\tJ\x85\xbe\x18\x16\xc7\xbf\xca\xb0+\xbey\x88\xb5;V\xaa\xc5;\xda\xfa\x15\xbc\xf8\xdb\x1b\xbe_\xbfj\xbf\x84\x10\xb3;V\x94\xce:$\xfa\x94\xbeR\x02F<\x91\xbb<:\x89\x80\xa5\xbdn\xbb\xfb\xbd\x9b\xc0$\xbe \x96J;\x9b+^\xbfW\t~\xbcJiT;vK\x03\xbe\xb1V\xe4\xbd\x07\x08,:2\xf3\xdc\xbd\x17\\\xd5\xbe\xbe\xfb\x90\xbd\x87\x05\xfe\xbe~\x94\xdc\xbe\xab\xf4\xbc\xbdd\xcb@\xbfA[\x17\xbf\xa9VQ\xbfK+\x16<\xb0\r\xda:\\\xa6S\xbf\xa4\xdd\xf1;\xe3\x81 \xbe+\xc3 \xbfj\\\x1b<h)\xd5\xbe\x96}\xa1\xbc\x07\xafa\xbej\x0bW\xbe\xdc\xc8\x1e<\x06\xf6\xc0\xbe\xe4ru\xbe\x9e\x9e\xec;Q\x9fp\xbfw\xb1\xfe:>\x87\x80;\x1d\xbe7\xbf\x7f\xf6l\xbf\xec\xea\x98\xbf\xf0h\xbf\xbf\'\x1b\xe9\xbe\x10A\x97\xbd\xeeM\xf1\xbd?\xb4\x80\xbfd\xb9\x15<\xa6\x87\xac\xbd\xbatl\xbe\n\xcd\xa6\xbd\x9fnY\xbf,\x14T\xbf\xc1\xa83<\xb3+\x0b\xbcU\x19\x86:\x15w<\xbfw;\x98\xbf0~\x05\xbe\xad+\xaf96\xdd\xf0;}\x8e<\xbc\xcd\x06*\xbf\xcf\xb2`\xbe~)#<\xa1"?\xbe^\x9dd;\xae\x7fc:\xaaS4<\xd3\xf7\x95\xbe\xe0-\xe9;\xd2R\xa8\xbdpM\xbc\xbe^\xfc\xa2;D\x12U<|~F<\xd2\tf\xbf%\xeb0;\x91\xb2\x8e;\xa46m\xbeH\xa4\xad?\x7fv\x00?\x99x,\xbc\x9eC\xce=\x81\xe1X?\xdb\xfa\xd1>\x8f?\xb5>k\xdc\xc4\xbb~o7=R*q?\x04\xd6<=\xe0\x98\x87\xbb\xc9\x10D>\xf0k\x98=\n\x13\xa6=\xe9\xe5\x96?\xf3\x0e;\xbb\xde1_>\x1cp\xf9\xba\xa0+\xb9:\xdb\x03\'>{\x0b\xc2>\xbd\x8e\xde>\x85\xeb:?\xb2\x8e\xa5>\xa3ZH\xbb\x8a\x1cn?\x87\xc9\xe5\xba\xf1\xb9\x10\xbc\xc7\xaf0=B\xae\xdb\xbb\xdf\xb6\x07>\xa1\xfc\x17>\x81\xb2(\xbcg4\n?\xe4j\xbf>\'0\x81?\x07\xcb\xc3>\x19\xa4\xb6?\x01\x0b:>J\xb4\xce\xba\xb8\x1f(=u/\x1e?\xb0{\xbb>\xa9~\xf3\xbb\x1f\xae\xd0<~\xe6\x91?n\xf76?[\xb6\xa2>\x99L\xa4?.v\xd1\xba\x9bIe?G\xce]\xbb\xe2)\x9a>cn8\xbcuxP>\x0f\x003>\xbc)*>\xfa\x9c\x7f\xbc\x00\xe8"\xbc\xf8\x04\x9b>\x89f\xb0?\x97\xa4\xbd?\x00\xea\xfd=S\xe4A>\x99Yf>B=\xb9\xbb\x1d\xb9\xb0?{\xc9J?\xa2z\xd8\xbb:\xb0j\xbc\x8a\xb27\xbc\x8d\x91\xfc\xba\xc5\x1f\xc1\xbbv\xdd\xa1>\x94ax>\x8a\x9af>\x85\xa0\xea>\x01\x1es?\td2?\xc0\xc0<>k9\x9e=\x93\x1bU?\xb8\x08\x05\xbc\xc2\x16\x01?l\xdf\x1d>\x1b?Q?\xf8&\x0e\xbc\x80:\xc1?j~\xc8=\xbdo\x95\xbbw\x17\x99>\x91\xa9\x9d\xbb8|\\<\x8cK\x87?\x04+\r?6\xd7\x97?3\xd9F?\xac\x0c\x98>kf[\xbb\xf5\xe9\xa6>\x98\x83\xce>\xf7\xdb\xf1>\x7f\x90\xb3>n\xcdI?|\x8d$\xbc\xee>\xaa>\xa4\xb4;?l\xd0/>\xe2\xf5\n?\x96\x81\xa4\xbb\xb5\x06\x8d>\x9e\xd5z?}U\x07?\xcd\x0f\x14>*\x14\r?J\xc85\xbc\x88t!?\xa7G\n?\xd3A\xbe=\xc9\xaf,?\xc5Y\xa0?\xf4\x81\x0c>\xac\xbc=?\xff\xecZ>\x86X\xca>\x06Da\xbb\xe2!\x07?\xa5\xe5\xff>\x04\xbd\x89?\xe6\xf3T>\xac\x80\x9c>5O\x8c?\xa30\x17=\xefnl?j\x99\xb0=Y:9\xbbn"k>\x92\x05\xf1\xb9\xbe\xd4.>\x19\xcb\xbf\xbb\xd7V"?\x13L-?q\x19\x1e\xbcH\x06Y?\x92\xe7\'?\xc3\xb0g>F\x18\xab?x\xc3\xdc=\xbae\x05?\xbc\x02\x8b>\xd7,\xca\xbb#%\xdb>*\xe3\xb1>\xe9\xf4\xd8>\x1e\xf9>?\x9a{\xcb\xbbro\x7f?\x15\x8dZ>d{\xf3\xbb`\xbe\x1e>\x8fv\x1c\xbc\xdd\xc51\xbc\xa0\xc6\xb3\xbb\xa7\x07\xa9>+~ ?\x14\xc9H\xbc3\xfe\x1e?z\x97\x1e?\xf4\xfe\x16\xbb\x80,\x7f=\x10\xcb\x08\xbc7g\x19\xbb\xc9\xc8\x9d?H\x1d\xd3>?}\x8e>!u)\xbc4\x13\x0c\xbc\xeey\xbb?b\x80\x00?\x9e\xce ?\x0c\x8e\xdb=q\x10\xc5\xbb\xb3\xeb`?\x86\xac\xbc?\xe6\x15\xae>u\x14\x00?\x0eT\'>J\xe8\xb2>T\x82\x81=\xcex\x86?,\x192?\xa9N&>\xd1<\xba>T%\xb4?\xbf\x06:?\x86\x10o>i\xff\xd4=\xcfu\x81>\xd3*\xab>'
-p496
-tp497
-bsV476534288049905664
-p498
-g2
-(g3
-(I0
-tp499
-g5
-tp500
-Rp501
-(I1
-(I400
-tp502
-g12
-I00
-S'\xc2,O<\xb2-\xbe\xbd\xe3\xaf\xa3\xbf\xefns\xbf\x11\xfeG<\xd2S\x8c\xbe\xc2t\xf0\xbdk\xcb!\xbfft\xe0\xbe\xc8\x19Q<n\xbf\xb3\xbe\xb9\xe9\x8c\xbd\xac\x96\x01<\'\xa7\xb7\xbe\x14\x9eh\xbf\xc6\xf7\xa4<\xe0\xcd\x97\xbe\xe2]I\xbe\x12!\x84\xbf*\xd3l\xbe\xe3X\x99\xbe\x9b\xfa\t\xbdW\x88\x94\xbe]\n\xd0\xbeR\x03\x91\xbd\xf1\xd4\x80\xbf\xcb\x02%<\xde^\xf0\xbe\r\x82\x19\xbfw!\x9f\xbd\xaf\x15\xdd\xbd\xd6\xd52\xbe\xbd=F\xbe\x8a\x00\x8d\xbf:\x88\xad\xbe\x90Y]\xbeX3\xe09 b\x92;v{\x92<\xe4\x95M\xbf\xaa\x1a\x06\xbf\x07\x9c\xdf\xbe\x99V?<I\xae\xb9\xbe\xb7\xfa\xb1\xbeO\x14\x9a\xbe\xcb\xbe\xdb<\xc8\xf45\xbf\x0b\xb1A\xbe\xec\xb8\xc6<_\x1f\x15\xbd\x0e\xae\xe6<.\xa2\xa7\xbe\x03H\x85\xbc\xf49\x19\xbf\xcck\x99<\x06\xc2\xb5\xbc\x86o|\xbe\xb2\x7f\xa9\xbf\xa7~\xae\xbf#\x81}<\x03\x11z:\xfbk\x83\xbc\xd4\xb4\xaf\xbei#\xbf\xbdq\xe6\xa7<v\xde\x11\xbf\xf2\x88\x9e;vx\xa4\xbe"\x99(\xbe\xbd<H\xbf\xcc)\xcb\xbeN\x01\xe4\xbd\x82!\xf0\xbd(Up\xbe\xf56\xb2\xbe\xbb9\x97<\xc8n&<\xda\xd6\xcf;}b <\x7f\x11k\xbe\x95\x95>\xbd\x97\x8c\xcb<\xf7\xd6\xdc\xbe\x9b\x93\x1c< K\xef\xbd\x99Yq<\x8fe\x08\xbf\x84\x98\xf5<\xad\xa9\x8c\xbdi\xf80\xbf@{\xbf;\xf5c\xa0\xbf\xde\x88\x18\xbf"\xb2\x92<Y\xd4u\xbc\x05\xd7+<\xb0\x07\x92<^\xdaw<:\x951\xbf\x14\\F\xbb9\x15\xa1<\xd0=\xd4;\xf5\x98\x19<_\xf3\xd8\xbe\x8b\xe2\x11\xbf>\xcea\xbc_\x19o\xb9YU\x01\xbfk9\xc2\xbc\x1f\xe1\xeb\xbeo\x9a\x9b\xbd\x00\x9c\x89;\x7f\x19\xc3\xbc\xbbO[\xbeB\x84\xb6\xbd\x97\x98m\xbf\xe9(Y<f{\x11\xbf\x84\xe9r;G\x91\x04=~\xb35:*j\xb1\xbd"\xba1\xbd/\xaa\x84\xbd!\xfdw<V\x84\x12\xbf\xb6\x950\xbe\xba\x06C\xb9\x1ce\xf9\xbe_\x1aZ\xbbxSj9\x8b\x1f\xb88\xee\x14M\xba\xe1\xaa\xa6\xbb\x90\xbc\x15<\xd4KM\xbf\xad%=\xbd\x99\xb4\x07\xbe)\x00\x1a\xbf\x8c{c\xbece\xc9<\xa7\xc2\n\xbe\xc3\xb8{\xbf\xf3u{<>\xf5\xcb\xbd\xe88h<_\x85\xa8<\xd6\xac\x8e\xbe\xc0\xbeT\xbe)\x9c\xd4\xbe::\xf2\xbe\x1cN\x81<b\xc9\xa5<\x98\xd6\xd7\xbd\xbd\xa3\xae<\xd7\xc2\xea\xbe\xf2\x85\xbe:\xe8\xa6\t:LH\xa1\xbe0\xae<\xbf0u\x1d\xbf\x02\xaeS\xbf*\xa4z\xbf\x1dA]\xbdw(\xd0\xbe\x99_\xc7\xbf-\xb1\xb5<\xb0\x98\x92\xbd\xe1\x04\x1c\xbe\xc6B\x06\xbdw\xb6\x85\xbeC\x16\x14\xbe\xae{\x10=H\xd5p:\x19\xd8\x83\xbd\x89*+\xbf\xe8\xc4\x88\xbf\x00\x9b\xea\xbc!\xfa\xa2\xbd\xd4u\xb7<\xf2\xff\xae;\x07\xcc\xde\xbe\x06\x85\xef\xbdT\xcf\x92<\xf67d\xbeeg\x14<\x12\'\xf9:Z{\x9b<\x17\x87\xa3\xbe\xe2\x94\xf8;\x97K\x14\xbc\n\xd9;<\x045D<\x0f6\xbf<\xc8m\xd6<G\x8ab\xbfi\x05\xfb\xbe\x9cM&\xbe\x91\x88\xc3;\x1c\xb2\x90?x\x18\x9d=k\x0e\xbd\xbc)%+=\xa0\xcb\x8f?\xd2F\xe3\xba\x96\xb7T?i4!\xbc\xb4V\xac\xba\xb5,B? \xb9\x0e>\xdc\x0c\x00?\xf1\x03-?\xd6\xdf\x12>\xcc\xab\xc7\xbboc\xee>\xc6~\x0f;\x99\x15\xcc\xbb\x93\x07\xbd\xbb\xc9\x8b\xed9-\xb8\xab\xbcw\xec\xf9>\xa9Vh>h&\x1b\xbc\x96\xa3\xf2>\x00z\xe4\xbb}\x97u?\x17\xd0H\xbc\x82\x95\xa7\xbc\x8ey\x93>\r\xd0\\>\xeaSK?\x10h\x11>\xa2\xee\x9e\xbc\x84;\xd4=\xb0/\xa2>k\x1c)?O:C?\t\xa3O?\x96\xec\xbb=X\xd9h\xbb\xf8\x17\xe7<\t\xfb\x16?t\x12\x8e\xbc~\xc9\xce\xbb\x1a\xdb\x9f;\x95\xc1\x1d?\xd7\'\xa7=~\xd8\xb1=\x1a\xc2\x97?\x00\xee\x9e>\xa1\xce\x93?\x83\xc9C\xbc\xbfr\x18?KF\xde\xbc\xef\xe8\xbb>\xd5\xae\x9d>y\xc0\x1a\xbc\xa6\xf1\xce\xbc\xb4\xd4\xd4\xbc\xfcE)?\x85U\xa5>w\x9e\xb4>\xb4\xe2\x97\xbc\xe1_I?k\xc5\xce>\xbf\x08z\xbc\x89\xd5\x8b?\xeb?\x9b\xbc\xa1\x02\x11?~z\xf1\xbc\xc2I\xa0\xbc\n\xd2\x00?\x15Fv>\x9f\xa0#\xbc\xceI\x93>)Z\x04?_8\x83>8\xb7T>\xf5\xae\x81?\x1f\xb7\xa4\xbbJ(`>\xdaAN?\xfe0l\xbc\xa8\x7f\xcc>Q\xe9h>"}%??F\xd1\xbc\xdczZ?\xeb\xe1">y\xf6\x01\xbcU\r\x86>\x0f\x98\xfb\xbbg>\xfb=\xbe5\x7f?\x9a\x18(?\xfd\xd8\xd8>\xce\xcd\xa2?/\xdd8>l\xed\x01;\x14:\xcc>\xfc\x02P?\x1f\x96\xac>\xbaz\x8f>\x19N\x19?\x9a^\x82\xbc\xb0=\xce>\x9e\x95\t?\x01\x18\x88=\xe5\xba\xec>BB\xbc\xba\xf2\xa9\xaa>\xfe\xf8\x8d>\xe0\x9dY>\xa2B;=Rs\x1b=\x1c\xdc\xb3\xbc\xe4\xa8\x90?U\x8eB>\x8d\xb1\xbf>\xa35U?\xdf\xb5\x0e?\xaa\xc3(=r\xa6\x8e>.\xcf%?(\xc7-?\xa5\xdb\x8d\xbb\x95\xb5\xbe=\xa5\x9a\x87=\xdbr\x10>C\xb3M>\xf7\xda\x02?\xf3\xfc\x91>\xce\x86\xf1>\xbc\xdb\x82?\xdf\x85\x98>9\xdb\x93=\xc7\xc0^>A\xbe\x02>+\x9c\xbf=\xef.P=\xe50\xc9>\xa7\xd8\x06>r\xae\x88\xbck@3?\xfa\xd8\x9e>\x8f\xd5\x8b>\xac5l?\xaeD+\xbc\\^;=\x8f,\xe5<\x86\x0bU\xbc\x13A\xe4>\x99\xf2\x9f>\x14ef=K\x12\xa8?\xe5X\xe5\xbb\xb5\xa5\xb1>kq\xc8=y}\x93\xbc\xf2\xc0n>V\xdeU\xbc\xe6\xa7\xd3\xbcScM\xbc\xf1+\x1e>\xb3\xa9\xc4\xbbNU\xd7\xbcF\xde\xc6>n\xc9\xa7>\x92J\xf3>D\x01\x1d?\xd4\xac\xa9\xbb-Rn>\xc1B\x96?\x7f\xd1\x80>\x19/\xa2=\x00\xde\xd8\xbc\x08\xdc\xa2\xbc\xc4\x08\x88?\xd5T\x19>~gM?) \xcf>\x88\x93;\xbc\xe7\x00\xbc>7\x02\xc1>-\xd4\xc5<UA\x12?\xa8\xf1\xd8>L(\xb3>\\^ ?\x11Z\x1f?\xa0\xcc\x12?\x04$H>\xcb\x8b\x8e>s\x9c\x91?\n(\xc7>_0\xf4=\t\xdc\x14>\xee\xaa\x9d="\xdd\xf8>'
-p503
-tp504
-bsV445258811893645312
-p505
-g2
-(g3
-(I0
-tp506
-g5
-tp507
-Rp508
-(I1
-(I400
-tp509
-g12
-I00
-S'z\xd1\x16=`\xbbO\xbe\xc5\x03\x85\xbf\x1e\x9e\n\xbf\xa8\x1c\x9e<\r,\x98\xbe\xba\xa1\x96\xbd\xfa\x00\x88\xbf\x13\xa5\x1a\xbf_Z\xa3<\x00\xd8\x10\xbf\xc6\xb5\x0e\xbe\xff\xd6\x14;Yx>\xbfO{\xf8\xbeZy\xd3<G\xa6\x93\xbe\x12\x089\xbe\xf5\xa46\xbf\x95\xb4Z\xbf\x97j\xfc\xbe7y8\xbe\x1f\n\x1b<`\xdd\x91\xbf\xc8\xaf\r\xbd\xe7:\x02\xbf]F\x8d<\xcbo<\xbf\xc6B\xf1\xbeq\xc8\xbe\xbesg\x8d\xbf\x99\xf5\xd1\xbe\xbd3A\xbe\xbb\x12\x91\xbf\x08\x84\xa7\xbe\x7f~\x97<\x07Pg<`AP<\'\xe4\xc2<\x10\xe1\xd9\xbe\xfb\xddV\xbf\x91\xbb\x8e\xbf\x01U\x87<\xfaR\xb5\xbe\x80\x9e7\xbf7F\x1d\xbf\x12"\xf8<\x12\x9b\xbf\xbe\x8a=\x8a\xbdv\xa4\x11=\xb6\xe5)\xbe\x05\x02\xf6<\xe1\n\x16\xbf\xbf\xfa\xbc\xbc.\xff\x80\xbf\xa9U\xc2\xbeu\xb2\xd8\xbe\x84\x08\x02\xbfDN\x97\xbf\x84.\x91\xbf\x0c)\xda\xbe\xa1\x95\x84<N\x91\xa8\xbdV\xe5\xfc\xbe"\xee6\xbcP\xeer\xbeK\x11\xae\xbe\x17\xa9\x9e<PyR\xbf|I\x98\xbeT\x99\x8a\xbf\x9c\x04c\xbfS*K\xbe\xeb\xc7d\xbe\xcdv\xf8\xbeq\xa8\x81\xbe\xa9E\x8f;\xedCa<\xfa\x0e\xb2\xbc\xb2\x10\x82<\xbc\xcf\x06\xbe\tjD\xbe\xce\'\xb5<k\xe1\xcd\xbe\x13\x89T<6\xdc\x8f\xbe\x12\x00\xc9<y\x15\x80\xbf\xa5!\x0b=\x1cOq\xbf7\x08+\xbf\xdd\x1c\xdb;}\xc6\x99\xbf\xcdZ\xdb\xbe\xb1\xc3\xc4<\x9d\n\xaa\xbd\x0c\x0f\xa3<s\x9f\xd9<\xa4\x86j<\xf8\xaaU\xbf\x9d\x08\x80\xbc\x86\xd9\xaa<\xdd]\x86\xbe2`\x11<\x94\x96\x8b\xbd&EQ\xbf\xde\x92\x87\xbe\xc5\xd6\xf6;@~\x1e\xbf\xba\xce\x11\xbc\xa1\xa4;\xbf\x971\x15\xbd*\xc9\x15<NrZ<0!\x1e\xbd\x08*\xe1\xbe\x9d\xb7\x81\xbf\xc6J\xc2<\xa7\xfb\xd0\xbeC\x01\xae\xbe\x81\xd0\x00=\xb4\xb8D<\x14\x8d\xa5\xbe~c2\xbd\xe7%\x1d\xbe\x9f\xba\x8f<\xf6-\x0f\xbf\xddLZ\xbe\x12\xc9\x15\xbe(\x04\x0f\xbfFk\x1d\xbe\x85\xab\xa6;q%?;\xf6\x92\x12\xbe\xc3\xb2h\xba\xba\xbd\x97;\xad\xfa;\xbf\x94T^\xbc\x82$\xbf\xbeX\xb2T\xbe\xf1\xba!\xbfa.\xac<#\nb\xbd\t\xb3{\xbf\x91\x9c\xd3<\xa4g\xf4\xbeE \xe9\xbe\xf8\xdc\xdb<\xc5\x08\xdb\xbe\x1c\x97t\xbd\xb8\xcf\x8e\xbe\xf3\xe5T\xbf&\xd4\x8f<ab\x82<f L\xbd\xe3)\xbb<\xf4\x88\x1a\xbf\xb1\xa0\x1e<r\xc7\xd2;\xb1\x0e-\xbf\xf4\xd1Y\xbf\xb1\xd1\x84\xbf\xe9\x1c\xbb\xbf`tL\xbf4\x7f\x14\xbcV\xb6\xbd\xbe:\xc4\xd0\xbf\xd1\xdd\xba<\x1f&\xc2\xbd\x03\x90\x14\xbe7\xb4\x84\xbd\xab9I\xbf\x08\x8e\xb1\xbe\x88\x82&=\xdf\xbc\xad\xbdf\xa6k\xbc\xdf\x7f\xe1\xbeM\x8dR\xbf\xe0I\xb6;\xbb\xad\xce\xbd<\x9a\xbe<G\xc1\x00\xbe\x0fm\x05\xbf\xc4\xe6\t\xbfH\xd5\xa4<\xdf?\xdf\xbe\x8fU\x97<y\xf1\xbd;k>\xae<EOq\xbe\x10Dk<\xd0kT;\xe1j\xde\xbd\xbf\x96/\xbd\xc2G\x0f=\x1cn\xa7\xbd>gR\xbf\x9ek\xee\xbe\xa5i\xcf\xbe\xc8\xa6\x05\xbf\'\x80\x9c?-~#>\xfe\x95\xe1\xbcNq\xc0=\xba]r?\x0e\'\xa2<\xaf\x9f\x1e?\x05\xc0\xaf\xbc\xafY{=}\x06F?\xcc\xc5\x0c<<|\x07?\xc2{\x9c>\xfe\x8b\x81>\xac\x9e\xee\xba\xff\xcfq?tK@\xbbk=\xd7=z\xf4r\xbcP}E\xbb}/\xe6=\x88\xeb\xa7=#6\xaa>\xcf_\x06>\xb0?\xe9>p\x00<\xbc\xba\x1b\x84?qo[\xbc)\xea\xa9\xbcw\xd6\x9a>\xd6\x92E?\x12\x96\xcb=\x05<\x88=\xe1\xec\xbb\xbc\xe1\x15\x0f>\x00\xa9=?HcH?\x86\x8f\'?\xdb\xd1j?\x1az\xc0=T\xd1\xea\xbb\x18J1>\x9e\x95\x7f?)\xa4\xbd>\xf7\tS\xbc\xfa%V>\x145\x94?\xb9_\xec>\x85v\xde>\x9d\xbc\xa7?\xf1\xfd\x97>r\xa4\x8d?\xb8 G>"\xab\x05?\xcd\x0b\x07\xbd\xd7j\x19?\x12\xec\x08?\xc6H(=\x8e\xbb<\xbd\xfa\xff\x1d\xbd\xaf\x93i?%\x12;?\xfa(H?\x99*;\xbc\xa8(%?\x14\xdf9?M\x0fZ\xbc\x1a\x95a?\x04\xf7\xe4>\xe5(\x0b>\xfa\x10\x0f\xbd\x19\x16\xc3\xbc\xde:\xb3>\xd8[\x0f\xbcc\x82j>t<4>,\x83O?)Y\xc9>;hI?-0|?\x12\x88\x04>\x94\x1f=?E\x97\x1c?\xd8\x1b\x94\xbc\x8c2\xea>?\xa8\xd2=fH\x82?\x8b3\xbb\xbc\x8bd\xbe?\n9\xac>u\xecv\xbc\xaf\xd5\x18?\nh\xa6\xbc,5\xaa>\xb6\x9f\x85?\xd1I\x03?\xb5\x1e\x89?\xda-q?/bJ?B\x9d\x13\xbcT \x82>\xd9\x80)?\xc6\xbd\x91>\xf6\x80\t?2\xaf\x11?\xc6\xfdi\xbc8e\xd8>\xce#\x00?\xae\xe3\xf3=\xa3\xa2??zwh\xbcQ\xb1\x80>g5\x11?\x9fM7?\x1a\x17|>\x1d\x81\x02?\xe7\x1b\xcf\xbc\x7f\xf3^?\x90:\xa5=\x88\xcf\x9a=\xda\x9d\x82?^.P?\xdc\xffj>\x05\xd4\x9d>\x0c\xf7\xc9>-\x884?\xee9\xf5\xbb\x00%\xdd>\xc8\xbfD?\xeb\xc7&?y\xf7\r?\xda_\x1e?\xe2\xaf\x87?;\x0bG>A-@?\xa1u\xd5>\xa9\xb9\x97\xbb\x16_\x05?\xcd\x80\xb0\xba\xe1\x8e\x93<c\x80e>L\x12\x88?\xfaGm>\x14\t\xd9\xbcU\'\x81?\x08I\xa1=a\x97$?\x05I\xba?\x87\xe4\x15=\xf5-S?_\x18\x98>\xf9OK\xbc\x0c\x956?\x12_,?d\xe3\x83>:dd?Y\x0f8\xbc\x01\x0b1?n=\xee>\xc0j\xd5\xbcj\xd86<\xf3\x11\x9a\xbc&\xac\x04\xbd\xe5\x8a\x1f\xbc\x8eJ\x8d>\x1b;<?\xe4\x8e\xed\xbc\xa2\xe9\xb1>\xfa\x06x>\x97\r\xc8>\xa7u\x02?\x1d\x1bU>\x8d(\x8d\xbb\x84\x9d\xb5?\x84\xdc\xb9>\xb8\xdd\x89>tm\xec\xbcE\xc8\n\xbd#\x88\xc5?\x9a9\x80>7\xfc^?\x9b\x88\xcf>,EM\xbci~X?n\x9a\x9e?\x8eVj>6\xacI?s1\xe3>\xde\xd3\xd6> \x8f\x89=\x10@\x92?\xc0t5?E\x004?.\xa3\x8a>\xa37\x92?\xbf6m?\xc6\xd3L=\xbc\x96\xdb=\xcd}\xa0>\xaf&w?'
-p510
-tp511
-bsV445258384627863552
-p512
-g2
-(g3
-(I0
-tp513
-g5
-tp514
-Rp515
-(I1
-(I400
-tp516
-g12
-I00
-S'\x87[<;\xb0y\x01\xbf\xc7L\xa5\xbf\xeboH\xbf"p\x1a;\x9b\xec:\xbf\xd7<\xa2\xbe\xa8\xe4\x8e\xbfP\xd7\x8c\xbem\xef\xbf\xbb\xcc\x03\x8f\xbfL\x08\x0c\xbf\\w+\xbf\x94O\xf8\xbe\xc8\xa6\x08\xbf\xde\x9d\x00;c\x05\xb4\xbeh\x93\xf3\xbe\xdc\xd3\x9f\xbf\xbcP\xb0\xbfF\xaf\xff\xbe\xb1\xe6\x04\xbef\xd3\x01;\xfb_]\xbf\xe7\x7f\x10\xbe:3 \xbf\x97\xc8\x08:)\x01\x85\xbf\xc7\xea\xf9\xbe1O\xb9\xbf;\x08I\xbft\xd4\xde\xbe\x1cw\x94\xbe\xe0 \xf1\xbfq>"\xbf\x83\xe1\x91\xbcb\xd0>;*`_;8j\xe8:\x85\xe3\x1c\xbf\xff\xff\xf2\xbf\xce\xfd\xad\xbf\x02\x92@\xbeB\x1a*\xbfC;<\xbf\xebA}\xbfyn\x90;b\xcc\xd1\xbeg\x8d<\xbeX\x8c\xb1;\x80\x86:\xbfV\xef\xb3;\x9f\x01 \xbf\xf0@\r\xbe\xc1\t\x84\xbf5\xe4\xd7\xbeq\x18\x95\xben:\x19\xbf\x9cS\xfa\xbf\xbf:\xba\xbf\xc1\xe3\xbe\xbe\x0c\xe3a\xbdM2-\xbe`\x0b\xbb\xbe\xd8\x8a\x0b\xbe\x9d@/\xbfH\xf6\xa6\xbf8\xa0\x82;\xfe66\xbf\r;>\xbf\x05D\xbf\xbf\xd4\x9eP\xbfR\x91t\xbf\x141\x08\xbf$vD\xbf\xdey\xd9\xbf\xdd\x99\xb2\xbe\xfb\x12\xcc\xba\x8c\x8d\x87\xbd\xbe\x1b\x11;\xa8%\xa6\xbe\x8c\xcf\xa3\xbd\x86\xeb\xf2\xbb\x93\xa4\x15\xbf\n\x97M\xbc\xd8\xf1\x8d\xbe\x94_\xe9\xbe\x00\x9a\xc4\xbf\xf3\xc2\x93;\xb7\x82\x99\xbf\xf9\xf4\x9b\xbf\xa0\x0e\x9d\xbd~\x1a\xa8\xbfHA\x82\xbf\x01\xc3 ;>t\r\xbe\xad5q;\xd7\xa2\x83;@^m;\xd7\xb3\xaf\xbf\xda\xdc\xad\xbe\xa7\xdc\x17\xb9\xcf\xe5\xbd\xb96\x16\x8f:\xda\xcbn\xbf\x8b\xe1\xb7\xbf\xdfth\xbe\xf7\x81\x89\xbd\xf1\xb9\x17\xbf*R\xac\xbd\x18\x16\xc7\xbf\xbc=\x97\xbf\xb2"l\xbe\xe1oK\xbd\xaeN\x10\xbf\xe1\xdeR\xbel\xbb\xc2\xbfF\xbd\x8f9 \xaa\xc6\xbe\xff_\x9e\xbf\x90O\xe7;\x98\x07~\xb9\x89\x80\xa5\xbd\xefB\xff\xbd\x8b\xfd\x02\xbf \x96J;\x9b+^\xbf\xe5#5\xbf\xcb\xfb\x89\xbd\x05d`\xbe\xf7\xd6\x02\xbe\x98\x8c\r;S\x9b\xcf\xba\x17\\\xd5\xbe\x05\xb1\xdf\xbe\x87\x05\xfe\xbe2#4\xbf\x80<\xd3\xbdjq\xab\xbf\x8690\xbf\xf09t\xbf\xfd\\\x93\xbes\xfc\x8e\xbe\r\xde\xb6\xbf\xc24,9i\xa6\xab\xbe+\xc3 \xbf\xfb\x0bU\xbb\xdb\xc3\xd3\xbe\x83"\xaf\xbc\xd1\xff\xcf\xbe\x02A\xd5\xbe\xe5^5\xbc\xce\xc2*\xbf\x05|}\xbe<\x83\xbd;Q\x9fp\xbfv\xf8D\xb9\xba0\xa4\xbe\xeb\xa1,\xbf_\x0c\xd4\xbf\xd0\xb7\x9c\xbfi\x87\t\xc0\x879\xba\xbf\xfeIs\xbezAl\xbe\x15\xcc\xf9\xbf\xc6\x1d\xe19\xd9$\xf6\xben\xd1\xe0\xbe\x8d+\xb6\xbe\x9fnY\xbf\x03\xa4Z\xbf#=\x15;\xa3|\x13\xbe\x83\xc9\xe7\xbd\xfc\xf50\xbf\xc5\xdc\xa8\xbf:h$\xbe\xfb\x1a\xf9:?\xc2\x83\xbb\x03\x96U\xbe!\xb3\x86\xbf\x1f\xca\xe8\xbeO&<:I\'\xff\xbe>\xad\xa1:\x9c\xd5\x1e\xbd#\x9b\xde\xbd\xe4\xb8$\xbf\xc8\no;=\x8a\xda\xbbpM\xbc\xbe]\xad\x9b\xbf\xb5\xe3\x97;H\x8b\x07\xbcmE\x98\xbf\x1cT$\xbf@/\xcd\xbe\xc8\xc9\x15\xbf\xbb\x9a\xcd?\x97*0?\xe3\x1b\xcd\xbbR\x90\x1f>\x0bS\xb3?\x0e(x>pc&?94\xd8\xb9B\x87\x87=2\x89\xc8?D2\xc5>\xe0m^?\xbb2\x0c?.\x03\xbd>\xa2\x8d\x8a>+\x89\xba?>\x86\\>\xf2\xf3K?\xbc+\xa7\xba\x99\xc6\x85=\xdb\x03\'>\xcf\xbf\xa5>gUX?\xa4\xf3(?\xa7&1?\xa6a =+R\xbe?\xf3\x04\'?\xdeGJ>m\xdcR?xc\x81>\xa3\xc0\x0c<0\xebu>\xda\xba\xec\xbb\xf9C\x0c?\x1f7\xb4?\xd7\xc1\xb7?\xc6\xb2X?\x19\xa4\xb6?=\x1dw>C\' \xba\x0b\x0f#>\x98\xab/?3$j?]Y\xb6\xbb\x1e\xbd\xc8=\xc7Ud?n\xf76?\xca+\\?\x95F\xd3?\xe3\x07^>M\x94{?\x0c\x05\xd2=\xe7}k?%\xbd\x8c\xbb>\xea\x19?Y\xed\xd4>A\x9a\xde>\xa2\x00\xb8\xbbT\xb6\xd4\xbax\x12\xfa>\xa55\xc2?\x97\xa4\xbd?\xa4\x8a!>j^\x87?z\xf9\xfa>\xb3\xb7\xae:D\xb7\xb0?{\xc9J?\x8dqQ>\xe1j\x9f\xba<[,;\x82{<?\x1f\xbfV=v\xdd\xa1>\xd3\xd6\xf1>3\t9?\xbf\xf8\xd7>d\xb1w?\x1e\x9e`?T;\xb2>\xe2\x8d\x1b?7\xcd_?6ae8\x96\x9c8?\x1e\xa2\x8b>\xc3\xa4\x9d?w\x0c\xed;\r\xb9\xe8?\x12\xae\xb4>\xbe\x85\x9d\xbbh\x13=?\x81\x8a\x06\xb9\x0e\xb9\x99>\xe8l\xac?\x03a\x8b?\xda\xd1\xa4?\x1a\x80\x96?\x08\x88B?\x90\x8b\xc5<]\xaa\xd7>\xc8\xd8P?=\x00\xdb>T\xe0\x19?K\xa4\xa2?S<\xc6;\xf3\xcb\xd8>\x95k\x8b?_\xb3\x8e>1\x19\x92?\xf7\x93,>\x06#\xf8>\x9e\xd5z?%\xea$?\x93R\x8b?*\x14\r??\xc0\x1d\xbb\xad\xa2+?\xa7G\n?\xd8{\xf3>=\x84\xae?\xc5Y\xa0?\x1a\x98\x84>\xac\xbc=?\xed\xcd%?o\xba1?\xae*\x87\xb9\xc2\x95\x7f?\xb8\x8cS?\x04\xbd\x89?e\xdc\x1b?\xf6\xce6?5O\x8c?T\xe6G>c\tn?L=7?\x06\xcb\xbc=\x82\xb4\xd7>w\xa9\x89>\xc6^\x17? \xd6\x01\xbb\x08Ny?\x88\xa4X?\xae\xc4\xc6\xbb\xcb!\x88?<{\xe2>\xa3d\xd0>\xc3R\n@x\xc3\xdc=#\xebX?\x03\x91\x0e?^\x9en=\xd7\xfd\x83?6\x13\xdf>\xe9\xf4\xd8><)\xb0?2a\xe5\xbaro\x7f?\x86\xd4\x0c?\x18\xb6^=\xc0\x00\xc2>s\'\xbd;\xcc\x8fP\xbb\x97fM>\xdc*_?+~ ?1?\x04\xbb<E\x12?z\x97\x1e?\xba\xc6\xb0?3f\xfd>6\xab\xb1<\x86G]>w\xff\x86?b`\xe4>s\xd9\x85?\xa2\xa7\xa3\xba\xd0gK\xbbi1\xf2??c$?#-\x80?u\xd4(?\x0c\x8449\xb3\xeb`?)w\xc0?\xe6\x15\xae>\x07b\x97?\xc5t\xbc>\x0fU\x14?\r\xb5\xac?\xcex\x86?\xed?Z?HL\x03?\x8a\xe8\x16?T%\xb4?\xb5\xd0X?\\\x85\x92>%\xc0d>\xae\x0e\xde>\x91\xbb\xe3>'
-p517
-tp518
-bsV473425528955752449
-p519
-g2
-(g3
-(I0
-tp520
-g5
-tp521
-Rp522
-(I1
-(I400
-tp523
-g31
-I00
-S'G\x1b\x03>%\x1d\x07\xbc\xe4f\t\xbe\x88\xaa%<\xac2\xbf=0#/\xbc\xeb[\xc3\xbc\xcc\xfe\xb1\xbd%T\xae\xbc\xf7\xf3\xbf=\xac6V;=A\t\xbd\xc6\x9a*=\xea*$<\x1a\xcf\x0c\xbd\x1cx\r>Kw\x01\xbdU\x16-\xbd\xd5\xbbe\xbdTg\xc6\xbc9J\xb5\xbd\x8f\x0c\xec;r\xfaA=qk=\xbd\xe6\xe44\xbc\x08\xcc(\xbd9\x9a\x9d=\xf3f\x88\xbdEc\xe1\xbd\x8c\xe6\xfe:\xe7\x16?\xbd\xfa\x0f"\xbd\t]\x16=\xa7\x9d\x01\xbeh\x84\x9c<"\x9f\x04>\xde\xb9i=\xff\x9fB=H\xe9\xf5=%\xcc\x1f=\x9a\xe75\xbd\xe5I\xc2\xbc\xd5ou=\xd0U\x98\xbd\xfc\xe3\x8d\xbd<d\x8c\xbc\x83\xe7\x0f>\x83\x0c\x14=\x84\x01\xaf<H\xe6,>\xe2\xfb\n\xbc3\xb3\x17>yTv\xbdb\x83\xb8\xbb,\x0e*\xbeYI\x8a=T\x80\xbc\xbb\x0fh\x1b\xbd\xa6\xa8J\xbe:\x08#\xbeG\xd2\x94=\t~\xb0=\xa4\xd0\xee< \x1e\xb8\xbd\xe1f\x0b\xbc\x8a%\x9a=\xa42\xb5\xbdK&\xb5=F\x08\\\xbdN\xf7\x85\xbd\xbf<?\xbe\xf3\xba\xf9\xbd\xa7\x95\xb2\xbc\x8f\xeb5\xbd\tSW\xbd\x95Hx=u\xb6\x93=2\xfbz=r<\x95=\x8a\x8f\xa2=(Z\x8f\xbc\xb1\xd6,<\x8dy\x02>\x0e\x85\xb7\xbdn\xffs=b/\x19=\xbc-\x98=\x89W\xfa\xbd\xadR?>\xd2\x86\x87<3D\x8f\xbd\xa5 [=\xd8#\x99\xbd\xf43p\xbc\xc8\x10\xe6=\xa3\xd4^\xbb5\xc4\xc4=O\x8b\xcc=\xee\xdd\x93=\xcc5\x19\xbd\xd7\xd3\x03<\x89\x90\xd9=8GO=\x93\xc5\x83=\x9a\xe9B>\x00\x1b\xdd\xbd\xb1n\x19;\xad\xcf[=`\xf3\x10=]\x8f\x00;\xd0\xe4\x9e\xbd7\x87\x91=w2j=\x86\x9a\x96=V3\xb0<\x92\x94\xe0<\xb6+\t\xbe\xb7/\xcd=8\xa51<A\xfe\xbc<x\x94;>m!I=h\x96\x1c\xbc\x00C\xf2\xbc\x81"\x11\xbd\x8b\xb8\xb2=\xc5\xb8C\xbd\xc9\x96\xab;\xc2l\xae<\x1d\x7fd=\xbc\xe3k\xbb~0\x19=\xd9S\x05=6\xd6\xab;\x8dI\x83;HQ\x08=i\xbf\xee\xbc\x98Z\xe5\xba4\xf4\xf4\xbc\xb6_\x01=\xee6\x9b\xbdo>\xf4=)\xda\xbf<<Q\xec\xbdY\x99\xff=9z\x8c<\xe5S\x85=\xedo$>\xcd\x0b\x7f\xbdJ\xe3-<\x95\xdc\xe1\xbc\x145\x89\xbd\xd9\x96\xdf=\xa2R\xcd=\xfa\xad!\xbc\xa2-\x04>tnx\xbd\xe7\xb1U=P;\xf4<\xd4%\xe8\xbd\x0b7\x0e<-\xb3\xc3\xbd4\t\x1e\xbe\xff\xd4\xb9\xbd\xeeU7\xbcb\xa7\xb9\xbc\xb5O\x1c\xbe}\x04\xea=\xc3\xbbK\xbc\x96S-\xbd-M\xa7\xbbAl\xd6\xbd\xf4\xaf\x12\xbd\'\xc16>\x11\xd7c<\xe3\x17\x8d<\xe7L\x15\xbe\x0e\xc5\x10\xbemW\x81<\x8c\xaeG=\xc6\x1e\xf6=\xce\xb0\xdd<\xa5\x03\xaa\xbd\x859\n\xbdSf\r>e\xf189\xd6\xbfx=\x951\xb1<\xca-\xe3=t\xeb\x97\xbd\xc1\xc4\x96=\xb6M\xad;\xb4#E=\xac\xf6\xa2=\xa7\xb0(>\x8a\x91\x10>\x84\xfd\x14=\x81\xea\xbe<D|6=\xa5\xba\x97<G\x1b\x03>%\x1d\x07\xbc\xe4f\t\xbe\x88\xaa%<\xac2\xbf=0#/\xbc\xeb[\xc3\xbc\xcc\xfe\xb1\xbd%T\xae\xbc\xf7\xf3\xbf=\xac6V;=A\t\xbd\xc6\x9a*=\xea*$<\x1a\xcf\x0c\xbd\x1cx\r>Kw\x01\xbdU\x16-\xbd\xd5\xbbe\xbdTg\xc6\xbc9J\xb5\xbd\x8f\x0c\xec;r\xfaA=qk=\xbd\xe6\xe44\xbc\x08\xcc(\xbd9\x9a\x9d=\xf3f\x88\xbdEc\xe1\xbd\x8c\xe6\xfe:\xe7\x16?\xbd\xfa\x0f"\xbd\t]\x16=\xa7\x9d\x01\xbeh\x84\x9c<"\x9f\x04>\xde\xb9i=\xff\x9fB=H\xe9\xf5=%\xcc\x1f=\x9a\xe75\xbd\xe5I\xc2\xbc\xd5ou=\xd0U\x98\xbd\xfc\xe3\x8d\xbd<d\x8c\xbc\x83\xe7\x0f>\x83\x0c\x14=\x84\x01\xaf<H\xe6,>\xe2\xfb\n\xbc3\xb3\x17>yTv\xbdb\x83\xb8\xbb,\x0e*\xbeYI\x8a=T\x80\xbc\xbb\x0fh\x1b\xbd\xa6\xa8J\xbe:\x08#\xbeG\xd2\x94=\t~\xb0=\xa4\xd0\xee< \x1e\xb8\xbd\xe1f\x0b\xbc\x8a%\x9a=\xa42\xb5\xbdK&\xb5=F\x08\\\xbdN\xf7\x85\xbd\xbf<?\xbe\xf3\xba\xf9\xbd\xa7\x95\xb2\xbc\x8f\xeb5\xbd\tSW\xbd\x95Hx=u\xb6\x93=2\xfbz=r<\x95=\x8a\x8f\xa2=(Z\x8f\xbc\xb1\xd6,<\x8dy\x02>\x0e\x85\xb7\xbdn\xffs=b/\x19=\xbc-\x98=\x89W\xfa\xbd\xadR?>\xd2\x86\x87<3D\x8f\xbd\xa5 [=\xd8#\x99\xbd\xf43p\xbc\xc8\x10\xe6=\xa3\xd4^\xbb5\xc4\xc4=O\x8b\xcc=\xee\xdd\x93=\xcc5\x19\xbd\xd7\xd3\x03<\x89\x90\xd9=8GO=\x93\xc5\x83=\x9a\xe9B>\x00\x1b\xdd\xbd\xb1n\x19;\xad\xcf[=`\xf3\x10=]\x8f\x00;\xd0\xe4\x9e\xbd7\x87\x91=w2j=\x86\x9a\x96=V3\xb0<\x92\x94\xe0<\xb6+\t\xbe\xb7/\xcd=8\xa51<A\xfe\xbc<x\x94;>m!I=h\x96\x1c\xbc\x00C\xf2\xbc\x81"\x11\xbd\x8b\xb8\xb2=\xc5\xb8C\xbd\xc9\x96\xab;\xc2l\xae<\x1d\x7fd=\xbc\xe3k\xbb~0\x19=\xd9S\x05=6\xd6\xab;\x8dI\x83;HQ\x08=i\xbf\xee\xbc\x98Z\xe5\xba4\xf4\xf4\xbc\xb6_\x01=\xee6\x9b\xbdo>\xf4=)\xda\xbf<<Q\xec\xbdY\x99\xff=9z\x8c<\xe5S\x85=\xedo$>\xcd\x0b\x7f\xbdJ\xe3-<\x95\xdc\xe1\xbc\x145\x89\xbd\xd9\x96\xdf=\xa2R\xcd=\xfa\xad!\xbc\xa2-\x04>tnx\xbd\xe7\xb1U=P;\xf4<\xd4%\xe8\xbd\x0b7\x0e<-\xb3\xc3\xbd4\t\x1e\xbe\xff\xd4\xb9\xbd\xeeU7\xbcb\xa7\xb9\xbc\xb5O\x1c\xbe}\x04\xea=\xc3\xbbK\xbc\x96S-\xbd-M\xa7\xbbAl\xd6\xbd\xf4\xaf\x12\xbd\'\xc16>\x11\xd7c<\xe3\x17\x8d<\xe7L\x15\xbe\x0e\xc5\x10\xbemW\x81<\x8c\xaeG=\xc6\x1e\xf6=\xce\xb0\xdd<\xa5\x03\xaa\xbd\x859\n\xbdSf\r>e\xf189\xd6\xbfx=\x951\xb1<\xca-\xe3=t\xeb\x97\xbd\xc1\xc4\x96=\xb6M\xad;\xb4#E=\xac\xf6\xa2=\xa7\xb0(>\x8a\x91\x10>\x84\xfd\x14=\x81\xea\xbe<D|6=\xa5\xba\x97<'
-p524
-tp525
-bsV445260035162382336
-p526
-g2
-(g3
-(I0
-tp527
-g5
-tp528
-Rp529
-(I1
-(I400
-tp530
-g12
-I00
-S'\xa4I\r;{\xb6\x02\xbd\xc1M\x82\xbf\xa1\xe6\x95\xbery\x13: -E\xbfj%\x87\xbep\r\xaa\xbf\xed(\xf4\xbe:XE<\x95y\x9b\xbe\xb4\xb0>\xbf=bf\xbf\xaf\x92\xa7\xbd\xcb\x80L\xbe_\x174<[\x97\xe3\xbe\x85\xfb\x1c\xbfu\xbb\x84\xbf\x07\xe5W\xbfB:4\xbeeX(\xbe?k\x04;\xa3l\xe3\xbd\x11\x08.\xbf\xc6O\xcd\xbd4\x1f\x83;`/M\xbf\xf7|\xe7\xbeK\x08\x1f\xbf\xac\xf2e\xbfg\x89\xa3\xbf\xdc\x7fl\xbe\x1d\xa5\x90\xbf\xb57z\xbe\xe3\x97f<\xb3\x14O;T\x04\xd5\xbas(\x87;\x95\xa6(\xbea_\x90\xbf\x85\x80\xd0\xbf\x9e\x95\xef\xbe\xa3U?\xbe\xf4E\xbc\xbf\x1d\xf3\xee\xbe\x92\xda\xee;.\x15\xbb;\x89\xbf1\xbe\x08qC<\xfe\x1fL\xbfu7\x10<\x16+5\xbe\xd5l\x10\xbe]\xb6\x8d\xbf\xe2\x9f\x07\xbf\xfb5\xa4\xbd\xd4xs\xbd\xa1\xe2\xde\xbf\xa5x\xc3\xbfK\xac.\xbfsH\xec;\xa0\xeas\xbb\x95ui\xbeH\x14\xf5\xbc\x02\xc83\xbd[K\xed\xbeE\n\xb5;\xf8\x82\xaf\xbd*0]\xbf\xed\x08\x04\xc01\xc8A\xbf2\x1e\xb7\xbfu\x06j\xbf\xb5\xfc\x80\xbe\x95\xde\x8b\xbe\x90\xd5_\xbfQ>\x07<%(\x19<\x10\x10-;\x96\xe3\x87\xbe\xf4\x9fT\xbb\xf7\x91\x87<\xefMu\xbf\x05\\\x91;\xab\xb5v\xbeu!F\xbd\x13\x87a\xbf\xdaI\r<\x0b*N\xbf\xab\x1cP\xbf\x8c\x94:;a\x84\xb0\xbf\xfcY6\xbfeY(:\xb5s+\xbep\x10\x0c<\xcer\xcb;o\x92S;\xd6\xe3\x8f\xbf\x0c\xdf\x1c\xbf\x95\xa7\x9f;\x02b)\xbd\x80\xcd\x8d;\x0b\x8f\xc0<\xa3\x8d\x9e\xbf\xdfth\xbe\x91\x8a=;\x98\xd2\xb3\xbe\x80P#\xbe\xcbc\xed\xbf\x99\xb8&\xbf\x82\x1b\x96;\xfc6\xc8;\x94\x8b/;\xc3\xe1y9\xea\xfd^\xbf\xcc\xf8^;X\x88\xa6\xbe\xedY\x12\xbfx\x0b\x86<nJ\x15\xbb\xaeq\x1c\xbf\x8458\xbe\xffa+\xbf~\'\xff;Gb5\xbfF7\x10\xbc\xd1\x1eJ\xbe\x84V\x0f<)\xfcU\xbe\xb9\x07p\xbb\x0c\xa4j\xbb\xe9\x80V\xbf\x9c$\xdf\xbeT\x9a\xfc\xbe\xabu(\xbf\xa3<\xf9\xbd\\\x12\xe9\xbf\xb7\xe3p\xbf\xd3\xe72\xbf\x9aQh\xbd\x7fi\x85\xbbQ\xc0\x91\xbf\x01\xede<\xfb\xd8\xe8\xbd\xb8\xeeO\xbf\xaca\x80<c\xbeO\xbe\xdc\x18\xc2\xbaTB\xc0\xbc\x91+\x16\xbe% u<\x17P;\xbf\xc2\xc4\xaa\xbe\xe2:\xb8;N\x87\xfe\xbe\xa4\x14\xa3;\x95[\x82\xbb\xadC.\xbf\x15\x8f\xd8\xbf1V\xa5\xbf\xf3\xc0\xc2\xbf\r\x8cX\xbfPW\xac\xbc1R\x12\xbdea}\xbf\x1c\xbbJ<*\xc1@\xbda\x92\x15\xbf\x15\xa3\xeb\xbe"\xec\xa5\xbfak\x8e\xbf\xc5\x1e`<\xa3|\x13\xbem\x9d\x0c:\x17\xc7U\xbf\x8a3\xcf\xbf\x8f\xa6\xc0\xbc7g\x06:\r<E<s\xc8\xcc\xbe\xfa6\x03\xbf\xe1\xaf\xb9\xbe\x97\xc0\x88<\xfco\xd9\xbb\x13\xe9\x9e\xbb\x9c\xd5\x1e\xbd\xeb\x10q<\xd07\xff\xbe\x82\xe4\x98;\xba7\t\xbd\x8c1\xba\xbe\xfdG\x03<\xd3\xdd\x83<\xbaM\x8c<\xfb`\xb5\xbfP\xe3\xd6\xbdr\xa2\xc0\xbc\x0e\x96\x84\xbf!\xef\x0b@\x0co\x16?\x9d\xde\x94\xbb\xb9\xfc\x02?\xa6\xd8g?\xc2;\x8f>\xb9\x920=:$A\xbb\x13"\x15?4:C?\xc9+\x1a>\x1c\xfdr>\x10\x12\x9b>\x93r\x1b?\x8f\x96+>\x82\xbf\xf4?\xd6\xbe\xc5=E\xbcU:-\xb5\'\xbb\xd8\xee\xec\xb9q\x97z?\xa3\xd6\x00>4\x8cl?\x8b\xe9[?\xa2#\xa0=9-\xc2=\x7fR\x1d?\xb0#\x91>\xa6\x83\xdb=\xde/\xcf>:\xc7\xf7\xbb:\xf9\xca\xba\xd3|\x97=)\x17\t\xbc\x05\xcd\x84?\x94\xf6\xe1?^#\xf4?\x1a\x06\t?\xe7&v?\x83\x06\xc6>&b\x10\xba\xa6Lk;\xb4\xb8[>\xa4i\xbf>\xf3I\x9f\xbb\tW\xca>W\xa4\xa9?6rD?:h\x84>W-\xb0?\xe7\x08w<]\xb5\xc0>\xf5\xdd\xc4=\xe9\x86<>\x12\xf3\x93\xbc5k\xea=f\xbc\xcf>\x7fW\xfd>\xb2\x86\x99\xbc60,\xbc|j!>\xf0\xe5\xd5?\xa7\xd7\x8a?\xe1M\xa9>\xe5\xb7\xb8>\x8c\x1c\x82>``p>\x0br\xc4?\xb8\xd3\x1b?\x90u\xe2\xbb\x96\x00\xe2\xbbP\xcfJ\xbc"j2<\x1f\xbfV=\x8cm\x0c>g|\x07>~K\x02>=\x9b:?\xb3y\xc0?\x95\xf88?\xe3\x07\x0c?\x9ax\xb4>a-!?X\x1c\x06\xbc\xe0\xf5T??\xa8\xd2=\xe9\xf7I?\xea\x968\xbc\x0e\x06\xee?\xc7\xdb\xfe<\\\xba\x9d<\xfa\xf9\xb9?\xe0y&;S\x08\x12=\xecC\xad?\x98\x0f;?\xad\xd2\n@\xdd\x1c\x88?Q\xf9\xb1>\xdc\x90\xca:\xa45\xad=g\x82\x89?\x02\xca\xbe>\xce\'\x1c?\x08\xc1\xc7?\xc5\x9b\x15\xbc)\x14\x1c>`\xb2\xb1?(\x8b\x94>t\xc7\x86>c|\x0b\xbc\x8b\xd2V>|\xc4\xaf?D\xc0\x83?Y2\xd2?o\x96\xca>\x16\xcc.\xbc\xb8-\x07?]QM=\x88\xcf\x9a=\x7f\x07n?@\x86\xf7?\xc7:\xf5>\x86\xdax=!\x92\x06>\xa0\xa6\x89?\xc5xH:\x9d_\xab?\x0c\xef\xdd>X\xe3\x1d?\xb9\xf2\xa8>Xm\xd2?\xe2\xbcS?(\x16\xa6<f,\xc9>\xd3\x8f\x90>\xdfN\x13;O#\xe8>\xab\xd3g\xbb\xa0Hf=i?\xda\xbbk\x06H?\x01\xf5\x85?:X\xa4\xbb\xb9Y\xb4?g\xc3\x03?\x08&\xf8=*\xf3\xd3?\xe7T\xfa>\xeel|?\x00,\xa4??C.?5\xb3>?\xcf\xd9\xb0>\xf2C\xa5>\xe4\xdc\x81?\x9aM\x90\xbb9l8?}\xeb0?\xbf\xa43=\xb7\xfe\x1e=[(\xb3\xbb.\x97b\xbc\x84q\x00\xbc\xedNp>\xdc\'~?\x9a\x11\x1b\xbc\x97\xce5?\'\xe0@?\xae\xa3??\x87\x93\x85:\xd4v,\xbcmUh\xbb{\xa56?/G\x08?"\xaf\x94?N^\x8a\xbcZ\xf3/\xbc\x9bj\xe4?=q\x91?hp8?\x1a\xcd\xdf<\xe0m\xf2\xbbz1\xf9>P\xb5\xdb?\xd4Q\x1f?\x0c\xa0\xd3?z\x1cx>\xb3Y\x13?\x82\x16\x9f=\xfe-\xa3?\x82\x9c}?\xbb3\xf6=\xc8T^?\x0e0\xaa?s\xfa\x83?\xb8\x03\xa5=-\x1e\xad>\x1aL\x0c?\xb7,\xa3='
-p531
-tp532
-bsV474175488634531840
-p533
-g2
-(g3
-(I0
-tp534
-g5
-tp535
-Rp536
-(I1
-(I400
-tp537
-g12
-I00
-S'\xd8\xa8\x8d;\x1a\x02Y\xbc\xc7L\xa5\xbf\xc3\'-\xbf\xc0}W;\x8a\xa2\x18\xbfk\x17z\xbd\xa8\xe4\x8e\xbf\xe3\xec\xed\xbe\xb0\xb1\x05\xb9\xfdS\xb4\xbe\xed*\xe7\xbe%\x93\x88\xber<w;:\x9d\xa1\xbe;\x1dX;\xa7\xaa\xd7\xbe\xf91\xe3\xbe\xdc\xd3\x9f\xbf \xadu\xbfB:4\xbe\xd9\xaco\xbd\xef_\xb0:\x1a~\xd6\xbd\x94%\x9c\xbcF\x1b\x07\xbfqX\xbd:\xb0\xc9?\xbf\x00\xba\xd9\xbe\xf0"&\xbf\xcb\xf1|\xbf\xe7\x96\x84\xbe\xd6\xa6\xa9\xbe\\I\x9f\xbf\xabl\x00\xbc\xf2D\x05\xba\xf1\x8c\x12;\x7f\xb2\x9a;\xf0\x9a\xf6:h57\xbf@Y\x9f\xbfz\xa5\xbc\xbfo\xdax\xbe\xa3U?\xbe\x8a\x8f\x81\xbfI[\x08\xbf\xddxc;b\xcc\xd1\xbeg\x8d<\xbe\x1c 9;\x81O\xb8\xbeB\x98\xf0:%\xd1s\xbe}E\xdb\xbc3D_\xbfm\xd9\xd7\xbe\xcf~>\xbe\xa5\xd5\x11\xbf\n\xa8\xbf\xbf\xbf:\xba\xbf\xcd\x82\'\xbf*\xa7\xbe;\xbe%\xde;\x8d\x9e\xbc\xbe"\xee6\xbcNq\x05\xbe\x02\x9a<\xbf\xc6\n3;\x87F\xe6\xbd-\x93\x14\xbfT\xca\x9a\xbf\xf0\xe3{\xbf\x1e/&\xbf\xf2|\xcd\xbd\x87\xac\xf8\xbd\x1fK\xfd\xbe\xdd\x99\xb2\xbe\x1c\x80E9\x02\xa2\x87:\x924c;\xe5n$\xbd\xa7\xef\xa0\xb9E\xe3M;\xae{4\xbf&\xa1\xc0:\xec\x06z\xbe\x02t\x97;:hA\xbf8\xe3[;o\xa5}\xbf\xf9\xf4\x9b\xbf\xdd\x0b/:~\x1a\xa8\xbf\xa0\xddy\xbff.F;\xc2\xcbJ:\x83\x14\xc6;47\xb2:<?z\xba\x16\x8f\x98\xbfWs\xe4\xbc\x15:R;\xd9 \xe8:\x88\x9a\xde9w\xf4`:e{_\xbf\x0eA\xc9\xbey\xe4\xe4:\xf1\xb9\x17\xbf\xec]L;\xbf\x1f\xb4\xbf\x08\xf0\x03\xbf\xac\xe4\xde;\xb4r\x1f\xbd\r\xe9\xa2\xbe\xe1\xdeR\xbe\xe0_\x84\xbf\xbb\xbd;;_>|\xbe\x16\x0e\xae\xbeP\xeb\xf18\xe2\xa1(;6\nA\xbd\xdc\xa9\r\xbe#\x05\x9b\xbe\x80\xdd\x1b\xba\xec\xb1\x10\xbf\x13\x07m\xbc\x10{(;\x05d`\xbe\x12\xf9K\xbe\x85\x8e\t;\t\xf3i;\xc1\xd8L\xbeX\xfa\x00\xbc\xac\xa4\xf0\xbd\xf8\xf4O\xbf\x8c<\xbf\xbc\x9b\xab\xa0\xbf\x8b$:\xbf\xa3\xf04\xbf\xa5\n\xaf\xb9H\xcd\xfc9lL\x8a\xbf\\\xe3\xe88e{\x92\xbc\x0b\x10\xf0\xbex0\xbe;~\xbd\x16\xbee%\xc5:\x9a\x07\xcb:&x9\xbe\xe3_\xba\xbb\xce\xc2*\xbfW\xed\x1a\xbe\xc9%\xe1;\xc6\x891\xbf\xbe\xa9\xe7:0\x9a\x0c;ek\x14\xbfTp\xbe\xbf\x92\x97\x7f\xbf\'h\xc5\xbfK_4\xbf\xcb\x9f!\xbd1R\x12\xbd\x84L[\xbf>\xcf\x8f\xba/\xc7\x00;\xf5\x93A\xbe\x81\xa0p\xbeT\\\x85\xbf7\x8c\'\xbf0\xee\xed\xba\x97<\x83\xbe\xa9\xd1\x9f:\x8c1H\xbf\xbc\xb2\x87\xbfi\xc6A<_\xce7:ZMo;\x03\x96U\xbe\x94*\n\xbf\xd2\xee\x9d\xbd\xbd!\xb9;x\x9e\x87\xbe,\xba\x939\x8dj\xb4\xb9\xb0\x88\x00\xbd\x973\xf8\xbe\xc5\x10{;\xf1\x95\xc1:~\xab\x8e\xbe\x0c\x18\xab:<W\xbf;\xfa\xdb\x9d\xbamE\x98\xbf\xb2\xef\xb8\xbd@/\xcd\xbe\xc5]~\xbf\xbb\x9a\xcd?0D\x0c? \xee\x9d\xba\xc9 \x89>\x0bS\xb3?a\x9bM;\xa6\xfa\x02?\x9f\xcf\x08\xbaKk\x8b\xbb\xedo"?\xf6\xf0\x19>\xe0m^?/\xd1\x1c>o\xd0\xce=\x8bJd>+\x89\xba?$\xe7\xa4\xba\xd2\xeaV>p\x9f\xda\xbb\r\xb6Q\xbbU\x1e\xc4>\x85\xad\x82>gUX?\x13\\$?\x05z\xaf>\xd0%*\xbb\x8b8$?\xdd`\x18>\xc2vE>\x03\x0bg>xc\x81>\xa2V\x9a:\x9b\xa9\x84=\x9a[\xd2\xbb\xe8S\x9f>v/F?\xd7\xc1\xb7?\xc6\xb2X?\xe1\xe1g?\xf6r\x98=j\n\x8c\xba\x8a\xe4\x0c\xbc\xb4\xb8[>\xc9k\xc5>~(\xc3\xba\xaf\x1d\xa2<\xc7Ud?\xf8M\x14?\x9f\r\xce>_\x8f\x98?\xf9<j<\x89\xddU?\xf7\xd6\x11>\xe7}k?.\x18d\xbb5k\xea=6=\xd1>}\xd0\x80\xbb\xadY\xe8\xbb\xf5\x0e~\xbb|j!>\x99\x15\xb2?\x85\xf1\x9b?#\xae\'>kRT?\x0b\xf8\x10>\x7f\xf7I\xbbD\xb7\xb0?$wj?\xfe\xdf\x07:\x06\xd5\xeb\xba\xdd9\x0f;\x81\xf9\xc09q\x9a\xeb=\xe2t\x1a>g|\x07>\xd1\xe6\xdb=\xe5k\xbc>\xb8{p?\xearX?\xd9w\xd2>4\xa9F?\x1eG\x16? 0&\xba\x96\x9c8??\xa8\xd2=\x02\xbf\x86?\xa8\x05@\xbb\r\xb9\xe8?\xfb*\xfe;-\xe5\xa8\xbbh\x13=?\x8d\xce\xf2\xbb\xb5\x08\xd7\xba\xe8l\xac?\x93H\xf4>\xc3\xa9\xc7?\x1a\x80\x96?G\xae;?\xa8\xf4\xe3\xbb\xefW)>\x1dC\n?\xd5~\x01?\x84}2?\xd2\x88\x91?\xf1\xf7\x81:\xf3\xcb\xd8>\xd2^~?\xc0\x14L>N\xaa\xbb>\x83tl\xbb\x8b\xd2V>X\x10o?\x9b\xac\xe3>\x11\xe9\xcb>\xdb\xe8\xb4>\xa1\xf8v\xbb\xb2\x03\x17?]QM=m(\x9e=\x16\x8f\x99?\x9eo\xa5?\xa5\x84\x98>\'\xb6\n?\xed\xcd%?o\xba1?\xdd\xa5 \xbb\xc2\x95\x7f?\x80\xa4\xdc>\x00\x8a0?e\xdc\x1b?+Z\x82?\x8ch1?\x80\xfb\x99<c\tn?\x1d/\xa5>\xc6\x16\x8f\xbb\x82\xb4\xd7>\xc8gA\xbbF\xf2\x0b=\xe3QR\xbb\xe1\xa4<?\x96\x9a\n?^\xfc\xed\xb8a?p?\x10R\x96>\x08&\xf8=,\xb9\xde?\xcd\x161<Qhm?\x03\x91\x0e?b\xd4\x1d>m\x8aB?\x7f\x14\x9d>\xf3\xd9\xe9=g\xbd\xb8?\x07P\x97\xba\xcb|%?\x89\xe9/?\x0c\xac\xa2:\xfe&\x8d<\x83\x83C;\xddl\\\xbb>\x90%\xbbf9\x03?\xaa\x15=?lA\xd69\xd8\xfe\xf6>\x12\xae\x1f?\x94\xe6\xb7=C\x10\xa1>6\xab\xb1< \x95\xae:w\xff\x86?]\x1d\xa2>\x0fM7?\xadU\xd6\xb9;L]\xbbi1\xf2??c$?)\xbc\x94?w\x1b4>]i\x1e;\xcd\xd20?n2\xca?v\x17\xa0>\x07b\x97?\xb8\xdd\xb9>v1\t??~\x85>\xa2\x96^?\x16Ay?\xbb3\xf6=\x8a\xe8\x16?"\xc8\xb7?\x13&\x16?\xa8\x9d\x0f=\x01+\xc4=\xbb\xa1\xe5>\xb3\x11\xc6>'
-p538
-tp539
-bsV445260234181718016
-p540
-g2
-(g3
-(I0
-tp541
-g5
-tp542
-Rp543
-(I1
-(I400
-tp544
-g12
-I00
-S'\xb6L\xc2;OT\x17\xbf\x1al\x8a\xbfP\xcf:\xbf+\x05\xcc:}cp\xbfk\x17z\xbd\xad\x02\xb5\xbft\xe92\xbf\xe9\xaf\x0e\xbey\x13(\xbe\x9b\xd5\xa1\xbe\x19\x94\x83\xbc\xd2\xfa\x86\xbd\xf6\x83V\xbf\xf6\x06L<\x0f\x83\x8a\xbe\xd8L\xd1\xbe\x97UC\xbf\x0e>\xab\xbe\xc7\x13\x02\xbf\x0c\x1c\x05\xbey\xba\x98\xbb\xbai\xaa\xbfL\x80(\xbei\xa0\x1e\xbf\x00\xb0\x96;eu\x93\xbf\x9d\xd7B\xbfI\xa51\xbf\xbf\r\x14\xbfU9\x89\xbe\xd5\x8a\x85\xbc\xae\x84{\xbfw\x92\xb9\xbeX\x04h<v\x08\xf0;\xf9\xe0\n\xbb>\x8d\x18<d\xa0\x8e\xbe!\xa6\x1f\xbf\x02\x8c6\xbfz\xd6\xde\xba\xae\xbc\x06\xbf\xb1\x0c4\xbf\xdbF\xdf\xbe\xd7\x8eU<\x14\xfe\xcb\xbe\xea8\x84\xbb\xf8\x99P<\xe2t\x84\xbe\x05#X<\xa1_0\xbfy\x18(\xbc\x87\xb5\x93\xbf\x1f\xa7]\xbe\x84\x8c7\xbd+\xf2!\xbf!e\xe5\xbf\xfd\x84\xa7\xbf\t1d\xbb\xd8L1\xbd\xe9\x0f\x9e\xbc\x07\xf5\xf6\xbe\xeb\xe4:\xbd\xbd\xcao\xbe\x87\xbd3\xbf\xf4\x87\x17<\xdb\xd2\x0e\xbf+\xa2`\xbe\xd7\x10\xc1\xbf\xa61(\xbf\'\xeee\xbe\xb0\xc3\x96\xbe\x98xr\xbfcsG\xbf$GF\xbe\x14\x7f\x0b<\xa0Eb\xbd\xa9\xbd$\xbc\x8eP\xc9\xbe\x909\xe5\xbe\xd7\xba\xdf;\xe6\xb1\x83\xbfO6\xa2;A\xc9\xdb\xbd\x16v\xa6:\x94\xdeb\xbfg\xd63<v\x02\xa4\xbeu\x84>\xbf\x93V\x91;\x16\xf7\xa8\xbf\x04\xc9\x10\xbf\xb9\xab5<\xab\xa1\x8b\xbc\xb9\xc9\x01<\x97]\xbd;z\xf7\x8a\xbe\x06\x8f(\xbf\xb48\xc2\xbeyt\xf0;\x83\xf3\xca\xbc\x7f\x01\xd8:\xf2\xdd\x8a<\xbc\xe6A\xbf\x19\xc6\xe1\xbd\xdb\xa7j;>]\xad\xbe\x9c(\xbf\xbe\x91@\xaa\xbfk\x05\xc0\xbe |\x97;hX\xb4\xbcz\x10\x05\xbf\xd0\xf1f\xbe\xbenb\xbfG\x8c3;G\xaa\x9a\xbe\xbd^o\xbc\x15\xceP<\x16\xa3\xa5;\x1c\x8ae\xbe\x18\xcd7\xbe\xf1\x8f\xdb\xbd:\x9f\x05<\xde\x85\x95\xbf\xed&O\xbeh\xf8\x85\xbciz\xcc\xbe\xed5P\xbdF\xcd\\;\xc3GZ\xbb\xccUA\xbd\xc8Dq\xbd\xfc\xf6\x07\xbf9?\x03\xbf\xe2\xc3\xda\xbe7\xa5\xac\xbe\x84K$\xbf\xc2\xb4\xdf\xbe!\xb5\x13\xbf\xc1\x8e\xa0\xbcgfy\xbf\x80a\x17<\xdb8\x15\xbfK\x0b6\xbeQc\x93<%\xc3\x0b\xbf\xca\xd6\xd1\xbe\x1dJ\x07\xbe\xbf\xc9\xd9\xbe\xcae\xd4;c\x01\x18\xbe\xd8\xa7\xd4\xbe\x14#0<\xff\x8b\xc9\xbe\x11Mq;\xf7p$\xba\xee\xb7\x9b\xbeZ\xf5`\xbf`\xccX\xbf\x89\x8eh\xbf\xdaDc\xbf_\xe0t\xbe\xfe,\x8d\xbe\x17\x97\xa2\xbf\x9c\x98P<\xfb\xb2G\xbe\xb6.\xfa\xbd\xf2\xe1\x13\xbeG\xdc\x14\xbf\x06\xf1\xbf\xbe\xca\x0b\x8d<u\xb9\xff\xbc\xbd\xe6\x8c\xbd\x1f@O\xbf\xc5\xd4\xbc\xbf\x86T\xa5\xb8\xce\x03\xbf;\x0c\xb8d<\x8c\xc9B\xbe3\x95+\xbf\x0caK\xbf"\x07i<\xa8\xe8\x9c\xbe]\x9d\xa5;\x02\x8b\xe6\xbc\x18\x0f$\xbcB\xcb\x01\xbf\xa7\xdb\x87:\xbfy\xb3\xbc\xb0Hh\xbe\x8b\xbb8;^\xc8m<+\x8dl<\xf6\xec#\xbf\xb2\x1e<\xbeO+\x9a\xbe\xae\xaa1\xbe\x18\x85\xb9?T\xb3\xe1>\x1d;\x0b\xbc\xd7\x1b\x1a=u\x01\x95?M\x00\x86>\x8d\xf6\x17?\x8d\xd3\x89\xb9S\xad\x9a>\xd1\x19W?\x91\x03\xff=:rN?\x9e\x1b\x1a?k\xfe\xfb>K\x83\x97:x\xb8}?\xb5\xedB<\x1dJb>\xcc\x81(\xbb\xebM\xb3:\x94\x03\x8c=\xc0)\xfa>\xd9\x800>\x16\x91Q?\xaf\xfc\x97>\x9c\xf7\xaa\xba\xc9lY?M\x87\xc2:P\xe1-\xbc$\xe9\x87?Q\x03>>\xa4;*>\xd3G0>2\xbdM\xbc\x07O\xed>\xaan>?g/Z?\xfb\xacz?\x87V\x81?\xb6\x9e4>\xe4f\xd1\xbb\xd4\xa6\xda<\nf\x8f?\x82\xad\x02\xbb\xf0\x85\x9c>_\x18\t=\xa6\x1d\x8e?-\x12/>\xf5\x9c\x95>\x11\x84\xb7?+\n\xb7>j\x9d\x80?\xa2>z=\xd8\xa8\x17?|Ie\xbc\x99\xe0\x04?\x14\x80\x05?\xfaV\xa8>\x971\x8e\xbc\xecl;\xbcR\xe4&?\r\x01\xad?\x04:\t? \xe9\xb7=4\'\xce>\xe5g-?\xfawv>\x8e\x10\xb3?@\xff0>\x94s\x99=\x82\xd6@\xbc\x17:,\xbc\x08\xcc\x8e=,\xad\xb4>\xc79+>;\xb8\x06?\t~M?\xbdC\xf5>\xad\x9e\xc5>\xa5_\x90?\xfd\xb9\xa0=\x0f\x93\xd9>\nE\x80?\xa8\xbcN\xbc\xc8\xed@?T&\xf2>gy{?\xec\xdd\x9c=?\x02\xc9?\x86\xec\xe1=\xfc\xf8\xf2\xbb\x1e%R?\xea\x89u:\x16\xf0\xe7=\xf0[~?:\xb3S?\x7f!I?=\xf3\x87?\xfd6\x0b?`\xc9\xa5\xbb:\xf78?Q\xd9W?\xa0\x96\xce>\x00M\xfe>\xdb\xebF?}a\xd4\xbb\x96\xe6\x1a?\x94dj?\xb3\xbb\xba=\x1cF\x18?.\xe67=\x00\xae\x87?\x99Gh?\x9b\xe4\x97>\xcf\xde\xce>\xcb\x90\x93>b\xa98\xbc\\\xd2\xb2?U\xfb\xb0=Ce\x18?\xeb\x12\xa2?\x10M*?\xdfK\x17>\x0e\xf2\xe0>u`\x02?\xe3\n3?.d\xd8\xbaL\r\xae>\x07\xbf\xf4=i}\xa1> 9\xe2>\x86\xbce?n\xa4r?G\xb1e>\xb6\x8e\x94?5C\x02?\x84\x89\r<\x0fk\x91>\xaew\xc7>\x8b\xcaV=\xf2\xe1\xd0\xbb/[\x88?!iU>u\x9a\x1a\xbco6O?in;?<B\xed>\x98#c?HQ\xd7\xbb\xceR\xdf>\x10\xd5>?\x1d\xd0?\xbb_`\x17?Y\x1d ?\xd3W\x1a?\xad:\x8f?\xc6\x1fy\xbb\xa2|L?U\xa9\xb6>\xa3\xc4v\xbc\xbc\x8a\'=\xd8 n\xbb\x0b\x043\xbcP\xa1:\xbc\xf5#h>\x16\x92J==h6\xbc\xa2s\xc3>\x15\xd0\x15?\xd2\xf7\xe1>\xe4\xa0\r?\xaa=\x95>3\xd5(>\xad\xf4\xa3?\xb2H\xea>\x02\xe7\xad>d\x1b2\xbc\x9c~\x04\xbc\xd4`\x91?Mw$?\xf5\x146?\xb0R\xa1>`\x1b%\xbb\x1c\xb1\x1a?\xf3?j?\x80\x7f\xd4=\x9d?p?F\xfe\xae>\x13\xeb\xf1>\xe20\x07?c\xa7k?=\xff(?g\xe7\xa6>\xe7\x8dH?T5\xcd?;^)?I\xae\x8e=~xH>\xe2\xaa\x1a>\x8b7\'?'
-p545
-tp546
-bsV445258044860289024
-p547
-g2
-(g3
-(I0
-tp548
-g5
-tp549
-Rp550
-(I1
-(I400
-tp551
-g12
-I00
-S'mI!<x"\x14\xbe\xc7L\xa5\xbf\xc3\'-\xbf`\xcc,\xbb\xf4\xd6_\xbf\xa4To\xbe\xa8\xe4\x8e\xbf\x13\xa5\x1a\xbf\xa0\x8e9\xbe\xb6\xf5\xc0\xbe*g\xa0\xbeH\x0e[\xbf\x86\xc3}\xbe\x9f7\x07\xbf\xac\xb6\xb7;K"\xb6\xbe\x97s\x16\xbf\xdc\xd3\x9f\xbf{\xcd]\xbfB:4\xbe\x1f\xe3\x81\xbey\xba\x98\xbb.\xa5\xdd\xbe\x8b\xeb\xfe\xbe\xf7s\x19\xbf\xa1g\x10\xbb\xb0\xc9?\xbfS8\xd6\xbe\xbc8\x1e\xbfsg\x8d\xbfNn?\xbf\x1cw\x94\xbeq\x83\x95\xbf>[\xe2\xbdt\xf8\x89;$\\:<\xaf&Y;\xaa\x1b\xc2;\x85\xe3\x1c\xbf\x99b\xa4\xbf\xce\xfd\xad\xbfO+ \xbe\xebsj\xbe\xe4\x13\xc6\xbf#\xb40\xbfbp\xd3\xbab\xcc\xd1\xbeg\x8d<\xbe\xdc\xce+;=\xb3\x94\xbeF\xfb\xd2\xbb%\xd1s\xbe\xa5\n\x92\xbd |\x8d\xbf5K\xed\xbeu\xb2\xd8\xbe\x84\x08\x02\xbf\x9cS\xfa\xbf\xbf:\xba\xbf\x80\x90u\xbf\xbb\xbee<\xef\x96F;\xff\xfd\xeb\xbe\xfe\xfb\x06\xbd\xbb\xb7\xb8\xbe\x972,\xbfT@\x03<\x0c4\x10\xbe\xd9q?\xbf\xc2\xb5\xed\xbf\xabH\x91\xbf\x14\xee\xc9\xbf\x141\x08\xbf\xb9\x89\xfd\xbd\x1fK\xfd\xbe\xdd\x99\xb2\xbe\'\x96(;\x03\x005<\x92\xa3\x90;\xf2X&\xbe.67\xbe\x9c\xad\xa0\xbeQ\x96\x1c\xbf\n\x97M\xbc6\xdc\x8f\xbe\n\xfe\x83\xbcy\x15\x80\xbf\x86\xe0";\xd3lz\xbf\xf9\xf4\x9b\xbf\xa3\x9bn\xba~\x1a\xa8\xbfHA\x82\xbf\x18\xa1\xd7\xbb]\xee\xd9\xbe*\x1c\x98<\xb1\xa0u\xbb\xf7\xe3{\xbe\x16\x8f\x98\xbf\xd1\x83\x80\xbe \xf8\x87\xba\xb6\xc1\x8a\xbe\xce\x0f\xfa:{\xd4\xe7;#\xa1\x94\xbfW="\xbf\r\xe2\xf2;\xf1\xb9\x17\xbf\xa9\xcf\x99\xbdP\xeb\xcd\xbf[]\x8f\xbe\x8f\xb1\x18<\xb4r\x1f\xbd\r\xe9\xa2\xbe\xe5\xe0y\xbe\xfb"\x8f\xbf\xea\x10\xde\xbb\xd1h\x1d\xbf\x94\x9d\xb6\xbeO\xc7\x9c\xbb\xbf\xe0\xf7;?\xda\xde\xbe\x1a\x08\xac\xbe\xdaC\xc8\xbe\x85\x0c\xb4\xbb\xde\x85\x95\xbf\xddLZ\xbev$\xd5\xba\x05d`\xbeFk\x1d\xbe\x01E\xd4;\xc0\xa7\x05;\x17\\\xd5\xbe\x97\xeb\xa7\xbe\xfc\xf6\x07\xbf\xad\xfa;\xbff\xde\x92\xbdK$\xca\xbf\x8690\xbf\xa9VQ\xbf$*\x0c\xba#\nb\xbdT6\xa9\xbf\xf6pu;\xa4g\xf4\xbe+\xc3 \xbf{\x7f\x8d<f\\\xb2\xbe\x16\x8c\xbf;\n\xff\x8d\xbe\xd738\xbe\xe3_\xba\xbb\xce\xc2*\xbf\xf7\xc4\x96\xbe\xceK\xf6;Q\x9fp\xbfs\x84\xc89R\xdc\x16;\xfd\xaeD\xbfkFq\xbf\xec\xea\x98\xbf\xf0h\xbf\xbf\xdb]B\xbfB\xde\x16\xbe\x9c\xc5>\xbd?\xb4\x80\xbf(\xd9\x0e\xbbS4\x08\xbeg\x11\xba\xbe\xe2H\x90\xbe-P|\xbf\x88\xd3W\xbf\xa8\x96 \xbc\xae\x9fq\xbez\xc3\xec;\xbf\x07-\xbf\x82\xfd\x97\xbf\xa6\x96s;\xe8e\x89\xb9Ri\x07\xbb\xc5%\xe7\xbe\xcd\x06*\xbf\xd2\xee\x9d\xbd\xbey\x86<x\x9e\x87\xbed5R;\xaf\xf6\xad\xbb\xb0\x88\x00\xbd)("\xbf\xe1ZG;\xc6n\x8c\xbbpM\xbc\xbe\xbf\x96/\xbdcp\x8b;\x1cn\xa7\xbdmE\x98\xbf\xf9\x89\xc3\xbd@/\xcd\xbe\x9a\xc9\xc7\xbf\xbb\x9a\xcd?\xe8\xecA?0\xc2\xce;\x8c\x85b?\x0bS\xb3?\xfd~\xfd=\xaf\x9f\x1e?\x85\x83\xbb\xbb\x08\x89u>U\xf9 ?\xf6\xf0\x19>\xe0m^?eU\x87>k\xfe\xfb>\x94\x86\xb0>+\x89\xba?\xe4\xbf\x11\xba\xde1_>t\xa9\xb9\xbb\xf6\xdc\x9c\xbb@\xe5\xc8>\xcf\xbf\xa5>\xaeZ\x97?c\t\xd2>\xb0?\xe9>\xfd\x0c\xf4=\x8a\x1cn?\xd8\n(>\xe0\xd2\x1b?e\xa7\x00?xc\x81>U*=;\x9e;\'>\xc4%\xcf\xbbH\xcd\xdf>\\\xac\x95?\xd7\xc1\xb7?O\xe0g?\x19\xa4\xb6?\xe9\x9c\xfa=\xfbU\xbe\xbb\xce\x05\xc6\xbbN\tT?)\xa4\xbd>6\xa3\x05\xbc\xaf\x1d\xa2<\xc7Ud?n\xf76?\x85v\xde>~\xe1\x93?+\n\xb7>\x9bIe?\xc2\xdeG>\xe7}k?\xb0\xa0\x8d;5k\xea=6=\xd1>\xfc\xb2)>D \x12\xbc\x0c\x97\x8a;|j!>ye\xaa?\x97\xa4\xbd?\xa4\x8a!>\xa8(%?\xfb\xdb|>\xfd=\x04<D\xb7\xb0?{\xc9J?\xc7\x8dT\xbbi\x8d\xa2\xbbi~\xa9\xbb;w\x1d=,\xad\xb4>v\xdd\xa1>\xb0c\xb1>\x98.\xb6>\xbdC\xf5>\x19\xde\xb8?-0|?\xd1\xd4\xd5>\x94\x1f=?\x08j\'?7\xdc\xbe9\x96\x9c8?~v\x96>\x02\xbf\x86?HG\xc9;\r\xb9\xe8?\xf6\xf2\x17=\t\xb6\xa8\xbb\xd0\xf5\x9a?\x86\xf3\x1d>t\xf4\xc5;\xe8l\xac?\x8a\xe9,?\xa7\xbb\xe3?\x1a\x80\x96?>nV?\xc9\xec\x1d\xbcY\xf76?]\xb0,?=\x00\xdb>\xb5Y3?x\x81\xc7?\xccg=\xbb\xf3\xcb\xd8>\x1f\xc2\x93?u\xf9\xbb>\xa3\xa2??o\xda>\xbc\x88\x8c\x11?a\x15\xca?D\xd7o?\x9b\xdbJ?*\x14\r?\xb0\x99A\xbb\xbf\xcab?\xa7G\n?EW\x08?\x16\x8f\x99?\xc5Y\xa0?\x1a\x98\x84>\xac\xbc=?\xed\xcd%?o\xba1?_\x9f3<_\xc6\x8c?\xc8\xbfD?\x04\xbd\x89?e\xdc\x1b?r\xa1\xb4?5O\x8c?G\xb1e>c\tn?\x1d\xe4\xab>\x0f\xcb\x95\xba7\x15\xe0>\xb8F\xc1=\xa1\x16j=2\x06\xd5\xbb\x7f\xd0\x80?!\x15H?55*\xbca?p?\x10R\x96>\xeas+>\x8c\x13\xda?Tc\xa5>{"\x85?\x8b|\xc5?b\x00\x1c?\x0c\x956?~i\x0f?\xe9\xf4\xd8>\xe8[\xaf?\x0b\xbd)\xbbro\x7f?\x06\x9e\x97?]6\xcf\xba\xf2\xd3\x1f=\x83\x83C;\x11Y\xe5\xbb\xbc\xfb\xb59f9\x03?\x06\xc6P?.\x85C<\x92K\x17?4\xbf\x80?\x91N3>C\x10\xa1>6\xab\xb1<3\xd5(>w\xff\x86?H\x1d\xd3>\xee\x91\x8c?H\xcd\x0c\xb8\xef\x0f\xf8\xbbi1\xf2??c$?#-\x80?\x9e\x08\x9c>\xb0\xed\x19>\xb3\xeb`?m\xfc\xc3?\xe6\x15\xae>\x07b\x97?\xfd\xeb\xc5>\xfcw2?-\xae\x04=\x10@\x92?\x14%\x8f?\xbb3\xf6=\x80\x95\x8f?T%\xb4?X[m?\x0c\x84\x19>\xfa\xe3\xd0>99\xac>\xb3\x11\xc6>'
-p552
-tp553
-bsV474168552585322497
-p554
-g2
-(g3
-(I0
-tp555
-g5
-tp556
-Rp557
-(I1
-(I400
-tp558
-g12
-I00
-S'Y\xae5<%\x1d\x07\xbc\x0bE!\xbf\x92j\xe7\xbc\xab\x05\xed;\x84U\xcc\xbei\x8d\x11\xbdKq`\xbf\xb7\xd0\x94\xbd\x88\x10\xdb;&\xf4Q\xbd\x80f,\xbe\xaa\xf2\xa2\xbe\xc0\xb3\x13\xbd\x9dK"\xbdn\x97G<K"\xb6\xbe\xe5\xf7\x9e\xbe\x9d\xb3\r\xbf=9>\xbf9J\xb5\xbd\x92\xc5\xb2\xbe\x10[\x8d;qk=\xbd\x84\xe1\x0c\xbe\xe9\xf1U\xbe"\x81\xdb:\x13d$\xbe\xc1\x0ev\xbe\x14\xc9\xd3\xbe\xa2\xfcM\xbf\xd8#\x14\xbf\x8e{\xb5\xbe\xc6\xa1\x80\xbf\xc5\xb8\xef:\xb1d\x05<\x9c\x90\xd1;\xd2\xf6w;\xd8\xf60<\xa7\xff\x95\xbe\x06\x9a\x89\xbf\xcb\xc8\x93\xbfg\xc1o\xbe\xd0U\x98\xbd\x8b\xe4{\xbf\xb9A\x95\xbe\xbf\x14\n<\x7fg\x8d;\xf81\xcd\xb9r46<=\xb3\x94\xbe\x8a\x8f\x1a<|g\x90\xbdF\xb2<\xbc\x08#J\xbft/\xa9\xbe,d\x07\xbe9"=\xbf\xefm\xa9\xbf\x87qV\xbf\x0en\x1f\xbf\xdc\xdb\xe5;g\xb5Q;\'\x9f\xe0\xbe\xd3\x03(\xbc\xb7\x87\xbd\xbc\xc8\xd5\xed\xbe\x89s\x08<F\x08\\\xbd\xe2\xce3\xbfI0\x7f\xbf\xf0g^\xbf\xc8=Y\xbf\x82Tq\xbe\x1dU\x9a\xbd\x03\x95\x83\xbe\xf3\xa4\xa4\xbe\xa6Gp;*@\x15<\x82cf;(Z\x8f\xbc\x9b\xd2\xf1\xba\x93\\<<}\xdd\x13\xbf\x1e\xcc\x01;K\x999\xbe\x0b\x8d\xb1;\x12\x986\xbf\xb5\xb0q<\xf0\xfb8\xbf\xa6\xcda\xbf\xe0F\x9c;\x82N\xda\xbeO\x7f"\xbf\x02\xb2\xe1;\xc0\xda\x91\xbew\x8c\x04<\x96\x0f\xea;-\xcc\x8a;9U9\xbf\x8f>]\xbe\xfe\xcd\xff;\xc8\xbb\x16;C\x16\xe9;\xf9\xdfE<\xa5a\r\xbf\xdc7\xcd\xbe\xe6\xa7\xd3;\xf6\xf4\x1c;_\x89P\xbd=\xf5\xab\xbf\xf7/\x7f\xbe|\x8c\x1d<[\xd8\xa0;@\xf3~:g\x9c1\xbb\x80G>\xbfmo\xea;n\xd0.\xbe\x93\xdb\xde\xbe*\x83T<\xf5\x89\x9f;\xd1XS\xbc7?O\xbe\xfc\x83\xb1\xbe\xae\xeb\x9d:\xef\x9e:\xbe\xc8\xb2\n\xbbS:\';\xc1\xc1\xfe;\xbf\xa0\xa5\xbc$\xe9\x96;\xce\xd9\xed\xbb\xa9oy\xbe:\xb3\xe8\xbdHA\xbe:F[\xd1\xbe\xf7!\x1b\xbd\x93\xd9\x94\xbfk\xc2\xfb\xbe[\xc3M\xbf\x0e\xdb\x0b<<G\xa1:\xff\xc5W\xbfsG\xbb;*\x00\xfc\xbef\x1d\x9e\xbe\x94|\x85<\xb9Ud\xbe\x7f\xaa\xfd\xba\x95\xdc\xe1\xbc\xd5\xea\xc4\xbd\x1a\xf2@<8\x85\xb8;\xef\xac\x13\xbe\x87\n\x08<2k\x1a\xbf\xb9\xf3F;U\xa3H:a# \xbfkFq\xbf;\x99\xd7\xbeI[\xaa\xbf\x9b\x1d\xd2\xbe\x80\xa9U\xbd\x19y\xe6\xbcn\x17\xdd\xbe\xdd\xe8\xe3;\xc5[e\xbdg\x11\xba\xbe\xe2H\x90\xbe\xc8\xd0b\xbf\xed\x868\xbf\xb1X\xfc;\x93\xd7\xec\xbd,\x02\'8\xbf\x07-\xbf\xa5mi\xbf\x1f\x11\x97\xbb\xed \xd29\xd2\xaa\xcf;\x07\x12E\xbe\xdei\xa1\xbe8\xda\x1e\xbd\xe5B+<.\xf8\x16\xbaP\\\xc6;4\x9f\x009P\xbb\x15<$m\x08\xbf2\xe6\x1d<\x82\xeck\xbbR\x10\xe0\xbd\xb5K\xb6;\xa0yQ<\xc2\x1f\x02<\xdd\xbb\x9b\xbe\xa3%\xa1\xbck\\\xbf;\xf5\xa8M\xbfC\x89\x8b?_\xbe\xa5>\x1b=\x17\xbcj\x16\xdd>x\x1a$?\xf6\x0es<\xbeJ\xb1=\xabP\x03\xbcG\xeb\x8a>\x83\xf8\x00?8\x05E<\xb4\xe1\xe8;90\xbd=Q[\x82=\xadT\xe6>\xa6t\x9e?\xd7f~\xbb\t\xedj>\xdb\xee\xcd\xbb7\x00\xda\xba\x12\xca&>\xfc\x85\xd9=\xb1D\\?c\t\xd2>\x81\xfe$=\xfcK\x95\xbbC\x04\xc5>\x1a\xa8\x7f=\xad\xf3\x8d>0\xdb\xed;\xd0\x1b\x9b\xbb\xc0\x1e\x80\xbb\t]\x16=\x11b\x10\xbcH\xcd\xdf>\xfb\xd9D?\x99\xda\x80?\xaao\x13?\r\xb62?%\xcc\x1f=\xc0\xfc\x8f\xbbq2T;\xd5ou=\xc4<\xce>\xae\x02\xb1\xbb\xacI\r:\xbdKM? -\x12?\x0f\x08\x12?-\xfaf?\xb4\x8f;\xba\xcaF\xed>[JW>\xcaF\x86>\xc9N\t\xbcYI\x8a=\xa2\xe10;\xa0\xea\xb1;C\x17\x84\xbcN\xd9\xf9\xbbG\xd2\x94=\x1dX\xa7?\x94\'\x88?2M\x81<\xfcw\xdb>\x8a%\x9a=\xd8\x8c\x9f\xbb\xbc\xa5q?\x16N<?\xeaQ\x90\xbb\x8e^w\xbc5S,\xbc]a\xba\xba\x8cLW<\xc8Z\xb6=\x95Hx=\xdc]\xce=\xa5a\xe4>\x96\'J?\n3\xe6>x\xc5\x92>\xacn^??z\xf2>\xda\xcc\xe5\xbbzKw>\xe6\x15}=w\xac\xeb>\x13A(\xbc\xa8v\xdf?\xd2\x86\x87<o\xcb\x8d\xbb8e\x1b?.\x90\xdc\xbb\xdf\xb6\xf0:\x9f!A?\x92#I=\xa0:\xa5?\xe9\x80\xfc>6_o?\xbf\xb2\x14\xbb\x03j]=\x8b6\xa1>(\xce\xda>\xb7\xb7R?E\xad\x9b?`}\xc8\xbb\xe0`\n=\xa72F?\xecYq>\x81\x01\xb4=\xb3r\xf3\xbb7\x87\x91=\x98&\x13?\xf4\xe3\xeb>\n\xdd\xd7>\xb5\x19\x8f>.\xa11\xbc\x8d\x92\x90>\xe0R@=\x98Z\xbf<\xd0\x03\xa7?\x87Gs?|\xc3C>?\x95S<s\xde\x84\xbb>\xff\xbd>\xf3\xe6\xdd=\x1a\xf7\x04?)&\xbe>DP"?V\x11\xbc>\x95\x804?\xe2O\xf9>\x16\xff\xb9;\x08\x143>"")?\x7f\xbf\xf8\xba\xc8$\x98>^f\x13\xbb\xb6_\x01=\xa3\x1b\x08\xbc\xc7uQ?!\x15H?@`,\xbc\xc2\x806?\x83c~>\xe5S\x85=$\xb6\xb5?>\xe3\xb6\xba\x05\x846?L\\\xa9>\xa9f]>\xdd\xe5\xa4>^ \xf6=\xe9\xbb\x08;A\x07~?\x12{\x9c\xbb\xaa\xfe\x9c>\xa3{/?\x90\x96\x0e\xbc\xbd`B<\xfe\xa5M\xbc\\\x8a|\xbcD\xe9\xfd\xbb\xdfl\xa1=\xc8\xe9H? \r\xda\xbb\xd6\xdb\x14?\xdfD\x82>\xf1\xc2\x12\xbb\xc7\x00\x03=B\x8c\x1a\xbcc$\xb6\xbb\x8e3\x1d?L\xc6\xf6=o?\x12?\xe4\xe5\xf8\xbbp5\x12\xbc\x1fs\x9f?\xc9\x1b\x02?=\xebb?\xad\x00;=\n\xc6\x93\xbb\x93G\xd8>><\xb6??\xa4\x92>T\xc9d?}Tl>\xac\xff\x02?\x8f\x0eX\xbb5\x05@?\xe0\xf21?\xa1=\x96=\xb1\xc1\x16?^\xe7\x81?\xfc\x87)?\x84\xfd\x14=\xcbx\x88>\xa5\xc7\x97>\xcdf\x00='
-p559
-tp560
-bsV445269662956146688
-p561
-g2
-(g3
-(I0
-tp562
-g5
-tp563
-Rp564
-(I1
-(I400
-tp565
-g12
-I00
-S'89\xb8;T\x14.\xbe\xc7L\xa5\xbff\x12\x9b\xbf_%\x8f;\x8a\xa2\x18\xbf;\x1d\xaa\xbb\xa8\xe4\x8e\xbf\xc3\x84<\xbf\xa6t\xb0;\x07}\x07\xbf\xaf\xe1\xc8\xbe\xbb\xf1\n\xbe\n\xb5\x10\xbf\xe9 .\xbf\x82\xd9\xd7;\x0cp\x8c\xbe\xc2\xcc\x83\xbe:&\xa1\xbf\x9f\xe9Q\xbf\x84Xt\xbe\xb08\xbc9\x1ba\xb4\xbe\xd9R\x03\xbe\xe0d\x12\xbb\xc8S\x85\xbf4\x1b#;\xb0\xc9?\xbf|\xe0\x16\xbf\x0f\xac\x9e\xbf\x94&\x0b\xbf\x05=e\xbe\x1cw\x94\xbe,\xc0\xc9\xbf\x84\xae-\xbe\xe9\xa2,\xbe\x80\'y:\xed\xe8K;*ej;\xd2r8\xbf\x9c\xb7k\xbfcf\x9b\xbf*a#\xbc\x1d+\xcc\xbe\x85a\x08\xbf\x9bi\t\xbf\xba9\xdb;b\xcc\xd1\xbeg\x8d<\xbeP\x9b0<1\xcf>\xbf\x90\x17\xb9;;\x9f\x92\xbf\r\xd7\xe5\xbc\xbb\xc6\xa1\xbf>\xb9\x90\xbe(\x86g\xbd\x08P\x0b\xbf\xe4\xc3\x0c\xc0\xbf:\xba\xbf\xc6AK\xbe\x88\xb0X\xba\xad\x88\xa1:Q\x13N\xbeO+\x86\xbb)%\x94\xbe\x9c\x87\xa9\xbf\xb9\xffj;\xddG\xec\xbdz^\xce\xbeT\xca\x9a\xbf\xa5R\xdc\xbe\x11\xa2\xdc\xbe\x9a\xc8(\xbf&\t(\xbf\x88[~\xbf\xdd\x99\xb2\xbe\x82\xea\xb0:\xbdaZ\xbe\n(v;\xb7\xc9\x8d\xbet\xfd\xb7\xbe\x0f\xf3\xf9;Bc@\xbf&\xc9I;\xb2\xe3\x81\xbe\x00\x0e\x9d;\xfc\xe35\xbf+\xcc\xeb;q\xc2\xef\xbe\xf9\xf4\x9b\xbfkV\x1c\xbe\x15\x0c\xc4\xbf\x94/)\xbf\xc9\xeb\xbd;\x0c\x04H\xbd\xd6\xd2\x88;\xf7\xee\xa2;\x1c\xcc\x1b\xbe\x94\xdd\xbb\xbf\x8c\x83\xc9\xbe\xae\xe0\xaa;\xa4\xa1q;\xc5s\x8a\xbe\xaa\xef\x05\xbf\xd70E\xbf\x92\xa0@\xbd\\\xf2\x93:\x0e\xe9\x1a\xbfQt:\xbc\xfb]\x08\xc0I\xba\'\xbf\x88\xa3H\xbe\x03O\xd0\xbd\xd4\t\xd1\xbe\x7fD\x80\xbe=\x96\x96\xbfxM\xa1;_>|\xbe\xedI\r\xbf\xa4P\x12<\x8b\x9c\';\x8et\xf9\xbca~\xe0\xbcZ\xd5:\xbe\x1bX\xa0;\x9aa\x84\xbf\xe2\x92\xd0\xbdx\xd3\xbe9\x11s\xf7\xbe\x1a\xcb\xd3\xbdL\xc2:;m\x0b\xcb9U\xa8\x08\xbfNz\x1d\xbd\xf4t\x1e\xbe\xba6K\xbf~\xc6o\xbd\xc8A\x8b\xbf\xed\xca5\xbf\xc7\x06\xc7\xbe\x010\x14\xbe\xa02\x03:\x85\x93~\xbf\x02J\xa1;}.\xca\xbd\xee\xe7\xcc\xbe\x92\xdc\xdb;\x8d\x03\xd4\xbe\x1f\xac8\xbct\xec\x0e\xbf\xff\xd1\xe1\xbe\xe3_\xba\xbb\xce\xc2*\xbf\xbc\x1b\xe0\xbd\xdc\xaey;\xea]-\xbf\xff\xa9h9\xbeN\xc3\xbc\xe6\xc08\xbf S\xc4\xbf\xe4\xa0\x10\xbf\xb2&\x98\xbfc\x10\xc5\xbf\xf0\xcd(\xba7\x04\xde\xbev\x19\xe2\xbf\x01\xc6\xd9\xbd\xa7s\xfd\xbd)\xd16\xbeq\x1e\x17\xbe\x1b\x94\x1c\xbfc2\xef\xbe\xf5<\xa5;\xa0\xb9s:/\xbd\xe3\xbc\xc98\t\xbf\xd6z\xde\xbf\x17\xa4\x19\xba\xe5h\xdd\xba\xbe$!<\x03\x96U\xbe\xe5\xb1\'\xbf\x8a\x90\xd8\xbe\xd7\x10\xcb;^3,\xbf*\xb9\x94\xbd\xcc\xcf\x95\xbd\xa5\xfb\xd2\xbe\x86\x87K\xbe9n\xcb;\x99\xd4\x9f\xbat}}\xbe\xd4\x81&\xbe\xaegX<\xa6\xf3\xae:mE\x98\xbf\xb7\x17\xca\xbd@/\xcd\xbe\x9bN\xbb\xbe\x80\x10\xda?0D\x0c?\xd6b\xef\xbb-\x9d\x91=\x0bS\xb3?\x81>\xe6>\x18.\x8c?f\x06\xf7\xbb=\x9e1=\x19\xe1\xe0?\x8b$->\xe0m^?0a\x1f?\xbd\xc2\x11>\'\xd4\x86=+\x89\xba?y\xb0\x7f\xba\xd2\xeaV>\xcc\x92\x94\xbb\xd7U\x8a\xbb\x9cN\x82=\x89A-?gUX?\xe6#w?\xf5- ?\xef\xf0\xb8\xba\xd3R\x8b?\xb1\xcaJ=\xc2vE>\x03\x0bg>xc\x81>.\xcc\x13?\x92\xce\'=D$\xa1\xbb\xe8S\x9f>\x94\x97\x0b?\xd7\xc1\xb7?\xc6\xb2X?}g\x84?\t\xb4F<|v\xbc\xb8\xba\xee\x05\xbb\x91\xeb3?\x0b\x046>\x99ro>\xaf\x1d\xa2<AX\x94?+\xac\xa7>\xe0!(>w\x1f\xe1?\x05k\x96>\xc2y\xa3?\x8e\xc7\x9d;\xe7}k?\x90M\xd9\xbb\xe4;o>E\xa3\x17?\xffW\xfe=!\xa3/\xbc@d\xb0\xbb\xa0\xa0#?Y\xdf\xe7?\xeb\x1fX?\xaa\xd4+?\xf9/v?(z\xda=\n\x05\xba\xbb\r\x0f\xdd?\x8bm\xe4>?\xe4n>\x81\xc8\r\xbc*\xa8C\xbb\xc6\xb4\t?\x02\xd7\\>3\xd0\xd1<\x1f\xae(<\xea\xbf\xc2>\xf8\xd3\xf1>C\x8c\x07?\xb2\x00\xa3?\x0b\xd3!>7\x18\xa9>\xc8\xfdX?p3\xba\xbb\x96\x9c8?l\xd9\x11>\x96\xff\x88?\xd2\xd3\xc3\xbb\r\xb9\xe8?\xa5\x86\x8e;{\x93\xb5\xbbh\x13=?\x83\xa0\xcb\xbb}\xae\xbf=\xe8l\xac?\x83\ts?\xda\xd1\xa4?\x1a\x80\x96?I\xd7\x1f?\x02\xf9\x8d\xba\xdd\xe4H?\x8dVD?"\xfc\x08?\xa1\xb9\x05?\xcf$:?\x12\x95$;;\x9e7?\xa1\x86k?\x1f\xdc\x11>\xf8\x02\xfe>\x11O\x86\xbbn\xaf!>d#\r?\xf5\xa8\x9d>\xf5\xbb\xff>\xc5\x12/>Z\t\xc1\xbb\x97\xaeu?\t\xe0&>a^\xbf>\x16\x8f\x99?N\xed\x81?\x1a\x98\x84>\x82\x84C?\x96"6?o\xba1?3\x0b9>\xc2\x95\x7f?&\xfe\xd5>w`\xb4>e\xdc\x1b?\xf6\xce6?\x19\x0c>?x \x19>\xfb\xa5\xa2?\xd3,\x10?5\xdb\r\xbb\x82\xb4\xd7>\x0f\x01\xbc>\xb8\xb7b;o\xc3\x92\xba\xcd\x07%?\x96\x9a\n?r\xfb\x99\xbb\xcb\x04\x98?}]s?MK\xc4<~\x19\xd1?\x03\xa8\x1b\xb9\xdb_\xe7>\x03\x91\x0e?^\x9en=.\xfd\xba>\xc7\xcb0>\'n8>\x9c\xe4\xb3?\xb6kO\xbb\xd5\xa9<?\x9b\xa2\xa7>\n\xff\xcb\xbb\x82\x06\xd2\xba\x83\x83C;\x8aM\x02\xbc\x1a\xb5v7\x94\xceW?<\x83\xc1>\xe1g\t\xbc\x80\x89\x1b?\xe6\x0c\x17?a\x0e&?H\xb7\x12?3\x16\xb3=\xbat\x02?\xfc\xa7\x06@\x0c5W?\x11e\xca>\x83i\xc3\xbb\x82\x8c\r\xbci1\xf2?n\x86-?\x14N\x8d?\x97\x80\xb2>\x08\x93\x00\xba\xd9P\x0c?\xc5\x8d\x82?\x9aW\xdd=\x07b\x97?D\xcc\xaa>;\xdb\xb8>x\x95\x9b?\xdaU=?\xed?Z?\xbcV\xb4>\x8a\xe8\x16?^A\xe2?\xbbG|?\x024\';\xbe\xdc\x0c>\xf5r\x88>\x06\x16"?'
-p566
-tp567
-bsV445232757225295872
-p568
-g2
-(g3
-(I0
-tp569
-g5
-tp570
-Rp571
-(I1
-(I400
-tp572
-g12
-I00
-S'\xd0\x96v=\xf6\xad+\xbd\x0e\xf4x\xbff\x12\x9b\xbfy\xb7\xe7<jE\x8a\xbe\x00M\xbe\xbe\x988\x8b\xbf\x96\xe1\x11\xbf\xf3\xcfu\xbd\x07}\x07\xbfH\xa6N\xbfq4N\xbf\n\xb5\x10\xbf\xaa{-\xbfe\x90z=\xa0\xb3\\\xbf=\xfdv\xbf:&\xa1\xbf_1p\xbf\xee\xceY\xbe\xfb\x10\xde\xb9\xf0b\xf7\xbc.\xa5\xdd\xbe5\x18P\xbe\xc8S\x85\xbf\xd4\\\x9d<\xed\xa6\xf9\xbe%\x11.\xbf\x0f\xac\x9e\xbf\x9b\xafY\xbf+\xd7\xe8\xbe\x95\xc3\r\xbf,\xc0\xc9\xbf\x84\xae-\xbe\xf7\xa6\x1a=\x04\xd1/=\x8e\x9f\xa9<\xbc\xd0?=\xfe\x81\xf8\xbe\xfc\xad\x97\xbfG\xd1\xc4\xbf\t\x87\x14\xbf\xebsj\xbe~\xf7\x8f\xbf\x0c>\xec\xbe\x8b\xd3\x14=\x08\xd4\x12\xbe\x8dd\x93\xbe\x84\xabI=\xa38G\xbf\xc6\xf6\xdd<;\x9f\x92\xbfVy2\xbd`\x97\xb2\xbf\x95\xde!\xbfg\xd0\xbe\xbd\x93\xba\xbc\xbe\xe4\xc3\x0c\xc0\xc1\xfc\xba\xbf\xae=\xef\xbe\xf9\xbbU=\x16\xe52=W\x98\x90\xbe"\xee6\xbc)%\x94\xbe\x9c\x87\xa9\xbf\ro$=\x9a\xc4\x91\xbd\xf9\x88\x9b\xbfM\x15\xaa\xbf\xc3\xe0\x82\xbf\xac\x12\xba\xbf\x9a\xc8(\xbf&\t(\xbf\x88[~\xbfF\xa9C\xbf@N\xb9<\xc4\x85\x12=\x17c\x1f=\xb7\xc9\x8d\xbet\xfd\xb7\xbe\x8e&\xe1<\xbc\xe6\x92\xbf\xadu\x90\xbb\xb1\xd5\xcc\xbe\n\xfe\x83\xbc|l2\xbf?\xbc\x92=\xe4\x18+\xbfO\x01\x81\xbfkV\x1c\xbeY\xc8\xa5\xbf\xcf\x99\x93\xbf\xb6\xe0\x00=\xb0\xc8\x11\xbf\xd6\x96z=\x96\xf6\xf7<\xf7\xe3{\xbe\x94\xdd\xbb\xbfS\xdc\x8f\xbf\x1e\x9e\xa1\xbd\x8a<\xb3<\xc5s\x8a\xbe\xaa\xef\x05\xbf\xa9kF\xbf\xc8"3\xbezw\x1b=\x02U\xf6\xbe\x96\xbf\x05\xbf\xe5\xd6 \xc0I\xba\'\xbf\x88\xa3H\xbe\xf7l\xe0<\'\xc5V\xbe\x18\xfd!\xbe=\x96\x96\xbf\x1e\x0b\xc0<\xa3\xab\xbe\xbe\xedI\r\xbft\xcaG=\xeeW6=~\xe2\x9f\xbd\x8a4\xc9\xbe\xc8P+\xbf\x07\xfd\x9c<\xde\x85\x95\xbf\xa0\xc5\x17<v$\xd5\xba\x11s\xf7\xbeqTL\xbd\x9b\xb5\x00=\x96\xf0\'\xbeW\xd6g\xbf\xdd\xc4\\\xbf\xfc\xf6\x07\xbf\x8a\xe9z\xbf\xcc\xbe\x8e\xbe0\xa3\x08\xc0\xf3\x9c3\xbf"\xaf\t\xbf\x010\x14\xbe\x94\xbb\x01=b\ty\xbf\t\xc5 =\x99Wh\xbeB&\xd9\xbeAd\x92=o\x8f\xed\xbe?\x13+<t\xec\x0e\xbf\xff\xd1\xe1\xbe\xd8u\x12=t\x95\xc4\xbe\x1b\x03\xf2\xbe\xea\xe8\x18=\xc6\x9aF\xbf\xc6\xba\xee<\xbeN\xc3\xbcb\x84\xa7\xbfH\x9d\xde\xbfhh_\xbf\xb70\xb5\xbfc\x10\xc5\xbfB\xde\x16\xbeV\x0cK\xbev\x19\xe2\xbf\xc0\xf8\xcf<S4\x08\xbe\xb3K\xa0\xbe\xf3\x18\r\xbf\x7f\xbb|\xbf\xda2\x9f\xbf\x0e|\xc5<\xdc\x1fQ\xbd\x16\xa6\xb0<\x8b\xf6~\xbf\xd6z\xde\xbf\x8cvB=\'\xd1\xa2<\xa5\xbb\xdc<^\x93D\xbe5\xc5E\xbf\xa2\xe6N\xbf\x13\xa1\x88=^3,\xbf*\xb9\x94\xbd\xcc\xcf\x95\xbd\xa5\xfb\xd2\xbef\t\xdb\xbe\x03\x9c\x1e=\xe9\xd1\xbb;\xb7W\x87\xbe\xd4\x81&\xbe{{j=\xccr\xfa<\xa0\xba\x8d\xbf\xb7\x17\xca\xbdCUw<\xb1jn\xbf\xa8t\xeb?\xe7R\xb3?\x18\xe5\xe8\xbc\x13\xa7\xa7>4{\x88?\xce=B?\xdd\x93\x0f?\xcdF:\xbd!<\x19?\x19\xe1\xe0?\x91\x03\xff=#\xab\x1b>Qq\xe0>k\xfe\xfb>\xf5\x8d^>b\x07\xd7?\x91\x9d\x1e\xbc\x8e,\xb8<d\x96\xe2\xbc\x1f\xa1\xde\xbc\xbcf\x96>\x89A-?\x17\xf9b?\xc4E\xdf?\xf5- ?,\x13\x01\xbc\xd3R\x8b?"\x0cp>NY\xb8\xbce\xa7\x00?\xf32\xd8;9-Z>\x9b\xa9\x84=X3 \xbd&\xb7\xd7>q\x89\xb1?\xb2\xbe\xc6?\xab!A?>\xe7f?,m\xa4>\xf2^\x13\xbd\xf1\xf6W\xbdN\tT?C@\xd3>\x99ro>\xe9\x11?>\xe24\xb2?\x95\xf3;?\xb4}\x9e>\x17\xbb\xe8?+\n\xb7>\xc2y\xa3?\xa2>z=R\x89\xce>\xac/A\xbd5k\xea=E\xa3\x17?\xd0\x00\x0f?\'7\xa1\xbdO\xd5E\xbd\xa0\xa0#?\xba-#@*\x13\xa7?\xaa\xd4+?\x14\xea"?6i;>\xfd=\x04<\xdd\xc2\xe6?]\xb2\x9c?dZf\xbcp;~\xbdd\x935\xbd^DD>,\xad\xb4>Q\x0c\x96>\xce\x01\xad>\x98.\xb6>#B;?\xd3!\x92?\x9e\x97R?\xeb\xb7$?\xeb\xf7\xa2>\x1e\x9e\x81?\xadr\xec\xbc\xf6m\x1f?~v\x96>!\x1dN?\xd6\xf5\xbe\xbc\xb73\xb6?y:"\xbcWh\xc4\xbc\x83\xb5i?\x86\xf3\x1d>6\xf6\x03\xbd+\x93\xaa?\x87\xa8=?\x99\xcf\xd9?\x1d\xbc\x84?\xd3\x8dl?\xde\x9b\xf6\xbcY\xf76?\x8dVD?\xd8b\xf6>\xe7w3?\xb0%\xb1?\xca\xc4!\xbd;\x9e7?\x08\xbc\xd4?\x02A\xe5>\x1cF\x18?\x8fgM\xbd\x88\x8c\x11?X\xfb|?_\xf2;?z\x0f\x9a?\x97\xa6\xdc>\x86:\x19\xbdd\xb2e?\xbd\xd8\x0b>EW\x08?k(f?\xf8O\x91?\x9a\xece>\x82\x84C?*\xbc\x9b>?j$?;z\x9d>Lu\x84?L\xd3\xff>\x97\xa3\x02?3\x9b\x10>\x86\xbce?\x08\x17H?G\xb1e>\xacs2?R9\x88>\xcb\x89\xc1\xbc\x87]\x96>\xb8F\xc1=\xe1\x8e\x93<w \x18\xbd\x08n\x81?\xb00\x99?\x90\xd59\xbd\x1d\n\xd9?$ \xa9?\xeas+>\xbc)\x10@\x9b\xb8\xd2=\xe8Ve?\x10\xd5>?\'\n\r>\xd4\xbb2?~i\x0f?\xd9M\xaa>\x11\x9b\x96?\xf1\x1d\xc7\xbcg]\x19?;\xb8K?!:\xf4\xbcnI\x0f\xbd\xef\xe2!\xbd\xbc\xbd\x83\xbd6\xf7\x99\xbc\x94\xceW?\xd7\xb0V?#\xf9\xf4\xbc\xdf\xf5I?\xf8\xe2(?a\x0e&?\xa2\xbc\x89>3\x16\xb3=3\xd5(>\xfc\xa7\x06@\x0c5W?;\xc8h?)p\x13\xbd\xb0VO\xbd\xcd\xd8\xc8?n\x86-?\x9a3\x93?\x97\x80\xb2>W\x04\xdb\xbc\xfc\x8b\xfd>\xde\xae\x02@\x1d\xf5\x84=tJ\x18?\x07\x9f\xc6>\xae\xe6\x00?x\x95\x9b?\xbd\xfe??\x87\xc0*?\xbcV\xb4>\xe6\xeas?^A\xe2?\xab\x1a\xd4?\x0c\x84\x19>\xc2\xe4\xd0>\t\xed%?Jz\x1d?'
-p573
-tp574
-bsV445233560220217344
-p575
-g2
-(g3
-(I0
-tp576
-g5
-tp577
-Rp578
-(I1
-(I400
-tp579
-g12
-I00
-S'\xb8\xbd\xe5;\xc3\xc1\x8b\xbe~p\x91\xbfY\x81\x18\xbf\x0c\xce\xd3;\xf4\xd6_\xbf\xa4To\xbe\xb1\xb7\x89\xbf\xae[\xb7\xbe\xa0\x8e9\xbe\xbcM\xa5\xbe\x13D\xd6\xbeH\x0e[\xbf\xa2*|\xbe\xb3H\xdc\xbe\x16@\x06<K\x03\xc3\xbe\x97s\x16\xbf\xf8\xe5l\xbf\xf4j\x1c\xbf%\xe6\x0c\xbf\x1f\xe3\x81\xbe\x92)\xbc;9\x06,\xbf\x8b\xeb\xfe\xbe\x90\x13\x0c\xbf\xeab\xec;7\xd3]\xbf\xa2\xd91\xbf\x90\xa7\x0e\xbf(,+\xbfNn?\xbflF\xad\xbeU\x98\x85\xbfN;U\xbbFQ\xb8;\xd0\xf3\xb1;\x00\xcf\xee;\x98\xff\x16<\xa5\xf5\xf5\xbe\x99b\xa4\xbf\xd3\x82\x8b\xbf\x99b\x0b\xbe\x8b\xe6\xe7\xbe\xe4\x13\xc6\xbf\xbd\xf92\xbe\x82\xc1@<x&\xc4\xbd\xe6[\xc6\xbd\xf9k2<e\x94\xbb\xbe\x08aN<\x1e\xfa\xf6\xbe9\x07I\xbd\xfb\xf2\x93\xbf5K\xed\xbe\xde\r\xb5\xbcF\x14\xa7\xbe\x12E\xd8\xbfz\xb4\x8d\xbf\x80\x90u\xbf\xac\xa5\xc49$6.\xba\x141\x80\xbez+\x02\xbe\x12}\xd2\xbd\xf7\xabq\xbf~\x9fG;\xd9V\x96\xbe\xd9q?\xbf\xc2\xb5\xed\xbf\xabH\x91\xbf\x14\xee\xc9\xbf\xcb\xe2\x84\xbe(s\xc0\xbe\x01\xfb\xc4\xbe\xa4p\x00\xbe\xb2"C;:\xc7Y;\xc2\xbd\x95;>d\xa4\xbd\xb0\x08\x87\xbe\x9c\xad\xa0\xbeQ\x96\x1c\xbfc\x99\xac;eFZ\xbe\xa8I\x9f\xbc\xb5\xbba\xbf\x8f\xb8@<\xd3lz\xbfY>Q\xbf\xafe\x1b;\xc2W\x83\xbf`\x1c-\xbf\xd3R\xd8;eY\xc0\xbd\xea\x04\xe5:M\x96\xc8;r\xec\xcd;\xb7%\x84\xbf\t\xb4V\xbey+\x1a<\xb6\xc1\x8a\xbe\xbc\xea\xad;\x908D<#\xa1\x94\xbfW="\xbf\xd7\x03/\xba2\x96\xdf\xbejF\x0b\xbdP\xeb\xcd\xbf\xf3z\x9c\xbe\x9cU\xaf\xbeA\x1d\xdb;\xbe\xd6\xc4\xbe\xe5\xe0y\xbe\xfb"\x8f\xbfs.\xf5;\xd1h\x1d\xbf\xe7B^\xbe~\xbfV<\x0cv\xc9\xba?\xda\xde\xbe3\x100\xbe\xa2A\x82\xbe?\'\x8f;\x1b\xb6\x18\xbfn\xd2"\xbc\x01\xe2\x08\xbe\xfd\xba\xc1\xber5\x8e\xbeI6P;\xb0\'\x18\xb7D\x9c\xa8\xbeQ\x10\xa2\xbeQ\x8b\x1b\xbe}\x82\xdd\xben\xc5P\xbdK$\xca\xbf\xd0\x08\x17\xbf\xe3\xc3\xc8\xbe\x99Z0<\xe8>0\xbbT6\xa9\xbfx\xeb\xa8;V\xd4Z\xbeAM\t\xbfW\x1c\x15<:_\xe9\xbe\x90\xfdb\xbb\xc7\x10T\xbe`\x95\xd3\xbe%\x1e\xcf;\xe0\xac\xca\xbc\xcd9|\xbe\x07HS<\xcc\xda\xf2\xbe\xa5\r\x899\x8b\xf3_;\xa3m(\xbf\xdd\xcdw\xbf\x13\x83\x84\xbfU\xa1\x96\xbfH^F\xbf1\xb4\r\xbd\xb1\xad\x85\xbe\xf4\x0f\x89\xbf\xbd\x85\x12<g\xa9\xb9\xbe\xe0\xc4\xb3\xbe\t1\x88\xbe-P|\xbf\x88\xd3W\xbf\x08\xb6<<\xae\x9fq\xbe>\xff\xee\xbc\xe1[5\xbf\xfe\x97\x96\xbf\xf1\x88\xef\xb9\xc5L9:\x05t\xc5;\xc5%\xe7\xbeH\xc7\xf5\xbe\xc1\xf7t\xbe!$U;\xff\x13\xd8\xbe\xa8\xa5\xbc;\xaf\xf6\xad\xbb\xe0\x12\x11<)("\xbf\xe6\x9b\x15;\x16\xa10;f\xc3\x83\xbe\x97\xa7\x8b;\x9f~\xfb;\xf9\x1d\x03<\xf4=g\xbf\x96\xef\x80:\xd8\x8b\x86\xbd\x9a\xc9\xc7\xbf\x9c\xa3\xbb?\xe8\xecA?H\x00;\xbc\x8c\x85b?\xed!d?\xceP\x88>\x87\xdb\xce>\x1dG\xf9\xbb\x02\xde\x83\xbaJ&\x84?p\x9dB>\'{\x9b>n\xca\t?\x0bVb>\x94\x86\xb0>4A\xa2?\x10\xaa\x9b7\x1c>@>n\xae\xb7\xbb\xf3\x91\x18\xbb@\xe5\xc8>\xdf\x11\xe3>\xaeZ\x97?\xafT\x01?\x19\x01\r>\xfd\x0c\xf4=\x8b\x8b#?\xd8\n(>\xe0\xd2\x1b?2\xb4\xb7>B\x88\xc8=\xa7\x00\xc3>sTq=\xe9\xf7\x84\xbbK\x8d\xc4>\\\xac\x95?9I\x98?O\xe0g?/\x9c\x9b?vK\x00>\x13\xd9\xc9\xbam\xdd\x95;F"\xe0>\xfe\xe5\xad>\xa6\x0bn\xbbO0o=\r\n\x84?\xdd\xaa-?\x81\xaah>N\x83\xc4?\xd7\xf1\x0b=\x15\xaer?\xc2\xdeG>\xb1\xf5&?]42\xbc\xb2\x93\x8e>\xda3\xbd>\xda\x98\xb0=\x00\xa22\xbc\x19\xbc\x1f\xbc\rj\xd0>\xdc\x9d\xa7?2pe?\x0cSj>U\xa7\x1f?\x8a\xf7\xf3>\x08q\xb5\xbbr\xb4\xba?\xa6R\x14?*o\xb3:*\xd7u\xbc\x88\xa3\xe6\xbb\xd4\x81\x06;\xf7\x8d\\=V\xb6\x93=\x1b\xe7\xb7>\xb3Q\xe1>\n"\xd3>\x19\xde\xb8?=\xf41?\xd1\xd4\xd5>8\x1f8?\x07\xb78?\xec\x93\xc7\xbb\x8b\x07\xe5>\x83\x9a5>\x9b\x99\x19?(x3\xbc\x85A\xce?\xef\xb8:>\xd7\x1c{\xbb\xd0\xf5\x9a?\xe3\x9c\xd3\xbbq\xf0\x1e<B]\x81?\x15\xce\x9a>\xa7\xbb\xe3?\xf0\xf6k?\xfaP\x0c?\x92k\xaf8h\x00\x1a>]\xb0,?\xe5\x1e\xa6>\xb5Y3?x\x81\xc7?tk\x89\xbb_!\xf1>\x1f\xc2\x93?\xc6)R>5\xcf\x7f>\xbd\x12\x9c\xbaV63?a\x15\xca?D\xd7o?\x9b\xdbJ?\x14\x0c\r?\n\x18\x08\xbc.\xd5\x1d?\xe4\xf9\x9d>^\xa1\x80>4v\x96?\x0b\x9fm?F`\x8c>x\xfd\xaf>\x97\xfb\xa8>_\x120?~\xf8\xa0\xbb_\xc6\x8c?\xba\xd9\r>Pn\x0f?\x85m\x01?r\xa1\xb4?\xe3S\xf4>\x12\xeb\xd4=B\x96\x16?<U\xa2>Ds\xac;7\x15\xe0>\x90R}:TC[<\xc7\xd8\xa4\xbb\x7f\xd0\x80?1\x95G?\x11\x93\x11\xbc\xcbi~?`\x9a0?\x06\xd82>\x8c\x13\xda?Tc\xa5>{"\x85?\x8b|\xc5?b\x00\x1c?|\xd1\xf2>\x8b\xf1\x80>X!m>\xe8[\xaf?\xe0\x8aI\xbb~*1?\x06\x9e\x97?c\xd9\xd8\xbb,\x82 =\xe2X\xd5\xbb\xab\x89\x16\xbc\x8cg\xbd\xbb\xde\xff\xed>\x06\xc6P?E\xc4"\xbc\x92K\x17?4\xbf\x80?\xd42j>\xcb]\x9e>\xa1\x7f\x19>\x15\xe0\xea\xba5\xe8\x9b?\xa0\x9e\xde>\xee\x91\x8c?\xad\xe7\xde\xbb\x9d\xc6\xc3\xbb\xffZ\xd8?\xaf\x0c&?\x8b\xaeN?\n\xbdA>\xb0\xed\x19>\xeb\n\x9b>m\xfc\xc3?a\x0b\x8c>\xd1\xe7y?P\xb6\x89>\xfcw2?\xa89\xeb>\xbd\r\x04?\x14%\x8f?\xf7\xe6}>\x80\x95\x8f?c\xf2\x94?X[m?\x80Lz>\xfa\xe3\xd0>\t\xb1\xae>k\x1c\xcc>'
-p580
-tp581
-bsV474112987838820353
-p582
-g2
-(g3
-(I0
-tp583
-g5
-tp584
-Rp585
-(I1
-(I400
-tp586
-g12
-I00
-S'\x1a\nT;(\xd3\x11\xbe~p\x91\xbfj+\xce\xbe`\xcc,\xbb\xf4\xd6_\xbf\xa4To\xbe\xb1\xb7\x89\xbf\xa6\xbc\x1b\xbf\xa0\x8e9\xbe\xb6\xf5\xc0\xbe\x06w\x1a\xbeH\x0e[\xbf\x04\x89\xd1\xbe\xf9&\x04\xbf\xac\xb6\xb7;\x97\xd6\xf5\xbe\x97s\x16\xbf\xde\x9e\x83\xbf \xadu\xbfB:4\xbe\x92\xc5\xb2\xbe\xe9\xcde;[\x8a\xf5\xbe\x8b\xeb\xfe\xbe\xf7s\x19\xbf\xa1g\x10\xbb\xb2\xdb\xb5\xbe\xb1\xb0&\xbf\xf0"&\xbf\x0csz\xbfNn?\xbfr:\xdd\xbe\\I\x9f\xbfg\x024\xbet\xf8\x89;J,\x89;\xe6.\xfd:\xaa\x1b\xc2;)p<\xbf\x99b\xa4\xbfz\xa5\xbc\xbfo\xdax\xbe)!\x8b\xbe\xe4\x13\xc6\xbf#\xb40\xbfbp\xd3\xbai\x15\x12\xbe\xd6\x9c\xd9\xbe\xdc\xce+;\xfb\xc3i\xbeF\xfb\xd2\xbb\xd4\xb5|\xbe\xba\xa5\xdc\xbbl\x0b\xc7\xbf5K\xed\xbeq\x18\x95\xbe\\\t>\xbf\x93\xa1\xff\xbfr\xc2\x97\xbf\x80\x90u\xbf\xc5\x94\xa5;E\x8a\x07;\'\x9f\xe0\xbe+\xce\xe6\xbd\xbb\xb7\xb8\xbe\xd9\xeeP\xbf\xf4\x10\x94;7\x15E\xbe\xd9q?\xbf\xc2\xb5\xed\xbf\xabH\x91\xbf\x14\xee\xc9\xbf\x141\x08\xbf>\x0b\x1b\xbe\xf6\xb8\x90\xbe\x9a\xe0\x07\xbf\xf1Q\x08;]\xfc\x90\xbd\xa7!V;\xf2X&\xbe\xf3v\xda\xbe\x9c\xad\xa0\xbe\xae{4\xbf\n\x97M\xbc\xd8\xf1\x8d\xbe\xb4\xb8\xc6\xbb\xb5\xbba\xbf\x86\xe0";o\xa5}\xbf\xd4\x13\x8b\xbf\x9d\xdc\x7f\xbd\xf4)\xcb\xbfHA\x82\xbf\x18\xa1\xd7\xbb\xc0\xda\x91\xbe2<\xe3;\xb1\xa0u\xbb\xfd=\x19\xbe\x92*\x96\xbf\x8f>]\xbe \xf8\x87\xba\xb6\xc1\x8a\xbez8o;Y\xee\xe6;#\xa1\x94\xbfW="\xbf\xb0\xce\x97;2\x834\xbf0h\x85\xbdP\xeb\xcd\xbf}\xd2\x0f\xbf\x7f\x07\x9e;\xf7\xe3\x89;\xb0\x9c\xb1\xbe \x8d\x85\xbe\xfb"\x8f\xbf\xea\x10\xde\xbb\xd1h\x1d\xbf\x93\xdb\xde\xbeO\xc7\x9c\xbb\x0f,I;?\xda\xde\xbe7?O\xbe\xfc\x83\xb1\xbe\x85\x0c\xb4\xbb\x9b+^\xbf\x8dt#\xbb\xfb\xfd\x03;\x1b\xd1|\xbe\xb1V\xe4\xbdbB#;V\x89\x04\xbd\x17\\\xd5\xbe\x89\xb1\x1a\xbe\x87\x05\xfe\xbe\xf8\xf4O\xbf\x8f\x16\x86\xbeK$\xca\xbf\x8b$:\xbf\xa9VQ\xbf$*\x0c\xba\xa7\xc3F;T6\xa9\xbf\x96\x10\xea:*\x00\xfc\xbe+\xc3 \xbf\xf9\x9e\xc3;p\x0f\xd4\xbe\xb2\x8f\x00\xbd)\xd3!\xbe\x9aC\xcd\xbe\x81\x11\xfc\xbc\x06\xf6\xc0\xbe\xf4\x89B\xbe3\xf2\xa5;Q\x9fp\xbf\xf8\xe9\xcf\xb7<\x90\\\xbe\x12\x08\x13\xbfTp\xbe\xbf\xec\xea\x98\xbf\xf0h\xbf\xbf\xdb]B\xbf\x80\xa9U\xbd4\x9d\xbf\xbd?\xb4\x80\xbf(\xd9\x0e\xbb\xc5[e\xbd\xeb\xd5\xa3\xbe\xd2/Q\xbe-P|\xbf\x88\xd3W\xbf\xa8\x96 \xbc\xae\x9fq\xbe\xb9\xa2\xb7\xbb\x1b*O\xbf\x82\xfd\x97\xbfW\xc5\x15;\xe8e\x89\xb9Ri\x07\xbb\xc5%\xe7\xbe\xcd\x06*\xbf\x1e\xfd\x93\xbe\x1ce\xcb;\xec,Y\xbe\xe7R`\xbc\xaf\xf6\xad\xbb\xdf 5;)("\xbfZ5\x03;O5w:pM\xbc\xbe\x93\xa8\xd39cp\x8b;\xa1\xbe\xf2\xba\xf4=g\xbf\xdb\xfb\xbf\xbd\x04\xe4\xb6\xbd\x9a\xc9\xc7\xbf\xaf\x8f\xd8?\xe8\xecA?0\xc2\xce;\x8c\x85b?G\x96^?\xfcb\x15?\xa6\xfa\x02?6x\xe7\xbaG\xeb\x8a> \xe5\x92?J\xc9\xfe<\'{\x9b>G\xcc\x1c?\xf4\xbd(?\xadT\xe6>&\xcf\xa2?O\\\xda\xba\t\xedj>#\xedJ\xbb\x9d\xb3W\xbb@\xe5\xc8>\xcf\xbf\xa5>\xaeZ\x97?\x13\\$?\xb2\x8e\xa5>\xfd\x0c\xf4=\x8a\x1cn?\xd8\n(>\xe0\xd2\x1b?\xd8\xe9\xa3>\xc4\xe55>\xc4\x0b0>\x9b\xa9\x84=k\xcb\xb9\xbb#\xa9\xe6>\\\xac\x95?\x81\xb2\xab?O\xe0g?\x19\xa4\xb6?\xf6r\x98=\xcf-\xbf=\'o\x9e\xbb\x82:V?\xc4<\xce>\xcen\x81>2\x06\xa4=nX\xa4?n\xf76?\x0f\x08\x12?\xb4\xcf\xe5?\xaeV\xf9=\x18\xe7o?[JW>\x82\xd5,?\xb0\xa0\x8d;\xd3\x85\x86>~\xecM>`\xdf\xc1>\xef\xf1\x10\xbc\x0c\x97\x8a;\x02\x01\xa9>\x99\x15\xb2?\x97\xa4\xbd?#\xae\'>kRT?\xd4\xf8\xac>fZ\x91:\x18\xfb\xc2?$wj?s\xc0\xd7<i\x8d\xa2\xbbi~\xa9\xbb\x8c\xeb\x97>P1\x15>v\xdd\xa1>\xb0c\xb1>\xdb\t\xb7>\xa4QY?\x19\xde\xb8?\x9daN?\xd1\xd4\xd5>\xacn^?\xc5\xcc\x90?7\xdc\xbe9`\x11W?o\xc0\x12?\xe6\xbe\x95?HG\xc9;\xa8v\xdf?C\xa1\xe8=O\xa6\'\xbb\xd0\xf5\x9a?\xd7\x85\xa8;\xda4\x14>\xa2h\x8b?\x93\xc91?\xa7\xbb\xe3?T\x13\x99?6_o?\xc2}@\xba@\x87\x1d?\x1eQ>?\xd5~\x01?\xb7\xb7R?x\x81\xc7?\xccg=\xbb7\xd7,?\x1f\xc2\x93?\xecYq>\xe2\xf5\n?\x08\xe6C\xbb4L%?a\x15\xca?D\xd7o?\x9b\xdbJ?*\x14\r?\xb0\x99A\xbbO\xb9\x8f?aj\x18?}\xc1\xb3>\xd0\x03\xa7?\x9eo\xa5?\xa5\x84\x98>\xac\xbc=?\x1aY\x84>\xad\xea\xda>\xf3\xe6\xdd=_\xc6\x8c?\xa5\xe5\xff>\x04\xbd\x89?\xc0\x05\x03?r\xa1\xb4?5O\x8c?h\xb3\xb8>\x94\xe0\x97?"")?\xc3\\\xfe=7\x15\xe0>\x1d\xde\xab\xbb\xd3D\xe8=:d\xb9\xbb\x7f\xd0\x80?1\x95G?\x91n\x98\xbb\x9b\x9fc?[\x1d\xbc>\x00qg>,\xb9\xde?Tc\xa5>{"\x85?\x8b|\xc5?b\x00\x1c?\x14\xab\x05?\xde\x1b\x91>\xe9\xf4\xd8>g\xbd\xb8?\x0b\xbd)\xbbro\x7f?\x06\x9e\x97?]6\xcf\xba\xbb\xc9\x06=$*\x8f\xbb\x11Y\xe5\xbbc\xe5\x17>_\xcaZ?\x06\xc6P?.\x85C<\x92K\x17?4\xbf\x80?+\x15{>\x96\xdeZ>\x01a\xea<\xcau\xb7>}\xd8\x84?H\x1d\xd3>\xee\x91\x8c?H\xcd\x0c\xb8\xa1O\x90\xbb\x0cl\xf0?\xc9\x1b\x02?)\xbc\x94?\x96\xe8\xad>\xb0\xed\x19>\xb3\xeb`?m\xfc\xc3?\xe6\x15\xae>\xd1\xe7y?j\'\xea>\xfcw2??~\x85>\xcex\x86?\x14%\x8f?J\x12\x96>\x80\x95\x8f?=\xf5\xc8?X[m?\xd9\xfd\xcd;J\x1c\x1b?0Kr>\xf3\xd8\x8d?'
-p587
-tp588
-bs.
\ No newline at end of file
@@ -1,3979 +0,0 @@
-(dp0
-V580436595335131137
-p1
-cnumpy.core.multiarray
-_reconstruct
-p2
-(cnumpy
-ndarray
-p3
-(I0
-tp4
-S'b'
-p5
-tp6
-Rp7
-(I1
-(I200
-tp8
-cnumpy
-dtype
-p9
-(S'f4'
-p10
-I0
-I1
-tp11
-Rp12
-(I3
-S'<'
-p13
-NNNI-1
-I-1
-I0
-tp14
-bI00
-S'mU\x18=\xb1\x19\xb9\xbd\xd2-\xd9\xbe{{\xbb>\x10y\xcf=\x12\x9e\xf2=-\xe3\xc5\xbe\xa7b\t\xbe\xe1\xc0\x02\xbd5\xcf\xa5>5\xadi=\x91)\x05\xbf\xe8\xb7<>\xc2!\xeb=W+\x15\xbd\x97\x86\x9e>q\xa0\x8d\xbd\x0e\x11\xa7\xbe7\x91\xf6=S\xa03>:G\x18\xbf\xb7>\xa8\xbd\t\xb1\xd3=\xa5`>\xbe[\xaa\x17\xbeb\x8c\xc4\xbc.6\x88=\xf2\x14\x05\xbei\xfa\x05\xbf\xf7\x93\xd7\xbdF\xea\xac\xbe\xad\xdfS\xbe\x1f)\xa7>\xcd\xc0\xc6\xbe\xeb\xfe*=s\xf38?VJ\xaa\xbe\xfe\xcf\xa8=\xfdD\x82>M\xc7\x00?\xf1;\xe2=\xe7m\xe2>\x7f?r>H\x8b\x00\xbf\\0\x88\xbe\x89+\xe9\xbb\xeb\x10\xc4>~\xee\x8d>n\x81\x0b>\xa2\x9c\xd9>\xa6\x8cO\xbd\xbb;\x0c?I\x9a\xa1\xbe\xb3\xa6h\xbe\xc0\xb5\x1d\xbf\x1f\xf7\xd1>\xae\x97\\\xbe!\xb4i\xbe\xf3\r\xf5\xbe\x9e\xea\xe1\xbe\xbb\xe5\xd3>n\xf6]\xbdrr(\xbe`>-\xbf=\xef\x96\xbe\xa0\xe0\xe5>\xe0^\xbf\xbe:1\x06\xbeP\xba\xe1\xbe\xdab\xce\xbe\xf6\xdf\x1b\xbf\xff\xd1\x10\xbfs\xdd\xd7\xbd\xca~y\xbe9 \xc8\xbei\xde\x05?Z\xa6\xfe>\x99D(>\rS\xb3>D\xb2\x04>RR6\xbe\xf6k\xd4:\xf0\xdc\x1d?I\xb2\xab\xbe\x16i\xd7=S\xb0\x98>\xd5\x15\xd8<~\xd9\x19\xbf[\xb2\x13?(\x94\x98>\xc9jQ\xbc\xa5\xbb\x8f;Z\x13\x13>\x7f\xd7\x8e=z\x11\xdb=&\xb2m\xbec\x0e\x19>\xc1^\xb6=*8\xb4>r=E>)\x7f\x85\xbc8C\xd1>/\xf0\\>\x8b\xd5k>{\xb8\x92?\x8a\xd0\xc2\xbe\x02YM\xbe\xc0\x1cq\xbc\x80\xe2\xff>\x0f\x0b\x01\xbe\xffw\x95=\xb75\r?\x8f\xf9,>c\x00\xcf>6\x0e\xa1=\xa3LP>\x8d\xb0\xea\xbe\xc9\x8e\x99>\xee\xe4\x90=\xd5\xbb\x15>5\xacD?\xe7\xc6[\xbe\x0f\x0f\x00\xbe\x1ag\xb5\xbe?@\xf9\xbe\x85x\x8f>zI1\xbd\xe5\x81\x18\xbe\t\x18\xf1=\x98A\xf1>\x93r;\xbe\xd3\x075\xbe\n\xfc\x9f\xbd\xc7\xf8\x00>\x1e\xec\xdf\xbe\x18f\x1a>\n\xbb\x1c=\xf8\x96\xec\xbd\xf7U\xe6=\xc2p\x0b?\xca\xef\xec\xbe\x0c\x8c\x0e?\x1e\n\x08\xbe8\xa5\x87\xbe\xd2o\xee>~6\x9e=7K\x06?\x840\x00?\xe14G\xbe\x9aND\xbe\xaa6\x85\xbe\x05\xb9\xb8\xbe)\xe3\x1a?\xaf\x9dM?_5\x0b\xbe\xf3\xb6\xce>\xb3\xfaB\xbe\xae\x99;=\xd5\x86\xc7=s\x11.\xbf\xe8\xfb\r?\x88\x19\x9b\xbe\xcbx\x10\xbfQp\xb5\xbe\xc5zu\xbe\x86\x10\xb0\xbe\xcax\xe0\xbe:G\x15?\x13G\x8b\xbe\x9e\xd0\xc2\xbe`r|\xbe\xf7a(\xbf\xe6\x07>\xbe\xee\x9b%?\x07\xa9\x0b\xbe\x1a\\\x04=V%N\xbf\x117\xeb\xbe\xc7\x185\xbf^\xa1n=\t\x07\xf1>\x11\x08!>\x9a\xcb\xb5\xbe\xeaZ\xa7\xbe\xcb|\x0b?\xf3l\t>\xfb\x90\x0f\xbd\x17\xb84\xbb>W5?\x02;\x1b\xbfN\x00\r>#\x1f\xdc\xbe\xa0\xb2\xc2>\r3\xcb>\xc0\x14\xf5>U)2?U?A?6T9>\xa7\x0b\xc2>g\x15\xf5\xbc'
-p15
-tp16
-bsV580922257779924992
-p17
-g2
-(g3
-(I0
-tp18
-g5
-tp19
-Rp20
-(I1
-(I200
-tp21
-g12
-I00
-S'\xd7$\x84>\xb6\xca\xf3\xbb\x9cx\xac\xbe\xb7&\x03>c\x16X>#\x16&\xbd\xe1\xfa\x06\xbeshy\xbe\xb9\xbb\xc2\xbc6YK>\xa6\x92\xc0<O#\x00\xbe\xe3;\xa1=\x8aN]=\x89E\r\xbd\no\xb3>\x88}\x8e\xbd\xbc^\xf2\xbd7\xc7\xb5\xbdA\x7f<\xbd\x80\xeb}\xbeJ15\xbd\xc98\x1b>\x82\xcc\x1f\xbe[\x82\x8e\xbd4p\x8b\xbd\x06]\x1a>\xd4+ \xbe4\xebx\xbe\xb1\x04\x1b<\xba\xf6&\xbeI\x0e\n\xbe\xc36\xc6=<\xbf\xa2\xbe0\x96R=\xd1\xbc\xc7>H\xaf\x82=\xe4\n\x12>\\\x7f\x93>@j\x15>\xc0\xc6\xcb\xbd\xba\xa8\xcb\xb7\xb8<->TiW\xbe\xdd\xebf\xbe\x16\xd5\xc3\xbc\x880\xae>\xa7\xbc\xf5=\x00\x98\xbd=M\x82\xcd>\x9d\xec\xf4\xbb\xffV\xb6>\xd1m\x15\xbeaq\xec\xbc\xf0}\xdd\xbe\x9eb7>\x98j,\xbd\xea\xad\r\xbe\x86\\\xe3\xbe\x01\xb1\xc8\xbe\xe4.">\xf3;\x1f>\xbc\x16\x17=\xac8\x9f\xbeJT]\xbd\xe4l\\>z9P\xbe\x1b\xef\t>\xaex.\xbesHb\xbe]\xd8\xfe\xbe\xcf\xe9\xbc\xbe\xf9\xa5\xdd\xbd)\xda\xfb\xbd\xe7\xa3%\xbeM9_>\x7f\x80h>PU\x05>\xf6rf>\x1a\x8f1>\xd4\xed1\xbd\xa7pR=aw\xa6>\r\x85i\xbe\xa7&\xfd=t4\xd5=\xc34\'>\t\x16\xb5\xbe_Y\x04?\xaf\x80l=H\x01\x07\xbe.\x07\r>l\x17\xd8\xbd\xc0p\x8a\xbc\n\xadb>\xea\n{\xbd\xd2=\x86>0\xbcW>&\tt>\xf3\xf3V\xbdZ\xc2\x9a<:\x93\x85>#C\xfb=\xa7\x1fG>i\xd0\x1a?\xed\xf1\x8a\xbe\xc4\xc4w\xbd\xdc\xf0\xf2=\x1f\xa3\'>\xff\x9d\xc0\xbc\x01T\x0e\xbec/r>[.8>p\xd4f>\xad\xd6Q=\xe7\x01\xaa=*\x02\xae\xbef\x80p>\x11\x97\xdb<\xc35^=\xe7\xd1\x06?\x9f\xe4\x7f=\xc1\xb50\xbd-\xbb\xfb\xbd<\x8a%\xbe]\x1fU>\xcc\x1a\xc1\xbd1\xc6\xb4<:(\x88=Iq^>q\x83.\xbc%\x17\x85=g\xb3\x80=\x90\xd0\xd0<F\xdd\x8d\xbd\x1d\xf0\xd6=\x10\x81)\xbd\xb9\xefJ\xbb\x8c\xc9\xab\xbd\xefo\t>\xe7\xd3\x81\xbe\x8fR\xbb>\x90\xe0O=\x03\x0b\x9c\xbe\x93\x01\xa5>F\x88\xb0\xba\xc9\x0bR>QD\xcc>\xce-\r\xbew\xa9\xce<\xcc\x879\xbd\'\xf5\x1e\xbe\x04\x19\x9b>\xe1\x1c\xa9>\x17\x03\xf3\xbci\xe3\xa8>@/\x1c\xbe\x14g\xc8=\xd9\xd0\xec=\x01\x8c\xaa\xbe<\x88\xd5=T\xe5u\xbe\x84\x16\xd8\xbe\xe3\xacZ\xbe\xc4\xe0\x92\xbd9\xb3\x8e\xbd\xa5q\xad\xbe3\x99\xa5>\x1a[s\xbd$T(\xbe\xa4QF\xbd\x07\x93\xab\xbe\x84,\r\xbe\x14\x92\xd8>=M\xb1\xbco\xfd\x8e=t\xe8\xcc\xbek\xaf\xaa\xbe<\xeaR\xbdM\xe0\xdf=\xb1\xad\x9f>\xe1\x15f=\nlT\xbe#\xdf\xc9\xbdD}\xc7>\x17\xb8,=\x9dQ\x1e>\x03Rp=l\xba\xb1>u\x14\x96\xbe\xe7\xe6B>\xc0\xab\xd1\xbc\x0f\x10%>\xc1\x06t>\x11r\xc9>?\xe7\xc6>\xf4nF>.\xf6\xa7=g\xc4\x08>\xad\xf64\xbc'
-p22
-tp23
-bsV580391420990717952
-p24
-g2
-(g3
-(I0
-tp25
-g5
-tp26
-Rp27
-(I1
-(I200
-tp28
-g12
-I00
-S'\x16\xa8[<\xe3NR\xbd\x93e\xc8\xbe\xc0\xa9\xc4>\xe6\xc9\x8f=z_,>\xea\xc0\xce\xbe\xea:\xd9\xbd\xd2\x10\xb3\xbcb\xca\xac>YNK=E\xb1\x13\xbf\x01\x02 >\xbf<\xe1=\xf1v\x8d\xbcRC\x93>#\t\xa5\xbd\xff\xb1\xb9\xbeG.\x02>\x91b5>\x94d\x13\xbf4>\xa8\xbd\x9a\xea\xe0=\xe3\xa0\xe3\xbd\xe9I\x1d\xbe\xb7\x1a\xb1\xbaw\\\xea<\x19\x9d\xa4\xbd\xb1\xe5\x01\xbfi\xae&\xbe\x84\xd1\xb9\xbe9\x11R\xbe\x8a\x1a\xa9>\x9a\xaa\xbf\xbe\x94Gl=p\';?B_\xb1\xbeb\x8a\x97=\xb1^Y>l!\x07?\x1a\x1d\xf4=\x03\xb3\xe9>\r\xd9L>\x9ae\xf7\xbe\x1fK\x85\xbe\x0f`\xd2:\xa0\xe1\xbc>\xe1<\x96>,n\xf7= Y\xd3>O\x7f\x9e\xbd\xf8\xe4\x04?\xa2^\x99\xbe<\xb6r\xbe\x17R\x1a\xbf\x93\x82\xc2>\x86\xf1c\xbe\xac\tJ\xbe`Z\xe9\xbe\x9a\xab\xd0\xbeG\xea\xcb>\xcdsA\xbd\xc7\x95"\xbeY\xec)\xbf\x8bo\x9c\xbe:\xba\xd9>\xb6\x04\xc5\xbe\xa6`\t\xbe\xc3\x88\xcd\xbe\xf3f\xd7\xbe\xcf\xcf\x0e\xbf\xe8\x1b\x0e\xbfL\xe3\x07\xbe-`o\xbe\x8fy\xcd\xbe\x02\x01\x00?<\x98\xed>d\x0b->?a\xb8>\x91\xb8\xa8=4\x93\'\xbe\xcb54\xbc\x8c\x8c\x1e?@\xc7\xad\xbe\x93\xdb\xcd=\xe9\xe1\x9b>\xba\x13\x7f\xbc\xaa\xb3\x14\xbf\x8e\xa9\x07?\xc0.\x92>\xcb-\xa2\xbb<!\xac\xbc\r\xbb9>\xf8\x19\x89=Q\x8c\x92=&g\x80\xbe\xc4#\x13>\xf9\x14h=w0\xaf>\xca\xf7F>1\xb2,\xbd\xc4T\xc0>\x16\xa4N>&3a>\x07r\x92?|}\xbb\xbe\xaa<S\xbe\xe0\xd5E\xbb\xde\x87\x04?\xa5&\n\xbe9Q\x1c=\xf1S\x07?\x87E8>O#\xd0>C\x9b\xcc=\x1cpH>\x04\x19\xe1\xbem\xb8\x88>\x1d\xc0g=\x07s\n>a\xb37?M}h\xbe\x14\x82\t\xbeQ\xcb\xb9\xbe\xc8R\x06\xbfP\xc0\x86>\xe6\xd1\xcb\xbc\x02\x8c\x17\xbe0[\xf3=Ar\xee>\x9a\xe3I\xbeWs6\xbeyA\xdc\xbd\xc04\xf9=\x8d\xb4\xfb\xbenw\x04>U9\r=\xdc\x89\xfc\xbd)|\x9c=\x81\x88\r?Y\x1d\xe9\xbe\x8f\x8f\x03?\x91R\x01\xbe\xe6\x03u\xbe\xe0i\xf3>cd\xec=7\x1c\x01?\xacX\x03?\xa0t<\xbe\x04YK\xbe|\x11\x83\xbe\xa0b\xb0\xbeyJ\x1a?\xa0\xcaJ?\x12\xbf!\xbe\xbf\\\xbe>\xb3\'?\xbe\x97\x13\xc3<:\xa9\xc6=\xa1\x1a1\xbf\xa1~\x08?\x82a\x93\xbe\x03\xaa\x0c\xbf\xb7\xfa\xb8\xbeL,i\xbe,7\xae\xbe\xda\x9c\xc9\xbe\xcf*\x16?)m\x85\xbe,\xca\xc5\xbe\xc3\xf4\x8f\xbe\x11\xb5&\xbf\xa6\xdfW\xbe\x16H\x1e?\x84F\x19\xbe\xfczK=\xc6\x97O\xbf\xd6\xab\xeb\xbe,s<\xbf\xd4\xb2\x83=F2\xef>$(\x16>9\x00\xaf\xbe,\xd6\xb3\xbe\xa9\xb7\x10?\x1a\x93\x10>\xda\xbc\x91\xbd\xbf\xcd\xc3\xbc\xac\x904?\x90\xa8\x19\xbf\xed\xb1\xed=\xf69\xec\xbe\xcd&\xc6>d\xf2\xce>\x9dU\xf3>\x89\x873?\xba\xefA?\x81\\A>\xeaD\xce>\x04Lp\xbd'
-p29
-tp30
-bsV580195241388597249
-p31
-g2
-(g3
-(I0
-tp32
-g5
-tp33
-Rp34
-(I1
-(I200
-tp35
-g12
-I00
-S'U\x80c\xbb\x11\x95\xa3\xbdF#\x0b\xbf\xcd:\x0b?\xb4\xbd\xa4=5(u>\xca\xbd\x10\xbf$\xae\x08\xbe\x19\x96\xe4\xbc\xb3T\xef>\r]\x89==\x91O\xbf\x89Ck>W\x9f\x18>\x93\xad\xad\xbcy\xd6\xbd>\xf8\xc4\xe0\xbd%\xdc\x02\xbf\xd7;O>Y<\x86>KJQ\xbf9=\xf2\xbd\xb9V\r>\xd7\xf60\xbe\x8b\x19R\xbeX\x07h\xbb#\x02\x1e=\xf8\x8b\xe3\xbd\xc3\xd45\xbf\xec\xa1c\xbe\x9fy\xfd\xbe\xca8\x8f\xbe\x0b\xc1\xec>\xff\x86\x04\xbf+N\x80=\xddI\x82?\xf5\x94\x05\xbf\x05b\xd1=\x1d\xa8\x94>_\xcf=?\xbcvB>\xfc\x97.?\xf9\x83\x99>081\xbf\x9c\x98\xbb\xbe\xa3\x9b\xd4;\x10:\xff>\x85\x03\xcf>\xb1\xdd+>\x0b\x08\x11?U!\xcf\xbd\x84#;?\xb7\xdd\xdc\xbe\x88C\xa9\xbe\x1b\x19U\xbf\xfd>\x0c?\x92\xae\xa4\xbe!\xbb\x92\xbe/.\x1e\xbf_O\x10\xbf=\xbd\x15?x\x94\xd7\xbd\xe8\xe9t\xbe\x90=s\xbf\xac\xd2\xde\xbe!Y\x1c?\x99\x7f\t\xbf;\xe6W\xbe\x8f\x02\x14\xbf\xba\xb7\x15\xbf\xc0\xb6E\xbf\x7f\x8bH\xbf`-4\xbe\xb7N\xaa\xbe\x9f\x12\x11\xbf\x9c`6?\x871)?+\xb6f>\'\x8c\x00?\x93\xde\xe6=7\x9e{\xbe%\xdb\x88\xbcQ4_?a@\xeb\xbe\x01\xd9\xff=\xe8\xbb\xdb>\x97\xf1\xa7\xbc=&Q\xbf\xf0\xe29?U\x05\xd8>5Fh<\xd9\xe0C\xbd\xbb\x80\x8b>Q\x1b\xc4=L\x9b\x9a=)\n\xb7\xbeM\xa4*>=\xa2\x84=\xdf\x18\xf7>\x07q\x95>|0X\xbdo\xb0\x05?\xa1\xab\x90>\x17\xcc\x9a>\xa4U\xcd?k.\x00\xbf\xccN\x98\xbe\xbd\xff\xb3\xbcg\x839?e@M\xbe\xab\xd9\xb2=s9@?Q\'z>\x11#\x14?[\xbf\t>\x04`\x87>{\xb7\x1b\xbf\xa3k\xc1>\x19\x11\xa8=#\xfeD>\x1b\xc4\x80?\xf9B\xb3\xbe\xeb\xe5H\xbe(\x03\x02\xbf%\xd0<\xbf__\xb6>\xa90\xa1\xbcu\xc3W\xbe\xdf\x8a/>\xa0\xdc\'?\xd0P\x8d\xbe\xd4\xcf\x8d\xbeN\x7f\'\xbe\xd3\x9c9>t\xb43\xbfk&>>\x0b\n\x82=E\xab1\xbe\xdf\n\n>}gK?_;#\xbfw\xb1:?;\xa1B\xbe\xd1\xb7\xa7\xbe\x9f\x8b\'?^"!>\xadi:?\xb1/0?\xc4\xf0\x7f\xbe\xfd\x9d\x9b\xbea\xef\xbd\xbe\xeb\x91\xfb\xbeD\xafX?\x95V\x91?\xe0\xa3g\xbeS\xbc\x04?SD\x83\xbe\x1c\x17\xb2<\x9fk\x08>\xd5\xc1{\xbf\xdb=H?\xa8\xa3\xcd\xbe\xf3\xaaC\xbf[\x05\x02\xbf\x99;\xa8\xbe\xb0<\x00\xbf\x04\x9b\r\xbf\x04\x99R?(\x8d\xc1\xbe\xc9\x11\x0c\xbf\xb1,\xc7\xbe]\xecj\xbf|\x0c\x96\xbe\x85|^?\x89\xb6^\xbe\xb9wj=\'\xc8\x91\xbf\x00+#\xbf\xb9;\x89\xbfQG\x80=_ #?\xd3\xabT>\x8f\x88\xf5\xbe-\x93\x00\xbf\x88\x97C?/\x8aO>\xdd\x00\xed\xbd6\xc7\x06\xbd\xc5\x85\x80?+\xe1[\xbf\xfd\x1e\x19>\x8c\xdd)\xbf\xa5\x7f\x10?m\x11\x10?\x10?&?\xe0C|?\xa6\x9f\x8a?S\xf7\x85>I\r\x10?\xa9\xd2\x8b\xbd'
-p36
-tp37
-bsV580325781752160256
-p38
-g2
-(g3
-(I0
-tp39
-g5
-tp40
-Rp41
-(I1
-(I200
-tp42
-g12
-I00
-S'\x06\xdb\xaf=\x82\x1c\x02\xbd\x86\x9e\x93\xbe\xd0\xbca>\xdb^\xbd=\x00J\xc3=de\x81\xbe\xbdu\xdb\xbd\xd4\xfb\x9c\xbc\xb0vx>\x9aE-=h0\xaa\xbe\xf5\xe8\xde=(\xe4\x8f=\x80\xf1\xcd\xbc\x98J|>\xce\xa9p\xbd\xad\xa5a\xbe\xb2\x1f\x0e=\x9e\x8f\xb0=\x9c\x1c\xbd\xbe\xd1\x05;\xbd:\xe7\xc9=\xe2j\xb4\xbd\x95\xbf\xd0\xbd\xe3\x89\xb2\xbcA\xc0C=z-\xab\xbd\x98\xd9\xaf\xbeX\xe0\xa9\xbd\xab\tb\xbe\x98\xb7\x0c\xbefrQ>\x1e\x1d\x89\xbe\x05"f=]c\xf2>:\x8e\x1d\xbe\x90\'{=\x1c@8>\xb6\xc7\x9e>E@:=\xa2\xa8n>p\xc1\x15>\xc1\x15\xa1\xbep\xbf-\xbe\xbb \xdd\xba]f\x9b>\xf49<>\xf1J\xa6=\xac(\xa5>j\xd3;\xbd\xbc{\xbd>M\xb8Q\xbe \xc6\x08\xbevw\xe1\xbe\r\x83\x80>\xba\xe2\xfd\xbd\xfa\xb4\x02\xbe^\xde\xbc\xbe\x12I\x9f\xbei`\x83>P\x98\xe3<\xc7>\x91\xbd+\xa6\xd4\xbe\xfc\x86@\xbe.\xf4\x8b>Y\xe1\x87\xbe\xabr\x94\xbc\x94\x0e\x80\xbeC\'\x8b\xbe\xd6t\xd3\xbe>s\xbd\xbe\x07\x1c\xb8\xbdg!\x1f\xbe\x82\r\x7f\xbe\xd2\xfe\xa2>\xaf\xfc\x94>\x16\x00\x06>\xde\x8fm>\x87M\xa5=XO\xce\xbdK9\xd4\xbb\xdb\xad\xd3>\xe6\xc6|\xbef\x7f\xc1=\x9a:E>\xf4\xec&=\xd0\x9b\xc6\xbe\xd0N\xcc>\xfc@1>\xa6/-\xbd\x19G\xb2<\xdb2k=\xd5\xbc-=\xe0\x07\xd4=\x00o\x1a\xbe\xcb\x1f\x0b>\xf0D\xb6=\x15*n>\x0c\xca\xb4=\x02\xb5\xab\xbc\xca\x04\x87>a\xfe\x11>\x18\xd3\x19>\x8eX>?{K~\xbe\xa5\x0c\xe2\xbd\x14"\xc9<F\xe5\x9c>"\xaf\xa5\xbd\xfa\x1e\xb9\xbc\xcf\x02\xae>\xe9\xf5\x00>aY\x85>C\xb0m=\xbb\x93\xfe=\xc6\xe1\x9e\xbexGK>\x89+H=t/\xbb=4\xbb\x00?\xf6\xdf\xc0\xbd\xc1\xd3\x96\xbd\x8d\xd6^\xbeU1\x9d\xbek\'K>\xc2_\x1c\xbdN\xf5\x96\xbd>\x86\x94=\x86\xbf\x94>=z\xd9\xbd\x15\xfa\xa6\xbd\x8d\xfbL\xbd\x8d\x0e\x8c=x\xf0\x89\xbe\xfe\x1b\xb9=\x1c\nL<\xf8w\x94\xbdn\x83\xae<\xf66\xa5>\xca{\x98\xbe\\\xae\xb4>\xd5\xb8Z\xbd?\x14B\xbe\xfa+\xa8>\x8c\xe5\x98=\x0e\xc0\xa0>e\x88\xbc>\xf8;\x11\xbeCS\xd0\xbd\xa6~ \xbe\x8e\xa2j\xbe\x7f\x8c\xc4>\xe0\xd6\xf9>9\x06\xbe\xbd"\xfb\x89>\xef\x95\x04\xbe\x1d\x9d\n=(z\x87=k\x98\xe7\xbe\x80\xbb\x9d>M\x8cN\xbe\x97\xdd\xc5\xbe\xf6An\xbe\x07\x91\x02\xbeD\xd1I\xbe\xea\xda\x96\xbev\x06\xcc>tv&\xbeEt}\xbeI\x84+\xbe\xe3\xf0\xd0\xbe\xe5\x14\n\xbe\xb6\xcc\xe7>_\xd5\x96\xbd\xbe#\r=\x97\x00\x08\xbf\xa8"\xaa\xbe\x8a\xa3\xce\xbe\xfcz\x98=\xe1U\xa9>r\xb0\xc5=\xedro\xbe\x08y[\xbe\xbd\x10\xc8>\xe3\xbe\x97=]\xe3X\xbb\x8do\xc2\xba[\x18\xe5>b\x9e\xbf\xbe$\x19\xcc=\x1e\x02\x83\xbe\x03Eq>Z\xe6\x89>*\x07\xb4>"\xe0\xf0>\xd6\xb9\xe4>l\xe7\x00>\xb6\xc0~>\xa3j\\\xbc'
-p43
-tp44
-bsV580538800872505345
-p45
-g2
-(g3
-(I0
-tp46
-g5
-tp47
-Rp48
-(I1
-(I200
-tp49
-g12
-I00
-S'\xddG&<t\x15\x99\xbdZ\xab\xdf\xbe\xc6\xd7\xdd>\x17\xb1\x92=\xe1\xeaC>V\t\xe5\xbeM\xf0\xf2\xbd\x9a\xa6\xff\xbc\xa1\xab\xc5>\xab\xc9X=\x04\x17\'\xbfE\xc7>>v\xee\xff=$3\x95\xbc\x90\x92\xa2>\xfe\xd6\xb5\xbd\xab\xfe\xd1\xbe\xb9\x90\x1c>\n;M>?\x82&\xbf.O\xaa\xbd\xb5\xba\xdd=\xb7E\x01\xbe\xeb\x05\'\xbe\xe9\x87\x92\xbb\xd2*\x15=\xfc{\xc0\xbd\x90\x1b\x16\xbf\x03z3\xbe{@\xd4\xbe%\x1ei\xbe\xe0\xf9\xbc>>\xf6\xd8\xbe\xc2\\f=\xa3\x86P?\x12\xbf\xca\xbe\xbfU\x98=\xd8Nx>@Q\x18?A\x13\x11>)H\x04?S\xe4q>\x89&\r\xbfv\xd1\x98\xbe\xb0\x8f\xa2\xbb\x92\x1c\xd3>\xa1\x8f\xab>\x12\xcc\r>\xc5T\xed>|\x0c\xa4\xbdF\xc8\x15?1z\xae\xbe\xca\xde\x8b\xbe\xf6`-\xbf\xf2g\xdf>\xa7\xb7\x87\xbe-zf\xbe3!\x05\xbf\x06\x8c\xeb\xbe5U\xeb>\x1bLv\xbd\x8e 1\xbe\xd2YC\xbfdp\xaf\xbes\xec\xf6>\x05\xac\xdf\xbe\xc0\xb7\x1c\xbe\x0e^\xe6\xbe8\x87\xf0\xbe\x15\x05"\xbfR\xe4 \xbf\x92\x1b\x0f\xbe\xb8\x97\x88\xbe\xe3\x0b\xe4\xbek\xba\x12?\xb0\xf3\x06?<\xefC>3.\xce>k\xde\xdd=2\x08A\xbe\xe1E\x03\xbc\xfc\xfb5?\xd0S\xbf\xbe\xd5\\\xde=\x86W\xae>\xe6\x862\xbc\x8ek\'\xbf\xe1\x0e\x18?o\xf9\xa6>\xaa\xd8\xfe\xb8\x02t\xd8\xbc}\'W>H-w=J\x96\x9d=\xb2-\x91\xbe?\x84\x12>R_\x7f=\xfe;\xc7>fij>\xdd\xe6\x1f\xbd\xbbO\xd8>>hr>\xd2<\x7f>*\x92\xa5?\xed\x96\xd4\xbe\xc5\x83p\xbeU*6\xbc\x9e\xf3\x14?\x82\xf4\x1d\xbe\x182g=\xa6A\x1a?\xae\x11K>\x83\xc6\xec>\xb5=\xdd=\xed\td>\xea\xcd\xfc\xbe\x16n\x9c>\x02!\x99=\x1eo\x1d>\xaa*R?\xf7-\x87\xbe\xb5\xe7\x11\xbe\xfe\xa6\xd1\xbei\xa0\x15\xbf\x12\x15\x94>\xd2)\xdb\xbc?d4\xbe\x88x\x14>\xc5\xaf\t?:\x0em\xbe\xa0Y^\xbex\xfb\xf0\xbd)\x9a\x11>\xa4\x1c\x0c\xbfQ)\x13>\x8b\xde%=>0\x14\xbeH\x16\xe0=\xd6\xff\x1f?\x1a\x7f\x04\xbf\xff\xe5\x17?y\xfa\r\xbe\xb6=\x8b\xbev\\\x07?\xa0N\xff=\x04\xba\x12?k\xe6\x11?\xca*Y\xbe^\xa1m\xbe\x9fs\x99\xbe!1\xca\xbe7R/?F\xabg?\x0f\xad=\xbe\xc5\xe6\xd8>h\x8e[\xbe\x1dS\x01=\xeb#\xd8=*TI\xbfl\x1b\x1d?\xda)\xaa\xbe,6\x1f\xbfEI\xce\xbec\xba\x85\xbe\xfe\xe4\xc5\xbe\xd3$\xe7\xbe\xfdu)?\xdb\x9e\x99\xbe\xb2)\xe1\xbe~\xba\x9c\xbe\xdd\xd6>\xbf\x93\xcel\xbe\xc0\x042?\t|)\xbe\xd9\xed==\xe3gj\xbf!1\x04\xbfJtS\xbf\xb3m`=\xc4G\x04?nA2>\xea\x9c\xc8\xbe|\xa7\xc8\xbe(E!?\xe5\x16&>\xcf\x15\xb0\xbd\xa3i\xac\xbc\xbe\x89O?2:0\xbf\x80\xeb\n>\xd6\xac\x06\xbfr\x0c\xe0>\xedb\xe6>\xcf\x8c\x07?\xc5\xc1I?rr]?\x02\x0e_>[\x8a\xea>.\x80u\xbd'
-p50
-tp51
-bsV580358381057249280
-p52
-g2
-(g3
-(I0
-tp53
-g5
-tp54
-Rp55
-(I1
-(I200
-tp56
-g12
-I00
-S'\xc7\xe9\xc0=,\x8c!\xbd\xa5l\xdc\xbe9\x07\xad>o\x86\x0b>T4\x92=rR\xaf\xber\xad3\xbe\xf7\x90\xeb\xbb_\xb4\x95>\xd2\x01\x9a=\xae\xd6\xe5\xbe!\xc1\x13>[<\xfa=\x8f\x9d\xce\xbc$\x1f\xb0>\x04\xa0\xaa\xbd\x0f\x7f\x8c\xbe\xc4\x87T=\x11v\xc4=\x89\xca\xfc\xbe\xc0\xc5\xbf\xbd-\x036>\xbc4\x1b\xbe\x17\x92\x06\xbe\x19\x9f5\xbdC\xa1\x9e=\x05=\xe8\xbd"/\xd9\xbe<~\xd7\xbd\xfd\x97\xac\xbe\xfcJq\xbeaA\x92>\x1d\xb8\xcf\xbe\xecU"=\xb0\xa40?&\x82\x82\xbeR\x1b\xfd=\xd4\'\x91>\x8f\xc5\xdd>V1Q=\xbdu\xa8>\x0c\xb4A>h\x1e\xd8\xbeP\x92\x94\xbe"\xc8\xbb\xbc;\xdd\xd4>\x8e\xfbw>\xe3\xa8\x04>\xeb\x00\xe6>\xa9\x06Z\xbdo\xc3\x05?\xb5\xcex\xbe}]6\xbe\x82{\x11\xbf\xbdv\xb0>H\xca9\xbewHm\xbeU|\xec\xbe\xe4P\xed\xbe\t\x04\xa9>bK#<\xb2\xef\xeb\xbdRt\x18\xbfK\xcdw\xbe\xbc\'\xc8>\x12\xf2\xba\xbe\xe9\x96\xb1\xbd\x91}\xc1\xbe\xd5\xed\xc9\xbez-!\xbf\x83B\n\xbf\x8d\x94\x0b\xbe\xeedu\xbe\xfcq\xb7\xbe\x8d\x14\xdb>\xf9\xa4\xd2>\xb3/ >\x9a\xd5\xbd>\x0b\xb8\xf6=Y\x9f\x1f\xbe[\xabT=\xfb\xf9\x14?\x13/\xa8\xbel\x07\x0c>[@\x89>\xd7\xac\xa2=\xf4\xcf\x16\xbf$K ?\xa7\xc7V>0\x82\xba\xbd\x88\xf9\xb4<DC{=\xd7\xe9\xb1=H\xd9%>\x03-V\xbelSe>\x90 \xf6=)q\xb6>\xf7=\xe4=_\xc1\x05\xbd(b\xcd>\xfa\x81W>Y\xab|>\xa5\x96\x87?[V\xb1\xbe\x81\x0b9\xbe\r\xea-=\x87P\xe6>o]\xc8\xbdz\xffb:.\x7f\xeb>\xb6\xfbV>\xad\x11\xba>\xceK\xc0=\xe6\x8e!>D\xe1\xe9\xbeL\xaa\x95>\x1c\xfaG=\xeb\x9a\xdd=\xc4\xd8<?4\xae\xcc\xbdz\xbb\x03\xbe\x04\x94\xa0\xbe\xd0F\xef\xbe\x7f%\x89>\x17\xde\xab\xbc\x0f\x85\xd4\xbd\xe9`\x04>H8\xdf>+\xc8\xdd\xbdDs\x8d\xbd;);\xbd\xb2N\xae=\x8f\x15\xc5\xbe\x81T9>L}H;\xe1\xfd\xbc\xbd\x9e,m;d\x0b\xf4>\xa21\xe8\xbe\xb3n\x05?\xee\xf0\xe6\xbd\x1e\x0f\x9b\xbe\xbf<\xdd>L\xa3\x1e=\xc5\xb9\xe8>#\xf3\x06?\x08\xb42\xbe\x190\xe6\xbd\xbf\x16F\xbe\xebO\x9d\xbe\xa8O\x0f?P\xf04?iY\xd2\xbd\xa5\x1f\xde>\x91hG\xbe\xa9\xcf\x19=\x9cu\x0e>7\xb7\x1b\xbf\xc7\xc3\xda>\xae;\x94\xbe\xc3A\x13\xbft\x1f\xac\xbe$Ad\xbe\xae\xf4~\xbe\x84Z\xd6\xbe\xce\x92\x11?\xb5\xd2j\xbe\xdfl\xa4\xbe\x03\xac_\xbe}\xf1\x1c\xbf\xf1SN\xbe.y\x19?0L\xf9\xbd\x1a\x07\x80=g\xfd;\xbf\x07\\\xe8\xbe3\x1c\n\xbf&\xda\xcf=_\xc7\x01?A\\\xd6=\x97\xbd\x96\xbeK\x07\x88\xbe\xcfk\x07?\xf0\xe5\x12>\x8f\'*=zv\x9f\xbb\x84\xd3"?\x83\x81\x0b\xbft\x0f=>\x1a\x8e\x9d\xbedF\xb5>o)\xc2>\xcd\xba\x02?!a ?\xd8\xe4 ?\xaf\xfc8>\x88R\xa8>,\xc4\x82\xbd'
-p57
-tp58
-bsV580406805039357952
-p59
-g2
-(g3
-(I0
-tp60
-g5
-tp61
-Rp62
-(I1
-(I200
-tp63
-g12
-I00
-S'\'\xb3\xf2<EV\x97\xbd\xf8\xe2\t\xbf\xef*\x00?\xe2\xba\xdb=\xfc\x83B>-p\x08\xbf\x07\x9a\x10\xbe\xb3I\x10\xbd[\xdd\xd6>\xc0{\x97=\xd2\x9b8\xbfs\x91^>\xdb\xe7\x13>\x8c\x18-\xbd\xd9a\xbc>\xf9\xad\xc0\xbd\xb4F\xef\xbe\xe8\xb34>\xda\xcd\x80>/mE\xbf\x9do\xf0\xbdS\x1b\x13>\xb6\xecc\xbeVyR\xbe\xd1\x90r\xbb>i[=\xd8o\x07\xbe\xcf\x0c)\xbf\xb8\xda+\xbee#\xe0\xbe#\x14\x8d\xbeLy\xe3>\x8f\r\xf5\xbe\x07\xb4w=\xcc\xe1u?\xe5\x04\xee\xbe\rk\xe9=R\xd2\x98>b\xe51?\xe3\x976>\xc5\x01#?(N\x9c>\xb3p(\xbf\xd0l\xae\xbe,\xd5\xa1<\xfd=\xfa>\x97\xbc\xb9><\x94\x1e>8\xc8\r?\xceT\xad\xbd\xfd@3?\n\xea\xd3\xbe\xf1\x16\x9c\xbe\xf3\xa7L\xbf\xf7\xbb\x06?6J\x8d\xbe\xbd\x92\x89\xbe\xe5A\x16\xbf5\xc4\n\xbf\xc2g\x0e?\x06s\xd5\xbd\xb4\x82r\xbe\xefyb\xbf%\xd7\xd1\xbek\x87\x16?=o\xfa\xbe\xccr>\xbe\xa0\xf5\x12\xbf\xddh\n\xbfYYC\xbf?\xe0<\xbf\xd3G(\xbe\x00\x83\xa1\xbeGd\t\xbf\xbei.?\xe7\xe9!?\xd9F^>~j\xef>%\x05\xdf=\xe0Vt\xbe90\xde\xbcC{I?\xd4@\xdf\xbe8H\x03>\xbf9\xcf>\xcaz\x94;}]F\xbf\xe2\xbd3?\xd4P\xcd>\xff.\xa9<N]\xb8\xbcT\xadX>\xca\xcc\xda=\xec\xc4\xb6=\xca\xc8\xa0\xbe\x8b\x89,>n\xcd\xa2=\xa3#\xe2>\x83O\x89>S\x92\x18\xbdKb\x03?\x87\xfa\x7f>\xa2\xac\x91>bR\xc0?\xac@\xf8\xbe\x93\x14\x88\xbeF\xea\xa5\xbc1M)?\x1f\x803\xbe\xe5\xb6\xa0=\xb2\xcf7?\xc0Zy>\xf8\x15\r?\r]\xff="\x81u>\xe6\xe6\x15\xbf0=\xc1>;\x13\xa2=\xcf\xa3I>~\xfas? O\xa0\xbe\x03\x93I\xbe\x9b\xaf\xea\xbe8\x07,\xbf\xb5\xff\xb3>\x84\xb6D\xbd\xb0z<\xbe\ro\x12>\xf3H\x19?\xc7\x7fw\xbeb\'o\xbe\xc8\x06\x08\xbe\x97\xca)>\xe3{\x1f\xbf\x9e\x87.>\xd7\xc1\x83=\xc83\x19\xbeC}\x05>\x15K=?+\x8b\x15\xbf\xb5)0?\xa0\xd77\xbeZ\xa3\xa5\xbex6 ?\xae\xd1\x03>\x0c[0?c\x9f%?\x1d\xd0t\xbe}\xc0\x8d\xbe\x81Y\xa2\xbe\xe0\x19\xeb\xbe\x98iI?\x18\xee\x86?\xf3\xe5>\xbe \x9e\xfd>\xb6\xfek\xbe} \xec<q\xe4\x06>\xf3,g\xbf\xb4)??\xe8\x04\xc6\xbe\xbdw6\xbf\xb3\xce\xf2\xbe\xb7|\x9b\xbe\xa8e\xf0\xbey\xb4\x08\xbf\xd7FF?nK\xad\xbe\xb1\xf9\xfc\xbe\xca\xcf\xb4\xbehhX\xbf\x80\xed\x88\xbe\x9d\xc9V?\x98}J\xbe3\x17`=\x0cx\x86\xbfz\x94\x1c\xbfG\x98|\xbf\x05\xbd\x98=\'#\x18?3\x88=>\xc8A\xe3\xbe\x99t\xef\xbeH\xbe5?\xeb:6>\xc4\x91\x96\xbd\xcc1\x11\xbd\xd8ro?\x8b*M\xbf\xde\x07\x14>\'\xdb\x18\xbfGs\x07?\x90\xba\n?\xedY\x1c?\x83Ln?\x02q}?\x93\t|>\x8f\xc9\xff>#t"\xbd'
-p64
-tp65
-bsV590874958890414082
-p66
-g2
-(g3
-(I0
-tp67
-g5
-tp68
-Rp69
-(I1
-(I200
-tp70
-g12
-I00
-S'%\x05#>\xd0\xd9\x1c\xbd\x87\x02\x8f\xbe\xb9\x8d\xe6=\x89\xba\x12>p\xb5\x9a<\xfb\xee\x18\xbe\x89\xdd\x12\xbeh\xbd5\xbd&N5>\x9e5L=_\xcf\x1c\xbeX\xf3\x04>\xbf*\xa0=\tW\x84\xbd\xa6\x04w>\xe7\xd8>\xbdp\xc3\x00\xbe\x07i\x10\xbd\x97\xa2\x10=\x9b\xa6\x86\xbe \xa4\x03\xbd\xfd,\xc9=W}\x12\xbe$?\x88\xbdX\x9dW\xbdO\xbb\xae=H\n\x0e\xbe\xe7w\x87\xbe\xa9\xac\xd4<\xbc\x97\x04\xbe#\xd8\xe0\xbd3@">9\xfad\xbe\xfd\xaa+=\x07"\xa9>%\xa8\x1e\xbd\xaas\xa3=\x19^W>P\xdcA>\xd3s\xa8<\x13\x97\xd8=\xb1\x04&>\xf9\xc4\x84\xbe\xee\xee\xee\xbd32\xb4\xbb\xd6\xf3\x95>\x9e\xbd\xc5=B\xf1W=05\x9c>\x89J\x9c\xbb\xab\x93\xa7>\x0b\x8a\x13\xbe\xb8\xcff\xbd\xe7L\xc1\xbe\xf0\xd8Q>\xaaS\x8a\xbd\x1d\x1b\xd6\xbd\x83\xb2\xb9\xbe\xef\x02\x9f\xbe;mQ>qB\'=\xe8\xb5-\xbd\xb1.\x9c\xbe\x06u\xe8\xbd\x15\xfd]>\x91;O\xbe\xd1\xe0?=R\x92W\xbe\xc9\x90+\xbe/m\xd2\xbe\xb3`\x93\xbe;\x7f\x0c\xbdS+\xf0\xbd+Q*\xbe\x07\xe5w>{Xb>\xef\xb7\xed=X^\x1c>\x9d{\xf7=Y\xd1\xab\xbd\xd1\xb4\xe0;\x9b\xe7\xa8>\x00\x84I\xbe\x8e\x87\x00>\xfdy\x15>\xeb \x0c>\x0e\x9e\xa3\xbe;y\xbc>r1\xf9=?\xce\xa9\xbdGyw=\x0e\x99\x9e\xbdp\x0b1=mX->\x91\xb0\x80\xbd\xc0\xf7\x01>}\x86\x1d>\x1f~\'>\xae\xc2\xc7<\x92.\xf7<\xdd%z>%\x86\xf6=B\x19\xff=c\xa1\x08?7\x8bL\xbe0D.\xbd\x9fO\xd8<\xc03->\xf0\x11\x11\xbd\xe8!\xc9\xbc3a\x8d>\x1fT\xf0=\x96\xd79>K\xbcP<\x99p\x8c=N\xe5\x83\xbe~\xa7Z>_KI=\x80&\xbb=\xc8M\xe1>\xa2\x1e\x8f\xbc\xa0l\x1a\xbd\x88G\xfc\xbd\x1a\xe8%\xbe\xda\x871>\x9b-\x8b\xbd\xc9\x98\x15\xbd\xff"L=\xa7H=>\x98\x1f \xbd\xe7\xf4:\xbc\xc8\xcf.;\rmN=\xde\x90\xb0\xbd\x90\x9a\xa6=7\xf7\xbe\xbb\xf1\xc7#\xbd\t\xb2\x0b=\x7f\x9cH>\xe9\xcaU\xbeS\xbf\x97>\xd1\xa9\xed\xbc\xceSM\xbe\xdf0\x80>\xd9\x8eq<\xfe^h>\x7f_\x8e>\xf2\xfb\x02\xbeW\x12N\xbdb\xf6\xbd\xbd\x99\xc7:\xbe\xc27\x92>\xb0Y\xab>\xf1\x8e\x0f\xbdQU~>\x01\xd1\xc3\xbd\x08zh=\xe8\xb2L=\xdf0\x9f\xbeC\xeaO>\x81\xceH\xbe\xe9>\x9e\xber\x8b\'\xbe\x9bs\xab\xbd\x9b4\r\xbe\n\xec\x8f\xbe\x12\xd7\x98>\xaf\xf8\xd2\xbdU\xfc)\xbex\xb2\x98\xbd\xbd\xd3\x8d\xbe\xa7_y\xbd\x91\xc4\xcb>\x05K\xd0\xbc\x06$\x82:.\xf0\xc9\xbe"\xf9\x90\xbe\xff\xb2C\xbe\x8ep\x8c=\x90"\x93>\xbc\xb6\x89=j\xd76\xbe\xee$\x00\xbe\xa7c\x8a>Y\x00:=\xa2\x05\x86=E\xe3\xb4<\xde\xe0\xa5>\x9e1\x89\xber\x17\n>\xc3\xb2\xe2\xbd\xdb\x10)>\xb3\xc5b>\x8f\xbe\xa1>\xb1\xaf\xb5>\x7f\x1c\x84>\x95\xe3\xc3=\xa0\xdf\x13>?\x92\x8b='
-p71
-tp72
-bsV582777611551641600
-p73
-g2
-(g3
-(I0
-tp74
-g5
-tp75
-Rp76
-(I1
-(I200
-tp77
-g12
-I00
-S's\x18@\xbd\x0bw\xb1\xbd\x1d\xb7\x18\xbf 8\x14?\x13\x8e\xa4=,\x1d\x82>\',\x17\xbf\xd3\'\xe6\xbd\xb3W\x0b\xbd+\xdd\xf7>\xb7\xfb\x94=3\x99a\xbf\xa8\x84\x84>\x8cI$>dX\xe7\xbc\x80P\xba>\x89F\xdc\xbdmk\x0f\xbf\x14\xa2n>=\xf8\x9e>\xc0Pe\xbf\xfe\x8e\x06\xbe\xb1\x8d\x07>\xe9A?\xbey\xfb^\xbeu\xd1\t\xbb\xf7\xcf\xff<\x9dv\xfe\xbd\xa3\x8f?\xbf\xf1_\x82\xbe[\xf2\x07\xbf\x7f\x17\x96\xbe\xcf\x81\x04?\xb5d\x10\xbf\x93\xc5@=\xe9\x16\x8c?a"\x1a\xbf;\x1a\xed=\xbbf\x90>\x008R?\xe7sc>\xcd\xe0I?l\x9c\x9e>\x13VA\xbf\xbd\xe3\xc1\xbeg\x97C<-;\x00?\x1b\x8c\xd5>O\x0e.>\xaf\xdf\x11?D\t\xef\xbd\xb1}K?\x99\xfe\xee\xbe\xebq\xb3\xbeP\xf0^\xbf\xcbF\x18?\x9d\xad\xb2\xbe?@\xa5\xbeA\x9d!\xbf\xdd\xc7\x18\xbfi\xc5$?w\xcd$\xbe\xb1w\x9b\xbe\xe7\xb9\x82\xbf\xfc\x8b\xeb\xbe<4-?\xa7-\x14\xbf@\x8f\x8b\xbe\xf1\x82\'\xbfOI\x1d\xbfU\xc5M\xbf\x08\xa5S\xbf#\n2\xbe\x8c^\xb2\xbe\xf1 #\xbf8\x9eB?\xfdo;?\x80\xd9m>\xfe\x1c\x06?}s\xdc=\xf4\x18\x8d\xbe\x83d\x88\xbc\x13\xcbn? Y\xfa\xbe\xe1q\x02>\xc0\xa7\xed>\x1dO\x15\xbd\xc4\x88a\xbfSyD?\xb0\xbc\xf0>H\xdc\x9c<\xefn\x97\xbd\x9b\x81\x9b>\tK\xf6=\xbdt\x99=\xa1\xca\xc1\xbeI{\x16>\x8fKU=\x03G\x00?\x0b\x81\xa4>\xdcw\x82\xbd\xa4\xa8\x10?M=\x97>\xb2\x1c\xa4>A&\xdb?\x14\xdd\x08\xbf.?\xa5\xbe\x11\xe4A\xbd\xe5eI?\x1d\x19a\xbe\xc0\xe3\xff=\xadRO?\xab\xc4p>\xa9u\x1c?\x05)\x13>|b\x90>;\xd7#\xbf\x9f\xa5\xcc>U\xa8u=\xcf\xafQ>\xc8\xfe\x88?\xc4\xfb\xd5\xbe\xe8ma\xbe\xd3\x92\x0b\xbf\x8f\xf6M\xbfi0\xc5>u\xb5~\xbc\rBq\xbe-\x81/>\x0b\x1e/?\x89;\x9b\xbe+ \xa2\xbe\xd9\xcf?\xbe\xbfTH>UJF\xbf\xdfKX>\x7f\x9a\x87=\x19\xf72\xbe\x84\xc2/>\xddW_?\xc1v+\xbf\xbd\xe5D?\x99~p\xbe\x99\x7f\xa3\xbe\xf583?+\xd4->\x94\x08K?\xb5\xb64?\xcb\r\x84\xbe\x1b\x00\xb6\xbe\xbcj\xd2\xbe\x17\x84\x05\xbf\xacQh?\xee\x9e\x9c?Gm}\xbeq\xc7\x0f?\xea\xf5\x89\xbe\x9e\x84\x85<k\x95\x0e>\xcf\x9f\x86\xbf\xbb\x18_?\xa3j\xd1\xbe\x1f\x82L\xbfTs\x12\xbf\xab\xc3\xba\xbe\x87\xe5\x13\xbfaw\x18\xbf\xd1\x12^?x\xa1\xd2\xbe\xccp\x12\xbf\xb3}\xd5\xbeH\xdcz\xbf\x0b\xd5\xa0\xbe\x18\x8ap?<"j\xbe\x08\xb2y=X/\x9d\xbfx\x1e,\xbf\xa4\x04\x99\xbf\x90\rj=\xfb\xea0?\xcc\x1cb>I\xc3\x00\xbf\x00\xfd\x0b\xbfHZL?\xf5\xd5_>[\x0c\x12\xbe8|@\xbdY_\x89?\x11Ck\xbf\\\xf5\x16>\x95\xa9<\xbf$h ?\xc7%\x1d?\xf8U/?\x98\x87\x87?+w\x96?\xc7\xe6\x8a>\xb9\xc1\x18?\tt\x88\xbd'
-p78
-tp79
-bsV580633419958325248
-p80
-g2
-(g3
-(I0
-tp81
-g5
-tp82
-Rp83
-(I1
-(I200
-tp84
-g12
-I00
-S'l\xd9a=!\xddJ\xbd\xa1\x9f\xd2\xbe\xda"\xc7>6\x12\xdb=\x94\x8f\x08>\x97,\xc9\xbe\x97\xbb\x1e\xbe\xa8\xf3\r\xbc\xa6\xbd\xab>\xb7\xaeI=\x93%\x08\xbfD \x0b>D\xeb\xd7=\x1f\xaa\xa7\xb9\xef\xa9\xaf>\x81+\xa8\xbd\x89\xa2\xa8\xbe\x1f\xac\xd2=\xff\x9a\x07>\xc7\x98\r\xbf\x83C\xc0\xbd1S\x17>)\x01\x04\xbe\xe9\xd5\x18\xbe\xf9\x99/\xbc\xad9l=fX\xc1\xbd\x84|\xf6\xbe\x82[\x12\xbe\x00L\xb7\xbe\xf0\x10g\xbe*2\x96>&\xd1\xcc\xbe\x14\xf2l=\x9a\xce:?\xc3\x99\x97\xbe\xd9\x16\xca=\xda\x8d\x81>\xac#\xf5>W\xd1\x80=f\x94\xcb>\x1f_P>\x11\x02\xe7\xbe$\x85\x9b\xbeR\xcf\x10\xbc6w\xcd>\xa1Y\x98>Q\xce\x15>\x89t\xe4>\xc4\xbcw\xbd^\xf6\x05?O\x98\x92\xbe=aZ\xbe\xcc\xa9\x1b\xbfdX\xc0>\xf9\xb2]\xbej_h\xbeYf\xf1\xbeM9\xdf\xbe\x8b;\xb9>\xd7\xca6\xbb\x7f\xf2\xf9\xbdL\x8b*\xbf4\n\x8d\xbe\x9c\x93\xd1>\x03|\xc0\xbeq\x04\xc3\xbd\x04;\xc3\xbe=\x17\xdd\xbeWM\x1a\xbf\xd7.\x15\xbf\xa9\\\x18\xbe\t\x83i\xbe\x11\xe9\xc1\xbe\xb1\xb4\xf6>\xd7\x7f\xe7>\xbc\x12,>\xec\xae\xc3>\xa1\xee\xe3=\x8d\xa7\x15\xbe6R\xe4<\x93=\x1a?\xb6V\xaf\xbey\x94\xda=\xea\xf0\x91>\x0c\x01\xb6<\x84\xf9\x17\xbfO\xf3\x18?\xd7\x9c|>v\xfc\x16\xbd\xa7<\xb4<\x1f\xe7\x19>\xf0\x02Y=1\x06\xd9=\x88\xf7\x81\xbe\xe9\xebI>\xdb\xc6\xb0=T\xe5\xc2>\x7f\xe5\x1f>Jj\x1a\xbdY\x12\xc3>\x84\xd3Q>\xf2\xaa\x80>\x0c\xea\x92?\x81\x8c\xbf\xbe\x80\x03\\\xbe\xccC\x05=A\xd6\xfd>\xc9V\xfb\xbd\xc6\x93\x18<\xfb\xeb\x00?oVT>\x86\xb6\xd0>\xec\xb5\xc9=\xa0G@>\x07\xe5\xeb\xbe\xa1\x05\x8a>\xe7>y=\xe6\xca\xed=\xc6\xe3C?*K=\xbe\x983\x05\xbe\x81\x9f\xb4\xbe\xef\x95\x00\xbf\xd7$\x8a>6\xe3\xd6\xbc\x04h\xf3\xbd\xa7\x04\t>\xa1\x19\xf6>T&&\xbe\x93\xf9\n\xbeD+\x97\xbd\xf1\x9f\xea=\xa3c\xe8\xbeY\xcb\x1b>\x11\xef\x10=j\x81\xd4\xbd\x93?\n=\xbaf\x04?}\xc0\xf3\xbe\x8a\xaf\x0c?\xd1x\xbe\xbd\x17\xb9\x91\xbe\xaf\x86\xf1>j\xde\x9f=\x8c\x1f\xf4><W\n?\x9diD\xbeZ\x91\x1e\xbe\x81\xddd\xbeI\x9e\xa7\xbe\x98\xa3\x16?\xaa\xb9D?\xfc\x96\x16\xbe6K\xd0>\x9c\xd6S\xbe\xa0L\x05=th\x01>or.\xbff\xce\xfb>\xa9~\x9a\xbe<\xd2\x17\xbf\t\x99\xb2\xbes\x97]\xbeP\x91\x91\xbe\xbd,\xcf\xbe\x9f\'\x19?\x81\x1c\x82\xbe\x04\x82\xc1\xbe\x97\x1a\x83\xbeT]\'\xbf\xe6Yi\xbe\xf2\x97\x1c?\xaf\xfa\x19\xbe\x17~\x86=\xf4\x93I\xbfG\x86\xea\xbe\xb9\xba"\xbf\xf3V\xa3=C\t\xf3>\xa9\xb9\n>i+\xaf\xbe4\x03\xa1\xbe\x1a[\x15?\xd1\xbe\x12>yjU\xbc\xd1\x9b\xe6\xbb\xbc$4?:\xc7\x1b\xbf\xba\xd5\x17>OY\xcc\xbe\x7f\xe7\xbe>\x81\xc2\xc5>\x80\x0b\xfc>a\x90-?\x99\xdc7?\xdc\x82;>\xc3\t\xc4>\xa8\xc1\xa8\xbd'
-p85
-tp86
-bsV580431845948526593
-p87
-g2
-(g3
-(I0
-tp88
-g5
-tp89
-Rp90
-(I1
-(I200
-tp91
-g12
-I00
-S'E\xa1\xb0=\xf4\x80*\xbd\x123y\xbe\xca:.> %\xad=\xaa\xa2S=\x1a\xa5G\xbe\xc8A\xdf\xbd\xa4\xbb\xbf\xbc\x8ba>>\xd6\x03$=\x08\xdfq\xbe]Z\xcf=\x8f\xb8\x86=\x18\xe2\x00\xbd\x98\xd9R>\' 9\xbdO\xbb \xbeSR\x9c<\x98\x8as=@\x02\x95\xbeO+#\xbd\xb8\x96\xb0=-\xb0\xd7\xbdKL\xa4\xbd\xa7[\xdd\xbc\xdd\x85b=\x1f\x9e\xac\xbdjv\x90\xbe\xf5\xe7\xf3\xbc\x05\xde-\xbe2\xf8\xf1\xbd^q(>\xeb\x17[\xbeJU\x1e=xU\xc0>r\xa9\xe2\xbdM\x1bR==a2>\xd1\x8bs>[5\x16=\xdf>*>*\xcc\x06>T\xc7\x83\xbe\x13\xed\x0e\xbe\xba\r\x10\xbc\x11\xda\x83>\xa6;\x0f>$\xf9\x8b=d\x86\x8b>\x8e\x9e\xc0\xbc\xf8D\x9b>\x96\xba\x1d\xbe\xd8+\xda\xbd\x1a\x18\xb6\xbe\x81\xe2V>8t\xbf\xbd-X\xd4\xbd*,\x9e\xbeVL\x89\xbe\xff\x10U>\x18)\xbe<xa\\\xbdZ(\xad\xbeJ\x10\x18\xbe \xcbf>F\xc3S\xbe\x8a;?\xbc\xf1^[\xbe\xef\xd5T\xbe\xdf)\xbc\xbea\xf5\x9b\xbeY\xd6o\xbd\xfat\x06\xbe\xb1\x95?\xbe\xfe\xec\x86>\xebou>\x9a\xd1\xd7=\xc4X=>CP\xb3=\xf3\xdc\xb0\xbd\xdf\xf2\xce;rB\xae>u|I\xbe\x03\x16\xb5=\xad\x02\x1e>&Wn=\xbc>\xa5\xbeJ?\xad>\xc2\xab\t>]:2\xbd\xe0\xce\xf1<\xcd\xb8\x8f<\xefZ#=\xefW\xd3=(B\xe1\xbd\xe0\x86\xf3=+\xf3\xbe=\x95\xd2A>B\x9f\x92=\x07)d\xba\xe0Bi>\x83\xb3\xfb=\x08\n\x01>\xf3\xef\x16?\x06\xafT\xbe\xe1\xe0\xac\xbdo\xd2\x8e<\x01\x19p>\x83\x04b\xbd:f\xa8\xbb\x9f\x81\x90>\x8a"\xe2=G_T>Xv#=m"\xcb=\xfa~\x84\xbe\x1a\x068>\xe6\xed>=\x0f \xa7=\x93\x8f\xd9>h=\\\xbdj\xb2a\xbd\xe9w.\xbeG\xdck\xbe\xfa\xe5%>\xe6\x00\x1c\xbd#>\x83\xbdS\xf1{=\x80Yq>%\xa7\x98\xbd\xf5\x91F\xbdO.\xcb\xbc\x03\xc3a==7;\xbeE#\xa9=o\xb0\xa0;\xe6\\m\xbd]z\xdc<\x8a\xa0\x82>\xd8\x9ex\xbe]\xc9\x97>#\x7f9\xbdKx5\xbe\xa3\xb8\x82>\x1fV\r=\xf0J\x85>\xa1\\\x98>\xfc,\xee\xbd4\x17\x8b\xbd\xbcB\xfc\xbd2dB\xbe\xc3\xf2\xa0>\x1cX\xcb>f\xa7{\xbd\xc0\xfbl>\xd5\xab\xd1\xbd\x8a\xf3\x17=\xfc\x8cV=\x9f\xe8\xb1\xbe\xe1\xf0x>G*:\xbe\xc3\xc8\xa3\xbe\x96\x193\xbe\x8a[\xe2\xbdY\xaa\x16\xbeI5\x82\xbe\xed\xda\xa2>H\x01\x05\xbe1=E\xbe\x0f\xe5\xee\xbd\x95\xa8\xa9\xbe\xd9g\xb8\xbdv\x18\xbb>\xa7\xaa`\xbdJ\x14\x8d<\xa4\x12\xd8\xbe\x13\x10\x89\xbe\x96v\x98\xbe\xe3$f=\xa5"\x8b>\x97X\x9e=\xd6\x9eB\xbe\xb0\xcc#\xbeH[\x9a>\xb3\xdb\x84=\\k\xa8<\n\x98-<\xcd\xa3\xb9>1 \x9a\xbe\\A\xcc=\xbf.6\xbe\xb9\x94;>K\'[>m\x17\x95>\xef\xdf\xbd>\x8al\xb2>\xdc]\xd3=\xc7\xd7A>\xb9\xa4\xf3:'
-p92
-tp93
-bsV582874593473376256
-p94
-g2
-(g3
-(I0
-tp95
-g5
-tp96
-Rp97
-(I1
-(I200
-tp98
-g12
-I00
-S"T\x1b&>\\\x14\xbe<\x96v\xa9\xbe\xff\xb5i>Qo\xe0=\xebO\xb3=\xdd\x8e\x84\xbe9[+\xbe:\xc2\xa7\xbc\xa6i\x88>\x9e\xfc\xa6<\x83\xf8\xb7\xbe\xf9'\xd5=\xd5{\xb5=oZ\xbd\xbco\n\x96>\x91*\xb0\xbd\xb9\x08\x84\xbe\xe6\xb7\xc4;uAr=\xfed\xbb\xbe6\x01Q\xbd9I\xfd=wq\x84\xbd\xe7\x9f\xb3\xbdfI\xdb\xbc/\xea\x86=\xfa\x98\xb0\xbdS,\xb4\xbe\x86\xdd\xa4\xbd>\x05\x83\xbe\x83\xd0\x1f\xbe\xad\x16K>\\*\xa1\xbe'\xc4\x81=\x14\x8f\x05?\x06\xea\xdf\xbd\x14<\xd6=\xbe;`>\xd6\x03\xa6>'\x038<\xd7\x0cC>\xa14'>\xde\xf7\xa4\xbe}N_\xbe{_\xd9\xb9LM\xa3>n\x8cN>\x1b\xb8\xa5=\xcb\xdf\xc5>\xf4\x93\xa9\xbd\x8c\xb0\xc6>bpN\xbe\x9c=\xfe\xbd\xd5a\xfb\xbe4a_>\x83\xac\xfb\xbd\xb6_\xd7\xbd\x8b?\xed\xbe\xc1\x06\xbe\xbe\xce\x0f}>D7\xb4=\x19/\x1c\xbd+7\xe1\xbe\x1b$<\xbe9m\x8f>\xbcR\x89\xbez\x96\xe0<\x87\x01]\xbe\x8c\xdb\x9f\xbeo\x13\xf9\xbez\xbd\xda\xbe\xe3|\x1c\xbeq7(\xbe\xef\x92\x80\xbe\x118\xa0>\xdf5\x8c>\x0c\xdf\r>\x1e#\x96>p\xc6\xe6=\xab\xb0\xb9\xbd\x00O4<\x82\x16\xe2>z\x82\x8f\xbe\x9d\xcf\xeb=\x86XF>\x8a\xff\x85=\xe0V\xd4\xbe\xcc\xe8\xed>3\xd2\x0f>\x07\xf5Y\xbd\xc4\xbbN=\xc20.=\xda\x90\x0c<\xbcw\xea=\xfd\xe0\x01\xbe\xeb\x13T>\x89\x1c\xfa=\x03\xbc{>\xad\xf4^=\x87#\xc6\xbc\xc5\xb8\x92>\xab\xc1\x13>F\xb57>{\x1bT?\xae^\x96\xbe\xe6$\x01\xbe>\xd6\x9f=\x97M\xa0>\xa5\x00\xa4\xbd\x84\x9c\xbc\xbd\xf5\xd1\xb8>\x05o<>\xce\xcf\x9b>\xb1\x13\xb6=t]\xf3=k\xcf\xb0\xbe\xfa\x03v>\x01\xf0)=\xcef\xca=j@\x0c?d\xa5v\xbd\x80/\xa8\xbd\xb5vf\xbe\xc9\xd4\xa8\xbe\xbcvR>\x05\rn\xbd:\xfd$\xbdC\xcf\xbb=\xc0\xc6\xa4>2`\xd7\xbdf\xdbX\xbd\x81\xe5\x1b\xbd\xbe/}=\x82\t\x96\xbe\xe4\x17\x96=\x04\xc0\x9d\xbc\x93\xfc\x9a\xbd \\\x18\xbdG\xaf\xa4>u<\xa7\xbe\x00\xa1\xc5>q\xbc\xad\xbc\x1f\x92r\xbe\x10\x85\xcc>S#\xc8=N\x86\x9d>\xc7J\xe5>\xa10\xfc\xbd\xbc\x0b\xaf\xbd\xaf\x8a\x01\xbe\x02\xd6r\xbe\x9e^\xe3>c{\x02?\x93\xe8\xca\xbd7P\x95>\xc9\xf7\x1f\xbe\xc3_}=S\xda\xbb=\xb1\x1e\xfd\xbe*E\x81>\xeb?\x87\xbe\xb60\xed\xbeZ\xd7\x8e\xbe\x86)\xeb\xbd\xb1\xdd?\xbej2\xa5\xbe\xd7^\xd5>\n\xe6\xdc\xbd\xfe\xe5\x84\xbe\xaa D\xbe\x86\xda\xf2\xbe=g<\xbe{5\xef>\xff\xbf\xc5\xbd\xdd\xb9\x86=: \x17\xbfW7\xd4\xbe\x9ar\xb8\xbe\xd3\xc1\x9d=U\xd7\xb9>\xf1\x92\xa0=d/\x8b\xbe}\xe2e\xbe\xb5\xfe\xec>\xb0\xaf\xd9=\t\xc3\x1f<\xcd!\xc4;\x97\xad\xfc>\x92E\xd8\xbe\xed9\x15>G\x8ex\xbe$4}>\xe3K\xac>01\xda>\xd4\x1d\x0b?\x93\xdf\xd4>q\xec\x04>\xb6\xb6\x88>W\xa2\x1b\xbd"
-p99
-tp100
-bsV590811531836788736
-p101
-g2
-(g3
-(I0
-tp102
-g5
-tp103
-Rp104
-(I1
-(I200
-tp105
-g12
-I00
-S'\x04\x85\x02>d\xb3\x9e\xbd\xdf\x0b\xa9\xbe\x87pA>@\x91\r>\x06\xef\\=\x03&q\xbe\xd7\xfb\r\xbea|&\xbd\xbc0l>Q\x9f\x88=\x8a\xd8\x84\xbeP\x86\'>\xc6\x80\xc2=\xdaq\x84\xbd\xc0\xb0\x8c>ItJ\xbd]\x9a8\xbe\xf4\xb1\x1e<\x03R\xa1=\x84\x8b\xbe\xbeT#Q\xbd\xf4\xfa\xde=\x85L6\xbe\xd6?\xd6\xbd\x9d\xefP\xbd\t\x13\xa5=\xe2\xd8\x1e\xbe\xd4~\xbd\xbe\xb0\xadt;\xe09?\xbeD\xd1\x19\xbe\xc9\x8ff>\xd2m\x89\xbe\x91\xa7B=\x87\xcd\xe9>yn\x05\xbe.\x10\x8b=\xa6\x8dp>\xddb\x95>o(\x82=Y\x83Z>\x8c\x9eE>N\x9f\xb5\xbe<|\x1b\xbe\xf0\xddA\xbb\xfa\xa5\xb8>e\xe4\x17>^\x99\xa4=\x9d6\xb7>\'c\x04\xbc\x9c]\xd3>\xc6FK\xbe7\x03\xea\xbdaw\xf1\xbeO\xa1\x97>|\xac\xe8\xbd\x07\x8e\x12\xbesJ\xd3\xbe\x8d4\xba\xbe\xc1K\x93>\x00\xfd\xfc;/>\xb5\xbd-\xd8\xdc\xbe\xdf\xec=\xbe\xaco\x9a>\t?\x89\xbe/G\xe3\xbb\xc8\x19\x9b\xbe\xf6Ju\xbety\xfd\xbe\x8c\x91\xc1\xbe\x8e\xa3\x15\xbd\x1c\xe9)\xbe\xe3Xp\xbe\xc8x\xb1>G\xd7\xa0>\xd1\x97\x11>\xc6\x1cN>\x14\x04\x03>&\xb9\xfc\xbd\xd0\xe1\x1c;\x83(\xe4>,\x8e}\xbel}\x0b>mdP>\xb9\xa0\xfa=m\xd0\xd7\xbe\x84>\xdf>\xb7\xffE>?\xa2\x85\xbd]\xb7>=7L\xd2\xbc\xe2\xa9\xa4=<b0>$\x0e\x00\xbe\xd3\xa8\x03>\xf1\x8a\x19>\xaa\x89n>\xf0\x19\xbd=\xe1\xd5\x93<\xbcK\x9f>"\xb7%>4\xc9\x1f> i:?`\x8d\x7f\xbe\x98\r\xa3\xbd\xddL\xf3:\xd7J\x8d>,4\x88\xbd\xac\xf0\xb1<\xc1$\xbf>\xcf\xd3\x03>\x8c\xcez>qk\xbd<\xa1\xd8\xe6=gs\xa4\xbe\x14*\x81>\x84u\x8e=\x07\xc6\xee=/\xe6\x0e?<+\x8e\xbd\x93px\xbd\xbd\x99R\xbe\xec\x98\x85\xbe\x0f\x81c>:Wp\xbd\xfc|\xb4\xbd\x90,\x8f=\xd1z\x8a>\xd0\x1c\xa8\xbd\xa1\x02u\xbdiE\xb4\xbc\xa8\r\x96=C\xc9:\xbe\xb6\xec\xe1=\x81R\x8b<\x90\xb8\x93\xbd\x9e\xc3\x9a=\xe5\x9e\x9e>\xb0:\x95\xbe-"\xc2>\xf7\x17\x86\xbd\xd4\xa6j\xbe\x01\xc0\x9e>v+\xd0<D\xdf\xac>g\x8b\xaf>\x0cu,\xbe\xad<\xc1\xbd\xcc\xc7%\xbeY\x96}\xbe*\xda\xc5>\xcc\x1c\xfb>*\xe6\x84\xbdOQ\x99>w\xce\xf2\xbd\xfd\x84==\xbfHf=\xe7a\xdd\xbe\xe92\xa8>\x91)q\xbe\xa7O\xc8\xbe9\xadO\xbe,*\x0e\xbeM\x1bN\xbe \xf8\xb0\xbe\x1c\x0c\xd0>\xd7\xdd9\xbe\x1c\xbat\xbeo}\xf9\xbd\xd7I\xc5\xbe\x04\xdb\xa5\xbd\xe8\xa1\x00?\'\x11R\xbdW\xf2\xf3\xbb*\x96\x07\xbfG\xe8\xab\xbeg\xad\xb9\xbe\xb7\xd0\x9b=D\x82\xb9>\x91\xed\xcf=\x1f\x8ao\xbe\xf9cI\xbe\x97\x05\xb1>\x08\xb6\x92=\x19!#=Y$\x99<$\xa9\xe4>\x8f\xe1\xbe\xbe*\xe9\x10>\xf9\xccV\xbe\x80\x08o>Sv\x8b>\x9fB\xc1>\x07g\xef>G\x16\xda>\xd8u\x04>\x00Pc>\xcc\xf0~='
-p106
-tp107
-bsV580909625945518080
-p108
-g2
-(g3
-(I0
-tp109
-g5
-tp110
-Rp111
-(I1
-(I200
-tp112
-g12
-I00
-S"\xd6}\xf8=\xe0>]\xbd\xfc\xe6\xb8\xbe8%\x99>\x86C\x19>\x04\xd4(=\x83&\x8b\xbe\xc04S\xbe4\x8b\x13\xbc4&\x85>\xa7\xfeZ=\xcct\xb2\xbec\t\xdd=\xe3\xfc\xd7=\x80\x80\xba;\xe4'\xbc>\xb8I\x8d\xbd]_J\xbe\x03F\x81<V\xe7\xd9<\x94<\xca\xbeJs\xc2\xbd\x1d\xed6>3\xd0\xf3\xbd&\x1b\xec\xbd\x99g'\xbd\xb1\xbd\xb5=\xa7\xac\xeb\xbd\xdcz\xb8\xbe\xfeN\x91\xbdI\xc8\x9e\xbe\xef\xae]\xbe\n\xd9Q>\x91e\xb8\xbe\xa6\xbcX=wn\x13?\xf9\xc9\x12\xbe\x93:\xd9=\xdeu\x8d>\xc1L\xa1>\x80\xf8\xf5\xbc{\xfe9>\xafA\x10>)\x89\xa0\xbe\xbc\xc6\x8f\xbel4L\xbd\xa6\xc6\xc6>f\x8do>TM\x1a>D\xa2\xcd>\xcf\xc0\x0f\xbd7X\xdd>\xb8\x1b/\xbeY5\x0e\xbe6z\xfb\xbeD\xff\x8f>\x00\xba$\xbeQ\xc7V\xbe\xbf\x80\xdd\xbem\xff\xd0\xbe\x03\xafZ>\x80S\x94=\x9fI-\xbdh\xa0\x02\xbf\xd5$-\xbed\xf6\x99>bs\x96\xbe\x8f\x9a\xe9\xbcv\xc4\x8e\xbe\xae\xc2\xae\xbe%\xf8\x12\xbf\xbf\x88\xfb\xbe\xc7!\xf6\xbd\x916/\xbet\x18\x83\xbe\x8c\x1a\xb0>\x0c\x10\xaf>rH\x16>lq\xa5>\x08.\x1c><\xc1\xbf\xbd\xd2\x84\xb6=\xffd\xfd>\xea\x18\x97\xbe\xef\xcb\x05>$\xdcN>\xa1\x9e\xc5=\xaf\x96\x00\xbf\xc9\x03\x17?\x96\x9b\xf1=\x0f\xc5\xed\xbd\xdb\x08\xa9=\xf9n\x0e=\xdd\x9d4=Cu:>\\L7\xbe\xf0\x01\x87>\xb9\xff\x14>6z\xac>\xcatb=\x14Kt\xbcA<\xac>4JI>\xba\x9by>\xb4\x8de?\xe8\x10\x9f\xbe\xac9.\xbe\xd8w\x96=Ty\xba>\xfa+\x7f\xbdc>\x04\xbd\x01\x98\xb9>luM>\x01\xb3\x94>\xf4\xc1\x88=q\xdf\x1a>C\x08\xcc\xbe\xfaZm>\x06x5=\x83q\x8f=i<-?\xc9\xf5\r\xbd\x07\xc8\xa3\xbd\xc5\x8b\x89\xbe\x83W\xbb\xbe\x047w>\xbcT\x07\xbd\xc9\x07\xb3\xbdj3\x01>\x9d\xb2\xca>\xbf\x8a\xb3\xbdF\xad?\xbc\x93\x92?<8\x13\x96=I\xbf\x8d\xbe\xed\xce'>\x91D\x00\xbc\xd2f\x89\xbd3\x1e\x1b\xbd\xaer\xb2>6,\xd5\xbe#D\xec>\xe9\xe4?\xbd0\n\x9c\xbe_p\xb4>\xc6\x10\xfd\xbb\x1cS\xa7>c\x81\xf8>\x10\x8f,\xbeQ\xbf\x0f\xbd\xe9R\x17\xbe\xe0Ml\xbelI\xef>v\xbe\x0f?\xe5*\xb4\xbd\xf9\x12\xc7>d\x1fA\xbe`\xbbV=\x1e\xd2\x06>nR\x00\xbf\x12\xf1\x94>\x87\n\x8e\xbe\xa0&\x0c\xbf\x0f\x8d\x81\xbe\x99.,\xbey\xaa\x06\xbe\xc9(\xb6\xbeS!\xf6>\x97\xe8F\xbe\xcc\x9c\x8f\xbe\xbc\x90,\xbe7F\x05\xbf\xc3\xe60\xbe\xcc9\xf3>\x10\xaa\xc9\xbd\xaf\xb7~=i\x05\x1b\xbfW\x9a\xba\xbesI\xa7\xbe\x03\x83\xe1=\xfdn\xe4>`\xab\xb7=t|\x86\xbe?\x064\xbe!\xec\xfd>o?\x06>jc\xa7=\x94E\x00=\xf4\xc6\x07?\xa9\xec\xed\xbe$\rO>\xc0YL\xbe!\xe8\x81>\xf4b\x97>\x14[\xed>\xbck\xfc>\xe3h\xfd>\x7f\xe9\r>\xe4T\x92>\xd6k\xc5\xbd"
-p113
-tp114
-bsV580896626799194112
-p115
-g2
-(g3
-(I0
-tp116
-g5
-tp117
-Rp118
-(I1
-(I200
-tp119
-g12
-I00
-S'\x04!\xe4=+\x8f\x81\xbd\xa7H\xd6\xbe\x83\xb6|>\xc9\xcf">\xf7\xdd;=\xcf\x9d\x8e\xbe\x06w\x04\xbeh\x8e\x1b\xbd9:\x83>sA\x99=Fb\xac\xbeg4)>&\xf1\xb8=\xf2\xc7\x94\xbd^\xac\x91>\xea\xf6)\xbd\x9c\x89\x81\xbe\t"\x08=\xde\x9d\x07>\xc1\xe0\xef\xbe\x1f\x1b^\xbd\x97\x90\xdf=`\xedS\xbe\xf4\xad\xfe\xbd\x16^U\xbd\xbb"\xbb=%\xaa(\xbe\xc7d\xd1\xbe\xb5>,\xbd\xf6Ca\xbe\t\xf4+\xbe\x7f\x86\x8a>\x1aE\xac\xbe\xce(\xd5<\np\x0f?\xfc\tR\xbe\xe4\xc0\xc9=V\xd0~>W-\xbe>\xd2\xa4\x9d=\x90\xc5\xa8>\x1e\xc7^>\xeb\xa3\xd5\xbe!\xaaR\xbe.\x8d\x13<\x8fB\xc2>b\xc1*>\xady\xaf=\x16h\xc9>\x04\xc2\x8c\xbc\x1bw\xfe>}s\x8a\xbe\xea\xd3\x0e\xbe\xb5\xbe\x07\xbf\xd7\xd1\xae>Z0\x05\xbei%D\xbe\xa4a\xdc\xbeK\xe0\xd1\xbe"u\xb8>\x1e\x99\x06\xbd1l\n\xbe\x12\xbe\x02\xbf7\xe8H\xbe\x14B\xbf>\xd0>\x9d\xbe\x9f\xfe<\xbde\xd4\xcc\xbe\xb8y\x97\xbe!\xa4\r\xbf\x85f\xe3\xbe\x0fZ\x8b\xbd\xb6<F\xbe%D\xaa\xbe{\xba\xd0>&\n\xce>\xce\x9c!>B\xcd\x80>\xbe\xea\xf5=[\xd9!\xbeg\xb1 \xbc\xecJ\xf9>>\x1c\x91\xbes\xf3\xfd=v\xf4v>v\xd0\xc5=\xb1\xee\xfb\xbe\xd5\x91\x04?=J{>\xc0\x81N\xbd\xdcE:=\xd0\xe1\xd5\xb9\xc0\x81\xb2=\x9eb >\x83 \x15\xbe\x8e\x99\xf2=\xd1\xf3\t>\xd9N\x89>\x9c\xbd\xf1=\x8a\xa6$;\x0cA\xbf>A\xb3(>\x00\x08:>\x12\x92^?8\xda\xa5\xbe\x0c\xc2\xe4\xbdDV\x9f;\x1fi\xae>\xed\x8d\xba\xbd_s\x96<u>\xdc>\xcf\xf2\x0e>\x88t\x9f>\x96\xfee=\xd8{\x03>\x7f\xb8\xcc\xbe\xdf\xad\x8f>a\xf1==a>\x02>\xf7\x08%?\xff \n\xbe\x9f\x17\xe0\xbd\x000l\xbel\r\xa9\xbe\xf4\xc5\x84>\xd8k\x92\xbd\x028\xb0\xbd\xc2Z\x86=l\x97\x9f>\xde\x1d\xc5\xbd\xee\r\xb8\xbd.\x1c=\xbd\x96\xdc\xa3=bi\x8c\xbe\xac\x8d\x07>MS\x91<1\xfe\x82\xbd\x9e\xc2\xae=/B\xc7>\x9e8\xa9\xbe?\x82\xe2>\x1a\xde\xd4\xbdd\\\x7f\xbe\xddt\xc6>u\xc8D=;\'\xd0>\x15\xb6\xcf>\x17\xf59\xbe\xee\x12\x15\xbe\xe8\x85)\xbe\xb9^\x8e\xbe\xc2h\xe4>^r\x17?\xfad\xa9\xbdi\xa4\xc3>\x80C\x10\xbe\x13\xeaF=d\xd4\xc3=\x13\x08\x04\xbf\x15\xf0\xdb>\xf3\xab}\xbexm\xdf\xbe\xfal\x99\xbe\xbb\xbb7\xbe\xbeQ\x90\xbe;\xea\xcf\xbeMP\xf5>P!D\xbe\xce_\x83\xbe\xe0\xd4\x1f\xbe\xd0\xd2\xf0\xbe\xfc\xfa\xf1\xbdE\xfe\x19?\xf2Cy\xbd\xcc\xdb\xd2<+\xbe\x1e\xbf\xee\xe8\xcd\xbe\xbaW\xfc\xbe\xeb\x00\xa6=5\x14\xd2>\xc6{\xe4=+\x8b\x88\xbe&\xd2|\xbex\x95\xd1>[d\x87=WP\x01=\xd2\x116:\xff\xff\t?\x04>\xe1\xbe}\xb0\t>\xc5Y\x8e\xbe\xda\x8f\xa0>\xc1.\xaa>\xc3f\xd0>\xacb\x11?\xf1\x9b\x04?\x8a\xfc\x1a>P}\x81>\x1e07='
-p120
-tp121
-bsV580586495813283841
-p122
-g2
-(g3
-(I0
-tp123
-g5
-tp124
-Rp125
-(I1
-(I200
-tp126
-g12
-I00
-S'|\xa3e\xbd\xb3\xd5\xa2\xbd\xee\x1c\xe8\xbe\xb4V\xfb>1\x800=\xa2ms>e\x9e\xfe\xbe|\xb7\xa9\xbd~r\xf0\xbce\xf8\xd2>\xbb\x0ff=\xa2\xd3A\xbf\xf8\xa8R>#H\x0b>\x0f\xe9I\xbc\xabz\x9c>\xe4\x92\xc0\xbd\xab\xd6\xed\xbe}\xcaK>\xde\xd6}>F=:\xbf\xcbe\xcd\xbd\xcc\xf7\xd9=\xc7}\xea\xbdT:<\xber\xc1\xe5;\xc7\x90\xf0;\xc6h\xac\xbd\x81\xaf"\xbf\xc6\x9fa\xbe<\xbf\xed\xbe\xdb\xfau\xbe\xa4\xee\xd7>u\r\xe4\xbe\xfeGj=\x15ke?\x1e"\xfc\xbe\xaf3\x8d=\xc7O_>!&/?\xa1\x96B>\x06" ?\xfc\xffs>\x87\x92\x1c\xbf\x19y\x9c\xbe\xf8\xbf`;\x8co\xd4>k\x06\xbb>1\xe3\x13>\xdb\x91\xec>"\x1e\xcb\xbd\x04P!?d\x9e\xba\xbe\xb5\x86\x9d\xbe\xd4\xf86\xbf\'\xc6\xf6>\xc0\x0e\x9c\xbe\xa7T}\xbe\xdf)\x05\xbf\x19\x10\xf1\xbej9\x03?\xbcX\xe9\xbd^-k\xbed]W\xbf\t\x8a\xc8\xbe\xf4\xae\t?W\x17\xf7\xbe\xfb\x1fe\xbe\x0c\x02\x01\xbfVi\x04\xbf\xb6W$\xbf\x99\x90,\xbf\xee\xa4\x11\xbeZ^\x93\xbe\x01\'\x01\xbf$\x88!?\x87\xa2\x16?\r\xd4I>4\x84\xdc>\x1e\xa7\xab=\xb6 [\xbeO\n\x8b\xbcJ\x85H?Dc\xcd\xbe3\xa1\xd8=\xb06\xc3>\x07\x19M\xbd\xcc\xe75\xbf\xa5\x1c\x1b?D\xd8\xc1>4}\xad<*\x1a\x87\xbd\xfc\x83\x8e>\x06E\xba=\x9b\x1bO=$\xbc\xa8\xbe\x8b\xe2\xf6=\x04`\x06=\x18\xba\xd6>\x91\xc8\x8f>e\x9az\xbd\'/\xe5>\xfd\x82\x80>x/\x86>\xa1<\xb5?\x0e\xa4\xdc\xbe\xbca\x87\xbe\x1e^)\xbdT\xcf*?\xfe\xf7:\xbe\xf7.\xd3=\xb68*?O\xd6D>g6\xff>\x8b\xf0\xf3=b-}>\xee\x05\x04\xbfR\x80\xa0>\xc9\x0f\x85=f\xd6(>O\xcb]?a\xd1\xab\xbe\xa0\x96)\xbe\x1bm\xf0\xbe\x00\xf4+\xbf\\#\x9e>"\x84^\xbb\xadH]\xbe\xe1/\x1c>\xcc\xdf\x14?\x8e\xd4\x8c\xbe\xb5\x8f\x8a\xbe\x0b\n!\xbe\x8c\xff$>%\xb9&\xbf\xbaI#>\xbf2[=#\x84%\xbeE\xf9\x0c>q\x9c7?\xbf\x81\x0f\xbf8\x98\x1f?\x17\\9\xbe\xfc8\x82\xbe\xcb.\x12?H0\x1c>j\xd6$?$\x04\x17?\xf4\xf3b\xbe\x89\xef\x8e\xbe\xe4L\xb6\xbe\xdcg\xdb\xbe\xb6\x8d@?\xd4\x17\x81?\xec\x95Z\xbebx\xdf>\x87\xc3c\xbe\xb3\xbe&<K\x80\xd9=\x9e\x1b_\xbf\x9c\xab3?w`\xad\xbe\xe2\x81\'\xbf\x1fR\xe3\xbeT\xdc\x99\xbe\xcek\xe8\xbe\xa59\xef\xbe\x88\xb17?\xacA\xb3\xbe\x87\x01\xfb\xbeL\x81\xb6\xbe\x0c\x7fP\xbf^h\x81\xbe\x8a~>?\n\x96D\xbe\x8e\x0e?=H\xaa\x81\xbf\xa6e\t\xbf\x82\xe8{\xbf\xdd>I=M\x9b\x11?;\xb4D>\xd6\xd7\xd5\xbe\xc0\x1b\xe6\xbe\xe7.,?\xf8\xf4?>\xec\x0f\x0f\xbeH\xa3\x10\xbd\xe1\x9ca?31B\xbfN\xd5\xf6=.a\x1f\xbf\xa5\xe9\xfc>\xec\x19\xfc>\x03E\x0f?,\xf4\\?\xcc\x98}?r\xdal>\xbe\xc2\x04?\xc4\xfa\x96\xbd'
-p127
-tp128
-bsV580535049684127745
-p129
-g2
-(g3
-(I0
-tp130
-g5
-tp131
-Rp132
-(I1
-(I200
-tp133
-g12
-I00
-S"\xd6}\xf8=\xe0>]\xbd\xfc\xe6\xb8\xbe8%\x99>\x86C\x19>\x04\xd4(=\x83&\x8b\xbe\xc04S\xbe4\x8b\x13\xbc4&\x85>\xa7\xfeZ=\xcct\xb2\xbec\t\xdd=\xe3\xfc\xd7=\x80\x80\xba;\xe4'\xbc>\xb8I\x8d\xbd]_J\xbe\x03F\x81<V\xe7\xd9<\x94<\xca\xbeJs\xc2\xbd\x1d\xed6>3\xd0\xf3\xbd&\x1b\xec\xbd\x99g'\xbd\xb1\xbd\xb5=\xa7\xac\xeb\xbd\xdcz\xb8\xbe\xfeN\x91\xbdI\xc8\x9e\xbe\xef\xae]\xbe\n\xd9Q>\x91e\xb8\xbe\xa6\xbcX=wn\x13?\xf9\xc9\x12\xbe\x93:\xd9=\xdeu\x8d>\xc1L\xa1>\x80\xf8\xf5\xbc{\xfe9>\xafA\x10>)\x89\xa0\xbe\xbc\xc6\x8f\xbel4L\xbd\xa6\xc6\xc6>f\x8do>TM\x1a>D\xa2\xcd>\xcf\xc0\x0f\xbd7X\xdd>\xb8\x1b/\xbeY5\x0e\xbe6z\xfb\xbeD\xff\x8f>\x00\xba$\xbeQ\xc7V\xbe\xbf\x80\xdd\xbem\xff\xd0\xbe\x03\xafZ>\x80S\x94=\x9fI-\xbdh\xa0\x02\xbf\xd5$-\xbed\xf6\x99>bs\x96\xbe\x8f\x9a\xe9\xbcv\xc4\x8e\xbe\xae\xc2\xae\xbe%\xf8\x12\xbf\xbf\x88\xfb\xbe\xc7!\xf6\xbd\x916/\xbet\x18\x83\xbe\x8c\x1a\xb0>\x0c\x10\xaf>rH\x16>lq\xa5>\x08.\x1c><\xc1\xbf\xbd\xd2\x84\xb6=\xffd\xfd>\xea\x18\x97\xbe\xef\xcb\x05>$\xdcN>\xa1\x9e\xc5=\xaf\x96\x00\xbf\xc9\x03\x17?\x96\x9b\xf1=\x0f\xc5\xed\xbd\xdb\x08\xa9=\xf9n\x0e=\xdd\x9d4=Cu:>\\L7\xbe\xf0\x01\x87>\xb9\xff\x14>6z\xac>\xcatb=\x14Kt\xbcA<\xac>4JI>\xba\x9by>\xb4\x8de?\xe8\x10\x9f\xbe\xac9.\xbe\xd8w\x96=Ty\xba>\xfa+\x7f\xbdc>\x04\xbd\x01\x98\xb9>luM>\x01\xb3\x94>\xf4\xc1\x88=q\xdf\x1a>C\x08\xcc\xbe\xfaZm>\x06x5=\x83q\x8f=i<-?\xc9\xf5\r\xbd\x07\xc8\xa3\xbd\xc5\x8b\x89\xbe\x83W\xbb\xbe\x047w>\xbcT\x07\xbd\xc9\x07\xb3\xbdj3\x01>\x9d\xb2\xca>\xbf\x8a\xb3\xbdF\xad?\xbc\x93\x92?<8\x13\x96=I\xbf\x8d\xbe\xed\xce'>\x91D\x00\xbc\xd2f\x89\xbd3\x1e\x1b\xbd\xaer\xb2>6,\xd5\xbe#D\xec>\xe9\xe4?\xbd0\n\x9c\xbe_p\xb4>\xc6\x10\xfd\xbb\x1cS\xa7>c\x81\xf8>\x10\x8f,\xbeQ\xbf\x0f\xbd\xe9R\x17\xbe\xe0Ml\xbelI\xef>v\xbe\x0f?\xe5*\xb4\xbd\xf9\x12\xc7>d\x1fA\xbe`\xbbV=\x1e\xd2\x06>nR\x00\xbf\x12\xf1\x94>\x87\n\x8e\xbe\xa0&\x0c\xbf\x0f\x8d\x81\xbe\x99.,\xbey\xaa\x06\xbe\xc9(\xb6\xbeS!\xf6>\x97\xe8F\xbe\xcc\x9c\x8f\xbe\xbc\x90,\xbe7F\x05\xbf\xc3\xe60\xbe\xcc9\xf3>\x10\xaa\xc9\xbd\xaf\xb7~=i\x05\x1b\xbfW\x9a\xba\xbesI\xa7\xbe\x03\x83\xe1=\xfdn\xe4>`\xab\xb7=t|\x86\xbe?\x064\xbe!\xec\xfd>o?\x06>jc\xa7=\x94E\x00=\xf4\xc6\x07?\xa9\xec\xed\xbe$\rO>\xc0YL\xbe!\xe8\x81>\xf4b\x97>\x14[\xed>\xbck\xfc>\xe3h\xfd>\x7f\xe9\r>\xe4T\x92>\xd6k\xc5\xbd"
-p134
-tp135
-bsV580397514626596864
-p136
-g2
-(g3
-(I0
-tp137
-g5
-tp138
-Rp139
-(I1
-(I200
-tp140
-g12
-I00
-S'e\x10"=\x84\xd9R\xbc\xdc\xa6\x81\xbeAFm>\xbbr\x98=\x0e\x88\x9f=\xa3n`\xbe\xc4\x9f\xce\xbd\xa4\xf3W\xbb\x86"T>By\xaa<\xc7\xd3\xa7\xbe]\xfc\x8a=\xf9\xa4j=\xd1\xe4!<\xd9Me>\x90\x15c\xbd\xd6VL\xbe\xba\xd6==\xad0{=\xe4\xe0\xa5\xbeABe\xbdL\xb9\xc7=\xbf\x9fB\xbdo\xaf\xaa\xbd\xb5\x93\x12\xbc\xf7)#=\x03\xaaI\xbd\'\xa1\x8b\xbe\x1d\xdf\xea\xbdw7p\xbe\xfc\r\x0b\xbe \x13)>\xb8*\x88\xbe\xb3\x9b\x16=\x06\x80\xe3>I\xc5#\xbeA\t\x99=):\x1b>\x83$\x8f>#\x0f\xfe;g\x9b\\>\xf3\xa3\xce=\t\x13|\xbe\xc9\x8eI\xbe\x7f\xd7j\xbcd\xf6r>\xb3v<>qX\xbf=T[\x8b> \xd2B\xbd`.\xa1>\xe1G%\xbe\x1cy\xf0\xbdi\xad\xb8\xbe\xfd\xc7Q>\xc8\x8f\x05\xbew\x8b\x14\xbe\x1d\xf1\x94\xbeN"\x8a\xbe4\xcfG>-\xe7\xbe<\xf6Tq\xbd\xd3\xe2\xc5\xbe\xd1i\x10\xbe3\x10o>\xf9pl\xbe\x8d/?\xbdQZU\xbe\x8f\x15\x89\xbe7\xb8\xb6\xbet\xc7\xb4\xbePo\xd3\xbd\xb9{\x01\xbe\x19\xbel\xbe\x07\x04\x86>\xcf\xf5\x87>D[\xd4=\x8c"v>^E\x8f=\xf1\x88\x95\xbd\xd7\x9a\xf6<\x89=\xb7>\xa9\xadY\xbe&\x0b\x86=S\x93$>\x13\xc9 <k\xcd\xb6\xbe\t\x17\xc3>\x97\xf8\xf6=&K@\xbdh\xa3\x9a<q7\xb1=n\xc3\x9a<\x07h\x9c="\xf5\x18\xbeb\x11\x13>\xe0\x8cb=$\x90o>\xf5\xc0\x86=\x05}\x0c\xbd\x100f>\x04\x17\xfb=\x96\x86\'>\xc790?\n(o\xbe\xfa2\x06\xbeS\x16*=~\xfc\x98>\xc7\xa1\x8d\xbd\xbc\x8e\xcc\xbc\x17s\x8e>\x82\xc0\x05>\x03it>\x81H\x8f=a6\xe9=\x13\xe5\x92\xbe\xa1W\x1d>\x1f\x87\x89<\xbc\xddT=\xcc\x90\xec>\xf72\xc6\xbd\x99\xd7\x9d\xbdj\x1fU\xbe7\x04\x9d\xbe\xfb\x92*>\xfd\x10\x88\xbc?#~\xbd+\x85\xac=\xa4c\x93>\xc1\x97\xc5\xbd\x83\xd0\x82\xbd\xa4\xb9\x08\xbd\x86\x85}=\xcc\xfb\x8d\xbe\xdf\x00\xcc=\x0f\x8dh;\xe1\xeeZ\xbd\xb0{n\xbc\xe7Z\x96>\xdf\xbb\x94\xbe\x88o\xa6>\xb1\xb58\xbd\xa7\xca4\xbe\xa8\xfb\x96>\xd4LT=\xb1\xdc\x86>\xb7s\xb2>\x03\xca\xe9\xbd}_\x9b\xbdvZ\xff\xbd!\x958\xbeZl\xb4>\xca\\\xe4>\x06W\xbf\xbdd\x8a\x85>B;\x0e\xbe\xa7\xaa\xd1<L/\xb6=\xb6\x9e\xd0\xbe\xe4\xfd\x83>|R7\xbe\x117\xbf\xbea\x83j\xbe\xfd#\xfe\xbd\xcd>\x1f\xbeL\x8e{\xbe\xdc\xe9\xb4>\xe8\xe8\r\xbev\x89]\xbe\xa3U\x1f\xbe\xed\xb1\xcb\xbe\xde\xc4\x1f\xbe\x1c\xc5\xb7>\x845\xaf\xbdD\xa4r=Jh\xf2\xbe\xe7S\x8f\xbei\xfc\xaf\xbe\xf3Px=\xec\xe3\x9a>\xf8\x99\x9a=\xbc\x0bQ\xbe\xb8\x964\xbe\xacL\xc1>\xd7\xfc\xae=\x07N\xa5:\xd0\xefP\xbbJ\xb5\xd2>\x16?\xb7\xbe\xea-\xce=ywf\xbe\xb3\x16b>\xd6\x0co>\xa4\x00\xa0>\x9a\xc0\xcd>G\xf8\xd1>Dt\xd2=0\x92k>"S\x9a\xbd'
-p141
-tp142
-bsV580552519279124480
-p143
-g2
-(g3
-(I0
-tp144
-g5
-tp145
-Rp146
-(I1
-(I200
-tp147
-g12
-I00
-S'\xcc\x01\xca\xbco\xb8\x91\xbd\xe4>\xde\xbebr\xe1>\xeaUU=\x1b\xbbM>b\x93\xea\xbe\\\xd6\xbd\xbdT\r\xa5\xbc\xd1\x1d\xc2>\x90\xfca=[\xa0+\xbf\x92\x97?>\x11\x83\xf0=\xa2h\x89\xbc9\r\x94>\xb9\xed\xaf\xbd\x1b8\xd7\xbe\'\xcd0>q\rd>\x86\xb6*\xbf\x01\x99\xb6\xbdj\x1e\xd3=\x00\xec\x02\xbe\xd2{*\xbe\x81\xd1\xce\xba;\xc3\xb6<\x8f-\xb1\xbd\x03\xaa\x14\xbft\x97C\xbe7\t\xd0\xbeP\xe0c\xbe\xd9\xf7\xc1>aZ\xd6\xbe\xb5\xb38=\xca\x9dR?g\xef\xdf\xbe\xe0\xd9\x8e=\x11\xb0^>\xfe\x9a\x1c?v\xd4$>x\xfc\x10?\x15\xe7k>8v\x10\xbf\'\'\x95\xbe\x1e\xda\x0c<\x84\xf6\xc7>L<\xa7>m\xeb\t>\x1fY\xe1>\x14N\xab\xbdQ9\x16?\xd1U\xb4\xbeT\xde\x8d\xbe\xd0\xdc)\xbf\xbb\xb7\xe3>\\r\x88\xbe\xf2,n\xbe\xac\xfb\xf7\xbee}\xe5\xbe\x85X\xf4>\x97\x8a\xc1\xbd\x05=P\xbe\xf4vE\xbf\x15\x08\xb6\xbe\x90;\xff>\x8a;\xe1\xbe\xd9\x9f=\xbeV\xfe\xf1\xbe|\xe3\xf2\xbe\xfc]\x1a\xbf\xc9s\x1f\xbf\x1c1\x0b\xbeI\xcf\x8a\xbe\xc9\x1a\xef\xbe\xb6K\x14?__\n?\xa2w7>\xa9\xd9\xcc>v(\xad=\x8fbK\xbe\xc5\x0bD\xbc\xe0/5?6r\xbd\xbe\x94\xd8\xc5=\x0e}\xb0>\xdfJ\x0b\xbdGG(\xbf\x82\xdc\x13?\xb6\xc6\xb1>\xdc\xeb\x7f<\xa4\x93G\xbdoqr>&\x95\xa6=\x04\xfbc=\xc8}\x99\xbe\x000\xfb=6\x0b$=W\xa7\xc8>\xded\x7f>y\xb9[\xbd,\x8b\xd6>O\x8ak>%\x90x> \xc7\xa5?Q\x96\xce\xben\x84v\xbeY%\xda\xbc\xda(\x19?\'\xb4-\xbe7\xa4\xaa=*\xf3\x1b?\x16V3>\x01\xae\xed>B\t\xe4=6Oc>N\xe9\xf7\xbeF\xc5\x98>O=\x87=y\x18\x1d>\xca4O?C\xb7\x97\xbe0\x92\x1a\xbe\tS\xd8\xbey\xa9\x1a\xbfy&\x94>\xaf\xe0\xef\xbb9y5\xbe\xefO\x0b>0\x14\x08?\xdc\xa2q\xbe\x8b\x84v\xbeaI\x0f\xbe\xd0G\x13>\x84\x0b\x15\xbfe\xff\x1d>\xab\xb4I=:(\x0f\xbeB\x0c\xf8=\xa4|&?\xd2p\x03\xbf\xbe\xad\x16?\xba\xc7$\xbe\xf5\xa0}\xbe o\x07?)=\x07>\xdd!\x18?%\xbc\x0c?\xfe\xd5Q\xbe\x8b\xea\x82\xbe%\xb3\xa1\xbe\x97\x8e\xcc\xbe\x1e\x04/?\x17\xeck?\x0b\xe6@\xbe\xf1\xa6\xd4>\xd4\xa7T\xbe\xc5{n<\xb5\x01\xd7=w\xd9K\xbf@\xa0$?\xfe\xab\x9e\xbe\x8ba\x1b\xbfq\xc8\xd4\xbe\xac\xdb\x8b\xbe<S\xd3\xbeO"\xe4\xbe\xb1\xc7)?A\xe8\xa1\xbeK(\xe1\xbe\x95\x88\xa1\xbe\xa2\x88?\xbfW\x92q\xbeUn3?v\x141\xbe\x11\xcd1=\x05,l\xbfXY\x01\xbf\xec\x1cc\xbf\xa6\xdfD=\xbc\xf7\x03?V\xb41>\xf6R\xc6\xbe\xb9\x06\xd2\xbeL3\x1d?d\x16&>\xf2\xf8\xd7\xbd\x063\xfa\xbc\xe1\xeaO?\x0bE1\xbf6L\xde=)\xf6\r\xbf\xf6\x9a\xe9>\x07s\xe4>\xfa\xe2\x02?q\x13L?\x9aNd?\x9bAX>\xa7<\xeb>$`u\xbd'
-p148
-tp149
-bsV580952185040596992
-p150
-g2
-(g3
-(I0
-tp151
-g5
-tp152
-Rp153
-(I1
-(I200
-tp154
-g12
-I00
-S'\xf6C\xd2<^\xc1F\xbd\xdf\xe3\xbd\xbee\xbf\xb1>e|\xa0=(\x13\x13>h\x98\xbd\xbe8\x1f\xd8\xbd\xe2y\xaa\xbcx\xbd\x9e>\xba\xa9;=\xc2"\x02\xbf\x9a\x8e\x11>:\xa7\xb7=\x9d;\xa7\xbc\x13\x8e\x8b>\x00\x00\x93\xbdG\xee\xa6\xbew\x14\xe6=\x0b\xbd$>D\'\t\xbf\xf8\x8b\xa0\xbdk\xdc\xdf=\xb0\xdc\x05\xbe\x82F\x11\xbe\xf8I\x94\xbbi\x96 =Fe\xa8\xbd\x99\xc1\xec\xbe\x15\xb7\x0c\xbe\xff\x1d\x9f\xbe\x01x>\xbe?)\x99>D\xc9\xb1\xbe"\xc1_=n\xbf+?]0\x9d\xbe\xc1\xdc\xa1=\xed\xd6S>d\xaa\xf0>B\x11\xd3=\xf3\x17\xd8>v\xc3P>\xf8\xd5\xe3\xbe\xa4Qu\xbe\xb8\xf9\t<\xa8\xa8\xb2>xM\x87>\xa3\x03\xe9=\xa8]\xc9>K\xe9~\xbd\x0b\xe2\xfa>hd\x93\xbe\x1a6S\xbe\xab\xe6\x10\xbfZ\x81\xb7>\x1f\x1aG\xbe\xafdC\xbe\x02\xfb\xd7\xbe\x18\xc5\xc3\xbe\xe9\x12\xc0>78+\xbdK\xad\x14\xbe\xf9\xf8\x1b\xbf\xb8)\x8f\xbe\xe4\x9b\xca>\x1d\xf3\xb4\xbeB\xa8\xe1\xbd\x19\xbe\xbf\xbe?\xd6\xc4\xbe\x8f\xde\x05\xbfj\xd5\x03\xbf~<\xf4\xbdD~]\xbe\x04\x81\xbc\xbea\xed\xee>F\xc9\xdd>\x7fw\x1c>\x13\x82\xa8>\xbf>\x9f=\xfa\x03\x1c\xbe\xa8\xbcQ\xbc\x97\xd3\r?\x1a\x8a\xa0\xbe\x8e\xb2\xb7=\x17P\x8e>\x88\xf5\x1f\xba\x92\xc8\t\xbfF`\xff>\xffl\x88>\x88\x93j\xbb\xffUb\xbc\x17\xcd >F@\x84=\xf1\xf3\x91=\xfb\xc3l\xbeJN\x0b>@\xacw=\xeb\xb8\xa4>\xb9\x1d2>\x95\xd0\x0e\xbd\xddw\xb1>\xb2o8>d|P>JF\x86?\xf9\xb9\xac\xbeYc=\xbe\xd7C\x94\xba\xfce\xec>\x13q\xfc\xbdR\xad\n=\x02\x99\xfa>\xaf\xbe*>\xa70\xc2>\xab`\xb1=\x95\xfb4>\xfd$\xd3\xbeI\'\x82>r\n^=#\xc2\x01>\x1c\x86+?\xfaMV\xbeIF\x02\xbe\x9f\x8c\xa5\xbe\xd7\xca\xef\xbe\xc0z}>\xf1\xbc\xeb\xbc\x17\xbf\xf9\xbd\xe5\x8f\xd4=\xc6\x9f\xd7>\xce<,\xbeW\x18%\xbe\xdc\x15\xc3\xbd\x06\x8c\xe9=\xb0\xad\xdf\xbe\x04\xf2\xfe=\xa0e*=\xec\x87\xd0\xbd\xe7\r\x89=\xff\xc5\x00?I\x1f\xd4\xbe\xd7\xf3\xf8>\x07J\xe0\xbd\x9d\xf8g\xbe\xa7\x02\xe3>\xb6\x8f\xd0=\x14\xaf\xf0>\xebJ\xf0>\x0f\xcc.\xbeT\x9b7\xbe\xa1.k\xbe{\xdd\xa3\xbeC\xb7\n?\x08#:?\xef\xf7\r\xbe`\xd5\xb0>\xadp.\xbe\xd8z\xac<\x96Y\xbb=Cj#\xbfb\xcb\xfe>\x0bP\x87\xbe\xf3\x9a\x02\xbfR\xeb\xa8\xbe$OO\xbe D\xa0\xbe\xd5\xc2\xbe\xbe\xb84\x0b?B9w\xbe\xe9\x18\xb5\xbe)\x92\x7f\xbe(\xa8\x16\xbf\xc8\x02J\xbe\x00\x1d\x16?\xf1\x84\t\xbe\xd7\x00;=m\x0f=\xbf\xff\x9b\xda\xbe{\x8d+\xbfi\xc8{=\x07h\xd8>\xd8\xa0\x0b>\xa8\x05\xa2\xbe\x94\x10\xa3\xbe\xc2\x7f\x04?M\x01\xf6=\xf2\xfaG\xbdgW\x93\xbc\x8dv%?J\xb3\x0c\xbf\x83\xc9\xcc=\xbc9\xd2\xbe\xb0\x92\xb7>\xce\x08\xbd>\x90B\xde>i\xdb%?\x0e40?\x94y,>m\xaf\xb6>\x8c\xc2/\xbd'
-p155
-tp156
-bsV580416305880285184
-p157
-g2
-(g3
-(I0
-tp158
-g5
-tp159
-Rp160
-(I1
-(I200
-tp161
-g12
-I00
-S'\x10L\xff<\xb8\x96\x99\xbd\x9c\xa9\xd1\xbe\xd4\xce\xb8>\x1c_\xb5=\xba}\x06>\x8f\x9a\xc1\xbe2\xc4\xf9\xbd\x970"\xbdt\xd4\xa2>\x80\xe5p=L\xfe\x04\xbf:\x998>\x8er\xe8="q\x16\xbdf\x9c\x8f>X\xc6\x8c\xbd\xb1H\xad\xbe\x1bm\xf7=\x1a\xfc8>\xc0\xbb\x13\xbf4\x17\xb1\xbdo\x9d\xdc=\x11\x05*\xbe\xb4\xe3\x0f\xbe\xbc\x82\xae\xbc\xbb\xedK=\xf4#\xec\xbd$\x1a\xff\xbe\xe5!\xf1\xbdd\xbc\xa7\xbe4EJ\xbe\xa1e\xa9>\xb4|\xbf\xbe/_!=\xaf,4?7\xd9\xad\xbe\xde/\xb6=\x0e\x19l>\xd9\xe0\xfc>\x99\xf8\xf4=r\x03\xeb>\xd7oh>\xf4,\xfd\xbe;\xd8\x7f\xbe\x06\x98\x9f;\xd05\xba>\xcc\x04\x85>\x90\xbd\xf2=[\xc7\xd1>\x9e\x1ai\xbd\xf9m\x08?\nq\x9b\xbet\xbd_\xbe\x8e1\x18\xbf\xf2\xc1\xca>\xe7k[\xbem\x94^\xbe\x8c\xb2\xe5\xbe<y\xda\xbe\xac \xcf>\xeb\x8e\xa6\xbdb\xd61\xbe\x96\xaf+\xbf*\x9c\x96\xbe\xd2b\xe3>\x95\x11\xbb\xbe\xef\xef\x08\xbe|\xb8\xd9\xbe\x9a\xa2\xca\xbe\xf2\xf4\x12\xbf\x0co\x0c\xbf\xff\xc0\xdf\xbd\x0e\xaco\xbe\x03\xb9\xc5\xbe\xb4\x15\x02?\xc7\xca\xf6>\xd8\x85 >D\x01\xb1>\x8as\xd3=\x1bA1\xbei\x17\x1e<\xcb\x07\x1a?\x81\x17\xab\xbe\x1bP\xd8=|?\x96>r\xff\xb3<\xec\xc5\x16\xbf\x84?\x0c?\x9e\xe1\x93>\xcd(1\xbb\x0b\xf1\x96\xbc{\x0b\x1c>n,\x9e=\x04\x1f\xbb=20m\xbe\x10\x12\n>~\x80\xa8=\xd5n\xae>\xcc+C>S@\xbd\xbc1\xfc\xc8>4\x95Q>*\xb2_>\xd6\x7f\x8f?\x9c\xc5\xb6\xbe\x11\xbdM\xbe \xd3\x99\xbc~\x03\xf7>e\xf1\xfc\xbd\x99\x88\x92=e\xd4\n?\x7f\xc4)>\x13\x14\xca>$\xa0\xa0=t\xfc=>\xf3\x8c\xe1\xbevx\x94>G\x82\x85=\xb8\xff\x13>K\x98<?\xa0\xc2f\xbe\x84\\\x02\xbe\xb4\xc5\xb2\xbe\xb0@\xfa\xbe\xdd\xa6\x8c>N\xe4\xf0\xbc6\xae\x0b\xbe~\x18\xe8=\xf9\xa7\xe4>\xc0\x9b4\xbeDL3\xbey\x0b\xbe\xbd\xfc\xae\xfd=|\xbe\xe2\xbe\xb6p\x15>_\xcf\x15=\xca=\xdb\xbd\x1ce\xe3=-\x1e\n?\x8c\x05\xe2\xbeLS\t?\x9a\xec\x13\xbe\xc9*}\xbe\xe7\\\xed>\xef\x8e\xa2=<\xe1\x01?R5\xf6>D\x8e4\xbe\x10YJ\xbe\x1f\xe8\x80\xbe\xa4\x11\xb5\xbe\x95\xfc\x15?\x97*I?\x99W\x08\xbe\x02\x1a\xc5>\xf6\x169\xbe\xa4\xa5\xcf<;b\xc7=z\xdb+\xbfH\xd9\x0b?e\xa9\x95\xbe4M\r\xbf@%\xb5\xbe\x05\x81m\xbe\xea\xc0\xae\xbeIk\xd4\xbe\xf6\xa6\x13?\x97e\x86\xbe\xf3\x91\xbe\xbe\xe7\xaa\x82\xbe\x15R#\xbf\xec|C\xbe\xa3\x0b!?n\xbf\x12\xbe1\x9d\x02=k\xd7J\xbf~\xf6\xe6\xbe\x02\xd94\xbf\xbe?j=<\xfd\xed>w\x1a\x15>\xfdD\xaa\xbez\x9d\xa4\xbe@!\x07?\xe0\xe9\x12>\x06\xf5$\xbd\xd4G`\xbc\xc6\xe41?\xf4V\x17\xbfdu\xfa=\xdb\x17\xda\xbe\xa3\xca\xc2>\xccM\xca>\x84S\xee>\x14\xa6/?A\xda:?\x93\xf1.>\x91\xad\xbd>\x00\xba\xef\xbc'
-p162
-tp163
-bsV580580461170282496
-p164
-g2
-(g3
-(I0
-tp165
-g5
-tp166
-Rp167
-(I1
-(I200
-tp168
-g12
-I00
-S't#\x8d\xbcj\xfcB\xbd\xd5\n\xbc\xbe\xf8/\xbb>\x85\xda\x89=\xf2\xf9\x1b>\x83\x96\xb1\xbe{\xe7\xd7\xbd\xa6Z\x02<\xa5\xeb\xa6>\x8a\x8f\xd5</\xbb\x04\xbf\xd7)\x0b>\x08Oy="\xad\x95<\xd5\x80\x84>\x04Y\xb4\xbd\x8f\x99\x9b\xbe\x82\x19\n>"\xd6\x08>\xb5\xf2\x0b\xbf\x1f\x08\xd6\xbdBp\x10>\t\x99\xe7\xbd\xa4z\xd9\xbd\x9fS\xc5\xbc\x9b\x955=\xbf\xb6\x8b\xbd=\xce\xd4\xbee(D\xbe\xed\x88\x9b\xbe\xebX=\xbeH\'\x8a>q\xe1\xcb\xbeVt\xc0<\xd5\x87,?\x8b^\xb1\xbe\x84$\xf1=\xb4\x85K>\x93\x8b\xdc>\x8dO\xa8=<\xa8\xf4>U*Q>\xcf\xea\xd5\xbeW&\x8c\xbe\x91s~<\xd1\xe7\xa5>\x89Q\x84>$8\x06>\x86\xb5\xc3>?\xe0\x88\xbdt\xed\x02?\xc35\x92\xbe\xd2\xf1(\xbe\x01\x12\t\xbf\x0e6\xbd>I2]\xbe\xec\xdd\x85\xbe\xb9f\xc1\xbe?\x91\xce\xbeR\xcd\xc0>BQ\x93\xbd$\xc0%\xbe\xeb6%\xbf\xc6?\x87\xbe\x8c\x0f\xd0>\xb9\xd8\xbf\xbe\xe3\x1d\t\xbef\xa3\xb3\xbe\x89z\xd1\xbe\xf8b\xf9\xbe\xe8;\x0b\xbfKG\xed\xbd\xd7l[\xbe\xe3f\xbd\xbeI\xbb\xe3>Y\xcc\xdd>\x08\x9f\xe3=e\x0f\xbe>+Ir=>\x18\x1b\xbe;Y =ml\x0e?\xee\x12\x9d\xbe\xf5$\x8d=\xd8\xab\x85> A\xdd;Ku\x13\xbf\xa1\x1a\n?\x8b\xd0}>\x7fs\xc6\xbc\x99\xbd\x83\xbdC\xf1Y>-A\x89=i\xba\x9e=q7\x8a\xbe\x08\xac\x13>xHU=2\x95\xcb>8\xf5\x1e>,\xb1\x83\xbd\x0c\xf4\xa7>\x96\xd3?>\x14\\m>\xd8\x01\x89?\xce\xd8\x99\xbe\xbb\xaa`\xbe\xd1\xbb\x979\xeb\xc3\xeb>\x01t\r\xbe]e\x88=\xc1\xde\xed>X\xde >\xfc\xba\xbf>\x93\xbb\xa1=\x83\x15\x1d>X\x83\xd5\xbe\x02\x82o>\x17U4=\xa2\x82\x9c=7(6?+\xe2v\xbe\x91\xd5\x0e\xbeAl\xab\xbe\xe9R\xfe\xbeI\xb7\x7f>u\xdf8=\xa4,\xce\xbd\xbdQ\x08>L\xe4\xdc>\xbd\xb3\x0e\xbe=5A\xbe\xe0R\xdc\xbd\x9a\xd1\xf4=\x1a\xfe\xee\xbe\xd8\x8f=>\xb3!\x81=\x8c\xb9\x89\xbd*\x9a\x1f=\x034\x06?\xed\t\xe2\xbe\xba\xa4\x07?\xf8\t\xe0\xbd\xadmc\xbe]\xc1\xe4>\x95\xd2\xa9=7o\xf0>2n\xe6>\xde\xc0\x17\xbe\xe1\':\xbe*\x95\x85\xbe\x18\xc0\xa5\xbe\xae\xdd\t?Rd@?\xc9v\x0f\xbe\xce\x8e\xbe>zwV\xbe\x01jY\xbc$9\xfd=\x8a\n1\xbf\x97\xc8\xfe>\xe0\xb0}\xbek\xfa\x12\xbf\x13z\xb2\xbe\xdbxZ\xbeQ\x8a\x9e\xbe\x1f\xcc\xc1\xbe\x88\xdc\x0f?\x80\x93\x8a\xbe-\xe0\xc0\xbess{\xbe\xaa\xa8\x1b\xbfM\x1az\xbe\x9f\xf3\x15?\xa4\xb0%\xbe\x98\xd3e=\xc8\xc3=\xbfOh\xcd\xbeR\xb6/\xbf\xa4A0=\xe8\x02\xe3>\x13\xf7\x07>G\xe7\x9f\xbe7\x1c\x9b\xbeQb\x03?C7\x17>75D\xbd\x98~\x04\xbcR\xfd\'?1\xb2\x13\xbf\xae1\xb8=\x03\xcb\xcc\xbex\xfc\xcb>!_\xa9>\x8f6\xe7>\xa1M!?\x19\xb53?\x03\xe9\x04>m$\xb3>\xc5Z\x8d\xbd'
-p169
-tp170
-bsV580919604400226304
-p171
-g2
-(g3
-(I0
-tp172
-g5
-tp173
-Rp174
-(I1
-(I200
-tp175
-g12
-I00
-S"\xd6\xab\x08=\xa5\xe6\xdf\xbdnn\n\xbf8\xdc\xed>\xf9\x9d\xfb=,o(>8\xe1\xf9\xbe%\x8a\x1b\xbe\x1c\xe2e\xbd\x10\x03\xd1>G>\xa6=\xee\xd3*\xbfN\x82}>\x84\xce\x19>%\xe1g\xbd\xd6p\xb7> \xb4\xb0\xbd\n\xdc\xe1\xbei\x84%>\x12\xc5{>r\xb9A\xbf3S\xe0\xbd\xdc\x98\x06>\xdaqo\xbe\x95\x1d9\xbeF#\x04\xbd\x89\xb3\x8c=\x8c:'\xberX&\xbf\xdbo\x11\xbe\x10\x18\xd6\xbe\xe1\xf3\x82\xbeP\x10\xe0>\x06\xdd\xf9\xbe\n\x82-=\x94\xdeh?0P\xe6\xbe9\x9d\xf4=rR\x99>\xaa\xe7$?O/,>\xb9\x8b\x1d?G\x86\x9d>K\xb9'\xbf\xba=\xa6\xbe\x89/M<\x0c\x07\xf1>\x8b\x84\xa6>\xb9\xf7\x17>B\x11\x08?\xb2?\x84\xbd\x01<3?\xd9\x82\xcc\xbe\xd3\x03\x8f\xbe}\x1bF\xbfLq\x07?\x9b\xfc\x90\xbeTl\x96\xbe\xc2\xa5\x13\xbf+\x9b\x0f\xbf\x02\x90\n?\xb9P\x04\xbe\xe6\x87u\xbe\x01\xd0a\xbf\xff\x13\xc3\xbezV\x17?\x956\xf3\xbe\x8d\xd97\xbe\xbfq\x12\xbf\xac\xf3\x01\xbf\x82\xfe?\xbfl16\xbf\xfe[\x07\xbe\xa0\xb1\x9c\xbe\xa0\xe8\x01\xbf\x1f\xc9+?H}#?\xa8+O>\x08n\xe2>\xdb\xc8\x0b>\xb7\x81n\xbesDR<\xb3\xb6H?#|\xda\xbeP'\x0e>)\x93\xc5>\x112\x17=)\xa9E\xbf\xbb\x076?D\x93\xc9>\xf7%\xb3;<\x03\xd4\xbcZ\xcdA>*\xf2\xd6=\x1c\x89\xfb=\x8f\xa2\x99\xbe\xbf[\x1d>\x8f\x07\xde=A\xa3\xe1>1\x98\x82>)\x88\xb9\xbcQ\x88\x05?\x8a!\x86>\xd1~\x90>\x9b\xea\xba?\xef\xfe\xec\xbe|$\x83\xbe \t\x15\xbd\x9b\xdc\x1f?<\xa0%\xbe\xf9[\xe3=\x96\xf36?\x166W>\xdc:\x03?\xdeZ\xc0=\x85\x08q>\xef\x03\x13\xbfn\xe2\xc4>\xc9X\xae=\x8e\xe8E>M\xbcv?\x85o\x9c\xbe\xac.*\xbe&\xc9\xe8\xbe\xe9\xea \xbf\xd2\xe5\xb8>\xf8\xc9$\xbd\xba!9\xbe\xbd\x15\x14>\xb4\xfe\x12?\xa9Vg\xbe\xc63r\xbe\xcbL\xf5\xbdGv(>!n\x11\xbf7nD>\x9e\x80T=L\x06\x0e\xbe\x84\x880>\xd7\\4?\x9dj\x10\xbfM<5?N\x0eK\xbe\xa6=\xa4\xbe\xd6\xaf\x18?\xf1\xf4\xc8=\x03\x1b+?`\xc1\x1b?\xf9\x84n\xbe/\x81\x89\xbe\x84C\xa8\xbe+\x9b\xef\xbe\xe4\x14B?\x17\x8a\x83?\xed\xfe.\xbe?\xa1\x01?\xa6po\xbe\xf7\xb4\x05=\xfa%\x02>8\xcb_\xbf'\x9f;?\xa9\x8d\xc2\xbeS\r5\xbf\x01\xea\xed\xbe\xf3>\x9e\xbe#\xe1\xea\xbe\xa34\x0c\xbf\x8a\x9d@?\x88\xd3\xb1\xbeJ\xd3\xf6\xbe/\xb9\xa5\xbe\x7f9S\xbf\x88Os\xbe\xe1\xd1T?\xb84>\xbe\x86m\x05= \xcb\x83\xbf9\x0e\x15\xbf\xae>m\xbf '\x8d=^;\x1b?ACE>\xc6\x14\xda\xbe\x10l\xd5\xbe\n\x82+?A\xb6;>\xd9.Y\xbd\xee&\xa9\xbc\xe1\x9dh?m,F\xbf3n#>\x1df\x0e\xbfX\xb7\x00?\xbfI\x04?\x13#\x19?\x00Ve?\xbc\x85s?\x0f\ne>D^\xf2>G\xa7\x93\xbc"
-p176
-tp177
-bsV580237505540321281
-p178
-g2
-(g3
-(I0
-tp179
-g5
-tp180
-Rp181
-(I1
-(I200
-tp182
-g12
-I00
-S'\x87\xdb\xab=\x0fa3\xbd\x96\xbc\xb2\xbeaz\x94>M1\xec=\xb2:\xab=\xbbq\x9a\xbe:\x8e\x18\xbe\xe8\xec\xd0\xbc\x8b\x0c\x85>\xa5\x87w=\xae\xec\xc2\xbe%F\x00>\xf5\xc8\xca=\xddB\x01\xbd\x86X\x95>\xc3\xf2\x91\xbd\xddC\x81\xbeS0F=^\x12\xc4=\x9a}\xdb\xbe\x91Y\x90\xbd\xeeJ\x01>\xc2\xa4\x06\xbe\nr\xf8\xbd\x10\x1c\xbc\xbcNKo=1\x0b\xca\xbd\xeb\xad\xc2\xbev\x89\xaf\xbdD\x1c\x8e\xbe(n:\xbe\xab\xfc~>\x9aR\xa3\xbe\xa3\'j=\xb6\xf1\x11?\x92\xc3M\xbe\xdd\x95\xc7=\x8e\x0bd>\xdc\x80\xb9>NyK=]T\x8f>;\xcf5>z\xc5\xbb\xbe\xa0\x90m\xbe\x05\xa9\xdc\xba\x19\x99\xb0>\xa8\x98_>Rz\xd3=B7\xc0>G=\x1c\xbd\xe6\xd7\xda>-\xe7a\xbe\x89\xfa\x1b\xbe#\xd7\x00\xbf\xa3\xb2\x96>\xb7I%\xbe\x8c\x879\xbe\xc8\x8d\xce\xbe\xd2\xa0\xc0\xbeV$\x8f>n\xfb\xc2;\x12\xe1\xb7\xbdJ\x95\x02\xbf\xb8\xe8]\xbe\xae\x1a\xa8>\x9es\x99\xbe\xd8AU\xbd\x9ak\x9a\xbe\xa1n\xa9\xbeRa\x03\xbf+r\xe4\xbe\xa2\x9c\xe4\xbd\xac\x8e=\xbe\x9c\xfb\x92\xbe~8\xc7>Gs\xb5>\xadS\x0c>\x8a\xe1\x96>\xa0\xf9\xd1=\x1ad\xf5\xbdY\x04\xcb<\xbal\xf3>\xaa\x18\x8f\xbec0\xdc=\xd0,m>b\x99h=\x9a\xa7\xf6\xbe.\\\xfb>-\x81B>\x02p9\xbd\xaal\xd3<.V\x97=\x00\x9fP=]\xc0\xf7=\xd2\x835\xbe\x00\xd22>\xd6\xaf\xcd=f\xbc\x94>\xd8o\xd8=\x96\xc3S\xbc\xd9h\xa4>}+*>;\xf0G>\xcb\x12h?\xed\xe9\x96\xbe\xa2\x8e\x17\xbev\x0b\xb2<\xc1"\xbf>\x16 \xa9\xbd"4\x16;+\xec\xd4><=0>W\xf2\x9e>\xc0\xd2x=d\x1e\x17>R\xef\xc1\xbe\x02\xf9y>\xbe\xa4Q=.\x1c\xe2=\xc6\xe5\x1c?\xaeu\xe7\xbdR\xce\xbf\xbd\xc6=\x89\xbe\xfb+\xc1\xbe\xed_h>\xa7\x97\x1a\xbd>7\xa9\xbd\xbd\xf7\xce=r/\xbc>\xcdq\xe0\xbde\x9c\xa8\xbd\xe6\xc40\xbd\xda\xab\xb7=q\xde\xa1\xbe\xd8\xe7\xfa=\xb2||<\x06Z\xa5\xbd&\x0b\xf5<\x116\xc6>\xf8\xd5\xbb\xbeu~\xe6>\x064\xa3\xbd\x15\xabv\xbee\xea\xbf>\x08\xfbZ=\x13\x8a\xbf>\x88\xb9\xe0>\x96\xe2\x1c\xbe\xa28\xd7\xbd\xe2\xdd\'\xbe\x06\xde\x8a\xbe]\x03\xeb>\xfb\xab\x17?\x8c\xcb\xc8\xbd\xfa\xea\xa9>\xdf\xae$\xbe&\xb8\x18=\xbd\xcc\xcf=M\xf5\x05\xbf9\xc3\xc2>\xc9\xaf\x80\xbe\x0eY\xf1\xbeb=\x89\xbe\x1f\\*\xbe\x90\x83_\xbe\nt\xae\xbe\xc2\xa3\xf5>\x0b\xb2I\xbe\x99\x15\x99\xbe\x95\xcdL\xbe\x94\xcc\x01\xbf\nW(\xbevt\x02?`:\xe3\xbd\xbf\x80\'=\x8eI \xbf1U\xc4\xbe\xeb\xd0\xed\xbe\xd4\xb5\x9f=\xf3}\xcc>\xb8\xf4\xdc=CQ\x86\xbeJ\x18e\xbe~k\xec>\x82e\xe8=6\xde\x97<\x1b%\xc9\xba\xb5\x12\x0b?\x18\xa9\xef\xbe\xcfH\x0b>-\xdf\x90\xbeF\x0c\x90>\n\xc8\xa7>\xf3\xf6\xd1>N\xe6\t?A\xbf\n?\x7f\xd6\x1b>Za\x93>\x9e)"\xbd'
-p183
-tp184
-bsV580902949569896448
-p185
-g2
-(g3
-(I0
-tp186
-g5
-tp187
-Rp188
-(I1
-(I200
-tp189
-g12
-I00
-S'\xb8\xd1\xe8=\x1dLq\xbd\x1d|\xb1\xbe\x93\xabg>T\xcd\x18>C\x10\xb5<&\x8bY\xbeVV-\xbeQ\xa6\x14<f\xe4w>\xe3D\x17=\x92\x81}\xbe\x0f\x95\xe4=\x11\x02\x11=S5*\xba\xac\xc1\x95>\xe6\x94x\xbdl\xd4\x1d\xbe\xb9\x8d\xbd<*\xcb\xd1<\xd6W\xc3\xbe\xdf*\xc5\xbd6\x13/>\x7fd1\xbe\xc0\xf6\x97\xbd\x8f\x82\x86\xbd\xe0a\xe3=\xb2M\x04\xbe\xca\x84\x8e\xbe_\n\x9d\xbd\xe4\xe62\xbe\x03\x86(\xbe\xe2\n+>\xb3\x11\xb4\xbe\xa6\xbf\x15<\xe7"\xfa>\xc3\xb7\r\xbe\xa63\x0c>\xf2\xa9{>\xf3\xe6[>(\xb3\r\xbd/J{>sB6>\x03\x1d\x8f\xbe|\x9av\xbed/\xaa\xba\x9ac\xaa>\x8b\xc3\x1c>\x0f\x03\x03>A%\xb9>\x13Y\x80\xbc\xd8\x0e\xde>\xc0\x81U\xbe\xa1\xb3~\xbdo\xab\xdc\xbe\xceb\x94>\xce\xb4\xe3\xbdC@y\xbej\xc7\xb2\xbe\\\x1f\xc7\xbeRo{>\xf7\x17*<\x9d\x0c\x9c\xbd\x87X\xea\xbe\x90E\r\xbe7\xb7\x9c>q\x1e\x89\xbemN\xe3\xbbo\xad\x8d\xbe\x11\xe9\x92\xbe\xaf\xc0\xf0\xbe\x8b\xda\xdf\xbeV\xf3\x97\xbdOp\x1d\xbe\x9dO{\xbe\xe3!\x99>?\x0e\xa4>\x04\xe1\xbd=)\x97\x8f>\xb3\xec\xe6=\xd9w\xd8\xbdV-\xaf=\x11\xe5\xca>|j\x83\xbe\'j\xc5=\xcd\xab%>\xe0\xf4\xf9=8.\xf0\xbe\xad\x88\t?\xaf\x04\t>\x18\x00\xc3\xbd\xeb\xfb\x0e=L\xdb\x05=a\xe6\x81=\xb8??>&\x93.\xbe\x00\xc3S>.\xfa\x12>\x7fV\xad>\xa7\x06\xef<a:\xeb\xbcc\r\x97>\xa8\x88!>\x99\rQ>\xd6BB?\xfa\xbat\xbe\xa5\x7f\x13\xbe8\xe5N=\xde\xaf\x85>c\x1d\x9c\xbd\xe6}\x00;"\x98\x9c>\xc1}\r>~\x16\x81>\xeb\x9b\'=N?\xb6=\x9c1\xb8\xbe\xb3\x0f[>\xfd\xba\xfe<\xbf\xd4\x15=\xb1\x1b\x1e?\xd1\xa9\x9c\xbd\xa6t\xb5\xbdhrU\xbe\xea\xdc\x94\xbe\nVt>q\xf5\xf3;]\xc8\xb6\xbc\xc0Z\xbe=\x9c\x14\x96>\xcb\x02q\xbcs\xd87\xbd\x8d>B\xbc\x02\\\x8e=g\xc5`\xbe\xdd\x10G>\xb6B\x14=yL\x95\xba\xef\xa6\xba\xbc\n~\x9d>\xfd\xd7\xaa\xbe*7\xe4>z+H\xbdo4\x84\xbe\xaf\xe3\xa5>\r\x9f\x85\xbcc1\x9e>\xc3z\xbd>\xf0\xb2\x05\xbe\xcf\xc6\x83\xbd\xde\x00\x18\xbemDj\xbe}\xb9\xb9>\xda\x99\xfc>\x1f\x02q\xbd$\xf4\xb9>\x0b\xd36\xbe\xbf\xd1a<\xbf\xd5\x01>\x921\xf3\xbeV=\x95>\xc1\x83\\\xbe\xb4\xe5\x00\xbf\xcd\x10\x82\xbeA\xca\r\xbesa \xbe\x1f\xe8\xb7\xbe\x9c \xdc>\x9f\xb5C\xbed\xb8v\xbeYS\xf7\xbd\xc8i\xd5\xbeZ\xed1\xbe\xa8e\xfe>\x8d\xd1\xac\xbd\xa1\x0c,=\'\r\x01\xbf\x95>\xa1\xbe\xe83\xa3\xbe\x08A\xaa=\xd2:\xc1>\xc88\xa5=\xf1\x11h\xbe~##\xbe\x12\xfe\xc2>8\x80\xbf=\xa4\xa5\xc1=\xb5\x01\xfb<]\xf6\xe5>=\x8e\xc7\xbe\xd7\xf1\x01>\xd1\x9a\x16\xbe\xc2a\x8d>  a>+\xef\xcb>`\xf7\xe0>\xbc\xf3\xca>^\x1f\x90=+\xa9I>\xca\x00\xb7\xbc'
-p190
-tp191
-bsV580388267645865984
-p192
-g2
-(g3
-(I0
-tp193
-g5
-tp194
-Rp195
-(I1
-(I200
-tp196
-g12
-I00
-S'dO\xd9\xbc\'8\x9d\xbd}\x7f\xf0\xbeH\xfd\xf3>,]f=\xec\xcb^>g\xee\xfd\xbes\x1e\xcd\xbd\x14\x14\xb4\xbcy3\xd2>q\xbbt=\xb9\xb99\xbf\xacEO>K\x1d\x02>H4\x94\xbcKB\xa0>\xa4\xd0\xbe\xbdh\xfb\xe8\xbe\xf8l?>x\xb7v>\xf8\xc68\xbf\x94\xa2\xc5\xbdYF\xe4=i\x82\r\xbePZ8\xbe\xfd\xa8\xcc\xba\xd1\xaf\xc4<\xd1\xe0\xbf\xbdr\xd2 \xbf\xcf\xaaS\xbeX(\xe1\xbe\xe0}v\xbe\xdf\xf7\xd1>\xe8\x1f\xe8\xbe%lH=U\xecc?8>\xf2\xbe\n\xf7\x9a=\x18@q>\xdfp)?\xac`2>l\xea\x1c?)/\x7f>!]\x1c\xbf+_\xa1\xbe\x7f\x0e\x17<gi\xd8>\xbc\xf3\xb4>|\r\x15>\x13\xe2\xf3>\x10\x10\xba\xbdL\xa6"?E7\xc3\xbeWy\x99\xbe\xd7\xd27\xbf\xddN\xf6>2\xb1\x93\xbe\xd7\xe3\x80\xbe\xffL\x06\xbf\x94\x7f\xf8\xbe7?\x04?%\xe4\xd0\xbd\xb7@a\xbe\xb1\xc0U\xbf8\xf2\xc4\xbe\xc0(\n?(\xb8\xf3\xbe\x8b\x0bM\xbee\xf4\x02\xbf\x86n\x03\xbf\xb5\x1d\'\xbf\x8f\xa1,\xbf\xa8\x93\x16\xbe\x1dL\x96\xbecs\x01\xbf\x8fr ?C\xbd\x15?,\xc6F>\t\xdb\xdd>[\xac\xbb=i\x1d\\\xbe7bU\xbc\xf3\x15D?H\x1d\xcd\xbe\xe1L\xd6=\xe7\x18\xbf>\x8c\xf1\x15\xbdu\x1b6\xbf\xc3\x00 ?EI\xc0>\x8b\xb5\x8b<e\x95W\xbd\xaa3\x83>\xaf=\xb4=m\xdav=1\xfc\xa5\xbez\xcf\x07>\xc7>2=\x0f\x0b\xd9>l\x10\x8a>\xb5\xbcm\xbd\xe0*\xe8>\xd1\xd1~>`\x95\x86>\xe1f\xb3?D\xa2\xdf\xbeL_\x85\xbe \xed\xe9\xbc\xb5\xb6%?\xd9\xce;\xbe7<\xb8=\xe3\xc6(?\x84kB>\x99\xa1\x00?\xb5\xc2\xf6=8\x9du>93\x06\xbf\xfbG\xa5>\x19\x8b\x92=K\x18*>\x186`?\xdd-\xa4\xbe\xedY\'\xbe0\x1b\xea\xbe\xad`\'\xbfXS\xa0>\x80\x81\x04\xbcL\\D\xbe}\t\x17>5P\x13?]\xa8\x82\xbe\x92h\x85\xbe\x081\x1b\xbe\x8fb\x1f>\xf0S!\xbf\xcd\xf6*>\xc0\x96Z=w\x12\x1b\xbe;/\x06>\x19$4?\xf7N\x0e\xbf\x9b\x13#?\x11-2\xbe\xe5]\x89\xbe\xf8\x98\x12?\x8d]\x12>\xbf\x92$?\xfd]\x18?,\xecb\xbe\x15\xc8\x8d\xbe\xa8\xf9\xae\xbe\xc5u\xdd\xbe\x05n=?\\_\x7f?Y\x96P\xbe\xa9E\xe6>\x83\x14f\xbe\xa5n\x80<\xc1\xd0\xe8=p\x9b\\\xbf\x15(2?\xef\xb7\xab\xbe\xf3+(\xbf\x07O\xe6\xbe\x8f>\x97\xbe0\xac\xe4\xbel\xf7\xf6\xbe\x9d\xb87?\x90&\xaf\xbe\xeb\xaf\xf3\xbe\xef\xdb\xae\xbepBO\xbf\x00\xe1\x82\xbe\x905B?\xbf\xd2?\xbe,VA=Y\x9b\x7f\xbfq\x10\x0c\xbf\x11\xc6u\xbfX\x90U=\x03\xca\x0e?\x1d@@>\xed\x97\xd6\xbe8W\xe3\xbe%!*?\xad\xf83>m\x01\xea\xbd\x12\x04\x07\xbd\xc7\x04a?p\xdf?\xbf\x04\x15\xf1=\xe5\x93\x19\xbf\xbb\xc6\xfc>dO\xf7>\x8d\xae\r?\xcb\xd9\\?\x89\x0fw?\xc7)j>\xcb\x89\xfe>(M\x84\xbd'
-p197
-tp198
-bsV580206153352790016
-p199
-g2
-(g3
-(I0
-tp200
-g5
-tp201
-Rp202
-(I1
-(I200
-tp203
-g12
-I00
-S'\xb9\xd9U=\x8c\x9em\xbd.\xae\xcc\xbe\xe4"\xb1>\x17\xf2\xb7=4U\n>s\xbd\xbd\xbe\xebs\xff\xbd\xad/\xdb\xbc\x8c\xd0\xa4>\'\xf8^=\xc8\xb9\x01\xbfa\xa0)>d\xa1\xd3=I\xe4\xf3\xbc\x8c\xd8\x94>\xba\x97\x9d\xbdR\xf5\xa6\xbe\xa5\x1c\xd1=r\x11 >`:\r\xbf\xe4H\xa7\xbd\x9cy\xf1=\x82\xc7\x17\xbe\x9cS\x0f\xbe0\xb1\xaa\xbcI\x8fZ=Y\x97\xd3\xbd\xfeE\xf9\xbe2f\xf9\xbd6b\xa3\xbe\x99fH\xbe\x8c\xed\x9e>\xd1\xd1\xbc\xbe\x02\xdaK=\xe4\xaf0?*\x02\x9d\xbe\xd3\x02\xad=efr>;\x87\xf3>\xcf\x12\xd9=\xe9\xb3\xd5>H\xff]>\xd2\xa4\xf0\xbek\xf8}\xbe\x94\xf8\x83\xba8\x03\xc2>\xc7\x98\x86>\xa78\xf0=\x9f|\xd7>N\'|\xbd\x98D\x05?,\xcb\x95\xbe\x05\xa2T\xbe\xb4a\x17\xbf5\xee\xbf>g\xaeI\xbe\xbf\x8bI\xbe|\xb6\xed\xbe\xe1?\xd7\xbe\x84\xec\xc9>f\xdb\x1f\xbdl\x99\x15\xbe\xce\xef!\xbf\x8c\xc8\x91\xbe\xd2\xf1\xd5>N\xe4\xbc\xbe@\xac\xd6\xbd\x1e\xd8\xca\xbe\x83\x92\xc7\xbe\xaaK\x12\xbf2 \n\xbf\xdcV\xea\xbdPzj\xbe\x1b\xc5\xbf\xbeR\xaf\xf5>\xa2\xbd\xe4>\x04\xf4%>|(\xae>\xc2\xb9\xd0=\xfc5*\xbe\x9ap\x80\xbb;T\x18?\xd5\x1b\xa9\xbe\x90\xd7\xe0=ia\x93>\x02B\xef<xX\x11\xbf\xea\x9c\t?I\xd3\x8a>\x94\x14\xb8\xbc\xc9P\xf4\xbb\x8b\xfb\x07>\x87\x93\x92=\xd8\x12\xc9=\xac-h\xbe\xdc\x98\x1a>\xed\xf4\xb2=\xf4\x98\xaa>Y\xce/>\xc4\x1b\xd4\xbc\x1b\x1d\xc1>\x90\xb2N>\x95\xb0Z>\xaaX\x8a?\x13J\xb3\xbe=\xa6?\xbe\xe7\xa3\xf9:,\xe8\xee>\xdbf\xfe\xbd\x8f\xf0\x18=\xce(\x02?y\xbe2>[\xaa\xc5>A\x1b\xac=\xfd\xc84>L\xae\xdd\xbe\xc4\x03\x90>>pu=<\xe2\n>Q\xc26?\x82\xf8E\xbeI\xbe\x00\xbe^\xea\xa8\xbe\xa4\xa1\xf2\xbe\xbc\xe4\x86>\xa0\xee\xf8\xbc\xfc5\x04\xbe\xc1\xd0\xe1=\x19\x14\xde>\x0b3)\xbe)\xab\x1c\xbeJ\x1f\xbb\xbd\xd9\x86\xee=Oi\xdb\xbe\xa2R\x0e>@\xb3\x05=o#\xdc\xbd\x8c\xc7\x93=\xfc\x1f\x04?\xb8&\xdf\xbeR$\x02?d\xf5\xf1\xbd\xc9!\x82\xbe\x0c\x93\xe8>\xa5-\xbe=.L\xfa>\x1ct\xfa>\xc6(7\xbe\xd779\xbeg\x1cx\xbe\xdcZ\xac\xbe\xbaZ\x12?\xa4\xfd@?\x18n\x0b\xbet\xed\xc1>V\xb05\xbe\x1eL\xeb<\x10v\xbf=\x82\x17(\xbf\xb5\x99\x00?\xc6\x02\x94\xbe\xdb\x08\x0b\xbf\xd7l\xaf\xbe\xdf\xb0\\\xbe~A\xa4\xbe\xfa\x8b\xd0\xbe\xa3c\x10?\x84\xbe~\xbe\xbcN\xb9\xbe\x8c\x96}\xbe/\xec\x1c\xbfU\xf8C\xbeI\xe9\x1e?s\xfb\x05\xbe\xa6\x1d\x15=\xf2\x86E\xbfT\x00\xe8\xbe\x99\xa8+\xbfq\xa3\x83=\x9bx\xe9>]\xa6\x0c> \x1b\xa9\xbe\x8d\xa4\xa5\xbe\x08\xd2\x06?U\x15\x06>>c\x18\xbd.-\x15\xbcW\xb9+?\xa1D\x11\xbf\x82\x18\xfc=\xab*\xcf\xbe\xb4\x1e\xbe>\xe6\xd7\xc5>K\x92\xf2>\xae ,?Na2??\x992>\x17\x9d\xba><\x7f\xed\xbc'
-p204
-tp205
-bsV579870755925553152
-p206
-g2
-(g3
-(I0
-tp207
-g5
-tp208
-Rp209
-(I1
-(I200
-tp210
-g12
-I00
-S'\xd3\x8ft>\xf5\x1e\xda\xbd0V\xdf\xbe\xcd\xea\xa8=\xa5\x91\x92>.\xb7\x1b\xbe\x1bv\x1c\xbe@\xf5.\xbelY/\xbd\x8b,\xe9=\xd9\xdd\x07> \x88\xf4<\xba\xb5!>\x83*\x89=\x9d\x07\x13\xbe?\xa4\x96>\xbb\xbe\xf2<\n\x0f\x84\xbdO\xb5\xaa\xbd\xc7\xb5\xa0=\xd2q\xa1\xbe\xde\xc0 \xbd\xc2\x06\x06>\x11+\xce\xbe]\xa1\x00\xbe\x83{\xd9\xbd\xb5\x01->Y\xc0\x93\xbe\xd1\xa6\x89\xbe9&)>E7j;S\xc0\x11\xbe\xeb\x92<>\xb86u\xbe\'X\x86\xbb\xda\x81\xa8>K&\'\xbc\xcd\x0e\xee=\x84\xa7\x9c>\x17\x8d\x16>h\xf5\xaa<\xc7~\x1b>g\x07}>\x07c\xa6\xbeQy\x08\xbe\xdd!\xf1<]u\xd3>U\x9e\xd9:{ b=p\x1c\xb8>\xafe\xb8=\x9d>\xe5>\x87%r\xbe\xf1B\xd3\xbc\xb8\xb8\xdb\xbeI\xc5\x9d>\r\xbc9<\xcb<?\xbe\xf5\xd6\xb4\xbe\x80\x00\xc7\xbe\x84\x92\x92>\xe3\xc4\x82\xbc\x94\xa4\xdd\xbd\xd5\x8b\x9a\xbe)h\x97\xbdo\xca\x99>\x18\xef-\xbe,Du=\x07\x8e\xd7\xbe\xff\xad\x03\xbeN\x08\x0f\xbf\xa3<\x96\xbe\xea\x90\x95<\x04\xaf\x15\xbe\xf1Q^\xbe\xc3\xe0\xa1>\r\x01\xa5>#\xa9\x0c>\x18H\xc7=\xef\'\'>\xdfS\x19\xbe\x04\x13\x86\xbc\xe4#\x88>5\x01G\xbeT/\x18>\xc0\xa6\x1f>H\xe7s>qP\xbd\xbe\x8f?\xff>\x80\xb5M>CW\xaa\xbdL\xb9%>\x88Hx\xbe\xd7f\x12>I\xb2\x86>I\x83\x9d\xbc\xbf(\xd4=\x95\x94o>\xc8\xef6>\xcdW+=\xadL\x91=U"\xbd>\xa4P\xd6= \x9f\x00>x\xbf\xfc>}\xb8\x84\xbex\x13H<\x15\x9c9;l\x94\xcf=`\xc9\xce\xbc(\xb4=<\x81\xd1\x9c>\xd1N\xb4=@\xb85>U\xe5\x85\xbc\x94`W=\xc5\x82\xad\xbe\x19\x89\x93>\xa5z}===\xff=\x12\xe1\n?\x83\x90\xb9;A\xb8\x9f\xbd\xa1\xf6y\xbd\xbc\x12r\xbd\xc7s\x84>\xe1\xc5\x13\xbe\xf1\x15W\xbb\x1c\xb9\x9c\xbc\x13\xdf\xe5=\xb8\xf0V=\xba.)=\xbbdD=\xfb\xe2o<\xb9\xa8\x1a=\x85\xe9\x0c>8\xba\xf1<\x07\xfb\x9c<\xeb\xcf\xc7=\x00D/>\x07<)\xbe\x99\xaf\xb3>=[\x94\xbdDX\x88\xbe\x97\x8dw>\x8d\xc1\xa3\xbd\x1b\xa9\x90>k`{>g\x16;\xbe,\tI\xbd!\xf3\xb9\xbc\xb8\xb6:\xbe\x97>Q>X\xed\x9d>Uh9=\x95H\xbc>\x19\\x\xbd\xc3\x15\x92=\x90\xe0\xc5=\xc5\xdc\x80\xbe9B\xa4>\x10%7\xbe\x85\xc3\x84\xbe+$&\xbew/\xf3\xbd\x14l/\xbe\xec\xa6\xc9\xbeQt\xaf>\x08\x16\xf9\xbdP\xfa\xb8\xbd<sa<g@Q\xbeW\xe4\xc6<\xad\xc4\x10?\x9d\xd9Q=\x14\x8eF\xbcU\x97\xa3\xbe\x02\'\x95\xbe\'\xb9/\xbe\x85\x19\x01>\xbaq\x9b>ZO\x80=\xf0\x1b\x1d\xbeDM\xc5\xbd0\xe0=><>+\xbd\x0c\x80K>\xa8\xc4\x1a=\x9b\xa3\x99>\xab\x98_\xbe\xe2\xb8\x13>8\xacI\xbc\xa0RC>\xb5\x15[>\x10\t\x8d>\xb8Y\xb8>!\xabX>\xa5\xc3\xd9=\xab\xa5%=\xddb7>'
-p211
-tp212
-bsV580426223660175360
-p213
-g2
-(g3
-(I0
-tp214
-g5
-tp215
-Rp216
-(I1
-(I200
-tp217
-g12
-I00
-S'\'}\x00>\x8a\x8f\x1e\xbd\xe8\xa9\xb0\xbe9\xfdV>nz\x06>I\xee\t=\xc3=k\xbe\xf7\x99\x0b\xbe@\xce\xf1\xbc#\xa6_>\x01\x12\x8b=\xdck\x97\xbe!\xc8\x0b>4H\xdf=X\x17\x8c\xbd\xd5\x02\x84>\xf1\x9e\x83\xbd\xb0YJ\xbe#\xfb\xe1\xba\x1b\x19\x84=\x01\xe4\xae\xbeTh1\xbd\x8d\x0b\xf8=\xc9\x05\x11\xbe\xab\x95\xb9\xbd\x1f\xa7m\xbd\xc6\xd5\x9f=/\xaa\xe2\xbd+6\xad\xbe\xd0\x87\r\xbd\xa7ky\xbePG/\xbe\xdfam>\xbf\x91\x96\xbe5\x8c\xc9<G\x89\xfe>c3\x17\xbe}\xfe\xbb=\xd9\'\x81><\xdb\xa1>\xf8\x8ew=0UP>S\x98)>\xed\xc7\xa9\xbeI\xa3I\xbe\xab)\xe5\xbc\xf7\xba\xb5>/\xe6\x17>j\xa3\x91=(9\xc2>\\8\xe5\xbc\xb93\xd4>oL0\xbe\\\x03\x02\xbeK\xa3\xe2\xbe\x05\xba\x86>e\xe7\xed\xbdr]\x17\xbe\xe9\x18\xcb\xbe\x93i\xbe\xbe\x86C\x8b>\xdb\x88\xab<\xca[\x8c\xbd\xa7u\xd0\xbe\x04\xc6.\xbe\xe4-\x94>F\xd4\x92\xbe\x14\xbf\xff\xbcY3\x94\xbe7\xeb\x82\xbe\xc2\x8e\x04\xbf\x7f\x92\xc2\xbe\x1dk\x92\xbdD\x91I\xbe\x1d\x87\x82\xbe\xe8\xd7\xa1>\x1b\xf4\x94>\xf6\xf3\x0c>\xcf"\x84>\xf1\x98\xe6=(t\t\xbe \x05;<]\x8c\xea>@\xc1u\xber\x8c\x08>I\x16S>\xcf\xad\xda=\x08\xeb\xe1\xbe\xb4\xed\xec>a3\'>?\x9f\xa5\xbd\x8f\xb4\xb7<\xd5\xf8"\xbd\xfbH\x97=\xa1\xb2(>\x93@\xda\xbd\xe0\xcd\x1d>\xd5W\x07>\x84\x1bk>\x93s\x95=[\xb4\x06<\xa4\x96\xad>96->4\x9a*>\xf4\xaa>?\xd9\xe3\x88\xbe\xab~\xb9\xbd\xb9\x05\xf8<./\x9b>LQG\xbd\xc4Z\x84\xbc$\x1b\xaf>lu2>\xebq\x88>\xc3i\x86=\xb4s\xce=5\xad\xb5\xbe$6\x87>\x8b\x0e?=e\xc3\xce=\xf3|\x08?\xf3u\xba\xbc\x85\x0c\xc1\xbdo.P\xbe\xad\x86\x9e\xbe\x17yS>\x8d\xa8E\xbd\'H\xcb\xbd\x0c\x8e\xbf=L\xd8\x94>UZ\x8a\xbd\xe1q\x9b\xbc\x07\x1cH\xbc\\\xa0X=$a^\xbe\x84v\xe9=s\xf4\xb2\xbc\x93\x8b\xb3\xbd\x84@\xe5<4\xa4\xa9>\xfd1\xa1\xbe\xf4\xbe\xbc>\x10\x85\xc0\xbd\x83;\x82\xbe\x87\x84\xa0>\x07_\xfa<d\xbe\xb0>$\xf5\xcc>\xd10\x11\xbe\tm\x9b\xbd\x173\r\xbe|{u\xbe\x18\xab\xd7>:\xc7\x01?\xdb\xc6X\xbd\xd1Z\xaf>\xd7\xa3\x07\xbe\xbbn?=1\x03\xc1=#\xc5\xd7\xbe\xf5\xe3\x97>\x17\x9c~\xbe\xa8p\xd0\xbe\xb8au\xbe\x1b\xc0\'\xbe\xe8YH\xbe\xa8y\xb5\xbe\xdf\xf8\xd5>\x06\r\x14\xbe\x818S\xbe=\x01\x0b\xbe\xe4D\xdb\xbe\xd3u\xd7\xbd\x1cr\xf6>\xf0^w\xbd\x84\xcf\x01=+\x94\t\xbf\xb8\xbd\xbd\xbe_W\xb9\xbekG\xa3=\xd5P\xc8>\xdc\x0e\xa5=I\x08W\xbe8\xcdB\xbeyL\xb9>\xa8\xec\xb9=H.#=|Q\x99\xbb\xab\x02\xe8>,\xef\xb8\xbe\xf9e->\xecYD\xbe\x1b\xc3\x82>\xc7\xe9\x97>\xad\x13\xd1>-\xa1\xed>o\xd7\xd7>\xef0\x1a>}^j>\xb8 \x96;'
-p218
-tp219
-bsV581002384299556864
-p220
-g2
-(g3
-(I0
-tp221
-g5
-tp222
-Rp223
-(I1
-(I200
-tp224
-g12
-I00
-S'\xdcH\xd4<\xd7a\x8c\xbd\x1f\xda\xd8\xbeD\'\xdb>\xcd\x10\xa7=\t#3>H\\\xee\xbe\x9d\'\xfd\xbdY5|\xbc-\xb1\xba>\x1c\x1ej=\xa1o\x1a\xbf\xf8\x02!>\xcb8\xe2=g\xbd\x91\xbc\xb2\xbe\xa3>\x98C\xa5\xbd\'\xc2\xc4\xbe#\r\x1a>?sI>\xb1\xd3 \xbf\xa1z\xb9\xbdC\x0b\xfe=\x8a\xa0\'\xbe\x88\x9e5\xbe\xe8\xdc\xd5;\x87\xe9!=3\xcc\xbe\xbd\xcd\x07\x0f\xbf\xdf\xc1\x12\xbe\x7f\x00\xba\xbe\xf0\xf0i\xbe\x9f\x1e\xb1>\xd7#\xc5\xbe2\xca\x85=\xa0\xa3J?(\xd8\xbc\xbeu\x84\x99=w\x8bz>=\x8f\x0f?^\x82\x06>\xe5\xbe\x00?\xe71~>\xc1:\x08\xbf\x1f\xda\x96\xbe|\xa0\x85<,\x95\xd5>\x08\xa0\xa6>y\xef\x0e>\xa1i\xee>\xf4\x81y\xbdFd\x0f?\tk\xb1\xbeY\n\x86\xbe\x90:+\xbf\x99\xcf\xdf> \xdbs\xbe\xd4j^\xbe\x97\xd5\xf8\xbe7G\xdf\xbe\xb1\x12\xe4>\xa5\xeaN\xbd\x13\xfc\'\xbe\x90\xcd<\xbf\xb3=\xb1\xbe[g\xed>\xd1R\xd0\xbey\xe8\x04\xbe\x98\x1d\xe2\xbe\x9dl\xeb\xbep\xa8\x1e\xbfm\x90\x1d\xbf\x13\x99\x15\xbe\x99\xae\x85\xbeA\r\xda\xbe%\xdd\x12?Q\x8a\x01?\x0f\xe29>\x81A\xc9>\x9d\x82\xb6=\xbc\x806\xbe\xa9\x82\xa9\xbc]l&?\x89q\xb7\xbe\xaf\x00\xc6=[T\xa9> \xa55\xbc3"!\xbf\x13U\x12?\xa7\xf5\xa7>\x9fJ\xc8<M\xcc\xb0\xbb\xb47L>\xd3d\x8c=\xf8\xfe{=\x1e.\x92\xbe\xb9\xa6\x17>$\x84p=[\'\xc6>S\x85l>L\xde\x0b\xbd\xaf\x92\xcf>\xb8\xfeU>\t\x05u>\xed\x16\xa0?\xc0\x96\xcc\xbeQ\xa9h\xbe\x11\xae\xb4\xbb"A\r?\xdf\xfb\x18\xbe5\xc4M=6\x87\x16?\xf7\xf5R>\xef\xb4\xec>\xb1\xd0\xd2=\xbc\x1bV>\x8d\xae\xf5\xbe p\x96>\x1c\x1d\xb4=\xf9K!>7\xf9J?\x0f7\x83\xbeW\x96\x17\xbe\xafG\xca\xbe=N\r\xbf\xbf\xc0\x8f>\xc5\x13\x04\xbdm\xc9\x18\xbeq\x86\x04>\xf5\x1e\x04?0?O\xbe\xf9\xecN\xbe\xf1\x84\xef\xbd\x8ar\x0e>i\x18\x05\xbf\xeb}\x05>\xad\xf4\x89=U\xf6\x08\xbe\x89A\xc5=\x16\x1f\x1a?\x99]\xfd\xbe\xce\xe8\x15?e\x97\xf5\xbdY\x88\x8a\xbe\x91\xae\x02?)f\xed=\xa9\x1d\x10?2V\x0c?\x1b\x18V\xbe\x8f\x95_\xbe\x07U\x88\xbe\xe9\\\xc4\xbe{\xdf#?\xb9L^?s\xf9*\xbeC\x8a\xc9>tJL\xbexO\xbb<\xdd\x18\xdd=9)A\xbf\\\x9d\x1c?I\x94\xa2\xbes\xf7\x16\xbf\xeft\xba\xbe\x7f\x1bv\xbe$<\xb9\xbe\x9d$\xd9\xbe\x8e\x14\'?\xb3C\x95\xbe\xebS\xdb\xbe\xbc"\x96\xbeSj3\xbfO5i\xbe\x84\xf2-?\x89\xc70\xbeM>I=/,]\xbf\xc7\x1c\xfd\xbe\xf5`M\xbf|\x00y=\xa5\x12\xf0>=\xe0)>\x05\x7f\xc2\xbe\xcff\xc6\xbe\xc2\xfd\x19?V\x81\x12>Ew\x83\xbdA\x04\xc5\xbc0\xd7H?\xd7Q+\xbf\x0c\x83\xe5=\xb2\x10\x00\xbf\xd3\xa9\xd6>s\xd7\xd9>\xf8\xed\xf8>{SC?`\xfaU?\x18-Y>\xbc\x8d\xda>\r\xed[\xbd'
-p225
-tp226
-bsV591035501014077440
-p227
-g2
-(g3
-(I0
-tp228
-g5
-tp229
-Rp230
-(I1
-(I200
-tp231
-g12
-I00
-S'\x1cr7>\x92\xc6\xd0\xbd\xe5.\xef\xbe\xb9\xe6\x83>\x9a(K>\x14"\x1a=>\xf6\xa3\xbenmJ\xbeB|8\xbd\x02;\x93>Zk\xc5=\xce\x7f\xa0\xbe\xae\xe1R>\x85\xf3\xfb=:Y\xba\xbd\x99\x88\xb9>\xa8\x05Q\xbd;\xc8n\xbe\x85\xf6T<\xee$\xea=~\x84\xff\xbeN\x96\x9b\xbdV\x97\x1c>\x98\x07\x91\xbe\x13\x88\x18\xbe\xca\x01\x86\xbd\xfe\x1a\xfa=J\x06\\\xbe{\xc4\xf5\xbe\x92\xe8\t={\x9cb\xbe\xcb\x0cW\xbefs\x97>\xe6T\xb4\xbe\xa5@A=\x98\xe7\x1d?\xbe\xe41\xbe\xfe_\xd1=S\x16\xaa>\x1a\xa0\xc3>\xe1K\x9b=\xdaS\x96>\x93s\x8a>\xf6\xc0\xf2\xbe\xb3\xe3`\xbe)\x02\x80\xbb\xe2\x0b\xf8>*\x11A>Us\xe1=C\xdb\xf7>O\xcf\xa5:\xda\x83\x0e?\xa6\xfd\x8d\xbe\x98\x0c\x1a\xbe\xd2\xd3\x1f\xbf\x85t\xce>\x18\xe5\x06\xbeodL\xbe\x82P\t\xbf\xe8\x9c\xf7\xbe\xd5\x9d\xc6>\x92(Z:aa\x02\xbeM\xe9\x12\xbf\xf8\xf0v\xbe;\r\xd3>m\x15\xaf\xbe\xd6\x86t\xbc\x85\x9b\xdf\xbez\xfd\x9c\xbe\x12D0\xbfDX\x04\xbf(\xdf[\xbd\xa2\xc3a\xbe\x1f\x83\xa3\xbeh\x1f\xf2>\xc0\x05\xdc>k"=>\xc0\xee\x8a>\xf2e.><\xdf0\xbeR\xed\x16;\xcf\x8a\x11?\xf2\xfd\xa4\xbe\xc2\xc6/>d\xc5\x89>\xbde,>\x86\xbc\x11\xbf\'\t\x19?r\xc2\x87>\xc1\x84\x9d\xbd\x8dg\xac=\x13\xbc\\\xbd\xd6\xb8\xed=u\xf7e>\xdf\xc6\x1d\xbe\x10\xa95>\xa8\xc1O>\x86\x93\x9d>N\x91\x00>\x90\x82\x1a=\xcd\xe5\xdc>r\x80N>X\xfaV>\xf6cv?%\x82\xb3\xbe\xcbL\xe7\xbd\xeb\x9f\xbe;N\x13\xb7>\xe7R\xac\xbd2\x99\xe1<M$\xfe>\xbc\x86=>6\x1d\xad>g\xda\x1a=\n\x16\x11>\xf2\xe0\xe0\xbe\xee@\xaf>\xdf\x17\xab=\xc5?&>W\x15A?\xfd!\xbb\xbd\x87\xca\xca\xbd\xde\xa8\x84\xbe*\xd9\xac\xbeb\xaf\x98>2\xa6\xb8\xbdX\xf7\xdb\xbd\xacV\xab=\xf9\x8b\xb5>NT\xaf\xbd\x12\xde\x7f\xbd\xd2r\xda\xbcJ|\xc4=\xc5{p\xbe\xbbu\x16>\xa4>\x0c=2\'\xb0\xbdX\xcf\xca=j\x16\xd5>j\xcd\xc5\xbe\xc7\xd1\x03?\x02\xc1\xbd\xbd\xa0G\xa6\xbe\x1a(\xd0>)\xd3\x97<\xbb\xda\xec>\xd80\xe8>\x1b\x94`\xbe\xf9\x94\x00\xbe\xaa\xc6@\xbe\xdb&\xa6\xbe\xb1\xd6\x01?\xbb\x91\'?\x99.\x9a\xbd\x93\xa3\xd4>@\xf2\x18\xbe\xf1\xe4\x82=9\x11\xb7=G~\x0f\xbf\xd2h\xea>\xf7B\xa2\xbe&e\x03\xbf\x8a\xea\x8b\xbe\xff\xe0?\xbe\xcf\x96\x8a\xbe\x16\xb0\xf0\xbe,3\n?&Jk\xbeXN\x99\xbe\xcaQ\x19\xbe\xe4\x85\x01\xbfp\xa6\xda\xbd4 .?&L\x8d\xbd\xaa\xb29\xb9\xcb\x141\xbfP\x16\xe7\xbe\x00/\xf6\xber\xdb\xca=\xeaj\xef>n\xe1\x00>\xa1\x0f\x9f\xbe\xb0\x82\x88\xbe\xd6t\xe4>\xeb\x1e\xb5=\x90\x15\x99=\xb6\xaf\xbe<\xc8M\x1a?S\xc3\xfe\xbe\xfdU>>\r\xc4\x85\xbe\xa2N\xa6>\xa6\xc3\xbd>\x86\xf0\xfa>T\xc4\x1f?<L\x0f?\xbb`1>\xfal\x8c>z\xa9\xa6='
-p232
-tp233
-bsV581390625054040064
-p234
-g2
-(g3
-(I0
-tp235
-g5
-tp236
-Rp237
-(I1
-(I200
-tp238
-g12
-I00
-S'\x0c\x12\xea=\xb9\xb0\xee\xbc\xdc\xd0Z\xbe\xd7\x80\xd3=\x9fd\xcb=\x1c\xbf\xc6<z\x86\x00\xbe\xe2\xa1\xd0\xbd\x8c\xaa\xe3\xbcK!\x18>\xac\xd6\x15=Y\xfb\x13\xbe\x8c\x1d\xb7=\x0b\x89c=\xbcV!\xbd\x12jA>\x18\x11\x15\xbd\x9dR\xde\xbd\xb4\x96\x9e\xbcd\x02\xec<\x9f\x8eX\xbe\xc0 \xae\xbc\\I\x99=\x95=\xb7\xbd^\x05f\xbd\xbf\xe6\x19\xbd\xd7\xcd}=9\x1b\xc0\xbdcrZ\xbe\xacg\xbf\xbb>O\xf0\xbd\xf4\x06\xb7\xbd\xb4@\xff=\xfcN9\xbe\x81\xea\x05=\x98\x07\x8c>\xc6R"\xbd\xd7\xb6c=\xfd-#>a\xb9\x1f>\xea\x04\x07<YP\xb2=\x87\xab\xe0=\x14\xc9I\xbe\x1bC\xcc\xbd\xf3\x80C\xbc\xa2kk>\xf01\xbb=\x04\xb2D=\xb4\xe3q>\x82\xe2=\xbc\x96\xdd\x81>\x1c\xff\xed\xbd\x8c\xdao\xbd%\x01\x96\xbe\xf4\x06">\x80\x06q\xbd\xb9\x91\xab\xbd\xf1\x84\x8e\xbe\xd9\xb6o\xbe\x18E\x1e>\x08\x16*=\x0f\xa4\xcb\xbc\x8e;v\xbe\xad\xb7\xb5\xbd\x0b\xc7*>\xfbF*\xbe\xf9v\xf4<\x89O&\xbe\xf5\x0b\x12\xbeVi\xa0\xbe\x1b\x89i\xbe\xd3%\x0f\xbd>*\xc0\xbd\x95\x91\r\xbeh\xa1@>\xa2\xe91>\x1f\xf9\xbf=&#\x05>\xbf\x93\xb6=\xe1X\x83\xbdd\xf1\xd8;l\xf5\x86>f\xe6#\xbe\x86Y\xba=\xbb\xdd\xe9=\x1d\xa0\xb5=E\x91\x80\xbe\x1d\x08\x93>`/\xba=\x1c\xf1\x85\xbd\r\xef:=-".\xbd\xce\xe2\xf3<k\xae\xfe=\xf01v\xbd\x95c\xd5=\xd6;\xdd=\x96\xf1\x0b>\x98*\xb1<\xe2\xe5m<\xd9pC>\xe6\xd2\xcc=\xd3\xd3\xc9=J\xbb\xdc>\r\xa2&\xbe\xff_4\xbd|\xb9\xd6<\xe6X\x19>x\xbd\x02\xbd2E\xf9\xbc4\xdaS>\\\x83\xbd=\xd7\xea\x15>\xff\xcf\xb4<\xe2\x04\x81=\x8b\xa0T\xbe\xc5t\x1d>\x02\xf0\x11=\x9c\x83\x81=*\xb3\xaf>\xe2\x8d_\xbcpe\x08\xbd\xbc\xe3\xd8\xbd;\x85\x13\xbe\x8e\xf7\x0c>D\xd5G\xbd\xf6O\r\xbd&\xe80=|^ >\xbe\xa7\x1f\xbd\xc3\x883\xbc\x07\x1f\xd6\xba\xa5\xf2\x18=n7\xb8\xbd\x87V\x87=\xf0\xcd\xd2\xbbf\xef\x13\xbd\x84\xf8t<\xd2{&>\xaa\x9f3\xbe\x8e\x84i>D\xfa\xc8\xbc4\x93 \xbe|\xaaJ>\xe5\x98\x98<\xf0G6>wUp>\x9c\xda\xcf\xbd\xe5\x84\x18\xbd,\x84\xa0\xbd|\xb2\x0e\xbeL\tj>L\xf8\x8a>\xdf\x8e\x12\xbd\x85;O>\x98\xe6\xa4\xbd\xde\xf0)=\xc2\xf3.=\xd2F\x81\xbe|8!>0s\x18\xbe&\x1e\x80\xbe1\xe2\x0b\xbe^i\x8f\xbd\x98\xac\xd5\xbdF\xff^\xbe\x0b\xe2v>!m\xac\xbd(\xfe\x05\xbe>\xef\x8f\xbd\xa99j\xbet!i\xbd\n\t\x9e>l\x07\xaa\xbc5@8<v\x9c\xa1\xbe2\xbfc\xbe\x01t(\xbe\x97Bq=G\xdah>p\xc0e=\x02o\x11\xbe\x0c)\xd5\xbdK\xefh>\xb5\xa5\x14=\xfb\xc4)=V\rY<\xbe4\x85>\xb0\xbfU\xbe\xd6\'\xcb=\xed\x19\xc7\xbdE\xa9\x07>\xe8\xe2->\xb5>}>\xa4\x8c\x8f>@\xc1_>\xb3\xfb\xa2=\x12\x81\x01>\xd7\x8b\xeb<'
-p239
-tp240
-bsV582793881307099136
-p241
-g2
-(g3
-(I0
-tp242
-g5
-tp243
-Rp244
-(I1
-(I200
-tp245
-g12
-I00
-S'\n\xd3@\xbd\x8f}\x7f\xbd\r\x9c\xd1\xbe\xaf)\xd2>7\xefD=a\x1f9>J\x8c\xd2\xbevu\x8d\xbdq\x1d\xbc\xbc\x12U\xae>\xddzD=\x7fA!\xbf\xf8\xd58>@=\xe9=b\x7f\xac\xbc\x94\x9ex>*\x05\x9a\xbd\xa3B\xcc\xbe\x00\xa00>\xdaeb>\xab\x9d\x1f\xbf\xa9\xb6\xa5\xbdq\xe1\xa2=\x8d\x85\xf2\xbd\xefo\x11\xbe\xcc\xc92\xba\xa65\x8b<\x9a\x9a\xa4\xbdn\xb8\x06\xbfL\xba;\xbe\xc0R\xc2\xbe#0O\xbe\xa5\x95\xb7>:\xe4\xc9\xbe\x9d\xca\xcc<\xd6\x90B?\xdf\x0c\xde\xbeW\xf6\x9b=\x06\xca@>\xc7\x1f\x15?m\xf1+>\x165\x0f?7\xcb_>n\x00\x07\xbf\xf9\xe7\x8b\xbe\xf3\x8e.<\xd4\xc5\xac>\x84\xc6\x94>\xa7Z\xee=:\xb0\xc9>i\x98\x9f\xbd\xaf\x85\x0c?\xd4z\xa8\xbe\x14M\x81\xbe\xbbd\x18\xbfl\xcb\xd4>.T\x83\xbe\xb6\xeei\xbe\xf7\x88\xda\xbe\xd4\xe7\xd3\xbeo\xb5\xe9>\xe3\x96\xf6\xbd=\x1bW\xbe\xcc\x978\xbf\xd5\x19\xa4\xbe\xdf*\xf1>1\xfa\xcf\xbe\x7f\x9bI\xbeW<\xe7\xbe\xbf\xa5\xdd\xbeI\t\r\xbf\xfb\x9d\x12\xbf\xf1(\xf4\xbd\xc4\xa0\x81\xbe\xf1Y\xe5\xbeA\xa2\x08?,\xaa\x01?`\xf3">\rd\xbd>\x99\xe7\x95= MI\xbe\xf4\xb1K\xbc\xfa/\'?>\xa3\xa7\xbev\x95\xaa=f7\xa6>@\xa2\n\xbd\xd7\xaa\x1c\xbf\x11\xd0\x06?\x14\xb3\xaa>\x94\xf8\xbb<\xc4\x19z\xbd$\xffc>\xa1#\x95=\xb3!$=\xd8\xbd\x89\xbe\xf8b\xa8=s\xad\xc0<\xcf?\xb4>\xea\xd0r><\xe0C\xbd\xfaD\xca>?\x8dR>p\xc6d>\x11\xe1\x99?S\xde\xbf\xbe\x81\xcad\xbe\x9cH\x14\xbd\xb1;\x0e?\x9b\xe8\x1f\xbe\x86\xce\xc3=\xe9-\x11?\xdb;&>\x17U\xde>\xdf1\xd3=TeD>\n\x1f\xe4\xbeo\xf4\x8e>#YK={\xae\x0f>\xdd\xc2=?\xdfs\x99\xbe\xc9D\x1d\xbe\xe3g\xc5\xbe>\xd7\x10\xbf\x9d\xa2\x85>6\xf7k\xbbJ\xb9-\xbe\xf8\x88\x06>L\x1b\xf9>\x03\x83]\xbe\xb4Gs\xbe+%\x08\xbe\xc8\xac\x0b>\x8b\x92\x0c\xbf\x90\x05\x13>\n\xb9B=t\xbc\x02\xbe\x18\x18\t>q\xb2\x1d?\rL\xef\xbe/W\x0b?\xdd\xc7+\xbe \x17_\xbe\xc1\x1c\xfa>a#\xfd=\x97\x99\x0e?C\x96\xfb>\xdb\t7\xbe\xe7\xab\x83\xbe}\xd4\x92\xbe\xdf.\xbd\xbe\x87@#?:\xdd\\?\xf1\xe83\xbe\x87\x06\xc8>p\xa4E\xbe\'(\x1d<\x94x\xd2=M\xbe<\xbf4n\x1e?\x17\x8d\x91\xbeCV\x0c\xbf\x83x\xcd\xbe\xb9=\x86\xbe\xb6\xb7\xd0\xbe\xaf\x13\xd4\xbe\x91\x9c\x1b?Q\x1c\x93\xbe@\x04\xcc\xbe\xc0$\x95\xbeFN2\xbf\xb1\xff_\xbe\xcf\x8f%?J\xe0\'\xbe\xca\xda&=\xfcKZ\xbf\x8a\t\xef\xbe}\xe9W\xbf\xc9z\xd9<#\x15\xf3>D\xef >\xd5\x07\xb4\xbe$\xcf\xc2\xbe2\x01\x0c?\xc1\x8a\x1d>\x9aV\xe0\xbd::\x18\xbd\xfa+B?\xf4\x0c&\xbf\x01\x14\xd6=Ib\x06\xbf\xfc\x93\xe2>\xf3\t\xd8>dm\xed>q\x93<??\xd6T?=^G>\x9f\x9d\xd5>m;B\xbd'
-p246
-tp247
-bsV582845634069204992
-p248
-g2
-(g3
-(I0
-tp249
-g5
-tp250
-Rp251
-(I1
-(I200
-tp252
-g12
-I00
-S'/%p=\x0c\xdb\x80\xbd\xedJ\xce\xbel\x8a\xbb>q\xf6\xde=\xbf\xc3\xef=4\xa3\xbd\xbe\x11\xf8 \xbeg\xe5\x8c\xbc\xc9|\xa2>W7\x7f=\xa3\xf4\xfc\xbeL\xa8\x1e>m\xdf\xf1=q#0\xbc\x88C\xab>\xea\xa3\x9e\xbdk\x9e\x9a\xbe\xba\x10\xb7=\xbdX\xfe=<<\x08\xbf\x14\xe4\xc1\xbd\x1a\xac\x17>\x9b\xcb\x0f\xbe\x8f[\x13\xbe\xc7S\xbc\xbc\x84\xf5i=#\x0f\xe3\xbd\t\x81\xf0\xbe\xbfz\xee\xbd\xde\xc9\xb0\xbe\x8d\xc3c\xbe\x17Z\x98>\x87,\xc6\xbe\x01x_=6\xb51?"\xc3\x93\xbe\xe0\xe5\xc1=\xef\x85\x82>F\xbb\xea>\xf9\x9b\x91=\x99\xf6\xbe>0\xeaJ>z1\xe6\xbe\x14\xf8\x8d\xbe\x0fGy\xbc\x17!\xcd>\xfb*\x8d>\xb7\xc2\x0f>0A\xdb>\xef\xd9^\xbda\x15\x04?8\xc8\x86\xbeG\xb0N\xbe\x8a{\x16\xbf\x11k\xbc>l\x91V\xbeLjd\xbe<\x82\xee\xbem\x0c\xe0\xbe\xb6\xa3\xb1>\xa6\xceg\xbc?\x9f\x00\xbe\xac\x9f$\xbf \xf5\x88\xbe}\xfc\xcd>\xd1#\xbb\xbe\x83\x18\xd0\xbdQ\xb2\xc4\xbeSx\xcf\xbe\x98$\x1a\xbf\xe4\xaf\x0e\xbf,\x83\x01\xbe\x81\xf1d\xbe&>\xb7\xbe\xd9\x14\xf0>\xd9\xbb\xe1>_L\'>\xbf\x9f\xb6>\r#\xf6=\xa3~\x1a\xbe\x8f\xa1\x18=W`\x1a?z\xea\xaa\xbe9\xe8\xf7=y\x1e\x8f>\x87eE=\x17\xf8\x15\xbf\xc5\x89\x16?\xc1"s>\xb9\xa1_\xbd\xee\x9e\xa0<s\xc4\xfd=\'l\x92=M\xf6\x00>m\xedq\xbe\xff\xd4D>=G\xcc=\xb7\xbb\xb9>\xe1\xd0\x18>w\xea\xe2\xbc\xefQ\xc3>A\x94Z>qCv>\x14\xb0\x8c?\x119\xb3\xbeM8M\xbe\x1c\x07\x99<\r\xbc\xf2>\xf4+\xed\xbd\xf09\x01=\x1f\xf9\xfe>dOC>@ \xc0>O\xee\xa1=\xa7B;>\x93\xa0\xe1\xbe\xf6\xcb\x8b>\xb6\xcf\x82=\x87\x8c\xf2=\xf6\x89@?g\xe3\'\xbe\x96%\xea\xbd\xf2\xf1\xad\xbe\r\xf6\xf4\xbe\x8f~\x88>[\xe4\xb8\xbc\xc7_\xfc\xbd\x8f\xfb\x04>\xa3l\xeb>\xfe\xeb\x1c\xbeg|\x00\xbe\xf6\x1c\x87\xbd\xbc\x8e\xe3=\xb9\xd8\xd4\xbe\x15\x92%>t\x15\xd8<F\xd7\xd1\xbd\x8aQ==9\xb8\xff>`\x1f\xed\xbeIz\x08?\x89\x9b\xd5\xbd\xb2\xe1\x8e\xbeA\x0c\xe1>\xa7\xd8`=m@\xed>\xf7\xa6\x02?\xd7\x9fA\xbe\xc3E\x15\xbe\x9a\xdfg\xbe\xfe\xfe\xa3\xbee\xa6\x12?\x89\xaf=?\x1fe\x07\xbec\xa0\xcd>\xfcYF\xbe\x9a\xa0\x05=\xb7\x92\xeb=8\xe4%\xbfL\xe0\xf3>\xf7q\x96\xbe\x84\x1e\x13\xbf\xb0r\xa7\xbe\xd6\x86_\xbe@\xf8\x8b\xbe\x10\xcd\xcc\xbe\xb7\xca\x13?Z\xd6\x83\xbe\xad\t\xbc\xbeOau\xbe\x1ck \xbf\xc1\tL\xbe\t\xa0\x19?\x8b\x8f\x0b\xbe\x19\x8e9=\x8a\x11D\xbf\x86\x06\xe0\xbeA\x98\x1a\xbf\x9c\x8d\xa8=yR\xf8>\xdb\x1d\x05>\xd3G\xa5\xbe:J\x95\xbem8\x0c?\xaal\x15>\x89\xf6\x16\xbb\xcfI\x85\xb9\xdc\xe7+?\x0cC\x15\xbf-V#>j+\xbe\xbe\x0c^\xb6>w\xc3\xc0>\xe9O\xfa>\xf9d&?\x0e\xc00?\x81\xc27>\xdc\xc9\xbb>7\xa0s\xbd'
-p253
-tp254
-bsV580569476686581760
-p255
-g2
-(g3
-(I0
-tp256
-g5
-tp257
-Rp258
-(I1
-(I200
-tp259
-g12
-I00
-S'Z\xed\x01\xbd\xc3\x86\x88\xbd#\xe4\xea\xbe*\x05\xf9>\xc5\xcfl=\xc3=W>"\xea\xff\xbef\xd3\xce\xbd\x88\x1c\xb2\xbc\xcf\xb2\xcc>\xc7\\d=\xe9-9\xbf}\xe58>\xc8}\xfe=\x8f?A\xbc\x07h\xa2>\xc4\x9b\xbe\xbd\xdb\xca\xe8\xbe\xc4g?>\x8c\xe5r>\xa5Q6\xbf$s\xcb\xbd\'\xc0\xea=\x078\x07\xbe\xb8\xe7B\xbe(\x1e8</\xed\xb3<\xbc\xf6\xa1\xbdf;\x1c\xbf,8\\\xbe\xb1\xf7\xe3\xbe\x8c\x1fy\xbe\x07/\xd0>\xbe\x18\xe3\xbe*\\n=\xbb0d?\xb3\t\xec\xbe\xce\xb5\xa3=\x85+l>\xa0\xe1(?\xa2\xb9$>e\x00\x19?\xc0\xfbr>\xa3\xe0\x16\xbfx\xe3\xa3\xbe6i\xca;\xcb\x19\xd3>s\xed\xb9>,*\x16>\x0f\x98\xf0>s@\xc2\xbd\x8c.\x1d?\xd8D\xbd\xbeH\xe8\x9a\xbe\x8b\x965\xbf\xbb=\xee>h\x8d\x90\xbe\x87h\x7f\xbexY\x02\xbfg\xe1\xed\xbe\xe7\xf3\xf9>}\x19\xb7\xbd\x0feX\xbe\xcb\xe3P\xbf^;\xc1\xbe\x9e\x16\x06?1\x99\xec\xbe\xcf+L\xbe\x18<\xff\xbe\xfd\x06\x04\xbf\x17\xf5$\xbf5K+\xbf\x89\x91)\xbe\xfd\xee\x91\xbebA\xfe\xbe\x0b\xbb\x1e?/\x90\x14?T\xddD>=\x94\xe0>\x9f\x1b\xab=\x1c\xc8O\xbe\x15\xea\x80\xbc\x18:=?\x07\xd6\xcb\xbe\xf6P\xc6=\x7f\x1f\xbc>\x80{]\xbd?\xd32\xbf\xf5s\x1d?^B\xba>\xa43\xc1<H\xf1*\xbd#\xa0\x88>\x8d\xa2\xa2=\xa1\x17@=K\x9a\xa3\xbe\xcdo\x14>&\xac\x05=r\xfd\xd4>\xb3\xab\x84>%!t\xbd\xf6\x15\xe3>\x98Zp>\xa9\x93\x85>\xda\xec\xb2?\'-\xe2\xbe5j\x87\xbeO\xfc\xa5\xbc\x17\x11&?\x88\x112\xbe\x1a\x18\x94=8^%?2\x89O>\x12\xc0\x00?\xdc\'\x02>}"{>\x9f$\x06\xbf\xd2\xe3\x9c>\x9eaw=\xc3\x0f&>\xbe>[?.+\xa0\xbeS<.\xbeo\xfa\xe7\xbe\x00v\'\xbfh\xd6\x9d>\xba^\x94\xbcmw?\xbe\x07\x1c\x12>9z\x13?>U\x82\xbe,i{\xbe\xaf\'\x13\xbe=\x89\x1c>\x93\x90"\xbf\xe3o\x1f>\xfe\xf7Q=\x9az\x19\xbe\x82\x11\xe3=\x8bw1?\xe3\x04\r\xbfc\x91 ?6\xa2)\xbe5\xd9\x88\xbe|\x12\x12?\x90I\x14>\xc9w ?\x80\xf1\x1a? K[\xbe\x0fP\x85\xbei\x9a\xa3\xbeu\xbe\xd5\xbe\xd9\xc5:?\x85\x88{?M\xe1N\xbeC\x91\xe1>o\xb9c\xbe\x06\x91\x8d<\x02q\xf3=8\xd5X\xbf\x1f\xbe.?\xa2\x08\xaa\xbe\x9f\x98%\xbf\x91!\xe4\xbe\xd4\x04\x94\xbe\xd3\xf3\xdc\xbeS\xcf\xeb\xbe\x00|5?"\r\xa7\xbe\x8f\x86\xf2\xbe\xa1\xe7\xb2\xbe\xc4\x1eM\xbf\xae\x07\x86\xbe\x1b\xe9;?\x89\xabD\xbe31\x80=\xe0\xbe{\xbf\xf4\xfc\t\xbf*\xa4q\xbf\xa8\xb2x=\xc2\xf5\x0b?^Z<>V\xed\xd1\xbe\xc7 \xdf\xbe(=.?\xb5\xfc.>\x11\x90\xe1\xbd\xb3\x89\x18\xbd\x1d\xff]?\xb0">\xbf\x08=\xed=\x05y\x17\xbfc]\xf6>\xcd\x03\xfa>=\xd6\n?V\x0f[?B\xc4t?\x80\x80j>\x8d\xff\xfd>I0\xb9\xbd'
-p260
-tp261
-bsV580927517671993344
-p262
-g2
-(g3
-(I0
-tp263
-g5
-tp264
-Rp265
-(I1
-(I200
-tp266
-g12
-I00
-S"\xd6}\xf8=\xe0>]\xbd\xfc\xe6\xb8\xbe8%\x99>\x86C\x19>\x04\xd4(=\x83&\x8b\xbe\xc04S\xbe4\x8b\x13\xbc4&\x85>\xa7\xfeZ=\xcct\xb2\xbec\t\xdd=\xe3\xfc\xd7=\x80\x80\xba;\xe4'\xbc>\xb8I\x8d\xbd]_J\xbe\x03F\x81<V\xe7\xd9<\x94<\xca\xbeJs\xc2\xbd\x1d\xed6>3\xd0\xf3\xbd&\x1b\xec\xbd\x99g'\xbd\xb1\xbd\xb5=\xa7\xac\xeb\xbd\xdcz\xb8\xbe\xfeN\x91\xbdI\xc8\x9e\xbe\xef\xae]\xbe\n\xd9Q>\x91e\xb8\xbe\xa6\xbcX=wn\x13?\xf9\xc9\x12\xbe\x93:\xd9=\xdeu\x8d>\xc1L\xa1>\x80\xf8\xf5\xbc{\xfe9>\xafA\x10>)\x89\xa0\xbe\xbc\xc6\x8f\xbel4L\xbd\xa6\xc6\xc6>f\x8do>TM\x1a>D\xa2\xcd>\xcf\xc0\x0f\xbd7X\xdd>\xb8\x1b/\xbeY5\x0e\xbe6z\xfb\xbeD\xff\x8f>\x00\xba$\xbeQ\xc7V\xbe\xbf\x80\xdd\xbem\xff\xd0\xbe\x03\xafZ>\x80S\x94=\x9fI-\xbdh\xa0\x02\xbf\xd5$-\xbed\xf6\x99>bs\x96\xbe\x8f\x9a\xe9\xbcv\xc4\x8e\xbe\xae\xc2\xae\xbe%\xf8\x12\xbf\xbf\x88\xfb\xbe\xc7!\xf6\xbd\x916/\xbet\x18\x83\xbe\x8c\x1a\xb0>\x0c\x10\xaf>rH\x16>lq\xa5>\x08.\x1c><\xc1\xbf\xbd\xd2\x84\xb6=\xffd\xfd>\xea\x18\x97\xbe\xef\xcb\x05>$\xdcN>\xa1\x9e\xc5=\xaf\x96\x00\xbf\xc9\x03\x17?\x96\x9b\xf1=\x0f\xc5\xed\xbd\xdb\x08\xa9=\xf9n\x0e=\xdd\x9d4=Cu:>\\L7\xbe\xf0\x01\x87>\xb9\xff\x14>6z\xac>\xcatb=\x14Kt\xbcA<\xac>4JI>\xba\x9by>\xb4\x8de?\xe8\x10\x9f\xbe\xac9.\xbe\xd8w\x96=Ty\xba>\xfa+\x7f\xbdc>\x04\xbd\x01\x98\xb9>luM>\x01\xb3\x94>\xf4\xc1\x88=q\xdf\x1a>C\x08\xcc\xbe\xfaZm>\x06x5=\x83q\x8f=i<-?\xc9\xf5\r\xbd\x07\xc8\xa3\xbd\xc5\x8b\x89\xbe\x83W\xbb\xbe\x047w>\xbcT\x07\xbd\xc9\x07\xb3\xbdj3\x01>\x9d\xb2\xca>\xbf\x8a\xb3\xbdF\xad?\xbc\x93\x92?<8\x13\x96=I\xbf\x8d\xbe\xed\xce'>\x91D\x00\xbc\xd2f\x89\xbd3\x1e\x1b\xbd\xaer\xb2>6,\xd5\xbe#D\xec>\xe9\xe4?\xbd0\n\x9c\xbe_p\xb4>\xc6\x10\xfd\xbb\x1cS\xa7>c\x81\xf8>\x10\x8f,\xbeQ\xbf\x0f\xbd\xe9R\x17\xbe\xe0Ml\xbelI\xef>v\xbe\x0f?\xe5*\xb4\xbd\xf9\x12\xc7>d\x1fA\xbe`\xbbV=\x1e\xd2\x06>nR\x00\xbf\x12\xf1\x94>\x87\n\x8e\xbe\xa0&\x0c\xbf\x0f\x8d\x81\xbe\x99.,\xbey\xaa\x06\xbe\xc9(\xb6\xbeS!\xf6>\x97\xe8F\xbe\xcc\x9c\x8f\xbe\xbc\x90,\xbe7F\x05\xbf\xc3\xe60\xbe\xcc9\xf3>\x10\xaa\xc9\xbd\xaf\xb7~=i\x05\x1b\xbfW\x9a\xba\xbesI\xa7\xbe\x03\x83\xe1=\xfdn\xe4>`\xab\xb7=t|\x86\xbe?\x064\xbe!\xec\xfd>o?\x06>jc\xa7=\x94E\x00=\xf4\xc6\x07?\xa9\xec\xed\xbe$\rO>\xc0YL\xbe!\xe8\x81>\xf4b\x97>\x14[\xed>\xbck\xfc>\xe3h\xfd>\x7f\xe9\r>\xe4T\x92>\xd6k\xc5\xbd"
-p267
-tp268
-bsV580562772146188288
-p269
-g2
-(g3
-(I0
-tp270
-g5
-tp271
-Rp272
-(I1
-(I200
-tp273
-g12
-I00
-S'r/\x06>\x10\x0b_\xbc\x93s!\xbeP\xc0\x92<c\xf2\xcf=>S\x8d\xbb\xadu#\xbd\x1al\xc4\xbd\xae\xea\xed\xbcq\x85\xd1=Z\x99\xa2<\xd2\xb7%\xbd\xac\xda\x89=\xa9\x88\xf5<\x84\xfe8\xbd+\xbe\x18>ms\xe3\xbc\xccEE\xbd\xccRe\xbd\x82\xe0>\xbc\x1a\x7f\xe3\xbd{hF\xba\x8b\x05Z=\xda\x0c\x90\xbd\x14\xe3\x99\xbc8\xfd9\xbd\x08@\x94=%\xca\xaf\xbd\xcc\xa9\x05\xbeR\xb0\xa9<\xecUQ\xbd\xe7OK\xbd 6q=\xe1U\x0b\xbe\xb3\x80\xb7<g\xd7\x16>\\~-=%\x9bY=\xacs\x06>5\x02u=\x98\xab\xbd\xbcR\x1dl\xbbJ&\xac=\xa3t\xdf\xbd\xb77{\xbd\xa2e*\xbc[q,>\x111\x05=\xea\xe5\xbc<\xf15<>\xe3\xcb\xd8\xba&C3>\x15\xfc\x90\xbd|\x06\xd1\xbb\xe6\x12M\xbe\xf5z\xb5=\xf4I{\xbc\xadr?\xbd2\xf1f\xbe\xa0\x19<\xbe\x1e\xb9\xca=\x82\x14\x83=Nr\x08<\xd7\x10\xfd\xbd\xdf\xc0\xda\xbci\xed\xbf=\x9b\xef\xd7\xbd\xc1\xcd\x9e=\xc4n\xaf\xbd\xfc\xa1\x92\xbd\xa2\xdcb\xbe\xe9Y\x0c\xbe.s<\xbc"\xcfb\xbd\xf6>\x90\xbd\xa6\xb2\xb5=\xfc\xeb\xbe=C\x80\x8e=r4\x8c=\xc2Z\xaf=\x0c\r\x00\xbd\x11\xfb\xc6;\xd9{#>j"\xd3\xbdu\xf0\xa2=\xc2\x88m=B\x10\xce=L;\x1c\xbe\xae\xd2U>\x85\x06\x18=\xc4\xe0\x97\xbd^-P=\xd5\x91\xb9\xbd\x88\xb8\xce;7\x7f\x02>\x83\xc7\x03\xbc\xc4\x0f\xb0=T\xa6\xe3=M{\xa0=\xf7\xf7\xc2\xbc,\x87\xa4<\xfd\xc3\x02>\xc0\x02\x7f=\x07\x8e\x88=\x9c\xc0k>\xad\x8c\xe3\xbdr\xc0u;\x99i\x1d=!kF=\xb4!\xb7\xbbE\x92e\xbd\xcah\xe2=\xddy\x80=\xf6i\xa6=\x8e\x88\xed;\x9c\t\xd2<\x93o\x12\xbe\xc7\xd6\xf6=\xc8@\xb2<4b\x16=T\x95f>\xf4\xd7\n=R\x0f\x1e\xbc\'\x80\x0f\xbd\xb4\xdf9\xbd\xcf\xba\xca=U\x01X\xbd\xd0/=\xbbD\x11\xc3<\xadt\x8c=r\x11J\xbbS\xaf\xc8<\xee\x1f\xc8<\x0c\xfaU<\xe8\xe0\xdb;)\xf22=\xf3\x8d\xb9\xbc@\xdd)\xbc\x1b\x04\xc6\xbb\x02vb=o^\xb8\xbd\xe0\xfb\x12>\xe5b\x07<G\xb4\xfd\xbdv{\n>\xa6\xc2\x12<z-\xb6=!R!>^\xeb\x93\xbdD\xe6\x11\xbb4\xa7\x08\xbd\x7fk\xad\xbd\xa6g\x04>\xefQ\x07>\x97\xf8%\xbc\x80\x84\x14>Vib\xbd\xa4\x07D=\xc4\x9e\xdd<\xb3\x13\x0c\xbe\xac"@=|\xa0\xe2\xbd\xb9\xce+\xbe\xb0\xd8\xba\xbd\xb3v\xc1\xbc\xc2\x8fB\xbd\xa6T0\xbe\x9e\xb2\n>u\xbe\xed\xbcWIe\xbd\xd5\xc3`\xbc4\x93\xf3\xbd\xa2B\xdd\xbc\xb5\x1eZ>\xe0B8<\xdd0\xd8;0\xdd6\xbeZ7#\xbe\xdc"\x82\xbc;\xd3E=M{\x19>\x9c\x13\x02=\xd1\x8e\xbd\xbd\xc7\xcf5\xbd\x07[\x0e>\xdd|\x95;\x07\x90{=d\xff\xbe<\xa8Z\x0f>\xe2\x9b\xd1\xbd\xea\xa7\xb3=s\x92$\xbc\xc3B\x8a=\xc90\xce=\xde\xc69>Xa+>$?\x88=\xb5\x02%=\x93/K=g%T='
-p274
-tp275
-bsV580365060213723136
-p276
-g2
-(g3
-(I0
-tp277
-g5
-tp278
-Rp279
-(I1
-(I200
-tp280
-g12
-I00
-S'\x1f\x17g>im\x0f\xbdA\xf5\xa1\xbe\xb6\xb9\xbb=\xcc\x97L>\x94\xc1-\xbd\\\x06\xd3\xbd\x9d\x1b=\xbe\xb4p\x89\xbd\xd1\xf6\x17>\xe1%\x83=\xce\x89\xb2\xbd\xa9*\x0e>Jg\xd2=\x89\xf2\xc3\xbd\x9fh\x88>f\xa9\x02\xbd\x11\x1a\xd0\xbd\x10\x96\xaa\xbd\x86\xc7B<\xf9\x8db\xbe\x89|\x0c\xbd\xac\xe2\xe5=\x9f>C\xbe\xbc\x02C\xbdu,\x98\xbd\xc6m\xdc=\xe9\xb49\xbe\x8aBm\xbe\x17\xa5\x84=\xed\xa2\xfc\xbd\x7f\xc1\x00\xbe\x82\xcb\x1e>\xc7\xd7z\xbe\x9c\xa9\x07=\xc7\x13\x9b>=L\x04<\x93E\x00>\xcd\xb1|>\xeaA\x13>\xa0\x97j\xbbL\xb2a=,\x057>\xd0\'~\xbed\xa4\x05\xbe\\=7\xbc\xf9^\xa3>\xb02~=\n\xb4Z=\xeaw\xa9>\xb1&\xd0;\x97\xca\xb4>T\xf5\t\xbe<.\x94\xbc`\xfe\xbf\xbe\xb9C=>\xafK[\xbd\xf9\xba\xff\xbd\xa4\xff\xc3\xbe\xa9\xbc\xb2\xbe@D;>$\r\x1d={\x94\xa0\xbc\xdeK\x8e\xbe=e\x8c\xbdgZY>\x94\x062\xbe_[\x8f=Q\x08_\xbe\xa7\xd6\x18\xbe\xda\xaa\xf0\xbet-\x8e\xbeZ\x06\xb3\xbc\x16\x8c\xe7\xbd\x8c6\x1c\xbe\xb6\x0e_>\xd9\x01M>z\xbf\xfe=%\x9c\x16>\xc9  >\xe4u\xba\xbd#7\x90</\xa8\x99>\x81\x8e?\xbe\xe0\xc4\x16>%\x8a\x12>9\xc7U>\xbcQ\xab\xbeI"\xd6>\x96O\xaa=\xd1\x92\xe2\xbd\xa6\xdb\xb1=W\xc5)\xbel\xab,=\xe0\x03b>{\xfa\xab\xbb\x10\xcd\x18>\xe9\x8eB>}W\x18>\xdf\x82\xc2\xbc\x99\ri=\xc7_\x8f>\xfd\x15\xfe=\xc4\n\x0b>\x9d\xf7\xfc>\xb7\xe4Q\xbe\xa3\xeb\xb9\xbc4Q/=i\xe8\xfb=\xf7\xee8;\x11\x1f1\xbd\xf7\x0f\x86>\x81\x96\x13>\x00\x86#>\xe1\xf4N\xbb\x17\x1eL=\xfe\'\x8c\xbe*\xcb\x80>#\x87Q=\x1a\x86\xae=\xa7\xf0\xe4>\n\xfb\xdf<\xecj,\xbd\xdcT\x94\xbd\x99)\xf2\xbdPc;>\x07#\xd6\xbdd\xcb\xfe\xbb72_=~\xfd!>\x19:\x84;\xe41D=\xda\x85M=\x9c\x10-=\xe3\xa1%\xba\xf9\t\xac=\x86\x19\xd8\xbc\n\xa0\x8c\xbc=\xaa\xe5<\xfc\xef\x15>!ZH\xbe\xb2\x86\x97>\x13\xfd\t\xbdy\x82n\xbe\xd7=s>u\x06\x06\xbdOU>>1\x16\x8e>\x8f\xe7\xef\xbd\xef\xae\xad\xbc\x07\xac\xf6\xbc\x97\xd7!\xbe\xe8\x0c\x85>q\xaf\x8d>\xd0u\x0e<G\xe6\x91>T\xd5\xc0\xbd\x8a\xd8\x93=vQ\xa1=\xf9\xcc\x86\xbe\x16\xd9+>4\xaa_\xbe/\x16\xa2\xbe\xf1\xba(\xbe\xecy\x86\xbd\xcdW\xed\xbdC\x10\x99\xbeo\n\x95>\xb1;\x81\xbd\x08\xf6\x00\xbe\x80c0\xbd\xf9\\\x83\xbei\xa6=\xbdQ\xf2\xd0>\x0c\x08C\xbb\xa0\x0f\x84;.\x86\xb3\xbe\xa4R\x99\xbe\x8b\x1d\xb3\xbd\x10\x1f\xab=\x9c\xef\x9a>\xb7\x87(=A\xf2\x1f\xbeC\xf5z\xbd\x81\x8ey>h7/=\x9a\x9d\xfa=\'\x84\xb8<T\xb0\x95>\x9f\xf9m\xbe/08>!\xde\n\xbd\xf4\xbb\x1d>\xb7\x1ag>4\xdc\xa9>\xb0\xf9\x9f>\x8b0,><\xe0\xb7=\x1d\x0e\xd2=\xa9\x85\xc3='
-p281
-tp282
-bsV580397555315523584
-p283
-g2
-(g3
-(I0
-tp284
-g5
-tp285
-Rp286
-(I1
-(I200
-tp287
-g12
-I00
-S'\xb0\xb0\xf6\xbc!\x00J\xbd\xcf\xd2\xb7\xbe\xf3\x91\xcc>\x16\xbc,=\xdd$<>\xe5`\xd0\xbem\xe4\xa0\xbd\x86j\x83\xbc\xc43\xa8>T\xdb\x14=o-\x19\xbfA*\x0c>\xd8\xc7\xc6=\xbf\x8eU\xbb\x01\xd4\x81>\xe5*\x9b\xbd8\xd6\xbe\xbe\xc0] >q\xdaB>\x9aD\x12\xbf\'\xc1\xa2\xbd\xb1\x90\xb5=Ih\xc0\xbd/\xc2\x19\xbeH\x7f\x8c<h\x91N<\x12iT\xbdp0\xfd\xbe1\xf1;\xbe\xc3\x0e\xbb\xbea\xe4E\xbe3\x10\xa4>~\xe2\xb4\xbe\xa7\xc3P=\xa8k8?\xf6R\xbf\xbe\x16B\x83=\x90U9> \x84\x08?\x08\x88\x04>%6\xf9>@\\E>\xdc\xf6\xef\xbe\xc7\x82\x86\xbeA\x9c\xb8;\x99\x0f\xa8><o\x9b>\x1a\x9a\xf7=a\xbd\xc2>?(\x9e\xbd\xcf\x9d\xfa>\xd4G\x99\xbe\xbaL{\xbe\xf7\x81\x12\xbf\xea\x0e\xbf>\x1f\xb8p\xbeX/I\xbe\xdd\x02\xd1\xbe\xeb\x1a\xbb\xbeWj\xca>>\x9a\x8d\xbd\xaaa&\xbe\xf9\xa6)\xbf\xd6j\x9c\xbee\xa3\xd3>\xe1\xa1\xbe\xbe>\x8d!\xbe\nx\xc5\xbeV\x8f\xd7\xbeXe\x02\xbf|\xdb\n\xbfu\x12\x0c\xbe\x0c\xcef\xbe\xd2:\xcc\xbe|\x1a\xff>\x8b\x1b\xec>\'\xbc\x1f>\xa2Y\xb7>M\xba}=\xdfh!\xbe\xfe\xfd\x93\xbc%\xfe\x17?_F\xa2\xbe\x1f\xac\x90=\xeec\x98>1\tX\xbd1\x17\x0f\xbf\xec8\xf8>\xe1\xbf\x94>)\xe5\xe6<\xdd[\x19\xbd\xdd\xb7g>\xcc|V=\xf3\xd8\xd0<\n\xd9\x85\xbe\xb8m\xe5=t\x91\x90<\xb3\xbf\xac>\xd1\x1cZ>\xe7\xcdG\xbd@\n\xb2>\xa2\xe6=>E\xa9X>G\xcd\x90?\x15~\xb6\xbe\x12K_\xbeX\xefl\xbc?k\x06?/d\x0f\xbej\x03Z=&\xae\x04?\xb1<1>B\x0e\xd3>a\xb5\xd6=\xd02H>\x08\x7f\xd7\xbe`\xeav>\xbcIV=\xe0.\x02>\xf3\xde.?:@\x86\xbe6&\x10\xbe\xb9\x18\xbb\xbe\x1c\xfc\x07\xbf\x10;u>\x08\xcau\xbcp\xfb\x1c\xbe\x12k\xfa=\xc0\xb2\xf0>\xd2,X\xbe+\xb2P\xbe!\xf8\xef\xbd \xcc\x03>\x1e\xb0\x04\xbf\x19\xe3\xed=O9@=\xd8\x84\x00\xbe\x8fj\xb1=mB\x0f?\xc6i\xe4\xbe\xa6[\x00?`^\x00\xbe\xd2\x9aX\xbe\xbd\xe4\xec>0X\x01>\x18`\x00?\xeb\xa5\xfa>j)1\xbeyrX\xbe\xdd\xe3\x82\xbe=\x92\xab\xbe\xd0\xc2\x16?m\x1aK?!i.\xbe3o\xb0>9,;\xbe]\x9cV<\x04J\xc3=\xd4x0\xbf\xf0\xb0\x0c?p5\x8b\xbe\x89\x00\x06\xbf\xf6\x80\xb5\xbeILg\xbe\'X\xb1\xbe\x152\xb9\xbe\xe7\x92\x12?\xad/\x85\xbe\x85\x10\xc6\xbe\xdbN\x93\xbe\xab\xda%\xbf\xcc\x97`\xbe\x8e\xac\x14?\x9f\x99%\xbe\xe0\x11d=\xeb\xc6J\xbf\xe4\xb6\xdd\xbe\x17\x14D\xbf}\xc5(=\xeay\xda>\xa4\x10\x1a>Y\xec\xab\xbeE\x0c\xb6\xbe\xb5\xa7\r?\xaf,\x0f>\xb3V\xcd\xbd\xd8u\x04\xbdmf4?zx\x1a\xbf\xd9h\xb9=\x84\xe0\xf9\xbe\xa3\xb3\xc6>\x93\xec\xc6>\xe9\xe2\xdd>\xe5\x1f/?\x00"G?"\xce=>\xc8p\xd0>eD\xa2\xbd'
-p288
-tp289
-bsV580217485456248833
-p290
-g2
-(g3
-(I0
-tp291
-g5
-tp292
-Rp293
-(I1
-(I200
-tp294
-g12
-I00
-S"\xd6\xab\x08=\xa5\xe6\xdf\xbdnn\n\xbf8\xdc\xed>\xf9\x9d\xfb=,o(>8\xe1\xf9\xbe%\x8a\x1b\xbe\x1c\xe2e\xbd\x10\x03\xd1>G>\xa6=\xee\xd3*\xbfN\x82}>\x84\xce\x19>%\xe1g\xbd\xd6p\xb7> \xb4\xb0\xbd\n\xdc\xe1\xbei\x84%>\x12\xc5{>r\xb9A\xbf3S\xe0\xbd\xdc\x98\x06>\xdaqo\xbe\x95\x1d9\xbeF#\x04\xbd\x89\xb3\x8c=\x8c:'\xberX&\xbf\xdbo\x11\xbe\x10\x18\xd6\xbe\xe1\xf3\x82\xbeP\x10\xe0>\x06\xdd\xf9\xbe\n\x82-=\x94\xdeh?0P\xe6\xbe9\x9d\xf4=rR\x99>\xaa\xe7$?O/,>\xb9\x8b\x1d?G\x86\x9d>K\xb9'\xbf\xba=\xa6\xbe\x89/M<\x0c\x07\xf1>\x8b\x84\xa6>\xb9\xf7\x17>B\x11\x08?\xb2?\x84\xbd\x01<3?\xd9\x82\xcc\xbe\xd3\x03\x8f\xbe}\x1bF\xbfLq\x07?\x9b\xfc\x90\xbeTl\x96\xbe\xc2\xa5\x13\xbf+\x9b\x0f\xbf\x02\x90\n?\xb9P\x04\xbe\xe6\x87u\xbe\x01\xd0a\xbf\xff\x13\xc3\xbezV\x17?\x956\xf3\xbe\x8d\xd97\xbe\xbfq\x12\xbf\xac\xf3\x01\xbf\x82\xfe?\xbfl16\xbf\xfe[\x07\xbe\xa0\xb1\x9c\xbe\xa0\xe8\x01\xbf\x1f\xc9+?H}#?\xa8+O>\x08n\xe2>\xdb\xc8\x0b>\xb7\x81n\xbesDR<\xb3\xb6H?#|\xda\xbeP'\x0e>)\x93\xc5>\x112\x17=)\xa9E\xbf\xbb\x076?D\x93\xc9>\xf7%\xb3;<\x03\xd4\xbcZ\xcdA>*\xf2\xd6=\x1c\x89\xfb=\x8f\xa2\x99\xbe\xbf[\x1d>\x8f\x07\xde=A\xa3\xe1>1\x98\x82>)\x88\xb9\xbcQ\x88\x05?\x8a!\x86>\xd1~\x90>\x9b\xea\xba?\xef\xfe\xec\xbe|$\x83\xbe \t\x15\xbd\x9b\xdc\x1f?<\xa0%\xbe\xf9[\xe3=\x96\xf36?\x166W>\xdc:\x03?\xdeZ\xc0=\x85\x08q>\xef\x03\x13\xbfn\xe2\xc4>\xc9X\xae=\x8e\xe8E>M\xbcv?\x85o\x9c\xbe\xac.*\xbe&\xc9\xe8\xbe\xe9\xea \xbf\xd2\xe5\xb8>\xf8\xc9$\xbd\xba!9\xbe\xbd\x15\x14>\xb4\xfe\x12?\xa9Vg\xbe\xc63r\xbe\xcbL\xf5\xbdGv(>!n\x11\xbf7nD>\x9e\x80T=L\x06\x0e\xbe\x84\x880>\xd7\\4?\x9dj\x10\xbfM<5?N\x0eK\xbe\xa6=\xa4\xbe\xd6\xaf\x18?\xf1\xf4\xc8=\x03\x1b+?`\xc1\x1b?\xf9\x84n\xbe/\x81\x89\xbe\x84C\xa8\xbe+\x9b\xef\xbe\xe4\x14B?\x17\x8a\x83?\xed\xfe.\xbe?\xa1\x01?\xa6po\xbe\xf7\xb4\x05=\xfa%\x02>8\xcb_\xbf'\x9f;?\xa9\x8d\xc2\xbeS\r5\xbf\x01\xea\xed\xbe\xf3>\x9e\xbe#\xe1\xea\xbe\xa34\x0c\xbf\x8a\x9d@?\x88\xd3\xb1\xbeJ\xd3\xf6\xbe/\xb9\xa5\xbe\x7f9S\xbf\x88Os\xbe\xe1\xd1T?\xb84>\xbe\x86m\x05= \xcb\x83\xbf9\x0e\x15\xbf\xae>m\xbf '\x8d=^;\x1b?ACE>\xc6\x14\xda\xbe\x10l\xd5\xbe\n\x82+?A\xb6;>\xd9.Y\xbd\xee&\xa9\xbc\xe1\x9dh?m,F\xbf3n#>\x1df\x0e\xbfX\xb7\x00?\xbfI\x04?\x13#\x19?\x00Ve?\xbc\x85s?\x0f\ne>D^\xf2>G\xa7\x93\xbc"
-p295
-tp296
-bsV580184398223421440
-p297
-g2
-(g3
-(I0
-tp298
-g5
-tp299
-Rp300
-(I1
-(I200
-tp301
-g12
-I00
-S'\xad\xd2\x04\xbd\xdd\x87\xa3\xbd\xdd\xf7\x00\xbfFq\x07?w\xccr=E\x85k>l\xd3\n\xbf\xe4\xaa\xea\xbdo\xca\xcd\xbc]\xf7\xde>w\x1c\x82=\xf0,I\xbf\xa9\xf4\\>y\x1e\x14>\x97\xfd\x82\xbc\x97*\xab>\'\xb0\xce\xbd\x03\xdd\xfa\xbe\xc7lU>\xb4\xa6\x85>)\xa8G\xbfs\xff\xea\xbd\xd9\xfc\xf9=\xb9\x0b!\xbe\x08\x0eI\xbe\xa7\xcc\x81;\x8d\xc6\xc5<\x05\xce\xc3\xbdD\x08,\xbf\x17ba\xbe\x13\x1d\xf6\xbe]\x00\x88\xbe\x17\xca\xe3>E$\xf7\xbe\x07,]=)\x13x?\x90Z\x05\xbfx\x9b\xb7=%f\x84>\x9d\x8d7?\x91\xdfC>[\xf5*?:\xcd\x8b>I`(\xbf\t\x04\xb2\xbe\x03C\xc0;<\x0f\xe7>4\x8d\xc6>\xd9\xc5#>2\xce\x03?\xc1\x83\xcc\xbd\x1b5.?#^\xcf\xbe\x95;\xa6\xbeT\xb8E\xbf\x84\xba\x04?\xf4\x9a\xa0\xbe$\x04\x8c\xbe\xbaM\x0f\xbf\x01\xd0\x04\xbf\x89\xe4\x0c?8\x84\xf6\xbd\x8c\x82u\xbe\xbc\x85h\xbf\x19.\xd6\xbeY\x1a\x15?j\xfb\x00\xbf\xc8*i\xbe\x87\xd8\r\xbf\xd9\xd7\x0e\xbf\xe7\x047\xbf\x0f\x02=\xbf\xb8\xc8*\xbe?\xe4\xa0\xbeG\x96\n\xbfGO.?\xf64"?\xe5\x9fS>\x0b\xa6\xf4>\xbd,\xc9=\x08)o\xbe\x9f\xbbM\xbc\xb15S?4\x85\xdc\xbe\xdd4\xe0=\xa8\x07\xd1>1d\'\xbd\xd3\xf9E\xbf\xb4\xb9,?\x0f\xc7\xce>Lb\xd7<y\xc4e\xbdK\xf6\x90>\xe8\x9e\xbe=w\xb5W=\xff\x84\xb0\xbe.\xe7\x17>0(-=\xb1\xa6\xe9>oj\x95>\xc9)`\xbd\xac\xc2\xfb>l\xa7\x88>\xc3\x96\x91>\xd8`\xc3?\xe1\xa5\xf1\xbe\x848\x96\xbe\x00-\xfa\xbc\x98\x084?\xa3dE\xbe\xfb\xf7\xd0=+\x957?\xa8\xafd>39\x0c?\xffR\x04>%\x16\x84>\xfcz\x11\xbf\x9c5\xb2>\x19\xf0\x96=\xbc\xca:>\x89\xc3q?\xcf\xeb\xb1\xbe|!@\xbe[\x04\xfd\xbe\xa0\xeb6\xbf\x16$\xaa>\\\x01%\xbc#\xd8V\xbe\x02\x10(>6\x84!?\xf9\x91\x8b\xbeA\xdf\x8c\xbe\xa8r%\xbeA\xbd2>\xc3\xe3/\xbf\x18:5>\xad,x=\xc7\x08,\xbe\xdbe\x0c>\x85\xf1D?r\xea\x1b\xbf\x03\x050?E\xf2E\xbe9\xde\x97\xbe\xf0\x06\x1d?\x8b.\x18>\x95=2?k\xe6$?\xc42k\xbe<\xb8\x97\xbe\xf1\xc1\xb7\xbe#E\xee\xbe\x14\xc5N?\xe6%\x8b?\xf4!_\xbe\xf5w\xf7>\xd4\x1ew\xbe\xfb.t<KV\x00>O\x90n\xbfq\xf6A?\xcb%\xbf\xbe\x04~7\xbf-!\xf7\xbeSf\xa4\xbe\xed\x0b\xf6\xbe?\xec\x02\xbf\xc5\xe2F?\xef\xd3\xba\xbe\xc4\xaa\x05\xbfU\x9a\xc1\xbe\xb3Ga\xbf\xfbW\x8e\xbe\x14\x89N?\x9d\xcd[\xbeu\x12[=u\x93\x8a\xbf\xcd\x89\x17\xbf\xd3\xbe\x85\xbf\x17\xadU=\x85\x8d\x19?9\xadJ>M^\xe7\xbe\xddR\xf5\xbe\xf5\xc58?8OM>\xd1\xae\xfc\xbd\xbeX\x12\xbd\xbd\xe9t?t_R\xbf,\x19\x08>\\\xab%\xbf$\x96\t?\xa8@\x08?\x15\r\x1a?\xd5<n?Mp\x86?\x1d\xd1}>\xfa\xb3\n?\xc1/\xa2\xbd'
-p302
-tp303
-bsV590424820434755584
-p304
-g2
-(g3
-(I0
-tp305
-g5
-tp306
-Rp307
-(I1
-(I200
-tp308
-g12
-I00
-S'2H"\xbd\xd2w\x99\xbd\x11\x96\xe1\xbe/6\xe6>E\x7f_=\xc1\xfdP>\xfdm\xef\xbe\x83N\xa6\xbd\x03&\x8a\xbc\xf9\xde\xbe>\xc0\xbej=\xae\n,\xbf\x06\x83F>\xa0\xaf\xf9=\xc8\xcf\x8e\xbc\xf5q\x8c>\xa5\xed\xa2\xbd\x16\x11\xdb\xbe\x90rA>\x1f)v>w\x96-\xbfSp\xbf\xbd8\xd4\xbf=\xab\xd0\x13\xbe}\xdb-\xbe\x93e\x12;\x13\x89\xa1<\xf6|\xbd\xbd\n\\\x14\xbfF\xf6;\xbeoq\xcb\xbe\xc9.g\xbe\x88\xc9\xc6>\xd5O\xd4\xbe\xdd8\x14=0\xbbS?\xf7\xbd\xec\xbe\xedX\x97=I\x87X>\x8b\xb6 ?\xab\x8b8>a\xd3\x1a?\xe1E|>k2\x15\xbf\x9dX\x96\xbe\x85\x04\x8a<\xaa\n\xc7>]\xfe\xa4>\xf7"\x04>\xbd`\xdf>XG\x9d\xbd\x19\x8c\x18?R\xca\xba\xbePI\x8d\xbeK\x8b*\xbf\x17\xe9\xed>~\x0e\x8c\xbe\x98Jw\xbe\xe0R\xf2\xbe.F\xe4\xbe\xaf\x9f\xfe>\xe0A\xff\xbd\xb0Je\xbe\xca\x99J\xbf\x93\x1c\xb9\xbeG#\x03?\x1bz\xe0\xbe\x9d\x80N\xbe\x93A\xfe\xbe\x02\xb8\xf1\xbe\xe6<\x1b\xbf\x1fu!\xbfz&\x08\xbe\x03\xda\x8b\xbe\xf82\xf6\xbe%\xfa\x17?\x90\x08\r?\xeeO6>"]\xcb>\xd7f\x9f=\x88\xf2W\xbe\xbb@\x97\xbcjA6?\x13\xa5\xb8\xbe\xb6\xb9\xb8=\x86\xa5\xb5>\xe0w\x01\xbd\xd5S*\xbf\xdc\xe4\x11?\x8b\xf6\xbe>\xca\xb9\t=\x91iW\xbd\x8d\xb3v>\xaf\x9f\xaf=\xe7\x191=k\x85\x9a\xbe\x86\xc7\xbe=~a\xfe<\x11a\xc7>\'j\x86>\x92\xe5;\xbd\xc8\x1a\xd8>J\xd6d>?2w>\t\xa5\xa7?\xaf\x8f\xce\xbe\xd3\xdfz\xbe\xf7\x17*\xbd\xa8\xae\x19?\xd7q3\xbe\xf1"\xd2=\x83\xae\x1f?\x0e\xb07>G\xed\xf2>\x1b\xff\xde=\x97?Z>o\xe9\xf5\xbe\x98\xe1\x99>\x89\x8e\x87=2g!>=HP?\xb3\xcf\xa7\xbe\xd8]\'\xbe>\xf2\xd7\xbe\xb0-\x1c\xbf\x02(\x91>c\xea\xe8\xbb6\x837\xbe\x14\x15\n>\xd7\xef\x07?p\x0en\xbe\x17\x8d\x83\xbe\x81\xd8\x18\xbe2\xfb\x1a>\xc2\xc3\x17\xbf\x9b\xd9\x19>\x1e+\x88=\xfa\xdc\x10\xbe"\xa8\x16>\xe7\x88*?\xbd&\x02\xbf\x16\xc0\x18?\x17\xc2,\xbe\xe2)y\xbe)"\x06?k\x95\x03>\xf2\xd5\x1b?3\t\x07?"\xf7Q\xbei.\x8f\xbez\xfd\xa0\xbe\x83\xef\xce\xbe\n\x87/?\xf2;p?\xceEE\xbe-\xa9\xd4>\xfe=P\xbe\xe3d\x1f<\xee\x94\xd5=K\xc0N\xbf\x7fx.?*\xcc\x9e\xbec\x80\x18\xbf\xcfj\xd6\xbe\xf1\xe9\x8d\xbe2K\xe0\xbe\x05\xb9\xe3\xbe\xf5\x8b+?\xe3s\xa5\xbe\xb9\xfe\xe3\xbe\x92H\xa0\xbe\x9f\x07?\xbf~\x11p\xbeA\xe96?\xe0\xcb7\xbeX\xd6!=\x9dam\xbf\xe9V\x01\xbf\xdf\x9bk\xbf\xfc\xf9\r=\xff\xa5\x01?\xf6I1>F\x0e\xc5\xbe\x0f\x00\xda\xbe\x8e\xc3\x18?\xf6\xc1%>\xd7l\xea\xbdY"\x17\xbd\xd6\x81T?a56\xbfB\xbf\xda=\xed\xf3\x12\xbf\xc6Q\xf4>K.\xe9>\n\x07\x00?\xcf@N?\x8f\xc0h?\x8a\xc0]>\xb0\xdf\xe9>\xe6\xa3-\xbd'
-p309
-tp310
-bsV581002453660782593
-p311
-g2
-(g3
-(I0
-tp312
-g5
-tp313
-Rp314
-(I1
-(I200
-tp315
-g12
-I00
-S'\xc9\x05+>\xfd\x83\x8a<Q\x94\x1f\xbe\xaa\x8f\x98<Jr\xbe="\xa8\xf4<\x82\xcdo\xbd\xbb\x1c\xca\xbd\x86\x9f\xa4\xbc\xfd\xdd\x0c>j\x9f\t<\xd2\xe0\xa0\xbd\x9a+\x80=-z\xcc<\xd2\xcd\xcb\xbc\xbb\xa9*>-\xca<\xbd.f\x9f\xbd{j\x84\xbd\x9eC\xcc\xbc^\x13\xee\xbd]\x10\xde;\r{\x8a=F\xa6\x9f\xbc"\xba^\xbc\xc6:=\xbdB\xb1~=v\x07\x8d\xbd`e\x10\xbe\x1b\xbeI\xbcZ\x0e\x88\xbd#\xadQ\xbd\x95\xebb=\x10\x03\x1e\xbe\x8e\xf7H=\xfe\xdc&>#\xcb{=\x8e>d=\x86\xc4\x05>\xc3E\x95=6Q\xf4\xbc\xc2\x89\x8d\xbc\xa8R\xa4=\x10\xd4\xe5\xbd\x0b~\x87\xbd\xf6\xc4\'\xba\x94\xfcB>\x93\xc1R=\xafP\x87<\x98\xc9Y>R\x87\xef\xbcbc<>\x15\xb1\xa1\xbd\xc7M\x07\xbc\xdb\xc3m\xbenz\x9d=Z\xaf_\xbc=M\x93\xbc\xda\x80\x8c\xbe\x0bdK\xbe\xce\xa8\xd2=\xd39\xde=c\xe3\x17=5\xba\x04\xbe5\xecC\xbd\xc0i\xba=~6\xf6\xbd\x952\xf1=\xf5\xebR\xbdC7\xc9\xbd\x1a8e\xbe2\x03\x1f\xbeG\x1d?\xbdW6\x84\xbd\x0e\x00\xa3\xbd\x9ez\x9f=V6s=\xba\xdf\xaf=\xd6M\xc1=\xb6Y\x90=\x8a\x0e\xd5\xbc=\xd7~\xbb0\xbd=>\x98\x1a\x05\xbe-\x91\xb3=\xddG\x85=\x83\xcb\xce=\xdbQ\x12\xbe\x0e\xdab>5\xd3\xf6<\xa2&\xa6\xbd\xad{F=~2\x9d\xbd%\xc1O\xbcPw\x01>\xee\x86\xb1\xbc\x13D\xe1=v\x17\xee=]\xb9\xaa=8U>\xbd\x00\n\xf2\xb8\xf0\x9d\xf0=\xce\xcd\x9d=RG\x8a=\xc3%\x8c>J\xac\xe1\xbdf\x9c:\xb9\xde\xce\x80=\xbda[=jA\xc2\xbck\x08\xe6\xbd>:\xe1=\xb3\xf2\xa3=\xe5P\xce=(s\xca<\x8d\x03\xb5<\x19\x0f\x17\xbe\x02s\xf2=\x14w\t=X\x8d\x04=\x05!e>\x1e\xc1V=\xf7\xc5(\xbc\x00L\x18\xbd\xce\xa8\x86\xbdu9\xd0=\xae)5\xbd\x8b\x16\xa5<&\xbe\xc8<\xf3O\xaa=\x16\x1d\xa4\xbb\xe6k\xbc<n\x16\x05<\xe2T\xc5;\xd1\x98\xc9\xbc\x8e\x05\xe7<\x02\x97\xd7\xbca\xe2\x9c\xbc&\x108\xbd\xb2\x07a=f\xc8\xd0\xbd\x0b\xab\x0f>\x98\x91\n=c\xe3\x05\xbe2\xe20>\x92\x13/=\xbf\xf9\xa9=\x0f\x0bG>P\xd9\x90\xbdj\xd27\xbc \xbb.\xbd\xceu\xbd\xbd\x85H\x16>b\xe8\x06>>b\xe7\xbc\xc3\xcb\r>\x00\x17\x8d\xbd\xf7\x8fG=\x15\xcb\xcd<\xdd\x846\xbe\xbb\x14\x9e<\xf0\n\xf1\xbd\xc5\x0fO\xbev\xc6\xda\xbd\xa3\xea \xbc\x90\n>\xbd\x0b#*\xbeh\x9a&>\xadX2\xbc"P\xa7\xbd\xfeR\x1e\xbd\x03\xac\r\xbex)\x82\xbd\xfa\xafr> j\xff;\x19a\x91<\x80dY\xbe\x80(P\xbe~\xec\xa9\xbc=\xea\x81=6\x19!>_\xe4\xad<\xf5R\xdd\xbd\xcb\'\x8c\xbdM\xa67>\xe69T<#JT=f\xf8\x82<\xed\xef!>\xe6\x8b\xef\xbd\xa0U\xae=H\xce\xd0\xbc\xd8\xf1\x94=P\xf9\xfc=\x90\x86_>\xbarP>\x1d\x9ff=\xa2\xc04=H\x9f\x91=\x17\xbb<='
-p316
-tp317
-bsV582839782859874305
-p318
-g2
-(g3
-(I0
-tp319
-g5
-tp320
-Rp321
-(I1
-(I200
-tp322
-g12
-I00
-S'\xdf\xb7\x8c=\xcb\xa4H\xbd\x8e\xb1\xaa\xbe\xd9\x92i>\xc7\xb4\xd5=\x08\xfc\x92=\x9e\xf5\x7f\xbe\xbb\x96\xde\xbd9W\t\xbd2\xcbj>\xa1\x8aJ=\xb1\x8d\xa7\xbe\x9a\xb7\x13>M\xd0\xa8=\xba<<\xbd4\xfai>\xb5\xf8T\xbdb\xf5j\xbe\x88yU=\xa7\x03\xee=\x98\x1a\xd1\xbe\x00me\xbd\t=\xb7=\xc8c\x18\xbe\xe8w\xca\xbd\xd4\x9a\xf6\xbc)\xd9~=\'G\xeb\xbd\xd7\xd3\xb5\xbeM\xb4Z\xbdz\xdaX\xbeG\xe4\x12\xbeL\xd6q>\xe3\xac\x91\xbe\xa7\xb3\xe9<PS\xfd>\xa5\xf9N\xbe\x1a\x98\xa3=\xfc\xcdJ>\xba\x96\xac>iU\x9b=\x8a\xff\x98>\xb7\\;>\xe0\x9f\xb8\xbe$\x953\xbez\xcf\x1c;\x1a|\x98>\xc4\x18*>\xe6>\x9d=;\xce\xa6>R\xec\x00\xbd\x9bv\xd2>\xe7\xbd_\xbe\xc4?\x05\xbei\xb8\xe6\xbe\x8d\xd5\x93>\x97A\x07\xbeX\x9d!\xbeO\x05\xbc\xbe\x01\xc2\xad\xbexe\x9b>\xdag\x0e\xbd\xbb\x05\xf8\xbd\x80C\xec\xbe\x01\xfcD\xbez\xf7\xa3>\xf2I\x8b\xbe%\x83v\xbdr\xe7\xa2\xbe\xcb"\x86\xbe\xee\xe8\xe9\xbe\xcf\xf6\xca\xbe\xfdB\x87\xbd\x02\x9c\'\xbe\rz\x8e\xbe\xed\xea\xb5>\xe1\xa7\xae>\xb4,\x00>\x00\nn>\xc1\x87\xc5=\xcc:\x04\xbe\x04#\xc0\xba,+\xdf>\xfe\xebz\xbe\xad\xac\xc9=\x1c\xa2Y>\xccd\x7f=l\xce\xdb\xbe\xd0)\xd8>\x90XT>\t\xdc\x0b\xbd\xca\xc8R<*\xb85=\xcc\xfcv=\xfa\xd8\xe0=\xdb\xe7\x0f\xbe\x91\x01\xd9=\xd0\x08\xc8=\x89%n>6\xc4\xe0=\xd7\xbb.:E\xd5\x9a>\x11\xf6\x13>4<#>\xed\x8eG?\x91\xe6\x88\xbe\x1e\x1c\xf4\xbd]w\x04\xbb\xdb\xf9\xa0>\x87=\xa6\xbdk\xd3\xf7<FG\xc5>]\xeb\x03>;)\x8e>\x08\xdaC=4b\xef==U\xa7\xbe\x9e\x1bn>\x93N\x19=\xb7\xea\xe4=@u\x0c?\xc4\xbf\x0c\xbe\xec\xe1\xb9\xbdJ+a\xbe\xed\xcb\xa1\xbe\x93\xa8T>\xbd\xe52\xbd4\xde\xaf\xbd\x18\xed\x91=t\x02\x96>*\x12\xce\xbd\xfd\xe4\xc6\xbd\x9ar^\xbd\x81\x84\xae=0\xb2\x89\xbe<\xcb\xdf=xd\xa1<W\xb2\x8a\xbd\xfa\xda\x99=aU\xb8>\xe9\xb3\x9a\xbe\'x\xc5>\xc4\x89\xb9\xbdd\x1fN\xbe\xcd\x00\xac>\x018[=~\xf2\xb7>\xa4\xd6\xb1>\x05\xda\x10\xbe\x13\x81\n\xbei\xad\'\xbe\xf3\xa1\x80\xbe\x07>\xd3>9\xd3\t?\x0c\xf5\xb4\xbd~\x8e\x9a>D\xfa\x01\xbe5v\x0b=\xb4i\x91=\xc7/\xef\xbe\x18\xb1\xbf>\x8dhb\xbe\xe4p\xc9\xbe\xe3.\x84\xbe|\xde\x1c\xbe\x1bh}\xbe\\\xc5\xa8\xbep\xf8\xd1>q\x812\xbe9\xfc}\xbe5\x8e \xbe\xe6L\xdc\xbe\x195\xf9\xbd\xc9!\xfb>\xc8[\xa6\xbd\x96\xce\x9b<)5\x10\xbf,\xc5\xb0\xbeB\xe8\xe8\xbeDuK=<E\xb2>\x0e\x9e\xcd=Tnv\xbe\xc2\xdbf\xbe\xc1|\xbc>8\x08\xae=\xc7\xb1[\xb9\xd4I)\xbb\xc9\xf8\xf9>\xe7\xc8\xd1\xbe3\x1a\xe2=D\xa1\x8a\xbenm\x8d>\xff\x1a\x99>2\xfa\xb8>\xf91\xff>\xb7{\xf5>o`\x01>>\x7fw>\xab\xc5\x96<'
-p323
-tp324
-bsV580393611675738114
-p325
-g2
-(g3
-(I0
-tp326
-g5
-tp327
-Rp328
-(I1
-(I200
-tp329
-g12
-I00
-S'\xd1S]\xbd\x81b\xa3\xbd\n\xc0\xef\xbe\xbd\xde\x02?\x85g_=\x03\xb9Z>\x14z\x04\xbf\x0ev\xd4\xbd\x99\xb7\x10\xbd\xec\x1b\xcc>\x8a\xa2o=\xc0\xdf>\xbf\xd8\xe4L>\xd1"\r>\xfd\xa1\x94\xbc\xf84\x9b>\xa6,\xb5\xbd\xa3\x17\xf0\xbe\x98GX>\r_\x86>\xdd\xdd>\xbf\xf6\xff\xea\xbd\xaf\x18\xde=\'\x9b"\xbeC~A\xbeH5<<\xcc\x86t<\x03K\xb4\xbd\xc2\x95\x1f\xbfx\xf8V\xbe\xc0e\xe9\xbe\xa8\x0c}\xbe\xc8\xd8\xdc>\xb3\x9a\xe5\xbe\xfcqK=\xe0Yj?SE\x02\xbf\xf0\xa5\xbb=\xa34h>\xa5y.?\x07&=>0\x15(?\xba\xe7\x84>M^\x1f\xbf;a\xa7\xbe\xf1\xad\x8c<\xdfk\xcb>\xd9\xef\xb9>\xea\xca\x18>\xfd\xbd\xee>#\xbf\xbc\xbd\xe2\x0e"?\xeaT\xc4\xbe\xb8\x9c\x9e\xbe\x88$8\xbf\x02\x8b\xfb>\x8eL\x9c\xbe\x8e\xc5\x8a\xbe\xc8\xc9\xfc\xbe3\xc6\xf3\xbe_#\x02?Kb\x15\xbe\xef\x11{\xbe\xe0\x08_\xbf]\xc0\xcb\xbeQ\x82\x0e?\x8d\xfd\xea\xbe\xc3\xbbq\xbe>\xdb\x07\xbf#\xaf\x07\xbf\x05t\'\xbf\x02\xdf0\xbf\x1d\x92%\xbe\xa1-\x96\xbeM\x99\x02\xbfl/(?-\'\x1e?\xddV;>e\x89\xe8>\xf5\xe5\xa5=\xfb\xfa[\xbe\x83`B\xbb\x13/A?w\x16\xcf\xbe\xd8\x15\xbd=\xde\xfb\xc2>\xe2\np\xbd\r\x9e;\xbf\x8e\xf9 ?\xfc\x12\xc6>H\x80Q=\x8aG\x80\xbd,[\x96>\xed\n\xb6=\x91\xd7\x06=h\t\xa8\xbez"\x07>\xb6\r\xd7<\xe2)\xdc>\x07\xe5\x91>xzY\xbd \xc8\xeb>\x82\xb7s>Z\xf8\x88>\x05\x86\xba?\n.\xe3\xbe\x94>\x93\xbe\xca\xf18\xbd\x86T+?|n3\xbe\xbbk\xf0=\xe5\xeb1?\xf5,P>\xae\xf1\x04?`\x9c\xef=\x86\xa5\x80>8\xaf\x08\xbf\xef>\xa5>\xafA\x8d=\xf8{2>\xa7\x9ab?\xa9\xc3\xb5\xbe\x88\xc76\xbe(\x06\xf5\xbe\xff\x1d.\xbf\xc6z\xa2>\xbe\x1b2\xbc\xe4\xe5G\xbe\xc4\xd0\x1a>5\x02\x19?\xa3\xbe\x87\xbe<\xfc\x8b\xbe\xe1\xb1\x1a\xbeo\n->Uo(\xbf\x9d\x88(>\x16=\x7f=:\x85\x1a\xbe\x18C\x19>\x06\x84;?\xe0\x01\x11\xbf\xb7X)?3\xe0K\xbe|x\x86\xbe\xdd?\x15?jM\x07>\xd2\x99\'?5\x94\x18?j\x05R\xbe\xe0\xe8\x90\xbe\x88\x82\xa9\xbe\xf8\xfc\xe2\xbe\xd8\x92A?\xa2\x0c\x84?\x93_L\xbeX\xd9\xe1>G9h\xbe\x9d\xd9\x0c<\x03\xc7\xfa=]g`\xbf\xfb\x02=?\xf5\xff\xaf\xbe\xb8j+\xbf{\xe4\xe9\xbec\x16\x9d\xbe\xf8\xb5\xea\xbe\xaf\x81\xef\xbe\x8bP;?\xbd\x84\xb1\xbe4v\xff\xbe\xff\xcb\xbb\xbeF\xe4U\xbfT\x87\x89\xbe\xf6\xdc>?\x98-^\xbe\xfb\\^=qp\x82\xbf\x1d\x9b\n\xbf\x90\x88\x80\xbf86@=&R\x0f?MLC>\x81\x12\xd6\xbe\xd8I\xe1\xbec\xf9.?\x1e=H>\xf3\xf4\xf2\xbdW\xa40\xbd\xa3^g?\r\x8cH\xbf\xccG\xea=s)\x1f\xbf3S\x00?\xf6\x08\x01?\t\xa9\n?\x0fl`?\xa8x\x80?g\x91e>\xf3Y\x02?\x1e\xb8\xb1\xbd'
-p330
-tp331
-bsV580321740548624386
-p332
-g2
-(g3
-(I0
-tp333
-g5
-tp334
-Rp335
-(I1
-(I200
-tp336
-g12
-I00
-S'\xda\xc1\x18\xbdc2\x8d\xbd\x99\xb2\xdd\xbeb>\xf0>\xad\xbe-==\xb6e>\x19\x9f\xf6\xbe-\xe2\xb9\xbd\xc3F\xc0\xbc6\xa8\xcb>2\xfdQ=\xfa\x937\xbf\x81IA>x\x87\x02>\xe0)\xdf\xbb\xd9\x88\x98>\xf3~\xbd\xbd+Y\xe3\xbe\xa7x?>\xddhi>\xb8:0\xbf\xa2+\xbc\xbd\x83k\xd3=\xb0\xdf\xdc\xbdw\xbf2\xbe\x91J\xdf;Y\xc8G<\x96\xdb\x98\xbd\x1f \x1b\xbf\xe0aU\xbevU\xe1\xbeu\x96m\xbe\xb1\xfe\xc9>\xf1\xf6\xd9\xbe\xb6\xc8g=P\xe8Z?\xc1Q\xea\xbe\xf7n\x87=\xc2\xac_>@R%?\x86\xfd/>7\x06\x15?u\xd2l>oU\x14\xbfz1\x9b\xbe[\xcaB;\xa3\x0c\xcd>\xc7\xce\xb4>\xdb\xee\r>\x89\x0f\xe8>61\xc1\xbd3Y\x18?\xf8)\xb4\xbe\xe9\xa5\x97\xbe-\xb9/\xbf\x0f\xf3\xe8>\x18\xe3\x92\xbee\x96l\xbe\x8eE\x01\xbfh\xd2\xe7\xbeGE\xf8>]\xbc\xbb\xbd\x16\xa3P\xbejpM\xbf\xe9\xfc\xbe\xbe\x15\xc8\x01?9\x91\xe9\xbe\xaa]H\xbe\xe0\xe5\xf2\xbe\xea-\xff\xbe\xe1\xa1\x1e\xbf\xf8%&\xbf\xd0\x1e\x19\xbe=D\x8e\xbe\xfdH\xf4\xbeF\x16\x19?Y\xc8\r?\x82\\A>\x82\'\xd7>*\xe7\xab=\xf60N\xbe\xaeRi\xbc\xf8\x9e>?-\xd9\xc3\xbe\xa2\xeb\xcb=R\xb4\xb8>\xfd1A\xbdi\xbc,\xbf\xd9\x8e\x15?H]\xb6>\xca\xdf\xaf<o1V\xbd1\x01\x87>z\x04\x98=\xb3T1=7\xce\xa0\xbe\xf0\xbc\xfd=\xaf\xde\x05=\x8b7\xce>.U\x85>\x03\x02e\xbd\xf3\x90\xd9>f\x81t>i\xb4\x80>\xff\xbf\xad?-\n\xd6\xbe(\x8a\x82\xbe\xc6\xab\xdc\xbc\x8e\xa1!?\x10b3\xbe\xe3v\xa7=r\xb8!?r\x81E>\xde\x1e\xf8>\xa3\xcc\xf1=N\x06o>\xaer\xfe\xbe}\xa3\x99>\xd0\xf1\x8c=\x93\x87 >\xa5\x93T?g\x1a\x9e\xbe\t7!\xbe\xdd"\xe4\xbe\xde\r#\xbf\x1b\xa2\x94>\xa8=\xb9\xbb\x17FG\xbe3\x84\x17>u\x02\x10?\xd9\x8c\x83\xbe\xd7x\x81\xbe\xcb\xf3\x16\xbe\xed\xe8\x1a>X\x83\x1e\xbf\x9bY\x17>+\xd4G=\x11\xe1 \xbeQ\x0b\xf9=\x08\xa3-?\xee\x8e\t\xbf\xc3:\x1a?\xd2m%\xbe\xd9V\x82\xbe\x15B\x0c?(\x93\x14>(P\x1c??[\x13?\x93\xc4W\xbe\xdb$\x86\xbe`\xea\xa8\xbe\xf3\x8d\xd2\xbe+\x088?;"v?k\x1bR\xbe\xed\x97\xd6>ba]\xbe\xfe:n<6-\xd7=\x1f\x07U\xbfeT)?\x06@\xa8\xbei\xf6 \xbf)p\xd9\xbe\xf7\xf6\x90\xbe\x03\x8b\xd9\xbe\xb5\xc7\xe3\xbeW\xfb/?\'\xe4\xa5\xbe\xa5,\xf0\xbey5\xad\xbe\xa7QH\xbf\xbd\xc1}\xbe=\x0e5?\xfd\x12?\xbe\x89yG=\x08\xd7v\xbfY\x04\x05\xbf\x83\xb8l\xbfeyB=\xb2\\\x08?\xad\xe88>\xfd\xff\xcd\xbeKQ\xdc\xber\x8a&?\xa3G4>\xc9\x9a\x00\xbe\x82\x9f\x07\xbdG\x1aY?\xad\x86:\xbfn\xb4\xf1=\x1dk\x16\xbf%\xb5\xef>f<\xf0>\x98O\x08?}\x11T?\x96\x99o?v*f>\x12\x97\xfc>qC\x98\xbd'
-p337
-tp338
-bsV580645553832349696
-p339
-g2
-(g3
-(I0
-tp340
-g5
-tp341
-Rp342
-(I1
-(I200
-tp343
-g12
-I00
-S'\x1e\xdeU>\xcb\x81\x00\xbd\x81\xf9\x98\xbed\xef\xc2=\x8e@Q>\x1e(\x85\xbd\x00P\xa4\xbd\xb9\xd4I\xbe,\x97\x0e\xbd7=\x07>\x1f\xaaV=?Fa\xbd\x86\xd5\xc0=a\n\x9b=\xee\x0bH\xbdq\xa3\x93>\xea\xe8\x00\xbdP\x9cn\xbd\n\xa0\xb1\xbd\x88\xe2\x08\xbd\xfc\x91B\xbe\xb3\xf3F\xbd\xc67\x10>\xf32&\xbe\x84f(\xbd\x91\x84\x99\xbd\xb3r\xf8=$\xbb%\xbe\xea!.\xbe:.*=\xe2B\xf1\xbdB\xef\x06\xbeP\x0e\xcb=\tq\x84\xbec\xa9\xcb<*K\x90>\x9c/\x12=\x88\xfb\n>B\xe9y>\xa8`\xb1=3\xed\x91\xbd\xe0\x8b\x1a<\x1e\xf7\x0e>&t2\xbe\x8fa(\xbe&*\xe2\xbc\x8f<\x98>\xbd\xde\x88=Z-\xa7=\x1c\xf4\x9c>\xaaFo<.\xc9\xa2>=\x8d\xd6\xbd\x04\r\x91;;o\xa6\xbe\x8e{#>\xd9\x15G\xbds\x82!\xbe\xe2\xa7\xaa\xbe\x98\x16\xa9\xbe\x089\xf5=\xf2+\x9e=\xd6\x93\xa8;Sr\x81\xbe\x0e"\xe3\xbc\xc1\x9e2>\xb8\xb8\x1f\xbe\x19\xd4\xa0=m\xec1\xbe+\x05\x1e\xbe\xf2\xe1\xdf\xbeE\x87\x8d\xbe@s\'\xbd\xba\xa2\xb8\xbd\x12"\x01\xbe\x94\xc8)>\x85\xcb9>\x94\x1f\xcc=\x8e\xb9%>xu >\xbdyy\xbd\xba\xcf\x8a=\x00{\x80>\xc4\x023\xbeg\xfa\x00>\x01\xf5\xd1=\xf07I>A\xf7\xa0\xbe\xfd\x8d\xe4>\xa2_\t=\xb1\xea\x0e\xbe\x0cH\xdc=\xe9R\x18\xbe\xe3\xc1\xd8<\xad\x1ei>\xed\x12\xd3\xbc\xcc\xcdD>\x12\xca;>\xd9f;>\xf3wu\xbd\xd3\xdf\r=\x17\x15|>\x02P\xe8=\xefT#>U\xf9\xe8>)\x9cA\xbe0\x930\xbd\x02\x1a\x95=Ye\xd9=\x82\xd6\xf0;pg\x80\xbd\x80-E>p\x13\x10>\n0\x0b>\xcb(\x0e;\xf5\xeb5=\x84\xc6\x87\xbe\x7f\xc1P>c\xc1\xff<\xcb#%=\xc7 \xe5>\xc5a]=\x93\xd2\x14\xbd\xea*\x8d\xbd:l\xd7\xbd\x07\x850>\x94\xe0\x9d\xbd\xff\xacr<\x0c3\x80=]N%>\x98\xa3\xf1<\xaa(\x97=\xd3\x8d\x93=\x90\x15\xe0<>\x1cE;Sk\xe9=\xf8\xb3\xb3\xbc\xb3\x81#<\xf3\x89\x01\xbdW\xcd\xd9=\xb8uP\xbe\x97\x96\x97>\x95\xe6\x8b\xbb3\x1at\xbe\x03\xc7V>1ex\xbd\x08I\x0e>\xab\x0e\x8e>\xc3j\xe0\xbd\x90\xf8\xc8<z\tL\xbcw\xec\xf3\xbd\x97\x8ba>1kn>\x88\xc8\x08<Y\xbd\x97>\\6\xeb\xbd\'\x07\x88=\x90h\xd6=u\xfaq\xbemD\xde=EBC\xbe\x0b\x8f\xab\xbe\xb82\x19\xbe\xe8>o\xbd\xc3\xe0K\xbdjK\x8c\xbe\x16#\x89>^\xac\x85\xbdu\xe7\xdb\xbd\x85\x08\xb6\xbc\xb0\xa6u\xbep\xd6\x96\xbd\xc8\xed\xb1>\xf1\xf3\x9a\xbb&D\xf4<\xa1\x9c\x97\xbe#\x92\x7f\xbeD\x84\xeb:<\xbb\xc2=\xd1\x83\x94>\xa6\xee\xe6<\xcb\xd1\n\xbe\x88\xce\xbb\xbc\xcd\x8a\x80>\x83\xf24=(\xbb\x1f>i\x01\x1a=\x93\n\x82>0\xca]\xbe8G<>\xc1\\\x9d<\xc5\xdc\x03>px4>\x98\x8d\xa0>\x9e\xc3\x81>*&\x08>\xe9\x0f\x84=\xc4\xfe\xa3=\xbe\xee\x03='
-p344
-tp345
-bsV580214448591368192
-p346
-g2
-(g3
-(I0
-tp347
-g5
-tp348
-Rp349
-(I1
-(I200
-tp350
-g12
-I00
-S"\x00>\xfa9\n{\xa5\xbdC\xee\x0c\xbfq\xec\x0b?;\x9b\xac=;\xbft>s\xbf\x11\xbf\x08\xae\x0c\xbeK\x99\xec\xbc\x81X\xf1>w\x06\x8c=EoP\xbf\xd3Jn>\xe5\xc7\x1a>\xdb\xe0\xbb\xbc\xb7\xff\xc0>s\x99\xe2\xbd\x97\x91\x03\xbf\xd4IN>\xad\xcb\x86>\x8b\xecR\xbf\xbc\xbc\xf3\xbd\x96\x12\x10>\xcd\xc55\xbe\x93\x8cS\xbe\x84\xb9\xa4\xbbI\xb9&=##\xeb\xbd\xb0o7\xbf\x87_b\xbe\x8d\x19\xff\xbes\xd5\x90\xbeM\xa8\xee>\x99\xf1\x05\xbf\xdf\n\x82=\xccW\x83?`\xe6\x05\xbfkz\xd6=\x01y\x97>;\xf5>?T C>x`/?)\xc3\x9b>\xe5\xe02\xbf\xe4S\xbd\xbei\xb2\xd0;\x83\x7f\x01?K\x1d\xd0>|\xf9,>}\x0c\x13?\xe7j\xce\xbdp-=?\xe4\xc1\xde\xbe\xdf\xf9\xa9\xbe9fW\xbf\xc7|\r?\xe8j\xa5\xbeS\x17\x94\xbe\xe5_ \xbf\x1f\\\x12\xbf'\xf7\x16?\x15\t\xd6\xbd)\x1ev\xbe\x83?u\xbfhH\xe0\xbet\xb6\x1d?\x10\xb2\n\xbf\x1d\xf3V\xbe/x\x15\xbfr\xcf\x16\xbf\xf7`H\xbf\xa7TJ\xbfu\r5\xbe\x8f\xc3\xab\xbe\xd6*\x12\xbf\xef\x048?\xd7\x94*?\xd8\xbai>\xff\x8f\x01?[\x0e\xed=u\xa7}\xbe\xae\x8b\x85\xbc\x9f\x15a?\x11\xb1\xed\xbe\xb7\xe4\x02>)\x99\xdd>g\xee\x89\xbc83S\xbf|_<?\xa9\x93\xd9>;(K<\xcc0<\xbd\x1a\x1f\x8a>\xdd\x0e\xc7=\x9b.\xa3=+\xb9\xb7\xbe}\x90->\xbb\x9f\x8b=\x03!\xf9>x\xd9\x95>\xe9\xcaT\xbd\xbec\x07?h\x13\x92>\x92k\x9c>s\x00\xcf?Qz\x01\xbf\xa8\xee\x98\xbe\x00\x01\xae\xbc9\x87:?\xe5\xfdM\xbe\x13\x1f\xb1=E\x10B?\xa1\xa5}>II\x15?\xa2\xf4\t>k:\x88>+d\x1d\xbf\xf0A\xc4>K\x83\xab=\x10AG>\x11)\x82?\x91v\xb3\xbe\xb5WJ\xbe\x91\xb9\x02\xbf\x7f\xbd=\xbf\xf3n\xb8>\x9b\xdd\xaf\xbcomX\xbe\x85\x7f0>\x9b\xff(?;w\x8d\xbeE\xe4\x8d\xbe\xcc\x1a'\xbe4\x90:>XB4\xbfs.@>\x03\t\x82=\x9b=2\xbes\xd1\n>q\xadL?X\x8f$\xbf\xd7\x8b<?\x81kC\xbe\x0b.\xaa\xbe\xd9\n)?\xe6C!>m\xe4;?\x90\xd11?\x19d\x81\xbe <\x9c\xbeI\xcc\xbe\xbeS\xf1\xfd\xbe|lZ?\xc9V\x92?=@h\xbe\xc1i\x06?\x80t\x84\xbe\xb3\xd7\xbc<\xb6\xdb\t>}\xa0}\xbf\x18\x92I?4L\xd0\xbek\x9eE\xbf+\x06\x03\xbf\x017\xa9\xbe? \x01\xbf\x01P\x0f\xbf\xc3\x8bT?\xd5\xb1\xc2\xbe\x86\x06\r\xbf\xcd\x1f\xc8\xbe\xc5\x9el\xbf\xf1\xe8\x96\xbe\x1d\x06a?\x1c\x8b_\xbe{$j=\x8e\xf8\x92\xbf\xd9\xfd$\xbf\xd0\xd8\x89\xbf\x99?\x84=\x85\xc3$?\x97\xc5U>\xaf\xa5\xf7\xbe\xbfQ\x01\xbf\xa3&E?\xa3\xb1P>K\x08\xe8\xbd-\x91\x03\xbd\x8f\x8b\x81?\xe1\x9f]\xbf\xe5\xb0\x1c>g\x85*\xbf]\x9b\x11?\x1dy\x11?S&(?\x05q~?\xcev\x8b?lE\x87>r\xd0\x10?gN\x88\xbd"
-p351
-tp352
-bsV580324501558304769
-p353
-g2
-(g3
-(I0
-tp354
-g5
-tp355
-Rp356
-(I1
-(I200
-tp357
-g12
-I00
-S'\x9cb\xa3=\xd8\xd1\xad\xbd3"\xbc\xbe\x1d*\xa7>\xbc\xdd\xd4=\xbf\xaf\xd7=\xcf\xd7\xae\xbe\xd9i\x1b\xbe\xac\xca"\xbd\xccU\x99>\xcfL\x80=\xcc\xcd\xe3\xbeQ\x0e\'>\x01>\xfa=[a\x12\xbd\xb4\xd5\xa0>\xde9\x8f\xbd\xba\xc2\x8d\xbe\xd9,\x91=\x8f\xba\xf2=\x8d\x92\xfa\xbe0\xba\x99\xbdC<\xf8=\xd4V\x19\xbe\xa3\x1b\x12\xbe\xa1?\xd2\xbc\xfa\xa2s=\xbf\xfc\xe9\xbdt}\xf4\xbe\xe2\x9a\x92\xbd\x9f?\xa6\xbe\xfa<N\xbe.\xd3\x95>_$\xaa\xbe\xe2\r\x80=q\x14#?\xb4Ru\xbe\xc6\xd2y=\x9e\xd0\x83>\x8f\xdc\xdb>\x8c\xb2\xa9=\x87%\x9f>\xac\xddF>IQ\xdc\xbeC\x15p\xbe6\xe7\xe2\xbcT\xae\xcb>\xf9\xda\x83>\x9a\x83\xf9=A\x0c\xd3>!\x017\xbd\xa1\xb0\xf4>A"r\xbe1\xaeT\xbe2a\x10\xbf\xb1&\xb3>9\xb6@\xbe\x0f21\xbeL\x08\xf1\xbe\xf3\x96\xce\xbe\xef\x02\xa9>\x97\xcb\x8d:\xf04\xd1\xbd\xfa\xf6\x14\xbf\x10<\x86\xbeT\x95\xbd>\xc7\xb1\xad\xbee2\xa3\xbd\x07\xac\xb6\xbea\xa3\xb4\xbeo\xd4\x15\xbfx\xd5\x01\xbf=\x95\xc2\xbd\xb3\xecY\xbe\xfd\xea\x9d\xbeD\xc8\xe8>\xc4\xfa\xd1>e\xb7,>\xf7.\xa0>\xbe\xc6\x06>\x96\xd9\x12\xbe\x9a\xba;<I\x0b\x14?\x80\xad\xa1\xbe\xd8d\x03>N\xff\x86>\x19<^=1\xa9\x08\xbfHf\x06?\xd3(h>\xbf\x96,\xbd\xd7\xa0\xf3<\x0f\xa1\xb6=H\xe7\x88=Y\x8d\x06>\xba-J\xbe\x83\xf96>-\xc9\xee=\xea\xdc\x9f>\x11\xc2\x1b>\xc0\x8f\x9e\xba\x03D\xbd>i\xc8X>\x936T>\x8e2\x80?\x82-\xad\xbe\xc9\x14,\xbe7\xc5\x04<\xd9\x1c\xdd>\x91L\xbb\xbd:\x95\xeb<\x06\x95\xf3>\x1c\xed9>i\xb5\xb0>A\xab\x85=I\xb9>>Z\xb4\xd2\xbe \xd1\x8a>\xa9\xf6\x99=\xf91\x08>\x1f\x85/?\x91\x0c\xf7\xbd\xadv\xbf\xbd\x85v\xa0\xbeAv\xd7\xbeQf\x82>\x86\x11J\xbd\x818\x18\xbe\xa7/\xea=Sh\xd9>\n,"\xbe\xc9\x85\xd4\xbdi\xa7=\xbdV>\xd4=\x91/\xb2\xbe&}\x00>\xdd\xbdX<}0\xf0\xbdH\x0b\x89=w\xa0\xe8>!\xa1\xd9\xbe,\xed\xf4>\xe4M\xc8\xbd\x80\xe7\x8b\xbe7`\xcc>-\xa2\\=\xacs\xdf>\xc3\x1e\xf8>\xe9\x7f>\xbe\x8ar\xff\xbd\x1f\xfed\xbe!1\x9e\xbe\xed\xb0\n?d\x96/?\x01u\xe9\xbd\xfc\xf3\xb8>\x15C*\xbe\t\x8dB=\xdc5\xab=ZK\x15\xbfp\xa4\xde>\xe2\x02\x9a\xbe -\x06\xbf|\xa8\x8d\xbe0KN\xbe\n\xba\x7f\xbe\x01\xcc\xc6\xbe\xef}\x07?\xba\xc1p\xbe&\xf8\xae\xbe\xe6\xf4_\xbe\x7f\x1c\x12\xbf\x84h\x15\xbe\xe9\x9d\x0f?y\x82\xe2\xbd\xd3z\xcb<VI6\xbf\xf1\x81\xd4\xbeLc\r\xbf3y\xa2=\xb0&\xe5>\x89\x8e\n>L\x0f\x9e\xbe\x85\xb7\x89\xbe\xeb\xcd\x01?\x8c\xcd\x04>\xba\x9a\xc7\xbb\xc7\xa6/<\x97\n\x1e?\x9f\xe7\x04\xbf\x00\x03#>\'{\xac\xbe\x94\x98\x9b>\xe4\xda\xb5>\xb3\xc6\xee>\x87:\x1a?\x83`#?\x98p4>\xd1\xc0\xb3>\xdc\xf7\x17\xbd'
-p358
-tp359
-bsV582838389516308480
-p360
-g2
-(g3
-(I0
-tp361
-g5
-tp362
-Rp363
-(I1
-(I200
-tp364
-g12
-I00
-S'lC\xa4=\xa8\x13j\xbd\x08\xc7\xc4\xbe\\T\x85>\x8c\r\xf9=3\x1a\xa2=\xc3/\x93\xbe\xd9\xc7\x00\xbe\xf8l\x1b\xbdFa\x85>\x05\x02q=\xb4\x93\xbd\xbed\xc2*>+\xac\xc2=n\x8b[\xbd\xf02\x86>\xa6#m\xbdY\x13\x86\xbe\xb1\xa6r=:\x93\x08>\x9d\xc6\xef\xbeS\x87\x85\xbd&\x91\xd5=\x0e\xca4\xbe\x9f\xc9\xea\xbd\n\xc4\r\xbd\xe7\x86\x95=\x8aT\t\xbe\xd8\xc3\xcf\xbe\xef\xa7h\xbd\xed\x1eu\xbeJ\xc3)\xbe\xd54\x8b>\xc4A\xa6\xbe\xe7k\x06=\xcd$\x11?l\xf1l\xbed9\xbe=\xf3\xc6j>L\x02\xc5>\xcb\x8a\xb1=GV\xaf>\xf33Y>\xdf\xaf\xd4\xbe\xac\xb9L\xbe\x8d\xc7i;\x97#\xb0>\xbcq@>\x9fw\xb5=P\n\xc0>\xc7z\x08\xbd\xda\xe7\xf1>\xf6\x9b\x80\xbecY\x17\xbe\xeb&\x04\xbf}\x98\xaa>\x89K\x1a\xbe\xd3\x1c:\xbe\xf9~\xd7\xbe7\x0c\xc8\xbe\x85\xa8\xb2>(\xe0)\xbd\x12\xe4\x0e\xbe\x13m\x07\xbf\xda>b\xbeS\xbb\xbc>\x88\x8c\x9f\xbe\xf3\xf2\x8d\xbd>e\xbc\xbe#\x91\x98\xbe\xa2\t\x07\xbf\xdb\xac\xe8\xbe\x01\n\x98\xbd\x96\xdb@\xbe\x83\x18\xa3\xbe\xecR\xd1>\x0ck\xc8>\xa7\x14\x13>N\xfb\x87>\x88\x8b\xe3=\xcbS\x19\xbe\xe0^_\xba\x9f\xc5\xff>\n\x95\x8f\xbe\x08\x1d\xea=`\x91z>\xff\xe9\x9a=\xa8\x93\xfc\xbe\x9cd\xf8>\xb2\xf5t>X\x0f"\xbd{ry<\x7f\x9e@=\xd1\xd7\x92=`\x94\x02>\x0cv#\xbe\xd7\xcd\xf8=\xe8\x13\xe9=N\xb9\x88>\xd4R\x00>$F);B\xc6\xb2>\xf0\xde(>W\x98;>\xffAd?d\xbe\x9c\xbe5\xdd\n\xbe1=`\xbb\x9d\\\xb7>\x8d\x05\xbd\xbd\xf4\xaf\x13=\rN\xe2>x\xef\x17>\x83w\xa2>@~[=on\x08>A\xe3\xbf\xbe\xd7f\x89>Y\xf15=k(\x05>\xe0\x8a!?\xd3\x14 \xbeS\xd6\xd4\xbd\xae\x8d\x80\xbe\xbe8\xb8\xbe:\nu>\xb3XM\xbd,\xdc\xc7\xbdZ{\xa5=\xee\xd2\xab>\x8a\xe4\xe4\xbd74\xe0\xbd\x91\x97}\xbd\x08\x17\xc8=\xe3\x96\x9b\xbe\xf4#\x01>VK\xca<E!\x9e\xbd\xfc\x99\xb4=$\xad\xd3>\xb9W\xb1\xbeR\n\xe3>8\xa7\xd7\xbd\xf8\x8bn\xbe\x0cP\xc4>\x0b:n=r\xc9\xd3>\x7f\x1d\xcb>\xf3o&\xbe\x03\xcf\x1e\xbe~\x12>\xbe\xdf^\x93\xbe\xab\x9e\xf1> \xbc\x1d?6i\xcb\xbd2\xd4\xb1>{\x8d\x14\xbe\xdf \x1c=\x18\x15\xa7=\x90\x9f\x08\xbf=\xf4\xdc>e!\x82\xbe\xa9\xa6\xe6\xbe\xe6\xaa\x96\xbe\xec\x894\xbe\xc5_\x91\xbe[\xc6\xc1\xbeUM\xf1>\xeb\xf0L\xbe\x86r\x91\xbeH\x815\xbeT+\xfb\xbeX>\r\xbe\xdb\x9e\x10?\x89\x9f\xbc\xbd\xa1s\xa5<\xfc\xd9$\xbf\xaf\xdf\xca\xbe\xef*\x05\xbfQ\x9cl=k\x8b\xcc>M\x1b\xeb=\x86\xf7\x8c\xbe\x9c9\x84\xbe\xcbh\xd6>\xcfd\xc6=`rF;\x8e\x85C\xbbt+\x0f?\x1e/\xf0\xbe\xc6\x88\x01>\x01\xe1\x9c\xbeiV\xa2>\x8eS\xaf>\x03\xb6\xd3>\xae$\x12?\xdcs\x0c?4O\x15>p,\x8c>\x123\xc4<'
-p365
-tp366
-bsV580220065863364608
-p367
-g2
-(g3
-(I0
-tp368
-g5
-tp369
-Rp370
-(I1
-(I200
-tp371
-g12
-I00
-S't\x98 >\x97\x16\x1e\xbd\xef3j\xbeh\xfc2=`:\t>\xbf\xc3g\xbcO?\x90\xbdO\xd9\xee\xbd\xd7\xd7\x01\xbd\xbb\\\x0c>P\xf7\xf6<\x89\xf4\x8a\xbd \xd8\xb8=/\xd6\x0b=\xdb\x8ft\xbd\xc0\x05F>\x8e\xea\t\xbd,\x0b\x9a\xbd\x80\x85x\xbd\rpY\xba\xfc\x0b7\xbe0\x15\xdd\xbb\x93\x91\x91=\x1b\xee\xe8\xbdD\x8e-\xbd\x89C\x81\xbd`\xfa\xd1=\x87\x9f\xe8\xbdS\x13C\xbee}\xa6<\xd7h\x96\xbd\xc0\x11\x89\xbd\xa5\x0e\xc3=}\xf9@\xbeE5[<\x00\x95g>\xcd\x9f\xdd<\n\x1d\x84=\x8b\xed:>\x9f\xbd\xc7=Y\x18\xda\xbc\x85\xfa\xe4<\xdb(\xe4=\xb1\xd0$\xbe\x17\xe7\xc3\xbd!\xe6\xb1\xbc\xa3\xd0q>;0U=\xe4\xd6"=k\xbb|>\x8b\xfe\xdb;\xeb5\x81>\xdbG\xd7\xbdc#\xc5\xbc\x10\x04\x8b\xbe&\xb9\x16>\x9c`\xc7\xbc\xf1\xaa\xa9\xbd<\xa8\x93\xbeO\xa0}\xbe\x82\x0f\x1a>\x9b\xc7\x8d=m\x93\xc5\xbb\xb8Y=\xbem\xf9*\xbdr\xd7\x19>\x7f\xd1\x1d\xbe\xad\x9a\xa2=\xf9\xca\x1b\xbe\x17c\xcf\xbd\xb5s\xa0\xbe\xd7\x8dN\xbe\xfd\x88f\xbc\xf7\xa2\xa6\xbd\\\xd2\xeb\xbdyU\x13>-D&>\xb1\x82\xbe==D\xd6=\xdfe\xec=\xa3\x15Y\xbd\xac\xcd\x1f<[mm>\xfa\xaa\x15\xbe\r\x84\xca=0\xa5\xab=K6\xf1=->i\xbe\x11\xdb\x94>\xc5}\x92=8\xdd\xb6\xbdu>\x92=\xdfV\xd7\xbd\x1b?\xa6<\xb8x&>O*\xd1\xbcky\xe7=\xd1w\x15>\xc5\x19\xfa=O\xbeX\xbc#\x82\xcf<8rG>\x91t\xb8=ik\xbc=\xf8\xfe\xab>\xb1\xc5(\xbe\x99\x016\xbc`]7=\xeb\x93\xb1=#;m\xbc\xc1\xd1j\xbdw0 >\xbf\x06\xa6=\x88g\xfa=-\xc0\xa7<5\xb51=q\xd0X\xbep\x0e&>7\xd2\x9c<\x95\x15U=\xe7=\xa6>R\xb3\x01=Y"\xcc\xbcoJ\x8b\xbd0w\xa2\xbdt\x85\x12>\xb1\x11\x8c\xbd#7\xb0\xbc\x05^\xe1<\x857\xd7=!\x91\xbc\xbbW\xfb\xf3<8W\xd0<x7\xbe<\xcd\xdex\xbcU\xef\x91=\xe5R\xd5\xbcg\x14\x82\xbcD\xbfo;(\xed\xcf=pm\x0b\xbey\xf7U>\x90\xae\x12\xbc\xe0\xe75\xbe}\x9d9>u\xda\t<R\x08\x1a>(si>S\x92\xd4\xbd\x7f\x9e1\xbc\'\xber\xbdh\xf9\xfc\xbdy\xb1@>97`>\xa3\xb2\x8f\xbc\xc5\xdcb>\x9f\xe1\x9e\xbd\xe8\xd7j=\x9dr-=W\xdcL\xbec\xb8\xc4=%Y\x18\xbey\xb9n\xbe\xcc\xb6\x0c\xbe1Yb\xbd\x81N\xab\xbdj\x94\x80\xbe/PL>\xa8\xa4b\xbd\x10\xf6\x9c\xbdW\xfe\xb9\xbc\xad\x076\xbe`B\x03\xbdn\xc3\x9d>\xdf\x80H<\xbf\x9c*<<\x95\x84\xbe\x85\xf6[\xbe\xe4I\x88\xbd\xe8\x9c\x82=\xb9r[>7uY=\xe8%\x01\xbe}Y\x96\xbd\xc5AG>K)s;\x84t\xa8=i2\x02=\x00PV>\xa3(\x16\xbeGE\xdd=\xaf\xd6\xd2\xbcq\x11\xdc=}\n\x0f>\xb3\xc9w>\xb0yy>\x1d\xad\x05>\xbd-m=\xfb\xed\xa1=\x8b;H='
-p372
-tp373
-bsV580182009760251904
-p374
-g2
-(g3
-(I0
-tp375
-g5
-tp376
-Rp377
-(I1
-(I200
-tp378
-g12
-I00
-S'\xb9@\xa9;\xb9m\x86\xbd\xe3\x99\xe5\xbe7\x9a\xe1>\xc7\xd9\x92=a\xb1C>=\x81\xeb\xbe\xf6"\xea\xbd:\x91\xc7\xbc\xdcX\xc3>\xdd\xd9f=]\xba\'\xbfb^B>m\x0e\xfc=2\xd1\xa5\xbc\xa4\x13\x9e>\xa3\xb2\xb7\xbd\x99\x1e\xd4\xbet\xd8#>-\xefX>\xa2\x97*\xbfp\xa9\xc4\xbd\x04\x06\xec=\x9b\x93\x16\xbe\x93\xf6*\xbe\xc9\x9a\xb6\xbb:=\x0f=C,\xc5\xbdY\x99\x14\xbf\xd4\xab3\xbe1\xaf\xcd\xbe\xcd\x08k\xbeA\r\xc1>\xb2h\xd9\xbek#U=\xc0\x83T?\xc1\xef\xd6\xbe\xccb\xb1=\xe3\xf5x>\xe5\xfc\x19?i\xe6\x1c>"\x1b\r?.f~>\x8e\xf8\x10\xbf\xd5D\x99\xbe9\xee\x9f;\x89\x93\xd3>\xbd\xd1\xa7>\x99\xec\x0b>!\xdc\xef>l\xb0\xa4\xbd\x91\xcb\x19?eJ\xb4\xbe\xac\xe3\x88\xbeu\x12/\xbf\xccK\xe5>:N\x85\xbes\xd8o\xbe`\xec\x02\xbfL\xaf\xee\xbe\x1bY\xf4>\x93-\xa9\xbd\xd4 F\xbe:rF\xbf\xeb6\xb5\xbe)\xa9\xff><\x92\xe0\xbe\x11\xda*\xbe\xe1-\xf2\xbey\xbb\xf3\xbe`r#\xbf\xba\x07$\xbf\xf6\xfa\x11\xbe\x10\x08\x8b\xbe,O\xec\xbe\x93\x08\x15?!\x0e\n?\xddU>>\x83\xa8\xd1>\xbb\x9c\xc4=\xb0\x89M\xbe\xed\xbaP\xbc\x8d;6?\xea\xfe\xc0\xbe\xbe\x13\xd8=\xd2_\xb3>\x9fk\x12\xbc\x1cQ+\xbf!\x86\x19?v\xd7\xaf>\x96\x13\xfc;\x05T\x0e\xbd\xbd6Z>\t@\xa2=|_\x8c=v\xcb\x93\xbe,\x87\x0e>J\xc1p=\x9a\xab\xc9>Wdp>\x01\xae%\xbd\xa6X\xdc>\xc6\x1dm>A^~>\xb5\x92\xa7?\x9e\xf7\xd1\xbeNMv\xbe\'I\x81\xbc]X\x16?\xba\xd0%\xbe\x83\xf5\x8b=\xd2V\x1d?\xa9\xf5N>=\x96\xf1>\x83,\xdd=\xde\x03\\>\xeb\xb5\xff\xbe\xe6K\xa0>Vc\x8c=\xd5\x05">\xaelS?_\xd7\x8f\xbe&o#\xbeW\xad\xd2\xbe\xd9\xe6\x18\xbf\xda\xd8\x95>\x127\x9e\xbc/e-\xbe\xbbD\x0e>v\x9c\x08?\x13\xeeb\xbe\xf3*c\xbe\x99|\x05\xbe\x99^\x16>-\xca\x10\xbf\xd1\xc9\x1b>\xee\x10R=\xea(\x0f\xbe\x87x\xdf=\xa2%%?c5\x05\xbf\xff\xfc\x18?j\xe2\x1c\xbe4\x19\x8b\xbe\x0f\x0b\t?\x8b\xe5\x00>\x05\xf5\x17?\xf3\x1d\x10?\xea]R\xbe\xd2\x80{\xbe\xb1\xac\x99\xbed\xda\xcd\xbe\xed\xc00?[\x8cl?\xb2\x8e:\xbe\xa5\xa6\xda>\xf3\x99V\xbe\x00\x92\xa4<;\xef\xdf=7\x1cM\xbf\xc2\xd7"?\xcd\xb1\xa9\xbe\xa5W \xbfq\xe1\xd3\xbe\x92\x85\x88\xbe\xc1\x96\xd0\xbe\xbcg\xe9\xbe\xceL,?\xb5\x1b\x9d\xbe{\xfb\xe3\xbeR\x07\xa1\xbe6M?\xbfCIs\xbe\xa2\xeb6?Z\xcd3\xbe\x9a\xcb:=A\xf3m\xbfJ\x1c\x06\xbf\xaa\xe2]\xbf\x9e[[=U\xc2\x05?\x95:,>\xd5\x87\xc8\xbe\xfc\x80\xd0\xbe\x17\x98\x1f?Zc(>.\x89\xb4\xbd\xe0Y\xcd\xbc\xe0\xb1Q?0E3\xbf-@\x01>\xb19\t\xbf!j\xeb>A5\xec>\x82\xc7\x08?O\x0fN?\xb7\x00a?\x900[>\xe1\x8e\xe9>\x02\xabR\xbd'
-p379
-tp380
-bsV578846959361986560
-p381
-g2
-(g3
-(I0
-tp382
-g5
-tp383
-Rp384
-(I1
-(I200
-tp385
-g12
-I00
-S'\xe4\xc8\xf9=\x9d\x111\xbd\x81\x1b\x9a\xbe\xdc\xe7>>\xc4`\x06>\xd6\xcb\x0c=l\x86;\xbeJ\xfd\x0e\xbe\x16\xf2U\xbd\tCJ>v%E=\xc3h\x81\xbezi\x03>\x99\xc9\xbf=7\xbaX\xbd\x0bS~>\x01\x8d?\xbd\xf7\xb2:\xbeKm\xdd\xb9\x1a\x08|=1r\xa2\xbeC\xf8,\xbd\xfb1\xb9=H\x89\x06\xbe\x87\xaa\x99\xbd\xcb*)\xbd\x82\x8d\x92=\xc2^\xfc\xbdH\\\x9a\xbee\x01\x03\xbd\x91\xdaY\xbeB\x0e\x0c\xbe\xad\xb9G>[-\x8b\xbe4*#=]c\xd4>\x12@\xe2\xbd\xdd\x91\xc0=\xa5\xbbR>\xdf\xa6\x83>@\xb4\xfa<\xb5\xb13>\xd2\x1b$>\x88W\x96\xbe\x98\x19-\xbe\x08~n\xbc0\x87\x94>\x12\xef\x11>\xe4r\x98=\xea\xe5\xa0>\x922\xd2\xbch\x81\xbc>\x96\xe3/\xbe\xd6\x04\xbf\xbd\xb6\xef\xd0\xbeS\xb3c>\x90\x81\xf0\xbdrc\x12\xbe\xfc\x08\xbc\xbe\xeb\xee\xa8\xbe"\x85g>)B#<>8]\xbd\xd7\x93\xc2\xbe\xa4?\n\xbe\xef\x81\x84>Hhj\xbeo\xb10\xbc\\\x85w\xbe\x00|k\xbex\x9d\xe3\xbe&\xe5\xad\xbe^"|\xbd\xae\xb9\x0f\xbe6}Z\xbe\xc3\xa7\x94>U\x0e\x8b>j(\x01>o\xddT>F\xb7\xfd=\xd9\xf6\xcf\xbd\xd8\xcaT<\x92\xd8\xc0>\xb8\xe8_\xbe\xedm\xdf=\xda\x0c2>\x8f|\xd2=H\x1f\xc2\xbe\xc5\xcc\xd4>8Y\x08>\xe1\xb3\x86\xbd=\x8a\x15=t.\x81\xbc\xb8\x89\xeb<\xd7\xef\x15>\xf5\xbd\xb5\xbd\x86b\x0b>8\xfe\xf2=\xd7NN>\x19=C=+\x19\x8f<\xb2\xf8\x8d>\x83{\x12>\xf3\x1c\x1e>\xf5,,?\xda\xc2w\xbe/\n\xba\xbd\xb7\x8f\xb3<\xa2(\x7f>\xc3\xa5%\xbdv\xcc[\xbc)\xad\xa3>\x88K\x0b>h\xf9e>Z\xbe\xf8<`\xfb\xd9=\rs\x9b\xbe\r\ne>o\x9d>=~\xb2\xae=1m\xfc>q\x82y\xbd~yv\xbd)\x89(\xbe\ts|\xbe\xe4\x0eA>\xabo\x8a\xbd\x04\xc6g\xbd9\x13\x9d=\x93\x03\x84>\x93(\x9f\xbd\xac4 \xbd\x1ap\xe1\xb9\xaa+\x81=\xa9a-\xbeC\xf2\xb8=\xaa\xab!\xbc:\xcbG\xbdd, =\x14\x88\x86>\xcdT\x89\xbe\x7fZ\xb1>\x08\xd9i\xbdU\x8bS\xbe\xc9\x8b\x97>{$\xb2<\xf8\xd4\x87>\xecE\xac>5\n\x00\xbe\x0f\xd2\x94\xbd"\xa5\xdf\xbd\xf5hM\xbel\xb0\xb2>\x14%\xd8>^\'V\xbd\x0b\xcb\x93>\x18-\xfd\xbd\xd3\x8bb=\xff\xb4\xa1=\\\xa6\xc4\xbe\xe8\xcc\x88>\xc5H_\xbe\xe4\xfc\xbc\xbe\x83\x85^\xbe\xc3k\xec\xbd\x01l1\xbe\xc2w\x98\xbe<\xcd\xb6>\xe8\x80\xfc\xbd\x05fT\xbe\rY\xf7\xbd\x8b\xc5\xc0\xbe\xd8H\xd3\xbd\xf7\x98\xda>\x8f\xd4M\xbd\x81\x8a\xc5<\xf3\x0c\xf1\xbe\xef\x1d\xa3\xbe%\xd5\x92\xbe\x9a\xe1\x87=\xb85\xa7>\xe0}\x9f=\xfd\xa6N\xbe\x00\x19\r\xbe\xa7\x1d\xb0>7\x80\x9a=\xee\xc4+=\xca/\xf0;\xfb\xa6\xcd>y\x80\xab\xbe\x9bW\x12>\x1e\x033\xbe\x89KT>\xbd\x97\x86>\xf8\x00\xb1>u\xbb\xcf>\xc94\xb6>\xfe\x14\xe8=u-L>|\xfcs<'
-p386
-tp387
-bsV580302672684838912
-p388
-g2
-(g3
-(I0
-tp389
-g5
-tp390
-Rp391
-(I1
-(I200
-tp392
-g12
-I00
-S"\xcbo\r>1\xcb\xb9\xbd\xd9\xd6\xfe\xbe6\xb0\x9d>E26>R\x11\x8b=\x11\xb7\xad\xbeL\xfd4\xbe\x0eco\xbd\xb19\x9d>\x17\xb3\xa3=<f\xd3\xbe\xe6\xfep>\x17e\x03>gZ\x80\xbdA\x80\xb9>\xcd\x96\x89\xbd\xa1q\x9b\xbe\xc5\xf0\x8f=\xb5\xd6)>\x9c\xb3\x17\xbf\x9a\xcc\x9f\xbdtT\x02>\xc0^\x8a\xbe\xe2;\x08\xbe\xc1\xd8I\xbdek\xdb=\xf5\xeb[\xbe:\xc9\x05\xbf\x9b[/\xbc\xc8L\x8d\xbe\xcc\x9fV\xbel\x87\xa6>\xb1\x13\xcd\xbe\nVZ=\xc7F/?\xc6\xfe\x88\xbe\xda\x0e\xf9=y\xb8\xa6>:\x1e\xed>\xa1\x90\xdc=~}\xd0>pc\x9a>o\x8d\n\xbf\xe6\xab\x7f\xbeP\xbc\xa5;\x9ea\xe6>\xc2Xe>\xd6\xf7\xf7=\xbb\xe6\xf6>\x8bS\xbb\xbc\x11?\x1c?\xcb\x16\xa4\xbe/ /\xbe'\xa3)\xbf\x943\xe0>\x192<\xbe\xbf\xadl\xbeXB\x11\xbfN0\x04\xbfT\x0c\xe9>\x0fE&\xbd5>*\xbe\xb1J+\xbfR\xcb\x8f\xbe\x91\xc6\xed>\xdb\x06\xc0\xbe6Iw\xbdjB\xeb\xbe\xeb]\xb6\xbe\x12\x0f6\xbf\x18H\x15\xbfoF\xa6\xbd #p\xbe\x86\xae\xc1\xbe.d\x08?5\xe7\xf6>\nD9>/\x83\xa1>\xd0\xeb0>a\xceH\xbe[!A\xbc\xf1)\x1e?\x01\x88\xae\xbe\xd6\xc7\x1c>\x81\x18\x9f>\xea\x9e\x1d>\x84\t\x1b\xbf\xf5\xd5!?G\xf8\x9d>^uW\xbd\x00\x0cA=\xd4\xca\xb2<\xc2\xb1\xa3=\xbc\x97=>\xfe\x9b=\xbe\xa22\x19>Jq*>\xb9\x84\xa8>Z\x88!>\x97\xe7\x07=\x8a\x97\xe6>'\x9cY>\x0eRy>\xc9q\x90?%\x92\xc3\xbe\xee\xdb$\xbe\x02\x11\x90\xbb\x99\xda\xd7>l\xf9\xf0\xbd\x82\xdfc=\xb8u\x11?\x92\x92I>\x7f\xe2\xcb>>\x96\x1e=\x17\xc6\x1a>\x1c\xca\xec\xbe,\x8e\xb3>\xd1\xa2\xad=$i9>\xa4\xc8S?\xfaO;\xbe\xfaM\xfd\xbd\xb2\xdc\x94\xbe\x05\xee\xce\xbe!,\x9b>q\x18\xa3\xbd4{\xed\xbdn\x0f\xd6=\x8e\xc5\xdb>&\x9e\xff\xbdaK\n\xbe\x9c\x1a_\xbdJ\x9a\xfb=\xd6Q\xa8\xbe~\x97\x18>$\x0bM=\x04\x8f\xcc\xbdR\x9d\x11>\x9e\xa1\xfc>r\\\xe0\xbe\xf0\x1e\x14?\xea\xcf\xcd\xbd$K\xa0\xbe\xa7\x08\xf3>\x81\x85_=\x94G\x05?\xdf[\xef>\xd5\xfe_\xbelaH\xbe\xb7\xf7c\xbe \xcd\xb8\xbed\xdc\x15?\x9f\tB?\x87\xf9\xdf\xbd\xeb^\xe2>\xce\xc6;\xbe\xffM\x87=\x0c\x82\xce=\x89\xb1)\xbfYZ\x0f?\x0e\xb4\xad\xbe\x1e\xc1\x0f\xbf\x9eM\xad\xbe\xc9\xcf_\xbe\x1cF\xb5\xbe^\xc7\xf6\xbe\x94d\x16?\xcf\x0e\x7f\xbe1\x8f\xba\xbe\xff\xb6M\xbe\xf1\xb3\x1a\xbf\x1e\x0e)\xbe\xe2\xdb7?\x91\x1e\xd2\xbd\xc6\x03\xd6;Y\xd8J\xbf\x8b\xe2\xff\xbe\xb66\x1b\xbf\xbb:\x82=.w\xf3>\xcc\xe3\t>6d\xb7\xbe~\x0c\x9b\xbeYW\x00?\xeaP\xe9=\xef\xb5\xce<2\xbb\x03<K\xff3?[w\x1c\xbf\x9f\xd25>\x14\xff\xb6\xbe\x12\xfe\xc3>\xaa\xcf\xdc>\tg\x05?\x19T3?!+,?\xd6\x0b5>\x8eh\xa6>I{\x8b="
-p393
-tp394
-bsV580212459002294272
-p395
-g2
-(g3
-(I0
-tp396
-g5
-tp397
-Rp398
-(I1
-(I200
-tp399
-g12
-I00
-S'\xb4\x81\xd3=\xd8\x18\x96\xbd\xe7\xd8\xdd\xbe\x85A\x9e>>\xe9\x0c>Q\xb7\xd5=gi\xae\xbe\x99^$\xbe\x10\x99A\xbd\x9cW\xa4>z\xb4\x83=\xb0\'\xe6\xbe/\x91G>\x00\xaa\xf2=\x91\xb2u\xbd\xbc@\xa8>\xca~\x9c\xbd\x9b<\x9b\xbe\x1d\xcbu=\x9c\xf2\x0c>\xff/\n\xbf\xbds\x95\xbd\xd4\x80\xfd=\xb0e=\xbe\x88\xe3\r\xbes\xc1,\xbd\xb9\xe4\xa9=_\xd6\x1a\xbe]\xa5\xfe\xbe\xc6\x8d\x95\xbd}\xa2\x9d\xbe{eJ\xbe\xf3\xdb\xa1>A\xad\xc3\xbe\x87yL=\xd3\xe5+?\xa6\x8c\x80\xbe-Q\xc0=\xc3\x93\x8d>s\x00\xe8>\xd3\xc8\xbd=\x19\xa3\xb8>q\xcbq>\xa0\x11\xf5\xbe;\xdet\xbe\xab\xdb\x14\xbc%\xeb\xd5>\xac\xaar>\x11\xa3\xe4=\x88\x03\xe8>\xff(8\xbdG\x85\x0b?\xbdJ\x8f\xbe\xb7\xd4?\xbeu\xc3\x1d\xbf\xe3\xe6\xc2>|a;\xbet\xb9K\xbe\xf9\xea\x04\xbf\x05\x85\xec\xbe`A\xc9>\xbcF\x8f\xbc\x90\xdc\x0c\xbe%B\x1e\xbf\xf1\x81\x85\xbe\x18_\xd6>\x98\xab\xbd\xbe\xd9\xd6\x86\xbd\x7f\xc9\xd1\xbe\x1f\xff\xb9\xbe\x91i \xbf\xb7`\t\xbf\xc39\xbb\xbd\xd4\x84f\xbe\xd9s\xb7\xbeK\x9d\xf3>5\xf8\xe7>\x0f\x0e5>c`\xa3>\xa3l\x12>\x1d\xe2\'\xbe\x1c?\xc6:\xed\x12\x1c?\xa1G\xac\xbe\xde$\x14>p\x06\x91>\x11\x07\xaa=\x15\x1e\x14\xbf\x85z\x13?\xaf\xef\x87>\x05\x9ah\xbd\xd3O\xd8<)\xadu=\xa4c\x9c= >$>\x8bpE\xbe\x87\xbc*>\x8d\xcb\x10>\xb4\xa7\xa4>\xc1\xf4\x13>\xcb-\'\xba\xab\xe0\xcf>\xd8\xc5U>/*`>\xe7N\x87?=n\xba\xbe\xd9Z!\xbe\xf8\xcc\xa7;\t`\xdd>K%\xd8\xbda\x9b\xe2<\x8fv\x04?)\xff6>\x9c\xac\xbd>\xc7W\x87=\x1b\xfa/>\xd5\x83\xe4\xbe\x87v\xa0>Yu\x80=\xa4Z\x16>/\xd4>?J\x00 \xbe#\xb4\xdc\xbd[\xb9\x9e\xbeG\xad\xda\xbe\xfb\xc2\x90>;Y}\xbd!\x99\x03\xbe\xeb\xf2\xd8=\x0cW\xd2>yd\x19\xbe\x1cU\xfa\xbd<\x9er\xbd\x91\x1f\xe2=k\x95\xb6\xbe+\xd5\x12>\xe5/v<L\xab\xce\xbdw\x11\xb1=\x1b#\xf5>\xc4\xd4\xd7\xbe\xa6N\x05?\xc1~\xe0\xbdeD\x92\xbe\xdf\xe9\xe7>\xbc\xf1\x8f=\x8fh\xf3>\x97[\xfd>??J\xbe\x83 #\xbe\x981j\xbe\x9bJ\xae\xbe\x17<\x11?\xa7\xa09?\xef\xe2\xf2\xbdi\t\xcf>\x84\xc75\xbe[ha=\xb9q\xbb=c\x18!\xbf\xdf\xb9\xf3>r\xeb\x9f\xbe\xb1\x7f\x0b\xbf\x1cb\xac\xbe\x0b\xe2U\xbe\xb1~\x9e\xbeeg\xe4\xbe\xbb\x8e\x0e?\x9d\x1er\xbe78\xb0\xbep\xad[\xbe\xb2!\x17\xbf\xb7\xb4#\xbe\xbaM&?\xf8\x9e\xd7\xbd\x15\xcf\xc2<O\xf0C\xbfc\xe5\xed\xbeA]\x17\xbf\x19\xe2\x9e=\xa7\xb1\xf7>\x87\x1b\x0e>\xff\xf0\xa9\xbe\x8e\xf8\x98\xbe[\x18\x05?u\xbf\xef=\xbd\x9f\x15;U\x8e\xbd;\xa1w\'?"\xc8\x0c\xbfP\x93&>\xe9\xb8\xb5\xbeW!\xb5>\x05\xa1\xc9>\x85K\x00?\x13\x83+?\x1e\x07&?i\x974>\xe7=\xaf>\xd84k<'
-p400
-tp401
-bsV592592524084129792
-p402
-g2
-(g3
-(I0
-tp403
-g5
-tp404
-Rp405
-(I1
-(I200
-tp406
-g12
-I00
-S'\xe3\xb1\xa4=\x8b\x7f\xbf\xbd^\xf5\xe7\xbe\xc1~\xa3>\x90\x1f\x19>B\x9e\xcc=\x9a\xe2\xab\xbei\x88\x14\xbe\xffvQ\xbd~\xc2\xa4>\xb2?\x8a=\xfd@\xec\xbea\x8aU>\x92\xfc\xf2=\xc7\xf1\x88\xbd\x05\x99\xa7>4\xef\x83\xbd\x01\xd3\x98\xbe\xe2\xf7\x97=\x97|\x1f>?\xdb\x12\xbf\x89Q\x9a\xbd\xba\x8c\xee=\x1d\xdfS\xbe\xb6-\x0b\xbeH\x0cR\xbd@\x1c\xb9=\xda\xb0-\xbe\xf2\x15\x02\xbf[k\xac\xbd\xc2\xd7\x9e\xbe\xd86F\xbe\xa2\xc6\xa6>\xb8\xee\xce\xbe\xc0z$=+\x95/?\x18\x1b\x92\xbeo\x0e\xdb=\xb5\x9f\x8b>\xc8\xd2\xec>NY\xd2=\xbe\xa1\xd1>\xdd_\x80>\xff\x18\xff\xbepwu\xbe\x17\xec\x19\xbc\xf5\xc6\xd4>\xd37q>\x12\xb3\xfe=\x026\xe4>\x01\xc2\x0f\xbd\xe6\xd8\x14?\xfaL\x9d\xbe\x1eX=\xbe\xb2y\x1f\xbf\x85t\xd2>\xf93J\xbev\x98v\xbei!\x02\xbf"\xf5\xf3\xbe\xb1\xd5\xd6>GVR\xbdv\x92%\xbe\xc7\xef$\xbf\x85\xe1\x82\xbe\x8e\xd1\xe2>\xe0\xec\xc4\xbe\xfd*\xcc\xbd]\xef\xe3\xbe\xf15\xbd\xbe\x01\xce \xbf\xca\x81\n\xbfct\x8c\xbd\xf2\x15o\xbe\x11\xeb\xc4\xber \xfe>\x1f\xc5\xf8>\xe6\xea2>(\xe6\xa1>Q\xc3\x16>\x82\xee9\xbewM\x08;\xf8\x94\x1e?]9\xac\xbe\x80l\n>5q\x96>\xb1\xde\xaf=\x86\x02\x1b\xbf\xbe\xeb\x18?\x93)\x93>\xe7\xd7i\xbd~\xe08<5\x1f\x86=]\x86\xb0=p\x7f,>.\\L\xbe\x0b\xf5\x0e>\x8bu\n>{\xb3\xad>u9\x1f>\xfb\xc0\x15\xba\x051\xd7>MJb>\xf0\xc8i>\xc6\xb1\x8a?\x8d\x1d\xbc\xbe\xa6\x88%\xbe]1_\xbc[a\xe6>&\xb7\xdc\xbd\xc2L\x84=u\x92\x08?rF%>\xd2#\xbe>I\x1er=\x15\x8b8>`\x8c\xeb\xbeM\xd2\xa4>\x1bZ\x85=F\xcb\r>\x8d\xfbE?\xb3rD\xbeuX\xee\xbdb`\xa0\xbeBS\xdf\xbe\xa9D\x96>\xa0@n\xbd\xb9\xdb\x0c\xbe\x99\x9f\xde=\xd7\xd7\xd3>\x8f\xb1\x1f\xbe%\xcf\x19\xbev*\x7f\xbd\x85\xd8\xf7=\x1d\xa9\xb9\xbe\x83$*>(\xc6\xdf<~E\xc2\xbdJ\xe3\xeb=Z+\x00?{\xf0\xdc\xbe_\xd5\n?\xa6K\t\xbe\x91`\x8c\xbea{\xeb>\xcf\t|=\x01c\x00?k\xe9\xf6>\xab\xe6R\xbe\xd2\x846\xbe\xc0\x98\x80\xbe\xd31\xb2\xbe\xddn\x12?\x07\x18A?\x18V\xec\xbd\x99^\xdc>\xd1\x1f<\xbe%\xb3Q=\xb7\xde\xc0=\x8b9&\xbf\xbf\xd8\x04?\xf7\xe7\x9a\xbei\x0f\r\xbf\xf0D\xb4\xbe\xb3wd\xbe\x81\xe5\xaf\xbe^\xf1\xef\xbe_\xec\x11?]\x08\x86\xbe\xb5n\xb2\xbe\x8a\xa1W\xbe\x05%\x1b\xbfSi\x1f\xbe\x07\xdc.?6\x06\xcc\xbd\x1a\xcf\xbe<Q\x91G\xbfc\xf0\xec\xbe\xfd\x1a#\xbf\x1a\xcd\x91=\xd6\xbd\xfe>\x160\x1d>81\xad\xbe\x90\x05\x97\xbe(`\x02?\xb2B\xee=\xf3Po\xbbbv\xdb;q%*?\x96\x19\x0f\xbf6\x12%>\xfe\xe3\xc1\xbe\xc3~\xbe>\xc1\xc5\xc7>:\xea\xfe>\x0f\xc7+?Hi/?~\xc1/>i\xa6\xae>\x00%\xce<'
-p407
-tp408
-bsV580274854416531456
-p409
-g2
-(g3
-(I0
-tp410
-g5
-tp411
-Rp412
-(I1
-(I200
-tp413
-g12
-I00
-S"\x00>\xfa9\n{\xa5\xbdC\xee\x0c\xbfq\xec\x0b?;\x9b\xac=;\xbft>s\xbf\x11\xbf\x08\xae\x0c\xbeK\x99\xec\xbc\x81X\xf1>w\x06\x8c=EoP\xbf\xd3Jn>\xe5\xc7\x1a>\xdb\xe0\xbb\xbc\xb7\xff\xc0>s\x99\xe2\xbd\x97\x91\x03\xbf\xd4IN>\xad\xcb\x86>\x8b\xecR\xbf\xbc\xbc\xf3\xbd\x96\x12\x10>\xcd\xc55\xbe\x93\x8cS\xbe\x84\xb9\xa4\xbbI\xb9&=##\xeb\xbd\xb0o7\xbf\x87_b\xbe\x8d\x19\xff\xbes\xd5\x90\xbeM\xa8\xee>\x99\xf1\x05\xbf\xdf\n\x82=\xccW\x83?`\xe6\x05\xbfkz\xd6=\x01y\x97>;\xf5>?T C>x`/?)\xc3\x9b>\xe5\xe02\xbf\xe4S\xbd\xbei\xb2\xd0;\x83\x7f\x01?K\x1d\xd0>|\xf9,>}\x0c\x13?\xe7j\xce\xbdp-=?\xe4\xc1\xde\xbe\xdf\xf9\xa9\xbe9fW\xbf\xc7|\r?\xe8j\xa5\xbeS\x17\x94\xbe\xe5_ \xbf\x1f\\\x12\xbf'\xf7\x16?\x15\t\xd6\xbd)\x1ev\xbe\x83?u\xbfhH\xe0\xbet\xb6\x1d?\x10\xb2\n\xbf\x1d\xf3V\xbe/x\x15\xbfr\xcf\x16\xbf\xf7`H\xbf\xa7TJ\xbfu\r5\xbe\x8f\xc3\xab\xbe\xd6*\x12\xbf\xef\x048?\xd7\x94*?\xd8\xbai>\xff\x8f\x01?[\x0e\xed=u\xa7}\xbe\xae\x8b\x85\xbc\x9f\x15a?\x11\xb1\xed\xbe\xb7\xe4\x02>)\x99\xdd>g\xee\x89\xbc83S\xbf|_<?\xa9\x93\xd9>;(K<\xcc0<\xbd\x1a\x1f\x8a>\xdd\x0e\xc7=\x9b.\xa3=+\xb9\xb7\xbe}\x90->\xbb\x9f\x8b=\x03!\xf9>x\xd9\x95>\xe9\xcaT\xbd\xbec\x07?h\x13\x92>\x92k\x9c>s\x00\xcf?Qz\x01\xbf\xa8\xee\x98\xbe\x00\x01\xae\xbc9\x87:?\xe5\xfdM\xbe\x13\x1f\xb1=E\x10B?\xa1\xa5}>II\x15?\xa2\xf4\t>k:\x88>+d\x1d\xbf\xf0A\xc4>K\x83\xab=\x10AG>\x11)\x82?\x91v\xb3\xbe\xb5WJ\xbe\x91\xb9\x02\xbf\x7f\xbd=\xbf\xf3n\xb8>\x9b\xdd\xaf\xbcomX\xbe\x85\x7f0>\x9b\xff(?;w\x8d\xbeE\xe4\x8d\xbe\xcc\x1a'\xbe4\x90:>XB4\xbfs.@>\x03\t\x82=\x9b=2\xbes\xd1\n>q\xadL?X\x8f$\xbf\xd7\x8b<?\x81kC\xbe\x0b.\xaa\xbe\xd9\n)?\xe6C!>m\xe4;?\x90\xd11?\x19d\x81\xbe <\x9c\xbeI\xcc\xbe\xbeS\xf1\xfd\xbe|lZ?\xc9V\x92?=@h\xbe\xc1i\x06?\x80t\x84\xbe\xb3\xd7\xbc<\xb6\xdb\t>}\xa0}\xbf\x18\x92I?4L\xd0\xbek\x9eE\xbf+\x06\x03\xbf\x017\xa9\xbe? \x01\xbf\x01P\x0f\xbf\xc3\x8bT?\xd5\xb1\xc2\xbe\x86\x06\r\xbf\xcd\x1f\xc8\xbe\xc5\x9el\xbf\xf1\xe8\x96\xbe\x1d\x06a?\x1c\x8b_\xbe{$j=\x8e\xf8\x92\xbf\xd9\xfd$\xbf\xd0\xd8\x89\xbf\x99?\x84=\x85\xc3$?\x97\xc5U>\xaf\xa5\xf7\xbe\xbfQ\x01\xbf\xa3&E?\xa3\xb1P>K\x08\xe8\xbd-\x91\x03\xbd\x8f\x8b\x81?\xe1\x9f]\xbf\xe5\xb0\x1c>g\x85*\xbf]\x9b\x11?\x1dy\x11?S&(?\x05q~?\xcev\x8b?lE\x87>r\xd0\x10?gN\x88\xbd"
-p414
-tp415
-bsV582832493373599744
-p416
-g2
-(g3
-(I0
-tp417
-g5
-tp418
-Rp419
-(I1
-(I200
-tp420
-g12
-I00
-S')\x96\xc0=\xe6\xa2\x91\xbd\xe4%\xd8\xbe\xb3\xcc\xb0>\x05\x9e\xef=,\xfa\xe2=\xf4\xb8\xc5\xbe\x95v+\xbe\xcc\xcc)\xbd\x0eP\xa1>\x0e\xc3\xa8=\xd4\x00\xef\xbe\xc6\xe8I>\xc8\xf7\x10>\xcc_O\xbd\xd1T\xac>\\m\xa6\xbd\xf28\x9b\xbe\x1c=\x9b=T\xf5\x15>\x0eC\r\xbf4\x89\xbd\xbdw\xc5\x13>\xc2\xcfC\xbe\x1d\xb0 \xbe\xa4\x87\x00\xbdtVv=\xfe_\x14\xbe\xca9\x01\xbf\x19pr\xbd\xf3c\xa5\xbe\xcc\xec_\xbe\x86\x91\xac>k<\xb9\xbe\x9f7\x8d=\xea61?p\x9f\x8f\xbe\xac\x95\xaf=\xab\xdd\x8d>^F\xf2>;Y\xe7=\x1e\x9f\xbe>R\x9eo>3\xa7\x00\xbf Pr\xbe\xea\x8c?\xbb"p\xdb>!\x8c\x83>\x1e\xbf\xec=\xb4\t\xe7>\xdbaK\xbd\xca\xb5\x08?\x99u\x89\xbe\x10\x0cS\xbe{\x14!\xbf\xe2\xb0\xc6>\xfc\xe7D\xbe+\x04G\xbe{\xf4\x02\xbf\xbe\xeb\xea\xbe\xe2\xe2\xc0>\xfe9\xea\xbc\t\xda\x15\xbe\x15E%\xbf\x04d\x99\xbe\x97\xbc\xd9>H\x05\xbc\xbe\x81\xc3\xb9\xbdD\xbe\xd6\xbe\x96Y\xc4\xbe\xf8]%\xbfPg\r\xbfE\xd7\xdc\xbdb\xd3o\xbeU\xb8\xb4\xbea\x85\x01?\\\x96\xe8>\x03\x832>\x95\xd7\xab>\xf1\xfa\x05>\xfb\xc8,\xbe\xbd*\xd6;\xcb\xa7 ?\xcc\xf7\xb2\xbe%\x0c\x1d> \xd3\x99>E\xfa\xa1=\x0b\xe5\x17\xbf\xa4\x17\x14?\x13*\x8b>\x0b\xd9?\xbd\x1as\xce<\xaaT\xaf=\xd32\xcc=~\x86\x12>\xc6\xdeX\xbe\xeaR>>Mx\x07><\xbb\xa9>\xe8\x8f(>\xac\xff\x96:\xc7\xd7\xd1>\x10\x95^>\x98\xb8`>c\xe1\x8d?\xaa\x8b\xb3\xbe\xb1\xbe7\xbe\xaaG\x8c\xbb\x80\x83\xed>\xdbU\xe7\xbdy<[=\x8dq\r?\x8cbC>\xb9\x00\xc1>I\x82o=\xc6P;>!\x0f\xe2\xbe\x19\x9f\x9f>>\x14\xa2=\xf4E\'>!qB?;\xae\x1d\xbe\xec\xe0\xde\xbd\xa9\x82\xad\xbe\xe4\xeb\xea\xbe\x16\xd3\x8f>\xb1\x1d9\xbdu\xa3\x08\xbe\x90\r\xe7=\xd7+\xe4>\xb3X\x1f\xbe>R\xff\xbd\xcb*\x94\xbd\xac\xa9\xf0=<\x85\xc4\xbeL\x91\x17>\x08\r\xd3<,\xd7\xf2\xbd\x08\xe0\xae=)6\x03?{\xaf\xe7\xbe\x81\xd0\x08?\xf2\xa9\xfb\xbd\x94=\x93\xbe`\xce\xe4>\xe0\xc0r=\xacf\xfc>\x9a6\x00?\x10\xaaG\xbe\x1d\x88"\xbeG\x85p\xbe,\xc0\xb3\xbe\x04\xa4\x17?\xdd\xd5@?7.\xef\xbd*\x11\xc7>\xf3\x91-\xbe\x7f\xf5/=qm\xb8=\xdf\xaa$\xbf\xfcG\x01?D\x82\xa1\xbe\xd9\xa8\x0e\xbf\x87\x86\xa0\xbe\x95bd\xbe\x9b\xd8\x9a\xbe5\xc4\xd6\xbe\x9c\x98\x15?\xc3w\x84\xbe>\x1f\xc5\xbe\xe4\xfex\xbeg\xcd\x1c\xbf\x99\x8d%\xbe\x156$?\xce>\x07\xbe\xd7\xbe\\<!\x8eK\xbf\xc9\x1f\xed\xbe\xe9_"\xbfX=\xaf=U@\x00?\xc5\xd0\n>e\xfd\xa9\xbe\xa5\'\x9e\xbe-\xb9\x08?C\x0f\x11>\x92KF\xbbt\x8a\xaf:\x1b\xa3-?@\xe6\x15\xbf\x8b\xb4\'>\x15\xf0\xbf\xbe\xd1`\xb5>\x9e2\xd3>\xe3\x07\x02?\x1c\xf9/?\x17<2?\xe3\xe2C>T\x98\xbc>\xc4\xc8\xd4:'
-p421
-tp422
-bsV580712034842574848
-p423
-g2
-(g3
-(I0
-tp424
-g5
-tp425
-Rp426
-(I1
-(I200
-tp427
-g12
-I00
-S"S\xfd\xdf=\xee\xd5\x18\xbd\x11\xa9~\xbe\xe9\x1c\x01>\x1d\xc1\xdd=\x1b\x9e\x1a=\xa1*\x1f\xbe5<\xd9\xbd\xdci\x05\xbd\x03\x0c3>\xba\x1b\t=poA\xbe\xf38\xe3=\x14\xc0l=\\\x88C\xbd\x9a\xc9K>\xbf\xad(\xbd\x9c\xae\x13\xbe\xf9\x83\x9a\xba\x8d/_=\xbfY\x88\xbe\x1b\x83\xcf\xbc\xe1\xa3\x8f=!?\xea\xbd\xe3\x12\x80\xbd \t \xbd\x8eZ\x8f=\xa0\n\xdb\xbd\xd7`\x84\xbeDw\x1a\xbce\xe3\x08\xbe7 \xc8\xbd\xe6\xf7\x18>\x9auY\xbe%\xd3\xde<\x05\x03\xa8>\x89\xca\x9a\xbd\xb4,~=\xd0\xb3/>\xe5lR>\xa4\x1b\xfb<\xf9\x02\x16>\xd1h\x13>\x8e\x87{\xbeC\x84\xff\xbd\xe3_\x97\xba1\xec}>l\x04\xd7=\xe5\x12R=}\x90\x89>\xb1\x06E\xbcW[\x9a>\x17\x06\x1e\xbe\xf5Q\x97\xbd\x8e\xed\xae\xbeO\x1bL>u\x1c\x9f\xbdI\t\xcc\xbd\x0c\x8e\x9f\xbeQj\x8a\xbe\xef{X>\x1dk\xa3<f?L\xbdu\xdb\x9c\xbe\xdd \xef\xbd\x8dz\\>}FD\xbe\xa2\x7f\x9d<v`R\xbeJ\x003\xbe\xbb8\xb4\xbe\n\x07\x8e\xbe*\x12.\xbd&7\xef\xbdo\x124\xbe\x86\xber>\xb0pd>c\xc9\xd3=Et\x1f>\xfc\xba\xc7=\x96I\xa9\xbdS!\xf7\xba\xd6\x90\x9e>&U6\xbev.\xb9=\xd2#\x0e>\xd9\x13\xac=\x19\x99\x97\xbe\\\xbb\xa5>\x8e\xb8\x06>=\xd4B\xbd\xabH\x1c=\xaa\x9c\xb8\xbc\xa6f\xd7<L\x88\xf7=\xa5\xef\xa3\xbdC\x87\xc5=\xa7\xc5\xdf=P\xf8'>e\xbaD= \xfb1<\xceOb>\x8ei\xda=P\xec\xec=Zz\x06?=\xd4I\xbe\x85\xd1i\xbd\xbc\x15\xa1<\xb4\x04=>\xcd\x07?\xbd\xf23\x80\xbc\xfc\xa0\x85>\x96M\xcc=\x86\x1eC>\x00F\xe3<\xb5v\x97=V\x11x\xbe\xb0a=>\x90\xe2#=\xfa\xd1\xa0=p\xca\xcd>\x14\x83V\xbdb6@\xbd\xe6\xe7\t\xbe\xc3\xe98\xbef7!>\xbf\xe5Y\xbd\xe2!6\xbd\x82\xc9G=\xa3\xc1C>M\xd5e\xbdbx.\xbdN\x1d_\xbc\xb5\x08T=FI\x07\xbe;\x84\x91=\xaan\xed:s\n.\xbd\x94\x83)=\xd2\xb7X>\xde\xd9L\xbe\x9b\xcb\x8f>\xe0b\n\xbd\xab\r/\xbew\xcfz>\x83\x8a\t=\xaa'l>mc\x87>\x9b\xd4\xea\xbd\xe3\xd2\x93\xbd\xe4&\xcf\xbd\xd1\x815\xbe\xf1\xc4\x8e>e\x90\xb1>\xa3BO\xbdv%h>\xe5\xb2\xc5\xbd)\x8c:=\x8f\x17J=\xe6X\xa2\xbe\xdd\ra>\x12\x1d2\xbe\x85I\x93\xbe\xceN2\xbe\xc0s\xb7\xbd\x0c\x93\x1a\xbe\xf4\x1c\x85\xbe\x13\xe9\x92>\x82\xa9\xd6\xbd\xb4\x03&\xbe\xcc\x96\xac\xbd\xf9\xea\x91\xbe\x0f\xac\x99\xbdN\xc6\xbb>S\xe2\x12\xbdv\xeb(<n\x83\xc2\xbe9v\x86\xbe\xa6\xadw\xbeN\x8aE=\x96\x91\x7f>\xe6\x07\x91=+\xca2\xbe\xeeD\x10\xbeQt\x86>\x0e\xa9/=\xad\xae\n=],=<T\x92\xa8>\x10T\x89\xbe\xe4\xd2\xcd=\x1d\xb2\x15\xbeb\xd71>[\x9dO>\x8e\xbf\x8c>=\xb3\xb1>\xf6\xe0\x8f>\xda@\xb7=\x1d\xe9\x1c>\x90^+="
-p428
-tp429
-bsV578805583916089344
-p430
-g2
-(g3
-(I0
-tp431
-g5
-tp432
-Rp433
-(I1
-(I200
-tp434
-g12
-I00
-S'\xff$\x8c>\x1aG\xdd\xbd\xae\x08\xce\xbe\xc6\xb6\x9a=\x8c\xb6\x89>\xff6\n\xbeZ\x8d\xbb\xbd\x9d\xc8e\xbe\xa6!\xaf\xbdF<\xe6=\xef\xd4\xc7=pQ\xd0<RyM>\n\x9b\xdf=\xc5\xa1\xeb\xbd\xeb\xf4\xa2>\xb4\x07\x01\xbc{\xc6n\xbd]\xd1\xa3\xbd\xa1\x1e\x19=\xea\x0e\x92\xbeBO3\xbdV\x12\xf0=w\xc9\xba\xbe\x00\x8c`\xbdT\x82\xc4\xbd\x92\\(>\x1a\x86\x94\xbe~\xee\x89\xbe\x1d8?>=\xe8e\xbd\x05\xb4\x10\xbe\r\xf2\'>y\x8c\x82\xbe\xaan\xd6<Rk\x99>A\'1<\xc4\xdf\x13>\xb0@\xab>\xbe\xa8\xf3=U\x03\x0b;\xfe\xf0\xa3=\x1cl\x89>\xf7\x9e\xa3\xbeRb\x10\xbe\xe8\xe6\x05\xbb\xaf\xdf\xbe>\xfe\xcc\xdb<\x1ea\x9e=\xca\xea\xb9>\x85\x06\x87=H\xd1\xdc>\xe0\xd67\xbe\xfc8\r:\x8d\xfb\xd6\xbe\xdc\x88\x8b>\x03\x18\x1b\xbd15<\xbe\x00g\xda\xbeHP\xd8\xbejc\x80>q\xf0\x14<\xa0\x82b\xbdx\xf7\xa6\xbe\xaa%\xaa\xbd-r\x8c>\xf8}$\xbeV8\x9e=\xb2A\x9d\xbeV\x15\xf0\xbd\xd1\xe9\x18\xbfR\xa3\xa4\xbe\xdb\x8b\x9d<\n\x93\x04\xbe[n\x16\xbe\x18\x1a\x9b>\xdd\xb1\x86>\xca\x97\xf6=\xbdY\xf9=&Ce>\xe6\x8d\x08\xbe\x7f\x93\x81<\xbe\xb3\x95>\x98\x86=\xbe5\xbb$>\x92\xa6">\x8f\x02\x9f><\xb5\xbd\xbeB\xa9\x00?\xf3A\x0e>\xc5\x8c\xe1\xbdt`\r>P\x97p\xbeJ\xcd\x87=\x89\\\x90>_\xcc0<\x07\xfd\x11>2\x11{>V\x96+>\xfcc29\xc2\x9f\xe7=\xf7\x9e\xb5>x\xfe\x08>\xfa2&>\x05S\x0b?\x10Yi\xbe\x19N\x98\xbc\x02M|<\x92\xb1\xb3=>\x88\x1c;\xe8X\xb3<w\x93\xa3>\xd6\x8c\x11>*<0>zsh\xbd\x0e:)=\xaa\xdd\x9a\xbe\xb3`\x9a>\x06Y\xaf=a\x03\x06>\xd4H\x10?\x08n\xd1<\xdac5\xbd\xb2\x13G\xbdz\r=\xbd\xb8\xedg>s\x9d\n\xbe\x92ho\xbb`\x851=z\x921>F7J=\xcemE=\x03s\xab=\xf0uQ=\xb2i\xb3=\xf24\xe5=\xfe\x92\xa9<\xd1^\xbd\xbb\x16<\xea=\xa8>\x15>\xf0\x8aV\xbe\x965\xc4> c\xfc\xbcR[\x92\xbe\xca\xceo>\x0b\xb2\xb5\xbdNY{>\xf3\x83q>n\xa6\x1b\xbe\nP\x19\xbd\xcb\xc2\xce\xbcj\xc6?\xbe\xc1\xb2\x82>\x81\xd6\x9b>\xe2T-=\xb9^\xb0>M\xc8\xbf\xbd\x9f\xaf\xbe=\x0b\x94\xb4=\xb9\xde\x87\xbe\x10{\x8c>6\xe9}\xbe\xab \xa7\xbe\xb4\x01\x0b\xbe\x05\xc4\xbb\xbd\x98x\x12\xbe\x01}\xbb\xbeJ\x8f\xa2>\x93h\xcc\xbdl\t\x0e\xbe\xf8\x14w;\x0e\x80\x80\xbe~=F\xbc=\xbb\xfc>S\x8e\x97<\x97\xc8\x12\xbdt\n\xb3\xbe&\xa7\x9e\xbeb\xef\x89\xbd\x1a\xcb\x96=\xd9}\x95>3\x00C=\xfa\xfc8\xbe\xbc\x96\x11\xbd\xf66L>\xfe\xb9\xcc<\xe4\x06F>\xca\xf7@=\xacz\xa7>B\xff\x8e\xbe\xbd O>R\xcf4<\x0b\x80&>\xbdRw>.\x11\xaa>\xafl\xa5>\xd8\x0fD>\x8fC\xab=\x1e\xddf=U\xe9.>'
-p435
-tp436
-bsV592593781179953152
-p437
-g2
-(g3
-(I0
-tp438
-g5
-tp439
-Rp440
-(I1
-(I200
-tp441
-g12
-I00
-S'-\x8eA>x\xfbp;\x00h\x8f\xbe6\x8b\xc4<\xbb\xfe*>\x1fAX\xbd\xc8\xd8t\xbd|u\xfa\xbd\x16`\xe2\xbcH\xeb\xe5=\xb5\x96\x85=\xd2\xfan\xbd:\x81\xd7=\xace\x9b=Q\xed\xd6\xbd\x0e\x8d>>\x94\xf49\xbd\xe5\xb2\x90\xbd\x12\xd3\xce\xbdp\x12i\xbc\x12z\t\xbe\x1b\x1az;\xd7\xf1\xcf=\xd6\xdd\x03\xbe\xe0\x00\xaa\xbc\xfd\xa1\xbd\xbdhv\xd4=\x19\x93\xf7\xbd\xed\xd0\x1b\xbe\x90O\xf1<\xee:\xc9\xbdH_\xd3\xbd@-\x01>\xf3\xdb^\xbe\xe9\x90\x16\xbc\xb97\x80>\xaf\xaf^<Nz\xe8=?\x00c>E\x19\xfd=\x06\xfd-<>\x9e\xdc<_\xac\x00>\xd5\xc88\xbe\x1d\xe4\xdf\xbd^J\xa4\xbcMX\x8c>\xcb\x8d\x19;\xe2\xb5\x0b<\x9f\x0e\x99>/8\xef:\x06\x81\x97>\x8a\xd4\xb0\xbd\xa8\x0b\xf4\xbb\x7f\x9b\x8a\xbe\xa2\xd1\x08>\xdf =\xbc\xc2\xd4\xc3\xbd\xbc\x9b\x97\xbe\x12\x9b\x9a\xbe\xf9\x9b/>\xcaAq=\x9f\x9fl\xbc\x06\xae\x1e\xbe\xeb\x16\x1c\xbdO"!>\xba@<\xbe\xe6\xcc\x80=;\xdc1\xbe\xd5\x04\xcd\xbd\xa5\xbf\xc1\xbe\x8d\x01<\xbe\'\xc9\x9d\xbcG@\r\xbeHD\x15\xbeuL\xf7=\xe3\xf2\xfe=R\x95\xbe=5H\t>\xeb\xd5\xcd=\xdb\xbd\xc1\xbd\n\xe4#<\xfe\xb8\x83>1P\x07\xbeK\xde\x07>\x86N\xd9=\x87R4>\x07\x89\x8b\xbeg\x91\xad>\x94&\x88=\x0e\xf6\x01\xbe\xda\xcf\x03=/\xdcK\xbe\x02\t\x86=\x10\x84U>\x98\xe6t<<X\xe3=6\xa0">ta\xd4=\xdc6\x1f\xbd\x081\xd8<\x00{\x81>\x15.\xca=I\x04\xc8=\xa1\xd8\xac>\xf3\xe6\x1f\xbe\x92\xb2\xcb<\xc5\x8cS=\xae8\xbc=\x98\xe0\xd9;\xe1P\x93\xbd\x07{\x1e>\xef\x05\x00>\x7f\xd5\x01>\xa6\xd6\x1e=\xa2\xe3J\xba\x03\xa9u\xbe+gh>=\x91\x9c<\xe8\x19g=\xfa\xb8\x9f>kJ\xbd=\x1d\xb2l\xbda$$\xbd\x80#\xd8\xbd`\xb9\x0e>*\x98o\xbdE4\x80\xbc~\x0fE=[\x08\xb4=\xc2\xd5(=*=\x9d=|\xd3\x18=\xd8\xc9\x01\xbc2@\x81\xb9\xa1\x0f\xae=\x1enk\xbd\xf0Y\xf2\xbc\x89\x0e\x1e\xbc\x9c\n\xf6=H\x99\n\xbem\xe5P>H\nc\xbd\xaa$M\xbe\xd5{;>=\xa9z\xbb:/7>z~z>\x19\xee\xb5\xbdW\xf8g\xbb9\xca\xd2\xbc\x17\x1b\x07\xbe\xaa\xa3W>\x95\xd1[>\x80j\xb2<\r6\x8a>wl\x9b\xbdc\x18b=p\n\xa2=Ip6\xbe?\x9a\xb7=\xdd\xf0 \xbe\xde&f\xbe\xe7\xb1!\xbe\xfa\x9d\xa2\xbd{#\xcb\xbd\xda\xd5\x90\xbe\x0fVg>\xee=\xd2\xbc\xe1_\xfd\xbcab\x05\xbc\x11DB\xbeH\xb3\x06\xbd\xd2\xab\xb1>\xc9B\xab<fn\xad<D\xab\x86\xbe\x0e\xbe\x8a\xbe\xae~n\xbd\xf5\x02\x9f=I\x14\x8d>\xa0\xea\x92<\x80\x1c\xb0\xbd\xf3\x9c\x87\xbdm4\x1f>SP\xa5<X\'\xd7=$"\xae\xbbo3I>\xe4\xd3\x01\xbe#:&>\xf3\xd55<\xfbT\x17>\xbb#;>:\\\x94>\x9d\xc5}>\x13R\xc4=L\x83\xbf=5gJ=qB\xa9='
-p442
-tp443
-bsV580910524793245696
-p444
-g2
-(g3
-(I0
-tp445
-g5
-tp446
-Rp447
-(I1
-(I200
-tp448
-g12
-I00
-S'\xbfM\xc0=\xe1\xd0]\xbcN:\'\xbeZ\x12\xa3=l\x85\xae=\x9a\xfa\xc4<NB\xcc\xbd\xc5\x90\xae\xbdt\x8f\xad\xbc\x1b\xae\xff=%\x99\x9b<\xc47\xf0\xbdAt[=\x03\x1c\x02=\x9c\xa3\xee\xbc\x948!>\xb7\x18\x07\xbd\xfb\xf3\xb7\xbd_\xe1\xa4\xbc\x99\x9dw<,7&\xbe\\\xeaf\xbc4C{=\xd2\x94\x81\xbd;\xb9?\xbd\x81G\xb9\xbc*\x91Z=\xc5\xde\x7f\xbdQ!(\xbew\x80\x87\xbc \x9d\xbb\xbd\xca\xfa\x89\xbd\x8e\xec\xb1=\xf5\xed\x14\xbe\xfe\xba\x0c=\xa5\x06_>\xc25U\xbcKSC=\x15\x0e\xfc=\xeb\xec\xf2=#f\xcd\xbb\xd7\xbbm=tP\xb0=\x9e\xbc\r\xbe^\xff\xb0\xbd\x15k\x8d\xbb\xa1\x8c6>\x90_\xa2=\x88k\x1a=\x1c\x8bG>\x7f\x83;\xbc\x1f\xccD>~\x91\xc0\xbd\xa8\x101\xbd\x0b\xdap\xbe\xc0\x13\xef=\x99\x00+\xbd\x00\xbay\xbd\xc6\xb4a\xbe L7\xbe\xb7\t\xed=G\x80Y=\xfc\xe9\x13\xbc\x85`9\xbe|\x17\x87\xbdk\xe9\xf6=\xbf\xdd\x04\xbe\x9fJ)=\xd5U\xe0\xbd\xb9\x11\xf5\xbdG\x9ap\xbe\xfd%9\xbe\x9f\xa6#\xbdQ\x83\x8f\xbd\x80*\xd8\xbdo\x94\x10>\x92~\x08>\xbez\x98=3M\xdd=\xde\xa7\x84=\xa4\x0f\x17\xbd5\x01\x94\xba\xd4\x9fC>\x83\x18\x01\xbe~g\x83=\xf5\xd7\xaa=D\xd8d=\xa6\xb0A\xbeK\xe1c>\x19H\x85=\xa5\x1e>\xbd7\x0c(=\xe7\xd8\xcf\xbc\x06\x8d(<\xb7\xac\xbc=\x89UL\xbd\xae\xde\xbc=\xec\xb0\xa6=\x9cv\xe5=\x13^\x15<\xca\xa6\x8a;\x8c\x1d\x0e>\xe7\x82\x85=4\x08\xa5=\x98\x1b\xad>]\x0e\r\xbe<\xbe\x04\xbd\xc4\xa1\x06=\x0bS\xea=\xe49\xb5\xbc\xf3\xc9=\xbd\xa8\xd3\x1c>\x01\x82\xa2=\x05~\xfc=a!\xc2<\x0epY=\xd6\xc2-\xbe\xdb\xbe\xe9=\xd80\xbf<\xa4\x926=MG\x85>\x14J\x15\xbc\x95=\xea\xbc;\xdd\xa6\xbd\x06\x8b\xe2\xbdz\x82\xdc=\x04\xf7:\xbd\x8d@\x9a\xbcn\x8c\x04=\x0b\xf0\xf9=\xb96\x02\xbdQ\x7f\xb0\xbb\x8f\xad\x07;\xb4T\xe3<\x16\xf4\x95\xbdL\xbf0=e#\xac\xbb\x04]\xc7\xbc\xce\x91\xd2\xbbG\x06\xef=_\x92\x06\xbe=:7>3M#\xbb\x84\xa2\xfb\xbd\xdb<.>\x89@\xee<,\x83\x06>\x16)M>\x14\xce\xa2\xbd\xb3\xc8\xa2\xbc\xb0\xb6R\xbd\xb8\xb7\xd8\xbdI\xad1>\xf9.S>\x1c\x06\x08\xbdH$\x1a>\x9b\x03\x8e\xbd\\3\x14=Lg\x16=\x8c\xd1K\xbet\xb5\xe0= \xd7\xf0\xbd\xc5\x8eJ\xbe\x88\x94\xe2\xbd\x04l2\xbd<"\x96\xbd\xab},\xbeI\x15@>y\xa6h\xbd!\xd4\xcf\xbd\xc5;k\xbd\xda94\xbe\xe9\x8dn\xbd)\xe2q>\xb7\xa8\x97\xbc\xf4\xc5\xb4<N\x08w\xbe4>5\xbe)\x86\xee\xbd?\xdfN=\xc3\x82*>\x7f\x01?=\xd2\x86\xee\xbd\xf6\x8c\xa9\xbd7\nK>\x9f1\x98<\x9e\xab\x0e=w-$<\xfaNN>i\xa5$\xbeT\x91\x93=ly\x9a\xbd\xb3F\xc7=\x8eW\x06>\xec9C>\x9e\xa2d>\'\xb4\'>G\x83o=m\xa0\xca=\x98\xbd<<'
-p449
-tp450
-bsV580901961391849472
-p451
-g2
-(g3
-(I0
-tp452
-g5
-tp453
-Rp454
-(I1
-(I200
-tp455
-g12
-I00
-S'\xf6\x97\xb7=\xb8\xf3\xac\xbc\x15\x91\xab\xbed\xae\x81>0-\x08>\xa5\x181=c\xd0]\xbe&\x85\x19\xbe\xe2\xce\xaf\xbcJ9`>\x92\xfb3=}\x87\xa6\xbe\xedV\xd4=\x9b\xbc\xc2=\xb0\x89=\xbcz\xf0\x8f>,(e\xbdn\x06U\xbe3]\xa4<X\xf2_=\xe0\xa2\xb6\xbe v\x95\xbd\xf3[\x07>\x10\r\xcb\xbd"\x06\xa7\xbd\xc5\x07\x08\xbd\x9b=\x84=\x16\xf1\xd5\xbd\xbd\x8d\x94\xbe\xefu\xc1\xbdf/\x88\xbe\x12p2\xbe\xb6iK>\xc9E\xab\xbe\x12\x1d\xf8<\x0b\x9a\xfe>H\xd5%\xbe\x82\x19\xfe=\xe0,R>\xc2A\x97>\x88\x88|\xb7[Wg>Z5\r>\xd4\xa1\x96\xbe\xb1bp\xbe\\\x05\xa0\xbc\x9f\xaa\x99>\xfa\xd17>\x1c\xba\xdc=\xea\xff\xa9>\xe9\xac3\xbd4\x97\xcc>"|7\xbe\t\x96\xcc\xbd]_\xd8\xbe\x08\xe4q>\x00\x19\x19\xbe\x8a\xd3M\xbeT\x89\xb6\xbei\xd8\xb7\xbeh\x19`>\rs\x08<\xe5\xc3\x91\xbd\xa8O\xe5\xbe\x97\xff\x08\xbe\xbf\xc9\x90>1\xe4\x84\xbe\xbdi?\xbd\x8f\xfb\x85\xbeBN\x98\xbe\xa8\xd1\xf1\xbeO\x15\xd0\xbeMz\xd1\xbd\xbf\x8a\x18\xbe\xe7H\x87\xbe\x7f\xc1\x96>b\x82\x9b>K\xb7\xfb=\xbf\xf9\x8b>\x91\xf2\xe5=\x15\x91\xcc\xbd\xc6\xb0l=\xcdp\xd3>\x99\x96z\xbe\x85S\xd1={:A>\xad>\xa7=]\xcb\xe1\xbe\xd6T\xff>g\xfe\xfa=\xae&\xb4\xbd\xbaT\x13=\x9d\x16\x03=\x95\xd1\n=\xba\x18\x11>\x0c\xba\x0c\xbe\xb2\xf75>\xa3<\xce=\xfc\xdd\x89>/\xbb/=39\x9c\xbcG\xec\x96>\xf0~\x1d>\xd6\x9fP>\x05\x95I?t\x1e\x88\xbe\xba$\x0f\xbe\xb7\xb8@=W\xa5\xa0>_Ds\xbda\x16\xad\xbc\xf6V\xa7>O5#>S\x11\x84>0\x0fq=\xd2:\xe6=\xed\xec\xaf\xbe\xdcEY>\xe4\xe0\xc1<\x8a\x92l=\'\xc7\x11?[\x1d\xb6\xbd\x10\xe4\xb1\xbd\xbc3V\xbe\xd3\xc8\xa7\xbe\xe4\xa0R>2!\t\xbdP\x1bN\xbd\x85\x97\xd2=p\x0b\xa2>6\xc7\x9b\xbdk\'0\xbd\xe7^,\xbc\xe4\x0c\x8c=i\\\x85\xbe\x01x\n>\xca?\xa2\xbbh\xab \xbd8\x16\x07\xbc\xfd\xc6\xa1>5.\xaa\xbe\xff\x80\xcb>~3\x84\xbd\xc9\xbbi\xbe\xfc\xfc\xa9>\xe5\x1c~<\xcb8\x92>+c\xc8>\x1f<\x03\xbe\xe8n\x95\xbd\xfeM\xe8\xbd\xfdgK\xbe\xdb\xfe\xca>2M\xf8>\xc4\x97\x9d\xbd\xa9\x80\xaf>\x9c5$\xbe\xda\xa1\x15=\x1c2\xfd=r\xcb\xe6\xbe\xdd\x8e\x94>\xf4pc\xbe\x1fe\xe4\xbezv\x89\xbeLF\x10\xbe\x89\'3\xbe"\xd7\x9c\xbe6X\xd4>\x86\xf1\x19\xbe\x11\x8am\xbe\x04\x80\x1c\xbeo\xce\xe7\xbeY6)\xbec\x1a\xe3>u\xa0\xa8\xbd\x13\x83y=I}\x08\xbf\xe6\xe4\xab\xbe\xb1\xe5\xa8\xbe>o\x9e=\x12!\xc5>v\r\x90=\xdci^\xbeE\x12 \xbe\xdd\x83\xd1>\xaaJ\xda=\x1d\x04A=\xd3\x9d\xd9:\x02k\xed>\x01=\xcf\xbe\x99\xbe!>\xa9\xf7Q\xbe\xdd\xb8\x83>\x03\x8b\x90>\xcdT\xc5>\xb9\xe8\xe3>}\xcc\xd8>\x8f]\xed=\xcb\to>\x97\x8eW\xbd'
-p456
-tp457
-bsV577441698122432512
-p458
-g2
-(g3
-(I0
-tp459
-g5
-tp460
-Rp461
-(I1
-(I200
-tp462
-g12
-I00
-S"\xb2\xd1\x1c>\xcf\xf9\x8f\xbdP\xa0\xa9\xbe\x9e\xe6#>\xe5\xb6\x17>;\xaed<\xc2\xc4?\xbe\x15\x08\xff\xbdW\x94\x98\xbc\x8a\x11q>\xbef\x88=\x86\x03X\xbe\x97\xeb\xe3=Zf+=X*\x80\xbdR\x9f\x84>>\xad\xf5\xbc\t\xd55\xbe* \xee\xbc\xf1kR=b$\xa2\xbeG\xe7\xd3\xbc\xe9\x9e\xb5=\x95\xa5\x1d\xbe\x99\xa4\xde\xbdR\xe7\x8b\xbd;|\xcb=k(\r\xbe\xc7<\xa8\xbej\xfcs\xbd'F3\xbe\xfa\x8f\x06\xbe\\\xa07>j0\x96\xbe\x9a\xab\x1d<$\x92\xdf>t\x0c\xa4\xbdbb`=\xa7.e>Gyz>\xd7$\xb0;\xd46$>\xe7\x8c\x03>\xbf\xe2\x94\xbe\xbe\xde?\xbe9\tM\xbc\x9fc\xb7>\x85#\xff=\x1b_\x97=W\xa5\xaa>*s\x99\xbc \xa0\xca>\xebfj\xbe\\6\xe0\xbd9\xe0\xd1\xbem\xbe\x80>\xe0q\x8f\xbd\x1aG\x1f\xbe\xf2\x00\xc0\xbeb\x98\xb2\xbef\x11\x81>/\x9a0=\x1a\x83\x1e\xbd^\x04\xa9\xbe\x199\xf0\xbd\x04\xd2\x92>\xfd\xb4\x81\xbe\t_\xec<!q\x97\xbe\xdaQp\xbe'\xe3\xdf\xbe\x01\xa7\xa7\xbe\xbf+U\xbd\x86\x160\xbe\xa6\xabu\xbe\x84\xb3\x8c>\xbf\xfc\x91>\xc4\x82\x1a>&\xf5B>\xbe\xba\xe9=yH\xe9\xbd\x0cyV<\xd7\xdf\xc6>\x92\xe3f\xbe?*\xd1=\xbb\xfe\x13>\nJ\xb3=P\x9e\xc5\xbe\x1c\xc9\xe2>D\xfc!>\x05\xfc\xb5\xbd\\>\x86=W]K\xbd\x1d\xdc\x91=z\xec>>e\xa6\xf2\xbd>L\x13>\xc3\\\r>&\xf5v>\xf7\x8eM=\xeb\x1d\xa9\xbc\xb4/\x99>\x8a\xaa$>\x92h\x04>(\xbf\x1a?\x8c\x0c\x88\xbe\xecPl\xbd!\x06\x16=\xf6\xfeu>Z\x90\x90\xbdV\xf2\x81\xbdY\xf9\x86>\\\xee\x96=\xf0\x08c>2\xad\x99=\xd6>\xfc=/ \xae\xbe'V`>V*\x13=\x9a9Y=~\x98\xff>\xf2\xf6\xf6\xbbU\xfeC\xbd\x86\x12)\xbeQHl\xbe\xb9\xb4q>e\x04O\xbd\x94 A\xbd\xd2\xe5.=6\x94\\>\xe6\x94w\xbd\x06!\xe7\xbc\xba\x90o\xbc\xf9\xb0q<tr4\xbe/\xde\x04>B\x9e\xbf\xbc\x0b\xb9\xee\xbcdo\xaa;\xe6\xf0|>\x0e{\x83\xbe\xa2\xc4\xaf>\xc7\x00G\xbd\xe5Km\xbe\xa2 \x92>,\x1e\xe8<\x1b\xf9\x92>\t\xbb\xbc>*\xdd(\xbe\x8c\xc3\x83\xbd\x0b\x13\x16\xbee\x84G\xbe\xe0~\x99>\xbe\x8c\xd2>\xac>v\xbdw\x8f\xb0>\x8e\x81\xec\xbd4b2=~\xf9\xa0=\xd2<\xc7\xbe\xa1\x01\x7f>w\x112\xbe\x19\xcc\xbc\xbe\x9f\x84w\xbeR\xe6\x04\xbe\xd9\x99,\xbe\x07\xfa\xbd\xbe\xae\xd3\xbf>t\xac%\xbe\x8e{'\xbe$\x80\xd0\xbd$\x05\xb7\xbeLi\xaa\xbdMN\x06?\xae$]<\x03\x9e\x06=i\x18\xe8\xbe\xa1\x05\xa5\xbe\x8f\xb1\x94\xbe\xb9\x99\xd4=q\x83\xb3>n&\xd0=\x8e\xe3P\xbeK\x8b0\xbe\x01\xfa\xac>\x91\x98\x9f<\xffV\x95=\x10>\xf2<V\x82\xc3>:h\x89\xbe0\x10\xe8= \xde\x16\xbe\xc2\x8df>\xdf\n^>;,\xa9>I\xc8\xda>\xc1\x96\xac>\xce\xa7\xfe=yAC>\x8fU\xa9<"
-p463
-tp464
-bsV580689385630392320
-p465
-g2
-(g3
-(I0
-tp466
-g5
-tp467
-Rp468
-(I1
-(I200
-tp469
-g12
-I00
-S'3\xda\xd5=\x02W\xa3\xbd\x81\xc7\xd7\xbe\x86]\x8b>d\x10\x16>\x9f^\xa7=I\x88\x9c\xbe\x7f\xbd\x13\xbe\xa9\xed\x17\xbd%\xbf\x96>J\xc9\x88=Vn\xc6\xbe\xef\xe8:>\xdfD\xcb=a\xcb\x80\xbd\x055\x9c>\x19\xa9h\xbdO\xbe\x88\xbe\x9d\xffT=\xbaP\x06>\xfd\xe9\x01\xbft.\x91\xbd?\x8b\xea=\x14>Q\xbe\xb6P\x06\xbe\xd9$D\xbd\x9a%\xbd=dX%\xbe\xfe\xe8\xe7\xbe\x8byy\xbdr!\x82\xbe\xf6\xb0<\xbe\xc9l\x94>\xd4b\xba\xbe\xc2k\x11=\xa0A\x1e?A\xdfi\xbe\x04%\xc6=\x917\x85>]h\xd0>\x83\x96\xa2=wj\xb4>\xc2al>CN\xe4\xbe\xe1\xd8^\xbe\xb4\x89\xb48\xecd\xcc>\x0b\x17P>\xf4\x8a\xdb=\x1f\x9a\xd7>y\x17\xf0\xbc\x0f\xa6\x06?\xf4\r\x91\xbe\xb3\x10$\xbe!%\x13\xbf\xa3\xee\xbe>_>!\xbe\xc4\xdeQ\xbeE,\xf2\xbe\xff{\xdf\xbew1\xc4>p\xf4\xf1\xbc\x9a?\x11\xbe]\xc9\x11\xbf\xe1\x16m\xbe\xe5\x9c\xcd>X<\xb0\xbe\'{s\xbd\x05/\xd1\xbeJW\xa6\xbe\x8c\xd5\x14\xbf\x9e\x97\xfc\xbe\x87\x86\x8a\xbd\xdc\xb7V\xbek\x1b\xb1\xbe\xad\xf3\xe0>O)\xdc>3\xda\'>\\X\x8f>\x9eu\x06>\xcb\xd3\'\xbes\xa0\x84:#\xbb\x0c?DF\x9e\xbe\x10\x1e\x05>8\x1e\x84>cs\xc1=\xf0/\x0b\xbf\x9a\x94\x0b?\xf8>\x85>\r-_\xbd\xf8 \x03=\x08\xec\x06=\x0b\xe8\xb5=\xd5\xaf*>\xed\x905\xbe\xf8\x98\x11>\x96\xe4\x0b>B\xa4\x9a>\xe4\xf7\x04>\xd4\x03v\xba\x13\x0c\xc5>\x84\xe9B>l\xb6M>4Cu?\xba\x0c\xad\xbe\xb5\x8e\n\xbe\xd2\xf0\xb5\xba<\x13\xc5>$a\xcc\xbd|\xa3\x00=\xb9\xe1\xef>@\x91\x1a>\xeb\x18\xad>$\xads=\xcdd\x1c>\xfcS\xd5\xbe9.\x97>#V_=T\xdd\x01>\x82k2?mV\x1c\xbeJ\xb7\xda\xbd\x1f\x13\x8a\xbe\x86M\xc3\xbe\xe6Y\x8c>\xe0\xc1{\xbdw*\xdd\xbd\xba\xe9\xaf=\x95\xa4\xb6>\xe7\x8f\xfa\xbd;\xd1\xe7\xbd\xc5\x05S\xbd\xeb\xc3\xc8=\xfd\xed\x9f\xbe\xc8\xc3\x17>;\xb8\xef<\xb6f\x9d\xbd2O\xb8=\x8en\xdf>K\xf2\xc0\xbe\x05;\xf7>\xeb\xa4\xda\xbd\xf25\x87\xbe;\xa9\xd3>\xfd\x16V=_\xaa\xe4>\xef1\xe0>\xfcRD\xbe\xc9\xfe\x1d\xbe\xfe\x03W\xbe\\\xb9\x9f\xbe\xdfQ\x00?u\r)?\xda\x82\xd2\xbd\xfb(\xc7>\x11\xae$\xbeb\xf2C=\xadD\xaf=Q\x19\x14\xbf\xe9\xe4\xe9>Q\x88\x8e\xbe\xa0m\x00\xbf\xdd\x9c\xa2\xbe\xbclC\xbe\xe3\x95\x98\xbe\xd0\xaf\xde\xbe\xc4\xf3\x03?\xea\xd2k\xbe\xc9\xc3\x99\xbe\xdc\x06:\xbe\x97\xb5\x06\xbf\x99\xbf\x12\xbes\xa8"?\xe5\x03\xa6\xbd$u\xa5<H\x9c0\xbf~\xba\xdb\xbeY/\x0c\xbf\x8fd\x9d=<x\xe2>\ru\x07>\x1eu\x9b\xbe\xbf\xdf\x8d\xbe\x87_\xea>\xc5\xce\xbd=\x9c\x0e\x85<\xd4F\xf1;\xb88\x18?\x84\xa1\xfc\xbe\x1c\xa5\x13>3\xd8\xa2\xbe/R\xad>a.\xb3>`\xd2\xe9>\xb8\xb5\x1c?`\xa1\x15?<\x85\x1c>\xc0\xdf\x96>\x98\xc9\x19='
-p470
-tp471
-bsV579918297715634176
-p472
-g2
-(g3
-(I0
-tp473
-g5
-tp474
-Rp475
-(I1
-(I200
-tp476
-g12
-I00
-S'\x1d\x1dH>#\x9b~\xbd\xd6g\xab\xbe\xe9.\xbc=\xc0\x9fG>P\xb9>\xbd\x07\xf6\x0c\xbe\xd9\x18 \xbe\x84,:\xbd3R\x1c>=\xf7\x9d=\r\xce\x9c\xbd\xc9m\r>U \x8f=\xe7\t\xb9\xbd\xde\xc6\x85>\xb0/\xab\xbca\xe5\xcc\xbd\xcf\x93k\xbd\xda\xa00=\xd5F\x8a\xbe\xad\xd3\xe9\xbc\xd4\xc8\xda=F\x1el\xbe\x0f\x06\xa4\xbd@\x06\x9a\xbd\x10\xa8\xfa=\xff\xf0A\xbew&\x85\xbe\xb3,\xa2=\\\xff\xa1\xbd\x87\x13\xf1\xbd\xe8\xec!>p\xbej\xbe:-\xc0<I\xa4\xa2>\'d\x8d\xbc\xc9\x92\xbf=l:\x80>y\x11#>\x9a?=<7\xba\xd4=W\xb3A>X\x90\x8b\xbe\xba\xcd\xfd\xbd\xdd\x9e\xc2\xb9 \xef\xaa>\x8d\x91r=\x84\x83]=\x8d\x85\xa6>\x8f\xd6\x01=#\xf5\xba>|\x90-\xbeN\xc7#\xbd\xd1\xd6\xc5\xbe:\xa6o>\xb7\xe9\x13\xbdV&\x07\xbeD3\xba\xbe\x12"\xad\xbe\x10Eh>\x91\x1b\x05=V\xcb\\\xbdqi\x95\xbe?n\xb8\xbd\x8c\xafs>_rB\xbeP\xb2|=0N\x8b\xbe\xaa8\x14\xbe\xa6"\xee\xbe\xd9u\x92\xbeo\xf3y\xbc\x03\x8f\xf9\xbd?\x962\xbeI\xf6\x83>\xe31|>\x11\x15\xfa=\x84\x1f\x05>\x1e\xa0\x13>wo\xd2\xbd\x7f\x13\x8f:\xb2\xbb\x99>\xb4\xfdC\xbe0\x9d\x07>\xe1<\x13>\x7f\x7f9>\x18\x17\xa9\xbe\xe0"\xd2>\xda\xd5\x0e>=:\xbb\xbdpC\xcc=.\xe0\x16\xbe\x9c\xbb\x8d=&cT>\xd9\x8a\x1e\xbd&,\xf7=\xca\xc8=>\x9eH)>\xc6\x18\xa2<\x1d}I=\x16o\x93>\x81\xb3\xe9=\x02J\x00>?X\x00?&wa\xbe\x8b\xc5\xb2\xbc\x06\xa8\xcc<\xd5\x14\n>\xfc\xae\xd9\xbcUh\xa1\xbcW\xa8\x8b>\xf6\x08\xe4=V\xfc3>D\xfdT;\xf3@b=Ym\x91\xbe@\xb9s>p\x94K=\x8fz\xcd=\xc7\x04\xf1>V8\xe2:\x16\x8eN\xbd\x01Y\xbc\xbdi\x81\xe5\xbd\xd1wK>\xb1\x01\xc7\xbd\xad?\xb3\xbcO\x91\xe2<g\xfc\x1d>\xc0\x05c\xb9*\x08\x90<\xaa\xff\xc6<p\xdd\x15=\xaa\xb2\xd7\xbc/\r\xc9=a\xb5\x86;\x0c\xfd\x93\xbc\xe6#X=\x95\xce1>F\xb2@\xbe\xe0\r\x9f>\xa6\x84\x18\xbd\xf3Gj\xbe\x89:v>\xa0:\xa2\xbc\rOs>V\xcf\x87>\x8f:\x15\xbe\xc9z3\xbdA,x\xbdRZ4\xbe\x07"\x80>\x0f\xc2\xa0>\x94\xbb\x9e\xbbj\xde\x97>\xafV\xad\xbd\xc9B\x83=%\xb7\x8b=\x93\xb0\x8e\xbe\x1dGi>\xbf\xe8F\xbe\xc2\xe4\x93\xbeO\x17%\xbeW\x8c\xba\xbdQ5\x10\xbe\xd7"\xa5\xbe\x88\x04\x9b>\x16L\xcd\xbd\x8a\xad\x03\xbe\x91\x17\t\xbd\xb3\xffx\xbew\xb8\xf6\xbc\xe7>\xe5>\x87\xc9\xe9;,\x0b_\xbb2{\xb6\xbe=\xaa\x91\xbes=!\xbe\xa0.\xae=I\xce\x92>,/~=\xb1\x0e*\xbe\\\x17\xd9\xbd\x80\x7fo>\x83\xffE<Az\xee=O9\xf1<I:\x9d>\xb7jv\xbe>\xe6\x11>\xfd\x9cy\xbdJ\x90,>\x03\xa4[>;\xed\x99>\x1e2\xb0>s\x06d>\\{\xc6=O\x88\xcc=\x91\xea\xd5='
-p477
-tp478
-bsV577431634338799616
-p479
-g2
-(g3
-(I0
-tp480
-g5
-tp481
-Rp482
-(I1
-(I200
-tp483
-g12
-I00
-S'\xcct\x9c<\xa9n\x82\xbd`L\xdd\xbe\x16U\xc0>}\x0b\xe1=\x90A\xea=\xcb\x0b\xb0\xbe\xc5x\xef\xbd\xc4Ak\xbd\xde\xca\x97>\xb8\xcd\x82=D\x10\t\xbf\x82|A>LL\x0f>7qZ\xbd\'\x13\x8b>)\xfb|\xbd\x92\n\xb5\xbe\x89\\\xe3=\xb40?>:\x8a\x10\xbf\x14y\xb1\xbd\xbf\x14\xc7=\x9bM*\xbeJ\xd2\x00\xbe\x07\xad\xb0\xbc\xfc\xd6\x1b=\xc3\x14\x02\xbeR\xc9\xf0\xbe\xdcP\x0c\xbeR\xf3\xbc\xbeB\x9eT\xbe\xe1`\xb3>\xfd\x0f\xce\xbeq_\xc9<\x1f94?\x86\x0b\xba\xbeyk\xfd=\xe4\n^>\xd2!\x02?q\x0f\x08>\x99\xa9\xf4>\xbe~h>w\xea\xfe\xbe\x15\xc9\x87\xbe\xfe\x94\xb2\xba\x85\xf6\xb2>7\x1c\x7f>\x94#\xeb= \xf2\xcb>^\\\x81\xbd\xf3\xc9\x0e?+\x11\x98\xbeV\x95H\xbe\x04\xb2\x14\xbf\xf8\x04\xc0>\x1c\x02t\xbe\xdeL\x80\xbea\x90\xe0\xbe\xf2\xd0\xe0\xbe7\xc0\xcd>\xbb\xf3\xf9\xbd`\xd6;\xbekw*\xbfD\xff\x84\xbeR_\xe5>\x7fA\xbc\xbe\xe8G/\xbe\xa7\xd2\xdf\xbe\x9f\xca\xcb\xbed\xcd\x17\xbf\xaaw\t\xbf<\x92\xcb\xbd<\xbci\xbe\xaa\xca\xd1\xbe\x97\x8a\xfe>\xacJ\xf6>\x05C$>\xa87\xb1>\x94i\xe5=FwB\xbe\x9e\x8b\x87;%\xc8\x19?\x0cb\xa1\xbe\xbcw\xdb=Z\r\x9d>\xbcG*=W\x85\x1c\xbf\x9f\x0e\x11?\x9bq\x8d>0\xda\x7f\xbc\xaa\x94\x07\xbd\x8cc\x04>\x98\xd6\x90=\n\xff\xcf={\x0eK\xbe\xa7t\xe9=\xd2\xf2\x86=\x16\xee\xa5>\xfb\'.>\xbc\xf6V\xbc\xabt\xd2>\x97OP>\xb7\xe3i>c\xeb\x8f?\x18\x96\xb9\xbe\xd4MJ\xbe\xd0\xf5\xe2\xbc\xeev\xfa>O\xf6\xd4\xbd\xae\x08\xa9=Ne\n?\x91\x803>2\x99\xc4>\x07`\x8f=\xc5\xb87>t\xe2\xe4\xbe\n\x1e\x9c>\x13\xba5=\x0c\xc8\x03>E\x88;?\xcb\xe2}\xbeS\xa6\x0f\xbe\x8a\xe6\xa4\xbe\xa0\xe1\xfe\xbe\x16\xdb\x86>Gp>\xbd\xa2l\n\xbe\xe3\xff\x00>`\x1d\xe2>R\xf03\xbeZE.\xbed\x8a\x9c\xbd9\x8a\x03>.\x92\xde\xbe\x87E\x15>\xce\xbf\xaf<\xbb\xe3\xba\xbd\xe0>\xf6=\x89\xad\t?\xcbg\xe0\xbe\xa5\xed\x07?5~)\xbegHs\xbe;5\xec>o\x81\x88=`\xdd\xf8>\x84`\xf2>\xde\xd6&\xbe%\x00R\xbe)\x97a\xbe\x0c\xf9\xa7\xbe\x87\xd9\x15?\x95\x92D?\xcb\xf4\xf8\xbdk\xdd\xd3>\xbc\';\xbe\xcc\xa9\xeb<\x95e\xfe=\x04\x15*\xbf\xe3\xa8\x0e?#\x1e\x97\xbe\xe6\xc7\t\xbfEP\xc4\xbe\xfc=l\xbeP\xe8\xbc\xbe\xac|\xd2\xbe\xe4\xf8\x12?\x9b\x01{\xbe\x82\x07\xb7\xbe\xdb?\x80\xbe|\xe3%\xbf\xbdlB\xbe-9"?\xdd\xce\x06\xbe(\x06#=n\xc0I\xbf\x14\xea\xe9\xbe3\xbe2\xbf\x9c\xaaC=E\xd8\xfa>\x06\x0e\x07>l\x19\xa0\xbe\xc9\\\x92\xbe\xc4\xab\x04?l\x95\x17>7~?\xbd@a\xec\xbc\x90[0?\xdd\xea\x16\xbf\xea\xe6\x17>\x8a\x15\xd9\xbe\xe4V\xcd>\xeb|\xd6>4C\xf0>0\xa1*?\x91.8?\xfd\xc96>a\xf7\xba>M\x13\xb7\xbc'
-p484
-tp485
-bsV590468299554586624
-p486
-g2
-(g3
-(I0
-tp487
-g5
-tp488
-Rp489
-(I1
-(I200
-tp490
-g12
-I00
-S'lC\xa4=\xa8\x13j\xbd\x08\xc7\xc4\xbe\\T\x85>\x8c\r\xf9=3\x1a\xa2=\xc3/\x93\xbe\xd9\xc7\x00\xbe\xf8l\x1b\xbdFa\x85>\x05\x02q=\xb4\x93\xbd\xbed\xc2*>+\xac\xc2=n\x8b[\xbd\xf02\x86>\xa6#m\xbdY\x13\x86\xbe\xb1\xa6r=:\x93\x08>\x9d\xc6\xef\xbeS\x87\x85\xbd&\x91\xd5=\x0e\xca4\xbe\x9f\xc9\xea\xbd\n\xc4\r\xbd\xe7\x86\x95=\x8aT\t\xbe\xd8\xc3\xcf\xbe\xef\xa7h\xbd\xed\x1eu\xbeJ\xc3)\xbe\xd54\x8b>\xc4A\xa6\xbe\xe7k\x06=\xcd$\x11?l\xf1l\xbed9\xbe=\xf3\xc6j>L\x02\xc5>\xcb\x8a\xb1=GV\xaf>\xf33Y>\xdf\xaf\xd4\xbe\xac\xb9L\xbe\x8d\xc7i;\x97#\xb0>\xbcq@>\x9fw\xb5=P\n\xc0>\xc7z\x08\xbd\xda\xe7\xf1>\xf6\x9b\x80\xbecY\x17\xbe\xeb&\x04\xbf}\x98\xaa>\x89K\x1a\xbe\xd3\x1c:\xbe\xf9~\xd7\xbe7\x0c\xc8\xbe\x85\xa8\xb2>(\xe0)\xbd\x12\xe4\x0e\xbe\x13m\x07\xbf\xda>b\xbeS\xbb\xbc>\x88\x8c\x9f\xbe\xf3\xf2\x8d\xbd>e\xbc\xbe#\x91\x98\xbe\xa2\t\x07\xbf\xdb\xac\xe8\xbe\x01\n\x98\xbd\x96\xdb@\xbe\x83\x18\xa3\xbe\xecR\xd1>\x0ck\xc8>\xa7\x14\x13>N\xfb\x87>\x88\x8b\xe3=\xcbS\x19\xbe\xe0^_\xba\x9f\xc5\xff>\n\x95\x8f\xbe\x08\x1d\xea=`\x91z>\xff\xe9\x9a=\xa8\x93\xfc\xbe\x9cd\xf8>\xb2\xf5t>X\x0f"\xbd{ry<\x7f\x9e@=\xd1\xd7\x92=`\x94\x02>\x0cv#\xbe\xd7\xcd\xf8=\xe8\x13\xe9=N\xb9\x88>\xd4R\x00>$F);B\xc6\xb2>\xf0\xde(>W\x98;>\xffAd?d\xbe\x9c\xbe5\xdd\n\xbe1=`\xbb\x9d\\\xb7>\x8d\x05\xbd\xbd\xf4\xaf\x13=\rN\xe2>x\xef\x17>\x83w\xa2>@~[=on\x08>A\xe3\xbf\xbe\xd7f\x89>Y\xf15=k(\x05>\xe0\x8a!?\xd3\x14 \xbeS\xd6\xd4\xbd\xae\x8d\x80\xbe\xbe8\xb8\xbe:\nu>\xb3XM\xbd,\xdc\xc7\xbdZ{\xa5=\xee\xd2\xab>\x8a\xe4\xe4\xbd74\xe0\xbd\x91\x97}\xbd\x08\x17\xc8=\xe3\x96\x9b\xbe\xf4#\x01>VK\xca<E!\x9e\xbd\xfc\x99\xb4=$\xad\xd3>\xb9W\xb1\xbeR\n\xe3>8\xa7\xd7\xbd\xf8\x8bn\xbe\x0cP\xc4>\x0b:n=r\xc9\xd3>\x7f\x1d\xcb>\xf3o&\xbe\x03\xcf\x1e\xbe~\x12>\xbe\xdf^\x93\xbe\xab\x9e\xf1> \xbc\x1d?6i\xcb\xbd2\xd4\xb1>{\x8d\x14\xbe\xdf \x1c=\x18\x15\xa7=\x90\x9f\x08\xbf=\xf4\xdc>e!\x82\xbe\xa9\xa6\xe6\xbe\xe6\xaa\x96\xbe\xec\x894\xbe\xc5_\x91\xbe[\xc6\xc1\xbeUM\xf1>\xeb\xf0L\xbe\x86r\x91\xbeH\x815\xbeT+\xfb\xbeX>\r\xbe\xdb\x9e\x10?\x89\x9f\xbc\xbd\xa1s\xa5<\xfc\xd9$\xbf\xaf\xdf\xca\xbe\xef*\x05\xbfQ\x9cl=k\x8b\xcc>M\x1b\xeb=\x86\xf7\x8c\xbe\x9c9\x84\xbe\xcbh\xd6>\xcfd\xc6=`rF;\x8e\x85C\xbbt+\x0f?\x1e/\xf0\xbe\xc6\x88\x01>\x01\xe1\x9c\xbeiV\xa2>\x8eS\xaf>\x03\xb6\xd3>\xae$\x12?\xdcs\x0c?4O\x15>p,\x8c>\x123\xc4<'
-p491
-tp492
-bsV580440792424157184
-p493
-g2
-(g3
-(I0
-tp494
-g5
-tp495
-Rp496
-(I1
-(I200
-tp497
-g12
-I00
-S"U!D=\x88\x89\xd0\xbc]g\xad\xbe\xad\xef\xa0>q\x19\xbb=\xaa\x16\xf5=\x03\x9e\x8d\xbe\x0e2\x05\xbeo \xf6;\x9e\xf8\x96>Q3j<>/\xe9\xbe5\xbd\xae=\x99\x92\x81=\xb9\xcc\xbe<\xa7v\x96>\x8d\xfd\xb1\xbd\x93\x83\x8d\xbez\xc0\x82=\x89\xcd\x89==\xa8\xdd\xbe\xd97\x8e\xbd^\xe4\xfd=\x92<\x18\xbd\xd4,\xdf\xbd\xa2\x85\xb5\xbc\x02\x98\x7f=\xb3z]\xbd\x1d\xfe\xbd\xbeX\xec>\xbe\xc7\xb0\xaa\xbeW\xb7-\xbe{/Y>Q\xbe\xc4\xbe\xbb\x8d\x1e=\xc7\xff\x1b?,\xe9W\xbe\x81\x12\xc4=\x036O>\xe1\r\xc0>\x14Hs\xbbs\x93\x90>\x12\x9a\x02>\xed3\xa4\xbe\x9c\x01\x92\xbeC\x19\n\xbd(r\xa1>\x88\xe1\x82>I\xaa\x02>\x0cv\xba>\x1c\x00\x8a\xbd\x98\x8d\xdc>\x18\x8ea\xbe]\x99 \xbe;\x87\xf6\xbe<\t\x8c>\xf3\xf9;\xbe\xbb-R\xbe\x84U\xce\xbe_\x85\xbf\xbe\x03\t\x89>?\xb9,=\x19C\x82\xbd\xbau\x04\xbf\x03v5\xbe\xd3\x8d\xa4>^\x96\xab\xbe\x1e\x10r\xbd\x1f\xe5\x85\xbe\x9d\x1d\xbd\xbe@\x8c\xee\xbe\x19\x96\xf7\xbe\x18\x1a\x12\xbeDJ7\xbe7l\xa0\xbe\xd2\xdd\xb0>\x0c4\xb7>0\n\x0f>\x96a\xab>\xa1\x84\xcf=\xf3 \xc5\xbd#\xe0S=\xf3\xa0\x01?]\x06\x94\xbeTp\x9b=\xb0\xc2N>\xf8\xc9H;-\xad\xf8\xbevu\x05?\xad\xac'>\x7f\xa1\x95\xbd\xccyv<B\xdc\x0e>~\x1c\xf2;\xf9\xf0\xdd=\xa2\x9a^\xbecsK>\xda\xe2\x96=0>\xac>o\xb4\xab=\xca\x9du\xbd\x9e\xfa\x93>\xfa\x9b6>\xd8xf>\x88\x89n?\x1a\xc9\xa2\xbe\xe7\xc38\xbee\xbb~=\x08\x11\xd2>j\xcf\xd2\xbd\xf6\xddE\xbd\xe3\xad\xb3>I&)>F<\xa7>\xe8\xc6\xde=v\xbc(>T\xf4\xc9\xbeG\x13L>\xd11\xea;)\xb6M=k& ?i\xce\x00\xben\x1a\xd1\xbdx\x1e\x94\xbeQ\x0b\xda\xbe\xa7\x06e>\xc6\x88\xc7\xbbN\xc3\xb3\xbdC~\xf5=\xcc\xdb\xc8>{;\x0c\xbe\xf9G\xc8\xbd\x88OL\xbd\xe1\x1f\xa2=a\xb1\xc9\xbe\xd6\xdb\x11>Y\x84s\xbb\xc1o\x87\xbd\x90]\r\xbd\t/\xc8>\x7f*\xcb\xbe`5\xe5>\xdd\xf8K\xbd\xb4}{\xbe\x1f\x96\xce>\xdc\x96\xa4=\xdf\x0c\xb9>\xd3\x19\xfa>\xe3\x1e\x1a\xbe\xca\xe8\xcd\xbdR\xf5I\xbe\xd8vw\xbe\x96\xf1\xf3>\x0b\x00\x1e?\xca\xd8\x0f\xbeS\xf5\xbc>\x18\xdfM\xbe\xebf\x0c=l\xcb\xf8=.\x8a\x12\xbf^%\xa6>x\xa3u\xbe\xf9\x0b\x06\xbf\xd9\xc3\xa9\xbeQ\xa06\xbe\xf4\xe2Z\xbe3L\xb4\xbe>?\xf3>\x18\x89I\xbef+\x97\xbe'#U\xbe\xffL\x0e\xbfC~e\xbe\x94\xfb\xfd>-\x1b\xdc\xbd\x9d'\xb6=D\xe0%\xbf\xc4A\xc3\xbe\xc3i\xef\xbe g\x90=\x14\x1f\xd4>\x19_\xe9=\x96\xdd\x8d\xbeY\x11w\xbe\xdd\xec\x06?\xe5\x0f\xf4=8\x04\xf9\xbb_QR<\xd1.\x0f?{q\xf4\xbe6z\x05>B/\x9c\xbe!\x87\x9b>\xca\xa7\x9e>\xcf\x86\xe0>\xf5\xaf\x0c?-C\x0e?X\x8e\x0b>\xa4\x8a\xa2>\xd1\xcc\xff\xbd"
-p498
-tp499
-bsV582800686246674433
-p500
-g2
-(g3
-(I0
-tp501
-g5
-tp502
-Rp503
-(I1
-(I200
-tp504
-g12
-I00
-S'J\x07\xb5\xbc2\xf4T\xbd\xd46\xd9\xbe)\x92\xdc>\xac\x08[=5\x89N>\x854\xdf\xbe\xf5\xa4\xca\xbd\xf4\x14\n\xbd\xa4q\xbd>\xc1\x9aE=\x95\x1a+\xbfB\\A>C+\x05>Qn\x9e\xbc\xa0\xc2\x92>\x84L\xbf\xbd\xb3\x98\xd5\xbeD?#>\xb7LX>\xb3\xb9%\xbf\xd0\xfe\xb8\xbd\xb7N\xd0=A\xec\xd6\xbdy\xd1\x1f\xbe\xe1=g\xb9\xd4\xd5\x89<\xb9\xcf\xa5\xbdfl\x0f\xbf.\xcaF\xbe\xee\x12\xd7\xbe\xc3\xc1]\xbe~\xb3\xc2>\xd4`\xd5\xbe\x8d%V=P\xd4N?q\xaa\xd9\xbe|\xd7\xa5=d"Z>Jm\x1b?,T">\x9ey\n?Lhb>\xc1\xc7\x0c\xbf\xa0\xfd\x8e\xbe\xe9J5:9\xee\xbe>Bd\xa5>\x82n\x00>\x82\x04\xde>W\xa8\xc2\xbd\xe1y\x12?5\xa2\xa5\xbe\xfa}\x87\xbe\xf1\xe5&\xbf\x9c\xb0\xd5>\x9em\x88\xbe\x8b\x9eb\xbe>>\xfc\xbe\x9do\xe3\xbem\xab\xe7>]\x86\xb7\xbd3\xfaJ\xbe\xa74@\xbf\x8f4\xae\xbe\xa9B\xf5>\xdd\x1b\xdd\xbez.<\xbe\xe0\xf4\xe5\xbe\x82@\xed\xbes&\x19\xbf\xb4\x8c\x1c\xbf\x83\x84\r\xbe\xc1W\x83\xbe\xcb6\xe8\xben\xf6\r?\xcaT\x06?&f5>\xa02\xcb>\x05|\xb2=\xa7\xf0@\xbe\xdaa\x1d\xbc\x01q4?1\xf6\xbb\xbe\x87:\xd8=\xee\xcf\xae>cS\xe7\xbc\xeeO%\xbf\xd7\x9e\x11?gr\xa6>\xcb\x08\x1e;\x8amU\xbd\xad4i>]\x1e\x95=n\xdfn=\xcd(\x8e\xbe\x1e\xd9\x04> \xa58=v\x81\xbd>R\x15h>L\xf8C\xbd5\x84\xd1>}\xf5f>/\xaav>\x94i\xa3?\x01\xdb\xca\xbe\x82\xb0q\xbe\xb9\x8b\xb7\xbc\xcb\xab\x16? ;\x1f\xbe\xbc!\x97=[\x07\x1a?\x94 ?>\xdc\xce\xe6>\xe6|\xdc=\x9a\x85]>1\x94\xf2\xbe\x948\x98>\xe3~X=\x9e\x08\x1b>\xc1)J?\x93O\x92\xbe\x17s\x17\xberK\xd2\xbe\xa6[\x19\xbf\xcd\xb6\x8e>\'^P\xbc\xed\x026\xbe3\xee\x0e>MQ\x05?6\x87t\xbekui\xber\xf2\x06\xbe.\xb8\x13>\xe5c\x12\xbf\xb9\xed\x14>\xc4\xf1\x02=\xd9\x03\x0f\xbe\xc3\xfc\xdf=\x95t"?M\x8c\x01\xbf<U\x11?\xe7\x88"\xbe\x90\x80z\xbe\x97\xa5\x06?\x87\x8e\x08>\x0ew\x11?n+\x0c?@\xbeD\xbe\x84\xdby\xben\x16\x9b\xbeK\xb2\xc5\xbe\xa7\xd2/?G&f?t\x8c=\xbe\xb1{\xcf>\xf7vR\xbe\xef\n\xa9<O\xba\xd0=o%G\xbf\xeb\x10\x1c?\xc6\x80\xa2\xbeB+\x1a\xbfWh\xd4\xbeBE\x87\xbee\x95\xcf\xbeo\xa7\xdb\xbe\xb1>$?\xbe\x14\x96\xbe\x10\xaa\xdf\xbe\xf5\xc9\xa2\xbe\xc9\xd3<\xbf|\xa0p\xbe\xde\x1b,?\xa1\x0f2\xbe\x00\xdf?=\x8e\x87k\xbf\x97\xc5\x00\xbfV\xe7Z\xbf\x8e\xd4B=\xac \x06?\x04\xf3&>\x04\x16\xc2\xbe\xe1\x14\xca\xbe\xd6\xe1\x1d?\xcah.>$\xcf\xe2\xbd\x84\x10\xff\xbc^\xd9J?\xd6\t/\xbf\xaa%\x01>\x05^\n\xbf\xd0\x96\xe3>\xedE\xea>&\x0e\x06?>\xaaH?eU]?F S>\x1a\xc0\xea>U\xd3}\xbd'
-p505
-tp506
-bsV580923267877244928
-p507
-g2
-(g3
-(I0
-tp508
-g5
-tp509
-Rp510
-(I1
-(I200
-tp511
-g12
-I00
-S'\x9d\xa4\x8b<j\xcc\x89\xbc5\x9c\xb3\xbe\xc2\xf0\xa7>\xcfzH=NjI>\xc2z\xb0\xbe2\x08\xa9\xbd2\x9a\xc8\xbc\xf3\xe0\xb0>gs\x8b<\xd68\x13\xbf\xca\xe9\x15>\x87~\xb1=\x82\x93\x80\xbb\xd3\x82\x82>\x82\x10\xc1\xbd$\xa0\xbb\xbe\xea\xff\xd8=c\xf1\x13>\x8b\xf2\x06\xbf\xc8!S\xbd\xe2O\xaa=\xe8Q\x9a\xbc\xed\xd7\xe2\xbd\xc5w\x0b\xbc\xcf\xa2\xb5<n5E\xbd\xe6\xe2\xf0\xbe\x03kQ\xbe\xbd\xb6\xb6\xbe\xac\xcc(\xbe\xf78\x96>_3\xbe\xbe2\x88k=v\x84)?\xc1\xbf\x99\xbe\x13\x05\x8e=\xbe\x154>\xa0G\xfb>@\x94\xce=P\xcf\xcf>\xdc\xe6.>\xa3\xcf\xd9\xbe\xfd\x88l\xbe(\n\x8f\xba\xd1\xb6\xa2>r\xcb\x8b>\xa6\x8d\xc9=\x8f\xa5\xc4>\xbe\xde\xcd\xbd\xc6>\xf2>\xcb\x98\x88\xbes\xe0W\xbe\xfe\xa2\x0e\xbf\x0e&\xa4>\x1a\xd3\\\xbeB#$\xbe\x829\xe9\xbe\xc0\x9c\xc1\xbe\xf7}\xc0>\xb9i\x03\xbcVr\x02\xbe\x12"\x1a\xbf\x9a\x03\x89\xbe\xb1N\xbe>\x91\x1f\xc1\xbe\xe1\xf4\xb9\xbd\x9f>\xa4\xbe1Z\xc8\xbe\xfa\xa5\xf2\xbe\x12q\x00\xbf\x16\xfb\x06\xbe8[T\xbe\x12\x89\xc0\xbej\xe4\xd5>\x96\x1f\xd0>z\x82">\x9e\xad\xac>\xc0?\x97=\x0bA\x0f\xbe\x92_U\xbc\x883\x18?\x85<\xa5\xbevN\xc3=\xe1\xa1\x8a>M\xc4\xf2\xbcSj\x02\xbf\xf8\xa7\xf1>\x8e\xe2}>\xec\xfd\xad\xbc\x1b3\x10\xbd\x88|:>\xbb\x16\xe4<-\xdbt=\xe0\xf9k\xbe-\x88\xf6=r\x84O=\xfb;\x9c>\x10\xce\x1e>~\x9cr\xbd\xfa\xc0\xa3>\x01\xaf@>\x15NM>\xa6%\x86?&\x9b\xac\xbe5\x9f:\xbe\x8e\'\x89<\x1eU\xf1>\t\xc0\t\xbe\xe0\x15\x14\xbcv\xd2\xed>cR\x1f>\x16\x9d\xbf>\x0eB\xdd=\xe2\x820>F\xdb\xcb\xbe\xc8\xe6p>\xb8\x1c#=\xce8\xe0=\x05N$?\xb67X\xbe\x85\xf2\xe3\xbd}5\xa9\xbe\x126\xfa\xbeR\x8dr>\x80\xb8S\xbc`\x05\t\xbe=4\xf0=\x068\xd7>\xb9GL\xbe\xc7E8\xbe\xa6\x98\xe0\xbd\xca\x06\xda=\xa8\x8f\xf6\xbe\xf3\xd4\xdc=n\xe4\xdc;\x03\x0c\xf3\xbd\xfe\xa5Z=3S\xfd>#\xca\xd0\xbe\x9e\xdb\xe6>&\xb5\xca\xbd\x06,U\xbe\x9a\x81\xef>7J\x1b>#\x94\xe2>\xfa\xa7\xfa>\xbf\xd5+\xbe\xca F\xbe\x0f\x14\x83\xbe\x08O\xa3\xbea\x15\x11?\xd4\x9a7?\xed\xf84\xbe\xd6\x01\xae>\x1e\x99?\xbeH\xf9\xee<\xdbi\xa4=f\x83(\xbf\xc0\xa4\xe2>\xd0i\x88\xbe\xec\xa5\x04\xbfS!\xbb\xbe\xc7<H\xbe\xb9\xf7\xa5\xbe\xbd\xbe\xba\xbe$y\x07?\xbe8^\xbe\xe8\xee\xb4\xbe\x00\xae\x89\xbe\xf7\xb1\x1a\xbf\xf0\x88_\xbe\x9d\x05\x11?\x887\t\xbe>\xceg=\xd1kD\xbf\x06\x16\xe4\xbe\xfah)\xbfH\xf4W=&\xd4\xde>\xce\xa8\x0b>+\xca\xa5\xbeF\xab\xab\xbe\x11\x89\x0b?\xfd|\x01>d\xf8\xc5\xbdv\x85\xc3\xbc\x11\x96$?\x96\xab\x0b\xbf\xb0\x9e\xda=\xbeq\xe2\xbeGt\xb7>[k\xbe>&\x17\xed>.2)?\xa1\xd3,?:\xb7%>\xd8X\xc6>\xee\x07r\xbd'
-p512
-tp513
-bsV580397380517928960
-p514
-g2
-(g3
-(I0
-tp515
-g5
-tp516
-Rp517
-(I1
-(I200
-tp518
-g12
-I00
-S'\xc0\xb6\xf1\xbd\x88\xfb\x9c\xbd\x05\xd6\x03\xbf\x18^\x18?}\xfb\xa5<\xcfO\x90>\xc3\xd6\x16\xbf\xcd\xac\x94\xbd\xc9\x9d\xbb\xbcI\xeb\xeb>\xddox=\x84di\xbfh5i>/j\x1b>\xabT\xfb\xb8o\xf3\x99>\x07^\xd6\xbd[\xd8\x0e\xbf\x1e\xda\x88>P\xee\xa1>\x87\xd0\\\xbf!{\x07\xbe]\x13\xe3=\x19j\x02\xbe#\xb8S\xbe{\xf6\xb6<\\\x80<\xbc\xf1\xba\x89\xbd\x18\xe85\xbf9\x84\x94\xbe\t\xf3\t\xbftZ\x8d\xbe\xe4R\xfe>\x0f\x12\x04\xbf<*?=\t\xed\x86?\xb3$$\xbf\xc5x\xbc=\xb3\xfe^>\x97RP?1\xdfs>\x954M?\xb9Q\x8a>l\xb66\xbf\x89\xf6\xb8\xbe1JB<\xfd\xd4\xd9>\xfb\xba\xd9>\xeb\'+>u\x04\xfe>\xb1<\x02\xbep\xcd8?\x1d\xd5\xdf\xbe\xcbo\xba\xbe,\x0cL\xbf#\xaa\r?\xb9\xa8\xba\xbe5\xc9\x9a\xbe\xcb\xb7\t\xbf\x902\x05\xbf\x03$\x1a?\xbb\xfa@\xbe\x7fq\x9a\xbe\x0bd~\xbf\xbb\xa0\xee\xbe\x04&#?c\xab\x0c\xbf\xfd\xe1\xa1\xbe,\xe5\x1a\xbf\xa8\xd4\x1b\xbf\rG4\xbf[NH\xbf\x87\xb77\xbe\xe8\x92\xaa\xbe+X\x1d\xbf`\xff;?\xb5\x942?\x08\xa1Q>\x81\xf9\x03?\xa5x\x82=\xc6F\x85\xbeG\x02\x8e\xbc!\x94c?\xd9\x9f\xe9\xbe\xf5\xd2\xbc=\xeda\xe6>\x98\x01\xc9\xbd\x07$T\xbf[\xc8.?\xc8\xc2\xe6>\xa8\xdaW=}\x80\xea\xbd\xb0\xd9\xc0>PM\xde=\x1b\x8e\x8c;o\xa0\xc9\xbe\x9bz\xed=\xf3\xb11\xbck\xe7\xf7>\xe4:\xb0>\xcb\xce\xab\xbd\x97u\x01?\xc7}\x8e>\x8fO\x98>tA\xd4?O\xe3\xf9\xbepA\xac\xbe\xb5\xaey\xbd\x80\x11L?\xe8{d\xbe\xc5}\x1a>\xb3\x17G?\xc5\xf8[>\xb2\xcb\x16?\xe5\xb2\x15>\xe9)\x92>\x92\xa3\x16\xbf\xe8C\xb1>K\x0cs=\x05\x93?>\x00\xcc{?\xf5\xd9\xe1\xbeT\xac^\xbe@G\r\xbf\xb8KR\xbf`\xb6\xaf>\xab#\x9b<\xfcOx\xbe\x05>4>\xe3\x84/?\x07\x7f\xa4\xbe\xe52\xaf\xbe\xff<U\xbed-K>\x85\xe9O\xbf\xed-G>\x1cq\x97=0\xce9\xbe\x99w(>Q\x92_?\x91\x11(\xbf`\x8f8?s\x85w\xbe\xf3L\x87\xbe\xf6")?\xbf\xbb6>\xc7\x94C?\x8f\x8c)?\x93Lf\xbe\xd8\xc6\xb6\xbe\r\xfa\xd2\xbeEg\xff\xbe0\xef`?\x83\x86\x99?\xb1Q\x81\xbe\x05\xcd\xfe>\x9d\xf8\x82\xbe\x85\xd0$\xbc\xfd/\x03>\xc5\xda\x82\xbfp\xe4[?#u\xbc\xbe\x0b\xf0@\xbf\x85\x1b\x0b\xbfu\xb8\xb8\xbe\x89x\x0e\xbf1[\x04\xbf\x05\xc8T?\xd0\xc3\xd1\xbe\x11\xaf\x12\xbfh\xf3\xdf\xbe\xd3\xfav\xbfK`\xa2\xbe\x81\x8fW?\xf1\xbe\x7f\xbe0\xd5y=ii\x97\xbf5T\x1d\xbf\xf0=\x9c\xbf\xddl\x11=d\x95$?\x8c\x0e[>\xdf\xe6\xf3\xbec^\t\xbf\xa8[E?\xd0\xd7l>\x9bL=\xbe\x9dEn\xbda\xbd\x84?T\xd2e\xbfL\xaf\xe1=\xd4\x99B\xbf\xce\xb6\x1a?L\xbc\x13?F*\x1f?\'\x8d\x80?\'\xe4\x97?\xdcP\x85>\xf9Y\x1a?\xc8J\xe1\xbd'
-p519
-tp520
-bsV580970927871033344
-p521
-g2
-(g3
-(I0
-tp522
-g5
-tp523
-Rp524
-(I1
-(I200
-tp525
-g12
-I00
-S't\xe0\\=H\xf4W\xbdI8\x97\xbe\x95\xfe\x94>\xed\xc6\xb3=\x0e\xc9\xcb=2\x87\x9d\xbe\x18\xa9\xf4\xbd\x90/\xd1\xbc\x8d\x1d\x83>\xe2\xc6-=\xfbH\xc7\xbeWD\xc6=\x88\t\xa6=\x7f*\x95\xbc\x0c]\x89>\xa2zn\xbdri{\xbeN\x9e\x8d=\x8a\x8b\xd5=\xe5m\xd4\xbe\xee\xc1y\xbd \xf5\xd3=\x9e\x83\xeb\xbd\xfag\t\xbe\x04b\xe7:\xaa|3=#\xa5\x8f\xbd\xd1p\xc4\xbe7\x13\xc3\xbdNj\x89\xbe\xe4\xf9(\xbeH\xecq>L\xc9\x8b\xbe\xa2b\x8f=m\x18\x0c?\nqG\xbe"\xd1k=\x02\xb6I>,\xa6\xb9>\xcfDR={\x95\x8a>\x97\x97!>1@\xad\xbe*\x9aQ\xbe\xf9\xea\x1d\xbcV\xe6\xa2>\x9a\xe8r>{\xb1\xda=\xbc\xe0\xaf>>\xda&\xbd0>\xc4>\xb6\x14Z\xbeB\xba4\xbex\xe0\xf3\xbe\x0eV\x90>Yw\x1c\xbe\x96X\x18\xbe^0\xbc\xbe0\xad\x9d\xbe\xd9\xe1\x85>p\xc5\x94<`\xa4\xa1\xbdT]\xf3\xbe\x04D`\xbe\x11\x8a\x95>\x03\x84\x8f\xbe\xcbZj\xbds\xfb\x8f\xbe$\xb8\x9f\xbe<\x80\xe9\xbeI$\xd7\xbe\xa2\xc6\xd4\xbd\xde\xd1,\xbe\x01*\x87\xbe\xe7\xc5\xc3>m\x16\xb1>\x08\x10\x0e>\x03\xef\x89>T\xc8\xa9=\xadU\xce\xbdc\xde\xf2\xbb*\xe7\xe0>zd\x86\xbeQP\xaa=N\x13\\>\x12\xac\xa0;\xc4\xd2\xdd\xbe_\xb9\xd8>\xa7\xc9@>\x953s\xbc\xdf\xaa\xde<\x87\x17\xe1=\xfa\xcc(=p\xfb\xa7=1\x8c6\xbe\x80\xa0\x1d>x\xbd\x91=|W\x88>\xcf\xe1\xfe=\xfc\x86\x80\xbcU\x98\x91>\xa7\x18\x19>\x14\x170>m\xf7X?\x11\xc7\x95\xbe\x84\x8c\x15\xbe\xcaz}<\x87Y\xbd>\x0e\x8d\x9a\xbdh\xcad\xbb\xde\x8d\xc6>\xd7\xf6!>S(\x9b>A(\x8a=\xee8)>\xd0\xbb\xb2\xbe\xf0JM>\xf3\t_=\xa9\xfb\xd2=\x00\xb8\r?\xf4\x99\xfc\xbdJ\x0e\xb1\xbd\x18\x94\x85\xbe\xf0;\xb8\xbe\x0c\x0eW>\xf1DM\xbd\x1f\xc1\xd6\xbd\x8c\xc6\xb4=\x19 \xb6>j\xcc\r\xbe\xd2D\xc1\xbd6\x809\xbd\xb5\x05\xb1=hZ\xa1\xbe\xf3\xfa\xb6=&\xce\xd9</\x93\xb4\xbd\xec\xda\xfb<\xea\x89\xc0>\xa1\xc8\xb1\xbe\x1f\xbe\xcc>\xcb\x1c\x80\xbd \x80X\xbe\x8as\xb5>\x0f\x17\x8f=\x95y\xb5>\xc2\xdd\xd7>\x95\x8a\x1f\xbeZ\xfa\xc6\xbdwV)\xbe/\xc7}\xbe\xebt\xdc>\xf3M\x10?j4\xd8\xbd/\xc1\x90>\x1e\xeb\x11\xbe\xf69\x11=\xeex\x9d==E\xfc\xbe\x90\xac\xbd>\x00|k\xbe\xe4\x06\xd9\xbe\xdb4q\xbeU\xde\x19\xbeP\x0bQ\xbeS\xcb\x99\xbe\x13\xee\xe3>Q\xa1?\xbe\xc9\xb1\x94\xbe\xd0|K\xbe)\x1a\xef\xbe"\x81\x1a\xbe\xea\xbd\xeb>\x1f\x90\xd0\xbdCaE=\xe48\x15\xbf\xd1\x95\xae\xbe\x9a\xb9\xf2\xbe+\xe6\x9b=\x0cI\xb1>m\\\xf4=\xc1\x1c\x85\xbe#zm\xbe\xbeA\xe9>\x82\x96\xb6=4\x89 \xbco\xdb\x9c\xbb\xec\x1a\x03?\x06\x9e\xdd\xbe\xd9\r\xd5=\';\x99\xbeH\xa6\x80>\xec`\x97>\x1c\xe0\xb7>\x08V\x02?Lu\x0b?nf\x16>X~\x96>\xc0\x14r\xbd'
-p526
-tp527
-bsV582820202036985856
-p528
-g2
-(g3
-(I0
-tp529
-g5
-tp530
-Rp531
-(I1
-(I200
-tp532
-g12
-I00
-S'\xeb|\xf2<\x824\x82\xbd\x88\xf3\xbb\xbe5\xb2\xab>\xb3\xf9\x95=\xea\xfb\x0c>\x88A\xb7\xbe\th\xdb\xbd\xa1\x17\xbf\xbc\xea\x1b\x9c>\x8e\x14T=\x00\x91\xfd\xbe^w!>\x9d\xb2\xce=P\x15\xd8\xbcWp\x86>\xee\xfc\x8c\xbdj+\xa1\xbe\xcb\x85\xe0=\x9a\xa9">\x90\xda\x05\xbf\x83\xaf\x92\xbd\xef\x03\xce=r\x7f\x05\xbe<J\x07\xbeo\xe1`\xbc\xcdH#=@\x99\xbd\xbd>!\xf0\xbe\x0b\xda\xec\xbd"\x1d\x9f\xbe:\xd8=\xbe\x81\x7f\x97>\xe0\xc6\xae\xbex\x9b/=\xf6\xaa&?1m\x9d\xbe\x0f^\x8b=\x89\xa7W>EX\xed>\xc3\x89\xe6=yL\xd2>w\xbeP>^\xaf\xe6\xbe\xe3\x04r\xbew\x9f\xdb:\x1e\xe5\xb2>\n\x8c\x81>%?\xe2=e\x7f\xc5>\xd9\xe9c\xbdn=\xf8>\xf82\x8f\xbeNBV\xbe\n`\r\xbf\xda\xd3\xb8>\x15\xabL\xbe\xaa\x9a=\xbez\xf5\xd8\xbe-=\xc6\xbeEb\xc1>\xc9YO\xbd%\xc2\x12\xbe\xaen\x1c\xbf\xf6\xfa\x8d\xbeef\xcb>\xd7\xad\xb2\xbe7\x9c\xe4\xbd)o\xc0\xbe\xc7\x95\xbd\xbe00\x07\xbf\x0c\xa1\x01\xbfK\xad\xd4\xbdX=a\xbeg\xa8\xb7\xbeY\xf4\xed>\xce\x01\xd9>\xf7a\x1c>\x97\xd9\xa3>\xbb]\xbc=n\x95"\xbe\xf1\xcf\x82\xbb\x02|\x11?\x8f7\x9c\xbeu\x11\xc7=\x80\xec\x8c>Y\xb0e<\x87\xdd\x08\xbf@\x87\xfd>\xf5,\x88>"\xa6\xd3\xbb\x819x\xbc\x02m\x10>\x8a\x02\x82=\xbe\xb0\x9f=\x82\xfdd\xbe\xba\x9a\xfb=\x17\x9e\x8a=s\xb1\xa1>c\xf88>R\xca\xd5\xbcH9\xb4>\xba\x83D>\xa2gM>\x83\xb2\x83?\xd9\xef\xa8\xbeW`8\xbeik\xfc\xbb\xd1\xb5\xe7>V\xec\xf8\xbd\xb1\x02S=m\xbb\xfa>\xba\xd8">\xc8\xfa\xbc>\x18\x9f\xa2=8\x17/>Vk\xcd\xbe\x901\x85>\xdfZ\x87=-\xb5\x05>\xc1\xf1+?\xaelL\xbe8X\xed\xbd\xba\x80\xa5\xbe]\xec\xe9\xbe\x8dEw>\x03%\xc1\xbc\xc6\xc4\x06\xbeC\xe6\xdf=\x17\xb3\xd6>c\x8c+\xbe\x1a\xbc%\xbe\xee\xbb\xbd\xbd\xba\xdd\xe5=A\xe6\xd5\xbe\xda\xfe\x00>\x16\x10\x12=\x8f\xe5\xdc\xbd\'\x82\xb5= `\xff>\xber\xd3\xbe\xc29\xf8>\xc3\xf2\xea\xbd:\xc2j\xbe\xb9g\xd9>\xc0\xef\xb3=\xe7\xe1\xef>\x9e\xdb\xe7>M#0\xbe\xae\x9b;\xbeA\xb6r\xbe\xaeG\xa5\xbeg(\x0b?\x9e\xfd8?\xd1`\t\xbe\x8d\x00\xb3>x\xea+\xbe5\xb4\xcd<\xc9\xbd\xae=B\xff\x1f\xbfe\xff\xfc>\xba\xc8\x89\xbe\xf6\xf3\x00\xbf\xd1\x8c\xa3\xbe\xfb\xd3U\xbe\xe1D\x9e\xbe\x839\xc1\xbe\xe8\x95\t?\xb0\x99z\xbe\x97\\\xb1\xbe\xf1\xf4p\xbe\x9b\xe4\x16\xbf\x93.5\xbev\xfc\x13?\x80\xe9\x04\xbe\x1f\xee\xf6<Z\x01;\xbf\rl\xd7\xbev\xf4&\xbf\x9d\x12N=\xae\xde\xd7>v3\x0b>\x17\xba\xa0\xbe\xd0\xc7\x9e\xbe\x03\xb4\xfa>\xd1\xd2\x02>\x8fNG\xbd\xbb{Q\xbc\xf54%?J\xc4\x0b\xbf\x95\x1c\xe4=\x85\x18\xce\xbe7\xdf\xb3>\x12\x04\xb7>K\x1c\xdd>@\x00"?\xe2\xf0-?-\xe6/>\xce\xb8\xb3>\x03\x12\xf7\xbc'
-p533
-tp534
-bsV580338452576780289
-p535
-g2
-(g3
-(I0
-tp536
-g5
-tp537
-Rp538
-(I1
-(I200
-tp539
-g12
-I00
-S'A\x81\xf1\xbcf<)\xbd\xa3z\xac\xbe\xea>\xc1>n\x951=6G2>4\x95\xc8\xbeu\xf0\x8e\xbd\x1c.:\xbcd\x06\x9d>\xf1\x8c\x14=\x97\xb6\x0e\xbfc>\xf9=F\xd5\xb1=\x9cU)\xbbz{t>\t\x04\x90\xbd\x13\xe9\xb3\xbe\x89\x84\x1a>l\xa4;>\x92\x00\n\xbf\x9f#\x98\xbd\x99\xec\xad=\xaf|\xc0\xbd\xff\xe7\x16\xbe\x88\x0b\xa1<\n%)<\x93kM\xbd \x84\xea\xbeDV0\xbe\xf5\xdf\xa9\xbe\xf1\xd59\xbe\xfa\xa2\x99>\xe9\xfe\xa6\xbe\xcf\x01Y=`\xc4,?Lw\xb3\xbe\x8c9\x80=\xd7[\'>\xc7\x0c\x00?\xb4<\xfe=\x11,\xee>s\x15@>Y\x16\xe2\xbe\x84\x1a{\xbe\x18\xb8\x87<d\xfc\x9d>\xd9\xe3\x90>vA\xe3=\xd6>\xb7>\xc3\xab\x8d\xbd\x0fP\xea>\xd2,\x94\xbe\xf1Wh\xbex\xd6\n\xbf\x19]\xb5>\xf4\xc2^\xbe\xb0S?\xbe_J\xc0\xbe\xe5\xcb\xac\xbe\xea\xd0\xbe>\xfcf\x88\xbd/U \xbe\x8b-\x1f\xbf\xe1\xe0\x94\xbedh\xc6>\x0f\xa1\xb2\xbeX\x90\x13\xbep\x9f\xba\xbe\xe7e\xcb\xbe\xe1\x06\xf1\xbe~\xc2\x01\xbfK\x02\x08\xbem\x02Z\xbe\'\xdd\xc0\xbe\xefM\xf2>#\x92\xdd>\xc4\n\x14>I<\xab><\x12G=\xef\xd0\x16\xbe`Y\xc1\xbc\x97h\x0b?2\xfe\x96\xbe\xe1i{=\xe9\xce\x8e>\xf1\xa3W\xbd\x9c?\x05\xbfJ\xf0\xe5>\x9f\x9f\x90>A\x84\x0f={\x03\n\xbd*\xc3^>\xf4\x0cU=\r\x87\x91<$\x8d\x80\xbe\xe3\x82\xc7=\xddQ<<\xec}\xa2>\x83\x19N>\x13&=\xbd>e\xa4>\xc2\xa6(>\xfd\x0eH>\xa1B\x88?\xb8\x06\xa9\xbe\xb1\x16O\xbe\xd0\'\x81\xbc\xec\x15\xfb>\'\x19\n\xbe\xb9?F=\x97\xc9\xfa>\xea\xc0%>\xc3\xce\xc7>\x97\xa2\xc6=\x04m:>\x04\xde\xc8\xbeY\xf3c>a&S=/\x89\xf6=d)#?\x7f:\x83\xbe\xe9\x00\n\xbe\x15F\xaf\xbe&\xb8\xfd\xbeF\xf3e>\xe3\xe2j\xbcp\x17\x08\xbe\xdc\x08\xe0=F\xe1\xde>\xbf\xfaF\xbe\tZJ\xbec\x8f\xed\xbdI\xd0\xf6=v\xd4\xfa\xbe$V\xd4=p9c=\x97\xbf\xe7\xbd\xb5S\xa9=\x81s\x06?D\xed\xd2\xbe\xf3\xfa\xf2>Tn\xe9\xbd\xef\x00F\xbe\xe3W\xe0>1\x14\xfc=7\xa2\xf1>\x99D\xe8>\xd5\xd3\'\xbe\x1d]O\xbe\xc14o\xbe\xc8\xef\xa0\xbe\n\xa4\n?\xe1\xa9=?\x13\xf2"\xbe&\xb0\xa1>\xb7\xea-\xbe\xbd\xc1\xfc;\x84#\xba=]Y&\xbf\x84\xe3\x06?\x03\xd4|\xbe\x96\xb1\xf5\xbe\xef\xc0\xa8\xbe6\x03T\xbe\xd4\x8e\xa8\xbe\x10y\xaa\xbeB\x97\n?\xf7\xd8z\xbe\xad\xe8\xbb\xbe\x10\xae\x89\xbe\x99\x1f\x19\xbfQ\xe3V\xbeRm\r?\x97\x7f\x1e\xbe\xdc\n^=\xef\xee<\xbf\x16\x83\xcf\xbe=\xe19\xbf\xa1\xdb)= J\xc8>d\x01\x12>v@\xa0\xbe\x8c\x16\xad\xbeRd\x04?\xe6&\xfc=\x1f\t\xbf\xbd\xd6\x0f\x0e\xbd\xc6:)?r\xe4\x11\xbf\x9d\xc7\x96=\x17\xc3\xec\xbe\xa1\xaa\xbb>\x1f\xa7\xbb>\x8f\xb3\xc9>\xf5\xd4%?\x87h;?\xfa.2>\x8d\xae\xc0>\xd5\xdd\x8c\xbd'
-p540
-tp541
-bsV580667947783483394
-p542
-g2
-(g3
-(I0
-tp543
-g5
-tp544
-Rp545
-(I1
-(I200
-tp546
-g12
-I00
-S'\xa3(I>\xf8m\x81\xbd\xd5\xa2\x9d\xbe\x18sA=J\xe1P>\x80\x94\x9e\xbd2x\xbf\xbd\x9aU\x13\xben\xe9)\xbd\x8bL\xf3=\xdf\x91\x95=A2\xe7\xbbM\x82\xfb=\x0f{Q=\xda\xc7\xca\xbd\x81\xa5n>\xad\xaa[\xbb\xa2\x83k\xbd\x0b2\x9c\xbd\xe6O\xf9<\x80\x12e\xbek\xe4\x9b\xbc!\xc8\xc0=o4w\xbe\x80\x91\x8c\xbd\x8f\x92\xa6\xbd\x9dK\x05>\xa2\xceG\xbe\xaf\xc1X\xbeK\xf8\xc4=\x80\xcf\xe4\xbc\xbe\x1e\xc4\xbd7g\xff=\x89\xa8N\xbey#E<\t\x8a{>\xaf-\xb4<O\x85\xb6=G\xe5k>\xf0\xfb\xd8=P#B\xbb2\xdc\x8d=\xf2\x1d2>\xdf\x9df\xbe\xffd\xc8\xbd=\xe7\xd6;\xba\xec\x9a>zI\x90<\xb9A"=\xe2.\x93>k\x959=\x8d\x91\xa7>\xf5\xde \xbe\x19\xc2g\xbc\x9d\xb5\xa8\xbe\x15\x98S>\xc0{W\xbb\xe7\xd3\xf9\xbd\xbf\xb8\x9f\xbe\x08\xdf\x9a\xbe\xa2\x1dO>\xa6\xb5\xf9<!!>\xbd\xeb\xb3b\xbe\xebGR\xbd\r\x97P>\x1d\xa9\x15\xbe\x0e\x80\x9f=*\xb6\x82\xbe7\xc3\xce\xbd\x19z\xd0\xbe\xfeph\xbe\xfa\xb1\xd9;\x7f\xf2\xd3\xbd\x9bI\x16\xbe\xb9\x19T>\xefI\\>\x0b\xfb\xdf=\xdbT\xb1=C\xfa\n>\x1b\xef\xb8\xbd"\xbd\xd8\xbbr\xcah>Q\xd2!\xbeW\xfa\xfa=\xb9\xa1\xe3=s\x007>qA\x8b\xbeaE\xbd>8\xce\xf8=\x83<\xb5\xbdE\x12\xdf=\x11i3\xbe\xf0\x85\x91=]sW>\xabBG\xbc\x05\xda\xd0=+\x00>>\x81\x88\x08>\x1d\xe5\x87;>\x84K=\x06\x1e\x85>\xeb6\xb7=7\x00\xcd=a\xf0\xc0>\xf9\x9cD\xbe \xe2\x17<\x18\x92\xc4<\x81*\x99=\xbd\xdc_\xbc\xfd\xb3\xbf\xbcm\x15]>\xc0@\xa1=\xa1\xeb\t>\xb8@\xb3\xbb\x9d\xa2&=G7\x81\xbe\x9f!\\>{\xde-=n\x0c\xa7=\xe2\xb8\xcd>\xc7\x16\xbd<\x89h-\xbd\rEK\xbd\x05\xa3V\xbdx_@>\xe1x\xd2\xbd\xb0\x08\xa5\xbbA\xc8\x84;\xe6\x8c\xbe=\xf7\x8b\xc3<\x91\xe8\x16=\xd6\x1a(=R{\x9f<z\xb0\xf4<q\xf6\xc0=\x92(\xdb7@\x8a\x17;SF@=\xa0\xda\xe9=\xc9l\x08\xbe\x12\xd7\x84>\t\x16\xf5\xbc\xb1PR\xbe\xe1\xffL>^\xf0\x0b\xbd\x163D>\x97J[>/\x03\n\xbe\x90*\xd2\xbc\xb2p\x0e\xbd\xd9\xaf\x12\xbe\xf2Y6>]\x1al>\x9e\x98}<R\x96\x88>!^\x85\xbd\xa4\xf2\x84=\xcb(t=\xf9\xebP\xbe\xbah;>P\xde\x1e\xbe\xd5]k\xbe\x89\xfe\x08\xbe6P\x95\xbd\xd3\xcd\xeb\xbd\xaa{\x99\xbe\xc5\xcb{>\xc1>\x9e\xbd\x9ff\xa1\xbd\x8bH ;\xc9\x16/\xbeI!\xf9\xba \xaf\xcf>#(\x0b=\xba\xef\xb3\xbb\xcd(\x88\xbei\xe1s\xbe*\\\xb7\xbd\xc1\xfc\xb1=U@u>7\x88W=\'\xfa\x07\xbe=\xce\x94\xbd\xab\xe70>\xc9\x8e\x92\xbcgi\r>\x806\t=\xa5\xa4k>\xa7\xee)\xbe\xde<\x00>\x10\xcc,\xbc\xe7Q\x07>\xf9>(>B\x01|>!\xde\x8c>\x00\xc8\x10>o\xae\x97=\x95\xa2F=\xc7\xc0\xfb='
-p547
-tp548
-bsV577356625696198656
-p549
-g2
-(g3
-(I0
-tp550
-g5
-tp551
-Rp552
-(I1
-(I200
-tp553
-g12
-I00
-S'\x8fj5>\xf81T\xbdUL\x8d\xbeL\xc7;=\xa8\xb3;>\x17]\x97\xbd\n4\xaf\xbd0#\x08\xbe\x804\x19\xbdT>\xc6=\xf9\xe6\x89=\x02\x87\x0e\xbb\n\xd4\xd9=9bL=\xb1\x83\xb3\xbd\xc0&V>\xb1(\x90\xbb!^U\xbdvE\x8a\xbd\\T\xd8<\xf7AE\xbe\x9c"\xa0\xbc\xaf\x17\xb3=\xcc$_\xbe[E\x82\xbd\x1e)\x8c\xbdg\xed\xe9=J\xef0\xber!9\xbe\x16@\xbe=\x99\xed\xef\xbcwQ\xbc\xbd\xb0\xb6\xe4=\xec\xff2\xbe\xea\xdc0<)sa>\x8c/\xad<\xd4\x9a\xa7=L\xadS>\xee\xcd\xc3=\xace\x9f\xbbl\xecd=\x1f\n\x1f>\xc7\x9dJ\xbe\xec-\xbd\xbd \xf1\x91;\xbaK\x89>\xd7Q\x8d<F\xde\x11=\xe8\x05\x81>\xba\xab#=kW\x91>k\x0e\x07\xbeHeE\xbcz\xe2\x94\xbe\xe9\xb86>\xf8\x9cn\xbb\xde\x8f\xde\xbd\xdb\xae\x8b\xbe\x87;\x89\xbeS\xb1/>q<\xd4<\xe5\xe4/\xbdF\xecI\xbed\x909\xbdFX:>\x8dF\x00\xbex*\x87=gii\xbe\xdf:\xba\xbdA|\xbd\xbe\x87pP\xbe@Uc8mQ\xb6\xbd\xc4\x8c\x03\xbe\\\xc8<>\xd0\x8e@>h\x1e\xc5=\x087\xa1=Fi\xf5=\x98\x03\xa2\xbd\x98k\xbb\xb9\x83\xe4J>\xb7\xf5\x0c\xbe\x00q\xdf=\x92j\xca=\xe4\x04&>\x04sx\xbe\xb6\xd5\xa9>\xe4g\xd4=\x19\x83\x9f\xbd"h\xd0=\xc4\xac"\xbe\xcc\xfdt=\t\xf1;>\xa7+\xfd\xbb\xa8\x8b\xc2=\x18~&>\x14\x89\xf0=\xf7#\x02;|\xdb==\xc8mm>\rw\x9b=\x0f\xe0\xc0=\x93\x13\xad>7\xa91\xbe\x1b\x94\x84;n^\xbc<]\xc4\x8a=qY%\xbc\x8d\xd1\xc2\xbc\x9c\xa5H><\xaf\xa2=\xdcY\xf7=j\x00z\xbb\xb8\x0b\x08=\xff\x9bc\xbe\xd7\x1aE>\xebg\x0f=\xf1\xe5\x9a=\xe0\xfe\xb6>\x1d\xc7\xbc<\x1b\x1b\x1c\xbd,\x852\xbdH\xc5B\xbdr\x13\'>*\x02\xc2\xbd\xbfDl\xba\xab\xa6\xb4;\x12\x8b\xb1=lS\xd0<\x86\x8e$=\x85\xc2\x1d=^D\x85<\x08m\xd7<\x87\xf1\xa7=`\xb7"\xbayH\xd6:\x0fv)=)5\xcc=\xce\x87\xf3\xbd\x87\x14o>\xee\xbc\xe4\xbc"v=\xbe\x1a\xb63>\x15|\x1b\xbdx\xfd*>\xa4CE>\xd2\x05\xed\xbd\x08\xfd\x8d\xbcr6\x9b\xbcAz\xfd\xbd\xdb\xbc#>\xaa\x8eQ>%\x9b\x8b<\xb3-r>2\x91a\xbd\xe5es=\x04{l=2\xb82\xbe\x89\xf5&>D:\x10\xbe\x86\xadO\xbe\x9d\xad\xee\xbd}\xdf\x82\xbd\x9f\x80\xc8\xbdL\x1a\x86\xbeq\xb0_>\x19\xb4\x80\xbd\xbfB\x8a\xbd\x8buc:o\xe9\x1b\xbe\xb0\xa4{\xbb\xd4\xa0\xb4>\xbb$\xce<4\x99C\xbb\x895n\xbe\x88\x8fW\xbeq\x13\x91\xbd6\\\x9f=\xdc<W>n\xa0%=\xa6\xf1\xe6\xbd\x16\xbcx\xbd^\xf1\x1e>\x82\x110\xbc\x1c\x08\x01>\xc4\xc2\xed<\x95IS>I%\x1d\xbe%f\xe9=\x1f&\x8e\xbb\xf7\x8d\xec=\xe3r\x1c>\xb2q_>\xb9pv>zb\xf7=\'\t\x8a={s)=:\xac\xd2='
-p554
-tp555
-bsV580935599676383232
-p556
-g2
-(g3
-(I0
-tp557
-g5
-tp558
-Rp559
-(I1
-(I200
-tp560
-g12
-I00
-S'T\x98\x1c\xbc\x9c!U\xbd\xddJ\xbc\xbe\x02y\xc2>r?_=\xbbE,>\xd7\r\xcc\xbef\x7f\xb5\xbd#\xf4\x83\xbcTX\xa4>\x14\xe5;=\x83\xe0\x0f\xbf\xcc\xd5\x12>|\x8f\xc6=]\x1dI\xbcJd\x84>\x18-\x95\xbd\x8b\x1a\xb5\xbe\xe6\xed\x11>\x80{=>}v\x10\xbf\xef&\xa5\xbd\xd6\xca\xca=25\xeb\xbd\x9e\xe2\x18\xbe\xe9\xb1\xe3;\xc26\xae<)\t\x8f\xbd\x0e\xfb\xf7\xbem\xf0"\xbeFJ\xad\xbe\xb0\xd3E\xbe\xe0\xca\xa1>l\x98\xb3\xbez\xf9R=R\xcb3?h\xd8\xb5\xbe\xe0@\x8d=\xe4\x0bA>Y"\x03?G\x92\x01>\x07m\xf1>\xe2\xe2M>\x87&\xf0\xbe\x9fM\x80\xbe\xa6\xedF</\xb6\xad>\x0c\x10\x92>~O\xf1=\xe4\x1c\xc5>/\x94\x8f\xbd\xe2f\xfd>/C\x9a\xbe\xb9\xdel\xbed\xc5\x12\xbf\x8c\xe9\xbf>/\xcb`\xbey"I\xbe\xf3\xe8\xd2\xbe\xd5s\xc1\xbe,X\xc9>\xf4\r\x88\xbdi\x01\'\xbe\xac_&\xbfC\x03\x9b\xbe\x16\xf0\xd3>=\xd5\xbb\xbe\xfe[\x13\xbeO\x15\xc8\xbe\xdb+\xd1\xbe\x9fb\x04\xbfLm\x08\xbf\xfd\\\x02\xbe\x05zh\xbeT\xd3\xc8\xbe\x99P\xfd>\xd4O\xe7>\x1b0\x1d>\xef0\xb1>)y\x84=\xbc0$\xbelst\xbc+ \x15?\x9e\xe6\xa2\xbe\xdcx\xa6=$7\x96>\x85\x00\xf1\xbcD$\x0e\xbf\xf7\x05\xfd>$\x1a\x94>\xf0D\x91<%\xe0\xf9\xbc\xbfGL>\xd5\x18\x86=\xc7\xf13=\xeb\x84\x82\xbe\xc5\x13\xf2=4\x0e\r=\xd7\x94\xab>\xee\xa5P>\xdad9\xbd\x0fQ\xb3>\xd1\xb9=>2\xf1T>\x84\x9b\x8d?\xc4\x93\xb0\xbe\xfd&Q\xbe\xb9\x15j\xbc\xdd\x87\x00?S\xc3\r\xbe\xc5G`=\x05E\x04?\x05\x84(>\xe1\xcb\xcc>\xa5\\\xc4=td@>\xd8\xc4\xd4\xbeE\xb3\x7f>\xf7xq=\x8b\xbb\x05>>`/?\x85\x85|\xbe(X\n\xbe\xf0\xc0\xb5\xbe#a\x02\xbf\x07\xe0{>\xd0\xb8~\xbc<\x08\r\xbe\xe9\x8e\xe7=E\xd6\xe6>\x93oE\xbe\xcf?F\xbe)i\xeb\xbd\xe4\x1a\xfb=+I\xfa\xbe\xccK\xfe=\xeaHN=\x15\xdc\xeb\xbd\x10\xf5\xae=\xd7\xb7\x0b?\xe5\xe8\xde\xbe\x12o\x00?^5\xfe\xbd1=\\\xbe\x14\xcf\xe9>\x1c\\\xe8=\xc4\xc5\xfe>|C\xf3>\x80\x8e1\xbe\xd1\xb5Q\xbeo1\x80\xbe\xcc+\xab\xbe\xe3:\x12?\x19BF?\x82\xa7\x1f\xbe,\xf6\xb0>B\x025\xbeo\xf5S<\x8c/\xbc=\xbfh,\xbf\xda\xc6\n?\xe3\xaf\x87\xbew\x85\x04\xbfHg\xb0\xbe\x12\x1ab\xbe3.\xad\xbe~T\xbc\xbe\x9cg\x11?8\x99\x85\xbeF\xab\xc1\xbeq\xcc\x8b\xbe\xf1\xea \xbfe\xfdU\xbe\xa8m\x17?l\xd7\x1b\xbe-\xbe>=h\xb9F\xbf\xc5T\xdd\xbeP\x99=\xbf\x9f\x1fI=Q\x81\xdb>\xc1\xd4\x14>T\xcc\xa8\xbe0\xbb\xb0\xbef>\x08?\xfc\xfb\x08>t\xdc\xa2\xbd\x00\xb2\xe3\xbcR\xfc/?\xf7\xc2\x16\xbf\xef\xea\xb8=`O\xed\xbeP\xec\xc2>^]\xc3>7H\xdd>\x86.-?b\x0f@?\xc3\x978>\xa4\\\xc5>\xf2\xadm\xbd'
-p561
-tp562
-bsV580551798248865792
-p563
-g2
-(g3
-(I0
-tp564
-g5
-tp565
-Rp566
-(I1
-(I200
-tp567
-g12
-I00
-S'Z \x99=[y>\xbdL\x1c\x96\xbe\xfcN\x87>\x18\x14\xaa=\xde\xc6\xd7=\xeb\xd5\x83\xbe\xc8\xac\x01\xbe;\xe2z\xbc\xb8D\x89>q\xbd\xcb<\xda\x00\xc3\xbe\xfc\x9c\xc2=\xa8<\x8d=\x03\x00\xad\xbb\x9e5\x89>\xb6\xb3\x99\xbdX\x0cw\xbe\x117?=>\xe0\x87=\xf3\x13\xc5\xbeb\tB\xbd\xb1(\xcb=\x92\x15\x86\xbd\xd5\x19\xe1\xbd\xe3O\x9c\xbc\x8a\xa6~=b\x8a\x80\xbd\xbf\xea\xbe\xbe\xe3x\xf4\xbd[\xff\x8f\xbe\xe6h\x15\xbebyQ>\xd6q\x9e\xbe\xad\xd2_=\x13\xa0\x07?\t?#\xbe\x06\x82q=}\xc0O>x\xdd\xaa>=f\x99<K\xf2`>*\xf6\r>\x91\x97\x9e\xbe\xa5\x95b\xbeaH\x02\xbdn(\x9e>~\xe4k>"/\xd3=\xda,\xaf>\xdf\x8fL\xbd\xfe0\xc2>\xda~L\xbe\xa3c#\xbe\xa8N\xea\xbe\x03E\x82>\x95\x1e\x1c\xbe\xe6\x0e\x16\xbe$z\xcc\xbe++\xaa\xbe\xa4\xe3\x80>\xb0\xb6Y=q\xd21\xbdb\x91\xe6\xbe\x9f\x13<\xbe\xa0\xcb\x91>\x8f\xc9\x97\xbe\xad\xce\xf7\xbc0\x8ap\xbe\xa2\xc7\x9c\xben\xd3\xe2\xbe\xbd|\xd6\xbe\x86\xbe\xdd\xbd\xe0\x0e,\xbe\xdf\x06\x81\xbe)P\xae>\xa2H\xa2>\xbf\xae\x0e>\xca\r\x8d>\xf3\xc1\xd8=\xbe\x01\xb8\xbd.5\x99<\xe6j\xec>\xaf^\x87\xbe\x8c\x19\xab=/\xfc>>\xfe\xe0\x99<\x12\x03\xd8\xbe\xd5R\xe0>\x9bA#>Z\x11X\xbdP9\xcc<Ja\xd0=\xc9\xf3\t<\x1bN\xd8=216\xbe\xbe\xad/>q#\xb3=\xf74\x8d>Iz\xbd=\xa8F\xdc\xbc\x9e\x97\x88>\x9cu+>\xbd\xf06>\x90kQ?9\xab\x94\xbe\x062\x0f\xbe\xc0\x0c(=\xfd\x8e\xb4>\x80<\xa6\xbdr\xbd&\xbd\x0c\xec\xad>\x0fL\x19>M\xb5\x94>@m\xa9=\xca<&>K=\xb3\xbe\nRK>IY\x12=.\xfb\x9b=lZ\r?8\xa7\xb4\xbdV\xc5\x93\xbd\xaac\x80\xbe\xaeu\xb3\xbe\xab\xb7P>\x8c\x03\x03\xbd\xb1\xca\xc0\xbd\xba\xa4\xc8=\xb7\xcb\xb1>\x13M\x07\xbe\xcaS\xaf\xbd\xae\xe2)\xbd%\xec\x96=\xc7\x14\x9d\xbe\xd8\x83\xcf=c\x80x\xbb\x9a\xc9\xa0\xbd< \x06\xbbL.\xaf>M\xd3\xaf\xbeW\x92\xca>~\xc8!\xbd~\xe6j\xbe\xce\x89\xb6>\x1a\xd6\x9b=b\x14\xab>\xce\xc6\xe0>\xa2N\x16\xbe"\x89\xab\xbd\x03+<\xbe\x0b\x0eq\xbex\x1c\xdb>\xa4\xf1\x0c?J\x11\xed\xbd\x9e\x9d\x9d>\xb9z$\xbe\xc5]6=\xa1\xa7\xa2=\n\x00\xfe\xbe\xe1\xa7\x98>U\x9do\xbe\x1a\xa7\xe5\xbe^p\x85\xbea\x7f\x1c\xbe6\xe5?\xbe%\xcc\xa5\xbe\x85m\xd7>\xbfi1\xbep\xe0\x8c\xbeF\xa9:\xbe\x1b\xab\xf5\xbe\xff\xbb&\xbes\xe5\xe9>\xcd\xa5\xaa\xbd\xbd[f=\xc4L\x14\xbf\xbcu\xb3\xbe\x00\xdc\xd3\xbe\xeda\x83=Jx\xb5>\x85\x92\xf2=(\x1c\x84\xbe;\x0f_\xbe\xd0e\xed>\xb0\x87\xc6=\x95Jg\xbb\x067\x9d<.$\xff>\x1d\xb1\xd2\xbe\ro\xf0=\xa6\xeb\x88\xbe5\x84z>B\xde\x91>)\xbb\xc8>&\xb7\xff>\xd8z\xfd>\x96~\x0c>t\x06\x93>\x94\\\x9e\xbd'
-p568
-tp569
-bsV578768747080654848
-p570
-g2
-(g3
-(I0
-tp571
-g5
-tp572
-Rp573
-(I1
-(I200
-tp574
-g12
-I00
-S'\xef.\xef=S\xf4j\xbd69\xb1\xbe\x07\x8d<>\xad\xa6\x10>j\xd74=9\xc2R\xbeb\x13\x04\xbe\x07\xb5?\xbd\t$l>6Wc=\xbf-\x8a\xbe\x04\r\x1a>\xe0\xc9\xa3=\xac\xbc\x8a\xbd\xa6\x98\x84>,\x9bH\xbd\x04\xa5L\xbe\x1f\xdd\xb7;\xf3\xf9\xb1=#\x8d\xc0\xbei\x05\x1c\xbd\xb49\xbf=\x86\xe2\x1e\xbe\xfa\xd8\xba\xbd\x16\x91V\xbd\x8a\xd9\xb7=\x89\x16\x12\xbe\xfeD\xb2\xbe\x80\xb2\x00\xbd@\x00I\xbe\xba\xc2\t\xbe\x11\xf5_>\xc0\xb0\x97\xbe7\xe6\xdd<\xed-\xea>\x94\xde\x08\xbe\xdd_\xad=\xa3Vd>\x8a\xab\x94>Wm<=\xbf\xf2f>\xa1w6>\x14\x86\xac\xbe\x184+\xbe\xb5\x14"\xbc^\x00\xa7>p\xc9\x11>\xe6\x95\x99=\x0c\x89\xb0>IC\x93\xbcS\xda\xd5>\xbc\xaaT\xbe|\x81\xe0\xbdp\x10\xe5\xbe\x84\x83\x8c>\xbc\xcc\xe4\xbd\xab| \xbe\xe7p\xcc\xbet\x13\xb9\xbe\x9c0\x93>s\xf63;r|\xb6\xbd*\x1a\xd6\xbe\xe1\xae\x1a\xbejH\x99>4\\\x8a\xbe\x18\xb0-\xbc\xad\x04\x9c\xbe&\xd2r\xbe@v\xf2\xbe\x00|\xbd\xbeV\xdb;\xbd\x81+ \xbe1I\x84\xbe\xc1\x00\xa6>t\xfd\xa5>3\x97\r>\xdaGT>\xfel\x01>\xa7\xb6\xf1\xbd*\x87W;&?\xda>\xac\xb4y\xbe\xf1\r\xfa=GsE>\xaa<\xd1=\xec\xa3\xd4\xbe\x043\xe2>\x12\xdd9>\x7f\xcd\x94\xbd\x88\xdf,=X3\xb2\xbc\xa7\xa8]=Y|\'>Q\x10\xe4\xbd\t\x11\xf6=\xbc\xaf\x0c>\xe0`e>\x9a\xbd\x96=\x97\xcb<<\xe11\x9f>\xb0\x17\x18>\x1b[">\x1c\xe06?\x0fG\x8b\xbe\x04Y\xae\xbd\xc7\xf4\x83<\xbaW\x8a>\')\x7f\xbdw\xf7\x0e\xbb\xb4(\xb4>\x07M\xfa=\xad\x1f\x7f>\xdfV,=i\xb5\xdf=Y\x7f\xab\xbeQ\xe7x>\x16O\x1a=\xcf\x8d\xce=\xc9\x92\x0c?T7\xaf\xbd\x93t\x91\xbd\x83\x89B\xbeB9\x86\xbei\'a>%_\x8a\xbd\x1fc\x9e\xbd\x93\xbd\x86=;\x02\x84>\x9a#\xad\xbd\x04\\w\xbd*\x05\xb7\xbc\xb1\xe9\x8f=\xa9/G\xbe@\x81\xef=@\x82A\xbb&c[\xbd\xfc\xeay=\n\xc8\x9b>\xe8/\x8e\xbe\th\xc0>\x8c\x06\x98\xbdV\x13d\xbe)(\xa7>l\x13\x1d=\x94\xfb\xa4>\x18\xca\xb6>\xffu!\xbe\xb3 \xcd\xbd\xd98\x15\xbe?\x8dp\xbe\xed\xa0\xc2>V\xb8\xf7>\xf9\x99\x8e\xbd\x12\xc3\xa6>\x80\xc4\x02\xbeT\x15\\=\x84|\x92=t\x83\xda\xbe\x17U\xa1>\xb4\xb6e\xbe@X\xc5\xbei\xf3\x80\xbei\x13\x0f\xbeI\xcd^\xbe\x00\xc2\xb6\xbe\xd4A\xc7>Q\x0f\x1f\xbe\xc6\xd0W\xbe-4\xfc\xbd*\x0b\xc9\xbe\xa6\xc9\xc0\xbdW\xe4\xff>C8.\xbd\xf1\xd9\x8c<\xc0\xf1\x05\xbf\x9a\xfe\xaf\xbeG\x15\xb6\xbe[,\x8f=\x17:\xb7>0-\xcd=\xef\xcdj\xbe\xcc\x1a?\xbe\x07\x1d\xb6>\xfa\xfat=\xea\x9e\x1d= \x84Z<\x89\xd7\xe3>\xdf\xe6\xb6\xbey_\x08>\xdd\xf5T\xbe\xf1c|>\xdaK\x8d>\xe0\xf3\xbd>L\xe3\xee>\xd7\r\xd0>\xe6.\xf7=3fX>h\xc1+='
-p575
-tp576
-bsV590465958025768960
-p577
-g2
-(g3
-(I0
-tp578
-g5
-tp579
-Rp580
-(I1
-(I200
-tp581
-g12
-I00
-S'\x86V\x0c>\xb5\x04\xdd\xbd\xd7v\x05\xbf\x04\xd2\xb5>\xa2\xbf8>\xaa_\xdf=V\x92\xd1\xbe\xd1\xfaB\xbe6~M\xbd\x00\xb2\xbc>\x8e\x9a\xbf=\x15\x88\xfb\xbel\xeeq>r\xf3\x10>\x7f\x9d\x9f\xbdo\xec\xcb>\x91\xb6\x9b\xbd\x1f\r\xab\xbe\xf1\xd3\x86=+\x9c(>\x11\x85"\xbf\x97v\xbd\xbd\n\x92">z\xf1\x83\xbe&n3\xbe\xfbFc\xbd\xd9\xd8\xd8=\x8e\xb4O\xbe\x89Y\x17\xbf\x15nG\xbd\x14c\xa9\xbe\xcf\xfev\xbe\x1c\xd0\xbe>y\x10\xdf\xbeJ`\x80=P\xebG?\xcal\x91\xbe\x9b\x8b\xda=/O\xad>.-\x05?\xd1\x8a\xea= \x93\xd8>Tg\x95>@\xe3\x12\xbf\xfc\xd5\x8a\xbeFw\xa9\xbb\x8f\x8c\x06?\x1cp\x89>8\x06\x08>\xd0\x1a\n?A\xb3\x08\xbd~p\'?|=\xad\xbe\x8c\x86[\xbe\xc7\xb7<\xbf\xd0\x10\xf3>\x96\xffP\xbe\xd2_u\xbe\xc9q\x1c\xbf\xcex\x0c\xbf\xa4\xfa\xf1>\xe5\xed\xcd\xbc\xc9 -\xbe\xb2\x12:\xbf\xbb\xf3\xa1\xbe\xb6T\x00?L\x13\xde\xbe\xc2\xaf\x94\xbd\x87\x97\x00\xbf\x0b\x9e\xd3\xbeD\xcfA\xbf\x8c[!\xbf\xd1B\xba\xbdPg\x89\xbed\xce\xd4\xbe\xdc\x9f\x13?\x1d\xb5\x08?Y\xcd[>W\xc3\xb6>\x11\xb0->KjP\xbe\xf1\x1f\x11\xba\xceN6??\x8f\xca\xbeW\xd85>\xa1\xf8\xab>\xa2\r\x00>[n/\xbf`\xed.?jp\xa8>^\n\x88\xbd\x1f2@=g\x93,=T\x86\xed=\xa73V>\xcb\x8bk\xbea]B>\xd4R:>\xa0\xff\xc3>\x8a\xde6>\x94W\x1d<T\x9c\xf9>\xcbu~>\xba8\x82>\x90H\x9d?%\x8e\xd6\xbe)\x8c1\xbe^0\x9e\xbb\x91\x08\xfe>\x80\x7f\xff\xbd\xcf\xfa>=]\x1d\x1c?\x1e\x92S>\xe9B\xda>\xdf\x11\x84=%6K>\xbf7\x05\xbf\xa5\\\xc0>\xd1\xc0\xb3=\xc9>9>\xdf1c?\xe9\xbb1\xbez\xc5\x00\xbe"\x90\xb6\xbe\xf9y\xf7\xbe\xde\x8a\xaf>\xf7\xbc\x9b\xbd\xa2F\x1b\xbe<\x82\xeb=\xd4\xba\xf0>\n\xb7"\xbeb#\t\xbe\xe9Y\x87\xbd\x15\xcf\x02>f\x01\xc8\xbe!,1>1\xd5\x1a=E\xe4\xf1\xbd\xe4\xd9\xef=\xee\x1a\x0e?N\x85\xfa\xbe\x8c\xf1\x1d?7\xcb\x03\xbe\x17\x85\xaf\xbe\x9b\xb9\x03?\x98\x9a\x86=N\xcd\x11?W\xa1\x0f?&w~\xbe\xc1\x17>\xbe\x89\xd9\x8a\xbe;\xe0\xcc\xbe\xdb\xd9%?\xd2\xeeW?\x99\x95\x03\xbe*\x12\xf4>\xcb\xe3H\xbe\xa2\xf0x=\xfb\x8b\xd3=4\x7f;\xbf\x01\xa9\x14?u\x8e\xb9\xbe\x16\x93!\xbf9_\xbc\xbeE^y\xbe\xdb)\xb8\xbe&\xac\x08\xbfP\xd7)?G\xb8\x97\xbe\xec\xa2\xcd\xbeump\xbe/\x1c+\xbf \x93-\xbeAAJ?\x81\xf6\xe6\xbd\xf7Rt<<\\b\xbf\xbf\x18\n\xbf\x97\x070\xbf\x06=\xd1=\x01\x03\x11?\xe75(>\x9f?\xc4\xbe\t\x95\xb3\xbe\xee0\x16?y\xf8\x04>lB\xad<z\x0f5<\xc51C?D\x97#\xbf\xaa\x17D>Q\xa6\xce\xbe.\xac\xd3>_\xab\xe9>\xf1\xa1\x15?\x0cxG?V\x1eB?\x8f\xd9V>Y"\xc6>\x9aX1='
-p582
-tp583
-bsV582841517024407552
-p584
-g2
-(g3
-(I0
-tp585
-g5
-tp586
-Rp587
-(I1
-(I200
-tp588
-g12
-I00
-S'+\x03\xf7<\t\xb5\x1c\xbd\x90\x0e\x99\xbe~\x87{>3\x04\x8c=\x05\xeb\xda=\xb6\xb1\x82\xbe\x03G\xa5\xbd\xbd\xb6\xda\xbcr+v>Y\xd5\r=\xbf\x88\xc4\xbe\x81\x86\x04>\xa7\xf4\x9e=\xb9\xae\xda\xbc,EU>\t\x0fe\xbd\xd0\xd2\x80\xbe/\xef\x93=5X\xf4=+B\xcf\xbe;\xbbI\xbd\xca\xf5\x95=W\x99\xb7\xbd\xaf\xf5\xc2\xbdF\x8b\x8f\xbc/\x8e\x16=U\x17\xa3\xbd\xbew\xb7\xbe\t\xe7\xd0\xbdRs|\xbeN\x10\x0c\xbe\x0b\xd1n>\xd4\xe0\x8f\xbe@g\xfc<9|\x00?\xc2{h\xbe\x81;\x82=zC\'>\xe3\xda\xb7>\xa2n\xa6=\x16{\x9f>>3\x1e>ve\xb1\xbe\xf5i7\xbe&\xe5Z\xbb\x93\xd5\x89>\x9a\xcc?>\xa9\xb9\xa2=\x04p\x9b>C\x97M\xbd\xb6\x82\xc6>\x0exZ\xbe\x9f\xbc\x19\xbe\xd2\x18\xdd\xbeW\xcb\x8a>%k\x1c\xbe\xe2<\x16\xbe\xab\xc1\xb1\xbe\xed\xaf\x9e\xbe\x8d\xf6\x96>\xca\xbe\x06\xbd\xfd\x9f\xe5\xbd#Q\xec\xbe\xbaCG\xbeM\x92\x9c>&\xa4\x8e\xbe?\xac\xa1\xbd)\x07\x95\xbeN\xcd\x8f\xbe*\xa8\xd2\xbe\x92\x97\xc6\xbec\xc1\x9c\xbd\x94\x89&\xbe[\xb2\x91\xbe\xb0\xe9\xaf>\x1a2\xa9>\x8c\x94\xfd=M\xbfv>\xd1\xac\x9d=\xc2\x06\xf9\xbd\x9a\x85\xc5\xbb\xb3f\xe4>\xcbUt\xbe\x9e\xee\xa9=\xaa\rX>D\x9b\xa1<\xe5\x16\xd4\xbezG\xc8>\x0elN>\x93\xb9\xb9\xbc\x82\xf3\x1b\xbc\x82z\xbb=\x17\x1d==2\xc2\x9f=U\xb1!\xbe\x1a\x92\xbc=\xfa\xc0\x7f=7\xefo>\xb9\x02\xf6=\n\xfa\xa0\xbc;\x07\x8e>\xbc\xd6\x15> E >Z\xc1I?\x0f*\x86\xbe\x9b\xaa\x04\xbe\x12\xce\x08\xbb\x8f\xb4\xaf>a\xa0\xba\xbd\t\xaa\xbf<+\xf9\xbd>\x81\xac\xf9=G\x0e\x8f>\xa3\x9f\x84=Zi\x01>?\x94\xa1\xbe\x1e\xfdR>\xcda\x0e=3\xee\xc1=ec\x05?``\x1e\xbe\x15\xdb\xb8\xbdk\x81r\xbe12\xb1\xbe$\xa6E>\xf7H\xe2\xbcJ\xc0\xcc\xbdb\xd6\xa8=)\x04\x9e>N{\x06\xbe\x10\x9c\xf7\xbd\x1e\xce\x86\xbd\xa5\xb3\xaa=\xac\xc9\xa1\xbe\xb0i\xc9=j{m<\xc0\x9c\xa0\xbd>\x08\x85=\x8fT\xbf>e\xa6\x9e\xbeZc\xbb>O6\xb6\xbd\xa4w6\xbe,s\xad>V\xcf\x9b=~\xd7\xb3>\x02]\xb5>\xc2\xea\n\xbe\xd2\xdb\x10\xbe~D8\xbe\xeaWy\xbe\xe2/\xd7><\x04\x0c?p\x9b\xd9\xbd\xef\x9a\x91>\x9dm\x08\xbe\xb7`\xd8<K\x9c\x8a=\xa2\x98\xf6\xbe~\x1d\xbb>\x0ceW\xbe\x82\xcd\xc6\xbe\x12a\x88\xbe\x8e\xc9!\xbe\xa0T\x7f\xbe\xf2\x16\x9c\xbec8\xd0>\xb4\x064\xbe\n\x87\x83\xbe\xe6\x156\xbe\xa9{\xe5\xbe\x91Q\r\xbe\xb1\xe0\xea>\x0cf\xb3\xbdt\x98\xf2<\x85)\x12\xbf\xc4k\xab\xben\x1f\xfa\xbe\xf2^-=\x15\xfb\xae>\xfc\x13\xd3=\xe5gx\xbe6Js\xben\x05\xc5>\xd1\x90\xba=?\x85"\xbd\xfa\xdc*\xbc\xd5\xd2\xfa>\xad\x83\xd3\xbe\x06\xf9\xc4=&z\x9c\xbe\xac%\x8e>Z\xc8\x93>\x8f\x05\xb3>0\xa2\xfd>\xc2\x9c\x01?\'\x86\x03>6/\x89>+\x97T\xbc'
-p589
-tp590
-bsV580343702603845632
-p591
-g2
-(g3
-(I0
-tp592
-g5
-tp593
-Rp594
-(I1
-(I200
-tp595
-g12
-I00
-S"\xec\xc2\xbf=\xb8\x1d\xa7\xbd\xe0G\xcb\xbeA\xed\x99>%\x8b\x1d>G\xefe=\xb3\x9a\x9c\xbe{l4\xbeQ_\n\xbd \xd7\x8a>\x1e\xa5\x83=\xc9\xb3\xbf\xbe>O\x1c>\x7f\x18\xd7=hE\x1e\xbd\x91\x8c\xaa>\x93\x1fk\xbdLbp\xbe\xe1\xbbX=w\x80\xd5=P\x8b\xf8\xbe\xb1\x1f\xb7\xbd]\x92\x0f>\xfcqH\xbe\xe5\x0f\x03\xbe?\xf4#\xbd\xbc\x93\xbb=\x1e\xb8\x17\xbe[\x9d\xd5\xbe\x8cEu\xbd\xe5\xde\x8e\xbeg\xc6H\xbe\x17!\x85>\xfdv\xb9\xbe\x01\x8f3=E\xd4\x1c?\x91\x0f\\\xbe{6\xe5=\x8d\xf7\x86>G\x83\xbe>M\x9d%=\xda~\x9e>a\x1dW>'\xa5\xcd\xbex\x99~\xbe\xe93W\xbc\xdb\x8b\xc1>\x87\x1ab>\x83<\t>=\xf7\xce>\x11%\xb3\xbc\rn\xfc>\xd1\xf8\x7f\xbe\x9b=\x1e\xbed\xe5\x0b\xbf\x01%\xb3>\x7f\x06.\xbe\xc1\x88m\xbe\x9fB\xdd\xbe\xe5\x8f\xda\xbel\x9a\x9f>\xd8>q\xbc\ro\xf1\xbd\xd7[\x12\xbf\xad\xc0^\xbe\xd4I\xc0>\xd0\xe8\x9f\xbeK=\x8b\xbd\xa1\x83\xbc\xbe4=\xb1\xbe\x8a_\x13\xbf\xe0\xd2\xfe\xbeQ\xff\xbf\xbd\xaf.L\xbe\xa5\xc6\x9e\xbe+W\xdc>\xb8Y\xd9>9S\x16>\xb0\x8e\x9d>\xcf\xcb\x0e>\n\xd0\t\xbe\xb0\xd58=1\xce\x02?\xf7\x9b\x9b\xbe{p\xf3=\xc8\x04t>\x05\xf5\xa8=\x8f\xf7\n\xbf\x13\xe9\x13?\x83\x92[>\x19\tw\xbdw\xdc1=\x0f\x91l=\x87\x06\x8e=\xef\xd3%>\xf7\xd8?\xbe\x18\xf6A>\x948\x07>w\xab\xa9>\x99I\xe9=\x85\xc7\xa0\xbbP<\xbc>#\xb6@>\x93Ig>u\xf5x?\xcf/\xa7\xbey\x8a&\xbe\xfc\x99c<X-\xc8>\xf2\x0f\xa4\xbd\xf6\xba\x16=\xcf\x8e\xe9>CA+>3k\xa6>s\xcaT=\xa1\xd7(>;\x82\xd7\xbe\xcb\xd4\x8b>\xeb\xd0v=\xed?\xe5=\xc5\xe74?\xa3\xe1\x03\xbei\xce\xc9\xbd\xf6g\x92\xbe\x1dz\xc4\xbe\xa1=\x88>'~L\xbd`\x9c\xc6\xbd\xc3\x96\xd6=\xb9\xf3\xc7>D\xb8\xe7\xbd0\x87\xb5\xbd<\xf6\xbb\xbc\\D\xc9=Vt\x9c\xbeg\xd4%>\x98\xab\xcb<\xab\x87\x8d\xbd\xd9\xd2i=9\x80\xd5>\x1ca\xcd\xbe-\x08\x02?O\xd6\xc6\xbd\xf3`\x8a\xbe\xffv\xcc>\xd5v\x97<\x11\xf8\xd3>0\x17\xe9>HO5\xbec\xf1\xd8\xbden=\xbei\x84\x96\xbe\x83\xb8\xfb>\xf8\\%?\xb1\xde\xb3\xbd\x9f\xed\xc4>{\xbb5\xbe\xf4\xdeH=\x195\xe2=\xd4\xcb\x0e\xbf\x9c\xe7\xd9>\xbd\\\x8a\xbe!\xb4\x06\xbfEy\x94\xbe\x95 D\xbe\x03fq\xbe\xff\xdd\xcc\xbe\xa0t\x03?\xed\x97l\xbe9\xf8\x9e\xbe\x83v=\xbe\xab\x11\x0b\xbf=>$\xbe,X\x11?=\xd3\xd6\xbd3\x08#='\x12*\xbf\x14\t\xc9\xbe!\x06\xf8\xbe\xe7}\xb5=\xc9\xfa\xe2>\x10M\xfb=\xacP\x94\xbe(\xe1c\xbeU,\xf7>\xaf\x0f\xec=;\x03K=\xdc\xe5t<\xeb\xa0\x14?\x00\xc9\x00\xbf\xa9$%>C\xb7\x91\xbe\xc5\x9f\x9a>\xb8J\xa9>\xa7R\xe2>US\x11?\x85\x91\x15?\xb3\xb8\x12>[@\x95>\x0cu\xdc\xbc"
-p596
-tp597
-bsV577723821865766912
-p598
-g2
-(g3
-(I0
-tp599
-g5
-tp600
-Rp601
-(I1
-(I200
-tp602
-g12
-I00
-S'\xf5\x08\x88=\x00\x89\x1d\xbdJg\xc6\xbe\xd8\x8e\xa4>+8\xd5=\x1e\x8b\xf6=\x16\x02\xa9\xbe1\xd5\x0b\xbe\xe2\x82X\xbc\x92 \xa0>\x87q.=\xa0\xc9\xf2\xbe\xfa-\x10>\xce\x9c\xc7=\x91\xf7\x80\xbc\xe3~\x9d>\xfex\xa0\xbdw\xd2\x98\xbe\x11\xc0\x8d=\x11V\xe8=\x82\xbf\xfc\xbe\x10\x0c\x99\xbd\xfb\xa5\x01>\xcaU\xca\xbd\xf7:\xfd\xbd\xbe>\xdb\xbc\xb5\rk=~\xea\xc8\xbd;\x88\xe0\xbe4\xf6\t\xbe\xc7\xc7\xa4\xbe\xbf\xa4E\xbeK\xba\x8a>(\xd2\xc1\xbe\x11\t.=\x1b\x03&?\x92\x8c\x81\xbe\xa6\xdd\xb6=\x12\x82k>f\xa4\xdd>\x88\xf7e=s$\xb0>\x83\x9d5>\x81\xd7\xd2\xbe\xe7\x07\x84\xbes\x88W\xbc\x97\xe1\xbc>\x12\r\x7f>\xb1\xb0\xf7=@\x0b\xd1>v\xc9\x84\xbdUv\xf8>J\x16\x82\xbeG\xad:\xbe\xb7\xc7\x0c\xbf;<\xaa>\xbe\x8a>\xbe\xd2\x1fH\xbeO\xbe\xe8\xbeX2\xd3\xbeM\x85\xac>\xb9\xfc\x9b;\x19\xab\xe8\xbd@d\x15\xbf\x96Tm\xbe:L\xbe>OQ\xb4\xbeP\xa5\x95\xbd\xde\x8b\xb3\xbe\xc5\xf3\xbe\xbe@B\x0c\xbf\xcde\x03\xbfo,\xf7\xbd\x9e\xeeP\xbeXe\xb3\xbe0\x87\xd2>\xe8\xd1\xce>\xba+">\xae\x83\xa9>j\xf8\xe0=\x8a\xae\x0c\xbe\xc6\xd0\xcd<\x7f\'\x11?\xd6\xac\xa0\xbe\xaf\xec\xe8=\x99\r\x82>\xea\xbc\x0b=\xbf\xd1\x08\xbfA\x0b\x0b?W&a>\n\x8cl\xbdo\r\x9b<\xc7\x90\xd7=9$`=\x01\xf8\xf4=\xd6lV\xbe\x11\xa31>\xe3\xa4\xc9=\x03i\xa8>,\xa2\x01>\x9b\xd7\x1d\xbd\x0b\x1a\xb5>\x82\x02G>\xd6\xc3a>\x07\xdb\x80?\x83\xf5\xad\xbe\x93Z2\xbe\x17\xb9\t=\x7f\x85\xdf>=\n\xe5\xbd\xc2\x94t\xbb\x8d\xa5\xe4>\x9fT1>O\xcd\xb5>\x15\xed\xc0=.\xfb$>Hy\xd4\xbe&\x00\x84>=?.=e\xb0\xd2=\x83Q0?\xc9\x84\x1c\xbe\x1d\xc3\xde\xbd\xcf5\x9e\xbe\xc0\x04\xe3\xbe[\xe1\x81>w\xb6\xcf\xbc\xe6p\xe6\xbd\xe2\x92\xef=\xe0\x94\xd1>b\xf3\x15\xbe\xf5\x9b\xf2\xbd\xff\x02\x8a\xbdW\x95\xc7=}\x93\xcc\xbe\xf1u\x12>\xc7\xe8\x1d<\xde\x97\xbf\xbd\xf5\xc0\xfc<\x107\xea>\xf5\xa7\xd6\xbe\xc3\x83\xf4>\xad\xa0\xb2\xbd\xa6/\x85\xbe&\xa4\xdc>b\xa5\xa2=\xb1\x1f\xda>\xba\xed\xfa>z15\xbe\xfa\xd8\x15\xbe8\x0fZ\xbe\xa1\xf9\x96\xbe\xb6>\t?\xe8$.?\x08d\n\xbe\nR\xc3>\xf3\xb6>\xbe\xaa\x0e\x0f=:^\xd8=\x80\x1a\x1c\xbf-\x18\xd5>O-\x8c\xbe/]\x08\xbf\t\xce\xaa\xbe\xdaMG\xbe\t\x02\x8a\xbe\xf9\x8e\xc7\xbe\x06q\x07?\xe5\xbd_\xbeOr\xa4\xbe\xb1\x1ec\xbepk\x14\xbf\x9ehG\xbe.\xbf\x12?\x05\xcd\xed\xbd0\xb0b==t8\xbfUq\xdb\xbe\xf8T\x0e\xbf\xa7\xcb\x9a=Z\xe3\xe8>C\xe3\xf7=\xef\xd8\x9e\xbe\x03\xe5\x92\xbe\xdb\t\x04?\x82\xdc\xfb=\x97ih\xbc\x1a\x00\xd3\xba.\xe0\x1e?\xa6\xf1\x06\xbf}\xf0\x15>\x10\xbc\xb3\xbe\x80\x01\xae>\xc9\xbe\xb4>\xc3\t\xee>\r\xfd\x1e?\xb3\xa1\x1e?#\xcc#>\x80\xf2\xae>f\x8dU\xbd'
-p603
-tp604
-bsV580573590703181825
-p605
-g2
-(g3
-(I0
-tp606
-g5
-tp607
-Rp608
-(I1
-(I200
-tp609
-g12
-I00
-S"\xd6}\xf8=\xe0>]\xbd\xfc\xe6\xb8\xbe8%\x99>\x86C\x19>\x04\xd4(=\x83&\x8b\xbe\xc04S\xbe4\x8b\x13\xbc4&\x85>\xa7\xfeZ=\xcct\xb2\xbec\t\xdd=\xe3\xfc\xd7=\x80\x80\xba;\xe4'\xbc>\xb8I\x8d\xbd]_J\xbe\x03F\x81<V\xe7\xd9<\x94<\xca\xbeJs\xc2\xbd\x1d\xed6>3\xd0\xf3\xbd&\x1b\xec\xbd\x99g'\xbd\xb1\xbd\xb5=\xa7\xac\xeb\xbd\xdcz\xb8\xbe\xfeN\x91\xbdI\xc8\x9e\xbe\xef\xae]\xbe\n\xd9Q>\x91e\xb8\xbe\xa6\xbcX=wn\x13?\xf9\xc9\x12\xbe\x93:\xd9=\xdeu\x8d>\xc1L\xa1>\x80\xf8\xf5\xbc{\xfe9>\xafA\x10>)\x89\xa0\xbe\xbc\xc6\x8f\xbel4L\xbd\xa6\xc6\xc6>f\x8do>TM\x1a>D\xa2\xcd>\xcf\xc0\x0f\xbd7X\xdd>\xb8\x1b/\xbeY5\x0e\xbe6z\xfb\xbeD\xff\x8f>\x00\xba$\xbeQ\xc7V\xbe\xbf\x80\xdd\xbem\xff\xd0\xbe\x03\xafZ>\x80S\x94=\x9fI-\xbdh\xa0\x02\xbf\xd5$-\xbed\xf6\x99>bs\x96\xbe\x8f\x9a\xe9\xbcv\xc4\x8e\xbe\xae\xc2\xae\xbe%\xf8\x12\xbf\xbf\x88\xfb\xbe\xc7!\xf6\xbd\x916/\xbet\x18\x83\xbe\x8c\x1a\xb0>\x0c\x10\xaf>rH\x16>lq\xa5>\x08.\x1c><\xc1\xbf\xbd\xd2\x84\xb6=\xffd\xfd>\xea\x18\x97\xbe\xef\xcb\x05>$\xdcN>\xa1\x9e\xc5=\xaf\x96\x00\xbf\xc9\x03\x17?\x96\x9b\xf1=\x0f\xc5\xed\xbd\xdb\x08\xa9=\xf9n\x0e=\xdd\x9d4=Cu:>\\L7\xbe\xf0\x01\x87>\xb9\xff\x14>6z\xac>\xcatb=\x14Kt\xbcA<\xac>4JI>\xba\x9by>\xb4\x8de?\xe8\x10\x9f\xbe\xac9.\xbe\xd8w\x96=Ty\xba>\xfa+\x7f\xbdc>\x04\xbd\x01\x98\xb9>luM>\x01\xb3\x94>\xf4\xc1\x88=q\xdf\x1a>C\x08\xcc\xbe\xfaZm>\x06x5=\x83q\x8f=i<-?\xc9\xf5\r\xbd\x07\xc8\xa3\xbd\xc5\x8b\x89\xbe\x83W\xbb\xbe\x047w>\xbcT\x07\xbd\xc9\x07\xb3\xbdj3\x01>\x9d\xb2\xca>\xbf\x8a\xb3\xbdF\xad?\xbc\x93\x92?<8\x13\x96=I\xbf\x8d\xbe\xed\xce'>\x91D\x00\xbc\xd2f\x89\xbd3\x1e\x1b\xbd\xaer\xb2>6,\xd5\xbe#D\xec>\xe9\xe4?\xbd0\n\x9c\xbe_p\xb4>\xc6\x10\xfd\xbb\x1cS\xa7>c\x81\xf8>\x10\x8f,\xbeQ\xbf\x0f\xbd\xe9R\x17\xbe\xe0Ml\xbelI\xef>v\xbe\x0f?\xe5*\xb4\xbd\xf9\x12\xc7>d\x1fA\xbe`\xbbV=\x1e\xd2\x06>nR\x00\xbf\x12\xf1\x94>\x87\n\x8e\xbe\xa0&\x0c\xbf\x0f\x8d\x81\xbe\x99.,\xbey\xaa\x06\xbe\xc9(\xb6\xbeS!\xf6>\x97\xe8F\xbe\xcc\x9c\x8f\xbe\xbc\x90,\xbe7F\x05\xbf\xc3\xe60\xbe\xcc9\xf3>\x10\xaa\xc9\xbd\xaf\xb7~=i\x05\x1b\xbfW\x9a\xba\xbesI\xa7\xbe\x03\x83\xe1=\xfdn\xe4>`\xab\xb7=t|\x86\xbe?\x064\xbe!\xec\xfd>o?\x06>jc\xa7=\x94E\x00=\xf4\xc6\x07?\xa9\xec\xed\xbe$\rO>\xc0YL\xbe!\xe8\x81>\xf4b\x97>\x14[\xed>\xbck\xfc>\xe3h\xfd>\x7f\xe9\r>\xe4T\x92>\xd6k\xc5\xbd"
-p610
-tp611
-bsV578792569280266241
-p612
-g2
-(g3
-(I0
-tp613
-g5
-tp614
-Rp615
-(I1
-(I200
-tp616
-g12
-I00
-S'\xdb\xabK>\xa1p\x8f\xbdL\x11\x9e\xbe\n\xee\xb4=\x0e\xdbN>\x11]\x8c\xbd\x06\x1f\xae\xbdi\x943\xbe\r\xcf\x8e\xbd\xea\x86\x01>\xd6\xac\x94=\x1e\xffa\xbd\x87M\x13>iN\xc8=\x8b6\xd3\xbd\xfb\x19{>\xa1\xb6\x8e\xbc\x8b\x96\xa3\xbdSi\x9a\xbd\xc1\xb7\x8c<}\xda^\xben\xa2\x1a\xbd\x89\xd7\xcc=\x1e\x1ef\xbe1kE\xbd\x0c\xc0\xa2\xbd\xe8[\xe4=K.E\xbe&o^\xbe\x9eG\x8f=>i\xe2\xbdK`\xf8\xbdV\xa0\x1f>}\xe8t\xbe\xda-o<@\xc1\x8f>3\xd1\xb5\xbb\xdf\xb5\xf7=L\x88p>\xcfb\xfb=\x183\xa0\xba\x85\xd4\x88=\x0e\xd34>\xd3\xcct\xbe\xa4L\x02\xbe \xd61\xbc\xee\xdb\x98>\x93H4=\'@o={\xc2\x98>\xbf\xaf\xc4<sT\xb1>\xda\x80\n\xbe\xe8\xb6s\xbc"[\xaf\xbe2\xd1C>\x99\xa0`\xbdk6\x1b\xbe\xca\x02\xab\xbeeh\xad\xbe\x8d\xf65>y\x08\x82;y\x8c\t\xbdq;\x89\xbe\xcc\xdfc\xbd/\x86`>8"!\xbe\x10\x0e\'=\x1b\x7fq\xbe\xe3\x8c\n\xbe\xd4e\xe6\xbe/\x07\x81\xbev\n\xd1:"\xc5\xe9\xbd\xa0\x94\x11\xbe\x1e\xf3a>u\xc1^>\xc8\xb8\xe0=\x95<\x04>s\x1e&>\x99=\xcb\xbd\x0e-\xf2<z\xc2\x8c>\xf2q,\xbe\xf4\xee\x08>\xbc\xc7\x03>^GQ>\x94n\xaa\xbe\xdeJ\xd2>\xe4}\xb4=\xc8\x8b\xd1\xbdl\x95\xa4=+\xbe!\xbe\x06\xef^=\x0b\xc6e>\xc2\xbf\x92\xbb\n\xb8\x07>\x82"8>?=\x1b>\xcf\x04Y\xbc:\x1fi=J_\x90>\x8d\x12\xfc=\xaa9\x03>\xee+\xeb>bqD\xbe&3\xaf\xbc{s\x96<`\xaa\xe7=DM+<\xbe\x1f\xc5\xbb\xf3>~>]\x1a\xe4=\xa1Q\x0c>eG\x90\xbc\xac\xd7x=\xa2D\x89\xbe\xe4\x10y>"\x15E=\xba\x11\x98=\x9en\xde>\xb2\\\xb2<_\xd2\x0b\xbd\x1fM\x8c\xbd\x05%\xce\xbd\x81;?>j\xfd\xc8\xbd\xb6\x14h\xbc,mI=\xf0m\x15>\xbb\xb7\x1b<\xb5\xba"=\x80\x1fy=\xc1\xf8\x1e=\x86\xf1\xa0<\x8b\xb7\xcf=cN\xab\xbcj\xd7\x01\xbb`\x8bO=K\x9d\x0e>\xfe\xe18\xbe\xda\xb4\x98>\x1bl`\xbd\xdbu`\xbe\xae\x82V>\x8a\xdfi\xbd\xc0f;>ex\x7f>Vr\xe1\xbd:y\x84\xbc)o\x12\xbd\x1f%\x1a\xbe:\xe9h>\n\xb2\x86>\xa6\xc4\xbe<U\x14\x93>\xd6\'\xb3\xbd$\x86\x87=\xa7\xa2\xa6=y_s\xbeU\xa4<>~\x95G\xbe\xa9@\x97\xbe\xd91\x1c\xberF\x9e\xbdD\xf1\xe4\xbd\x88\xae\x99\xbe\xc6C\x8d>\xd48\xa9\xbd\n\xe7\xe7\xbd\xc4\xcf\xd6\xbcQ\tv\xbet"\xc7\xbc>\xb3\xcc>[\x90\x18<&\xaf\xd2\xbb\xden\xa1\xbeD[\x86\xbe\xdaG\xad\xbdn\xf2\x9f=[u\x96>(\x91B=\xf4e\x0b\xbe\xfbc\x03\xbd\xe4\xf0Y>cr\x12=\x83]\n>Wk\xe9<\xd3=\x88>x2S\xbe\xce0->\x12k\x8e\xbc3_\x14>\xb9\x88I>\xca\x88\x96>\xb6X\x8e>\x92\xcb,>\xc7]\xa0=\xcbC\xa9=S,\xc7='
-p617
-tp618
-bsV580171998996889600
-p619
-g2
-(g3
-(I0
-tp620
-g5
-tp621
-Rp622
-(I1
-(I200
-tp623
-g12
-I00
-S'|\x83}<-\x9a\x85\xbd\\\xb0\xea\xbe9\xdc\xe0>\xc1>\xa3=\xbd@=>\x97\x99\xe9\xbe\xe7x\xfe\xbde\xbd\xe7\xbc|V\xc4>\xe1Pn=6\xdf&\xbfK\rF>\xb4?\xff=g=\xbf\xbcG\x9d\xa3>(\x16\xbc\xbd/\t\xd3\xbeE\xc4\x1a>\xe3JS>H\x06,\xbf\xd9\xeb\xce\xbd7\xd0\xfd=\x1e\xe8\x1c\xbei.,\xbe\xec\xdf"\xbc5\x11+=m\xad\xcd\xbd%H\x15\xbf\xd7s3\xbe\xfb\xcc\xcf\xbe9\xb6m\xbe\xe3,\xc3>QT\xde\xbeHBa=\xac\xd2V?\xa3\xe4\xd3\xbe\x97n\xc0=\\\x10\x82>yt\x19?8\x91\x15>\xf8\x0e\x0b?`\xc0~>\xb0\x1b\x11\xbf\xad[\x99\xbe\xa0l\xda\xb9\x08\xc0\xd7>u\xef\xa7>\xcfF\x0f>Ss\xf4>\xdd\xb7\xaa\xbd\x04r\x1c?l\x19\xb3\xbe\xb9J\x87\xbe\x18.1\xbf$\x06\xe5>3l\x83\xbe\x9f\xe2s\xbe7C\x06\xbf\x18\xd3\xf4\xbeD\x99\xf3>!\'\x9c\xbdS\x84E\xbe\x07\'F\xbfOO\xb4\xbe\xc4\xc7\x00?\xf9\xc7\xe2\xbexd(\xbe\x9c\xd9\xf3\xbe\xa1j\xf4\xbe\x10X\'\xbf\x1f\xa6%\xbf\xa3?\x12\xbeO$\x8b\xbe\x07e\xec\xbe5\xc8\x14?s\x85\x0b?S"@>g\xaf\xd3>q\xe9\xd2=S\x86N\xbeG\xab\x16\xbc\xe9\x038?\x14\r\xc6\xbe\xa1\x91\xe7=T7\xb4>%\xb2\xb0\xba\x13\xde-\xbf\x96\xc5\x1d?\xecH\xac>\xb3\x13\x90\xbb\x8f\xf2\x05\xbd}\x90Q>g\xa8\xaa=\'\xb3\xa5=\x1b`\x91\xbeG5 >\x12\xc7\x8f=\xd5\r\xcb>\xc9\xfeg>\x85\x0f \xbdd\x1d\xe1>D\x94r>\xab\x1b\x81>\x83_\xa8?l\x99\xd4\xbe\xc8\xc5v\xbeD\xd4G\xbcD\xa0\x16?E\xd3 \xbe<\xe7\x83=\xfb\xba\x1d?\xa7VR>\xd4\xc0\xf0>P\xe6\xdb=\xc5Y_>\x19b\x02\xbf\xa6\x02\xa4>\xa5L\x80=\x1e\xec#>ucV?p\xef\x89\xbe\xcb\x08$\xbeI\x97\xd2\xbe\xc5\x86\x19\xbf\xb0\xbb\x9a>\xbc2\xc0\xbcX\xf1.\xbe/]\x0e>\xb3\xd2\x08?\xac\x81`\xbe7\xc6W\xbe\x8e\x0b\x00\xbeoP\x17>?o\x0f\xbf\xe2#$>\x19\x995=e\x01\r\xbe\xf1\\\xcb=):%?\x93\x17\x07\xbfl\xd0\x19?1\x97 \xbe\xe3-\x90\xbeY\xe8\n?\x8d\x02\xfd=\xeb\x99\x18?\xa1\xc1\x13?\xa5\xfbQ\xbe\x91cr\xbe\xccQ\x9a\xbe<\xbc\xce\xbe\x07\xc32?\x17\x8bm?\x93\xb06\xbe\x8d\x11\xe0>\x03\x97X\xbe\xc3\x0c\xbd<\xb4\x1e\xe3=\xdb\x96M\xbf\x97\xd3 ?#\xe6\xac\xbew[$\xbf\x00\xb0\xd6\xbe\xa6g\x89\xbe9/\xcf\xbe\x00\xb4\xee\xbe\x84\xf8,?S\xce\x9c\xbe#\x84\xe4\xbe\x8d\xb7\xa2\xbe\xdds@\xbf\xa88t\xbe8\x079?h\xe80\xbe\xd3\x1fB=\x80vp\xbf\xeb\xfd\x07\xbf\x9c3\\\xbf\xc4\x8a{=\x05\x06\n?\xad\xc2+>\xafG\xca\xbe\xd0\x84\xce\xbeL\xb6"?QI+>\x072\xa3\xbd\xeb+\xac\xbc\xadmQ?\xaf\xd82\xbf\xcb\xf1\x08>\x01\x9e\x06\xbf\x1f,\xeb>Q\xcd\xef>\x93R\r?\xa1DO?\xac\x84`?K`X>\r\x92\xea>\xc0\xcb\\\xbd'
-p624
-tp625
-bsV580378401602670592
-p626
-g2
-(g3
-(I0
-tp627
-g5
-tp628
-Rp629
-(I1
-(I200
-tp630
-g12
-I00
-S'\x0ej\t;\xf9\xbb-\xbd\x1aJ\xd1\xbe\x1f|\xdf>8-\x8f=z\xb2A>\xcae\xe9\xbe\xc1\xa6\xdc\xbd%LR\xbcs\xcb\xbe>oR\x1f=+\x9f$\xbf/+\xf6=g\xce\xc0=\x95gc:>,\xa6>m\xc1\xae\xbd\r\xa2\xce\xbe\xed\\\x15>\xa5\xdc?>^U\x1f\xbfaJ\xae\xbd\x00\x0c\xf9=8%\xcb\xbdS\x88=\xbe\xad]\xaf<\x19j\xe9<m\xcbp\xbd{\x92\n\xbf@\x1aV\xbe\xcd\x05\xcd\xbe\xc9Gd\xbe\x01Q\xaf>\xa8\x9d\xcc\xbe\xcf\x14\xa0=\x90\xf0N?\xa7\xd1\xb6\xbe\xd0\xa9\x93=\x00\xc7]>\xb6=\x13?n\xe0\xcf=\xdeO\xf7>\x90\xcaL>\xbfn\xfb\xbe\x80\xd6\x99\xbe\x9a\xbe\x10;\n\x9c\xc7>]\x19\xb2>\xfd\xb9\x11>]\xda\xe4>\xf74\xb9\xbd\xf7\xf4\x08?\xad\x06\xa9\xbe\x15\xa7\x8b\xbe\x9a\xbd&\xbf\xe1\x86\xcb>z\xbbp\xbe\xef\xfeV\xbe\x913\xf4\xbez\x95\xd0\xbe\xf2\x91\xd0>\xe7\x92k\xbc\xf8\x0f\x1b\xbe8Y3\xbf\x8eW\xa6\xbeg\xed\xe0>\x89(\xd4\xbeJ\xb0\t\xbe\x1eZ\xd2\xbe\x02\xfa\xf0\xbe\xa0j\x14\xbf\x7fq\x1a\xbf\xe9\xd80\xbe\xd6\x87}\xbei\xa1\xdd\xbe\x99\xc6\t?\xd7\x90\x00?\xebL=>\x10\xc5\xcd>\xe9\x14\x91=.\xf6\x1c\xbe\xf7\xba\xd0\xbc\xb9\x83"?\xe5\xec\xbb\xbe\xdd\x0f\xaa=\x1f\x9d\xa0>\xbf\x1c\x83\xbd8\xe7\x1b\xbfa\xea\x0f?\xc5@\x99>\x0e\\O<\xfd\x98\xc1\xbb\xf6%q>\xa37a=\xed\xe6B=\xc1\x82\x92\xbeO./>\xb3\x98\x0f=:h\xc2>+\xa1U>nc\x86\xbdC\xdb\xc4>\xa5\xc4I>\xfa\xe8u>ha\x9f?X\xb3\xd5\xbe\xf5\x02m\xbe-\x95\x84<\x8f\x7f\x13?\x8d\xc6\x15\xbe\r\x9b\x0b;\xd3\x9b\x0c?\xa5\xe1O>\x9aJ\xea>3\xcb\t>\x9f{k>q\x84\xf8\xbe&$\x84>SaK=\x9f\xad\x08>w\x19C?\x9b\xf3}\xbeE\xef\x1b\xbe\xeew\xca\xbeW\xfe\x12\xbf\xe3\xf2\x91>\xa3\x06\x0b\xbd\xfd\xb5\x1a\xbe\xbf\x8b\xff=\xd8\x04\x04?q\xaeg\xbek=G\xbe>{\xe9\xbd\xb9\xd0\xff=6i\x0f\xbf\xbb\xda\xfb=\x8f\xb13=\x8d\xd0\x02\xbe\xb8\xe39=B\xd3\x17?\xf6\x99\xfd\xbe>\x7f\r?\x12\xa0\xd7\xbda(\x83\xbe3\xca\x08?c\xa8\x16>y!\t?E\xa0\x16?\xe9PM\xbez\xc1J\xbe\xde\x9d\x85\xbe\xa7Y\xb5\xbe\x05\x82#?\xbamY?a\t<\xbe\x00\xab\xc7>\xfb\x95S\xbe}\'\xdd<\xf2\xa9\xe9=\xb1\x04@\xbf\xbf\xf8\x10?\xe5U\x99\xbe\xab\x89\x16\xbf\xb9\xc7\xc9\xbe\xb3\x93p\xbe\x9f\x0b\xb2\xbe\x1b\xf3\xcf\xbe\xe1\xb3"?\xc6\xc9\x89\xbe\x89\xd9\xd5\xbe\xb8\xc0\xa1\xbe]v4\xbfc\xf1\x82\xbe\xa7\x1f\'?\x89\xe6&\xbe\xbd~\xb2=gL]\xbf\xaaY\xfb\xbe1\xacK\xbf"\xd8\xa1=\xef\x9f\xf5>\xd2\x8c*>\xa9\x83\xc1\xbe\x8f\x94\xc6\xbe\x85\x9b\'?Xz\x08>\x05\xb2\xa8\xbd[\x8a\xf9\xbc/\x15C?\x9d\xe3%\xbf\xea\xb3\xd3=&d\x02\xbfq\xb8\xd0>\x81\xbc\xdd>\xdfu\xfa>FSD?\x00nT?\x89xR>-\x0e\xe4>\xdb\xc6\xe3\xbd'
-p631
-tp632
-bsV590880200289824768
-p633
-g2
-(g3
-(I0
-tp634
-g5
-tp635
-Rp636
-(I1
-(I200
-tp637
-g12
-I00
-S'\x84\xdbA>\xa8\xec\x9f\xbd?\xdc\xc5\xbeq\x8f&>k\xf6;>\x950);\x87#i\xbe\xd7\x9e(\xbe\xf3\x9c`\xbdw~W>\xc9\xfc\xaf=D\xaaL\xbe\xcf\xfe>>\x1b@\xdd={\xf1\xd0\xbd\x13v\x99>\xb1*\x1e\xbd\x01<\'\xbe\x80\xc2v\xbc9\xc9\xac=9y\xc2\xbe\xcb\x9cd\xbd\xdb\'\x01>\xb8\xa2\x87\xbe\xb41\xe5\xbd\x9e\x1c\x8a\xbd#\x9b\xe6=p\x08V\xbeG\x97\xbd\xbe_\x17\x91=\x10\x18\x17\xbe\xd0\xfc-\xbe\xb5\x06x>\x8d\x85\x8b\xbe\x9f\x03\x18=\xbdq\xec>\x17p\xc7\xbd\xc8N\xc1=\x97\x04\x91>\xad\xcd\x95> \xf1\x91=\x87\xd6V>\xbb\xd5n>3\x87\xc3\xbe\xb8a\x17\xbe\x97\xc7\\<\x94\x05\xcd>\xfd\xe5\xe7=?X\x92=\xdb\x1a\xcc>s/\xa9;\x14)\xe7>iP]\xbe\xfd\xcb\xd3\xbd\xe9\xa4\x00\xbf\xb1\xb6\xa3>\xff"\x9f\xbd\x1d\xd4\x10\xbe\x93\xfb\xe3\xbe-\x93\xcf\xbe/~\xa2>\xdd\x02\xac\xbb\xb82\xdd\xbdk\xca\xdc\xbe=\x03?\xbe\xa1@\xac>f\xcf\x82\xbe\xbd\xb9q<iw\xb8\xbe\x84\xa2e\xbe\xcd3\x11\xbf(\xee\xc6\xbe\xfbq\xe1\xbcl\n9\xbe1E\x7f\xbeU\xb2\xb8>4\xbd\xa8>wH\x1e>\xd7\xdcH>9\xa1\x14>W\x96\x16\xbe\xdd\x02\n\xbc\xcdb\xdb>\xf9(\x83\xbe\x0f\x87&>e\xf9V>(\xc86>o\xf1\xe2\xbe;\xfe\xf5>\xec\xf6R>\xa4\x17\x8c\xbd\xf9/\x9a=]\xe9\xdf\xbdc\xc0\xda=<\xb1[>\x14\xd2\xb5\xbd\x05\xb2\x0e>\xff\x0bC>om^>2\xba\xa5=\x05\xfc\x1e==\xfc\xb6>\xd8\xa4\x1e>O\xde">O\xba9?7\xe9\x8a\xbe\x8b*e\xbd5%2;\x08Lx>\xb4\x06b\xbd\xbd\xf9\x9c<a\xe3\xca>C\x06\x15>y\xca\x83>o\x05\xaa<\t\x17\xbb=Y"\xb1\xbe\xdd\xfc\x99>\xf9\xb0\x9d=s\xeb\x10>YG\x16?\xdf\xad#\xbds)\x9c\xbd\xc8=4\xbe\xe1kl\xbe\x98_\x7f>7"\xc2\xbd]\xdd\x8d\xbd\xc1\xd9G=\xb9%z>[\x13X\xbd\xd8\x91\xc0\xbc\x8bO\xa6;Uc\x83=\x07\x7f\x00\xbeY\x1f\xeb=\xe16y<D\xadd\xbd\xeb\xd3\xbb=\x98E\x9c>\xe1\x1e\x8c\xbe\x08\xdf\xc7>\x1c\x8c\x97\xbd\x05B\x86\xbe\x90\x01\xa7>\xd0;\xe8\xbb\x94\xa1\xb4>P\xb1\xae>\xcb\xdc5\xbe\xcf\x8b\xc0\xbd\xe7\xb8\x02\xbe\xf1\xbc\x81\xbe\x01\x02\xc7>\x07\x89\xf7>\x87E\xe0\xbc3a\xa9>\x1d\xc7\xd9\xbd\xb5\xb1~=qx\x83=\x814\xd3\xbe\x83\xac\xb0>\xd2u\x84\xbe\x9c\x13\xcb\xbe\x93\xf6Y\xbe\x85\x12\x0f\xbe\xa0\x81X\xbe\xfbb\xc7\xbe+\xd5\xd3>\xa9g$\xbe\xa3\xd2S\xbe\xcdn\xc4\xbd\'\x0c\xbf\xbe\xb4\xb0\x82\xbdm\x8e\x0e?f\xd8\x0b\xbd >\x87\xbcC\x06\x04\xbf\x8c>\xbe\xbe\xe0\xed\xaa\xbe}\xb5\xbe=\xc8p\xbe>\xcfx\xae=\xfckj\xbeu\x11J\xbe#*\xa5>Y\xd8t=\x00\x1e\xba=\xf9\xcf\x86<$\xa3\xe4>\xac\x90\xbd\xbe\xe9\xd9#>\x04\x07.\xbe\xa4\xc0{>\x05x\x97>M%\xcc>#\x7f\xf8>1\xea\xc1>\x7f:\x08>\xd0T7>\x90\x00\xf3='
-p638
-tp639
-bsV580215301578625025
-p640
-g2
-(g3
-(I0
-tp641
-g5
-tp642
-Rp643
-(I1
-(I200
-tp644
-g12
-I00
-S'\x93j\xa7>Iw\xce\xbd\xdb\xd5\x06\xbf\x9b\xf0\xc3=(\xfa\xb0>\xc1\xb5\x15\xbe\x11\xdf8\xbe\xe5\x92m\xbe\xc1\xf7\x7f\xbd\xcbK3>\t+\x10>\xc0i\xb8\xba\xc0\xefH>m\xb4\xb6=\x8d\x0e%\xbe\x9d\xb4\xc9>mz\xd6;w\xbd\xd1\xbd}\x80\xf6\xbd\xf9=\x90=\xfb\x17\xc2\xbe\x12\x14\x16\xbd\xca\xf6)>_\xeb\xdb\xbe\xf9\x93\x07\xbe\x98\xf4\x03\xbe\x0b\xa3R>\x00\xa3\xab\xbe}<\xb0\xbe=\x9c7>\xa3\xdb\r\xbd\xf1r/\xbe\xf8(]>b\xa2\xa2\xbe\xd0\x10\xc8<\xcf\xd6\xd3>g\xa5\xb3<;Z\x1a>E\x13\xc6>\x1d\x079>\xe3)\xd0;\x13S\x0c>/z\x98>\xcdd\xc8\xbe\x874-\xbeM\xef\xd0<&\xf4\x03?\xf5r\xdf< \xaf\x8b=I\x97\xf2>0\x1d\xab=\x92\x03\x0c?\x1f\xe1\x8b\xbe\xcf\x8b\xf2\xbc\xec\xb9\r\xbf\x05\xa3\xb3>\x00\xd0\xf76\xb0kR\xbe%\x88\x00\xbfW\xe9\xfe\xbeX#\xab>\xe4\x85\x15=\x8cz\xb2\xbdd\xa7\xbf\xbe\x94\xe7\xc2\xbd\xbf\xb7\xb2>\x10!n\xbe\xf3\xcc\xf0=\xb5\x80\xe7\xbe\xe5\\3\xbe162\xbf\xa5\x0f\xc3\xbe\x90\x92!\xbbK\x884\xbe\x12\xcf\x81\xbe\xf5\xdc\xbd>\x83\xf5\xb8>\xe5\x1f9>v3\x13>\xff\x7fX>])&\xbem \x92\xbc\x04\xff\xb7>`d\x86\xbek\x93H>\xcb\xdeF>\xaeb\x9c>\xd3\xe8\xe7\xbe\xd8\xf9\x1e?\xb5\xaeZ>\xde\xbd\x01\xbe\x876H>\xb8\xa8\x96\xbe\xab\xf9\n>U\xcf\xaa>\x8f&\xaf\xbc\xf7\xd7%>-\x97\x99>\xbbaa>\xbf\xf2\x9d<\xd5\xb5\xae=W{\xe1>\t3\x0f>\xcc\xb3+>\x1a&%?;\xe0\xa4\xbet>-<h\x03\xfc<-J\x06>\x11[\xfb\xbc\xa1r\x0b\xbd\x8f\x97\xc0>\xf5\x8b\x0e>\x10\xe9k>+\xdb;\xbc\x8fq\x83=U<\xd7\xbe\xf0n\xb6>5\xbd\xa3=m\x8e\x1a>\xdd=-?X\xcb\xe5<p\xb0\xa8\xbdAg\xa1\xbd\xa3O\xab\xbd\x93|\x9f>pW3\xbep0\x86;ew\x0b\xbba\xae!>\xfdMK=m\xd4s=\xcd\x95v=4\xfb\xc2<$B&=[\x95\x17>\x80\xed\x91<\t\x91\x10<t\x06\xb0=xqI>D\xe0a\xbe[\x16\xe0>E1X\xbdI\x98\xad\xbeG\xac\xa8>}\xfa\x89\xbd\x0b\xee\xa5>\xb3\xd5\xaf>\x81\xf7g\xbea/J\xbd\x9d\xdb\x04\xbd\xedBk\xbeA\x80\x91>3\x1e\xc3>\xe7\x1c\x1c=9u\xe5>\x07\xb2\xc3\xbd\x1d&\xd2=,\xbe\xea=\xe7\xf7\xac\xbesT\xae>\xb5\x06\x81\xbe\xd5}\xb8\xbeS*X\xbe\xa7\xf1\xff\xbd\x80}G\xbe\xe3\xe8\xf6\xbe\xf5U\xda>\xc2e\x02\xbeY%\n\xbe\xa0\xc4\x0e\xbb\x93[\x8e\xbe \xaf\xec\xba\x18\xba/?A2W=\xe7\x8e\xab\xbb\xbc\xc6\xdc\xbeg\xd2\xc9\xbe\x1c\n-\xbe9z\x1d>CI\xc7>\x0f\x8b\x99=c\x84X\xbe\xeb\x1f\xf5\xbd\x04g\x8f>\rD\x08\xbd\xe7\xa1n>\x10Q>=\x1d5\xc6>6\x00\x95\xbe \x91K>\xd3\xeb\xa9\xbc\xab\xc2e>\xfd\xa7\x92>p\xc5\xc6>-\xfb\xee>5\x9dz>!6\n>\x1b0\x9a=\xb0TQ>'
-p645
-tp646
-bsV580981542828163073
-p647
-g2
-(g3
-(I0
-tp648
-g5
-tp649
-Rp650
-(I1
-(I200
-tp651
-g12
-I00
-S'0p\x18=\x13\xfe\xc3\xba\xb3A/\xbd\n\x0b\xad:>\x03\xf1<\x92\x10\x95\xbb\x1e\x12+\xbc\xb6\xc2\xcf\xbc\x16o\xf8\xbb^\x00\xd6<\xa2l\x92;H\xdd\x06\xbc:\x82w<\xe1N\n<\x00\x1fH\xbc\x94\x89\x1e=\x08\xf8\xd8\xbb;\x15:\xbccQ\x8f\xbc/y\xbd\xbb\xfb\x8f\xd3\xbc\x03R\x13\xba\xdd\xddv<H_\xa5\xbc\xa2CA\xbb\xd2FF\xbc\xdf\\\x9e<~\x84\xc0\xbc\xa6\x1c\x01\xbdw(\xe5;\xf8%O\xbc\xd3\xd3l\xbc\xcf.\x81<\xe8\x90\x16\xbd\xd3\xb9\xba;8?\x17=Fem<bf\x8e<0m\x14=\xb8{]<\xb4\xc4\x0e\xbc\xf2R_\xbbI\xca\xc1<Z4\xcf\xbc\xb8\xbf\x8c\xbc\x84\xddT\xbblZ6=HZ\xe7;\xf8\xda\xf2;\x9e:J=V\x9c\x18:J\x85>=\x008\x97\xbc\x0b\xc0\x84:\xe8lT\xbd\x14\xf2\xb3<\xda%\xf2\xba\x9e8#\xbcT0x\xbd\xa4\xacB\xbd\x06\xbe\xb8<\xf2D\x8a<\x06G\xa7;\x9eD\xf1\xbc>\xc1\xa0\xbb\x98\xca\xc8<7 \xd8\xbc?\xdb\xb4<\xaa\x80\xac\xbc\xb2\xc2\xa0\xbc\x82\xdfs\xbd\x84\xaf\x10\xbd\xf0\xe5\x90\xbbw\xeag\xbc\xc2-\x8b\xbc\xe6Q\xa8<$<\xb7<\x1e\xa1\x8d<>\xd8\x8c<\xf0G\xba<] \xf9\xbb\xe8\xb0/;4\x7f$=\xd2\xc5\xdf\xbc\x100\xab<L\x11s<\x89W\xeb<\xed\xf7!\xbd\xd0Pf=\x9f8\xe3;\x88\x8b\x97\xbc\xcdrT<\x96\n\xdd\xbcDrb96b\x0c=\x1e\xbb\xb5:\x961\xb9<\xcb\x01\x02=7\xdd\xa9<\x1e\x89\x19\xbc\x86\x81\xe8;8\x08\x06=e\xc1\x82<I\xd5\x93<\xcc\xdfb=\xb5t\xf0\xbc\x84\x8f\xb6:\x1czC<\xab\x1b!<x\xd2\xb99\n\xbd\x8a\xbc~\xa8\xed<.\xa0\x8b<[\x02\x98<\x04\x08\x0f;\xe4\xf5\x86;\xbed\x18\xbd4\x94\n=(3\xf4;s~\x19<\xd4\ni=\xfe\x08@<\xf6ir\xbbP\xf9\xc2\xbb\xc8?\x17\xbc\xd8\xa5\xd3<o=\x86\xbc\xb2"D;\x04\x03\xb9;\x1a\x86\x96<7\xac\xdc:Z\xea=<\xf0\x0c"<\t\xaa1;\xf8\x8d\x8d;q\xef\x15<\x1fz\xd6\xbb\x03R\xfe\xba\xfa\xbd)\xbb\x02\xf4`<p>\xb7\xbc\xa8<\x0f=\x9dp\xa8;\x17\xa8\x0c\xbd\x1c:\x11=\x15Lf:&\xbf\x9b<\x01\x92,=\xf5\xdf\x91\xbc\xc34/;\x94[\x89\xbb:\xf3\xaa\xbcqX\x00=;\t\xf7<\xa3\x89\x8e:\xe2N =m\xa8t\xbc\xac\xc6]<\xf6\xdf\xdb;\xac\xcc\n\xbdd\xd98<l\xde\x01\xbdb\xdf?\xbd Q\xb2\xbc\x16}w\xbb\x00\xa3;\xbc\x020<\xbd\x98r\t=\xcf\xa9\x82\xbb\xbf\xc4L\xbc\xe8\xb4A\xbb\x1a\xd5\xf5\xbc\xbd\x99\xa7\xbbT\x97`=P\x1f\xc0;P*S;B\x1b6\xbd\x10f*\xbdy&\x9b:>\x04c<:\xef\x1c=)\x95\xe6;~*\xd4\xbc\xd8\x97\x17\xbc\x94a\x14=\xa2\xe6\x14;\x1cK\x8c<\xc9\x8d\x87;w\xae\x07=\xea\xcd\xcc\xbc\x06\x85\xc6<\x95\xfb\x13;\x94\x19\x90<MH\xe0<6\x8dF=\xbf\xf2)=\x10\x9fK<+j)<f\x0f,<z\xe8x<'
-p652
-tp653
-bsV580365718589431808
-p654
-g2
-(g3
-(I0
-tp655
-g5
-tp656
-Rp657
-(I1
-(I200
-tp658
-g12
-I00
-S'4L\xed<kb\xa5\xbd|\xf4\xd2\xbe\x0c\x0e\xc4>+c\xa5=\x14>\x18>\x99\x82\xd3\xbe\x11\xa6\xf7\xbd\x06\x0e\xbd\xbc\xfff\xad>\x073\x82=\xaf\xe2\x0c\xbf\x8d\x055>\xa0K\xea=6\xc6\xf0\xbc\xa9\xed\x98>s\x98\x99\xbdq,\xb3\xbe\x8d\x94\x03>\xef\xe98>\xa7>\x17\xbfjc\xab\xbd\xef~\xec=3\x96$\xbenp"\xbe\xe7Xg\xbc\xfc\x91;=\x86`\xdd\xbd\x8a\xec\x07\xbf$r\xf7\xbd,]\xb0\xbe\xd7\x16[\xbe]\x04\xac>\xa7\x9d\xc0\xbe6QG=\xb7U<?\xcf.\xb1\xbe\x9c\x9b\x8c=*\xb2v>\xb4\xee\x05?\x8f\x92\x03>\xb4\x1b\xec><\x1ei>\xa6d\x02\xbf\xfc*\x88\xbe\x7fnj;\xc6M\xcc>\xca\xd6\x92>\x8d\xc4\x00>l\x8c\xdd>\x9d!j\xbd\x9a\xc0\n?\xe9A\xa0\xbejYw\xbeCb\x1f\xbf\xcf\xe7\xd3>y\xc1a\xbeLgW\xbeMm\xf1\xbe<\x18\xdd\xbe\xea$\xd8>I\x9ak\xbd\xe0\x9a(\xbew\x970\xbf%w\xa2\xbed\xad\xe6>\x8c#\xc7\xbeY\x1b\x06\xbe\xcf\x98\xde\xbe\xf4\x90\xd5\xbe\xb2\x88\x19\xbf\xf1\x7f\x12\xbf\xfc\x01\xef\xbd\xb6c\x7f\xbe?w\xcc\xbe\xc4#\x08?\x81L\xf8>\xa9i/>{C\xb7>:\xe2\xd4=o\xda6\xbefBn\xbb\xc7l#?\x04\xa7\xaf\xbe\xed\x81\xdf=\xb62\x9e>Z.M<\'\x82\x1a\xbf\xbcC\x0e?\xb1\x02\x9d>\x91\x15)\xbbM{\xf7\xbb&\xe7%>\xae\xc4\xa5=\x85\x94\xb7=_O\x83\xbe\xcd\x98\x10>\xbf\x11\x9f=\xf2\xc6\xb7>\xbc\xfeV>\x84a\xeb\xbcJv\xcd>\xd4\r\\>\x01\xaae>9{\x94?\xd30\xbf\xbe\x00!Q\xbe\xbfSV\xbc9d\x03?u\x95\r\xbe\xfc\xf7\x81=<\xc7\r?\x14%4>\xaf\x8e\xd4>\x94\x12\xb7=\r\xbbJ>\xdc\xef\xe7\xbe8\xcb\x94>\x14g\x9a=\xc0x\x18>\xfdtB?1\xf8a\xbegt\x04\xbe\xefx\xbd\xbe\xc3(\x03\xbf\'}\x8d>\xe6\x02\xdb\xbcag\x1b\xbe!\xaf\xf5=y%\xf3>7h?\xbe\x01\x1f8\xbe\xc3\x10\xd3\xbdl\xae\x00>!\xb2\xf0\xbe\xbf\xd4\x13>\x0cN8=\xd6\xaf\xfa\xbd\xb4;\xd4=Ig\x10?\xad\x13\xee\xbe\x15\xf6\x0c?\x8d\xa9\x06\xbe`\x13\x86\xbe\x8c\xae\xf0>\xca"\xbe=\xb1R\x08?o]\x02?\xbf\x8dJ\xbe-^O\xbea3\x89\xbe\x10\xcd\xba\xbe);\x1c?\x91\'Q?\xbb\xa6\x19\xbe\xf1\xd9\xc8>\xc7==\xbe\xcd\xc2\xd8<\xa1\x11\xc5=VK3\xbf\\\x81\x10?\x17"\x9a\xbe\xabT\x10\xbfG\xf9\xb3\xbe\x8d\x93v\xbeJ\xa9\xaf\xbe\xd6*\xd9\xbe/K\x1b?U\x9c\x90\xbea\xbb\xc8\xbe`\xc9\x86\xbe\x05\x18)\xbf\x13\x9bE\xbe\x973\'?\xbcQ\x15\xbeS\xd9\xfd<\xf4\xcaQ\xbf\xb3\xb3\xee\xbe\x07\x9a=\xbf\x03\xdcw=\x94\x18\xf3>\xa7\xe9\x1f>\xa1\xb1\xb3\xbe9\xac\xb4\xbe\xcf_\r?\xd6\xea\x0f>?\xf1L\xbd\xd7\xd5Y\xbczF:?=\xce\x1d\xbf\xa4\xde\xfb=C\xf2\xe6\xbe<\xc0\xc9>\xc3b\xcd>w\xc6\xf5>\xce$7?\xc9\xbbE?!\x9aH>\x87\x19\xcb>\x01Y\n\xbd'
-p659
-tp660
-bsV580259883976556544
-p661
-g2
-(g3
-(I0
-tp662
-g5
-tp663
-Rp664
-(I1
-(I200
-tp665
-g12
-I00
-S'\x08k\xdf\xbc\x9c\x85\xb3\xbd\x1cp\xf4\xbe\xee\xf6\xff>\xa4\xeab=Y\xd1T>\x07\xc6\x04\xbf\x95e\xe9\xbd\x97\xcf\xc6\xbct\x07\xd1>\xfd\x87\x88=\x07\xa1;\xbf\xf0ZU>\xac\xde\x10>\x9e\x9b\xa6\xbc$/\xa5>\x919\xc0\xbdWW\xe8\xbe\x84\xa4E>\x02\xfbz>\xfe;=\xbf\xc9\xbe\xe5\xbd\xbbt\xfb=\xe8|%\xbec\xa0H\xber\xc5\x7f\xba\xd3\x80\xc8<,\x0b\xc2\xbd\xa2\xa1$\xbf@\xd0G\xbe\xce_\xe8\xbe\xdc\xbe\x83\xbee(\xdc>$c\xe7\xbe\\.R=\x12\x19k?\xa4[\xfa\xbe\xe7\x8f\x9a=D\xb0\x80>\xadZ-?1#8>\x19&\x1e?\x80Y\x80>y\x15 \xbf\xf7U\xa5\xbe\xe5F\xc2:B\xa8\xe0>;8\xbb>\x80\xcf\x1c>@\xfa\xf9>\xba\x0c\xbb\xbdG\xdd$?\xd4\x1d\xc1\xbe\xc2\xdc\xa1\xbe\x1bt;\xbf\x14\xa7\xfd>\x1a\xd9\x94\xbe\xff\xdf\x82\xbeI\xbf\x07\xbf\'W\xfd\xbe\xccJ\x03?\x17_\xe2\xbdt[h\xbeuR[\xbf\xa5\x0e\xcd\xbef\xe1\r?\x00t\xf2\xbe\xb0w_\xbe\x8b4\t\xbf\xcb\xdf\x06\xbf\x82\x0b0\xbf\xe4\xd91\xbf~\x88\x1d\xbe\x88\xcf\x9a\xbe\xf0\xf0\x01\xbf\x88\xf1%?\xb4\xfb\x1a?d}I>P\xdb\xe5>\xa6\xd3\xc8=t\xcbc\xbe\x93\t\x0b\xbc%\x95I?\xf5\xfa\xd3\xbe\xd0\xa8\xe6=\xc4\xe6\xc5>Q6\x1d\xbd\xa8{<\xbfl\xfb$?\xbe\xcb\xc2>\xae\xb8\x9e<)G=\xbd\x0c\xb1\x85>/S\xd0=\xa7j|=\xbd\x1a\xa7\xbe\xcc\x97\x1e>6ID=\x14\x04\xde> Y\x8e>\xa7x[\xbd|\x88\xf2>D\x94\x84>\xf1-\x89>\xd8g\xb8?\xfc\x16\xe5\xbe(\xf1\x8c\xbe\x8e\xaf\x04\xbd\xc6\xbe*?\x8b\xb17\xbe\xb6D\xd7=d\xe6.?X\xb7P>y\r\x03?\xab\xc5\xf7=\xc1\xd3\x81>m\xa7\n\xbf$\x8e\xaa>)\x94\x93=\xe3T4>\xc9\x1bf?\xf4\x02\x9f\xbe\xb1\\0\xbe\xf0.\xf4\xbe\xcc\x99,\xbf\xb4a\xa4>\xe4\xda>\xbc\xf9\xd1S\xbe\xbf3\x1a>\xcd\x95\x19?\x1b\xf8\x83\xbe\xf2\xe6~\xbeTw\x16\xbeY\xb8$>RK$\xbf\xac^4>\t^S=lM$\xbeJ\x9b\x04>\xa5\xad:?\xf2\xb3\x14\xbf\xfc\xec&?\xd2\xc2A\xbeB\xf0\x92\xbe\xcc\x9f\x12?\xfcV\x02>g\xb9)?t\xb5\x1d?I\xb8a\xbe8\xb8\x89\xbe]S\xb0\xbe\xa1\x14\xe3\xbe.ND?\x8d\xe0\x83?\x9b\xc2J\xbeBC\xeb>p\xdfe\xbe\xdbV\x8e<\xa5R\xea=\xbc\xcc^\xbf\x8c\x866?\\\xb8\xb4\xbe\xedG.\xbf\xa7\x06\xe6\xbe=A\x9f\xbe$\xc0\xe3\xbe\xe0L\xfa\xbe\xb4\xcb<?$.\xb5\xbe\xb29\xfd\xbeC\xcc\xb5\xbe\xe5yU\xbf~\t\x80\xbe\xa6\x8bC?o\x98K\xbe4\x926=\xa2\x1f\x83\xbfu\xa6\r\xbf\\@|\xbf\x0e6q=l\xb5\x14?j\x7fA>\x95[\xd9\xbe7\x81\xe6\xbeX\xf1.?\xf1\x15A>\xe5|\xd8\xbd\xb4\x0b\xf8\xbc\xc2\x12f?\x1a\xebD\xbf\xe6\xda\x03>\x14\x8d\x1a\xbf\xd7\x0b\xff>\x04\x91\xfe>%@\x12?"\xdb`?\xfc\xdb~?\x87\xd9r>\xcd\xe0\x03?m\x8e\x9b\xbd'
-p666
-tp667
-bsV580922835952095232
-p668
-g2
-(g3
-(I0
-tp669
-g5
-tp670
-Rp671
-(I1
-(I200
-tp672
-g12
-I00
-S'\xe9t\x16>\xe8\x8aV\xbd\xc1N\xcd\xbe\xa7\xfd\x87>\x11T\xe4=+\xba0>/\xd1u\xbet*\x13\xbeV|\x18\xbd\xfbg\xcd>\x1b\x17d<\xcb\xed\xe9\xbe\xcd\xba1>\xdc^\xb1=\xa7a\x0c\xbc\xe6c\xa6>\xcd9\xe3\xbd\x8b\xb2\x9a\xbeU,\xe9<\xfb\x1aM=\xff\xc7\xfd\xbeoZ\xcc\xbcE\xdf\x02>(\x85\x9b\xbc\xc5q\x80\xbd*\xef\xa3\xbd\xac\x07\xe4=\x0b\xc1\xc8\xbd{\x1a\xee\xbe\xb0!W\xbe\x87\xc3\xa7\xbes\xc3%\xbem7\x82>\xbf\xbb\xe8\xbe\x853Q=\xb4V\x1c?\x91\x1b;\xbe\xe5\xbd\xda=\xdb\xde\x89>\x9f\x84\xb4>U\xe8\x84\xbb\x81\x00\x8c>{\x8b@>\xa4~\xc4\xbeP\x0ev\xbe\xcdrg\xbd\xd8\xe3\xd5>\xac\r\x83>%2\x01>(}\xf6>\'\r\x9c\xbd7\xcf\x0c?\x00\x12w\xbemb\n\xbeg\xf9\x14\xbf\xcc[\xab>\xd8\x16V\xbe\xc3pd\xbe\xa5\xaa\x0e\xbf\x04E\xef\xbe\xb1\x00\xae>\xa3\x85\xb4=\x0c!7\xbd\xf9=\x15\xbf\x17\xa7/\xbe?E\xa0>+\x13\xd6\xbeK\xac\xd2<0\x7f\x8c\xbe8\xab\xad\xbe\x0b\x10\x0c\xbf\x08\xe3\x02\xbfx\xe9^\xbd\x8b:H\xbe\t\xaf\xaa\xbe\x01U\xb3>P\xbf\xb9>\xb0\xbb->+3\xac>]\x8f\x1e>\xca\xd1\x0e\xbe\xe0%"=\x1f\xc5&?G7\xb4\xbes\x04\x1e>\x9c\xe7~>\xcd\x97\xf6=\xf5(\t\xbf\x9br\x11?\xa3M5>=g\x13\xbe\xf0\xec-<l+_=\'\xf7\xe8<k\x00_>}MI\xbe/B->Q`\x1f>[)\xb3>8\x9cD=\xd5\xea\x04\xbd\x012\xb4>\xb3\xa9n>1Wd>\x1b@x?\xd7\xcf\xa6\xbe\xc9e\x18\xbey\x05\x97=\x01\x00\xbd>pJ\xe2\xbd/\xa8\x95\xbd\xb9\xb8\xbc>#\xaeB>\nD\xa3>C\x96\xb1=F\x8b\x13>\xd1\x86\xdf\xbe-B~>\xd0ql=\xf8<r=\x04X5?0\x87\xdb\xbd\x84\xd4\xb0\xbdS\xa5\x90\xbe?\x9e\xd1\xbe\xdb\x0f\x90>\xff8\x90\xbc\xbf\x88\x04\xbe\xa7\xd6%>\xe7\x86\xc2>\'\xd5\xfb\xbd\r0\xc5\xbd\xa3wd\xbd\x89\xaa\xbe=-\xbf\xab\xbe\x18\xdc4>\x88w\x1f\xbc8\x98\xb9\xbdt\xa1\xb4<\xf7g\xcc>i"\xd6\xbe\xf5o\xe8>\xdd\x12\x84\xbd\xc9b\x9a\xbe\x10f\xdf>\xa7 \xd4=\xb8D\xc5>R\xaf\x03?\x10\xd3K\xbey\x03\xfe\xbd{\t\x82\xbe\xc3+\x9b\xbe\x17\xb3\x08?kj$?\xb1\xbc \xbe\xa9\x8e\xe6>M\xbcg\xbe@\x84S=g\xda\xb4=J\xc0\x1d\xbf-\xc8\xa2>\xe3t\xa4\xbe\xd6\xe2\x19\xbf\xf9,\xb3\xbe\x18\x8c#\xbe`Mt\xbe\xbf\xec\xe1\xbe\xd5 \x08?\x99\xe3Z\xbe\x81 \xa2\xbek\x8aQ\xbe\xae\x1d\n\xbf\x04(A\xbe\xb9<\x1e?)\xb8\x84\xbd\xa4\xb3T=\x85T<\xbfO\x92\xe8\xbe\xb9B\xe2\xbe?\xe9\x92=M1\xf8>\xa7`\x19>\x80T\xad\xbe\x90\xb4\x86\xbe\xa1g\x05?\x03\xf7\xcd=Q\x15\xf8\xbc\x9e\x16\x8f<\xbb<\x16?\xd1g\xec\xbe\xad#9>\x05]\x91\xbe\xb7d\xb1>\x1f\xf2\x98>#B\x11?\x8dr\x16?9\x99\x0e?\xd3n\x06>Q\x91\xb1>\x95H\xea\xbc'
-p673
-tp674
-bsV580988709119496193
-p675
-g2
-(g3
-(I0
-tp676
-g5
-tp677
-Rp678
-(I1
-(I200
-tp679
-g12
-I00
-S"\xd6}\xf8=\xe0>]\xbd\xfc\xe6\xb8\xbe8%\x99>\x86C\x19>\x04\xd4(=\x83&\x8b\xbe\xc04S\xbe4\x8b\x13\xbc4&\x85>\xa7\xfeZ=\xcct\xb2\xbec\t\xdd=\xe3\xfc\xd7=\x80\x80\xba;\xe4'\xbc>\xb8I\x8d\xbd]_J\xbe\x03F\x81<V\xe7\xd9<\x94<\xca\xbeJs\xc2\xbd\x1d\xed6>3\xd0\xf3\xbd&\x1b\xec\xbd\x99g'\xbd\xb1\xbd\xb5=\xa7\xac\xeb\xbd\xdcz\xb8\xbe\xfeN\x91\xbdI\xc8\x9e\xbe\xef\xae]\xbe\n\xd9Q>\x91e\xb8\xbe\xa6\xbcX=wn\x13?\xf9\xc9\x12\xbe\x93:\xd9=\xdeu\x8d>\xc1L\xa1>\x80\xf8\xf5\xbc{\xfe9>\xafA\x10>)\x89\xa0\xbe\xbc\xc6\x8f\xbel4L\xbd\xa6\xc6\xc6>f\x8do>TM\x1a>D\xa2\xcd>\xcf\xc0\x0f\xbd7X\xdd>\xb8\x1b/\xbeY5\x0e\xbe6z\xfb\xbeD\xff\x8f>\x00\xba$\xbeQ\xc7V\xbe\xbf\x80\xdd\xbem\xff\xd0\xbe\x03\xafZ>\x80S\x94=\x9fI-\xbdh\xa0\x02\xbf\xd5$-\xbed\xf6\x99>bs\x96\xbe\x8f\x9a\xe9\xbcv\xc4\x8e\xbe\xae\xc2\xae\xbe%\xf8\x12\xbf\xbf\x88\xfb\xbe\xc7!\xf6\xbd\x916/\xbet\x18\x83\xbe\x8c\x1a\xb0>\x0c\x10\xaf>rH\x16>lq\xa5>\x08.\x1c><\xc1\xbf\xbd\xd2\x84\xb6=\xffd\xfd>\xea\x18\x97\xbe\xef\xcb\x05>$\xdcN>\xa1\x9e\xc5=\xaf\x96\x00\xbf\xc9\x03\x17?\x96\x9b\xf1=\x0f\xc5\xed\xbd\xdb\x08\xa9=\xf9n\x0e=\xdd\x9d4=Cu:>\\L7\xbe\xf0\x01\x87>\xb9\xff\x14>6z\xac>\xcatb=\x14Kt\xbcA<\xac>4JI>\xba\x9by>\xb4\x8de?\xe8\x10\x9f\xbe\xac9.\xbe\xd8w\x96=Ty\xba>\xfa+\x7f\xbdc>\x04\xbd\x01\x98\xb9>luM>\x01\xb3\x94>\xf4\xc1\x88=q\xdf\x1a>C\x08\xcc\xbe\xfaZm>\x06x5=\x83q\x8f=i<-?\xc9\xf5\r\xbd\x07\xc8\xa3\xbd\xc5\x8b\x89\xbe\x83W\xbb\xbe\x047w>\xbcT\x07\xbd\xc9\x07\xb3\xbdj3\x01>\x9d\xb2\xca>\xbf\x8a\xb3\xbdF\xad?\xbc\x93\x92?<8\x13\x96=I\xbf\x8d\xbe\xed\xce'>\x91D\x00\xbc\xd2f\x89\xbd3\x1e\x1b\xbd\xaer\xb2>6,\xd5\xbe#D\xec>\xe9\xe4?\xbd0\n\x9c\xbe_p\xb4>\xc6\x10\xfd\xbb\x1cS\xa7>c\x81\xf8>\x10\x8f,\xbeQ\xbf\x0f\xbd\xe9R\x17\xbe\xe0Ml\xbelI\xef>v\xbe\x0f?\xe5*\xb4\xbd\xf9\x12\xc7>d\x1fA\xbe`\xbbV=\x1e\xd2\x06>nR\x00\xbf\x12\xf1\x94>\x87\n\x8e\xbe\xa0&\x0c\xbf\x0f\x8d\x81\xbe\x99.,\xbey\xaa\x06\xbe\xc9(\xb6\xbeS!\xf6>\x97\xe8F\xbe\xcc\x9c\x8f\xbe\xbc\x90,\xbe7F\x05\xbf\xc3\xe60\xbe\xcc9\xf3>\x10\xaa\xc9\xbd\xaf\xb7~=i\x05\x1b\xbfW\x9a\xba\xbesI\xa7\xbe\x03\x83\xe1=\xfdn\xe4>`\xab\xb7=t|\x86\xbe?\x064\xbe!\xec\xfd>o?\x06>jc\xa7=\x94E\x00=\xf4\xc6\x07?\xa9\xec\xed\xbe$\rO>\xc0YL\xbe!\xe8\x81>\xf4b\x97>\x14[\xed>\xbck\xfc>\xe3h\xfd>\x7f\xe9\r>\xe4T\x92>\xd6k\xc5\xbd"
-p680
-tp681
-bsV580598825695465472
-p682
-g2
-(g3
-(I0
-tp683
-g5
-tp684
-Rp685
-(I1
-(I200
-tp686
-g12
-I00
-S"\xae3\xdf<7+Y\xbd@\xa0\xb4\xbe\xa4\x17\xa4>X\xf1\x8d= T\x0c>`o\xae\xbe\x88\xe1\xcd\xbd\xee\xc3\xc0\xbc\x03\x92\x97>S$N=\xd5\x11\xf7\xbe\x18\xe2\x18>\x94\xb5\xc3=\xc0\xd7\xb1\xbc\xe8\x89\x83>Y\xf0\x8d\xbd(~\x9c\xbe\xe5\x14\xce=\xcd\xaa\x19>\x88\xc1\x00\xbf#\x8d\x8a\xbd\x87\xf2\xcc=\x16\xf4\xe6\xbd\xde\xc1\x03\xbeT\x07U\xbc\xe2#\x13=A\xc7\xac\xbd9t\xe5\xbe\x86\x8f\xff\xbd\xe3\x9d\x9c\xbe\xc7G5\xbeb6\x92>\x8b\x1e\xab\xbe\x07\xc4?={\x12!?\xe6\xf1\x94\xbe\xf4.\x89=\xd4*K>0\xda\xe5>7\xea\xd6=CH\xc6>F'>>kC\xdb\xbe\xfa\x1bc\xbe\x11\x82\x90\xb9%Z\xac>\xcd!|>\x1bV\xd7=|\xa2\xbc>\xe0\x82z\xbd\x03\xf5\xee>\x03\xa6\x87\xbedKL\xbe\xcd[\x08\xbfS\x1c\xad>\xe4\xf5B\xbe\xbe\xb44\xbe\xed\x85\xd3\xbe2\x88\xbf\xbe\xee\xee\xb6>Xu\x19\xbdU\xdb\x0b\xbe\x96\xcd\x13\xbf,\x0b\x87\xbe\xfe\xab\xc1>--\xaf\xbeq\x0f\xdb\xbd\xa5\x8e\xb5\xbe\x80\xae\xb8\xbe\xfdK\x00\xbf|\xd2\xf6\xber\xb7\xd7\xbd\x11\xf5W\xbeG\xb4\xb1\xbe\\\x12\xe0>\xf5\x97\xcf>\xbb>\x19>\x84\x18\x9d>\xf7t\xa9=hP\x19\xbe\xb9\xca9\xbb\x18{\x0c?\x99\xda\x98\xbe\xc0\xe8\xc4=\x9d\xd7\x86>\xb6\x03\x1f<F\xe7\x02\xbf\x0f\xd4\xf4>lf\x80>.\xe6\x98\xbc\xe5n\x84\xbcsM\r>\xe8\x02\x81=\xb8<\xa4=\x19\x1a^\xbeUP\xff=\xa0\xaa\x83=\xb5\xd2\x9a>J:)>\x99x\x0c\xbdX\xe6\xaa>\xc4;=>\x88\x16E>\xf7d}?Y\x11\xa2\xbe 4.\xbe\x11\xe9\xab\xbb1\xd5\xe0>\xf3\xda\xf5\xbd\x1a\xd7\x19=Q\xa8\xed>\x91.\x18>\x98D\xb3>;\x89\xa6=\xfe\x01,>\x82\xb0\xc6\xbe\xed~|>\xcc\x1cf=k%\xf5=(H$?\x9fv>\xbe\xcd\xda\xe3\xbdG\x14\x9e\xbe$\xf9\xe2\xbe$\xd8p>\xe4\xcb\xb1\xbc\xfc\xae\xfe\xbd\x11R\xd1=\x01\x0b\xcd>i\xac(\xbe\x99]\x1c\xbe\x9c*\xb9\xbd,\xdb\xd2=e\x08\xd1\xbe$V\xfe=\x84a\xdf<\xc1m\xd2\xbd\x08]\x90=\x84\xb9\xf3>\x19\xfe\xc9\xbe1\x00\xeb>6\x9f\xde\xbdh\x91\\\xbe\xd9>\xd4>\x0e\x93\xbc=\x17\x1d\xe4>\xbb\x10\xe3>\xa5\xe8)\xbe\xdb\xa3.\xbe\xbc\xe9l\xbe5\x8d\x9c\xbe\x14\x8a\x05?x\x850?\x11\xde\x07\xbe\x0c\x0f\xad>a\xef%\xbeq\x18\xca<\xf5P\xa5=\xa2.\x1a\xbf\xb1j\xed>\xa1\x0c\x81\xbe\x06n\xf8\xbe&\xae\xa0\xbe\xd1DM\xbe\xb9J\x97\xbeT\xcc\xb9\xbef\x86\x03?\xd86o\xbe\xbbf\xaa\xbe\x9e#n\xbe\x9c\x08\x11\xbf\x0b\xf52\xbeN\xda\x0e?\xa8\xb2\xf1\xbd\x8c\xe9\x0e=\xa2\xc44\xbf\xe2\xf8\xcf\xbe\xb80 \xbf\x12\xaai=\xba\xa8\xd4>y\xcd\x03>D\xb4\x99\xbe\xfa?\x99\xbedC\xf7>\x89\x9e\xf5=\xa9\xe6D\xbd3\xc7O\xbc\xe3\xba\x1c?\x8b\xc9\x04\xbf\x8c\xb8\xdb=\xf3\x16\xc7\xbe\x16:\xac>\x98\xc2\xb2>\xde\xa8\xd8>\x9e\xc3\x1c?g\x88&?\x8cq)>\xf1`\xae>\xa6X\t\xbd"
-p687
-tp688
-bsV580353923371925504
-p689
-g2
-(g3
-(I0
-tp690
-g5
-tp691
-Rp692
-(I1
-(I200
-tp693
-g12
-I00
-S"\x84\x14\xee=\x1c\x06\xf2\xbc\xfb\x9c5\xbei\xce<=\xcc\x0e\xd2=E\x86\xb1\xbb\x9cV\x86\xbd\x1a\x7f\xc3\xbd\x86\xb1\x01\xbd\x86\xf4\xd9=\xac\x02\xdd<eC\x83\xbdT\x95\x9f=\x973\x1a=\xad\xdcB\xbd\x90\xb6\x19>@\xc6\xce\xbc44\x82\xbd-\xa1\x1d\xbd\xd5]\xfb;\x88\xac\x16\xbeG\xe8B\xbcEym=|\xa3\xc2\xbd\x07\xe1\xfb\xbc\xdd>5\xbd\x1b\xa8\x90=\x1c\xc8\xba\xbd\xaa\x04\x1d\xbe\x04\xc2\xc0<f\x0b\x86\xbd\x12\x10~\xbd\xbb0\xab=\xca\x19\x13\xbe\x90\xf3\x92<A[;>\xb4\x1b\x87;\xe2\xe0Z=v\x8f\x0f>KC\xb2=.}\xbe\xbb\x847\x17=\xc1!\xc9=\x8c2\x0f\xbev\x1d\x93\xbd\xd2\xafO\xbc\xf7\xb68>\rE>=\xea\xc2\x01=<\x86D>Y\x02P;p,M>4O\xad\xbd\x84\x97\xc1\xbc2\x1eb\xbe\x0c\xbf\xf0=~\xd5\xfd\xbc\xb4\x04\x86\xbd\xf4\xb7i\xbe,\xf6G\xbe\xe4$\xf5=f\xe5\x1d=\xba\xa9U\xbcu\xa9)\xbe\xe6\x87>\xbdy\xdd\xfc=\xbc\r\xf1\xbd\x90KJ=\x1eq\xfa\xbd\xdd7\xb0\xbd\xd6C\x82\xbe\xd2\x9a)\xbe\x0fr)\xbcs\xbd\x83\xbd\x99>\xba\xbd\x94P\x03>x\xee\x05>z{\x8f=\xc3g\xac=_D\xb7=\x993E\xbd\x91_\x19<w$A>5%\xee\xbd\xde\x19\xa4=\x11\x15\x9c=\x88H\xc9=\xcd\x94@\xbe\x02gj>\x0e\x02v=\x84\xa2\x7f\xbd\xa4\xb4A=\xac'\x98\xbd\x1eg\x94<\x848\xf9=\xc3N\xae\xbcH\xee\xa9=|<\xde=A\xe9\xc2=\xb6\xae=\xbb\xd9)\xd0<\x9dB\x1d>\x96d\x91=\xd4\xe4\x99=\x0e\x15\x93>r\xcb\x01\xbe\xb0\xb8\x8e\xbc#$\xce<g7\xa0=\x0b\xed\x1d\xbc\x9b\xc9\xed\xbc\xa8i\x15>\xd3&\x8e=di\xcb=\xc4x\xcf;\xd8L\x17=\xd9\xdf$\xbe{2\x08>\xdc\x82\xbe<\\\xecJ=\xea\xea\x86>\xb7Q\x19<4\x84\x94\xbc\xc5li\xbd\xef\xb6\x94\xbd33\xdf=s\xebT\xbd\x0b\xe1\x96\xbc:K\xe3<\x9c\xff\xc4=\x8b\xad=\xbcZ\xda?<\xaeH\x8b<v2\xd3<\xb5\x03\x9f\xbc\x18iX=q/P\xbc\xe5\xacz\xbc\xc6\xff\x85<\xac\xbb\xc0=9\xbf\xed\xbd\x9c^2>\xc9\x08X\xbc$\xad\t\xbeD\x83\x14>\xa4$=:\xf5p\xfb=\x1f\xbf/>\xd4\x18\xa0\xbd\x08/\x8d\xbc\xb6\xfa?\xbdF\xe3\xd7\xbd\t\xef!>1\x838>`5i\xbc^\xd3(>9\x8bu\xbd3\xc6-=w\xf3\x02=\xdd\x03+\xbe\xfd\xf0\xc7=,\xb6\xfc\xbd5\x18B\xbe\xec\xc3\xd1\xbd8\xb5-\xbd\xe4\xa3\x91\xbd\x00\xcb?\xbe\xeez*>\x02\nL\xbd4\x01\x9f\xbd:\xe9\xde\xbc8\xf0\x19\xbeqz\xe3\xbc\x05\nw>L\xf7\xa1\xba\x92?\x8b:V4^\xbe\xee\xcc/\xbe\xfb\xf5\x8f\xbd\x9595=\tC->\xf2\x95!=d\x18\xd4\xbd\x9e\xf9m\xbdd9\x1e>$;\x8b<,\x06l=j\x84\xac<r\xbb5>\x1ds\x0b\xbe\xe7\xcb\xb7=@\x93\x0f\xbd\xf4o\xb9=\xf9\x80\xf9=<\xa6F>\x99%J>`\xf2\xf5=\x93)I=\x10\x96\x90=8q>="
-p694
-tp695
-bsV592592666199719936
-p696
-g2
-(g3
-(I0
-tp697
-g5
-tp698
-Rp699
-(I1
-(I200
-tp700
-g12
-I00
-S'\x86V\x0c>\xb5\x04\xdd\xbd\xd7v\x05\xbf\x04\xd2\xb5>\xa2\xbf8>\xaa_\xdf=V\x92\xd1\xbe\xd1\xfaB\xbe6~M\xbd\x00\xb2\xbc>\x8e\x9a\xbf=\x15\x88\xfb\xbel\xeeq>r\xf3\x10>\x7f\x9d\x9f\xbdo\xec\xcb>\x91\xb6\x9b\xbd\x1f\r\xab\xbe\xf1\xd3\x86=+\x9c(>\x11\x85"\xbf\x97v\xbd\xbd\n\x92">z\xf1\x83\xbe&n3\xbe\xfbFc\xbd\xd9\xd8\xd8=\x8e\xb4O\xbe\x89Y\x17\xbf\x15nG\xbd\x14c\xa9\xbe\xcf\xfev\xbe\x1c\xd0\xbe>y\x10\xdf\xbeJ`\x80=P\xebG?\xcal\x91\xbe\x9b\x8b\xda=/O\xad>.-\x05?\xd1\x8a\xea= \x93\xd8>Tg\x95>@\xe3\x12\xbf\xfc\xd5\x8a\xbeFw\xa9\xbb\x8f\x8c\x06?\x1cp\x89>8\x06\x08>\xd0\x1a\n?A\xb3\x08\xbd~p\'?|=\xad\xbe\x8c\x86[\xbe\xc7\xb7<\xbf\xd0\x10\xf3>\x96\xffP\xbe\xd2_u\xbe\xc9q\x1c\xbf\xcex\x0c\xbf\xa4\xfa\xf1>\xe5\xed\xcd\xbc\xc9 -\xbe\xb2\x12:\xbf\xbb\xf3\xa1\xbe\xb6T\x00?L\x13\xde\xbe\xc2\xaf\x94\xbd\x87\x97\x00\xbf\x0b\x9e\xd3\xbeD\xcfA\xbf\x8c[!\xbf\xd1B\xba\xbdPg\x89\xbed\xce\xd4\xbe\xdc\x9f\x13?\x1d\xb5\x08?Y\xcd[>W\xc3\xb6>\x11\xb0->KjP\xbe\xf1\x1f\x11\xba\xceN6??\x8f\xca\xbeW\xd85>\xa1\xf8\xab>\xa2\r\x00>[n/\xbf`\xed.?jp\xa8>^\n\x88\xbd\x1f2@=g\x93,=T\x86\xed=\xa73V>\xcb\x8bk\xbea]B>\xd4R:>\xa0\xff\xc3>\x8a\xde6>\x94W\x1d<T\x9c\xf9>\xcbu~>\xba8\x82>\x90H\x9d?%\x8e\xd6\xbe)\x8c1\xbe^0\x9e\xbb\x91\x08\xfe>\x80\x7f\xff\xbd\xcf\xfa>=]\x1d\x1c?\x1e\x92S>\xe9B\xda>\xdf\x11\x84=%6K>\xbf7\x05\xbf\xa5\\\xc0>\xd1\xc0\xb3=\xc9>9>\xdf1c?\xe9\xbb1\xbez\xc5\x00\xbe"\x90\xb6\xbe\xf9y\xf7\xbe\xde\x8a\xaf>\xf7\xbc\x9b\xbd\xa2F\x1b\xbe<\x82\xeb=\xd4\xba\xf0>\n\xb7"\xbeb#\t\xbe\xe9Y\x87\xbd\x15\xcf\x02>f\x01\xc8\xbe!,1>1\xd5\x1a=E\xe4\xf1\xbd\xe4\xd9\xef=\xee\x1a\x0e?N\x85\xfa\xbe\x8c\xf1\x1d?7\xcb\x03\xbe\x17\x85\xaf\xbe\x9b\xb9\x03?\x98\x9a\x86=N\xcd\x11?W\xa1\x0f?&w~\xbe\xc1\x17>\xbe\x89\xd9\x8a\xbe;\xe0\xcc\xbe\xdb\xd9%?\xd2\xeeW?\x99\x95\x03\xbe*\x12\xf4>\xcb\xe3H\xbe\xa2\xf0x=\xfb\x8b\xd3=4\x7f;\xbf\x01\xa9\x14?u\x8e\xb9\xbe\x16\x93!\xbf9_\xbc\xbeE^y\xbe\xdb)\xb8\xbe&\xac\x08\xbfP\xd7)?G\xb8\x97\xbe\xec\xa2\xcd\xbeump\xbe/\x1c+\xbf \x93-\xbeAAJ?\x81\xf6\xe6\xbd\xf7Rt<<\\b\xbf\xbf\x18\n\xbf\x97\x070\xbf\x06=\xd1=\x01\x03\x11?\xe75(>\x9f?\xc4\xbe\t\x95\xb3\xbe\xee0\x16?y\xf8\x04>lB\xad<z\x0f5<\xc51C?D\x97#\xbf\xaa\x17D>Q\xa6\xce\xbe.\xac\xd3>_\xab\xe9>\xf1\xa1\x15?\x0cxG?V\x1eB?\x8f\xd9V>Y"\xc6>\x9aX1='
-p701
-tp702
-bsV579907249331515392
-p703
-g2
-(g3
-(I0
-tp704
-g5
-tp705
-Rp706
-(I1
-(I200
-tp707
-g12
-I00
-S')\x91\x07=\x8b_\xaa;\x84\xf6\r\xbd\x8e7z;\xfb\xc1\xc2<\xf2b ;n[\xfd\xbb\x1c\t\x9e\xbcf\xa2\xc5\xbbZe\xcb<\x80\x9f\x94;H6!\xbcS\x8c4<\xebl\xc4;P\x11\xb7\xbbd\xa5\x12=\xd9\xf3\x05\xbc\xce\xc4>\xbc\x06\x9dj\xbc\xb4\xd0`\xbb\xb9\xe9\xa3\xbcnC\xbb:\xb2-b<\x82F\xb9\xbb\xb5\xa6I\xbb\xcf\xfe&\xbc\xb1\x9f[<\xc1\x04\x85\xbc^l\xdb\xbc\xdc\xd9\xe19\xaa\xf0]\xbcP\xa8\x18\xbc\xc8\x00,<\xf6\xf3\xf7\xbc\x9b\xd1\xe6;;.\xf4<\xe86H<\x82\xe5]<\xda\x00\xe8<~\x95\x18<f\x13\n\xbc"\xa5\xf7\xbbl\xc5\x93<\x0e\xaa\xab\xbc\xa5\xa3e\xbct\xe2;\xbbn\x9a!=\xb6 \x1b<pS\xad;\xb2\x9d.=\xe6sx\xbb\x96>\x1f=q\xa5U\xbcL\xc6\xd6\xb8\xfa+2\xbd:h\x82<\xdb\x16\x15\xbbl\x9e\xd5\xbb\xfe\xacd\xbd\xcb\x99\x1e\xbde\x0f\x96<\x07\xd8\xaf<\x16\xac\x0c<x~\xcd\xbcB\xb5`\xbb\x82\xe7\x87<\xcd\xbf\xc0\xbc)\xa3\xb6<\xd8\xb80\xbc\x94\x91\x88\xbc\xf6iL\xbd\xcc\xf5\xf6\xbcT\x10\x0b\xbct=\x1e\xbc\xcaD\x8c\xbc\xc8\xf3{<\x0fFA<\x16\'r<\\\xd7\x87<\xca!\x99<\x8a5\x9c\xbb\x8c\xd4\xf2:\x93\xe1\x1b=\xccV\xc5\xbc\xf2\xc5\x98<J$o<\xb11\xd7<J\x83\xee\xbcjI>=\xae\xe6X;\xde\x8d\x94\xbc\x1c\xf7><\rP\xb9\xbcb\xad\r\xbb`\x96\xd7<D\x94\xfb\xb9Y\xd7\xa6<\xbe\xca\xc8<\xa7\x06]<z\x83#\xbcN\xc0\xc3;\xc4\x92\xdf<\xe8\x05X<\t\x9c\x88<~;N=\xaa\xb5\xa9\xbc\x82\xd4\'\xba\xce\xc9C<PZ\x08<<\xdb<9\xb2\x00\x9a\xbc\x98\x00\xbc<,U\xa3<b\xc2\x91<\xaco\x11;\xcc=n:h\xf3\xf6\xbc\xb0\x8e\xd4<\x7f\xa1\xa9;o\x01\xf9;4\xb5<=\xf4@2<:T\x8a\xbb\x80\x99\xa7\xbbSM \xbc\xe3\xcf\x9d<\x96\x0eW\xbcb\x0bg;Q\x1c\xe3;\xee\x17\x88<\x0e\x1f3\xba\x84d\x1e<X#L;\x81\x90.;\x08C\xaa:\x88d\xc1;\xca\xc2\xdb\xbb\xcf\xfb\x8e\xbb8.\xd6\xbb\xe8\x9d\xe9;\xd58\xa6\xbc\x96\xd8\xde<\xd20\xac;~\xa2\xe7\xbc\x1a\x8b\xf9<b~:;\xd0\xb4d<,\xcd\x16=Gm[\xbc\xc0Y\x9c\xb6\x89\xea\x8b\xbb\xb9\xb7c\xbc\x1c\x08\xf2<D2\xcb<\x0b\x1d\x9b\xbb\xc4\x12\t=u\xb9M\xbc\x1eg4<65\x0e<\x83\x18\xf5\xbc\x88\xcf\x80;\xc4\x87\xd2\xbcV\xba\x17\xbd\x8c$\xa4\xbc\n\x17E\xba/\xc5\xfd\xbbN\xac\x01\xbdD\x96\xe7<\x14\xef\x1c\xba~\x02F\xbcG\xb0z\xbb\x04x\xd8\xbc\x8c\xc1\xd0\xbb\xda\xd17=l\xa0\xf9:\x85\x03c;\xdaL\x1d\xbdT\xc0\x19\xbd\x99\xa2\x91;\x0cXI<\xea~\xf9<f:\x98;ZS\x9f\xbc\xd8\xfa\xfb\xbb4\xdd\xff<\x80^\x8e;U%\x0f<z\xe9\';O\x84\xed<P\x1b\xaa\xbc\xbc\x93\xa6<`\xcc9\xb7B)M<\xa9\xdf\xc1<N\xb40=\xfc\xab\x12=\x1c\x9e\xf2;&eB<p\xdfh<\x12e\x12<'
-p708
-tp709
-bsV580918203984957440
-p710
-g2
-(g3
-(I0
-tp711
-g5
-tp712
-Rp713
-(I1
-(I200
-tp714
-g12
-I00
-S'8"\xd1\xbcqX\x84\xbd\x8d\x8d\xc7\xbeMw\xda>l\x1dL=\x93\xf23>\xb4\x85\xe4\xbeo\xf8\xca\xbd\x88\xeb\x96\xbc\xd6\x1f\xac>\xfd\x07o=\x8a_\x1c\xbf\xe4+#>,\xd7\xed=\xb2\xadD\xbcW\x89\x8f>n\xe9\xa1\xbd\xc2k\xc0\xbeZ1%>bfO>\x9e\x83\x1d\xbfTq\xcd\xbd\xaa\x03\xeb=-\x9f\x0b\xbe3\xcf0\xbe\xb6\x03?<\x88gh<\xbe<\x95\xbd\xcf[\x07\xbf\xd2f&\xbe&O\xc0\xbev\x80_\xbe\r\x0b\xb6>1\xc1\xba\xbe\xf1\xe6z=+\xfcD?\x031\xcd\xbe^c\x86=\x13zS>\x14\x10\x10?t\x97\x15>Kh\x02?\xbe(X>\r\x82\x03\xbf\x1b\xac\x88\xbe\xfe\x82\xfa;\xa4r\xbb>\x96\xdc\xa0>P\x08\x07>\xb1\x9c\xd0>\xd8\x12\x9c\xbd\xe2\x9e\x06?}\x9c\x9e\xbe0:\x86\xbe\xa2\xd8\x1d\xbf\xa3\xe0\xd0>\xe2(u\xbe\xd6_X\xbeE\xf3\xde\xbe\x0bL\xcd\xbe\x08\xdb\xd3>m\x0f\xa6\xbdM\xdc?\xbeWL5\xbfF\xac\xaf\xbe\xafQ\xe7>F\xb8\xc7\xbe\x96\xc18\xbe\x07\x12\xde\xbe\x07l\xe3\xbe5\xfb\x11\xbf\x0e\xac\x14\xbfL\x81\r\xbe\xb6\x97}\xbe\x91f\xd4\xbe\xd60\x0c?\xf4\x04\x00?F\xa6$>\x1a2\xc1>\x95\xe8\x90=\xa0$5\xbe\xf3\xd4=\xbc] #?N\x07\xb2\xbe\r\x7f\xb8=}\'\xa5>\x95\xa9\x1c\xbd\xb8\x95\x1b\xbf\xb4\x85\x08?h\xf6\x9f>2X\xbb<\xaf\x19\x0e\xbd\xd6\x12k>\x0c\x8a\xb1=7\xb2-=\xd4\xd7\x8e\xbe\x87s\x10>\x08\x85\x12=\xe2@\xba>4#o>~\xab:\xbd~\x1d\xc5>\xe6*S>q\x14f>\xa0\xcb\x9a?\x19#\xbd\xbe=\xbfn\xbe\x1e\xc8\xcb\xbc\xd9\x83\x0f?h-\x15\xbe*\xea\xa6=+s\x12?\xc8n7>9\x8e\xdb>\tD\xc5=\x96 ]>\xf4(\xe5\xbe\xad\xc4\x89>\\\x04\x81=\x03$\x1a>\xa7\x80>?K[\x85\xbey\xaf\x14\xbe\xea8\xcc\xberl\x10\xbfP\xa1\x88>u\xfa@\xbc\xeb\xee(\xbe\'\xd7\xfc="\xf1\x00?qV[\xbe\xa4\xf5Q\xbeY\x92\xfd\xbdx8\x0b>\xd9\xe2\t\xbf\x9dd\r>\xe7\x85[=\xfd\xbf\x07\xbe\xb9h\xbf=\xfd*\x1b?\xc7\xe2\xf8\xbeR\x16\x0b?o\xb4\x17\xbe\xd4\xf1o\xbe Q\xf7>;o\xe4=\xfcT\x0c?\x1bu\x04?\xdb\x07;\xbe[\x87Z\xbe\xf0B\x8e\xbe\xa4\xf7\xba\xbeS\xe1!?M\xfcY?\xdb&(\xbe\xf8_\xbb>%n<\xbe\xa9\xe1\x1a<|$\xc8=\xc5\x829\xbf3\xaf\x18?]z\x94\xbe\x03<\x10\xbf\x12\x9b\xb7\xbe\xf3\xbb\x80\xbe\xf2\xee\xb7\xbe\xd0\xe7\xc6\xbe7,\x1e?k}\x96\xbe\xe8\x99\xd8\xbe\xc0\x87\x9c\xbe\x98\xd0/\xbf\xa7\xa2^\xbe\x0e" ?\xde\x902\xbe\xea 4=\xb1|Y\xbf\xe25\xe9\xbe\xcf\xebQ\xbf\x87\xe2k=\x85\x9d\xf3>z\xdf\x1f>o\xfb\xb4\xbe\xa5Y\xbe\xbeh,\x15?\xae\xb2!>\x14\xd1\xae\xbdhZ\xe1\xbc|\x07??\x90l%\xbf\xd4<\xce=\x1d\xbe\x00\xbf\\\xe3\xcf>S\x13\xd7>\x0c\xe8\xf0>H:;?\x9aCV?\xb6\xbfI>\xd41\xdc>\x88\x8c\x9a\xbd'
-p715
-tp716
-bsV580197911830642689
-p717
-g2
-(g3
-(I0
-tp718
-g5
-tp719
-Rp720
-(I1
-(I200
-tp721
-g12
-I00
-S'\xca\xed\x90=\xce\xcbH\xbe\xe8:\xbb\xbe\\~+>\x0e\xce\xeb=L\xc1\x15<\x16~c\xbe\'\x05\x82\xbd\xa4\xf5Y=-\xaf\x93>\x82g\xed\xbc\xfcm\x93\xbe\xbb6\xa4=\'L\xd2\xbd\xe1\xaf\x0c\xbd\xfe\x8f\x7f>\xe2\xc26\xbd\x05s;\xbe\xdb\x8e =\x11"\x99=r\xdb\xf5\xbe\xfaP\xaf\xbcW\x95\x0c=_\x07D\xbe\xb7*\'\xbe;O\xc0\xbd\xb9\xe0E>|#\xe5\xbd\x1e\xdf\xe3\xbe\xa2\x98/\xbe\xf0\xff"\xbeX\xef\x92\xbd\x84\xea3>\x9eq\xbd\xbe\xc2\x10}\xbd|\xc9\x0e?\xd5t\xe7\xbd\x02\x15R\xbc6\xfc\x81>\xdd\xa3\x8e>+\x9f\xb4\xbd,\xc9}>&\xfe\xdd=\x99\xb5\x89\xbe\xaa\x8f\x81\xbe(F\xa0\xbd\xe7f\xae>@\xff >!\xe1\x17>Yj\xb2>l(s<\x95\xb5\xe5>K\x0c\x97\xbe\xa0\x14E\xbe\xb4\x94\xde\xbe\n\xfb\xc6>\xf2}\xd8\xbc\xd3\xaeN\xbe\xd4!\xb6\xbe\xf9\x12\xac\xbe\xda\xa1\xc0>\xd1\xf6\xb4=\xd7\xd5\x99\xbdf\xeb\xc4\xbe\x84\x06\xd6\xbd\x90\xc2\xba>i1\x9b\xbe\x8em_<\xf7\xed\xd4\xbe\xa7By\xbeC\x0b\xd1\xbe\x07\xbf\xd4\xbe\xb3\xef.\xbd!\x91>\xbe\xa0}\xa4\xbe\x9cc\x9b>\xeb\xc0\xfb>\xf9\xb1\x0e>\x97\xa7u>\xee\xb0\x1e>n\x02\xf6\xbd\x81s\t\xbc\xf3\xa7\xdf><o\x87\xbe|I\xb3<\x8ev\xb8=\x9e\xca\xbf\xbd\x13\x17\xd4\xbe\xd5\t\xef>\xb2\x95~>\x14?1\xbdm\xfb\xd2=\xa5\xf1\xa1=\x8b\x08q=\xecL%>\x9ehG\xbe\xf6\xf3?>\x07\xd8\x06>\xa1\xe7\xa6>5z\xe6=\x17\xfe\xb8\xbd\x81\x19\xae>\x9bR@>;\xf6!>t\xca*?\xd9\x11\xc3\xbena\xda\xbd4`p=\xac\xbd\xab>u\x15\xd5\xbd\xbe\xfbL\xbd\xec\x03_>\xdc\xa9\x8f;\x94\x1c\x94>\xf4\xc1!>\x95\x13I>\xfc\x0e\xe0\xbe\x14X;>\x9a\x17\x87\xbd\xd0\xa4\xc7<\x16\xe5\x0f?\xec=\t\xbd\xd4\xeb\xb3\xbd\x1c.\x8f\xbe98\x8b\xbe\x8c\xb8\xa7>\xa9\x8eA\xbdp\xa07\xber\xcc\x989\x0c\xb5\x8c>b\x94\xea\xbd\xab\x04\x86\xbd\x80\x169<%\x02\xef<\xcf\xe1\xa1\xbee\xddD>\xc4\xf4\xa3\xbc\xbb\xfb(\xbd\xdb\x97v<\xc4\xcb\xa0>r4\x9f\xbe\x90\x19\xba>\xfc^M\xbd\x12\x06\x9a\xbe\x9f\x10\xb0>\xf7\xdc\xa2=\xc3\x0e\xe2>t"\xfc>.\xf1]\xbe\x12\xb2\xb3\xbd0c\x93\xbe\x10\xa3\x81\xbep>\xbd>t\xb2\x15?u\x86\xfc\xbd9\x86\xd7>;w<\xbe$\xban=\x97\x93q=\xab\xc4\xee\xbe\xe4\xfc\x91>nj;\xbe?|\xde\xbe7\xb4\xb6\xbe\x0c\xe1a\xbe\xe0\xb4r\xbe:\xd2\t\xbf\xba\x9e\xc2>R\xda`\xbeL*\x03\xbeuc\xaa\xbd\xe0}\xd1\xbe56\xf9\xbd\x9bb\x18?\x90\xc0\xa5<;m\x94=\x82\xab\x04\xbf\x18\xc5\x9e\xbe\x12U\xe3\xbe,\x0f\xd8=\xc4\xd4\xaf>\x03\xda.>\xb7i\x8e\xbe\xdeM\x91\xber\xba\xe3>[\xa4}\xbd\xc0N\x88=\x15A\x9a=\xbcE\xd8>t\xf3\x83\xbe\\\xb9\xd4<l\x12Z\xbehL\x86>k\xe6\x00>\xf9/\xab>\x9f\xa9\x01?\x1c\x80\xf4>5b?=%\n|>\'\x8a\xef\xbd'
-p722
-tp723
-bsV578776908223102976
-p724
-g2
-(g3
-(I0
-tp725
-g5
-tp726
-Rp727
-(I1
-(I200
-tp728
-g12
-I00
-S'\xear&>\x13\xccz\xbd\xc4\x9c\xb3\xbe\xbd\x953>\r\x000>\xad\xef\xeb<#\xf3C\xbe\x170(\xbe\x9ar\x86\xbd\xe9\x93_>\xf3\x8a\x83=Dar\xbe\xb5\xe1.>,\x92\xe1=a\x94\xa5\xbd\xa1e\x94>\x89\x16V\xbd\xa2]5\xbe5d\x99\xbc\xc2\x10\x8a=S\x93\xb6\xbe\\\x075\xbd\xab-\xdc=\xba\xee9\xbeb\x83\xb1\xbd$\x82z\xbdz\x9e\xc5=\x03\x1d0\xbe1Y\xb0\xbe\xb12\xf7;\xf30M\xbe\xc6\xc7\x12\xbeR\xb7a>\xe4^\x96\xbeL\x07$=\xe04\xe2>\xeb\xf6\xca\xbd\x07o\xd9=\'f\x80>W\x07\x89>\x7f\xc9)=\x1c\xa4?>\xaf\x11O>\xfeU\xaf\xbe\xa2\x8a$\xbe\r\'u\xbc\x83\xdc\xb2>\x84`\x0b>\xd5\x84\x9b=\x962\xbc>\xf0\xc0\x15\xbc;7\xdd>\xcf*D\xbe\x85\x1d\xad\xbd\xb9x\xf0\xbe-\xbe\x8b>p\x93\xe4\xbdg\xdd!\xbe\xcd\xe1\xde\xbe\xfe\x0e\xc6\xbe\x1d@\x8a>\xba&Z;f\x9f\x94\xbd\xa8\xc8\xd5\xbe}\xdb\x13\xbe\x10\xb4\x96>\xcb\x06\x85\xbe\xb86<<\xeaN\x96\xbe\xe4rl\xbe\x12\r\x04\xbf\x98d\xbe\xbe\xf3\x8e \xbd1t\x18\xbeF\x13n\xbe\x08%\xa7>\xfc \x9f>o\xd1\x17>\x0f\xf2Q>\xc4\xed\x1a>H?\xec\xbd\xe6\xde\x02<\x08a\xdb> *z\xbe&\xad\x13>\x88\x03M>X\xd5\x1e>\x99X\xda\xbe\xd8s\xf1>Xb&>\xf8\xbc\xb7\xbd\x9b\xf1Z=\x9f\xbd\x96\xbd\xf0\xacO=G\x94K>\x81\xae\xa8\xbd\x13\xeb\x11>~\xfa->9C[>\xeb\x10M=G\x08!=\x0f\xfc\xa4>\x98\xcd">6x+>w27?\xe1x\x86\xbe\x8a\xb2\x97\xbdf*\x8a</\xcc|>\x96\xe60\xbd\xb8\xd19;\x91\x19\xbd>\x98c\x16>S\xa8r>\xbe\x9e|<)V\xcd=_\xd1\xad\xbeI\xe1\x89>\xed\xa4r=\xf4B\xe4=F#\x11?\x88,\x81\xbd\x82U\x7f\xbd\xb6r1\xbek8t\xbee\\`>\xcc\x8d\xb5\xbd\x9b\xd5\x88\xbd\xbb#\x96=\xf5\r\x83>\x87C\x95\xbd\xbe\xf4\x01\xbd\xf0\xef\xc2;8\xcd\x9c=\xfb3\x0c\xbe\xfb\xda\xe1=\xafB\x0e\xbc\x8a\x8fQ\xbd\xda\xf0\x8b=0\xf2\x8d>\x97\xa2\x90\xbeV\xa4\xc4>\xeb\x08\x83\xbd\xf8\x88t\xbe"\x1e\xa4>\xbes!<\xf9\x1d\x9b>\x133\xb3>\x9ea"\xbeu\x84\xa5\xbd3\x8c\xff\xbdU\xd2l\xbe\xeb\xcd\xc2>\x86E\xec>\x98F3\xbd=Y\xa8>?b\x02\xbe\x03\xc0\x8b=(O\x92=\xf6"\xd3\xbe\x0b\xf5\x97>\xf1\xd3\x7f\xbe8\xf3\xcb\xbe\xc8\xb9g\xbe\xcdD\xfd\xbd\n\xc7L\xbe\xbc*\xb6\xbe\xecV\xc8>\x07\xcb\x12\xbe\xaa0^\xbe?\x06\xe0\xbd\xb1\xe6\xc5\xbew\xc9\xa6\xbd\xad\xd9\xff>\xa4\xf8&\xbd\x18\x00\xa8;)\x0f\x05\xbf_\xee\xb3\xbe\xfa\xcf\x98\xbex\x05\x9c=Q\x94\xbf>\xeai\xba=\x8d\xaff\xbe\xd7\xe5\x1d\xbe\xe8V\xb4>\xc6\xa1\x8e=\x88R~=\r\x03\x9d<K\xe8\xde>\xd0;\xb8\xbe\\\xc1+>\x03\xd31\xbe\x9c\x98e>,O\x92>%>\xcb>{\x19\xe5>\x03F\xbf>\xfe\xd9\xfe=/\x10N>?-\x8a='
-p729
-tp730
-bsV580541025174888448
-p731
-g2
-(g3
-(I0
-tp732
-g5
-tp733
-Rp734
-(I1
-(I200
-tp735
-g12
-I00
-S'\xc9|\xad>\x9d\xbb\x0b\xbeq\xd7\xff\xbe\x1f\xda\xea=n@\xd0>\xade\x91\xbe!O%\xbc}\xab\x9e\xbe\x88u\x1e\xbey\xec\xda<\xc0\xe3)>&\xac\xf3=t\'h>yq^>jue\xbe"\x03\xaa>]\xe80=n(\x91\xbc\x0f\xc4%\xben\xfd\x8e<\x0e+Z\xbe\xeb+\xc0\xbd\x89(\'>\xc7\xba\x03\xbf\x19\x8e5\xbdz\x0e\r\xbe\xe2\xe09>\xce\xee\xc5\xbe\x16\xb1(\xbe\x18\xc0j>\xd1\xec\xf2\xbd\x86\xe7[\xbe\x9b\x0ew>\x0e\xfb\xaa\xbeO\n\x05\xbd?\x9f\x9c>\xecV`<\xd1\xc0\x90>\xc1\x0e\xbb>7p\x8e=\xdcd?\xbb\x02\xe7\x82=\t2\x9b>\x9as\xa6\xbe\xda\xbbG\xbeqx\x91\xbc\x9a\\\xd5>S\xbf<\xbd\xe1\x0e\xa4=zz\xc3>\xa5\xdc\xc2=\xb3\xd0\x06?De%\xbe\xc06\xad=\x90>\xd2\xbe\xe3S{>\x14\xa0\x8e\xbd.\x10\xa9\xbe\x98j\xbd\xbeL\x9c\x03\xbf\xcdo:>\xf4\xf7\x0f\xbe\xae\xca\x98\xbdE\xfd\xa5\xbe\xf0j\xba<\x8b\xd5\xa5>\xc6i\xf7\xbd\x11\xc3\x0f\xbcMJ\xcf\xbe\xb5\xf7\xf9\xbd\xac\x1f<\xbf"\x87\x93\xbe\\e\x87=G\x91\x18\xbe\x9d`)\xbe\xc7\x83\x98>w\xf6\x98>\xcb\xaa\x03>+\xc4\x12>l\xbe\x8f>\x936?\xbe\xe7\xf1\x9d=7@\x81>\x08\xcd\'\xbe\x1f\xcbP>\xcaj5>\x8f\xc9\xde>Ii\x03\xbfR\xb8(?E-\x96=\x9cF$\xbe\xe03\n>\xae+\xc6\xbe\'z\xe8=\x8e\xf0\xc9>\x06\x12\x00>\xa4\x151>\x16-\x91>\x10\\->\x07\x13\xb4\xbd\xd6\x05+>\xb3A\xf1>f\xdd!>\x94\xa2D>\x03f\x08?\xa22p\xbe\xd2\x9f\xba\xbbN\x05\x8a\xbc\xdd\xf1W=\x015\xf1=\xc1\x1f\xa8=k\x1e\xaf>\x13\x037>\x11\x12\xe7=\xb2\xfe\xd8\xbd\xe1\xd9:=a\xf4\xc0\xbeR\x8c\xd0>\xacC\x8a=L\x1f\xac=\x81s\x1a?\xe6Ei=\xae\xf3\x8f\xbd\xa0\x14\xc4<\x1c<\x12\xbd`\x9d\x83>\x85\x14O\xbe[\xa9 =\xc7%\x91=7\x99\x0b>[\xca\xf9=J\x9e\x1a>\x01c@>\x8a a=\x94\x94k>Z\x0b+>(\xf6\xe4\xbcp \xa6=k\xef\x01>\xc9p\xef=\x9d\xcbO\xbe\x05\xd8\xe0>\xfa\xcb\x18\xbe\xc6\x12\xa5\xbe\xb8\xa4J>Ib\x81\xbeJ\x1a3>\x951|>\x14\x14\xc4\xbd|b\xe9<9T\xd3=X\\\x0f\xbe=\xd5W>lur>>\xde,>\xa7b\xed>\xe5-\xb3\xbdq]\xbf=\xd9\x1a>>\xb4\x03D\xbe\xe3C\x93>\x8b\xaf\x8c\xbe\xb2\xda\xb4\xbet 7\xbem%\xbc\xbdnH\r\xbe\xf8j\xd1\xbeu\xb3\xb4>\\\xa2\x89\xbd\x94?\x9d\xbd\xe2\x03Q=I\xfd\x87\xbeQ\x85\x18=\tt\r?\xf5\xa6O=M\x18\xd4\xbc\x9a.\x94\xbe\x8d\xb3\xa1\xbeE\xfdT=5"\xe9=\x7f:\xdb>\xc6\x86/<@\xbb\xa6\xbd9\xa7\x1a>\xb8\xc5\x1d>\x9c\xe9d=zv\xa3>\xf6\xf4\xec<w\x80\x90>\n\xef\\\xbe<|\x9f>Gy\x13>Ze=>X\x06\x8d>\x06/\xb6>\x0f\x1er>Q\xeb\xb2=\xe5`\xbe=;>o\xbc\x8f\x9cN>'
-p736
-tp737
-bsV580272092328914944
-p738
-g2
-(g3
-(I0
-tp739
-g5
-tp740
-Rp741
-(I1
-(I200
-tp742
-g12
-I00
-S'\x1e\x8bD>\x7f\xeb\x88\xbdE\x96\x9c\xbe\xe1\x0cA=\xe6 P>yQ\xa2\xbd]b\xbf\xbd\xeb\xbc\x10\xbe\x0e\xc4-\xbdE\xfc\xe9=7b\x99=V\xcf\x99\xbb\xd24\xfe=\x8e\x8eR=\xd8\xc7\xc8\xbd\xae\xcej>\xc9K\xca\xbaE\xacf\xbd\xf9\x85\x95\xbd\r\xed\x06=\xf7\xf3e\xbe\x1a4\xa2\xbc8\x98\xbc=\xbb\xb9|\xbe\x81^\x8e\xbd0\xe5\xa4\xbdd[\x04>\xb0JJ\xbe\'\xc5W\xbe]\x06\xcb=NF\xce\xbc\x00K\xc1\xbd\xbe\xa6\x01>\xc2-J\xbe\xc0j5<\xe0\xeax>\xb2f\x89<\xdb4\xb4=\xca\xdcj>\x8a\xce\xd5=I\xed\x9b9\xcd\xc2\x97=6\x852>\xd8dh\xbe\xf2+\xc4\xbd%+\xe9;\xb3#\x99>\xe9\xe9|<\xb2h#=$\x9d\x90>g{F=\xc0w\xa6>\xf2\x15 \xbe{Ll\xbc\xf7-\xa7\xbe+zV>n\x7f\x84\xbb\xa8\x81\xfe\xbde\xb2\x9c\xbe_\xf4\x98\xbe\xfb\xdeN>\xf9F\xc1<z!L\xbd/\x97c\xbe\xbe\xa4T\xbd\xf7\xdeQ>\xb9\xc9\x12\xbemt\x97=\xae\xaa\x84\xbe\x12y\xca\xbd^\xf3\xce\xbe\xb1Lf\xbe\xba%\x1d<\xd90\xd0\xbd\x90\xfa\x15\xbeB}V>\x98\x8b^>\x05L\xdb=s\xaa\xaa=\x8b\xa0\n>\xeb\xc9\xba\xbdj|\xda\xbb\x1bof>\xa2t\x1f\xbe\x85n\xf6=(\xe3\xe4=\x01\xdc6>zE\x8b\xbei\x1e\xbb>sv\xfe=\xb3.\xae\xbd\xadD\xdd=\xd8\xd41\xbe5y\x95=\xda\x05U>3wJ\xbc\xd6\x1f\xc9=\xd5\x8e;>\x14n\x07>w\xa3\xe1;\xd1\x10O=N\xb9\x84>\xbb\x19\xb5=\xf1W\xcc=\xea\xde\xbf>\xcf)B\xbex\x91\xfe;\xb9\x16\xa1<\xf2\x8d\x97=\x9d\xe8g\xbc*\x99\x81\xbc\xf6\xb3^>\x89\x80\x9c=\x1b\x18\x08>\x1a!\x03\xbc\x1e\xb2#=[\x0c\x80\xbe\xe9\xfdY>\xe5\xfb0=\x02`\xa9=\x82\xaf\xcc>\xd0c\x92<\xb9O/\xbd\xf6\xccG\xbd\xc7mM\xbd\xf7\xb5?>\xf6\xc1\xd3\xbdI\xb7\xe5\xbb\xab\xf3,;\xd8\xe0\xbc=?-\xc5<}+\x08=\xba\xef$=\xf9\xba\xac<\xbba\x01=\xd7\x9e\xc2=\xc8\xa7\x1c;\xb7%s;\xcbXW=\'\xde\xec=\x03\xed\x06\xbe\xd1d\x84>j\xb0\x04\xbd\x06\x80O\xbe\xce\xb8H>\xb3&\x15\xbd\xa0BD>\xa7\xbaS>\x7f\xe8\t\xbe(\x0c\xe6\xbc\x95y\x0f\xbd-\xae\x11\xbe-!3>\x19\xc1k>\x8c\xc9\x8b<\x8d\xec\x87>\xc9\x1c\x7f\xbd\r\'\x83=\xb9\tq= \x10N\xbeG\xc1A>\x82\x1d\x1d\xbe\x96\xcff\xbe\xfe\xb6\x06\xbe(>\x97\xbdn\xce\xed\xbd ?\x98\xbeG\x10z>\xc6\xb9\xa3\xbdJ\x81\x9f\xbd>\x95r;\xbf\x97+\xbe\xd2x\xee9!m\xce>\xa9:\x08="\xbb\x02\xbc8\x95\x86\xbe\x15\x9en\xbe\x97\xc8\xbc\xbd\xf0Y\xad=w\xb3r>\xf9\xecW=\x88.\x05\xbeJ\xd3\x91\xbd#\xc2*>\xa0Y\x97\xbcJ\xe9\x0c>9\x16\x07=\xf7Gi>5\x86)\xbe\xee\xc6\xfb=2\x002\xbc\xb1 \x07>\xff\x95&>v(w>:)\x8b>O\xf3\x12>#\xab\x95=\xf1\x12?=\x15Q\xfe='
-p743
-tp744
-bsV580409475724627970
-p745
-g2
-(g3
-(I0
-tp746
-g5
-tp747
-Rp748
-(I1
-(I200
-tp749
-g12
-I00
-S'\xcb\xee0\xbdRF\xaa\xbd\x7f \x06\xbfV\'\x0c?N\xe0s=\xf0\x85\x81>\xdb\r\x0f\xbf\xa2\\\xd3\xbd\xdb6\xd3\xbcC\xa1\xeb>\xb5\xee\x7f=\x92\x8aU\xbf\x13tf>\xec\x02\x16>\x18\xd3\x8d\xbc&\xfa\xae>\xcd\xbd\xd9\xbd]A\x05\xbfC\x9db>F8\x8e>\xda\xa1P\xbfZ|\xe0\xbdb\xb5\xef=\x05\x82\x17\xbe0\xe5O\xbe2n\xaa;\x8a\xea\xbe<5\xac\xc3\xbd\x9a\x864\xbfXh{\xbe\x83\xe9\x01\xbf(,\x8b\xbeC)\xee>^\xd9\x02\xbf\xbe!\\=\x06~\x81?\x10\x1f\x0c\xbfR\x92\xb7=\x92\x99\x82>LkC?\xa8RR>\x84\x0b5??.\x90>\xb6\x99/\xbfF\xce\xb8\xbe\xc0c$<\x10\x96\xef>\xeb\xb6\xcf>\x1aj$>\x0c\xae\x07?5\xee\xdb\xbd\xa5\x0c7?*\x8f\xdc\xbe[\x0f\xaf\xbe\xa8>N\xbf\xf2\xd1\n?\xbeX\xab\xbe\xb6P\x92\xbe\xcc;\x15\xbfz^\n\xbfA\xae\x15?.\xed\x01\xbe\x8cg\x81\xbe\xd6*r\xbf2r\xde\xbeW)\x1c?\xbf\x05\t\xbf\xee9t\xbe=i\x13\xbf\xb8\xf8\x15\xbf\x89\x04:\xbf\xfa\xfbB\xbfZB1\xbe\xea\xea\xaa\xbe\xd2,\x14\xbft+5?\xe6\x0f)?]ea>U\x99\xfc>\xbe\xb9\xc2=\x9b\xe9z\xbe\x0f\xd9\xa3\xbc\x92\xa8]?\x1a\xfe\xe3\xbe\x1b\xac\xe0=n,\xda>\xc6\xc6Q\xbd\xc2[M\xbf\x02\x0f2?\xaa\xde\xdc>m[\xf3<\xf2;\x89\xbd\xcd{\x99>\xea\xee\xbf=\xa2,\\=k\xa4\xbb\xbe\xca\xf9\t>\xd6\xdf\x0b=U7\xf2>N\xe7\x9c>\xf2|\x8b\xbd,\xd5\x00?\x8d\x14\x8d>\rQ\x97>>\xce\xcb?\x88\xe0\xfc\xbeU,\x97\xbe\x0eh\x16\xbdIM=?\xdb\xf1U\xbe\xa8S\xd2=\x8c\xa5>? \xfbb>\xbd\xfc\x12?\xc2\x98\x12>\x9a\xb1\x8a>\xb6\x8d\x17\xbf\xdbk\xb7>\xda\xca\x9d=\xe5\xc8;>\x98\x19z?\xc8b\xbf\xbeWtI\xbe\x10\xda\x03\xbf\xed\x15@\xbf\xb3!\xb0>"\xd5,\xbc\xf0\x88a\xbe\x88\x9b,>\xa0P\'?m\xf2\x95\xbe\x8d\xfc\x98\xbeB\xf20\xbe}\xcb5>*h:\xbfSY;>\x90;|=P\xce2\xbe\x00\\\x1a>NjM?\x12\xae\x1f\xbf\xbd\xce6?\xf7BJ\xbe\xb22\x97\xbe\x1eo%?z\xd7(>\xa7c:?\\\x17+?R9|\xbe\xbbQ\xa3\xbe\x9a\xc3\xc3\xbe\xa8\xa4\xf8\xbe~iV?\xb0\x1b\x91?K\x83q\xbe:\xe7\x00?\x80u\x82\xbe\xa9\xdf\x92<\xa2\xe9\x02>\x13\xa8z\xbf\x92KK?S\xae\xc1\xbe\x15\xd1<\xbf\x7f\xf8\x03\xbf\xc0\xd2\xab\xbe\x9e|\x03\xbfw\x99\t\xbf\xf0XO?.\x0f\xc5\xbe`\x84\n\xbf\xbau\xc9\xbe\x03\x0cl\xbf\xdf1\x96\xbe\xf5\xabY?\xfb\xca[\xbe\xc0wy=s\x89\x90\xbf\xebk\x1e\xbf\'\xf0\x8c\xbf~3U=%\xb6\x1f?\xd6\x9bX>\xa2W\xf1\xbeV\xe1\x01\xbf\x9e4@?\xa34N>\n@\x0e\xbe\xbb\xd5)\xbdZY\x7f?\x9e\xcaZ\xbf\x04\xd1\x08>\xcd\x141\xbf\x8e\xb4\x10?I\x83\r?\x82\x02\x1f?\xf8\xb2y?F\xad\x8c?\xc7 \x87>C\xa6\x10?J\xe4\x9d\xbd'
-p750
-tp751
-bsV580176906684772352
-p752
-g2
-(g3
-(I0
-tp753
-g5
-tp754
-Rp755
-(I1
-(I200
-tp756
-g12
-I00
-S'\xc2\xb0 =8"\x8a\xbdKJ\xea\xbeU\x8b\xdf>\xb4\xe1\xc4=\x88\xc88>uZ\xef\xbeX\x1c\x0c\xbe\xbe3\xda\xbc@\x00\xc5>\xe5+n=}\xc4!\xbfbQ:>4\x96\xff=\x80\xa7\xc4\xbcu\x03\xb0>\xce \xb4\xbd\x92y\xce\xbe\x1d\x89\x11>\xa3\x05I>v\x03)\xbfn\xc8\xc9\xbd;z\x08>a\xa9)\xbeu57\xbe\xf4\x80:\xbb\xee\x97E=\xab\xa9\xda\xbd\x06k\x16\xbf\xcc\xc5\x1c\xbe\xbe\xc7\xc9\xbe;=u\xbe\xbd\x1f\xbe>}\xeb\xd7\xbe\xb2p\x8e=&\x8cU?\xcb\x7f\xc2\xbe(j\xb7=\xe4\x9d\x88>\xa3&\x17?\xe4k\x08>\xfb\xad\x03?\xf6\xbf\x84>\x962\x0f\xbf\xf5\xad\x9a\xbe\xdb"\x8d;\x0fw\xe3>\xb2(\xab>"\x11\x14>l\xe0\xfd>~\xee\x95\xbd\xaeh\x1a?\x07\x8b\xb3\xbeH~\x87\xbe\xf3]5\xbf\xf4\xf6\xe6>nB~\xbe\x0c\xc8i\xbe\xee\xf8\t\xbf\xf1\x07\xf4\xbeW|\xef>u\xd8E\xbd\x0e\x0c4\xbe\xd7\x98D\xbfr"\xb5\xbe\x00\xc3\xfa>I\xe1\xde\xbe\xe8I\x0b\xbe\xe2]\xee\xbe\t\x07\xf4\xbe;\\+\xbf\xbf\x16&\xbf&(\x17\xbeKE\x8a\xbeuQ\xe5\xbe\xd9\x18\x16?45\t?{\xe5G>\xc8J\xd2>\xb4\xba\xdb=w\xf6E\xbe\xa6\xe9{\xbc\x96+4?r&\xc6\xbe\xde\x9e\xf2=Z\xed\xb2>\x86U\xf4;\x14|+\xbf\x03=\x1e?\xa0\x1f\xab>\x1b-\x18;#\xd4\xa8\xbb\xb2BA>\n\xe7\xa0=\x1b`\xb4=1>\x91\xbe\xcc\xb5)>\x9b\x1b\xa5=\xf1\xca\xcb>\x14Ef>\xde\xc8\x0e\xbd\x8c\x8d\xdf>\xac\x0ei>\t>\x82>\xd2\t\xa8?\xd1\xc9\xd8\xbe"ql\xbe.\x1b8\xbb\x85\xc7\x13?\xd3\xfc\x1a\xbei\x0e@=\xddK\x1d?7\x9a`>\xd5\x1f\xf3>T\x01\xdc=\x0bh_>\x86\xb8\x02\xbf\xc2f\xa4>\xbb\xe2\x9f=^\x1c\'>\xb8#W?8U\x82\xbe\xcf9\x1f\xbe\xfe\xf9\xcf\xbe&\xb4\x14\xbf{o\x9b>\x07\x93$\xbd\xa9\xd8\'\xbe{\x86\x0c>\xf2\xdc\x08?\xefdZ\xbe]\xf8J\xbe"\xf3\xe7\xbd\xf5\xa7\x13>\x85\xe5\t\xbf\xae\xf2\x13>\x94a\\=\xd4\x9e\x0f\xbe\xb5\x13\xc2=\xd1J ?\x14[\x05\xbf{\x99\x1a?\xa4^\x07\xbe\xa4\x0c\x96\xbe\xf8^\x0b?\x8e\xe1\xf6=\xcc\x0e\x16?\x1ey\x15?\xc5;_\xbe\x80\xf2b\xbe\xe0\x15\x91\xbel\xb0\xcc\xbelu/?I\xeeh?S.3\xbeH]\xdb>\x979W\xbe\xd2c\xf5<\xd7/\xe3=\x8c\x99J\xbf\x81\xa0\x1e?\xc8$\xb1\xbe\xd2\xeb"\xbf\xce\xc7\xca\xbe.\x13\x82\xbe\x0br\xc4\xbe\xa2\x80\xec\xbeB\xe2-?\xf6-\x99\xbe\xcf\xea\xe3\xbeK\xce\x9d\xbe\x18\xb1<\xbf\x06Xq\xbe\xe8\xb88?\x02\xbb.\xbe\xb8aR=\x17\xcck\xbf\x7f\xe1\x07\xbfFMS\xbfz\x85\x90=X\xac\x05?o\\->\x82:\xcc\xbe^,\xcd\xbe\x0e\xcf#?[\xd1\x1f>\xbe\x0b\x83\xbd]\xcc\x95\xbc\x95wP?P62\xbfS\xd2\x0e>\x877\x03\xbf/B\xe2>,Z\xec>Ei\x0b?\xackN?u\\\\?\x0c\xe4]>n\x91\xe7>\xf8\x00J\xbd'
-p757
-tp758
-bsV580581832489627649
-p759
-g2
-(g3
-(I0
-tp760
-g5
-tp761
-Rp762
-(I1
-(I200
-tp763
-g12
-I00
-S'\xdc\xceE\xbd\xa78S\xbd\xe2\xee\xbf\xbe\x0b\xfc\xcb>-\xac\n=w\x96<>\x01\xa5\xcc\xbe\xde`\x8f\xbd?\xc4\xb5\xbc\xeb[\xa7>\x0e\xbe,=+\x15\x1d\xbf\xa6\x99\'>9\x8f\xdf=U\xde!\xbc\xfaLs>\x80\xf5\x9d\xbd\x7f1\xc3\xbe\xd9\xf1%>\xf5\x0bQ>+\x9a\x17\xbf-\xc7\xad\xbd\x8c\xd2\xa9=\xe5@\xc2\xbdyl\x12\xbe_\xb5\xa1;\xe9\x98\xfc;\xdbV\x82\xbd\xb8#\x00\xbf\x06\x00@\xbe\xaeY\xc0\xbe\x9b\xf0F\xbe\xff\xbd\xaf>\xf9"\xbd\xbe`]\x19=\x1d\xeb:?&\xe1\xd1\xbeQj\x8b=\x1bY3>\x07\xe5\r?\xffs\x19>\x95\xdb\x04?\x8f\x94B>\x8b+\xfd\xbe\xf3\xee\x81\xbe\n\xb08;O\xb5\xa2>\t#\x95>\xee\xfc\xec=\xf2P\xbd>\x01~\xb2\xbdI\x90\x02?\xe0?\x99\xbe\xb7\xeaz\xbe\\\xce\x11\xbfPB\xc3>B:x\xbe\xe1rR\xbe\xe4\x9e\xd2\xbe\xce\xd9\xc3\xbe\xb1\x83\xd3>{\x07\xd0\xbd\xb1\xddF\xbe[\'.\xbf\xbc\xea\x9e\xbe<S\xe0>c\x81\xc4\xbe\xab!C\xbe\x01\x1e\xd5\xbef\xef\xd6\xbe\xb9\x84\x04\xbf\x81>\x0c\xbf\xc6\xdc\xfe\xbd5hl\xbeO\x00\xd6\xbe\x91s\x00?\'\x91\xf5>\xd9N\x1b>n\xd2\xb6>\xb7g\x87=\xf5\x993\xbe\xa4\xa6\'\xbc\xe2C ?\x1d\xd5\xa5\xbeC\x9d\xa3=p\xd4\x9d>^c<\xbd\x9a/\x14\xbf\x04#\xfe>\x89\x02\x9b>\xf7<\x90<{$k\xbd\xdd\xcfi>M6\x90=I\xc2\x03=\xadd\x84\xbe\xcf\xd3\xd2=\xf4\x7f\xa3<\x93%\xab>rz`>\x92)J\xbd\xe1\xe6\xba>\xb3\xb9K>\xd4\x02Z>\x10\xf5\x92?\xb5\x84\xb4\xbec8d\xbe\xdd\xfa\xeb\xbc\x89\x14\n?Qk\x16\xbe>\x80\xa8=\xf5{\t?\xc5\xd6 >Ya\xd0>\xf41\xcd=\xcf\xd9I>"\xdb\xd6\xber\x9e\x82>\xfd\xab&=\xa6\x92\x08>\x0b\x013?\xa1\x08\x8e\xbe\x07\x1e\x12\xbe\x8e\xb0\xc0\xbe]7\r\xbf\xea\xd8|>\x0e01\xbb\xda\x9e)\xbe\xde\xcf\xfb=\xc0\xc1\xf0>\x13\xe0_\xbe\xb7^^\xbe\xb6\xd4\x02\xbe\xcd\x0b\x07>\xf1R\t\xbf\xde\xdb\t>l\xa4\x17=\x01T\x00\xbe\x17\x97\xd7=\xc7\x19\x16?\xd2L\xe9\xbe]\x1a\x01?\xa7\x1c\x1f\xbe\xd62R\xbeLi\xee>\xd1\xa2\xf8=\x93q\x05?\xa3_\xf5>\xe70*\xbev\xc1l\xbe\xe6\xc9\x8e\xbe&\x15\xb1\xbe^C\x1d?\xc9\x0eR?4\xf4.\xbe[\x91\xb8>a\x96:\xbe\xfc\xa7\x1a<v\x8c\xbd=3\xef3\xbfe\xef\x11?\x07b\x8b\xbe\xddZ\x08\xbf\xd3\x80\xc1\xbed\xfdz\xbe%\xdc\xc0\xbeUf\xc1\xbe\x9b \x13?}\x92\x8b\xbe\xad\x0c\xc8\xbe\xa1\xbd\x95\xbe\xea\x95*\xbf\xf6\xae[\xbe\xff\xcd\x18?^a&\xbe\xbfw3=[\xe8R\xbf{c\xe1\xbe$\xfeM\xbf\xce\xc2\x13=\x04\xc4\xeb>\xda(\x17>a\xf5\xab\xbeD\xb0\xba\xbe;\xbc\x0b?\x94\xfc\x1d>\xe4\xbc\xe4\xbd\xd5h\x08\xbd\xc0F7?\xbc\xe6\x1d\xbf\xd5F\xc6=\x19\xf4\x00\xbf\xe3\x0f\xd1>|\x98\xcf>5"\xe8>}\x923?\xbfIL?\x82\xf09>\xd7\xd2\xd4>I<\x88\xbd'
-p764
-tp765
-bsV580681904711720960
-p766
-g2
-(g3
-(I0
-tp767
-g5
-tp768
-Rp769
-(I1
-(I200
-tp770
-g12
-I00
-S'\xf9E\x88>F9\xc9\xbdJ\x89\xdb\xbe\xcd\x8b\xc2=.\xe2\x90>\x1c}\x0f\xbe@\xd8\x0c\xbe\x9a\x92b\xbe\x06\xe3\x93\xbd\xee\x11\x01>\x16\xee\xf1=Fbv<\t\r,>\x16\x94\xc3=l\xb3\x12\xbe\xfb\x84\xa7>\xa5\x10)<6/\x90\xbd\x03\xbf\xc5\xbd\x02/A=\xe5}\x95\xbe\xca3Q\xbd\x88\x9d\x17>=g\xbf\xbeS\r\xf2\xbd\x9c\x14\xc6\xbdC\xe12>\xddW\x8d\xbe\xbe\x84\x8a\xbe\x88\x872>\x15\xffd\xbd\x82f%\xbeG}E>\xa2q\x85\xbe\xfat\xc8:\x85j\xb5>\xdd2\xd9<\xfa\xb4\x05>\x1bk\xa7>\xc2\xf8\x16>\x18\x9e\xfb\xbbx\x1f\xb6=s\xc2q>C\x83\xa0\xbe\xd6\xfd\x19\xbe\x82\xb5\x86;#\x86\xd1>\xbb\x00\x15=\xca\x03\x8a=\xfd\x1e\xbf>\x1d+\x86=M\x87\xdf>UzH\xbeb\x91\xeb\xbc\xaeg\xe2\xbem\x91\x8d>\x0b\xb9\x1d\xbc.q;\xbe\xadr\xcd\xbe \xae\xd1\xbe\xf6\xf5r>\x8a\x1f\x10<7\xb7\xa1\xbd\xeeD\xa4\xbe\xba\x12\x96\xbdnu\x98>\x9472\xbe\xa6\x7f\x8d=\x9e\xfa\xbe\xbeL\x8e\x16\xbe\xaa\x99\x18\xbf{?\xa3\xbe\xb3m\xb4\xba\x86\xfa\x0e\xbe\xb8\x89@\xbeM\xd4\xa1>\xa3\xb5\x9e>ru\x12>\xea\xdb\t>a\x11E>\x1c\x8a\x01\xbez\xc5\xf0<(s\x94>\xf5G^\xbe\xfa\xcc,>z\xc4\x18>\xdd\x96\x82>\x92\xc3\xd0\xbe\xfbo\x07?v,\x1a>\x88>\xdc\xbdfL\'>\x1a\xd1x\xbez\xee\xdf=`\xc8\x92>\x8e\xc2\x8f\xbb\x19l+>\xa3\xc1\x80>EyA>-\x9a\x05<\xaa\x8f\xa6=F\xe4\xbd>&\xe9\xe7=B\x10\x19>\xc9\xab\t?\xc7h\x8e\xbe\xfe\x80H\xbc\x15:\x9f<\xf0"\xe5=\xcd\xe2\'9\xe3\xf2\xde\xbbz\x0e\xa8>\xd0\xe7\xff=5\xdf>>\x96\xb72\xbc\xf2\x9d\x82=\x0f\xa5\xb1\xbe\t$\x9d>\x16\xbcX=\xc2h\xf1=\xc5U\x11?\xb2\xb9\x1c=\x00\x04_\xbd\x12\x8a\xa0\xbd\xb3\xa4\xa3\xbd\x11\xd6\x83>vF \xbeP\xa9W\xbb]Z\xe0;u\x9d\x18>\x85\xff\x13=\\\xef\x92=x/\x93=^4\xd8<P\xe5L=\xb3\x83\x0b>\xf3h"\xba\x01\x1e\xa7<\xf3\xd1\x92=\x1ag\'>\x95 B\xbe\x1d\'\xc4>\xa6aj\xbd\x857\x93\xbe\xc7\x12\x83>]\xd2\xc8\xbd\xae\x1c\x82>\x12\n\x97>\xfb\xf5&\xbe\x90\x0c\xf4\xbb\xc5\x03%\xbc\xcai=\xbee\xfa|>\x8df\xa5>\xa0\xd8F=\xb4J\xbc>\x02~\xa1\xbd.\xb3\xb5=\x91=\xc6=yP\x86\xbem\x95\x87>[\x0eh\xbe\xd8i\xa8\xbe\xf4\n-\xbe0\xf8\xd8\xbd\xbe\xab\x08\xbe\xdea\xce\xbe\x9d5\xae>34\xdd\xbd=?\xd0\xbdD\xc2\t\xbb\xe2t\x83\xbe:q\x02<|B\t?\xc6\x05\xf9<\xc0\x9e\xf0\xbb\xca\xa3\xb3\xbe1\xbe\x9f\xbe\xc2\xdb\xd2\xbdHr\xf8=\x06\x06\xad>\xe6\xd7~=k\x8a\'\xbe\xce\xe6\x8b\xbd%\xa1w>\xfa\xe4\x81;F\x1d\\>^\xc71=\xaa\xf5\xa5>\x85$|\xber\x9f>>\x9b\xea\xab;\xca{0>nGw>\x9f^\xa7>\xae\xb3\xbd>R*E>\xdd\x98\xdb=^\xd2\x80=\xe4\x8b\x10>'
-p771
-tp772
-bsV580536207534383104
-p773
-g2
-(g3
-(I0
-tp774
-g5
-tp775
-Rp776
-(I1
-(I200
-tp777
-g12
-I00
-S'\x86\xaa\xcc=\xf8u\x0e\xbe\xf0\x81\n\xbf\x86\xa7\xd3>g\x80)>\x17\x990>\x89\x19\xf7\xbe\x9e\x80+\xbe\xc18\xe8\xbc\xffA\xe5>\x07`\xb6=\x8a\x82\x1c\xbf\xcd\xc0s>\x01\xcf\xe4=\x8a\xe4p\xbdW.\xd8>\xc6\x93\xbd\xbd\xeaN\xcb\xbe\xa7\xa9\xe8=/\x80H>\xcc\x14=\xbf\xe8@\xb8\xbdDO\x15>he\x81\xbe=MW\xbe\xe3\xbaA\xbd\x80\r\xd1=\xe7\x08;\xbe\xea(.\xbf\xdaB\x0f\xbe\xaf/\xc2\xbe\xe1g\x81\xbe\xad{\xcc>\xdc\x1b\x00\xbf_\x18\x87=G:e?!\xf2\xb2\xbeQ\x8a\xac=\xb4V\xa9>#\x89\x1c?7\xb3\x07>c\x1f\x07?Q\xc1\x9f>+r \xbfP\x96\xa3\xbe`\\"<\xa5\x18\x11?\x9c\x8b\xa6>\xb1g\x1e>\x071\x13?N42\xbd\xa3\xd99?\xf6\x97\xdb\xbe\x1f#\x8a\xbe\xcd\xf5P\xbf\xe5j\x0b?d\xd3w\xbe#X\x8f\xbe\xe5\x13#\xbf/\n\x16\xbf\xe1\x80\x10?\x8d^\x01\xbd/\xb8B\xbe\xc3\xaaQ\xbfV\x99\xc2\xbe%h\x12?#\xca\x00\xbf\x81\x02\xb6\xbdOg\x0e\xbf\xe0L\x02\xbf\x07\x03B\xbfeb2\xbf\xd10\xf3\xbd\xfb\xba\xa5\xbe\\\x14\xfe\xbe\xd4[&?\xff\xe7\x1c?\xc1\tv>\x1cq\xcd>\xbc\x99\x1d>d\xb4h\xbe|\xca\xa8\xbc\n?J?m\x1f\xdc\xbe1f\x16>\'0\xbb>@\x89o=@8?\xbf\xfc\xf1;?&\xab\xcf>\xecb+\xbd\xff,:<\x8c\xf6\t>\xe4\x82\xee=_\xa8E>$\x19\xa4\xbe>~8>\xc2\x95\x14>z \xed>\xda\x90p>\xa4\xaa(\xbd\xb1 \x00?\xe8\xf2\x8c>\xc4\x1a\x8c>\x88p\xb2?\xaf\x1d\xee\xbe\xf6\xf1J\xbe@\x82\x97\xbc\xe9\xf9\x17?\xca\\6\xbe\xf0\xf13=-#)?\xf5Q4>\xa0\x81\xff>\x80\xfe\xca=t\xec\x82>\'H\x17\xbf\x07\xb4\xc1>\xef\xb4\xd1=\xea2.>tHv?\xd3nl\xbeFY\x11\xbe\x07\xb6\xd8\xbe0b\x14\xbf\xf6\xb0\xc3>=\xa4Q\xbd\xf9\x1d1\xbeJ\xb0\xf4=\xa1\x83\x0c?\x81\xf4W\xbe-tQ\xbeaM\xce\xbdl(\r>7\xb9\x05\xbf\x81\xc9S>l\x16{=\xbf\xcd\x01\xbe\xb6m\xf6=\xa4\xbd%?\x0cs\x0b\xbf:g1?\x04C\x03\xbe\xd9\x13\xaf\xbe\xbc-\x18?\x7f*\xec=\x0f\x98*?}\xe0$?\xd4\t\x94\xbe\x01\xb1l\xbe\xa94\xb3\xbeg\xff\xec\xbe\xfa?5?\xbagz?\xa3*6\xbe\xf8.\x02?W\x12m\xbe\x84\xd6a=\x9fg\xda=\r\'_\xbf\x90\xaa-?\x15d\xb1\xbe\t\x145\xbf\x94\xfd\xdd\xbe\x02Y\x91\xbe\x0f\x15\xd8\xbe\x15\xb4\x19\xbf4\xb0C?\xbd\xd3\xc3\xbe@\x16\xee\xbeG\xa4\x93\xbe\\\xceE\xbfV\x1f_\xbe)]f?7\xbf\xf4\xbd\xf3k\n=0\x1d}\xbf\x9am\x16\xbf\xf6-]\xbf`\x8c\xe7=\xa2T\x1b?<E]>\x91{\xdf\xbe\xc72\xda\xbe\xa9\x9a/?w\x0e\xee=\x1c\xde!\xbc\xed\xbeQ<]\xfc\\?i\r6\xbf\xe5d\x1d>\xdb#\x04\xbf]\xe7\xf4>:V\xee>\xbe}\x1c?\xc1\xb6a?C\xf2i?\xaf\x12t>@\xad\xea>G\xde\x84<'
-p778
-tp779
-bsV580579892250714112
-p780
-g2
-(g3
-(I0
-tp781
-g5
-tp782
-Rp783
-(I1
-(I200
-tp784
-g12
-I00
-S'\xce\xbc\x05>\x86\x8e2\xbd\xfbb\xa6\xbe\xd7\xfe\x88>[\x97\x12> \xef%=\xfc*i\xbexIN\xbe\xa4\xd5"9\x96\x9e\x80>/P\x0c=Bl\xa0\xbe\x86\x8e\x99=\xbf\xc1\xa2=Q\xe1\x84<\xcc\x88\xb4>?Y\x9b\xbd]\xa67\xbea@d\xbb\\\xde\xe0\xbb\x8f@\xae\xbe-\xfa\x9c\xbd<\xf1)>\xd8\xc2\xa0\xbd\xa3\xa8\xd3\xbd\xe8\\+\xbd\xbb:\xc5=\xcfG\xb7\xbd.q\xa3\xbe\xec\xdb\xc0\xbd\xe07\x98\xbe\x88\xae?\xbe\xdf\xca&>\xbby\xb4\xbe]dS=\x136\x07?8\x13\xb7\xbd\xc9\x99\xcd=^#\x85>L\xea\x87>\x1a\xb6\x8a\xbd\\\x84\xf0=\xdc\xea\xe7=\xf2\x1f\x81\xbe\x81\xd8\x8e\xbe\xb3\x9cs\xbdZ\xff\xb5>C\x8bg>\x91\x90\x11>\xad\xc8\xc0>b\x92\x11\xbdL\xba\xc5>t\x92\x1a\xbe\xb1\xf4\xf6\xbd\x83\x9c\xe4\xbe\xd3\x83o>\xe6\xa3\x11\xbe1\x05F\xbe\xa9\xd9\xd3\xbe\x89\xb8\xc2\xbe\x9b.0>\xd3*\xe4=3w\xec8\xb7<\xe1\xbe\xdb\x1a\x04\xbe\xa0f\x84>@\xcb\x8e\xbe\x94\x8a\xdb;\xdf\xb4Z\xbe\xdf+\xa3\xbe\xaeW\x03\xbf\xe0\xb2\xe6\xbe\x12)\x02\xbe\xa6\x83\x1d\xbe\x18}b\xbe\x8c\xcd\x94>\x1c\'\x98>|\xe7\x0c>\x86j\x9d>\xd1\xd0\x19>\xfd7\x84\xbd|-\xbd= F\xe5>\x19f\x8c\xbe1:\xe2=eK$>\xde\xa9\xa3=\xca\x8c\xe6\xbe\xbb\x7f\r?4\xc5\xa8=\x85\xed\x00\xbe)\x96\xae=\xe2\xe4\x15=X)\x18<\xba\x8a7>h\xa5+\xbe\xbe\x8a\x8b>\xad\xad\x0f>\x08\xfb\xa4>\xa32\xb5<?~\xca\xbc\x1f\xc3\x93>4\xd5:>\xec"k>\xae\xd4N?\xd8\x1b\x97\xbe\xdf\xcd\x1d\xbe\x93s\xc0=\x1b\x96\xa6>\xf4\x1eY\xbd\x1a\xe9\x9b\xbdxB\x96>@\xb0?>\x06\xf2\x87>O(\x9e=\xb1\x1a\x19>\xf4\x00\xc1\xbe\xd3\x0bL>*\xf6\xce<\xfd"*=\xf4\xf3\x1c?\x93\xc1\xf6\xba\x0c\xb5\x84\xbd\x17wv\xbe\xda\x85\xa8\xbe/\xaaa>\x88\xdc\xf7\xbc\xa2\xd8\x88\xbd<<\xf4=E\x9a\xb9>\xd0?\x9f\xbd\x08\x8d\x91;\xa13\xaf<\x01\x99g=n\xaa~\xbe\xbf\x18\x1a>\x9c\x8d\xc3\xbc\xe0\xf8P\xbd\xf4\xc9\x9d\xbd\\\xb1\x92>7\x8b\xc2\xbe\x05\x8f\xd9>\xe3\xe1Z\xbc*\xda\x96\xbeT}\xaa>\xc1}a;J\xf9\x8d>?\x0c\xf6>\xc8J\x1b\xbeX\xbb\xa1\xbbn-\t\xbe\xe1\xf7J\xbe\x93\r\xd5>\x89\'\xff>\xbfu\xb5\xbd\xfd\xb6\xbc>\x92\xf5A\xbes\rn=\x08\x82\x02>\x93\xd4\xea\xbe\x84\x9eW>8}\x81\xbe\xb6\xde\x04\xbf@P{\xbe\xbf\xbf\x15\xbe\x1d\xce\xc1\xbd\xc4-\xac\xbe\xce\xc8\xdb>\xbb\xac(\xbe\x04\xc5\x7f\xbe,V\x19\xbe\\Q\xf6\xbe\x86\xf84\xbeW\xd0\xdb>\xa3\xfa\xa3\xbd8m\x9f=3*\x0b\xbfav\xad\xbed\xc2~\xbeQ\xd1\xd8=\xcf\xad\xcf>\xcf\x98\xb5=*\xc8v\xbe\xe3\xe7\x16\xbe\xb4\xa6\xf9>a\xde\xe8=\x05\x8a\xb3==91=_\x94\xf1>\x01\x7f\xcf\xbe3\xde?>\x8b\x14"\xbe:\'^>\x01\x96\x85>\xed%\xe0>\x8d\xbd\xe3>\xc0 \xd8>\xec\x1b\xfc=\xd2\xc9\x84>3p\xfa\xbd'
-p785
-tp786
-bsV590442139940573185
-p787
-g2
-(g3
-(I0
-tp788
-g5
-tp789
-Rp790
-(I1
-(I200
-tp791
-g12
-I00
-S'R\xc9s>6+"\xba\xfe\x02\xa9\xbeN\xe8\x02>\x13\xe3!>\x18{\xaa=J\xcaM\xbe\x13!%\xbe\xe9\xad"\xbd.\x85\x89>\x96\xb5H=\x85wz\xbe\x805&>\x82]\xd7=5\xf0\x9d\xbd\x9a\xb6\x98>\xb5e\x9b\xbd\x0b#9\xbeM\xc9\x7f\xbd\xa8\xfe\xdf<\xc2\xe2\x9e\xbe\xf9\xbd\xc6\xbc\xdc\x02\x03>\x8d\xff\xc5\xbd\xb9^\x95\xbd\xc6\xe6\x96\xbd8\n\xa2=\x8f\xe1\x1a\xbe\xc9e\xac\xbeXr/\xbc\x86\xe40\xbe\xd5:\x0b\xbe\x8a\x9aP>\x85[\x90\xbe\xbb\xcf\x93=-\xca\xd2>\x12\xe2-\xbdi:\xd4=\xe3\x9f|>\x95\x1fz>=\x02\x1c=-\xb5\x01>\x08\x11D>\x9a`\xaa\xbeN\xb7\xff\xbdg=^:\x83l\xca>V\xdf\x02>\x89\xba>=\xfd2\xd6>Wi=\xbd\xaa\xbb\xd6>\xd9\xdd8\xbeC\xc7\x83\xbd\x0b9\x00\xbf\xad\xa3r>/E\xa6\xbd-\xe2\xb1\xbd\x15_\x02\xbf:\x8c\xc6\xbeU\x84\x86>\x92\\\xa9=\xfb\xbd\xb8\xbc\xf3\xa6\xbc\xbe\x93\x87\x1d\xbe \x1b~>\xb5\xe3\x8d\xbe\xd8\x15\xcf=o\xf0d\xbe5 f\xbe\xc3\x15\xff\xbe\x01n\xb1\xbeNVZ\xbd\xe3\xde\x1a\xbe%v`\xbeOw\x87>\xb3\x99[>\x9e\x96+>S\x0eJ>m\xf2\xf3=y\xdb\xdd\xbd\xd7\xe8\xb3\xbc\x95\x0e\xe7>Si\x87\xbe\xe1\xd92>\xeb\xa4K>JN:>\xfdu\xc3\xbe\xf8\xdc\xdf>Mj\r>S#\xee\xbd\xfd+b=wH\xe4\xbd\xeb\xb9w=ZzY>\xc9\n\x97\xbd\n\x0b%>\x16zE>\x19\x0eA>\xe5\x9a\xd5;\xd7j\x91<-t\x97>\x8eG%>\x8b\x15\x0c>\xcf#*?z\xd5b\xbe;\xb9\x0e\xbd\x16\xaav=jDW>G\xd9n\xbd\x91\x06\xad\xbd\x8d\xf1\xab>r3%>\x12\\m>\xa3\xb1\x1b=\x03\xd2\x8b=\x9e\x16\x9f\xbe\xe5\x8a\x8b>I\xf7\xa4=\x92\x0f\xd4=\xaf\x9f\x04?\xa8\x9d\xc3\xbb\xe5\x94U\xbd\xc6\xf6\x13\xbejCe\xbe\xe0\xa6T>\xa9\xf2\x9a\xbdYx\x1e\xbd\xcd\xd7\x97=\xb6e\\>R\x99o\xbd&y\x8f\xbc\x13\x9c\xa5\xbcF\xa7s=\xd7\x85\x04\xbe\x9a\x13\x94=\x80\x03v\xbc\xc0\x99\x96\xbdu\x84\t<\xcd\xb1z>\xf7\x16\x8b\xbe\x07\xa9\xa2>]7\x92\xbc\xb7{x\xbe\xd2\xf1\xa9>\xe3Nz=Sa\x86>Q~\xb3>.\xc4\'\xbe\xdd\xc3\xa7\xbd#E\x04\xbe\x9b\x1ah\xbee0\xbd>{g\xc9>\xf6K}\xbd\xbaH\x94>R\xa6\xfa\xbd\xd6o{=\x9f\xd83=\xaeR\xd5\xbe\xb9\xb4R>B:\x81\xbe\xd2\x87\xcd\xbe\xe7NS\xbe\xb1\x00\x9d\xbd\xe9 7\xbe\xa1G\xab\xbek`\xc8>\x01\x87\xde\xbd\x15\x81^\xbe\x11`\xf2\xbd\xc7\x83\xad\xbe75\xcc\xbd\xed#\x05?\x8d\x0c\xec\xbc\xc0\xec\xd3;\xd3\xee\x06\xbf\xcf\x06\xcb\xbe\xde\x04\x81\xbe\xd2\x92\xc8=Q\xaf\xc0>+\xeb\x93=z\x8bm\xbe\xe9\x18F\xbeM\x85\xae>&k~=\xff\x02)=m\x11\r<j\x0b\xcc>\xa2\xc0\xa6\xbe0[0>\'\xf4(\xbe\x1d=a>\x1ed\x8d>Q\x03\xdf>S\xa3\xed>\xef\xfb\x97>\xea\x00\x03>\x19\x1bU>\xb6K\xe8='
-p792
-tp793
-bsV580617276744929280
-p794
-g2
-(g3
-(I0
-tp795
-g5
-tp796
-Rp797
-(I1
-(I200
-tp798
-g12
-I00
-S'\x06\xa3@>\xfcj%\xbd\'\t\xbd\xber%=><)5>\x89)\xf5<sPJ\xbeT\x155\xbe\xa5\x89z\xbdn\x81n>\xa4?o=\r\xf3\x81\xbe\xc9\x14">\xb7\xe4\xdd=\xa1\x9d\x9a\xbd\xb8\x99\x9b>\x12\xa3k\xbd\xd63J\xbe>\xab\xff\xbc|Gf=0\xfe\xb3\xbeH\xc74\xbd\x1b\xb4\xf1=a\xff\'\xbe,\x00\xa3\xbd\x91?\x84\xbdVp\xc8=,\xa9\'\xbe\xdc\xe3\xaf\xbe\x87\x95Z\xbcBk_\xbe\xe3\x99\x1d\xbe\xa4O`>\xd40\xa3\xbe>\xc9C=\x97<\xed>\xea\x92\xb9\xbd|\xdb\xfa=\x1b\xeb\x85>G\xda\x8a>\xe2Q\xd1<\x8d\x161>\x019L>\x85~\xae\xbe\xd3\\>\xbe\xebjT\xbc\xf7n\xba>\xed^\x13>,\x85\x9f=\xa1\xa7\xc9>\xec\x1f\xc7\xbc\xf4\xa3\xe1>\x06<I\xbeB\x9c\xae\xbdUN\xf9\xbe\xacX\x84>\x85p\xeb\xbd_\xfd \xbee?\xeb\xbeX\x03\xd0\xbe\xa6|\x88>\xa5\xb5\x01=?\x8aP\xbd\xa7\xc0\xd7\xbe\tZ\x11\xbe\xcf\xbd\x96>L\x82\x88\xbe\xebk\xe2<\x0f\\\x8e\xbeNn\x7f\xbe\xecs\t\xbf\xcc\xe3\xc7\xbec~\x80\xbd\x94S#\xbe\x95\x88w\xbepS\xa3>$\r\x98>\xc1\x83\x1c>|\xe5k>m\xbf\x1c>\xbb9\xf1\xbd\x0c\xb5B<@b\xe0>f9\x84\xbe\xd6\xd7\x16>\xdfYL>jE">\xcb&\xe0\xbe\xbbj\xfd>\xb3\xb3\x18>\x0cW\xc6\xbd\xb0\xefw=\xa5\x88\x91\xbd\xfc\xfa\'=L!M>\xa0\xf1\xab\xbd\xa6\xab*>\xbe\xff.>\xae|f>W$\x02=\xd0\xb4\xf5<\xc6&\xa9>/&)>U\xcb4>)*??\xd4\xb3\x8c\xbe\xe9\xaf\xa6\xbd\xdc\x1c\x1f=\x9e\xca\x82>\x0bI.\xbd\x8c\x8e\x17\xbdvY\xb9>U\x11+>\xd4\x7f\x81>w\xb8\xfc<+\xa5\xce=FO\xb5\xbe9\xf9\x8d>\xd4+g=^\xf9\xd2=\xa3\x8a\x13?l\xfd2\xbdj\xd3\x8e\xbd\x8d\xa0,\xbe\x08v\x81\xbe\x95Nf>\xdd\xd5\xb6\xbd\xaf6P\xbd\xd0K\xa9=\x9c\xeb\x89>\xa50\x85\xbd\r\x84\xaf\xbc\xc8.\xdc;J\x8d\x8c=\xab\xc6\x1d\xbe\xf5R\xd5=l@\x81\xbc\x08\x83U\xbd\xaeS\x17=D\xde\x8d>]l\x97\xbe\xe5_\xc9>AGb\xbdp\x86\x84\xbe\xf99\xaf>1\xd2\xb6<\x04\xfa\x97>\xf8\x9b\xc5>\x03\xe7\x1a\xbe*5\x9e\xbd\x85\xc7\xe8\xbd\x87al\xbe3\xc3\xc8>\x19;\xec>\x91:J\xbd\xc4\xb4\xb0>\xfd\xc3\x0e\xbe|+\x8f=\xe8\xd0\xb7=\xf4\x9d\xdc\xbe\xbc\xef\x8f>\xacn\x86\xbe\xfb\xe9\xda\xbe\xbc\x0b\x7f\xbe\xee\x8b\xf3\xbd1\xd7G\xbe\xabN\xb9\xbe\xad\xb8\xd1>{v\x02\xbe\xeb\xa7c\xbe\x82D\xf6\xbdv\xab\xd0\xbe\x8c\xa4\xe1\xbdx_\x04?\x8e&4\xbd\xbc\xa6\xb5<\x94\xe7\x08\xbf\xe6e\xc5\xbe{\xea\x91\xbea1\xae=\x01\x8b\xc5>\xf22\xa7=G\xe7n\xbe|\xe8 \xbe\xf9}\xc2>4\xc0\x9c=\x17\xad\x8b=\x14\xfaS<{o\xe5>\xe2\x92\xbc\xbeVL7>\xc4\xb2,\xbe\t\xdds>\x8fT\x9b>E\xcf\xd6>\x02\x9b\xef>\xbb\xb2\xb9>!\x9e\x01>\xd9!W>b\xd9Q='
-p799
-tp800
-bsV580537577532473344
-p801
-g2
-(g3
-(I0
-tp802
-g5
-tp803
-Rp804
-(I1
-(I200
-tp805
-g12
-I00
-S'\xba\xd8\x80=\x86H\xa8\xbdy\x1a\xc3\xbe\xce\x99\xa1>\x05\xb9\xd1=\xdd!\xd7=&h\xaf\xbe{\xd4\x0b\xbe\x1b\xfc\x00\xbd\xb4;\x97>EP\x89=\x831\xe3\xbep\xd7,>A/\xde=Z\xdf&\xbd\xc3\xe7\x96>\x04S\x8a\xbd\xd7K\x91\xbe}\xde\xa7=\x82\x92\r>\xa5J\x03\xbfI\x80\x98\xbdY:\xe8=\xd0\t,\xbeT\xe8\x10\xbe\xed\x8a\xd4\xbc+\xa1\x7f=\\s\xf5\xbd\xec\xd7\xef\xbe\x85\x12\xae\xbd\x8c\x9c\x9a\xbeGrE\xbet\xff\x97>\xb4\xf0\xb0\xbe-tN=\x94o$?\xb3\x16\x88\xbe\x84\x84\x8c=T\tw>/f\xe1>\xbb\x9b\xc2=\x1e\t\xb7>b\xb2Q>S\xa6\xe2\xbe\x1cmj\xbe\xe2\xbd+\xbc\xe28\xc2>\x9e&w>)@\xeb=\xc1o\xcb>\x85_-\xbd~\x91\xfb>\x85$\x87\xbe\xb5TM\xbe\xc8\xd2\x0f\xbf\xae\x94\xb8>hJ:\xbelsB\xbe\x0bn\xe5\xbe\xec\xf1\xd0\xbe\xf3\xb2\xb7>\\\xdd\xeb\xbcC\xaf\t\xbe\xf2|\x16\xbf/\xdc\x88\xbe\x0c\x15\xca>Fg\xaf\xbe]\xe5\xbf\xbd\xd49\xc5\xbeu\x81\xb5\xbe;\xe8\x0f\xbf\t\xdd\xff\xbe\x1f\xd3\xc0\xbdsNa\xbe\x17t\xac\xbe\x80m\xeb>Cp\xdc>\xbc\xe4#>\xef`\x9c>\xa5\xcb\xee=\xf9\xdd\x1f\xbe\x97\xbc\xb2;\\(\x11?\xcc\xbc\x9f\xbeR\xcb\xf0=p\x02\x88>#\\5=\xd2\xfd\t\xbfw\x86\x06?rn\x82>\xdcr\x10\xbd\xb5\xa90<1\x9d\xcb=B\xc5\xa1=\xc9,\xff=\xce\xd3T\xbe\x94\xac\x1e>o\xb6\xd0=W\x7f\xa0>_f#>\x8e\x8fw\xbc\x0b\xa2\xbb>\xec\xe3L>\xe3-N>\x91\xb9\x80?d3\xaa\xbe\x8d;(\xbeD#\xad\xbb\xca\x92\xde>\xaa\x06\xde\xbd_Q>=\x82q\xf7>W\xdc\x1d>{n\xb2>6\xdf\x89=*\xa4:>\xce<\xd3\xbe\xecF\x8b>\xd5\n\x86=t\xa7\t>\x13\x9e/?\x08\x85\x1a\xbe\xc4\xaf\xcf\xbd\x04\xc7\x9e\xbe\xecS\xdc\xbe,\xb1\x84>\x93_!\xbd3w\x06\xbe7\xc1\xcf=\xb5\xe5\xd2>\x91\xbe\x1b\xbe\xda\xcf\x01\xbe\x97\xf3\x82\xbd\x1f\xea\xd3=EZ\xbd\xbe\xfcG\x12>\xdcd\xbd<\xc7\x84\xd2\xbd]n\xa4=\xd9e\xf0>".\xd2\xbe\xcc&\xfa>0\xce\xe2\xbd\xf2\xc7\x80\xbe\xe5\xe3\xd2>2\xd3\x80=\x19\x05\xec>7\xa3\xed>\x01t<\xbe\xfc\xa0\x1a\xbe5\xcdk\xbeN=\xa4\xbe\xaai\x08?\xb0\xde2?\xfe\xfc\xf0\xbd\xc4\x9c\xba>c\x0e(\xbee\xcf%=\xbe\n\xab=\rl\x18\xbf`O\xf0>3P\x8b\xbe\xfd\xe5\x02\xbf\xcb\xc9\x9b\xbe\'\xf2V\xbe(\xcf\x90\xbe\xb8\xd7\xcc\xbe\xb9\xc8\x07?\x9c\x94~\xbe\xc8\xdf\xac\xbe8\x91_\xbe\x04*\x12\xbf$\xb5\x1f\xbe\xfc\xca\x16?Dg\xdc\xbdY\xb0\xc1<\xf7,7\xbfl@\xd5\xbeV\x9f\x18\xbf\xb4\xff\x99=\x90\x10\xe3>q\xcb\x0b>\xe2H\x9d\xbe\x17\xf3\x91\xbe\xdb\xc3\xfc>y\xca\xf2=`\x84\xe9\xbb\xd5\x89w;\no\x1e?\xea\xbf\x05\xbfY\xb6\t>;\xd0\xb6\xbeCR\xa8>\xa8b\xb6>\x9cI\xe6>\xd5]\x1e?a|&?\xfeO/>\xffM\xac>u\x04\x98\xbc'
-p806
-tp807
-bsV580378975366733824
-p808
-g2
-(g3
-(I0
-tp809
-g5
-tp810
-Rp811
-(I1
-(I200
-tp812
-g12
-I00
-S'\x9f\xf4\x99=\x0fbr\xbd\xaf\x89\xbd\xbe\xf6\x9b\x99>S\xad\xff=~t\x98=\x10\xae\x98\xbe"3"\xbe(ra\xbc{\xb5\x8a>\xe7\x84N=\xddr\xcb\xbe\xfcH\x07>\xe6\x01\xc4=#\xf3O\xbc\xa5\xec\xa1>\xab0\x82\xbd\xf65p\xbe\xb6\xcat=\xd9\xe0\xbc==\xa9\xeb\xbe\x8a\x80\xa9\xbd\xf0\x16\x0b>\x91\xf6\x0f\xbe\x11\xb8\xeb\xbd;\'\t\xbd\xc8\xbc\x9c=\x80\xcd\xee\xbdOb\xcb\xbecA\xb3\xbd\xc8w\x93\xbe[\xa6C\xbe\xe8\x16p>\x19\xbd\xb7\xbe\xa8\xb1)=1\xe0\x18?\xc8?a\xbe#\x89\xcd=\x1d6v>Cv\xbd>\xe2\xe3\x05=\xbc.\x98>r\xd3:>8f\xbf\xbec\x91\x81\xbe\xe5\xdf\x9c\xbc\x91B\xb5>c\xe2k>\xdf\xa0\t>v0\xc4>~\xaf\x14\xbd\xec\x95\xed>H\x01s\xbejd\x1e\xbe\x80\xad\x03\xbf\xacV\xa4>\x9c\x9d1\xbe\xfe\x04]\xbep\x13\xd5\xbe\xbf;\xce\xbe1\x82\x97>\xc0\xd7\xe1;\xfc\x18\xcc\xbd\xe0\x1c\r\xbfB\\V\xbe\xbd#\xb2>3\xef\x9f\xbeC\xd8\x8e\xbdz\x14\xa9\xbe~\xa5\xb2\xbeu\xc6\t\xbf;\xe4\xf8\xbe\xfc"\xd6\xbdXbF\xbe\xb95\x9e\xbej\xce\xca>\x9e\xe5\xc5>z\x1b\x0f>\xf2\xb3\x9f>\xcb\xda\x01>\x8c\x11\x01\xbe\xd5U7=\x146\x01?zc\x94\xbe)\x85\xd7=\xef.l>3W\x80=\x03p\x03\xbfjT\r?\x9dVF>\xd9\xbf\x88\xbdz+\t=8p\xa1=rtT=hh\r>\x88\x1dH\xbeCC>>\xa8\xc6\xda=\xa2\xd5\xa7>\x80\xd8\xdc=\xbdq\xb4\xbcP\\\xac>N\xdc>>\x18\x8ce>%\x9cq?d*\xa0\xbe\xd3\x0b+\xbe\x14>\xed<?\xe9\xc9>pi\xb8\xbd\xf6\xe6\x9c<`\x87\xd7>M\t)>\x03\xdd\xa3>w\xca\x85=\xaf\x96!>1f\xcb\xbeL\x07}>Q\xdfc=/\xd5\xbd=\x04\xb8,?\xe6[\x01\xbe\x1b4\xc7\xbd--\x90\xbe\xbc\xda\xc8\xbe\xbe\xf8t>\x02\xb6\xf5\xbc\x85\x8b\xbe\xbd4\xd5\xe6=\xe9J\xc9>E\x13\xee\xbd\x06\x12\xc0\xbd\x1fa\r\xbd+\xd0\xbb=\xfd\x07\xa9\xbe\x8c\x93\x1f>\xcf7\xb2<\xa3;\x96\xbd\xd4\xef\xed<\x95e\xd2>S\x10\xce\xbe\x11u\xf5>Nq\xa1\xbd\xa9T\x82\xbe\x94\xe1\xc5>"\x85\x07=4\xdc\xc9>b\x95\xe5>\xe3\xd1+\xbe\x16\xf0\xdd\xbd\x1bA@\xbeX5\x8c\xbe\x03\xdc\xf8>sw ?1_\xd0\xbd\x92\xcb\xbd>\x0b\xcd8\xbe\x03\xce4=\xd4\x97\xe1=\xe1W\r\xbf#4\xc9>\xf8^\x82\xbe\x0b\xd6\x03\xbf\x13\x17\x94\xbeQW<\xbe 0e\xbe=F\xbe\xbe\xdb\x12\xfd>[Ya\xbez\x1c\x9b\xbe\x9c\x91>\xbe\\\xe1\n\xbf\xf5\xd73\xbe\x05\x80\x07?\xbd\x8d\xda\xbd\xb9\xfbH=\xef\xd6%\xbf\x1c\xd0\xc3\xbeVT\xf3\xbe\x95U\x9d=\x9d\xbc\xd8>\xb6"\xe5=\x19\xa5\x92\xbe-yj\xbe\x9dS\xf3>o\xec\xf2=\xf4\x05\xea<\xea\xbaL<L\x83\x11?\x88\xdb\xfd\xbeV\xf4\x1c>\xd9\xa3\x95\xbek]\x99>pC\xa0>\x13\xe3\xdc>\x07\xee\x0b?\xe9\xb0\x12?B>\x13>\x9d\n\x97>\x8b\xa8J\xbd'
-p813
-tp814
-bsV580685620323987456
-p815
-g2
-(g3
-(I0
-tp816
-g5
-tp817
-Rp818
-(I1
-(I200
-tp819
-g12
-I00
-S'\x00\xcf?>\xf3\xd4\xaa\xbds\xd3\xc6\xbe\x9f\x12K>\xb7\xb7Q>zE\xad\xbb\xad\x9dR\xbe\x1b9N\xbe\xb6\x7f\xa6\xbd\xd8YQ>H\xea\xa9=\xfa\x11`\xbeI\x9dC>\xeaM\n>\xb8\xa4\xc1\xbd\xff\x96\xa7>\xce\xa9\x1c\xbd\xf8\x152\xbe\xc6\xb4\xaa\xbc\xd3s\x99=\xf0/\xc1\xbe\xb1P\x8a\xbd\xaaA\x02>i8\x80\xbe\x9fE\xe5\xbd\x1b\xed\x80\xbd\xb8\xcd\xe0=x~V\xbe\xfd\\\xb7\xbe*pF=\xd8\xe3^\xbex\xf03\xbe*\x06}>}\x93\xa0\xbeNl\x11=\xdf\x83\xf7>\xc7\x80\xc2\xbd\xc3\xb5\x00>\xb6\xbd\x8e>\xaf\xcf\x91>\xaaf\x17=\x15\x04F>ovg>*\xae\xbe\xbe\x7f\xd6:\xbe\x05ha\xbcp\x01\xc2>\xa6\xd5\x12>\xf2\x84\xb3=\xdar\xc3>p\xf1{\xba\x8d\t\xf0>\xe3\x85S\xbe\xd9\xf2\xb2\xbdy\x85\x02\xbfFj\x97>q\x07\xef\xbd\xf2\x9f?\xbe\xd2\x12\xe9\xbe\xffR\xd8\xbe\xf5\xbc\x8a>\xc1\x1c\xb0\xbc\x8a\x9b\xb6\xbd\xaf[\xe9\xbe\x16:\x1e\xbe>\xef\xab>\xeb-\x80\xbe\xab\xe76\xbb_\x0c\xae\xbeEW\x83\xbe\xa1\xf8\x14\xbf\xe8\xa4\xcd\xbe\xda#G\xbdC\xb4&\xbe\xdeav\xbe{\x05\xbe>E\xc2\xb3>U\xf5">\xed\xdab>\xa3\x172>\xd5\x8a\x03\xbep\xfc\xf8<\x11S\xdc>\x9e\x16\x86\xbe\x17\x83\x1f>\x00NX>\xe8t;>\xb0\x98\xf4\xbe\xf1\xbe\n?^\x1c0>\xc9\x1f\xb5\xbd~\xf8\x97=\x15+\xc2\xbd\xe6v\x84=\x82Ej>\x8b\xcd\x9e\xbd\xc3\x922>\xa0\x14A>\xb7\xe4o>\xa1RL=6_I=m\xa7\xb6>\x1b\t(>)2B>\x8a$H?Q\x8c\x96\xbe\xfe\xb9\xb0\xbd\x8b\xbb\xb8;~%\x84>\xb5\x04\r\xbdE\xbf\xae<\xb7\xf3\xd5>\xda\x88!>\xd7D\x81>\xd0j\xc3;\xa3\xf2\xf1=\xc8c\xbc\xbe{*\x9c>\xe3\x1c\x88=\x9b\xa5\xf8=w\xb2\x1f?\xc1\x7fe\xbd\x9b/y\xbd\xd8\x11>\xbe\xbfF\x80\xbe\xda2z>P,\xeb\xbd\xad"v\xbd\x8a\xb3\x8b=R\xfc\x90>\xd9\xec\x94\xbd\xd8\xc3\x83\xbc\x87@\x06=\x1d\x97\x98=#r\x01\xbe\x95[\x01>-\xd1\x16\xbc\x9f\xa5\x0e\xbd\n\xa1\xa9=Q\xde\x92>\x9e-\x99\xbe\x86l\xdf>\xd1\xac\x95\xbd\xcf\xb1\x83\xbew~\xab>Rq\n\xbd\xf1v\xa2>\xc5\xe9\xbb>U\xd9#\xbe2\xf7\x85\xbd\xc7\x8c\xd6\xbd[\xaev\xbe\xe0\x8c\xca>\x89\x9a\xf9>\xb1\xe5\x9a\xbc\xf3\xef\xb5>\x05\xd5\x05\xbe\xd0\xc5\xa9=#1\xb2=3\x04\xda\xbe\xda\xf8\xa9>\xbb\xfc\x89\xbe\xc6;\xe1\xbeEpn\xbe\xaf\n\x0b\xbe:\xceL\xbe\xc7\xa8\xc6\xbe\xcd\xad\xd7>?\xe8#\xbe\xa6\xa4i\xbe60\xe3\xbd\xebM\xda\xbe\x9f\xee\xa2\xbd\x02N\t?\xae\xd0+\xbd^\x0e\xcd:,\xd4\t\xbf\x13\x88\xbb\xbe\xb2\xf8\x95\xbeU!\xc1=\xad\xf5\xcf>s`\xbb=\xa5\xc2j\xbe\xfb\xd6\r\xbe\x83;\xc4>x\x03\xad=\xa1R\xd0=\x0bi\xbf<\x90\x16\xed>\xd7u\xc9\xbe+,F>7\x1b*\xbe\xdd|k>Rr\x9f>p\xb0\xd5>\xb9\xc3\xf0>?g\xc6>\xf6c\t>h9O>4`\x90='
-p820
-tp821
-bsV578776783237038080
-p822
-g2
-(g3
-(I0
-tp823
-g5
-tp824
-Rp825
-(I1
-(I200
-tp826
-g12
-I00
-S'\x01\x92U>\xc8\x90\x9b\xbd\x0f\x83\xad\xbe\x02\n\xbc=\xe6\xbfQ>\x82\x98\x96\xbd\x1a\xfb\x00\xbeu4.\xbe\x1a\xd7\xbe<\xd7\x195>yW\x0c=\xc0\xb9\x89\xbds!|=W\x8d\xff\xbb\x9b}\xee\xbc\xf8\xe6\xa1>QP\xeb\xbc9&\x84\xbd\xd6\xc3\xa4\xbd\x1b\x1c\xd2\xbc\xd3\xe2\x85\xbe\x82{\x0f\xbd?\x16\r>k\x1a4\xbe\xba\x1b\xcd\xbd\xba\x1e\xbc\xbd\xafi,>\x01\xd1!\xbe\xebMt\xbe\xdb\x02\xa3\xbb\xc1\x15\xb7\xbd\x81C\xea\xbd\xfb|\xaf=\x81J\x94\xbe\xe9\xff\xdc\xb9\xc8\xa5\xb1>\xeb\xed`=\x88\x18\xa4=H/\x8b>\xf3\xc1\xd1=\x8d\x91\x03\xbe)=\xa6<\x1e\x11\xe5=\x9a\xcc.\xbe\xc9\x04L\xbe\x12\x1dB\xbd\xc6\xa6\xb5>\xb9\xe6\xaa=\x1az\xea=\xb5\x8c\xab>^}\t=\t\x93\xb1>u\xcd#\xbe\x83\xba:\xbd\x89\xf4\xb7\xbe\xae\x01j>\xe0\n\xb2:\xb3\x0f*\xbeC\xfd\xb1\xbe\xa9\xb7\xa9\xbe\xf5\xc11>\xaaZ\x19>\xdb\xf2\xd6;\xd3\x93\x80\xbe\x95\x85\xc7\xbc\xae%V>\x87\xcbF\xbe\xf5\xda\xf1=\x80j}\xbe\xe9\x8e)\xbe#\x8c\xe1\xbe\x9e"\xa1\xbe\xbd\xbf_\xbd)/\xdc\xbd\xe9\x935\xbe\x19{:>\x0c\xf2\x87>\x9a)\xf0=\x17\x0f0>\x89\xb3#>[\xe9~\xbd\xd35F=\xad\xb4\x8e>`;W\xbe\x12\x1c\xd4=\xcb\xcc\x98=\xc2\xf2\xee=\xd0\x00\xa2\xbek\xf5\xf4>\x15S\xa9=\xe9e\n\xbeb*.>\x05I\xee\xbd\xb8\xe7:=w\xc4j>\x18\x19\xa6\xbd9\x03e>\xa9\x11L>\xfd\xf4r>\x85f\xf5\xbc(\x97Z\xbcQ\x9f\x8b>F\xb8\x03>V}%>\x97\xf4\xee>t\xe5\x84\xbek\x1a>\xbdz\xd2\xd6=q\xdf\x15>n\\\x07\xbd:\xb9\xdf\xbd\xa1\xf8\x1d>\x96\n\xc3=i\xdb+>\xa3\xbd}=P\xfd\x9d=\xfe\x03\xa6\xbek\xeb5>\x00\x9a\xeb\xbbRD\xd4<\x8a\xc4\xfb>MA\x9e=\x86\x07=\xbd\xd8\x97\xfb\xbd\xfe\xa8\xe7\xbd\x15\x9cs>\x0b\xa0\x97\xbd\xeav\xf3\xbc>r\xa0<\x93\x8f/>\xf9\xb0\x97<\xbe\xa1\x98=,\x01\x89=\xd7\xff\xb6:*\xb9\x90\xbd\xd2\x0c\x1a>\x00.\xa8\xbcP4\xbe;\xc1\x83k\xbd\x9b\x1a\xfc=\xce\xd6f\xbe\xa9:\x9b>2&\x9e<P\x87\x92\xbeO|t>Q\xd9\xd0\xbc#\xd9T>\n\x0c\xb8>!\x81+\xbe60\xe1<#\x8a\x90\xbd#\x08\x0c\xbeE\xf7f>\x19\x0b\x95>Q\xc9\xef\xbc\x0eL\xb5>\x12m\t\xbe\xb0#\x8a=\x92W\xc8=>?\x8c\xbe\x8e\x1b\xea=\xc0\xf20\xbe\x92_\xb4\xbe;\xa8G\xbe%m\xce\xbd\xab\xcfz\xbd\x03\xf8\xba\xbeq\xa6\x95>\xa0e\xce\xbds\xf8\xa2\xbdS\xd3\x80\xbc\xc0\x81w\xbe\xf9\x1c\xa4\xbd8\xe0\xdc>~7\xcb<\x9d*t=7x\xa2\xbe\x1b\xfd\x82\xbey\xb6_\xbd\x95\xd6\x08>\xf2\xb0\x97>\x0b\x7fz=\xcfD1\xbe\x1f\x02\xcd\xbdZd\x9e>{\x10\xd1\xbc\x06<3>\x90C\x83=\xef\xdf\x88>\x11^A\xbeuH\x08>\x03s\x84;\x85H\x12>\xd2s\x05>\xbb<\x9f>\xc9\x90\xa2>\xbb\x0f?>\x1b\rf=u\x0c\xd5=x<\xe8\xbc'
-p827
-tp828
-bsV592589529929916417
-p829
-g2
-(g3
-(I0
-tp830
-g5
-tp831
-Rp832
-(I1
-(I200
-tp833
-g12
-I00
-S'F\xeb\x86\xbc\xbfW\x95\xbd\xd8S\xe5\xbe\x12\x99\xdd>\x966\x99=\xcb\xb5<>\xefr\xda\xbe\xa1\xbb\xd3\xbd\xbf\x05\x1d\xbdYP\xbe>^B`=#\x19(\xbf\xaa\x07K>1\xb9\x03>\xf1\x8e\xf1\xbc\xea\x82\x98>9X\xab\xbdPy\xd2\xbe\x83K\x1e>0\nZ>mF)\xbfN\xa8\xc1\xbd\xe3\x12\xd8=96\t\xbe\xbf\xbd#\xbeS\x1e:\xbc@k\x02=\x8b\xd4\xce\xbd\xf6-\x11\xbf\xc2\xadE\xbe%\x8d\xd6\xbe\x10\x97c\xbe^=\xc6>\x18\x97\xdf\xbe\xa0+*=\x12\xebP?\x8e{\xda\xbe\xe0\x10\xb9=\x1b~f>\x05X\x1a?\xc7\xa5\x1a>f\x17\r?n&h>;\x8a\x0e\xbf>>\x94\xbeq\xfc\xbe\xbb\xce\x1d\xc7>\xaf\x9d\xa1>\xce\x0f\n>\x0b\xa2\xe1>\xc8\xe7\xad\xbd\x0b\xb7\x19?Z\x93\xac\xbe\xa6Q\x86\xbe\xbeH(\xbf\xb6\x9b\xde>[\x80\x88\xbeo\xd6|\xbe-\x02\xfd\xbe^\x92\xed\xbe\x83g\xed>\xfe%\xd3\xbd0\xabR\xbe\xba@C\xbf\xeb\x95\xa7\xbe\xc81\xff>\xa2p\xdf\xbe\xef:C\xbex(\xf6\xbes?\xee\xbe\xf5]\x1e\xbf\xe2\x89\x1e\xbf\x91Z\xfd\xbd\xe7)\x85\xbe\xb7\x1f\xef\xbe\xa9]\x0f?U\xe8\x0b?\xae\xe89>\x8bs\xc9>\x9b|\xcf=\x8a\xc1J\xbe\x08{H\xbb(s6?\xe1\xd7\xbe\xbe%c\xde=\x97\x88\xb0>\x83\x97l\xbc:\xe3*\xbfn\x1c\x19?P\xd1\xa8>\x1dV\xe3\xbb%\x7f;\xbd\xf2TX>\xd7h\xa5=\xa3\x9a\xa5=o}\x8c\xbe\x07\x06\x06>\x83ta=3\xe9\xc3>M\xe6d>\xe8\xfb2\xbd!\xc3\xdb>\x17\xfep>\x86z\x7f>A\xf9\xa3?\x82\xff\xd0\xbe\xda#s\xbe\xa6c\xc5\xbc\xfa \x16?\ni\x19\xbeK\x0c\xac=\x9bg\x1a?GJ8>\xdb\xfa\xe5>\xd1\n\xd3=\xd3\x1fd>\xc7\xa5\xfb\xbe\xdem\x9d>~\xf3C=\x80\x17\x14>v\x90P?\xd3\x18\x93\xbe(v\x1c\xbeOS\xd0\xbe\xfet\x18\xbfS\'\x97>z\xfd\xb4\xbcFA9\xbe\xe6*\r>\xf2\xeb\x04?\xf07m\xbe\x9a9c\xbe\x03\xd6\xf6\xbd.\xdd\x15>\xa2h\x0e\xbf\xe0n)>\x97\t\xff<\xa1D\x03\xbex4\xf0=\x8e\xde"??\xea\x02\xbf\x96\xb3\x14?O\xb41\xbe\x14\x05\x83\xbe\x0b\n\x07?2\xf7\xe7=\xe6\x7f\x13?)\xa6\r?\t\xf7K\xbe0\x19y\xbe\xd2\xb4\x9b\xbe\xeb9\xc6\xbe\xa17/?K<h?\xefa5\xbe\xce\x9c\xde>2\xa6V\xbee,\xc3<MA\xdf=.\xbdG\xbfxY\x1f?u\x9f\xa3\xbe_r\x1d\xbfs\xa7\xdb\xbeJ\xb3\x8a\xbe\xd6\xa6\xd3\xbe\xf2\x7f\xe9\xbeV\x08\'?\xf1>\x9c\xbee!\xdb\xbeR\x99\x9d\xbe/\xf4=\xbf\xb2\x8cg\xbek13?\xd9\x9a%\xbe\x1a%<=C=k\xbf-E\x01\xbf\xe0\xf5Z\xbf/\xb2]=\xc2U\n?\x81\x89->2\xb2\xc1\xbe\xfeu\xc4\xbeC\xd7\x1d?hr)>\'d\xba\xbd\x9d\xd5\xd5\xbc\x0f\xefK?\xe5\xbd-\xbf\xc1|\x07>\x8a\x15\x08\xbfi`\xe7>s\xb1\xe7>\xdf\x8f\x07?%\xf7G?1d]?\xd0\xbeO>5I\xe7>2\xccb\xbd'
-p834
-tp835
-bsV578813088629145600
-p836
-g2
-(g3
-(I0
-tp837
-g5
-tp838
-Rp839
-(I1
-(I200
-tp840
-g12
-I00
-S"\x0e~\xf8\xbb\xf2\x05H\xbd\x10\x98\xc5\xbe\xd5\xbf\xb1>\x19\xc1\x82=\x93m\x1b>\xa3\xfd\xb1\xbee\xa3\xa5\xbd\x08\x1c\xe6\xbc\x06\xdb\x9d>b\x88'=q\xe0\t\xbf%A)>}\x02\xca=\x8fn\xcf\xbcJ\x13u>o\xa5\x92\xbd\xb5\xe5\xb2\xbe\xb5\x85\x03>1\xec9>\xd2\x81\r\xbf\x8f\xb5\x90\xbdc\xc6\xa7= \n\xe5\xbd\x9c\r\x00\xbeI\x1a9\xbc\t\xa2\x0f=N\xf4\xb1\xbd\xda\xcc\xef\xbebK!\xbe\x9eI\xaa\xbe\xfe\xbb4\xbe\xf3\x94\xa2>\xdf\x07\xbc\xbe\x03\x84\xcc<\xc6A-?\xd9s\xb5\xbe;\xaf\xa9= \xcbD>\x8dP\xff>\xaf\xe4\x01>~\xc2\xef>/8J>&!\xef\xbe>Ju\xbe<o\x0e:\xd5g\xa3>\xf64\x81>\xd0\xd4\xd8=7\x87\xbf>\xd5P\x92\xbdoK\x01?\xaa\x00\x94\xbec\x03T\xbe\x9f\x1b\x0c\xbf\xb5\x0c\xbb>2\xa2\\\xbeRiR\xbe]\xa6\xd5\xbeg\xa7\xc7\xbe\x1fp\xcd>\re\xac\xbd{m4\xbe\x90&!\xbfMg\x88\xbe\xc8)\xd5>*\xe1\xbc\xbe\x9eE\x18\xbe\xc7\xa5\xcc\xbeze\xc1\xbe\xb3\xe2\x03\xbfI\xfd\x03\xbf~k\xd4\xbd\x8f3]\xbe\xc7\x0e\xca\xbe\x85\xb3\xed>\xd9\xdf\xe7>\xb2\x85\x19>\x07\xef\xa7>\xd7j\xa7=\xd0\x10,\xbe\xcb\xda\n\xbc\xa9\xf7\x15?Z\xb7\x9d\xbe\xab\x90\xb6=*\x13\x92>%\xdf\xab\xbb\x1e\xad\r\xbf~v\xfc>\x12U\x91>3\xeb\x8c\xbbw\x8c\x17\xbd!\x98'>\x07O\x85=C\x84\x87=\xa7\xaab\xbe\x19\xc1\xc4=\xe0fG=\xeft\x9f>'\xb6<>9j\r\xbd\xadc\xb9>\xd3\xc0>>>SQ>\x8e\xb0\x87?7n\xaf\xbe\xbf\xd5B\xbe\xbe\x19\x8f\xbc\xc9\xe6\xf3>\xc6\xd8\x06\xbeI9x=r|\xfe>\xd5M\x1e>\x1f^\xc2>\xd2?\xc0=_p*>o\xe9\xd1\xbe\x9a\xa2\x84>Z\x8d\x0b=\r\xe2\xfc=\x9d\\-?\xfb\x10|\xbe\x89u\n\xbe\xe7\xd0\xa8\xbe\xf5\xed\xf8\xbe\x07\x93z>z\xf8\x8c\xbc{<\x10\xbe\xca\xf2\xe5=\xfaJ\xd5>\xd0A;\xbe?^@\xbe\xae\xb7\xdc\xbd\xe1j\xf3=R\xa6\xeb\xbe\x91n\x07>\xbe\x8f\xea<\x93\xbf\xda\xbd\x01\xf5\xce=\xf0\x04\x07?\xde6\xd3\xbegu\xf7>\xc9K\x0e\xbe\xfb\xbb[\xbe\xa6\x9e\xe3>\xc8\xab\xe0=\x0b\xc0\xf7>\xc5 \xe7>\xd8\xc4)\xber9Z\xbe\xeeu~\xbe\xaf\x9f\xa5\xbe\x17\xed\x10?\xe5?A?z<\x1a\xbee\xd4\xbd>\xa0\xbb2\xbe\x89P\x92<\xcd\x8f\xc0=\xce{&\xbf\xbar\x05?\xd1+\x89\xbee\xdd\x00\xbf\x7f,\xbc\xbeM\xc6e\xbe?\x99\xb6\xbe\xf6\xc5\xc6\xbe_\xf5\x08?RBw\xbe\x1f\x17\xb0\xbe3 \x80\xbe\xb9\xf3\x1b\xbf\xb1\x15F\xbe9F\x18?\x0b\xe2\x07\xbe\xd8\xda'=z\xdbC\xbf\xd7\x16\xdd\xbe%\x925\xbf\xa2!\x10=\x8b\xbe\xe1>\x9fn\r>\xc3\xc8\xa2\xbe;\xb5\xa9\xbe\xed\xd2\xfe>g`\x05>}\x87\xa7\xbd\x01\xb9\xce\xbc\n\x17*?\xf4F\x10\xbf=\x9a\xd9=\xab\x1c\xe1\xbew\x82\xc7>sO\xc5>\x9a\x01\xe2>\xb9\x1f)?\x11R5?\x9b\x00+>a\x1d\xba>}\xd2\n\xbd"
-p841
-tp842
-bsV580306685459357697
-p843
-g2
-(g3
-(I0
-tp844
-g5
-tp845
-Rp846
-(I1
-(I200
-tp847
-g12
-I00
-S'\xc3\x1a\x16>\x89}\x1d\xbd\x94\x93\x9e\xbe\x9c\xffS>1u\xec=a\xfc\x88=\x1a\xe2r\xbe\x13t\x1c\xbes\xaa\xbb\xbc\x0f\xac\x82>m^\x14=_\xda\x98\xbe\xfd\xa7\xda=\xaf8\x9d=lz\xed\xbcc\x04\x94>\x89<x\xbd\xb1DI\xbef\x10\xec:\xb6\xe9:=\xd9m\xb2\xbe<\xff)\xbd\x1a\x9c\xf2=#\xe7\xd2\xbd\x94`\xc8\xbd\xe5\xd0\x16\xbd\xa7m\xa5=V\xd6\xce\xbd\x06{\xb9\xbeg,L\xbd\xf30d\xbe|h\x1d\xbe\x11\x8e?>\xd5H\x90\xbe\xc1\x8fo=<\xd4\xf4>:\x13\xc4\xbd\xba`w=C\xf6t>\x90\xc9\x92>\xc5\xd3 <\x8c\x0c >\x0b\xe7\x1d>$3\x9a\xbe\xc9\x8cF\xbe\r\x13\xe5\xbc\x1c\x0c\xb1>\x84nB>\x06\xe7\xc6=\xa4`\xbf>\x1f\x83$\xbdD\xf9\xc0>\xf4n@\xbe\xd7R\x0c\xbe\x97\xad\xe9\xbe\x86\xd5}>\x97\x87\xda\xbd\xec\x00\xe7\xbd\xf4\xee\xdb\xbed\xb7\xb0\xbe:$z>\x01&\xae=\x8fg\xd7\xbc\xfd\xa5\xd0\xbe-\xad,\xbe\xc2\xa1\x87>)\xf6\x87\xbe\x80\x99\xd2<\xb4\xa0w\xbe4w\x87\xbe\xc3V\xf6\xbe\xd4\xbd\xcb\xbe\xeaT\xb2\xbd\x14\xd7&\xbe\x90\xe9g\xbeP\xc3\x9b>\x93\x1c\x8f>\xcd\xa1\x16>\x83\x98|>9\x16\x00>1\xa2\xc3\xbd\xd4\xc5\xae;c:\xde>M\xc2\x83\xbe$M\xef=\xea\xea<>no\x9d=\x06W\xcb\xbe$\xfa\xe3>\xac\xa4\r>\x07u\x92\xbd\xc1\t\x82=\x96\x86\t<\x10\xc8\xf8<\x96\xd8\x13>\x168\x03\xbe,\x07<>\xbe2\x07>\xf6\x0ey>"\x91\x8a=\x07\x04\xd9\xbbn/\x94>\x81\x9a%>\x84\xa6*>\x1a\xe9;?\xb7\xcd\x90\xbe<\x0c\xd7\xbd}\xccx=U\x0b\x94>zj~\xbd\x8f)~\xbd\x94\xfd\xa4>\xe0z%>qu\x89>\xa3\xdd\x92=\xb1\x01\x02>\xbf\xa4\xad\xbe\x1dhc>\xe9Rp=\x14k\xb6=\xd9\xd6\n?\xc9\xd5\xe6\xbc\xc62\x8d\xbd\x86\x92O\xbe\xd7y\x90\xbe\\?X>S\xadf\xbd\x991\x9e\xbd\xbb\xb6\xad=\x01N\x9a>\xac\x95\xb8\xbd\xb2\xa6\x13\xbdq\xd8\x87\xbc\x06Rm=\x1d\xe3^\xbelO\xbb=\x17\xe7 \xbc\xcc\x0c\x9e\xbdFl\xe9\xbb\xc9\xb5\x99>c\x90\xa3\xbe\xec\xa2\xb8>q\xd9\xc7\xbc\x82\xa0\x81\xbe{@\xad>o\xd6R=\xe7\xb5\x9c>\xfcE\xd6>\xe1\xc6\x1a\xbes\xb7\x84\xbdl\xb5\x13\xbe\xb1\x02g\xbe\xfaa\xce>\xad\xf7\xf5>\t\xf9\xa5\xbd\x9e;\x9c>~\r\x0f\xbesYp=\x97\xb2\x92=T\x99\xdf\xbe\x81u\x81>\xf1\xd5~\xbe\xbfE\xdb\xbe\x06\xadg\xbe\x88\xe5\x00\xbe\xb7\x12\x1f\xbe#\x7f\xa8\xbe\xd6\xf4\xcc>o\xa4\x0c\xbe*\xe2l\xbe\xc9U\x13\xbe\x96\xe3\xd5\xbe\x97\x81\x00\xbe\x8a\x93\xea>\xda\x11m\xbdh\x0c,=\x16\xc6\x06\xbf \xf3\xb5\xbe\xef\x92\xa5\xbeZ\xaa\xaa=\t\xaa\xaf>\xb7\x16\xc0=.4\x82\xbe\xc1\xc1N\xbe\xcae\xd2>\x96\xcc\x9a=2\xcf\x0f=7e\xc3<\xaf\x08\xe8>\x83%\xbb\xbe\xc1\xd2\x12>MeM\xbeq\xcd]>\x8f?\x87>\x99o\xc9>\xff\xd4\xef>|_\xce>\x1a\xe3\x02>\x912{>\x8c\xf4\x9f\xbc'
-p848
-tp849
-bsV577388756946255872
-p850
-g2
-(g3
-(I0
-tp851
-g5
-tp852
-Rp853
-(I1
-(I200
-tp854
-g12
-I00
-S'\xb0\x9eg>}\xfb\xd5\xbd\x94%\xd8\xbeU\x9e\x9f=\x7f\x14\x8e>\x19\x98\x1c\xbe\x13s\x16\xbe|\x08&\xbe\xd9\x03%\xbd+h\xd5=\xf9\xe4\x03>=\xb6\x0c=\xdb\xf3\x1d>\x81b\x83=\xbb\x07\x0f\xbeu\xf1\x8f>\x10\x7f\xff<<q|\xbd_\x94\x9e\xbd\xd7G\xa5=\xd9\xbc\x9c\xbe#u\x1b\xbd<\r\xfc=$\xaa\xca\xbe\x9b\xda\xfa\xbd\xd7\xa0\xce\xbd\xb7t(>\x97\xc0\x8f\xbeX\x19\x84\xbe\xa5D)>S\x0b,<rd\x0c\xbeU~6>\xcb,i\xbex}\xf2\xbb\x9df\xa0>\x8b@x\xbc\xcc\xba\xe1=\xa0X\x97>\xcb*\x11>QM\xbd<\xa7G\x19>Q\xe4t>\xf9\xed\xa1\xbeDn\x02\xbe\xb8)\xfc<\xc7W\xcb>\x7f\x9f\xb2\xbb\xf1wP=\x05\x9e\xaf>+\x9e\xbb=\xebC\xdc>\xd0Tk\xbe\x0f\x08\xc8\xbck\x12\xd1\xbe\xe7o\x99>_"[<\x81\xaf;\xbe\xe4\x0b\xaa\xbe\xfdR\xbf\xbe\xd0j\x8e>\x93\xb0\xb1\xbc\x94o\xe0\xbd\x16\xf3\x93\xbe\xf7V\x90\xbd\xa51\x96>\xcfe"\xbed\xc5Y=\x01\xe8\xd3\xbe\x0c\xc1\xf7\xbd)\xe7\t\xbf%\xe8\x8f\xbeu<\x98<\xf2m\x0f\xbe<\xe3Y\xbe&\xbc\x9c>\xf0\xbe\xa0>\x8c\x14\x07>\x15\xaf\xb3=^\x9f\x1e>\xc3X\x16\xbe\x18\x1e\x9b\xbc!\xc9~>Y\xd9;\xbe\x8a2\x0f>\x0bM\x1a>\x7f4k>\x04\xd6\xb4\xbe\xfdK\xf4>;\x82J>\xa3\xe4\x9c\xbd\xd8\x99">\xa7\xd8r\xbeo\x7f\x10>\xef\xdd\x80>\x893\x80\xbcM\xb5\xc3=M\xc6b>\x07Z->\xc5v6=\xce`\x8a=\xf1\x1e\xb8>\xb4<\xc7=\x1c\x04\xf6=\xe3n\xf0>KQ\x7f\xbe ZZ<\x058\xa4\xba\x9d\xc7\xc8==~\xd3\xbcHj\x84<\xf9\r\x96>9\xab\xa6=`\x14.>\xfe\xaf\x82\xbc\x89IK={\xf4\xa6\xbe0\x8a\x8d>g\x99g=\x05\x8f\xf9=/\x13\x05?\xb9\xe1\xf6:\xb5\xe3\xa0\xbd\xf1\xa5i\xbd\x8dlX\xbd95\x7f>2\xff\x0f\xbe\x05$N\xbbk\xea\xbb\xbc\x13\x93\xd4=d\x06X=7\xbc*=KP9=\xdfhv<\x93\x82!=U\x7f\x06>k~\xfc< \xc9\x9f<\xbd\x04\xcd=5\x08\'>2\x11\x1e\xbe\xc0\xb7\xac>B\x8d\x90\xbd7\xd4\x82\xbe\x87\xf5k>:\x80\xa1\xbd\xbbz\x8c>c&k>\xa4\xdf5\xbe\x0cLL\xbd)\xa9\x9e\xbc\x99?3\xbe\xb0\xf2C>c\x18\x98>\x15\xa0>=C+\xb5>#\xcca\xbd\xd37\x89=\x11D\xbf=\xdd\rs\xbey\xe1\xa0>8\xdd,\xbe\xb3|v\xbe\x0c\x14 \xbe\xeb\xa9\xee\xbd=\xb3-\xbe\xbf\x80\xc3\xbe&\x92\xa7>%<\xee\xbd\t\xb0\xaa\xbd\x17$\x93<\xdfOF\xbe\r\x1b\xe5<\xe0\xfc\x0b?\xef\xe4T=E7^\xbc\x1b\x11\x9a\xbe<\x1c\x8e\xbe\xbbk+\xbe\xd5\x0f\xf6=\xc9\xd2\x93>\x991l=\xa3\xda\x12\xbe)\xf2\xc0\xbd\xcc\xb8.>\xf4p:\xbd\x077F>\x84\xa1\n=l\xd6\x92>\x89/U\xbe\xc62\n>\xa0\xd2E\xbc\x14V=>+!Q>q\x04\x83>\xf3E\xb1>|@O>\xc4\xb9\xd1=<\x80\x0b=K!3>'
-p855
-tp856
-bsV580269109188931584
-p857
-g2
-(g3
-(I0
-tp858
-g5
-tp859
-Rp860
-(I1
-(I200
-tp861
-g12
-I00
-S'\xe8\xa1F>#\x05\xc6\xbdP\n/\xbf\x94~\xc3>|\xb1\x88>\x12\xc9\x90=\xa0p\xdc\xbe\xcf~9\xbe\xf4\x87A\xbd\x9d\xab\xd2>\x01\x83\xda=o\xde\x08\xbf\xa4V\x85>\x82=\xf4=u\xfa\xd5\xbd\x01h\xea>y\x94\x82\xbd\xadc\xd4\xbe\x12sM=9\x92a>\x89BC\xbf\xef\xd3\xa3\xbdb\x02,>>\xaa\xa8\xbe\x9d\xc5I\xbe|\x98\xd8\xbd:\xd5\x1f>\xc9\x19\x8b\xbe\xe6\xce%\xbfAa\xcb\xbdR\xfb\xac\xbe\xc8\xf0x\xbe)U\xd2>x\xed\x0e\xbf\xb7\xf8\xe2<-\x14e?V{\xa8\xbe\x0e\xa04>\xe63\xcc>\xd0\x9b\x12?\xe2\xbb\xd1=q\x1c\x0e?\xd8\xda\xb4>\x0e,*\xbf\x9e\x87\xaf\xbe\xc7\x95u<\xc0\xfe\x1b?\xa8\x0e\x82>d\xe2\x0f>\xdc\x98"?\xbaz\xad\xbc\x86}T?\xa8\x83\xf5\xbe\xa8\xd6Z\xbe \x14[\xbf\xff\xca\x0e?\xf5|I\xbe\xdf\x8c\xa6\xbe \x971\xbfeL,\xbf`{\x19?\xd8>@\xbdc\x9cP\xbe\x15\x8fN\xbf&0\x92\xbe\xe1v\x1a?\x01\xd9\xfa\xbe\x14\x90y\xbd\xc9\x1b&\xbf\x7f\xf9\xf8\xbeB\xdc\\\xbf$-6\xbf\xa4\xa4\xef\xbd\xa0\x04\x9d\xbe\xd9 \x0e\xbf \xc5$?\xa6x%?\x8d\x8a\x80>\xef\x03\xce>%\x07F>4\xb1\x86\xbe\xd5R\x03\xbd};C?\x9e\xc6\xe6\xbe,(2>\xb7\x7f\xc2>!\n\x18>\x1eOH\xbf9sZ?\xe9j\xcf>\x16\xec\xa4\xbd,\xc9\x97=\x10T\xea\xbbA\x82\x00>\x9cz\x81>^@s\xbe\x92\xcf3>\x1e\x97Z>\xd9\xd0\xe0>\xd6D4>\xbe\x88@\xbc\xa6\xbe\x18?#\x85\x8a>K\xde\x95>\xc5\xd9\xb1?\x05K\x06\xbf\xcdP5\xbeDs\x9b<\x9d\xfd\x07?\n\x9e&\xbe\x00\x00.:/@)?B\xfaV>\xc77\x00?[\xab\xc6=`KH>U\x9e(\xbf\x931\xe6>>\x19\x91=\xa1\xc7:>\xddW\x84?\xdf\xbcf\xbe\xc88H\xbe\xe6\x02\xb4\xbe\xb99\x04\xbfWp\xd8>\xa3l\xfc\xbdZ}\xea\xbd\xef\xb8\xb0=d\x1d\xf2>\xee\xb9\x19\xbe\x1eV\x1d\xbe\xa1\xce\x99\xbd1\x1d\xe2=\xc6e\xe4\xbe\xedBY>\xe5\xe4\xf8<\xa6\x8f\xae\xbd\x94\xdd\xff=\r\xdd\x19?\x7fm\x03\xbf\xd2_4?\x8ct"\xbe9f\xca\xbeA\xbf"?/\xbf\xaf=\x93\xc7%?\x9c\x18%?B\x83\x94\xbe%\xb0|\xbe\xe8!\x8a\xbe\xd8\x93\xdc\xbe\xad50?<Vq?\xd2K\xf4\xbd8(%?\xf5\x84o\xbe\x0e\xfd\xa3=qS3>\xd8dX\xbf\xf1\xfb-?\x19~\xbe\xbeH\xcd1\xbf\xb5*\x02\xbf\xed\xeb\x92\xbe\xfbC\xf5\xbe\xf1\x1f+\xbf\xcf\x8bC?\xff\xb9\x97\xbe\x17V\xc9\xbe\xb4\x1fs\xbe\xfa\xfa>\xbf\xf5fM\xbe\x0fr\x80?T\xbb\x98\xbd&wk=\x06\xa2y\xbf-A(\xbf-\x1dM\xbf:3\x0f>\xe0J$?/\x013>\xd2 \xd8\xbe\x0e\xe4\xca\xbeh\xc3&?\x82\xd0\x9f=\xe9\x0cA=\xf0\x18\xd4;\xd6oX?U\x0c.\xbfJ\xd0J>\xad\x9b\xe3\xbe6\x98\x02?\x16\xb3\x03?\xbd\xcc$?\xd5\xceg?|\xbbN?9\xf9h>WO\xc9>\xee\x19\x97='
-p862
-tp863
-bsV580679960400125952
-p864
-g2
-(g3
-(I0
-tp865
-g5
-tp866
-Rp867
-(I1
-(I200
-tp868
-g12
-I00
-S'\xf1r\x1a>\xc3a#\xbcZ\xa8L\xbe4\xf9h=th\xd4=\xb0\xe1q=\\w\x04\xbe\x81\n\xc6\xbdYt/\xbc\x17\xf87>\x97N\xc1<rs\x10\xbeh0\xbe=\xe2M#=J\xe6\x07\xbd\x01QJ>\xf9\xeff\xbd\xa4;\xeb\xbdz\xf05\xbd\xca\xbdP\xbb\x11tL\xbe#\x14H\xbb\xdf\xa9\xa7=\x1f\xef\x16\xbd\x86RT\xbd\x02\x8d6\xbd<w{=\x13\x11\xa6\xbdZ\xdbc\xbe\x17\x92\xc2\xbc\xb4\xb0\xc4\xbd \xf7\x93\xbdm\x00\xdb=\xa0\x864\xbe^\x04\x81=\xc8<~>^\xc6\xa2<\xe4\x08"=3\xcf\x18>o@\x19>\x86\xbe@\xbbs\x15(=\xcb\xf4\xda=\xe161\xbe>\x11\x8d\xbd\x1fc\x13:N\xec\x7f>m7\xa0=\xe1\x94\t=\xa7\x89\x81>\xd0\x0e\xa3\xbc}\xbav>T\xf4\xd9\xbdfWQ\xbd\xc3\x9d\xa0\xbe;\x10\x14>a8\x18\xbd;\xa3\x18\xbd\xcd\xae\xa4\xbeh\xe5s\xbe\xa2q%>u\xea\xe1=\xd6X\xa8\xbb\xea\xdaY\xbe\x81x\xd5\xbd\x0c1\x11>\xbbb4\xbeu\x86\xc7=\xd6\x8c\xfe\xbd \x0e\x0c\xbeI\x07\x90\xbe\xf9 W\xbe\x9d\x92/\xbdu)\xbf\xbdyu\x04\xbe&\xee\x1a>B\x9f\x0c>\xd0\xd3\xd0=\xa1\xb7\xee=e\xb9\x93=Zuc\xbd\xf6\x1ad\xbc?\xcb\x8c>g\xae9\xbe\xb0\xbd\xdf=\xa9\xdc\xe0=\x11\xb3\xa9=\x0c\x95P\xbe\xe7\xae\x89>\xc8}\xc2=\xfb\x83\xa0\xbdPwz=#\xaca\xbd\xf6*\xcf<^\x88\x0b>/]\x96\xbd\x05\x1a\xd4=o\xdc\x06>|Z\xfb=\x80:\xf3:\xc5Gv\xbc\t/#>\xd7n\xcd=@\xaa\xb0=\x7f#\xcc>\x14]\x1b\xbe\xbaSi\xbc\xcb5G=\x19G\xff=\xdf\x89C\xbd\x8c1\xa9\xbd=\xc79>\xc28\x9b=\xbc\x1e\n>\xe9\xbf\x05=%\xcdV=\xe9\x9eC\xbe\xfc\xd2\x0c>\xe8\xf8:=\x1b\xa7q=\xd2\xe3\x9e>m9\xbf<\xce\xaak\xbc\xfc\x8d\xce\xbd\xbe\x81\x01\xbe\xc5]\x13>\x1c\x83!\xbd\x1d\x01\xec\xbc$\x90\xed<\x12e\x06>*\xad\xf9\xbc\xa0n\xb1\xbb_\xa8y\xbc+\x03\x9b<\xb1\xe4\xcb\xbdi\xf8R=\x1d\xd9G\xbc\xee\x10;\xbdJ\xcd\x14\xbc\xc0\x86\x02>\xd5{\x17\xbe\xad\x94C>@\x88\x1a<\xa3\xdd\x19\xbe\xc0\x1b\\>L\x89l=\xe3\x96#>TUy>\xa8\xe8\xef\xbd\x1e\xe9\x11\xbd\xd7\xda\xbf\xbdqX\x18\xbe\x83\xf3Z>\x0b\x05l>\x1d\xa5l\xbd\x13\x9d0>\xb9\xcb\xa7\xbd\x1b}==#\xe3\x94<v\x9b\x7f\xbe\x8a\xaa\xcb=\xd8\x0b\x0c\xbe\xf4\xe5y\xbe\xcc=\xfd\xbd\xe6\xedT\xbdZ&\xb9\xbd\xe7\xdb\\\xbe\xfdTs>\x1b(\x9b\xbd\xad7\x07\xbeC\xeb\x95\xbd\x93\x84B\xbe\xdei\x83\xbd\xdf7\xa3>\xa4\xb2\x05\xbce\xb9<<\x98\xcf\x9d\xbe\xc77r\xbe\x85c\x08\xbe\xbe\xd3\xa2=\xb1\x14c>\x8dB_=\x97q\x15\xbeO\xc8\x01\xbe6Mr>\xa4\x89\x8f<[\x022=\xb5z\xa9<\x94yk>\xae\xe06\xbe\x96L\xbc=\xd5\x18\xbe\xbdJr\xe3=\xb9n\x1b>\xe7J\x89>.\x91\x94>\\\xcc4>\xc0\x00\x87=\xd4\xae\x01>\x19\xc6I='
-p869
-tp870
-bsV580192649036107776
-p871
-g2
-(g3
-(I0
-tp872
-g5
-tp873
-Rp874
-(I1
-(I200
-tp875
-g12
-I00
-S"\x00>\xfa9\n{\xa5\xbdC\xee\x0c\xbfq\xec\x0b?;\x9b\xac=;\xbft>s\xbf\x11\xbf\x08\xae\x0c\xbeK\x99\xec\xbc\x81X\xf1>w\x06\x8c=EoP\xbf\xd3Jn>\xe5\xc7\x1a>\xdb\xe0\xbb\xbc\xb7\xff\xc0>s\x99\xe2\xbd\x97\x91\x03\xbf\xd4IN>\xad\xcb\x86>\x8b\xecR\xbf\xbc\xbc\xf3\xbd\x96\x12\x10>\xcd\xc55\xbe\x93\x8cS\xbe\x84\xb9\xa4\xbbI\xb9&=##\xeb\xbd\xb0o7\xbf\x87_b\xbe\x8d\x19\xff\xbes\xd5\x90\xbeM\xa8\xee>\x99\xf1\x05\xbf\xdf\n\x82=\xccW\x83?`\xe6\x05\xbfkz\xd6=\x01y\x97>;\xf5>?T C>x`/?)\xc3\x9b>\xe5\xe02\xbf\xe4S\xbd\xbei\xb2\xd0;\x83\x7f\x01?K\x1d\xd0>|\xf9,>}\x0c\x13?\xe7j\xce\xbdp-=?\xe4\xc1\xde\xbe\xdf\xf9\xa9\xbe9fW\xbf\xc7|\r?\xe8j\xa5\xbeS\x17\x94\xbe\xe5_ \xbf\x1f\\\x12\xbf'\xf7\x16?\x15\t\xd6\xbd)\x1ev\xbe\x83?u\xbfhH\xe0\xbet\xb6\x1d?\x10\xb2\n\xbf\x1d\xf3V\xbe/x\x15\xbfr\xcf\x16\xbf\xf7`H\xbf\xa7TJ\xbfu\r5\xbe\x8f\xc3\xab\xbe\xd6*\x12\xbf\xef\x048?\xd7\x94*?\xd8\xbai>\xff\x8f\x01?[\x0e\xed=u\xa7}\xbe\xae\x8b\x85\xbc\x9f\x15a?\x11\xb1\xed\xbe\xb7\xe4\x02>)\x99\xdd>g\xee\x89\xbc83S\xbf|_<?\xa9\x93\xd9>;(K<\xcc0<\xbd\x1a\x1f\x8a>\xdd\x0e\xc7=\x9b.\xa3=+\xb9\xb7\xbe}\x90->\xbb\x9f\x8b=\x03!\xf9>x\xd9\x95>\xe9\xcaT\xbd\xbec\x07?h\x13\x92>\x92k\x9c>s\x00\xcf?Qz\x01\xbf\xa8\xee\x98\xbe\x00\x01\xae\xbc9\x87:?\xe5\xfdM\xbe\x13\x1f\xb1=E\x10B?\xa1\xa5}>II\x15?\xa2\xf4\t>k:\x88>+d\x1d\xbf\xf0A\xc4>K\x83\xab=\x10AG>\x11)\x82?\x91v\xb3\xbe\xb5WJ\xbe\x91\xb9\x02\xbf\x7f\xbd=\xbf\xf3n\xb8>\x9b\xdd\xaf\xbcomX\xbe\x85\x7f0>\x9b\xff(?;w\x8d\xbeE\xe4\x8d\xbe\xcc\x1a'\xbe4\x90:>XB4\xbfs.@>\x03\t\x82=\x9b=2\xbes\xd1\n>q\xadL?X\x8f$\xbf\xd7\x8b<?\x81kC\xbe\x0b.\xaa\xbe\xd9\n)?\xe6C!>m\xe4;?\x90\xd11?\x19d\x81\xbe <\x9c\xbeI\xcc\xbe\xbeS\xf1\xfd\xbe|lZ?\xc9V\x92?=@h\xbe\xc1i\x06?\x80t\x84\xbe\xb3\xd7\xbc<\xb6\xdb\t>}\xa0}\xbf\x18\x92I?4L\xd0\xbek\x9eE\xbf+\x06\x03\xbf\x017\xa9\xbe? \x01\xbf\x01P\x0f\xbf\xc3\x8bT?\xd5\xb1\xc2\xbe\x86\x06\r\xbf\xcd\x1f\xc8\xbe\xc5\x9el\xbf\xf1\xe8\x96\xbe\x1d\x06a?\x1c\x8b_\xbe{$j=\x8e\xf8\x92\xbf\xd9\xfd$\xbf\xd0\xd8\x89\xbf\x99?\x84=\x85\xc3$?\x97\xc5U>\xaf\xa5\xf7\xbe\xbfQ\x01\xbf\xa3&E?\xa3\xb1P>K\x08\xe8\xbd-\x91\x03\xbd\x8f\x8b\x81?\xe1\x9f]\xbf\xe5\xb0\x1c>g\x85*\xbf]\x9b\x11?\x1dy\x11?S&(?\x05q~?\xcev\x8b?lE\x87>r\xd0\x10?gN\x88\xbd"
-p876
-tp877
-bsV582792895033446400
-p878
-g2
-(g3
-(I0
-tp879
-g5
-tp880
-Rp881
-(I1
-(I200
-tp882
-g12
-I00
-S']K\xd8=ghM\xbd\xbd\xc8\xa9\xbeb\xb3Z>9\xae\x02>\x91\x91d=;\xd1e\xbe\xacI\x04\xbe}\x0e1\xbd/\xb5d>\x96\xd6Z=\xc7\xcb\x97\xbe\xad\xbe\x16>\xc9\xb9\xc6=~\xf9i\xbd\xc0\xba|>\xb8\x80J\xbd\xe2(Y\xbe:\x04\xc5<:-\xbb=y\x16\xbe\xbe\xfdEL\xbd\xa8\xf2\xc0=Y+\x1b\xbeg\x96\xb7\xbdl`#\xbd\x88\x95\x8a=\x9e\xd3\x06\xbe6\xd3\xae\xbe\xf0>\x19\xbd\x94\xfe]\xbe\xd6j\x17\xbe9\xeaf>\x88\xac\x93\xbe\n\x81\x01=\xddj\xf0>ba&\xbe\x88\x8f\xbb=SoV>\xa8\xf3\x9d>q\x18\x7f=\xfb\xba~>\xd5\xa7@>\x82h\xb1\xbes+7\xbe<\x1f\xbb\xbaR\x86\xa1>\xde\x88\x1d>sB\x9e=\xb4\xc8\xad>\xf1\x82\xc7\xbc&?\xd2>NmT\xbe\x03U\xe3\xbdx\x91\xe6\xbeQ\xde\x8a>\xff)\x08\xbe\xdb\x85#\xbepl\xc4\xbe\xe8>\xb5\xbe\xaf\xd8\x90>\xba\x9a\xa6\xbc\xd86\xba\xbdCa\xe2\xbe\xe2\x0c,\xbe\xe2K\x9b>+4\x86\xbe\x92\xca\x06\xbd\xac\x1b\x97\xbe#v\x83\xbe\xd8=\xf2\xbek\x12\xc3\xbe\r9t\xbd\xfd\x00\'\xbe\x18\x0f\x84\xbe6\xff\xac>\x9a}\xa1>\'\xe5\x07>ogg>\xf9\x80\xeb=\xfb\x9c\xff\xbd6\xf5t;\x16\xff\xda>^Op\xbe`\x0b\xe6=\xa8,Q>-"\xc7=\xe5\xbd\xd9\xbe\xc8L\xe0>\xcf\xc9;>\x08\xceN\xbdh5\xd7<\x83\x1c\x80;X\xa4K=\xde(\r>\x8dx\xf3\xbd\xbb\xf4\xea=\xf3\xb1\xeb=\x03\xd8j>\xc0;\xaa=\xd6q.<\x98\xc9\x9b>\xcco\x19>\x00g&>\xb3\x99@?\x1br\x85\xbe=\x00\xcf\xbd"/\xf0;]\xf1\x92>\x05"\x84\xbd4\xc2V<\x1d\x12\xbd>S\xe4\r>J\xbb\x85>\x1d\x16\x1b=\xf6w\xdf=1\xac\xa7\xbe\xc3\xa4y>\x1d\xbbW=\x086\xcb=\xdba\x0b?xx\xd9\xbdW\x83\x9f\xbd\xa3\x1eJ\xbe\xa0\n\x93\xbe\x04\xc0Q>t\xc7k\xbd\x12\xf5\x93\xbdm\xd0\xa5=5K\x90>\xd3\x8b\xb4\xbd\xd8\'\x99\xbd,4\xe3\xbc\x94\xfc\x9c=\xack`\xbeX{\xd2=O\xd0\x19<{\x1eq\xbdgT\x8c=\x03j\xa5>v\x9a\x95\xbe\xae\x07\xc5>E\x1c\x9d\xbd\x8a\x84Z\xbe\xee\xc1\xa6>x\xe7\x06=\xda\xf3\xa5>ae\xb2>\x84\x9c\x10\xbe\x8a\x95\xe4\xbd\xa3\x9e\r\xbe\xedkq\xbe\xaaf\xc8>>\x12\xfe>xy\x8c\xbd<j\x9e>\xcbm\x04\xbe\x8aK2=\x08\x97\xa3=\xef\x85\xe3\xbeI\xa1\xad>\x87ll\xbe\xb71\xc8\xbe\xf6\x8cy\xbe\xa3\x04\x0e\xbe\xa0Vc\xbe\xf2\xba\xa8\xbe\xca\xee\xce>\'\x10!\xbe@\xacq\xbe\xf8\xcd\x0b\xbe\xe9\xfb\xd4\xbe\x80\xa4\xe3\xbd\xbd\xfe\xf8>\x016\x84\xbd\xb2\xea\x88<cN\x08\xbf\x08\x88\xb0\xbe\x9c\xa3\xc4\xbe\xa8\x96m=-\x91\xb4>\xd8\xde\xbb=\x18\xbdi\xbe\xbf\x8f@\xbew\'\xb7>\x1c@\xa5=s\xdd\xb9<\x8a3\xc7:\x1bS\xed>Rh\xc6\xbe^\xc9\n>\x94\xf1k\xbe`a\x83>\xd8\xbe\x92>D\x1c\xba>\x96\xdd\xef>s\x02\xdc>\x03\xae\x02>\r\xc0f>\xc0K\x0f='
-p883
-tp884
-bsV580439042128379904
-p885
-g2
-(g3
-(I0
-tp886
-g5
-tp887
-Rp888
-(I1
-(I200
-tp889
-g12
-I00
-S'dO\xd9\xbc\'8\x9d\xbd}\x7f\xf0\xbeH\xfd\xf3>,]f=\xec\xcb^>g\xee\xfd\xbes\x1e\xcd\xbd\x14\x14\xb4\xbcy3\xd2>q\xbbt=\xb9\xb99\xbf\xacEO>K\x1d\x02>H4\x94\xbcKB\xa0>\xa4\xd0\xbe\xbdh\xfb\xe8\xbe\xf8l?>x\xb7v>\xf8\xc68\xbf\x94\xa2\xc5\xbdYF\xe4=i\x82\r\xbePZ8\xbe\xfd\xa8\xcc\xba\xd1\xaf\xc4<\xd1\xe0\xbf\xbdr\xd2 \xbf\xcf\xaaS\xbeX(\xe1\xbe\xe0}v\xbe\xdf\xf7\xd1>\xe8\x1f\xe8\xbe%lH=U\xecc?8>\xf2\xbe\n\xf7\x9a=\x18@q>\xdfp)?\xac`2>l\xea\x1c?)/\x7f>!]\x1c\xbf+_\xa1\xbe\x7f\x0e\x17<gi\xd8>\xbc\xf3\xb4>|\r\x15>\x13\xe2\xf3>\x10\x10\xba\xbdL\xa6"?E7\xc3\xbeWy\x99\xbe\xd7\xd27\xbf\xddN\xf6>2\xb1\x93\xbe\xd7\xe3\x80\xbe\xffL\x06\xbf\x94\x7f\xf8\xbe7?\x04?%\xe4\xd0\xbd\xb7@a\xbe\xb1\xc0U\xbf8\xf2\xc4\xbe\xc0(\n?(\xb8\xf3\xbe\x8b\x0bM\xbee\xf4\x02\xbf\x86n\x03\xbf\xb5\x1d\'\xbf\x8f\xa1,\xbf\xa8\x93\x16\xbe\x1dL\x96\xbecs\x01\xbf\x8fr ?C\xbd\x15?,\xc6F>\t\xdb\xdd>[\xac\xbb=i\x1d\\\xbe7bU\xbc\xf3\x15D?H\x1d\xcd\xbe\xe1L\xd6=\xe7\x18\xbf>\x8c\xf1\x15\xbdu\x1b6\xbf\xc3\x00 ?EI\xc0>\x8b\xb5\x8b<e\x95W\xbd\xaa3\x83>\xaf=\xb4=m\xdav=1\xfc\xa5\xbez\xcf\x07>\xc7>2=\x0f\x0b\xd9>l\x10\x8a>\xb5\xbcm\xbd\xe0*\xe8>\xd1\xd1~>`\x95\x86>\xe1f\xb3?D\xa2\xdf\xbeL_\x85\xbe \xed\xe9\xbc\xb5\xb6%?\xd9\xce;\xbe7<\xb8=\xe3\xc6(?\x84kB>\x99\xa1\x00?\xb5\xc2\xf6=8\x9du>93\x06\xbf\xfbG\xa5>\x19\x8b\x92=K\x18*>\x186`?\xdd-\xa4\xbe\xedY\'\xbe0\x1b\xea\xbe\xad`\'\xbfXS\xa0>\x80\x81\x04\xbcL\\D\xbe}\t\x17>5P\x13?]\xa8\x82\xbe\x92h\x85\xbe\x081\x1b\xbe\x8fb\x1f>\xf0S!\xbf\xcd\xf6*>\xc0\x96Z=w\x12\x1b\xbe;/\x06>\x19$4?\xf7N\x0e\xbf\x9b\x13#?\x11-2\xbe\xe5]\x89\xbe\xf8\x98\x12?\x8d]\x12>\xbf\x92$?\xfd]\x18?,\xecb\xbe\x15\xc8\x8d\xbe\xa8\xf9\xae\xbe\xc5u\xdd\xbe\x05n=?\\_\x7f?Y\x96P\xbe\xa9E\xe6>\x83\x14f\xbe\xa5n\x80<\xc1\xd0\xe8=p\x9b\\\xbf\x15(2?\xef\xb7\xab\xbe\xf3+(\xbf\x07O\xe6\xbe\x8f>\x97\xbe0\xac\xe4\xbel\xf7\xf6\xbe\x9d\xb87?\x90&\xaf\xbe\xeb\xaf\xf3\xbe\xef\xdb\xae\xbepBO\xbf\x00\xe1\x82\xbe\x905B?\xbf\xd2?\xbe,VA=Y\x9b\x7f\xbfq\x10\x0c\xbf\x11\xc6u\xbfX\x90U=\x03\xca\x0e?\x1d@@>\xed\x97\xd6\xbe8W\xe3\xbe%!*?\xad\xf83>m\x01\xea\xbd\x12\x04\x07\xbd\xc7\x04a?p\xdf?\xbf\x04\x15\xf1=\xe5\x93\x19\xbf\xbb\xc6\xfc>dO\xf7>\x8d\xae\r?\xcb\xd9\\?\x89\x0fw?\xc7)j>\xcb\x89\xfe>(M\x84\xbd'
-p890
-tp891
-bsV580549743878754306
-p892
-g2
-(g3
-(I0
-tp893
-g5
-tp894
-Rp895
-(I1
-(I200
-tp896
-g9
-(S'f4'
-p897
-I0
-I1
-tp898
-Rp899
-(I3
-S'<'
-p900
-NNNI-1
-I-1
-I0
-tp901
-bI00
-S'\xd4\xfa\x1c?]\xbb\x9f\xbe[I\x98\xbf\x19\xa7r>P\xcbG?\x8a\x99\xe4\xbe\x18U\xdd\xbe\x1f\xc0\xe1\xbe\xfdx\xdf\xbd|\x08\x89>\x17\xaa\xc2>Q\x0e\xe0=\xa4\x14\xdd>\xea^9>\xc4?\xca\xbe\x03\xbfF?5\xe8\xd7=-\xa1*\xbe\x86\xbbO\xbe\xb0A\x81>T\x8d_\xbf\xc9\x08\xee\xbd\x925\xb2>\xaa\xcc\x93\xbf\xe9\xe9\xb9\xbea \x90\xbe\xba\xb4\xe7>\xdb2M\xbfp\x9b7\xbf\xcc\xfd\xf6>I+0=\xd9\xad\xc8\xbe\x8f\xb0\x03?*q\x1e\xbf\x0f\x9e\xc4\xbc2xa?\xd5 \x91\xbd\xb1\x19\x9d>\xdd\xedQ?,\x10\xd1>\xfc\x00\xac=Ke\xeb>q\x1b-?<\xabf\xbf\xd8\x8c\xb4\xbe0\x90\xc4=+\x93\x8e?\tk\xae\xbcY\xeb\x15>\xa1\xcbo?,p\x8a>\xf8\xe4\x9a?\xe7l(\xbfg\xd4\xa0\xbd\xe9\xf9\x91\xbf,\xf3\\?r\x0f,=\xd5\xbb\x06\xbf\x8f\xf0d\xbf\xd8\x96\x84\xbf\xf2\xc8H?\xf8\x03\xce\xbdV\xaa\xa9\xbeYhQ\xbf\xb3 X\xbe*bW?\xc0\xc0\xdb\xbe\xf7\xf4\xf0=(\xce\x99\xbf9\xf8\xad\xbe?y\xc1\xbf\x04LH\xbfc\xc2j=*\xba\xcd\xbe(w\x1a\xbf\xcarc?\t\x86e?\x00M\xb9>\x05pt>,\xd3\xd8>\x02^\xda\xbe\xf3\xd2e\xbd\xcf\xa2.?\xa6:\x02\xbf\xde\x82\xc5>\xe5\x10\xdc>\r"#?\xe0\xd0~\xbf\xa7m\xab?\xc4\xb6\x14?\x93yF\xbez\xe9\xe4>tW\'\xbfv\x1f\xd9>\x8e\xb01?{\xd0`\xbdg%}>f]\x1c?\x8fT\xf5>A\t\x18>\x95OE>\xd6\xda\x81??\xd1\x88>\xe7\x11\xa9>\x12\x13\xa9?\xef\x9f1\xbf$=\xfe<T\xb1\xd3\xbc\x03H\x8f>\x01\xd5\x9f\xbd\xd1I\xaa=e\x9fW?@\xb1Z>\x9b\x01\xf4>\x85\xcfV\xbd\xb8\xae\x11>\xb8\ri\xbfC\xbaE?\xee7)>5\xe1\xb0>a\x1a\xbb?\xad\x9aO\xbc\x9b\xb7g\xbe\x13r\'\xbe\xf7 \x16\xbed\xd44?\x84\xa4\xc7\xbe19\x18\xbc\x1e\x00\x9d\xbd\r\xab\x95>Y%\x1c>rJ\xd2=~^\xf9=-\n =\xd8\x93\xd0=\xe8\x8a\xc0>\xde\x00\xdd=\x95\xb1\x82=\xbeq\x9b>\x13\xd9\xf2>\\\x1d\xda\xbe\xf6\xcfs?"\xd6`\xbek\xa93\xbf\xec\xd1 ?\x07\x80y\xbe\xbd\x9aH?{T\x1e?#u\xff\xbe\x9a\x88\x1a\xbe\xd3/B\xbd[[\xfa\xbe~\x1c\x05?\x7fiV?f\xc6\x11>\xb4\xc6}?[v\r\xbe\xdbw7>.\x08\x88>:\xa7(\xbf\x19\x15o?\xf8\xbb\xe9\xbe\xa5\x88&\xbfTZ\xd7\xbe0\xb0\xaf\xbe;\x04\xfa\xbe\xaf^\x87\xbf:um?\xd2\xdc\xb1\xbe\x8exq\xbe\xe0\xffJ=\x02Y\x08\xbf\x1bz\xb7=\xc0\x0c\xc5?\x05=\x17>\x80\xe19\xbd\xe6CU\xbfH5A\xbf\nu\x02\xbf\xaa\xbc\xad>\xb8\xa4M??\r\'>\x16\x0b\xc8\xbe\xfd\x87\x85\xbe\xc9\x98\xe9>E\xbb\x05\xbeX\xfe\x0c?\xe8\x18\xb8=-\x8aN?`t\x17\xbf\xb4\x8b\xbb>\xf2\x92*\xbd\x82;\x06?=\xc9\x11?\xdb\xee/?\x1e\x8fw?w\x97\x17?\xd0\xc5\x95>\x97\xf7\xb4=\xebb\xff>'
-p902
-tp903
-bsV580397787256393730
-p904
-g2
-(g3
-(I0
-tp905
-g5
-tp906
-Rp907
-(I1
-(I200
-tp908
-g12
-I00
-S'\xf4u\x97\xbb6\x05\xb2\xbd\xb4\x7f\x17\xbf\xae\xbe\x17?\x03\xc0\xb2=)\xac\x85>\x98\xca\x1d\xbf\x8a\xa7\x14\xbe\x9a\xe9\xf7\xbc2h\x02?\x9e\x18\x95=\xc9Zb\xbf\t\x08\x80>\x9av&>\xcc?\xbd\xbc\xf0\xc2\xce>&\xad\xf4\xbd\x18\xa5\x0e\xbf\xf6\x07b>\xb4k\x92>\xb1!d\xbf\xc1\xcb\x03\xbe\x85\xdf\x19>\x8f\xad@\xbe\xa6\xc4d\xbeI x\xbb\xff\xf1*=\xd3Z\xf7\xbd\xf0+F\xbf\x81@x\xbe\xdd.\n\xbfX\x1d\x9c\xbe\x87\xf6\x00?\x99g\x10\xbf\x9bh\x8b=\xff\xfa\x8d?,\xae\x11\xbf\xa7\x1b\xe4==\xcd\xa1>M\xf6N?\xb3?T>7i>?\xebC\xa7>\xf9"A\xbf\xac\x83\xcc\xbe\xb4\x91\xec;\x7f\xff\n?O\xa0\xe1>F\n;>@\xfd\x1d?)\xb8\xe1\xbd\xe6\xc9K?#\xaf\xf0\xbe\xf0\x93\xb8\xbe\x94\x1ch\xbfD\xc8\x18?y\x9d\xb3\xbe\x90\xdd\x9f\xbe\x80I,\xbf#2\x1d\xbf\xde*#?\x97^\xeb\xbdo\xa8\x85\xbe\xb6\x94\x84\xbf:\xd6\xf2\xbe\x9bO*?\xe9\xdc\x15\xbf\xe6\x96k\xbexL!\xbf\x876#\xbf\x8dCW\xbf\xff{Z\xbf\xa7PD\xbe$\x90\xb9\xbe\x94\x1d\x1e\xbfP\xcfF?sV8?\x17l{>j\x1a\x0c?\xb4J\xfb=t\xfd\x88\xbe[\x19\x94\xbc\xd46s?\x950\x00\xbf\x96<\x0b>Ps\xef>\xd9\xb8\xbc\xbcP\xe3c\xbf?{J?Tl\xeb>4/\x83<y\x89V\xbd!A\x98>\xa4\xa3\xd5=\xa3U\xa7=W\x9b\xc7\xbe\xf6\x869>I2\x8f=\x85\x94\x06?\xda \xa3>P\x10l\xbd\x13\xa9\x11?\xaax\x9d>\x91\x95\xa8>\xd7\xbf\xdf?!\xac\x0b\xbf\\\x12\xa6\xbe\xecb\xc6\xbc\'EJ?z\xa0_\xbe\xb7\x0e\xc3=:\x89Q?\xf95\x88>\xdde!?\x81?\x16>\xad\x9f\x93>\x97\x9e)\xbf\xe7\xbc\xd2>\x8f\x85\xb7=\xc3\x88V>\x96J\x8c?\xe4\xa3\xc3\xbe`\xedZ\xbe\xa1\xc9\r\xbfq\xcdM\xbf\xc0\xa2\xc6>\x1a,\xaf\xbc)[k\xbe\xe62?>7\xed6?\xc4\x1c\x9a\xbea\xd2\x9a\xbe\xbf\xac6\xbe\xd4DJ>\xa1\xfcC\xbf\x1aAO>\x02\x9c\x8d=7\x9aA\xbe*\x95\x16>\xbc\xc1]?q\xe11\xbfPdK?\x9a<T\xbe\x06v\xb6\xbe\x91\x906?\xe7\xfc/>\xc0#K?\x87\xef??BM\x8b\xbe\xd9\x98\xa9\xbe\x89\x1f\xcf\xbe\x10\x1f\t\xbfS*l?ra\x9e?\xc0}|\xbe\x0f\x97\x10?&\x0f\x8f\xbelf\xc0<m\x8c\x14>\xc7*\x89\xbf|?Z?\x19\x02\xe0\xbe\x99,U\xbf\xec\xb4\r\xbf9]\xb7\xbe\xf4\xd2\x0b\xbf\x17\'\x1a\xbf\x93te?\xf1\xf4\xd2\xbe_\xaa\x18\xbf\xc9C\xd9\xbeY\x03\x80\xbf\xcb\x9a\xa3\xbe@er?\xd7\xd2r\xbe\x06%\x7f=m\xda\x9e\xbf\xf0\xb21\xbf\x11\xa3\x95\xbf/\x88\x8b=2\xa91?9\x97g>\xd4\xbd\x05\xbfg2\x0c\xbf\x1a U?\x80Nb>\xd9p\x01\xbe`w\x12\xbdF\x0e\x8c?j\xb2o\xbf\x8b\xae&>\xc4D9\xbftr\x1d?\xb5\xf2\x1c?\x1f\x0b5?\xd0k\x89?\x1c\'\x97?\xa0\x11\x92>\x19\xff\x1c?\xd1\xe7\x98\xbd'
-p909
-tp910
-bsV582803171657031680
-p911
-g2
-(g3
-(I0
-tp912
-g5
-tp913
-Rp914
-(I1
-(I200
-tp915
-g12
-I00
-S'\x03\xfb\xa1=\xd89\x17\xbd*:\x9f\xbe\xdb\xc8g>"\x95\xbf=Yq\xc5=z(\x82\xbe\xde\xc8\xd5\xbdW\xd8\xdb\xbc\xdc\x99|>\xc3\xc4\'=\xfc\xa5\xb1\xbe _\x06>.\xf0\xa1=\xa4\xa2\x04\xbd\xd9\xd7s>\xf7\xc6r\xbd\x0c\xc3r\xbe\xb5\xb5E=\xcdt\xcc=\xcc\x01\xc7\xbe\xa2o0\xbd\x97\x08\xb7=\xafL\xd6\xbdZ\xa4\xc5\xbda\x11\xd3\xbc\xd6\xc0W=c\xa7\xc9\xbd\x00\xb8\xb7\xbe\xd9\x9a\x94\xbdD\xbaf\xbe\x91\xdc\x11\xbe\xe4\x19b>L@\x90\xbe[\xbc0=\xc7*\xfa>5-7\xbe[9\x8c=\xb6\x93A>8\x8b\xab>\x00\x12\x88=d4\x8a>\xb1B.>\x02\xd5\xb0\xbe\x0f\xac6\xbe^\xb1\x8c;\xd8<\x9c>B\x0f7>\xf3\xd5\x9b=\xe6n\xab>\xde\xc2(\xbd\x86F\xc9>\xe2\xdf[\xbe\t\'\n\xbeIl\xe8\xbe\xacM\x8b>\xbb\x89\r\xbeH\x81\x0c\xbe\xd0\x9b\xc3\xbe\xb3{\xa9\xbe\xf45\x95>\x0e\xd7>\xb9X\xe8\xb9\xbd\x1b\'\xe7\xbe\x12\xefE\xbe=\x8f\x98>\x07(\x8e\xbe7,\x02\xbd\x8eQ\x8e\xbe\xdf\xc9\x8c\xbe\xec\xad\xe0\xbe\xe5\xb5\xc7\xbe<>\xa4\xbd\xae\xb7)\xbe\xf7j\x89\xbe*\xce\xad>\xa8\xce\x9e>\xa0\x8f\x08>\xc0Xs>\x1bs\xb8=\xf4\xc0\xee\xbd\xd2\xf5\xd9\xbb\x11\xc3\xe1>\xb7rz\xbe\x86\x81\xca=\xb0\xc5S>&\xb0]=\xe2&\xd1\xbe\xc4\xcd\xd0>EYH>+y\r\xbdG\xdcv<f-Y=zr-=\xb8\xbc\xd8=\x11\xb9\x19\xbe\x02K\xe3=\x1e\xe2\xbb=\x1c2r>\x82f\xd2==Y4\xbc\xe5o\x90>\xe4\x14\x16>\xeb*">\xeb\x81G?\xb7%\x86\xbe\xbc\x8b\xe6\xbd\xb4\xfeT<\x9c~\xa1>\xfeF\xb3\xbd\xc8\x02>\xbb \xcb\xbb>MP\t>ZO\x8f>;\xf0m=\x95\x12\xec=\x84\xd9\xa3\xbe*\xc5`>\xdf+U=TH\xce=cZ\x08?\xce\xe8\xf8\xbd<\xa8\xa6\xbd\x907d\xbe\x87\x1a\xa2\xbenrK>\xb2_\x1a\xbdh{\xa3\xbd3\x86\xa2=$\xff\x98>\xd6o\xe0\xbd\x0e_\xcd\xbd<\xd5d\xbd\x15\r\x9b=_\xb8\x8d\xbe m\xba=\x88\x0f\x97<$\xf6\x9b\xbd{\x98`=\x19\xd0\xb0>\x12D\x9a\xbe7\xe5\xbf><\xde\x81\xbdtuL\xbe\xbc\xf0\xae>\xb4a\x93=\xce\x0f\xae>\xc2\xd4\xb8>\x81\x1b\x16\xbe|\xaf\x02\xbe\xdaB(\xbe\x0c\x10z\xbe\x81\xce\xd0>\xc5\xb4\x05?\x96\x9b\xca\xbd)i\x93>\xc1\x88\x08\xbe\x87"\r=J\x9f\x8d=\xd0x\xf2\xbe\x95\xe8\xaf>\xderc\xbe\x07\x8c\xc9\xbe\x19w\x7f\xbe\x8a\xfe\x0f\xbe\xeb\xfdj\xbe\x87\x9f\xa0\xbe\x06X\xd3>\x94g)\xbeQ\x16\x82\xbe\x84\x04&\xbe\x9c~\xdc\xbeRb\t\xbe\xc2\xad\xf4>c\x94\xa1\xbd\xbct\xd3<\xf4\xd9\x0e\xbf\xcar\xb3\xbe\x82\xdc\xdd\xbe_\xa9]=\xfc\x8e\xad>tw\xcc=\xa4\xe5x\xbe|Xl\xbe\xcd]\xc3>\xf54\xa9=\xd7TL\xbcC{\x94\xbb\x9c}\xf7>\xce\xe1\xcf\xbe\x14s\xe1=4Y\x8c\xbe\xd3\xa6\x86>4F\x93>d?\xb9>\xc5\xe3\xfd>b\x82\xef>5\xc1\x06>=\x14\x81>(\xa1\x1c<'
-p916
-tp917
-bsV580912196277817345
-p918
-g2
-(g3
-(I0
-tp919
-g5
-tp920
-Rp921
-(I1
-(I200
-tp922
-g12
-I00
-S'\xd6HY>\xbb\xf5F\xbe<\x96\x95\xbe\xac)\x8a\xbb\xa0y\x91>\xde\x00\xd4\xbd\xbaxD\xbd\xa4B]\xbe\xfb\xb7\xe6\xbd\xf6\xc7\x1f>\xbdc\x19>\x046\x9f<\xb2\x13O>[\xe6\xe9=\x1e\xcc^\xbeM\x1c\xa1>\x8cKL<\xf1\x16\xd7\xbcpy\x1f\xbe\xfe!\xf9\xbb\xbbe6\xbe\x81\xb0N<.U\xc2<e"\x91\xbe\'\xa9l\xbd\xee\n\x05\xbe\xad)\x10>P\x02\x83\xbe\\\xd9\x9d\xbel\xf8\x8e=\xf0*.\xbe\xd0\x1d\x8a\xbd\x99\x0c#>\x9b\xe9\x86\xbe\xee\x92\x9d\xbc\xc4f\x83>6\x11\xa6=\x1e\x18_=9Zk>m\xb2\xac=\xea\xef\x14\xbcI\x0b2\xbd~\xd5\xf3=\xc5\x8br\xbe\xf0\xd5\xdc\xbd\x1f\x12\xe2\xbc\x94I\xc1>\x05\x04\xf0;]\x89\x92=Vu\x95>*a\x96="\xc3\xc4>d\\;\xbe_\xcd\x0c\xbd.\xf0\xb7\xbeKpa>\xdb\x1b]\xbd\n+3\xbe\xea\xb3\xaa\xben\x8f\xc2\xbe\xd4WB>\x13y\x99<\xc5\xea_<\xd0\x890\xbe\x0ega\xbc\xdc\xf6d>\xebS5\xbe|\x15n=\x04-\x88\xbe\xcde\n\xbe\xec\x03\xcb\xbe\xaf\xcc\x11\xbeg\x94\xbf=0\xb7\r\xbe2\x1b\xec\xbd\xb7jn>,}\x96>\x98.(>\xe0 b:0|y>\x84\x8b\xd0\xbd48\xde<\xe47\x9d>\x04\xb1#\xbe6\xa8\x1e>\xd4$\xaf=\xeaRE>\xe2\xf3\xc0\xbe\xc7P\xe6>\xce\\\xd6=\x0b\xb7\'\xbe\xeen\x9d=\x05\x1cp\xbet9\xcf=?V\xbf>I8\x98\xbb\xf0\x80\x04>UBr>P\xc33>\x94\xd3\x9c<po\x85=k\x17\x9e>\xa4\xdb/>t\\\xc9=]\xae\xa9>\x92\xd7V\xbe\xfed\x95=\xc2\xa6\xed\xbc\xfe[\xf9=l&\x1d=E\x168<.\x99a>\xbb\xa2\x02\xbd\xa5\xe0\x14=v\xf3a\xbdlZ->\xe9\x05\xab\xbe\x959\x8f>\xde\x11w=\xb3Bb=\\\xfa\xd9>\xb0\xeb\xe1=\xfcTn=\xfc\xcc\xb1\xbd\x15\x8eJ\xbd7@\x82>\x9c\xbb\x17\xbe\x8c\xf1\xad\xbdU\xc4\xb0<?\x15\xaa=\x0c\xe4|\xbdp\xf2\xa2=\x1b\xaa\x1e>\xa4O\x9b\xbc\xf1\x93\x0f>\x98\xbd2>\r7\xac\xbd\x19\xa5\xbb<C\x7f\xaf=\xa0{~=\x1d\xcb\x10\xbe\x93\x03\x9b>\x8b\x82\xb1\xbdp\x0c:\xbe~\xb4*>\xee-\x99\xbd\xec\xef/>\xf5h\x8d>\xf2\xf0:\xbe\xfc\xf2\x89=\xbc\x9e\xd8\xbd\xe0f-\xbedQ?>k,d>\xf0f\x81=H \xa5>\xb5\x08\xae\xbd\x9a\xd5\x13>t\xc1\x89=ZI/\xbe\x90\x8d\x19>\xe5\x87\x12\xbe\xf8\xbf\x98\xbe\x17\xa6\xfd\xbd\x95\xe0\xdf\xbd\x0b\xcco\xbdGX\xe1\xbe\x9dS\x87>\x1c\rR\xbe\x10Qo\xbd\xe1\n\x90<^y_\xbe\xf0f\xe2=\xa7\xb5\xf1>p=\xed=\x1e\x86\xe4\xbc\x9f\n\x85\xbe\xae\x12S\xbe\xd0\xe5\x96\xbc\xe6\xbd\n>u$\xc3>\xcf\xcd\x0f>\x08s\r\xbeB\x9b>=RXy>K"\xf6\xbc\x1c\x085>U\xdd\xba=\xa8\xbb\x15>\xdb\x93-\xbd"Yc>o\x9a7=\xba\xbc\x95=\x1fc\xde=\xe7\x86\x93>\xf34R>\x8c\x07H>\xd9M\xfb=V>\xdb=\xc3w\x1a>'
-p923
-tp924
-bsV580900896114102272
-p925
-g2
-(g3
-(I0
-tp926
-g5
-tp927
-Rp928
-(I1
-(I200
-tp929
-g12
-I00
-S'\x0c\x01n>5E\x9e\xbd/P\xbb\xbe\x87\x1e\x8c=\xd9\x8d\x80>\xd3\x14\xef\xbd\xbco\xb6\xbd\xec\x15=\xbe\x83B\x89\xbd\x010\xe1=\x8d\xf9\xcc=\xa1\x86\x11<<\xb4\x18>\xf3a\xbc==\xc5\x06\xbe:\xae\x87>\xf1\xe2\xe9;\xb6\xa4r\xbdl\x07\xc2\xbd\xae\x1f\x07=T\xd6m\xbe\xcc\x95\x12\xbd\xa3\xda\xe9=\x80\xa5\x9b\xbe\x88\xdc\x90\xbd7\x06\xbb\xbd\xe0\t\x12>i\xe5w\xbes\xdf^\xbe\\\xfc\x03>\x89.X\xbd\x87q\x07\xbe+\xc9$>\x96dq\xbe\x97d\t;\xd7\x84\x8e>&hq<`8\x03>\x1a\xb4\x89>s\x8c\xe9=\x85\x82\xad\xb9\xcc\xe1\x99=\x1f\xbeT>\xd2\x00\x87\xbeIm\xfa\xbd\xa4\x8f\x049\x8c\x96\xb1>\x0c\x97M<\x84\x9a^=\xfbO\xa6>\xc4\x89b=\xbfk\xc4>\xe0\x11*\xbe3OF\xbb\x86!\xbb\xbep\x9bf>\xb9\xa8\xa8\xbcP\xaf)\xbe\xe9\xdb\xaf\xbe\xc9\xad\xb8\xbe\xdfeT>\xdc\xcb\x88\xbb\xc1\xa9j\xbdw\xae\x86\xbed\xcd+\xbd3\xbbt>\xd1K\x1d\xbe\xb0\nv=\x9b\x14\x9d\xbe\xbat\xe4\xbd0\xc3\x00\xbf\xa7c\x83\xbe\xe1\n\xb2<t\x02\xf0\xbd\x9f\x1b)\xbe\x89\x88u>\x9a\xfey>\xb1G\xfa=Z\x18\xd2=\xf1\xc2->-\xfa\xed\xbd: ]<\x1c\xea\x82>\x92\xd1,\xbeD\xf7\x18>Qg\n>\x13\xb7x>\\F\xaf\xbe\xdch\xe3>v\x10\xf1=\xf0\xfb\xdb\xbdj\x06\x00>\x0c+i\xbeD\x89\xb3=\xd2\xcf\x82>\xc3\xbb^<\xc6&\xef=\xb6\xb8X>\x81\xc9\x17>\xafI\x1a\xbc\x01\x8c\x9c=$$\xa2>]B\xdb=\xe8\xd3\x01>\x84:\xdd>\xcf6_\xbeE\t\xa7;\x94\xe9\x9a<\x82\xd9\xaa=\xed\tP<\xa6\x89\xbf\xbb~z\x84>\x0c\x9b\xe6=l\xcb\x10>X\x00\xa6\xbcN\xeb0=L\x19\x94\xbe\xcc\xa3\x88>\n\x87H=\x924\xb5=\xdd4\xf0>||\xb1<D\x14P\xbd\x07|$\xbd\xbd\x85m\xbd\xddbV>W/\x06\xbe\xfa\xe4\x94\xbaw\xf5\xb9<3|\xe0=\xc4E.=J\xcez=w/\x8c=Mp\xe7<\xef\x08\x88=\x07\x08\xe7=\x9a\xce\xa1\xbbH\n\x85<x7\x8f=\xd1\xd4\x04>Z\xc3"\xbe\xa6A\x9e>C\xd9t\xbd\x94\xa5y\xbe\x7fSU>X\xf9\xa7\xbd\xb0\xc0L>\nYp>q\x00\x0c\xbe\xfft\x90\xbc\xf2J\x85\xbb7\x07\x18\xbe\xd46N>\xf9x\x81>t\x819=[m\xa5>\xf2\xe4\x8d\xbd\x86\x91\x90=\xed`\xb5=\xc1k[\xbe*\xf5`>\x89\xacE\xbe\x7f\xfb\x88\xbec\xb5\x1c\xbe0\x98\xa3\xbd\xf3\xe6\x00\xbe\xf8\x19\xad\xbe\x01\xbe\x91>\x19\xd0\xa5\xbd\xb1\x07\xa6\xbd\xd1?\r<Z\x19O\xbe:P\xf1;\r\xe4\xe9>j\xb6\x11=\x81H\x15\xbc\x84\x0e\x94\xbe\xbf\x05\x8a\xbe\x88q\x93\xbd\xb4\x91\xc4=R\xef\x95>\x193;=\xd5k\x08\xbe\x13\x05\x1d\xbd0J6>\x7f\xd9f\xb9\xc3\xf24>m9\x02=(\x19\x86>\xff\x05F\xbe\x1f\xf30>\xa4\xa8]<\x92\xba > \x9dM>\xcb\xd0\x91>|\xb3\x93>K<\x11>\xa9J\xb1=\xf4\xd0+=\x7f\x97\x17>'
-p930
-tp931
-bsV580586861392969728
-p932
-g2
-(g3
-(I0
-tp933
-g5
-tp934
-Rp935
-(I1
-(I200
-tp936
-g12
-I00
-S'dH\xa5>)\xed\xc5\xbdE\xcf\xfc\xbe\x1e.\x84=e\xf5\xa8>\xdc:\x07\xbegr\x13\xbeNOb\xbe\x06\xb1\x83\xbdSX5>\xe0\x11\xf1=\x00\x9c\x11;F\xcdD>\xd5w\xa4=|\x83"\xbe\xd8\x0e\xbd>|\xfc2\xbb\xea\x84\xba\xbd\xbe\x1a\x02\xbe\xf4\xa5R="{\xb1\xbe\xc74\xd9\xbc\x8e/\x19>|\x83\xc4\xbe@\x92\xdf\xbd\x8a\xf5\x08\xbe\xbf\xafT>\xe8}\x9f\xbeU\x83\xa5\xbe\xe3\x8c\x1d>B\x93\x06\xbdU\xe4\x17\xbe\xc2\x17I>\xb8,\xa0\xbe\xd5t\xa2<K[\xc1>D\xc7 ={(\x18>m\xe6\xbb>\xf0{\x1e>\x81\xf4\xf4\xbb8f\xde=}\xf2\x8c>+]\xb5\xbe=s\x1d\xbe\xa0}\x1f<H3\xf6>\x84\xb7\x9c<i\xea}=<\x83\xe8>=)\x92=\x1a\xf3\x04?,\xbe\x7f\xbeOIL\xbc\x94\x8b\x04\xbf3\x9c\xa6>\'\xbe;;\xf5?C\xbe\x16d\xf9\xbeq\xcd\xf4\xbe\x03\xb6\xa1>\xdc\xdbI=\xadH\x93\xbd\xc1\x87\xac\xbe\xdf\xef\x99\xbd&\xc2\xa3>\xc6|e\xbe\xe7\xba\x03>\xff\x12\xd0\xbe\xe2\xe2\x1b\xbe\xb7)%\xbf\x7f\x08\xb2\xbe\n\x94\xc0;\x94\xda#\xbe\xc6\x91o\xbe\xc62\xa4>\x12\xbf\xa8>{\xe2.>\xa0~\x06>\xb0\xc4X>\xc2i\x19\xbe\xa7\xe5I\xbc\xd5\xe8\xb0>\x8f\x98{\xbe\xeeLC>z\xbc4>\x9b-\x96> v\xd7\xbe\xb2q\x15?\x9e>C>\xf3\x0f\x0e\xbe\xa3\xc55>\x94\x95\x96\xbe\xae\x16\xe5=\x1c\x1a\xaa>\x96\x84\xc1\xbb\xba\x0b$>k\xd3\x95>l\x02N>@%\xe5\xba\xcd\xe7\xa5=\xfan\xd4>\x1ay\x0e>\x84\x14">(\xbf\x14?\xdb\xcb\x98\xbe\xde9\x99<"\x15*=\xf6\xbb\xdf=\xbf\x0e\xa1\xbc3&7\xbdN\xd1\xaa>\x19@\x04>\xe6\x15T>\x91[=\xbc\x9fRb=\x95\xca\xcb\xbeF1\xaf>\x86\x1c\x85=`\x1d\n>^# ?\xd3\x9f4=`*\x95\xbd7\x81\x8a\xbd\x1eE\x8d\xbd\x9e5\x97>\rd.\xbe\xc4c\x84\xba \xb7\x85:F\xb5\r>\xdebL=\xe0\xff\x8c=\xaaD\x87=B\x0c\xd3<\xb4\x8df=\x13p\x12>\x80\xa1\xed9\xc4\xc0\xcb;\xde\x1b\x99=T\xa2-><\x9eR\xbeu\xb4\xcb>,\xd0E\xbdF\xb6\xa6\xbe\xe0\xb3\x9e>\x0e\xbaa\xbd\x92\xab\x97>z\x96\xa8>C\'W\xbeb\xd7*\xbdm\xf8\'\xbd\xe2K`\xbe\x82 \x8b>>\x00\xb2>+\x14\x0b=5\x88\xda>\x05\xd8\xc9\xbd\xc9\x0e\xd4=\x0c\x84\xcb=\xd4\xf9\x9d\xbe^C\x93>\x16\xc7u\xbe\xd8L\xb3\xbe\xfa\xd9W\xbe\x1d9\xd9\xbd\x82;:\xbe\x977\xf0\xbe\x955\xc6>7\x16\xe4\xbd\xabC\xe5\xbdf\x9e\x13<K\xca\x81\xbe\xc0B\xf8\xb9)r$?\xfe\xe5e=V0t\xbb\xcej\xcf\xbe\xfe\xa9\xc2\xbeO\xe9\x03\xbeCn\x13>v\x04\xbf>i\x84\x94=\xfalJ\xbe:&\xdc\xbdy!\x85>=s\n\xbdK:`>\xea\x11B=NO\xb2>\xbau\x7f\xbe\xa9\xbdJ>\x0c\x19\xe3\xbb,\x1bR>4\x0c\x84>\xfe\xb1\xc5>\x88\xaf\xd9>:\xafR>\x88.\xec=\x0e\xbc\x88=w\x81H>'
-p937
-tp938
-bsV580381850104889344
-p939
-g2
-(g3
-(I0
-tp940
-g5
-tp941
-Rp942
-(I1
-(I200
-tp943
-g12
-I00
-S'\xa3\xd5o\xbc\x82\x8b\x96\xbd.G\xcd\xbe\x98.\xd1>\xc8rx=f\xd3\'>P\x88\xd1\xbe\x1e\x8a\xde\xbdAp\x01\xbdQ\x92\xae>\xaa\x1cA=\xb61\x1c\xbf\xb2\xf04>\xd6U\xf9=\xe3\x02\xa9\xbc \x97\x92>F\xb5\xa6\xbd\xc2\xef\xbb\xbe\x82\xfa\x17>[\x82C>\xce\x7f\x1d\xbfal\xb5\xbd\xebV\xc8=0#\x02\xbe\x06K\x1a\xbe\xa3\x89\xbd\xbb~\xd4\x02=i\xe3\xb1\xbd\x12\x87\t\xbf4\xfc*\xbeD\xdf\xca\xbe\n\x01V\xbe\x0c\xdd\xb2>\xe9\xc9\xc9\xbe\xd7\x13@=/\xbcC?\xd5\xe8\xc7\xbe\xe4\x9c\x97=3\x06a>|\x81\x0e?\xd4t\t>\x08\x8d\xfa>#LV>qW\x02\xbf\x1f\xfd\x8b\xbe*C<\xbc\xe2\xff\xb6>:\xf4\x9d>\x04!\x0b>\x8e\xbf\xd1>\xea)\xa3\xbd\x03\xc9\n?\x02(\x9d\xbe.\r\x83\xbe\xf4\x9d\x1c\xbf>\xa3\xcd>n?}\xbe\x06\x02c\xbe\xe2E\xec\xbe\xe0W\xd9\xbe+\xe3\xd4>6\xbc\x98\xbd\xbe\xdd5\xbeZ\xb54\xbf?{\xa2\xbe\x02\xa5\xe8>E\xc1\xc9\xbev\xaf6\xbe\x88w\xdc\xbe\x0e\xda\xe0\xbe\'\x88\x14\xbf\xf1S\x14\xbfF\x0b\x00\xbe\x86\xd6}\xbeHo\xd4\xbe\x16\xb4\x07?\x9b\xa9\x01?\x17\xf0\'>\xaa\xe0\xc1>\xce[\xd2=\xb4\xe16\xbe\xae\x8a\xdf\xb9\x0e\xad\'?\x104\xb1\xbe\xe6\xc9\xc3=J\xea\xa1> \xc1\xcf\xbc\xa8\xce\x1d\xbf\x82\x14\x0f?\xe5\xd4\x98>j\xebD\xba\x19\xc0\x13\xbdc4V>\x87)\x8b=\x84\xc7\x8b=\xea2\x84\xbeS\x83\x14>>KO=\xb4\xe8\xb8>\x8a\x8d\\>a^#\xbdK\xb0\xcb>\xb8\x88d>K&p>\xa8\x0b\x9a?C\xe5\xc3\xbe\x86qh\xbe\'\x94\xa2\xbc\r\x8b\x0e?a\xd7\n\xbe\xee\x86\xa5=\x1d\x15\x11?\xe3\x1a1>+s\xd7>\xecn\xc7=\xc2-c>\xe0\xc9\xeb\xbe\xc6`\x91>\x13\xfcm=\xab\xb6\x10>\xbf\x1fB?*s|\xbetE\r\xbe\xc0\x0b\xc8\xbe\xa9\x08\x0e\xbfa\xb9\x8a>\xde\x94\xa2\xbcA\xdd3\xbe\x1e\x90\x08>\x97\x1c\x01?c\x8eb\xbe\x82\xd1N\xbef\xb9\xd3\xbd\xbe\xac\t>\xc2e\x04\xbf\x93\xa8\x18>\x96\xb5\xe4<\xa8R\x08\xbe\xf2z\xce=2$\x18?\xf3U\xfb\xbeW\xfb\x0b?ir\x1c\xbergx\xbe\x82=\xf9>2\x11\xd7=\xe1\x94\n?\x96@\x07?\x92H;\xbe\xb5\x9bU\xbe\x16\xe4\x93\xbe\xf3\xeb\xbb\xbe\x96\xa1%?\xe6\xd3Y?\xa6J$\xbe~\x19\xc9>\x9d\x11L\xben\t\x00=\xe5\xb2\xc9=kP8\xbf\xee\x17\x12?\xbef\x9a\xbe\xca\xdc\x14\xbf\n3\xc2\xben\xf2\x83\xbe*\xc1\xba\xbe\xde\x01\xd6\xbe\xf2s\x1a?B\t\x92\xbe\x93\x92\xd1\xber\xca\x95\xbe\x9e\xa24\xbf36X\xbe\x18Y ?\xe8\x04$\xbe1N>=5\x07[\xbfM\xca\xed\xbe\x03SJ\xbf2bO=m\xb0\xfc>\x17?$>J\x1e\xba\xbe\xb2\x9f\xb4\xbeT\xcc\x15?\xaf?$>r\x1e\xaa\xbd\xf3;\x89\xbc\x19P=?r\xf6"\xbfh\xf7\x01>\x18\x83\xfb\xbe\xd5G\xcd>\xc0w\xd4>\xdd0\xfc>\xe4k8?K>R?\xb3\xf5A>+\'\xdb>v\xd8\x96\xbd'
-p944
-tp945
-bsV580922170408333312
-p946
-g2
-(g3
-(I0
-tp947
-g5
-tp948
-Rp949
-(I1
-(I200
-tp950
-g12
-I00
-S'\xc8\x10\xc8>\xdc\xa1/\xbe\x05U:\xbfd\x03\x06>\x8b\xa6\xce>tk\x93\xbe(qa\xbe\xd1\xa6\x85\xbej\x8e?=\x9e\'\x83>Z\xf3\xe4=\x1d2\x8a<%C\xca=\x8a\xac\x1c\xbd}\t9\xbe\x80\x0c\xdb>\x1d\x95==R\x11\xeb\xbdew+\xbei\x96*=\x8b\x17\xeb\xbe\x88j\x1d\xbd\xa6;M>\xf0\x05\x06\xbf\xc3\x16U\xbe\x9bzE\xbe`:\xbc>\x10Y\xa5\xbe\x00\xba\xe3\xbeV\xa2\xda=\xd2\xfa\xed;c\x02O\xbe\xa3<R>\x83\x19\xea\xbe\x82\xdd\x0f\xbey\xe1\x1d?M\x1eQ=\xab\xfe\xf4=\xf2\xaf\r?\x7f\x18@>FC+\xbe\xdf\x0c\t> =|>\xb6\xbf\xba\xbe\x14\x90\xb0\xbe\xf2\x1f\x9e\xbd \xa1*?!\xa3\x11="\xfc">\x1b\\ ?U\x15\xdd=\xf4x(?\xed\x04\xc2\xbe\x83k\xf6\xbd\xe3\x1f\x14\xbf\xeb4\xf2>\xc3B\xf1=N\xfb\x90\xbe(\xc7\r\xbf\x02a\x13\xbf\r{\xd6>\xber\x19>\xecH\x97\xbd\xb6\xcd\xc1\xbe;\xb7\x02<&u\xe4>\x0e\x04\xa0\xbe\x80]\x15>\xcc\xee0\xbf\xc3T2\xbe\xc0\xfcb\xbf\xea\x17\x05\xbf\x1a$\xac\xbbN]n\xbe2;\xc2\xbeQn\xb5>\xbb\xf3\t?`,W>\xd2\xc9\x81>\x85\x99\x91>R4S\xbe\xf7(\x0e=\xcde\xe8>\xb2[\xa4\xbe\xec\x9e.>*\x1f\t>j\x9bS>(\xfb\x19\xbf\xa4\x10J?~Bp>\xaa\'+\xbeHz\xb3>\xb6\xc7\xbc\xbe\xb5@P>\xe53\xc2>\xcbt\x8d\xbc\xaa\xca\x91>\x9ex\xc0>\x0f\x17\xb7>\xdb\xe1-=c\xc8\xe0<\x8c\x0c$?\x1b{=>\xcb\x01J>u\xc2\x1e?\x02\x8b\r\xbf\x1e\xf5\xde\xbc\xb2e >\x00VN>;\xb4\x08\xbd=\xf3\x1f\xbe?D\x85>\x02\x1b&>\xaa[\xaa>H2F>a\xe4\xc9=@\xec"\xbf^(\xd1>J[o\xbd\xfe\x0e\xc3=\x83\x9aT?\x16\xa2\x14>\xad!\'\xbe\xe6z\x18\xbe\xd5\xfe\x02\xbeVz\xeb>^\x05K\xbe\xa2\xd0\xa4\xbdG\x04\x85\xbcj\xc43>(\x0e\xf3=\xea\x866>p\xf7\xa9=(L2\xbc[\x92"\xbd\xe2C\x85>\xde\xef%\xbdK\x83\xba<]\xd4\xb5\xbcX\xc8\x8d>\xe9X\xa7\xbe\x06\x84\xf4>V\x10\xad\xbdx&\x15\xbfN\xe2\xc1>\xa5\xac\xa6\xbd\x80\x0e\xf7>\xb7:\x1d?\xd9\xf7\x8e\xbe\x00\x8fc\xbc\x149\x83\xbd6\xc4r\xbe\x1e-\xb5>\x07\xad\x0b?&\x92\x97;\xc2\xaa<?S\xa6\x17\xbeBG\xc8=\x8e\xed4>\x1e\xa4\xbe\xbez\x05\x96>\xc9\xfd\xa6\xbe\xc2\xb2\xfd\xbeU\xb5\xc5\xbe\x1d\xdfa\xbeZ\xffD\xbeV4G\xbf\xf0\xbb\xfd>\xb5\xf8\xe4\xbd-dE=J\xf6-=\x90J\xb5\xbe@\x1a\xbe;\xcezb?\x03\xfb\xe5=\x03X\xce=\xf5#\xfe\xbe\xd3\x08\xfe\xbeq\x07J\xbe\xc5\xa6E>\xbe\x0c\xfa>\xd0\xb7\xfd=e\x9b\x99\xbe\xe6gu\xbe\x84p\xaf>6\xd5\xf4\xbd\xc4\xaf\xb0>\xc8k\xd0=0\x8e\xf0>\xdb\x87P\xbe2uT>\xbbO\x8b=h9\xa6>\xcdKq>\xd05\xe3>\xa8l\x19?\xd6\x06\x8b>\xb35\xfc=w\x04\xba=\xe5\xe5"='
-p951
-tp952
-bsV577716323150598144
-p953
-g2
-(g3
-(I0
-tp954
-g5
-tp955
-Rp956
-(I1
-(I200
-tp957
-g12
-I00
-S'\xc0\xe7\xc4=U\xbf\xd1\xbd\x7f\xbb\xcd\xbe>*\x8e>=\x05\x1b>\x89\xa0\x98=Qe\x9e\xbe\x9b\xdc\x13\xbe\x01\xfbQ\xbd?K\x89> G\xbf=J(\xbd\xbe\xf9\x0bK>SM\x02>\xae\xf2\x97\xbd\\\x05\xa4>$\xdbK\xbd\xae\xf0\x80\xbe\x07\x1eU=\x1e:\r>\xa8w\xf8\xbeT\xa4\x85\xbdwK\xe5=zE]\xbe\xa8\x94\x17\xbe3&$\xbd\x08r\x95=\x9ah3\xbe\xdf\xca\xea\xbe\xa4\xb5\xb3\xbcp\xb1\x8d\xbe\x85\xdcG\xbe\xd8\xa8\x99>\xeb\x95\xaa\xbe\xb2\xfc5=\x17\x96\x18?\xd9\xd3d\xbe\x8eB\x90=K@\x80> \x19\xd5>\xc7d\xd4=\xf7I\xa5>\x1f\x9ag>\xd2\t\xe9\xbe\x105U\xbeD\xda\xb1\xb9}\xc9\xd0>}\xd6O>H`\xd1=\x1d\xda\xc8>\xa8\x9fr\xbc\xed\xdc\x02?\x98{\x87\xbe\r\x13/\xbe\xfa\xaf\x10\xbfB\xf4\xbc>r\xac2\xbe\xc8\xcdN\xbe\x98\xca\xe8\xbe{_\xda\xbe\xcb\x84\xb8>B\xa14\xbd\xaa\xf9\x10\xbe\x88\xaa\x0f\xbf$\x94y\xbe|\n\xcc>\x03\xc9\xa9\xbe\xb4\xac\x92\xbd\x08\xb4\xcd\xbeR\xdc\xa8\xbe\xd0\xc9\x15\xbf\xb8\x1c\xed\xbe\\\xb6\x81\xbd\xf2x^\xbe\xe6_\xa4\xbe\xb9\x02\xed>\xf6\x0b\xd9>\xe2x.>\x806\x83>\xd7:\r>M\x92&\xbeb_\xb4;\xce\xc6\n?\x00p\x95\xbe\xe8\xe8\x0c>\xf3B\x85>t\xfa\xd1=\xb6\xbd\x07\xbf{\x0b\n?"k\x88>x\x84X\xbdFI\x01=\xa3\x14\xd2<\x0c\x0b\xc0=\x8994>\xd6\xf04\xbew\x0f\x01>\xc3`\x08>\xc7\xd0\x97>\xdbv\x17>bI\x00<\t\x1e\xc0>\xd8\x0cE>nAM>bEt?\xcc\x06\xa5\xbe\xd1\x9c\xfe\xbd\xfc\t\xc5\xbc\xe5s\xc8>\x05z\xbe\xbd\x12\xe0}==\x0e\xfb>=\xee\x08>\x99\xdb\xa2>\xfb\x1d\x19=\xd2\xf2)>^.\xcc\xbel\x8d\x97>{9\xa7=UW\x0e>\xe6\x1a0?88\x0e\xbe\xc9\xb6\xa3\xbd\x8dU\x8e\xbe\x9d\xd4\xbb\xbe\xc3_\x87>\xe3\x11\x85\xbd\xe5\x8a\xfb\xbd(:\xae=\xa6\xd9\xbd>\x1a\xdb\x0b\xbe]\'\xea\xbd\x18\xbb\x1b\xbd\x14h\xba=o\xde\x95\xbe\xa4\xaa\x10>T\xaf\xde<Q\x83\xa4\xbd{s\xf6=g\xcb\xd8>\x83\t\xbd\xbe\xf6\xff\xfb>H\x90\xd7\xbd,uw\xbe\x9a\x14\xc6>\xa7Z\xe5<\xe3\x85\xde>\xa9<\xd7>\xda\x80L\xbe\xcd\xd9\r\xbeZMP\xbe\x8e\xba\x9d\xbe\xe2\x05\xfa>\xdb0$?G\xb1\xb1\xbd\x91\x8e\xbb>UH\x16\xbe\nYe=\t\xe1\xaa=\xbf,\x0e\xbf\xacv\xf1>\x93\x7f\x84\xbe)t\xef\xbe{\xa6\x8b\xbeL_J\xbe\\&\x8e\xbe\xd3l\xd4\xbek\x13\x05?\xf4\x7f\x81\xbe\x12\x18\x9e\xbe$\xd53\xbe\xe6"\x06\xbf\xb0D\xda\xbdv\xf9\x1c?`\xc4\x93\xbd\x90\xa2\xe7:\x9eX*\xbf I\xcb\xbeQ\x04\x06\xbf\x06\x89\xb3=\x116\xe5>\x0fD\x0b>\x93\x96\x8f\xbe\x93\x1cy\xbe\xf0\xb9\xe5>\x86\x80\xc0=Q"\xb9<\x82\xdd\xe6;2\xfc\x14?f\x02\xfd\xbe\xf6\xe1\x1f>B\xf6\xa2\xbe\xc2W\x9c>*9\xb1>D\xcf\xdb>x\x01\x16?\xfb\x89\x19?\x9d\x9c6>0\xb8\x98>w\x1d2='
-p958
-tp959
-bsV580674695416156161
-p960
-g2
-(g3
-(I0
-tp961
-g5
-tp962
-Rp963
-(I1
-(I200
-tp964
-g12
-I00
-S"\x0f\xed\xe4=)\x9ca\xbd\xa3\xa0\x9a\xbe\x17\x1b&>lw\x00>9\xc2b=\xa6\xecD\xbe\xad\xd8\xfe\xbd;f\x16\xbd\x93\na>\x92g =S}\x81\xbeCP\x0c>2\xa7\x8b=\x17?c\xbdA\xe2x>j\x9fU\xbd<S8\xbewM\xac;\xab\xa3\x89=\x1f\x9e\xae\xbe+\xe0\x18\xbd9\x16\xae=\x85\x93\x08\xbe\x9d\x9b\xa6\xbd\x0f\xfa@\xbd9\x89\xa5=w\xf7\xfe\xbd\x97\xc2\xa7\xbe;`\x05\xbd\xf7)8\xbe\x94p\xf8\xbdU\x8eB>\xa9\x98\x89\xbe\x1f>\x0b=\xd2W\xd6>\xe9\xdb\xe2\xbd\xbe\xd4\x8e=bVO>\x1c\x1c\x88>W\xda\x1b=\x1f3E>q\xd0,>\x7f\xd7\x99\xbe?\t\x1d\xbeN\x8b\x05\xbc\xcd_\x98>\x12\xda\x0b>=\xcd\x8f=^\x90\xa3>\x0fK\xa3\xbc\x96%\xc0>\x810A\xbe\x8a\x18\xcc\xbd\xb4j\xd6\xbe\xfe\xb5~>_\x93\xd3\xbd\x0e<\x05\xbe\xa9\xc0\xc0\xbe\xac\xf9\xa8\xbe\xba\xad\x86>\xbbc\x9c<\x1ah\x92\xbd\x8b\x10\xc3\xbe\xabQ\x19\xbeM7\x8a>z3{\xbe\xab\x18C;\xa9\x13\x84\xbez8f\xbe\xec'\xd8\xbe|-\xb0\xbevA@\xbd\xcc\x01\x15\xbeM\x0fd\xbe\xb9\xff\x95>?\x00\x94>\xe4\x9e\xff=\xb6#E>\x86\xbd\xee=\xedJ\xd0\xbd\x82\xee\x18;pk\xc8>\xbb\xb1b\xbe\xcf^\xda=\xee\xea/>\xa0\xb2\xb1=\x83\xf4\xbe\xbe\xeb\xf6\xcd>\xda3*>\xd1\x9b|\xbd\xb9H\x06=qR\xd8\xbb\xd6\xf8,=/\xae\x18>. \xe3\xbd\x05\xf2\xf6=@\xa9\x01>\xb5\xd2X>M\n\x8a=\xaf\xfbl;iz\x89>\xa6\xe2\x0c>\xe4\x10\x15>\x8d\x06(?\x8dfy\xbe,\x89\x9c\xbd \xb3\x81<\xe9p~>\r\xf6v\xbd\xd6\x91\x05\xbcA?\xa4>O\xfb\xde=I.k>j\xc0\x0e=I\xd6\xd8=/\x81\x9a\xbe!Hc>o\xca-=\x19\xe8\xba=q\x98\xfe>\xa9\xbe\x91\xbd\xe2~j\xbd\x1aX7\xbe\xb7\x7fv\xbe\xed2K>O\x8cc\xbd\x86\xc1\x91\xbd\xaf\xa5}=\x80\xcfy>\x8f;\xa7\xbd\x0e\xc5z\xbdin\x92\xbc\x95\xa1~=k\xc8<\xbe\xfbF\xc9=oH@\xba~dX\xbdE\xfcK=\x00\xc0\x8b>G\xe7\x83\xbe\x96\xe3\xaf>t\xb9K\xbd[\xb8N\xbe\xd0W\x9b>Z,.=\x0e]\x97>\x1e\xc7\xa9>\x06;\x11\xbe\xf6\xb3\xb3\xbd\x03f\x15\xbe\xaakd\xbe\xcf\xfd\xb3>\x03\xe6\xe1>\xd0U\x8c\xbd\x16\xd9\x8d>\x16}\xfa\xbd`g`=\xff[q=@\xf4\xcc\xbeED\x8d>\x82\x0bS\xbeL:\xba\xbev\xd9a\xbe\xb5A\xf6\xbd\x89\xeeB\xbe@v\xa6\xbe\x07{\xb6>\xa7\x9a\x16\xbe\xc1\xffQ\xbe\x0c\xb0\xe4\xbd\x8b\xb4\xb9\xbe\xeb\x16\xc2\xbd\xf0\x7f\xe6>\x86\xb70\xbd\xbbyV<\x89\x93\xf5\xbe-\xbe\xa0\xbe\xcd\x83\xa4\xbe\xad\x16\x82=\x81\x01\xa5>\xc1\xf6\xbe=\x17r_\xbe\x0b\x855\xbem\x93\xad>zZe=\xc6J\xee<`\xa3\x92<4-\xce>\xe4\x8f\xa9\xbe\xfc~\xf9=\xc0\xb2G\xbe\xc6z^>\xf9\xday>\xc2\x80\xaf>\x8e\x87\xda>;r\xbf>\xcf\xe6\xd9=\x03<O>\x11\xef\x12="
-p965
-tp966
-bsV580713693882793984
-p967
-g2
-(g3
-(I0
-tp968
-g5
-tp969
-Rp970
-(I1
-(I200
-tp971
-g12
-I00
-S'6\xf7\x9d=\xb6\xad3\xbd\xa9S\xc4\xbedu\x8d>\xcf\xe0\xe3=\x90p\xfa=n\x08\x9b\xbe\xff\x8b\xf3\xbd\xaa7\x14\xbd\xa4\x81\x9b>\xfer%=w\xaa\xe5\xbe2\x1a(>\x94\xd0\xb9=\xea\x8a*\xbdQd\x91>\xde\xab\x9c\xbd\x97\xa0\x9a\xbe\x02V\x82=\x8bf\x06>\xb6\xb3\xfd\xbee\x11^\xbd\xb7\xe9\xbf=_\x81\xf3\xbd\xf6\xec\xe4\xbdA\x82\x0e\xbd\xb7\xee\x80=\xd4\x03\xef\xbdI\xa8\xe2\xbe\x01\xd4\xf1\xbd\xdf@\x94\xbe\xb04%\xbe\xc8\xa5\x8c>\x92\xc7\xb8\xbeV\x9fE=\'\xb1\x1b?\x8e@u\xbe\xda\x81\xbe=\xdb\xd7_>\x94F\xd7>\xc5\xae\xa6=wN\xb5>\x1a\xf4M>\xb2O\xd8\xbe7\xc0`\xbe9"\x0c;\\K\xb2>z\xbe^>\xf0\xbd\xbf=\xd5\xb4\xcb>\x86\xe8o\xbd\xaf<\xfb>T\xde\x89\xbeo4)\xbeuR\r\xbf\x8b\x07\xa9>\xa1\x900\xbe>\xd85\xbeY\xd4\xeb\xbe\xcf\xde\xd0\xbe\xb2\xc0\xbb>\x8b\xcaA\xbc\x89\xc1\xfc\xbd\xaa\xce\r\xbf|mm\xbe\xf0\xe1\xbf>\x12\xe0\xad\xbe4\x92k\xbd<\x02\xb1\xbe*\x1f\xb0\xbenC\x04\xbfay\xf4\xbe^;\xcc\xbd\xdbkK\xbe\x92\x11\xb0\xbe0\x1e\xd2>\xa0\xc1\xcc>w\x1b!>\xe1\xfd\x95>\xaa\x06\xe2=\xd1\xa4\x13\xbe\xc0\xeb)\xbci\x1f\n?\xb2|\x9b\xbe\xf7B\xe2=\xe6\x9b\x81>\xa6\xff;=,\x11\x01\xbf\xdc \x01?\xb4~x>\xfe%\'\xbdTp\xf1:i\xc9\xac=\xd4\xd9C=%\xee\xfa=\xd6\xb4<\xbe\x83p\x0b>\x1ef\xd1=\xd0-\x93>\xf6>\x01>\x84r\xc3\xbc\xaeG\xb1>\xc9-9>\x97]J>\x95\x01w?\xa0n\xa6\xbe^Q\x13\xbe\x85\x14P<f\x85\xcd>\xb5\xe4\xdd\xbdv\xccY; \x80\xe6>\xf5P\x1a>\x15I\xae>\x8f\x9b\x92=\xe6\xd9\x1c>\x04\xce\xcb\xbe\x17\x0e\x89>\x90W;=\xaeq\xf8=\x8a\xff%?\x96\x8f(\xbe\x97w\xda\xbd\xd4\x7f\x8e\xbe\xa7\x00\xce\xbe\xf2\xf5\x7f>\x90^?\xbd\xea|\xd4\xbdb\t\xc0=\xa1\xed\xbb>\x00\x93\x19\xbenC\x07\xbe\x0eJ\x89\xbd\xe6\x18\xc9=\xfeA\xb9\xbeps\xf3=V\xf7@<\xa7\xda\xb8\xbd\x9e\x81\x86=r\x06\xdd>\xd0\xb6\xbe\xbe\xe7\x97\xe8>\xce\xc3\xbc\xbd\x01\xc6l\xbe\x7f\xdb\xdd>\xbc6\xcf=\xb5\xbd\xd8>n\xb6\xe5>2\x840\xbe\xb1\x9a(\xbe\x853\\\xbe\x12\x07\x9b\xbe\x17v\x02?\xffC\'?PO\xfe\xbdW\x89\xb5>d3/\xbepa?=LD\xb3=~R\x17\xbf\xb6\x00\xda>Ge\x86\xbeB\xd6\xfa\xbe.9\xaa\xbe\xda\xe39\xbe\xce\xa0\x99\xbe\x9bN\xc9\xbe\xa1\x9f\xff>d\xf9R\xbe\xfc\xcb\x9e\xbe\xe7IV\xbe\x0fV\n\xbfFF4\xbe\xdb\x82\x15?y\x80\xc8\xbd\xd4\xb1\x1f=6\x992\xbfKC\xdc\xbe\x06M\x0f\xbfb\xf2\x87=\xe0T\xd9>\xb9\x82\xfd=\xf5\xda\x9a\xbe\xc6\x1e\x91\xbef\xc9\xf8>V#\xce=iJ\xe3\xbc\xcb;\xc6\xbb1\xa2\x16?\x8e\x0e\xfe\xbe\x00\xaa\x02>0\xd4\xb4\xbej\xb8\xa8>p\xac\xb6>\x9f;\xe5>\xd1\xc2\x1c?\xac\'\x17?^\r\x19>w\xc3\xa2>;c\xb0\xba'
-p972
-tp973
-bsV578790819475296257
-p974
-g2
-(g3
-(I0
-tp975
-g5
-tp976
-Rp977
-(I1
-(I200
-tp978
-g12
-I00
-S'\xba\xbc\r>5\xc8\xa0\xbc\xb8\xf1A\xbe4u\x0b=\xbd\x7f\xea=\x7fmD\xbcy\x85w\xbd}\xec\xd5\xbd\xf7\xe6\x12\xbd\xb8q\xd5=\xb3\x02\xe9<\xc9\xdca\xbd\xcd\x9e\xab=\xa2%1=_\x80T\xbd\x81=)>\x93\xc0\xe4\xbc\xbd^\x81\xbd\xe9\xabT\xbd\x02\x14\xa7;ut\x13\xbe(\x0c\xff\xbb\xd6Lz=\xcf@\xc6\xbd\xb0\xbc\xd5\xbcC\xc0N\xbdiQ\x9a=8\x98\xd2\xbd\xd1\xcd\x1b\xbeWU\xf9<\xef\xa4\x83\xbd\xfbFr\xbd\xbf\x13\xa4=\x90\xa1\x19\xbe\x82O\xc7<[67>VY\x9b<A?\x83=Hx\x19>\xb1\xa2\xa8=\xe94\x08\xbc\xdf\x85\xcc<\x87\x85\xd6=\x17\xe1\x14\xbes\xee\x92\xbd\x01(\n\xbc\t\xcaA>\x00\xa5"=r8\xe1<\xa2pO>hr\xcf:\x06TV>\xa2\x1e\xb4\xbd\xe3\x8fR\xbcG\xedl\xbe\xa8\x06\xe7=\x063\xc4\xbc\xf1\x85\x80\xbdU\xc8|\xbe\x02\x11V\xbe P\xf6=\xe7\xd6R=7\xcb\xb5\xbb\x81s!\xbes\x828\xbd\xbd?\xfd=\xc0\x9d\xee\xbdf\xb3\x83=\xb6W\xee\xbd5\xcd\xb2\xbd\x06\xb3\x87\xbe\xa5+)\xbe\xf65\x93\xbc\xfc\x8c\x87\xbdc\x1e\xb7\xbd%\x9d\xff=\xbb\xdf\xf7=\x92 \x96=\x8d\x0f\xaf=:E\xc4=5\x87D\xbd\xe0$\xa9;S\xd9;>\x8f\x93\xf3\xbdPl\xad=\xca\xb8\x9f=N\\\xe8="\x86=\xbeV\xc3y>(\xe8f=\x0b\xd1\x90\xbd\n\xffS=\x027\xbf\xbdC3_<\xeb\x96\x08>_\xe05\xbcn\x19\xbb=\x19l\xf5=\x07\xd3\xb8=\x11e\x82\xbc\x1a2\xdb<\x08\xbc">2q\x95=%/\xa2=\xaf\x98\x95>\x01:\x01\xbe\xbe\xfa\x15\xbc\x8c\xc7\t=\xa3\x12\x90=\xa9\xfb\t\xbc\x88\x0b(\xbd\xdeG\x19>~\\\x95=\x1a\x8a\xc9=\x1a#^:\x0f\x97\xfd<\xc77(\xbe\xa1\xac\x14>\xe6.\xed<M\x9a_=\x91\xa6\x89>\'\xfc\xb1<\x86\xff\x94\xbcA_E\xbd\xc9\xf7\x7f\xbds\x97\xe5=B\xf8v\xbdy\xe4\xc6\xbbi\xae\xd0<\xc0[\xbc=G\xb2\x99\xbb\xdeX\x99<\xc1\x89\xb5<\x1f\xb6\xb1<C\xf2\xff\xbbx5D=\x8a\xa6\x90\xbc\xe0G\x83\xbc)\xb74<.\xe1\xa9=\xd7\xf1\xe7\xbd\xcb\x9f4>\x00\xcb\xb8\xbbf(\x0b\xbe#\xd7\x1d>\x13]\x9f;1\x02\xf1=\x92\x9e2>q/\xa0\xbd=]\x85\xbc+\xd2\x1d\xbd#\x81\xd4\xbd\xd6\xf4">`\xe0.>9\xb6\x01\xbc+\xd7,>\xc9\xaa|\xbd\x0e\xc1P="u\x18=\xde\x9c*\xbe\xedP\xb5=:\xf2\xfd\xbd\x11\xe4A\xbe\x16\x17\xd5\xbd\x10s\x15\xbd\x1e\t\x92\xbd\xc5 A\xbe\xda\x8f*>50$\xbdq\x05\x9d\xbdWD\xbb\xbc\xd6t\x18\xbe\xf5\xdc\x02\xbd9\xa7~>9\xf9L;FA;;\xdez_\xbeN\xae=\xbe\xfa\x0bU\xbd\x11\x07R=\x1e!3>y:\x06=\xfd\xe7\xd6\xbd6\xa8X\xbde\r">\xb0\x1en<\xf9\xe0\x86=SE\xa2<\x1a\xc20>\xd5R\x0b\xbe\x83b\xc8=?S\xe4\xbcz"\xae=L\xb0\x06>\xc6\x91P>huN>\xb2/\xd6=>eP=\xae\x1f\x82=\xdb\xb3f='
-p979
-tp980
-bsV580977217964019712
-p981
-g2
-(g3
-(I0
-tp982
-g5
-tp983
-Rp984
-(I1
-(I200
-tp985
-g12
-I00
-S'q\x00\x86>\xae\xc9q\xbb\xfa\xc4\xd1\xbe\xc8D\r\xbci\xd3y>\x87\x971\xbe\xd2\xf7\x8e\xbcx(L\xbe\x8cw\x8d\xbd\x17\xf0\xb5=\x0bm\x87=\xe9\xcbw=e=\xa1=\xc7\x04S=\x99\x02:\xbeu\xebF>[\x14K<\x93#\x02\xbd\x89=0\xbe\tH\x13\xbcI\x9e\n\xbeQa\xaa<\xd5\xb0\xe3=M\xael\xbe\xbb\xaem\xbc\t\xb6\x01\xbe\xaa\x0eR>\xd3\xd2\x0b\xbe\x12c\x02\xbeE\xdb\x9c=h\xbe\x9a\xbc\x07\r\xbf\xbd\x8br\xf1=\xfd\x1c\x80\xbe\xa0\x01\xd1\xbd\x0b\x7fn>3\x86\xbb=\x93\x1f)>\x07\x14\xa3>\x850\xdc<\xd8|\x84\xbd\xdb[\\:\xd8\xec\x07>W\x0e%\xbe\x0e\xa9\xf5\xbd\x9d\xbb\x98\xbd\x8d\xf6\x8d>\xe1\x18\xcf\xbc9T\xf4<\x92\x89\xad>\xfb\xb9#=\x8d|\xa1>\xce\x95\xed\xbd\xb3\x1c\x10<\x954\x80\xbe\x12\x89\xf8=\xcf\x90\x9b=\xd0&\x18\xbe]\x17\x97\xbe\xb2\xda\x97\xbe\xf0\xc9#>\xeb\x05e=\xd3y\x02\xbd\x12\x9a\x03\xbe"\x7f\xa4=)\x84\x1e>\x83\xed.\xbev\xaa\xc8=k\xf7\x95\xbe\xb9`\xeb\xbb\xa6\xab\xf3\xbe\xa5\xa0@\xbe\x007\xd0<\x1d\x90\x88\xbdg\x08"\xbe9V\xce=z\xb2V>\xfdc\xb9=\xfbE\x00>\xa9\xc7.>\xbf\x81\xae\xbd\xb9\x1a\'=\xc1\x15D>rm\x0e\xbe2\xe9\x04>\x19\xf4\x93=\xa2\x1f\'>N^\xb1\xbe\x0e\xc0\xc9>0\x9e\x01<\x0e\xf4\x1d\xbe\xd7\xe1\xe1=G%\xad\xbe\xa9\xb8y=\xb7\x0bn>G\xc4,>\xda\x18)>\x00R]>.U\xa7=(|\xbc\xbd\xc7\x0e\xe3=`\xa8\xbb>Wqh=\x05\x16\xc9=\xb5E8>\xe8e\x87\xbe\xce]i<\xf6!\xa4=5S\xe6<\xfd1\xbb=\xe5W\xc8\xbd\x91R\x19>u\xda\x08>\xfdG\xee=r\x87_=\xc8\x18\xc4\xbcEY\xa4\xbe\x07\x0c\x8b>\xa7\xe0\x81\xbdjw\xbc=\xc7\x87\xbe>\xc9\x12\xe5=\xd6#\x98\xbd2\xa2\xdd<\xd0\xe7\xcc\xbc\x80&<>\xe7\xf1$\xbe\xee~3\xbc\xabQ\xc5<\x02n\x0b=F\x96\xd6=\xa0\xddB>\xb2S\x88=M\x95#=U\xce\xf4=\x81\xf5\xde=\x90&\xfc\xbd\x072d<\x02\x1d\xa4\xbc\xb2\x91\xdf=2s\xf7\xbdKlS>\xfb\xb8\xee\xbd\xa9\x1a\x99\xbe\x85\xe2;>\xef%\\\xbd\xa6*(>\x88R\xaa>f\x07\x98\xbdz\xd3\xd5<&l\xa5=}\x8f\xf2\xbd\x02\xa7d>\x89\x1fK>\xe1\r\x87=\xbeP\xcc>\x9f"a\xbd\xf1\xd5\xb3=y&\xf6=\x10\xfb\xb6\xbd1iY=\x89\xe9K\xbeJY`\xbe\xc5\xdaQ\xbe\xf2\xef\xc7\xbcHh\xba\xbd\x8f\xc1\xb3\xbe\x0b43>\x87\xbf\x99=\xb93\xfd=~s\x88=lR\n\xbeDU\x8a=\x91\x06\xbd>\xddtO=?\xd0\x88=\x0e9k\xbe\x02\xd0\x9d\xbe\xab=3=Kv\x9d=\xe3\xa8\x95>\n\xb5\xcf<\xf04\xcc\xbdot\x89\xbceg\x06>\xba\x03\x0f\xbd)~;>9e\xd3;\x83\x0bB>\x11m\xc0\xbcg\xdf:>\xee\xff\xf8=\xdf\xe8\x00>\xe6U:>m\xa4\x90>\xde\xb5u>\xe0\xf7\xe9;\xc6\x93\x98=U\x19\x16\xbcR\xaa}='
-p986
-tp987
-bsV580896804507672576
-p988
-g2
-(g3
-(I0
-tp989
-g5
-tp990
-Rp991
-(I1
-(I200
-tp992
-g12
-I00
-S'3\xe2\xa3>\x06\x99!\xbe\x19T\x1c\xbf\x8cB\xf3=\xd5\xaf\xcc>`\xc1d\xbeF2`\xbe\xe5zk\xbemKh\xbd\xd2\xf6\x12>\x93\xc3C>\x97yU=O\x82c>\x87\xed\xbc=&zN\xbe\xfac\xce>k\xa1K=\xd8@\xb4\xbd\xca\x13\xdb\xbd\xca\xae\xfd=\xf9J\xe5\xbe\xbe\xf9i\xbde\x9d8>\x1aq\x15\xbf\x83\xfa<\xbe(\x17\x16\xbe{\x12p>t~\xd1\xbe.F\xbd\xbe\xb0!y>\x81\xf7\x85<\x93\x8cK\xbeH\xe5\x85>\x0c\x8d\xa5\xbeG\xe82\xbcDv\xe8>\xf5=\xfc\xbc\'\'#>\xe9[\xd8>\xfboU>\x02\x8a\x1c=\xfb\x0cj>P\xf7\xb0>\xd6f\xeb\xbe\xd5\xfa9\xbe\xeeS;=\xb3\xd1\x12?S@\x01\xbc\xe3?\x9a=r$\xf9>\xe2\x96\n>\x88;\x1f?A\xfa\xab\xbe\x94\xbb$\xbd\x17j\x16\xbf\xf1\x84\xe1>\xe1\xef\xab<7s\x88\xbe\x8fu\xef\xbe>\xd7\x08\xbf0\x89\xcc>c\'1\xbd\xcfI\'\xbe\x04\x1b\xd6\xbeX\'\xdd\xbd_\xa3\xdb>\xc7\xfcf\xbeH\x9b\x89=\x92\xe0\x1b\xbf\\\xf33\xbe%\xd1F\xbf\xb2\xe2\xce\xbe>\xa6\xd4<2%S\xbe\xa5\xc3\x9d\xbe\x95\x84\xe7>\xa0\xa0\xe9>\xa1\xb5?>vG\x02>\x1e<a>\xf3\xa5]\xbec\xdc\xd6\xbc \xb4\xb5>\x1c\x15\x88\xbe(\xbdK>\xd7\xb5_>\xbe!\xa8>\xb5G\x03\xbf+\xde0?\tq\x96>\nk\xd7\xbd\x17\xbcj>3\xa9\xab\xbe\xb3\x8cW>aE\xb7>\xc2\xbc\xe8\xbc\x10q\x07>8\xe3\xa1>2.~>|\x18\x90=\xdf\xab\xc9=G<\x05?\xc9\x93\x0f>\xe2\xe4.>\x08O.?\xa2\x08\xb7\xbe\x02\xe5\x87<"\x94\x02\xbc\x80`\x13>\xaa\xe1\x1f\xbd$\xef\r=T\xd8\xdc>\xb7S\xe7=\x87s{>\x12\xb9\xd4\xbci^\x94=\\\x92\xf0\xbe\xd7W\xcb>-\xde\xa8=\xf3\x9d4>dy@?\x1c\xce\xee\xba\x07j\xea\xbd\x08w\xac\xbd@\x99\x9f\xbdV\xe1\xb9>#\x0fN\xbe\x96\xa2\xae\xbb)\xa6\x1b\xbd\x7f\xd3\x1b>\x8f\xc4\x9c=\xe7\x9fg=\xeaM\x82=\x82\x8b\xa4<\x8b\xb9S=A\xd0C>r\xecU=L\xdb\xf5<fV\x18>\t\xbcv>r\x8ec\xbe\x19\xcd\xfa>\xc5\xdb\xde\xbdXo\xba\xbe\x0f\xf6\xa7>\x0c\xe0\xf6\xbd\xcc0\xcc>*\xc1\xa6>\xcd]\x83\xbeYa\x99\xbd.U\xd9\xbcC\xa3\x80\xbeZ\xcb\x8a>=R\xdc>\x06 \x90=\xe2\x9b\x02?K\xd3\x9a\xbd\n=\xc1=\x87o\n>X\x93\xaf\xbe6\xe0\xf0>\x9a\xb1t\xbe\xd6D\xaf\xbew\xb6a\xbe\xe8\xc30\xbe\x9d@}\xbe\xb7\xd7\x0b\xbf\xfe\xac\xf3>\xf4`4\xbe\x15\xd5\xf9\xbd\xd5\xb6\xbd<\x85\x80\x8e\xbe4\')=\x93\x8cJ?\xd5\x82\x9a=\xc2\t\xa5\xbc\x87\x85\xdd\xbe\xc8\xe4\xc8\xbe\xd0\x9a\x82\xbeA\xbf2>\x8d^\xd5>\xecn\xaa=\x1e\x05Q\xbe\x80L\x08\xbek\x1dw>,7\x85\xbd+\x1e\x91>\x04\x19B=4\xc2\xd4>\xde|\x9b\xbed`D>\xb4\x81\xac\xbcvf\x89>\xdd\xdd\x96>\xcf\x9a\xb8>\xe4\x93\xff>\xd2\xbc\x99>\xf5\x97\x19>\x9d\xc8C=.<\x81>'
-p993
-tp994
-bsV580338832693964800
-p995
-g2
-(g3
-(I0
-tp996
-g5
-tp997
-Rp998
-(I1
-(I200
-tp999
-g12
-I00
-S'\xec\x954>\xde\x87\x84\xbc\xb2B\xa7\xbe7{7>\xdc\x894>\xf0\x83\xfe\xbb\xa5K\x19\xbedxC\xbe\xd8\x9c\xf3\xbc\xc5\xfdB>\xe6V==4\xb7N\xbe\xb5a\xd7=\xd1\xc7\xcb=x\x1e"\xbdTg\x99>\x19%?\xbdE\xbe\x0c\xbeK\xe59\xbd\xcex\xb5:A\xfc\x89\xbe\xa6\xd0\x82\xbdIH\x11>.<\x04\xbe\xc9\xe6r\xbd\xf2\xe0j\xbd\xad\xf1\xbc=\x9a\x03\x14\xbe\xf9\xd3u\xbe\xf7\xcb\xe0\xbc \xbfR\xbe\x92\xec(\xbe\x9e\x18\x1f>! \x9e\xbeDs\xf4<\x9e\x8f\xcf>\xdb\xfdk\xbdj\xb0\x0f>\xe7)u>I\xd6I>;F!\xbd#J\xdd=v\x0b\x12>\x90ly\xbe\xda\xc6U\xbe\xa2!\xc6\xbc\x9e{\xa4>I8\x05>\xe4\xcc\xcb=\xc5C\xb2>\xb2!\xcc\xbc\x84\xf3\xbe>\xc0\xfc\x0f\xbe\xd2\xcf@\xbd\xe2\xf6\xc8\xbe\t\x1dL>i\xae\xcc\xbd\xda\xd23\xbe\xedR\xc2\xbej3\xba\xbe\xa3\x8e->\xd8BB=\x8d\xbf\x9d\xbci\xd1\xb8\xbe\xfb\xca\x9c\xbd\xa0\x1fn>Y\xc5X\xbe\xf6\x93\xe9<\xc0\xc4e\xbe5\xddn\xbe\x8c~\xf7\xbe\x05\xe7\xb6\xbev\xe2\x8f\xbdA\xe1\xf8\xbd\x90KP\xbe\x98\xd8e>\xa0Pp>\xa2%\x00>\xb6\x1ci>\x0e\xf7\x11>>\xbf\xa8\xbd\xff\xd1\x80=\x9c\x9f\xb5>\'\x04c\xbe\x98\x1c\x03>6\xa8\x1d>\xc9\x85#>\xb4W\xc9\xbe\xc5Y\xfd>\xa5\xe5\x83=\n\xce\xfa\xbdt\\\xa4=\x0c\xd1\xa3\xbd4\xda\x0f=:\xa6L>\xf4}\x93\xbd\xd6\xdeO>\x89\xa6\x1d>\xf9\x97k>\xfe|\x87\xbc(CJ<\xad?\x92>\xe4{\x13>\x1c\xee?>u\xf2"?\xca\xefr\xbeG\xda\xb7\xbdw;\x98=a\xb5[>\x8e/\xac\xbc\x9d\x12g\xbdr\xb3\x89>\x93j,>\x05\xceR>\x86q%=\x8eG\x9f=\xeb\x82\xa2\xbeA\xe1i>\xa29\x08=\x05\x00D=hn\x06?\xc6XW\xbb*\xb6\x84\xbd\r\xb5\r\xbePZh\xbeW\x9cJ>\x84\x07\x82\xbd\x12\xee\x91\xbc\x82E\xc0=RTz>^\x90\xc4\xbc\xe1-\xe8<\x02\x15"=\x94\x13K=\x0e\x16\xfd\xbd$,\xfd=\xa3d\xc0\xbc\xc6y\xa2\xbc\x82B\xf6\xbc$\t\\>\x83\xc4\x93\xbe\x8c\xba\xb0>xh\xed\xbc\x8f\xdd\x82\xbe\xbf\xd7\x90>\xa6\x95\xf5\xbcz\xa4U>\xed\xa2\xb4>\xa7\x96\xff\xbdq/\xb3\xbc\xcf\x89k\xbd4p"\xbeXT\xa7>\xf8\x1f\xb9>iR\x0b\xbdD\x15\xaa>\xc8\x02\x12\xbe\x08Td=D\xc6\xea=\xb5x\xb4\xbe\xd5\xc2<>\x9a\x00l\xbe\x1e\xef\xd6\xbe\xd8g]\xbeSL\xc5\xbd.\xf0\xde\xbd\x81u\x9b\xbeR\xd2\xb5>\xd3k\xcb\xbd%\x1b/\xbe\x88\xb3\xbe\xbd\xcb\xd3\xb9\xbe\xdeo\x01\xbe\x80\xc0\xd2>\xe1\xae0\xbdw\x18D=\xe6&\xde\xbe^\xeb\xa2\xbe\xb9\x07\x1e\xbe\xbcV\xbd=\xdd\xa9\xb5>\x07~:=\xef`C\xbe\xc8\xc3\xbe\xbd\xfa\xde\xad>\xb1\xaa\xae=d\x0c\xdb=\xcec\xa3<\xef\xdd\xbe>J\xfc\xa4\xbeR\xd7B>\xf6 \xb3\xbdsBO>h\x00q>\xb4\x88\xc2>Y\x81\xb7>D5\x8a>\x9f\xba\xbd=\xeb\xcc)>0v\xd9\xba'
-p1000
-tp1001
-bsV580365450036531202
-p1002
-g2
-(g3
-(I0
-tp1003
-g5
-tp1004
-Rp1005
-(I1
-(I200
-tp1006
-g12
-I00
-S"\x00>\xfa9\n{\xa5\xbdC\xee\x0c\xbfq\xec\x0b?;\x9b\xac=;\xbft>s\xbf\x11\xbf\x08\xae\x0c\xbeK\x99\xec\xbc\x81X\xf1>w\x06\x8c=EoP\xbf\xd3Jn>\xe5\xc7\x1a>\xdb\xe0\xbb\xbc\xb7\xff\xc0>s\x99\xe2\xbd\x97\x91\x03\xbf\xd4IN>\xad\xcb\x86>\x8b\xecR\xbf\xbc\xbc\xf3\xbd\x96\x12\x10>\xcd\xc55\xbe\x93\x8cS\xbe\x84\xb9\xa4\xbbI\xb9&=##\xeb\xbd\xb0o7\xbf\x87_b\xbe\x8d\x19\xff\xbes\xd5\x90\xbeM\xa8\xee>\x99\xf1\x05\xbf\xdf\n\x82=\xccW\x83?`\xe6\x05\xbfkz\xd6=\x01y\x97>;\xf5>?T C>x`/?)\xc3\x9b>\xe5\xe02\xbf\xe4S\xbd\xbei\xb2\xd0;\x83\x7f\x01?K\x1d\xd0>|\xf9,>}\x0c\x13?\xe7j\xce\xbdp-=?\xe4\xc1\xde\xbe\xdf\xf9\xa9\xbe9fW\xbf\xc7|\r?\xe8j\xa5\xbeS\x17\x94\xbe\xe5_ \xbf\x1f\\\x12\xbf'\xf7\x16?\x15\t\xd6\xbd)\x1ev\xbe\x83?u\xbfhH\xe0\xbet\xb6\x1d?\x10\xb2\n\xbf\x1d\xf3V\xbe/x\x15\xbfr\xcf\x16\xbf\xf7`H\xbf\xa7TJ\xbfu\r5\xbe\x8f\xc3\xab\xbe\xd6*\x12\xbf\xef\x048?\xd7\x94*?\xd8\xbai>\xff\x8f\x01?[\x0e\xed=u\xa7}\xbe\xae\x8b\x85\xbc\x9f\x15a?\x11\xb1\xed\xbe\xb7\xe4\x02>)\x99\xdd>g\xee\x89\xbc83S\xbf|_<?\xa9\x93\xd9>;(K<\xcc0<\xbd\x1a\x1f\x8a>\xdd\x0e\xc7=\x9b.\xa3=+\xb9\xb7\xbe}\x90->\xbb\x9f\x8b=\x03!\xf9>x\xd9\x95>\xe9\xcaT\xbd\xbec\x07?h\x13\x92>\x92k\x9c>s\x00\xcf?Qz\x01\xbf\xa8\xee\x98\xbe\x00\x01\xae\xbc9\x87:?\xe5\xfdM\xbe\x13\x1f\xb1=E\x10B?\xa1\xa5}>II\x15?\xa2\xf4\t>k:\x88>+d\x1d\xbf\xf0A\xc4>K\x83\xab=\x10AG>\x11)\x82?\x91v\xb3\xbe\xb5WJ\xbe\x91\xb9\x02\xbf\x7f\xbd=\xbf\xf3n\xb8>\x9b\xdd\xaf\xbcomX\xbe\x85\x7f0>\x9b\xff(?;w\x8d\xbeE\xe4\x8d\xbe\xcc\x1a'\xbe4\x90:>XB4\xbfs.@>\x03\t\x82=\x9b=2\xbes\xd1\n>q\xadL?X\x8f$\xbf\xd7\x8b<?\x81kC\xbe\x0b.\xaa\xbe\xd9\n)?\xe6C!>m\xe4;?\x90\xd11?\x19d\x81\xbe <\x9c\xbeI\xcc\xbe\xbeS\xf1\xfd\xbe|lZ?\xc9V\x92?=@h\xbe\xc1i\x06?\x80t\x84\xbe\xb3\xd7\xbc<\xb6\xdb\t>}\xa0}\xbf\x18\x92I?4L\xd0\xbek\x9eE\xbf+\x06\x03\xbf\x017\xa9\xbe? \x01\xbf\x01P\x0f\xbf\xc3\x8bT?\xd5\xb1\xc2\xbe\x86\x06\r\xbf\xcd\x1f\xc8\xbe\xc5\x9el\xbf\xf1\xe8\x96\xbe\x1d\x06a?\x1c\x8b_\xbe{$j=\x8e\xf8\x92\xbf\xd9\xfd$\xbf\xd0\xd8\x89\xbf\x99?\x84=\x85\xc3$?\x97\xc5U>\xaf\xa5\xf7\xbe\xbfQ\x01\xbf\xa3&E?\xa3\xb1P>K\x08\xe8\xbd-\x91\x03\xbd\x8f\x8b\x81?\xe1\x9f]\xbf\xe5\xb0\x1c>g\x85*\xbf]\x9b\x11?\x1dy\x11?S&(?\x05q~?\xcev\x8b?lE\x87>r\xd0\x10?gN\x88\xbd"
-p1007
-tp1008
-bsV580895113963905024
-p1009
-g2
-(g3
-(I0
-tp1010
-g5
-tp1011
-Rp1012
-(I1
-(I200
-tp1013
-g12
-I00
-S"\xff\x8b\x96>\x91\x93\xd8\xbd\xb5E\x04\xbfDd\xb9=$Q\xa6>W\xed\x1a\xbe\x93\xd3\x1c\xbe\xcd\x83a\xbe\xf4(\x91\xbdz\xa4&>\xd9\x1e\n>\xb0YZ:\x8b8C>\x18\xa4\xb1=\xf0\x14*\xbe\tk\xb6>a\xc8b;%\xa4\xc1\xbd\xdd\x05\xe5\xbd\xa1/\x8c=\x0b\x89\xb8\xbe\xeb\xe4\xf6\xbc\x87\xd6\x1c>p\xc6\xd1\xbe\x0b\xe5\xee\xbd1\x16\x03\xbe\xef$Z>\x99T\x9f\xbe]R\xa7\xbe\xa1$.>\xf0\x1a)\xbd\xf1\xa6#\xbe\x9c\xea^>\x9c]\x9f\xbe]k\x18\xbb\xcf\x8e\xcb>\xc0\xa4\xd3;\xc4B\x18>\xf3\xa3\xc4>[\x86.>\xae'\x04<\xb8&\t>\xd4\xc8\x8e>\x9d\x8c\xbd\xbe\xa8\xca(\xbe\xab\xaa\x86:\xdd\x9a\xf4>\xcb\x0f\xbb<\xce\xd7\x86=\xb7P\xe8>\xcf\xdc\xb2=\x0e\xc6\x05?\xf3zy\xbe\xe33\xf8\xbc$\xef\x00\xbf\xfc\x12\xad>\xa0\xdet\xbb\xb4/\\\xbe\x90\xc7\xee\xbe\x85\xf6\xf2\xbe2\x9e\xa3>\x143\xa0<P\x10\xc1\xbd\x95\xfa\xb6\xbe\xba\xad\x8f\xbd\xe99\xac>-Et\xbe\xb9\xe4\xbb=\x9b\xcd\xe2\xbe\xbbb\x15\xbe\xad\xf9-\xbfL\xb7\xb9\xbe\x1d\xb5\x8c<1\xf3&\xbe\xdc\xb7{\xbe\xd3J\xb4>\x88\xff\xb8>\xe9\xd3&>SN\x10>\xdb\x0c^>\xff8#\xbe\xef>Q\xbb\xd0:\xb7>g\xa5z\xbeh\x9dB>\xaf\xa19>_\xbc\x94>\xc8)\xea\xbe\xb8\xa8\x15?\xe0\nI>Y\xfe\x08\xbe\x9b~3>\xdd\xde\x95\xbe\x01\x1c\x01>}\r\xa4>4\xa4k\xbbe\x91\x19>n\x8e\x93>\xac\xb6S>\x19\xd8\x8f<#!\xcb=\xd8<\xe4>\x85\xb5\x0b>\x1bB%>\xe7{\x19?\xa8\x0f\xa2\xbe(\x04{;%R\xef<\xc9\xd4\x04>i\xeb!\xbcO\xe5g\xbc\x1b\x92\xb5>\xf1\xd6\x14> \x14_>\x15\x9e\x82\xbbS$M=\xedu\xd2\xbe\xf4\xc6\xb2>x\x1fR=\xad\x1d\x15>\x11\xc5&?\x03\xbe\xb9<%\xba\xad\xbd\x02\xa5\x9a\xbd\x8f\xea\xaa\xbd\xe5B\x96>\xd7?.\xbeTm\x90\xbc\x08\x942<~4\x1a>\xfcdT=n\xe4\x88=\x0b\xd1p=\xd5a\x1a=dQZ=\xffp\x1e>\xef?v;O \xa5;\xff@\xc4=\x97\xb9O>c\x9a_\xbe\xf8 \xd9>\xb2\x84\x9e\xbd\x07\xb1\xad\xbeF\xf9\x99>\xa4\xe6\x8e\xbd\xa7\xe1\xa4>l\xf6\xac>3\xc2U\xbed\xc53\xbd}?\x01\xbd!\x8bc\xbe\xdfE\x94>=\t\xc7>\xbd\xc5\x0c=\x87Q\xea>\x9f\xc6\xc1\xbdk\x8a\xbe=\xa0K\xe7=E\xdf\x9e\xbe\xa1\xfe\xa5>\xe5\xb2\x82\xbeMT\xaf\xbe\xf8\n`\xbed\xf6\x05\xbe\xa3eG\xbeX\xe6\xf4\xbe\xdf\x85\xc9>T\x00\xeb\xbdOU\xd1\xbd\xff>\xec;\xe8G\x8a\xbe\xa4\xe6\\<\xae,%?{\x186=;\xdb\xb7\xbb3\xd2\xd5\xbe/\xee\xbf\xbe\x19;!\xbe\xc7\xa8\x01>X3\xc5>Y\x90\x9e=[pH\xbe\x147\xe0\xbd\x7f\xee\x80>\xbdN\xce\xbc\r\xe3_>C\x8a(=#U\xc2>\x01\xf6\x8a\xbe\x9d]K>U\xb0\xf2\xbb\xd8}g>\xa4\xc8\x8f>l|\xc1>\xd5\x9c\xe1>'zu>\xc3Y\x06>1\x9a\x83=5\xe0:>"
-p1014
-tp1015
-bsV590877493374144512
-p1016
-g2
-(g3
-(I0
-tp1017
-g5
-tp1018
-Rp1019
-(I1
-(I200
-tp1020
-g12
-I00
-S'\x84+*>D\r\x03\xbdMR\x8f\xbe\x00\x8c\xfc=\xe5\x0b\x0e>\x89\xaa\x05={\xaf#\xbe(\x1c\x12\xbe\xc1a%\xbd\x0fYG>\x86\x94<=\xd5\xee6\xbe\x87\x19\xfe=c\x9d\x9b=\r\xb8[\xbd\xad$\x82>\xbakO\xbd\x82\xba\x0e\xbe\xe6\xfc\x08\xbdv\xd6\x00=\xb0\xa9\x8b\xbe\xfe\xef\xd9\xbc\xb5\xc5\xcc=8\xfe\xf9\xbd\xf1|\x8b\xbdxbV\xbdv\x8f\xab=\x15\xe3\x04\xbeS\x9f\x8d\xbe\xe2\xc7V;\xe8K\x16\xbe\xa7\x83\xe8\xbdx\xea!>;\ns\xbe\xf6gQ=\xfae\xb1>\x9b\xba$\xbdA\xdc\xa3=\'\xecY>\x9e\xceH>\xb9\xac:<\x1eJ\xd9=\xa1\x82!>W\x87\x85\xbe\x9e2\x00\xbe\x88\n\x0b\xbc!{\x9b>\x0f\xc2\xe6=j\x91r=\xaa\xde\xa2>\x98\xc3u\xbc#\xc2\xab>\x83t\x1b\xbe\xd60\x83\xbd-\xa2\xc8\xbeJ\xdbQ>{\xfc\x98\xbd"\xdf\xd6\xbd\xbfv\xc2\xbe\xe4\xb6\xa0\xbe?\x81Q>X\xads=(u\xed\xbc\xfb\x9e\xa0\xbe\xbe\xc0\xf1\xbd\x8fo[>H\x98[\xbe4\xdfb=\xf2\x98M\xbe\x81\xb8<\xbe)\x16\xd4\xbe&\xbe\x98\xbe\x9e|;\xbd%\x90\xf9\xbdN\xe3/\xbe\x8d\x19z>\x94\xd4_>\xb1\x7f\xfa=\xd8\x15*>V\x02\xf7=f\x10\xa9\xbd\x11\x02\x8f;\xbd\xe9\xae>X\xcdU\xbeGm\xfb=\x17\xbe\x19>\xa0\xab\x06>\x16\x9f\xa5\xbe\xc8\xbc\xc1>\xc2\x14\xf0=n*\xb0\xbd{\xadt=\x8d\x02\x88\xbd\x92\x06\x0b=\xb8\x16,>\xbf\x98\x92\xbd\xaf$\r>X$\x1a>\x1d\xba3>\xa3\x8c\xa5<\x1bz\xb9<\xb6\x0e|>\xcd|\x04>\xf3\xf5\x04>\x126\x10?\x8dpS\xbe\x98bN\xbd\x11\x92\x16=0\xf5;>\xb6\x90#\xbd]\x9b2\xbd\xe4P\x8d>\xa4\x0b\x00>\x97\xebB>!8\xa8<\xa1\x1b\x9c=\x90\x99\x89\xbe\xc6\xe3V>\x18\x9ed=\xecu\xb0=;\xa8\xe5>e\xf9g\xbc\xa8\xaa"\xbd#\x9e\x05\xbe\x94\xe55\xbet\xea5>\xe9\x02\x89\xbd\xd3\x12\x14\xbd\x13\xdci=\xc8\x15M>\xcd\x9e?\xbdC\xech\xbc\x83\xa9\xd29\xbf\x18H=\xf8\xc0\xd4\xbd\x91V\xa2=\xdcs\xa7\xbb\xb9\n;\xbd\xfa]\xab<\xfd\x11N>\xe2\x84f\xbe:\xed\x99>s}\xaa\xbc\x8d\xc2Q\xbe\xef\x8c\x87>\xb1~\xdd<\xdbEi>\xd0\x11\x99>\xe7\x1e\x08\xbeI\x1bP\xbd8\xfb\xc9\xbdO\xfa<\xbe\xa3-\x98>#\x89\xb0>$52\xbd&v\x83>\xcd*\xd7\xbdQ\x8bn=[\xde`=\xdd\xa6\xa9\xbeE\x89M>\x82\x87M\xbe\x06\x83\xa8\xbe\x16\x1e/\xbe\xe0\x97\xa8\xbd\x13\xaf\n\xbe\xdf\x9d\x90\xbe\xe2\x8a\xa0>\x9a\xb8\xd5\xbd\xb3\xac5\xbe\r\x90\xb2\xbdS\xe7\x95\xbex\x05\xa0\xbd,\x17\xd0>\xe3K\xe2\xbc\xdf\x0e$<\xd7P\xd3\xbeHb\x98\xbeh\xadL\xbe\xfb\xd9\x9b=$@\x96>\x1bA\x8f=&\xc8A\xbe\xa5h\x07\xbe\x91\x89\x97>\xd2\xfcB=sek=\xacL\x9b<\x1b\xc3\xac>\x8d5\x8d\xbe\xb6=\x0b>@\xfb\xfa\xbd\x0c\xad,>\xd8Hg>\xa9F\xa9>\xde\x15\xbc>,\xe0\x8b>\xce\n\xcb=\xe3{#>T\xbcZ='
-p1021
-tp1022
-bsV590741865001054210
-p1023
-g2
-(g3
-(I0
-tp1024
-g5
-tp1025
-Rp1026
-(I1
-(I200
-tp1027
-g12
-I00
-S'\x8b\xdc]\xbd\xf4\xa1\x9b\xbdPN\xf7\xbe\xfcn\x01?S\x88I=-\xb6r>\xc3\xda\x05\xbf\x03w\xa7\xbdg+\x8c\xbc%\x02\xd6>W\xaak=\xeb\x18D\xbf\xd3\xa6V>\xb8`\x08>\x04}\\\xbcu\xc9\x97>\x00^\xba\xbd\x8cY\xf8\xbe\x88v_>\xd8~\x8a>\x1b%A\xbf\xe5\xc2\xd1\xbd\x0c\xe8\xcc=3\x94\x12\xbe(Q?\xbe\xf4\x13\x11<\x90\xa7l<\xf1\x94\xba\xbd\xc6\xb3$\xbfy1`\xbe\xc5O\xe6\xbe\xc9#~\xbe\xf0+\xdc>#\x00\xec\xbe(\xba#=<\x14l?\x1f\xd5\x05\xbfz\x7f\xa3=\x04\xc8e>0\xcf4?g\x01O>c\x98.?\x90\xf4\x88>\r\xc9$\xbf\x8c~\xa8\xbe\xa9=\xa4<<,\xd7>o\xf6\xba>&O\x12>\x90\xaa\xf5>\x85:\xbe\xbd\xbf\xdb\'?\xa0\xda\xcf\xbe\xa5\xaf\x9f\xbec.<\xbfO\xb7\x02?\xa1_\x9e\xbe\xedS\x87\xbe\xe5\x1c\x05\xbf\xe89\xf9\xbe\x8ep\r?\xa1n\x0e\xbe\x8b\xba~\xbe\xb4\xafa\xbf\xe4r\xce\xbey\x06\x11?0)\xfa\xbe\\\xfci\xbe\xf2V\x0b\xbfj\xf6\x07\xbf\x15\x03)\xbf\xcd\x863\xbf\xf7N\x1e\xbe\xc40\x9b\xbe"\xfa\t\xbf\xfb:(?\xa82\x1c?\x00\xfbI>L\xf9\xe4>w\x8f\xa3=\xa9\xb0l\xbe\xd7z\xb8\xbc#JJ?T\xa3\xcc\xbeP\x15\xc0=\xf3[\xca>\xdb\xd0I\xbdP\xf5;\xbfjb\x1f?\xcd\xbd\xd3>/#4=\xe1\x83\x86\xbd\xa3\x15\x91>\xc3\x14\xb5=\x8fB\x0e=#\xe3\xad\xbe;d\xc9=L\xdb\xb5<G\xf6\xdc>;\xcf\x96>\x91\x05j\xbdEk\xec>K\xaaz>\xe3\xdf\x88>}!\xbb?\xa7\x97\xe5\xbe\xaf\xfb\x8d\xbe P4\xbd\x9d\xc6,?+\xb3K\xbe\x03\xc0\xdf=\xb1\xd20?\xf4eM>+2\x08?\xf7\xe5\x01>k\xc0r>\x9b\xf2\x07\xbf\x17\xc1\xa6>;r\x92=\x18\xac/>\xe3ee?\x80|\xbf\xbeA\xde<\xbe\x0c\'\xf2\xbe#\xf3/\xbf\x11\x90\x9e>\xcf\xce)\xbb\xbb\xbeL\xbe\x9a\x8c\x1c>\xd6+\x18?G8\x88\xbeY\xd4\x95\xbe\xf1\xbc/\xbep\xe7+>s\x1e-\xbf/Q&>0\xf0\x95=+\xbf#\xbe{\xb4$>=L??\xa9\x0b\x11\xbf;E(?\x002?\xbe1\x1b\x86\xbeWL\x16?\xb1\x8a\x1c>\xdf\xf8,?+\xb1\x16?Wce\xbe\xb6\xf9\xa1\xbe3\x02\xb3\xbed\xf6\xe4\xbe\x1c\x02D?S\xee\x85?\xc5\xa3b\xbeU\x9f\xe9>G\x7fj\xbeh\xdb\xf6;\x9cc\xed=_Tg\xbfy\xeaA?\xb1,\xaf\xbe\xbaF)\xbfO\xa5\xf1\xbe:\xa2\x9d\xbeEY\xfb\xbe\xcb\xf7\xf8\xbe\x0f|>?y%\xb6\xbe\x87\xa7\xfe\xbe \xec\xb5\xbe5\x17V\xbfU\xd8\x89\xbe\xe4\xf0H?\xc7\x0eR\xbe\x11\xb2H=id\x84\xbfu\r\x10\xbf\xb5\x86\x84\xbf\x0c#\x0b=\ri\x0e?\xb1\rF>\x7fr\xdc\xbe\x9cF\xf5\xbe$4+?o\xd2;>m~\x0f\xbe\xcb\xaa;\xbd\xdctm?\x7f\xa3K\xbf#\xb2\xe4=}\xa9&\xbfF\x9d\x08? \xbc\x01?\x91g\r?\xeb\xffe?\xf95\x82?\xef\x01w>\x0e\xa5\x03?\xb9\xb4h\xbd'
-p1028
-tp1029
-bsV580280938954952704
-p1030
-g2
-(g3
-(I0
-tp1031
-g5
-tp1032
-Rp1033
-(I1
-(I200
-tp1034
-g12
-I00
-S'Pu >n9\x12\xbe\xc9X\x1f\xbf7\xed\xea>\xc3\x0eJ>;\xae\x1f>\xea\xde\x08\xbf\xd0\xfam\xbe]^\x18\xbd\xa4\x19\xf9>\xa2\x9b\xd5=\xa4\x01%\xbfwn\x88>e\xa7\x15>\x8c\xb6\xa3\xbdnq\xfb>\x99o\xd1\xbd\x8fj\xd6\xbe9\xb7\xcf=\x06gK>\x87\xd7L\xbfGp\xde\xbd\x0b\xd1D>\xf1\xdd\x9b\xbe\xac\xaea\xbe\x96nz\xbd\xffo\x06>\x96b_\xbea[A\xbf(\xd2\xc7\xbd<\x1e\xd4\xbe\xab\xeb\x98\xbe\xc3\xf0\xde>W\x02\x0c\xbf0\xe9\x94=\xea\x0b~?c\x1f\xba\xbe[\x9f\xde=\xf8\xda\xd2>\x1e\xd9&?f\xbf\x06>^\xb2\t?%/\xb8>\x91\xd81\xbf\xda\xee\xba\xbeB5%\xbaVY&?\xa7\xae\xb8>\xa1\x19<>\x86\x84,?\xd0<3\xbd\x9d\x9eM?\n\xb9\xe8\xbe\x82\xfd\x95\xbe\xcc\xe5i\xbf\x93\xf1\x18?xb\x84\xbe\x8eY\x99\xbey\x1d=\xbf\xf0\x8a,\xbf\x11>\x1a?\xa8\x8e#\xbc\xdb\xcfB\xbe\xc5\xb9j\xbf\xb4s\xd3\xbem\xcf\x1f?\xb6\xb5\x0b\xbf\xbeu\xa7\xbd\xa8\xd1\x1b\xbf\r\xaa\r\xbf\xbe\xe3g\xbfa\x1dK\xbf~X\x03\xben\xe3\xb6\xbe\xb5u\x06\xbfc\x069?\xf3t*?hF\x86>[M\xef>\xae/K>\xcd7}\xbe2\xc2\x9a\xb9CHa?0\x1f\xfa\xbe\x13\x05E>2k\xd3>7\xed\xdf=K0Y\xbf\x0c\xb2X?\xcc@\xd5>\xb3\xa9~\xbdB\xaf4=\x1e\x11\xd6=X\xef\x01>\xd1al><\xd5\xa8\xbeecw>q6J>\xff{\x04?\xf7\xf8\x7f>\x7f-\xa9\xbc\xf6\xc4\x15?\xcf\x99\x9f>\xec\xa4\xa2>\x1b\xba\xc5?c\xa9\x07\xbf=\xa5i\xbe\x1a\xc6\xc7;f\xe4#?2\x1e1\xbeC;B=\x03\x86??\xbc.x>\x15\xf4\r?MS\xd7=\xee\x9d\x88>\xd5\xa1*\xbf\xc6q\xe8>\xf3\xcb\x02>\xc6uV>\x92\xdc\x8c?\x19\xf4[\xbe\xdc\xab"\xbez\xdc\xf0\xbe\x94b \xbf\x0fp\xd8>\x08\xbb\x94\xbd\xc2\x9d@\xbe\xdd\x83\x1c>\x83 \x1e?\x9d\x8dS\xbe\x9eD@\xbe9\xac\xc0\xbd\xdf\xfa\x1f>\x93n\x07\xbfkPi>\x82\x15`=\x92]\x19\xbeE\xf5\xfb=\xcdJ6?\x1dC \xbf\x9e\x16I?\xf9\x10\x14\xbe\xf4\xb9\xd8\xbe\\\xa4\'?\x15.\xc7=\xd1\x1f;?\xe7\\;?W\xb3\x9f\xbe\xe8\xb4k\xbe\xc9\x06\xb8\xbe<?\x04\xbf\xf3\xffN?Et\x8a?\x92\xf31\xbeh\xaa\x15?\xb71\x85\xbe\xf8\xd8\x92=R\x91\x04>\x04\xc5p\xbf\x0c\xb49?\xa2\x1e\xde\xbe\xd7\xb1O\xbfv\x97\xec\xbe\xe5\x1d\x9f\xbe\xc7b\xdd\xbeZ\x84,\xbf\xeb\x8eX?\x94\xd0\xca\xbeR[\x02\xbf\xa4\xbb\x9c\xbe-\xc5]\xbf%"k\xbeU\xefz?\xd0\x9f\x17\xbe;\xeb\xf1<FA\x8c\xbf\x8a\x88+\xbf\x87\x0ee\xbf\xe0\xa2\xf8=\xf3}-?\xe7\xa2c>\xcd\x7f\xff\xbe\xa5}\xe8\xbe\xd2k@?-\xaf\x1d>\xf9\xe0\xa5<\x18\xf1\xb1<\xbe[w?\xebGL\xbfbyV>\x19D\x07\xbf\x83f\x04?\xafs\x06?\xed\x0b5?2\xb5x?|\x0b|?\xbb5\x88><\x0c\x00?O$\xa2<'
-p1035
-tp1036
-bsV580654416090517505
-p1037
-g2
-(g3
-(I0
-tp1038
-g5
-tp1039
-Rp1040
-(I1
-(I200
-tp1041
-g12
-I00
-S"\x0e\xee\xfd=\x90\xb1\xba\xbd\x17\x84\xc8\xbe[9\x7f>[\xc8\x19>\\u\xb1=\x14H\x94\xbe\n'\x1a\xbe\xda\xa0+\xbd\xb8\x85\x98>D\xdd\x87=5\x93\xba\xbe\xf3\xea7>A\xc6\xc3=\xca\xa8\x81\xbd\x9dU\xa6>\xdc\xbd\x83\xbd\x10>}\xbe\xf5\xed\xf8<\x89\xf6\xd9=T\x1e\xf1\xbe\x88=X\xbdu-\xdf=\x16P8\xbe\xc0\xc1\x05\xbeU\xc9S\xbd\xa9\xce\xb3=\xe8\xfe#\xbeEx\xe7\xbe\xd0\xb6w\xbdQ\x8f\x84\xbe\xac\xa30\xbe\x8c\x06\x8a><\xd5\xb4\xbe_vL=FR\x14?\x82'5\xbe\x9e\x85\x97=^\xf1\x82>\xcec\xc2>\x94j\x87=U\xc6\x92>\x19[Y>Ax\xd6\xbe\xe7\x97W\xbeG\xbc\x9d\xbb\xe1\x9b\xcf>$\xbbN>\xbb\xfe\xca=4E\xd2>Z\xb7\xdb\xbck,\x00?\xd8\x06\x87\xbe\x80\x07!\xbe\x0b\xb9\x0f\xbf)I\xb3>\xf8\xf7\x1b\xbe\x17\x03?\xbe\xd4\xbd\xf5\xbe\xe0\x05\xdc\xbeq \xb5>5V\xcc;\xc2\xb8\xd3\xbd%\xd2\x07\xbf\xf0\xb6c\xbe\xdaK\xbf>Z\xf6\xaa\xbe\xb9\xb9\xac\xbcm\x17\xba\xbe@\xf7\xa4\xbe\x83{\x0e\xbf\xc9@\xec\xbe\xeb\xb9\x8b\xbd\x8e\xe7R\xbe\xfc\x07\x9f\xbe\xed\x14\xd6>eU\xcb>\xa2\xad2>L6\x85>\xd1\x15\x12>D\x87\x12\xbeI\xc1\x83:\x9ds\t?\xdb8\x99\xbe\x8dr\x07>$yq>,\xd9\xbd=t\xad\x01\xbf<c\x08?+<w>\xb5w\x8c\xbd\x7f8\x1b=M\xb7\xc7<Z\x19\x91=\x1dS?>>\xda3\xbe\xc4;\x1f>\r\xa8\x15>\x9c\x07\x99>W`\xec=\xe2\xc8y\xbb\xf3\xaf\xb7>\x1f\x0eH>\xca~E>\xe7\xd6i?\x91u\xa4\xbe\x07\xe1\xed\xbd\xbf\x13\x9b;\xf4\xea\xbb>B\x9f\xc3\xbd\x90t\xf1;k\x9c\xe2>\xf5\x00\x05>r\xab\xa1>l.U=\xec#(>-\xff\xce\xbe\xe4t\x8f>\x80\xb9\x8e=~\x98\xf3=X\x1e+?\xcc\x9f\xde\xbd\xd6\xb3\x97\xbd[\x8b\x85\xbe\x84\x8e\xb3\xbe\x94\xda\x8a>\xf4\x1ft\xbd\xe8\xc9\xd6\xbdl\x87\xab=\xd9\x9b\xb4>\xf1\xe3\x03\xbe\x89\x13\xca\xbd\x1e'\x0f\xbd\xeav\xb2=R\xc4\x8f\xbe\xb7c\x10>\x95\xe5g<l\xea\x9c\xbd\xa6'\x99=\xbe\xcc\xc8>\xf8\x90\xb9\xbe\xcb\xed\xef>(\xb9\x9b\xbdq\\\x84\xbe\x934\xcc>\x0b1g=t\x98\xd3>\xbc#\xe4>\x19\x9eM\xbe\xdd\xfa\x02\xbe\x84\x9dY\xbe\xf4\xf1\x99\xbe^k\xf2>\xe9\xe8\x1c?G\x87\xcb\xbd\xbc\xf8\xbb>`\x0e$\xbeP\x8cz=/\xd5\x9a=\x7f\x19\x0e\xbft*\xd0>|\x0f\x84\xbe \x13\xf9\xbe\x9c5\x93\xbe\xcc(5\xbe8\x8d\x84\xbe\r|\xd8\xbe\xd6\xab\x00?g\x04l\xbelb\x97\xbe\xf9\x08/\xbe\xa0K\x01\xbf\r\x06\x04\xbeX\xc2\x1c?\xe7\xd0{\xbd\xa0o\x81<z\x83(\xbf\xd4<\xd2\xbe\xdbB\xf7\xbe=\xd8\xbb=,\x80\xdf>\x1b\xbc\r>Z*\x95\xbe\xf7\x16|\xbe\x8eE\xed>\x84\xc2\xa0=\xec1\xe5<\x0c\xa5\x8e<\xf7O\x0f?\x80@\xeb\xbeu\xbc\x15>,\xa8\x95\xbe<\xe1\x97>P\x08\xa5>dG\xe3>\xf87\x14?\xf6\x1f\r?@\x1d >W1\x95>XA\x05="
-p1042
-tp1043
-bsV580637900607455233
-p1044
-g2
-(g3
-(I0
-tp1045
-g5
-tp1046
-Rp1047
-(I1
-(I200
-tp1048
-g12
-I00
-S'\x99\x9e\xe9=\xaa\xa1\x02\xbc\x97a\n\xbeG0\\<[\xc7\xae=\x9f\xe8\x8f\xbb\xc2\xc4\x07\xbd\x1fV\xa0\xbdS+\xd2\xbc\x8e\x05\xad=Kp\x84<\xd4\xfc\r\xbd\x82?g=\xe5\xa2\xdd<L\xb4\x1a\xbd\x00\xe7\xff=kj\xca\xbc\x80\xb49\xbd\xc3\x1fI\xbd\x1aw\x03\xbc\xe7n\xbf\xbd\xa7E\xf2:\xb3\x9b/=d9W\xbdK{V\xbc#^!\xbd\xae(w=\x99>\x94\xbd\x94$\xde\xbd\xa9\xc9\x87<tz8\xbd|\xf3\x1f\xbd\xd7\xe2K=\x17[\xe7\xbd<\x17\x9b<K\x97\xf8=\x0b7\x0e=\x14\x97:=\x10\xfe\xe6=\xee\x03D=d]\x98\xbc\x07o\xbb\xbb\x82h\x8d=\xab\x17\xbd\xbd\x95\x1bJ\xbd@J.\xbc\x0e;\x11>\xd5g\xe1<,\xec\xa2<\xbc\x92 >28\xff\xba\xe4\x8c\x17>\x80\xb1q\xbd\x1c-\x80\xbb\x82\xf0*\xbe\x9e\xa0\x94=\x0b\xca;\xbc\xc4\xd1\x19\xbd\xdctE\xbe\xb7\x1a\x1d\xbe;\xab\xa4=\x07\xf2m=BZ3<D\x0f\xcd\xbd\xd2\x01\xa5\xbc\xf9\xd5\x9e=/{\xb6\xbd<\xf7\x8a=\x94\x18\x90\xbdDAi\xbdt5A\xbe\xe4\xae\xe8\xbd\x10\xcd2\xbc,\xdc0\xbd\xd9\x85w\xbdx\x0e\x98=\xa4\xb4\x9b=\xe0\xddk=\xee\xf0m=\xbc\xdf\x95=\xa46\xde\xbc\xf2kg;\t\xaf\x08>\xbb\xe5\xb7\xbd\x14\x81\x89=\x0c\xdbL=\x14V\xb2=\xbcv\x01\xbe\xe9~1>\xa0)\xec<\x1b\xbf\x7f\xbd\x12^7=(\x8e\xa2\xbd\xec\x18N;\x85+\xd9=YR\x19\xbb/\xbd\x93=#\x8b\xc4=\xb9\xb2y=T\xd8\xc2\xbc)T\x92<\xe21\xe2=\xcfMZ=hU^=\x06iD>\xe25\xbf\xbd9\xba\x91:Y\xae\x10=\x05\xe6\x1c=\x0e\xd3y\xbbq\x1cN\xbd\r\x05\xbc=\x97\xa7n=\x83\xe9\x89=\x92f\xea;\xa7\x9e\x88<\xdb*\xf4\xbd\x07\xbc\xd0=\xa1\xc3\x8c<\xac\xe8\x0f=\xe54@>g\xc7\xf2<\x93\x9b\x13\xbc\x94&\xe1\xbcb@\x0f\xbdK\xc3\xa4=R\x11A\xbd\\\xa8\xf6\xba-L\xa4<K\xd9c=K\x16p:=Z\xcc<\xc6\xf4\xa6<w\xe1A<`\'\xd9;\x14\xc4\x03=\xd1\xe8\xa7\xbc\x91;M\xbc`E\x88\xbb\x0b\'7=\x02\x03\x9c\xbdb\xdb\xee=\xe6h\xbc;\xe2\xbf\xd4\xbd\x0b\xb6\xe4=\xd11*<\x12\xbb\x8f=U\xc2\x08>$ny\xbd\xd9\xe8\x8f\xbb\xb92\xc3\xbc\xdc\xc9\x8c\xbd\xbe\x15\xdf=V\x85\xde=R\x17\xfc\xbb^\xde\x01>UIB\xbdE\xf4(=\xdf\xd5\xd0<\x94r\xe6\xbdB+\x19=v\x89\xc3\xbd\r\xce\x0e\xbe\xf2i\x9f\xbd\xf9\xe5\x94\xbc\xe3\x14&\xbd*1\x11\xbe<d\xe7=\x83\xd1\x98\xbc\xe9\x999\xbd\xaf\xf9\\\xbc\x81\\\xc8\xbd\x07<\xb0\xbc\xe9\x887>i\xa9\x0f<\xb8\xcf\xab;zH\x1b\xbe\x98I\r\xbe\x11h\x1c\xbc\x0e\x8b"=\x19\xdf\xff=\xcc\xff\xbb<\xbf\n\x9f\xbd\\e\x15\xbd|\xbb\xea=\xd5\xf4\xbd;dfI=\xf1\xc3\x85<I\xab\xea=\xa7o\xac\xbd\x16R\x97=D\x8f\xca\xbb\xbe\x83f=\x15\x9d\xb8=\xc0\xfe\x1d>\xbc\xcb\x0f>>\x05R=+\x91\x0e=`\xa0,=\xc1\x82%='
-p1049
-tp1050
-bsV580321578887618560
-p1051
-g2
-(g3
-(I0
-tp1052
-g5
-tp1053
-Rp1054
-(I1
-(I200
-tp1055
-g12
-I00
-S'\x7f\x03V>\x86\x8e\xbd\xbc\xda[\x92\xbeg/\xb6=U\xbb+>\xd4\xb7\xbb\xbc\x1c\xed\xf4\xbd\x82u6\xbe\x86\xde\x1d\xbdVd(>Ci\xf7<\xbd\xcc\xe0\xbd\xac\x84\xd6=\xa4\xc0\x8a=Q\x07\x80\xbdj1\x88>/\xef0\xbd\xf4\xfe\xca\xbds\xf7{\xbd\xc9Q\xdc:F\xe4m\xbe\xd0M\xfa\xbc\x97\xbf\xd2=a\xa2\x1a\xbeZ\x08X\xbd\xf4:}\xbd\xfa\x18\xf5=\xdb\x9b\x17\xbe\xfdgv\xbe\xb6(8=\x99\xd2\xee\xbd\xb0\xfb\xde\xbd\x04o\xed=\xbd\xe7p\xbe\xe9\xf7\x1f=\x995\xa1>\xa19\xc3<C\x8f\xd2=i)o>\xe4\xfe\x11>\xf5"\x03\xbd\xd5\xbe\x1c=\xa9\x80*>!d_\xbeW^\x0e\xbe\xe4\xcfY\xbc:l\x90>l\x11\xbb=r\x99\x8a=\x95\xc4\xa1>\x7f7\x07\xbc\x80\xd0\xa1>\x911\x10\xbe]L\x0f\xbd\xd4\x07\xbe\xbe(\xdf1>V\xab9\xbdy\xa8\xce\xbd$=\xc5\xbe\xa6\xf2\xa4\xbeVe0>VJ\xc1=M\xb5\x91\xbb^\x01\x89\xbe=\xf5\x9f\xbd\x06\x91G>rY/\xbeA\xcc\xa9=\x99E2\xber\x86(\xbe\x83o\xd9\xbeT.\x92\xbe\xb0\x00`\xbdJ\xa2\xe8\xbd\xa5\x04\x0c\xbe*\xdaW>\x16oK>It\xdc=U\xc0)>\xa2\xf8\x19>\xd1`\x89\xbd{)\x9b<\xba\xa4\x90>\xac.C\xbe?A\xf0=\xf9\x95\xea=\xd4\x91\x1b>\xfcq\x9a\xbe\xa1?\xca>)R\xac=PL\xb8\xbd\x8c\xee\xbf=\x89V\xd4\xbd=\x02o<:\xa9<>\x99\xe4\xf4\xbc?\xd4+>%\x8c2>&\xec(>S\x13I\xbc>\xff\x00=v\xb9u>G"\xe2=\x11&\x0b>\t\x05\x01?|\xc6]\xbe\xe9 \x1f\xbd\xe3\x18n=\x87\xf4\x0b>\xc2c\x84\xbc\xaa\xb2\x86\xbd\x7f\xd3x>\x818\x07>q&7>\x9c&\xcd<\xf1m\x8c=\xef\x82\x87\xbe\x81W`>\x03\xa9@=2\xb1\x97=\x8c\x18\xdd>\xb9\xc1\xc0<\xf0+\x13\xbd$V\xca\xbd\xe3\x83\xfe\xbd\x90\x88->\xae\xcd\xb8\xbd\x80\x97\xea\xbb\x07\x19U=\xb3\xc52>HY\xa5\xbc\xc0u\x95<\xaf\x81\x18=\xd5\xb8\x08=\x97\xa4I\xbd\xf9\xf8\x95=\xf0\xbe\x98\xbc\xa0\x17\xcf\xbc\xa1\xe4\xcb\xbbk\x86\x18>\x0f\xb2M\xbeBp\x97>\t\x9b\xe2:\x17\x99^\xbe\xe6*\x84>tJ\xe3;*\xe5I>?\xf0\x97>\xef5\xe4\xbdEV.\xbc}\xfeo\xbd\xf0\x11(\xbe\xff\x91\x88>o\xc1\x96>\x01\x13\x85\xbcy\xf7\x80>\xe7n\xdb\xbd#o\xa9=\x8ab}=\xf4l\x8f\xbeF<\r>\xe7\xabU\xbe\xc9\xad\xa6\xbex\xe1(\xbe\t\xfe|\xbdI\x83\xcd\xbd\xd9\xb1\x95\xbe\x9c\x05\x89>\xa0\x88x\xbdqx\x0b\xbe\x96\x89`\xbd\x13\xf1\x8b\xbe6\xb7\x97\xbdy\x87\xbf>\xb8j\x8d\xbc\xb1>\xd7<\xba\x11\xb6\xbe\xc4\x16\x95\xbe\xefm\xd3\xbd\xc5\xda\x93=X\xdd\x86>\xb6cj=\x84k@\xbe P\xbb\xbd\x0cx\x8d>\x1dz*=\x19!\xc5=Ik!=\x15y\x94>\x97\xd1x\xbes\xc8\x1e>=\xbfp\xbd\xf6c\n>6\xa4Z>\xfb\t\xa2>\x1c5\xab>\xad\x93C>[\x96\x9c=<\xd4\xeb=@\x9aB='
-p1056
-tp1057
-bsV577379395654008834
-p1058
-g2
-(g3
-(I0
-tp1059
-g5
-tp1060
-Rp1061
-(I1
-(I200
-tp1062
-g12
-I00
-S'\xb1h\x0c>}zm\xbdb\xa1\xd1\xbehnd>\xdb\x17.>i4#;\xdd7d\xbe\\o.\xbe\xa3\xa2\x86\xbdC\x18`>\x89wz=\x8c\x05\x8d\xbe.\x8d.>[\xa2\xd5=~t\xbc\xbd\xf0u\x8a>\x97\x12D\xbdqWe\xbe\xa0\xd6\x0e<:\x83\xda=\x084\xd2\xbe\x83\xb8r\xbd5\x95\xd5=\x15\xcei\xbe\xd1,\xba\xbdrzq\xbd\xe2\xf7\xd9=\xa9L/\xbe\x0fh\xb7\xbe\t\x17\x8c\xbb\x95;Z\xbe\xceQ#\xbe@\xe2\x82>\x1cB\xa7\xbe0*\x01<\x83\r\x03?o\n/\xbe\x8c\x7f\x08>I_\x89>!\xcd\xa0>\x89{u=!\x80\x8b>\x1dTd>e-\xc5\xbe\x0c\xbfV\xbeW\xcc\xca\xbb\x08s\xac>\xc7\xea\x0f>i\x18\xa3=O\xf5\xc5>\xe5\x00k\xbc\x95y\xee>Hke\xbe\xc3\\\xd4\xbd\xdbc\xf7\xbeM`\x9a>e\xf5\xf6\xbd\x98\x87F\xbe\xc5~\xd6\xbe\x0c\x12\xd1\xbe\xce\xd9\x9e>g\x842\xbd\x02\x98\xe9\xbd\xf2`\xf5\xben\x8a!\xbe\r\xf7\xb5>U\x7f\x89\xbe\xe7;*\xbd\x84\xf8\xb8\xbe\xcft\x81\xbe8)\x11\xbfTs\xdb\xbe\xfa\xc7k\xbd\xc2O-\xbeW\xe1\x8e\xbe\xf74\xc1>\x13\xcb\xbd>"\x14\x0b>.~\x81>\xac\x83\x1d>\xadl\x11\xbe\xf4\xa1\x94<\x9e\xf7\xe2>\x016\x83\xbe\xd2W\x01>\x91G]>\xfa\xda\x05>hq\xfb\xbe\xb7p\x01?1\x8fD>\x1d\x85d\xbd\xb7m6=\xa2r\x1a\xbd\xec\x8fn=\x1f\x05*>.Q\xae\xbd\xbfl\x17>\xf5\xf9\x1a>\xac\xa9s>\xaa\xd8\x9d=\xc0\xbe\'=\x9fi\xc1>\xd8\'\x1b>\x7f\xff8>]\xccM?\xf9r\x9d\xbe8\x0e\xe6\xbdR:><\xfc\xf5\x95>\x9f\xc97\xbd>d\xca<r\xb4\xd5>\x9a\xcd*>X\x8b\x94>\xea\xa2\x17=}\xae\xd5=\xbd%\xc3\xbe\x14\x05\x9b>\xc2\xe7\xd8<\xc1\x97\x02>\xcd\'\x1e?\xc9\x02\xd2\xbdn+\xca\xbd5\x8eJ\xbe\xd4Z\x91\xbe\xf2\xfew>\x1fm\xb8\xbd\x05f\x8d\xbd\xf0\x8a\xa7=\xf8\x81\x96>\x12\xfa\x8e\xbd\xa0ZC\xbd\xec\x03E\xbc\xfb\x03\xbf=\xfa\xccG\xbe\xace\xf5=6\x849\xbb\xf7\xc5B\xbd$\x06\xaa=\xbb\x83\xb2>\xeb]\xa0\xbeX\xa8\xe0>\xb8\xb2\xd8\xbdU\x7f\x89\xbe8\xde\xb8>[\x0ex<\x16\x1e\xba>^\x9c\xc6>3\xa7\x0f\xbe\xdd\xfe\xef\xbdF\x99\xf5\xbd=\xe2\x83\xbe/\xec\xdd>\xb2\x95\x0b?\x9e\x12U\xbd\xf8?\xbf>\xf1\x05\x0e\xbe\xba\x00f=/\x96\xd7=F\xd0\xeb\xbe@<\xc0>\x1e\xab\x8d\xbe\xd7\x99\xdd\xbeu\xfb\x92\xbe\xb0W\x1e\xbe\xc6q\x80\xbe\xd8\x84\xc7\xbe7\xbc\xdb>\x05\xc5\x12\xbef\xeff\xbe^\xda\x04\xbee6\xe7\xbeX\xcd\xdf\xbdJO\x0b?EN\x96\xbdo\xdf\x96<\xf5\xd8\x13\xbf\xeb\xf2\xc8\xbeo\xd9\xc6\xbeE\x8d^=\xf2U\xca>\xfd\x92\xba=\xa0kz\xbe<\x98;\xbe\x9e\x96\xc0>\xf8\xff\xb6=Xlp=\x1e,\xe5:\x8f]\x01?t\xd6\xd4\xbe^"%>\xe0\x17V\xbe^\x9b\x92>\xd5\xb8\xac>qp\xce>8\'\x04?\xa6\x81\xdf>\x1e\xba\x02>\x85\xc2]>\xe3\x92(='
-p1063
-tp1064
-bsV578816250710622209
-p1065
-g2
-(g3
-(I0
-tp1066
-g5
-tp1067
-Rp1068
-(I1
-(I200
-tp1069
-g12
-I00
-S'9\xc8\x95>\xfe\xc8\xe2\xbd\xba\xfa\xd9\xbe7\x82\xc2=j4\xaf>p6l\xbe*ZF\xbc0\r\x86\xbe\x19\x12\x03\xbey\xde\x0b=;\xf6\r>\xda?\xc0=\xa9\x13E>\'\x9b9>nsB\xbe\x87\xf0\x92>\xb2\xf9\x00=\x8e\xe5\x98\xbc?\x13\x0f\xbe\xae\x8bJ<\x89\xa1=\xbe*\x8e\x9b\xbd_\xe6\r>;\x7f\xda\xbe\xe2\xba\x19\xbdf\xa6\xf2\xbdA\xbe >2\x97\xa5\xbe\xf9_\x18\xbe\xfe\xb8C>2\xd8\xd1\xbd7\x7f8\xbeK\xb4M>\xea\x7f\x92\xbe\xefS\xc5\xbct\xee\x86>X]y<\xc6\xa6r>\xff\x84\xa0>X\xaex=\xba\xfe\x89\xbb[\x16X=W\xb7\x82>\x05\x96\x8d\xbe\xa3>\'\xbe\x12s\x83\xbc\xcf9\xb8>j\xe5\t\xbdy\x13\x8c=\x8c\xff\xaa>*K\xa1=\n\xdb\xe5>\xec\xff\r\xbeRU\x89=\xa6H\xb6\xbe\xf6\xe1U>U\x8dk\xbd\x10\x7f\x8b\xbeL\xe4\xa8\xbeh\x17\xe1\xbe\x81\xfb$>\x93\xef\xda\xbdU\x01u\xbd)\x9b\x8e\xbe\xa2\xc2r<K\xfc\x8b> -\xe4\xbd\x82\x82y;\xdf\xc3\xad\xbe\xe6\x88\xd9\xbd\xd4[ \xbf\x9a\xf6\x7f\xbenYU=\x18\x1b\x03\xbe\'A\x12\xbe\xf6\xd3\x80>\xb2\x98\x80>\x06&\xe7=s\xc0\xfe=\xd5\xb3s>\x15\xcf\x1f\xbeCm\x83=\x02\xb9e>\xb5.\x14\xbe\x1444>\x12\x11\x1a>\xc76\xbc>\x96~\xde\xbe\xb2U\x0f?@\x93\x81=`\xa5\x0f\xbe\xc6\xab\xeb=)p\xa8\xbe\xcc\xea\xc1=\xb2\x89\xab>\xfeW\xd0=&\x11\x1a>K[{>\xf4\x97\x14>Js\x97\xbd\x16j\x0e>\x12\xb9\xcb>\xf4\x99\x0b>\xfe\xd0\'>\xf8 \xea>\x8d\xd5O\xbe\n\xc9_\xbbJt\x0c\xbc\x08\xb1B=\xd3\xc4\xc0=\xd3\no=\x92\xfe\x93>7\x81\x1d>*z\xd0=z\x91\xac\xbd\x9eD\x1a=fM\xa5\xbe\xe2*\xb1>\x98\xa1e=2\xf4\x98=B_\x04?\xc8\xb6L=\x03\x9el\xbd\x82\\\x86<\'\x81\r\xbd\xe3\xc0`>\'P/\xbeA\x01\x02=\xe6fz=S{\xed=9\x1e\xcb=\xa9Y\x01>\xbf\x18\x1d>\x98\xa9==\x00\xe8A>\x8a\x82\x0e>\xa8\xa7\xdf\xbc#\x95\x81=\xc0\x9d\xcf=:\xc6\xcc=\xfe\x923\xbe\xff\xf1\xbe>\x9b\x8b\xf8\xbd\x13\xf1\x8e\xbeF\x175>V0P\xbe\\"\x1b>\x12\xac_>\x02\x97\xae\xbdc\xe4\xb6<\x8b=\xaa=c%\xfd\xbd\xb6\x9d>>P\xa2S>\xb6%\x0b>\xa6j\xca>\x82\xd0\x9b\xbd\x86\x0b\xaa=\xb2m\x1e>\xee .\xbe\x85\xfet>\xe8\x9fr\xbe\xfa\x11\x9d\xbe\x10\x9d\x1c\xbe\x1aq\x99\xbd\xa6\xca\xef\xbd\x83\x95\xb4\xbe\x04\xb9\x9a>\x9a\x17`\xbd>\x0c\x8b\xbdb\x9c$=\x968k\xbe\xd2\xa3\xe2<\x036\xf2>\xe2\x01.={\xaa\x98\xbc\xb5\xc6\x83\xbe\xaa\xaa\x8d\xbe\xda,&=Q\t\xc6=\x03f\xba>\x06\x95-<zV\xa1\xbd\xa3=\xed=j\xb6\x0e>W\xd2;=\x0f!\x88>]\x1b\xd4<\xaa\xd7y>\x90\x17>\xbe\x88+\x88>\xeb\xa4\xef=k\xa2!>\xf0Us>R\x93\x9f>#oY>\x00\xff\x9d=\xf2\x86\xa6=<8\xbf\xbbB\xb30>'
-p1070
-tp1071
-bsV577421595565764608
-p1072
-g2
-(g3
-(I0
-tp1073
-g5
-tp1074
-Rp1075
-(I1
-(I200
-tp1076
-g12
-I00
-S"\x9cI\xbf=` \x7f\xbd%\xe9\xb1\xbe\xe5\xa9o>\r*\x03>\x97\xd9\x9b==O\x83\xbeN\xfa\x0c\xbe\x97\xe79\xbd\xab!\x81>\x1dWB=c\xe0\xaf\xbee\x03'>\x11\xd4\xc9=\xb1\xe0[\xbd=\x98\x90>\xd0)u\xbd\x97]a\xbe,n\x1d=\x0f\xed\xd1=\x07\x90\xdd\xbe\x15Bj\xbd5\x1b\xc4=AW\x1d\xbe\x8cC\xd1\xbd\xca\x05)\xbd\\\xb8\x9b=\xe1\x98\x0e\xbe=\x11\xca\xbe\xdb7H\xbd\xdd\xaez\xbe\n\xe8\x17\xbea\xf3w>\x1f\xd9\xa0\xbe8\x81H=\x9b\x1c\x06?]\x87<\xbe\x94\x17\xb1=\x05\xafg>QV\xb1>M\xdf\x87=\x02c\x8a>\x7f?N>\xf8(\xc3\xbe\xe1\xd6:\xbe\x0bk\x0b\xbcz5\xa9>+\xfd?>X\x97\xc5=\xe3l\xb8>(\r\xf3\xbc\xd1\xec\xe3>\xd5(h\xbegR\x08\xbe\xc1G\x00\xbf|\x8d\x9b>\x87\x86\x18\xbeW\xbb/\xbe\x1df\xdb\xbe\xc8\xac\xc3\xbe\xf7$\x9d>\xcc\x9b\xdb\xbb\xb8\x07\xd4\xbdG\xf2\xf9\xbe\r\x1aJ\xbe\xd7\x97\xa8>OD\x95\xbe\xddq?\xbdB\xe1\xa1\xbe\xa3\xff\x92\xbeo(\x00\xbf\xdb3\xd7\xbe\xbf\xda\x82\xbd\xf1\xfe5\xbe\x9f\xca\x8d\xbe\xa5\x1c\xc2>\xc9H\xb9>\xa1\x02\x10>\x1cj}>\xf3\x90\x04>\xec\xb6\x01\xbe!k\x1c;;\xbf\xf4>\xfbj\x88\xbe]\x1c\xee=\x88\x01b>Y\t\xa7=\xf7\xea\xeb\xbe\x04\xcb\xf4>\x17\xa9T>\xd3\x88n\xbd\xe7.\xbd<@\xf1\x15=itU=\xb7\x1b\x15>\xbb\xfb\x14\xbeQ\xe2\n>#\xec\xff=/%\x84>@\x8a\xce=\xc0f\xbb;\x1dQ\xa3>\xe0\xea/>E\xc28>(\x13X?\xd5\xdc\x91\xbePL\xf0\xbdk\xe3=:\xf5S\xad>\xff\xe8\x9c\xbd\x91\xe3\xf2<XF\xd7>\xc9-\x0b>\xf1\xf8\x91>k\xcb\x1f=\xf2\xf7\x11>Q\xad\xb6\xbe\x1d\x9c\x84>\x0c~x=\x1fE\xe8=\x7f\xde\x1a?\xfdg\xfe\xbd\xc4\xfc\x98\xbd\x0cXt\xbe\xaa\x80\xa5\xbe\xb7\xd3g>\xb1Lf\xbdm\xb5\xc5\xbd\xabf\xb2=\xf5<\xa6>!1\xfb\xbd\xf0k\xd7\xbdw\xca\x0c\xbd[A\xb9=\xbdi\x84\xbe\xf4\xeb\xf1=\x17\xf4P<(\xd5\x9a\xbd\x82\xdb\x99=\xa9'\xbb>\xfb,\xac\xbek\x13\xda>1D\xa5\xbd\xc0\xf0a\xbem\xd9\xba>8\x13O=H\xcb\xbe>aN\xc6>%\x1d%\xbeQ\x13\xf4\xbd\xefK?\xbe\x0b\x82\x8a\xbe\xa4\xd8\xe4>\xefn\x10?y\xe9\xab\xbd\x99u\xa5>\xaam\x17\xbe\x0bVd=\x8d\x02\x8f=\xbdW\xff\xbe\t6\xbe>O\x1bz\xbeDj\xdf\xben\x87\x85\xbe\xc1T$\xbe\xf91}\xbey\x95\xb8\xbe\xd5\x91\xdf>%oB\xbe\xcc\x16\x8f\xbe)\xbf#\xbe]\xdf\xef\xbe<\x17\xfe\xbd\x99\xbe\x05?\x94`\x9e\xbd\xab\xde\x99<\xb3D\x1b\xbf0\xa9\xbb\xbe\xf56\xe6\xbekP\x82=\x13Z\xc7>\x93Q\xee=\x91\x9a\x8a\xbe;\xc2]\xbeP\xf7\xd3>?\x01\xb9=\xce\xb2\t<+\xceE<So\x01?\x81\r\xdf\xbed\x10\x11>r\x93\x8d\xbe:\x95\x88>0\x0b\x9e>\xbc\x0e\xce>:m\x05?\xff\x85\x02?3\x1b\x08>iE\x87>\x8b\xbe\xbe<"
-p1077
-tp1078
-bsV590410320172187648
-p1079
-g2
-(g3
-(I0
-tp1080
-g5
-tp1081
-Rp1082
-(I1
-(I200
-tp1083
-g12
-I00
-S'\'o\x04>\xec\x81Q\xbd\n\x15\xac\xbe?\x8aZ>_M\x04>J\xb4r=\xfa\x89\x7f\xbe5?\x1f\xbe]\xb03\xbd\xc6\xa1r>\x9dov=\xaf\xf3\x94\xbeO\xb4\x1f>\xfa\xbb\xd0=\xad\x04j\xbd\x7fg\x8f>\xd9v\x81\xbd\x87lP\xbe\xdf\xd0X<\xb4\xfa\xa4=\xda(\xc5\xbe\xb7fp\xbdf]\xeb=\x1a.%\xbe\xfd;\xd4\xbd\x05\xe5,\xbd\xf7\xd0\x9c=\xd7/\x0c\xbe`&\xbc\xbe\x19\x92X\xbc\xf96]\xbe\xf4\xd1\x1f\xbe\xe0\xf9n>Q \x91\xbe\xd9\xb7Y=\xb1\x9f\xf9>\xcf\x80\x10\xbe}\xe7\xa4=Z&t>\x9b\xea\x9f>\x1dnl==\xb5]>0\xc8E>\x84\t\xb8\xbe\x13;/\xbeW\'\xbe\xbbB\x1a\xb1>\xb4m+>\x8c\xa0\xa3=\xac\x88\xbb>\xf9\x8c\xd3\xbc\xad\xcd\xd2>]\xd7G\xbe\xa4t\xfa\xbd\xc6\xb4\xf7\xbe3A\x8f>\x83\xe8\xfa\xbdc\xbf\x0f\xbe\x10\xe4\xd9\xbeav\xbe\xbe1 \x8e>,\x1aK<\\\x85\xac\xbd\xf4\xc9\xe6\xbe\xa1\xcdD\xbe\x00&\x9c>\xb0\xd6\x89\xbe\x040J\xbc\\#\x97\xbeq\xde\x85\xbe\xbcl\x02\xbf\xa9M\xce\xbe\x04\xf5\x8a\xbd\xf4"+\xbe?6y\xbe&f\xb5>\xe1\xad\xa4>:)\x0e>\xb9*p>\xa2\x84\x01>!!\xf1\xbdI%\x1b< \xfb\xe8>4\x80\x85\xbe\xde\xa4\x08>\xb9CV>\x86-\xda=\xd4\xc3\xde\xbe\xc1\x94\xe9>\xf7X;>\\\x1a\x84\xbd\x00\xcc/=_,F\xba\r)y=\xe8i\x1e>.\xd7\x01\xbe\xaf\xf0\x1e>\x9c\xe5\x11>T\xe9r>A\x89\xab=\x87\xc7\x87<\x86R\xa0>\x0f\x1e$>%W)>j\xc8G?\xcfo\x89\xbeCi\xd3\xbdzEi<G\x84\x97>!\xd6\x89\xbd0W\xd7;\xe6\xed\xc9>6\x00\x19>\x0c\xd3\x88>\xd4\x01\x0b=,4\xf7=Q\xe2\xac\xbe\x8d\x1c\x83>\x07\xfau=\x8f\xed\xf8=}\xb6\x12?az\x9b\xbd\x07\xfd\x88\xbd\x8f\xba^\xbe!\x9d\x94\xbe\xed\xbd^>@\xa2q\xbd\xdc\x13\xa1\xbd\x9be\x9e=\xe0\xe3\x99>S\x86\xbb\xbd\x01\xe7y\xbd\xd0U\xe3\xbc6C\xa4=o\x01^\xbe0r\xda=^\xb4\x90;\x06\x8d\x93\xbd\'x`=?\xf2\xa8>\xcbj\xa0\xbe\xa9\x7f\xcc>VO\x88\xbdo\x8ft\xbe\xac\xee\xab>\xa0\x92\x0f=4U\xae>_X\xc1>`\xda\x1b\xbe\xbf\x0e\xc2\xbd\xb2\x9d\x1c\xbe\\y\x82\xbe\xbcf\xd6>y\xdd\x03?M\xac\x92\xbd\xe3H\x9c>\xe7<\x04\xbe\x1f)X=\xe1\x11\x8a=\x1fc\xe8\xbeDN\xa8>\xe3\xa7~\xbe\xd0\xf8\xd5\xbe\xc0Ik\xbeX\x99\x13\xbe\xfa\x88R\xbe\xe7\x88\xae\xbejT\xd6>g\xa7*\xbe\xd9 \x85\xbe\x81\xf1\x15\xbeq\x94\xd9\xbeO-\xde\xbd\xcf\x90\xfd>\xff\xbf\x95\xbdJU\xcf;\x88\xe5\x10\xbf\x99O\xb7\xbe\xcfb\xc2\xbe\x8a\xc8\x97=\xa6v\xc0>\xdf^\xc4=\xd3\xa5{\xbe\xafKO\xbe\x1cb\xc7>\x9a*\xb5=<,\x17=\xa1\x10n<\xa4\x8a\xf4>\x11\xcc\xcf\xbez\xf0\x15>S6e\xbe\x84\xeey>S\x1c\x9b>\x1f\xa3\xcb>\xbc\xcf\xfe>\x01\xbd\xe3>l\xc8\t>\xa1:w>J\x0b\x0b='
-p1084
-tp1085
-bsV580238842353094656
-p1086
-g2
-(g3
-(I0
-tp1087
-g5
-tp1088
-Rp1089
-(I1
-(I200
-tp1090
-g12
-I00
-S'L\xc25\xbdf\xfa\x82\xbd\x05c\xd1\xbeK\xc7\xd5>W\xd26=j\xf0B>3\xe4\xd6\xbe\x0c\xae\x98\xbd\x9bn\xb5\xbc\x8e\xba\xb3>%\x92?=]~$\xbfLg8>\xd7\xe9\xdc=\xe6\x12\x81\xbc\x14\x98\x80>\xf4 \xa3\xbdR\x0e\xcd\xbe\xc1\t/>q\x05a>\xc1d#\xbf?\xb1\xba\xbd\x1bY\xba=l\x99\xf2\xbd\xcc\x1c\x18\xbe\xe7\x8d\x9a\xba\xdb\xbe\x91<\x0e\xea\x99\xbd<\x15\t\xbf%\x1cI\xbe6\x81\xc4\xbeM\x8bO\xbe\xcfO\xba>\xc7\xa6\xcd\xbe\xcc\xe4\x0c=*\xefF?\xb9\x88\xdf\xbeK\x11\xa3=\xbdmF>\x9c\xa0\x14?\xbcV!>}.\x10?\xcc\x0b[>\x8aY\x07\xbf\x88F\x8a\xbe\xb0\x1d\xba;G\xa5\xb1>K\xf9\x9a>\x196\xfe=\xfc\x05\xcd>9\x84\xb3\xbd\xbbX\x0f?\x04~\xa9\xbe9u\x82\xbe\xd3\x86\x1c\xbf\xa88\xd6>\xc4\xb1\x81\xbe\x0clk\xbe\x18\xf8\xe0\xbe\xad\xe6\xd5\xbe\xe2\x9e\xe8>95\xee\xbd\xd4&V\xbe\x87]:\xbfG\xee\xa8\xbe\xac\x16\xf4>\xa2\xcd\xd3\xbe/\x11K\xbe>`\xe8\xbe\x17\'\xe3\xber\xcf\r\xbf\xdc\x0c\x16\xbf\'I\xfc\xbd\xe5t\x7f\xbe\x15\x9f\xe7\xbe\xf7\x17\n?!a\x04?\x06\xb4%>\xbe\xfd\xc1>j\x86\x90=\x177E\xbeR}6\xbc\xe9l*?\x07\xd5\xb1\xbeL\xd2\xad=\xf4\xb8\xa8>\x8b\xc1\x1f\xbd\xce\xef\x1f\xbf\x08\xcb\t?\x0cG\xa8>\xec\x0b\x8d<\xef}\x83\xbdd\xe0n>nX\xa3=\xdd\x00/=\x82\xd3\x8d\xbe\x92\x1f\xd8= \xe1\xd6<\x1c\x1f\xba>K\xcdp>\xc2\xc1Y\xbd\x13=\xca>\xa27\\>brh>?\xd5\x9b?M\xe5\xbf\xbeP\xd8m\xbe\xdfu\x01\xbd\x7f6\x11?\xe6\xe4!\xbe\x1b\x93\xbc=h\x08\x12?\x1e\x86&>\xdb\x1e\xde>T\x9b\xd8=\x1f\xf1S>\xe0\x03\xe9\xbe\xc5\x17\x8e>\xdb4==\xdcu\x0f>\x97\xcd@?\xb8\xa0\x97\xbey\xb1 \xbe}\x94\xca\xbe-H\x15\xbf\xed\x08\x8b>\x0f\xa5/\xbb\x02\x9e.\xbe\xc2d\x02>R\xec\xfc>\x0f\x92a\xbe<\xedk\xbe\xd9\xaf\x0b\xbe\x8a\x0e\x13>\xbfx\x0f\xbfD6\x1d>\xd4E9=\x83\x8f\x02\xben\xbf\xed=\\S ?D0\xf7\xbeT\xb1\x0b?8\xfe-\xbe$\x88d\xbe\xab\xc8\xfe>C\x86\x00>\tD\x10?\xcf\xc3\x01?\xf7J8\xbe\xe7G\x81\xbe\xbb\xe1\x9a\xbee\xd4\xbf\xbe+\x96%?R\xf7`?\xa9c6\xbe\xbd1\xca>\x1ecG\xbeT\x89\xc7;\x98\xfa\xc5=\xc4\xb1@\xbf\xe9\x9d\x1d?\xab\x9a\x93\xbeY\xad\x13\xbfAS\xd1\xbet$\x86\xbe\xb5V\xcf\xbe:\x17\xd6\xbe\x9cZ\x1e?\xfc2\x98\xbe\x98\xba\xd2\xbe\xb6a\x9c\xbeO\xb94\xbf.\xf8f\xbe\x10"(?\x99\xe5*\xbeV\xb62=\x12\xe8_\xbfd\x03\xf3\xbe\xecw\\\xbf6\x8d\x1f=t+\xfb>\xccs%>\x97\x1e\xb8\xbe\x8c\x19\xc6\xbe\xdd\xbd\x12?\xc4\x10#>`j\xdd\xbd\x8b\x89\x00\xbd\xe8\x18C?\xa9O&\xbfp\xa9\xc5=\x99a\x07\xbf~\x19\xe3>\xb9u\xd9>`\x9a\xf8>\x95\x19??\xdd}X?\x87dB>\xdb\x8e\xdd>\xc9\xffs\xbd'
-p1091
-tp1092
-bsV580228070507876352
-p1093
-g2
-(g3
-(I0
-tp1094
-g5
-tp1095
-Rp1096
-(I1
-(I200
-tp1097
-g12
-I00
-S't\x98 >\x97\x16\x1e\xbd\xef3j\xbeh\xfc2=`:\t>\xbf\xc3g\xbcO?\x90\xbdO\xd9\xee\xbd\xd7\xd7\x01\xbd\xbb\\\x0c>P\xf7\xf6<\x89\xf4\x8a\xbd \xd8\xb8=/\xd6\x0b=\xdb\x8ft\xbd\xc0\x05F>\x8e\xea\t\xbd,\x0b\x9a\xbd\x80\x85x\xbd\rpY\xba\xfc\x0b7\xbe0\x15\xdd\xbb\x93\x91\x91=\x1b\xee\xe8\xbdD\x8e-\xbd\x89C\x81\xbd`\xfa\xd1=\x87\x9f\xe8\xbdS\x13C\xbee}\xa6<\xd7h\x96\xbd\xc0\x11\x89\xbd\xa5\x0e\xc3=}\xf9@\xbeE5[<\x00\x95g>\xcd\x9f\xdd<\n\x1d\x84=\x8b\xed:>\x9f\xbd\xc7=Y\x18\xda\xbc\x85\xfa\xe4<\xdb(\xe4=\xb1\xd0$\xbe\x17\xe7\xc3\xbd!\xe6\xb1\xbc\xa3\xd0q>;0U=\xe4\xd6"=k\xbb|>\x8b\xfe\xdb;\xeb5\x81>\xdbG\xd7\xbdc#\xc5\xbc\x10\x04\x8b\xbe&\xb9\x16>\x9c`\xc7\xbc\xf1\xaa\xa9\xbd<\xa8\x93\xbeO\xa0}\xbe\x82\x0f\x1a>\x9b\xc7\x8d=m\x93\xc5\xbb\xb8Y=\xbem\xf9*\xbdr\xd7\x19>\x7f\xd1\x1d\xbe\xad\x9a\xa2=\xf9\xca\x1b\xbe\x17c\xcf\xbd\xb5s\xa0\xbe\xd7\x8dN\xbe\xfd\x88f\xbc\xf7\xa2\xa6\xbd\\\xd2\xeb\xbdyU\x13>-D&>\xb1\x82\xbe==D\xd6=\xdfe\xec=\xa3\x15Y\xbd\xac\xcd\x1f<[mm>\xfa\xaa\x15\xbe\r\x84\xca=0\xa5\xab=K6\xf1=->i\xbe\x11\xdb\x94>\xc5}\x92=8\xdd\xb6\xbdu>\x92=\xdfV\xd7\xbd\x1b?\xa6<\xb8x&>O*\xd1\xbcky\xe7=\xd1w\x15>\xc5\x19\xfa=O\xbeX\xbc#\x82\xcf<8rG>\x91t\xb8=ik\xbc=\xf8\xfe\xab>\xb1\xc5(\xbe\x99\x016\xbc`]7=\xeb\x93\xb1=#;m\xbc\xc1\xd1j\xbdw0 >\xbf\x06\xa6=\x88g\xfa=-\xc0\xa7<5\xb51=q\xd0X\xbep\x0e&>7\xd2\x9c<\x95\x15U=\xe7=\xa6>R\xb3\x01=Y"\xcc\xbcoJ\x8b\xbd0w\xa2\xbdt\x85\x12>\xb1\x11\x8c\xbd#7\xb0\xbc\x05^\xe1<\x857\xd7=!\x91\xbc\xbbW\xfb\xf3<8W\xd0<x7\xbe<\xcd\xdex\xbcU\xef\x91=\xe5R\xd5\xbcg\x14\x82\xbcD\xbfo;(\xed\xcf=pm\x0b\xbey\xf7U>\x90\xae\x12\xbc\xe0\xe75\xbe}\x9d9>u\xda\t<R\x08\x1a>(si>S\x92\xd4\xbd\x7f\x9e1\xbc\'\xber\xbdh\xf9\xfc\xbdy\xb1@>97`>\xa3\xb2\x8f\xbc\xc5\xdcb>\x9f\xe1\x9e\xbd\xe8\xd7j=\x9dr-=W\xdcL\xbec\xb8\xc4=%Y\x18\xbey\xb9n\xbe\xcc\xb6\x0c\xbe1Yb\xbd\x81N\xab\xbdj\x94\x80\xbe/PL>\xa8\xa4b\xbd\x10\xf6\x9c\xbdW\xfe\xb9\xbc\xad\x076\xbe`B\x03\xbdn\xc3\x9d>\xdf\x80H<\xbf\x9c*<<\x95\x84\xbe\x85\xf6[\xbe\xe4I\x88\xbd\xe8\x9c\x82=\xb9r[>7uY=\xe8%\x01\xbe}Y\x96\xbd\xc5AG>K)s;\x84t\xa8=i2\x02=\x00PV>\xa3(\x16\xbeGE\xdd=\xaf\xd6\xd2\xbcq\x11\xdc=}\n\x0f>\xb3\xc9w>\xb0yy>\x1d\xad\x05>\xbd-m=\xfb\xed\xa1=\x8b;H='
-p1098
-tp1099
-bsV577645651523215360
-p1100
-g2
-(g3
-(I0
-tp1101
-g5
-tp1102
-Rp1103
-(I1
-(I200
-tp1104
-g12
-I00
-S'4T9>#\x97\xfe\xbcMdT\xbe\x93\x82c<\x0b-\x14>0]\xbd\xbc\x18?\x10\xbd%_\xfc\xbd\x08Wt\xbd;\xfd\xe6=\x01\x0c\xed<\xbd\x96\x1c\xbd\xad\xb6\xd3=\x80>6=\xc1nm\xbdS\xa5P>\x05\x0c\x0c\xbdL\x8ej\xbdWo\x99\xbd\x15*\x81\xbb\x9f\x95\x14\xbeC4<<$IO=,c\xd9\xbd0\n\xb7\xbb\xdd\xd5\x90\xbd\xbcE\xc3=\x1bz\x01\xbe\x03\x9b4\xbe\xd3\x1bA={\x06\x94\xbd\xd7\xa3W\xbd\x1d\xbc\x8e=\x9bg-\xbe-\xfb\x16=\xea\x1a%>K\xb2V=\x84\xf1\x9b=)\xd9?>\xcdgs=\xb8\x7f\xd5\xbc[\xb7,\xbcX#\xfd=m\x1f\x1b\xbeM\x8f\xa3\xbd\x99\x82\x96\xbc\xbd8Y>-\x9a+=\xfc\xf1\x01=] h>hA\x9a;\xfd\xecr>\x85H\xc3\xbd;\x9e\xc5\xbb!/\x82\xbe\xb0\x8b\xe6=\x8fv\xf8\xbc\x97\xc2\x83\xbdRg\x9e\xbeU\xb9v\xbeJ\xab\x06>2-\xaa=\xa7&\xee<\xe8\xdf\x1a\xbeR{\x0e\xbd\x90A\xf0=\xed\xbf\xfe\xbd\xd1f\xd5=d\x16\xbe\xbd\xa0\xb9\xab\xbd]a\x9b\xbe\'\x1a.\xbe,AF\xbc{\x06\x81\xbd\x13\x87\x96\xbd\xb5T\xff=]\x9f\xe9=4\xe6\xad=\xcdj\xac=\x7f\xfd\n>@\xd2U\xbd\xb9\xe6E\xbaU\xa8A>\x13D\xfe\xbd\xa1$\xbb=\xbcR\xa5=KR!>3A6\xbe\xa7&\x8b>\t\xf2\x1d=\x93\x9c\xb7\xbd\x95#z=@6\x06\xbe\xd4\x9e\x81\xbc\x13\x0b+>\xd5\xde\x1a<\x0bn\xd8=?\xd7\x14>\xd7~\xb9=\xc7\x86\x0c\xbd\x9b\xc6^=\xec)2>\xa5F\xbb=\xa5O\xb9=\x06\x06\x9c>Ut\t\xbe\xdbAP8\x7f\x93D=\x907m=\xf6q\x89;\xc7\x07{\xbd\x9c\x8c\x18>\xa7/\xa5=\x98~\xc2="<\x9f\xbc\xa4\x91\x17=}!8\xbe\xdb6*>\xec9Q=\xbf\x0f\x8a=\xd5\x84\x98>\xc0SQ=\xb5\x18\xd7\xbb%\xc0\xca\xbcy\xfc\x05\xbd+\xa2\xf6=\x936\xaf\xbdD\x8f\xc2\xbbN\xd9\x0b=$z\xd6=D[#\xbcT\xbb\xe9<\x1d\x8eK=CM\xc0<\xdf\xf5\x17=\xa7\xde\x1a=c\x17\xeb\xbcG\xca\xa5\xbc\x95\xb4q<\xb7\xd8\\=\x8f\xba\x03\xbea\xf0E>\x1e\xe9\x89</\x86%\xbe%\xbe\'>\xb0M\x94;\xfd\xe6\xda=\xc0\xddA>\t\x1f\xc8\xbd\x91\xcb\x15\xbc)\xf63\xbd0\xcf\xe3\xbd\xbb\xee\'>\x05\xd5(> po:@7G>\xc5\x1b\xa6\xbd,\x1e\x9f=ID =q=5\xbe/\xcb\x9b=\x9bY\x16\xbe\xa8ZY\xbe\xbbn\xcd\xbd#\xc7\xd5\xbc}\x08\x87\xbd\x812[\xbe!\r.>\x1d\xb1\xe2\xbc\xd7"\xad\xbd[\x18L\xbcx\x14"\xbe#T\xf5\xbc\x88\x1c\x87>\x85\xca\x82<\xe9_"\xba\x07\x8cf\xbe\x0bsZ\xbe\xad\xe5\xb1:\r1k=+E5>\xab-\x1b=/\xab\xf4\xbd8\xb1\xa5\xbc\xc1_2>\xbb$\x0c<\xb7\x19\xa8=7k\xeb<\x88~6>\xaf\xee\x10\xbe\xa1\x0e\xfc=\xf9\xabB\xbb5I\x80=\xa7\xbe\x0b>E\x85s>\xcf\xdaB>-=\xb5=\xa1\xd4L=\xc8\xcf\x81=p\xa8\x8f='
-p1105
-tp1106
-bsV580213477261885441
-p1107
-g2
-(g3
-(I0
-tp1108
-g5
-tp1109
-Rp1110
-(I1
-(I200
-tp1111
-g12
-I00
-S'Pu >n9\x12\xbe\xc9X\x1f\xbf7\xed\xea>\xc3\x0eJ>;\xae\x1f>\xea\xde\x08\xbf\xd0\xfam\xbe]^\x18\xbd\xa4\x19\xf9>\xa2\x9b\xd5=\xa4\x01%\xbfwn\x88>e\xa7\x15>\x8c\xb6\xa3\xbdnq\xfb>\x99o\xd1\xbd\x8fj\xd6\xbe9\xb7\xcf=\x06gK>\x87\xd7L\xbfGp\xde\xbd\x0b\xd1D>\xf1\xdd\x9b\xbe\xac\xaea\xbe\x96nz\xbd\xffo\x06>\x96b_\xbea[A\xbf(\xd2\xc7\xbd<\x1e\xd4\xbe\xab\xeb\x98\xbe\xc3\xf0\xde>W\x02\x0c\xbf0\xe9\x94=\xea\x0b~?c\x1f\xba\xbe[\x9f\xde=\xf8\xda\xd2>\x1e\xd9&?f\xbf\x06>^\xb2\t?%/\xb8>\x91\xd81\xbf\xda\xee\xba\xbeB5%\xbaVY&?\xa7\xae\xb8>\xa1\x19<>\x86\x84,?\xd0<3\xbd\x9d\x9eM?\n\xb9\xe8\xbe\x82\xfd\x95\xbe\xcc\xe5i\xbf\x93\xf1\x18?xb\x84\xbe\x8eY\x99\xbey\x1d=\xbf\xf0\x8a,\xbf\x11>\x1a?\xa8\x8e#\xbc\xdb\xcfB\xbe\xc5\xb9j\xbf\xb4s\xd3\xbem\xcf\x1f?\xb6\xb5\x0b\xbf\xbeu\xa7\xbd\xa8\xd1\x1b\xbf\r\xaa\r\xbf\xbe\xe3g\xbfa\x1dK\xbf~X\x03\xben\xe3\xb6\xbe\xb5u\x06\xbfc\x069?\xf3t*?hF\x86>[M\xef>\xae/K>\xcd7}\xbe2\xc2\x9a\xb9CHa?0\x1f\xfa\xbe\x13\x05E>2k\xd3>7\xed\xdf=K0Y\xbf\x0c\xb2X?\xcc@\xd5>\xb3\xa9~\xbdB\xaf4=\x1e\x11\xd6=X\xef\x01>\xd1al><\xd5\xa8\xbeecw>q6J>\xff{\x04?\xf7\xf8\x7f>\x7f-\xa9\xbc\xf6\xc4\x15?\xcf\x99\x9f>\xec\xa4\xa2>\x1b\xba\xc5?c\xa9\x07\xbf=\xa5i\xbe\x1a\xc6\xc7;f\xe4#?2\x1e1\xbeC;B=\x03\x86??\xbc.x>\x15\xf4\r?MS\xd7=\xee\x9d\x88>\xd5\xa1*\xbf\xc6q\xe8>\xf3\xcb\x02>\xc6uV>\x92\xdc\x8c?\x19\xf4[\xbe\xdc\xab"\xbez\xdc\xf0\xbe\x94b \xbf\x0fp\xd8>\x08\xbb\x94\xbd\xc2\x9d@\xbe\xdd\x83\x1c>\x83 \x1e?\x9d\x8dS\xbe\x9eD@\xbe9\xac\xc0\xbd\xdf\xfa\x1f>\x93n\x07\xbfkPi>\x82\x15`=\x92]\x19\xbeE\xf5\xfb=\xcdJ6?\x1dC \xbf\x9e\x16I?\xf9\x10\x14\xbe\xf4\xb9\xd8\xbe\\\xa4\'?\x15.\xc7=\xd1\x1f;?\xe7\\;?W\xb3\x9f\xbe\xe8\xb4k\xbe\xc9\x06\xb8\xbe<?\x04\xbf\xf3\xffN?Et\x8a?\x92\xf31\xbeh\xaa\x15?\xb71\x85\xbe\xf8\xd8\x92=R\x91\x04>\x04\xc5p\xbf\x0c\xb49?\xa2\x1e\xde\xbe\xd7\xb1O\xbfv\x97\xec\xbe\xe5\x1d\x9f\xbe\xc7b\xdd\xbeZ\x84,\xbf\xeb\x8eX?\x94\xd0\xca\xbeR[\x02\xbf\xa4\xbb\x9c\xbe-\xc5]\xbf%"k\xbeU\xefz?\xd0\x9f\x17\xbe;\xeb\xf1<FA\x8c\xbf\x8a\x88+\xbf\x87\x0ee\xbf\xe0\xa2\xf8=\xf3}-?\xe7\xa2c>\xcd\x7f\xff\xbe\xa5}\xe8\xbe\xd2k@?-\xaf\x1d>\xf9\xe0\xa5<\x18\xf1\xb1<\xbe[w?\xebGL\xbfbyV>\x19D\x07\xbf\x83f\x04?\xafs\x06?\xed\x0b5?2\xb5x?|\x0b|?\xbb5\x88><\x0c\x00?O$\xa2<'
-p1112
-tp1113
-bsV580202884136062976
-p1114
-g2
-(g3
-(I0
-tp1115
-g5
-tp1116
-Rp1117
-(I1
-(I200
-tp1118
-g12
-I00
-S'\xb1\xc9\xc4=\x93g\xe9\xbd\xe31\xd3\xbeH"\x85>GS\x1c>,,\x9c=\x96J\x96\xbe\xb5f\x0c\xbee\xc1\x0f\xbd@\xf5\x9a>\xf0\x80\x95=\x93o\xbb\xbe\x966?>\xfdc\xb7=S4\x9b\xbd\x19\xe2\x99>\xce\xa7K\xbd\x0c\x0e}\xbe\n\xac<=.\xdb\x04>\xfb\xb8\xff\xbe\x82\xfc{\xbd}\xba\xda=\xe3\xc7]\xbe\xfdW\x0c\xbe\xd1`k\xbd\x10\xbb\xd0=\x11\xeb.\xbe\x16\xbe\xef\xbe\x8ds`\xbd\xa0\x8dx\xbe\xa3|/\xbe\xcb\x1e\x92>\xce\xb0\xb6\xbe\x8b\xab\xab<!\xe1\x18?\x05 c\xbe\xc4F\x99=\xe3\x15\x84>W\xcf\xc5>\n\xfb\xa0=$\x07\xac>B\x9ea>\xd6\x97\xe0\xbe\xef\xe8V\xbe`\xfc_\xbc\x05\xdc\xd3>\xd3qG>la\xe0=\xae1\xd4>v\xcd;\xbc\x9d\x89\x07?c\x82\x91\xbe\xdd\x94(\xbe\xe4\xd9\x0f\xbfb:\xc6>T-\x1f\xbe\xf6*\\\xbe\x14\x1c\xeb\xbe=)\xdd\xbe\x18\xd4\xc4>\xb3\x95\x02\xbd\xe3\x14\t\xbe\xa8\xc9\r\xbf\xd40^\xbe\xba\xaa\xcb>\x93f\xb4\xbe\x08\x0cc\xbd\xe8\xeb\xd5\xbe}W\x9f\xbe\xe8e\x11\xbfG\xe3\xf2\xbe\xc8\x11\x1a\xbdL$X\xbe\xf6\xc7\xab\xbe\x87{\xe0>{,\xe2>\x0c\xaf->\x0f\xcb\x82>7\xc0\x13>\xfee\'\xbeLL\xdd9\xe1\xe1\x0e?w3\x99\xbeR\xe2\x08>\xf9\xf3}>R\xc8\xbc=\xb5\xe2\n\xbfr\x01\t?\xde\xba\x89>\xe3\xeb\x87\xbd\xb6\x08\x15=\xedG\xc4<\xbd`\xc9=\xa2h>>\x8d\x08<\xbeH\x13\x00>Bq\x14>E\xae\x9e>"\xe3\r>\r\xedk;\xda*\xc5>\xaa\xf0J>IoD>\xe0\x9ai?\xee"\xaa\xbe]*\xfc\xbd}\xb1#\xbc\'M\xc0>d/\xc4\xbd\xe4\xb4?=>\xfc\xe6>\x98s\x01>\xf7\x93\xa1>TOS=\xd0\xb7&>\x16\xcf\xd5\xbe\xe8\xbb\x92>\n\xc1i=\x9e\x86\xf0=\xff\xad1?\xa3\xdd\x14\xbe54\xc1\xbd\xa8B\x8b\xbeV&\xb7\xbe\xab\x95\x8f>\'\xd8y\xbd\xe0"\x04\xbeS\x9b\xad=r\x1b\xae>\xd4\xf6\xfc\xbd{\x83\xe4\xbd\xe2\xe63\xbd\x12\xbe\xc6=?=\x90\xbe\x9e\t\'>1\xca\xe1<1\xe3\x98\xbd\x13.\xd2=/\xae\xd9>\x85\x14\xbc\xbec\xcf\xf5>\xcd\xc0\xec\xbdY\xf2\x87\xbe\xc9\xc6\xc5>\xf3\xa1(=*\xbf\xe3>\xb4\xca\xdc>C\xc2T\xbe\r\xa7\x12\xbe\xac]i\xbeq\xae\x9f\xbeq\xcb\xf4>c\xc5&?\x18\xf1\xca\xbdi.\xcc>S5 \xbe\x88\xac==\xd3,\x9b=\xbd\x8e\x0f\xbf\rk\xe8>M]\x87\xbe#6\xf7\xbe\xd1\x8d\x9c\xbe\xd3\xc7K\xbe!\x99\x92\xbey\xca\xe8\xbe\xf8\x9b\x02?(\xab\x80\xbe\xca\x7f\x93\xbe\x96;%\xbeh\xb6\x00\xbf\xca \xe0\xbd\x15K$?\x80\xa6u\xbdu\xf7\x12<\xc9\xd8*\xbfX\x0b\xce\xbe?\xe5\x08\xbf\x1a|\xa3=\x87\x17\xe4>8\x1a\x1b>\xef\x9d\x98\xbe\xc7r\x87\xbe\x9e\xff\xe0>\xc6\t\x95=C\x8e\xd6<\xc0\xa7\xa6<@\'\x13?\xc7\xdc\xea\xbeK\xce\x0f>\x96A\x9b\xbe\x9ep\xa8>\xfd"\xa2>T\xe9\xe0>\\\xb9\x16?\x8e\xf1\x15?\xc35 >\x98~\x94>\xe4:K='
-p1119
-tp1120
-bsV578782400278327296
-p1121
-g2
-(g3
-(I0
-tp1122
-g5
-tp1123
-Rp1124
-(I1
-(I200
-tp1125
-g12
-I00
-S'\x1fZ\xc4>\xc0\xea\xe9\xbd\x1c\xdb\x9d\xbeQ\xe9\x9e\xbd\x8e_\xb1>\xa2\x845\xbe\xa1 \x94\xbd\x10g\xa8\xbe:\x93\xcd\xbd\xa9\xad\x14>Y\xd3\x93=,\xc05=\x1e=\x12>\r\xba\x86=)\x983\xbe\xff\x88\xfd>o\x1f\xd4\xbc\xda>\xa4<z\xe7V\xbe\xd4\xda\x86\xbd\x87r^\xbeS\xae><\x17\x9a0=y}\xb3\xbe\xf1\x9b\xcc\xbd\xadD\xc9\xbd\x9d\x8cV>\xfa\x05\xb1\xbel\xe1\xa8\xbe0\x03\x1a>\xf0\xa0\xf2\xbd\xa9\x84\x12\xbe\xe2A\x1d=\xdd\xcc\x95\xbeL\xa2\xe1=\xe5\xa5\x8b>\r+\x95>o\xcb\x81=\xc5\x0e\x99>\xc2<\x16>\xf9\xd9\x8c\xbdq\xe9L\xbe3w\x0f>A\xaf7\xbe\xccp2\xbe41\xfb<}b\xbd>q2\xa2<\x1c\x90\x1e=gb\xbf>f\xa2p<\xc5\xb7\xa9>\n\x0cE\xbe\x9f{\x08\xbd\xec\xf6\xe8\xbe\xee\x93\x1c>m\xd3\xa4=7\xd63\xbdy\x84\xfe\xbe|\x0f\xe0\xbe\x93\xf26>\xbf\xcdb>\xc0Pl=\xe4,\x19\xbe\xd9\x91\x9f\xbd\xc7\x89}>lB\x8d\xbcB+\x86>\xc6\xa6a\xbe\x86\xbaq\xbe\xccN\xe4\xbe\x16\xe7e\xbeW\x84\xc0\xbdg\x11%\xbe\x81n\xb2\xbd\xc1* >\x86\x92k>\x03\x81d>\x99\xab\x89=\x1b\xff\x90>\x0cz\x1f\xbb\xda\x82(\xbd\xfak\x1d>P\x1b-\xbe\x12\xb0\x17>\xf2\x821=\x06\xd3$>\x84SR\xbe\x0f\x14\x18?\xfe\x84\xb8=S\xf1\x08\xbe\xaaHS>&\xb1\x8b\xbe"X\xa6;\xb9&\xc3>\xb1\xea\xb9;\xaa\x11\xbc>\xbf\xd2\x92>\x05\x0b\x15>\xe1\xb6(\xbd\x84\xa7\x87;\x16&\x91>P\x93\xef=\xecv#>\xc7\xff\xe3>\x01\x81\x97\xbe\xb0\x17\xc9=0o\x9b=\x17\xc7\xa9=\xbdO\x9c\xbc\xd7Q&\xbe\xf17\x80>\xdf\xaa\x0f\xbd}X\x15>\xe4\x8a\n\xbb\xc7\x1ak>\xce\xd1\xb9\xbe\xb4E\x96>\xdab\xd5=S\xe5\xb9=\xe6\x06\xde>\xb2\x10\x96>\xd9\xbd9=|\x9bg\xbd\x86\xd0\x98\xbc\xa5\xcf\x9e>\xf1\x11n\xbe\x99Rs=|\xc5-\xbd\x8f\xda >\x87\xf1\xdb\xbd\x15\x0c\x1b>vO\x85>\x80\xd9\xa8\xbd\x8d[\xe6=\xec\xce\xc7=iO\x03\xbe\x81\xa6\x14<\'\xab\x9a\xbd\xbf\x15\xa7\xbc\xac\xfa\x0f\xbe\x0e\xaf\x9a>-\xf0\xd4=Y\x00m\xbe\xf9\xa6\xb6>1\x06\xa4\xbc\xb0h&>\x99\xf0\xc6>C\x8bb\xbe\x10P\xfc=\xc3# \xbd,+)\xbe\xf0\xfdI>\xf3F\x15>T\n\xa0=\x7fGJ>\xdcV\xcb\xbd\xcc\x1d\x9a>J>e=\xf41?\xbe\xf7JO<\xbd\xb0\xf8\xbd\xbf2\xb3\xbe\x97\x07\x16\xbe\xf7y\x81\xbdF\xc3\x87<\\a\xe2\xbe3\xcf\\>\xb7\x83\xb6\xbd\xedM\x81\xbd=[\x07=\x18\x89\x96\xbe!\xefG\xbd\xcc\xfe\xd9>\x14\xb3\x1c>\xc3\x85\xec<o\xc0\x81\xbe@I\x99\xbe\x1b\xdf\xb9=m\xd8\x7f>c\x91\x8e>@Tn=i\xf4]\xbe-\x8b\x08\xbc\xd1\x8d\xd9>\xf3S\xba\xbdvC\x9d>\xf6\xbc\xf9=O,&>\x0f\x0b.\xbe\xbd\xceX>\x11\xed\x84=\xd8\xe9\x94\xbb\xfe]\x1b>\x07\x97\xa0>Lm\x93>\x99W\x90=\xbf\x02\xb8=\x1foP=a\x19\x06>'
-p1126
-tp1127
-bsV578847428834664448
-p1128
-g2
-(g3
-(I0
-tp1129
-g5
-tp1130
-Rp1131
-(I1
-(I200
-tp1132
-g12
-I00
-S'\'\x96\x13>D\xd9m\xbd\xf4l\xc7\xbe\xf7\xd6\x82>\xbc\xe9\x13>RN\x99=\x93^\x98\xbe\x1c\xfa5\xbe3\xf9C\xbd\xc4\xe1\x8e>\xbb\x1f\x8f=k\xe7\xb3\xbe\xfac6>\xcc\xe3\xf3=\xb0\xa0}\xbdC\xd5\xa6>#d\x97\xbd\x9f#x\xbes\xde\xae<\x0bt\xc5=\xdc\xcb\xe7\xbe\x9d\xd7\x8a\xbd="\t>\xcc\xa76\xbeO&\xfe\xbdE\xda;\xbd\xb1\x8a\xab=\xb5}\x1c\xbe\xed\x0e\xdd\xbe T\xc6\xbc\xae\x93\x84\xbe\xdcw<\xbe\xfcn\x8b>>\x95\xa9\xbe\x84\x96\x80=\xf22\x13?\xe9\x07/\xbe\xff\xbb\xb9=q,\x8c>\x8a\xc3\xbd>\xdaa\x8b=\x97\xdb\x83>\xcf\x02_>\xc4c\xd6\xbe\xf3\x1eP\xbeY\x00\xf4\xbb\x89\xc2\xcd>\x9b\xd6N>\xe9U\xc3=\xdb\xc7\xd9>\xc9#\t\xbd\xbe`\xf4>P\xfdh\xbe\xca\xd6\x18\xbe\xa3\n\x10\xbf\xf7\xb0\xa6>\xa2u\x15\xbe\xab\x81&\xbeRz\xfc\xbe\x1e\x01\xdc\xbe}m\xa4>\xeb\x9e\x8f<\xc1\n\xc8\xbdR\x95\x07\xbf\xd4\xa7j\xbe\xaaK\xb6>\x14\xe8\xa2\xbe5S\x9c\xbc\xa5%\xb0\xbe\x13\x95\x9f\xbe/\xcc\x16\xbf\x0f\t\xf2\xbe\'[\xae\xbd\x8f\nI\xbe\xa0\x06\x93\xbe\xd3a\xd3>R*\xc0>\xf6\x84&>\'\x00\x8e>?\x0e\x13>\xc2\xa1\x0b\xbe\x0bS\x14<V\x00\t?6\x9f\x9c\xbe\x99\x8a\x1d>\xd2\xf1z>\xbc\x1c\xeb=s\xe0\x01\xbf\x90\xf3\x07?\xe5T[>\x0f\xea\x95\xbd\x14nG=\xc5\xfb\n<e}\x91=\x00\x042>B\x1b\x1e\xbe\xd9\x9c:>\x15\xcd#>>\xbe\x8e>\x89\xfe\xd1=\xaa\xc2h<\xbe\x9e\xb9>\x9c\xa3@>I(G>Yik?{\xd9\xa0\xbe\x89\xc3\x00\xbe\x05\xed\x94<\x02n\xb5>\xdf\x1e\xa7\xbd\xc5\xfb\xa5;\x07<\xeb>I\xcb3>\x7f\x9d\xa1>[T6=\'N\x13>\xa0\xf9\xc9\xbe\x1bK\x95>\x9c\xb2\x8d=\xcam\x0e>V\xfa*?:j\xb8\xbd)3\xa5\xbdy \x85\xbeP\xca\xb2\xbe\x8b\xc5\x81>\xab\xc5\x84\xbd\xbd\xb4\xc3\xbd\x01b\xbd=\xec\x99\xb6>\xfbj\xe3\xbd\xa2\xd0\x95\xbdO\xb8\x12\xbdA\x16\xba=\xef \x88\xbe\x9d\xa7\xff=K\xad\xd9;\xb6\x1b\xb5\xbd\xf5Yo=\xbc\xb5\xc8>\xc3\xce\xbd\xbe\xa9s\xed>D~\xa0\xbd;v\x8d\xbe\x9a,\xca>\xce@7=\xabe\xcc>Q\xf1\xe3>\xd9\x087\xbeek\xe4\xbd\xd0\xad9\xbe>2\x98\xbe)\xbc\xfc>\x9cm\x1b?0\xe3\xb2\xbd\x11\xf0\xb5>J\x81\x1b\xbe=\xc9t=\xb0\x81\xa3=Z\xd4\x08\xbf\x0e\xc8\xc4>\x82\xe8\x93\xbe\xfb4\xfb\xbe\xaeN\x8a\xbe3\x90.\xbe\x90\xb7u\xbe\x9b\x94\xc9\xbe\xe3\xf3\xfb>\x1a\tK\xbe&\xfa\x9c\xbe]\x1a6\xbe\xee\xab\x00\xbf\r\'\x05\xbe\x8b\x18\x13?bs\xb5\xbd\xdf\xecK<q\xf7)\xbf\x86g\xd6\xbe\t\x88\xe8\xbeVN\xb2=\xf4\x03\xe0>\x06P\xe8=\xbf\x84\x93\xbe\xc3\x12x\xbe\xd5_\xeb>1\x1b\xd5=\xbbP\x10=\xc9\x9ak<}\xb8\x0f?F}\xf4\xbeu\n,>}6\x8a\xbe\x87X\x93>\x81\r\xb5>\n\xe8\xec>\x1f<\x15?)\x9d\x07?\x919#>\xf0\xcd\x93>+d\xf8<'
-p1133
-tp1134
-bsV580650350715265024
-p1135
-g2
-(g3
-(I0
-tp1136
-g5
-tp1137
-Rp1138
-(I1
-(I200
-tp1139
-g12
-I00
-S'H\xd8\xfe<\x8d\xe7p\xbd\xa1!\xa8\xbe\x13\x05\x94>>&\xc0=*~\x86=\xe2\xe4\x88\xbeR^\xe0\xbd\xae\x02@\xbdh\x06Z>y\x0c\x81=M_\xc2\xbe\xee%\x18>K\xfd\xf6=\x08nE\xbd=\xca`>\xd1q3\xbdn\xe8~\xbe\xd1\x04\x9a=}\xfb\x07>\xa0W\xd7\xbe\xaf\xe4\x9b\xbd\xa9\xe5\xb4=?\x81\x1f\xbe=\xec\xd4\xbd\xbc\xb0\x9a\xbc\xcb\xe9\x05=JA\xe2\xbd\x9a0\xb6\xbe\x9eC\x9d\xbdl\t\x8e\xbe\xbbC.\xbe\x9fl\x8b>\x86\xad\x97\xbe\x96\xed\xcc<\x16\x84\x08?v\xab\x87\xbez(\xc2=\xfe\xf99> \xc9\xbf>Z\x97\xca=\xed\xde\xad>\xf2\xec3>\xa2<\xc3\xbe\xc2/O\xbe\x8d\xb8j\xbb1\xc1\x90>\x0fy>>o!\xbb=R$\x9e>!\xe5\'\xbd\xcaC\xd7>\xfa1\\\xbe>\x1a\x18\xbe\xd3\x91\xe3\xbeb\xbf\x92>\x10\x9e2\xbe\xe9#E\xbeJE\xab\xbe\xddc\xaf\xbe\xaa\xfe\x93>%Q\xbc\xbd\x1c\xd8\n\xber\x0e\x01\xbf\xba\xaaO\xbe\x04\x96\xae>\xae<\x88\xbezD\x06\xbe\xa5\xaf\xae\xbe\x7f+\x9a\xbeS?\xf4\xbe\xcb\x88\xd1\xbe\x17g\x97\xbd\xebu6\xbe\x86\xd6\x96\xbe\xd1\t\xc5>\x84\xc3\xba>\xd0\xed\xf9=\x83\x96\x86>\xdb\xa9\xc3=3\xc2\x15\xbe\xd0\xcdJ<\xc8q\xe8>\x0b\xc0x\xbe\x17;\xbe=]jp>\xd6\xbaI=\xda\xd0\xf1\xbe\xb6\xc3\xe4>\xad\x96O>\xbf\xdd\x8b\xbcLeF\xbc\r\x0c\xa7=r\xa1\x89=\x02\x02\xbc=j\x81\x14\xbe\xe5\xc3\xdf=\xda!\x84=\xdd\xc1~>\xe6\xff\x02>N\x91\x0c:L5\xa6>\xb8\xdb%>\xb6W3>\xe6\x8aZ?\x12f\x8a\xbezK\x1a\xbe\xe7\x95\xb8\xbc\xfe\xd5\xbb>\xc9\xa0\x8e\xbd\x82\x0c\x93=\x18\xa5\xd6>O\x98\r>\xf3\xde\x90>\xcc\xb8*=\xc5H\x12>\x9aM\xaf\xbeF\xd7v>\xc0/5=^0\xd7=D\x9a\x10?\x08\xf9$\xbe\x18\x89\xd0\xbdN\xf1{\xbe\x1e\xd2\xbd\xbeJ\x96S>\x02\x1c#\xbd\xb8;\xd2\xbdW\x0c\xc5=x\xad\xae>;\xf0\xf9\xbd\xf2\xda\xdd\xbd1\xd2:\xbdK\xe7\xc5=\xcd\x18\x9d\xbeE\xdd\xf0=;\xc6t<\xe1\xba\x91\xbd\x8d\x1e\xb5=\x05\x07\xcf>\xe1\x01\xaf\xbe\x86}\xd2>\xeej\x07\xbe\x94\xceF\xbe\xe9\x1d\xac>\x1d]\xd9<\xeeu\xbb>.\xdf\xb9>\x12C\xfa\xbd\xa0\x9d\x0c\xbe\xf7\x07#\xbe\xb1=\x80\xbe\xf8B\xe3>\x1c\xc3\x13?\xfe\xb6\x9b\xbd\x98\xdc\xa0>\xaa^\x08\xbe\xa5\x19\xc7<\x1a\x18\xc3=0\xc3\xf9\xbe\xa5F\xd7>~]k\xbe;g\xd4\xbe\x8e\xfa\x8a\xbe4\x876\xbeV-\x85\xbe\xca8\x9f\xbe\x0e\x08\xe2>A?C\xbe\x8ey\x8d\xbe\xa5\x02@\xbe\n\x9d\xfa\xbe\x96&\x05\xbeX,\xf5>\xddH\xcf\xbd\x98q\xbd<\x0by\x17\xbf\x9cm\xaf\xbe\x89\xb4\x02\xbf\xb7\xd6A=\x1b\x08\xc4>J2\xc3=}Ym\xbe\xe6\xe1M\xbe\x8e\xf9\xc7>\x98Q\xf3=j>5\xbc\xba\r\x84\xbcD\x92\x04?\xfb\xaf\xe3\xbe.\xcf\x00>2 \x99\xbe\xa6\x9c\x95>\x1a\xfe\xa2>\x1bW\xb9>\xf5\xc1\xfd>\x96@\n?\xce\xc7\x0e>\x9a\xc1\x8b>3"g\xbc'
-p1140
-tp1141
-bsV580659384583262208
-p1142
-g2
-(g3
-(I0
-tp1143
-g5
-tp1144
-Rp1145
-(I1
-(I200
-tp1146
-g12
-I00
-S'<\xc5\xc2=^\x98\x95\xbd\x9a1\xd9\xbe\x82\x95\xb0>\xa2\xd0\xf5=d\xb9\xdd=\xfd\x94\xc4\xbe/j.\xbe\xed\xc80\xbd,\x07\xa1>>\xd3\xab=\xf7\x84\xed\xbe\x0f\x8bJ>C+\x11>\xb4uV\xbd\xcc\xe0\xac>$\xbc\xa3\xbd,\x83\x9a\xbe\x9c_\x98=X\x8c\x14>pg\r\xbff\xf2\xbc\xbd\x0c\xd8\x12>p\xccF\xbe\xe4\n \xbe}Y\x03\xbd\xd5=\x80=\xc1\x17\x15\xbe\xec6\x01\xbf\x84Wm\xbd\xcd\xbd\xa5\xbea `\xbe\\2\xac>\xc7\x10\xba\xbe\xc3\xeb\x8b=g\x031?\xbf\xe1\x8d\xbe\x07"\xb2=\xfd\x0f\x8f>\x87\x08\xf1>"\xb8\xe4=\xbf\xf2\xbc>gUp>xT\x00\xbf\x87\xa9r\xbe\xb4Sd\xbb\xfd9\xdb>\xab\xb2\x83>\x19=\xee=2\x02\xe7>$\'F\xbd\xb4\xd7\x08?U4\x89\xbeN~R\xbeS*!\xbf\xecT\xc6>\xf5\xefE\xbe\xf0\xf2H\xbe\x8e+\x03\xbf<J\xeb\xbe\xcdE\xc0>\xe0\x9d\xe5\xbc\xce\xb3\x14\xbe:@%\xbfTr\x98\xbe!\xda\xd9>\xf2)\xbc\xbe1\xf5\xb8\xbd\x1cN\xd6\xbe\x8cH\xc4\xbe\x0b\xcc%\xbfEn\r\xbf\xd8\xd8\xda\xbdR\x19p\xbe\xc4\xbf\xb3\xbet\x99\x01?K[\xe9>\xc6\x841>\x1a0\xab>_\xd9\t>\x1b\x08-\xbeMg\x16<\x8bL ?\xe0\t\xb3\xbe\x9c\xb4\x1c>\x83\x12\x99>\x1e\xc6\xa2=Z>\x18\xbf5\x10\x15?J\x85\x8a>\xf6\rA\xbd\xdf\xeb\xd4<)=\xab=\xe5\x11\xc8=l\x9e\x15>\xbc\xa0W\xbe\x14,@>TO\x08>\x1e\xd7\xa9>\xf2>\'>\x0e}_;j9\xd2>\xb7}^>C\xb2a>\x15\xe7\x8d?\xf1\xa3\xb4\xbeF\xc47\xbe\x93\xb5\xa1\xbb\x07\xa9\xec>\x91\xa3\xe2\xbdy\xa9Z=\xc4\xac\r?\xf1\x85C>\xd6\x1f\xc1>\xcb=j=\xe5\xac<>v2\xe3\xbe\xa4\xf3\x9f>\xab\xe5\xa1=VG\'>`\xa9B?\x1fq\x1c\xbeq\xfc\xdb\xbd\x81\x9a\xac\xbe2,\xea\xbeA\x00\x90>46B\xbd(\xdf\x08\xbei\xe3\xe7=\x07\x82\xe4>\xb2\xa9\x1e\xbel\x15\xfd\xbdH\xe0\x8d\xbd\xd0\x01\xf1=\xea\x81\xc2\xbe4X\x18>i\x8e\xc9<\x87\xe4\xee\xbd\x9d4\xb0=o\xbe\x02?\xa7\x98\xe7\xbe\xf8\x92\t?\xbb\x1f\xfb\xbdt\xb7\x93\xbeP\n\xe5>\x0b\xfcl=[\x00\xfc>\x14L\x00?\xb9\xecF\xbe\xfah\x1f\xbe\xfeYo\xbe>\xea\xb3\xbe\x14\x8f\x17?\x1dg@?dr\xed\xbd\x1c\x95\xc7>-\x8d.\xbeS\xa1:=\xc0F\xb9=i4$\xbf\xf4\x11\x01?\xd9\xee\xa1\xbe\x99\x06\x0f\xbf|\x86\xa0\xbelyd\xbe\xf1\'\x9a\xbe\xd4\xc8\xd7\xbe\xfcf\x15?Y\xad\x84\xbe\xc3(\xc4\xben\xd6v\xbe~\x12\x1d\xbf=\xd8$\xbe<\xce#?\xcf\x10\x06\xbe\x04oP<E\x0bK\xbf\xd0\xc2\xec\xbed#!\xbfE\xef\xae=\xdc\x0c\x00?tO\x0c>\x10b\xaa\xbe\xa5A\x9c\xbem\x14\t?\x98\xc8\x10>s\x9d\xa2\xbaf\x8a\x1f;E\x81-?!\xe1\x15\xbf$\x0b)>\xf7\x01\xbf\xbe\xf6z\xb4>\x14Z\xd3>B\x16\x02?$</?f\xf51?\xeeAD>\x03@\xbb>\xd4`\xd0:'
-p1147
-tp1148
-bsV577645984089505792
-p1149
-g2
-(g3
-(I0
-tp1150
-g5
-tp1151
-Rp1152
-(I1
-(I200
-tp1153
-g12
-I00
-S'>C\xe4>\x1a\x9e:\xbdt]\x04\xbf\t\xd1\x84\xbd\xd7\x1d\xb3>\xb1\xf2\x92\xbe\x83T\x95\xbd\x10\x07n\xbe\xe1m\xda\xbd\x9e\xff\x86\xbb\x19\xb9\x1a>\xa4\x85m>\x9a<i>\x9eS\x02>u\x83\x85\xbe,\xd1\x97>~\xb9\x1a={M\x19</\xbc\x14\xbe\x96\xf1\x9a=\xaelv\xbe\x8e\x9fb\xbd\xaa\x92%>e\x9c\x1f\xbf\x04U\xc4\xbd\x07\x9b\x03\xbe\x8ejt>#1\xd3\xbe\xd2\xc9E\xbe8\x12\xd3>\xf5\x8f\x14>\x0e\x97K\xbe\xf9W`>\xf5\xd6+\xbe%\xd6\x19\xbd\xd6\xdd\x89>\x14\x84\t>\x88\xb8J>\xf2\xac\xd6>\xef\xbe\x1d>\x04\x9c\xa0=f\xe5\xb4=\xbc%\xb2>\xf2A\xb3\xbeq\xc0d\xbd\xb4y\xcb=LO\xdd>\xac\xdf\x0e\xbe2OH\xbcnZ\xdf>\xebj\x9f=\x90F\xe7>Z\xdeW\xbeS\xbf\n<\xce\xe6\xdd\xbe\xdf\xcd\x98>\x03\xe4#>3Y\x87\xbd\x1d\x82\xd5\xbeW\xb9\xe4\xbe\xa5\x1e\xab>\x12\xed\x97\xbd\x06l(\xbe\xa7*f\xbe\xfc=\xd2\xbdI\xd6\xbd>\xe9\xa6\x82\xbd\xb3V\x08>\x89W\x01\xbf\x82A\xfe\xbc\xf2-3\xbf\xa2~\x85\xbev\xfd\x0f=\x13D3\xbe\xd3QW\xbe\xee\x9e\x88>^K\x83>\xcb\x0f\x18>\x16L\x94=\xb7\x9b1>#\xb1U\xbe\x12\xed\x83\xbd\x99?\x01>\x17\xe18\xbeO\xcam>#)\x13>\x9f\xab\xd1>\xdc\x8c\xb3\xbe\x13%\xff>8T7>\xba\x9f^\xbd\xe0\xddM>q\xa0\x06\xbf\xa3"M>dH\xb3>s\xea\x1f>7\x82\t>\xa7<\xa7>\xe2\xdb\xd4<c\xaf\xbd\xbc\xcd]\n>mL\xe3>\xd5\x000=\x0cM\xd2=\x8d\x12\xba>/X\x86\xbe>0\xd3=^\xb2\xef;\xd2\xbc\x81\xbd\xdb\xc1\x0f=\x97\x04\xb2\xbb\xf7f\xaa>\x89\x05.>\xa9\x9fP>\xb6\x9du\xbb[\xd9\x95\xbd\xba\x91\xa2\xbe4 \xdb>\xe7\x0e\xa5=\n\xc2Z>\x9ee\xf0>\xb5\x86\x12>\x9a\xbb\x00\xbe\xe2\x12\x97=\xaa\xdaK=s\x86\x90>\x14\x83\x7f\xbe\x11H\x8f=t\xb6\xbd\xbd;\\\x9a\xbc;\xf0\r>\xb9\x01A>M\x16\x1e>J4\x86\xbcB\x8c\x82>\x01K\xad=\x12\x8d\x02\xbb\x18C\x7f=F%\r>\x9dM\x07>\xc1\xfe-\xbd\x0b\xc2\x88>\xa5y\xaa\xbd%~\xa5\xbe\x93\x08\x86>0f;\xbe\xad\xde\x89>\xa9\x98,>\xb9\x94\x12\xbe\x1a9@\xbdB{\xfe=\xae\x99\'\xbe~\xb7\\>\xcf\'Y>\xcb\xe3G>{~\xb2>[\xac7<63\xf9=y\xfa\xa2=\xe5\xe6\xd6\xbd\x08\xc4\x8b>\xb1\xb2\x87\xbe\xf5at\xbe\xf8\xea*\xbeC9\xa0\xbd\xcb1,\xbeX\xc6\xe5\xbe\x84\x04\x84>*)\x10=\x83\xe9\x90=\xfe\xa7\xc6=h[\x02\xbe\xe2tu=\xa0\x8a\x18?h\x93\x9d=\xb29w\xbdW!C\xbe4\x02\xca\xbe\xb3H\x1d\xbc\xcc\x18\x12>\x16-}>q\x88@\xbd\xab\xb7\xba\xbd\xbb\xfb\xd8\xbd\x10\xdb\x1b=\xb6\xfa\x10\xbd\x92\xe5\xaa>d*F\xbb]?p>\xc0:9\xbe\xc1\x80>>$N\x0b>\xca\x98I>\xcb\xd0\x91>_\xab\xa7>\x08\xf8\xb4>\xf2c\x8a\xbd\x88\xa7\xb4=G\xf1\x17\xbe\xed\x96\xc0>'
-p1154
-tp1155
-bsV580333451376721920
-p1156
-g2
-(g3
-(I0
-tp1157
-g5
-tp1158
-Rp1159
-(I1
-(I200
-tp1160
-g12
-I00
-S'p\xbe,=[\x1d\x06\xbd\xd3\xffg\xbe\xb0\xb1;>\xca\xbc}=\x06u\x90=@\xc0F\xbe\x99\xda\x9f\xbd\xf6\xa5\xa9\xbcr1:>8\xe8\xf2<\x80\x8c\x8c\xbeg\x10\xc0=\t\x95u=-0\xb2\xbc\xbc\xe12>\x87r2\xbd\xd4\xc07\xbei\xf54=\xe0\xe2\xa1=\xa7\xd1\x98\xbeA{\x1e\xbd\xa2\x9e\x82=\x00\x9d\x9d\xbdP\xbf\x9a\xbd\xb6\xfeu\xbc\x85\xc8\x11=\x85\xa9\x83\xbd7P\x8b\xbe*\x14\x85\xbd\x84\x0b<\xbe\xd3r\xdd\xbd\xa0\xb4->\xc8\xf6X\xbe\xff"\xf4<\xd6%\xc1>\x87\x94\x1a\xbe!\x02K=v\xec\x0c>\xd8G\x84>^/J=z\x7fV>\x97\xc7\xf2=*\r\x83\xbeu\x89\r\xbe\x95\x1f\xbd\xbb\xb4\x17^>n\xe3\x13>Q\x01\x83=B[v>\x1aF\x0c\xbd\xee0\x95>\xe6\xc1!\xbepd\xe5\xbd\xa6\xe3\xaa\xbe\x15\x10O>\xe5D\xe0\xbd>\xdd\xde\xbd\x7f\\\x8c\xbe\xf1\xb4v\xbe-\xfaX>\x0b{\x01\xbcc7\x91\xbd\x9f/\xb0\xbe\xde\x88\x16\xbe\x06Rg>\xbd\xc7S\xbe\x8f\xd18\xbd=\x9dZ\xbe\xf9\xc5Y\xbeZT\xa6\xbepx\x97\xbe \xba~\xbd~`\xfe\xbd\xe9)O\xbel\x12\x85>Sj{>R\xb4\xc6=\x82\xfd;>1)\x8c=bH\xb2\xbd\x08g\xf29;\x1e\xaa>\x83\x83=\xbe\xb0\xdf\x88=@\xb6\x1f>5\xad\xca<\x90\xf9\x9f\xbe]\\\x9d>\xda1\x11>\\\\\xbf\xbc\xa2&\xb9;\xf7\x92q={\xb5\x02=\xb0\xb5\x8c=\xce\xfe\xf0\xbdz \xb8=\xd3cp=4\x869>\x9a\xc2\xad=\x1b\xe75\xbc\x1c\x86X>#\x1d\xe9=\xa8\x02\xf8=\xa4\x08\x18?\xfb\xcfM\xbe\x8b\\\xc4\xbd\x97\xb2\xe7;\xbfo\x81>:#\x81\xbd\xa3Y\xe4;55\x8e>\xb0#\xcb=\x87\rV>s\xdd;=\xbc\xf0\xcf=U\xf6y\xbe\xbd\x82$>Om\x03=\xfa\xb2\x98=Y\x16\xcd>\xe32\xc4\xbd\x8c\n\x81\xbd{\xd54\xbeL\xbd\x81\xbe\xa5\xab\x19>\x9ek\xe1\xbc:\x9a\x8f\xbd\xca\xda\x7f=BJs>\xcb\xe2\xbe\xbd\xd7\xaa\x9b\xbd\x11d&\xbd\x01\xfbz=\x9a\xf5c\xbe\xaf\x8e\x97=\xbe\x9d\x14<\xb8\x1dr\xbd\xa9\x06\x19=\xe8\xa2\x8a>\x88\x87t\xbe\xc9)\x90>\xeb\xf6k\xbd\xf24\x17\xbe\xdb\xcd\x82>\x92\x88M=\xc1\xf0\x84>r\xd7\x8f>j\x9d\xd7\xbd\xe6\x1c\xbb\xbd\xa9\xdc\x04\xbe\xbb*;\xbe\xde\x0f\xa1>7-\xd0>\xe1J\x99\xbd;S]>\xdf\xc3\xce\xbd;\xa2\xcc<.BX=0f\xb7\xbe\xa5\xbb\x86>\x99\x11(\xbe\x1ey\x9b\xbe\x03{E\xbeV\xa6\xea\xbd\xd6\t.\xbe\x02\xf6n\xbe-@\x9e>\xbap\x06\xbe\xac3H\xbe\x81\xb6\x06\xbe\xb1\xbd\xac\xbeI\x9a\xd2\xbd/g\xb1>\xb7j\x83\xbdx\x80\xbe<\xa5\t\xda\xbe\x0bA\x83\xbe\xbb\xc2\xaf\xbe\xbfv+=\x15t\x84>^~\xa0=\xee\t<\xbe,P-\xbe\x96\xaa\x99>F\x01\x8c=\xfdEC\xbc\xf1$\x9d\xba9u\xbb>\x86\xd8\x9d\xbeJ)\xa4=\xc1fZ\xbe\xb9\x18J>\xfb\xf6]>_4\x8a>\x01q\xbd>\xf9\xb4\xbd>]\xa0\xc9=\x1d\xd0K>\xb4Vn\xbc'
-p1161
-tp1162
-bsV580626838604644354
-p1163
-g2
-(g3
-(I0
-tp1164
-g5
-tp1165
-Rp1166
-(I1
-(I200
-tp1167
-g12
-I00
-S'r"\x90>84\xd0<ac\xa3\xbeq\x7f\xa9=9\x19->\xed\x80\x9c=.O!\xben:(\xbe\xa1s\x1f\xbd\xac\x1e\x88>\x1d\x97"=\xff\xb1Q\xbewz\x17>\x93\x84\xc6=\x8fC\x9d\xbd\xd3\x9b\x9a>\x9b\x8a\xa0\xbd\x83\xb4%\xbe\xb9\xa8\xc9\xbdZ\xe0\x9e\xbb\xe95\x84\xbe\xa7\xc5\xa6\xbb\xe3\xa6\x04>\xfb\xc7r\xbd\x84TO\xbd\x1c\xa0\xb1\xbd\x10\xad\xb1=a\xdd\x15\xbe\x99\xcb\x99\xbe\x94{I\xbcqj\x1b\xbe\x87\x8f\xf8\xbd\xd92,>^j\x8e\xbe\xc4\t\x9c=\x90\xe9\xb6>\xac\xc7\x86<;\xf8\xe6=t\xb7|>\xc7aD>\x03\x87\x17<\x13\x04\x82=\' 3>u\xee\x93\xbe\xd0\x9b\xe6\xbd\xc4B\x98\xbb\x19\xda\xc8>\x10\xc9\xd6=\x99\x91\x06=h\x81\xd7>\xad\xa2Y\xbd \xf4\xcb>oQ%\xbe\x80\x19\x07\xbdg\xae\xf3\xbe5\xe8G>kqk\xbdR\xab\x81\xbd>a\x05\xbf\xb7\x9b\xc3\xbe?\x07o><J\x00>\x83\xf7\x92<\'z\x9d\xbe\x07\xbd\xec\xbd\xa0|Q>\xc2\xa9\x86\xbe\xdc"\x1d>\x1d\x87.\xbe\xebjK\xbe\xa9K\xf2\xbe\xb2\xb2\x9d\xbe\xc9\xb6]\xbd\x9b\x06\t\xbe\x9f\xccF\xbe\xfdJO>\x81\xdf\x1f>\xd8\xb6,>C\xc17>H\x9c\xf7=1\xbf\xbc\xbd\xd5u\xcb\xbc\xb7\x8b\xd5>\'N\x82\xbe\xa7\xdb:>\xeds6>\xfb\xa8R>\x8d\xff\xab\xbe3\xe1\xd6>\xb0p\xc8=\x8d\xd1\x10\xbe\x87\xe5\x88=@\xe6 \xbec\x96!=\xd9\x05l>P\x87-\xbd\'\xd3.>\xb1\x92T>\xce\xd0%>\xc8\xce\x1c\xbd\xbf\xe2\x97<\x8c\x83\x8c>%\xff\x1b>\x11D\x01>\x85\xcf\x14?O\xedP\xbe\xfa*\r\xbc\xf0\xd2\xb9=\xb1\xa1!>\x0b\xa29\xbd\x03\x0b\x0c\xbe7\xd8\x8e>!\xec)>t\\S>\xd4\x10*=\x8b\xde-=\xbf\xec\x95\xbeM\xd5\x86>\xfb\xd7\x9d=\x08+\xb1=t-\xf1>\xef\x89\x19=\x94\x112\xbd\xef\x94\xcd\xbd\'\xc67\xbe\t\xa6E>\xe5\x97\xad\xbd\x94\xd3<\xbc\x99I\x91=[Q1>P\xa4\x10\xbd\xba\xa0\x84<\xc58\xc5\xbb\xdd\x95.=k\xf5\xa2\xbd\x0f\x0cm=]l\x04\xbdg\\\x86\xbd\xe9\x9a\xd1\xbc\x07v=>\xd1\x7fu\xbe]\xb6\x8b>\x81\xca(<\xed\xf1w\xbe{\x86\xa2>}\x91\x8b=8\xb3T>\xe0,\xad>\xa8\xd7\x1e\xbe\xc9\xb4v\xbd\x80\xec\xcc\xbd\x94\xacJ\xbe\xceW\xa8>\xceD\xa2>$SX\xbd6\x18\x91>\xe4\xd6\xf7\xbd\x99)\x8f=\xd8\x95/=,\xe6\xbd\xbee\x1d\x01>\x14\xbcz\xbe\x1fk\xc4\xbe\xbd\x18J\xbe\xe9c/\xbdGP\x14\xbeYO\xa4\xbe\xddz\xb5>Y@\x8a\xbd\xfd\x968\xbep\xee\xc6\xbd=\x14\x95\xbe#\xd5\xc6\xbd\xcf\xa7\xfc>C\xc1\xbf\xbb\x05?\x82<\xc9\x90\xf2\xbe\xff\x8f\xca\xbe\x90(\x1f\xbe\xcb\x0b\xd9=U\x7f\xb5>\xe5\x8ad=\x8d\x10Z\xbe\xb7\xa0)\xbeB\xf8\xa0>M\xec9=-Z^=w4\x1d<3\xcb\xaf>U\xd6\x8a\xbe\xa8\xe18>}V\xea\xbdA\xcfD>\xb8c\x81>\xc4\xbe\xde>4\xb9\xd6>\xdc\xc7P>\xad\x9e\xed=g\x036>\xe1[\xfb='
-p1168
-tp1169
-bsV580219712698781696
-p1170
-g2
-(g3
-(I0
-tp1171
-g5
-tp1172
-Rp1173
-(I1
-(I200
-tp1174
-g12
-I00
-S"\xe6\x8d\xcf=\xf3]\x82\xbd\t\x12\xd0\xbe.\x0ez>N\xbf\x1b>\xbb\xef==\x15Y\x8c\xbe\xb6\xb2\xf9\xbd^\x9e\x14\xbd@\x02\x80>}|\x95=\xae\x05\xab\xbe\xff\xac$>\xf8\xc8\xb1=\xe2\xfe\x8e\xbd(/\x8c>z\xa3!\xbd\x8a\x01\x7f\xbewS\x16=\xb8\x8e\x08>\xae\x98\xeb\xbe\x06bZ\xbd7\x18\xd5=\x1e\x1bN\xbe\x8b\x1f\xfc\xbdy\x1fJ\xbd\xd6$\xb2=2C#\xbe=\xa3\xcc\xbe\xd6^6\xbd\xe6{]\xben\xdd&\xbe\x89\xfb\x87>\n\xbc\xa7\xbe\xb10\xc3<\x84]\x0c?5\x11T\xbe\xb0\r\xc1=\xc5\xe1t>\xd3=\xbb>\xc8\x90\x9e=\xf5z\xa8>\x88\x8cW>\xe3\x07\xd1\xbe\xbbAM\xbe\x88\xe8\x18<\xf5\xbd\xbb>\x80\xcf'>\x03\xaf\xac=>k\xc2>\xb3\xf9\x89\xbc\x17\x0f\xf8>\xeb\x0e\x88\xbetr\r\xbe\x87\xc3\x03\xbf*9\xab>\x0f1\x04\xbe\xac\x08A\xbe8J\xd4\xbe\xec3\xcb\xbe\x90\xd1\xb4>\xc7\xa4\x14\xbd@E\n\xbeD\x18\x00\xbf\xf7\x05E\xbe\x99\xe3\xbb>l\x90\x99\xbe\x9dJR\xbd\xdbb\xc9\xbep\xab\x94\xbe\xd8\x18\t\xbf\x8e\xd7\xdd\xbe\x81m\x86\xbd\xcc\xaaA\xbe\x14\\\xa7\xbe\x90\xcb\xcc>Z\xd1\xca>\xc2)\x1c>)={>\xfe\xd5\xeb=\xfa\xa3\x1e\xbe\x93\xed&\xbcN\xa0\xf3>\xefA\x8d\xbe\xae\xb3\xf2=\xa4\x1fq>X5\xb5=\xdc\x04\xf6\xbe\xc3\x96\x00?\xd5\xd9w>g\x12?\xbd\x88\xfc*=\xd6\xe4\xc9;)\xa2\xae=\xd3\xae\x18>C\x9c\x14\xbe\xe6\x0f\xe6=\xc5W\x02>\xff\xb8\x86>\x99\xe2\xf3=L\xfd+:Bv\xba>\x1cf$>\x00_5>\x8c\xf2Y?\x96\xc8\xa1\xbe\x93\x05\xe4\xbd\xe0\xa7\x01;\x8d\x08\xac>\xef\xa3\xb9\xbd1\xb4\xae<\xd0p\xd7>\xe8\x12\x08>\x88\xdd\x9b>\x98\xfb_=\x92\x06\x02>\x8b\x1d\xc7\xbe\x7f\x02\x8b>\x83\xd35=~Y\xfe=\xfb\xcd ?\x15\x1d\x0c\xbeg#\xdc\xbd\xdadi\xbe\x8c\xd8\xa6\xbe\xb6\xe1\x81>[\x00\x8c\xbd\x1cl\xb2\xbd\xb6{\x80=\xb9\xdb\x9c>n\xe3\xc6\xbd\xcb\x9d\xbc\xbd1uB\xbd\xa7\xff\x9f=7\xe1\x8b\xbe\xe2|\x05>\xd1U\x99<\xb4a}\xbd\x95$\xb2=\x1e\\\xc4>\x07F\xa5\xbe\xe6\x00\xdd>\xa5v\xd6\xbd\x1e\x10v\xbe\xaeo\xc1>\xab\xe1?=h \xcc>\xe7\xee\xc9>C\x984\xbe\xcbI\x14\xbeZ\xcd(\xbe>\x06\x8b\xbe\x11\xd6\xde>\x98\xbe\x14?{\x12\xa9\xbd\xaaq\xbe>f\x0c\x0c\xbeu\xc88=\x0e\xf8\xbe=\xa1P\x01\xbf\xfc\x83\xd9>\xdb\xb4t\xbe\xaa\x97\xd8\xbe\x89\x8e\x96\xbeE\xe35\xbe\xe4\x9b\x8e\xbe\r$\xca\xbe\n\xca\xef>\xeaLB\xbe\xf2\xc6\x80\xbe \x96\x1e\xbem0\xec\xbe\xcaN\xec\xbd\xc4\x13\x16?\x9a\xe9w\xbd\x95p\xcd<\xe2P\x1b\xbfu\x8e\xc7\xbe\x87\xc5\xfa\xbe\x9f\xa3\x9e=a\xb6\xcc>d\x91\xe2=\xb2/\x85\xbe\x18\xbfw\xbe\xad\x98\xcc>\x90\x06\x84=\xf4\xbc\xe1<8\xc2\xf0\xb9\x06\xfc\x06?\xce\xad\xdc\xbe(\xbb\x02>{\xbb\x8d\xbe\x8do\x9d>\xb6\xa7\xa5>\xd6\xc9\xc9>\x0e\x1e\x0e?GC\x03?`3\x17>\x93\xbf~>p\x18(="
-p1175
-tp1176
-bsV580979794768044034
-p1177
-g2
-(g3
-(I0
-tp1178
-g5
-tp1179
-Rp1180
-(I1
-(I200
-tp1181
-g12
-I00
-S'\xd2x\x1e=\xd5m:\xbd\x83\xfb\x90\xbe\xa86p>\x0f\x82\x8d=?\xa4\xc9=\x03\xea\x81\xbea\x16\xaf\xbd\xd1\xc3\xa9\xbcA i>\xa9q(=\x08\xc0\xb4\xbe{\t\x00>\xedw\x9e=\x94a\xd9\xbcxFS>\x0f\xf7S\xbd\x13\x96g\xbe4\x99\x88=\xe7\xc5\xe4=\x9c\x14\xc5\xbeh\xc7`\xbd\xd7\x18\xa9=\xbb\x92\xd1\xbdc\xc9\xc6\xbd\xbd~\x91\xbc\x97\x03\x17=\x0c~\xa5\xbd\x94\x9a\xb1\xbe\xd3\\\xa2\xbd\x10<d\xbe\xe3\xef\x0b\xbeu\xd8a>;B\x84\xbe\x85g\x11=\xb3m\xf4>\x84\xa2Z\xbe\xc0\xd1m=\xb7i+>\xf0\t\xab>\x93\xb7\xa2=)\xec\x94>1d\x1c>\xfd\x87\xab\xbe_\xe5)\xbe\x14.\x1f\xbb\x85=\x8d>9\x017>\xbfA\xa3=\xaa*\x98>\xa0\x97"\xbdy\xbb\xbe>\x10\xb2N\xbeV\x17\x12\xbe\x8f\x8f\xd6\xbe\xb1\x7f\x89>\xd5\x8b\x0f\xbe\x830\x0c\xbe\xa4\xd3\xaa\xbe\xd3\xa0\x99\xbe{\x8a\x8f>m\xe8\xf9\xbc\x03\xcd\xd5\xbdq\x10\xe3\xbe\xc4jJ\xbe\x1b\xf1\x95>\x99:\x87\xbe-\x06\x92\xbd\xd5\xf5\x8f\xbeg\xfe\x87\xbeyb\xcf\xbe\xfcL\xc0\xbe]\x87\x8d\xbd\x1b\xe6!\xbe\xed\x03\x87\xbeA\xc3\xab>g\xdb\x9f>{1\xf5=\t-j>\xa3\xc7\x97=\xfc\xbc\xf1\xbde\x1f\xa2\xbb\x93\xbd\xdb>\xfd\xb1n\xbe`\xe6\xae=k\xa4R>\x9d\xb6\xfe<%u\xcc\xbe\xab\x93\xc0>\xb8\xe4E>u\xdd\xaf\xbc/\xbdW\xbb\xd5}\xa3=\xcbpe=\xed\xeb\xa1=\x89\x92\x1e\xbe\xb3\x0b\xc7=@\xdb\x8a=\x80\xcdj>\xd5\xa0\xf7=\x15\xffs\xbc|Y\x89>\xc1\x02\x14>\x14\x08\x18>\xe14@?\x89\xc0v\xbeXS\xfb\xbd\xd0\x87\x92\xba|M\xa6>\x85y\xaf\xbd\xbdW\xfb<\xc1,\xb7>\xcd\x15\xfa=\x97)\x87>\xb0\x9d]=U\xa0\xf7=MN\x99\xbex\xb8M>\xac\xdc3=\x07n\xc6=\x14\xac\x00?\xa9\xb9\n\xbe,g\xb1\xbd\'\xdaj\xbe\xfd\xd6\xa7\xbe\x80\xe1>>E=\xc3\xbc\t\xf9\xc5\xbd\x858\x9f=\xab\xc1\x97>\xac+\xeb\xbd8\xab\xd8\xbd.1\x81\xbd !\xaa=\xe7j\x94\xbeG\xc9\xc5=\xff2\xbb<\xa1e\xa2\xbd\xd3\xe5{=t\x93\xb7>\xf7\xc5\x9a\xbe/\xd7\xb3>\xe3\x98\xad\xbd\xbd\xf76\xbe\xef\xe7\xa0>qE\x80=A\x9e\xaf>M\xc6\xab>zj\x08\xbe\xf3$\x05\xbe\xbd^3\xbe\xa3\x9er\xbe\xb8R\xcd>@j\x06?\xbdd\xc4\xbd\xb7\x05\x89>\xd3\x8d\xfa\xbd\x87\'\xa4<\x9f\xfbw=\xafp\xea\xbe=\xb1\xb4>U[Q\xbe\xad@\xc1\xbe}\xe1r\xbe\xf5\x1c\x19\xbe\xdc\x99i\xbe\xcd\xaf\x94\xbe\xefs\xca>\x93\x905\xbeq\xff\x80\xbe\x17\xca+\xbe\xc5i\xd7\xbe\x15(\xfe\xbd\xf92\xe2>s^\xb1\xbdqu\x9c<\x8b\xbd\n\xbf4\xc0\xa2\xbe\x90\xbf\xed\xbe\xe5XA=\xc5\xeb\xa6>\xb3\xa0\xc8=\xa8wk\xbe\xd5\x9ei\xbe,\x95\xb8>\x88V\xb9=\xd3\x16\xd6\xbc\x9d\xe2\xa3\xbb\x05\xe1\xee>#\x9f\xc9\xbeC\xe9\xbf=\x19J\x91\xbe]\x01\x85>\xb7\x9e\x8a>\xc0\xcb\xac>\xc0\xab\xef>k\xfc\xf7>K"\xff=\xc3\x1d\x82>%\x95\xd5\xbb'
-p1182
-tp1183
-bsV580346141981691904
-p1184
-g2
-(g3
-(I0
-tp1185
-g5
-tp1186
-Rp1187
-(I1
-(I200
-tp1188
-g12
-I00
-S'mU\x18=\xb1\x19\xb9\xbd\xd2-\xd9\xbe{{\xbb>\x10y\xcf=\x12\x9e\xf2=-\xe3\xc5\xbe\xa7b\t\xbe\xe1\xc0\x02\xbd5\xcf\xa5>5\xadi=\x91)\x05\xbf\xe8\xb7<>\xc2!\xeb=W+\x15\xbd\x97\x86\x9e>q\xa0\x8d\xbd\x0e\x11\xa7\xbe7\x91\xf6=S\xa03>:G\x18\xbf\xb7>\xa8\xbd\t\xb1\xd3=\xa5`>\xbe[\xaa\x17\xbeb\x8c\xc4\xbc.6\x88=\xf2\x14\x05\xbei\xfa\x05\xbf\xf7\x93\xd7\xbdF\xea\xac\xbe\xad\xdfS\xbe\x1f)\xa7>\xcd\xc0\xc6\xbe\xeb\xfe*=s\xf38?VJ\xaa\xbe\xfe\xcf\xa8=\xfdD\x82>M\xc7\x00?\xf1;\xe2=\xe7m\xe2>\x7f?r>H\x8b\x00\xbf\\0\x88\xbe\x89+\xe9\xbb\xeb\x10\xc4>~\xee\x8d>n\x81\x0b>\xa2\x9c\xd9>\xa6\x8cO\xbd\xbb;\x0c?I\x9a\xa1\xbe\xb3\xa6h\xbe\xc0\xb5\x1d\xbf\x1f\xf7\xd1>\xae\x97\\\xbe!\xb4i\xbe\xf3\r\xf5\xbe\x9e\xea\xe1\xbe\xbb\xe5\xd3>n\xf6]\xbdrr(\xbe`>-\xbf=\xef\x96\xbe\xa0\xe0\xe5>\xe0^\xbf\xbe:1\x06\xbeP\xba\xe1\xbe\xdab\xce\xbe\xf6\xdf\x1b\xbf\xff\xd1\x10\xbfs\xdd\xd7\xbd\xca~y\xbe9 \xc8\xbei\xde\x05?Z\xa6\xfe>\x99D(>\rS\xb3>D\xb2\x04>RR6\xbe\xf6k\xd4:\xf0\xdc\x1d?I\xb2\xab\xbe\x16i\xd7=S\xb0\x98>\xd5\x15\xd8<~\xd9\x19\xbf[\xb2\x13?(\x94\x98>\xc9jQ\xbc\xa5\xbb\x8f;Z\x13\x13>\x7f\xd7\x8e=z\x11\xdb=&\xb2m\xbec\x0e\x19>\xc1^\xb6=*8\xb4>r=E>)\x7f\x85\xbc8C\xd1>/\xf0\\>\x8b\xd5k>{\xb8\x92?\x8a\xd0\xc2\xbe\x02YM\xbe\xc0\x1cq\xbc\x80\xe2\xff>\x0f\x0b\x01\xbe\xffw\x95=\xb75\r?\x8f\xf9,>c\x00\xcf>6\x0e\xa1=\xa3LP>\x8d\xb0\xea\xbe\xc9\x8e\x99>\xee\xe4\x90=\xd5\xbb\x15>5\xacD?\xe7\xc6[\xbe\x0f\x0f\x00\xbe\x1ag\xb5\xbe?@\xf9\xbe\x85x\x8f>zI1\xbd\xe5\x81\x18\xbe\t\x18\xf1=\x98A\xf1>\x93r;\xbe\xd3\x075\xbe\n\xfc\x9f\xbd\xc7\xf8\x00>\x1e\xec\xdf\xbe\x18f\x1a>\n\xbb\x1c=\xf8\x96\xec\xbd\xf7U\xe6=\xc2p\x0b?\xca\xef\xec\xbe\x0c\x8c\x0e?\x1e\n\x08\xbe8\xa5\x87\xbe\xd2o\xee>~6\x9e=7K\x06?\x840\x00?\xe14G\xbe\x9aND\xbe\xaa6\x85\xbe\x05\xb9\xb8\xbe)\xe3\x1a?\xaf\x9dM?_5\x0b\xbe\xf3\xb6\xce>\xb3\xfaB\xbe\xae\x99;=\xd5\x86\xc7=s\x11.\xbf\xe8\xfb\r?\x88\x19\x9b\xbe\xcbx\x10\xbfQp\xb5\xbe\xc5zu\xbe\x86\x10\xb0\xbe\xcax\xe0\xbe:G\x15?\x13G\x8b\xbe\x9e\xd0\xc2\xbe`r|\xbe\xf7a(\xbf\xe6\x07>\xbe\xee\x9b%?\x07\xa9\x0b\xbe\x1a\\\x04=V%N\xbf\x117\xeb\xbe\xc7\x185\xbf^\xa1n=\t\x07\xf1>\x11\x08!>\x9a\xcb\xb5\xbe\xeaZ\xa7\xbe\xcb|\x0b?\xf3l\t>\xfb\x90\x0f\xbd\x17\xb84\xbb>W5?\x02;\x1b\xbfN\x00\r>#\x1f\xdc\xbe\xa0\xb2\xc2>\r3\xcb>\xc0\x14\xf5>U)2?U?A?6T9>\xa7\x0b\xc2>g\x15\xf5\xbc'
-p1189
-tp1190
-bsV580596802912686080
-p1191
-g2
-(g3
-(I0
-tp1192
-g5
-tp1193
-Rp1194
-(I1
-(I200
-tp1195
-g12
-I00
-S'%u.=:\x90\x01\xbd\x1c#\xbd\xbe\x1c\x98\xbe>\xa4\xae\xec=L!\xc6=\xe4\xd4\xaf\xbe\xd5\x81(\xbe\x14\x8c\xcc;\xda\x99\x93>{\xa7+=w\xc2\xf1\xbe\xffH\xad=\x8b\x15\xb7=\xac`\xe3<\xb2\x13\xb1>\xf1\xe3\x9b\xbd\xbax\x8c\xbe\'\xfb\xa4=L\xed\xae=@\xfe\xf5\xbe)o\xd7\xbd\\\xdd*>F\xb4\xc8\xbd\x98\x85\x0e\xbe|\xec\x11\xbb\x0f6m=Ea\x92\xbd\x105\xc6\xbe\xa9\xdd!\xbe\xfc\x06\xb3\xbe\xa4\x15d\xbe\xcd\xdcv>\x80\xe6\xc5\xbe\x01<i=[\x0c,?\x9a\xcfz\xbei\xa7\xea=l-l>\x9fJ\xd2>\xa1e\x1f;\x1b\x80\xa3>\x02:\x18>d\xe4\xb4\xbeZ\xfe\x9d\xbe\x95\xd4\xab\xbc\x86\x9b\xb6>o\xba\x91>\x19\x08!>\x9c\xcc\xc9>)\xc7q\xbd\xc9"\xea>\xda\xaak\xbe\xc9\xb74\xbe\xa6\x17\x07\xbf_\xe6\x9f>\r\xc2I\xbe\xecTu\xbe\x87\xdb\xcb\xbe\x94\xb4\xc8\xbe\x94>\x87>&I\xe3<\xac\xfc\xc0\xbd\x9f\xf3\x15\xbf\xf1\x03]\xbe\xc3\x0e\xb1>\xb2\xc0\xa8\xbe7\xe2\xb8\xbd\xad\x84\xa2\xbeQ\x9d\xd2\xbeD\x82\n\xbfu\xb3\x08\xbf\xc9e&\xbe\xf7,C\xbed\xff\xaa\xbemZ\xce>\x86\xed\xce>\xa6\xe8\x12>\xf1}\xbc>\xe7k\xca=\x14\xff\xd8\xbd\x8c\xf5\x83=\xa7\xe7\x02?\xe0{\x9f\xbe\xe7\xff\xb6=\x87\xe6r>\x9cM3<\x99\xf3\n\xbf\xad\xf1\x15?\x98\xfb3>\xda.\x85\xbdB\xb0\x1d=\x1d\'\x15>\x0fX/=\x8d\x0c\xe2=Y\x17u\xbe\x84;n>\xd5.\x98=V\x02\xbe>\x80#\xd6=\x89\x17`\xbd\xa4\xdb\xa8>\xb8\xbd4>4\x8e\x82>|\xf1\x84?\xd8\xf3\xae\xbe\xf6\xb9W\xbeMbb=6a\xe9>}:\xcb\xbd\xe4\x9f\x88\xbc\xcf^\xd5>\xfcxM>\xcd\x1a\xb5>\xcd\xec\xcc=\x06\xb95>o0\xdb\xbe\xa9\x01^>\xfdY\xef<\xaa\x0b\x95=\xffi3?\xa5\x88\x10\xbe\xb3S\xf4\xbd_\t\xa4\xbe\xed\xd2\xee\xbea=}>\xbc\x13\x85\xbc\xc6\x7f\xb6\xbd\x19\xb2\x03>0\xb7\xe5>|2\x07\xbeCP\xaf\xbdl="\xbd\xb46\xbe=\xf1\x1c\xd6\xbe3\xa3\'>\xb7p\xbc<T\x1f\x92\xbdq]\x03\xbdy\xd7\xe2>\xcc\xac\xe4\xbeB\xc7\x00?\x82\x8f\x89\xbd\xec\x81\x88\xbe\xf7#\xd8>C\\C=\xca\x11\xca>\xb4g\x04?\xc2\xce,\xbe\x8cW\xba\xbdf\x0c1\xbe\x89y\x85\xbe\x97\xb5\x03?%\x82*?\x80\x84\x05\xbe\xb1\xf4\xc4>\x1d\xfeR\xbe\x14a\xf5<\xf9.\x14>S\x9a\x19\xbf9c\xcc>Z\x9a\x83\xbe3,\x10\xbf\xecT\xa2\xbeA\x18E\xbe\xb1\xcfR\xbe|\xb7\xb2\xbe\xbd\x92\t?\xbf!g\xbe \xf5\xa9\xbe\x07{n\xbei\xb4\x18\xbf\x8d6s\xbe\x19\x06\x04?l\x99\x0f\xbe\x9am\xc0=Fs0\xbf\xc9Y\xc8\xber<\x02\xbf?\xbc\xc7=\x89\xc0\xe5>\xb7\xc5\xdf=\xbfL\x96\xbe\xa1\x0b}\xbe\'\xb0\x10?MJ\x0b>7\xe5\xc8<S\x10\x96\xba\xd4\xb5\x1c?\\\xf1\x0b\xbf\xe8\'\x1a>Me\xa5\xbea\x8c\xa4>\x9e\xcd\xad>\xa9\xc6\xe6>\xbf\x01\x15?\xd9\xb7!?oa\x1e>\t\xe4\xac>\x8fK\x0b\xbe'
-p1196
-tp1197
-bsV578824941291880448
-p1198
-g2
-(g3
-(I0
-tp1199
-g5
-tp1200
-Rp1201
-(I1
-(I200
-tp1202
-g12
-I00
-S'\xbd\xf6L>\xce70\xbd\xa1Y\x98\xbeq\xdd\x96=%\x9dS>\xe9\xba\xa2\xbd\xd7K\xa1\xbd\x06[:\xbe\xe9I\xa5\xbc\xf4\x9c\x01>\xecTv=t\xad\x9d\xbcyp\xb1=LwK=\x12YM\xbd\xa5\xbe\x90>\';\x9d\xbc\xbdb\x1d\xbd \xe4\xb3\xbd\xf4\xe7\xdc\xbc\x96\xcdD\xbe\xa1\xe4!\xbd\xc7\xf2\x0c>\xea\x9e7\xbevii\xbd}s\xa1\xbd\xb5\xf6\x07>\xdcB.\xbe\x8e|-\xbe\xb9\x9be=\xc9g\x9b\xbd\xfb\x17\xf6\xbd\xdeP\xae=9\x81x\xbe\xcbr\x83<\xfa\xf8\x84>\xdf\x15K=\x81Q\xe3=\xe1\xefu>\xcf\xbd\x96=\xc2D\x9b\xbdMo\xa8;\x02Y\x03>z\xc7(\xbe-\xb6\x1a\xbe\x16\xad\xb6\xbc\x9f\xcd\x9a>\x94\xc8Q=\xc0\x97\x9e=\xa4h\x94>\xa5?\x00=\xe74\x9d>\x14\xbe\xe6\xbd\xfa9<\xb9\x1d0\x9d\xbeq>.>d0\xaf\xbc\x95|\x1c\xbe\x1b\x08\x9f\xbe\xf2|\xa1\xbem\xb2\x00>2\xa0\xae=+@w\xbb\x8a4h\xbe\x86c\x9e\xbc\x8d\xf6.>y\x16\x19\xbe\xc9\x91\xb3=\xef^I\xbe\xdfW\t\xbe\x93\x1d\xd4\xbeLc\x83\xbef\x97\xe4\xbc\x9b\xf1\xb0\xbdz\xe4\x01\xbe\x9a\xac#>\xd3\x04@>\xeb\xc7\xcd=\xb3\xad\x06>\r\xe9\x17>yWh\xbdO\xcdt=\xdb|l>`&,\xbe)\xed\xfa=\x05\xe3\xb0=\xd0\x19<>\xf6\xb0\x92\xben\xf4\xdb>\'~K=5Y\x0e\xbe\xfc\xea\x01>\xd3\x0f \xbec!6=M\xe3k>\xaf\x1d\x0f\xbd}\xa05>d\x90@>\x19\xa7:>r::\xbd>\xb6\xe8<D\xbct>^l\xd3=\xa55\x14>\x9c\xbf\xcc>\xe2\x19C\xbe\x04\x1a\xe0\xbc\nb\x8e=U\xb0\xb5=\x9e\x07\xb3\xbb\xe5\x92\x81\xbd\xdf\xcd.>\xf1\xbd\xde=\xa74\x00>"\xde\xea;\xd7\xa31={\x9d\x84\xbe\xe5\x11<>\x82\xeb\xcd<\x17\xda\x1e=\xe1\xbb\xde>\x9f\xfav=7\x07\xfe\xbc1^\x83\xbd\xa0\x94\x9e\xbd\x97g:>\xa0\x8a\x98\xbd\x8b\xc8U<\xe7W\x1b=I\xed\t>\x89\x16\x1b=?\x8b\x97=ll\x84=\xc4\x9cT<:ii<\xbd\x92\x01>|ry\xbc{\xfa\x8e<\xd18\xf3\xbc\xf3\x05\xbb=\xbf>6\xbeGJ\x8f>\xd1f\xc6:M\x04o\xbe\xbd\xf7F>amv\xbd\xea\xf6\x12>\x14\xee\x84>\xad)\x02\xbe\xbf)\xdd<g\xc2\x95\xbc\x06\xde\xe3\xbd\x8e7>>\x99\x98Z>\x02\xde\xee;@`\x96>\x9e<\xcc\xbdU\xf5\x84=C\x12\xbf=j\x99W\xbeT\xfa\xda=q\x8c$\xbe\xeb\x80\x98\xbe;o\x0c\xbe\xe0;\x87\xbdsI/\xbdE\xb6\x90\xbe{\xdd\x80>\x0f\xc8\x99\xbd\xdfy\xaa\xbd\xfa\x88e\xbb\xaf*O\xbe\xad\x9fQ\xbd\xc3\xd7\xb4>\xbf8\x83<\x17\x9a\xe0<{]\x86\xbe\xdd\xf5d\xbe\xe1\xda\x95;\x8a\xe8\xd4=\xdb\x12\x8a>\xce\xb8\x12=\'\x0b\x04\xbe\x9b\x92\x06\xbd\xb0\xfef>@\xffq<\xd7\xb8,>\xaa\xc6==\x87{k>\x89\xce>\xbe*\x9a$>\xa1\xbd\x03=t\x96\xf2=\xed^\x17>L\xc9\x8f>0.y>d\x0f\xf7=\xa5U{=\xd9Fj=\x96e1='
-p1203
-tp1204
-bsV590409709892558849
-p1205
-g2
-(g3
-(I0
-tp1206
-g5
-tp1207
-Rp1208
-(I1
-(I200
-tp1209
-g12
-I00
-S'\x0c=\x90=)O\x8b\xbd\xb0:\xd5\xbe\xf3\xef\xaf>J\x90\xdc=\x80\xa5\x04>\xb6\x08\xc1\xbeQ!\x0b\xbe5|\x10\xbdxd\xa4>S\x80\x91=\xfe\xd7\xfb\xbe\xde\xd5B>\xde\x93\x04>5\xb0>\xbd}\x84\x9e>\x18\xb3\x99\xbd\xd1W\xa4\xbe\x0c$\xba=vM#>\xab\x8b\r\xbf\xe2\xe4\xa5\xbd\x80\xf7\xfd=\x8d\xb2,\xbe\xee\xad\x17\xbeV)\xdf\xbc\xf6\xbbV=:<\t\xbe\x181\x00\xbf{\x02\xb9\xbd\x13m\xa4\xbe\x1f3T\xbe\xce\xee\xa9>\xef\xe1\xbb\xbeo\x98b=R\'0?\xce\x05\x9a\xbeVZ\xac=\x03=\x80>\xcc\x1c\xf8>t\xab\xf5=\xec[\xd1>\x9d2j>\xd6\n\xff\xbe\xf9\x1et\xbeHk\x1c;h\xc3\xd1>MD\x82>\x16\x10\xe6=~\x96\xdf>m\xdeZ\xbd\xf3\xaa\t?\xfd2\x93\xbeQ~S\xbes\x13\x1d\xbf\xdd\xc0\xc8>\t\xf0M\xbe\xdd\x1bL\xbe\x9bB\xfb\xbe\xdb\xa4\xe2\xbe\xdd\xa2\xcb>\xacn@\xbd\x0c\xcc\x1c\xbe7\x06%\xbf-\x1e\x94\xbe%@\xda>#o\xbf\xbe\xc3\xfc\xcd\xbd7\xde\xd6\xbe\xaaV\xc4\xbe+\x03\x1c\xbf\xed\x95\n\xbf[\x86\xcf\xbd\x1b\x04o\xbe\x8d\x17\xc0\xbe\xf8\xcb\xfd>\xfbq\xe6>\xa4o3>\xd7C\xa8>1G\xea=5\xb11\xbe\xbfx\xa6\xbbv\x19\x1f?\x03\x15\xac\xbe=Q\n>\xa7)\x9a>\xf4\x7fy=\x92p\x15\xbf\x8f\xdf\r?\x16\xf8\x91>\xb4n\x04\xbde\x17\xf7;Z\xf8\xcb=\xea\x86\xb9=\x8ax\x01>\xb8\xa1^\xbecF\x16>/\xd6\xdd=#\xbe\xa7>\x8b\x86/>Z\x7f+\xbc\x85:\xcc>B\xaaW>B}[>\x88\x1c\x8c?m\x80\xb2\xbe\x86\x9b3\xbev>\x04\xbc\x85\xb5\xee>\xb6\xb0\xf9\xbdB\xfcQ=\x97\x1b\t?\xe6\xfa6>!S\xc3>\xffy\x90=\x06q2>\xa5\xec\xdd\xbe7\x8a\x99>\xcc\xab\x97=\xf4,\x18>\xf8\x05=?\xa2\xa3@\xbee\xca\xf1\xbdU\xd6\xa9\xbe\x03J\xee\xbe\x8c)\x8b>\xd9`$\xbd\x98\xb1\t\xbe\'\xac\xe6=\xfe\x1b\xdd>\xd5\xee%\xbe\x17\xb2\x17\xbep\xea\xad\xbdH7\xf3=\xd3\xc7\xce\xbe\xbe\x1d\x10>\x0e\x98\x06=H]\xea\xbd\xd3\xd0\xc7=+\x03\x04?\xb3\x0e\xe0\xbeK*\x05?j\x14\x00\xbe\x96\x82\x87\xbe\x94\xfd\xe4>\xfd\x85\x9c=\x19#\xfc>j\x0c\xf7>O\x91G\xbe\xb3[<\xbe,\x15v\xbe\x93v\xb0\xbex\xa1\x14?\xdfg@?\t\xf8\x02\xbe\xca\x1f\xc6>9\\0\xbez{\x0c=hM\xb7=h\x13\'\xbfr\x80\x04?\x0b\xca\x99\xbe<\xec\t\xbf\xc0\xe4\xa9\xbe\xbd\x9f`\xbev\xb1\xa6\xbe\x852\xd5\xbe\xeeQ\x14?\xfe\x81\x83\xbe\x82\xeb\xbc\xbeLTv\xbe\x10\xc7\x1b\xbf\x97\x81.\xbeMs%?\x1eE\x00\xbe\x7fA\xaa<r\x08I\xbf/\xd8\xeb\xbe\xe3\x17)\xbfuN\x92=\xa3v\xf6>\x82\xdf\x0e>\xd3>\xa9\xbe\xe1_\xa4\xbe#\n\x04?\xe3\xc8\x06>\xe8(\xe2\xbc\t\xa6\'\xbcJ\x98-?\xad\xd6\x13\xbf^\xaf\x15>"\xf9\xcc\xbe:\x1c\xbe>\x9b}\xcc>\xbe\x12\xfa>\xc0o.?\xa3\x982?\xfe\x11@>LM\xbb>\x93]\xb1;'
-p1210
-tp1211
-bsV580226908996124672
-p1212
-g2
-(g3
-(I0
-tp1213
-g5
-tp1214
-Rp1215
-(I1
-(I200
-tp1216
-g12
-I00
-S'\xaa5\x1a\xbd\xd9\xb4?\xbd\xd3\xf9\xaa\xbe\xcb\xe2\xb9>\xebQ\xed<\xb1\xc26>}m\xbb\xbeq;|\xbd\xb2\x86\x8f\xbc\xa9\xba\x9d>~\xc1\t={\x7f\x11\xbf*\x1e\x12>\xa9D\xc3=2y\xb5\xbb\xbaGb>\x1d\\\x96\xbd\xdb^\xb4\xbe\xba2\x18>\xc2/;>\xff\x8b\x08\xbf\xbd\x9c\x88\xbd\x8d)\x8e=\x03R\x92\xbd;\xb8\x04\xbe7!\xfa;\x97\x9a\xe2;n\xbaP\xbd^L\xed\xbe\x06\xba5\xbe\x85M\xb2\xbe\xf0\x982\xbez\xfc\x9a>`\xf3\xac\xbeo-\x17=^=*?\x05\x05\xb9\xbe\xe8\x82d=\xfd\xad >\xcd$\x02?n\xf0\t>}\x15\xed>_\xae2>\x89\xaa\xe3\xbe\xa0\xe6t\xbe\x18a\xc6;\xd2\xad\x97>\x90\xf2\x8b>\xef\x9c\xd4=\x1b\xc8\xaf>\x13\xab\x9f\xbd\x1eC\xec>}\x1a\x8f\xbe\xf1Ei\xbe\x92o\x06\xbf\xbf?\xb1>P\x90h\xbe\xca\xd39\xbeN\xe3\xc3\xbe\x89\xf5\xb1\xbe\x03\x18\xc2>\x96\xce\x9d\xbd\x17\xfe$\xbe8\xc5\x1e\xbf\xeb\'\x91\xbe{\n\xc9>\x91~\xb5\xbe\xd7\xf2 \xbe\n\xb9\xb9\xbe\xcd\xdd\xc7\xbe7\x94\xec\xbe[p\xfe\xbe\xde?\xf5\xbd7=]\xbe\xd3\xbf\xc2\xbex\x9c\xea>+t\xdb>*Y\x15>\xb7\xbf\xa7>\x08Op=/\x9f\x1d\xbeR\xcfc\xbc\xc3:\x12?\xef\'\x95\xbe\x9d\x88\x8a=\'J\x8e>`\x96D\xbd^\x08\x05\xbf\xc8\xd4\xe4>Et\x8e>\xe6\xdb\xa7<\xe5\x17M\xbd\xaf\x16X>\xb1aL=\xc3\xf4\xd7<\xa3\xd6y\xbeX\x04\xb1=\xc5\xf9Z<\ry\x9e>\x07\xa0M>\xb5\x11O\xbdz\xcd\xa4>^o7>=~G>\xe9M\x86?^\xd5\xa6\xbepJI\xbe\xea\x00\xac\xbc\xceo\xfc>\xb9.\x0e\xbe\xa7\xe2r=R\xad\xf8>F\x9e\x13>\x87$\xc2>\xdb\x95\xcd=\xd0\x938>\xcbE\xc5\xbe\xa8\x9ai>\x07\xb4B=k\x98\xed=i\x0c"?\x01\xb7\x80\xbe\xe9\xd7\x01\xbea\xbb\xaf\xbe\xd6\x1b\x00\xbf\x8bma>y2y\xbb\xaa\xb8\x16\xbe\x06u\xec=\xf2G\xde>\xc7\xbbP\xbegyP\xbe\x0e\xec\xee\xbd\x9b\xc9\xec=&U\xfc\xbeW\x91\xe8=\x82$\x10=\xc9\\\xf2\xbd\xae\x94\xc0=\x81\xd2\x06?Ve\xd2\xbe-<\xed>hJ\x00\xbe\xc8%>\xbe/\x18\xdc>K\x1f\xf8=\xb2k\xf1>\x8bw\xe3>\ty$\xbe\xb1,X\xbe\xbf*\x82\xbe9\xc5\xa1\xbe\xee\xfd\r?\xca\x98>?B\x19\'\xbe\xc0\x1a\xa6>\x89a/\xbe\x10)]<\xc2\xf4\xaa=.\xe3%\xbf\xf74\x03?\x85\x15|\xbe\x98K\xf7\xbe\x1d\xaa\xaf\xbe\xfd8_\xbe#\x12\xad\xbe\xd5g\xb0\xbe\xfbC\x07?\xc8D~\xbe\x16\x1d\xb7\xbe\x01\x92\x87\xbeh\xd7\x1c\xbf\xa5\xfaL\xbe\xad\xfb\x0b?%\x11\x13\xbe\xde\xd4;=\xf7\x1c?\xbf\xc28\xd0\xbe\xe0\xe59\xbf \x1c\xfc<\x92\xce\xd0>:\xe8\x0f>Wb\x9f\xbeK\x0e\xac\xbe.\x0f\x01?\x83\xd9\x08>\xe1p\xd8\xbd\x9a\xba\xf4\xbc\xa1\xf0\'?\x97F\x10\xbf\xcf\x90\xae=@\xbd\xee\xbe\xcb.\xbd>\x18\x18\xba>\x8d\xb1\xd0>\x16K$?Z\xed9?\xc5C2>\xcf\x83\xc2>\x9aH~\xbd'
-p1217
-tp1218
-bsV578840426175705088
-p1219
-g2
-(g3
-(I0
-tp1220
-g5
-tp1221
-Rp1222
-(I1
-(I200
-tp1223
-g12
-I00
-S'\xf6j\xf1=o\xb4$\xbdz\x1c\xc6\xbe\x91y\x92>\xb9\xb7\r>`o\xa1=\xces\x94\xbe\t\xa8.\xbe\xda\x7f\xdf\xbc\xf9\xc8\x90>\xb6\x89W=\x7fH\xc8\xbe\xff\x12\x12>\x17\xd8\xd7=i\x97\xa3\xbcP\xae\xac>\xef,\x96\xbdY-\x82\xbe"\x18\r=\xdb\xe6\xa8=G\xe2\xe3\xbe\t\xbd\x88\xbd4H\r>\x947\xff\xbd?\xf0\xde\xbd\xef\x9f$\xbd\xff\xbf\x9e=!\x87\xff\xbd\xf1\x11\xcf\xbe\x1e\xe4\xa4\xbd\xacV\x97\xbe\x8f\x96E\xbe\x14\x17w>\x8c\x89\xba\xbeCA]=\x18u\x16?1]@\xbe\x9a\x15\xda=\x8a\xe8\x85>\x0c\x8d\xbb>\xf0)\xe1<,\xa4\x87>\xec\xe6=>)\x94\xc4\xbeg\xf6\x80\xbei0\x9e\xbcV`\xc2>\'wh>\xa9\x9b\xf3=\x9a7\xd3>\xc7\xf7=\xbd\x91\xff\xf0>|ki\xbe\xb2\x88\x18\xbe\xc3\xfb\x08\xbf\xa0X\x9c>\xff=,\xbe\xd7mE\xbe:@\xf0\xbe\xe7\xca\xd6\xbe\x99\xa3\x97>\x8d\xfa\x11=\xb4f\x9b\xbd\xd6\xe4\t\xbf\xb7\xc3N\xbe3\x10\xad>\x9c\x96\xa4\xbe|\x0f\xe7\xbc\x863\xa0\xbel(\xaf\xbe\xe1\xb5\x11\xbf\xb0\x05\xfa\xbefd\xe8\xbdO\x17?\xbeQ4\x9a\xbe\x13Z\xc5>\xe2\xfd\xb9>0# >\xf6A\x9e>\xa2<\x0e>#\x1c\xfd\xbd\x11\x90\x12=\xb72\x05?F\xbf\x98\xbe\xd5k\x00>\x8f\xf7o>O\xb3\xbd=\xc1(\x01\xbf\xe4L\x0e?\xd148>\xad\xc2\xaa\xbd\xaf\xfaC=\xd3\xab.=\xf7y\x1f=\t\xf6 >o61\xbeP\x7fH>\xe7\x7f\x04>\n_\x9e>\xa8\xcd\xae=)J\xdc\xbb\x18^\xb2>j\x9bB>\x01qc>\x93\x16r?\xfe\x18\xa4\xbe\xc8g\x1e\xbeQrA=\xfa\xd8\xc1>gQ\xb1\xbdOC\xb2\xbc\xa9\xba\xd6>\x91!>>\xb8\xec\xa4>\xc5\t\x84=\xbc\xc0\x12>`M\xcd\xbe.L\x86>\x9f\x1fn=\x10d\xd9=\xad\x16.?\x07~\xcd\xbd7{\xb9\xbd\xc5\x97\x86\xbe\x94w\xc0\xbe\xf9\xa6x>i\xa3?\xbd\xe4\xee\xaa\xbd\x109\xea=\xd6N\xc6>\xcf\x1a\xea\xbd\xd5\xee\x99\xbd\x7f\x99\xf2\xbc+\xbc\xb0=\xc4\xcb\x9d\xbeOe\n>\'\xd3\x91;\xf5"\xa4\xbd/\x8e\xb0<\x146\xc7>Q0\xcc\xbe\xb6O\xf1>\xa0}y\xbd\x1ba\x8d\xbe\xbcD\xcc>t\xf1:=\x83I\xc0>\xafc\xee>\x92\xbf4\xbe\xc1R\xda\xbd$\xdb.\xbe$0\x8a\xbe\x04C\xfc>\x13\x8e\x1b?@\x16\xd6\xbd\x90t\xc3>\x12&9\xbe\x87\xcb]=\x13\x96\xe6=4\xb9\r\xbf\x9d\x91\xbc>\x85\xee\x8d\xbeYt\x04\xbfE0\x95\xbe\x0c\xb7,\xbe\xcf\x06b\xbe\xf1\xd3\xbf\xbe\xc6\x82\xfe>l\x8cC\xbew<\x9a\xbe\xb6\xff=\xbek\xba\x08\xbfq\x074\xbe#-\x0b?q\x8c\xc9\xbd\xb1\x17?=\xc3\xf4(\xbf\xed\xb0\xd4\xbe\xd0\x02\xdd\xbe8\\\xb1=\xddg\xde>\x8d\xa6\xd3=&`\x93\xbe\xecYi\xbe\x99\x03\xfa>s\xda\xec=\xafe\x04=\xae\x93\x02<4\xbb\x12?\x16\xc6\xfd\xbe/\x961>\x8e\xd4\x8c\xbeg\xb9\x96>&\xdb\xad>\x1f.\xec>)\x0b\x10?&\xdc\t?Z\xe6\x1e>\xa4\x82\x98>\x0cW\x03\xbd'
-p1224
-tp1225
-bsV590884749809422336
-p1226
-g2
-(g3
-(I0
-tp1227
-g5
-tp1228
-Rp1229
-(I1
-(I200
-tp1230
-g12
-I00
-S'`g >^\x0c\x11\xbdS\xf1\x86\xbe\xac\xe8\xc7=\x9b\xbb\r>\xd5\xed/<\x91\x13\x05\xbe\xd5\xd3\x0b\xbe\r\x0f3\xbd\x82\x15(>\x8d\xd4B=\xc3A\x07\xbe\xa73\xf5=\x9a`\x92=\x98\xf7}\xbd\xe2\x88j>\ng,\xbd\xde\xc6\xe8\xbd\x84\x8e#\xbd\x11\t\xe3<\xcc\xeft\xbeTk\xcd\xbc\xca\xbc\xb8=7\xbb\x08\xbe1\xa3p\xbd\xf4\x99X\xbdcZ\xae=.*\x06\xbe\xaa\x80w\xbe\x98\xed\xca<\x9b\xb5\xf3\xbd#v\xce\xbd\x11\xe1\x11>\x88\x05Z\xbe\xdcM\x1b=i\xc4\x99>\x82\x96\xd5\xbc\x8a\xd2\x9e=\xcd?M>Hx)>\x84\xddC<V\x94\xaf=\x92)\x19>Y\xcdp\xbe\x11\xa5\xe2\xbd11\x01\xbc\x1d\x0f\x8c>Xe\xb1=\xd5\xbfJ=E\x91\x92>R\xf1\xcb\xba\xd5\xe2\x9b>\xfd\x8c\x07\xbe\xd12B\xbdj\xde\xb1\xbe\xac\xa0>>T\tv\xbd9B\xcc\xbdh%\xae\xbe\xbc\xfc\x94\xbeA\xf4=>\xcc\x189=\xf8j\x03\xbd\xdf\x13\x8d\xbeBl\xc4\xbd\xf3\xfbJ>B"?\xbeU\xfdP=\xddBC\xbe\xf7\xd5\x1b\xbe5\x9d\xc4\xbe\xcdp\x86\xbe\xb9\xb4\xf6\xbc,H\xdc\xbd\x05@\x19\xbe\xd6~_>a\x01O>S%\xdd=\xba,\x0f>B\xc1\xf3=Ct\x9c\xbd-\x97\x0e<xe\x99>\x82\x0f:\xbeJy\xf1=\xa4\xbf\x06>\xad\xc0\x08>\x97\x10\x96\xbe\xfb_\xb1>\xf6\xc0\xd6=D\xfe\xa8\xbd\x91Lw=\xee\xa2\xa9\xbd8\x93\x0f=/I(>muR\xbd"\x12\xf9=s\xd0\x16>\xb4\xc0\x1a>\xf4\xf9g<\x8e\x00\x01=\x8f\x14l>\xf3a\xe6=H\xa4\xef=\x13\x17\xf9>7\xf7?\xbef\xd2\x17\xbd\x80S\xf4<\xf5\xdd\x18>\x88\xd0\xe5\xbc\x03\t\xeb\xbccW~>\xf8l\xe1=\xcf\xf3(>oA-<OH~=\x96<w\xbe\xaf\xa2L>\x8e\xca6=J\x80\xa8=\xc3\xbb\xd0>\xa0\xa1\xf5\xbb\xa8`\x06\xbdG\x9b\xda\xbd?}\x11\xbe\xfd\r%>\xd99\x89\xbd\xa7\xb5\xf5\xbc\x99\x00E=\xa9\xaf,>\xfdC\x04\xbd\xa8\x0f|\xbb\x96\xb0\x12<b\x961=7i\x8b\xbd\x12^\x9d=\xef/\x0e\xbc\xcf\xd9\x0b\xbd\xedJ\xea<)t/>s\xfbC\xbezp\x8c>\xaf\xdb\xcb\xbcgBC\xbe1_l>\xde\xaa=<\x99?P>\x141\x85>\xc7\xb2\xf3\xbdaI+\xbd\x95\xc0\xa2\xbdN\xfc(\xbe\x01\xe2\x84>c\xf9\x99>\x14\x05\xf5\xbc\xd9\xc8s>\xfd\x7f\xb7\xbd\xd9\xbff=\x8a\xa6M="\xda\x8f\xbe\xfep7>\xdbq:\xbew\x15\x93\xbe\xb1\x84\x1b\xbe\x15Q\x99\xbd\xef\\\xf8\xbd\xbe\x13\x87\xbec\xeb\x8b>\t\xb8\xb9\xbdg\xbb\x15\xbe\x85\xb1\x81\xbd5}\x81\xbeXob\xbd\x99\x0f\xbc>\xab\xb3\x94\xbc\x18\xa6\xfc:\xcf\xe2\xb7\xbeEz\x86\xbe\xd6}!\xbe\r\x12\x87=\x83\x0e\x88>]2y=\x90S\'\xbeLB\xdb\xbd\xb1r\x7f>\xc5\xe5\x1f=\xec\xa4\x89=\xb8l\xab<\x91\xeb\x96>\x8c\x9dv\xbe0\xcd\x04>\xa1Q\xba\xbd^\x07\x18>\xa8\xc7O>\xd3B\x96>M\x0f\xa5>\xa5\x06i>\x03\xa8\xb1=\xa9~\x02>S\xcc\x81='
-p1231
-tp1232
-bsV580419451931213825
-p1233
-g2
-(g3
-(I0
-tp1234
-g5
-tp1235
-Rp1236
-(I1
-(I200
-tp1237
-g12
-I00
-S'\x7fP\x82=\xf0>\xab\xbd\x13|\xd8\xbe\x00\xad\xb2>Z\xda\x05>\xf4\xb0\xd1=\xbe\x1b\xb6\xbe\xf6\xbc \xbeI\xb6W\xbc?\xd2\xab>JiM=\x87\x96\xf6\xbeP\x08\x13>n\x1c\xa6=J\xe7\xd5\xbcr\x83\xaf>\xf7\xff\x95\xbd\xf1\xbd\x99\xbeI\xa0\xa2=\t\x85\xfb=\xb1X\x0c\xbf\xf4\xab\xb4\xbd\xf2-\x0c>\xe0\xf5(\xbe\xd56\x1a\xbeQ\xe4\xf0\xbc\x9c\xe8\xb4=:L\xf4\xbd\xf7\xa6\xf6\xbe\xb4j\x0c\xbeJC\xa8\xbe\xcc\xd7W\xbe\xc2\xdd\x92>Q\x1b\xd4\xbeT\xb8\x0e=$s6?,W\x87\xbeQ\xca\xbe=\'5\x85>\x91\x80\xe6>\xef\xdf-=\xe1N\xc0>\xc6\xebH>m\x7f\xdd\xbeA`\x97\xbe\xa6\xbe\x88\xbc\x8cV\xd0>\x80\xdb\x89>\'\xb6\x16>\x8c~\xe2>\x83^>\xbd\xa7\xaa\x08?\x0f\xd4\x96\xbeQ\xd8N\xbe\x8e\xdc\x17\xbf\xd9\x84\xc5>\t7B\xbe1\xcdx\xbe\xedB\xed\xbe\x87x\xe4\xbej\xd9\xbd>w\xf5\xa8\xba\xc4\xe3\x01\xbe.?!\xbf\xbfvz\xbe\xb7\xa4\xd6>4p\xc0\xbe\x97s\xa9\xbd\xdc\xca\xcf\xbe\xd4\xef\xce\xbe\xe7l\x17\xbf4\x17\x0f\xbf\x90\x8c\xef\xbd\xd0Rh\xbe\xf3\x8b\xc0\xbe\xc9)\xed>\x17\xb5\xf3>O\xea->\x91\x18\xb4>\xc9\xd2\x05>\xc6\x9c\x15\xbe\xaa\xe6\x0c=\x95k\x16?p\xaf\xab\xbeF\xe2\xe0=\x17\xc6\x84>\x91B\xdb<\xf6\xd7\x17\xbf\xc9\xbd\x1a?\xa1 \x81>\xcd7f\xbdI$\x07=iz\xf4=\xa1s\x8c=\x9f\xe8\x15>\x89Xw\xbe\x7f\x03L>\x0c\xa8\xdf=\x16H\xc2>\x14\xa3\x15>\x831-\xbd\xcc\x93\xc8>,\xe4P>\'hw>\xb5\xc9\x89?/\xf2\xc3\xbe4\xb8A\xbed\xca\xe3<\xf1\xe1\xef>\xc0\xaa\xe7\xbd\xf4vE<\xa0Y\xf2>\x0c\xda,>\xcd\xee\xc3>\xa0\xa3\xcb=\xa75H>p[\xf1\xbe\x10\xe5\x8b>\x872\x15=\x87\x9d\xd0=\x80\xe5A?F\x8f$\xbe\x89\xb5\xf2\xbd\x84^\xad\xbevv\xee\xbe\x81Y\x97>\x17\x8a\x17\xbd! \x01\xbe\xbc\x8b\xec=p\xa3\xe1>a \x1d\xbe\x07\x8b\xf2\xbd\xa0vV\xbd\x81\x81\xd5=\xd4\x81\xd2\xbeP\xbd6>\x96\xe9\xb3< \xac\xa7\xbd\x17\xc3\x14=#\xbb\xfa>\x89O\xe5\xbe*\x80\n?\xe7f\xca\xbd\x9a\x01\x95\xbeS5\xea>\x90\xf9\x86=\x84\x82\xf3>: \t?`xO\xbe\x94\xf8\x0c\xbe\x13\xf0p\xbe]c\xa5\xbe\x10R\x0e?\xbc}>?a\xb0\x0b\xbe\x10\xe3\xd9>v\x9cO\xbe\x12K(=\x84(\xf6=?2&\xbf\xe4\xa8\xef>]l\x92\xbe<\x12\x15\xbf\xad\x14\xb8\xbe\x19oa\xbe$\x0f\x8f\xbe\xfaW\xe7\xbe\'\xb8\x12?}N\x87\xbeV\x87\xac\xbe\xe9ad\xbeU%\x1f\xbf\xe7-N\xbeL\xfb"?v\xab\xe5\xbd\x0c-u=f\xcd@\xbf\x8a\xa5\xe1\xbe\x17k\x19\xbf\\\xdf\xb8=\xd7\xbf\xf6>\x03\xca\x19>\x9c\x1c\xab\xbe\x1f\xc6\x98\xbe\x0fe\x10?\xd1\x1e\xe6=\xfa\x7f\x8e<0\xe8.<\x19\x9d)?\xc1\xa3\r\xbfg\x1a\x13>o\x93\xb8\xbe\x14]\xbb>,*\xb5>\x84\xfd\xf6>\x9cy(?\xdc..?M\xe8\'>\xab\t\xb6>\xd3\xad\x81\xbd'
-p1238
-tp1239
-bsV580289201041752064
-p1240
-g2
-(g3
-(I0
-tp1241
-g5
-tp1242
-Rp1243
-(I1
-(I200
-tp1244
-g12
-I00
-S'$\xe50>1\x0fK\xbd\xac\xe6\x8a\xbe\x1429=\x97y7>\r\xb6\x93\xbd\xed\x10\xac\xbd\xf3p\x05\xbe\x9c\xec\x15\xbd\x8b\xbd\xc3=\n\x86\x8a=D\x17@\xbb,S\xd4=\xb4}I=\xdb=\xb0\xbd\xd0\xd5Q>\x99G\x82\xbb\x10\x1cQ\xbd1\xac\x86\xbdr\x8d\xd5<s"B\xbe\xd4\xdf\x99\xbc\xa0Z\xb0=^4Z\xbeS\x98\x80\xbd(\xb2\x89\xbd!\xb3\xe4=D\x9e-\xbe&%5\xbeh\xf4\xbb=\xecB\xe6\xbc%\xce\xb9\xbdb{\xe3=31/\xbeh\x109<%r^>\x11\xd4\x9c<\x17w\xa6=B\x03P>r\xf7\xc1=>\xe2+\xbb\x06\x9db=!\xa8\x1b>\xa9\x89H\xbe\x148\xba\xbdx\xd3\x89;\x92\x1f\x87>\x054\x85<o\x86\x0e=\x03\x81~>\xa6+"=\xde\xf5\x8e>\xdd\xa3\x04\xbe\xa5\xeaC\xbc\x98F\x92\xbe\n34>2\x13a\xbb\xf9P\xd9\xbd\xe6i\x89\xbe\x11q\x86\xbe\x10\x06,>\xac\xdb\xcc<\xf5\x97*\xbdl;F\xbe\xad\xcc7\xbdCp6>\xd6\xc7\xfd\xbd*\xd8\x83=\x98vd\xbeaE\xb6\xbd\xb0c\xba\xbe$+M\xbe\x80\xd0f\xb9\xd8\xe1\xb3\xbd\xe1\x97\x01\xbei\xd8:>\x96K<>P\xf2\xc1=\x0f\xbe\x9e=\x83O\xf0=\xe5\xa4\x9d\xbd2\x01\x95\xba\x03\xf6F>\xa7\xf1\t\xbe\xd8D\xdc=\x98\xd5\xc8=Da#>\xf1\x0et\xbe\xc1\x15\xa6>\x17\xb5\xd1=\x8f\xd2\x9b\xbd\xaa\xac\xcc=\xc7F \xbe3\x90r={\xa57>\n\x88\xd1\xbb\xb2"\xbe=\xb4K#>\xf6\xd4\xe9={p1;\xb6\xc6?=\xdd\x9ei>B\x94\x98=\xabk\xbb= \xcc\xaa>\x16\x02.\xbe\x1a\xa7\x89;\xdeN\xbc<\x91\xc0\x87=\xad\xb5%\xbc7\x85\xbd\xbc\x85\xc7E>|9\xa1=\x90\xf6\xf3=\x80\xa7h\xbbF\x96\xfb<\xa4"_\xbe\x9ckA>\xbap\t=\xe4 \x9a=\xe0q\xb3>\x8b\x89\xb6<\xfc\xdb\x1b\xbd~\xa3-\xbd\xf4(@\xbdJy#>bu\xbd\xbd\x16\x9e\x81\xbaX;\xb5;\xb1W\xaf=\x8e}\xd3<lW =\xf0\x0e\x15=.0\x80<\xb53\xcd<\x0e\x97\xa2=|\x11Z\xba\x087F9\x15\xc2(=\xf2\x11\xcb=m\xbc\xef\xbd\xba1k>\xf7\xf8\xdc\xbc\x0f\x82:\xbexQ0>\xbc_\x11\xbdQ\n)>\xf6zA>\x98\x1b\xe9\xbd}\xf3\x94\xbc\xdc\xd5\x8f\xbc*\x91\xf8\xbd\x02\x7f!>,{N>\x05m\x84<u\xf1n>\x90X]\xbd\x08yp=\xd6\xaaj=Xp0\xbe\xbc\xc7$>\x1a\xac\x0e\xbe|\xebJ\xbe\xaa\xc8\xe8\xbd\x85V\x81\xbd\'\x11\xc7\xbdQ\x0c\x83\xbe\x0e\xc1Z>\xe6\x82|\xbdN-\x88\xbdrj\x859\xaa\xc2\x19\xbe+cK\xbb\x9ab\xb1>\x12d\xc8<\xc4\xd9J\xbb\x05Ek\xbez\xc6T\xbe\xb1\xf7\x90\xbd\x10\xbc\x99=\x8b\x93S>Mc\x1e=_\xda\xe3\xbd\xa1lz\xbd\x06\x96\x1b>\x8e\x8b3\xbcOn\xfb=\x9d6\xe4<\xd9\xf3O><\xc7\x1b\xbe\xd8\xef\xe5=\xddV\x92\xbb\xe9Z\xea=i-\x1b>\xd1\xe4[>%\x92s>)\x00\xf5=E\xd9\x8b=\x10E\'=4\xe6\xce='
-p1245
-tp1246
-bsV581027567471198208
-p1247
-g2
-(g3
-(I0
-tp1248
-g5
-tp1249
-Rp1250
-(I1
-(I200
-tp1251
-g12
-I00
-S's+G>\xc2\xc5\x86\xbd\xd7\x03\x9e\xbe\xae\x0eH=\x8f\xc8P>K\xf2\x9d\xbd\x16S\xc1\xbd\'~\x13\xbe\x0e\x0e4\xbd\xc1\x10\xf4=\xdb\x05\x98=K\xd5\x1e\xbc\x98\xcc\x00>R\xa8V=\x10\xd0\xc9\xbd{\xe6o>kPi\xbb\xe3Jq\xbdfF\x99\xbd\xa0\x1b\xfa< \xbcg\xbe{\xb7\xa6\xbc\x01A\xc1=\x03\xd6y\xbe*\x0f\x8f\xbd/\xe5\xa5\xbd\x00v\x04>Z\xd3J\xbe\x80}\\\xbe\x9e~\xc6=wL\xf9\xbca[\xc6\xbd0]\x02>\xfe\xdfN\xbe\x00\xeaO<\x18B~>\n\xaf\x9a<@\xbb\xb4=\xab\x9am>\x19K\xdc=\x9b<v\xba\xd6\xee\x92=\xba\xb12>\x9e\xcei\xbe\x1d5\xc9\xbdcS\xb8;K\x1c\x9b>\x17O\xa2<\x1a\xe1\'=\x83\x06\x93> \x03>=M\x13\xa8>\x83\x15 \xbe\xc1\xd9\x84\xbc\xf9\x1b\xaa\xbe.\x16V>\xe9\t\xc0\xbb\xf80\xfc\xbd\xc2\x84\xa0\xbe\xb0C\x9b\xbe]\xdbO>[\x03\xee<\xa7{C\xbd\xed\xaaf\xbe\xc2e[\xbd\x05\x85S>\xfdr\x16\xbe\xbeg\x9a=w\xfa\x83\xbe2\xc8\xd1\xbds\xbe\xd1\xbe\xc6\xd3j\xbeK\xf3\xd2;\x88\'\xd5\xbd\x9b-\x17\xbe\x9b=W>\xd0\xaa`>\xd5\x04\xe0=?X\xb2=O\xaa\x0c>@\xf8\xbb\xbd\xd0w\xc0\xbb\xeb\x01m>\x1fo#\xbeG$\xfd=Ev\xe6=\x87f8>\x0b"\x8d\xbe\xdfC\xbe>\t\xe0\xfa=GY\xb3\xbd\xa8\xb8\xdd=B\xa11\xben\x96\x92=A\x12Y> \xbb[\xbc\x1b&\xd1=oF>>\xa1\xc7\t>\x891\xab;\xc9\x0cN=\xec\x83\x86>\xe7\xae\xbb=h\xd1\xd0=n\x1b\xc4>\xb2\x9fE\xbe[\x14\xee;]\xe7\xb8<\xfd\xd5\x9f=x\x9ae\xbc7\x13\xa9\xbc\xaa\xb6a>\xca*\xa2=\x89o\n>\xd2\xe1\xfc\xbb\x8e90=\x99\xef\x81\xbe\x83\xf6\\>\xc691=\xb3^\xa9=\xbb\xa9\xcf>\xa3.\xb2<\xa7\xee)\xbd\x90SV\xbd\x15\xb6]\xbd\xda\x7fA>\x12\xe4\xd2\xbd.\x96\xe3\xbb0\x82\x99;\x1f\x92\xc6=8\xda\xb4<n\xc4\x0e=+s,=m\xbf\xb0<\x17\xbf\xed<\xad\xa1\xc3=\xe58\xa09\xc1\xf0\xc1:\x82\x8aP=\xe9\r\xef=.\xc2\n\xbe=w\x86>.s\x04\xbd\x9dBR\xbe\xfb\x0eM>\x93\xe2\x10\xbdq\x18E>W\x05[>\xfe\xa8\n\xbe\x1e\x85\xdc\xbcW\xff\x16\xbd\xdb\xd8\x14\xbe\xf059>\x97\x1ep>q\xe6\x82<~\x83\x89>V\x02\x87\xbd\xe7\x83\x86=\x97\xddt=I\xeaS\xbe\x86\\@>J\xcb \xbe\xbe\xb4o\xbe\x99\xe2\x08\xbe\xe2\x03\x98\xbd{\xc5\xed\xbd\xc9B\x9a\xbe\xdb\x14\x7f>op\xa5\xbd1\xe2\xa5\xbd\xb1|\xfe:\t<2\xbe\xb2\xe6\x15\xbb\xc2\xa0\xd0>-^\x05=\x98\x17\xe9\xbb\x15G\x8a\xbe\xef\xc0s\xbe#\xaa\xbe\xbd.\x93\xb1=\x07\'w>a\x98Z=\xf8W\x08\xbe\xf5\xab\x94\xbd^\x912>k\xdb\x85\xbc\xe2\x08\r>\xb1\xff\x07=\xf5\xcam>\r\xa3-\xbe\'l\x01>\'\xa7I\xbc\xf8\xc4\x07>\xbfg)>\x87\xe1~>\x92\x05\x8e>\xe8\xdc\x14>w\x94\x97=\x9a\xa5O=\xff\xd6\xfb='
-p1252
-tp1253
-bsV577417806507032577
-p1254
-g2
-(g3
-(I0
-tp1255
-g5
-tp1256
-Rp1257
-(I1
-(I200
-tp1258
-g12
-I00
-S'\xf9\x83->\xebw{\xbd\xac\x13\xc0\xbed\x1bB>\xeeP$>Bo\xbd<\x1e\xbf|\xbeB\xb0!\xbe\x15\xcdF\xbd\xc4E_>\x0c\xbe\xa5=\xec\x18u\xbe\x9c\xd34>g\xf8\xe2=\xa3\x1e\xae\xbd\x7f0\x94>0\xcaB\xbdpn<\xbe\xcd\x92\x01:\xa2f\xbd=\xbc\xb1\xc8\xbe\x8d&y\xbd\x91\x10\x03>\xde\xf4n\xbe\x1a#\xe8\xbd\xd6\xd1h\xbd)C\xc1=\xbc2<\xbe\xa6X\xbc\xbey\x90#=\x00\xd0.\xbe\xa1\xdd,\xbe\x97G~>\xd3\xe3\x8c\xbe$\x93/=\xbd\xdb\xf5>i\xbd\x00\xbe\x0fR\xc2=\x97\xa1\x88>D\x0c\x9e>3\xff\x97= \xd5k>\xb3\xcaa>\x80\xde\xc4\xbe\xe5\x92\x1e\xbe\x8biL<\xcb\x0f\xc4>\xd1d\x08>\x9f\xdf\x95=\x0e?\xc7>\x00$*\xbc\xa4\xae\xe2>\xdd\x84[\xbe\xf4\x92\xe8\xbd3S\x00\xbfc\xe7\x9e>\xd6z\xbb\xbd\xe5&\x11\xbe\xd3\x8d\xdf\xbe\x8b6\xca\xbe\x1f\xca\x9d>\xb6O\x12\xbc"T\xdd\xbd\x0b@\xe4\xbeP5J\xbe}\x17\xab>\xc2*\x86\xbe+\xc5,\xbbo[\xb2\xbeB\xc3x\xbe;\x89\r\xbf\xf56\xcc\xbeT\x83F\xbd\x90V8\xbe\x9c\xe0\x83\xbe\xb6I\xbb>\r\x82\xa8>\xe0\xc5\x18>u\xd5]>\xc6\x97\x04>\xeb2\x13\xbe"p\xd6\xbb\xfd9\xe1>\xb3\t\x87\xbe\xfd]\x1d>\t\x98^>\x02\xd3\x1c>\xad\xf7\xe4\xbeM\xae\xf2>\xda#P>\xd9\r\x80\xbdb\xe4~=\x82\xce\x8e\xbd\xa0}\xca=\x878?>F\x9f\xd5\xbd\xa1=\x14>U\x95->\x8b\x99d>b)\xac=\xab\x12\xf6<\xba\x0c\xb2>>\x89!>w\xb6#>\\\xf2B?U}\x89\xbe[L\xa0\xbd<\x83\xb2;\xf7\x07\x89>\x1b\xec\x84\xbd\xc4V\x97<v\xf4\xce>\xe9\x9a\x1a>k\xfa\x88>C\x1e\xe9<\x8b\xe1\xc9=\xfb\xb8\xb0\xbe\xf2\xbd\x92>\xee\xeb\x94=\xdaE\r>\x8c\xf2\x15?\xa2\'q\xbd\x82\xc6\xa7\xbd\xa0\rE\xbe\x85\x9a\x86\xbe\xbfAu>\xf5\xb6\xa3\xbd\xf0+\x8a\xbd\xbd\\e=\xef\x14\x88>rz\x84\xbd\xc5^ \xbd\x89\xe5l\xbc4{\x93=\x80?.\xbeJu\xe9=\xd9\xd1\x83<\x1fY\x7f\xbd\x855\x9f=\xeb\xf6\xa7>t\xe4\x95\xbe\x04E\xca>\xfeI\xa4\xbd\x84\x01\x81\xbey\x07\xab>Wm\x0e<\x93\x01\xb6> \xae\xb4>\xb3\\+\xbe\xcc\xce\xd3\xbdV{\n\xbe\xaa*\x83\xbe\xe6\x1d\xd0>\\\x18\x01?\x11\x0f&\xbdK\x9b\xa6>\xd1\xdd\xe5\xbd\xfc\xe7X=\xd1\xdc\x89=\x0f\x9c\xde\xbe\xe6?\xb5>\xc3\xd4\x82\xbe>6\xd0\xbe\xecOf\xbeOe\x14\xbe\xa5^`\xbe\xf5\xac\xbc\xbebV\xd9>s\x83&\xbeb\xe6l\xbe3\x83\xfb\xbdJ>\xcb\xbe\xa2\xa8\xac\xbd\xf1\xa4\x0b?|\xa4\\\xbdLt\xe5\xbb\xceD\x0b\xbf2\x9e\xc0\xbeoM\xbe\xbe<\xe0\xb5=\xcd\x89\xc1>\xac\'\xae=\x07\xacp\xbe\x11\xa8U\xbeb\xdf\xb0>\xe3_\x98=\xadT\x8c=\'\xef\x15<\xad\xa4\xee>\xcdr\xc8\xbe\x0f%\x1a>|\xc2I\xbe$\x17\x83>\xe0\xb6\x9d>\'\xdd\xcd>\xe5@\x00?\xd3~\xd2>I\x1d\x0c>V\x96Q>\x16\x04\xba='
-p1259
-tp1260
-bsV580344461894520832
-p1261
-g2
-(g3
-(I0
-tp1262
-g5
-tp1263
-Rp1264
-(I1
-(I200
-tp1265
-g12
-I00
-S'\xeb\x92\xc6=\xe4\xceK\xbdM\x08\xb1\xbe\xc4\xff{>\xfd\xc6\xe1=\x11\xe9\x9b=\xa7\x0f\x89\xbe\xf8\xed\x06\xbe\x8a\xf4\x15\xbd?\xaf\x81>%\x0e]=\xb4C\xb4\xbeSW\x14>\xc4\xb5\xc1=\x08\x182\xbd\xf4\xa0\x8a>D\xcd\x80\xbd|\xefu\xbe\xda\xf1\x1c=N3\xd1=y\x0c\xd6\xbef\xcfX\xbd\xf6g\xd8=9;\x08\xbe\x1fa\xde\xbd"\xa7\x10\xbd\xa1;\x89=\xe7\xa1\xec\xbd\x05\xf2\xc4\xbe\xf0\x07\x83\xbdW\xfa}\xbe\xccc"\xbe\x8c\x1fz>N\xd8\x9c\xbeg\xcc2=J]\x07?$\xbb;\xbeU\xd6\xa2=\xaehe>\xfd\xb0\xb1>\xc0kq=|\xf6\x87>\xd3x1>\xfd\xcc\xbc\xbeF\xf3E\xbe\x04>2\xbc_z\xab>\x0f\xb1C>NV\xb5=\xa2\x91\xb9>\x0f\xc6&\xbd\x16\x1a\xda>\nr^\xbe\x8c\x10\x17\xbe\xc9\xdd\xf8\xbe\xbb\xb1\x94>B\xe7\r\xbe`\xa1 \xbeRM\xd4\xbe\x85\xde\xba\xbeO\x0f\x96>\r\t\x8f;\xcal\xc0\xbd \xf9\xf3\xbegqJ\xbe\xbd\x97\xa5>>?\x95\xbeEh&\xbd\x0c`\xa0\xbe\x04\xd9\x94\xbe\xf2\x12\xff\xbe\xd1c\xd7\xbe\x97G\xac\xbd\xde\x003\xbe\x17_\x8f\xbe?)\xbc>\xfc\x89\xb1>\xc4n\x12>f\x89\x84>9\x18\xea=\x12\x99\xff\xbdd\xf9\xeb;\x85\t\xf3>"&\x8c\xbe\xb9\x85\xf0=)\xdf`>\r#\x8b=B\xe8\xe7\xbe\xc45\xed>\x0e=G>\x04\xd8b\xbd\x10U\xf4<Cp"=\xa6\x12\\=N\xa1\x06>\xbb@\x17\xbeN/\x18>\x04\xff\xea=G\x97\x81>\xc0$\xcc=\x89\xc7H\xbb\xe6\xb0\xa6>\xb1\x92+>L\x8a1>\xb5mU?V\xdc\x93\xbe\xc1\x17\x01\xbeKR\x91<\xf4\xb5\xad>\x00x\xa7\xbd\xa1\x93\x18;\x11\xad\xca>R\x8b\x16>\xe4\xf8\x93>\xeb\xe3q=\x94E\n>\x83\x17\xb7\xbe\xbcAy> &A=\xf9\xb6\xe9=\x8a-\x16?\xa5U\xd1\xbd\xfc=\xaa\xbdN\xfbu\xbe\xec\xd8\xab\xbe\x80\xd8g>\x1e\x95S\xbd\xc4<\xba\xbdB\xd0\xa8=70\xa6>\x92_\xe7\xbd8X\xa3\xbd\xbe!5\xbd\x8d\x83\xaa=\xe0\x0f\x8e\xbeT \xe9=\xf94\x1f;\xe8N\xa1\xbd\xa1kO=y\xf8\xbb>\xfb?\xab\xbe\x1b\x19\xd1>\xc0\x0f\xa8\xbdk\xe4m\xbe\xb9T\xb7>\x8b\x16h=\xc5>\xb9>"\xc5\xcf>\x80\xb1\x1f\xbe\x843\xeb\xbd\xbd7/\xbe\xee2\x85\xbe\xe2\xce\xe3>0k\x0f?\xdd\xec\xb9\xbdR\t\xa9>\xbc\xab\x10\xbeI\xa1;=ZP\xa3=\xf7;\xfb\xbe\x95\x87\xb6>\xe0\xc2y\xbe@E\xdf\xbe\xd1J\x89\xbe\xf1\x16%\xbe\x12\x1bl\xbe$s\xb1\xbe\xac*\xe1>\x9f\x8f5\xbea.\x88\xbe\x1e\xc41\xbep\x06\xef\xbeIx\x05\xbe\xa2\xf5\x02?|9\xa6\xbd\xd4\x95\xdc<\xcd\xfb\x19\xbf\x85\xd0\xbf\xbe`\xef\xe2\xbe\x12\xda\x94=\xf0\x18\xc6>U\xf3\xd8=y)\x83\xbe\xab\x86h\xbe\xfeb\xd7>\xa3\x11\xbb=\x18k!<\xd7J\x1d;\\\xf4\x02?\x1b\x0f\xd9\xbe,?\x07>\xaf\xaf\x88\xbe^\xa4\x8a>\x83\xf2\xa0>\xa7\x17\xce>6\xd0\x06?\x85\x93\xfe>fz\x11>\x8f\xd1\x89>\x93\xe3C\xbb'
-p1266
-tp1267
-bsV580695881470615552
-p1268
-g2
-(g3
-(I0
-tp1269
-g5
-tp1270
-Rp1271
-(I1
-(I200
-tp1272
-g12
-I00
-S'\xc1|\x0e=\xcd\x1b\x06\xbe\xdd\xc8;\xbf\xe1 \x0e?\xd9LW>\x98\x97\xf6=\x93\xdc\x16\xbf\'\xf0\x10\xbe\x9dV@\xbd58\xe4>`\xa1\x0e>a\xb8?\xbf\xdb\xcb\x92>\x04S#>\x8d\xca\xcb\xbdC\xba\xde>A\xfaW\xbde\x80\x06\xbf\x9fd3>=\x8d\xaf>\xb1\x96p\xbf\x80\xf8\xf6\xbd\xdf\xca">\xf0\x80\xc0\xbe\xd6\x06\x87\xbe\x19\x0cK\xbd\xcc\x9b\xc7=\xff\xb8\x81\xbe\x8f\xcfC\xbfM\x1b\x18\xbe\xb4\xac\xe4\xbe\xcf\xb3\xa1\xbe{\xd9\n?\x84\xc5\x16\xbf\x991\xb5< \x06\x8c?"W\x0f\xbf_i\x18>\x81\xde\xba>\xd9\rK?\xe3\x15b>q\xe9L?\xf8\x9c\xc1>+NP\xbf8\xe8\xc9\xbe\xa5J"=^\xcf\x1c?\xe1\x86\xaf>&I*>\xfd7!?\x90\xdb*\xbddHf?\xe0E\n\xbf\xc2S\xa7\xbe\xfdmn\xbf=\xbd*?U\'\x96\xbei\xa0\xc5\xbe\xdb@\'\xbf\xf5h-\xbf\xc3\'4?\x912?\xbe\xaf\xe6\xad\xbeC6\x82\xbf\xe7\x13\xd6\xbe\x0c\x0e=??\x88\x0f\xbf\xdc|v\xbe\xff\xd3O\xbf\x81N\x18\xbf\xd9\x95o\xbf\xf8aT\xbf\x8f\xe6\x0e\xbe(\xe8\xbe\xbegp.\xbfA\xe5R?\x8d\xc7O?\xf7\xb9\x86>\xd7\xed\xf5>M\xc5\x19>^J\xa4\xbe\xdd\xcb-\xbd\x83\xc2d?D\xc3\xfd\xbe\x86"">\x931\xf3>\xe8\xb2P=\rJk\xbfA\xd5c?\xc1\xcc\x06?\x94\xa3\xbf;\xb1\x98\x9a<B\x1a!>\xb9\xdb>>\xb9\x83&>\xb3\xe2\xac\xbe\'7\x08>\xb3\xdf\x01>\xe6\xee\x02?\x15N\xa7>\xbdf\n\xbd\xd3 ,?\xa1\xe6\x91>\xfe\xd4\xa7>\xd1m\xd9?d\xbd\x18\xbf\xc6p\x87\xbe\xb5^g\xbd`\xc9<?\x88"X\xbe\x94\x0c\x07>\xac\tX?+\x04]>\x12]\x1c?\xf8\x8d\xfd=\xc8s\x8b>@\x818\xbf\x0c\x01\xf0>v\xa8\x96=\xe3Xo>5Y\x95?d3\xc7\xbe\xa5\\y\xbe(u\xfd\xbec\xeb6\xbf\\*\xec>d\x80\xba\xbd\xcf8R\xbe\x9c\xeb\xf2=k\xfb ?\xf4\xa2y\xbe\x15Z\x8b\xbe-\xe2\x15\xbeq\xe4&>\x9cK+\xbf\x93J|>S\xb0\xa2=PH\x03\xbe\xf7\xb3^>\x0b\\V?R\x1f"\xbf\xc9\x12R?c\x0f\x83\xbe\xb1=\xc2\xbe\xe1\x7f7?\xd7\x92\xd8=YFR?\xf4\xed3?\xd6\x82\xa2\xbeW\xff\xb0\xbeI\x02\xb1\xbeIF\x05\xbf\x15\xcbX?o\xdf\x98?[E:\xbe\xb1d+?\t\x8e|\xbe\xd3\xb6"=\xed\xa5<>\x08^\x81\xbf,:s?=\xbf\xce\xbe\xf5\xc0A\xbf)^\x14\xbfpq\xc8\xbe\xe3\xff\x1a\xbf\x91\xdc0\xbf\xc8}i?\x99n\xd3\xbew;\x04\xbf\xa9\x01\xb3\xbe|\xd2n\xbf\xcbWx\xbe\xc4\xf0\x8a?+\x9a\x1f\xbe\x9b\xbbb=X\xf9\x96\xbf\xe5\xa81\xbf\x1b\xf0\x93\xbf\xf9\xc5\xe9=\x8f\xd39?\xfct`>\xef%\xfa\xbe\'O\x03\xbf\x94\x0fA?R\x0b\x0e>\xab4\x10\xbd\x13\x80\x12\xbd\x90\x10\x87?\xa9\xdda\xbf8Y->yf(\xbf\xbd\x08#?\xe9G\x1e?{\xf6)?\xd2\t\x8a?\x99\xb8\x90?N<\x94>"\xc1\x05?\'\x83\xc4<'
-p1273
-tp1274
-bsV580196636284047360
-p1275
-g2
-(g3
-(I0
-tp1276
-g5
-tp1277
-Rp1278
-(I1
-(I200
-tp1279
-g12
-I00
-S'\xf4\xb7K=;5{\xbd\x94\xbd\xb8\xbe\xe5\xdf\x95>\xdf\xd9\xb9=) \xe4=\xed\x81\x9e\xbe\x0eL\xe3\xbd\x87\xa3\xf9\xbc\xdcd\x91>\xf0&H=\xe4\xe7\xdf\xbeL\xc4\x1d>\xf4&\xbf=\xd2\xe7\x0e\xbd\xda\x0e\x86>\xa7+\x85\xbd\x1b\xdd\x91\xbe\x06\xef\xa3=|\x10\x0b>Y\xd6\xf6\xbe%\xff}\xbdl\xef\xc8=d\xd2\x04\xbe\x02\x1d\xf6\xbd\xb5\xd7\xc9\xbcf}]=\xdf\x1b\xd2\xbd\n\x19\xde\xbeA\xab\xd1\xbd\x14\x91\x91\xbe\xc4\x89.\xbe_\x1b\x8d>\xf2\xd3\xaa\xbe\x14A\x1a=L\xbc\x19?\xd0\x08\x84\xbeo\x99\x97=\x8eNZ>\x91\x16\xd5>\xd0\x1a\xb5=\xc9\x92\xb5>.\xe1?>+\xf9\xd2\xbe\x9c\x88]\xbeW\xed\xf8\xbb4\xd2\xac>\xd4We>|-\xcf=J_\xbe>\xb3\xdbK\xbd\x8b\xdd\xed>*\x9c\x81\xbe\x02\x879\xbe\x88J\x05\xbfIJ\xaa>b\xc61\xbe\xaf\xb36\xbe\xaf\x1e\xd6\xbe*\xbe\xc1\xbe\xa6\x87\xb1>\xf4\xc9\x00\xbdy\xc3\x02\xbe+\xef\x0c\xbfu\xe6q\xbe\xecW\xbd>t\xbc\xa8\xbe\xdb\xe1\xb3\xbd\xa0\xf0\xb4\xbee\xf0\xaa\xbeOL\x02\xbfuw\xef\xbe:\x0f\xb6\xbd\x8b$L\xbe\xe4\xf8\xa8\xbeT\xf5\xd5>\xcc\x9c\xcc>)B\x18>\'\x99\x94>4D\xd3=Uc\x14\xbe8\xd7!9?\xa5\x07?\xb2z\x94\xbe\xdf\x9c\xd6=@\xff\x7f>\x94\xe4\t=\xc4m\x00\xbf\xbb\xe6\xf5>,Us>\xe7\xb8\xf9\xbc\xe0\xaf\x838\xbd\x07\xcb=\xa7\xa4w=1M\xd8=s\xf2B\xbex\x1b\x03>\xef\xba\xb2=\xb1\xea\x93>\xb4\xfc\x14>%T\xa2\xbcw\x91\xaf>\xcb\x898>\x96RA>\xe5\xb3p?,\xa8\xa1\xbew\xa2\x1d\xbe\x8ev\x97:\xb7\xf5\xcf>\xc8N\xd4\xbd\xfe\xd0\x00=:\xcf\xe2>\xb8\xe1\x16>Q\xe0\xa9>I\xb5\x95=rz!>\xa4\xe4\xc5\xbe\x95\x97\x81>\xbd\x88F=\xf9q\xf2=\xfe\x98"?Y\x0f\'\xbe-\xd7\xd6\xbd\xa6\xb6\x92\xbe\xb7~\xcf\xbe\xe0tu>\x90\x95\x13\xbd\x05\xac\xf5\xbd\xff\x02\xc7=\x11\x1e\xbf>\xdf\xf3\x15\xbe\x05=\x04\xbe %\x91\xbdX\xc9\xca=\xb8\x91\xb7\xbe\xe5\xd5\xfd=\xbb\x87\x9a<s:\xbe\xbd\xfc\x8a\x97=\xdd\x0c\xe2>\xd9\xca\xbf\xbek\xf9\xe5>o)\xd7\xbd\x1cdi\xbe\x90V\xcc>|i\xa0=E\xb2\xd9>\xd4F\xdd>\x89H)\xbe\xd7H\x1e\xbez3\\\xbe\x8b\xe6\x96\xbec=\x00?\xfe\xbc\'?\xa4\x0e\xf2\xbdt\\\xb1>|%"\xbe\xac\xde\x07=\xdc\x06\xaa=\xa4k\x11\xbfJ\x94\xde>-\x04\x83\xbe\xe0\xed\xf2\xbe\x1d\x1d\x9d\xbeg\x85D\xbe\x14\xea\x8f\xbe\xbc\xdb\xbe\xbe@\xd7\xfa>\x8d=]\xbe\x18_\x9c\xbe\xfa^S\xbe53\t\xbf\xbf\\\x1f\xbe.g\r?%\xd3\xd2\xbd\xa5\xca\xfe<z\xc7,\xbf\xd5\xc7\xcb\xbe\x17\xf2\x10\xbf\xe5?u=\xc4\x8e\xd2>JD\x01>\xb6\xfc\x93\xbe\xf6\xd8\x8c\xbe~?\xec>\xf8@\xdf=\xe8\x1a\xdd\xbcU<\xb3\xbb\x01=\x15?\xb9\xbf\xf9\xbe\x02\xde\xf4=X^\xb1\xbe\xe4M\xa4>>\xbc\xac>\xe1\x0c\xd7>-}\x16?J\xc1\x19?\x1ch\x1e>?`\xa1>\xc6V\x95\xbc'
-p1280
-tp1281
-bsV580943927571705856
-p1282
-g2
-(g3
-(I0
-tp1283
-g5
-tp1284
-Rp1285
-(I1
-(I200
-tp1286
-g12
-I00
-S'\xbd\x1e\xc0>U\xc9\xe1\xbd={\xff\xbeN>\x9d=\xc7\xf8\xc2>X\x00V\xbeM\x94H\xbd\x8d\xee\x9d\xbes_\xfe\xbd\xf8=\xfd=a\xbc\xfc=x\xcb~=_\x95^>Q{">\xb9\xdbH\xbe[7\xbf>k\xca\xd2;\xc7\xdeM\xbd$\xe8.\xbe\xad\xb1\xe3\xbb\xe7\xa6\x85\xbe7\x7f\x87\xbd\xb7\xc3&>\xe8\xd6\xdf\xbe\x11RB\xbd\xef^\x16\xbeS\xddU>\x08\x1b\xb6\xbe\x85Gz\xbe\xedY5>\x17\xee\xd1\xbd\xf5\x19D\xbe\x93\xfbW>\xcb\xf2\xba\xbe\x05\xb8G\xbbO\x8f\xb3>\xe3\x8c\x8d=\x8dGv>?\x9d\xc6>O\x85\xc9=?\xcb\x1e\xbdH\xee%=\xdbA\x9a>\x942\xa5\xbew\xefE\xbe\xd9\x9b\x10\xbc\xbd\x13\xe8>\xc0zD\xbc7\xbf\xa3=\xd7\xd7\xe6>\xae!\x82=(\x9d\x07?%|L\xbe\xd3\xa5J=\x80\x98\xf5\xbe\xa1\xa4\x86>\xb3@\x12\xbd\xb8P\x84\xbe\xb8\x19\xf7\xbe\xfb_\t\xbf\xb0Qt>\xfb;\x83\xbc0f3\xbd\x95\xf8\xab\xbe\x17\x8c\x86\xbc\xd8\x06\xa3>\xb0~,\xbe$\xf9\xbb=?i\xbe\xbe\xb4\xe2\x16\xbe V7\xbf\x93\x80\xac\xbe\x1d?\xff<\x07\x87$\xbe\xf8\xab>\xbe\xbfW\x8e>\x88+\x98>c\x91\x1d>4\xa7(>\xb6\x1f\x8c>\x07\xe0%\xbe@\x18k=\xb5\xd9\x9f>]\xaf[\xbe8>X>\x0eL(>\xe8.\xc8>;\xe8\xf9\xbe\xd0\xbe)?\xbcQ\xbd=\xc9:/\xbe\xc6,\x1e>\x99&\xb8\xbe\x00P\xb5=\x93\x97\xcc>\xb9\xfe\x9d=\x18\x11V>\xaf[\xa1>\xf9xH>oh\xad\xbdut\xf5=\'\x94\xe5>C-+>c\x84D>W\xc5\x12?\xe3~\x8e\xbeB\xe8\xa8;\xc1\x8e\r=b/\x8d=\xd7\x86\x83==!\x92\xbc!w\xa9>7\xd3.>(O(>]\x9aa\xbd\x85\xada=\xa0\x13\xce\xbe \x8a\xcd>\xd7\x89\x92=\x04|\xbc=\x8c\xde ?\xebf\xab=\xdd4_\xbdL\xd2\t\xbc\x08\xca^\xbd\x96O\x94>\xf0\x91C\xbe\xd9\x0f\x14=\xe4fh=\x05\xe1\x19>L9\xbb=\xfd\xab\x00>\x8b\xa3">1_\x15=5;(>\xbb>!>\xfd\x07"\xbd\x0f\\V=\x8dK\x99=\x93\xb2\xfd=\x931_\xbed\xc4\xde>`\xfd\xa5\xbd\x15\x86\xb5\xbe\xed+\x8e>\x13\xd9&\xbe\x1f@\\>\xdb\xbe\xa6>\xfd\xc3\x0c\xbe\xc5\xc7g<\xd1:\x0f=\xa5\xdb=\xbe\xads\x85>0\xe4\x90>\x87l\xdf=k\xa2\xe8>Q\xb2\xef\xbd{\xa2\xeb=\x8f\x0c\x18>\x8b\x8e\x85\xbe\xcd{n>\xeb@\x95\xbe\x8c\xe2\xd5\xbe\xa0RZ\xbe\xb1O\xa7\xbd,\xee\n\xbe\r\x15\xef\xbe\xad\x12\xbe>\xf3p\x8a\xbd-\xf3\xc2\xbd\xbb\x0f\xf9<\xe9E\x94\xbe\x9d?M\xbc\x05A\x1a?\xd3\xde\\=}\xd4\\\xbc\xaf\x18\xb7\xbe\x17\x8c\xc3\xbe\xe0\xcd\xc1<_\xfa\x06>u\xe5\xd6>+\xe7\x0b=\xbf3#\xbe\xf9v2=\x15=r>(\x19\xfc<\x16\n\x97>\xf3c@={\'\xa3>\x90es\xbeQD\x95>\x18-\xd0=PWE>\xe3\x1c\x8a>\xc5V\xd5>y\x00\xa9>32\xcb=\x07~\xaf=\\\xdd\xca<\x0b\xf1M>'
-p1287
-tp1288
-bsV580348639643590656
-p1289
-g2
-(g3
-(I0
-tp1290
-g5
-tp1291
-Rp1292
-(I1
-(I200
-tp1293
-g12
-I00
-S'H\xd3\xb2=2\x8bl\xbd\x15:\xca\xbeI\xe3\x99>&\xcb\xe4=\xf68\xe7=%\xb2\xa6\xbe\xc3\xd3\x08\xbe\xa0\x97\xff\xbc\xc6)\x9f>\xeb\\L=\x8e\xe2\xe5\xbe\x7fJ%>j7\xc3=v\xd6!\xbd\xe7\x99\x97>\x08\xfa\x94\xbd\x1d\x10\x99\xbe\xf2\xfd\x8e=\xf3\x8d\x06>\xe8_\x01\xbf\x92\x1c\x81\xbd\xd6u\xe4=\xca\xcb\x13\xbe\xa1]\xfc\xbd\xe2\x8f\x06\xbd\x19\xd1\x93=\x8f\xa4\xef\xbd\xf8\xf7\xeb\xbe\xc8\x04\xcf\xbd}\xec\x95\xbe*\x0c;\xbeY\xc1\x8f>Ar\xba\xbe}\xc31=]\x04#?\x9c\xec{\xbe\x86\x03\xb3=\n5z>\x86\xcb\xda>H\xc2\xa0=\xd1F\xb6>r\xb5V>\x1d\x8d\xde\xbe\xe4ct\xbe\xd2=\xca\xbb\xe7\x01\xc1>h\xf4r>Q\xbb\xde=\xf1N\xd6>\xadgQ\xbd\x1b\x97\x00?\xa6\x12\x8e\xbe\x13\x8e;\xbecj\x11\xbf\xb1\xa4\xb3>@\xd04\xbe\xaf\x9c?\xbe\xee\xfe\xf0\xbe\x86\xcd\xd5\xbe\xb6\x95\xbd>\x02\xf6\x1b\xbc\x9d\xd8\xee\xbd\xe6\xe3\x14\xbf\xed\xb9y\xbez\xb5\xc6>\xda\xb7\xb3\xbe\x0e\xf6z\xbd?}\xbb\xbe\x92\x0e\xb6\xbe\x13\xae\x0e\xbf\xd6\'\x01\xbf(\x1c\xd1\xbdK+Y\xbe:\x83\xb1\xbe\xb91\xe0>\xcb\x8a\xd3>f\x0f(>\xb4`\xa0>\xb1\xe1\xf3=\xde\t\x1a\xbe\xa4u&\xbayH\x0f?(\x02\xa0\xbejd\xeb=\xca\x9a\x86>v\x9a^=\xa1d\x08\xbf\x03\xe5\x06?MGz>\xd1\x99&\xbd/\xcap<\xf6\x80\xa9=\xbf\x99_=\xd3\xe7\x00>\xb5\xa0H\xbe\x06\xb8\x19>\xaeE\xdd=&\xff\x9e>}\x98\r>d0\x8a\xbc\x8d \xbc>\xff"E>\xef\xe0R>\xbcX\x7f?\x98e\xaf\xbe\x1fe"\xbe\xd9b\x8e<\x93\r\xd4>\xaeE\xdd\xbdD\xbf\x01<\xc4\x88\xed>T\xb3,>\xe8\x9d\xb7>n\xd9\xa2=\x01\xfb">\x8a\xd8\xd6\xbeD\xa1\x8d>D*k=F1\xff=\xfa3/?\x7f( \xbe\xd2\x98\xe1\xbd6\r\x95\xbeX\xbe\xd5\xbe\xe2\x99\x83>\x9f\xeeD\xbd\xd2\x1c\xe6\xbdx%\xd4=\x9cZ\xc9>\xc3s\x12\xbe\x91r\xfd\xbd\xe8\x83\x88\xbdS\x8f\xd2=\xb6\xad\xb9\xbe\xf0\xab\x04>\xe7\x80\x94<cS\xc4\xbdJ\xed\x85=h\x8d\xe8>\x8a_\xcb\xbe\x9d\xe6\xf7>\xa7\xfa\xc2\xbd\x81\xb5\x84\xbe/\xa3\xdc>\x062\xab=-\xff\xe2>\xc0\xc7\xf1>\xda\n9\xbe\xb2\t"\xbeCD]\xbe\x83\xb5\xa0\xbe\x1ai\x07?Gk/?\x1f\xce\xfb\xbd\x13\xc9\xc1>\x1e\xaa1\xbe\xab\xbe2=\x1a\xb5\xbc=\xe0\xe6\x1a\xbfd\x9c\xe3>\x97\xdd\x90\xbe\x89[\x04\xbf#\x1f\xa8\xbe nD\xbe\xbd\xe0\x94\xbe\x80\xa6\xd0\xbe\x11I\x06?\x8e\'_\xbe\xa6\t\xa4\xbe\xf2:X\xbe\x11\xb3\x10\xbf`\x000\xbe\x8d\x1b\x1a?vD\xd6\xbdL\xa0\x16=kd6\xbf\x8d\x92\xe1\xbe\xed2\x12\xbf\x97X\x8b=\xb6\'\xdd>T?\x06>\xef\xf6\x9f\xbe\xaa\xf1\x94\xbe\x9d\xc6\xfd>V\xc5\xde=j\xa7V\xbcs\xea\xfe\xba\x98\x14\x1f?X\x12\x04\xbfV\xce\t>\x7f\xa4\xb3\xbeJ9\xae>#)\xb8>Gm\xeb>Y\xab ?O\x10\x1d?]\x07)>\x04\x08\xa7>r\x02:\xbc'
-p1294
-tp1295
-bsV580218426079203328
-p1296
-g2
-(g3
-(I0
-tp1297
-g5
-tp1298
-Rp1299
-(I1
-(I200
-tp1300
-g12
-I00
-S'sU\x12?\x96ee\xbc\xbbl\x11\xbf\x0f\xeeH=\xf5\x8d\xf8>\x9ag\x04\xbe\xfa\xd4\xe3\xbdX\x9c\xbc\xbe,\x07\r\xbe\xdaG=>bs\xd8=\xb3D\xb0\xba\xedb&>c\xa6\x14>EmK\xbe\x03\x99\x0f?\xba\x8dC\xbd\xedL\x17\xbe\x00\xee\x80\xbe\x9e\xc3,\xbd\xbai\x8c\xbe\xe6\x11\xb8;\rP\x1a>\x95\x1a\xb6\xbe^\x8b\xfe\xbd\xd6\x13\r\xbe\xad|u>\xd5-\xad\xbe\xf2i\xb7\xbe\x15RJ>\xdbN&\xbes9\x13\xbe\xb6p\x08>\xf6/\xac\xbe\xb8I\xe1=\xd2\xeb\xc9>\x1b*\x7f>\xd8\x8c\x81>K\x01\x02?\xc2\x97\xcc=X\xb0\xfd\xbds4\xd3\xbd\xe8\x16\xc3>\xc4\xfe\xa3\xbe\xab\xc2Z\xbe\x02\x1fH\xbd3"\x15?,\x92\x92=\x83\x9d\xc0= \n$?\xfa\x94\xe0=\x97g\r?[\xf7V\xbe\xe6t\xf6\xba\x12\x840\xbf\xe0pa>M\x9eC;hr \xbe\x06;D\xbf\x18p\x10\xbfQ\xa9\x8c>\x02\xe8k>\xca\xbd\xd1=\xce\x13\xac\xbe@\x8f\x11<Bw~>\xdb\x1f`\xbeV\xe2\xab>Uo\x97\xbeQ\xc5E\xbeM\xe7T\xbf\xb3\xa8\xd8\xbe\x059\x83\xbd8\xdd\x99\xbd-\xc1Y\xbe\x0e\xdf\xa6>\x08\xfa\xa4>J\x8a\x88>\x9f\x9e)>\x18\xfd\xae>^5\xd2\xbdEAl\xbd@\x9f\xb0>\x16{\xa0\xbe\xa5~c>\\LK>&S\xc6>uX\xcf\xbeX`4?\xc3\xed\x94=pn<\xbe3W\x9f>c1\xed\xbe(\xf9%\xbd.\x93\xbb>\xe6\x11\xcc=(\xb5\x8c>0\xd0\xce>8\x8b">\xe35\xb7\xbd\x15\xcb:>\xa0\xdc\xd1>\x11\x06\x0b>ZEy>/\x040? O\xd5\xbe`\xe8o=\xe5I)>\xb6\x13\xc1=\xd6}\xb1=\xe3L\x7f\xbe\xb4\xf9\xb8>\x1b\x04\xa5>\xb9\xd1\x81>\x1a\x109\xbbm\xe5\xb7=\xa8\xce\x08\xbf\x16\xcf\xe3>\xaa\x16\xa9=soN>\x1a\x1c:?\xc7\x04\n>\x1e#\x99\xbdV^\xc5<\x06\xfe\xd5\xbc\\\xd3\x8d>\xee\xff\xbc\xbe]J\xd9< se<z\x151>\x03\xdc\xd7<\xfe\xccw>m\xebT>\x855Q=*[\x15>\x00V\x98\xba\x96\x82\x88\xbd;\xd1\x92\xbc\x00`\xda;\x1a\xc4\x86<\x9d\x99\x82\xbeU\xd1\xd2>>\x14\x92=?\xab\x01\xbff \xdf>rP{\xbd\x92\xfe[>Z\x04\x03?\x13{\x89\xbex\x92\x91=hj\xdd=K\x9c4\xbe\xf2\x02\xb1>~\x06\xa8>\xa0F\x87=\xfe\x05\xfc>;\xb6\xf3\xbdp\xd9Z>\xab\xf4">%\xe0\xa8\xbeN\xe7\x01>\n\n\xc6\xbe\x98/\xec\xbe\xcbnk\xbe\x17\xfb\x03\xbdr\x8d\xf8\xbd\xf6a\xfd\xbe\xe6\xd9\xc7>\x1a\x15\n=\x16\xed\xf7\xbdh\x90\xba<\x0ep\x94\xbe\xd6B\\\xbc\xa3\xa4\'?\xbb\x10\x8d=\xeb\xf5\xa6=*\n\xe6\xbe{S\x07\xbf\x06\xfe\xe7=\x92\xa1G>^.\xc3>k\x1cE=}\xc0j\xbe\xa6m\xd7\xbcb\xc7\xf3>=xF\xbd\x13\xaa\x9c>\x05\xc1\xc6=\xc6\x00\xbb>ws\x8a\xbe]R\xa4>\x13}\xa7=Vt\xf8=u\x10\xc2>\xc8>\x11?\xaa4\xea>\x17\xbd\xa3=\xa6\x0c\x1b>%\xc8\xbc=\xcc#\x1b>'
-p1301
-tp1302
-bsV580244647349501953
-p1303
-g2
-(g3
-(I0
-tp1304
-g5
-tp1305
-Rp1306
-(I1
-(I200
-tp1307
-g12
-I00
-S"\x00>\xfa9\n{\xa5\xbdC\xee\x0c\xbfq\xec\x0b?;\x9b\xac=;\xbft>s\xbf\x11\xbf\x08\xae\x0c\xbeK\x99\xec\xbc\x81X\xf1>w\x06\x8c=EoP\xbf\xd3Jn>\xe5\xc7\x1a>\xdb\xe0\xbb\xbc\xb7\xff\xc0>s\x99\xe2\xbd\x97\x91\x03\xbf\xd4IN>\xad\xcb\x86>\x8b\xecR\xbf\xbc\xbc\xf3\xbd\x96\x12\x10>\xcd\xc55\xbe\x93\x8cS\xbe\x84\xb9\xa4\xbbI\xb9&=##\xeb\xbd\xb0o7\xbf\x87_b\xbe\x8d\x19\xff\xbes\xd5\x90\xbeM\xa8\xee>\x99\xf1\x05\xbf\xdf\n\x82=\xccW\x83?`\xe6\x05\xbfkz\xd6=\x01y\x97>;\xf5>?T C>x`/?)\xc3\x9b>\xe5\xe02\xbf\xe4S\xbd\xbei\xb2\xd0;\x83\x7f\x01?K\x1d\xd0>|\xf9,>}\x0c\x13?\xe7j\xce\xbdp-=?\xe4\xc1\xde\xbe\xdf\xf9\xa9\xbe9fW\xbf\xc7|\r?\xe8j\xa5\xbeS\x17\x94\xbe\xe5_ \xbf\x1f\\\x12\xbf'\xf7\x16?\x15\t\xd6\xbd)\x1ev\xbe\x83?u\xbfhH\xe0\xbet\xb6\x1d?\x10\xb2\n\xbf\x1d\xf3V\xbe/x\x15\xbfr\xcf\x16\xbf\xf7`H\xbf\xa7TJ\xbfu\r5\xbe\x8f\xc3\xab\xbe\xd6*\x12\xbf\xef\x048?\xd7\x94*?\xd8\xbai>\xff\x8f\x01?[\x0e\xed=u\xa7}\xbe\xae\x8b\x85\xbc\x9f\x15a?\x11\xb1\xed\xbe\xb7\xe4\x02>)\x99\xdd>g\xee\x89\xbc83S\xbf|_<?\xa9\x93\xd9>;(K<\xcc0<\xbd\x1a\x1f\x8a>\xdd\x0e\xc7=\x9b.\xa3=+\xb9\xb7\xbe}\x90->\xbb\x9f\x8b=\x03!\xf9>x\xd9\x95>\xe9\xcaT\xbd\xbec\x07?h\x13\x92>\x92k\x9c>s\x00\xcf?Qz\x01\xbf\xa8\xee\x98\xbe\x00\x01\xae\xbc9\x87:?\xe5\xfdM\xbe\x13\x1f\xb1=E\x10B?\xa1\xa5}>II\x15?\xa2\xf4\t>k:\x88>+d\x1d\xbf\xf0A\xc4>K\x83\xab=\x10AG>\x11)\x82?\x91v\xb3\xbe\xb5WJ\xbe\x91\xb9\x02\xbf\x7f\xbd=\xbf\xf3n\xb8>\x9b\xdd\xaf\xbcomX\xbe\x85\x7f0>\x9b\xff(?;w\x8d\xbeE\xe4\x8d\xbe\xcc\x1a'\xbe4\x90:>XB4\xbfs.@>\x03\t\x82=\x9b=2\xbes\xd1\n>q\xadL?X\x8f$\xbf\xd7\x8b<?\x81kC\xbe\x0b.\xaa\xbe\xd9\n)?\xe6C!>m\xe4;?\x90\xd11?\x19d\x81\xbe <\x9c\xbeI\xcc\xbe\xbeS\xf1\xfd\xbe|lZ?\xc9V\x92?=@h\xbe\xc1i\x06?\x80t\x84\xbe\xb3\xd7\xbc<\xb6\xdb\t>}\xa0}\xbf\x18\x92I?4L\xd0\xbek\x9eE\xbf+\x06\x03\xbf\x017\xa9\xbe? \x01\xbf\x01P\x0f\xbf\xc3\x8bT?\xd5\xb1\xc2\xbe\x86\x06\r\xbf\xcd\x1f\xc8\xbe\xc5\x9el\xbf\xf1\xe8\x96\xbe\x1d\x06a?\x1c\x8b_\xbe{$j=\x8e\xf8\x92\xbf\xd9\xfd$\xbf\xd0\xd8\x89\xbf\x99?\x84=\x85\xc3$?\x97\xc5U>\xaf\xa5\xf7\xbe\xbfQ\x01\xbf\xa3&E?\xa3\xb1P>K\x08\xe8\xbd-\x91\x03\xbd\x8f\x8b\x81?\xe1\x9f]\xbf\xe5\xb0\x1c>g\x85*\xbf]\x9b\x11?\x1dy\x11?S&(?\x05q~?\xcev\x8b?lE\x87>r\xd0\x10?gN\x88\xbd"
-p1308
-tp1309
-bsV580945328909758464
-p1310
-g2
-(g3
-(I0
-tp1311
-g5
-tp1312
-Rp1313
-(I1
-(I200
-tp1314
-g12
-I00
-S'\x8b;\xd8=Y\xe6)\xbd0\xe5\xa1\xbe\x1f\xd3E>\x15p\xf5=>\xf5\x8c=.H`\xbeIx\x02\xbe\nD#\xbd.\x85l>\xc6\x939=D\xf3\x96\xbe\xafy\x10>\x8a\xf7\xae=\xbcwT\xbd\x06\x91\x7f>\x82ci\xbd\x9a\x1bT\xbeFv\x8d<g\xb5\xa4=\xaf\x0f\xba\xbe\xacp4\xbd\xfb\xe5\xbf=?\x95\x01\xbe6(\xb4\xbd$\xd9!\xbdn\xf6\x8e=\xc2\xeb\xf2\xbdjp\xaf\xbe\x00h0\xbd\x97RU\xbe\x0c%\n\xbe\xc0\xa6Y>\xef\xe2\x8f\xbe\x07\x10&=\x9eE\xea>\xc6v\x0e\xbe\xac\xf7\xa2=~/S>\xc2I\x9a>\xe7\xedZ=\xd9dc>\xf9\xd91>\x10\xeb\xa7\xbe\xd9h(\xbe\xd1\xbf\xbd\xbb5\xbb\x9d>F\xa0\x1f>\x16\xbe\x92=Z\xf9\xab>\xce_\xfc\xbc\x02\x99\xc8>\x0f\nG\xbew\x07\xe8\xbd\x90\xd4\xe3\xbe,\xc6\x83>b7\xf7\xbd;4\n\xbe\xf45\xc9\xbe\x1f\x93\xaf\xbe\xb3\xee\x8b>\xdc\x8c\x17<{\xf0\xa6\xbdPX\xd6\xbey2-\xbez\xb5\x92>\xba\x9e\x86\xbeR\xc7s\xbcB\xec\x8a\xbe\x1b\xc7~\xbe2\xdf\xe5\xbe\x00D\xbe\xbe\x165\x81\xbd&|\x1e\xbe\x15k{\xbekO\xa2>\xd1\x9b\x9a>\xb7\xb8\x07>/*^>\x97\xe8\xe0=\x8f(\xe1\xbd\x06\x8b\xce:\x91\xe9\xd8>zot\xbe\x0f\xc9\xe9=\xd7UG>Q\xfa\xad=\x12\xf7\xcd\xbe\x17\xfc\xd6>\xc5\x054>2\xabp\xbd\x1c\xa0\xdf<BD\xdd;\x89.6=\x1fa\r>\xc6\xc6\xf9\xbd\xc0\x81\xff=,\x95\xf5=\x9eG`>\t\x1d\x9e=\xfb\xe2Q;\x89\xc0\x91>\x91J\x14>\xda\x0b\x1f>\xffz9?\xba\xae\x83\xbe\xac\xf7\xbc\xbd\x02\xe6\x85<\xa6!\x8f>\xff~\x89\xbd\x02\x88\xde\xbb\xdf\x14\xb5>\xbfP\x06>\x0f\x9a\x81>640=\x85"\xe2=?d\xa2\xbe\xda\x06m>\xfb2<=\xf5p\xce=\x11\x84\x06?\xdbJ\xb6\xbd\x9a\xbc\x8e\xbd\x1a\xcdI\xbe\xf5K\x8f\xbeY\xcbN>\xe5Ua\xbd\xd6\xa4\x97\xbd\x93a\x94=r\xfd\x8a>wQ\xc0\xbd^r\x8f\xbdP3\xfb\xbcG\xe8\x91=0Y`\xbeR\xe8\xc6=Jqe:\x0e\x82\x82\xbd\xda\x05M=K\xb6\x9d>\xde\xbe\x90\xbek\xa2\xba>\x15S\x81\xbd?\xedT\xbe\xe77\xa7>z]Q=\x00b\xa1> \xab\xb4>\xeb\xb8\x11\xbe\x02\xf1\xcd\xbd\xe6"\x17\xbe\xe7\x8cp\xbe\x04Y\xc6>NX\xf6>\xd1n\x9c\xbd\xd2\x95\x94><\r\x03\xbe\xa1xO=\xcc\xf4\x86=n\xe1\xdd\xbei\xba\x9b>\xf1Rd\xbe\xfcq\xc6\xbe\xd6\x8ct\xbe\xd4\x17\x07\xbe\x1e\x0fU\xbeD\xb7\xa6\xbe\xbe{\xc5>\xb6\xb7\x1a\xbe\x80\xe0j\xbe\x1c\x96\x0c\xbe\x1c\xfe\xcc\xbe\x9e\xc1\xe4\xbd\xc1\xdb\xef>\x1b\xedy\xbd\x7fD\x9d<U\x9b\x06\xbf\xe1L\xae\xbe\xc0\t\xbc\xbe\xa6\xae\x81=\xc9\x1b\xb0>B\xc2\xbe=\xd4\x98l\xbe\xc5\x14I\xbe\xa9\xb7\xbb>5x\x98=j\xd4\x95<\xf4\x82\xf6;4\x88\xe3>rA\xbe\xbe\x1au\x04>\xfcVf\xbe[\xafv>\x0b\xb8\x8e>\x160\xbc>\xdb\xb2\xee>\xba\xc8\xd3>\xf0\x89\xfa=)\xbcf>\xecK\xea<'
-p1315
-tp1316
-bsV577758239892209664
-p1317
-g2
-(g3
-(I0
-tp1318
-g5
-tp1319
-Rp1320
-(I1
-(I200
-tp1321
-g12
-I00
-S'A\xd75>\xef\x1c\xf9\xbc\x99fc\xbe\x80\n\xbc<W\x13\x1d>\xefwx\xbd",\x19\xbdw\xf3\x00\xbe\n\xfb+\xbd\x0bz\xa7=\xe2\xe4H=\xc3\x9c=<U\x96\xc4=g\xaaW=\xfcLE\xbdD\x89L>\xd5q\xaf\xbc\xeff\n\xbd;0\x88\xbd}h\xae9/j\r\xbe1\x9c3;\xc3`\x89=Y\xb6\x0e\xbeAe\x91\xbc\xd1\xcdx\xbd\x19\xf0\xbc=\x95\x1f\x14\xbe\xfd\xbf\x16\xbe\x99\x05\xa5=d\x02\x16\xbd\x08nw\xbd\x08\xa4o=\xfb=\x1f\xbe\x9dN\xf2<\xb6\xc9\x17>\xc1BM=\xac\x8f\xab=\xf4\x1e:>3$.=OC\xe1\xbc\x18fh\xba\xcb\x89\x01>-L\x1d\xbe\x98\xd9\xa6\xbd\xf4_\xe5\xbb\x97\nT>pV\xb1<\xd8\xac\x12=\xc7![>\x10\xbf\x8e<g;e>\x83\x94\xc5\xbd^\xf6C<q\xd4n\xbeO\xd2\xfa=\xaa#\xa4\xbc\xf7\xe4\xb4\xbd+\xec\x8a\xbe\xacWw\xbeo\xbf\xee=\x90\xbd\x84=\x8d\x14\xa8;\x94\xc6\x17\xbe\xf8\xeb\xc4\xbc(\xfc\xef=\xc3\xef\xd7\xbd\xcd\xed\xc0=1\xd4\xe2\xbdC\x1d\x8f\xbd--\xa1\xbe6=!\xbe\x8b2V\xbc \x80q\xbd7M\x94\xbd~\x8a\x03>\xcb@\xcd=-W\x8f=\xbd\xaa\x91=\xdf7\x01>(.u\xbd\xca\x15[<(\xc2\x1f>\r\x12\xe2\xbd1i\xb7=\x8ep\x9e=/A.>#\x84+\xbe\x9b6\x90>\x12\xa9K=\xf39\xb7\xbd\xc5^\xad=\xb9\xb8\x16\xbe\xb6\x11\xfe9\xc7\x16&>\x88i\x1e<\xe6@\xd0=\x06_\x17>%U\xbb==^\xbf\xbc\xa8@\\=\xf1\xf87>m#\xa0=\xef\r\xc7=!\xbb\x94>lw\xfa\xbd\xc4\xe0\x89:\x1f\xb54=\x98\xee/=\x99\x88\xf8\xbb\x9fZ\x1a\xbd\xd7\xb9\x12>\xad\xbb\x9c=-Z\xb1=\xd2U\xd2\xbch\xb5\xba<a\xb3(\xbe\xad\x85 >\xc3\x90M=\x8d\xe1\x8d=\xda\xf4\x99>\x85XC=C\xed\x17\xbc\xd4\xf6\x95\xbc\xfb7\\\xbcS\xa1\xf2=20\x97\xbd\xa8;\x8e<\xe7\xf1\xd0<F\x84\xba=\xa2^\xa9<\x98\xaf\x02=\xcf\xbd\x18=\x93*\xb3<\x83\x83H=\xd9\x01[=lQ\xef\xbb\x87\xcdE\xbc\xf4*|<\xd6\x0eB=\x8a%\xf5\xbd#\xf4K>\xe8K\x9f<\x83\xb0#\xbe\xfd\xcf\x0f>\x90}-\xbc\xaf\n\xe2="B\x1c>\xd3\x82\xba\xbd\xed\x1e\x0e\xbcL"\x8d\xbc\xe2\xfa\xb4\xbdA\xe4\x08>\xa3\xf0\x16>\x9b\x1b\xca;]hI>\'a\x85\xbd9\xaax=ZOJ=V\x19\x16\xbe\x1f\x89\xbf=\xea\xbd\xf6\xbd%\xaa:\xbe\xe9\x80\x94\xbd-\n\x07\xbd\xedTk\xbd\xdc\xc6H\xbe\x9d\xc1\'>);\x17\xbd\xd45\x99\xbdQ\xed\xf2\xb9}\x1d\r\xbe^`\xbc\xbc\x84U\x83>\xe4c\x83<\xc1\x83\xbb:\x89$P\xbe\xd0\xeb@\xbe\x98\x13\x8a<(\x89U=o\xde%>\xb1K\xf4<v\xd3\xda\xbd\xea:m\xbc\xb8\x95\x00>\xae\xfc\x19<\xe2\x07\xd6=\x9e\xb3\x18=\x9e\x9a.>\xfd\x8e\x11\xbe\x0c\xa1\xf4=g\x91\x81<V\xb5{=\xfa2\n>\x9d\xb5S>\x81\xcd5>6#\xa9=Q\x8e;=SA\xfc<\xa7\x93\x95='
-p1322
-tp1323
-bsV580239492205961216
-p1324
-g2
-(g3
-(I0
-tp1325
-g5
-tp1326
-Rp1327
-(I1
-(I200
-tp1328
-g12
-I00
-S'\x8fn\x1b>pR\x0f\xbd\x0f\ng\xbeS\x11l=MW\t> +D\xbc\xbf\x03\xad\xbd]\xb4\xfa\xbd\x9d\xf7\x1f\xbdK\xc8\x03>\xf8\x8f"=\x97\x1e\x93\xbd\x8a\x01\xca=?\xe4U=o\xbbz\xbd\xc9\x04I>\r\xb4\xed\xbc|\xd0\x9b\xbd\xff0S\xbd\xba\x94;<P\x819\xbe\xac\xe2\x82\xbc9f\x9b=y\xbe\x02\xbeg\xe96\xbdc\x83Z\xbd\x11\xbb\xb5=\x11\x95\xfc\xbd/6B\xbe\x06\xa3\x1b=\xc7\x17\xa1\xbd\xb0\xe7\xa4\xbd\xd7\x06\xd8="w4\xbe\x94\xef\xcc<\xa7si>N9\x18<\xc7\xdf\x8b=|\xee4>z*\xe1=QI\xb4\xbbv\xc32=\xea]\x00>=\xf26\xbe\xd8@\xb8\xbd\x03\xa6\x1e\xbc\n\xe0n>\xfd\x83`=\xbcZ =\xd9\xa8v>\xd7\x15\xd9;\xf8\xb8\x81>\x06/\xdb\xbd\x13\x85\xd1\xbc\x1f.\x90\xbeD\x8e\x17>L\xa7\x0c\xbd\xc7O\xaa\xbdO\xc5\x91\xbe\x9d\xa9{\xbe\xbc"\x18>\x9c\xe7I=Gr\x8b\xbc\x97\xffP\xbe\x9f\rx\xbdL\t >\x8c\x8d\x14\xbe\x19j\x80=E\xbd \xbe\xcd\xbe\xde\xbdM\xc9\xa5\xbeF\xbfR\xbe\xf0\xe8\x7f\xbc\x81\x1b\xac\xbd\x90\x06\xe8\xbd\xa0\x1c)>\x06`$>\xba\x14\xbb=\x1a\xfa\xd0=4\x93\xe2=:\xc4t\xbdJ\x87\x12<y\x94j>\xec\x81\x14\xbe\x8a\xc1\xcf=\x84\xdf\xc7=\xd9\xc9\x03>G\x15o\xbe\x1f\r\x96>\\Q\xa1=N\xf0\xa3\xbd%\x13\x83=A\xa2\xce\xbd\xe7\xa3\xe0<\xf7\x88 >\x8a\xb0\xd9\xbcy\x06\xd7=\r\xb8\r>\x03.\xf3=\xc2n\x82\xbbZ\xd9\x01=\xaa\xd3E>\xffU\xb5=\xe4\x8b\xc1=\x81*\xb9>\xb8\xde \xbeTB\x81\xbc\x19\xd7\xfe<J\x1f\xc3=\xf6@c\xbc\xbb\x0e\x16\xbd$d?>6\xcf\xb2=@\xa5\xfe=\xb1\xfe\xa7;\x1a\x017=\xefTN\xbe\xc9\x16->\x03\xb1\x07=H\xfc\x82=\xa9\x07\xa9>_\x9bp<\x9f7\xc3\xbc\x9e\x05\x8b\xbd\x87\xec\xb0\xbd\xc5W\r>\xfbZ\x8c\xbd"\x12\x8c\xbc7M\x01=\x93\xe0\xef=U\x80\x1f\xbc\x01\x9a\x9d<\xac\x7f\xc1<\xack\xf4<E\x84\x9d\xbc\xfc\xc0\x85=z\x02Q\xbc\xca\xe0\x90\xbc\xdd\x88\x9b<\xbdp\xe9=\xbf\xdb\x10\xbem\x83_>\x13CZ\xbcQ\xea)\xbe149>\xb9\x97\x8c\xba\xabt\x1c>\x80\x10W>\x89l\xce\xbdr\x8c\x9a\xbc\x14\xc7O\xbd\xa9\x84\x03\xbe\xa9\xf8D>&\xf2`>\x8f2S\xbc\\\x90P>y\xa0\x93\xbdgja=\x9c\xf8-=\xc76R\xbe\x91|\xfd=\xaeO\x19\xbe\x99ck\xbe\xcc\x8a\xf9\xbd\xf4\xed[\xbd\xe65\xb0\xbd\xe3\xeel\xbe\xd6\xc5W>\n\xaf\x82\xbd\x90a\xc9\xbdG\xd2\x02\xbd6\xe2<\xbey\xed\x06\xbd\xb3\xbf\x9b>`K\xb9:\x97?\x11;\xf9\x84\x88\xbeI\x96Z\xbe\x84,\xae\xbd \xc9x=\x8d+Z>\x8a\xceC=\x16\x8b\x02\xbe\x08h\x8f\xbd\x11~D>\x18\x93\x95<\xa8\xf5\x9e=\xcaU\xcf<\xf1Ya>\xf4=/\xbe\xcd\x08\xe7=\xd6\x83\'\xbd\xf13\xe2=\tZ\x1e>@$u>\xccd}>\x14\\\x17>\xea\x87\x83=O\xff\xa6=\x10w\x82='
-p1329
-tp1330
-bsV580894517382885376
-p1331
-g2
-(g3
-(I0
-tp1332
-g5
-tp1333
-Rp1334
-(I1
-(I200
-tp1335
-g12
-I00
-S"\xfb\xb2\x1e?t,\x93=e\x81\x1d\xbf\xf7\xc4\x11= \x18\xe0>\xb0K\xd6\xbc0\x04W\xbek\xf7\xb6\xbe\x19 \x89\xbd \xd9\xb1>a\xd8\xd6=m\xe2\xab\xbd\x98\x96Z>S\xdd\xfd=\x8d\xdc \xbe\x94u\x18?y\x13\xc3\xbd\x90\xdc<\xbey\x8f\x89\xbe\xeb\xe9<\xbd\x1f\xc0\xb5\xbe\x00M\xc8\xba\xcdD\x8c>\x16V\x8b\xbeKQ\xc7\xbd\xa3\xa1)\xbe\x0fou>\xa9\xd5\xaf\xbe\xf1$\xd3\xbeU\xaf\x16>];\xc0\xbdL*Q\xbe\x8crC>\xb1\xcb\xe0\xbe\xa9\xa6\x0f>3\xf4\xfa>8\x04i>\x0b\x02r>\t\xc1\x00?E\xa3E>\xa7\x0e\x8e\xbd\x93F\x13\xbd]\x83\xb8>sZ\xd4\xbeH\x8eE\xbecL'=\xbbA:?\xb20\xa4=\x03\xed*=\xa1F@?\xc0\xc5\xc6;a\x16*?M\xb5\x91\xbeW\x89\x1b=mdN\xbf+ \x9b>\x91\xf4\x9e<\x99F\xbb\xbd\xe0\x01_\xbf $,\xbf\xe3\xf4\xbc>\x17~\x95>P\xc6|=#\xf6\xcd\xbem\x89\xf9\xbd\xf0\x8a\x9c>cr\xae\xbe9\t\xca>A\xbe\x9a\xbe\xb0/\x85\xbe%\x85[\xbf(\x08\xfd\xbe\x1f\xc2\xd6\xbd\x10\xb0A\xbe#b\x8d\xbe\x05\x1c\x9f>\xfd\xfdm>\xceD\x95>\x05\xbaj>w\xe8s>\xc9\x1e\xf4\xbd\xd5k\x81\xbd\x10\xf7\x01?\x00\xfc\xc4\xbe\xf34\xa2>\xc93\x80>\xe3d\xe8>\x88\x99\xfb\xbe\xa0GF?\x96\xec\x0f>\xa6\xd4\x81\xbe\x1b\xab}>\xe7\xac\xe6\xbesOf=\xad\x9a\xe8>\x8dL\xe0;\x13\xae\x9d>\xcc\x96\xe3>\xa8\xf8n>A\xfe\n\xbed\xae\x9c=\xab\xf2\xe9>+f9>h\rc>[\x0eO?X\xc4\xbd\xbe\x10\xf5\x8a=W\xa5@>\xad\xb5\xbf=\xa5o\x1f\xbd\xc1\x0f\xa2\xbe\xf8\x00\xd2>o\x05\xa1>\xbd4\xa0>h\x8a\xfb<5z\x87\xbb\xac\xad\x02\xbf\xad\xd4\xed>\x11\x01\r>\xfd\x16.>\xd8\xc3H?\x9f[&>\xb8\x85\xad\xbd1\xe9\x05\xbdhi\xe1\xbd\x7f\x1a\xae>\x18\xach\xbe\x9f\xcf\xc5=\xa8\x03\t=\xc4\x821>D\xec\x8e=\xb1Y\x1e>M\xcd\x8e=cKs;Gd\x83=\xf9\x9a\xa9=\xd9U\x13\xbd\xfe\xf3\x00\xbdx,\x9b\xbd\x172\n>so\x8b\xbe\x9d`\xeb>\xef\x05\xc6=X2\xe6\xbe\x17\x81\x06?\x94\xeeB=\x03\x9e\x8d>\x05\x83\t?a\xbc\x8c\xbe\xf5`$\xbc\xc1\x15]<\xcc\x8c\x8e\xbe\xc3\xa0\xce>\xd3?\xb6>\x9b\x81\x14<#\xe4\xf8>P\xf6%\xbe\xc5w,>\xcb\x1e\x04>\x115\xf5\xbe\x99_\x1c>\x05\x16\xca\xbe\xbc\xb4\r\xbf\xbe\xd1\x8c\xbe\xd5?J\xbc{\x9d,\xbe\xf1\xc8\r\xbfg\xbf\x08?\x90S\x8b\xbc\xcd8D\xbe\x15\xfe\x11\xbdw\x95\xa5\xbe\xb0\xb2\xe5\xbd\xcb5V?\xc0\xded=\xac\x82$=5\xcf\x15\xbf\xf3\x1b&\xbf@\xf6\x95\xbb\x0cZp>\xf8\xfd\xfd>\xc8\x1f\xf9<\xfa\xfd\x9b\xbe\xb3\xc9I\xbek?\xf0>e/\xf3\xbcGx{>T^\x13=[,\xea>\xccP\xb4\xbex\x1d\xa2>\x8b\x06N;\xd4.|>\xf8\t\xd1>\xa9\xcc'?\x9d\xcf\x1e?\xb9\xd2\xe3=%\xa8;>C\x1f\x02>L\xc9\x8c>"
-p1336
-tp1337
-bsV580705331547897856
-p1338
-g2
-(g3
-(I0
-tp1339
-g5
-tp1340
-Rp1341
-(I1
-(I200
-tp1342
-g12
-I00
-S' /\xaf=\x07\xc4\xda\xbc\xa0gq\xbe\xc0\x84\n>{\xc7\xb6=I\xd0A=;\x91"\xbe\t\xdc\xbb\xbdD\xff\xcb\xbc\x8a\xa1->\x06"\x07=/\xcdS\xbe\xdfQ\xcd=\xb2\xd6k=\xfb\x99\x19\xbd?/;>\xd9\x0e"\xbd\x14\xd0\x18\xbe\xa1\xb5\x01<\x07\xc5h=\x8a\x99\x86\xbe\x8b\xe9\xee\xbc\xdd\x89\x8f=d\xdf\xbc\xbdh"\x80\xbd\xbe\x07\xfe\xbc\x14|a=\xf1\xbb\xb4\xbd\x9c\xe2~\xbe\xe4Z\xf2\xbcY\xc7\x11\xben\x91\xc7\xbd\x01a\x1a>\xf5GQ\xbe\xfe\xde\xec<\x0f\\\xa9>ex\xc4\xbd\x8e\xa4s=\xaf\xc6\x1d>\xfb\rZ>\r\x93\n=l\xb9">\x8b\xb3\x01>\xe4\xe8s\xbe\xebj\xf6\xbd\xcc\xa6\x86\xbbt\x9aj>\x7f\x06\xe0=)\xc5T=5&\x80>\xf9/\xb4\xbc\xb3L\x93>v\x1a\x16\xbe\x15\xe1\xa2\xbd\x8d\x11\xa6\xbeE\x83@>\xb4\x12\xa7\xbdx\x93\xc6\xbdq_\x94\xbeL\x1b\x81\xbe,\xf2M>\x03\xd5a<\xb3\x04a\xbd\xfe)\x99\xbe+\xca\xf3\xbd\x84_S>\x16\xc1C\xbea\xe8\xce\xba\x8fIK\xbe\xca\x1a5\xbe>:\xa9\xbe\xd9\x19\x8a\xbeK\xe19\xbd\x92\x13\xe6\xbd\x02\x058\xbe\x0bUg>\xac\x18\\>P\x88\xc8=j^ >\x98\x94\xa3=\x06\xe0\xa6\xbd^\x84B\xba\x8c\xb4\x9c>\x9d\x003\xbe\x13\x00\xab=#\xf1\x0e>dX\x87=\xb4<\x94\xbe\x16\t\x9d>|\xeb\x01>\x1c\x177\xbd\xff\r\xd7<uw\x7f\xbb\x8e\x9d\x0e=nU\xd4=\xf1n\xae\xbd^\r\xba=3\xd4\xba=\\\xd8">\x88xV=+\x7f\x1c;oFW>\xec>\xd7=\xecQ\xe4=\xfc\xf1\x04?\x13\x82?\xbeiF\x84\xbd:\xfa\x8b<\xe4\xecI>\xd3\x9aO\xbd\x078N\xbc\x91\x1a\x80>\xe1\xa4\xc4={\x9f<>\xd5]\x0f=\x9a\xb9\x9a=\x80\xc7l\xbe\xad\xa7,>^\x99\t=\xec\xe1\x94=\x1f\x9f\xc3>\xbc\xbft\xbdJ\xa3Z\xbd\xb8\x99\r\xbe\xbf0I\xbe\xd4\t\x18>d\xe0&\xbd<wH\xbd\x9a\x8aT=\x06\xb0B>o_\x80\xbd9\n>\xbdT\xa2\xbd\xbc|mF=\xfd\xed\x1e\xbe)\xcf\x8f=\x1b\x1f\x1d;\xb3\x89;\xbdi\x94\x03=\x8d|a>\xdc\x08Q\xbe\xf5K\x85>\xb4\x1d.\xbd\xd4\x0c \xbe\x07;s>\x84\x0e!=\xf2\xd8i>\xdb\x02\x83>\x1c\x1e\xda\xbdqP\x98\xbdLb\xd8\xbd\x0c[,\xbe5\x0b\x8e>\\\xe0\xb0>\xb4\x88d\xbd\xef\xc9]>n\xc4\xbb\xbdA\xa8\x10=J\xd4H=(\xed\x9f\xbe\x1cT_>]v&\xbem1\x8f\xbeW\x8c2\xbe\xae\xd9\xbe\xbd\xcc\xa5\x19\xbe)\xbfu\xbe\xcd_\x8f>\xbaQ\xd8\xbd\x95z$\xbe\xe9\xe6\xc5\xbd\xd8\\\x91\xbe;\xdd\xa6\xbdY\xd9\xb1>\xfe\xcb\'\xbd5!s<\xceo\xc2\xbelM\x81\xbe\xdbX\x85\xbe\x12\xa3C=\xbcc~>\x17>\x87=1\x8b-\xbeR\x0f\x16\xbe\x06\x96\x85>\xce\xdaK=|*z<q9\x96;H\x1f\xa4>\xfd\x1b\x87\xbe\x9f\xa3\xbe=1\xd6"\xbe\xc9\xb14>&eN>\x05K\x89>\xe0\x92\xad>\xc9\xd5\x95>\xc5}\xb3=F"#>^v\xcb<'
-p1343
-tp1344
-bsV580248015677628416
-p1345
-g2
-(g3
-(I0
-tp1346
-g5
-tp1347
-Rp1348
-(I1
-(I200
-tp1349
-g12
-I00
-S"\xd6}\xf8=\xe0>]\xbd\xfc\xe6\xb8\xbe8%\x99>\x86C\x19>\x04\xd4(=\x83&\x8b\xbe\xc04S\xbe4\x8b\x13\xbc4&\x85>\xa7\xfeZ=\xcct\xb2\xbec\t\xdd=\xe3\xfc\xd7=\x80\x80\xba;\xe4'\xbc>\xb8I\x8d\xbd]_J\xbe\x03F\x81<V\xe7\xd9<\x94<\xca\xbeJs\xc2\xbd\x1d\xed6>3\xd0\xf3\xbd&\x1b\xec\xbd\x99g'\xbd\xb1\xbd\xb5=\xa7\xac\xeb\xbd\xdcz\xb8\xbe\xfeN\x91\xbdI\xc8\x9e\xbe\xef\xae]\xbe\n\xd9Q>\x91e\xb8\xbe\xa6\xbcX=wn\x13?\xf9\xc9\x12\xbe\x93:\xd9=\xdeu\x8d>\xc1L\xa1>\x80\xf8\xf5\xbc{\xfe9>\xafA\x10>)\x89\xa0\xbe\xbc\xc6\x8f\xbel4L\xbd\xa6\xc6\xc6>f\x8do>TM\x1a>D\xa2\xcd>\xcf\xc0\x0f\xbd7X\xdd>\xb8\x1b/\xbeY5\x0e\xbe6z\xfb\xbeD\xff\x8f>\x00\xba$\xbeQ\xc7V\xbe\xbf\x80\xdd\xbem\xff\xd0\xbe\x03\xafZ>\x80S\x94=\x9fI-\xbdh\xa0\x02\xbf\xd5$-\xbed\xf6\x99>bs\x96\xbe\x8f\x9a\xe9\xbcv\xc4\x8e\xbe\xae\xc2\xae\xbe%\xf8\x12\xbf\xbf\x88\xfb\xbe\xc7!\xf6\xbd\x916/\xbet\x18\x83\xbe\x8c\x1a\xb0>\x0c\x10\xaf>rH\x16>lq\xa5>\x08.\x1c><\xc1\xbf\xbd\xd2\x84\xb6=\xffd\xfd>\xea\x18\x97\xbe\xef\xcb\x05>$\xdcN>\xa1\x9e\xc5=\xaf\x96\x00\xbf\xc9\x03\x17?\x96\x9b\xf1=\x0f\xc5\xed\xbd\xdb\x08\xa9=\xf9n\x0e=\xdd\x9d4=Cu:>\\L7\xbe\xf0\x01\x87>\xb9\xff\x14>6z\xac>\xcatb=\x14Kt\xbcA<\xac>4JI>\xba\x9by>\xb4\x8de?\xe8\x10\x9f\xbe\xac9.\xbe\xd8w\x96=Ty\xba>\xfa+\x7f\xbdc>\x04\xbd\x01\x98\xb9>luM>\x01\xb3\x94>\xf4\xc1\x88=q\xdf\x1a>C\x08\xcc\xbe\xfaZm>\x06x5=\x83q\x8f=i<-?\xc9\xf5\r\xbd\x07\xc8\xa3\xbd\xc5\x8b\x89\xbe\x83W\xbb\xbe\x047w>\xbcT\x07\xbd\xc9\x07\xb3\xbdj3\x01>\x9d\xb2\xca>\xbf\x8a\xb3\xbdF\xad?\xbc\x93\x92?<8\x13\x96=I\xbf\x8d\xbe\xed\xce'>\x91D\x00\xbc\xd2f\x89\xbd3\x1e\x1b\xbd\xaer\xb2>6,\xd5\xbe#D\xec>\xe9\xe4?\xbd0\n\x9c\xbe_p\xb4>\xc6\x10\xfd\xbb\x1cS\xa7>c\x81\xf8>\x10\x8f,\xbeQ\xbf\x0f\xbd\xe9R\x17\xbe\xe0Ml\xbelI\xef>v\xbe\x0f?\xe5*\xb4\xbd\xf9\x12\xc7>d\x1fA\xbe`\xbbV=\x1e\xd2\x06>nR\x00\xbf\x12\xf1\x94>\x87\n\x8e\xbe\xa0&\x0c\xbf\x0f\x8d\x81\xbe\x99.,\xbey\xaa\x06\xbe\xc9(\xb6\xbeS!\xf6>\x97\xe8F\xbe\xcc\x9c\x8f\xbe\xbc\x90,\xbe7F\x05\xbf\xc3\xe60\xbe\xcc9\xf3>\x10\xaa\xc9\xbd\xaf\xb7~=i\x05\x1b\xbfW\x9a\xba\xbesI\xa7\xbe\x03\x83\xe1=\xfdn\xe4>`\xab\xb7=t|\x86\xbe?\x064\xbe!\xec\xfd>o?\x06>jc\xa7=\x94E\x00=\xf4\xc6\x07?\xa9\xec\xed\xbe$\rO>\xc0YL\xbe!\xe8\x81>\xf4b\x97>\x14[\xed>\xbck\xfc>\xe3h\xfd>\x7f\xe9\r>\xe4T\x92>\xd6k\xc5\xbd"
-p1350
-tp1351
-bsV581046748094816257
-p1352
-g2
-(g3
-(I0
-tp1353
-g5
-tp1354
-Rp1355
-(I1
-(I200
-tp1356
-g12
-I00
-S"\x8c1\x12=D]\xdf\xbc\x06\xe7X\xbeU\xce >\x86Cl=\x8d\xfc\x83=r\x03(\xbe\xc3v\x82\xbd\xad\xdb\xc6\xbciE(>#\x0e\xb7<\x04\x16\x81\xbe\xb1\xf3\xba=\x97^S=\xc3h\xc9\xbc\xf4\xff\x1b>97!\xbdNy-\xbe\x9c\x1f\x1e=\x17w\x9d=\xbb\xaa\x8b\xbe\xc4}\xf2\xbc]\xedG=}\n\x83\xbd\x0c\x81{\xbdjd\x8e\xbc\xc8\xb1\x0b=\xcd\x91z\xbd\xbc\xd2{\xbe\x99\xce\x88\xbd\\\xd8,\xbe\xd6\xfe\xbc\xbd\x83N!>\xf4\x97M\xbe\ng\xa0<\xcc3\xae>\x19\xd7\r\xbe\xec\xa5G=M6\xf5=\xd1\xbbt>Pr@=\xa7\xe3H>L\xa8\xd1=\xc90o\xbeg\xd0\xff\xbd\xc5\xd3\x81\xbb\x11\xb4?>!-\xfb=\xec\x0bU=\x8c\x00Z>!\xb3\x0e\xbd\xa1!\x89>\x9f\x95\x14\xbe\x7f \xc7\xbd\xb7\xde\x97\xbe/.9>\xbc\xb5\xcb\xbd\x03\xde\xcc\xbd\x8a\x9f}\xbe\x91\x98c\xbe\xe1YK>\xf3\xa5T\xbc\xbf\xaa\x90\xbd\xceL\x9d\xbe:\xfd\xfd\xbd\xb6\nV>JLB\xbe\x14p)\xbdT(I\xbem\x89B\xbe\xcd\x8b\x93\xbe\xd1\xa4\x86\xbe\xc7\x05b\xbd\xd0\x1d\xe3\xbd\x99\x88D\xbeI\x1di>\x93\xcdg>\x9fR\xb4= Z(>@\xd1\x82=\x85\xd3\xa3\xbd\xacBI9\x89\x05\x9a>\xcf\x16*\xbe\xb4\xfd{=\xdf\xeb\x0e>Y\x08\xaa<\x1c\xe7\x90\xbe\xccU\x8e>\x97q\x06>J{\xbb\xbcF]r\xb9\xff\xe2H=\x1c\xbe\xc8<\xa1Z\x87=\xb4\xf0\xc9\xbdr\x94\x98=\xfd\xf8U=\xe0\xc3!>bO\x90=\x93\x1dI\xbc\xc3wI>\xdd\xb9\xce=\xc1e\xe2=K\xa7\x08?a =\xbe%\x84\xab\xbdQ>\xac;\xe7\x17h>\xf3\xd6g\xbd\x07q\xdd;\x16\xe4\x7f>Q%\xa7=\xdd1@>\x89J/=(\xb9\xb2=\x9a\xd8b\xbe\x07u\x17>^\x17\xa0<\xf4\xc4\x85=\xcc\xd2\xb7>9\xd2\xba\xbdS1j\xbd\xb9\xa7!\xbe\xf79i\xbe\x9cY\r>/d\xe0\xbc\x86\xf9\x82\xbd\xea\xbaY=C\xc7S>\xac\xbd\xb2\xbd\xb7\x98\x94\xbd`E\x15\xbd-Y]=\xea\x87O\xbe\xfc4\x8b=z\xcej:\x14\\M\xbd(\xa2$=\xb7\xdey><\xb2T\xbe\t\xc1\x81> tn\xbd\xe1*\x03\xbeZ\x89q>\r\xe2W=\xe1\x0eo>\xe3\x00\x81>F\xc5\xbd\xbd\x07C\xb9\xbd\xa3{\xf2\xbd.\xef(\xbe\xf0\xbe\x92>@\x01\xbc>4\x82\x8e\xbd\x97\xe1N>,\xd7\xc1\xbd\x00l\xd5<\r\xf8F=\xf7(\xa5\xbe}\x97r>O\x81\x15\xbe\x9c&\x8a\xbe'\x1cA\xbe\x8d\x82\xd6\xbd\xf7\xfb)\xbe\x1c\xec^\xbe\xcf.\x8c>\tT\xe7\xbd\xf2\xf7*\xbeCk\xee\xbd\xe1\xe3\x9c\xbe\xafb\xbe\xbd(\x9b\xa2>\xcc\xe5[\xbd\xb9!\xaf<]Q\xc6\xbe\xe1\xd7p\xbef\xeb\x9e\xbe\x10\xbe\x0b=\x9f6t>\xc3Q\x8e=\x02:(\xbe\x94\x00\x1d\xbe D\x89>1$p=\x85|\x84\xbcR\xf6\x98\xbbi\xb7\xa8>\xc7\xd3\x8c\xbee\xf4\x94=d(I\xbe\x11_;>L\x0cL>Z\x93{>Ty\xad>\xc1\xa8\xa8>\x81\x0c\xaf=\xed\xd16>\xc1\xba\x0f\xbc"
-p1357
-tp1358
-bsV580250969071439872
-p1359
-g2
-(g3
-(I0
-tp1360
-g5
-tp1361
-Rp1362
-(I1
-(I200
-tp1363
-g12
-I00
-S'"p\xae>\xfa/\xf0\xbdt\\\x1a\xbf\xd6\x00\xed=\xa0\'\xbf>a\xceB\xbe\x0b\x1fH\xbeB\xdby\xbe\xb4cx\xbd\x97\x0c;>x&#>r\x0c9<\x9e\x82O>\xb1\x0f\xb0=/\x15;\xbe\x1aC\xce>\xbe\x03\x8a<(\x89\xe7\xbd"4\xfd\xbd\x89j\xb4=H\x91\xd6\xbe\x80q-\xbdd\xd9<><\x06\xfa\xbe\xe2\x98\x1b\xbeF\x04\x13\xbez\x9cy>\x86S\xb8\xbe\xb9n\xbd\xbep\xf7K>\x1a\x89\xc2\xbc\xb2\xb8A\xbe\xc2\xd9w>\xf3\xca\xb2\xbe\xd6?w\xbc\xa4[\xee>\x80\xb2k:\x86\xd7(>\x85\xf2\xe1>x\xe7I>(}\x98;\xed\xaa2>\xcaV\xa1>\xbb}\xdb\xbe\x9bkP\xbe1\xbdE<\xa6\xb1\x0f?\xdc\xb4\xb6<\x08\xab\x9f=\xd0\x15\x05?\xeeS\xd5=\x08\x1c\x1a?\xe4U\x9a\xbe\xe0\x06\'\xbd\xd8O\x14\xbf\xea\xd4\xcc>\x1c\xa9Q<\x0f\xc7z\xbe]\t\x05\xbf\x9c\x1b\n\xbfwb\xc0>p\xc1\xa8<\xd1u\xef\xbd\x0e\xfd\xd1\xbe\x00<\xac\xbd\x17\xe1\xcb>\xc6\xd6\x84\xbe+\x8c\xcf=\x909\t\xbf\xe2\xc92\xbe\xe2\x9aH\xbf\n`\xda\xbeV\x84 <vtC\xbe\xf1s\x97\xbeO8\xd2>Df\xd7>\x8f\xa6A>\xbev)>t\xc0p>\xa9D@\xbeA\x1e\x14\xbc\x96\x85\xcb>M\\\x8f\xbe\x8a\x8cV>hIS>\xa0R\xa4>\xf4\xf5\x05\xbf\x14\x83-?=2t>\xf2!\x0e\xbe\'\x08b>\xbe\xcd\xaa\xbeT\x0f$>\xcaa\xb5>\xd4,~\xbc\xfd\xd1,>7\x1f\xa7>tC|>z(\t=\x9e\xdc\xce=\xba\xb1\x04?\x04s\x18>\xc1`7>\x1cj.?\xd9\x91\xbf\xbeh\xb1\xaa:\n\x07 =\x06\xc7\x16>\xd5R\xe5\xbcg\x84\xd8\xbcX\xd2\xcb>JB%> a\x85>A\xba(<\x0c\xfaU=\x00P\xf6\xbe`>\xc9>\xf44]=\x8a.&>\xf63@?\xcc\x9f\xbe<\x0e\xf0\xe4\xbd\xf0\x0b\xb3\xbd6\xb8\xbf\xbdz\x8e\xb1>\xbe\xf4D\xbeB\xee\xd3\xbbl0\x96\xbb\xd6\xed(>\x80\xaa\x96=\xcb\x9f\xa2=\xc1Xc=\xfc\xfc\xf3<<\xfb.=o\xdb7>.\x1e\x85<\x9e\x97W<\xba\xb6\xc9=\x90\xcds>\xfe[y\xbex5\xf6>\xf8|\xaf\xbd\xb4\xea\xca\xbe\xb64\xb1>E\x9b\xa7\xbd\xf1\x16\xc2>\xd4\xf4\xc5>\xd8\xb5w\xbe\n\xb8i\xbd\x0e\x0c\xda\xbc"\x00|\xbeP\xc0\xa1>\xfc\xd3\xe3>\xe6\x1a*=x\x05\x08?\x9e\xa8\xcb\xbdp\x87\xc7=\x87"\x0f>\x8c\x00\xb8\xbe\xeds\xc5>\xf1\x14\x91\xbe\x14\xf8\xc4\xbe\xba]\x81\xbe\xa8*"\xbe\x8a\xffd\xbe\xc4\x1a\r\xbf\x92\x15\xec>Z\x81\x07\xbe\xa0\x1c\xdf\xbd\x0cB(<A\x9b\x9b\xbe\xd3\xa0m<\xa0\xd3A?\x8c\x01m=\x04"\x12;\xc1\xa7\xee\xbe\xe04\xdb\xbe\xa9vQ\xbeU\xd3\x18>w\xe7\xdb>Z\xda\xa5=Lnd\xbe4\xb8\x14\xbe\xa0!\x8f>r\x07,\xbdpM\x85>\x88\xcfC=ji\xde>\x92\xeb\x9b\xbe\xad\x8cX>\xf5l\xfb\xbb\xad\x03\x8a>d\xf3\xa0>\xd7\x10\xd3>\xddA\x04?\xee\xe1\x8b>Q1\x1d>{\xdf\x8e=(\x90R>'
-p1364
-tp1365
-bsV582834514164056064
-p1366
-g2
-(g3
-(I0
-tp1367
-g5
-tp1368
-Rp1369
-(I1
-(I200
-tp1370
-g12
-I00
-S'\x8c\xf3\x1f>\x15\x13j\xbc\xdf\xd4.\xbeJ\xda\xf8<;]\xea=\xb5>a\xbbt)`\xbd\'\x10\xe9\xbd\xb5*\xc5\xbc\xcc\xd9\xe6=\x06\xe0\xb1<=#P\xbd\x17z\x86=K\xd1\x19=f|)\xbd\x8c\x063>\\\x11\xf4\xbc\x9b\xfct\xbd\x1aO\x85\xbd\\,\xc7\xbc\x9c\xcc\xe4\xbd\xb7\xcb\x05\xbcM\xeb\x88=\xde[\x88\xbd\x9d@\x05\xbd0U?\xbd\xff\xac\x9b=V\x91\xb0\xbd\xd7l\x14\xbe\x0c\x8d\x95<\xfb\xee\x93\xbdY\x86\x88\xbd\x91C\x84=\xa2\xb2\x17\xbeQ\x8f\xd6<z\x9f5>\x89\xbb]=i\xdbX=\xf9\x98\x16>\x86\xe2\x94=]\xa1\x15\xbdb\xc9\xa9\xbcS\x8e\xb5=>>\xe3\xbd#A\xa3\xbdc,d\xbc\x81\xecK>~\xd3C=a\xe2\xf9<z^T>3\xa4\'\xba\xf7\nD>\xd4V\x9a\xbd\xb2s\x88\xbc\x10\xbfk\xbe\xda:\xbb=Z&\x8c\xbc#\x846\xbdn\xaf\x81\xbe\x0e\x11P\xbe\xe1&\xce=\x05\xc9\xb3=\x81\x92\xad<\x91+\x10\xbe\x11H\x0c\xbd`\x1d\xd5=\x9e\xc8\xdc\xbd\xf2\x94\xb8=\xfb\xad\xbd\xbd\xf6;\xba\xbdC\xc6\x80\xbeR\xa5$\xbe\x1eX\xe5\xbc\x17\xa3\x82\xbdwP\xa0\xbd\x15\xb0\xc7=@\x8c\xcd=\x11\xbb\xa5=\xb57\xad=\xc9\xb0\xbf=-\x9f\x06\xbd\xa7S\x91<4\xc0:>,\x08\xf6\xbd6_\xb3=\xfd\x9b{=z\x13\xda=\x0cG/\xbe\xca"{>f%\x19=,f\xa0\xbd\xae;\x94=J+\xc3\xbde%\xfe;\n\x89\x0f>R]\x98\xbc%\x8f\xe3=a\xa4\xfd=\xe7\x06\xbf=\x13\xee\xe1\xbc\xfc4*<\xb0\x9c\x0c>\xb2\x1e\x8a=\x16F\xa1=\xf45\x87>y\x08\x08\xbeX}\x08\xbb\x17\x0bQ=\xa2\xfbx=\x18\x84\x07\xbc`\xc2\xa7\xbd\r\xff\xf2=`u\x9b=F9\xbd=\xa5\x10\xb0<\xb5n\x1c=\x902&\xbeTg\x05>|M\xc6<R.\x0c=\xec\x1a~>\xf1*Z=\x94i\x0b\xbc\xc5"3\xbd\x01*{\xbd\x16\xe0\xdf=\x13!\x7f\xbd\x90K7\xbb\xefA\xe2<\x0bU\xb3=o\xe3J\xbb\x0f\n8=\x97+\x10=b\x1b\xa7;7\xf6\x1a\xbc\x9cs8=V\xc8\xeb\xbc~\xe1/\xbc\xack\x92\xbc\'\xa7_=t\xdd\xd1\xbd\xe7\x0c\x1f>U\x17\x85<\x1c}\x14\xbe\xed\x1d\x19>B\xde\x93:\xcd.\xb9=w>D>\x9b*\xa3\xbdR\x10\x11<\x04\xba\xd8\xbca\x19\xbc\xbdO\xdc\x12>:t\x11>\xd3>V\xbc\xfcR">\x8ci\x82\xbd\x85\xbck=a\xce\x13=2u\x1b\xbe\xda!\x1e=\x8a\xaf\xfd\xbd\xf6\xd7P\xbe\x8e\xf4\xce\xbd\x82\x0e\xda\xbc\xbe\x00\x18\xbds:B\xbe\xbd\x8b#>wp\r\xbda\x1d|\xbd-\x13\xab\xbc\xad6\x10\xbe\xe4\xf0\x13\xbd\x8f\xd8s>\xf7co<2\xa6z<\xe0\x87F\xbeE\x99:\xbe>P\t\xbc\xa1f\x82=R\xe4+>MH\xff<q\xa3\xcd\xbd]\x9bW\xbd\\\xc31>\x00\xff%<\xc6U\x96=a\xe5\xd3<\xb1w\x1c>\xd2\xf9\xe5\xbd3\xbc\xd3=\\\x04\x1b\xbc\xfd\xe8\x94=s\x93\xdf=\x97\xedR>\x95;<>\xa1\x99\x89=\xdc\xaaD=;\xc5\x8a=\xfb\xde ='
-p1371
-tp1372
-bsV590878096452104192
-p1373
-g2
-(g3
-(I0
-tp1374
-g5
-tp1375
-Rp1376
-(I1
-(I200
-tp1377
-g12
-I00
-S'\x1c\xa0\x86=\xaaq\x8e\xbd\xfb\xd8\xd5\xbe\xc3y\xb2>(h\xdb=,\xfc\t>7D\xc2\xbe\xc7J\x10\xbe\xd7v,\xbd\xb6 \xa7>\x85\xb0\x8b=Sb\x01\xbf}GF>\x82\x8e\x05>C\n8\xbd\x9e\xf4\xa2>\x17\xcd\xa2\xbdh<\xa7\xbe\xf9\xcf\xbc=\x0b\xb3#>}\x81\x10\xbfg\xe4\xa9\xbd\xf5\x17\x00>8")\xbe\xad\x07\x19\xbe\'\xf1\xcc\xbc\xe8\x95W=[\x16\x08\xbe\xf1\xda\x02\xbf\xb17\xc2\xbdI\x1a\xab\xbe\xe8\xfdR\xbe\x1d\xa3\xab>$1\xbf\xbeoL\x7f=\xd193?\x0e\xbf\x9a\xbe\x853\xb0=.-\x81>\xa9\n\xfd>5c\xfa=\xfb\xd5\xd1>/Wl>T\x80\x00\xbf@\xe7s\xbe\xf5+\xb09\xb1\x16\xd1>o\x0e\x86>\x93\x7f\xeb=\x04\x1c\xe1>\x97\xa0g\xbdm}\n?k\xb8\x91\xbe\x9c\xb7U\xbe\xe1\x1c \xbf\x10\xd7\xc8>@+T\xbeT\xc7M\xbe\x87U\x00\xbfUS\xe5\xbe\x8d\xe7\xcb>s\xf12\xbd\x05\xf7 \xbeQ\x93\'\xbf\xa3?\x97\xbe\xcf\x01\xdd>\x90\xf6\xc2\xbe\x90\x8c\xd5\xbd\x0c\x13\xd4\xbe1\x9f\xc8\xbe5R\x1d\xbf\x7f\xf3\x0c\xbfxc\xd6\xbd\x81\x1fn\xbe\xdb\xfa\xbe\xbeOT\x01?\x8d\xc0\xec>ka3>Me\xab>\'\x89\xf5=_\x0b/\xbe\xd5\x80\x11\xbbWh!?\xdci\xb0\xbe3^\x0c>\x1d\x00\x9b>\xed\xaa`=\x94V\x17\xbf\xe4\x06\x10?\xd2\x85\x91>\x97\xa1\x08\xbd4#s;\x07H\xe4=A\x17\xb0=\x96\xda\x01>\xc8\x06c\xbe&\xc6\x1e>/\xf5\xe2=\xf1\xa9\xaa> \x122>\xdc\x1d>\xbc\xe3\xce\xcc>\xed\x9fZ>Y_a>\xb0=\x8f?\x9f\xbf\xb5\xbe\xa1W7\xbe\r\x12(\xbc\xb8K\xf4>\xb0D\xf9\xbd\x9d\xf6`=U\xeb\x0b?l\xaa8>$e\xc5>\xfd\x93\x8c=(b<>\xb8\x83\xe1\xbez\xbb\x9b>\x8b\x1f\x92=\xaf\x1f\x1d>\xa5\xe5??A\x8eC\xbe@h\xeb\xbd\x97\xee\xae\xbe\xb4\xc2\xf2\xbe\x08B\x8d>>\xd9\'\xbd\xcd\xde\x0f\xbe\x89c\xea=A\xaa\xe2>\xcfk2\xbe7F\x1d\xbe\xc3K\xac\xbd5K\xf9=p\xfd\xd3\xbe\xc2B\x10>\xd8!\xf3<\xecp\xee\xbdC\xc7\xc5=(\xa8\x05?\xcf\x93\xe3\xbe\xedl\x07?_\xf3\xfd\xbd\x84\xfe\x87\xbe$y\xec>2-\xaa=\xfff\xff>\xc5Q\xfd>\xab\x92H\xbe\xc1.9\xbex\xed~\xbe\x18|\xb3\xbeEC\x18?kJD?=\xcd\x07\xbe\r\x1a\xc6>\x0c\xc64\xbe+\xf1\x1b=\x91D\xb7=U\xa2*\xbf\xbcF\x05?\x13-\x9d\xbe#\x02\r\xbf\\\xe3\xaa\xbe\xdcKd\xbeer\xa8\xbe1\xba\xd6\xbev\x0b\x15?e\xde\x85\xbe-\xc5\xc3\xbeo\xc5}\xbe6?\x1f\xbf+\xfe2\xbe\xdd6%?\xa2\xb4\x05\xbe,q\xb3<a\xb5M\xbfU\x80\xed\xbe\x99C+\xbf\xea\x12\x94=\xc9\xb1\xfb>5\x00\x13>\\H\xad\xbe\x91R\xa5\xbe\x01\xa6\t?}\xaf\r>N\x1a\x00\xbd\xcf\x0f\xde\xbb(\x1e0?\xc78\x17\xbf\xa5r\x19>\x87\x8e\xd1\xbe\x99\xfc\xbc>\xc9m\xd2>5\xb3\xff>\xfd\xbc1?$\xf96?\xa3W@>\xcf\xaf\xc0>\xeb\x81&\xbb'
-p1378
-tp1379
-bsV580369454506381313
-p1380
-g2
-(g3
-(I0
-tp1381
-g5
-tp1382
-Rp1383
-(I1
-(I200
-tp1384
-g12
-I00
-S'\xec\x17\x10=\xd1\xf6\xac\xbdz\x15\xcb\xbe\x9c \xaf>\xb0,\xc2=Q\xf1\xe2=k\xfe\xb8\xbe\x99\xa8\x00\xbe\x82\xd1\xf3\xbc\xd6\x11\x9b>\x10F[=\x94\xe6\xf8\xbeg~0>\x11!\xdc=\x1ei\x0b\xbd|8\x94>\x90N\x84\xbdf \x9c\xbe\xc9\x00\xe6=\x9d\xd9\'>\x03\\\x0e\xbf\xe7c\x9d\xbd\xef[\xc6=>\x022\xbe\'\xb9\r\xbe\xa5\x89\xb7\xbc\xd9\xa6~=\xeb3\xf9\xbd\rb\xfa\xbe\xed\x19\xc9\xbd\x90z\xa1\xbe}\xe4E\xbe\x9bO\x9c>O\xc7\xb9\xbek\xdd\x1f=!\xe1,?\x81\x1a\x9f\xbe}\x03\x9e=\xa6\xdes><\x9a\xf0>\x99\xaa\xd3=`\xa6\xd3>\x04\xa2b>Od\xf0\xbe\xb4\xa0~\xbez\xbb\xd6\xbb\xa4\x87\xb7>\xe2\x8b\x84>\x87:\x02>\x8d\x96\xcb>\xcd\x86B\xbdf)\x03?\x14\x1b\x97\xbe{8Y\xbej\x81\x13\xbfJa\xc4>\xdf2N\xbe\x94\x93Z\xbe\x7fO\xe5\xbe\xeb>\xd3\xbe, \xc6>\x9eXN\xbd2P\x1d\xbe~\xe8!\xbf5*\x8d\xbe\xeb\xf1\xd6>J\xe9\xb2\xbe\xa6\x03\xfa\xbd\x1f\xe7\xd2\xbe\x81\xef\xc0\xbe\xfa\xc7\x11\xbf\x0bo\x07\xbfZ\xff\xc9\xbd\xa2!i\xber\xfd\xba\xbe\x101\xfa>\x92\xed\xed>\x8aF\x1d>\x11\x94\xa7>P\xcd\xf7=\xaf\x93*\xbe\xd0\xfb\xb5:?\x8c\x13?o\x81\xa0\xbe2p\xc9=\xd6\xb1\x8e>M\x02\xcc<\xe5\xc6\x0f\xbf\x93$\n?\xff\x92\x8e>~\xa0F\xbc\xb0G\x8e;\x1f+\t>\x98\xd2\x85=ju\xcd=\xd7\x10^\xbe \x04\x0f>{\x1a\xab=\xee{\xa8>\x9aG8>A\x93v\xbcI\x92\xc3>\xa1\x95N>\xebO\\>\x83*\x89?\xec\x1e\xb6\xbe\x8c\xc9?\xbe\xef%_\xbc"\x1b\xef>\xb0\xa3\xf1\xbdMx\x8b=\x1a\xfd\x03?%\xe7!>-m\xc1>\r>\x96=;`B>\x12s\xdb\xbe\xe3\x7f\x8f>\xea\x8b\x87=\x8c\xfb\x0b>\xe4\xde7?\xc2MM\xbe<\x9a\xef\xbd4\x83\xa9\xbe\xfd\xd6\xe8\xbe\xbf\x13\x86>\xa73&\xbd\xc1p\x0e\xbe\xfaE\xe1=\xfaW\xe1>\xd2\x10/\xbe\xb6 )\xbe\xbdu\x95\xbd\x13z\xf1=\xf0@\xd1\xbe+\x85\x10>\x0c`\x13=\xa1/\xdd\xbd\xf3\x8e\xd6=\x1b[\x02?[g\xdd\xbe\xcb>\x05?\x9cT\xfe\xbdf\xbb}\xbeq\xfb\xde>\xb1\x01\x94=\t\xfb\xfa>l\x92\xef>mW:\xbe"\x9f7\xbe\x93\xf6x\xbeQ\x9f\xac\xbe\xef\xc7\x10?O @?i\xf7\x01\xbe\x9fZ\xc1>\x99%6\xbe@y/=\xa7{\xba={\xb5"\xbf}\xb1\x04?\x84\x0e\x91\xbe\x1b\x07\x07\xbf}\x9f\xa9\xbemye\xbec\x97\xa4\xbe#\xeb\xd1\xbeC\x97\x0b?\xce\x0e\x82\xbe\xfc.\xb6\xbe3\xf1k\xbe`P\x1d\xbf=~1\xbe`\xeb\x1a?\xd7{\x02\xbe\x04w\xf7<\x85\xac@\xbf\xaf\xfb\xdb\xbeS0)\xbf\x84\xcb_=\xdeC\xe1>9~\x16>\x02\xf9\xa9\xbe\x13s\x9c\xbe\xbce\x02?[Z\x00>\x7f\x13\x05\xbd\x9e\xd6$\xbb\t\x8d)?\xfc\x13\x11\xbf\xad\xeb\x03>q\xac\xcd\xbeM\x08\xb6>p\x15\xbe>+1\xe5>\'\x90&?\x9d\x954?\xa7d->\xb7I\xb5>\xdcJ\xe1\xbc'
-p1385
-tp1386
-bsV582880721200656384
-p1387
-g2
-(g3
-(I0
-tp1388
-g5
-tp1389
-Rp1390
-(I1
-(I200
-tp1391
-g12
-I00
-S'\r8g>;a\xae<\xa9\x82f\xber3\xb0<\xec\xfe\x01>\xe8x\xf0<\xa2F\xc7\xbd\xb8\xa0\x07\xbe\xdc9\x96\xbc\x8b\xa4A>z\xe6u<"\xb1\xed\xbd\xa4\x9a\xc3=G(+=\x10\xe1d\xbd8\xff`>\xb0Ff\xbd\x81\xc7\xca\xbd\xc8\\\xb9\xbd\x84@\x8c\xbcC\xc8(\xbeq\xf9\xee:\xef\x1c\xa6=\x9f\xfdE\xbd,S\xee\xbc\xc0\xae\x81\xbd`\xba\xa1=\x84-\xe0\xbd\xa1\'W\xbe\xd7\x8a\xcb\xbb\x12\xcb\xa4\xbd\x85\x02\xa6\xbd\x13\x9e\xad=\x8e!O\xbe\xc0qN=\xd0\xc3q>x\xda{=\x94\xf9\x92=\xc3\x834>\xc3\x0f\xee=\xd9G\xd7\xbcf\x87\x19;\xd0\xe6\xe0=\x1b;3\xbe\xa0W\xb7\xbd\xb2~\x81;!D\x8b>b]k=\x9a\xb7\xa2<qX\x9c>\xd6 ,\xbd3\xc2\x83>\xb5\xf8\xed\xbd\xc6\xdc\xbb\xbcy\xe7\xa4\xbe\xd5\xfe\xf8=\xda(\xd9\xbb\xf93\x8b\xbc\x84\xc1\xc1\xbeV^\x8c\xbenR(>3\xd9\x06>\x1d\x01\x05=M\x9f9\xbeA\x86\x8a\xbd\xf0f\x0b>";#\xbe\x9dQ\x19>S\xeb\xe4\xbd\xbdI\x03\xbe\xf8\xd4\xa5\xbeW\x11V\xbeR\x15M\xbdvL\xbb\xbdpm\x05\xbe\x12\'\xd0=\x13F\xc1=\x95+\xfa=\x0f\x7f\xed="X\xc8=z\rX\xbd\x95\xa7\xa9\xbc\xc4:\x87>\x14<0\xbe\xeeX\xff=#\x97\xc3=\t\xf7\x07>\xd6uM\xbeBS\x96>(\xdaU=B\x05\xce\xbd\xf5\xdc\x99=\xf5\xa3\x02\xbe\xf3H{<\x8f\x04,>-R\x99\xbc\x08n\x18>\xc9\x82%>\x9a\xd5\xd6=\xf9\x07\x0e\xbd\xd3\xa6E\xbb6SA>\x01\xee\xce=\xba\x83\xb5=\xd7@\xba>\xa3\xca$\xbe=\x07O<\x03\x82\xba=\xd1\x87\xb2={\xcb\x06\xbd\x10\xaf\n\xbe\x10\xbd&>&\x94\xd8=\x9f\n\x14>L\x9bG="\xfd\x07=~ZW\xbe\xe9b>>\xe1o+=\xea,n=\xf5k\x9f>|\x17\x8e=\x8b\x10\xbf\xbck7l\xbd\x04\xae\xca\xbd\xc5\xde\x1b>$%\x8c\xbdiK\xcd;\xe1\xf6\x12=\x85\xb0\xd2=\x82\xa7\x9c\xbc\x13\x99\x11=.\xbb\x85<\x9f\x05Z<\xb2^3\xbd\x97\r!=,\xd3%\xbd>\xd8)\xbd\x86\x82V\xbd\xbeR\xc6=\x05,\x1f\xbe#\xc3+>kn\x1b=0+A\xbe%\xdcq>\xc8wj=\xcb~\x0c>\x19\x81\x82>;\x84\xe8\xbd\x16\xa4\xed\xbc\x8eJ{\xbd\xfd\x9b\x02\xbe#2^>h\x0fE>\x99\x91\x1d\xbd\xfd;?>Ln\xb3\xbd\xc1\x80\x8b=\xf7$\xd0<z\xbao\xbe\xe0@\x1f=\xd9..\xbe/\x82\x8a\xbet\xeb\x15\xbe\x9fK\xa9\xbc]D\x9e\xbd!]|\xbe\x11Ph>\xb5D\xae\xbc3\xb7\xc5\xbd\xdc\x1f^\xbd\xdb\x0bF\xbe\x19\xec\x9e\xbdB\xc0\xaa>\x06i2<\xaf\xe5\xbc<\x80\xd3\x9d\xbe\xc7\x9c\x91\xbe\xa6\x99\x82\xbd\t\xbd\xb5=<\xd8e>\xc0P\xf1<Ti&\xbe\xa3I\xf6\xbdzJd>\x07\x14&<E\xf3\x8f=\x8e*\xbf<\x12?b>\xf0H+\xbe\x01\xd3\xfc=\xf7\x9fH\xbdj\xa1\xee=Q\x03!>nv\x97>M%\x95>\xe4\xe5\xbf=\x88?\x80=\x06\x03\xd6=\xc2d\xaa='
-p1392
-tp1393
-bsV590429678764077056
-p1394
-g2
-(g3
-(I0
-tp1395
-g5
-tp1396
-Rp1397
-(I1
-(I200
-tp1398
-g12
-I00
-S'\xd8\x9d\x8b>\xf6X\x98\xba3m\xc2\xbe\xe5\xeb\x17>\xbb<9>\xb5\xb3\xc6=7\xbcn\xbe\x0bs<\xbe\x91\x91:\xbd\xd3\x8c\x9e>|\xfai=\xb6\x00\x91\xbet\xfe?>o\xd8\xf8=\x08\x94\xb5\xbd\xc9M\xaf>\xe1\n\xb3\xbd\xd3\xb4U\xbe\x89"\x90\xbds\xe2\x06=\x15\x9d\xb7\xbe\x1b\x86\xe7\xbc>\xae\x16>\xd7$\xe4\xbdC\xe4\xac\xbdHt\xad\xbd\xddp\xb7=\x04M2\xbe\xf0\xfb\xc6\xbe\xa0@M\xbcY\xd1K\xbe\xb9\x94 \xbe\xd1\xb3q>\xfa\xdd\xa5\xbeU\xf9\xaa={\x0c\xf3>\x98\x8bS\xbdyN\xf3=\xd4\xfd\x90>&\x8f\x90>4\xe99=\xcbo\x18>1\x13b>\xed\x1c\xc5\xbe\xf7\xb6\x12\xbeF#\x8b:\x882\xe9>\xe2\xf8\x16>\xdc@\\=\x91:\xf6>\xef\xe9[\xbd+\x99\xf7>\xe7~U\xbe\xb4m\x98\xbd\t\xac\x13\xbf\x03[\x8c>\xcd\xd3\xc0\xbdD\xa3\xcd\xbd\xef\xd9\x15\xbfim\xe4\xbe\x19\x85\x9b>-?\xbf=\xafd\xde\xbc\xd0\xe9\xd9\xbe\x0537\xbe\x14\xaf\x92>\xad}\xa3\xbeY\xbc\xea=\x7fm\x84\xbe\xc0\xbe\x84\xbe\x16\xba\x12\xbfM:\xcc\xbee{y\xbd\xa5\xf42\xbe\xf2w\x81\xbe\x17\xcf\x9c>\xb0\x92}>\xe0\x8dE>@\xa5h>.D\x0b>!\x8c\x00\xbeI\xde\xd5\xbc\xa7J\x05?=\x00\x9c\xbe\xfd\xc5M>I\xcfk>\xdb\xc7U>\xc03\xe1\xbe\xf3\xab\x00?K;$>g\x1a\x08\xbex\xc3\x7f=\xd3\xba\x01\xbek\xf6\x90=\x8d\x9ay>(\xe5\xaf\xbd\x05\xe2<>x*b>8\x86^>\x9fd\x14<\xcck\xa4<\x90c\xae>\xa7\x9d>>\xf7\xd8 >\xdf[D?F1\x82\xbe\xfb\x11%\xbd\xff\xcb\x8b=\xe09y>\xb1\'\x8b\xbdM\xec\xc3\xbd\xdf\x9d\xc6>U\xa4=>"\xc3\x88>\\\xcb2=\x1b\xd1\xa1=\x7f\xec\xb6\xbeA\x96\xa0>T:\xbf=\xf7\x17\xf5=\x9e\xc2\x18?!\xa8\x0c\xbc\xc5\xc2v\xbdMd+\xbeg\xb2\x84\xbe\xb7\xb6t>\xf9\xff\xb0\xbd\x8fd9\xbd9R\xaf=Ik~>\xa3m\x8b\xbd\xf8\x81\xb2\xbc\xa70\xc7\xbc\x93\xf5\x8c=\x99p\x1a\xbe\xc0\x08\xab=\xe9\xd5\x86\xbc\x9d\xe9\xae\xbd\xdf\x1e0<\x91W\x91>\xb3v\xa0\xbe\xfc;\xbb>\xf4\xa0\xad\xbc\xabd\x8e\xbe\xe7\x99\xc3>\x11^\x90=m`\x9b>\xb9 \xce>]{A\xbe\xc8\x1c\xc4\xbdU\x00\x1a\xbe!\x14\x86\xbe\xe3\x1c\xda>x\x9e\xe8>W\xe9\x92\xbd\xa3d\xaa>\x934\x10\xbeu\xbd\x8e=t\xfeK=\x93\\\xf6\xbeo\x17u>8\x8c\x94\xbe-\xad\xec\xbe\x15\xc6r\xbeW\xd8\xb5\xbd\xb1ZT\xbe\x88\xda\xc4\xbe\xd1+\xe7>\x83\x88\x01\xbe\xbb\xc4\x80\xbe\x9d\xe8\x0c\xbe\xe3\xe8\xc7\xbe\xeb\n\xeb\xbd\xb7\x85\x19?\xe9\xa3\n\xbdO;\xe8;\'\xab\x1b\xbf\x10e\xe9\xbeA\xac\x96\xbe\xc9\xde\xe5=i\xce\xdd>#k\xaa=\x8d\xed\x88\xbe\xcf\x04e\xbe\x83\x9f\xc8>\x99\t\x93=\xe1h==\xd2}\x14<\xdcm\xeb>\x94\xc1\xc0\xbeWCJ>\xd3\xa7D\xbe7\x19\x82>\xc3\xe1\xa2>\x01O\x00?\x80\xf8\x08?\xeft\xb0>\xed\xed\x16>\x0f\xa7v>]<\x06>'
-p1399
-tp1400
-bsV580285139290324992
-p1401
-g2
-(g3
-(I0
-tp1402
-g5
-tp1403
-Rp1404
-(I1
-(I200
-tp1405
-g12
-I00
-S'\x8cZ\xd8=\xfb\x0fp\xbd\xc5\n\xc4\xbe\xf0ic>\xf8\xe6\x16>^t&=ut\x81\xbe\xd0\x8b\xf7\xbdfA\x10\xbdn\xb6p>\x18w\x8b=T\xbf\x9b\xbe\xb7M\x1b>Ti\xa8=l\x07\x89\xbd7\xb6\x86>\x94\xa6\x1c\xbd7Rj\xbef\x9a\xde<\x99\x87\xf3=\xb6\xec\xd9\xbel\xb7H\xbd\x12\xdf\xcc=r.B\xbeU\xcd\xe8\xbd\x96\x82E\xbd\xa4/\xae=\xda\x02\x1c\xbe\x9a\xc4\xbf\xbe\x0c\xfd\x13\xbd\x97\xbbK\xbe\xb4\xb5\x1c\xbeT\xc9z>\xf6G\x9d\xbec\xa5\xce<ih\x02?|.;\xbe\x9b\xcb\xb7=\x05dj>\xfe\n\xac>y,\x8c=\xbb2\x97>j\xdaK>$\xa7\xc2\xbe\x8c2?\xbe\x8b\xec\xef;\x9dM\xb2>\x19C\x1b>\xfc\xc6\x9f=P\xc5\xb8>\x1c w\xbc\xdc;\xe8>g\x80|\xbe\xf2\x04\x01\xbeBd\xf8\xbe$Y\x9f>w\x12\xf1\xbd\xb1"2\xbeV\xe3\xca\xbe\xb1\x8d\xc0\xbeD\xef\xa7>\xb7\x92\xd3\xbc\x00N\xf7\xbd\x12o\xed\xbe\xdf`6\xbe\xd0\xe4\xad>;7\x8f\xbe\xf4\xe1\x19\xbd\xfb\x05\xba\xbe$\xb5\x89\xbe\xad\x98\x01\xbf)0\xcf\xbe"Yz\xbd\xf8\x964\xbe\xefR\x9a\xbe\xff\xe7\xbd><g\xbb>9]\x14>\\Wi>\xd7\xd6\xe5=\x1c~\x12\xbeX\x90\x0f\xbc <\xe3>\xdar\x84\xbe\x9e\xc9\xea=\xc01`>\xc0\x00\xb9=US\xe5\xbe\xbc\x97\xf2>5\xb4c>\x8aJF\xbd?`2=,pw\xbb\x11d\xa1=H\x94\x15>\xeb\xc3\x06\xbe\xa0Y\xe1=\x80x\x00>\xbe\x9bz><\xbb\xd8=\x8co?;Cb\xae>\x10\xa0\x1a>,N*>\x9f\x98J?\xe7R\x97\xbe\xb4<\xcd\xbdh\xe4\xba;\xc6\xbc\x9d>\x10f\xa8\xbdW\x95p<mV\xc8>\x83\xa3\x01>,\xfa\x90>\xfdAO=\xee\xb5\xef=1\xd8\xba\xbe,\xa3\x83>!\x042=@Y\xee=.\xc1\x16?9m\xf4\xbd\xcdf\xc8\xbd\xc4\x9fU\xbe\xfc\xb4\x98\xbe\xa4\x85s>+\x88\x88\xbd\xf4\xb3\x9f\xbdK\x0cr==-\x91>/\x8d\xb2\xbd\xff\xd4\xa4\xbd\xf7{$\xbd4\x9e\x93=\xd5\x17|\xbe\xa5\x8f\xf7=\xb9\x00v<G\xabn\xbd\xe0Q\x9e=\xc2\xe4\xb3>ZE\x9a\xbe\x81p\xce>\xe8\xbd\xbd\xbd\xbe3j\xbes\x1c\xb5>\xd4~1=8\xea\xbc>V\xdd\xbd>$\xd3*\xbeN\xa4\x05\xbe@l\x1a\xbe9\x9e\x81\xbe\x95\xeb\xcf>\xd5x\t?\xba\xcc\x99\xbd)\x91\xb2>\x1bo\x03\xbexS<=\\k\xb1=\xee?\xf0\xbe\xf7\xbb\xc6>\xa0\\h\xbe\x16\xef\xcb\xbe\xcfO\x8b\xbe\xc7\xe0%\xbeAi\x82\xbe\xf2\xbe\xbe\xbe\x0bP\xdf>T%2\xbe\x07No\xbe\xa4T\x10\xbe\xa1\xe9\xda\xbe\xf5y\xda\xbd\x93\xb8\x0c?\xbbO]\xbd\x841\xbd<\x04\x94\x10\xbf\x15=\xbc\xbe[h\xe3\xbeo\x88\x99=S\xa2\xbf>w$\xd2=\x14\xc6y\xbe\x92>e\xbe;8\xbf>g\xb9p=,\xe6\x00=\xeb\xd0\xe5:\xc2\xcc\xfa>>\xc6\xcc\xbe\xf5\xcc\xfe=kx\x80\xbe\x11`\x91>\xe1\xdd\x9a>\x85\x13\xbf>\x14X\x04?T7\xf0><\x0e\r>pEk>g\xb3.='
-p1406
-tp1407
-bsV578779043534749696
-p1408
-g2
-(g3
-(I0
-tp1409
-g5
-tp1410
-Rp1411
-(I1
-(I200
-tp1412
-g12
-I00
-S'\xa6\x1d[>>\xea)\xbd1l\x84\xbe"\x18\xb5<\xcf\xf5->\xa8u\xf3\xbc"/\x95\xbd\x95\x0b\x19\xbe\xc2F!\xbdZ/\x1f>\x9eX\x17=\xae\x90(\xbd~\x18\xe6=hf\x19=ga\x90\xbdf\xd0s>\xa8\xe5\xf5\xbcZ\xf8\x88\xbd\xb1\xe9\xad\xbd\xdb\xb0\n\xbc\xae\nD\xbe2\x04\x1a\xbc\x94\x1c\xaf=\x045\x1a\xbe\xa0K+\xbd\\\xdd\x9a\xbdZ\xcd\xf6=\xbbz#\xbeU\x90Z\xbe*\xa09=f&`\xbd\xc2m\xaa\xbd~\x0c\xc9=C\xddY\xbe\x82\xdd\x01=\x8eRn>~\xfc\x8a=\xf50\x9a=F\x1cY>\xde\xb2\xc3=%\xce\x1a\xbdj?\x0e<\xbd\xa9\x12>\xb6\xe09\xbeQC\xc2\xbdM\xfb \xbb\xce\xc8\x8f>\x12\x08"=*\x11*=\n\xe8\x92>\x1d\x9a\xec;*h\x93>C\xdf\x08\xbeH\x94\xa0\xbc\xc4D\xa4\xbe\x92I&>\xee\xaa\xb9\xbb\x7f\xea\x9c\xbd<\xe0\xb3\xbe\xf1\xcf\x97\xbe:D1>\xc6\xf3\xc1=\x8a\x06\xb2:\xea\x90M\xbe\xb0\x9eY\xbdIl+>\r\xe3\x16\xbeP+\xff=\x0b#2\xbe\x1e\xcc\xe2\xbd\x16\x0e\xb8\xbe\xc63c\xbe\xa2\xefg\xbc8{\xc4\xbdsD\xf7\xbd\x96\x1d\x19>z\xf3&>\x1b\xd8\xe5=N!\xce=\xe2\xf6\x07>\xd5\xdf\x81\xbd\xd3\xf9\xb7;\xf3\xa4w>\xba\xef(\xbemf\xf7=\xc7\x03\xb1=\xb8%&>\xe2Ws\xbe\x1aD\xb0>\x8b\xc0\x9f=\x8e\xef\xd6\xbd\xe4\xc7\xcb=\xce\x1a\x16\xbe\xd2\x98\xf1<h\xdcW>&\xc8\xac\xbc\xb4:\x08>\xe4?=>\x02\x85\x06>\xfes\xf1\xbcs\xd2\xba<\xfa`Z>]\xc9\xd1={\x0b\xcf=\xa1\xfa\xb9>\xdd\xe1:\xbe\xb3\xa7\xc7;:\xdf`=d\xaa\x8b=\xa0E\xa4\xbc\xb0E\xab\xbd\x0e\xda6>\x06X\xa4=||\x04>r\xb9V<\x94\xd68=\x10\tk\xbe(\xb0E>J\x8c/=+Sn=u#\xba>\x02\xf9e=\xd6\xfbv\xbc\xea\xe9Y\xbd\xf5pw\xbd\xdb\xb95>\xff\xa1\xb0\xbd\xed\x1b];\x11\xb7\x90<5P\xd3=\xaer\xb8;\xdf\xdc\x19=L\xe52=]\xb6@<\xb2\x84X<\xb5\x8a\xa1=*\x14\xc5\xbc\xf24\xb9\xbb\xa4\x98\x88::\x0b\xad=\xa6\x96\x08\xbe\xcayk>~\xcd\x1e<\xc3\x96O\xbe2HY>\x98\xba,\xbb\x84\x00\x1e>Z\x1cw>\xbbd\xfc\xbdS\xa6 \xbc\x83\xa1]\xbd\xdf9\x0f\xbe\x86\x9b?>\xb5\xf5Q>\x86\x96\xdc\xbb\x95\\l>\x8a\xe8\xa8\xbd\x82\xcc\x97=F\xbd"=\x98\xcf]\xbe^Z\xc0=\xb0\xb0&\xbe\x8c2\x88\xbeDi\x10\xbe\x97\xf58\xbd/\x8d\xa0\xbd\x8e\xcd\x92\xbeJwg>E\xaff\xbd\xaaQ\xae\xbd\x12X\x81\xbc7\'9\xbez6%\xbdB\xf6\xbb>J1\xf1<\xdd\xf1\xcd:\xf1a\x89\xbe\xfd\r\x7f\xbe.\xf9\x1f\xbd\xfe\xe1\xb6=\x1dAh>\x01rI=\xeb$\x18\xbe\x94\xab\x9b\xbd\x104U>Uwx\xbb\x08,\xf8=\xc00\x1c=0~^>\x8e.#\xbe\x9b\xd6\x03>\xd8!\xcf\xbb\xb5i\xe2=\xc4\xbb\x15>\xc1\x82\x8c>\xfdN\x88>\xd5Y\xc6=\x1e\x8cX=\xbe\xa8\x8b=\x7f_\xc7='
-p1413
-tp1414
-bsV582870639469543424
-p1415
-g2
-(g3
-(I0
-tp1416
-g5
-tp1417
-Rp1418
-(I1
-(I200
-tp1419
-g12
-I00
-S'\xab\x9f\x1d>~E\x1f;\xe6\x82\xa5\xbe~\x18|>z\xb2\xfd=\xc3;V=\x94\xeb\x80\xbe>u%\xbe\xa6E0\xbdt\xc8J>(,o=t&\x9c\xbe\xabZ\xf4=\xd6+\t>\xb14 \xbd\xbd\'\x92>X\xf9]\xbd\xfb2a\xbe\x96\x91\x18< \'\x89=\x89d\xa8\xbed\xf2\x89\xbd\x8cJ\t>\xeb\xf2\xfa\xbda\x9e\xe8\xbd)j>\xbcy9:=\xb5\x90\xe6\xbd\xb6\xa9\x9f\xbe\xd2\xc5(\xbc\xfe\x1d\x84\xbe\xec\xb5?\xbe$Bi>\xba\x99\x86\xbe\xf3\x99q=\x86Y\xfc>|\x13\xfa\xbd\xde`\xe0="?h>U\xac\xa3>a\x16\t=\xbfy?>u\xe8\'>\xfcL\xa9\xbe\xa2\xc1F\xbe\xb7Y\xa8\xbb\x8b?\xa8>\x8a\xa4D>\xb4H\xa5=(\xa9\xb3>N\xdfL\xbdB!\xbf>H\xcf&\xbe\xd3\x9b\xf3\xbd\x84\xb6\xee\xbe\'zf>: \x02\xbe\x88r\xfa\xbd\xdam\xd3\xbe@J\xae\xbe}\x15X>\xf6$\x9a<\x11\xc3q\xbd\x81\x0c\xdd\xbe\x13k3\xbeUS\x8f>>3m\xbeDL\x89\xbc\x1e\xb5\x82\xbe\xc1\xce\x91\xbe\xcd\x0e\x04\xbf\x93\x1b\xc8\xbe/\xce\xf9\xbd\x8aY\x17\xbe\xf1\xcas\xbe\xf8\x1e\xa9>.\xe1\x88>vJ\x17>;\x14\x87>YE\xd5=k\x8e\xce\xbd\xc1\xcb\xb1<\xa8=\xd0>\xffn\x82\xbe\xc5~\x04>6\xd7V>1\x89\xdd=\x90q\xd6\xbe\xcd\xed\xe9>\xaf\xcd\x05>E\xa3Z\xbd1\xa1\x7f=sD\x8f\xbc\xd9\x1b"=%\x0e\x00>4\xaf\xc5\xbd\x0c/:>\xf3\xf9\xf3=j\x04Y>\xc7\x02S=\xd6\xcdc<\xbd\xac\x98>\xbb\xcd\r>\x90\xea4>\xb5\xe6I?\x93\xcb\x8b\xbe/R\xf6\xbdG\x7f0=C\x0c\x97>\xc8\x9bT\xbd\xbe\x92\x17\xbd\xe2\x8d\xc2>\xd4qM>\x1a\xf0\x8d>\xa8\xab\x80=K0\xcf=\xcc\x1a\xa6\xbe1L}>\x8a\x9ak=\xcda\xde=\xee\x85\t?\x96Ig\xbdj\xce\xa6\xbd\x85[K\xbe\xd8\x91\x9e\xbe0I=>Fw\xa8\xbd?\xd0C\xbdT\xce\xa8=\x0b\x1f\x9d>\xfeG\xbc\xbd6(\x9d\xbc\xda\xc6:\xbc\x85E\x84=;\x80k\xbe\xff\x8d\x8a=>\x1e\x1c\xbc\xa6L\x8e\xbd\xf3\xddB<~\x15\x9b>\xd1\xdf\x9e\xbe\xad\xfb\xbb>l\xd33\xbd\x99\xfdi\xbe\x08\x17\xa9>:@d<\xbc9\x8e>\xad\xa5\xc0>8\xcb\x00\xbe\x18\xaf\x8e\xbd\x01L\x9e\xbdX\xafP\xbeG\xed\xd1>\x1b\xd8\xee>z\xa3e\xbdK\x9b\x94>\x119\xfe\xbdod]=\xdb\xf2\xbb=D\xdb\xd8\xbe\x98\xd6\x8f>\xd9M\x86\xbe\xa1\xd9\xd6\xbe\x94\x96^\xbe\xe0\xfb\xf0\xbd!s1\xbe{)\x8e\xbe\xeaq\xd0>hZ\xe4\xbd\xef\xccs\xbe%Z)\xbe\xd8\x0f\xe2\xbe\xc5\xf5\x08\xbe\xe0\xb1\xdf>9\xf5\xb4\xbd\xee\x89+=!\xee\t\xbf%u\xbc\xbe\x10(\xa3\xbeS#\xaa=\xe8|\xb6>/=t=~\x16\\\xbeH\xf6:\xbek\x84\xcc>Q\xa5\xee=g\xee\x0b=p\xb4\x1f\xbc\x06\x18\xee>\x0fp\xd2\xbeNz+>\x1d\nY\xbe\x14xf>\x93n\xa5>}\xc2\xc7>\x93\x9b\xf1>\x90\xa2\xc8>\x1c\xe5\x17>\xbe\xc9v>\xac\xeag\xbc'
-p1420
-tp1421
-bsV580208215477997568
-p1422
-g2
-(g3
-(I0
-tp1423
-g5
-tp1424
-Rp1425
-(I1
-(I200
-tp1426
-g12
-I00
-S'\xc89e>\xe7S\xd6\xbd}\x16\xd7\xbep\xee\xa7=\xe5\xa2\x8c>\xe1O\x1a\xbe\xaa\xd2\x18\xbe\xd9W#\xbe\xfdo#\xbd\xddw\xd6=\x03\x7f\x04>\xf5\x04\xfd<\x1d2\x1c>l#\x82=-\x10\x0e\xbe\xd0)\x8e>4\xbd\xf9<\xb7{\x81\xbd\x8d\xd6\x9b\xbdK\\\xa6=\x85\xcb\x9b\xbeg7\x1c\xbd\\\x08\xfc=|\x8b\xc9\xbe\xd5\xb8\xfe\xbd\x84\x0f\xcf\xbd\xdf\xd3&>g\xb3\x8e\xbe\xa6?\x83\xbe\xb5\xc9$>\x07e\xec;\x08c\x0b\xbe\xab/8>\'\xafg\xbe\xf5\xeb\xb1\xbb\x8f!\xa1>\xfc4\x8c\xbc@2\xe1=\x0f\x7f\x95>\xec[\x12>gn\xbf<\xefO\x1d>\xb1\xfcp>[\xf1\xa0\xbe\xd2\x1b\x02\xbe\x03.\xe6<T\xe1\xcb>p\xc73\xbbs/P=!\xf8\xad>M\xf9\xb5=tq\xdb>\x0c\x80j\xbe\x18\x89\xe9\xbc\x97\xd5\xd0\xbeM`\x99>\xb4\x89X<yg9\xbe\x85\x8d\xa8\xbe|\x14\xbe\xbeb\x03\x8d>(&\xba\xbc\xa5\x15\xdb\xbd&7\x94\xbe\x05\x1f\x93\xbd\xe7\xa7\x95>\xc5\xb6"\xbe\x15xV=\xd7\t\xd4\xbe}\xa1\xf9\xbdh\xdc\x08\xbf\xb7\xb9\x8e\xbe4\x03\x91<a\x15\x11\xbe@\xe0Y\xbeo;\x9d>\xfa\xb2\x9e>i\xe2\x07>\x1f\x83\xb9=C~\x1d>5\x19\x17\xbe_8\x9c\xbcaZ\x80>\xc4;<\xbe\xe7\xc6\x0e>2\x19\x1b>\xcf\xefg>e[\xb5\xbe\xeb\xe4\xf2>\x85hJ>\x80C\x9d\xbd}\xcd >\x99\xb4m\xbeK\x99\x11>W\xe3}>\xcc\xdc\x91\xbc\xc4\x17\xbf=X=`>E[/>\x10\x182=\xfbY\x89=T\x8e\xb6>1F\xcb=\x81\x08\xf3=\x1c\xe5\xef>\xad~}\xbe\xcfi8<\x80\xf3\xe0\xba\xe1\xfc\xc9=!\x82\xdd\xbc\xb9`\x86<7i\x96>C\xf5\xa6=\xdfR->K\x9fX\xbc\xcb\xf5L=\x8f\xc9\xa6\xbeI]\x8c>\xa3se=\xef\xbc\xf1=9w\x04?\xa0\x9f\xfa9\xedt\xa0\xbd\x08*i\xbdm\xfe^\xbd\xfby~>E.\r\xbe\xbcS[\xbb\xc1\xb6\xbc\xbc#Q\xd5=\xd9\xd8V=g\xb7$=\xf8\xb02=0\xf4r<\xe4\xdf\x12=6!\x07>\xf3\xf6\x08=\xd4]\x9d<\x13\x98\xca=\xebD\'>E7\x1e\xbe8\xd2\xab>/\x0e\x96\xbdd1\x82\xbe\xf7\xaah>\xdd\xb0\xa3\xbd\xbb\x97\x8b>\x87\xa7j>\xa0E5\xbe\x955M\xbd\xd5\x96\x9c\xbc\xf4V1\xbey\x0fD>\x899\x98>u\xe0>=0D\xb5>\'\xff^\xbd\x183\x86=S\xdb\xbc=\x87\xd8s\xbe\xe4\x1c\xa1>\x90\xae-\xbeXeu\xbe\x82\x90\x1e\xbe\xdd\xc1\xf1\xbd#Y.\xbe\xeda\xc1\xbe\x89:\xa8>\xe5L\xef\xbd\r\x91\xab\xbd\x99Z\x80<\x14LE\xbe\x85\xc2\xcd<\xbfT\x0b?\xf9\x16[=\\\xf1^\xbcx\x1a\x9b\xbe\x1cD\x8d\xbe<\xe90\xbe\xf0I\xf3=\x8e\xbb\x93>\xa5\x9fk=\x01!\x12\xbeq\x9c\xbf\xbdy\xa3/>+\xa57\xbd[\x1bD>\x85\x1b\x02=P\xec\x92>\xef\x8fU\xbe\xe0\x06\n>=\t\\\xbc\xfd\xae>>\x9c\x05Q>\xfa\x7f\x82>i\xd4\xb0>IdP>\x7f\xb1\xd1=\xb9<\x17=\x03\xc80>'
-p1427
-tp1428
-bsV580975732274401280
-p1429
-g2
-(g3
-(I0
-tp1430
-g5
-tp1431
-Rp1432
-(I1
-(I200
-tp1433
-g12
-I00
-S'\xc8;4>\x8fIG\xbc}\x9b\x9a\xbe\x8f\xaf1>IH\x11>\x8f\xea\'=\x18|E\xbe\x16\x9c*\xbe\xd1\xdc-\xbd\x83[W>\xa1F7=\x92;t\xbe\x19\xd8\xe0=*/\xbf=}\x86;\xbd\xf8\xc5\x90>\xcd\xf1j\xbd\xf9\xb18\xbe\xb2{\xed\xbcJ\xb6\x05=K \x94\xbe\x18%\x17\xbd\xd9G\xe9=\xce\xc6\xe0\xbd\xbd~\x9a\xbd\xca\xd8\x1e\xbd\x96\x10\x99=N$\xf8\xbd\x86\xcc\x97\xbe\xf0\t\x96\xbc\xfcCQ\xbe\xc8]\x16\xbe\x90h0>H:\x88\xbe$,}=\xee\x1f\xd2>\xb9\x85\\\xbd\xca\xfb\xc4=`\x80g>C\xeaw>\x94\x96\xa5;\xa31\xf0={\x8f%>\x83\x85\x8e\xbe+Y4\xbeFX\xc8\xbbv\xb2\xa3>\xa96\x1b>\xe66\x92=/J\xb3>\xefs\x04\xbd\x86\xca\xb4>\xbfD\'\xbe\xf9\t\xb6\xbdH\x15\xdd\xbe\x00fM>9\x9b\xcc\xbd\x19\x80\xde\xbd\x11\xa4\xd2\xbe<a\xae\xbe\xe8\x87U>\xd9D\x95=T\xfc\x8d\xbc\x11\xbb\xba\xbeU\x05\x0c\xbe\x1d\x0bq>\x9aPb\xbe\x1fzB=\xd2VR\xbe\xd5 s\xbe\x93Y\xed\xbeVE\xb3\xbe\x98[\xb7\xbd\xcd\xc6\r\xbe\x86\xf8H\xbe\xc39\x8a>\xcf\xb6l>\x94+\r>\xbd\x9f_>\xa2\xbe\x00>\xd9\x8e\xa9\xbd\x8e\xb5S<\xef\xaf\xbd>\xc0\xfah\xbe\x88?\xfd=H\xe4+>$a\xf7=YF\xb9\xbe\xcb\x8a\xda>V\x9d\xe2=\x0f&\x9d\xbd\x93T\x8b=R\xde+\xbd\x0fR\x90<\xa8\xda\x1e>&\xb7\xb0\xbd\xe6l.>*\x08\x10>\x8e\xc1M>\xa6\xf2\xc6<\x9fNt<2\xf2\x87>}\xad\n>\x93&">\xb5\xe1*?3\x95}\xbe\x83\\\xa0\xbd\\(a=\xd5\x03l>"\xe8%\xbd\x01\x7f\x96\xbdm\x8a\x9e>\xfe\x9c\'>\xcfnp>\xcc\x042=X\xc1\xc1= \x16\x9b\xbe\x8b\xa4h>\x84\xd8y=\xa6t\xb3=FV\xfc>V\x92\x99\xbc\xdd\xf5]\xbd\xd1\xf4\x1a\xbe5Ul\xbe91@>f\xb6\x9a\xbd2\xf5\xec\xbc*\x91\x9d=\xdd\x99\x82>M\xee\x84\xbd\xf1k:\xbc\xb3o\xb1;\x96%H=\x82u!\xbe\x17\xf0\x90=z[r\xbc\xcd\xf3Z\xbd\xf5\xfe\x83\xb9F\x1eo>\xe4\x00\x87\xbe<e\xad>x\xcb~\xbc\xea\xbek\xbeLw\x9f>\xbc*\x01=*\xf9u>2\xf9\xb9>6\'\x07\xbe\xeaAP\xbd!\x05\xa9\xbd\x96EF\xbe\xc7\xdf\xb0>(\x01\xc8>\x88\x90Y\xbd\x826\x8d>x\xe2\xfe\xbd\xc4&\x85=\xeb\x84\xa7=\xabx\xc2\xbe\xf9\xbc^>\xa4\x0co\xbe\xe1p\xc3\xbe\x86\xafQ\xbe6\xf3\xb8\xbd\x9aa\x0e\xbe\xc6\x04\x94\xbe\xe7\xc9\xb8>8\x93\xc7\xbd\'\xceQ\xbejP\xf3\xbd\x86\xe9\xbb\xbeu\x05\xf3\xbd\x1a\xc1\xd8>\xe7\x16J\xbd\xcf\xa4\x0c=m\xe2\xec\xbe\n\xef\xaf\xbe\xcf\xd8h\xbe\x7fs\xa8=r\xca\xa1>\xbd\x00\x84=\x15{W\xbeN\xe1\x14\xbe\xe3\x10\xba>-{\x93=\xa4Io=\x91\x16\'<f\xc1\xcb>\x83\xc7\xab\xbeX\xa0\x1f>\xbb.\x1b\xbe\xa7@D>\xce\xb9\x88>\x8e\xc3\xb8>\x96\xa6\xd3>\xc3\x06\x9e>\xf8\xc3\xf4=\xa6\x87H>*\xd1\x7f<'
-p1434
-tp1435
-bsV580634303400402944
-p1436
-g2
-(g3
-(I0
-tp1437
-g5
-tp1438
-Rp1439
-(I1
-(I200
-tp1440
-g12
-I00
-S'\xf0\x7ff>o\x05\xe0\xbd\xe3\x8e\xdb\xbe\xf7\xf3\xaf=\xd9\x03\x8f>\xad\xbb\x1d\xbe\xfa}\x1c\xbe\xcaI\'\xbe1\xb44\xbd\x88\x80\xd1=5\xf5\x08>bc\x02=|F!>\xa4\x0b\x8e=\x1b\xd4\x0f\xbex{\x91>\x02W\x06=i\xfc\x83\xbd\x14%\x99\xbd\x15\xee\xaf=_\xbd\x9f\xbe\xb7\xc4\x1f\xbd\x87:\x00>\xb8\x82\xce\xbe\xf1?\x01\xbe\x9f-\xce\xbd\x99X\'>h\x08\x92\xbe\xa3\xf0\x85\xbel\x8c+>\xbc\xe8\x10;\x1a~\x10\xbe\x81n>>\xf1\x7fi\xbe\xf1\xb0\xe1\xbb\xb5\xa8\xa4>U\r\xae\xbc\xe56\xe6=\xf2\xc0\x98>\xcb1\x18>,\x10\xd7<T\xae\x1f>\x90Ov>\x82\x18\xa6\xbe\x93\xec\x02\xbeH\xf9\xf1<\x9fw\xce>\xd1Q\x0e\xbb\xf8\xc0[=\x07\x95\xaf>L^\xbf=c\x07\xe0>i\xbel\xbe+\x08\xf8\xbc0\x07\xd4\xbeA\xf2\x9c>}\xa3\x03<\x9c\xac@\xbe=3\xab\xbe\xc8\x85\xc0\xbe\xf3n\x8e>\xf5\x0e\xf1\xbc\xe7\xd2\xe5\xbdw\x10\x98\xbe3?\x9a\xbd@\x17\x9a>\x8bb%\xbe\xab\t==\x1d$\xd9\xbe]\x07\xfe\xbd\xddb\x0c\xbf\xa4S\x92\xbeV\r\xa0<h:\x12\xbe\xa1\xf2[\xbe\xe30\xa3>\x9d\x98\xa3>\xb8\xf7\x07>\xdc3\xb7=\xeb!!>\x9d<\x1a\xbe\xe3\xf7\x84\xbc=\xc1\x83>\x9f\xee?\xbew\xd3\x12>\xb7\x94\x1f>\x8dZn>\xd5\xab\xb9\xbe\xb0\xc7\xf7>\x95\xd7M>\xabA\x9e\xbdB\xad#>\x88Yq\xbe\xba\xc6\x15>\xc9\xae\x82>E!\x9a\xbcu\xf6\xbf=\x80\xe0c>\xcb\xae0>||@=\xd8\xb8\x93=\x83\xcd\xbb>\xc03\xd0=\xc5g\xfc=\xe9\x8b\xf8>C\xc5\x80\xbe\xefZ\x11<g\x14\xb8\xbbUB\xd3= \x11\xd3\xbc\xd4\xa1\xc8<n\xa1\x9b>\xfd\xe5\xab=\x07\xd1.>\xdcE\x8a\xbc\xc9\x8fM=c\xac\xa8\xbe+\x8c\x8f>\xdfcr=\xd7\xe6\xfc=\xcd\x18\x08?{\x040\xbb^\t\xa0\xbdm\xedy\xbdL\x0fo\xbde0\x82>_\x8b\x0f\xbe3u\xc2\xbb.<\xaa\xbc\xf5\xe7\xe5=\x10hU=\xe3\xc2\'=\x9b\xa3==\xddU\x8f<\xb6\xc8\x1b=\x00!\n>\x1a\xc9\x07=s\xd2\x9a<\xadE\xdb=%\x83->\x93\xb6"\xbe\x8d{\xb0>$\x19\xa0\xbd\xc9\xab\x83\xbel\xeci>%\xd2\xad\xbdHE\x8e>\xd7\x9fl>\x81\xc68\xbe[\xcbP\xbd\xb17\x9d\xbc|\xbd5\xbe\xa4\x91I>-\xa8\x9b>\x95\x88B=\\\xa2\xb9>\x0fG\\\xbdLE\x88=\x13\xfc\xc1=lVx\xbe\x8d\x13\xa8>-\xcc1\xbe\x99}z\xbe\xa5"\x1f\xbe+\xac\xf6\xbd$h1\xbe\xf8\xb3\xc3\xbe\xc0\xcc\xab>\x8b\x8a\xfb\xbdd\xf3\xb7\xbdy\xadV<M\xb2K\xbe \x16\xf5<\xe3\xbf\r?\x8f\xa6M=\xf5\xb9x\xbc\nY\x9f\xbe\xa9)\x8e\xbe\xf5\xf14\xbe\x91W\xfa=*\x7f\x97>-*v=\x8b\xa8\x13\xbe\xc3K\xbb\xbd\xe8\x891>O\xc5*\xbd\x81jG>$o\x03=7\x88\x97>\xc4\xc0\\\xbe>:\r>\xf5\x03\x83\xbcQ\xb3@>\xf7yV>\xfb\xad\x84>\xc7\x11\xb4>\r\xf7Y>U\xab\xdc=\xf9\x1d\x15=\xb9\xd23>'
-p1441
-tp1442
-bsV578797361922736128
-p1443
-g2
-(g3
-(I0
-tp1444
-g5
-tp1445
-Rp1446
-(I1
-(I200
-tp1447
-g12
-I00
-S'\xf6\xadN=\xd5ax\xbd\xb9\xf2\x99\xbe\xf4\rY>\xb8\x04\xcc=\x88g1=)\x87L\xbe\xd2\xb6\xc2\xbd\xb1\xbc#\xbd\xd9\x1cF>{\xee/=\xbdM\x97\xbe\x0f\x1f\x05>i^\xa2=\xcd\xd0P\xbdg\x87K>\xde(\x1d\xbd\xf8\x88O\xbekR:=\xda\x94\xd2=\xf5\x00\xb8\xbe\x86LK\xbd\x08\xdf\x8a=\xc6\xdf\x11\xbea\x0e\xa9\xbd\xfd0\x04\xbd\xe2\x9cr=!\xf1\xe0\xbdxi\x9f\xbe\xe4\xef\x80\xbd\xc2\x9bY\xbe_\'\x05\xbe1\xf1\\>\xca\xac\x8b\xbe\x10\x84\x07<qv\xe3>*\xb0B\xbeci\xa6=\x11\xfb0>\x8b\xe1\x98>\xed\xf4{=\xed\xe7\x89>\xe3/\x1d>z\xaa\xa0\xbe!\xf80\xbe\xa1_#\xbc\xf2\x8f\x81>\x88*\x12>\xe9\xcc\x9b="\x89\x8f>N\x98\xdb\xbc\xbd{\xc0>\xe8\xdcG\xbeo\x08\xed\xbd\xe5\xdd\xc4\xbezC\x82>\x92\x8c\x04\xbe\x18\xb5+\xbe\xfd\xfc\x9d\xbe\xa8\xa4\x9d\xbei4\x88>\x9a\xeaZ\xbd\xc07\xda\xbd\x0e\xd4\xd1\xbe\xfc\x1d\x17\xbe\xa1c\x96>\x08\x06r\xbe98\x9d\xbd_%\x97\xbe\xab^t\xbe\xe8\x8f\xd1\xbe\xcdL\xb0\xbe\xfc(K\xbd\xfa\n\x19\xbe\x05Q\x82\xbe\x90\x15\x9f>,\x9c\xa3>?\xb2\xe3=\xf1YY>\xa8\xf2\xce=s\x1e\xf7\xbd\xd5i\xf8;\x98\xac\xc4>&\xedS\xbe\x83&\xa7=Jd<>\xc0\xe8V=\x16\xdd\xca\xbe\x19N\xc8>!\x8b4>\xe2\xff\t\xbd\xbe\xdf\x93;\x03r\x14=<\x94G=\xa0\xed\xdc=\xc5g\xea\xbd\xb7\xb2\xbd=\x17)\xa0=d\x13Z>}6\xbf=\x9bw\x85\xba\xc0\x90\x91>d\xef\x0b>\x95\xc6\x19>\x86\xfc0?:@}\xbe\xbc\xb8\xde\xbd\xf3\xb7\xe5\xbb\x87Y\x93>\x86\xb7t\xbd\x80\x17"=\xdf\x16\xaa>\x16\xe0\xd9=\x8d\xd0t> m6=\'\xb9\xea=#\x85\x9c\xbe\x11\x9bY>\xddO\xd2<|\x97\xa8=\x15!\xfb>mF\xf7\xbd\x18\xa5\xa8\xbd\xb6\xcdF\xbe\xbfi\x91\xbe\x05{B>\xdb\xf9<\xbd\xf8,\xae\xbdd\x86\x92=\x9c\xdf\x87>\xc2\xa7\xc3\xbd9\x1c\xa8\xbdrE\xda\xbc&\xce\x96=v\x8dm\xbe\x8c \xdc=l\xacl;\xb8BO\xbd\xf3\xf6\x96=\xac\x89\xa3>\x10~\x8b\xber\x06\xb3>\x98\xba\xc5\xbdC\xdf9\xbe\x13\x85\x96>\xf3)\xf2<L\xfd\x9f>`\xdc\xa1>\xc9\xfc\xf5\xbdBY\xe6\xbd\x83%\x11\xbe\x0e\xc4Z\xbe\x9d\xdb\xb9>\x8d\xe0\xf5>E\xc0\x87\xbd\xf5\xc1\x95>\x04\xdd\xf4\xbd\x10R\n=\xea\xdc\x9f="P\xd0\xbeA\xbb\xaa>q9I\xbe\xbf\xa0\xb5\xbeh\x8f|\xbe\x08\x06\x17\xbe\xa8\xb8d\xbe\x88\x94\x9c\xbe\xe1\x85\xb9>\xb8#\x1e\xbe\xc4\xffR\xbe\xba\xa2\x06\xbe@\xc0\xcc\xbeo8\xd6\xbd\xc9\x9d\xde>\x8dEu\xbd*\x15\xaa<\xcf\x1b\xfb\xbezP\x99\xbe\x0c9\xcb\xbeiQ3=|\x16\xa6>\x15\x05\xb8=\x80\x87P\xbe\xf1(2\xbe\xc0\xd6\xa7>\xc0\xc0\x99=\rE\xe1;B\x13\xfd\xba\x02\xfb\xd9>\xbf\x1b\xb4\xbex\x06\xdd=\xa6!l\xbe\xc0`~>A\x82\x82>.p\xa1>z\x89\xd8>\x9b\x9a\xd9>\xdb\x86\xdd=\x04\xd9[>\x10u\x89;'
-p1448
-tp1449
-bsV580984525338992640
-p1450
-g2
-(g3
-(I0
-tp1451
-g5
-tp1452
-Rp1453
-(I1
-(I200
-tp1454
-g12
-I00
-S'\xc88F>Z\xf8\xbb\xbc\xd6\x0b\x87\xbe5z\x9e=o\xd7*>\xbf.(\xbd\x8b\x06\xb5\xbd\xf8C"\xbe;tI\xbd\xd9A\xf2=\xc1\rV==\xa0}\xbd\xa6S\xdc=\xad\xb4\xaf=6\x86\xa4\xbd\x0f\x1f`>k\x9c\xd1\xbc\x98B\xa4\xbd~\xc0\x8f\xbd\xf3\xf6\x8a;\xd7\xe82\xbe\xe5\x85\x0b\xbdQ\x92\xce=\xb1r*\xbe\xcd[8\xbd{4k\xbdN\xa0\xb9="i\x19\xbe[\xb68\xbe3\xedv=\x00\xa8\xc1\xbd\xd7\x88\xe5\xbd\x01\x92\x01>\xd6YL\xbek\xaf\xc2<\xbe\xe1\x83>\xee\xdb=<\xbaK\xdd=\xf2\xebQ>\xb6\x14\xf3=\xd5\x85\xfd\xbbZe>=`\x1f\x1a>\xce\x84N\xbe3\x89\xe9\xbd\xf2\xb4Z\xbb\x01\x0b\x87>H)I=\xae\'-=b.\x8e>\xe1\xb5d;F\xf2\x92>\x12\x90\xe2\xbd{<8\xbc\xde2\x9e\xbe%\x1f\x1c>u\x94\x14\xbd\xdd\xbc\xcf\xbdHK\x9f\xbe\x1f\xe4\x93\xbe\xa8i\x16>\xea\x97\xf9<\x1f\x83\x9a\xbc\x1fqi\xbe\xf0\xc7m\xbd\xaf>5>A\xef\x0b\xbe\xc3\xc0i=\x85\xca;\xbe"t\xff\xbd\x1b7\xc9\xbe\t\xe9l\xbe\xf1\xd0\xc8\xbc\x83\x8e\xc5\xbdB{\x00\xbe\xe3\x0c6>\x96\xc0#>\xe8\x89\xcc=\x11\xff\x02>\x8e}\xff=\x980\x9b\xbd\x19%\x9e<\x87:u>\x9d\xf4\x1d\xbe\x1b\x1a\xfa=#U\xec=\x9390>\x86\x9d\x8e\xbeo!\xb3>\xab\xcb\x89=\x12\xb0\xaf\xbd\xa8\x9d\xa0=\xd7<\x12\xbea\xf8)=\xf7\x97:>_Z\x17\xbb.\x18\x08>r\x90">\xe5=\xfe=J>\xaf\xbc_\t1=\xf7\xf6m>\x0e\xfe\xc2=\x9bo\xe6=\xe2^\xcf>\x90\xb8.\xbe^\xd7\x9a\xbc\x7f+\x1f=\xd2\x04\xc7=N\x1cL:\x8b:"\xbd\x05\xcc[>m\x03\xff=\xce,\r>E\x9d\xc2;\xdeU\x17=R\xe3h\xbe\xea"W>\x01@$=\xc9\xc2\x87=9\xb8\xbb>A\x98\xe9<\xbd\xa0 \xbd\xfb\xbdp\xbd\xda\xbb\xca\xbdM\xfa\x1a>e\x82\xae\xbd\x1c\x15\x00;\xe1@4=\x13k\x02>\xebJ)<\x9e\xc7==\xbd\'-= \x92\x01=j\x1a3\xbbm\x05\x8d=\x868\x91\xbc\xdf\xed!\xbc\xa8dI<v\x1d\xf7=\xe1\xea"\xbeo:z>>|\xc7\xbc\xbeMI\xbe\x81\xddJ>\xae3\xf7\xbc\xd2\xa0\x1d>m\x07j>i\xd5\xb8\xbd\x96aS\xbc_5q\xbc\xa9g\x01\xbe`\x05X>mwf>\x16\x124<m\\n>\x8bl\x9b\xbdy\x92n=\xcd\xff\x8a=qRY\xbe\x1b\xc3\x07>0\xbc:\xbe\x81\xf1\x87\xbe\xba&\t\xbe\x92\x7fQ\xbd9H\xb6\xbd\x9fC|\xbe:zu>8\xe5I\xbdc\x94\xc9\xbd\x16\x91\x06\xbdv7Y\xbe5\xc51\xbdnX\xac>[\x87\x87\xbb\xd4\xd4\x0c<+\n\x92\xbe\x10\xd8\x7f\xbe\xa2?\x8d\xbd\x1f%\x8b=\xef\xc7}>\n\x85\xf7<\x06\xd7\x01\xbe\xfe;_\xbd9\'H>5\xdb\x1d=&3\xdc=\x16\xdc\x9d<\xafsv>\xd5\xc8D\xbe\xa0\x1f\x19>k{\x9c\xbc\xc9\xc2\x04>\xe9\xb5>>EF\x8b>\xba7\x85>\xa2\xc1\x04>\xa0I\x93=\xb9\x08\x9f=9Y\x9c='
-p1455
-tp1456
-bsV578779644859539456
-p1457
-g2
-(g3
-(I0
-tp1458
-g5
-tp1459
-Rp1460
-(I1
-(I200
-tp1461
-g12
-I00
-S'\x94\xc6\xa5<\x04U\x9e\xbby\x88\xc3\xbc\xac?\x07;W\xdd\x8b<\x8c\x88v\xbby\xabZ\xbby\xf3_\xbcs\x7f\xea\xbba\x04[<\xe5\x89\x11;\x8d\r\xac\xbb\xf72,<\xb3k\x9c;\x0e\x11\xd5\xbbF\x0e\xa8<\xe2\xc2\xa9\xbbQ\xfc\x04\xbc"o\xf2\xbb\x08\xceZ9PC\x84\xbc\xbc\x9e\\:\xf7\x96Z;\x04\x8f-\xbc\x02\xfal\xbbV\x0e\xf4\xbb\t06<\x0cG;\xbc6\x0e\x97\xbc\x91\xbb\x86;\xe5\x86\x18\xbc\xe4\xd8\xba\xbb\xb0J\x1f<N5\xae\xbc\xc4\xf1\x16;\xcc\xbf\xb3<\x03[\xb6;D\x1e\xfd;&\xa7\xa0<\xca\x97\xd9;D@:\xbb\xb4Ky\xba&\xb1?<\xd8O{\xbc{\x13<\xbc#\xa4<\xbb\xb3\x9e\xb9<A\xc2\x90;\xc4>d;(\xa4\xd1<\x8e\xb4\xce:m\xb2\xd4<\xda*\xff\xbb\x06w\xa5\xba}%\xe1\xbce7/<\xade\xfc\xba\xce.#\xbc\x96\r\xef\xbc\x85\xba\xd2\xbc\x9b\x1aF<t+\x06<\xf4\xff\xdc:\x1a\xd4\x88\xbc\xa0\xca\xd9\xb9n\x89\x8a<\xf8\x1dz\xbc\xb2^!<nOT\xbc\xceE\x1c\xbc\xdee\x01\xbd\\x\x93\xbcD}\xd7\xba\x90/\xb2\xbb\x91\x8d1\xbc\x15b[<\x05\xe9\x8f<\xa5\xb3\x16<\x9c\x8fL<f\xcan<\xdc\x06s\xbb\x18\xfa\x82:(L\xac<Q\xaa\x81\xbc\xd9\x08"<wx\xb8;;#N<8\xe8\xb4\xbclx\x05=uT<;\xd4\xf4\x03\xbc/b\xf9;\xd2\xb4K\xbc(\xad\xef\xb9\xd0\xa1\x8e<\xe8\xcd\n9dyp<V?\x88<\x9a\x16\x18<\xa2\x00\x9c\xbb\xc3\xe6y;\xf6\xc3\xa8<2\xd9*<\x07\x9b/<\x13i\x08=\xdcg\x9b\xbcL\xea\xdc\xb9\\@\x01< *\x02<H\xd1\xf09\xd5B\x06\xbc\xb9S]<Hu\xfc;M\xf18<\xaf\x04\xdf:\xd1p\xb6;\x8e\xc2\xc0\xbc\xb8y\x92<,\x8aH\xba\x93d\xbc;\x9a\x01\x05=\xfb\x17\xa4;0\xd7e\xbb0\x9b\xcc\xbb\x91d\xd0\xbb1\xd5r<\x80\x81/\xbcsv\x08:\xe8!/;\xe0\t\x14<\xc0BR6\xe2s\xcb;f(\xf4;\xf1\xc1\\;\xc6<\x19;\x7f\x15\xdf;\x9b\x17\xc2\xbb\xce\xb5\xa1\xba%?\xd69\xae\x84\x0f<\x93K\\\xbc\x8a\x15\xbc<\x80\x96F9#\x9a\xa3\xbc\xa8\x80\xa1<(J\xf7\xb9\xca\x96I<\xc4\xd6\xd8<\x82&\t\xbcM\xc5\xdf:\xaf\xddS\xbb\x90fA\xbc\xfa\x84\xa4<\xea:\xaf<\xf5H\x90\xba\x17\x1c\xca<\x90z\x15\xbc\xf4\xe6\x15<\xd0\x0c\xfe;8\xf0\x8f\xbc\xc6:\t<\x82\x86\x85\xbc\n\x84\xd4\xbcd,\x8a\xbc\x9e\x8eM\xbbI\x9a\xdd\xbb\xf0\x96\xe1\xbc\xf8\x9e\x82<\x087\x9b\xbb\xd4\xaa\xaf\xbb\x8a\xd9\xdc\xba\xba\xdc\xa8\xbc\xd5>\x9a\xbb\xe9\x10\xec<\x86\xa0%;\xa8\xd4N;\xd2V\xd0\xbc@/\xca\xbc\x0f\x17\xcd\xbaP}\xc2;\x04\xa4\xba<\x83!`;\xb6>F\xbc\xe0Nl\xbb\\&\xbd<@\x15\x027\x0c\x1eV<\xa8\xa3\xb8;~\xea\x9d<\xecb\x7f\xbc\x9b\xa7N<a\xf1\x95\xb9\xd4\xd3\x1a<\xeba\x90<\x06\xf7\xd4<"O\xc0<\xce\xd8\x0c<D\xbaZ;\xbds\xe7;I\x108;'
-p1462
-tp1463
-bsV580931644049113088
-p1464
-g2
-(g3
-(I0
-tp1465
-g5
-tp1466
-Rp1467
-(I1
-(I200
-tp1468
-g12
-I00
-S'\x19\xfd\xac>\xbb\xf0\xca;uD\xe7\xbe*d\x91<\xd8\x8co>\xef\xa6\xd0\xbd\xa7%\x0b\xbe\xdbI?\xbe\xf4\x11k=\xf07{>\xcc\t\xb6<@\x0b8\xbd\x1d\n\x07=a\xb0\x1b\xbd\x14\x18\xac\xbd\'\x07\x9b>\x9df\xf5\xbc\xc3\xab\xd6\xbd\x7f\xa9+\xbe\x02\x0e(\xbd\xaf\xa0q\xbe\xd73$<p\x16\x16>\xc8e\x1d\xbe\x81\xd4\xa3\xbd\xe6m\x03\xbe\x14\x0ch>\x91\x0c\x0f\xbe\xbbs\x90\xbe\xc1D\x8f:\x83D|\xbbM\x84\xec\xbd\x10\x81z=k\x8a\xa7\xbe\xc7\xc9E\xbd\x8d6\xc6>d\x1e\x08>\\\xe9\x9e=\xf3\xf4\xb1>\xc1Q\xde=\xc5\x00\x1f\xbe\xeb\xeb\x9d\xbc\xca\xe7\x08>oz9\xbe\x882X\xbe\x83\xd83\xbdu\xa1\xe1>g\xcf"=\xd5\x82\xa7=\xc0\xee\xf1>`\x9c\xe69l\x9d\xc0>\xe4\xedk\xbe7So\xbd\x87J\xcc\xbe\xebk^>\x04\xb3\xc6=D\x9a\xa4\xbdG\xcb\xf2\xbe3\xae\xc6\xbe\x97\xd9\x83>=\x08\x85>\x04C\x02=\xc4\x0f>\xbe\xe8\xd2E;\xbbTV>\x95\x90|\xbe\x10\xd7h>\xf3\x8b\x97\xbe\xbf~\xee\xbds7\n\xbf\xcb\x8a\xa6\xbe\xa0Xz\xbd\xdc$\x12\xbe \x01s\xbe]\xdc\xf0=t\x88_>8\xa5\x12>\t\x94=>\xafA+>\x93{\xc9\xbd\x00\xcaJ;iG\xa2>\xfd\xd0g\xbe\xac\xd9\x05>\'\x16\x98=\x8d\x11\x04>\x8d\xdf\xa4\xbe\xdbg\xf7>1p\xa5=\xcb\xfa\x1c\xbeY\xbfd>1@\x84\xbewf\x84=1\xe5m>P\xc9w;\x83\xacm>{C\x88>\xc5xV>\xc5\xd8\x12\xbd\xeb\xd5\xfa\xbch\xb8\xb8>\x00\xcf\xfb=\xd5\n\x03>\x08\x15\xbd>\x94\xb5\xb1\xbe\xdd\x05\x8e<\xcchJ>\xaf\xc3\xdc=[%\x1c\xbdR^\x83\xbe[\xb3\xd3=\xe7\x02\x14>7\xbak>\xd0F3>\xf5\xcd\xa9<\x00\t\xc6\xbe\xc1\xa6\x86>\xc1\x17\x00\xbd\'\xd5_= \x8c\xfb>p\xe6$>HU\xb6\xbd)3\x8c\xbd\x90Q\xb7\xbd\x95\x9d\x8b>\x1d\xfe\xd9\xbd\x1b\x99 \xbc;Ce<\x1bK\xd4=\xb9\xeb\xa5=\xcex\x01>O\x90\xa6<\x0f5\xe0\xbc=w\x87\xbd\x9d\x1f\xf1=E\xc8\x89\xbd\x88\x1c\xc6\xbcG)\x03\xbe*,\x10>_\x17\\\xbe\\\xd2x>\xb4\xc13=\xa4\x92\xc5\xbe\xf5\xe0\x9e>\x19i~=\xbbf\x87>\x07\n\xef>\xa7\x041\xbeN_\x89\xbb\x9f8!\xbdwy\x19\xbe{\xa3\x85>\xa9\xed\x9b>\x98aI\xbd\x94\x1d\xdc>\x9c\xc9\xf5\xbd\x96\xf0\x96=\xc8(\xd3=\xdb*\x88\xbe\xc0\x0c\xef<\x15lj\xbe\xbc\xda\xb5\xbema\x8a\xbe\xba"\x8f\xbdm\xd3\xab\xbd\xf4\xaa\xf8\xbe\xca\x1f\x9b>\x85\x9a\xb8;\xecr8=\x1dR\xfc;\x04\xbca\xbep8~\xbd\xaf\xc7\t?\x14\xee\x81=a\x12\xd6=\xaf\xe4\xb1\xbe\xdfY\xd1\xbe\xfb\xe1\n\xbd\xc3\x16\x07>m\x13\x9c>\xd3\xff==\x9d\x9ap\xbeL\x8dW\xbe\xedG\x87>T\x02\x98\xbd\xf4->>Cg\x8b=\xbf\xa6\x96>\x1c\x84\xf3\xbd\xbe\xb9 >\x93\xab1=\xad\xf3D>\x83=,>\x80\x81\xb7>\x05\xf3\xdb>\x14d\xb3=\x8dL\xa0=Qt\x98=m\xe5\x93<'
-p1469
-tp1470
-bsV591037947727720449
-p1471
-g2
-(g3
-(I0
-tp1472
-g5
-tp1473
-Rp1474
-(I1
-(I200
-tp1475
-g12
-I00
-S'&vL>\x9e\xc7\x969\xc3\xacx\xbe\xf2*\xb2=\xdbT5>\xe1w\xa4\xbc\x1c\xbd\xab\xbd\xeb\\3\xbe\xdeq6\xbd\x0ca\xf4=[\xb1\x1b=\xc8\xde\xb2\xbd\xdfe\x9c=\xec\xdc\x9f=O\xcb=\xbd\xfa\xd7\x87>;\xed8\xbd\x8d\x95\xab\xbd\xe5U\xa3\xbd\xbeZ\xeb\xbcsJ"\xbe{X\xe9\xbc8\xdd\xd5=\xbb`\xcd\xbd\xd4\x8dB\xbd\x1d\x95M\xbd\x00=\xae=\xa2k\xf6\xbd{\\\'\xbe\xfa0\xcd<\xe2\xbe\x0f\xbe\xeb\xee\xc8\xbd\x83\xaa\xaa=\x14dP\xbe\xa2\xecM=\xc3A~>\x14\x90B=\xb5\x92\xf4=Q:W>M\xb0\xbc=b\x18y\xbd&\xb4-\xbc\xcb\xa7\x03>T\xbf\x1c\xbe\x80n\x08\xbe\xa3\x13\xe5\xbcM4\x81>*\xf8\xa4=u\xf0\x84="b\x90>r=&<\xd9\xc9\x83>|>\x9b\xbd\xf4dI\xbc\xb3/\x9f\xbe\xc2\xf6\xe1=\xa3\x84G\xbd\xa05\xd9\xbd\x94j\xa8\xbe\xcd\x00\x8c\xbe\xba\x99\xc5=\xc5\xef\xc0=\xa8\xe0\xef<\x05\x82b\xbe\xd7\x88\xd9\xbc\xa8\x01\x06>\xdd\xbd\t\xbeX\x7f\xc3=\xf1\xd4\xf5\xbd\x08\x8b\x16\xbe3g\xbf\xbe\xb1\xefv\xbe\x1e\x0fn\xbd.\xb5Y\xbdB%\xe2\xbd\x85\xb4\x1c>\x1c\xe9\x1c>\x03\xb8\xd7=(\t\x0f>\x8f\x13\r>z\x89\x15\xbd\x8e\xc5\x10=\x9e\x9fd>;8+\xbe&d\xde=1x\xd0=\x9b\xb6\x1b>^\x05~\xbe\x12K\xba>l@\x9c<1\xd0\xe0\xbd\xcfE\xd0=PS\x02\xbeBW#\xbcT\xda,>\x9a\xf8j\xbc\xab\xb6/>7l#>\xf9J\x08>\x97\x05@\xbdf\xe2:=E\xbbC>[\x05\xbb=\xb5\xa6\x0f>\xdd:\xd8>\xd0\x8c4\xbe\xaf\xfe\x02\xbd2F\x99=+j\xe1=7\xbcj<\xa9\xdc\xaf\xbdh\'A>\x08~\x19>\xd3\xc4\x05>\x9e\xc6\xd9;\x0f\xa9P=]Mv\xbe\x14l8>\x1b\xa0\xf7<\xc2\x94}=G\xe4\xc0>>\xe3*=(2\xe2\xbcC\x04|\xbd\x0eU\xd2\xbd\t[\x08>F\x81\xcd\xbd\xc0(^;QeJ=8K\x19>\t\xb3\xe9\xbb\x04\x1d\xa2=B\xd7\x87=K\r\x13=\xb5\xca\x93\xbc\x8e\xc4[=^\xc6\xfc\xbc\x06\xb9e\xbc\x1a\x04\xfd\xbcn\xbe\x9c=~i8\xbeLes>F\x94Z<\xee\xdf\\\xbe\x00tS>\xc3y\xcf\xbc\xaeH\xe4=\x84\x92\x88>\x97\xbf\xda\xbdT\xe8\xda<\xcc\x89/;\x8e\xfb\xca\xbdw\xd0\\>[\xa9V>\xba\xcaT\xbb4\xb6o>"c\xc0\xbd^\xc5\x93={\xde\xad=n}\\\xbeX\x05\x94=+E7\xbe\xc0\xc2\x92\xbe*\x8a\x02\xbe\xd3\x88!\xbd\x88\x14>\xbd\xa6\x13Y\xbe=|f>\x95\x82\x02\xbd\xbd\xda\xde\xbd\xa3k#\xbd\x0f\xda\\\xbe~\x94\x86\xbd-\xa8\x8f>eT\x88\xbc\xbfg$=S"\x91\xbeZ\xe3s\xbej\xab\x18\xba\xec\x05\xb0=\xe8\xd3v>;\x80\xca<\x98\x16\xfc\xbd\x80\x0c\xea\xbc\x9eh\x88>\x1cS\x1e=;\xdc\xeb=\xd8\xc9\xf2<\x00\xbeh>\xd8\x9aJ\xbe\x83H#>\x8e\x1e\xfe\xbb\xfbN\xbe=\x00I;>%{\x96>x\xcfs>\xcc\x85\xfa=s\x19\x8c=\x9db\xc0=\xe1\x1a6<'
-p1476
-tp1477
-bsV591025117741867008
-p1478
-g2
-(g3
-(I0
-tp1479
-g5
-tp1480
-Rp1481
-(I1
-(I200
-tp1482
-g12
-I00
-S'<\x93\xe0=$\x07\xe7\xbd\x91\x84\x06\xbf\xf0\x1a\xc2>X\x91+>\xa6\x92\xf5=\xba\n\xde\xbe\x9f\xd35\xbej:?\xbd\xb4\xed\xbd>\xa6\xfa\xc6=\xc7`\x05\xbf\x8c\x9aw>\xd9z\x15>If\x99\xbd\xda\x91\xc5>\x81&\x96\xbd\x0c\xb5\xb3\xbe,\x1e\xb7=f\xdd?>\x89m)\xbf9\x1e\xce\xbd\x88\xf8\x1e>,\xe0\x88\xbe\xd60<\xbe\xf1\xfbD\xbd=7\xc0=\xe0PL\xbe\x87\xc8\x1a\xbf*Na\xbd\xe1\xde\xac\xbe\xcc\xad}\xbeD\x14\xc8>c\x1a\xde\xbeT!p=1VN?\x9e$\xa7\xbei\x0f\xd5=\xf7\x9e\xa8>\xe8\x0f\r?\x99a\x0b>\xf0\xdf\xf1>\xf7\\\x99>\xe9/\x19\xbf+g\x8c\xbe]u\x1d;3\xc5\x05?\xbf\xe9\x8d>\x1d\x1d\x0b>\xe1\xce\x08?\xf9\x9a\x0c\xbd v*?\x932\xb4\xbe\xfd\x8di\xbe\xff\xd7>\xbf\x81\x82\xfd>\xf4\xcd]\xbe\xc7\x8b~\xbeHs\x19\xbf7\xcd\x0b\xbfY\x05\xfd>c\xe1a\xbd\xbd\xbfF\xbe\n\x00B\xbf*\x1b\xad\xbe\x14\xf1\x05?Z\xfe\xe1\xbeQ\x84\xd3\xbd\x91\xac\x07\xbf\xd6|\xda\xbeo\xa0B\xbfL{%\xbf\xe4\x0f\xbb\xbdMv\x8d\xbe6\x15\xdf\xbe\xf1|\x1a?\xc8T\x0e?\x16KY>\xfc\xbb\xba>\x16\xb6!>\xda\xab]\xbe\x06\xdf\xb2\xbb\xbcg:?\x7f\x12\xcc\xbe\x82\x8a.>\xc3\x1f\xb4>\xac\xd9\xe3=g\x174\xbf\xc8:.?\x07\xfb\xb4>\xbd4C\xbd.b\x08=\x10\x8e\x8c=a\xba\x03>\xcc\xcbB>\xdc\xe3{\xbe\x83\xe11>\x84\x82)>]1\xc8>\xfc\xe5P>\x8d\x14\xca;\xb9B\xfd>\xf6Q\x7f>\xac\xee\x82>\xf9\x8a\xa2?\xd7\x08\xd8\xbe\xf1\x8e?\xbe\xe4G\xa7\xbc\xee\xb8\x05?=\xb7\n\xbe\xe7\xaf\x95=H\xb1"?\x1d$R>\n\xbf\xe1>\x14\xb0\x85=)zO>\x94\xf9\x05\xbf]g\xc1>aL\xb6=\xc7l@>\xf1\xb8f?\x97\xeeR\xbe\x94\xde\x0c\xbe1N\xc0\xbe\xba\xe1\x02\xbf\x07K\xb0>\xb9(\x8a\xbd\xb6\xa2&\xbe\x9f\x89\xee=9\xc9\xf8>t\'-\xbee2!\xbe\x01%\xaa\xbd"\xee\x0b><\xe9\xd9\xbe\x15\xce3>j\xcfT=\xff\x0f\xfe\xbd\xd4\xa6\x0b>/{\x17?\t\xb7\x00\xbf\xcf_!?F\xb1\x14\xbe:>\xab\xbe\xdf\x94\x05?\'\xc0\x8c=\x816\x19?gL\x0e?\xf9\x8a\x7f\xbe\xd3\x80U\xbe)\xee\x91\xbeL\x8b\xd3\xbe\xa2\xe5*?\x83\xb7a?\x81\xfd\x0b\xbey\xef\xf3>C\xddG\xbe\xcd\xc5K=\x03\xb8\xd3=yAB\xbf\xfaq ?\xe6\x9d\xb9\xbe\xc1Y"\xbfz8\xc0\xbe\xc0\x14\x84\xbe\xb0\xa7\xc5\xbe{w\x08\xbf\xa8\xbc.?am\xa1\xbe\x1a\xc8\xd6\xbe\xa7}\x7f\xbe\xa1V0\xbf\x9fI3\xbe\x7f\xbcM? \xbb\x01\xbeY\\2<48i\xbf$\x9f\n\xbf\xc9H@\xbf\xff\xa5\xbf=/G\x12?1,->\x7f6\xc8\xbes\xfc\xbe\xbe\x89\xd5\x16?\x19\xf9\r>)\x14Z;\\\xb1m;\x7f\x82J?\xe7\x05+\xbf\xe4\xd19>W.\xe1\xbe\xd7w\xdf>\x01%\xf0>\x03\xf4\x14?\xddkM?\xe0;N?f\x1b]>\xa9&\xce>\xb0\x9e1='
-p1483
-tp1484
-bsV580212528862642176
-p1485
-g2
-(g3
-(I0
-tp1486
-g5
-tp1487
-Rp1488
-(I1
-(I200
-tp1489
-g12
-I00
-S'\x8bG\x8c>\x9da\x98\xbe0p$\xbf62\x0f>"\\\xa2>\x06\x10\x80\xbe\xd6;{\xbe\xce\xd1\x15\xbeX\xe1\xdf=\x0b\xb0\x85>\xd8\xaa/=-d\xf9\xbc2\x9cR=\x82\x1b4\xbe\x90w\xeb\xbd\x161\xc1>rz0=5\xe4\xe6\xbd\xb3\x0e\x9f\xbd\xd2x\x90=H\x9e\x0b\xbf\xae0\x9c\xbc\xc5\xb8\xee=\xddU\xff\xbeH]\x8e\xbe"\xce@\xbe0\x9a\xc2>\x00\x07\x89\xbe\x0e\xc4\x00\xbf\xde\xf1c\xbcp5\xe8;\xcds\xe6\xbd\xc0z=>\x18i\xdd\xbe\xf0\xee+\xbe]\xc8 ?ZY\xd6<\xda\xb5\x1c<\xd3\n\xfe>\xf8\x9e:>\x8a\xf3h\xbeJ^4>ma->\xaa`\x9e\xbe\xcb~\xb4\xbe\xaf\xe4\x00\xbe5w\x1b?{y\x9a=\xa8hX>\xa12\x05?\xba0\x14>\xbe|\x1d?\x0b\x95\xce\xbe\x15\xa0G\xbe\n\xf9\x08\xbf\x7f^\x0c?\x13\xbe\x0f>z\xf4\x9a\xbe\x03\x86\xe2\xbePQ\xe9\xberf\xe3>~\xdc1>\ny\x8c\xbd\xb1\xdc\xb1\xbe3a\xfb;\xd0\xed\xec>KX\x9d\xbet\xd9\x02>>\xf05\xbfz\xd0.\xbe\xcdK7\xbf\x82\x92\x01\xbf\xbd\x9e\x9b\xbbzc]\xbe1\xd2\xc6\xbe\x9a\x9c\xbf>U\x9b)?]s@>H\xb7u>\x0b\xef\x86>\xd7\xfb;\xbe\x1ax%\xbb\xa6\x99\xd7>\x98\xd1\xa5\xbe\x9b\x1b\x8c=\xa3\xd5\x82=\xca\xc6\x13<0l\x08\xbf\x1eQ2?`\xcf\x99>\xfek\xba\xbd\xbeG\xba>\xe4W;\xbe\x9b\x145>\x9do\x9d>\xf30\xf6\xbd\x1e\xbb\x8e>VE\x9d>\x85$\xc9>F \xc0=FC\x19\xbd\xedp\x13?\xa3\x18L>J/.>bD\x17?t_\x11\xbf\xae@\x86\xbd~.\x08>\xf5\x90\x87>\xf8b\x99\xbd\xd2]\x05\xbeZ\\5>\x02b\x1c=f\xd7\xa4>\xd6Nb>\xe7\xe23>\xf4j!\xbf\xda\xb7\x90>S\xdd\x01\xbez39=\xd75C?\xae\x05\xe9=\xcb\xf2\x17\xbe*B}\xbe:"\x04\xbez\xd0\xfc>\xea^-\xbe\xb6VA\xbe=\xa4\xb2\xbd;\xebN>\xf4f2=s\xba\xf7=l\xc1\xc8=\xab"\xc3\xbc^\xf7&\xbe\x8bS\x8e>b!\xb7\xbcJ}\x96<B\xb9\x17<\x86<\x87>\xa10\xa6\xbe>\x80\xe2>\x9ar\x8a\xbd\xd6)\x0b\xbf\x87 \xad>)s"\xbd\x15\x7f\x07?\xad9 ?\xa20\xa2\xbe\xc6\'6\xbc\xd2kB\xbe\x95\xc9w\xbe\x83\xaf\xa0>\xec\xb0\x17?K\xc3A\xbd\xd3o5?\xb1Q5\xbe}\xd7\xa9=&3\x06>X\xf0\xcc\xbe\xac7\xa1>\xdd\x89\x81\xbe\xd3\x1a\xea\xbe\xdd\xc1\xcd\xbe\x06\xce\x8e\xbej\x9ab\xbe\xe2\xfdL\xbf0p\xe3>\x9e\x9dB\xbe\x84u9=\xdcY\x10=v\'\xa5\xbe6\x1e\xe6\xbb \xd0]?\x940\x05>=\x13\xe6=\xea\x7f\xea\xbe\xfaB\xc1\xbeI\x18\x9e\xbep\x07O>\xb6~\xd3>\xc8,;>\xc3\xd3\x97\xbe\xe7\xc5\x92\xbe\x8d\xc7\xd1>\xf8\xa9U\xbe/P\x98>\xf2\xfb\x03>\xbb3\xd3>\x01\xf9\x07\xbe\xa5\x99z=3P\xbb;\x9c6\x92>B\x9d\xd5=\x16\x9d\xb2>\xf7\x93\x12?X\x85\xc2>\xee\xb5\x80=\xae\xcb\x15>\xadH\xe4\xbd'
-p1490
-tp1491
-bsV580561879212363776
-p1492
-g2
-(g3
-(I0
-tp1493
-g5
-tp1494
-Rp1495
-(I1
-(I200
-tp1496
-g12
-I00
-S'\xa003=&\xbb6;B\x84@\xbd\x0b\xa0U;&\xd3\x03=M6\x87\xba\x10\x89\x18\xbcd(\xe3\xbc\xd2\xbd\x1b\xbcF\xe4\xf9<jv\x89;\x0c\xd94\xbc~\r\x8a<\x18\xa9\x10<G\xc9\x1c\xbc,p<=\xaa\xae\xfd\xbb\x1f2k\xbc"\x97\x9e\xbcf?\xbe\xbb4\x19\xda\xbc\x08\x16[:\x83\x89\x87<\xe0\xe2\x85\xbc\x1c\x9d\x0e\xbb\xfa\x14^\xbc\x90(\xac<\x1e-\xcb\xbc\x8ed\x0e\xbd\xd0\xae\xb0;\xd0o\x8b\xbc\x8c)N\xbc/k\x81<\xed\xf7$\xbd"h\xfc;\x8a\xe2"=\x82\xe7\x85<D\xa0\x9b<\x14\xe0 =\x84\xf4]<\x82\xa9F\xbc\xf8\xe8\xce\xbb\xc4\xd5\xda<f}\xe3\xbc\xf6[\x9e\xbc:{L\xbb+2H=:\x89,<\xd0\xb2\xef;\xf0sn=\x1b\xc6\xe4\xbaXLS=E\x10\x9b\xbc\xca_\x0b:B\xa3o\xbd\x9e}\xb1<|\xec\xf9\xba\xc5R2\xbcG\xa0\x90\xbd{\x0f^\xbd\xf4\xe6\xd5<\xba\xaf\xb7<\xe06\x06<\x06}\x0e\xbd\xb1Gk\xbb\x16\x96\xc7<\xa8\xb5\xea\xbc\x14\xfb\xe0<\x93\xcf\x90\xbcb\xd8\xaa\xbcZy\x85\xbd\x04\x8c&\xbd]y\xfb\xbb\x98rd\xbc\xf9]\xac\xbc\xd2\x13\xb5<\xea8\xb2<\xa7\xf6\xa4<\xfc\x18\xb1<$A\xdc<\xcc5\t\xbc\xfc\xfa ;p\xad:=\x1cz\xff\xbc\x7f9\xbe<d\x1c\x91<\xcd\x06\x0c=6\xbb)\xbd*\xbe\x81=7S\xd9;\x9a\x00\xa1\xbc\x9b=\x87<\x95B\xf1\xbc\xa6\x99G\xbb\xa1\xb9\x18=\x02\xe9\xb7:\xce\x8a\xd8<\x1aG\x05=\x03H\xa8<(\xceS\xbcI\xa0\x11<\xf5"\x0f=\xb5\xac\x8b<\xb1]\xb2<\x94\xb2\x84=\xfbb\xfa\xbc\xb2~\x16\xba\xd7\xc3}<.\xce?<\x00\xf7\t;J\x05\xbe\xbc\xba}\x04=\x8b`\xc9<\xba\x9f\xba<\x8a\x05\n;d\xae\x1c;8\x97*\xbdi\x07\x15=pJ\x02<v\r*<\x08\xe9\x83=\xa2\xc7P<O8\xa0\xbb\xfc\r\xab\xbb\xa0\xa9\x1a\xbc\x9a\x86\xda<\x1d\xd3\xa8\xbc*?\xa3;\x00h\x10<\xe3\x83\xa9<\xf01\xea9$\xc7S<\xc2\xa8\n<\xf57\x92;\xdb\xdb[;r\xf1\xda;\x82\x91\xfc\xbb\x1a[\x9e\xbb\xaf7n\xbbj\xa15<d\x8a\xdb\xbc\xb4\xdb\x17=mi\xc0;\xbe\x18!\xbd\x84T,=x\x1b\xb6:\x9a*\x9d<$\xbbE=\x9bV\x9c\xbcW\xca`:Q\x94\x9a\xbb^\x10\xa8\xbc6g\x18=\xcaR\x0c=D\x12\x0c\xbb\xa6\x8f3=\xefq\x81\xbch-~<\xb9\xbe <p\x8f%\xbd\xfa\\\x03<\xea\xf2\x15\xbd\xfc\x1cS\xbd\xe0\x85\xd7\xbc\x9d\xf5\xde\xbaf\xcfI\xbc\xb4\xcdA\xbd\x0e\xd5\x16=H,\x8f\xba\x8c\x91\x81\xbc\xf3W\x81\xbbN\xfa\n\xbd&\x89\x01\xbc\xa6\xc8s=\x98\x0bu;\x11\xcd\x98;\xc1xH\xbd\xf6(G\xbdq\x87\x8f;^\x16o<w\xb9$=\x959\x98;\xe6\x93\xe9\xbc\xc0C5\xbc"/(=\x8dN\x85;ya\x87<\x05\xa3Q;\xb96 =Bp\xe6\xbcv\x1d\xd7<\x1e\x90B:ai\x9f<\\\x90\x00=\xc5\xa1b=n\xc9C=\xed\x18#<\n\xbeZ<`\xfdc<\xce:|<'
-p1497
-tp1498
-bsV577655370484723713
-p1499
-g2
-(g3
-(I0
-tp1500
-g5
-tp1501
-Rp1502
-(I1
-(I200
-tp1503
-g12
-I00
-S"\xa8\xbap>\x9a\x05v\xbd\x96/\xae\xbe\x1c\x8f\x0c=Qpk>*\x85\xa3\xbdr\x96\xab\xbd\xa3\xca\x1f\xbe\xcdM=\xbd\x8fl\x03>9\xf4\x9d=\n\r\xf3\xbau\xe6\r>\xcb\xd3z=\xaf\xb3\xdc\xbd\xd7\xcf\x85>\xb8\x1a(\xbcJ~w\xbde\x97\xc3\xbd8t\xc4<G\x19j\xbe\xf4\xb0.\xbc\xf8\x0c\xcf=;\xb8z\xbe:\x19w\xbdxC\xc7\xbdt\xc1\x15>\xeeBY\xbe\x943g\xbe;\xd3\xda=q\xd3\x03\xbd:K\xcb\xbd\x01\xe5\x02>\x078b\xbe\x82\xf4\x84<B6\x81>\xea\xcf\x12=\x10\xd1\xd8=\x88\xc3\x86>og\xcc=\xf0B\xf0\xbb';f=NeE>UDw\xbe\xe4N\xd5\xbdT\xf7\x91\xbb\xbcx\xac>v\x7f|<8\x061=4\xd9\xa5>\xe5\xe4B=\xbe\xf0\xb9>,\xec'\xbei&X\xba\x02\xd3\xb7\xbeE#_>q\xe3\x94\xbb\xdc\xa0\x02\xbe\xba\xbd\xb8\xbe\x0f\xaf\xac\xbe\xfa\x10a>\xe6\x06N=;\x9c\x06\xbd\xb82f\xbe,X;\xbdp\xa4T>\xad\xb8-\xbe\x1c\xdb\xd3=H3\x83\xbe\xdfl\xc9\xbd\xc0l\xe7\xbe\x84Nu\xbe\xa6\x1d!<F\xd4\xe0\xbd@y\x1e\xbe\x83\xb7U>w\xb5W>\xe4|\xf6=\xc7%\xb7=\xda\xcf\x1f>\xc6\xf2\xcf\xbd\x11\x98!\xbc\xec\xde\x80>4X)\xbe9H\r>\\\x0b\x01>M\x93b>r\xda\x92\xbeH\x07\xce>\x1f\x83\xf7=b)\xe5\xbd\x97\x1b\xee=1,`\xbe\xef\x16\x82=\xdf\x9ct>\x16MW;_\xff\xda=\xa8VU>\xb0\xf9\x08>A\x91F\xbc\xcdX\x85=9Y\x91>\x13\x02\xd5=\xd0\\\xe9=>\xf1\xca>\xd14M\xbe\xd9\xe1\x8c<\x95\xfa\x17=\x8ex\x8f=\xcb\x96\x04\xbc\x1b\x05'\xbdd\xa1c>\xf2\x94\xd0=9\x8c\x0f>\xe5\xc8E\xbc\x91\xce\xe6<\xffK\x8a\xbe\x9fax>z.K=D\x16\xbe=\xf8\x0c\xde>?\xab\x1c=\x08\x98C\xbd\xb5=\x15\xbdU**\xbd:!E>\xff\xea\xf0\xbd\xc9O\xad\xbb<cJ<\x08\x07\xc7=`#\x19=\x94ZK=z)N=\xb4\xdb\xab<\xe4\x9bX=\xd4\x15\xbf=\xba\x04\x92\xbb\xdcd\xb2\xbb\xa9&T=?\xd3\xde=\x91\x8f\x18\xbe\x16G\x8b>\x19\xe0\xc9\xbc[\xcal\xbe\xa0\xc9V>\xbf\xc0\x07\xbd\x82WK>T\xb9i>m\x07\x17\xbe\x0cK\xd8\xbc\xb8\x95\xfe\xbcF\xfb\x1b\xbeh\x9aG>\xc9\xfbr>\xfc\t\xa8<\xae\xe0\x99>\x8e\xbe\x96\xbd\t\xb9\x9f=\x1f\x94\x87=\xec`\\\xbe\xf7\xb99>\xc0\x125\xbe\x9fa}\xbeMc\x12\xbeR:\x88\xbdH2\xff\xbd\xb7\t\xa7\xbe\xb9\xf0\x85>\xc8\x9f\x8f\xbd\xe2\x89\x9e\xbd\xac\x0f3<\xac\x052\xbe\xe1\x91\x97\xba2\xe0\xe0>\xc9t$=}\xdd\xb6\xbb\xc3B\x91\xbe3\xb4\x8b\xbe\xc0\x1b\x85\xbd\xef\xa0\xc0=V<\x84>\x93FH=!\x9c\x0f\xbens\x8e\xbd\xd0\xf75>~\xd6\xa7\xbc^h\x14>\xa5n\r=\x06\xefu>u\x8f0\xbex\x7f\x1b>o\x17\x9e9\x9ei\x0e>(\xa98>3\xe3\x91>\xbc)\x92>-\xab\x08>\xe6\x98\xad=\x13\xbc@=\xdc\xde\x11>"
-p1504
-tp1505
-bsV580259333184864256
-p1506
-g2
-(g3
-(I0
-tp1507
-g5
-tp1508
-Rp1509
-(I1
-(I200
-tp1510
-g12
-I00
-S'*\x82u=\x06\xd1c\xbd\x91\xae\x8a\xbe\x9b\xf8X>(\x11\xa6=\xaf\xc8\\=\xd9\x13t\xbeN\x04\xdd\xbd\x00\x96\xe0\xbcZ6A>\xf7\x0fT=\xcbj\x8f\xbe\x12\x1b\xfd=\'\x8b\xae=Z\xfa\x16\xbd\xc3dV>\xd7]2\xbd&>=\xbe\x0bYC=c\x88\xbe=\xb6\xdd\xb0\xbe9\xb9q\xbd\x17J\xb1=z{\x0f\xbe\x86\x90\xcc\xbd\xcb\x81\xaf\xbc=\x81:=6\x11\xc7\xbd\xd3\xb8\xa2\xbeAG\xd9\xbc3\x8aG\xbe;\xb4\r\xbeR\xf4V>w\xe3e\xbe\xb6\xb4\x17=\x0e\x8f\xdd>/>1\xbe\xaf,^=\xf2w7>\xa2\xc7\x95>k\xad\x88=\x9e\x17n>\xe33\x19>_,\xa0\xbe\xf5\x07\x1e\xbe\xd1\xe5k\xbb\xdb\x1b\x89>\xce\xa7\x1e>M\x01\x9a=Y\xda\x8f>\xe2y\xc9\xbcW\xc6\xab>HD0\xbe\x1a8\x05\xbe\t\x99\xc7\xbexW~>\xca\x05\xec\xbd\xdb\xf4\xfe\xbd\x88\xdb\xa0\xbe\xa8\\\x92\xbeP\xcau>M\x1a\xbd\xbcP\x06\xbf\xbd\x15\x06\xcd\xbe\xef\x9b;\xbeO&\x8b>\xb1\xcba\xbe\n\x93r\xbdl\xb7\x8c\xbe\x0e\xb7p\xber\x89\xd2\xben\x03\xb1\xbe+\x9a\x83\xbd\x16\xd0\x16\xbeana\xbeb\x1d\xa3>\x92\xdc\x95>\xaad\xdc=\xad\x10S>i\xc5\xb5=\xc6\x96\xde\xbd\n\xcf\x84;\x87\x9f\xc3>u\x88[\xbe\x17\x0b\xbd=*\x9b<>\xd6\xccN=k\x93\xbe\xbeP\x86\xbb>\xba\x071>\xafl\xbc\xbc\xbf:\xb4<\xe3\xab8=\x1a\x18\x83=\x99[\xbe=\xabN\x01\xbev\xf8\xef=\xb1B\xaf=]\x17S> `\xd4=Y\x80\x93;6l\x87>\xb5\xcc\t>)u\r>\xf5\x89/?K\xd7g\xbe2\x9d\xe2\xbd\x9aD\x9d\xbb\xe6\xb5\x91>:\xb2\x85\xbd`5\x1b=\xdbM\xaf>5\xd0\xee=\xf1"q>cW\r=\xa5\xc1\xee=\x01\xe0\x8e\xbe\xe9\xbeK>ZgF=b\x18\xd6=\xf7\xc2\xf3>)\xab\xbc\xbda\x8f\x90\xbd\x1f\xeeT\xbe\xb0\xbe\x8e\xbeNW7>\x11\x8a\x18\xbd\xdb\xef\xae\xbd*\xdb\x86=T\t\x8d>/d\xbf\xbd\xc8\x1a\x93\xbd\xa7N\x12\xbd\x8a8\x94=\xeaak\xbeY\xb7\xbb=.Y\x85<\xa8\xeb\x8e\xbd\x806n=\x91\xd7\xa1>%\xdd\x8f\xbe\x1b\xaf\xab>\xe1\xad\xa1\xbd\x90\xb7<\xbe\x91\xba\x8c>g\xf6\xf1<VW\x9f>*K\x9f>+\x90\xf8\xbd\xfe\x8c\xc7\xbd\x82j\x11\xbe\xf7/`\xbe\x92\xa4\xba>\xae\xfa\xf0>v\n\x89\xbd\xe9\xf7}>\x9e\x9f\xd4\xbd\x07\xbb\xf3<\xa9\x0bp=\x05\xf9\xc8\xbe\xaf\x88\xa4>WPJ\xbe\xc0\xbf\xb0\xbe\xf6\xf7H\xbe&:\x11\xbe\xa0\x80@\xbe\x06\xb7\x8a\xbe]\xda\xb8>\xef_$\xbeQpk\xbe\xe3\x9e\x12\xbe\xcd\r\xc3\xbe\x18\xe8\xc4\xbd\xc3\xf2\xcd>6\xc5\xa1\xbdO(\x02<\x10 \xf9\xbe \xb4\x92\xbe7\xc5\xc7\xbe\xe8\xbcY=\x06\x8d\x9d>\xfe\xc0\xac=\x05\xc4R\xbe\xc9\xc6@\xbe\x11\xe8\xa7>\xdf+\xaf=\xaa\x90\x04<\xb1`M;\xd6\xa5\xd7>\x90J\xb9\xbe\x9e\x12\xd4=\xbb\xd6f\xbe\xd9\x93`>F!\x82>o\x9d\x9f>\x8d\x8a\xd8>\xc9_\xdc>P\xf2\xec=#\x81b>\x9d@c:'
-p1511
-tp1512
-bsV578769229408768000
-p1513
-g2
-(g3
-(I0
-tp1514
-g5
-tp1515
-Rp1516
-(I1
-(I200
-tp1517
-g12
-I00
-S'^\x0e9>\xda\\d\xbdN\x07\x88\xbe\xf5\x1f+=\xae03>\x10J\x8c\xbd\x06\xbb\x98\xbd\n\xa6\x01\xbe\xe0\x85\x03\xbd\xf5\xfd\xd5=\xbapo=@m\xaf\xbb\xba\x94\xcb=6\x89 =R\xab\x9c\xbd\x9brW>\xfa\x88\x04\xbcf\xdfY\xbdxR\x90\xbd\x8b\xabw<\x13\xc9;\xbe\xab\xbdY\xbc\x8bS\xab=-oI\xbeVG|\xbd\x94\xa0\x93\xbd\x8a\x96\xeb=\x03t%\xbe{\xcc7\xbeH\xdb\x96=M\xbb\x0e\xbd\xaeN\xa8\xbd]\xe0\xce=S^8\xbeea#<\xaa<[>r\xa6\x07=\xfe\x02\x9d=-\x87S>\x89\xf4\xa7=\xcb\xfe\x9c\xbc\x8e\xc2!=f*\x10>\xc32<\xbe\xc4\x8f\xc9\xbd~\x9a\xac\xbb#\x05\x89>\xa0\x98\xbd<\xd9{"=v\xae\x80>\x1e\xef\x13=Ob\x8f>&\n\x04\xbe\xd3\x14P\xbc\x8a\xe7\x90\xbe[\xbb.>v\x81\xef\xba\xf0\x11\xd7\xbd$\xae\x8e\xbec\xc2\x86\xbe\xf9\x9a%>a\x835=\xe2J\xb3\xbc\x15\x0c;\xbeb\t\x18\xbd\x7fP0>\xdbb\x06\xbe\xd2\xa2\xa2=\xe8\rT\xbeN\xd2\xba\xbd\x9b\xf6\xb5\xbe}\xa3K\xbe\xda\xbb\x88\xbbh\xd2\xb3\xbd\xab\x86\xfa\xbdFs0>\x02\x894>43\xc7=\xcef\xa9=c9\xfb=\xc9\xc6\x98\xbd\xbaw\x12;\x1a\xfcM>r\xe3\x0e\xbe+B\xd1=:\x19\xb4=\x04\x10 >\x9a\x7fn\xbe4f\xa6>\x03W\xbc=j\xfa\xac\xbd3\xde\xcd=\xa0\x12\x1a\xbe\xb0\xc7G=B\xad<>m6:\xbc\xe2\xde\xd4=\xc6\x0b&>HR\xf6=\xa9\xf2\x14\xbc\x96\x0b\'=\xee\xe5b>&,\xad=\xc4\x89\xbd=\x1d\xd1\xa6>\x04T,\xbeF\xf4\xf1:\xf6\xde\x05=\xdb6\x83=\xd5R:\xbc\xdd\xa6\x19\xbd\xd3\x86/>\xba^\x9a=\xc5\x8c\xf2=\x88\xc7(;w\x85\x12=0N`\xbe\xaa\xc79>\xd8*\x02=\xbc\x8b\x81=J(\xb1>"+\x12=9\xb6\x06\xbd\x9e\x800\xbd\xce=6\xbd\xcc\t#>\xb0\x80\xb4\xbd\t\x04\x0b\xbbr\xb9\xe7;v\x93\xb4=\x0er\xb7<\xa1\x8f)=\x9b9&=\x858c<r\xfa\xca<\x16\x04\xa7=u\xbe\xf5\xbbX\x10/;\xb6\xf0\xde<bu\xaf=p\x8b\xf7\xbd&\x13f>#@P\xbc\xbeC@\xbe\xd6\xdd,>\xfa\xd7\xf7\xbcE\x08!>\xf5\xbdK>F\xda\xed\xbdb\xb8L\xbc\xbeN\xe9\xbc\x85\x00\xee\xbd\x8f\xd6\x1d>f\xb7G>\x11\xc5/<\xaa\\w>\xd8F\x81\xbdFBq=\xd8Gh=P"6\xbe\x86\x85\x0c>\xf7A\r\xbe\xfe!U\xbe=\xee\xf1\xbd\x82er\xbd\x8aO\xb8\xbd\xad#\x86\xbe\xdd\xbeX>\xd6\'}\xbd\xa05\x84\xbdJ\x93\x98:\xc1i\x1c\xbe\x7f\xee&\xbc\xae\xf5\xb1>\xd8\xe4\xfe<}!W;\xdd\xe7h\xbe\x16^V\xbe.\x1ba\xbd\x86\x12\xa3=\x1b\x19S>R\xf04=\x88T\xe4\xbd\xda\xf3`\xbd\x80\x8c#>\r\xb8V\xbcZ\x7f\xfb=\xb1\xb0\x03=I(K>\x03U\x0e\xbe\x08.\xe2=\xa6\xcf3;`\x13\xdd=\x87\xf1\x0e>\xd0\x9fb>\x83tn>\xf6\x84\xe2=\x08t|=>A;=\xbf[\xaf='
-p1518
-tp1519
-bsV591113446525112321
-p1520
-g2
-(g3
-(I0
-tp1521
-g5
-tp1522
-Rp1523
-(I1
-(I200
-tp1524
-g12
-I00
-S'C@\xeb=aAl\xbd\xeb6\xc0\xbeq\xa2\x80>\x93Y\x01>\x11S\xc1=\x7f\x9e\x96\xbe\x18\x9a\x0c\xbe\xe9\x04\x0f\xbdO\x10\x91>\xc9\xddp=\xf5/\xbe\xbe\x07\xe9)>e,\xcd=\x1f\xcbO\xbd\x17y\x97>W\xe4\x88\xbd;\x0c\x84\xbe\xfd\x1f"=\x98\xfe\xe1=\xf4\x1e\xe8\xbey\xf7W\xbd\xbb\x0b\xe8==\xd6\x17\xbe\x0f\xc8\xf4\xbd\xd3\x1d#\xbd\xd5O\x95=2\xbb\x0c\xbe\xe0\xb5\xda\xbe\xf8Fd\xbd\xb3$\x7f\xbe\xbf\xd9+\xbeKL\x86>S7\xa6\xbe\x1fz]=\x89\xd2\x0f?gI@\xbe\xaf\x98\xa2=[\tv>\xd7\xdd\xc0>IC\x96=0#\x94>\xe7-R>\xf0\xcf\xd0\xbe/\xc0H\xbe\x87\xc1Z\xba\x8b`\xc2>L7L>d\xc5\xba=\xbd^\xcd>\x83\xf7\x10\xbd4;\xef>%\x87y\xbe\x8f\x9b\x1c\xbe\x8ek\n\xbf\x15\x90\xa7>\x99R\x17\xbe\x91\xff%\xbe\x1b(\xed\xbeS\xd5\xcc\xbe\xe4F\xac>\xf9L\x14<\x10y\xd5\xbd\x93\xe6\x04\xbf\x08\x0ed\xbe\x18\xe8\xb2>;\x0b\xa5\xbeib\xcb\xbc8\xc7\xad\xbe\x92=\x9d\xbe=\xd2\t\xbf\xb4\x9d\xe7\xbe\xd7\xa4\xa3\xbd_!E\xbe\x19_\x9b\xbe\'\xc1\xcd>\xa4/\xbd>\xcdo$>=\xa1\x87>E\x14\xf7=\x0b\x9d\r\xbe\x89?\x9e\xbb%\r\x05?7\x9b\x96\xbeG\xcd\x07>!\xd9v>]G\xb1=\xef\x06\xf7\xbeD\x1a\xfc>\xb7Xj>;Kh\xbd\x87\x0c\x19=\xf17\xf7<}"\x85=A\xe8\x18>d0+\xbe\xa2\xe1\x0e> \x12\x08>\x8b\x8d\x8b>A\xd6\xe8=_\x8e4\xbb\xf1<\xb0>\t\xca7>1\xa7;>1\x17e?!\xb5\x9c\xbe\xedl\xf6\xbd\x1c\xb3d<\x0f7\xb6>\x8d\xa9\xc4\xbd\xc8t<;\xb1\xa0\xdd>\xd3\xc0\x1d>\xbf\xe1\x9f>_\x1bn=\xbc\x1a\x0b>k\xa4\xc1\xbe\x043\x88>7n\x86=\xcd\xf7\x00>_\x0e#?\xc1`\xf3\xbd\xe0T\xaf\xbds\xef\x82\xbe\xfc\xf3\xb2\xbe\x0c:{>TG`\xbd\xb55\xc7\xbd\x1cS\xb1=S\xc7\xad>)\n\xf2\xbdm\x11\xca\xbd\xc5o\\\xbd\x8d\x98\xb4=\xbe \x95\xbe\xb1P\xee=\xd9\x1d\x94<\xd8\x01\xb5\xbd\x84Q\x8f=\xb8;\xc8>/\xfb\xb2\xbe$\xdc\xe1>\xd7\xb1\x9d\xbd\xe9\x14}\xbe\xec\x0e\xc7>\xab\x0f\x8b=\xf7\xbc\xca>]\xb7\xd7>`\';\xbe\x07%\n\xbe\xcd\xbeC\xbe\xcf\xa9\x93\xbe\xc7\x84\xf1>\xaf-\x19?\rM\xd5\xbdp}\xb1>\xa4\x0c\x19\xbe\x81\x86@=Z\xa4\x99=\\j\t\xbf\xe4G\xca>T\xa8\x86\xbe\xffL\xeb\xbeL\xb8\x8d\xbe\xc0\xa1+\xbe\xfd`\x83\xbeS\xa7\xc2\xbe\xe4P\xf6>\xaf8K\xbe\x1a!\x95\xbe\x94p5\xbe\xa4\x14\xf9\xbeC\xf9\t\xbe\x99}\x12?\xdd\x80\xa5\xbd\xf6b\x9c<\x05\x81%\xbfK6\xd0\xbe\x0c\xda\xf5\xbeg\x01\x9d=,\xd6\xd1>\x84!\xf2=\xc3\xa1\x90\xbe\x11R\x84\xbe\xef\xf7\xe0>!\x92\xb8=x\xaf\x0b<\xc3!\x95;\xcaS\r?\xb3\x88\xeb\xbe\xf9\x13\x0f>\xa2\xfb\x96\xbeI<\x97>\r\xc0\xaa><*\xdd>3\x1d\x13?_\x8d\x08?L\x7f\x1e>\xae\xf3\x91>\xa7,\xe9<'
-p1525
-tp1526
-bsV581012133028081665
-p1527
-g2
-(g3
-(I0
-tp1528
-g5
-tp1529
-Rp1530
-(I1
-(I200
-tp1531
-g12
-I00
-S'\xa1\xd0\r=\xfa\x08\xa4\xbd\x86\x86\xea\xbe"\xbf\xab>\x90\x8e\x0c>\xa8\xa7\x91=*9\xb8\xbeo\xcf\xc4\xbd\x12%\xfe\xbc\xe2\x82\x8d>>d\xb1=\x83j\xe7\xbe\x8d$8>Z+\xcb=o\\\x84\xbd\x01\xd6\x8c>Rv\n\xbd\x07P\xa4\xbe\x90\r\xce=\xf8\x9fR>&\xb6\x13\xbff[\x97\xbd[\x99\xd0=\xfd\xa3q\xbe\xd2\xf1$\xbe\xe6\xff\x07\xbd\x0c\x1e\x87=\xcd\xdb%\xbe\xbb\xd3\xf1\xbe\xc5\xad\xa9\xbd\x8e[\x8b\xbe\xc3\x82H\xbe\xba\x19\xaa>]\xc1\xbb\xbe\xd0/\x88<\xdd\xc7+?9\xec\xaa\xbe\xc7\xd9\xc3=\xbbDn>V\xe9\xf7>\x07j\x07>\xba\x0e\xf7>\xa3\xees>s\x96\x00\xbfzKy\xbe"\x18\xc2<\xadH\xc5>s7U>K=\xd2=^\x92\xcb>*\x98\xcc\xbc\xa9\x0e\x0f?\xdd\x1c\xaa\xbe\x1b\xdeH\xbe\xdb\xec\x14\xbf*\xba\xd2>"\xb05\xbe\x88\rr\xbe\xae\x9e\xd4\xbe\xa0s\xda\xbe\xc8A\xde>\xe8\xe9\xdc\xbd\xbe\x1bQ\xbe\x06O \xbf\xc3\x9f\x82\xbe=\xf4\xe8>Ju\xb1\xbe"\xcc\r\xbe2i\xff\xbe\xa5r\xba\xbe\xab\x97\x16\xbft\xb5\x03\xbf\xfac\xaf\xbdh\xe2k\xbe\xee\r\xd5\xbeG\xbc\x01?&\xf9\xfe>I>)>RD\x97>\xce\xb5\xcb=U\xa9I\xber\x90\xc7\xbc\xc8r\r?\x85\xda\x9d\xbe\x98\x91\xd4=:\xf1\x95>P\xbf.=\x86\xb7\x11\xbf\x10\x9a\x0e?\xa88\xa4>\xa0\r\xf7\xba\xc0\xc7\x90<%\xac\xb0=ct\xe8=m\xa4\xe1=\x90\x99O\xbe,N\xb5=\xb6\xff\xb5=\x89\x1b\xa1>X5H>\x1a\xc2\x87\xbc\xfb\xb1\xd5>\xed\xf45>])P>\x88\xca\x85?\x82\xea\xbc\xbe\xf6k#\xbe\ty\x01\xbdP\xf8\xe4>\x96\xe3\x02\xbe*$\x9a=\xd2\x92\x05?Z\xbd\x0c>\xa2\x14\xc1>\xedV\x95=\xae\\)>\x88\xc3\xe4\xbeo\xa2\x97>>TC=@D\x15>\xd9\x9a9?\xe2\xe9l\xbe\x19\xac\x16\xbec5\x9a\xbe\xa2/\xde\xbe\xba\xf6\x92>\xe04w\xbd\xf2\xc1\xfb\xbd\xe4\x11\x96=\xf6y\xc5>/\xae\x15\xbe\xc1O&\xbe\x91z\xaf\xbd\r\x1b\xcd=\xd3\\\xcd\xbe\x04\x11\x1b>\x8e\x1fA=\x06f\x9e\xbd\xfb\x92\x06>`\xe0\x02?c&\xc7\xbea\x8c\x02?z\xdd\x1c\xbe\x9a\xedv\xbe\xd3\x86\xe3>\xe9\x1b\x80=\\?\x01?h\x9e\xdf>\xfe\xfcH\xbe\x10^U\xbe\x00WV\xbe\xcdY\xa5\xbe\xd5\xdf\x05?\x9e};?\xee\xd0\xe1\xbd\xda\x90\xd4>C\xb6\x1c\xbe\xce\xdc\xe9<px\xe6=\xc3\xed\x1e\xbf">\x14?\xa4\x8b\x82\xbe&\xb7\xf1\xbe;7\xb6\xbe\xe5or\xbe&\x12\xbd\xbe]D\xdd\xbe\xb0\x07\x10?f;\x80\xbe\xbd\xb1\xa2\xbe\xf3IX\xbe\xa1\xea\x12\xbf\xbc\x8a\x17\xbe\xfd\xc4,?3\xb3\xc1\xbd\xd2\xd0\x05=<T:\xbf\xbe\x14\xde\xbe\xde\x8b2\xbf\xc8\xaa\x93=\xf6K\xe6>\x06\xdb\x08>\xa2\r\x9b\xbe\x98\x9f\xa0\xbe\xc3 \xee>\xf8U\xaf=\xf6\xf5_\xbc\nv\x9b\xbcK\x9e&?i\x17\x0b\xbf\xf2k\xe5=4\x06\xcb\xbe|v\xc8>sV\xc4>\xb2_\xd5>8c*?\x8d\t0?:\x927>\xe6#\xa3>\xf7e\xb3<'
-p1532
-tp1533
-bsV581025667313106944
-p1534
-g2
-(g3
-(I0
-tp1535
-g5
-tp1536
-Rp1537
-(I1
-(I200
-tp1538
-g899
-I00
-S'\xd4\xfa\x1c?]\xbb\x9f\xbe[I\x98\xbf\x19\xa7r>P\xcbG?\x8a\x99\xe4\xbe\x18U\xdd\xbe\x1f\xc0\xe1\xbe\xfdx\xdf\xbd|\x08\x89>\x17\xaa\xc2>Q\x0e\xe0=\xa4\x14\xdd>\xea^9>\xc4?\xca\xbe\x03\xbfF?5\xe8\xd7=-\xa1*\xbe\x86\xbbO\xbe\xb0A\x81>T\x8d_\xbf\xc9\x08\xee\xbd\x925\xb2>\xaa\xcc\x93\xbf\xe9\xe9\xb9\xbea \x90\xbe\xba\xb4\xe7>\xdb2M\xbfp\x9b7\xbf\xcc\xfd\xf6>I+0=\xd9\xad\xc8\xbe\x8f\xb0\x03?*q\x1e\xbf\x0f\x9e\xc4\xbc2xa?\xd5 \x91\xbd\xb1\x19\x9d>\xdd\xedQ?,\x10\xd1>\xfc\x00\xac=Ke\xeb>q\x1b-?<\xabf\xbf\xd8\x8c\xb4\xbe0\x90\xc4=+\x93\x8e?\tk\xae\xbcY\xeb\x15>\xa1\xcbo?,p\x8a>\xf8\xe4\x9a?\xe7l(\xbfg\xd4\xa0\xbd\xe9\xf9\x91\xbf,\xf3\\?r\x0f,=\xd5\xbb\x06\xbf\x8f\xf0d\xbf\xd8\x96\x84\xbf\xf2\xc8H?\xf8\x03\xce\xbdV\xaa\xa9\xbeYhQ\xbf\xb3 X\xbe*bW?\xc0\xc0\xdb\xbe\xf7\xf4\xf0=(\xce\x99\xbf9\xf8\xad\xbe?y\xc1\xbf\x04LH\xbfc\xc2j=*\xba\xcd\xbe(w\x1a\xbf\xcarc?\t\x86e?\x00M\xb9>\x05pt>,\xd3\xd8>\x02^\xda\xbe\xf3\xd2e\xbd\xcf\xa2.?\xa6:\x02\xbf\xde\x82\xc5>\xe5\x10\xdc>\r"#?\xe0\xd0~\xbf\xa7m\xab?\xc4\xb6\x14?\x93yF\xbez\xe9\xe4>tW\'\xbfv\x1f\xd9>\x8e\xb01?{\xd0`\xbdg%}>f]\x1c?\x8fT\xf5>A\t\x18>\x95OE>\xd6\xda\x81??\xd1\x88>\xe7\x11\xa9>\x12\x13\xa9?\xef\x9f1\xbf$=\xfe<T\xb1\xd3\xbc\x03H\x8f>\x01\xd5\x9f\xbd\xd1I\xaa=e\x9fW?@\xb1Z>\x9b\x01\xf4>\x85\xcfV\xbd\xb8\xae\x11>\xb8\ri\xbfC\xbaE?\xee7)>5\xe1\xb0>a\x1a\xbb?\xad\x9aO\xbc\x9b\xb7g\xbe\x13r\'\xbe\xf7 \x16\xbed\xd44?\x84\xa4\xc7\xbe19\x18\xbc\x1e\x00\x9d\xbd\r\xab\x95>Y%\x1c>rJ\xd2=~^\xf9=-\n =\xd8\x93\xd0=\xe8\x8a\xc0>\xde\x00\xdd=\x95\xb1\x82=\xbeq\x9b>\x13\xd9\xf2>\\\x1d\xda\xbe\xf6\xcfs?"\xd6`\xbek\xa93\xbf\xec\xd1 ?\x07\x80y\xbe\xbd\x9aH?{T\x1e?#u\xff\xbe\x9a\x88\x1a\xbe\xd3/B\xbd[[\xfa\xbe~\x1c\x05?\x7fiV?f\xc6\x11>\xb4\xc6}?[v\r\xbe\xdbw7>.\x08\x88>:\xa7(\xbf\x19\x15o?\xf8\xbb\xe9\xbe\xa5\x88&\xbfTZ\xd7\xbe0\xb0\xaf\xbe;\x04\xfa\xbe\xaf^\x87\xbf:um?\xd2\xdc\xb1\xbe\x8exq\xbe\xe0\xffJ=\x02Y\x08\xbf\x1bz\xb7=\xc0\x0c\xc5?\x05=\x17>\x80\xe19\xbd\xe6CU\xbfH5A\xbf\nu\x02\xbf\xaa\xbc\xad>\xb8\xa4M??\r\'>\x16\x0b\xc8\xbe\xfd\x87\x85\xbe\xc9\x98\xe9>E\xbb\x05\xbeX\xfe\x0c?\xe8\x18\xb8=-\x8aN?`t\x17\xbf\xb4\x8b\xbb>\xf2\x92*\xbd\x82;\x06?=\xc9\x11?\xdb\xee/?\x1e\x8fw?w\x97\x17?\xd0\xc5\x95>\x97\xf7\xb4=\xebb\xff>'
-p1539
-tp1540
-bsV580331829410009088
-p1541
-g2
-(g3
-(I0
-tp1542
-g5
-tp1543
-Rp1544
-(I1
-(I200
-tp1545
-g12
-I00
-S'\xea\xf8Q>\xdf\x92+\xbd\rv\xc1\xbe\xc1)R>\xad\xa0R>\xf5\xf3\xc8<\x19H^\xbe\x08\x9bX\xbe\x98rk\xbd\x12\xe2k>\xb5\xbf{=\xdc\xf4\x83\xbe\x0e\xa8\x18>V9\xef=@\x1ao\xbd\xc8\x00\xbb>H\xc5\x83\xbdm\xa6A\xbeEf\n\xbd\xae\xea\x14=?5\xb8\xbe\x98\xa0]\xbdz\xa9\t>m\x17,\xbe\x99o\xcc\xbd9oo\xbd\xdd*\xd3=\x92\x04-\xbe\x8e\xee\xb2\xbe\x8f$\x9f\xba\x99\xb1{\xbe\xa9i(\xbeJyJ>\x14w\xa5\xbe\xb3\xfb\x80=\x01\xc7\xf6>y\xf3\x89\xbd\xe6 \x08>:\xef\x92>\x90\x1c\x87>\xa3$\x19\xbc\xd0^\x11>\x95\xbcT>G\xf6\xa8\xbe\x167X\xbeVv\xe5\xbc\xce|\xc5>\xd1>+>\x19$\xd8=Q{\xd5>\xb3\xa6E\xbb2\x16\xe2>\xc3\x84<\xbe\xa4C\xb9\xbd\xc4N\x04\xbf\xdf\x7f\x84>\x15\r\xfe\xbd\x1as7\xbe\xce\xf7\xf7\xbe\xb1\xcf\xd5\xbeu\x8fx>v\x90\x88=\x13\xb2\x05\xbdY\x8c\xe6\xbe\x0f\x87\x08\xbemX\x91>\xd9\xbb\x85\xbe\xa4gC=Jf\x8b\xbex\\\x8e\xbe\xfd\'\x12\xbf\xe4\x02\xd8\xbe?\xc2\xa9\xbd]8\x10\xbe8\rr\xbe\xdf\xa2\xab>\x037\xa4>\xd1\x17&>v`z>\x80\xa88>\x0e\x8d\xcd\xbd\xfa\xf2\xfd<@\x87\xdf>l@\x8d\xbe\xeb{\x15>c\xb3N>w\xfa%>\x18n\xe4\xbe1n\x0b?\xf1v\x06>\x13\xf5\xe0\xbd(\x89\xc9=\xc8\xf7\x9c\xbd\xebv\xaf<\xe4\xecU>\xe4\x8e\xc7\xbd\x8f\xebR>\x03\x94B>\xa4L\x80>\xe1\xb2\xe7<\xb0r =\xf3\x8f\xa6>\xdf1+>\xed\xe1X>\x88\xb6L?\x9d\x98\x96\xbe\x93\xbc\xbe\xbdRGj=|g\x8c>\x18\xb7\n\xbd\xa1\xbc@\xbd\x16\xb7\xc0>\xbf\xb5E>"\xc9\x84>\x96\x97\xd0<\xda\x9a\xf4=\xf2\x97\xc4\xbeW\x83\x8e>\xbd\xd7~=\xdd`\xe5=]S!?B\x0e\x0e\xbd\xf2;|\xbd|\xe3<\xbe\xac\xfc\x84\xbe\x0f\xd1i>\xb2\x0b\xde\xbd\xf3\xb9Z\xbd\xfa\x03\xb3=V\xfd\x9b>\x04Z\x95\xbd\x7fn\xf1;\xf2\xdb\x0e=1D\x9c=\xd4C$\xbe\xf31\xd5=\xd68/\xbc\xcd\x19e\xbd\xcf6\xb8<\x01\xa8\x84>\xbf\xe4\xa7\xbe1\xdd\xd8>\xca?\x06\xbd\xc0\xfc\x95\xbe\xc0v\xb5>\xadQ\x04;\x8a\xdd\x95>\xa8\x84\xd6>r\xd85\xbe\xb1P1\xbdG\xf1\xc4\xbdc\xfae\xbeUo\xd2>\x93"\xf5>f\xc7L\xbdoX\xb8>Q\xcc\x1b\xbe\xcdC\xae=n\x8f\xdc=\xbf2\xe3\xbe\x88\xa3\x8a>\xa4n\x8b\xbe\xd2^\xed\xbe\x95Qo\xbe\x81]\xf8\xbdv-(\xbe\x03\xc3\xb7\xbe\xe8\xf9\xd7>\t\xa5\r\xbeg\xf2v\xbeg\x85\xf2\xbd\x1f\x15\xdb\xbe\xf1\x88\xed\xbd\xda\x8d\x00?\xdd\xe6j\xbd[\xc6\x19=\x03\xdd\x0c\xbf\x13\x14\xc3\xbe\x7f\xbb{\xbe\x00:\xd5=Z\xdd\xcb>\x13\xa4\xa6=/}u\xbe\xc7\x18\x10\xbe\xd57\xde>6l\xa6=\xfap\xca=\xa3\x06\xf1<S\xd3\xec>o\x08\xcc\xbe!\x9dO>\x92?$\xbe\x93\x88_>k\xc1\x9e>\xff\xe3\xe2>r\xe7\xef>\xf9\xdd\xc3>\xca\xb2\x07>m\x15d>\xc1\x0f\x86<'
-p1546
-tp1547
-bsV577653681824346112
-p1548
-g2
-(g3
-(I0
-tp1549
-g5
-tp1550
-Rp1551
-(I1
-(I200
-tp1552
-g12
-I00
-S'P\xe6/>\xc0|\x06\xbd\xc0*\x8a\xbe\x90\xae\xb4=\n\x82\x13>\xf7\x8e\x06<\x96Z\x01\xbe\x13\xcd\x0b\xbe\xe8."\xbd\x9ec+>\xd0\xa9C=\xab\xd3\xfb\xbd\x87\x88\xf7=\xebk\x88=K\x06\x81\xbd\xb0\xbcl>c\xd1,\xbd?)\xe4\xbd^\xe9@\xbd\xf9\xea\xbf<@\x12r\xbee\x06\xb2\xbc:\xe6\xc0=)\x14\t\xbe\xa9\x15j\xbd\xab\xc3q\xbdf\xba\xba=;\t\r\xbe\xea\xbaw\xbe\x9e\x82\xe4<\'|\xda\xbd\xcfl\xcc\xbd\xd6e\x0f>\xb8\x04[\xbe\xdat\x15=f\xa1\x97>\xa2\x1dv\xbcFX\xa2=m4S>\x8e\xa3 >\x93m\xbf;x\xa8\xa7=)|\x19>!\xa4p\xbe\xa7\xaf\xda\xbd\xfd(\xc2\xbb\x9b\xfa\x91>\xda\x10\x9f=\t\x85A=Cs\x97>/W\x8c\xbbr\xed\x9e>\xb3\xce\x0b\xbeO\xc3,\xbd=\xe6\xb3\xbe]\xf3@>e\xe0P\xbd\x99\xb1\xc5\xbd\xfdS\xb3\xbeI\x12\x98\xbe\xd3 D>\x18^[=\xbd\x91\xf1\xbcO^\x88\xbe\xff\xf8\xbb\xbd\x9a\xc1I>\xf3@C\xbe\n\x95\x84=\xa9\x06F\xbef\x84\x16\xbe\xddf\xc7\xbe\xa5\xdd\x85\xbeB\xa5\xe9\xbc\x00\x8a\xdd\xbdz\x16\x1c\xbe\x99\xc7W>\xc6\xcfG>@\xf1\xe4=\xbd>\x0c>\xf7\x0f\xf3=\xdf`\xa0\xbdn\x8d\xc9;\xde\x1e\x9a>;8=\xbe\xe7^\xfd=\xda+\x06>\x11\xa5\x14>\x1b\x18\x95\xbe\x16\xfe\xb1>\xa0\xa3\xd8=(\xd4\xb8\xbd5\x11\x87=\x01\x14\xca\xbd\x91\x90"=\xcb\x003>@\xc2C\xbd\xd3\xdc\xf9=eM >\xaag\x19>Z\xee\xd7;\xdaR\xf5<\x95Ip>J\xf8\xe8=\x87\xdd\xe7=\xc7\xce\xf2>\xeeS>\xbe\xe8s\xf2\xbc\xe3a\r=\x895\x0e>\xdf\xa4\xfe\xbcu\xc7"\xbdJ\xc3u>\xf8\x89\xdf=\xd8t&>awV<(\xe2V=\xdbgx\xbe\xa9\x93N>r\xca:=\xf0\x89\xa5=e\t\xd1>\x8b\xd6\x83:\x0c-\x0e\xbd\x10\xb1\xcd\xbdg\xcf\x06\xbe\'\x99)>\n1\x8b\xbd\xd2m\xc1\xbc\xb7:1=\xb6I\x1f>\x12V\xb5\xbc\x85|P;\xce\x94\xfa;\xa2\xd4#=HKn\xbd\xcfA\x9e=A]\x16\xbcK\xd7\x02\xbdU\xea\xc0<I\xa6(>\xbb\x08>\xbe\xa7\xc8\x89>\x08\xc8\xad\xbc\x12*G\xbe\x1dUl>\xb6\x8bV<\xc3\xfcN>\xec\xe6\x83>3\xac\xf9\xbd\xf2\x1f0\xbd\xb57\xa1\xbd\xdd\x03(\xbe7o\x81>r\x1e\x96>E\x8a\xe4\xbc\xb8\xb3z>\xd9\x07\xb7\xbd+\xf3d=\x13\xd2H=\xbf\x9c\x8e\xbe\r\xa5.>/\x1e<\xbe!\x10\x93\xbe\x92\xd8\x1e\xbe\x8a\xef\x90\xbdh`\xf7\xbd\x05\x8a\x8b\xbe\x9f\xc5\x8b>\x8ed\xaf\xbd9\xcd\x0c\xbe6\xc8j\xbd\x1e\xddw\xbe\x9eL^\xbdX\x92\xc3>u;5\xbc\x95\x0b\xda:\xf5\xd1\xb5\xbeg\x9e\x8a\xbe%0\x17\xbe\xc7{\x8d=\xff\x19\x89>\xd9\rr=\xd5\xee&\xbe\x92\xfe\xe3\xbdp\xd5u>\xf9\n\n=\xe72\x94=\x1f\x91\xb5<\'\x84\x93>\xdd\x11l\xbe\x12\xfc\x03>H\xc5\xa6\xbd\xd0c\x1a>c\xa7N>\xc1\xf7\x99>\x7f\xfb\xa5>i\xb0V>O\x05\xaf=\x82\xaf\xf7=\xfa4\x97='
-p1553
-tp1554
-bsV578841952520519680
-p1555
-g2
-(g3
-(I0
-tp1556
-g5
-tp1557
-Rp1558
-(I1
-(I200
-tp1559
-g12
-I00
-S'[\x01M>VNU\xbe\x01\xbc\x8d\xbe\xc2\'^\xbc\x003\x8e>\xa1\xd7\xd1\xbd\xac\x19\x17\xbdarZ\xbeYT\xe9\xbd\xef9\x1b>\xcc\xed\x10>\x8c\xed\xdc<f\x92U>\xb7w\xe1=\xcc\xef_\xbe\x9b\xa5\x9c>kmN<%\xd7d\xbc\xf3-\x18\xbeS\xea\x03\xbcI\xe14\xbe~qR<\xb2f4<m\xdc\x93\xbeD\x16Q\xbd\xf4\xaa\x03\xbe7\xf1\x0f>\xeb4\x84\xbet\xed\x9b\xbe\xe0\x1d\x94=_\xf7&\xbe<6q\xbd\x11\xcb\x1d>\xbc\xd8\x83\xbe\xfc\xde\x9e\xbc\x80Rw>qd\xa6=\x85\xdfI=/k^>\xaf\xc8\x9e=5m\x17\xbc\xdf\xf98\xbd\xae\x91\xf1=\xf5}j\xbe\xd0\xf6\xc9\xbd\x044\xdf\xbcD\xd0\xb7>\xdc\xe3\x82;o\xeb\x96=\x96\xc7\x8b>a\xec\x9a=O\xd7\xbe>b^5\xbe\xe4\x97\x00\xbd$\xea\xb0\xbe~\x1ca>\xb8\xb1^\xbd\xc7\x033\xbeJ\xd1\xa4\xbec;\xbe\xbe\xc3\xaa@>\xe5),<\xcb\xe4/<\xb5\xa9*\xbep\xb7f\xbc\xf4\xa0a>\x84\x87,\xbe\x8c9^=Am\x84\xbe\x05\xd5\xfe\xbd\xfc\x94\xbf\xbe\xf8\xa0\x06\xbe\xd8>\xd6=\xea\x14\n\xbe\xc4\x12\xd7\xbd\x15\xc7h>\xc2\x1b\x96>\x03\xef >\xe4U:\xbc\xa4\xac|>\r\xb6\xc9\xbd\x04W\xef<\x1f\xb6\x97>qx\x1a\xbez\xf7\x17>\xe3j\xa3=\x1c\xd6@>b\x7f\xb9\xbe\xdf\x06\xde>\xdc\x07\xda=\x0b\x9d"\xbeWe\x91=w\xcec\xbe.\x9a\xc5=\xcf,\xbf>a$\xc1\xbbY\xa1\xfd=\xf9Dl>\x947/>\x141\xb3<\x88b\x85=\xdcU\x96>N\xa5.>c\x0b\xc8=$w\xa0>lJK\xbe\xf9!\x98=\x85\xc3\x17\xbdD\xd6\xec=2c+=1-\xe3<&}]>\xa6\x1bC\xbd\x14T\xe2<V\xad\x83\xbd\x06\x9a4>\xac\xfb\xa1\xbe\x1be\x8b>$Os=\x17\xd8W=\xf0\x9b\xd2>r\xd5\xd8=\xc4\xe3\x8b=\x94\x87\xb3\xbd\x89\x81)\xbdZ\x8f\x80>\xfc\x01\x15\xbe\xb3\x1b\xbb\xbd\x9c\x0e\xab<\x8ds\xa5=\xbb\xd1\x87\xbd\xa7_\x92=\xbb~%>\xdb\x9fP\xbc\x0e\xc6\x17>\xd0\n6>\xdfU\xa4\xbd\x81i\xcc<\xe4Z\xc6=\xf7\xf8_=%N\n\xbe\x91W\x98>\xafp\xae\xbdjY/\xbe\x0f\x00\x1f>\x89Q\xa3\xbdF\xd9,>=\xe2\x83>>\xd97\xbe\x92\xce\x86=\'z\xee\xbd\xb1\xbe.\xbe\x1827>fY[>\xc7F\x80=\'/\x9c>\xeb\xa7\xad\xbd\x98\xd4\x15>\xfcXa=T\xa6%\xbe\x17\xc3\x18>*\xd4\x0b\xbe\xd9\x0c\x96\xbe\xeb\xb7\xeb\xbdg\xb8\xda\xbd\xf0~o\xbd\xbc\x8a\xdf\xbe%3~>T\x95Y\xbeW^{\xbd\x82\x11\xb6<\xb6\xb8W\xbe\xfb\x8c\xe5=\xe08\xea>R\xc3\xec=]\x82\x12\xbd\xfc@\x7f\xbe3zC\xbe9DM\xbc\x1f\xe1\x04>\xffn\xbb>";\x16>\x85\xa2\x0c\xbe\xebua=$\xe9m>\xfc\x82\xef\xbc\xcbZ4>\x95:\xc5=S=\x0c>\xfe$\x18\xbd\xb0b\\>\x8a\xa54=\xa0\xd8\x83=\x98k\xbe=\x85\x06\x8f>\xd7\xdc?>t\xc2F>"=\xdd=\xeeY\xd2=\xb0\xf5\x1d>'
-p1560
-tp1561
-bsV580999869394857984
-p1562
-g2
-(g3
-(I0
-tp1563
-g5
-tp1564
-Rp1565
-(I1
-(I200
-tp1566
-g899
-I00
-S'\xd4\xfa\x1c?]\xbb\x9f\xbe[I\x98\xbf\x19\xa7r>P\xcbG?\x8a\x99\xe4\xbe\x18U\xdd\xbe\x1f\xc0\xe1\xbe\xfdx\xdf\xbd|\x08\x89>\x17\xaa\xc2>Q\x0e\xe0=\xa4\x14\xdd>\xea^9>\xc4?\xca\xbe\x03\xbfF?5\xe8\xd7=-\xa1*\xbe\x86\xbbO\xbe\xb0A\x81>T\x8d_\xbf\xc9\x08\xee\xbd\x925\xb2>\xaa\xcc\x93\xbf\xe9\xe9\xb9\xbea \x90\xbe\xba\xb4\xe7>\xdb2M\xbfp\x9b7\xbf\xcc\xfd\xf6>I+0=\xd9\xad\xc8\xbe\x8f\xb0\x03?*q\x1e\xbf\x0f\x9e\xc4\xbc2xa?\xd5 \x91\xbd\xb1\x19\x9d>\xdd\xedQ?,\x10\xd1>\xfc\x00\xac=Ke\xeb>q\x1b-?<\xabf\xbf\xd8\x8c\xb4\xbe0\x90\xc4=+\x93\x8e?\tk\xae\xbcY\xeb\x15>\xa1\xcbo?,p\x8a>\xf8\xe4\x9a?\xe7l(\xbfg\xd4\xa0\xbd\xe9\xf9\x91\xbf,\xf3\\?r\x0f,=\xd5\xbb\x06\xbf\x8f\xf0d\xbf\xd8\x96\x84\xbf\xf2\xc8H?\xf8\x03\xce\xbdV\xaa\xa9\xbeYhQ\xbf\xb3 X\xbe*bW?\xc0\xc0\xdb\xbe\xf7\xf4\xf0=(\xce\x99\xbf9\xf8\xad\xbe?y\xc1\xbf\x04LH\xbfc\xc2j=*\xba\xcd\xbe(w\x1a\xbf\xcarc?\t\x86e?\x00M\xb9>\x05pt>,\xd3\xd8>\x02^\xda\xbe\xf3\xd2e\xbd\xcf\xa2.?\xa6:\x02\xbf\xde\x82\xc5>\xe5\x10\xdc>\r"#?\xe0\xd0~\xbf\xa7m\xab?\xc4\xb6\x14?\x93yF\xbez\xe9\xe4>tW\'\xbfv\x1f\xd9>\x8e\xb01?{\xd0`\xbdg%}>f]\x1c?\x8fT\xf5>A\t\x18>\x95OE>\xd6\xda\x81??\xd1\x88>\xe7\x11\xa9>\x12\x13\xa9?\xef\x9f1\xbf$=\xfe<T\xb1\xd3\xbc\x03H\x8f>\x01\xd5\x9f\xbd\xd1I\xaa=e\x9fW?@\xb1Z>\x9b\x01\xf4>\x85\xcfV\xbd\xb8\xae\x11>\xb8\ri\xbfC\xbaE?\xee7)>5\xe1\xb0>a\x1a\xbb?\xad\x9aO\xbc\x9b\xb7g\xbe\x13r\'\xbe\xf7 \x16\xbed\xd44?\x84\xa4\xc7\xbe19\x18\xbc\x1e\x00\x9d\xbd\r\xab\x95>Y%\x1c>rJ\xd2=~^\xf9=-\n =\xd8\x93\xd0=\xe8\x8a\xc0>\xde\x00\xdd=\x95\xb1\x82=\xbeq\x9b>\x13\xd9\xf2>\\\x1d\xda\xbe\xf6\xcfs?"\xd6`\xbek\xa93\xbf\xec\xd1 ?\x07\x80y\xbe\xbd\x9aH?{T\x1e?#u\xff\xbe\x9a\x88\x1a\xbe\xd3/B\xbd[[\xfa\xbe~\x1c\x05?\x7fiV?f\xc6\x11>\xb4\xc6}?[v\r\xbe\xdbw7>.\x08\x88>:\xa7(\xbf\x19\x15o?\xf8\xbb\xe9\xbe\xa5\x88&\xbfTZ\xd7\xbe0\xb0\xaf\xbe;\x04\xfa\xbe\xaf^\x87\xbf:um?\xd2\xdc\xb1\xbe\x8exq\xbe\xe0\xffJ=\x02Y\x08\xbf\x1bz\xb7=\xc0\x0c\xc5?\x05=\x17>\x80\xe19\xbd\xe6CU\xbfH5A\xbf\nu\x02\xbf\xaa\xbc\xad>\xb8\xa4M??\r\'>\x16\x0b\xc8\xbe\xfd\x87\x85\xbe\xc9\x98\xe9>E\xbb\x05\xbeX\xfe\x0c?\xe8\x18\xb8=-\x8aN?`t\x17\xbf\xb4\x8b\xbb>\xf2\x92*\xbd\x82;\x06?=\xc9\x11?\xdb\xee/?\x1e\x8fw?w\x97\x17?\xd0\xc5\x95>\x97\xf7\xb4=\xebb\xff>'
-p1567
-tp1568
-bsV580349297469734912
-p1569
-g2
-(g3
-(I0
-tp1570
-g5
-tp1571
-Rp1572
-(I1
-(I200
-tp1573
-g12
-I00
-S'\xcc\xf7\xd1>\xc48V\xbe\x01\x02L\xbf1\xe5 >!\x85\x05?\xbf\xc0\x98\xbe\x15\x81\x93\xbe\x8f\xf8\x96\xbeS1\x97\xbdG\xa77>y\x97\x81>5h\x95=\x15\xde\x94>h\x0f\xf8=\x89\xd1\x87\xbe\xd5)\x05?\x04\xb8\x8e=AX\xe4\xbd\t\xbf\x0b\xbe\xa5n,>5\xbf\x15\xbf\nb\x9d\xbd\xf3\x8dn>q\xf4E\xbf\xb1\x03x\xbe)8A\xbe\xad\x84\x9b>\x04\x9b\t\xbf\x95H\xf6\xbe\x87Z\xa5>\xf4\xcf\xed<3\xc1\x85\xbec)\xb0>\xe1\x89\xd4\xbe\xc5\x1c\x83\xbc\x92\xd6\x16?;\x8c@\xbd\r&S>\xe5\xb8\x0c?w\x11\x8c>;\xe6f=\xc4W\x9d>),\xe8>\x91Y\x1a\xbfxFp\xbe\x07d\x83=\xe4\xeb>?\'\xcdz\xbc\x18*\xc9=\xe7\xc2 ?\xeb\xc58>t\x9fO?\xac(\xe1\xbedBW\xbds\x9fC\xbf\xf9\xd5\x13?k\xc0\xeb<\x17\x1d\xb4\xbe\x13\x8a\x19\xbfm\x921\xbfT\xcf\x06?\xe2.\x8a\xbd\x1b\xbdb\xbeXw\x0c\xbf-\xe8\x10\xbef\xfa\x0f?\xd5\xa6\x93\xbe-<\xa3=\xdc\xf0M\xbf\xdcih\xbe2\x8b\x81\xbfc%\x06\xbf\x11\xea\x1f=\xc3\x14\x8a\xbeE\x86\xce\xbe\x05\x0c\x18?{\xc9\x19?\x98\x86x>\x16\xe6">\x08\xf8\x90>\x1a\x02\x92\xbe0\xaa\x19\xbdE)\xea>\xa5*\xae\xbea+\x84>\xbd|\x93>\xd0H\xda>Ks*\xbf\xf4`e? G\xc7>s\xe6\x05\xbe\x98J\x99>\xf5\xe1\xdf\xbe\xae\xf7\x90>\xa7\x83\xee>\x89\xa8\x10\xbd\x9b))>h\x9c\xd1>\xedS\xa4>\x97\xd7\xc9=\xf3\x00\x05>\x1c\xcf-?\x0b\xbc6>\xff\xcca>A+b?\xfd~\xed\xbe\xf0\xbd\xb2<\x91`\x87\xbc$\xb0?>mTS\xbd\xbf\x1af=\xd3\x90\x10?\xa4\xf8\x11>\x8f\xc2\xa3>S\x14\x0f\xbd-=\xc3=T\x01\x1c\xbf\xdc\xa4\x04?1\xca\xe1=ofl>Anz?\xcb\xab\x0b\xbc\x98\xdc\x1a\xbe\xd4\x03\xe0\xbd\x17\x0e\xc8\xbd\x01w\xf2>\xafz\x85\xbe\x8f\x17\xb4\xbb\xb7\x7fO\xbd\x17\x1aI>?\xcd\xd0=%\x83\x8c=\tq\xa5=|\x1f\xd8<n\xa7\x8c=\x8b\xf3\x80>\xe94\x92=550=\x91\xfcP>f=\xa2>I)\x92\xbe\xd7Q#?j\x0e\x16\xbee\xf0\xf0\xbe\r\x14\xd8>\xb7B&\xbe\xd3\x88\x06?\xf8!\xd4>P\xda\xaa\xbe\xd4\xab\xce\xbdj\xe3\x02\xbd\x1c\x1c\xa8\xbe\xa4\x99\xb2>\xeen\x0f?\xef\xf1\xc2=\xaf\xfc)?\xd3\xce\xbe\xbd|7\xf6=d\xf24>\x9f\xa8\xe1\xbeH\xc6\x1f?\x11q\x9c\xbeS\xb0\xdf\xbeIT\x90\xbe\x15Jj\xbe#\xe0\xa7\xbe<m5\xbf\x17\xb2\x1e?t<m\xbe\xf3\\!\xbeK\x81\t=k\xa1\xb6\xbe\xf5\xb0r=z\xf0\x83?\xb0\x1c\xca=8\xe0\x00\xbd\xd9\xd1\x0e\xbf\xcc\x99\x01\xbf\xabT\xae\xbe\xb0]g>\xe9\x9b\t?\x95\x15\xe0=\x0f$\x86\xbe\xe3\xce3\xbe\xb5\xe4\x9b>d\x81\xb1\xbd\xff/\xbd>\x14=y=Q2\n?\xc4y\xca\xbe\x8d\xb7z>\x18\xcd\xe5\xbc\xd0\x8b\xb3>C\xa8\xc3>s>\xec>\xd6\xe8%?\x871\xca>\xf9/H>\xb3\xe4p=gi\xab>'
-p1574
-tp1575
-bsV590866940219957249
-p1576
-g2
-(g3
-(I0
-tp1577
-g5
-tp1578
-Rp1579
-(I1
-(I200
-tp1580
-g12
-I00
-S'\xfd\x05\xa3=l":\xbdp\xba\xa4\xbe\xb0Q\x7f>\xc9\x07\xf3=e#t=S\x01y\xbeF\x10\x13\xbe\r\x8c\x18\xbcv\xe1n>^/==\x0en\xa6\xbe\x83\x7f\xe3=@\xad\xa7=\x0f\x19}\xbbT\xd1\x94>\xff$g\xbdBDI\xbe\xc7\xac\x05=\xdfJi=$\xad\xbe\xbe\xd7\xa5\x94\xbd\xcf\x88\t>\xbd\xfc\xd8\xbd\x93l\xca\xbd5G\x03\xbd\xe9t\x89=\xe0\xbf\xda\xbd\x9e\xc1\xa6\xbem\xf3\x99\xbdJ\xbe\x7f\xbe\x81<1\xbe\xb7\x1fI>\x15\xc5\xa0\xbe\xdas\x1c=\x1aJ\x00?\xd2\xa9%\xbe\xbam\xb5=\x8d\x14Z>\x80\xbc\x9a>\xe7\xcd\r<\xfb\xb6b>\xb2\xe2\r>\x8b\xf4\x9b\xbe\xca\x93b\xbe\xbb\xeb\xa4\xbc&,\xa5>j\x03D>~X\xea=\'M\xac>\xfc\x18\x08\xbd#\xed\xc8>U\xc56\xbe\xae\x90\xf5\xbd\x96!\xdf\xbe\xf5}\x87>){\x12\xbeU\x00<\xbet\xcc\xbb\xbe*\x01\xb4\xbe\xb3io>:B\xd9<R\xde\x98\xbdOy\xea\xbe\xd6\x91%\xbe\xa7\x8b\x92>\xe2%\x8a\xbe\xaa\x19"\xbdV\xf9\x89\xbe\xcdt\x96\xbe\'\x84\xf1\xbe\xee\xd9\xd5\xbe\xd7P\xbc\xbdq\xf0\x1d\xbe\xa0Q\x81\xbe$f\xa1>\x0b\xcc\xa0>\xc7Z\x01>\xbf\xa2\x86>Rd\xe8=\xfc\xa1\xc7\xbd\x81\x0f^=\xfd\xfc\xdf>\xa7\xda\x80\xbe\xc2/\xda=\nO@>\x99R\x96=nR\xdf\xbe\x02>\xf7>;\x02\x15>\xba\xd8\xa7\xbdqL9=a;>=\xd1\xabO=\xd9\xb6\x12>\xfd\xfa(\xbe;\xe44>\x0e\xb9\xdf=\xee\x89\x90>\x9f\xe4\x91=\x04[\xb5\xbc\x1fg\x94>\x10\x81$>\x0blK>\xd2\xd8I?\x80\xde\x86\xbez\\\x0b\xbeY\xbf =\x13\xf0\xa5>\xfc\xd4\x98\xbdC*\xb0\xbb\xe3\xf7\xab>E\x87\x17>x\x12\x85>\xe6\x13j=\xc6\x85\xfa=\x02J\xac\xbe\xa5PR>\xda\r\x12=\xbdz\x8e=\xf1\xc9\x14?\xfa\x1a\xa8\xbd\xc2!\x9b\xbd\x86\xc1p\xbe\x84\x19\xa6\xbe\x9c\xcdY>\x06\xce\xaf\xbc\xb5s\x9a\xbd7j\xc8=o\x9c\xa6>.^\xb3\xbd7n_\xbd\x85"\xa5\xbc!\x11\x8c=\x8b\x96\x88\xbec*\x0e>\'C\x0b<\x8f\xfci\xbd\xc4\xec};{\x9c\xa7>!\xe1\xad\xbe\xd3\x96\xcc>\xcb\xc1]\xbdi\xb6n\xbeU\xa9\xa5>_\xc1\xa6<\x9d\xb3\x9f>A\xf8\xc6>\x11+\x1a\xbe\xbd\xa7\x97\xbd\xac\xec\x17\xbe#E\\\xbe$\xbd\xcf>\xd7E\x02?\x975\xb7\xbdQ\x1b\xa7>\xad\x00\x1f\xbe\x89M\x0e=\x8fj\xd0=\x8b?\xec\xbe\x99H\x9a>\x85\xa2c\xbeRa\xe4\xbe\xbc\xbbv\xbe\x15I\x1b\xbeC@+\xbeF\x8e\xa1\xbekC\xd7><%8\xbe\xe5G}\xbe\xf2g\x19\xbe-\xda\xe4\xbei\x1a\x1a\xbe\xe5\xb3\xe5>\x07\xbf\xa9\xbd\xc6\x82/=\x829\x0b\xbf\xb7\x03\xa5\xbe\xe9\xde\xb4\xbe\x9e\xff\xa5=\xaag\xc2>\xbea\xae= +n\xbe\xe1\xdd>\xbe\\\xf2\xd1>\xc2S\xd1=\xdf\x1a$=\x06xV<\xf5\xe8\xf1>\xfe\x00\xd4\xbe\x90[\x17>\xe4\x10`\xbe\x1dr\x7f>\r\xb0\x88>\xed\x1d\xc5>\x9c\xce\xea>\xca\x18\xe9>\x81J\xf7=?\xd1}>\xb6x:\xbd'
-p1581
-tp1582
-bsV580321740447977472
-p1583
-g2
-(g3
-(I0
-tp1584
-g5
-tp1585
-Rp1586
-(I1
-(I200
-tp1587
-g12
-I00
-S'\xa6qc>\xef\xb8/\xbd\xb5\xf0\xa1\xbe4\xf7\xb3=O\\J>bH\xca\xbc\xd1\xe0\xe9\xbd\xc4\xf66\xbeZ\xf1p\xbd\x91l/>\x7f\xd1n=~e\xce\xbd=\xf3\x0b>\xf7\x11\xb0=\xf2{\xb7\xbdD\x81\x8c>\x15\xb9(\xbd\x00)\xdf\xbdi\n\xa5\xbd\\\x16\xea;\x82nv\xbe\xd5\x82\xd5\xbc\x0b\x1c\xe4=2\t4\xbe\x00au\xbdp\x96\x98\xbd\xda\x1b\xed=\xef\xcf2\xbe\xde<\x80\xbe\xcd\xa2<=\x02\xcb\xfe\xbd&\xa8\xf4\xbd\x13L\x1e>\x1e\n\x82\xbea\xf4$=Yc\xa3>\xc9\xa4\xa2<\xcc\xf7\xdf=\xe6wz>W\xd9\x1d>\x1d\xcc=\xbcJ\xffQ=s65>\xd1\xf3y\xbe\\[\x04\xbew\xde[\xbc3\xf5\xa7>\x95\xed\x93=\xd1\xaac=\x915\xac>\xbf\x15\xb7;\x90!\xb6>\x13j\x13\xbe\xbf:\xee\xbc\xe4\x95\xc8\xbef\x93H>\xf1jV\xbd\x85\x13\xfb\xbd\xd5$\xcb\xbe\xc4\xda\xb3\xbe\xeb\x1bF>\xa6G\x83=5\x81\x99\xbc\xe9\xb3\x90\xbeW\xdb\x9d\xbd\xdb\xbf\\>\x17\xb2G\xbeO\r\xaf=y\xf8]\xbe\xf7t!\xbe\xf3;\xeb\xbe\x80q\x90\xbe\xaa\x1d\xe0\xbc\xea\xd8\xf3\xbd\x15\xac"\xbe\xa4\x8ee>\x02\xd0\\>E\xe2\x02>\xd3\xce\x19>\x03\n\x1c>\rX\xb2\xbd\x91\xcar<\x7fS\xa1>\x17\x8cO\xbe\xa1^\x14>;\xa9\x0c>\x10\xca>>\x03\n\xa9\xbeWA\xd8>\x12\xac\xc7=cn\xe8\xbdz\xf4\xbc=\xa3\x08\x16\xbe\x0c\xaa\x19=cFe>d\xb3\xe1\xbc\x8d\xe5\x1c>*}E>\x9aM&>M\xfe\x9a\xbc\xb7\xfe(=\xdf\xae\x8b>\xda\x18\x01>k\x15\n>\xbb\xea\x02?\xa6\xdb]\xbem\xe8\xb4\xbc\xa6\xf8:=\x86\xf6\x06>q\x14\x06\xbcz\xd5o\xbd\'\xa0\x84>|\x91\x03>\xcc\xe5+>\xa2k\xf6;\x88\x84\x81=\x89r\x91\xbe}\x04u>\xb7\x0fF=\xbf`\xa5=\x16v\xe9>\xc9\xf5\xec<\xcb\xc8\t\xbd\x01b\xb6\xbd\x83E\x00\xbeD\xbeF>\xf6\x7f\xcc\xbd5W\x87\xbc\xa4\x8aC=V\x93\'>\x01S\xee\xbb\xd3v\x0c=ON+=\x06b\x17=D\xe7\xc1\xbc\xec\xd0\xb4=\x1b\xce\xc5\xbc\xa6E\xa0\xbcy0\xa7<\xef\xb1\x1a>\x05-I\xbe\x04C\x9c>\xa61\xb8\xbc\x9d*n\xbeT\xa1\x82>\x89\xb9<\xbc\x0e\xb2J>4\x80\x99>\xd2\x1c\x05\xbe\xd9\xa0\xa7\xbcu\xa0`\xbdU\xbe.\xbe#\x04\x87>\x9a\xea\x94>\x0c\xba\x07\xbc.j\x93>w7\xd2\xbd\xccD\x9a=\xaa\x18\x8d=]\x1a\x91\xbe\xd66)>\xb7LW\xbe\xce\xd3\xa5\xbe5|0\xbenT\x92\xbd\xa2M\xef\xbd\x93\x1a\xa1\xbe\xe6\xf1\x99>\xd5\x88\xa1\xbd\xb4&\x0b\xbenTC\xbd[$\x85\xbe5\xd4U\xbd5\x8e\xda>J\x0c\x18;\x81\xad\x1c<M\x97\xbb\xbe\x7f\xca\x9a\xbe1\xf7\xd1\xbdt\xda\xba=gU\x9d>\x03\x17h=\xa0\x96*\xbe>I\xa5\xbd\xde\xf4\x8a>**\x03=\x03\xaa\xf4=\xe6\xa1\xf2<Di\x99>\x1f\xc1n\xbe\xeb\xb5+>\xb3\xbe>\xbd\x9e\x96\x1c>\x13qa>)\n\xae>\xae\xf0\xab>\xb4\x1bA>\xc27\xb5=\xb5\x1f\xe7=D\xa8\xb0='
-p1588
-tp1589
-bsV582886739124969472
-p1590
-g2
-(g3
-(I0
-tp1591
-g5
-tp1592
-Rp1593
-(I1
-(I200
-tp1594
-g12
-I00
-S'\xbe\xa2&>\xb6N\xc6\xbc]\x05o\xbe\xf1\xaf\x98=%?\x08>\xc7\xc7!<\x06t\xd5\xbd\xed\xa7\t\xbeq\xd1*\xbd\x86}\x1d>\xcb4\x04=G\xf4\xe6\xbd\xe8\x02\xd2==\x8bo=\x17\xafa\xbdbk]>U\x90(\xbdQ\x03\xcc\xbdC\xd3O\xbd\x97\x1b\x12<\xb1\x90M\xbe\xed_\x8b\xbc\xd2d\xa8=W\xeb\xdd\xbd\x01c<\xbdb\x04Q\xbdC\xd9\xae=\xc3\xba\xed\xbdv\xc2]\xbe\xeeB\xb1<y\xd4\xdc\xbdB\xf5\xb2\xbd\x02\xb2\xe9=\xe7\nJ\xbe\x1a\xd3\x1c=\xd6y\x86>^\xfa\xc0;EE\x94=\x92g@>\xa2\xc0\r>y\xca\xb8\xbbw\x9eB=\xa2\xb4\x08>z\xceH\xbe\x9b\x91\xd3\xbd\xd1\xb0I\xbc\xb1m\x7f>_Z\x9e=\xd8?4=j\x1e\x8a>\x1a\xf0\xec\xbb\xaeD\x8a>\xdf\xa1\xeb\xbd>\xb6\x1d\xbd6J\xa2\xbeM\xc5\x1d>\xa6,@\xbd;!\x9b\xbd>\x16\xa7\xbe\xdf\xe8\x88\xbe\x1e\xfe#>\x10\xab\x88=lY\x0e\xbcY p\xbe\x11\x83\x9d\xbd\xf6\x9c*>\xa70\'\xbe\xcb\xaf\x93=7F\x1c\xbe\x81v\x0b\xbeX\x19\xb1\xbe\nOr\xbeS@\n\xbd\xc2\xd8\xbd\xbd\xe9\x80\x00\xbe?\xfd6>V*+>F\x0c\xd3=\xb9O\x03> \x88\xeb=\xcf-u\xbd\xd5\x02\xed;\xebU\x87>\x95/)\xbeZ\x15\xde=\x1d\xfa\xe0=\xf3o\xfd=\xb6\x1e\x82\xbe7|\xa2>\x9dC\xa4=\xeb\xc8\xa5\xbd\xf6\xb6\x80=c\x16\xb3\xbd\xfe\x98\x83<\xe9\xd5\x1f>@\xe5\x1b\xbd8.\xfe=\x11B\x13>w\xe1\x06>\xf0\xcb\x83\xbb\x13\xec\xcf<\xda^N>\xf3\xd1\xcc=6\xa9\xda=\xaf\xb0\xd8>\x07\xb83\xbewt\xd1\xbcGp*=N\x8f\xf5=\x9aA\xa1\xbc\xce\xeda\xbd\x12\xacV>5\xd6\xd7=\xf6k\x18>-\xbbg<\xcfsa=X\x0cb\xbe\xaf{:>\x16;#=\x0f\x9b\x8d=\x83\xf0\xb7>\xda\xba]<E\x94\xcc\xbc\xc1\xab\xb2\xbd\xc5N\xee\xbd\xab7\x15>\xe6-\x90\xbd\x07\xb8\xaa\xbc\xdb\xfa,=J+\x15>\x89\xb0\xd9\xbc\x9e\xc32<\x80\'\x97<\x1d\xee\x07=EqE\xbdG\x81v=\xb1\xf4\x9f\xbc[\xad\xe7\xbc\r\xf2\x0f<\xf8\xe3\x08>\xdf\xa8)\xbe+3u>\x0b|\xa5\xbb\xcd\xb87\xbe\xfdr\\>\x0e\xc1p<z\xde+>sK}>\xdd\x94\xd5\xbd\x06 \xca\xbc\xe3\x01\x81\xbd\n\xc4\x13\xbej\x19l>\x8c\xab\x81>\x18\xea\xcb\xbc\xf6VY>\xe8\x88\xaf\xbdjW\x7f=:\x876=S\x9a|\xbe\xa5\xa8\x01>\x13\x180\xbe\xbeJ\x89\xbemk\x0e\xbe\xd6Ae\xbd\xc3Z\xc2\xbd\xe6\x80y\xbe\xea\x81r>\xc7\x05\x85\xbd\xd9\xeb\xfa\xbd\xf5#O\xbd\xff\xe5d\xbe\xb9\xbba\xbd\x9f\xe6\xa6>\xfd\xfe\x1a\xbc\xd8\x93\x17<\xc1\xe1\x9f\xbe\xb0;{\xbe\xb1\xa7\xdb\xbd\xea\t\x82=\xadrn>>HT=\xa0U\x1a\xbe\x11\x8b\xb9\xbd\xb0\xc0q>\xeaT\xfb<\xdb"\x8e=\xf0\xca\xc8<\xf1\xb1\x82>\xb9\x08Q\xbe8\xe6\xfe=O\xe4\x86\xbd\xa5V\xfc=\xb2\x056>Eh\x8c>\xe7Z\x92>\xef\x131>u}\x96=\xd6\x83\xe3=N\xe8]='
-p1595
-tp1596
-bsV578824609388224512
-p1597
-g2
-(g3
-(I0
-tp1598
-g5
-tp1599
-Rp1600
-(I1
-(I200
-tp1601
-g12
-I00
-S'X[.>\xcdp\xb6\xbc\x14\x9f\xe6\xbe\\\x0e\xa4>`?f>\x1e\x1f\x97\xbb\xee\xd0r\xbe\x8b\xc1\x80\xbef\x86\xf7\xbc\xceg\x80>0#\x8a=\xdf\xd5\xaf\xbe\xedO\xfa=,\x15\x11>uHf\xbcn\xb1\xd3>5\xd1\x83\xbdc\x1fZ\xbe\xc6\x93\xaf\xbc\x03;\x85<\xf7\x91\xce\xbeq"\xe4\xbdT\x12[>j7\x1c\xbe\x1f\x1f\xbc\xbdy\xb5o\xbdwX\xd2=\x151)\xbe\\\x8c\xa0\xbe\xa6k\xb2\xbd\xb8\xd1\xaf\xbe\r\xbb\x7f\xbea\x1cj>\xc9D\xe7\xbe\xbc\x03\x1c=l\x05\x1c?U\xf4\x16\xbe\xdb\x12P>\x07w\x9c>\x99\xbb\x9e>h%m\xbd?\x94P>\xdeX/>u\x15\xab\xbe\xc1V\xa9\xbei\x9a.\xbd\xac:\xd3>q\xd2[>dv$>Jx\xe3>\x82B%\xbd\x97\xbf\x03?\x01$@\xbe\x82\x96\xa9\xbd\xa8]\x06\xbfG\x1c\x8d>\x12\x08:\xbe\xea\xdd\x95\xbe\xc7\x7f\xed\xbe\xbf\xa0\xfb\xbeX%Y>\xcbR\x13=\x8a\x89V\xbd\x8d\xea\x0c\xbfr\xfc\xf1\xbd\xcc4\xac>Rn\x9b\xbe\xb1C\x0e\xbd\xf2.\xa1\xbe\x1bw\xbf\xbe j)\xbf\x17{\x06\xbf\xed-\x08\xbe\x00\x031\xbe*\xf7\x9a\xbe\xdf\xa5\xad>Mb\xb7>2;\x1f>?\xd0\xb8>*\xda7>1\t\xe7\xbdL\xcd\xf7=\xc2\x0c\xff>\x8bL\x9e\xbe\x19{\x1c>\x95\xffd>?\x082>\xadu\x14\xbf\xa6\\6?}X\xb7=\xfe\xad\'\xbej\x19\xb5=\x96\x0e\xf0\xbc\xe6\xa6(=h-v>F4\x12\xbeB\xee\x93>\xfd\x03->\xb0R\xb8>,s\x0b\xbc\xd6\x19\x9d\xbb\xb1\xf3\xc8>\xdd\xf1P>w \x94>M\x04y?\x1e9\xaa\xbe\x93\x865\xbe\xc5\x95\xbb=\x11\xea\xb7>\xbc\xf4\x19\xbd\xac\xcfG\xbdj\x00\xc6>G\x1du>\xb7$\x99>\xedQx=Q\x95\x02>J\xa9\xe6\xbe\xfcN\x91>E \xef<M\xa3H=\xc9\xe6A?^#Q\xbd\xa8\xf4\xd6\xbd8\xd1n\xbep\x91\xc2\xbe\xefi\x88>\xea\x10a\xbd$\xb9\x03\xbd\xd5\xbe\x17>\x9e \xcc>\xff\xefD\xbdP\t\x8b<\xac\xb8"=\xf3\x1e\xa0=\xd0\x89\x81\xbe~\x9fH>B8\xa8\xbc\xb4G\xac\xbcq\x9dW\xbd\x86T\xb0>\xf0\xbf\xdf\xbeap\x05?W\xcb\x84\xbd\x8e\xff\xab\xbe\x1b\xca\xcb>)TF\xbd\xb9\x06\x9b>\x12\xdf\x02?\xca\xec \xbe]\x11\x0e\xbdS\x01\xad\xbdVQ\\\xbeD\xe0\xf4>\tR\r?\x83\xc3w\xbd\xa3\x92\xf3>\'\xaa^\xbeJ\x8di=\xf7\xb5E>\x0b:\x07\xbf\xf6,\x9c>\xb8\xe4\x99\xbe=R\x1a\xbfJ\x82\xa3\xbe\xd6\x03%\xbe{>\x1f\xbe\x87F\xc6\xbe`\x83\x06?\xf7\xa2(\xbe\x0fs\x8a\xbe\xd3_%\xbe\x9d\xea\x0f\xbf\x9e\xdfX\xbez\x7f\n?G\xb2\xc5\xbd\xb55\xb5=\xefU"\xbf\xbb>\xd6\xbe\x96F\x8c\xbe\xbd0\xfc=N\xcf\x04?L\x92x=$\xa3\x81\xbe\xb4\xc3\xf4\xbdY6\x04?e\xc6\x18>b\xb7\t>\xb0\xfbR<uv\x0e?\x85\xb7\xfe\xbe\x135\x84>\xe3"\'\xbe\xd6\xd4\x99>t\xe0\xb0>\xf1\xc0\x03?\xca\xc8\x01?\x03o\xe9>\xae\xf3\x0b>x\x97\x85>\xa6>\xa5\xbd'
-p1602
-tp1603
-bsV577352932670070785
-p1604
-g2
-(g3
-(I0
-tp1605
-g5
-tp1606
-Rp1607
-(I1
-(I200
-tp1608
-g12
-I00
-S'\x05\x9e\xa3>.\xe1\xba\xbe\x0b\x87E\xbf\xba\x88*>1-\xc2>\xf9\x97\x99\xbe\xeb\x7f\x97\xber\x1b-\xbe`h\r>&H\xa4>\n\xdeB=\xde\xad"\xbd\xe5Lc=\xfa\x10h\xbeI\x90\x0e\xbe\x9ew\xe5>`\x9eS=\x12,\t\xbeO\x90\xba\xbdH\xcc\xab=\xd1\xd2)\xbf\xe2w\xb0\xbc@\x89\x0b>\x15~\x19\xbf\xbe\xc4\xac\xbeD\rl\xbe\xfeJ\xec>\xc5%\xa3\xbeZ\xe6\x1b\xbf\x10\xc0\x00\xbd\x88\x0fu<{%\x04\xbe\x14\x0ca>\xb2]\x06\xbfD\x85T\xbeM"B?\xfex\xed<`o\xca;\xf5\xee\x17?\xc8;^>\x90\xce\x8e\xbe%)a>\x84\xedL>?\x02\xbb\xbe`\xdc\xd9\xbeN\xac\x1b\xbe\x0cy:?\x1b\xce\xb2=\xd0\t\x84>R\x11 ?\xcb\xc65>e\xae=?^\t\xfc\xbe\xd98u\xbef\xe4#\xbf\xbeo*?\x0e\x851>\xb9\x16\xbd\xbe\x16b\x05\xbfzJ\x0b\xbf\xb6\x93\n?6[X>\x90o\xad\xbd\x96.\xd5\xbe\x8d\x8e`<\xea\xd4\x0e?\xd2\x88\xbe\xbeh\x15\x1c>\x96\xd2\\\xbf\xe4\x1eR\xbe\x95\xdcX\xbf\xe2n\x1b\xbf\x80a)\xba\xb3o\x86\xberw\xf2\xbe\x9b\x95\xe4>\xdc.O?\xb5\x82d>\xc5\xdd\x93>>d\xa0>\xde\x8bc\xbe\x80M\x97\xbb\xf0[\x01?\xc0\x17\xc8\xbe\xa2\x87\x99=\x86\xb1\x8d=\xa0\xf6\xbb\xbb\xd5\xca#\xbfT#V?wb\xbb>\x1fR\xd8\xbd\xdac\xdf>\xc1_U\xbe\xf7\xb8_>\xbd{\xbc>\xa6\x1b\x1d\xbet\x9f\xaa>\xf8I\xbc>w~\xf6>\xead\xf0=M[a\xbd\x9a\xe40?\x8e\x18u>\xd6\xffM>\xfb\xa53?\x9e\xd2/\xbf-\xc7\x9e\xbd4\xed#>\x9d\xe9\xa4>p\xd8\xbf\xbd\xd0\x91!\xbe\x8f\x85P>\xde\xd2\n= 1\xc6>\xb6\x94\x8b>\xad\xfa_>n\xbdC\xbf\xa9j\xab>T\x9a!\xbe\xe4AB=L+j?\xb6\x08\n>h\xae7\xben\xa9\x9b\xbe \xcb \xbe\xa8\xf5\x19?\xf8\xd3J\xbe\x9azn\xbe\xa4\xeb\xde\xbd\x08\xf5s>~\x1cO=\xb8P\x0e>~W\xee=\x8c\xbb\xfd\xbc\x02\xb7R\xbe\x1eL\xaf>\xdcQ\xd7\xbc\xbau\xcf<dR\x07<\xc1\x1f\xa4>F2\xc7\xbexu\x07?M\x15\xac\xbd\xa9\x8f\'\xbfP\x1a\xd2>B\x90/\xbd\xe2\x19%?\x98\x8dB?\xdc\x1f\xc5\xbe\xe4YX\xbcbDu\xbe\x8a?\x96\xbe\xd1\x92\xbe>\x1eo7?\xa8\xe9x\xbdz\x04[?D\xa4]\xbe\xa0\xdd\xc4=`\xd0 >b\xf1\xf7\xbe\x94\x01\xc2>\xee\xdb\x97\xbe\x13\x96\x0c\xbfJ\\\xfb\xbe\x9fm\xae\xbe\x1cu\x89\xbe8%y\xbfv\xe9\x08?<\xc5q\xbe\xc1gq=\nL8=\xeas\xc4\xbe\xf4k\x1a\xbc4\x1f\x86?\xac)$>\xc2\xbb\x0e>P1\x0c\xbfb\x1d\xe5\xbe\x01H\xc4\xbe\x9e|{>s\t\xfe>\xdeKh>\x08\xbb\xb7\xbe\xb3\xbc\xb3\xbe\xeb\xc6\xfd>\x15{\x85\xbe\x844\xb7>\x13!#>\x80\x9e\xfb>\x9b\xcf\x19\xbe\xa2\x80\x80=\xc0\xda\xb5;d\xdd\xb1>~g\xe3=\x98\xa8\xd3>\xe6\xbe0?\x9a9\xed>\x84=\x8e=\xb2\xc54>\xbe\x0e\x10\xbe'
-p1609
-tp1610
-bsV580601091177488384
-p1611
-g2
-(g3
-(I0
-tp1612
-g5
-tp1613
-Rp1614
-(I1
-(I200
-tp1615
-g12
-I00
-S"@Eo>_?\xa0\xbd\xf0 \xd4\xbe\xb7\xab\xae=I\x90\x84>\xfd\xe0\x00\xbe{-\t\xbe/95\xbe;\xc3<\xbd?\x1b\x04>[Q\xe8=k\xd5\x05\xbb<\x03\n>Q\x16\x84=\xd0R\x02\xbe\x0b\x0f\x94>;\x88\xfb;aX\xa4\xbdX\xe9\xbb\xbd\x91\xd8V=\xe1\xd4\x90\xbe\x11L\xe7\xbc\x15K\x06>\x1f\x94\xa5\xbe)=\xda\xbdk\\\xc8\xbdX\xff)>\xc3|w\xbeoS\x82\xbe\x95D\x03>\xfc\xcf\x12\xbd\xf1\x03\x0c\xbe\x19A.>\xdc\x11\x7f\xbeV@\x97\xbb\xe8\xa9\xa9>@\x1f\xe7;\x9d\x85\xe8=\xccp\x9a>\x00\\\x10>\xb81\x84\xbb$l\xd7==+U>\x0f\x06\x94\xbe\xff\xf2\x14\xbe+\x83<;\x1d\x90\xc6>\xdf\x98\xc4<\x10ng=\xad\xbd\xb7>\x1c\xd4\x8a=\xe7\x85\xd2>=pN\xbe\xcd,\x05\xbdk\xe0\xcd\xbe\xe2\x0c\x87> \xd2\x1c:\xf8\x080\xbe\x8b\x90\xb8\xbe\xab\xf7\xbe\xbem\xb5y>\x03\xfa\xbc<M\xf8\x96\xbdk\x15\x91\xbe]wb\xbd\xafs\x8a>\x1fA>\xbeh\x8c\x8f=\x95f\xb8\xbe\xb1w\x04\xbe\xa5~\n\xbf\xd7\x94\x96\xbe\xf0D\xe3\xbaj\x93\x08\xbe\xcd-O\xbe_&\x90>\x93&\x94>x\xcb\x07>\xb9\xb1\xf2=CU)>`\xcb\xfc\xbdsS\x17;$\xd6\x8e>%\x84I\xbe`\x7f\x16>H\xcf\x0f>s\x94^>\x93\xe9\xbb\xbe\\c\xf3>j~\x1e>E\x81\xd5\xbd\x18\xaa\x1b>\xe0Mf\xbe\xd8:\xdb=`f\x7f>\x81VP\xbc\xea\xa8\x04>\xc3\x1ee>E\x0f3>\xc9\x81\x85<\x7fd\x89=\xbb\x10\xb5>`K\xd4=\xafq\x03>\xe7\x1c\xf6>\xcb\xa3\x86\xbeuA\xbe\xba\xa8e\xfe<=\x89\xe1=}Ta\xbc\xa5\x92\xde\xbc\xb7\xa3\x8c>\x0f\xf9\xe7=\xac{6>\xddY#<\x0c\x8dB=\x18r\xab\xbe\x8bD\x8a>,p\x0f=\x130\xdd='\xed\x04?dx\xbe<\x06&\x91\xbd\x95\xb4\x88\xbd\xfb\xdb\x9a\xbd9\x0cu>\x1d\x84\t\xbe\x8d\x81\xdc\xbb\xbb\x7f\x93;|\xc1\xfa=\x84?5=\xb8Qr= b2=\xfc\xe8\x99<u6\xc6<\xdb\xe8\x00>U\xfb\x8c:'\xb27<\xcf\xadn= 3'>8v1\xbe}\x90\xad>\xb5\x99s\xbd\xc7\xfb\x8b\xbei(w>\xd0hi\xbd\xa8\x03\x82>\xdd\x9c\x91>\x10\xdd*\xbe\x1c\xf1\xdc\xbc\x81\xac\x80\xbc\x07\x83,\xbe\xd8\xcad>]\xd1\x9c>_%\xdc<\xd0s\xbc>\x0f\x84\x96\xbd\xf9\n\x93=\x13\x9d\xcb=\xe1\xcd\x7f\xbe{\xfa\x81>\xe5\xb3F\xbe\xc6\xf6\x8b\xbe\x05\x187\xbe\x15\x88\xdb\xbd\xf9f\x14\xbet)\xc2\xbe\xa4)\xa4>\xbb\xf0\xc1\xbdk=\x9f\xbdS\x19\x1f;\xaf\x01b\xbeT,\xcf;\x04z\x04?\xacP\x1e=\xe3\x02\xe5;?G\xa7\xbe\xf0$\x98\xbe=\x19\x06\xbe\xa5\xc7\xe4=\xfb8\x9e>0Nv=.j\x1b\xbe\xc7\xb5\xbd\xbd\x1c\x13Z>\x1cn\xc0\xbc\x10\x05:>\x01\xa1\x06=\xafV\x9a>e'[\xbe\xdd\x91\x1e>\xbbB\xc3\xbb\x8d\xf79>s\xd2b>\x1c\xe0\x95>G\xac\xb6>\x10\x8eC>\xddr\xdf=K\xa0a=\x8by\x02>"
-p1616
-tp1617
-bsV580669914811334657
-p1618
-g2
-(g3
-(I0
-tp1619
-g5
-tp1620
-Rp1621
-(I1
-(I200
-tp1622
-g12
-I00
-S'aS\xb6=\xf9r\xa4\xbd\xa1\x8c\xf2\xbe?~\x9e>{\xd3(>\xb3\xcfg=y\xb6\xad\xbe\t\xfd\x05\xbe\xfca)\xbd\r#\x92>\x97d\xb2=\xef\xcb\xd3\xbe}\x05A>3\x8a\xd5=y\xb5\x9c\xbd\xd8<\x9e>\xf6Y\'\xbd\xbb\xab\x9b\xbe\xa6j\x87=\xb8R6>T\xfa\x0e\xbf!W\x8f\xbd\t\x04\xec=Y\xd4|\xbe\'\r\x1e\xbe\x9d\xb0D\xbd\r`\xb6={\xdb:\xbe[\xed\xf2\xbe\xc3Ok\xbd#}\x86\xbe\x7fpI\xbe;\x07\xa5>\xd3\x81\xc1\xbe\x804\xc7<.\xfe(?5\x81\x8e\xbe\x8f,\xdc=5\x0b\x89>I\xf9\xe7>\xe1\x8b\xdc=\x80\xee\xd8>\x1b\xb8~>\xfb\t\xfd\xbea\xa7v\xbe\xbb\x87\x8d<}\x97\xd4>\xc8.N>\xeb\xef\xcd=-\x11\xdc>\xbb\xc3\xa0\xbc@\xda\x11?\x15\xe7\xa4\xbe\x01p5\xbe\x04\xfc\x19\xbf\xb7\xb0\xce>;g&\xbe\x0b\x91k\xbem\xfd\xec\xbe\xff$\xe9\xbe\xc9\xb1\xd8>X\xf4\x8f\xbd\x84\xda6\xbe\xd3\xf0\x1b\xbf\x980w\xbeM2\xe4>\x19p\xb2\xbeX\xde\xbc\xbd5\xc7\xf5\xbe\xe9\xd3\xb4\xbe#(\x1f\xbf}`\x04\xbf\xb1U\xaa\xbd\x18\x85i\xbe\xad\xe5\xca\xbeQ\x98\xfc><\x91\xf7>\xad\x872>\xa8\xe5\x95>z\x85\x00>\x05\xed@\xbe\x89\x0c\x84\xbc3\xaf\x0e?\xb8T\xa3\xbe\xc6\xd3\x00>\x8d\x9f\x91>m\x99\xa9=g\x8c\x12\xbf\x9d\xa6\x15?4m\x9a>\x94Z\xf9\xbc%\x93\x1d=\x93\xb2\x17=\x11\x86\xd9=+\x92\x1a>\xf4\xb9;\xbet\xbb\xf5=\xf1_\x02>\x91\xc2\xa0>Y|&>\x04\xdax\xbb\t\r\xdb>\x9c^<>a\x89U>r\x8a\x83?\xd0\xdb\xbf\xbe\xef`\x13\xbe\xd0]Q\xbc8\xc8\xd5>PO\xe9\xbd3aD=^l\x03?\n\x13\x1a>k\xbb\xbc>1:\x87=\x90o">L\xb2\xe9\xbeg4\xa1>\'\x80X=\xa4v\x18>\x8c\x97=?\xf0\xadA\xbeC@\t\xbe0V\x91\xbe\xcc\xef\xce\xbe\xef\x8a\x97>i\xae\x9b\xbd\x17\xcf\xde\xbd\xfc\xff\x94=\x9d\xdf\xbf>\x04\x15\x03\xbe\xb7\xad\x03\xbe\xf4\x0b\x85\xbd\'\t\xc6=]5\xb3\xbe}\xad\x1c>\x02\x0c\x05=$\x02\x98\xbd_\xa6\xed=}\xd7\xf3>$O\xc5\xbe\xa1\x04\x04?=\x8b\x08\xbe\x95\x93\x89\xbe\xc5\xa4\xe5>\xe9\xd5\\=\x15\xf0\xf8>\x13\x14\xe9>\xb1\xbfQ\xbe3\xc3<\xbeUdJ\xbe\x137\xa5\xbe\t\xdc\x04?\xbb\x005?\x8b\xa9\xc9\xbdt\xe9\xdb>\x95?"\xbe\x0b\x07<=t\xf7\xe6=\x16\xbe\x1b\xbf\x19Q\t?\xf0\xab\x8c\xbe\xf1o\xfb\xbe1h\xb3\xbe}\x8bc\xbe-\xc9\xb0\xbe\x8f\xbc\xe8\xbe\xe1\xde\x0e?\x0f\xc5q\xbe\xbe\xdf\x9d\xbe\x03\xf0E\xbeG\x8c\x0f\xbf\x10e\x11\xbe\xec\xda/?i9\xa6\xbd\xad\x05\xf2<S\xee8\xbf\xd7\x1a\xe7\xbeA\xf7\x1f\xbf\xe1\x8f\xad=\x0f\x03\xed>&Z\x06>\xfc\xda\x9c\xbe\x0f\x19\x97\xbed}\xf2>Z\x0b\xa8=\xcf\xca\x93<\x91P\xbf\xbb\t[#?\x14<\x07\xbfTL\x0c>\xd7\x04\xb5\xbe\x1f2\xbf> \xcc\xc6>/\x06\xe5>\xdf\xb6)?5\xa8#?\x11\x194>\xc9\xde\x9b>V\xa6"='
-p1623
-tp1624
-bsV590479120460546048
-p1625
-g2
-(g3
-(I0
-tp1626
-g5
-tp1627
-Rp1628
-(I1
-(I200
-tp1629
-g12
-I00
-S';E\x13>]m\xcf\xbd\xd0\x8a\xd4\xbe\xdbn|>\x8a\xe5->JaY=\xb8Y\x9c\xbe\x82\xc6,\xbe\xfe\xb40\xbdk\x12\x8a>\xea\x8f\xb4=\xde\xbe\x9e\xbev<I>5\x93\xec=\xcfi\xa1\xbdg\xf9\xa6>\x9e,I\xbd\nQb\xbev\xa8\xd7<\xed_\xec=\x83\x10\xf2\xbe\xb2\x94\x97\xbd\x81\xd3\x0b>\x82<\x80\xbe\x104\x0f\xbe}wd\xbd\x8dv\xcc=6=D\xbe\x12\x94\xe7\xbe!\x98\xa1<\x08\xe1Y\xbe\x7f\x83A\xbe\xf4C\x90>\xc71\xa3\xbe\x9d\xa8P=\x96f\x12?\xc8 8\xbe\xd4j\xad=\xd4\x16\x94>\x85:\xbb>&\xb3\xac=\xaal\x94>\xc8\x9c|>\xea\xb6\xe3\xbe\x02\xf8D\xbe\xf8CL\xba[\xd2\xe0>!n9>x$\xce=u\xe4\xdc>?U\xbd\xbaD\xd0\x02?\x84\xa6\x82\xbe2O\x16\xbe\xd8\xa6\x13\xbfP\xd3\xc1>yT\t\xbe\x82=<\xbe\x15\xf7\xf8\xbe\xa6\x1a\xe0\xbe/N\xb9>J\x88R\xbc.7\x01\xbe5\x9c\n\xbf\x96\x1et\xbev\xd6\xc4>w\x18\xa4\xbe\xc3\xac\xf3\xbc~\xd8\xcc\xbe<\x04\x95\xbe\x9e\xb2\x1d\xbf\x98\xa1\xf3\xbeN\xa8B\xbd\x98\x99Q\xbe\xa6r\x97\xbe2\x9c\xe4>\x82\x9b\xce>\\\x8b,>V\xa5\x7f>xG\x17>\xf6R$\xbe\xa5iz\xba\xdd\xf3\x08?C\x04\x9a\xbe>\x83\x1f>\x86\xeb\x81>\x90H\x12>Py\x06\xbf\x1f\x9a\t?Hj\x82>f6\x80\xbd+\xd3}=\x13l\xba\xbc\x98\x85\xe1=\x18rI>~\xb3"\xbe\xa9\xed\x1b>~k4>\xac\x14\x93>\x02\xb7\x03>\x0eu\xe8<\x1a\x93\xc6>\xa6\x18C>\x9b8C>KUg?\x91\x8c\x9f\xbe\x8a\xb6\xe1\xbd\x1d\x91\xf8\xbbT\xc6\xaf>\xa6\x80\xac\xbd\xd9\xd13=U \xf0>\xb2\xcf#>\x1eE\x9e>\xae6\xe5<\xa2\xc9\x0f>\xc2#\xcb\xbes\x07\x9d>\x7f\xe9\xa8=B{\x19>\x1b#1?3\x9c\xd1\xbdZ\xac\xb3\xbdJ\xd6\x81\xbe\x84\x92\xa6\xbe\xf3\x85\x8b>\x8d\x91\x95\xbd\xaa)\xdf\xbdR\xab\x9f=$\xc3\xab>Q@\xbf\xbdA@\x9e\xbd\x05\xe7\x0c\xbd;\'\xc1=\xe6\xadp\xbe\xf7:\x0b>R\t\x1c=\xf8\x03\xad\xbd\xadA\xd0=\xdd\xdb\xcb>\xaa\x93\xb8\xbe\xb2%\xf4>cl\xbd\xbd\x17O\x90\xbeAt\xbf>\xd7r\xb7<\xae\x8c\xdd>\xeb\xe4\xd1>#\xf7N\xbeI\x91\x00\xbe\xd2\x81F\xbe%K\x9d\xbef]\xf2>\x82\x1c\x1e?\x1e\x93\x9c\xbdM\xef\xbc>\xf1\xc2\x0c\xbe6-U=V\xa1\x95=\x82\x0c\x08\xbf\xc0\xe8\xe0>I\x0b\x92\xbeH\'\xf2\xbe\xa5\t\x7f\xbe:\xe56\xbe\xcdr\x84\xbe]\xaf\xd8\xbe&\xdf\x00?H\x11j\xbe\xae\xaa\x97\xbe:%\x1a\xbe\xcb7\xf2\xbe\xafc\xcc\xbd\xec\xd5\x1f?\xb2\xa9\x91\xbd\xd6>\xfc\xbb\xf9s&\xbf\xfah\xd0\xbe\n,\xf4\xbe>\xd4\xb6=\xd2;\xde>\xeb\x9d\xfc=\x96\n\x93\xbe\xf0\xd0\x80\xbef\xb3\xd5>\x9b\xd6\xb4=5\x06[=\xb3\x03\xa2<\xfb\xe2\x0f?j,\xf0\xbe,\xf5$>\xd6d\x87\xbe\x19)\x9a>t\x9b\xae>\xf3\x18\xe6>\xe2\xa4\x14?\x98\x1d\x0b?FW#>"\xc5\x88>\xe9\xe1\x98='
-p1630
-tp1631
-bsV578781881480556544
-p1632
-g2
-(g3
-(I0
-tp1633
-g5
-tp1634
-Rp1635
-(I1
-(I200
-tp1636
-g12
-I00
-S'\xee\xc1\x14=\xdb\xc7\xa7\xbd=\x94\xea\xbe\xa1\xbb\xab>\xa1\x8c\r>~8\x8e=\xc8\xef\xb6\xbe\x80\xac\xc3\xbd\x82P\xf7\xbc[\xea\x8e>\xb2\x8a\xaa=\x8a\xa1\xe8\xbe`@6>zJ\xc6=\x8f\xa2\x85\xbd_\xce\x8d>ca\r\xbdBb\xa4\xbek\xd8\xc9=\xf8pP>\x81u\x13\xbf\xb4?\x94\xbd\x9d<\xcd=\x12\xc8o\xbe*\x04$\xbe\xa0\x86\x0e\xbd\t\x15\x8e=\x97\xfc$\xbe\x1e\x13\xf3\xbe\xd3O\xb1\xbd\x06\x9a\x8c\xbe\x0cyF\xber\x9e\xa9>F\xf9\xbc\xbe\xfd|h<-2,?f3\xa9\xbe\x96\xe2\xc1=\xa2Pq>\xe5)\xf7>I+\x02>\x15\xae\xf5>\xf6bq>x\x13\xff\xbeF:|\xbe\xb3\x18\xac<\xae\xc8\xc5>\xd3\x15V>\xaa\x1b\xd5=\xbd\x06\xcd>f\x95\xd0\xbc2o\x0f?\x0c\x14\xaa\xbe\x1b\x94J\xbe&\\\x14\xbf\x93y\xd2>\xa1\xbc4\xbe\x13\x92r\xbe\x06\x1f\xd6\xbe\xf2\xe6\xd9\xbe\xc0\xda\xdd>\xd8.\xd4\xbd\x03/M\xbe\xd4\x8d\x1f\xbf\r\xb9\x80\xbeZ\x9a\xe8>F?\xb2\xbeX\xde\t\xbe\xa0\x9a\xfe\xbe\xb4\xac\xba\xbe#\x93\x16\xbfh\xc1\x03\xbf\x11\xc4\xb0\xbd\xe0\xd9j\xbec@\xd5\xbe\xf6\x94\x00?#\xaf\xfe>zu+>\xc0\xd2\x97>\xa2T\xce=\xcavI\xbe\xc3p\xd5\xbcM\xea\r?F\xdc\x9d\xbe\x1b\xf7\xd2=B\xe1\x94>\x82\xbf)=Bi\x11\xbf\xf4\x9d\x0e?\r\x1c\xa3>}\x00\x93\xbbz\t\x9c<\x80\xb1\xad=\xc5*\xe4=K\xac\xe5=[~N\xbe!\xc9\xb8=f)\xb6="^\xa1>UCE>Vf\x85\xbcH:\xd7>\xad\'8>\xe5\x03R>\x8cu\x85?\xbf\x0b\xbf\xbe\x96\x80$\xbeK;\xe2\xbcS_\xe5>4;\x02\xbe\x11\xcd\x90=A\xfd\x03?\x16\xbc\x0c>\xa6\x8d\xc0>\xaeE\x9e=W\x80*>N\xcf\xe5\xbe\xbb\x90\x96>A\x8a8=o\xc2\x12>3\x939?U\xd6i\xbe\x02\xda\x17\xbe\x08\xc4\x99\xbeB\xe7\xdd\xbeWW\x93>\x90P}\xbd(\xb0\xff\xbd\xdc\x1f\x97=<\xc9\xc4>[|\x16\xbe\xb8\xf4"\xbef[\xa9\xbd86\xcb=\xd8\x05\xcd\xbe\xbfb\x1c>>\x1f3=\xda\x8b\xa1\xbd\x16{\x03>\xad\x17\x02?\x8c=\xc8\xbe\x12\xbf\x01?\x96-\x1c\xbe @y\xbe\xf3\x03\xe4>\x03_\x83=F\xac\x00?\x80/\xe2>G\xbeK\xbe\xa8\xe1T\xbe\xed\xf2W\xbe\xd9\x83\xa4\xbe\x8c\xb0\x05?\xdcE;?\x96J\xe0\xbd\x06\xb7\xd6>\x86M\x1e\xbe\xc3Q\xf4<\xc0\xec\xea=\x0e\xc7\x1e\xbf \xdc\x12?"\x17\x83\xbe\xbe~\xf2\xbe\xcf\x9a\xb7\xbe\xb3\xe4s\xbeSp\xbc\xbe\xc0"\xdf\xbee\xc2\x0f?c\xc5\x7f\xbe\xeai\xa0\xbe\xad\xfaV\xbe\x99\xcd\x12\xbfk\xae\x18\xbe\xce\xbb,?s\x98\xba\xbd\xfc\xf4\x10=\xbe\xdf9\xbf\x82\x1a\xde\xbe[\x881\xbf\x9f\x02\x97=\xb8\x1f\xe6>d\xd6\n>\xa6\xf3\x9b\xbe\x167\xa0\xbe\xe8\xe2\xef>V\x8a\xaa=\xd5\xc7g\xbcx\xbc\x95\xbc"\x0b&?\xa35\n\xbf\xbeI\xe6=&\x1a\xca\xbe\xe1f\xc7>\xab\r\xc3>\x1e|\xd6>\x12\xdb)?\xa5[/?\xb3\x1f6>\xb7\xe9\xa3>\xd6\x1d\x91<'
-p1637
-tp1638
-bs.
\ No newline at end of file
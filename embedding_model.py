@@ -1,63 +1,74 @@
 import argparse
-from sklearn.feature_extraction.text import CountVectorizer
 from gensim.models import word2vec
 import numpy as np
 import glob
+import multiprocessing
 import pickle
+from feature_cache import files_hash
+from tweet_store import load_tweets
+from hashed_bigrams import HashedBigramModel, NUM_FEATURES
 
 parser = argparse.ArgumentParser()
 parser.add_argument("-i", "--input_glob", required=True) # */tweets_cleaned.p
 parser.add_argument("-m", "--model_filename", required=True) # e.g. 'word2vec_embedding_model'
-parser.add_argument("-w", "--warmstart", default=False, type=bool)
+parser.add_argument("-w", "--warmstart", default=False, type=bool) # train an existing model on only the new or changed input files
 parser.add_argument("-b", "--batch_size", default=256, type=int)
 parser.add_argument("-e", "--embed_size", default=200, type=int)
+parser.add_argument("-n", "--workers", default=multiprocessing.cpu_count(), type=int) # word2vec training threads
 parser.add_argument("-t", "--model", required=True) # e.g. "bigram" or "word2vec"
+parser.add_argument("-f", "--num_features", default=NUM_FEATURES, type=int) # columns bigrams are hashed in to
+parser.add_argument("-df", "--min_df", default=1, type=int) # tweets a bigram column must appear in to be kept
 args = parser.parse_args()
 
-# Creates a word2vec model based on provided list of sentences (each sentence is a list of words)
-# Filename is the name that you want to save the model as
-def train_word_embedding_model(input_list, filename, model):
-	if model == None:
-		model = word2vec.Word2Vec(input_list, size=args.embed_size, min_count=1)
-	else:
-		model.train(input_list)
-	# Save model so that if our program quits in the middle, we still have checkpoints from after each input file
-	model.save(filename)
+# Restartable iterator over the tokens of every tweet in the given files, read one file at a time, since
+# word2vec goes over its sentences once to build the vocabulary and again for every training pass
+class TweetCorpus(object):
+	def __init__(self, filenames):
+		self.filenames = filenames
 
-# Create a word2vec model with the given arguments
-def word_embedding_model():
-	# If warmstart is true and viable, load the model from the given model filename
-	model = None
-	if args.warmstart and glob.glob(args.model_filename) > 0:
-		print "Warmstarting model from %s" % args.output_model_filename
-		model = word2vec.Word2Vec.load(filename)
+	def __iter__(self):
+		for filename in self.filenames:
+			for tokens in load_tweets(filename).iter_tokens():
+				if len(tokens) > 0: yield tokens
 
-	# Get all input files to train on, and pass them in to the model, saving the model to the given filename after
-	# each input file is processed
+# Create a word2vec model with the given arguments. The model remembers the hash of every file it was
+# trained on, so warmstarting only adds the words of new or changed files to its vocabulary and only
+# trains on them, rather than rebuilding it from every event
+def word_embedding_model():
 	input_filenames = glob.glob(args.input_glob)
 	print "Found %d input files for training" % len(input_filenames)
-	X = []
-	for filename in input_filenames:
-		with open(filename, "rb") as input_file:
-			tweets = pickle.load(input_file)
-			tweet_texts = [tweet.text for tweet in tweets.values()]
-			X.extend(tweet_texts)
-	train_word_embedding_model(X, args.model_filename, model)
+	hashes = dict((filename, files_hash([filename])) for filename in input_filenames)
+	if args.warmstart and len(glob.glob(args.model_filename)) > 0:
+		print "Warmstarting model from %s" % args.model_filename
+		model = word2vec.Word2Vec.load(args.model_filename)
+		model.workers = args.workers
+		trained_files = getattr(model, "trained_files", {})
+		new_filenames = [filename for filename in input_filenames if trained_files.get(filename) != hashes[filename]]
+		print "%d of the input files are new or changed" % len(new_filenames)
+		if len(new_filenames) == 0: return
+		corpus = TweetCorpus(new_filenames)
+		model.build_vocab(corpus, update=True)
+		model.train(corpus, total_examples=model.corpus_count)
+	else:
+		trained_files = {}
+		new_filenames = input_filenames
+		model = word2vec.Word2Vec(TweetCorpus(input_filenames), size=args.embed_size, min_count=1, workers=args.workers)
+	model.trained_files = dict(trained_files, **dict((filename, hashes[filename]) for filename in new_filenames))
+	model.save(args.model_filename)
+	print "Trained on %d tweets, vocabulary of %d words" % (model.corpus_count, len(model.wv.vocab))
 
-# Create a bigram model with the given arguments, save a bigram vectorizer object
-# http://scikit-learn.org/stable/modules/feature_extraction.html
+# Create a bigram model with the given arguments over the tweets of every input file, streamed through
+# it in batches, and save it. Its memory is set by --num_features, not by the size of the corpus
+# http://scikit-learn.org/stable/modules/feature_extraction.html#vectorizing-a-large-text-corpus-with-the-hashing-trick
 def bigram_model():
 	input_filenames = glob.glob(args.input_glob)
 	print "Found %d input files for training" % len(input_filenames)
-	bigram_vectorizer = CountVectorizer(ngram_range=(1, 2), token_pattern=r'\b\w+\b', min_df=1)
-	for filename in input_filenames:
-		with open(filename, "rb") as input_file:
-			tweets = pickle.load(input_file)
-			tweet_texts = [tweet.text for tweet in tweets.values()]
-			sentences = [' '.join(sentence) for sentence in tweet_texts]
-			bigram_vectorizer.fit_transform(sentences)
+	# Cleaned tweets are stored as their tokens joined by spaces
+	sentences = (text for filename in input_filenames for text in load_tweets(filename).iter_text())
+	bigram_model = HashedBigramModel(args.num_features, args.min_df).fit(sentences)
+	print "Kept %d of %d bigram columns over %d tweets" % (bigram_model.num_columns, args.num_features, bigram_model.num_documents)
 	with open(args.model_filename, 'wb') as output_file:
-		pickle.dump(bigram_vectorizer, output_file)
+		pickle.dump(bigram_model, output_file, pickle.HIGHEST_PROTOCOL)
 
 if args.model == "bigram": bigram_model()
 elif args.model == "word2vec": word_embedding_model()
@@ -0,0 +1,118 @@
+import hashlib
+import os
+import shutil
+
+# Bump whenever a change to the featurizers changes the features they produce, so that cached features
+# are computed again
+CACHE_VERSION = 1
+DEFAULT_CACHE_SIZE = 1024 # MB
+
+# sha1 of the contents of the files, in order
+def files_hash(filenames):
+	digest = hashlib.sha1()
+	for filename in filenames:
+		with open(filename, "rb") as input_file:
+			for block in iter(lambda: input_file.read(1 << 20), ""): digest.update(block)
+	return digest.hexdigest()
+
+# Content-addressed cache of featurizer outputs. An entry is keyed on the hashes of everything the
+# features depend on, so changing the cleaned tweets, the model or the aggregation can never reuse stale
+# features, and is a directory holding a copy of each output file. Entries are written to a temporary
+# directory and renamed in to place, so a crash never leaves half of one. A hit touches the entry, and
+# evict() drops the least recently used entries until the cache fits in max_bytes. Like the LRUCache of
+# tweet_tokenizer, it counts hits and misses
+class FeatureCache(object):
+	def __init__(self, directory, max_bytes):
+		self.directory = directory
+		self.max_bytes = max_bytes
+		self.hits = 0
+		self.misses = 0
+		if max_bytes > 0 and not os.path.exists(directory): os.makedirs(directory)
+
+	def key(self, *parts):
+		return hashlib.sha1("\0".join(str(part) for part in (CACHE_VERSION,) + parts)).hexdigest()
+
+	def entry_directory(self, key):
+		return os.path.join(self.directory, key)
+
+	# Copies the cached files of the key to the output filenames, returning whether there were any. The
+	# outputs may be stores that other processes have mapped, so like feature_store.write_dense_features
+	# each file is copied next to its place and renamed over it, with any .json header removed first and
+	# moved in last
+	def fetch(self, key, output_filenames):
+		entry_directory = self.entry_directory(key)
+		if self.max_bytes <= 0 or not os.path.isdir(entry_directory):
+			self.misses += 1
+			return False
+		for i, output_filename in enumerate(output_filenames): shutil.copyfile(os.path.join(entry_directory, str(i)), output_filename + ".tmp")
+		headers = [output_filename for output_filename in output_filenames if output_filename.endswith(".json")]
+		for output_filename in headers:
+			if os.path.exists(output_filename): os.remove(output_filename)
+		for output_filename in [output_filename for output_filename in output_filenames if output_filename not in headers] + headers:
+			os.rename(output_filename + ".tmp", output_filename)
+		os.utime(entry_directory, None)
+		self.hits += 1
+		return True
+
+	def store(self, key, output_filenames):
+		if self.max_bytes <= 0: return
+		entry_directory = self.entry_directory(key)
+		temp_directory = "%s.tmp%d" % (entry_directory, os.getpid())
+		if os.path.exists(temp_directory): shutil.rmtree(temp_directory)
+		os.makedirs(temp_directory)
+		for i, output_filename in enumerate(output_filenames): shutil.copyfile(output_filename, os.path.join(temp_directory, str(i)))
+		# Another worker may have stored the same key first. Its entry holds the same features, so it is kept
+		try:
+			os.rename(temp_directory, entry_directory)
+		except OSError:
+			if not os.path.isdir(entry_directory): raise
+			shutil.rmtree(temp_directory)
+
+	# (last use, bytes, key) of every entry, least recently used first
+	def entries(self):
+		entries = []
+		for key in os.listdir(self.directory):
+			entry_directory = self.entry_directory(key)
+			if not os.path.isdir(entry_directory) or ".tmp" in key: continue
+			size = sum(os.path.getsize(os.path.join(entry_directory, name)) for name in os.listdir(entry_directory))
+			entries.append((os.path.getmtime(entry_directory), size, key))
+		return sorted(entries)
+
+	# Drops least recently used entries until the cache fits, returning how many were dropped
+	def evict(self):
+		if self.max_bytes <= 0: return 0
+		entries = self.entries()
+		total = sum(size for _, size, _ in entries)
+		evicted = 0
+		for _, size, key in entries:
+			if total <= self.max_bytes: break
+			shutil.rmtree(self.entry_directory(key))
+			total -= size
+			evicted += 1
+		return evicted
+
+	def size(self):
+		return sum(size for _, size, _ in self.entries()) if self.max_bytes > 0 else 0
+
+if __name__ == "__main__":
+	import tempfile
+	import time
+	temp_dir = tempfile.mkdtemp()
+	cache = FeatureCache(temp_dir + "/cache", max_bytes=30)
+	outputs = [temp_dir + "/a.json", temp_dir + "/b"]
+	for i, contents in enumerate(["0123456789", "abcdefghij", "ABCDEFGHIJ"]):
+		for output in outputs:
+			with open(output, "wb") as output_file: output_file.write(contents[:5*(outputs.index(output) + 1)])
+		assert(not cache.fetch(cache.key("features", i), outputs))
+		cache.store(cache.key("features", i), outputs)
+		# Entries are ordered by last use, to the second
+		os.utime(cache.entry_directory(cache.key("features", i)), (time.time() + i, time.time() + i))
+	assert(cache.evict() == 1 and cache.size() == 30), "Expected the oldest entry to be evicted"
+	assert(cache.fetch(cache.key("features", 1), outputs) and open(outputs[1]).read() == "abcdefghij")
+	assert(not cache.fetch(cache.key("features", 0), outputs) and cache.hits == 1 and cache.misses == 4)
+	# Storing a key that is already cached, as a second worker would, keeps the entry
+	cache.store(cache.key("features", 1), outputs)
+	assert(cache.fetch(cache.key("features", 1), outputs) and open(outputs[1]).read() == "abcdefghij" and len(os.listdir(cache.directory)) == 2)
+	assert(sorted(os.listdir(temp_dir)) == ["a.json", "b", "cache"]), "Temporary files were left behind"
+	shutil.rmtree(temp_dir)
+	print "Cache reuses, and evicts the least recently used entry"
@@ -0,0 +1,147 @@
+from label_store import as_ids, find_ids
+import json
+import os
+import pickle
+import numpy as np
+import scipy.sparse
+
+# Features of a set of tweets as a matrix with one row per tweet, dense or scipy sparse, next to the
+# tweet ids of its rows as a sorted int64 column, so that the rows of a batch of ids are found with one
+# searchsorted like the labels of a LabelStore. meta describes how the features were made, where known
+class TweetFeatures(object):
+	def __init__(self, ids, matrix, meta=None):
+		self.ids = ids
+		self.matrix = matrix
+		self.meta = meta if meta is not None else {}
+
+	def __len__(self):
+		return len(self.ids)
+
+	def tweet_ids(self):
+		return [str(tweet_id) for tweet_id in self.ids]
+
+	@property
+	def num_features(self):
+		return self.matrix.shape[1]
+
+	def is_sparse(self):
+		return scipy.sparse.issparse(self.matrix)
+
+	def positions(self, tweet_ids):
+		return find_ids(self.ids, tweet_ids)
+
+	# Returns the rows of the tweet ids that have features, in order, and which of the ids have them
+	def rows(self, tweet_ids):
+		positions, found = self.positions(tweet_ids)
+		return self.matrix[positions[found]], found
+
+	# Returns the features of the tweets whose ids are in [start_id, end_id). Rows are sorted by id, so
+	# of a mapped store this is a view of the file, not a copy
+	def id_range(self, start_id, end_id):
+		start, end = np.searchsorted(self.ids, [int(start_id), int(end_id)])
+		return TweetFeatures(self.ids[start:end], self.matrix[start:end], self.meta)
+
+# Sorts the rows of a matrix by their tweet ids
+def sorted_features(tweet_ids, matrix):
+	ids = as_ids(tweet_ids)
+	order = np.argsort(ids, kind="mergesort")
+	if scipy.sparse.issparse(matrix): matrix = matrix.tocsr()
+	return TweetFeatures(ids[order], matrix[order])
+
+# Writes sparse features as the ids and the three CSR arrays of the matrix in a compressed .npz, the
+# same arrays that scipy.sparse.save_npz writes, which scipy 0.18 does not have yet
+def write_sparse_features(filename, tweet_ids, matrix):
+	features = sorted_features(tweet_ids, scipy.sparse.csr_matrix(matrix))
+	matrix = features.matrix
+	np.savez_compressed(filename, ids=features.ids, data=matrix.data, indices=matrix.indices, indptr=matrix.indptr, shape=np.array(matrix.shape, dtype=np.int64))
+
+# Dense features are stored as three files: the float32 matrix as filename, a .npy, its sorted int64 ids
+# next to it as .ids.npy, and a small JSON header as .json recording the model and aggregation that
+# made them and the dimension. Both arrays are opened memory-mapped, so opening a store reads only the
+# headers, and processes that open the same store share its pages
+def dense_filenames(filename):
+	base = os.path.splitext(filename)[0]
+	return base + ".npy", base + ".ids.npy", base + ".json"
+
+# Every file is written next to its place and renamed over it, since the old store may still be mapped
+# by other processes. The old header is removed before the new arrays are moved in and the new header is
+# moved in last, so a store is only readable once its arrays are complete and never pairs one header
+# with another's arrays
+def write_dense_features(filename, tweet_ids, matrix, meta=None):
+	features = sorted_features(tweet_ids, np.asarray(matrix, dtype=np.float32))
+	matrix_filename, ids_filename, header_filename = dense_filenames(filename)
+	with open(matrix_filename + ".tmp", "wb") as matrix_file: np.save(matrix_file, np.ascontiguousarray(features.matrix))
+	with open(ids_filename + ".tmp", "wb") as ids_file: np.save(ids_file, features.ids)
+	header = dict(meta or {}, dimension=features.matrix.shape[1] if features.matrix.ndim == 2 else 0, num_tweets=len(features.ids))
+	with open(header_filename + ".tmp", "w") as header_file: json.dump(header, header_file, indent=2, sort_keys=True)
+	if os.path.exists(header_filename): os.remove(header_filename)
+	for output_filename in [matrix_filename, ids_filename, header_filename]: os.rename(output_filename + ".tmp", output_filename)
+
+def read_dense_features(filename):
+	matrix_filename, ids_filename, header_filename = dense_filenames(filename)
+	with open(header_filename) as header_file: header = json.load(header_file)
+	matrix = np.load(matrix_filename, mmap_mode='r')
+	ids = np.load(ids_filename, mmap_mode='r')
+	assert(len(ids) == header["num_tweets"] and matrix.shape[0] == len(ids)), "%s is incomplete" % filename
+	return TweetFeatures(ids, matrix, header)
+
+# Of the files in a folder of features, the ones to load each set of features from. A dense store is
+# loaded from its .npy matrix, so its ids and header are left out, as are the files of a store being written
+def feature_filenames(filenames):
+	return [filename for filename in filenames if not filename.endswith(".ids.npy") and not filename.endswith(".json") and not filename.endswith(".tmp")]
+
+def is_dense_store(filename):
+	return os.path.exists(dense_filenames(filename)[2])
+
+def read_sparse_features(filename):
+	arrays = np.load(filename)
+	try:
+		matrix = scipy.sparse.csr_matrix((arrays["data"], arrays["indices"], arrays["indptr"]), shape=tuple(arrays["shape"]))
+		return TweetFeatures(arrays["ids"], matrix)
+	finally:
+		arrays.close()
+
+# Reads features from a dense store, a sparse .npz or an older pickle of tweet id to feature vector. A
+# pickle filename that no longer exists is read from the dense store that replaced it, e.g.
+# word2vec_average.p from word2vec_average.npy. Vectors of a pickle whose shape differs from the first
+# one's are skipped, as the classifiers used to do
+def load_features(filename):
+	if filename.endswith(".npz"): return read_sparse_features(filename)
+	if filename.endswith(".npy") or (not os.path.exists(filename) and is_dense_store(filename)): return read_dense_features(filename)
+	with open(filename, "rb") as input_file:
+		vectors = pickle.load(input_file)
+	tweet_ids = [tweet_id for tweet_id in vectors if str(tweet_id).isdigit()]
+	if len(tweet_ids) == 0: return TweetFeatures(np.zeros(0, dtype=np.int64), np.zeros((0, 0)))
+	shape = np.shape(vectors[tweet_ids[0]])
+	kept = []
+	for tweet_id in tweet_ids:
+		if np.shape(vectors[tweet_id]) == shape: kept.append(tweet_id)
+		else: print "skipping tweet due to weird dimension:", tweet_id
+	return sorted_features(kept, np.vstack([np.ravel(vectors[tweet_id]) for tweet_id in kept]))
+
+# Stacks the rows of several feature matrices, keeping them sparse if any of them is
+def stack_rows(matrices):
+	if any(scipy.sparse.issparse(matrix) for matrix in matrices): return scipy.sparse.vstack(matrices, format="csr")
+	return np.vstack(matrices)
+
+if __name__ == "__main__":
+	import argparse
+	import glob
+	parser = argparse.ArgumentParser()
+	parser.add_argument("-i", "--input_globs", nargs="+", required=True) # e.g. data/*/word2vec_average.p
+	parser.add_argument("-t", "--model", default="word2vec")
+	parser.add_argument("-e", "--sentence_embedding") # e.g. average
+	parser.add_argument("-r", "--remove", action="store_true") # delete each pickle once its store reads back the same
+	args = parser.parse_args()
+
+	# Convert older pickles of tweet id to feature vector to dense stores next to them
+	for input_glob in args.input_globs:
+		for filename in sorted(glob.glob(input_glob)):
+			features = load_features(filename)
+			output_filename = os.path.splitext(filename)[0] + ".npy"
+			write_dense_features(output_filename, features.ids, features.matrix, {"model": args.model, "aggregation": args.sentence_embedding})
+			store = read_dense_features(output_filename)
+			assert(np.array_equal(store.ids, features.ids) and np.array_equal(store.matrix, features.matrix)), "%s differs from %s" % (output_filename, filename)
+			size = sum(os.path.getsize(store_filename) for store_filename in dense_filenames(output_filename))
+			print "Wrote %d tweets to %s, %d bytes in place of %d" % (len(store), output_filename, size, os.path.getsize(filename))
+			if args.remove: os.remove(filename)
@@ -0,0 +1,529 @@
+from rate_limiter import RateLimitScheduler, TokenBucket, STATUSES_LOOKUP
+from scrape_metrics import ScrapeMetrics
+import Queue
+import heapq
+import random
+import threading
+import time
+
+MAX_QUERIES = 100
+
+# Splits an iterable of tweet ids in to lists of at most batch_size ids, including the trailing partial batch
+def batches(tweet_ids, batch_size=MAX_QUERIES):
+	batch = []
+	for tweet_id in tweet_ids:
+		batch.append(tweet_id)
+		if len(batch) == batch_size:
+			yield batch
+			batch = []
+	if len(batch) > 0: yield batch
+
+# Ids that come back missing from a successful lookup are retried after RETRY_DELAY seconds, doubling
+# with every further miss, and are given up on as deleted or protected after MAX_MISSES misses
+RETRY_DELAY = 30
+MAX_MISSES = 3
+# Ids whose request failed outright this many times in a row are left for the next run, and once every
+# credential's requests have failed this many times in a row, e.g. because they are revoked or the
+# network is down, the run stops and leaves everything it has not fetched for the next run. Either way
+# a run always ends
+MAX_ERRORS = 3
+
+# Indexed retry queue. For each id it keeps how often it has gone missing and when it may next be
+# tried, with a heap over the eligible times so that due ids come out in order. Ids that missed too
+# often move to the dead set and are never requested again. Ids whose requests failed too often in a
+# row move to the failed set, which only lasts for this run: they keep their count of misses, so they
+# are persisted with the other retries and tried again by the next run. Ids that have been popped for
+# a retry stay in counts until their batch is recorded, so they are never queued twice
+class RetryQueue(object):
+	def __init__(self, counts=None, max_misses=MAX_MISSES, retry_delay=RETRY_DELAY, max_errors=MAX_ERRORS):
+		self.max_misses = max_misses
+		self.retry_delay = retry_delay
+		self.max_errors = max_errors
+		self.counts = {}
+		self.eligible = {}
+		self.heap = []
+		self.dead = set()
+		self.errors = {}
+		self.failed = set()
+		now = time.time()
+		if counts is not None:
+			for tweet_id in counts: self.add(tweet_id, counts[tweet_id], now)
+
+	def add(self, tweet_id, misses, eligible):
+		self.counts[tweet_id] = misses
+		if misses >= self.max_misses:
+			self.eligible.pop(tweet_id, None)
+			self.dead.add(tweet_id)
+			return
+		self.eligible[tweet_id] = eligible
+		heapq.heappush(self.heap, (eligible, tweet_id))
+
+	# The id was left out of a successful response, so it may well be deleted or protected: back off
+	def miss(self, tweet_id, now):
+		self.errors.pop(tweet_id, None)
+		misses = self.counts.get(tweet_id, 0) + 1
+		self.add(tweet_id, misses, now + self.retry_delay*2**(misses - 1))
+
+	# The whole request failed, which says nothing about the id itself: retry it straight away, unless
+	# its requests have now failed max_errors times in a row. A rate limit error is not counted, since
+	# the credential is rested until its window reopens
+	def error(self, tweet_id, now, counted=True):
+		misses = self.counts.get(tweet_id, 0)
+		errors = self.errors.get(tweet_id, 0) + (1 if counted else 0)
+		if errors >= self.max_errors: return self.abandon(tweet_id)
+		self.errors[tweet_id] = errors
+		self.add(tweet_id, misses, now)
+
+	# Leaves the id for the next run, keeping its count of misses
+	def abandon(self, tweet_id):
+		self.counts[tweet_id] = self.counts.get(tweet_id, 0)
+		self.errors.pop(tweet_id, None)
+		self.eligible.pop(tweet_id, None)
+		self.failed.add(tweet_id)
+
+	def discard(self, tweet_id):
+		self.counts.pop(tweet_id, None)
+		self.eligible.pop(tweet_id, None)
+		self.dead.discard(tweet_id)
+		self.errors.pop(tweet_id, None)
+		self.failed.discard(tweet_id)
+
+	# Pops up to n ids that are due at the given time. Heap entries left behind by a later add or a
+	# discard no longer match the id's eligible time and are skipped
+	def pop_due(self, n, now):
+		due = []
+		while len(self.heap) > 0 and len(due) < n and self.heap[0][0] <= now:
+			eligible, tweet_id = heapq.heappop(self.heap)
+			if self.eligible.get(tweet_id) != eligible: continue
+			del self.eligible[tweet_id]
+			due.append(tweet_id)
+		return due
+
+	def next_due(self):
+		while len(self.heap) > 0 and self.eligible.get(self.heap[0][1]) != self.heap[0][0]: heapq.heappop(self.heap)
+		return self.heap[0][0] if len(self.heap) > 0 else None
+
+	def __len__(self):
+		return len(self.eligible)
+
+	def __contains__(self, tweet_id):
+		return tweet_id in self.counts
+
+# Shared, thread-safe home for everything the workers collect. Tweets are kept in tweet_text keyed by
+# id_str (to_record decides what is stored per tweet, e.g. the whole Status or only its text), and ids
+# that could not be fetched wait in the retry queue, which is persisted as a dict of id to number of
+# misses. If a journal is given, every batch is appended to it as soon as it is recorded
+class ResultStore(object):
+	def __init__(self, tweet_text=None, retry_counts=None, to_record=None, journal=None):
+		self.lock = threading.RLock()
+		self.tweet_text = tweet_text if tweet_text is not None else {}
+		self.retries = RetryQueue(retry_counts)
+		self.to_record = to_record if to_record is not None else (lambda tweet: tweet)
+		self.journal = journal
+
+	def record(self, tweet_ids, tweets):
+		with self.lock:
+			now = time.time()
+			successes = {}
+			for tweet in tweets: successes[tweet.id_str] = self.to_record(tweet)
+			for tweet_id in successes: self.retries.discard(tweet_id)
+			failures = {}
+			for tweet_id in tweet_ids:
+				if tweet_id in successes: continue
+				self.retries.miss(tweet_id, now)
+				failures[tweet_id] = self.retries.counts[tweet_id]
+			if self.journal is not None: self.journal.append(successes, failures)
+			self.tweet_text.update(successes)
+			return len(successes), len(failures)
+
+	def fail(self, tweet_ids, counted=True):
+		with self.lock:
+			now = time.time()
+			for tweet_id in tweet_ids: self.retries.error(tweet_id, now, counted)
+			if self.journal is not None: self.journal.append({}, dict((tweet_id, self.retries.counts[tweet_id]) for tweet_id in tweet_ids))
+
+	def abandon(self, tweet_ids):
+		with self.lock:
+			for tweet_id in tweet_ids: self.retries.abandon(tweet_id)
+			if self.journal is not None: self.journal.append({}, dict((tweet_id, self.retries.counts[tweet_id]) for tweet_id in tweet_ids))
+
+	def pop_retries(self, n, now):
+		with self.lock:
+			return self.retries.pop_due(n, now)
+
+	def next_retry(self):
+		with self.lock:
+			return self.retries.next_due()
+
+	def num_retries(self):
+		return len(self.retries)
+
+	def num_dead(self):
+		return len(self.retries.dead)
+
+	def num_failed(self):
+		return len(self.retries.failed)
+
+	# An id is done with its first pass once it has been fetched, is waiting to be retried or has been
+	# given up on. All of these are hashed collections, so this is O(1) per id
+	def __contains__(self, tweet_id):
+		return tweet_id in self.tweet_text or tweet_id in self.retries
+
+	# Lazily drops the ids that are already done, so a resumed run never spends quota on them again
+	def unfetched(self, tweet_ids):
+		for tweet_id in tweet_ids:
+			if tweet_id not in self: yield tweet_id
+
+	def num_collected(self):
+		return len(self.tweet_text)
+
+	def snapshot(self):
+		with self.lock:
+			return dict(self.tweet_text), dict(self.retries.counts)
+
+# Lets one engine run feed several ResultStores at once, e.g. one per output file, by remembering which
+# store each in-flight id belongs to. Batches can then mix ids from different stores
+class RoutedStore(object):
+	def __init__(self, stores):
+		self.lock = threading.RLock()
+		self.stores = stores
+		self.owners = {}
+
+	def route(self, tweet_id, store):
+		with self.lock:
+			self.owners[tweet_id] = store
+
+	def split(self, tweet_ids):
+		with self.lock:
+			ids_by_store = {}
+			for tweet_id in tweet_ids: ids_by_store.setdefault(self.owners.pop(tweet_id), []).append(tweet_id)
+			return ids_by_store
+
+	def record(self, tweet_ids, tweets):
+		tweets_by_id = dict((tweet.id_str, tweet) for tweet in tweets)
+		num_successful, num_unsuccessful = 0, 0
+		for store, store_ids in self.split(tweet_ids).items():
+			store_tweets = [tweets_by_id[tweet_id] for tweet_id in store_ids if tweet_id in tweets_by_id]
+			successful, unsuccessful = store.record(store_ids, store_tweets)
+			num_successful, num_unsuccessful = num_successful + successful, num_unsuccessful + unsuccessful
+		return num_successful, num_unsuccessful
+
+	def fail(self, tweet_ids, counted=True):
+		for store, store_ids in self.split(tweet_ids).items(): store.fail(store_ids, counted)
+
+	def abandon(self, tweet_ids):
+		for store, store_ids in self.split(tweet_ids).items(): store.abandon(store_ids)
+
+	def pop_retries(self, n, now):
+		due = []
+		for store in self.stores:
+			for tweet_id in store.pop_retries(n - len(due), now):
+				self.route(tweet_id, store)
+				due.append(tweet_id)
+		return due
+
+	def next_retry(self):
+		times = [t for t in [store.next_retry() for store in self.stores] if t is not None]
+		return min(times) if len(times) > 0 else None
+
+	def num_retries(self):
+		return sum(store.num_retries() for store in self.stores)
+
+	def num_dead(self):
+		return sum(store.num_dead() for store in self.stores)
+
+	def num_failed(self):
+		return sum(store.num_failed() for store in self.stores)
+
+	def num_collected(self):
+		return sum(store.num_collected() for store in self.stores)
+
+# Hydrates batches of tweet ids with one worker thread per API handle (i.e. per app credential). Each
+# worker draws on its own credential's token bucket in the scheduler, so N credentials give roughly N
+# times the throughput of walking the ids serially and no one sleeps longer than the API requires.
+# Failed ids are retried from the store's retry queue in the same run. Any object with a
+# statuses_lookup(ids) method can be used as an api, which is how the engine is exercised against
+# FakeLookupAPI below. Latencies, waits and checkpoint times are recorded in metrics. errors counts the
+# requests of each credential that failed in a row, and once all of them reach MAX_ERRORS the run is
+# aborted: workers hand back the batches they take and the retries left are abandoned to the next run
+class FetchEngine(object):
+	def __init__(self, apis, store, scheduler=None, metrics=None):
+		self.apis = apis
+		self.store = store
+		self.scheduler = scheduler if scheduler is not None else RateLimitScheduler(len(apis))
+		self.metrics = metrics if metrics is not None else ScrapeMetrics(len(apis))
+		self.condition = threading.Condition()
+		self.in_flight = 0
+		self.errors = [0]*len(apis)
+		self.aborted = False
+
+	def run_batch(self, credential, tweet_ids):
+		api = self.apis[credential]
+		start = time.time()
+		try:
+			tweets = api.statuses_lookup(tweet_ids)
+		except Exception as e:
+			self.metrics.request(credential, time.time() - start, len(tweet_ids), error=True)
+			response = getattr(e, 'response', None)
+			headers = getattr(response, 'headers', None)
+			reset = None
+			rate_limited = getattr(response, 'status_code', None) == 429
+			if rate_limited and headers is not None and 'x-rate-limit-reset' in headers:
+				reset = float(headers['x-rate-limit-reset'])
+			wait = self.scheduler.backoff(credential, reset=reset, rate_limited=rate_limited)
+			if not rate_limited:
+				with self.condition:
+					self.errors[credential] += 1
+					if min(self.errors) >= MAX_ERRORS and not self.aborted:
+						self.aborted = True
+						# Workers waiting out a backoff are woken to abandon the batches still queued
+						self.scheduler.stop()
+						print "Every credential failed %d requests in a row, leaving the remaining tweets for the next run" % MAX_ERRORS
+			print "Batch call to twitter failed (%s), adding %d tweets to retry queue and resting credential %d for %.1fs" % (e, len(tweet_ids), credential, wait)
+			start = time.time()
+			self.store.fail(tweet_ids, counted=not rate_limited)
+			self.metrics.checkpoint("journal", time.time() - start)
+			return
+		self.metrics.request(credential, time.time() - start, len(tweet_ids), len(tweets))
+		self.errors[credential] = 0
+		self.scheduler.succeeded(credential)
+		self.scheduler.update_from_headers(credential, getattr(getattr(api, 'last_response', None), 'headers', None))
+		start = time.time()
+		num_successful, num_unsuccessful = self.store.record(tweet_ids, tweets)
+		self.metrics.checkpoint("journal", time.time() - start)
+		print "\tSuccessfully collected %d tweets, need to retry %d" % (num_successful, num_unsuccessful)
+
+	def worker(self, credential, batch_queue, total):
+		while True:
+			# Only a credential that holds a token takes a batch, so the batch goes to whichever
+			# credential can serve it soonest. Once the scheduler is stopped, on shutdown or abort, this
+			# returns None straight away and the worker only drains the queue
+			waited = self.scheduler.acquire(credential)
+			start = time.time()
+			batch = batch_queue.get()
+			self.metrics.idle(credential, time.time() - start)
+			if batch is None or waited is None or self.aborted:
+				# The token was never spent on a request, so it is handed back
+				if waited is not None: self.scheduler.release(credential)
+				if batch is None: break
+				self.store.abandon(batch)
+			else:
+				self.metrics.rate_limit_wait(credential, waited)
+				self.run_batch(credential, batch)
+			self.metrics.maybe_flush()
+			with self.condition:
+				self.in_flight -= 1
+				self.condition.notify_all()
+			if total is None: print "Collected %d..." % self.store.num_collected()
+			else: print "Collected %d out of %d..." % (self.store.num_collected(), total)
+
+	def put(self, batch_queue, batch):
+		with self.condition: self.in_flight += 1
+		batch_queue.put(batch)
+
+	# Feeds the given batches to the workers, putting the retries that are due ahead of the next first-pass
+	# ids. Only full batches are sent while the first pass lasts, and the ids left over are carried in to
+	# the next batch, so no request is spent on a handful of ids. Once the first pass is exhausted,
+	# retries are gathered as they come due and fed in full batches, with a short one only at the very
+	# end, and the call returns when nothing is in flight and nothing is left to retry. The queue
+	# is bounded so that a lazily generated stream of batches is never fully materialised
+	def run(self, tweet_batches, total=None):
+		batch_queue = Queue.Queue(maxsize=2*len(self.apis))
+		workers = [threading.Thread(target=self.worker, args=(credential, batch_queue, total)) for credential in range(len(self.apis))]
+		for worker in workers:
+			worker.daemon = True
+			worker.start()
+		held = []
+		for batch in tweet_batches:
+			if self.aborted: break
+			held = self.store.pop_retries(MAX_QUERIES, time.time()) + held + batch
+			while len(held) >= MAX_QUERIES:
+				self.put(batch_queue, held[:MAX_QUERIES])
+				held = held[MAX_QUERIES:]
+		while True:
+			if self.aborted:
+				self.store.abandon(held + self.store.pop_retries(float("inf"), float("inf")))
+				held = []
+			else: held += self.store.pop_retries(MAX_QUERIES - len(held), time.time())
+			with self.condition:
+				next_retry = self.store.next_retry()
+				# A short batch is only sent once nothing in flight or waiting to come due could fill it up
+				if len(held) >= MAX_QUERIES or (len(held) > 0 and self.in_flight == 0 and next_retry is None): batch, held = held[:MAX_QUERIES], held[MAX_QUERIES:]
+				else:
+					batch = None
+					if self.in_flight == 0 and next_retry is None: break
+					# Wake up when a retry comes due or a batch in flight finishes and may add new retries
+					self.condition.wait(max(0.01, next_retry - time.time()) if next_retry is not None else 1.0)
+			if batch is not None: self.put(batch_queue, batch)
+		self.scheduler.stop()
+		for _ in workers: batch_queue.put(None)
+		for worker in workers: worker.join()
+		print "%d ids were given up on as deleted or protected" % self.store.num_dead()
+		if self.store.num_failed() > 0: print "%d ids failed too many requests in a row and are left for the next run" % self.store.num_failed()
+
+# Minimal stand-ins for tweepy objects so that the engine can be run locally without credentials
+class FakeStatus(object):
+	def __init__(self, tweet_id):
+		self.id = int(tweet_id)
+		self.id_str = str(tweet_id)
+		self.text = u"fake tweet %s" % tweet_id
+		self.created_at = None
+
+class FakeResponse(object):
+	def __init__(self, status_code, headers):
+		self.status_code = status_code
+		self.headers = headers
+
+class FakeRateLimitError(Exception):
+	def __init__(self, response):
+		Exception.__init__(self, "Rate limit exceeded")
+		self.response = response
+
+# Serves statuses_lookup from memory, taking latency seconds per call and dropping missing_rate of the ids.
+# Like twitter, it allows rate_limit calls per window seconds, reports x-rate-limit-* headers through
+# last_response and answers with a 429 once the window is used up
+class FakeLookupAPI(object):
+	def __init__(self, latency=0.05, missing_rate=0.0, rate_limit=None, window=15*60, random_seed=None):
+		self.latency = latency
+		self.missing_rate = missing_rate
+		self.rate_limit = rate_limit
+		self.window = window
+		self.random = random.Random(random_seed)
+		self.num_calls = 0
+		self.window_start = time.time()
+		self.window_calls = 0
+		self.last_response = None
+
+	def statuses_lookup(self, tweet_ids):
+		self.num_calls += 1
+		time.sleep(self.latency)
+		now = time.time()
+		if now - self.window_start >= self.window: self.window_start, self.window_calls = now, 0
+		if self.rate_limit is not None:
+			headers = {
+				'x-rate-limit-limit': str(self.rate_limit),
+				'x-rate-limit-remaining': str(max(0, self.rate_limit - self.window_calls - 1)),
+				'x-rate-limit-reset': repr(self.window_start + self.window),
+			}
+			if self.window_calls >= self.rate_limit: raise FakeRateLimitError(FakeResponse(429, headers))
+			self.last_response = FakeResponse(200, headers)
+		self.window_calls += 1
+		return [FakeStatus(tweet_id) for tweet_id in tweet_ids if self.random.random() >= self.missing_rate]
+
+# Answers with a 429 until the given time, giving a reset time that has already passed by our clock, as
+# a server whose clock is behind ours would
+class SkewedRateLimitAPI(FakeLookupAPI):
+	def __init__(self, limited_until, skew=1.0):
+		FakeLookupAPI.__init__(self, latency=0.0)
+		self.limited_until = limited_until
+		self.skew = skew
+
+	def statuses_lookup(self, tweet_ids):
+		if time.time() < self.limited_until:
+			self.num_calls += 1
+			headers = {'x-rate-limit-limit': '900', 'x-rate-limit-remaining': '0', 'x-rate-limit-reset': repr(time.time() - self.skew)}
+			raise FakeRateLimitError(FakeResponse(429, headers))
+		return FakeLookupAPI.statuses_lookup(self, tweet_ids)
+
+# Fails every request, like a revoked credential or a network that is down
+class FailingLookupAPI(object):
+	def statuses_lookup(self, tweet_ids):
+		raise Exception("Could not authenticate you")
+
+def test_failing_credential(num_tweets=250):
+	tweet_ids = [str(i) for i in range(num_tweets)]
+	store = ResultStore()
+	engine = FetchEngine([FailingLookupAPI()], store)
+	start = time.time()
+	engine.run(batches(tweet_ids), total=num_tweets)
+	# Ids that were never requested are left to the next run's first pass, the others are persisted as
+	# retries, so the next run tries them again
+	assert(engine.aborted and store.num_retries() == 0 and store.num_failed() == len(store.snapshot()[1]) > 0), "%d of %d ids failed" % (store.num_failed(), num_tweets)
+	print "A credential that always fails gave up on its %d ids after %.1fs" % (num_tweets, time.time() - start)
+
+# With the scheduler's limits the same as the API's, the buckets follow the API's windows from its
+# headers and no request is ever refused, and run() returns without waiting for a window to reopen
+def test_rate_limits(num_batches=12, num_apis=2, rate_limit=5, window=2):
+	tweet_ids = [str(i) for i in range(num_batches*MAX_QUERIES)]
+	store = ResultStore()
+	apis = [FakeLookupAPI(latency=0.0, rate_limit=rate_limit, window=window) for _ in range(num_apis)]
+	engine = FetchEngine(apis, store, scheduler=RateLimitScheduler(num_apis, {STATUSES_LOOKUP: (rate_limit, window)}))
+	start = time.time()
+	engine.run(batches(tweet_ids), total=len(tweet_ids))
+	elapsed = time.time() - start
+	num_errors = sum(credential.errors for credential in engine.metrics.credentials)
+	assert(num_errors == 0 and len(store.tweet_text) == len(tweet_ids)), "%d requests were rate limited" % num_errors
+	num_windows = (num_batches - 1)//(num_apis*rate_limit)
+	assert(elapsed < (num_windows + 0.5)*window), "Took %.1fs to use %d windows of %ds" % (elapsed, num_windows, window)
+	print "%d batches on %d credentials of %d per %ds took %.1fs without being rate limited" % (num_batches, num_apis, rate_limit, window, elapsed)
+
+# A credential that is rate limited for a long time must not hold on to batches the others could serve:
+# the fast credential drains the queue and run() returns without waiting for the slow one's window
+def test_slow_credential(num_batches=6, slow_window=20):
+	tweet_ids = [str(i) for i in range(num_batches*MAX_QUERIES)]
+	store = ResultStore()
+	apis = [FakeLookupAPI(latency=0.01, rate_limit=1, window=slow_window), FakeLookupAPI(latency=0.01)]
+	scheduler = RateLimitScheduler(len(apis))
+	scheduler.buckets[(0, STATUSES_LOOKUP)] = TokenBucket(1, slow_window)
+	engine = FetchEngine(apis, store, scheduler=scheduler)
+	start = time.time()
+	engine.run(batches(tweet_ids), total=len(tweet_ids))
+	elapsed = time.time() - start
+	assert(len(store.tweet_text) == len(tweet_ids)), "Collected %d out of %d tweets" % (len(store.tweet_text), len(tweet_ids))
+	assert(apis[0].num_calls <= 1 and apis[1].num_calls >= num_batches - 1), "Slow credential served %d batches, fast one %d" % (apis[0].num_calls, apis[1].num_calls)
+	assert(elapsed < slow_window/4.0), "Took %.1fs with a credential of 1 call per %ds" % (elapsed, slow_window)
+	print "The fast credential served %d of %d batches while the slow one was limited, in %.1fs" % (apis[1].num_calls, num_batches, elapsed)
+
+# Due retries are folded in to full batches rather than sent alongside them, so nearly every request
+# carries MAX_QUERIES ids even when a fifth of every batch goes missing
+def test_full_batches(num_tweets=20000, missing_rate=0.2, retry_delay=0.05):
+	tweet_ids = [str(i) for i in range(num_tweets)]
+	store = ResultStore()
+	store.retries.retry_delay = retry_delay
+	apis = [FakeLookupAPI(latency=0.0, missing_rate=missing_rate, random_seed=i) for i in range(2)]
+	engine = FetchEngine(apis, store)
+	engine.run(batches(tweet_ids), total=num_tweets)
+	num_requests = sum(api.num_calls for api in apis)
+	num_requested = sum(credential.ids_requested for credential in engine.metrics.credentials)
+	assert(num_requested >= 0.9*MAX_QUERIES*num_requests), "%d requests for %d ids, %.0f ids per request" % (num_requests, num_requested, float(num_requested)/num_requests)
+	print "%d requests for %d ids, %.0f ids per request" % (num_requests, num_requested, float(num_requested)/num_requests)
+
+# A 429 whose reset time is already past must still rest the credential, rather than let it retry
+# straight away on the tokens left in its bucket
+def test_skewed_reset(num_tweets=500, limited_for=1.5):
+	tweet_ids = [str(i) for i in range(num_tweets)]
+	store = ResultStore()
+	api = SkewedRateLimitAPI(time.time() + limited_for)
+	engine = FetchEngine([api], store)
+	start = time.time()
+	engine.run(batches(tweet_ids), total=num_tweets)
+	num_limited = sum(credential.errors for credential in engine.metrics.credentials)
+	assert(len(store.tweet_text) == num_tweets), "Collected %d out of %d tweets" % (len(store.tweet_text), num_tweets)
+	assert(num_limited <= 2), "%d requests were rate limited in %.1fs" % (num_limited, limited_for)
+	print "%d requests were rate limited with a reset in the past, collected everything in %.1fs" % (num_limited, time.time() - start)
+
+def test_fetch_engine(num_tweets=4000, num_apis=4, latency=0.05, rate_limit=None, window=15*60):
+	tweet_ids = [str(i) for i in range(num_tweets)]
+	elapsed = {}
+	for n in [1, num_apis]:
+		store = ResultStore()
+		apis = [FakeLookupAPI(latency=latency, rate_limit=rate_limit, window=window) for _ in range(n)]
+		engine = FetchEngine(apis, store)
+		start = time.time()
+		engine.run(batches(tweet_ids), total=num_tweets)
+		elapsed[n] = time.time() - start
+		engine.metrics.print_summary()
+		assert(len(store.tweet_text) == num_tweets), "Collected %d out of %d tweets" % (len(store.tweet_text), num_tweets)
+		assert(store.num_retries() == 0), "%d tweets left to retry" % store.num_retries()
+	print "1 credential took %.2fs, %d credentials took %.2fs" % (elapsed[1], num_apis, elapsed[num_apis])
+
+if __name__ == "__main__":
+	test_fetch_engine()
+	# Each fake credential allows 10 calls every 2 seconds, so this run has to wait on the limits
+	test_fetch_engine(num_tweets=4000, num_apis=4, latency=0.0, rate_limit=10, window=2)
+	test_rate_limits()
+	test_rate_limits(num_batches=5, num_apis=2, rate_limit=3, window=30)
+	test_slow_credential()
+	test_full_batches()
+	test_skewed_reset()
+	test_failing_credential()
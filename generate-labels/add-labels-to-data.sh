@@ -0,0 +1,20 @@
+# Adds the labels merged by merge-labels.py as version $1 of every event's labels.versions, e.g.
+# generate-labels/add-labels-to-data.sh labels-03112017
+add() { python label_versions.py add -d data/$2 -v $1 -i generate-labels/$1/$3-$1.p; }
+add $1 california_earthquake 2014_California_Earthquake
+add $1 chile_earthquake 2014_Chile_Earthquake_en
+add $1 non-english/chile_earthquake_es 2014_Chile_Earthquake_cl
+add $1 cyclone_pam 2015_Cyclone_Pam_en
+add $1 ebola 2014_ebola_cf
+add $1 hurricane_mexico 2014_Hurricane_Odile_Mexico_en
+add $1 iceland_volcano 2014_Iceland_Volcano_en
+add $1 india_floods 2014_India_floods
+add $1 landslides_ww_en Landslides_Worldwide_en
+add $1 non-english/landslides_ww_es Landslides_Worldwide_esp
+add $1 non-english/landslides_ww_fr Landslides_Worldwide_fr
+add $1 malaysia_flight 2014_Malaysia_Airline_MH370_en
+add $1 mers 2014_Middle_East_Respiratory_Syndrome_en
+add $1 nepal_earthquake 2015_Nepal_Earthquake_en
+add $1 pakistan_earthquake 2013_Pakistan_eq
+add $1 pakistan_floods 2014_Pakistan_floods
+add $1 philipines_typhoon 2014_Philippines_Typhoon_Hagupit_en
@@ -1,9 +1,11 @@
 import os
+import sys
 import argparse
-import pickle
 import csv
-import glob
-import numpy as np
+import multiprocessing
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from label_store import CLASS_NAMES, write_label_store
 
 def find_csv_file_path(quake_dir):
     try:
@@ -22,7 +24,16 @@ def remove_bad_files(files, to_filter):
         new_files.append(file)
     return new_files
 
-def merge_labels_into_one_hot(paid_csv, volunteer_csv, output_path):
+# Sets the mapping tables in a worker process once, when the pool starts it
+def init_worker(matching, indices, weird):
+    global matching_labels, labels_indices, weird_labels
+    matching_labels, labels_indices, weird_labels = matching, indices, weird
+
+def merge_event(event):
+    quake_dir, paid_csv, volunteer_csv, output_path = event
+    return quake_dir, merge_labels(paid_csv, volunteer_csv, output_path)
+
+def merge_labels(paid_csv, volunteer_csv, output_path):
     labels = dict()
     
     if paid_csv is not None:
@@ -55,10 +66,11 @@ def merge_labels_into_one_hot(paid_csv, volunteer_csv, output_path):
 
     print "Done loading labels."
 
-    print "Converting labels into one-hot vectors"
-    labels_vectors = dict()
+    # Keep only the class index of each tweet. The store writes them as an int8 column next to the
+    # sorted tweet ids, and consumers expand them to one-hot vectors when they need to
+    print "Converting labels into class indices"
+    label_classes = dict()
     for tweetid in labels:
-        vec = np.zeros(len(labels_indices.keys()))
         label = labels[tweetid]
         if "paid" in label:
             label = label["paid"]
@@ -66,20 +78,20 @@ def merge_labels_into_one_hot(paid_csv, volunteer_csv, output_path):
             label = label["volunteer"]
         if label in weird_labels:
             continue
-        vec[labels_indices[label]] = 1.0
-        labels_vectors[tweetid] = vec
+        label_classes[tweetid] = labels_indices[label]
 
-    with open(output_path + "-labels-03112017.p", 'wb') as output_file:
-        pickle.dump(labels_vectors, output_file, protocol=pickle.HIGHEST_PROTOCOL)
+    write_label_store(output_path, label_classes, CLASS_NAMES)
 
-    print "Wrote %d labels out to %s" % (len(labels_vectors), output_path)
-    return len(labels_vectors)
+    print "Wrote %d labels out to %s" % (len(label_classes), output_path)
+    return len(label_classes)
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument("-pl", "--paid")
     parser.add_argument("-vl", "--volunteer")
     parser.add_argument("-o", "--outputdir")
+    parser.add_argument("-n", "--workers", default=1, type=int) # events to merge at once
+    parser.add_argument("-v", "--version", default="labels-03112017") # name the labels are added to each event's labels.versions under
     args = parser.parse_args()
 
     weird_labels = ['yes', 'no']
@@ -118,35 +130,17 @@ if __name__ == '__main__':
         'praying': 'sympathy_and_emotional_support',
     }
 
-    labels_indices = {
-        'not_related_or_irrelevant': 0,
-        'donation_needs_or_offers_or_volunteering_services': 1,
-        'displaced_people_and_evacuations': 2,
-        'animal_management': 3,
-        'other_useful_information': 4,
-        'response_efforts': 5,
-        'caution_and_advice': 6,
-        'sympathy_and_emotional_support': 7,
-        'injured_or_dead_people': 8,
-        'missing_trapped_or_found_people': 9,
-        'infrastructure_and_utilities_damage': 10,
-        'diseases': 11,
-        'infected_people': 12,
-        'personal': 13,
-        'non-government': 14,
-        'physical_landslide': 15,
-        'not_physical_landslide': 16,
-        'traditional_media': 17,
-    }
+    labels_indices = dict((label, i) for i, label in enumerate(CLASS_NAMES))
 
     filter_files = ['Terms of use.txt', '.DS_Store', 'README.txt', '']
 
     print "Loading labels..."
-    total_labels = 0
 
     paid_dirs = remove_bad_files(list(os.listdir(args.paid)), filter_files)
     volunteer_dirs = remove_bad_files(list(os.listdir(args.volunteer)), filter_files)
 
+    # Find the csv files of every event up front, then merge the events independently of each other
+    events = []
     for quake_dir in paid_dirs:
         paid_csv = find_csv_file_path(args.paid + "/" + quake_dir)
         volunteer_csv = find_csv_file_path(args.volunteer + "/" + quake_dir)
@@ -154,10 +148,22 @@ if __name__ == '__main__':
         if quake_dir in volunteer_dirs:
             volunteer_dirs.remove(quake_dir)
 
-        total_labels += merge_labels_into_one_hot(paid_csv, volunteer_csv, args.outputdir + "/" + quake_dir)
+        events.append((quake_dir, paid_csv, volunteer_csv, args.outputdir + "/" + quake_dir + "-" + args.version + ".p"))
 
     for quake_dir in volunteer_dirs:
         volunteer_csv = find_csv_file_path(args.volunteer + "/" + quake_dir)
-        total_labels += merge_labels_into_one_hot(None, volunteer_csv, args.outputdir + "/" + quake_dir)
-
-    print total_labels
+        events.append((quake_dir, None, volunteer_csv, args.outputdir + "/" + quake_dir + "-" + args.version + ".p"))
+
+    # With several workers the events are merged in a pool, each worker getting the mapping tables once
+    # when it starts rather than with every event
+    if args.workers > 1:
+        pool = multiprocessing.Pool(args.workers, init_worker, (matching_labels, labels_indices, weird_labels))
+        counts = pool.map(merge_event, events, chunksize=1)
+        pool.close()
+        pool.join()
+    else:
+        counts = [merge_event(event) for event in events]
+
+    for quake_dir, count in counts:
+        print "%s: %d labels" % (quake_dir, count)
+    print "Total: %d labels over %d events" % (sum(count for _, count in counts), len(counts))
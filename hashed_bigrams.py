@@ -0,0 +1,69 @@
+from sklearn.feature_extraction.text import HashingVectorizer
+import itertools
+import numpy as np
+
+# Width of the hashed feature space. Distinct unigrams and bigrams beyond this share columns
+NUM_FEATURES = 2**20
+# Texts vectorized at once while fitting, which bounds the memory the fit needs
+BATCH_SIZE = 10000
+
+def iter_batches(iterable, size=BATCH_SIZE):
+	iterator = iter(iterable)
+	while True:
+		batch = list(itertools.islice(iterator, size))
+		if len(batch) == 0: return
+		yield batch
+
+# Unigram and bigram counts of cleaned tweets, hashed in to a fixed number of columns rather than looked
+# up in a vocabulary, so no vocabulary is built or pickled and any number of files can be streamed
+# through fit in batches. Fitting only counts how many texts each column appears in, in an array of
+# num_features ints, and keeps the columns that appear in at least min_df of them. The features of a
+# text are its counts in the kept columns, so the width is fixed once fitted and new tweets are
+# transformed without refitting. Like CountVectorizer, n-grams never seen in fitting are ignored.
+# sklearn 0.18 hashes with alternating signs and non_negative takes the absolute value of each column,
+# so two n-grams of one text that land in the same column can undercount it
+class HashedBigramModel(object):
+	def __init__(self, num_features=NUM_FEATURES, min_df=1):
+		self.vectorizer = HashingVectorizer(ngram_range=(1, 2), token_pattern=r'\b\w+\b', n_features=num_features, non_negative=True, norm=None)
+		self.min_df = min_df
+		self.document_frequency = np.zeros(num_features, dtype=np.int32)
+		self.num_documents = 0
+		self.columns = None
+
+	def partial_fit(self, texts):
+		features = self.vectorizer.transform(texts)
+		self.document_frequency += np.bincount(features.indices[features.data != 0], minlength=len(self.document_frequency)).astype(np.int32)
+		self.num_documents += len(texts)
+		self.columns = None
+		return self
+
+	def fit(self, texts):
+		for batch in iter_batches(texts): self.partial_fit(batch)
+		self.select_columns()
+		return self
+
+	def select_columns(self):
+		if self.columns is None: self.columns = np.flatnonzero(self.document_frequency >= self.min_df)
+		return self.columns
+
+	@property
+	def num_columns(self):
+		return len(self.select_columns())
+
+	# Returns the features of the texts as a scipy CSR matrix with num_columns columns
+	def transform(self, texts):
+		return self.vectorizer.transform(texts)[:, self.select_columns()].tocsr()
+
+if __name__ == "__main__":
+	from sklearn.feature_extraction.text import CountVectorizer
+	texts = ["the quake hit nepal", "nepal quake relief", "the relief the relief", "", "hit"]
+	model = HashedBigramModel(min_df=1).fit(iter(texts))
+	vectorizer = CountVectorizer(ngram_range=(1, 2), token_pattern=r'\b\w+\b', min_df=1).fit(texts)
+	# With this few n-grams nothing collides, so the hashed counts are the vocabulary counts, reordered
+	assert(model.num_columns == len(vectorizer.vocabulary_)), "%d columns for %d n-grams" % (model.num_columns, len(vectorizer.vocabulary_))
+	expected, actual = vectorizer.transform(texts).toarray(), model.transform(texts).toarray()
+	assert(sorted(map(tuple, expected.T)) == sorted(map(tuple, actual.T))), "Hashed counts differ from CountVectorizer's"
+	assert(model.transform(["unseen words only"]).nnz == 0 and model.transform(["x"]).shape[1] == model.num_columns)
+	pruned = HashedBigramModel(min_df=2).fit(texts)
+	assert(pruned.num_columns == len(CountVectorizer(ngram_range=(1, 2), token_pattern=r'\b\w+\b', min_df=2).fit(texts).vocabulary_))
+	print "Hashed bigrams match CountVectorizer on %d texts" % len(texts)
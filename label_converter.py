@@ -1,7 +1,7 @@
+from label_store import LabelStoreWriter
 import argparse
 import csv
 import glob
-import pickle
 import re
 
 parser = argparse.ArgumentParser()
@@ -10,25 +10,48 @@ parser.add_argument("-d", "--debug_every", default=100, type=int)
 args = parser.parse_args()
 
 LABEL_KEY_LIST = ['choose_one_category','label']
+NON_DIGIT_REGEX = re.compile("[^0-9]")
+
+# Streams (tweet_id, label) pairs from a label csv, one row in memory at a time. Universal newline mode
+# reads files ending their lines in \r (as the exports here do), \n or \r\n alike, and the csv module
+# keeps quoted fields with commas in them in one piece. The label column is the last of LABEL_KEY_LIST
+# found in the header. Rows too short to hold both columns are counted and skipped
+def read_labels(filename):
+	with open(filename, 'rU') as f:
+		reader = csv.reader(f)
+		key = [column.strip() for column in next(reader)]
+		label_keys = [label_key for label_key in LABEL_KEY_LIST if label_key in key]
+		assert('tweet_id' in key and len(label_keys) > 0), "%s has no tweet_id or label column: %s" % (filename, key)
+		tweet_id_idx, label_idx = key.index('tweet_id'), key.index(label_keys[-1])
+		num_columns = max(tweet_id_idx, label_idx) + 1
+		num_skipped = 0
+		for row in reader:
+			if len(row) < num_columns:
+				if len(row) > 0: num_skipped += 1
+				continue
+			yield NON_DIGIT_REGEX.sub("", row[tweet_id_idx]), row[label_idx]
+		if num_skipped > 0: print "Skipped %d rows of %s with fewer than %d columns" % (num_skipped, filename, num_columns)
+
 labels_filenames = glob.glob(args.labels_blob)
 print "Found %d input files" % len(labels_filenames)
 
+# Each file's labels are streamed in to a label store, with every distinct label as a class in the
+# order it is first seen. The store is written as the .p that tweepy_scraper2.py reads the ids of
 for filename in labels_filenames:
-	labels = {}
 	output_filename = filename.split('.')[0] + ".p"
 	print "Saving output at ", output_filename
-	# Initialize objects and csv reader
-	with open(filename, 'rb') as f:
-		rows = f.readlines()[0].split('\r')
-		key = rows[0].split(',')
-		tweet_id_idx = key.index('tweet_id')
-		for label_key in LABEL_KEY_LIST:
-			if label_key in key: label_idx = key.index(label_key)
-		for row in rows[1:]:
-			try:
-				row = row.split(',')
-				c, tweet_id = row[label_idx], row[tweet_id_idx]
-				labels[re.sub("[^0-9]", "", tweet_id)] = c
-			except:
-				print "Failed label parse: %s" % row
-	with open(output_filename, "wb") as output_file: pickle.dump(labels, output_file)
\ No newline at end of file
+	class_names = []
+	class_indices = {}
+	writer = LabelStoreWriter(output_filename, class_names)
+	num_missing_ids = 0
+	for tweet_id, label in read_labels(filename):
+		if len(tweet_id) == 0:
+			num_missing_ids += 1
+			continue
+		if label not in class_indices:
+			assert(len(class_names) < 128), "%s has more distinct labels than fit in an int8 class" % filename
+			class_indices[label] = len(class_names)
+			class_names.append(label)
+		writer.add(int(tweet_id), class_indices[label])
+	if num_missing_ids > 0: print "Skipped %d rows of %s without a tweet id" % (num_missing_ids, filename)
+	print "Read %d labels in %d classes" % (writer.close(), len(class_names))
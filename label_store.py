@@ -0,0 +1,316 @@
+from tweet_store import open_columns, write_columns
+import array
+import heapq
+import os
+import pickle
+import numpy as np
+
+MAGIC = "TWLABEL1"
+VERSIONS_MAGIC = "TWLABVS1"
+# Every version of an event's labels lives in one file of this name in the event's directory
+VERSIONS_FILENAME = "labels.versions"
+# Class of a tweet that has no label, and in a diff, of a tweet whose label was removed
+MISSING_CLASS = -1
+
+# The classes that generate-labels/merge-labels.py maps every event's labels on to, by class index
+CLASS_NAMES = [
+	'not_related_or_irrelevant',
+	'donation_needs_or_offers_or_volunteering_services',
+	'displaced_people_and_evacuations',
+	'animal_management',
+	'other_useful_information',
+	'response_efforts',
+	'caution_and_advice',
+	'sympathy_and_emotional_support',
+	'injured_or_dead_people',
+	'missing_trapped_or_found_people',
+	'infrastructure_and_utilities_damage',
+	'diseases',
+	'infected_people',
+	'personal',
+	'non-government',
+	'physical_landslide',
+	'not_physical_landslide',
+	'traditional_media',
+]
+
+# Expands class indices to one-hot rows, only when a model needs them
+def one_hot(classes, num_classes, dtype=np.float64):
+	vectors = np.zeros((len(classes), num_classes), dtype=dtype)
+	vectors[np.arange(len(classes)), classes] = 1
+	return vectors
+
+# Labels of a set of tweets as two aligned columns: the tweet ids as sorted int64 and the index of each
+# tweet's class as int8. class_names gives the name of each class index, where it is known. Looking up
+# a batch of ids is one searchsorted over the id column
+class LabelStore(object):
+	def __init__(self, ids, classes, class_names=None, num_classes=None):
+		self.ids = ids
+		self.classes = classes
+		self.class_names = class_names
+		self.num_classes = num_classes if num_classes is not None else len(class_names)
+
+	@classmethod
+	def open(cls, filename):
+		columns, meta = open_columns(filename, MAGIC)
+		return cls(columns["id"], columns["class"], meta["class_names"])
+
+	def __len__(self):
+		return len(self.ids)
+
+	def tweet_ids(self):
+		return [str(tweet_id) for tweet_id in self.ids]
+
+	# Returns where each of the tweet ids would be in the store, and whether it is there
+	def positions(self, tweet_ids):
+		return find_ids(self.ids, tweet_ids)
+
+	# Returns the class of each of the tweet ids, or MISSING_CLASS where it has no label
+	def lookup(self, tweet_ids):
+		positions, found = self.positions(tweet_ids)
+		classes = np.full(len(positions), MISSING_CLASS, dtype=np.int64)
+		classes[found] = self.classes[positions[found]]
+		return classes
+
+	def __contains__(self, tweet_id):
+		return self.lookup([tweet_id])[0] != MISSING_CLASS
+
+	def classes_of(self, tweet_ids):
+		classes = self.lookup(tweet_ids)
+		assert((classes != MISSING_CLASS).all()), "%d of the tweet ids have no label" % np.sum(classes == MISSING_CLASS)
+		return classes
+
+	def one_hot(self, classes=None, dtype=np.float64):
+		return one_hot(self.classes if classes is None else classes, self.num_classes, dtype)
+
+def as_ids(tweet_ids):
+	if isinstance(tweet_ids, np.ndarray): return tweet_ids.astype(np.int64)
+	return np.array([int(tweet_id) for tweet_id in tweet_ids], dtype=np.int64)
+
+# Returns where each of the tweet ids would be in a sorted id column, and whether it is there
+def find_ids(sorted_ids, tweet_ids):
+	ids = as_ids(tweet_ids)
+	positions = np.minimum(np.searchsorted(sorted_ids, ids), max(len(sorted_ids) - 1, 0))
+	found = sorted_ids[positions] == ids if len(sorted_ids) > 0 else np.zeros(len(ids), dtype=bool)
+	return positions, found
+
+# One version of a set of labels, seen through the base version it was recorded against: diff holds
+# the tweets whose class differs from the base, with MISSING_CLASS for labels the version removed.
+# Looking up tweets only searches the base and the diff, so nothing is built to open a version. The
+# full id and class columns are merged together the first time something asks for them
+class LabelVersion(LabelStore):
+	def __init__(self, base, diff, class_names=None, num_classes=None):
+		self.base = base
+		self.diff = diff
+		self.class_names = class_names
+		self.num_classes = num_classes if num_classes is not None else len(class_names)
+		self.materialized = None
+
+	def lookup(self, tweet_ids):
+		ids = as_ids(tweet_ids)
+		classes = self.base.lookup(ids)
+		positions, found = self.diff.positions(ids)
+		classes[found] = self.diff.classes[positions[found]]
+		return classes
+
+	def materialize(self):
+		if self.materialized is None:
+			ids = np.union1d(self.base.ids, self.diff.ids)
+			classes = self.lookup(ids)
+			labelled = classes != MISSING_CLASS
+			self.materialized = LabelStore(ids[labelled], classes[labelled].astype(np.int8), self.class_names, self.num_classes)
+		return self.materialized
+
+	@property
+	def ids(self):
+		return self.materialize().ids
+
+	@property
+	def classes(self):
+		return self.materialize().classes
+
+# The tweets whose class in labels differs from their class in base, and their class in labels
+def labels_diff(base, labels):
+	ids = np.union1d(base.ids, labels.ids)
+	base_classes, classes = base.lookup(ids), labels.lookup(ids)
+	changed = base_classes != classes
+	return LabelStore(ids[changed], classes[changed].astype(np.int8), labels.class_names, labels.num_classes)
+
+# Every version of one event's labels, kept as a base version plus, for each version, its diff against
+# the base. The base is a version whose diff is empty. Versions can use different sets of classes, as
+# the taxonomy has changed over time, so each one records its own. All of it is one file of columns:
+# the base's ids and classes, then the ids and classes of each version's diff
+class LabelVersions(object):
+	def __init__(self, base, versions):
+		self.base = base
+		# (name, diff, class_names, num_classes) of each version, in the order they were added
+		self.versions = versions
+
+	@classmethod
+	def create(cls, base_name, labels):
+		empty = LabelStore(np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int8), labels.class_names, labels.num_classes)
+		return cls(LabelStore(labels.ids, labels.classes, labels.class_names, labels.num_classes), [(base_name, empty, labels.class_names, labels.num_classes)])
+
+	@classmethod
+	def open(cls, filename):
+		columns, meta = open_columns(filename, VERSIONS_MAGIC)
+		base = LabelStore(columns["base_id"], columns["base_class"], meta["base_class_names"], meta["base_num_classes"])
+		versions = []
+		for i, version in enumerate(meta["versions"]):
+			diff = LabelStore(columns["diff%d_id" % i], columns["diff%d_class" % i], version["class_names"], version["num_classes"])
+			versions.append((version["name"], diff, version["class_names"], version["num_classes"]))
+		return cls(base, versions)
+
+	def names(self):
+		return [name for name, _, _, _ in self.versions]
+
+	def version(self, name):
+		for version_name, diff, class_names, num_classes in self.versions:
+			if version_name == name: return LabelVersion(self.base, diff, class_names, num_classes)
+		raise KeyError("No labels version %s, only %s" % (name, ", ".join(self.names())))
+
+	# Records labels as the named version, replacing any version of that name
+	def add(self, name, labels):
+		version = (name, labels_diff(self.base, labels), labels.class_names, labels.num_classes)
+		names = self.names()
+		if name in names: self.versions[names.index(name)] = version
+		else: self.versions.append(version)
+
+	# The tweets whose class differs between two versions, with their class in each. Both versions only
+	# differ from the base where their diffs do, so only the ids in the two diffs are compared
+	def changes(self, name_a, name_b):
+		a, b = self.version(name_a), self.version(name_b)
+		ids = np.union1d(a.diff.ids, b.diff.ids)
+		classes_a, classes_b = a.lookup(ids), b.lookup(ids)
+		changed = classes_a != classes_b
+		return ids[changed], classes_a[changed], classes_b[changed]
+
+	# Written next to the file and renamed over it, since the old file may still be mapped
+	def write(self, filename):
+		columns = [("base_id", np.asarray(self.base.ids)), ("base_class", np.asarray(self.base.classes))]
+		versions = []
+		for i, (name, diff, class_names, num_classes) in enumerate(self.versions):
+			columns.append(("diff%d_id" % i, np.asarray(diff.ids)))
+			columns.append(("diff%d_class" % i, np.asarray(diff.classes)))
+			versions.append({"name": name, "class_names": class_names, "num_classes": num_classes})
+		meta = {"base_class_names": self.base.class_names, "base_num_classes": self.base.num_classes, "versions": versions}
+		write_columns(filename + ".tmp", VERSIONS_MAGIC, columns, meta)
+		os.rename(filename + ".tmp", filename)
+
+# Sorts tweet ids numerically, dropping any that are not numbers, like the empty ids that rows with a
+# missing id used to leave behind
+def sorted_tweet_ids(tweet_ids):
+	return sorted([tweet_id for tweet_id in tweet_ids if str(tweet_id).isdigit()], key=int)
+
+def write_label_store(filename, labels, class_names):
+	tweet_ids = sorted_tweet_ids(labels)
+	columns = [
+		("id", np.array([int(tweet_id) for tweet_id in tweet_ids], dtype=np.int64)),
+		("class", np.array([labels[tweet_id] for tweet_id in tweet_ids], dtype=np.int8)),
+	]
+	write_columns(filename, MAGIC, columns, meta={"class_names": class_names})
+
+# Writes a label store from (tweet_id, class) pairs in any order without holding them all in memory.
+# Pairs are buffered run_size at a time, and each full buffer is sorted by id and spilled next to the
+# output as a run. close() merges the runs in to the id and class columns, which are then copied in to
+# the store from memory maps. Where an id is added more than once, the last class added wins, as it
+# would when filling a dict. class_names is only read by close(), so it can still grow while pairs are
+# added
+class LabelStoreWriter(object):
+	def __init__(self, filename, class_names, run_size=1 << 20):
+		self.filename = filename
+		self.class_names = class_names
+		self.run_size = run_size
+		self.ids = array.array('l')
+		self.classes = array.array('b')
+		self.runs = []
+		self.num_added = 0
+
+	def add(self, tweet_id, label_class):
+		self.ids.append(tweet_id)
+		self.classes.append(label_class)
+		self.num_added += 1
+		if len(self.ids) >= self.run_size: self.spill()
+
+	def spill(self):
+		if len(self.ids) == 0: return
+		ids, classes = np.array(self.ids, dtype=np.int64), np.array(self.classes, dtype=np.int8)
+		# A stable sort keeps repeated ids in the order they were added, so the last of each is kept
+		order = np.argsort(ids, kind="mergesort")
+		ids, classes = ids[order], classes[order]
+		last = np.append(ids[1:] != ids[:-1], True)
+		run_filename = "%s.run%d.npy" % (self.filename, len(self.runs))
+		np.save(run_filename, np.rec.fromarrays([ids[last], classes[last]], names="id,class"))
+		self.runs.append(run_filename)
+		self.ids, self.classes = array.array('l'), array.array('b')
+
+	# Every pair of the runs in order of id, and for the same id in the order the runs were written
+	def merged(self):
+		runs = [np.load(run_filename, mmap_mode="r") for run_filename in self.runs]
+		def pairs(i, run):
+			for row in run: yield int(row["id"]), i, int(row["class"])
+		previous = None
+		for tweet_id, _, label_class in heapq.merge(*[pairs(i, run) for i, run in enumerate(runs)]):
+			if previous is not None and previous[0] != tweet_id: yield previous
+			previous = (tweet_id, label_class)
+		if previous is not None: yield previous
+
+	# Writes the store and returns the number of labels in it
+	def close(self):
+		self.spill()
+		ids_filename, classes_filename = self.filename + ".ids.tmp", self.filename + ".classes.tmp"
+		num_labels = 0
+		with open(ids_filename, "wb") as ids_file, open(classes_filename, "wb") as classes_file:
+			ids, classes = array.array('l'), array.array('b')
+			for tweet_id, label_class in self.merged():
+				ids.append(tweet_id)
+				classes.append(label_class)
+				if len(ids) >= self.run_size:
+					np.array(ids, dtype=np.int64).tofile(ids_file)
+					np.array(classes, dtype=np.int8).tofile(classes_file)
+					num_labels += len(ids)
+					ids, classes = array.array('l'), array.array('b')
+			np.array(ids, dtype=np.int64).tofile(ids_file)
+			np.array(classes, dtype=np.int8).tofile(classes_file)
+			num_labels += len(ids)
+		if num_labels > 0: columns = [("id", np.memmap(ids_filename, dtype=np.int64, mode="r")), ("class", np.memmap(classes_filename, dtype=np.int8, mode="r"))]
+		else: columns = [("id", np.zeros(0, dtype=np.int64)), ("class", np.zeros(0, dtype=np.int8))]
+		write_columns(self.filename, MAGIC, columns, meta={"class_names": self.class_names})
+		del columns
+		for temp_filename in self.runs + [ids_filename, classes_filename]: os.remove(temp_filename)
+		self.runs = []
+		return num_labels
+
+def is_label_store(filename):
+	with open(filename, "rb") as input_file: return input_file.read(len(MAGIC)) == MAGIC
+
+# Reads labels from a store or an older pickle of tweet id to one-hot vector over CLASS_NAMES. Where
+# there is no such file, the name is looked up as a version in the directory's VERSIONS_FILENAME, so
+# e.g. data/nepal_earthquake/labels-03112017.p opens that version of nepal's labels
+def load_labels(filename):
+	if not os.path.exists(filename):
+		directory, name = os.path.split(filename)
+		versions_filename = os.path.join(directory, VERSIONS_FILENAME)
+		assert(os.path.exists(versions_filename)), "File %s not found, and there is no %s next to it" % (filename, VERSIONS_FILENAME)
+		return LabelVersions.open(versions_filename).version(os.path.splitext(name)[0])
+	if is_label_store(filename): return LabelStore.open(filename)
+	with open(filename, "rb") as input_file:
+		vectors = pickle.load(input_file)
+	tweet_ids = sorted_tweet_ids(vectors)
+	num_classes = len(vectors[tweet_ids[0]]) if len(tweet_ids) > 0 else 0
+	ids = np.array([int(tweet_id) for tweet_id in tweet_ids], dtype=np.int64)
+	classes = np.array([np.argmax(vectors[tweet_id]) for tweet_id in tweet_ids], dtype=np.int8)
+	return LabelStore(ids, classes, CLASS_NAMES if num_classes == len(CLASS_NAMES) else None, num_classes)
+
+if __name__ == "__main__":
+	import argparse
+	parser = argparse.ArgumentParser()
+	parser.add_argument("-i", "--input_filename", required=True) # e.g. data/iceland_volcano/labels-03112017.p
+	parser.add_argument("-o", "--output_filename", required=True)
+	args = parser.parse_args()
+
+	# Convert an older pickle of one-hot vectors to a store
+	labels = load_labels(args.input_filename)
+	assert(labels.class_names is not None), "%s has %d classes, not the %d of CLASS_NAMES" % (args.input_filename, labels.num_classes, len(CLASS_NAMES))
+	write_label_store(args.output_filename, dict(zip(labels.tweet_ids(), labels.classes)), labels.class_names)
+	print "Wrote %d labels to %s" % (len(labels), args.output_filename)
@@ -0,0 +1,100 @@
+from label_store import LabelVersions, VERSIONS_FILENAME, load_labels, sorted_tweet_ids, MISSING_CLASS
+import argparse
+import glob
+import os
+import pickle
+import numpy as np
+
+def versions_filename(directory):
+	return os.path.join(directory, VERSIONS_FILENAME)
+
+def version_name(filename):
+	return os.path.splitext(os.path.basename(filename))[0]
+
+def class_name(labels, label_class):
+	if label_class == MISSING_CLASS: return "(none)"
+	return labels.class_names[label_class] if labels.class_names is not None else str(label_class)
+
+# Checks that a version reads back exactly as the labels it was recorded from. Older pickles are
+# compared vector by vector, so a vector that is not one-hot, which argmax would have hidden, fails
+def verify_version(versions, name, filename):
+	version = versions.version(name)
+	if os.path.exists(filename) and not filename.endswith(".versions"):
+		with open(filename, "rb") as input_file: vectors = pickle.load(input_file)
+		if isinstance(vectors, dict):
+			tweet_ids = sorted_tweet_ids(vectors)
+			expected = np.array([vectors[tweet_id] for tweet_id in tweet_ids]).reshape(len(tweet_ids), version.num_classes)
+			assert(np.array_equal(version.one_hot(version.classes_of(tweet_ids)), expected)), "Version %s differs from %s" % (name, filename)
+			assert(len(version) == len(tweet_ids)), "Version %s has %d labels, %s has %d" % (name, len(version), filename, len(tweet_ids))
+			return
+	labels = load_labels(filename)
+	assert(np.array_equal(version.ids, labels.ids) and np.array_equal(version.classes, labels.classes)), "Version %s differs from %s" % (name, filename)
+
+# Folds the dated label files of an event in to its versions file, with the latest as the base, since
+# that is the version everything reads
+def import_versions(directory, remove):
+	filenames = sorted(glob.glob(os.path.join(directory, "labels-*.p")))
+	if len(filenames) == 0: return
+	filename = versions_filename(directory)
+	versions = LabelVersions.open(filename) if os.path.exists(filename) else LabelVersions.create(version_name(filenames[-1]), load_labels(filenames[-1]))
+	for label_filename in filenames: versions.add(version_name(label_filename), load_labels(label_filename))
+	versions.write(filename)
+	versions = LabelVersions.open(filename)
+	for label_filename in filenames: verify_version(versions, version_name(label_filename), label_filename)
+	size = sum(os.path.getsize(label_filename) for label_filename in filenames)
+	print "%s: %d versions, %d bytes in place of %d" % (directory, len(filenames), os.path.getsize(filename), size)
+	if remove:
+		for label_filename in filenames: os.remove(label_filename)
+
+def add_version(directory, name, labels_filename):
+	filename = versions_filename(directory)
+	labels = load_labels(labels_filename)
+	versions = LabelVersions.open(filename) if os.path.exists(filename) else LabelVersions.create(name, labels)
+	versions.add(name, labels)
+	versions.write(filename)
+	verify_version(LabelVersions.open(filename), name, labels_filename)
+	print "Added %d labels to %s as %s" % (len(labels), filename, name)
+
+def list_versions(directory):
+	versions = LabelVersions.open(versions_filename(directory))
+	print "%s: base of %d labels" % (directory, len(versions.base))
+	for name, diff, class_names, num_classes in versions.versions:
+		print "\t%s: %d classes, %d labels differ from the base" % (name, num_classes, len(diff))
+
+def diff_versions(directory, name_a, name_b, limit):
+	versions = LabelVersions.open(versions_filename(directory))
+	a, b = versions.version(name_a), versions.version(name_b)
+	ids, classes_a, classes_b = versions.changes(name_a, name_b)
+	for tweet_id, class_a, class_b in zip(ids, classes_a, classes_b)[:limit]:
+		print "%d: %s -> %s" % (tweet_id, class_name(a, class_a), class_name(b, class_b))
+	if len(ids) > limit: print "..."
+	print "%d labels differ between %s and %s (%d added, %d removed)" % (len(ids), name_a, name_b, np.sum(classes_a == MISSING_CLASS), np.sum(classes_b == MISSING_CLASS))
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser()
+	subparsers = parser.add_subparsers(dest="command")
+	import_parser = subparsers.add_parser("import") # fold dated labels-*.p files in to versions files
+	import_parser.add_argument("-d", "--directories", nargs="+", default=glob.glob("data/*/") + glob.glob("data/non-english/*/"))
+	import_parser.add_argument("-r", "--remove", action="store_true") # delete the dated files once verified
+	add_parser = subparsers.add_parser("add")
+	add_parser.add_argument("-d", "--directory", required=True) # e.g. data/nepal_earthquake
+	add_parser.add_argument("-v", "--version", required=True) # e.g. labels-03112017
+	add_parser.add_argument("-i", "--input_filename", required=True) # e.g. generate-labels/labels-03112017/2015_Nepal_Earthquake_en-labels-03112017.p
+	list_parser = subparsers.add_parser("list")
+	list_parser.add_argument("-d", "--directories", nargs="+", default=glob.glob("data/*/") + glob.glob("data/non-english/*/"))
+	diff_parser = subparsers.add_parser("diff")
+	diff_parser.add_argument("-d", "--directory", required=True)
+	diff_parser.add_argument("-a", "--version_a", required=True) # e.g. labels-03102017
+	diff_parser.add_argument("-b", "--version_b", required=True) # e.g. labels-03112017
+	diff_parser.add_argument("-l", "--limit", default=50, type=int) # changed labels to print
+	args = parser.parse_args()
+
+	if args.command == "import":
+		for directory in sorted(args.directories): import_versions(directory, args.remove)
+	elif args.command == "add":
+		add_version(args.directory, args.version, args.input_filename)
+	elif args.command == "list":
+		for directory in sorted(args.directories):
+			if os.path.exists(versions_filename(directory)): list_versions(directory)
+	elif args.command == "diff":
+		diff_versions(args.directory, args.version_a, args.version_b, args.limit)
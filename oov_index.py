@@ -0,0 +1,211 @@
+from tweet_store import read_header, write_columns
+from tweet_tokenizer import clean_and_format_text
+import hashlib
+import mmap
+import os
+import struct
+import zlib
+import numpy as np
+
+MAGIC = "OOVINDX1"
+EMPTY_SLOT = -1
+# Flags of an entry: a phrase that has a replacement, or only the start of longer phrases that do
+PHRASE = 1
+PREFIX = 0
+# Bumped whenever the layout changes, so that stale indexes are compiled again
+INDEX_VERSION = 3
+SLOT = struct.Struct("<i")
+OFFSETS = struct.Struct("<qq")
+
+# Parse the tsv file in to a dictionary mapping out of vocabulary words to the tokens of their in
+# vocabulary text. Each replacement is cleaned once here, and kept as a tuple so it cannot be changed
+# by whoever uses it. Where a word appears more than once, its last line wins
+def build_oov_dict(oov_filename):
+	oov_dict = {}
+	with open(oov_filename, 'rb') as tsvfile:
+		lines = []
+		for c in tsvfile.readlines(): lines.extend(c.split('\r'))
+		for line in lines:
+			key, val = line.split('\t')
+			oov_dict[key] = tuple(clean_and_format_text(val))
+	return oov_dict
+
+def encode_word(word):
+	return word.encode("utf-8") if isinstance(word, unicode) else word
+
+def word_hash(key):
+	return zlib.crc32(key) & 0xffffffff
+
+# Writes the OOV dictionary as a string table sorted by phrase, with the replacement tokens of each
+# phrase joined by single spaces, and an open addressing hash table over it: a power of two number of
+# slots, at least twice the number of entries, each holding the index of an entry or EMPTY_SLOT. The
+# hash is crc32 rather than hash() so that it is the same in every process. A key of several words is
+# stored with its words joined by single spaces, and every shorter run of its leading words gets a
+# PREFIX entry unless it is a phrase itself. Together the entries form a trie that is walked by hashing
+# instead of by following pointers, so the index is still only mapped, never built, when it is opened
+def compile_oov_index(oov_filename, index_filename):
+	oov_dict = build_oov_dict(oov_filename)
+	with open(oov_filename, 'rb') as tsvfile: dictionary_hash = hashlib.sha1(tsvfile.read()).hexdigest()
+	phrases = {}
+	for key in sorted(oov_dict):
+		if len(key.split()) > 0: phrases[' '.join(key.split())] = oov_dict[key]
+	prefixes = set()
+	for phrase in phrases:
+		words = phrase.split(' ')
+		for length in range(1, len(words)): prefixes.add(' '.join(words[:length]))
+	keys = sorted(set(phrases) | prefixes)
+	values = [' '.join(phrases[key]) if key in phrases else '' for key in keys]
+	flags = np.array([PHRASE if key in phrases else PREFIX for key in keys], dtype=np.uint8)
+	max_phrase_length = max([len(key.split(' ')) for key in keys] + [1])
+	num_slots = 1
+	while num_slots < 2*len(keys): num_slots *= 2
+	slots = np.empty(num_slots, dtype=np.int32)
+	slots.fill(EMPTY_SLOT)
+	for i, key in enumerate(keys):
+		slot = word_hash(key) & (num_slots - 1)
+		while slots[slot] != EMPTY_SLOT: slot = (slot + 1) & (num_slots - 1)
+		slots[slot] = i
+	columns = [("slots", slots), ("flags", flags)]
+	for name, strings in [("keys", keys), ("values", values)]:
+		offsets = np.zeros(len(strings) + 1, dtype=np.int64)
+		np.cumsum([len(string) for string in strings], out=offsets[1:])
+		columns.append((name[:-1] + "_offsets", offsets))
+		columns.append((name, np.fromstring("".join(strings), dtype=np.uint8)))
+	write_columns(index_filename, MAGIC, columns, meta={"version": INDEX_VERSION, "source": oov_filename, "dictionary_hash": dictionary_hash, "num_words": len(phrases), "max_phrase_length": max_phrase_length})
+	return len(phrases)
+
+# Read-only view of a compiled OOV dictionary that answers lookups straight from the mapped file, so
+# opening it costs nothing and forked workers share its pages. It behaves like the dict from
+# build_oov_dict for get, in and [], and replace() rewrites whole token streams including phrases.
+# Each process remembers the phrases it has looked up, since the same few thousand words make up most
+# tokens
+class OOVIndex(object):
+	def __init__(self, filename):
+		header = read_header(filename, MAGIC)
+		self.meta = header["meta"]
+		self.max_phrase_length = self.meta.get("max_phrase_length", 1)
+		# Identifies the contents of the tsv file the index was compiled from
+		self.dictionary_hash = self.meta.get("dictionary_hash")
+		self.offsets = dict((name, column["offset"]) for name, column in header["columns"].items())
+		self.mask = header["columns"]["slots"]["length"] - 1
+		with open(filename, "rb") as input_file:
+			self.data = mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+		self.memo = {}
+
+	def string(self, name, i):
+		start, end = OFFSETS.unpack_from(self.data, self.offsets[name[:-1] + "_offsets"] + 8*i)
+		base = self.offsets[name]
+		return self.data[base + start:base + end]
+
+	# Returns the replacement tokens of the phrase, PREFIX if it only starts longer phrases, or None
+	def find(self, phrase):
+		key = encode_word(phrase)
+		slot = word_hash(key) & self.mask
+		while True:
+			i = SLOT.unpack_from(self.data, self.offsets["slots"] + SLOT.size*slot)[0]
+			if i == EMPTY_SLOT: return None
+			if self.string("keys", i) == key:
+				if ord(self.data[self.offsets["flags"] + i]) == PREFIX: return PREFIX
+				value = self.string("values", i)
+				return tuple(value.split(' ')) if len(value) > 0 else ()
+			slot = (slot + 1) & self.mask
+
+	def lookup(self, phrase):
+		try:
+			return self.memo[phrase]
+		except KeyError:
+			value = self.memo[phrase] = self.find(phrase)
+			return value
+
+	# Returns the replacement tokens of the word, or default if it is not out of vocabulary. A word whose
+	# replacement cleans to nothing maps to an empty tuple, so check the result against None
+	def get(self, word, default=None):
+		value = self.lookup(word)
+		return value if value is not None and value is not PREFIX else default
+
+	# Rewrites the tokens in one left to right pass, replacing the longest phrase that starts at each
+	# position and moving past it. The walk from a position stops as soon as the words read so far start
+	# no phrase, and never goes past the longest phrase, so it takes O(len(words)*max_phrase_length)
+	# lookups however many phrases the dictionary holds
+	def replace(self, words):
+		result = []
+		i = 0
+		while i < len(words):
+			best_length, best = 0, None
+			phrase = words[i]
+			for length in range(1, min(self.max_phrase_length, len(words) - i) + 1):
+				if length > 1: phrase += ' ' + words[i + length - 1]
+				value = self.lookup(phrase)
+				if value is None: break
+				if value is not PREFIX: best_length, best = length, value
+			if best_length > 0:
+				result.extend(best)
+				i += best_length
+			else:
+				result.append(words[i])
+				i += 1
+		return result
+
+	def __contains__(self, word):
+		return self.get(word) is not None
+
+	def __getitem__(self, word):
+		value = self.get(word)
+		if value is None: raise KeyError(word)
+		return value
+
+	def __len__(self):
+		return self.meta["num_words"]
+
+def is_current(index_filename, oov_filename):
+	if not os.path.exists(index_filename) or os.path.getmtime(index_filename) < os.path.getmtime(oov_filename): return False
+	return read_header(index_filename, MAGIC)["meta"].get("version") == INDEX_VERSION
+
+# Opens the index compiled from the tsv file, next to it, compiling it first if it is missing, older
+# than the tsv or in an older layout. An index can also be given directly
+def load_oov_index(oov_filename):
+	if oov_filename.endswith(".idx"): return OOVIndex(oov_filename)
+	index_filename = os.path.splitext(oov_filename)[0] + ".idx"
+	if not is_current(index_filename, oov_filename):
+		print "Compiled %d words from %s in to %s" % (compile_oov_index(oov_filename, index_filename), oov_filename, index_filename)
+	return OOVIndex(index_filename)
+
+if __name__ == "__main__":
+	import argparse
+	import time
+	parser = argparse.ArgumentParser()
+	parser.add_argument("-v", "--oov_file", default="OOV_Dict/OOV_Dictionary_V1.0.tsv")
+	parser.add_argument("-o", "--index_filename") # defaults to the tsv file with a .idx extension
+	args = parser.parse_args()
+
+	index_filename = args.index_filename or os.path.splitext(args.oov_file)[0] + ".idx"
+	print "Compiled %d words in to %s" % (compile_oov_index(args.oov_file, index_filename), index_filename)
+
+	# Check the index against the dictionary it was compiled from, and compare how long each takes to load
+	start = time.time()
+	oov_dict = build_oov_dict(args.oov_file)
+	parse_time = time.time() - start
+	start = time.time()
+	index = OOVIndex(index_filename)
+	open_time = time.time() - start
+	assert(len(index) == len(oov_dict)), "Index has %d words, dictionary has %d" % (len(index), len(oov_dict))
+	for word in oov_dict: assert(index[word] == oov_dict[word]), "Index maps %r to %r instead of %r" % (word, index[word], oov_dict[word])
+	for word in ["", "the", "earthquake", u"u"]: assert(index.get(word) == oov_dict.get(word)), "Index has %r, dictionary does not" % word
+	print "Index matches the dictionary. Parsing the tsv took %.1fms, opening the index %.2fms" % (1000*parse_time, 1000*open_time)
+
+	# Phrases are matched longest first, falling back to shorter phrases and single words
+	import tempfile
+	temp_dir = tempfile.mkdtemp()
+	with open(temp_dir + "/phrases.tsv", "wb") as tsvfile: tsvfile.write("\r".join(["a\tw", "b\tz", "a b\ty", "a b c\tx", "in my  opinion\tI think", "p q r\tpqr"]))
+	index = load_oov_index(temp_dir + "/phrases.tsv")
+	for words, expected in [
+		("a b c a b d b", "x y d z"), ("a c", "w c"), ("in my opinion it", "I think it"), ("in my", "in my"),
+		("p q p q r", "p q pqr"), ("", ""),
+	]:
+		actual = ' '.join(index.replace(words.split()))
+		assert(actual == expected), "Replaced %r with %r instead of %r" % (words, actual, expected)
+	assert(index.get("in") is None and "in my" not in index and index["a b"] == ("y",))
+	os.remove(temp_dir + "/phrases.tsv")
+	os.remove(temp_dir + "/phrases.idx")
+	os.rmdir(temp_dir)
+	print "Phrases are replaced longest first"
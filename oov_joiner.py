@@ -1,67 +1,77 @@
+from oov_index import load_oov_index
+from tweet_store import TweetStore, content_hashes, is_tweet_store, load_tweets, write_tweet_store
+from tweet_tokenizer import CLEANING_VERSION, LRUCache, clean_and_format_text
 import argparse
 import csv
 import glob
-import pickle
-import re
+import multiprocessing
+import os
 
 parser = argparse.ArgumentParser()
-parser.add_argument("-v", "--oov_file", default="OOV_Dict/OOV_Dictionary_V1.0.tsv")
+parser.add_argument("-v", "--oov_file", default="OOV_Dict/OOV_Dictionary_V1.0.tsv") # compiled to an index next to it on first use, or an .idx
 parser.add_argument("-d", "--debug_every", default=100, type=int)
-parser.add_argument("-w", "--warmstart", default=True, type=bool)
+parser.add_argument("-w", "--warmstart", default=True, type=bool) # only clean tweets that are new or changed since the last run
 parser.add_argument("-i", "--input_glob", required=True) # */tweets.p
 parser.add_argument("-o", "--output_dir") # california_earthquake/tweets_cleaned/*
 parser.add_argument("-of", "--output_filename") # tweets_cleaned.p
+parser.add_argument("-n", "--workers", default=1, type=int) # processes to clean with, e.g. the number of cores
+parser.add_argument("-cs", "--cache_size", default=100000, type=int) # cleaned tweets to remember, per worker
 args = parser.parse_args()
 
-URL_REGEX_PATTERN = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\(\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
+# Replaces every out of vocabulary word or phrase with the tokens of its in vocabulary text, longest
+# phrase first, and keeps every other word as it is
+def replace_oov_words(oov_dict, words):
+	return oov_dict.replace(words)
 
-# Parse the tsv file in to a dictionary mapping out of vocabulary words to in vocabulary words
-def build_oov_dict(oov_filename):
-	oov_dict = {}
-	with open(oov_filename, 'rb') as tsvfile:
-		lines = []
-		for c in tsvfile.readlines(): lines.extend(c.split('\r'))
-		for line in lines:
-			key, val = line.split('\t')
-			oov_dict[key] = val
-	return oov_dict
+# Tweets are handed to the workers in shards of this many
+SHARD_SIZE = 500
 
-def clean_and_format_text(tweet_text):
-	# First, remove all user handlers - i.e. any word beginning with the '@' sign
-	text = re.sub(r'@\S+','',tweet_text)
-	# Remove all URL formats
-	text = re.sub(URL_REGEX_PATTERN, '', text)
-	# Then remove all characters that are not in the alphabet, a digit, whitespace,
-	# in addition to the appostrophe which is still used in contractions, periods,
-	# and colons, which will be dealt with in the next steps
-	text = re.sub(r'[^\w\s\'\.\:]', '', text)
-	# Keep only colons in between two numbers (for a time)
-	text = re.sub(r'(\D)\:(\D)',r'\1\2', text)
-	# Keep only periods that are followed by a number and preceded by either a number
-	# or a whitespace
-	text = re.sub(r'\.(\D)', r'\1', text)
-	text = re.sub(r'([^\s\d])\.', r'\1', text)
-	# Keep only apostrophes that follow an alphabet character and are followed by either
-	# an alphabet character or a whitespace
-	text = re.sub(r'([^a-zA-Z])\'', r'\1', text)
-	text = re.sub(r'\'([^a-zA-Z\s])', r'\1', text)
-	# Return word vector, excluding start marker 'RT'
-	return [word for word in text.split() if word != 'RT']
+# Retweets and copies of the same text are common, so each process remembers the most recently
+# cleaned texts and cleans every distinct one only once
+def clean_text(text):
+	cleaned = cache.get(text)
+	if cleaned is None:
+		cleaned = ' '.join(replace_oov_words(oov_dict, clean_and_format_text(text)))
+		cache.put(text, cleaned)
+	return cleaned
 
-def replace_oov_words(oov_dict, words):
-	result = []
-	for word in words:
-		# If the word is in the OOV dictionary, clean the resulting in vocabulary text
-		# and add it to the result. Otherwise, just add the original word
-		if word in oov_dict: result.extend(clean_and_format_text(oov_dict[word]))
-		else: result.append(word)
-	return result
+# Returns the cleaned shard along with how many of its tweets the worker's cache answered
+def clean_shard(texts):
+	hits = cache.hits
+	cleaned_text = [clean_text(text) for text in texts]
+	return cleaned_text, cache.hits - hits
+
+# Cleans the texts in order, in shards across the pool if there is one. Map returns the shards in the
+# order they were given, so the result is the same as cleaning them serially
+def clean_texts(texts):
+	if pool is None: return clean_shard(texts)
+	shards = [texts[start:start + SHARD_SIZE] for start in range(0, len(texts), SHARD_SIZE)]
+	results = pool.map(clean_shard, shards, chunksize=1)
+	return [text for shard, _ in results for text in shard], sum(hits for _, hits in results)
 
+# Every output store keeps the content hash of the raw text each tweet was cleaned from in its
+# source_hash column, and the dictionary and cleaning rules it was cleaned with in its meta. Returns
+# the previous output with the position of each (tweet id, content hash) in it, or None if the output
+# is missing, from before there was a manifest, or was cleaned with a different dictionary or rules
+def previous_cleaning(output_filename):
+	if not os.path.exists(output_filename) or not is_tweet_store(output_filename): return None
+	previous = TweetStore.open(output_filename)
+	if "source_hash" not in previous.columns: return None
+	if any(previous.meta.get(key) != manifest_meta[key] for key in manifest_meta): return None
+	keys = zip(previous.ids.tolist(), previous.columns["source_hash"].tolist())
+	return previous, dict((key, i) for i, key in enumerate(keys))
 
-oov_dict = build_oov_dict(args.oov_file)
+oov_dict = load_oov_index(args.oov_file)
+manifest_meta = {"dictionary_hash": oov_dict.dictionary_hash, "cleaning_version": CLEANING_VERSION}
+cache = LRUCache(args.cache_size)
 tsv_filenames = glob.glob(args.input_glob)
 print "Found %d input files" % len(tsv_filenames)
 
+# The pool is forked after the OOV index is mapped, so every worker shares the parent's mapping of it
+# instead of loading its own
+pool = multiprocessing.Pool(args.workers) if args.workers > 1 else None
+num_tweets, num_cleaned, num_hits = 0, 0, 0
+
 for filename in tsv_filenames:
 	if args.output_filename:
 		output_filename = '/'.join(filename.split('/')[:-1]) # get directory of input file
@@ -71,11 +81,35 @@ for filename in tsv_filenames:
 		output_filename = args.output_dir + "/" + output_filename.split('.')[0] + ".p"
 	print "Saving output at ", output_filename
 
-	with open(filename, 'rb') as input_file:
-		tweet_text, _ = pickle.load(input_file)
-		for tweet_id in tweet_text:
-			cleaned_text = clean_and_format_text(tweet_text[tweet_id].text)
-			tweet_text[tweet_id].text = replace_oov_words(oov_dict, cleaned_text)
+	# When warmstarting, a tweet whose id and raw text are unchanged since the last run keeps the text it
+	# was cleaned to then, and only new or edited tweets are cleaned
+	tweets = load_tweets(filename)
+	texts = list(tweets.iter_text())
+	source_hashes = content_hashes(texts)
+	cleaned_text = [None]*len(texts)
+	if args.warmstart:
+		previous = previous_cleaning(output_filename)
+		if previous is not None:
+			previous_store, positions = previous
+			for i, key in enumerate(zip(tweets.ids.tolist(), source_hashes.tolist())):
+				if key in positions: cleaned_text[i] = previous_store.text(positions[key])
+	todo = [i for i in range(len(texts)) if cleaned_text[i] is None]
+	print "Cleaning %d of %d tweets, the rest are unchanged since the last run" % (len(todo), len(texts))
+
+	# Write the cleaned tokens of each tweet, joined by single spaces, to a tweet store alongside the
+	# rest of its columns. The store is written next to the output and renamed over it, since the
+	# previous output may still be mapped
+	todo_text, hits = clean_texts([texts[i] for i in todo])
+	for i, text in zip(todo, todo_text): cleaned_text[i] = text
+	num_tweets += len(texts)
+	num_cleaned += len(todo)
+	num_hits += hits
+	columns = tweets.optional_columns()
+	columns["source_hash"] = source_hashes
+	write_tweet_store(output_filename + ".tmp", tweets.ids, tweets.created_at, cleaned_text, columns, manifest_meta)
+	os.rename(output_filename + ".tmp", output_filename)
 
-	with open(output_filename, "wb") as output_file:
-		pickle.dump(tweet_text, output_file)
+if pool is not None:
+	pool.close()
+	pool.join()
+print "Cleaned %d of %d tweets, %d (%.1f%%) of those were answered by the cache of cleaned text" % (num_cleaned, num_tweets, num_hits, 100.0*num_hits/max(num_cleaned, 1))
@@ -0,0 +1,139 @@
+import threading
+import time
+
+STATUSES_LOOKUP = "/statuses/lookup"
+
+# Requests allowed per window (in seconds) for each endpoint, per user-auth credential
+# https://dev.twitter.com/rest/public/rate-limits
+RATE_LIMITS = {
+	STATUSES_LOOKUP: (900, 15*60),
+}
+
+MAX_BACKOFF = 15*60
+
+# Classic token bucket: holds at most capacity tokens and refills continuously at capacity/window
+# tokens per second. Once twitter has told us when its window resets, it only refills in full at that
+# time, as twitter does, and each window after that ends one window later. The bucket can also be
+# blocked outright until a given time, which is how a backoff after an error is applied
+class TokenBucket(object):
+	def __init__(self, capacity, window):
+		self.capacity = float(capacity)
+		self.window = float(window)
+		self.tokens = float(capacity)
+		self.updated = time.time()
+		self.reset = None
+		self.blocked_until = 0.0
+
+	def refill(self, now):
+		if self.reset is None:
+			self.tokens = min(self.capacity, self.tokens + (now - self.updated)*self.capacity/self.window)
+		elif now >= self.reset:
+			self.tokens = self.capacity
+			self.reset += self.window*(1 + (now - self.reset)//self.window)
+		self.updated = now
+
+	def wait_time(self, now):
+		self.refill(now)
+		if self.tokens >= 1: wait = 0.0
+		elif self.reset is not None: wait = self.reset - now
+		else: wait = (1 - self.tokens)*self.window/self.capacity
+		return max(wait, self.blocked_until - now)
+
+	def take(self, now):
+		self.refill(now)
+		self.tokens -= 1
+
+	def give_back(self, now):
+		self.refill(now)
+		self.tokens = min(self.capacity, self.tokens + 1)
+
+	# Trust the server's view of the window over our own estimate. A window is at least as long as the
+	# time left in it
+	def sync(self, limit, remaining, reset, now):
+		self.capacity = float(limit)
+		self.tokens = float(remaining)
+		self.updated = now
+		self.reset = reset
+		self.window = max(self.window, reset - now)
+
+	# Spends whatever tokens are left, as twitter has said there are none
+	def empty(self, now):
+		self.refill(now)
+		self.tokens = min(self.tokens, 0.0)
+
+	def block_until(self, until):
+		self.blocked_until = max(self.blocked_until, until)
+
+# Keeps one token bucket per (credential, endpoint) and hands out permission to make requests.
+# Each worker calls acquire() for its own credential before it takes a batch, so a batch always goes to
+# a credential that can serve it straight away, and a credential that is rate limited or backed off
+# waits without holding on to any work. stop() wakes everyone blocked in acquire() without a token
+class RateLimitScheduler(object):
+	def __init__(self, num_credentials, rate_limits=RATE_LIMITS):
+		self.condition = threading.Condition()
+		self.buckets = {}
+		for credential in range(num_credentials):
+			for endpoint in rate_limits:
+				capacity, window = rate_limits[endpoint]
+				self.buckets[(credential, endpoint)] = TokenBucket(capacity, window)
+		self.failures = [0]*num_credentials
+		self.stopped = False
+
+	# Blocks until the credential has a token for the endpoint, takes it and returns the time spent
+	# waiting. Returns None without taking a token once the scheduler has been stopped
+	def acquire(self, credential, endpoint=STATUSES_LOOKUP):
+		start = time.time()
+		with self.condition:
+			bucket = self.buckets[(credential, endpoint)]
+			wait = bucket.wait_time(time.time())
+			while wait > 0 and not self.stopped:
+				# Woken early whenever the limits are updated, e.g. by a rate limit header, or on stop()
+				self.condition.wait(wait)
+				wait = bucket.wait_time(time.time())
+			if self.stopped: return None
+			bucket.take(time.time())
+		return time.time() - start
+
+	# Hands back a token that was acquired but never spent on a request
+	def release(self, credential, endpoint=STATUSES_LOOKUP):
+		with self.condition:
+			self.buckets[(credential, endpoint)].give_back(time.time())
+			self.condition.notify_all()
+
+	def stop(self):
+		with self.condition:
+			self.stopped = True
+			self.condition.notify_all()
+
+	# Reads twitter's x-rate-limit-* headers from a response, if there are any
+	def update_from_headers(self, credential, headers, endpoint=STATUSES_LOOKUP):
+		if headers is None: return
+		try:
+			limit = int(headers['x-rate-limit-limit'])
+			remaining = int(headers['x-rate-limit-remaining'])
+			reset = float(headers['x-rate-limit-reset'])
+		except (KeyError, TypeError, ValueError):
+			return
+		with self.condition:
+			self.buckets[(credential, endpoint)].sync(limit, remaining, reset, time.time())
+			self.condition.notify_all()
+
+	def succeeded(self, credential):
+		with self.condition:
+			self.failures[credential] = 0
+
+	# Takes the credential out of rotation after a failed request for an exponentially growing delay, or
+	# until the reset time if twitter told us when the window reopens and that is later. A reset that has
+	# already passed by our clock, e.g. through clock skew, still leaves the delay. After a rate limit
+	# error the bucket is emptied too, so the credential never retries on tokens twitter says it lacks
+	def backoff(self, credential, reset=None, rate_limited=False, endpoint=STATUSES_LOOKUP):
+		with self.condition:
+			now = time.time()
+			self.failures[credential] += 1
+			until = now + min(2**self.failures[credential], MAX_BACKOFF)
+			if reset is not None: until = max(until, reset)
+			bucket = self.buckets[(credential, endpoint)]
+			if rate_limited: bucket.empty(now)
+			bucket.block_until(until)
+			self.condition.notify_all()
+			return until - now
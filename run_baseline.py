@@ -1,5 +1,5 @@
-#takes in two dictionaries -- one is tweet IDs --> feature vectors and one is tweet IDs --> labels 
-#Creates feature vector --> labels mapping 
+#takes in the feature files of each event (dense .npy stores, sparse .npz or pickles of tweet IDs --> feature vectors) and its labels
+#Keeps the feature rows of the labelled tweets, in tweet id order
 #Separates into two lists
 #Separates 80:20 for train and test 
 #Returns train_data, train_labels, test_data, test_labels
@@ -8,49 +8,46 @@
 import argparse
 import numpy as np
 import glob
-import pickle
 from baseline_models import *
+from feature_store import feature_filenames, load_features, stack_rows
+from label_store import load_labels, MISSING_CLASS
 import os
 
 parser = argparse.ArgumentParser()
 parser.add_argument("-t", "--tweet_glob", required=True) #set of folders for each event 
-parser.add_argument("-f", "--feat_vec", required=True)
-parser.add_argument("-m", "--model_type", required=True)
+parser.add_argument("-f", "--feat_vec", required=True) # folder of feature files in each event, e.g. bigram
+parser.add_argument("-m", "--model_type", required=True) # "nb", "svm" or anything else for a random forest
+parser.add_argument("-lf", "--labels_filename", default="labels-03112017.p")
 args = parser.parse_args()
 
 method = args.feat_vec
 
-
+# The features of each event stay as they were saved, sparse for bigrams, and are only stacked
 training_data = []
 test_data = []
 training_labels = []
 test_labels = []
 parent_dirs = glob.glob(args.tweet_glob)
 for directory in parent_dirs:
-	feature_vectors = {}
 	feat_vec_list = os.listdir(directory+"/"+method)
-	feat_vec_list = [filename for filename in feat_vec_list if filename[0] != '.']
-	with open(directory+"/labels.p", "rb") as labels_file:
-		labels = pickle.load(labels_file)
+	feat_vec_list = feature_filenames([filename for filename in feat_vec_list if filename[0] != '.'])
+	labels = load_labels(directory + "/" + args.labels_filename)
 	for filename in feat_vec_list:
-		filepath = directory+"/"+method+"/"+filename
-		with open(filepath, "rb") as input_file:
-			feature_vectors.update(pickle.load(input_file))
-
-	keys = [tweet_id for tweet_id in labels if str(tweet_id) in feature_vectors and 'unknown' not in labels.values()]
-	x_val = [feature_vectors[tweet_id] for tweet_id in keys]
-	y_val = []
-	for tweet_id in keys:
-		if "paid" in labels[tweet_id]: y_val.append(labels[tweet_id])["paid"]
-		elif "volunteer" in labels[tweet_id]: y_val.append(labels[tweet_id]["volunteer"])
-
-	num_train = int(.8*(len(x_val)))
-	training_data.extend(x_val[:num_train])
-	test_data.extend(x_val[num_train:])
-	training_labels.extend(y_val[:num_train])
-	test_labels.extend(y_val[num_train:])
-
-clf = train_model(training_data, training_labels, glob.glob(args.model_type))
+		features = load_features(directory+"/"+method+"/"+filename)
+		classes = labels.lookup(features.ids)
+		labelled = np.flatnonzero(classes != MISSING_CLASS)
+		x_val = features.matrix[labelled]
+		y_val = classes[labelled]
+
+		num_train = int(.8*(len(labelled)))
+		training_data.append(x_val[:num_train])
+		test_data.append(x_val[num_train:])
+		training_labels.append(y_val[:num_train])
+		test_labels.append(y_val[num_train:])
+
+training_data, test_data = stack_rows(training_data), stack_rows(test_data)
+training_labels, test_labels = np.concatenate(training_labels), np.concatenate(test_labels)
+clf = train_model(training_data, training_labels, args.model_type)
 train_score = calculate_score(training_data, training_labels, clf)
 test_score = calculate_score(test_data, test_labels, clf)
 predicted_labels = predict_labels(test_data, clf)
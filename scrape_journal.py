@@ -0,0 +1,105 @@
+import glob
+import os
+import pickle
+import struct
+import time
+
+HEADER = struct.Struct(">I")
+
+def read_pickle_snapshot(filename):
+	with open(filename, "rb") as input_file:
+		return pickle.load(input_file)
+
+def write_pickle_snapshot(filename, tweet_text, retry_counts):
+	with open(filename, "wb") as output_file:
+		pickle.dump([tweet_text, retry_counts], output_file)
+
+# Append-only log of everything a scraper collects, kept next to its output file. Every batch is written
+# as one length-prefixed pickle record holding the tweets that came back and, for the ids that failed,
+# how many times each has gone missing so far. A checkpoint therefore costs O(batch) and a crash loses
+# at most the batch that was being written. The snapshot at the output filename is written with
+# write_snapshot, by default in the usual [tweet_text, retry_counts] pickle format, and compact() folds
+# the journal in to it. If metrics are given, the duration of each compaction is recorded there
+class Journal(object):
+	def __init__(self, snapshot_filename, read_snapshot=read_pickle_snapshot, write_snapshot=write_pickle_snapshot, metrics=None):
+		self.snapshot_filename = snapshot_filename
+		self.metrics = metrics
+		self.read_snapshot = read_snapshot
+		self.write_snapshot = write_snapshot
+		self.filename = snapshot_filename + ".journal"
+		self.journal_file = None
+
+	def open(self):
+		if self.journal_file is None: self.journal_file = open(self.filename, "ab")
+		return self
+
+	def close(self):
+		if self.journal_file is not None: self.journal_file.close()
+		self.journal_file = None
+
+	def exists(self):
+		return len(glob.glob(self.snapshot_filename)) > 0 or len(glob.glob(self.filename)) > 0
+
+	def append(self, successes, failures):
+		data = pickle.dumps((successes, failures), pickle.HIGHEST_PROTOCOL)
+		self.journal_file.write(HEADER.pack(len(data)) + data)
+		self.journal_file.flush()
+		os.fsync(self.journal_file.fileno())
+
+	# Yields every complete record in the journal. A record cut short by a crash ends the replay, and the
+	# journal is truncated back to the last complete record so that new appends stay readable
+	def replay(self):
+		if len(glob.glob(self.filename)) == 0: return
+		valid_length = 0
+		with open(self.filename, "rb") as journal_file:
+			while True:
+				header = journal_file.read(HEADER.size)
+				if len(header) < HEADER.size: break
+				data = journal_file.read(HEADER.unpack(header)[0])
+				try:
+					record = pickle.loads(data)
+				except Exception:
+					break
+				valid_length = journal_file.tell()
+				yield record
+		if os.path.getsize(self.filename) != valid_length:
+			print "Dropping %d bytes of incomplete journal records" % (os.path.getsize(self.filename) - valid_length)
+			with open(self.filename, "r+b") as journal_file: journal_file.truncate(valid_length)
+
+	# Rebuilds the state of the previous run from the last snapshot plus the journal written since. Older
+	# snapshots and journals stored a plain list of retry ids, which are read as ids with no misses yet
+	def load(self):
+		tweet_text, retry_counts = {}, {}
+		if len(glob.glob(self.snapshot_filename)) > 0:
+			tweet_text, retry_counts = self.read_snapshot(self.snapshot_filename)
+			if isinstance(retry_counts, list): retry_counts = dict.fromkeys(retry_counts, 0)
+		num_records = 0
+		for successes, failures in self.replay():
+			if isinstance(failures, list): failures = dict((tweet_id, retry_counts.get(tweet_id, 0)) for tweet_id in failures)
+			tweet_text.update(successes)
+			for tweet_id in successes: retry_counts.pop(tweet_id, None)
+			retry_counts.update(failures)
+			num_records += 1
+		print "Replayed %d journal records" % num_records
+		return tweet_text, retry_counts
+
+	# Writes the full state as a new snapshot and empties the journal. The snapshot is swapped in with a
+	# rename, and replaying a journal over the snapshot it was already folded in to changes nothing, so a
+	# crash at any point here is safe
+	def compact(self, tweet_text, retry_counts):
+		start = time.time()
+		temp_filename = self.snapshot_filename + ".tmp"
+		self.write_snapshot(temp_filename, tweet_text, retry_counts)
+		os.rename(temp_filename, self.snapshot_filename)
+		reopen = self.journal_file is not None
+		self.close()
+		open(self.filename, "wb").close()
+		if reopen: self.open()
+		if self.metrics is not None: self.metrics.checkpoint("compact", time.time() - start)
+		print "Saving %d tweets and %d retry ids..." % (len(tweet_text), len(retry_counts))
+
+	# Starts from scratch, discarding whatever a previous run left in the snapshot and the journal
+	def reset(self):
+		self.close()
+		for filename in [self.snapshot_filename, self.filename]:
+			if len(glob.glob(filename)) > 0: os.remove(filename)
@@ -0,0 +1,156 @@
+import json
+import os
+import threading
+import time
+
+# Upper bounds (in seconds) of the request latency histogram buckets; the last bucket takes everything slower
+LATENCY_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0]
+FLUSH_INTERVAL = 30
+
+def new_histogram():
+	return [0]*(len(LATENCY_BUCKETS) + 1)
+
+def histogram_bucket(seconds):
+	for i, bound in enumerate(LATENCY_BUCKETS):
+		if seconds <= bound: return i
+	return len(LATENCY_BUCKETS)
+
+# Smallest bucket bound below which at least the given fraction of the samples fall
+def histogram_quantile(histogram, fraction):
+	total = sum(histogram)
+	if total == 0: return None
+	count = 0
+	for i, n in enumerate(histogram):
+		count += n
+		if count >= fraction*total: return LATENCY_BUCKETS[i] if i < len(LATENCY_BUCKETS) else float("inf")
+
+class CredentialMetrics(object):
+	def __init__(self):
+		self.requests = 0
+		self.errors = 0
+		self.ids_requested = 0
+		self.ids_fetched = 0
+		self.request_time = 0.0
+		self.max_latency = 0.0
+		self.latency_histogram = new_histogram()
+		self.rate_limit_wait = 0.0
+		self.idle_time = 0.0
+
+	def to_dict(self):
+		return {
+			"requests": self.requests,
+			"errors": self.errors,
+			"ids_requested": self.ids_requested,
+			"ids_fetched": self.ids_fetched,
+			"request_time": self.request_time,
+			"mean_latency": self.request_time/self.requests if self.requests > 0 else None,
+			"p50_latency": histogram_quantile(self.latency_histogram, 0.5),
+			"p90_latency": histogram_quantile(self.latency_histogram, 0.9),
+			"max_latency": self.max_latency,
+			"latency_histogram": dict(zip([str(bound) for bound in LATENCY_BUCKETS] + ["inf"], self.latency_histogram)),
+			"rate_limit_wait": self.rate_limit_wait,
+			"idle_time": self.idle_time,
+		}
+
+# Thread-safe counters for a scraper run, shared by the fetch engine and the journals. For every
+# credential it tracks the request latency histogram, how long it waited on its rate limit and how
+# long it sat idle with no ids due (input not read yet or retries backing off), and for the run as a
+# whole the ids fetched per second, the share of requested ids that had to be retried and how long
+# checkpoints took. Comparing where the workers' time went shows whether a slow run is rate-limited,
+# network-bound or I/O-bound. If a filename is given, the metrics are written there as JSON at most
+# every flush_interval seconds and once more at the end of the run
+class ScrapeMetrics(object):
+	def __init__(self, num_credentials, filename=None, flush_interval=FLUSH_INTERVAL):
+		self.lock = threading.Lock()
+		self.flush_lock = threading.Lock()
+		self.filename = filename
+		self.flush_interval = flush_interval
+		self.credentials = [CredentialMetrics() for _ in range(num_credentials)]
+		self.ids_retried = 0
+		self.checkpoints = {}
+		self.start = time.time()
+		self.last_flush = self.start
+
+	def request(self, credential, latency, num_requested, num_fetched=0, error=False):
+		with self.lock:
+			metrics = self.credentials[credential]
+			metrics.requests += 1
+			metrics.ids_requested += num_requested
+			metrics.ids_fetched += num_fetched
+			metrics.request_time += latency
+			metrics.max_latency = max(metrics.max_latency, latency)
+			metrics.latency_histogram[histogram_bucket(latency)] += 1
+			if error: metrics.errors += 1
+			self.ids_retried += num_requested - num_fetched
+
+	def rate_limit_wait(self, credential, seconds):
+		with self.lock:
+			self.credentials[credential].rate_limit_wait += seconds
+
+	def idle(self, credential, seconds):
+		with self.lock:
+			self.credentials[credential].idle_time += seconds
+
+	# Records how long one checkpoint of the given kind took, e.g. a journal append or a compaction
+	def checkpoint(self, kind, seconds):
+		with self.lock:
+			count, total, longest = self.checkpoints.get(kind, (0, 0.0, 0.0))
+			self.checkpoints[kind] = (count + 1, total + seconds, max(longest, seconds))
+
+	def to_dict(self):
+		with self.lock:
+			elapsed = time.time() - self.start
+			ids_requested = sum(metrics.ids_requested for metrics in self.credentials)
+			ids_fetched = sum(metrics.ids_fetched for metrics in self.credentials)
+			return {
+				"elapsed": elapsed,
+				"requests": sum(metrics.requests for metrics in self.credentials),
+				"errors": sum(metrics.errors for metrics in self.credentials),
+				"ids_requested": ids_requested,
+				"ids_fetched": ids_fetched,
+				"ids_per_second": ids_fetched/elapsed if elapsed > 0 else 0.0,
+				"retry_rate": float(self.ids_retried)/ids_requested if ids_requested > 0 else 0.0,
+				"rate_limit_wait": sum(metrics.rate_limit_wait for metrics in self.credentials),
+				"checkpoints": dict((kind, {"count": count, "total": total, "max": longest}) for kind, (count, total, longest) in self.checkpoints.items()),
+				"credentials": [metrics.to_dict() for metrics in self.credentials],
+			}
+
+	# Written to a temporary file and renamed, so whoever watches the file never sees half of it
+	def flush(self):
+		if self.filename is None: return
+		with self.flush_lock:
+			data = json.dumps(self.to_dict(), indent=2, sort_keys=True)
+			temp_filename = self.filename + ".tmp"
+			with open(temp_filename, "w") as output_file: output_file.write(data)
+			os.rename(temp_filename, self.filename)
+			self.last_flush = time.time()
+
+	def maybe_flush(self):
+		if time.time() - self.last_flush >= self.flush_interval: self.flush()
+
+	# Where the workers spent their time, as fractions of the total worker time
+	def time_breakdown(self, summary):
+		worker_time = summary["elapsed"]*len(self.credentials)
+		if worker_time <= 0: return {}
+		breakdown = {
+			"rate limited": summary["rate_limit_wait"],
+			"network": sum(metrics["request_time"] for metrics in summary["credentials"]),
+			"checkpointing": sum(checkpoint["total"] for checkpoint in summary["checkpoints"].values()),
+			"idle with no ids due": sum(metrics["idle_time"] for metrics in summary["credentials"]),
+		}
+		return dict((name, seconds/worker_time) for name, seconds in breakdown.items())
+
+	def print_summary(self):
+		self.flush()
+		summary = self.to_dict()
+		print "Fetched %d of %d requested ids in %.1fs (%.1f ids/s) with %d requests, %d of which failed" % (summary["ids_fetched"], summary["ids_requested"], summary["elapsed"], summary["ids_per_second"], summary["requests"], summary["errors"])
+		print "Retry rate %.1f%%, %.1fs waiting on rate limits" % (100*summary["retry_rate"], summary["rate_limit_wait"])
+		for credential, metrics in enumerate(summary["credentials"]):
+			if metrics["requests"] == 0: continue
+			print "\tCredential %d: %d requests, latency mean %.3fs p50 <= %ss p90 <= %ss max %.3fs, %.1fs rate limited" % (credential, metrics["requests"], metrics["mean_latency"], metrics["p50_latency"], metrics["p90_latency"], metrics["max_latency"], metrics["rate_limit_wait"])
+		for kind, checkpoint in sorted(summary["checkpoints"].items()):
+			print "\t%d %s checkpoints took %.2fs in total, %.3fs at most" % (checkpoint["count"], kind, checkpoint["total"], checkpoint["max"])
+		breakdown = self.time_breakdown(summary)
+		if len(breakdown) > 0:
+			print "Worker time: " + ", ".join("%.0f%% %s" % (100*fraction, name) for name, fraction in sorted(breakdown.items(), key=lambda item: -item[1]))
+		if self.filename is not None: print "Wrote metrics to %s" % self.filename
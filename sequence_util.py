@@ -2,51 +2,62 @@ import numpy as np
 import tensorflow as tf
 from gensim.models import word2vec
 import glob
-import pickle
-import tweepy
+from label_store import load_labels, one_hot, MISSING_CLASS
+from feature_store import load_features
+from tweet_store import load_tweets
 from sklearn.model_selection import train_test_split
 import matplotlib as mpl
 
 mpl.use('TkAgg')
 import matplotlib.pyplot as plt
 
+# Reads the tweet stores written by oov_joiner.py (or older pickles), dropping tweets with no text, and
+# returns their ids ordered by the time they were tweeted
 def get_tweet_ids_time_ordered(filenames, include_text=False):
-	sorted_tweet_ids = []
+	ids, created_at, texts = [], [], []
 	for filename in filenames:
 		assert(len(glob.glob(filename)) == 1), "File %s not found!" % filename
-		with open(filename, "rb") as input_file:
-			print "unloading %s" % filename
-			tweets = pickle.load(input_file)
-			for tweet_id in tweets:
-				if tweets[tweet_id].text == []: continue
-				result = [tweet_id, tweets[tweet_id].created_at]
-				if include_text: result.append(tweets[tweet_id].text)
-				sorted_tweet_ids.append(result)
-	sorted_tweet_ids.sort(key=lambda x: x[1])
-	if include_text: return [(x[0], x[2]) for x in sorted_tweet_ids]
-	return [x[0] for x in sorted_tweet_ids]
-
+		print "unloading %s" % filename
+		tweets = load_tweets(filename)
+		nonempty = np.flatnonzero(tweets.nonempty())
+		ids.append(tweets.ids[nonempty])
+		created_at.append(tweets.created_at[nonempty])
+		if include_text: texts.extend(tweets.tokens(i) for i in nonempty)
+	if len(ids) == 0: return []
+	order = np.argsort(np.concatenate(created_at), kind="mergesort")
+	sorted_tweet_ids = [str(tweet_id) for tweet_id in np.concatenate(ids)[order]]
+	if include_text: return [(sorted_tweet_ids[i], texts[j]) for i, j in enumerate(order)]
+	return sorted_tweet_ids
+
+# Keeps the tweet ids that have a label, in order, and returns them with their one-hot labels. Where an
+# id is labelled in more than one file, the last file wins. A file that does not exist is read as the
+# version of that name in its directory's labels.versions, see load_labels
 def get_labels(filenames, tweet_ids):
-	labels = {}
+	classes = np.full(len(tweet_ids), MISSING_CLASS, dtype=np.int64)
+	num_classes = 0
 	for filename in filenames:
-		assert(len(glob.glob(filename)) == 1), "File %s not found!" % filename
-		with open(filename, "rb") as input_file:
-			print "unloading %s" % filename
-			l = pickle.load(input_file)
-			for key in l: labels[key] = l[key]
-	tweet_ids = [tweet_id for tweet_id in tweet_ids if tweet_id in labels]
-	labels = [labels[str(tweet_id)] for tweet_id in tweet_ids]
-	return tweet_ids, labels
-
+		print "unloading %s" % filename
+		labels = load_labels(filename)
+		file_classes = labels.lookup(tweet_ids)
+		found = file_classes != MISSING_CLASS
+		classes[found] = file_classes[found]
+		num_classes = max(num_classes, labels.num_classes)
+	labelled = np.flatnonzero(classes != MISSING_CLASS)
+	return [tweet_ids[i] for i in labelled], one_hot(classes[labelled], num_classes)
+
+# Returns the feature rows of the tweet ids that have them, in order. Where a tweet has features in more
+# than one file, the last file wins. Files are read with load_features, so a dense store is only mapped
+# and only the rows asked for are copied out of it
 def get_embeddings(filenames, tweet_ids):
-	embeddings = {}
+	stores = []
 	for filename in filenames:
-		assert(len(glob.glob(filename)) == 1), "File %s not found!" % filename
-		with open(filename, "rb") as input_file:
-			print "unloading %s" % filename
-			e = pickle.load(input_file)
-			for key in e: embeddings[key] = e[key]
-	return [embeddings[tweet_id] for tweet_id in tweet_ids if tweet_id in embeddings]
+		print "unloading %s" % filename
+		stores.append(load_features(filename))
+	embeddings = [None]*len(tweet_ids)
+	for features in stores:
+		positions, found = features.positions(tweet_ids)
+		for i in np.flatnonzero(found): embeddings[i] = features.matrix[positions[i]]
+	return [embedding for embedding in embeddings if embedding is not None]
 
 def load_data(input_files, label_files, embedding_files, test_split=None, random_seed=None):
 	# Read in all data and sort in accordance to time sequence
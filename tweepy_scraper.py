@@ -1,106 +1,97 @@
 from app_tokens import app_keys
+from fetch_engine import FetchEngine, ResultStore, RoutedStore, batches
+from scrape_journal import Journal
+from scrape_metrics import ScrapeMetrics
 import argparse
 import csv
 import glob
-import pickle
-import time
 import tweepy
 
-MAX_QUERIES = 100
-
 parser = argparse.ArgumentParser()
-parser.add_argument("-s", "--checkpoint", default=1000, type=int)
 parser.add_argument("-d", "--debug_every", default=100, type=int)
 parser.add_argument("-c", "--start_idx", default=0, type=int)
 parser.add_argument("-w", "--warmstart", default=True, type=bool)
 parser.add_argument("-i", "--input_glob", required=True) # e.g. california_earthquake/tweet_ids/*.csv
 parser.add_argument("-o", "--output_dir", required=True) # e.g. california_earthquake/tweets
 parser.add_argument("-f", "--file_idx", default=0, type=int)
-parser.add_argument("-t", "--time_out", default=5, type=float)
 parser.add_argument("-r", "--retries_only", default=False, type=bool)
+parser.add_argument("-m", "--metrics_filename") # e.g. california_earthquake/tweets/metrics.json, defaults to <output_dir>/metrics.json
 args = parser.parse_args()
 
 auths = [tweepy.OAuthHandler(app['APP_KEY'], app['APP_SECRET']) for app in app_keys]
 for i, auth in enumerate(auths): auth.set_access_token(app_keys[i]['ACCESS_TOKEN'], app_keys[i]['ACCESS_TOKEN_SECRET'])
-apis = [tweepy.API(auth, wait_on_rate_limit_notify=True, wait_on_rate_limit=True, timeout=1) for auth in auths]
+apis = [tweepy.API(auth, timeout=1) for auth in auths]
+metrics = ScrapeMetrics(len(apis), args.metrics_filename or args.output_dir + "/metrics.json")
 
 csv_filenames = glob.glob(args.input_glob)
 start_idx = args.start_idx
-num_apis = len(apis)
-
-def run_batch(api, tweet_ids, output_filename, tweet_text, retry_ids):
-	successful_ids, tweets = [], []
-	try:
-		tweets = api.statuses_lookup(tweet_ids)
-	except:
-		print "Batch call to twitter failed, adding %d tweets to retry queue" % len(tweet_ids)
-		retry_ids.extend(tweet_ids)
-		return tweet_text, list(set(retry_ids))
 
-	for tweet in tweets:
-		successful_ids.append(tweet.id_str)
-		tweet_text[tweet.id_str] = tweet.text
+# Lazily yields (filename, tweet_id) for every row of every input csv, one row in memory at a time
+def csv_tweet_ids(filenames, start_idx=0):
+	for i, filename in enumerate(filenames):
+		with open(filename, 'rb') as csvfile:
+			reader = csv.reader(csvfile, delimiter=",", quotechar="'")
+			# Skip first header line that delineates each line as tweet_id, user_id. An empty file has no
+			# rows at all, and raising StopIteration here would silently end every later file too
+			if next(reader, None) is None:
+				print "Skipping %s, which is empty" % filename
+				continue
+			for j, entry in enumerate(reader):
+				# An explicit start index only applies to the first file
+				if (i == 0 and j < start_idx) or len(entry) == 0: continue
+				yield filename, entry[0]
 
-	unsuccessful_ids = set(tweet_ids) - set(successful_ids)
-	retry_ids.extend(list(unsuccessful_ids))
-	print "\tSuccessfully collected %d tweets, need to retry %d" % (len(successful_ids), len(unsuccessful_ids))
-	return tweet_text, list(set(retry_ids))
+# Routes each new id to the store of the file it was first seen in. Ids already seen in an earlier row
+# or file, and ids that a previous run already fetched or queued for retry under any of the files,
+# never reach the fetcher, as the files need not come in the same order from one run to the next
+def pending_tweet_ids(filenames, stores, router, start_idx=0):
+	seen = set()
+	all_stores = stores.values()
+	for filename, tweet_id in csv_tweet_ids(filenames, start_idx):
+		if tweet_id in seen: continue
+		seen.add(tweet_id)
+		if any(tweet_id in store for store in all_stores): continue
+		store = stores[filename]
+		router.route(tweet_id, store)
+		yield tweet_id
 
+csv_filenames = csv_filenames[int(args.file_idx):]
 print "Found %d input files" % len(csv_filenames)
-for filename in csv_filenames[int(args.file_idx):]:
-	with open(filename, 'rb') as csvfile:
-		
-		output_filename = filename.split('/')[-1]
-		output_filename = args.output_dir + "/" + output_filename.split('.')[0] + ".p"
-		num_tweets = 0
-		tweet_text = {}
-		print "Saving output at ", output_filename
 
-		# Initialize objects and csv reader
-		reader = csv.reader(csvfile, delimiter=",", quotechar="'")
-		reader.next() # Skip first header line that delineates each line as tweet_id, user_id
-		entries = list(reader)
-		tweet_ids = [entry[0] for entry in entries]
-		total_tweets = len(tweet_ids)
-		retry_ids = []
+# Set up one output, journal and store per input file
+stores, journals = {}, []
+for filename in csv_filenames:
+	output_filename = filename.split('/')[-1]
+	output_filename = args.output_dir + "/" + output_filename.split('.')[0] + ".p"
+	tweet_text, retry_counts = {}, {}
+	print "Saving output for %s at %s" % (filename, output_filename)
 
-		# Warmstart if necessary
-		if (start_idx > 0 or args.warmstart or args.retries_only) and len(glob.glob(output_filename)) > 0:
-			print "Warmstarting...."
-			with open(output_filename, "rb") as input_file:
-				tweet_text, retry_ids = pickle.load(input_file)
-				print "Loaded %d tweets from previous run with %d retry ids" % (len(tweet_text), len(retry_ids))
-			
-			if start_idx == 0: start_idx = (len(tweet_text) + len(retry_ids))
-			print "Starting from entry %d" % (start_idx)
+	# Warmstart if necessary, rebuilding the previous run from its snapshot and journal
+	journal = Journal(output_filename, metrics=metrics)
+	if (start_idx > 0 or args.warmstart or args.retries_only) and journal.exists():
+		print "Warmstarting...."
+		tweet_text, retry_counts = journal.load()
+		print "Loaded %d tweets from previous run with %d retry ids" % (len(tweet_text), len(retry_counts))
+		journal.compact(tweet_text, retry_counts)
+	else: journal.reset()
 
-		# Iterate through each batch of tweet ids
-		for i in range(int(start_idx)/MAX_QUERIES, total_tweets/MAX_QUERIES):
-			# Save all progress to the output file if we are at the checkpoint
-			if i*MAX_QUERIES%args.checkpoint == 0:
-				with open(output_filename, "wb") as output_file:
-					pickle.dump([tweet_text, retry_ids], output_file)
-					print "Saving %d tweets and %d retry ids..." % (len(tweet_text), len(retry_ids))
-			tweet_text, retry_ids = run_batch(apis[i%num_apis], tweet_ids[i*MAX_QUERIES:(i+1)*MAX_QUERIES], output_filename, tweet_text, retry_ids)
-			time.sleep(args.time_out)
-			print "Collected %d out of %d..." % (len(tweet_text), total_tweets)
+	# Keep only the text of each tweet, journaling each batch as it arrives
+	stores[filename] = ResultStore(tweet_text, retry_counts, to_record=lambda tweet: tweet.text, journal=journal.open())
+	journals.append((journal, stores[filename]))
 
-		# Iterate through remainders (if any)
-		if total_tweets % MAX_QUERIES > 0:
-			tweet_text, retry_ids = run_batch(apis[0], tweet_ids[(i+1)*MAX_QUERIES:], output_filename, tweet_text, retry_ids)
-			print "Collected %d out of %d..." % (len(tweet_text), total_tweets)
+# Stream fixed size batches of new ids from all the files straight to one worker per app credential.
+# Ids that fail are retried with backoff alongside the new ones
+router = RoutedStore(stores.values())
+engine = FetchEngine(apis, router, metrics=metrics)
+print "Re-trying %d tweets which failed on the last round" % router.num_retries()
+first_pass = []
+if not args.retries_only:
+	print "Starting from entry %d, skipping ids that were already fetched or are pending retry" % start_idx
+	first_pass = pending_tweet_ids(csv_filenames, stores, router, int(start_idx))
+engine.run(batches(first_pass))
 
-		# Iterate through each batch of retry_ids
-		total_retry_tweets = len(retry_ids)
-		for i in range(total_retry_tweets/MAX_QUERIES):
-			if i*MAX_QUERIES%args.checkpoint == 0:
-				with open(output_filename, "wb") as output_file:
-					pickle.dump([tweet_text, retry_ids], output_file)
-					print "Saving %d tweets and %d retry ids..." % (len(tweet_text), len(retry_ids))
-			failed_retry_ids = []
-			batch_retry_ids = retry_ids[i*MAX_QUERIES:(i+1)*MAX_QUERIES]
-			tweet_text, failed_retry_ids = run_batch(apis[i%num_apis], batch_retry_ids, output_filename, tweet_text, failed_retry_ids)
-			successful_ids = set(batch_retry_ids) - set(failed_retry_ids)
-			retry_ids = list(set(retry_ids)-successful_ids)
-			print "Collected %d out of %d..." % (len(tweet_text), total_tweets)
-			time.sleep(args.time_out)
+# Fold each journal in to its final snapshot
+for journal, store in journals:
+	journal.compact(*store.snapshot())
+	journal.close()
+metrics.print_summary()
@@ -1,14 +1,19 @@
 import time
 
 import numpy as np
+import scipy.sparse
 import tensorflow as tf
 import argparse
-import pickle
 import os
 
+import sys
 from helpers import get_minibatches
 from model import Model
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from label_store import load_labels, MISSING_CLASS
+from feature_store import load_features, stack_rows
+
 
 class Config(object):
     """Holds model hyperparams and data information.
@@ -253,29 +258,23 @@ if __name__ == "__main__":
         # "data/landslides_ww_fr",
     ]
 
-    chosen_labels_matrix = None
-    tweets_matrix = None
-    
+    # Collect the feature rows and class indices of the labelled tweets of every event and stack them
+    # once at the end. Sparse features, like bigrams in a .npz, are only made dense for the rows used
+    tweet_vecs, label_classes = [], []
+
     for event in data:
         print "on ", event, "..."
-        tweets_file = open(event + "/word2vec_average.p", "rb")
-        labels_file = open(event + "/labels-03112017.p", "rb")
-    
-        tweets_vecs = pickle.load(tweets_file)
-        labels_vecs = pickle.load(labels_file)
-
-        for tweetid in tweets_vecs:
-            if tweetid in labels_vecs:
-                try:
-                    tweets_matrix = np.vstack((tweets_matrix, tweets_vecs[tweetid])) if tweets_matrix is not None else tweets_vecs[tweetid]
-                except ValueError as e:
-                    print e
-                    print "skipping tweet due to weird dimension:", tweetid
-                    continue
-                chosen_labels_matrix = np.vstack((chosen_labels_matrix, labels_vecs[tweetid])) if chosen_labels_matrix is not None else labels_vecs[tweetid]
-
-    chosen_labels_matrix = chosen_labels_matrix[:Config.n_samples]
-    tweets_matrix = tweets_matrix[:Config.n_samples]
+        features = load_features(event + "/word2vec_average.npy")
+        labels = load_labels(event + "/labels-03112017.p")
+
+        classes = labels.lookup(features.ids)
+        labelled = np.flatnonzero(classes != MISSING_CLASS)
+        tweet_vecs.append(features.matrix[labelled])
+        label_classes.append(classes[labelled])
+
+    tweets_matrix = stack_rows(tweet_vecs)[:Config.n_samples]
+    if scipy.sparse.issparse(tweets_matrix): tweets_matrix = tweets_matrix.toarray()
+    chosen_labels_matrix = labels.one_hot(np.concatenate(label_classes)[:Config.n_samples])
 
     print chosen_labels_matrix.shape
     print tweets_matrix.shape
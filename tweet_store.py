@@ -0,0 +1,209 @@
+import calendar
+import collections
+import hashlib
+import json
+import pickle
+import struct
+import numpy as np
+
+MAGIC = "TWSTORE1"
+HEADER_LENGTH = struct.Struct("<I")
+ALIGNMENT = 8
+MISSING = -1
+# Columns are written this many bytes at a time, so a column that is memory mapped from another file
+# is never read in to memory all at once
+WRITE_CHUNK = 1 << 24
+
+# What the scraper keeps per tweet instead of the whole tweepy Status. created_at is seconds since the
+# epoch (UTC) and any field twitter did not return is MISSING
+TweetRecord = collections.namedtuple("TweetRecord", ["text", "created_at", "user_id", "retweet_count", "favorite_count"])
+OPTIONAL_COLUMNS = ["user_id", "retweet_count", "favorite_count"]
+
+def status_record(status):
+	created_at = calendar.timegm(status.created_at.utctimetuple()) if getattr(status, 'created_at', None) is not None else MISSING
+	user = getattr(status, 'user', None)
+	return TweetRecord(
+		text=status.text,
+		created_at=created_at,
+		user_id=user.id if user is not None else MISSING,
+		retweet_count=getattr(status, 'retweet_count', MISSING),
+		favorite_count=getattr(status, 'favorite_count', MISSING))
+
+# Columnar, read-only view of a set of tweets. Every column is a numpy array: tweet ids as int64,
+# created_at as int64 seconds since the epoch, the optional int64 columns, and all the texts as one
+# UTF-8 blob indexed by text_offsets (tweet i is text[text_offsets[i]:text_offsets[i+1]]). Opened from
+# a file, the columns are memory maps of that file, so nothing is read until it is used. Cleaned tweets
+# are stored the same way with their tokens joined by single spaces
+class TweetStore(object):
+	def __init__(self, columns, meta=None):
+		self.columns = columns
+		self.meta = meta if meta is not None else {}
+		self.ids = columns["id"]
+		self.created_at = columns["created_at"]
+		self.text_offsets = columns["text_offsets"]
+		self.text_blob = columns["text"]
+
+	@classmethod
+	def open(cls, filename):
+		columns, meta = open_columns(filename, MAGIC)
+		return cls(columns, meta)
+
+	def __len__(self):
+		return len(self.ids)
+
+	def tweet_id(self, i):
+		return str(self.ids[i])
+
+	def tweet_ids(self):
+		return [str(tweet_id) for tweet_id in self.ids]
+
+	def text(self, i):
+		return self.text_blob[self.text_offsets[i]:self.text_offsets[i+1]].tobytes().decode("utf-8")
+
+	def tokens(self, i):
+		text = self.text(i)
+		return text.split(" ") if len(text) > 0 else []
+
+	def iter_text(self):
+		for i in range(len(self)): yield self.text(i)
+
+	def iter_tokens(self):
+		for i in range(len(self)): yield self.tokens(i)
+
+	# Boolean mask of the tweets whose text is not empty, without decoding any of it
+	def nonempty(self):
+		return np.diff(self.text_offsets) > 0
+
+	def optional_columns(self):
+		return dict((name, self.columns[name]) for name in OPTIONAL_COLUMNS if name in self.columns)
+
+def encode_text(text):
+	return text.encode("utf-8") if isinstance(text, unicode) else text
+
+# 64 bit content hash of each text, taken from the start of its md5, to tell when a tweet has changed
+def content_hashes(texts):
+	digests = "".join(hashlib.md5(encode_text(text)).digest()[:8] for text in texts)
+	return np.fromstring(digests, dtype="<i8").astype(np.int64)
+
+# Lays the tweets out as the store's columns, in the order they are written
+def build_columns(ids, created_at, texts, optional_columns=None):
+	encoded = [encode_text(text) for text in texts]
+	text_offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+	np.cumsum([len(text) for text in encoded], out=text_offsets[1:])
+	columns = [
+		("id", np.asarray(ids, dtype=np.int64)),
+		("created_at", np.asarray(created_at, dtype=np.int64)),
+		("text_offsets", text_offsets),
+		("text", np.fromstring("".join(encoded), dtype=np.uint8)),
+	]
+	for name in sorted(optional_columns or {}): columns.append((name, np.asarray(optional_columns[name], dtype=np.int64)))
+	return columns
+
+# Writes named numpy columns to one file: a magic string, a JSON header giving the dtype, offset and
+# length of each column, and then the columns themselves, each aligned to ALIGNMENT bytes
+def write_columns(filename, magic, columns, meta=None):
+	# The header holds the offsets of the columns, which depend on the size of the header, so lay the
+	# columns out relative to the end of a header that is padded to a fixed size
+	header = {"columns": {}, "meta": meta or {}}
+	for name, array in columns: header["columns"][name] = {"dtype": array.dtype.str, "offset": 0, "length": len(array)}
+	header_size = len(magic) + HEADER_LENGTH.size + len(json.dumps(header)) + 32*len(columns)
+	header_size += -header_size % ALIGNMENT
+	offset = header_size
+	for name, array in columns:
+		header["columns"][name]["offset"] = offset
+		offset += array.nbytes + (-array.nbytes % ALIGNMENT)
+	header_bytes = json.dumps(header)
+	header_bytes += " "*(header_size - len(magic) - HEADER_LENGTH.size - len(header_bytes))
+
+	with open(filename, "wb") as output_file:
+		output_file.write(magic + HEADER_LENGTH.pack(len(header_bytes)) + header_bytes)
+		for name, array in columns:
+			step = max(1, WRITE_CHUNK//max(1, array.itemsize))
+			for start in range(0, len(array), step): output_file.write(array[start:start + step].tobytes())
+			output_file.write("\0"*(-array.nbytes % ALIGNMENT))
+
+def read_header(filename, magic):
+	with open(filename, "rb") as input_file:
+		assert(input_file.read(len(magic)) == magic), "%s does not start with %s" % (filename, magic)
+		return json.loads(input_file.read(HEADER_LENGTH.unpack(input_file.read(HEADER_LENGTH.size))[0]))
+
+# Maps each column of a file written by write_columns, returning the columns and the header's meta
+def open_columns(filename, magic):
+	header = read_header(filename, magic)
+	columns = {}
+	for name, column in header["columns"].items():
+		dtype = np.dtype(str(column["dtype"]))
+		if column["length"] == 0: columns[name] = np.zeros(0, dtype=dtype)
+		else: columns[name] = np.memmap(filename, dtype=dtype, mode="r", offset=column["offset"], shape=(column["length"],))
+	return columns, header.get("meta")
+
+# Writes the tweets as a store, laid out by write_columns
+def write_tweet_store(filename, ids, created_at, texts, optional_columns=None, meta=None):
+	write_columns(filename, MAGIC, build_columns(ids, created_at, texts, optional_columns), meta)
+
+# Splits a dict of id_str to TweetRecord in to columns, ordered by tweet id
+def records_columns(records):
+	tweet_ids = sorted(records, key=int)
+	values = [records[tweet_id] for tweet_id in tweet_ids]
+	optional_columns = dict((name, [getattr(value, name) for value in values]) for name in OPTIONAL_COLUMNS)
+	return [int(tweet_id) for tweet_id in tweet_ids], [value.created_at for value in values], [value.text for value in values], optional_columns
+
+# Builds an in-memory store from a dict of id_str to TweetRecord
+def records_store(records, meta=None):
+	return TweetStore(dict(build_columns(*records_columns(records))), meta)
+
+def write_records(filename, records, meta=None):
+	ids, created_at, texts, optional_columns = records_columns(records)
+	write_tweet_store(filename, ids, created_at, texts, optional_columns, meta)
+
+def is_tweet_store(filename):
+	with open(filename, "rb") as input_file: return input_file.read(len(MAGIC)) == MAGIC
+
+# Reads tweets from either a store or one of the older pickles: the scrapers' [tweet_text, retry_ids]
+# (holding Status objects or plain text) or oov_joiner's dict of cleaned Status objects, whose text is a
+# list of tokens. Unpickling Status objects needs tweepy, reading a store does not
+def load_tweets(filename):
+	if is_tweet_store(filename): return TweetStore.open(filename)
+	with open(filename, "rb") as input_file:
+		tweets = pickle.load(input_file)
+	if isinstance(tweets, (list, tuple)): tweets = tweets[0]
+	records = {}
+	for tweet_id in tweets:
+		tweet = tweets[tweet_id]
+		if isinstance(tweet, basestring): record = TweetRecord(tweet, MISSING, MISSING, MISSING, MISSING)
+		elif isinstance(tweet, TweetRecord): record = tweet
+		else: record = status_record(tweet)
+		if isinstance(record.text, list): record = record._replace(text=u" ".join(record.text))
+		records[tweet_id] = record
+	return records_store(records)
+
+# Snapshot reader and writer for scrape_journal.Journal, so that the scraper's output file is a store.
+# The retry counts ride along in the header's meta
+def read_store_snapshot(filename):
+	if not is_tweet_store(filename):
+		with open(filename, "rb") as input_file:
+			tweet_text, retry_counts = pickle.load(input_file)
+		records = dict((tweet_id, status_record(tweet_text[tweet_id])) for tweet_id in tweet_text)
+		return records, retry_counts
+	store = TweetStore.open(filename)
+	optional_columns = store.optional_columns()
+	records = {}
+	for i in range(len(store)):
+		fields = dict((name, int(optional_columns[name][i]) if name in optional_columns else MISSING) for name in OPTIONAL_COLUMNS)
+		records[store.tweet_id(i)] = TweetRecord(text=store.text(i), created_at=int(store.created_at[i]), **fields)
+	return records, store.meta.get("retry_counts", {})
+
+def write_store_snapshot(filename, records, retry_counts):
+	write_records(filename, records, meta={"retry_counts": retry_counts})
+
+if __name__ == "__main__":
+	import argparse
+	parser = argparse.ArgumentParser()
+	parser.add_argument("-i", "--input_filename", required=True) # e.g. data/iceland_volcano/tweets.p
+	parser.add_argument("-o", "--output_filename", required=True)
+	args = parser.parse_args()
+
+	# Convert an older pickle to a store
+	tweets = load_tweets(args.input_filename)
+	write_tweet_store(args.output_filename, tweets.ids, tweets.created_at, list(tweets.iter_text()), tweets.optional_columns(), tweets.meta)
+	print "Wrote %d tweets to %s" % (len(tweets), args.output_filename)
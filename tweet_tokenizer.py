@@ -0,0 +1,143 @@
+import collections
+import re
+
+URL_REGEX_PATTERN = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\(\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
+
+# Bump whenever a change to the rules changes the tokens they produce, so that incrementally cleaned
+# output is cleaned again
+CLEANING_VERSION = 1
+
+# The cleaning rules of clean_and_format_text, compiled once
+HANDLE_REGEX = re.compile(r'@\S+')
+URL_REGEX = re.compile(URL_REGEX_PATTERN)
+SYMBOL_REGEX = re.compile(r'[^\w\s\'\.\:]')
+COLON_REGEX = re.compile(r'(\D)\:(\D)')
+PERIOD_BEFORE_REGEX = re.compile(r'\.(\D)')
+PERIOD_AFTER_REGEX = re.compile(r'([^\s\d])\.')
+APOSTROPHE_AFTER_REGEX = re.compile(r'([^a-zA-Z])\'')
+APOSTROPHE_BEFORE_REGEX = re.compile(r'\'([^a-zA-Z\s])')
+
+# Replacements for the rules that keep the characters around the one they drop. A function is used
+# because a template like r'\1\2' is expanded in Python for every match, which is several times slower
+def keep_groups(match):
+	return ''.join(match.groups())
+
+# Tokenizes a tweet: strips handles, URLs and symbols, keeps colons only in times, periods only in
+# numbers and apostrophes only in contractions, and drops the 'RT' marker. Every rule can only match
+# where its own character appears, so a rule whose character is not in the text is skipped without
+# scanning it. Most tweets have no handle or URL, and few have a colon or apostrophe left once those
+# are gone. The rules that do run apply in the original order, with their original patterns, so the
+# tokens are exactly those of reference_clean_and_format_text below (see test_equivalence)
+def clean_and_format_text(tweet_text):
+	text = tweet_text
+	if '@' in text: text = HANDLE_REGEX.sub('', text)
+	if '://' in text: text = URL_REGEX.sub('', text)
+	text = SYMBOL_REGEX.sub('', text)
+	if ':' in text: text = COLON_REGEX.sub(keep_groups, text)
+	if '.' in text:
+		text = PERIOD_BEFORE_REGEX.sub(keep_groups, text)
+		text = PERIOD_AFTER_REGEX.sub(keep_groups, text)
+	if '\'' in text:
+		text = APOSTROPHE_AFTER_REGEX.sub(keep_groups, text)
+		text = APOSTROPHE_BEFORE_REGEX.sub(keep_groups, text)
+	words = text.split()
+	return [word for word in words if word != 'RT'] if 'RT' in words else words
+
+# Bounded map that forgets the least recently used entry once it holds max_size entries, and counts
+# how many lookups it answered
+class LRUCache(object):
+	def __init__(self, max_size):
+		self.max_size = max_size
+		self.entries = collections.OrderedDict()
+		self.hits = 0
+		self.misses = 0
+
+	def get(self, key):
+		value = self.entries.pop(key, None)
+		if value is None:
+			self.misses += 1
+			return None
+		self.entries[key] = value
+		self.hits += 1
+		return value
+
+	def put(self, key, value):
+		if self.max_size <= 0: return
+		self.entries.pop(key, None)
+		self.entries[key] = value
+		if len(self.entries) > self.max_size: self.entries.popitem(last=False)
+
+# The original eight pass implementation, kept as the definition that clean_and_format_text must match
+def reference_clean_and_format_text(tweet_text):
+	# First, remove all user handlers - i.e. any word beginning with the '@' sign
+	text = re.sub(r'@\S+','',tweet_text)
+	# Remove all URL formats
+	text = re.sub(URL_REGEX_PATTERN, '', text)
+	# Then remove all characters that are not in the alphabet, a digit, whitespace,
+	# in addition to the appostrophe which is still used in contractions, periods,
+	# and colons, which will be dealt with in the next steps
+	text = re.sub(r'[^\w\s\'\.\:]', '', text)
+	# Keep only colons in between two numbers (for a time)
+	text = re.sub(r'(\D)\:(\D)',r'\1\2', text)
+	# Keep only periods that are followed by a number and preceded by either a number
+	# or a whitespace
+	text = re.sub(r'\.(\D)', r'\1', text)
+	text = re.sub(r'([^\s\d])\.', r'\1', text)
+	# Keep only apostrophes that follow an alphabet character and are followed by either
+	# an alphabet character or a whitespace
+	text = re.sub(r'([^a-zA-Z])\'', r'\1', text)
+	text = re.sub(r'\'([^a-zA-Z\s])', r'\1', text)
+	# Return word vector, excluding start marker 'RT'
+	return [word for word in text.split() if word != 'RT']
+
+# Edge cases of the original passes that any rewrite has to reproduce: overlapping colons and
+# periods, handles and URLs inside one another, and non-ASCII text, which \w does not match
+EDGE_CASES = [
+	u"RT @user: Quake hit at 10:30 p.m. today...", u"a:b:c", u"a: :b", u"1:2:3 x:1 1:x", u"..5 .5 5. 5.5 a.b.c",
+	u"don't 'quote' it's ''' rock'n'roll o'", u"http://a@b#tag https://t.co/xyz?a=1&b=2 @http://x.co",
+	u"caf\xe9 \u0928\u0947\u092a\u093e\u0932 #PrayForNepal!!", u"RT RT rt", u"", u"   ", u"'a: b.' :.' '.:",
+]
+
+def test_equivalence(texts):
+	texts = list(texts)
+	for text in texts:
+		expected, actual = reference_clean_and_format_text(text), clean_and_format_text(text)
+		assert(actual == expected), "Tokens differ for %r: %r instead of %r" % (text, actual, expected)
+	print "Tokens match on all %d texts" % len(texts)
+
+def benchmark(texts, repeat=3):
+	import time
+	texts = list(texts)
+	timings = {}
+	for name, tokenize in [("reference", reference_clean_and_format_text), ("compiled", clean_and_format_text)]:
+		best = None
+		for _ in range(repeat):
+			start = time.time()
+			for text in texts: tokenize(text)
+			elapsed = time.time() - start
+			best = elapsed if best is None else min(best, elapsed)
+		timings[name] = best
+		print "%s: %.2fus per tweet" % (name, 1e6*best/len(texts))
+	print "Speedup %.1fx over %d tweets" % (timings["reference"]/timings["compiled"], len(texts))
+
+if __name__ == "__main__":
+	import argparse
+	import glob
+	parser = argparse.ArgumentParser()
+	parser.add_argument("-i", "--input_globs", nargs="+", default=["data/*/tweets.p", "data/non-english/*/tweets.p"]) # raw tweets of the events
+	parser.add_argument("-e", "--example_filename", default="example_tweet.txt")
+	parser.add_argument("-v", "--oov_file", default="OOV_Dict/OOV_Dictionary_V1.0.tsv") # its replacements are cleaned too
+	args = parser.parse_args()
+
+	from tweet_store import load_tweets
+	tweets = []
+	# The example is a printed Status, so pull the text out of its repr
+	with open(args.example_filename) as example_file:
+		tweets.extend(eval(match) for match in re.findall(r"\btext=(u'(?:[^'\\]|\\.)*')", example_file.read()))
+	for input_glob in args.input_globs:
+		for filename in glob.glob(input_glob): tweets.extend(load_tweets(filename).iter_text())
+	# The OOV replacements are cleaned too, and are byte strings unlike the tweets
+	with open(args.oov_file, 'rb') as tsvfile:
+		replacements = [line.split('\t')[-1] for line in tsvfile.read().split('\r')]
+	test_equivalence(EDGE_CASES + tweets + replacements)
+	benchmark(tweets)